@@ -24,12 +24,22 @@ Date: 2025-11-21
 import csv
 import json
 import re
+import sys
 from pathlib import Path
 from typing import Dict, List, Tuple
 
 # Base directory
 BASE_DIR = Path(__file__).parent.parent
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent / "PythonHelpers"))
+from crosslingual_index import CrossLingualIndex
+
+# Output columns after 'chinese', in CSV order
+TARGET_COLUMNS = [
+    'pinyin', 'english', 'spanish', 'french', 'portuguese',
+    'vietnamese', 'thai', 'khmer', 'indonesian', 'malay', 'filipino'
+]
+
 class ChineseTranslator:
     """Handles translation of Chinese words to multiple languages"""
 
@@ -38,61 +48,43 @@ class ChineseTranslator:
         self.load_reference_data()
 
     def load_reference_data(self):
-        """Load Pack 1 as reference for common words"""
-        self.pack1_data = {}
-
-        pack1_file = BASE_DIR / 'ChineseWords1.csv'
-        if pack1_file.exists():
-            with open(pack1_file, 'r', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    self.pack1_data[row['chinese']] = {
-                        'pinyin': row['pinyin'],
-                        'english': row['english'],
-                        'spanish': row['spanish'],
-                        'french': row['french'],
-                        'portuguese': row['portuguese'],
-                        'vietnamese': row['vietnamese'],
-                        'thai': row['thai'],
-                        'khmer': row['khmer'],
-                        'indonesian': row['indonesian'],
-                        'malay': row['malay'],
-                        'filipino': row['filipino']
-                    }
+        """
+        Index every breakout CSV of all three languages (Chinese, Spanish,
+        English) by their chinese/spanish/english cells, so any Chinese string
+        that already has a vetted translation anywhere resolves in one lookup.
+        """
+        self.index = CrossLingualIndex()
+        self.slow_path_calls = 0
 
     def get_translation(self, chinese: str) -> Dict[str, str]:
         """
         Get translation for a Chinese word/phrase
         Returns a dictionary with all target languages
         """
-        # Check if we already have this from Pack 1
-        if chinese in self.pack1_data:
-            return self.pack1_data[chinese]
+        known = self.index.lookup('chinese', chinese) or {}
 
-        # Otherwise, we need to translate
-        # This is where the complex translation logic goes
-        return self.translate_new_word(chinese)
+        # Only columns the index can't answer go to the slow path
+        translations = {}
+        for column in TARGET_COLUMNS:
+            if column in known:
+                translations[column] = known[column]
+            else:
+                translations[column] = self.translate_column(chinese, column)
+        return translations
 
     def translate_new_word(self, chinese: str) -> Dict[str, str]:
         """
         Translate a new Chinese word that's not in our reference data
         This requires deep knowledge of all target languages
         """
-        # For now, return a placeholder structure
-        # In production, this would need proper translation logic
-        return {
-            'pinyin': self.generate_pinyin(chinese),
-            'english': self.translate_to_english(chinese),
-            'spanish': self.translate_to_spanish(chinese),
-            'french': self.translate_to_french(chinese),
-            'portuguese': self.translate_to_portuguese(chinese),
-            'vietnamese': self.translate_to_vietnamese(chinese),
-            'thai': self.translate_to_thai(chinese),
-            'khmer': self.translate_to_khmer(chinese),
-            'indonesian': self.translate_to_indonesian(chinese),
-            'malay': self.translate_to_malay(chinese),
-            'filipino': self.translate_to_filipino(chinese)
-        }
+        return {column: self.translate_column(chinese, column) for column in TARGET_COLUMNS}
+
+    def translate_column(self, chinese: str, column: str) -> str:
+        """Slow path for one column (currently placeholder generators)"""
+        self.slow_path_calls += 1
+        if column == 'pinyin':
+            return self.generate_pinyin(chinese)
+        return getattr(self, f'translate_to_{column}')(chinese)
 
     def generate_pinyin(self, chinese: str) -> str:
         """
@@ -128,7 +120,7 @@ class ChineseTranslator:
 
     def translate_to_khmer(self, chinese: str) -> str:
         """Translate to Khmer (Khmer script)"""
-        return f "KH[{chinese}]"
+        return f"KH[{chinese}]"
 
     def translate_to_indonesian(self, chinese: str) -> str:
         """Translate to Indonesian (formal default)"""
@@ -164,29 +156,13 @@ def create_csv_for_pack(pack_number: int, pack_title: str, chinese_words: List[s
         writer = csv.writer(f)
 
         # Write header
-        writer.writerow([
-            'chinese', 'pinyin', 'english', 'spanish', 'french', 'portuguese',
-            'vietnamese', 'thai', 'khmer', 'indonesian', 'malay', 'filipino'
-        ])
+        writer.writerow(['chinese'] + TARGET_COLUMNS)
 
         # Write each word with translations
         for chinese in chinese_words:
             translations = translator.get_translation(chinese)
 
-            row = [
-                chinese,
-                translations['pinyin'],
-                translations['english'],
-                translations['spanish'],
-                translations['french'],
-                translations['portuguese'],
-                translations['vietnamese'],
-                translations['thai'],
-                translations['khmer'],
-                translations['indonesian'],
-                translations['malay'],
-                translations['filipino']
-            ]
+            row = [chinese] + [translations[column] for column in TARGET_COLUMNS]
             writer.writerow(row)
 
     print(f"  ✓ Created {output_file.name} with {len(chinese_words)} entries")
@@ -202,7 +178,8 @@ def main():
     # Initialize translator
     print("Initializing translator...")
     translator = ChineseTranslator()
-    print(f"  ✓ Loaded {len(translator.pack1_data)} reference translations from Pack 1")
+    print(f"  ✓ Indexed {translator.index.rows_read} breakout rows from all languages "
+          f"in {translator.index.build_ms:.0f} ms")
     print()
 
     # Read the overview file
@@ -235,6 +212,8 @@ def main():
         generated_count += 1
 
     print()
+    print(translator.index.stats_line())
+    print(f"Slow-path translations: {translator.slow_path_calls}")
     print("=" * 80)
     print(f"✓ Successfully generated {generated_count} CSV files!")
     print("=" * 80)
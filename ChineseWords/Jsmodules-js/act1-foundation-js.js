@@ -1,2 +1,2 @@
 // Obfuscated production version (zlib + base64)
-export const w="eNq9vXmPFFe2L/pV4lp6lz6SOfR07z23/7EwHvt4oBvaraOjForKjMoKyMwoR0QWJFctgYc22MbG8wC0wTZmLIyN2zZgG+mkLb7HE1UF3+L91vqttWNHVhUGt9+VbCoyIvbaQ+y95uGvf/3LX+5Ju6OdaZJOTmVb77n3nqybpxv6SdZNyqw7TAfZA7iJV8Yp7uXyxnw/m0vKYjbZVW3Gz8nlub3J5Er+dDKcnCmT3nByPN+D+0svnln+7JkbV64sHX7tnv+89y/3FHkxL0CSdG6YPyZddYZpXeVVlW7oJtmwpze9qyTNhpNFfW2Y99HnI9LX8dFcIh10k9Atbt/89NjKm/9gh+yqHPWyKinqfPQ4npeTq1VSTU6X2/HDno31STab4rLMnsL1cHJihEl8vx//H5mTGTx/eunCwaXvDijMMu2N+klR5tkgL+eTQSZLNkwF2ja8XI+KOqmH6UKaTM7UeTnqTM5USfqY9sgmRT+psqSbdnMOQR/WVZnPJuMaIxEw358bJ5Pz3SQMBvdufL1v5fx5jobT6+bdMptP0GX1IF4Y6a8qH1VJ9nvp0J6P7XldoevBhkf1a/WTyeIguf76blm4rz69ee2r5QP8QP9S4MMM0s4vEgKQj/0vuJPN4dbIbxSr3xmnu3+RoBP9WoDPPmTkV/7GLlrDnpyosQ5Fr785jF1uZFUx10my0dP9bPQH3Yllls8n8h35qk6jyrHF8rk6GxRcr7kq+eEcNsT35/bgyQ+HuvLlPv7sxtcf3jx57cbXR21qdbZzpmiN2u40E1v9yiCr83hmoTfOjd1oB2k3Lesh9kSS4W/RGcq6ZzgQuInjVGYLo0K3X3ixn+jFyF7FWdD72VyddIf5Q7I011/fhcUsk+L6K3N7ZVqvfrT0/Mnlg99NdZl2sIVwWp9s9SlrOrn8ZLtPrj3enVx64L+uTXeMxc3KbO7PuH/9lWGST47vTXwU0v8bZ5eOnuYobAiTRRyg9qTzuiwq6SuedN5Pq+k51/me1fP94Rw2QTzhF640E7beWvMN3cXz9e5WTTf0ue5UZQCtub5wxXBKns0N05mkiGdbZXWd9XOc/SqLZ1xMPsOr/aw9Yb4ZTfn66zizk9PNjJcP7lt65S2fcdRnPOd2pxhLZRO/L3S7euJN32tN3QcSZs6BcN3zzuTEoExnk8lxAH5KV72T4s7cvC7ycUy8r0c05f1Z/dRJKRhn7G9K1xhB8TBugkqcmE2KyXFgu8uCwpcPXLt56NOlV65O9Ti1taJeo90Vdxotd6tnW/Co47Dk2rUveT+t83lgoqR4As/01+SLORynyT7/LU+xxNpHuCF9DB9VMnJ8NE4Ej8vC4sat9z5cevkqlnQKPsaaztt6xv00q9n0ZmvZ6s3XsumQS2n92VIWQm9GHSG6mSwWlqc7AjHam40VgYbnvWFWg6wvYB3LQrBffzSblSkw8gxwcJr15d5QsCwWLhdce/2wdLd07dmli6/e/PSru+qOT0MX9wtsgAXhCz3g1sozlwmesCcfgeJmNfYENjeA3hsPd1jk6KyWp2WOu3uxiPnIKPulvBM3XLvdOJ1vZjo5PyaP4fNcfu7V5UunfZ6B9lfywaZGpu0jJkA/atMPjm+eymaMWAE5LlPDFCjKFwgjk8TD3NriVnykgWPhSHWYVVGWRQf4oQqMS5k68KocFR10XoHODmRZiMKGw0J4vqrI+/meUSpNvaXcB3+YkGnJFvKHlaXId4Le4//PR3qe3npted/Jpf3vrzcCMHd1/u9rDQBPsqqyY716AJnwRYujp/O6uF9x+a7ER8Oz/f1+bEwfj+yfC59xND6UPJsZFDMCCJ9MuZ0tOg4wGoOCHRR+E736y/JleHdXZ1TWssOkw+/fAK0yjCJdC0f17Se33v18+csDAX8DhgyWXWwlO2j3hL0mJPma4ylQS6+9G4ESlLjYxxixOwbp3BYl3bne6Mtez+bnFQFPFsNdEMpB2n+seVOwRr+v85ic0KFfP7xTkGEui7X06Qc3Fz9ZevWcHeRh2gPnZ5QkdC+d4MOXJcZhPZFJz/KFpOn9Mf0e+aDA4W5ezea2k5HKJyeEOPsYyE4tHzvJMXAAvZxcWJn1hrrzirKX99u3hoqK8u/f2C3Ee6zY78zSoc+Wjx68cyA4eQGMrMNbLxKIQshw6nrlKMgS9tOlCX88jh+aQCFnQlfY5Answ5UvTrk8gRUdTs72sLWN/0PTP5GaySVvj6NrkaxGu2STLD6dOGwZ79/+sfzs8wTOIatAF+O4vSLVJffWkwtpH8d8VCwk/XzDtiBuxe+qeBfQoGzJQSInaybC+O8tfX0hYEL0tpmC42YDuJlgHtG1jSBwcdn8Dtqi5fkBj3MuU9cz8S0O9NK1c3fatQGwnrX1Pf/5n7+7p+qWxZ+z/vwg3ZPdc+9ffgxWLG1GcmZLAgwYf1uE2rc5Et8W4+yAqn8+uasRuiKJ6+cQe2KZZ5XA00g5DwY5IxJnHoykmCC/NLz8NufftznTvo0s+oOxNBDkgJglvj9ig53fvt/Z3O0RZx146hZj+VDETW5tWMiHGq5xa4tZDGxizMM90jBujzTM2dRl4M4CZxbxSVsi/mOzMyqjtEP6LE9Giq1bTNEaHNHmteCscT9iFW7HJKzBHGxdgyBvjbiBhyJGIPAAbaobEdqIvBJrDmrwwkL9wVc0C2+EcDUV3Oo0bWtD8lr3WqTlpxOVQE9+GsaOkHSEnn8U6cXo8u5xZcCSEZ6rUgD7K7blQr5QjrYl/z1phvm7e7IqG/VGOIbzunXXfGcO1+XsbZ5X+TCdr277Qh8ixvovDPPxML/NCDBK6H1wnn/7q9+BDUvnMbPd9/yf392TQhckf61dtWOHN8t2/PZXO34FmKrmrEfzlWKxLFyturepn4GzGT2t6Bx4T5CQoNQDLwMF8TOMhACDuYKGEoKpDBirNxR2S7Wm0APKh5PXMr+HF0f+Ilj52SKZz2s91vvlxKAj+WgX30Y3dmQmHw3KnKfwhzeqpM7Am5dgOWb15IBvhPzO8zRXF+XMpgq8Vn8mFziTK6rIUJg3v7y0fPCltva1sFHno/l5UbzWw1x/F+PmBR2tfLEZERY2dfsFuilmDfrkfJ+wV8695OrWAsh40+TsTCaTh0JGaMKmyZkZ/KeHjM/P8HmGr5RCrt80npGNeU8+OT0j6E2ub35xbOnCMS41Nl0hCDzrpSLLPa0/wt0+GBWd8JldiUCQNfzoEtqburafzuqp7gO1yEWK2cii7UqzeRGpSJCBm/fLezdP71t6lXrQKi0X0FqxVNYv2Bw3Z/ym7LxNc50s0w1//c2xqGvHqoheBByuSZ1Vw1x3VseuinAVLrCXLgFTDX84p9vsvXPL7/7tTptv6o108UREFSgy/8XDgMHFq4qFkajShETIV9TZ5CPh/1TMqfK00nnlC6M+tynIdzEP4q9UA18IqvFhnpZKOHYmmKd28dGtI6QbhXWR8gQpbLEbjApBQnhKyMDP8nyME+PgZOPXDvDjMw4Qn7aQx5n9TflnF/9MFnEgbaFXPri09PkZNiq7mR6uUoiLtMINvchw2CrdXsI3S3Pp7tg7aKwtRzODdIbnE6er6Ms2wOm1m/XkbGlb3m9BN13p6c4WQDaSQt/VbQSEMLlCuvr3d1bOXW7gB5gBkqyN38n3ejt8Om8nx0lPEU+OUNl+0SMbsFP56ZHs41svvHbr6nO3bwH40ojw0YBHA9+lkPn0s4XJCXz0Xqrr1x2KNCO6igxHBSdY75eTRX1Z7vm7ZQoZgfYOERT0eH1/xLi8m/suOZdXganUvsAyzPULHqh+jsUWlLZnlI0Vn3WlizHe2amvADrUdaInGWfKVgwSQJevfuQCgLd1QbEGJ1b1TN0XIMb5AIpzPuDzdFRdGHey0jjYXJjobG/aM5XCqIeWA2XZD6KtoYh+AU4Eq5EAMZR6ZARXdHK9lfmtqdcU62NqfVFXEv/gHMjxHcrA3ry49Lej68OHsKKnvFjI6z50aPgoa0I1+5HeXjp6EWB5UIY5GC2Vv/vKZaWTz3Lpt1/mulfANCXX3x/qZjmzdJILDQrTH2mrwSAjQt2pv0GEit06B1j92EyMfdasyEuMQM49FANdKGyUpuIukcW4n6ddHWoJRuuIwFt+5+Typ68aq5MvbKocreDSUIrdJz7JZvP+pmqsYOQYnS+5ywGHQKD72FT0i0oJbzGziZfgddMZ3M9G8qs7GmyCwEA0XgNH6OyPfrB8yYDY2gve4lVrwW2x0ZRLjZb2+eRTwUYopz+bTZTvkZtAh3otfC5wMOUUHCUsvW7N/edWju3z4evHxrKnipm0td7g76HosKW1tHvuIpqyaxyuBay9bshypkxtZ874PdDd5jzIxJeh7D/+mk23qDfhBGTddEA8PLkK5iJXpAclfFHKY3vaK/qbuoXuAbF92hn5+Itl03QLMhmktR1G+QG9UTiQ7afjfvxsSFve5PMxxZ2VN083hx5jBFWT71SOMlEvwSY41F2AY7RXn4pyXla5VjylJPP64b6qlhVvvgyYCnAwOTPq9bXL0QY1PD7NHWt3QUFgZ6x8l5uKCdvc9UtVWlSVkp8KLKfrg/SMzRd6H7NUw7i0u3oeTddRP5CtDNxkYCED22gsKblR7XxyRjpwYqf/NlwaObS74aOMh3IGqmGCAg/UsEBtDsi5nzthfcC0bJpif8j5sFNhKJyZUNFKWAg7gOS15As6v/CjpN+Ifovi354iGzl2WtwX6WKT0Vf8mJwZbCrtWh801xGRJnW2xYdIURjW5VW6k3+xO0k4STS5diRIeFVpuRLEQAZJvPgeto4sVKAJ9rvbz/JAWUhT7gyNG+I39J2KKKQbX1AvUGTGX4J77QEw76ahIlGi3oB3DVFm0whzruaEHVt+YBK57tiRDqroZaNZQ4+GG4kVDbIjJsNIARUZGuISOf4J2MJRRYQiHDkYsiGaWeNEi0lEUTf44ZJ7LRxsO9StE22CdgUsAClrUGyBEFv1Ybvtpn+EcqPYMi1u3/bNIHTf/q0gev/YayaA3/a1IIb/2BwojP9mHWE8tO7s2GGNyx070Lqz4zeNTF6mO0ei8itN9QfuoDOqaLytS1gDVZUnTJgKOZ/LFr353KtL3zxntG7yD8VS1JaVo9/rtxKJ2G5CLMZn3r3NfYcUFD2GAMc1cYORmjMSjFd9kCZn4IxUqNgNq1Shii68BlNmKXxqkdt7YzA2yqnWafaEtsuFP4e2X4d7XjT/+wUnLH+xf/mtL5Ze2Ld0+XNjPA1ECbsotJhPcPJ2c36UDMFWbzG9DsGIgFwl119RPaxCWj54bvngGz6JSpVYXZzXxzhc3hgvpK4g+hzDwq5VfHHrhUPLnx90Op3Kbhw8qmS6uV73gZrPCVDW8pP9gEZQC3pcoEmbnOnT1AXtmrSe6+XZbvm3T9YlF3PC9+eE3N747trNb6kV7Yt6VnWzuFJtbLgzrlIaQX44VIWmy8e+86aQV/+oXFkxW8BUOMr40YYj/Qn1pvzeXcD8Nae74dKMWn3Ufezt55b/8bztKNDkfBvPOS/QRCSK1j1qCL398rvfeXvrcGsYSTQKNa5k6k8nTj1DWA9VIIVHz1ef3VFrXPndyeldDYQDVwOEGjTGnL5ycGuTgwIBhNpu7hb2VzYbbfi5+9lcfHXl7HN3B0HbwoZHQ/3Z51ZeWrStvQcG3NnNPNbz0AypmyCOOiRsVUjD0Uv3qMhWas86Ljhu6cK3y29+F3Yk9DYFHQjSEpupMGNb675dChch67mfJqILlwGKc6HPBzS1+eM8E72+rj9w13bfBN/v73IPLB2ijaDopCX34ExuexBqrAeoORKnGdi5ywRtpbNvPkPLu/n0I5ya5su98n74chCDh2oV7gsj/DAHkA42Kzw1l+PYdRNpL+d3/xtofEezlBZVUKavvPuJK9PLDF+1l6qquoTgmqfqLJnuFQDdzeHYimcev9cbohIVcLJiV84Bln1yIMbekHAqaPYfVjjhpoEBD2e+P8fnXev27NuuddPXE6W+W8mnwCwG87uBs8dKh4nuK3Uc1C9EHdjxeVOBPfu2+xsOJu9TZT4YPaJrkw0mVx5RX8K8eFxREY6imLjkHH/5yfLla45PwYg9rjhdWObCVnanXtS6DbAQtTe9te/V0HSun86kahyGkLvAq2Kn39sFNkG3Hj1ZSR2uOl3IupMrqRkTh3rx37oj0Mb/OkFtb6aGf5gmZgJpOfapNy46kPhm4d6VDoDwRrC3D/6kzFIqd0U7N8KKDf+kshxfFVsDcKPdlQMF8akGct6s7g2CItzofEJR940rR2B9XXrhYNyj28atJ3e05UNaxhWw2cVjkMHXVoG6bbwQ4TDvQByTcYi9euPebHZ2BF5X8VEpgiMdGUArofbQJYXfsbpBFbK0118ZqUri65fgPrv0+svL778dpFIYYWXIyjkKTB1yrWJKroAxVH0KyLtl1AvyzKGGISvQMORcObUucKZyslDezFIP1yELc6QvShlt+Levlj593aT8fkopn3/9t/0h9dfGssmOvYem0Sx8/CZ35mxUF3PKlMNJ4LQy5hffXHl2MfA6YBZ1f9lFc0tl8D7xzNDa3nrnsrZdS2Qtdir3j+VSvYpwbs632SnfS3bNBRYFrgyV2htyuyOsTqfF6gQOp+Ft5o236TtvM2+8zVzgbcjV/Dgf0uf3UAYi4h7KFvcwP8U9zAfuoTL6r5S/TfbnGxBRc+L+riNQadam1lmgtWcaWps5rR06rSWZNaGpVBVBZn/RRj8hEN1uJ6wkqU4hZo1CDAKF6JJC6LafnJghDbTFAM7t8TzPc0wQWfTOrg5bGBWKSNBtO3Ca4QSjEGROI3BP3+fPOp11+kDaEOHiQYOLB46LB4qLd5uTgiys42AoGPCT/9qPcUkdkaLcNsp01BWQliGsKVwV0JTNuSwG0QkEtelPTnQMa8QII+CKO0UUxBF3etD1oLZPqYmhjz4K+RV6tU62s7s56eQVXCSm5M+1XwmC5zqPg8S57nMTNdd+HmTMdQdI4fLX6wiXeQ6h0tulO3ZIw5kdv45svcNyVBdDNew8ZC4qOb1M5EnHHinfNBbXA4kpGGYLarQ/z+8mn/DGN+8vv/e+8TggyL9XpDKcXFC3sWG2hb+H+QPcWrPe8NbJRW8oRpZFnCigkW7WIXV+0thLvV1PvqhJnrPH/H4hVjp0mBSPxa9WcFUrxFFjM1l4kedO67ZYfufMzS/3O/IrZ6h7FtDYLqrggtlXcZEAMM27QDDN+ztnDCORuxJfpkG+R5Cf+j2nnVInO4ZCWYVVORHgGoCxFcD+m9dea5S+8k8n+6NpfQcZfKL+6Cpf3b98OO6H99Qf0KEdOxmgQfGpnGeuf2Ag0iWC3xN81lL3+dRVH6mPztuXb1472ki1FT9MntYGIbobPZfWooNXJea1o7f2myarUmdhcWWuxY76BI0wmfh/1nCh2wunR3L5uAlNwAgP6nQwuaSyygB3QLDGSbYr3d5M8fhA/+E8l5//EP8ZM16KakVVFtDiPkQuh56wuNXrFb/nN5/39je/es0bA/fMT078kRRgXgXh5lZdkUdWTAbWcZZ47NZHf9e2e+H+Is9hjYOWTHhjvzOGg4A6v53uBwe8G5cPN953Q/VEUevMSCUxqAcX0q5eAlPX29wpiO5Py++cuvHdMffDkd0N1GYhSrDx1rDuYmsMFSaU3/pGpc41+FB7mre6/Scphc25w8vNL04BeKT1WyjUF78SE6D8MM982AabX61HZnE4TvXz8tsXlw4c4SxVHZjgzSdUr2xyB7S5En/whOIB3koXstETjWSyW8+J2g1MxSh2g7cvmmGUrkYVVPIQdB4wD7YHqKQf6EXOaLfrb9Js/eryIWpMR0AgCB2g43LaEyMs2OIzKqH0lfXPVUoYw3DZVac4HYSCMyPdMePJ9uR0mstrqkt28mdZqI4k6AhMQ/DBhdBqpvGHRdv5ZL4IYg7QXAp8zMBBAQXZU3cEAMkgVCv9wYWlj8+aphmv9LPH/YuUcDIDc6ouTiXO++PBdgRkRO2TKMMmiwLn1rl3l189bJirT1E5VXHRfoJhU0EfgnNhjOXHp9DKkZ164OGPnjz8LrZE8xe80FUtj/qSf7C4cmGf6YjVEyxHSE7GrzgcddTlmdu1eUAXaAcIg1tHcRV9KZ8DSJ59WExKRUU4gSBqdl2ESxhdAJced/BqE8VLYWGWt966tnz8hLPYgqhcGJNfhj8NQYFNZNTjQK3ORK2K/K6/yXN07eiNy8+bk8AIYyd+FD/E8ENdFPGLuFMchcuOTlbiaaqwXEsXX1t64VXf7DCCweRKrXpeDJJRSkcm3FdDWy1uBIka/whmct4UU6/dfOGSy4Spm+fgONghTUtHcoF5DZLdyg4B4g+HdIFvXD6w9PH74bjpd4Jml1dy2szXYGzmkqE3XLr8hTdMccrV1ihmEnUQ8Bv+F21kh5tv5s1Pv3DfzCqFigH0PhUGjlNnhKOEf9S8AScdeWPyWXhFYxuBXeo6p3U5An7jyksOPBc2VflT2fDkoUFV9ZZoj3eTsZZ9z/1iO/+ta35YRl1aYe0i3PG/ijPQ3jDGx6fWEQIhi8HTN6UTBbax2bflh8JX+cS4ImeJhBEy7kS6xgzM62jcp4koMCYNV6K2l65K6vPGkHRoQ9PPQ9Yh5htoNdQ/wjeoPEinC2MWnFMQZUOfWKbPTaV/Ie3Rtkli3aK0pVPaMlDakrt41iktiaxrhFSDAAqbqyZhJ/921dRnJCzQL26rUSrkZajeHpmKELs5UZISpyODfFRSelkYqSVMKIC6n884BSHxaDC342xD146kiaCJm32PpIZQe9wgKRFqbTiY+Ddg0o5h0o5h0k4E2XGeI7zCvo/9cXE23BX3XeK2BoE47nDEIX9pnVOMQWTB13MaCWlCFh2X6h20qR/xj11w9ZMX1qQ5jJjroHI6SBpoSjpbE/8bbvSU1eapaR8Zl8h+XCC7vTz2I+LYj0hjtxfGbiuL/Wo9WWwtUexXjSimqjxg/MFIgk7naVgQ1nuYJ0PE0XTdN91fxM20eVFvwcCWq4qvhHeaiGei5RNJWdf5uWsQ0yRGftFjfhAmDgFms+EkylYqxoh9uS+in/K1pWCnRFn0bJuZpXYmUR+CJE7tDx2046Ik+F7ibH+vaE5j79X7t04YHrXh9/RYkvi+oYS7D1X5qbKLqKEkVQKYgy0uGgj3OScGPpMNbnz94q0z52OJjvp1iKmcDD1oIKXB+rHVBLsGZkHcH8FcOnAxglkMqkz4yKK3mR65mQWf1sbK4+hC/KwrNaruhsRslxhsR+2oPee+lw8eWjrw/tLFz0yQ2QvDLdYCXv9ph8B5o9IYMc1QUIJY6b3C3kEcQeU9kKQ2/ZCushfnvwCtwH9dLDeZMUkkYZYBdzgDl5F4jgk+Ut+xRNMIhKZZ81hdVKHtzaRZdJ/uquKnJl6knUT9tum6Cpe15Zf3Lx1bPbDt5jwhQg7j9dq9b4861HgXpC5Imp4E/T37LXtwH896NMuwZF7S84lBDHrDg5Ize+4hyWpzun44RCQvHX7lxtWTHpHsgKET6RkT2kDXkIypLrKErF/US46o1G3h03l/xhBpb0GVW0HbUtBartfRLISXmA+zqPVpE1Z9AilG4kkcPBRNgtoShlUyCweNaaZFAZq/n0RgFuHMcBd52OhGEuCq98u3hBqx0wNFDSb2Y6hpJPCPUwsTV4Zar8ylf1E38Bn9iu98sfzOl8ufk0cfyYZPE8J+kjpN0MzJGU1fYN1ELLuE8l/SJjoO8HYSvT/It/sRbzrkEWd3pgLJ8VEVV5TizkD1kqJEiZ8vzEFiqBve19lQhnBsvtLAGuDcloJbn0BNGdQKsL7Oc6JVU273/ghuvNQRaC42ARtNlWHpWHF6BxuVz0s3rDFioLkhMPds2oz5+pu7E7X++NY4dAB2nzBggj4O3vFsB2obsF9PTXVjW90MTSBJf2z3C81bAQkU/z6xegT5KhLi4zH6oaNxt6qNBUKsnDzJGPAmXA+J+QRBFHlXpKIskCnpLhGj8J9squIDQQmw65NdxJdv91BAQ5YZeWEviQY4Pd7upnlLu6nFl+VBKtQ7SdOZIo1n2RV9DxE9DV2D2ZlrudTsPUMIM6KfiPcXOK9V+0uVl9H+eueMfy5BoRYyDexpu8swZ7S5BOgam8skB9tcJj+I0rHA/5sZhz23UTAEf4xTuw9UXErY/TgxJCG4mfHKRMpEFL7DPj4DTOFDdvii0OrRRBu6wb3JGWEIov74Xv+x9bs1JmJzfMptCDzmHED0KTR0BxKnRNFhd6UNtwX15yDr2lZPdHuT4/KPZXg3bfguMTwVAxBIbnMfkyR9Mk6MA1JEHxgxDOnwK86FrR6V6FGfWmM8vDs1GN5cZxxZxDY1AyHbxFGEz/Ikv8UjtvikLL7o/xEmAnP83ujbLr97uvVtk5wKWXzUZLxxr6XnUIDMcRK+IngytUVffjppIKul7CrhthanVKvAMG1/KtHodZnrgWG1YWmGa3whfBNRGcefRVyJB/F3WX531XcxDGQ9xtshRnWhm2kUF3VkWE57IcLdiQwlk0vbNMhsbkNX9cOa1EKR3FiSn/h1KmyY/bBNLkEuHsj48ZkbV190zlLhEjXEcMHv3e9gDUEQbIvMB9hG5xWyO70rD2zCBmw0uupgkHNlkOc2OwMMrp3GiuN7NQvZnjDOo6dXXrno4xSAqSV2waeUqBox+jQbh7y17hyBq6OEbzl3YOIJ1G7+4yLhrqN5ccHqT83Y6dsBJSqv4EU3tzvZ3BacYpEp9tNPhSDkrm2Vn+BfBnnjqq8vqNs2PAX4a5A3GJ1Cxs8rYQTh4p/mrluMdcRVK25SVa2gIzU9ICZgvtJ7gnU2R/xzYJ0Dy7nZ2M3Nxmpudibz/phlDdxq4Cu3G0+53Tk9Mxltb7GQgXsMjNcTLWOm8FxPBGbrwTb3Fhi3wARtb3E9m43F2R5xNJsjZirwUTFf8ThBxEwENfc6jja/MMUsPG6cwuMB1TweSPnjbcYg8AQ/M/UOhHtNCvXAFG1aRSK3rkeRtrcIYiCF6xChzetSoEB8ovEFJP1Aa91sHNvbOD9ge8eXj7Rwpfas98ZmpWujxbVwoqGvx+3AEhc+0cKCAQGu4QjfT8WjqqoepNAy7f2+6nHj8r76UePnvtYzd25f9azxaF9rMNRu/XI9N3ZvksF5HULejl/Gmi1wzzA3arJCMdzAQ0PtgtA8qCBzn74xFOHjzOgPmoUNFGQOhopH3Iwl6siQuebcu1BLemQR0opI6xQsOrMhwqCa1oT/h7WBi27WgKdJAG8ZbRR4pL4MI18F2J63QEOxaZCFG41HDTVnNOp/DrbkjjTwnmDxVBi1KIcD4MnlIghN96l6vw1TssERJu1b8Yih949H/BPhpkkDmUtMuC1L3JDfzsT6bkLT1Rb9fGaSqyWcdwsXQkZC6GKP46At+wjMcgAOV/ufBz7mFbrgUrMDU7dL8OZTNO1nOdSnlv2jTJmrTlRkas883Usse9PXZ5deOB5T6TA2Uul4bNEb+pOR4enAvxiDww8bSgpwA8j2RKt4ihEY2hFbWxUmyebDW6APVBZhqI11vz1cu8s3t4QgoNagxVzWdGlWM+2Q2wxIQbh9INNRj1rFHCrKUrx09zaJdrHR+J6kjOhZDjjwcEy1y1BCVS2d3i2uP7tp5rxxdd+Nr6/ceudC1FXUw9YGMOH9WT0ZkhY4TRvyYQBG2iXZz3RpxBEb5GoDwi0Hpl8Gq+1PwWj3olVXWXwsbrImii8f/2p53yuuHcYRKgiDifrUR4gw+zDqiU4NPjT6W5JRON5BcrkpwPvf/9kAy1IEqFiENlRZ0ScDWM6ZAAUxBHh1qiuLMc7EAF/8ewwwl6ScmvuROWeAtC15Jx9NLqnnPRZULAmWphMREImk6mSCR7DvkqPTEjzeJ18Jzy03qOxb+1SWE1TvrMoHqt8sygSqH876MRFJu3G0rrpKBUgguhyWRBSxtZ5I1OJrNYWoNy0SC3opNjxgRACzxE0dCOzqs2EUDCYnPJ4hQgsxjOKf6SQRsQa5GNSF4qr2CXHsSISX9AUdqG9CIY9lHTGGObjF6Mbv6WAFe+8xzPXG2Vv7DponBmy1op4LfYw0bnMgul9ZwaYvEIdBwsFQ4YMwrhld0agzXVX26Fqpsz4dwYK2lwRFOolUMSYQHMGNDswQI0EBMRocG2kYWZh+NA5FGLam3x7ylgN2mfOII3qNm1lbIM8i3TA01uPi/uV3mfsK4cOp7SZv3sl1adj6PknQ6G8QJvMM4+vJ6hB6SAEovYTsf+gmYLAnib8I0lfDTlhAXDY8Yi0f4Y+1Vp8KB0G3CgJYT87+edi8wOH9jExY4L9+JhYpcEc/MxcTGJifRMmNFTA+IDSOhxE1NF+gNgsQqP/dUMgp8timjUZpIhpjtIVdtyhVRKZ+pFlDNiKacXvsG+Hsu0TYAVffFo208WbAmHfUxsZ1p+iGmOauUED4LmvInvJD8+ZC5PzD2t4W67zTSKHrPG9E0XVfcHl07RcaoXTdUVIy/d/rCKZyY8cOa/e0O1787yCdwj8slZoAzOUrnMu8JNyxX/KIT/RBsVu9JC/PqrcYIx0Ofnrj64/tvCLbzOSS5nZKPahMyN1wpHmjCDxTlSM8oOCSam/yDqTntN+TrGf63uYm1Of6K5KOcNazI751dOXoN9qvuVrMI+iE3WWIIxV0qPpNva2XvMuMh1eeFvaQ0c0r3328fOBwi80XX4MGXovVj4EHZj+8b5pUZfglc1vUpbj2Sr8cP5gV9OuDT5FjJ0mbfIrQ2sH6ViaSxs0TKto7/gp0OpLMvaS3trrXU2m1/MrrrrQSHCkLqmmrAF0h2JR6gKxeKKEvTkma5NZE3+ftWhJ8YUbS7WbnEZQb1s5tUuAWrpzCAHxedywcYie9DislkffKqUOOv2XUgts56qyL1HJQNNtY0Vqf6Q+4yuD2k4pHZhN6+htUcyi/9BY8/gE77BhITTAZgudLTAeM0ImB+N+oJTk8BpNoz5GqBFS3gIhFNR7E7dpC+JVhewdx+6Z9BYqqfNT09xk212l0vTlOHVr7WA9cA7Swikg0NSvO23CUHrG6hTingnZJxGtTAwOqbCRBkyBYfjMkTJ+D+hwEDlmFNnuWVCOQkiT1eJz6AjlI4ZBpQ+4jfhJOADxC8mhkP+awEeBexJWWsEFmbD0/ZuwgwIZR3z1O0QRac1WEV159ucErdTqfVlN4BbkBKw3KnMYs+vbeKdwi7uUxZgFV2ZN4p4ZX/v6Sdur71zYG5BJy9bRGhPvDwm0GPBCne3YMDj/nqlEgFI0LTM32kiJdhDp52eICJacDD6md60BJzXjac9Rv9ym/my3m6wM39+0H/GaR94r5rdkXOSx88ZZAyIw8H4Z9I84nvh8m5zu2HZbPn/DtIE5QkqePG4E/uKiShXaoxLDwLczHmz0SSq1xAGroAAFRR68AdBhtM4xo0/pNH5VGEgs3ZhHEJ7+928aeJPxIUAdhw/VFjGyA4EYfknhrrfwlDXL2U2QvegeMjLFDdOwd78Ga6qJZi6Fdy/1hdH9zsPYQlm281z8DuObIzyIVjh750QMhE56kCw1nCMCyWk+7vVDLLz9Ik8X55hitvPGlHyPJHr2gyN064He2m00v/OKFv2x92Vcf5rvlHFmXm515Z682nedf1179HM2L73rzBZHmZ6GNuqp0ISy5MQFhySWC3fYpAtidNIx6kxOkvICts4AftBSHUuCkEKMes5QKdDtidaqDZxc69sPqQSidGPa9+AX6acZeItI5QmTyyz8CksfIMz7aVYQPAJow06z/8tHzYf21Oc+WXhoWmPFLBSLD+kEQgMKx03T5E4Wzrx0w0FAEixdo1tQCBsKqM1zAV9W8j3hUrn4ZllXh2ulnkSUupQDj97ewAyMBmmfzeIjbEgH5avPhuWphudRzL+B6FswwVP/N8YDqkUxzO5EZ/2bMnp+Vc1FL/Ft5u4N3gSEKTaPo2ymgPU1HLrULjGaDc2sOAdJlJYYC9faTlkOdsMz596tPAe7HJ379cGvar54NW6NOjeGsBam6ed6Yyloqn2jHUBIMJJWEMzYrL59TKPtCynNjEZtk3E0K7pB+G9p4T/wLGe3WJ2+3Ati4CIHt5Q7w0DX9FR49GeI/TkuklTG3gKkjWktJwvxwSq4VK+q//AEGn+JE4Okfdob+YePmH3ZW3hh5cvCBjW64Z+OZySsbl0z+2IBrorFsfqwxCs2vTQhV3BV4UvKjLYYx4hQjPpH8oXGFZAfdjbXDPLDGstF5lfecRTPmjIyZJ31ab5GMYyF/ZJkhRpsGI/1kI+RZ04/lF8abkC9hEKcGmAiroNUeFhi1VaWdTrFJ+ANyBuQKpg6WRMcyuLc5WF5c7Q2LOzpiXOWplAn3gJU7jKco9totcCUqz4bgl2NcKyNKngDP02OT+ujdmhdKakjZ7GPyswjq3yTkQ78psP4mJKjRfKiC7jfNa+CJoHrSkjtZPEHBxOF39LbVRwEOvJPXicuIxu7k/cIy9QHT3Ob1YshbhaEb4pk7gW8M7Ndn19OQMBv342unp1vrjSntyPTTKd3I6sctzcjU4ym9yOqxUSvyb7fVirDVwPLN/VuUbq7siTeDItKyJzl29Lq5DVYiXONsR5Lg4QMuCXrCOCaKG0ryiig/nOJ1DdWSMi2h/a1vD3v7PhLxzkqFlVlmT7Ffc8x9L78g59QZQ4ER7qz3VHyAwvlzZjj8YPnoOQsA05C2fNYba1hSpkfiyG57f+nid/6+Su9STMkwkV2K+G6X43Clad5CKnlkeTOKks1mqmWxP/i5U3/pl8G094RGS18veiPBj/msFPvUZC/q/N/vGOKUB/zVzXYNLeN4NzH0juKXAcOXksBpKEYXzScM5ecAGXkscas/FVWufuMZeSjKyN1UI0tpTaqSATOEFnZk+RlaqrhQi1BK6H9TLVRQafQcpVEGfcMku2lJn5wYus/WyulLNy4fW37p2tKh/SHPy2xpYWYi989bSlS/Ga48xqSyAqAO8btXAEtKxjhETe+khuIudktH08WI9WBGlD+I25eIcEXpfTFcF/1V7+pFEjLM9JjcSwqEXD9ceTzwypsfgOQvL17FfCxeDpi/0FiRWtJxKd6BU9KZTuFO9FAMjvAoUwRU8JmFjbCNPqgzVNKacQd6hI9DIiEyHLCg2RXE49oolj89IuFdB4/4KCrxRJJA58I0BjAtQfMyx0w4EAQ0mhDJAvqdDYW6bWaWOlCYTC0zx/Iat17/QErMPW8JDfZm/Prd5P/55b953Vhe2j7gD8Evdjn5XOxqM6Z6NLDLr55YfvFFaCAdsmTKLxUpgHu0K82Pz0uJO+AVc1hprSX1hrMMiQhmeP4cXOJufP1sqDsEOWjGPgBSt2vJBQil+j0ED2mS/xGDJAdcW8miKbAFkUiqA5UjL32goJ+9cdmLnIixE7KRMj7Cbnat/ISs8h4tMaG+n5KwnS/hZqLBOrN9LbCgBnAuM/xjlSU+9KKu86J9PimblJdb8KHw2TWYCPlC09nhg1qbAKq2sw8xFDN/AlunKyUEHlCF4ANJtQHEp9tnigNLuDm5VKvpmjUQtcebLz6zcu6kOLoi+9fziyFL04CqwZr5UYISSHeuBO/Z2dQ3qSWsGdHc7YO00Asekd9SRs3yMmG7VpLEX6IlNCXUV0tHjixffvvGlTc9Yhi1BQoiPb+KboJfDM9PVzp+rXJg8G4e/Bzjv/XhUYcnSU9Rq1li6irJjxEmo8kuOnwgU8o0GNFyY4NwIkOXPU3DrKI24ohgSZlF0SobRTgfOY4VU6tgo9w69iFmZ3qwbCFlXWOp8sZhpRrFZMNym+FQa/cN9C3WnbDBUeHbhiLDNCj9AEbSuKJmR7ZLJHMrTcEvMNR6sZMrkFXO7/Shvnty6ZNnUKjCh0oH5q5E+GqWf2ELgI40vatckWeW2qGS3pUICqi+l/JbS4ZXuXD1GrxcmXWG4qpow668ufLWWRda4YZAr1KGekCmIKffY7kViQmpckHQ/VnmEEbFmboTNUklUpKEIaXnPZ1ad1k6LWGV99iOr3wYN0+8fHPfy8v7jgXZ2TJ4m0ZB0x3UxcD1CU9HRU3wiurHOHXlolSpkFp5E8q23Jbe3aeLkHKR8jt0x0MDGUTUbVDS0pWCKFrPGXBfVw945FRBzas2lAzcqt1VzwoG7vPUzYlOCgoebIuZhkg+bTSy0YmBSj7/Jaiki9+y9VheU1IJD4N/r1TmYWb1WnO9A3+p10U/M4+Leo+4R83VwekCRhvnHeAke+VlZx8QIZYj9A0HsKImKq+EbcShq+h2hDJNwMOKNTW9CV/H5p+rNVUbAyYnl+GhI9le0A+DJm98fQg5itGTdSMskn4caAD8qrk5tr+Mi77+em1Vw69+4GbaXp64G/+ejAnGRYtOX/+O3Ytfs3u4rBTrIVmT3aJpW3HtlYHr145/JYzC6UZZkklKun7IwdMnhqskm65LyhVY+KFnaU88//2tjz64deRL5/YQ5ib6fiA8S/mBXU8bQO64miRb9xUo+LziwrkOGPlOlahzUS0lTyk3iVJwP2soasT1Ja2ac+qlpW/2odMbV19ZxwcEGhiXG8QfmN3yQq1HlrmNFWCMz1+fNXcu/lys3pkP6p35pma8F4inMoERAa7X2bip2KhfCGY/ufAbc/VG8s9knU0/0FVC3VVUZ3U56iZBvvOVltRkdqTcSGapJyB0DU0jrFrLY87VqrTTMF6e6lV2IsuXGf+TUY1Sz5OpqDMeCMCvKNjofrUE7IGpUI1G9MOZCSfnyIgjn+9p/vGfCJybZSyCqi6MCCNFiWK8zC/0DlPDs2SCkg6nGKKvrE1fydou+kf0lYYUqGU76JrBLnm7LvGZagZrS9bDvKmuCF33VR59P/FkrMlCN5K/6WODXjDb60fCDgL/7DUaocdJztK04P/LX238pVT2g3z0xLTIP/UsCPvT94OYv/qBCfhTD4Jov7p3CvX/a22h/pe/+iVyTFCY2/G/Gvf7Ct5k9M/UKKJi3jIS0UmTkUb4jFsj/099MfOab3We0HFTiqf18z+7MygO8i56gt585lPPiPnz9yWpKENflz/3vkqo670AJMKrQfYR7cN4F6UeHc0r1s30j4roP2hKGBHQT3g205wRSfzjP1EdsdbQDdU0s9XKBye9lc0vFwN+t3GiRWJM/rZpIV9lNqM3MKEugtdZhE39BizFFhbu05ONu6sG0SVM3Kv+rmPwQfQmU5fKR935lS+qfGr+r2LarDbUj9JlkDFy7AQegwiQ8370A2WV6rwmp3CFSpW1nh41AOiDSk0ceglfJuRN3BtqzEA7dvPae6HMzEZ7q78xAoQ0t5Mr/JJ8/P3+uilScyEUqVH6iUWcJ/3sI+pvLJkECQOZxEdE60iZwEo8nrbYnRk1Y/HNT98KaScVUZcBCm8xEI8Qzkeemp++5U1vXzDy+uu7Q1lfk1oPvIZak3G5SUspm3qdYKsOrHv39FwntLx54rw3m073kq2V7iVdI91LNpXuxUlqN8SxIoI1pHj5OZPKMJBzsckowy/gfSmf5AWSVW0mJ71syiljG6OYssrF06/OS7rCzEukmZkIqeuaovKLHy7tP+qllHUXW8nsed/K7E2LVVaWrS+ZZ3WbVGyoDlOVlKcIMGSq6WqsOcLuaM0Qb4RSYvW78V15kQaxTHhhylu7+jCqIm/xLo9NnVzek1iWrX9cXLm6uHL1VDNogDBP+QA1xo1xZ7CXi++f4BLvDjNCj0An1p8ik6Y/4JO4P4yWCTEqeh/mqkBVjZ0X6shRH7MWpR09sxcKauw2MwcfDsuZqKb08rEPVq6+4cm6mKDDwaojPSsFsEuHB6SUW8SSA3Q3ZoFmZ5dsaysZTimpZQZ2N8qIg2HvHerbujoqp3YzZV09LjbmXw3TKuca4mNRRk6it2EYFy9t2SALkGeVc+Bt8c226AJJ688iohIL5JAt7ErB2klTYtcNaQWhuOWNkObdqZzlTCeB2x2KoJ8fJ6yB7FXQUXgYjqqWNr1UPNNQVRIaqSpsJJWmMq1S3qaoWqc8EFRDF0BnoUPVP19gd4EYLVhgr5IhyGHYooH+GFXryXo/bkH8oJKAOMMIflDKpWvPx4EhbUpZNGSyIZEANvA9HUHb//4qaP8s6dWyKONAgJeM98XUGshh5g3svAW4FwHG/NtwX7kawf33J1kIrNNJNzB9T5mN5JDIj3+n47Em7CGLs/L+c5Kv59XAUbFi886NVT7iuc3076MIqtVo00HUeOnwO1FjOA3Oh4S8IsVKXQPlhzIAsfRC9YahHn/1YkKdL3ovQa6Ov9+MyulhuauIf7NnHiok/vzDBjmdZ2I9BAt98/40ixjm5hhwj47v93EgkowzsIUcKLU6okgemjrn2W/jsXaL+WaszFBvIzVgCqkTxUopINkMDkhGaNFL3AaijvaMXAkkh5yyUc+Ke3oqCxVj9nAHLD97yflUKraCgstv7App5S39JJseuOhN0ZFk53rQ9OG2NNL7H0jIdyehzBD4FDK3YE98Etp+1Sx2rjeL3TYLC6WUXSxxlGsHewQs5IguRnENeqPtR4v2Gt9uqKWmlwiOk/4iJiGv7Yx2eFOO4AMMpS+tgR4+zZzhic9O+mpT+xMYUrtDXtT5UGdC75RtJMcYYWJHvwHrNjxfqElurF4Z+DaWjq3ZKDBzEQ9H7s1b0fGhYWxg+oBKoGv8UotRCiyStY1Zmeg6uh/dbjiIiH0oyR1sZy69nHm2kfE65bWItVbMviHra9D0mJITxNBur9I2BTrdIqh3ssNiUhbRMUPlgd4QcxudaUhMRF9CC0f6EcYP6L6F6mP6YZhHxNARr3BH5VPFWw2WjlD02o00/zxRFBGoY8/1X5ciSNzgRIuOyhzZlOuin4B5AsbKHG8gLSxMbnQD4C1DE4Yi2vghqqYwA6YmCWkE1iqmsOqNVi2F1U9bpRTWehxVUlj1uFVIYa2xUbHyP29TRgGtFnbsaNIc/M/IW6KH+A7VB4LM9OdpMeJd8R3Pmge5e0tbTjJxl7aEZKVmyyTbnNt5xy2WsvU7WT+0BPdpLbVcgpgylW/WKgnCxfSZCc+zBoMn19IMrPiiCYQRowHbzsO6NZ/2hCI3//GVJxSx91l+LwAMcKwCHyHQLE5hDRWvAMWI0KAEuWUghP0oPS0Uf4IReoqlX/pSbZ5ZftIZZR0qCmsr5vIjhbikTRpaD7P/d997ZD8ITUbX5VZViKnYv1g/5MTc3gAU1YMdKMCJOIo29KBDFbMCCXsSzTuieYtrIZRcP8XYkrK/EmtXXTXZEY9bIMS3K+fe86qz9MHv5LPNCtJYzHAa6OqGFH9HAZp8CQeGRXRgmLZ6v2wUrck2D1+2PHzjjKXjWgP1emKg7CzFRzcXTZ4Cx4ulYwz7MZBVUz5KoKXhO+sTpMkGf07dsioBCEbM7QbGcjvbh4Z5R6o+8DP7I2Z17aMyjpSVilM5qXQpWZxMtJwsMuNXKWK50b2BxBHoYNIaRrkFsT7KC1btD2oGEcSNwmsmA8aUnwZcD0eA3yKaeMkjrdLIk7rAY6YpZ1GFog6i/IkhRwYfFQLppdRvQ+Ml7edVQ9PPML86yOfljOdcY3upX2HtJ2fx2TU3UDHYKD6mD9B0xD+Sy+5hUznBdtejrmnlqu0nTcpoXEFeaNEMvaz9plhAS1XSXz88dAg3vj3uEMS95iGSt4esgNIjVJkzYf2JsEGWLrwMdjiUfpeabLXxkVqqrWahQr+/q2RZWdWv2d5ADnaDYNlSsWZUBhd91hXxXKg462rd41mHTa9Jj8s+jRFKQeGEFu5iam21A3pDqVPqDVEKueAX1oSh2hTep/Tn0XS1XtlKI5jOUSN0Hv+ZORghgmKxAwczepKGuUpjPdR0RqgHg6sAyHQSwYeneaFoTDt6TJ1De6Gb5cWXvZtUqzWJY0qCXWGljEX/BucaZdHhMQoIC6qSw5eif3xf0OWCe4/sElShMuPRl/Cff+ShWg3he0p/26HNN5f2GyWfgbe2SBM09UgTK4eHLme0tRbCE+WhlzYv+JtPpea3GNu1YpSGn4AKWPjJ28fsM86Ir5UodgI/qdD0nqiO8hQo/PfGoOltcDBUTKX/YQOXLpJ4n7If2abWD7wl6qwnzgmWjCSDLR+eA/rR9npCT9jxR10JkSiNCa2EbWJD5vMEOpIYHhbbfvUoknnaNJyXBaSBXhgXyzz8QItdb7b8ykFv9pPQoqoT3DsY6RCvnQv6chhpB5JLe8FiKEaVIQFxh4ADkCaiR603aIB6RkWZCePwKU+D4f16lkkdlGTLfsoGJUnx1DHaBxVnkWx0gSd9XKXGyegofG5w1mQ9jMRWCQOR5qZ6PXYyCr4TkaJT9D2fnvBJipVZhKaTz4zcJYBvaTotFLyumE1r+aCFkeLY0r1HPWc0s+rkuAZvSAADTfRQTqjwpYnjPIvlhS89BQfrcAtrHaQtZb70uEluHE3apkLG0YPLL9ksOnnJFHP6137aL8Y6ed6q1z/znDqqBFEkIqprUZ4y24r4IcGZyqrKivI0ZQFWCzUZ0W3n05UL7/xTcDT9PuCgpPB6cQp3wI16Yl3jQ8FKRBxmzO/EnKdyjD1yOuRxIkYx8HXxhfJxJgqRdzvROHvIBKGKVkeHoXK5DYPl/JrzVs5XOVMV+Bt8cmF6NlRttsc4HiOJxukIU7I5mAhYCFaMAltImf5svAP5hsDZz7v0b3ragbprGa9hbILxCGX6gFVLU3RHHsc4A6PpTtBF4fWQ6boecjWXfJgHonEHOk4+eA16mmYqWDW09O4JKUloYBjYrCszp99WqfUOhQAZ7SHZaUiEkwWnA5RPjbAorg8E5baY2HBwwNu5q7/0M6u2iyiWyNVeeopl7POnvHIA0YWjPSI83zOmyoFahtoianFSw01ES3eGT4hJTFpQ1YSyEPpP3mieNGHLGhUyfkTIvq2MfXsR+/YS9m0F7NvJ1/9j/dIY0+L1/4j8F8TK45XWxbdK82Nr0SfxSnzUwhFG0K/rj8lpEC2UAxNx77JspJUTF5Ze+JtrtA1eVIwXexu/g53GntNK45CDmaYBbnYaQnc7zSCTwl6j7VEusC0urkmuH6ZV3lW4tV4xsmTA11rXxjkjCf7K0Q9ieHVoHPJWtcBm9D6aDU4A3SRANpuCgnWvaDEDPuiW07w/o4wuzO5dFKbTqnGgGkDTZcEC36Q9nsUXugcQoJDF9y6hgRdwgOQHCC5KhQuq9iidOvdkYapSQ2Sx8mLbZUPTxLR4ftQNooBoRj697EjsvsKCtu5rg7vP9g9z4dznKYs5OIEXxgZgcQQEvf5G/aJSfZtyG6XYRGYtZW8dbc5Vr3Pskhc43NJPJc6P6qQp3C0/GPqVQIYLL4fet6xaFJ+EQdYZjBODqJnq9hFS43HRT0PBSQz8Kca2C0usavVx3577BvJdCTDCd/iuzJm0WoNBF7Xwg6ZoFW/QrrtYIE0eW4UceV5MmnuYI1hocuTZ8ErPuqaDYQmphAnCuvF4RNfy/nM+pDuwsungTObh4FzsgYjajQ1lYqXN+KPnLrFjKbyygUTZvFHPKB8lpTsOmObixEILjCqW+GsMs7JkiRqa6dQgUc9ggKACMUAAMkzi71WZE6p9s6L9VGq4hk/XwiYRKhl5DRmt8yP5wJMxRK8hDbtx9QxIWr3EWXnHIWKzNwTSlGqFa/WqoUZVWFtjbgq2JsU6LVrzMH25Ov1GX57Kc2Dz6OM39kS1dw6D/a9i5g0J1jXDV2NWtG/RlW/RmAOjXs1w6f3ZF+4mt/s4EEAXpLN08gLjhqEhYNGYeHuLwiSpZfHxN0yYhk2Zrs8Vxk2ZqM3SUk5YpRX3Sm7iUkNSmJFki7YDDRshq28mAbylYVXYxnxwTiJOOGhgGICgjCzDL4zPkeIlufjlNx5VV2bUS8xECjhkXyN7Osr8Y0gpw4peyONkLAqSITVetV6IwstBUelFQP/0UVChrX0eILlF1BVeZj067XrEt4oP3XRoiQHpDS8x3gGWVShVQIabFdkzQM2uiuayuRpJAI6j5o+/CJRFzby2VLZjF8KOpZ2WA1GTr6COrpt9uWKww/hywW+/PyPK0sEIEv5wFQUSN2i+gFqcqAogj8PD0BjR5dxDU639uS5yRMTEV0vyrHKxlZ5haWX4tz58FwlXsVSY7cpVj0sLg6S81h7TGgNpdW3kKe6SFCH0FbDUCS0g6PjFLkFDZ/1ums2Gk2d26hMvu3Hux2mKnapwotYmdcJa1v6DfCUJXKmShhVeUG5S8okaK3knvTs1e+vFoMH7CSyUfa+GhxLe47t3nIdKub+l0A7ssMTYUIrOy6mQY3O/auU74SWx0FLuy3ZDc5o0TIrzasCigVNbWXxzHR8DMuINi94w5zoCv2pY8sCNO+tsa978yRheEPPGEWMsGi41BqV7cvoXLUhySWKuVA0GOfcflKoDtbINI/44sMZ3x7E1DGfEba7LYQXeLmLsbvsydSYNI3ZH7kiuGW5YJGNrhkpM3HGIigZyL8668EhbZA8jepowHltzX/D1HZRKPoodlNqUuU2WDXlGoyuGMUUNtPR2b8ckqEV/piau/8TkIKYFa79tYzaQ/zz+m0Z+bcz345/YsVaEsladFbMUOIrxfVAzfGJtUid4xRAK0cgayRQUdwCNJP8d3zeRnTqdTGGtN5pkCms+bZIprPPYkyms9bhJprDO2Ki++O06yRSsUbljRzGUKp/jHb9ttBc91IOGtzVSr8F4PUeHGwQvDZFqD+rRUnyjh+bx25P7GWuNoUic3hzrLQksM7e664dnNAOOLO+33yAswTM14ZDBqTWVVFPUT42kXttwtEHrIy9W0hk9EwBNMh6rvuz6YcmDplt+8WMA/ElqZQHiNS4BxRQDGiqKxl1PziapMDseQ2o6Cw1cyD1YaBZj0byUb50FoICTtU4XrR7YRBsnx4GmF3RW4tdGbV0ZQo5p34KOX2IFPRf4ze8u33rmI9f45dJsTlUTDpDayj+qOlagpup5bYrLCDp0mI8F65t3Qm0m+2iyP1vqXKR9ZhJzZny21Llg5Jp55zMeZ8GCNIAEJnrpu313BWy7y5MNREqVBBdS/ySiYUtEp2ZJ4IeI84BuQyyPcyoh2ltiLpe3OqR4uyRzOyIcrbacJpiUFc5Z0gi5gjD9G5cvRtm+NEeZ9RjyfmnCQvYZEoA1L2aeCWxWIoqtU08K1vTKtGDssz2zLrdumFbYv/oC07snZhgAeA13MbWZgz+triKknKdEnnHiGSdJZXcPtrJFhZltibJGhbe55+2uT88+nMoYUf+WKPVUkKYGOf0yVMlm7nQ41imTZtUa9B2iTuWz9LzoDIJOZe8/+2pzuEWtYbDMsU4Sk3cd1jgNBoEkALTysgrMTImilzzjYqOG0XsgQIMs6DGTElvUzQh1jQ1pHP9KtrvhDQ4QpsHZMEJ68Min26vKc/1mKgRF5Q5s1VjuwFeNbhhqztxYrY00FF9IkHiDLZAPIcIWzBfOiT7KQ7hBgpWLfsNaa95w18SqI4nkDbdtxcTh1oXlDtcemuMt5tgFO+BS6m8hHPFhGKpbUxWQLJ/bVJ+7JlvULBQKTmsdmMZYQK6jNQ6BDgTfgcRnQw5lDnxVtc7B3a6qJNBuVhVJtFev6kErP39XS2lwuZQEG+bOGfvy2Xh8LFw1L78gm85sNT/jqnlHXDV2Y7Hekk6ARS1VcDne3whRv6NxWBR0Ck3DR+MgMhDW7o6kzhW6kidY7+EIpuwWQ0/TSPBNpsaK6htP1Ei7kqJWhe041WEToxK0F25zOmG+EvB6koC2lGlmZaz+EHhbScNMGKwutRW7u3IEa+CUoSkoQ6JQCcK0sUYlZCxVj+aTVuiOJAN4S7enwKMQK3PdF8wRec0LLnKPd8Vx5rYvIY5YVy8fhHyAz3zk5YOsYogd+9ZuoMo6cEOsEuL8kFez4KKymkVAmhqB6ctmkWu2pu0lVSTHFfU4TF9PDcP09byjUZol3IqZGM0J4wy7lZB/mm+BnnPF53LKDZnLwPp2LJ02BLKADowmUPTS5QKpba3V3QwhoikRQWkWJ9KEFDzmzWJwCEGPqcuwlloinDI5vvmorxvX79l0yFE7O+3Mj54Ts/Hm9l6HPLNj1YYhdUa0xX3GjG1gau+aR2yzh6t5wwcb7mlLxAxGTOD2FgMYeD+T6du8UYslmmKFpnigNvsT8T7pQMq3Cr6gX5EwBxQnKNO65lvQlWu9wzAb9iXiXW7DTTH+ucVN2a5osRXcAdOfqWElAhvxo5QpJrMxjX1Mu3jMunCCs72hq4Gm3jHxC3TPEDy/kREiUl8eC9F9C5XYHhGfQHgCdeCrW4wcPGh0YHtMAwL6j49CylOTmeuELlvAlxGyXP/kNFhrCmXxmyrGf5DADTkRL/0IWD8UrcPvigvJZJIXW6EbqOCPU0vSXKTrwYab1l/c5sVGjXG7lxptxu3fcqXGbd5qdBu3Hz5VHL9ZR8XBtvOi3Yiadnf8Jig61JQiLGA5A/tOmbJ+mwayjDYwkVIi6eBwUpkEvqSvliYWmmpnGl5UMxUHU/HvkufY3xpA4daYAd1qkVbOysgtf3AYTkjLB99o1A8S+F6JNdeG50Wk4MNa5xJ7EAbnegk8KXbmWm/HGnQlERdsb0ViI4pFozMah8zxmIB05DuOJaTRr8VpF77XphWPM+oLJuz4A38XixDeZZb9LGneCgmHNb2TuLuLL8oP5/aG7MOo2XvrhUNLF1/0wqqJZXRjkrA0aY1Av8FQqhNV9kIlsZLWsWs6Rz8c6iatrqn3vPXst6HTUHhjtDPA8mzBq/qcek9wZ9ZjCTLvWGIhJLSLdX7V1xDugpKoDj6bH5+ylE1kJoEhn2QMQy1+GPKRaZjwRU37xSPxgiLBUhYK8UU9iKDTgA96NU03kCqfbmncoV9jFj669VlN5BOSB1DySMqT5nXq3DTL0hCRN4+5EypX9Mxoj/5Dd1QpiLj4Cf6zzxesg0ngnDc3ZtC+2QqNi36MOJ8WQzXfIZMka3okjfUwUb56ayvsXOzOYUwhkA4qaw5pajkyC4IMC4HMmRYPKS8Vuo0tLtJmH1Ji6JSFA7msKi9GS8qsD5xbevGMh01GfTVnp9VddHKadW8dH+t5+vBI56sODnqPTg3NaIy5gMs1kokNqSwbTM6iMDRCZRSbQWU27/WppAy6FAnOJE7cXp/tZ+KiLckFxGD6x5Beda9IHOrh/dVnN184e+vY8ahb5FmTPoGhspLClvQHwIjOKcrOVG8lsi11Wn1p/H7eV/uXd4dKQiz4wSBj7fXGtRMrR762fLeoXNTL1AeAFtYKabVUZSyKY7pK5J1CX5Fs8ZrwqhK6UUHEKEdFqBgnuFOqTp0wbzYNaD+/9Ppn9lkHqSkOIP8z257dogilXsLww6Ims4EksSH/uBhDAhehcUKDkNuk0jQyIauJFopQTxcPth0oJ13Mek4Tgc/8NJbSBOBPXvYYXGWqmQUS58+SLRrDlCiqqSXao6IDjTLbRDfD4JMnGgLVjCBCaZy5w5r60hOlcgChtJ/gUx2DLdZGHKqFYSR/41fOBHEpKu3wh84qPGrmpGF93+8fc2I3rr6NBCq3nvGCJGKlnnxUqd6AYS4zPh/2oMLjUOmdCo42hzo2WUcToOmaHXlyMDk+wvNbDFGiaXYRcQcz0cyTTAwtPsWI0mNcke61BQ1tSvJOqbFSxV5gwFksvnAP6lYE1bzmwlc3Gujt55LSYp80CyQyI/tCX39TtPQI9ZVhIirKEiK99MnN747ISL893kotJwuCWhwy7qeaNHM8eRULm1vCOWQQGOum1bRz0Hah5/+I9e9xl+LY9fyBqD8NSkjtpFnAgp8yPgtHTKMWeLwUO9vxYrg/UDNPlwf9B6rKE9VQ3/5GphSdbUhv0cdrkxM91agG+stMC34OnQQ3XZICR10WG5nJiTKQnD8wXCVGPLTMjs1TwEY+rllz09ZN6iV1Dz+L1FBLbz+jIP+lzn8hu6Sc0eKRdpY0FXan0TDXRRmeDbNdUHNF2WZyDQ8LJ2vp2KuAb5USxC3plNvisCZif5N4EXW3SfuN8U0Or5ndZKyWb/p0qZsdLqZ/u3nBqi9IkJUoYdJ+k2BalWd9vYEKIgOt65lpPRlms0V6gtQqoc5VJmvmGuCL8AU9Wz78C8vfPIOj5VhBardGJjHoICRL3AJtYpJBWhxP5XqQa+YXd3nXBZeTu5fO7zinywe/c4lIXB7RWJkN/VbCHiNhk0QA6Xrv1DqsTzPjKJliiafRpI6Z+Y7YkLEpJTen4QFJYwwtKWq/0KMesY/YJKPOHhUY51E0z7LEDZJwG/bpYaK1wUDahRt55vTKs5/cumK1fIN8IWa8kEikZIHorgbGJkyZMq9VQvtBsFDfv63q9au4AhHCEog4aPo8vbtJO/XMaZjVPe3UfQMssuI0CxdYSEa1FuQU/nnBqnrmwikyGS0t+cT2xATIzwIk72hA/ShL5GOUreOA4QMPLkV4OUQY6Ex4kCeLmb4KRsaimapsNwkLerP9Y66D1tvyR6/D0y0gOU9RNFI94yh4k0da0iZHkWkMPUvRYMOjLW6RyIA8YsAEXamZFEFnpNAGhdxjhJmtDzLYPhqRQkIjBVRoayneGhEuFtoaOa2RzmKJbFoWmxbAXESIZINpISsWrO62NlosWURiBRn5uMCiZdntBaV3LCIEwWBKgS4ccqtKI/njDd22Lh2UpdGlK0scs8KB/W1xoIHXzXVJyXAyx6Ywml5hQ5nLwFCG9FrkWYcuDRhLudu4E+cN27yc1frKnHETJtHU/g2TFPFGxrYYs7J+gzY7Ytw0sy1D+SMT+hdUY4RP9C/sIEW8QkOyf3xWtokjykh1lA6wsFwvJCXMhOjkyCiGlXvRYMKqea9B+g6rr8FCKkz5JDlDzEMUpb+QnNIIo2FOaU42PIrmzBs2Z+A+Irwm2FxQpCrFrtTElowsZ1C5efhqair165XgH/ry0oV3DQUaAvVRtnOrVOqQrbl1leJsjRcahdlaDxtF2dpPXUG2xtNGMbb2sKgQ+/U6CjG2mZeQJR6zHb+OE4Ig2FG8HBdClsOtIcB1JOI30wu2EiNuo4SF6YjqoN1y3N8Nbk1THDBN4tbAak6ODwK5kkwFz3/o5KoZxlOrO3+81dtTrT7+rEqiAN6cWxW2Z8zo5qOOmKPrVhpHyUqQqWW8Mptmsir3IwKqEBaE1q1UkaUkVdwllb09CaTJ5wWLRnB+kM9vXDvm85PUFRjHlrU63tr01BLDpXSf9UU9ep0wc0nUne7vN5DEhN1xyguFRo+Aj8u0WB/zCi2oFjNhbTJJAj39DrPjKzegXvuaZE1DmCOM8c37S3871GLi4QkGURK5j5mddmAaD3Y40pv2DqKk+RJmnUO7lI1nIKs93AQsSxqS0KtWQ3pp+ehL7NNiJ0TDAWRhVczptzxaSDwMQAq4gqcURlCT0ardXgOeTI0vydoWJHl74mXOpba4poGuVAslTl7SKpTek5ABrQZDObIRLk6JH7uUQD/5bbQg/3eHSHfe6VGa5BgN0Hyj+ybiCvOzkT7H9qFYBV6zidHBz3cIwuzh1WFulkAvM+rZ0c92h8QhqPKtnuVaRkAzQEnE/ZG/37z2yvL5DxtuCx3ez2ReAV4LeAPXMrkDWm8K8o2vv1h6/mAEmVqfGP/s5S3P5KrstaGsdNXLon7SvJ2OqLSIdcBR147EB1jCPZN74+ZxGpo1e8S5riX3Z9VCIZ6jpunWXIPYLcK3vdvgyL0qcAnxNXwmeZdbMT2IhcFO2tJyA2+1LSWv20C0q6i127XQtcRCPPckXHcNjoiD2C5dXXr+ksSjNKFMdxtAqj7ecQcUvwJoY69UytIKMafoe3Kmz0o4UtPEEgDL6RAs01GXzTF8eivzBFM1wOUZOu9bCaQQLi4KgUMSMfDRRY8YAIUQrjM1YeDezLpXt2QJJxCVSqW1oXHMbCg6GTyFvAp2KLk3DInfvC8ySHKvDGtbkwpLhPKOYI8kHmNIkHXz2gdAImGInnnFgqMEZfJKKmHJlxlLcNgTVFVI0glBTcHPHSWfJ6d3Md6JfLOUfb7wocA27rmfq8ZdUZQLdVrum/dRv6luBDsLikuBx8dS2CMrH3QbeyEErdxAnZIGCDR95yyyKNJS6P7js1FKDZT6K4T2plJve0rhBr09yoirKW0tXRuzbjiAUT2lcBtKLj8c7TXVbdSz6T5EpYU9skFU7Ln2LHbizYsfLn38fpMxe42B5eKv3BqNpbPtT41CM9q6Irfy7qWS+MBSdbf7fw8mhah/twhZ50VkNpKOB5HRiH32zIMxnqzLdexK/gkSHrrCf34OfH4+p2YaMThJ2BRDAoMdgVH9IDQ+m+38JBrBOdmncnUG9Y+kvH7ESvz2I3aDdIxhZ0JSWpRWItCO/D3mO35qN2ky1ZGxjN4HZQXoeevEkkEhckyqGzEflAQ1OtYh/9Kz1FC5aDT0nymks/zSUfwXYRyBvt0AbyPQLQHcw0EnSGh2ehQGZw5WK3WnWGezUseNymSlawyxCkusLN00YsT0/3YoGqPxbD7Uf56va/oOjB07tXDvXOrPSe3qntVWEPZjKGSFTr9SfEbiOVPV9Pv8JIhjmMRT/H6/lCnbPT3BpQsHl997v4X2czVWes/3K2ZFKv+ZJPRt90Dl7o27l9vjGXBCofeHmStxhiKAj0HW9YtjSxeOsXPzOJLNyu5y5AHcKPF289iUNADzcehlWBRAY/Vs6p0IaKlVpWfwMpWjFw4uHTogqdNOHmub8aOu1rc1T3cZjM6r+tZkkKJnskFYTsjDz3EEVmmuq56pvj21u/AJtSCT2Wr8C0rEEMrOTn9DyfC41jd858zqTcpO729t02ie+s69Uef3R3s16n56w9oownZl99Su/uu//muj1mUs971m1pdHrts1tS6YxjCepqkreOf/61pyr5n88VC0vJIvewCuwuz+jZ7XhBAqQKjuBXfvmhBTpWAgmtRmBJZElH72FeQWyu9J6SyUN1LkUalrwVxTK5LWoLgTlIuEPSjqxKbZzMiG7oNloKfrkDXY01Uw95lLspraCmrY75MgdEag31fxOSw9lyzXhemmYdl4hPrpGPbhdxz2OmmhfrpKIVYoRNqEuxDjY9G9LbBHorqLzS2s6ui0QaOxTBxJw5GIiVmCGdyZMW+DRWcH6VL2IMZqQih4l7qJ2LYmQ5pLRNJMLDPTlLj52NoS8ZQk/FPEvbaIFwl3LYXUtP4pfhjkqCC5rZafnohiZLfGwtETccDiE6uEoFj24SaggPBAI5k8EAklj5k4sm1KFImlj3VZ++aerU7DWEdcdczM3x3rFvOaEZd52/ZVq7HxfP8/MHwxo3d7Nun+jfg/5rgCk9VqF3ijtQ9ViyFZgxW5P+ZC7p/iQO6PeY+HI74jsBo/I7UPRD4isfe3UPAUcZsiajEla2jYj+HxmAjcBfqPEfQ0dg5RtfwI4t2JodbwCXp4dVztmu9EkbVrP49ia9d7IUTXrvlCFF+73iipbf/VehG2ZLnhfmqtejt+RXV76Px3TBLZR+B5ub3uo2CJsEJ//auYfbgEotcfA98p44RUZHvAUeQCPl6kv8rZk7K75UPx67+NXvf1+us9fZD+dF5znIU3fxO/6Svnw2y9+ev2mzoLNS2EeUDM/0v7E4Zv1XyUZvXDMvt6yiYZSnaPLV1m6FXQki9ZJofEHk/U4l6GVWeROfnFZX8clzt23PN//j/LbJrc";
\ No newline at end of file
+export const w="eNrkvWlvHEeWKPpX8hl4o5mcFiTb3T3d88Uo7qQ2bto8uBCiqpJVQWZlFnMhWbwYQGrbbcurvLttaSy1F4mSKMmWu62lbQG3bOh/XIiL/sU9a2QWRcpytx/wMBdgMTMjI04sGXHOiRNn+c///M//+e9PpZmNDke2E9n2U7/6H0/lzeXczkdB0oiMXXrqV0+ZvAl3dU6H58jk85GJgibc246t8zM85KFtxYtwE4R4i6+baW7rdqkRxXVK5wTMG8/lSWyay1hBZM0yJciLZm3rm2YNnuI8DXreUAI8QEtnYtPJ54t7yQZt60AbTXFPmSK7FBtslnQIOsEp1CXoqXuDXaMUbJqdtbNxvsy12CV6xm41a1wrlcdqSo8GX0Ixw1lDa0JJ4pqXbLCYxx3qEj9hG2bhPY8wgMrnsDmUxgkt+FWliUaf6ZVtYaOgBL+hR2x577eTb+U+kH4PN/w62MV4uvErRk/HSkfGZS73u+ikdqvUhaLJT/3Hvz9FU3A8TYMwiOLsqV/h3AyCZCiLgloN2xw3zFH8HZ6empDrOP7k/tD01MEEbuenpw5kcE0hbf883ExP7WvBL5qeGpuDXwjpo/IbmY+p7DD+pqeGavCrw/3gfNzA9AH59cOzgWvfEfwdnqocOTxdGejvq8Dfcl9laRGu+ciwf8Du8+NhP4Hbg3CF1HZfJWr1VcK5w6P+1D4/GvVbo36l2djnHx/0+yozQaVei8YwZ7Wv8vzxgb7KsSOHg0H/XwchbXrqKVifSZzVTJKl+KH+x/94ytTzWeOZ7sVgHGdU3ZpdoRfUvSSApdgKBnDw63nHQJrFHO0waHpJPOPNpRV47N5uLnvdO3bei7orideIuufpg629urL+1R8e3Lmzdubtp/4DEEFs4zYC8UwzsvuxqlpkoBVpanbVvSBqUKJW5Zkg6q5StsiGUOcI1nU+b3pYQd1z1ULy5vVzG+/9hSvkqpK8EaRenNn8ALxPundTL+1eSqbxq/O7Dr0JZgzcJsERnFfdCzl04odT8PsEl8raS5fWrp1e+/4VgpmYRh56cWKDlk3aXivAIYsMQpuCzFkeZ14WmQXjdVcym+S17krqmf1UIxeJQy8NvLqpW24CvczSxM54nQxagmB+uNLxulfrnmsMpD24dXLj6lVuDXevbutJ0PagynQQlws9pTZPvWAMK5T3HXmfpVB1a9cofa3Q6662vPvv4ALa/Pb65r1v11/hD/QvMXyYlqn9s8cA8GP/C6QAPvpnL9eE+NE8HbP4zx5UQl8L4HMd2PI7f+QqeprdvZDBOMSNsOLajglBGjdrXpDPh0E+QTMxCWzbw+/IWakbqYUpZptZ0Ip5vJqp9+MVmBA/XFmCNz++gdhn7fOvHtz68+YX9x7cOitdy4LZatzTakkpOvZollaQ2XLPXG3cN66GKjB1WFERzAkvgGtci3DcA1gQkAjLKQkW8pimn8sYenSTS1ZYC5QeNDMPqMcQDs39d+ZgMBMvvv8mocW1tz5be+mL9dPfb6nS1GAKwWo91FMnjmn39qHeOnnsIW/35sD/ure1YhjcIAmaRyH9/puRZ7vnlz1tBdb/7uW1s5e4FdKE7iosoN5O2yyJU6yr3GkbmnRrnzO79Gh/f7wCk6Dc4ZfvFB2W2nr666or91ere6S7rs4du4oN6Onry3cEp9gAGJeqF5d7mwZZBkQY1j7QmVKP4+5XkDUMejvMOUtdvv8OrNnupaLH66dPrr35vva4VGe5z72VQltS6fhzrtpHO17UvV3XtSGu59wQHndb615oJWbG654HwEdo1GsGUpptGuTz0PGQlqjh9Bn61F6CGKejObFqaEE8TGS6e2HGi7vnAdvdRhS+/sq9zTeur715d0uNW6ZWqdbS7CpXWhrunpplwEsVuyGnqnXIQ5PZNmAiLz4I7+ip+00TllP3pD7jWxhiqsMlYB3RKJGR83nHQzyOAwsJD//057XX78KQboEPbTVtGc9yPcVoFrXJWPbUpmNZVMhDKfXJUMZIb/IaEt0ABwuGp54DMVoOOoRA3ftGFGRA1hdgHJMYsV+YzwSJAYxcBRxsghDTIsSyMHAWce39M1jd2r0X1m68tXn9259VHb91VfQhbAALhM/VAEkbf7jN4Bl29zOguEEGcwImNwD9Vbm5UWyhsgzfJhZSl2EQbS6U/aatlQtuX65j2kVPu1c7zGNoP9dffGv95iXtp6P9KX6wLS2j8iUmgD5qUQ8sX2twMpZYAVwuW5qJUIgvQEbGKzdzvIdb0ZY6joVbSs1M4ySJa4AfUse4JEaBp0ke16DyFOhsC4eFUVgUxcjzpbENYU9isKiWxHTgDz1mWoIFO0wshZ0Feg+/r2kvs/7+2+snv1g79fFOLQDmLrP7tmsAvAnSVJb1ow0IkC9azedtFvcRLp/ztDW8tn84BRNT24Pz59pX3Bptig2qrbiKgOCTEbfTT+0ARqMVcwWxJkKtmhm/DKfO1fIkwxmGFf7wLtAqwShYNXJU33358KOv1//6isPfAAMby1WMMzsoacheMyT8mp0toNbe/qgEClHiaghthNnRMs1+It2WEkKc60G7TQi4u+pSgVC2TLi/yIlYIwypH90L1PT7Z2YRGdIuau36p5urX669dUUWcmQawPkJJXHVYyXw4ZME2iE1MZMe2AWvqH2/7MViWNxF1qA5zYyU7V5A4qxtYHZq/dwX3AZuQMMyF5YEsLcboIFr2LA3KSJUZH94dxGJd4ew38raG1+tnz395EBg5TkwOA7vv8pACEIAq66R5G4vIY+6m9DXnfJL2VDgmqARlv0EzMONby7qfgJGNOpebsDUFv4Pih5maoa3nNwp3ePOKp/DSbI67ylsbO8f/7L+wksMnJtMG7oyjlvGXZ33q6x7zYSwzPN4wQvtrim33Srnpe2dQ4M4JVserqxqCeP/ae3WNYcJobYKbxwrArDCYEZobEsQeHC5+BOUhZJXW7ycLXad1sR3sKDX7l150qoFgNRMpZ/6j/+ATXA9iY8GYbtllgK3C94ZVnm3Wdpn9uwAHcafKqH2KUXiU2Wc7VD1L7fvKjZdpR3XL7HtKe95HtnwFLucQbfPKG1nBku7GLd/KXj5KeXfp5Rpn2IWfbC8G3D7gDJL3Fdig5Xf7lM2d7rEWTueuoexHCpxk+MFCzlUcI3jPcyiYxPLPNxIwbiNFMzZllvHnTnOrMQn9Zf4j4oyKrmpMX3GNzlh6x6maBuOqLIdnG3SS6zC45iEbZiD8W0I8niJGxgqMQKOB+iluiVCWyKvjDVbGfDCSP2BrygGXgjho1RwXGnaeEHyetJ6SMvfT1QcPfn7MHYJSZfQ808ivTK6/Pm40mHJEp5LUTb6nzAtF+xCkk95/+QVzfz3p4I0yBs5LMM2Td1t8zThPpl5zPvURqadPjZDCFuMnTPoicFjWhlZxAa/fvrfgQ0zbejZ4lP/89+fMlnQwquUS0+c0GLBiV8/feJpgLnduUTQBDo4x/LkWXhAlLOcx3JjQ5QvB9WYpMrBHNxS1o7BQcg7EYmwG1EMA0OUyS7TA0mlcxZvw+rtsEycc6Mc3RL8yIYs6LbLfI3sLArm6QhkmYXaScAC9FYS0IUzYq5G3hL4UGWERer4QDU0c0yAb0VXi+uZYFqCBSNA2fOMJPJNd6rRialurIX6H2dcBx21UNvDiE8jADIlwJqFezqt4BHj8WJoOjQ0VDwEfGrAXaXeUXXSD7zn9lIruXEug1b8REJ9FMIP+0fgcnh68mn4PQP3E/g7PD0ejuGbcfgdakf1uTH/8PTBzI74zRH/6Ig/MoJvD0wf6B/2g2F4t789T7kgdd9Cm/OP9e/3p8dG56ZHf7fPD+HNKPxG4K96eHp4Zu+oPzfqj/X5Q33+9FD/mJ+N+AvtiGEMwl8TrgPy64e/3/f7fY1B//f7/P4hv+/ZYX+5z+/0IZBsQOD09/l9fX6lz99T8f+t4v+24v+m4h/873u/3RFFlrfpHvhtvXskbU8YwK6EzuO6K8CzIAOB7NArrwP7wCg0R+YZNkZ1z2QRoTvAfBFulejEI8uJHmG2QNMgY64ZYRs+E3ttmq+41wRqt0Ize+3GB1CNkLvuZ63EMgX98d3UywLYVyewXZghqgd7voQO4oAWNrM4qe5JYZ8UVi3C6d4hISTB3PzrzfXTr/WenMTSapu323hokkWWnuNOkYFai9i2ihv9PfUwhmriGYHevRoy7I0rr+lRSQyM1J7u5Sqt3iROkZ/b012pwh8RSH6/wu9h/cPeADJ0qoQabfdSFVkTvN/85tzatXM81IAXY1z/QcOgHGaeHlxqGDLa6K7MeQgBx/Czm1BejlpCQrNJEAJbgDcGeoODNmeCNopDmJkGvuoU5tu8dHLtLT7DSE2yAKWJwwjCmItDYlUTkWrsadaCgIjV/fc6eNTSoUOkVYDDY5IFaWRpZtXkLnZ37gbm0k3gMqIfr9A0+9OV9Y/++KTF9zRyGjwULyEU7P/qGYDBg5fGCzmKwZG9w69IvbE57t1IRJFak1K/7EIe8jQF1jtuA+NOHB98odQDRGkSYvpmPegnVfHZw0+Y54ulCsMriGDjmV8eI3aGtwwZeCt834EVo+Bw4mcK8PMVBQifNmZywFfDlzm+dFdhQcpAb3x6c+3rFS6U1ANaXAkyhlgKEugGsXtK0wv3vFgcqzv3IRSmknm1Zaq8PmF1xSFR5VgTs+7lRKa8JgX5fEqrO1gAls+LKS9NI0AI3TvME//XhxtXbhfwHUwHCcdGU+yyloNPp+VwOdEq4pWDHHIYN5iFn6W9MBG2hy+//fDui48vAfCxEMOHArw04LvE2J8wWOhegI/eMDR+9QglEShnDGCpwAqm9KS7SpkxTfMmBvb3fFaJm3xaXj98Iju0zZM3dYeWwoaQ6gJ2vxnGvKBCC4ONKG0pDzqEz+pYRQfyzFIWgO4BNwLztBPQlqDlAXT86p9cA+C9ctyy9LUspt2SjkBk1wJQdNcCezRqVT0xDWJEsIekhBAsm4aIA/MGlGzRdvs0lBUUEcawi4DR8AAxJLRkEFfULCUFmrQlG2F96FqIRw2Mf2Ad4PJFzmXjvRtrfzy7M/x2y7AaxILNwryGH2VbqHL2S8lrZ28AWF4okY2Ik8NPMEObnq+IlwsTS3MFNjze/Y8jmiwra1/wQAOFCYmFClqtgBHqrPBcrFhDJ/ZcDA/qpVhsE2hBnZguW7dZTDQVUhlZdEJr6tTUBDZJnyC89Q+/WL/+lmxT7MKeVNEK3ApKkXTGJ8GMDfekHQKDy+hqwrMc4DCQlgn3xGGcEuGNq3v4FvappgrpQY5P9by1Bzb7jMYzwBHU+7Ofrt8UIDL2iLf4rmfAZbChKA81lJTPh5/KaxGDGsx4tGfBRECHdI97VMDBLGOApQRDT1Pz1JWNcye1+fSxYdgNYSYqTQn8HOH5E5bGci/egKJcNSyuBRh7mpBJNTEyM6uaBnS3WA/Y8fWzl9bPvy3djbM9sAKCumkxHu7eBebCEtKLge4m+FreNuJwTz2mOYB6C7JGPv9mXU6pEJm0TCaLER+ChWJB9r7thOV3EZ/Dd7/usKhi471LxaKHNgJVw++U5AGKhkMP9kZ1XvvL9BYP1nCUM8JTRDLvnwnpWIjw5usAkwC2uit5I6Qq812kNDDPM1ZSgYIELZodNMtFPAzTXGXDqYlhH0FMAWwXVZZLa6wdUzr0kpRasNzdq1B0B9Ehs5WOm3QspGMbhSVlbpQq765gBUrs6H/BpTGH9nP4KOGhlIEqmCDHAxUsUC8HpNzPk7A+wLTs2cL+MOfDlS6wphcxEyQWQRZCFiDzWvgFlV/4SdIvRL+H4j+eIgs5VlocomRgj9BXeOiutPYkck8vivsSkWbqLIMPW4pYsC7fmVm+wuxkwslEk8eOCRJkJVpOBNGRQSZenA+mDg6UownyXA8D6ygL05QnQ+OC+AV9G9wK0cRH1AsoMuAnxL3yAjDvnoiQKKNeh3cFUQZbEWYz4w4rtvxUpGk0Y3NqVNwI8hlBj4IbGSsKZEVMgpEcKhI0xEOk+MdhC0UVJRShyEGQDaOZbVY0HmcS6gZ+OOG55ha2LOqeFS1CshSwAOyyWnG/909eGpqarZtJD756/1ZR2WNzOoHZ43M5sdlPZRPh2WOzORHaT/WBBWnP7iBIc6VrJ05I4eTECShdO/HszvI0wHzLIo8yeROfCBfMQrtJ/3U2Eq6M7mJgPusiJlqGHLQOTIceWSikCqmQlMptXIV00bBdkts8iRgFBnNygwqjlgVbeHFatHOoTcoAk4hVWhFgnaRNScy4pemA1OGBk1LVxCWRIb0GUG0ChmI/wqpRnliVnfFNjHrODRaL8U2ADaN2sHhR71kzF5vdoUIkC5M71doNwsg0ZfyEtth54ntjw4I4GfLyUMciM9RBm5deyNDIuBAM6b70WLroRHfSkVLji4YqpXsy+dzEQP8k/P1+wD9+tHPs+NHlYwP945MV/+khf2TIDwf93/X7A/2HcvgtHBxLw4H+g1n/gfnZ/gPJbP/+w6P+8qgPMPbDbx/+BvrHMriOHRhN5uE6OtA/8tt9AGHk4CD8H873+ck+P9znz+7zn8f0oRr86v2DZqIy7FcnzLDff/zoQP/zRwegLZ2B54/3A5Q+/A30V6bgN12WTfUPVs3/3+Rlzx8PRv1/G/WnJgaO/gyZWmJmczxuS+TYDbj7Wp6y4lSW2LpHx2i4iSIhxdf4qTdffGvtby8Kr9r9C3EZfFKV5GOEa1GiJYkw7QBNL06p3i6BYm1dgKOnYK2cVAk8wDek/9tdiRrA1OMeM0jaMR0yQbYoACwF+8zYSr4ObExop5mZ4CCVs7i//uETUtlBmQdUh5N2/ZtT6+9/s/byybXbX8vGUUAkQSfOMioNnZfEdu5FsC3ulzMVBoMCrtS7/yadgRKk9dNX1k+/q51I6QCpDvR2PzeXEzoLRg9nvoZmAdUhPPfw5TfWvz6tfLZBatIaJTa7uN/xBamuMUAcyy9PATQGtUDLMAka3ZWQ1UwatFKzZsMGi/g/5K2HxaP8H64gMnjw/b3N7/hEMsSj0SG2KajRSahL6aSGFRB+fCN1RdfPfa9F49RM0q4qnomTtpcH/NGinB7jGh3JLcZhaJo0G25WSeOCVLc/eHH9Ly/JjAKe2k4xneYbKIISgZ40Pp3T8usffa/lpcJx15JSK0ixISBddlSojX54lwVKL32x/u1XT1Qa7jS1e2mugPDKXQchAx5RFK4t7La6pxECMNqSuIjbV5xsrD9nVcf1xlsbl1/8eRCorAdsIinJXX5x47VVmdpLeZzMVHhZt3Ngh+jezMYhpUZBGtMcRdkI6ZKcRyq2du279fe+dzMyAY6RlfdMApMpFkWXnnS5xV0AjucpVs+4dhtAcV9Y3zKoRfYAr4lGSOMPvMe0ToIfTtV5Dqy9wefzMWAonoNVK3Ow2l0ZYMkvKqx2v84TD8piZX/7Ckr+nE+fw6opvtybH7svl0Je0sgKcSM7zA0wrQrBI1U1WHZ1D8vj+j31LhR+ol5iidQdZG989KUeZCcBfNWGoWPixCYNa8hQwSwjgHrFLVvUiufv9S4eaSA4HLE7VwCWfHJAjI2I4aRpnAwTHJcoYGAPJnq359sqNX/hA5WaU3aPuOdx3mcAIxRXPQEnr4mPZnSfktI+fSGWYZ9viwj7hQ9U17/V/ZiPq1v5CI1N0OreGSE9fhsfIFQESxHVS3Ad//XL9dv3FJ/CRuoA4XTc8sYysrN0k9E0gIHItOjDk2+5os3QVA0pZoXWLPBdPKtpc8Dm09RjKxKmDneVLgT17h0jijwR3fw/9Rxo4/+6wKc1ASnd2R/erTrScu66Fo5rKbD7XmpNCxBeHre91mHa7BhMRel6DiMWHSZZDGfFc37AjZKKCyqueRkg5wqpFiKKUIWvC4S6H9z5ZO3elbWXT5drVL00qUmNXPgla6URYNFJK4N0di4EVPXSYhTu2FqQz2M7UFds93IwM5PDXpXwUYKCH1YiBFrZSgwN6XloLqogxzi0998kxvDBrdce3Dq59s7r6x9/4KRK+Tw1mXZ+CJOaTCe+mSXA0FR6C5AXsdULzGwyVNdkAuqabGmnVQecSTvR7io/hzFbnP3wSYhCVSr4x2/Xrr8jUrrQsJSOr/osF6b+VBgn2bk/QdFSL7T9IjeyXCgjDrp7dd6DXuEMufHexgurjtexZCvXXZGbIolkaCHjmUjKPvzwNpXdTuQUz9LuHYaLdhrIuSnfJqt8mdk1FThYZtGBoaLzQispyOrUelgdx+EUvE1beJtQeZu28DZNx9swV/PTfEjI34MYiBL3kPRwD+0t3EPbcQ+p0H+i/L1kv12AKBVn3F9XBIrFeql14GjtSkFrA6W1kdJaJrMi9EhIxBfIFTVADCO6RSWsTFKVQswIhWg5ClFnCkHTvnuhyjRQBgNwboPXc5vblAY5pczVuIRQoRIJemwFSjOUYMSIzFkBq0H5+TGTvTFj8gKNIy5uFbi4pbi4Rbh4URQEcWAVB9cCfOT/8tBJWMZLKLcXZSrqckhLENYWXOXQlPQ5iVulFQjUJuxeqAnWKCMMhyueFFEwjnjShU4LtXeVihhpdNRLUS5eC2brFa9mU9O3VX60fRYnONrhtZMY7fheREXbv3cyoh0byMKhZ3YQDll74oQrZ06cwILVE8/sLBeyKCiglWFm+CY2KvGxSSwyC9NmvSBrQmfTO4MWwmIoHIsGVRiZVkRywxiK0A2pVZEIEq2hafGh/XCHpwEbLJMik2H5NAwvqxRZtEQnxBmhyQjJK1l4RC+tofVpGiQBNfWYZCAABbWt2Aq6hk/c2OZyyV6bK40Nan65W0toJGjFVAReRHwHjVQJk3V3pk4wuW18QqJj53So3PDoKHDPncqUdIm6UzRemluTVlED6tJzqviJxDjtET8Z9Ccq/mDFn+jAE1ynpybHzT6/NeIfGvT7K/7U5KGsOuDnA4N+ZwDfHpw8+PweVKyampyaPDCFOfY/s3940N87IDn2yW+sOSlKVFOTo7NyPznStzCGKSNTk8N9I/5wZaoygs9D8hucPJgA/MmBY7/D/8fhP/z9ZthfHvbHKj68+ldKgfvmAOpcTY/R5fAeqL8fulAHeE2obITq+++uVBUleRZHpEExJHrcllWx8U1NXtEGp4P6uWh4GwULpNl6lREsTskHf/t4/U8fy2YEOOcxov5R9xrZVkRBPz9HdoBpwIwWfPjFqhZEbYZVIH1A7+tBjdnoQ7IPpOSs+03GfHSwX9NjVIeBCr14fzlrarwoRm3mCu+1UfByieb7+ocrm389pVxKUuVDXgQNeJ1OkrKImQYEIEfcCEGOuD9cEdaBt0Go8N+yS8ilkHGgqSXU2U41YZkUki5g74G1IgCnNu+9XZyu4r9aMCnHq62g1l2Z1LNVIjT8shO6fGQ0o9DOfeGgNSLeIlq6pPEsDVHHLBqPVdpR8kajTvhi/YPbm/fOFuKnlD8MoDuBUEotvcfSeNhNp4X3zj48JUdGKVnUob1fhgpLB1nbIUAjqSxe8JaDiLXHUTvJZl4OLzLT6t4koUILUlCh1AvmzHTRxfMt+sf9XH/pz/Anu+YEzzBItpjF8RBvR9hcDJIajXiMv3lby29++7YWBiah3b0wyaxamyRWRVKW8maWWA7Y480ww/Hws/+isss2pDWylAdJTjI9Tem024YsRC6Fzkrlwe0zhYlKROrapAaRk8jEdFcXgJrQJjW02ZRqzrONwPqHFx98f06V1XF2Aw8idvxzNbjxcGpEBNPknCMlDXT4UEtFrnp4iMUlTdUK3/zmIgAvHa8txGSwmqKuDT6I+epNWyueel7J0f55pqPrH9xYe+UT7iWdu3mQ8yAd4IqAIAhDNNI9SHiAk8xCkB8sRAiLtE7ogF7O8vCA/oMbooHE+vhp0DCtFhklopnHAJ+Gt+jGskuI+++xfthb62/w0WQOCMQkYt1nGqjtBPvXFRIlhLRHt7Sd7+QNr06WI9QIAifaMOdk8wT8AFsbZizXnOXHJCZhphPmiSjv02uuVLUwGoOyba8dO3kEoDkDjBN710BQqRfTjABA2Ag6/v302trnl+VIF7KEwQH9IkkM/O4KyafgfjY44JQ0ABmxmBil1t1VhPPwykfrb50RzBWyTMuQXEceYWdFErnzdZRUEYv++UUopciOzFTgQisPnuP+Uv8RL9RJHEsGl5+ublw7KYexZC5ha3Ym4K8Y5TWyC+TpWrxgO0EF2L2NSpUIlRryIoDktR9nwKUN8IEwcJ9yH7vb0LQBLpulNCKSkMbii+Th+/fWz1/QvTAiKpWa4JPgT0FQsJ9j1yAtUu9i1ErI7/57vI7unX1w+yXRxsuh7Ywf0VjHPZAdDzwx7kRruqRGnUWj89QN19qNt9defksnewDTMpTjaxu3vNywxjCkk0ZLhvp6HmnZMJjuVZEgv7358k0V3hjVg6m2aFdDSXgD/Wp5i7RvAYg/vkED/OD2K2uff+yWG32n7krEd7jaRKmvI3oJkRZcu/2NFjSwyuncF/URSBNPE/QKZXCGiwHT5vVv1IApNamNgd4b3Glx19kNCNpIZ5xgUsrR/cplIQcggF2yzLIaVwn4gzuvKXCL+8ma2EfIZheoKiXhMc8i74Bx3vN8kZn//j1dLHmd1Z3kxqXolXAGlBeM8fnFHaQ1dZMC42VYWxGmsSiS4QPBJ0GCcEXKEiEjJNwJVg09EPXeTsi6GI4xKbgSUnKok0itLQxJjZVV6PMw61DmG1g9hy7IN5DghrUbhVlQTgGlgiFjmZAnFV0X45CViJhY91DaRClt4ihtwrN4RiktE1kV3ZKoDyisJZHfLF/rpFMjJMzRL55WuUHyQoflQFbwusgdZVKidKRlyZIGmMqFnLeOIWueiAI7o/wyvq8qzhZ0rUiaETTjZp0jRhBqgyeIYYSaCQ5m/OswaU0waU0waa0EWXGeIrxYvo9cVO7kUtHGjXFbgUAUdyjiwCurwRDGYGTB2S1r47CuFgqjSUBIRXWJf64SJl15bkyKxQh9baVKB5kGijRdxkSvLqFBrDavmt4lo6KTn5acPF5w8hNyk58QmzxeavJYocnTOwlNtpOZPL2zzCQJbN60HWiQiApmJYVlILh/T0UIUi8erEG/cQ0RPgDGlQQxskLTTpRYsOwirksaa3yoUzssRo+iMOLSTZMfpT0WoAfSAnkWwUIamUVXRhOwkkUSrYh2zyw9UjKpqcSsCww0arFQWzEoDlnuBRYrhIzaI+/qmqCGd3FTBo9ERpQgr+JcIJIrvoz977ExnW2VRlyTtDZosopy5JmgL4vnPhrGZXlmfw/ywR75QMX30LF3g12Mbmk0dfCK0SqNTmkwir4XXS31rehI0fAnkvVMLqUTkx34TYwvwG9xanLiEP4mJzpLcD04OXEghuuByYn983DdD799+JucGAvgV4f7UfmN4G9yYngOfrOTE0PH4XlocmLwKFwHJycGanAdmJzoN3Dth18f/qYnJyrTUxOVqcnO0uLC2HBfJc/6+9hgrzLf3l+JowN9lVY4OOaPDw9W/IptjlQaM6PjYyyHkqw5+s/jW70O6LWfr1OTZsBfHNhOWkLHYsCUtXJ0ntTmQ3rcHUfWi3IvrauNtWaERFNkpCTjZZaOy5LAIwkKnpih1JlQ4Yv3HvztY/T1tqq+K+IQfclVhG1g8QdJGlDXMkTpDG09E2QgPNpFB1Oi4jHrlepAOn7xlKug178HOpFDf1FjxImQDzmyhMs8dvOxa4y199FPTYRu2yI6SCTxAh7poMs/4N/7dfeOG8QmKsvI9v3BrVcfrlwtC134rDoKFrgzrE3eskvdm2L2HqcFzJjZsxLMtVdulGDGrTTArV7cqLB1WiBOlDLZbQN1NcDvp6SgtBhHntxCY2ukk9TQDfL66TfWXvl47cZXImtYtnUcCxtUTY2Bc0JKvk7I014C/CSlxZKnbk2qNTDXW9TDrC/XolskgBbDXx2Gm/dL6BBRTtnV+AI2Ap76SuRXZEfhkTs8VzQoXpO5VgKjjcVK6Wy6hTYbaFFV88iGkc241q+/tf76qbVzjzZsWhSJUQ7Bfmd6a58uVUh+G358o+4VNSGH8sJ3XIPaO2X5DLvX4lu2AmBjfEpQ51qBvFfXWqS/cf+M86y1dubNB3e/UM9aCjjyTEP2iQV0ci2wpYrA491ZqRbrdejknz+d1id7FqrNHYumps2d6K7QfakXyO63XS8yelu4B7tg53s6cfqNUidYoMnugdibJCumiKATOLE+5tNmgqpXj8kBGLJ2noNLmuDfMdTSjrdFqEEkc9BUU5LJdYy4O6M9L92JeesqTeAV+ooffrP+4V/Xv+ZtdI4T3ngM+xCfDwJb210hN3xSTWlXjS7pblIRagdsv9ALXctO6xIvKuQlztWJlNLCRyVckaBqIEuACSWiH7hYlA0jmvA6zoIycFOlIw1YAzZXa87EBaEads4EYHWcmyj4pg1pXwlueahLoHmwGbCwvdgsaius3tZu2oqZXdu0GNBcBJh7xhRtvv/eokeaFDo13njlwa3XXIMZ9HnY3l2uxQse7JCObKlGproobQBJmuyttw0rtgV4N+Vv3NsC+wgJ0fYI/aDWqInB7hj4FyVP2AbIuSufZ8yHCCK2dRRcBI5MYXUeKlgdlq6iPiELaera2VX48r01xAYomZAXrsUjRx0HeqspclE1GeqFDvLhdM0rKiOk8QJXxXY4nwE31/JEZyvD2/3sO7n7FYoQy/MLNkePzC86XyjNrw9X9HMhChXXX4A9ZXYJ5ixNLgS6zeSSzb1MLtni47lADL8K85fN3Ygh+KFjJB1QcYLu4zqeIAnEzex3i5EyIwqdYZ+vAKbQJit8lDk3WN3JVQNp3RVkCEr1cb5w/87VChNRKa9yaQIvc25A6VOQGXtqY/QGA7PLFNxWBDvWoC5T3aPpzRyXfizBu6bgu1CJI24BgeRprm1C58XCiXGDCNE7RgyadOZN5cIebRUedRzZpj2cuqUxnLhDO4IS21Q0hNkmboX7LIf4W4zI4DNl0UE/7jrSvZkvl77t+keXer6tZ/nMBD6q19m9LG4mCSD76nRfEXgy0uu6Pe8VkEnr5C7D7RmchA7uItP7qVDoXmefheweyg1NtM0Xgm+Cpzrlz4Jmda3yd1n/6JHvIhhIaixPhzKqc9VsRXGligTLUS2McGfjJvR7ihwuNHfV6QiHnDMSkuugE0+9N8iGyYNMcjT4Voc8n688uPuqcpYEl1FDGS7we30KVhAEg+0h8w620HmCrAagxAPLZiOo8agDg2yJQW5WlAEGrp3PE88vkzftJdfOs5c23ryh7USARhyUZuihP8NRLk0c5q1p5iBcamV+/x2egZ46At/8yw2Gu4NwVDdWh4u2s55kZhK+Qz//i16ld+NU3jKVbVYNEgSrByL4CPxLyxZmq5SBTBg7YcBPLVtgdN5k/LI7DLe5+Ie56x7GusRVE26i0xRER3Q62F3J2ymlIdaplPhnxzo7lrMi7GZFWM2KMpl9ZZbVcauOr5wWnnJaOT051Z3uYSEd9+gYr4M9+gbIcx10zNZgL/fmGDfHBE33cD0VYXGmSxxNpcRMOT6qzFccYBBlJoIP16gdvfzCFmbhgHAKBxyqOeBI+YFexsDxBL8w9XaEe1sKNbCFNj1CIsd3okjTPQTRkcIdiFBlRwrkiE+pfQ5JD/SMm7RjuhfnO2yv+HKkB1dSzZTWkYP0XrS4HU4U9HVAFizjwoM9WNAhwG2MQkOUnAVpOsiblq2WoI+8Lsw/H31V2Hxu904NPR95V1h3btcYFkDv3cmkU4sEJ07gJu/E3p2Fz7FpxHldYojwA+u/aWIQ0oNq5rm88sRaaHDDOntByE90aq8BPDKnFeeKw3jJM6EQNFO0wWJEKqZB5BKcKLgTBSywXu55wIws9azqbRKYiF1YmCbekzszCvgiqn8hpQUNE0EXljgjPklbuUSwyFeUq7PBKcZesewwTZrHJ0TNlB9Z7a40fMWIuTEif3HFUJS7zkJe6Vm5L9J+aTKNvDTMFX8iue6h+diOjx6KDqZ4PRgeSOfheiCZGB/dD3/tqWH/0LC/0OfnfegPzQz7R4d9SBxL52PIMzYxPjM6Md4YHR8dqY8Etal+f3S4Xh0fHa6Njw5NwtPQkUP9/vjo4P5+H/IPwm9g4PnBfr+/358eGhwYHJgb9icG/Urf8QE/pzz7+vzJ8cro5MRo5cD+sbGKz/8P8v8D+L+s1XYQXlf8xkxloj78bJ//TJ9fbY/6I5XBgaf7/L19/tAAu1MbdP3YST9ufBQKDm8r94W9Zdz9jEJSoOZBbpqk2JLP8zb/OcoR4dZ8JZ8gX/vAXzW9RUJQpIeB52nOP/GVj9Y+/1h9UJgkx9IGNrAc8yKESZUx/IntgePhogA3ngMvfosJeOn8zbX8EcDyvgd0w1YFMu7Vyq1e+/xiqdX/GGyMECLgNYzGRddqPN10gLu3YydSeI7Op3thos9/hskKGuUWb947W27x3wnXeAVkHmKG26NKEvG3E6FX3WPdi376fKJTkqHjp34eCGwJQ0eFEm60+Jh9cPslAL755alfBj70y1XBQ80VyHkxuvk5wrppgU3zUHy8JoYjEqAAmRRyLjU88dF96/Lay+fLPKxrG/Ow5baVctAj+xAzLf1i7EbsjBBsB9eB7O1oWu5iCQwrwvRM1Rtvlz68uITwUuOaWqin9TZXUjlnv3MX0dNo1PcoqhS1D6qQpxkgBdwLA6uRN1jmbuN8PkF7sOUinBJMNM6HzgUb4ukfdjgcUImdzpDg9dIi6q4usp7Og7snH9y68/DDa6WqSjWMF4AZ3lEinF4POHIO+2cHjDk79HFPQ4Mmf8DM7ap5aAFIpy+wEdW3sA1tlEadJFUdNMgSQdX6+W/XT76pZyewhGKGweEYSMmVYYZJUEOJc6t7k57RbaHina/z5S2AT338iwHGoXBQYRB6oeKIHnJguc8MEBGDg5cZGlloY7UM8NX/KgO0GHqFInywZ2FA2hKihV91b5KNJwwonrNJMJaku+JhQBYO4wGbW4zEImE8nsOvBO8lAgzOW/lUEvmFUh6J+kLfrBTvhT6c1CMCBKpG0TpJ8gkgA6HhkFAxZ0JPw8WIJyYKFKNFY0/Mq+NdA0IEoJeQSA1pxcmMawW7HWN4vIYYmvN2g5ZAShITC7uaJjqGyudJNpvYBrA0XojogJTrYnyN4whtaNYsT/wGNRax95JgrncvPzx5WlQJmyEJr10dOXn4aeHJCI5gURcQh5bHjWFxaJbBrgxHtFQZjSrXqDLby9odxIIylxBFKomkTb4jOIgbFZggRgYFiFHgSEtdy1z3S+0ghCFj+t0bWrLFVVpe4t0VvompRHc1Zz1Csiq+cWr9I/ZwbvN5I7NJi9csDQ2Xfg7DcGgOhsnRpODr4egwdBfoYZV5U47xANU4DHaI8ReD1NGQFeYQlzSPsZa28KdKk1KggmC9QAawkxTql2HzHIf3CzJhjv/6hVgkxx39wlyMY2D+LkourIDwAa5wuRmlgqLM2ssCOOr/cyjkFvLYSxuF0pRojNAWrrqHUpXI1E8UK8hGiWY8HvuWcPbPRNgOVz8WjfTiTYcxn6iMtOtJ0Q1jmp+FAtx32UYygw8UHSmFirdXF9whTyGj2eF9IajZMYNKa7bPUIhsdmwly21+v4PYBhNOnJBy86o5+PsdZTf5jPpnYjdQnXyGlcry+YbYXKL5Yz4vqoRt0RuzwSLpxbWt+m5fJrGEQXgz/EwGlSYjf14uNmtGyXk8x1pl83gnSm/wqbUxgZhfplxtsEh+FsnaEcjuIqfWGETetLNw3+FiMTm9QsdZs2rqOavacvjAddm21pSjdyzblnqqCjLFe5YyVV3WZhppqpGAs5YtNp3e3nIxnPAQGfEvxuKrPKRbdnDvcsamZWW0gob40oIxDxo8UjP8NXj0S066YlIZ5ogEPFY8UjQyPASFlWeDZ5X42xev+2o2K+A4IADbnDaeSB5kA3N0eakdHT96eLJ67Mj00cMT4Yj/LKTUjv+mz/91n//scjs69PyQ/5sh/9dDPuaZa9SO4xXL4vXw/uERlOk8u7wU4Tu4tp/p97N+f6nPX+zzj/96QO5CKZlKyXBOnq0+N47XCfLzRw8PHBryDaTU6lXMEZh69dj000P+3iGR6xw78vRo3/+t7vHTAK0zgU1mOxvYv7TRQbM84St+Qy/iRTL2uT1DRg9sWX/6+oNbnwvVDvNa9yb5AjfqxASZ3ignP+MMPKBjudTMmIbm5JQgTU3YQC/5lK9SuJa4/yaGnpnRSDjvn904+zeqV9QR2zkwQlRd0M7RQzefAVIy3XIqR7e5M4+bRPamtfH95+uvnOnZ7KM+XgGvZ8NfBu62/C6/nDbSth89/ZeqRAs1rJfbD1sWqFcbD0hsxjNF7JyguwLrMPHQ7b8Gz5E8mmUxTjBwZ8JGh2Qlygc762++owc7yCnhgJKbc4BOEKRLDYBMmpquLu4SFrFShPJzcoYO4aFHWG1Fdwq0J6bKpVOwZ7hzERqg/XpiERHMpHeayyLN2bj4hnJx2Grk8LjVQT1uohNWaSuUpnf00DGLkHyIuIkZjw1WBarYRd58f/2D2wDbzZgsymcj9CfsyTlpEFZbqKNK2lbuNWwV5X0GYxCEcXNRjrri7vlMXMbRtu3D9fe/kRNKYFRSbTXrxEbFvSndV8phojJt6yv3AJobRVM3M2iDmJpWzpGM0cYKOFj0sFTEO07juqmR0yX+ZmE+08zyGNjcYIbqoYhYwiZjQKzzZVeptg1LXZsczszkcSpLCF/l8tCEiZBUZaTRTQ1H57raYV81ANa1+ufjFHK43kxLeOWt1wu8kpm2SbfglSRPU3ICtBWzUO7lLbgFrSTLmAV4yyVPKxW88l+vUaU6f2Vi1KOY9/Z8Yu/So1jP1XlBXGrIMjjzoh4fAkIhPzRG9BNM1LCkCC2DC4yZaakLp2bNwOapolHTYGcSshRP9BVuvbJ58hTALwZ5GVVUinlh45meKRHU6H3k5g0qaOp86F6tyXRYv3pBpwMqCmNcB54I/MCDihHHImKJY53C/LqiBv2ksQJABR387eP1s3cAtGtt0YzSpNVEbRV5rsI9mXis+uK7n1tYA0J+4oTCMOFCFCYVQCAhjOu9Y6WZyKmWriLJqBWwgbcsonMfag1SlAZNSkRyj+lRKb3iNCIYlky8d74CcMWSnzEJL/l8wEVOwPAybg0BsCCj1S4ZMnzShdRdbRfLaOPdv+oywkiBC4TcpQL+zpJY1MJfPNbMUpd89cgu4jqSKiu6hedapTsvvUO16jpqowlm8QWTBKdl+UOmZsENuTABbsjRY5rM03PXHWnIG90LTHkBNvUiN8EuxAMInClE3uCoNghdllhmqPFcBbX9DGnZYyWCfW98A/UUbU8WbFhCZPikHyFOqviOX83F7gMATagW479+9qobfyrOa4tuBQtU9ZaAYLN+RARAcGQ13f6S4JzstXstKIKYvRZjKnavbtTZ6lVHVTR0eanc/asbVoIrq59ACrFFYPz9xXpWSADFZTnv3A+gmOxu8eF51NxwkXa7w/UcHFlQ/d/OO1Tfvczxe63E8Q04UmqQNEsl4X+q5U7/DAwRU9gNnU4O7VHoSYxTKzQbOLdiEbRMzRMUSMmHJF4mwxIDmW+vA7if7vj9Mz3dfuuymxqZEYYzQ6SqKmzCVGYY5Zoqjn841ULXhcrYbLx+haCcdOEthUUsAi8W4RZdqMVLDRco6sGtyw+//KDHDwMPgmN7eQaoBwZ6cq8OOTPmS+gwQJhbgEkt2k5UyvEEiFwTVqT//AAMPm8nHE8/rAz9sHDzw8rKCyPPHLxjowvuWXhm5pWFS2b+WIDTBjdod8jUtnjaU4/snONJmR/tYRhLnGKJT2T+ULhCZgfV1KPGcYOEZWMDD05TFk2YM2bM1MnwToMkHAvzR+KJMN/TyumT5XuinD6W3ghvwnwJ+yIhO2lkFSiy7wI7H0hNrRbvQf6AOQPmCrYsLHTywj5qioUVtEgHDykvU13hKi8aDtAAWLnGZsHxsiQBV8LyB7XhPsdjJURJAyZoODWmPpSa8Q2RGqZs8jH5syDq34Pkg74pYP09ZpnuCd3vaZP9NKJ6piVPMniIghmHP1FuiYUNOPBJsjMuYzT2JPljiewAmOYx2eOIk2JBN4xnngS+MLC3Lu8kJ+XobQe2D2ewXY4tMtKtb7dISB993SMf3fJ6i3T00baxbPR3j5WNcqmWxCf43WPCfarg0s4XdzSvUfjJpswdkdfZJb2p85q1sxIPaTG3syYSRS80qE7R4Yba66LiVgf2yaLS1bKdHFhuEcxhoANj2elAvGiqJJClJ2OX8BF9xLGa2rKp2nkAzC46MepBPRdB6izGkwHS0MklhkAT6mvmpCUHFYco8xXVsRkq2aLIglEOyCuBblDDa/kiudfjVtslgJfyU97hiASmw8/YR2zJvIo3USEOsqvjurxq8iYF80RzdYp0g0pr0LyWCEYpvCHfWTOHD41I3C3yV4hbRdABWy+ihbIAmlw0UKAHFtqSQJRDEoiNtA01nqhKg8MnM2senx/2c/q/MD15KIVfNu9iEEwePDTsJ9OT+4b9A9OTv4f/Rw9PTZR/kxMzR3qfZ49szbP1d4zzzRw7OjXRjif7jh09DNfpClyn/hsKJhOTNFDtlj5Q0kDHynRfJAM/7+6BwJbEMWdeUXGMRgng6AAReiwtBQUg5orcfnRX54vyD787o+VR13MGQ9qzj0h9anKwYXwybcAqrE+ZpR6l0R5+3ut+zWFpPl0/e0WciZAE385oYXJxQbPvh08WJf/aje81P4nQgHtTdkBuUYYmtx13R779XfzPL08pWxfM8NGNXOBxlp4IPUK3l1yhtVurWgiZFDtjkXLW1Eo1rAn3gi/4qR7MRRImsu4Jj7Vx9apjsxL02h2h/gOhpqS70sojT6Jt6Vs8VaVvXMWXeC64yCe6HkDlU12A6dzU1HD42U0RMSQ1is4Y8BgkaGjuIT9Tep+lcSsUcr7ISm3dC5EaF2xcuvng9rn11+6tvXHKOfedScRlCQrf2hLHShPdnRpDU3RKPOsXiN+/CbDWXrrkIJJPb9LZqsNsqZGPYDzIr6IEtt0m72LEV4WoQxaHj+SlG8+5FW6wR3eMyH7/TKq+pTbe+xT47vXVu9Af8b0C7FdMRs0Z+mAn4h+Z7kotVmvPIANGqwGsfM5+gvCd2DdzGXqRBXM1VOViS892nNQ94Uha1IjuHRtpK9avf4J+CE5/oq1IUWUenWbFIrYLml5m2WFqE2pLyTPNXC0Oa7tisi8KJF4E7vRgr1T3OJ75w3c+3fjD7bWXxDnecsBfv+79v3t/R6fcd1O5lXnAD0jk5bb7Naq4VEX+L2DX37qw/uqr66+cUcgY3jQhpABbOLmjoKZ8iwayfMeOy09V1e5SwmLceg0gPbj16oNbHFnKdC8Cv2yq8gGCpE5xcusejS3hIYrMmrPDnRaPLYZOQdiISNBtHglzbn5KoF94cFujyqPekZda2n3gnq8uMYNxlJeI1pGREkbZ5EyQ6JFV+UxIx6Oki8bD3L3N+9I3XqVxXpXPB803NumHDwWfnaze0ww5gEEKKBtk3ctD7NbHHoSpU8e4rwMklR/w0l3AAdZDdpcnUVa6NzPSIkP/FVLj5qt/2LjyBVpk3Tqp9aIX7hbL5zP2tekksTRz0cuErE3KyaL6jL1j1UPg79hcM1iACU3LH51xw3RNMfIqmvWSH/Bv1z75ZP32Bw/uvKfep5KYPTrDvlbuSomwaXPvL6XUfgpNK/A2T38N7X/457MKDyPddC+S84cUfS26zpDjxBq/wC4F5DVDAhoC9xrbmrw1rlelMqgTKJH08LQDJwpuP3A5puymEybKw3N/ht6JMDpYIEqB+o8oKsJmGTK3l2ap+k6EmVD1BIV2FCxYGsenLr1QsJkCJXRgMHZPO/WCORSPSTxh/gLRj2hR3b2TeHisJ0396Iu1L/+wtvqZNpUt7eroLYpjxANvDuiIYvrgHW9cPeAUMKYPIyhA9Q3D3xrD+uCNyrjfW/TYgynLjFAkfee9jfcvq+QosSwnZCcJuLHn7XaDY2Sj8XJqEUGHMxz4LTF5VisVMejSgwmDYRNRtr6aEx/quF9dkhmfajM2L7y+efL19ZPnnABLwi6KWI9c52VxS4V686VI1JCFhNTcddrKkGTPSExqFjDxtNTqrq8+uPX55qWTrjpeNKlFOTj8RKuRUTStM8B9dVrgJf1GPv6gghg2kY5YSMmRncDxqmuiYHgmRoW/akEk54VGFoJpoJIv/RWopMrAcOoR2katR3YJSIZoGE6dg4RlFKAT8BcpQIaBKD9mS6ip3Myc/mPSvaS8w+crD+68ruxDYjKbAl5sESJMAnhCtlF2L3GYmDq6o+QdArrK5OzoFCkj//zs2aN7u+qR51Coh717PLj1xub1c1CTVIMsEn0c2OzoXZHYkSs78Ln/TkZE4+TG3U9VY6phPbU3RbkZRoXEoyw2Sq1JWjmbpMFtSlivE2oSa5kRrr3TUiH3+W+RUbhUSCwD9O0VOn+uIWO4FEMoqbgqhX10pKE1PQ1a+vCzTx9+8lfl9pY9nEpAMAJxHwmzng/irOJqJtk0r4CCtwkXNmvAyNdSj/R8ISNF8Lx/hiTzp+a4LiIcFOr84mtrfzsJlT64++YO6piJdfsGNFzjavmGjnDFXT+H7RY+f2fWXLn4K2UZa9vJWNtOxtoWGesMS/TYdFWFq7v3xLvpC3UvWbzRhGa2m/lnZp1FSFcnQl0nVCfCg6yIaqp8pTjInMmJGwnEjWEQUXBnYcccL8j8V4nx0vg+OBOJEVL+J2BZZtZmpiILeEEA/JQ3NjRfJWqmYypIrFh6UGZCyXktIlWkeb7oY7DAAT+JejoinGTM4Qd6Qykcz5Pj3BLpUIqBhwaZHBpwQG664KGBIAUWdZ9W8Xydebs64zMSqWTi+JWD5ehpxI5ZeenrimfGmlnoQvwmhyJOOM9WhrgkZCHwZVloBC0nXEtbpW97n96910tpf3Rwq9xtyzsncdua7mRtj74QKduWF06+9mjtLFn7t+0la3uf3nviBGePTvzbznai+XIUzHFwSL5BARqHMVhmM0pUKWRxMPnGo9sGhQNli9FMbzD0pbOelPCZi42IpGKs49asyS266BM3fVRM/fxRkNFMYl2aqjyzW758SXwi6h3QgMDOijYdtI4eS0IqaTU/kmQJDTc1FidA70jwhXweIFYd7KrrNVTO74v7oG47NE4oGKQbWMm5FskluucSdChSw1a6Y+HbknP3KLcdDt89z2a2/AV4+DX6Z8cJ00pjV4wV5S8Nh+u/6zDnqDJM6UXRdAYYiRROGvVEordn9z5/bHDfmD/166eH/KcP/67fHxqcfMYO+L9+/lhQr1Vr1bzPH+j3B8f/teJP7fMhKRkeGjyE74YGDz6zz4enA/CwCL/9+KtV90Xwi+F+TH6j+KtVR/b3YfmRWnV4Bn6N6t4hhBIE9cEq/GpQebvfj/sxmAW2YO+xuX7/2G8o9dd7nz9eG/CPTO8d8Af75gf8o9DeZ6DEnopfgRdHIf3/C1Ha0OB8e2gwjoYGW+HQ4NysbUInfrfPH2zMTA4G9Yladb7fhyb+AiK6OE2txwZQ5MQibovParaCYkcXgJzHSwZWlDHI2wQD6JHHllEoeQ3tUbW2AvI8x6ZWm3+4rsGNfvm6MKqQq+v211pXYlL09TzODo6BjwUGJmZ3C8QT1sjzfD2gCwnefiSnwSh2u6CBqSw7xOCLPgY1m5HnADrE5VIbn36hpaR/FnXj6oWVmoXNAT1Lt7qrgGApATpUD0X+zSp54oQdBu76F4U9Gflw8TgGGxmUdWB3w+YaZLM0qtZlnJGkTmJghlpD6a5slG1y2EULV/Lgzh83/3JD66EPFKR0nNS9CHc2tBnRRDpbpxcpaQ/QbdDwupc43urXTCcvb97708Z74o9vt+QKd5cAhSbt3uEvya9/OJU5AGvXXtDSxBXDILaZKw53LwcdjDXBMKrdlZyZNet1iFNwEejUWoiCz21ef98FJiH2K3FQOIn9wDCEqyVTqOvva1HYUMyyjxEK5ACP5PmiHVIYiPvvLJIKWpX/k/Lf22u3rsGfKy3RwYyUNlyaBTeXmjVXcvPCVS221dtosJ23UbONt9Fgi7dRZZTrzo3Sxupp52H0l/Rpyn6EVguHpvwFtC7a/STxAqwFZntQ6IShf3+Vda8ZjOuSeaHdRdKurVnbGNACneiTr2rRwOiu4ry5f4aUZlf/vHbq7Ob1b4tZjMKNgDcsNJW5NmI6Uonn4CFcYha8AiYdPVxkgM5Rap1cnQHJ5JMrVPRL0FVcvZyKGVnXJMAdLlPzudAseu2AiTOuu+7tJU/8sP/lxsbd1Y27F4tGAwgxRXVQy7ixXFkIebsrFnGJVgc9ghoBnUh9hEyK+gCflOuD1rI/xpTNeywdi5AcXmMu2xbsuVAUz6aPCzHL4SscpQEWC0oDVQlg/dynG3ffVXfu7B9SwZKlKgd95SoVHiAlKy4BFKDaCSI0Wbu8Ge3xxZqgZ9OWpJYcskKzlyPKTaND0qd6QBtSdctU3pUKpqX9qHPP1L0ZofMws+ChGSROkAWv49F+gJPR+FHMdzFCa0JrGY3tFbL4NSCwstKI2NVd4InuiiS4iJ1K5ST8JRO4RY3biSJ6FCF3NALm+otvrb94TyNgJoRnCqrKhAZwjpJU1kJB7LOFoiImKgiqoAtAZ65COlW6xtU5YrQgfqWIDHlZDlPU0R+hag0c7wPiQw6oJECssgM5oJRr914qW173Usq4IJMFiQRgLZ3TJWinPn4E2j9KeinCdccR4DXZ0ULXCsiu5wVs2wO4UQIM/e+F++bdEtx9h8i/cwyc8S72HpsEOS4SfNjHln3kL5ZZnI2PX0R3sW85jopsGYPZ3anNed0GdB31OuzsqFUqvHbmw1LhoI5u+yRkE8qmMEQt8UMBABHvttmuiJY/KQh371RZMfjBrTfK369K0jc33GmJf5N3aouPBrNRgZyucuiFUx8DzK0souubYsAlat9Y2dIf2+nYQm4oy2rxeCgSIe0L35XbWo/bRVs52Ki0VIARpFrJGQEBwsmggLCF4h6ApwEeMqlDaC9G1+/zjvkCgqqeFEk4scQzYP2Fm8qnsrjaia01Yc5FCJUAJVz0lRtaFCpC59CDcsolQ4O1TzAhX/RcxHjgU5i5BfZEO0HlH+nF7E69WJReiK8SnMXoqGR7a2qHhRTRlVFcgd74RBfng/LtgloyVsCE5URPjEmY11ZG2+XEJTjAntwSKUCLjxw3qt/tL3S0WabrGFJJYV5U+VBlQp+UbWSOsYSJFf06rFvwfMrtKauXOL4tSBxbVySWeTjm3rQU6xQWjE0SQGnCPsLX9DA1JY4mMWVWpnRfSi8lFxxEiX1ImDuYZlfuliOxLZNbLbxHYRUrqpbI+jY0vUzJGUQkyY/IkB2d7iGoTzLDyqSsRMcElTt6w5hb6ExBYkr0xZVQpF/C+A7d96D6Mv0QzIPb0JzvIIX2p4S3CixdQtHbF6IIhYyiGIEq9tw5O8az5wnOaFFRmSKbZEf04zCPw1iB4g0bQ6cXWLmHkwRNCIroxQ+lwLhVYGo858Vuu7i4j+ToCYv76NueqLjbvS4FxX3kdU9M3O3axuLS3z4mIi6UWjhxovCy99ud4+EGixzsJAgl6Mm8hPEIRP/PVMWXW2yay8WtWPaiOp4Ehl3kAB/GLvENCVnFQDiuwxOnsXs4wy7j4kXLxtcRX+GDcWG0xmZw1ZjrNHlT7kSyShL5htxEZi4yLP6dc1bavKs1iwEHnq1ZiTNr63yXz0sDTVVsoEOXYA0rNC7HOes8zEqclrgjsky0+s5VqhmZPHUW21UWjqquoAya2kLr4DhXedRzTi71kPtC/kg5Fg01mFvJLePWiFT1SQSdU8Mj/tyw/+yvhwf8pX5/sd/vH8MAuUv9Ff/w9GRrzF9uVZ8/PD2xd+nZfr+v4lcq/uT4M53D04cW4LdYM6MD/lTFP3J4+mCe8P1AZcxPzfT+31T89vT+31b8+el90cy+1qgfd/r9vWH1+emx30Ith6dHZ+E3d3h6pNkY9i2bYc8M+zNsgD09HDcOTw/V4RdEg/7coJ+bwb2t53876udJbWBvq3p4ur8x4k/3j/T5w33Q3r6oH/9P7MO+xP1+pd//V0h3d/+Xml8nppGHfNwNjGTYZk0PTkXDy6B4YdXUUJzeo62heLxPKBwLb4ytUHRICkM+YuOUIHQlYX8pJSlkLqog0c6YIuXiPiXkUAsaOQ523RSed4EO4imInNfOvSwYJuIzrx5rN//yrXqslfz7uVEK0MHZz4EcGAKrs7E4ZvPOFYAibGYrAYaarYjlIVG/4/wIWx182Q6CMEVWk9xImyptDlIWx2yIvjzwCgGWMa50FPzvk3/iDQZDw9bVmRgRRIN6Kxzs/UJz2QHdOHdSgQI4FDhBGStBxKtxq4U8PnATFLsuQ1aYx494MgzbmqKWSpYW4TfOixXxdxtX/sR+b1fabMBaI7gygqzkxbboKbBsLODKHTT8EgoMBlGBQbdJa3U3ykWn1AOYBHroAMmpbG3ooBwOA+9up1RzErc0rDC5do5t5gVkKlpxAs2470xvokXcgfOZMIn5GAyqyQkYie8nHzrILEb+5c+srzhsUDhXwzb2+AonAoBuwkV41F1ll/IJCt6Es22hES41xmRhkC+g1pDHkdHrUR4nxkNRm/Dw5AyQ3bJdArhqy1ttBVCEFwB83SRm3QVKCjWmUTDHnjhIWHch4patv8Y8o2kYPpcOd1P5NslgwwD6lzkJXFJVp/5cHmMYS/nuZfjs5Hw6bu1GA60BVvngCwZLGBahsv3hkwZLkzfuynyiqB/C99uYAifTbaaJqLmU0OH6/TORQnjw3XmFgGqxQ8zADrEGAcmwA25G1L3gJsjatddhwytIoBmaKnc7IQ9WC/JgZjV9LokXnQRd5sad1xSChOOBMePjnjjk2NIabAfWOmnl8FrfvP5NEX+J65StjgEeFinzHIdXJP0dLbh5/ZwraIH35S9MEWmoaLOWsx4uxUNijy4/XCHz/yss870Kf6LGVbMpatrAHiU/xAo1KRlKk8oLQz3tVPyAEfdK8FPgVQiNUUX7ybKq4apZX31dqzF1GNgYFUo9mBWsIRSjhH0ZdnGzbG4FEBZI6A5fio1LQ0SXC6r1OYeogqRCZ1+DP/3IEWn75CZgY7VIHQJh+d3oElBLi5k2FFUzbdZzhjaZKpVGkUuExwOWLd9Qaw2f+S2syhSV5JK62m4DFRDb7Q/OyWesoo40im7djpGgURoKh60BFD4mWzBKhj0Ki57NcWk4VuGV5ynXg9NU6kkt8OMNVCoUf55BK290V0L6aMsaMSY1SV5H++JEtpkpboy4IAeMAXSEBvBEiTffOrt25gXphu5WAVKLbmSfyrFYAS3Wtdj6m6e12N+FFklgqKZ1b95VrIhoOpnxWhisbUEMkPNUkACqMYYBEca6CTAeQUOoKDuTPHNRPUlqvRrGhBqF4diOSKMw6gJZFWqjymFKCmn/F9quhIzMqRXatyA0HBPZk1GChmBxOVw590XJcwUKDWpxqAEbkE8irMyByGu2mqsqH+cif+333yHmf+3spfXT4oMFli2r5ZLGK4Xu6Z4ny2e0/mXVurjJ4ZMpMoGGSbn2V/VimbCsBzbPTp5CzBctN3QvS1EBSIxw9vT6a9KLmk04hgFd5VGe2FGAun5+5yt1S0tiTkIieDiFxyPssBT1hwMvZuJt8XjEkNG02mnnrG57fePah/8QHNowAZwH39/bycj3CbhRjdwkfCiwEiUOs8zvlDlP4hgbzOkwj1NiFB1fV74hPk6EHcy7XSiUNLGDeVwlBcWIuNyCwVJ+TXkr5auUqXL8DXxyZHp2pb1sj3A8QhKF00GmpOIOAQ/QwOCxXz9TpqPCOzDf4Dj7tsr35CSmRWrWwmsImyA8QmL4bEW4A+ZxhDMQmq4EHUXaQyLNHlJBNn6YgVK7HR1nPngbemoCEp0UtPTnE1ImoY5h4GJ17DnrWycUfxQJkNAeJjsFiVCyoHSAJVBCWAjXO4LyWEwsONjhbasCbvrMJM9mFMvIVTKRjyNgqY9oaEpGF4r2GOHpnBFhbda9zPJgltMawU2Mlp4MnzAmkd0CCR+JhaB/tpAtk8/TbaIk/4QY7bFStMcL0R4vQ3usCO1xErTf7BweeasA7Tc7W/Lm81HeXCbFObmPRGKDMYnFqjSouxDFQYiyIrUn5Sfe6OV1FXVV6YnL5XU0eGVJpulQggJU4BE9sU8r00QFd5fOsrCYVOqqLHfim1LbQm4YqtLlVVcatQApRRQB86q8MPzEXYQCnHuRHpjtL2DD9+VnepFx21Exk4rD4C6i8nMOW+RZ7pQkSZ2sn4h3InSkkTXcKSymI0bjxaiJv4H7AG7ENZeOqg6iDhshahkZNxqu79pb10G8KXdCcnI7uXVPJJMbHZjcC7+nB8KJ+tTowAT8xuEvHx04BLeHFgfa9jjcHITfAfiLBzJ7fHRg//y+aNRvDfX5g4N+BJepij+0XB+bGD80BAWez9rHR6HEyOjAUfgN/ytkgMtAOLQMVezzhyrT+/xDB5NBNC8eGYYSs1nbDvS3B/0jkDDU6D/ct29QJICNYf83A/7R/TUAAS1aGB56em9r1N8z4M8NjQ/6KVwPzVXHD1YPHdg/PzTiH9wP2Q8fPLCTzGpqAOqwUJU5NmxGWFY3lgOUiXKu6anR43+3EiGqWrRbpGBGZgsUIxEtLhM0+BkVS98cvgA9dC8BXxndfw8lMrfxo25cuLb28h/1WFngOW0JeOyuwLNTlpD3rCqhkJ2uRAFclCUYuipLtGCXEdfz6ZLH+36VqKBHaw6tNxeryhwxTRgF1UMhl2xu17++sHH20zK8zBV23tl7wAas2D/jNPHqnoMsB/sEVg0OURdnUNWXbFilvWgcmnp3dSE8xIwdcFIJhfRDv8/IHmoktwd3/gg8oovk9jOhAbuuAJllZ3ClcGjAeI6yvdRS4LqKcaRXSRLFgaEd24n6PVfzututo/Dy+m3lM56LxSnJc73gnpP5wx6fn9Owddw4hOfaBsDKxsVsUJOHcUqHXrQhSFAxYUbCtmWlyflIdm47xoZzSfSp0K6I7J9wA8ofDOpFG+Frr7va+x8ZFO2EQKYedDyBSPEYTjKkQu0xNBS4lTQgTXKEfbfhrpXOtjuhvNcJpLMSwODWQGel5cCF5OxolYL/UpguNLSqq57j2tt/5lIuEgQuuZabw9yChSIShDQv0dgC1JiEG8Nu8Ovl9qA49OMXtUlPoOpCjROxBDdOJROmgepThbYKqkoF/NBQa7MOBt/exXyzGHqtEIXB8M2viHDxwkIPGJL98lPHLKAaIoFC/SWBxKJAAfSXGwoIgERe+XulYt8l3yzufZvBs/t0PdikhEpyjSNOsd4xJqTX+d8n/xSxdlU5gjIQt4anu23FIag4JwgkDBZgLaZxG8McPNLUIKxaermlzZSOyYEX71Cipx9yaE32dKUvzyfYgM1LH79Q6iGlo8gp4aTsWRKdUYn2SaHbI9+ijt+i0Mkp1SraQ1qffOG697iPs+Dhd448032Z/WLZWsSBw8vTG2WaXoaDD1fXYdYuwu5qXzcvvI4dlV6KS0WJtq0Gf4XfJef0NMeIgbKgzSLrWhnPgZdgQwRb9gfcJ9zxK2jAMACCxVjY/Fi2IhjA2qLJa6HWfKdKqtqy67/1xuY93kHmgX4Mi5aqbODX8Toow4xYKJ3RDcqkFRTLpRnQP7wUSK7Sux7Oni5T1+4KjVXJoxkxjnWOgBbFYmiKPswcLPZixoAENxOyZ98PchcXt8Vdjrbtipo//8ZRFtK1kqGSGbvgZiwrS3FDSO8KUUddda94xDa/PKXDZVqwmvA8o5UDgx09QoHQwpAzRHktNzSS7qUrHHXv8BzaUlrf0yCXiBgqTGM0IR5somcwtNj8h3/+6OGH12CooLcbd9Xlg2ski1R627RNQ3qqFvJUrpIpgqvLYakLdqGEX+QWaOiMpppgxq08URa78LpqyPw0TZFV5VbU9qQOWctMH5ivZAKXkDBAgu8SN4lRc4SVfJLalZq9/6oTsv8dLJR8r4KHQt7j+w+VhzI8vzHYetxOGWOnUdzGVYHLpo8OzmouE6pJsWgmWEwjmGKOSVFeDbCo49Q2Vt/bQdGPGfGCRS+Yc2qB3hUsuePGlXWWMS8uAVvulnnjEmOMQmg6rzVLlpV8FzCECmMuQ2d6ludfPbItOgiPSvyxY41/HsdWMJwlbnNHDsvxdiXG7rGZWaxZMGJPpBOshzcFiyRsTUTERLV3WRbI3IuyLrykxWiejeULC3kZcx3wnbWEE35V1hLupcy9ZFmQZ6l1cVSmqI6WPi53mQT10J8tHad/ZXJQpgXb55Y2C8h/HP9tRX69mO+nP7FirRLKemStyGGeohidBxlbJm9P6hCvCEJhNLKNs0DCHYBGvH+C7+vhTN3qLHC7HIWzwG3fFs4Cd3itzgK3e104C9yhbSxh/PUOzgKlUHLiRBydOJEGnRO/3llDr8phM2yNpVO1XGKOzJC9O6qbSUBZ0oHDJ0km02aSG+bxsiSo7z8MONtiW1t51jeQyWqYEE0QP3omcqa1HE6lI8VMBzLlatUsz+VYt2i+K8FikwBrMKFGwBXnh2Epp8STtSHl5AAiTXpivT4T0XsSai4x44XKfsvcJQxvQo8SkpYtkosgumTzzVkpUaSa4hkR+s65tEMYQJebWNXoJ1tHuRjU0iC6MStGqIiYW+629lT75rpThNQtGskteyLJ4uBA/2T/5MTyxN4j03A/cXQ8bB4/dnQcfofkdxD+anA9AH8Grvvxd+zo9L5jR/dNjPhjB0f8peaxo2MNSB8dPTDiB0ePjiyFx46OzB07Orx/xD82bI/CuyH4S48fHTx27OjgPDwPHBsYHfGPHu0fGPKrcGeD4/19y9NjI0MDUWX5yOjwYP9O8jzMg++3XkfhOobPw/A8gumDkD6E7/vh/cDPkQ82bMtGQJc91OBqsl65hX1RFOwKPTxKuWYiMWxrYDoG3MO8MSd2KAm9ooj1yP0zVfKhjAjsu79tfPqF+voGMualsUFn5XxIkxuoIcp3hYSRU6yM1fMAGkbOo0Oj+2fQkz4RldXPAeDfdbaKQET6hlBE9EZ+jqBwXd37YzCVmjpAEqkg2eda9XQxA22hyCbvXwZAjuvprmRGjv4BTe/ungdGaIF6heYbfGSVOH9ZrOTxwykUPp7XmJKb399++IfP9NjLYrEmCf8UIB/ZTdKZJEI1ZGAop3cl6HNxvN+poGglfKTHdRRRBCUEW816HAyTIwdKCDbYKhX9tlU1J77/5iK3Frapa9+f/FnAplViU0BkuQ2Dc86jPTxm8lBqLcFEo6ABm2lSv2mSDEZyoc4Y5qoxTzmHEUAz2CL0FYFPcITt/Tdb7G0auv/g9o2Sv3jyci81Os/xFPKC63Qu5IuMgfqSn0F3WFKpupUvamXH8lxnb8/qPHVdt9z8pQwcJtST03EAT1bdIphW8JdIX5J504soMVD2tBxmh6sb7PE37nrWX/I77nLznJdU7Z58ONrFl+qXUDsXnbyiZVk5kcTYYjUCy9qw2/WMPJY5l0n4WfCOzRfOf4tz/4W3isWNgkOBJfYjGOCyrrA6xp2Kew4gCxMZmOjToOR/RQUz5ANO7V0LZMFqo4axRVa0kMZYkMb5b3G6C97gBnYv0jaYW8hqrPjplunAi74ZiRlKYXNl1Dhsro4a6yKSTs/udHukQfgCPZwV2GLtxXslbMFxJ7mjo7wId6GnrTgsNq8Uf1LPOkibEuNPyrTiAJRShcSgpBqK5Y3njQuywJcDvuclHrmmqkoRAcLhU8WiF+/hFJVjegJHMXPlTAZB7nAu4+x5GXzNRtpkFy5XR5Xi5f7cUcVAjMWoPnz59UdH9TS7qfh5QylweSgZrOs791iHT9qjbeFR0zC+OOlEYeEXHDWtiEeNqxFHZegLD+3pWSsGyM7upRwwVKraMWlMgRxYQyaNaVWTngxpGNJIXuC4wZ9Al1VtRgN9MPgi1kfKAlIN9cHKFYRaCbbiVIXNGJVBS3szpROiMLg7yNBvg+FARdhWfQl4m0hD1TWWhpopA8CEMVDKUAQmZ6KQIsKUtpZCkYufWYpIRtAVSTrwErCBgJc8CYiFKmKOknEo4iI17CQcJ9ap6MkDxlXD0N+6DL3XMPQSeVqWfc9s4EMhxw1xtGnlhzQqMg8qR0V2SJMcjeiwiYMGGdPeISUkxyOq7kZ0PMnbiI7nE7VS1MEkKLbQHNdON1sZ8t+nYEfrnPA5rnJB5tiwUJal0gZHFqACoQks3KDhAlLbM1Y/pwklmlIiKMXglGSNMS/zYjC4Ce6kgIZhO8GfW2W4fG0e0sTVNOkOc9TKTivzQ+tEFJ2s5Ksxz6xYtWBIlRHt4T7LjK1jan82j9jLHj7KGw4W3FN/iRksMYHTPQyg4/1EatbLG/WwRFtYoS08UC/7U+J9TCuB/QPiC1auReaAtxMsNdKzJURXeq7kmlmwLyXe5THcFLv56eGmZFb0sBU8A7Z+poKVcGzET1KmMpkt09j9VMV+qUIJznRBVx1NfWLi5+ieIHj+RkKImPryssDTJaQS0yXi4wiPow6ctV/IwaDQgekyDXDov7wUDK+aQPQHm5lDxA4H/8TKKbDWFpTF35Qw/iADF+TEeOknwOqi6Fn8KhpEN5w2Hvf+CbDPgs1wlx/FLZhwWyWEj8lYCAofl6mQFz4+l4oNH5OrkB4+vvksRHx2ByEil22j/LBUtH7i2R1FiaSN10LjUlN3Qjw0eE84ahAHBg5aHB1E7FQ7Odq18QuyaLUdY2cZgGnqLVwxU74UsNM/ctiXVzlZhXLVnCSSVfdcqsjO2uWYnf3BHTkeZFEjyt+gAa3IsDkwyjL1iY4axY1gEFoTUltbJive2Xkn/4uCpr4MwnwO6sAz4cjJR90jtJqqJDMi7LC7B54g4zDIWF3eJGCQhLqYiQYAiY1tQ11suDVvstiIDigOOLfNRhgQpSW3waI6imyhCbJIDEnfkh54NGOtNqS7R74aN7z0Ndwwy6DyoJRGrvdKVWlPpWP6jw8ULJtsP5H0cSaoP4+/hWS2sQg/vJ+aHD+E18UFfpa0/Xovz2OLC4l7D/ezTbg2Z/AXPD8NGfQHz/XyM/7wUvEPw2Vy/PigvzzoT0+ND474z4z6e0f9uVH/AOQ6OOxncLsw4B/83Zg/vg/vDkHC2IA/OuBPjI4Mx2Pwbx/+xkaGx0aHKxV/HyT191UOVvzy/wH+38//+7aXOJLWAO7FkmqcoiFAlDdYcyDKd7E7bg+DCgDJ5HieCVsOkHvqLeXkMDOKydwJrQ3wPRAaMudVxYMWG3l599+si/bBp2fWzlxdP/1uIQdER2spKi5J89gb7ixaVGUWLWFd41RACG/iWXgl7ULuA925AwqJPWlRWUaxQn6vuD0iqfjke26Li4iaoQkZrCk5AC4HR0WWpKYvNC8MgsvLAVMDr8jlYseRk3A0vkS1yx+vLLtAcuvX33r48htrN16Vo0eUWVBcAHY1jy7ISy2gbwC9zbxUMqTom0cq1kO9/Mc36l5P1XzE9/CF71ylLoZyPutgaeC3R+rckg+ZmKCB41FUjJa56EqEjIfY8mXzL+iFGy2IPr8ojr95VwesyiG2qM1Q5RA/Mp/B66ACShkpD2gcsj9B2oyUakCJQwHeCbjJvZ2hDbNE5Mxyw7Ec2MiEk7sXMJoERiPBN0V2Fn6Tr+4oMWTITXXyiK7kS/SPjaNgPNdWv4Q/+XxOEcZzW9hKofETilqMbGf3M/PFyjGkqdLwDIdn9gpFGY82uOM9bs5Qxcq1yTlueXDrDW7SluEIxOmOG4jQU/87mCmmaSx+eKT3zgUjdRm3ArdJ9szeebDXr1xZe3VF3fSU6irWTk91pZVTjHvP8pGaty4erPyRhQO1l1YNa4ywBXALZq+diVhq3epebu1Gw23CZstBJuJsKGBbns0oCkx3VbLPhAEaDKIzO9QNmnRBepZx60/2ht9+tfny5YfnzpeqtSnVCRgqSFjqgfUB4OWgEye1LbUlQJRqPXWRvzgbkqqHVhd1r3LsZnZqRbU+uHdh45NbEjWp1r3ZCEjdjZWJUpu06ewGT3BYK9DWYsqCgT/JbXqKDFwKe/0kj3Uvi1qJ0Ieoe0EUt8mB2tW1d76Sz9oyIsGLYt7BaBLLMshmzVTZaWoJEloq/+VGGRKw82S13nK+NFNyW+q8aFLMX1LqVOdOLdrSxjPqQxPhsz9UcaEJ4L+4rT6faHfLsURg/UnIDtm5eIRqMrQ9TllXlHa9jG4ip36OojoSUSbG6wSqm02WnYxSuQHqg/ELxKfUBhms3bCoFqKSIAyeLIcZMFl3lR+oV+5V0SdyMvHDqQ537MHdDzavw05UY0ujQlb3s5QEeGx0XdX+cA0kxYmI3pEER/qQlbWzSh1gLS2uSF3M4/LBzbdYtHsUrCmum4ZNqoc4vBhauBlPrNxpri2Qob1nawlZ7sfLgAFnYPCReyANWguMx7BqjNYBgJeIJT7FEpmLnBL8/ffwuOzKEjXz/plIHPC+9uXm959gS7873xOgAAdkwaN2HymCFfDKg417ERoW0lB5WYMXeDA6eXy8fBBWrhJ1mF96pVQfmcgaWWliPqurjN+5JUY2tLy8CDvL8mL3coCaeXWpkzlHVXlFFdQ33M2BaWYK0huHkK17oUFHG47+smc/XYdKgosqmQKXqox3s+dgFkbg+gOGK4EWRxIfpHgLsOtBMCNGgzRJJdTq2pkX1q69sPbBHwjkv2T2n3GWJFUkfbqWKKBarTjqyeLEvYuCuTiplrybWnJW4FbW2rm3AL4EvUUN3It6KA5jggfhaL1MmqUmLE7BcfHK+Te2VaKWXUpost/evP7HzWsSSBdN/lEaasIiTBlJsUNKMDDSCAzlrJwS5jM2Q4cBKBcNxCNS97wldzO2zWtLm39t/W9/gKWlWAHWa/ls2uYhxhpY4MNpjEOGNhZ437LkaVQNMGnAceUusykmrNP109+raAK1+6EwMRv0rZA9Du0utEen8UaumN6GjilG624KDRKImqQ0GSYlRngRPIDBsIIahvFm+864hZMkry2R5KYd5jXxSt7yXHLUXY0Qjc5AJ4nV/MOljRe+fHiHD3Gec/sLPE93jiuBA4kMMQJIL9lFJ+4kngtCt7EgNfdxMnAhXJEaD91itIo6Ly0Wbo7/cOnhh9fUzfFzLRhkwmlivLrg5djb51LknxcIJuxykVPkkEastMbYnjHB2pkPAckrGiCTgaQG9BpFcQI4NBa4FOTlsu5l6gkv5O5qQFmBkRHb+jRYZMLCLrIaHJUMdbqltvXP3tk4+6lDcuoSNyeBf+4Mp0rHFYVPXBHdq1fc1q7RHm6RkQHziA4TwCpYKENnu/VdBLnB/g5kfFrGGy2RQobGFJCgbScBL7Zw5U1bsU8rdmflHdnWvdjWDZhuEUp7g62brPLGygGa3gJoWgBNF4AGFWfLzqK0rWBGniWehYo9cuvu9Km8RXAbgy0nWcghl4F4zB/vqvceagFlKQ61iCUus8KO/e3hQB2va2lImeHkSC3IaGqwZGIuHUP5f3q7tt44iiz8V1p5gZ11ssJZIOIl8tjG4+saHMzyZPV42nabme5hptszZhVpEZiLIkMkIiESDEuWVQiXKCg8QFjJErPS/pGMCf+Cc6uqUz09sMkCksceV1fXqaquPnUudb5j4ZxZZk2MNiAiZU+kEyMb+rIcizj8V7ikSBtKSFKykYgtIqyMv8EXR0Sa5pxdUUYopH9ohp282X5UXiQlK7gt+5dHJYtY7YxsF6YOpoItylsJI++b7Uh2DMncTcffuq6eY/qmrSaFrpMyZQbJI4RxoMfiUcxMlkRdzkzGg7WX1Ji5QMYMvI8ZnoM+QhZJ1um7mcXhk3mRScmpt3QmEi/Oc9gKR6uUWLITmLy0s4r5XnFpro5YsEsqOMt12UVnsS6/aizVJVedhbq8W2yZnhxjmeZ72hhAz6/ZxuRYmzSZXlvG/sn/mVOUKWbcYQjFDPEoTSFjKsYMz9ozoIxRmwv5XOZuXs/jXbL6tsRyqksF7THfwTwySUi4pZQMOsy3vaJd6QGda+W+9LESyMQu0L5hy8hgnNfjvEH5t214ehoi5mTak4tUjcLtOcigyf/FYmyl1iIE0mTsWJygsG4LyMyLZ0TZQJ7YrzRCDCSxow5dEQ0ZSNT9nnGZ3AzTp6/KvCYW/TKB9nq6RhzVU0zszeeModu92ITfRz3ExMi5PB3TsAEb7bGlficR63dEQJp9W4Ix//ylZb6NrBW7LAorgHdW80iLT9E9MftQ+AQuz3XJ3NqJdJNmpkbmwAxZ/A5sN6du/y+m86XF2pp8nv3r8+ur+IGfRhtuewk+pqw6tZJNtWYqK3kfiqFgud+FwUH78H2x330pNjXxA63NQ1kCX2vy/5y0/DJ8XtB14WfzBSqkC6u1yenK1IXa1Eq18ty5+crcLMIOzM9UptYXKpNnFyrPzVaeXqh04Dfc3Z+Zrk6de/KJx4FC58LyYm15qZb+aa7yx7nKubnKfHVqd2F5aXEHKm3B55nZhUq7hqbzqdnpVq3yF2h75snF2cpZICl/qpVqOdBluIcnCz/es/k5Vi1wU46GPE6M4aX0WGNbDTBGNEL6d+43e6D3EXQfJ/hYtUrr4B8tK/giAt/BdSP4um6sjxJf9qitezSeJ3OzbV4iwqhtgwTZiPNNPGGWeQlIEG0vosNuXTmmFIxkLYkyjKWHu70kJx1MB/JimLn0JWLpSzmJMY/vxzcO7x0fmfEhJCP0Y7qM8Kqj5Bn0ttLA0GLXeBYwIqciRzvlu/fvfs7keMh7KYVcg0YIj4ZFiCxO98gfEiQEEoBJCYt1OFsr6RUU6krpAQiaS8ke/746fP3QMwdsxyBqd/OowXmVWmI7ZYI5FUqdwZ2YK8Go485WEO3XG6lBjdwnX0c7sFTxUb5z6eSDS0xTAo7RVgpiB6GfmmC/fC8wsbNdNFQnKaqUlEaJjuIRSoB45jHNwB4mE6U2YmhkZ5MRJ7DZhPMq4V18FBpF67t1zk7OFilnpriBwZ/3vj3A00VuQn7fLnIMXLGXYoNSHZSAwqYYy1CNOs2BevKgIlqUhIPPZ/bNCkkbiJ0ksUkgqNTpsGYz6llAzC/hgWFgE6W1JcaOSHLXPrx//PbJF9ed3gYEqwxDb9vzGnftSmZRaG270PK9b74eHrylWmb7seY/L3ORyUFEirqwrHCkMhqyKeOMYVQJpkC2POr4mn6BEcYomNC3a3jVUorwXmeYtabrsRCDverIymlfJjs8umzI2ujHkWj/zUSuYcYwLxD+kQRX0rQXO+nd28GMBC3003Qj6AjjPQSCi9IPeN4polgjP9z5bnhwB4O4Xfz/g6KuUGCkJsCGHNu0KGpkr6GM5Tf4OOnNJmdmxxzbkroK3w7kMpt0bGG/0wFuyoe7yaD4bZ0jXreZY1oYNDQtHmKY7T9vmzBb2CFQfw3FrDARCXmK5cMYXDTOduMcnha8ZtIVGgxcDVIE0AsmbJf4mTfRmhFMYLfWHMQzmvc2kXsEuo8W+Pn+8UfARGwXDaKoIAogy+Rvg5toMIPnhogKK2z0RDBFZE02OPQLIPDpiwwSwBr4ye0rw1vXsW3Rw5sx+e6IRRnz0DppgFTeBgXUmYgESSIEPr6Piaajzqw5NpfihtZ5hK3TFFXraAMjN54HS/6TzxRUZDvfTHHvDWF+w4LpPmrkGXQenfJlVntGkzQN5FnBdJ9gFgp4tUsN92yxp3U4+DTu4wIhA8rxq7AS79++Pvzkqsv1VtKxGEOQvN5IIqZmoReUi8m4hLqGPDC1j1uSZM6n//7wm1uKvvEtC/FUOaCRcEu5n5nmtgQl6MEaCxGTwl/WVgSk4Me8B2Z8ZkxuGLo5BCLWLYGqrpohT8PgJnnH6A0h2JPB38lCF+VNDJAKa8yFYLacuMH7GGM14Jbi7bQI23DtQy13PCyZMCgQEpHR0GCrQ7izmQUCcpzlzRBENcY5RiQQw3VYftkWyOMYbaP0q8B0Ti59AD+K42DrF6ThNW502jY3Z70L3Jq8PdQGjxxErdDEuRgxKzS8kYSssKSLXTvFJNIVGSMM//VD1UeR2UxX/3+5ztG2gh0TFYykGDapEDYRGRgwpYRQDuoSx4PJ0BEEJSSfoRkfRj4ngR7if14JMNasOMDhrbdO3r/qsf2Yjj0YylXirHX4CSxtKYNdbkKTx+L9OkhClvoc5wCoswpg+oDz+vXR8NYRE5dDxLhYmVzciFunEaSiDYuSj5LwZUslSVNgY9lWaIhg0/+9ghtIQocbeGTDwzcREvxfR/6BIEVq/KmVIkl7fGWENiU5QIu1dEJyHVx+jXvA/BIPQrmnyOTsIwwHX6LK4T1BDLPvpK3iM8TMBWXP8L2bo4uUiVa9ZarGSXUmFPGqWquKfHHBSi/scmXy7Kc5c+aMcxAxANKEHBDCS8ZLJA4iEBptf9ytxlXU/v44mJDDQ3AR/UWY6a0FUoWcIHIeI1FC2JTKjiOQ7o1NVYyy0BECa81BJEH3gTwFLEoHX0W40abkkSWJxaawepdwx9CvrIn8cOWj4cGbiogM041Ium46y+goxhtFCCnGmHteoozIaZ+yr+48IjcxbNP5Ll9PW4M7AhAnXq6gRyRgTnTbl98zbY+BO354k4I2KChrwgOo8Vp19xV2paobtdnjqoadOjaqdWKlDSsVE0YJwuBuxGBnAmlktUtcg9BXUUJBdskczJHckrDjFTXNQBCHC+rmUrlGXNCEH0bd81U8pdx5Bqmi/UlftHqU1dxG9acVBSyzqpWjFY3ysTKiBGndhxcBKwgzTjOZUUrJkqgjawVVRGsfY0V7Vyaz4wRrJVVrYf7BRDctayop82fv73o3i8z3Gwh8WtD7eTGpeho+WuKyQpZ3n5WNyl8qTyApEUWqWgqpFiSQqpY95pTcYUWNX3G3t5u82mKrHgsubG6FTU3vZG4P+yU+rjeBB2D/mkEXubOFouGHgAEbGEcRRbDQRsBoSusoOJry6wqQZlwFC0lTWkGB0ozrJfvtHhsHS8Mi98aGuWt74zF23FniT3Hyg2Y3CTsXsmYebqEodPEiOpB5CtBDuA/8jgSnx5861QeJIsbm9SRdxHdvcAMaeVpX/7Oqbubr4qkmbP1hm7C7bc2zuqaZOdNNr+akX5NGQU5KO46McLz1I7TPyj0UN/t2ms184iJJEBJvusGZZ6hpzAOEg4ta4UqGfh2Y9U5Ub+X0H0/7Mnzd2Dj1t58AMcgJ4g==";
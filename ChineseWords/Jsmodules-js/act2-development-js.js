@@ -1,2 +1,2 @@
 // Obfuscated production version (zlib + base64)
-export const w="eNq1vWuTFEeSNvpX0ubD4cvKzmp2Z/d958tac5V0aIHUDLKxtTUsqyq7KqEqs8msbKh+bcxgJCFAQiChO2gEEgha0LoAkgBdMHtLY/ofx6im+Rfn8VtEZFa1ZvTuHFvN0pUZGe5x83jcw93jT3/6r//6TdyOi8VofHlYJtFK1Y/mfvNPv0n6rTRejOhRUoyvpwM8j3fTiypLhpGW5CeDtBOVaTTsddN+lPT24VE2vtSJ8P/of+nRqJv9dLzq4vn6t5fXP3j30f0Hk5dP/eY//6lOusjbQrpoDfKSSRdV0q/wuE65yPt41t/hacuTBu3x9RL/Xh45uhunbj3++CLTTYZZDDJVv0w6EZqIn71+WmxFWfxZlmmV91vj1WiYREerJEPzmYPwqxF/1devulnaX1mJO1Eni7kr+On43iAa366Yn1GEXkiP4umjC59PrtzfOHX78S3PDZFvRSDpumE5XZ7RCUqz1egIJtma0RdKNuwNoRz0xv8vE2Bq7GsDnxdVG3UIzWq82o721Ie+n6RoBVXPRXMtmvNzbvKhIma6o0NlSPWnCz1u8lBoTn48ObmyqjTjfrtJskjpYZ2i7+Qpor6fPdmkj1aisX1H9+H9Ew/vf250k2GRT3WvjW6jc8PhdR3siYZ97Giiwejl8x0m/Dka/Oj4F9LgTpwM42Ipym1yJ+PVYZZ0izhK2n7ySrk+ytkTTPleGRXJcj9dCEj9/DqeykxaGwm5x+9+RjPp/Dchxb1REfOK8eQyNAarhrp7G17ERjLWFyuVtbSf5fkgpE0TCFSrUUgaE2n94sk66aLKO7W2Fvid9Ptoazocn5KW0jPfzj5m0RIqTTr9fBdNIW5i0NCfbhzEY7RSG/rKG7JklBqmFCasMK8E+2lCz7DqdWx3S3v5HV70G62tAvLa2C6t1JA+Wvv4vdsB/byXxcMybtPcbMXUo2VWYY5AWi0nPfqdj7+yElYEnY+1cSQX2XRpEavg9pDJdLO/nlkhOmffmFy5Azrrn7ytvYr+ifKy+AN1DlEoi2oP96S84DUUJy1XL3i/jXWPRoYVPzpx+tEHL4UVL9KaWI3iMi94IWZ51k0Hsibomaz9DuQqrQUuxiswGVZtWgqHsnQvfqZY8z9dOKSddWGRaJ38anL2C9B6dEt3Gfo4TmOaTlL3UvUMDQo/7/TjnTQYRYoVbbWuYJ7dPxzWOlk7t/HJ+0GtGM+kB1kbczMOYmuI+9wSjAHJ7LgnciXp4lW+RZqT9seX29wg/iDTbayIj0RlP0kWpfQemYlVBuLnj2hHjld7bZZp76zfXaWeXH1fWqek8/EnZVTar5KlDJOOhhmmXak/Su7YEhNSOIgjfmv8lCKHpGyClVs6jtApwkWdIXQMWAkYytvpMBt/PEDnomfyozrASXUYz2N6TN0yxCqBDJRh5i8u0ysSt7RWBtIzbfsEI570l4pqr8j5AYvcPnPy8zmaYevf31j/mpboozs3mI0yPsr1YUOk8S2ToZIsaXR2aicQJV+mSI7k/UVPCauxZ1NZyGyc/komspGJVzJsDthPeBGmRZc2Evd3rj9otxjFhazxv545JFsF1/vTjapHs3b1PjYMqvj4l0HFSQeDsNeqK6p5+9Oe9/uYO67q8eX0sDGsFU8+fl851orzYYI9ISn/wCIhz0hUrdAmtZd3226SUQ3JsEz30zbbjvstyLnkBRIaqDb96TzvsBWPPsmk7954tPpAeJavh2n+LG/nVPswreiHvuq1+RWJviyiulkWXR8Z01Q7MX3lojCNyoXppQEkQY5dSwR3sZSjEbSJ8Q6Wutf8O4uTPksJsNJ7QXrm5kHiuitUxpdbROWVY5N7t6hr3v9B5wwRgJDLkmXmuqQaaTfuxvI7tgct+d0BUmw7MhAaviVC4+H9N7T7lQYme3d8G4Jjhy6KLiE22Z7CV6N+J0vSYvEJ+Zn//HqLEBwmJM/Gi32q/MGHj15nUfedDACQKXZOntHLxfg4cTjUB61ijpeBFujnLS2QJMUQW1DCU2h8DzufzXimsX7JGqA0+tVKjAkxz+wnNDkS+jt4HCeoo+KRSLGVRgTJFYByjV9/O7lyDTVunP/Q16hLiGvUVcPPwyWklTaXkNbrlpDVWwPWqKeIB3MC8QVksXjOqvhgE/cx6MNf8SBu4r4jtJ/+sYG/VCBe5gUnIIzn7kuyKphyDKyD/xN4xTTtpyOVY1NHU2gdctmWp5ajsQcZTSuYd+Q23j71+NP3A3L5coqGLRISSgZFQot4UZ4k3Sp/niqzEgf5Z6I/0bpO8ryulsMQeI7SbV6T909M3iG94dH9j6VdQmA5UvFJ1ReRSdf4IP2QNypXpfZQqFrdXqxa3cM0y+sKEeGYaY0ol4J1dShpQ7qoMrRNdoxDUc5T0etBjy6+Orn6Q6AHEaWkeo74VQpEs4JA3U7PuPrxav33MO6ZYGTQlgwi2hhLFY0fX3x47+TD74795j//8/cQFkX+AvaWQXw0+c0//ReJgniJt8asSPYJPO3GS3OsU20PdFmnwiomS5fHazKs+2U06R885X9rumagZbIetcO0rAXTrPaIKqXkRGmqLZ6tAmlCJdjgs1N0ZS3I3NfhgxbASw3wnxqEBzyvHa4PsHyI4gVdMt7I+f8rMg7AcACDgQxE4mTuj/Ft+8uAbgBDAwAK8Pe84MHnBQrSPwr/AtgXwkiGSA4e7eE5To+eDR/VsFGIio4yBcYg+00VYRlqYCMAGXV4oWhil/9H9/tgl2/s73tlb39Wd/RndSPfGuzhbvPWXUl3Vrel2h+2twV7WrCb0Xayn+Ez/2M/3XbitpH6BjInkn6rCHle3pXjTsV5IMi97CbR+YyXmfTIyci6WAwEoheETgKK5BOBVBNEXgQVLDpEFGzTBR/+WzOpiBBxi7yM0U9/AqDksr/HNEuqbgWMtcQwU5/22llSLNaelGkGhbTxqN/NkvBRlo6ytFYT6ofKjin377/9PY30Erg48pv/9Xusu2RA/3LJ9oF//+2B3+JDNvthApI0BejPsUwH8WKMldPNVMki1agPUYtNt0sLnh61BjsYySWYYQVUSxTIsFO208XxZWAIyPS8XcZDGpROTHpWD8AijwbY7FAG9ZOQw9RrRz+/1WEET2r2PR7sHz6dXPr64d3TG9+q8WKKpwYbM8nWScEyY9TEKiNURHSgvrKEDjtIFmRd9tMW1VUyrE70QZbK20PQRCJZTxB1S1JvOl4d0EZy9ToqXr91uV5xPKiAh4qlAc8Wqw/PUHevPRcSqRdkWnE0qrY2yP38uif38J6s9iJpkzkyJnU8KZ/AOlmS5Z8UwI/8DipyWeXLT6zQSxgpWDjEBwEv5CvI6vFl/WpxEfpiAsVlGI1go4GuluyyQWODXjq+DoZ/fqu3IqP28O6rkyuvTF45IeJqfK3k3XElEerbuZnxwfHlra52qhDEXZ2ELc5dk7psh1vC0EZxq1oQCbRMGkrG8tJeovNa4/sLjJTRY9iWszzkVqcXDATVIWP19OSBilWp2VXqK8uaHEo9AY+ndYeDipG2Zc7AFJnNsVQary6L6Sdlq4IvhYVSxEat3x7RM9jFOunzAcNrQFw3V6Lx2mHheOPyaxuvfPb4MzU6pctQNng7AEiOqRJW09hiQfVBJBZs6QG0hFXtUKoTqBPVCZBF6/h5V7/0ebpMkgBMdhOqsCIDHRqHemgi8eTI20Wss3WQ0wJbIjMhWnEoFvsrRG+bLCdQzG9VPEFO3tv44fPJh+d0z+3H3F/9GHBCMM+oKAiZ/s1n+iemJV5S17LxCisiCsiy5njn0aXjQlcaNv4ETQtallFTt4TtIpMVigQNow5c8i0D8KA9c9GatX7x/uNP/mLNykmu50XCugX/OV7l2YBNsQpfFOkcgyUA0XZkdRLPF+9Ljbqlxp20jS1vOYqHfZojkFGQc74F+3ftqw/M9BcZfdFPXIP6aVwAfydL5RMAbT0Wzda4CyTaWDWW1j0+f/zxjfesdZuxQ2J3/Mn4GqyMO4ynIt61OTf0Lzq6rR9gGIb4M6pz9pTg0N5K5NgikXfjfWFKJWytNzJUMKz3h7VeG68lgibzrvAm6dI6T3/49NHxG26ephCIWGw8DcNGagN/qTmj+Aha9LxvhpGSZgghpjK+U2BzDhqSF0NsKI0lx2V8U1B9i/bkxvCNb3aC0Ztc/NKaokQag2WU0ARme8FR2rxVIjGDsQFNNzSgKPaHqpVm4ztBo/Ck3qJyfL+VD6s4aBSXaYyOKbx/PdMNBunh/SuTl2+6hYfTtm7Ss0MdI75HdNqCrJdUMxvg29goMRdh6nT0d8jB3SBnU5EwobABQFexQ8CHYIj1D686RpiL9CjIR7zZS5PTo/GQhIlvsz3R9vLPuNbcv95Ywf+oKX5CXvto8sr9TdoqRIOWcp2NpvKzRjOl3HQ7jYGwkcLBdCOXoirfP9XQJVQfw6L7TPAGaGOqzWCpv+Vptwpf72B5HJEmr586v37yjX9Ir1Y/v2mL73WapxtffykEBDXFPfRI3OaFMSxZxSzQu+AWKjyL6SKWEpj+OJJhE9chsrXmNE9TPt2614+YDFtDyV5CdL79AqTWb34MW4mswFXaSIqnWd0AlAMaKwD75uR4Q4nw66SgRQAirG7dOxwZAdoiXv9Oap4NPuKwITUUskjtibc8Mw1G6CttHCu1hwyRFEEbBaStHa638YdPgUmCNtb5edrxQG1Nh2KorlN/2iiOWpEo+GivEdP2MhUZrhSGBhwzox8TnmriKJBWnYxsMpdsBvLzIm3L83ppLBPqoiiDLdu1LP3p+CGy6WirJt8fm6x9autNiRZ6clRUsGsvM/fWppxMtEotKblRkJToRBDbXpuERMjNQpBRa0chU3BqCENipH8WfhRZdjET4eixOgZtBZIqpRGsDR9ESnP8IFaC8fOMPB0QT2qrjUz3bTd2VH566ER2ydg5wcV113ShkECgDQmBsKC0ShShUAUK9J/cIC/XuV/rkY+3uR64qYB6/asfNjHF/QPUzUDXDBRNal+fkThrewzJyQq01XS9fTUtzyl4v06fCpWpQJP6O/ScupIzQ8PZqst5f7CItzotZuuU+hKqLk610PMg+YP0iK2iPizU9QanMnjoPqeQfc6A+pzi870BMHeYfDPIGgucYzN1WbJGiR7FoRRJD8KH+zYDrtPo+akQNDu8bNDUAOc+AYrhzxALNoHgvMEy/YMfONgVAK4ptPWWICjIhTkPr/hPv27qKGYav+j+Of1PExv8Air45U262Bz76Abtd2fdMlWpln153m3J22QnfiHYgd2++3+umkspvwk+H2x+bssLNqPtfgfa5jedbbrTbA83GLe3hLJ2eyjld3jxt8OE69ZQfDuh/XfLPPli2iQpiB7KaInZvw/Sq8RSbBgoNynjzJWbvXfGy80LqClzkwLOsLk5l2Lm/LdNzJy174YHDtCHrQP/5q2epJOLFnKdpyeBZek4NpLj+JMEEc6KYTfivezKSxsP3phcvG6aPsAvnY73+nu0FvndoRXwvKFvljhFOi8HDDggXqqiQ3m+246iHBk9hmIiIrq6WY6DbBZ2Kf7ihRynbXL3IQDU18liD9jE+rTjHE4joxrrF411qZg2rw6d6+wxArREAu5DSkmn1PLaFPcuwsHLIkGN6UYRB0GrLjoXODIusb1xfJmPq+gJNJCSDhBXFBBLORK9VKQnX9Emlf50oRWR4YQUhclrcOs79o+p2PA7lj3RUIj24z3QUAJlUqsev6t8y1T1VMqqx48jUvtPN446rjeuPvBc/3cqDVhG/Y5j1K+nK2WjQ8he0Kib7Pq+Nyp4AIn72/hy5rv5jOvm/06dAbtUve/hM76H+1GzO2Z1RtAXcRLl5kzTcRw/vHsx7GJXa9KzfaNWs20rUjesETB79KLYlwUV3WiCRjBJ1wqQdJJhr3g8poP0KDmnjI8F8mXUUgnDwmV8b9FWKRb+4/dfCgXM31UNGBpFVhejn1NSk53dQlJHAxEV0AH1VIee6p9pmS/x4TMd3cJN+Sa2RmXp8YcfT7645wSH1kWbpJ5Yco2kmQzTVvyUrzkhxWe/rz6n36Ip91YiT4iG6oezQkYBG3l9qdyjE4vV4fhOW5tOx1OVaD7R8Kh0oo4Eji1cP/54b/3d445pqxAzBi42O+vVuvOQjE3LQgEOGfCSGV/e6yhl5M099FavgKoa85imYlwy5fHIJGkf7WTBnacdsd5Jp/c7HbxxIjtzoAyVW9+/e+fh3TU3HbjWDHA041Mqqzu2BowAZuuEyJsdxcerfHAVkoT7sJy8qzroaNNa//CcUFY3rnynHH3CELqKnsCakbGAQXtRxigth5WfPuD+SDh9rrxjTYjF+RlDkRbiY5f3MBSdlHaQIdkn+k9bzRiI8Vqx09WfRx05aoXfy4V+5EkRxye+FUKKiNBD2wOes9R4dq+oTul3rufnc/2A48evvOY6/dfUpetQK5SFKNXpqX8atwSL51A7Ok/w6U1+UB7i5DrZ6pegHK8ZR3SwZhxRLTDWHGTp56pqQ4a5nZvqjA10UMWtGuLwJGRzFgIyQoO0LSx6DuMWjIpiNslbc45Ff6bmmDztBhrVwOFmiRacnpBLjRGZI8WpCUUYbLe1wFLOB8T2nqpfjEJS1KFv/SiEzC8oIaMMDwc5Ghb6N9xtYT9j3DJnriky7/c4gVGNb40CeTE5e9sxb9WSKclEGNdN1roMvt776jS4q3c5QiixT512naAgaozCbwotdRzHRD9MoQ/HBLZXcZcZphc4xFxJXQsWyWxebwB0x5WwAd9+6hrg6uUWLPvKXQuGTSqkYkGZMVooM2y2gQj6NnwrRomS7CAx6x9wcIdW3WEojIf8FwxnvaTl5gy6oReKhnOvG8/8ie3QjEhTMjxapQGoFoo2u6t8FAmRGVOcyLkpDmLhHhZn4v23zHzqw37MD0kcZanjWjxpA7ZPnZneEONuWrKCCmC8HJtzFKwPAiLabFJIejGhiCMORfj6BUVI7ZuZpaBwyObFuoYpGKKxZKHG4pQVD/cV41MH5geTvlkni3ixpjA4XcFDasXRhpwNMysSFwzuoawhWAOtClcFAAv0NRgp2FHQouFEBZ4COT16k1q0TsVjBvkE7HmdbHYXMVrKAtDl8JZ+CZCSe0DDG39JR7YBhKkhJAeOLOSEEEYDW4hvV1/mFe0TshZq2KEBHNzObju527kbKMEBBLe1uh3V7aF+96ztzm5j9ntcZ2qPu2R7XMf2uDTcL91WGexKtQ3J9iHbgmp7m9vW3HYRB7tO23adWHeduLHruA0nFNihoPYCWpmXQLya9HeCvyY0nbAMJaSKxZrsdWL3b8jBeLYYdBIwkCMqkWInkEwa1UWRk0IznMzI6IHJujf6vyL+G30A81TT6WyzUt4JbdMS3intF4qYk9pmRbzT2i/wK9ad323mxKZfLh044D7sHPhdYN1pIxBgvNbPgTY7dFBqPvZLgxEeQjLLUXdYTE+6BxX/GbW5rEXgYPu8N8LUxy5Mf+Q8yx5/emLjz7ce/nB+48G5ydWruowx8DgxYrQO33qyiObPsP0nzgajLmF2SGTyf6noXKril/gKb9OuIvd4iEWzRJ+yvkOfEQDAzscfjgQlje9jZ6Jj0xqDtOedexEWVMedc2W4DaMNe1xXSckBJBSYQc+2YI8dr8ozFMytXK7lBvTBAB439OapoEsQk3QbK+Icue/d7EuXPDq1OjnzweTsrcnr4gsmH5MnAMZMMBURYwcHUh3lWc6l2FPFHilZbro+qhOWKDn8/3ZIeuPanydn/6zCJaHgmXyZNbJ4MF7lIJ0YUR0SmSJvE4lMkcJHVD2/BAsaDArnBNZ3yOuYRdf7H09++OrRW1+vv/NljQaMTYN+ushWcPjRp6KQeZoRv+WTLodn+Esd837VxlRMOBQyEi9VrVrHPsHRxQBgrdcexhLLEjCnwKfOM+2kzCuhIOPbdpuC3NxpVCDn4eQr1gCsKXb3pA7io4oyl4KEdsFLioMmeh+35VAhoVMvnCDRd8QmhN1OnpoHKahwxL72rFd+dezxnz9fP/VjnTpptHy2x0cH6XKdC4awFK2lB4SjXArM5onXDVeWhZU1GBzSouM6YzCbiFJ/k86rAAyUaw6ouTz54iXhWlmm9ZMWFK1MNkOcSGWI7xPO2XqAWVVULVnfeAePB2Ebhn2eCDVO6QBLvueWif1BeVUlHVbVYZLQgCfLbFwB8OjpQfXNXqkuMRhnji76/gM6s/6cvWJO/2WaZUJ7wz6fEXhGVR8Qi6/nL+aoWzlP8CwBkkMW21FvnQMcjkiMmTEwufAXDSlPhnmKGPIW+RfjdKVysnh8vede9UU7SfGaA6DCz/pyLpPapyPM2Fbat24a4TlbM+jQEQf4Kg1xTAWZdJ+jsO9dwmE+xMPDe59OLvw4g68yJ5EPBwFgecSCLqd9d5A1i1GUXOZwVFJpYTHCdzummCYYmjOjrnZ39hU2gS3oJfQXCvLBtKZVJcxfB9yb0ZhPJ8c+qjcGPHIQbiA626xMhfJVC9UE7CFRuQLxihPYkY4roS2O2J9cWMOgPj52oUaMRhNGJ3Z/MGo4bOnwbB6QwZIXlyfLo+jO7YwyRtCd4ZFh+BL70hsTpPavXV1/+xPhoeZa1nBlY+zF7urqnFcmchgab+bLJhIs8M4T7wBxzmMHATl6ZhKsUNOk6MmBGxRqm7XLaiIxGonp1N2kvzugZ2Lcl3eUyTfXkZ6c/LLmThrL6lXS5lgab2mQd16mMdnHHXXxN42nqAfep0pdvE9nUM8ibGJVl2tVud/gIqu2VIc5RIoPaTXyPGCIhx8+MlwLyZdu3max02AP52NJlieU/QEeEeKTC0H603lWfYxj9k27v/76VWFZdEqyjdKxPefjKCoaiOfZX1ietyn+efbz+gfuB1lzSOWUvfanG0NGGnrWMnn95cdXzplCG5ckqHkTWy4SqYdcs4e6c9HD8aoEGFHJbEZJGht7wqZZir6jMw2jzKF31zY+/1hoS6shcnpRnTCeje/0ogZhKZk1S+JZTNYTMz/CCe8t7mtxMpjcf/fxy2+CZkAN8yFLnzjUJifEIlnhQ3ShaVMS8SRpNymyZMuCo6I26ZLwBr0N6cPsDjHQlmnDZwTje0Xk2ZFzgsnLV4Udn7pFx4mEUaJRE/4pb3AIx5q3lC36XGXR9Ac6B4fxDumMRYw1G1UUYZFy9Pjq2uTci8TH1bUpPurjEE6k+lgkjVczv2kMC/MTDsvVNRuWkv2k4NVJnf+0eHnCYtErQzcHK2TOXa6MHvgRDQor5X3dJP/9dydvnzDJT2Hy0KvZE5rdbBHZqQkG0K4B+UhLhoEM2kw3HgQpBgo6C8/UOzcmZ7mhZhjoyLm4ZBiAfiGADD7Jiu0DvtjocX3y8m1hS3jC3gp5A+JLOHXk7ZvQrPhHlRR9hz1XXpa2QWFjSAdiTqx9ncnXSWWfY2tHVaAP9yythpHGKiYo6V0MguBRI/kYTr8HpWty988b37xsViFfd04ZFcybrcYWneEgeLQtfqDBJzJN/VduwOrcwKYj7nB1djbOIuL0y5CdNsURU9KTIqVzUPKIace6RdMrwSySp2WL+gNAkZFDBf6YMpZAnMu39uoQvXFAZgTpPYiOxEWnN0wlEp7spz+/dZhtXj0L9Xz8JnJzvAPfMBfwKeyR0iyndI4p0gLA1XAYk5oqb40fUZy4exwftMlVEr6rh5k4HKwTf++j9dffDIjHiv0YovagYmvYGKIsEQ4F4lsctoHnHow0/Np9pQj1oH03gpWEl5pwcwg2GrEetezg5KcbpQM4j86u0enJ2bsGcFy9HVMznq8z0zEN4/mACwU5WtqUB2FlW017CImr3uCJi2fLACb1GNCfOpfUB3PLJN9u2FaHEjFP6QpWtzhXc/hnDtQrHcZvzuskUbK8wkecbiBF6pu81/aZmjgbAyLncz71Mg9ceNr8eHL90mVzwkUblZOSDBmrksiDkgjhIRY0pkM73i8PrSBmIuCYPh7Bo69PuxBR50V8SXa5S4t10pPjr+CgKSBNRpg+SfbE68lsaSRAUwWashQkN/SChYiqnxI/pHoxCbJFCdK43nXK8fo7OGT/8uHdz0w/7hN445h3rhMwm/ULGKQkKZbRHybb6pHvUlwBsca+Cwuw6OwTYAGce68VhZyIPfmt9x/ePSOsbDx4f/YxRAzBCRllcUycIQJLgsWI2rB2scFqV9NuFprLnFVo3mxB82oAcsam+aatJzTweLPLNmdhkWg3faB/zLKH1M0gpVgitjmrAxnHSD3eOsvMsKdmT9gb2DmchaOheO8wdXur07BdJXum1ehQg66rqVsbqujWUN/c6lTK3a7bApVxhrKoStteU9D2ikq2t64COt2vpgmF8U9TWtVCTa9xKs1/LzzO6SYNwFUDTHVcNfWqDqPrAPopA7D6Rx7+W0OhM/Hnr2GjhiUDFAkotdtyI1WM+hglcWxlrs7RNSQUYKAANSzU0cVCHVNoBHMIZULI0AALW20XtiwAW2WX1TwPfjud2kh3hNvVDrdH7XBbI/umBrtQuPmR9BYnGU2GI3sJPXLCuyaxG7J6txyi7VaJvFuF8N5Q+jqZu8khCvwSdtOhhHw46wClWaJ+eDL1tn5wMuN1eGjSfF0/MJnBmxyW/OsvHZaQpwUOS3gvOPCv/qCENvoE0EYhL6Yc/B/z4RPYs5dkwtKT2Jdg1aST5ziR4BSNibk3/vUGhoRTq9D/ox4+/sXD799AZhX8p6Mj1ZBhbBCrB0v2BPgzYnieNEiVW4YSzMZOjkxFQrClenXEjktxH2AfVQt8p+gcsCgaKQe8q02qSPv2AdrZwVx235CvUR5EvROOkjayUsKRebXId9JIEJznI9+ZGdfAjITegjQt7spGqTSClrm6pWlSZz0CnjL4BZ6RBSPBgvYmHq5ee/wZWridFxsHywBtjfBZWnBgP/sqDQCAEDVdcdwCHSaT1dYFxk8+/wZWWxcY7whaWzBMKZQ6NYFmfDz8vKdnxZhKvXmOljRPCPnVzkiXu41agxyFEgUk6FKzRfJI0szBfNTQQocxtUhfKsj1e8WZtFejv4fgCEFSz7B8rI4q8iOBwPJn7VOAvslJQRYVVRHXoG+apYtTmNfTBz6hL2Ry4cza4VxxvYs8SYmqFHq1HggH1zUdHc19GpBSz1dtHeapmOONAOfROCxNIq3i9e/+kVQoFNFTkggvIfS31mG89OvWIXSmI3TuQb67M9YiqVLTWShYkwqzUOSiyw1J7R2v8eIT9W1IlpGS59Qz5qvAkeJUjpn6I7suZBEzImAt4cSuLfNhwDgKQQskVVrSu45OLJ2r6uHQupbrtY4NVUMZPlUKdfj+W5XTqAUEZNSkfpkbVXd8OZK13WI3RCBW6JhlxWqDgJGqixWOzIxRIkVgGEUIbEJZE5EricNcfj5XkWaLpIB/PcMeMutf3pm88+HkygcBmQLft5ysIEJyUpLly5UnhNchGaLQCQWKI6VbARPSLCikeJuMhPFvoD3Ez81t3LzGvY1Pel2Ne9br/I3xqrWVdHg/F9Ro76nSmkjXqlWkc811kb7EuXXIQMfqI6eAiXswWlHSxVmSHUF7w3K8tixpp2uyHb4z0AgrTjvtRPyNEQ3F0Kc+ufzJxktfOQlfp19S4CNA8GeUFBDkl8fX+wLeliQFELkTQ4g/x1o21BDo9Hw0KAFc4/vUXCHI3q9nhFqtychLE2s6SWvull9sabOZnYQbyplpmk2VVJRhY5GN0hobUGZaTPwpT2l/rfJdQYNchktpkmW4LKEOYTbQkcgy7QCXZbtP2ezJB+jcZTL7ypynDj+R8joTS4rBiXpl7EM6eqUk3OMJuX7q1fU779qERDdCBVyjWmDcaLE8C0hW0F+xjuQxUxSbUIsTZS3FkHZMjmoRb3yk23QUido3t4SgSy3c4iPLoVtQcI7KO65Z1Bg86VhrKLuf5YFR4QMsuBK258fLYXvYEskKBVrRqhkTkLW4JYHQSCFN+sIgz4veUAozoLCqxRdOalZjEZ3sYGHS2OSSXny/zvCOjk5JZ7N+fOgLyl6eywhhdiwlTlz0YEkbUveOMFKU+ljEKpL80dRwEvvU+5OT31rThAWyHAw1j1QbKTxT9Ro3euF7/LuEVcXnw5KExQjQZD5xVup3/ooFH/f6qUfJpggZNaderPm5GhOPPR21STb5oG/jTNoP1sZLd8PBYqMG6uBki63mH2Tzb6EusfkibtPVxpnuT0hlChMGnJCbQuNYxfYPKGEynSJReM622hsU7UWsBS4lSZ8xCSLhLWT6IHllkkO64LmNa6cefXh544urIT2dw/IjDv+m9bQ/rDnXvE9B1Zr3iSvWxYgZAocGWIjYbjG+M6SuJ2cVnsAZGe5JkHIUxuVl3hhGfRya0yGnyJiuRjz/fO4wT2fW609vfP3t+rurllVPqjehBbGsJ0hBrXRoeoh7XlLQW50KNrnG2fa8ItDsCtb5CoVmdZXv+UDJc6qdYb4F07UM0zklp6Y3OWWpoV/waVRNuRDlJtAtJBsBKxa7Qt3FaS3TysTCLBViYabaMBO11yD7NF63k7YQRFs2jxqO5lKbo3WH1KfwqrYhwKuuCSFctQYEODUEqTMRqvDkMaQxHsBILrIZRnX4tAHstoaQjnwLHaIrkiaeqyFGBxYd7tpmiGteoRYf1dYPZh1gsx2+SJdsKodYStK9k+9Rpgd7DJb+EEAkB458VZj1NZyitdjzOlioAYXNUMLuWQhhoQ4PSleQt2qT0C+E2MDhgsY2vU/dl0lg1jN2lLxPb29s0fuC/dntzTN30B2zd8+F5tZZ6ta5bXrX3BpumW67nNrOds/ayhbCfcz1UG0LeyHcv9ze5cX/dhP3tT9I4C/UtxC3e7iZEHOgyG4REibeiQ33fJY8d6J8ExNjey4aYQnOds8OXtYNi+GLuk2x/iY0JwZv6pbEOgtiRPyXXzIituMDB+iLzoF/8RZEkpyySMm26BacPdZ/0DO3OnQHDkd3nL6+/tpnKpSAexbngu95gMiRc8niC8mWxZWI76PW8f0xq4MHqVMJE92YNhzVIkp7TruRVmIRvBrivX7upt+PJE3EL9aEsylsQ1oXb0RaFzYiqyttUzTBDpb0OJ8BbU3Zg95Jl8nbnB2z8q6EV+q9MUd0u37wnuXztFrgGIla5IYNqmAP2/H1azpBtc83Pv/SPucUoK2BeGBIjCh8i5c4IR2HO4j7FQTzIBFnCLJ9SPTQj++iov/DWsR756a67Fg9ZUyRITgIHV8D4peYQDgaqAulHKza0Qkeo+255tDoL+X4DrJk3nzBxmt0MwtOocULbOOLExufX5F0IZ+1kUSDOk5puKqBavaJwuJqJsGh1f58LqvX+sOloFZKmdOWvF9pPniilIwfA/0HHvlcNVKXATaXBBnZa/HkGxtfnJq8oft6N2WtqWJBKn+L4Ylf7FN2rCpix1fF3LiqYjqm1GMmLMoldQLgcKVSB+NImal/IUAvW2Iun3y09pZOK2QnsQqKjqshfO5qwNeGs/C94SxzBiTcnFVdCVT3HoCgSkmKcAqrJwpWmDzuxve7uieZl185ZwOL3pc1cP/xu5Y9nOuXFLqYO+zIRJKo5GzsfPwuB7FcklxsybVuhTV7Vy52RK4fwf7DXlzvfo4rbjT2x+cRC3KH+YRhlieMHSj0zIncJvTM6e/+PqGFIZ8/+tClF7OVQVIOOpT4t9MaOCr+2d00KV3Qftc8S8df2VNZH712nOyzfuTdTF0k335fxazVHVYZ1GMV8LExJwkSX2OrwDkNwUEcEmxZFAPzFcIoFJQfS3yF1EMoceXEKYidx0d2xgynIMvQDV+gDZVa4nvNLvXua3G2Fjd5560untVZrSD7UMccvspluC3uMoZ7nzoi3tnb+0Ih2m5v2KSGb7dz4bbWaXn1dzLHbWkYeW6rj9Oxj6ZJahOx6YuHuW9fQM/a533HlaK2ctpX3DmH17OtEbaQzBm1ZGuVnDf7VGt9WIVUCyCVSxUwS/vkMj4FyltYuepvYd1SqF637J6udsJLi1r9+skHVj174Q34xh/J3McWixSyG2bEVTJN4y6ZDjsjsaKhJUq6qw6dRXZZ91nJ3+V0HU8/8f5yuDlInOQmZzQQkt2bHbESChsFsMu1D0ahXgjnEQC5JMS0asnyQolIrP6rDygViZKoNcvnwHPt6ntfTSnJDtdWzjdE0uA5vz/n7OfbkbjKa+3wKfa4VOhZqA3RDHu+HVo/t8NImPwPHKJC/2/zh/KSv+YQpXJfHaJEYKkfFAks9YAKo5JCFyv/VCvgrNYuyujkl74CWV3YPfDRUCY2/cnGmpSDqJy3MbmXC2CBT3mtjc7hfcrDve3U5llu7b/gx+6c1y12t8W+fqbqUpCTHoYfJBXIApk4YlsjlhjDEqQuNXL82HFndWRhwUB2u6jj8P+QNJGFmAdy8i5Dp/My4ULDRUQexrwFLae7jFern/ZjrZ+8vYuh6PFQV5Zi/lMeYRIVLc3dIKkhJDj79OTup2FLob5xMK1UMUgkYJef9tkg5HJnwohsbdXa0FSrjSxvMTsps5mgEHCsj/j7YbUkCm7P23Gu/mB2nCK2qGW2ewGZiwGEY3dxZUhHv9fLK/Xo9u6r/P1MUxp0goGwg61QNaCBaED0j+otTvH5G8VVqzCVQrWBxGkDudMGctMGFrX3OSuKaRF0Uan0d0p3WdGJZ6l9halaePBeiC4hWoSjCSDd5r1jOP48zuSHYOi2HJAe4tArj50D4Mxp7uVrdr1DajzuXUjLIa88B3EDfGs4tAjwaRHg08LwaSz4VKCpo8dwUYsDgcqgKjakzbOMFQgKCHQk8ToOIFzsIVysEK6vhjux2AWoKglQVeJRVaKoamj2BRpNg2MCWjqOol6Io88YwRSWEJP9YaeQC8EBaaiAhiQEKfaSQUKLT3rEfU3BAfuJShsrTguhW7RkwGDSsinbjsx9sWzsLlvvLMtolrIdDThxwzs278gFWhiEsIxFeuuzUdWSK8EGDFq+rIn8xIn8YSDyExH5i7qkGTEEol66Ag6FS4ii1QnT1QlOOffabPZQ8Wuyl2Vr4qUuk9NHaF2pdgsOPPgVElCFlZdUlOVGV9EwkUWfsbFHRIxJl7poMWNRC6HAkZprEsq71TQYzSjgjUazXnrD0ey3Zjya8dYbkGazJUak325mRMJHywcOmCmJvAcO/NZbkkq6Zoo0oQG2U44qiemCYd525dQ5o+COAUdpxHT7Z55Vgvvw2RGEn8wxeIGp/OdzPN0vnZi8cknVLHgyiCsvE4kHf5AQQcZHdNkLnEP5EW6AauvBKROTpwyRyJmIac3VQBJThAXYA75LJx7ePaapIT6rDld0kaC1aYgGVeyu7RsGF4KCWvOHsIA1iG/ikwatf/iRaxDdVcl3YygFaRDdUsRPrRap0xVmSvJM72LjzMFSds4uZWOS2qLTX4Gqaw66C3DCt4aMQUW33piDYs7OfSHMx8o3iNyy2UjKUOjuLT9GyxXzyDS4PZCvlHGXUL4QSnSQtCTlDrH2JFwAzRFqDHMpK+34/lKkJLVJ517aeOMyCLtWeU6DZthDYxt5P2xirV/82pjmjpXZpH3P3Mhj+VP62XUu1+M79+LXv46Nn84fMi4+cVzINY+XlRG64zGWXuHbHS/L33y/o5tRVI9wgYsdUZUfYjpxP4zxo8svRIVqY/9Y4vtSU3gF7dW1SK7fdDTCMRlyjk6H9Ig+JUP5gjuoF25xRm/cKgXjdUA35Eq3qUM51yq9xzXOOV1RalS+Tz7gJDjHXIgIuYSEfHfhsbJa5xt66hKXEYaLnMbGc0w3ttnUnHz1ZzfKXLUwLJUyc1yZjreNMcIB2J67atNt/er3qOnXDTLHfyoX968ZFzFd9kwySYc568pP6buYLnrmt9KVKeEe/JyTgSArAdUqTE2++goV/zqm9KJLYWvjRydb1dTwh5qN4Q/euvAHNSrMhUnGUZGuAaQI//FEIGDoirelOJrJEyf0hkkBkSYN5lJa6tpjZ7/0qxOQqOJgLFuiQ4A2bEzCVhwUsNWqP+cEaWQagsj1K8cvvYH4EVDxTHfzgwHDpFsO6jKxIz6QfuIhyXw38j3LoQ7KPmKwrWepXmZcqpRJp3VJFw80bVxKkfM/n5PUUl7UfX1h/Yu3UKNfJeOvYW8sw12WoqcQhNPcalMp5lpFT+iRm6Orbm1vnHYrBWlMYpufyA7Qt5Wd8N/Sx/Kc67hOty64Fb3xxY+oKuR1fC1NFskNPAAF5KQQ8oopwY56ntV+DMO8327umdx+fPmB61qKZpG6FQtwvTIrpEJhluuas3NnrkyYxdkz6vNLCIKBLpUO+rUbA1bWu/Ugl/Fb41IKmRwuMJvEG9+4rX4gNUumEQm31qr5lFdMRlIzm9/abP7mmlmLnndV0zE15vSS1A/WN77VWx+Xc77sGYns2OTax0EPpJyeDVCCHH6d9+U60hThvQhCgzXXIlNa5vwnYbrHz1DlX9xxVokB+nSYLOmxA+F5oI6I/9rB9xIsk5UoJ38/XYbwxyCZiz/21Ghw7kb30xGbnD0pf/h4QShFRxNZlrGLF9SHahLjcU+XePYopowVU/JTGhnVGBcNsHz3gw0MriIraIFWci0ZjNM4Dawkr1QHOxmdXPBvMkItlUeQSDYWbZD8Q68v2gZx+ioqdayTh0lsC5QZ558hxyUllmpy3I1bjl9SQWwiffyq8btCklrurUCNzPZKyuiKfnMtrojQkKrJd42AFVGI+YCKU8nZQnj01W0Q8fzDsNIO2cdM+twDXmnBwdgWrBQ5mnvmEcCkvD+68KbHu211BOPqY+YeMqlFoY98TTkTSXT02v1KSh8UIzQpnZhObWoG0YoVUQAegpq24/Y7IMjtmBn7SIqDaCXs5MM/EvmHVABROPxVH7jIuWDTDINrGnd5wPBUUZhgevXjaHOiSAG6XJzArX3wf5N2OSwdfBbo7CCowU+Fng52Km4VzBpCRYOJDiMqQBSEKegyAGseqdVRmiI0w3qC8zxkcnhJwZIhJUNagrLUv7BDkQFigYCVfPwx9xmFTMKaodiiXUkf2AUz96/ptbCUO0sMFPgz7eGKB7Z00uOePsdj/svdUQzY4a6FJcjBTlH0F/+ZD2N9iPDaShGGoAt3L+lyouwmaMyytDJ4vJy4vV32dbdDiqomRgHaDMngkLO8KPUn7Yqysza2K9uq3D6le5TudLLLBfuG2y1sk9C9wTYF2QtEPnD/QFFeFJEs59xDE78iaz07Yn9IGI3YrPD3RuhfEHMiNO3iR14KkDd8QiS/unFgNoEokaK0zvnckxY237HMv4+KQWu1J/JhhsWEfpAnKdKEzs82mcwq4W0mM996o8kmr81qMuu1N5tswpvYTZ7czG5CD8heQp8N1HDyZGA4waHkYHw/Ixt/Iqk6sdktLqJSddiiAxjGoa5gmw7QhlKWLMBVxuePCVuBV8QCQElY6HiRTZ7vrr/9JTKwbPx43tLtpOS8AM1J41ZhfKNaKA+TpNcJ33cpKRE/sd2JjcYkyiKjx/Pkk/V3v5m89o7QczCwR9nOB3Kfhhw0kscZrquPFZn2qQDYlxIUuUL/LpKhSeEsl6BbuvgNh7JoHVJkSHA1sqo6HE7RI/iRi2sZY2pybRl5L8iHSMfz9UsP7z8wX0jyhlP1VdJT9ehaX9mr7A3OL3FOIWR0two/crxKGlgO3uwjPHpJeaM9LpdzEcr4Rw4xYIl6k4XTJziuAUOTM5pVdshWE0ZgdF3mURFNuJg4ZXM+XexL8msw/kxfQr2AmR5fxfpZx3/YrxYTrnDUT9xD2AY46RolYjzPWbvZFenLj9df+mhyEprdK3aDFXvSINsPHZblpaxuubSwfk45vgdf3JhyJop8XJJP+Ci2w19G6t5GmyUd79j5ZcLvUots5nBN9s009ypgIdKFjCk2OXJXM1joCKBTcJFQLl6KSJC3DnOzBO4H3xn2VlvkgIArHXQT/gbeGCUCDRVzIE8dvFdXOO88bZqHJYT64b1XKff8mRcdgGXWCKvKn7JSZd6UbOGLwt+O+Cjif9WHVPiAuRlKs/0UgX7EIs6YCX9XPfqGTu3OvLh+8pyqNjEyAgw4k7L8TQtNlhX9okVFVdLftm5kjrrk2dUhOkpu0VRVx4gP3330/o+GGXNeuZQzXqjIT4pnUUpUQLPKKzV6QftlnSAT4d7luUg/aZsApXuvYi7iD1XY+cpD7NCk9pSCb9C06GjaeWKI6bQMt7ch2aj40I1RSUkhKe6jVKYvriXAIMTJKBohJAf5NtjBP7MzMU6lJTlO0BOS2Pr4w3sfUn6Te3fMxYkrZJZKasMUDxCAqxm95TMo/wHxU0pWb2zCTD7hwWX5yhQjx4YIV1AVDurdAJuNSVbtiLLeCyJTa73Qa+cmSRsdgWTLiQlOps/+6Lc4m5PrhcnLNzYevGK9wHYdEciepVmsyOVsiRQNWNE9ZrHOhS64vt5qrLzQDPzxJbrZmNlodEVSNrqCxoMk9NFUQ5CbPWGfTPcEQcCy3hU3Dk91xcO7LwZdEXIyg4Mm5VkUNej4JpJIGVH1Lb11XOi5qSe2IMkOmtFBeKw0XYs5/RLdm0yWktIu2NSJKF9zVBH5fqetiibaaHiUkm5zaOFQTxMpX8PNahhwNb7HKByBJI+PHRPOJi+vuVijy3Q5D0AXGfnhx9+FGlbKWXIsb4jJAeV8rHcMqWzQiutfIf0P8tZj78Q+kRJ3bKi9xQikU2Nn8sWDyZVrAS8i8aixyIWRehlIHeSeJL5QO/PScATPisWGHNQVecTJQRqR+2/Vx54rbsxDR3DmJGS6m0xDMFGbhKA+PQnvvzVrEhZeNnJWE/3pyOJBUw6KI0JtAo5vluEEnFy44CagnjWQ9wmcGcb36VLxhQZFybk6pMAGPF7QuVfIEWCfPVc6UPczvtWGGaDJVw5bHApBMcqc7BlN7nHuo4Cn9RffQNajgCccf1RIUkqNEyWJCNMDTso+FOcsVyKpFQHptDfUqwlsDxLniJ+Os13sTUJEvARPWQ+QmY7az17sg4KdmrTxdF6DpqeUHhJHDuSEcVoaT4S17fEKZUyQ9avtTyXvGLxYJD4iy90FRsjSHQGo17h6dOPVjWOvBVxBBzmI//VJUv49f1PgRcfB0EgUgEd/vkdmOZpZck0AuQtSqwCVWDFfFTlFZ0ulrOSM4igiFvccQVel1FIqLvdrjGABIGQwRBjO4hMk7I4M1QOe4R4hvZCD+589vPtOnQm3dpmEohklqKs4YaJ+CSuVqTUsRII1/JpfOgEBXz0vGld7XWozidqakeq90LbqY0pKmsW7adJDp1omj0dJh+ZeiDnsM8n6yE/T3RJeVPvC/oz0Q7IVkWTg1XGdk0DhuEYc894CC+sXT66vfVJbJclKlopESJoPrES7USJDWJBIxXCVGGG3SIRkcPhGrrpAfEM+9KUwE85AXIjPlJzJ8SRa4bXBztNmoYIfE8XU0WGd5v5Ml3lI5NSuNySeeNVwRuL6bWV8nkcrxfgjL8Gr32OtGH8y4isqC/hvEwwy5G355Ufc6AVjXqPAgx5QyMmJa0X9hfBnW9zV+G8YyDrmxdUWl3syLfMAYg65Or/7AeOHWeTqbMfjtU6+QrGGaEGXFuFK3hFlHtm28aZibVTeVPwKH/GbfuI/avMbnLkMaLfWAnBmkjmdqwMdZlIZ8rPx53cevfVRwE/JEb6YP7mYLxAIbL8wh0gh7LPYQd6BLTi9o1CsJJhENREks8hJIB0lTCBkQF+gfNy44m+7HQkMcdtIn45red0Aahd6J0Mhxamt6Cp2ZI+3R1sAw7uy1Th5080srE0ITs6+tsk1PmJ/4drZXCJ09BnbYZ4NLDDO8DJlCGmaPZpGDrEchKYMrpZT29/XS3jwTucUlzvK80iepnJ/k2mPiamMoh7a5/apfBZ8oeZgDoJThdYrduIxy6jBceYVtVApmqEMeQWItzpSekJly2lYrhrVI2bUIVqDUxQC7SDQCzzKboBw/8KD7gBsz4DZmhgu+L7U7wWP1lCox58h8gwxZwg2DWcG2DJAlQGOCzBcgN4MswW4qI7SBAk5BOSRj0M8IZ4IkITf89mFeub2Lk7hfjtv7OL1/dvqslrcdurRgP80/M72Jf+HbUx+Qwo2oWD7McnupLrJ80CK16S3l9smUFV6qqh0sjEUz14QmtDzso9pqbyz3nE9M20A/+d/fvKJJ5+MShUnDeP31Ftn+J5+44zes16pwXvqlTN2z+JDDN3/vImhG188+STS1IlB+sA/Bxf6dBBOQle/SX7ZfHxnOdojEZVAvmTFpKtbyfNktzjClqKxanGYFZejPocNJKOYd6+Ub4Uih63ePodh6f7YKLhLHlvI+vsf1G6ULzhuWqlKSIM+g2l0t6aJcpVpniiuxpm6BuSk04k1+/gQFnuyM8WaNL/xnn9R8twd5i+xxokuLrC77cnvYC9f/+KspkSFbRau2cU229skvwY5nchfnGne8maASehCWiMbIa9LfRJM+UmPU8jIgT95n0hqo4z8jDhTQ5FLUsU0IxXL3WZKq6h+P+TkzMnwfkh0zYBDl8gqmvFfJWERQhRJtTWoE3kGd5kPv69WHPmlUoss6FGHiU+JYgdO901K4z7x8+lZlxYVp8GTDpWRomtF6epV6VQarbfvWKeSy+kSX/LHdVBABs5j5ZJ48gW1lCV0+V+eyRXzcLxa4tTU/Ek//IapG8zE4Rr/jU8r/ZZHVzwEAtZIU8U4n74qvDln8AydGdwNIfcPSnb7+q0US4CJKB1lHPShV0MwfZjM5G5Cf5GEhtSs6OWH47Whxta8u4qLx9bPnvMJUCiITa6loPwnK74Ol/6kUmKS+sQVoMRuRkchLxPQsGNe6wn1xCfPBsuN8j9zUjLgzmd16bGPcJeiR+RKpyEpOq1o+P8eez/jKP9cbTxtcjVqSVM2HkDJuPErlrSrxDGLKvQkrOIpgjTMHCEOWTNs0wPKlL2P9ayKJ8RIXsf0mn7KHU+yc1IGO06ELSONBHZIgK3bL6XWlpmU+f62aVe/AgRdng7Du0d4iEWjCQbX07SB/calzAOGY18l+5fz8nEGJkCmFxxKWFVOH/7wth3vYDIW7chVgOmGm6ARNUX3bgylX6EPwSiNM0Epto21IjqmjOUeAb4jVJYAZj/HWhx7n7j7UiVcm/P+wNQYs/hPMrpwQNLiFCqg5C0FykKaLKjzNu5mwOM5rzCgH+SGc7mP8M2PHr97b3JeTreVQE5pnxclBpWf8CrvdzXk2tEhb36ShPKAk76rL6mnhMTNpaOz8bldg9WFcmn3RpTiQKkenRwOKhIWtyy4eyJkVMkb8AgPM90F74W5pAixg/TL1ylNyMk7dVo5ecDv8aTQgOD2YKFFd6DLFatCyRLZyyWrIS26d8zRwi1jQgtu25zPo205SShZnPRUJkl4KA2wJPSwUn26qZgI8WjxI+tAVSXQeetv3wqVRZ5nqir25eiQbtP9D36LYJ3D0dz/fmCrAJcsvNBUGNUtkHVF74bOqabiarvfTI5WkjhGXrFUKVmS50f2OaFNc0mmVF9X8ZdnH969EmxR5iNL/Jr/qTk6y8bAd/wG1amHmNZ1TDfQhM8FhcOEUrLzYWCN1ZgvAh+xsis3beRHKG0/xOdiP9bE1n6TUaYnZ06z1hwynSbzxvUTTCtkHVTmjXlsL1p10ABNay4tQPV1H3OcOkvuQfmZ2p1zQzHuJvKTVgIfQyWFJLEHZjFd4+R3zpbKU0IzxjnvcpKS6B5+5Pm2YuadbOznkdEKRAWRU1dDMk19591+OxRYVvpmUIxamx64hlgJbYm+t4ZQFw2cGfbam9YU/x1HujwX1k2hKcjJLJG7/1ErSXKa57vRGRGCOyIYkEmpW90171anZrq8bScZ8tsONjZ5je2EzzXUdMcDccKfYkihkHn9rMG7L+dZN1u6sN5zVMQ3+uSJxjIlv4UA9KUSNeYQWMmG8prpiDp/6BG/dj7N+lM12XJ4SrZcsunDoiUOBMsRV5/2sIqTmTYgVWVCWBPqLE5J2V5TS5w2EqoRTkPwmoM9mg/UBacpBMjeYL3H9B5411C8A/AKR9AOgyM1DBx0ew3n7mnAbIewHYpU+BjARsOLIRp1GNTQ76xeZECoKDCEfg71TWOqGpgKQJRHTzWU5gCaEzpWgc4Obbx+JMV9MAJ8FsRZQ0ELW6HD5zxNGa3EdQzh4ENtP3cbuW3etmnXN2q3R0993M37wrR9zQw40kL172urA20BYqOrdtk5Edgbtji2EsLZiXAH/sR+0dOtSHafGZK8KcanZLjNNhXdMu9lytekaSBFA9nsxaVJSZGQoSjzcsnLxNqzTMwFEE9ehDipVF8YKoZsUchqmDbikJJOUIhzAjVMOI13zoDTfO7MN9Mv1HjTeOFMN9PUxXDzP5+cbbihhXLggHwwPPA/n/R2G9y8i5OaObloFun9RfbjQZ/v4NU7KuWwii/ixVz/ak6uqSxasHltkyvu/0j38lIyTfdQHFzoVl4+zKbuv3cHl/LiGNtiGoT0Strn8y51oyEMurVOzUo4OiP4lT1llgdPSC0PTGaGowIOGAapZDcKvRQKgmj8mAwxVrqwsqPCF6WTzZ2ubRWvfQ3YgufOG9edw1RI112E6bomJC+3RVG/jVdxzLGtwYa7G9P3q5TGL7q0yerR+JSbh6OAN3bBPiGsmX6GmBG+/unwnBwl8QO6cZev5tH3cp8R1EDsnfsaHkss6cRX6fGf5bgxZ1MCKdh0wdRTHDiDJ92MT8CROOtpL7fhSEh3RksQTA6fIJSSo034Ynk6HHj+spDRU8Y+VEnuWHi49GO6G5migHJKlBBHmooo5VIY0UILkbUv72vOVK0h1nd02EgJr+SlPpRSeqFul2PR2pyThY7mKSSBvRU5S/uJx+/dXn/t1GbsUfLgeBO2KPpBXs7gioKg27IkhjGnvPOsiZMAOZUqNyzOrwozlvUAl0z97Y6iUpt1lNbwNzqKSm3eUbcz31GTExd9R3HlYqBTNnjlz3nKWPOy2kdMZbdbca5qXXFcs19xrr3QjhctxVzYQkRN9atS3tTbF/sX7jG1zd16eZMOgslgLWDl9RPo9fWPrs4gnoj+3qTsdPgGYVHka0S9Lm9kVY8XsqbHxzQ75FZT3Cg0b/NFjBNHWVDJhZCS5elg6qZUrCYQdne7Wbh7K9cvfkST6XO9EmAoF2zpnXH0IY/asC3P+cINro4NO/aYygpZTqNoT1MpK+Z8vvlPqbNX1z0hPS09w22pJrbFBKNuFIFnWbAvObeycF+S9vJ5t+5L1KVvfeT2pZC625tCylDhR3wEHZK1ko6m7VHI029uKY4yS7dzSH4vpL2bAlK6AvhQTl94gLPHfzwfbI10CoEWIlUMLt3YYonYxbYOnIibnfUDcVyhqGnOZp1GSKX6/7hlRIZ0sbhaVBDtmV+cXX/t+OTDD6a42dfgYJtznSAXJyvhSPKlapR4wRMjlPriD0IkqD7NNVwAYwZ8vcP8KStLGyaJoTgawAh2gsJwcOewiEU2tY147fRhR6cWxy/4fZqslqTcdFRsnHv90dqpBh+c+kiNt44JvVTSjLOehywJbnCewUXdnuvZED1HeGgwoBunkXb7pieqm+aQXYVwJJy0PEE+2lEkZJ5QK9rcU2fsbCekBuNYKinYaiTTqMJhppzXTZGny4X5koaZPCRydzgCsfpRwAoH0V0VRpxuyFEDBMqetbvB4eUk/h3ARO6QcCli8v0dNsGGYizT7eBerZ247EbbWaOAKVjtnEWFLv7BfQbokMoumglpJvqd0e2TJ8cLdmOLMaC37DB5ta6yT+zR8W1KRwgSwziYsgDqsVzU6ZgIZjoTdh/ztlRSmmn3ufBCE27GPCdf6kE40dffcxN9mqu52dywhXaKD7r5iwKjn63xQM6LSWIxxupFL2xwnubjwoNjgG7rfjYQJoo61fHON1Avw3TA/mAwyg+/cyeVAwSKAq1qzTv0vKEl+1KDBM4a+ArOkBZfk0ZiNqBZ1ygOOo0CZMNm7Pi1rdBbPFETX96pNUkSFc0FwhVoNgZaUWKZ4a+djrFp9KtpU6HyVlOiAvWpppw5vay5+c3Vt725mmIyV1OM5uoqkVOH1Fqww2kap0zH4D/4RR3yb473t80C0tumAfS2JphfCLG7w+2zofJMaDwDETdx8O4Q9jrI28SGNVBYA4K+vgBrOrznwJ7CN8N18nO7x3EOwU0BmQaEqWMXj1q21vCRg0bT+KSJSUIk0sQCNRgwEwPEkLSHuV21nbe++9Dd1pTjfmrH/WNto3db/PSGN73XTe1v01vbH+v7qttSm/vMzA1makvZbBtzO5g64y1zNJ1WOyWk+SFftEeFGjUfDRa4ieIZcrguwNqBAEs2FcNOAltNrhL9XIWMfSTlp41nNtfpnkwu3zCgzXjvjGiz3jlD2uyXakyb8dIZ1GZzJEa1/7GJUc0WLzlEobsO/I/ArKZ38UogFJ+9S3p6zsMr4Ugc14nUmL1twU29GjmFM5hYnISoAGA6giptn616ml6DE7NISsj1Mx9Pzr5HaV7MAZxzs3CFOTlVPicOqULcPdAkUVZomxaKKSiqkuz1SoPvwxbXQ6GC27DNATHHlF+GjxSA1pBCAtnUa1eELKc9Asv2gq5JsWtD6LuUPgze+w/hOHgEISPujVwuggwmXcrQ1ZNr4Uh9GUqaN74i++VHx2/QDXFXVicnbtaYo0vMXLp+MAWzW3poIeSC7xbUIjBnpIdK1r9Swlc/XcCNMJTssUnxwmfr371RI5fzXQZk+0Hq6r6orRnu6KrI0kcey21N2jL+Kh9KScjyUi5QKZNlBJNG2aAaVnMWEkN7aqmEEajF8aivf7v+1jeg++jaq3onZpdS3ip58byT0F2eU8qAwmp2xiEsLyyo350UL0Py5ldToy3eNQFtTHa6Ox7DT25UsC0O3DACZlIuriTiu7H5dFvv9fGTgHJ7qd8/eZnBRTmYBYMB+d6nbJoayO00MhHg0N3lG2eDeWB36py/iDx/Og2unG3wiFUbPxuyRjdJPOs5Yc1Oinjyg/SIeIz8/OaILxSvU1y/fXv97t2AHNUEf3vOd0+biMZMkVE0o6cc/jDQi1OsaCY29YE6p+AR0z6SG2kYm/96pqWkM72z6dG1M+tvroH2+ntXw6ng651rzAbPRtKYEAHbuxtzgvnR61JFwatxgUlBOp7nwkIi2DNvWVC/hUbwhIBXdyYapguT4CmwnKTPBvES1AMl8tgiXvFptxD5dulGAAWWIqX/rcdQIKeyGBhyVhSEJ76oEAfRi5qIoC9rRLkTj7Q1ektmB9J99CVY1Ou2ECnCBq0gqIO0Lg4VWZnibHLi2/WLx2ZwFiN3ijC1zGBdmKJQ6mU2gLgXwg8lJSWfO2FGP2FOhnwnhysuvOgmQcwETslgBjsFMeNDL5wA5/s/2FYstLNo4AVmX6whnKuCXdasjHiOmRglpZXnk7GpBYw/HtAs7RK6MvEqeTopncU0uzeR1KLBbtGqSMpRsn4kQqAgQpZ74jTVyodtij/BgPPVdCz6RJfBZ/KKPqOvSP6JqZa+2sOChmQfuWiiZ3dJZOxhUUGZNWULou/xK2+ArRk8IdMU7aqZxrAEHCX8akhugmq3DHjSz561WJaAJwpr0U+fdcc8yFfdrfFEJz0XfqjzNODgZzJt0S0Wi4QhXXANj89wCe/JDwN2Q02RXItPk0G0UkAJZRIPmiE35RbKt44LKmQSovSCQYefboi7bKr9p0EghCHunkS6ZRpZjQYJ2R3YRCw5X1051+SXAlWAn7gIJeoB07un2M0Qe5lSMuZSstsJ5nY88kwc0g1HjWvl5B6jgF0klKb7jDyvCQd92IkXJAtufekSk52K4Bp5lg5ZqgzH3+WsOSO8qSJtcVQN2AxhHwzV2Zkd3ktAYEm7V7CzqS4HDnp59OIaXE5peDX0hauIWb7aqvW7P9FlR2PXTTUMIJ+SuF2BtOFvAywgfAQL1QECXg2sngaMXXsVEaoBY9o5gdzt9flmb+2cQOgOKT6J37kOCqQuAqT4HUoOh+qugm4ayVPqJC9vJawHnaSiVoN7iPRBlhQCABiOUyqcnZz6i6gfFGExlJsryEW7zSkgiTq/U2CguV+wRuU9sSHQBOuyHdPFRoALC5KTHpkX37IwTY04Ov7K+gdv1FjLhDUYKaqW3VuXeYZS0dYr8SKGnkWSl46LYWc9yjI3zZRDGBJccRwdJEVXAK0rKnInJXMRTQm+8QF7MDqAp4YMwc+vH9JMDCxWJNRp49iLSMXAw7sW8M1XflbwT5Jbrpht7qHB+E5/iS6cIylSpnrnTKrfiJ5TQf7uMq7oR9d4oCtvxzdbNQ4e3v1g/Yu3Qw5oZrGUILW4FZdMmFP6sqSg1yIjcIgiWX818bJIiXwkBTKKFOKv9B+WD6N4niEfYk9bkWRh3mmXm0n2ZZEMR+SWM84RfNJ868DaPE83PhGXMAplh2EXkB9ftGgs6KG4xlUoaUjTIXkOh+EVfLIvmDMgj/sSvnyLUJfnoI8k5yIVHJgj00lK6ZP2sl9TISEIYq2IFQna3ZXyOe9H7vs8cZ8usVigm94haBwmBOAgA9QlZU70xMcfvrlx9ywNm+qJjjN8N8D/nqsFOxtb7mUjGNr42uRjYcyFTFspzTDCVnFi0bMHe8j63ZcD9nJkTJN5VVq6Zue5gd1R0hMXOpacm89cN+xtvuJea15nN+OtSI8Oaq0L8WyJ3B33Wc5n7OQqztTtkVI/XznDQuNUg8lZW6Sx54W+XH+6O2Ru9q7oGPsbO6L59bod0RgbFuQRHGBtROPh+JHlrOzQKvdhjRuY/Cdz6LIIY1SQ16U/0qK15PuSXO17pdsA4Eamr+CjVXXqsJu2gY/WHOJ212MRN4s8vOPPYNjZFm3i+6Q8LfJApjnZgKKGP1Toq8NcLso+IbVu4iRlXPMKdw5TbGTaNsNxihOABG3ik4NXGm3KYpaqwLPILLdTmF/Wh+FWRifD0xsYMnr0GX7EVcZ3kPPGxdcdGLIc6c711o+Cwb3yopF7zMQzXnmRQV2WZ6pH8VjKpUCqOHmSqqs4sKMkoaUw2Any9A8Iug4k/wZNIc4oIpkVxHOZf/QkPkMuA+gw0Z/Pdbhuxsi0j/ga9bgmbT8hs3KbVSfPpTI1gzJ7SddOcpi5z/gwZ+Z5jFoAd5jRbyGw8unD2ONkvdnFG/BEJ3tata+nvIb1tFnHXtAobm+Natqh9jjb05wZnPhIydBczazTNOjsVxvJKTON7DeLyIL7VM0fMwwfewNzx97AyrHXTBu+EjMhTBsPtv99+RSa+nZD0/ZqtGmsrir5O9Ccm+rnLMUzUDO9BucVNqvF19DQxxZCXaams4TKiVWjGkioJznVgTC+Q/MOt7tmyAVFgcKgMFxhr0FchbK+9Yet4R6nPqMQz6AcTyz/jQK1OkSbF+ijYEfQjW/VERsoj1rmDAbYdm87uyNz03o03LLndeOzPc42M/vKttJgrwr2JpP2XpQHojqYXG5eBbL3GS9wTcjqxypOvUCri7J5kWH8D8fnkKAxhqX0zGuJSWLQCYUUn76ZuPk+vJx46l14P/GMl/6K4ubL8JbiGRzJocm/P7npRcV0voAzExauB/7dH5rAxIFUlnSUi6zASCXDigudWiLDZd5pUaBHO7XnQWF6dpDLlvw6gYZ4KElecNcaI+/uSJ117RTy9PWNB+dwQu1Cs6U2SmDIuc71AodUnkpMq90d0izLD0GQIv6w57IEuCl5LWtE129eJmHiidoxH1e4UD/pU9Lxbk8wNn8MfsgE9bAvpVAxyldp9uhXLz668r1dLB/rIaUn488pa2TkpNKoeSKCEB0RF3ZiZE6HXahpwbA7qw7kWjZQU5PEHZMivtc3TsyKqg6N6HCCGlYCozAPFo2t9s3xLSSsRIIWccmkazNoDyRfvker99dvXcax9cMfLk6+vTqbM0rYicvlGHgHnPFd8gjQ1mAx3m8p8jVhH1X67KB9FTJ2CItUb4SzwPppts6uoZ9mskU2crIDU9Zf/OD5g4PFJ7h6gptyncT43p6gtwjuLDLA5G/Gt7fLV/KRhK/DuYWicQsJC6arMshxaXxr4L00zn+GI+f1izecr0aNJfKvoYt9exnfPeuYEv/8OivsX8M3f3QzDit/LmCIHW0ogp3919QZ8v6ozgucIV86FfICGbv4RKzxc2RPpYS2EhVk9yykHR4ayiRAmYKg9QCYLy1VZeSyDHT8rZ08jqRcSE0SSBYMKsYUUszmGl9xEI6tXW3jWMagTk5fkjVtK42Toy8zaqQsDKQKhQ0RwIcrbBuGMG2InsfgkrQ8VIWUc7HN0V05LacKMcuaLH8gilDI4uQBTKzHQhZ1LbBHbydl11yLjLelwA4BkWNTw+TDL41HCZnnMS4pP9eIWNPAeeGIkX2lcZrGErA9+DFHqH+QfBIiPiaOojHsem9YA8SFhNLw8d5Md15BoHbkRDobf87nPlqQ7duZhLbApQylqJ8N+KJr7h3kJU4mha46UT2+cm7j+AfkFA4PnPeCe3jJGsT1bvf38MZi0hMetttlvFlYEtooHXp7yjz9yA9uijSutodLXJ00RqgF75+I7w2hJAzih5jCXredFw4sgyU7lEjuEIxAwddX22qxCvqJVqCuiFYD+CL73wItF7FnwMW4v2C3KVJMJJ+HadKkGsMb106tv/Lmow8vAy7O5rl0l98ap30msZT3FurMScm2xDWETAXF6V5BnhmkUk8xc/ndx8cu1DnRJQspIZJH7UxpR+5XlPANdT3XfUKcNZNUfcDTYicxgQRMvMvJ5eT3DnKalJA6birHtAEMDqhTUiwKtImIAY65oIQaSny/RuxnkuKF7lgmBtgpFwlzskiI+5teOWfOFFlsRu83yFqjKe8StTpvJXJZbtqpEkz4VbkcHD4KCYy5dGKPa2YgwealxTCx9vZxLssUT4fJLvZL0y2Q7nUn/F7v+a9fwl6Ii96B53+BD0pMv1RSMD/fPxvJ7WHCFL8b33GZNvp6tY+x6L6lu4KfbjDqXmoQS75LPWxUB6TdssHy4/c/nrz2HTn8zmSZQ9PpfK+QDIU0ZoCkAzoM5QdkGWzj+CFl0W5Piakk6yQv8N6T2OgB5FTkcMDZq0IuCORcPAV1Jpw0ssovRQEvzzEL6eAJkuG4s0vZmXeZWdwUUq7ERYksDeRb59iy3Ft07j7FDAcfv1pnRnmAegYsQP2hxxAIEorFcmNPyLTHJ4r+EZOteIT0CWcP5eMJUvNrU+iLt3FAAbXsF4jDPjoX0qYDw2010mQI3VanXOojCtHWhTRNGwnST8+k7UELbClQmHUZ0S6ekQItLkAOkJBdSAt5DEIW4oTHioWHnD/cGDWlB8yw2N5/kQUPdoWFJs4VJvIZOGgGtG2yIMi2wYIpLFWIKjgBv73iH4JWOYDbVSmeZqo0U42wspnqnBzk4H5Ka6EI8z+AovLsiZLM3ey0Rqte3owo/YD4FFFCgOc4fQGalhtwsowjSAngW2R+Lert+MolYQLGKXZ7nHnxkDZJ3WKtueYX616zZyw3OYiSCXTSpjbqK3O1aAWBNubUMDWjDMf3qXs0l1gBmzX3iv3OW5R4B10ifaGVTakrv6CoBIpAUwnwiJ9d1zy23wTVL+iM3K3TcLebe5pIz76fwq+/2DUO++onAabygMs/dACrCatmAaoFQyQehSwEuIMPchr4YjNkseABxX6HI/Y79KAyt7baN9uun9P98Bnb+54JdjpuWUNkb7Z5Pef3rPlwt5oPNynLp1jHE5uI/30qeedN4M57OaspFutN3Eya/s3JUmdnShx5K8SCzZkFmTMvhOLHiZ1pAxwV5RsM4PPSNL413jnDW/O5M7pNv1CDW+OFM7ZNUxdD279tYmijxXDgwGIOSxu66cC/PRlcR9SFIwDfXMI5RhnU0RO68Y/yxYq2LKVGfL9J6p5ittLpD9/kmtAFP33ethin0BUlSzwOmfo8nIVfCFJcAWjecvfv0A1eEfsr8GwXioumEtHjZQmJki1SiS9yOi37yEgXvEvqQyNMoImlDtPd+PpL1cXoenoyZlC+nAF7FA0GFKXK7qrpHGthXIayX1iRRXghjyihjgSpn1vh9qUS2Lx2bvLpd49OfmW3v6YrdC0lVaKhXogsg2YCMhyLixw94fsSMb54uygnOXzoJtfKrqgRHjdYTo5/IFRUBqV8+ituBXyeK6kS5Ll6EWBsWiUQg7oP/PXGouzdKwShOD7iyo2Hd0/CeUCDYAQfDCNggoir4ghSAwnAUMsR18/mCbWXUBY7Kz4Q0wTAwhGC0WUCa48w8VQDPHheHHIQZiTxze1lZAileOJhHwOOpBycxpnS6xL1AbssDJ5A1ew9QlkMWpJJjoMgYNThtAUDKoDArpLF1vj2Eg3XEZ9MbrJ6YnLlnfUXbzeIkgoehyqGJ9eFpZd8avfXyCb2EXHA2kVC6ZXhD2c8mFLBurvjROM9oLUzJz5wkBycYcS5QxzlwXTvJ/qKOFpSjuhosqDLfE3rse9zYbAfLhjIB/6oH2sheyHaGbNlMeYv3wRTFmNOgTl21hvwx6eDl8R2NYO7XZxxZvpTY00s+5wQKmqwNh/4GHvmvIsxcxeOHC3pmEwAc40hK+gCZnrBb8LZQumU7AsbqlHmy6ZkLJX/B4nGjjbf4L/H739WW+nEwP5wodenpy53pbvbrXihuKu26B1Fv+yZpDRUJ0TiZGYwDQr31I/71LDbb+jwpMfzGnQD/ujkt/hv/eKFGWPeHOtfGOJNh3ZXMKLKgBtOoe17dfzJgBdSUf31PBkioQLxIQHueISrWfKUHH6XlNe+PxyKjo1Oj/j/uZyUn96j/ywn5SJObkhp4FuZyPpGRFLeCeY1ZhSurwPxXfB0YWmcZ6sjsuaIIvEVJFEiBkhqoHw9rNQVvMnVpeinC4cixx139FeTs18Id3a0iolkbaa+JRcKbXNu9PKg6b0hTpE9FWRtiOh/ruXff0T/WcuB3ohxkWks3V0f5NIJlRgDxE2Id+B4OQoYoVvt5nX1cF19kfsFAmoHypn2BHsMlW4DMF4p0qPK/2ieRJZ5mPkWRyLaBJhvnQZ99obVcZLJkPDVTjqXCnaei5sTgv3yOTTkAtnp6f9Jos3JtXP035VrVr/uX3VCwYRwG5/OBllDMht08wt50PaXvP8pMzBecxIQr1VFji2+o4KUK2HM3XG6HIxMMB/qzZ6eDL7d50EE/9NWn79K/2mrK76Vj85LG4RsCgDk00aOyraUUUC5qxNgfFsrCNnQlncSChPBx7Vhlw6gtDJw8NBbxIVDDSJa/eDRd+eFTc3KZTlq2aUJwQaphKRJplo+y8k4tTDfcbVXgzfTTG/aKewDvJSstYsUpRDThfbpIc4XnK6QGCJLbJe80kVNBL5aW318+cdHL18Llw3WAnpoOfJsiRt6sFZwgr0cefZ2NxcKsj1HjsXdtTWCrlI2tzWXhvDo1wbzZ3MXR20xYz6apYsuWRaSu/Q4oe5WWRC9bgVIowiQLhT6+YPMwb+XHkyu3jb4F+u4Ut2ahctmQiQ05PDFijGh3cGoa/QJk9xuTmR8s6PSJZI3juNiRyFs850PGDm5OP2pQPYghwtyKyhzsDYAXUJ1Gf/oEKpJ+K8SdDflNeYa94iWyOs14or1TA2XZqIQnSsTCV4vSIyCK5gIKVLMW67BTRTvxncCr0RCVmfrlWuP334gpGW2Un7Ay3Bp5yTYHFdFdu9SYu/oCs9IshGwJzLaUqrqI/OEApMpPS/vnWhAh97wHBn1gH7J2YEir5yCRleYHIoydS2HyLrHCe3ufzs5fnX9izOPTn6jXFE9FR+oZ5xY1JHFVMVNCbk+VYoV4/hGUb6UykoqMU4RdJBDOVhHZpLrb9+crGlEBIQJH2zRhkUDgONBXqIQFAQN4ZJDCJpNFDgX5LNRKtcuebCRDzOie8FopUrmo5+ODyL6Hw06L9NPT+K/9VM/1iAYk50PMBiRm/foi0jNO+QlWTc96lIaHnMxDcFAuFt6yU4coOjzdsvPALdxrSk7JV2m3+i/QcyJYDoUp6Mh/LDO0f/4LIy3/rv4b3LWbi3hqxA6Cp2I1l7JkkiJMildMEkQeZgP+XIETFEit1eu9moR5OhIcjFDVmt0wiRkPVq+8BehrImJ+3CFJlWaleCYnfQRmBw3tCzTyLkfVfsWndhrWSN5DNVY9Sy+6pb1HJqkQe5uXHhLqs6Dr03jcmyIe7VZvo1s0glt5E79D2zk/BodNTKrBB2sUYraYeS4IPs8BvTCx0I+OI7dUT+GPeZOX3e4U9c5VvX7kTtypRmCy1/5nNVXFZ5G5UNREdmP5Xmrk1xO5MSO6mVZRqdKog6u8dU6dJaEei/8ZbZxObTR0LGfbHs1k0xghglsL4HVxVskzBLhHojxwZscmsaGeTE0zJuRYd7ZF56qmRacVUENbqopmoLUr+mIoY4kT1lJCrWxQBk0tdlp7lPK8iYq8q6mTjw3rQjP11Rgp/06/bJuBnBWB8/qrlBddJqiU9vq2tou09I8J7u8VuZUMenDmroyQycSCD4Fgz3eDlWPUOmo6wAzNI8Q3IdIM6jawfdfBO7kXjD+PGYcvbA5cjesGCLkv4GNtWJmfOcvgGNXtUOeAeBUYLfNLkOwGxCe1WsPtnnE6HCiw2E7VWTtFPT1lMdd2z3kcmjLgZ6dAnh2Cthh+xgjD4c1ahBD1n0gAbBr1x95LBCgAOyK87r1zut+Oy+brN9Y3Zbqtru9ssPt1Z1tr+xofjNz21goxXc6yb3T7RY7bX/YGe4LbiswAbrNBLEkrOvKDTgD/sfS0lHpKUdYdpKeN/HfdINtvvVOsFNvvAvsjFfmANt85d1fZ/AhNvnfbeb8yl8MDhyQ3fPA79Qo78j9Xu+TR6R1sQ8ZKeNFynfzpz+R07A0cS/KIPn4UklnfL/7/W+OQjtNOcVv0Al/oqlDk7vYGRb/16C49cqfoJOQNQzbQVDyX8KS1kvGZq3kb+sluRXi5mvtwKHof9WHyI2IHwDf3z7HsfYmDT9CFpBKg7tT0qcvQYwuJ3wQMoifHbZj5kRusqJf0unz+PPAgd/8r/8P5lQZgw==";
\ No newline at end of file
+export const w="eNrUvWtzVEeyKPpXVsyHQ4RiO649e8/MOfvLCb0QYEBCEmCzYwdR3V3dXdLqtVrrIal1YkfAjI3BNg+/7THeBtsYZMAv7DHgsYk47Qn+xw1aiH9x81WP1Wp57LPnxo0bdqO1alVVZr2yMrMys/7jP/7jf/3rb/LCJEcT00tM9zf/9O+/SVQjUYky661Ela3f/BMn6DxRPXgpO2kJrz3MQN/oyX4dLpjoNiQU8KxjSDWxvPGzbrcS3XCvqp1DPabHCWVLlz37jt/s9yX7Hf7p2QTVLNNC560k3aDPKeDUcO9G6WXIqZv4vJGUK/YFqkkSvYYZdbtOX+nJJySqA3BinRusSJVtrNYIkGVsDryWbWnECn2lV/iLjS+pFt2jD5rzmaVEteBV1RBAyd/oJVU1LKLzMsa+hgY35NmotmpgN8cV0PaduxPRVgQ9VWapxSNjkwDuCr+nbd8UeUvUcqradhjpr+5Ajbkdfz/W9GSBcmYjhWgoXK/bTvadKT1X6SL+S62XptpWedQdmozgv/3rb2i6zuW5jnWSwozCeax1trdIdL2O2B1dXFg/Bv/Y32rZfGYd/llfw99qM/z2d3+LC0fhz/P4vLZazuyWD/5v2+fjXM4cP3Z0AX6LkxPjc1Pwz4nJsaWJsYmJsfHxsfAZPj23bwxz/L3fNP6m8DeJv4nfwArO0qKusiI3sJr+/d9/o+ClGfWvFrmONso4GqcFWDOqGWGSzvo3TAfS1UH8UCa6iCQnpXRMI8pNVLRbJo50exFHvH+lEcE/+DPrUSv56TQt8a3vrm79+Z3H9x8MXjz3m3/7pyroLK0z6KzWSXMCnZU6LiG5CjlLY0iLpz1sThmC3b+Rw9+rPQd3+9zXTz66THB1kSgAU8awZCJoIry2Y5NNQF54zGHGpXGtvxkVOlovdQLNJwzCUj0qFUspWC7xxoZqRDD5qSsotX+vE/XvlIRPL4JeoPXw+P3PB5/c3z5358nXHhsEX4sApOuGVbM6ohMEZm2oIwhkbURfCNiwNxhy0Bv/r0yAHWNfGfg0K+tQB8Ms+5v1aLY69LE20AqsnrKmkjWldGrycqYIbm85D6H+9H6bmlwwzMGPZwefbApMFdeHQWYGE6sQfSfvAOr72YPVMbQSGhs7uI/un3l0/3MLVxdZuqN77egOdW44vK6DPdCwjx1MaDD08hsNAvw5NPjx6S+4wQ2lC5V1o9RObt3fBJrXylSk637ycr4Y8tkUmPLtPMr0amwWAlAPL0Aqz6TbPQb35J3PcCa98ZcQ4lyUKVoxHlwCjYFVg909ifuJBankw0ZpWxonadoJYeMEAqhlLwQNE2nr8tkq6KxMG5W2ZvCu4xjaaor+OW4ppvl2xjCLulCpbsTpDE4hamLQ0J9u4i4FrZSGvvQaLxmBBlMKJiwjLwBjozENVr2M7UFuL32DD/FQa8sAvDS2hSs1hA+tffLunQB+CsxCkas6zs2awh7NkxLmCFCrVd3G97T/lc1hs0Dnw9pYS5k2XWnCKrhTEJhW8rfzuNcOLr42+OQbgLP18VvSq9A/UZpnR4n5wFmYlbPUk/yB1pDSNVcv4H4H1j00Mqz48ZmXH//5hbDiJq6JzUjlaUYLMUmTlunwmsA0XvsNoKu4FigbrUBdlHVcCsuwoyOnA2v+p/eXpbPeRw7i8dmvBhe/AFiPv5ZdBgsroxaIJ8C6u+UBHBRKb8RqLw5GZmBF21o3YJ7dXwlrHdy+tP3xe0GtMJ66DbRWUTOASYO5QC2BMUCardpMVzTwJVm6h5tj4v7VOjWICiSyjWVqLcpjrZuce5ZnYpkA8DfWpCP7m8QVbf357a27m9iTm+9x6wR02v84j3L7lhOVIdBRkcC0y+Ulp47NYUIyBiqirxafnOkQ59WwcnOHEXQKY1FFCDoGUAkQSuumSPofdaBzoWfSdRlgXa5AusJk7JYCVgnQQB5mKnEVPyG5xbXS4Z6p2yIw4jruZuUc0/kOkdyYMHl4CWfY1l9vbn2LS/TxNzcJjVytU32wIeL45roQkDmOzl7pBITk82R6LY2bHhKsxradygxm++WveCJbMGojgc0B9hNahCZr4UbinlN5wd2ipzJe4387v8xbBdX7003iWh9v3ocNAys+/WVQMXDdmZqz1WXlIfto0+MY5o6run/VrFiEpeLBR+8JxlIxiD6wJ+j8KJGENEFStYGb1Bztti2dYA0a+MNjuM3WVVwDOqePI9GAas1Pb9AOy7IK0qTvX3u8+YBx5tKFSQ/Tdo61F6bEF/nUrtMnJH1JhHUTLbrRs0hj7Yj0J5cZaaicke52gBKksGsx4c66KTQCNzHawYz7TO8ggcZEJQCV9nHumVtLiHWLofSvoggxeOnU4N7X2DXv/SBzBgEAkUv0KmGdY424G7cUvyubUOP3BnCKdQcGiIZvCcN4dP816X6BAZO91b8DhGNaFkULOTbensJPvbiRaJM1n+LX9OGFGnJwMCFpNl5GoefRgw8eXyBS9z0PAHCmsHPSjF7N+qcRw0ISatk4LQPJEKc1yQCSUAFbkKYp1L8HO5+d8QRj64ptgMCIyw0FE+IQoa9xcmh8DpJB/o90SSNhYCuNkCUXBpRq/Pa7wSfXocbtNz7wNcoSohpl1VB6uISk0uElJPW6JWTrrTDWUE+mOuPM4jOTReQ5KdXSMN9HTB88qY4a5vvWcD99foj/EoJ4lRYcM2E0d1/gVUGQFfA68B+zVwTTvjpQKWzq0BRch5S35qGl0Ngl4qaFmXfgtt869+TT9wJw6aqBhjWRE9KdTOMibnKKbpXpPFZmcyzRq5ZXaF1Dz8tqWQGC5yDdoTV5/8zgbZQbHt//iNvFAFYjIZ9YfRZZ6qqW8IW/CF3l2kOiauv2ZNXWXZgkrQpEyMfslIhSzlgVh3QdqIsIQ5O8YyxHKU1FLwc9vvzK4NoPgRyEkHR5BPEVCAizBII6hWlUfX+z+l6otiWMxLTpToQbYy6k8aPLj+6dffT9qd/827+B4N3I0uOwt3TUuibJG5iHLm2NSaYXmT1tqe44yVRTgSzrRFjhycxq/zYP6zEeTfwDqfS3ImsGUibJUdNWylqwktUsi1ICjoWmyuKZYJYmFIIt++wEXV4LPPdl+EAKoKUG7D82CBJoXju+PuDlQy6euUviN1L6VzjjgBkO2GDgDJjiJO6hf8c+WUY3YEMDBhSYv3nmB+eZFcQ/wv4FbF/IRhKL5NijWZrjmHQ4TKrwRiFXtE4QiAc5ZkURoqGW2QiYjCp7IdzEjP8j+32wyw/t73O8tx+WHf2wbOQTwR7uNm/ZlWRndVuqfbB7W7CnBbsZbifHiH2mP/bVbSduG6luIONM6SeYyNPyLh12Qs4DQu5pN5LOA55mYpKjkVWyGBBETwgdBWTKxwSpQog8CcqIdDApmJQFH/6tqFSYiLhFnqOK8j9Q1YZ5/xWmmS5bJfBYXWIzJbVdT3TWrKTkJgGBdCgpbiU6TLLq90r9ILLDlPvDb/8VR7oLWKz95n/9K6w73cG/lLN+8g+/PflbKDhKkw+sWdlood6c9aoxJbB2uAvPBiryLwpf4EGZdaNrSdkmhXeNU/gT1WVUuWy/UIL9BuU2zArV2HAJrGSHbinjtMS3Mi1UxyYhO7FkdJM/YW11escqTZGqFn+A9A1+Z1hp2Q4+0DuXMI1KAVSHUn7ShqdSm46NioNUzlNulFhRmIGSpFMa0PmI/Aa94CPMoQ1sB3VOuULvnNmsBOn0LulqWZfrrhp4tc3ZqBYQNIJBsVWEw+eGKxiccCyCrrf97PrV9aPtt2pHBV1i22+bXMUnbAM//CLtfLN24tjhfTPz+2aO9GYWj2zA64F9Y/tm5kpInYX/1zAD/uD9kOQ+OHOwsW/sd5jv2SX4mX0zByYO6H1jf9g39ntM3Z/ArwOZ98FPw28Gfi0ouRf+P95uUi3T7Wbt2L6ZqaPwPAn/1+H9xL6ZiecnJ/bPjE3PoA5+v/13ozcO9U/M7R/LZ8bgPaN/j06NPTcB8IoccmWTE910Iuns5xJL5tmj+8aOHp5pH97X3B/UpvbS094p/ncS/g31/6O0+A180cBkRin0XEc1FWyErUR0JqjpiIFzAh66hfs3JtU60ySYadgwMlXHDAkwvnXT7F8FkQBYtLSeqwJpbEOh2qQNckIadYB3hTxQP/IssJPUo4dvNkggR63ZPaLdP3w6uPLto7svb38nusgdOA2hMRJsFZSOIwuNlawMhTkBqC/PVTfq6AXeZmNTw7pykpK1JCSGvy7XQXTg7RE4ly7Xa/qbuIAeX7sBFW99fbVaseqUIN5k3Q4Rf1sfpEHd7fp4CKSakWCpqFdODIF7eMGDe3SPN+9M1/F0QaF2TedPwbbX5d1cZyAO0rf+lSgv09WnNvBjf5P3erUE0gKXAtarf1VKNZtpVOgWTImo11A6g5cZO2iknzf9G4DwwzeJfiMed18ZfPLS4KUzzH30r+fE7G5ohj5FzVRL/asTrvYZou+RqxNFhUvXuS7LsHZhaCNVKxeYoVhFhUNC7I/9CJ1X699fIMEXegy47CQNsZXpZfpXaEOh6l8ePBAuiWt2lfrKkmEMuZ4Ax5eFYdVx3dR5zmSqkYwTk9HfXGVNriEloc8FCyVTFlpc72GagrJmPkD4NghQtzai/u0Vxnj76qvbL3325DPRIZvVFGqb5NMWhZWQ1oUUkFgfcDgZKW5BUowjvWxkAjWiKgBUUJ9+w9XPfW5WkRIAki2NFZaob4fGQT04kWhypPVMyWztpLjAuqj1h1YsKz5OAU6qjorQOOp/TRR7++y97R8+H3xwSVjoWFF/xQqkAxZhelmGgubfTZNHmJbwEbuWdNGwIqIALCmCvnl85TTD5Yb1P4amBS1LsKl7wnahBhqyBA3DDuz6loEcgSxw0zZr6/L9Jx//p21WimxammlSFdBjf5NmA/C4ZfghM+PEh4BcWY9snYjz5ftco3DIqmHqwMGuRqqIcY4AjQI651twbGaxOjA7SyRYItauQcBzZCBO627+FMhgbSLNtnHvI2kjTRe37skbp5/cfNe2bjd0kOz2P+5fVwUJiYRTpmZ2xwb/QkfXpQAMQwGPURWzfSxWtjcihxaSvJvvMVJCYSu9kUAFRbU/bOul8ZIjaDLtCq+jakzm6Q+fPj59081TAwQRFhtNw7CR0sCfa05PrUGL5n0zLChuBgMiKP1vMuC1g4akWQEbytCSozy+KVB9DffkoeHr32oEoze4/KVtigAZGiwLCZpAaC84SLu3iilmMDYA0w0NQGR1YlkzSf+boFGQUm1R3r9fS4tSBY2iPEOjY/VXfzvfCgbp0f1PBi/ecguvgZYubXtGa4HPsooqw8MIrJnO0+qwUcJczCMPf5rP4TspaX4ZCWEbQG4V3iHAg3mIrQ+uOUQIC7MO4CPa7LnJZl0VSEx8m22KtJdeVaW5f7u5AT9sip+Q1z8cvHR/l7Yy0KClVOdQUyltqJmcb2c7LQJhIxmDnY3sRmV6bEdDu1C9Wo30geALcBs72gwoxXv2u1V4oQHLY42bvHXuja2zr/1DerV8+LpdfBdwnm5/+yUDYK5JtaFHVJ0WRpGTxiiD3gVsI90hMp0pzgHTv2xFpLFexqOTFOepocPqe3FEYOhwA9WfCOe7LwDU1q2PBm+zGq2/iRtJtp+0B8DKATeWAds3zqeVAoQ+6wwXAQAh7cm9lcgCwC3iwvdc82jmQ4UNqXAhTWyP2nNgJzOCpaRxpKNathxJFrSRmbTbK9U2/vAp8CRBG6v47Hc4YFtNwedOVej7LcReLWJ9HbTXApP2EhQeLtMymWlgP2qaamz3Y8pGgirWK3YGUnpm6pxezQ3LBLsoSjKlXcvMT6eXUUUrrRr89dTg9qd2vQnQTA6Cs7Iw6Sphb9uU4omLQNM5NQooJXQiAJuqTEIE5GYhgBHlZcZTcMcQhsBQnZT5USTaRUiEo0fiGEgrQKkMjmBl+ICkDI8fkJVg/Dwi+wPgurLaUAqvu7HD/DuHjmkXj50jXFR3RRYKAQTSEAMIM3KrWBAKRaBA/kkty0t1HpN6uPCk64FbwlBvffXDLpr1f4C4GciagaCJ7YuJEydpj1hyVOpOWFlvsSLlOQHv18lToTAVSFK/QM6pCjkjJJwJWc7HgkU84aSYiR3iSyi6ONFCjnf5AeWICRYfFqpygxMZPOs+Liz7uGXUx4U/nwsYc8eT78ayKmbn6NQpz0mihB5VWQupB/KHi7sxrju5530h0+z4ZcuaWoZzkRnF8DXkBYcZwUOWLZMHSnBsV8Bw7eC23mQOCujCuGev6NGvmyoXs5N/kf1z559h3uBnuIKf36Sz3Xkf2aD97ixbpgjVvC8fclvyJO/Ex4Md2O27/+eiOefym+B8sPm5LS/YjKb8DjTpN51J2Wmmwg3G7S0hrZ0Kqfy0J3/TlrhOhOTbEe1fTPO4xM4TBuboQRjNYfYvAvXK1cTwecMuedzpw27f3VnE7hnkZGKXDO6cYncs+dTi97ucWlTKFSdPYsHayd/vfoiBCmyzZBSrs5f5lYzj64kqe5UP8I4TWNdaiRJ1faJMDRJoXg+lsiV7Uk2FBDawb1TTMYUIxVLZZJhl2qM3qsV0YKJJentD3vkLItO1aLY3bAp/RG17e4O/0jGApNhK1Rp/g0GJJcF+ij0a9CrpeHxj+0Te5Yuc3shJS9MlCZpQkS3ITcAU+QaoDX2z5yymU6btCsBSHApMBx0iLJIbNkGGLhxDHjMaIh4SGQHb376Hgx4N+8/3lusc3xth631TfcN8MwK0f9EpxuLC/Ab8eosLR56B39Nzq0W2UOYrs+vwdy1fOby+Cn/LlUPrqwX8zY8uLhzEX6N2bBH+Prtw4MRz8PcA/PbjT9L3yd+ZJvxdXNh7tHFs8empMUiZXpiKn1tcmDq+MBmfWFyYfL7ZqEGOiTqUWJ8cO3Z0cXz8maePjG/05nfzM9jteWK8m+6dnhiPl6cml8wfpsfUXkibGx+bHR/DdPg/nxkr6AiEzz9OPH9g8rnjB6b2To/rSczTmBx1ioE6NtYq3KDtBoVfJoR0ht2/R4zFrSXUAxNv+skL2w9eG1y+YTV3IMyi8Vo7npVa+L2BO9q8laaJg8jMIT7/j+tRt4yW0/SgtRRxYMRKhIAwKwIzKI5SYl4MPNHGrEwdrXFRoImF+NsEOjLZ7zB/eKHsVVC/bFHnipEZbaDZxawFgFtegH0ISTdyyS9Ncd+iTpo1UXTY2SjEIGjVZWehjspiOj/oXyVrEkzRcZSjfc+GCLicD1kpzNLmUsh0mp/er0WoCMUlNXj1ncGPp/4xFVt5HLZxhCEi14/3AIYAyHWlengv0z07qsdctnp4WePaf7q57rDevvbAY/1fqTRAGep3GEP9YvyQD3UI6v+G6sZzOt8bZZpz1cBZJ76bz7tu/q/UGaCL1fsePu97OI6Gu2NUZwR9oXSUWlvXhsP40d3LYRe7WnXb8oGVmi2byHVr4Pnrqh0pnxegCOMYNIJAulYASEcZ5tghAej9OtqO9k8F9KVXEwpDxKV/r2lXKSz8J++9EBKYX1QNINSLbF0kzZzjmqxpFXBeUYdJhWoK0aBUeTR52iXbMLSs6oCsAKyuoPTkg48GX9xzhEPqQqZXDIqoRtQ0FKam9vmaNSoyjvnqU3xnzVd7I/KAcKh+uMhgRABDo2yhe3gCuVn0v6lL0/G4uWRNRlSscyfKSPSvdl0//nhv653TDmlbIcyYcsXsrVbrzjcTOipiCEsRcItZ/+qcg5Sgs1XhtdgBVFHOE0yRWVE1TyOjgRfqMOFOTYO18dzpcaMBXxzJTpyQBZXbvn/nm0d3b7vpQLUmIF4mdOps61a2AT0QTquA0NkMsvc36SA6BGmigg3jRL3jYONa/+ASQxYr63QvWyaZDPpsHdcMj0WmyyaPkcmL0k8fwH4tnD6fvG2boNg3CYbCZGwCn7ZhKBoGd5AC9Y3xflszDET/drbX1Z9GDbaEaiU/vR9HHhRifOY7BiQSDvTQVIBzYizO7hPWyf1O9Ty8FAcYP3npVdfpv6YuWYdSIS9Erk6M8oyqsWydAuvWeIpOY9MlTlxLYz3hlyAfl1uM8KDcYoS1qEgtEfVzVdWBhrmdG+tUlunAimsVjsOD4M2ZAfAIdUydUfQYqprJMlaDprVxh6I/I3dIvuwGGqqJQJLCBScGbFxjhMcLbHMMWUh4rkuGbkoGH/Y7Vt+MQlDYoW/+yICs2a5GJSsNB/oBZPKs2nWdaeJbxq3lKM/7WUcwyv7XvYBeDC7eccjbalE1bEkY1Y3a9yQrSRcRwKCunnGAIMei+NQ4QoHQSKq+xbDErwsm+gp6Jp4SqybVIoTxgylXNoxrQROPwaoNePh6uRE24LtPXQNcvdSCVV+5a0ExDAVVJplpWViQpxhuAwL0bfiOlYw56jUV6RP6N2CekNM8JdJTA0Rukp94IKEb2iFpuHTB4kxF7A5NHKnBgwRbacBUM0Q7u0FeihjIiCmO4NwUB2DhHkaiXJGoVcJTEmNFiUiOEuOwZkeXAO1z53duiKplclI4AWO8qqztsm4oZiLqpCLUbYVcxJrjInz9zEVw7bupmUHg4M2LZA0rYLDEkoQSixNWPLsvPD52YLqkY3vakKlmRWBwsoJnqYWPtpyz5ZmFE2ce3LOyloO1TKuwq8wAM+tr2UjmHZlbtHyiMJ7McnrujWuROoUfsywfM3teJhvdRcQtJQHT5fgtKQlMSuoZGtr4czTBCFiYCofkmCPrEYocxhBvwabXMc8r3Cd4LVR4hyHGwe3sdid3O/cQl+AYBLe1uh3V7aF+96zszm5j9ntcY8ced8XucQ27x5lwv3RbZbArVTYkuw/ZLaiyt7ltzW0XKth16nbXUbLrqKFdx204IcEOCbUn0II8+8lXqL8j/BWi6YhlSCGFLFZoryO7f4cOqtFk0FHAgI4IRVKOIFlqVCVFjgqNsAFHJSZM1rnov0X0DH1gpnbYhO+Wy9uI75rD24z/TBZrQ75bFm9T/jP4srb2d7vZmEvJ7smTrmDj5O9219ZiXJayZ4C779E6Lc0KnpxyIusPW+VaWjOIf/COfxPFAVfKXgsrVAYGdJ1NI/gN9Yv+I9a+BDtTqlgBaNbNEiUgzSzbRi0DEDRmTii4iH/h4CNmXZfrBL6d0zaM0VYwMotPYWhpy8azKQHN3CZ663OaK9YSXTW8ITu/wGBrCsaCSdwcmH91alpabuBxsCSx/rFRYm5uX3ujzCSJPjYNakyxK0Qpik+SGd9IyenC7+gOd6uk06LbUA3oCegzinaj0MLcv6Pms1zBzBzShXTaXf8OncdK5Fx6QPrZvmJkG91OFfUtKbew3U2fgG9AblsyZmlZL2uSJlrcHTNlaErYUa+MqM0+NG5+WPyY+AHwve27MuxGhiA9E/SJbexwq36RyrjIVhbC37Gji3P4d+7woVkME9PjtMO9YmWhV2SYfhDTFw6MPbt8YKxzCP9NDh86kB4Yw3T4vh//Hj60T+Nffp5pQ/pe+z78ew5/x/F3DH9HAc7KESgwD78jhw+tT06Mrx6ZO5TPQ+LEeHdyHCB2jhwYA5Dxb6fHjuzFYDVL4+2ZveN6397xxr4ZDEuD0WmeHZuaGD84vrZ37MjM2Bwbvx8YqRSum26nfztOQUhtoL2U9ZztdnqQCAwdW7yF2cTgrVPSY1SnvNavHrjuez3YMYF5x4eUNqcnn57Z/uPXj354Y/vBpcG1a7L7w36RmBYJ+XGKftCt9ACpjVXS6bVQ1AdGDs1gSzRPKekjlIKvpiUCvypgr+1iUVKTYDGUG4BhpoI9Fq7694GhReupCoLIKl/609a5Nxx2zqLxDvQP+VGWOie3cHS3xrQ9wJr3NzkNMqY2Xyr5OligE/Xoy76gS9ai/h3YSC+hFf+tmLvk8bnNwfk/Dy5+PbjAJuFcGA0CgdSzKIbAyM4RNU6cllIuMli1SQKWmi5JVcAc+wL+rYegt6//cXDxj8KTaHSJT1dJkaM6/U1yvVd6tWR/c/6q2d+cM6+JVu9K2UM95CXWBjTQl5A4nvc+Gvzw1eM3v916+8sKjCTSndg06TDcQD+xHsfDjOgrGbw4MYhKypjHZR2moqYAJxH7nknVMvbarKYdkPHa9UKxh3qAnMhLVZyRASdcUXiyeFsmNUPnVRwVYA/TuigRYSsmrw/sILJYyFPOiEIy4GKaKX1XdbYt0Gj8kkZUDtGELXUvTc0lDBXSIw9aUkd9derJHz/fOvdjFToqwsjEhywIzGoVC5J8MQaD2An1Us4wGidaN1RZElY2hGCBi47qVICsZl3gLTRbAXlCsCY3+auDL15grAVlXD8mwxhEeNTQ/9gkpc4Yc1I6wqzKyhqvb/jW38wYbZOSwUoVU7Rj4fLUMlZbCq6i28NtRGsccL1KOlmQV9pir3arnYtlLIwzxQz465/RdO1zMo59+T93ooxCYhGTqYBHVNQIfFDk8VMUS4fNCjxKIMkDC2ctvqoYRP3bHDnCIjB4/z8lUJQuUhPX0KgiQSOL0tHi/o22+xSzUgN2S466ExaL2TzD2KI9mLE1E9tu6kE6KUHR9mizXBdq+LebSJPuU2yle1cGtz8F8vDo3qeD938cgVeeIsnXWbej4TlbNbGzZxmFKORcpSAzqAkDVhTKTe9AGqXXlBB1tTsTmLAJdPCWL6cpuu7DtMZVxcjfAClxRGM+HZz6sNoYwJFC6wSks046mJC+SqYKgV1mTU1AXvtXiYLguKKQRnze4P3bMKhPTr1fAYajqXP2lbLQgHlt0Gzu4DkHLS4PlkbRme9YyDCCzpQHz5OukIesRQK1hbevbb31MeNQsTAfsmgnkY281sRGP9dsE6V2M2lnChYY6bORINvok50gW6ARCNLD4aRos92NarlZuyqaVQtDW1VcS8cHA3iWjPv8DjK66DjQg7NfVrxKFK9eAW39S9SeIfDO2UThsZqDzm4nagf0wAlFoLMTygjoSQSbWNmiWoXuD2GRlHvKFQp8QLZaEk8qQIiGPwE5HGtB+tJK60R2htDrlkA0U40x3Zbrhl1zgJD+9AZpTCzGZKJ+f+vCNUaZVVF4pILWexRlLytxIObJbYjT6xjVaHR6tYB7QSUwaqp4r/3pZkGchhzRDi68+OSTS1YPpnIk1LSJrWaa60EPrUJ2Lkzsb3LYAMyZjMiJY2NT6EQHY2rgUaiFTAE1rm9//hHD5lYDyWlHVcCQ1v+mHQ0B5pzJcE5IU6h0tacWjejhm9TXbGs4uP/OkxdfB5gBNJgPiXlquY6+CJneIFs6hmmnJDLiLZ0les+CgyJHWXmm+GsIPy2QDNR52tDRYv9eFnl0+Hhx8OI1RscHZJRxQmKkxXnSp9IGB7LTIRuIUdKFFu0sIHOwUNPcGU0Ya9LFCoeF4tuTa7cHl/6EeFy7vQOP6jiEE6k6Fnro08gyQ8NC+ITDcu22HZaczKXrUY6dv58l0G43beehtaPNZG28XR6xE0AYGCyG9nVL+e+/M3jrjKX8GPyqXWeHKPK2UUuphA2DdnXQVYrjhiUgzbRUJwgclqEJTSJOOgpt5guJG9ZgcxqOGwbyBTNkmx3L2wd4ka70xuDFO4wW4wR7K9AbAN4t84i2b+Rm2Uw6x5gasOfyx9xuULAxmA6fQlRKJ1xal7Y4bO1QFcAv9LJUQ5zGJkxQlLuICUoBNYqy9vK7IHQN7v5x+y8vWmWyrzvFOGnWqL2CFh79FooN4CtFeJr6Um7AqtiY/hW2iq+is33x8qN7X4bo1DE6EIYyzDBwMLo1qLqSLRo/Mc/C0Rf3iBkRCDJ8FkmFMQ4hkHMuaz8t4xfHyPSAeneiNZU12oXh+FZ47PLwzRVSlbdtAJcnr381uPj29tVXXRgXRg+FZj7cd0ihFABYFYVCMZW/WnxYcKLucXjgJldyUB6xgbjaHQL+7odbF14PgCvh/YhFbYOILd7jucm6GrXnexxvE8dGrfJnV0o41CVbrpcoXmqMzXKWHmelc82et/50M3cMzuOLt/HQ9eJdy+C4ehtWzJivItOwEsZ8gIUwOZLbCg+MymRFegiBi9zggbNBXEdD1wPrj52L4oP1zkAXr/6NrOA4WBiEbHOP8ziLeiCs8xpXMa0iCVFKK7xHQcRMFKdpu+7jr1KMtffbyIOYdeeI8+C1wY9nt65ctb440EbBJEdFxiaH58PQoJAICxqmQ10d40SbEWYisGOS3FMNE+MuhNBpEV/hXe5Kswp6cPqlrTd/DECjEiZGyq69nEwHFMjQlIGkzBnRGy0jIiLiJ7sRi1yMhKzJvpo3Wk443nr73uDyl4/ufmbl4xiZN4pkRXUCm03yRbfT41C3Fn6hJ6vxrDi7MMQS0YpRyA11ODAWwOfeq0UhJnwM9eZ7j+6eZ1S2H7w3+vRSAeEEGmXdmSnuGywJIiOiw5ohhdXMsN4sVJc5rdAhqws6JAogp2w6NKzrCRU8Xu0y6TQs7PQuCfIwSh9SVYPkrImYdFoHVI6heDwxSs0wW9EnzAV6DqfhGBK8p624PeEkbFfJ7E4xOpSgq2LqxJAoOhHKmxNOpDzoui0QGUcIiyK0zVkBbY5FsrmqCOhkv4okFLpB75CqFipyjRNp/mte8k42GWK4KgxTla/a8anKRlcZ6H2WgZWHNPxb4UJH8p+/Bo0KLxlwkcBKHbQRT0vi+ohLohALqfhIVTihgAcKuIaFKnexUOUpJJBJyMqELMMQszBhd2Eb22uCd1mJ3ua30x0b6XS4XU27PWrabY3kohLsQuHmh9SbbeskxCXvJZjkiHeFYg/R6oN89n5QKPJBIcJzIfV1NHeXs1dVTw/iWSYXHHXuOpyjeua642v1vHXE5/Csdfhz9Zx1BG58xvovP3fGigZaJ09Soe7Jf9n9fNWsl2Y9VW34n4/v8Z3P+koM6OXjdnEKH8LRMZ1E7eJXmjvoENOEX4uDg/G7+9LOyxUOSCWvfABYCQ+GTik162NRCwvZVz4kzHU7JWMOOn3NddudZlJ2vPWiafhIspeWhSBbNumNUimSVZBub9YogeOGTqBwVD1+obO5DUlEHxF6QzA9VQqCKQhA9MZZYptbd/lNrtBAZA1bKdTsu1w/gue+qdqwV5uUcg5cHRDX/b6/g/51HRp0n+sv10O2U3w3uGbblrq2udYE+Af4/qIjyoX5tXRxYf7IwnwP/87Bbxb+Xxwfg6fD+FuYP9SBXzzfW1s/gKkHF+afXYFfF54PyG8//hbm92n4NRbmZ1rwa87vVcchfe/8dB3/TsNvCn/zk3UFfyfhN3EUf4vz40cXF/BQkY4jAfj4+FhjZmxxZizeO3bo93vHfrd37PCz7ImSzB0Ym9s/9uyhg/w+Mb68NDFu2uOt5sy4buyr16Yn1Ym9UNHzzx0/tnd6chzv41iYH3EwiYw1XjIiIiaQ+Fpk0uIp4JG7vEFgivI5SBXQSNNWREox8di9uQ4bPJBAClCK/yBFO/3Fo7++Nrj2A/wv1JCrQUV0R4mhafIU0AMLDNL1EKh8T8ExJMgXgaBw5COuXvwfVc5WfuRKYuNNoVM8oMgaIIozJTrgzMS2ALSzAXuHK4MmwWkQbArlFm4jKQEoIEYl4BRqAF66HwScImRcAxNkMha4aarFjKnACFrm6uamcZ3VwFMYBz9wYMhI8sqQF6Thatf7n0ELp2hzIx91kG56UMxkFE+LTIo7IHD0sqwkd2G0+cJTEhePavD5Xwbv/6eLR+UA2rbAMBnVsUcOCVlxzXt4NhtBqTbPweLmMSC/u5JkSd2GrdE15udFmpM7F2gkcebAfJSIHk6mkywxV5BKeZHrkDeG/i4AoyKn02s6lGmJ+or9pWG/BiFrcJY5+RKrUBVR0ySmuUPG9PBBHsASPLn0aurkSraQjzxIDmbC8Co9EA6uazp0NPVpAEocVKR1ME/5+MsCoPB1K9wklOIvfP+PhIIRQDwkDqzAgP7eOlTdX7cOl4FpwHNGdLEZsRZRdbEz+BtpLsLgbynrTgpUM/Vv0+JjdUmBmsic5tQBa1JIAZowHyH1PFkYJhEhwsKRputRatbUEMaRAdr4LQKLe9fBUdy5oo4pbNdSvbZjQ1UMD58oYWT4/kuV46gFAHjUuH6eG2WrfzXitV0jbwGQEPdA95QkpjPzX7ZghfevdiLNWTKgKTBAePfAcsLe5Q8vlahJeqMd/e088T5bX34zePuDwSd/DsBkUL7maAUC4pPJJF0tPSD4HIJBCI2QoDhQshUQIAk+iIouSyOBD+hID1G69e6yzl1ep869Lsp02+tUxuIqteVoLDMe1Gi/Y6UVki5VC0mnmqskvUshLVEhTuoairwIHFF/E68uGEXZdaGLvH97lS9vqtB24G+yRlLS5U2OxN/s4VAUPuLg1Y+3X/jKUfgq/BzjjYDQ+RmG1gfwq/0bMQtLXY68iV4/QMSPkFYLxP64HtFRPMdN6N/H5jJAclI5z9AqTdb5U0ouZbDN3fOzLR1uZkNTQykg5HBT+UKHsLGPNx/YxgaQCRYB3+chHatUPhM0yN0TwU2y90Tkaf9jmA14BLmKO8BV3u4NHTOQwQp1Gc++PKWpQymcX2Zijq6yUTtX3vOynXPYepqQW+de2frmHTshoRvLFaBPGGkygU1qoQqyTLsRrCNOJoisg61RuOmuAmpH4LAWdpq70YscRIT2l68ZoLugp0YmAoVbUCC/pA3XLGwMhui1rcEY+Tb8ohAf4AU3wvb8eDVsD2n+SYCHVtQqyrv+V5wA/JMqUT7vpGnWLjgzMRS2ajZZ55pFOYsnqbAwcWxSvqTrmMzwhoxOjrYQfnywBN4BlvIIwezoakcu2oWGjBk6hYA0lVmLk6u9CKeGo9jn3huc/c42jVFATV0h4VvrJmsace6y8MLv8LcLq4rsMTj2oQWAk/nMRa7fuRVkZF7hpx7GeEXOaHjqKQmLOzTxyCFBmmQnX/LwgomDwdp+4W44WKREhDroyoLa8AOesdWgLj5j2exGrja6L+4MVyZsQoeutUIPdlJp+QS8dghPbdGLdrLyBbK2I9K6dLWOiSfRHRepaAmdJ9BvjPm57evnHn9wdfuLayE8mcP8osJnXE/HwppTCbcaVC3hVqliWYwwQzLVyFJWP/e/KbDr0TiMJnCCB2VISMlZ8uoqbQy9OINtolsKjWlJoKGHl1ZoOpMe7eXtb7/bemfTxqbn6i3RArIsJ7ZBrWiksEw9zxe52TqF2aQaR+vPs0Cyy0jmy4Q1q4p884GQ50Q7y/MtWFnL8nROyKnITU5YGpIv6PS3IlywcBPIFhwEjASLmVB2cVLLTmFiYZQIsTBSbBjJtVdY9p38uj3ZDploG0SvwkdTrt25dcep7+BXpQ0Bv+qaELKrtgEBnxoyqSM5VMbJ85AW8YCNpCy78aiOPx1i7CZClg5teR1Hl+lhfq7CMTpm0fFdk5bjOiSsFplGVA0hHMNmd/jMdO1UDnkpvjQNbf0SOUgnZulowCI55shXBbO+wqdILTa9yixUGIXduISDoziEhSp7kLuMtFVbCn085A0cXzC0TS+KlxESzGqgvJz26amhLXox2J/d3jxyB50evXsuDG+duWydkzt3zYlwy3Tb5Y7t7OCorWwh3MdcD1W2sOPh/uX2Lk/+pyy5rzwgwV+obiFu93AzQZE/50EmEpa8IxoufRQ9d6R8F5V+fTzqwRIc7UUVfKwq8sMPVR1+9Uuovg++VDX3VRRYaf/PP6e0r6uTJ7FE4+Q/766xx0BGaUmOnGqZHygaUo11w/xAKuQ1uqVBHnRDIiRtsH8KkI92Dv9insQ9pmtlzrc5mMQ+JYrcjlSD1c4J2nlRXCS9RtpnSGa3Fd3e4AfIgspi9oGSJ3QFktuXS7x7u5ToSCvaZuQHuiZCfGDKDedTJPG2gEPn51GJBJb9gFRDnkq8t2PJeU1xZ0GRnJPkSSJZNfgzP0AFol7nG8ib5F+UsGqdy3AHs18P95/tM3HUWmPlvCjPJdwV6bsIE25ex/0rOGvxKiLUjHUAa/4iZfvc7OLv4feHhX85cXxhfHxsdWbsd3Oz87+dnT/yz3OzR56ePfJMraXnevDbaOnZNfitH52bPQz/Q9aGen5ifAzeD80ePLZvbIX+zTj12W5nefZAJz6QJsuz+5Pl/WknnjowNnlgbOLAmJmb3bc0NzvT7K2v6dm9iwfG2vDUqlPJ6cbC1Nj81Njs1NOqUcOUyd89f7yhTsDT3OzE8YnfnXhudrycGTtK/x77taGmjs5u9I7Ora/92nL/Xz2POCZA9oh3Yjywc7uqTZY/QP6+buB10eRp/fKNrVc/E84DhJvmeFCeqDB6R3RtrA9UWFMl7FAgdfz1lK2DKHGjZCRaCrlKURXkNh1ZTqnERtORcEtbl255ppNDMP5sTTovgdeUuojblLqA27R1mTp69k4TO2fiGsCWcLjQO2YVXbjI2jltcagTuWJ5TXjyB+/auzJsLbD8oRa+jBYrmKXDcSmNZkm2+PbnX9ridL1GrcNmjRyvJdbdLgV7J9djtmkG7quj2cIQFZzsyf/jO1DR/2EtbBJ7S+xgbT25Qi/tbqT610Gs5/gciW6JXwJbK1l7BEiGtqcSnzLuplAOGIZD1sC6fxsvMe7fyNi0evuLM9uff8KhOD+rp6tY2MJwVYPosshaCVczcgdS7cNLSbXWH64EtWI42jrH1DZp56mco2l25E8Ux1T1w9fXQDbOUS4kV4Czr21/cW7wmjDvLUOqkZK4JX5m7TJ9WBR0bFWIjq+KsHFVKbT9EdsN2Hm7YllHoQNyGYy1PBGjfZBsSd169ezj22/KtGokroKs4WoI010NUNoKU1DeClPWwh6F46RscdAob1YPUDEAsOrYY0ObGc3Y+/dbwnha0/l83A4s9D6vgftP3rEX7VH9fD0NzB2yDkZ2I6eLC8mmja2bKCf6raC9+gap71w+5YDcWAMmk0yj3/l8cNFedu1jdAdxuX0wbhuDm6wSxZADbRHFkOMXl9e4MLj44w9c6G67MpDKJSZnpzFcA+vs9NQyOncBtFrWXaP/lU3l9dGuK71o+5FYVvE7eOs9IbO27rDKoB5bAdliUQBeduCxFThL3DRSQMFWWfq3BrgwChnGnmYDXDG71S4fW9qSR1bPGm6ZlcheZvfk9a+2hWqxQxP5qbnS7MHEvmfOBYzdlZJKRnJMUhRKhvJQW9y9pfc+dUC8B5U3MDYNPRc2achhyvlF2dZJfjEitt5Q3DB0hxLD4VMf7gQpTQTOnt22fPsCeLZ93iFLIEordzpgOY+raiRzFCA4il0lkHnJRlw+jHlsYP2OuzjmomWxIZVdNOVAQxNWLkqasG7OVK2bd09XOwpFTal+6+wDWz2ZtnfocmyOik9qSQO02wC1wvOnwpQNsvAlbYLkANayhkseD19csZzKpXhzday9EXr/SoctzwfnJSgJ+Qw5YHnaxutSmaI5CNVMLRA+CiJiUjVHXMSggLb+aw8wLKCAqDTLx5d37Yq9AwTnJC8mm883hEPMO2N6Z0Hv26Fd5ZV2+PD1lCs015eGSPR63w6pn9phQVj6H1gZh05V1sjYU/6KlbHQfbEyZoIlxsVIsMSsOHT1De2WfapUQDdGOdfds1/6Cnh1we4BhQqe2PhIGllDnsnOhQd9tphh2bpwrdJG50W2w22s7nRjo3zFfsY5zHmE2Tg6NTKgt/os9BwWi5cl1HNY72CKniRuwMTDIkudSxSnU6fd0QIRC2Jkp1jn1lB8E4LJWAeYosk2dDotE8pUNE0LjyvJ5W7G4mrrx/1Y6kcXqqxgZV2WAh9Ij5wEkyirSRw1DtPGgZJeHtz9NGxpplYpsA1X0dEcPIdSY9L6unspllVh2yq1QVNtbahe59gepAvMmDmWJCpflF3WYrW9svbaD1ZZmykbQYiU28CZs5aT4ugka2lDypMpgbPPuPsKlR+pLweZoMPolBSqwybIH5FbnODzd7KLVGFFCpEGtJMGUicNpFYaaErvU4RCK0UoZN+pvw1e+45mDbn0FUzVzDPvGcsSLEU4mMBI07WXWdH/XCX8wjx0na0glsmf2fPOAeNMV8hxabJnz0Auwr9ALQtaeY7FDfhby4dmAX+aBfxpZvlTxfwps6YOHrGLkh04UB5U4Q1x88yVMILMBDqQ8FkFLJzyLJwSFi4W7Tyr5QOuSgdclfZclRauqrBKRBxNy44x09JwEOXuaEkjDiazl02Qk8kOzgXZAW4oMw06ZFLsR2ISanScyzbhwhyQ8wW3saQQbbJFczQ6As2bst2RqS9WLbqrtndWeTRz3o46FETtbTvv0K+IEcRLU5l6S1qvpDBEvLm4yyGFuGtH8ouA5Gsm+U1Z0sQxBKSeuyLrb3bLup0wLZngGP+6TrpNIb+W9hJt1Z7qEjhJgtblorcgb75fQQGFWHlKhREnZRUVmhd9QhpdJjGWulRJi9UI1zJ9LBKdrMYYuMNa4REZvGZ41EevHR791WqIR3z1WuLRaLGm+Le7aYqh0OrJk1ZfjCZCJ3/7MwbeJSt+RVEKbz1Wt1KqKtv42LNX+1JiqqBL+bVHSs+GzZtKcb3slLbLUtgsidaSLgJYolTogrroXGN65upEA63aOT5zRjQyXnL3DsMLhUZShSCUYBQlfO1VIi8ZlVPwfsFUCxJ6WQsGieCOWAnukL2wqEJ9qY38X0OjaBfR3/T4HoQaV6ObgkgNHxk36dcOPhH0tqsWHiXcFfeS7V7uTcJQOk16ifvF9gQ33bbUaYSTUlTBhSDJmDklsW7/slsGalNjJ6bGnpsaW1gzLf92/OhCGXx7euhbz7+dgNf/+tvC02utyptxL09P/N16FPyeruCvToR51InjC8fCt6P/f1EP/wPUyblqxwbVIR3gqclfWxVRzhIM25cl6DbdIf9nVaIRXlKy8AfF1nSTrHJ/ulk2ooeXaM+7cmbw0hXRteRGnOQIiOoc5eAbJCThbcpFRGe/kJHzJf07BIxTSU5Cs2GCNV6RlAjiTzd7Xuq7cubR3VMSq/GzcqWsRXli21RAg0pyhPQNSzsqw9YcDTPYBoGYkkuDtj740DUISGhMl88KBG5QVmpOtbVwnS4zQeI0PPSFRLqai/NSs/D6NQIpLXr5K4DqmgPdBTKFbw1qhLNWtTFLfHCd+kx4+7pvEDo80nEoyUN3v/ZjtFoSjgSD2gNMFl5phaI+A9IySJITg3na9mjKAM1haCTr4rVP/fvdSEBKky69sP3aVQDsWuUxDZphEy3aD193E2vr8rcWaepYnk3S94QNJ/Mj97PrXKrHd+7lb38dGj+9sWyx+NhhAeO7mvWvCiI6q2WKeyVOa5hOzxqvg3UzCuthLLauvAZV+SFG27oVGD+8XZb1KHVgImFhYtDWvCQnNfFbxkD8bfJ2Zos5NMeLYoVH4gvOJI+xffLONxZbgWBx7Shcg4SiuGpSrdx7VOO4UxhxjYL32QcUlfaUc75G488Q75Yq+ptVvNMcW5JahLMUx8ZjDFA27dQcfPVHN8pUNSPMlRJyVJmMtx3jsn+HDnU27XTbuvZXqOnXDTJFVhEs7l+3WKh2oogmyTAnLX7lvgPZQ75yVxoUfuB1nAcCVYVYKyM1+OorqPjXIYXMKplSkKT4o6Otom88WlE0HvUqxqOiWRwPb/GDimQN/PAp1BUQmBjdAVQ0Eie6MS8pYcYNI2dwqUuPXfzSr84GsoWo77BLtADJDbhTRksFGexqlddxFjcSCe5B9QvGL7z2+M1vAYpHupUuBQijgqlTpYkN9nbwE093VCvyPUtOxIL+5fuuZ7FeQpyr5EkndXEXdySOu8GYVA8vcaxnT+q+fX/rizehRr9K+t8Cl5WHuyzGJehv5sNbreFsrlWYgklujm66tb39slspKkb3A54Mea5iu7I1PXMfczrVcQOvNXUrevuLH6GqENf+daOb6PAVMAVojhjiClOCTPI9qrHSnWC7uWfp9pOrD1zXop841y28ANXLs4IrZGSprnFrYUaVMbJPrt2G+vwSAsJgViv92lIgW1a7dYny+K2xa4AmhwvMTuLtv7itvsM1cww/DmQkVZM9F+uNuWbSwdfpDIxqJlXaIVc1GqTBnO5y/YD69nd8EpauYmDIBkaWp3OX+KkNDVRODggx9CR9TmP6DKSlpaLCRD1lfb5r1syfA+CcPo+Vf/GNU012oE8L3ZWzRxTqgeuI6GmaLv5cRVVxipb9sgxXU7Llh4fZCgy6TMG9OmCDi2f5wUfi6Hb0uuZlqVwkDkkUvTiNu+nS7BGeUglPSak4MqI2alqG5fsf7MDEKslwgZY0TfCEaimi0mndNGAnw+NLekdNdDdf0wlVlmIoQqpRNoiXr0GlDnW0JVV2gRLi9BpinGPI1mGMW6rm8EU9hJ1IH71i8d1ASs0Xw0KNhPaGIe4K36kWl4VhcNVopY6MFUJQdEpNsd3tQnj81R0A4vFfN8gievRhJn3uGV5uwZKyC5azrKce+f5mW3B//P7rnt+ti8k3Va8Ie6BJNQwqgvwhA9EyevW45NxLfBKFmieYTnVsBsJSwlEAewjQpB133gaA1I6RUUVQcGCphMx56UXzHxQBWODwd+mqDqmmhbnGcecEYk+FC2OeXiw26xSNmRldyo7MrS3wf6GKqcgd+8yss2NBLfsprKdjO4VvZZ41ZBUtm+h4RGEQmcNk7jJg1jynVuXShEOzvB7zeZ5lcvySMEuWU7KcFnNZ4knQQB9AVkN2TNH/iPoMg5GYhhbeol5yH9gbnO9f57IUlZa1lPBo2v3NVTruwOS2pEMyPTH3wSyMta8mloPMn/GJHtNCSWJhaP4gB8DchfRLAjyjoKuhMavcyiB5Vbu9nfd1t0OyqMaaQdwMUeuYEr3I5RV3Rd5Zh7Yru1W5fUr2KNnpeJcL9g23W9hNQvYGuynwXsD0gfoHBOUmk2Q2diks+WVa69FhJaQmbsTOCn8xqzwBmWOiKafHMS0FoDd0TMxvLRXoToGUcFZc52T8gAsbcy/R+zprtTfbTB9GqE3xBX1GcqUPjdabjsrhFacjv3rN6S6frep01GevO90FN1aePrOb8hQTUGmKxTqiPX3mZ7SnGxjgIeO92FCoe1W2KZVVmHWzYXo20EKZLqNdbc9wbHyznihoSlMMRaEi1FPyWwuvF2hvmFiuMIVUqgVfoYyLno8RKoyqicqxBkVQAWkvICjNEobIV4bNgRv4xMn8XdVSitfPF6CaOAWupJ3b0mbFfwXqW+aURpcsrBuQPiihpAWO4SGo9aW9CZUxgwTbtrURleWk12yXNftCt6tiC7Cl1Kdxpt0LKXmx9zJNlrVYyr0GMOndAqGXcg2eNEbp57j/Fg6ly8UHKfR1LkODZd0b5IOihIeE4cdqcpvAdVnUKGqG4UsR+E0mg+jB5cbYFR4vN0x2PGzP2w+x7T35ILcESOf4vgjbSRAEd4sk4/ZL1L8Ysf/oYlzfLZr/8O/oYmL4b9ccXWyro4tPU1n4vwZpydHFjgrzw/97IU8Mf5fgW3v4poDjRxdXJ8bsXQGTE+N7Mdr/r1V67puZzifw34z+XaF/uxNjM9NqaiydGNs/M51MjOmpsfrU2PNTY52Jscb0+ML+fTPxBN42UEzgzQL47yT+OzlB/4xUpaaZ7vTvJ3j0r/k2HWB/mxhIRZw10C6DJFOXsY52NQXnxYPhMiGzJE2HwxusE8SAp2h1RCeh72y99eXgxWvbP75hQ9satGlUPNHLFQyBh7VgzGMOZRt+b2EAYEqx/CqdJSNzE1l4tHN8vPXOXwavvs3wnGDYxgsJO3zlLdsfobfJqqE7cFBWjTEDzh/6gl7r+LeJ508i4FKORBvOQW7sUgdnKVCAjWxVDXKlbqNAkrJbCUnZaPHa8x5Qj+5f3/72hUf3H1g/KPSEEYUWh4IGxGvMe+f2y55G1MgUgxH+NSzkcOWbmihQUlx2ya8XCyHXm7K5BEbXRztZQAl7k9iVjx/dvw8IDc7LxU8F6VFJJuvANFhnZkXl0It4yg9CMHE0nf5n8jFt4Ok9lFJSrOELxmVTU4W9WLvE/g1DAc7x0oM36GI9slD+8qOtFz4cnD3z6O5LvMP3r5OBrYrIJinNeb/H0M8qqpov9e+lEdqUEecEG32Xi5CFVoNKRuLaguwzWn1YsyZN34yNIkahWsgvy1pdg3SE2hGLFB1CUFeT+NBgEU/EDY3XZaE3Mn91UjjxZHFQzkrjcjrRQVEW7d9QIgcJpKdZWBQp5PY6eq5t0NWQyEavcLiyR/deweshz//JibSEGkqv/MgrledNTjr/KHx3wHsR/RX/McYjSbtl5F6ZxVuz0SYICVJiiqDxEhrznP/T1tlLouxQZQ9XH3U5Phd8HAhTFd9wUckNNG7d8Bx199uVy2hhVsOpKvaSH7zz+L0frRSZ0srFax0ZCr+iL7tAwgxy8aNAww/IQVcBEhDqXZqL+IqMI0C69wrMRXgQFV6i6LpTUoTkLPFA06J103iqgOm0+hTMbtRaky0OySk5uqO7QoanbyOGmZop3Yt6BbB1SUTOvYk1laGw1RxPFHqC7547/ejeBxhL9N431vKZKiSUcmzDDhyAAG4m+JVMU3wBxCfni/eALSfwmgaX6CtBjBwaTFwBKmNQ7YbCpJaySkfk1V5gmlrphXY9tZR0qCPaLaMt4ST45Iv6NUVOdr0wePHm9oOXbC+QppcJskdpFCp02WFDc9YAFdljmlUsZMHFETvTCy44A3984cnNdxmNoa7Q+VBX4HgghV43En5ouCdskZ09gUJhXu2Kmys7uuLR3T8FXRFiMgKDYcijIErAoVtlHlmg4nLy9WmG56Yea4f5Jo4E7eOUwHQtplDHBrgN1J3m4lHalYnIpSmiAPp9mlqJE61XrOO9eBRWpBAjI4yNeKssAqz694izfPTX156cOsWYDV687eIMXMX7s0EMw2O/vL/ZUuvcMAwwRF8QyQ7er1DtGFTilPWhUj3VaBcZ7J2wTxjEjo5uviYOpFFBZ/DFg8En1wNcmOJhY8uVxHgaiB3kUrTPVE88NewVTdMcooOyItccHcQRuf9mdeyp4qF56ACOnIQEd5dpCEhUJiFA3zkJ7785ahJmnjZSBFF5dWAhYZgOsn1iZQL2b+XhBBy8/76bgHL6iEapDbPav9+ALWBhCCLfb1KgUzMkL8jcy9goICaD1kYJFI8uniYEcPLlRY3coDE+EV2sBE1uU5zhAKetP7326O75AKc8LcoEdlGAwGoTBIwJdG9iwTbbLoeuZAHQpl3I7aF2D2KbyZ9Ok6b8deSIaAmesz2AintsPzm3dTKydZbG4wkuNN3gVQz9TTTD7r/MjUfA0na1gdHSeP1K+w3H+E7WUvaNTlJ3x3j/FogDUFeI1eObr2yfejXAarmuluAXI6X8Jc/odN1wbGjEAsDjP95DRT3OLL7JE70IsFXAKpGqbpPpFJ4257ySE/ShjojcU/SM0mBLMTtfgdvLSuIMijwzzaeQ2K0V4hhH7B5yeiEG9z97dPftKhJu7RII4WYEoKxiTUD9EhYoO9YwAwnW8Kt+6QQAfPW0aFztVapNICprhqv3RNtWr/ACkEQdxEkPMtUqOkJw6HH3gRXkn/ENC5RqDnJogUoJ+xhJQdQeI2Wg1XGDAi7/9IbY678JKGxdPrt1++PKKtEbiWGKoIcTbI76UI5Ea6GK4SqxgN0iYZDBcTx68ADHV5AZCHqf0m0/GZtS8yk9TaINWhvkU2V11rqOSXR8L/dsmFUaEj7HbxeIE60auv0HPUg5NhK6DNAJP64Uix86D1z7K6wVix+P+IbQAnq2hIGHvM5vfsQtvGDMKxBo0AMIKdp2b4gZMTzW2Yqdnk2dba7RuLvOnnh42EQDCHPI1fn9DzB+MItcnXXVv91INzDOCLSghYtwI22wMK8MfilJGuUvJX2CQvQl1r5Qnb7ksergbi0Z9GrMczoVu3qYSXmIz/Yf33785ocBPjlF94H5k7L6otTuDeYQCoQxkZ00ru9JI+RzYh1MogoJ4lnkKJCMEkygIk4X8O6rSJkpe0hYqJqJ0YCD1g2w2pncf5hxdmwrdBX5t6mpaE+OgQvMgkT8oNXSSmxICwY4uPjqLjdts/6Faid1CcORNNLDHA40ME7xskMRMqz2GFZysOYgVGVQtXSN3H25Jxu+yZyifOs0jzjV8BXrVnrUVmRk8dAWt0W5WFBCDogoAIYItF6wY0ca4hocZl5QC4WiEcKQF4Boq0OhJxS2nITlqhE5YkQdLDU4QSGQDgK5wHPZQ0y4/+CZ7oDZHsFmSxD2oHwu5ZkfrXChnv8MOc+Q5wyZTctnBrxlwFUGfFzAwwXcm+XZAr6oyqUxJ+Q4IM/5OI4n5CcCTsLv+WQbPHJ7Z18xv50P7eLV/dvWZWtx26nnBnzRsJzdl/yD3Zj8hhRsQsH2Yym7o+qWngdUvEK9Pd22BFWop5BKRxtD8uwJoSV6nvYRLKF3tndcz+w8Env66WeeeuaZKBdyMnQctuOrOwrb+cUdg436JEdgOz65469RePDR19O7HH1BiWeeOXlSFNInn/65O7fx7uI1s2R0U2KyUwIb/gN2moOVmBq90rGERFDh4CtteXe3H+v2BheiC5BrLtGGatmgwx3esjmBv0CDtKnZZIld3s4xWHxCEc0pNZfg8UbCnAOVJDhy2Xfa3khVgmdT4bu2hz01Cn0uIV/4LVHLPidRWn8GtGRbQUFh7PkNvtobreXC5/CTBOVZ5mMdqkwcJ+Brh1PxSSLVNMu1wOmAe9+dj/kkNyB+BMIed53r+tL3Hj8F3RG03qZ69F3MG3JbQESd5wFdof1Ljp1OPJetqBPPHYHfHP5OPDcb7x+Dp1n4HT7xXG8FftmJ5w4l8H4Q/u/C32fxt+/As3vh794Tz+1vw8+ceG5fE36tfXtn9kP6/HN7a/C1fqIOf+Bv7fjCXGdirF5TJ54/tgBPk3vHji/OT/xhMaXnY0fn548chvTFhSOHxxfmD68emHp+dv9YMTOWzWC0d0g7src7MTN2ME3g30PxgeW94dGTac/o/XtbzcrR1IHlZ//BNvxpQwHbBqIm37CU9r9ZjWY5/AnIo3i2AKkxWogeZK+1nPVIkj3W5WoUk4+v7iniKU2E+zEaVvNdTMTWwb9rdCmkAVGBRcut9/68dfn+k4//04ZIpEhmApX9jyVNFxwpLI58ZRK5mapxCugOGtM2lNy/V+SJQe2vkmsjh77TG14fNW3tGm9T6Mn3yTfu7Pdb7/xl64uLcimQylppkmaTluPkiJdoHMpPdNeijWQJSNYiWyMdDdzg+jjyycdtCurKhnloJcrBhhO0B6bYiVnK14qYBBUfJNDsl73Ne+ySOc35s6jnv3xD7uJuRB2KM4BnFQk95SghIJ+vy4mgzkZqw7q2I18te91ypdYNuI0dxrafwtHThXeoyllke9y27dKspMD03KE8Ui28hGvDdiqO1lvf2E5F1xA8LeCYoKi+NPWkTMbFSMsFEc1w/0wSvtInKbt0ORsVicMyBN0Kfx3DgiAULaUsjS5b8gWoof4Ixvnla4yb89xEghPcjooWt6uK73es3svaBeENckcJeWjL5agEv5lGDaXbwd2o1v99I5LYE7cLcYR/Z3Nw7vzWxUs+JClGnOCLWTEi6YavwwUkLQUYByN1GTDUuoUjgigBkBhBtNY19sTHh4PlhjegUZhwkAYPy9IjX54WunrzpeYFqh9qUfF/n3ovobh7qWhe62gSXOOmbD8A0f/mr1jSrhKHLFQh59MlTZG0MBTOCWhNUccEvCtukbQfJU2IHn9W+Blf+ZZz5mcxpjxdBccjPXjpzODHs8IU4+VyPJMS39922lUvwYUuN0V4+y4NMesZgsH1MO3A/sUFsYetlGyK7V+KlE8xkWEbPe54903B9NEPb9lDV5iMWT1yFRToZqj3lCt482zB/Zr2vzIJntRztknSVaDxgOKbNFFTztghdSLH6FPvIXZfCoWrUyTeTMWKyL9O8MpNDlSbCYHirxjVBqjJgjhZZREmj3sxHvohoTt1CQrI8E/euTd4g63QBECKF581OWAMpdAqj1sSH8nBQddbpIScQNceis+Hh9S/YXUFAGf7c3sRfKt/J7Y3p+bs6CCeFxS7hSnsUhq7m1J5VNFqf42GWa9FqSfmHLTTGrxdvYGBO89+U4WVoqfarAcFDdjA6c530jKsGEmXOeQg2ascU4rCEsICgrzsYD2+zCZ2aWJyirBZt1FCMXw791TCYXHxIiwOsWlzxbHmGyxptCjJdqAI+NB5W299HapwaJ6JAifmA/1TkPI/6Wt/E97H//cDuwoK1T4+rMYR833S4Hh3MQr+rMopv5mslxzKlT8RVcmJkqdri45o41ziKRXLKv7y4qO7nwRblPVlQXytn4h1SOKNIZmtVieW3FLXKdlANZ3WM4YaLyWkI/oKqrAxaDqhR6UbB89ew4srgXw2YyVXu/lNRpAenH+ZdFkh0obilFHlTxGsEHWAcsgiD9uLVB00QC724xZA9VVfsP5nGd8GwK+GY7LwZ1ST8SuuBDoc1hlf4wg8i9UAnP3enXDQlJAY7s4LDKkkdA8lebxtNutFZNFPIwsrIBUITlwCUGH8vXfPaWAUiNw3AwNK1DHBNcTmkJbId9sQ7KKOOxy5/rptii9HHqlHwrrRhRTEQA6z8z8rOZFO03y3cHrIwa0xD0igxPz9ujd/F+V5Wrfni/xujxt3+QzbCck7olCngTjjzxY5U4i8FBvC3efzqNsTLka97aCwD9PZM0PLFK2JAqbPcIgHx4HldHxVUehi5xee45fOx1l/rkJbVnbQlit2+hBpUQFhWXP1SQ8LORmpmRVRJmRrQpnFCSlTFbHESSOhGOEkBC852KRDgbjgJIWAs7dsvefpPeNd4eIdAy/sCLTDsiMVHjjo9gqfOzvEZjsO23GRwj4GbKPlF0Nu1PGglvsd1YvEEAoXGLJ+juvbyVNVmKmAifLcU4VLcwyaIzq2Apkd0ngpxNm902Cmu2xCJUwLnQ2F6TRNiVtRVR7CsQ+V/dxt5Hbztpt2daN2e/SOwq00ZqRtaULAgWaov6ytjmkLODbdUBygBHjvwhCakIKH2jg+sF+0ZSvi3WcEJR8m4ztouJ1tQrp53vOUr1DTgIoGtNmTS0slmUKGpMzTJU8TK2kJqwuAPHkS4qhSdWEIGbKLglfDTtUqCunIClEAzyHF6tA3p1YdTndK1Z0fRKU69MEpVHdCZ3Xq/3hmtDoVF8rJk1ygOPk/nvk5bWqSmPWUYmql6HhM76w7AyG4bUOgYHxsTvDG/LRWS7Mkr2Qw30pUj/yBTMYvkgritJJa+ZXSTcaeRvjEek2zYjKA1uAAJfhGdZHNO2MJFA4N7TnJVgkNhm6XsN5pQ9J8MyAz61AbkiCf2G6f2xTbBFtMvpTcdJsM2HWkukSxf0NLZh113pJTNMu7fGGlJ2HWc5nDnvYd63rSdZ70kXSQ7xLffl9R0DTXkgB3j6g8/bK4LHgp5sLs/ML83GG5GfMQ/hbmDy7LnZgd+PvswvyBNvyMvRMTfvvgV4dfA34zC/N7j+KdmNON/WPHF/BWzPmp5/Hv1ML8pDoK/8xPPH98cWEim56anID/lyfG8AmeyQh+Ik3GO/GzB5aXDh5oH3x2f6t54HfjY5BBw2+G86LN/t5p/E3hb7L4WU3mano4gkpJQIK9Vm6bgIQYI1Qd5psIxKgCPWQhd/8r/Ir5a9BhpMRS+vloTR/GC19cIhtiJhhBBI2ukCDd+2brbdj2XrLeuAx6w8RklyHmniiVTVSh2RwOTq/bVfusLs4DEl0cgRlhUJfhQuHgvKE1XYZCCyWjatLmzmzeXuazogXOXte2knZDCTVw75vBazecYW8Ily3i+9d914TgYSMhW/es1t+M+5uTQ2hwjBb0kXT9yrnhrR553MSz+tZKFOBGzoNnGDWrsej2NyO8pWVlnE0eKEEXfH29/c533GcaucnFIcta2vvZpvbJH9ksJiXlGqqcOlH/6j5y+YYUWLpoqdWL4v2ek0nb9RLNY3j8WgoIe8omOGYp8nAobtqLDEasYeIU9nTs2EaiYxDX0wj911OM86ciiaRrKBeMaCaZUP+dxnKvj9Sg5BsaxWC8Zv4oiZwLecWUpH+snkKKogkZOtOSVT3dJHjmybt3tl49txt6eMGV2gUt9NvljyOwwvA9dV4ShaKI7R41NmZD5wfBhhica4yMDdpXxr+gozDXbh0lNfydjsJcu3fUncR31ODMZd9RVDmrrAUNWvnjHjKseV7tPYJy0K04V7WsOKrZrzjXXpWZpo2QHrZwQxdxmfOXavuU/+CSsW3LddZwImTq96vMvl84A72+9eG1EcA1a7SGITut1hBgVm1VgHrtlgUrmi0GazVbCmcHBUxQ9YwCINB8YXXdOhEqnEhNCVK8ZNyUUqIUJLPsWxQKlW9iv/whTqbP5dpKEGQyulISj60IGo1aUed0uhSWqiNVp03GvAyWbgGwqYbz8gFX/xaFByLoZH18j0HvpJ7htlQh26yUFHO/wAI62Jec+XO4L3F7yS5L9iXs0jc/dPtSCN3tTSHk9VL3yFQqBGtzOph2j+rfiK35pINM1O3S4MFNBu3N6fIUdWR471QOHUb2iYeCrRHP5aCFwE4VUW+PvSyQT5tActKJLcAGlhjvh25cM1FX62fdMsKjJT6DsP7suGd+cXHr1dODD/68A5vFIQwmnYkfmuLaHA4k7h0lhgzzwFBu+9MPDCSo3qTi1gZjBhLntLX7L23Ua45rTF5rFmAjyFysa3Lfa5LyuUdrJzYFGtwYuY2P9kLU46O43xCycenC49vnhvCgyL1ynOGQgIdGcKLhcUi0P9UYhUX1hMOjwZI/4zCEgGycFrTbNz1Q2TQLMmnN0qaueYB02CmckLXY3ZDmnjtvTztDaG2g8BxBvALSRGWiV/kEewd4KJPQRaIjcdAdOtI0/atxFKBC4R+uMSJOW0LebciU0SlZhlbQmdghAk/kjs27EYGPp+0EK1h9LNvBvUo7L3xv21mBAFOw3DsKCl5OHcfYIaW9DDmEqaWchRujxeFxe6uwRUBugibwct5Avhvr/TsYTR9AFCqYsiC6whLG0O4OiWCmE2BXmLalHK9Cc8UZF5xwI+Y5+vx0wom+9a6b6DuxGh+NDZ1Z7MADb6fHkD6HKzigkb3WNjqOeHsxGnSX2GnGwSGgYVYdDoiJcJ1iIO4bmBu2grCM/VIwyo++d2f3nbQGDYmk5mk5gavxvjQEItEYn1BHIaxGine1myiEWZUolpxEAWDDZkz/2lb0b7SlAdsP3nM1cfg/iWJHFUgcMVxRrKuk0k7G2DVui5WmQuGtIkQF4lNFOHNy2fDmN17d9sYrgsl4RTAar4pEThwS/dm0kzTOWRmDHuhDleXfnd+fHMVIT+5koCeHmfmFkHd3fPtoVnkkazyCIx7mgw+GbK9jeYd5wwpTWGEEfX0Br+n4PcfsCftm+Tp+nfJ8nOPgdjAyQyxMlXfxXMtEhT9yrNFO/mSYJwk5kWFeoMIGjOQBFFDaFWpXZeet7j4gRaM7f2PHjvt8ZaN3W/zODW/nXrdjf9u5tT1f3Vfdljq8z4zcYHZsKbttY24HE6PxVfL6lmp3EGlK1EYyDdW8HixwS4pH0OEqAasHBEzvSoYdBbY1uUqkuBAZW4jz71Qn27ke/TdyDHl+WKU84rtTK4/65lTLoz+KennER6diHo0Rq5n/+y5qZrt40XAXuuvkf/85RXOJ+tCai4KNf3VLgrC00rLNClxUmbAryjqXsAkYqYWsX01R0iQkq1v/qsoWBq2hOpwxrcTJLkLrWjSBBcaBQ1fHrPZ17wDVrAfxVqDfYlNuDKVQQ8qeDbmCGJZZkAAYJdC60n2nYDbuXVPwGLx0EZI4/AoANmrZv2aJbsMb2bVCbSBZyQvQMEKH22yWSoosQ2+pWk5Vi+qg9dEjJCWKi1pWeBNmj4x3U9UmfX5hExBDhW8SBwc13GbFvmMQdrw9s8eGvg5Xa/dbNmwXiUaZG0uviu74bFLn2N6jpnHQoAY8UZU93dL2fkmrmbZD7wfZj2Vl0NzgBGPge9v3sXSh9JfvKekF296gpT0JcsLoIrK/RFmOsWPw103jun3e7R1/K/jr+m8r3RSj2Dwf5h3+QZ44fIf/l5+nQlSQCmPsmsmJQwcnJ56ZHpvdOzYxN3t44gj+5vA3+/upsWcnD/4O/p04hIrzUb9hZfrM1Nhvd1emk5aXuE80c0EbNL5TkS6PYmd5ijqC9uCTPsScFEhNjQWonDKAcJ7mynLXZVvCQVIgUb7HZOv8R4OL72JYUuueSLFEqcIUXX6OsLsUA3cJEtTYZpqUTApd9ku+clFgANfaEscYhvLo7mfWPSaFjW41MSheFRiwgo487eXVq6aNIrL9gBd42wutsZzBgsF3X7BIzFoEH+0Xvvb6b+fLFkaUbtPd16S0KDgsOSoW3nzx8embg0t/GnyyOThzq4IcdKtxd0wCUnvgfXkhxELTBYCcBVa9Wc5J62JQqvrp/XI9whtKhiG+/9nW969VwKV0ASdqfI1ux6ysSjqQivp99KerS5DR/ldpwTmBg8v5au9cr2Yg5SWdsijHrcM2ctK5AP7bTY6WcuG7rTf/AnAfX2cFYJm28J4mAc8W6BxYhuaUICDCNBmlogTPKIj9OWfPQ/DWvrQCm61MA9gw2TP0UU4iNCdWse64YQThEmNHa2RP+jfIyktunPeTAGNRi1cqWlsDxQlmQaeDnqGGFNIdvjedJ8JPp2Ei4IlSMA/sbe9vXN6+9kCmwScXh3CEvVodDlHD608Pe0xIn8NZPPiOWWPLyYevY0TWO70qxK07d7bu3g3AYU2qY+iSRmQdxaMfj0ISTCXn3I5c6W2zJnyS1hEjTUgi2GupBd3eiP52viagk7/x5e+Pr5/fev02wN5691o4FXy940OzwaOhhyZEgPbBoTlB+CzwnGC1TgULmBSo2fFYWIddslBfZVnfOu7ShGgZVF3sD514aQqsanM48ObFHsjX0iSPiv1uIaJD7bB7LyxFvLOq6uFrsiarFVNSDzBOKCY1TIqfKExWzGtEsGPL7Nv4FZWNqPGQj4DiFC/SRsxq7MDlGHUt5Mi8sQOzwZnvti6fGoGZqpsmI7VKIjojhYF+Vknt6T4wPniTDtqeMzJShDAp6CJZl51xkU0CkQlc5gAZ2CkQGe8Y7Ag4XVpLJ0QMO4k6nmDGrAOlSGpkum3zsAW1JaOoqqL5ZNGUDBY/GtDEtFCmsuSV75XAYGs70b01ePHaELpZrUQqhzdMNlSGIS6I7rHxcA12YvSOhgHPUJQj0scaDCjGn7AYlkL6xwc0WGqWCA3SPnRVgJ6d4bgtK6x4ItQELSB9T156DdAagVOsaFdNxMM6wEjTpwLN5eW0IsBJih22ntYBTuh0LUUPu8Pd/h0ggCFOeL77/g9VnDoUmgcV2nj1ahMlR+f6TeNTdOE72iMWiZJ7vSrRE3gQbS7gEnKtOsMO4fkevCRQ6UWehJB7wbIOP91ktxEj/ScuyshD3D279dZ7OLLiqxyi27ETMaf46vn4ML7IYgL/RFkwsCwgfXAHuona0AZvEMs5GjtL2g5HmokFXssdxWnari/ItWcRX74doDu4/Slewu1x1eSSbM+5gbIUedpCJBslsmvoYVEQVSn636ekL8vTrEQdUa/skPLRFijE6Yccv3IQfDlMfEZOF7IcyCX78Z9uD348i8MrjtlUhSL6alet3/0RLjncuG6q8ABcFMntBlAbKhvwAoxHsFAdQ0CrgZRSAWLXX3l885UAMemcgO624/KA75yA6BboPU/fXAcFVDc1XA5yFoWYbUI39TgVO8nTW3Y6h04SUiuu5wh6iSgFMwDEjmOgxr0UqhqhLzGxKPi6VXRVqtOVBQidvgljIJEJYY3yd0SDWRNYl3WFt3EDu7DAFykuwdSxQUTEH/70S1t/fq2CWsKoZTDH6TbXY2T76hAyrKMr2ZtGAz2DjkUjEd1R60RzTSIYGpjFNnuU5hpNx9iqWbIy3TGoJMYpQdeUwh4MHUBTg4fg4YVliRNGZIUd8bdP/enJzXdpeG8HeCMFyMpCdfhqdkKbeqjT/ybumgZTkdzIRclGyrCcUwL9nbFY4UvL4tC/AYBv1SoYPLr7560v3goxwJlFVAKVYTWVE2C6goYoBX5mGpHnhm+pkYuCmEqkPc6QoB87lZI/RB966hCxfGka1yK+NQhbSESBbwtiykDW5X89RXfanLU25oDaIZpuZAfD7oSCDrFdwPnpiQAFMYUR/0IBDdS0QA+a0M2Q7HmY5wzAX/th68s3kevyGMQGeoT9Ai0zhwpTg8E958i+N2NXPNZRKuEEMYD1An+uKd6PXPlUu6JdIgswu5DQOJ4QGA5UO18R5FhOfPLB69t3L+KwiZzoMBO9ypFKKB6Llvs4FKrH4rVLYUbMBfSxuST+HZ2FIYoeva13L2zdfTFAL+1fz3he5fZ6IWevBbsjX6eTyVhSLHlrsGW/phvus9xD5Ga8zdJG8wzbhZDWRbP/RXtHEezkQs7E/B+vKvrkPBGNc0NIjtoiLXqe6JO4yTTfIjd6V3SI/Z0d0fq3uB3RIlZk6BkT8NpGo9EB0VneoYXu5wYdyZj+4yHIKhNjqCCtUv8MOpnL5+hy1s7dBpCpUj4lDy+UjSrbjdvAh7cdx+3udEdsmjS8/c8S056MdrF4FJyaNJAmRc1vNGQFGVroEZZN3ie41l1MIy3WtMKdmSSplidHmEtSeLqgTXRe+NJQmxJFVBX4WZOxXSQy4UpIsd/K0B5k5wamGiYm9kOViTpgNy66o9Nylj3Zud78kXlwL7yIBzshccALLzyoq5wmchSNJd9kLYKTBymyimN2BCRIKcTsBPfKdZB17XB0OJxCFO+O436xBw+9tNlPkS+vaxDQh5caVDfxyLiP+BrlkNbUn+JZOWmr43SuTA4/CD3dsue3hNxndIQ78hRWNIDTVum3EGj5JFF5PlmuI/YKPJbJ9ov0tc9LWPutduy4xBjy2qhhPdSs0z2NW4UTHSRbbq6i1hlW6BwTHck5qxo5ZjUiC66oqD9GKD7mAnXHXKDlmLOqDV+JVSHsVB5M/bJoX8Py9pCk7cVoK7G6qvg5kJyHxc9RgmcgZnoJzgtsthZfw5A8thDKMhWZJRRObDUigYRykhMdkMd33Lzj210z+FbtQGAQNlzYXsviCivrW79iG+751APC4llWjiaWLyOMWpVFO8SsjzA7zN34Vq3ZgfJcy7hlA+x2b3d2B+aW7dFwyz4kG5/d4+xmZkvZrTTYq4K9yVJ7T8oDUh1MLjevAtp7wBNcS2SlsJBTT9CqpOwQ0zD6Q36qSGgswpx7xD0fTDHwXJKzD9/ysfO7v+NjxDd/w8fIj/Z+j50f/e0eIzHio9I/7HJUKucLJ09Skc7JP+x+VIqnXknZI+cbjktUN+EbRq3jQzB6tKF1oNgymfen5QY8tzguDoc+CtJUUq6kHedvUi6XPfcK+el2ZHmFsh2DlyAH74nGY9gNPqvDJx/Zp14umQwvCCHcFDnCBAkpOcvACqSbJVyypgNCGM4gDfKUS+Wae5fLR9aCJEPtUU2TuySM2gm4rgRJ2Cd0BOyTyjUKeeQT6Ch2Geazw2iZ4AUpgI9Ry6YXgJKO9Un8oFt8rrnEr3RKKU5JlfEjDx4/KH5AbF/bd99/YQeFHRF2gH8OsR9G8hedYbZbzTn8TU4c6sAvWZg/Mos/m27w18Zfa46jEx2dGjtscx2Zfe64feb32nH4PRemLeJvAX/zs1BLE/4eGd/fnBzTB8aTDp49ju/vTI4d2P+7qTH4++zMFEYlWhkfH/u580l4bU+OOpuMFUxfDGFi6v3b9UyTfgBNghqqkzZq6FdcNzY9yIxpS5Q3p8866sXLWh+Xq+NR0rnXE08Ya+Lz8o3tB5cGr91wkYC4NoxiT1fgyb2ehlM5hIq9UnY4LyUCQAwwAawtbbS3+HKDCtCtW1dxz/ZArQ0NVbhQNaMR0OqgB6issSMlEkCxpDEYmQAvLbDHPq9cfvzJXx/dFRt8sQDyYLwRUAUMmwFZaB4IC2IOiPNytmBeDrtQYkMDEyyqBteyjmh0OcwN6rvmfONYey9ahx6eAWLDchAFCAcb/EeOEfpfL0emv9lhfwe8TRVZTVyojzfvb319deuda49+uDz47tpozPDWBqCkJN8GmGXIf6hVJbEJiK3FQCuaHECw2JItFSK2DHshM401G8dpJ1oXb0M/jUQLj6LwuAWvfoEXmj+NRD9F1aNUx7eM9u/NBr2FUkWT5Dgq078zxaW4EEdLSlvo9gIMBYXxwBtU0Sq4/3XHm0C+8dngwvdbl286Q8gKSmi82ikj1U70YogUO79VUSHjVboQtpVQFKMjAUJkxYoBk8g4XDwN7vequDy4ufXCuRCX/6e1q+2N4rrCf2WUL5GQUKukidR8qbDBJikbDCZ2yRdr7J1dj9md2e7umNgVEihJgSYttChtwTTBCYQ6BNKUhBCShg+bKH+ENfAvep/nnPsys2unHyqtWfbOnXvOfT0v97wYVqaxN9ZwDbi2QFYTcUK36TfTOqcGgasQLjZL2kb+7XSKXuSCWtVdZk6ZR8jw0pLELQgm1cypYRbsWmPmy3BubcZjh7KZ1OEfrsmetjuNOfNWKZwh6Bc0DmFHRK5qdqv6Zu2IXnt2iqU81Dgo5qICRwrlRadxIMqaQ7Et+oYQxeHDy9tXT4co6l6gu0w9pd+LDcRktwKt7SKHpkZlCt+0OEqEJs5xD0Ga14CaxmkSjChAFxoWxKJkRGiDj7Uy/j+dTwLEh2CAq6NaAULpJvaZiMVOFhip0M2BWhfDj2xwh9erWpHXSJn4jSZZZmphnK18aYbm6xVucWjummqh/PT6xSdnrsDj6uoH23/XAADIeQOlK9vdbyVuxhCC5lxwYPQZyZwT1EzatC3xkLn8YGQ+Anp4597w6j/LoM0MLQ42exHTySLmlxj5p+0uW0ewG1jcDLY0VJ2ZgW6TNhC6W2wDrUQbUDt/24LBC2r2WWwXURt2kqQ1q3GlVxCCg9fOGjm3hPCTm+e3z/7l8T82jVQ2HucewlpQ62UxbRFEJ1+eLSMnNZfEaTBEKqj+/SVVH0FzNYLM5t+ent4oY6Jb1pwScvKoOjdlWGRDtYsgjLvSCfGESFJ1sEq7U0BizZzdM+JMtsxlgzAhIfRH314xy8ZImwF0REaGF2sEBOjQiPhtCnxOA0RlElGwEwkC9HhZbiLPDYFrVkkG4fjTyVGwhhhdroC1nUbwXfQ6X0yWeEmS1ovELPittVgyzq8mxQoNY+Km2Y+UEw3QXrdYPsaEBqkp7SfTNPpWEmgOzwbE5PLIf/mWoYXDC382YvMueCA7WaeH2FFRTErIpPKCFJ8NvnCB3Vqa8dmi6N5tmcX/cgVR91A9RHmpgVWiqhZQywrKTy9/OHz3G3jTjEWZkZBwjd6VMPWYM8OStmFzwAIo4Je6g62UR7stBVJJVk/mSXsSO3uGySlg18MQxiEWYHKunn90/3y4aGSXX4sCXI4QhbS9F2d4J44UnZoLBOiWkGIlloBQ6MFw3aFlAzDDvGUEGca6eaeMjOIwuImsABgPve1L69D1F8H9HzTovLj3RQRbcIa0hCkkeAsIbVppCX323pPTbz568O4uwOMWdU8ONu7lJ0ugcd8wWYbc0yJEBNKNNAr7O7ONxsL2TEs++CjNCt1GoOIZ9FRiaecYEqhftZLnQXARk3CueHjINd+tterpMfwW5H1XFDyzKyhU+VxBIh/DB41hbasoCGdbQcEKLEXIVTALm33EH8KtMl6Qa1IMOlU3hRYf3f/EaqiSFcaSQhQ15TB/ZbioPNvbw60SbUOx6+XJGqJdieke4k8dYbQs07XcMk42wN2PF1d8j6z5mLoSnL0mSAyvb9GnYGw+au2S+pzY7lqnE/eYbifscuCCGsikVWnUN+Za0QYCacyJYaqt7A8eYHg0dG13tWCimRX7O19EnEczJDIW2tiIuLKLoBIIAlUhwHP8tBD1vP0OXP2srshDugwPubWn0dTt+yP8665D43hffSXgqTzD5Qsdg1Vlq8YxVLOWI/FcyGzAd/C+tMJf7MRZzHqGYs7xEXOOe9Azt7TbdyLXR5QevmJp3ysBpWPPKkf2TsTriKdZtZBa1UIiZYPql/mJHY7/Y3ry1uyBW/PnrMbZL3dxp9P0JxdLGZ2R48hrIWbtmpmVNTMfHj/u2BnVc6Mq09itxfurOu7KM6ffrpY73fboA9VrVx44nfYodNFnv7iDPhubYWGhkS8sQFex8OLO6uwiR+LjDlximFgY30VO5eY6gi9RcdnIi3X8xP5qQLW6nkskMlW0aiGDqKTMRm2VzPxdaBj8pvm/xJGiZ4+WUOma4ZN0PDSW0E8mQY7s8D0U4SUjaxs5yerakxNSIFxPXcuT4g1RBdflWExXzEcC9ot6V0oY2i1pigdjKyuWUWwKZBji5aKZS/9ceyilhFhkMhb09lnCb77UTaQ4acV1Dg6KRFl+AoGpinaBJYIvcxitKLpxO24rJBkHFKB8MV7MJX4WhyAtllHEMMNdF+ZK2ijMr6Iv5QxMFdugV8gftJJKYhc736VZtRPop8tNjk6FG3cdZjemOoJ2wHRodCi0o9pB7Y9DXgbvf1J7L74+P3f8tWOz5u+o/v+Ifs/o92H9fhXf9s/8PqTfv9bvV/T75fm5+m+CetP6PTU/t8LyJfm9f2lxfi5+7dikKa8vLb4+Z/7mk/j4seOvrU7vOXwQUa6en3juIDTeP59YO/rynsMTJ82/M+Z3odGyfmv+cvPXRuSsyYmjqNucSI7ypQOTE/GB/RPHD0/vmZze87OpPb+c2iNKdQmQNTbBdDNtx8xFywmnhIaSfiL5cUX1JbXWmLE2daWG9MBios4MpkjZ3CIPSqEDSWc7PFQztRO88M721Xe2zxmp8d8uo3ICgYw2fiRdArFh9RsoXpXgAcLvKvAGQzHblyzoLlleLbSAIQGRhSDcJ1/+SxUreYcxXBhrtU0r3HYb8Vzo4pHuo0qFdRA50VZppIb3QjBWCed0cZ39SyUE0O2Lw4+/eXzucwFgWl7PlyI2okERemmxFAEMo9Zk6VL4vHcihxKiIdYPNFQBQ6UwIDneuD08c0WgKEOR0mJKTPFoAyVBxaRcLe/M3Cz2DPuvJnc/3GoII74OeYiexNdvPbp/bnjjP+ouLsx+PzIMfsSmGGvFcvxGIFqN2D51jar8RAR0W70tekbD+Z+ETNxL8mYkSBysSAIeFycGCDISNPXuar4aIfJOv2UmPO9LYi4kTAL0Ns382ntN07S4RLyvRYlCTnfhbp+SX9xGhaYRx8iDDO52MF0nfSDy4dbvh9f/uv3m3QpQ6NPiUF/gwTWjdfqhzJXAJvYlYEBVQYKEWVHvWYuD1RBQEecwUc/oO/cEEx9iA05B7WjwBTDKg+XeSvQRMOooRjDn6ab5qlNh2PdzQbAVbhhD7PlSK9ZK9oGoWoiWjcb09qcGKRuNCS7s1j4qwI8WNddEET0Gu2lGKx191aIm13QMJhxVUKsFfjkeOe+WQ+zCmcOWjqHP21eZsm6SNfmAT8LVglC89g07VWuZr5vi5kP+MScajVPvmc/Ty5+UdjoQmAs3enl56nZXuIfcjheI06VN7yD6bU+Q0lFdEIk7M4Nl0HWlft5Hpt3+HmytQSnHPegm/PG5r8xn++rGmDmvzvUuU7zj1E4HM6oIuOkU2H5UBx+1uZG6xQ+XcKuQ9hPe+Bn2M253k4NiMNZDpsJWvy8KMzPoEf9x+Qw+/hofm8+gkTeoAWCebajSASQlJahpdJWsicx7sPfzcDsR16KRF9KWaAU+NydRIrcJ6KC83S/UfaqK1bXo+40TkcOOA/358MJngp01RzILyfYZYwuzQ+1zbuHlQdeX+3l30UMZfAqD0brv+bcf4GN7bkQxIC5nGk93Nwa5DEIhmj0xrSUFjlejAJFOJNISVjHbasm5380zcx7n4UjQyrbnCIDFFd6RRX7cWt/arDXEW4xvQQSIty6DFj1IdJ5kMSRM1q1rqUuD87i6IOjLRnfKDVy64R9J0jC8eRGf6zdt+0q/yoCCBeEIn64G2UOyGpT4hTho/3ukf4pM1+ByWJxenTrbosWso9CUCGLWns0iU10P5W6PLgbf70sGiPnTXl+6gY/2ushBqGD8UAFkl4CR2EHITWPP9qIAclMXwOCuNhCioT2vJ3CtNC+Xpl0GAAEYf7i1LA7eiqE63m5defzNJUFTIzrb/CY0A87ieipu3JLlhBezGdPSMGv5jIY5STPNndy1L5iHkvGkAc8+g7ZhEk8w10y6jmMI1ypNeHKJzsfwV7e3nm5+9/jtm+G2MXvBjNBq5NES161gr/Qzcy579A5VN0oWr0YOxUOlPWKGStGcrG4NwdHvDeJn125qGFbyfFilDRdWNl5Jl5mMZUI2xHKzMCyNcoBIEf3jlcyxf289HN64a9m/WOcVbWu8WrsSIoEhN6m2GgEdCmZdPTYJcr81vIYdbKRwAfLWmeHZBwLYrndaCzAxFf6rjOwKXezZC2Sd0Q6YIUFbFn8zIGhJ8C8SM9zIicMWD4vKh/s1YsN6QZ4uoRKMRACC+6VTIKk2OEX4iefqEAwfcbCK0LISrK7W6zefvvdQQMtqRWz5zXoRM4ESfZFxidUTf/U+XL8lbhe9d0xfeir6yDpBCB+kdiHtNB2o4wnXyNqy4X5huQRvZSegISntiShTdyxzZH3NYOgPvhqeubH92R8fn7unWKGdgtYxGZNSOLBmqa4n5tyWUoVYkI+vVGWacVtTgTGY5grdH6nwIsjt9z4d3lYvQnOY8JYaBAsTUCzl3KIZhHfcW8OvUuLRDTZZlfWWepzsdl6LkOkdO1VihH5/ph3hD5PObfrxOfPZPv9diQUj2FrAgwFczXNfAFVznJdkbPBcl8LwPBdhCA8UdxDfSEhnUjRJbllm2O2kI4a8m/htxq8dM2RiHb6tGuzq2mKEP15sk/TfN5/hBZuHlmn06so6AdaMRNhHkgWkmsEJIoV5n4n1zBIFuBlJ1r4IlqMuYXgtZ3Ub18UC1nPLG+8LZE1q0xrcpihNITimY1tslnBFyrISOcdRpW+Rib2UtSbFRjRWOStDdijKOVikQd6nRw8eQNR5+KWVuBwa4pJkr7Es2KQeXng58T+48OJjM1BrViuBW3KkN+lHDgtctpkJ3fhQwAe2FQfKNhWnnSnFAWdCsY+ifity9hNYIWffFaMJ31R4tZz3RUSkUdpR2ybsx+T6He3yLMMVsYiDt6lTw8WwaXfj/fE3RaGOBnf4QvZKKplADRPoXgKti9dIWE2EKxDlg1c5VJUNNVE01KySoeb0CwdLqgWnVVDtuUqKVkBqlWTEUEaSUgpJoTQWCINWbHaS+4iwvIOIPF2VifeNCsK1kgjspF8nX5bVAE7r4FGdDsVFJyk6sa0srU1bKc1jMu2lMieKyRiWxJUxMpGw4CNssOe3Q9EjFDrKMsAYySNk7kNOM2jase+7Mu6wFRrciclHz+7MuVteMeSQf4I31oaJ+NQuzLFr2nGeAcOpjN2kTaRns+e9qinzJj3H6PhEx4dN6ZE1JdzXQc937fcsl+O2HNMzJQzPlDA71I+R83C8RonFkH0fnACGapeLPC8QcAGGKtaU9NaU3taEyHrC6kiqI3czQuFmlLLNCEXzxMyRsfAUn3In95SjFlOWPkyFdMGRAnuATtqDWEI7NyV7aptfNoAzao84j9CxqGaP/6rrSPWpdxwZeeLdRsY8sk4j1UfeZWQMHnLB9sJODiN8o72wINRz4QW9YXPgXhI38lbPnAzH+q0ibiAy5KlTcLSRLs6YOmtxq0Nl/gsvPfOGkU5TpocJBuEUlg4Wd3cqrP6LoLodlVNGJoE2zJCDoObzYU07ShbNUs3nyjXZC3GNsf3oP8Nso8EUuRnxE+DH2+fH0dHE9GftopVPcjgl9VbHHKOrCW812/GrfVzzGEwkNzl+yaDXzH8XFp753X8BZgqMcw==";
@@ -1,2 +1,2 @@
 // Obfuscated production version (zlib + base64)
-export const w="eNq0vWuTFEeSLvxXyubDqy8rs92d3bOXb01fdFmQeugeZGvHjmHZVdnVCVWVrcoqoDm2ZjASEiAhkECjC2gGJDSiJS5CIAkaAWanGNP/WKOqm3/xPn6NyKxqXWfNZkRXZKZ7RGaE++Me7h7/9V//5//8Jj+UJUtTv/m73xT9vCjSxtPZNH7k+6TxYN5Kd+DfzqOj2VJtcDE7VMsGFw+jZevB3cd33hheuPKb//13SiWp5Y1OstJ6MaZWr/U6SaObNNNurTOrpOXObrZLWSzVmp1sf57vJFaDi/trgR9aNi+8IdyYVdLO6tLf0N1kKet2qTE9kHO/5fkmaK0UpR6ftB4TmVrSTVZLnd6mz0w/7jTxSSZ3WphG3T7J/NJeN+/U8hdwoUF/9bm73NhKhcsK/0pXerXOcz6G7NH5pWgEwzffsxEoxalJFKdK5PLFMrlm5/u3DgZ6D44ovSLNpYf4q58/1aoJRWq2PuLHwWoXH30Rz4qtTx+GHtKjeMnzEc3BkUB0KqYY9ZIoRp0kktrJVr/Ql4g/eMRd/BHeIKZdtXudwaVO/AZP+RtkYlNjxKZKlKJuMaX45Z0qvbyWv7x4mNGrS9Jq35qdv55qlCbohfjlgWL0+spUp2KSUSeFZNRLoum97KTtVlLnOUt/p/ajdGWtZX8NrjYwrcMMHF74cnThqnWxSLt5I+nmtCIO9fFIq1ak9FjhdAv7ozNY79aMHH4/3tgQYiI/Gnmvls5Qr/p5j1Yl/yhS/rtI/HIXK6+G7tXaeXdOOzi40gTlw+jjpZb0cXjm1a3XPx999OmvI542akqflvOHrwplG3rS7GO8Of5HBNr4EN1+Pe/OR3wOpyxFdle5dfPVmkmSbrpycA2c01osSwZ3V+q1fHCxIYJkePnV4fEvmfPgWsLPd5NGh6dsii+XdzGoBfqVdLJ2QjKx0ennkFn7W8lL+NX//p3DJaJbX38ZEcV3hKzLZQnkPVkLaEMrTzQmRn9kg/WDtf5fT60c9ilx/vbw7Ss2JX4yoZSmvdHS18uU9JMlLaEyWO8NbtdrWArdPg2Qr7SEQhatUIjdS6vWp9F7R10z/UJKj75YE0KP78jaKQaXuj2+uzu4AnUgc4ga+a9GJ1thVdkffLXi7+bMW/5ikn6dJ0I3bflfjRQTpsc/9teTpdpq2lswEoOr/Z6QeHIkrN7uci1hIdNJDjBfbRRx0Mnxp4iXwaXsZe/GiVNBqggNFyugk0CwFN10z0RqQbowRcye/ULxyUcXRZH2srSbNUw0ZXlX/05W6pjcjVoieqS30sy6gRzGuMYac5XInb41PHr6V5Mj1cuIgeideVvoNbpp/2UITCG4Uu8nTSWIK1n/5cOZk1zG3HCK37/TPxw6+O1fvIO/imDoIihqF38aBIvBVxV5/bSHvz+zJs8+vvfpT4dSZRBVQVA/9WljfdJZd/M5lhFp1sXCPOTKLcHbXbZF2eu/yDLn4kGfypf/6Px/BonBXVZhpBGfvHIFROTddTHdZyIancxo+CWiwSsqG1xxGDF87Zi/f7qxMUbjotFoxDSkG1c62o3XjqkuaZHy6DFKONRPa1lbFmeRt6IrbZpJzU7elvfKMnhw7WV+r9eGx76R7mRpm5ZDmrUy+iPPGtyQthoN1jf64KMvVuRzXnt8F7j6f//7bwqAyJfS1mo7OZT+5u/+D4nyrJsudzLqCGRTJzXwTn3Je728bBi4TSD9WM17rAiTFcfP+GO1BFQUKFdRsgJaQ7MKZV8oYVhHrwFoGsY0eCm/X4pBpcNJg3+C/QT4KepbKME9B3oBkwld5SIgbLaMvhx3yefNCBnxN9A/Cv+rirMcYm0HMgK4qGIK/j6OJmYDNnJI9DehGUGIcfyQiGJnzZ9Emj+ZDCEcPbimdjWt+lkWz4JpZdHIQR0nQR0npo0TUaamikWFRrrPlJ5rO1V1c6bjRL3FyijSRBeDJlIltFu1j6idkopw/RArB9ELO1UhiCYIkpy/xvbLTRfaT1plvr5scUFg0mCLbr7CvWc5mYyJWpGyP1+4qWAzqfYTJZEIoUgCYfC/+bv/kh+1Tp71eIn8+29SrO1mH4KAZ2n16kpdP+X4lSLrJKvFNpdaTX7RY5c62Vonm8gJ/QDUwwT97T//O020Vdxw8Df/998xWTC+/yvDOLh3rz7S2vvbf977W1AiZwsmXAJsA1sB36KZ1PgFQj60u3kxWJd51klaaSPB96d7VvSeTl47CGMeOH/Z8OH3Z+okQm/VZYaPrl1+fM/n+c/gMrjWf3kiFwDQlZqxos/03YfCJ5iSrCJAy9YUJEffFlZ8ca0FdJIdSLurDiRJXB6KAeqx48GsxFO1tCh45THhWo//liv5PlmSmM7wHDWyhD7uX0/1gTMi2iSEb9wWyjoh64NrnazGGqXXX8KrqHFv82w1q3cymFAsqODV6XSyJkizsU4L9q9frNDLfnTUbfXh8Y+G9886CHDSodvGQLseM7ERlDn1kvJYAlMdCrPc/gujrYML+M41ksEZy3Feqz99UnUefbEvnlWP7538wVn1K3mGKUaMfY6B6//sMNk7Eo8TDpJonGwhlV2DMgtBuBtMeueXZPVkJfIONpJ0Zcw7GBirSc9cVcz2e/3lGrA6rPhuulrMssilNhgQcCJgwGx66o0tGp/elup9K+RVWMZkE3NfLMguzZ/zDZUQ7326ee2EQpJ8FS8PBkMGhkvwdBV5G8Cglcwx+Ep6taLfWsV4nz6ctgSMptI8uNSuCSwlU2wpeZYN2R4snl5WA4xYYpfDos9iWi81645O5NdOSXfkfXdX2+y6KAAb9gE50NjoN5R5Cv8cLCi6g0FAsZYcxPJptbKXApT9/gzY0Eyi93rv+PCzNzCL5L22ixS9rTmLtD34vE3vVHlRN3FT1i6zSduJ+AOYH714eANqg41uLWLJiuvI8C9/EJ6lD/lC/P2KTjJT+nadyndT7Xmpxas92+dejI8+HX75WjA0fjFtXmYRA1loQj4Ic/qPOCboVzutD9Z3myyn/2Ryca3l93UGV/fRm3df0NbDt0cXjsS+BqUKbNiAbqi/GFOHP3AdbdwYc4lvVm7d2lrR36EwsF1zxjSzH34gbH/lbMLK7JML4ft31mw2bT28MPryjs0mfrBQwdCGcFmM2eBfLN52ljwFZ+Lz/BGIT8G+Oow1sSfI1UcrtZ+v1WAlMxA8w5ZlLeoCfaL7FzeP35Q+mCHRJpd+AcWK4eQrtfYs2xDSCnY9+f5kX/idJAmtuZ31anqJ5cngGpYOXum1yHP2zfDurch5hu+ABSTe4bZYYfLV8po6kLV18r34bEs18ifrb/l+ga98QOEqlgS+NkkaiNq8KoTJc1b0V/E22Y1X2aShJ1fqOQAC1kEQxvuLfoN0aySOoVmJ+yWsio74s0bvn35y71VIZRk28RlsrKbd6RLX6YjLlJCesbcYEZXXKCR9TLAfCLpMVYYhDtLQ8ynrsRjKqqYuLpnNNfrgw+EfTpnZRVTpraaglbHlSu9uUaGFWmzcOyeknWMy3rmVDk3PXN6aKZalPjkG6SWT+knCS+ab7R3r3Z2DSYMVEBirDqLvS5+65Upo9P5bT+69ZUrIGE8Js6lAfUoIzrBVfXY5TBcmx+jrNX7DRE4tLhi13QYwgfo10Qv86GU9qFQmHd3RqiWw2Z/Vt9TN25igXWykqJtznWEX9dvf+ZXh62/aO4dJW68NPqGeMwBJ2BW703nSxBzchkDAOm+JUz7pJIObwpmmNd4ar9W0iB4ud0WQZ221z++zlz7DUgLINvSOffjfSt98MnTEe9XL+p1aslPsTzSCcTefV4NV1z5PicGVNV/5mBKXo90nJnaRPzK0TL2QDRQmTN6DVYFAgfxq9VZhxQsPjpLdrEUPAdUC9htvYnv0xuPv3hbm8imB+FiKJF1eXZjbHRKyxEUmIw0kGVxr0BwM961hAoqHLJMGUnU9Unth9+ry+uYH991/GDGi77jSgrHdXZzIEtstKfQEmTiLY9zp4X32bKkbDZY6MCBpHX7F7t+/nmrWQs9YzF8YfvupdG2yI47Rmvj6s34honyw3l+V94wFfxAAjB2ekbUWmWpkNU0php1SK2rKDKgdZYvMjbGyXfNCZNFMla2ZqXFDZqpkMrm1NBnTz2yH6acmQ/qZEqSfiy0Xt1mY0+H0QA0+6kODW+gmCxO8SKAisMGspTZaIOW7eMmQloQ7+YWSteB2wq8FYxEW/gEUvOgIwpHKVBnyOtoNHWJ3OMl9txXmrANzZYjp6PJvAv8c+VVw0nwFIM1HsEgvCxqaK+Mvh17xprUCCAEdrbTfy8T40Mu0DfqM7l33i9+XwI3jml+i3SuKPWj1ceVr2GWqpIDLundc8f6g/ou1XqTvSkpopqJ7FrdTOYsVPTNb1neu6krDg8x5QSX9CyrWX4jUh2uOicIbH/35idKaFtlaUhbTLqHHvYEYLoRXY6om7jg8vVh1CU6+xf2C21x25+C219VDOPm6uwm37aD4Cv9xG1+hPpbs3ateQ3ove/+x5DHEysv72HmFloHPNa9LMAmae9RM29npAbjWF3Ut4O46vevJd0MKYad6jifCo6NkOG+Ix/vd10Y3/yABBuu1wPVF2e2oBQoS31ELrFgfZdEdK4tsc/LqIx48dW+Ag0zdXr+hURKZ/ZX36t7of6krap3e3282P7vx+O771j+hsRp6l8lv65zSWw2d099R30RfoGMgLXN38BnmSrqc8fykeTNYX5ZfcPBULqV6BS52UXO6qXt98/ydMjW4SWD/wezq/65El3eyqfMszX4Xc+FLPAwSO9MxTwEXGBH2FdpQgiQB8+/fInfhqT7tT/DbGn759vDyh+iNq1xFYOGvqJFEAlQv/z3Y4G30K+LfuP/B8MS6fjV7TP6133CHhWfv8nxikfDul3hYXkQ968HmS0k+UXSKApgV+l3w7O00s1RbyzcPbmo737xST1iCAfocqjEv4HNWZcNrfwHD0bsTGJLvrLs6VeKYdrlRWre5m2/uAIrvLHGkv5wh/isMD7RyfTtQJi2OvslbSWuwoT/gFiPvmAJBVsMMj6ATeNuRVPHrG5vX39NIEafSDQSjVvK22d+8sU/eKaNF2/t3jhgt2oTBthwgVSM7wBMW+8sN8WMW2tLALpdYRdFtyy14NIH8UmtgI3RwjWI2zpI8HZ46Se6v44ogMC9BJ92lUVPrMAKhZARPNWrKgn4t5zXQflbajajG/zBJ1dGrmUi07f/AftMSgVYa9fDIqcd3TtijomFaS/1c/8hLDfwggbqsZY8KUG4lPQAVBbu5OlOkMf4zw8tb6aXNvKeYbPBVk4ELh3fgb4kdGh67OTpyD/+1QSn5Dq1rkQbS0id4my218+nAI178znbymo/4h6XPvHU60XZv3s3SOswEUiNpb4m9KfWkRS4rbJ8CGHd7bMYBtMhVeawrD5E6STul5xrdjKA+Yy76CBIpx7tL+BKbV68OH7w3zn9xnO9imdliicOiQyDjwbD5lLCI6WN7uUkOvknD4zk/YXT20KThQXXiiowPO8zx8DbeHB8eU1oYYztT4bVQZrDgw1MWOjrmUHl7bbK2xoZHm9/w3K9O/nj8zITR9YputqyDY9d29O2OTPx2oDQ/xnW+zGq+RH8uoNera/GXO2JjS0gpNjPSjvngE/YsXkRTE7+LhIikT1Gj3UYKkR2N5MPsvwytL95I1lhwMEFCS2ApeZge3xGQDf/kgYxujtYcMcgIqUgEV3QHFlyd7U5lQExz8h6uvFTRs8bUV5yw1WCI1UiSkikbhG352tpSELAIkQJZVt8IknrygYgkvBh7FBvK/ufgVjah+fu3lo3E6Na7RkKCResZ5Gav1d/lXYobxm5ZI6+t/6K+ORRD7wyKoXeDz0rPya533ICu1n/4Fuq2U0fHjXqRd1ihFJ2MQ4z9d7/Dnt3B3ZfJkyQQ4K17w9dPR53q9pY4ypO41fGrkMgewzzWLDdRD4wSOmCU4HAXfq15iS6Jfmlgm22nICzu5MXAPmtMKZOswX8mbe+NthBPM8XBkp6e5PwxKP67AON/F5D+dLnV8fYvAduCsn8dFBYM/NMR44ZsdFSBG79nhNCQUYt5oQ3l69rq2Mxh2c8HUYadDDU5lBEcs0tB0i7BRc9GaMiBkDraDnMULdTaHI+gLj/ZGhTcIYCjijYUB0xNhBvPlTGGIwv1+wS9GmvU3JWpqdFIgUbaM1JLkcoKra6mgoKKtFOkGSBPVCPkrgxMDaiKcfUSSf/nRAI3Bydc0j8naQP9l2dj6e6S3WVa8nMlrIpGl4tlmViSh2VZGP4MQlBlVDdzIZLy3ypnum5xBSnjskrFC/YE1W0EtLmP/T8qJkRCqHQoiwZ1iNDsr/1/FLa91IZ/puILGbvqbpDxK+4BmXRJnR9jl9zvMakf4vL4h21cHmRZwd3BD3T2/kNwdZBbOm1mLXIEEyCgoISVTrbcygmmFHJRrsKxgavgg3CjhuecRI/z9ZQeBvIrJN0FLxe7+kiJ4AdbeXCvkVeVrLEN+KGg48XVtnX0862bH46+/lZ1kXSlSQ7qg/nKgugl6QBZP6160qunq9xujCnEAkJmcImu8DYZnsRmnLPHjFirAVZwsGnE/btzW5euxNwTBGnUmV5DVCDGukob2gWHW/KWCL+ATFrZmsO9mUjS/UmnqMHyQnxRd1lyIciYvUhfcOv866Mj78qSJA3bIYc42E2LsdgmN2ZN2LECtXuMG099ZoCp38bFPU5/o6H0b7yjnuH8AHauawnCpCjoJAcwgJnNuLS71E04trCWrkJ84D3DLVGIR6eVL9FjFPYCry2ZULAt2bWT0s9iqZ216rW1dH8n3+V+CMoGociTW/xGL769efzq8NqZzTdvu1PZJgvhz9CT0jwj90zoR/wQoVHvhswteGW8D/HEirrB06rcjWQ51WgaWIAsu9G2Aod0a7D+VIPehvv2wq3WuL/TxwvgB1LuSUYx4UuaZlDTON1rZ558d2/r5qXh5c9EbGOTLusuJzWlyW8S2hZzAxydPYnkSbcqO+xv8DUL8xd+lhwkXgJhOrr91ZOP/mR6mXYKi+7vVWLST+wRiNUi1+RvbCZRg2KtW0T92j6L/d587eToT0ct/DvvkQWkRLu0cakU824z7cQUIZBaOwJF9HJFqD2597aht3RnLTOMiD9z2eq4heY1c5f9BwWE7tRwhoP0gRFPzwjirTfo676hjjfsOJMkg8+JZ1ZGv/FkS6cT/wTllvopu0neNcpI2FqJCA/PfBcRPgwdu0zzNu024TwXwy4nkCZTlluZh9zpbfKpgQxg/hXkx2hmi7qtRAki51ZIGrFX5PVvtj54a+vIUV249DAsIY5hwBttZPWC85DkCiwi2jPt8ApeD+0kBHPsQ7A/A8/wI/gQa8yZfRrYjKAPYqypD5wTwMyHN2XWAKrh+660UghBiRbqJyRHVxN9lUmvhYZ8X9pxj/Qqwl6wR7SUMPjE9OzR6xzcpYDprW9v4W0Oj52Tbw4ffHdJ6JPUw8/WElMn0rn8ZNoMt4kmMo96GRuFQtP3L5gqb2Gw0oBtmbDcBljpdlWmYsd/hRuLlHbHpjXTAzvI0oq9LMRxT8tUqxMvhGw/yyZDm7ay6f08Wb+69fV5dXgxk8QzAlvCAKKU4m9ZHBn5hOMVuImIrtQoRpJD2Im2ZJOA9JPP31a9g3dygHYeILoRM8FqpgOjIjdPam9wnfIpsZAZ8Sb7qrevpimkMYLfn9XlImlaJBw2H5wcnXugoelLgsq7B+B75kwibeklrP7lSTNv8OTw5k2ZmsXTXQztGcFR2EzRPMis3S8EjzaTLofObyAc4dEXfdlOOHF+eOausO43oVtYVSfLgw3OG0hSkryt5WWOOcMdSfkG+msZgU0U+PiS0f7+TF86d+L86MvbOgHqYlrTHmXG3kK8vhXaNmHXN+ZEnw0ApGIAsJdvbGbwEqXpnGymU4zdFQ4dffPz4R9lpyajL/+8gtdmJ+E4t2v0pbkxyREdLcFtTODR+TV5/snrHjVDzshENlLSJn5h+7JD03CnhMzoZV5RmIztdnawgBDtC3aiUDlotjWWU0fZ73/r1ujOHVI4FNMvEWRFkRAV+hSw3253hce0hIyFa6AK3VMkLG9BjcQBhWaB0uYrGsiQY3Klg6+B/YHGYDWwr6ZY7v/1LAMhGCuYiy2KxOOli/tTxHil1IydhxY9IReazZSCO2lzVM25Rk1d6fsggtqMW+BIf+PJnUujG5YMQm8mJyIasYg4gtrLub0tvUzXRQIdzBHghSlS5PluhwTfv9Woyc4WIkF4eJ+MTpwFm+ExtakouK//Mo2s3Uf4nvyZ0NYwvyZs29SAzG0Lr6k7Lpvf3Xly8zs1Qw9lFLGSZLynjRlXUAiJYEWKSmLNTtZpuAkUEaMAh0fYBAI2pf7d/G54TGxNihDmQRZILC4KQljIIupmB0R76wuBfAOdXPd2ICrqzC56dJ88yRsOeAL77zq9GGnBzAEcZh94r2BVyNs8DJMp+/7RF5wWe/qLJ3f+PDwj76yf5wdq3ilO+FtvoSmpSWee4l2cWy25i/nzJzqINV5jfrIxiC4TcBFebHG+9uSTP4GRwgx8WnSKMRANNeVJXGrFCMXczh8dbVOcBtTDFUlwfvOL4enPtx6Kr4PMiR5LLYjTZEUIactar5f9B5vN2LsBGRruO5/jeRlrRsHWObQJNsTqOtg1irvmbYQVnY6IZ2nIfakOtpHuh6SsNfNGGK28WmCNpowWr3XzDQVVxiFHnA2JJmQ2SGidMOGdO8o8F5uf2SR8G98lbHpR/jnNVN5xAYcnR8/rim4gbKhHW7MU3Zqx/kJwE1y03IjJZI3RnRR0qq38FxInUphYPenL4C6HW3xFDmEGFQwYT6wPT14Znbz8+OFHwhlQHht3ZCwFxtREyCJim+7DXUkxkanI1sAPk/Ms+QRFzjLHzXN/Zmk7ybUXWbdiSYpr9xpsxxltUzMxsg0jq9CstGCcVW2yBTXFxAxTsANLh/U/VhunwQsccMslWCvjdspsbJ2cCEZJZBXMlqwBNwGEtyB0A+cGywMgFywegLiCcAPg4WcEjCO43RU0W/3XUG4EbyNs67DPAV8J6e12jOfwLqCuaUNb046xphVaKV4TPCWfi7DUi7Li+/yqCS29qBjJchzXBN6oQzTZI6E3/K/+PMidI8ghYEM/qwR4MroQ3dpl8dTM5lX/i+43STYvoYOqiF0Fz4jyFb0r9wJYcJhdjzTrvAxUeKX76xkPXbzHUGLyHaB+pC+kd+Y5yG5edMycO31NWanUnhfYVWRitpGMlh5mO2TnhUcbSeJnRAhr7+XXtMpdkbaxFJtWuTWtskok1IwKJpFJHmMvqzyWAZWlPxWvel/qE3IY9e5q8qI3h6zF0BTSFeM2y1P0tpCgGDMR19vfb5eZKIJr799HTjdSyy2BqEnL3EjUImjBW8fvkwb7Se8DEXeyBS6T7cT66PKpzc9OKSjBhDxQK2I+3BBYjN0hHDpw8jwTc/j+QiuQvye53MlhCnMEXiUVJCF1+ls2JxlDIZcpCa2l2zQTAwuwq7VkKKNs89VvUEcGWRhlHungk13Ro3CN7yqTR4RJEt1B4QL5rpi8FnZh8iYdWXgvURw+B22QiWwqjYMeO0hSzg50qMwBLrGCnDeZL48hwVZ2e0sP6mMSmutassnRm5IEEenJ4cevbL51I9KTTr7NdnqpJ/BV7Ih70En7OypMGznrN9o6rUUsidOn94WZ+oUkwC1b1V2iLOFxegOZmBrWFt3Dg8L/YXCyjXf1ZQbW+2sSas4+ty/Pba5vDM/cGb4tEqcNs4gT0el5GQG8lrDmwMKa4247Uem00FOLgCogAULSN060TENv8DnlQSQcD0xLSNspIxycGSPZrQVnAnHuXipNnHcAGFFwjhN1/0/vjT65vvXwvO5MQRg3a8p4LrDjC89wVA3fwdx2BB7NbEeJumY2MHGbgHA8NDjS/YBst8ILATShgoD29QfrHEVNt2XxfVBoRU1/UdyMpJw8OioRnbc3/3xrdMYqGkj3mMZ8iUkB0+AZEQPhlmw+MJAhOH2rQUDkbQRITKG3Q1JKnC0pfNKUVZlI1BeHVWOMQJgaI6n3AdrSS8OHOCj+ku/fqtcenSXNsHXqxPDEV/r2uxwtrm+a5Ve6JK4NvYZf2bNO0EQXkxOxBXIms3TyFDSLpf4cPPnUIEmfoXKU3taymlHYPDlITUiu0JSmR0dDLtPWyZuWyMT+m7aIWZ0vwLgIFq0xK3XZ0E+/rKQbkrBBZAmarSjdjY+95+zJj9UGefCrWiNV1318Xyoea9UaEqMtGoO89KoubBozn6O2QVCrzHKmftT2AWSCiPdfpvfFt21mQNpTYLK8ZygEnhH+iukqJ9Xy6wUMsYRsfb2EvT1V7Otv7fVqL7rJLiVaXYVyhehJ35iO9u3rbx0WN8lQ4+TfzIysOvWPDWhs6RLq45tYuAPRSPw9EL6UF+pKvgD2N9kdQ9Tv/hF+GDWxmhxNal0riHThvypXmaa+yA3v690/el9RdIkENUr+IBcm1MM6gHZWtZhAmiSTD651ZZEd7mtw/QEt2URrfVpskxryYmiZjb66tfXwde1x1o077AyiNiYefgtp7fe69/srlwyU5Qu8JOW+or8pSr5H+zjso0UCtDsjZFMJoQq9jqB1iZcmG48Fz82bmx/cs1XWESJxpzvNsTZnFrUpg7ZJaAnKvqgsXDRjxw2ZV5GogKlKDVVRscR3BUnRgPyrV2Zzh/w7Opsfb7wdhIX4wZkXOyXF882sXpAADG1Ykt9KXD3hTNaSmkDWnOBI4OnSrkTBm0gibtNWlvcozov731uV2Efc6vdSkh608rTsi/R0RXbEXU5eoEM1+a/Gfoze/zP9T8M/GFWutDJy6w8+UYpKespBLl+XveTQoZ3ly3w16tdOqz22JHvJ2jcruJK1alHn+E1cl66ps5m8XpbO2qFfpQ+YaJN+vk5OM7P08ZTJ4Eo/+obXRxeO22fEJgAX48FgiJvUwQIck50hpi/OXbkNjYk3co0e2hhSxlr3ra+l1YQt1xN6TZhKIAteEcUy0N2tLKWfCGntkijDHqZVJqRmlgZyY6dfWJYj5cgVyQ738gN704aKFK958j7W8OejD2QHuU+54MkqkCCoccEaKPCCh6ac+fvBV0Q+G4QwM9dZjcGmgfWLyNfnkdiBsfjBJCJbeGutqMNwJg7Wp7mkDRZBK+WCZ9ye64+1/SDe1w1GQqGS29KRupSEQi+vb50VXN0nCKIZzrqmQYX9amE65NzUSmw+MIPKdIj58HQQPjwdJmYTViy9YN25zRXbc25pxSbQC2bbvBDbPaVWM3XczBmzcXZVzInZqjGzq2RLzJaNFrdVRL0LcBd1lIUfMXYfB+6On+cMnztinovRsiPlAJMDdp13SOxYdSHCqY5RHaCymlXUWMKLhhQFJQaIOGfQcM7QYEBqc4rSBJ/F4OyogbKpAMSOKgBbVJwkGEkBkoAYCX8S2LKgkEXgimGVnQxPdgom2SmYYafgBcEKChR2B2wgW7DXdqum3i1aWjR0SYXuilTnrkhl7opUpetiUZFBP75gevEFVYWupKZVPYlmitXSbNBGJyINpNvxvYWysnE9o8J8p0jxnSK5xT9p4R+RuCzJygWTkiIUOTCsv1ASfi72TFJMi3SYVpEgsmahvPx95Y/7oaJFhFgtXaIVp9Q297iHarvr7q7a/gb1XW1zgzuytu+leLX+7Z8me7UidwPy59jjsvff/ikOK8MIKVwH1eg4DZp+spwVt5DcwHFiWO68TUXeEgmzknvFOTS4u4YdnZ76hrb+8NXj+2fdN1TPCnjuaxoR3W+kspXfkqrcCK4p1lZWtY5Yv8GhPbb5b89qqLQ9i6/XErBEirTuz0LV0RNrKyymr1CtYO4XF9d5IN0yHI30bQR7HCKz4XCy7K8grWfc/FSLY9fg8ViucS3np57n5G6+vC9ls3+lVnolcNEKRSqabE4zmusURNswv9kfvnty7p69m7FuDC7tKXeCQxVaralJzGvd5ypsZcckYopAcGeKQHDNrm3QlhS+R8dyjeEBoCbKLeDkbruF9RZ9fNCWnAJggkLTCbYenLVcAkTF0hNOal4iZdNM/6btSymmzaiiECgBApbuK6F1mvcMIde0pGjywzdD6YqDXogY+VbYouOE6K8/3vrLURXVEJbPGJFn9PlnPA//JekCP659+FrtduzA9OsUI4P8e5mqyOOndHtL1eaLZMRTORqacPF1f5ryx0pXOK69R7FqdUV0pScpaAVTdIkD3klcsY77+vzoxjlEtw5P/0EV1+BrhM4rGVQBKLKimArkUXemrb3rxjZPh+aMPSUR13F/miQ+JE7D+2GuEu6CIWdsD9SyZJHrWIBgwn5Sa2RjnCPSS816b73cSnE73shhawRpecoyljgK2b5575US1wnEt+HZncAxncAPoQbODTEGIqeaeeZiAD/WWBD60ucW8oTES15uO6COJnxAMfQuchmp+5tvX3AhSMSjDhv9brUtGoDcE347A3tbykLfFvwOnV4WJJn9tlH895EPno+aq0Px21Vy8X5thzfBVapvfDE8+qkNyLkJThe5ZY1s44jQsiYVVv6YyaqIjcgqYWOyCpARsTUNbM7bsEJL6fNoM5U0qY4sekK11QaX60a1pe/P2efaPPPK6Mb5zQf3bYDRU/1m/nyJDo+vn1f5kne12S/fuqY2Q4mlTD9naTMQgGHweS98QEgsqoUTD7OgRLbxb6d3RsOTOn4+ts37b/uXEy7oav58eDYakvCwoej1eBxC2wcB2r6GCnb11SojgVWI0BxpHxtS9MwPDE0olAb46OgqY8/VMMzHd88+vvuOL7pyb+w7VnsTDb3Sl6T6FuTR8rsI3fA3It2wlwL7IuWSKIay8ny5/ApwR2+wMb4madtc7o4GPtg4HAa89c0tG62xsQ/LD0ZjcyZhVE4/HhHRl0giob9152M1UMkOpJXIu4O9dH8RLUKVLpTKBD0IupMHow9FwyEXQDRPb1y38Tg/+276cDSkiFtpSHJjPCjmEmbsjes+Y1s5P4ySRkHCEBHjsy+eqj3bMpF3uG98hKTg1jgTNBojRbYFMXMiQOPAPOMAhirrwypFJzCusTrn25kfi1PnpriPuTnuk6hFHWWXgxrD2ORqaTwe1qhjicMaeTQS02ijEQqiCYS6dV9piwpwqhq96jSlzxon6ViVfPqh0xkBsbjXcr3a7Q6C/4NtskRbuCYlRtc+3frWhSGBVKag3Rb63m+ljjWzEBGWV21ktdtM1rr9A5ZVEOU/1biSCKoO2TIyBERUbD084/LceEVQQp7vNzz82HiR5fBs4GCZPkafKnE5g+HRD7fxkwnHWWW0EAYzY6QXglHoBmHZ4pkNds5sZNzMBotmtmzLuB0TjJiSvRFaxNRQO8OMjHQ7y6CTWUk+NSaiXFXGyV5lhCH+tGXuhosBUk9HSNpBdIxlFZcObvifWeUvw6iOTw0/PieQ8D/H/jFc6IgwAmj87du0zU1zC+VcxTDwa+GvCIk5CisBoR0RrtkRI5/qhRLWiXFOgB+LplL1j7TUEECGA4xxfb44pskXKwp8say3Fyeo7FhdR0p0TtTnnGvNuaAs5yI96ToyVlg79N6nWQ3tiNXUjlhB7Yh1k+ulsl54fkwnTFJDIk3aFF3dqui9gDRV34lpq45osmLNJ00OFvlbBfRCSTq7ZA5imY9SoggFykwzj41fEWG5O5KULiVjsfVjQiQIJ5dL4148ExiUbikPVlx4k25w/93Ei+682+aqeu4mXXW33TbdEp/dv27jszN3DhJB+QXt/dfgsGuTVoVPJQlgJbSUQTU2gVO9IBuGZf3ITgLXkFfXarKXpZbeiY3h+WumX5zp8xG7Mo/nI6rPlAiqQhGKrFDUS5MdjtU6yBRZv6TYwac+QbNjc6cevGtXuIz3WdPtTz79fPOVuwGPKBtsEnn1IuOUlIsdObtaKHRk3KzWUcROix0JPyt2dJhi2w5VwGRBVfOw4XhoApykBxBEbYh835hBzttvZTh57WU/a5LW0yeUiWED1g4YXq6ynsDyeeejQiOh3P2X7dSa4ZnPhIPIN6WL1Nd95ghzmzFvphhAWRqZILp6SACeel2On4YYMXn0q4lSmqFT3Xxr3Tai1OcV+3bxLldXKc24P+7ZtSe4yObYrJPHHFAepLLtTYP0J9a3bvtqMToFjeO5CUznKsxK9+TPxPQVxDP9AOJRRHY1LH984c81iCtYYXpTdRSSyWJ2CftPMzNMEHT85J2zYekwAfVGO4/IGW0sfABMXI0QIy0DENIOjT0kpMsxJQEjW/AJhTfGH8ZCQ+z+6rBK4Sjt4MA6arnOApoRlXL8qlteDSMGbThXZR5/qTHuPuIKX/VnGVcZu3ANHw/VQxD5GOQeB0LGUg+VdJfGRljnu7Qi+rmDNc3ZFGF9/E/I2QwfTjiYFcb0gxkm1H0ETJf7HaiqF46phn5LBpd3W/KZ4n7zDdV+S364ukfPNuVcq7obYm8Oz92MDDGhYT0XFqHrwkCsXiPNXY8ImylGhOO+Z9GCgdCnFDDd4dKr1Y5Twd0gcy9SIPBFPiiAFzz2b8IWDu3vM4mgYrglhFaajrE7SxpGOHk5PWelGkZ4eTm9bBmxc3kvj/arkAojbSurpYhubJvZvVUAsBY9Ekx7KrJ0RY6loIl7/+bo7Vd9kIFxNM4K69JYI/ZhvDFjG3LE2UoIMmsbMxWQzg6U3BZrSFaL5x7fUP2ELY7Cs/GJ/vnQPE2kgN47FhYNU1BpJ/RB6XCqezQpX46EtdLm6eeUdfIxZZt8lGfKe5gbu2yvE3XqKKxjh+1ubiDgUqPD63xVA6wljInqw+QSZ/D47pkniOf99H7YVcWzlmNotDl4M84u9BtDPqHwybkSt6cSBn6WSKgMPT653aLUeOl6UfpB9YIQEcI7iDqWIs0O5D4Y+cgdVgo6HHzlzXNf23CUOqRAtLclPCp7WoGXbmgJo2grK2amu1nCzMP58u6BjJYKvytYZ7kGU1JrIdKf9sA19C7vLvHdKVfH7zcVngEbsrcPR9rA17Q/M59DzU687lPBcQ50u/sXsB5d/Xj4xwtqPrUigZS1Sg6tdByuC4sDeZmF7jMxcZ/K5THpQLISbR9CpfMoSqLBc1Hft27ce/L+sb9R352Dqi6mHfxYSCqjvPsVNd3pJICnaYdfA+2zXGq051Qmu5cUXNtI79VnsS6flbRYFtaUvrkmuQngMrpwosSo6MuH7FJpKPrwu8KeKcp6FFohRm5e2xXTRXe+f+egU0aFztHxtyc7y36N+eSWk6tItmim3Y6ZdtNl2g2W6ZKp4lZKbCEQpZ9kI/CNkZUg1sh8ZIi4EWIR1YbmHcAbdH8mQu0O2CPMzGuNkoenHCFPB2y8EAFjB8UqCQtx+xFMZRtGGwSUzsWI1NHo3zbyWc5fFKznn4qAGFeC0+L3jL52OPCaiVGXI64YC007Dpo2BDTt4GehhHwc9USQZD5AkXlHH/MBdczHeMOhRlndz5XV/HxJs8+VNPp8SZe7Gg8K1pXrHk0e5paWxcSbHnUdGqm5oDx3uUbbpYpsV6y7XGsFpTKnmmQuVh7zpjh2lfWFqwp/j5nUo8Ffdall4H+JbNsdi2QXxz/rcZOKLhF1KZH8SzTpQYTUzpL4m3fxFMs8F0oT3GQ4yhUdIneUPlZ1k024IbjJJl0MbrLJV81NNuFqcJNN7pa4yf5lOzcZP9SCl0wE9N5/iePaGlwBr5ewA2BOEud71FJPTMFLs91ZT8LWCN6uNkXbI4Nb/ZVoe2R0+555syJuCBbOeEIGdghmWwUU60sud8yvIEC2q8xwrcPxpV68WPhyoOyHwtVKhzTlLAmWUJ1MPYHtwW0I6X5SOsQNs6xltw6uHcDptZLqtZZTc6dPp3xxNKeeeCMHOVIEOKPOOx8OH9CRzlsP36/ynilxlZM1yJiZjen/PjqSWRno6cpMORT2IGjYg1hgaUChY1Iz35vowC4q8m6ipNdvkw9lDVJVqwNIQHPPDpF5dJ7rQ7xx+ckRnMKwPrpx2rLa6UQaKdoEfdpOtLAtn2HD4QCEnvXoLD5ntsuxALncq+HWGfOfDqMLHdBzp5mxpVj1UbcIXnIxIVB3so7qQCge1uU2NXLp1KNWkyocmY2OU446KBJEpy6KmX6GczcLMzZuvzf62K10fBliwwcJG/3delqwUv1PodlIheqcJXIaXc3jZLJGEyuPV4dUTMBkSQ/QAXVU4OikUO/RUVcM0xesz/tzygHPtIABkc81lIgLfT557R3U09j6WDLR0/bTKXHhnuf4oUx2y4GDPVTvyvRIHxCnDZ79DPQBwWoRcQYVbwtpq6iWcUWhvKCz8+a15CodsdIyByBMhAwl6ndoAVy5hhJJXZodyDBDVgXtiaxyvR8qOvSCnhqIPT7R3rzF9dGl4anjFoWYK9t2n7gsBra02gqRPMYMLZr2scpb5BjaovphjYk4YoWF5vh3uPhgjxJoOe8Xp8uFbGiUFqD8S6wVOn8JsKirVRgog6D0XL0IWckZfUZq1kMwBldaHGxG8+Ow6NXhlZujEw+0qAKVEqIBosiUsOOSATDLMCL4nfrt5CmuoVHPuQlzO9zWoVN/2pSSInhdamIIQy3Uz9z0K4oNICtHCqusxsuGC6u4KxJVVQ7S3/ly2Kfv0Jas79OP3v0kOId+Je2Xa0ZfKi0LeUuJxeYkFAHBaF1FBGKWraS3nBpKfiae7xJ5i8PG04xXE/6f0pkhWgiXDxLF9F+jrKreUx3WTSRRsdNKpwpIRvGFzdeuDo9/sW0HMuqBn2Sqy7mm9qE8QCfAIend+4Hq59yPXVEnIN0lAyBt1bQPWiWHe1DefrGXKxsv4c3ajou8WtppsfDlZda05j7+lDaOwhdTqjiWNdGAVjeF6KhWM4aYYPFUT2AXf6NlV+BnPhOqDrdRWHMn93IN54mjMCLLBZL7ogRwR6a3kKEGjTotorOw2B5O0j3xBYXb2AmRPapQxSmh+ihSTtrk1GQ3HTOKtl5xZtOKFF8wTu08l5xQ40dpEFyBqfCtlIfCM3hp9znkwRsfXG9IkCm6AJnN8B1HVAmbLlUM1YDrDinW/YlaNHU9hU5e1pPLZ+gYI9+7A5PnjbzYNZ10OiIjSzqQQTWaeiBz5hXdhv4sb7eSuLPYAKJD1Cr9zQ/DLKU7pcCB9RmoFJl5cZdJGoceQ1SGHjOvqYiLdPtwV5uVWNRxIhb6TcS033qwFHnY15eT+nj/n5aDFauj6PTXElpM5VFgpS3vh39kqTQSfODD8ct/b92GMsZdVccE7uKM1Qh6Zj5TZhiNlhlGnwkMdbhcQvAATRdZw/RnBbBAPkZoZaWAhFTZSNrrzCGTu9/dBKwIq/iAOCozrNd2105/FerU3LHIFabPUshvlKMfmVMjJQtE4leo3KgxpTV+/U3habFpCjC6aYAwCzoGATAzUm+oVfCB2CTmFGcIxmB9LNgFuliCehy2RMAIsqhgkPI8txs4YvnJNHPPQlD3IEqpvfbONjXu1V4QHmImTHHR9Yb/vRaayzbDRIOBj3lhaE5VOBZKFsJMFbiXEHuA646gLQUFouyA1I7xgDO81sPYuFYrwcFyCSVHEJlnmsHXEj5eiJHxVAyK5yJE7GhYYhawldDkPW77QJ3+U/2XW6TIujG8BCLiG6UwRhqhzE4uCCWeAgYzI4wpWG/aMJ4dpMB/rCYlsOg4cRzEzVax28wYXputALXZgNEcnUWYZr4EaBYMyswHFKNIM8IvPwJeKLnCoYO8Rd6qozMjO4WeDxpQykLAJw5NYhU+HVBB2Y3pPsygsCNt3a3oaqmbazqzqppdK2+jvGLdNROrLddYkbqqqhDVTaZCdkbawxXHBLk9PSaxIxURS+kdsYB22RwL5p1Bbi64PJ5yUfxSJIddBv+IPKyug2j+y8yfUMwrJWs43622eLWmV/VqKO01diVU+JpwyQp9VS+Fel8T+iFepP+1jRdJn+ju3UuPNPb+r+BEokIehM1hRaGCpL4qa6KVKXNfGxK9ZYVKyNBJgnIr9lqe1zxZCtHscewh+6/vnX5y5NzwuEwvHLKT1KQcri5dbEHU9PAGaRhci+7RnL10pWb87K4rXGZMufFhoR8IKz2SgY+PlbPD4eEWfCCN2NWghO+oRW+T7cFl1Mjv0SlSSH9Qv6Wc+FCjw5flwDFUEeSQyCtvDM/cGF5+ffj6a1aXU5Pd9F8gXv1LyC54Wp4SFK0ohOy4Ja0MHX0NFDbpJk/FX6OJyRx/jobcY99hcAn7Nmca/hW2HjwYnfzavkIfuxUrUnuFnmKVewsUdzqhKbV4hIwlMRINEy9cWtW9DVjlcMRBfKPcNttr6DPfERwLuIGuR76Fa1SviI7AUd/C8Pyfth6eCxmOKAve0+NihLqU6YE+lB1SzPOlyDw1cnoSEBNTSlGlmrg6DdEK7agr7DVpfHOQkxS/Obm5/vCnkwpTVamhuk1E7eHrgRoNsWMKgsaoP5K0wfWCuRhHooMkMnhVXSVyTw9skE8BD0U30eNWe2RedPoOUXJQ67K7wu+gqRMUY8vpfnvD6OIbZwfkuHf8YfV7pamhO5SDq0vYHuSI9SdHH25tfBVENol2DaGBOkWuc4CgiYRIJAcTKxiWPTq63wgNvztihLoZHc1m0e84oauwXNn4QiHbRvj0Ta7tzWGYX3+z9fB+FChUV52GTRycYy8T6bA1kw6p93TPSY50Ujo408no0JfvriqqxHYtx4qJesQ6IOzRS1SVrCGA/lkJkO/vpzlJS3D48Av0KiJVE5w4WC+0SLmQkRlAJCjxmU/+6UjgO1dUE2JP3ruN04yN3i+T4DgWpyy8eYLRZHCp8fB1TIgflt18eH3jR8U3mMWS21iJ4BY+f/OhiHqIBgMF8esV0aSRNPXkcRkL2OhYLM+b9E03sSVAB/EJ6pAyIQAuXDLzGvvT758eHr3w854np6I/f+eN6Hl5XSxaREp1M00NkXQfXNBzoQ7S1JJJP/zuxtb9q2Epx1RIhMsZMD3YGAfYECpErKiscpJnZbrqgtz4wmiy8thTFeukL/ZMFOouz1V36dOwk/1pqNn4ccwTtTwjGuSzC2QgGRcUAMj5S5lkPlGJIOf+V/EU8LlyG6rg+S57CnzDY2Wu+qxy1ce96qNXhIxa1NK527Wyj8Njn3rNRysgqf/aU3Q6qyXjXGp5vciP/EFUQVqlKjyerUDCvMbZX1IhuHKZxHZNshkslazPWfJI+Xqomw04wkROme8voxKpvD2WdyzS5WGW6JoLQRL9222CRkpLsLT84oVXAX8x7quCPod1pT8C+ipBryru8gp1Ypwniom8JeChEhgKQIUOSqrCFAY+u2PA41jnxzCFFs0zIOEY4pcBCNXxpuBpbVNVMIn5oO0TOvTBZIxfwNkgXMdatPMvUs2ulV0lswKcUrasRxvBsOv27epKwZNJlZ6ru3jOVPVPPG0iUR3rm6BsftLkq1AJsn47QS9zR5pURJt0/nHRbOLTBedPkpqlOSbT64fFXMZJhybgfrp4Uglj4sXlhksUbwlCRMTHuDXNc3OKC4XQMbQVa3rsqlvT41fcmp50Sa3psUtuTU/qh1jT/7yNNS2rau9eeaS595+DNc2BZHZ2T9okn1HYWmn6kT50QX0/WYPdhBIuzmYlokWPHbPdla6Q890lIRk2l5rdxPeW9KIXx3HKmmAhhC1kt0dlXMRwkANAuAhjXfY14SaZlhNNUkoiYuMh7cpRAwjzgJesQ+ED2sYxOYydD3tm5fD0t1u3/zK8J3MLQ85b0S4CgoM6xJ9XPZ9lS+52nCyaCeRFAZl8Z4Wy191kylZ6k8Iosb9cgy2KrMRZObKTzvmuBeAopfbpLHma0DlvDEHmADW8yH6+/KCgx7wpZd/4JKSrbWbM7syLR4c3XhtqZIhxJHuoKYegBk5t3RJRRR3x7GZ81GqPB+g8bWUZS/XxCkcvHJQcooSGeArw4XC9ykTg2Be5rZHkrc7BXNMeONJFdp8l7eH+fUKKFlABeVzvF3zIB7yghyR8rxhcqVNrHQoJbytwXZSTSg4hnLIjTwhvPmyz1eovEzl6spFqL2Ys/sL7IQEY0g3fnISH9OVCc5x5N78+YX9S9/I5DrorBeqgnAo6dK7wJXT749GZC7aElO6qTHadgsqA8GxkKie0BYyguyWZ8hopxYzoi8teNL1GZymYWxhqPBvlAmjMtqQAaFSvtVSuHhSrhqw8Klala4jLOJ54ffPYZxZmJ1kJvF4l2EITG7j7tgkmN/FylS0zzVowYz/mApC26lxGb2iFq7SB4KkaOV2lGiGvE+ZCs7rACSxd+RZ245LeSIes1hpWmRgaD762qxzCQ3r3ycdvb3322vD+uyUuIQi+xCdUv9T7+H0JB4t+Dwz0bQmH8LYOpZwyTXHJqA3Y1q+/lEr/FnYtsKSDK0Nb/AlEXvEDfHkp00rLTUIt7RrfRJ6LLLWBItaX9LWce8gT4uGlzT9fG5375od6kmhBS+sIvPzSMLEfdnelG/jsC+U+PDq67D0YnpYUZDokI32JTu3zLjhBvWZ0Sz2xa6Er4/2QW+J+4Pikg6EbwwfXq90gaPX7QJ7O7UVkXtxSup7yj0Ca9v7WnPjmuSualE55UjpTlugxauAT1nJpwn5tRm1cQVsi67KCmrnmuy5CVTS0n2+L8IsPqKiQ1fsmCvz5rCq38+JXF1qNXSe+2VjCU6stMUfxPjlPeJ90j4pq+V4kMnU9l4bOSaGdDI5mF10qWepdy5b3W/dD03CkB0aZ8/EPejPgbMuHekmOZbp3AXy3HuqRi2odplIJHqsP7rOasOZKxXpdLhsfmJBz7vwKPMQFJgw0ahi1Q0l5eE+B5Tt0sGpCmUNNKochtm6+Ur7vICYyEFqr86Js2Pibc/HP787EP4cQYOGjjK7t41rTWj0u4RXd2DJERdEHGFVXTiTWVCiuflP6YBS3Fj4YHX892OjIcRZLbalHjOA+nHbMoWpkJvZpz3VBz8qmmzliwsWnnI2s50KAhNSzIJDAiEhgOIEEYKHrUvAab4cOh2XRIUQ5nArHAa0qWOAL1I0X5NCnZbRX7zfGHYl0DxwvyvECHDuujG98ZBHkdKp6K63LyrCMBtRUXcpVpPRSyXdowZd8S0Wa39dhPSZ3IzaY9TuZ+HQAakGnXlF86+jCxugE4uW+LDF0YaKPM/hyeaLc+NXKXTErESyBkQkW4eSCxV4rCRfIOSl4H71ViqOlgyVWZVWE9yqnSxRW8Vx58xc9WMgJQv5SPRlNXqolo0kVC1oLMXZBUthqovGHYpoie6ONurUl1IIaGXVR/LvKrP56askZjd64so1nJpgxgjinDWW6ZVM1YNzEcPvCrQq3JYIFMVVG947rHWIvlIF1GcJPBww9H9CzA+eAmndUIPNiBJZnAk6eiUGyA2RzV4zhUnXyKBYdB6KOQQ25zSkUU4wW/4wgmaOxAJL2GDbaY3DIoNCeGAQ5/pkIOXYJzhgHF7vKkGKxhCUcR0Ta29XyxD9cSbt6NqW5EDTlQqQeF1wnvlTWha4ETQPudq3Hfq1I5bxQ0mWuxaTTJroTObCiLouXlUtaCu9y7cKaJfeiXSW1XBXxL7hgf8EluQvRFyLx6TIzEl4uIneZpNpVllC7YunkcikWSoslUbQYSR+7Ml9a+r7sJxSIljf1HNVd5ueqxaHHr4fC0BOuhaLQEy9aQejxi6EY9MQeiWfmn7YrBK3fG1Wg6bXs/afgmYEkpuph3WivFBlrJLW7anV0JNaYRHZf7vQ907XWKv0m2C+7A8uy4YzcC97cu3wKLrfNe3Kw5+DzOh88yl5UP7uqYbwW9eCgcLGP+qcUbwAmrOXPoLqccuAtoYtC3+rW//Jh8J1FPBIqp79WHsvGub/BWEIDjSZw0fEwD/PaI1sbOoREvlZEkIYOBe7pjp/fVJObikJ+p5aZQgCW9/oYBXKdqSevnx6+S8c4mI8jqymdmRIbtrla0aVeVhP6M9HuWqAvFr9QVy9oL1lKwwhS2mNeIp921H+5Q7uvD6QWKniXS7/hDFrt+tb1ja0H69Z1u5sOUv8kQzzVbpa5zIH8IznaNInE7ySXmt5JXsqU4jTp4owG6tUCUy6n9qGw/PVTbNJKwbZJWCib1879zRfKpYavE5D3ELh+k4p7q9cMrqM27xSEQht9ihX1wPwiMc/pFbKINsxX9uS961s3Po58Zdh0w7GrRc1Y8D5Euo+iYfXIdebFTi8qVxjdrOHQ2Den/e3a/mLKpphz1enFTAMGBO5M5BBerYPAUZQIh8UFTv/zOggcZs+3s9MxVENg11xK7mKvhcCgk6Hny3TKBXuernTZnrk6PPJg88Kft65ftlM77JDnPhR2Q2rag/vaixqAqSQfndfILKVLs/nIMaFnJXcwM2koYcUjV6MjWW6+YsJdYc3U7a40JKT1CG81fc0f+XD01Z9t4bTTpZoRmq4wAp8dEhdbvgeHPxysBV7T4eRC4yWuS+FUGZFOtcAlqiLkw9FI4jAaq2jaoqOevT706Oujjzcu+7RDSvbg47qAmbIkwCm+DG6fKokCeiAJ90+SB/wcbwSxRAg9EIkgHYh37FB7P12SHSWE9PLvnu4wJXYdDtR5SaPn35LKTRKADnCVZC/ZP926dAVMou8kj8zG1Msfya/zNwq3yxGNxkI9y8zAS59SvpdmI3GZBa7UwjOpI/HrXMSf7+KMJeSl8yZo3zOQHp3Hl/n+TMvOBPjsk80zr4VjATJmwmeGZGbXxq2oDyIUxVatGTmNrWNqYbX3G+TyNnOPyhfWpSkpFW3ipV63m8Xq41qHLUS8U9j6jBVZgDvOS9TdeHvzoSf1cuxjNztMRCQflajbr0Q2LTQvlaeSEl8Me+nGgPN0zgj5H1HtP1Wvs5LCV+3FivH6Fdfpg0/8gdKSwEuILkSrgneawoXxReFPlhUl9SHoyetXwpYF9mBtA75BTvOlCVsWLTWWeb9Q7WZO3c0ZVqjXik6GOnoy7PsJ6VICmEMUSgAzqnwOfZwAFkiLZ0oIq2rn7UL2JRxIu7rFD7xCmTSyD9LVcjpyp/rAuxYlwHfSzl/WdYMPc/mQGnyvfWDnD6VUzZ8Th5wPn+KnzZqcrszi+wO3QhtX6s6PDs5VdsNr7xm7FsVBUELYTj6MmzbItUwkq6S8njXwpRkLpOlODQRcLQ5i8WuIL2w0yKYNDqM/+SmqE1jweL+nA4fK62kUZGata/hjwc8K4adRFsGexq7q4Ba04oriKPOHwCHNrQKlaGuQAxJxu7QLlupZICCde4qsMDHpdEOlybauCOqNN0bvHtu6/pUdry6zO/IW8ZkejHSjkFC7z3EbfBqIho+A20U+91O5wGpkFhM9RRPQ226FXNZuiC0yayKb5qdQCH+VjInYkkCIRL+wxRj9HbWHv6qQfgzPz0RIfsYx/Iyh7JkScHfM/pPHU3ojlxqOjUvgdT4g15kIs0rUDZxSslceIccINpLOa5PPjeDhj4HG0s0xZAx3TwKNjhRLOKgMtaYj+DNdQj5lCOfo7RfTKgGYCeglghazAbPMOlqZjZGKgxT/oqnF4Cl4UKHvGt4ww+8jtOBIQRWi69lIyUYqNtaukVod16mRBTsT9OiMa9CZWHm63iwplkhn7ZCqPUGfVDSUKyd9F5HmMAkeiW2T1SanVUh3tUKM5jTxr1AYRmrCmHdMg0RaGleFE0cZ2yBXSGslm1gqySTL0sGBenv0qCybHNVUnYm3hHydyZdD0s521y1zZ+L1kL6zXQfFt/Xb7XJ48NiBvXvj5+p7fxuFHvFeASK8DlAd4PLpTPxQH5dgJmh50/gqZ2bT5XTsXCcSDAWfP1YT+Bddo2N2McH2l850Gl28s3XklehMp1K/Ir0U9akUgxH3Jt7PiHtioRjWAcW2ytvy3QE7tSAM78QhnVNLn6EsFdWK56PAJFwnz+BA5fM+NBuRFrlmMef7xE8ePYXEBYiA5wQ5UFTNVQrQ51r27x7fvLc+On2m2gWSW8uZ1fIb6wFdG6zvmdSBIpOg0vih/XWtdeHs7Wxq5u9REAUqrLdTinJpMCVN2JEcTAADXKTUkKe0PMiSV58LT3ajLB57DvXB0q5l8pDI5ZzRJUvleXLuCMEoKxPipMTaeE4DXZW7FiiJa1GEB+TuMlsvSxExVlcN83WbGU4ZygrFnGvTe5Rs3kXx1tAFmlx94cs1ccTKqSP+QS7yWtjnD9XlKXKs1LD1IEmHEiRG30Cm4Ob5608u3fUpqJzyA2xX6i/sY2D/94WYG6JQeMPAmByUbY1AXs+eFPKjP37p9YRu9egYSwZ8puUh5GinXvClq3iaOp1MEJ9reC5ET+8ZbjXX8PJGrzIAlF1JvNXRzdd9V7LMVtdzxNaTo2OeMzE7RZmBk61gYWSvT0w68USSJeUVBdSmM4dkqECgNp24JEuPmIkndU3wy69wBzhkvZTfB2sPsetRfl+pO+3ZuBsaHRvx9vJJwrPzXFQfyvhpgSjmE85rRC5exzbvEPBEczeLF2/BK2aZMgJDEVfNZeR4JrEQkWWshEJd16y0mlezLgXVU25yn465ruXNKEEPHYTlxWcjW4bet9cRK2zLemJfZyf3b3Zij7i53Am8qBf1ZGZnr3kUzNxSynOOnAwxkfBNcJNJkJV6OIsNE3B/nY4pl9JSUBfh5KDhqUvRyUFCmPRF1hzcaonURflMoj4f6OKGfXlLkxD5/PM2B+TRZp2Sl+06oa61H0m+L3t1XVYB9SR8u3kvysnNdp+oe7rPMlOovNRfv/BQzuHR1x9/Fw7kMTYzJR6zFeIzJcr6xp2yvnAmLKYsOaDrVBwWZzKvxnMRcaEdixk2D7tNQVSjarPRrQ+FiYeI0pSrmvTihFBiT/nXL/t8O/r61o1vbb55J+j7wLWWRvx50yM43YUvGmGgA67oEbsCnFoUO0EdEEl3iUqBO2fOnrkkfK1kJ/bFUb0I6IHEidnUNMVJK2GvdXW1T6fHwy++4jX3liteoCqZoFUwdXqcfEpFTUWpAEjpMZkWz3T6GuEp9QyVaEnh/6pw+MGeBRFRIpRoAbjSd7LO0U579KlCD60uGPfQFT7xR1hMKeBSDmHBhSYFzLBfCQpn6UVFPHS/7C1pI6J4EtIUFJNPS+swu+DF86FJnq8Ov/109M2VUFqPTnxHcIdm62UJ/WZ0tcZNVFkvvmVNfsrFwEGNLiZvsYsl0Z+Oo+ugjBhce1hrSSUkGvA6VdIMZEFK3RNya5BqKB2Rev066YcSnA49QY4QgLW930gj6rFAJfYUjJZK3EHEvcVVNZ23qiVlq2qJXy5JDypoplhmsC71U4BRDcxofRUHM6mWWFE0I29XzktROENv+O33YzjjbNpcctu5SAVuZ6HVt52D198OLKz+NrOw+tvpMkWV9/W8zG6PyjhyoAUuYL3JeSSod81lkDHT+ESflhZBHn30cOvIUa6A7KRI7HD8s1Kzn0xP/2aKTdnKcJJSbUZIDi9/pqdf4VBw6x7sVdQ9od/SQ72Y6TW8CPrJHWW3IIDirZ72FF7B4Zk3raf6pLzRmOyOQNZeqBO28uyBtNVnZ9r8Qie5A4O5N1Uy8k6UTLvZ2KCbikw5t+LK9tNMyf6ZL5lJu8evmVXkBlHJENldsYB2R/bO7oq5sbtkZ7iNEaH7eQP28wHQzzuUny/BeEfw5uZLBEZMwM5dHg/DRkbNu2O47Eh5gkiQhV+WBmLTlaWBlhQPosCKFMbo9Ieg6Z4JWG/PBKC3p4LydpTApePKCrTb4bjOkddcAHPTAck5iosA0FxAP3ti6LMn4J49MZZyHDUOdyainCq8mXdQQ7aFb+sHVDEZUjy7rcJ+tqyfnw3K+MVY/7rqjXXggmu/BVd6C6buFmJV52ounkaRMtkdJk3YJNsVqQvXFDZFXIBrMWIWz4L+RXQLEk29PZLYLqxdvE6bXJ0XiSoF2vOSIHUhqi+XxBlnzZqg4x+lZpZw0yXh5nJtQjVpQP7lFxGFxvCsWkm6cjFUka5eCBWkx69Y9ejKlVA5erwL4iv8x+2qRtMD+d69hNv2/mNUMbq/SqV9WV3r3zRn+wvhd4uUa/jJxoEqVDuQi3crz18bXbzkmFTpoqbqzvCsFYPWi9i07MrEVk79Zfit5Z4SBy1ozBw2H7wlk/NAZkeNhiHo8aECtbty4LIMRm8nU8FHxV76VkpnbeiDVHPSkgjIzKUaVDY+BFuePeU1Lqvc49PAx3oR5RSM9cPS86r9sNyCuCtq4ElPLG2T67BJDhHmoUgeOh6SA3tQdrefH3gaJxtYpVy/v8P3Z7b9lSy18nylXjjCzkmmyE7mpQ6xffMYNjNHbzycyNYyXCPOXTnoULcvYr7YY5BM+pjrmpIIfLVmsjDeeuVN3bFOO7plbcPNW2u9YtJYcyrYj7L3QFvl0Xb4BC8ZJ04s1RFuXj3nw4u4cFaA8zgcsgnK5CWhQCjLM0TZcghA2xIIcoSkNhKpkqwjgLt3RV7aYbd35LZ+vdJ1On0l7eUd73+GIK1H520Mw2tnRheu2jAK40WWarRLAyu4KxFCBUXI8ntPpJUC1OhoXuE+bQe+MEuS97KXY0x975242s6OnDLD1ki60pKzFLhJMz/gXe2nvOvMB8xILvE+1ml8tkzi1b1Ws9acnzOgKWQ4Z+DhL9iOJ7jVkeeHDyVJhd7IErnTaOiErsRFObjdWpUa0oQM6HPk2CPpDW73NPyIK4it1hS8NgzuI6hP0K22UA1AqohkNTNQSHJ0410rmwH15zeuC88ZMWisuZEGWlpuGOTEFyO0VMPRp6FipPt0L4F/44nD0elBCniwq0BZIAUlhXX1nBewaCJvr4Z3L4di7rOCZJbxhv2L42f8ECHlJycgKbOOHYgk1/wsJKatloOEZTl1Pa+BaWs1dJgMJklRjSINzl2+ZBtV4tvV4o5yic9c58dwDjQOJZHH+ArhrzTy7NJhgwQUS57drRvv0j5R8OwS1VkjX/pD/6EPYrQ0ZotpaIJxImccpgd0r6lpCeAFe1sa/H04zkasDeTNJz0pT+y3kq5G3NMK7bMBZD5rU4oqRHtY3p0PH9+/YBvbxlfOcMYnDqE2zjYOsxGu0Vats/T4GmNoMT3Mz7dwM3hLpFpe7FjnABNePxmfwdalkumhxl7LHsJ51Q3oeX8OFwChKQqFPtoaH6BkVRioK/vtBNDSl3tAietRzT2qE4XF0ILSFTuS6+ci0RGSTXomnj6czC4XUH4a0A5eW6sqicJvFPGdtKZt5e23NCD+zg8sE4iZQH5wtEQr6UsqWMHE4MZlsxGBOn2pUZtau98uJ/5Ic4Yo5h6ftT2tg41yGOnvK2G8FBQ2uvZJ6APXWzXGs4HXbKD/XBiL56/YaE5GlIrobEh9XXQaIUq6LDhdivO26v1CHnFKPa8fR69L6jEqHzBBKawyHxHR2mcKI5uOyc/GlJ3oOgXD+nvYOvkHUA0kKZ6e51b1ZfBVA3xUXFyZEtp7zoWCHtMgYO/65dG7HxjYY5dOsxYxWYi6TpW72a9onh6+T/8O3MTdE7ESf49ymujvCQwgRhMG3+KasnYkGOHEJo5bzbRKfVseEi8QjhUseYFwtOC2XqBJzHZIEpPxMJeQczGXUOBjPjZm5D42JPKSTk5rlOTaF1cPq2ns9EvV6Ocl5kh0d1pbYwc9lgP9BB5oJzXZLuMqYsyP36QMa/Pcn8Fw9P4NGxlKyrYSG9gBGH1cmWJHmYeOxpi4wzCwsEQtJu/nD3apOsYyb/yinO8uiYC3JvXMoS5CiqxluUqVlCBm1iR9S3SGeRCHd45HHsRAWvpeIiwfQwhr34209j0Qt8/A1Lf1zLHZNW321+Q/IjvMTbAJFtD0uNmzOGbtTJftnIWydeOWjQX95HzqLJsNPLnRwJC1rhHm1RtgTNTYmliIrQg3IAKun1Y8vxBjeIkrnxfYLoA9QuvTBtKnAzKP0PgLARI7GnYovFPx705FvDvluR2KTAWTRpExhvkKh6KstaEa093BZ+qwcxxxOtaMiQKzyi5IXl8IVBA/GLeW0FkFmv0gHIqx0AQglIdQi8K3mwh9LAbQEeMbRxqRwsBrwJaubFSxXiIIhZo0eiariS/4mPpaxVmEFFQ8Vx6NtHhVhROsDJVHggIP+aCslqLdGpV/vlMTa9VIpaaOIsIf8q/9xpPySFWPjauYBdEtU5FamS6pFFcnQbxPTxLt0xN1yHQk2qdLUt0FugvXqUiEn4jF6qxL1IWyMHU5WhJ0WrEN+bdIKGNDLvd2EW6LsVxzkTbBKbec7bTVX3XJlS4Fh1y5Objjqu3mjCu1B1dclbE44v5hO0ccDLC9e8XpsfcfgiOOUl4Q9L7at3IPcFrjB4eSREkvXA/P77LcpNBCsdBSjEL2u0wTbOJo3mP3oAlMjTFg98dYihjH3ZqlEFPNykw4aiXiJXErwsSqECe610uhZrk6zSXrvsFnaH2OnDc5oJHu5T38hAv3ec5QQ9L0OTljSTOHsMigjzgIhQ4vfHSeK/188DH2Cx7fw+7sDWM/FXOcKbOZiYnPCDAOhPVkCqZpprpmjVPv4lgHTA7sjq8WZDHRkJ6KTtXCU4fDZX4ybKQ30ugaBhdtpXM/uAasBc998DGqwPpeekT22XInnq1wfbbM6Nl4oMTABwryYZ+ejqknuCeCyAebUVHHKDJwR9hyowqP8eBW+08fzOFRXw7hAZQESJHtNCS8ZBHCJxHhjmE9uXBkEvfIoWq8xZLE8dSrL1a5eyBhYO5hgYG9FjtjztHpcWFqY72VVkF0CbV0YBrqbXfloNqXaRLShsOrxzffOzn8VpMuqLRdtJjVdbSEnpeoixuptH7ZizSJjzmRlFNwIv2Cvi9zlsN+7Tu9io1v/yf6bnys78rJ+s6fu9uUs1jYVoYesINZrJ1OC8XRNDs0flySEtVK27p0BFH94dipn0lPsu6EpBrDTDBkS7RoH66R0YGYDUTqzhldyF25UKdCeFBlrR2WM2GP2DOyBrv9fWzg+1WJ+ODsdBzsy97NLw5xosEhTSh8/N3l4en3hg9fGX55OkorlF4EpkWFy3N2okCgrR5DpqffmI6u7Imnl877I6ko59r9XosKpxxw1oKpIQcrcRIDP3fLn2tRMUEUYOm/bDeQxkY9NngGehRn0+vhW+npPKiLA4D8/bkGlRIh76ocUL35x++Alrf+8OHmH+7aMdWV7s2UuoTzmndN6spMmT1jpVrMl+bfuyedn+3rIn+1vs1rgDzvTXgLyeHwzORXAMfVyvjw+2Qfjw3+8u1o5KX+zMR90GGXec8Efs9G4+0rZJPRXr5t+h7wFmom7dMpyJrtgeSQnMLdsLpDM6e+yq3NTNcMOeTrNRwS9R98YvFXBOr2Uwl6Cl5lKfLe/eE7tzbP335854hBX/YPHZJ6tvJDKalfzehoeCFT0PLWS+kyZ7eje2Tj2UmvXRjz4lMkpC9nvfb8FD88RYcMAq714hNfyQtLsZ9gfgC+Pjv1NecVQomwFlX3ymeI7nKnD6jNOc85oz+nBOdkCE5ED+5gEiaas+5yoSHRiW7Mtfsr3VoUgRHukngs3MjHd7Q4Mzw4P6E321zsn8qUchLNO6NX/zx88F6J125lsTuivFvI6St3OvrOmYwLPFoDLMQg8niAdAZ4W/2Y1qY30Il82DNJl8mhucCRryhuh9NkimQ2AqJiACA6gCyJriBRGAKj988Or98NjGeMGy9uJjsrNMMRKU5P3zUTknxPOHkuNfoJndIi5xB3yDNNxuGibko2+hzZxxfXVgAFqXS/JF+IkuIytWTBSxbht8Ojnw4fHFf/32AjYYQjh26vw2ShM03FJyOUbctDSQdvkpP+/kyvZt0X+o/vn0Ud/B+KmvoBhC4GfPWGSYaAw/8YGqdlZByaLFcsQsMxFOZulSAlMy5hUOna+E3llhiGbodBpxT8LZTg3kIE8+ZifOfYLurrz3iFaxOAl0OuvwFJxUOOhH4lDHIE5Lnvdua6gQOpo7yT+6HYoAoMtkUFP0/tBq1b0bk/oHB/toIrqbdIt01UNaZnIiVT0TA/It1j0T5Brv+IrI0FbSRlOZJMxpWZuIPZm7rEo5C4Vuu5igR1uRnk0YJJogWVQQsmfZ4tCx4XNxMyI8GMRCwCifTJal7khBtCVuSkiyEncvJVy4iccDXkQ07uljhW/n67bEh5qNi7V0Tw3r8PzhXWDz2KnqTqKirGJVRF2kxT5I2cj1Yv3cAtoioGG8s1DUZgPTG6cGrr+DumJ34Wm8GtH+BDG3XX6EiLZfNhQ+GN/nRU+GnsKipTIO8RHLEcpXISn/LIvhaNhMEGC2WFZxwZU8voWHkNVZSHC316XR78fw/l7BJUIsID2SHcQRWWUjpILFnh00wwqeEeLrh7SJbQE7KPP753ZHTk082PjpT6Vjr1meqsVHsk6YLemXXqjMaiCXu4Rnr/feQDPfTZeNqxz8LSjn0mNw2CHFbhheAjuQef6WmF5faG5AatJqLpuKR7TVyM2JKzNTu6cH54+ebw+Je2ciMqDf+4zKNRW831s8a3QCYUGhkascQFRcLOFvCzFzhe/lzVQpYu40xMPZ4h8b/hOAwXGgC89jedFUsp4lIddfPDV0evnh7du1SmFhCS0QwwySkbTjLqhU9/pe/TnznY9MeIcWhn4hzo2NY6xav6rOfXg0olTl9uUOpEtMZHlQ2usKqUjIAHxwFzh5++MTx2O2Iz5QxmY9KzTpZr6J9Z02PKY4LffgV7OiZIyf6U92kdp4o99Dt0nJNvV+Gc9p7bPfZmLq7p+VKQ18t8NheHwn4zeuXk8Phrw1NHY1YLzmShRH4hIr1QohpPTaP6ZQTduaKB1iTW7yttpCKygISpVW+UkZCJ4S06FhxXRBaqfeWtbz6BgWpfuShxKzClNYy2zBCxHVSFRtPOIrZ4Qh4gW7BXC/x9Jz7lXDwzkhGFi7ksfdC5zGda6DAP9dO1fgc2iK9BnM3TX0pK649yOxFXJitPauwMNg7awkMdg9F7F8PCk3IHSng20JwySjv0XNAGwSgr2gOCBGQvffPkyGmhaLO1oEjCsChgVPeQdRVkhlwviYsuVVrIFzXxkU671b6S3XP7hvf11xP//gzHWaoDbHTtHsjLpDqkqQiqSmivS+QpnH77EFbOF+0mDsx59MUah5FzCPXFZSlcB3/A6KMHo3MPfgHVJh+azK6xMt3RK8fgGYvoQocc6FKGQaxx8Am5UTTPGhXYNn2j7U1O7+y5zhEaS17ki9Ey9nW/P7PPdM7wu4ubtz9znaN8wXEx4mhewsWYnSw445IvhA8QsfHvIHzkpcGayKkyIR1D+iPKtAg367AQV4tcPRsRv0ywa/h48B7fOGbjERzBhdAQgCek5uWIQ3G+d53pU3LyGZ+IR2UgBht2M2EGQRHE+yUtzOictTQj87VpjHP6qI6DTWQEPqxG4hd2H7aQ6yp6qcxykLt8JtmKa6Qj7w6v3woaCXiljRcR4JGcRkrk+72nwTHCRMwGKDKlDNB1bmZAhLPCGhmdyb09GNJeRFiIuiGI/wClLfIbjecmlb6SNCuenpCihX3AfTnHiNnXayoM0g84uPqyu1UUBX15jrZWAwpC7J7UFDQeqiJBeFZJ2oGuTkznHZNSpVJQik6509JW7rA1RuitQe6RpfKcU8MzzDoyPbXPhRMO2kQaKmrE7oo1SENMoavmRA9FWZG/wWzi8Tgst16bYuSfqt0jxMNntSK02pXhw9effPjAPUNKtEHOU9q5jEh3tWkhNGH3lhoXlAf630rFn+9sqKKgAhVh9eT1NzEKO6ENhkImh6SrAC36bam8iWB7vFu5RumSmrzFr4RLGQiyuiQHL7xChQwevLf5lp6qjbPp6DB42paf1xz3NaqZBh+Xn+omt3gD/7FaWwOs1QPhmjXnRtPyTxeED3OA7wdO2EhrSxKyvn65qt45EFwZw4RNriyXy9mdigmP3X7yxftOfc7pPqsU55Tas3YeIqWSlwjRyYhff2uEJvnhIptuumTNTbsdN12y4aYjM9EtxMgqmpJuwrqZcttnyi2eqdjMcQvnb2LeuInxC+2LyLiILYufjsbLKHwMf/9sUOxQuAqCnyvD3+dKwPe5Euh9LsK7DnXdz9OwQzjXJ0BBKCKJyYvg3xjwmw6obM4BmZ7MwiUiFHsZ6spRz1+OBxOZ1w8AiQS44qJGGhBSCRZVAVFAQRHwCVjnhTLEcXRjAwj6v5dadblSM+ZH12oUBO0+QbVPidadFwLUNGW6fCFS467Bf6YqK+mxqhJz+V76Q9RGWWNU1cUPPeki2yX1T5REsYysCMgffrAsAqsyy1x6qlTgOyvIO02LsOrUm3hLcOtNvhwce9tdN9fexOvBubddB8W992+/3ca9J48t792rT6V7/+23odQZTkQFcHtG3x9i/gfrz8iMt3bMePuzKeVvLzb0nBfd5hj98S7isHGigm120M4UuXLSWkSH2kgh9dJaiZXdvFa9maqOdNihZq20EyQ6TfvBiPgsVJp0wYquD64hazpGLIMbeROhzGrdhTsi8w7fYblFdkIukXO0+XbYrMfNz45uvf65WY/6/GxE+0QgO+vERPi3mJASpAl4fB20hKLGeub7Ej5GmlAEHa73e0USzUTyCDoKGVLZKaf9HGT+K6TAA9xs96D81lJNktTXuVoZ737C7FavwAZ5uN79ePjG61oyusnMuX42l2SnZArxqUv6fuhHizyjiF9Z5rhQ7BTjhhZX1MGzFKIBjvIk1bukfqBAeyrbn0hybrBfvV3u0PDG3ScffRx16L+PvIH/AScTgGhmiGDHlrpVccVuR52bUM9WmwpMG0gYuS+0yp9wDLdoV747Z1BGTiLhED/VXcAywwdHKMTv9BteRRvAXU/Shb5Dbi0HzfIBjgXlS1I4GIcVdqUmNtt0mL69vCaVhrnomcYdas4m4jJxmWIz4Z3PDtY4CBGGdMsTKs8BstPczg6VOji8/Orm+TtRBw8nq5HzoseajhMNHBbyDcFLzr8UGA4uNjnewZH58O5XW6/cN2Quj0quDU53cVTgPHqcn4NLdk2ZVZ4wtrSEkdjaXijzJg9F2+GIdGH0/lubX4k2aBHcb1ZWREtbq+sBnNrJ5NUA+2J/aTFotdqQyEPLYevEjeEfX403KnlBLIl9CwQEzqj0qeGkg1uH+QZsXOsdgDuUsfk0uP1HqIgrWUiDqw23S5jN8MKXZpcUlA+E41UoKVANiII29jrcRkMVMGO30RuWpMbVHIPjVg5lvCbZ95J6iIFmg3U2V67/aevGhxjj4zsbYaMl4y0Vko/2PNV30NYGnxjHUlp7whEyh6Mbcr5hLXoecQF0gFDR7/bke9sFVryiK6I+aonr68elfwa7kHkn50hExg5BUTpPFoII3oA9spN6wBLBZKf4MKJaKEIs1SOuW3ICA63s19/ByQsV+vMR5XlRdQjR45cPUjuNBirp9oTE8Oi3rtUwv7NoF6ORkfMlchLrDWu2MPWnLD05yU9dc7L0Hn4xfOOyLT2EUkWlFbFKKKwA0cD9uKxil+HskhWOp1JXB59GuuqzZQYUERcOPBI+W69+aMceMUKkk6tkhmd51zZVU1gORHqtaPdbemgDxXdQ7qB8yY5kl4Pa5tUrdL7b1Sue35o1uCSb/zHe1GGHvJI47w/nrEpg6ddwdHFn8HlJ9NAFmpD1ktyxR9b4kXTsCZqJlUfg7CCdfqnu8uevpxjBfIADoU5B/mwd/dyd9Uoxi1dnkHxZvEDju6uL1GXferfCFQszYknRY6hFiiUqAf0ZCR05rIw0GGrg6BVslEcBTmlLMpf8BBpEYyJ16fT7mseOOEepkoeY7sHHknGsjgisgHwNYUpF8E1opxt8nLNUz6J+Ww7B9W/QZ6sQggLY8HRQwHv/d3xIVh+FmuxXJ1yUMlnkAuyk7P6jGAqTB3xgCmQSp+Af+WD03jdb9+8N74qBWxCV5yULm4hLSAZ5GnHG1/Ohu0T9P8M7jmlSfwPBfCnnYwVaVLY+qkLHJx32Ud0+64orKsevwTX62Upr8v55hRFEXGvX4NlEJoLGxsmxgLQ2QpXFO2974E8WuW9SruQQSzNcLAmzVrMfhJnQNGkGoi7NlvNlc513SB63y55zKCJE+slnQUFr95mThwRCQqP/ZWt88/hNi/7/RWSVnidMMLkoW4JKiZu8TICs3Du9msAQVIzSznGSSPBekVlKwiwKGPjy3PDOMfdP97IO1TuQAgx1+JO1+okQxTkFvBW1hr+VNH28R2ebSpUm29lPQTDgPe1iDjG7Q705K5ZBAm3WILj2kvqFMo4HxFmD4hq8KEGB10ff/YG8a3e/+rGhJ1zAZUUHb9VblkJcXcRCx2/kj28T9fbL7Dg33n62XRPsmciSycWS0V1Athqmg8GyR0o7dbXoUDABIvDfUtDPJ5wS1FdfHwH8KV4fjuZLCDlgY2KGkOO2HoSrsNW6UbpifwdY6lDUhtOQUEUGns8Y1mQPzDjUc4SnU9TRVcBRoXESdnPE9osQi4CVvzWQcPBgcfTYrtIMdPwt2Wpxqzeqijf9PmZORFq5ck0VZkVDR4oSOnKPOoNZhu6Tf0VpqaqKldTzqp2eV730vCqk/9QzGIK2iFVFxj4kbGBx+qk4lFrN35tYFoFsYnPOJOYulZM7RUZOBwHpsjFIsB0iGExwPRMkoX0EEVV3jrlEYbq0tZR1mhL458Wg4ipQsQhx6TEh+Y/05zwpMa5kASxTTQGccENIBJx0MaQDTr5qSYETrobUwMndEkfXv27j6BIssHevP9XY+6/B0UWrPeGjhxMUvRMXQUYtcs4xx37REdP5Mu3VUJuk/eIxqspEJQ/WbKn12Kgb3KWujm7cgEH35Kwp+zqduU28dFcbkxwan1gtivjrU84V85kK5HvLUljXaNOpsV2nvnX/hgLsDmWFUxUabJJ1l2RHJEkJpnDt+6wrdcujG1t+Z4HQ7h4qPEn5hnRVy5Hp0S19AA3zrd55f/Pz97xaYcwUYkR9rRFXisGcG+NKmezTVbZ40a3pMb6Pjrac7eiNE6oIGKF5AgByyKmBi7/Q/sa8nN6MJq7s39aEBb4nVNT4/gzFvEmNqo07VtxJnuNzJindTbwLxoBThlFmaVm9C+HmffmKOheED0AgADtU9JRx0i0BhHMIQ2wKWFZHgU+/oi/Ry2xh67dV15fIxyHLFu4BOoBaXqKei1yspft5XJAA7MmSoDtJVWWn4psfPHnn09GJB2PM5PUFTuH1lRhpTRLjo+/P+VglM+air5EUSK/PPiH+TnIeCWp8Yx5gcT7FU6MvieBJdDOvLjJ2OnoSljTztIT7rNtfFDHe0VO2rZDuq2/Todg6LSvMuWxYhbeXG6sy17tjxlqrLDC18mPC1SqQ0RkvnEIDNv2XB5e4Br6NnF4npQSxnIIYSMZeAN1QHr3dSzvyRXKw8hIogI1ig74/EzaHL2xsXfpkdNvX5+Qu6Qgn9aj8WqxLdqr7eHfC4e7Wleh4d+mLF2iT/UtsQPKBmTotWkWokk57ou2sxd+BZmKWSh58/GTClVtlXTcTLlJA0hgV1IQurlG/UJbRJwsXHyeosJ+20voc7PflK5vrG8Njt36gZzsndSt8s206Fc/d8W51JvbK5rB0Sj+dlcfpZpTBw/iSpzDgexNh8WTMehFkubXLyal0UZLd8579hN2KLBQ9Veoon7T76Islxfib128OX/vSYb7ya9aCGqnyjbVJxFTOUbFnStyDUil1QAeuPdCB71mM1g2fuN0rv3nOv8BhLa20V1kweLT8liV+pSQoPnstEhR4ICpRETPzGm8xN7HA8NBKvZe8VKavVd2EvlV1O9xvyWBkptJ+a9but6oT/HBf15ne11uho9Mr85h2Yhs+gzeP3rDpq0z4NVS5hLdmPMLbClw6FSb2XcDDZmOvI+WpOhFGIkbNpMeHHVHULlde2yWbP11/Qs+AF8QEA3GFKx8a315/PlQIXok23f/0DdXF1H33JOMi4ExSJSMQHYVRoXAVnIetJTbFkS4GnRW4z5Y44mDeOcFR7ZozJFb3Lgm3UN23LVJA5zKdJYiWp6JpDxQHJJk04ykvTSUIlfEpJE0HTyhh8+cLlRWuDCNGoeiV3qLcnomYSOEro69Vr4S8rmSkEiKYLO/wKYey3bi+mnSsFm1B2ZJUxIR3p+RmLkrLu1L6REKt9qU4aZB8AxJyJgVlkMAz+uqD4UdnIohLxBZihCuMpx3j2g1MXuGtEzZ4K5QN3nLtLJp9qC6Xi1u6RQNB4EcjNMpdMuOsrUFVLjLKsm2p5Xipz+epqv20cXLzo0slkauFl8Cg8h30ClGU9+/E5P1vnCyLUemxvUw6aoFmsZ2HFL1+2kMq5Dyb0vvv8hNJeP2UAXbGq/nQB798zF4+JUtSxrTwno44Up412zCWVE38An14FNsRcc6XD9S/PK0b0XKoDzIIxc6k2CyRKGsIReGKcHwLybGsdBMDhdVMK5z+9VSfYLCUpgKLS2+Ozv6l9P6LdFd4tvoJShdVqznVsA4uvcmfYpI7zC0wM7yqJtd0ZG25nRXbO9Nu5ewOpk1kz4xZMW7BuInhZovZKvNqOsyrvSBGQkDs0wrU3QrYKZD8PyIk7ii8jIKnY/j7YgnzTgesO13CuI5uJ+LIXeMAclcAjTvHwOJLZZAYw8MJCEwxh+Ku6Ulgaxz3TZVBleOpEqoZR1G7yximApx2VxCLgxVPDmVkoEcB4AdDiMUSbFhkyFACC44TpHOI/cKp4/zWMEv5fGFaZoNL9Ke2sGIWnRwp5Flx+JSV4ET1tyPWsq5fY40XFNBUUHBB5UwHdeOqxvVM0C7TqkxUvMeS3WW6CXSRsjtFbotgjYSqCNTo87lEm1aJaRJs2mWXSy0TWSYrxLFe+mlCwwXGhLAvOlxiiSrCc3FnYKS5sbCvibeEsK/Jl0PY13bXLexr4vUQ9rVdB8Ub9i/bhX3xYyhcb08t7/2X30ZFs+CcB7SRip/yt2ha3s3cxw1W+NOue9XPuzin8uxKKPC+cXbr/l+s/IORDlJdfvtPIY65vCoB2Hq7ynknbvqWaavKxSElOF1JQuU78nfoNdzF3GLd7jDAD92Wgowkq6PK+1snb3rHlTir2PnAwTSr0deyJfOBhSnXiIMrWGGhCpZlZ0o7ilwpSCpwQwoCrheEPSWtpyfGlbRKgWa7F2KLn6dBUZUmxB+L3O252+LReVZoH98gG+XaiTG+Vji9xFY9QiWm6lKLWapXKLCzswaZm4GUAtKOCkxSZe0liU7u0v4Pt6URO5zHkWozqR67F/q1qLJD7nqLNnuU2+jT77a+/vIncutJbdEf47akisjZoRy2c9s8flUFOZVrPiALB1qpRcfU21EJUAjcYDNwzW6w0xEQedDjCKQ1n4Knv3zy/i2bgg7vmMuewMLmYCiZw6x2REwc4QUePgmFiU7CHJIWVSKWbBklS6EUb+KrCZyikVDZxJWeDeW5cH76Wlz49+vbXlLKeSRaiazgA+8pG+pQfKiDcNGjHEpc7BgHZ6RnOAgfK0H2NxlLhwMdNDcoo0PAdVBP3rtNCUKnvvgfGNc4Uz151XnaORUolnuYPJcvCOZC3d96NDjAtbr4NVXqwXGR7Q+Do6mAvd6NIK9Hxx8O37oyNueYzXTEY4JNQbymIy426SImNumUi0067OpREplkcC212eYJHwi5oT0y5hqlr0RGWGXCfXUwmnDDU59VKk0zm99FPKq2hXOaiXmY7jEWXmGaOJi55xWyKWKzKCmeW9QQ95xLJpnn5Tk/6p2qnVr33zo2vP6xfwSyXax4KVVnQp0y15hK3zVmiUFw+il97buQ177jeC3a+sJ2x4u8dY3avS3eS4kOOqCAh55om0zzmxF/JK6OcMYBHxbEGk5ONbezknFuENTc5XBcMtWMBNvFiB/2JmUP/P8v7tuapLqONf9KxXnRkyLO8eXEOefFQRfdYNxAD91GcSZigqjuqu4uqKpdqkujZsIRIAkJZLAQkpAQYHOVhDBYMtjcLPHQcuiP0Ld/MZn5ZebKtat6xh7HnImwRdfea2eutS+ZX+bKC58ibnOBC/mp9qJ0yFKlxIO/iXufOgeD5fyqkckJI7RVWHvCgj5HSdmg6vF9+JDNUu0VRWsRj4T6FlVtNbzfpg23r70gK9BMVSDStkQ89pvYCxy+jh34Ws9PEZ9ZJ06AoEBWh1GmjmWJsr+sEtRYE79BE9q4bVtbzcaMJnh0YWjrEPrU4I+n37UZCz14XW6U4O6bl9fPIFCxRuGcPZaEGi9AP1vU31WCTWr4YadAddBcfi1RJA0yD4Kbl7V0d4uKPx/l9iy6/yc1OzsNKSh2wvb/yDSQqjfSIoN0MN/h47xnfTzb+6PKRb7zZ67OjTOPectRvZ3OrmbOuchN3XOBWwPDAi/1zUVWtn8CTuqf49SzblwXfsdFUaewYTdbEz3qemk3827bl7L9yZe+DqVuy0jEbQ1OvGEudSXt+7NEWWfOhG3aKJxVsYYXlFjxZbOrArXO9AfeRpnC4Mm0W5YVVGp6QkSIgEhN1DJtxGK8g3Z/pIhIhm+9uKLFi6ECRiXsiJZIXPcaK0fIgY0pCvBJPijtHkTbpBaeQ58ff2zaBGdZPOAY14njKFOBd2gpqkr9puDTROodG4BnXrx8+nXuh6pFDiOOqFqi695Y1XXuhqK57+SGgi3kRpCbP9kRs3jc2knWyD6zQva5/bHPzI49mcHhpkbE+9G8CDbFrgTrJyOadyAfcPVkwNOTAURPGnaeDYjZ0XKAyg5iJxwgJ9Q6keFVR6oRak2UcN2soyupJtNDeKkirImAFx0r/kPURlBaRGgBniXcVDVMlnDSLzKE5NgoAaP0PVUjGkoYZSKgE0cm1vkSRcUUPDA4QZX//HgCDRlccKhgOCEp7BkFBUlNV0cBQNT9GrUGbSVuIf3BunEqKEVXiEkbQglK8BT+oYeTVBK0UdIN+5JSSIrnsKmA13LJ70LfZfKMCuMZE8E6yd0qcSFsd3o8I+LtUC7YXKSZPHMJg3Atlyl7gzxxWTImRouHavAHhXDuGgnRGj2fIrTGnEsBWmNPWnzW6MkUnjV2RvBH/etO0VksRMkbtTw4ckSuqh351+SP4m3RFemwlMIz2xwWKPa7inzeeepyRweX+KstKmXYV4FPUeWCHan4fkdqyNF/2Av76P72ybMbp2/S/6xrKHKltBHXQGIj+9aHy05qWUp687vdYrmf9eJKrBB7Ch6KTL+QFBYD2280eyNImyuDdwPUph6TvW4JaIsjl5tVzRvGfvn88cb1dw1g/4xE/AKF7VScIeU3tvCu/qzC0aTUt7JWMfYsDFqI3E5X+jz4JKmSqlTt+BmmU28c40E8q/4rWreDF99nl2q9kubHt+DrD9Zvf4YJqlTyxrUEebiIyGFshixwHmaH2yJxTRR6Jw6j8xxG962APcloMmy4dD1Xsv1Pux8daVTr1euJ4eb186F6fSJUtNGuVtLpiaWkblPuq5w/EDj0qUjaQNIKavMVZ8JruvAF6GM/hyg3uGcLywvasGeEsnYDheHpFDnGeW+ct/Ib0p58tSKlCEcuo5OrIjfoJycR4DxdwImXFAA2Z0td+3LghZxoGme91HFO8uDIDA6OsD1YYodIwwvdijGSaPhTYJOS4KigH/fTmdQYGfxMsDL+9tOSD9HpDFOv57Wn4hJYQr/nl5TgfuG3/xgP7TMqnRScB/oogINmevDbzSWE177Sqg9aK5gTYMTpgBECIWW3uduUpgvcvrmppYMJVKO0OHVSlZCMO+zR2Hx+ucSjp60nnUvoRpnY+LHEyosUOyeNVhRGHmknbY2pXHn3jUbpk+Jd5sYql2wQR278rMg0pdImN+b5pqUvi7eZKdFgEL4ttZDQGMq/rs27L6ghTfi6Gj6JSeUsCcHMXIoLkBeSKjb0Ipc5q3AVWKC6Fajr6iD8ORpzoT9Zkv6Ukky1bRQYqQLgaPHJJP/JDsMASP/CPBOuA1gBnPsg6ADO+EjsesJhIe8XoizQKcQYiPQPXCD+QR6vROtVyi4ruGRNLvmoGBFXDR7zkEhozXNMgz8izpmW4fSwgwD8I2MuDgkPz2jr0Rcb52/GZzR8vdDSzfRowPQsHg5xWbtRzehPqthz0pB7oOrr+WqlJS0QSyuiPSXCiz0ot9KSGnpJXBON5+GlFdFm4yBf0PbJk7EhiVDabStaLVbQpp5e7hXahx2uaAIjyB8KC2LKvh4i6l3ROTScilvpju5gYVi39u4utzm1cCjjXGBTw6dCOqrksvouSSFqne655O99Sv3TU8U94wZQ0wQrUcprJ3M+RVVr0Agb7a1i5DVZS4irPRMSwDl4OKVV9VLm9wqVyBGZ4WlVUmoI9Zge/cmzqUaIWRm8XqkGXqLodfAQ/ORF9phsKgjIGjbV2FsW2MGJWz5ZDMF0uzVmbbmyUkY65T+tP7j68rsXKf9LrlNMjfVT8Z79iWTfIhiYqsoGDhFUsizf3nwKokLRcZ64qFlRUlydRAdzKeeF4O7Vcxx4jFPm+GUnR/T4SoM2rd6VemGvf/yOeX0TT90oGGUb9hRG+dpVxrfU+doKh1nva+ZsewpHC3YHUSik7WOQ7UpiuB0Z1upS0U0cR1pLphjkPbal6BZ2ArF5QTW3nn2Sc0GQgtEXI9Ioa3SDkNV2laAm1pQ2rGSCD/4sDSvH9uJza0CQ/C4H8dWE3mcz88CNAotLSTh6Rt9Tw85adifB5RmH63Uua5MjdQfpqtbIDCObSJxjhsMNAh8Q2EtRKjAJGq2lJfSpDQh0R/j5fwv6At4bB/ZmFDAP7IdjsJkAwGYitHNUl/DQIYVBhwz7HHLAcyiHOg5zxqCLHWEFMEUOJyKWaJS0ujhsm0twdVFtxQqVup7JoYIDBHWeqwINylMUtFW9CrozU5xRa/ItHbriIq3Bl/SwYyBqE63KXLe58oqaa1RtKTW0MzTdsTspp91BI7kyMhGPODDAGO05r9J8UlUDtEISsBMuW5F2aMdMpAZhGiRpSU5Vx8i16qg4q5ogC59sJsdchplomXapst9EypxKk1kTJBAfY6J+qN55bSLxKkf8jJxO0T6jp1Kkz7hzFuUzci5F+IybDLwpP90puocvmZdcN9EgR34aSjrVm+21Z1reHFkNB5GuSUX30cy5y6U9tZkz9cp8tlzxoS0kcfLQPrdtIz8oA+Dl1E6QCuwtSP1LdwA+fbHx7QNO0DYfIGbgSe9KLlUlFZZaMlLOqdIPDCztW2i72j/RNA99i7pii+nkhyizVT1qRGHeM4PvX9i+kjok0YcoFyzJ/Zk0SksK++z0HvN5ZiStl6uQ9D6Y1GNhjzYqlSbG/KGrGUPJ11MaXjiUaqfY8Lh69e+4uGERplICVMvcEonN5x/qNuVQ2pfwI9XC8U2thS9nOP0ZWRQnGnxq7e5h2cAMV/EuI1uJuo0STrGuP7agAOr7D4/jueue75O7XDBO/VEZwTeaIieyCXAg9ESZ89EwDoeOy3f9/T1OgwA/qfH1G3CLMZk9bK01taRk36IzxdoVv2Fr2O8U1RCp2cNGXjoxoF2khjS6DwslFTVfQR8TLPS9O9s33/adbZmmtK/CNBCXc3fAW3VpEnKUhjZ5T71e8RnMRK74vF6LPLMPSxiHD+u/7FmvPdX7r7dg/dnn9ADGPmttgZM9at3p33EcDsU9f2OIzX6w0/2EDqqz0wYOKUvx4zWpZvLdCvlTOVGzkHoCVB1S9jqoFYnUZqSbu7qCjh5rTyWgg2uYMvUr39F2HdUu1eAXCqkVNyXVkNmNfIb2sMeb5ZIlLgRxeu0+n1+l7dXVpSXtnsN+BiUvZbrugrpWXlmSmN8W+3mO6kOqDwvZxaYYXK1lxDHAPMQqPzQ7mrPTcCXGeNCbLOB50Cbd9idfUSV7eySJ2yHdmWstcI9w1P91PnKSooVrrcWK8ZpO6eKBHZLGwUcj1Nf+tFJIeV7Nj+mJK23gObnYSe7zTjEPW7sPDEreft5oxsOgwlQtsZdlNbINJQ/lMQEVWs76hd/bJ76iMAxcRHEw4Tmn6UXeQVEFo1ByWS8RAibp5cewnlv5zRUuUCdFrCR6gHzd1jCdQ5ph20os2K3frJ954IFg/whxiHSlr/MW6haIT29ks6Z+oyb9oIBDoYlTJPWw19Xhzgv8HIslI/39Fe7wzh436x25feUr0jap72VHaLj2E/qu/OIpoiss0qSduN3rr0yPcbMmjrHApKlF25Bzt3zadLbVsnlzk/ORef/w0Wp52l/m0wYHv93CwOZNN5oZhJkLkzRzI28T/9Im3uCkbrLwWvPDtPLmcPmVuvTIq1WkjgmdG8FN6RJyr6AKGrXNoyoB9I1zqjV4d9aerWLDROOlUO/u5TPeMCGB8fL5e2aFCj1IIdRcpJ8Nrt0BUeQjgiBiVlWXRM4Lsgg8Muq2wLCoV6ql1YhfNV+DzXzVDC6WdJ8+2vj0D5ZcsFhp6F2UKuZUTmxR63wSHwnHooyFRa4ZlwZxVVou0eWr4NjlVrpPgt7eeQxe3rSVmteTqPeZStkcrsJs7wJFdhX9tBDai+jn60BrhLSQjcu+EIkiY03ADjsBJiRbaN8bLPVZHPX+dcaMnki9otuF8liEadwvDJy1WI3wjXgi0+YGJ2o5jHE8ESFMguhBfRuIcAgjGCKHMFgi3mkvQiIMdC1GOa4kwhNah2GTsSWJ2Ar4zPD/Xkf+exX1780Av2P9vxfoOyD/O9E4gHgJz8zlUGYuAzFzGX6ZC5DY0XCGT2cyVCqAcIEykdcedooIA6cC/HPQ94/NK6Cp/xdQymGUtb9LyEMgjqxotXYoAJrpHMw4hPm7tH1Q9VHPa+wHCRv9i+tF4a9VDQfJ1G3QtdB5B8YpwgOuAmejXnWNGvVSdbxGmnZddCioOFduQTQfcKF8wMXxARPE1ahHXHn42k90JCqRnH4rQ61rI58Jv1507GAmwV145wIVtdpN1k26cJtVGTqbi0+XnC5O5lxq7Tc5Muci5LUoklwajfHK8A83iso+mdLJ5JEpn0j+mNEz5o0pnUm+mNEpwBPzk508MXzgyBGVlUd+kvwwtX6LS9SxVl2WDir8JBY8cpxC3ZuvDl4l/fcKwjJ0vGQ2r9a4ecPwv0lAxpLlKjRTJEZDq81wRiw74cmIkszFaye3bp1mL/w5zY9r0eyR/lJw0EZloYZkZDvMa6L/T8AQm694wJuFFZ87vfXm3fX3z6mZwXURH0oTYbIHqFIuUgklC6IzRHdhlkWWcrMomWDkQEzHuGnnIjcoISvEitFRsTEu0i6ubxGCN97Z/vjq5lWNJGx2CypFKK3qMYMPpQ9kt1htg6Nwn0ZmZBhL7KXynfCieE6+Yr8WhAevimZsIuJVWFLa5tYL9QUPuFiarAB1gSlLUg1nTgfm2q8NGSLaeakxlKBlyvTo2e4DV5GgOVrHgm6FGwg1YfvQc2Omp89vXLi//uTz7Zvq2qw3AEOEsigzbhkjrW2MVxijvFhvH0O+ZCLPUZlcX+keqogxi83nT14+uRYLFHJjTSSmorEtB0YKGuAAzkUqcZwqjC1KB6FYZ4zxRUUxzr2jVneYgAaDnMffrV95ZLH0bWq9IOWDCfdxa1K4H+gw/S3dfJT/WbEg9DAvUWYx4dxp57W9rEF1xhI9klMUqTDefH5x87v3EkKl95/MqcZA4lTweqzIOwO4OpTTJMIK9IuSpk1U77W2x+ErO3Iocz8nwnm4UrlNAK0EcXGK+BLFdixgXMHteEgdaMTussU/055pKtD7h4vbn/5x/c4nXqAXFdfrPssep+Rw0yObEsUtLujbrzMQLksqvaYBKwZeflnc9MJg87MHo203e3STBB5Ql4oCfoLYgBMhGRQL8Crt8osI0Vac4Tq5jAz946KyK6XWLr9Hw4C+ZIjTt9CRfZc3qckLZYmvv3PaoEC9WGrV0Mi2NCNyNhR2D0qzoec/7rrSjIjAoECOH6Yg+xccJoK4XExk49bZzWdq2ixLfyJu8smFJIdoGYuCCkNsDjZbXE44naa/iF+/QkU+xLE3RMBIR5ZNgFVi0S+e2/jsEifH/+GKl2MmcNgbBEL8KsohY0WbPFKIbJXfwX2BFW1FUorvL3RdzIP71pzwwrFgtPn83e2LZzQotSlVNBjmCbaXTSVeFewMLhLFA8iobkhAM+NDLv3eay7PWtQqGi6dQkHoZS31QBJm68a9rRu/j4kowq6K8reSfQJ21ZSO4iOYQ98TUgJ5y0oBdU9MoZeQl0ElAzSuVg5IzQKSUPRh7NdXVWT4kpVxqUk3g3muOECyZEo9YFalXCxduPS+/owrEtNrYRVXbomOS/zoUxeNHbh1UEch59ZCXpCSxkMyeQX6/IhMXvlr54zw1iUu9uLlXPSlwwtXcLi1iADSCCyW6Z17+eIayYD125dUvxGPmpbHLAhrireQYhtbqHgnp4FuGwQSSGUeR+icEVXBS9AWwoUIi9j91u3pAmJyyKUDhBIwJpJmScLSiuwEqtPIcHoDuWCHtFgiKAQAiqRWfqcrYvshtOvTh9unHtCbt/5EXwkqfCqzTyyl6imOOTfaepAjJU7HKUNm1oxLCiCje6hvNtHfOn/WUyOW+uxgoqJF+7W4Nr240t5EwEi/P9RyHiSyuEwiPc8GJTzIoWMLrM57HkDzxy6vB4+I21Ref8SNv29eHRGIxi7JwYxXlIHjOJrwAzOIPqyNmJHQs8i4mnTck64bXeutTrX9j9ZeoTgWPiGN0uV91MpuBEe4618rXPffJd5pkTv+sfrDhi5KydMOtSz4rthCVEZ+/cIZFh2/LWs+n4DrPuNczRSgM2Q+/aD/lIspP+Fhyq8m6KeGhvHUsPFowD0t8icl1EMy6ViOerICzcSE9MfrqUYz3c9bl20jlFxs4vqfL9Dv3A5wMd/dmCJfLTJH6snoE7l1maTC1ovf2gvXRFw676lywfa1L/BouX0IR2tx+SZuwCIb9eTvJ4HtgVvyNqSzcknBoMQPcBFJieGS5/JU/K8fU1rTVzKT21qLvYYCuviH60qTcECQNQ7hWs63oj+eoaK7XP/y+UebZ6/oSo6yQy5gDO6jbOpcdquaC1witavnqeoJeSJX6RnsTpuhJ6TBN8xZjjmjrmrULe7GLTxYoi2tPnoWypHgghyWAA6RAV0M5GpMHOJRDRx9kHLyMA9wkkiPcV4vtuImxNATkKS/ltzAgkkVjKkPk/k0rSZTsln2ZMaKmyjBOEEHJbcLgj0wl5kCbgBYlkIG+s863DegPRvxtWNqfYZApIZESwB0TwY8HXRqRRjSa2v3E8YcAXI7gbdfBtTmSE33HgwxKVAqY7HZAIwcDSUcVHX8I3cwIpHZHIM4/MA9NNUclHJQxtWk7V3Fl5WuyoKynt0XVawrVrk4KbWkyjIVtjcpL9db+tRMV2X6qawnZl1BuGrQl9WEcSaEc9k7m2Suy1u14E3M7lMBO6WCdTbJQJd8Ol+TcVGyRUFm8stlVpRWI2/YYXzwSaqEj9s/6zE+Kbr451LiSi4pO6XKZ5NXauRMckuNOWV+qfKp5JgaMw94pn68k2eKrmhKiJBItCM/julWrWGrwfie0nV71K0RrT+a8wyeadOSP7haG3Zbi7zXD9vSrNhHUi+irg3sqYOxXtFW1qHrzPmPyc1JZcD88++Rs9jJ0OMThzQ5SCJDGrScBh3n6oYjXLiPBXVWcx7r5x9u3tPEKE3lZZtCAzZ/1ldASzuOfVHgP+P3tsWdkrle7qDZp+jEA8h+4u3xJmei0b2oN8QNTPToS1xAVKqUQ/4rWnFe+GTr/avr713f+vzU9tWT/p1wBIqsSiua7UJwakvSMNjCo12kXfrx2CRovZRAvUv3530Ccm1irnvR4Lr+znmNnGxyuTvd0KEfJCO6XFDQ+lisSNoMNnWos0ibkfcqbVoelUqE5Oedwc1dQGVfpE6w1pCAidsXqLwvJU5s/eFxCm6kpiYc18C5eLL3Sd8b/R7ytNGDEaF9DR9AsZ1kydaAXxHee1+6exhXTZv85M9gCNFOL4Gk59cJfaIxi70pXCCKelC3X6XdJUlotqHtWp185SgeR58EHah0W429tkKEgf9w8bgAiXld4JtPN858sP7kQeTKdghpn45uHyXG2s6704GW3HE4MS8kzWa2xPw3Ylf0nffm9VMbZ++lKFjyy3B30GUp8wgLhqsErL0rz4/b1FNBpiGSz6jUPb1QlT5h13ZojM4tdha8JfrWu/c1NJPjnG8NEmF6T1eG/H73K9J02Zi0KTyv7WzqHMbfT0xqoG8tX9Y/fo84WMsXya0x+hzsHwizolxi969RHnAsnviDjbbW4mMHdwfQY/vzy+TX3v7keWzON8h55POXDJ5sAQWFGuQrCH32sARi411r+tQ3iXfKaM8Q9QDong/WnmMflLtd3OfTPerUrk2q0W6qNWENriS8RfPFNx7f2D714foHyGtnySAlRZjFz424JVw47Zh1URcfiWdcdEDbMi6IvGdcEO5vc1g/BatTpkmbPknE4LSlJ5s086GmKnwKYQw1XCBVf1lScXFP1DInj9I825e8sgbO7ZdNrGOQgN+j0dHWrz/fOv+H9QtvlfnjL3pQdMMRf0qVhHUa+ifVrmFLD/01fCL6Fxe9oStbk2E2TTZyWHzx7wmdjcTo0B+YzOaHV+m/2Y0mWx0p8LTBRcaGGEvcxl4gJW+1cW2dhUIPrA7kN324zHKXJ47Ifb+BoPU3n9JtX7/4xFx3SyDBYkFaCYDR/4mH02eyKhosaPXiExZJGrQq7XMoJWHI3hT+ghDBvnZ3ocmbt5wit0u/LTqCdlJ+DS98eWlY8KYSncX+ABWbknQI9lesXRc1+sHD9du/o+5FW9/dindvlJ2+qcYtvqfMoB8yg663YmLQd7f8Na1T2614w0iGUwp2uGGU2nAj3DB6T8L9oifez+/X9ul4v9h7Rhx2/Q2ESdP2YHc0UHe7j//yU/7sbSJL/8tux0KBGPseG6l2KxZaw3p2IwYNdsuGD5ZrlqZbsfnRVb8Vy1wqItBMc6Xu362hdqZlgjZLISb/xSyJGv1Pi4YMex52baI9dhtrN6mVk/b5Y+88vZhdznAr9Yznj9taNGvL+AtvWaPmsUw8uBuqo8zAmuoqWbsXoOr3os9oqYW3jgQVia/BGxquxCekeTC/220KCcEZLEiv263N4EGDOtA6Ae18JvxV4KP3GU0gyXy7MrSfjGztHvo4LDNy1LZtzsc98ODj3dvw5tMOyQoiQeShD7nhpqoYeUEpH3G+gcQXyGHOTBYDj177Y+KUYJcoXO/v36JOI+tfXxuTS5PIhlQaT8+VHTzQSeR4A+/ra06Odxtrnsa3uNgsYttLiXTkIbghqwMKP+V2ORqZ3ELPtdRzbv3a+xtPHiXKjKkoJwa1bHmrs1l7ZR9615M26EhsgRFtv+KxiMf467c2dk8e0R2wvk3LCyHpkD7KvvhqbbZSQF47r5FTb+TlZ7e5v/fbd74JVG2WgWqT06D3Jbo6Qij7ZMUTrxqT4w/vfGMak1DyorihuSlLr8CU2zU0WEbNES1N0xhqVbaVHqruKNJb+9Jh3vadF4lovKttDpDTu6pE/cZSI3jkenAtZ6TOrH0JP6AE2tx5wWb1m5/tGOTF6LenfRQTRmb3lW6QYcCClj0QTL5QM5uj7lkVYshFG+pvNJ9GLKeS0eT2Utl6sUnDduHvz1vjsPVSNWvJP7vcWElmCnlnZc1qsmbGbH6qXkjUv5uzahK4JeBBPVTBSUrbsGdtxlvoFRDdq4ZiDeUbvicd1B4uojMcvUb0Z20moe6phLenHGgDXwfUq5B0KqDRnysGNXQLTJsQH4wttOpLvxNGAzQLaMnQ2Kyho1lFRbOGhwCCvAx2hCBnHX3MKOZAbqN0fVP0UgT9v8sU/ykgiVnDEAAO4BF08KyqdFPkNidRt0nRSlojCdalCnQguobW9COFRSBe30yZJjVaBK3lmmZ3UDBRne2OWsX1iYWLFz1ze0LOS4aHqY053TmDmogSXfflVZ7vSpJ81gWuaO0ryPbxtnhwi6sIPKSibxpCTxszil2tolOlUTUTbcKJJdFek0ESX/glJM6oG477E3aavd1UBpvvbm2y7IkbN8CdcWNPuj9uh7Pqkht31r1yO0wLjrkf7eCY04vq4psjB/WRH4WgsSZviIuNo4FGXPqdHiOqBOruhTZgoW+y7wPFNGKH9/EKz4NrspNhRI3HTfGwaUTC3BTPAseD3a0ow/2IdhYIKiZaYjvtEJfNROUqRwFzzSxj3q/Zt1Ix7vhowNt3D3zSfS6Zxmo0riwfQZ4tisDCkgquFbf2rOvW54W3tz64YUvqy5ro6l/KJ8V/C3m4fLECnDSi8euuGHHMGKQ115QL2bXClGiipMWySWNQJz03jMG8WZs+O2qz5kJfdz+1WdfEGOInIRSm3WqRxyBUXpmGJmHbhZ+BsoKlzqZRHxU9TKvQMwRHSDjw03ynGlcvTivB72wlBWW2UK5Q10fpRfoIPD6w6W/W1sdn2XkS3yy5ZiK8VA0/AGsJTGYC+fxhBDb6QIQJHrTE4rXDMkjbdssvUYeb1sdBLfaKYhU/XBxKx9f7/ipt/JYcB0/zr4O5xA+D2cz4EsAAlo5QzhaQOGD6oG/9SwlSJGxDwQnSr85wDfXQlb59vSX+ReJfyufX4Su4PkwNlLYuXrXuSUKzV9MeJUaxi4BgENRzSm+gHUyYHhUPfR3k1s+gdgGBxOYStzcP02TgSHe3uYQ6BjZbHXo0TLmHYZjykpfGkzmvf+FzdiY+txILnX7goOOUwUBbi2u1CNQJ/MIXwZUZKaSWi3ekVXCYdEU6tRbZTSfh3MLgtA66qsXFLn0l1Io23fwPvvHWVc6op6ikzGUZ6Dcy0TIExqKLKHLwsAfywTe+lgGHMKIMFMw3zrCxX4X8pA0cpOVzcC/tXWibZNyd62KF4FW/fZFw0uabFwO86gba5unxA+5ZUgb0ZLqE6QP0qjgXgDCwsIwM6tfL1VRbjaOk9mT/pY/MGjrKynKpR9X4UXGkxmX86VmT4paBxLnVXVpq0HJ4/B7fYHydWWKXicyTc29vvqW7q2/Qnn5kJfXZC87Eyxnx9spYTvQ194Zo0XNC41T4YWw+ugdOjmNrbXZXEhBQvE32oITP8mbsgmbsUO2QmjTJ8XE0hfZwYcgPiELP2rOmqdEShYv9dqGst5+/vfHr8+kZFb2FRIXtgtf5SOQmRsLRYRzn3Fa75OpCHOZwoRI4SgjOO+BnQStcbp67w1B36ENYWpPj+Mi4At6jx9TkNus0YO3GIbio6I7Sko430BGaslkeDtnzJUbk+nnSp9c237yUhGsgD1WttF095JRL2gHkIVlB3J5KA/5bqgLSRUGNuxS0Q241rd/lA1o2gJIu5jnkib+XxVepVeCsGY8ccegfDZmQFHRoH02bZ3A3sJF9DnodhpykiNhb2nCbF4e2sOppZYVCDIYKuHpJMeen9SSFmdnCTQmXH1iL1kb5wOiIgv8cuAiQ0FuO1FsWPOhy4HcvNp/dJFxmq+pzZ+02i65IbGkoEWyJ3dH8d+KGhB9mk3OUPlc3nZ3CQMyaXISotMsiQR5VQza0JGpJ9W02dsZ4Doqur5AMYdpX+2iQHtc3VGXpd74w+t6bi30JoYv8ums3e2P5kU3akvi+MRzrVK92GTElss8mjKWo3TVwRaDGIt2SGqCH/D0M4EQOGDCRHwpLPloERQNWpy8wSdtd6XU4VW8RbmXJuLZfRafHCQD6S8nX4eHpcJyzUeb3695d0N0hgCkYBGoEzLi5MRsNjdeCkeH2hRZt+yWKswB84ydj7j0BxDt+DyB72pDzQYfUB+Ihh7VlTCuS3v4og8uJEm51yKohvQbz9PHnwG5XBhcdKRrqAoADbHO4tsegFVBVRDt7AszZk8DNPkM1exzRAMxkAAPBrEMqq1QNaKKacMSsQQigB4UODhpcoQekUI0YwdGB1VpOajRqz1G1OZkUs6tkrRuvmihTiyX1VM2VoOs/VX6uKVwB5erhUNI4rmzs+ah8NvlfEvvVKOtdyqs1GSTumL8K+3NE1o0IOpU4YwVbLl9mgixzKWbyRD/t0X/Cxz3yZXtqXVFMESIVt+RIZl12LiTW5cdDXl35hKfVZSdCVl2ZOzwk/7JjUh35SY8ckQsWjvxLco+QUKZLCbgNl8gWpu2RCZRCo7RYPkwxca+Il4Sb3CHaxcdzXTuMh5PETon/RtDeUOL8blAIM2P8oVTll2zFRxsPz27+7sX6JbxVNSj/OJdT8oUYCMgnNI0vBmAgm1CGCOKs9hsuGJ2U5V3rnKwYlmSDETIgu0nvih0ccILCMN0SH0yBQS2/J5Q6Rvt2dMZuh1pV0Ea4D396h9/HS9cyVzMZDoH7dHI8pxM0g+kY+xFnMB1jQHQSs1lHRpsFHNWYhHnd5znURMrvYhVUZZ1qvs1LLU9frw7rpGHceqGxwgd9uQXqn0ghUqz20uXtOw9stfBpMKXo0wC75NTwAeLeG3EvGQd1CAgDc/jzABLyK/5OC+riA+HR6biOBN7Nm1g+zs1c0mv8EYxtlkaykO3TF0ka2UIMuDrHwwG8JqYlBJv45iAWzA/52+q8tS6usPYdScoyj58hp4ZxWgwFn+YfrZgxpcG9gsojtPJVCj5Pi7z8rT8tIe0sd2XMtBNLY4gRTR+iLCg8vqe7YM1WxRnxQ3vrDPjoR9dY6bElb0+CW3LPq5fWX74T+aBeg966bBHigrI1rH9824WMdmgXLpo7tfZAQqeYkXUBpa/phI0Q4rTGqvVN0Olr9sO7Z8HBLUrv3W4So07fZXzdqLhgDxtlYUAuLzmtO4nJb74tTZ9LEK3dWJLNSJeTthB55ajSyQlyR7mglDWhqgqV9qt0cKHKSn6ASVbSdGbDUm0+WCumozCmqL5K9nM1LYR/RJk4MqJxjH7YUte+xH4zFvry6QUqTpxJBvbeOoldKZhDKvDxsUbuRPexuRudmbq8UKYQFuBpwQOSVUXBDWgK2ZfUFdlx1WJkS3SEUmgpZQT7/wtNHnKiQXgedgsnjV+UnuISnbDxzSkCtRuff5lWVCxoDqKsoy9h22qaL+kPJpqLOCesEk7IWogqTVGiNjnOQF84qCZ2fi8P4uOAauJHTyZhemiNATSEPxYm1eR2xngwW+f+vH7nzyVJl3GuBmGXMc/lXc4/E3k6CVfQPgc13GUKYcnZSssrzJSvrUoWxOkzuiqiR8kzY1Y1XV5MI0MaYCEvmE0+TtzZaEEa4QJ76O5iLUks/ApTz083uMTsQpo8ymzYp7L+8Y31i5ds7riSQ4LbRW+Xk+Ly2LZTjSM1H8F1jgkrMJNqQgXGBZAATKx/DVfWlleMjLopFKPqxBcMG9s9bhKBl0s9s/xcFyQ39ZiYfhYPQ3qUNHcXrxd7MR7eKLMKK0rcfEmJV3lZxnMirSxxxdrAU7dse1JuLKxNvMzltem40to6DXbBxrX9cLUVV/b8ha0sMAorS7xSWIFzGrcy5rintDLimdb1/IX2lg4rKi+mvIy4gDR5m3mULWWZMiJJohBJ8sPUF+yLFfSAc7Oi15QyOfM+P2AUCsnRmHeB8GAIfcS929xTTTqJOriZp5rRB124mBQj29KgP8Rem9SRoW34ikEUYSCFSQvLQxxUEicBKffAJqyjcZTrQu/OVsI55IdtBVwxunnYGdCe4oyvoNCADyJ68qIm8/TCpLV6gkxYEUmcbB0p5aAlFb6U2DuPx/ufRsyqYExN5ibdrpIxt3+sGRdNuBFzaTq3lKZLBtJ0Mo1mc6PIDSJP0MS71U9GQTioFsdEZmm4lVEyAg4H/H84wv7DCfAfyqC+w3zt/ragTTEV7toBQbjTET47dA6QtmpgNgFYRZcTAbQ6YC3DyUMAirMJQIYjEaSNQ2iKzSIkUzCWYJhDMINDkpQmoCRgk30R6DjGGQUj1RyHzJXgx1wCHvsj5HC44RSnQWhaCeibsz9qdNfmrg41ACf717VdUHPjdFw16Ju5oGjmgjqbyDSZK7FczleDeJ8Lcn0u6I49QW24xjChi9lrPwxcNafjMdbs9VzcNTNhh9MlUVdvjEhTl6Mu4E6JYJuEMLNrX7OLMH6MR8y+SYrd6UMblP1i40Yk79jYs8lHtsNp85SNO538ZTvMDV6zf97Ja2Z+jSNH+ggw+ueY8tfmCji0WTTsLfreA/0rDkmKlpUtpBhAwQXleyGAgn1yNQobw1aFIjGGkrpZsf3Hqxt/euzBOAxNuRJeJefcPwghyWlBhUQvZRPI/Q46gwyBYxqzsbQi5qE+B5mF93zs9IAwG0NqajiF2glDVAPxQ4UEpebDaKtnQAlYFKA2DZesVhdCGrj49d88S+U6Nv78oOQOY+8Kdw5migejO0y2BylBbKn2SuYO44XqDNCkwFOimsZfMVSahqIomYImvRdyp7E31OWgoJInQgYoAJLz0dM3MCP+m+SA8Dh3tm756l1amdSD4tnKACvRm34Bm7hdO5zi42k9XYRfEjPExwtvfnCXrrFX85vbumMR39FxL2c+AgNCZA+kRYrsYYFRjnsTChI1bMY6v4/Zi5gMdhmcG+s8cCoP9zF5g3AfkTqykdAeLjVi+Bj95kqGpXil3lDkbohXovwJqjW1YkFkvE+hBZRsS3rro9/7BwdtK7lx7DxRrvjemuJvkQUm7ig3gKs65nLRWfRlsctyjtpzVnw2h/3b7/Besk9KBcClrzEr3Gv5+iiepgAIWBw2WNwjhlt2etVk0XENjQBeZEfWatqNl/deTGLf3qU3/+wV295VhzylsK2I85ep7QrWMfjm5nG/gdIPMjizkhcBdKzRYy9YyWCruIMzop1CWqQcH11jURc/oK/xGA8rr/GvDFjiGs995WvMBEzOfFdZzOD0iJSRKYzImGNohBplDM8jiZhzllzY4SvSSge8FTl2rbzLFtbaoaIGTWntlC+Xc8XDaref3CjHV4DlwejpANMxIRa5mgDPavYgUXsZz5GYZe+oV8SnXe7migfbWu/R8rABJwZ439GeNZkmwt5hGlc0xpLVjz4fIzTxret07c6kb3yl4Cg4BD30+b0WKUI3Xr5T3H4a1aBIIirA3sA4jmpaVWF1vS633XaYt678mm/76d+UlLZwKulq4zdtVd7nK3IY7PqFf0QiMLAnDB2tXPXmC0tLxuD3pIdaSB0u0iRvk4V6dSSnmpJwpStxjbaQ6R2oIeJBilWSLSW51MdQVmX72s3Nt26PUcjMZ0QZC7+Rr4R5jnwjzDu4aRJzdUEJa9xCts67bVmGppc0OfxMg5z9GYVhcG+kI+rkaIooQG8pq3J851kqHuMLxAPzy/HU0krlGaU5TFvFFlmbnEyXFtl+HJ4jTu4O7jedmK5dpmXxQ9QLuyEPtehS9Xeu3ZD6Y/flhvelWgGUH+W91Va0XBvdmSEqinBQgxLgoNbGgl5N71u71vDyXPwMljzBjgqdUKVSTRkZuTlpYmPvTj6xMXcIcxp3ezrDifzOaFEBuTHpYf1X3ZhhIbmh7XBnbj/a/vzi/5c7M0/2m03M1IvOT2+RzM1EQY+EoVTNSDemISZixz4dvQ/kc2I9ZE3WaRSJnQ53Tkb7FiTIsmj44SNscFy7waLh9INMuTjHgwiFT4IusR2RdcK7LOtkAgdM3IUJ6G69sC8v08RDaY0qwrFGkw26QpUMWBu1ChMlfe3m+qnPRoi3R29gMO2Ueju7f2rYCXGz6Yi46p4TBdGOD+dEUwt+4LHYeXsq3CXPHgmHTBM69uexfef+5jcP7XmkV5JpZGDmRPNQFM92XmiPpLJVjA1eLjBxVyv5A+1y1FJ02uSIIC2c05aaJUKP0kZ1xm9pkh2KWtp4FLAEsUJ/RFJey5KJmc+NqLHPbZz/M5rLUyUTfSrZ5fvdIp/NrHE3xKMJXDXDd7+bu3poIFmlmWGZW5VatgklX/FTf5ntFq22KbPXptRIm1LzbCozzdwqCwbSdDKNppM9dDhaQoejFeQGkFYara0YIK6KqfHXD+F57WWHge0jrN8J01eB5WcUu1eB2WciVHeQnvDxlOHiGcXBM45/qwH2OuB1qOgg8bDiQkWE9nhwhaHAgwr/DhrcA4JYmgwYz9GdyQZtrC7/yH8N1WRwJmKZ2omiicJuwA+HkFjTlJaAJFnqFCrZle7dESYEfDAOHMzkGm/GVBu856JOkx4NStQ1Z0YpU5X86i1USsRdYUYuUTUFnTRGIe1PYvSAyc4pl5oHcoXjuubvJOFYUq80CQKxEuTJoSBNXZD+bZdg+I69EDlEb4c+iHqq3APRDpf7H6bjee9DPV7ue5gYw7357z/63/c8lNjAf/9R6ncoAbzsPis4XGag2bBkqywgLgJFvbWh6QkZ2eJgJxs6IEt1GZW7F+wYbx2dgItj7emy1QSgQpPr1MH+vdtURtdqAFJcNNonc3AtAj2Vt1arGOBg4M3p/jR0Gl/4/EB7Y/HOkDRYUM7M8PFD8FTXPwn/DiriNClZWwLXqJYebe6JPU7CTkv5U4kXKf0rqddvndu+dt1iUftQ+XJtTa6dRBcAv4yTynHZ+gWYhTXa2OGeypRz2Gf9361xPy+px9mTvldICKPvTJz/NlrqInPsPun3llhyuzV5nZMJtXLfDx/VLecFdQYs58XIcBXPuRKrZSqgUWJlw0DeBiiDv55vJ/ofKBKudRhy9GuSi4U6CX0KR6Yqx31hQp4KyTWXgU0eyVx6NpSda1Tdv4FgMVJrA6n2IXrp9IuXfzEuUm5VaMxEDkM6Dj0ntVrBZMYI60mtzMrEUZKVKKsw5VeecXecvRzJ516cwLBs6lQlOkx97SFH0S2l2b/z3tZbD30BBRYgDCcg6WVB+IFKs8Jmwkjnk1fyOn+hrYQ5IFxWID170TyOVKd0pOlrRBMaCWLscsXq79toQjKkanljedjzjrGph8UPF7Gek9TBYuukrwczJorA/fgNxrhnXKUcI1DbztnUa2iRYx0rnJl0wP0WnKzAKvtjxbshKn1o0oh7SKFSTovrF5Mk4iF75COk/Ts6rS8u3zgu5G327dbbl7a+/b1BjUI6NzAPr+mryZ6o/WuV24Vo/kRAW2v8Cl3bSqMMB2n2TUWw+wUyQJa4mnkN79Qcttg6jZZ+cah+xq8yyU70VnaNShuCfX+nSK9unTln75RXMwbL6cTIPwt8FcJsOvHI12FcrFoxs7DQ/Y7Uha5wcQTU4+vjkL5W9GwrjVm1ZikGVL4QLgNMSrorWG+ZHP3UorI/7GH7UXrPrVa8ddS3LzbPXl4/89h87x18fERtNyqRwBTo2wE1DcBvtzMw60BiWY0LbyFc/hYs8LxbUpVb1iNqgwpGrEhjZlkPjvEj51HyRuEQWZPLtAbN1OEkgYccLiLVNd6nJkKPNh59Yjl/Wl+aaVT9Mwef+FoBUjHd0md+HeT1YQh1LRixsHafGhFZKKL9ybtC9PfRSZTftcM/XFA5WvGWlGh69O2HW8/ubb75l+2Pnuv29dozLkRg0T1clcA6s9WHnONX05KXy+SGJgUf25g5FxjoIK655Xe7+uZg+6ousj/c574cEIm6YltCi3aX4bHDLabK5nZ/+wztOdt17e5MIlr0UDRZz0H+C7UlCb6QQoKGpKlp6dufmfC/1Ybi0hlJDdVsjgWnvkNj2To66V1AS5AlbXtD1VnX3z2Zz5NY7A+U69p6LZ1XT4JQTbP1yq/UzkBrvnIy3YAbarHS4Ezgg5p8x+Gqdfha9GAceVSPETaiXcNX641jUKBkRJIn4/srDMvEjrz6p62TVPz1Uj7/wEnoF+MWkTFJizAWug5hoBYubaDWOKJ3QoPIqeNWRdCIbLFyFFU6vywbzdRf/aB8ffx5D9G0CRL98aP1TymO4bq+zTIlI80kSULZjPOzIJzma7QxX9CFSdDkMhH8Lmt9FyCnNkQfztYg9zow9Om5VqTpWUvNsLX781IJ1uo5/+X5xoce8sNxWA2uLcukDiD6jw6t3ZVjaKuGQ3GQMLHDM9YAGLy0/a8w8pRUAQkcUzMFybeq/Z3biM7jhFRDOLDT+41Vjiz3rpL3vNcTemRdoRLq25/cL73xy62DTh/HVJTbgKMHjXa694k67j6Ie285+FlYNvWbSyhITfOqk7VJSbQddaNQC5KhBoFyuClXhGohZXbr7ScO/HtB/FOgR7+pWHiFn6B4Z2QnM33x5Dt0sQSnnn3w7NXTD54CL0VpsDChmvBUigmv9tpXA92s6rDf0cIdT2AwoqO4UMIBuBGW2TW5jI29h1JKBffj0cYHWlCi/ypQhZYqIrTLP7qYOr+BfBIFnwfHi18YJTJGjoHS+vs79ZlU+6+qllc1GVtVte72ZhadG3J/s00EcyiYJRNmkBx2K2RCjY8JNzvc5Ej2hpsA+9ywUMw/rUYEzIcA8hFJqGg7wexdCbk7Zk+4+mDC0mcdP0csWwLLDpMjeBVfV1E1rKpo8oCjU4elAT46lps2rOjwbS4AQ4eECa/tVpC221GZoaS5AMAceiVcVHU8VHUUhNg4sR0CMImopIu3o6//0m+scLWu8WYJIOTowPQ3HqWp7CnT/dD7rqdNie5XpWxKc69pYehffUNKSgtKMSmpyaD/XPWp+zPpDU1wMU2xP2gfVzuuHvhpQlIH8XzAZb9LfRfGKiP/E4JXJeJkJmddxmrNd/g2WWShGz1+L4hEMWFnkg7yqKoyaM5kThViZq+KBbw+Y1xZ9LHPVOQRlj1Z8UxyZGVHkx+rdNjcWPFw8mKVeMKJ9W87ObFodPfIERo+f+Tf1IflLP6D07ippiE1VOnNUYff2mKDhMivaF1rX2EpMzRmlRKu+1wz8Kf/8U9vkHJqMt242F9xvA8L895UHP6TMNzuwK8oSHjtGxF4YeSP40i7KzbNbOSP8pGyCl5lWgc9q/+RPwq/++mGp3vst9XuJD/iDjWkKqpyKyXTnehyZhOtul07MFioyYwllVx+4Xbvpz+PHPmn//m/AEw857g=";
\ No newline at end of file
+export const w="eNrEvWtzG8eVP/xVpvxiXTW7qbUd57bvAII38QYSIHX515ZqAAyBIQcz4AyGJLi1VVISX2RHtmwrcWwpiRTbsWjrEll2bEm29QJy6Xs8JZDUt3jOrS8Dgo4S5/88VYI409NzTndP9zm/Pn369P/+7//+z389k3aDaDkKelHQeeY//vuZyAtqXrAdeDvP/AfcrMs93QS1ZuS10twzSpGngV9Tz+gGnm2pu23rybb1IPIi8wRurEfNKG6YZ3gnD4NGpDn5Cd1Rqt8MdgIvhGu/gXdcyqxVj70GXGfxjr4O/K0sbu0wEcjNt3ANLDqcSlc9eq/FKXiRdbk8G7pkG7G3Tg97cNPhK3iX2izOdiQRrlSibl686DEn1ap8iYmBtyVcoapUaz/SCX5EebEGG/qqpZpq6HuZD6I/gGlvq3VVy0pbIqeh5pJW4aaQ2nOFuYZcJ1UNrgSXXBXymf/zX89QZyunqR/6UQzNib3Q95OJbuTX6x7k/PHzO9uduPoi/PnpnNuJKz99AS5//Fxv68fP7Wy/8Dz8fb63/cJzO/B3Z+uF53rbG514Hn8J/Af/5jrxLPyZTZKNeAbSZhq1UydmjkXVijtXdY9V3emqO2VddCdcyDAL12vw3wsFd2ayuToz2fJnJvDXXIWn6bw73vDg/1MnahX3uXm3XuO/a43aiZmx4wvjeHVqpniyMu7OzhSW4beyNuH+Ytz9OTwqueWFaM6tzriVxfLCUnlhe8ytLC0uwK+8mc15M/BOOj8HpZ2b7cRTBXey4BYLbqHg/n95/QzIgyTu1r2kmwbw4f/7v5+JobPWCvBV0iyGb9b4UTCGH3uNE7fi0C9iT3h4Nqg5/SvBthP0r2BHOPj27uOvXh9cvvbM//kPoeI5cQM6RrhgU6s73chrJF7TT5xoXEhzziSYExY1pxkF63E8i6z6V9Ydww9S9i+/ztyIldcO6lxeU1yvFiQJJvqbMZWb328CrVaaK/FrqsRIxvESr5Mr9BFlJvp2oZGPN7rQzNQq9mvEz+8mceTE8/CggVcZFZcSQ5+5tOjOb3WdaFrXIXh4qWbVYPCbd1UNhGJhFMVCjlxczZNrRo/e2DL0vj0j9FI/5hLCVRY/GzpMEZNVGeFma7iIDz+1e8XBRw9MCfFVaOSyRbN/xhAt2BStUiJFq5BIUgoZZqk0IlxQjRO4MC0I3W64eFH/amS34HndgkSscIhYIUfJKhZRshvvfK7xQt14djWtpvP84bI1o+/ON3Id9LLdeEDRar481YJN0iokk7RKiTR1KSO/HXp16rN47aub3JNeqK761xvQrU0PHFz+697l66qIqZ/EDS+JcURsZ/BK6KQ+vpZquqm6iPq7iaPIwf3je/eYGMuPRtx1/BKWKou7OCrpJvXpOvX04wRGngPFc9pxMiEF7F9rAuUdKOPVkMs4uPDrg1c+2fvDRz+MuN9whD4O5/d/zZRV1b1mBvWN4R8SaMOHSLJ6nJQtPjs+SZGlYW5J3HGUJEn81lYPOPuOLUv6d1t1J+5fabAgGXz468GrfyXO/RsevZ94jYi6rA9fLk6gUhW8A7zV9lAmNqIsBpm1HnrHUYc/ensnR/Tgi79aROE7gqyLeQjEXR4LkAap1NGIGF4E/d0tJ/vufGtHd4lLnw/euqa6xFMT8rHbK1rSvERJPpkXMpX+brf/ed2BoZBkWEF6EjKFwBqhIHavdlSZ9t49qzXTP0np4ac9JvT4Kx47af9q0qXcSf8aqAPuQ5hIV40oaJGqzPqftXTbXHhDN4yX1akjJH6orxo+dJgu3azXvZrT8bsVRaJ/nbAokHhyxozeZNXxSMhE3ibxlUQWB1EMlyxe+leDDV2Mc+eNVGEaWqwAHQ8ES5r4KyOpGelCFKH3rDPFJ3+4woq0GyBIV6IpiBO59lp16NwNx2M90m01g8SQgzr2SGMi3By8eWdw9s0fTA5VLyEGpHfhLabXSPxsAwQmE2zVM68pBOFJkG3sBJrkKvQNTfHR29mOKeCXf9EF/EEETRGBohTx6SCYDb6GkdfTvfzoQo/ffXz/o6eHUnkQNYSgnvZtxfo1zTqJJ0hG+EECA3NbKzcPWndVDcputkAy58qW7sof/k7z/wdI9O+SCkON+ORX14AIt10C3b1k0YgCRUM/Qho0ooL+NQ0jBi+/pNsfMzYO0biiaDRsGlyMa5EU4+WXRJeEqDy6hBK2M98J2jw40zi0nrSxJ8Esq83tSjK4f2OD2vXG4KW/cXECv43DwQ/CAC9imOrhXz9sNEjfyIsPP23x57zx+C7gapi2pQAij/thp+1t+zQzSOIg8VejAAsCsinyFXjHssTdbpyfGOg5AZejg1M/UIReS+NnuOjkgIoA5WGULIBWoVmBsvM5DKvRqwGaCmMqeMn3x21QqeGkgn+M/Rj4Ceqr5OCeBnoGkzFd4cIgbDyPvjTu4s8bIDKibyAXqb4axlkaYh0FMgy4GMYU9H00mhg32EhDon8JTQtCHMYPHit20vyepfm90RBCowetqbWaFv3Mg6eitDJrZKOOPaOOPaWNPVamShWzCrV0n1J6WtuJqptQOo7Vm62MLE10xWgiUUJLon1Y7eRUhNYPtnJgvTArCoE1gZHk9DWOHm4y0J5qlOnxpQYXCEysbJrELSo9yUnvkKhlKfuPCzcRbEqqPaUkYiFkSSCo/DP/8b9840Rx0KUh8l/P+DC2mxkIAuqlw09bdfmUh5+kQeR10iMehU1q6EOPlMV0ZDkA6kEH/fFP/gs7WgcybD3zP/8FnQXq9z9cja3Tp+WV8PSPf3L6x0BplDUWLY51EOnY3YOsRbdid4u0GTHOWqlKYaNdM/Ia5pkksNUuCtZy9OCeH6BtVZ6g0ZQTxOiZNPlTIjWgS0nG7JgCJaTXyxKVQqa/EA2ea1wOyKISkAEkZzva4tnme+Kc9YBGTyhGgadS8LaVNqFdzGuSgO9lWNysFZEpFtJVAtGEenk1MWRiU9E90Qja9IEbZEleZXqQRLfYakEor22oeybo96Ra21mwTff8VbowQlXD70Cxm5Im7Wh/O/Ol9IcxH0K1u9XIVpPqFrRazLSP1Rym9rq2VtVUVUzRn8o6W1lMN5Yri8lypbLslleWK/hbwF9lvgdP5rcrc70U7ufgN7t6oroEf2fk7zH5TctvKuT0SflNyG9cfqVwlZ6PHcffSqUYrp6A+8KxOReuqtVld35udmsTSrK07BYLWRdSFudm8f95/n9urFhoF9bX1ufhedCCu2ax4DcK9Vo05ha8U8Vi4eS/T8Gz4ytjheXxn4y74Zj7s6I7WxxlDQWN4MHkAybzICybnkNdB8ZEO4nT/i4rgsgL/YYHAhrztCRPFDtbcYSGg1U1gXt0oY4Y506dVdDejQ8f39eK6B/g0r+RbYzkAjPElqNYoRz9+n3mY2w9hOGAllJ6oNozpfnsh70Qpg/Bpp909EwP8cy2PYN86VVj94G3HD+lVmPCTpeu+Um8xjoT9I1fc0BUYe/+7jxIF8eijSjp1udMWTRGvX8jChyCfN2sBk3hUGljkAr1KEg6DiEJ6NxRFDSBNFnTUKN+92kLG/vhWW1MG7z6h8E372iUrkmbYisGUnSbiapBnlPXy9fFMJWqEMujvzCkRfAAvrODICkgoEXK9Ok7VfTw0zW7Vz2+/9r39qofyNN0MWSs+xhw/b9bTTJf2vUcfHvGqieZMPK2e+6FQDgxNjfNzwvqXssy3zc8v3XIfG8Yi82NuAoOyrrZqgOT6Q5Mx/xOOk6YCNNghr/jN6DCZBuSjCHWT7L5kq+FZr9V6Gxsj2MTT4L951JDJMS7H+3fOCdzhrgDjQcz+gAY1uIUwHobkHvoTdDsyOs6aRZ2oL4/2vFDni36nNy/2nZ43oi2kpo3RZamrhcCawdwfo1sglXdi3G8OKo40pFfPs/F4fZOOm2yLaaA69cA2mPd8B7Qtp8CL4dyEEpPe94WDJ8wDI6bueajC8AGexK26/1XBx+/Dr2I27Wd+lBaR7Pw2/1P2timwguLCZmCdp6N3/bYYEf8sOEfftpz+vcSx2JJyPLM4C+/ZJ65Dzlvfz+ADKXct4uGvpvA26shjfZgTZsZ//DR4K8vG0vAP02bhpnFgAcakzfCHP9jyyHetf16f3dJyXL8L+CHvVDni/rX17DltbH24MFbe5fP2MZAoQqTtwbohvqCTT1x+ruQRok2FzuzcEucXpoVZZ7WdjRj7NkP3mO2P7A3wcjM0Mb36O2e6k0HDy7v/fUr1ZvoxVQEQxuES9VmA39h8LYD79mu4x+jj4B8UjKmQ1099Qba4nGkZnHP8TdJPjy6QKYfxyoCfqJvruy/epvLoGb6bVxzS0GxQnXiltMep0k+pwK7Ln9/NADonCgJVXI76DryiORJ/wYMHWjSG5Zp+2+Du3cs6zZ8BxhAvHzTZjMJf7XYkRUeSR2dFz5bzcEFH7nn72f48gdkrjzVh6+NkgZEbTwshNG0nWYdaE2ysw+touKbrXoMAAHGgRHG62nWQN1qiWPQrMj9KoyKiA3Oe79/88n9X4NU5mojn/69jp+M5biOWVwKTLqkWtEiys3IJHWdYIKP0KUwVA1ewTAlL6gSsyVL1NSVmjKK7L33/uCX55VdBKliq/pAKyDTErZdVaCFmFSodJqQFI7I6MLBzAe6Z8ytphRLLUPLPTYyqh/PNDJlVm0suaMtr0EKCBiLDsLvi5861Epo7/dvPLn/hlJCinGBmRUM9QITLJHZ651V012IHKGvl6mFkZyYRLxmljQAE8jCA5QCbrpBF1QqkbZyhI7XTUlxYSslcRs6aOL5ah1il2AXllu3+bXBK79RbR43/LrT/wBLTgDEo7WSWc0TO2b/cxAIMM5DXjWDaWj/NnPGbg2tRmPVT62X80Vh5Ol0MmrPrj9JUgKQrSkdLbJ9yWXTnSFi83I3yCLHm2UDESQC4yQui0VJxj51if61nh750CU+tJaHidgV+sigZeopr3ASYTTvdRgCGfKd4azMigZeN6XcuO7+3acA+xVvZHv21uOv32Lm/CkB8ZEU8RIaXdC3IxSyyIU7I1bE699oYB80+XrQAdmEHXACqrouqj2zvPzh7v5732gDv8UIv2Mr9GpeUh3JsgOfE/QETnGqh7jjy2vq3VwxGiR1khiHQ/8zWp/57nzTMSUjMX958OVHXLTRlnJCa7wYF2Qpi/L+btbhdoYBvwUAjFYkrNmaNVXDWVNBMGxBZlEFNYEq5mdkejKWn9fMWzOaQn42Uzg8kSnkpkx6tjQa05eOwvSF0ZC+lIP0E/bMRc9ZiNOOv+l47WC7fweKScIEGhJQEbCBXotpOEDyuWjIoJbsbvvzudmCnif8UDBmYeHvQcFVjSA0UinkIa9Gu6ZAtF6Fcl/PFSZUASbyEFOjy38J/NPIbwgnlYcAUtmCRfKY0dBEHn9p6GV7lQiAYNAR+lk34MmHPEY/hUlxLsnS5Ry40bjmn9HuQ4rdaPXDyldhl0JOAed172HF+736z9Z6lr7LKaHSkO6pHqVyqkN6Zjyv77Sqy1UPZM68SPp5EevzlvrQmmOk8IaPfmyktMZB1vPyYlpL6MPmeqguCK9GwWF7ObxdHbbZj86iDfdHPNbW+yOfiwl/9HNtxz+ygGzMf+EIY7685p0+LWZ9bJfTLxxt0ifX2IxWkchgK46ya000y3IijW6PjMPsRQx54qzh0XM09/r0Dpr28ev52TZcxmwY5hv4n+3FGTSfR0uX5Gws15FXg2t/leAm3ZCXbi0i4xV7bpN9GE3Y8CNTNmWSoqh0opUGDV+MYW26o3FgJeINLRBYaXijatPIaoY0p/B6AlXYW+W/QU81kbeqrrINsYd7q3JBDarSrCRqY25WYqubim3oulW4/lbVVRWlUlIPXXQ241N+LpIqEPz/NNb0yYnxxcXN/5x1OxNueez4ysR4eXtifGFm1m3Uax48ncdfzZvrwG8D0/AH/2bwNzF+bA1+6zWvdarmBae8Kb/uTTXgxWbdm1yteRNN35tYbcA74/C8NV46cfzkSnVpbOvkyonj1aVitTPvRvPuiZXlpaXn5t3JWTcoudUK//1HvYfHNzqLM/mUdriynM8P1WmuTk74jamJem1qEu69f4GXMuu3ONsA4QUT5m4U19mnEpK7mIxeXf5mFjM85Nx1lGijc4Oub0TBBH3Xh2fRPHWPF35/+/Le7V+yn92uY7gu8KK/Yyiwm6NjWBHqC6wcrSpZdkjHIQ9SELeAAyuIbtYQZ8FAXUGddaK+EoPvLvW+/Y9vPb77e1U+ptExpQv4XhVO6HVM4eTeKhujMigYkGYN0f8YJLK/GpAWQOnc313lOy+oDz3y5Un/ioBJ8W26uX/pqzy1huM5UGTQ/Ys5uuTQhYUnzLBoc6FHVA1U7mM2T4bwUKNWPWsD1EScET96A43y5zNcpqfWGvz1rcGH70NpNLCVeY65shJR8QLApev+PfImu8ZWxG/eG5zbla+mXuO/6j4BOavfvUv9iRTvb/8KL3ND1INu/yoANdD56KQp04QW3qfUe6Nm4EtqPnP/tqRT5lbdI5wAE4xth3jBLJhk0uDGX4Dh3m9HMEQLddIp5Dj6CSVy6hG5KXMEE97ZHEe80gzhf2a4GcbSOgDZQnJCjUMv7N+Tm24Wow1aplsEdmkSAsiLBDQC3lfu7d98VxwmNZXEELRS0aatrsm/DW3AihZ6uX11RtFCXwQn9mDi0gg2qcNuZzCPodWCVFIaXjdg24OVbTX0WjjP91UCmXr6N9B18R3Ur4Pzr6GR+VXB6dAvgY4/J87DuwFgtLbMWhqOsMC71dgB2lOcroiKGyyRFCTcCViiHX0R9K/VcGqItR6cOf/4q3PqVcZxYS2L5SLOJdCLOHUiKECv8nQ09LowHZApZSwmS060LwNovFbXb8Zdmfn0P2vS9IC8HOGaXWgHL93eO3Mf/leVEvIRjmuWBpyS4SQyqLXjMcPDHvya7egxb/E3Q594S3dCr6c4Cfw6TMZRjfjdGtks616IhuH+tQCmn0mXjCUwNeCn/FrCL6E68aPce40kwAk1zWzwI7DDOK3hwpfYv3598O27h/lXD/Ot5plVcxyqeqKheNDk9DyzsOk3oqyJZvRR1aM+P6J26qVR1QPVCU+4fkn/ml29e785XD2iVDnEtjTEq5JnUNHVExZSO+Iw1HpttGkcqh76gLV9NBCM+nj0zojaddMkWJXK0QKS9e3OjPx2QKl8iGs5z6qcoz9h5ojXe/aXO6Pq5qFSbAaoHeP+B2S/vwJJTbhPPSTiP4uJKhsqRDLn40pBtgFan23+pLEeXoIa3OX9FWjHffwVT2X90NsMMLM15pBBgEiFHZmtHDDg6mTdEQbINEYbfev4kJ5VTPWIY7biE9ixJCkajIywzT/r1YyAfXQBF/JIfT++/9GT91gkQcOoV6M40Jf9O8GI5EdvrCoSe3d+q0jwnol6AHKzG2Zzukh2wqEsPVwb0XdYNg3FoHQKikHp+h/n3mPnLzsBilr//ixYbE0dCq6op3FECiWNAtppo++ziNZP+nc30F7LEOCN+4NX3rQKlXRrtNkBuRGgZgdXhXlUMmfCEihKUABFKQ085heW2cnSuhP/brVo+dVrg9euGPZBoyBMggZdem1dGklBnsrgBSzx7VEmVgXFFw2MXzRIfyyfqvH2PwO2GWX/MCjMGPjpEeM9Xk4cBm7Uzn62gaYj6BeSkH8uqRqbaVj2j4MohZ0UatJQhnHMnICkOcZFUxYa0kBIzNk7tJkE1NoE1aDOt2RzYdzBgGMYbQgOKIyEG9N5jKGRhVhXjV61NWqslalSo5YCtbSnpZYslWVStZoyCsrSTpZmAHkiGiHWykCpAVExWr1Y0n+aJXCzf05L+mnePZdtjNvSXUt2LdO8f1TCimjUcjEvE3PyMC8LzaURgiKjkkALEZ+uRc4kesZlpIyWVSJeEq8txllAm2tkZRUxwRJCpENeNIjZEXu/82+4e6nWzuaHLY6Hnmpj4+En2s446pGYGA890tbFUeVgw+LzRxgWcWZ1+jS/EJ1+/vsMikEbHXejrBt47PLZi3Fzv7r3Wyl57sPfjO1VcB/s8BZ+9ba6D3YoakCw7bGljq4oVAKZCyFrsB2saRMZ3PhMxtsKxE0VPVflknJkrZgc9ekvW9xi9Dfdof1r+Ic9ZL02O8/BXw5q4GEchVW5FCNeBnNwNrjxFRtCoXRbfOFzQIW4l8W9YMfDO2yOdWqXBhpB17K21BtGBjpDN5lDk4yCaNXz2NIZrMEvwsVPGnzQAHhPj9oBcCLf9KANd/QcX8iIGPyf0ZwpQ4/qBta7pu/IestOt9YH4oaQL2JaPyZziW5YaUhpOa8tTcONwfWn+ipjZyYVkUJz0XRJnso+6TeWq/ibLSw9D78X1L36eadOHp+bLSycPD7fhV+Gt/Kbxd9sYSaCX7wz7U6V3ImSWyq5hWOri257tjC9Nr1ZdNeniu5sYaoFvwApArXJJvxt+nQ9Xhj/zwV385jbAXIdD3+nkOMY/D0Jf4tNvwF5G8uzhWDRnSnmLIX/XnAXC+5cwS0V3Olptz7lFifc8viReZJfTLljs+7CTC71/69oDHOzyaJbKI+yd+IKsN8MQlxzxVkB+v+1omA1jHGukvJDftqN0DsQhE0n8xp6/7X1Oj338WWY/qW89RskbArzF49fDGOzkoULmGiSudd1AgD6vKp1cPaTg9vv733xpQBSLkoT14K34laFwSkXAE0gYd3r1v0OpSvG6M0ISKN/FZ+QRwq8mTqGPaiFngNzC9p4ZXH/+uLB1Ws2dy+pxXWi12AcDHXtoO9YSluPyPuAGiDgVDLpQN6A4dS6F6XOaoyuvMkq7wtGi9YVFKEHl17ZO/Nb1ssIsyNcewZ2Y2wxauOKocPsCEWrPIob6T9iAPqvDQ9XNP17DaF/621ZhI03k/5Vx4scH/07Y5gdeG0y5fpJLfFon43jdwBDQDuDlErZrBvGNXwNPUw7foJ2lLjN9l0fb9NaOwjrTs9fj+I5bYzEndHo5HmHWvTKW/uvXh/cuLD/m8/1+q3qLDgJNSXJ9TO00Zpy2C/hlFQXg/tWGpgy2B3LKgZ1q3wxvFVfHFdrbQZwkNbq9HfD/u6zDWwNbeA3WVXiepRBA9ALPpUkwP2RNdly68ietRsXnnx9/+D21cGHHzN2iwDkJKueIzSpJQFyQ98Ajpo94rJRWYWd7/AzteWV+amN8mwqZKZ7n3/25A9/VOAcnXLSZFlgE96mScamC37G137NwQSZcN1B6jfW1D7I/Zdf2/vjWbUVMu6iGUSIJugjJBTjpOlHNkVAJWHRUIRStpjak/tvqSmcP+sEaqIIlzF7FdyB5J6ymc/g5qhZ8Rzcwg/88FN2fnjjdfy6r4v1vZklKMn8kHtWgPfwZijdiW6BciiLFYkXJ4py9ujtlkV4cOFri/AOAO1V7Ld+0gy6PIDqMc7UuMtSKvHgnDqNPzVMD4JV7K4JdOeqeHDgZumLLZRGZBp95W8H771xcOasDFx8OW445C4ILdoI6intyecnGfTT/m4U0QjeNekoBOP+bfKUwXfoFfgQPeJMhs0ooU1+ijWWgfbHEvPBbe41gLHg+7ZCH4QgO+ZmHsrRjidN6XVDSIjXQOOrZalO3HK6Qa3m0QwUumcXm7N/F2HGwZd3oDUHL13kb16PQOAxfZR6cBvWiDqSjvmWaNOcG2kmMB4CsgwxTe0qQFTJW4CURuhteiS3AZclichUb9NvUWLqoyPKmOx69mqcFYS9nyQ0O4WuVkdeoCqnyG7QRq8xbJ8nu9cPvrgkVm9i4unoGCEzAFGKW11IHCnyHrkGUhISbTm4HYG2cyJt3lkNpJ988pboHWiTTVx+BNHdTdl3BkAVCHpZTun2b2JsERjINO311oazd3yAgk4j8adkuHDIAhQO+9++tnfxW9mmWeOpebLZv9aiXfWS0vVI/fObysYBbw5u3+aumf4ogapN8mQq8jYlJkjQzlKelDa9hLaR3gsiGE0MtPfPXRpcuMussyboFlLV3mr/Hu2h9XyUvOHqKrl3Qw4vnwGvVrMati95lRLtRxcYugPtvb9+Lh2gzvY1dAcKaMkAmq+Fa6e0/gV9IiMrQBpDC9XzGZtBx2n4/gT7raE7+zXapfGbTwa/4+XaAL/8MZnBAmoml/Ib+KUp0YtrToP9yInAw0s9fv/JK9pBFVckPF5N9Ztw10i8CLvhLHunymMaUTi9aAdbKQjRjLETeqWDZuuRnDpLi3937ux99RUqHNzfys7aaeohFfwUQbf/ecI8xtg72zwDqqB7Uo/kLVBDcYBTHKC0/yvxGYyhc/n9LzqOB2gs9JpksE1Xs+/eISDUiNDdPUSndxq6kN/PWo6PyR68gG/wg2bTx30U6IckNp2GI+tpayCC2oRbXn/81etPvrq6d0ttjMaWiZGIbA7wYJRtxKq15DE+Zwm0FSd17CJpHC9pSPDojYbDy9vfnW9S9T7YO/cOsBm8JIYV9KPPNrBm7SxIPL700AuLminyug5Mz9U6flOWXfe//urJ7a/FFgUzWOx1AbmPQY9L0VuTsSI6AJNmRxOVyQQUV0HOBJ5ZCQZsiuW7/fXgJTY44WYcqmQaJ/BVEWGlMNiDTdbe0iAg34BOLAu8ICrqxM56dY3fpFVHeCOrp9K9CGmljQTgMC2EwdRgVoT3GsFkjET18FMKEfPmp0+++tPgArdZFsebji4UBb/YDSHJc7gwz9JS7p2QcxF/+kRbMMYd4sfeAVBkBC7Mi8xOLz/54I/ASGAGfFooFGEgrKpPnTiXCjVkm1v88GwbXSJBPVzjYD+/+XTw5icHD9jgidOJLkktEKdeiwlJSq/bDWbIdtZ2kAxW9+1P4H2ua4D7mmLQJi0ArVLZHm5xorXElnTH/p2kwfl8qWzDXwdJ6TTjhqktNy1gjSbXFpp1/3UBVYpD7LRjFE1+yhJdmNDyPUZhYsMfsfEoG+ViNl0rFhP2VDIhAIcnZy/JiG4ETb+L/hm4kSQg/ZX2d5v9XUqEzqQSrZy4v0NS6coDOQlTrC6XpX+XPBs/w1UhAhUEGM/tDl67tvfah48f/IE5A5T3NkOcLBnGmITIwmLrr0EuLx3JlGWr4Qed8x1cGGA5Sxz3L/6JpO0o+741u+WZJK/v3IC5Y0nSZJpozQ2tWaGapZnJ2fCcrCJTMZ6GCdiBmQ7pfxhtFBKK4YCeuZjZyuF5yrg9OzlnJiXWrGA8NxvQUwDmzQhdgXMFyw0gZyxugLiAcAXAza0FjC24nTCaHf6rUK4Fby1sq2GfBnw5pLekMZ6GdwZ1jSm0NaYx1phAK8FrjKf4cyGWWuARn1FTI1paEIyk4n30GN7Iqoi3wl6u9Fdut6hwCDkYbMhn5b0UhC5YtyYknppBWfQ/634lycrspS+KWKvgEitf1rucF4AFebR3UbOWuaLMy1+vB1R1XkICJcbfAdQPlwX1Tpn82cusYyb0yo9SViK1ywy70oCnbSijuYRBkZdfqbaWJJ5kISyl57sxkbssbW0pNiZya0xkFUuokggmlkl6OxuPclsGDA39gj3q9VAfEc9Dcg8H8tDJJoKHSTKhO+w0FbNDp5lgHTYTtr8/d1SUDhZcp5/7nugcW0Frh8Pa/gffZBxUIcE4xOpKTLnBGkZkULbg2GupJAovAVTW0VLOj/iehlkY+WkkIR/wWsJFdCmQRU1fU3Ls1SlsL/ylguiAGB7GgyDjcoYux1JgeSvwVNgMr8XUWxzQN+NbvxVnTfpLt2iHVyEzPCERZT0mAReBCjaxjb9MlgE8/CicpO59/RKFsOAUsWgHHprGU7a7kxezpLJVHCNP476S3N26+giq4a1m122s21G3HLcXNxK3CjcFXVO1paZcPatuVkVMsa0iPZV9vVpZeg5+z1criz347SxXK5sr1UoZ/m5XKwvTE261Mp/Cr1utzG3ALykWZuPCbKdXdNtrtRcW3Jno50V3p+gWC8fWbRt3FODTnNW72Sm7xXIurViY9O37wkT93/NvrXlA5mfj+E9HxoASluQ3hr/j1UoRCrx5fKVQWSlUj024zz/3QqHsFnZ6U9PuWLGwlW1Ou0tT7ovIsZv+ouAuF9xqwZ39v29FLxZOnSycOP7ilDtWWOlBA1QrUIpRNnVE3SHPQL1QWYkxhScDOvVwPk5Qtyju+jda7ObGuuTc7t6H5/c/Pi9zDtA3m05q86EEw+JQDuYQQd+ZtDk8uhwa8vc5bJm3gxuGYDqKCJM3p8g9OyDRFGkH5LRJzWWTPc2gXxMJm4qxGfZ//beDVz7Zf/V2noff/2DOejXpX5vLk/cBWls50CUwnrPJSwxTIq/AD2GzGu5oJcdMtIApxErbh6IohqlUhBH94BHh37KCdPxaA94jj67ci/Iab3LTILhJ+6B4O7EFgwd//tX+G7csGKzJt8kMlyuJE1GazhL5WXGIaSMm+IruUY7FEjl99A0zE7MvO7EHHfEECTyqp05AC5K4rlt5qFLw83w24VzfoHnzusObNsmk/teL+7v3Bhe+GrzFgKId1xyKuYbvcw1iKHkNjVQq2S62JsqFZnoy4cdgvzBDxG/sSUTCbv8T3FHs0c46HEKSjsHPgDNNgVTWlPbUUxQMn5NoBy/MElKKFoDF/+O7ex/cPHhwSbxPQMo3HWE8YdjRg0nZ24KLI8itaHg0g2KOuuwRJuKqA6Ze0qA9o5vsUuUDDgqUIEDfvf4u7UfEbIGdD6R86sgd+sby5u2HZ3lv1Of7f7qzd0EF7+PiEY1yjkkKM/9JFgMmS1A2DLgKmr4Kt4fkVQ28NrUOSim2pfppRvFJPPbspg2KUEeYQMo+CMkHM1dsNPgQW2wOffRG3Xn4DkKAg/PnBuc+k9ZPaN+ltDTJL7/Glkt5BnfBlCaoRBeRY7EF5JTMks6TYi/mUOtJhvaGlMOnmCDJki1U4ZHTxN/CpK6nwiM/PGuiAhy8dluFBCDzbJvFrPQXmMJmceIQK7HI4q1+LKQbvPUZyeLMqyV07/1Zl5wW6my1gQt0w1rDl5U5O5/PC1KiNXi3I2sMXIQTdaG6MfE5q9b/nKFeTtTPqmU+7iC8uMfd+8pbqmeAtMctftzOoBCoR+gmxqcUnoaaF2YZKrSRNC9OrXXQhS++VM0rpUi8OSE6PAr5CdLjshEdKdsXX+pZbxPtMBRGJ1A2lDqWj+xjQRrgpI4ykXCHCQvvZIUJPEfSTXjnbf9ei6ytSP3u7/a+kvgb9Gaqi5Yi6VTfDT0lmtKQ93RZ7/5OlzVISFADutv0rNDPm5BOqhY6kGw3j/s3Eh5kO5lsU92U6MQ41sfY9OD0PyOkvffZnYMHr0iJg8QusGZgpRFxc8+kpdy7utyfacmA8XJgBsORra1r3G/axWVaWoLxQk/bGnnNOAJ4G/FknPdEoQmHBM/t2/vv3VejLGIidqGj5qE0zcxKEwZtJaF549UVYaFFc+RvZpEtKvymhwnDoqJGuYykaID8qw/15gjNt9KbH997ywgLXuYiXrTmwAtbxGqenSwlocb3QlwWuoisCg8AZNUalxfC4Ex9KnyXDSdQ7CDuoi83lb/b4f0NkFXnxXAXoJXHeNmzKyMy4tUwNPJuO/y/+Hfu/f5P+E9cPAlVtsIAV+36HwhFIV3QIJees6uIKdBs/jE9tco1q8Js19hVRMqmYosGoWMVjlriJhdN1pLQqK0Cw0R4l/uAniTJ54ti7Jm5jydM+tcy6xve3Lv8qvqMHqg5jDsLlUFuHPIZ4Bgv/BJ9XrvhbJDo6UQKR4vrvsJYQpxnEkWc2VLo3JeZKTurQhOhvyLmDgMfbzMPRQG0W39XBeHHZJIGnDHKUhUvBKNNpF5RL+IB9sb1Uo7T+uT3MIY/2XuPHUQyjKrkdQAJAjWKzQoKPKWqCWf6fnEjQJOs16J8bH3MYqpYllqmfL3byjBmMzfvumLeEhZ5xwPhujtG0VthEIQ+xfam9FhueutAPBP/AUShvEs84iMYEIV+uHvwDuPqDCGIxAqSMQ1UyGxuukNMSaGn+gMxGOoONh/qDsyHusPIuBxDMz0zu9NzLns+p2da9hRoXs1t5u15Ty5VTXX0NOfQHGduaDoxPjyZmcvNJcbzkxY9V2H1zsCd1VFgbmzsfhi4a/w8ofC5RswTNlrWSNnAZINdyxoSa6xasXCqxqgaoJKaFdSYw4sKKTJKNBBxQkHDCYUGDVKbEJTG+MwGZ2cVKCsYIHZWAFhVcBJjJAFIDGLYxZlhS0UgC8MVhVVmCZ7MMiaZZcwwy3iBsYIAhSWDDdjD4saSaOol1tKsoXMqdM5SnXOWypyzVKXWxawijX6cV3pxXlShVlJjop5YM9lqadxoo3OWBhJvm24lr2y0nhFhPstSfJYlNy8/KO8uS1zmZGVFSUkWiuT8nVVywk+LPSUpxlg6jIlIYFlTyQ9/PfIPm5mtQeT8myNDdMjmfEQebYA+6rm2Rh+dQUzTR2TQduqjS8lG61+8ONpobZkbTp9mi8vpX7x4tAG7h6G+qNviJUcvCCMva4j5mm+yDYk2UeO9u2LTDXoxuRr7aNrlI+tSPHxuLSJ7Kt2JZXkNuyuHlKBrshqjv3SPGNGVPEf3aI4bbd1wCfCovba8om7YYo3GXTwvz1xb6R2OGp2/V8+zHfUErrp8BWJfJcKlyuk1VKLHLaK8zD1zzeWsxZ7wwyuVtxFlOi9e83l5Q+2uLdB2k6pWUy1lNYzVEqbu+Zqq2ukKqUqYYquimsI9le16aXpyEX/Tk+VN+G2NFQsLhYVkeQEtvvOF+S5cBS2/AXnmpidnI/jF05MzIfza05PH1uC37jemIcd0sFr3Tk6VmqeC1mQDfn6z5p2cnpyoN+unTo6XVr1m3TsxWToZzLrTk2Mr8Ds+PVmsThaXwwVIKSxNFio7C26x0NsuFrY2j7IFQ7k6hTh6rlhoh+trG/Nu65i7NIlxMTpzbjznLk37jdrUeOnU1ETp2IJ7bNZNJ9z/HHePr/xsES3n1aV5dw4qNe8WK0vVhSM8s0GKoMdrEtP2FLolLMOmV85ArtagUsnTAy2S7KnMedkA27/bcx5d6Ir99eCXnz3+5h1tf60Haf/GqiM7C7OGz95wIR/ylm0Eaa/VkbD0WYO8Y5X/nHpXthyqd0FChjwhQbBa1+8CnMQ3ei2CQtfw6CkqF4WC/ZaLpeaq9f6NeuJv49R8x1vVTeDXA0p+NiT37ySAZ3Q02LPHKBQZPV7zybTWcnJN4qf8Kjq5aMM06hPcjNZQtulffv3k4n3VNoeK0b+6ki8EefuFYWEUcyeZHmLLTgcW0/7dDc108IZsH0ejVwe/R6QiY/kJJeEeXQpFprIQNsSPD7R5by7g7lS25R58+47akwsDEd/QpMq848wP5Bo9gPhsNkLuKcN1IKCCU7F3ukTpAiDRVCG8cCm7aQItbulzrW700MuFwnd98eeDv5wVOASAZFIRmZT3J3XUuONcBHpdyvCF2MZi6HN1dDNt+9JVO9DeXRNYjB6ioQyDp2KHs5/rtzEOQ+4J7Q/tort3XWZNuTfR7xO6aI02jiIkIBz5xaW9WxcHr10ZvPlLAYf9L/ofKzJJAEM4TQuGfH+XHrAZz7IrRNhn1Fu8c9EuTxNVNLs66nIocyQVQc1Og9aYE3hViroIBD1ai1CJZPCinZ25ZMlbz6ei66tOJM9vnDZSlyW8fhbw0/79X+W4jiB+BM9kBEd/BL9HbzQ0t71z3Au9ZhxoMQA3PRKEeuhTClob7SHP2TbFmAsfkI0pVyjo8Tf7b13WQhCJWwVW9JPhNKsCnMfcawaqtYSFtBZov6gbGEmm7lUt/p8z7x2zkoerorOL5CKXp4j8yESq3/t0cPYjVSHNjefCLLdUItkRWGipJBFW+jUlqyw2LKuYjZJVoM2joN3warpaJiX3eSQZA3AO18x6Q7TVPTr97WrbeXRRfa79C7/au3Vp/9tvVAWtt7JmfCxHh+qXxcN8cQWjmeWz9mRenmPJ3U+zVD0QQHn/k675gCCxMHKrXc0UA0Ic/naS06oeR53Xddv/5i395ZgLFDU+Zt61qsQ8VFXkuV0Ppq0rAbT1GErJnO4M1cQPa15X0g9VyXrne6rGFHIVfHi2Q/O7jqnm47vvPL77th50+dKo7zhcGqvqQ2XxhluBX823hSmGbhEuhmoUmMP7FMBToaw4Xs03AeTo9u8dHpPoeca5rYr37+2YCh/87Y6qrWKjPiy9aNVNMzG10vTtGiF9dsZl+gdf/VmMQGhrwZFIK/Bdfz21BqFIFwwJAHoQ6I6ujLxkVQfNbFY/vXVT1UfzU99NXraqZHHLVYkz2pUiLqbH3rqpe2wY08vxmiVhkIjis2Z31a5aluQ2XDtcQ1RwPYqoYtURncONmDlnoLFhHpAP4DDrHZGiIxg7pM4pO/Ejcaq5Ce4jbhr3seO/1DKhfQGmbvw0Vx+9M0DqYu8MoNrwtgBVG6bAmoCpq+ILbVYBmqpsANE0ucyy1UBjVVw3M4UOEIjZpebnw8WOoiwxc5MaukkoKbF346ODL7UwRJBKFKTYTF+XW6jDmKlYhLmpFVkpNpFVxf6emZUR5U87uWIn5AjnMlyFwWvXDh5c0PJc8bKgBL+fNfQOHsULZw5ThoPaLKvoY9xozWBw9v0jbNHMcVwYVUxlSop0xUwK9YQwP+MZN/OccWtyM25mNOP5uYyex5hJTG6+YVJ4qiHzDDXJ8I+aGUSBCiAvkwkr5gvhZB2tjyD+mIqAYx4aSD1mIWkNom0sK7i0f0tfBkNXCqNqfKrw4zRDwpOH/ihcqBGhBdDo27fRlQT7VhpwkBbzzFxZSEyjsBwQKlq4pmgjn+EHOaxj4xwDP6pKpcqFn0swIEMDjMP6vHpIk1eHFHg1r7erI1S2ra4tJTrB6nNCa80JoywnLD2pdaStsIqS90ekhoq2miraCqpo6yatl/J64dghnTBKDbE0aeMGpXBI7xmkKfqOp7ay2IOzWLXugwYWvhYBXclJZy2ZjVimk7nRCwg3dyuLjX7CwnLJkpRaStpi6+8JESOctFw6bClXAgPDlvCLQ2byURm0jXzkQ20gP+KpWMdHPdWm8SOKxXbxnx9hF1fmnNOnWUaf/vnRRnGKksyWWr5kQy3UC0rXEbM0XUuU5Q06iZHP19zgiM3BdhazaZquxCa7lcVNtgvjFduKMVSLGJbpklLJsVpY0SXn3aKwKZ6+pFS/ifGN62zG52tK97KWh4cu6ksuLSIpH09xNNf8AK3XYvbGK6ad9cjK39LXEg0F38RTAPiRuhMfbLRMr6PXtRxyiLdMuEE+3+oB3lE6erx7bIamS78Rb+nWN82t2lq1qmpI3Xa6uXQLmTbRzWDqraqqK2dVRRdcFVSV7Smduhe32aG7vAm/rZVqZQF/1cp8wu7ccx12556N4BdXKzMh/NrVyrE1+K1XK9Mt+AXVytQq/JrVymQDfn61MlGDX71aGT8FP69aKZ2olE62p9xqZXnpRLUyVq0cXzqxUimeWKkW4HpZGcTXJtxfjLs/H3fXSm6a/GzRfX6js7jkJovu8pIbR8mS2w5/vOi+sOgWC+treFBisdBcLfiNUrFQr3mn5hfcF4vu+pxbnXLLU+7apPv8ojs+574w4z4/444Vqr1Zd6xYmZgeZRJvI24NGolnpgMmJT9t7d8AKMEP2O0lj0DJDKcx6PWewx4ZYks5d29w6YZCcJrpMYtdnscxi+pkjqBANqZIkE3soMGODZyBTBpkOegMfOojsPN6jAhb2a+v0bFu7yj0/OSjT/Z/ddcgfmHjOZ6Os6s4efmwvJqdY0LyKm4qKq/FTsLyMj8VlncHPbS3h6ZrKZ6i0N/FzX2HJmz4gr/mqTnv2iGTFzmR5CdsNzYcdT49aqwPcLuwqrAUQM1Ih1mPYHlM8xG17GGUuQ11zPjgwsfMgRGE0N3O/DVlatZWmbjpQwXy+l6p+uvbPIUSu+arb4KiVhr/BxPFWBia6v4bu8qdQqzK9uoJLuJ1MBZOdnjtRL1Bh64c6nX8mp6ybeExfk01aT63e/C5Hi2KTor1mB7BdGKIWS5PPGnTl2ky0TfT5HqKax9q+MMX/kRckY2dQzIN14K3W6uZP61QBGrq/+T210/efscMHSIg6z2ah7Xco1joChBxmeYr0lwBJq0nn9qxMSHPSDMLVS6U6KRvfxjl4KjyD1cr51TZNibisyogD09Lb9/ef/W6tm00FDHAmxPDzO0vdYi7rvEQX7EYK65cd+ZqPl7/Y/TfN3KP3PltqQfIoXaohnXKJSfkXdxyJLAIC+tX/3jw5R3z4ZiDsnMQfWPoYOq6BkSXym2oip2bqJpyc5gBXWzedG+XmzIMl5uDGMkCxDtNcviD95Sp4zeDi7ctUwfTUCVnFqbozIDtSoo0Fd0irIwdSNgue2ANGBD6GKdA1pDl6XDB8QAmI3Ov4HaWK3RwJA34i/f3zSIpeqkRCaNiKMVsEFA6RuXMaRjmpAO/a1aiYZiXDvwerHpJM+7G1opw0OpwWquT25fUv6HzDgOAnvWKMZ5hOOBrfEwpdtxvbu+99WtdScPYqucQ61xdLfamvjZjVWWLswp2T6xVnfFAsWAzZxjsxZu5vkcZhj9hSL7kqn6sf95XtlxUQO++ZAYNURBpx/SB0o4vq6A+PbaEtdCm7qcpS+cjyqrzYTAU8hK4N6e8CTKQUBHvEOInbceTPU51eirbhNgZFyOZxuwt9/juhSd/ujP46BvjtwDvqkAYijZtQbBDYOiMJugF84npZDYd78LwU9EuhKHeZdMOMX4TFz3N3WBk2/6NkNbopS6pH2zGujL8kSNSClId+Mr7F79Q1RHqIAWs1WPmMbRqbHjJkjEzshaLbWayXszMtFN6nGwGOFSoreJuGsuWAExNWfqjl4k4kMdJjXL7dFpi1hR4BtiQ7OkNz08cfz1QVj3iiWvlGR5AR+7ad/8CrPeu/3nwu8tioAgtgRSEOZOxfxiuM4vNOM9CVnKJuO7K+TpJRYIcbV2FocL37zXEBdwq+8Gt+09+/9K/qOyag6guom0sxUGthsGhWmIcw5Mhf4Q+NLJdLIj5zL4Yj03reilF4ZW88i6MyymO3ULCGmOM9HiHHXDZu3wuxyjN+EMmGMQYP/yc8UpY9ZxUwhhy5t6cTReK8+jtLU15//1f77361mhz9A+ZPumZk1aRNKMZ0/OYMT11GdMTlrHcVEXPUuwZAlJ6qjkCZbRmCTwbKVsTET0JUfuCFJrXAF5B90kLtWvAbmFmGmsY4aagEfKYwcYVCxhrUCySMGXDOsJUmsNIAoPSCRuRajT6r92/A3hPYz39qRCIUcxyOQyR0FdRA6+Sjbo04rKx0JjGQWMKAY1p8FPJIR+NeixIUjZQpKzRR9mgjrKNNzTUyKv7ibyaL+c0+0ROo5dzulyrcaNgtXJdkQg3lBKqnV1Kj2odaqk5ozzntEabE0U2Z+surbWMUpkQTTJhK4+yUhxzeX2hVYVux4CDJsJVnQNu6SuWbUu2SNbi+B96XUlFLRFlKKH882TrHgup2Zz4K2vxZMs8LZRGGKKTLIUCocFXXhs2RI/IYAzRox4aQ/Top8oQPeKpMUSPLhYbon92lCGaXgpPnxYBffpnL35PYO+4EWctNj/zoXt4j6x7AXoj7wRifo0x7nXAoTgozgU6W8NHbKunksqW01ZKxl00Z+r4HME2hq/msN7xlrrH/Jh9ix29vRrfsRc42oV3+GBBvCMf4shj2tlGJocJ+pDND9hxHK/JRrsKdWIjdY1vqDgp1YlDaazSLWUGobMlJni6DuSYvXpmkjOTGns7OhmuOR2KDXVl0/oW3UitJYI4ubBvi/uz1camQVXTWa2lW0faQ7WA1FrXVFVO10CVWRdSlVCIP6WNufxi2V3mUCEJ/Bbg14XfPPzm5Dcrvxn5HcNftTL9U3pzGn5T8puU3wT+xk+eWBk/dXy5dOr4SunkieWxU/A7eXxlZblSXFmuFouF2caUWywsL7qVRbe4mUVlt5ienHFXZtzSWHFjrNiJo3ZhqRiul9aC514susVWMy67Y8VVf7HozlEMkZ8W3I2ycbEujbVKbrPkjqu/Jf47Vq0Ef/f4PwBadMxB1yPb2QQHRutiSt1T2JiTVc66Z9btQTBJkrV237+Ttay1+73P7ytDsMUt9boByXLD7tmG04FZTMaxumx+Kc5l5vIMexFtMNInVDFf2in1PnNVoSGbfCwvKfcoECN6u/854JvMc6xThyEvIjnO2r+x6TVkr38vxuQoc8IwoO08cng4GdPQ/+kqTdi+en/w7UuDy9cOHvx+mHcpx5UPKUY7wLhNf9kcc6wYENkbTNkEbsRZVRc0KilS9GvmgxF1EmTC42iVzoXJYRvNjz0AJBL9jXe0ddV53A8vUfy/1z98cub9wYe7e7feVFHL8HBvDsrbwsD/cnoRHQdOvmo48Uy4HvEaZ0YcyXllv11A/MdM7UwBuH7MWO2xz5IE6KY8+05ADvVveskqRajV5kg8QD5sYgRbZd7qZA4dEJCIVRKmM464h9M8/fN39/6sDVzwZZBNgXwdhP4S9wBF9STTbPhMdUJF8lB0JZAHkVU0QWnR6OCIeNBZ/M3+bkIBbF9j6t3E7/AMt6LKvB5jjK9AAtQh+Vj8XOk0lycvvz1489ODP3OkMb/9Ix+5UMljuBEmtE+uDeT7u4Gcjg7E0ftgnebIMHtxLOKEx99i0ipidkARY+M0qPsSEyal06pDZTuH2XUQp1ROTz9LgnaCvaMbYKhPXLDvUDxXDCpLp2ddBwHtCPAl/4s/XB2cf1W5yMfCtp0hl6phi6MtZcmjmEGK7PvtkP8WVK0qSxiKCa9hMAuJ4RZRcPkuRlChwC9Z3QqHk6YBBuCAsYJH2cOMIpEoe7iFNPdePTVhaQL8jJgsJ532r4XkCY39Y4ch6eDa7b1z30rQPAwVixVMf5QwOwoJ58Pwz3CHc9b2nqUYifWYkqBvm2wRHqDexj3JPNXlmIfMUE5jJG7yFXn6zCOHA2d27GFDgTO1FX899LbwOl41TmQR+gtpJ7K9335g7Ko/kPaGo+jzcVpMXsVE8boOKAKcgcooQvy/qs5to+e0H4T6O28LibsY9SWlLTgNHw+GldOO8OglUCVOD7fVd5+NSDehRI37V/HoSA4pc3n/5euDVz89sgABlmBCMZfh7IhphV8A+l7LMeXo73I55qxCgHTnLaB+6EgZJAoqlSC/cqkal9csTcuqxUpuWlykVHtrVknTqpWXj3DN1XwxoZrGbU92W2grAqT5yo5ABNNnuzxjoW+0qhX4hY+Zqp6pdtpkPUpAa3W7fsRyAeU+KwHIEUgWtHGARh1j0Zkqx1OK0nLuU/QFvXxNRilGIKaYIPKqn9TauB5AFm5iZPkFBTXcb4TRtxSndhxzUBDFD/fBUoTdVK9CPmCeZoFjTUMeaPH+zQbvgIAigMymmS8gRmaT4IkQshsoQsW67okxoO7wafDcWE8+vIAnwutlb2ByTJFnk0Dkj1lkeEgbMg8/5QOkmMyFX4mP1MdxO/Tswmb+GnS14fLGO4mfYU6OcKXKDBO6LMwVGaWxKTGISlNi4lWwuHCxdxJJFmJWwZGYKTcSk3L3P2hFXtvBxandVa9+uPw/IjfFQ7WIsp6HgylfCxhpq+uejxEzrJrAB96xG//dXVWVQ9xFdYzgzusYsr2LmJfyDK3aEkPrMwFDqS6FiN/E7sJjGC+HAAvIRwuttFKQkCIbUXtd2FZy9+vbACvMKN5kG3/g04nwVZs6JkfKrZLokxTSGYENWcWAUwOdlzgvHSehmOIYv/kb5qkcpwVgJL6BMBWpAwOYEseTDVMHtMAqijnBGYwxSB8zdgFdzB6nGrZYwAhkUUog5RilK3BE8pNoxnqLnFjW770MNI84yFDmC8yDpwkFOlmvoa97Jjk/Zxg5YaCzfAmaYxi2Sm6GUBoG7jnEbuC6RtBqfySIsk0OHqi9oaFZd7xQmtXXYDmHki2ITD1NwdccPq7YyLhgg+IJCxFrNMzuPv3drEnuIeoDRdmz2UaIiiyx4SUgIsrIkdF8C2VGMSMUuwsomGlhTMZ6YwrjqdMy6aLj5cCixomHQdz4MHYrHcJr40NAbdxgNI3OLExTzgGaioIyZYNiBGla+OXvgBfc+aehA7cirXKDSouj1JOjdjRKqRh8oqGJrcLHDCrIrwBo879R2Ja2ToZ0NZ+LonTmsGrWWvkI5WXrrpKttrTGstTVsAoR3aRUyKylPbTiGCG3xw5JbEtF2FK6aAtoLZttwTxr5GZFy+OCFsXHLTmsZfDfkYfD48Dq/9zzRwRr9nE2HC/JXHw4ZvPwUxO6+dATE8F5xCMVyHn4kYnnPKIcbID96REGWHkjOX0aX2mc/un32V+DtayLJwPSMs0O31PTwBQr2Aj8WsQn7qH5kJIomFTQUO+EeMNmQjJpkolwg+/E69TjM1birGldxl6COUP+G9TijAM1r/MFUA+YMbq2pnIdeNk686XwGei92mRyWWgqQbecjPXJPWhyoOmMqsrRJrblKvK2sHw7OvQEX1Nl2PwpV9kG1wJT5JzGhMkGXsgXFB0jW5caSdSJfNNKO+qm4yjR3DzUJtIiUiJTUVMzMdnImzucm2pHhmJVkqeytTZOrCziz4f/4F8Zfgvymz+xcnJ+anKuE09NdqfdiP6fmpyF25lwcqa9NHlsem1m2T227NYq7vrU5HRh2kU6J1amfPjB1WQTfqtTkxO1iblld3bZrU9Njp+aHN8qu16j4h4vzrmFOXjn5MrJmVk3O+YuTrvHT6zNujMzwAmDYExU3WUoRGGyEJfdcGqytw13m5NZ98VZdzJNSj8kfHInxhpB9bBe/6KQzCMsuBhGESfGDSeLa57IKZWEapEVjyR4kqWFATxbaKVJ+Sj07JhEKcLNO13alULrrvfffHLm4uBVlu1BtoFT+g7FbuSAAfXAkeNxOaF/w8oj0Rz8lqP4qVzXKMizcMOFsAfvMSs59LaLRGkvN6h2NthIYv+Kg+G2rBTJxm4tq6ux0wVkHHednqy38Zm6INg3yKYGOusihyS79vrgwq3Bh68MXnlZHXoiYRDkL0w35YrJVnTABiHIkJQJqQPt5dgt62tsBkniPWt/jSZoEvtzNDiP+g79qw2g3tBf4eDbb/de+0J9hSxuspWqv4tvEd69AxRnNaGCmBuYjApvgTSUbqdza7SpD1RskuH5dk43IGMJlJlyGKseZMDnlmHvBkaLxUPGxbA3uPTHgwcXTeyLCDqqHMjN1DlIKoBR9uwBJVOzbEOKnJy1TsSEkhUn1I4NirRM+mZsIoJqpxYKX/G31/Z3Hzw9KdNVhdpnWdOi9uAVQw2rGCl0hnWUG9yIsaRCIXpSSSQDTZUIkftyGiZ/inYG44VaPsMQkg2yA8r8IAZqCdkKdQ7sOgaVhprul7cUXfjGweY4exQEm+pwJE5qiGdN/3rNefQ2KYQnZx8c3PvM4CXEVeL6CVi2v/usmf957NrnbXkqXHPw8Oy6IjT4+owilMB8AduYhcAmzPVUFBX7QcruDvDpm3RwGm0f+OJvBw++sRxc6wIoO/CNuh53pB2VjACu3hVfCYz4qOk8/uo1RQe/fNKRKV33R+zjzNgUxgEC/64nOK6XJNkUb53M1rFP4hAcPPgUSmWRcniS1t9N5QQ4JsM9AElgSBw6Wz3iLZEUz5qJPXn38713/6bo/XMSvFcbEt7UwbAzaKnx4BXoEN8vu/EsO1qO+H7xDcxsya1YseBmPv/yqrB6sCoDCuKHK6JRNSFOui7ARuqiIgChvkk8NQR8nGVSV+EgjTBroAMLbtBi1jdvDs5e/sfeR4u+fv+r1633ublItLCUSgLZNMwbweFBlTvYFnYt7vSDr28dfHPdDGWbCopwPmC3CxP8TbJCpCxWRFZpku9wd5UBee9TRZOUx8qwWEd9sTJSqGt5LrpL3u7vmrdBzdqvQz8Rs49FAw3mhgxIxooAAD7hPuA98RigVXP/js10+Nor90TBUy71FvA1r+W5yrvCVV7XMfd1PH4rRcwMdxMVdH/w0kc64r4K3y9/1VtRgGs7vE37aqij9f9Bvxg3gg7GQNX7WFGYOxQXgI9fGnqMYtvhfa4qyADNFzAYwANZ6QuatKMYhPBq5D/LrUfyjkQ6v0wSXXbJokT/8ghnx9wQzA0/e+ANgT8b9w2DPg3rchcGfeWg1zDu0vHB2TLmCSbSKQYP5cCQASp4CvUwTCHgs2QDHo11/h6mkJDlCkhoDPHPAQjR8UrB49jGmMzsq4hrl3iippIx+oHfoNCwop3/KdWstbJWyaQAC8KW9GjDWFWSTD1tpdSZROlpdWf3mWH9Y3cbS1Tb+sYom6fqfENUjKw/StBz3+EkEdFKOv990azEpxacTyU1c32Mu9f3i7mAwlEoAff04kkkjBIvWm5oiaJTjBBh8XHYlEV9s0Ah5Lr+5LAp69BTbco6/ESbskY9ElPWoUfalDWqHGzK+skRpiweVadP8yvN0z852pSFW5rREbDODnb6VjkCoh1pR+KJqls55MtrB20JKoqX6nysHU8c6mhX9A5vy46zNItT5gEpfMv8OjFxWLfuAjL9YGxWGGGhvpRMwTaFno354C2+Y0NQsB34W9YlBjHlrd87TbJTrVt3TTm6KyYj2JYKQutl65LCVjTOJyWv2S96bazhmrqiM9XYMrWGhQu8tr6WgkgWZUPju7hmt7vVzNKuulF1M1otpdvGNIWuvVVXU027UqrkupimUE9l/FosLyTwSxfL8x34bSyW5yL4xUuL5Vn5zeBvsXysBb9gsTy9Cr/mYnmqUZ7y6+XJRm2xPFlfLE+cmih5K5B3HH/lmWW3FC+7i+XSKbgfq8B/i+Ui/F+sVJYKZfgtFtKkMOEWCxsYtXXM3sRub1P3G5NTc269NgX/e6eysjt+8gT8P3F8pbjsVmfQUXFuabLgVsfd1YI7Zm1iH2GIor0D6kxxv4lrHcYloKmPGscHsmYRNGh5i3cIkkXm4heDl15SXgEJk9NeEUzSOEU0E0/7RMhDHXFUU5Y9tUxY7dLqYmxMnnPzwcR0ekSd/XH6u5REJ0fUyesITxrnI1CzGD6tE6Hbm6SRGzZNO3d0uJrBm18efP6XwX0Wy1DlOLRWv7t13A8muho9GlJcJvZgAsOzxcBpxrNDlPWBIURZnRmCO2dSaIGgjqFeCH7uBmENwKyZc/ERoP3bILUTrnaIbioAuBdofSre4olX3OR49XRC+/U2MaZluCtnB7deHohHo+KIpoRmwLsdNKe2LOULxrV4JkE9a8RwPW3zVEpJsZS1Seaoo7F627iH1e4CeCzsbneoI5DPJmdreHEYbcWy05U8NNlrine6fvMNTrKUIyCM33qW0uHDcQN5ke9p/1odU+uA5aC1DNcqn6C83d91In6DeWNL9MIwW0Vy+GbDl1KUlN+gLgc7DnIxtFNNCjPaVAJHkRdafYRfjfig0da3hCPrA65Lney786keQp//ee/CZTWEhG6HO7t0QWGAU0HLyuSh61Lav1fjLi8evsQIvzj7UGEzapY8XWWGsoUBt3/KNj3e9SkbuVTK0NMtNgiggQQjAMsYovMnzr2y/9LHamcFb0Sl8cpOgrKXlYqvnDc4Ew1XdvWQjarKTmZzgflNR3PZe13CBvuN/g2YXaFvKwNuHCfEBXt1GoA44m+hMtYko4/5GupIJQCLHejQ5HqKOvPJn986+PjlwTe/zXEx+x5zfMyxHZKP2os5qA2PhoG0FnMwrbXtUxwq3IqWRnhOFX39ms/lq8xVSNIF8aak6Df8NX6BHtcCOSKqiYC/7VAmNPoFvqro9W2yETSwP3Ac5QdX9/90Y+/i376vJJ6cxKEK4vdiThhZDpV7qBjw2Sv5Mjw8u6pLMHiT4zrh4b3+cSeOTBE0QXmm6OZKop6ZohwuB2exyxE8fGfLFGPw7c3hYuCsZNmQhwlLEAZdOyX33KcbQxp9Vnqa+P7FaxLpC7fGS0+p4WuYgLKYB17N33IwJhwfneOzR3iQYjIdVieDUBQN+qGpQfjpexipVR1UhhTo86njxDQvajqTqthFdmbF0nNUis2RDbea5+OvXhPfCjyE6AqSqct52Xh+M67A0wZG1qUc+itRIch01nXQNOShCLWM6dxKyQwzwVBX9SofF3//MvA9ePBHCRfBhhWfj7CD0dfxkCWyXuI1VnrOjxWfbkqSlO3Ghgdbj5mBbBSLm+QsoksK0+DIx016uFm8iTEG2UwUt/L5tqAj+3gO7wI7GuiW0+Kf2k6Jf3J9g4Ef1LX/kUrq1e24yFbGUCEq9JqDWqGWDnSEZAopmvtg6G9tPlic+O3+vYjP4ay1+SClpL/bziJysUYLS4a+QuRNJZnJ00+LTygG5uYDLYEEBwlEkECIiGewCBIAC93kk7qgdVYBhpPoYKLkBgwTho6ABXqAxZjnw+hXIX04v2Ic8eZGw/EKn4tIkxdhfOsPatNg4oVZ6Nd5ZKhNrH4Y1GIRKV2ft7iGwWb/jog0nS8iPca5PadH+h2tY9mjt/Gj8tnue5fv7Z17/fHdv+YYamEirxP40vJEuFHTci6bFQsWw0gJFuakBYtqVhQuIOf4pD6rVXH/B56I2eFRYdqVj8VM1VFtwpu+6FbKJ5vrRtXxB7hRVfwBDg2IY8HGLqHf6XjiN89WHa/htb0wzKGWMOTYIewparH67nxNM9p7/doRRk0zjWHEOaZQpp7ZDE9g9BRDzy/0rELPJcwMopBH9xrXa4hdyQPrPIQfMxi6bNCzBs4GNReHIHPVAsslg5NLNkjWAFlZ+g7hUrGPChY9DEQ1BlXIbUKgmGA0+9aCZBqNGZC0orDRioJDCgqt2CBI45+RkGOOccZhcDGXhxTVHJbQOMLS3lotj7zQSlqrZ6U0K0ZTViz1WNE68XheF2olqDTgktZ6ZBK2VM58TpdpLcaFVqLb45M26zx4Sbn4ObdkrV1Is8Q6EnJOLQ+L+Hkt2Oe1JNdCdN4Sn1pmWsJLi8g5Janm8hJqzpZOWi7ZQqmaE0VVS/qoJ+Xc0NfDfsTJVtxS03hgFL03fKrV4efmRKsRz8xpViMfqpOsDj80p1iNLBEbNV886gQr+d6nT1OznH7xe06vWg2yVuCjUT6I6EYCOFrJcsv2MCwzWflC5dumkshSHMJtjR+i1xnfY6ddBZyk2fA+Xn8rytj+CXT4ThzO4LcR+a0daFntNkiJvLu4SzFAQ2UApHs6kCmM1TlXwFxuSS/EWCqqApof6ZbCG6wFoRzIRdcSMFM2HLMfXU9c59CTsGvXLPbk0KkukAuV2VPds23R50ibO/w39mrqdCp2vYO/GFmTC5m11OXQd8g1vGllaVXdklbbmWYyzaLbQVVcVVZXzqoN5eEAo8J97ansnJXFrY3K4mbnRKXcg9/2yROVBfydqMx78Dt1ojIH6XOYPou/U/Af/JuB3zH5TctvSn6T8pvA34nKeAq/5ESltFB1T52slMZ++pOV8dLY8WJ1btYtTbgvLLjLHFDTA+LjpcJOZ94tz20cc7c24Wox6/604nYm3FKajG90FiF9vBRHE+OlcLy0vjZeClql5urqPKT6jVK9BqRK3qn5Ez+vuD8dd38y/s+65gECwlDoieXe46eElhKZ7Ue8Nw2hUsY5tZtPL+zgPU63eUF7lX2kgoeXyB/lw/ODS3/cv/8eA/1P6uhFRDAt1ofdNxSvqpw0bh5mcY9c5IAJoesLkaM4kBfDFaavDrr856tBOVO7Jnj+Zi9fl3sX/wV1MQlYG8NF6kM81EJzVodvRJGHJPgcJ0S40UOcVHQmhzOlKd/7aiczThzJPYVmXxQ0+8krbw5+i+e+Ktti4AidUo4N2TpC61E3cJh+yXIIMfTZ0sbUZeGu69V8UwMf3aJquAxrlZ9zSPHlBV9tLblLceyDmir6wc17B9/uqqKr3A3cgAnCm5pVOKBdMoY02XSsc6IpW3KiSPJxXw8+LMnGDscwpdjw7zPLH97FRo2Uqw1roOzfuPgvHyhXG3qcAHm9ZSJr4kllYq1uRF6bFrdNTMMM9xbpjZypp1YsrqEl4p6yUT959+bBrT9bNuoA5lk1OiGZWdDSub+Gu6fqHKWTeJGxGc9esDLL9rnA6aJLlrOeFlQX01ylexFTM/eC+Z7n8AFfHHKOdt1sBvCnS+EidMg52pZJ2cnYbwLPkUncx2UaHXaOJns05dvAY3HJ4nstITvC9cGZb/cv/+ng5ofqmF9hnGQAlBt8QB9w7y3Ihh0h+fCSOBMLXezNZ15ieiq6KfRMrIoZ8dkGJlHkVu2WpnOZMVNXuXwTwKCL85ymHvNn3t/77E9q4LT9mqMIjQ0xAj5F3keVzxOGaInTvMbUioHhxUsGzGmoRtLVDBcrYKuujuw8M7VRx7OETszOibzx8Iuzj+99qLtdUGv3/1znSUReEvgUGZzORrREAb7gmfyj5AG9R74LJBFMCVgicAFsJ5Nt6Mw1doLw2wHdd8UpwlPPG35W5ohldM9Rs1ACQCsGHByAXX4Orl4DJtZ34lfGber5j6Sf0zcy2en7aBayokMM9DkuGB9Adq9TRDsKikk9KeL9jnQiIeWiHe4RiDYcxpnesf7wEnyZRxdCdcDhxx/sX3jZnHEYEBM6ZDhQ9iQ7tRHHTJFtRI4iJ+7gRM2M9qyBS03KzIJnMdQ5ycvFx6WhXleZ2dpCBzeEaUTbHEsqnt3Ds3pL2sGtt/Yf6CAw5K6fBDtIhOOXIHV15/FiocQxoa4kxKvG/UsxoH3dF5j831HtT6vXSUnBV+3aivHmNa3T+x/oF3JDAhrBemCNClrhNQ8ODwr9Zl5RYhmMnrx5zSwVJv6m8hlr4GJVbcRSYShGKnJxEXsVhXqJCVaItRiPkj/7mllvZ9K5gAEaomDAAEUVo/blAgYY0mwRZsKi2mmZnmx4m34iXmmAV3DnNa8/JhK5lHPK2lOiHNsoJ664B4k2tEBf3hZDy8vvqQPLfQTftNFc80nx7HBJlmBGwszOb7ilkojLr8Kvf31HsRvceFexC9F1DwMIYAvgDUV6pz29ZPKuBw340oQFfH9WfNc76RYMftmVEvevgGy6R9suX/vo4JY+FSvrSsVB5XXFcT9QqT24qOiDT+ntx3f/ot72gqR/B7RiS3CUskMmQUypDKVwSZ586CE7pzOW6irfdUjEU6bYlCILmU2yMbGgvvf63m9fOrj5maCThHu3ZaWlA0oJ6Vq7GFQ+jdtadd/vpBZwQ2ON5nJw6w/EYqSFdgR6WxLIpdIVYrOmNdac5mkomKvcZMKeSXjdMEvVYLSurXRzNQzpD+H5koXkSxrDlxTKLuWAu8bsT12fXIsQfh0BXssGuZYszMqOokG2wT4qFnK0YCPqvDbauhEe/j3QmMtsQ0aTexRo1Egxh4PyUGvMgj9jOeSTh3Aavf3TtHIAZgR6saDFuMEs4xqtjNtIRYMU/UV95TYu4EGEvtbwCjMsW2hBIwVRiFrPWkrWUrG2drXU6mGdas1gS0aPlrQGLdnKU+vNnGKxdFaRA6QafTKkobRykrawNIeS4JbYVrJayWkR0okE45Q98HRnYnBy+E1llRbnrFBcgb2wRthm3fPl4CcllnIySe3qriX+ipz7rTrH8NbukVnM/u7Rj80m76Oeq53eI5+b7d5HFZBtyj8+as83vLZ5+rT9Xv30j482LPut2Fv3grXIo53MeKfCOAbbwRq5dfIl+5ridezVeH+33HAYTPScRT/YHXMTKXNqgEZToYU3nAtt19662VpO4Ts5kVxEQcK06szJD+UWdeC6x0dHBWt4SVpxLRMXXT/kG05FI6sualcSyH5aw33j4iCM15wr2IEyNJWvKt+R5ZUMvLqZ2OxOpcQceHSTDqlJd+yCGmE7hfGWvvTEmoxGXz72Sa751ClsfN3cpnlNe+r2041n2kkaRreGaQBdR10lVQWrxLqMplRPZUleWgxPoDfr0uJCCr/u0uL8BvySpUX0mp3rLC3OtuEXLS1unlhanDkOeY8tHmvP44bupcXpfy+7kDINvyn5TeJvaXHCg19taXH8JPxOwdvh4kxpfWlxbBl+K4vFShPfL1YrhcX1GbdSWFpD39fsOP7fTQvJRg99aTE058Qc2pvTaXd9yt2YdLeK7o8rbjQvm8sxLOeChOUsrPqThUZ9yqtVXK/iBuh5e+rkWLFwvFhYWf7FlFtfchdmXG/SLS4tLs6M9KilJfAgBHmJATFyJ7nTmMzgEczC5aAW+ykFysLH/qEz4FHvwjdIU8/h2ZX1DGZXKL/Xc+e/71356uDMr6zz33PlsmCfVaaca6FdGnuZ3i6J8jBUBZCpo/BW4cdgVifxOcnBJG6FEsS9DoAliVcRcKfshRoHYX+XzgaW4DCoQyWoVLzGy7/WW/5mDBp2moE5Ootexy2bdO7lb1/dv7+79+aF4SIgLFgN1KkEh0qAz/q7K6MKkAa8zch+ab0uoQc1e/HCYv7auS8N41rbR+fNBlGSLdwcEgdwNzzEzcLPSrTGmo6jb95MrH3d6r1aO/ATtbcbEQ2F8Kmpzd1PLp7BWYqK2qhJ8WR+WrY+CXeJF2mHBjQvcO48Wx0l0GIsllDiq01SXX8Ng/RAn2tjO3JwpSobQ/EBdq6M+VKIUjYi1P2ePKSxsKZfqvNbaLd01pOYY8Cw7zN+A+6C+5duPrl6V3dB4RRvktlG7jIP3ZrmbW7xpk/r4IrJFq/WG/KAZrc1+b3f/VWHd70DkAwaBQeWAtGAIdABjadvGkFj14EhTBMqDaDp0Eps57hrADS36HWaX7GzDbTq3u1XtLNNnq2MZ4utjlVl8yzZ7GQSZzipEcyMVPOxxYQN/Wio0AHexGSi7P0mIJyYTNjin3tFWVA4zCTc6SdUANrEmIv48Pjr9wdfn7EiPuSK0x63iyH7pSzeOpot84ymrXC9ip/E6yU+4hMd1DE6Q6R8UoJN6ruBPXhTGjGrGCPCHEcj0S3ITZcNMEE9FkLmhJogN5o7QYLbLDFUVFbDXh03rZANUMBWnba26pgNX94cvHJPDeuRZR0fXb7xkSWi5HwhoKEW2ABp2MvOWmKuInzFtCHAuPp3QXx1LAnSAmGrpAd0wPV6HIodG9WFOWV8cP6qdco4E0Z9ETT7d0KWumlG1MuGLmRYi0MJS4GEYc5WFR8UIc9eKExdTrFA+b6qzwkiFVD3zLcr6+NFKFnlYzSN+dReZYz2+92neofC4Owrj782h3crNqUcj/Eh4qUcZWlxTVkanAizpQjXd+p4zE3Q8Dt2X+zvNiO1FUYtYKkuGKcYWLCjXzIdz9/0fAoy2bVDhCB7DIe1ofvb2VcObn2p+psuBH6fBtC0+NOaolnTYr6Q2Mi6AFdC2g4p85IQXQKxACzpruKhZpoz7ae+ynzV4SPdbd9JET2gOFEmK+ziqJX6u0APdAgkZH5Lh0BfHTKyDpMxWgW6TpfCkeDxLKxUAEjVGFIpN903byCeEsNrjhYfYTgsHL63ZEZE5Ah5Eo87951U4dCBzPpUpoQqTDOVUCt85J95Tm4fAR/YDA+a6AdKZltQOLUFQTyYn5duJdFPofnQ/9unY9w+3aEVLjYsStiPXw++/Gjvb9dMpPPQw3XMpsRvCDy8J3TVoyQMdG5n6fEtPzQcxKZB5JVLfk70+4fRtVFGBK71bo2cSvBkH0chpxnQQMNhKNFqiKrBhtMHN2+ifsjBaVOSxNsBYK3a19KIcoR4jj36WPvsTmdxD+l8EM1b1JKwFbVEjYvSA+NLC5bp73I4S8CoCsxIuEsNZnyJeClohluXT34VOIMt/NbvbTij2bTp8DDNhc8S0yzkHDHNQZ8kZliok8SIhTpJzF/FzVJ8tFMUJ12Mqk/+g/AAxhufrBrX+EAn6Gl0+ncoxznt/eHBwZmzdJaTJoVih7b1CDV1S/Tkmig2eaVQk+Tgn0xy8CE7smIMglgVz8+a/Wsh3nMJ5WEgz6Ah8JYKSlZ3AIp3ulLSx/deH1z4jSqpvMktapMtGrKqQTVhddCcIa1OmiPa1KCjrO1mulfITfLO5aZ24/aErmBN5fQsLj9/KuXmP+XcNGnp8DM1K9ITotxEZGloBrRkzXeWhqYbS7l5hp5jWOi+rIB92QD6soby5RyM1wheWdE9hhEjsHNC9SHYSKh5yYbLGimPEAk88PPSgOd0eWkgh6MZUaBixtvo9Pug6coIrLcyAuitDKG8Yg5calw5BO2KGtdp5DVhwNyYQXIaxVkAaMKgnxUb+qwY3LNiYymNow7DnZEoZxjelDWowbmF9poxqGI0pJg6UmFP5fXzlFHGC7b+1arX1oEVrf0qWulVlLqr2KpOqzm7G1nKZMl0GrMGPWepC60pVBfRAlzOhiHxzOifRTcjUV+nWxJbC2stXseUXC2zROWj5uKcINVCVBoXxRnFUVGCjm5yySThxnLCTcu1EediAeRfXXD+jef8w2diDT0052ENPzBnYR1+os7BGnpizsA6XAQ2xb9w1PlX+EJ8+jTittMvfF/ACjQYB9vKHC13cqIVxh/26vqwKLqTYBS1rJV6kb7kE62CGiUFNYnQEOxEviThlbgLY+iJVXURRHwGVE1CleLpVbS2hfZj0K/K8t+SezYRx7bp3g85hc+DynbEk5mumSVMNLBS5gVKoAcqHgUSV8+UE7W/Tm7l+iZY4zzETpnw5Yas3362rc3r6lqODsOw2tk2Zt6y7iVcBJIIlVEeL8WEz1/Danzd3tTKql25LaUdTdPpplKNoVrCVJyuTCVMsa0y6lI9pU1+e2IK7eq9pfLmTyfcpfLWTybgfqELv6wwn+xMuYX5tFWCtLkO/DZeWHDH59wXZt1oli/jamVpRn7H8Lfk15fh73RlaWoVfs2loL48WatMuItAP/CXK0sTDXg+sQL/lU78YtL98aS7VDr5Avw/Vpl1V5bGlmbd45CzvlJZKlYLy7Pu0kq1UCn0ttcn3cLWZmfCnT0x7s5D0Yo5L+1/L7iLBXeu4Jby3tvtsLLgTnFsjNbirNtchfsZO27GeHHZjebcSfutkyeak25j0j2+slJxd0pjheoSG/afG3XUVtbBM5EIWMs1apesYu5DhMHmlqbxAn0J/yi3nUs39q5c1bNHoduIyNQnt+oULXmYxqDZpixO2WrQlTw5DnISFHHY//YNViObGICog0e3mypQipoUJ7izSlVGsuOkXteKlqtDH8/3lRfxsA61ixUNUhi8W9Xv8r29d87rw0GGubPRmU9vPlQKa1ProXKo+BDD5VCbW+2iiCmGS6LihlAAe97EDhqDMUJYY78lPK8oizd/tOPrI4Z0/ojyB8oPxKuFcdyqp3ouHKP2Z5eeqyg+B7956fHdv+y9/mAkWxVixeKMYTqhNrKOb/NNvE2OgmZz7QkJw1cOm2LGB7/6jbhu+ZH4bqnqxmGvm46qa4yHhPZvAOR28rWNMPqE1PPRhZrUcP/6RV09iwttS9U8dsx21jx53tHKlPkdpKw2sQJttYM1jgDeeXy8lNQg8YMWN9qOtkxwtqw+VHQ88dnvxpEuf7AD09xLqg6DGxf2Ll9X1UgVL7QpWe4KWRcdFtBVNsUtWtTuHqeipzYkC/cxdcg0sURkxk4Niql2QkOuysWBT7Ymu4HfCvn8VkqSrcdhGGQ+uV/RodYczGaN0CedZ+3pyMydIJzQZ5tKDIO7f9FOIP+IXxpOjCJ+f/CAd0lji9TQ8I1Vx3kQLyb0Pw87fPgWYnj8HPGzodPtf94VP1yK/txx/l/ivrTJjSJb9K/o0yVCN4hhljt35tMNSb3Z3e1e1F6/OEpSSarukkqupW31Jxsw2IAHY3YwMzaYwQ3YLGbxMuCIJyb4Hzes7va/eGfNzJLUDMzc+16E5a7KzDonMyvrbHnyHFEzG6qYRwk7M2gJJk/AaLYa7/DR3Xd2PntdQx6CoGoabjPOKTY9aHHDt7AkTxOAY6spwxJZFF8NZnFZl10/uocntpyM5aKaBM0AjyEnGJUgltzSgKJVSL0CzD3lx/50XYNJa8iFB9s7Fy6bxOWCj7OuC7KuJmHnOpN/nWCLjs/+yQa65Igl2JJGDpR7paR+8qRvt2GoSreUeRdGsmJwFZJzfiz1QDeQx6gGNSXf2YOBpUB7ubk9mL3PXscdXbsHg1CnFXzuQv7gC1FY4rxMMCTCjUfGYnQR4l3hlkYgSsgu2qD3Qw6nbBfwfErdFbpNUar2O1Ebd8RBHZzTJYWptYx/+t13Hn13VT28FC8ZR/CQuvU5NWhdf1PG6vgsGZTG0VQRqnMr4TO+TIGXSKRzdwuMPC3p+8HdEeTAoGzb+OihPuSDtgZ83jwHFaDsojsmvrQ+JW3XCHrYlY2CCBy5N/c9Rk5y4qVjjF/4GEJgumzxocRDaSEFysY9Y5t8w5MKD4YLHwRQ+wUTtBuPPnlhRb+8DT2HTu/5ez2KTkiAfpDbYOhlHIsgIWBdv0AGnjD0M07u42u5ac5Zxrk4KPRDKI/jrCKDdYJo4PVNO170jt659YHtAyWqUcTTFte0hX/AjsUcoNbRvOBAAqm74A0+si6zeJpny98MsqqBiweeNO0hg08CoNYa+xuni2PpCx5Asvfw7TweJtHSZ/Snrrjgp13IBug2ngox87D3wtMA1YLEg2W0tkYng2pV4MOsbIIUpb0DhihIfksW9m7f2Hn9bRX2yPjaKjhIqk7XMeUZ7QCoTZbaybXFxoZZBxVbZgXTRMusRQBk1CPhm43IWh7F/uALjw5wBJLer8MPsb12OzuTs9cOb/11X3vtJGRlPkWvONR4a7Co8dbiUWs4ITLW8LRLnNovYJSVjI2yxKYH25Ju6yA73zLv9gt92kqDzwFvQR7oeAXe2KYI0ISPZpKHtfvaXwDhzluf6ciibhZ6OrDNwc2QQqOV8zhkNIrEmPYtCo0UQOB1MF6M4dma5KLR7tK0x5mvRWJDBwXL9zr8UigKLpCZPscPYJ6htv7h3QuOrd+C5r7nAPPLYMDSdwUtfbfA9TUQ9H1t6KR2VVT/mnzh6GFGBZugAVXG1Z61MW2nktdzqnntxmg26v0aoSzKagMtbiggkbUuR61GG4AyUSBtoupqEUaBsHJ9ReT5qivD8wGrZRbbWWB3pPWKCukVK5k70vghKxIbadiIwgsi/y6IxLvAz5VFMmWZ1PFhU5kvMaIocW1gjf6q3d0wYue4xGlkTRcoyKy8XxnVqxZK2s3c0px0NiKa/aQ45MpCEwShyDpFJWZjGKWPNSt0uPKNkTQchgHTEEScLIH5EopQyeAmh3U2NDGBT1fSXzGRAhZPWSMcLj7KwlGstKHvLAO3AUmILTn7qkL/zJ6qy1UdluobKcJe8F+9hyf5kVE+Ns5iqsxbSg5bqeRYimEnlrxXJpH2ykQeUnFIeyVH1Q1BN8S15JDwiy5ZnTYUtZonpoaO5gidRNvutgI/4ZjQkSln4rbm0jVD0iaYz5vBgn79o8bzXJU1neeLreF8tFzN5rlyazQfRcwm81/vZzIHBezkSTZ6nPz1T6Yrw8DF6Getxt2Ioo9QqdhtM4wK4rNBW+5NzZa6lcst5/rayjBxGb0OvmPPdsxcdiro20s2k2dNQLbB5Xwp5vPgTKaBRjBgCd5p/jKMSdxFr24orUk2NSlmc2+Kpz9ouXB8ZS2SWow3n6/MyFAMooO/EbS3Ah4V3bLNPvGa2hW+o+IOBv5tSGmHk4rx9GHO0T5MZyy9kzIewAZGGIFb5w5tAFI9Ovt2ts2Emjk0k2YmzJ0iZy7swHWYZlxmJG7nna79LGO5d7y6vLoyu4R/D3UOFdcXil24X4R/PalbWJmdX4ffxsrswTb8Aig7gD+orsPfOfjrw2+2xu1nah79nYbflPwq+Kt5x5dXZsszB4trq7MluKuW4ni1WO4eKs4vFBdXDhRLUfdQpVwK0awdtMuLxT8uFDHsM5Q1VmorpeLGVLF0olQqHiwVoexYuXT0SLl0eK20urR5AEpWTi9PckvHs9N+7PcyjdcXD7bhhpwmndPTlAvAtNJD7rYED9VxNEH27FBJavfN88PzD0CSUjGQFF7zGHFhxbgqx11dqEEeCflnOrjYQ5ORaAYmT7ya0Kk6ku1hDpuGKjyo04U0I3mF2pK3mkdJC8zh8wbHWaNTvjU5gg5MCuQ5crf88XIf1HoK1fr2+8Pn7z968OHw5c8UfcnFOJVHM+UCn2LF0gKWlLgEU01dEvYLe+d69QFx9dKgl6DFAYekDuLihLNlq+lJ6zLW8J06GJzjNEb9oPw36ib+9vuPvnvZeI05YOfynZgbwTqXRzTnDhQRmIECeOuRBloBqUvMyM1gA0xo4fjAl61zCWa3cAfXy548HYVh1LSOcBhNAo9I4pBgklmIeWF44xIM6/HVs5OwOxsSipstMVt+2lsaxW5c5i1y4wBv0Uu0asJsvFkbztKG7y33FThVDR9NK9LsXp8240/hIsSt9Wcv7L75wvBbOb2Lscmdj1lMrzXoeQ46m2Fz3y9ZYSfhUSOsYLJG2H+i7006LrshfcepuP/t/0bfFY/2XTBp3+l1xy1OAk22JpCjNCO0lgPpgUUUluUgIke3ECvH3vWzO1+fs/nufyE8Dt/AIMWYRADtsdsQPU4aoGegJ21MJn+1iXFFHSOZI+sq6+FbfUSf4W8wztbJQGZq2beRwhxlgy9pd+CTM3Ri9YxEpnj0txvDl98cPnxm+PnLTnwK7oVFmoxgOaDZFC1ssbgTPHnHHmhmKe+UxBFHXajjp9U5LAmVfHKtDkFV54zudBqWnrtjngsxGvzgCz87pQ1Q4i3Ar4OH3f0wTeFdSVrw7bQACuaPrzUwFiTuTvx4hbaV3vgbaJt7T7+z+/S9nasXJ3VvKtelMxmFHx3rylQePekaBRcvrr/XXzD41IPJr4mpe3wagJ6nE2bB27LPTJ6Chue3x4efoX1pbPA3vnJGnuvPlNsHGXYe95TFN+eMNxOVh0d74yvl96AeApvxM2Dmemw4AVkOHbvh67bFFEOFm7YC+WZwQ6te6Pn+PMp4gy9RKdrA9Ht4TIOoyJvfDa/c2X33q0d3z6rqSPbVM5zLh28EktilFY440hMESe1V85sUJgm6hzYS6HyJrRCDm2yTR00Z40Ng/wPvCbK/wVNQGaEwWvAGtza9BqcR8jd9POUAyDe9diEMg1QsLJjV8FzT+I8/89Hw5VeM0RSgzRicMwp/RgDO8BAMEElaSiCUNAdxM5HDP55sbHeydlxwfA1tK/Y8hoaUujSkEEN28wD4ZocSHWKeCTqNfWXn2b8Mv38zh2tVUKw6kFcZnEy5gSNzTmAMwcNvgIgYkDwaYMOjxU80T8ukweA6Zg+I/SZuCFTpjEeQYObrxJt2BFFWoD/tkyYesyQKivTOW68Ob9+ziKcUG33cBHaaYdr0sAaezDUB4sAh/ubgeiPzMENtkJFPMu7soHFlTTb1Gxn5sFNlvw2iIKYt5GOGzKQozwhawDgcxbfDcx8Ov78g9vPBfY8knIzN0qDhAX2TPUOGrFuGAtpaYw3oHy+nBe0+w3/03at79z/5Kf/gn5DQ2QA22mCSImDEf1c09vOSsS3SoAOONOyKwtStnEhJiHMyKHdtvFG+xBVD95NBSyL8VXPiXtUR82Zc+c7Idk5ff8EU9icIXkbk+h8AKfKQkYT+RTHISEAmiJKEZshUOOBEOAvUD5ENRgWDfaWCX8Z2Ldcd4bk/wXB/MYPLsTeHt01kNcpnHCYzwmH+AXV3SfsEuv4PaK1LaB0qSz7TPK5AyR2ovb6heOj8HYYHRiiooZuWHlWVElWFBlWV+szlCY8hNxNCbAAyJLGFfyvIk6MBNiY0sOE1JlXa4BqTazW0xoRaG1hjcrfYMPnUfmE1+KHk5EkmwSef+qlYzehVS0Yy4GvrdEuvk2xr65LkjC98chbF/GXk39lQYxbdBxTrFyT6fpczr+FfBgz/Y1CZZovjTgT9rGbvvD5crMM9Z1HjWwM8O5VFfYYC9X6D7jnaRJidZpxIELIo5SIeB0bgSPkygRuOBk2WwqTFvsQUDRojTTslmAgvWOdR4pNaosndGlwVdPkOofYCjATXNjNGBdjmFHvDKqxTau4jnJ7WBGRgtanw4KrL4Pg6CHmSMKOct4Hb0qeljgp0bltkpaVIGR7h0lt9neZFysvS90MA8m9CJ91MMrb12eA5NldmZnQu7NCdsZrhmJHwC6BO/hyz5/Fjh1ePHlmr4g+uV+TvMvyW8Kd1TpsF+TuPf/84U/z9VPGpqeKZqeKxw7+aKoZTRaftHP49dnj2BFzPwm9GyqfhX/8gPDHVPAH/nTh+uFKHmvrRtSo0LdePHoHrI2vl0q8PTKOBsw+/0+XSZjYFF/iDfz34dV2f3t+sFuemijNTxakpfKbd9KfKaDD1opXib383XTxxfLb8H4eKxw8Vj8E/aGYigUwDyAnmUpL4Ujz5g4E3RTBj500uU9kvakSoR/RzDaiEhb/B/WZB3PNI8tu5emnvwhWV/H4RmsGdn8CDriu3MEFvU3d1QYTd+fM5xifnrqIg6XoFwAgMloPqgmYJnJCcktg3NB1sY8CwgHxFC0EE9XLMhh9O5OltfvD/PORMzDUPH8BVW8Dgu37sYaolys0MbGqwjUL6LTynep3NgvcuPHpwdufsh7vvnc31DUN4Nd0QnKM94lAXpjPb2Bnxzmb0fq2Q/vfZtzkap8GJvjFIGxjl8IIxb6HbX8+v0xizwUcssI6UN/hce89j2ZWy7BV4021wraFceOfqu8MbXwwvfK682IHSMC+XcDQKvUheq9sEuHwip5oclFAhuq1BCwplajHe+FgEvcBvJiAvcrJZz1xH7bqtAHJrrgEnRQ/jhDW77zy78+zLOw+u56FZnUdhWsXHQFbNR6EnZvkLfLP8CYMufxhxJ8AoMlbzCep41sqsepqeqOMb+NxAoCNQVFgxHDEJv3ya9fsLoLgOP3xxeP4rB03JIJh2QU8bsJTW8DLqDLURgN9++ejuJRcgxoHDmCXacQzmive24xQ4phdHdma0jc7MtT7nNUalDaMd8t747W92nnlheOG54aVzLqqqQVLNga86oKs5qO7SVKifO8o4BbuTNFHyfrkMhb7A6rZYKg15JGg0MCUylnunyOakb3nvmw92rl7Ut5zksCWwpOUIWB6hn0QYoFRCJjho4Ql+AK07acHiN75pPsWRULPXo/svwlrmPshapjSjMswzmd/PQCCw32AQx1nNy31/GJckqsmXx+FXB/dP64e3d+6FnTev2Q+PI+EJ4GkLs6SQOAPkj5cbqBhpPFcAiKrp9W8en32ZIepqTdC33n4UWQs+qaZDM7g+Ry5iDMIXrUnQjsHNUPuKloyvPjN9/deB/3iZTh6ISXvn1gMAz4vqjByjFVaC3h9MT/3UWx9c50ptRK6qP3zSpyOQdPzvWpNjmj+6e3bnve93Xvv+n4CKSb9PsbE7D3fnmfPDh884cIGHbMZ4OtblOPAKqZA5Tx9znim/kfIWhSZJDc9hGDUT/5n03y348C6vK88Z/u3a7lcfGZ4jeAHjmoNR7f5rLjr+4BRLVLUvwEFj3gPj4UnrZfUIg9b7yT9kpoltLMPqxxhnQkdEkwnoGmY8MI8vntfxsBxBMbKTJwUU7edFKW+nxQbpEzgAWEoxTaHXG9zXxigzsBSBuI9KzH6DWaL2E15dxmmSYQwyXchxhjG8DPn1g04BM34z6cXMV5bu9vDTaBuOdPb14e07liOBvNKBibDiEU0Cgc/SJwGjIxMRGtALfYxesk3FJBA1o0Ij8OLmTwhD0gtHFsJusA6/iSE3aEbdtYlRkTlEAC1PoKKJvsD1iLym9e21RAySFzj49JQxlIoU9Plr6GxkpaAUyNUBF4ewSAA8LSBL6tR/KmclZVDCVBI8Xp7vNJflO6yFjvTWQINnLb/mxJRkVx0ak6TPiQFsuQkXjLARbeVykAYbNz7VbTGbr+P+i4zGHY8Ry7XXyhjpVri7I/F8mdFB6q5hhg+ff/zO98bWK0AbuB2CvggO6FiKqrbIT6iwKjig/6HPO3QGDQabF0GFUT1+/iUYhViungRFIdjkkK9MQJOsw0kZ/BRYr9RhqA8JPEBTQmG4WLK6zrkwn8EgXN+/ufunbTFwtfzQK3joqLYs8Zn6GE67Cwoth3/QJqaALnqFPoi1c5x9rlUw2HBZ/vkq4yEMWzDUpsu1OYCOTD/Xir0dALbHZMIWBR2PfjjXsjLh+a8ef/KWgT5j4M4JxBmBNkfp9a4jrT2VB7Tz3od7X3+rgCZZ1h2drpLT5ipGj6vkdLiKoyYaDdHRikrcTdBuSkb3KRmNp+SqOUbD+R9Rb4yK8U/qF45y4WoWP18az0vhY/L3LxaKjSg8KgQfyIu/B3KC74Gc0HvAkXeNqGsstw2J8jzYniAKAiNiL3VH/BsT/CpWKpsxApkky6XwZiJ7qdQVNQa3OGM707zMCkhIwEUuavhWQsqJRaMCkZWCHMHHyjqH8iKOkW50AJb/p74GHs8Vw/qINb6W5e4TWHuJue4yA8CikvLyqsPGDQf/hawsx8dGmZih77kLZht5jjHKLn7qSUOyDaX+mZTIpZEjBPKnH8yTwFGapUZ6YSqFfyskuN+EH+GomX5iE2uon1xtTfX71auxfmK9Ndfv10E22P/xt/sY7Pmx5smT8pR/8o+//Ql/Yq/pNdDzlN1WgxQtwB6n7QuSYItt30EIV3BHNl6KQtPSKBvktNtxCjz07D0deW02/AJcjo+tBdTUF9O03ECfO2IwJviUTlDMveYa6FxwRqM0+/QaAv8024FxBFpOYEMJqQFX7EGLPsqctdHeUDZG9rqNyL+3Rm7KFNSi6zX4Ap2LvTr3MKpzD5079CPWdIcEI+ZY0gCJOgQoOc4IP6Z3WaTBq/HKxP/AwB4cFAP+SIAOdLs2+yotutFpgV73fLt3wgXGTdm+RZ1pMcXn34Q7x8708uTZyaIh8KaNGTwPdWRY0nt+Mt/Xn2Wh972jVfwdOby6rNfuD8oXJ5WXDq4fq5QObkD9AS2rlObK5WKLn5o9Af/hr+XT/TS7H2cHi8dKUxvHW75XPXF4tVI7cWR1ulIqw/1RaF36zUqxPlcszxSXp4uV0ulTK8VZqIZ/Ty0V4f9TeIc/1zJfKQVbh4r5ksavqrmS2UrphHs/XTryu3wEkOnKan1lYrTtJMIIWrNCBgfboF7NMuPScmBcetniBEfXGpJBW/wPdt64N7zx0c7FF9ULAV1G0CLrFxw4WIZyZeoXcqi0cX+0MQa+7JJdXEvRRYNFU+kHKbavgmTKXdC0eoNbUct3FY/BZ1FrsK1GGtvCsdLAZ98MUd2P+EgIesVsqRFo96Nze89/rEYgeX7agX3Rgp02wFiGCwmQAEQ+cmEbYDFEOcQUrXsxOhShMtAreOzeBgpBy+MDsl2R/H12YUNHi9DbFM0AHqBibbPpxbUCx0nbpoDZ5JbU6qpx7z4aql9/f/ji85IUrEXIKUMaJd3DU8K82c0R5Gw/Qtzg6EZxkw48eYNb0CCkoK7wLPpOAkZ+EjOaYD9SgMd+SYNP8cD24FrQyXdo+Nm9x++973Tov8++CP9A3UU9oBV0YAVEqebpOZN5dSqCVSxFCSwbWM/czpbyZb3QD9FdLp5RjYRzPJPvvYigoJIMvz+Lvvcvv2jypIH+3WBNEsTWNPPoNFgdBgU8NKMb9vePOesZmWZg+aZRgXNJUdxtORAgwUhivw3VeOio0E6D0wU6HQD0LzSRQl4DzRvXdnAm18HhjWd3373rdHDL6zk2yJQEVjpBa7Q7amA3u+hO9LvBtRY5IhoFe3jvy71nvlMFmx/lQ+StIDTCvcGR0sFzqNI6QTbyhKLFTziNvU41jxsNjR2jVXAXdt760+6XLNSFqLW3Rr6IUEpHvwfA1PEmfw3A6TdyH4PkI7In1PFz2Lv42fCNZ10PIvogamymAkUGMPubes5jcGeLGnT9TFqA1oKhSJ4EbPM25xEfrx982jDmBUIzvPq5mhcSPOjejdoY7ULsAAl63HSpDIfKOok2wxnmaB29CAZHpXTG4BYHgOOYGjDQYLBNVofbf9777B0Y46O79+1+aUA7o0gf9XkMMSilsOi7rYCotPSEXFe3nAYRNeg7z/fbKaZmT7I45fetFSQ/M69w+ihJzG5f4P6p9jT4KOBMoY7NAjVKr0fW3cCLj7CL06ZGOGAXri0vJNdt9vjC48mUYxO/7Oev7F79ywj8ZQfyMrO6LZ8NLABqQWFkf7+UMojhuW8NV4P1HTibkY0AbajOXo806OuHKbf86ZGffUEs7PzpPfxk+OIN/fRi4Ef2ICt8Jejv5xVAOXEi+8ekldY0NSBGWz79ZCMWk4tBgK7qNpU849l79h1NKE+Knr/u8fpKgyhWbye/FxMH7CedLJS0nOh4iUEx+E12OWwSQNv99CYAhP9N4JagQVHBzcV4UZf21QTEu+bhiFhJCsvSC+rdwcc50oMVuCDrObqjj/TpEX/sCVyJI48MPm0jT79eN/Tn75dIgnn7/s7FS0B/9s59bPbcBGLgfp2W8gXuB+q2Hv1IDe3bjkewwofpoES37rrfhk+UT6oGSHQo6ig5fNf9dalphJHjeeyHfCTf5Bi+/xyeyX/5LQnQlEQ8//5guzV4n0PpiD0RvoCo73Uwno6xOXKnGyEe4OEAzthvPRx7+xvoswap7Pib0TpFZslW8NFu5q8X9K5rKzlSM1ryQRs4yi5/baUHlBIXaBLFljr79s6b3+x992B4j+1UCUI5yOGFEDj7SuKGwebgzkHbXYR+3M6xCxP7awFGtYgSR4aYmNAJhB5j0K2sHjSCmC3KEdwNbuFt6Bd4/ukLQxGx3yk0IzySK07rG/Td4LdhA/3ffcV45AaOFdanEGUuNYPKHDELW5klZgxTqRkANdSsGTV1B6yL9LiT3wADRhQWfH4taVY3W19o6AQiIcfy2MNl98IXeizvnwIr8MxJRgLnHGPEZHFKLz2QrMwmU8/LWiqjdKIElkrbuj3wiSrH7+fz14Z3z5ttpjToYiAvjixW9zsa+o+BRvWAdpT7cC2g8eX98GpLoOJie/VDAGjlPeliBGS2LEbZth7tBG7WQHHtqJh3A3LUD3pi4b/G3vq3d/72NBrJ7335j4buUWTCtgxewxLWrMO7g0LGr+Av7OOO/s/pcUZ5+8V6jdVnHE0mYk1GNvNJa6hYheUIRxeOJe6tVQEc4T8Uob9E4ZrqfCECfom+DyPN5yRkKxsjstSXeANGbNVu5Gr02oqlRhTV4TT4DAEJnrMqa5IhdVzUMxKeLFEjXVk5yhZOkt2MxPZPSSwsrPxPCxJGeNADbr3BfQmtBNcchsEtNYXC4pW/j6kTDlceqROGOcKhHUYJPPKI7OkQDV3nv8y0hFW5TOqgcKeDwpcOCkM6Llk2LbdwWUVApuBGQBMcsV04bB1WsswEWcnmjFLMRaGTC0wjK5ZAGtpoKViZCYMSrllLCfUlMKm6e95QFIKLO8RBt8Ue+SbKqRve1CUhhnpMiGqB/HMZmRiFaANZZjS2xYQGNsLFpEob52JyrUa7mFBrY15M7hbbq/+wj72aZYGTJ81TjZN/+O1PhIxOg0bWI9skXIGYEtM19s/DuBfsyGzuJa3fFseB5oDKHCuC3M776pNONxJSuouBJgIJ/Uw3atpeD/rqcszXxqIapHC5AShbzq06J3vYMKh5DfdOwFAY6kbupiuPoWE3a8klt0B7dVsdp7ugPtM9RRkCkiNQ8JK9qJsejIvC5tClzJbMlDHN4jQ1+EEJ1ExXHKs52IoymL66vWzo5OcmmqfXTKWdOzNXzsS482DHLSM1w9SxaPdNb6WHpks/y6q8Mr+cwW9zfilJZosr80tpuXTo9/MYLXp+ZX4xgl9vfqHTXJnHnI3zG/ALV+YPBvBbX5k/0IJfe36u68/PLSwXm6XZejyLuRUb7E8NrWfwtzI/fXz6xEoHMUwdhd+xUuXIUvHwgQPFI2xBXpkvV+G3Vp0vrZSOr0LL0mbmwf9pcnw2Z/3FLI6/XSpuLBbn1mcBQ7hRWg+iFShvt7h8YT3/xIn5Ys2rz+ciR5eOHT1Y2jeutHs9wc6MzBbTJGH+wEhC2AdYQnltEvKg9uJaJ2qixwOWcTgpeAyj/WIovb5yupRsKoN7+PHufPbZ8Ornj19VWbsO6gzhEt8w4DEgcCOqNZY+MoxFQHhKFnza5NRKChsuaIEz9L3vPhP9tovRxjC6aSEO4hr7FXg+agmU/TCIOXOd0zA0LZNu4KVxJmEB/Z6EuZbc2LAYzQ7l3bd2P37T5KtwkQIXlx1LByueTZoZw4oR0iqjaGGiw8oY3h/OhQbtzosXRQ4jBckcjI39AAsoqCh6CVA4TWpDuR07cpCX2thIjT9eRs9xjn18/64GDebnMHhFG8NAsHFPEVAoqiBDtYjseLbxetQW2x7jAR0M9GWQkEuKSTbWf/ikzwiHf7ump50TePVtmUQTvjkZbId1mcR2PeZEDdgyDGUS65zmI+n7GzQuYMAzTGc4UkYkSZyGL739+MqHOxe/H0PG02cx2enLIZJYl4pH5s/g0QjZhEWmEeW3NCOTLL0nTvic+SmsA+CNT9DSyDjAmOc0pq8LbQ1sZvClmJZlVOjG2RpLUV0yKTRMKqVnX9l97WtdliPIKRz1CG4TxnoUubR2EUsMbItUw1ozVo1sjUm06Wg5oMlODa5TFkQdOU4nHpUnMQHIgDc2AdggP3pti35tiXd6ZBLQDRw9bH+8bF2srt7fu/7Bzlfm+5zcJRnhpB7lp0W7xE9M6g5PjdsVnRvTFxP4m72AgPHDtMaeLIswsXny0LOoE4T0HnAlBj7HV3Of9Ch3D3/XLY+C3yE1DlKBC3XYr2bTLhZKP4eS+gY6pBCj3fv8md3t+8Pzd36iZwuTumXf2T6dctfueLe6E3ula5g7Ja9Ow67GAZ5sJ/WOljBoz60gbqItyaTB4qYxBW3BSg4CFaV6GxfwdPaC6NYBebh8UhMVe/f2F8PnPjdatuBrFSwbGcXrchMHKWfS1Wdy2C1TyXVABi49kIEfWXO+G6BMeGo3N/N0LjnYBBEoHflg4NH8LLMXaI5QfPScQyjgASf0oYvMxA53sbEBBB5q11PvaB6+RAtn+BotfCsLeTC8UtFrKehk4egC38rkO5N2abuFpqz8OkZ/poZZwbvnPtPlK0hoGkax2FlTHHa2LJbuCBJ9L4BDV2Pa5bDHXUdGQkQtL6V013j2hSJ6L/Lea2yeCDmWJEtMzdBvU0R9xZtSrC7JEdV2XNf+/A3mWxDvNS+gNHAEUigjKFTojDy42U6jIKyRJczrAnsuWOzTOYxhSAmT6MCSQYioHlxnbDa/U4epgKxl+LhBi/WecJY9SHGo6rTcJc9FOREqoDy0LSM83bq885erI1+4IHQQ2WDK0kSwzTpIOKCywpdoygxevuTB9WYEDBpfmPgYD7Z7XldznCQYRQSDY9LmMDemZCe0KSxPeFiqb4qCaaBpjh23OVDp8OVXdr58e/jeZUfERWBVV8JlxBUj42oDAi/irQGs4i1DVvGWYjLj6gs6fPYfw+NgCNQuhn3TQm7FK07LGhj9LcDoM6EYbq6jXImZtTiYxgu7713PkVwJ6AsIRt6D1CBEnn8DjOf//gt5Mso91snEZJu4ijUjtjP9uIWbcEbj3PzH9IRnpx8jI1w2UWLxhd84r5OPQUQwkhDjrjgYMf4Q6TAabAjxWfhhyDYtAU5xpCz0z18WPxBO6+z1OmzmQQ9npij9LKFPjZsgHQtyjUhQ6AWSOePvlzIUgznkMaC4/tLOq3/NzX/iL9pnR19BrlK4moFqv4PrL9GrmGSNNhqYKl6jKlfF0baMnuXqOxWj5axa1cbRZ8a0GKPBGBXDqC2qqyyL6rAs+gIrCVZir4igbrSABRbJ5x1J3EjheSm44oq/SzmZt2Jl3UpOxjXS7UQ5cnFcgFy0QuPCmLB4NC8kuuLhBAlMZA6RuyqThK1xua+UF6qMPJWTasalqNW8DDMiOK2OSCxGWDFBU0gykGSQcEMixFpObFgjkSEnLBg5gTvXgG9q8D7NGqzSBZpILLqOl1JCjJl5ssOQp9nemmeCE9lf2eWyhr+6HM8yoJJlcJblVCy7MazG8BnLXSrCTIS8u5Td0HQl6ExlF5huM2F1iCoTVOf1GYpWEYqpFKxiaJehWkqylFbwvlbuVomGIRgTnKcxvWgNcwJS0iCQkWbGnKcnNrHO05OrrfP0fvXqPD2x3jpP79dBNkb/537O0/RYdPKkPtU8+Z/7G6OzDb8tCQrpUkyjWd/L2janIdyoLTVlYzLZOPlG7K1pFoVZZC69HjnPphhVWBL98Y0CaidZ32QAzPoUTwkD/3IUY/+0Yrcl1AQNx1nb5lTEGwsyOm2TCp4WYzXwxw1tjtcyxBoMCqCnmiCxZYu4Pmh4db3KJJ9jcMpxBz4VeJw6kE26YunWW41H0pFy2nnfMEPymuIrLnfGVo03AYeM2TIO0PRu7Mswc6+zbadX53Nk7uxk6eyY+cjNhg5Yh+gMiMfgdNl08WcZr+dnV87Arz+7XFoobs7PLp+en11K4ZfNzx6K4ZfMzy724HdqoTNf7AbzswuR35gP4deZnz24Dr+NA1ATtWcPhPNFqJ9rwq/VCRuzHaD+87MzNfjVy6XpE15YKf5nubhQLs7PTh2bnfr1XPF4qRLOFY8kB4obc8Wjp7GmvAa/w/OzpdVSCxrMFatlzGi4Ujy96c+jbfrff3+olMRL5dKpXtRdnS8eWAVMHN0Z7hYwtvPqvN+o1yoLxWNzOQN16fixo/mSqcNrpX9gqiaHWNA7OM0LX7MYTJ4+61Sg2V603qR6ubdR+OHVts3qd//Vve/+qjELFbQVufje3DJwYDQ9PmMozUUIM8BVGCbYIg93QPLw1vk0aJevba+7g1tUot3ukvZtu81ZOFCQctIt7r3whem4ACf5d9liULFX4UuszWWLQiVfB4ORfhmFSL8k2PjobUPhbTntGogosHITVAz55HrKlg8u5axc2hZkCnoeB4WhhdNAhKLU2BR/eJekzfc/QwPCrYtjeDVbXg6tmGtzSMXe7aIUk61FJxoEY1MNIgFRBLOKYDq1Gh/Ai9E3gsp8B10CA5NilAu1LdCXZBRdNrgToiOEYNv58G97X3/+M7GlnFDmH2GriZRo0A2u9wy23QufipSFObo2+cMBkTH0ajY/JkhrVKArsK8NNCVmMLiekndu3yzBlz9//NYdXYJG9yIsRywKXYM2ziuhKjtIjPplcZhFyEhkEUYgBgEFruln5NVs/iXPfE2AyRkJ5spopzoUE1MDIxQ62Z6+/srEQTY4PAmfnWB6qhAP/J9xM3kyFsnfmcOiuTsNIkncyXg0bvb/yFi65AQox9+Dwc3TOqjHb36FZ+AvffK/MK5xpDxAi1OTk7a7wRZuKxxihSgJsrozONCl6rzpIFSvXU+DDTs4XArNwuC+pdc7Fx4O/3RzbM0RmoqDY4LCj7gqDhZddA4SXXSCRRddGnsYJ4GDFNQ6ZJCwLygAMoOWlkbuLaGFZGTBfXnaWXDDSx+NpBcjNCsOjlHF32CacnEo71EUJq0YYlBbjEmLhqcZkhzjuYMFbs8pzq+aRSXkJZAVTHGj3f/T+eHt981LQMOCZqzBkMKD7cRwTIFvOGYOgbXIC3zpO4OXvkcpBn7AvcglcuuKml5IG51Odkt0BkyZ2wQSwicMfLZD2sSWlMudOByu31Tt1ZjWHdjcjW01WUeY6ADQrjn40sxj/zCsAmxrDpZ2K5jjeJetwggO/CY+ectgUJ0Zl1rBFwtRGCW8y96P4HOkU8mhnyW8waNmpDiKwia/Es8PKzoa3AxnOxLgGF79XO1IrC526DRAEvBGfXaKvdO82FQBnqoBDgJBxAeXFfLgXsdCNouVHP49MuoFzI07uu8c+MtyhrnHVjBpAp8ab5bBPfWB3PJO0USRUvz+28ML7MTvgYYQIyUUXzq4DWvAo8i4wjdaxVDToH3UQgQOUmOAu29LvjYQtUHywd2nuoQsRX8/n6Jgb+nmPOjtFKqV8qICD8YZPo3+XKdzG/ODe22zLa/7EDsXvkV/ANmKMOg8tZy72MR27mDzuZmDSwznLird3GRMYjzH6Ao9d1x87w4qjf2slxsTvOrGiKvBdscM5fGbN804BLoOwwLXMRjgvu53CWjjPAGQpecIWLvN0Z4LmuXUrw9uBj0hqA2Ez+UcCTgNal6bRlDwpIJICAmREotAuRGS8e7g03VmREDD9x6+KxmrmAWMU9gxLmGxzikqIyE7aJRRMB5rIJaU0bEXq+sqfH74sUnm4zZtT3G7rtvOx6RAmAQ7k00NxhNwdAm0zlx4+Oje53kjsediGLMSexau2SoRXmdsxND3/WzErAsZJcioP7kS1XiMtmO1kYOqhRw0+sdBVTtmcwqHUTVced9VLxydomTF+mlXmjeCvCNXTzvy9LQjRE+r7Fx1JGYjLTuishFiy0ZAtlJrOSevGknVFbXKI3Jd1UhXFDAx5qMXImGVHXnRyIr/ErQxKc2V0BzxzMpNFZXJrJw0n5OQjGxkBSP7PVVcacjKKGVHOjGSidjUJRK2CA8onHBqx3y5FRpy4oIRFVROsAx7WYQCy6Yr4wKAy/vFo5u5Fdls5QZ544zDFA1DtNyQmSA5FvMfeDmWJTE3srzhoGUKlvEcURZwNE/5DdE3NHlZiPGykmDp5JRQXCa2+72eMfK2midshqQpPTMUhl2ZDU2Zc+iJoSUT/JexqXhmZVFcGnNfHq+33ssT6qzz8sRK9V0er7SuyxN7xMbi3+/nuYxE9ORJeOjkSXrKO/n7nzAWR2gJPIOBrMlASVEYqIgdXiMvqKk5Fb12G1ImYSUw3x6ZG70a33I55ocjc2XQozt2sj2T1SOJCRFhxj8s4Joe3gR+y7njUMpkdcUMeIwEY8pyCVdi4r7U7buWUTxmvGub/sk91wRZ6lbALZ2n2vIklZ8f+uJTHGQtEzscfZlTCSytAS3IT5ruJWh0nQJCG2O23JOhG4NZBA01i+NUcoCNsRk3s6vTaSbQmSFnfpzZsCM3I9Wh8WhM/3P9ky79LLNvy697qyvLS/A7hNdyvwi/BfnN429l+WAbfkHE9QeiFv2di1q+t7I8ewL+1leWZ2pQNg3/js4UpyvlqZWDNpI11FTwt1z+9/ni6nL5j/PF6lp1dRl+K9A2Lp9aXCh3Dy10wkOL5Y31pYVipRy0K+XGoWIT6huVcm2mfGLtcHH21HLx4FLx4ELxV9P5WBblw2urv68Wf7VQbMznaiYYc9HhZ5Ny0ttzPx08b0LGL5GX0KeihzlwjbjUD09HYSLSUjb4khSv7AzKAh36D/cXv7r1+OzFnfPvwz+RCmI+hO/RXmCS0qGbhI952EpJRAJso9eL2iYxNB9nMqj4UBPjELXuIzobrZrqmSAeU1MxF1zP0VP9OjXKaam0RQm6ZFBTBfXRg293rj2v2ul/gXxUj0HiMwgH24WQCf1/FfCYUtBsegVFj5w05COB9knTD6wEOaxCUR3/i7vT8DewEfYqeULiOuLgE9wsbBRs/3AKPn9leOMd7qCwdJAeWhgytAH6AgaZPMLb/HUM8NHFRPIYMxMIKpVr60RTFoKA04o9TFaIuYuO63zAlG84+QoB4e61S06+Qgso6pDYllC4NUBJob2iDnXAP+RgSP777NspnVf1agWDBMd0+SOGz54KANnHLNfIbJsRifeD65wKEKoG25jyOkYnNZTxQYAvUPKJscegsk9MF27xdCrXwwMY0SP2Occ9pYW/mZpAv9CNiya5VR7k0lgPlsbQLo2gYx/6y72CIqJjlucYjY2uEHUoA/m0eH/yrdXJ3HtTTQdtu91slQ0hlIWN7GmkVr529tHDZ3Yu//lfw9FdsrkzDQ7OnMkY5Agxrm5MGjX4WKICSnYoPFlNFjtuQfoX+VH1AkqzCar0ZiDJokAj5WRywQ/vkrPhh2gO3H3w9ggOUOpqSy4W3CDgIgeNKbOoTFoqg0n88AmR8SH36Cxy7PfO+COfFPpP+X0M6Ue7IO5nFYUY+vJ6DSfNflnoQFXox6nzbYl5gaRz+3Xtbj/c++x15+vyTSemBTNFmkHkFHwu9GqD7Sx2saxpBGQHBUc/ZugyOib+eM6gnkyPUP8kAZUkEq1CGAAeQ5y29N9PIm7A1D9Ss57hAcgAXnrF4QF4lNiiiwlDPZ8hVlBwblhFQNTfwcLkn8HzkgifHFyvRxjSNE/5SCAgB9HRlwREq4beeuYVYTAeag4v2yGAX6LCgmcNnXe099VHO5fed99RdiqSZF3wahjpRX45gGVwvZKDPy1kz4BmusdQzXg+3gwjYs75EXXjDJStmJnbyJB8ecQdE7TH5iMjGnyapfkBPT571k1BS5CmdET9aLPLTDQEHLDcNiUyBoNfdQaEkM14AKjGr8AIko1CR32V0nrWIF9ul25jzIqM2hmCnYLETzl087R6G6jQj38yuQh3Xnhr5+KrNiK7YmOhJmBUxJQHZ/N4oorEKCU0kk1XwUsUAAIuxgAnshAei7Hn9WMbUmgzSLpEM8x5fQpFy/F6v/raHNMfA6Zh0uORGOkWoomTzm69Jgg7grUB45HD2hjsbRI7MCKA6Sw34e72PEStQVgocZg9WD+8ffXR9w9tYAF6ThRSHn83oD1SrVLfPIQqtAGd3wUs0ren7zFQgmjkPNrfQUYZ+x0694LJu+rOXonU4ZEartJdE7QQutslQCvqGt1Zt0yu3h++/pxumVicsss2jtbZkBvHq08pXt2Xy6OWTUfGrBty6xHaUgfbqW4CduEdt7yOixADIgYpW10l1mgkG82KiYIy8zY67/w9/9Lw/pt5LOx+p/DJAqOQxW+PwCZBm90FERqZIgY32ScNAN7+Zu/h25MNlInRBkiSLxkhvmKl92pOPTBKgXpcWjl6Wdapys4SltWKy8tGXG9g2NO8pG6EdGFr7ToaFMiyrHK4isCHSOz1U1EJ/LDVIirjSqD7ip//rNDnyHuThL1lEZhTvTEy2LIjgC27op2R6qw8tCpi0KrKPqtG4FnNizpGzJkgXewrVrBMkRcnXFnCH+HqtNsRtNhOnGZRYaNOBr08E3c4uFcXBuowT2LQGhXZ4Z05xulyTZzSzDAujGTqMfHDjHzINjk5veFthnm5nGucbQm0jr/q8I4py5ymHI5kmJGSePZwZjEmljMITM2nhTUwV7AEtmxoK8ez0DIlqQ4xdSjpCJ2qTKBrlXFyVlFC5nyyOTpmaJiSlgVDVRaVpKwJNakqIWHyMcGftQ4Pli2uUV/WsWrrxzpeZX1YJ9Wp/+pYnfVdndQZNkX+x35+q/hIjYIoEAc5+R/7GyLpgD6QtFPisij3Ehh3K/JqbJmjS7Z+kQ9jwtc+H/hPfInWexoBUdyBBt2Q3ayW9dWWCZcGFQbpPm18RukOS097jUBMdWl2WlxM6RvhzIAbNkItl3IaOa8BteiGqXn6xGfVb3poP9ySztItuYOfQdunRznT/ZBvEX3fLaY7ygzQjyi0cWpcTVMu05ugH4g3qx9KgVRhPNxAogq3tYAi+bo+s+3RN6BzbiZc51fnUWdQ5syZJp0QO34zYB2hGZPtv9Nd07ufZZfstJvHqqsry6srSwn80sPzxZnp9akiWgvh36L8Fja53bz8DuJvs0NlBzY77WOrK3O/msEIDLP4W12ZObEyE88Xj6+uTNdWpuHKg1ZNqJtaXakg8MrqSvnIGvxXXSklK/Bk6cAqZr7LXOfQ0RgKpe7MYnFxAa7Djd+sFA8cwHC+y9Nw3+ovFo298qlyqVGHkcQ4Evw7A3/9leLRX68Un1opHv5DtfgUAKny38pKtFL0VoqbBybG520EncF9STnHZ2SXOPZOB+g5FiY9TLdChiZMvjK43y6YpiFH5MGmoFpg/FEPlc42ew7SkZbrxO1O2R2rew93vruN0bZ004p7YCKYCTibKYZQShoPqhNB20GgMbwIthG1twLdUg4HH9OFLQoDT7aAAELNhHm6dfnxuzYPPaxYeqBF8zOtkFqiamn1rG7S5UCi9cCAfHT3RT0owmGeYrbUEHMV00ESUdgp3jlL9PnHV6/+god9Pa9EaVkk9RCA2H3wqvjVZJQkGl+pJPMLJD8h1WAsKz6Tu+Vj1WD7CHncOE+hWwxaZmTf36lC+XqjLkrLD6+e5vcuTkp3tzGIv9iAcwCBpJVHO4DH6sqjmNeddlx0mnjpD5/goVrGRwGb/8TY3BM+MfuCBJLmI9GzPmRhIlt9mCXdqOKc+4nZ88RWpIkHgnTUzA0UxMJagbNF80Bf+PDx+88aVyzqZtQoaDfYkXQ7Rd8S2wkqhaYBOoE1CqYHyy5W/ryOujhzHxYhdj6s/2fvenBP5l+mYHj/r/ACJr5rSTSee9XimrZvOy5yndQUIXunMTrZAO9yxrw48EFAJdt54PUG24VGjMeNsoiCw3nQDDfna35A+TJgcvubnDd5cI88EDGvDEJ/9/vhjY/2vhbXLvjGa7Q1UPBIYj2T+Z0sRu8uCvlFALl6cAvr+16j0G+1JEc52vYEPMVc3mboEkazRSfIQrStrstLamQRuV3FQSSBafFEGTbRMH5BV06A+0ZwRB3MJL7k97H72teP3/x4eOFzfSUW26q4koSgkWlOJoOHKjG9b9gsKK4FG/vLQccRwBiPnHccfL0ZUcokOW0dk/k6NRFe2PUpQdcmbDa4xXpfo5uhZxS/jGCwHZKNikZDfhP0Ur4F5QCGM7z8qX7im6L6MBZiHAh4zcA0ifcYohBGgmRoPbm0KaWnm6yRt6wFmxhtnCISk7tb8kQqDqav4gE5tieR8/IHfxpeuG08l/8V4EzSBb70m6DrsU5YkYEnttoAbrxNhslVQPXYOaOL2TDxPUYtBf3Du6BJkpWb4vHR3H4M3Gb48BPTb4RhuB/BN8zPrQK4hMJ22gDXuf5Y+Rioj2i0lk4H0WaGkQBMt6E2DLXfXUy1NtrvH1/rj3b7Zr7bjMFMNyHQfsNEIwKn54TE9lzBa8dvasd9DBEUNeA7z+zIg6z9RAPdhjOvQEEpoW5MbrKP+IU+h7QGpSAt9OEbx8A9jLs7uN/nTUpx8OXg5Y/u4yYlEIxHD15Qyw/BYyrEAfTh1sdAjEyKTAuHECGqiqFEBhfTIsaRg64DdAb1RGVkNLSXkR+D9ryvRg6kdG99tfPWZ3pUtVnwZRYps1wQQQknbQA85D88uAVFfbcRZgrCeMtmFHjYJrTzRNLbc98yLh0G0HzkCKanFAMVM2PpWvB8dF42A+l2syQ/Dk5XaQey87YZCLk9IydAIzkJJkBbULkjlPIuON9a2UEGb6RRkC16ei2E1N2jdzBL5FHC68oTOW6u4oSXF2OMPOGKMFZEd9i3ChFGhCEZIi/C8BB5TZuIkoRAxqKQ3ZG44gmMQ2WTifFlUQt4R+X/OSP5z4nUP5cT+I2s/0sFfSOQ/0JpnAXxEXlmLS/KrOWEmLWc/LLmiMRGGs7Jp8s5qZQEwnqQJoM73cgVA2cc8c8Iff9avxxp6n9DlDJiFIN1JQ8ScWhEfW/VEWgW8sKMEWF+Ebd3WL3L58VZEYiNXGHwX77qi/9ijt06vJZ53qFJjPCQYYFVl68ajurypcpkjrRgeNGqw+IMc3NI8yFDlA8ZcnxICXHF5SOGeZixb3XJjT6NceOToyTSZ4LLC8qWchTcEO88QeX8eUrrpg1xqwoNrebJp6GchpysGaq1qHRkzZCQoy5JMtRogiUUb4xSNGoHHam0VtDRCmsDHa9RC+hIjbV/jneBrZ+/28/6iQUnTwqtPPm7/W2fPkWAzdpbmI6qxnY1OZFtw6FuYCYyPg0uVxiglNT+wO95jYCsjnxsnK4w6VXAjn2Yswuaal4yvGgBqZHD5V2vzcfVU5N1jK5o2HjyHB0wA8rIRX8psxr7+7KrYRfjstLxdvwbtLckcRgeJecEXiZzF18Gak6k9GhBn30TUUryOqZTWRemAboSeKe5T3CBvc54Crw+IEHLZEcslJ3Ik8xnvWCLnsE/2FlJpOa3A1B++Ug+/FUPSM4BFmx12UcT/5KDZChdxGRzwVbGQWwzjDuQUXhnMjlvZU2yWOIfdbqUwenbsi/GvAI71XZieSDOZMm0mBmwY5VbHYt2nLpI/fk51tLDa9VV7/jRFfi3hNeTflC3sE/5gX3KZwju0ZVphr8yhX+P4O8w/tbwVwW8pbw9NK2UilOVcgl/UBwuFmebpeLpteLM4eLBuXJpfg4qWvW54n/MHyydWSvOHS4u7Bcx9udcV8orf5hoI/WSEHMBoMTbpozTSCXr5hhioxAGT6ZPgmz6BLspSnuKYdX3MNlttkIOii09+BpYz0Rf4opi7CPclI5+OEcxat47u/fBedyVfkkioYRAWfgsdYROjIW6x2GntBjpDfzKbCSpFczpCT2j9tL5vae3hy+/JCYATEBxp0CuLoOvBx95HDSGjtR2s5ArQE7Q89tNCitQSDxb5nc8ENMTtNWFGvU/26B0vLQVTALK9ecev35196ocSwl6UdDBtAq9AvfgVZwCKO13GCNhX+AYOE5bQE8pBghXq4Bw+ouSQJNxFSQ2Dx+fIpR7Hz2391D2RlOMSk8j4ARM3aAmRi0M/IRJdnxqQpJzy8/oBFzq1WLdjcd4gdBHzfDaK2DC9YDtEvDeEOn5SzuXbw3v/vXx+7LV1/BZRSDIJGhiim1KBa64nDaCC2XqDY6MY8HjER+MpPsJh2tHFLsP7j66+56bCWLwUdfnEEQxuWzhKRuS1HFrqpnBkjSh3JuUcd0N6I6yf0H0j0/WNcETKAGogHz7/fDdr/RgZsc/41GeJtDJMJYMmwahGK4p+7ngv0javRTjEKkXZYPdj/1OW05oKEpcPHdieySJEO8+uLL7/QtWe4T1H/stPyW/TV4em7RmWJXMqBrEC6yH2aUk90na9WaNaolGVj8ZAYIRlyhEPimb5NSMwcBaXiGtc7sI05eDqCbHv9p6mG5wLbWZkD678vitL4cfvmkyIXFqu4bpZYznuzFJvHYp9rO6rH7pAWFpiWSxwCJ/avJc0bY1Idh957bNasFJrOuFGCaJRHevl0VswzMpruuIFV0UBx9vPplkHOOJUl7nnqPHYhBRSJwujKTC/pQzMyYUCwy+hS75ITy9d+HK3vUPhs+dVzG9EbVCjxwHRnsE7CfSORjpDbz/Sc+N9AgApBEHjOAu0H4+uk3yIS/uyM4HF3fvi9mhTfncgXjHmLGDZNRGxqHzMnaWCULM22Sr4QrwJYVOTKehoowdKLs0bFAm6WDjlZd23nkDw6B99q7JewWKW5w6gHApUpGiSrsZhZzu4xo86KBqAP0LuvMyLsSBeb63TIYeRrT74PnHVy7ICaeA4iWiCkZ6NzlZ4KjYBoDhgLFBBJSATseh7oY59uKgXdUjUJyg/hxn3mpLUD+gMHvXP9m7/ql7qpnQVTjPEB1lZnQVe7bZtEAMiTnd7IDXI84M3ZxyhkWIw4jqekiLCig6HVAo+DAWZakSDW9pwE6P0kbWMLYc0JIZsU5rOjiyQrG5/fN3MPUTLAuNrfkB8TiLDz514tgOti5HzMtjC/mQuYDml6T0iuHjK1J6ZZadQcSrzmLRhZfHIouOF1yEZ/eIBABHQLIMa+7Rw/eABgxvvCH8DXB4kockAj2QLPleJws5tjlVs+bpg5AALPM0u5IrUCG8oHYycQHARHa/M7auiMlkhkHiCBLrfxyBBSgsjEgrOA4pNYcViKEZKSU9iEKsHHKEFFzTBbLLsKvzW3cen7sNK294V5ZEO+TI7BYlpZfhMoPNW+eSEUynQYCrquHnWgfnUFY2wN+7dNGcs20laPz1An9RspjBwqU8siSMJEkmgRuBZGFAfAymVQ/pTSYbdWTnsXEo/bKH4+FX9Oj+c7vXvgJ0e+9fHSOIis7SwRwulwZOwqjEj5Ex6eOxATIgeuopjnwXlh6mN+2RtIhJiZJs3XsiKQRYAQIeIa3L3g8Is/gA7tGY506Q/2+zAJOK7I8dnDhn32C7TQPeJq1j79l3hpcvIOn48yjnMx0wvE8xV3IM0CBEPInD/wSLMj/CoczPI+nHCwiB38vWHbkn9JqO1AM0aSMv9eQyYQES4B+nbDIsmM8P3lYnhTThbbkasSJbgFmTpriL+DTRHIocKm/kg7eBKuw9/LMuuIDPaaG/A2bGG3zErxbztKL3MgbqxUy35LiWRC0g2MaRmVaDraVHIhRKTAGmCyCfZnov92hv5PWHwxsfU09uSNI7jzMV8R9M4AXEgQ8dcRE/i4f34eI+p86j5x89eG334rsyknU0ljsyBihEhp3TTnJQx2QYPalvp7hL0Id3MGUdFRB+UxIqoA/2sy/vXL0E88UvFmBTTtVYXRutuEDF5NBINKDHDTHuLro8VhyMppFgMm6PjIk8HydZpFGLK5OiR0KS3LWMgsUqlaNMvWrVpwVRmazOMptTVoyK4ignnKra6AWOPrCWUwWMAqCn9nJC/0Uj7qugXXXlayNTyztkiVQl0REBdDYneBqhU2J/Al8b3LIy5pggt5/wdtiR2oykJvuCKjGJoDQqi1UdwchIQ1YOqhj5h2bQlUSqeRnEiB88h8qaHabsMOOK5faGxY8yXaEFo3z2oMtiDWOlhy1Ts6wsx8LmLPMyfEvemvKqHH8a5RNVwyAMa5DFqsQ4R4TztLdqaa6ht6LBK5k9KAR2Rghr1dJAQ/mkv0rjXMrmEjKlX4ZmudRqbIUd4Q/eUhXn4zaf9QR7MTx8gIIZ0yOjBuPRWmsxHquxJuMJVWozHq2yRuMJ/WCr8W/3sxrDEwG5zBJFO/nbn8o61kAf0XUxJeotMSP4ZL06nSbv01ECvtMArHXMENZFW6t6uK5Ttqu6ZA7rooAfNKLTGEHV3qOJlZOxBRhkAL8sD/9GXltzZ/lo/MVF6NEt13TJJ5ZNn+iV2uBj9NlGhEbsOl168HoklGqDPFf5fDue+A/kUD7Gi41aGBiaTxaEDAaoWGIbUXoyzCmWCLIg5WY+u81KQFS/7TcC1Gs4AxteSLMQ50KGxBddPaW/EfTJq55t6ubwPFudAy9r++LEu5FFG4qFzcE+WvYDbZpQ4IdgS9xeGxIolt6RfUF24gk7PdwyM8MxZGWSyDgocyH+s2ZcZhx64B9xbxhDtf+zrMXZeqOmv8Nr1RX3fhPLqssHi2tQcwrtu/Avwb8rB4t/nCkGTbzWH/xrb2aNGtdFTbjfsG2jAK83s3XEMgN/G/B32n0ef0fxdwRgIdb08NpKqdg9iN6x6zPFP04X/zBd9KrF2YViWCnOlotzS8XZpeJ/zBeXDizJzbJrff7fuF6qpweK08tL3swvfXJi3IEwC31U7P1eIYbvg5MrBzXUmoNNShLiddhgEwabgzudAgbAMi27UbunDWPZ9WuwUw3KCobjX3r90d0Xd67eN3w/jlqeAQPfDu0Se50cQmjUto1OYwKLMSyYKXjwaWhwDC/d2f1EIgRIQCg0JsjJpf9KRJPtBlFCkvt/IcOCsoRSIqXw/dT9QxwGAH3WAgzJAHPR8GlvFuABC67z8SzKePX3T4izXX5z7+Wrwxeu7f313OOrZw2DRLdQGpUErS/xKa2QziOjaSeL1kvCNbUTMF5v8EVJnOZMB+hZi1wcxBjr8LlLcoQowIwG4mUBNyAc9DBnhGYK3qTz4+xpEXp+B1XufqEfrVOyCc+ngEEwuXVO3sRniFFcJC/GG5d3X7u5c/79vc++tad8Ah/z+qDlKCaHJGC0cJ9htzOfD/p3WH2TBn4H3Uk8Vlz5nNstyp+sWCX4zpvfMEKW6WARUJC3BqidnPpaVwqGGS4EUedJILsUFkubdrzG4H6f8wMAL4SCQi+kLhEuPg/545XTpEHUZIBP39u58Mrw7m0XKxogQOzsik+HRUwGC3QeYPF43+aAPKLz5tUR5H8ig0JicO9eO7dz8RN7HCz0N4M4xohoGPuKBFOMNTd4nt5fClopnuvgKAw1aOmDEgdKa0fSaP94OcFQHZwE9v5zO7ce7D1/S84o4YG/D1ILGNbpZobrO8Fc2olB0in0KbAho2ngedbEIvEYvibVHr7+AmDQpNp0yFzh46lXBzBKyC3c91HIKTrI00aQwpZ0C7iz1WWd4/Ff39597+zjNx/YdNi5MSCOfP/pKHtuAFHUGhmB4LFDADQmL3iSRAm6r6QJ20UbMOfp4AE7J2E+4VtYHUc1lmfTxMOISl4oeyHicypRx3a+vf743KvDVzg6GlIGCkyJKA4ocD15bGC7x48bZBw1R4+7DFuPHgN4c/QYFP4Onm8tREFjsN2BT5IdY6EQnQdxcXl1qmLfQo8foMROSKkwfwunq0tTmMKER+Zz3SJ5lmwwBfyBU8nvvfjXvUufDS8/M4qfr+BFwYTzoZB4cFO6IZd+i0w8nMHYdESuMHQqPBlOO70J0LqB5Avvy9IbcpyFC+7M7qtX4f/cRDe8FgdSG2yjlYGsJBkGOzws/i8YobUeSUE/pXv4cBFlyZygpnm/zqc3n74H0z68cldt9i0GgWSBskUyon+Ew8BHsEIa9CTJlbtIkuQkCSUorwfNDM2o+AXxUc7Bdj1AjyqMFVGSbwtKCr6GkaBncODtVhbhbjLU8sbgzdMcywcNlYNrxEZfuTO88Zfh92/uff+BO3vj6GSlKjZ3nSKCxDkify10T8h//4FZpg1/y3MnDGh43XMnLKgPrjsTBuvEmS9440l+vh6fd+cLzeaAofQzAAOnjdng4HNqtYT/x7f8zrMAFv7lpqMe8WHTGK1TOhX1MGvkJiL1cT/G+WAxLY2dit3XrpqpaGPAQQem7WsaANwp7iQC1F4SMPqfewnQ4J+EnsxicxZKSTsdMPZi8lbrBMngVuiZDEqwMHsY6oF9QfEgFK0J/LgRBdnuvr8AywK+8MfvfL8/EnPiilnHKAKeCgNW54KhmrlIUFoKedUBoQLylZ4RH2KswJ7R2u4MPpYaHpA8R7sWmcLoA6VQALgYb63zsITgI+H88znogKX5+qSObQStzqFpx8N0MYJ8s6rjlN1w3npjPLtX/yImI1r5WQElM/y26KXDrWExtECzglfz+QQ402EM0UOWHVj2G2SNxL0Q3nN7+YNHd88OP39vwqFyC9Y5U27i1NDWPcOx4HDn/vP3DDh0M/BMPItmMyCfBxvNAmgNNuEJ6adJHGBGZDkuREQga2vwKqCc7728c/crCxllqiySdEXo4xB4TxykqCDwDbW65PCnQDtPmAMCG/j1C0iABzMgm/y4g2mjb8BHmdAmjfaWcgT2JVRl1hxb/LhfZtb94w+/cKBqLx2oAcYDOmjhSguCbDpLW3DCMfFQwIdfKMcEKblJ+0+YdzeOuMsdr9ksmciVEuDUzyS292bMsVtF0hvcNGLe4w8fWqDurHbQa11mVYCaiY1bXT6Aiem6+Az54CZvAJD364cP0Z729Dv7el6j9BsDQZ8RmwjLyGi3lp1xblCX+F8kk9c91Tka5qgjKXKuDvUz1acxzWlEaTL60qj2op1m3QW/P5P9GLWXimpL5rPLKytWTfEaAY1ZVNacMpuvAjm06aqzohIYTcB42sbAI2dYPs6YAMA3FkZMuvsqxaqUr/I98KBO1ox95td46S1bqXvGytszRtBm+dqRekUknXGk0QMig6p0yzKtlfhY2aI/zr2V0Vg0c6QllcaqKh1VRSqqqjzEQpDJdOaKIBeN9LEsMgcH+UAxRqWXyOH/JWX851iSqKoMwYID43B4cFVYujJy7ROxW8toKb4HENZWgXngIhNY+UhZI6DtnhwztWw0criW4TRTDoNx2dmUy1UMP9EzXFGs+x1M5+nYpbKNNdkyZzbhUnRxyBF6XrKUvGoILnHtd/kI7leGEFYcErgqpG+Bid4Mb++SXi2kU6hRJUfaCBNSojmlQeT0f5Mpzrj9HaZ0oxvEU4V/Q+N36k2PmuAnNTBW+ImVxhC/T63Y4ifVGnP8Pt1ii/xv9rHIy0MNMsqnnn/yN/ub5DHEw5lALMTQGG/F37dni+mWXXbXtTRL8E48lcnK67aXIvJMamE4DaeSCwSIJPHCSz+Q5GomtRdda3FUN6VR3ZdwDsG6F0rQB7zAW3E1PhVJQIctuiPTf4sc1APOC5fVtYBC6kRZ2DVRHeiWLdwB+nSz77jX5nv2MsegwLRhUJcIwaaMrN+NLNVoFAndka8zXMlM+F26437ZSZdZdufVTqI1mNPMyFyYidCRO2PVoZmxuH3XfmrPfpZhfXWlsiy/Jfkdkt8i/lYqC1G5CP93y8WtA8WN9fZ8GLTgKgzaBzfW6Wq9dWAjaEPrOfnNym9GftPym+Lf4crqyhH4Vcr4q65UStXVSmkz+9VacaZcShPXUbr0BwxV0Zkr/yzjdel3Td99uuaV14rL5dKJ48GUpG+bLRcB++Gp0loV0P97eaITdoAOZmQ6EMddTJoJ1JFTOIg3gKSuBlaXmIZkccAN5NMF/Lwxm2XWAlnujMpzaHEAGUnluTr6V28XBOEin+wjzY4sHxbtgtEc0foiWKmUtUe1diDuo8qCCoqdeRHjNrvxptMJxrNH6dQdWb6F30OPZh5ShIH8B/d7xqhz+dm9V67rkBIaEzx9mDgVXhN43kLlEXClAnWZZkGBc48ZtMQywiwDodMl6CgIh7lOc6OufW/chvuNQur9de01RmHffkt77ZGNAd8EQVgwxgB6DQTliQUW0NAkgO9AULEBDC0OCUeMVGEN3iFjZMGB8cnZfg9TS9mR8H1uJFHXSwfXUV6VVvKQvALjbx+YlbX3+kW0Sbori54pO4vKNwVshGAkyw74/Mtw0MgLIST8osm3veMMA4TY3ugi6npb3VyjEDcbeBQ/XoHVice2zFLa+fPVvRfv5b8OxOJ+GIhm2QyBEbABgSDnBmAxcPcZvphS0OfNqgxhQBnbjboQrWPanpYft/AOpCrKbdhgE9y1zKae37tyVfPOE8zYk+zOCrHHh98YoNQJvFRyPyO8wU0i9QBueIFj44HuFYBU0XK7ifoYzG7Q4jh52ltpuu50OeZm3OWWyVtAfR5+ZPpskJi+jaCQ7jsYpJ0g4DEIAhkEwNdB4MmvMKphcEg7CjwSCPSq2wqi3KSDzBNyYzsOeCrETCRmJH+/VLeT/8oXOhCLKBZhfxRLm5VKF4mEuVMUPT4xyTj0hbzyhRlLikcCOMwwW0XwNLneRXTrA2Mkf0k8LFNogNg6Yz5YNHGiSE5L/cYVUD92n77iaC09B7YaUE2BMdgKAngzPVCVHY2mYLCwbsMo9PRxO/Qx1U3or4M0SduaCZ8ih1KUQVuxX8s4oqWHORbhXYM8TA0Bc9hrtXwYDrafNQ47pxAlb96C1v/Ss7vPiLfSmSjOoaLkeRFGncgjwl3LiZjga44zTm6+JX6f+DJ2v/qEMRn10OvgLgBIU6LGJl5Mx1HQuakup9MbXt2j9OKmHXShk9UzfEHthFMWEa/kZNKYianHzPrxg2d3Xrxk31EU1y0UVLdPYYmLjXTv9cxtZ7D1e0kQ87mGrF5wMJJL63OMT51AMRcg5tX2asQ8YWgB+sWDkMJqFLymAAAAEa8Nrq+y5RdmFIZ02ifDTFQrDO5kaFAm28zwEvDT93affsMSVwc8s2qBbdhDHvIId2DwTFkZuL4Vn7dF2mHU44CN22mGexwSH9o0CLWB3/Jq6EKM30vzyThIq2qTQQ9+89HsvXx19+3v9KPpYA+2HTS0fQjLAZ1VJBpG189qtE9EqGKJIhaRHl5grCZktcEn+QoImZqYAjp+lkq2VLgaKRhvEeFlakgAHWVBz/c2yYOGDvzl4e7990Eu01ElMB6U4zZzwFoZeYRbdOv5e4uND7cjmjxGfE/33zfoRAzkXnupx2mQkCTQq/Jpn5i8gIXf5touK8406pkRZoMvG4UfX0vt6/riueHVv5iBoaNRMyGXdBdfb/B+PBFfwwOqHE/G2Gj4cZt9NGn7mhBT0PT3GCs7PjZhSjwWPeg6c4QTKlDBhG5ELHmtyRBVsDp/GUHqpmXcxbAUTd6toehCehd1YzxQJ3cCvsGG0y6eG1LIuL4+2Wa4+zgEOwqBKAHLRt2ouorGUUfJMPqFBAU/zME/WfjmW5S5Zx0h3sjvjpC9oJLzkhGpD7lFRqwdlWmJ0uvFqHBZHpFbjcgqR2RUzJPXnxfsSjlx0UiKKnWxAMdimxHXZlW0YqnKlXZmHTFn1go3B1WqmTUSDQszOQGDD4dkUS2oONJExcoRVRUhWHoQ0cEIDYahO5JCxZURjHSgibAsG3W55zjbnLaM2bBkSeonnCjHFkfYUyXPBA3/E+ZnOIVhQHn2sGo5jmE2+n6EPiv9HyH7FZfWGyov2qRDcSdcRXo5RuvGCJ1QnImELU9flh1aZqiY0hP5tMf/OB/32JdtwkhE0QxIpGTtH4sikatzgkjky50YEqMVJoRErsKJIDGKnQ2Pv943gEQUNU+epAfqJ3/9E7FzM3TezU5RmAi/LbY1t1BNXCBj+MZXV0vY4BUCPM1olco9Ti5azaK2QpVbrgi8GqfGCkK+k+KewUHlbB6E+Tlly/levGUNWrwhi9pWlLW89pYU8z3H7Am8rvaF78gU180CU8x35C/c9DbscOmWgeAQIk/jP5yREq7LwnwNfU0eOtD2+IIjEmP/Ka6GmA9TKZG6SNJtoW3QD+Vy0uuwk28n28yuzqeZQJkwM0dmTsws6LjtQHVY/Nf2Xa5+ZrCIMyuH1/rwW1mW3xL+Vg6diuDvoZXFBP8uriwkp+DvAvzm5XdQfgfwt7ZyZA7+4m8W/q2Xi3A1g7+Vo9PH11amj60cnfLWVqZOHJmbnoJ/p8rFY2sr5WOHV8ql1flyqTpfhn6cKZ/e3JoqZ2lptbi4MP2bQwsL5WLUPbRYqq6W13+3VDy0VPz9XHGqHLSPHpmeOr5a9BszZbiv144cmps6CsBdq+Wp2WJ1df4fOOGCJATfK2hLWWtwHbf6y+yFHg+2sTjzMLUNJQcLIvbcNO0xWQG3Z8ukVtFeBKlYGR1WuZ6dIsU6ozylFA7nq507F3f/8nD4BpNyjyVuty/niC2p5J3v0AKzKZbAcx3KieFurxZVGB/vlAb2kj5phHMKaQDiuB/qrGhhiqdsMzslpjF8RKGZk40QOtWHGp0OMWWwCMjz8PVzyATeeC+3bQrauoN9wW6i2growYLrx+j2YMH1Z5ROOB6NTi9405U7oTvINXSbpJxKPIpulCQBvASfNqZlvNKsa5thMlp/EwvNcCMOsEnZZXi0b7z9+MPbOlo2JCIk15DI6Kwl0TSgraoxm65iECscIdDNa2wAktWmWdOk6mCB8+qkXZecyGsqC53G9NZ2Gb/GFi4UAWggj89fARFAB6LaosF4xNEYLdIRtdHizWuOjHzVrFaDW5IdEWrjXdOIc58hxjfAs9310Mt/tGQ7GGkcR9kpmL7cKEkptoN8+zvztgi0QVnKIZPc1H7GLQLTRFBgdCPx6AjCgkGEL+2ZC4xHPjp/M0bzmb6JGB6oydaIWXxb+UaxD6suNwiy++oYhq/fMEQG9D6/VWAsEgBgcJvcgBFRmfUg/Jq2tAUBhzFWNJOsdF+O8D5/kTEYMw5GL43JJV0oRgO+S3e51RM/ZqcPp0GeXmLcMEsmv/hupPsY43ZwvUWONYZO6kBoySWZv+W1LKGkMXHYzgTKu/yg0Ep8gZZWQneqzlC1PzxW7o7oDlHlSa8eVexA8MaliWMt/A240aEObrLvFA/00b3Lw5c/y1EG3DIxIErWMZFCvGOZn9+5Mm3ze1eI1NALQcrEgnGqIxyFBuj4cY8TU9P5a/IekmjXLSiJg04Qiy9bPcAmWz4o0WwswMhHqEcOrpF4t/PFOdAkd/56044oqksgDRpHQmcPxR7WkhsEmidxBrBQOAKrxy2gi3QCAX3mZMExa8Idp3bqvg5mTfjqB9upfWl+yhzCvBYEFfz4p668mL2Xvhl++M0IpcthrjjELoc8T+/y+HMkTzphGLTpg1jLqAvOkHMjHR1hjvnqqGhAeAZcRgXwdi++O2FUC6OD8XOSBqOgBaaddztu0EjEU8LCRojtpmcpFt85Xc9X+5g3qG47z3Ec9VMZvn59eOUN7Ts/icdbOlFcMqAw55l6XXGJZ1qg7AuyAiKpWKlAsbBIwEg0ozemS6MlNviI/LGg1113gbGTVoyZP3lxyXYIvtc6BVjZIHuL+nYCHwXO3ePlhabDO9dHUTkjstjMkCyu0WEpzrIdmcXKY2Oc4n4UUzxrZ2y0tTM6Nmk3Mrauj/se7th+vBq6I3vwUEfmIHJGZnFZFzmDadLIEOPsyMgApx3XAxZecyMaHczoMNwB2M5rz13aMkpTxiiJS0Qs/VD2xfoFMNYZPi/OEkocUBzWmukfyyjBZiznt0iEZ4TMjwL8GHR7CHjS8G9ndXsIpQ94sGkZIxqwGH7GG9wUqDQO2gUVUQgBZb6INJhGWrCYSEj5hNE44/DXMdnXVG4kGAjpiI4A04AFRwyCOIuWzQgicV4EoGevyIn02Om0hACjDotE4na2wXGRGBaFkBZgz3072eg7plY5ytR0XqUrjShzixPVOFeFG1OXFvKa0sKIgrRgVaNqXikyCpGJMsJrK7FKgVMoGkc5p2kYLWNECTjiyP9HXLH/iBX4V3OivhHz2bsxqlNAXyPuagFJuAuu+GxEZ0ekragwawVYkS7LjtBqBNZRcXKVBcWqFSCdEldImyShiWzmimQijFkxzIhgKg5RZAUSShzZ5KAr6BgZZ1wYqeTlkLUR8WPNCh6LrshhxA0DcYEBLQgAWTmLLkc33NywQ3Emzf013M5hc5N4XMXhN2sOo1lz2Fk5x8kME8vT+YpD3tccur7m8I5Zh20YjqFEl3svSU75qTVpz21VX8+TuyBH7Lh6hNQ1/DFqauioIXDniLBNMzHTZ4/qQ9x+ghlav8nCvxUS5gajxuhJLaxJemKtNUzvU63m6UnV1ki9T9/YVP3UfqZqtWucPJmws+xTPxW3AjObtQP1ApV72p+gmMRO2OPgTGbiFKOVle3N7YhCFqfsykn2TNcfNuDHA6/u1pzpIpo61wHULOhaT1S+l4r2lnFD5Q5kEgAixoAaziO0PYV/KTAvXgiyBgb/DdZ1fA25xKjOnchkjjsjJRLcF4HXjLWaCjT5WktiUJgqMg0DdcYYHk4VF7FNGWNddLjn0Akt4LnoRJkY1zva5aY2bnHUjaa0BS1c6iUUyMjLkhdjX4WZeTPNZlp1EvmvzpSdGjMRTtK5sSFJv7XT/PdnWbGPHzm8Kr8V+BdNlZenK8UTcHvk8NLBqSL8f2CqCLeHsOzwYq97eHGxUuwcXoi7Rw4v9A/Px73D86eClcWFefxBowPwrwN/5/B35PDsDPzqcA1/Z3z4Oy2/qRPwq8wvFY8eKRUrG8fg/xPHD5cBT7kEpdVyWEH/2LVysFL89VPBanED4LsW6c1sa7WYVorlNJjCuBYbKwvzGyuL2I8Dbrv14NiB4nyrUp8vTs0YP9xZc9VZKR4uFddKxQXsQWUu570LPVmr/sNgFB0MyppEaRY3zfY9/KU9vTTIyAvD9UHEnJ+x44OI21qen8huv+hVqBjKfv/jL6/ufP2t8WdFRRMTJxTymJMlFnnwwHpEDsC5DuStiNKDnD7N3ai6mTi4H2JBpF6Iy0Hgd2PWF/2s0eUcT9ANDlBpiiI6LpVvlka9NGoXah1izyC+ScBbjkxGW+NPX9z9/oWdb26PGLfRVgqICeKSa9wmDxvP77a8J3LGbRyo9IDzyJrD+oHiF43IdkN0IuqCxGGLaKbZvaKHfrUjdkVqIOoM1bt2+1RNcl9Yc6I5gYm2Kny6JIlszHFNtBkwKpKCzQNosOppsT25CePp8cEgQMYnNwk3vrg33sM9ii9uyKa/u0YnLc58C27gOMcy77fOscj+R13HCQKdZ1PTG67H3EK05jdqnDe9YcOZvMesSg/sMUsyBO3Fd7KW73pgwz0mvhhx+Y0zkqIcl98aMM4WFIkfNm71S0xf9erae+1T88Gx7ExRG9AUKlj5ewvIekoDtNg5Ah4/1VUDqvQiocG2qc6PMWSA9OaI+fa76I5lOiUE4I3PuVc81/T1xV4rYpG+mfkovPHpQnKWEgOEtPPlbFoTzdJ969BG654MXMZDClb+xXfVQ0q217xusElbOQit5Ni6GG/e2AUjo8+DGudsXk1WW2h9GsxirCO0okVgrB4DwQ6SysfHGDXIqm/GuIHNRsf4d1Q/3DG+9LEZY47A5JGXRskMV49RGerCGI2BniyP0BjshyUxL2nYiy4+YUeaojfPxLGio4oz1q6/UUev3tHhYhQjZ7SP714fdVFklEuu3ZKRTvBSzLMJxlnJvUhO1cXvEZDl1qhJoIjxxjbNeRWQXOlo42izFI+s9inWD4EGBtThUTy697kL2J8IVj76fBuCyd+6dFdnxn7jmxE6krPfYILrmqgITDx9pzz90MrP2pivz+d26BjcF2J1rUHTrk5ae+++iNN+/k8jTJswjfBqxbegSQFrBSpmdElkPiIiGOxWxTxasMrkE0o9JozrJObwvF2MG0yrSb2luxTtJ02ouuH5Ma4Bj50GKX/C4FpAUX42ONLn4/fe333mxgSGjHjGmDHhG/tKEOfYN4K4HaOrRS4GZULNU4i2tl6HhiEHnwP04JZzQuYdOc3YWGlLxGQZECnAWFgSyfTW5ccf3rfxTM0A+YWZx/mt2ZHSO7J9WNAgojQ2qrSPRrnddX6PXDnlGNOlYzJ26pa64HaDLZ9eatTzNgsYVQzd/7b0vBTG8Kc4Wsz8Mh9bcQRxmJmMg1yiX6AAwHMhfl2ehvXW8XwTMRrfQcuEfrh1GZNnyGHmscmxHZs4O/mOTZgh7tOk6elm5fzMSLgrmhj7sv5fTUwWUdSSjjMzN756/Ncr/19mplZo+NoxZS/SP5ki6puSghiIIcVzsxPjk8Gnq5+OzIPfCJAPYUwXaQVkp1vY4I3sSEK3IGn48TXernzvOpKG87dzzMVgXOLTZJbQWbRjtI5wj9I66sAhJXdOB8T3htCPDlPJw8gYhYTzGJU2yAiFMvDYBl+SMQAgD8+9Mwa8Mz6Bjmon0Du5+RPFjoCrTgfAhfdsRQDbfTlbgYSi49ei9fpW/DrUyyvBU0cgHZv38fjDW7tf3NH3YZckwsgJM1vBqkuetZ5gjwVZKCgaXlyMxGycZKfM4xze38D2gxC4cB42RdMjeIObsfT4GQn/wHkWtD3nVGBgkdy4oEx6BQSmFnSAhhb0SbsZrro8M6Kiz1i9fNFo5NWcNm4UcVcFrqjiu2jUXSlKKd5JTrHMa5USSZizkPCt3Knu5mptM6qvzYiSNiPq2UxONTNamaMgLVjVaMHqQ0dcTeiIqwUZBUiSX3ibKhBXSNX4+6u8jxLnilm2d8X6/WT6CsvyyyK7V1hmX3ZFdSOkW/l4RuXiZZGDl438W3HEXiPwGlHRCIlHRC4UiVBfDz+hUuCSiH9LKu6xBNGadmQ8I90pbVhmGYv+0P8q1eTEGVeW8baigGONs/ywymdTUZZPcOOx4YG01Jl2pJcpR3AxMkueBy7nOd6ysjbeCyN2avmow0QN58xByrFKXHr1wghwwzBdLC5rcnjSBIa0aMnoIaWdM4ZqHsozHMNrfiEII0vKk0pBmKw49GTVoaaGkP68R7j5hG2NepB4ZbSrzYztZ+Sq7EZGvtjuYIyW69ZFrtzuWYwi5s2KP/5mn80KbF47eZLc6//4m333KTC9Xzc4k7U1KWOQShE5WdfYkA8XGTlZYzhniYUBVxEZszNgCrqV0d4KKDZEVPNbbine87UkfYw4hDNmfOQitobXKEWkgQUFvOR8yhhowHEJB332+p4a5Gt0i8S0CS1oCNScbrEF9RRd8wFNQzzptfdokucg0w2xzmPM8RZnn/QamjYS6Szjg3Z4g1e1INsiTHzgFG85jEit1ZU4HS28c/Ja1qipm+8yaktCRrT8C17od0TVGTIk2VOxb0feA78FmXZnmmVOzRTqhOkMmSmR4cuYdZg6MhlKLuGjdBWB/JxdiRPHj23Ar1pZXT1c/HXlt2vF1d8cP7ayBb+npqcqy/iD+iX5HZLfovwW5Dcvv4Py+x38DkxV5maWivB/c6oye2Q2XCyuTRfbUDMjv2n5TXn4O3Gs4p04XgGM5f9cKReXy8VWZ6X4x7UF/P/wApT/dm62XPrVvy9O4d+pyunNqUqW/urfV6aoxdpUJeqGpc7B4sJcEVqvL0Or5Tls6TemKvUatFycOn7s6HRxeW4WambLE3YYOGkfmrEjdEJNJV5S5lP6J5PvbZmT52xRyxBdiLVpGnt+m5O61bUMHTK22NQ4uNfWqHF7z748fPjMzgs3Hj18T9NDDG410JgS0TkxPrMkuCWeYcqFDm4MCAdNF5jT1hD/nPhbUF5cwYwIv73DOGVDHYSwLsdMDZKEszQ1QiCCbBcDoUOyPAaDm5QVioJzPfPS4/eu6bGqhEVvetajZ6c5QaR5DMOO8WPDy2yegS8O+AmluUxQDu95KQjclKolRtcgiW0A/I621LU1pczCY6ggZ4dkUZmS8GYYF0OSOvz4WkOPb3MkOj2+rWAwwcvaCKp2PYtGUGkzBq8NBMHfL3Us/FdEI/W6KPonHoUV4Eh6iV/reOuoVwGSOEgpGhk1DLAlYom1KRq52/XUZxdsEC9TigdJ8uH5h4/+plgoEw/BWHYxZFDO8ial8WEkywpYKiVpDwLnbD0AWYQaXPKo/7q9p5J836MtbpbregcUJtv1wR30TW/Z3j/3wt4zd8wAIh4AISyzxEUD4htOQkRoygo633kBL/0n2AIYzzbSCPx2KOsaep9RIvFE/IQz1kOpbbugqRm1NWgUmLc4KbQyPl2MOG160x+v8HjO7j29vXfWjId7DBBZ/+Z7RsxzhnkQuAVHPzdoGh5nNtdkpgYZrq7b3zEmzb2D+yJkZSTROlNq1I15aVLaPaJE2GSWPkK/W4BqWbg4cZjjTe1Me8++sffdpyryR5TUE3GYdE8St4TTQmlSPwKafyMMW9I/EVx1UOkOboUF/CCAukZ8mLmFie48XlNr7LjS9UP54jg+Ni5loJ1ZVAB1w0i2g20KAM9rCuTbvQsv6Zoyia4Y5YJFZD4L/ioI2YLFkR+HYtFEVohCT6F2KWVYAcPnccT2hItkWcG7LfhVsSr5/7ex6+lt4griX8XKnUtpJcSt3iSNWmLnECH1ZC3x4nXYeC3v2mAqJFQhtVEPQKkKFA5UBUUhygElFQgS9bCV+CTOn2/RN/ObmffWAqmnOG+f5v2f+c28eTP9Lp8QyhDlwPKQda60TJKykRbjEZx6UvLBmjY0Y+758T+n209nP7/VO7ABDp+jtohYlVDJCy0QFR3tLVoDqqXzCxFtha7ynh6jCax3xgnbeDwsNm6Nk0nCqdloPCijJadavKNQNOrHqRuDPDqn964H5ITJ8RfvP3QzdnL4WMNXSOoxohHZMUc74baCakN05475C5CXxWDqElJwo9rfGCXq4K8/6XbW/d5cQmYmLf74QPhoA+nX6N6bc9UfPzp7v3f649H5bx/EKax6TzG11GeWAmyRLa3JhhYKVxFLUoS0zEjAO/z+jX+t5rn17NUxiEuYpN2h7BxcI3eZ9wfzXHABc9SJXs1e11mG5RxTfHbvD53fglRsCtxS7a55ovkI+bTkG/g/U+uxSyOHmleN9uWOo6fM/68tCC7pEWfZqPUxpyhOkFg6joHfC8gW25OMyCfbv8x+ulvvp2tiNaBMpbW+5mLRY6q+t5Yb5OWOZgWhuBBucSZ0J8xBbdoSR4IegXRh85TCsOamlDls1BiOL3STGxCgH3+lu4t/nxEsY3vO87/P7h6c7v1e73/QEtPPPzWIWiN+ENqEjIMbEEvTyJ0OeifTlKdZE8f0GI2wqwP5JvvvKTt8DJJhm08fHe8x8nmDo789nD05nB29kN3MXVLSRNJxKO1x/SsI+/4qbfQXdKGa9yniGe1liQAK5LQF1oevMfjeAAY3t67ktH0zz8QcUu1f41whmurr6MPJI3OkJe/mhLKPEKkWfOpdUbXLZZxcRWqFlbgRLV6DGajXQFvEPfaeoCGLrsIggTxVl8H5przVb1M8jWWJraIIB/ayIpnSey1k/+pxgjtJA4706c9Onx+dP96f2/Fp1jb6KBNWrhU220rbz72njtkHcc28HcPeSbyp6PeQq8z1qzuo/tzMRwMxZ/adlJGnFfSIg2IGZ4j+cnbvnQH/UcD+k15c9AULT2gF2UrKHgX+xCcbsbElGNf1wJN1XQ58XO2w0CBmUu04EYWgC2X1upRL4wHZ//URwW1Uhs8xxfxqwZyX0hVBigv2A44KiPk4PHkosdGKC0AVEszWoV36Z4iu0w6kj0gJVN7Mv1NKThm5AUqz+7ufCVIt+l8kmlfkla1ItLuVmkZnitz/1omgDgVqSVMVkqumhTRF+Wia2mEqh9c3TAX41hQLwfxXRImA+hCAfPjnC9r2MPtrj9wNs3tc3fZYetvwc4hl58CyweQQvLLNOY8UqwqabBk6NVgawEfDclcUKxp8Ww+AoUFCj9cWBaQtGipTlLQeADCDXh4XRYaHIkNB8Dhn3SEAJiEqGWJ3FPLX/Y8RTrvixe0BQh0dqPzGUqrIXlbZD7lvclqF6KoIZRWaKyqFIX9lh8wJLQhFL6SWAvlnok+uIbzckGejKilWA+ljYsfEA60mOHXAnlvG+43rGzMWHvk9GK9wxKUanzUeK1nBcMdALOsq2BSu6ZijKLNTTgd+FAkPWleeE4HNrAhbwPb5hEnZHfa1Bi/hvEU5/OINyrVSb0+eK1ZzcljsrclzbcKYfOlzxmRXe9jpuOrXOpfElmxNXKaIRGWcFU5wrJfu9F5PumRrdtvuNYay5upM42zItq+vLi/ccsKpT3TDwd4hvzti5qPlsPqXQXWdgTsLWV69YYYX1LwY1tRZ0W7Wan5Rr8mjoFH6cZQLzP2DpbDZ9xPu59imVWeSlniwNc7yiKeSgzY5uvRe2I16K26VZBV1PeaoSPwfpnvV/ex0Fn74D6Ilf3U=";
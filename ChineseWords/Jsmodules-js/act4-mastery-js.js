@@ -1,2 +1,2 @@
 // Obfuscated production version (zlib + base64)
-export const w="eNrUvWuTFEeSLvxXyvTh5ctids5eZnb3y1jTDaJnBGrRDDpra2tYdlV2d0JVZZNZ1dB9bM1AV5DERRKjG9IIdAWJmwS6ABKYnWJM/2ON6m7+xev38MjKAoGkfc9rNiO6MiPDPSIj3R/38HD/z//8j/94YjVLikZS9pNmI2mkRa+bN7tbn/i7J9JWN5/Pi6VGyvfajSJd7ufFbri3OrgUHmo3Engq7ctjdLGX50UjXew1Wt1sG1zt3v1ypdEdnOvDf++emYP/vLnQyH86sbgKN4dnzg5PfLj2/sW1szfWjt1+4t//7j+eGFxoOMYmoFWvTIG9wfmskwamnoIbcD3ih65ljYgRZHpwcbFs1DEC99beueK5IBaKZKndbzbyssyXGvng453Qrkg7g4/ac40yWWoc6qfAR7eR/hFvSONW2ofG2DTtJNCw91+H3+0mk0j+RravcffL/kJjoTu40G0Mbszh2N84MfzxjY3nf7z3/XGiiv1MGqUt8JdewQ7x9+DmSsM6g9/3bp7gXuj5X+F1pg99nf3BtRV+h93BzUPICL3I9dNfweQNr9zauPPjb/oWjT6/OqZLFNtJ/wCMIaU3tgrdIdG03U77B3DIfXiV3bwknpACNOe5wOuDa6t6fWXxILZLUiX7t+N9oPvTqZXGT2/0SxgxDXjjyvV7tz5dO3b43o1XiTwslgw+hyQiD+w0G2krIpzTRLQiomUGM1zk8zFlWC1n4YWfX1wdIb929ruNO+/GHAy+aObLDRhuY3AOF2a/hz/KrD9DS4d+NZJ/wzv5SiNtdrNZ+PunU138KorG4OI+XFI/nl1/4du1tz+SQcErSIFhXNb0d7NRdpMpHIbeashqgZ80jO409dpsDG4Wvue1S58MP3vOdz74ePB50u9lJazXBJdro5PCd9RNcfDdPOvJzTZOV7+bwgh6S50cvwiYvKzpbye9MltmVsKTuG7n88bBFG9Ny4z29+NneAlm6SbKg7MZMjd86Zu151+E7+n+sev2OltAr5tkU+5Fxlzoq3TEaQoimjwVgRTMQ4UOCJIymWtwn/Rn2usBvaI/q0S6ODFJmWxREt280Ur5txK4+2XofvjhTeq+zHvJfKPMIxJlL8OLKX4VZWNwQbrNF5vpIrRtx9R6TWicxiQHl+CToO8xEB5e/uu9m6862tH77eQoIou8CaJpqvp6u3k7nR15qyBgFvhy9ELzHry/DLtqToy80hv7VDjwG107flnlA0xFFwVpfwE+sDKv5wibpO2FwYUCORicbeCFwYUOfJtdmrtkGVrBz27EYUkPc9f1PF5ssQbwHF5+b+PzFxyH8H1m7aVDuIxW3d9F0tQ/u1kif+F4Ow2WTYOv+yQT3jkBUml45L1H7gxW5qGG6xHlwPevcn+P3hkui7tnQEsJX/dffmXj848fmy/rj7ni3niBwbvIO40cP9P+QpHO0FtkSdturILeSzr0aqVhO0Uxgy9JWibyuvaXE6baGCAMzh/0um39h3fuv33Z6Tbp8WnRa16+489ItMdC3WkxJGVqDEj4QYF6eiYMh9QY/v6DdD240H/m/9wJo+gli88S0liQEaQd+OMCvcq1v7wInd+7cfTercO/Ev9Gh9lnCvrR06OdPmih7W4E3T5IgZVGe5q/c2oE11aS7WEUSQP1fsGEaI5+OtVu9H96Y0Vew6mX1t4/ZmMQUpUxtOMxtP0YovmHvsPsn3qJuu2n2C189CiJ9zWa3byF62cFpCX8zdenARii2H3joKll7Ofo66yOAxoAaAE3srx/gNAHMLmpSZozlVuINcpN8O56IzjDQwzucakDqidvCUriDkq62G8JWBqcxe7hWtaDxQ5NCZly07STkWKilukcIfMj+JFeEimOc4Jf69vX197+FsQ4zArD0k7WblYJ54MLPRCLonwddW7d1hHCu+wl6cGY8ODigQYS73m6a1dPDz+54OiCcBDOAbakTUBW/LdctN4y/FYJ3OOrJSFxExA9vFdmn0ElKDp9Hb0Ky8AHLLwENE+xIOAoYhcRkhFhiMQknvj3f//XJ0qQ8s+m7aVOcggWR2RVjWDvGHBHGHuMpVSxkcxOaAaLxEwQtTy8xWF2RsVCeETWPOp2kJu/QPvI7cu2L5pmL0auMWZltLqP3yxAVX3fCU40QtSSOjUQ6eCj4a4Ofawem/HwFJbhbUNkmZhRisYcFCPwmSBOwikVZEQfisAh+ptB0Jx0w9DHgR6PKlrUvp3yGAAqlATnDBok9KYMDzgkwNCJNGKq0CT8IpQU3+wm8ivW4k6FP36XXgF77fszXn6k57yS+xnPRjqmqmB+BlkW7062m2AXqe5EOgv0IHqd3P25YsiJsl8ixEx+OeFCy+0/EWTC+Hbh8lnOnnziX+HxtL/Q74kqqN5dbHbTYr72DpgcyVI55lZ7gaZk5FY3W+lmtZSAj262CB/dv/z+X5/Y30yWgOuDT/zvf30i6aUd/JefKPbupUcW9v7L7/f+I/SEPqhksZ03QSEmLQRmZSPnr/dQBtYIgBhwF4CzBcR1h6/TQl3Kq83TJrUHidZM2Uoo8ePq/nSijwCyCfL7wkHDo4ePrV08B7N878f3WaBWeEjgy6/joY0qvIYJUIJ0vYaLLOJCFBQzYApKqRcZ6GiQx8liN+sY/SJlh0k373jSBbelhkK3VxbZfGOlYyQBOMGXC5wDVGGy9z97a/29FwCqjKHsB66ER4cttCvDZvKVUTMLYdzAgI47h+bYf5/NZui1GFyYB8trif1qyeBSkRXpPKN1AhJFo9Xu5wcbjCHPgqJEy6or41t74c7w8hEdXJE1IgoFYGgEoDWUqGmaCaV8oTFCDIax2nAUEZ19c5UJ/hqDuXtmfzSU4ckrbigguLoymBnyw5DzsYYKWqURoR5cccTYRJhrGDmSNseZGi+JrNkdfNFCTdohNwzIyIR+Flm+TC4taJHylZQ9NSt6AVTeMsF5tMnJorz75QGF78NTrw8P31b4nnf6vRJUZZ/NvIaRyZJNNF/kB8p2s8KkO9PVjmWquN/qkgb7IwF9t82WM9gaZQqOj226kpsp2oNweZV4llUMY9if7ECmLsAb5y9XzOtXL8ACVjM2F0LywkuWFfQS9mXQcf5vJN9zvDwddSeLlXpTtjvpHAwYHHaDc+RSAmUBDybce7KMQ6GLadlN5V3D7Mz55mmB7ok/PY0GRdbY30UnkUzZpUMg/84toiQAuxHV+Ma51zbuvDO8/fbG5/w+/oSWIIOSTVPUj/4HvEahC5rvz/lpngbwj7XA1sx7WX8HcbUCZmU5OE/e5TZ7SlboVroA63UZPsEi3cPWB/B/kbAu9rtx9OK97w8Pbx+VddgaXKCnutgl/pUjoZyWNXc1ob1oV9wLd8TcoW7sZGgM0zdE05kuNkFOddNNHfk0XSPy3heIezcBRqD5I81MAHZw86C8vI2rbwI8WHv7rC076UP2CmCYxQLtFKDNB763SUcn592EHriRkEyZAqHeNK35iBbO9V9eMVIyoKyPk12CkBJaS3nRI1IglJNNsicBiwfaAf4Fj5OOiy6l+7M2DW6KJ6+/CDjpEO5I4OoEj6d8rWsXPxq+9T7IhvXnbtg3q2RlIqtEY3JGiacxpiXfgBIxQcfDy9IWOSa62HuxTF5msDZbMjb8BUs5R+9ECsZzYwUke7qLdcIK7i31dFENT7y2cfm8LirsOJdFEHeZEUHqbDrqR2QMdaNcthOw7uEzZFlpshZ9NF0AOgV+oYi9WDTP0Hcg10l4hif0x1JDWpD+gb0xMo9xXwL8kIPzZMV9+uPwyMl7N2/e+/4LJ6nlcYQMO7RHVQkkxgJFAAs7YqIrO2JyhhSYmEMKeSuTZ/ImujI6fyaRZqRwP6yL13zDXK610kKupe1eD1bFBH1WZ3WQft2tH/0KKbtF5xUrbh95dcdKm/0M1Go66pkHw126JVbky+DRzhuDY9iafwHIYYS+uVdupUUmN0CUl7xgtCUCHKUzuNhfVXQDdNbeP2zoRtv30x3xXHVZmul9fin6i16J9WwDwI7jb6SDk7jUh9eRgO6gzzB8+HkH1Nhu/eZB4MI3tEzfC08OfRs4L/phdBKdYDB0WQHDzgeslAZxDw+3bW4DU46jHYGbLcLGDkd/TyQBhAH+/I0Hki7MhY5GJMoOFSexIPFChHip88bE2H52BNZPjeD52QqSn/UQ3tB7HYCeqWDnmRHQPBPD5W0xTjaIzJ0b4Cu8LHFI1QRJjEwdLH2EPjwmrAOEDgzudjDQAcDdFYBm4MzNFbv9SwZMtN21kLW3KlSa9EDJQFItQMlhn3qLYpQIoDh0AvteoI76OWJlEoYIo9CSbPxd1qS/aDuMWkGjwTn6MsvN+awDKIZNajW9/OyT6B6v4qeqSMKjiFi77vxZqrXMRjS416i/oEvVfab3qupmJlY0M5GWifRarM5MsfyyDk2+m2z3AncbwXH9y11Mw58qX022ssHIMhW/U/o3oZ9BbnJrsS17hYZqUONYUD3l34y9lRqHThgXOlMAVBS471V17IxrFRw8Y1sER88DmqjDZ1yT4Ph5AL/sAPrncQ6ggDrICcSPpnv/OTiCCrCocDUGfAHSOesEaFHk++B+Spu4BYiNp+QbA/W30u4tghyZZVFwHj0O5wc/tBvZ3TcPNvK7R0i0bjz//vpfPh3evrx+/ri88F+FIjj9QJyj797TxtVy6QZIDSYrBFkMwb4kmgf99gy74ekXCx8gU9C22+AsIFwNTvjk843bzweedwirO4THHcrXFv3e7MlPf9Qn2f8LDkgUf2oasw+Vr+EOXVo4A1lvFGlTN+kybcs28k+nUELC9hML4K4Eelw5Pbxyg8TwGQmnoscmSfbbn+5quEjaA+dSu+ZNX5hH7tX52BP3UAO/lSXwchQJb+3GDRZ72UFw29tv7HwBZcgh2pVo/HR6hfleP/M97Ezc+/7E6JR1tlbmi2NN/ER1t8aztLIljIhieJSqDOrGq0ySPcXojYi4zvoUgQASUa+0YdezOrZOtojhBm50d4+A3XLqANIjV/ZbG998B4RcjFCFDjw+MoX5QtarksKdsZgUbo05Uj+edaQQT49+YniVPzMKtQBAD8EWT8mNug+um2Bo1MhXB06ZheoHt3HnZfe14YQaDztkPpX8DplNpbpDZjJQ2yIz6QjJbBKVkSEKCA7jAwfNlmhcCor9iAr63Gjv4G/HVwj4yA7CvR/e2bjz/q86EqHCw2ASrIoHn5N0BjOsI/CXlTFeAbHQ7E84lQzXVsBOZtjAl/Aa/R5cAKfU38A3B/529EMPj345fO3m2tfnqnRCfECFVggScPRCoIAjGAULGGH1NjJhNSJbWTOl0Dx9SyDn2lkHIorUVWVN2FlVyG2xXQYXSxUYsBTOgbwH1YKq994PP8AHPPz++/sf/PVXJyV2ktBQzxggZxDgnRJWVIJRXRQX0s6oR9xEFdjVKWENgtmWlYmEkPKWBGDCTnuC4w3A7AYpexaGA+uiRZrmPfQHf3f5/vM/PpwaDoht/8FhT7ICqAPpfj43wS5FT5ydikaal3xP373OYy8sE53I0GjFmvDakLmEd3Wtx84t2kK+wErx1Gvo2IKd5KNfRMSmPJkpR2DKdT7Fe8vWNSr6917gPjUOdSETIdZLKI5J5oskHoTT0TWbLWkpl22yQNbJJSalawJ2RA/gf9n3/RqujBfPDy+/ZrTx2+mkrelA4ynud9ZzboqImVctBOoNuQfNR2Ft+qL7+W7Cfzy2LtlHxinuq0CzxoqPWkUdLosKYlVBf+uK+pkschfMH3dgohD2bDHUt5PPUayOGjgqFLtwHQBmH2M6ZkQ45gQZwGSElZD0WFahkCyTRivP0VULkQ47TU4W8mJBTELIqr5Y1p3jqOe9WuoYd1tHHXXpCHVUp476j2cd9Z8HHheyLQIeUWUtMHhcO3P9UcCjPfnpj/ZkAAHFQxAcQU+Gb7xvAgAUsZvsmzwKgBVYwSCWYEWdh+c3MBzMWvi5LAvcVqwN3mU8GMEzM+Zv96fDug7lRgg3YEB/uRbSGpJ9PKxcBXgK7uqQnQc8OxzWiVHOlhiuGVB77L4cjqkBMVMRqJjySGLKI4gpBxsMMag+SHBNMRYS/U3yMC3s7/BX0NimrH873VlVnLVa82crMq/FnArLiWfaEukMvoBv56kRSV2GMwpemzhV8midmLx3wn6MqK0Ts3UidkS8BtHq5Kq4BkWg6rQX5KRXSfhLxKBJwPqAHrYVJ9GfgjZ1TVDPSIsosGf0bhTcU3fbBfiM3I6CfOp4Yz/P7x8Q6CPWL/l59iedvb8PPh6UM/kcnKUAO2MLuU4+R/EjllK4KxdaaW8+KZqbYWPtWX4b52ATAH3LHFuOOy+kYY5dWf/6NkTzDI9+q77AdL5Bm+qKHvHEA22ZGwqn0w50SfanW0kHSR106DHQ011qImV7Fi3YJsn6ByB0mQ8XzCUU7w+BjAcOpY12lsBGMHnL4fACX0uKuRw32mDjnPZMskU4T9PZD/MIGoobSRD9qlBe6P7t+IIp05evI/3vPrU4BM8CjxWOmGXzMHFhqEZdRhp+q81h1HScTMf2ZvrFXDxE2EGA03GAPdwgm3DE4kEDXFzo57hNCx65JkjdZjy09Wvvrn/9th8a7JjC92jjAs0AX4YbltznQWHnhQ7IKOheF/ctwwEoBRKwmzXQbG4lrYyOjpG3twDtg2ITbmJkBUQ5803yydlzcIcfa1ZvZI0VegIlPWwwtUGotWiZgml/ijzgr3x878cTG9fPD988EjOjw3Qs6EitjViM9lNenxLSXW+iEY12icJZx4wWb44ZLd6qHS3d8KPFo42LTYLuHPFlQ7534517379SHTJ2oOw8U2FGGHnGE+OmKFpXhEu5NasLGMk1IjZwIRNZZsF0JMQFl3igARc06PF+E/z5CePprJ2X5prK/K3Kc21AFbD+8GNdaRUQzURhCHYNo1fzwbl2gyDG4Dxtp5y5uX7sIwAa68duVHkxdwFz4E1cacHvXmnJm1cq+uaZgrz5droMZm+/VTfQ9lyCd+pGCt9VK7HH3Jj0oWigMNNfr4C/52zXD3X99PmNw6fcUI0XG6h05r5mproS3Q6yWKnoJ80UVEINPqcAAwqHakPElGCFQxioiIcW0fzuw3U6yZijAyZqzc4sbEyn6xZ7KK8ENaAiTxf4HCacllg14xCAyhdwCnN4+Ac7wovhWUnEAe6KY3hB4ACD9F5GeUmN244DCNyKKEN8iiMI4VqOFKAOduUbyT1skkB8U7Kp1VC6QHMPgxTXvK3tQUevAGZCqqhis59OdChM7BLH6t+4ykRHB+feIv7WtxiNSbwyOih5ldK9LVkiEEJ0moNL8xBYOLcZdi/xWHUj2UeP4ZvcbBJKbZiUznkVyQLF//B73azSip3z7bTgk+pkVqykEEhLR23TPvLYSxr7c8KjZIXhu8ZdcHS0nN3PphS86LXDn6+//+oYDmmXgKjkW8Yy2qV74xmU7ewqewBgn2R9ttCIGcRggS/fMfb4DUlAMk7xMZKpANAsHrlF0WgUihbaSXBLUmyWZhA+SPGKN0GngGDQ6Ja1b47cu/maRrfADn4Cx3ysn6kRYlN8lHWkkVESV4/SEU8PUdHQBQ4zTp3MIBIamGxrrrCGim+AiERDi5xEKi7YEOmEYEMdjVGcGqHlx1P4VkpqmxsOBw3IcL4/HKv5oILDWwoa39aNe1v2qC4bfW2RIiS8IO8OtSGBAnl5qARf+Vhf3q+BOIyC4kWiEKQxfhK9DKMq8e31Wxy3iSicExM0gLRc5I8gNG5aa/prqTE/n+9v5t0/sRthEbUAiQ/Z1r3++fDK+eFXX1Up0xbDMfJwwCWli1sMOrGOMu4w0JwKsf24vcCz6cjpfDJBnc8yL9t0yLrH/BYYDLOHz1nzlUN9Om8NGrXQW/ZMs/oQ2aywwQqxZ3wqmgYNQXL7cOQdGfKRl4fH35KjhtgTjZTo6OiEAn3f2JsuDuvNFgf2ZnFrAAMgLgO0RoNVxiRb3HAV3BB4lTQMwkdueiFu2rSGKyTQFJSh8kTtgrP35pG1Sx+DbqkS5K/B0bKhBEo0nkBEBuWp6DsiKjSsOq+hmohbnHG4xZuFW5xJWLU+zRCMTbBdwfja5cyurc7kim07M7ScvXPELJ1dZuMcEfvGG09m1fhvetp/zdPhw638qQaD2Qq/ESyvgvE6GL5LQe+sh7u7FOrOOpRrANcjyikDi1MBRcYXA3g03PhboDWH1OoQ4R7XPXU90u+e0OmzASgZRqqDH5NjAMcD0NCuEZixZwT9eOAj0VpFvgDKrumDJEcUPh4+iZrVan2n8r2+hxDm9sN18Hjt61Tvg/TuM/Ua95lRRTs5qmIj7WpqL9Y807HKiRTNdNAwf4pVi2mVGpUyU9El20YVyIzXHNu8mDcJH0vbiUjURuJ8wknYiVi4mlytdWZmvaWsgHjYKXMLjLoz69p4h2btfe/SHNMgODXrGni35hgu2bH5u/GOTX2utXevrIq9vwuuTdwz6GGKlSKVky8kQ/TUlLvNgbI98PUn6PJDrMenpnDjq6Tdag1iuPo6Ho6QIAaUjQsN6Ygys9DvVoNpqY8iagIaLwfxchBUHROjnBJ4qsCI0S7KTSbFKRDgC15s8jkP+IopvhH0G0azAn7JMShctjavLcCZhwYfOltOWrRH3ELzExNSpCsiF3PcjRzcnLMDREevAikN0V1FVNSibQ/y8WX8s5uRA341zaLbeA6MNoMggPApzUOjBLDv40e4exkJAHswvnrtvqREghPdcIXs6rP78J8J8TuTLoOoFkqP1EpbadpE9ygcBy8oWIL2rzCSsIkZGmQL69sXh999XaH054gKPXpN1aH0y66URuiSXsFL3KO96k4C4CM7BJ98ImuqC2chlmH23ZqqtJJw7DbIRb64ZEfycEk17r4JYeIwWygi3z+2fvMz2ByuJSi4mekpCqs2YhskIlZO23lxRwoybARS8sKTZpFOygtnQlv1fcPL/rO8a9316qMCh9BpFLwLlLKCotSvDb/7DHww8NZrw70re2wjcd6NQg64WfcSikIdi7zEXWU+c8FvAbujM1f6Guigywrdlyh5PuWSY0SA/7JB2vfcpz385AuLTzIqOwKF3aHvHb5XJtEIffLy4R51SwuiK4TfmNdWAvFAfLMbTog4Vml/MeL0k/ccp9y1dOs7dF0xf9aRsEfdcB8IeRLeDqfTiLn8C//8UdePRCKA30Ny9EHk+NH3bLFmcIYPvlh4mdoZnipAGcdd+TZtQc+0lIkCvO+FmMLwkw/rKXCema4RKPkEf2gALsS86yhwdAcSQEmuMu+TD53M+8XdM6BVIgxqmQRDKRTg2mXUnXa01Xi8uSoCDZ7f+PaaCrSf1wW8Zu1F3zJ2wm8Z8F87ITWVwbmItMlfoFyEk5woEe++KeG+stju3TyDob662OSgHSww7ctO2KHCtm71eB38of2z4hMypPGUFis8puS+PoocCefY7PSaO7PGJ9XQjaSn1Z674djNF9EKjPrqZT38bx++L+4W9b323MOtxy5knwl9GwXunPt3x77kk9ZjX/ZZ06dXgRbuKDbGEdsRu/svn8SYIDvUOfbwFuRMgWxZdJYMgtJ5CiQ4i3tkJxf397DOkCmLX/jp9CEnXjYufx9jnMT2QtBKSdmXLf1JC+lVXjNyKv3Tq1Yigm2IxCMxiF4tLwBvH/0tONT4TmKRfGd1ngoH5yKkpxcDknzGg0jDjxZmoyDK4SsPrRys8ogqwCnqgzUrPqcRaKpPqQMJnIiwzVhgM2EgY+sIvJioYIsJkhaGKcZil4f1OYIoDEg8niaO1HBVB0+xotztFOVUUJS7vbo1TRtU5ISoSDn0TP9iuFqhaizWYA9QXzudfpkZ1S87x6kv01xxt7PS3YTvarZOt5heCSphIqiESVMJE6MqwbTBY8poE88P/fCrMi4ScI8n3UywPbLUMYFTY2ETpxMYjjPHFuyIfV3XIljXtXeDbT3mtlrWdbeDXT2GN7aq/2mcVc1zT6FCc2Jc/5MLFwIfzTkMAV9sQ9gJfUaw2FqQuRAkUYg7gWYJttqnjSjYZAUaTLEoWpVAEwndH1wsKLr2fYw1+f77tbc/DaksoO9JyTqhhNJsD8UQEhFwDNEe5jwsEKNwrU+f4ZuLZUxi7fqt9dMfOhKrcBAbZFGvPbjZECMLYgTnOS1yt0CzqG3mVtS4LY58TOIHcr/Nx9Ahw7Rs+PABNPjsFqMz6ZTn6PDw1Al3Mt33O1HDwVNV2k9VCIsBMkKUIaAnGei5DEPxqMmzVx21SzDkRm3pharDxuSq0YDXL16MRhuOZ0eEZyJ6M54SHxM9F0YJNLD7Dz41CiwTYd+DM8BCisd9HCZP1zhedCU5yO4DSppJDuKLmvLzzHULav95nWA4ve8EIupdJ3CEBO0f7SocdXadDi5pE+4ZQx3oYL3RcCmnieeFLmQ+snzTmOrz8C0xENAzU2G8Ryl2pox9UIz4YwUCPY2CpKz1nUOKOtfzo8wGvSIMQW3yfMD7uXeLdzMge0F/Jydj6iR04FkuQDYECgIR8yw8j7628PzgHCwM38c+iDSgFFKbOLh0JQkNKGeUdnuALD/tdXjiFnRsXOG0VbrFOWs1JMW2v4/zpt3KtLmOMT1o6DinXIcS5E7u//6yRPfIZhTe59VOF7ppiiFLcpvSITbQZQUCjNJbfX4Edh3uv3db8hPFfUvHBVIggdgF2yPuP6UTkNo/f0uhe5ho132+kLXG9E8LiO67vnFirGueGcZhuhsNaZABislu9K/DfEQA2Q8EOCsTJKyiaOWUOiKgx+lZ0WFKf6Q4CGhLB9zh30wewgjY8BCnbsIYK/A5Q1b1Jmc4AFxzqFHcPYNmCXLw/LUhZEw9IgGvMe0WJoTh3eQaDvhOFxrWUJeRR8Rp/I40Dt5I4+yWKT5fspcNJCwGuAc6NLlwAhyaTCiFEiWtID7QHYuchla9AD+8BylozQsw0vkMn0WX/nxXrItcV8PD77quinSVzx7CIbhJXglQCKE0qUXrDPJwoZ9wQtYZuCHnn7ZlJvqd/5GV9j2e/5Ot+C65JojhJBxcIyL26nN99UaHX7lSknddJYVvPJBC8ZTygTIIHYLw320RqXab3X1EAlzD0yyklAQKKetf0refuAV9r986GYRwacsodMy/rWN9xz3MmCvHiUWm+s5xyYTO6UPj7QLWx1ChAUHTYdXHLTmyCMoYk9dsDfLvEsZ/3D3Tkak/89e1K4/fpyjU0CVokF/YpWEG6ZEBwy9nMvSIWi70WCbkMIf/tfgAGiRuZaCDypNy/Jekl/v58mZ4e4PLeOqIs3cNLrUo2z8/C9lf4cAhPbuSUNzlMgRHhotsFHHaZvovGli3noeczfC/Gl7ktBwH70Xc7K6hDodS8ZvJd0bkqU6FVAZA/RRTRxUl1GsjPMh6mHJGwzNqLBAoEfQeIfZarP7eo4Lkp+ogeQWN/1JwWsGljwVKA5R8dDAao8Ofi978V6I45lExm4NrBn5YT5eKdUSJ8z8OdTjIUQMIdtmMM8hQ9R9pfqf2axQ+l4+gPHCmPWuUbEW/BtXq9OqjqD2v8Zy6G6MfZoMAnxDh/XT4EEzfOGXzmB2JYvllgt/L518onL1crhehFPqIooq6mxwRVLudeNoqKfSDQBqRRi40QpLlNDBXFs9iTWxEXaMoOKK2QRQdMaaFC4+oaxHFR4xhlV05//iAAAnN6rNXn5zf+4/Om4OLCL3lUk5If0reFH+bc7bLBbJSeyRzzu9vYLEb8JeSZ/HoLawp9L4kqILIIzBum4JCwD8O6xH8jB347IAdyfUFrRYxXHE1XaKELgchegGOPfS4EhJ6cu8e2d8QQkjj81eHPxxmShJiDVFVLS4SwTvWcAFFTFnk7MbkBpJcfGu40rWzjhc5DyvrBvj4uRbM8KVroBpAAkh2e+AK3e0d1I0JbG8tcywRX++3AWdCbnk9tkIXB+eoMQa+beezAOBB2d9OxGVCrn3GUTiDnjxiqZeOe/KUoSIJ48ThJWgxlZwBh73T0soNtkhSDASQwXI2uL99iSnxwBUtOfxPXB2+fHPj8GvrtyS4bLmdQ6ABBsj+HcwvxY11JGqyX5LgXFrKMd7vwhSfvG3nRZFge4hV6T9FXna4HSa5i/XlGnePzDuyw6/+Mjz5uiOrKRowr2yGWY5oMGUQ5D3KQtvBwOSih8gJPjM7TqtPdquP0q4F3sFOaTb4IcgBVOKeCJa0ubSPEjmwn/irtW+PDo9fW3v71Rq20m6R99JdoyyBmOLrVWaAjYKPQ3hOuhBLyQGqKE9hfuZjLs78dePO6bFcJHI0qMLDauoOR3ke9CiR52Ae98AIGuB7oTWBHAA/HMzxOiwKYOD+eyfrGMgoN8TPpt+m5p487IfSB8Af+KV2RPyHw+uf3RpPHHb5lsq6l4A1hnKI9Kl7D2l4yvOx0l7i93Bjnm0P5AM3cTj/ynF4E8DI8Mc3axkBSTJVywYKoZqlmeoT0VToRSeLIi5YGAUuIHl/d/ARbTniGQE8ap+0yLgtUwh4TuyOVJWAFCy0DVjm8Nw5u5tncx3SymW60EVtzXfIlXsWVyVIizk237uDGxzj89pbw5PvAKZZ/ytj24gTiulswqdPPnnPCYgpEB7kuPcs+PYQi7VUehZuwFTcKCv0b352//CHjn5lKtLBNxDpuYrhgL2JkfkgKAEZF8q0pMNHZcQMqFQI0ZWH+dwwvKPWUt8xBRiKsmm+uSCFei6ROf3WVTiSDlzBO6rjCjag0b+0Y2RWIIgV7pR0J+IFI3fTffoQbMdQs47nZHDjEO2j9DwnG5ev3D/8nuMkb8GibjfpqAUfH+S6kRgX3ynQF5XNs76HqHk016oN4dC3XCaUTNckjhyz3lAWK2SDyyAePQWpb7Dexi3G5BkgKoxerNBezkBfGGkJXKyQ5TaBqGyCO2q4F+5IUcoBHyU5uADLuhMHSUKyJ05NgMXiaAMaAiMBmSS613oXBSGmywoJ1p+HhFmWYN0TiHuO4i4r8ZZRh0evug4RLHMwJArpJQ6EJMnRBxRdcgQkrMwFF/1I5Q/4fLhEP35zFTB9iH6kOdcQS55I6xfEC023hFbKNFvfOSerCX0Du67vItV8Cwt8oFwvwBrtJVvDBJ5ddTHKp54HWEhhymynpaucA1TSG1JtgabEx2S5bRNWejnynusFrIwldupiVCF9rTCyJdb5sLDnJ9T/SMn+FKOeOgFp/hSjOlAHjv6pCM0Bb1MxlCtESjOOWyGNxvDNyAh0IyJiNfa6HLCbLItE6crKmaeNZzzFciBm8dhxxyI+gMlKSskVApus4oTnO7BxLRs80OFco5U5tkLfwhf1XKPHuFaq5KCsQq32ZqvTUFFmeZtLNXhdBuclwvtD3D642JZ3d/TW+pd11Afn9oySXdmsTtOqHp+uUKQDmbTLE6iB7zRQKxIWQfAVppYtgZb9Joy8QW84py9vJfRhgHCDN73LfR0a3yGfxpGFEOVx9CpEeWigB/uzPSFYRRJAbWQKsj4QK0sbeGelklCvtqeBb05o1J+cYrssf4ARR/XfZtz9igln1lv8WexwX0Rk10i2JfKseaspGCzBUOF6t84kEZsgWAJjbIDp6qqYrq6GeCkQaPAYOqDnh3Pj0Wc97nxcdgzFBfyWB3TAtUgUEtC2QMAB05QIBy642xEcckDol7Ma4EyAD5FOVn0dXQwKOtLNTjE/usr02tKpSlFoqshIgQXF5XWWU1jCLMNB9QcKvrN7TQ5vw1RMnEi6onkeV+2YxnlUZWB64Nd5t0EyBrE4EtMW5J5cqIq6igyq8aaBON/9IEea3K/1oem9WvdZuFnjOZObtU6zwBH7y/7h5/jL0Eu59x9cLuxMIXSLpCicV+PfPc4z7+5j0Xk5Sy/XuOY8m3ZYGKBFNUUhvT9bdmtvXYLqdpDhX8uoUqI17pDz0kGVUi6GUdhFKTLkmpWkeoXoZNgQMKoStk8EGXgmug0PtWcz+LaDJSuh3A06iQiHOjG9bLumcbudYWBXGq7Q3rGUVz5DTljYPAai9yXVDGxgJgsPI5t2F5In6ShmbdtulShmu16JqW5885GjOjjX4qJMsO0ECRq581DFKVx0RZwADayGGyvJfiw0mdKF/pNSnRBrNMBuBNbqOa3FNOFN3rvzwfDllzT9LD2ygBgrbVJUpl4BCdLkK4HWAsa6HuKYLGjfxBO9nqoFzqH9FZEevvIhWF+ONEa3tufwiCLuHPuhY60NvgOpoEo3/PAIpISvzIDeAZkdcTS41OPyzCS0iRtiDLdGP8IqzSDAgSVgTM7fgo3dBdMmQWcRvGx1D/v3vwiFGTt2HlceGF0IpQQWVpbCoZgLSHzu6DNEa9OpXQxMveA0E/6G0mdtjJ+l9MesqyzvgwI3expLjQT9hdEJmK0RPxf4MnoREO9aOYwr12HPS1ValZ1jtYw8gIOtEeHtVLYqEJWaVUQyfPT4JWQpi3r9BgoM45UyL+GLx5YUp7JDv3YQMoBXi3moIL9p2oJFzi7R3uN+CRY5/Je1I3Kkex+eOfYEexnELaTNEaJaN83IsUSrEEOM4ojRRqcRM4kGvudkWZJWkMafS2jt1sgzuTcTpJn9pqEBEFiQ0GMc2WfPafQxSuoH0dJ3huOqEMI8XZ4MbwAshON5jgyOCfbP2snuSuU58IB/sVn0jw0JoPkqnzugwaRzK1w7D0eChzzunpF4HgiFvnfjQ925496jLkNP2gmcywtdYNW50AVuBVyC9HNLsoDbcxn9spOKeAF+a9Yqviu5IlCYdUmUyo7pBkR9nLyim6a0goxHrw09t6kbuqhCGzvrQabB88sUuHsRQ3BYKO3F7qNicKusOI8K2gtZyUlBROA1xQLFWN5Rv3zx5Z7vH4gOnl1+b/3cZXf2bIT+TqVcR3JnoLSTPvWYCn/uRiOkZehlyymerZe3A6FQy+gA9C8okTaWWUx/T4eKz3NWW+uFb4d3XrTsQ/odyCNZssd9DUprzMdHzzBkNZowh8/qslXSvG6ZcCzKYP+JyzPkLFRw8iRhSCzJYLT9JSo8bp97imERzQYHYRk5NdmEoFhtgs0eSO9SWUdKVmREiyV0oIUhyIEWLURB9X1IQEdnZErJWW4X8tE2uARRI9oFXHxUE0RKTWJ62is31m994C0Lai2x4EYhGZFhnpesQoZEs6ODYNPRWWaYx869dI5/lbRnkWOIsyzkSyQAPjsCa9gqPBlQaPqV9XMxqsGDVrSsPD2GqFV6j/VFCuBGaSbf4+X3Np67EipAUc+a54k6tXx73K0k1uqXLtWedqkxL9Snhr38wSaIThv+gXuFYC36Jd2WCGq3/p87eIk6p1CugrL/d5wUIdH+NkuQkdnYbTxnmJXmj/FkbFW+WVc7ySRFDKnTsYXhnC3jDB1/Ndg2sVnjbJoYVBKvlrOosDQp9F1us37EZHD2ggfL4a8YD0cgODYCRuH/z+4oQq7jYOtUDUicqoGHUyPYMEKGDhZGCK2KzGJYFgMyj8UCEHsAMLLdYffbgSGPgwIIehhEKZeSRS7WGRDKYyAcjxIeBBEeXSB4BT1GO09HqnnaK+GRH04nOoWoiskrpIoi8ioo0j5O9YxoFK9xqjcrOiCI/xEdM8baD4ksaoW22xUnUe3k9K/TbdccMSBSTUZTkiDryERHuBRLTBGXVc/YSk8eeEA1uTFtzEM27r55ycY3EE/ZmAbmLRvPJXvM/n6Mx0yfa0YV5P7eBZhJBiYoVwbRF3MiXSgkobeUYuHINp2Y1xuclGmJmsPxQxFGUOKSW0PEiEooTDsL51L5gAxmVqITyNfWTuAhlo0T31nScaJMEZkXtBMQAa/IdvdSuA+73Hy/lz7pCfCm84VWIHAUU7C6DFPLkuslGt8cpV+pG98cN7fxtamDJT860vSACvzoQBZtXP7Ejy4i3pt7uoZ0V697yqleNco8ZKPqhixU3ZD7vcHNDu0XQulvrYIG7vQ+xgWGSzldyf0lLHufNzAZUYPKv6X+JniesX5s38rqwP4GbZmcHH72KRaBu/mGHOjQp0DH92Ewq1JgUi+6mnl5dFWL5qXhqistr9Ql9TnTtbznNNV9yBgIpmED80LyDgBNN19uo9bFG/jKIKdbSDLm7tc9iRtxXYh1tVt44K9PlV8vHaCct/g+SPK99M3a8y9C1ltAx/+9bGk5dAr1jpmT/DzKmpPLENaPDkxI1ycKk4O6M7qKarZ0gWLYmNvu5JMA9nCkRMHJi9aMeCBIE2DQuWj534AuDzmQluEqZQfpxWfMJLmuQVxt3nuWd4bEAWCtueOzfU7MpbtOV26Qo+DdOjpd/AhpLwhiHYu8+SB62HZrTHMTlFbfzSNUsjI4IhrAKzpfsDq3FK3tSpZiIJYA311dVdoWD5dJuY+UG+/HmrvYFKruykr66VS7EaJioDuCpShiT710/8ib4DCGNCaATn9bLpJGxAf7ToyDCu1tkp5vIQ9Hoz213UaqZFrROCnZ1+g4IeVX3Th/BVqak13phCMSsFRKiXSh2s0ti4sq0n6TYnh5jxeCViVQFhPshMptmg0qo/rGL5yU6m2f3Nw4d97TaHHtcEdmSezGroZbEEVKE+2gM9NtNaZHKEt9cSUZyp2n+7DEhRwgYQgMZd3oqn797QAIC0waDUAYYqqWnuYPCFuuQOx22p7U75AjchG2o7Tr8Oc4PHkcTdh3Tmh+oXwJj9lJlXTwaS7lmzoyugW+uSNQmI76FqOYOrWh4GxpWHkora0TNSXzM2F1fhgm+DcCcwMqu/o6cB+y8jqCCR+/B3v5jemYjDBM/RvDsBuO4fsKG0nu9PBkYhfTuVHaAK6utyINtR2lRcV8J3YFAhCaHAgVL7HXjqydvuIHRDRpNKVS44EQjfzfXO/TUb+ygKjDx5tyjno8W2Xx6KmNb/76a8650RGWiYCy7JbxKPeteMk7QtEHwtT8mrcvza95/tj8mv9FIwtU/Lc81iUUDIiJyHCYiKyFCW8lTDjwbpi9ApgnIqg8EQHkiQCMJxwoNixcQaGTDnxOesw56aFmhHANXv5/AuJqEdx/K3zz0M3q6hVbOVs614hnRNNlfvPiWYeNDBZJ7UqK2C4K9ZB0uSC0BNDihXzV384hMLugFEVV3R8rfnLLwKO7on53uU53+S53VRWw172/kuL1qu+XdCn6x3TP4yse0wYmlidMAcyKPJ4wYTzrRbGJ4V8gg00uPmofNq02paOuG/Bo6Kw1/p+G/JqoOm/GtjL3zfgW5sB5UBNx4YxtYk6cB/HLbpz/OcaNE55skSOHfuz9n8GNA+7PdsY59NqUVgNCpQvyIOChjrbdw9MV4DOGPLLkJsaU3dkcnBumW7jdm+Cn+iRHtnRhj3U/SShMel7u7yZ6GO/SgVBGHOvr/nSCMo6CgDpzZuPqR2svfKhOWaWMsZEILfogNyIXuWMP5R81S8v+PJaMakWec8+tdLcKB2Li/oztRQzLkY6Cb50UJ0V6+FGQuEc/O49AnPnoLCpoVtx0QiXKvnjF/ExSJQrI9RzPIYbbl/liPH0Zyh9M87caTd7w9otrr/rJ41wAWDlCkg/gATFwQMGkcJEr8hLpTdwqYlcf/8aquIGSFMYlEhI9TNnae9kS8lddM5zenW9uqlsz4cHKiFfCg6MLh/jBau37R0Z+8bYbOdUgbG8efKHuOnHQYREx9ZmT6YxzgPNOgACLEOIswCkR2quzGSCKYQYu3naVNjlDKEQZc1HSC+AlRw2OGhNU1LLHTJyAENPflFyLcwUUIBcwA854q+XulyWlOqUkg1RCGxKckRA8/AFKsU9/RDPsffGFLEH9MCpwssPTdiRHiDGVpFGlw3axJyLnbpMui1XoqJBaAHYNc8rgpKXFpj4B8sFFic+/wIgZztVfxsprrG35G/U1rGCKNNMj/UwaPmEjfYWcsFE7lpyN0rGkbcx7WI1Zkk5CDJnuRiV4aLaL9Q8o6VAH5qaby12qBg+QBA8vVx5swxdPPeKZQQ531LXGtgC9E6rhQisOzIG1775SkKNfgK72sLJxaelCppLTbgXDyvJSDxJnQv5yytt2AWQCJkovt9qZe/hKF5u5ZGrD1dvjDV59CA79QDqMxfAYp7A4BEgN3wEcdMuSZ+VgPp0UBm/sGctn8er6pWMhmp7TJ4S+p+xQcpWXp0LAffWhpzgAv9dQRnaqT4oZYJ8UU5e6FyB2CgAYJBxsHJwjoMAKNFg4KAwdkwVA+zw0xXQB5IvuJiRCZMicOSDDV6mDhtwBa6dvVAatDDxtw/W0/+yHqsSf1kEG0hM8zEBUnG9EUQ6tsD6jUKdl8vmo7hrcaunWrKkpbkZb/jDzbToSD5qJFdONfbiaDvInDafqSWq8+sbwwjFMUnryiyhtK5SvwEQvSF0P2EIxGIjsusDUbRcQJEoPHY+Da8SDnqulxi1mYkoyEwoDkpCQKOtXwaPMcj4XKAO80INYG8mPbgOUw4jgS4GfJa9TOil7AwsxnafN0FsfQO8bH33pe99lPe9yPe4Kve0SLqUz5pK7kjOMvJOk5+lkp8gdqOOdJDlQx5a1O5aA0hR2WfU43c3T65dO6+kE2aRiB5LsirF8FssWZQPvlwh6RQFhfYrqoS5l2XCHCYYg5XI8vkiN5QZsgJMsK2T7K5FYJTlfxu1y3IfJJFwGDzOUst2GFdvAgKRxnHwbTGtQCmsv3JEFBEl+8Whlo6jY7HA9Q12fVq13vEGK3gz58ACfUdIHIMgAKp8D4OAMPqUa+BtXvrv/3GHmRbBVk4s+Ny1ZVkEljDDZruSXA7QDFxJLl0XigkYtZxkxhvhvfIyRqxx9fwkOw0NiHJUEWbePRQJhCwpT9ydLmRXrhAF0+5hRGgubwXwLcR00Pwe3cA8Q70wIlkspfZcJLpxpycPGrFBEw2WMVCJe5GUL4SU3Vrtko3WtZMCgxexaGDUII0rpFIb9ytnhyed02ITrYDc9qR034rplTE4VBu7uyqO43uAu1szwz67oo108E5z/UTLqg8GPmVyNLeLoPCRxZb6kxASorX0NPYQKWKGDrvGGHU+tNEDxmy7AmN1ZVVxZnHYJzqlufGPlzvXR6bhjzDn5b67nad+tHUZ0nZ645TotqPQ0JTWibIPZ8mYuegbnvLqgHfGgImTwWRYsCumY7QmM4Q93+CK/vSaXRCOAxel10dkCc8Z7xwCIjry3cefE2sWPYh500QAGbhB9XTPSgBJ47DFi+nUoGV0m1L8uk2QhwRMHUtcJk0xwkI181XjISOoTZwin4TjhpnxRuefPHNMwlNwxfN8bV2W/EztmQSndwskNOMtoWyRMgP2/1PPKjqhbDUPDToMvlYUWbSbHIQoshHDreCRGgeUW3dJ9fPdM12/mO8HF3iE4H1cGwQVHwU9/620y/FAk9C1lwSkWGXU+LRoh1R+sDZSE4EXqut6lmkCN8JxrVgZji/fF+1iFq01Jm4KNtn3ELIMOwDisGmRQzfjZiv1uVruzeZ3FtctM2wmLrGH7MrItxxiW22NTssLm9oi77ZF9aFYhr1ZInQFJ9doSMQjrCc4dA2o4tLViJIF4tus1JtKIfZQTkqLhtDkGmOASb0PJJbFdzGx5NEvBWwnORKhB5TV4fBSGewTu4HcN9n66Arj/7ID20xHCnoiAtUHqUbxZJCN4k9HuriraLJJRtBnApkOaDmaG3kOnrh+75hCgg38BzTgAExCL80waJhsBZGOftksRqqnDM5MByUwYhplQ9DLhUIsBlhgkzHh4MOOBwUwECWY8FDAUEDTiH4M63Kpq8I9BB7IRq8rPab68xbKtGUKyWMS6iCy6wLcRlS5gjM4Wp3JM24S5SSmYschAJzzNUyuiEfZ3QWGV5rQxRWBKQOanInGn4170j0jKjohYPQsL7Mw/DR7Y0vTB9Mh52Po24UzsmPvhXOzYBno2tr5BOB87lkt2Ff+PcWdk8bl8797wWLb3f7iSe3BOL10AJsKuUUmJh/Ea7hlxSm04UdNdyCQKpplS896mrmaNoJKuZ9rqKdo49ePwpe/UU4ROoEBE15H1H1YS07DYPiGD7u0tMRmxHJmMWo4smyA/ElSTwYMF6BuVNUL7YKAr9RZVEIaLm2ZtO0yfa7AjsSyS5bRNjrY2gCx9EHa22iHcMCOteQ122U9zqsYjLH2v/7jx1+PDT16AGDjZerQO1F12KDBjZwmMBT5O4MhqwehAUVNoMykNFFHdIC8yZd2hx/axWlxTA2xy2IjmjT4QgSg2vtRY5407r9+7+bWpROtTHX3SqXIt3coRCOpX2A0da0Zx6lm5hRSy7awTAoSgQin/LkXQ6e2d/pfm+4Fow5tWo2ftuWPrL1mJlfCkHtmwnrUwt7aQwtz2kxm33nWWqXtLVC4pPLH/RGqTlnQNLEigATaRXKWWTW5pF/kvTNtliUAlkyt6e2pSPt8+7JJ/Msmm1LAqtTP0GlsdK71opazktxSzctQ02ylRCfm9l1niy5mEc9toCiEwYHC9qacXaNPXfyrtqLl+J+gfbqyUZLa5j6Shu3m0HUkfyto7bw4v3xjPQFrAxZ9JnVwvD2MBcaBRBwwoupLclJDIlPKrk7GwkCDGnWYpSOWywe8ECWQTuo8/fBs6TFb0yFruY9pnuV6NpHW3+F3kpL7jSNrbh+/d/MRF0kLpqiInOQ3xB/p4KldRvodO9SLaPuFqaJM1qMXOEfqav1bCGYkFzOiseaAgF0CBgV9ofCVUDp43o9B2L9AFSHG7fIOdd4Ov4AYUAmUHyugzEA4B74nrZ6ETRqrADL7uSFjzDSk3B3Vg7r/7Gphf97UQr2OGjsFFXJiN6RgoK3TloGRMVc5LGkUr6467DItqebqBYCSL7k6w9RlNAKbL63JEczLyHAbk9w+wH8XPAgkgGj+l7RZ+QAwdvQo5u0f54WOiVUZcKKLxUNaRDhPBcjVMwUsf6vhLSO3fSXwAd0KSB0NM5jmBhjXhwG106gPI05htCnPEaIAlXm6Eml9de/9VWGOeAmCVLUZA/pY7UF+rv8X1DOWan6z0LB82dawfNm4hcsgt5FreHaQHYh2Iyexxjm26iJXJJTdAG75Z2BeEQea4wwA5dEMW5Dbn88F9nwNSamt49ML9czeHR1+2cjK4cSlKiOOLRQHRD1Y+QkJVvPWrxwa5T9XwJv57mCQP9v+bnOTcZDx6bFuYkgIk1XyjPe0VAiaUwj1iyq8HjpgVekewj4mVFbMGbI/tpw2IVOzJQ5SMDJN8at4KCWtfv3Zr48hpCAaBk24W2R6zhvl29zjG8Dh2F73WuyocYcMFYmrHCDMQ8UzpRmlzaYQb3n7xvNTqZ2HJV5FwTKF1ZgZrpKzpNoWc6uNcocGz+KdonizrN/MUEn/Lu9lhzgqHEeBgVhNTR8mvRrgFrq8wbAqceZ07ZsMe+J4nr26RcM7SwRfzInzQ6ljgurzQCio+kdsLzi/q5RXxLPfEKUNOazTDB2flzPYG5H575a8VSlX/caAZO80dVe8yV6rOYS50vemqxM2AlTIaeUdPlELNz2QRAqc0H7XWScI1DYmhFqZ5XjmYTtIiZeRgPUv+H9zcYuFz6RTWZDp8ZHj1Kx8EYNkEILqDvPIhDT/2D+Yv/GfWU9EEAhUynCWCkwgoLUxlYLmxUHlJkQceS7+3uUy46JBEKsp5gM7g2qQ6EsFGOJhvt0pTwDJIC6xB2+UqU/duHF07fAK8iralVpJ/t/cQWmjNY1YGNFSEHlQ4muNzx8twtY4qwXwtzqC0AeprfQYwyzEtNZ5jcps7cAmUjd/wkFZhvwOcTADH0Nkg3A3Osrzdp07s9VtQveBVt8WDkadCLO/1J2JSUgODnMHcSNoQKhJim+fb1M4R4+9wNdA7+vrGy1+MORAdTF22adjMZRMGsnI3JTM22bY7I6vWDNrYZtzurcXtzk6c8Dbi9sg8NMvQm3AzarwFa3BSTLZJb62ZoeaNqW3BjNoWLKbKn2o3mcnkFEMwfSaDAogvBsPEbBJvD/CX7gz3qqXujfPYIne2uMfq0d8RWq9H54aHBasw+uTE7gI8KQeUAE5/Y3YUZnqEKR0KnpuUgASFclzikxGc3RPwNuFhmyG2AKY47QP/Y78JO22LYJMhppE0VLPV5FOzlaRTswEqzXoIY+hlFB/siJGBKeGxqne80vVwYAQLhLVXpA9ZfV7TOjUr+8a7wi7xrrArzHtFGdp2lBVA9ZlpMa+/MLqD1MvTD9Fi1C7r8BYG6JsSIDu4VDvJiILxasUpFBHvkngoiPdYk0ByE8gHUiPRvRwPgpXl47TtmrFUnVGR2ozvu59BkpoErc9HSBHws6DBYaHP1iUkrDaIMhKO3IxSEtbcdTkJq3ejpIQ1bLHH9V9+Nz4rIUfz791LT5V7/+V3IS0h4L2Usa/mX8KtHnOC4V1CiyXHu3LepY44uPlRyVhYmj+WnsBtZQxu/7OknOtx/AedibqJMhWTjEP0x7W/rL1tyIB65LMO3I/iAL3eSsN13yvFxXCPlrWzfwAPgRX5MpgenLugwANW6EvBxMBZnxV7/wBmivPN2rhNBWshpYy1P53AU3dz5vhfO/bm2qvn1ffPah70KkFSTYDc5ooZhH7ZgYgVqxNMme0OErdxFzUcIdZ8+RDmwyRpl+CD9dPfMEmdpKV+E06FQbRh2iaPGshLCPqlS4twwqM9uCDVqakhSOl5uEgtV8r+HDWbsUIeaCWAj8Fo04mXO8M77zJlR/NpI/W0df80d7pF3sbiasP1SpmCLnFvvK+YYwgCzBHt/x3CkIGEYnogoQTpqlXavgbp2hSvADbJqYxemT3FufOhxPfpFXJJYrDm/Q+vbVy5NDx10QgAAuBC4aH/lZyvRLe5c9A9s75fqGMRej35utjNlHq/w0bHoSyNF1UqefXlbcOpqWh57eNn0fjYN+bJhCpZtMOSg9mD2J2bZMTxots4f3j9L+/qotNqAHTyNS9aCacw0f7gItSkho+PvLLKATXVq2CU57AUrHJAl7LPKFlCPHeY5m+7yiHOxa9yCHT5lemhsR6RlMxzSlErAC1hKpOEAt7YAIdLUE8Udii1GIhrhMFushl8ECBIY3+TA1IcJRJLGZ6UCuMD2XRHdof464Vgn4bFL4TPtwevj3aFlLR+wz10USB9NdDxEY5kR0YmRsarm8E2YD3JhhECbfSWadgkQnF0zcaRkwttlO8UNwnHwKCMxUIX+ubISU5EC/9Z0B0wSKG09tpzugMGJQSQxFTc/QQXa2gT/9zhdg6eDP1JkCf1VrMcsPoarN8+7ZnTmoAdqP4mPp6IUXj0fevSwAAkhASQYgarCeFKwQ40lhdU5lxDlgzG8mJMUabjy6SWpIbzwgxCLRcN50160CWpRbC/n1JedvllidIHKyFxFVghNRmvFKRgawS612NpAL4Y7sLfC/Cj22/2+Wzh4CtQtox05Z5WicA+ATnqYfST3927c85OosP0gw8uiR4EcbXcpw9Fuk3a8otuFzlHmZxFVKvdY8/fXebOzcdFYWVy4o5+QtEI/V17P/zkGjFoHs3LDtq923fW3rIjeu5x8StzTUxY+c3Ncj7UNZEcZe5KT1IQgpp3tDhPGZOynPW8qMhMBxJLXpLTkkkjAQ4r5WCQ2rRKKOqoNLkNa2X9/HEDC5I7H/WILkAt1wLrcjU1X5S2RLURWtKlxELsLbyeiZK+fZUpctQxVLyTBA4dLNnRzSgzejPTLA94JpGTXsEihLZQVBOOX6ygw4VzUKWLiMpBzDQkqTqeW8aDIwC2Oak5Zs+4yTZVAsUPsXRinMgi59oYbSqaw0Ib23X1sH4HQr/gm5Wd1CMsNVftmOe3TIPtiUs6HHQc8R50m+uggkikffs/gAGW+FR1OIZenKqO+mfvFCaqg/7FNfVr9I/RdEJDIquJhPme+gsFnmYq0DvY3yoBbGC+thrgVtHyDtQOvU/QjjXL/pKCi2GxHGzwN3P+oETtSW1hDk2EZMkYmvj8NY1OfGB0Gp/x4ZNuLjiNFhYiokCF1xbsJDABMe/aGsfFuyJJm8y3HA47bY95BAURuBu+9dzPel7OGnT1aQyNg/nEp2uPej+2+WCmQ7AbpijAjawFstfBPyVykW4FgD4CzR8Ck2N8HIHjPQxa9xBS3SMQdY9Dp4ZMPSzdYUByh8HN+JqHdQ7TqdYCTJjyUfUCtdZTDKEmR7Cax2m/MYgZRTAxfEHW21ovQaAF6d0FSCRlwCLZHqEUAyi/WHlHeruitLkkLqnPWdWqpm9nvZY2BV1RcpNBw81Eqm3Sa7XJWHGa0hQfj6gMp1HGqpFYgzj1YQFY5KI1hdCLVIFpgV9bQpt0fmwxFkmvR5BbKm4iQRN5hqR0p5jStb6hapOKd2jkdsU/VHM/8hBV71d8RDUMspfonx/oJeLHIBsffZN7/zn4iUCOzSdzie0fgyKanwcnKJgKuouMztEmHIHUBLRQJQ2+4hYGEuQhaOw8Rou92bH0Qs9fuv/2dyG3EFMRBLGEe0RPx9RoR4hu0F5sjqcb4PArGLOYSR/ifsGVRWf0il4bc8NkFEec4EFSCXkuUK1hWMWBUPScuMAIaql7DiXF5zDw08LM+KeFmUFpPbrAI13p5Hl7IQSaUXoB0p8SsfX1sfvvXLdBSt/VQaa4MdZPOiNDVGL8gB8j0x0Zo+PAj5LZ8KNsYS6XHM+k6EBBQMMuI1+z0cJBtHYYbLfrEwvjxqKkApHBvv/22rvX3RtVEtXxelLVIQvF8AjEf/OQifrIiD0f0ZCJGTdkqGQJqT3mYZu/l3DkEmQHxqOJ58gK7fSLOUmHAoGPHLAAQr09l3YlPgGiTRgTF6mcGkf32Y2DjVAXF6XN+7fvn7nNVXF/Y7oSNccULeM9VKDPlySdM5Wfh6WVL1VJ5MvIAxOAnemWJ8CLiIwZCXi++s7a1+9CNLangKdZcQN4DKVeSk5gyBU9ShVMcXzSUUdZ0cJyIvVsyEiZD8uKMvh4HrIuYsgRTSUKrpUeBzcJPTD/5zO6xLS6ObdJPB3cCZvHnVyAhEcILNz/+MTwJJRmu/xb0dE3R3SswPtyTkXKIcMwVBCkfiHxeZ9gGZiJ4OrgXG3gq6TUd3LG4v6Z82sfvWjHLMBJiXkoMJvLcn8RM/vB/DcBidGOIIRI4N4ZlbTOqOw0OknQUJslbZj2IQ00Z8fLlvvsQ0kwIHqJXzMlrAEZQOx0uK4b7tcqU7QR9DGzpOUaE6knKaYhKBqW7IPrPd45lRKT6H3a9BRbwLihh2nZqaRejj6bZZYCMLNoYlMZTpIFnQ4nhzlL0YqFOd6Gn5wcvmhet/FsjFIXarC+MaA44e36B5GUo7lMUI/mVgh2Ub9mtQPHbeXFMQMHIxAfqx867Lw+K9ZMKx77Sxfd2KWgp2dBy3oia468kaMCRlznc7skZKBgjBqaMnimqGU+Ewp9QpVFHrfB53aAEpQ5ePlhqjsUQ8u13JvB+E3ZH4dPaVV3QPQQWHBQzhVrfXc8jtVlH52Vekex/95bWHOZCr3bi1BuRvSucoPe3lgLZe3BuSZX7qT6omgNyPPoKguaGJYDMoecYYzvqEYOfEbqifj06glKeiNQJx7wo9NDkHgZrEq5TtsMhFyr7QGAk/0DmwKN1G5KXhwI3KSjzwjcMW31m2STv3v8/hefQFHkte9reSjHMQGAvk+iqvoAanSJLCkfxggygVNijAAXa1dPP3gBtfB9WYlV8Mb5RUQikw8ocslV+HoXcdtpNc14KcnLkmDskdWE/8VMf/F62vjx4v9160k4rawo4NStKNjvKuZHpxBTnM0/cAohMRiGH0Zz6D9IMHJz9K2OzOICR0LUTOPw5WOj08jsjSB+sFYGl7FMwMgsOr4eNonE4dhJjBn1s8iMulkEFQwArYNh9C3Is4N1YxyvJsq5BLpnNshyLJTe9OypJJeHRl4xHXpkEz+oswtQOl1Feh0vhfAAFx0bRh2vOxakMb+/fOHBTGgSaeJB42wJ3DOgTXs4VPRctJekGBrdpAAMuUnbdNRCHE7UgCI2uAU42uRx9xgZHPJIRvEb+Orm9Tjf2rtv3H/nazvRN8JRy0Um1zHVwowBJZ3qGmUIj7HDGcGdoxxJYLJnSKaIGdIpIgS2mXes2POvyR0Re9EhfpqWHuhnLtHTX9CribYFhxTaoH0Mjl9hR+JPJ0pGXD+doK32H/4KiOvejau1ROFIPRvpniYWpch5Wj3RlJt6khhWFBPVemZIdPj9Z7LDhEEgIuab8tmSBdmUL1PzJ+AKWymm2B2GWgCKhEYG+cufDm987U1V6lqMVOpajdOmVbxZAVUjdmnoVf0M1CFZpWN8x+B4mPCuhmPOpTFbcWdsd54Mcx+ovdue61McTIHR3eKA1mslosnlpyMb3Szz2GDeGpnIW80qnhUreDY2e83YpV4WOPit9h+1HM1olJPZaIxRGlD0zcqLY+ONMr8OvpBrbLbhV4WexILikOGfHhWgnopMNrPWggm1W22n3Wox7TZTKbaPzDSSzaWcLBkJq+U4xxrr5eEmyy5nPpnlpAwi6Ifs3jmm7JPCymgSsDHbn+NsPWYcMA3Jf4cWQdnQDARqF5hNwBQEfkckGHtXSRgKj4n0sHSpEjEAbuA7bDOCxOsfsILFikl2aU6CDsNsc5Znkn4hIFXDp+LAKMlHoWAQJrJFaZMVBOp9j0C7aaslCzVgPoN6FSS11b4+RU+zHBDcomLWwmyEjJ6sQCEDQBG62GoJ2xym4Jqp8HkjmpBYDgcXnqziA0MFmkStTRYy+qVhIuiErAJgmnDUrJOcOY1b5qiCvfyDwxvWyulZU7FOm8HXhXrHKzCMgS0mTWUVOaumGQ6SL5olSwinnUwxVRXEk04vzARdMBN0wJ+d6Depr3J5liTyLMtikk6xYDfp+zBvOk/Msw/2p4dGYzzqrsEYn3rUotarHlqM8atHrLJn/fc/z7Mub3/v74NvPUFPNcYpYHBLJvGInCmMdk5oEwfylWWIJK1yeQ9cNBjMgkktUsqnTcnDcPGBjMgpUgrFNPQVMonR5tPdN/srarGf/G795mchkxgnK4StQ5JQ8K0NbnZxew9zMU9U+KF4MpCh8PXBTh9cHFzgPBTEWhqexwR3LOfmsLHnEHd+NOVR4I2DwoQ3iQjTw6bSJ8wU5efyU0czt0O+kW4GL8IYhHniM7Kef4ze5+MHkG1a23P3mGGKus8wXQhP8GRlduHDw016ihqi00YLcsD07GKD95Z/Or1EA+LB4Bbzu5dhSP+/Ho/spNp4wn4qfEsQXkwxMg8cDVBf4uOvDxpCaGWMQ0jejHs+kaPLlQXPYX+8mOQcF5p34T1ATMm979/U9/B/O99hvplvt3/NPOIZn8xFwivruHvdtGD7hzU3FwjA5VWO+/CW+8aVV2AD1Vnu9mBna7Urjr6LfsX3p120sJHjYGGm44QR+I0wvoBMk7TcjOff0lAPEHawC4ozkJcBd+UUgGIcvI9OXH4e9ifOuec5xReu99Avc4Qn8iiq0SoyAmdwLG/4yctWlzHwh0eQwRo9tyfmC6063AoBM4uqhHieRCTGXJAYdAxocCxR1shYNy0+DjKiW42F9JR98GNM3oU+Eg+I1nQrHpk4/K7uxvs+YkLuRuguetnYq71s6DNeTolXO3hAjwuNjdE7qS9RNqJ24LUv6M0xuoeBntc88H+ueU7a5/5HL6y9emdEOToqKCFAhPDxqnou/R5RlUnbLKphsBttHMVM6l6YcanbYTp5nDM7vA1T1dWlEWbLNxd2NEl2eJfERk5o3pLcgmw6+aUlucXwGcx7iQtaOpftXgrf5vjiJLxD2fClmBtwkYKjYDG8QyoRklJ8Lp395P0H4Y0t1EZgiQOHmR9eV208+MufP3+fMvhNlLx9XuISMSPjBAeCkOSUrzPtU05ch1Go9gEYp0vybd5/58O1E2/ot8nUdlapbOOeOeYMgkkldyF9E9YhfxLc368SjUpfL8f2WMqqw+/CW7Jg1Mf6iEO3zDH3yRx3imyedEx05Eav+kMRdS31mjsFgZWJuJaMnIKAskTnLoe0W/zIpCPDFlH4O/xFBrl1yfGM3J86U/HTpi9XGYdSNwvg7cMM31zvFQPk9BKeeiKDrA3Z5xbRjIQPlnKgQoohSQINGaXIL/MhZKyDarAVQgWvhIjQKsrwRTSsQZjsqZLUaFBHk4NCn/V01QvJZNULiUGmZaOa/TusspDdD/+itm0fkTzSQbvhkofvT8GipSzgLiF2n5e4zwI+fP28ywLeSbn+uvQNHI3lZAwLEFABfZQUkhZ4oGAyOWBNfgdjBBfR50eYi1jz/LaGlwlutrtYaKvdVY836wGmkcfqAlkNjA9Y0mhqngwiSguiNq/niA7eOU6n7RzRZDvrVFhkcZq2Ur8GGRtCdFIOdPcX0PETaHKaRW2a1Zsso1aKN1BqUH6A+JwXi+/BzmZZhfa7OH1EeFZAfZURazJbg+E9fPfve9LcCuG3+7NyJ4LKHic3sxYGghgw5LwQctVgIfvKQ9PM2ioI3B2BTwOej6MrIqT3QJj3qy4xyc1koChCROxH7bC/jaDIJk8LHK59MhUsCFpoScxvBDJihLHtAQo/FXXv9bxT8o84r5HydZr30TShV4I1GnBXrJN2RUpol9c+u5zWMYUzKthn62X6U3US/Sknx3dGKsSURwWNx24p/mAr36cXwCYHa7yR7glEvChFq77I2ibBE1l/O/ghx91XL2Tt/eCDHMcgeyB/N84D6SQV1WeCip97f+f8j6BGBl/AuZSOGMqYFEzdP5jdIV0o+nA8BcP5M/QsZ5tkp0VuiXXtH1uhW9hjxZ0kEubSPvVsgHhYO/ypuTUcL7yVZwxwbjsCRYE0SgeRatwcHeHguwz0BQcYWalYx2S1Yh14zKCYF2iTuU4yOgcw7FxvYioIPwvwZB49GM+DIHeuNlIzEV2O4dOZuP/2eZ0J0Ceh53iMET9YagZvcZbxPRWWaifHMeVnh3gJ0wO86PRQAmKpVoBRaTOSsg1O0qCXkTOcBzuc29KmdtfVFV/CaeOcOrrBgkf+KDkKG91wfgGSo6jFHVHFCIym5YrzhCGpTUtO6DrKkFVd2ldIgzYsno2Ja5QPUbfYFIog2IfJhJMOoOzCkknQxVTKhM9j0InajxI4sCKp3aVCrJqT4WGpGyP+njcxTMbOQt9/42j1IDQ9IxmvQihDxMsmF8RQ4WIkgkE4kPiFQF9gIjNgdkOBGdvBoUDrCK0WmA2O9e2nuGuJx/pIGMtKw8/U+UM5djsReAJt4ISGdYH5wrv4GjO+AcBVXB0rDaqrAGdFMBzjLK7I41egtsLa29+uvSaOBs9Rz01MhZ2WsBNHelT56fl58gz1XBK6wJjMFTOlc1ViP10+VSsn8jsQG7TUWYFLbQYC3AbzcsKJTLoAv6kFlNN+VstrLq5K0kvKggL76XQ055Vv199+GTKh3Lt1OKYn+VcdNZeBNVDUFKxGEnQBZ2GtENX6k0TQMrHm2GePEyZgnv9+3pIwb7pcypH4vO0bgrZfokowabpNinL0yDLuSTpJxg7rb59Zf+sHrGUgOeiJWspYtmNjkc5lHNq3jcG61gFQrzqAbHCNqpw+LZ0KagDAP7hBgXvwihC/YZvBNUqMVUDIB54exorf6IijY7c35zHMv+SC0lCy86cTbOUf3zj6BhyEuv/ya8M3v3AZF/ENYR63SmV3riresWLWdEPqBWDznVI2rtt38we8OvJSWE0pE83/tTnnsGz1L6TZ4hKiNzjbyyVlVvHV7eGM+/N2hwSWOhhWkmLz/6IcoF07C7+EcnLJjMljL6+9elxXvieKvnB2n1UJs7w0Z9sI9VLjDOlx4yGIysAFy0pmQmVliqasZwDPGDZG6EL6P4zDRDs5JkjNY3IrnExBJPMXrw1fe2uU2rYKqW0REU1L0UqpjQQthK45hk361hxN1DdimyDt+VpF0vPFPJbwsPdHlzVzJqbQxTPC+8wz9OGnax8f1nfHfcir2+ZJ2WjclTKMR8hI/vFARcPyiIoOyWxPTMHoxxXjl2X8jyxPfaRN0fF+lIJj4A1SVJiOFOsnzBGCsVX6NhYltqSgjodpTzttc9kcXSKe8nQNvfzJmJqsRiJmmrslMLAQl1KPUWPwJLkWUvdL4GFR3bGnJBu2Yw8IMcTYaw9oRRFunWaAyAg1QJMAS4uG7cfL72gHnmjZDjzSUu82nPjpQOw+lqUjHCi2NB36IetSat3YeeKksAck2bCY1sAMWNaJJcO4SOLM2dcff7n2yidmYlcJF/2mBsNUSUPIHQcvRqQLjE7a4ghDQs1tEWE4ar5qhNeO3Y7WC30be0YX68gi3ROvlVmJZ8OqHHSanqA15NgbvnbLLA9HIwwsImSD0rZ+REZOhuTo6aCYoA4KMA+AAYhJ4o0KCMbF0ie0EXKY4rj0dps9EU2+T7tllODgjX4pW3myN7h27DD6ePSkrnUQbbt4Om7DxVGTVSn0dE06crwohRouylovphmQYiuAGUjVZTKxCLc663SrtwzNKKxahBORyTURWVgT3sZ7OjKlzIoKQJ6tkMh6eloB+1K46SyWmchSMSMlsg28bTHt8f/IDYX6hvJjIJ0yLB+Dn2ekUssojB8H3w0ge7Q665HqrMOnswGZzo5AUkOjAg6nDINOCSycYkA4EyNBA4HiNaKChi2J7HQ/tIIh/yLY9ecK1vMYL4CeXTHQ2RUDm12KYyL0YshFTv6XHGtbrkCSAM7hBCfwZhhV7PZowYCCKe6tqp3jPwwFbI1Us2nlquhJnZ85Ej3huhM+Y0WdKkRThuKBDU4PXdk86fEN5zYxTWRaKNYEWyPhP+0E/laR8judeDfBLoun19f1A/xP2dh26JCmIjlqEtSLt8kg0yaDHJtU+TUZSS6TWqM+R6an0rXibazeND/jyA3zMNbcEd9i9Y55FWtYYH/iP43xJ/JrhyQBi729e3vJ3n8KrkTavJrrpBwyTr4PDESg9ClzLJExopQz3VPVziU6EGJ34+cxryS65LGWVzZHAa3pQgvOzwPo3EccQ7Q3Fk+nNA45hOtSymFI3AsYdIH3g3Dyz306vPXKxp2XYUdIU7xEbFpAkVwnN77wOVPH1ozn5I8V2mB8rgaq30j8Ou/XowennZSqHIvpyt4B3pMSkRNhl9+eMi2ZYAw+bwwc1AgFPMPzJLnkOdJaFeb7NzF0R80WHcpo9JAbvN+KkJeXWr1J25jgJIJy+iuTTeh9UdyQENe4IcjVDnlaOxhcyrvbkEoatmCoAAh7djF1CoTGg8cJMkGn/T30RYEcxGeAzEqbS9Sc72JlT8g8B6cFKPj9xeGZH+9//NdRMsuhHIcntsymVA+SLgNKbnOREqGMhJetNkVvEZLNzDeMC4rK6bE+PTLHafYbgSOpVbF+8tLG0S+YL61YQbWdlAqXPcHppIHT5Z5c/q/D7ypMyjVopfIghn3voVTH0ZNhjigPupui++/6Kapw4WYp7u6BEyUP181W3Eu3ds6Mw2jKmE+dsr4m97cisdesICxWtFyiY6aIj/7GdVjZRnod8i6YjSSFa7lSbZcBtlz01YyjZpxulAhQGWw0yHZ5SlFwoBAMwYEFH/seDVss9KT52dGYRTnvzQ/hUVuNVZRnMKOudTQ412IHWhylePs2+NAcI3Tse9IOe0v2Rc5Q3krtknbG8ye92CF2SNhWcIWEC/DJ97QINl6VItgrIOa5eOJBziIqDriNK1eGt7614DTOuJRrd5KBKfRJK6mtTXgjKcHftKq2eQJhHRkZXj8K9EAxsP8wwT/FuzChv9WFSD9ScyCepzDFIyDKbQBH1i9ZWg3pFvelMz6JZZ1zFrcp67/aBr1KeoYxIiRFLpiQFrmgg3lcJyGnI5XzGUMuvC51YjDAF68PLrCIoCdo5yqANrxIrfc3eRkgsFolk1eLg7z4OVq8H35apYveII4PCCSLHrwxd2rQEU1DY2qrJwYDQTkyyAT1yCCdnykgiEPcF7KdjoUdwRgGiE4oAaNoORgP/c3ilMJakPGT8+ZsW6HHcWcGg3tlD569UzDrUdQd+qguH3N78p4lBC8KAio86eXABsGUpNR61MzA4gIY74tizDoOvuaEZEQckIlldFuANGO6xVbK7xLdYmlBWeV4pwvSvC1BdkcqUp1LCVJouwDVG6TiwCk+Fwh5AU8TCPjgxMa514Yn3/rtCMkWHhHSLbxACGqNLUlOACVGK1h8UozbjRimFOC6akpNF3AXA5r+drzfsy2YO6fWjtl55N+SoH6pRNC+VAcNwSAHjQFuxKwDIWOd6Tpghfdp+VgT3wMIwn3w/foe9GtisAXalMQ/xaAi2EI7BTPcQgk7NuzXj70GoGv93VvD41ctU18dk7IzO5ZD29CtZdB2div80aKocMcrwxjTxTHCVY7SjsISXSx9xBonFgrKUyI+Yg4LNBtcFG8vWQgM+mhekPH7HZs5C6jhyY9lAo9efQCfaSicNo7P4Lkbw2BBVZ54KY5wKQ69KpPqqVQu1a8Xw/QK6FDy9bADDLy5pOaMhOH70FVgJMIdMmEBdwQzwxk60TxFfsDAPLc0ymbQyEpSiwapqaMdc8Q7qwRRxUiUOyGL6OgD49TquQcDp5bymUCFBbcjrUghE4aJVTETi9QwEzOR4jCwaGGiQlq4zqn5M+xVufpIlqoZqf+dlqEZhbGpNqVZL9HImgpGxs5gAE55y8+MvhFzRqpQBvujarJMV6ycaWctmaGkeeHF2OjR9zLFaeDbdNIcs9pUDRCzBeTxRNB3GuA3XeQsq0kVfxv2lqJLgpMDQI5gsQfcBoINp+5h5Dn6j0efBjxj9DfjYN+Mw3kzAeHNeGxnsK4KoFhiwoH9pn0wDkZRRZHB9UISwQYkheVTc72MXw1U8WVANetRlAEop/q3mMLfEhT8VtXrdNEgi8GV3xo6GGoYo40n6/XwZK3y3V1RultGFK5XtrpT0JOSE/IvKSEp2j6qCr1+8SxXlJ3z2EmcqvLje/J8sKsjVym5R2XjtkgqmkAc9Zfi6iuyiTEO05G75jEdvWMu07pb4jMduWVO0zo+2Gv6j2O8pvxEEtym/+iyq4JfWwp66FlHyUpMW7S0BGmPWndWgVjeAwnblk1VFOVgf4LPck4KAEqi4nN01Fshuu2vvv6OGgSSGc8z4JBNhbzCGUfeYxjPgaCXEQ4UvigHtteKYmKJ4/fQ6sJ6ROew+AZHFUEaFMionXCWDMpKYrd490yerLmNWw50Vw+zURUju49mKVfrGFxAYUbuxNsvQqrpjesfb1z/sModf7TNNokS6TyU4Wpao4K39/MdlL2dUpQwI7tIbJML6Wyo0AGBh0RUFQcVbUY52MbjcPBOwPqaYk2CtzbJHXotcI91E9CEuEdkgM68yiPUEB1f8zQF6FqSO1RFh+qMHQD1xcd09MTCiReHx47fu3N54+MX63naWcsNlEOhHRXYHB1cArVNORRpdVTYkGPAgQFN+kyE1WMMEweQYnBtkeYdZCL4AGA2ljr0dWBJXpSVkKKCkl5xsR9I37GTa9SBEwZzqGgJkISKnPG+QyZdQArdAjMgghuSuIKzZ5OS+wOO9J7fjyu2FNNq7eid4eWP1o59aTunzBAeG08JFW6TXMHIDQYkwGxQuBrmmh5ccBUfmRE8JZ7iC2lJMCBxg0G9cCrUkqkxH7BkVo2Hez+edJle8IxWYuFezWwZnBMIgSnQa1lPkgH+4TvhGJlckCAvxBK44amJvl45h/udVlA3UOqQjNenOYe29S4VkfWuVESmXP5CgFP5c/cj3/5O/1UVFpYQf+S0nuijCuupx9nBzlWXE6RwDcvJU/KWZoXiWTqsODFCV6yTCmU1UxxxjZ8h2rrzQmluGoCrB+dwz1QlPGczhIJN5PVfhVzAErGDcQWUCBPSsdA2GIB4OQ+K6QshLhdiZ2Fp7SZM06eydoUFM1+9DmmpNJjZ0T7iaW6t0PHdb4+6FX8odxv8oRl8m+Qi97nycTb76ufAarWAXzjxkDan2s/WHi7neBWP4Ehs/JdYhRfTVxN4uv/y62uv/HD/8OEKVfBfCT7Fqm6oHeD7Z2g60kaJ8H2joKU0mYRW04Qd4s2MO/MQ4mfX0uCEDBdpSOx9DBcxb0ouQRz0IV8MfiT4kmFE6keqUpxvSAqeEbLz6A+dqaO96J5pSGc+OE4Z0DBAYkA/cCg2q7gVhXpAuhamRm8mg/6s3Q2C/5r+FYSSS//q+nPWT3w6Anob6UuLPnNnMjtQVbVA14QOEBZPQRUfdS6qDfbnaH9KlseLLX8McuPyR3oMknc35EmO0gNWpWcfp6edc5gedR5C9AIF2T4hAiGpjuoIz6PFRTll4QblpY9TFqEHFkSiLniwISzxHPo0mKcD/J6BpZBAoo6fmfG88ASPZ4UfjljZXeEjLDhgxGa+vdQ3nY4xKNQhHzCb6+dBrXPMMvMjt/OKRsegFHucWJE+iKMtkmFrX0OL3h7pc1asixQK9fZ1KGE0PPkaMFfPWdjLqWHNbf2Mcub3gWK+EHMcEGk3wpoexTDOZM6g/morWwY1nDVG3iNPDcCaslH3Jndx+VZ9fMz7dPO3gHHrdfMHf7aqk3f8Lzp5oyz6OcCwCrs/ZhYfyOXIdAqbtdNJnMZzCYzqXKaoQlEcqbUDVwbXF+OYy9pW+aLZN5AcDpNMfjlnps39z14aXr6tdg23BniI7gXEsqRXmZL4QA0bcluMWc2wpHIZqAVA6AgKImR6hAhrU1uqabfD2XNbzIjbYnbbllFzzRtqMX7aNdb48TZXZF+ZXfWQnsx0kBJI85AoD8HWttheMFNhjJ3A529omvV7nRxvFWz3psCTHngb5ha2P0dcO2sIdzZg3/iiA7s1SPfB82cAc1sEKw1S/jqYzuBchKqmOKOxeDujq4Sgphx6MtwkFiLkfpytd5YqVpmMkIiBEGdhmo8pwiAeM2yuYgaDC5LZUAUZuXiD9Ku5ITWzRX+b7n7sflTjmbKr6pNnqjpkskZtbI+UxVStivDaoVbuPlNVB5PjROv2SJjOjopQLz1NqJkYkz9y/2+QUiagRn151HiMJ69yz/x41evmxRu9IT68yg3z4I1SZ//dP4zx35EgDt67f4hqIz0yhJRfAUTioRlBSxLEdPNzRG2aIkQeiE6ABpAG5ta8JJgqKTJbm4OAkPox4BTrUaVhvhMMA0dZLX8ibeeDNPc5fMxk0kM2c4yNaFENCgL14kbQPOgJexmg5ngByq3Lp/pDKnTxQlgXdJuyofO8NFKstAYp8sB3MN/Qcjdnm1RqHnPSaVXdk+/f+/4VzYZu3F2oYw2DKCsMheFQWSXHi7ABIWuOA7C+HBOcaYo5YAWUL3az1T6e68N8mX9m7dODJS3bB1CuLGtnPboBlcZALmJT8Clw2/24ybWUL/JJC+4gW+WxIs2v6cVcOrV+6bv10+drSPY1lCMmatv0nibEckyOEpW9eyUqedCIpG7Zl3gIsg0LKQyS81w3R8eI+Wnm+k03SEjO3e71/QgHN2gjpxlG+OJ39z85ZSP05HSAMcEwPk8PnSuy9+qJylE1JSojJJI2QtBCy5jwp6SI205I7kZGLB7bzPFG6esohYdS2mZkwMofXsmitccNKHV2EZLr70MHxJyVAnr7+vC1F827Ip3WmUjCDPNSQfnKzMMsJGGpAvFz2YZRdA8MqR6jerIF1YHJzduYQAbughJfQzLjjqtiyiVlrTm7HOmgVtZyaavoiDeqTvNL3P/4w+HZ54LJ08yxCA5i/26yD7LDQZI2SQQQaHcHl1uc0r7Eo5dcQwnTtxd9TGdODnGMq4bk5fCR78u4AkO2mZiBHNP8gOMFNdghY+b+YamrtZAKRKGE48UyufDC1RWM7+SdWfiIqJDhQVrblAr9+FvDT966f/iIyqsO5eNsYT3Gpqb3pozlVI0D7SGtPrpsgaH6GBy4EU8PnVEH84mOEgWquEvaMqrrz91QR0ra1gwXbQm5SDubAT3um6hwgF6IEKqBJRchk+lEhZ+8DVEAyZL0AxDw5gqdkKKqID307+BuVqexJDVdcXVhsgEoV0tQhs4ww5qHMqpHXx9+f7nKZW5Z0hxjdER0WWtbOGZ0mRl5WWRGVjUcUbQcBz3KSUSuwiU9G7lCUY0Shk97XLxxgE3E/QISlTe7sK06X2hL/ELI3nn9s/Vbls7BKMnrQwCZtVrsuQwRpIGctDNKuH+1v5yokFLPFtEKpTmIVcihuccGhPKSs8rxMPgXsd9rSGkYMpqxqARGSLZpBf0FykqsffBpNASsJTMjYRDNZF6zxekQwlVJf1szhEBJXwtRslg+MLaA0XhHEoL4GSP48Cp477gN2qxuSBapnY+I9iNtpyPsRrKRplZ7IK2nXB3dsA0b0bW0UUYz2oV1uyu6B8s0dQ8WFrLEpgOqvkXLCeOySk5KNSf3IGFim7cdVqQUJceAH+Stcyo+eOTN4evXhlc/kCiSnLuhiqtk3N2Cz6MLfroJzTqQzpGRBmhnAcs6lXyMD7dsrHvetOGuQ5ko8L2UnA6V6rFjoRG3LLiGfA+ltFQ3V4lGeeWp4o/elVUCuF3qRdGziRdsTc68iZVqV028AQTDWIdXz6iEG8MXwMJUasWPcIbV0Ou5QtjIT40wBugQCgrsrmGNj53xoUVjDw40bEil55QlPiilv4szZfL8NCkNZMiViTWOapq3uFgTHf22hJmY7PDul/1eyJh5/NTaifOaMfMPHIxj9OE49QIJuD80OBFd4IDjX/7AGCI80MUHqGyvPqBcrHQnYhY0gp44CJgGJNqS7XFA+sZEBkmEG5Sco6A2id3FNZA3yk09Evg03fT6VUDhJD93QwVURGKbm1h2/9CrVbkarS7uU2Up9Wm+6mwJYrQwMja3oOk+RktEyW4gzRxcanOw9KQ2kYwPJOuQjKBOcESefF9RJzXk+CjtVs6Xc5/u1sE02xP1JwcuuUM6c1l7LtrZhbvMHqw6iOtbGUIMpqJZiWKJ0GcGKL1Q91dJ88w5u/QSzz3i83At5Q9LfsYWVo155U2cLcGsmfHWzKSzYsyC8fbE7mBGTDrTIVgLk85KMAthFJM/EwPx2VrsvT3G2zMR0DaIXYG6ooorCJed49hG0KxqbMKxUxGANegaA6qZCEodjvATnVtIDiZyjNugpIHIKjZDl3Zbgr9qgOPWkd4ZlgEknHGYzODYCBYbQUi8dxujsZkYiM3E0MhQ0a/WuYEWwysOMTxpSGE2wINJRQXPVsGAhwFyNpk1sQcAs+y3TyJtb2p+jM4bUcEMHnp9bdEe0bazo6rMK7Dgv1Z1YB5Q1Rrmx65pkboWqiJMO0QGkYhm767hJFMeP8RtyU0zKstNjEcyXATzDhGuO8JPk6kmTmsCENWk3DUuBrGmQQhDrLsZIhHr72owYs3dEI9Yzxa7NP9+XEiimcfBr/n3wa8JcrHs4ySvQr5PygWJy7IpGd6yvmTdw2b0LprSjH6m+gsDLA5RVArB7dIyEdw/fRjCU4ZXIVz6pMnWFPPQA1k5sgjhwVDyHahOco4GdCX0CLHQ3xA6SqXY4KMIZCia7nPuXbUTjoPrNkvhy8h7A/cB64u7hrl3bhr43OaxJvSiIZrrNzZe+cp7aR6ba+ubmeaetfgpMsVRAqCOuylsqbQsLklu63EJuFu6OCTolOdDbdAba98eDQEAbTxLWpKwKlPltxQavOuDnYNfkApbYVwvERDGc6yrF4jgq/zyHabBBDgEEUH3F1OUtfZzTI5O6SC7nG+BW9CGLu0sLUmmR6yGrC46TP2KBUjO0EG545fXTn+7fuvdCgW3Ne/ImBnqCYWWgVzYNQ4UNViBKIY0iCAk5zkJo9vNFiu3soFtxm+FLmwO5st8HDoQziktCB4g0JxVn56HMwQVwnA6OetsrZAEYwW+ZDq1rSRDu0Ar7ZfldERJPhOmZAkvIVIJa61QJWaNZcwwS01HjHvWb7nUEoVlBGw0LRSUa4mi9FlK0z+xqoNQOLKx2b8rWVTuv/EV2Nng49VEKkwZkNlm3u1yVEvOCt1jl6KQXsHds92BJqV754Xz06kuLZmGI07bg2dh7TBhC3heRN8fYHo5ohWIUsobyeMGe/Z4lSuoTgaamsdNDtNcaje6mqHlja/un/l27fhHbmxSTTEioeeRZVB6Ilnnkc8kewLqJOb+VfwsUCwR7zutJEvRnhM5eWjDCTMlhs0mdG5iROm87DWtXbx979Y7IanYgsUnqdtIpY7zfonXSA+2SocScsQdisR5jA6xK0ghpEmfoLO101e0P2iY0eMP+APe/FxDe0HpevkD7iQciIBJx8+ZNiL42CNHGtkehh525OSEf+aTOIgf+cdPJ/Y3LJKIdy+Onxsetf0ZI0JuXhwolJaAefiiKUkd6BgmuRl5TpbxnLNE6yrtrj1casUJYmJljryOUMAQlv+/RdzAO23cPbPf+Ll369PhySvVZc/DbmVYjRczAi8UEl1fhAnIlzF51Dw4QZp6abHEeaKHKQqgK+UdeAIgGmD9xFWbAKVGhZMXxHhrDs5TJv00BGsqmW5oR3RcrGZXCmrOGxV4nRqZjDWhW0HhUM4rhCea77KYn9cCTH1qGjRPF7aSEAUH1XMRNf3fjq+Y6nn+7L0f3lHVUxo5wROOWBVVKDVFFkrLo4tATiNsiZx+3skhdO7r3Bl2MWsFTlW5Bmk6H0ygr1dYSfOcwTsBFa1zlghoge53y94WgwCgsI3LEIBHEzvfLd2K7ofTTK1G6Jxgy3vct8bHYKZdrN3Uxik/RJteoj0ktxOq5CU+oZDtYFWFjRC2kqfhKZJlCw2yE8S7sXb2h3u3vrOMUgRhkNRMQFz/dfhV+F/jUCYFwLCJlX0mEh6/KAFGL9y9CasZEVSSlUMs4xmTx7IyQBIbIgEszRtc4EnoCPBDW2+SnGWApMBzk2+PtGKJZ8M4F9tXCIM/ea/edVOCV8bOowWQVgYMhxdpkzJCwQ4Chx4qKO9JvUSPezjqsGhMKH5YwOFshDsNcwa0tksQ2i5FZbsMiEXwy5BXQD/bDPZsM6SzzSBOhGwM1Djdyx+6172FHBtXzcsNrBZrhBw8Zvh/e7uyJrmKY/1XOvxgvVzC9r3G2wvRzAyybiCYmBng6YaiZ7pn1KKXUZ/uQaMbjpDEvlkyiwFJXEAyWkALIGHEINDD2MEfYRb9i/vlWlnndGMgwBEEmq5Tp7KqTlVmVlbml5mmsN8aCEoBzB7d+Vxqu8AOaQvUIZ2cnNpqF/ESXWYmT12Wfoe1GaTdOFGngmS2Inpmx4ibXM7MRvnickWaXwO4iTL66cTfZxJbF+u53IQ4J3cuHll4xrvnAsMOnHo68kxnl3p1r9xMmVjhDKxI4NPOt8pMa1a41axxKGMbs4EbOSOK4k06B/mpN0JSst6SJWKOe1gEEzJOYHprP69J/XHpJvLnea6J0rM80UTlYcwykT/MU0xUeiRmhF99W34JKCMHDtAr3QO/Cq5RncaK3KMhMrzbn7Nlj57gng6JteHmSHe5K3KfVwhmDN3DUHghWarIX1gDHLQBeP8hGfSQKhi4yuNQbO+XfOinDvG+g5r1ySpi2tgOeu65nVf/vvPuzZ0PFKfduiVqeblHhXaJBG09706h/UEPOG95ETpTKIhQ6oIp7Ew/3ICMTF1pDRCJpyAcsIjDzsuApfhQyBwGIqyDWX1SQrEzOIcKm84RD73UZ2ikQpPKI76+AxawqtqSRqRv3z65s/ER9prFpRepDwocH6jaqFMlH6yR6utYnZypLkzIBopUfUvkOUbx1Lz9CrrUoksf/tYdFZMF3SkJFKDu1Q5ywfdh5EYotakyzRrTYofPr19j98qb/wdy5Pb57qcZORuS0dLRKBUfi1MpHDxeidhgmIANRvyAWlgAQHXArBf9FcSzK9PWR5T2HhyzYE+Ypt6gpRcGmGHcS/Xco0hf0+qUK70tCgLhgvdIi29zDu3NDf6KJ87fPX0KgWxbV980TTR0ZdUGXumFfc5SP3wmIv2DOh2hDzYdTN7VUqwDqF0co08CoxiJGOTVIYViExkd7uutdqMdHvob6/ENLSMsmxXFqj11mHvBnrnXvtl4fvfTz7Zuv64X2+lVtoEAUiCVyK1tnwAcvEwc6rOOFPtygmbiY2I2Wt6mUGmHjBALI9Aj2ZZdgc0Fx385MWqVCZu1xc/Fo/dVgoyQNJqMNCraywZyV71LeKOqwxTWpK1roZbWtT5OC1sL9EM6GUuJwAQqy5oyP0GFXTNZa+U0SvgBU+7yXtuWdOMQ3ZKsMVMqr2ZtB+hwOszjODAQLmxcyzsfXt+6/UJcy4m+j7RM2gaciKcxJ6Jp4EbYBs40nTkhP18TGwKwFHQYxv5hdFHsniGXUrHwKSyT7kAe4p3hmHeA/uzv0LWHMmO5Tob877Hfh4QS4DLi7umvyOvj6RerHfEtHDuh447E08ADaR13omoDV5K6c7vkbU5HNGpm0OJt2928JIWYMspjNxosEdKUIEXYC4TD1xT3KiuiMxuiM46MBmL5ttVMeNpDy1WHyzfgNt8996ZlrCOycpEegmoC1dXcuYdMFOIDk6ofobrBrSeSdthzpuvKe7MNNjkgXqHGMvuZ7GUUbjCwfI6Al1ySn1mkH0GncJZNtZxdPY+cZwlqUhuNPtpaFJPPDJxSymlg1LKITadmRmkm514JDMtUzQrUEHCnjKTcy8kLgSrMnFSiFCnwh3EAGML7nx+Smr5z6hlCAbhw/O7ZY5ZzgN9RPzmllZCclIY+l/b7e2Prmi6BG/ZbicFAk1AM9VYb96hU1gp5KAZcqxdrkfcjYABqnvWSr1Y/GbFfxLLA4tx97a2dF65nZGSnBRL12LztLy1o6N7yphO6JZr2/DiNwaI6xfZ6ZJprcaZigUhH2CuENNt7e09g6yWNlVgUMJm6pq0BOHv7+hlT1RB/A8NYM3WZPP3pIki73GfDWTN2WksaSbMxCp4VhygkNc12c9xgRXvU67XU1iTFcgU4tjbHqXAidD6liYMsB/m81xUXMs289+SFuxuEq3b3+LNl4sL6AtmUvsirqIVcqSUTuRCy4TERG959iX+Jgea+xO00JVOqQigMbK+xAs3JZNwsZmMShhayMXkr/q0SJf1aXiV8LivyRWa0/PRAdHg4Y8P7+Cizd9LBau+Y49RUPESVjk1+XIlnlWnLpMBHhIfSoWRa8XvK5w8/C8jEkGJ+vwR/yj5mZZzBD0QLfzDTwF35Nlsf6a2ub6t+y1qrGKLkOau1ynEn6NOuxlZ02Fx5ncrV1VxPzTVU1xXVv8TUO1bTHnSNkIuqup/rYw5Alelgrv5wYI/pPdL8eC3L9Rx1NDTVYlqAt1RXmGawrWF6tB6fJA3ClYfvpjk0R/98lRdHp9OXaFNcPFKUb7+kHbhwjkJzKgnLqSQip1wyTuUS0YVhkElzSSDNuSiaMyk0F0SQix8TCjMmDWaU7cd/je87yw+sedp58rSz42njwtMZ/3XWG6eTwTyXRgIUnIqExy0E9uacrfy2fYPZvIX0V9DFTAurGKK0NgLJ+ouSW5Tc5MrmqEm1klFqYo1kmvqWKmagmlQlmam+pb9irPrlJGOVrmI4u+BVzYeKEKMDv0xWK8w8nIUUuQ5eSIWEkmEzIq3HCl/e7ykYz0meSnwbolf7LQ6EOKjuf+khLpHBXvpPgMcfDC/qFRDnAbvEfo8S7HWVQ31f+uv28b9vPfPp9pNPK5Y3uqUXHtSReqA6k4g8JsFq2qoEqklbCZ2viesI8mWQOyyWHGLB5uweeoOl5nEUaQihVGHXZ49hgqFpkYNl0uF56+Sbu19eCf4xlEZE4MPp9CKW86ZfqDfd8t7iS3RvT7vOrVmGYuq3eTFKdxwARN0SFMtCHvZTH6MajTajGv0DeqgsSPpnXOjHnVoRW0wtMxFQnriTbwYTwU9G1r4nE3RjiBz04dLHsUAE73NoRNEjZgiwCptX1xpNTSjEJZD+Q3UyFEsAeRqy5xMbAnbvvFnRo2Q0mR7lg4nKlAwnqFJhPKZPRQOE8MFggBiQQxAskKQkEV9YkqRPw81rJEQ4VzgJZPFgSFUbWhOp2xotSQQ/+m9dcmJ/5SAnznDJ9tet5yQDyUgaoXdHRECA+dteqA3W05pzcy7WXLDlUm9ID897rmkGtNdrBKkn8rUJq1SR97xHHT9oPU9LLfWcl1rsORGse1KBhgdQYAREYD61K6HH+QKmAaTVa5m8ASs2o+tpSUF7yWgmf1JqkxWODRAYwR7htfIH9fRQgKjYvXMGnxRqwXdvGABNnNjc4Og43XiiQb29dVWalgMLJS9n0xAi6+dTiP2qXg3KL+IdhWPCSFF/wTxMBb8UvR+Kn+nOtWNbf/tArUFae9hm1zv9WQCtYUE0K0pjVtTW49N1TU6X2qasQ6ntr55T7/LuoN+jlNDkZsI2TCsakV06FsDcmZUAHppOCzA8qhmEUkqRFizKojGKW7e2bp+gUAzlFd6cDsd+23js93p4ClI6oEhGB8QE8gFhshFsYsFNWkZBPJDviQZF8vSbWQHnSjk4pJDNmURNVUykljqsyZ9AFEtq67lnv7l1LKObDao0pmxIpQE5AK+NiZrXMQWdAw4Yh1oGTqdFmSNFVDI65kwRlYvMoeKK+CnxwpaAkRfubH15zlN844AIB5CyztOjODGazZK2gzjaEYWYVzUdjiFrV5QcAQD0ThgGIHXB4CuGjUTesYJw1+9tzQuCBRcZ2flszNjycBmfsvRxj9csi5zB8rHX/jOfIpccYFR2zlyrTrrAAfQ1siJOPYMIdMxokM++vbV5Qxw+8s+A+RDnDxxeYQwe1PLesYPi61sXTkjPxiwEwl3szZQ7pHmttatZf8gbNT3KOtMkaCF6/kg2TVex3s9QWAp2dEdmCYrn7sXzYNeqJvVc1shwCV2Ckym37xneoylCQEMicEGmYK8/qumGFSAWMi/nfEAh4bV1IRhYpANmYBlr++A5glJM5sBpN372OcuTHsjGPdXfSUMO6vHAdcGBa30l58+pkt7rKu/3b0DVyKBDfsfXk5bmClrSzlwLm5G8RuGGZibqX656RRVIQd8L8qJQxSQ8ca0kU0mCPiL5N+1em6xGA7r6krA++pOvRkw1yO++glKgcpm93sBY9c++S+txsjsI7Sixc1E9n8RoVpakpwvOwOzrzsvH/bWYC0UXVKmBhwSTXv+q/pFJBhcKOSOInG4+bvjyg5zLJhb7/VuqsKlxDOoHtCbnWz3ZVmwR/g6xikXOgzpdMUVMqJQsEZMqJEPE5Bpmh5hQI5khJndVrBC/v3eCFcJZMhsg5M3mgd/f6zYIHDC67qWbssYk3+TwnP5UPJUNqEJXmskh+cxXW2fdH1feaT2aNSlhpuER/aVBptacaQzSmjlh8gJYgRW+Zx3hUa20qSTvrayJSXWl75IQo08oDdZ9yqB3/Xbwp04EFQu3RLE9WBs9XKZXrQr+83BOUV0mhaBHRPQo8UTTMNkTVHBDH+TJjK26ZQ2PNSNOMKONMeJY14CCMaunn4I64rdhPz1ly3bjpC3rBDnDkfZAxAH9pFgrxGw5UPIoHS2X2OFCEw0P2tyfFq9iY8yIqlS08fbgMba8cmR8k5QM5ktvHwPprWfElsqap9F9WDLf1owmI32rpqnUBPy7lggtGN8zOmQffvO6UAnZkvltc06W3Mja/bJi7Q+CYi1luWK9Yh7wdGS2jXLqL8jTnG0UeVNchFNLpE0eNsz0QBb6EhxfZlyVlNKgMDnFqDAx1XgjRbL43FB8VtyYwtCS7EQQjSltK24k65AX5fYU8sNK/iQXvtj97G03Dq30eFKg4vEn6h/ikH2KKsa+N8BMBAJJI5wX46w0oX7p5DJUCACOfCSgGI8oEO7d+IWoHtwCjrYFlVs/0XCZIhMJxb3vx55LSAr5yuiofZlvvrq49dkFP/Q4uWOJUr3cfj1r+uHYqoKMS6ueAR0XA/wR0xiG7f6gWR4DXYvJVk4jwGXaYMwQRuS4GoZw8oYPwYgdC3SO5c3X85Yfjo2GEZy8YSMg+MjBsmaikCHQdZME4Vr/CV0JPiENQitlpFsZApwlDobNIbviPUl0+LgmMMfRS7tvlHqM7yU2Viy7NYKmEVYzqEdaVEuSVzKZagbLQNGz6QhJverpL+MyBccUQpXRbEUtyh8OV19gVrSWNVqB0hyJQ6+9wAELMXtUja7MGhy5Jqg2GuItqaq+PssgqjdCKqnj13e+uLOzcc6zSYXOBJaExPJLiKZlg573x6Mn8v74qsl7E9lT3hlLz+198ZAKspYdJb+aPnPeNU0+BLPZMnT4xpK66A7oyUJiV4WkeGUPzqPiCCQcSx/w+Rdeh1OWZWbzc+z9K+QiRDApn2iO7/O7n13fuvrG1svHLRti1iMz+ntnRo092LlqbC11pD6uD2z7qXYgJX3zDrgkxBFWR9QS30IZOCycAzExtKsDi+P5t4wkH4B2nTbjWropofwTw3RTMuBAJ0Lbr5lV8gk6io7SBcnt69svnrILEsC60lJjqCikjqPWVBIw3hK3RuJhaNkIQoOb7/Y8FQM3evfE+XGMkvqb4dsknmn9D6A4Zd65UouvCq/j8SVsHL2iIp7n4DhfXgHTM3CcvDePjunCwhjKeyO9hRIhpaYBD0KO/jv1l6q0q06AC75xE5ALwFZlCkhejZ0BlltxBj674DOQ9+fRMZ1YGCt89waKCyVSSi/MASQl/tM5UAFA16aEVJHNgEz/0IbeqP0H3cd0OEYSeWXae+b1yn0ggI+lt/FVKNdAjaILbBIoNztt/DAFn360c+amTUHWnflqH+pOUZ+LHEq09mZELBDo6z8/4aQoJchXEyxaOIbt19PZlJzK9vOJbH86jPk5rHQmeigecR7KzkCVR+ng42eecOyYzk4Q036+qJaH80Q8SmTniHR6qEcdd9rPCfVwOvCDQaY4TwcteLrcSHwQNWNXiHNVeDopttNB7y0VJ/20qpzO2LbYG/bCPgmmhQV6uRX1TlcOA4uZHqupTXsLWEtzQUVz7SwuUH5xKIrSTFKQ6roi67nu5WqXBg6oDjFfVTgA38mhGrFKEfWLhapOEdUJiy492GmTvFPIPhF1AtwC8M0le1I0G/3BROWgJJbDkigsbWOQjftK8nPMY6PgDat3v17rGn8LAjIXZi7DfiJ54TLiJ+PGzoF/GLObwOactU0w5vH2JAsZRViPM+SVKuRGvPLD3IBXfRqNd6WnueGu2i0x2v3u24x2fBJno91ae+XA75LBTjgxXbcDq27zg2Ymjgvkrys43oTPULhVa0Zprmhh+u7l/F1iS3C3XKHDzkomzttNMXeYKKOb15eeNVGWdYiR/hoa6hp6MzrMFghHZsl6Qgao9FbqRxdQ3RYtT/w2dYXvy1+Ufvh9OWE7Eo5QGBPNpCSSLUadVU1rFCakIH/e6mstPoYMEMbLoLdpLv7x4REJdteI6q07TyK4kyOqxW+o3+UoEs3STtAYsAry0bzXbnEy5oIixMnpmLwm2gji2M/iYUiRYhI2DB/uLqnRBNJAZ97B3uiMfJCT3TIWL46CxeO4qFHYcO+dOgxx3+QTAYxukc5sfYrIGterAd3Vj+vN5F6UycP10IPaiPwLN5JrFi4sb9K8jKcP/xdC2R0zHaNiQgcGhMVCPaB/rRMw+PeybmyfuBS6gTs5gNQWv5B/CEG0R3gTNXXwhw9Ho/sLOGcSoneXcYiB0TFaOiI+b/BbQT5ASDCR3Fqb7jrJKK7VuAeMJ9DXvMcnLt29/BU64R5UgWROIjQem2QXu9QgZjY2yLdgUCYEkg0+2Su2iwDFYiWtiIlEr9ClHV6I1UUnoWaGCBlYSQBJvO8F5OkKdYWX/QuXd99/auuFM8CSUg/g0aFGrYQyig5k+KKj9byKddt2F+9x+ELUAlHZ6PCIEJIKsNYnr6ghfX7pPdgIhAlUGirKAKDWtWprZHVJHqyO6OKKkn1MGiexOh3pzplbGOnd2382bicOcEpZ+E5tlZ1+ImUCKRdgpoNLvIJ6BI+e8bNvGSuIqnCmiSUGKWijuKJdE0UM00sJZxgMqqmfeL0vDxs81xRHNRJUqCK9KIhQAwLKpuxCrfkEFrjB6TlxPyhq7fbJm9sfnyBnMnMALHVGkszLhXGpO00BjXpwfGfCiwMC2ezUQq/El/4K3bFar2hm7rwn/XEPTXQFGsVReOM/YOttDyuW2MJ/lHzzStjq8JDBWdf9VpjYP6ODs/cPvP+Yp78FfPDtp05+8/kpg6Xoc6ijeeLASCMF7i9F3eeSdUMy48QS6o+jbZsnjjRtnjilLVzrFwkVwPbknhBgFfZvP8VXhf1r6TY+F2jKLMgKK2vr5ZMhyMrw2Mvr+KizC0xiXVP96cdRhBxtXlatNBy3ZxyJ7c8YKCZbMwzBNqb2X74+YzOFAdAaeO16HIBQ2+/sFJMjXu5g6OtIKVQXfiqtUzkhwqfGOYPOX6TZCOuLHU5iYsFAg3WPYY25Aa09JNmJQrgMSsyULuKGhQzxjmKtySXSxyegN7lgxBljtZYTMQiyZlufkIRLMG4EPJaaFcgxadQkvahchHLmqO6qhg2MiGVqPaR1Ow6GibRSzUYSrAyfzkjiOgwWcG5l2X79LRoNpKxaWSh3wmiFosQJ6/9Im0+bTlblHXQ1AdSnugTRAx/i4ebVrsTdPE7bgNCMH7SlFujLYhOyCmQa5EnVaJMpdSZnwG4oWTqZCxdFoiJj+vaLZ+MnGeb6IEPttvbEb0PZP/JaNGMryCmzL4k0+loZLXysRCvx07TnhYul3c48LOwSYdthiwv7Ku3xW9dKezzbIpJdIWRRSHkTaHOkZmVzSIPf5hqlenxF629OUPjLir7IxEy9D7p9q7jHNOt9UWdNgNhV9XmhpKwq1nBUkf8d+nHUTqNiGrXSH6ATRoUwaIPsglUUml/D/3QWbiW5zhE0qxZfIIyGI6J1DwvZuslWzr89rznfvJI3Tmb5fg0hcy0XE2UquU7jLIdWfADebU37srcqvOZDOoeoFwSlQOX0dJLQ00E2T7tcfiyJZJfGZVFcjzK1HsVu5UmUhCUxWHfZN68Sr+6Cbj6TcS7a4pE6AXr6xJgONe/iZi6TMy5icmkwQRJMByEwRgRU2L+z/B/MeyMzLHHCuiyGelA6yitp0dlb1QJEdbnXdDouKnDJ1cdu/RnzyG0/Y5+p5af6zO0+YzsjVp/fTrD60CI/cADvSKhY0Tjw22D0weeCLYMM2ebqSiDoQ/ZhaUlxwQWicreR1pC0KxS1kR9kxm4RuR7ME10OCSboIg7JFaB4tYXu3vlw5+ZFwMVvv/H3xBUYbU/1X9iAtSnVf8kqrCRdAZYapgEnSqwCC41cBV4ZjBg8LGEMMNrVqKT6ckkOaQBxCN/3Dld/RFYsC0PxrgdtosjyEN71u5rHraWtp0HxzzAk/r0eH9potFl3redWbTT2pkv3yoDKQj68Aa7XKAn7ojy8IPZ5kFcP+bbAEL/ZeCcfH/GSkZ26MvwGKlX8hvJU29sstvnt0C0ySlJRtWeXR4fEuzt07JkbcO4OHRvQKpWE7GwGgztDX9TEHj1ZlBuKNQkV2m+fE1CI5D336rJ8y62v3rj7tubsbntzfHm37g22rTXczGlb8IPLmoIjXGgKQo8QiZcJzGepZM4ABE/REAYXrRpY5ZsbK2BCJQMiRT89zv6SZt24sshw/MZIt+48DUB+56W4lfVJQfh1GgP9sEnpMuAQD4RSktS0TeKlb78vDX7/td1sxc/oi1y/oK1xfMDtY++nkBjynGYLgHAHW8G+vjqk+BUDqTNpdXUaWicsLlz+DPkQmK0szhGaFhVyhEqHZLiriMzngwT5WZx/iNEcSInHRh0d7rVJb+fCVHEoYNLrAwqWHe5RHZW0Q8s67TDS0BO3X3w6wEjD8gc3IrU7DWqqsFgZfaROCxAOgz0CmItOHMka3P3oXGytEJxSdLwnk9lpiN8TjNUFwRwSWBqGQ4+ghvHBDXiDNF8SbpS/xjNHsUAdLZBFgiACDYnHOgHtnbPvlMk/VCE6W6Hl7FZdzXUJLprJ+WkbVkFnljYfhwcR/O1ICXUjVus5IFOXcP+pMB6kAfm5Hs/RF447toiB43tzcyXMeaE9k1MsFC0/o5iBtxpZRW/92LMFItsVzMSNuMNwvwkff99kQILDFRqhxUFR7hnsANTjFKSF7HnAT3az0Nkz27dueoAWfQUJoSQNraWXuUUxUo4N07OnTj5CWadQUevRq0tsOl+mK49C8QH++fIKrcPLEgAgxFlyvLP93Cmhno0N13NyCT3cPHfQlt+amUBK4+Pci4S33JckrDV4kj1hGhDh3/l6lETdHx526Ylk3WffsXEPiN0NNc1eqSO0aNhAQlyH+qRdIfsuwEGhI7UYBlmr83kcB7gWpyzI+/OgYbhrZ+RsLl0JRyH7ymRHNye+Jf/US1idcgoVHz6cA6k2T0Z4Yyxx+QL436q5LeEL7Jy5HV0jvxt9ueDCEUrde79PL1oShao9oWP328ekH7ISDrUUQZKCsiTLFcA31moBK6nfUtBIqtL27GpPwArG91T742Ap6ftrR3SxP4XE1bfcLVtImU82XBwPssVQnbKFSkcgg2rcfnDGDu2LP7Y0n6LWZWnyRJKuul8WE5UNLN1A46hX68hYvGoLyZ5oMM1O/49p537IlqlFGczWrZe2FcWYcNfXOGatb3PPWgOVQFkgUHJZtbEGpxZY1bzpvZqTUJsREzA0EOw3y1bpm1LSoXbUPsV7kpNUHpb9yAUUgRpzVZJaRS5DdLOqajlY6pM3fCs2KLCPDouWGRN+AY2QedUqeDrMdcRqpoyrnnFRqdBYOOsiaMSxJJ2U9IPFyGnI6BZGJFpCb8yY1CLmmn8aEGn9OiD9MtHe1u4Pc6u0kXDTq0OW9aKRDR/FLGzjzGItV1z8jzFFdiryA1FQ3v7lu+loEw41+UmKAhTfK9y+/h1OUz1BkcxVwkeSNiiKoB8xRGFVVVWVVNNPo5IdNOxveSVps2NUWcIYak8ci9XiSvFUOH4ApjimCeppUPJ31YHWBw19b2iBda7fxYwjPxqBpGcFJStqO0HFicVJtZmLepSrUInPy3HDlApTOZL6kDSGqCuwpWq1TQG7Hvy0SncjPXfDi7/zx0H6BtE7IAEmNkUE2Ap/RBJhYGALeB4JsJIMdfH5L4YDwfFYLo9cFnlUrBKMtF32ruYCwHm/qi7GKTlvsDh7OaMu81xnt0q4zAVNQx7kho7I5ZzBjfGHoqo1M8NgVZTdoarPkzfUmGfJGWrsQ/OFqj5MrlBjeyQ2sd9M8oSiPcz2MHmpdeA3wSZGe4tg0MH+ERKADq5wXjbaXfh2VL5HggPtCe2yMS+seymFPUucR9KTrx6RRHU4F9LevvQiYn63//zK1rXn0w7n1/dltPdFevsClX0CUsBoO4kGxxJfktYdUw1RjYvtnlw1wyMJdgm1P10exkccAkkPNy8/yn6Z+YuSepnfaAAXDyojQPk4AoaUcFrLHniJHbj93nmPmam0tDCWeDjOVd6QI11GXY90ibgd6Zi4X43SvEIL60j2nJRjtT3Q0qiDtjm9uZbCdqN4MEgNd3CpSJidRJM/JiUYVZL4lMdPl0hORUpTkcBUanfeP6Q1Kx9RGtXAG0G05ITFEjJJquA9HPfD6cJCcCXZ+/k6WWsijyeFxCFAq+/5Yv7xKid15OPK7dM7GxcSrGmkZAltq8Rg6q9Q8+S4ieCKZ8FtkGuEUmZX54tCWO/KB4TSwN+HIXTxk0AzRinpFDmXapEuBpZIcDFqcM6wNQcPbcro7IbsGlEJ4F7Udl1yKK7JcToUNqnBusF/pNYU/uOa95ivtWyuDFlWfg7Ya08/Bt1sWTX9HsMWruAkCxVuRLo1yS8pH+Pu2+d2Lx5Peajs1YIAW9LH6N1T9PoR5bQPTzOc5x3glGmEqQ+UZPKFkPoTr+HWkM7GraRYLBJmtyCT8d/r8pgfkg9u0lYe55nGur3MkH+XNzDX25+I0nWftK2YGppH6j5pcTS8h2Wh/iwYEYcDSJkAH2QGAkJaS3S4928IldB7OeWukWu42rwWJUtUt1UurFQlauudUI9c0I8oTbm0+vqUZL79BIR3v3py+/prgbZcoMjC1bFwySixMynWWxSHhe3iB1MPudOO5GMVkgmxVxSkRjh4DCT8MF4DkEOERB+G+/71DqAwYAAOeM2KMQO8MYuiev7l7ZOnEsxci3OrCI8fbt6krlv8ItzSBjLuhgY4KgGvIOJAKfDp4iNp33SzZj4MUihaOQY0Zgr8v7+aOSihaChl7r5wlVzNKIW35cK+8w4lEU9wee2moH8xjbl0mSuJybVJdenw1sQUKW1pnzs02UtZtzsAAC7NvtVKnfYSP1+yg+DXrx12oGzkuzz519BlfkVwSImEYid6abPlf5LLrDWnbijcmGU/ptzYjn4tqbMj/LU+V+YEe86iMCdhfsBBtpj/a6fvnnvK5UQzJd2GddQTcsfyZsv/DOxUkJWFm6JBtbseIoWp4eK5MEBAKixifsN+h3BWGy6cs5oqnk3PcvHMapaL52bQ2XDBn9S6+KCZdDjufNDd0PeouG2ep+XQVGdOcRmhO9b2EnnGCxy4OZjQOUZr98q1GQO75YauKxxVf8jGgNnCDVgaAyxkSxLTdLlJlBQR3kpx8ta/GM3OWlPzOrelM78m+OstBqzW2V92TPbV0uxntfULGIQ7X4jYF7hEaEOvkUeD9v9vz249+4z3H5JKbjKBvSPpzwqGHybs+rk059aKrhhuQyO/yE0gKHT8O6hy9tt6yb8T6DpDKV1Js/vcK7vX3rPedYlNIvCn1ZO004yyKQ222vdr0jR8PXveoXsa/Vtww7R57TY3rtPNzehNBnJY9XWG/R6jpRX0DoN/uXx4F8Z4Qv8wLINrbyANuUsHOo14n/kOc480jO84K/eYqc+S2twG+DmHu0vrcpspbU9w1vohZ5XSKWXiEWW6fDaYLp8Hpl14duQsUI/HAD8B/FBdPGjhVRV8JtOG50QBnhKldzpq165ZJwW3bpptUmgVvKrLaSRW65kG68prWeGcKWmb85meqerf/ly/dN1SuhNUloqyMlZNcfU66SYVJYxezJWghVz3iVrPA7nC47pOpujUXcGpB72GPXqw09dSwjLTMXIFo54Ui7mkTswmLWI2ag+uOERhP+VCvp5k+5SJ9Kkoyl2KR8E7F6TuXJK3rHj6X5lgTFIx2hai+SEzUriUCgIqSKeBSwRyvlM5kQpdSmQiIsgHTY8xG1JnzKasGRrjpH/l7Drn1bPCgqv/RFaZ+GRkZIGBOfeyfwLPqjAsj+hDXbtCqgTzZc9CHF9eHkL4yg88ei97EAL3ytTFUnXvxJg9MHzx3Gp0D9ybrFQd8dtqL/cHhvTd7si+IFSennh18VPB6sJDBj2SF/UJm1GLhuB+EmIeYQBr01Rl1peCnkovEZbpcQVTw9J8/uY3t05/c+vVYLSlbjRE+zFZ7B24nKVDMfKSodgkc+pIr6T/aB9cAQJ1VyCIdBvnAHICNkugUKZSFPcoWAXcxp6wp729EOsvtQ4t9mupDbBwRtZbFvhPNs0Q/eufb518eedvGzDNRKNFJG92i5y02S4C3WS7iHQZe+HGMKcLv9KtUy8FuuKdyx4x5q5EeSEY8QPeHcD2F4ikUA/XdwKRZCV2U0K8T5z27Bzy0vGtt0/bOaQ1gvAWI8nR8HdEt1GkPILI1DTqpExIaIe3LioFedxz8zJ9Rxu0kmGCpzDggd+Rdsmvi0vJptUWIYTKHao8aEhlv1Kl2vdwbb1UZWOE8nTWCN6TnIIwSrwEP4937r6u17mYCrnDw6BWk+mpNVoTTyPK6xQMULH+aNXsUNoLrv0EA1dbPzQrBfbOSs37JP7ouxdPSHfCVVuzvZZnjAKgzahlyqHnluK7Nq27VIzu1/saLrHUUp9TylICWtG8UkhPu3ttw/JKkfkDG2EZfNMpCz3yxkTIPB4I7Vm9Dwu1W1rZaerjZfVCvkRXKoCkXqpZL5itP7P19NPSiwQvg+iORtTfvSyaY2OhsYtU5tyiJ1H4nRwIG+R2PnwxIGtCZnWWah5pQK3UVX9FOTOtUCy1PdzAimM12tKtjljAGcWBnFG0LzTxb320fetp6YZ0YAkZUjZoJjffW2qvFhKoQp6CNGgc5BjZTCoRYYiQhy1jDQUDU0W6g2TPyJ4671Oyog3Gxbh4nmyHz3208+IVW1lGx48cRKWdnTiUUD/4TRk9NbAnapZHiim5TTX7nDQ3xNLqpW+a1Lj8q2r92dKXNReT4Wg2pHihqWVFj3YR1rTqenQj6i+754cWGBxfqmHeH14QPEASJXEAEULmSdWGEXOtJtf/irhcsC8RmTO5PS0kN6KOwCvzLXWNnIfIpIk4ekFWbtt1SU0xluXuEncmAq1cSmFjMJieWaCVoDBTwjutFdPdBUTtkFjAb2o0sQATVunSHRXs06bWZliWR6a86rNg6j+KQ1S3SzxDjc2aNoegFtoSWILUOdvHvoBjqcyiNBF2PgzHI7ZJRU2hJdUogpAX4bqSSSf4REcVBKFjCkKDkznr2odDNMuWUMZs1dCJ88oOXhyrO5Dx500WzbwlOPH41saF3YuvbL98TuF7CaSiJQkOvYFZ5bAkqTVN4phn498KvZBKy4YdQ6rC53Sdr11i4/hLuNSXLikTAKcOgcbCAPJIbq7Rsxr8s5cijK+QrxUMOZadF3Eut75I8Mn8MqflsqZ7/EtbbY38B6DWswZJQKUG3/8yV+xUo1wIWp10O/AtVujSSZWjaWrhMggEllgw2NXBWeLFfmrtDtoEGjgy4y+UieWaEtOCvIIQQOkDSUdl7SmR0uPT26eFlgXODSE1WL4XfGiVkqGpiiT292tUznBpbMUn+gfndflRJoakluJy69hx0w2Nkn4Qe9m+ibVvn8Ur6KcR45WSUOMVt/8jqkwLJX3JjFslfSmqSsbkSx1w3NVI3xz9SsSN5zNRpADVyhXGT/QT5794wtakiMi0JNF4dj/pUrQRhomlxGXpflJPNFfWkyg9jvWf4ngjIfHCNEIxADJRakyX6bT3ZnREXioZlZc/3njolMRCzO7eb7wOQVIdDtLO73cqarZRAgZWyz/W98dG8fUQR+rNAqwLUaTfFj9qJ+L8BKwA3/hpRy8cuiTmLpwz/YhpfjR+MAtHuXCEiwe3cFwbc1Cb9ThK/TuUp7+y01I4J8HnqhD2Q4chTRMQzh7lc48fdvLTBavtptaP0eVnwtHBDw05Ls84FbgeQ3KtAMdB8LWGXqa6Phw14bIK7Dt4Nq2NpPvuy9RQ10Az9TMonFHLLBVn+l1Q7shQ3STAlik7UKdf+SP/M6pRQYFiBWcu6TVzrs7MuR4znykwrruUFJfZTAeZzfSU6rNMC8jl/z4VzvtEEod/TBa7GM5k8GySvbNB4paKc9lXlnr1JGbqLoFKhVHiTBA3Y1ZJxuGpIPL22VykuDSJfOlh4Uj1fMUJK3o4MlFnoN4v1n1Hj+ZvKgi9sS/nW2NsklS19nPyopGXy3bJ6vNkmxzzLNknxz40G2X1YbJTju2R2Cp/PclWSRN+4IC+0j/wa7VWOsk/KFofjJqDBaTsbCDPL55j/JsfyGBnUWcdph04ecEm+oefHcGtSpvajtPxJ0LlYu/7B2L1X4fqNjt/+lmnv/lxg7wsQ83/ijVtrqybWc3/zGvyKDz9AY8Di/R/8o/lXyZ9hjTnPsE2m7QUel1EQk7xdBJHgGgQ43C38RC0Mx4ZZWIe8S+Z8P3488CBn/3v/wPEHz00";
\ No newline at end of file
+export const w="eNrMvXmPG9eVKP5VCv7jCeCMMZnJ4iT/DEj2rt5ItiTLgwfhkqwmq7tY1V3F6m72wwBS7NhybMuK7cSLnFhyvKhtSXYsO7YkL8CjAn2PB7HV+hbvbHcpki3L2/v9AFFdd6l7zl3qbPfcc//7v//7f/32kbQbRMeioBcFG4/86/98BJ9U1ov8euS3YtXefeRfHwnaaS4bsrJgLcharciPsjome5yBjzHUakXZTpDplzkLnuOsnQa9OEsDKmpFque3d52cIIpUEqzhUyNL9DPUy9ZbUbAJCChd6j7yA7QNsHpDr6wxaHhuAoJOsoPYxBmCVcGOzuCG/GDNlHBSekZjsJ3vGuRhKYLs+Z3I141wDr8YhPCfeSUIcTC2qePusMAz9oq6IfU3IaNrUv42TETAACJO4TtjJ8fMBVa2Q6wH1QygjNjwyJiBsD03vdR90i3zCnBQfOS/fktYBctp6od+FHcf+VdcbL6fTHUjv9FQULWWxcu1rXj5iZXacrWysIR/FxbVidrysYXa8lYGefOYh7/KwtG1ysLcuk7LOzPym8Yf5k1tnjxRp/qTCvImFiY2VWWhfGxho3y8/kRtuf7EyvKxykLxWHWhuFLbysqlYro5OzVRrWyUi9GJxcLxxUJpplqYXSpUioWj8lhcrE0VFoqFUnHVLxWbDbU4OVEqnpx6/MTiVPH4sYWjc1yvXKpWHoFPKom7DZV006AJn9T/fGQ3UImn0kw1POX5STeKG9EkDIDfjOLVONnwfC4LvcTfyuJkBcp2+1ftS6EHrUV+Jq9RZjeOE89vd71mFEzhvN7+sOdF/UsZ/H/7Qh3+e7nlxXfO0aQPLlwcnHtr/80r+xdv7D/79SP/BV96f89zECtCrW7qA3r9y0HHt0jNQwHk5/ChvMDLIYJI96+0U28cIlC2/9pHLhaEQqI2wqzhxWkab3hx/2+LUC/xO/23w7qXqg1vJ/MBj8jz57BAKjf9DCpjVb+joGL3/5x+PVJlBH8jWPNuf5i1vFbU34u8/g2kTYOXzg2+eungya/ufvECQcV2ygZSCb9yycEGMd2/2fNMY5C+e/Mct0Lv/wjT6X/rdGb96z2ew6h/cwcRoYm898rfYfAGH906+Oarn3QWDXyeOoZLEEOVbUIffJqxXWgOgfph6Geb2OUMpjKKU8IJIUB1HgvM71/f1fm99jbWU74G+88XgOp4d873vDsvZSn0mDp88NGnd2+9u//s6bs3niPwsFgC+BxUDjyg0/D8Zg5wTAPRzAEFGtgFTFbzkGG1XIQJv9zeHQG/f/Hzg29ez2PQ/6ARb3nQXa9/CRdm1sVEGmTLtHQo5amTTCQ9vxEFNXi+cz7CryLx+leQpN796uK9p/6x/+rb0imYAh8QxmVNzw0vjdQEdkMXebJaIEndiGap1YbXv5m4Le9ffWfw3u/cxvt/67+vsm6QwnpVuFy9jg/fUeRj56M46EphiMOVRT70oLvRifGLgMELGm6xAqq2xajYN3Hdrsbeto9FszKi2Tp+hldhlG4iPbhInGTw9Gf7T/4evqf7z35qprMJ8IAZTTgTmcdCT6UDnIYgB5OHwoKCcRiCA4QkVXWP26RHv9sFeElW00AiHBiVqpIGEcVe0+e0BnD7Q9v84K2b1Hwad9Wql8Y5ECBaYaaPX0Xq9fek2bjd8NtQN8xDA5axSiPpgOxfhU+CvkcLeHDtr3dvPufAzs1vJ0YSmcQNIE0Tw9MbxaFfG5lVIDAtzs5NaNz1UGiCphrFkSm9saaJA8/o/gvXNH2AoYiQkGYt+MDSeDxGWMUPW/29BDHoX/Qwo7/XgW8zorFTW1ALklEOw5Re5qbH43ilyRzAxfDaGwfvP+VgCN9nEG7s4DLadZ4T1dCPUaDkCfvb8Zg29T8hmXD/tXNAlQZn3vjOjcHK3PGcFpEOfPEct/fdG8NlcfsCcCnB6/4zfzh4/2/fGy/THmPFrfECg7mIO16Mn2nWSvxlmkWmtKG3C3xPdWhqpWLoI5nBSZKaSqZrPS0a1sYCQv/ytsvb7n352v1Xrzm8TVpcEr7m0ndM5kh7nqg7XAxBGTYGINxOAXuq2O4QG8P0f0rT/b2s8r+/sb3oqvYJkjRa0gO/Aw97NJX7f/o9NH73xtm7t07/SPgbOIw+Q9AfPb3ayYALzTg9iDKgAj0vnOXvnCpBXk/N2F4oD/l+woBojO6cD73szks9mYbzT++/+azpg4Aa6kOY70Po9iE3/tC2Hf3zT1OzmY/NwkePlHjNa0RxE9dPD6glPHP+LAiGSHZf2jZsGds5+0dmx1YaANECNY842yTpA5A80iDO6UsRyhrpEZi77oic4YoY3OJGB1hP3BQpiRtIKTNrirDUv4jNQ17QhcUOVUky5ap+JyDGRDX9OknmZ/AjvSpUHMcEv9ZXP91/9R9AxmFUWCztBGFjGHDc3+sCWRTm60Dn2qHuIcxlV/nbecD9K5seAu+6cPc/fmXwzp4DF4iDYA5ii98AyYqfJdO0FuC3SsI9Ti0RiZsg0cO8MvosVAKj09PRHUIZ8ICFp4DzJKKc5tFFCckAYRGJQTzyX6BOpkDlT/jhRkft+ENa1YjsnRe4czL2IZrSkI5k9ISG1UiMCqI1D1fjMHrGkIbwHVFzpW5H5OYv0Hzk5ss2XzSNXl5yzcusLK2u8cyCqKrnW+FAo4hKtgcrRDrio5G7OvSxurIZd0+LZVhsJLJA1CgtjTmiGAmfCuUkHFKRjOhDEXGInlkIqkszLPo4Qo8rVTSpfuhzH0BUIKOKFQ0UzZSRBxxJgEUn4oi+Fk1siqSkfGGkJJXn4g4L//5NugzY5b4PMfk5PucyuYd4N8djhhnMQ4Bl8u7QdkPYhao7JJ0JuiW9Dt19WDLkkLIfQsQM/XKICy23/0YhE/pXxeWzFUw/8lt43c9aWVdYwXBpuxH5yerYElA51EZ6SFHYoiEZKdK22LF4REEbPrrfPPbbR9YbagOw3n7kf/32EdX1O/iX30hOnaJXWqd+89ipX0BLY+28KtsJGoG/zXZOSbZTec7iduo3oXWbNIU9aD2ioize1Wkc5XVbUOcEW2LJurrJ9kGTpHo+vr/DKMjzNtsgdwLV9pt+hh+DqksGwa9DH3x5pBRbHeMszbbpbaVTjG472MmgYtBkBHSO9K0Xoy7SNs+UHas2vLAB88pma07KeASKykyDnJaiINsV8yw+6vrUfqBii5EGic9mlIOGM9zOWJuxdcfPjJgdLz08zoA4HTZdtD0y2GuE6a9556GsuI0nTj4+M72c8t+lbGZ6caMC/81MLyTwd2Fmer4Dv2hm+ug6/EKsB/lzM9OzUaUAT7P4Iv6wBMqmZ6anFPzqfuPk437jCfydnK5NHJuZLh+rlU8cnyi3lwu/WCqUVibKM8XKdKNYnS4Xs6VyMV0uJpsLG/Hi7kKhGHXmJwrlYrheDGaWCv8xUVhfLvxmqbCyWPjZfKEyverDe5Vysa4mNquFSrUQLxdWapPl0kptYqFa+LdKYeloYWaqUK5WpsfYdFU7jBsgYKomKjqpFzM33AlAuweloH8ZhhzFnw7nE+HfiIer+w2qDxJCw2etO6Xhv3MuQ4WsAfLQ3rbR704/u3/lElCtu1+9yQLKEA4KOOk4HEIUiccgAUIl5Y/BIshhIQIfI2AEPg09CUDmBfkG1lTQMfATnw2QUdxxQSdclyoK3G6aBKter2NAgiICnBAwB9Gfwd5/78/33ngKRP9DILsd14BHuy2wh7rN4Id6zSjYfgMCut8xVMf2MzZDQatJf2+1v4cg0Ryo+leTIPFXWfslwTzxmmEWb3usk10EwRMtFZH0b/+pbwbXzujOJYGXg5CATooK3RhIVNUPBFLc8kaAQTd2PQciajuffcwAf4zO3L6wnuvK4MWPnK6AIBBJZ5bJrknG/DFQ0MqTA9SFHAcYq9x1z4Aj7v0CQ+MlETSi/gdNlEw7ZNYEmUNRMgniLTIRQw2fc3y2fPZ0BoiQW6Qeo42LLDS3P9zU6vDg/B8Hp7/W6nDcybopiJ4Zm008AyZQR2i8yK4arLAASiWzww3LUHG7w0sa9HkF8uOUWc6gu6d+N6AcWskNH+0rkL1LOMsqhj6sqwVEag9mnL9cMVc9twcLWJuFYgEkE54yraBJWAug4fgkyUsxZs/mmpPFSq1ptDt+HTqcgYJ5iUy0IHzBi4pbV1vYFcr008iXuYbRqbvV/QTNfUeXUEEPvPUIja4yZFd3gP5daiMl6O+RJHBw6fmDb14bfP3qwfs8H0fRssJC/pEJakf/p+qebYLG+31+m4cB+bff8eJukC0QVr2446X9y7RbE7LlsUdFfgvW6xZ8gol/nLV5wP8K6Y7Y7sHZK3e/OD34+qysw2Z/j96KsEl8ihFQTMuamyrqVnRT3Ao3xNihrNkJ0LhE3xANp99uAJ2K/CMd+TSdSrQblqAeeQRkbho/knRJIezf3JbJO/j4ZRC391+9aJadtCF7b9DNpEU7b2hDiTy/7MCJeXeu21UdBJP6AKg7S2s+BwvH+k9/MKCkQ0GGg50CkRJYG3HSJVBAlNUR2eODxQP1QJ/MWqZflOWvByF1boIHL2uD3rGDO3y4OoOm/lr3r7w9+PObQBvu/e6G+WY1WBnIYaB5cAYSD2MelnwDGoghdNy9wG+SoS/C1pMt2rXp9vea0jdMwVKO0drnd1Xb6wFl96vME3q4V9vVi2pw7vmDa5f1osKGY1kE+SYDAkiNzebaERpDzWgsQxWDHAf8j2ilobVo84xAcUjwC0VdhknzMn0Hkk/E076hExue1CD+c+dcm8xNuM+3l3j9y2QVeferwZkX7968efeLDxxKLa+jyLCgW9QsgciYhQjCwkIeaG8hD85ICgzMkRTiZiDvxA00DXaOEUkzoHB/OcI8t2IseU0/kTw/7HZhVRTps7qoO+muu3tn/46QnUXnMlbcjnXZHTNttttRrdlcy9wZbtJZYkm8pVa92Os/i7U5BUIOa7yPdtNJWmRSAKQ85QWja6KAo+H0r2S7WroBOPtvnjbSja6f+Qv5sYqYmulynhSdoikxLZsOYMP5b6SDg7iRwXQo4B30GdoPP+4AG1vR3zwQXPiGtuh74cGhbwPHRX8YHaUHOG4KA+5GClaKR9jDy6EZW4uUg9GCxaYkaCw48I/nKIAgwJ+/wYGoC2OheyMUZUGTkzwhcYkI4TLOupmX7WsjYv3EiDxfG5Lka64Ib6T3cQL08pDsvDwiNC/nxeWpvJxsRGRu3Ah8iUtLHEnVEJK8ZOqIpd+hDVcmHCcQOsLgiiMGOgLgypCAZoQzZ6x4Gy1lgYm2j1tBOKlFpbIrKBkhaayAEkd+VtIySk5AcaSTFGp1vCxGWZmIIYpRqEl6/xo06Im2l6kWVOpfoi8zfTSuOQKKkU3GcnpJZkS6D2fxE8OShCtF5Lnr4kOx1jQY4eAuR/0BTWreZ/jeMLtZzjOa5RyXyfG1PDszjOWHNWjou6HtLsGdInFcPzmZvn3U9NXQVlYYmabid0p/FSUt3eTaolt2E+36RJXzhGrenRkzK2MMpLZfaJwEoSLBfeRhQ+lhtazB9NAa1nD6gCragHpYFWtIfQC+bFD99WEGVSt1kFGVX/VP/fpww2oLHUD9LEQLnCLamAHZDHo6H0e9GbPrJVSQp6AeZE0040WURLfTHuVRGRn9gvYu2ej5UTJpDoPNoM4eofwQk2eugdbVae2mKS6cyviVgkqWbQIr0I9i2EzF2KgAf3/V5rDxMs6aWR2KMjLyq7pOE12Lu2hzTdh91G9yhpRwGyrbjNS2KdW9QZ/goMdtYgmmGNck407Kg4JCbZ01T8FaUGdrsgxtwEDNYLjDbYeWHG1zQ+d4tNKI2M47PTc9dTtm+oBNJFLmoPdQRtVmo/4E/opL6crPurV4uaBz9K8yPd+BX1SZXj5arUzjbw5/lenZFvzaWAfSM/Bnugm/1Wbjiempk+lCAZ7qlWl0j52egH+dSqEyXT4Gv+PFUrf2s3QFoEGyWJ1OixPlYrhTYkMoPC/MTM7NF/xyIeoUfzZfKIbr3eVCVCus1tD79ehUoVxstxakTrXSbGwuFKpHC1ulQlYqTEGCS1xD7JZTY2eJIVUrS/NjTK5J3A6R7ltJHuSgoGOF+CReg3Kf3I8SYNDzws1A0OyF3TZw7Boz3cto27vc/zL0gtsvb3vx7TM04wdPvnnvT+8Ovr527/ILQlp/FIhZ/zoITrjr7MJGunz1BvBnBisAmeE3I1LEs3CZN5ApxWwewCTkMNK/CLqkdqt75/2Dr5+0OC8IqguC44LGq6Q5m3nz3a/0m7xzmSjc2DVGKN794zz0LfETxxSlCxK/od1LAl2XrVF3zqMskjXFFhOJi+JHrww+ukECzwVxBKbXyiRlmUcn12aSnIZjqZtmdyUYR27V2R1WzksecqUNlXiJYqekfIV2N9j2mhYKNt5Cbr1D++nenVd6jPe9C1/cvQHQzo0OWWdyaLzYS9IdqGgyP0q9ku0ReZ9qqNKpG88xSN7jRLtfDusgI985kD10Ttjf84b71gna6Cjn9O72mS7A2kR4tAn754PPPgdAjnfrEBx4fWQI41bQHQaFPh15UOjU4YD66qIDCjXX0U8Mc/kzIydBUJ1b/b15KRj3wQF/QqPu8FfX/4Qdwd0P7uCbZ5yvDQfU4LAg46nBL8hoaqgLMpIWWklG0gEko0lQRroo6qbtX+QHpVy/tPrp9iihz412vf/5Qo9UDNn7vvvlawffvPmj9kSgcDcYBAu9/fdJDgqaXkcUTRZ7MQfIQiMrOsIv5PVUWwR0zsI8Svf3grr3zw83cWcL5Y3B2Q8Hz9/c/+TSMBzr2TYEy7q3OfCsi5sDMOfmZgBruz4D1uaaZtDwyalczxLQuTDoBKkxCpsqbBZOpFisBP0rqSYYsBQuAb0H1oIy090vv4QPePDFF/f/8tcfHZRYJASGtkGDjgoEvJPCilLoj0wejSCQYovo/iMKTieFNRgDD0yVHH7gzT/QvjphkT3lml4GVPYidAfWRZM4zRu48/L5tftPfvXt0LBDbGXrn3ZBDqmuFnQW14tsvHeBs/negOYl39Vzr8exa5eJHkhbqWeq8NqQsYS5ut5lMzI5P+0xUzz/PJqQn/rH/tkPcsAmXDATDoAJp/EJ9ooyTSOjf+MpblOfoGgFQsS6ijxwZbyI4oHQQ3lmtKSmZJvBAlonWQxKr4n+JfjQ4X/eZXoeV8bvLw+uPW9g47fT8ZuzFsY8t1tzMTeMiJHXXAjYG2IPnI8csvVEZ/EKaVrct4gsEQZT3MGEal7PPW+BPFwW1f7Fz4F/6xX1kChyE4wfN2BIYdxF9cLrxHXyMtWmBE0UI8gHVS5Db8RlIY4xiQyRDysuUl2mVUgkU+U14xg3RbwuZTKdTGRigUwO3vudnljmnYdBj7tjoeOJkXHQkZeOQEd26kD/6qID/eGEx1ZQEuERWVaLhcf9C59+F+HRvPnuV+ZNKwQk3yLBkejJ4hvvUIIAirKb7FB+FwFWxAoWYkmsGGdL/QkUB6MtPCzKIm5rWdvvpnikj0fmkGfn0ZF1HSk3J+FaGdDNHivSGkn2+8nKwwKeFu7GSXauwLPgyDp5KaeUF9eMoPa923LkmDFCzEROqJhwJYkJV4KYcMQGIzFofqBwTbEsJPyb6KGfmGf7ZDm2YdY/He8cZpxjueZDMzKXizksLCacafOx0/8Avp35EUqd2tN1LjdxWMl3a8TQe4fYH0Jqx5HZcSR2hLxa0urQVTHCC0HVw57QdpimhD+EDBoKON4VlXXFMlouUace4446UiPnkjpamnNLHVfsuKaOFOfcU8fhxhbVxx7goiraL1lU11Xn1GMPsqYqxIaO45ugAZwjXpXtXUy0orjFhj/JEBulamQNW0ZJLvGDMGhCXe4LpbgAzX8NtHmmppQfbAGdg49V6Ad1v6sT+u24hw6fUiJJLlPBmt/CeAftXTIL+k39FKgOJXSmdK2usGNoK10n5Fsmhw75h4nPvqZ+kxKcqb1jKZN9Qdu72D850o/P2oDbDhQAU+Kwyo9cD8rQWqk69pldUnkcdrnEpKjMzIydBT3meohz46tHzo4Tv2gHxx0E3WXdS9MZB3eDrIPbQ9lbw7VmozK9nPLfpQz/VivTi/J3Af/ir8Ppo52Q/s5h3vTsjI+WVvjXCtca05A3Dekp+HeyMj25XCtMTx6rFlRleuIE/B6HMvQpLVemSzX4rdSmixX4VUvFbKlUTJfLpeIm/GL4lacL8P96MZibQhOpaytd9X+5VOiVyMparKtJ16ZaKj5+olQ8fqxcXKlVK1NLhd2Jwhh7KvL0uA7LGHT6Epkp30dWL1YJWyoZTb+7qpLGo2Hon2DKdykIaceUTyCiPwFJc89+dO+Tr+9+9ebg7D/0Dpe/6pGrmNbU8FwsOYIZjZfOxFKWeF01VQdBbTuamoWnfa8IlNmJb6puFGSbfuLxEdS6olOhKeTt+F4YqC1FwFQ3kDyV1GN0H4kjIvEbGOlEddaBZoE0yJXkqOWuQG5F/3yhZQTXZz5F+J+/a7zrXBS4r/29KFiFgbNdNdClpzat9XsDTfeT4RiPgyyp57sIlCBNY5DznU42UhDUHtDBdiuL0fkovn2mARJOI9+1e9dfv/fJq27XEn8DeJ/pF0hhwIWcbkk5dwobT3SHDATtwcFtS3dAbQFpIwo8NFE1VTOgAAO0h5mApIciChSiv2B/r8uFZP8270EJv9YYLgi8Hr2BUlX/Mqye2x82aZl60Z3ztK/7h7/d/ercwaeXBy+fySOju+mgoHtq6oh1xiRl+jQg7ctFMHK93aBDT4f0FgsP6S0Wje0tFbi9xQAY7QapyezHbLp898Zrd7/4w3CXsQGNTmUIGUGk4gLjqijG9ARLKarpBYzgvBwauJAJLKNg5FEgSCkee8UFDTJz1gi6rHgADwjj1JiBA7do6L0QJHhYf/ix9ppJ1k3Juc7k4RmnuH8p9Eic718mJ4ELN+89+zYI9feevTGMizHNMQauOUlq8NxrWDLzGoqeeYYgMx/6W/1LSdYc19GwrrBkXE/hu2oq85rTJ/1SrqMw0p/0vKB/MXK7eu+VywenzztdNbiYjkpjztfMUHu5YkuLNRT9STMETaH675PbHDn5hmpLy+U76H6PoS3Q1JVBPsW7iNHYmavNhmOsTDEY2l2kVyKho9DstzhaR/8q/ieGGFAKPjj45vXB6S9NoBd0OlY5DNDXC53mLAboev4M0kuqHDoYdIM85L2mC3Dw9asOKJDwedvMgDzO6j8IO+pI09NwAeZxVgic6qGuD3JOD/QThIosNrhzrkPOz1f5ROeNjxnoaOecWcS0nsVcn8QCqjslUynNmyVLAKzjaaN/ddWP/PqjcTfF4DueWqPXcCYfNRRK2wt8igaQqBZ5tfK8PqqpFW+EhX7C8YxIhe+BPNahgCx+hjh2lbcek+5HFg+ca/TtQqPmxXU2W8BE759+/96bzx2CIe3IEZS4dCiiEZUdjqA4aQ2jB8riNPOzlpdHEF3gPnzNoMczJMdscIifJZoKypA5ZdMkH2tysLb1xGVTJY9KtfQIuVj3bwJPAcKgfTb3Pztz9+bz2mfTT1MVNsyxHvINzAOb4IAnI5UMJDGrajhiVSUo2iGPD8/4Ds0gEPq4jVlziamo5RsAImd8hE4iFMeFHuFYF3rdGwNxYgSW25/EraVBTTndYVc46c4Xp/Ns3rJgO0uW45t148yWeVUvGz1tOUZI8oLMHXJDEgpk8pAJ/uFvevJ+DInDQNDyIkGw1Bg/iW6AZwVw9rImn0ZAKZzDV3kAWjL5I7CVG6Y2PW14q6vxeiOOjrLJro1cgMiHuFB8+v7go8uDv/99GDJt5z1L1kTI0nBxO08PrAMZd/NoTAXYOm7l8Wg64PR4MkA9nmmchhSKp8v4JujieZyj8XDOTkZReYCjJrrIvNMYfonsQ/46elRz7Bzq9J1z8OEDKh3p8plnBi/8WQJSYEvUU4KjeycQ6PvG1vTiMK2ZxYGtGW9sEAOi/gfANTxmGWW2bgV4ZpVyicOg+MhV9/JVG6ZijwiaFsqQeSJ3wdF7+cz+1b8BbxkGyF+DA8t0xUKi/lgg0ikXip4jgkLdGmeh1ypiyVEOS65aWHJUwmHt0yiCeRWsapWvqqN2TToqV163M4qWo++cMZpO1eg4Z0S/cZUno9W43/Ss+zXP2g936FErDEZX+InE8mFhfJwYXtVCb80Vd6ta1K05Uq4RcF2JcsIIixNWisxnWuHRyI0/hbTmSGrjJMLjTvPU9Ei7x22jJ6ygZGSkceJH+RCB4wHSUHVEzDg+Iv24go/4ICdxC5hdw3X9H2H4eKQyV20s13dYvsvv21EQfjsPPpz7Oqz3QXy3Mp7jVkYZbXmUxea4q2F7ec4zm2c5OUYzaznM0TxrMVxlDEtZHuIlU6MMZNnlHFMumTcUPk9tizlSmyPnRYfCFvPE1dDVsRsHQXcjSBqpP2HMAqNbB+PquJsHY8vd7YNDKtgNhHEV3C2EQ7DkTYRfHb6JoN9rnjolq+LUrw7fRkBP7KwuASD8hJNknG5mdY6cELRTSrETcIw+z+T9G0qKd+T9rKeaEhpXHiE3znb9FhvBVZ3T7IKcBqorXsShJNl/2M2nlMag3YoUR0dq5RIaTbSUU1KydwVLeiYz+07QMx2lFEcVbppseOa0ttkriWRB/taYFB/nHTtgmOJcWIhutt5ncQfUDiEta3eY7LCYcdAu3Lanumu6O6YDFmGNocHpocz8leWloAr/LS82mksFeFqE3wL+Ksvz4fJ8Z3exUIMk/Du6PJe2Kstzq7NBrVJZnm1Xlmea8PMry9Ob8NtC0/vyFP4qy5Mn4O/kxMmfTxZOFDF/An5l/C2XWpVapbS8XGzVapVi1TXhu8/FOJqtFsKyWizszBaKa3MThdJEob00+4ulwupcqdirFjhKRWkp/556YnrCGP7bk4W1cmGuWCgXC8dW5hX2ZrZYqhVmS9DOmC0A3MfuYsDKxJdzz8Rr9Zl5p5iPSXXjENknUL9NfWYenTFS8qDSjnUf/xGPxopjHcoQLU8aojiXlG56DEvb8nJVQDKMgQ1vg0jIwChCH54pNcBoZ/8mg+KAcsDp2g0+5Qvcjk63gByIZ5lAzo/xSKC421xv+WHocciBLdUkv6UmmmkwvJ/fE/khRg+Z/s26OT5+9mMApQ9o7aL20KSteLKFB5yMAtoU3vWDXDFGASAHBVia8zqqpwaAbb9whpuXnoACvAGTFGYSYLa/hzlkf7q4hn+Ksj9DMp9qc7DZpt/0/QZuIzShK+TARz4V6N3ewHh34lbxj98PPv9kCNKxHBR69boWG6VdNjl6tkmagqe5RTPVHQVCerADrFHJmoriJNiC0XfW1FAtOYwXgvzAmRsmIAMuKe/2y1kPek7OL28+e+/me4N33h8LUPRLhqe1leFKrKvngKWzJvqWA+q1jxxQMuGqkfhlmXAGNKnnGyb7mMy19sTIUNC98xJujV1uUQBAOqN4ffD5e3e/+ABmfexhvyG/j5FTfl4i4Q1M8+IeSQ2LXIGeTnzilmcBm6MT93oa6Jhzj8rljCSfcY7RS839skEq6jqf9uCdD4zPrIGyYCGs2LYX3FYZhGfb5OXDLWo3iw4MMeObx7WpglQKI3s+2EGVfF5ymL7zhoMpNy3Nug06TTF+piFBj5rhNlA1UOyiRbEoYvkLf+b0+hHvuNtndMTzd78anH3DLNagEazCFwuTqRvDM6VI47gpt04oWiYtZYIA893KQxi889Z4CBy1MzIAUo6HZiukPlBABwJ7HCIApOSa5r3zlkPzfnDzrPhpIKz8MQhWOZCA6yZzzemGJg2ON3eFoMH7B/+4rgnawzUB06xb0bOMjfAsg54UKmJTIJokfoO/QMn0O6QX335ZjqDIYrt78wIeP9GLTcIswALTbZn4CijYmmZ1cAV40O0z4xMwxPE0LGZ4DMn5+sib0UYxMLELnIgFHKcAza06VsHvbjjoxm20luTa6gZd/D+D74ubRX6vW+7iFn0UdJ22DQRunNt3Dv3LJ60P/ZvPmj69IdHCCcSDZ1tMgIX7z7yIfqompMehR/dXY68bZRRJoJUoHgJxGOYW2RjM7X1bY4iU8am788qOQ14Orn2Rl3GU2TNEbd7nPR9pT2pIqzLNiKm0T1OtgYhsQyC+E4Jo/XUJ4NdnfwoM9ZkDQpFszOMseo44l5P0dKaVJCuuEGnkR+P6qYUoR75yRStHrHIlKitOURvMWfE97RWt+Sk1IM58OdnmUMGmaISMyRHxojgkWxSJWhiZ4lDZ5dvaHJEojCDx/Thxjg0P8+AJZpQrDqOcsIxyxWW3htNaFlkUFikhb+gvulAnmo3lOdgD2Neiw1+WR/nL4mHsy3CufLM1aa7oNlUbx1sMX7EsoWhZQtmwhOIoSzDc4HvSaEOev/XDH6ZxOQL3/aibIWzfmeoYgjPGEkWYFtFFtM6WnhE71Lga1go1ttTaoA4p1haoccXW/nQIbmx9+uVh1icee3JfrYsR6pcPsD1lu+iBysfoE3ZRpDPmNgeWYi+L2yZ4qB/aHClGZ1V20ww5qW+8YgNQFjf1o75VCwHEu/p6KZPCmgpGh+JPolXJPG9mdXnEN0wCr4nCUyQRQ9ePdHuWaqc6uGloE3QOPvGzmAv0U9bm2684JIJ5xoZoKOg/G+LUyck2Jcm+pYiyTVL3oG0KX4C90888VCZbHtF+hHdq4U965yTHzYmZAXY5FddTPZ7uYMqDGSIzInoIdJ+H+2v7ZpC36DJuD2PfSjajJfxtRin8uvBbWkzgV1lciOG3kSWbS9XK4nxl8ej64tG5sLI4F8BvrbI424Jfu7I448NvtbI43YBfs7I4peBXryxOnoTfE5XFiROLE/F84fHKYvnYYvl4rbJYqi2Wjq3UFosV+FUnJ342ge6mAD2tVpLNn+1ql9TOTLEQrs8dnS+srwVHj1cKjUW0V/VKhVKt8C+/3MZ7tY4uFeaWCu1y4TfFwrK0tDzJf4vHj5VWauVfzxeqlcfmC/7cWJfWIOlfwiOB7VDV2Q8SCH0z6MYgBVjfSKimsNaarkQOkT2oMMFiwK44Q8pRzv6VhE5bvYn+kF98sf/quzaIILRdlnh/GpAfHCd3bwKimpTyV4E4GwjXM2KBL7fTPIj9T2/de+UtB8Suv+WBHNAN+zc9MXCkAW4UoZdYlKBJIjSmjlzlUDab8ToCkLlCDgD2f06/Lk4JHJAAWF47Fw2MIsyeHpw/58QEc9stjsFgfhj2/BBgUf5HgLL65YK08JzYrvle0+7TcK+d0K5Or01g1+Fu4zUxuQ7fu3Il11sbGCsHeDkHb9mFxAF6LtleAgxs/i/vGggsjyQbfGwoTbJ4jY9NUh6fH+qpbTbd0fUftIl5RV9ecuFTc8jx4RrB45VuI/ef/MpppBOQ7UE3ZYNMOY32r+oq3DK641FIMwPDuTyLcG5Fd16yN2fhpSWnb4lyjlbRIcS7FNx0wqAPQikmeiq1EOTyHbfxg48+dVr+LqNBU4RHkho8HjA/d2/xjrtqRNkih8HtKAo1JRmJv0WOimIase+jndu+378EC8NtY83b5eC9R/iwUU/ZChStVze7SVYX3erg3C1o2GCFwzbULI5Z05PLwtxyHDfdrAyb0zBedGIbjunWBjn0SFvU2ZZ4oIrDBJbzaqeMyPfRrVaK6WIHD83FQMAosPD7ZwZfv3r/ja8lMmy+bWk4QQhEECPQ+/Pt+xQRQ7fP35JtHgbaaT5uBc1D2qcFROVO2zgwpmkeGdaBtMfUR5+iGiQeUz8O8jkAiL4FwPFw4yafXvOpIVKy+KIZ3KygBx87AXUptBj8DeQlPKVhX+KguegHHMWgrjUaHFsOdIodL7l9AU0CiMGT1wcfvzI4I4cy8rCbGIqTPZ7GYMAlEVQcA116ngNO/XdAY+cNaBzd1Mf3U7ZwA4XFA48WDg1u6jegSlFDSJHSirYFvKPNF+poC9yXb+y/+g9jgRtpfJmjgEl7blPMi5ymBqdfd5pK/F2ORdFN+UxuhFc6poZq0TqLmxna6IuyziK/u7pklpnwd/4jK+0LjAch7mIRmQUJYWUDGRAQM/WxnnoDh6dcQ5K5HgaFM25BIXnyOcBA5OMRlakcqDBkUzuBUF4yy0RKg0AiZdqXi+jO3YK279160RLh1Cwj2zCnTcN6jrt494+ElxGa6jaOS8Y2Th8ab9UxP842FQpNpzU/bkoIC2DGGDZ00tK/q+ijePtCR4b+wl/3P/r+bQpDtU0CB/mBTRqZQVpkgeGHI2lbRC5nW0wVbVbBvyYHJAi6igUdZJ50W2FKfDmLtx6F2etfw1PoHDe5f7VJ9xbyu6oRoPC9TMuezgZs+Z5vM9kgwRdQ0f9o3Lj15OCdPfg3BheJnsAO5jlsVsZAT2OiI/FiDjzduCl3HCJ/ykNHFiXQx3ohkvYw4SgNFa0skFAi0ntOYh8rq7/xXYXk+XEi+ZA0/kOF0yG59HsJpVaU/O7CaF46fFjpzf1KtBzzXWU2R1wzwg/z6VTLOsLE+Y8jdTgixxiBoGpGnIUMzf5znN9h+2MYPl+ESRG4Dfccw2SH+KtlrQ5f/S5sz+V4Drs7hD/ULAEvCvFesh+C4TcOs/meDQlj+WGE36XPP5A4u3R5PAkl93wkVdRceYRQrTjkaVIuA7QEaYQaOe57EqbUwyjFPIpj/PfGVco58I2tkPPgO6SG48I3rkbOh+8QVNmM+osHOPHpeKqn9Jurp35xuCUVFM9GoHbF8qnWMc2npvCiqCxu0+lwsgeqXZ1EY2LWbkgo0ki1d9WqJMjhLthBAyB5kgVZO1KrJqlW4b1gLcjY7gpar05kq2inW2tFqmnhm7TCZoI6HrXl2+GyZpbaVITGTXIXZIyyHYwdqpN0PD5S23jzU9zeFZc6kwgwFGuHXQGhwDxnMZ23J9tkjKFR5Rnrq10+CI9Ds+ukyAi7ywNKFl9K85Bt5kokg1tA9Z9ssvJA4FRLHPjEmquTMkV6MvTAmxHXo6vHzg6THhCn77qztnfDnbHIS2xoNq8yNg9jQUXvv6DdWv0uvzX8Bfhr468FbcxUK9ONyvR8pdCsVqYU/OrVyuRJ+D1RrUwch9+xaqX8OPxOVCsleKG0slIrVuBXLRe3SuVScWIC/isV54+WigtHiwvzxxcLpeK/z8JvLq5JzNWZaqHYbPy8CiV1tVRBr8Bfkq308RNL5ePHJh4rFmrL88XCZLFQqlbi5bEWUyTUuBssl4/rpMSqdIv5hkfJIEtQl/j65XUPr8YO+hdp5+zsLbyB/E0Jv53ELQWtiaTfjRTQ/AiYNbA2+OQlkjnUauOxlV1/g4JobseR101Ul+9Nx53K22fWPQGEMN5/bvDlaYYkR+2CBh5XwpsH2SMLMpCNQ3d5m44ryFWEkzYnMvFlrvAtMyx/AYPlm6MHT18H8Qu4rNyFCVjhdnIH5U+VAlFnn3LOz0LQ5aI41MeXKbN/iSrjAYgZPhOqQm89VGKWpK1r1lVwBF3wqK88/YILnqICKttP7J5Cq0TKUUd591VqOZ1NlI+ObtJZjnX/zw8x4H9/T9/4ee7jwTM3D04/f++WHDLYCuMtaBkG6V9hfOn8QEdOz2QpCScbGzGe+9ib4GhHYZwkCuvHLT+bp11kKLaDDFoqyI+3z6w6YAd//9PgxT86YHVYPLw1J8DIstSZ1ApLXbpjp4MH1JIuaifAykwII/1mNPwq7cpjCTZKo8Ev3f4QTUEUOK9/dY2C5/E+6N/3/3F28ML1/VefG4OWH8Fn5FdHUQJRgPOHkQE0Ej4W62ISJRlXJ5kFxmc1j8WFvx5888qhWCg5Ij6Ew67vHJJ3cdBHyl0MVtHHg8RvnBdaE4gB4MPOin+ERQEI3H/jxXEIBBSP76Hhh1TdBe9vKfoA+AO/GuaAf3n63nu3DgfejOKNdNwk4I3k8UZ/b9w8+PYtF49euMHzcGOV9XvEA50UOOblCzATgMjgq5fHIgKUZGIsGkiExixNX7+RGwqd6dCiHBZMjCwWqQLt/G1yqcGzohjeDEQFciH1+3uRMiVyB+1q0CQ3lzSG9y6Z0jiod0jyTX3aifS4hLZLLuKqBGpRZxNZ1L/BPqzP/3nw4mugN9z7K+uPOUzobE8DPn3a93IxATIFxIM2x1wU3PpN399IXRRuwFDcSIfg33zv/um3HPhDQ+H3P+u/r3bxWEi3ODIeJK73L0K1lA6hpzlkQGyNg4a8zPFjYI6aG5mDFOgpdFfIyy251vsqmaz+/PH+BbzUG+ZoHFYg9KENd2FkVIIES1IqyeGCJ7j8Nf0SiD1UreNi0r+xQ3uVXReTg2sf3T/9hoNJ3IRFHTboyC2HkYjYJrAXBZ0E7b3BKvP7JojnIUfwdis2fZ1NmijlyXlCjDRKkYMRDRK89s+eH1x7Hm/nvcV6bwBaC3rnD8HeCoBfGNDimD8ElutYoOLk5UBDXy8HFIV5c08B9PdgWXfyhwDiJteLAPub5GDl99DUqbQv0W0khBii2F4f9+T+J5fM9XEugHzLuXMFQ+cJcg2e/dhpEBVSdvZHIr3Bjv5EOTLQVFP28IeV2XK8++lyR44TJN79n30MerP17qcx10cIeCBNu0BeaLjl6IAMs2k75gChtm1A12k78XWMuxYHFtIZsEa7atIO4MVd56za+SdBLKTjamwL8Xf5hhMJKU83JzbE/zOIzVb8UCtn3nBaAU1+gzdO0Guevlbo2QbzfFjYq0Vt46cA61pGPX/u7o3ntIzqCHWqRUKBleYAt4m8KJcIlWY5rkccjcU3A0ZENwIilpluxAdS1JZQlEhWzio5VuFp5s08is++4KCIL2CAyFTiM6otJRtdXII3jEzoButeM3DQsm0LXtTyGD4WQ/Mm7v+wqBU+am6hHGJmccgXUbq8rAvZZv5Qbu9fCWXuzt669+E46P1Lx0fB9h7VGxPDfHx2CCIF5qCdVAvt3C0HWqKYBMFX6JuoWbTsj6BnKe448eVsTUUfBhA3mOmq83Vo/0X5NM60rBfj2Y8HZ9/Qjoy8Z+QCglUkB4QMmIS0D5SVpQ7MWapB6J0jFwbOnMAYf4Ke9bL4AUpc6HtJvOyUD6lwRnvLfxYLzheR02skwi1Zr12tySosVlEJsmV7FTwZwlgnsJrAITrA7PCqmB1eDfmlQEKDK0Nb6fnbsXGlz/Fy5/dFx0hxVn6LrXTAN61qkYC23qwcMEvBRyHDKc6JQ44g9MNRteKMFR9yPFnz61ymZdA53uww5u/OMl1u6bBKYWiakREDs4zL5VkOwxJkWRzUNneR70xZg923MfwtX5M1xHm+L9sxHOe7MgPDB36cubWU0ZLFEZ9tS/ckY5jUDdGgMRZrIOcrDzJWS/lYO7UuG2uitoVjrNNSONYwbTFim/TPH8YmjTsBp37+oNi0eJA6awY9f127hHIO25LJLixepXj/l05h/VjVo0zi2cZ05VTDZuFp/+0A5hCSseIbpIIdm2KTbMTGUCUphqk2oD3Bxj5joNeWtq+ax6yd7fg9PrPODy10vViX27+wO5g0Fu5NfQZdmTTZWxOydWv7ecJ3kdGjY9Q1iQyv3vIzsb+b51jRCLFZl8dOvJkxMO+63KNFzxJNtyNYWPzibV2J58AOuR3bkVHEpsxAydDkhsPtv+4v/9Xd030YRtq++ZDeuxRUdnl6KT1WmV7qbkF6K2k2JH8BfvP4q0wfXYdfWJmeC6bnpiuFNX3pF4ahxV+y2ZiGt3QY2iemJxWGon1Ch6DFC7+my93jpdr09kKBgtBWpou1anH634qFXxQL/1EsVIoF97lcKv47/R9HnV8uoeNuqRiurwXpcmFtGZ7brVJx1S+uVKC9utqoFSZPwn+/mnr8xNZCIVkoHNau+zzuyq9Aa61NElz8RNJdvrjSKfczkNY5jJnkRapsrCl402gT2QLeIc/GlP0/X717693Bi+z1qe/H4QY5/L5/pMG36yYmU24td6qlJO0K0LLd5zZQ5SQoAWRdT2nvsq0AKEqwao1HcjrQoyAw/UsJ3qITjqkchgH6K/s2h1yiGOrtC7Tm7375BgC9L1E+FXyPrW8D60ctNU1RcMbWjYaB4qVevTzUg8/edqD2LzX5lvcmerEn3Li9Ft5mOrfCgwC+awt6aj32mr5PGdk0bQjQJKJ7HV7+/QoLGjSTd7/5y+CZp/UtO/RKC9Uav0EHfXQOMO0G51hYLTw+tcOuxlC/gcGUXKjGHxxNHjnQgz+8tX/2vAMaD0yFdYwOgw5Rbtfx8l4uAcqTOt23r0RBOjQCugTEpBxG/atdWGCXt9mqQNgQYujx8/Zr91+9BjIToASISeijOGhE2aqn0D4Lk613ZNz5bzcS1IIlFJK8MLoQUvGXH1oKO3ksDi4978BnrSikgEl41mnPEQYxfdGjUy98yxOLhybkntaVzNt4d7EVGdHpDi+lwM8FvoxuTveNzP26H316/42vtRQ5jM6zYxF5AAaTOcCoACvPAsV18ac/MEj70eOXEPgsXelvIMGTYXJvtP3isSa5Xy7orx2IDKiIyaryOkdmjQ/kxQ1yqVkXH8jTf9o/I9G01jDckwuwG8QpqoTDQIWkWXBM0YaAoVrgACP/HQPMULTQ31JbEi+QhOy6orU7hp5J2bKlZiZNXQPZuyWn2bBn7/1OH2hDSv0gWHrOsF9DgDBEsguG99xaNuKDAwb7tOtvhWolT7Nw0+mDR4X/mC6BNrzLR1mpM369R2oz9QTPDd++IG6qB9e+uHvjLe2Qwq3nmrQt6UZU3WlicP59pwncfbuapvGGLOCwHlDKBL/ADEjrgMFcKmH6kJhFRErFEejgya+AiGpfIFpBBkeXG7rY+k7XhRWavjMfZBg8vgyBmxcyFLcxZEZOO0z6t9Ihe21C24+9mBhETl8E5pyCwhiZL1+2Ty5nm7lYBtfeuHfpmhPOYAT+ooY8DuSihbRIn3oeCn/uBoaNiNcNtnwMayazoyCNNnd3gpTUMUGddZrt+3gr2ZW6Pq1y76l/DL75vQn8qr8DeSVQx52vQcM65OOjd1hLNDBhDE/oZatB87plwHlSlqiQb6GMmajg4Emsxjwlg95mGKqGrU/8haC3X8Nj32IDTltJBKAYSkQ2eyC8q+k4ULIic7CYQltYeLLGwqKFKIp0FsYpHbtO5Wo2kxGP1sEliBzRZODio6tPcSePvQ8HH924d+svrjJPteWIk4GgRmiYi0swBIZIswMHhU0HzhaLeWxP9+ucSmmbMMaTO7KQrxIBeO8MrGFzZbwRFBruynpYGdWIB83csnLhsYg6DO97fZEicCM1k+/x2hsHv/vIXilPLesQu9SoCXXOzUpM4yx1opzrJrUrJ7WpvTn/0wwQBbD4T27V9zJKSbMpCrWT//sbzKLGyUM5oUsOOw4VIdL+KlOQkdFYMTgHGBB0Lj8Ykxpv5tUOZbrz0rYhfftn/3jI7WhWl3EUHTfX6jZ5tcbRafJCJeFqwsUmJkIlfZdTph1RGRx9wRWW7VNeHs4JwXklYFT8f+iGcpLrYWLrxBghcWKMeDgxIhvmJENHLMxJaMOSWV4sywtkrixmBbEHCEbGIcNJO8KQKwdZIejbRJR0Q7UTyrMSyveQcFwp4UEiwncnCC6DPoQ7z+ZY86zLhEcSDk90GKJmTC5DGmJELgvKcR+H9YxwFJfjDBcO8QBL/kd4zCHavo2NNpZoO44oRKodOv3jNBsZQwyQVEOjKT6raciQDpuVp5hCLoeN0b2uvICRHcQGPGyQPqSOMUofVm4M04dXEOP0IRWMgfpwLNlI/R+HGKn1e3yBmjZX/8fhhmq8j2zNb8ZZmyMcB2uxalLwMzSmJrqEEqYk2Imzbou9p02aI3hCbrYOoDcjtR4rtiC7ecYUmtV9XcpJtpZCNtFrVacEZobszEyoUBhVnaMLMfaqLtQZEnoCHYS7WZ29uetODtmDAUSkVn0MIRF0TFpMxbgzmtgXJYPfazcCiqKhG6W0vEc+2rvui5zDbxJ4ByKlqYgGXw+1GdWhIXWGT4+XM0RO/52umo7ZXhicHfzMGw9lkD6+Ul0e/s1MT83Dn6Pym8Mf5M3ir7r8RB2rwN8m/J1ebta3ioXq8tKUvDn5OP+dePw4/S0/fnwF/5bgb3X6ZHGq+PP5QvNoYWe6UCr+qlpAH+j1qbVge6LQbv1me9KEPZ2bakzPTamZk8WT1cJS8UR39thEtVCuFhZqi1MFVYY8eLlYWZpqlAtTY03LOkK038AYlHVhweQq193AATgSUqQyXcBBozeoelCXLTIfBpVre/6WZuN4Lc7tl+VwNEZ+pshP1/fP4QHmg3Ofm0vRCDKdxtnTjQCf/IO4YW3Y8qYv5V1/2gXAzlB7TQvgLF4R40TA3pIYm7n+1Sns5bj+1bm66V9IDWy4vSNxGERnt3fAsA+uveP2Lge8W18aAzrS+S5kX+cayNxlA9XpskB1upx1+zc75MfSifUVCLjNm6G/us2KKSd2sxK/3Y09DALrtbuknjqF/b1gB6NumSu2+zeo1y+8OHjv3XsXvrh78yU5zKvfAkE4g86wf5PNjDLPODvlcoGY8+X1Nldh7PCFHHS5mo3hmnvZaKizbpB6CmXQyOedaRpuzg5RNMUCnDIV+jYIulM+7k10EIliLzVFGOwhW0e15eom3cmD80HiwdOf7T/5+3tvPgcq5P9btJoeGbMUHfPLIydxUTVqjvASJOhI2fAjLVXygb6AclEWTR0HZqzMdRf5FKh5OSdpXu2RvUnMdCQu4YFDEYV/ArjcZQtauqshO3qvbKwwSL53UbGRMPJ42J3tl0UbsC2O3NApGQdE1t4QH90ga9rr4+BE+BGSj0LDT5K48SB4WHcyD/NIV5E7jtIWlJu6cwTUanhooVSrumdpJLcoATAFeEd6Vem6GFhArv71ufI6KOFdrJr6saykO+dDz3prQnOkuyGJPf/0/TMv739y6d4bT4EK99NiobwcHmxgNBgMwZ6S6wNasQ2L40JbMaBShpXrJwVZHu3nm8+O7eePAEvfGafh2OOxsFRS8cCMG3RxmvbXTfysQWdL2PfIT1pygAMDm5pLqj0dhZeksv2nXuQrq++9c/Pg0mUXBmAymQezIcaVSLsBEkS6xsrRLxlu05sdgcy2FgOSzC30YfhreAWnHB5mPdGHzwJz9dcfWq0pwUutQFsEkWxjiT8grNkLE+WHZf0d8kkR1G2R2nX4cxy8+ALaeV47p+O6xhsYYoF76qfxxkZ8pCO9a3HhgoUwm2tbLEfUqOkKjpY+7kTjNuEO1ISMT9Hc+c1igjsjMDbAsoenAzfrh6bD2rny82Am35vNgxGEqX2DcBCjTKG0bkV0p4tRKSIMo00hoyg77klFXY+ubcE4kyanf7XdYAfd/BJ7/sz+Kx+5HSKY1JtUQ+OOEIz4pNP6bK5dWUDU4PcbcvbGvziM4tnzB5/99ccccwNHUCYAGmVnGY9i38wveQdQ7gNhaO6aN1+au+b5Y3PX/A/qmYXifsuH2k2tAlHMKQ7FnLZQdLWEoiO8G5l9SGAu5kTlYk5ALlrBuOgIxUYWHpJCy47wWXZlzrIrauYkXCNe/n8ixI2V4P6fim+u6KavE0uSSb7NjeR2kWgixjdOTjiykRGL2MRIHhTwujYjYhTwQCVysAMz4l23OE6Vn1Bo2GHen2f8ZLuEV6u5dqtOo1W3yeowA3Z574/EeF3W90OaFP5jeM/3ZzyGGxiyXDQMoCb0uGiIcc0lxYYM/wAabOjid23DDKsZ0lH7ZisK9Kh5/8OTVHHYwnloLWPjPLyGsXI+qIrYOQ+tYiydD8KXbZ3/foit077ZJGsnJU79+wOdcjcpuq4f7EgIgmwzUpHJJzfPZqzau6ZGEEkOl6EpLl+GOficBj2oltUl5oAyGVi46cNb+onvNeJW0EaoIUe24QZFuSVjq6pTSsK9BhivQPIljT6pa5HaBmAS2yCkNHVvLVsL/DplUkIcjpU400ac4BgJMCxrMFYqEzfVzVj1JBvrYqQM4M1kJkSvYUxTRwGYFADNQzssZ4mNcZNjEG/Kg79OMY8JTlun+W2fjJwBKxqc0F67iArZNWWkJEsKh+bOzpQ7LzL4ZuT1MNuB1QOpB86MlR0ePQ6m39Sq7ZhB3KL9UNZU9fjKEv7g306tsl0sF+Bpt7bco6cM8reWjtUWU/h1sd7xY7WFY7X58lwBnubhdxR/UjIHv1n5zeBPtw7PU/J3sgF/j9UmTsLviYaivPKJWukY/I431ONLJ44fK6KJdXlnupCUCrPFQsU8ATZZsZtuTaPT7+ZG3Fsq9GYx6u7ubGF1svDYBOavl4prATr/Fn+2IHbbYrMxU/gFldbD5cL6coFvp5ooniiVl48WnigXTpbRsFsbY5NVu34Y8EUEIcVHVK0gIXMgnhwOTRke4d3wgkbCG6N4P2BQVx1FRejgpJDvTrMvZ9SMgnUSN/CGxXQ9Ujriw9VNPtyR4gWC6Lx4jq5tAWnjwoWDj9/ef+otvQ2pIeMBHNQTMhACcpvCDnoozFA1P81W8X76Zm6v2MVWmttV7aH2DNptdESVhuxuMknB5Nvo9oJkN9xZ5h7I9jVafhMaFWc4wwAYD5u43ZGka2+7amgM8UxnGrfzwxegMIF3JezmBm/w9e/3n3MHj4O64TW1EkUOoxD4W+jkSZaCLpl8dSE6R/DmFqfvnEf3TQ2JYjBfZBByRI2uhuwGG4jf8JrhuyS58Mi4NWNfHOpxz744unAIH+hutj7S8ytfOz3v+HUvDh/tf6Bt72JthxXR1bvEZAfDMcBxJ+k+9LfJRaQLouCKOwIE0Y7AFYmD2sHz4HzNStyNAt5NCOMUxXEUf0He3HIVIL7FAeOYgoaIB/d6IM2mdMAaMGPngtsfpnRfDN3UgLYNjFRNEs3pv6BI8u5XaFN5UwybG2HWoNuUF1zYDsgRYAxFecNw2MjlApHgLipiGQkaSuTiUZOHwUFx0PzkSEbadf+KHALdY/X341cG194enP2QRWf+Rs0V5iAjwxDp6zIoqTz31gv6CvnWC92wXHwhDcvdF3FXJdpnvhllq9r/QmFklggvW6XosR0YmyiW0phC0CjUP4dfDOGLpxYxMAU7+Ou1xoo9zQldGE0rDnT7/c//rjUW/QXo1W5XNi4tvZBxabkrGFaWS/U6wU7/Ogfg3gOagLfNpZMmeBqePmrEEnIbV2+XXZr0S6GHN7207Wsci3AH1C6cg8wDbnxCIqxROJpWdPuCCUz43L2rz9ojmxwHz7Y9YSLfDOMyb091Dr80z6c8u55GZFEbmBkBNjAzdLlkF8hOAtoCEQfTDw72luB113hLue06Rn2D+rGtinHfaGMpUkRCpMscAi7AqdSdHryzt//KjaFOawSWTHdd2MfcrmrgS7qTFnSRu2mBiiWdIMrJaOZn5Ny7RQZczbv6t5raGcmwKa5GTm4w8iHFXQLOxIzpxhqupm3+pO+cZ6rx3EuDvWfxppcXP8jdfdPImhixE6HrKC5BiL7Mewzd+L0AReniLkL/OuGgg7dQ5SYjMSEh5gUBiSxPkPVXwb0MYg4+IR3c6/b39H2KpoMS8aLhr0Ey5XVK4Vhu4K3vl8n959ZfoPWDtz90W6+alqtOi1XbWlWwlMYYS25KAmXwtrAO2iDbvk7UBt4WlqgNbCZzzr4iNb19pqljNtx85d7VV/QRWNlxZmuwbHEzfRYzFdIG3vwUVRQJhGlTWA81KcuGG1TodBtLDKbENyh73f4HRMsS2ctW4p0rQQy4XoybqoE4iOKJ2VT2zgEqWoOoHy++un/uXWAK+099Iwso2EIzH3yaQwY4yA+Q1/vDpjgsIEZvrHL2BT4Ir19oRXfOb6LAwaFYU22tO/jo8/u/O824iGxFAaZos1aiHid0XzreWCSBwkHagQxl4h4TuaBeS8AMPDXzT46VwVeqf3F18MzN/b8YA1wQZbAIVSdDQRLAgSQp4ZWgA1GG13L5QIhgvAW47jS/B0W4oY8lRZHlfIrDbAgXjrQE1GZUyIfvGvrmEi4y2QJ4w+mryTK9dWpJh4GLmTzbayBGFJvXdvsPFwcv/k53m+S6rQC5zph+o1y3hVGGbcedUnkV1xuU4sWj7rs9/WqEgWfiObmWsOnRlRwGLcLo8v6ntxgvuacT2NaapyOdgKzQwX0uz8RAGaqA5NdvQZ+dgCi4sjh+7uD8kweffa5d6vSrs/mG8fKAk07Ls26zJuKF0+i5W06j+G1gCH9FYw+CzNajHTpgnmZxBNwRo2Fkkb8lsmgaR+YNPLVmSziTZw9krRP6LDnfk4KWUxgzdgQBgejMGwffnNu/8nYeB71oQAb2CL5eM1KBosQdN8D016HB6GVC7etloloKz9jJJfIYyYzdSuWrxpPslKagNMA2vfRI3NbY82eOsb5Sbhi+74OPxXkBG2ZCKc1uAt/o2P1OBsCbOdRybyHXrHa8xkbtxggTLfIMyfsbMRFCP5ARhyOmW1SknXKcdyLXM8chXGzq/ecLLCEy4Tr78f4r/3B1MvxQxNnbZ8IpGhk1PiscwdcJ5gYahMiL1PT4/RGVxii0NDxXS2MnF6BMmR9S9F2ro82MqGXQACiHwwpZJyGGPKT5jui8jsZVNapt0fiSsn6Z0y0PUSxn8qrkEJozOexmcvqh0Qp5tfbfj/xGEIqPPKynR3dhKPhmZVdJAvJs8seoSCP6UUyS1CQ7BrKDNYpLvKcsWaK7GLXlu2kKrpbgqAhjpPIx8vioGO5K4I74PUb2XhoSuI85gvZSTsIu5gRrI1KPypuJGpE3WdqtDkubiRqVNq2w6UiajphpW7eNOu2YPEcCdMQ/K804AoyVWJxtBiOTjQhkh75tsnJSzTh5pmwlmaKRYYpaeik6UosRWPJCwrIrHiy7gsFyTiRYdkUBIwVYjjhn2eGkZoNzlgeyEquZn8P54ibTtob1r2QS67hXUgYXo1TaQoe7ksNyDLexY+OT+34SAE9Y4qEV0uhHMTCs1BhtDCMwTEDGZ4jizuZb0Q85KjtCYnXAFUBndcn7HxLekd8dDroyvo4NvHJIuQ2+cmgFHYBlfAUbhOVQLHnf52eHBWLB9+JTp+xrwamfPeiORcQn5P0XSfCeiMKtgzjJ6Lo9IjOSw87jUbAWBRLYgx7Fp3yHbkDUT+aOQ2hje/Qqwm251FBgkId14mTEErUa928o0rX41Ds5WJM3lWBqaK8j7lDg71wOh1mBNN292MS7C02aywATqLsRc4lJEfohRtb2ZSuDU7q3eCliQCFotD+/m2eq6BsL421OSxSZtUjV9aPdMtnFiyhjFWY8UjpJEWja+p7KTuTvBpGbwtje2a7cnoi7VSq0CQC8a2fYTqaZPj1jdm6ceXCGPDesZgztkJkRGhoek9T9dbvmdsPi/FCbQ+VSZQd+vRPHqlNz5dJyubTUhV9WLi0m8Eshe2a5ACULUmMe/+KvUT++glmSP1suzazCryXpaSieasAPniflN4Fl8K+83qivnKhOleDvccgvPn7i2NREsbczOVHcmihm3WKazE4UNx5bKhytFqbIwd4vF6ahuFYurU0U24sTxdYqJJvHqo36RFE9MVk8WSwVanOlE7W58jGoOW6bxw8aGAA/bFkHjpTuf8I8dN/gm838JI5agTikNnyq3j0S6cCCIVnPQm3nPTj/1eDpz7WdF024FojmAqZ9ywcYhnGzFzC401zKgxG7D4PRdh+WLFJQxOMOHoTFnQ2h8OSSApKuLvIT5J6Rf6RmPFP0ex5vA6SJ2vJDMpOHoCLpF2F9h9bzPyCZ93ri3XmFb8w4w7LTp18d/PWFwTtP3bugL5YyDWhj945Fxpx9NSjw8VcHrByCdSDqm8wYlPbZ1JKdTKTPkp+O7KYadICPfV3jsCE+NyDAINP/UJ/NO/jmj3dvfmIEWtOmNtNLoxpraVaO7FK7gq5tWF/sRi1rbBP8kDvWVzfxJZ2KmKKLF92UDgm74/VvmmvK93/37L2nzS3T9k19xNi0LEibGoy1TTLipnU9ytS8uS9OblLB9lVXAg9RXn8PMlP4vCSXaja4psnkJ4zsbO5jkQt10FY75uatr087d7AwSJSl6O4U3Rju+aCCVWSvKF2HTyvrtL+lZvLQ9KUzBMVes7bF8pqcob00RUPYi7v9Txv6tC35X7mfSpirrr8T3N3xeikZXZyPxNOONeQZRB/K/msvD67dOBwBP4HMh4ROhtNvQwG1OAMdNDiRdGmTIY3poH1Kqn5LoYY6y1QQNR+8CKsBg0nlmHDrUPCDpEu2rgwpreQPH2pxinguYhK+84davj599+Y7zqGWUHWSmOh0/33zui+5KJ3ZRnUmWi5srq0TeFRjcQS+vkZIThYQCnixlg4VjLHk0AcbTSd4G1nc4K1ktLwlaMCnIzRcwKb3/t+hYMf32Pw5+k7q4TyRyhuhCVUu4+1/0pETRjf4Kveb91556/7rzw/Ofnz/zDMjyFDYhhwWxkLkIJAOwZXAHnmoEt/DQNQhPmiPsK3tRk5H0KlU7y2y7Sg3ABhRPeLDRWrkPTxAmm2yFdQdBSJA1H+6PU3wATJ09uOD98+M4sNhTYYRcU4FGBzScaDtQDBdtUPw9Fu6/2ncAjLpnqVSRHnQ23OVA76ZKnyGCrfkQEXTx6foxAE65m3wciOd97n9N5+DNeZCAE2jZADIs5TEQDZLTsvNmGyvbsvyYVPD+sNGBwA+/RI3sxVLPVDW8UFZ5KvOKFPhzZocyyqEbzbu4OmJGPcHg3bXXkYVcshX3LXFAKEcl3vv/qWbg7PPmFt90e1AmBAf9REGRAlmPgJCs3jTrg5zwW1qDm/IfxfjqKsUFgBvbmsaj/stTQyhBpRq1QtnXYaAMYfRw4NCsGebXo/mqN3AKwaBIGz4/jptH/piDdqheNV4D4SOsyYnzO5dv3Vw5pX958/c/eYv5pBZHjW8kuW4gxiGD4pwz6k6hBFWbBFSCyPIpEf4ShbaGh7BhjdPXVzG8mdByb3M00EKbSvG3JRj1lRMpz/063xRpovi0dw4mcvXGCd7/5rMzYIxNToyQkd1GxhdWFKeLbrz0rbtNvmw/pEbZrMc4L1KezKJ4mst+h+sCvFBm0ErWSLzO6g9q2y0Vrsmuyf7Ql0xqdKWExrR+hclxtDBmTcGf/jrEKTh3R8LM7/l5UB1N7w0VGe7S+C6hicN3Jif5DbTuKMjoHSDumofaXr6yiJ9XTWu6VBlrVkeV/Zrl8i5AW2PXCTrLW5NM/G5eh6vxj59ZvDx310XHhP9Kgx82lOztyFi+wFAapF7j4GiA14NgeGoZhz0SsPC0FsmfDIyL7lrk/uSdR9NFd/9LIcG5Ghep3+9rLcBQEfYjmfMhd+AMlCLXe/O+Ygv+7574+z+6XN3v7poNsRT2p3pfgsstMVhFDFUVARe5AMNI6BbkDsOKon5+o5MDRtEfX1NZqLwPJqPR4qdrVnIAmbjbldKLbtb2ciaII6hqVCw619kerumt6Du3Xrh7q3nnA1aPAQiwOJuVsyDkqtIaSuHK0kdkooE2KOrIdVzgPF3uGvhnf3jwTMfHBLAx6q6rNOwmssqTDNA76wJo0Iv5rRao9DmdcYZV1uccfTEoqsjzuTUQ6MZuircslberDZYFpWt7GprRlFzlakpq0ZNWY1p6FHrTUZlchiDVX3KlgHkM61iYnQSVx/gL91R3Ic1dVc5z2vkji7uyuq555y0Pl46N/KwyCosffLdXyJ4UsxSETjdgtqomOlKmNKgyHNlcSfSohylRYIzZSK8FV2xzUhsVpjiMGX8x6RJdprKiU1GYhoJm1obDpZaGwqSWrOiUs0VYYz0MiofLOQlA8OED2W9hzNdVxwYkQXs2kv8b1l9Lqd12Kx4fVStj0fV+nTwTm+Auh1FsdL8zHAxl3+hbxaxl6Vv4WJUL+jwBiTwmxREdgXV1AiDcdmKw1CEvEugTEve85ykG3hpMI6iu3TcElamj7Nmz5up6rImqY18uZO0lNRQ0PEh6+kwWg04OCz02riY9cMVckHrRwpzUevHlDph64dLc3Hrx6DF+yW/+dXhgev5YN2pU/RWeuo3v3rAIZm46wdrajXTYXB8uVFTNeO6nG3ga0ybmCPXqOI9SpLLr7V3dTYZ4Ht4VyeFdKNnCkYTqV6G3aYmIzzQgmm3eYrkpOombcvI+k/b6KZY3+KaNVEmklMvkmQsmxQ93neaCTK+LbUdBTscQAe3pynJr2DwolXa7VEdneSgOXjWJNXjwcd1MIevHsVzQAmfEqEU+78q3s+AhdDhC1Qjf5sPsOBO0DY3BDPBubY88LcZyyDiR5kWmRRnCvT4mtF1RzM3enao7NiYoXD67nRWd013xiJIN7BuP9RuxlqwUqscnVuG39JK7Wgo6cWjcwsx/DbgeR5/UJbCL4DiOfi3Dnmz8pupzBydg7/T8puS36T8JuRXxt/6WlCD3wo8l45Vj85lP1so/Hwej6NMlEtd+G2WSxtxuRR1wnV/bi3wj5barcnZQmnVD+YKjX+ZLfx8toDpuprHoytPnNxawKtUOdjQROn4sWpvXo6ubFULC9XCv1UKM1NjI9aDauWzmqlD86JPhLE3YykpZikfDOGQvB3ZCeZXJZh9arY+6A30v8IjncckGnmXHSUpEsBNXDB45du5d/ev/2n/VSOEU4t8wpfb0SK3zm/6Nt9tlRxIuUVzh0q2iaEPkngLtHwOa5dgWAE0W+I1TUHGMnS2iUHE3Woh+nMA2fXp/qA75zDWRN3skO8/+/L+c5f1JjlL1CDCkvanr6MK+f5SUjTZVq+aQIzwAjMnfE6I7kY2cI6+vbDpCUjaTv/LvVc+Y5B6kDayRgwaZbwKC5q27/cgh7PaG/29sL+3wqNGFUEgWoVMqtlLszpVWzbXqqJC3vEsbDrn/c3gm9cZsgNzyYBaMs0vcaMlmY32rue0SkFkr3Jr7IATo68ejBE5yuygb50i59csbpBYuEt+XiDINMQAh1VQqEG9eZ5vMux5d17pkfUfKff9t64ffHR1cP6KAQDC9hZZDm37vZhzcsXcOIh5Nbfd22dWbasv/lFMVHQRYof1e6DJ+UXlyy2HMtsBgHSX1xq/i3r+2iFvKrpXNLRLDkavB18J2Ut40R1cPn3vT6/rRafvZqR4L3ECFLPCF2Jye5CZKfz4aANEY0BVdW4zUTEsBXOPY0SBSTVYUi6+YZg/7Srv39h0V/ng3K0fGR7axXIgJSi5hqjvY97AKJeKPMPZ1gVZKoEpMVezOpXQK1y8prZB2vfWG+y56UAishRgfADbP6BN38hGLH+9XS/2jKOf/Xy7MH20AatB62+4i9ZAhK9tYfgKH/lCRIoj/dVeU6bDOn4DutKFaJjW5wtQ68VdkPwRg1aI9J0OGESxt5HBeoS2+YgB31EC/7X0ZvP+n6/uP/87vdmcxQRiIt98ka/ODAl/bnCGTxnY9uQ0BLU2ZjnEzUjB+s3IuYzWRAKL4ggH5UB3dfq+9dJAT12UvrMwxrudcaVgA/rQC0indU+WDB56QYkw0P3D0LlXKQg0n3uBERxc+Ks+96K60CSxRZDt5jUuVXdZIvXBe6lpFDSocn6lIASzRqB5HYwB9BzWLOG5BYkoa2QcUaP/d2C2rFRKmb6zE9sEJU2HYHrx87vfXDLxl2D4Vz1s2HkRyNVWRh+KNKtCSVFxErM75kVUIHXz2PLn17hxY04m/2uJM0HJ/p5Jjy23Sb6xFy0Rq7JZfffrb/b/bAJTOK/LFk62CdoDmqsaj0pUFKeKhK92croSnR7YvAOLQ1gzKHODIC8qsogBiA2XktOS8XMEHFbKtqXatErIPTc1dBvWyr3LLxhhQW4yRD6iF6C+PBfW5a5vzL66JrINW5OylDmLZs6hMVDit88xRD6ek20qCVvWwQtUo4DuqWsEOrYZRuLgeMiwCKGuH+A5xR7aNjk8sd9GBRjIjCdX3GG0HjxhCXotXzGHMeNusvlCpQqDiw+Fb4v5ptKQrjBmoo31Ih2iqhO3PfhmxWnhDFPNXRPc5B8Mg1X3q7o7aKNld48Q3fO38LZPcpH5z/7VtnKjmGMfuvko5tQ+G4Ixhjm0L1bgH6N9dDsXGHIEiUAYM2/WSvDYb4KG+GxSPL1VB6jITubryzapHhp6oR5zlvWUTuHAYtn2+Ju5vC3u7Wh9o3A4JFS/eg19+J+8rt34H+jGzYdh+Ui448VNCwslIguF19bdL04zALGkhNrhmTcgVUiWkjgM/Zk8jsAgLHaDP//uod6XQ3mRfht9yGE88e2xAY6+t/pgVAerN0yQJzhpC2QaU41E6CIVWQF9RDT/FjE5Lx/nhOPjLLQeJ0n1uIioxx3p1Eimrli6YATJBSNu5vNcsc6R6TTXApnQ5wBNCXKteRahyiOymiun/cRCzKgEkxdfEPVQ314pogXx3VboZ0awUDM5KcUIKD+Yeef49hDTrvGIIvusaa5q+G3N5dKGQQ8xubLlcMs51lZ2uVo5zzgN0xRzqrAMh6McykbyHMRhH8bXkXZDDEPo5liB4QI/NoU21Pl7k7Ec9foOdEuTmxyhyRlhgWniFIgqPdYMO1xlyBA7Ujxkih1TnjPGDpcPmWPHIMgG2V8/0CDLrzVOnaJv8tSvDzfJ+kmEfsMULgcfMRI4m1Ixcncgsc4lYQrhmyTbKpfqlCkGQSHbZnfzhk6yrzo2pGAMNu0zF8CYrAaqyyZDSYh7ey/AaGr4mQVrlGBbZpZoIy099yRGkMmWBJsrswjDCqEL+LqTdroDTcft3Qy+sm03Ay9E3ZQ3MKrQbq4NznFbCfOVnCwzrgpvAgnqgqVOsv97QGZftcrhfkxKcSdS6D2bYfmxSTbV3QgUKt06J535tJPnTJSeEzsJdtD1iOuBNSNpx80dIHckch12+uZ0RSNvUH0ou+6xlWqlrp6owd9l+buEf+V5caW6sAG/zZXqfAS/GPKO4q86txbMrbf/ZbpQnV1vz64F8ASvNPBV/f4TtZZStdUn6pDfULX6SnXicfidXKmWj8PvxPFqaQV+xxpQ+fixlWK5VOzBbxt+GfwSjFKE15OWip1wfW12Y7oQtOc2KJD8FAY5Ks5M/noCUlPw/+M7S4XH5gu/wvSJ4+XisRWoUR0XJL6pVlVdGYcqGMbV1SxGhV67VeFuYSNejfUNQs2gA7y2iZ51sfWivozu0y93TOjbJ6/ef/VzG/eWoYicv4FOE0t5aOQiQQXknBTjYd0YGHWdrkLsBGHDCynkRNINMW5pQMfiFMZFkRN8CQqf6Ge4ybEgDBZ4IPCdPYmSl9TxHJPxu+ak8bvuX+UM7mmvE8dhy3peU+g7knLFhfmTZ++/9qnppLQ93EkfPUUy1RnpogbGL7h9ZLgjfXQwcHvJaLi9bGKc0RiPWOuOghgVBj7nmd42FebozkaRezMUetpImErp7Juv7r/+qTOjGsRwf11Qw10WiPaVoCtdJugjPXbxyHWZkHG6rBpB0t9bTeMOBh9A40+QUaSNS2Qr6mRJXUJ1Kq/HHnwgeoV1PxKHPX9Xseaa+BIECY3cN7bFPC1nAe+/+fX9C1/fO/exPhH408EVN3KGaK4sTAI/3pD7uPykfzmApRVvDIOItxAHBtBNs6YLgBcRmRzk/N7Hr+1/8vrBZ5+7EDA4C3pEHQKp69NWTeplo1A9FeGbDnSkFU28D3Y8GtJTxsNE7Oz/bTXrkg8uDSWKF70ue/sKvKh/fTWgLIYVxVxHuXDQNWQVXZtAcTtDPP/+384NXvx4cPbaTwVHzxzB0f3xt+I2ieMZaKDcrr/lZ6Q8pVGgEokj/kqPw7LLkeH7Fy7vv/17c2oYt3cVhqpN1RaIPPAHxr8B+hK5yPhRhs4kGJrdh2XIj2ROqZHM6oOU0uDI7cFWxpZOhSeENniaKZgq0ABCp5OFfK56zdNIkWfE3xgloQLAWDHMgjHggDjIlL3/aZddibaCJFFsIz4yz3Yq9HDBe/VaeMYgRsvqFlMBGFk0hAV0TgBpQafDgUsvkvt+Yszjg3deHPze2MYPR2MUukCD9Y0nbBT7rz0IpESaYYA60swQwAil4GBsx9HPqn1IxxOfzuiO73o3Ck6IzaGZ7/vTV5y+ZzEh4qLQ32PQiJoD3oCjG6gJBaZABJLOdo3AlM4zxM8/sa6H2SayLLKL99838UCAmat2A4a6Q4dKGuQk07AmKp+t5vjWrr/RmWS9u5OobQmTg6EZary5lEVsSb9zHt09b5+ho/1v/Bk058H7zw2+PG0mQmMzwnc1Nrgnk+dCQdi/1ECNsoO4wLCgZs/vo0HbcmJYDogcYoaHXkY5ssUzx54IT5c9JVkX1WnCAT86HdMDs/t7Op82A0m/HK4PajJZKeIETwboQgnzeDFYo0g+qF7jvWMvk+Xs9Rfuf/DO4OZ7+1+MxSE9DAlQuzMiVcMvIEcXV8v02xBBJHBIDCKABYzHgxdQE+cLdH+gXHz6wV1ERDI53gZNHH69bdwc3vUDXkoyWXI6aWQ14f8YhT6/ng6+uvL/u/UkmA6tKMDUWVGJCpLV0SHE8NurDxzCGKYQq7hj6H6QCUhouAMyMootdg0cM4yDZ54dHUZGb0TiD2AEr+E9jyOj6OD1bYNIGB46iHlE3VFkRJ1RBBYMAloHz5U1s46HF/86uBpSTsfCc8haWh7UO0jULHqakstLI1NMMTzYEGfZ2d7gxdc0SR+HSyI4QKaDhoGO+Q4KUpnnL249GAl9wRHhoA+ekHDPAq3fxa6ifTHckNvsqZA8EqWQNtOphpiFqQK5MHKNBATl0IT+l0xSOOSVgBwacepWdXSK/ddfuv/aJyZAxQhGTeeozjikmhgAK6VjzqMIYVQmv+EvjmIkJ3VchGSIGCE9RCSBPcr7yrw/py8eQNmLYlLRsHSBP/Mdy1lL5ypdV4Uh6qAZnhbrsbn/zrmUJa4758gh5su/gsR198bHY4EqaHJlGCbeKhrzsLpAfa7qgkQ/2zxQfSE9Ah188Z7sA6OrlpD5hny2pEE25MvU4cBwhfWSCTZaIxc408or5M+8O7jxiauqUtOipFLTWjltmCuLe8BqRC+1rWo7AzVIWukhOzyrSu4aFVPDs45JozZkzphxLBnGfKD13bCekbdagsedZJtI56UoTW4t5XR0o5nnFebJnIo8abTimmjBtbzaa5RdaqXF3uBj/2jN0SiNEmgIlTG6ogJ3UGTiWHmjW0n6H0geq234VaG9P6GDOfCnixcdZxM5lc1oa1aFWtG604rWmFaMqpTXj4xqJFvAMWkycs6EHf/HaC/frrJUHfXJaE4aQRT646YXYwRqPlJMKgErs1mdg08a5YBhSDhn1AhSTwfU0nqB0QkYgojfORAsew+DMFJ4HgiI3tsGiBHAjfBtnQGA4mWb+vZcI5NUdYitDovZZksrkGhiVlI18qkYMFKyUWhhEG8DoCt9tBCoy10JNPKbTVmoVuYzot6QJDVpvj4tPdX4hEwzwiN6gmxOMpoeEoWMAJSTLiZN/GFHpqANM6hA0oR4XDniwvSwfGCkAh0TOCQNGXePYCAoZIQWgGnAkbOW2XeYa8bIgl36txp7ppbDZw2LdbgZfF3Id1wGhodCkrJhWWiu1VUi308aKVMIhzsZxjTMIKYdvrBsecGy5QHHHNJvqL6myzWiyDWmxUSd8oTdUN9v2/PigTnx4F0vW+mQfS+nwiE7X7kaY/e+bI1Ddr9yqPL+12MPt/8ls3/qscN3wGLV9rNewFsS+EgHA+CRbrjd8GWzQpK8QQVJCjgEK9WU6wzxevd588juBNFuEmVKcRbg/RmR7JVwRrapn+M2e8GbFyHHothTkZPgjTJIcVQnvkg5lDRf0RuojWxTN8dpvnoCq5tbJWICIy3gFc10mbCcQuA030pBV4VE+pk3qHA7yN4tojeIeOeO0OS7LPCJX2D03dHNj6QdRjtAdnic/tvOm87azpmeaGwtqhqdh9qEWoxnTs4WNmYeny2slgrNxkIHflGzMb8Ov3C9Df/PHPXX1yB3fmZufmb2NzMF+D9Ya8804NeE3Gn5TclvUn4T+JufKdfKK7uTheOT8F5JLRQgtzRTXHpsujBTXP71dGF6crZQLBX+rQjlUWdhJlyfrcwWlmcLarJwVB7n+M/qTGGxuBGrY0cLi/jWEydLpQIGWioeP1ZdNDdpFCC3WK38er4wky4X4unCL8beWaz+b3Xv2tzGkaSN/hXEfngdgX0du2uPZ2fPlwlcSIqSSIIgJdn+omgCTbBJAA020JTIExshecZ3y/Jtxvcdy1fJtmTP2OOxZI8dcWCH/8cbIin9i1N5rawG6PU4ZjbOiVCL6Orqyqzq7sons7IyYXEHHPDAazNhR3uKFY0uAeidkDl9BpQviRntoHwLvTQhrGGM6dEwfDTM106spugCDMjGteVjSaNXxXcv5rti5Lr8l8Nb7/tY0hSuPu5EKNSdeBrf6oPfCqTWqhT4QUdpBzucwMojcMobX6NIhMha7O+HEOcEDdagsuUQXBok6K3njbydmTd2dZaAJdymGymM0GyHDkdugcVKP3FzlzLoxonirFj+YQcobWFNMq1PzUOMYWw+gYCRNMC1wug6WQXeZ+gOizvWOxyk5C3whAWnqR9eGmCHqDPgO/XqDdel/1/3h12EtD/eUciJn8jhtAEFUTm6N476gEKo/FgXfC1lPG4nDXN/xOFvCi88+bPTy8SxAMAi4p/D/o0vbn/5ojyH/6/z7ceb+DaOWcQj7BNPzG5KYR3cslq6YfO/q65WQ6dh7pFDozV23fnkqbsv3zDGLr2xN1NsitzKg7Pw+rzZBqPkaBcM0TGT0cjNkxBFIcPoKvdCDAUOUwK4dJTA5VwfhrvKO0lFLYDrsO5B98fZ+Iq5n4I8w/vu2yWOIKoDuus7wPwSikrH2f6nf9x/9/H9xx8r8gdhbNbdjH065AsMIbB6uBePMOmr5YmnxJALnAYNA7LrAynLlg8zLNbBP6BbdPK3lK1Xf0je+PQjD6DgiI8ZMHHhVXEzs22EhMwF31zwsKFVfdiuzfB1iqzYgSAPlDf+CLkT24zzE2LHPfaOXDxC9pBuZCWPO670Vfrcffu3B09/OyEcDRWYIdwUQlv0p3Npl1WLTOr66hQG+8Faa8ikLB8rl7KCLINHWZP801BRXXw1/GjZ6syOpEnyzxLZSFEB1jQnbm66/JGmOQG/UMh8AC80N84eErgviTbORP4Zso8EOpOmbcguuuGfIWZ8jXHjCcYPoSU75o2MOiXPEu2IIX7ovepC8Bj6/On75M7fg+m71tnhHmLyV8jDEWdO/jrjHLOiGIyCqSwTN4nwt3n3lT8cPPuCfJtEbbFIZZZaJmfqJI85ej1+E9ogfRLU3t9lmwV+veS0qkGLL7zqnpLusvhZH7FvljimNonjXpaso4wJ9pJKqd3tN62mlJntfZBomlID8/a+G+8eXrnhAy/TLTVDhowI/rf/hTYsbZIc9ak9WX+ATxu/XGG8F2WdNBtAjqc8brDntxTBdt4G5WxsxxtgeXEfLGbB+Ghb0gCNr2EYnTf+cPDSzTu/+WuBUEZvQkBoD+bwDbBFucnkdJGkbHMwNGm3wxlLVwz3RFYM97B7Ylgq5n/yb5mP7w6/sG7XbrWZaKBbMumjtuL4HOWBMimRcnrFbR6o/eevmjxQPdjK4Z4vt+04OpKTI1gYptDGEH2tPQ/oJc1BetBUp4zAS/TBReIilDz/WMVLJ27Su2jSFr1rOt6cDjCVPOSXS6bAeI8llabEWkOi+EJMzewwIYMXj5JpixOSbHGaCAs0TpVWYgpEZYOJ1jgoUN4BW6mnSYH2pWoyXWWZ1FKsgjIF5XuIT7FV6dr42mBYhPZNCkHm72VQX2REq6xMwfAWvtvnXVNLnD83PwtXAqhscXIraYPvlAJDii3GpQoLaXnJV020roDA1QB8KvD8ObIiQHo/CvP+rq8Yx/dUUBQgIlp66JGJGqHIPZZW2s9yVBV0dw/T4s0sAcgIEcbsjwj8mMW9lfNGyP+N4xoIXyN5/zZJaIXgFAnYDGVSMxBCTSt9mkbqqMCZnNhXps/pJ6fN6CfNPL4YiBAVHgU0Hpql6IMtfJ92AtZ5cIoB39wBiBdm0aL5fmoVb7yfftmb7o+6Lob7qde92f4oBslo/8ujjPZmpsJ021tR7+wvjzbZgwU42fSGdrAXb6m1uGct8L2+bMRYzzdaUd//TvQWjgVEP8U0vQsJpjeG/UjPJCk0mKYxawJunBmGZbKbJR2BZofJEjqmgLe0rGOaBzcj9zFuzrpkfehHySCJBrLhA0+It2jXkTA/aYeIe2PBzs7JE/gkp2WDZM11XRNZw4ksbEAIo139SYZxx4Aa0Ok37+dwPYSE2lv+hC+l+RDHPjInOo5qqKctKDzkOsg6puHgmYHyo+RHQjvvO+s7p/2RHniGPX8/ydA/38hH842d4fwSHPloeX5x2x3Z8vxCOr8wODVXnu9udprL8yfn+/j3xHy/C3+P9125O+aX54/F7lhfnp9ruaO9PD8buWNteX7mIXc8PF+PjpfPzNcfPl5+cHm+dsodp5fnqyvuWF2Zryy7o/nAL5bOVcu/fOAXjUq2faxeHqS/mi3vVSDBda9a2erMwK9kpbncqVbW42ql3apW1qKHWjOQRbtSKZ85UT51ovwf91VOn3roWLmyunI/GPyby9PM+w6ljT/suCmV7VAZXiTcAgH44k6Wl87jNtAE1jqTe3jtny+x8cretouXoMWCtZYF+PVNMRw66Xtw4T21GhpeyLlEGaDw46hzeNIgfBk0UHXoW9ouefoMs5WsA9xbSvaQgwCmSTb+bOTA2lovmhwD1+1ULkK0PjsK7s40uDEcB1aMKZ3rlIHok1e5jMTdl6/KSDi45lsO+xjwA7l84RKlcTtdYGnq4Bim7OggL354HC8yPJjhidNBgp90g6Nq9/spGPEphZw3c1FddLOSQsCKAxg2CnsqS/4QKgLjV5JN6+D3N/ffVYNWQBV8AlsaztsSjjvQxWaBcrKWcP0CaQc2szMhcfE7RerqLYk+bZuQrSnqOSU203h/WAikORj4UM0z7Mq2y7nzMKwj7M4o3syJedmc+iI4bmoMnbsvPFEMoIP3cFBi71wX8HKPcasrcDHhU8ccsEedp89aGDGgankGKfH6pRTfIzAKuNGg3Sd5DH40EA4CsQ6/afCZmuUG2k0UMfp3deKebwISsvXhMSZ0wemFbEncLWHiyvF1CA8+fgveyEuf7D/3m4OXvzh4hu14lqORGZgCO21mJ/Q9LPIzsuNkGRqZOOGeMR4rYkrGagjt9CkaC0dy6o0/Hw16u66oSzib6kDqhPE1KnDnWGMUbXCCwbdgXYXyEmCgyvE12tL91BeHLz9+++YTt7+6ENLjFBmGmkmS4SlKlgwl6WQnJcooEGXjLRHUZBkptDmiQFuQSDF3BbTxCIuHHEop7dqKDkwPMNVuHM9y1tMRGp5GHPGfoPnhy68f/v5rSBbJSf6QWkyqYk/7wo1zP6Rt7YM2LR3AVqUDyfgzcLjrL3GjDMqdPj2+ia7k7hGBegR1xp9h7OIs38CoM3HaRjs3hmu5tQ4bzzAhS+mH57ru2yEj2qU7T7xw+8tLdx9/Zv/FD01QfHhCEGqbA6lgcHzKXovlcZ+2YuAFTsgI1RcxgEN8rp+b8XO8GvKcuV4oI80H701po5CY7+JkYwDKUdKOKGfvHjy605TScF2v4IQl9rvdKLv3QUzT0NcYSgOYJwdqq3ny8YOnL8mbb4nCUhNZp4uEab5UW/YE9aF4vuPtyoOfKj0XNFcSEzJXxmApsgxAbIrSBN1hMoSdAWCGCgli9ZDcLgXh4pn5w2f2n/n9JLXZAqnZgIiEM2vHWIfd6HzT5FXNbUsYXWwbsI2f7amsMNNTYRrO8FE/wWJJbgBZTiC2zKYaXv/w3sE7F+TZURv86GYtKe2NKRn6/jAZThHlqYijOFKRLqlpB6Lk236F+GUH/uPXU27p4n4t20vGMe4Jop+y9BQSVK4hgtG39OVHHYbRvA2Gh3lLO+5SXmJ5RSzl+Sn00rmQGr+NSEwld5thYMYW2xGhRm+oNTU4sTrDw6zoEIPB2dQhxiFEv+tLWgAjBeLWeQKIhFA9NPGwNCupuwufBw4uSEsdXICWLB5lSdzL4vV+zDiQTVW4DRWNN5xMWOPQRJnewPlg2HLlmMn7rkDi03yM05kxX73z0cFT76oFq0g4y1vinlkkvZOn5E4fkM7AX7ZqCLf7aAPzhH94lsygSPjgyW+C9wW/jdOTL+vES3o6fFdW2MMa0p5iFCaE1ocv/WH/ma9U8zA0fMcCQtopqWt7pOS4S4aedIoISqcc5nFgoNvidcB8O4HcsrjOeAE9i+Vylwx9LbqOi9EYGOuFfMgr5bz0fvDkBTChSoQXbSBY1bR0zHqmocZvJdOTd9KQo5eSqcFLOXWRQBVI1hWcGojpexPWCGeMdjpjNUNVCosaYSVQuSqBhlWxOt5SoEqpFuWBPGkhgfa0JIB94C8ajaURaCqqpAS6gdUt5i3+n7ggUF9RfgikY4LlR+DnBqfCnYTxR8F3BcgWra5YpLpi8OmKR6YrE5BU0SiDw7pi0DrDwjoBwkaIBBUEslEW4oImbd5rYE5SCgbKZwi7ThWwnsV4HvQ0Q6DTDIFNU3BMgF4UuXDEqCHt/hjudiOO/Rnn5ANEVxQtKFBQwT0j0jn8oShgJhDNKpWLU09slnGCqceXm8nnyKlOBKIKQ17g8EYPebNp0MMLxmyikkilUCgJZoLJf95M+DM8yy+a6V0ndn55Rrm8P47/uvZtQbpUD+ZRnUHt9Fbzc1rNz2M1mb9qwcyls9akSZ/oyexaMOYXL6oZf+KCGvCnXGHTffGKGu2nsEDm+geOMNfTYz971t1x9uwoOvvAjznXYwT6bpp3Omht1ZI83aOITimZtfEXGZOTuJ9ClH2KFgSR4je4iOLEb05c3dSLZNrf1V/qYA+W/XbxFI3x5yCafao/uU02H0OmgW0NUUWnlHYYzOD5Bicmxt8UkamP7uvqhU6nKdmlIfrSeeou/kT7fz/fTfMR2/zxN+c1jgbkze+GE1vWArwtT7foLMWL5nSDRhZOfIfpnFcQsIfqqI9n0hF6OvJA9GnIuMvAyhDKqNnx0QHR7muHtYu2O5Z75dRz9pOM9mdOn1pdrtcataXhSm1p+Xh5VK8tDk6tPpjWawuZ+7vtrp6EWlzzRL12fGemDGf12nzHHRv12rHYHetcY65em43csVavzTzkjodPrW6nUP3Mau2UO063XUUK9F9x1SvNmWolHw0fmC9Xq5VsoVoZLFb6950s/6Jedle2qpXN9ky5WtnoVNbj3WqldX+lvBbtzpXr4Jn/8EPLZ6q106eq9ZV6bWlmuqEePS/WejFtEUTLInjRYVDLNcI7sIOIUv2Bfy3oA3zTjITI9/dDtH9YT3btZMkabmCKO+0kW3Mq3SbOB1GyU4II42gwG1+hnEtXuqDhdciZAaa2K+/tf/XUnW8fv3vhNQm8GbCp3rBcjmvQzGdjGlsNy8nxAu38hxf2PNU/835FcjYD+2g3Ggr0zOYLC99wDXPwMPos3KUYNII9l7SqfU7c62DP9hyuJ9POOoGjb9wCv1MxCkhXJl1fTeftOjo/PF55savqFNqdd/sn7EG1GTi9MnFxem0lo6ET0bAzglyz8hjiIGEGVFo3gYCWadKK+qVh2o3z0yivHMqAexyZ3S7l6L3aL40/g3jg372I4ZUfe3T/9b/efee/Jsns+HykltgOGSpGSSdyOmiXsrQyZSC8o8k5RxudpLteUi7QpXREaPXiGuUZLHmOOFnn4eXrd574kPiSlJ2Y3FqoUN5XGE7sOBaPuPj/XHhVlJBUPC4LN8I2v9OY6ym4048RJoIzQ3T3VTtEBS7MKIXN/ehA8c3TRitspT91zJTDYMiITxmyXLIbyl+nOfCvdgwZDDGsCGgfEGlLLRDP7z9+Sy0QCWU6xLcX4i+gGyIVujEejT+0JVyNkkAggTbmLG6TV4dSCjzbmaD3bM8ozM+kz30mkYXemnS45/g+dBOEVhFHe74H8pxoQ+MrbTJPhy7233yz/8SnhhEM81PT4D4cE59StLVjLZLGaPy4FQ1aFA3dFI/1rrlPfsR5dLEUf7fjXTfNY/h9DHx2RZ2r73zyyf5XX6hnNcXBTaU5jovr28Q3qStVaJk2gnN8q2YtAf8eKRl6f0SNcoKBrPMR/GTbXUXOxUCPJ7Ga56+ij/1FN5VrBy4eXtcwatwsOFUltPNeG6fY2nVtv1gHbLYSsyIgxFk+iZBk+cRADJQoMsUQGusJKTRQzolyYXcKlI+v0RSBd+C6sFeJoBBrb7XoNQC1ZQ8NSpId9dEPwJ70h/eKdMHWSs5tnmQ2ck/MRIkwRGNfGetKhAhPkENEEEEJEYH7pbO8I8ZB9gVzs3SS5S2nACNKgC0g5EkOqzls8m07eBzeua6m7F28HdY9YWcKO5CR7deNeuAyDhbgG08ahzLLEoAXAQEFnqTYs4EwJaJSZWCjk6fZBpuKDAd/ojDRSNwhE42z3YnWdAF7yOdDMDrHGcb6pnXkeNNB03wbgEInbZELgKvbybuScvE5igNxvvTDSwgC3nz2zpVn9i///h9HiBfIkZAskHtCG05N4xhQQgzfYLb4klasxCCEFCWWF2ryAvfBG/f7S/lIFzi/fe7gSY0/848kKF8qEtQv1UDDdPyOkxgtN9P0koxSV00AK7iOr49WsS24iXDTfb+2BfmaCGw5aYrTP26gALAFVgDIO/LxLpvNDp98xoGuw1e/2r/0qcZPn8Yk+z0cyaG6S0xlUP0mCvzhS1Hgjt4MZUxejgmuUpjt0KfebAQLWKNAkl54srtiyGEGaoPZgjKKOp5BuxXFzfFbhs2UJqj9y+/wAD7x6Y/wGfvM8Ufx6e3iRzCYYZprehUnuGRzeZFJWQcQLsVqHsL0AugQ8tNhRztL16IpG/wU3/umPCMB7uAB87jDqxlG0QnGKbCye+applJWhYbfJNFogJosY0HmLqOVAKqY2KKFyCLYt0c4tbhpT8GpJuJBUKE7s4BWIJARw4SimIgFYpiI6ZRiMDBLYaSCUnjaksFP0Fe59G/SVFVJ/Z/UDFUpDFW1uuQiACWr7pWMRa8A1q3mp0rfhDqD37zVP4oqy3xBy5k32pIqSpKti5WNEX4vdUrO1cXIQhDFsKiAqC7At0eMvmMPv7GQcl9ERfyt2JuzTjNO9gA5gMUWcCsIVpx6mpDn5B+LPhV4huivYWBfw+C8hkd4DYvtFNYVARTNmOMPopZ+MAZGYZ7H8ecZp+fwSMpd6KZSDF9Nq8SAasWiKAVQRvRXVeBXvYCfEbmOhQpZFK78o6GDooYjpHFtuhyuTRW+qwWhW50QuFbYyjrciBMB8l8UQlQQTYpCK18sywVhZyx2vMlC+LEtWT7I1JHKLHla5sbZYFbUCXFyNQLeviypHLEcMXFV1yMmr+iCxLRLvCIxcUmXJKbxQWsSvzhiTYLuiPyixC9+ZPtAlO+SOZo93m0BGcsjSGMb7+XQOdwrwGltYcLFFQFMiSs5D6hM4vVE6/FW6j7ntp5Rvfxcvq6Bb+AECZlb+YTWB/KNIahiW/qbE2gkm9Fuko/kZypO8NF6IgsHfMJReTb2OAsG/pIaSVui8NBvyQ+xjqfb5kQ3I2y6h42dhszE7WJZUM1JuLBOP9J2IH3ZGo8zn0m6CHkK+gTM6Opg8kj68dIRkjHxQyC91m6afhU7EDDreftJqw8rzaXMHcNTq+7/WnUR/taqCwmfn3THCffvgdly9Xh/o1Y9ntSq8+vu6NSqx9ruiGvVubXqXOv07D8fL//qePnhWnU2qs78y3z5wepM5Xj5oVq1frq+diaZKzdrqysrtVPN1eqp5qnq6kqtWmm4Y7m6O8zuP1lunyhnVdwD0D9+rF7u/vPJ8ly9srXpaCcbC66kXumsV+L2ydlya+1kPXp463h50xF48Pw8RP85fXKuPldeOrVaXXJdmKkvN6alp8gSyVsqkS84+RJ6FOGcji5V4gg0hHFzkKXLPkBdHN9etxsTGNd8TFcw8I/ovOoO9PwromFzaHHLgFEVCuRFPzDkrVJgOWB1YIID0QeEA3UNArk7IHdzMGNA2uUrkGOUnGC7iSPSiijMIIZ11Evk7MF3TrkMK+R4VUIbYLJmvQ52HkpKOr4G6ADt8988evDse3c+f+fO538ockdSsNVF2cyNk/HBMIL5bNEbLV3AJHUY45EYaSIOQpvsWz4R6bu/JaKCxGBYEVh0ITiCeyZpC0W8g2Zw6R6+go/FXSOw52gma+AISBFQ+BasCJbkdRwCsNXyFUwWDIDMQezvP6JN27J/9dlH95+8dPvbG3feeXQ6T4tTuRn2I3QA6OZr4+sOB2MQenw7CmxwUBjPgOS2QsKyBOMGzmH08WcbOO4OZOTbMBqDHn4dw6SH61DZGgag4JzGoxE6Lw4hvx0GoZRMp+50DbxTYSEv4SZ6aZpBCPm8Q1xFcbfGwRPXS+OrW/DGDtlWcfDEt/s33j548iN19CGGIIhQjGrWLCdbAW7Af86NBnpXQ0qt8bUVeUmEEYgZFMMDabPvOnIDe1BKuz4aNfHhXpk95eH2Xy+bUJmwYz9S7+RWspPFmLIC/ZJ3JK6AUyjoig8qwAXskwzgHPxzJFLyU1fAPUdcPQ2lHoImuZtShWnrbjawV9speUJCykImQBkLqfmJb3/RflWZetGFHzm+T/hR+fdpROGVrxRfp8ufmtfJUrKmmwLFtzB0RWWCLqv7Bcqi9xvi4u6JtGUpE+OElpwUHF8BFx+Z4SkcfB7FuIy2F/dydjAFNzjMJJB3IlxXdloxRweB+O/pBmz1cK/WKioJObjmXM10782nnx/+5rrsvTG0L1qaMwU6tvljQbO8wEDN+gWGxH2buOZkUwLCaOZiOBy6d98pBBS5Vap3Y1vfFadQChuyeSuXA+TfXYT8P4g57j7+/MFTX9+9cKFANXOiibQCSF4P0sF9/6TrTdQRInRdKaSwbV9J3L5FOuEoT+8lRS71HulaFnurvi/ELpE53xdCFL2UfQ7xQ/7YG2bdl+x6JIbZIsX1EscwnSC7DgsMjWm0N8w9JW7M+nILA+K1jgzIB95P7hVFECZ1rzqqVzU+mcS1p/Vuoj4t+TPcpGTyZ5j2jDkh3MznWptoi0eHG+PRySKYTOAjpA66l8edw+fKY1GssJWCQYfD5H/ctkEx7tx4W4Ji0HIh30lO5Y5Vbtm6lUvj5FWOjXuPck+B1yORgA+xKDLC8qhuvEZYmE7Z2ccIC98CTUQsLqiz3ov+ChgJiadtes6OJR9ObBo/jaN5oQE+mhW6OWBltcCHf+EcIzry3UGuMh1cJrFBCjewlqderNMWG+KHL6cFiQ4+lHo7ssJtIEdVDlG8iemZGeQMiTfMgPn57Vu39i8/45ibzplfHJ3CmllLneTMLqyGfAHm2ObZboI12TmonPGYdaO8new4MZyUJp4jDY2DNcPStCeJKNrffsTzNOPXgW1W08bP/WwXB+/S72TwJlm0YwB+Snr9iFH8US4nhpPZnDqcyGk4lo5RGcsYRChMR6LtuJLx5xvhFoGptdIN1W9+eDaHKP0fralqc/f9x/ZvfCN6DdV28BDsdYBlUa4SJV5UUGxIdWGLRdLqc5B4LlNAaAgyIiR6iAin5gYQ1W7B6HNVVeKqqrdVJ9U1q6iF+Kl5pPJjda5Av1K96r9pSVUHzvS8vp4i2JoN9QVVFY7QE2i7KA6zfK+1o7WCY1YVmLPAWzE3s/0B4NoVRbgrHvuGhQbsTkG6Pz5+CjBnA1ipkPLvg+kUzgWoqk4pYXj5IChFBFU36ElxE2uI4+u41DBl9UGwSi1AIgpCjIapRtsAg1jMcG8RMyhc4NDwMpHhmomf/aZcwDOV3yq7f3Y7IvFU2BXlyXJRhtSmiI1jgbCoTxURVjpMnXeXi+KgdtTUeiyYTFcmp1A7e+qkptMY/0jtXz9L6QQ1aRzHykeYxgvX1DBeLFez+OQFNooXLqhJfJI6GcTvP8IgjhOxN4ff/yM++vke2EM5Tsqet/kmUQv8r4ecqjjuSgFc24PSTh+N0nRCXumbfahE7vTwm1zcMUjNGpuw6YRtsAkmBmZjNZ/0o5xswL0kOucaG+qJu5eCx6xF7dRdYk/8NTEvA3t7McfRlxOxPLexja7+Vov0Lpnm1QpNpygCcNPAOUzcJFHmoYBGB0P1oM97Oyhw3YglA/Jmko84hj6f0Si42nAf8cMnhlEZtzZe2vKPxjwXHXkZaz+4fix16GSgzMDoSJh+a5+DHnnuPbfK308ykc/WG3m98cBceWd5tr4Ex2x9cdsd2Wx9IXXHYLZ+sueO/mz9xJY7urP144k7Nutr0YOz9fnBfHm2fix2x/psfa7ljvbGg7ORO9ZcazNwbKxF9Q2sXTvljtOz9eqKO1Zn6xV3udKs7OR7o+HDy+igv12tDNJqpd+rVrrgnJ9UOovzEGEH4um0W5V/q5d/6SabY+ic31yefbBy+tQvKxBJZ6m5POeuTs/b/DdrZ3zm9TPYPs2KCDvc3voAFCKJxcg3BLFAvP4zyp3GTZF8h7hHT6o72cu5bbtrEexzF8pe5zaUxaiGpHWnuORlc48drWXjK/C/O4OIhagvs4VOcrRFZMDLR06fztM+hU/zadrYwKdN4GXM1EbjUorXSt1ucg7McuslScX7FqSNwUwrkqntzuU3bn/5lGRqU+6uTWMNHP4LDPnuYMpnwwuzMUwsB3G3ZJigkL7EAWG7dKOf7OUQ4QESE5wiYDdy0oKXuvdiN9snI7yQuu51sWrXPU4s2gKHjEG6QXtuqYFkj/oKNP+ED+b6c4fX/3L40tUpJHNxOwyJqkuZpRl3KMpjSJT9zIQoB5xGkuJeNoRwGF33IvlOUg6u1mQfIRDoWt4yndzN4u4otz0c30Sng5bv4aN/ufvuc9pDS046GBL0/bP0wG7JfkKWKActEKLcQySpPXQAbwciqw5xd0jPR9FG+xAE8EjhwtDmePY3xegSQ7ogfXhDQi0jqoBpvTKf+G8TbHtrmqb45c/3n3lUDZfc6DTrAzNDvBQUaGHmvzM+MEsF7TlllwFRnB1DAhGTfBss+PCdpGrIj7oDpx1CyAEnYHql8znEWMRp8HpQnaz5uGU/aZv4wBjsB1CpmvzuvvOH/bce8daEVgoJekGt7kebpWijm0pIKE+7P77RpnR7QwjCQfmdIbVclkOqNVxrgj1AkZNMpWgzoeyQyb3ITDxM6QbDC4DD88rM3Quc87sTM/rHZGjZDlrHfeku7EUgLyL3EfXgSzqH7zamabv0+/13f3/3wkWZr3qY+KDdhyGS1GOYTQ0zhYKpgZP5Rju6iUFuS9oxG1ExWlEW06ZyTxU8etpK9fCRm2KjjLsS66zL7oFx716nmG1WChyAgc+7FSYp1EoqBX7SbuZgy4DbcdrVrV3cK48ZS0dgOoWF4l5p0I3ha8C3C8JO/fDCOdQSMJqNe+effPHgief3v7xR5DLVcNSGMQwWsiN5Nw0z8popeX7JlKxIOKSo0a5GGPwVrfADiZKxix74vGUMl49pTQ6qsGXTzai0jgx1xa6J7lvXfJqEz98//EoDeyklfnygmyXtNi0K+N0OnhzXU0qwNLw1rBRIidEYafm0ocjqRp92bWOHYL6k8N3UDTpD9kclTluL9ihIeAne/F18g353++anB2++F3QB8tw22GWvFa1LWG7pgi/lPCNTuuApyWNBSup3no4/cIyGi/1ZzhjBugK75w4eBq3iWn8W616+YKlfFxH9Qj/ZP8Qg5klLvBND13s4BHQ1Pq/SDBwczMKluDcQTXFvcC8y76NyCutX+DqBD/GQov+u8bV0J+rSit5uxmEX0G/4HLl5gTZw9+KL+89/tv/pm+zxmFIzgHPQbuEad2pvuoYAiZLqrqH9w6GdDqScHlJAB1gN1eZpPZSa9ims+8lwSHknRpETJZAE1bwWUd9J4dIIZmmcmv2MhjnvMBuxXOW3xOmdnMsa743sxNaiFAfuWwZXS57eHAQDv7ynX5cZ7gi+HCyMqf+TnDlG7pnOFcBGumuCMYcOh4nHpoY1CkBA4SuUvYNXPrnz7aucQgFnfCeU/neYkoDGp4Xx9n1SAsi/PKV6mxJJYxAgzUwAUeW/+ygf+dQEl547ePaqpCb4NTmOKv2ol3dwgvt1iSJ+ew7IV/PXhCH8DX244f/5VkOEey52+5WQBdnthRx4TONmtIEuHw7TXsSdRMIlDNOWYZ1Ir8I7kJaG94xwwsfhxscvExQM8iM3ZYIKSMyagSXLKj5amVeDt4valLkU29RloGQwvtKGXRypbvDJwREpCHs4vgVFXdrYU5MqHPsL5zogw6jz0u8cCUGdWJF8eaVZjjREbZpL52L0OPbtcegNahCjb0yNkGP0wqbqg8W1l+m1FCF6VVG1RNZE8DNzKD0Ty/IQx5mit0oRjT3gc18W04fFp6GGNUW9sipO1as1DavN1IwWoxqM1SdWvRpRM6qD1xZqRktQDWESky+HQHxlKvY+FuLtRgC0FWIXoC6L4gLCpXUnqMNoViQ24th6AGAVuoaAqhFAqQsBfsI9dtG5iAP6KJRUEFnEZrBa1GVH5SnAcWaidYJlDhI2DCZTODaBxSYQErlFhGisEQKxRgiNFBX93RpX0KJ4xSCGOUUKKx4e1AQVnCmCAQsDOEoNSWILAFZoSSwKpL2K+SNk3oQIJvAwyqVGd0LarkyKMivA/NKQiANdXBCpoUtEU2rEpoaICJUOgULEU7M111C4UYsfwrpoppmcy3UaD+ZwnpgXeHJd8Kc6p+p0OsVZXlTK5lH+8lMqeJf5aRe91/z0q+I4P+Wq952fzhatFtx3lPu8qsd+yeC+Hw3rcz6B6PIQIB8/LTDAYxlGjFmHYPVo5gZT8jqFbHc/oA5Hoe/wKdqu89R1Lu7ob3GTTwbRuv3NMfujZBuM0rDMgPHhk34CJgcq5QoQMrUfSQwaPJXlh3wrX0/8T2TIlXD4elingBNgfou83akneJLsogd6H2P8nOdLfEZO6dhz6gz91pQArnSdDOx5m09pW4vkL3CjgmfMMzXC/Rq6m2gcglH246qDp6NlhsqMgvZbeq198z1R3j3jwim39JNs/o1k4+GVZmPJHYt8LMDRbJzsuqPXbJzYdMdWY7jxcGOYPNxszK+7o9NsHGu7I3Z15/iYddc3mo2ZB93xULNRP+2OM668Bsdqs1FdXWlUq5Xj8+ByX69Vs+r2YKGa9hd73d5KeaFSrm5t3l8vVyvL8+uV5eO1atxurQ0WylGt7GpH1YcezObK1TOnjzXLqw8ul5Naeafqrqw0d5rlhWb5X5bLSyemWfwdYhjmMP3s5W2Klw8TdoujYCc5RyaHajhLtbgansZyBl5959EVEhXRoUZru/vShf2vL+x/+vz+45cVdcSQCs+R5cATcddpNEC1RnHswMg2QiyPvzc6yTHMLtYueTLowv0BtS64DfoxvoKGyiTK1gt2TXfdacFsyCTujQHTCaL1Eiz0Ktb//Oadp/5o7Zc/m2ttm5imlhmAIFPkmuaAaj8ejK+11RmWL8umV3d1aJxfXaM0HmKduXnwxRPe66wLEUGGKMaHsfA7ZBrkagCNpxstTEcPS3NIgBl3TXdKngg8yo9eIRpEgPzeQR39sI6Jcz6A/GwYMr9PMemoBnoRoTvDgKPhO4iciPEass9ADtTXMdzBpRsHL31x+NWrBQrGH8yQUQONJeRrenLeVclTFA85pOhDxTv4sE6B6o0LFdt/Cl5TahYq0I1bSbpDQW084RRDJ8I2UInr+97V/cvPFwhnDsL1ZgoknRrvZBzG3hGSvp6nFefD4XxAiT8ToqRJAVoppnsFyKEO9AlE8uyx2YuQX5qsgTEocq+RY6Ol+w9wIRnl8iCOTxAITLbJ+kQrHxxp8u4Lfzx48pvDl65KsEmi7HSWe8nFwlAdUmKqERnbmfQuuGysepqYcY5enB+e6+MrUzLE0SflLffuEGHdZbMBVnGn7fJGe08Uw4JyrOuoHUNpFgHpmqcpsa55S/T1bqkvUSxf+OPd1784uPS26VsvniQhUWW4UxJXRsaRIstYArJ8Qu3L9NNBB1Zakd2NBsFqLJo/cSkWosn7ZVgw+8M2hnVehT34+JvbX73iAy931ClWDKoy6xi7MNtTJTwJN8h+rtQgzzg/o0Fo6ruPNDCua+zgpU+kPVcxwdt/5Id78mslaQVm1xtvUiN+W6sbdPiccYmOgleQe6uu7knICgrgfor2U4NmRSc/PLtVUvdVWte7dGX/CV25VCK4AAIdjdupG4cPWxyaC4NpoAGexmQHotXwFhGh3debh5L0EpnYXUN7fD+C1/+hgBv3TEvfvb6l/Nz+6r39y58UX3vqdjtxX3oXsqZ0Mt7SlfkBSHcgwO567D5zKdoYwjjhzeh61ucMkzQAdx9//vDZT3UAhBokvGE9cxi3xlcxmV/sdwgImb6vh3TMBgGiQ3vCiIp7nLIdJm2BQFeBg3GBAZ5IToBsfV1yQOdY1Uuefu5uTtpG9HwMkv77S7sqen7z1u2vXxHRM1RyjCcMsSKqEGqCLISWRReenGzrQHLyeUfnYdlLxk6xi+rx60lmKsTxujcOuPkWhTSNmXsmTkTLmEUMWlzzq7zqSyDAUZilTIhRCRtf5WZZ9n9/KW+XfOMIW16jtsUpE7KRQProLgz5eVwOZunB8W9BJA9oW1yyQKIKKoFChza4kziXdUqoQbPd7+Ctr29/9ReNuosQBkg1POL6Pxeedv9K5xPOQQ5VxIeESFj8IgQIvVDzOlk1eKLi2GpsM2rofMxvhpuJFZGAY9cyrzT0GPiBFaSGZmSHpHqlc+mxQCoOYYc/xav+I8Dgd1+bbtQcRsNYowp4kDb0GA4Kcfk+QMEGAvsWCihvTorwdgtHDRYNCYU3MzhcCXCnYk6P1pqM0JqCypoKxAL4pcjLo59ZhT2zinRmFeIEyEZBjZG99KFb2Ztx8B+RvFQB5G4thC0KVrQ5L8YXpAEDCrrdqLcSSm0V2CZzIu+CAs/ahC2GWsKvmchTlaU/4d000m6aqGNB0pgQPY0p4iaUMw0rX1SuUPM7yU6JJ/q6n99n/LRO60q0Rqgzuc7idgoP5u6mmbDNTF23c6ZOl+zUwrMZT2JDncCGPkGPzlvFSatBs1VDZiiZNhpmNtKJyIo3Ys7JT14rpZLdmF4R8RZ3L8ERSS/d8Jb+V4nqT8t4GV4P010WroW5Licu2kSX4cUwy+UER2Rg+7cfS3HpwMjZs3BL7+y/HW1cc7PFpjsG6QDtonLKIarTbjJAYxMu8OKp2mna7hTiHbTNqdi83EPYTaK9ft7y5+yJuouRm5PtfmJO+cZ4Pcd4zO7lXNdzbRS2b5s23am6+DpFr59TuAY5w0sxNbcH+aHOmXOTcHIviTrJrjlh5+BuDgE6dsk3GE7IcncuzVt95A5/ymhAkIlezikm6YR5WwfXXwoGgSc8DMCQpvTEM20KH4AMtx9cP5J+3HSQdEj8CJjumt5Jb6QDnmFhUPj5SUa31kMry6vNxhL/XeS/C/z3JP89wX+P8995+Ns4dn+jfKZSjqlsrtmYfXi2frwcnZ4pxy0smwHjW6P+r8fKZ8jyVjsVtx5aPrXaqLq/K6dWm5VatZK5Y+COvju67th0x4Y71luL5c1a+XilXKuUK2sn58vHKuWH//1keW++/O+QoLLyYOXM6ehYuXJqdXa+DFG1a9XGv89PdbbtRh3yzMjiQS9tirhwX7CrNb4GYbvgA+iQh8iQImbCyj7EgoC1D9jcxbtRuYGtltMwuyOoIKElt5xCWMVn8sNzmyivnHryp0Hp+49wZe3tJw5f/OLwrc8PP+QccMIWqbNFjobMEgDUSsjOkPlxHCSrtIqpzAw5hKpnQRRdpG/W1HOB+XGWpS0OQZjswMohJkNxE9z4Wt8RQd1F6oPy5iQKpj/Gxdgsb7VSDAw7zOKdJUrt3HWic8BaBsfjOvj68uGtT52MkqhcQ88DJ6UzVKXXvpJ2Vkil3FclJ5AfCUlHhw5JgC8yRJNCsTUENwlwI8Bn3WV4OQQvBQqEzjKum24M0rRb6uRdUQHaJaSFu3N+eAn3wnz+X44c7NF5688BOemS0OLeMBXti1IZamI6JiKdQQLSGfIsjd0LMOrmbtSHaSfJYgY7fGl8baPlkMYQfSvb7JPhb8jcCMfu0aiPKt/G1ftxu50QsIacY33QfiHggHuWt/ApPvLO3dee23/j6v71V0SDM6wMpOMTXMjjLPChI2Hpb/BwGB5kOJC8qnPuPXDqCkYoA6A1zAk+4ttBhWRLzLdT9pOKEnNR79i1d3AZRPLscB6c57aRC9xGdeP2rSfv/Pkv+1//jl2l/K1oOxxfMyXkB5RC+Doto92PASPD+ZCgmMaRmPQWP1OnCo4w+0wp6p0KPtlOMkq6pT5ZWrjKER9rjNdp+9WLEDAvoShhkMWEUP+tvxzeegtymTD2H0qT8l4TNf9e82X/YnMBP0glI+kWkcDEaw1J253qtyMYVcqhl333pMGhL5FXOtqEdfcdnJSKbzO3046kmxedog05Z+y7fPjRJ/tfP2XfZU9fe1okLR32xH2fPVHfcSEsHUeaOjnF7ajtPohkHY1I7vvB3Aru6xlhKRTTPOVek15GF909oyn3xIm/BxbSeTImByWHm/voSUj7Pg8fuXn3tW/Aj/DRpycZ0U/YMsH9tsR9xw1p7renKh1nkvzl9mBrIJg2oJksxs+2N75KhW7I3PfRyrMWxNmlOHlyA0Qhb5PDrhSBrWM9LZ3PM1oxkrcZcnXBBlP0fDj86sXDlx+/+/Yrd18mf2EgS65ZZge0oToI3UXBtEdelb76eahrHEUtaU2phnRV6W0nbprMYK5gI7Ocejsz7A2FIt7145Q+PA3CMkDgyOSHZyXV38H1dw5euukD7XOjdtcPF9nEtplS8vkShVoQXkOpyWIOklM/NwxKO5lxOKLQtgFJ8vSgGwzVLMESpgi7tDFoE6YH+/4jwLuHzz0GIZvev3j3jQuSzxDvYc9rpuXj2DINvk7tp3O2dU7FiA3ral6WcYLLEftJZXkMZbHJcZlhrb6tBf70w6QHds+taEE2Sf8pR0+7dQoKevelVw+f+iQgQ1+aIVGxzcv3xQURf1vatI/t75rW3LtRtsbbLPp9MGkDZl3j9GvDLHJCGtdJ+ufcp+cRK0xR6fhKT9Da4cuPHnzyukC1dJTE6wQWGazm0TosoDLLKRqc25ZpLok8shEKmnEXKHiYJl+z/cCGSd7vx2yjpWJaOp9aGzcVg4kqRusGbbnAHdlXeuSUTFuhD3/z/t1bEFX67sXHi8Rp6jNkfWpkrcIrS0zNLy0RIekeEpHu/drPX2TY/LWf7Tjds68CIbPQzikFnO9ZZjOb6ZkmNJPpWVvRZ+Up8dPSKuZxSZG+ZEJLtQegg92ZGosBVZm5oxSruSnqVM0qUQW1SdUVq6vUJUsjqgiLXimpc/TSov6hugANDADzKkXqoO8YwThGqiIUfjJA4Aq+xUYOuFXxNuNbRK1kwKXrCGt5xj0CTyuMncCwIXithXA1xKkhQlWsyB6LAu8Qpp1URIhFk9hP8ZiG3w0wmMIf3CoquIean46yFOew67pAizqFHWasUMdQwyN/adde8QhCwcNPQw7t/PsX8eXodlMKDZIPhxCSJS2gAxXOVmjWvLCseRFZU8lYCyWiCkMjk5peIDVVFDVFCjWNCFLxI0JhRqTBDE/79q/M+zrlm6m5rnNyXafjuszC9WD+1anXDiemMmjllCbFF9Ect2qmN53ZinfLM2iELfhfBosJCpsw4HLt0ihP1yoQV3kLHK+LZtyjanlj7pE1vEn3R6qIYfeoKt68+yP8kpH3X48y8vJbfPYs3BqdPUv3js7+69HW3ijfgDkFYimgDTzuQgnZDNcwxDDbTbtawBfVMEqXyJII5kh34i22XCBBB8BYm2B2Q7QoGustmpQdJx1p8bwYT7EpveKbhlC9/WTTteFNmim4ZWIxhQfAqAEYhYBPXE2OQNByYxAlbTGyUoG/im3GyXayG5RQDQxu4Miw2+QGn1NNGEsYJwymDO92vJFnptzXSrYxPAQ6RfoisQEXH4Qfdz+uOqh+DP2Y+THy/fd9Dbrl+xT2wTL2k8y/zeXG0qnVFQhBvOD+ba2crB8v782UV1dO9vjaCXcc59/zfByDg8vmVldmH3LHw3C+ujJziv7Wz5w5tVI7c2q1dtqdn27CsQxHo1pJT/Q6x8vrx8snyZa7s1BJ4uPlxcrG7FK5eaK8Ht93stw6Vm63avPl5my5Wonub5YffuiXs+V/nS1XGuV/Wyr/61K5Tn/cPTPViqNcr1XqtfML5eoU86+bwtJkwAHwc6d10C5/J9WirNNB77F7hhjFlq5S6IF2lKUx7lHd4J0Z/mLbwRZH5ZwDSxvmRvZBAEE/vopbUmgf/nUMcPTM7w8ufrH/2J8PfvMopwRzbPGKOzBSMVRnPJEzFEeAW6UYAtSWD/LfznvoTEdOFAjBaAkVU/CyCwWvz7oiju5AVXBXmm4vH7+VrOE+Zm+F2r/8yp2/fmwcNCHXL2UhAzMALd221aOrrUu/MXpxaXvMOrbG4hL5lg0mxI6GPWS/OI7gRxdTz6PVR12bVh/9GRyyLCf+RJz/fYeW8B9SC2xt7lk6msbW9g8jK88TCapVkSxmbsrBbdoQ1HQzh429YlGTCuPrO1Gbs35jiYPRI97/QSY12ASCrrdoUbvz7SsTCgn1JlBItDNWK6HuGJ3E9EcUE2vJI0BhLHkZeKRGA9y4AgK2RZnZR+MbgMYGESZqoU1xtmrENduuJHbV3NSQH+dXjhYycP85vCq0kLH/BCUyzakRuDcHApTfL9FCbrDi3zldF3HvnFkUAW5AoQ0552yFzPUOBBInoNqOW/kw5LwPjG8I5/5V85zjq2Y5B4IVzU0Y6d5W1wMgsOLbpagw4QsMHfBvL/lkOAFWwkkM3qcW5/4B6zP9hAypHdy2ScHT+5D2BR+o5nC/c+WZO9++7h6pw9c/vWEn7rIOvkQUhPv7S+QtyzSA2y+vU9Ok+SfutUMb66CXrPjAYgP2TaEzmDuGGgmTitJV2fxDaVAc9yPaAnR448L+ux+yWZVrjxL0/ebT4fgq7cN2n5DDrMPSrr26Sxs3TduQGty3/c0TvPGvl6VuNNIW+DniYoAU5bDAYwvSVhqUrLnXy6ndSbfE9kTI+w7qJGldMlF8+eX+14/ALlmeK7Q57o6cS3/kfNdcdaS4Q5YMdwgJhB1yg52PdN85l8H+ageUPQ3YZJ22gwJMuboxgmgaM54a62rjq8k2Z2h3RN0rtf/E47e/vBDQDTpV6FPQpUKHNI+P9Ama5z4ZzBGVos1YQnJzUeDJZ0FGV7z5LLgIPPo+JkdZfLFpL+9T3+7/9W3x6YO0T+NrE5inD1v4YTQLaCfqxzlE/5lEOri9P5kAORT2XJmQyOfAggTtG0WevEZIdcBM21qhuH1YJGRXgj67Tz7Lcta5GUy9BdBEgpHjhsrH/nz41Bf7T146fP3G5KBTpKaUN73aocf4Tl2xvoWjL3eNPyOPw/AxuPEg78PxNTcIt7JSyB16yP9u//1HiLMpLwJEm+eIMIYh2hQ+YFYDfmA7hL8UMNOGgKpw/VQwTNfd+/467Bh2X3SXRskBzzsfvOOma4ZJfZU11F0I/LWEKSnuHd3LmUYdDQqO4sgM0e0caqqFsp9itmt8RdhKGbBgLJXEgFgqpxoRcYwcKAa7el1XEVJMFs2WjWlX+dwjZAOPM8WCmaK+wu6DWgH3KuT92xtgGGkw5E+83aM0BWgenSkKm6H0yGapc8biL4VeFgJx7rghuPExMDFXFJUEkMTgEQjYO/5QHETA/JrBGjJFXICfuMYo0CBcRDaggOUyul27iZV/piqtp8luI7StxA5F9YoXo0GZl54qOM1kX9G5fNqvtVAoqqDyDSyS+YV/Tf4IJIMKhXAisDPdiv3gixfCWdZPsX97SxPT1LQJ6me0Rvota7YTRj29B6aKtSRDi33RpndEJW/SO6qCt+gdXUMMekfU8Pa8o1klc95/PHCEOU+nZLTk0Z3ts//xwJHGPFe3LcFPR+Dyt8VGnjSScj7jPbztxKmElPALf6YRxUTdcxCdtuG6jsIZ3YlZx9a1WTr1Povd3Ltm7sIZftxpvkd34E9KNRaDm6SUwn5lzV0GRjO6AFu621JERq123gUTH/wKCuiGPN3KuwlEP00x1aM5x27hubmUcp6tc0mUdyT2KZ5EfWJI7J8aQJVOsYS2KWMRhUbdNqdYwpuiU8eBXKcT2gqNIVHhMfmnos9BHoIdZx5hGUgZOjNuwZgEAyAnvoumO4ZvZfEn2foW5xq5O3YW55aG7hgtzy5uuyNrLs4t8HHy1MryrPt7Ao6548nG3PHNztw8HMmGKzsG15dn51ruaLufkTvWFudmHnLHw+56Ha4vztVWz+Df6ukzp5ZnVxfnKmdOrcxWdvKFamU0bM5l25VB2qj0H2iWV0+UIaJqkjXK89WNzvHa+tJ8+dxceTRXbi62WyvLaxFEVEVXz9Pz1VVX73itXqs2p9j4nALf021YPrmz33xmrsNPDiV5y6kaH7f9jrPXv9l/Qzdc0T3x6aBJirBjLsEvjq8jzQkip9Zklw1OsJ14J+oLIzhrdBIoCbmlOfeousQ75a1NIUCdsH/niQ/3P/nabJjzBDnDToFiku3kS0V6k1WdfF8KKfKeGCKoW177kB+2LZnefAKiiC9EQa5hqd5lJw1b02YfwhjmGMe8J+mH3Ki+9lsH99Vt4x9PWZJSK2lJDgu7HQCdA/GdOOMwkwBmMEbMHphuWugZiKPsoFeC/MQoJQT4tNsR5zBLsjO4RIhBwdoA4lHuv3nBkd5/jBb9ULMTuui5C/CdaWL+MNbkmBqlFCt5QquCK4QOLGS+8glR8W8P3S27z3AzibBfVFz1glFcqSxUXDuyxRFMUvKhPPf8we9vBh8K3Ul7wHxLoK1tSyY2Q9bpI9sORKqqRqVGIVGKViFBqtZ1ArDu2yNyrlRjJSasQG83a6xMpDjy1lctCu2V4DDsHR/f/+rOX95U46ub/jGQcYJ/hukmRiuDgEruu5c0HLslbgTT175BTfDGQ/BtHVLsT3pI8UYrh0gHb9knBPWSfHsvoVxf/IhG6xB6AnLDpWpWuNoq/fBCvidP5vY3H+z/5X01Kii5C55Spdh+JWh6ybbKqcuoVUldFo0Seoi+D6MkzdrFPoD/Bn3KvgcbnSSb0oUcdiaZLlz+TLsgxC4YOhfC5ithy0u2UdODy59JDyApRbbO+S2pC+AXQfGHhH8ILNuN3dfn3h3Mn0NdaEfxhvk46KsA44Zs1fz9TTBtMPtCqY+hjWkNw712OxCVk6aarGJpQS2MMElk4mKi65KhqEmviST7JKTr4yu9eIgBNTmpeJyl3bSVZKNSHq/zdlTIRk47tuQG3JFqk7yXwLcjwtAEFNCTo1tRRvkf3sDULJ+ZjO8XPzn86tvDW29r0nfDjJmSom7eyhJ0bfT86PbYkB99a0Ju7PQUMsNPwfOie2bBGr0HDqApzrw7nCM8y9N1pyNHLd5LksGVVT9dDcE7LaFYYXvksUozFl9A+9IwxQuYDHp80337H4MvK0SI/BNlXL/8zp2/fLJ//eX9SxfvfPv4JEeyqKbM5NE97svlxYwCI5VpPKBtdZIBEYOGAZWETovhHsXkBE8dd9g3IxNeMtkx25//kZ6EHWDW4WPc8SuRkNVy5FciM9zJDjn8SmL1PwemntwvQH79ycHTz8kC5Pg6TlAYJffePWyNJQGGmsXWQDyMJMehaXD8Vl8TPGKjdx95Z9pECfwGoT39nCn8m3igxbmzU7K30lyH/fNhQXkJGOY8jQv614/dpCdxQUNuTk9hYXUK5TlLb7VAiKnxjlYiB/+ee35S2k0OgAq+aQMQCsB4YghAXk0dAZRbdgT+8r6OQMjP6SlMrE4VvnOG4mqBFNMzY+AkpfvHY8ACANwSIEhfMAI0/CPpelT637De2cUgGDulbnLPCvuGZRTrvnC3eyqgUJVgG5wMgvts8MM3Q/DnTw9f/1yGIGBnZZKHilLk6ySHPK25gIjs9P7h2XNKChKNfnOExdipYQusndVIK1tAjWzBK2OqhxV0okWr4iwGOtDEJa/4qM5j1I56oEHUVb+YLDf6hFUlAj3Caw8Vi3HrqidUjHagikEAnOsGBdeLjdgLFhkrIA6hcN0D27rBvYVij08nwemMfBZz5luYp2gpw5L7DCzuVHBoppj6VKRW1xbcu9Q0EE3RmX1B8cYRAaUZD5Aq/EZWQuylsIt3uDGGWJkEHOdz2lNoqwwtvlidxBQWTkj4kI1uAvKOo5WTqKOYldEmbkkhC3k7SrMjwUFBLJtXAoXhfCgb5wvyc8ploaAN8zY0dpuQ+c0IyFCYqQz7B8kLlRH/sNlYZ+CfN9kdMc3p1HaEsRw/T7BAQwidaYbyQoXQSF68GBrIJ69a43jhamgYn2SLjOK/+jGjOGriaBTfSTpnf3W0QRxTXKn1NQKPTSxA7fg8RK7EYAVxl87Iaz+SqAVJ3/7GzFZdWqORn/kG2XmTLhpv4deulAWXOXVWsQJmvUq2840WhTcABrGErLo9yDCW7MaYo8v9IefTHPxSNRIBOn3uxdpcArEM6FJ6jgvgJoy+uc1+uH0+pVidEF5g2/VQuIqgdSqlEcmdUkWBTvUndWLNk+ICjjZgxxiJ8DhOjFz40/eee13smu+JYR1DmoZ8/URf1aVFPhbgWF46ueWO7vLSicQdmw8/uNpw/2L+24G/rt4x/ju3Rn9n1x7GvzPLS/XZWtn9qq89/CCU1FaWqsvuaLqaD680lytbjfLGjIQf6PeOz5a7W/ctlf8Dsn5tJtX52crxk+Xjs5VqpTVTifoL5dlK+aHj85Uzg4Xy4mz52O7JcuNEuTaqllfoJ0QoWF46Pj87LUABwhLw7crS0vjDdoBNh90kHuIuYTQo9Ptp20JbjhrO914L7wUZ3U6cXuE0/06AbZM22f4E14GbzzOPC64LGMKI/xEH9jHc5NtojtM4lAEnYI31d3k+eulQY4MB+PCsoHPW08SHOmdBjgeImmr6BNMKmBsih2u7A84cbgZkCLuwJm+LUSfP0l4Jk9/4sfjuo/MU2ovjR+1/+5s7n9/E+FHkpJr2cO9vPHQtwb4TN7tnmD/KTYCQc6BbGkI8LNgqBi56SSvDfScRwL4uB0kaZlEPdEoISQcGoGzObiHbGOHmgYjsIsOtfiTpw5Q79k5F3ugRbXSjNTBgpLCPfhpXGTiGTePmaC6K5NPxFQ1FAOSf+sz7Aae98ecwLtPpx9kIsu1MGY58eAQDGUSeBA7grzDRH1/vB2wcPHLVsBFl6UY/Hv4L/YFMIn2IrlfibZk9B6B6/5LlMWT26mE+or14mLfOk4P1aJiX4oGDcwRjuTY41sAKEVdDDjB6WkqpIxwHd69945hQd11DMiRhGrdNoj+3b9CNrG0QXS7c3ECh2ftR1pGvqJ1oSWwjwMIt4CHibrDVCaBDM6Mozjo+HCx+9xTS9mNgBV/7p67dee+3+0+9vv/uB7xvK9+MSoVsI46BIM9IvhtWEbbl68Jv/LuPdkuGKH3ot7+8QCQ50HoKLrgjePzEvZtGHLJy+B6KgnC3u1w1zqUugKNBDl4SkE/3qH7CVMc9PXz9S9fTu18/K7MdeVszZZp3SgP0MLWUIVkZhaHdaOEb1Ic0acF89iN9dUQZqcLAwgRJWUeyKNkhrcQNL+R0xtC3bX7EuyldjHCsYfd7TjFwh/5Gin+bQcIsSOAdr/ikAbecQo2Oy6TjHVz+/OCPj4DnsnibF5gB7M3qdJGdNoXIPTmdGXNjBsk2uiXDFe2A/BgceoQrGJlvrxA/uh3AseLg9V7SjWflfbsHtSz3CR9DXUMISx3ssptZd9UFCaZ/zBKGrqbjq6i/fPvq/pc3Dn57+fbN5yQIX4oBKsTtc3yNC9Q5F9jHkl2J24wJJtn5k9sWt09qWtw+C59wKR36GGjyTd5jtsWb7zf1u+LN9ytpN29Siopga7x7s/YvXTZb4yUvW/E93tPpwg1ihRLBycPheKDcPL211LD9PG1P5Pu02/vp0zRdkA+T+aenj5FoTQfgHXjpE9sBorag06kbHNqb6Cb03fFn5EffK1HrUA6Z4XzjmKT6eWrWpvdxXziIiVVJHsTfmHvH1JqcjEB2usK0QxXlJY5kozd+UYiaVCL98RGHm1QwOoV7UAqJSMDldsJXQML5oNUQZtk3SwGWqVGR9AS5IKazZndjGJYJEY50m25y3a4mxWglO+3IC1ZMo4YZxbgbKODU5Hjwu1ehN07KsskRcijmHYjtAzn/nJpQ1/xIIN5J3jmsRon1oC4EJI178Wh8vUe7pbfgM4CsRiflVTP06WUjspzQxMiTSQtmAOpEzrjpxsG3EdjO10iiHjz5ysHTb9hHMgrxIKbcie+xzwaygIa1YMQ68Vpp3os0eFoBLfewPC0/n/pvnmYx/7XjHGa+Epq2zSdO01fhG//yRuEbDz4RyrJosin6/Inwcfhm6eOgBn/MD5dx/ATqbx8B+ItAn2RiAO8Nto+H9wqynreY1SfGmoTPqwWwyjmHLET+n8DHFp1aYGpR6c/AhBYQGjSI/r7DIefZ1J86hUtJiDkMsopxNS0f5UDrXhSyFZGtkPbwHsoVZCpp47BGlZY2WlGsYqJIJcQ0OuXAG28S8MR1fe2lCr7zJq2jxQUGFLCcrnsJXTeyua5y+YwXySqNi6K4YmVqxYrdiStWEhbEYEVl3wpLvIoKupVAxqlosyq1T1+gAyMYakXFTTOQMypiQmlwhCSoGyEwRQRMTP865f/suddOhoWZsEIvQ8WAjuKbtKbT26Q5FOoi16AdDyfSJk1eVlPolEtqCJ16jc2gk9fUCDqVGTKB/vsRJlB4yc+edffQBv9hdPbfj7aApgPKqbNJXqB0imZENN3FyTZ2Gv+qeREsaPl59HKP88042eQTd0sSt8mkl2/rz2QtP8d2uCTqwhlcPy+E3ODx/WjfbGvepJgyGFEOpbV8jTeix9DEGln6gMmUEjB16JQso+fiLdmrn3ZgB3uLCpGFdrLN2/T7eMK3uAfF3sfYQzjXKzmHdYU98HTOl8AUSqZPOqNRQHsl04BoruoPjIMqxNU4OqAt+DLYPBrB+PniYEh0FLTb0kPfKdMJZdqwKVz9JJNotr3ZWmkuN/jv0sj9HWWbrebyQuqOgSs7yccJOEbZNtQ77o55OJrLx7Ja2f065o45d3XT/Z1dnt1cKG8sQPkMH3U+angsV5urzeXqynJldXUFI7jm7hi648QgPb1cfmAJzKXz3a3l+fLizgJs6T8+W56nXyePV9bjvfZMvVZdKFcWyufnyvOV8kNz9dqZuZnaqTl3YXWlUnPtTzOSQmDcNIFVUNmHBMkDR+gAGVPxEAtIRU16riTCOsmo1J0RFxSslzg8ioGPIEArBh6iBIu8kHbn248OP//g7sufH7z8hZeiGIuf9cVRP+KmWF+EJUUmqQoj1RCN0VNClZFohCpjJ8sxtLiPpIaxsPOCqoglYeA2Bx/7pd0uVj9FMzyCR9r66GgDRcSP+0887khrr6At3yk8NV3C8117UXrDzeq+R2xVeiN3Khqe6FARFJs7HEqICuB4WOyegcnYyeubKkZcF2/f+kPYP5C9uVgpgih1UMpR6opDLXcjzMW7DVuwogVFk5xdyzdp651h7LHP7nzwjmEsg7d0hzQpMBuXRklKalUfrqzR8vYO7eNekMeZfPc6uF6/uE7Pcv+bl++++V+MErU59PzY1QYTaS3tSFvjm9tBU/vPfmWaciAR8hWtQ8jSVsH8l+VgjEBAYK2A7i0f3+o4oV0wuMPW9C10thdr4MdrmMZSgMf+t4/uP3VFsUey4welH+/4PsCJDEoPw6piRyCVb4nbBOzx5nvU4N/+brdj+xj1JecnKO+4e4AHF97z+5VhWxtazGh2kDdY368uKErDjOoc9XZ1I65jXq71dQdFS8U3qw/vqX+pbt+6RQxRdwd5K0XFG5z03lnEmHWg9LoPNd/uJ6DnYqGvOKJUU7sZRDIZ3cM6HWhTuHvOJplyetXB04+aJFNRG3xQ2U6blRjgSxk8pG58zmlz91A6HcfE+aDBO5++bVsbUhYTx3ifBrMbkdNslsA028KQ0K47cMmpLWjoSLIIxov2goe34cjBRu0uF9BLslaSwF/uPXG0D9/4Q5H84gTRxgQtnW55HyC/gmuyRPOodGsIOn6C5qPMhrg+X4gtaKv1NexsD7ICQqE1PKXfXdy1dqf3L2oERUmdp801CxnpiPZMSHHIufQCikFqFyHLuV2QqGSJT4YmHAAYAkbRoJfoRzaM+lEHguRAwpa+BFdz6qTfQf/WOciupGbUN14/+PJz3T0PT4HiW4BGE7Mn0HCY84ydJUOJeJach2ztriLXg1tbuNS0DkuEQ46C9v2lDryH12h3JhFHyfGHgyeeI+pB3/KUE8CPxm9vyOu3IybDQv9apRQ8nt0rghGERqV2Fp0TjQGifOv7mIDv9Xcfbav0/ObRgzf+IP3OYLobkT95kRF4adCgCLMO8MSswHrITgkwUoxJkrg62q/6SRxjQsOQn5OS4Y2ZIVsWsWJMB/KUYd1JPMBb+qhb7u0kqw05gA8jrI2DYe6YSpyegPtvID6v7gkcvv619av/afRpQfieruwN+Vu4iClECHMCZqo3LxAf9CZsxhwnH3bMU3b4/PsXd0omImwac2h8qJK0E86TfK4U0brugu1svlv64aXz/LL/9ts7N77UPT1ESjb0jJJoAy3svKOHqHQpMGoJ2zc7eUz7tJmHmvchhejVxIEErLpALxOUZZKMMNrTal3qi1aNBym45iftbnrMf7kfoSV3jTqz/+UzB5zjCLKy7WBAgVTGHlEDlDiwACnL6K21NTDx4ACbh9dSSbCNFQlIzEP3vbn7cH+QfpTnc/huumzPxW8yRWcv+h6xAMKDuIF1XzLuPUBYBf6m4InAsNxNqb/5TD/FCKIugHEFaUGsgY1WxKSOk/cbVkBKUMVphPCpMQFI+l0yVKAvNz8lGrYvHpMCPlizMw0YqU2PCCX0p/SJLciK/H2HAPVzh/jJWPt0ko7CVRwhoUsVGpi5b43S7qGIRXqaGTlW4KI/phSJVqQKkQFv/+29XrUxSk2oSUH0iCtDXY/6CdpUn2Llh5DwlEeDBARVxSDAylCVQargUwuyDcL+kVs8mp0CZSGSanJkX6QWVrJa4fQOCHD0A9TniDE/FQPtZhHfN5KoB4rvbD7SvxsBj7MMyLJox0AcW+yhTdPiKIVQfp4ndUNAhUAODx88YrBYAS27gwSiqejO2QGsJfbVh9ueh5eN9DWiNwMBRjb4bHyN5scscqowFaIAK8hQFZ//TXec4DgTyiOVRRqyhAla2ip7B6EA0LmfoYvMlAkEfiZPYZ2oi3OuTrdMuDgLCkLOQkOHneV0gpviTAtVS2KGcW9F0Zd28rp3pZ1yzXvSTr0ojrSTF70f7VSOyIb8y6PcaOEbRvsx3RSf/eUDP5IRDO2rkPl90I/I8XJNC+Ftg3AGHG6CfrOf6ba7g8IKwC14Srnd43wXw05Ea3TCWQqhmM29G3xODqU9MGHzHXJKttItTHffw1h/fMqxUOEMXEQlBdb54PJ2MiKzaoqBUd0p2n9bST6SsLZ0xlnv820ppjPmmPvB/OYU5daNkvR6Q8aMurPJkRu6fIpm4LW+Rl+AG+icYrwmm1qOZ+QJO5QBdjo4nnHM1/B5yAPQEfeDbAbVj6IZJR0iHRMdBe239NT3zXdGmFd2f5LxeXWlueWO5ZVmY8cd59zvJThWmosPHy+7X4vuWHD/1tzfk3yccP823d/d5onjXfd3no9jfMzxMev+DdzfGThWmvXzFWix7o4aH9VTcKw2K6dWVyrVyvkzx8rndvbmy0uj++YhqGwjq54s//N8eWFxtr5cKVfS/olKubt531J5owapwzYryUZ9qVzprN8HEWbjdjpXXsCa0cMPHis3F8sLs3B25nS8WK4BlebifPlXs1OTi4F4gzyFDoFl0Z6bIzrZEgs4N31C+T0U3EGugKCbcsOulkJYKNqn61XV67DGfQXMrRdBvF59+s6VZw6efWH/xpNeyOLt8wHteUtv3lCZpyBuGI3U08BYS1epdQ3ennTdhNAn76gsgmjtbAK+NrKXMIQFXBxfO437asIb8ZZdvCPqJrATZ6tFO5hBDwZxooEznBA8uPKO7nmeaGl1KnFjUZm4g6wqAXW2qnjiYlVB4urNA+PqFKEupbfOWAF0Hc241KqBbqB9aRa3OF5m3nYf/NAnBwGa+DDHf8r3mKR7lBdfK5CsWUo1S6Dm213RBynN0kOkRnnjNKXOgB5wyAvQxu7FfdsZ8GqCY8ASNXpAcc14FEFIg34qMTHyjdJ3L8JiPeUS//q1w1vv+/wpltIw7UWnpxIb9tMJalLbEOyUhvewwyF48zFl3Kr2ARFm964Motjh88FcPe4UggrmPis8bA7iIn4ZEBTGWQdcZuVlgCj5beqdOHXcACom+DG0jWFe+/EOWbRMYRsarEh4RN8ah0e8oRyjJ4aMlaSwodMMHc35YYAzhlTj5zGK4x6niR+/lfQwatwmP4y7b75954OLPlG83DqEgJb+YfTvHfZTm04l7ae98TWfSQVpmKE3lGjwiRDvB9tJumieij22X4PkYBS5GX/v0mW8CHuovMKwhSPt3ttrmFvg2i031gd/Ir3n19Q2xxzkRO+/phbz0b0IR/l0iBFDMQAIEkBbQkbZTkqeDnL/MlEx3JOhaQe29rHZeY3SuPfiYuFEVaC22zX1YAvheaZJfhY/PAe45u7Lf3KE73zzm4NPXjK0aQ2TXlzuC5bkfjqjYl7I1PwzPXeC1H0GGqUrWVuQpE8NRDpKZHT/jMJH2JU48OGj6BHGRW23m0VxKV4ziaE4Buf1ke6Cf/LSweXnfBjuGJMf0xw/Gn8OrEv8ibQPZpMYc61TgAomoBVIHDAFVPA/pfZFPWqH3QBMH4fJptxIufk/HQQ+ta5oRGXqcXcdvKM/yrUfd751M+dVE048aVN0ZKTR9P5HuMzV5ibZC1Fbo9UAaot57sJgtwK2u3m/Xxh9qeWZ1hI18aBP+w8vbWtGri+e2L/8e8My3kIJT4AEx5bX0nasP2GXhzTHnpPYGPO8k8HynsxRcBbm2eLrPDltpekaTU40+Y1vipxwk9/dt3+rcqJNNzYp6jS22iQetbwd608znVIKJ5pNXYO89LEJgClS8TyUgOlQiFGdWEIP0y4kdIlUOAc1WTwLzlLxjDBLxXPbYLbxNQPr7IW2x3DIvMFujncL3MbvwOvQ5v0H5OUIbg5JCzZzUd4x8YkEUwLX7hdrY7KtWG3NH2NUpE3pgxut/cc+831I2u4O8qprAyVOPSel7Vh+YbRvaY1XuLAtHvkdSvQWY2YsHv11Tf42KIx+UJufgOSKwzVJeQJXIRrrS+CEx/y/+/j+448p/05SkTPB+EOKJOrgOM4i7ci/ML4VfmOwDd65D55tBtDhuYFyci5c4rnP7oahZj/2o/vEC3duXBHuejBNtqPN2N3UkCwE1GCcVGnJFBLSyvUuLJXyb4qrzM0z29g4Dzc2w4uJo3gz5RHWpcSYK/AyIp6pfHgrH5YgepvEorrx8sGTL6p0AG1EeUY3gnuoYfccG+RK4Hl20MxNR9LBmxiuiFonhwJq+wj/4p+jqxS0lCNVlHpRN6gX9YG6Cs8u6QIVqwaoBvBzsbhB4ZMQfCZAw00CwDUCvXWLrhVZe4BbEWTrAS0H9+1hvspBJUCwCl6LgHOmgDZXApzJ8G8hxJeKLYkdA1kmwMpUmKLw2mOTCRAGN4YgaDXEPhb1zIaAR7FOAHQqCnAqBtegE6r70nfSBYtiFMAowKh4YNH0cKLhUUTDogcFDlbY11TIV7xsr4lIr1lRrlLcCt6mkbpNL28ReOqvQDB6qWhtC9b8EBgpVEoZAWWkU6YSAfzFWU74QpUSgYgw8oHzcDZMjs6GT8/J23L5Vzhdh3N1g6bgyT92qvTzpJ3IzASms5f8MXPWxISlERlcXVnFnQjGEFwzcRjCchOCoXhBoy8EF0zghSJ1MhY/cGTMBTfhk7Nx1Dv7wI8ZihNMMhXv+uRRVEJWzCR3J+sYkJdSV+12+g6R+nPXWYwQQLZNiJZAJbRiCJbIbcxGw1EGHJUOlUOFzT7E9KXAA/E6xMBtYRmc512MwcC5sMDImWxjIbrlbhLVNgWDoFM1iLahHhlCh3xKPrj9aAsye/lcZmwBjyEqQbqXRF1/wrF122CPhrEhq+soX6MiHAuIxos9wZ9p5BOVdSXOLw0mF2KDSTTiwXM34Gk4NoZvifqbbCa72jv3GzuHYZ05RgP8jNvpOUOSmgkfkz4UGXwZaD+IfgR1yPyY6IBIl31/pWumL8qucPiTTMob7YebqyvLJ6tl+OX+VRbLp1ZXluCMS85AqjI5l0PSlLl/p+E8wXaOrbujAynKkg04n11zR8udzyQbbbinDkdWu79Rvh9SntU2T69UV91x6vSp1UoCDS2W/+UX99Vr1Uq1kg8WyvBru7dSXpktH69Waph4rPvPGzPlzVp5oTY7D87MWRVsyr9aKndmwKxcb631F8qtWrkSufonKw89OEdhJdwtx8GsXF1x981PMSp3ydM5WU8zSVyWdEmMQRDUPvlB41UKPe4uYoxZupGv4MLjMKI0JpAAAFIacdNQpaEzNxuRrkJqloscG95Jkic/v/3la7e/fNEscwIbESkrAp2VgWtBmmQhPyJlhYG0Z6RfUFeYB9VXHHXF+0A6cWo7bDOTtTOiDKWuuA/boR04kCu4l1NusPVb8eZaWvJtOMSFiQLWKZsJWlKB/ic39y9fOnz31p0rV62N0ZIXM2NIWkyNhq43NVq6GOrus1FI9+C3l/efe8bQpf1f6EMqDr6QLxYDLA5KkPOTItKaevk2R6SVEvEtAKhCbu5iNnjm4v6br4nZIM4d1iab5p75bYOJcuB/yPgxiOMTjP1p87C2ThoA7OnE5mn49iJ4k91kAlGXMvUq6oEnNJaCCTohzOgqd6FyFlFldUKC2vdibXZDQtshQzAE8FdwjgMb4jMXHfy++zt2gHJDQV4vrlMDbymO8x3yzYV878ZebOvnAzEbMxdY+xzm4RI+OFut+3Y6JeWJdjze+eARYsc4p7STnTCT/DDeyWPR5TTnPHqncN3WMK+yhwOWSMr5m5vuw4G4lpxv/uDSjTs3bkm+ebBWug9h3cEcpUz0YP9Csg4XiHaDPUhM7ZgrK02+vM773K6CE8L3lyBLBnOBKOyx/UcfJS58NM/cPUurbmuZXT2xhTJd+DKdLfoU9Kwb5vVy5A4/etokCnEQs9sq6V5WaKXC6qYrx0nLFFNt3dAqxbYafNJxlxasMGgeuG8yLzDwr3568OWjxAYx0Er641swkuMrrWQwpK3Q4FsPnR5fa2MgaaoEhB0yW5JM1hBuBiqC1w7uJejz9lBIYn4LwxB+8A6Y+p/49PDpj+XNEjpqIQAqSWAgYEKp8TQWerwe5qlJfnmkpEsgweOEsYEprVJ4pl7rCp8q128Unqw4ZY7yhkn9DEOLehl8Re6dZtUMfIj0ZvWV5AKJfu5riL+kFhifSU+JXCaJkPgeJ6XxhzslcpjjBFJD9L6F1QdsjwvB8bZL2aLQr6sE7rawApG2OVFUIqubJU4ZRd4+h288TZmiCqmtJeuAJkqMfeYBTSQfcy0pKCQIM3kSdWGV8yQiYZYuvXyIXuC8ONRPXQHrmnzNrMztJVnU68GcwWtDnE4bItsltHX58KsXDy58dfAmO5dRE+bLH19DAllgbIupGsSowJdwl8l4g5unwwCB6AhAgAWZVszvvtMOULaYMpxWJdlSWFlzMdnqmpfpZhtFM34SqAvs33r/zgcvHFx6m7MRQUzAeB3ihvhmGzzDgqRex2vxlGvT7zJcUKV1CdUJUOEmOMAxS7iW9cztLy8RSzwJuJnahLKhCSCMFYQ1+lIDT/s+hs3H4J28sSepoGAn9Zdf+WxQeHNaNU338YxbjXM9aadp0CAIKN/ge38NgR0jylWD6ohtM28hoPOGJdyvXTJrt45ACwWDrPS9AXOxGpl6WQIx2nNZq3FgYr3ExLggrEAEXOmsx6iInjwptna8+RrRktAMIyc1UL4P0cZEJSOBiiD2F3jf96g1teK5dGOFXz9ILOlh6a33Dy5cFGwolPiByM3yTKR9eSxagR8N2ZqZBNuasf2/I2RaLeAlsUUX8JKFSjLJFxjQNBeWvrjGF4jLnI9E11OpPDHxA30/83/wiLyTJCL9K+kaD9wJVIpGppvuVcIy707AGs3Hu16UXnTvv48UYwnRvgUhZENseEpRvUgnmQvokLxkMiwv/379AS0JhZi4ynz2OydIJruz0cc4+0SFraxMQHKD4Mnugm3UPb0fXjinzR6+9tuDJ57/sQglohGHGjDnK3Onono5pYuiOhg9U1VM8TxVxcyockaFs4qbUdemKGoNjdTBv025/xVoS0ZPypJ8SNMPKEOc9dDoHkW9R5WdULtA2C6wfgqWnzGqgyoNYeTHaRC4YoO+SEEHoq8OI/Z9UDxskXARAusX3PDvhse+8wEMVQQawE8DOC3KLBQH+M6AO1hXakNIwJoo1P4svKQ/LYwyAAoBTtPjmqbCmabimJUAwCh2KQCXRoBBGgFOmbwWoIBQ/s+zcJ4nSWz+iCxWMRzI4IaXvQ0jcQvFoewrSr2KFzMVlUCFQitxjhA3U96SYIaHAju3N0KRotLEzktLNCNVwjeOpqIlO4nqBKp8IfbNT4d3cs4vmb503pqyhABVS/8LnN7o5uIywuR1v5Qw5ZpfTph6UZYUJi/6ZYWpHNHSwi+OWlqAAT97lm9Jz/6CFxeU5P/FwdGH/ShbHXXzaB1y//2n6//4Q+psw9XZjboDtHI6Mufjdj+Btu1w/CfEfcX9arO2+i9MdRmd//ynbjr+YwT7EkzN+21NGSthM6h5X1gTe6HZHLEfo3/CtVPzsPTJ+Mfgx1wHWEYTXoV+L++mNRxOmBGcaKC1nF60OALLt+tZFq/1cjyjAV9wP8+e/af/+/8FfTcf1Q==";
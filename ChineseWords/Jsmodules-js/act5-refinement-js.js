@@ -1,2 +1,2 @@
 // Obfuscated production version (zlib + base64)
-export const w="eNq8vWlzFFe2KPpXKvrD83sRhzMP95wvDiyETV8wakS747wTN4hUVaqUUFUpV1YKxIsTAZ6YzNSAJ7CNbGzAWIANHhAGIl7h4H/cUJXEv3hr3mtnlXDbbb8IG1Xu3LnXHte01/Df//2//tfviqSetftfNJJ6UiuSXpGVr3byid/9ze+KtHwV3lznN5086yVF1kr613fhy7we3uXdZr4dC3udtJ0upNkclML7FF5vhvL+vbmi1ulfzvbW6Gf/enkAioeXzw7urwwv3Rosf/67//qb//W7/33oBPxXK7J0ob/UTRsZQK3XirT/Tf9qchBgpwQ6bc0kXYAtr13PulB5i1WxBsb2z1WZiPtYPvnzYu3Jn+ddF489/eQIdbHIG0mvVRYpgMp7WbmDmqUiBJ82avNlXi+T9AWaJFd5ri6VuWA2ry1Cd1pTUPbkz2UTYc8drGWPL7boHwT+0aXh0ffW7t6C/xh42uskc62sO1OzpnfxuJIWF4eu6EyEd/En3A14m+HrF+JuNDv9pXKu9vhGORc68ubb6w+PcUeyJKtnnazaZgDeTWH5u1O8FuMrcwfgZS/rbIOSHCb/AEK+PleXlfjxxlwd4V84Ojx6Zv3q4cHRDwn+Qdizs5PwJq3jL/qZL2S9esql/JOLfau0sv075dxBaxXWdnDy3Oj26+WdSodxw5SvdpM2LufoPMPb0W9kkPhyH365i3fawVrnySnoFs049RDK18++O3zvIc71haOy13pJ1kjbo9OcNfrX21iu3eAjydU3mumUX7e36VLr1Dw5syjz3Xl8uFnrf6mb78LRwYOvYNrXbjxau3FC+tS/2s1ni7SWwJncSs3D82wK89Copd2My/KD3bTEWl1YoZdcrXRfgqcAYNSenO/QAgNOmIWiwfGLg+NfDI6srN5/j0Dl3bJRy+daCZzT3fjN9U43wZPbypIFLuIqe7XGvm6+v9boEsD+1yVu4x9P0oAQGBSuPrg0+O4zhkQwkl6K3ZnF/bJ3ZqdsI/nZSvIXseTx4WwGOtmulf2vGzBT12YJMxxZu3hz+M67g89O/Ardtaahp/twHbK9CISaXz/x+fqx2wSkCyhrHvAZHqxuCkjQHtwL2P7dOQQAS3uKDzNufvhzGXa+7f+nFx7B/h98enP97cM8AkSPWR32Sh0RGZzaTv+LDNo9wEetkxRFlvNLeEozhE/v8MsMPnVfpv5Dfkhrc739efdFWf9m5/GNvbWoj7gNTr21dv80902WKEvnWoDG4aTjdk578EC4do4LYJLTIrzvFekCTHxN3gKUc7OIzWuwI+Zq5Y8n5wrcCd/fBpS+fuq74flvdSe05tvYDMObIFD9a1woQAmcVSS4Ew5kq1Vu5a0ngGpZ/zKd9TaebwK2/uDB8P6SnaUO7A08Op2E5gXmvkz3Jm0ketfr8pLxS71ada5Z5t253r4kBeTehW1FB+vreThUvVr/cgPn9Gta6bXLd9e+ODy4cvXpkZMCGRAyjKdXkz5sVnrfgUH1GHo3nRJCL1WpC5tHQLdg4vGz3R48kfkv9xpwoPLD44d4m5Wd/nIPCXNewHibvGmLspNRYdG/hmXzMvBcy3NXl39ClVJeMwWfgRP05V7EZXDO4BFP0PJn648uDt9ZXv1ehw4HHIlG1mlmBYzf92E2ehV3ZPTD0f4ANZUK01GHCNnDciy3Q5cA1b93iiek/yng0m6vKLuzgEJn8qLGRfWygQeIGBx5nbRgaWtUAm/7x/B1/05Wd++5BS71LcDvtBbaop16b5GoAPBl1xEzfF3iEVx/7evhhfeHx98bvn1D5my+neJnuA6AdmZzHB7Q+AUkhXDgu9lMSUVpQWXdrDvLBfvqyUwvLeCrWS4xQIhNYZMAdiViTNAGp999eniZz2PAPkBrOnDaWkRa6nDs+9efG8FAwMYmMP4WkJyE8Jihn24JGHi2lnqcBOdyBrgb2qSCiXDgdz8bXPmKMRCvDKxsvYROArj+p+1aAvOEu5ZhIY2ATVLHGiUSv/61Ni4AoIOadHM7IcfsAHzWIvrYSKgK1LAeT/IOomaAK+ymc728DdgNTlxW497jwJ+cb2OPlagJUu9/yViGR4MTeevk6r0Tg+MfI2/z3i0eEg0mMI/5XCeFFR3lEPGEt4FQwzTJrudtVPaQYZZ6Lwgx0IqehcTd3r+2WOEf1+5fX/3+A88/Jo1OuoCkotIVZBW7wKMQ228w6IzhqvInTGyghV2VnuD3064XtsOIv+JeDM7ffHr+kGxr2JWAivDcRBzTgTKFEVPxCJ8n39RHPjKGtpwFuYCOF3FZulBAFIoaUSPlqM+sLV0AOuRwQDNDUgIMXNKIG4fdBPsC6Csd8EbM+PEahW+5xri+QStJykW+bz/eQN6vv7QYenb927XL54UwskgIBK/9RyKKWVGURIA7fySmppm3avTTi1cdFvyyvcbRPz48CxsCYQxuf4UwLnyx+v0hN3qS8EiG4ueik05rq8B5ENWtJ3D06Xz3+C2Dx28aWoSv56w+nqlUmgJEDOxg6BSO942PuTvxgU9qebvc5Q542kKh5hV/npHPYeZWTi/wcvtzZrzcEUW+C9A/yB4Hic3Fkzk4c3b9m9sRSFyzBB+meAgwYplnmH6QctMmbEGSYhOUPAErFkknL/h0AEuSwwGAvcd94VNAEi004LuDXfj0xurKCnfkd//1X//xu6LRzf+EXE1yIP3d35BOwOsBRkT/UXE6lvJNcOYBuo3ot21Urj+CDGpyp5KD/pIIfcCMZEHuaySNLIh+MPzORuKfyXzC7Wb8SU+rahv2cSSeOcFMZCCqi2INfc0ST1QWBI9I5Ci30zHiv8BF8nOr2Sy7vWkvC5gEUGHPJzw7PhHx3/hkXHaVtx7lqicCQx1Y6cDSvhRxs8bD6iQIOxiYReMQHYP4QmALjRu0jW8cFPNaU0TJq3zVlOOljH+qck5bI0Zpa8wXjb70/I7jdCIu45jxFVuNj9jqmQdjGbgzMSmLqNdGNGsqUCujUEIhf8EJdDjdMPkvby3GkyNIctqQ47QixWOGC6crSNAQn8M3RQIM+n87orG59n/U9PP/+B1MZNks4SzNR5QlrjQHTF139lkViqyTzBfPrtFqdtJn1Ohki53sWb2ArnYyHOS//f0//MfvgOWdhwHu/93/8x8oLLbxr6OMe/YIudgDtff8C7SLWtgkm82LvJXNAvvKWxAqz1PR3DzwhK1ugnsl6S+7ejN0QBdDPThv88xklweYpUcUQAgZdKyDc1+v3/xa0Kk2g5xYd35zBSCJEfSGXnmwqX3gAIOqg2hTACw6XgarCl5QCDdAagA+upuVzVSIF+JzYOQXGOpCVhbdMp9i1E61obgEmYtrzwG/1iP2OMWKpD89AwzI43MIdSV7lbhOEnvPvLV26ePhV6+tP3pQAU9bNW210k3IrIcObI+gEjYP8IptMawvCQMIlPduKVXp9pfnUT8G6AB5ASiAx+eIR+lmOaHH0mpZnWweWIAFWlA8MYWoR1BjiUA++2jt64egq6wAaecvGAiQ7V6otF2+EBpv5KzNApJQcxBwjT57wO3zJLW7uC0AuwuhaQPHi9JTsphrAVZAHQ/XmE2zVjpTg2JGu5ezDuJqIrtfNkyZNXj0zeqjpcHNDwYfMo7rX5+1Wcry2drBdJH24azMylyP5DadFGtW5oTb0zkp8Khht1PoC6C7SZHnUa+Xs5CaHsi2qiBPpaCcJLUtVwZ1X7PWY6bSVH40BFP3QeeDEoGa0P5XQMk6c6e6qdQhCDIep1Xk4YhCUYcD1ASk+NTdeiz0vxBpO/XIu/8VnAPABqFmG6huw33aNP0DyKfMjPaXWVh8/c7wk8/XTt0e3PzIg7VRBaAgJqpuVyDqqAQcDyuCpSMjKDayLIFbF1IT1gvaoAfKBG9zWIPcC8cfxTmt2gDlVNFfeYGnEUuBree6UwEsHs4IBQBoOJ8OBSAhxO+3EePD80gP/kU9cw+u6TAebFTG081byUKtTfsGlHf4kHbKeonrz+86pA1KS/ydv4wIbxnRB6pdMtDj41Y+9MPq/e+GXy8Jfc0B+issiGao62S+SEvpIoJ/hpb0UHBLiihIJiqkdyios/aK71vkJXcPiBKQQSCWKevn4Z4E/pf+rd47NnzjtPXPKcKmWXvuH6uvQSgZbVi6Kw1Ld1t48ZIfTHbJIDuwF7Pw5N8AX8byAixLzspOIXSwNE8Pn1NCF1A+ErpeZ3KE3hA5axNn5OgNlGZcO+B/0Lz2CqR/f6wA/nPD4A6PvCboKOPtg6pU/iH7Sf8yQnPbCvCZ21bUAJyJZIG2DDWDRwRo1kLJRYlUSMvwuD99OWobUPyB0PY7InJm8/3leifj24L5TH/CDuMHIOg8ISAU2tv+9YOoJCht8QZH3x+c+tj2mjY6X2tPhnahKRKPsuhR24VHPmMg8eG9sEAgBf1xbj9sOZCBsR8ZatZasyJEuheoeUHBw+4+4Ng+vlF4NHTow3BsG/odnFr95QrTfcDTYUtIvmqhORz4zW+5Mb9SAWcaMgtkACsYwmSkxvjyyalZbVu7eecCNl7dBkTbre0O03rdAkLp+VEIvWsZab61DNRebxczoOqo0U0acjU9zwWwy6C3TVAXTvC94rxWzGbayYSvarWEPj8+zPI70DaAzUgYNt/61dcGp99bf/Dlr7W3BZDtbgCgu1sH5vrph1Ep5uZApGu6czj8/LVAiHWagOhz33TsQLesvzZHUEv6rCW+2wQn9BrhYK/H6WCURY9lgUgI2OqZ8CnPfhvn7ZDgKwH1vaLI7hVBcLs9Z2tMbcRsTiqjOemYzEnlL6djvtVYVmH0SGzOaShbhbOLeUXj54yZ2+G4qp3CS+0QLiq6ljXeKXAw08q7BBZpWlmVLRUuxRiUwJ1sM6Zkm7Eh25TziHkCYwfEQAMp/it0OYKswCt8padlaZVqG8FWRZkjm3xn48hq9HaEohoxlVnwKL4Yh+OFwwoPStGMlv1cQmZ05hd3wRMAh/0LUn0pZsaO6E/Wq9ibcejfMP9fOJyANw1l/mK0QljKENRfhZ0MYYxqULR+rUfqrpnNVe3JuAqmORn70rQmG7wVjcm4t6Yt2aBbrCn51400JYo29+yRz5I9/+r0JKB7wkuxYLeVtjYdTNUajHShreixh4TXnp5caiE13IcbHTfZ+vtn1w+9vv65aST/msZJslIIxMKc4PYZCcOs9Zc6iRnOpMViK4FnkBaC4UymtcxwJtNqbDkDtKNGJg1o4EJavjODo28NDn8QA8ELEUDRd3pJi1WO3ApensCemCdGOgBDwQsVksSMYQW812XAm1mJTnpw1HoydNyNZ48Pj3/G4AX59b8pMrj+nQ+2QShJ5R2+RHfmQSkgt3odrJG682GgiPCkTK2ErqFx0KIN9ZsTTz95Q4cKul+BVr3tkoZAbpoff1cmUJ5xUWZ9MfO8/nW8JecOsXJ17f457hELlntBlAIhFe6aNpEtDpNGlOHrXF7Hm3sUQnrJcyB1IU1L5Bv6AIyjSE6E+1mQNVIgfHj1DTuyt43QPKjhSVVM8Fd/+GD95tL/f8DZnEMHD/fKAXjexpvHWkl8Pf1+7vd0VMp6K+ELhoSrbBNt9483mmCRsx/P382l1R9uD4+ejYfhm8T2ZBChcewv1jMY2NOsVoEknQZw1mmAJiyJzEvKitVoslozoMavtbaRGFCESjw7RTuFwrAoYMMGYApelNV7p1Z/+OFXBQGjCCBgFL8BCBiF3FKKqAAjGbx+WkWFX3EkMRgYjQOTZwsz/TusmwW6Dtd6ABhXnDAvvMxZIwtWP/wguxM4hq7Y2HQeXySDgze+BfuawcOj1n1iIOCrnbaj/gaL2gTlGO8ovEf29XhPLbYY3s5wpargeAQM7Ndej6y/1EJBah+vxvDDz9Yunfi1V8MDgZE4IMhSAfYk45SUflObWJzBb54ylJBBNYLYGxApCB97a48P4y3f4OG761ePrd5/Ry7G4Ba+DC2lhB7AVhBtIKmJba4FRgzcgiGGn9kbUFvtxxvUrvRn9fuV9ZtXfl5/QhvcI25DeyQsabMFPc4Brx4UW1i852lCGetpgZQKw1vPoDAYw0K1ZqNEtULGpI5t1uDfeaN27ywPjl4xaqfgfq/3UE36SWp4Z/cArf5ebp5Dk3wBzQ3+Vr2fJ/s26z1AWr/1xkjv9zLFRRkUxMaJMBZ+gSZUUi5ApXoqpQn/rNfcWDtPzoM4xeJg6Aj24chbIBhyTwTBdMGwG74Eqbxd1kC70K0XbCOWkdEYvmBurCvXvxlbk0n5TCYfaGW0isq6f6IpuNeSKXh8ke25b67gFLz1vopDAThqtGGsh1k8DLCRR+rk/zdPukF2teFvUuPaOB0/3ni1FgDjkN9eYbDuehy0xmA4muCAhS0j0RLV0YhKHPcpxl7wAk3uSltxqw93SsaIIhGPlhxIq19yB7vKjDr4EUPq4Y9jSe27yYgptZ4YV8pd+e3ngDTv8STc/85NAjCWSS30QIwlFtIWAA0dOFYF22ttjiHONTO5M2rWAky06LjxHkMcr0MS+4ggorARhJNgxEiiWmNUYjJhycsZm02y2Ozkic1BbNnsJBYTViL2fUpY/wKpPV90oNDQv9Nhw48eGGCABmVrEAdMEuCeKLsLVHoBpDXicTebRbzY87DVZ+BgPe+MGmTkGs1Q1h5obvQpDS8CU+k4ykBqHQ22Qkd5Hb8YOLnwtRztULAvaxHhnhZFeWCfHO8UMzgRZxO98txMxMg4LuYvHknEPjjeocdXSgdTMmOjI99V47xWShpAofZG6WVXsR7noP4gAj8lZHm3J8pGkH8JdYwooyOLP78ZR2wCmaEJ50U03D5BO9JehMIIfY/F3REuqCCLSf9u0mNlQ8h/TWsRrhlBNM6AB1a5KNAoxn0+xoRnfLXIiGeDKpEZz4Z1nCHP+DqRKc+GnWYV1b88y5iHvgVbnoCk9/yLU1MVaN/VEQom3pRUglcrHdAikTqaK3X6K01+BvtRumNEVh14K4BbJ0ss2GhoOss3K7hN3n59/eobw7flJguu/gFZNhK+tsKba2j3ZdpwBzNpkjDYwUwgkI0QOAPVrGXiHd7hht2OQY1zD0ggkMGDgWxaKV2gerrp6juyaaU5K9/719ADDllroZrrtw7DUTbWoaFfkFbtevgdv2mk4Xel0SbZvPas6fVHR54e+iAoYGcB/8ileJnAVSJwmR0yHS/IChTehlvx/UlrK5ExoD5LaDuxguLA2jvfrJ29MHz3crVRuuKzVqFos28W7gAzqgGtggE5zZG1rMY+3LS/gPpZTcszNw7efcCcfFm3261zh4dfmtUMXB2V0jzhArZ8TwkAbxqqIQ0630p83OabF2soaV6sofDiCbYjCqbo65rWD+j9eyjUUq5aj2ouSkVfD10LgCKCRSree5Ar5RnCncdurf7w3vrda9AFAw4eH2iPEQOHHWWlDvpo3cUel8Xgn/xZgNZcV3DZrp4E0NyNyujR0KgjTIwOHs5ON+uAqctWN/hugppRQJjM/Oj4kZaLHSyOmMYuvo3LtMnvXgOgqw8vDk+fqU48OkyUDfnaZr6BxjNSajOPVetayr/ma9yHP4S1lg7wYjNkxRiAhOZrZQa4qwc2dku/Z2sxRIGof9zbv76FsFID5o3s7u6gkT64AiX/id1Q7Ic2U4sNEHWIDZZ7vqUGXDGJndT6w4eD776OgOYCdrOA7JAjTidDhWdtcwS1ZYAnPFS08OAbRkDRBhTp3spbDJOZmwbcWndRGiEMCSwmSSjA1sPNU134+roW48y2wIiN1c5aalXgsj4Vo+L+ddQxz9XY0PnyYk3tWYaXfxicOQrua0+/eHv46SGPIWkpoRudaIn1RQcmISyyfQJYuDNunQmb4odk3sJrHfokR1v74qciqcyEui1UJiKZobrPmAkgqFNuJsbMQjwFCJwMla/DLbxYquYMZzORB2kQ1lPa1NXEtoRVA7s2I2704GTBZCYt3Q0F7i+sQVQMhRHqnLudgL7ZRQzVrAq+WhhEXgExTtqFyrsjOddAhtsXghnoNc+kp9UyuSMSbl2rBjItRTm7fenc6/B46nV43bynSwgX3WGZu/n432w3FK3o4Ox7bjklyANu0TpfRzjWyZiIOjo8xzwUXSW57wI3Fb6CF1WWCjeE46hgSziOarQzDfT2ZVMMc5JNpWSkC1h7b/4SuZakqDB2HZlmE1xELtIDRN9L17gDEUpzM2AYTYcdsJmNd0PmMVaPmV7MBosnCUgexdkQLrIwLQWxrWykE2ACy0GoOTCsXkHhALKGguFVSSIIhEk3eXGEJFpxoIkHQ6FRxJSKyhdVKG4xZRI+EKaYgB85DQQKWMDVRx9W4LNBVSCIYlGlQNWkSuF562kHj62nGUwVAM+RY3ZKOmoGgd8rAJlB42hwAptM2gHxwiz+ev33XBP0Xlmm8Y5gtvz6w0qcLOHFiI1kiImKNDBRFRrGVXBsvfHywXuLPG2YH96iDlxUVmHZjaeu8ryBbEaMbyCagfkdQzGVFd7i+GBjgU0ToIyjZyI3Ko8ZyrGs5F+xrbTZUZatO8o7oWFsZqo0PfndUb4JcNwOz6YZizaOU3m5wqG8XOFMXlaxzhiRmAeJGZDQ+B9cu3/wbU64Bv8QmrOmjFjvZvK8W2nylBH83Z7aG6GPiW7Ey2yLiOyYV44KbkwCJ0co3xh6N1kldNOOthldc2s9JWv8slvWybCc0zHBMGIRbcI/hP33B9t5E7bp/hCjZEPDP7eNSLir4ig1fdJ+gxZHv6waP42tEsyfxr8OBlAbvVcTqLHvgxHURh1kHdM/b2gGpedrzx45ynv+2emXuqjLAZyE/jFbWNGIeAsljUnSttbJtx7cGPn9YlKgGdYsm1v/eLKUq3i0kFgmMwn2Zrx1F+2ub360umJ3zQEI35sHKHhlHkDwbXkAYtf9FRhowRDByBrcWzS+4htHvJ+oIybOkufARyKHqEtlPm+mAP1l+QJYgB7e2vNXjZSL4bZgFm4FxAwQPZDoXhluPQCJkKILXJDeurN+6O3hhTdZkMFLUGSCok5cxsgGoOob7QDVB8+MskGBSeJuCPuVpK2oJ7Sbgfw2XEfWj9wd3PrBdUSWtU02SO1JXdhZDLPiFhY6xVZKk7q03Rz5zLC2FCgCPfoN0eDS3juxfu3Q2s1DtrQOEC9ugET+Yw6MLG8AxOY16CM6CgztOm5/FcMj455yp4xpU//yJp1OHlShg8kp8EUvmWNcXOMROXAXSfdw5ioMSQF9rCgOqGktQCrQ9LZWhYe+uajqrznAHRT/R6CnnY2gn/1kBDovXpF0F8CDcx5/9MrcrWIv48gFKZRvDsNOujNWPw9LimhuPwcD2WBhUYHrF3Z48hNd2LGd0OMb9wLZ+TFd4OUe6cTYRZeO+EXXvuTgSAVHA9yiwZqMzweMGlRNWpTwkSHrGyjaq7UKsuVgTrSm13/k4An63S+JJDx6f/D5a+vL7FIQw6g0H7WMnow9kn2pVVnf0Oytu77Z36b/Lev/6sMTP7f/UaO++y3rvrX6W3T/yZkZ6/7w1vlfqfvSKnVfW/1VUFTYqIh4UX17UO3ocKci9j1036MPD5IRiAcpqCMCTMjDwQW0MR4qoI1RqGgX0pUQVwkLQXz5gCYg8qIlZL7I9uNp3Cm28gwFLNbZXh4D/5wW3RxGZ9qU1rOF2iRdpKJjGz327BkeX/HvXtE7YXQp8E3D3fDqyueuddgxoKIGpSvfLfeSA2pFw/1F2geRFn5fHUQuhRhDBjRgOStdCzHjIcN7DNZTUzH7GkvYp0+uXfweJNXh8qcBPM8BNrNT9nBJv6TtnXzJ7FrFgXzwBjdGzZRpjZac+g5GT7DWpEJcrMky44ttsNREC8AKDFQyoMbGeB5gBrZ67+jT1z71ZNvaQmyvrQmWDw0icpcmefdbo4TJrdG/sHfk64J9Y9S8ssi9w/29IuHFmr5zBTz45vBlpXfUpKd71CjTO2uUrMZma23Q9mI7YC6SoWUSxJUgJSMzSBATr79M78lUDMLalTyXZ6BZPhj9O3UKzPgIjsTq/VMVfkybB2bMQUC+a5QPE0iO/xJoMeulII35Uqg44YH9S8cwnjD3FWZvW8Tj4TI8OYOhjm7oMixfGVy87JYhAJCFGAVC9WIwuCoeEC+OA4WLE0CBMNjs3+GIAxpNAtSWEigpBJOIqnEwiTrV2tdKaOKW92K0yFZwrl1/ePbpofvqXJtLA2xmIhDk2lBe0QNGCMRXdGNojcqFJDdJF5JjTZiC+GGCh5M6grwxRtSI5Qw396OTHs+3n2vHrgdG3dOIQB0iouDowSiD/GuwxuM50xG2dDwvWOUCx7GAVeZvlOWrMHu/lAcL3Ncv4+hiPsV4oV+BvQqciWd2fuHie05ghA0wgj1Ckjek1Z5Ee+LsGIoWh2UywkyLHUhyS0e9qCVIkMk7JCacjmoGSiIkxFEPoWtG0Rw5e9ZnuYUrE/oV6IynL0QIGMkLZo/wecDkdJp5YLDJy1fRX5Dcl6eefdQ97q5i0+2G4rYb6twuCHO7Q2uG0cYoq0hRBzeBNUaI20dUVWMqBEXVuJdBTTX+rSqpxrwNKqrx3WIF1T9tqKCSr7p79gh63/NPTkHVhhAxwN4BXamzfjyj2KRdKmF1PRZRuE6rBMScA/tYCXldoaUDUnD2nT5ccjDHc2v3j8It6OCmsEv5DAebz7BdUxXdmcEI9Xxnli6Az8hzZLlIV8LWNF8Lc5POEBB4EBgD2pGCfn6zmgRSHN7/feh9GgwEIoDgZ/Qy1yCwPCb9xmLDzpdwxS0K2nsNCwxLCqmVzyGi2fo330Zx0dCoASjDKyE8GkW4hDA5oBts0n2yh5l0sx0eHrHWSW1fztvTQLK5JoNUi83fBCQHn4uAfnVhLND+0ksxRLhArS2y3akGPl7USItShxw16dQ6OGrjRHBCEJT+ctkSh1qIyp1BQKPdEn+QQjnzHUH4bSHol/arzQlEbLz5ttmc/NwG01bNtSlGCNSkXKbjFHQT2cBdIMMwsx26XMZyAtCD00knhm53wKikxHioYM3Syv4UfLjooMBvtsf/APbz8NKhYJSKTWzlo9fReygrxEYFKKtufWPo5xQaS5BHHWkxpSBBeGyrb5F3Cc0z44LBWbV1FPvPnPrFXfVNIfMTmkpi2SftOcks+wmxDAb/+JzqTtc+PDQ89VmFkmXl1Fj6R51y3+Pk/Zzv3QShPG4TBHL4z+mBb4CnRRuAwwwMOAhPGIRNOELEbe3+tQxuQtlKy1fhKWqhnJV66RClrleF6/xyafDmr9S8uG5q6+iaFlrnNe1mGOOZ9P5dQP2AkBt++0GYXnlN+vGi63Ye6xgAV+idx+DNo08/F9+w0G5IYREa04bYETBqB2c4tJPMAy6AmEPsAAsP7LXHsVLil00yoKgnk0rvOHZy/1oTE4FQ5Pjjr62dgluTL4a3TmuUCo2fU2BjtBeAFmHoFoRF8hhw/XX3muEspv8zBmOJH/jyniA9PX9z8OYdMckH+Qo+pBgmcHnXI1fDzWEQZIMyaeMgxWFvsxnZ4wmokeoQQ+HjNN385ul736L28NI1kU+oIQxDDRh9NuPomTxjXAhx4qR4bFWCyyVc5CAjc9jTu2OCPDjztl0fg30YoFoK6M0hpufRS5ofcn1HT/Mpzt1MDf5KhFZEjWiqx44tT7+4AmFJnW8Lud2AggsDOesS0Bno0F1wB8LdkVpIV0v9cPATcUuXThFo8cohrVYATjku4KK2bj2ABBfDcydduNhGWmey7q2JIA0FcC05u8CrSZGGKOUPWs6yCOtLMxUjqns+XwtxFafXrp1QyyI3DRK2W5qfGjsZ1q2peD5cyG/9OPTIT4zrjp8Z7pSfGQzAKbMyB/wz+NixTKHlxPFAHMpp5nd0QjAIpRiF15Xd2Z+3WiQpKuCVrKWhnnEqvjlscZ45NQgbBR4oyUCFU4NQkZRwdhCutJeLAMQspAr5UwVISHBioDi9STxGUWOX6ME46cbTmXQjEQUKEfwwg009s6vfLwMAsKHXM+tmMG9QxGtNiqGTOBVPndQKE5zP+fEgLMR3TfTflqkDcIjxLtwdrxdqC3cQ/m10JmOJwcSEXxJuuKHhhplT/vlNBLbUOFJzfDPukePCAn4UPw/c9Bi3UcYFm3scV2ocKUfNk9qp/qj+jTm5X8gTeh7LMVg/zYo4PuhnMUGee/G8TxsCDd8RFJLIIcU+Z3I6eweIVjnuIbAOfyF1jwl7hapPKkE/JkRQid90RFiNmCoZZVPRIqFAXfKsj4FiGZ0aDy+Qo4gMGf6vYv4pj+6nKljeY9KpCH8a1vSnfcrhyHC8p+xYT8UIyrDSL23j67JpmGCMMiWVL5AikV828JVVfcr4OkGlssH7oFXZsIIqVsZXCLqVDXvJ6pV/3FC9Ih/O79ljXzb2/KPTsHBQtxmgBF0NpAoGVVwyGkg5vPCRl9s5qCQw6YzGUS37d9CrphpI+fxX60e+qARSBgm0CUJ4Tfux3Sy6mhi2g6Iqa7mrLl3ZHmwUUwysWeOuMLp6fLEhXtXaH+zE8rHBvTvcFU0JkHTreZtYB0x5EyJn9+gFWhBF9x3uA3flsWilPVQi6eUHWcFhyp5w+7H6/f3h7bMWQxv8lAE98afE62QSoQLUhKEHbPvHMSqiT8REsDVpBoJAKOvyJQlJT86Tighi+llnqBcPnx46xn3hjrRJh4lRtUFnVc6K/wNxfOiIQYsOstWsOknYBy0yruZvaD9wOQTFSEX9BjwA5cwgZ0EIDoin4umH14fn74G74PA7jnyfdEtcVNCz1bjpXYxZoBA8M3AvSF/I44HK51HBEypjODvk9WgnhEI0K84eH95X044gejz/cPDDIe6DQ3cLrXwBvI1pvRfytmMy4Z4ZA8viZmhRSM5SXyPv1u0mYz6iTygcsZYyOcccJh12I68zWR+cPguUffUR+8W3Ic4KNCV9IUHXwQfU+wIROLCUhe0nwLEWWADvrzHQLRakWyGymTbDkp3fzlFUNk+PlAsgnEKr5uJsQaBIq8h+HovyjC4hzaTZUW92Djaeywx/cwoSIA3PfKSXfO3+XfoqnuktstUFdC2a7C18B9hGP3780g/WT3CdP5+MZth6ZFPMXfJmsk1IWJRjoimxR2Z9dDNrUQjuFlsqS+RsMpnlV8GA2X8ASrRZyd12bz+ZPyjfdnwJoioObj8YA5rdMSOwLuRrBFQjv7rKEv9V4anmkuBFrp9oTADBWGEnMp2EcD/dhoZoBRwrxXgn2k0rVcH6G/yI6lrAUWGWwPIacrVgbGeKtHP0+vDD14fHr6zdv1uFutsDdIMLwGRgDEnHZGAsUDCBkFFBGkwwSyo4+rrFakflUK9YLND/ChZpRhksX1nrYhnURDKsRciw0z2/RL7JhHUfHP0WUldqKhptjcPmB5D0qC/Fc0KARI4TAkQOJLXu4+m0gLJiqtcaSkI5ismJ2MbS2Wg10Tt5jPeSfIfCeOy9xC8qUjfbtDrnJbBndc5LZLIbeiMBr2quB5xFKJUUcVyNMh+AUt2BdZrEAFIUXQQxUMHlFqiwJZovUb8MC1w8X1+Lw+Mu1qkOB8dF83p19eDguGvL7wzPP9KQvu5zXrkAQ/xeXA31fGEA0foZGMl6QEBGV9BhFZkyiAYLW1BdWUfXjq4XK6iF30Co2/2g+xYhjlYNb1ZJuKh1frxB6m9YvTsXBjePPj38jcaRTaIdBTZNkL9F0JkElcCuUV4yYGebGVlgWdSgpDX6Hd/342O3tgjOedQ4JaRFXg+UJYs17R6uMnB7nx/mnrGZNuzbhNN/sJyW5a2RCOqLKfOYodZ+rDISPB2CykicVYqdPnh4AiOtauz0DO6aWpL3GY25ikyzw8GIW5zxuVJO9XFBXDlHlSENBFTYHh8d6YIdH+6Cyqboj1AXNNFJF2Ee64Il8g7obRslPvM+AzuoDF/LRhOOEX2zNcjd7bODN7+0sNuQrKpeExxL3WxxCaJZGY5UISS7JaBXLJ+I8GsAFrAsQXMO8HXM5wCbc6HLqnXyf6fCVigNNVu+MjrAY2mqH1MQymtkcQJ0a2VWrpmuPATCNbx0MiSHho/AUwxQtrpXSRniXC3kdH+VmiC/oZ0OvSGQyz10/0IqKbCRA/3kvafv3mTIDLO/TE7gkGOZCNRiQlo8lOzpmV63En2/CMYOpVg7AOO3XaO8wwU+Kb04xvvg4oO1o1/pmOi0Y35n+JRtErD/dNIxrAccytlZVxrqUiG9Tmrywct2xwEJBAwyXQyegDStDFuUO3W0m+wgf/oim1KhjRUpT4m7DoVYKZuhAnxPnzTxTp/G9+T8rKLYZoeZLDp5K5cIz94bXBI1pXyXi8YWxLVknnnUxIFtch/wpTB7DL1JeS4rX+ITPbDRkQ0GBP02KbJD53Bx37329PVr3LHxur+KyBmkTPsZpEkvQY6RHbdE8uIWLyVucbLhFi8QmiTopK9dQeDaZRLWLhWpdjlZygSoMcLLlqrMssVLKTHvvMWzzMYoe/lg0kkGx5w4MGmCQMT+G+df5XV3Rqzrzpi7HX0pLK1xs56p3KIM5ZbARhqG2+VxmyE0x7hNB6Zt2hi2aeXVph0baMxflbjvirixXaIRI3q5K6LcuyJyYWQiYkemHCsy5ZiQKWU/piLextiav6pTjkZH1Hk7kWTSq9Dv/cTSOTI3QuAmjLhNOMI2YTRtIiJnRski2uJJiiMkgXhEZMPIhSHtKcbWU4Kkpww5T3icbPjYoagX7RLJ8OA4DPhihPsM440qFKW74Kfnvq0oFDeoYwrFjd6bQnHjCqJQ3KCCKRQ37iUrFP9hI4WikHIIq260Yc8/+MDqB5MuXXgCZ9W/w3g7JbsTdITr31U0vxcNu1wdYsQAsTckuxYqkQFT1uHYvGrZs9bPvTF47drw0seaQAvTiyXzaIHLujOgDnQz2WkSQcH0zlIE2QnBlpJiSMJQ9nZJNwfWSMAggVC0QEGbMKC7wsUVPrnEAHWzQ4zoGfYtBgm2R/dUkp6pgSHmIdtySy6xYbzGGNAtNoS46yHrYXdhg9O3hx9fsoswbRxYi21R+8gqt1oVKFpLoIBgR/szAOnfezXAOMWWoV1N7CsQ9EmbR195yvvLFeS1tv34xkHUovak6fVv3hgev6BNM/WRLySXnGTblUJmelFSLASKZpVDms51vIil4CS0AEGTa35c8k6cQRBtu8Qy0KcbLJKDG1bVTIMwZ3XO98WJBtfvfgKZJzTRYIE3PfJFEbz8YQyZlgYvf8zpnIXK5udfqKM/MqMdvSZDR3+ku/WadoF9/ldXrnIfeIMfACNTMAOc4QgmGWb6Zj1jF5Npk3ZuFoW1UClNEUtlYAUDbhMpHASyFckgDyxtbpYYLRHr3Xtr95eHx05oOlYKNQpQd7MpiETvyDh3Kb9EeLurgHzkjhgWB+8wQKbpTTD3ZDOR2yMywCeRj7F4IkVaBVRrMzV+BWxngz2CD9od2eDkhfW7cMH6XtQ8WSD6xrP8Fd82vaeW96fsthQ1zcaG1LIZG8IFRKENN1p5IcpgSujs38FC44GWdtH2f2VRm3z6yYerD96vNEme99WGMeKA5NkZU01g7AMvhokApL/ESXoJyPBjvcvLZuQeg9EkmjGDuAnMBV122tuU3qUUsRYWlllW9zUjz170NaFRqIL7EmwwQEtBR43QKSWlpcvMyzOCU2/eHhz6eHD8o407JoY01V7R9pB3Y7vEr1x3IFvM/ulqV8BGiS9krS9Hv9O+YLaH+sazZK83miar8Ix5gnQQ9ZGJgk339SLnpQxTtXb+Gqa6DFM1pns2V5W+VSZrTMei2aJO+elyHXITJj2SCQOMhx7xSUif0IM8j8DHdTLRLIc3AD/Fclcb8D6Xpb1QiGF+New42cMdvgUM/NrNd5XbBRSEcH/PEbsIPynUbR6QBBcyIB5DCRBGTQwh5KDAhB/tNF55ADBfq6w2SKZUN6rZScglICwuXrztQ6pPKf7OvGrXX8MvH67fhVCo362dvzMCPMejxFmeGHaJMi9IzvmOCLRIyVSKzEAbIqMlbKl9vRZAMz5giGbBMNdB5TxE9EUXduYnFnN6CCwBGjcYR0APyhBw48yS32P7iIfDr44oSwD7EtWEtFdnwPuIk8dkUgQZz2Amu6xyHa04n7UKShXbQ5i7FDEHkIyXGaIwN2C2B7E3weRJhoLmflJgw7E6xkDJsw5KUT+lnFNWB+jKgy8DF2UfASvG+bggaqoA210Fo3XCR8/1iO8AvB0Bk1AEBEuMX+uI72UwYMDTDQNJ+FlGsT/pNkg9HC/Nk/OvhpUZnH7HmLV61unf7fbwmjg5kNGhw+BrJVgH9FjlmdP9chsYngQtYPcKU41pp9u1Hbs5GvfemsFBGJdWGIx0Xvl5GQA8ILYOI9D3trf4MR4CXGPU3RiW3wsMJ0sOjfig3CUg8VGxmmOOCkPd4k8LgrTTAhBFEQKuULAdZ2rYrEZkpoK0JyprqJNolbScECB1uLrZ10nIquLenC45xmdCo6Rldgr4Dpd96e2n55QF42uA7gwxrCwI0HVWd4G8+whCqKFwOmq+aHDwztsgwG33BhkCRYiaCpLTMZOYiI82CclJRyOi0QtBbplw4soOE1QmvIhi4klVgNhWFR62ecFhmxcZtjm5xGQSYQCNbUdKWaQv0poB+Vf2P8+kNAlMO0KRUo7aDZmu2hHX7lh1x6RLWjk1Smwo/8yqzUzsMJWJFihNqjiGl35phFv3fHrgb7cab7vVeNqtzM++ELOyxsUavzktXOa0MJbTxk6+YIyk8ZDj+bSJEQZtYhxbttszZFsqrJhnwjZgcSZGeZuJsRzN7oiXmRjhYjz/YszL74W+VpiHbYFv2BZYEmNGKtR6UhqZcpR5ilmB7REDYETfUUhSzDXUdLkQclck+i6mgp4AOuqHOxQ6kBoN6rnfFHXePbufVQrkyA8o8ZDI7GKH6S7/yrWolQjR+ZMnN0ZqIhy9xVDzFoePg85nS4TuDdUbKpxQJDihqC8g180RvjNUN6qVY2ywFfRdGEEAEXJFJTeugunjxr40ZdwGb0UTN+6tqeE26Bbr4P5+Ix2coDYy6YOPZvb8vVfANVPiIMk0rVFCLnt0BIOEbinenHTZbR1tWp5rSHJeyukmaS9IbcY7OViQc77eurSEiT+WpKViJt9bk0ZycriUFzkiSvC0zHqoDZjhYJ64PlcfrH93Z3DlCMSDk3AGle52U4raBli5h9c6aeglHhBgVifHdw62eEZfVvoErMCf4g6FrJzUGU3MiQbVeP6EJxZzOixChEaSPeahkOnBU1V2kCnDLVnwqPkWDxKjY9jdrD1TTluW1uU6hcLbq5G2D7+9/hBCClzRSNsOOuCv+TANHdeJgyBP5Qu4Vq8oe44ucjpygRwGHUBLmkqCqmkqI6zRo6w2kcxjb2K5x+OTHue2cV95FttJQYiHGzT/VTFocPza+u3XvRgUdsQIXrOd6xGc2wwb4LpebSb/faUXkd8Dd8L5PbSQnWtRqAR0yE8wzxOs/4wEV6BXKRtl0nVms+QEnAfBkolrjbRAs6hvAS+BwA1S6SJXAl6U+A40W5Gb3OvURzIAf+eLwfHLmODk1Hcb9i7BMw4rARcysFQTP9FPt55jO+pWdLSrkXhrHY6XlfvslxUtW9EKcp52GnrMvChHhkvj6SOjIqmOQafB6tdlFpIXMmm0zZsEOZq2w28PTh5x0+a6ABgPUaKbrbgjbn5cTyJB3+r76fBdqUwI9cZNSCvpNllRAVu6B2kZJNI9hEttgT8eFUI3Ld59rr4xWD/DA0bh7pFv3tSCnPUu1r3aQLEYK77Hy5+iGBvi3cOtLASehbizhHEMfRW4GyCwbW9Eu8VXNhgfaWQikJDjTRLUBUPV0bPvelNRglCv/DbhOOcz5BXUyPvL2B6Eki3Vuy5FGYPfpw3KAKcZWDFiE4aMj+OhWyMUr190XpgKbh43NA15Rr2wLNS7XDp9vShxUdiHAC6egH9cv3WBPAk27GyNYkqXWzbuLLxvSGaicf1Et1OYzC3P6CmmFyTmC6hrpxZ3F/HZW29aZzXEbY9Dc2wCSlIXS4K5eplAaiYx6jMru1AZWLLropMBpjqbgzUVSzuiLPe6ZATSlO39JngufhDh8FGkxBiccAxe26GGEIREYhkonEpMgqBfi/zByCFD4KIpFdiiJhXHI2hkFt3KZCgTYweMlWZ3Bm+lMR/puPklVZapvteqqVWj3MqfvzZ4cGHww2kLMBYmUq2mtAcQMad/PJ5rMaEieOkLERzkoQzA+ic3JBhNWYct0y0pC6GyRq9McOqBHjCLJc1iuwwVCbdLTQk0kzhWBfWuFK1f795OvQXBhVSqjgGGtIcMEtg0lMl2jUIM+Q4NpKY7DBAl2yFD1GyHIExhcjeKxokgR1hZsIHv8XuAM46N9S10rIU0sLBwQ7PACuIOo63QuKRpvZy1YyYWDtXTDz9xTOy4bvaXXhnTP1WAVbslmrxqX0gX5rohGkmGr7owOWvEvtFO6tDBg8yam+MDh+e7S0QFQtxudpyT/w6Y8EV8h1x0AuaWgPTnW5QNNXBMZJLIBmAzFHUN+abhsYeD729GXQrttiAQ7zK7VY92CHF3i04Xax9HeuW+dt1CPhf2WWbu2kudWrWPqMT44KF1MOodBoeDHZo7mQh6hTYDc3WICVJnz5b+Idcl/EScpLgjuEgohUl0FEJMaAaLt/wBMQCCAjtYuOw3xBAmaKQDwAQR/IloKgDqjG4TjCfeAb07diF/MYIrG4ThVTZI7r1ThJOuerIwDsbQM7Eji2Dh4MfSv7bI4cKcG8vq9x9AwDDnxuJZeVaJGQMPlpy7A0CsULAiDLBhzSBOiumRQkMceOoIwxnZ/ORCoK7QpC9lNwOdRGHAd9viqZ9B2DPiaCD7RQO/qMc1JryBMPdlfacDBAwzUPWyToUKCu1AUld5H4ZAg5A2i7x3UP/brkggj9534gfqL7t0i4foZK6Va35Z0Jp19ebxIKpIiyznWBBd+QDxLZjQsRVKSkWA8HKuRfO4LMzYAV4y2CzgBxaDZeHTgQNaSUUKRqVTAgCB5P7kG4e4Xeh7WVj7EL9r9f4G2ueKAmBHJOWRFraTRGfBZH72Zs7AxnFO5Lsg5Jt0HyTdlY4mjWVxekuQ4ndFsvsuJzmb0PzX6tlU7jRhc5wgt3lDqW3zqKC2eUQ2m/bymMlgseijeVKDQ5qKN1NOqJmKRRkTX5zscJDkhGaYOxYcmswBqAt6pY4viMQCEwU24qvHs/5jWejxHP4oW+85eh9ooilqX44J0VTdsISSyOfBgUYCHWAexHyG4twpT2rsqGsxMJMps38hK6x71c1e8jyfsXsx6zVB/FbEY00oY7XLM1TGS8UcyqRjSiY9IzLp+I9tEddhHMdvTT1Hafd4wo3UogLawd0Vk5UGWNYW/ZUXIrr5e080jWA6IJPa8qS2Nukp4aSjgEb4PLHYHX2/V4sEskf8o1h/wqHegNonFN96PG4Ydnw6VbHwrsl3YzKpjtSIkqiOvo3yp4577VKnjryOsqaO6xvrvf/93zfOlyr+nnv2MOnZ8+//HhTfDZAk0018ad3BiEKZuKfDRR5eJpJdYEIVnkPvn4SS01utPKMG6Hum32gjqW8X8eWm2RZGmYLQqVaOZoPs6b6MUTUE84L9IHq6v3148KHmIo06B3ZdcurHda1borJ5sYSi56ZHetZgc0a+OPHdykFKFcFe+pSLCRv15umHlzXkckLtARkt8UTwdW2KQPDmD4WUUI61s9HqBJdU/qHsxxvZAWUHET6djEc3MVTf/eW1+1fFMoAbY/HIoAbDAAEmrK7BIT7XQ3jVWlc+t4BLkRbEsyoofYLkwEzVQxIPVA9DR5PBnrJNBdBUzMgtta06OLvunSkx2YmU9O+1IbDGPmOc1i7eXLt6VhmnGDT+T/5i6lftoWOK2JRCw7KFlAWNwjtd5D8SjugElfpL7I1HtbVHkDJ+t+uP5FTn7mhadaXQqLOgVHJVNrIEm472KBPJ6XP0G89J5li/wkhisK+YlVz9/pzOyPguBDNc1wVvsjvaA/tE+6CWu64LYrvLPVDb3bxQRYUNXOIXVUbNFd1oU67nhquxRK65DQABRW49tA3AjYApBS84NVCQD73ElpEa4DnGIYwEiCynA8ABqA0CBJ8W1xUgJ7C9/EUEONRTGQk7qjkHVqFH3m7RfQPEEyJrG9aYZ+QJR2hiiQLsPjgJ0zY88WgU1O4RQCJVxWB2eyAiWAUoJlcRGHPgNjDJXOeZY9Kq0Zi0UAfFoT46mNqdRzU4sjx858jPGlUF0O4IjAzLwVHHdAak7vZJna7rMGKsuD+BZ082A1bSbLjLrrdk0JIBoMI6UgRj4rgRcRFGrbw0Ycm6KANaHW8OKUJtqno8mne1YT6FFu1qcNwl3hhQCeSHKNhdoUxJN10W4hLYzFJ5o3UlxV7ZsOTu8DuNjCoVqmRrPBWs6DlbF81AQAHkcAy4n+N90cUn9KF8lYOouU+c9X4Bxi37CkMBeGo6bE0i1vuvPxgePzQW7pyEGBiFqpEWPESpzODCugs0DTlP0HTZPTBU7AAnSBntMJgNcDNqkgszCiarbUV24Q18sZc+WOTdgh6lwIluk/Vk6DzRdIU8OH4ROoD2q3KFfJCb2svB9iCkwTxdi7OemV9243cvRG1b7Ahs15QfZJkFFuaooY4XDzmXpNMxROccLyQ8VD1nvXZA+01IVLw/7+wLWHxZc6voEt56a+3jzwyJR+DdGsbAQ0SJGLDgJYOqGh8DqitJQMePWYDCmqHbflajsCsHwVSWjacSKU5sah04dnoxXCspcN+9CcOzLPW/ETAZGQPTkXUx68WrRToVeK9jHEU12NqBGJWkIkxeBn4LmC6KRUYI/PsTa9e/Xbt8XhAdtzYf6F4Q/ojTQeu3rRsA6HKKYGtep4cBRNMD3FWKJgUChdBPm3T1Lh8xLz34FZFW3SVb7pAFnuQjBs40w1s4AbZ+c3nw8T0DRkwLtQxu12AND3awHPMpBkk8sn9LyJG/a5HkkLi31gW2dI++0+7QDXqHA01Kn+DG//RrkheGDhDa4uYN5p74rAGOYMd0qwHqogQ15oRIEHCXEsgtiHr6AO8Ndk1fvXcZqYK4pmPIoRS57UnPl/tQQ8yaT2qYIWTNpy0khjTN/lrcsuXWZKIBjlJgD0o7IBRCeGv92b+3SCqyvRRwmHROr309vPD+4PS7PgssUh2O3qFUCEPidoKDWV3qaFwFo1VxCBYBJg5mBGkDBaUKX5vHyWubI/lssxfJpp0oZlKYGtex2FSv2ag44peU6nYjy04rHE+CYZXHyGAmHVXkky1OHNkRBKAdQehx0o4JFj7npiUM5ShtllK08hbZ9R0Rm24ceuCYJ4RXnlAGecJY45jtNnaYg/Qn3RcDA7eFdxQXIQu6xfOexnY6JnBL/HEoDL8Ck2f8XZgEUGKqRJHSOaGw0eDUsJBJlBpl3QwzcGRRuO5qgmpjRgM46NYPnNNYtumlmHGZiNiVl5RRmfY8irEn45pSlmRMQ2lG3MdmzxkYU1AlWBNiwii0eCIEhkQCPOFI7//0VNcIriCeJgWPMxYhnDB63uvfCkrb7kmdUTkxqzUK5zWCvBDjyZyncI68BdKz21GArR7fbw3ofbfH54bF/6oROqTqMarHGIYDj3ns599EqNWQ6qi+UOGCLWr4tKIx3KCO6Qw3em9aw40riN5wgwqmOdy4l6w7/B8b6A6VFO7ZY4hzz/8IukMU09AmHwQdY2XYRaCJZYULhlfIPU+TlHTMZPi6INAT2vsSNbQ94J4QgbHN582bwKoPjqwow+6gtkNgNwfT2NoIZmekrgVMY5jK1BK8wPrtBfOslnB+s5n8zlvsUiqPPTQ9aHHe2pIjXYkv+dE/Q9AJU7UR0gDzMZR0tFlCK5jLPBHVVmjW6teTWgSP8A2XSwnflUG0hrmadoHvzIZ373Mn5IoI6D76jZHZAxgM8VFq9K9hIYnvuGnnhT6nWmpVF7ksCVZFeJv95PyMOhxdOLu+9JkNWOBx5CyCsosDZTXUiD+1n4DjyGasXtM2sb13HgxPfcGtyhxCxsK9Sdhw7C5CZeziTTnjZyXjBJXbhmMfmHJvI9ENxzGv4ZgvgZJAuFuIeg03jcrd/soAJbligMqsFMOULXcQSAFlmeyia0PWIwclKebUiuEnrTbmltcd9/Y7kF8+LID617hWQ6h10aVaY0Ue1+bC1Hx0QmEUC127YEGHuRPCQ2Uk07f9YU1EnE8q5xVl+baLa0jxuVGcz/SwkhqbgqLqcYVUM+fvjRodeF2CBXqvaBKc3UHQI5DRgVMihOs1g233Twz8txknptPzAx2884YfKJEzUG0VsdqEoHJxZbBM5uyVjTd8IfG4ZOCoUC1Jr7qMoc60O2Qm+c3w9Te5P1WM/CvSAc6NYUQAokj+lhSAoQUagOBMM9lAJCX2hnhBWrAZKkgEcH/c3pTyGwxTeNDeRR91+KPMvkoougvFIQHTyX1AhndLtCLwU2oEZwukHrfuqbNF3GhQ7ETdiCfAf2BTUOmBToNCl1kQ2BYOFUjNfAAK7mOaLsqFXcUqYabxKWxoCX0mrQ+XjkLgs2rrhmRD67Z1uPWDsmeobd4toW3JOM8xqBgC5pvXSFQ8G7ppeNrGzdfITOkoAo3SUTB9ineKu64IIFj7MOWB+FoEhG81AhB0RoZDVzdA4CX29MgRzSyZoeV4jZedw/ljQCkZEVkJ7mZ0Q/VwE4ADLFdcTPajOeBWcvibldlT+wGMBglLI/YDBogCfh2owKGyVLKFCSTJFoYw4LrZUoUFQDp5DMcm71ccENo4O5cliO95/KNwin7FARGgMB4EY6wj3wEkrLXCw5a36ZKanYYr71NQrVOSPNoTEN2RrrWEq7p0cvDmiYiNJBNOikSArUwLIymGnRqhmCFOCyvZ028KJgD6HTCT9p30YqdahoJsto8tMsmsRU1DBxdvr79+aXj0vWA7njBfCyo1CAHKHpBE1ohLxc2Pvuy71Gg8Ea7WVedfXbyOx5csSxMuZA4ds96T4unWvcHK+eFHh9eu3nI6OIo8mGKAGooGGengkF1fQGs8CPYzrZo4iHg+YYotAyTRhQkGt065KxsYvp8XCg2BAxhZTM5wmblqFFuglaCBFWe3bGHcZxUMMFrSlTd0RWkEcHlUdhJ2/G6V8xluvDhmOYoiO6z76vVMA8DmNQAXhNal1kULCuENyXpctlm3AU4hGLpWt2G1Aj7KJrxekoW5Gg4M3rqzfvVTi1XBYUMpayE1sUsCBHJpSlGlCBbHZJTamMpnAewiub6WMu/RqgQdVfgWdJR7sIHGkVzWm+V0ROSng40hP0RvRPYzsc9pMEzusztDfWZ9QShAKbki/pno56WuXSZq7TLxapfKVLucLGVylJyugm3STfDgAAeulESMzRVxxiSZyLJAZACxPVR2Xg0P7ZnNDkeEDBMwNMBDxHc6btPYy8DbbvPsu3Huiiq1oYhnDVyqb8KzooEJ/aXLr+HKmecbYbMmqgzWRIWtmhhhqCYcL2VslMROlC009o9yMca6iNYbQO1g44+CfkQlCf0ylsE4BblGyEH3SVUb+Zz8DIVYRp8bZTaibBo4zO+3mbWCmsACTANzzlYEkU20UGmhkUFHA6cd+Zs2yjcdiN7OQPGM2tkdjtIHT0NG6cauiFwYmYhQOGUMBk4OKaPqHulVjx8UZW8RfC0IdRSb7nKIdFfAobsEfU573Gl4c0wWHV4A0MrRhi3xy2oSnbFVQg6d8a9DCp2N3msGnbHvQwKdjTrIasN/20BtyJ+19+zRr4o9/+a0hnDz0pUAIzW8DEWZhS2122BIgZ7aKQanhT/bpbSTSF2smrTo2mSGWDEMskK8GF3xwz8HRWIVU+W1OxfW7nwM4qrmocewLWUTA86ACgzCqvDNHEZVmkGSpamL4agXlJoELU0kWRuaUUkG4wANQ+n1apy2moENLn6y+r1cIABtksxsbNHSEqWXFWv2Z0Iqe60yW65w8Xw2Z+meawcsI1l/CS2nOV0HKGMozeiHrw2unHz6PgxWMi4oHFMX0KHTUhX9CUkqcNMTTEfKgVHAXkFgwFk3oNd1qDXENnGROSAFFlGkk0IcMHwlub3CJJaL++oZnUkOvIjcX7SuGHvx0/fcukrwJWEnXEhzuNoF7wOIG+Nin29Y2diRNhzn1owIHKEPyppYD5gtYToNOqYmzjTvW35EFA0tvWAFFJOHKixCFDiM+FaisZDcQn2t2erFRfLxYY4EeeTk6vfgqvlo9YcrZup/vfA9d4zXglzqEbwxg9sAYhgag3NDK9iFA53NUrESBYnJ7tQ6JWxWDV03I6VEde2LVvwJLDIsOeC4OVY7oQ0ApOhW7c/KQQlMDmplivi9/u0dyBuKmuUfPnM+JWhldSCliym85yNrLHlm8NX39qggYA8vWgBuhvL0i7c1DDeEXcG9QzfOEEF7luPyQih2KL7e9FfOs61E4mbpmxy1whywBX9AJC38DPxy2B2fjEQen8M0AmDF0ON0tjj373+39sPK4Mp1SHxnRLgDl7wpx0iakyxbcBcNAhQ5FWHqrGSWXXOAstUxazXHArIuQB4IDNxJX8xV4GNo9KbE+mHow8s/DA9dlZW3IyFptkqJbwC96mj4+agWIRCphb4DYAzqzpIEz+nfA4OsFQ7jOk8y5aXhhTefvn9leOrPvMBAJV5Ff6/EDVpiqaGUDsDJjcWqkTM7RGvXCE8tlM74ix0VuF++KqIkQx28D8GRVyTAXzelLOzgRZBLiDcoeg5TkjatjGqh0jgDrwdfRoGL61pGKhw4wZZdBW9MEer59wff3QTHnbUVtS1P8OsSB9Akg2443AXlTGgTRSpqTBGB8xKPMnwD80x+TU2JXpB396Mh4v4aoVBAYdNRJ+B44rWadQDSoMOtmiRIBFdjyi8S+BguioU4tP7tikWe1ZRCleAKucwBPv/xuf0iPl7m2EuXVgYnv0IR8u13NJS75qhCeBOVnFZa5qoRsIkA1WWwMpBRTH0C6SPr21Ytcox8wu5fEMMP7YlKDBYDWGk6Fljx7IrlGHnegsa2R5nVxH6WKDDoSejWUtLPDj55HZQkMMGagTYAZjtahZmaU8WMqAOtIhlksWOLQM7Ry1n2uAMsXv3sCs6A3/wMzrKoVtHlCTidGXFlFR6kBX5UhebrwiSc86IP8vXhfLXZvDt8YG1kJLHwucKzDJoI4rk+OQkHC8/ysRsWsR/iy5cYqq0m7jqcSAi8FFsah0J8dzgZFEjHGc08u/G8wPev8GsGU6fhd9vjDhANe3J+0eCvXzu0fmtZ8odANoflHqdxpCCrpkCTnC8QQjOjN7EOzd725qOPe/5jrz0D08J9CZjycJ6d85wxtoPD4xttoDiUBR3X6coboEhb++AN2CNI227dHVXuFQldcfTI2LuhEWF9D7vzrCbHayAkw3MTo8q+jOvgfQf6sIEBc2jN976zP8fA3PDFnGZED0NAFSdmCbaeg5pzcOYNyzkDVjrtkaQzIJq1x2SdGalb6I5vtDjVMjMj6JmOoYeF50OGBGbsAqQQf6dypMDfxiGkwAsVFS2UP4ShvpZhwEavggL4jL6+njfwgL3WLo8s1ZZ4ZbbEi1DZJ2IodYcJwx2dYTzJzHzhf6RjHd0R5D/4ayp8mRMbUfkGaZx7ojL5+GTQJdOBZKFkLoiZoQYdWxOVTEBimhcEijT8zPfazxGBw2SMEX4/sPlkqQgUs0UBNDfg4o15D6z0NG3YVH8qfzyWUzYG2TOiMJtloYwmiDuz+mhssDwvyqM+CyNq3Kfynco7GmdX4Se3REycsW7cJ+GXwNqsromL6xxGkxmjrRFDZIyQskCTyvhMCmfj/xpDYYyEsRATwjcYfY5+KH02qmxaZLEs1F9J+KG/Aq0zChccfJFU7XQUStx5wgtXHiiGEYqQU9cOa3ySo3O86N8YejSs6DXjXiybChxFEMWmHKYxBPNXdCdCI4JARnROAvpZiZvHVgk6p/Gvg85po/eqcxr7PuicNuog65z+dSOdkyDxKGPzvwatUxviF2B+FRQKyNIV1FDoAjU7K8lH+Hwhz4V+lsukkYKLEMhk1aCD+uQMmrt0KSl67cmfObTV8pXB569BcvThR5eMkycnvBw1GnT2ygUKOQ7bG0pUvYR2J1QPCDdVLcSsu44SKkrYomgSf3IH8r1bHh6oMbEBbBNSuHPsB358Hvi4mQRJBvDOE//vI9JvgtkZerzuz1+ivQlS50WMdEZRFhpkMHl0eOjUYOXC4Ohty2eJMIAtp2SWDARGQcIIXIRtwgcSSZ5HFZ3ABO3nHwgkJJMzqBrwAofkYGJGywCQbwd76Lsp4+Jrjzp5c4bRSb06V9QRLra4JB4gYw+RvniIazc+BptVHaIDqgP1UMcP1/cAt4wbsnbDjzjqBK5i6AFQTkqLzdG0OJY7cvtkMpx0OY9FkhUjtXJw8cUYW8qN9ziCDpoME0b6AoLnDG5+FA1TakvbC7YlcTO69zQK+A1hZWwf+sZx1ULjbdSeStq5dEJvLNkrLtOyHG7rXTXKcAXeBU0A5CpxqlDUSyw35DZz6SawyX53gOUQHy4HoT4yEgNCY7FaNhwHBdcjQLHRyFzYYHQxwkCkhgxDl4V9OwSE3Cjf/Agg/For4RunjLDWeLsEA50Oqav2otyB0gPobV4mXgK2S4ncIOg8n6OQdaScn0nIPollg5fpfjnBsDugQJyr9Z7rkA8Q8f8ZxpaFIzWDkQg5tt+x4deQe/LL4eV7Y8BviaBORRAnA6AeQSV1nGsbmCHXMCbkW+KEGwl5BMEEFcgiZurTtZhTTBcOUgflBQrpu/llf5kDvqT2Vr9aSDNIgwwS0aKWUvKOJunj0G25SVKbhv9hFPJoae3i98MLoOc/uXbxrkYLcX0q3PaUvujFgisjpL8ov5+LVjcAw60ZYGAwm1kZBvwDYg+IgMzx45UWxEMnHIl+BT1NO9jFjEbuC/iAU8QBQUbmbB6NUoDdYMkLU1MQwfmRFCiYMe6NbwdfvRmG6AG7gQrQ6yP7+FlgR8gcQ2Uqp1DdoEfODPwrhgwyUkgk4mvi0cEY72MG2FSPHxoi4GM7nYTqUZiqSy4Uxf+go1hIQB3H1kFMLZAdE53ZDEVXA9VQ0YG4BLXK0BQeD07hOdoT9kwgPLZnlNJMOjIXbZrLGMjsciYoYXj4NvxnEs4SWwBCHBAJCSQmgeKJJUHjSKnJCRS1hMJm7uRg47N6LDyswemTeBgCuLaGACG2SeJV2nMneotcgf7GaMukBp/nf1Ek+vzw4PBp+O+nV0Zi4snSdFEhUlkXvH6YR4wWViUChng0AINGgRsGHes0KyUBLMfxLij8vbzONdhvmdQBirwkLypQQMJwnpzZS/8QPlsZXLy8ev9N+E/dy1JwPnSYokwriCJBWxxZcjBhaMfnxTUOnXcto5YAh1sjEGYuQjaoMAYK+oXmqDYAComO924yAracqwmrxkaBr9/BGTqtlgWYpbJRBYCRPLj5JnKe1vhiUmjTpP+KWgbVl2uZGXU7FZOBV9eDQVLocqgkRTBTfC4mHbcehxplfh1Ph0QUxGwu1QOYla3amEPYCnxiOIhtCnIaHcbHh3sVqKv333EgeXyCm69W5IIgegDVB1XcfgjSBu0mc3p1gjo4lNrpxHMYpeHl79YfvY8zKMGUcFBhJK771uVqVzUgE3WUmhnv0hmEm4lYshkj00xEAg1boAcxxskwLU448jLpxGct/BUX09VGo8NXKyKHmeTgxAaqvVnZjQKyxrMPywzchAGTASdRG0OeA/DR7GZTKwhP7hjyMaTmlRDu1uiKst2B4w4cccQNVxjhCgusEqbjRx0zGkRWJ6wGG8p0djJqw3OdgSuUntNXoH3dahhHi8gnb0wtHKZ/jpk/484q7FjMZUVPxmZFTE6VixrhbWKm5ifYimndbMxMVPmXRPYxq+tKaKPXSyjbJthIyFyPVlxs6W4m5X5E0ceR80lPyycjKh5I+CSHCwiEO5BRqg6RgNJZl9ynxAhAc6xe1S52UG8zKxmqgUz0pIS7GZE4R98McSvlmXY0Z1oJzg7OuRloWIV6KeYnlC/Rp/kpIh0Bu/+C6YkxeECkTDcVcU4Kzgz80D1ln2OEpnowcrQDIghx+9C+CaTrOYw7V9WFbVgt6MM2rhJ0Ys+qo3qxDesE3dizOs36sX/ZSD8WPs3AMIu/TPf8i4sEh0rnAs1CKRQ72D+9wFKFFGL0J8Kp4Bs8Wg8ST1sh59Ug48onpygK9H7A+8RjvXF6eH8JOKGnnxyR6CtoIeIbSsm2FsoU3pgqjPiokGHlpAkXpzQSVQXehaPDo+jMqfDyOvKjcJ1WZpwVrEwpQyFhAdYD1nMqyRv9ZVYeQyKhFkZPBjUWe7Jcx+GA8CJ3Yv0fKCXiu/eHxzCszdqFz2JQcLNL18cCCn1N6Fkh6XuDJJ7fIGygYZnEeREwqytw/XUIvMANDJqGFKInBof2ec1E5l40MCkT2F5NE9Fv1eh/jHh6g7wjThyD/9auHYL/tMlEgxUA0sHQqhNyi1BIpK+Eghf8iGan9E9obe2d0/hfaI0WDk5TG5NLZiUbBWsJUmoOYGxFi5Uqixy7KWdLHbqGyXAJOpLTHIQEuo9ZWTsv8UjaaKsHSvPNrID/gu6kirJVFwlkgYa2QlZWB62d1ZVT60fuaCOEeWsW4F7CMxxgBMz8IV5Yo/ZdwpKM/2KRZA4OhC9FFGwWk8yhQo3GQRniH70OueYGV94ZHH0rjshPTBV6ZFrKvgr0eQ4CNTfhQ/LLV/CDWSFANOjWH3cFe4Kxag9GXRm+fmnt9EnXFTc0lMUxgmsO8uGB0SnJ4pfP+lBnplpOtkg1SYl8Gb0A6NL5zbsYHuvKO2CcJJs0R+9oDB8nHyI/gDFtdU+N1oB8HxzbWZ5pJXISdTwoWInbpz2ogBltBxtaNGgBLfIODhhRdrAhRJjxWdOjEkaEiR6cPKxXCGBpBGYWCgpyDEL4W5AuszoTZDStQ9M+QOF1qgF/2ghkAfJ9LGLiRHEmVAWWh7d++5PhGx87eHjyCs32Kjjrj3wAsZjT0hLq+qOc01A5l1I089JSyFhXowj6KOTRgDPzKBwe+hDGu/ZacGNtgJwKC+Lggh4d4k0AH2YwQyWFh9ke0J2X8CUnir/WikGt3b3l4ESD9NTND1IJjh+jq+sHaTTu3qtMBTA0Od3hfgog1y/eND2yriLrkPt3Qf85pY+efJICGbJP8K1hg3zxtFU0EoFoOxdvjlmwgFH/qoHIatFYMNdMz1YLVbxvr/x14xGv/hlrGi6OUb0r7eaYA74Bi4sXIXL7gsE+SrRaQTfP7XyapRKa+7XkOHfT/ZhDhxNmwhme43h6X5Ij/+DmncGpY8NLI3TIw9EiA+TrISgKAhXKBJYnRwKOCZGCK3hP63zhblZUUdBOZiyxH/Cj4od7QEhx3c1K4cLtwe2z4OlW7T8jVEC3ivisc4iEgeLJi5FPGuM+Ak7fSkeoLPfEaKx2BtXxy10mqEBPgCd60Wvat6n1xX7ahxQRB/wk8YqKKO1bw0//DNdT/vYrX8gwzgD1YpZ/prV5Nt3Ad/Ss12BbmAuUWnnOYWQw+yfkHFIwgOQg5ZCC0R6HM8P9btqy4DMkGOV14d4nuja2tdDByrbW4OHR34rFETg88QqHyamCUMqrAPgtty3Eldt1FJVy6NbRDmM2ENXvv3/64Ue/FfGJIQr58RA75SyZcAHEdk1iVGFqz1xIOeiorkt4Kqu8CFWj4FWN2jyoQHTAnEkMpxCwTkPkAjxQ330FUzlY+RzCVGhIrCbpj9nolhpq4TNHYG/ga4yuSe8FEGjj9ot/pLXtkzdw889K3uDwpEfVKt0ISmYJRgUXPr9gO9nMtjsWEOLsbzfhuSsvQXiGCKMt0rKI2OCkhb+MtXcMvRMMZFfojpO9JpMufLSx4XjtEHF2I+xhPsITVp4jBjnwo79a08LwRazeM0bo+CjPsQXmJfAsxqs4LiVmUGLu5Kf3g7IYjg1wMjpGV9T7ztFvjaQLxQWcS6NEosfeKEDqCCcxdROKprQsN/rgiIsv1F9Ct4RIEGbfwtYMu50RAx1l6qpiasHRPzH7jHkFFz6zbgXNBXQj+MVhlEoEvAhfKKYYyYtLtUEDA8cOB17NijvyOuTEHX0VMuKOe6f5cEfehWy44zrDyqB/3kAZxJhszx76It3zz845z5nH4yF7pWJPizGPC2b54qoJ1wRvJ7DbBky0kEau3B2KwPt12Q2u3Pe+Xj8hMZ0SDFOEt1UBZEd8XmKIWpgIQMCqOSb/M4DoCRcBA1e4CFI96+AdNYXr6WQ7uNOvZh1wmCDr71AcqgLfYHUzrtEGzwP4ZlIsOME1DdOMKf+GZ+Dd00Pg3YiDqwyyzvfVRYezmZdpZWx1zinPQ9ufbtVhRe3DuFzjOBrkaUmhCxgczzVZyFPfFzFYxnZ3urEhuIcDOy22wIKGrnwwuHK10lH0jwjtUn/RJTICgJSnKSb8MTAZgMAMI0DAYQBXPrCguOTcKVck5gIabk3U/dOsethTMFQgte/jcxlF8W0TiBOrKxeHH5+pjMtg2CaLwNhCKCQZSahDg4khrUSQZDDtkn1znjGajlbh0ajXjh/KYhiKhUrRoQQIPzEWhSNjETjRQBbDQIwwoXIJY8K+mnIC2qD1Z8UTEJheyslf44sE+rD/lXyJ+lTNj4x+TeC+VFAQOTYtIM4dxENWxbD+lq8OgMw+ff0aqGPQ3UDuEH7xSZplKkwoIgIpeEJhRUcqsVzV85ImBDEAJVVoheTW/C4cgFblKzgFbfJyDBnYrQtwCC22ivThytXBycu/9Wn0HYhmQBCBLCL5Sb/klpwyLy6yoYXukFJi5PAjCNgWJMegoCpbY5kRHNBj/zYb2oP0A1O3bOk0+37bRu7J3ax7R7+LLB6H3ERxk3Dz/hsOwHfeIp9p3DdHLYObNkYBBsGYPU7Ii9zqJtWqpZLtKNQbsIp/pvuGEOpt7epJdfXJ59FIsCFxq4DfQZDCd0bvwFVqX62leZXJbqEZtw12C9CqaxvCnYPBgngm9bK8S/f+5avs1BS9hUui1jxJnawxxqBSFPkLgEjrEPnr0u3V77+wnuPlbZFY+/xkzY9/rRA4j6jAMRiQ3AvAOBjBTct8sZyzFayH+lVBLBXubPb4ItKPp68/gGaGt07/mhMhbdtMaPPkddhA/0daKli9GXwU4SGLXqI7hywjaj8wCTVIEhT1gMIY3Tix/s13qw/ODd68JnYYfA5y3QgtOwYYXYFhtPQQtNLRagwMASxSXIMI3uDse0ihArwcJGLSg5JPGcfMxCDBmAEHMC5rDuldgIVOZhg/KZf8i+JhJjsUA+iQwIxuZjhrF+5amjGERAOc0mRjBIq7znlzJYpCYkU2egbHfJCHhAMKYGzi3HRZz8HxlKcnbegtZ1mwghjVtMdU8ygt8BRYO1beycO+ht74lpArCy1hMIOwTzp5obuEfmpzEIZDdwjdu8/YcsHlO9KTNxV5tVL7qtA+tVxhG618bJB8SFxzcEq0uXFqFSexeKFBsZwTEpx84ISDIBJ4OcBx/4uhNOb1q4z4Dscn7Ah8gbUhMd4dN+xZ4VxphSMbufKioSzmPwPzaRyl/9yIDVOZmOUby+9NVZi8qSpbN+W5uekRNs4zb79ARqkwJ+M5kz96ruSPjh35o/Ztc4UD8cyHNWVD1THK0Kbcx/ahrBHSOi8izy/Cs5Fee81El4ihp7eODDoCqDhdMb08C80IdMdRnJ/+RKiAw//5fImBSgzRzGN8fYcn+H3AOvIertw6bFoZ8PEIJt6mGJg0RF2xqQi41uM9h/SMErGaiNEeIwGHnDxmapQbfRFjjAq6UOsfZMPbm9GGBiV6UJiBmqxq+jO+TrD72eB9MPrZsIJa/IyvEMx9Nuwlq3f+aSNbH/ouATMf/ezVPf8UdDyYM+8AuIVwPpBUnjQZiL1FJxf3XvKAaHxVQn5k8nh7/e41uJ5Ub1gKzImf0N4CCQ1d++15IaGIl/YsjfdmmfmFLHHdmgvhuv7gFgOwvL+UdhAjdJCer0Uuu1iUYogOMNHhLLlWE3YxEO4dvoiCdCQ1TZ/6Jd10LdU16xcAG354RrN+2VdtmpwAjyfLXkvaFHuOsqYoCMmaQgD0ugUubSBEVq0VEopA7A8pE2ActG1MzQYYBPpntIJq8WAoIS4xf+/jaM5f+9VGE4BI5HKCYKFqmDcqGllO4TRSGA2Tjr1JwSFsci7AKwqJVQI//iRyQtbSCzDKoUxOxkdOwxXY2lUxi4Q4ntoE3HeAyVMNgU0xuoFbj0r7+IeTnkka4wCC9td9bt7l6OhyxCwJd+OD71HkGWAtIPxEvl2jJlIoXyiHjCaZlM/14HwjlMwC9IlaeYnysohq+emFR8NvTtjtDjuJ19Dj0vVjp97jk8t4jTKKcg9aQeSXT+Gd9ELezTXLHB1a0QkTuoRFkCWoWQu9IeX7x9wZiaAOcUcTyjqsQwejMijQKB0ShDAae97/Cj7azZHpi2jg4I5cR2VOXeaeIvN9P7i9AvMuk47xcmDCCfDuAFARUs4RdepVKLiyFvXPwEjkPwIRDaiVcHZ2adxSs6OBc3De5JbZbZO1Uaid8bd7aBl0VW/3+AwDMwQB/t0A+tczCsyBqaYQnlx+lHWqFw8DndB6WWlaP4BTM8i4/Q+9NjhzlMH6dOoJ5q3C0Eg7JboVlMwnz0VoUIJgUdWWIkIMUACmjNS5CBVivqGmGoIxLrwK8RbeUVzoATPpUKiBeDiAgkQcOI9GAjDBigRKr4TzBiY6s8wxKMmAD7KmdpL39hauusGBDWjeLlVmzHEYwAPECNBt2/FvBw8+GVx6Sxz0KScZbwj+bfuBHsN+oLZlQ8RNu03BrbtNAUGpEvGkglNSY1ZSw1bjGWZjbYgnLdqljFoV9w5Ke3WG/TrMC1tiZUB8NczH0MVQ6bUs16tquH4ntwtwhManfYDkCljWFjqRSO8NhN/NBMZ1fAPGFtPu9K9rZJNnc7dkiyUsbszpfnUfmN2qMklWoYuKS1kDV05t6wBcw37yqVl/Iulz0e5h99mxuFoqM8+L6dvWJfjoBDetq+C7iw2M9paKw2bRdv2EU6N+wiHncYfDYGp4H8yIVWIhxx8CF9WSauTu1mN/yi6z+2viycZX9ceuw0XB8J3b8TVEWEy5hgiCitxC6FJy42EtDUC8kATGCy4EiFSfCSmNQrCyV8kZjIo1LFkhs8PBHP3scDxHNzvSMGz40CwoahHLU8/xLFnMSFjQXty0pJAQ1wFu/P63prPNVGlLScJAS0M5wYLelhxuJGiRlnGYCJkrpLQppyUr+HO4ZwenwXv7a6rnwTU/d5hmDNU8kkq2lSywlg3yHMzkHG5Fy6xotBZGs0lKKPaQghFaAAYczfrdb37h2qDpB2Y8ieje+mePVr+/NLo0v6hdTbNBbZLyYZw+RyQRia8sP0NhKHMCg5MWMCoVsa+e09UQVPYi/PRsuuPRf24zEX/smGNgS+eVMyaLG3pkLrXK/BrXW2VLeacQ94fIUZg9YzkjRtOYTM8GGQdEPf1Ki4AR8byaMWl/8aeeYxnLq3h2IWIUIhYh4kKMAQk0W+m1Emql0FXibDT5l/ZCiaXRSKMAguYF8QuJiqmTEaWNP5KnQCSMNoTDpadKkJ2eJoeWDRf/JR/F8XNd5FzFLvo3FNTlh+Iawy9/CTw77nbSx+hhKHzzs2IRjakQNDDjXgb1y/i3qnsZ8zYoXsZ3i7Uu/7iR1oUGHsUf+kendGFxErRoGJODfbkWeAsmczxrkFSCAq1T/H6OPP4h3JB+aBJidxaTNMyz6egC8vrSCAqILZQttDXQ1UNlkAP25z2+TQEfQ211cOyktpq3NvW/OMhwKZ0F4RBIl5FyO+gsDEF52+IsjIakLXYUXr1/pXLxCZfh3JJcTbck5U10LQ38qrat957cPNFLax9opbTPeYHyGsvkIAaCsNHgoPl0pYQUuNBn0PZ0+ivNUJBjn9Hqr15PLD0DuPzmEjPyMidqWL+5tPbm1eHbloimiamYkxGgMKgmmJvR4BQwxNbj2q0AW+J1l02SYqIucIaixzfKZtyJmx+sX33DdYI808EStxA/buIDKJAj1SdvdHmNi4SXeIm6dK9w7timrNTKqcGbd4QG0cU8f0be53GrOYkm8r6geADSLnudu4aBiXINy7bEYA/EuczzZRWsrcV35iutjCNMgwU4GJOzbPNFHUK+SwMZzJY0Aky1FKJdMTfw5EzHWnhw2VpYavHy9C/rj2X08k4bBT2hJQKE0MwJZ/QvdyjqImmWXvt09f4pE9gaLK09xy2gBOdbsAauMZGhFnAWpIUCY2xolzWYaY1xDb4KhxOPJaazZW3MXDiXZ04947RzU3rSpRmeFj7eGLNhPx/vwcNDf0UzGkgW2jlz1q9RFYXhagkGwtWS4eFyGebBFbMWYc3iFplVxGb4V39Ff2EjYEquTTw5M8PfD2+dD8eDvy5b8qvFAULkRMjXeCDka4huIF9DLPJS0iuiTpUu1akkpX9JeYqMEJszX1t98OincR2Fh8kYlf6F6E4g0I32I1UmtRPaDKDYFFaEylrE7wH/ldQ1KaEl4j78weA0B9rNN6XyedrahCoNaQEu6OCQtGRmpBGcGW0D5kbbwDwnBzLa9lkOvzFLcYv4rmQvRO7nsGo9ohNP/kzSx2XKPXD07PrN69oLaQB7od9DJ+R7wlfUgNAUagC6YA2ALDaT1znrV0F3cSgR1ylxAERN/oJQFVwzzZSuEjq5LsBXGIJkJkTHBIMIQBlYsHbq9uD02fVPbkSLKXyGmlPxUTEzHTHo5bVbnNGVkxZh5bQ5Rq2A8ecFtRYUm0CRKkQ07ilOhS1ALGCTY3k8OTXDt2EYxeP4cZ1CaQqmMLSE63inxwlnpRXa39TC4Obr9PlYUeonuA87r4qLFBHpPjdSbtuZ93HgCK5YqpWITCt5VtJYIYeeBnrqJzSoQp+02KiSp3QbUSN9Ihyn1ENIB+9S/odRvWB5RfCK3f/iCTQsLCj4Z3yoeFdQJKMy/68hRMqyo7gsdfzb6AIpjhEE01X8ApkaBDt0Fb0IXjC8Igihm8hp7tpZxlRkDZIYWtLzLmVQui7qDZrvJLACdHDkzOiBQR31vO0s/oIPiexs3tXxllaxoUP+7FM1Utx00mngxigKTVV62LheECKeUSfIEs+spCLFxpWCZPHMnrOA8Q8bCRj8LYQ4lY8LzMuN8YP2/EMQNGi5KBWEWjTgarHDHCdIJ9dzYJFwjX84tPY5i5zgQk6JnuAvR0bQAjD43alfPTnV4K+Gx84Z74UaEcw12yXxD5ZoEzJi8HlJBcyMoUfKXKjFPBnlO+yQHQ560pLzHmgSKFTJqfvgvLf+nbALCIKVmAdJe8kJmyg8PRk8UEv7WsmffFMaip+bkjj8pJrH8FV0p9TNFkRHDxwRdpiC7oMf4IIxgWN67jue0RS4ng8//Mz1HPOlcrf5L/9L36es0g8NSH+lAekvhDHLF/jqjdNKHAQj6zrHmSxSklTcS+QroWO7rN3lcs51bHDxI+1YCu2+ErOqPPBq02GSqXGZ5NB66DW2Lr0OE5zWGbG6+aUjL8VYMeOayV7iiWFqZhLitjEifSOaZqToYTSr35+wae5fZXX5wZTb3sIbn7ygqJmo35fZ/OlgaEdne4Zu4g5iiDm6LONnzE3jVqvJSeh8C8crLQDzADq7F+kcWRszkEuh2gjnP+E21o5+KbY0GMuA+Paw8bocnxxsEJ/DEYQDprWRorh92sCwae50Uawrf7ou2lbospnOQf1Bwf/IPjDzh4pa8Ifqog66y3k0LHlGN+OMGRgL0U+8z5CBGyakxxDRNOML4E3WEvA8EMhb22K+Z3fUHAfP5taGJx5ZALwWqjNK8HXv5ELwcDoxe2copHozGB8Tgg4UEggPL4TBm3SfohLcLJa14dR93C2SrOEv3nXWTpg9t+l4zcjTADgFUfPS6lJ3u3DjAdfsBWdH5JqIBDtE4yj7JFjNALLvFToxaKfr0NE339lSF5tQ9lsgQkCWvxztCpwV+ktcCvsUZqU37dtS9wRubO2GXIhBXg2YfmQWyg7+vCwcft5ARAKSv+JLCOU1Q/FkWXhB/e5Si+TnI9Ck4OVZaQvD2CRRY9zS/5X3/s/Rljg1KTp6S15StFxgCoaG6RIAH0YEjsrs44ozhgEpt4u2DU1DeqxtG5z50trAwJTki9kNF+qUfiHbIVrOeo8WN2UOdh83obflODk6MXxLBaajCyxI1VUZstQSd3iZBMh3Cfe7cK9LvGpPlAkwMywGzRK/BV/KNoIvdQ+1U47NQFcQQB5nJCQJzn02w1a/4NvcossGNksCaQoFSYlP/PBdECRl8Nk8RjdLFJP0sgWHbeSt4hmgjrOGo9GNANtVNPPoBrSre0++ZNw0n3RDY9KMXuXco1DT5T6+z3l66GNox0cP45sOjQHXCsHD+GGxtT9vFdIYLEyb/uHGhm9+Av/ZGrck4xDkcm0Suww6bMjiOcfBJTK8ip1hMUTMKMHSeu0hiwRlSoJ8jv9m+M9im6uCWCw22UfPjhfHkLVKTK41aTZhbisXbos5LWOzmBpknsVCfQAlyCAOy9475ipvOobIeCFno2D8jzE9S3Vri0uUWal7ZsX4FGHmkUthmasncuICl4imy/gFYxUkDUiGuRhV6qYcjCIhgZU0zwjgUU+4jWbLtVBWNwVXiZjcGkhmkK8hjBbTXKO3cnI4nzyJqykRPUfvjNTp+eSQb/kccS9g0lHOMib1NMno0c8co5IJoxC/YIiArg1Ry94hpKro9CDgI/I9ojsvGE8683doGC/4lHGp8XCb/g5R3ibe2B2MGswKRGLbwkvAhpsYEzISHAc4WaRcxxDInEEL6lNZ92//9m8xJygfSHggcsw/OyQPgl1FDyvRyaYWAbcEtLBJUMImRQebCBVsYjzAp39E5ic19d8Vz+kDBd0ckTYhfwjJUuhnDLGky25vNE/r+DpBytzgfZAwN6yg0uX4CkGy3LCXLFX+/UZSpXwHYqV9WOz5e+cSTl6QjeRlDRiAOyEl07uCE/TRK9hKbc48R6Fcn5wBpT0oZDEQrwSPHHz39fqhtyEGr4UpRp6PIyxT2FYN5ogZitGYMS80SLzFwE1wg1PL2OCFz7lNhyPB+l/k3wI8mYDVoa80OMvLfF/bRuRIFjQp4hRKAynuL2+tPfhk7ea7kj5VJGlMzYbBpWEqtpsqcwvr4XppU8zS6GBzCuTBmavclIhwFHu7KNhjkh2E+keoY2AlV5eBktl2vSYjxbauN3zPYLtrz2BixZ4RpEGyekcpFZDMf3JQ7VRD8ta4GeuSHpmcciFkFAgD+Or+9Zc4qHItXdwpZgnd2iLFOyT7yown/Na99Vvfys0h0Q9qAdWd3EKO90fcQoJZXKkBVHRe7kgToOeEaxdrhbrRLl+SfrR3SDfa9Iu70d6hvfjxDTHvfPeWLHlPPmaF4nMNrkzRqLiJxWSfNEtMD7cA7I60gCGtsJW5zb4ReuIsD/STGpnb6SJz/XjS4nIN3jd+AvEOfwFX48D/7pWWEOUu8u8UzPS2cVuErtnRjZpDknHqY20Oe5VEQ6Mn7lXye+0VF2KXICeTjO3cUVE90Ev9s5c+kieorB+cO6ofVE/QmH0PQTEXyOLU73y8DcVtikEN5RDdfHdw/pgIN230zsb8Y9l8wbIxpHOEuEs9TG8IhaWIjFhv0dfrJOh4AiSmBvuADWRJFOmxcbjCG94+Pzh9b/DpbQWZ0UT3b9HSbeYYRTsp9PiifDI49/HgnNz8wSbeLJeH+D8tDRg3bqnRp4ttLnl82L49e0i/BWYxecUdQn12J7BtjhLvXVQvCQlQeYxqyhbDTT8nOYfo7BCywCyfbLABn4M3ne2MMfuVNn1luzKjf0f3xecagZzr4YmLgRfpIn/Ipsh3JICufJh3kxacVg7xzMGoQVahqeVX/eVpDUaNiRL/k6i+jeDsIR0B1iatXf9+gbTkBWmBM2/T2sN3OnEw3zJxmBYLI01xdPNKzhQJnM44IxAMNIwj/HfhOGCOkN+FY+pQFDtpgx7Q8peMgbKOZBFKgOIckAbeubRxTO7QBYvGDZlQbPCf6OCf57tP/OR5vPqkICLP49Xnf5LJ8fN0gdrZzN/D7Sd/DpefQdBj7ydZ/y3Wd0lnTlPAVGHGZvHMVZ1F3aWLm8BOQTcuyDGsX4W4fTB5pAmAr1VfceaqCprPuw4873rwfOgCDwN24c74BJx5V7vwPB4BRMrPu/Dqz8vqplukAQ2x7k7BmXdpGseGp0du4v+r7tuapDqudP9KhR+OX6SIGV9mPOetaWhZMyDaAp0IP5wgdlft7i5UXbtUF6A44QgkDAJ0wwZdwQZkSYAECAlGokFID22H/scJqhv+xfnWJVeu3HtXAxI6MRNho67cmblW5s69brkulp+CvRtCZmqSJTT9RBaLHDhBIkoRKpOEuiaPKJYY4/dcfylflgBujtwIDF8SM3FkxjZj88bghSRJfi7mncxMhY8KAw2sU/jeygqz6At7mcyNlp9eptBH4XLK4vh7Lv3D/CZwGmEP/M+/h7+MN0SCCg8XwWmsv2ZET6V+gfBOQVxp7pt6gLcYtdqmHI2jjTocBcRqOKjdVNyFnClJquvAigaohnTgjUn/yeRrlpOY8ynkf8dy7vh2kdO88Scon59+uheG7ti3uAwY3HHtwBf81cgHIyPogfu/rO7ku1UtA8EROzjSL4rxLZigS3rG1F6maUzvYbrGZl1U25jaxfSNzfAVjePfflOvcWDkCsUmOr2jhZZ/+42pHJqssr2iBVyQtXdBCx/ssz+lejzTWakpwnmyyQNTi4rcW31t/VC0CVYnA5ARhVKUp5PsO342Kq8SZ3uKiARETRgq6Tg9JVrRVv6TapK2uJV8wNotOOV1fQG1/aQRKVtF2rmrHxnViRPG+eJ06WwQHZf9bPe/e+9HzCbbx9OF+3xsH+Xbe+uTH4mezccI2nw9LkvGYlDBU3IDJZdb0WqMaGhzFyhrGrlOYRYr6lA2nElKodF1/VDLA7z71eTk608SzN/PjFMo91bPOSiPdhrIiAYVeUc8rWfU2YrtnHRcb51GuhUhkX6nRbiwmQZ0scMkVI5pMg2d02SaBQp9kxo6qFEksgY8WNrc/nvmjeBjIm3wWwvzXVmQt0bTrVqhxG1WdGmoIs/vrVaNTJIgxZMoTjrJD8ZJOLVgZCr/42EkUwg+YYpsiasYcXI3+kuSN1DxIknfwZWLmD9p4SK5c1iQdwZTWajZG+aQSFwZLANJCoyjwEvcqKcKStYIMZpNE0/hB7TIHgcsPVUsodw5bgO6LHDTCcpFIuUVkXGlK7ZzrAjLQRGSsMMSeeYnS+eKUwE3NxHhFid67K2RjX7RlXT6/BG2Jo4SITmM+kHguxKCIPDv3T36iPB1mCAQhqnXI1jHjDk7joq9knKA5HVKok1OvzPqsIjoCL42I49FpfcXltVvEa/ou/eCww5lAd0pPjv6Vx8p+Vsc7EvL6u9MV6XzyKrCPGxyltsDdrSJR51cdb8USzudjCPrx96ZNiLQojiETnUcQn6WavmHn2UTF2+SkEauT8mTb3nY3q9+aKFwIzz5vj7n3TyRmU13cEiXW3xHNYauPxoGf1Ho+PmKbh1No5co2DlMxfcoj4vM96fH6v98680fjgtmiahgJo9KHkps5ep8OlYsMENwxb68rN6Vf379hyNBIcGGBGaaeq9UiDzDNxoi5uRezMmjmNPmAA0n4XhhyfhZZjwoNx6UJdy+HTLpihxSK4Q8xixBXJgmK2RlJp5XmHhWZeJZKIxlYkLk3vnmOAq3XWApwDPaGi6bR46We442jhwtc/NcWdBplDHW7JfEHBguKkKshEn6alA1XjaQwLS2xKFJQOKQk3h4rhWZj/GeruMWzYRb8LVzPmZbjbEJxyM2ARnpesIKNu3ftZLQgQhPo3JKEjenhwldi0RNaIjSDyEeSjiUggXyxR8M/TPme4OMS74zWVGaUtNBPnn+3qs1pyh6FOGls6Q40fFvdkd7uzV+i5t0dHWnNunkKk9t2stqT03v5apPbYq+KH2/+c20+lM6uAnVL45t7vmNU/vgLg+Ldris0arF7YJshI1O++d4jIh3Ns9RDWPuDid7qSzMadnZQXJFhCmimlKwfRU2lttCPt9G/cf7126vvyvGNHhG7gow8qYaBTMqHhqlSLpMz2MdbzcdHb44l5bzZKzUuhWrelKih1CJiGp64nesSIQ0qEVjEb5akpTN8p/CptSDy2VXUh8h/en6obcnpz4NrkdcBlUBlncN8d3k09dp/99D78dt41T2yWVYddeklqzBhUIVgeoSsWuDZJ1S/FPE8PJKIZEni5U6oUALWxvX7GpbksdyKIDBKRDguzx540Z4XynkCswyuAqkUJjOYBCtMQBSndNmJ/Mf5QqXintcdLQ7Uiu9zhcqjVLuoiUrx8qFRjeuXZhcv/uIiNOpKzhkRCDI4SM7ISU5dringFBLOEJ5fOxF/uNihohJG4j8B+J+//0nj7cDIiWQAxC698cXzoIw2wXlSqFLYFhMHlBdYrb9rVI8P6WY09jc61+AmaFIRqXQ8UDScBai8MQKx4TqVklsuZ++7J2hlqObFag9gVkZ1zC14CoT/7hZrXy15ofl4tU/elbe18sHyd6/KLhOjr0/OfnJj8fVzQpc3axaCJev/0PpTcrtQP4FPpc0n1s132vGlGHIHO3Ihs8arSVxY8poEbsFFkvdfn5ocjo9Sd46M8ndfkrS4crzccxXS7w+Rxy5FhwONJANTnIkm4apsQ7OzcSXRASAC75EAFTuWgHE745lNL5LjNWug1tDTpl9yftXktPzl5cA4Q/PQyGWFaHEZeACKJfUjLoQ+A7Dn4Nzy4TFuD60GBhwOc8iB2VyZYzb7PmEhaDawoP3P5oKAvlF9tG3vTjKdj18fhH3HADKKhoB2E7F4cLOu8LRk6Vklb66aQkwrtwtCQjYWHTo3i0twjJQu5UYm/BfubJbtCQ7gOpG07Xd44wOvITZk5bGFVZCLOrlV+36Nh/o9a0kX0A9TKRDaC9m9H02VYfBVe5iO2F4YUbheDodm1n4pC3DoZipM5slIKQh9EoaxDrBnZZCpzFXwwMmoZPaKy5FQGRKuPatAbIj7QAhmA8UwuYY5PLZcAdZpRRvj2A0VW+yHAeFg5RajRCGTX+3ZeZm+JMw551RjGnDDWHsdZhKNtn+iZvpRpBqE0c8PnAqh03zqXXnr2cx2+bA3QgSznREbZmhVsMXSu7Rrby4sEg5ZWrD3WNotL5t1xlB3PRtsAN0X1KEBOnXib5BQFiRY826ufwpglhbTnlX3QyjdBlFS85e9agzOPHNC4fsPC1eg+b1TGJJpheuy0PWrRMBystojzreCTJeikm4ZFO55KDCJVuOSxaar1QFj6lSx6PP5kSDqXLBY+DmRILIufOBHBZJTjAwbqo/SeyX10WKjVdoTJGJp0bYW1N3fSiunpF1SoYF5WhZqJGmczlOFol6puOV6p8PP+0h03p2l3U8xTEU3aC11YIqSDRGYUJOXRmoa85/iRXNyH1C66ufr6fBngAbOUxIbm5EMpI+T1sjyaslFZFEPYSieXpSJiYWbgl9vQcj4mAmaP6gEXXhllP7uXDL6X1cuOVmnSzccmonF265GeZisfjXaRYLG5upyYKGNvf8azRYIDQf98pQn8mKSOIsfzLSRM6bFIGlIfzWj8RZ9hGylsEo5Oeh4IfLUI/Z1qbZqq99MDl6Axa3yZnzauaCiVEyBOgfVB9V/qKEsPJMM/S2/FT3X705+fwbN5WYHPttLdqBYIyDo1bBsbgihusjKi3WDk8kR0g6rBkesmzOoXut3BrVWQ9kd7nJ/sCjtRusZp0+d+/2Rcg3G6e/iL43fS6aOeC4BEno0Rjti3ApRj88jtAQFTTQkP+9ZHT0YO5fBJX43IPBfpH9iFK8tjIYSiRnyGVupKJIl/dRoF1Lt5YynOdJ1yFbn+JKbYoQeMpx6Zp5UiIuEJ2+fvuk23U3HYQr3m0PVzfZ9fJbG9pEXoywyLc6AoL5h2pejhAjICbw85xslH9zA2UnXWjbcxKzKBlp7CDx9VyCHKsSYy7F2Z85P7n752DSpasQEjzx7mRucS2kGD6ZaUavR+AvlY8FGjObXXpdQvoYFSiNvWMWG4UdM9kwaE0/Nco4FI7Zl3iHSBNFxiCuhkOEs9DEetLI96M3CClnTgpBjznQLaRiOXMe4RPr5z4O18wyzYxoYQ2Fs10k1sz9ajfC3LvN7qFzq7TIM2s1z6zfqFtFqH5Zs5yDa1fjoA6PShc1LChTqluZFNKgKzVyw2MWfBsJzVbXj38bFucQsRVSVDDK+vVKa03gJytWwFrV72AjAubYi0sCVc2InJANaXMHXU4/ScWS8N2z4ycnYxy9hM+Rn+VcZKlPLHCXlh+lFYeRHR1auKHyjEOgMnaUYBbHqXaQLMKXAwW/Q86d146sH9cELxRYTrVNHX7iXSrtDrXZKjLU6ZkyGpxLk496KOy6dmHcMIw40x8K634suIRKNVlvhW2l4Y+aJko00T7AFZVjXaVTb0zufmHFtblvm0qhCGL6O/wMz9OnS+yNS1mPPQS+k7so86sTcl9i8DN9PWxuuNDPpZVSQC/QhbiF/rZpSrIIqaf7rU9gDhICckAPN4Kbw0xFiw7abnFmxeMtMWKSZ7KwScxj+OAczgpG+pdrlEOqCCUcSXESbhRwEp46G9jsrLHZ2cBmZ0Nh4ziV+n/yRI+PFMfZ0stUhEAmJt+8/dgIhWlCeChN8kN2iMvaFvQlh5d27OSDQ+d/wAbZTPrSeJ7HRynKNGGDWJ55bIRsHt0hniWUFEVu10ag6BQjfCCPTt4juqxX8h5qoLU1QTmej3XYWDLwNXkQ3+Nzs5ZEGwZ61HX10OjjP3PeqrDADxrx8ybmDeOP5MnYPaACz5I50yanM33jDnLiyOxhk4YddgYoKHU4J3nkFkpqFEsoSGhu6Co1FEgd14aYNrxjCsRlNnZzEDTgbdw5FeKgKXd1hKrsxQMVxuLBqVnOgKWmj8vB8CJw6mSBvCoLDL0soCqv66ccczHIAsK9AsckqePNc45j6kypONBJxIFOKg4ME3HABDYWCDD3FH8OLRFOt9XdQgTDLiXn74TEVBS/qafKS/pOxn+cKZzU7ORlzQGCmIJCLEUcGKx6QvKLxVPYkAZBdtRlJkIpkXYvk0LjcRIptAkvkLbyaeKoF0XjGQgvNLxt99vJYbVCWEXySsWtRMJKBCsTqVyyWWX/mm82iDMh5ayKDPY0/PJigRMIdMrOIhsc+jxGf8h0+sM/KDPvyLn7KIup7wvRyy/Z37FZHOCZhXvubYxbU35EZbFv2mE/6oL1CqBx2k3fGSp54LgNHVc0hrjpuG4gGykLM+616WA6bpkkUXYsYip/MMYQuEKFFdSwAU/9jfCnpNnTZE+Hjf56mmvkdvNtgeFKzLee+FQoj5p7GOdtsJcI0ywZeSpPzbRTfWIGnbpHasapPDLjTR0eYrL5lykmG9lt5Meide/5F2eo4QrleSMUDdcy5nkjVCYPz12F8jy0ScU7MFcy3uxtaM3yjc/AgF4Olcuz0JmSvVF9zV0eSii6yYFt2pMLqITGWJUz1lJPqnIa+FiUk+FbnfUGx/W3siZXbqHMYtGjrRHCtqmEFxlvd4XYbT+IqnYxMp0clXLHeD1tOjXiRpGrZYrrS66OJfj+/kXYcv+0/sdjZmO+PGh4ZEjiOiBpiwaNFBlNSEZalUNkVm4HoTENyhh49SliIcqTw4JTnuaLbb3P0IKMs+KMIzUs9Hp5iKzb+mjzQTmPGXfy2MyOhLE2If3L930nUTTyDVQcm1x73SUsQVqSnmRFFL3R4jaHlHKZrGuhjBkIMmdOFDyQiEgqtCEXV5YisHZlLN6MKQLrf3wLODgECsoETfwsUwcgsTrSLRsoyby3TcJaGcqUtqhO8Eoo3kpUlOan1BZgvXuFmgLCvdU3J6/qDRAAvCQxczJ1z4dm6swk1IV5WRZyE1KAjc1GmTmbdAG4j1BV3Mm3kiXGiPqwfYDEy30jQ76VI/iy2eRKSbaCf7yxFNQQ4oqkQEDLOi+WnhNwLz658QrKuB6afH3NFvM7WwkXcZHZI/bs21GZCx4e6UT8+lEYj+pSUX6mEcfp8fGDgYWrV/Xz0Ky9y53x3xa9fYrq7Ighgf0akaoTXq64xEAu+Etr33S4iuTN+9cPT769tvH2x7VfA6OyveZjEGy213wLfTcifAkOlfAdJHjod1CHR4GKcL0GV258QjiQny3FsjcFB6mEMjn2GV4CYXDp0E+OQWkXFAPbA8WgaO9bWLtRoY90Odveh2NcpY80oqilj9TOCTdYsJCwoiDwrV1dEQJ5SVWMb9ffe5MS33514qfgFh4NTgAC9jEnKVocyxBcjGfU4TJbQWFrCfBsCZwGU7V4erENBUAffQAQlARHAXHirmK5wz5syDpQtGGRXsl+ztEwxd48gUH+kHA7wFrw31jGrwIEVasSILyaPvRqJPWR/JSjliylz5UzNGtlwc20Lk55qF1J815uvAg5LNRaPg1fkpdBZ/BKpY7MiTOTE59OTpxfP3NTE63qgojH7tCV7AgL2BITQ/hJkAcgzhA5TZsKXpOANOAaXeQ72CcKvNI20mSdiDYhpcOOUGmKArX50TYVlJYpZL7BH+baJXa4v/IhYufxUW4cdyH4btJtmgshfIZt5LgM+Usl5UW5N6JIl1LImtXMgNJSI8SfdqkQ0YLiLEs98tXk+keRCXSyHjS1dn/eAO4qwdrGjsDuh0Y3xolhK4izdtrNtauRPpnUmHeoGKBRNJFAOV49HdCKQ4a010HGsVZw/C45O7/IOIjk+eCDbydnrgOLIHnmal0gK3OKR3xQwqMypFU3yGPCV/6hypHhgst/CH8OFzpSQb6XvA5rN4dSA5p/MmCJvpezg2+E3weu7JpMvZf0egAfDFHwB6ffJwp+99TGmVs/DgKfzNLsdDp16vpQHnujce98o70npxmkOsEOIajzQkWliiXTTCfEp4JzSfKtyMj+eSKOplKwk38fKklFEbAkTW4+rCJ7pYJXyuPLjD2yc8fEUwEmFV1SwenRp1NJIMoAD30ryll+DIcs6U0VtlXhWZtglHAf4xqOSNGfa5d7u/RP15r3TDhTcuxoMe0a8r1EGo/0h/pLA57tqf4ed5L+ji6WSa0nJ2XKk5IbT2QiYSmTN/mgS6qae4L0mHxYy993+eNW6wopc/lWWDXIPxDLq0lbXt/F7CxTHpuxZepztbjUPzezy1QExfby6ym2Fx7WoozkOqq559fRAJNR7hTsFJz6ycabSYmANuXenOPdRYlDus/WmAVISznJxLj8oDuAQZv4879zhsFmwT15Qk6b2RuwcaLFPloha1iXqlw0KJVtPpZctgW9Fy5IRW4OpD2xd81/Pjj0AV3aHb2i9dQTPLtOmEtxTCS6ElYYZnJdRIZSC6t0R+U7RC11WLFX2NnJ1x8LUnXoZL1Rc2fNdqGZ28t4WH9DYjzguOe1S2MtxN6QK7oLnJfko7PQICkRjVZI/P+9GxGtuBmMU6gST1VmWly6PiwNtXa7FJVdtx3Z2tWW1rH3uzHOWn4v6IMdht2IW3EZYMM+/ESQGVjDw+ecue8LcK2910TlP6hcEtIPhvzpkHSzHqdSHzVEjiz1glPNfrwwjWN4iRMcH5AUFno/BEv6kZuIggXLVINLZyRuBbBE2t+xNbe/SA5r8euiq/M45eTEpcnRL92URG1RN5CKqEgqJfsZDEOux2Bb0gN5lZ7lWEvmP+Q9qvmf7q0eWb9+K2TSsgnm/WyVH8kDpOe1WSWFn8ypiRr7lI2R0ijj8LZDenwE5S73SENH7a/dofZ1RlociavsuzUeSUH2fe3O0xJiPe5Lvn/2hYHHMVI54g2THP/BKxvnrk6+PRZin2Aw1rkAXAyjsHNR8fQh5wDnpgrMrQm8XZqh1aBpBmKGJYAOUmq/QoqDc5VxjRRk2x83g71JLCX6ksUSUcDUl+MCqdfT3Evze8ouckVzsq11QzzS6hGUnLx/+K65HidwebkjibZJIZMJXB+k4Hnl+kQ7IT+korOdFaW9kq3H4cQeshcQ1C74mA0APAJxzSQtUcZ8rc0gEeUkVEloeasRqjXwEK5ZoEOkmePLiTTSf/nSs1Qd4IJ+HOHK7BY+jPR2kC5KJSkoCCLu/8JJxV01zg5857Qp3BeSkyM7aWcDiiwXnWO4yCnx5b7uxW4oaBwMQR6LwzccFpWdSNGo7odDqLIlHqXqxlDsZWG4CTWSWqFEO0jrUgzJ3+7wDSYgb0zBc2sNblurKG2tQWRO7zBKQOkTSSAS4RiyORxXiVomvNWQcgJzesU6tA4knVIlNZFJLYDCnmt5gd+KauBHEvvLVERexWasHuAUmi39FzBDxYGNO1fxv/V36H9AN5QecHCelZMzdD8f8rTVqAGq2c0duFh9NiOL2won2JEiHqyNDohgdTWlPr7wnVbRlCtFMIyr8i1eeB0ptGni1zW8YYR+EnbAGQApWTiMjRJKJ+UZxHDQ6xXkxcrZdovwBFkLC4Q3S3fqxp3YlVr7zIqOCKIgyq5hMvnibWhX9ZhE6SYAckY7g23CDOSX/SlEL8rw5l7gDPMiyQDm/e/+qhkY4eWwxNF7FGkFDWW3UP0O7DB0McSJZiD2yu2k605yBSRiat0Pf0vKndEYkFgB8Xt5t0kz+HeQoACR4t6t4w6FbNjukUOOMAFyaD5IPus9vmF5TsoH5dxDwsT57yGCqbvFVj60i3z/JBfs4M+3OcT1ozeo8vQnLxvxb/Esz4sfE08vZRSsGQ4emf5Jvlk2rWZE5AmdbhcHooo5ZB5SDqgwCqvDHOJX7jfuOBAa8QUoOByLIc/ZG5O3niAMPgQOBNXniyAGOdGoQaZmpEDx9R7aUftMr6LxdcppZmqvl9FrFzD92tWeXUavvvzgwz+Fy2gjRMJnighrZYV9UdAYZJnYl6GKHMPESgabGBMgqhSjEFWK8WxNBgS3F1oJXXItk4lxJl2i9Bw3A6z9OYtc35/tKCgtqvHmqwAV/Mk8KHhGzKSwIIhLJku3kdIpgoEO8ltRCOEtp7DI3PfZewJpSgm9qAvNlPSfstLjNZ2ZVPU0nbOsXz3unImqVKck1akou1PVZLepJDMlPcg0IJkz7659yAFfO+QOObMf9OiC/Rr34xOnG9RpBY8usifyuhPWn6DknIjNtTLz9pK8eqgkps44EXl7Kh6bUFz9NueMArDY2xqFqGT62JWbOiFuugT3IyWjslg0VSZ6bFFjipxRETKUCc8a752NPFcvPR2bjey8hpE/+hyBOZbZ4vNSysrYVd8IfSTynlE5LvVYDM8ziZQJucPBhG1ON5oomrXLn0aZjSiXyOScp5BznjbOObI45wiv0dyq9ZIdlfojMg/GkSXz5ZQ+Zr+c9twMmNM7qAVzSgczYU7HUmyYv5piw9RxsGIat9jzK+dFlqQiQ0bni6wTpAnJuArwXDUtWSwEXEpO1hCBiqUGS1LGAWySawryg+Qro+guzTtVwiTv1CFyMFfFpIxJ0EkqmKBa2e4oJdUhQ0HqFWSESjIRDnsitFKoMNHjsCdCModa7gw78ttAOMVqwnvx989eUpOJ1qdaP3uOTCahPpXBm00gzZYAzPip1UBiU6vyxxPX2CnSdXBjdRlqoEiWwV1tFYF+2zLABkrL+AHMRddh7EUW4jgMriagF6yMntM7VSkEyIdTc5/naXPR0TIsoZUVC+3b5XsgXAVLkmASbtnx9MG7Nzf+egWhXfB7KkMmzpSDxGQ909ISNJD44RqVNBq0t1axqR/IKCGiC1VrZRRsPgM1oDsUmZh+sf7VMUEv6rDwGwFecN/pDbalCHH1Pok8DD0pviP25KaM3PXYYH3pReJkKC9DwlKLUBCwx+5sHH914+rxjUsq67eLHoerKvQXpN7vUC7vDIEX+OLt8qg3cJ25Fe8cr19bZkK9eLZ1GRJSOB6WLgHv73IhBuZ8zQ5iHy/EqBm+LyuU2QxP1i67yzEZwvtMg/bqLZk0J1OJng8aIajonfyF19ePXwQiISVDikiml3clNKjWYzSgOBzCZZ/HYJFMXuySRIq9FIA0+NDsUXTLwQ8FFTn2dKh3yexAT2VzJdMQXhJdgoglvZ8dROFOib1FOZ6eyOXkjcdhqjC0zYRIfi6IuyQnT8FffA0F2ybXj9ryOVs52004SsJrjyvwXbzB+HSLgght25kQC4m/c3OTGfHYdTe3Js0SKRjKVVvssrgq64m/sWvDgulcqc9xfNAlul/qrFlB6ZpMxMJL/LFvnPsYWgvR/i9O+Mq/M5IYEFyFnCHYDWLGg8SFPem7ERzl9snzXRat7YEgVNtBCJ8Cvbjn4neYB/OTe6zJ4YmfcZy0pAe/yolvmky0RKqlZDpnL/2w2bXBzX9J4swDHCEBACGARAxrFnRzkHUgTUiZLERcUIukuvIkJ0+WIYUqbBlSQCksAxWUwjKeAAAmKgEKLeLQ+wLjia5ArsfjGnA/Xl5Dl0sNbY0wpNDtkJsCkBFng6QbL9NmVHppSRHaRHoBzCi13D3lkqGICCUey2Dr+jvcTXVCg/hl9e2n3Ezx7KCAnXAxxRrTTatvYxB2++l3x4l3u1l3O9t0V+pyB7v0zR89HW+3TAfFNlCOrqW1zskrPQ/3PmhHgSc1N+zHTzKAC10I6mGYUxTEMGfGhbzIxZJf40hrn6CYT74sb/FgPhYtV4RRivleyjvbwzukkklb4s6eDylxCMbrx0NWnIeD6XPmy5nNAVkXjklWiPz5Xhd4sk9d1miKhmYJxReArKVFLy7FOvBzcieh02jLoGiRuIzJWycsuU/giGJcJ2/3oj9vhVE1PqGtlmctuEp9UYjb+pKXD/+AKAF3C277/iT5jYabWXUKOwkz6h8FgYTyUfRXh6wIUEGGUqNuhUUzT+7kYpv2FfHhQae2Cdo8gxRNz2IH3odxl4qoNGIrx6iSyh2wkwxKN+7cf/k0EZwP3pqGHuexwM4LcShhRjks7FktakkPjxuluyAT/4xWA6LMIaN/vNFKELx3B/Elnz84fDfgWOuu94QqWtTpXJsoXJspQLOqNTSC+uN1n1rFJ9FDtidKyPYwmT5J9A+nfKipkCTbZ81WGH6psTD8hD0m949TIb5OfH/By+0veHH9hXguZryIbmJ5RRx9tiyIPluWQJ9NRM9ndVoV9ZyMG4U8FYG2CGZFkO40aMMJihUxTiUpSngD/10uqGUiVCZSMEtP40hcRGT6CeQlE5WetARjwsuTFyxMpviBDNMzX8d55Ty0XUfx/3QTqg93nLXTrs5r8mcNu3zOM7BDkVIYieB7VcelqiyKk9jyX2BGagfeFhnUzsCcdjvOZEwp5L5bjhR3pkxlD9WT1vBKxt34moVoVmhlqHKFQ53ta81wLq4BxYkd2NZgzMqFrjbpGGtdbdYplrvavFeoeLVJr1j0anP0xbr4y2l1r2SwZhOT0RSsig3c80vvKombXhyh4HdNyUwzzoNF6cKWm3yJlvZ5sYPI0TH7lI34Tvbvn0E//f5Nrlh+59a9W3+5t3pdb5wooqfFSbvk+HKuVOTYguS9O8xMvjEdftykSuWLMAxK/U3IgAaALyQOy/T6QaOu54d0sFHiRKxncO+Ed/Ta5aauIBjQuOsF6SrGs0GTelIirBc1WzXdLKPSpdrONk59/eD9r4LtLIKiS/9iSJHm7LniIA4kZ9l8Ak66N62//NlrCHTxGjiJW16FzpHzLwvsEKWN17oQV0iZuArQ/3R9sZusDreoLVzmU00FvT4nD5grZhncuPO3ybHbZhm00bBL9TkfTgKnz82aJ6fS1cHqwly2PQF3eXQggrsqkfwd5HTvSdAplAHcdofFkXOtPlnKyOOQYrqcGdQGDuJIWS+HTo2aT/e5By+ZE9qT689eW/TtW5Pjn4ZF12BhS6pFJE93Ih3vR6fIhD3x+OiuCD66K1QLGwYgisf174EqZEvzz1P4D+0fIdPdIKVEOGiQX7714M/HaiHrMUvBug/J95W99yBl5x083XmBFz4mIVzQqCB6QNQBYWmNpJIo/B8KfoYeSAEMMUlu89vowKpzVh7ZtqGhTejibGOMJ7s0YSb7j9ryJ6+j1v3VsHy4w/CkRZPlMjLa9jkFgt7iKUaGEHnB5vF5kQzmPD3iZ0AFKIqWoZOpFcqho/4Ggo7lryEDPsZl7e7azZU28215w6InwTd0yB9Fm0qoXjZiJ0dDo7UvDzmHYEZ9cp6i4+cYW3NOaWgg4NLDF0xDFSfL7/9MYs6Dl0/df/2r9VdfeQh2cv42x067TENO6YlHLpzhiJe+Q0ErvMMViAj5PPMRfHVrp+gNdiVzfPvFtcv6BNejxc85Ahqe5RJGdPXF+mH0eyd7zeH5Ule50V52beaLdo3APo4i51cmmrimikUbKZ0GnBm9Fg9OfvR8LSJ8hBIslptDuQ4wNML5YSTC+RmEz2vA3ypuDWhR7Xl1L5LjOsj5Gbk+88cN44x4YmbpUBtJNA25RXt2nOkXB8acp5z7Nyg9yHnNa3ZncuYu/k2/9YCLI1X2rQdcSgclmzaygozxnYiMEjpGxggdMpb3ES9Fjutg0bh6ZRtIe7nHzZ2Qvwk8XZ/BOpUOaUr72A3JYzPu1umKgAVnvulfv/H2vdVPNu4crsD3rDaFn2yBh+8+ETfCqHyArUsX0GHptEvtbLdfNzWtfY42zsMV15x0baZtbq0SghcSlMQVv3ZD0pSERf/kkCVtjsFdP34qBJq1m30Es5GwkHnwB0YZ3fTgCT2QjI8RCfyuDlTIPKCjox1GfFX5/en9cRfOIgGsvfcyKvFFVlHxb7+CShyYYBLFLkUjHAHGIhyBEXmQIMGL24nR4tPcVHoPSc9m2paXmsj3NKx68tFnSG8RVm2zRKwdPL/O2p7SFJZmsAILZ1DGwslfuKdEU38MeFH7kNllYWdsTboEiooL1RW2grUPmA/g659tHD0RaCoxjKX2Ehmx9UIxW7scf5Yfy+xobD9Tml2yWsnkyG/Jkx8AK/0UboOQOwph39SCCBASJuje0JoWqSX2yYtlyoeMOPHtckF6iX2Ezks44KsfTQ6/FQHM2bzz4a85m2ZeXb9Gyxx+yQ5Cr17HFMFktJT1W42IYLfgBocflhea0j4evxudiN+Db98P+IkANtsQOFu9zFVog/5kIFvj5Er/bXYm/SJcKYgziAsRs2MmUthzIioS09imPCb9k+1ucZ5wgyQz2Q2SinTkUkBe98/GWfN4jxx69Z+1HwVZNNucB8ADQSbnCOPNO9M8QlmAhAa9SxTnXaKK7/JquGngid4665XjWaehzkZVeNZpwaYAO/1wS1QLt5gmuMUrgNuc6mdaX1XZmk01LNGvtpZVqtmSJjWf6FCmPqUaTKoCJWpS9VHUU0xFcTLLLMgrzCaQ63EtEjSOHYncggryXcnTjvyOprLssJc9bQL908QX7sez7E4UBNMNgug9m4jes7XytrTuTkTs2ShW4zyyocUEapOla0XYquS6s0ZcLYmqXkg1+XT61rKAN7/ZzoqAOG8yYRw+dMNVLJyfsq8mHJpcmApls6ksNpuIX7OJ1DXr5C0Ttby044ScKMMkf6VCjBdgvMiwgzl/WVKoygYqEsyoSLDDCQMmBwhTniO++h9EMeaetr8a1b+U3xqrVWteZHB1/3Wsztjc47Eg5T2e8Ri932p8Jmli0i/kPtLmQI/Dt+j+mzKJwCEqYfNLcM3t57+lMg60sYHVlEPnp3aL4fPTu8QQ+s36hDD6qX1iKP1mSIux+BfTwull6DKMxThAlNKQB+z5hTMU464bbkR9McGB/pPXHP6AnNghCxjfqc3Q5emoeI6I0oASdowsq3qHe+Xi/T9tsg5fn/cC17QpKDtobxdlWQPDfUY+INzsdtkj6++n2kPloXS3+97H92/eZDb61EOxhr9Q9r82RRx2HmA++0g4h9lq0YYvB8uy2UKjjDw71V003DVoa6lYFJm4GXaDvPlAg1lr76PMcof9fGVHgRCe5qopk5NFGNXP8cb7sHG2F9WfbSB7WFBpJLooXGDBbFH3cOOVaw/+enX99LdhD1NUbJEeG+wSoTMNERtTh4vbmDJGsjGGkFLsDnKO4ZYgk4h/ul5Y+1u7O9Kork6bH4YoeY5owlPxjMfg8DgMJnqlg7kjbMFj6ZR3Cq6Tprl38e9Qsltp0d2zRydnPpxc++rBe++o+5/OXoNPiob1nAZ8rgS2S4FyBNvg3rt9G6CFUO6D60wBH4ODyIY2Vz7NB0b/OLWPXhCLbfvy0XPA74sZPcSjDnsxsYWHcmqQy+vvERr1XMgjRGeVncEWNIvQ6s31184GuJirK1OBfqBMCpuQF2uIgWJB90h0hUnZZnt2dktY2VTwYI+UQNoUO6Q9d4RA8AtiNCNoZ5eh5QxsAZ6+zwszzSmvHH9GbQCXZnzJlIwcTQttbRkuQq+D/472WFulyuMdctqQYNnjlzc++mb99FdlUNnWCpj+IofYGBDuYgCecbNTzoM4+4NDmmGJsq/BJ4I2keNPSdWwJQ1yKltAj8KzyuL28vP+Ai7g3AptrhYlP7eVgpUvSMSJLXby+pGN2x/aYuvQkTXVo0IS3dYKIjqihMQzKQZwvTX48LkNtYHZkLsdxwUhZahbAz+DuQbR9f4CasRIKlDrw1oFZBCx8PUXEPsqsjJIfNHP5piM524iKgEbZ7LmMCHcNOwhJ6NXx3D+ZCF7cWqPK8yRTryCELzJkcMbH/9lcvvof33kv2QR2dBGNSHGmTyG8f/fJYAK8Wj0zwzT4NtYOxAYauombbBeweXxskS0XV1hReKl4PkIvJBfcv3WkeD8OAUvt/5a7JJ9nIZi3SbGvuVdTLC1XRRswy6qTPt0Adl9C6lzU16+WDieJhIyBF8ceMTyEvYqFDdkzs4jrGGYFVvUulJdBhsyJctb+Ry/cQwp39w5/u+1mniweR32SuD2NNrZKNpQyacuIe+uoNfM0+0d4eq99iCBhRVDmov0+0fBvbsyomlbmLeC+j8+a78ULUTpq9i4+BpdGrpX8d9iFfYKBP/wCoJkPd+YTg7JzYgyWrK5oxbtOMujfcYkmVfQFaG8vN2Qy91e/9dD11Gbj8Om6thFzC3ZDYdkZybbCv+0xzCpJ7+1OPDalb6UWcGdOint4mb1MWDcWz12744lGNRRCediSIO8yq3qeltjsrgAXZcmkMPSALZJFTpzStLXI90KyhCUrABFHsLgiUiRFzvFojwflZ7HwTBe2nB8IQM4m/Ew6sk3K7fZ74/qd17hxEqceui7dx/87c3J2evrZ6+oSDRsL8Cm1shTfOCI0F6AJDvMEzxC73EJAelMGVAEFyGK5+lWk0KgAiqcZQdZzM8LHum+1OxG3QZUl+1XzOCutMzjEYAADgsOfo/kPMkzNDn8n2vTMJhYwC3AiOXbFJCrWKewNC07A1F5eu0/1y6KmY8llx2hxKa0yQGDsilV0KJNELJmTfdenv+H5Cv6s6SxF7/1JlXe4Pq1d87d++Y8wrvvffcX/YDMSsnW6a43J5YeJqbGnIuZGZSQ6YamN3s1kkuWHXeoKat6+UzpmVx64wPdH91b3ll/51W79HY38B1x4PYX79KUlbsojHjB4qCk9jMBVrai+WuLWqsJWV9mN7G7tMRgNN3sQiaX+XpTy3yNecibhio2jZl620qdMWNbvRFjV401xVtSgrSU6PpiCqhYAJ5PVX9T+FNVn4zvpBJXjFd5aCWluktKddq5okfPJ0q0KdDmkKxhjKzMsnTQUa8V6K5ObTWFVRMJqnaoqh27aLFeGNRCdhgmVZA0Qb7YikpgqoGa7reJ7lSvME1XkWrUohplyOtBU5WNOg1jik5Rp0fUaA9ecdhczn6IcL2pOD1FhK4Izl5m3kzUnCpfbiZR1kuRNbKjFxunC2G1ktc0WasqXyVSlQlUiaQzFwScOS/RzDlBZs6JLya5KEOrlVemySkPk0/mvGRiAolCcvP7KcsTzUZebxw+prsJDM0zNw7qrXtQZnllfhcZy6xxtrTNmIwxlinFweXm8H8YB6srDF7tkxYFr3meFgSv7eCLgVc7pIXAa7GUa5h/3qwIOIsruIIRJrznn90VzNpFeJUscl44CIjkij3oqszRDE84ypyfybV6dtA9IUo3KBbENN2kWiD8ZHnY3s8UCd/IFsllt9KQfyiMbu0KB5TcuYD/3fvuwv1X9d49okNG+LZGR3pMcG/Lmb4TJFBhQQIkIwLgop3OSAiWABTwkvmVjyaBBfzJkSMa04LINgprAG/G3QO7IrumUS5t2g1NxQquHC9omethKOqwAl/8MGxeE/XEGlhLVGJFhMNPUQTr/sVX1l/5sgzeqnzFppBfLQJ3lb4iwJ6r9iWgwnWwQArXwQUIS5vukLhCBMYOSd5e1MYh59mgVr6dt87j0Jmb89BMmoWiIE/YnXWgvjm6bCTi56DbE5OTfwIu91ZPulUPEdMqpUEhHsSVD3uUHrSPvBJUaypTj217lIzAvQ+cTldSRAy0+hRKPnsBv37o5cl3hzV7MMJZSATCzlNwELvfUE2SAxRmycFt7SW+VtCOY9+R6tlQR1awQMBBsZ8X2JySSkrQStjcteOIOr5/++X1Qx+H1wAxokd11+hC+xn1qoFbBF0lUupe8o0TIQm32kvgNJKmt09JHmJimAADx5x8AIhgCJT166fv//HbNHEXMiiQtOuzg1C8FnnK9C2PyLTenFmPO2sykbZmejjT4u2ljeYY/G+PIJEINvj+oZMun5PMlit9kYk0Ngg3C5ZeT7t1047guL+VGoACxqpGM5RQfVaUPLwKBFhDdmDqw1SQbhrpcrDL7D08yQZFUy+GcPdZNAfaDtq1LL5VRHMaVMT5ednpBUgRzYYompoX54ObG1++e+/2axYAg9kXNDiaX5WodNw69a3KO62DFN6pwHHvlM4jJXSlo9uhakfPSMwqLZfeJJ9eVKeWVGoZ+VVxUe9x7E02ktDMZYk6+oDvwL8/OaSAqT65NREThbJz7+6p9XOn129dVkesfcgBnoXPF8nzNRseCli0GlL7t2utDHWpUerLdYD5Vy+CN6gN8owkyxnr8wx5/fw364cuBlcy8n1q0bdL341IXPiGOkizI6vPQ3tH8uGOG6Gi+ZAk/EyqW8Y65xJpAtcRSFyrAy7YR/T67Ln71z66/8phlOvTA81VASHWaByd1K3UYoExvI7PNNUDJDnHmmIAnYMcwCm/gBmhTaxCgBK3uHApvHZYgPpUOaDBNR+JXy0/vcKR+xTlz8+YjJMTLnKAKj+j84IXgPOMYXR2pHI66ryAW+suhL64+wwmqi9X6M5Oam/8DRLhgzvvTVbvagknQOZM0H3NMIw4bmpq4msllVvLY3BbV7qFhMIKDEWjQiZhBcSu/5ZAWKDd//wvPnUwBbVCukVd5FEhzhdDzdBPdIvcB0n2xdPgkB2yEeDsdXgsF7fH+IIzLOhoJEJlJw6qJwzek+UqoeKunAldN1A7Zma4MP/2yPrXFyZHvw5Hgu7lsf9CQwUNaRiq+z0a+Lf4D8oj8A41Xtj0OHot8+RiCJPbn6zrzW2Bai4dyvSHO1N5k5TARt0g7YEcfsgtHQlOwSnL7OGYIig7axekpvhCaOY0yX3LEgUatKyHEZ8Dc7APcWNP1TsPq9IksJuSx6dn9+EKlzIQI1WfxnwSwKYk8Qk9iVLR3/0AlreZMlIdTAFjo1874wALA3YFUQmJkBS26BBzJhud5IOVvpoKdomTO8u/xKTxfzplf3kf/wOHxv+0hs/T8IbDrBLAx/OLv+yA2/l97adSk7nUT5EaNecldbnMLXmP7t16TaYOFAtyI1FsOsdIkPosS1776H1JA7cchO63D6/JdUIINJJ+8jtyHf/xRo9MaMsaIcdZUNmH8Jv1m3dAtZAHVeAuUi7whoDnCKKiuwSBCWAX25orngqENQgyZ8CFpywDY7jb5d1wiokAksjisS+QXEKAmWTJkhQyRvaprraUp1lk/gtY3JqFelD7uHlc7p1LOwFHukn3QKo3hGNJew2c9mv5BriSnEQO4XfUtdBmzKvcybDIKzwqGbgJp6ogFrBJGJZg5BhWnJ4StBeqJOSuMa/DhTpbcxkDyT7Bma9bcV8udYVGwVRMWBw9UoVfvy/ybPq+4OGj7EuoehuwqezL0SNuX+DPIlZF2FHp20AxHkkywg9W2oGZj4t/51rxV0EytLgdHVrrD/EJAmVBxvx9hXwsndFiPxdVsghvibP4dzgHGp3iK3/CQV4/+y7Sn8nHT9PVSDUDQmBvZW+0+ya74nCIkFPRhqG7HfHAexzTKmasCFqqXIKfC4Ev9W8vrIibsRevQl+DzME2CxRsz7diDH7y1nvrp1drkMjY5auEQlccwdKOyD66pXwwCglTMMjkDRZhfny33txPBgZS6aWmm/1J+q+1itI/65R9U/BT3Xrea9XzTqGeT9To+USFNu3Za6w7nZa606mlO+NEJR3UNE8TYkjNCXlcSMOxFC61D5wi6VRI7T5vnefjHGljop5FxSzoSKYSmQ5U1kRMA9ECjiqpq34RNYqKCG+Ce6yzvStW1t4lsomWcC3Lwib/BuZJObOXxPzfWbsp0TxRlPUCbBRbncAqqTrblpnT5e/kPxeLQrKJe0nPyXjEP1H1YDCSyGccAfpRLMvPbOie0TGgX/rMizNekFFZItf/Btllt8otvzORxQSVVJSYYfYqHDz8NpbtWLVn0im7TXly+mwqmzPmVpqRyX7yo/RsKoMwthBJsEQqKNG3llpiaiS0QrfmSzRrPqVWKame9yTKqFON2ZgVioYfWDYa1/WIJuPap9FgPOVxMBfXPY7G4im4ian4n6aZimkUzMSOZu/5JzUVG2jNMd1hKzGsydlijvucP/yBgu5k6QRrjLRbgzYe/Pp//uwA7jnbHBHgNucPdP1Bxl7Oa23df+W6h536w886dOVI5ifX85e+Z9i1gGbS8xdpT15FMIzLOiAu/+/01dlbii/EJe+26AjdUToauGqCCsdbqjpot70IDQfLXsmegzDLewH3WiQ1pl+y7zvw5549P/s//w9ev2M8";
\ No newline at end of file
+export const w="eNq8fWlzG0eW4F+p8Id2BHYcO9Pb0zPdXzZAEjwkUiRB6pzYUBSAAlBkoQqsQpEENyZC8qXD1uG25LYt2ZZ8ipYp2ZZ8SLKliIUc+h8bBEj9i31XHgWAGtttb9gQqzKz8r283pUvX/7nf/7n//7rc0nLDw+Gfjv0m8/90/96Lq0noesvwR8vXX/un/R71I4g/7korYVufcP3AvjfvMM/ad1P65ji+uu10KuXuZqynYS1pPUNqnYD8tfhc8zkirgYYAIfhm7Nx/r9IA2hkrRKRQBOVMMkrrSUNtKoEnqYyQ/pMn4Mr4IVwCTUNgSsHwCAJZNJJb1q1IT8NKonBIWefBcQbOB7M225FQBMFeAbdAnBSEshIppW0pJ5oybgd2kbMFzyEDSC4QesOXIJE7fkQz2ED5Zu+HVqHaGFOZSPBZe8ttW9+Mq1qG6jLwDrpMY9oZJSRKeNdWOLaUCqPr5D36okar8ArSHyaUTIwaB7sc4x08CMuD2sZvhkxPR4ZEbCdK50pOo13T26X6ShVmusdthIP/cff32OJu9ckniBF0ZQKc5qz4vHW6FXLrtQ+uBicb7/B/9PTefk6eiwEj/3B/9H9vsh/B0szo+N5kcOHVyE58Xi6Ei+NZObH881Czm/kKsXcvsgyX6H18qB3Bj8OQC/MfkF87nl+VxwINeczKm0Qt+XB/aN5uE38hys5Thqld24lfgVWMv/67nELfuNzucVt+w6iQvJ6UoYjUKPwOJegZxNzgkjv+XCXHQ7m0XMjMomL4pr0TQmQm82vFXPr0Mq5HuQnYf0zr164oSda/6SQ4+dTSIbvWtvdB/c71293d369Ln/ALryf0+8Bv87ie+tdq7HXsUHqGUn8TrfdD5zNwC2R6C9oOTGAFuyLcxiKDymi+gKhuJnFRnN4pg++VvbefK3poXimacfniIUk6jitoI08QBU1PLTGaqWkhC8V3GaaVROXW+EOskqDIuNC3NCNXLagE4wB2lP/pbWEHZ9w/EfXwnoHwT+/tXe6bd37t6G/xm414KFEvhxydFVF7ldbsDJBhXVEyYv+wmjAbk+Zo9k0aiFnetp3Xl8k+iJIPLK67sPzzAivuuX/dDvr9MAjz0Y/niOx2J4YUYAMoG5TOEqhs5fR8ib9bKMxE83aSX3Lp/unb64+9nJ7un3CP4GzNlqAUlCGZ/oMVr1W2WPU/mRk+1aaWQ7d5jOc60wtt1zbw5Ov1YU9iGMEyZdid0GDudgP0Pu4DfSSMxcxi+LPNM2nPDJeUCLepwwhPTdN/7ee/sh9vXl0zLXWq5f8RqD3exXOpsNTFdo8JLk4nv1tMfZjSk11KprnlxsS3+Hj0/WnM4XavJdPt398Svo9p2bj3ZuviY4dT6Lo2riOS6syXGqHt6rHvRDxfFin9OijdhLsVQMIzRplfKWXVwFAMN5cimkAQaagDyge/ZK9+zn3VP3tx+8TaCiOK04UT1wYZ0u4jebYeziyg18d5WTuMiSKrEcR2tOJSaAna9TnMY/naMGITBI3P7xave7TxgSwXBbHqJTxfmyVJqVaSSPgRtNYMrjk34JkGw4aefrCvTUjSpRhlM7V2713vp795PXfgN0ddWA6TKOA3E8rn73tU93z3xJQGIgWU2gZ7iwYg+IoH6xMmD6x/VF4oBPzvNixskPf67BzNfz/+nlRzD/ux/d2n39JLcAyaNfhrlSRkIGqzbsfO5Dveu81EI3SfyIM+HN8xE+5eGXPnxqfenZH/KL59Rba1E8IeNfCx/fXHIyOOI0OP/qzoMLjJsMke/VAyDjsNJxOnsteCFaW+cE6GQvMfmtxFuFjnckF6C8WUVq7sCMqDvpT+dIctj+/ksg6bvnv+td+lbNhKDZwGoY3iiB6tzgRAFK4HRBgjtqgQyCdJynngBy/M41Wuso7DGw3R9/7D24rtdSCHMDl07oUr9A36fekttAprdZlkymL+X+ovVaGsX11rLrAXGPYVrRwvq6CYuq5XSuVbBPv6aR3rl2d+fzk92PP3t66pxABoIM7Wk5gkNe8fsQGtVi6LE3J4xeihIK+QHQAXQ8frZogyc2/8WSBg5cvnf2BE+zNOxstZAxRyCPAWtmNpGGPiUmnRuY1pSGRyo9ssryIxRJJZs5eAlW0BdLSMtgncErrqCtT3YfXem9tbX9vWo6LHBkGn5Y8xNov41DNZOVRWTww0F8gJtKgYUMQkTsYTi2GgYlIPVvn+cO6XwEtBQksjSuAgktRYnDSeW0gguIBBzJdgMYWodSILdzBrM7d/yylc81cKpdAzx7jqmLZuq9NnEBkMs2kTJ8TeL17otf9y6/0zv7du/1m9JnzYaHn+E4ANmpRtg84PGryAphwcegZlGSl1Ba7MdVTlguu6WWl8BXVU7RgJCawiQB6krMmKB1L/z96cktXo+G+gCvCWG1BcRayrDsO5vPD1AgEGNdaH8ALMclOqbJT5wCBa46nk2TYF2WQLqhSSqUCBt+95Pux18xBeKRgZEtp4AkgOt81HBc6CectQwLeQRMkjKWSJH5dW40cACAHDiC5jQRR38dPguIP1ZcKgIlNMYFnkFUDUiFsVdvRQ2gbrDifIexx4Y/udRAjBVTE6Le+YKpDLcGO/L2ue17r3XPfoCyzdu3uUnUGCM8RvXQgxEdlBBxhTeAUUM3yaznaZS2UGCWciPCDFRBW4TE2d650e6TH3cebG5//64tP7qg+K0iq+hDBUXFGGQUEvs1DFpjOKr8CTMbqKHYhwl+v2BhoWcYyVeMRffSraeXTsi0hlkJpAjXTUZiWk89aDElD8h58k154CMt0KZV0AtoeZGUpQYKmELiEDdSEvXFneuXgQ9ZNKDmIysBAc6tZCuH2QTzAvgrLfBKVvDjMTLfcolhuEEtrsdJNm4/3UTZr3O9bTDb/Hbn2iVhjKwSAsNrHCSm6CdJSgw4PEhCTS0KHHq01auQFT9/SUv0j09WYUIgjO6XXyGMy59vf3/Caj1peKRD8XsSeguqVpA8iOuWXVj6tL5bnMvg8ZuKSsLsui6Pa8qTqoAQgzhokML2vvwBo5Nd8K4TNdKitcC9AJWaQ/Z6RjmHhVtZvSDLrUUseFlLFOUuIP+ge2yQmIsrs3vxjd1vvsyAxDFz8WWOmwAtln6G7gct16vBFCQt1kXNE6hi4oZRwqsDRJIIFgDMPcaFVwFptFCBjQ6i8NHN7fv3GZHn/uM//vpcUomjwyjVuOue2ARsO8CA6j+oTme1fK04cwOtiWhP20y6ejA6qNY7FTvoXBelD4QR3+h9FbfiG9UPmh/upf5pnU+kXZ8/aamiqg79cUY9sxQz0YGoLKo19DVrPJk0o3hkVI50mpYR/wUpkt+DWi2NWwu2LqA1gD7xfNQWx0cz8je+aSm7X7YelKpHjUBtRGkj0k5mpFktw6pOEHHQCItaQrQExBEjFmppUE98LUGxrDVHnLxfrpqzZCktP/VLTuMZQWk8KxcNZtryjiXpZKSMM1quGNdyxLgtPGiRgZHJsrIM99qLZ80ZbqU5lHDIX7ECLZquKfmvry1LJweI5IImjguKKJ7RtHChjwhqwmfRm8QFAf0/LaaRd/7gqM//+hx0ZFpLYS01M5wlW6gOQl1cfVaBxA/dZvLsEkEt9J5RQm18PAvV0MdG/ts//8tfnwORtwkNXHvuf/8VlcUG/rU44/Hjwi6OQ+nj/wr1Dtti8dJ1j7ZM2PJNb7zZ4gchPKf+iq+2K/Cd7eHwlOBmQRqRWdytqwSy6PthSDsPFalVUlRh3CrBXGvfpM22eTLhN/Avg9FJVgk/MCipBMr16xsAzvca+lnS2/Afp8KTpAURbqMwevISVQRVVSE/h0SUvY3QTdsajXrCCRqHhLNc2s/Bd3ypyi5G27xAV6kOcXHvwi/RjpCdRvAItluzEHElh4dIj4c1GKandc/afWj6S3eQ9InqA91m3WDTPtMEC1eD28/a+ijOz6XwW20GS4sLxflZ+B3AXwve52dKxeL8dAN+YasJ7/v9I61msLhvuXSkOD9Vg1+9OD/pwa9anJ8ow68S+W5xvLQwD3UU8Dc/tuwv4F7Hwf8+k/vLTK44P3oI6lgqjrjz+ag0n3cXivnVtHEgl08mgpncSD5eicZH8vmw8d+LufzyvrH942Njc5Ber43kq16lPAul9o3kIe3Y0aPjuVohd+Tw/n3/bSbXnMlFM7mVkdzCzHh+fmZ82IaH61ejJAr8KmiKTO1hXTYpqd4E9SuIXSTLbmfLKlciXtg25YC1NVmfTddZe0ZuS2PX3fq0++bXu7e+FslFVYNKT9zM9wEkjZ1yKMsG6+kPLMAhiPDTGcCyncJg1V6KB3IRKOigssZ+WvNETkTRCXTmVYa66qdJnEZzLEVRaUhOa76UroNq1CJN1MOCtFVxEWT9x28i1Pv+Cil4ZGG6+OrO1Q96X724++jHPvDEFbwg8F5AvdggMJ2BSoKTgZdMZWF9QXRHoLx9WwlwcWeriaZooHModkMCvD5P6kDsRySJpLqULuM3QdpepQFF5pSIJRI3BxDIJ+/vfP2wd/VMH5BGNKJBOCG92HWnI6bySsSGY5C+HAsCjtEnP3L93EmNGKcFCFIi0zVAuURDhduOVAIWQHMql6h6fuCVHEhmCeeaH6JYRBLuFxVtN+4++mb70fXurXe777E40dms6l7yo6qz4bVpHlalV+otMpGoTtHVSp9wfapPEuRqiDZQlBJIFgUxnaEJPWJ7kLfujyubGaXGXpl2SLhw4EY1p8X6m7auUxO0ZR2QN/Y6qkLh3wdKxpmRij0pQxCkPZYBn5sjtnvVHBDcIpgR1gbjaudzMWx5tpzU+QrWAVADU7IBAm7F+rSmTX03Gg7rfZ0ttsu8dKf34ac757/s3nrfBqtbZYAmoGLLNopAVK0ScNysDCzVMoKiW+a7XsUni3w5oQm6nrq4ccqbNS2z/NFyoopWvHQl6dwf4W7EVNCgueycAYuLM0MCADSsT4sEoMyJ30+RjsH9SC92Rtm3XqyqTXuwUmlPHAXuqtOgeROnHr54YVpOcfw5LyTDq5fic3QACd4Wkg+0cPqdTeS13RM/bD/4rvf1dRFlI4B+iG0+Pm4rsAqiUmnPjx9NTWpRcE2KUJD5IRHs0CbGhmLe2pRMRg9ZMQgGoevxVljbwZ/gt33vTO/lCxo/y+a8wBtV9mt/Nuj/gxULulKxoBvgHme04RalkSHMRd+82TmgArFqDsMS8b6CMDoYmqcn31SMzpB8ZHStsDDAb4idNUgJsfgNpPpc2tB/EFFbCfK/g32A/1bRcHunXhRy5PP0wV0LfpD5pP4yQbOmFdAza1pRBbAm3FWaMlQNLhHgWaspJ7lSwEvN65p3IFM3kPh1U/dbYt3xm52tcujzxlzTV48ww/gFGDp3iBeY3M7mBtrjUj143dPvdM9/oOeaqrTpNAqmXqiKLBF+5lXVC6+8xjrXyAVDINBe2Fmu30y5JCQBwEcjdlAVe42VgUZO1PH1NiMs28c3E5sMnXjPLNuK+g5WrXqyEr1lUJ+wJmRfjqkOG37rW67MHilDMzUxM2wAC2iCyUSN6eWT81VVt0LzzmWsvH8aEG/XdYfM69UUEE7Pr8LorZqR5+uagdurjXwfuDpunrgV8QJpcgLMMsAWVZdR3sJvqoJ+qeGO2kV1KeHPj0+yqQx4G8BmIgyTb/ezF7sX3t798Yvfam4LID27AYCa3aphFp52M/qSuTq/c61mrcPepy8aRqy6CZg+46baDnxL46v7CEoJzirFRpvgGKwRDmI9zNypRPSsLpBRAsZtIXzOFr+15G0RwUOG9B1SxO6QELhFW7LVQm1G2CwoQbNgCZkFJV8uZOVWLbKKoEcWqoiaMi6SXVZW1PKcFuZmLKlqVmSpGZGiMh4QWnYyEsyCkl2MiLSgRJWxPilFCyhGOpnSQsmUFkOmlOSRlQm0OCC+UMjxD9E+JIoCh3j3XKV5/VxbM2xlk7bYJm+PWmw1kzvAUTUzlV6wSXwyjMaLhGVeFEfTvOyXMjLNZ341CjYDsKh/QlZmRZkREfXIJkydM4z8a8r/M5tj6KYmmb+arBCV0gTqH6JOmmAMGitVeYctCqV8v6FyWAFtpByaqQ2Ue+SKcXJYrjZM7oEWGyX/vJdRUpHN48flM/f4n59hkkyDyF2OXLanrdMbkpp19I1O2de3FrklSiAjd9qW9LTm+Uv4juXTur/ET+gizU9LaQ1QU0k1LgYFE05TT2ndMtb5aF2zTHcxvoSeZMm7AHSDkJFFn2l59kDPWXJb6onhe2swVJTIj5SK7tswRtwYP5BXymgCcZCMED3IyXBIiZSCYn7TIzTSFXnF55r5jDuNU5Sl0sqTd/zI7nDpX+471YXkgu1rA22mY8hr2m65bqJpoGmRQV5ja3D7WTbFxeL8nPxm51cOozmxuJCbT/BpJpqfaTYgZxr+j4rz+5fn9wdHC7ni/D4ffkvodv2n6Vw0nWtM5/44nuu3Lxbnx134laBcYZHsi/BvsrIA/47ib37kCL4fns8fWTy4WMyP5FfTkXwr2J/LxzP/Xsw1owPT+bAxkw+W84Xcgcnc1GRubDI3MpkrTufmp3Ol8dyx8dzKZC6azDUmc2Ehl6+U/clcyT02lSss5Ebyx44eQUfrkXx1PLc4NpqfHxvqWh0l5MFhnIy94IUNT7ku08ZdkHltoeiq355cDVCeXEZWgWO8+84buyde2v1Ub5/9I5WTbUJBICXgNa6fxRigO53roau9PL2kHbjwDvq28fL0VSnt5emrYuzmCdKXQ/536I1JW1IXu6df7Z58NwsEd+9ByLnTcgPeH+NacKcfqGqTVFEDDE0XuHtG6gwWQCckBpznHV/atMUtOoaO9PyNs72znzB4ER863yT+KuijxpEVbRFRyB5fli8rzHC/XPYrWFY3FEUGSVMurTfQk7Wtm/rNa08/fFk1Nep8JND6XTOkos6m5A04dgiUZ3h1aFy0L3lnE126GCHeCdx58CZjxKaZJS9xvHTF8ZIXyHGUhUu0gpU5vYxuZqjGt9znEydEqdCVb+gDzyE7h1dyItDWPRAd0U8LZmRrigSltO7QvibB3/7h3d1b1///AWffQ9X4t29bwKMGusk4KWnG9Pz8PloqaTlweTfc5SJTsjX7082a8+RvyAegmu0fvuydfiPbDLtKrE8aYSpHfLGchoGY+k4fJEEawGmkAZoI9dIvHm9NZDorKDUAkWCKFOnEFOLeSRoeJJpB+ekmDkzCg7J97/z2Dz/8piCgFQYEtOJ3AAGtEJcaUbahJd2XLihl+zdsSRYMtMYCE/mrpc4d3t0ArlfxVwEwjjhRXsiMeE8jSeVFZifI3LE4hIaPr5B33Mvf9t5+2H14WqNPIjh8Natn1D9hUoOgnOEZhU5PdjmeU+2A4c0a/x8FjlvAwH7r8fA71wM0RSzzaPTe+2Tn6mu/9WjYQKAlFhBUSoB6kielR89UJyb78MxdhjamluNNkgCEe2ZLzuOTKOl1H/5997Mz2w/eEi+OsivkgWsl8uDF6MLAVUxZNTBh4Bo0YfiF2PidzTV094kFn+3v7+/e+viX4WPqYIy4DoWRKHW1ADDGI3cbcnADnRJqkMY7HcBKRWUs+5BoTm5AsVolRcOcz6yOHazh36bmdm9tdU9/rLmdArdPOU3U6JE2siwnPah1n7hJmSrZW4or/L2wb5IztsYeIO3efnkA+yXmuGjFafm0/aZh0i5N3Lkh6QJUinuS6vJj2bHaGj65VN9w2KBiEEEcTr3au3aKMRECE3eu45dR2WmkjgvSQzlhh2afPJwxg6WxWHyVfHZ9lvSSLx+owujC68eHqQvuBdIFj6/w4aNb97ELXn1HGRQMcNwTgraeZAOLgY0yUhgd407XkK3S8Nd1uDR2x083VxwDGJv8+n0Ga/ly+QGecnCxwSKWkXEGN3SQlFjSp3gmQwb6h6d6xHV5zzGCKDLxzJADa7WH3ILdL4xa8DMCqQ1/mEiqvytkhFKNiZZKGZXfvw9o7yrbCQ++szoBBEvXMRiIZ9+qFwBQg8CZfrCtIJ+FWK/5sutacwxMdD+8+TZDHG6FFWc+o6Kwx56lwYhHX3+JQY1JK0u2npHXmkXe0ifyRm3JWxqLVlYy4vuciP4JcnveKkSloXMnZC/FVuICDyPjqyV9G7nbU+IucOlV0NZIxs3r41vifMpHFIwEa8vOuAeDUqM+1aFfqG/Um2cyjFBpSZSG1Vo8WCdanNeSF40kZ76WpW0Slv2AGPeCbDUZ8cmSnbICTkayyWTZ0kxGkLGkmJ/dkoz4YMkOLd6U3fDI55qWfKw8yQOPbOjC7TWnl1nFltAN9UAMfk7Y8qLNlDVD/jXcMcMZLbb4y6uxmI1hM9ThPIiato/SjNQZJjFDvofS7gwt6CMWBTuvYFNlTZD/kdoytGaA0FjepjDKSYIenNbnQ/xNhxfLeJzuUSTjc7pnGcvrdHiZjN/pnkizkfdfn+V5St+6x48bIn38X59h6MUYEOgEiZMprfMbB8Gob6BNNN3IvNVqZAJ8DsbFX0/X9BP7SOL+g/VoHEjRm9OHKqiFFDoDHlUGu0LCAwXzaMnXlCJOlG6FHCS9gF/wsebV01LotpV7q9/kJMkzOV6A7+KI7S/ZhlhOIUto2+Shz6X1eU11D8Kmt4z9lytT76q5Pke4gLQS++aqVG4rGn3dGufobhnoe9W5qjutvtRdpjtI94k86Aab5qnWWPhb+GrMfpbJd3L28MR8bn5uchZ+ByrlYwtzkzMh/KK5yekAfg1MUz8osw9+U/irHFsoQ9Ik/PXgfWJyfG4xd9SvlKGGggsphcmxhOseg98o/iD3GPwdKc5N5ucn8419uSQeS9FJdKU9ko/CfCP4tyl427c2k9ufh3+m9uXytWp1EWqpTJQmx/L5XN79cyF/9Mj47AR8CO8j+YOL+eK+fbmJfVBqH3wxNF4GSHqhyHsSKINScCs/jAIivFIo7Nyv8XsldsmnBRVbdLKOozI52QNZxlNRvJOPRPX1l3Y/e7n3unhOuBs+iBYVl90k0FMK6j1A5HnDlyqJ32/4AoF8Uq+l6HgoNZOk/RZXbNFX3OFsgcAIQuOGETJ1Kjns2FKmVd4SMnVqxJu9nRsY3AAVUZExd2+fBManBe2K+oJs0JvmOZtT8cxzX6U1Os7U0lXvPjr19MS7ZsOvCtxanLBStwrSo5OEdCowoQM+kGu8sNbcYJyEPpDVrqOv3n0kXztvfbPzxuXe36/1V0ouJbpWSMrb1XrA/qkE1Fp1EuojXbNyLuWqbYeHX1S1vHPl4ZOLIMp/UdbeFG+e7H2hvTSjJEqleuKcfKjRIwA8aaiEVGiFzcDXKbt68b6V6sX7Fh0dYDqiGQfDmHjldeXvZRJVKhctZ0q2paBdDk+NgvyY/nQO99kpSsZFkjTO3N7+4e3duzcABQ3cg/m/2g8cZpROtaAPlm23OC0L/snfBKhjoYLD9tk5AM1o9LUeHVtDEflV42HtxH4Yp5SqGh+7uI8A4gWrCqr9KPnKESdsMbVdwlZs0SS/ewOAbj+80rtwsb/j8SxsWpGvdc9X0FlTUnXPY9GySuWnpsM4zJuxFgR4sBmyohhAhJpO6gPtarkwpfexdzKSQLTWL3U2x4gqVaDfyM/7Dp6/TIGOHEU0FPVDH912xfViUhrFr+R6xXlyUfxydx8+7H73dQZoJGDzAjKkM9ahj9sDTj4DNdCAR22o6FHIHi1AojVQlBLvv8owWRWouDAUqLsThQSFjPR5UILTCB3heKNFJWPPBm6VD9rrVF3EdyqenBfrbOKOTN3hM2zX2o7yn+xd+6F78fT29+eefv5676MTNoWkoQQ0wswQq4wQOsEMsv4EqHA4bJyJmuKH5E7JY21wkqWtcLG7wu3rCXUita8j3BKVfUZPgPg5Z/XEkF7IdgECpzNom6tpJCcjIoaTJ/YgFcJ4Sp1qNLEuUWwSr6WZG71YlhOQ9FJrPw/nF5YgLoaqOyFn7eUBbnrbkkr2m4lUojEQCYhhtiEovJixCmmQZq+SYBp+zT1p82rp3AF7UFkVNWxakiI+0a/6XjWPu141D8QdNYRx6plhRjFo2DP7qWZGtPvG29ZwSvwunKJl3ryzRCctRJQxlk1WhqKNV+s7I02ZryCjX6TCCWFJVDAlLIlqEJkKBnJh1z8d/8STlAEUsPRSNEmnhj3cXrEQWeAjH0hcBAMk39dvMAIZkmb1gKZoqtmGmun27ik8Zo3J2oqsG4srCVgehVATKTLRNj0SW9kp1MAEkYNIsxFYbXOeBZDteQyvnyX6rdCN3YkBlqiTDU/cMImaI3qUlE4oE1LAnEnkQOhiAn7qAjAoEAG3H73XB58deA1DFA9eBVS58Cp49mkdCx6f1mEw/QC4jyxhJ6WlpiFwvgIgPaglGuzAGrN2ILzQi78d/rbUBNgrkWn4GX89/OpBp1i6hK1G7KVDjPZpA6P9SsOwApZYr2V5czCfDlGzPDymzuZTWp/IrmXqfpnXsM2M4GuYphF+h3BMJQqPWXKwFoG13UwJjrYQuVd6VqAcKkr+A9NKVTsossWDshMexPC14Vmt/HhQbgIaN2OLaVpEGyapHOiTUA70SSYHlFqnBZGsDJIVQEzl81a983ado1aF86Y6XZVm1ovMnhcVT57TDH/R5vaa0WeZbkaWmcow2SFZFhfcmwUWBjjfEH5X6Gd0CxZv03zNGus5GeMD1rAWzHAuZBmGZhaZSThv5t+8nnmjetLNZ0myJsO/tI6MctdPo5SrrcLb+YNWVPqdbYcWMe62w7ONw+1e+crldmi+cbrdC0G2yP5pT7dbtb6OH5elfPxPz7DGctReF9Ci/7Xnq5WAMoGXLsUeu86iHa8iL/g12vC0uQ/daf2lTBKI1VQKMyieLkzEbIJdS1ofqIWSMChB7DeltDxyYmASA51YMoklcc2l6vA0DAUYxn7MJmxQQpW9Wv229aZP8dfk8D2GydPn4qM1r+GGAk89rmEbTOMS5ZNM4MpWP8orfFAOff2BPKOFONARC/DFCkagB8iMjOn1vi7O9KX0nvSX7qFMbwy0npY/tU21xjTFxvZnGXNnJudS+K0ehH/GczOTB2fx3wNhVPUaVW8G/sw0ZyanQYz1VvYvL9UDv7Y0ntsX+PXlJXyaCpZqy34dnqLGpAe/6tyB6YkSVFfGKg9Mjx+YLhyF37ED02OHvelcZSJXmsgdnchB3ujMZALwDkyPLMBv8cB0fh5+xQPTq+noyExuciK3WsjNz8XTByeb0fxceGB531RxPOfvx3/3Nady0VQOng7OVL18ZW4iNzWWG8m7fxzL5Y8dLY/m9k/mJiZy4xO5AlQ0lUunpMYF+KUUMXl0pDg/xPQbo5kVxAU8Kj3GO2YoUqARoEDbhmWKaFb26pzfdhP0yK/yybufzqXiU4auflvk78cxZG7fxSN4t97fvq+dpgwQdgAzUND3y4Bgty8DRPut9cFAV7wMDL/C2KIXMbvO4EZ7GYUk331+yfGjdCVOo6b2aetsyRcgnbfQ/Yy/qnic7OFUiD05EYKH0clBKoa2dO6RDfrWu91X7+yeeL13+RW2MaA3D+onGSSuYTy50GsMIkDlPR8kNAoHmUVDNCPXCzKYEKMBybhiIbJ76m739g8WIjKsDXKmbRTUwFYxuKU1sBjvhNxtC2po4whVQDO2FJ4P46hpGQCH9t5ruzdO7Nw6oYfWAsSDayBRKAELjAyvAcR+ohiZZxAYOih++VUWHnmpprPSphc6115Q3cmNSlRjIgo32HLrLCY53CIL3BUyC178DJqkAH2gpA8gG46BlOApLKcfHkZEwj1rxwIcomVuALoX7gX9jQ8HoPPgJW686gYg7sJDK42sUWz5HC/Og/S8abYbl3T5yAwpSiBrHIJxj4HFvRV7YHvnPlQDOxQJtXyzWKCmPQQFHu4BJIYOuiBiD7rCJQKKBUuj2fDWPVkf0Oqy46kkl5cMuZFC0pIqlZBTIiuJjvJjoVgfMQwGSWuP3ul++uLuFp8uzcLoqz5TM248tsgsRbXK+Jpqb9+1q/198A80/tsPX/ul+GcqtdEPNPq61t8D/ScXSxr93u1LvxH6Uiuhr2r9TUiUmahIeHFnZUM5hONMRep74oFNPmyQTEBskEI6MoCJeFhwgWwMhwpkYxAqOjjGEljYZfsE7wuiL6NkBMLmE38NV+OsHJtkKE/OV/noJIZbvSBmc4yJ+4JX9ledAnkEYYwDem3pd3g9ZOcdUs5NeLrUrnrn5W+3739q1Q4zJmpGTiSO3y13XbmDMr7I+1oJeftkGhFJIkbujJpQA3VcIv6odAYTQ6Q6ygJ2g41fF87tXPm++8mPva2PDHjuA6xmVuZwSk9S9yx7S1m1YkPefZkro2pSz6EhJ9yXHBxrsu63HRlmzJiCoSZe8ORvaw4IA51rKNf2Tr+xfe/00xc/stm2rgupvapNqLypEIm7VMmzX1dKlFxX+jOxo2PPiBuT5vttxg7n930J6lyzkQMJ0rGrw8w+7KhKm+9RpczvdKXk/lx1Gn6SYD0+UFR0sXUTtv+zgOTWQfSjfPJ5bjhJyn15EarlhdG5U6Zw+I9gSWw/ON8nj6nqQRizIKDcNSiHCSRL/hJoWdFLgdTCl4KKHW7EP2+I4Al93yfsTWVkPByGJxcxwOxNNQxbH3evXLOGwQCQgRgEQuWyYHBUbEA8OBYoHBwDyi37tc4dDj6lAoulK76EpzVxxTLFOK5YmUotBy513NYSxugPTJyV3YdvPD3xQMVZiaQC9pcUCLKjL1n0gnHZMYs283Wl4ivAVZKvwFBfXKN+aMXD0jqMvjFE1cjqGVbfD3Z6tr/tvrbEdSOo2zzCcIcMU7D4waCA/FuIxsMl0wGxdLgs2C8FDhMB+4W/QZGvT9j7tTKYkb5+nUSXlVO0LPQbiFdGMrGFnV85+LYkMCAGaIY9wJL35NU2i7aZsyVQBBwMVzNmGmzDkgPV6rZKQYZMxxyzjNPimoaTCAuxuIfwNc3RLHb2rM8iHSRa+JfhMzZ/IUbARF4oe4aeG0pOq5kbBpM8XcHQERTJZu7ZS92m3f3UdFqTuGlNOqeFYE5bZE1TtCF2ZLKhB17RYYI4PWBFHlLA2JCHZRoL8vBcZT8ekmusx8PRYtvx/9jTdixfxcePC3k//j+eFUUWT+xHaMfE2+HW2fVV0tCwWKHr6GrmcZnsiejzmX1RRk26IW5NPG/VqwrNAJX66YYyUOs3MvJGdZ2ln8kaW9/wlF1aP8sXoRvrL/iZLa/+itiL+Snie+fW5dI4P/Pm0e17da/GoWbllW8PlECpacWjO/h8d8O8o08zX9kH7UhL6v5AfI5S6E+6a07dYWiedZ7crhfwXXnqTW4nVA7P8kmNIas3r6aN2H1DZcbDGgxVGfep7lzdmaYjubsGO8e0WrfRtMjC3sLx512pt1CcP3Joce7Q4myyONuKFw8kK4cWD8SQNgP//6mQO7Q43VicDpcX9y/X9zeC2qHFfT78lhangtrUcr06ASUmPfhVDy1OlOFXwTrtHySO0d8ji6OH6e+hkcMHi/OHDy7gDy/VS4MDOXd/bnwfXpA3uzEnV+U1o+VCbqSQCxvV/bn98Jueak3llidz/zqV+9fJ3J8mc7X9LTINY8zZkXylDHX9KU9X7MH/R0byh6DW0cW8fyA3Ar90MteaHOYw3PCrqLOBsFfm/WSfrmmJKYW3tzGJbi7RhUDC5sCrOoXO9KNnIIrVHNvqZMr3Wry58+B09w2QukSHiUp8756P9Wr77Z0SXtbHPibeauQkz9O5GHKh0lWzGxVXaR0zAcUA2oCnlAKPqiYxhq4k+r8n3qHGdDaDzib7pUTqPhxuk/pGX5PTTJ2KJxua9yr6jhyyEt//dPfRld1vvs2EiEcnQBDXDplI8XTZh7PhVWK3Rv5XNkw39mdseKTvus5yxDxDg+TDQAxSnQf6XUByHP4M0K8uDwXauT6ZhVhxXKfNp5rUHVBtdemElKEwIMRKLTjKJ5jgmCCVna00kIBHnc3Qb8TsiFaRW614T90869v4rq8pH83TF7u3Xtc+mr+0Qi9wrDrFaY+qFOcz7ILYlQkcg2wMPRuSMxamE4AWsExaMeQNEQRuilfDeE4Q+IdNhABaKPDMpz3fhfncu3rCHHnCKsZ56YXKb0MnYqUClPdT7MrwFL2pzEXFcaBGj4K44rLtz0WFwlTP2gTeU6NqR1vcxfO/GlW7KtRITFVu1iDhtSxzif9f2Eqg8Y/fVBsaO++d6J3/pE+89NO5oUIpIWV9j533S763OgiNZLqDdl7+9pdgYFfA3aIqgMUMWnFUCTFItqhpSNsanRvAJz32araLcBcFaPzwbJMNmkJWRBX84nr3ld+oegkMomrHwAemdh7T2MfrrmgzLgbSDwS5Yk+/KFbZtGmVxNbMY8Mf0Aq1Edl95fTTTyXygKnX3OZpKlMVcZiJTD3Yw6Yetwm0wHErHF4FXjgmBMeyzGbWyOGw7BYUv+NrpDo3angnKl2id/bFnfO3t7//vHf7gooiqOKbJlgZzQXgRRhaE2GRkQRU8bKVzXDa3v4sGH0HJju7EaSnl251X7kjBz5dYNzATg+QkZMcy8vkgC6NIJ/Ngm4HWfNbeX2EE1eAQ/Z8vBUQu+nWN0/f/hZN+ldviNGAKsIbuYCiV32+SIR7jBM7m1VJHlqU4HIKJ1mQUWNrKV8rgty9+Lp2t0oSJLV0txnfttXEGDz8Eqk8emt62HclB/7KZTVIGtG1nY9NP/38497WJ9bJaTrU3YzoTis1BLQGQvKdCqMqh1NQo6VOeeMnEvRIkCLQcuabTM0GOF33GT0+WdYYbP94tffmOevmnIpXZrZue9/GaQWklogDLCkXXHVbC38QWJ64WF6q6XM6vmdfXUtSxYWdG68pT1yrG+QGM6l+bmhnaLTmsv1h3X6mPjYY2R1joWP3DCNl9wzeRSK9AmoC3pjFir5KJ4ln1ec7XhLdIXhJgByiKitxZy0KAjLfKMD3/UDdeoVd8c1JfeUV35LKTvTrKTl08i2plCQpfFEqF1riJABRXQbdvg+IuetVg+KbXrNtlL2lFONjFKz2hAWrJWLVJIZverCm1uz291sAYPfRKbVmrR6MKnT5l7ofVHXiXLbrpJTp4KhutwdhIb2rYXQg6ToAhxTv8t3hxtqGSAfm30pYyGoMWk34NTcvVdTNSywp//IqjFiqJVIdVkFLj3xFDtBHOReJkx7j6ku7YHIPk0q1RMpRzaW0px76/2YluV8pE9oyliVg/deiiCUH/SIhyJZebNmn4a937ggJcWWRIs6+rM7WOvEqS3owosPP5O5Zxt7H1QuKoZ8RJqiY30KGsWpmqtgoH61IXAqkLO/q1XAszaeGwzPsKMOGNP3vp/xzNrmf66PyNiWdy9BPTTXt1T5n0UizvOf0sp7LEihNlX5tHV+nNU0Jhlg4PfkCORJF/QG5st/IObyMsXPukW9MnXsWUNbO4QWMwXNPLNnm+cc9bZ7yYfP4cf1l5fgfnxWpNmr7G/Z1VF4FA5dSMgVJ3QA9UjltpmgDW+c0Pg7v1tBE6KlIBVXfXaZUMb+5VTSIluWCLUog10q86ymySnEKQlhDzNSTuukKoK6kdd9bM2+Uk1b8+gYmsCnUrVOCePmqwANkYaVX2tfh8ABywVRd3sksW3OraOwL2Tjor0RumxIpoCw6jtL1WlIXphD5a6CVUsLsEmqSxJZe6Jl0LaVGwxJa4xSOD0vGTMYPZHp6R0hVQoj6siKbNiVJJJOjPS5qDHQ/6s6VDtRIqc4yDTCdoRov7TSt0k3QCBsEf7ZVE3/HjizO9lsjIW0GftNk+Vzcvwy/QNL3yd+pyX+eyi0t5A4s5OBtEn4T+NP2zCOLBfp7jO2a+DtE70dGDh2E54ML+CuO5BsHcvP53OhIvjWSX53JpXhvVvQXeA9H8sEy/PVr/43NnlVvfCH352KuUs4nM/hFYSR/bBxtmIWxkfxofjEeQavmxBDbJYezL4GMFasrZDqbLU4ZvELKZNh3TjWiCnRg1dwhlXbu4Pnu/iukLn21e+rzviukAhcmlIPn7hiPaX22oIbhFuk+KZVuFRdUps1pGQ+vFHEYFRYEHl+pSDQshQ8isXWme+8Oo6LuHXXjctQgoRzv1TZ3hrUoAx1mM9v71gfWDn9bp7bQPKv2+uk8Bt4Lbjb7t79/0PvyDX17WNlvAePnT0mL8CWyYLpiYcCnUDi2YOYTOawSFPRRFRBBy/IlmR+eXCLja7ruaGQIi4dPT5xhXBiRBm3Z4X1ibiVMq3ISl3QpPBJMg14B/UUd19UfBHTMj7+h+cDpodf0xLAN0jVdzEthKx6/SWvz6XubvUv3uq+/1fuOr9d04xQH1YXh5aqLzLMhcTWNcC4ILnT2ltKbaDo1hTGQP2pRNBNMIh5w8x+fXHYUIih4XHrY/eEE42AJEqtBtBp6HHBwNWpY6luzGeGVOjgZArqMJFXZqBXFsTvkI/qELmJSqSwo40XJIYf/KrPA3L3wBsjM2484nlnDK2FVgguZkCz4INSMEI31Szj9BDiWCgJvzWGgY/p6MgWRDwwyLJn5jQiNUPrMsccJnU2+YE2fpIYJowryieO2vOPh5JpbC1UUMr5mLZIe/ub8zoMLvYvvK5+WRucufZXt6TGZ6gLayXT2GLu8NDD+Gn5pN9bu4DJ/Xsj0sMZIdzGjZB/Yqvkx3l3mx3Iyjrdfa35Al48FfGZO7gyjw1ucZY7S2R8EgV8NUjKZ3Vsjbz+lEZ29vn3vTPfLH4eA5sAgGbDWZTcZoOrOG6uw3Hyj4Kk9AYKXCUKCvnOxV4OZyBJoy4/iirqcBmisJKMLUOz1Fa0Dqg4QlpYKYxGQ2L8C0xcjw25ShNTTm733Xuqd/Xjnwd1+qIs2QKtxBpg0jCGpNmkw+ookAiGtcht45VjC987pW+rQ7NpK2glGAoBBKinVxS6symIalEQBVyWhKkxubRKx1BeluHv6252br6n7rlVtfGGgAUmvKlPO8AqQzBFeASILkmq346AGwFljJ4kctDFEaIBy5SgIrY2ghnFyhpyjl+/QzJU9R88ZffYsPsJhHaPv3nrXOkZPJ1QMNhKo2LEw4KvKPWZAUozufEx8xwJr2egNSDEhE0TDBbeCqOnIPUbE/XxMsG4yskvxxUDtMpXha4HwoKc6dMzXAu1svdW79EhdZmR9ziNnYMgJbKuEOoPNADLjp8HIfY8EZHAELaoiXbaeYiR9FVRlcOzIm6aPtHBOveWvOW1lHqFRQ0ciUtud8KebtLEEo3fncvfW6acnv1E36LiZGdXy8ZJoIWcSDBBR24xpdwikcnI41tFe3WDwO3Zvw9fYaYMwSZUXyacLZL3o8cm2o9DDUQZp79OTjBmfSoJ56/LFp2wB8aNg4O64tscypim1hkUGro27GjhywwzdGtd9+BreMaNujQMVA51Vidqi73IiNnQSLSEDu7cvncrjgFjpHA2UbHtQYDq7dAQFvXwYBWX1wZOxZSETodeGfiwLlYhC0J4qKb7zPAu9DR+zZaKJxIhRglRw8i/f6L7yhb5wzF/1y47QWEIz4BQks9IcKUJEdsyQV0wfzdBXA8xQWYJmhWIq402WMDlXY960okhMlBiYVFMysAtjKCZM9dTHdHnADXKwBL51vyobuB8/BMbVu3pODR99lABBBU4nB/0lDWmuSsSBGyiZgC4CdIhyCORWCwMRIJcU2CiBfvj207/fYsgMs7NF4Yhit0EMqu2SfRxtZvRO2YGr8ttxK0zFuQ8Ev2l1v13nDpuT+Xa77pUfd05/pdpEqz3EkQtTdsFD/GmlY4A5WJTVqpVqylIiZbuOfHBA7x5eg+moINOW+2vdjz9j2GI2LeMxgRDl0wn2HEaXYtqWIOnaJGIhv0QJmE+f1NCFjdr35FJVkVh0YkQhi1be/atEZ+91r8oGgHwXyV4IqGtuk2VU1wJbYxwwU4Q9hg4AvYEv8Y1e2MdWNybsbDZoi8ggh4P79xtPX7rBiA23qvepnEbL1I9Gm7Q1yCG641hGXxyztcQxSzccsxVCrQla2lfRKFxFrWEVlUpVtHQprUANUV7G+nWWMVtLycrOY7bIrAVlWz8oWJrBGUsdKGhFICP+a8m/X9adzYius1npdjBTRFotzdpC5ZgSKMeMGKkpXNGmbZqgWYLbghHaFrTAtqBktQVLDNTCXz9zL2aksaLYmolfFjOcu5hhF5pNZMSROUsUmbOEkDklfsxlZBst1vxDSFk8OsOdp4klk12FntdIpLPY3ACDG9XMbdRibKOap41m2JnmZBneYrMUi5EY5pFhG5pdaKI9x9R6Toj0nCbOozZN1vTYIlETentW08FhFHAiQ/s0xRs01Qu6zh9sGtVnqt+jjDbV75WvTfV7FxBT/R4FtKl+byzZVP8ve5nqhZUfP254w/F/eZahfj2tl/0VVDxwZi/TO11V1vKVWyw/01r1N9KoRU8YJBdfKB8WgZdKSNwQg3lhCt1vVk3J1VXcXSOgHiqJrMuVGrnTKhdY9Up3pGHAX3lwCSd32V8ih9mSeYEvyY68XAsjaNO6ypRXyfbXyV6tUFgn5CBh2UeQ/opsNXiSpDLTesr+uhV5lbAShPAG5bklkyCfpSvcVUv8Iql4S/aKghHS5gVdpkdG+ToHh5AEn5qdHQnV96q77c61uo67y3SP3RfSD6blppmZdulmGMwNbj/LQF/1SsXpqcm5qcnZBH4teD4gvxnMw2wusn8ZfsHU5D4ffkul4lQNfvVScRKyJ6tQYAJ/NWCtU5PjC5OFQ4vwXoDfGP4mR4/h++jkyLFDU5MjLpQrwTs6B+N1c8lIPl7JNyuLuWOLuanJsDESLOdH8kv+9GS9Nj3FLsVuYXTkKJniDxdncwfHCyML44XR0ZH5/cOuk9twY3LEAb2kc4elHo/8ITFqQueuEpKW0OHYKkNqDIhFFW+dPbbuka23DExnhbVuJPNvvtx98Ubv6gfAgpj/dD4DeoLHtdjyDLIVecyENRLHnke7JSclIDlEdbo5AwjBUkyW7UrsgnoB03uVgu/iNXYKLtLHc9cZoGIV5cAtcYyo2I9a5D8h17pXsAeiBrnhUDAGz4jV5F3ld663UHDXPhrdC1/2PriqHTRU5SCYT2XqR0UzCPqgqFICJWo5RN0NkM69FQPjPB8jijGY1CqerGII6k1VjzHPMEEql2xV9+ObG7gH0ZKqd795uXf2sqqaZTf5gnVFYkigv0giq4xoZ0kEiiiNJBFzGdtAocBJiDiCJu5nOOToWUuqtRj4y5xklPAmH13b2LNoGLssKHSul+lmdLwrmSI9fbhz8dXullz/ix4I8kViorVBG3yVaqK1QWGTbMVrS1TANlTlQuW+gQHbUGotOwoFjt22ff8zxoEn+LrbQvf0Ekei9N24KncJxSmsO7JtV9HUYQp5HvJ4PwCKXHc8WAjkw+h3blRpcrO9Jf3pHHtT3r2382Crd+a13qVvzQUrAHWRXRQlCiPAJVCUifAW+wHZERizsDgIowak90lcGBe35opXA53WJIMJy0CuJKkiQeCXHM4Cpa3C4WM2tO9G99zl3buf7j56O1M9ecbblfvRIbtuyqea1zw+456pmp3gqWbtBF8J3ERVXAnQIqCrzeTBQOOClnrxoOj9tqry6Yfvbf/4Tl+VFEGtv2KMHCf3cw8pJjCWy1591ADpXCfqxUB6HygfE78ku4BMJvHMW8tH0ZyccHSuR3ke3dMDA8sKn/U1E89W5msio1AE52VURRsfLTUip7hDdIOcbK6VhKbe+rJ74oPu2ff3RkwcPPuxoukheUNR4iwLHa/pry30o/L4JIs8BpfT3ylc8I7L8t69pLP36iZd4Bn9VPGgSH9HwaT7mjZb1q2u2rl0Y/vRdaurhqCn+6oPt77OGoJYprcIKbu7LISsDhOMpMOA4mH4JNdcGtnqfI43kQE1530ZkwPwPUy3SgPd5zSvZRLxciN12Rr5aZ+8Dervzq2/K10RSBDC3ceRl4k+KahTNiAJEquB2BRKgDBpYgjm5k285rThZUceADSdvtFuuFw2UzJ06fyoGVzctl5Gro+E5cnFFb153Pvi4e7d73Zvf7dz6c4A8AiXEt8Oz7BTtBi5rTCayYAWGxOlojDQcB3AgM1BjgHN9IAhas86EKlx899fxXhHLE+0I3oxIgE63WmJgF6UQMCVs0J7j/32Hva+OqVEApiXaGSnuVryy3Jlri9JqYu7ZjFvWAwWbPoB+q1DexFmURFmA5LpMkMU4Sb2qnihdks1Bd3QJUE3R5fRApS8q0Yp0g+AyFOPRB3gKz9+YaQo/RGIYjRASRgpYIv9YFQZ89HzLZI7gG5ngEncKoIlhzLKSO+lMX4Ld2NUQ1x+l1asuXGFNleyQ/Pk0ooZme6Ft7SwVvbDzt24hU4W7rpPiw6DaKclH8V42a9uda43QOBx8WTGkgjVoFe7DWdmke8gW3I0HIRx9T6DEeSVPC8NgBek1qYFKl/PLX7NNiHs3C9bbdh62wicrDlUsgvlLgHJLhVdcshSYahj9mpBkHq1AEQxI8Ygo4Hi7GC16h4qSvBasuEDZVxVxEtHBQhoe85y6JJP0r26GnKMs4vOslt8WO07HPbrrz99U4lgvIkWl0hgZUWANoPjVQoFQRBMCQUnVG71Gg56jGgI3R9ODDciKyVqzmhOZ7TGRHK01pAs7WhANRoxesuopa7MaEVl1FZRtHrSr0BM9SsPU7biMGWrDFOWXqJ1EhEAtdiOnDLxJmjMgP0r8T/yJdU1QjtCkVS+q8wFWp+R2i1R3RLS2UapneUrSn7mjQFfzgcoIVqg1KjgEFl6ckBat+V0I9+Oa9l2XMu04yzPjmRFWS3FanlzQaTMBREsF7Q4OaIFSS1DDpfTRgcEtNFhYtmiLZCN9YlithC2h4gzOijbjA6VaBYzsszogBRjyy9aeNkn/LVPeJgycsOUEUm0MNLHrQtSyZzFmedYFJjOCACa6VsckszaFXWkJhF2l7gqL8sFbQZocT+coYCAp3lQy3qmu/asd+uxnwNZ7MetEJMpcnSdmJ8ilRS4wnQO2+xGs5oMjR7TpHnMosfG5jOWIfea1GtSOKqI4KgifYa45jP0TpO6QZs2U4Nx5w90xS4S5D6D9rAC2po9NFObsvfIFTv2sFxtxN4DLbZg//NeFmwhbeRqDh+Vjv/zs0Izu+XIBUHOK4U8yJKgwvGiIzcmLNENdvLGgTSiCqTb1l+VZEJEoAHZX/Igpa7frA/kPrlEFVDvmTo9sar67cyrXc0KGmj9esKe0D50kEqRG+XiGocIoWe2cGOBNCAndE/8rynBK4lzNkYMaelnT3oDA3M0TG9JAhv0udkRW6RLtMRDK1Hg+yu+u6EdvCmB7drt1F9SbvlpQK+mVh2SuWF61+Pw0RwUBZ+9hvSIDKIaMWts9DBY3Z3pV7s/VY/p3tHdYZqebbhukmqQyVZI/iwD+NEjh+aL+wpz8ncW/w77Qd5+/Av/78PfvsJUDX51yZvcV5gow68i7+Pwp4C/Y0fpfezY0SP4d7S4b6QAf0f2FfL52RykHkITeDI9haEy1mcoYkZ+dmpsJB9sFAtLfm12Gp69cCpXKVcP5Bam0SfdPXZ0ZPHw7PTUwfzSgdz+6Vx+caEwUhyFl2Gm8JpHuhy5WFfShuNiqAAvecFDD4CYo42hb+bz5KyIu0J0npWv3SUDNvMUc8YQtLVSA5V7qgkvHr4uNSWlaMmRSiIKySEZEYosUeea30K7XImvR0FK+dmPu9/d6X58qntKpJh+dGOP4uCDfNRC9wTPYImsCtTGwnDkgNn49GUfTiCUH84iVFN35TIyvZfu6CN3yAlFOxW3cExC0YJsbHgPrnQP8rc0RPUImUPCrWZvlJqPYbeAe5ZS9qBBpW6rTJcLLKm7y06+vvvw/e37H6u7yyzoIEk0TTeEFhIbXgDDhGN1SCnKGERBtVwgm0Yb0J1rbQ1199OTg/y7RbdqZ6wPOidrgbA5e4vv1ra+spVdyx6BElGF+r/fINE9e2P3y5dsg4SZEQMShp65tqhhTYY9pI6WU4r29WGRORnLSFgnYwNUrAKKcIdHcly8Zx7GvyQx8SjL48MF5JZTgyJol9vwQik1UAP1osoFCcGLy6HvtLkQaIWkAaD7pXgkbRKOdETwrc+7Z6/hBcvnv9sTOxfXOIyEW/FhqEb/Czyt8RyKqDWig6hmDE0a4eywMs72sOIJDfTmb9JMwzPVE7JkODXbfeQcK8XxGq+0Zt9sLhnSaTTNawQ5020nX++eO2V1m4UCUDwkiVZvZRGx+sfCJGNy0+Xt7rBR6esQwsbqkMCNa2wyhCndcmDG892BoQ9qspNQIqCpbxCM1OlpLO/jAqMLBFGDfSEI0qp1e6Dy5WWDkkSn2foIDUrmBsHOZ3hlulf1iOJo8pXgbEhbAKDfzsybpxjWdqAjUKRGjwgoG3vNwbVvYdNnjiSs7GnCN8eV6Nx4JepsYX1R6KQq/oKH2j7ng3yH+xRNCYaAgXbxEr7sDXO6EroBUazP8B2ktGN2Byypc/r68jzZ/v26LeEs+ZRp7+oHoMnt3r5MZ033RNahW7rSsb2RbaHnAt+MPgxPDEwCnTn2DExBVmc1CLhr6GTRRXr26isaWXVpUIsjKr4AnKQsHnH1cuqWGso5XXuLm8KgHG2KdRTUW78OYyoe48RZ7sXkzFiT6f3KJ93T72Zo+CBRYgpONAY30NFW30r4ngKKgpllQYBXmz8YWGQIXPYsBLZsWMjRdKikioEHpCmjQxuMhaqz5jz7kI9UuzmTCktX3wsc5Z0v3mWXbnR/vNz94YKOC206Unn/Kgy8uNU5m+1rcQUmeN5IBg7KUBrA7oc3JYZoWoYpE6dlpP9KNDo0ypc5tkBtS6kXG6kpSLRdSkp8UNcSVXAHhO4/VLvg51/duXVC2beyAN1VYAuJAQliGlpHioMQPTqZnAEJazU+nIH4+AoH9iSI3VffEU088QEMXaKAIAdE2dBDmzQFQE+HirF2DaGuwTMi7JqH3tZIh0MmW6Zyjt8D0kIjK8TConr63oeWEDsMzc71Q0PwU6bofrTEpt6PC1mlLTRkb4DhK6u0rDUS32gmhbTwKulSPrvgcH3HxFS8CvllK8nJ/g6E8DbmoRTtOhW0UDYDj84VaYmJXOvZkblEwbJRbuqdedj9/lYGJVNv4MN84MA7gwgh7Q5odfE+wABW1tcWWijnwjzzdUCf66HTjyOaE999qBHMYIcxvWGGRpZOBFih9069HHvoG4u0unPCQgk/kcO+jAgOEtpDJH4eESY8zoH+NoYwAIHqffVi9+oNTRhMBw0gAEIQwR/NdAVALalpgje0hWndQRSiiQxcmSAMr2+CRPYpS5Gk+09kMg3G4ITZA5lChc15zM6NNkd5to5jbn//bvfLr6zjmLYoz8ZpLcCvp/QuALFAwiZpoIaOhlgQF1oFDWng+VMMZ2Dy01E4FSyHdi74uJzqRBHAF/XgqfNyZs7IgTmZLyo0oIrJg1cIV9xmWp61AIHADFw9LVOiAoUeWZ5VeBkjV7dcp81zB3diGn0ayKN3LPUDdxJi2k9HclIPIiGfuJcQKx+ADdysSPyIo4XF8gHS25ofsD+YR0lA8CIuRf24JcLYOg8ZTJanJ85kwbLyaYEDXklJCozSTglAy6U4Pbpyr4Fyg0Q8x/q3753efrDHPlCfAWAmo+XRfkjoZtaC1vk53o3fbEZ10e+Mkq+1e6Pp3g/Zmq3U6TGjxRczunvR0py10vyPWryV3qmVzWGKXH5PrS0/qKjlB3SzBVsf0zpYVvWZUw7t+mC1Um/mLKVmLqvKaPXF0h02SE+omb5jxaHGEoAKUtRXxk7IqAVaFdhLrh4u+g8VoYdL+INivS3R26HIarIBw1HDamqXRoKNRc0YeJKQ4UrsRiUKT65kUi2OWjUaYdJj8a+gq7OyYn/Slvm0uJcVvUZJ3srIWKNKsCraApWWpbISSsESSgq2IFKw5I+pjNShJY7fm3sO8u7hjBu5RR9oC24xy1YqXrqSdO6PZPjmPptpaoZpASmomguqtoLNCQsWB9SMz2YWi5nvl1SSQLYJ/yDVH7VIryHto4re2nRcU9jBvSfrpJIj3/VtPg0toXefhufq7ae9smX/aWi23oDaCzfegfrLX4ZvQFlxC44fZ9Zz/C9/2TvCe7rub/gYCJzGiF4j9uD313FDZJ3j5vALhcxpeMuy74GPXNijmyfNfgi98aEKCvmtP5E3ut6StovWoBRfOkmPaqvFb4beGqXLswp7BGX4YAUehQg0CMDOflal8Q0LtvSb5NBtofwFP3N6SEhEFO0otBDCmOd4JILOOdCDlIH+8Zr2M0WGp5MP69iZrhw2WWdYaTuivS3ZKKrzu+p43dHSt6YrTc/pnjJdo/pFt143VrdON0fjrxFWqGrsftYe0XyLQqnPza/S39ni/IEV+MXzM0dnc1FxfqZZnJ9uwC8szu9fnt8fHC3O7/PhtwSlp/BXnJ/04FedX21hDRPF+XEXfqXifOHofGH5GKSNyW8UylTg78gi/hbm84sLxXy6tJj74xzGMNp/MBfM55bnMSo7HppoRu21sHF0PncEUqcKeGZiI5/74/7CCEdiL88dhHIl9+j+qRE8OTE2kj+0sH+qsMetnVElbSXeC+xxFWKYVl8iE3k1Fz1hyKndpQLP48FvF3djTKnIpwroexZ50cFf5bYx84VqgKF7fceko887BznawlCFIqx0tz7FIEevn+y+JzakLHKerwKTDkMtTnF/pp1C0vMLA5hV2Befd/1ttCKnHYgtTHCKxP+asHn63jV1uZRL9YHkmSITYV8jD4Gg2wrq9SYdS/uDxQku7ZKZtJ9u+utKg0L4xEwe3cL45w+2dh58Jm5tXBlbFDRU49UmwEQ71HBINbQhrOjalWqYuKEfNP1yQhdFOiQtYVQQDrCAPKiFl2SRt7nSNBIQQz1M5tK6eKvsLZVSvNZVUjr3Gs7jN5e1rrFz5dbOZ28oXSMLGn8UKkCF1LGhQya6Oq174t6rI/GiQxKK7C6HyYVCnesciIFKK4y8Zb49SvAB4WJZo7N74qWMUItmPq+ZeAOaV+otATIDehff4a2+sZWvCMv36V4YQTmrfW1//6bqkeEomDMkFgr2eZNBDPQnCgd17MRCQQ6eMAbq4EmUKNuebrgEhe1rNRe0WutxOau5KkDjDWsC3Hht9/ZDPQG4EhfaPK4BJRQ+SQJ2SonYbXBcWAEiw2kB4Ku2NITt78/KqWWQwGB62Xt3jc5dSiP7gNpsAum6RYEOMlt0HmgCFb3J5FMQBCIT1+kqoR/PQbf1Xns0CGpxAJAYIrJgFm0gYoswULQpgsDo2D0ajFsPn9kmVTTTJpWoGsVR3qAj16RV3VNbvbdO/aJW9QFazICRZllwVEwiBqQiLbll2uHGazjk5HvLD/ySW5eTLRx1hbwxfQCUaEQScxImW4lEh8GNLKmC9Dk8yIJR7zDylUdFPU+Zvqnf1QGc83gcS52WiUmdBFIShX7CZ+1Sj7Zz0kSiQdR8T3JUWdbwymlFRZjDZy9zIkBB5SMBDFOO/9Oyph4wJIBizQDt5yDK5CsAOKQrHJna+sQ6epYEgb+caBKAqyZkV0g5evbSj72zJ4bCrUt0qUGoKsiWDVEKMzgz7gJNXa5H0NSw28DQFgrKkzcjcQxBAVDnSaBHg85mQxE7kwNfLNEHbZ4tGEwElLcpGU+Gzh1NXhfds1cAATx8IV4XG1zVEkcwD0r0qrZmODPO5o1k6tZhw7BebS8kt+KyV8dNnezgoeTihqEmdNapQYm5W454K8iQ/VrFC9aicNlQ8S11i6wawtuv7nzwiSbiGfDWGGaBm2BiWcBClzRUZSTVQNVIEtDhbRagMGYYscl3KOLehtcWz19Xkl3dtRY4PrGpae3XKcckuQXN655893cFJi1jYKplMd7vuZJ4c0b2OsNXUxhH8XoZhkbsL9dA3gKhiwI8EwH//rWdzW93rl0SQse1NQ3fM/YSknTQdXt8DwCxE42xTMfVq+5hAJnuAenKQy8cgULkp0HbWyQ+yKWoNPRuyBtRKkghBoMk9/GIt1VAMvVx41qA7d7a6n5wTwMjoYVqdkM8ylX2WxzuMwuSZGQ7l4gjfxeQ5uBauRoFPqaV+U6hQ04nIUfvF5zOXuteeFFuwKUFhAdJogpLT7zWgEZwTCJdwm2BVot3Ss0I4BivapWwRJ2tdZ4bHJVo+9415AoSlQijTXoobRdsudyOMsmieUFFmETRfEFHQ5Oq+bAx16x2jYVptPwUlDWaASax4rXUY+dem6zKS3SLC5lpX/y6d/md7oW/W4NDXIcDtykuhPeMhOZ0dFnKqJBamldlo+8JMDkdTZD2sOkr5Ss/TF/LZ/SzvK2SLViqmNbClGc4q01lR7eKg71KqppudCxBJw5nwTDKQ3QwrR316SdjljoyYxSgGaP0WNqOViwsBsfCeUEH6PXLMH8XsqK7UhlmMmK6ltCNxDwqsvKoEpBHtWicFbu1OMw3n7nxhBHgxnhGcRKKoGO27KnFTksIHMt+bBLNkxHytHxnOiF2tUbh0Tqhu3hSF+Q5CVCoRDdNGfi6hjSKa8tlt6Rid6mpbySnoWLTZFZwGc2IK5NKUFmwZRQtngyrSokkQyryfJI+8rZkoIWCfoY1Kv73wotHTbR9ZMCjFuvdb3NdzXCF8NQobrAWEcwKo/clO1dI2rTN6jSXkzMhmsPZRnQeiOFszuZwFnszrGfR4gDjNr0fN+R90abnmor/Qy20iKpNUW2KoWngGZv62TkZ0qqJ6qCJXcF1/uCYT/uM7HuU0Wb2vfK1oX3vAmJq36OANrbvjSWb2/99D3O7YoXHj2vCefzf9za3+22/hSGLyB6Nz2xdTusex9ehkwJpnRLYVJuWUrmuNErL9K5ODOAhA7Y8R25dp3B1UK/Ux1dvchL5TS75rhxokLMBnMTh8hOdiRe+LtM5D04lhEN9FqXNZzToIteyn1bUkRV6EVB4aWzVfqYo++roBjZH2eLxecUnszmWcqtynIFfpJOqIYUrIjD0IvcdVD0V7ScMEWUPz0ZIBH88IdMGnOUqBEkg+zgMgw4FFXCwIi/FqEPc3y2yl0sUIhwqNU5qWOxh0J2ue9h0p+4t1Tu6O3TbdUtVy6RZpgkKY43kzzLSV44cLi4uzC8dXFyYw2f4Oyt/D8hvhstMN/jv/gj/LqCZft/68uLCVB1+/uLCZEm+m6hSufFSczFXKx9bOLyYKxwrwEvJhdyxauVwsVo5giVHDy0ujBw6iL/FPKQdzq8v7xsdya/h4Y58Eh+cza2MLOTyC7mNfC4f/fNcbn++Af9OLy8tHszN+/XWXG4SDfo1jG/kAaDJwspI7hg8jMNfSDuaP3RsMndkMndw0V/MuYt4UGRhiAEfbSV4qjNNjD7Bh0xrmJZYwcgT8U+okaWcJX27rLfMsscXuLPYAhUGpQg+q3DrFujL3VP3ldZsQW2YwNoWTK1bZmCGA2V1wGqGqTRLgmf0ryUvdANRv6q+PEcBByWR1xa6zNEThcrHoH8Sjej033a29Cl05tyrQM5A31DVEm+HNDIbSfgTlaXKl10nA4+YPqdLCvt4dO4gdEGBfT16dx8wEuLaAMI3Rh4gd70yiJjEzyqdG5hINjTkHE0Rkj2Vqou2Oc013rDohfXkUkkdWb/8xu71T3SDBR5HLiYoRQ5UXFHHQD39CIIG+TqXHVUn1vfWj73zn3Ot0oetJF1yzYTjA8eUxkGCUpCKq1W5S5PS9YTjU9TpUsVVE45v8wJee91vKRWzd/nu7pcvKRXzNwZIyowNlfUZhilTbgPksdYsxxDARzriLsn07JlHGu30p3NtNeNef2v7h7fNAKgT2lat5hI52dDQlSVRtjQnevqUt0nM3PKmUNDXKTESosj4ZFhr2IvVFZua27de0aDWsOLK081jaFPz1WKlvSS6lEIt10dXepfuDTrL2QY9fYVdnznP8pczxjxylrMsecYtRMPWfhMM/Pdp5zVYDXZDu2+9bDeUZMq05SdZ2yVB5eS+xrKsqbN0e80XEg9ZGo67GiltbmxhqGmFDrn3f9N76RXGp58i/4Z8gG/91Eyg++B35QAMzfAABKe3BypIpMRPHh17Ej4+AWp5mniNFzzOwTDxGzov81HIH/n6K5fiA1Iku2rkLIMsvCjRYjtfpBVzSBC5x+176pBgtlJjXc2gke0A+wPdBX0YqG5Q0KUXBLa+jgJYTdMAbXlL6iJs69oLLGJ6Gt/MhJbQ01J77/rp3lsDtWsia2rXU4dr35A5Q3XzbDF1c8xeiQHMELq33tWRgLk31KThbhvWXwM9pVpheJRqBfOn7Eyx9gwNCDYBztlA7FIEhLcWDRAMZwOLrqwBdS+89fTUKYEV+3jiyeFh54sKMaCvtIi82xeZ3FA5nAReKgXb7hq6sY9TyIiq9J7ye8No/DA04vemAVHA5fU+OJTmyT3oAknuQUcYXuzqS9ANINV5DEd33m/YIDybYx21vXO5e/Z9s4p+wwYRINMeBKNFR96Ic9l0jIstapCnCIed6cv3GlEZ3d4dmhOd+1XaWxap6uq57iuvZcRIOnpAsaywlgURJOVAgrohhiEuiCjZUt8kzADUdyBM6u8Ei1l1oiHs3FvmkwTkjqmONHSvfLn70tXe6bfNmSeX5VqvEkZNttIwWyMpFSc/RkMqqsNOrki1VnF+itEnBjPZoEW0kCX0JUfuBLp9r3v/Uu/9kzuf3bYM4RT53cMQhxSNP2MIR3F9Fb3I4xLty5A53Guy/YusyxqQ3O5CMLh2JJxocFMDhQdYDBgZTCKvrm8Vo+hUgYuOwTRXMNzmvbpSDDDe5scvqxGlFvhekoYuhw4K0qaPEy97ZxSqIjMafRU3hxqA1asQrp/8yLXLVsRqENGpJ5lmcSWN8Bi5nob9BfBVJuFmSiejlPdO99U7u599pKOd8bUNeOTQpSqKEqCdUz2KS0qwOCa+lMZLilcDTxyGVSrLHkHfpQ8Kvr70gTHYw+xPQY9q6UKGyS8Y33h+yeSI7qfVPsuMqPU+vXGv3tloZxLQVNWn/mnVz9a6ilrVKmr1qqh0qqKlS2k9SlZXwmeptOLBIbKsVFIx8n3qjNZkMu49ogOIz7wS55XDvH5nd/kBJUMrGCpEWEbutKRNLV4a2XbKFt+15K5IpaooI7MaKdWuwhZFjRD6a4dfXRfFMt+AmDXaL2CN9olVowMC1aglS2kxSmLXyxQa+kdJMVp0ka0nADXDHlgJPWRSXHrSIoOWFGQvL2p1NqloJarLo0nENPpcc2bNlLUZHFYZh2Srl9UFgl66EvE9zPWyqxIVL9Rs0OKBCxb7W9Ccb8EwvVnD8TS30xupij/YPGSQbxQz7EKziQwJRw5RBkkOOaPaAKCsFr8okj0m9FoI6iA1LVqEtGhoaFHI54JNOzXdHHI/MA+A8we+1CjFL/uvBx5axNwOPDzbXA68V766G3hovrkaeC8E2Xb/b3vY7vmzxvHj6qvk+L/95RnBmmqRS5GPfHUbQIRBrEEnJfP0Rlr1l6C98qzt53RBLTRlyXzK72RiZps/es63KRySq4I5cZIUSTfSUlqiQyb4CDlyny2aw2Gew5+WWMYlBUgHB82nuPcwUHitQdO8AyocHqjs1vnG29RK8MTWDEh6a3xPgXrTV+ninzBdRjN6tGG9xyp4lcugYEG6iXkH3FO+LQAjZXkV/L4UcRBbTkujtldjEzwUAKB8UkDeZL8oQqwjKg9AtfVfrOY8NjISusOtjpWONP1lekZ3gmqxaZtphUZWYaYx+FmG+eL83Ozv+VvAXxF/8/ibwwhK6gf/78vnRvJTE7lj4zlJOVTM2WUK+BvLj8BvFN4Lw4zqoZ/GEsHRQYcdVOn5AF7DARq6CrI93p0Df6YlFS9Xo7JY1A1oa79EmgoGHSNVhdzQ4J8NMejICbSdO5d37nzQe+mV7fuv6csF0hpG9GykTue6eI9g2NoSSnQA53k+INRK6OZU9IYs8NXo6OqbPN+aykDDWOUtENzbGlj3yofb38smN4hugfj1kddlIDZhncx330h4wCVdmL0rObmJIbu4WOzwh8SAr+OBOL5NNARxF/nKey92Pz739B1orFwIqeBoaxrxJJWqLGMkQyjg2oy2kLGdDQK27WcaOJvOlEsJGtWxThxkjviHSRRKMpFztXYh8bDwQVRuL5d9Ylkc2R6Vo8y4YnD7j962xlWi24q0bd24hmus83nNsa9m27OwltYbwO2CkujjBgcluWsMWGpnMXbVjWvY0zxv+RUlGKhpRCdQ0FMq0I7TJQypnaJDq3hKfM3R79sq8sXjkxxq/9S57e8/6Z59tP3Dx/oE52ZiY27pJavieELwhjRuD4imaQzOalrCJ3MxhoAnJxmS0NN+HyFQvUDFBi9JKgml+osg+wkMMgw5iAB1tsqin1oz1cbR+xtyb1rJ4QvJdr+9s/39Odx4+eET66gwegKve+Q8gb4o5DEs7wy+P1+/KhAwh9v6fjCG8vTz19UtYREwcpg75BXV8r0qX3wSuJi8WbPdoqqBK4GJVU6EmyYcERMfKg595tUkyhI5Mj5+E285fHzSb9G/5Dfyznc7P9zvfrzZfeW0llHDKMHjtujJXpdLwOPODaSqLsVta6VulU9cg+BX7lyXZIPCmhvgzQj0Rb0PPt7cVpNgqgy9d+2H3onPZOT1kpBbwFMJWwVYhep2vEwpIiBSCo+ERjDIZi1JdNLOvZrTuc/3ZDTJ5HK1d/mVp+983Dv/Nx5g4BIreIzftRotwarRiAXA6XSyLkYxiqJAdU8aoPGCv5jpg/vFilhaGGr3nRu9q/clgnqMgRzcJT+OI4mhDUnPB86GV9NpVAr3VPyal0mjm2HKKo0snLCC9eWv6NWDUC+90/3uVm/ro5376vyTi1+n2IAaHTqCxZ3QlY4N4kiJwxwRxA0JFIA50M90XL0mQamieA2d5dccIqFAwhYySMDyxF1njcD2/Ve7p7jZXuLHZbr+1Ij5nJS1ceAJlVi8xnVJSVQGjkT2OkENfvzmmlhXrnFw26v3u+e+QgvL62+pm+bUFdoIb7Tvym2VZhUjYKMGqnXBtgaZufKPQNoX/+mpmkQY0I5P9fsx+rFhkPEN3B9eyNpzcO2KdzMFVKlGsOIic8aDOPC9Zd7UB2ZBvpUfvtS98iV08O43X/YB5rMeCqanD/6VxFquC5LTMJ9XFsgRBq+ROW4BlmBNHOGHAb/yCaxl2XnAk+wg6ZQkQonIIEHZpbREbhIFPVeOBVnlYX01+AiS+UDX4ZNCz+sK13L05DzJXB+eg4WFa/nMTX2hYNLZSjEWtiOnsPmeYxCJAxVeTI5k813VkV/xqef5dPYIuyfAUwlvdsfvprMIEA97cqmt4e/eOLF7e0uuN/VWgb1hlCRQq/EWC21flitpS8CoKCdrYta5rWbm45b9sW1cDkrusus1E74GGG+6IiMztIMdPoDj/HRO7t34+OWn7z7cefdlmCPI227fHbR9Jy7tALboQFJFXblhYxg3eRcJd0mRDddHB23hPpfB7UAMTeBEoanNxj5ci/DmI/ii7gDVLGSagDsATudGTWPeu3qme/FlfSVuJUwbA3fiVkLac+i/FHegbKJmfCWIo8PaQooBh/BuF5H5UCCBHrv8+vb3b/UtqagSWgTJyEJJn5HWXoSmvErDiPi2hRbgM/n6uqnBA/XauTYwVGPZkRnLDkLfPBFn3jvMGO6oHsaVzMIX/k9bEIMzgsJC/Jb7ISyJDeyIGGMVY6JMVsPs0g0/ZT7grqYsBbEwVKFlq1UlrSAxzzMKhWceoyX9OKBwaB1jQN43Yj550wPHDOiGgj2keC28G1F6gSaspx6VfDxUUtYCsi2IQm+miRI0Qd2pqlctBst7W17VuwiiWvpUcqeSHbVk1ydPjmWEOC26MU4iL5W9Ol+NGyVume8pYMFoPCMQaUFIiUAFJfgURLKx/2qBQgsSWoQYFblB8+fMg+LPmivrTRbxfldPrnlQT4bXaQ5n4rYgq5q1OJQcOTUZVrrhGJpRaCd6s1izKzmzjtt2jiaPmiraG0e2WjZnJAqjis1ZlEYTmH8AnQwZEQIyYJIV0LjwKW4gzKR+k+zQIsYkOzzbmGT3ylcm2aH5xiS7F4Jskv3zXiZZIeIUP5+/qxz/8zP8qctob4wl9jw6/sozRmPf8CsR3ROKMTDkkdLRnJeqOOrWC6h27oYKvZ7o58itozwrNalH9BumNxVkQ57TqO0jlFJIVsy0pB9Df538l0O3lpYoerzCwXpJ6xgxSMd4l0dKFcMrp5sX119xfXaArlL9OiFy0fG4iT8dM16/eWvUjUumUvVMlei4IWib1S/Y31bYfugwO4a/24YnSOHupMxUzNRqiGQY7E6XXs52Me0mS7+Z3lH9YdpvNV43zW6Udjc3Qf8Jp59jpXWPLBYLizmv/MfxHD4fXJiflb8HFuZnIvg1F+anG/ALF+b3L8MvkPx98ndq0qu0x3NpFeuYqJbx2avAM+SNL0GZhfnCUfgdW3Kp/NjC/OjBQ5WJXGkid3Qit+QeKR46ODIPfxcPHcwvTE6UxtFqOzqST+C3MpJvRvmwUUM36WB5JO+vFNBh+sBsbk5Kzk3qL0oj+WNH4e/h8YlcYSJ3ZDx3eDy3fzI3MZHjFPt5iMW34YM2C7oLKuR0EgpmDB6Rr1blZlXmbajvYByOLbIGR4lT8UDinqK9KvTERB3neuw8+RtHC976uPvpizsvf9t7/6rWoilIQ4TWROJ76SrdpwasBVKUaRddIqkcCM1UNJFjf2W0DqF1S4y8EqLLAvn2bRue78ZYAdZZDiMOp8ev/xN0qJKL4hroraP/5xFtvcWuhxFR1qJJoiZO+PgKBo+mwHUVOlBzunfifPf+5e5pZm6gARMMmNTOrAYCrSBDgOOVX8AXMgf8TzSPC8zOZjpPIBPf0VBVDEFskgUTWmQBZMeVFsb2kHbxjnyZon2Y1km5MhdULWwHnJJtIHNusXxwE3dufrCz+a1qogVUNdSGOry5NgY4ZawmKzTsFmeQwFE0GACxbpBTFAUo5ovqUNOmI2VuzJd0un4yUCqKWhS2WGnCLQ5KikfKSBr4vHv1RvfW+5lmSmmpe1VPSZyMVj61Ap5jx8xDu3IcNVN5A3cuuD9ib1Q503DUBF+lRaGXWsV8iq0SRTUAZBUiT6EbaBPcqoijzfVboKLasyP2ZHFZEMoDLdFAqC26lG6OBQXHw0DRrZG+0I1Rg2EaIiWkGWpY+OyvgBBnp1vvA4TfaiTsynEkTOUNYLZeSKbiJdT5UXOPOh8dIDkepkuKmljTcZ+nKOC0b1xyyXWW9fID5PrkYiRTbxWU8NbzIZ0RJ93bx+s6YEmVMLg7h0s/0/v6eu/qF71r94aAH8tAnctALBhALYJKpnCrblBErIoDbxVkabpN1KUT49BBCapnvjrz344oTCbH/Yb0BA1ki5zZ2eIYmp7OVV+ten6Ad/LgWQtOpZtJa2QLx7A2NbKYqIiqTEIeXd+58n3v8oeA4s6VuyoAo4VTYk1PwUVt6llpRPTb8vx8ZnQNMJyaBgbGB61KM+CfSgg8v8naNnpbeFWmkXjulIMYuJ2tGK9rtr6AD8jA0AZhGBWjJvpLgqjPVg+8d5MYzk9kvNz+4V3gN92vXjFNtAFbDRWgmwPz+FlgB9gcQ2Uup6BajR5YM/Cv+NhJS6MgUxKXDl5gN6SBNXUinJoI9FivTiL1aMgoy0Wviv7HnRur7vOJOK4yt0BVSOzVJQpYnUZOEsZpy+lrmoLHjVPwLN5j5oxhPHrOKE5TsNhcZtJcw9jQ13whCb2TX8L/2rpwnZ3To0BFWRVvdTmpL3G4aUOBOrOtUugmglm+Sa2qloUNq3vhHC4GA66hQsSR2CRXAOj3MJOLUoF6xgtsaAuqyf+iOeLTk92TF+D//3pkJMy4DE2Mxsi+ccGtvyZSNDMqGWBIRw0wqBQ0UadzZ4GlewDLVyMldLefZEfq/pTULQMUyaRT9uHjm9CcJxeX6B+iZ/e7V65tP3gF/lfhB7yma1OK1OsjFC66icqQezE6udvrxaockLdqRgsdNtchENqTkY5HQBsojjKelNANoPvecM9bWsBO3Y6Iauyv/tId7KELyumNNNR+ABjpjauvoeSpK2+7iaqabM+Zmndv37VqZkFdr4qCkdXVwiAL0JYpJEnQU7wuCpa0nr29geV1XB0SpB2vqu1fgH4aOEMWYWDkRLMQG3RvRGYxPj7Z6oO6/f+oe7Puto1sUfiv8Onk+3jb59zTnT6n+ymLouZ59PTiBZIgCQkEKAySqSc7iRM7g+20M9vp2InTtpI4cYZOPMTxA9PL/+MuUZL/xd1TDeCg2BnWvXctQQQKVbt2FYA91a69779tdcnjE9p8o0svMKoHcP3EAzm2jnCdulq2RPs3Wszoi+fItLtXv99/+B7OoMSnxUGZkVjoa5S7UVUxbglRAtM/5IdRbopZzaaPTlPMKDS8OcqoMZYO43M21VnSfas6ojAX07JiJeBlTdHDtOZgqQ1Uu6DEjbh9k8MGhCUHiJqTgy9RAUOZA+hRtaBNeiKTWwJ5H1Zz2GQQ0XxFid1G4jYScUYa7hKEu0RgpWFa8qgljBqV1VJWjXu/Wx3JwLClTiMVCubUqhKko5riqCKK2dCnFg7Tvs4Kf1o66xLHslJW5kqLWRkhp1uK6pFtskLNz4gVS+plY2GiW35x5D1mU3kKMJIEZcogbN9Qc91bseWrt5kW1jIcvR87H7F5+UiGixsWPsLhpAzjNmyUqm+BcFq1MhenGCGyzksbCsUAbaZVh1cKgU0kUsJoZlicxd804VacZ8niOUuK4ZDXuc3DuriXovxE8iWhD19lWIeh7r9gerIU3BBS5puKcI4IzTTy0F0lPmcJmrJB0x5wYIJJMIGut6Bd1zGUd7cdemA1Y4seXMXYow+qo2zSA+sYu/RBSLNt+s+DbNOmqXfihLR0T/z5oGgfgdPw3E2ah9BB8y+G4whbVBDAjTRGb1fK7QnQKY0oXTi+43snyRMAeD1aYPkiRM/fsL6F1ltOHppSHlI+D6CWs+Y5cI+CS5xEm6e+RIdgjIXtbCprNKKkLglXqCjGWLJS60ugCi0K18sBO1zfXKTr8AtN2XnfqfMpNoBydBxif9q0JOcehtvwJGyJDCZlf9o4dMRN1xomx83wMakrUH+atmqY1vicgMEgrSZ8JWOl/JYejZ5HZBVQnBC3jvE1XFoGkzOTx5WyAHPeVZ59lfJWT7CaSjVPZlp4GtSYaYBqjYEBicOxIKOweBKz9PLS4gL8pSt5PLMP+Dt29Mjhle5y+4DbE1gH/g6PEwS8Onpk5bCUPjuZX1xojo3kj8PF8aN0rwT3nGMIfhmPJTwWh8byhbG8P5RfG8rb5xNDhb8OZ0paS/mpubH8LBRN8y/UOTmJpur/nMwPgvO055MThblhjAR+fCG/MZ8fneyb+BXXZGPcVEQJ6JKYVrdBB5ZCDOBLYg+8CL31KkABVCFnE6WtOY/OU+6rTRDNSA168cLu/WugrDz+6GUJoIkOlDYgl3ZmQZnqr08Vlk2okPsKaaFYQhqQNUn6e+vs7lkMBaL6C8uoMjbSXOptpKh5pqCzBHCJjJpN9eWQSsJK+xavrSYJevXkKpHj8j7obRxOGiuXkfYPPsXDur97DiOT7r31SbaryC2Rd5V0hTuV6Vr1pO7rniR4V9S+iX7XEqpTutm599rOnVN7H36iu0HPyViWUX3fa2LuMl4T1zcqmBQ+ccpLJJf7OTowz8tntLf21XPwt3fzFPwpkI6KNwdyASaUKcoieyzBmh2KP/cv3LRE/wy0vbcv4J+BRg8OGF7DQ8tdylvKVAkK05y2SRe1uqq0OPxuyI6s5KXg4SOgLa2sx5O7wr29NyWkZANd2dvbSYHXpz8ll4049ctiJNigod0jJ+QtDWfn3vn9l79RQEg4yum0fhJh7yTLSKzCoT8XLk5LZMn+LVpkFuD0f1JEKXa8n06voc2bxlGlBE4vdH441bn+dufsS9k8hKT3YDyPKPSdw0q0sXpvchzfetFORCit4IS1FeAfGJktiwpighl6tjKo7L5wZe/C6xYq1tDQXIZ5a0KgHCd7p8TL3jyooZqZ7nJy1eWou4RUe5t8ss58ixGOr7+9e/UHeUlDjK2DEcClIYrsmMlHvVO9Nfy0yhmt5JqeREjWCLsreBK3L9hdGcqo32BNFnVvhizyG2woorzBmiDCjFf1UgdRRJjozuun1SpfzYtKoe6qmQIlcdxSziuzzIye5+j5DlJWmWrATwM72cgBh82tBY6EolA2Zru//dsf7b74odUffnnAUjltoNCsFf4AsRizF3k5Il0r8p2ayqGUIjNXpYlXylHeQLTD0IA9HY9i99QHMN69500QlIoTB/BArH7b2yDCoFqq+zSVVH+Y4xKDwRC9LLBRzM92tfftl1Y/mUHa3M0epGI49hituvYgNY+7u85cABOykYvTx9Dl/uUv9FKPeoq8zNP+Nkn9eXVps09a40kSji+BftK4zCNQ0YfykwcKavaBGYr6qwYiT4vGghl2E/20cBXmtXu/bjwSE6qkQT9+8z1cgRG48KFGICHDl+s5DVkgxXiNKTp1YpCQaf6apRJ6w/vyOUeoQuSSmNzh4Buuc0j0z0ms7HzxTef8ud0rPXzI7kcV6Y7setgVxfE1ZdKXzY6kO2ZEqruY32k1X/g2K1IR05vMVGIT6KOiD3eBkeJz1058b93u3H5j9++nu/FnggrkVhE+jRwSYeB4cqOnSaVfI1DGdWkPl2VMNI9VyOCK2a2IGSrwE5CJxuzFsAnlnLhJ7yEFNb1aQiKbEKd9affjv3Wuf2ovUIcbHkapIiyqfOrmmuzZiPfoWq1UD7MUKLXCkCOB3qxSpmXVDRC5/Ycvq24UxuabYbxr+rHgtVuT58LYO+rZ6FcLt+frV6vz49nfS8SRfnjiVT/MTlUXivOqDvguwxbmynAtjoqZI3FTCnAEw1Tv3Hn8wd9/L+aT7VHYj91jkFbJwxl6bOQkzHAlCKkQh5YAW5YIw7pyC6pm4g9Xck0X/smAOX86TiFQnYroBfhBff8VTGXn3j/2br6qohrXaImH96QQIB+vOe9cBW9jggS6Lx0lTn1Tomto2HbKSgZ/UMpKi07apFppN0KSWYNRigt/v5Hn1rxpSwSstbentX0rkpstP6nXPJ8MoaI2WNrCk4n2lkBvKQbyVqg3Tt41mXSRo7UYjiuDGcmuRzwMe2TCruuMgGzk0d8MtAh8GVHvgBFacpQtsRnhxcgsWlaxpJSsgJKVTn7+fVAihiUGWDo6BshXLgm9bTVLF44LNJdGiUyPN2sCqyOaxNxNOJriZaHmDxZzsQvVmfAtYRJE2YfZ4WjZ8jOiT5lQVZRaaPTPzD5TXqGFB9btInOG3Ah9sShKVxDzDL1QlKLbvsu1c/+G/BYH3mXX7b2t7bl9bmk7bt97Yr/tvafttn2RYXvtswPstUzJTpygFu6JZw+w0+J+u8CphWlEUl6kz9OtwGuIZZJvmQs8SyvkzirlqfJf9U6mYYPL9bkqb1nlfF5NS2iJRcdhydQX6UJVwalI2AF1U/qFM7K0Wnc8DdXNtLCDOpOplGyX5LVby1xXvYpbY8Om4zWwQC7TEG54bsOqxlee761jGASJw5y2AtRd5JpDOGAfGh9z4aK9NEzV5Kpz9NItSXvoVZ+bB9P1GNjCyzPdO7VmFs2kqTMVFYJGKAPV49Jj0AhrFAWnJ7HYolF2anJiHn8nJ+bW4XwW/uKJmTCYmGk2JqbxCAO87055NazmTq7h74Q7seaNQ4M1rzaO9/HAH4E5Aj8l5xiaZ4/icQTKipMTQ0twLE9OFBbgWKSIy1tT+Xi2EK3PFZrhdNB4dma8OjkxXp3CYxJa/RlqjRbGRoqF46NFDAAxOrIynF8ezheWl46O5ocWF4b7hYGwNmIivzrctXMLM0DFrD1lqzpcMwUNKOcDU99wMzG1AspH9DU9a4mpdffr/VcluK6D8WLRN8N0Gcju6myPqtCRDkFACd2m1SHGXMh0tnPvXqanshegRxbFTQ28GUZ63QvqiUv7DE2xqQoiuK7rcY1GroxtRmSvUNC+1cgZVQjZyTsXdkENImWoa5Bl9s6KUW4H0Sx1u8ZWptsytE13VA0rAx/GZQHH0aB6SMuXIAwhi6S9mIR7C6MWTluMEgH96/W0khN/YwB0/f3O9RtdiOJOXAOX8MXgG5kOUIiryWbRbGcyAOnTjAA7NgO4/r5OEURhRMQhQAcbMT4CKtCI9mHlmBSmAi1y/nTJo5xGDeri1Z17l3c/vNg1Lt2Hfsky3egHoXqSkZg6NJhsT/cyPclgGinvAj9gNIGqwqNR+8PtobTMUHTMSjUU08PPjEX1I2ORfjIDaZmBaBkP7bSYIWcdkzc1Usu7iW24IKslCC5Ic9llc2rY/kpa4tKELIbjDd93GjFF82ZHOlKC75bEqslLIbxQDhLr4xdudm6jRUetmP/iL6nKAi2RiEyXQidUX5lPCsNqwNBwU68kTUUKQCkmeW+ni2EN+Z75APyuVvAVNCieBoW+LRfsUcNHqINcCg7Xb3Rev/p7f402ApkZEEIgD5Ei8oxbjxw3Kuda7Fao3pBUgpXyZQ6YgIpWqnvBVSEVVJr62blz6vd5oe0u7YGpAECCNEcZ0i9yIp5I1j06j73sOMTvgkHuP3zvdxyAjbwOQa0CcFvc0gQEwpxI7obsbaZ4Rbqu0101VWw7E3MbtK6/0dKdibm9d+N1tak8bKJLfEUCCIPqgF2KCpe5Vwm8tZwvMTDYS6+Whb179XuAasGOnFrqqz3wiRdG5OWWrvP2+cxdt4xxmNGAw4svGN2XQjBDJwL97budK7d37nyqMUdXpdjR8PlKg+9/W/WAe3obEkXY9PH4g4+gG6sPExBA7/q3tvXD81A7+NN/vc7Iej9dRv7x+IUHAGb3ywu/5UQIbD0TCjzFt6hgpA16VPD0SngperiXuYkbh+UxoiHx0cV1OGhvLMnRe5+9uv/P73ceXOqcuSleh/wdhOpF8PVngHG8uA9ffQS+21uNO8MOWhRBK9Nf5413kUOZ/sLI4yUFil7AyQtQ/cN8wEBx2QhP90xfGM4AA9mGvBVJxTKQNxQjmZLtCQMa4Ky9xXEFHOmJBjgvwX64K0adPO4Tidfl6CI9eu6O5SC7JxyQ6UZPnDVdGvNqKNPjVpTDAOkue++/iCse55QRXyDwFGg4ujwIzXsN2NiQUCozkDBslnlPgjBWbwmdKnCRo98Q8jIr6ce1++6XyE/OKOLlu7pVrHDyrcIG+rTqQfJHYoGDr0SB62ehtDQWW2lQVM5SEiz9wFIOjEpg6wGW9N8ypVlZv1sQn7HkhBkjF2gYkvHOkoZtUThUvMJiG6GSRU1ZVv40wqeWKO3mmtkwl8mKfH3lvfkuIW++W6ybt6W5pR4xzhbefoGO0iWc9JdMVmypZMUSR1YUboUuCcQWPjQoPVQ1RhnavNVYN5RnhLzOVpGbLbjWrFffZqZLzNDmtxYbtBigoumK0su18AzDdyyO8/NNhAtY9D9sphgSTxOaJmYbtOgE3zdUR+6jBYg3Ehh63EOJJxQFJmNrJO5JhtbadM8iepoTscWVyR4TAYs42ZSpkg5qkaUYXeRC+bqiGN4ooMcoavRoFlrocXTtX8d4uQ64b1xcB1ZQ/q39Kxjn1oFYsqX0T4M8W6mdc+KEbrZ+4k8HmEsxiVvo1NnWF5mcblueUw6cNRUcYYszuoWO58NZLeCkc05dCiTSgE/WN+WEycZJVSqekRiRljw0w5pcssTkYRBYqMt50rhAPG2divbjRONjncsYY3SB1WjKtRhHERF0FE1bmQIDa0uiHJhzfctVI1HGRFWiqyAoXSgxE6hE10g3KRDDSXVq22UperANa50jOqyKWdVrpptkW1UX4lxLqJzEzIIGV7oUb97M4zPPK/N4zIPQM68n2kxqZs70DFkzYUasBmhGorDW6D1hiruFeTnmFubGlvLrcDYLfzH8zsgxLccUHugdiwecT8gxjtfVowtj6p59VCsLw+r8MB4reCzjsVStHC1spPXx/LOL+biwlP/TYp5MrM0QCiaH0Q3VmcrPD+dXixShAWPr1uYL+blCfriAMRmqcFRU1N3C0eL/wMi8w2Nwu1goLmFM3oU+RlcnSpOTbiLpil25UrmK9V3cY23dlzTFKvMMSSO04+b2/rc3O588UIGQKGUJNiFiX05DjOqmrzccygWirwV4UmVt9NH5NMpZyW32H3zJHYi0T0mBGxSckdawfIrWhEUuRmesgLJC9g9dE9gKSNIzdhHFZ3RyayEnn/6cvDiuYQifq/hRQ2e7H1zcu/JqtssGTY7pjydL35aszvo6k9RZdSFJnakD5UqwBV9LkuZ8k++4vR1LmXTG4ez71Ky4ceYaPXx9Hgx6SHDmnvdwNG/e/M1GYzqRnG7Ug45SyspKXPFCiqTowmhYllt1Yo5eGnIBLr9LmEo4OSKKu+cr544aOihQfKmXLzx++fW9G7IrZwOedKhSxdfa234OO5tn/l/z/C74+DPNuupn67lMF/R+3WfwVgrhiIMlS6RTOy0BBR0FWT8F+jKt8klQkiMor6SJJ+X1BPgR9uLp1AWyZHqN0kbLsunjtx7u/vNV7bnA8cFyGPDDwmNO+ahRtDDcTagw8I0NTprCPcFC7tVraYjxVDAGCKCERWn761rOYEMLyx8yMpJbLnAaDhpWAjV0H+h5ogM0SnqGzNjD9lfQaJlz9sWZgQftu2W0rpZl7ilnwZ3O7Xsw7zLpGCoVJpw6XjYdKoIUcjDVcncv+GR1PgTdjeREoC4yA/IdWuVXwH2Joerg/joTO4Qhc9QQNg+judT2XEGv1xvKc4W/YdBOKo49gPa2RzEZm06O+pOF/bRM9bLDwBgIiZdqMzz0k9M94+t/6vnOxbPcrRVsDrQNJ+dgVNw5CWwMJU3nmQwZlPjHVNVXhBBj00WOS8hlSCGmQ68pJ2emhTee71x/W9FCu2NmHapXwzysDoWIWN3ZZMR0JlSRulLuTiBsRBgrSHJZo2khgqcgmeflvr7bdGDeMIv5orIu1jkC/EmSzMmT5JXvOg8+6lx5SWKzoW2cXwCXz/X7QJfmfSDY8kJkQVsvBUO3XgoPFCTZyA9fSY51O5XQC79h3ivobCpzr0dQZXcxzsiti7ytWAcBkjCJfqmBmSojTCKX80LlhuVu8K7f9jdUaw2IXAyP1cc9zIK97sJ+m6kbC/EBmiZmBW9vq6CWB6ub5GcsOmdW9fzqPmif3dZdeQoRriTIM7DKCbYagAXYnnwCa3+R1FzM7Yg+x7XpLpWZ54dpw1aP4O+vMmj1FGx0EUAvtlRsXhYF155wAmpPuLMRBpwBQUV2TR0MphCo0LPOhptSjdBahtx0OWLLZk4CKbAb2rntnXuv7r59O7suaB6mrAsay4EsC6pHycDNs9QdZB8kdWNbEqgjWotwyIpr4lRTIDkuVhGpY5kdjuNvzw6H8rdmRwDDC2/AJglpc4Q5fks6XQA80CQLWpJrys5VBn7/O72I4qlVFCRkSeSSEmxMwzHt95Z4taqMo5TJXCGndUs5dZf36jZzOGvK8IrP/NJpmjG0u7LBPfSdDTZ7J+5qKeRIm6pMF/XWwkCmTgrFdk/Gwdp0BhLN/rf//IXPBt0aMRdshu/tf/Jw586V3kfzi+CqBKQEk6yB/QysoolI5ik5NYWmzFIYLG0BAxKT+GpLuir6sL5hTm0x3ZLRnxZMRj62hGMQS5tKMiZvUrpkKbVb+NVSb7dYym8KSX9IHEXY0yJnRtDUQqYtBmkJiDD9ShWBIGLLalpIe+KmtsTSV1axxYWMoJARETJSiBZADM9W/FoxasWhu5mz5sm/FAvFLDWP1BxAyLwQfmFRWe6kmdLgRnJlmITmDebjUl+VEDv1NVlkWdPiJ2mUTZ1iJU1R1EX9moKynChao+nLk/SnP3f9pfcxjFLmnoPC0PapYEyi/W4ae2j/u8oY2ueusYT2R4vNoH8cZAalgWdCz/5xsBXUJRtomb0k1+XUSTA6PjszypmT1r3VkDJf8dxWvLSmr50kbaH1jFLXbZlzn4mKF/CvE2A2Eq4kZ2lYt/qvBWR+k1O2vgXmzCtxQFbxdmx5yp1VItymMBYJ2ion4Sa0jmRIdEKhZaueW5KWdOLWACOHodOP4CSD1+PUI1PEUt40ZTRkPEtsrmXTooSijagR9VB6IpNgWPnzeP7Z8XyzUi4tHR7LL4/lF8fyM8GRBW9xfm1x3h9byC/OT8HF1OqfxvN/HM//j7H8X8fyk3Xn+NTE5GLepf/V+kK+upBvhlPjYWksLDtjtdLx+cV8zTlmoE6NzM3lj4w0ji5MTw2vmPLpqeLSsqm16s1PDTWOwO8iVCwM2sG+MDd1rJifXvWSkd9sV/zTnvczN7IhBR45BkPkIBobTHwdCbZQdqr8cmJOT85G+MGp3SsfaNtIVMXErU3eELSBWq4AQdOIj1q1gpaApljFfeibYcIL+966hto597qCGvqH2p9ucb+U4pa4Z+hjuva6RGly14ijY5Qm3B7kc4SmnfvXu3xwcpHLkMRLypc02BkPKdDUFGzlgsPgSVLU8EFKFPicKzzMsTUqCjHBMFvLffJuQNkzVte+C5LavZopCBFn3MvBbzWnbP18Fc13tJ/7Kidv3f/i2t6ZG7uv6eTUNVAtYUTdncKgau2bEQ1OdRw7Ptf2Td+SpCytkf6eQYGzlv/0WVrLIvHF+/s3XrSQoJBgUYlERgygRRIwZa+g+hQGTG7jQ0J/EkfF0rrXYsOCPKl75ztnvhHpi3zEuBmF/cpCDUkpl/sxBWITuBzuywIM6oMFWF5LjLJHMnuT/Sbg2eqkVuxd4XFarZ17L+3cYbmq/Wk53FDvtQezJUBAnZRC3C3GAB5dDDSEB1c1hGs+P572VXVyC8NruZWYrtApLoFnSdyyfTWgVBNkU33+453757WposJ2imcYAtoubAgawE0WrwgCzoJAiDG4oUJZZXDJMZfFW+bjxM8SWGeJ7ZB1811ePH/A186g1JcuYHha+PPGYHmb/Hl3fjz1K8Co7DkA5+Ib9jPqJmH4tIQC4dOS4eHj0pQHn5iGCM8sC1ECv4eJnLXvqTMEEjh1BeLRxRK33/3yTfN5cOvUlzOfIzPKFyGt8YOQ1vffVq0jJ045PCOtJpB/F5W49J+WDVAF4E1qN3cePPx5WkdxOT0mpU9I7qQHcq56qMyoDeb97W1fhHAq80nTAc2D1hTbX6dbtARBGWdPv9+5wNmFwkOuNHf9Q2jMEwi+04CPxJeZESA4MwoGzI2CgbmPT3r02nshnAPJoDSTmCa7vc3h/3MJ8YlHfyO9+yolXDz7xv4X2woLAYBYqPaAhLQnekUAhKcQAEBBA0gitxSi7AizF5NbCNqCypQtMUranxKpilyvlFqVMHTJBrTC2I8lkxLkdBVJBhbsnb/dufDG/kefZR6mSNjKs5c/Fe0xKtu0+Nm1SurJCUR4cgock1ag+E0hrTEFhVNE1WnQ50A0FV4BUn5qHETx0fkSO2Zg+MRXXlFTKKBgCg0kfI7fJOSfqKDQ+00QOl+8QM37GhF+RvrQ36uiRYoQqfdcs3L9Oq9JcCYlEVzX6ZczbFqxZ8Uau9ihzQNt7ic8qIs/qWLNlWxON4gbqSuicYp7COvgt5T/MakXKq8IvKLuTzyBmgoLCX6KhoruColkUmb/1wSRMm8rWuZa8lvvA1I0RghMpOhL5CrqECnyInRB0xUhCJEjX3Okv+XIWaUS/orVF6w+X/5m1Kzjf/pw5JtRHwyuzjT1m8Ut+CORN5vf6uwrrRTmgKIUzefIZBm4SyCNUfjPbr15cD2jPh9Qx2jRB1ZSyvTgSkanPhBzVq3/c5BqzW2bJ05I4/jECWpdPvGfBzgaOWvs3OOskYSTroeoOjfVKSeehueqi/lcl3tpXZfDuS53MDpcU5/rcsq/nb2S3gLU4fWprqKzX/M55YEG6QvAS0brdRs8mgkUNuuyn5Ni2fl8wt8Luc8kfMZuSq4vfMxnUJiQphJyUDknXcO4ewS2ksZ4TacYzU+i8vFeRqi1yXOppk/Pl54gPSPWBKgx60GqYamBMO6MLyGp6JInFOpJlPbxsfkUjo25OFpN1j13vRlUwoZfj8Kg0sTfZqMS+HU3bKzVl5em/KXJxJuMV+Hary0vTUDZuBs3vGrUDMrLS2OVUefoxFh+bLQE/0dqC/k/T+SPRUt5PjteOsIq/9GiUv7LK8tL5cN4rOCxPD5WWIAjE+Tu6EJ+dnJ8amIsGMnz/4lx/D9N52sLeX82Pzc+PYVX7tz05NRENJIPRn5P1ZwIHGWMVe6oSN84cIhD7gIUgguUCqSKP5za+webJyMvKhWoWcQR4lRB4DbnVKtH5yvcavfcJa2toPU8F9F6PgkbpUOoukDzlApYfcGd+XVTi7UYFHFyATlRY0QhCmISPjpPUVXP399/+PL+9yJgYxe84LVFK10O7X2nLJbkrUqQ1nzniA1KZexkUJKuk5ZxMdI2+R9E3oas5yaYSQgT/2Is9YC4GqtNfTC3EfdoCizMdz/4xMLcqQcuo82//J/au7z8awAIvgJA8HUSP9xgNw3OPrsF33yZU2LELun21k3UxACxRQ33Vlq3EOtc/rtCzAW4h7PKHQ+8G7SZZAIuk2ygG6wRumBtJtgtsyhizS8xSSnGih7XdFZJi4SpKTmkn2LiykpmmlEGNqPZufOqnub2DV5a3XIZ9jC/+BQNgsBk8L7KvutbBo6a7RJ5bWxhNHxyrOBrTGFtPS1KNBdnILzSBQHE7YZHIRYiT8MoNTy/GwinSWYYe2c/F0dojOlGmq558SJOY5gE3jM4AvOBqdoog1nvaQUjvFtfF4Xltr+uy/pViNjHekudUJ4C2tzh2R8VQbA/qstq0BGn29U5diOPE+ti2gZ74u1EuvjCmCy6Yszx2FnokIYEWkK5fU3BYk1hOQOOc+wxtN1XH+pY/T4aAFPgm2xYBhERpxMmziqkeiVM5QE8VzxP19B5qOm6a4qU4Muik7uev49vi+R0feK3TsMxs2e9dPzMaJsoyNayJEhPl9CNkgRdsmIahNREIhiQVAgYB/CQcRNnEquJwU1WFjn65/f6UceH0FqyQYyAtm1xYG4nCdrXuBTeU5iVZMmGpfaWMrC9z8R5wnM3YPpRDkgDPL0qOnFYQUKSo5C2RC8D1y1R6htW93Et8JpPFqeXAaTQ5arAwnCeTgYYQ/r/w+T/64UEU8uAYE7Vs5cYp7irUPJkYqyMcsqxfnDGMHfGtNin0Y0wYft05+LnGgbm0KCYNJFxvqIsrd6MrIiVE3q4Lut8awxCeVbh5KiJYY+GMCBm4zacsjIfXvMlLJhMghOFpYab81i7S8T8BjPDhoMqS1K+eo2gpXqHGi7HqKPlamCPJQnNiHNPiyguJhnzfVprYRfW7QqynS1JpfTjO53TEsCo4jUxELujKEnibVjURu4qOgPcsappNO4BRbiKzDz8DOCqd09aMm1q0iqOKUIwatn/LmXFIqm1c+X241MfAhw70Dmviqtw9b6Jc84XLX8z9GMBBg+mQf8Y2O6Zj+BPP2NfsgxWvaBGorETh42I3jY/rXrotlNixV32wOy9/+Lej6xEpyRDBxzJBf+1WKbOPfrbpmyoO/tGfwMGilaOtgRp+4/D0lYo0hZLWlrMYm7g2SIWWtAojy5JWPq+JVyFNUsg0rKQ5c+m5R8t9Fwra1hcooSVsi2saDlF1F+UUthKkYhlZYNLxDas5QUtKki2YA9kCkfZqUqUNZ1tCiGIA47QUZtxa54tLgReWZuEU6TkGoBTQrmGKFqW52p+K18OabISCIaYnsXvNKtT3ydHpw/rJL04EXycTEltnqT50VOOUbEJzSF+wRCBXGtCLe8OEVVFTreAHtHGcfKPgPG4pf/AXY1CT5mWahnu0H8gyTvEL3aACY7Y5E5im7kJ1PCQVveACPbrmLZ9tCqOG3HXQvqUdejf//3fw/bHCX+QcOHF+jQgC0ri1BOsRF82QQTaYsjCISEJhxQ5OESk4BDTAf76e6xktLDzH/Ez6oLyg/TYZ1yfgx1jkJg0KacRMMdu20z/OsYuM+C+sckMrKDsMf0rGFvMQCzZDvM/B9lhpF3zxAndMD7xPw9KYQC0qiy5Vn28oqfpYPAjWokr4QWVgVRkytgAkFY8ql8DrcKVXVqy7UrlCwjZjIBbrkK+RdxefjDTABo1sNJ6gK4Ibp0vwxb9OPLT4P1o8PWolL0h+xKEXIlKnZbU8mgPLdswcMZi/g0IealTYltLN2RrCmTU5J+AnzX2S6jTkNQ/9ilTnwR9DNwP33sS44i/Vq/BMb9Wn4vgWF+rzyZwxLMzjZl8sA63puGk2ZgOVkvhWv3Zqfx66NcnG15pbnZyFc7XoMrG3Oy4O1I9fqx8bHmxcvzwwmgD6JFO+Fo+dnihcnx5cXY4nskfmZsdPlo+vrIwN1s8XDm2tDg79Mfx/HLl2PJC+fjhxbnZdHIsf3Iiz+4Ts/ps7v+U18IvNJ9QiFyn4syqMIFI91zalEBRceUWEM4G7XPhNIuPLrZyoJvlMEOWZHXpfP/1/qnXdm9d1/nDUMPh1GeUT0llWQkruPDo5sJYZW/UyakcJOcEGQG+9Q+GaUkEzZyy9sReE00Y1EqFZJ1lT7YGigLkW+wiB8WtrVdlp/5Lew8+2vuCqai2G7mlBq5honl8Wi91DfM6TeLWxGGf2BhAIxv/DQYlBgtKihfHHNyFYxm0XybEAjcty0Bph2k5JyNFWNsVGzMg7gozmFjZ6bHl8gZdtMkASz3G2e5clSsrx2A0SopBhJSk1KPwl6BFtrfHOdtZzm3NicNmlGtRlgPaeeLxhH95d//L78SzhKQlgoDLYQwhRP8ChgC8SQDgQtjVQEDs3Pn08fMfayiERiMdFzwaM4JGg84YjcaMwuJfL8rGl3e+lEeeSGNecHqmwpUpBjWDaDlrApZEfIYAwr1AwEDWCKVesIHQFadfpVMCUp+z4nH/63Udjbvznpaekctyi9hDE9WqQEIBo8XnrhvnJhgWCScck4PAoYB0/kMFDrFyMkOjK8bKmVRYcSGi9NPpuozt0lkxtNFN9bNKjeQKKqsGl86qBt1fUJ/3vtK+tUF7cew3H71l8DXFVAbyEX3xTufNc6LKNzCQFGjykdeM2RLkNTDacuKibcZrpmIgwXotu17g4B554Jg5eA946xAp3glvm1P97d5+s3Phbufj26pLjya6/SU9ugJHJp6jnIAtadK59GHnkniGwEtcEOcSPOjRxKE3nKOmrQaX/HRat33jlGoLqpFz2PoI1bX1BTb0FtJ3L6v9o5KW4hzVlFcMX/q6JAOnb4eIBTQXV1Zovvuueev7vK/00ne9rqzWfqPei3+o1IBcD7+4bOex2+KGvEnrG8lsJQ3DyPHha+Xca5wlDjRzmlq+1b61pLLEeUDAjxFD1yN445QaAdYmG3X7foy8ZEggFNnhfYnbqYmD+ZaJcytOBeNLc9rBrmTGktGQaYZhGLhlgOjfW68A5TCJlzmSLsWuFxh0gXuiyE3aCyS9twMc56QAePvK4GR5BgWdJs8NzOA/UoN/jn1jsMlz6BpD8Q6fQ9eYY7QZ6zlysAkK3P7RxYCb7zy4aswaHKhBnv+wxv2aRNjCKWCuUNKzePGGmkX1lrYOxUGoXlzQ2nk1Iazh5JHdC1or69zFG8qs8pyFwHMWBs8ZFHgY8BbOZb+Ai+8oFJ7DTwCJ8nNW3sPn5Om6wwJA5T60voKL79A09s0bidKEDqVH3m8qZRzKEhIpzzHZRy1BwkgRIpOohMNPKJZoxm9z/Zpb51hTtKdVMXwOx0x7Vkc0m9cMnkkSR+Um3knMlPkoM1DFOpnvNRrEoq+tEplL64fqGKWFuZywOPqeu/4Rv1GchtkD/ZtUZ5o3GIIaOz7j1JKrAltlsJ4ivAMQF5p7Xl7gIU2tRoSj0T5sn/ZHkyoA1G4g7kzOhCT1q0A6BFANrkATk/3n8NfMb6JLbyH9b/F7R94nFNxd6SHw+cmney2xXnt8bM/hjib9wodKaYEPhlvgDevg0V18p1enroThDAUlMUprJZzp1qoH1tJ69eAaWrM+qIro1gOraO36IHxZv/7rX/rr19CygWFULC27AiV//ctABRsdBTxy6ucgHF0XzqZXlkR3ckoNnE1xsOcb6gJbY8wQMqy0zDm2cWlnAHsHZK+cOl0p73vrgu6QvsvldBpSxOVaKnZmOYMKuDuWDL6BOuPBxbS6Qno2nUkpG+GomE+9gEZcN1X4ggK4bIWpuqEvUMUg54UAfsm7AbdTUEHakmsy73qBW2fvBzO5emat2VNTZybHTIYZPg9YjVGNygxD4a3xZCwJM0DnSTT+pYX5FI6NpYW5eGEuWV9amF1fmI2jpYWZEI7m0sI0aPtr3sLU2upUw/cWJn1vsrG2urQwUYOjvjD+p4W8u7QwXnWn8+XSsdHx/FjFgfOKg+ej5dLSwsgxvC4dX1oYPgLH0bWJvDeRX148Cld8fhjOV9T5MpwvDW+ks4t5fyq/NpWfrRTz63w6d7yYP1bMHy3mjxTzQWNq0l+bnvT+Y3pqeCb/3+P5/xrPHx8FaHncVrGQ3xjJT03npwCNEf4dU7+joyNHjwwVWF8vqt+hgfq75HvxGpKmvOpGJUnvu6FPgbzgTtIJnTmbUs3hRi9Jnb1z99XdU2Y5qRcYdJLiju1ucBx114aGScQNtD8gxwW9rb1NDOUPbGIYptP2tYZboVJ0uPcqFceCSVv4H10si4x6/e3dW9c1CzcADTwDLgsN9LC6DW3/4bu/AhpPH4FTzpMwfZiy4sI/fiV6Gh4hqOE1G26SY50iJJBUgPkZGvw0sIZHVbxGTiLW4W7uhnjvJybO4C3OgktOqJgE953vOhdf+y27+elyK9vLzt0PrV6e7G3A9Rc3IncEeVsvi2c70SN8Xe+82XmJtwZnZpoldQ0pRp8Akkf4Nc2Awfc0A6aEETY4U3ycOiy4B+1tj8qPkaAJQiGL7vTUFLzPS/zUENzd75QFZ0QSC5cZEkiWx3RGdgaSQYqACE4C5BfjxGIvY6TtZ0+HEYNgfBQIpwbPLuaEInjGQRvhLOSwnS14ExIS9vixyXJ1iZ/Z/sOXd+68Ls7bDIMD/nBjbogqlWkFgpnV6g8h5jsBnZTsfH+AiwpoAxQX4Q9hLXJwITkg7RXfIJfVOxoRWioDXnaFEcFw9l7UM8wBLmxgWVgGFOBmAULcDKCnnhqeaHmdKbX1l08wNaYVa5yq1S/qPuCdztz/zoOXnrB/acYIqGayxQRYR0HvLEnDVQ41iMov5qHDHVYF2R3i+x55XOD2EKH31+qySQQe0cN3lXc0JtKZYwdpOYu8sluhmEI4rGguOyqBw6NScGi1kheeyavZvOq4L+prXqTFN+PM7tm3B7VQtMg0wbfaNMFNLbJonPq5srvhcCBa9rzBbRP1xNsUp//gp0uywWv/+w/tPTW5VO3NSdAvglZOWrlWLk3U5pzAybkNmToEI+vvMHMAipbgnxaZR2+2ZLPZnfO/HBeAYlABSDYqriBCmhju9GkJFpVA73vbrstWlr+99suRwMhDGgmANNAlIWR5hhbDWcxxbTHHNWKOR/vALQnHFpY0P3M0D3I1D3Iy3N5TyahYDukrhDwFFCUuDJIVnG4m7vYwcaeXiZN7RUZMMNzbPRhH5rYlkgJsRtuHy7qGo7k2R2sZjuZYcD4vCRhhjH3mizd4alxEhGgoIJGsTmheFnP8C4+XJjnuSUJKjc21DPPRvCewuEU5wy3IY8ltkeFTswmLRxzQpaHrGVZwYH2hwxYRHkTlhCQeTA8zdM0QNaYhQj+YeAjhEAqmyBd9MPivRYtwWF3IitCUPhX4k6fvvccHAdUcjGJTRCsEvv7lIF0N+mwSOaCi8UY4qJJxSTi4lvJLOKCWcU44GH22oPxlgAVFNy6fOGG1LZ/4y18OCMWQRkHqc+xQUMPllBNqOU3aleHhVg46kwiuqKavaqMJn5YBjpPWAnXDXKDdAb0BVXYqfZ56q5hjitJJOZE6hVK6IspfV6dQ6m6l7O6X1tWp4KPTf3mBdRo66hQTXuliz63yTgxE3T5vcUQFN1BnOCYcuzVWR4/ItW649o000uXqVJl9xOahTtVkm2mm2mbmzEzZ00SBZ3j8erRmfHpEahAKN42kwQrReBKTStSsHl1aXJiX37kEfhcXZo8kEV3PLC5MN56dzofT+cZ0PlhcmFpbmJr0FxcmvckmFEznVxcXJmpw1JOoCS3HKwtjbnlhZjo/VllcGHXgKC0ujByD4zjUqA6vrywtFFeWi0cOLzUXAWL+8NLQkZXl5aXCwlJhsTWSHyqkjSWMAhuvD9eK+WoRz8Pj0/nF6fzCdH4SI8by6bPThXrt2HLehd6iSeiwDCfjQ4WSM1Q4fuzIbHHo8Mrw0MJifn4xP1wcW8k3R/LeSL4+0tdokq5j/FXlN9D+eJazRuByVc73noHbXsgrRTEGSsfqfg7O53mRYTNHe7karIqgzNG+hylI7vpwwsLHW51/PL//xb3dd3hdx1mlMPrUh1uW9SnHjXlNn3Uw9GJ0Oeg3E3gNDkm3gUWrIA5jJQstKpEQEPuY+D2J735I1yFwSE7V2/KDMFf1YJSUykBnDcq1rzZzj84HHDC8c+HT3VNvdS59qny+cXNAWTrsnjV3gzZT+N7/OvWemTbKpZrxy+idNbJImH7f/dLqVIYIsxZnxolrPqs5VmK7Rwr6bGawVDUGtGBqzZhNhELawK0yMFOcwp0HDzuvf6OeV7bnnj67u+vpiQZo94GcWnfQAPnHMdBxJQqTVfqO+EiAqJfKgrHAQ18bes0enQcJRbxuQISEF23vi2ud2w+eEHF860La3c498MuHS1aYGszCPdvRu19avTw99qw9oVSE4TNi1p5ANNp/77fH2+oE0TadoMMlfOGkRtISFa9uB9gNKZkx6CqkUbbvYtA9TMwgAbRufwWi4P4/Tpu8tJH4/XDympDNBRh0UG74bNlyY28Tv2zO2nUtsqECar8BVMJVgWZcGfCvg/p5Wreh7vzw/m8BleZ1ewuXnquMa+fse52L//j1uFpQAVcLKr+s7IkWhO0buLqPARjR1c3OwEbvrawkS1jTROVbs8iGnWuN6YaVaI2VVu6LdFYb/r1EgUe9VSCj1mqDRAtINzwKT1Hh7TYpBdlQvm8ScyPnRqjZKdAwDgqgTP4K2AFlHDcdwBunOjDfHWk45NbCn57VC356Mc6/yykd6cvLdEIfnt0LsizTixlGHMKMUI4RGUgcgFLPAWDVYKw6OBgQaCg7CcWPodTM90g0goE8/uDvj9+7PrCLOIUi+LarqbP08/BZWbI6wFw8pgM9U6Y5s/OAOXpmKE5PXZm0TGeY3y3gKIFkaj21c0eygMdi9WVTLfyy90hVR8KFXq3W6EHyNK0VLyH29Oi8Z1gJsqjTL2tPIjcWTyKOkLjhYTxjr+rg91kWC4DbAq6XYXgKInM8AUdGSnrT6kHYJOpMRj1QceKwyQVs26NKNVUJrXzkp6YqibXvpukIDXFf/Kg70q+01VHS/hQohIYRu/zZUAUeJW0osrqRBFeZ4Vi9UDyFSk5FjMJzjyGX1SliTjMjGOOEa4RhrhUonmT9z0ym1QINA6bF03f+6G9o1rgXiW3071cA2sGdWy1QOJMWffPcAyZqdxIZRipkphLy2iBjSXtbF+q6nlW5GtK3QTvPIo7jqaRfS/RVAkKDX2uybPEpC2Iev+WB7O8w0qURLSnE9JNCsMQ3WzikXWu8XUNvN0OxxBHfn3pClqmMAGXLaE/a3hJkbCkmwyXLwiXjHi5ZsbhkKFl+RPAYKHU8OTRLNBgoFzwFbpZIYDg3fsf4snActVhzU7lEsZ8fFyo2tkKjFRnz1jB7K8usJ7zHxrBODgYnHE1i22hYFiczRN2R9kL1r6pLfZNoPe1TsniKxVBkgtp3Q8y7mksVQMovoairS2dsg9bkPkPrez9fmwbbBFiTwwzJdTWRNKTPpq2G5PUlFYZE/QxFs+lJNzHRkWFCL2k20jguKLsZ0Ih+kWEG1rMiwwyuY0WGOaiSjgwzsJIVGeYgzNne99+D7H26rSMGP2xaPvHfg819GITJTVcjNHKxT0+I3pV8RTuEcP+vV5Yk8JghaU1dcdyYlmR4glJ1Cidey0tr5MtDUVnpknYItrx1R1nY6EpnuadAruRFtCUFYpPCkMsVk9QqxFAuLb6hAp7CMFqMFNaUAgmq4lQ4GgtFfvHIrcgMTO7oAt4chehKk3UzFeXQ2bIb4LWeM92ArhhzjRSlwapxCd9y0ai5ps1/Lpv3PJpBNQ80QTKl+gGpue+eazW5Zjr17NmTpOfEngU1aGucelx6JBpvg+gT2QpXvZX/uZj3VrYW86XFfAiX6lhcmJmFnxk84Hx6cWZ6AX6n8GiG3kozXMU6E3KML8z8aTw/DmdjcozKMQJ//7GQh7NhOYrQ1oPfIfirjeaXFmYKizOFxuRifmIxPz6WLxaHCnA2VFh3JqBdMwwajfF8oeCvLU/nx1bym8WhoUK9Fo3n18fz4Xgebg4VKmW0EhaOH1tdgKujRzbnJ4ew7mRxceHYcn66j30wrGAMkMhNcMkLtUfiUFyE23Yw0oQE99P1UHsk73BdEqcqZjVu8t5OV9l/QFIqfvF+56Vv9k+91rl8VdZk4pT5wbacAHQ5wyRJfE+yVlVsUPsvf9v58gcLFK+PRZ5klg4r3lZaCSlKF2u9cqt9FVQSdYejh2abldVNUoUpREnF1YWyTQOknHqZdoKl7W/IqvHmhzv3boA6sffmV8brGig3MOGY9l9zqM9cumH6xeh96rbpLXAl/hzmQPjp8prdzf4NYMpf2t3AfKG5FtMeVZwNL+JoottUmOIj2MCAIhWZWkzD6WaqJmTsNSPVIFSAHYpYJ9lYeGf5zr3zu/cuWrNugQNdhmbb7lcm2aplT60qY/XM9IW76kxHDuC90b6VlryI12uvUgIeuqYCzNhT8vR91GowQY+pwJH3QJ6gSLa88ogR+C5f7Tz4m1p/xHV71PPg2TFs3lSCsUoYUkHW8p0cqIDcG8l2S7K2j+YPDwQ4U9vEt5W+TYxb6lpCssO7jiE/SFpkV0YuwggAG2lIoZAcVURmidSuh08QlIpRWqT8rEUBPVSQ1stX9//5/e6HnyifKAZTYKNHTvqZZgXRsa68nIK9rM2MAluUM4JMYLc8J8r1GwVw9SpGQ+wznK32LdPIp1bZQSUhZg+yRsbZntH/AzdgkMR77+Lu1bu7535Ug7MQ0SPE6EcN1yAhY830nxmxdMwxaK5u5UzHtMf8JvcqVntKUpCuu3FAKVlyEa0B0JYfSlCSrsPnSPdcHD3elLuUxiAtq5a+NA2tpnyPQj045NVHEiUF4Q1+Ok0pI7bZbgPi5cXzu6+e2T0noV8xgFYtl8GP9xVxuYVasRcZrDTWjQbll6FXXXKXwLy0chojyn7x+s6dTxgXlU7daTZoaUKd9CnCEJQeZh3ADSySZKRz6fXOg69UymFu5GG+bkZMrtWlup+9W6N9WJgJzO6BHEhuMHzZfhZxrDFHHg9Z965FLpdiWrQSem/pEEcegkQDrOxxvPOPnR84rop7Ul7u9raGFFbwRVvmbUxwe8hEhiFIOjwMwNH4wHtYZIzkzCrkl1QQynAkwYm5kcKJeWpRsdmiZrNFxWY5Q1XOBiU7fwjQ0yNF8YTwYQpCQCY6P7z11AgpMCoMDgL5JTOE3wiaAbb0Qzt78fGpq79ggjQkeWgE5+lRMjKNmiCSZ54aIQ1HZoigyAfjuVWgfULfMBbSSdds70vRs0zIO1w4uVbO9yRpH9xvSbMWx+YvUyNyOqNiCuPlcmhX/PqJLch3ix//5as6VXgF9A3f0WJeYi4yd1rWjfbnJyXNnAaO7/Q39ztnvmHoapISnzzXQkynR4lPqATDHZu0ohyCSFXlvKJo/ZICk0rP1/r6Nq0tUbAn6G/v/iUV7wnzuZlehb3YnTJjsbsTK7juLGtp3FZ2Tu6nnyzg9soCiS0LiIXJqiccs6pkAeZeimOi1HH+Q4tjCqSsOOBnxAE/Kw4kGXFAC2wkEADsAc6HaH5iU0Y5CFkwDDBhpa9CVmOcGnmrbEnfkvGfBoQlNVvyssQ6rHnkAEaif+BuiJ6QuSLxtOFSvDVbLs0IpUjabZkUNB5LIgVtwhZIK+4gcdQWRc07oB6oetrWtSWH9RXCeiSvrLiVkbAygpUWqawETML+JQeTEmdUGiYRGfRddWWLBZZAICD9Ktn3ImojFwxOLuwb3czbcO7IKYfyvCLoW5+bYt76SCzc5t6acUtoQ6MsRlo7jIwu2F8B1Jz2wGcWuTV43RKLK2qGeGC7QJGNLAvT3OvAxvi6OZxYzGIRA/mDZgyKK/Swgj5swKb+mvBnSbNNk206rOmvTXM1uT14WsLY4dUSm/j0UB6xrhLOI7l/yzHT7LKp9tzVltTeO9p+2u+WWE17bmlbaT882EL6XwMspDzbJ07Q+E/812C7aOCkFW+V87vR/kXMrM6FRAbcdNWpSmZ7NkiaSyBIUHNd3O1aWGKuycAGp5jJSpwC65KeKazJTa/itdgsR76P5hLvY3YpeM024UPW3elLjIVXL8MlhWPSN+lKTIANp+ry9kkeBF+EKVy1PMeXS6duX3p+iqbfmlgVnbq5wBz1IAR5JUo+iO3klG9462IBhee5rozIQZCueevsc+i0aALVZVpOS7VAjLgM0L7UT0Bm28yrzKI9W3pW1AzokVtDMyNRiGuU11XaLOn+Saydk6OzzaH88uLCPPw5+Gsfk6NTE8vq7qT8luXXld9gYX70GBzH8XpucnREfocP82/x8DJCm29N5Q/DraXJ0ULBnco3h4pDhTE4yDrppUv5pbnR2lAhnELvxmAqPwH3ZuYmjx+D3yNwrAwXloaw5WyxODQ3s9jPvzEEDT856VKATHKba7Q/pYImK2T6fsXxYqfB/jSqjPbsoMyJNs1V5BAULPQzkMtOd66L14iqjNkRnDQhzxPdC+VPkkJVk3Jtq0JVAddf8bZyzEvXcpzhT3eP5Oylf+6+cIb7V9ksGzkK61dxypTkG0Pxm10JORXHKsIbMRukKJiV3ciFm4SM77rVXAuolofElJ35XDHYYv6R9t0Wx97bv3Guc+GN3RfP6pXO7ThnI4OKyEmOWhznsshIPHI0NliIFNlHxQMdqRsD26pgsGCbgoUF5Qhyq56sqgPBBDGTnXhUumNxckraN9Wtgxu51Kblu6aYNoOQ4xryGIzSc428Ti6+tnPn9c6Zm50vXrPilQYu5u7CKApsTtGBbBLMUYZGZ94XBlVAYnJyyiXAdxIqhy+z5mQRaH/e4h0pWQR2X7wAOFgIhJg6DcU8R9xQ2RiPvh7AYOdtk33OYw8zihObxGGDtpGKcIHwMbIlSKSrLGRADzt3z3deFj8E6GCdg4gw6KYdq0Ygo66j4JKKYAHETdIaGqayKaMbygaiKrjj/hhSpAzqiXcSta6NVCNfAW4AJAzaWiP41+s1pZ2jsIh6dQumnQ2gr3wIg9l7/u7OnVOd77/Qg1nQI6F83wzdYE8ehj2wbn/VBYgef+S5NY/sd3FKgUvo9YvaN2vtbTL6SbHU7q4MvxV8+hjmxmf7Gu1NCdvXvATdszZz7ZvtH5BB7L717f7tFzo/frH31id9vwZCZbrPx8DYTPf5FiKrhfoSLFTUd5DBQ76DfniE5TRs5horvx0OuFcKg3uVGQdOmt05+xk8BMTg5qnfHYOuWRAM9BwIBqG3UWp/00Mf0UXI24DXuJc+YouwL33EcopASPI2bw1XelD7VoMJ5E3RvH/cffc8Zor67pXfg1vYaFBERGAfoxyh1WIZjIvmGf1wKfagMNzVcbGrO9kQXyHwbDJVHV1/H7rAGLjSEcXtDus+eVJH0Nbz29sN5xna0Ryuupk+0CvfLeFY4HdMxxXr6eSTB9lOaDSRU/edkqSnSCs8lIiSLEvSipCKcVyU8UCqokGqnlsD9YSoo5979GYAcwd0Bh4ppxx/5XLnlU87r1zdvfytZCaSASGPnZGRzKgBDJlIeTaQTx5YEAyn8cpuE61TQOLGxIM9Qgrc8DRp0pWQNtVyvP9gDYgVRq6iWyMiKNUxhliOPsz2Tdo0+flHnbevwEe5d86KSWYBHZHgcOozBEm9rNKXcAzA7tqVMKxle5ag5rpTHKrp8fcdKohoyp7EQz3zXef2dcMEfKeJIXOjed3hUldfI7QdxbqQCBUG8LtfWlB9r9y+ZeiTlhpduOEZisYSKAXwyjaomCYJzrWScXQpcPwAt9ysEQ4seT5+/8fO5duAhZI8XTG64eJLFg9zowuPniaVfo1sTMjxTMQ/g8v+P06D8Gfhgq+Uku850F372yT159UldczhyPjdgW+Enkf767RM1Lsmq2bwwSAFf/zme0jBH1zau3zn1/VAb2YXdHw7BXT/7dj6iZq5swv1c7I0g6xOMMMEdZ6p6AwTzxladdZCfFZw7pJ8e2Rk+35GHM1KwZb8+7OSlBEBu6TJg5v1yF5ZwSvL47sZu2HnFhPPCjBZ0SUrOD05OJEEjAzws09FOMuv4ZBdelMP2+rhWQdglOE+mmtYRApP29vNJTm1St2mFs6EHFu0GGctciwaH7mK4kvQGn1Xrlt+pr5FF7tJrU1OuilPltzYRMYQlm7yxh90l6pm3XGBIiywWJ75vrs/bjE6ojLnDuf+LYde6jC8Pnn++lfR5scBt7UNcuB9MUT2v6+tkQMRZJPknweYJKlZBVP4SavyiT8fEOKOjHghUBCKyxCmGIOtpkopVB0ZCdFDkff7cw0pZgsZhX7fkgo1ym4nZWT2gs/gJO1/ZhNiBQ10ZVWQor1MJb13K3JJcNFtEwTcOq+T8KVq4dTL0EHAu7hXvfqWKjXZ8coMU1wV9TXFjyOE0pLq1bpIT6YnqV84MJGfwssqZm+Dk5hr8CQ9CsygueVU1ZVMETag4HU4G4ET6+u0SjMQOi3ea+1LgdrfXQ0oAwuAUafwH54XW4/5nKcl9fGU/D5Dp0ZXdNr99OzHpDajm7k3k23NLs+cnrT+E0SXPOju0dGZjb1C94nMnsePHR2zj8WF8Vk8rOtpOabgrzicV3cWxidqcNThtAzH+NFqeezY0aqG5OBxHI9jCGV4Yby4AsfhhfGhJTiW4V9haXG8MFwcKgwV4sn8bLQO/zNR9ApBY7Lgr63B2ehkfnoVfuu10lR+aXHBhT7K0HQEjtHCkbHJfPHwyizu/F5eKhQXF4b6GEUdDPAK1CsMyLnR4Ty3HqbDGSWKlwbkeiW7WUGDcVFPbW8nuFwdeygzT9IG/HJINQkgZbJpxmQwrJD3vgptHmCq5hxml3JbnF4qRFqZQwMNeuShRYMcQf/5+NT76F/yEudi6sIzsBSsLI4ZLasLK2imdS2DDGb7Eo0Lc1CzqcjCivYLXOl8/wkj1Q8dp5mW5/pMFxRTeTceur5GohVTPKn2TZRyybTD3iTXKHjq9Su7b32L0XIfvvd/ZDYMWmYyCCfRq0NMlV7JhdbQ3PZ2gNGu+k2H075VQUeLMDsbLadizwUy0UTNhpmKbehWzcPv1DN1lrP7pzRW73Hn3DNQp6jplHMcKg2E5E8TtJc0KbthmmPdrqtWw6tvwgOTHa7rlHPsJIcGFFeGf37fOfPt7jvfgRgrRlA/ZQ+4IPT0uSl19RnqRhV6XOjlZUB2XrnZeelrCyRKQMAmMRM4x3vWl8pYa9WIRzI14meSCYphQzIh7iuSINU7d8/s3r6jwn1rAPM2tJ6LzI1KzkDlPAMMU7JJRJgyAjObwcvrqYyVjfZ2vYlWs/ZNeot5OQUtK6hCkptxixQ1dCL2D3HoqlbEKTjJbfPReaiMTxh16/ef3/vwVufHs2pXfPuGggWd82JFextL3ITS8lFRT5/Dmf6WJGmS7k2SglFf3NEW5h8IaY+Vk0NTtsSQIHs8FYPIyVE2oC6uItQi/Ig5YgTWOkS1JAkJzyK69pK9O1A71e+eefzWw/0XHuhNaZl+abgp78PO9ozLUnIj2z2NXO5IpTin0Jkm48UqR0G1cKK9U9d27r7K+Gi7HPCIhksaDCaxlHSpHKkLFR0O2VXJqQSq1ITSiEoTLqa4XUga8Zf8c7oSdl6Tj0N5d9yBDyPryII+PZy5BAiiGwfqTd1IYXStQ1uqSLm2oD8+bd9zYozYxXaApEpZKtm1ZA1k5mXbSSWDxQvfWFj0zEQWjd75sBDqmRIbpd6JwagcocaNqRHhR7QDLSGCIbqGv/ANEZDXB+A53Ae34V6UhvsgMirril2d4ieS6REJR0JLVIGXA6IRVnnHAGb4HBVvoERXQI0RxF6f9US9tVbfl4yf46yu2y2R/Tmitt6FyYADl2Ar8h/6VElA9+7fgr/dt/EP0FXZQK1+JvjNSazLn7lbyfXpVBIOWt2pVT3UZAMn16DApZxXlyxEMRKsQLJcwhcusRpuneTkrdTHLf4Wr722//AyAn5NNr6mUI83pFKaAszfF7gSZIEzprIxr9kMccMFpQQK1Z3Q98Mocrg6VqNKtOtH6hTZbgNEgQ1QGpPOV291LrzRHxMj3aiOLEO67lsLMyC/bGZ7tEUZmtxrpC6wJAN97j/8u6SJqOBWP4zrgHvw25+y3ARyr1et4mItBfAEsZc9BqzqKFeARIylm2GE1NHLxShWgGpRX9bSDPyPMyiASLFz55yFgpN4TfQdZSaAe2+2cHtVk1Y9Zzmjt0s1OIAQnSf/69R7QThML22V1oTZFwz48z0KfnL99ccv4+ZmTfwrBGWRXW4JPGc21cUVl2AvihuxBitpGwigZW8xDWMXdH9EKsZcxWSiouAP3fVavtWFxAKAXuDlqKr40a93LvyGfdBLYHXROf2+1UXsIo2KHTHtKoovviEWtXfEPQS+Tn6bidqLg0j7GoBv32pqB5G7px9/9IZyENGEiPlMaPpqNMhtEgqVLGPqUq8sxxCx4sZajFE9ihQjPYoUY7M1bqA8NHEkuPBcR7N/ITtErtkqq742XRK5Hl3xpSvJc3v+ZehKuT7bXTkJx8I2fYEgzuk2rInkSqYb0EHGWSGs5VRfaIL/7F3uqb+R3NKFCl36T7fSY2s6hazqqXXObv3qaWFmVKV+SlI/FWU5q5osa5Wk0KUHaQ2IYbpB+yMKBTDDfh2OvsBb1/RVKzJ3LN2gn1bw5CJ7Rl63hPXfUHLOiM19ZebpLnn1VJeYWrBE5OmseKyF4t5vc1RTABJ7K6mKV4Mfu3BTS4gbLMH9SsmoWywaKBM9tagxQM7oETKECRc17y0aniuOCBabNey8DyN/chiKOXazxUXOLq/ZVaQJvSHyNqOyuNRTMTybSWSZkPVyEGEblYlGiqbL+VRTZk2Uu8jkqE0hR23aOGqRxVGL8Gqa27uiQM6DUYome9Oya0lhQB29pjDovl5UGFxBVhUGVNDLCoOx5HWFZwesK0i7yokTmlucePag3DlbkrQFAzmYtDFWCTtAh5T43K3wlTLQA3XX5coejS7DAWXYQWu/iruKsRC4nHwD4KIJE4Hpa8laHda9+hYXi92erpXTb70s55QZZg2XBlb52vFDdtSVa8pOk1CuHXEMXtUX2LjsUZQDDGdBlxIaNeBiwiNWYVjRB5jL9ayo9DSB51urEpIYnU4ZTkmf0gmHbcV4EXilgrxyqeenvM6yKiEjCLSEyW25a2lYMdd9nox5Ftbk60nmsYpHs54ke0LUDJgx6yEq9PU4rPC0gtOTLBMsLsyncGysLM9Fy3Prw/n1leXZBI7YXVqc/7nj8MryxPJ4pVSH8+Wxagmux5ZHqxX4HYVjBP6OLg8fO7KyPHz0yEpx+cjh5eKRlaHDdXdxvu4uzS/Ob6RLixtpEv/X7ProZP7Pc7hoAH9ThcpofnpyCH+msKz7wNWBkWE8inj0WxTIhkzPOcDOR3sCp+fcyKPirvDpID2WOc1RVxD1HCsoJIXrYOoUu4BjYoM8znHVcWO/xMfuwsT1+yGy5Yqi342J0vF7MFnzKYKfaB39kMFwYD3IsNRBQo2aE5Y9WKpB+UbNCYsgJNfwjIwrQYStkDQXP322LiZInBUKz/QhmiBPv9/VXzHTU7Grg4INWgyOGrQYUwhwH7tfdhxU2DsMMfhlhkFV9SiUPKSHAWJV1zB+gbAm49DiGg/EkticBD7oXCOdFb8hvApSejkl4aGbLQ59yb2sSklRl7oB+ToE7buczAiVRSIKj9/5du/vn3eu3Ozc/qq7Z5T0XGDZTlNbPTJoREn7Cwfuxt5wLzb9GxJKEcgicMfjCcYXhnQVC0USTr7a/e4so2dsQmED8XIj8cOwutzCQHQcdELVxK29piYVOeiSTgtAN9dQMvSapHxUEAXu9uz9vXMv7906t3dTdGcvbFKkEul9hfzbnYQdVDQCK+Rcsp02Y6sylcIzh8cvJRSCEuMXkO1YI0HutOd37r7K3dv+SqBWueRKBsKTcfrA4vZ2o4ExpOFOe9tyAOEmNM/YaFU8Qbg4A4rtZkAjGBXxO7v22u65G4CICn6XRcQRB5UuNEB0tQySFg7KocXGoIomZHK7RUPZvz7Dr0v337nwRufle1b/EQakphzbudhNxF+K9k42GqHEdIWHhIuKvDIVOVtus8FhV5IgbbKeix7nFKEkDUsFFTPN++n0Gru0rKrub7za+eFU5/ZLeviUVY3skLRB1rbGNLyT7W8InyAMkdB6lkk+5NALFmw0y5+9bcGW8MSsVZa9qsfrHMCnm7ynxiqDAeN7JftqzI0A6X5XZclegsvOrGbdpI9978NPHp8iRvTVKzpDNKgMBU5gAFwFHf7I1a9gdxmHDbQfme4wiqrrLulAPXYn+zdOWz2oTwEf3Kz5Dl1lzrVuSxI75GcUIofTmN2iEKNlIlqsJWLY0is3fxl0KbDg3+QQQ6ofJgHQBXfEak05xJU43Im27syy2x6VcFBhm+S4mWFwdlo9DM6arobx+PmP1TB+gw6IqKhecBCn3uM+ftMRsAuYGUPnwaXuMQSUX3zY9PGMz2Gnhq1OUoq7jyvI2jog0guI70vd0gv0aaSWB5essJMsQvGuHGDrcq3Wen1VwL7Hkb7klV6CDhTQVwu9ZIH4Vie11j0s2+CXDeBlC+qytdaDMK11nm9/NTiabga3+/7zinIEOv2WizuvXLWOCuXtWxtivtuES1xQYrqgzC0KJhtcFEwg7fAy4DYCeoypJDx2o9St81PccltsNWJhFMP91Fx/Wj1DzJM+ZGb2qgo+in28dk7FH/35biLKMVA4uCNdhcLRSI/0+d7m/nieArIQhDnJxwBfQAJUrWmGoivQfXSZxLdRDwN3RJphdC68osOoKo7Ii1W4oyuMeLnfazqR7MHzZCUHyjB8Ktb1oLKqi56sdAGiRLPBZY8u4t4I5ekgjs8XX+pcf5ERyFA+3Pjvo1UOVJCE4p2S1BYlNrljRxGcV1CFlI1KA/AIAhnsgEfqCjQPrQAzJ+dMKYUnQROWwo5j1X5zf//0m0hw3r8wCD0KYQYzz8ShCzMMX6bv9UUtU8PGDSOd4ZJZQVKAY9C49F+vVzII7tz/pHPhy8cvPFA49nVJ/40yb/bTuQ5QuA5SgIqiNeSU+mPrPn0Vn4weMp1RQqYVMLmT0T8s5UNM7yjZTmjbu7oS47u6jFMosG5nhfh+4vuKLbev2OL6inkvCraIrsXyHnF0olsQneiWQCcyoueEgBVRz5JxjZAnItAQYxYq6U42JlqCYo8YJ5IUxjr0yt4zw7YI5bAUTNJTyxAXFpl+B3lJi0q/tQSjhZffXrDQMsUvZJg287U4L78PnlWR9zhYAGWfkoHqe71wtfzZh13O2gzslKEUmkSQn4LFpXpZFKULoTNgRrKuMmIY1JxiTssWZ9JMSUUZrxuKW+imsqf6k1b1SFqBecxMNHtopUptDy+1s1EpUNTjGPdCnxzJEWbd2e0PqGgS3B9UyeS4P7iWSnN/QC2T6f5g9Nla/6dBye65scRt5tYYpwQm8MSfBlvtU5R1JbNfWuIrChgaOgkb5NEPHa/IVfykJ2Z6OnXTk2woR3swl8sF38HgI7iVwL6Qahy0QwC0JAQKu7VXyNWfA0nRhbRfxRxmyjrNV9zESethWnM4Cz2dcwu09sfipE7nXIxrhRSZRXvryzWZq9Eff1N5tuO59I5O7jXb4106CZ0GXKCxfc26UuGRqyruCIaAqWMBb4nwTXnoA8I0ARwgmaOZOPZVus4LCtazUY/ATLmZYjOlegr1jOkpUnNiT4Aash6iNSIZj6BsIfdEdvulxbEFOebxWBybS+BIF8dmIzjixbGZJhzri2PTARzh4tiUD0djcWxyFY61xbGJOhze4th4FY4awKjA4S6OjZbgKC+OjRyHw1kcGz4Kx7HhQnFlBP4NF4aOQL3C8lhhEY6l4ULr5HBhc2O4kCbDhTgaLqw3h8OgMFxo+MOFtdWCVw/n89Ujy/nmTD6cyS+6lepIfrhQLg0XnOMjhWNHi2P5obF8Af7rs+Ly0uJ0Xzd/N8ZAcGofH6ZocSjcMEZlrpfJASRbZ8334lyL/KFT8if66bM45z0636CF2Ts7dz7YuXtbvCVwh3iFYiMzq6AMMBVQYWMixaoCsEC8LHtRyanmoIMl0bd0B7SY/gKDF+bpNdofIROJ3C22VMMb0nCi9nZZRqCM1VT1GldlQ3VcxpoYb3hNcnChV9S1RNmp9y59//i975Sd2nSFDmthggG9yOvS6jHm0NDzme64elnX59Nmjntnj7eLzZzqnQKUnea+VTAsIKElM0IMeByCrJUdn6nGo2tBLQ+qgS4jrl/ovfm5tsLv3f+4c/aetsLr1hVgKhR2NNNPRMUSjrSnqtVXEDnudKa7baI+0t0tDpjmu02nyUFMQPF2Iz043Bgid2oOestjjABryUE3jE1LHi9txU/LhyKqQUOmNH3otrqqB33vTufcp2rQfbDQQ+qLiJudiWx7u3UWGTUnNj4yK4yPzIoTpWhsxfgu9nOIUN+m4mey/f9sfdMz+rVg5Lkt3fPpO4//drZvz/KaZbu1PiS7Ls+93SXPvNWfzDz3pz4mFhJyTgBiPqgVQFgqaRJz6GYvpHtQo+yiSsKeaB5UIDOV093S001VGcsgxVwL7ixJGhDa+6CH33nt/s6dW2r4cftTAhqWSQfCBZKIIs2JB4pgpBHCHRyuuR9mGlM4VPaRQzIbVjQ6jlh8LXTEV47R0WFCcbEM2jle0P624ZGMzE+YbRLtbTQgA1xQ5xvtbU3s+NWQ6D/bCYVqd7COSyB8G0ZLF7sY7ROUSby5oq1BvEHg0d9QPHh8+tL+a9/tvvz8z2DH79/B2EmVQcgJPbGRU++wwUueIaOlnmEDxHF3nvgIfHXtS/gEA86H5621t+VOe7sZPkMRdUA8423pt9b6N8PrOfL4hvu1QLjRKm3LIScxiehz7sbOvc87Eh+0FwsPuGxM+d764kExZhf7IkKvUAaLejnhpTeNhnp/CAn1/sTq84rpW/WaNChvXlxj+XWNXbqH23bo467AOdVwsk11S6RpgYcET15nvKKN1lcxk+A3GIXxqoSPvt+5/AD+Z791hYtFqvS3rnDpelGcQS17kNF8xyAjhI6Q0YTOqzpRzfNx0xWw6MRhe6NXb1Kxr8LkAk+Xe077VrZJmctbVhPXFD86T8txpKSSCL77zVs7d/+xd/+Fnv5tVpvtPzMFdv/WJ2K10FRe9S1D567V0HGWPGfZHjcWtb+EMgp3bMacqVrOlllj5ZAOKuCdGfGr33DYOzXo371njk6q+909d0kFLvDKkdMgYcGxuz+ZOriqCnfwBgfWN0jAdW9D6Zka+NLawojcAh69uWlm4cqXu7f0c+9GxTzIXlTsp9+DimmYwcSIXYKGegUIC/UKpOj9mK7ZM5FWD1FR13PI1Cxny9yuItw3oUbduf5Z55UP1ag1FIO11Z89zr41uUgNTfelWDh1pVk47nVpCtGUi5gGtRG5cWnOlGaqKIoa/nS6QRZn76T2X3/ts72XXlE0FRlGzavhgpEs3jvtbXPZfZuho+I+1gWdgwcz8M51Dv17Eljpp9WcA3JHyOwbS7brTRQmcI1eF1WxxNRxwzqmnXHXKLYIxuEg/9arHF7i5eudFy6YDkY13Hl1NqrBzIvbclqncB7k3PrybQChzLM1J6rkDIKgc2OBhR8MTxVl69j4feMb/B7/+J7CjwWwYo77GbZlrlAK5JI6GTbAhf5r6ET6WbiSLi4/ANGKiS9LYbMsKiLTGBEekz0lG7eBo1ZrGZJerRWRDt13cMfYhIHqGp8NVSua0Bchrh54FFfK7qR9d930cf7+oN0MJECCBr3EivMSq+JLthquNfCM3lq0leOipaEWjSpctLRgrQBb+uGQUQuHtCY4ZCuAI5bqp7W+XmWrmNWwWL8a7lapil2a1HxGh9LqU1aDyapAGTWp95bRU7SKYsksRSCvQYg6hRMtK41jJiO3+L4bcPY5J0q0yjKjH/YgAHKqxReqR1CWMwqC1g2U6F3MiN7FvvI2ly5nROyiEavhfSRDixaotSzdV4TtlVzn+oirXaKqLaRq+XTw1JKAN3/QzLKAOK9lQtM8sZqLWDg/YF61cKjlwqxQVszKYsWM+FXMSF1FS97SopYt7VhCjpFhMmdZIcYWYGyRYYY4f7ek0CsbiEhQEJFgxhIGtBzATHkU+eoUUozRQ/os13sm/FazWrHmGQbX79didZrNPR0LEt5jMx5N74c1n8kUEelncm9os6LH6lu0frNMQnGInjBMNSeBb2wck1PixCpW0x2KaWA1E45pcBUTkumgOios08A6JjTTQUjzwswfB4Vn4qb1EydQtMTI8dTgxB8Pih3v+QHuVPASMv07JauEbPJNKMAw51W5b5Wo/I1OmuBCTN26hnlzJGh6HarDJ11iR38840WGTc9PQ95IsYnzQ2ltQ6eEpn65IVfUk4tbDyg5ZSvF/RKUPtIq5IUGF9dtvAbelq0OpkDXwFWXtJKBwkWmBm5OwOWQTB0p1LVwmjI1sIDvwmOAGWlg1kp1xTfSGNc2MAk0T0ha805yGd30TnoVs5sBryU2Pi7qlD2M7ERxnSq6jJdZAldWj/jcWucZ+Dytp2UejTwNM/fZSc5OqD112Sky06FGr4cuw7SHpdF+ogUeDCkvxxweR+AfHhPjYzN4jI9NN+AIxsem1uDwlxeqFbg9CTVqcNSXF1bxehx+q/A7Jm1H5XcEf4/icYSui0ePHMbfITgKcL48PraRjo8lMUdxaoaFoPHXifxQwV+DGt74WL02OTHmTk6Ml4cKTnkhD9WOjdDejZXh4WJhaWixNpvfnOkXwh4Y8IYDYgEbyEE6Q/9xOAEtzkf7NHmXFNCNKA1nUWSIMTxjqlPL+VTL5X2lg4D55EjWVDKtBoEpUppLGFMbxOExZm+enwvIN/mnS14iEi56Ob37yf6335KQ+4efxToOG87hAxGPAwwsUHwinBW0vmjHzySkaTqlXDfy5F5+Q+Mu4QBqYZU11rKaDfRrBwmJbGqR20h92vHCMwoIwV1X7FjobqhaRS7Q46jsRl5VPLtjnsMQ07Gjy0yJ1KaqzOHe8188/vut3Td/VHOYRUUP0sYGZgnRGYSIbtMPF2tiujHiidEIiTzlt281nCpqR7RVuoKKnRekEi/A9+imir9Ee+XhLu+5xK1gcls1RmlCGlNFN8q1uJLrh/UjJgER/E84ljFIGJRq8aXO5Y86X3z3+N23xRFeoPfBJ4uGrjmo89GubgMMwYB963537t2DrlmM2QiDXBg4uS3Pp9DXmbf5ZPqvSxv4gEip2nDTWcDvq4K8xKlP/rxkf8UIirj541huk3ybKGosvqvkFl2SmLF3v9199YrqF2AFDAq4e+xt0AJPtQ8xECxwlRedeTDlTlO/u11YaVBlp24oAZcJdrmWYxECxk8puYSgfnepN5c6K7llmmkQdV2MIk6fkQedczF8yZiRDYpKnpQkVa+GnqxSo313M4fenynIdqQIn9veu/7D7pvfdXflDPd0E1Vp87buhKroDsYs6BhNy0B/fEri6WKs7UaEfv4uRTZBQ4AeUuxi7ka8pe71DG6V7kelMLZHqGFVMAOcHikI2iXey6wH23ntzN69j/Rg+6HDY+qPCupbwz2ISIsuJMayGPx0uqr771x4QyxyAS2zTMPrUgGtZMNLYnc0h3Q9KgF75sQPug7p/KAhsP09KrW3fdZkgcSHkTNKZNy1APmuDUkXK4BuYm5SRj7ZIkWfLGhGFDTuc+JIrzzf+eKfnTMv7H3yQefeS//3I/81iYIa7f2H7NYpctVCpqOQffvtexpT5eXftyFgKIF6pUDXUs7/2xwr4VaD1Px1tQcA8Np99/zunTNqG8AAvKzx98UuM4+DUOw3iaZu9yxmsNWzyNiqWRSN81AImvUQGlsGPHy2Px5CEpIAX4xtxNwu7EVlzTFM/wnGkDjhkNg+e4dBywwc07v7PX797N5nX1rv8f9bozEvNo1DPxJM7jWXCz13ZvAQ3KABtQqHvBnlGNP3RQIWFiYIC61vT4J70EgRbAXg9qD+r8+8dWO/zT6KvRuv4pK+9Sj+nxiFfgSMv3oESrKezw0mh+hwi/kLyBjZF20D5ck+Y5TMe9Blobx7ukEut+b6/z50LWrziZpUaVsF2BzLPsFVILR80qW+3d7OXidOnTOARJxr1m2g9CkbsD6BPnbunt25r8PJS6sM56KeYreXW/WrrQszg1O9y9C4ZzU06LYMLA+ECMdPm6hbgTIESpbqhW+m614U+mt+WOX7add90zgqmebwhcRpOUfNsCate94jD/hLMFmfU8hOCmr58J3HH5/vXLm9e+VzEYkSr9S+Vs+5WXwqaYLZBDF7pY2Hqt3qQoArY2w9xoWJ4lX0OcDNwAoVit/45c7dq4xHdl76zEa/Cegdtj1i6u7zivb9h46gOxiw2gGA2wgIQpkCS1GCXurGZLFXfZgc9tIR56/nFCPclyThok5Enm7/s32DjfAkucwwL1FWe37BQNnkVPDGYg+yZp/qTded4kiYf+OkZbyDq4zpR0u0mvThzg9Xd187vfPwA/mA9BoCrR0FtrG/62ZmIcCljO66FxVDEcHr1SQ/LXe71WGR0+uDN6BmxiUFPtBN43z29u7bL2uXFMs/xuetTLZbDBc53VWkD7P8afWStW5zZ902bntRsa/VBK0vxQPsLhU2GA02u6DJZb6/qWW+j3nINg312DQK/W0r/YwZI/2NGEt9rCm2JUVJSxldn00BPRaAxazqrxX+rKqPS2OoEvcYr1xVikp1gEp1tnKPHj2fUaK1Aq235siGflJmSTrwxacMdFdLbdUKq4SoFu1QVDtyoCS9UKmFtHUGVUHUBGnZ2SiBWQ1U634H6E79FabBKlIftaiPMmTrQQOVjX4axgCdop8e0Ud7sBWHg+XsnxGuDxSnB4jQPYKzLTMfJGoOlC8Pkij7S5F9ZEdbbBwshPWVvAbJWr3yVUaq0gJVRtIZVQLOqC3RjFqCzKglvmjJRRhaX3llkJzyc/LJqC2ZaIFEerLg2yC7ARUNr9cc3gRSVAzNZm4U3qLfjW6W183vDGMpas6WLdNMRjOW3mVTzdCXMV21NO1aMx1QRy+YDrqvV0sHV5Cl0gEV9DrpYCx5kfQ/ByySGnHlxAlhwif+86AF0gb+eSc93qEGvwHtU5LMJJJru+aZ9Ty3pHNxU2gyWjqrubIBDE5wQ5hKEV0KnS1ZKIVfb53G5mF0OOCG0BuFOOMTTvUcOqUUI6/x7ja+4lYujAtewwgX0nATF564tZp05da34NmkcUDx2+iXFkUdjxb91nFtLmxIH/hLm7d41xbuHKhQbmkZBZ2lFR6nu0aZr711ysoONeFyS1/zVjrcQMeR2Byfc3uv0mXYDHHlj/aVUUJrB6BhmeTz4ZzaOPxNlW8HTq1RRS5nvPbcQFcA2VRVCKkBFMOkr3EFPNP3+QSXRKGWvg4pwJl+6JnH6/rqYekHo56DnnU1wWoqzZzxhJiZMZNgDc8aiEFZI/dki6Qry0vqKDQpHt1S91HYWJzpV/60B/7IL66PLh05vILH8tBGszBU+ON8vjGbL2wUJ/NzQwX4Py+R7JoqYh0GrJvJW1d/mdBXhSMTeWiDacChcLhY2BjPDy3+dTH/X31zgDvtGzBxVYoXji9sFJbgObDGUFZ3KFoS3WOXNcxPpO+gnBKHJV5YKmPeVrpTT7xNkieAww1xjPNGjv9hOIj257Qx+v41+Nt5eG3/ZfFpM+jgEponUT5sTALPpaxsGSTCQAJ9GARABvb9lMUN7pC754wgxFiwW+i/c+aM7M2OvQZuzwXJGt5C2uZjFaUul0k1KAobHrAW3unnJCoBZyNX9lSzeQngavKV1zAdLqt2n+6+cGb/xvO7z3/d3b3OyG6KVNxt07mVld102LQys3NXytWKe1KuViGIBR6uAFM2T2iboLZclcKE4sVhKXm+6cotVZmKXVWMdgFBge/QVpFY/F5l2O2bFGH+ziudi28ALjt3L1qjTkKYRafi+RiW2Yw8aWLaiKgZu5gX3JHdUPpWpkXixkD/G1lEdNfir8+5B7n73VOnOw9fkKwyoRejAgMzj5vcybUV88eexHAhFKTBq9GioFRs2RUx9zBWJPMIUBiQtxa5bwpVHFLkPA7/8MW5nTuv7987vXvqE/UYQAlonoSO0VlsTDxWo/Y2OgJgShf8WlnF8YBIg5zI6VsiDFZmAhyqPuA1R/86ZG7cy+7tN/df/DEb0Nkrk65qR7nDuAPohRrpeHiDalPEdaosQfE8iVh2uULTixNNsaR+PLN36xxM8P6pi1acX4bmCn1hQLLv1gs3dNh1qRZkK4K8PE4TK93kUo61zb3sXjlnmWjgUTigaSYpUR+SYdBPAJf2AxLO1R0nDsuyrOs7oJLEUg60q85+y0hzcnVQFBd5pkugA5RzbCaS+I7vf7v39Ts7917Vm0sBekmC/NCjYoMMlQ58qvxM+/Wknin3Yz1TfB8x0Qe+uj5mph7j2Cs4XHyS9PaeTEMOse2gz3KMxLFlaqOFUxVTCmlfbpAHy6OLCW5GjtBlGNns/rff7jy4tPvhm7t3tsXJeaN9reGozzcIY4mSXk7DCn04UKhLqddarqtuK1FXTdO97jWHuw7Q7k3WOOp59+oPu6duKDdt9Cuu4LeL3w3rS/AN+c2mjN5V5T7nSWlhTTKPJKifOy5/uakq5V2cQfsm6Et3cVvTNUrAdOXD/S+u7z//ws6dT+SFBrAx+lVIPAiyY3Fvcc6EiaB3OnJj8qvQRSYQhNWz6k74RfjoPMma3Clyi2s31WNPgS5iRjkcNzxY4Ff1Qw2KQIXRqugekXHc4BJ7ip/h+wIPAN5naIbvjhON0QNAbi2zoOq2764rA/PXDVxx5zypH4M+9/j+u527DyTdNvRMGYIiyTwTpVRUhq8VDWaSypTKAq6mEs1IZ/WczjAjHdG2Op1Yhnvb//IDO6UMBmcB3TSMQIBn16lEMrch3ULXfNRc4a7a7KSiasG751Pb4H83dnWvTQRB/F8pfRfEjxffxCdB7Qm+h2uzSU4ut+FySY3ik1qEIkUQv32otKKgiFCoVvtU/E9M+m84H7uzs3cXEfqR253sbGY3M7/Zjxk6alWC6UnDu2d5l45glWYAFVVqnH/5qVwhRVd4bUfG7OgI1NzicHe+deinBJ6qAfmzDuVucEHlrrZBAT3z2XyuAtvhlh6leZh6XTklTRzmRx8W7tyFLQEEYQT4sR3wSGIgRnfFQCp48gNuyfniJ8yyVCpnGJ0gP9klfAUj4oopfU4p0U5BBw3cZISvA1mw9/P9Y5iKpw/ckgfz3uB4lCM5zeL4YmYaM9lw8RSQ4QYHo/SUqKnwdenZkpgxsurdmDEIevuNYswGOEClIXbCJwuxORpnXGHnPCFM61KE9CnpD/9FIw2/OMvevYIfsNDw4/ItnylTbJUvx1P7fBdlTOU0Xpug5LDxmz6AJyEeaZvjd/75vs1Ne40FuBE1Ns7jDUsYopdNcby4gEruplMom2miWY7JIGiMFOHvJyNcAB+42+eUHYPO5/9aHPwErTXfY01te5gjaoXZ0+1cW/QBMAHbXuZyiGEy9xXkTJlRqgmbBOJ7jceGQqV5lqgWH3+b73xlZoIsCUl1s6o0U+tSCffI/gIvKk197u4pFc/q1IbLkXnX6ArO6uenJcoa+rTp0vrtHwO2nO89d8f2pUXTtE7SC9OwUdEb/2GpGh3zvYkMFvdIGazQPCbuss5JMKrQtPUFiaW43gOOokYZkbpBLh8L1lGnrx9iL7YeNfm3y4XrlssFKv9HLsVVLZePRUMuW4+UXMqs5D2Bse3jd6PsGw6WRxXDzBvzmcXQ1OXJF1AZQAzw3uCkFXqATwAoLW7FTS1/WfJJrzTsSlo/SpTdLadYvjiLPz+Fibx4+2L+y6V/weZaUM0YO3C7IRtH/g+pqD4EzjG0Ie5KIpr5iOJF8CJ0YD3igDV9d7O/Rp+tD/kKj4ZXnlY400XWdQxkQ3vaxH6+83Lx7EdLJ1I6sFnrQsHHOGPCwlCknGhiWL4CKJzxLGfguX/cvlmHCwzo0l/hO6j+Jfq/UspO/xXl7IuDH/vWifaqE+VQJ5EbnUQutHjP2mNdU17qmnJL10JDNR9UPE8BMejm+HiE6OFIKMLWCuVIKhfSkSdCnIQ24sLIPQuOmfeRxCUSH6juiYgHwsjfexDOvwgeRQPCC3CXIH2ExxU09wi4iYUF/3rjibmU+rx5l58c8E3ZAGU1gA2wVQFWDjmfSYR5FYeeXvas5SxTGukpjIf2c5xm4wlHFYEpgA92wI9ppepwGuCTq9NwRgMZhyWM+++xyy2HW24KZBGgEkOJy2Re2YL7ZzHZylRrIx2b29gmx3VLzZwYt1qLpPajh1rdUgMhZiGoYL4F6JS+lLQqU1GhDb2V1HRWEmurWFUnWkWJdmrZ9CGHYkW/sb7l00YRNnxaa8N2z5Jqv9nTVh22epb0jTd6zi7b6MF3VZ2O0tmds26jR1i73EM5rRJX+STtmS5uBOGFdv7oyGuW5iNaYr54afUO7svQbTslnPu4eYmLvZTvSMgvKHIvqfurOR4YwOUnRXleU3qp+W5GlOdiSvoUfluLP0e1SnBfDZ2MUhgQldRJbh46ieLUKIYTcOFIpM4HLbIeeDjwsYfpjQr3GEAWpVkfTuiJ5X4dXnY6q/f+AjoSjoc=";
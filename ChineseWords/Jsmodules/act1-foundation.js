@@ -80,7 +80,69 @@ export const p1_1_greetings__goodbyes = {
     ["请保重", "qǐng bǎo zhòng", "please take care", "por favor cuídate", "s'il te plaît prends soin de toi", "por favor tome cuidado"],
     ["慢走啊", "màn zǒu a", "Walk slowly", "Ve despacio", "Marche doucement", "Vá devagar"],
     ["请慢走", "qǐng màn zǒu", "Please walk slowly", "Por favor ve despacio", "S'il te plaît marche doucement", "Por favor vá devagar"]
-  ]
+  ],
+  accentFree: {},
+  tonelessPinyin: [
+    "nihao",
+    "ninhao",
+    "zaoan",
+    "wuan",
+    "wanan",
+    "zaijian",
+    "baibai",
+    "huitoujian",
+    "xiexie",
+    "duoxie",
+    "bukeqi",
+    "duibuqi",
+    "meiguanxi",
+    "qing",
+    "huanying",
+    "haojiubujian",
+    "zaihui",
+    "baozhong",
+    "manzou",
+    "nihaoma",
+    "nihaoa",
+    "ninhaoxiansheng",
+    "ninhaoqingwen",
+    "zaoanpengyou",
+    "shuoshengzaoan",
+    "wuangewei",
+    "zhuniwuan",
+    "wananbaobei",
+    "shuoshengwanan",
+    "zaijianpengyou",
+    "shuoshengzaijian",
+    "baibaile",
+    "shuoshengbaibai",
+    "huitoujiana",
+    "womenhuitoujian",
+    "xiexieni",
+    "xiexiedajia",
+    "duoxiebangmang",
+    "duoxieguanxin",
+    "taibukeqile",
+    "biebukeqi",
+    "duibuqiwochidaole",
+    "shuoshengduibuqi",
+    "meiguanxide",
+    "zhendemeiguanxi",
+    "qingzuo",
+    "qingjin",
+    "huanyingguanglin",
+    "huanyinghuilai",
+    "haojiubujianle",
+    "womenhaojiubujian",
+    "zaihuipengyou",
+    "womenzaihui",
+    "baozhongshenti",
+    "qingbaozhong",
+    "manzoua",
+    "qingmanzou"
+  ],
+  pinyinUnits: {},
+  distractors: "B*BA*C3*EKA*C3*EK7DE*EO*HmCEABCD*Hp*JEQABCfABChKLMJjABI*G8*G+*G/oHLMHKMTrHKL5678ABCDxVWXF*Er*JF*EU*J32*JVA*DI*EE*EG*I8U*BNAHTA*C2HPWXYPVXYPVWYcPVWPVWXPVWXPVWXYPVWzPVWPVWXGHKLPVWXHPVWnqsxIHKLPVWXPVWXPVWXiqsxKPVWyinqinsxMPVWinqxuN*DmAtNABPVWXPVWXPinqPinpdPVWPVWXPVWXRHKLSHKLSHKL"
 };
 
 export const p1_2_personal__pronouns = {
@@ -147,7 +209,63 @@ export const p1_2_personal__pronouns = {
     ["尊重每个人", "zūn zhòng měi gè rén", "respect everyone", "respetar a todos", "respecte tout le monde", "respeite a todos"],
     ["某人曾说", "mǒu rén céng shuō", "someone once said", "alguien dijo una vez", "quelqu'un a dit un jour", "alguém disse uma vez"],
     ["打听某人", "dǎ tīng mǒu rén", "inquire about someone", "preguntar sobre alguien", "se renseigner sur quelqu'un", "perguntar sobre alguém"]
-  ]
+  ],
+  accentFree: {},
+  tonelessPinyin: [
+    "wo",
+    "ni",
+    "nin",
+    "ta",
+    "ta",
+    "ta",
+    "women",
+    "nimen",
+    "tamen",
+    "tamen",
+    "zanmen",
+    "ziji",
+    "bieren",
+    "renjia",
+    "dajia",
+    "meigeren",
+    "mouren",
+    "wolaile",
+    "woyuanyi",
+    "nizhenbang",
+    "nilaima",
+    "qingwennin",
+    "mafannin",
+    "tashuode",
+    "zhaotaqu",
+    "tahenpiaoliang",
+    "renshita",
+    "tahuaile",
+    "weitachi",
+    "womenyiqi",
+    "womendejia",
+    "nimenxianzou",
+    "nimenxinkule",
+    "tamenhenhao",
+    "yaoqingtamen",
+    "tamendoulaile",
+    "dengtamen",
+    "zanmenzouba",
+    "zanmendeshi",
+    "xiangxinziji",
+    "kaoziji",
+    "zunzhongbieren",
+    "bangzhubieren",
+    "renjiabuyuanyi",
+    "xuexuerenjia",
+    "dajiahao",
+    "dajiayiqi",
+    "meigerendouyou",
+    "zunzhongmeigeren",
+    "mourencengshuo",
+    "datingmouren"
+  ],
+  pinyinUnits: {},
+  distractors: "*ANBCD*ANACD*ANABD*ANABC*ANABC*ANABCHIJK*AAGIJGHJKGHIKGHIJoGHIQ*DI*DJ*IkO*Dv*KP*J8N*Dv*Ikt*GNRSTM*Ik*I0*I2*HEPST*Ez*EYPRPRSU*ATPRSPRSTPRSTPRSTPRSTdefhPRSTPRSTPRSTZefhZdfhZdehjrvwZdefZdefgrvwJPRSZdefZdefZdefLPRSZdefZdefgjvwZdefOPRSZdefgjrwgjrvZdefZdef"
 };
 
 export const p1_3_demonstratives__pointers = {
@@ -217,7 +335,66 @@ export const p1_3_demonstratives__pointers = {
     ["就此", "jiù cǐ", "That's it", "Eso es todo", "C'est ça", "É isso"],
     ["彼此", "bǐ cǐ", "each other", "entre sí", "l'un l'autre", "uns aos outros"],
     ["知彼", "zhī bǐ", "know the enemy", "conocer al enemigo", "connaître l'ennemi", "conhecer o inimigo"]
-  ]
+  ],
+  accentFree: {},
+  tonelessPinyin: [
+    "zhe",
+    "na",
+    "zhege",
+    "nage",
+    "zhexie",
+    "naxie",
+    "zheli",
+    "nali",
+    "zheer",
+    "naer",
+    "zheyang",
+    "nayang",
+    "zhezhong",
+    "nazhong",
+    "zhebian",
+    "nabian",
+    "ci",
+    "bi",
+    "zheshi",
+    "jiuzhe",
+    "nashi",
+    "jiuna",
+    "zhegehao",
+    "maizhege",
+    "nagehao",
+    "yaonage",
+    "zhexieren",
+    "maizhexie",
+    "naxieshu",
+    "nanaxie",
+    "zhelihao",
+    "zaizheli",
+    "naliyuan",
+    "qunali",
+    "zheerhao",
+    "laizheer",
+    "naeryuan",
+    "qunaer",
+    "zheyangzuo",
+    "jiuzheyang",
+    "nayangshuo",
+    "xiangnayang",
+    "zhezhongren",
+    "shizhezhong",
+    "nazhongshu",
+    "mainazhong",
+    "zhebianzou",
+    "wangzhebian",
+    "nabiankan",
+    "qunabian",
+    "cifan",
+    "jiuci",
+    "bici",
+    "zhibi"
+  ],
+  pinyinUnits: {},
+  distractors: "*AN*A5*A6*A7*AN*A5*A6*A7DEGICFHJCFGIDEHJCEHIDFGJCEGJDFHICEGIDFHJCEGIDFHJCEGIDFHJ*AN*A5*A6*A7*AN*A5*A6*A7CEGIVzAnDFHJTzBCYei*HIb*FDCWW*HIDXDWXYqEWXXEWYsFWXFWXYWiGX*HLGWXkHWXlxHWWe*HMIIWXYgJWXhx*HNJ*HQKWXKTWXLWXYLWXYaMWXMWXYcNWXNWXYOWXYOWXYPWXYhlPWQCDETV0QzQRCRCDE"
 };
 
 export const p1_4_yes__no__responses = {
@@ -287,7 +464,66 @@ export const p1_4_yes__no__responses = {
     ["真没事", "zhēn méi shì", "It's okay", "Está bien", "C'est bon", "Tudo bem"],
     ["很准确", "hěn zhǔn què", "Very accurate", "muy preciso", "Très précis", "Muito preciso"],
     ["不准确", "bù zhǔn què", "Inaccurate", "Incorrecto", "Inexacte", "Impreciso"]
-  ]
+  ],
+  accentFree: {},
+  tonelessPinyin: [
+    "dui",
+    "hao",
+    "xing",
+    "meiwenti",
+    "bu",
+    "meiyou",
+    "bushi",
+    "buxing",
+    "bukeyi",
+    "mei",
+    "bie",
+    "haode",
+    "shide",
+    "duide",
+    "duile",
+    "suanle",
+    "meishi",
+    "zhunque",
+    "daduile",
+    "shuodedui",
+    "haoa",
+    "henhao",
+    "xinga",
+    "kexing",
+    "meiwentide",
+    "jueduimeiwenti",
+    "buyao",
+    "duitou",
+    "meiyouren",
+    "zhenmeiyou",
+    "bushiwo",
+    "zhebushi",
+    "buxinga",
+    "zhenbuxing",
+    "bukeyizuo",
+    "zhendebukeyi",
+    "meile",
+    "zhenmei",
+    "biezou",
+    "bieshuo",
+    "haodene",
+    "zhendehaode",
+    "shidene",
+    "zhenshide",
+    "duideya",
+    "wanquanduide",
+    "duileba",
+    "shuoduile",
+    "suanleba",
+    "jiusuanle",
+    "meishide",
+    "zhenmeishi",
+    "henzhunque",
+    "buzhunque"
+  ],
+  pinyinUnits: {},
+  distractors: "*AN*A5*A6*A7*AN*A5*A6*A7*AN*A5*A6*A7YIST*AN*A5*A6*A7Qk*DuJ*B+*CAHaGXa*Epi*EVDS*AN*A5*A6*A7*AN*A5*A6*A7MNU*D5LN*HFqLMObNPbkOk*Ds*EPFk*D/*Im01FGvODIDIScLW*D5*Gg*AA*AB*EKBUCgFH*EV*EpCDiptjYipGH*El*ErNO*KTAF*KQDIzFlDGDIS*B+GDIHWDIHDISIYptZYipFOPQJdzF*AS*BFn*EE*BFm*InKqLDIYitDoMDIMDISNDISYipDwODISODIuPDIPDISQDISdQlD1RDI0RDI"
 };
 
 export const p1_5_essential__verbs__i = {
@@ -360,7 +596,69 @@ export const p1_5_essential__verbs__i = {
     ["早起", "zǎo qǐ", "Get up early", "levantarse temprano", "Se lever tôt", "Acorde cedo"],
     ["到了", "dào le", "arrive", "llegar", "arriver", "chegar"],
     ["到位", "dào wèi", "in place", "en su lugar", "en place", "no lugar"]
-  ]
+  ],
+  accentFree: {},
+  tonelessPinyin: [
+    "shi",
+    "you",
+    "zai",
+    "lai",
+    "qu",
+    "chi",
+    "he",
+    "kan",
+    "ting",
+    "shuo",
+    "zuo",
+    "gei",
+    "na",
+    "zou",
+    "zuo",
+    "zhan",
+    "shui",
+    "qi",
+    "dao",
+    "bianshi",
+    "suanshi",
+    "youqian",
+    "yongyou",
+    "zaijia",
+    "suozai",
+    "laiba",
+    "kuailai",
+    "quba",
+    "kuaiqu",
+    "chidiao",
+    "chicai",
+    "hewan",
+    "hexie",
+    "haokan",
+    "kankan",
+    "tingge",
+    "tingting",
+    "shuohua",
+    "shuoba",
+    "zuoshi",
+    "zuowan",
+    "geini",
+    "geiwo",
+    "nalai",
+    "nazou",
+    "zoudong",
+    "kuaizou",
+    "zuoxia",
+    "zuowen",
+    "zhanqi",
+    "zhanhao",
+    "shuizhao",
+    "shuiba",
+    "qishen",
+    "zaoqi",
+    "daole",
+    "daowei"
+  ],
+  pinyinUnits: {},
+  distractors: "*AN*A5*A6*A7*AN*A5*A6*A7*AN*A5*A6*A7*AN*A5*A6*A7*AN*A5*A6*A7*AN*A5*A6*A7*AN*A5*A6*A7*AN*A5*A6*A7*AN*A5*A6*A7*AN*A5*A6*A7*AN*A5*A6*A7*AN*A5*A6*A7*AN*A5*A6*A7*AN*A5*A6*A7*AN*A5*A6*A7*AN*A5*A6*A7*AN*A5*A6*A7*AN*A5*A6*A7*AN*A5*A6*A7*B+*CA*CoU*B+*CA*Co*Cx*KQBTU*CnBTU*BG*BHCT*HgCTUbm0Dcru*I6Zm0Eau*Ek*EneFTUdFTUgoGT*Bw*Bxf*Gf*Ct*C2i*GghHTUkITUjITUm*J6JTZbl0*Cyo*ImKfnKTq*A6LTp*A5LTas*JAD*AS*DIruNTUV*AS*DIacwOTUvOTUy2PR*AA*AB*C3x0QTUZbmz*JmRTU*ACx*Hm*JC*Cw*Cx*DG43*Gk*HGS"
 };
 
 export const p1_6_essential__verbs__ii = {
@@ -433,7 +731,69 @@ export const p1_6_essential__verbs__ii = {
     ["须要", "xū yào", "Need", "Necesitar", "Avoir besoin", "Precisar"],
     ["肯干", "kěn gàn", "Willing to do it", "dispuesto a hacerlo", "Prêt à le faire", "Disposto a fazer isso"],
     ["肯做", "kěn zuò", "Willing to do it", "dispuesto a hacerlo", "Prêt à le faire", "Disposto a fazer isso"]
-  ]
+  ],
+  accentFree: {},
+  tonelessPinyin: [
+    "yao",
+    "xiang",
+    "neng",
+    "hui",
+    "keyi",
+    "yinggai",
+    "bixu",
+    "yuanyi",
+    "kaishi",
+    "jieshu",
+    "jixu",
+    "tingzhi",
+    "deng",
+    "bang",
+    "shi",
+    "yong",
+    "gai",
+    "xu",
+    "ken",
+    "yaoqu",
+    "woyao",
+    "xiangdao",
+    "xiangqu",
+    "nengzuo",
+    "nengxing",
+    "huizuo",
+    "buhui",
+    "keyima",
+    "keyide",
+    "yinggaiqu",
+    "yinggaizuo",
+    "bixuzuo",
+    "bixuqu",
+    "yuanyibang",
+    "henyuanyi",
+    "kaishile",
+    "gangkaishi",
+    "jieshule",
+    "kuaijieshu",
+    "jixuzuo",
+    "jixuzou",
+    "tingzhiba",
+    "qingtingzhi",
+    "dengyixia",
+    "dengdeng",
+    "bangchen",
+    "bangbangwo",
+    "shishi",
+    "shiyixia",
+    "yongta",
+    "yongzhege",
+    "gaizoule",
+    "gaizuo",
+    "xuzhi",
+    "xuyao",
+    "kengan",
+    "kenzuo"
+  ],
+  pinyinUnits: {},
+  distractors: "*AN*A5*A6*A7*AN*A5*A6*A7*AN*A5*A6*A7*AN*A5*A6*A7*C5*CqbcQdeERfgE*K8*BLhijkEFlmEFnoEFpqEF*AN*A5*A6*A7*AN*A5*A6*A7*AN*A5*A6*A7*AN*A5*A6*A7*AN*A5*A6*A7*AN*A5*A6*A7*AN*A5*A6*A7*D0W*DcA*A/*C82*F1W*DqBE*D0TV*DcYZ04*Cp*C5X*CkX04*Di*AQ*Co*Cp*C8cEdebEdeeFbcdF0bgGbcfGbcHbcd*BLHbcIbcdIbcdJbcdJbcdoKbcnKbcLbcdLbcdwbcdMEFG*K2NEFbcdeOEFGrbcd*KS*A+PE*CD*BubcbcdeXZ4*Di2REF*C8U1*F14S*JKEXZ03"
 };
 
 export const p1_7_numbers__010 = {
@@ -497,7 +857,60 @@ export const p1_7_numbers__010 = {
     ["末期", "mò qī", "final stage", "etapa final", "phase finale", "fase final"],
     ["整齐", "zhěng qí", "neat", "ordenado", "ordonné", "arrumado"],
     ["整合", "zhěng hé", "integrate", "integrar", "intégrer", "integrar"]
-  ]
+  ],
+  accentFree: {},
+  tonelessPinyin: [
+    "ling",
+    "yi",
+    "er",
+    "liang",
+    "san",
+    "si",
+    "wu",
+    "liu",
+    "qi",
+    "ba",
+    "jiu",
+    "shi",
+    "di",
+    "shou",
+    "mo",
+    "zheng",
+    "conglingkaishi",
+    "lingshi",
+    "yimuyiyang",
+    "tongyi",
+    "erhuabushuo",
+    "diertian",
+    "liangquanqimei",
+    "sanyanliangyu",
+    "sansierxing",
+    "sanfanwuci",
+    "sijiruchun",
+    "simianbafang",
+    "wuyanliuse",
+    "wuhusihai",
+    "liuyiertongjie",
+    "liudianban",
+    "luanqibazao",
+    "qishangbaxia",
+    "bachengbawo",
+    "badianzhong",
+    "jiuniuyimao",
+    "jiusiyisheng",
+    "shiquanshimei",
+    "shinajiuwen",
+    "diji",
+    "paidi",
+    "shouxi",
+    "shouyao",
+    "mowei",
+    "moqi",
+    "zhengqi",
+    "zhenghe"
+  ],
+  pinyinUnits: {},
+  distractors: "*AN*A5*A6*A7*AN*A5*A6*A7*AN*A5*A6*A7*AN*A5*A6*A7*AN*A5*A6*A7*AN*A5*A6*A7*AN*A5*A6*A7*AN*A5*A6*A7*AN*A5*A6*A7*AN*A5*A6*A7*AN*A5*A6*A7*AN*A5*A6*A7*AN*A5*A6*A7*AN*A5*A6*A7*AN*A5*A6*A7*AN*A5*A6*A7SUWXATopQUWXBRopQSWXfjQRQSUXQSUWQSUWQSUWQSUWQSUWQSUWQSUWQSUWVjQRQSUWQSUWQSUWVfQRQSUWQSUWQSUWQSUWM*G9RTM*GKRTr*GONR*C8*El*FHqtORTsORTv*GqPRu*GqPR"
 };
 
 export const p1_8_core__measure__words = {
@@ -570,7 +983,69 @@ export const p1_8_core__measure__words = {
     ["成群", "chéng qún", "A group", "Un grupo", "Un groupe", "Um grupo"],
     ["一副眼镜", "yī fù yǎn jìng", "A pair of glasses", "Un par de gafas", "Une paire de lunettes", "Um par de óculos"],
     ["两副", "liǎng fù", "Two pairs", "Dos pares", "Deux paires", "Dois pares"]
-  ]
+  ],
+  accentFree: {},
+  tonelessPinyin: [
+    "ge",
+    "zhi",
+    "tiao",
+    "zhang",
+    "jian",
+    "ben",
+    "bei",
+    "ping",
+    "kuai",
+    "xie",
+    "ci",
+    "wei",
+    "shuang",
+    "kou",
+    "tao",
+    "zhong",
+    "pai",
+    "qun",
+    "fu",
+    "yigeren",
+    "shouge",
+    "yizhimao",
+    "liangzhi",
+    "yitiaolu",
+    "jitiao",
+    "sanzhang",
+    "liangzhang",
+    "yijianshi",
+    "jijian",
+    "yibenshu",
+    "liangben",
+    "yibeishui",
+    "jibei",
+    "yipingjiu",
+    "liangping",
+    "yikuaiqian",
+    "jikuai",
+    "jixie",
+    "haoxie",
+    "yicijihui",
+    "jici",
+    "yiweilaoshi",
+    "gewei",
+    "yishuangxie",
+    "liangshuang",
+    "yikouqi",
+    "jikou",
+    "yitaofang",
+    "zhengtao",
+    "yizhongfangfa",
+    "jizhong",
+    "yipaizuowei",
+    "qianpai",
+    "yiqunren",
+    "chengqun",
+    "yifuyanjing",
+    "liangfu"
+  ],
+  pinyinUnits: {},
+  distractors: "*AN*A5*A6*A7*AN*A5*A6*A7*AN*A5*A6*A7*AN*A5*A6*A7*AN*A5*A6*A7*AN*A5*A6*A7*AN*A5*A6*A7*AN*A5*A6*A7*AN*A5*A6*A7*AN*A5*A6*A7*AN*A5*A6*A7*AN*A5*A6*A7*AN*A5*A6*A7*AN*A5*A6*A7*AN*A5*A6*A7*AN*A5*A6*A7*AN*A5*A6*A7*AN*A5*A6*A7*AN*A5*A6*A7*BI1VX*Bu*Bv*F0*F1TXbdaeisTVbdcgkla*FODUWZeiTVXdYgklTVXbWaisTVXbYcklTVXbWaesTVXbYcgl*Bw*Bx*D4Y*Bw*Bx*Ct*C2pxz3Ycgknxz3*EQ*HGLUTVXbWaeiTVXbYcgkTVXb*F4*F5*FZOnpz3*B4*B5Ycnpx3*HlQUWTVXbRUWYnpxzWaei"
 };
 
 export const p1_9_basic__question__words = {
@@ -631,7 +1106,57 @@ export const p1_9_basic__question__words = {
     ["有多大", "yǒu duō dà", "How big", "¿Qué tan grande?", "Quelle taille", "Quão grande"],
     ["多高啊", "duō gāo a", "How tall", "¿Qué tan alto?", "Quelle taille", "Qual a altura"],
     ["有多高", "yǒu duō gāo", "How high", "¿Qué tan alto?", "À quelle hauteur", "Quão alto"]
-  ]
+  ],
+  accentFree: {},
+  tonelessPinyin: [
+    "shenme",
+    "shui",
+    "na",
+    "nage",
+    "nali",
+    "naer",
+    "zenme",
+    "zenyang",
+    "weishenme",
+    "duoshao",
+    "ji",
+    "duojiu",
+    "duoyuan",
+    "duoda",
+    "duogao",
+    "shenmeshi",
+    "shishenme",
+    "shuilaile",
+    "shishui",
+    "nawei",
+    "natian",
+    "nagehao",
+    "xuannage",
+    "naliren",
+    "zainali",
+    "naerhao",
+    "qunaer",
+    "zenmeban",
+    "zenmezuo",
+    "zenyangzuo",
+    "zenyanghao",
+    "weishenmene",
+    "wenweishenme",
+    "duoshaoren",
+    "youduoshao",
+    "jitian",
+    "jige",
+    "duojiule",
+    "yaoduojiu",
+    "duoyuana",
+    "youduoyuan",
+    "duodale",
+    "youduoda",
+    "duogaoa",
+    "youduogao"
+  ],
+  pinyinUnits: {},
+  distractors: "G*IpIP*AN*A5*A6*A7*AN*A5*A6*A7*Bu*Bv*GOE*By*BzDF*B0*B1DEAH*Ipb*B2*B3GdQAfg*AJLMN*AN*A5*A6*A7*AJJMN*AJJLN*AJJLM*AJJLMAIQRIAPR*BKIPQ*Cu*DYBA*EQ*GkDEDEFT*CC*CEZDDIPQEIPQ*CLEIP*COVFI*CRFIPcGIPbdGI*CSceHdHIPIgPQIfPQJIPQoqsJ*GS*GW*Ga*Ge*Bu*Bv*GO*GSpLIPLIPQrMIPiqsMlNIPiosNnOIPioqO"
 };
 
 export const p1_10_time__essentials = {
@@ -698,7 +1223,63 @@ export const p1_10_time__essentials = {
     ["马上来", "mǎ shàng lái", "Coming right away", "Vengo enseguida", "J'arrive tout de suite", "Já estou chegando"],
     ["一会儿见", "yī huì er jiàn", "See you later", "Hasta luego", "À plus tard", "Até logo"],
     ["等一会儿", "děng yī huì er", "Wait a moment", "Espera un momento", "Attends un instant", "Espere um momento"]
-  ]
+  ],
+  accentFree: {},
+  tonelessPinyin: [
+    "xianzai",
+    "jintian",
+    "mingtian",
+    "zuotian",
+    "houtian",
+    "qiantian",
+    "zaoshang",
+    "zhongwu",
+    "xiawu",
+    "wanshang",
+    "shijian",
+    "yiqian",
+    "yihou",
+    "meitian",
+    "gangcai",
+    "mashang",
+    "yihuier",
+    "xianzaizou",
+    "jiuxianzai",
+    "jintianhao",
+    "jiujintian",
+    "mingtianjian",
+    "dengmingtian",
+    "zuotianqu",
+    "zaizuotian",
+    "houtianlai",
+    "denghoutian",
+    "qiantiandao",
+    "zaiqiantian",
+    "zaoshanghao",
+    "zaizaoshang",
+    "zhongwuchi",
+    "daozhongwu",
+    "xiawujian",
+    "zaixiawu",
+    "wanshanghao",
+    "zaiwanshang",
+    "shijiandao",
+    "meishijian",
+    "yiqianhao",
+    "zaiyiqian",
+    "yihoushuo",
+    "zaiyihou",
+    "meitiandou",
+    "jianchimeitian",
+    "gangcaishuo",
+    "jiugangcai",
+    "mashangdao",
+    "mashanglai",
+    "yihuierjian",
+    "dengyihuier"
+  ],
+  pinyinUnits: {},
+  distractors: "*Dw*DaRS*HH*HWCD*HH*HWBD*HH*HWBC*HH*HWBC*Gu*HH*HWB*AC*EOJPIfgAHhiA*AEGP*JElmABMnoALpqA*HH*HWBCtuABGJvwxyRSAQSTAQRTBQRSBQRSCQRSaCQRDQRScDQREQRSWEQRFQRSYFQRjGQRkGQRHQRSHQRSIQRSIQRSdJQReJQRKQRSKQRSLQRSqLQRMQRSoMQRNQRSxyQROQRSOQRSwPQRvPQRQsyRQsxR"
 };
 
 export const p1_11_basic__adjectives__i = {
@@ -765,7 +1346,63 @@ export const p1_11_basic__adjectives__i = {
     ["趁早", "chèn zǎo", "As soon as possible", "Lo antes posible", "Le plus tôt possible", "O mais cedo possível"],
     ["晚饭", "wǎn fàn", "Dinner", "Cena", "Dîner", "Jantar"],
     ["晚会", "wǎn huì", "Evening party", "Fiesta nocturna", "Soirée", "Festa noturna"]
-  ]
+  ],
+  accentFree: {},
+  tonelessPinyin: [
+    "da",
+    "xiao",
+    "duo",
+    "shao",
+    "chang",
+    "duan",
+    "gao",
+    "ai",
+    "huai",
+    "xin",
+    "jiu",
+    "kuai",
+    "man",
+    "yuan",
+    "jin",
+    "zao",
+    "wan",
+    "daren",
+    "zhangda",
+    "xiaoshi",
+    "xiaoshuo",
+    "duonian",
+    "duome",
+    "zhishao",
+    "jianshao",
+    "jiuyuan",
+    "xiaozhang",
+    "duanchu",
+    "jianduan",
+    "gaoda",
+    "tigao",
+    "taiai",
+    "aixiao",
+    "huairen",
+    "sunhuai",
+    "xinren",
+    "chuangxin",
+    "jiuhuo",
+    "yijiu",
+    "kuaile",
+    "feikuai",
+    "manpao",
+    "manmanlai",
+    "yaoyuan",
+    "yuanfang",
+    "jinlai",
+    "jinpang",
+    "zaori",
+    "chenzao",
+    "wanfan",
+    "wanhui"
+  ],
+  pinyinUnits: {},
+  distractors: "*AN*A5*A6*A7*AN*A5*A6*A7*AN*A5*A6*A7*AN*A5*A6*A7*AN*A5*A6*A7*AN*A5*A6*A7*AN*A5*A6*A7*AN*A5*A6*A7*AN*A5*A6*A7*AN*A5*A6*A7*AN*A5*A6*A7*AN*A5*A6*A7*AN*A5*A6*A7*AN*A5*A6*A7*AN*A5*A6*A7*AN*A5*A6*A7*AN*A5*A6*A7*BF*BH*BJh*HAdAE*Cy*D/U*K9*DJT*K9*Dh*AJ*G8*G+*G/*AJ*Gz*G5*G8*G8YDR*G8XDR*G/rNRERSTFRSTFRST*HASAG*HBGRSHRST*JvBHR*BF*BJRjIRST*BF*BJRhJRSTKRSTKRST*Dy*D0*EGL2LRS*ASMRSRSTU*G/ZNRNRST*Dy*EDu*DbtORS*AC*EO*Hm*KaPRST*AE*HpyQ*AE*AQ*Er*Hp"
 };
 
 export const p1_12_basic__adjectives__ii = {
@@ -835,7 +1472,66 @@ export const p1_12_basic__adjectives__ii = {
     ["干净整洁", "gān jìng zhěng jié", "Neat and tidy", "Limpio y ordenado", "Propre et soigné", "Limpo e arrumado"],
     ["脏话", "zāng huà", "Swearing", "Palabrotas", "Juron", "Palavrões"],
     ["弄脏", "nòng zāng", "To dirty", "Ensuciar", "Salir", "Sujar"]
-  ]
+  ],
+  accentFree: {},
+  tonelessPinyin: [
+    "re",
+    "leng",
+    "nuanhuo",
+    "liangkuai",
+    "gan",
+    "shi",
+    "pang",
+    "shou",
+    "hou",
+    "bao",
+    "kuan",
+    "zhai",
+    "shen",
+    "qian",
+    "qing",
+    "zhong",
+    "ganjing",
+    "zang",
+    "renao",
+    "reqi",
+    "lengjing",
+    "hanleng",
+    "hennuanhuo",
+    "nuanhuoyixia",
+    "henliangkuai",
+    "liangkuaixie",
+    "ganbei",
+    "ganhuo",
+    "shitou",
+    "shirun",
+    "pangzi",
+    "fapang",
+    "shoushen",
+    "xiaoshou",
+    "houdao",
+    "shenhou",
+    "boruo",
+    "danbo",
+    "kuanrong",
+    "fangkuan",
+    "xiazhai",
+    "zhaixiao",
+    "shenke",
+    "shenru",
+    "qianxian",
+    "qianbo",
+    "qingsong",
+    "qingbian",
+    "zhongyao",
+    "chenzhong",
+    "dasaoganjing",
+    "ganjingzhengjie",
+    "zanghua",
+    "nongzang"
+  ],
+  pinyinUnits: {},
+  distractors: "*AN*A5*A6*A7*AN*A5*A6*A7WDQS*I7*IeYZ*AN*A5*A6*A7*AN*A5*A6*A7*AN*A5*A6*A7*AN*A5*A6*A7*AN*A5*A6*A7*AN*A5*A6*A7*AN*A5*A6*A7*AN*A5*A6*A7*AN*A5*A6*A7*AN*A5*A6*A7*AN*A5*A6*A7*AN*A5*A6*A7abEC*AN*A5*A6*A7TACDSACDBCDQBCDQCYZDyzWYDWZCDWYC*GaQb*GAQaECdFCDcFCD*KZ*Kj*Kl*Kr*KuGCD*ENHCD*K6HCDICDQqrIMJCDQtJCDKCDQKCDQLCDQ*Iz*IULCjrMCjqMCtNCDlsJNvOCDuOCD*C8*El*FH*F1*ARPCDXzWYXyWY*D9RCDRCDQ"
 };
 
 export const p1_13_core__radicals__components = {
@@ -908,7 +1604,69 @@ export const p1_13_core__radicals__components = {
     ["手足", "shǒu zú", "siblings/brothers", "hermanos", "frères et sœurs", "irmãos"],
     ["舌尖", "shé jiān", "tip of tongue", "punta de la lengua", "bout de la langue", "ponta da língua"],
     ["口舌", "kǒu shé", "quarrel/dispute", "disputa", "dispute", "disputa"]
-  ]
+  ],
+  accentFree: {},
+  tonelessPinyin: [
+    "ren",
+    "xin",
+    "mu",
+    "huo",
+    "tu",
+    "ri",
+    "nu",
+    "tian",
+    "mu",
+    "er",
+    "jin",
+    "zhu",
+    "shi",
+    "yu",
+    "chong",
+    "yan",
+    "bei",
+    "zu",
+    "she",
+    "renmen",
+    "youren",
+    "xinli",
+    "yongxin",
+    "mutou",
+    "shumu",
+    "huoyan",
+    "zhaohuo",
+    "tudi",
+    "nitu",
+    "rizi",
+    "meiri",
+    "nuren",
+    "nuhai",
+    "tiandi",
+    "nongtian",
+    "muguang",
+    "zhumu",
+    "ermu",
+    "ruer",
+    "jinzi",
+    "huangjin",
+    "zhuzi",
+    "zhulin",
+    "shikuai",
+    "yanshi",
+    "yutian",
+    "yuji",
+    "chongzi",
+    "kunchong",
+    "yanyu",
+    "fayan",
+    "beike",
+    "baobei",
+    "lizu",
+    "shouzu",
+    "shejian",
+    "koushe"
+  ],
+  pinyinUnits: {},
+  distractors: "*AN*A5*A6*A7*AN*A5*A6*A7*AN*A5*A6*A7*AN*A5*A6*A7*AN*A5*A6*A7*AN*A5*A6*A7*AN*A5*A6*A7*AN*A5*A6*A7*AN*A5*A6*A7*AN*A5*A6*A7*AN*A5*A6*A7*AN*A5*A6*A7*AN*A5*A6*A7*AN*A5*A6*A7*AN*A5*A6*A7*AN*A5*A6*A7*AN*A5*A6*A7*AN*A5*A6*A7*AN*A5*A6*A7*A/*BA*BB*BC*BF*BJ*Dt*Ik*By*Bz*G3B*FC*K9*EgB*C9CTUCTUVDTUVDTUVhETUETUV*Jknpv*Ht*JCFT*BF*BJ*Ik*I0fGTUbHTUHTUVITUVl*K8ITkIJT*LCJTU*JkdpvKTUV*JkdnqpLTU*Ge*GCMTMTUV*HH*HW*Hh*HitNTU*JkdnpOTUVPTUV*JlPTUQTUVQTUV2RTU1RTUSTUV*GHSTU"
 };
 
 export const p1_14_emergency__survival = {
@@ -978,5 +1736,64 @@ export const p1_14_emergency__survival = {
     ["很安全", "hěn ān quán", "Very safe", "Muy seguro", "Très sûr", "Muito seguro"],
     ["求助电话", "qiú zhù diàn huà", "Helpline", "Línea de ayuda", "Ligne d'assistance", "Linha de apoio"],
     ["向人求助", "xiàng rén qiú zhù", "Ask for help", "Pide ayuda", "Demander de l'aide", "Peça ajuda"]
-  ]
+  ],
+  accentFree: {},
+  tonelessPinyin: [
+    "jiuming",
+    "bangmang",
+    "jinji",
+    "weixian",
+    "jingcha",
+    "xiaofang",
+    "jijiu",
+    "zhuyi",
+    "xiaoxin",
+    "yiyuan",
+    "yaofang",
+    "cesuo",
+    "chukou",
+    "rukou",
+    "diushi",
+    "milu",
+    "anquan",
+    "qiuzhu",
+    "jiuminga",
+    "kuaijiuming",
+    "bangmanga",
+    "qingbangmang",
+    "jinjiqingkuang",
+    "henjinji",
+    "weixiana",
+    "youweixian",
+    "jingchalaile",
+    "jiaojingcha",
+    "xiaofangyuan",
+    "xiaofangche",
+    "jijiuxiang",
+    "zuojijiu",
+    "zhuyianquan",
+    "qingzhuyi",
+    "xiaoxindian",
+    "qingxiaoxin",
+    "quyiyuan",
+    "zaiyiyuan",
+    "zhaoyaofang",
+    "quyaofang",
+    "cesuozaina",
+    "zhaocesuo",
+    "chukouzaina",
+    "zhaochukou",
+    "rukouzaina",
+    "zhaorukou",
+    "diushile",
+    "dongxidiushi",
+    "milule",
+    "womilu",
+    "anquandiyi",
+    "henanquan",
+    "qiuzhudianhua",
+    "xiangrenqiuzhu"
+  ],
+  pinyinUnits: {},
+  distractors: "STBC*E+*EeUVXABDYZABbABC*JncdAefAB*EY*KghA*Im*In*KS*IUklABmnABpABC*GoN*GHr*Go*KiM*GHuABCwxABzABCABCDATUVASUVBSTVBSTUagoqCSTUDSTUDSTUWgoqESTUdFSTcFSTGSTUGSTUWaoqHSTUISTUISTUlJSTkJSTnKSTmKSTWagqLSTUsWagtMSTqWagrNSTOSTUWagoPSTUPSTUWagoQSTUWagoWago"
 };
@@ -80,7 +80,69 @@ export const p2_15_family__members = {
     ["爱妻子", "ài qī zǐ", "Love my wife", "Amo a mi esposa", "Aimer ma femme", "Amo minha esposa"],
     ["走亲戚", "zǒu qīn qī", "Visiting relatives", "Visitar a familiares", "Rendre visite à la famille", "Visitar parentes"],
     ["亲戚朋友", "qīn qī péng yǒu", "Relatives and friends", "Familiares y amigos", "Famille et amis", "Parentes e amigos"]
-  ]
+  ],
+  accentFree: {},
+  tonelessPinyin: [
+    "jia",
+    "jiaren",
+    "baba",
+    "mama",
+    "fumu",
+    "erzi",
+    "nuer",
+    "haizi",
+    "gege",
+    "jiejie",
+    "didi",
+    "meimei",
+    "yeye",
+    "nainai",
+    "waigong",
+    "waipo",
+    "zhangfu",
+    "qizi",
+    "qinqi",
+    "huijiaqu",
+    "zaijiali",
+    "jiarentuanju",
+    "xiangnianjiaren",
+    "babahuilaile",
+    "jiaobaba",
+    "mamazuofan",
+    "zhaomama",
+    "xiaojingfumu",
+    "fumujiankang",
+    "erzizhangdale",
+    "haoerzi",
+    "nuerchujia",
+    "haonuer",
+    "haizishangxue",
+    "zhaoguhaizi",
+    "gegejiehunle",
+    "dagege",
+    "jiejiegongzuo",
+    "dajiejie",
+    "didishangxue",
+    "xiaodidi",
+    "meimeikeai",
+    "xiaomeimei",
+    "yeyelaile",
+    "kanwangyeye",
+    "nainaizuofan",
+    "peinainai",
+    "waigonglaile",
+    "kanwaigong",
+    "quwaipojia",
+    "xiangwaipo",
+    "zhangfushangban",
+    "haozhangfu",
+    "qizizuofan",
+    "aiqizi",
+    "zouqinqi",
+    "qinqipengyou"
+  ],
+  pinyinUnits: {},
+  distractors: "*BB*Bj*CZ*DG*F9*F/*GC*GOYBDEaBCEBCDFHReBgBCDFRBCkBCDmBCDoBCDqBCDBCDEuBCDP*IRwBO*IRyB0BCDFH2B3BCD*HO*GvUYTYaeWZbcVZbcdjVWCTUaVWbcDTUYVWZcVWZbXjVWFTUYVWZbGTUYVWZbVWZbXdVWITUYVWZbJTUYVWZbKTUYVWZbLTUYVWZbVWZbVWZbNTUYVWZbOTUYVWZbPTUYVWZbQTUYVWZbRTUYSTUYVWZb"
 };
 
 export const p2_16_days__of__week = {
@@ -138,7 +200,54 @@ export const p2_16_days__of__week = {
     ["下礼拜", "xià lǐ bài", "Next week", "La próxima semana", "La semaine prochaine", "Semana que vem"],
     ["每周一次", "měi zhōu yī cì", "Once a week", "Una vez por semana", "Une fois par semaine", "Uma vez por semana"],
     ["每周运动", "měi zhōu yùn dòng", "Weekly exercise", "Ejercicio semanal", "Exercice hebdomadaire", "Exercício semanal"]
-  ]
+  ],
+  accentFree: {},
+  tonelessPinyin: [
+    "xingqi",
+    "xingqiyi",
+    "xingqier",
+    "xingqisan",
+    "xingqisi",
+    "xingqiwu",
+    "xingqiliu",
+    "xingqiri",
+    "zhou",
+    "zhouyi",
+    "zhoumo",
+    "gongzuori",
+    "libai",
+    "meizhou",
+    "jintianxingqiji",
+    "yigexingqi",
+    "xingqiyishangban",
+    "xingqiyikaihui",
+    "xingqiershangke",
+    "xingqierkaoshi",
+    "xingqisanxiawu",
+    "xingqisanyoukong",
+    "xingqisiquyiyuan",
+    "xingqisifagongzi",
+    "xingqiwuwanshang",
+    "xingqiwujuhui",
+    "xingqiliuguangjie",
+    "xingqiliushuilanjiao",
+    "xingqirizaijia",
+    "xingqirijucan",
+    "shangzhou",
+    "zhezhouhenmang",
+    "zhouyizuimang",
+    "zhouyijiaban",
+    "zhoumoyukuai",
+    "zhoumoquna",
+    "gongzuorishangban",
+    "gongzuorimeikong",
+    "shanglibai",
+    "xialibai",
+    "meizhouyici",
+    "meizhouyundong"
+  ],
+  pinyinUnits: {},
+  distractors: "*ChBCDCDEFBDEFBCEFBCDFBCDEBCDEBCDE*AAq*CZ*DGK*Cm*D5IJ*CmIABCDEmnAJe*CfIAQRSTfghiORSTOQSTOQRTOQRSOQRSOQRSXbOQWbOQOQRSOQRSOQRSWXOQOQRSOQRSN*DU*Gr*GtPghiPfhiPfgiPfghPfghOQRSOQRSnMBCmMBCPfghPfgh"
 };
 
 export const p2_17_months__seasons = {
@@ -208,7 +317,66 @@ export const p2_17_months__seasons = {
     ["冬天吃火锅", "dōng tiān chī huǒ guō", "Eat hot pot in winter", "Comer hot pot en invierno", "Manger du hot pot en hiver", "Comer hot pot no inverno"],
     ["四个季节", "sì gè jì jié", "Four seasons", "Cuatro estaciones", "Quatre saisons", "Quatro estações"],
     ["季节变换", "jì jié biàn huàn", "Season changes", "Cambios de estación", "Changements de saison", "Mudanças de estação"]
-  ]
+  ],
+  accentFree: {},
+  tonelessPinyin: [
+    "yue",
+    "yiyue",
+    "eryue",
+    "sanyue",
+    "siyue",
+    "wuyue",
+    "liuyue",
+    "qiyue",
+    "bayue",
+    "jiuyue",
+    "shiyue",
+    "shiyiyue",
+    "shieryue",
+    "chuntian",
+    "xiatian",
+    "qiutian",
+    "dongtian",
+    "jijie",
+    "zhegeyue",
+    "yuedi",
+    "yiyuehenleng",
+    "yiyuefangjia",
+    "eryueguonian",
+    "eryuezuiduan",
+    "sanyuekaixue",
+    "sanyuezhishu",
+    "siyueqingming",
+    "siyuetaqing",
+    "wuyuetianqihao",
+    "wuyuehuakai",
+    "liuyuebiye",
+    "liuyuegaokao",
+    "qiyueshujia",
+    "qiyuezuire",
+    "bayueliqiu",
+    "bayuehenre",
+    "jiuyuekaixue",
+    "jiuyuejiaoshijie",
+    "shiyueguoqing",
+    "shiyuejinqiu",
+    "shiyiyuerudong",
+    "shiyiyuebianleng",
+    "shieryuezuileng",
+    "shieryuexiaxue",
+    "chuntianlaile",
+    "chuntianbozhong",
+    "xiatianyouyong",
+    "xiatianchixigua",
+    "qiutiandaole",
+    "qiutianshouhuo",
+    "dongtianhuaxue",
+    "dongtianchihuoguo",
+    "sigejijie",
+    "jijiebianhuan"
+  ],
+  pinyinUnits: {},
+  distractors: "*AA*BB2*DGCDEFBDEFBCEFBCDFBCDEBCDEBCDEBCDEBCDEBCDEMBK*D5LCK*D6OPQBNPQBNOQBNOPB*FO*E1BCLMBCABCDVWXYUWXYUVXYUVWYkUVWUVWXUVWXUVWXlopqUVWXUVWXUVWXUVWXUVWXUVWXUVWXYUVWcopqUVWXUVWXclpqcloqclopclopUVWXUVWXUVWXclopUVWXUVWXUVWXclopUVWXUVWX"
 };
 
 export const p2_18_years__calendar = {
@@ -269,7 +437,57 @@ export const p2_18_years__calendar = {
     ["一周年", "yī zhōu nián", "First anniversary", "Primer aniversario", "Premier anniversaire", "Primeiro aniversário"],
     ["新年好", "xīn nián hǎo", "Happy New Year", "Feliz Año Nuevo", "Bonne année", "Feliz Ano Novo"],
     ["过新年", "guò xīn nián", "Celebrate New Year", "Celebrar el Año Nuevo", "Fêter le Nouvel An", "Comemorar o Ano Novo"]
-  ]
+  ],
+  accentFree: {},
+  tonelessPinyin: [
+    "nian",
+    "jinnian",
+    "mingnian",
+    "qunian",
+    "qiannian",
+    "hounian",
+    "meinian",
+    "shengri",
+    "riqi",
+    "rili",
+    "nongli",
+    "yangli",
+    "niandai",
+    "zhounian",
+    "xinnian",
+    "yinian",
+    "zhenian",
+    "jinnianhao",
+    "zaijinnian",
+    "mingnianjian",
+    "dengmingnian",
+    "qunianqu",
+    "zaiqunian",
+    "qiannianlai",
+    "zaiqiannian",
+    "houniandao",
+    "denghounian",
+    "meiniandou",
+    "jianchimeinian",
+    "shengrikuaile",
+    "guoshengri",
+    "riqidui",
+    "dingriqi",
+    "kanrili",
+    "charili",
+    "nonglinian",
+    "annongli",
+    "yangliri",
+    "anyangli",
+    "niandaijiu",
+    "naniandai",
+    "zhounianqing",
+    "yizhounian",
+    "xinnianhao",
+    "guoxinnian"
+  ],
+  pinyinUnits: {},
+  distractors: "*AA*BB*BjtCDEFBDEFBCEFBCDFBCDE*BGBCDeBCD*A5JfgIKLhJLjkJKlmAnoB*BC*BDBCBCDE*BkBCDBCDErBSTWYBRCRSUaCRSDRSTSYDRERSTSW*IdEFRSTUFRSGRSTdRSTcRSTHRSTIRSTIRSTiJRShJRSKRSTmKRSLRSTkLRSMRSTMRSTNRSTNPRSROSTORST"
 };
 
 export const p2_19_telling__time = {
@@ -336,7 +554,63 @@ export const p2_19_telling__time = {
     ["每时刻", "měi shí kè", "Every moment", "Cada momento", "Chaque instant", "Cada momento"],
     ["晚点了", "wǎn diǎn le", "Late", "Tarde", "En retard", "Tarde"],
     ["飞机晚点", "fēi jī wǎn diǎn", "The flight is delayed", "El vuelo está retrasado", "Le vol est retardé", "O vôo está atrasado"]
-  ]
+  ],
+  accentFree: {},
+  tonelessPinyin: [
+    "dian",
+    "fen",
+    "miao",
+    "ke",
+    "ban",
+    "xiaoshi",
+    "zhong",
+    "shoubiao",
+    "naozhong",
+    "shi",
+    "zhunshi",
+    "chidao",
+    "zaodao",
+    "zhengdian",
+    "shangwu",
+    "shike",
+    "wandian",
+    "jidian",
+    "sandian",
+    "jifen",
+    "wufen",
+    "jimiao",
+    "sanmiao",
+    "yikezhong",
+    "sanke",
+    "banxiaoshi",
+    "liangdianban",
+    "yixiaoshi",
+    "liangxiaoshi",
+    "jidianzhong",
+    "qiaozhong",
+    "kanshoubiao",
+    "daishoubiao",
+    "shenaozhong",
+    "xiangnaozhong",
+    "xiaoshihou",
+    "heshi",
+    "zhunshidao",
+    "henzhunshi",
+    "chidaole",
+    "biechidao",
+    "zaodaole",
+    "tiqianzaodao",
+    "zhengdianbaoshi",
+    "meizhengdian",
+    "shangwuhao",
+    "zaishangwu",
+    "shikebiao",
+    "meishike",
+    "wandianle",
+    "feijiwandian"
+  ],
+  pinyinUnits: {},
+  distractors: "*AA*BB*Bj*CZ*AA*BB*Bj*CZ*AA*BB*Bj*CZ*AA*BB*Bj*CZ*AA*BB*Bj*CZKkJZ*AA*BB*Bj*CZfgFIeGhi*AA*BB*Bj*CZFkJlM*GBnoL*GBpFQRSA*BX*Gr*Gt*IOYDJvNRSANQST*BmNQRRUV*FC*BoT7BRTW*FC*BmSVYZabc*BmPSWbcFXXZbcZcFXZbFXRXZaIGFHgHXZfHXZiIXZhIXZFXZaFKJHKXZaKXZapLXZLXZanMXZryXZqyXZNXZaOXZa*IlOXZPXZaPXZaQXZaqrXZ"
 };
 
 export const p2_20_numbers__11100 = {
@@ -406,7 +680,66 @@ export const p2_20_numbers__11100 = {
     ["上亿资产", "shàng yì zī chǎn", "over hundred million assets", "activos de más de cien millones", "actifs de plus de cent millions", "ativos de mais de cem milhões"],
     ["数字化时代", "shù zì huà shí dài", "digital age", "era digital", "ère numérique", "era digital"],
     ["输入数字", "shū rù shù zì", "enter numbers", "introducir números", "entrer les chiffres", "inserir números"]
-  ]
+  ],
+  accentFree: {},
+  tonelessPinyin: [
+    "shiyi",
+    "shier",
+    "shisan",
+    "shiwu",
+    "ershi",
+    "ershiyi",
+    "sanshi",
+    "sishi",
+    "wushi",
+    "liushi",
+    "qishi",
+    "bashi",
+    "jiushi",
+    "bai",
+    "qian",
+    "wan",
+    "yi",
+    "shuzi",
+    "shuangshiyi",
+    "shiyidianzhong",
+    "shiershengxiao",
+    "shieryuefen",
+    "shisansuile",
+    "shisanlouzhu",
+    "shiwufenzhong",
+    "zhengyueshiwu",
+    "ershisuile",
+    "ershikuaiqian",
+    "ershiyishiji",
+    "ershiyidian",
+    "sanshierli",
+    "sanshifenzhong",
+    "sishibuhuo",
+    "sishisuile",
+    "nianguowushi",
+    "wushikuaiqian",
+    "liushidashou",
+    "liushisuituixiu",
+    "qishisuile",
+    "nianguoqishi",
+    "bashigaoling",
+    "nianguobashi",
+    "jiushiniandai",
+    "nianjinjiushi",
+    "baifenzhibai",
+    "yibaikuaiqian",
+    "chengqianshangwan",
+    "qianlizhixing",
+    "wanyichushi",
+    "wanfenganxie",
+    "shiyirenkou",
+    "shangyizichan",
+    "shuzihuashidai",
+    "shurushuzi"
+  ],
+  pinyinUnits: {},
+  distractors: "*BC*BtBC*BtACD*BtABD*BtABC*BlGHISAEd*Bm*DY*Dc*De*BnEGI*Bo*DaEG*BpEGH*BqEGH*BrEGH*BsEGH*AA*BB*Bj*CZ*AA*BB*Bj*CZ*AA*BB*Bj*CZ*AA*BB*Bj*CZABCDFABCUVWXTVWX*BvTUWTUVXTUVWTUVWTUVWhmTUjTUVl0TUFTUVTUVWTUVWTUVWamTUnpTUbTUVTUVWc0TUahTUipTUTUVWinTUTUVWTUVWTUVWTUVWTUVWTUVWTUVWTUVWTUVWTUVWclTUTUVW"
 };
 
 export const p2_21_more__measure__words = {
@@ -476,7 +809,66 @@ export const p2_21_more__measure__words = {
     ["几束", "jǐ shù", "A few bouquets", "Unos ramos", "Quelques bouquets", "Alguns buquês"],
     ["一堆东西", "yī duī dōng xī", "A pile of things", "Un montón de cosas", "Un tas de choses", "Uma pilha de coisas"],
     ["几堆", "jǐ duī", "A few piles", "unos cuantos montones", "Quelques tas", "Algumas pilhas"]
-  ]
+  ],
+  accentFree: {},
+  tonelessPinyin: [
+    "he",
+    "dai",
+    "fen",
+    "bian",
+    "tang",
+    "dun",
+    "jie",
+    "chang",
+    "tai",
+    "liang",
+    "zuo",
+    "ceng",
+    "jian",
+    "ke",
+    "duo",
+    "chuan",
+    "shu",
+    "dui",
+    "yihetang",
+    "jihe",
+    "yidaimi",
+    "jidai",
+    "yifenbao",
+    "jifen",
+    "yibianyouyibian",
+    "shuoyibian",
+    "paoyitang",
+    "jitang",
+    "yidunfan",
+    "jidun",
+    "yijieke",
+    "jijie",
+    "yichangbisai",
+    "jichang",
+    "yitaidiannao",
+    "jitai",
+    "yiliangche",
+    "jiliang",
+    "yizuoshan",
+    "jizuo",
+    "yicenglou",
+    "jiceng",
+    "yijianfang",
+    "jijian",
+    "yikeshu",
+    "jike",
+    "yiduohua",
+    "jiduo",
+    "yichuanputao",
+    "jichuan",
+    "yishuhua",
+    "jishu",
+    "yiduidongxi",
+    "jidui"
+  ],
+  pinyinUnits: {},
+  distractors: "*AA*BB*Bj*CZ*AA*BB*Bj*CZ*AA*BB*Bj*CZ*AA*BB*Bj*CZ*AA*BB*Bj*CZ*AA*BB*Bj*CZ*AA*BB*Bj*CZ*AA*BB*Bj*CZ*AA*BB*Bj*CZ*AA*BB*Bj*CZ*AA*BB*Bj*CZ*AA*BB*Bj*CZ*AA*BB*Bj*CZ*AA*BB*Bj*CZ*AA*BB*Bj*CZ*AA*BB*Bj*CZ*AA*BB*Bj*CZ*AA*BB*Bj*CZUWZa*DX*DZ*DbVSWZa*DX*DZ*DbTSUZa*DX*DZ*DbTgiw0SUWaSUWZ*DX*DZ*DbTSUWZ*DX*DZ*DbTSUWZ*B0*DX*DZ*Dbiw0S*DX*DZ*DbTgw0S*DX*DZ*DbTSUWZ*DX*DZ*DbTSUWZ*DX*DZ*DbTSUWZ*DX*DZ*DbTSUWZ*DX*DZ*DbTSUWZ*DX*DZ*DbTySUW*DX*DZ*DbTgi0S*DX*DZ*DbTuSUW*DX*DZ*DbTgiwS*DX*DZ*DbT"
 };
 
 export const p2_22_more__action__verbs = {
@@ -552,7 +944,72 @@ export const p2_22_more__action__verbs = {
     ["搬走", "bān zǒu", "Move out", "Mudarse", "Déménager", "Mudar-se"],
     ["挪开", "nuó kāi", "Move aside", "Apartar", "Déplacer", "Afastar"],
     ["挪动", "nuó dòng", "Move", "Mover", "Se déplacer", "Mover"]
-  ]
+  ],
+  accentFree: {},
+  tonelessPinyin: [
+    "fang",
+    "dai",
+    "song",
+    "jie",
+    "zhao",
+    "mai",
+    "mai",
+    "zu",
+    "jie",
+    "huan",
+    "jiao",
+    "xue",
+    "wen",
+    "da",
+    "gaosu",
+    "renshi",
+    "ji",
+    "wang",
+    "ban",
+    "nuo",
+    "fangxia",
+    "fanghao",
+    "daizou",
+    "daishang",
+    "songren",
+    "songzou",
+    "jieren",
+    "jiezhu",
+    "zhaodao",
+    "zhaoren",
+    "maidongxi",
+    "maicai",
+    "maidongxi",
+    "maicai",
+    "zufang",
+    "zuche",
+    "jieshu",
+    "jieqian",
+    "huanshu",
+    "huanqian",
+    "jiaoshu",
+    "jiaoren",
+    "xuezhe",
+    "xuehui",
+    "fawen",
+    "wenren",
+    "huida",
+    "daan",
+    "gaosuni",
+    "gaosuwo",
+    "renshini",
+    "renshiren",
+    "jizhu",
+    "jide",
+    "wangji",
+    "wangle",
+    "banjia",
+    "banzou",
+    "nuokai",
+    "nuodong"
+  ],
+  pinyinUnits: {},
+  distractors: "*AA*BB*Bj*CZ*AA*BB*Bj*CZ*AA*BB*Bj*CZ*AA*BB*Bj*CZ*AA*BB*Bj*CZ*AA*BB*Bj*CZ*AA*BB*Bj*CZ*AA*BB*Bj*CZ*AA*BB*Bj*CZ*AA*BB*Bj*CZ*AA*BB*Bj*CZ*AA*BB*Bj*CZ*AA*BB*Bj*CZ*AA*BB*Bj*CZwxPUyzOU*AA*BB*Bj*CZ*AA*BB*Bj*CZ*AA*BB*Bj*CZ*AA*BB*Bj*CZV*GuAOU*GuAOXZ5BWBOP*ABZadWY5C*ABYbda0DO*DR*DSdE*ABYacgwxyh*JTFOewxyfGOPjHOPi*JB*JC*JDlmoIknIOknoJlmJOkmpK*ABYadr*HVLOq*HVLOMOPU*ABYad*GvNOPNOPUxOegwOegzPegyPegb1QO0QOP3QRO2ROP5*Gv*AASWZ4S7TOP6TOP"
 };
 
 export const p2_23_daily__actions = {
@@ -619,7 +1076,63 @@ export const p2_23_daily__actions = {
     ["准备出门", "zhǔn bèi chū mén", "Getting ready to go out", "Preparándose para salir", "Se préparer à sortir", "Preparando para sair"],
     ["休息吧", "xiū xī ba", "Let's rest", "Descansemos", "Reposons-nous", "Vamos descansar"],
     ["好好休息", "hǎo hǎo xiū xī", "Get some good rest", "Descansa bien", "Repose-toi bien", "Descanse bem"]
-  ]
+  ],
+  accentFree: {},
+  tonelessPinyin: [
+    "qichuang",
+    "shuijiao",
+    "xilian",
+    "shuaya",
+    "xizao",
+    "xishou",
+    "chuanyi",
+    "tuoyi",
+    "chifan",
+    "heshui",
+    "shangban",
+    "xiaban",
+    "shangxue",
+    "fangxue",
+    "huijia",
+    "chumen",
+    "xiuxi",
+    "qichuangle",
+    "zaoqichuang",
+    "shuijiaoba",
+    "gaishuijiao",
+    "xilianpen",
+    "quxilian",
+    "shuayagao",
+    "qushuaya",
+    "xizaojian",
+    "quxizao",
+    "xishouye",
+    "quxishou",
+    "chuanyifu",
+    "kuaichuanyi",
+    "tuoyifu",
+    "kuaituoyi",
+    "chifanba",
+    "quchifan",
+    "heshuiba",
+    "duoheshui",
+    "shangbanqu",
+    "qushangban",
+    "xiabanle",
+    "zhunbeixiaban",
+    "shangxuequ",
+    "qushangxue",
+    "fangxuele",
+    "gangfangxue",
+    "huijiaba",
+    "kuaihuijia",
+    "chumenba",
+    "zhunbeichumen",
+    "xiuxiba",
+    "haohaoxiuxi"
+  ],
+  pinyinUnits: {},
+  distractors: "RSBCTUACEFVWXYABCFZaCEbcHdeAGfgAhiABjkAB*BX*DULMK*IP*JPn*BX*DUKN*F5*F6M*Fl*GT*Gd*AA*ATvABCxABCASTUARTUBRSUBRSTCRSTacCRDRSTDRSTERSTWcERFRSTWaFRfGRSgGRSdHRSeHRSIRSTIRSTJRSTJRSTpKRSqKRSLRST*JxwyRlMRSmMRSNRSTNRST*ATORSORSTPRSToyRSQRSTowRS"
 };
 
 export const p2_24_places__locations = {
@@ -689,7 +1202,66 @@ export const p2_24_places__locations = {
     ["历史博物馆", "lì shǐ bó wù guǎn", "History museum", "Museo de historia", "Musée d'histoire", "Museu de história"],
     ["体育馆打球", "tǐ yù guǎn dǎ qiú", "Play ball at the gym", "Jugar pelota en el gimnasio", "Jouer au ballon au gymnase", "Jogar bola no ginásio"],
     ["奥运体育馆", "ào yùn tǐ yù guǎn", "Olympic stadium", "Estadio olímpico", "Stade olympique", "Estádio olímpico"]
-  ]
+  ],
+  accentFree: {},
+  tonelessPinyin: [
+    "difang",
+    "xuexiao",
+    "gongsi",
+    "yinhang",
+    "chaoshi",
+    "shangdian",
+    "fandian",
+    "jiudian",
+    "canting",
+    "jichang",
+    "chezhan",
+    "gongyuan",
+    "tushuguan",
+    "bangongshi",
+    "youju",
+    "dianyingyuan",
+    "bowuguan",
+    "tiyuguan",
+    "zhedifangbucuo",
+    "zhaogedifang",
+    "xuexiaofangjia",
+    "xuexiaohenjin",
+    "gongsikaihui",
+    "gongsishangban",
+    "yinhangpaidui",
+    "yinhangquqian",
+    "chaoshimaicai",
+    "chaoshidazhe",
+    "shangdianguanmen",
+    "guangshangdian",
+    "dingfandian",
+    "fandianchifan",
+    "jiudianruzhu",
+    "dingjiudian",
+    "cantingdingzuo",
+    "xicanting",
+    "jichangjieren",
+    "daojichang",
+    "daochezhan",
+    "qichezhan",
+    "gongyuansanbu",
+    "guanggongyuan",
+    "tushuguanjieshu",
+    "tushuguanxuexi",
+    "huibangongshi",
+    "bangongshikaihui",
+    "youjujixin",
+    "zhaoyouju",
+    "dianyingyuankandianying",
+    "xindianyingyuan",
+    "canguanbowuguan",
+    "lishibowuguan",
+    "tiyuguandaqiu",
+    "aoyuntiyuguan"
+  ],
+  pinyinUnits: {},
+  distractors: "*JIBCD*GP*GQ*FwALABD*KDABCABCDGHdAFHeAFGhAjABC*FQ*E2l*Jo*JQmn*JACpABNPQRsMPQvABCxMNQMNPRMNPQqrtyUVWXTVWXTUWXTUVXTUVWTUVWTUVWTUVWTUVWTUVWFMNPhGMNTUVWTUVWeHMNTUVWIMNPTUVW*JoJMNn*JkKMm*JkK*JSTUVWLMNPSrtySqtyNTUVSqryTUVWOMNPSqrtPTUVSqrtSqrtSqrtSqrt"
 };
 
 export const p2_25_directions__positions = {
@@ -759,7 +1331,66 @@ export const p2_25_directions__positions = {
     ["在远处", "zài yuǎn chù", "In the distance", "En la distancia", "Au loin", "Ao longe"],
     ["近处看", "jìn chù kàn", "Look up close", "Mira de cerca", "Regarde de près", "Olhe de perto"],
     ["在近处", "zài jìn chù", "Near", "Cerca", "Près", "Perto"]
-  ]
+  ],
+  accentFree: {},
+  tonelessPinyin: [
+    "qianmian",
+    "houmian",
+    "zuobian",
+    "youbian",
+    "shangmian",
+    "xiamian",
+    "limian",
+    "waimian",
+    "zhongjian",
+    "pangbian",
+    "duimian",
+    "fujin",
+    "dong",
+    "nan",
+    "xi",
+    "bei",
+    "yuanchu",
+    "jinchu",
+    "qianmianzou",
+    "zaiqianmian",
+    "houmiankan",
+    "zaihoumian",
+    "zuobianzhuan",
+    "zaizuobian",
+    "youbianzhuan",
+    "zaiyoubian",
+    "shangmianfang",
+    "zaishangmian",
+    "xiamiankan",
+    "zaixiamian",
+    "limianyou",
+    "zailimian",
+    "waimianleng",
+    "zaiwaimian",
+    "zhongjianzuo",
+    "zaizhongjian",
+    "pangbianzhan",
+    "zaipangbian",
+    "duimianzhu",
+    "zaiduimian",
+    "fujinyou",
+    "zaifujin",
+    "dongbianzou",
+    "wangdong",
+    "nanbianzou",
+    "wangnan",
+    "xibianzou",
+    "wangxi",
+    "beibianzou",
+    "wangbei",
+    "yuanchukan",
+    "zaiyuanchu",
+    "jinchukan",
+    "zaijinchu"
+  ],
+  pinyinUnits: {},
+  distractors: "*CdBEF*CeAEFDJWXCJYZ*BX*DU*Gr*Gt*GsABEABEF*AO*APAB*Fa*E7ijCDklABEFopAB*AA*BB*Bj*CZ*AA*BB*Bj*CZ*AA*BB*Bj*CZ*AA*BB*Bj*CZRyzAQ01AATUV*CxVbdcBSTTbdfYCSTZlCSWDSTXlDSESTU*D0TVdUFSTTVbfGSTUTVbdHSTUTVbdISTUISTUJSTUXZJSKSTUTVbdLSTULSTUsuwStvxMquwSrvxNqswSrtxOqsuSrtvP0QST1QSTyRSTzRST"
 };
 
 export const p2_26_basic__transportation = {
@@ -829,7 +1460,66 @@ export const p2_26_basic__transportation = {
     ["没车票", "méi chē piào", "No ticket", "Sin billete", "Pas de billet", "Sem passagem"],
     ["堵车了", "dǔ chē le", "Traffic jam", "Atasco de tráfico", "Embouteillage", "Engarrafamento"],
     ["路上堵车", "lù shàng dǔ chē", "Traffic jam on the road", "Atasco de tráfico en la carretera", "Embouteillage sur la route", "Engarrafamento na estrada"]
-  ]
+  ],
+  accentFree: {},
+  tonelessPinyin: [
+    "che",
+    "zuoche",
+    "kaiche",
+    "qiche",
+    "zoulu",
+    "dache",
+    "chuzuche",
+    "gongjiaoche",
+    "ditie",
+    "huoche",
+    "gaotie",
+    "feiji",
+    "lunchuan",
+    "zixingche",
+    "shangche",
+    "xiache",
+    "chepiao",
+    "duche",
+    "qiche",
+    "maiche",
+    "zuochequ",
+    "xihuanzuoche",
+    "kaichezou",
+    "xuekaiche",
+    "qichequ",
+    "xihuanqiche",
+    "zouluqu",
+    "xihuanzoulu",
+    "dachezou",
+    "wodache",
+    "chuzuchelaile",
+    "zuochuzuche",
+    "gongjiaochelaile",
+    "zuogongjiaoche",
+    "ditiezhan",
+    "zuoditie",
+    "huochezhan",
+    "zuohuoche",
+    "gaotiezhan",
+    "zuogaotie",
+    "feijichang",
+    "zuofeiji",
+    "lunchuanmatou",
+    "zuolunchuan",
+    "zixingchedao",
+    "qizixingche",
+    "shangcheba",
+    "kuaishangche",
+    "xiacheba",
+    "zhunbeixiache",
+    "maichepiao",
+    "meichepiao",
+    "duchele",
+    "lushangduche"
+  ],
+  pinyinUnits: {},
+  distractors: "*AA*BB*Bj*CZ*GICDF*GIBDF*GIBCFaBCD*GIBCD*GIfHNhGNU*HUKij*GIBCDImnBopBCrBCDstGH*BX*DU*GI*Gr*GI*Gs*IPB*HeAyz*GIBCD*GIBCD*GE*GIBCYBGHZbfhcCGHCGHNUDGHVbfhEGHNVZfhWFGHFGHNgVZbGVZbeVZbHVZbmIGHnIGH*H6*H7*HeJBJGHiKGHjKGH*H5*HdLGLGHNVZbfMGHNNVZbNVZbwOGHOGHNuPGH*HJVZbzQTGyQGHRGHNVZbf"
 };
 
 export const p2_27_colors = {
@@ -899,5 +1589,64 @@ export const p2_27_colors = {
     ["鲜艳夺目", "xiān yàn duó mù", "Bright and dazzling", "Brillante y deslumbrante", "Lumineux et éblouissant", "Brilhante e deslumbrante"],
     ["颜色暗淡", "yán sè àn dàn", "The color is dim", "El color es tenue", "La couleur est sombre", "A cor está fraca"],
     ["光线暗淡", "guāng xiàn àn dàn", "The light is dim", "La luz es tenue", "La lumière est faible", "A luz está fraca"]
-  ]
+  ],
+  accentFree: {},
+  tonelessPinyin: [
+    "yanse",
+    "hongse",
+    "huangse",
+    "lanse",
+    "luse",
+    "baise",
+    "heise",
+    "huise",
+    "zise",
+    "chengse",
+    "fense",
+    "zongse",
+    "jinse",
+    "yinse",
+    "liang",
+    "an",
+    "xianyan",
+    "andan",
+    "shenmeyanse",
+    "yansehaokan",
+    "hongsedehua",
+    "hongsexiqing",
+    "huangsexiangjiao",
+    "huangsehenliang",
+    "lansetiankong",
+    "lansedahai",
+    "lusedeshu",
+    "lusehuanbao",
+    "baisedeyun",
+    "baiseganjing",
+    "heisedeye",
+    "chuanheise",
+    "huisedeqiang",
+    "huisetiankong",
+    "zisedehua",
+    "ziselangman",
+    "chengsechengzi",
+    "chengsewennuan",
+    "fensequnzi",
+    "fensekeai",
+    "zongsedexiong",
+    "zongsetoufa",
+    "jinseyangguang",
+    "jinseshanshan",
+    "yinseyueguang",
+    "yinseshanliang",
+    "denghenliang",
+    "tianliangle",
+    "tianhenan",
+    "guangxianan",
+    "yansexianyan",
+    "xianyanduomu",
+    "yanseandan",
+    "guangxianandan"
+  ],
+  pinyinUnits: {},
+  distractors: "BCDEACDEABDEABCEABCDABCDABCDABCDABCDABCDABCDABCDABCD*HXABC*AA*BB*Bj*CZ*AA*BB*Bj*CZABCDPABCTUVWSUVWiSTVSTUWSTUVSTUVhSTUSTUVSTUVSTUVSTUVSTUVSTUVGuvwSTUVYSTUUSTVSTUVSTUVSTUVSTUVSTUVSTUVSTUVSTUVSTUVSTUVSTUVfvwxfuwxfuvx1fuvSTUVSTUVSTUVxSTU"
 };
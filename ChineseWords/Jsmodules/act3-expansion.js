@@ -80,7 +80,69 @@ export const p3_28_body__parts = {
     ["靠背", "kào bèi", "Backrest", "Respaldo", "Dossier", "Encosto"],
     ["心脏跳", "xīn zàng tiào", "Heartbeat", "Latido del corazón", "Battement de coeur", "Batimento cardíaco"],
     ["保护心脏", "bǎo hù xīn zàng", "Protect the heart", "Protege el corazón", "Protéger le coeur", "Proteja o coração"]
-  ]
+  ],
+  accentFree: {},
+  tonelessPinyin: [
+    "tou",
+    "lian",
+    "yanjing",
+    "bizi",
+    "zuiba",
+    "erduo",
+    "shou",
+    "jiao",
+    "shenti",
+    "toufa",
+    "yachi",
+    "shetou",
+    "bozi",
+    "jianbang",
+    "gebo",
+    "tui",
+    "duzi",
+    "bei",
+    "xinzang",
+    "koutou",
+    "yaotou",
+    "jingmian",
+    "lianhong",
+    "yanjingda",
+    "biyanjing",
+    "bizigao",
+    "xingbizi",
+    "zuibada",
+    "zhangzuiba",
+    "erduoda",
+    "shuerduo",
+    "shouda",
+    "jingshou",
+    "jiaoda",
+    "xijiao",
+    "shentihao",
+    "duanlianshenti",
+    "toufazhang",
+    "xitoufa",
+    "yachibai",
+    "shuayachi",
+    "shetouzhang",
+    "shenshetou",
+    "bozizhang",
+    "zhuanbozi",
+    "jianbangkuan",
+    "songjianbang",
+    "gebozhang",
+    "shengebo",
+    "tuizhang",
+    "shentui",
+    "moduzi",
+    "paiduzi",
+    "houbei",
+    "kaobei",
+    "xinzangtiao",
+    "baohuxinzang"
+  ],
+  pinyinUnits: {},
+  distractors: "BGHPAGHP*EWXYDMQ+/bcCDdeCDABHPABGPjCDE*HL*JmAlnoCDTU9*QmDQ+/tuCDvwCDABGHDM+/ABGH3CDELU9*QmLT9*Qmg*BP*BQ7BCDECYZaCXZaDXYaDXYZEXYZEXYZFXYZFXYZh*ET*MlGVGCDfHCD*OFHCDIXYZ4XYZJXYZJXYZKXYZKXYZLXYZLXYZMXYZMXYZNXYZNXYZOXYZOXYZPCDEPCDE0QXYzQXY2R*T3C1*URRCSXYZkXYZ"
 };
 
 export const p3_29_food__basics = {
@@ -150,7 +212,66 @@ export const p3_29_food__basics = {
     ["涮羊肉", "shuàn yáng ròu", "Lamb hotpot", "Fondue de cordero", "Fondue de mouton", "Fondue de carneiro"],
     ["海鲜好", "hǎi xiān hǎo", "Seafood is good", "El marisco es bueno", "Les fruits de mer sont bons", "Os frutos do mar são bons"],
     ["吃海鲜", "chī hǎi xiān", "Eat seafood", "Comer mariscos", "Manger des fruits de mer", "Comer frutos do mar"]
-  ]
+  ],
+  accentFree: {},
+  tonelessPinyin: [
+    "fan",
+    "mifan",
+    "mian",
+    "miantiao",
+    "mantou",
+    "baozi",
+    "jiaozi",
+    "mianbao",
+    "jidan",
+    "rou",
+    "jirou",
+    "zhurou",
+    "niurou",
+    "shucai",
+    "shuiguo",
+    "tang",
+    "yangrou",
+    "haixian",
+    "baifan",
+    "refan",
+    "mifanxiang",
+    "zhumifan",
+    "chimian",
+    "zuomian",
+    "miantiaohao",
+    "zhumiantiao",
+    "mantouxiang",
+    "zhengmantou",
+    "baozixiang",
+    "zhengbaozi",
+    "jiaozixiang",
+    "baojiaozi",
+    "mianbaoxiang",
+    "kaomianbao",
+    "jidanhao",
+    "jianjidan",
+    "chirou",
+    "mairou",
+    "jirouhao",
+    "chaojirou",
+    "zhurouxiang",
+    "chaozhurou",
+    "niurouhao",
+    "chaoniurou",
+    "shucaixinxian",
+    "chishucai",
+    "shuiguotian",
+    "chishuiguo",
+    "tanghaohe",
+    "hetang",
+    "yangrouxiang",
+    "shuanyangrou",
+    "haixianhao",
+    "chihaixian"
+  ],
+  pinyinUnits: {},
+  distractors: "*AA*AB*AG*AHST*OKA*AA*AB*AG*AHHCYZ*AL*AT*AU*Qm*AD*AM*AQG*AD*AM*AQFD*KcCgK*IXij*AA*AB*AG*AHILMQKMQkKLQk*Cl*DitB*Ct*Rzuv*AA*AB*AG*AHKLMk*Ri01*QiBT*B7*ClBS*OKABVYZBUYZ*AVXkC*AVW*OKCDUVZDUVYEUVYEUVYeFUVFUVYcGUVFGUVHUVYHUVYmIUVIUVYKLMQKLMQiqKUprKUyLUVnrLUm*CMMUnpMUUVYZNUVY*DIOUV*DJOUVUVYZ*CEPBDoQUVQUVYRUVYRUVY"
 };
 
 export const p3_30_drinks__beverages = {
@@ -217,7 +338,63 @@ export const p3_30_drinks__beverages = {
     ["喝豆浆", "hē dòu jiāng", "Drink soy milk", "Beber leche de soja", "Boire du lait de soja", "Beba leite de soja"],
     ["矿泉水好", "kuàng quán shuǐ hǎo", "Mineral water is good", "El agua mineral es buena", "L'eau minérale est bonne", "Água mineral é boa"],
     ["喝矿泉水", "hē kuàng quán shuǐ", "Drink mineral water", "Beber agua mineral", "Boire de l'eau minérale", "Beba água mineral"]
-  ]
+  ],
+  accentFree: {},
+  tonelessPinyin: [
+    "shui",
+    "kaishui",
+    "cha",
+    "lucha",
+    "hongcha",
+    "kafei",
+    "niunai",
+    "naicha",
+    "guozhi",
+    "kele",
+    "qishui",
+    "pijiu",
+    "baijiu",
+    "hongjiu",
+    "yinliao",
+    "doujiang",
+    "kuangquanshui",
+    "lengshui",
+    "daoshui",
+    "kaishuitang",
+    "shaokaishui",
+    "hecha",
+    "paocha",
+    "luchaxiang",
+    "paolucha",
+    "hongchaxiang",
+    "paohongcha",
+    "kafeixiang",
+    "hekafei",
+    "niunaihao",
+    "heniunai",
+    "naichahao",
+    "henaicha",
+    "guozhitian",
+    "zhaguozhi",
+    "keletian",
+    "hekele",
+    "qishuiliang",
+    "heqishui",
+    "pijiuliang",
+    "hepijiu",
+    "baijiulie",
+    "hebaijiu",
+    "hongjiuhao",
+    "hehongjiu",
+    "yinliaotian",
+    "heyinliao",
+    "doujiangxiang",
+    "hedoujiang",
+    "kuangquanshuihao",
+    "hekuangquanshui"
+  ],
+  pinyinUnits: {},
+  distractors: "*AA*AB*AG*AHKRS*Gq*AA*AB*AG*AHEHVWDHNVbcBD*BFde*RYDEVWhiBD*H6*ON*O4jBRSAMNno*BLLN2ELM*RAtuBDzvwBxyTUBKSABKRABQUXBQTX*BqDEHDEHVZDQTaDWQXEQTYEWQFQTUFQTU*BjGQTGQTUHQTUHVQTIQTUIQTUJQTUJQTUKQTUKQTULQTUqsLQMQTUosMQNQTUoqNQOQTUOQTUPQTUPQTUQyTUQxTU"
 };
 
 export const p3_31_common__foods = {
@@ -281,7 +458,60 @@ export const p3_31_common__foods = {
     ["吃葡萄", "chī pú táo", "Eat grapes", "Comer uvas", "Manger des raisins", "Comer uvas"],
     ["西瓜甜", "xī guā tián", "Watermelon is sweet", "La sandía es dulce", "La pastèque est sucrée", "Melancia é doce"],
     ["吃西瓜", "chī xī guā", "Eat watermelon", "Comer sandía", "Manger de la pastèque", "Comer melancia"]
-  ]
+  ],
+  accentFree: {},
+  tonelessPinyin: [
+    "doufu",
+    "tudou",
+    "xihongshi",
+    "baicai",
+    "luobo",
+    "huanggua",
+    "qiezi",
+    "lajiao",
+    "cong",
+    "jiang",
+    "suan",
+    "pingguo",
+    "xiangjiao",
+    "juzi",
+    "putao",
+    "xigua",
+    "doufunen",
+    "chidoufu",
+    "tudousi",
+    "chaotudou",
+    "xihongshihong",
+    "chaoxihongshi",
+    "baicaihao",
+    "chaobaicai",
+    "luobotian",
+    "dunluobo",
+    "huangguacui",
+    "paihuanggua",
+    "qiezizi",
+    "shaoqiezi",
+    "lajiaola",
+    "chaolajiao",
+    "qiecong",
+    "fangcong",
+    "qiejiang",
+    "fangjiang",
+    "qiesuan",
+    "fangsuan",
+    "pingguotian",
+    "chipingguo",
+    "xiangjiaotian",
+    "chixiangjiao",
+    "juzisuan",
+    "chijuzi",
+    "putaotian",
+    "chiputao",
+    "xiguatian",
+    "chixigua"
+  ],
+  pinyinUnits: {},
+  distractors: "*B+QRBSTADUVQR*BG*BL*B7*DiYZABP*TBab*AD*AM*AQ*A+ef4A*AA*AB*AG*AH*AA*AB*AG*AH*AA*AB*AG*AH*BHmnAop8A*AD*AM*AQ*A+stABF*T/uvACRSACQSBCQRBCQRCVQRCUQRDCQRDCQRECQRECQRFCQRFCQRGCQRGCQRHCQRHCQRhikIgjl*IzgjkJhil*IzgilKhjk*Iz*BnLCQ*BoLCQMCQRMCQRNCQRNCQROCQROCQRPCQRPCQR"
 };
 
 export const p3_32_eating__drinking = {
@@ -351,7 +581,66 @@ export const p3_32_eating__drinking = {
     ["需要加菜吗", "xū yào jiā cài ma", "Need more dishes?", "¿Necesita más platos?", "Besoin de plus?", "Precisa de mais?"],
     ["立即下单", "lì jí xià dān", "Order now", "Pedir ahora", "Commander maintenant", "Pedir agora"],
     ["手机下单", "shǒu jī xià dān", "Order via phone", "Pedir por móvil", "Commander via mobile", "Pedir pelo celular"]
-  ]
+  ],
+  accentFree: {},
+  tonelessPinyin: [
+    "e",
+    "bao",
+    "ke",
+    "chang",
+    "haochi",
+    "nanchi",
+    "tian",
+    "suan",
+    "la",
+    "xian",
+    "ku",
+    "dan",
+    "xiang",
+    "chou",
+    "diancan",
+    "yongcan",
+    "jiacai",
+    "xiadan",
+    "duzie",
+    "esile",
+    "chibaole",
+    "baodehen",
+    "koukele",
+    "kehuaile",
+    "changchangkan",
+    "changyikou",
+    "zhenhaochi",
+    "haochijile",
+    "tainanchi",
+    "nanchidehen",
+    "tiantiande",
+    "taitianle",
+    "suansuande",
+    "youdiansuan",
+    "tailale",
+    "ladegouwei",
+    "youdianxian",
+    "xianledian",
+    "kuguaku",
+    "chiyaoku",
+    "taidanle",
+    "weidaodan",
+    "haoxianga",
+    "wenzhexiang",
+    "haochoua",
+    "chousile",
+    "saomadiancan",
+    "bangwodiancan",
+    "yongcanshijian",
+    "qingmanyongcan",
+    "zaijiacai",
+    "xuyaojiacaima",
+    "lijixiadan",
+    "shoujixiadan"
+  ],
+  pinyinUnits: {},
+  distractors: "*AA*AB*AG*AH*AA*AB*AG*AH*AA*AB*AG*AH*AA*AB*AG*AHFaOPE*ItcO*AA*AB*AG*AH*AA*AB*AG*AH*AA*AB*AG*AH*AA*AB*AG*AH*AA*AB*AG*AH*AA*AB*AG*AH*AA*AB*AG*AH*AA*AB*AG*AHP*OG*OH*OIO*K5*OG*OH*BG*Cl*LG*Sa*E8*E9*Fj*KU*Jn*AQTUt*JPSUSTVWSTUWSTUVSTUVSTUVSTUVESTUdjuvFSTUbjuvSTUVio*F9*JQSTUVkSTUfo*F9*JQbduvhSTUSTUVSTUVSTUVfi*F9*JQSTUVsSTUSTUVqSTUT*JPSUbdjvbdjubdjubdjuQSTUbdjubdjubdju"
 };
 
 export const p3_33_clothing__items = {
@@ -415,7 +704,60 @@ export const p3_33_clothing__items = {
     ["眼镜框", "yǎn jìng kuāng", "Glasses frames", "Monturas de gafas", "Montures de lunettes", "Armações de óculos"],
     ["双肩包", "shuāng jiān bāo", "Backpack", "Mochila", "Sac à dos", "Mochila"],
     ["包里装着", "bāo lǐ zhuāng zhe", "What's in the bag", "¿Qué hay en la bolsa?", "Qu'y a-t-il dans le sac", "O que há na bolsa"]
-  ]
+  ],
+  accentFree: {},
+  tonelessPinyin: [
+    "yifu",
+    "kuzi",
+    "qunzi",
+    "xiezi",
+    "wazi",
+    "maozi",
+    "waitao",
+    "dayi",
+    "chenshan",
+    "maoyi",
+    "neiyi",
+    "shoutao",
+    "weijin",
+    "lingdai",
+    "yanjing",
+    "bao",
+    "huanyifu",
+    "yifuzangle",
+    "niuzaikuzi",
+    "kuzitaizhang",
+    "lianyiqunzi",
+    "qunzipiaoliang",
+    "pixiezi",
+    "xiezihejiao",
+    "mianwazi",
+    "wazipole",
+    "caomaozi",
+    "maozizheyang",
+    "yurongwaitao",
+    "waitaobaonuan",
+    "yangmaodayi",
+    "dayishishang",
+    "baichenshan",
+    "chenshanlingzi",
+    "zhenzhimaoyi",
+    "maoyinuanhuo",
+    "chunmianneiyi",
+    "neiyishushi",
+    "pishoutao",
+    "shoutaofanghan",
+    "yangrongweijin",
+    "weijinhaokan",
+    "sichoulingdai",
+    "lingdaidapei",
+    "jinshiyanjing",
+    "yanjingkuang",
+    "shuangjianbao",
+    "baolizhuangzhe"
+  ],
+  pinyinUnits: {},
+  distractors: "*I8QBC*AD*AM*AQ*A+*AD*AM*AQ*A+*AD*AM*AQ*A+*AD*AM*AQ*A+*AD*AM*AQ*A+L*UH*TxAJK5*HcgABCHKABHJ*UF*Tw*AfG*Ml*AGABCDABCD*ACtAB*AA*AB*AG*AHAWYaSTUVRTUVRSUVRSTVRSTUDQYaRSTUEQWaRSTUFQWYRSTURSTURSTURSTURSTUIQWYRSTURSTURSTURSTURSTULQWYRSTURSTURSTURSTURSTURSTUOQWYQWYaRSTU"
 };
 
 export const p3_34_weather__words = {
@@ -479,7 +821,60 @@ export const p3_34_weather__words = {
     ["有雹子", "yǒu báo zi", "Hail", "Granizo", "Grêle", "Granizo"],
     ["很潮湿", "hěn cháo shī", "Very humid", "Muy húmedo", "Très humide", "Muito úmido"],
     ["天气潮湿", "tiān qì cháo shī", "The weather is humid", "El clima es húmedo", "Le temps est humide", "O clima está úmido"]
-  ]
+  ],
+  accentFree: {},
+  tonelessPinyin: [
+    "tianqi",
+    "qingtian",
+    "yintian",
+    "duoyun",
+    "xiayu",
+    "xiaxue",
+    "guafeng",
+    "dalei",
+    "shandian",
+    "dawu",
+    "wendu",
+    "yubao",
+    "qiwen",
+    "shuang",
+    "baozi",
+    "chaoshi",
+    "tianqihao",
+    "kantianqi",
+    "qingtianhao",
+    "shiqingtian",
+    "yintianleng",
+    "shiyintian",
+    "duoyuntian",
+    "jintianduoyun",
+    "xiayule",
+    "kuaixiayu",
+    "xiaxuele",
+    "kuaixiaxue",
+    "guafengle",
+    "zaiguafeng",
+    "daleile",
+    "tingdaodalei",
+    "shandianliang",
+    "kandaoshandian",
+    "dawutian",
+    "qidawu",
+    "wendugao",
+    "kanwendu",
+    "tianqiyubao",
+    "kanyubao",
+    "qiwendi",
+    "kanqiwen",
+    "jieshuangle",
+    "xiashuang",
+    "xiabaozi",
+    "youbaozi",
+    "henchaoshi",
+    "tianqichaoshi"
+  ],
+  pinyinUnits: {},
+  distractors: "*Iv*Qa*QoQC*L0*S8SB*L0*S8U*Q0*Q1W*Qe*DjFr*KU*DjEr*KUcdAB0*LJ*OJ*Pq*MygAB*EP*Hc*II*Q2klAB*LM*MFnAopAB*AA*AB*AG*AH*AD*AM*AQ*A+uABC*RIARS*QsAQSBQRTVBQRCQRSTCQRDQRSfhmva*KrEQbEQRY*KrFQZFQRGQRSGQRS*F/HQRXhmvIQRSXfmvJQRSJQRSKQRSKQRSXfhvLQRSMQRSMQRSQRST*DjEF*KUtOQRsOQRPQRSXfhm"
 };
 
 export const p3_35_shopping__basics = {
@@ -540,7 +935,57 @@ export const p3_35_shopping__basics = {
     ["看标价", "kàn biāo jià", "Look at the price", "Mira el precio", "Regardez le prix", "Olha o preço"],
     ["选购好", "xuǎn gòu hǎo", "Good shopping", "Buenas compras", "Bons achats", "Boas compras"],
     ["慢慢选购", "màn màn xuǎn gòu", "Buy slowly", "Compra despacio", "Achetez lentement", "Compre devagar"]
-  ]
+  ],
+  accentFree: {},
+  tonelessPinyin: [
+    "dian",
+    "shangchang",
+    "pianyi",
+    "gui",
+    "dazhe",
+    "tuihuo",
+    "huanhuo",
+    "tiaoxuan",
+    "shichuan",
+    "xiaopiao",
+    "cuxiao",
+    "tejia",
+    "kanjia",
+    "biaojia",
+    "xuangou",
+    "zhejiadian",
+    "qudianli",
+    "qushangchang",
+    "zaishangchang",
+    "pianyidian",
+    "henpianyi",
+    "taiguile",
+    "hengui",
+    "dazhele",
+    "youdazhe",
+    "tuihuoba",
+    "keyituihuo",
+    "huanhuoba",
+    "keyihuanhuo",
+    "tiaoxuanhao",
+    "manmantiaoxuan",
+    "shichuanxia",
+    "keyishichuan",
+    "naxiaopiao",
+    "geixiaopiao",
+    "cuxiaozhong",
+    "gaocuxiao",
+    "tejiapin",
+    "youtejia",
+    "kanjiaba",
+    "keyikanjia",
+    "biaojiaduoshao",
+    "kanbiaojia",
+    "xuangouhao",
+    "manmanxuangou"
+  ],
+  pinyinUnits: {},
+  distractors: "*AA*AB*AG*AH*Kd*L/*S6RTUBE*AA*AB*AG*AH*E/*LJ*OJ*PqG*UTZBFbBCdBCEf*NdBChiBC*LOjkBMNlmLNnBLMqBrBCEQRSTPRSTS*K9BPR*K+BPCPQRCPQR*Dx*D0*D6*JQDBCE*FWEPQEPQRbFPQcegoZGPQaegoHPQRacgoIPQRaceoiJPQhJPQKPQRKPQRLPQRLPQRMPQRacegacegNPQROPQRaceg"
 };
 
 export const p3_36_around__the__house = {
@@ -607,7 +1052,63 @@ export const p3_36_around__the__house = {
     ["在花园", "zài huā yuán", "In the garden", "En el jardín", "Dans le jardin", "No jardim"],
     ["大车库", "dà chē kù", "Large garage", "Amplio garaje", "Grand garage", "Grande garagem"],
     ["在车库", "zài chē kù", "In the garage", "En el garaje", "Dans le garage", "Na garagem"]
-  ]
+  ],
+  accentFree: {},
+  tonelessPinyin: [
+    "fangzi",
+    "fangjian",
+    "men",
+    "chuanghu",
+    "qiang",
+    "diban",
+    "tianhuaban",
+    "keting",
+    "woshi",
+    "chufang",
+    "weishengjian",
+    "yushi",
+    "yangtai",
+    "louti",
+    "dianti",
+    "huayuan",
+    "cheku",
+    "dafangzi",
+    "maifangzi",
+    "xiaofangjian",
+    "jinfangjian",
+    "kaimen",
+    "guanmen",
+    "kaichuanghu",
+    "guanchuanghu",
+    "baiqiang",
+    "shuaqiang",
+    "mudiban",
+    "cadiban",
+    "tianhuabangao",
+    "kantianhuaban",
+    "daketing",
+    "zaiketing",
+    "dawoshi",
+    "zaiwoshi",
+    "xiaochufang",
+    "zaichufang",
+    "quweishengjian",
+    "zaiweishengjian",
+    "quyushi",
+    "zaiyushi",
+    "xiaoyangtai",
+    "zaiyangtai",
+    "palouti",
+    "zoulouti",
+    "zuodianti",
+    "dengdianti",
+    "xiaohuayuan",
+    "zaihuayuan",
+    "dacheku",
+    "zaicheku"
+  ],
+  pinyinUnits: {},
+  distractors: "*AD*AM*AQ*A+ATUD*AA*AB*AG*AH*HWXYA*AA*AB*AG*AH*HX*LCbcdeKRfgABL*KRhijkABlmGRI*KRnopqABOrsAN6+*Mk*Kevw*QkxyABS*HY*HgARAGKUBGKTBGK*BwW*Hk*IsV*HlCAY*H1DGXDGK*BL*B7*ClaZEABcFGKbFGKGelmGdlmgHGKfHGKi*KlIGho*KmIkJGKjJGKmKdelKdeoLGKin*KmLqMGKpMGKsNGKrNGKuOGKtOGKwPGKv*LAPGyQGKxQGK"
 };
 
 export const p3_37_furniture__objects = {
@@ -671,7 +1172,60 @@ export const p3_37_furniture__objects = {
     ["开窗帘", "kāi chuāng lián", "Open the curtains", "Abrir las cortinas", "Ouvrir les rideaux", "Abrir as cortinas"],
     ["软地毯", "ruǎn dì tǎn", "Soft carpet", "Alfombra suave", "Tapis moelleux", "Tapete macio"],
     ["铺地毯", "pù dì tǎn", "Lay the carpet", "Poner la alfombra", "Poser le tapis", "Colocar o tapete"]
-  ]
+  ],
+  accentFree: {},
+  tonelessPinyin: [
+    "zhuozi",
+    "yizi",
+    "chuang",
+    "shafa",
+    "guizi",
+    "shujia",
+    "deng",
+    "dianshi",
+    "bingxiang",
+    "kongtiao",
+    "xiyiji",
+    "diannao",
+    "yaoshi",
+    "zhi",
+    "chuanglian",
+    "ditan",
+    "dazhuozi",
+    "cazhuozi",
+    "xiaoyizi",
+    "zuoyizi",
+    "dachuang",
+    "shuichuang",
+    "ruanshafa",
+    "zuoshafa",
+    "daguizi",
+    "kaiguizi",
+    "shujiaman",
+    "fangshujia",
+    "kaideng",
+    "guandeng",
+    "kandianshi",
+    "kaidianshi",
+    "kaibingxiang",
+    "dabingxiang",
+    "kaikongtiao",
+    "guankongtiao",
+    "yongxiyiji",
+    "kaixiyiji",
+    "yongdiannao",
+    "kaidiannao",
+    "nayaoshi",
+    "zhaoyaoshi",
+    "yizhangzhi",
+    "nazhi",
+    "lachuanglian",
+    "kaichuanglian",
+    "ruanditan",
+    "puditan"
+  ],
+  pinyinUnits: {},
+  distractors: "*AD*AM*AQ*A+*AD*AM*AQ*A+*AA*AB*AG*AH*AJWXA*AD*AM*AQ*A+*Kcab*KZ*AA*AB*AG*AH*GjL*Mk*O3ghAB*QoijAklQR*GjH*Mk*O3opAB*AA*AB*AG*AH*GYstA*GauvA*GmRYAQAKSTBKQSBKQ*EP*FBV*IIU*OVCAXDKQWDKQ*GmQZEYEKQFKQRFKQR*Bw*Gqd*Is*GrcGAf*PLHKenHKhIKQgIKQjJKQiJKQlKQRkKQRnLKQfmLKpMKQoMKQKQRS*K6NABtOKQ*GssOKvPKQuPKQ"
 };
 
 export const p3_38_describing__people = {
@@ -738,7 +1292,63 @@ export const p3_38_describing__people = {
     ["太自私", "tài zì sī", "Too selfish", "Demasiado egoísta", "Trop égoïste", "Muito egoísta"],
     ["大方得体", "dà fāng dé tǐ", "Generous and decent", "Generoso y decente", "Généreux et décent", "Generoso e decente"],
     ["出手大方", "chū shǒu dà fāng", "Generous", "Generoso", "Généreux", "Generoso"]
-  ]
+  ],
+  accentFree: {},
+  tonelessPinyin: [
+    "piaoliang",
+    "shuai",
+    "keai",
+    "chou",
+    "nianqing",
+    "lao",
+    "congming",
+    "ben",
+    "qinkuai",
+    "lan",
+    "chengshi",
+    "shanliang",
+    "nenggan",
+    "youhao",
+    "yonggan",
+    "zisi",
+    "dafang",
+    "henpiaoliang",
+    "gandepiaoliang",
+    "shuaige",
+    "henshuaiqi",
+    "haokeai",
+    "keaijile",
+    "zhenchou",
+    "chuchou",
+    "nianqingren",
+    "nianqingshihou",
+    "laorenjia",
+    "bianlaole",
+    "congmingren",
+    "congmingcaizhi",
+    "bendan",
+    "benshoubenjiao",
+    "shoujiaoqinkuai",
+    "henqinkuai",
+    "toulan",
+    "zhenlan",
+    "chengshishouxin",
+    "weirenchengshi",
+    "xindishanliang",
+    "shanliangderen",
+    "jingmingnenggan",
+    "hennenggan",
+    "youhaoxiangchu",
+    "youhaowanglai",
+    "yongganmiandui",
+    "yongganderen",
+    "zisizili",
+    "taizisi",
+    "dafangdeti",
+    "chushoudafang"
+  ],
+  pinyinUnits: {},
+  distractors: "*QcRCE*AA*AB*AG*AH*B4VAE*AA*AB*AG*AHZACG*AA*AB*AG*AH*S/dAC*AA*AB*AG*AH*NziAC*AA*AB*AG*AHACEGACEGqACE*O0ACEACEG*QqwAC*EP*FB*Hc*Q2AUVZWaegBACERVZbCRUZSaegYkDAX*Ju*LK*NnERUVSWegRUVZRUVZGRUVSWag*BBHACSWaeSWaeIRUVkJACXjJASWaeSWaeSWaeSWaeSWaeMRUVSWaeSWaeSWaeSWaeSWaePRUVSWaeSWae"
 };
 
 export const p3_39_emotions__feelings = {
@@ -808,7 +1418,66 @@ export const p3_39_emotions__feelings = {
     ["着急什么", "zháo jí shén me", "What are you anxious about", "¿Por qué estás ansioso", "De quoi vous inquiétez-vous", "Por que você está ansioso"],
     ["舒服极了", "shū fú jí le", "Very comfortable", "Muy cómodo", "Très confortable", "Muito confortável"],
     ["很舒服", "hěn shū fú", "Very comfortable", "Muy comodo", "Très confortable", "Muito confortável"]
-  ]
+  ],
+  accentFree: {},
+  tonelessPinyin: [
+    "gaoxing",
+    "kaixin",
+    "nanguo",
+    "shangxin",
+    "shengqi",
+    "haipa",
+    "danxin",
+    "jinzhang",
+    "fangsong",
+    "lei",
+    "wuliao",
+    "youqu",
+    "jingya",
+    "xingfen",
+    "manyi",
+    "shiwang",
+    "zhaoji",
+    "shufu",
+    "gaoxingqilai",
+    "gaoxingdehen",
+    "kaixinguo",
+    "wandekaixin",
+    "xinlinanguo",
+    "hennanguo",
+    "shangxinshi",
+    "bieshangxin",
+    "shengqile",
+    "bieshengqi",
+    "haipashenme",
+    "henhaipa",
+    "danxinni",
+    "biedanxin",
+    "jinzhangsile",
+    "biejinzhang",
+    "fangsongxinqing",
+    "fangsongyixia",
+    "leisile",
+    "taileile",
+    "wuliaotouding",
+    "taiwuliao",
+    "youqudeshi",
+    "henyouqu",
+    "gandaojingya",
+    "shifenjingya",
+    "xingfenbuyi",
+    "xingfendehen",
+    "henmanyi",
+    "manyide",
+    "taishiwang",
+    "gandaoshiwang",
+    "biezhaoji",
+    "zhaojishenme",
+    "shufujile",
+    "henshufu"
+  ],
+  pinyinUnits: {},
+  distractors: "BCDE*Bw*Gq*HkD*DX*NX*NY*N5BGYZ*E43*QoadABCBDefhABC*DD*DF*DH*R2*AA*AB*AG*AHnABCpABCABCDABCDuvABwABCyABC*EI1ABTVWcSVWcBXYZSTWcSTVcCUYZDUXZfDUX*JyEUXEUXYSTVWFUXYGUXYZGUXSTVWHUXYSTVWSTVW*Dl*D/UX*Dx*D0*D6*F9STVWKUXYSTVWLUXYSTVWSTVWSTVWSTVWOUXYOUXYPUXYSTVWQUXYSTVWSTVWRUXY"
 };
 
 export const p3_40_health__sickness = {
@@ -869,7 +1538,57 @@ export const p3_40_health__sickness = {
     ["可以出院", "kě yǐ chū yuàn", "Can be discharged", "Puede ser dado de alta", "Peut être déchargé", "Pode receber alta"],
     ["养病中", "yǎng bìng zhōng", "Recuperating", "Recuperando", "Récupération", "Recuperando"],
     ["好好养病", "hǎo hǎo yǎng bìng", "Recuperate well", "Recuperarse bien", "Bien récupérer", "Recupere bem"]
-  ]
+  ],
+  accentFree: {},
+  tonelessPinyin: [
+    "jiankang",
+    "shengbing",
+    "ganmao",
+    "fashao",
+    "kesou",
+    "touteng",
+    "duziteng",
+    "shoushang",
+    "liuxie",
+    "kangfu",
+    "quanyu",
+    "fuzhen",
+    "zhuyuan",
+    "chuyuan",
+    "yangbing",
+    "shentijiankang",
+    "henjiankang",
+    "shengbingle",
+    "rongyishengbing",
+    "ganmaole",
+    "deganmao",
+    "fashaole",
+    "zaifashao",
+    "kesoule",
+    "yizhikesou",
+    "toutenga",
+    "youdiantouteng",
+    "duzitenga",
+    "youdianduziteng",
+    "shoushangle",
+    "buxiaoxinshoushang",
+    "liuxiele",
+    "zailiuxie",
+    "kuaikangfu",
+    "yikangfu",
+    "kuaiquanyu",
+    "yiquanyu",
+    "qufuzhen",
+    "xuyaofuzhen",
+    "zhuyuanle",
+    "yaozhuyuan",
+    "chuyuanle",
+    "keyichuyuan",
+    "yangbingzhong",
+    "haohaoyangbing"
+  ],
+  pinyinUnits: {},
+  distractors: "*PwQBC*IvORATUABVWABXABC*AJ*AAZA*Dk*AQbQdABCfgAB*L9*MBhijkABlABCNnoA*IQM*LK*NnB*RrrASYabAGRT*JFBGQPYabCGQRCGQRDGQRDGQREGQRPSabFGQRPSYbGPSYePSYHGQRcPSYIGQRIGQRiJGQhJGQkKGQjKGQLGQRPSYapMGQMGQRn*Lj*NmNPSYaOGQRPSYa"
 };
 
 export const p3_41_school__life = {
@@ -936,7 +1655,63 @@ export const p3_41_school__life = {
     ["在操场", "zài cāo chǎng", "On the sports field", "En el campo deportivo", "Sur le terrain de sport", "No campo esportivo"],
     ["美校园", "měi xiào yuán", "Beautiful campus", "Hermoso campus", "Beau campus", "Lindo campus"],
     ["在校园", "zài xiào yuán", "On campus", "en el campus", "Sur le campus", "No campus"]
-  ]
+  ],
+  accentFree: {},
+  tonelessPinyin: [
+    "laoshi",
+    "xuesheng",
+    "tongxue",
+    "jiaoshi",
+    "ke",
+    "shangke",
+    "xiake",
+    "zuoye",
+    "kaoshi",
+    "chengji",
+    "biye",
+    "shu",
+    "benzi",
+    "bi",
+    "shubao",
+    "caochang",
+    "xiaoyuan",
+    "haolaoshi",
+    "wolaoshi",
+    "haoxuesheng",
+    "woshixuesheng",
+    "haotongxue",
+    "wotongxue",
+    "dajiaoshi",
+    "zaijiaoshi",
+    "zhejieke",
+    "shangzheke",
+    "shangkele",
+    "zhengzaishangke",
+    "xiakele",
+    "zhunbeixiake",
+    "xiezuoye",
+    "jiaozuoye",
+    "kaoshile",
+    "zhunbeikaoshi",
+    "chengjihao",
+    "kanchengji",
+    "biyele",
+    "kuaibiye",
+    "nianshu",
+    "fanshu",
+    "xiebenzi",
+    "nabenzi",
+    "yongbi",
+    "nabi",
+    "beishubao",
+    "nashubao",
+    "qucaochang",
+    "zaicaochang",
+    "meixiaoyuan",
+    "zaixiaoyuan"
+  ],
+  pinyinUnits: {},
+  distractors: "0*Rc*H9RTACDz*SVVW*Gd*GgXY*AA*AB*AG*AHG*Mn*UBE*Dj*E8*E9*FjK*OSfg*LQhABjkABH*OSlm*AA*AB*AG*AH*AD*AM*AQ*A+*AA*AB*AG*AH*BA*HN*EXL*FpvwA*GkxyASATVR*LUATBRSVceiRW*LRCRV*LSCR*G2YDR*G3*G9XDRSTVFRSTdFRSUeiR*FQ*FSbGUciRgHRSfHRSIRSTUceRJRSTJRSTKRSTKRSTo*ME*O2Ln*L2*ME*O2qMRSpMRS*DhsNA*HzrNAuORStORS*F5wPR*F6vPRyQRS*HFxQR"
 };
 
 export const p3_42_work__office = {
@@ -1000,7 +1775,60 @@ export const p3_42_work__office = {
     ["提绩效", "tí jì xiào", "Improve performance", "Mejorar el rendimiento", "Améliorer les performances", "Melhorar o desempenho"],
     ["做考核", "zuò kǎo hé", "Do an assessment", "Hacer una evaluación", "Faire une évaluation", "Fazer uma avaliação"],
     ["参加考核", "cān jiā kǎo hé", "Participate in assessment", "Participar en evaluación", "Participer à l'évaluation", "Participar da avaliação"]
-  ]
+  ],
+  accentFree: {},
+  tonelessPinyin: [
+    "tongshi",
+    "laoban",
+    "yuangong",
+    "huiyi",
+    "gongzi",
+    "jiaban",
+    "qingjia",
+    "xiujia",
+    "daka",
+    "chuchai",
+    "kaihui",
+    "huibao",
+    "xiangmu",
+    "baoxiao",
+    "jixiao",
+    "kaohe",
+    "haotongshi",
+    "wotongshi",
+    "dalaoban",
+    "wolaoban",
+    "haoyuangong",
+    "xinyuangong",
+    "kaihuiyi",
+    "canjiahuiyi",
+    "fagongzi",
+    "zhanggongzi",
+    "yaojiaban",
+    "zaijiaban",
+    "qingjiatiao",
+    "yaoqingjia",
+    "xiujiale",
+    "quxiujia",
+    "dakaji",
+    "qudaka",
+    "chuchaile",
+    "yaochuchai",
+    "kaihuizhong",
+    "zhunbeikaihui",
+    "zuohuibao",
+    "tinghuibao",
+    "xinxiangmu",
+    "zuoxiangmu",
+    "qubaoxiao",
+    "yaobaoxiao",
+    "kanjixiao",
+    "tijixiao",
+    "zuokaohe",
+    "canjiakaohe"
+  ],
+  pinyinUnits: {},
+  distractors: "*KQQRB*Ga*KO*Rc*H9UVABWABCYZAB*Di*Sa*SbaHcdAGefA*E/*Fs*OJ*Pq*IQ*Ju*Nn*S3*Bw*Gq*Hk*Is*FD*MFmnopAB*FyqrAstAB*KWuAB*KjRAS*KkQASTBQR*KgSBQVCQRUCQRkDKQlvQRZEQRYEQRbFQRaFQRGQRSGQRSHQRSHQRSIQRS*P+IQR*KK*NmJQJQRSWKQRXvQRnLQRmLQRpMQRoMQRrNQRqNQRtOQRsOQRPQRSXlQR"
 };
 
 export const p3_43_communication__verbs = {
@@ -1067,7 +1895,63 @@ export const p3_43_communication__verbs = {
     ["给回应", "gěi huí yìng", "Give a response", "Dar una respuesta", "Donner une réponse", "Dar uma resposta"],
     ["回复你", "huí fù nǐ", "Reply to you", "Responderte", "Te répondre", "Responder a você"],
     ["给回复", "gěi huí fù", "Give a reply", "Dar una respuesta", "Donner une réponse", "Dar uma resposta"]
-  ]
+  ],
+  accentFree: {},
+  tonelessPinyin: [
+    "jiang",
+    "du",
+    "xie",
+    "liaotian",
+    "taolun",
+    "fanyi",
+    "lijie",
+    "biaoda",
+    "jiaoliu",
+    "goutong",
+    "qingting",
+    "xunwen",
+    "dafu",
+    "bianlun",
+    "shangliang",
+    "huiying",
+    "huifu",
+    "jianghua",
+    "jianggushi",
+    "dushu",
+    "dubao",
+    "xiezi",
+    "xiexin",
+    "liaotianba",
+    "zailiaotian",
+    "taolunhui",
+    "laitaolun",
+    "fanyicheng",
+    "zuofanyi",
+    "lijiele",
+    "bulijie",
+    "biaodahao",
+    "huibiaoda",
+    "jiaoliuhui",
+    "qujiaoliu",
+    "goutonghao",
+    "laigoutong",
+    "qingtingzhe",
+    "renzhenqingting",
+    "xunwenxia",
+    "quxunwen",
+    "dafuni",
+    "geidafu",
+    "bianlunhui",
+    "laibianlun",
+    "shangliangxia",
+    "laishangliang",
+    "huiyingni",
+    "geihuiying",
+    "huifuni",
+    "geihuifu"
+  ],
+  pinyinUnits: {},
+  distractors: "*AA*AB*AG*AH*AA*AB*AG*AH*AA*AB*AG*AH*E5*E6*S8XNZaD*K2bcDdeDE*NffgDhiDEjkDElDEFnoDE*JqQpqErsD*Fp*S6tuQ*Npvw*JqMP*NpzADEXYZa*K1*K2U*O2*FD*LMTBWCDEV56CDSYZ*TODSXrESXsESXFSXYFSXYGSXYGSXYHSXYHSXYISXYISXYJSXYJSXYKSXYSXYZLSXYLSXYxMSXyMSXZNSXaNSXOSXYOSXYxPSXyPSXpvQSqwQS"
 };
 
 export const p3_44_phone__internet = {
@@ -1128,7 +2012,57 @@ export const p3_44_phone__internet = {
     ["建账号", "jiàn zhàng hào", "Create an account", "Crear una cuenta", "Créer un compte", "Criar uma conta"],
     ["去充电", "qù chōng diàn", "Go charge", "Ir a cargar", "Aller charger", "Ir carregar"],
     ["在充电", "zài chōng diàn", "Charging", "Cargando", "En charge", "Carregando"]
-  ]
+  ],
+  accentFree: {},
+  tonelessPinyin: [
+    "dianhua",
+    "shouji",
+    "haoma",
+    "shangwang",
+    "wangluo",
+    "wangzhan",
+    "weixin",
+    "duanxin",
+    "shipin",
+    "zhaopian",
+    "sousuo",
+    "xiazai",
+    "mima",
+    "zhanghao",
+    "chongdian",
+    "bodianhua",
+    "tingdianhua",
+    "yongshouji",
+    "maishouji",
+    "dianhuahaoma",
+    "jihaoma",
+    "shangwangba",
+    "zaishangwang",
+    "wangluokuai",
+    "lianwangluo",
+    "shangwangzhan",
+    "kanwangzhan",
+    "yongweixin",
+    "faweixin",
+    "faduanxin",
+    "shouduanxin",
+    "kanshipin",
+    "lushipin",
+    "paizhaopian",
+    "kanzhaopian",
+    "sousuoxia",
+    "zaisousuo",
+    "xiazaihao",
+    "quxiazai",
+    "shumima",
+    "wangmima",
+    "dengzhanghao",
+    "jianzhanghao",
+    "quchongdian",
+    "zaichongdian"
+  ],
+  pinyinUnits: {},
+  distractors: "*Gj*HP*HT*MC*Af*ET*AGRMUAB*KT*UBVWF*PuXYE*PuZa*MHHbc*MHGdefgABhiABjkAB*Dj*E8*E9*FjCnoApqAB*FArsAQARSPARSSBPQRBPQPQRSCPQRZDPQ*UoD*UKPEPQREPQRVaDFZFPQcGPQbdGPceHPdHPQgIPQfIPQiJPQhJPQKPQRKPQRLPQRLPQRoMPQnMPQqNPQpNPQsOPQrOPQ"
 };
 
 export const p3_45_getting__around = {
@@ -1195,7 +2129,63 @@ export const p3_45_getting__around = {
     ["准备启程", "zhǔn bèi qǐ chéng", "Ready to set off", "Listo para partir", "Prêt à partir", "Pronto para partir"],
     ["途经这", "tú jīng zhè", "Pass through here", "Pasar por aquí", "Passer par ici", "Passar por aqui"],
     ["刚途经", "gāng tú jīng", "Just passed through", "Acaba de pasar", "Vient de passer", "Acabou de passar"]
-  ]
+  ],
+  accentFree: {},
+  tonelessPinyin: [
+    "pao",
+    "jin",
+    "chu",
+    "hui",
+    "zhuan",
+    "ting",
+    "jingguo",
+    "luguo",
+    "gan",
+    "zhui",
+    "duo",
+    "rao",
+    "chuan",
+    "fanhui",
+    "dida",
+    "qicheng",
+    "tujing",
+    "paokai",
+    "kuaipao",
+    "jinlai",
+    "jinru",
+    "chuqule",
+    "chuqu",
+    "huiqule",
+    "huiqu",
+    "zhuanshen",
+    "zhuanwan",
+    "tingxia",
+    "tingzhu",
+    "jingguozhe",
+    "gangjingguo",
+    "luguozhe",
+    "gangluguo",
+    "ganshijian",
+    "gankuai",
+    "zhuishang",
+    "zhuigan",
+    "duokai",
+    "duobi",
+    "raolu",
+    "raoguo",
+    "chuanguo",
+    "chuanyue",
+    "fanhuiqu",
+    "yaofanhui",
+    "didale",
+    "gangdida",
+    "qichengle",
+    "zhunbeiqicheng",
+    "tujingzhe",
+    "gangtujing"
+  ],
+  pinyinUnits: {},
+  distractors: "*AA*AB*AG*AH*AA*AB*AG*AH*AA*AB*AG*AH*AA*AB*AG*AH*AA*AB*AG*AH*AA*AB*AG*AH*ItHop*ItGop*AA*AB*AG*AH*AA*AB*AG*AH*AA*AB*AG*AH*AA*AB*AG*AH*AA*AB*AG*AHDrsG*L4tuGvGHNxyGHl*PoAGAGHNU*TFBGTBGH*KK*LjXW*IQ*Ju*LKYVYde*MA*MBW*Sda*PwEGZEGHc*UL*UMFbFGHfGVXgGVXdHVXeHVXVXde*IAIGHk*Sb*UJ*UKjIJGRmKGlKGHoLGH*ItGHn*ItGHopMGHNYVXNVXdOVXdOVXdPVXdVXdeQVXdQVXd"
 };
 
 export const p3_46_daily__routines = {
@@ -1259,7 +2249,60 @@ export const p3_46_daily__routines = {
     ["还在待业", "hái zài dài yè", "Still unemployed", "Todavía desempleado", "Toujours au chômage", "Ainda desempregado"],
     ["活动多", "huó dòng duō", "Many activities", "Muchas actividades", "Beaucoup d'activités", "Muitas atividades"],
     ["做活动", "zuò huó dòng", "Do activities", "Hacer actividades", "Faire des activités", "Fazer atividades"]
-  ]
+  ],
+  accentFree: {},
+  tonelessPinyin: [
+    "xing",
+    "xishu",
+    "zaocan",
+    "wucan",
+    "wancan",
+    "dasao",
+    "zuofan",
+    "aoye",
+    "sanbu",
+    "yule",
+    "wushui",
+    "jiaoxing",
+    "shuxi",
+    "tongqin",
+    "daiye",
+    "huodong",
+    "xingle",
+    "shuixing",
+    "xishuwan",
+    "quxishu",
+    "chizaocan",
+    "zuozaocan",
+    "chiwucan",
+    "zuowucan",
+    "chiwancan",
+    "zuowancan",
+    "dasaofang",
+    "zaidasao",
+    "zuofanba",
+    "quzuofan",
+    "aoyele",
+    "bieaoye",
+    "sanbuqu",
+    "qusanbu",
+    "yulexia",
+    "zhaoyule",
+    "wushuiba",
+    "yaowushui",
+    "jiaoxingwo",
+    "beijiaoxing",
+    "shuxihao",
+    "qushuxi",
+    "tongqinzhong",
+    "meitiantongqin",
+    "daiyezhong",
+    "haizaidaiye",
+    "huodongduo",
+    "zuohuodong"
+  ],
+  pinyinUnits: {},
+  distractors: "*AA*AB*AG*AH*AiSTC*Dg*DhDE*Dg*DhCE*Dg*DhCD*E/*Fs*LJ*Pq*A6*BL*BM*BQefBC*PoghB*B40ijDklBRAmnopBCqBCD*KV*KYsB*PnuvB*QS*QUAB*HdLABBTUVBSUVVWYCUXZCUXYDVWZDUWZEVXYEFSTUFSTUGSTUGSTUHSTUHSTUISTU*P6ISTJSTUJSTUKSTUKSTULSTULSTUMSTUMSTUNSTUtSTUOSTUrSTUPSTU*P4PST"
 };
 
 export const p3_47_hobbies__leisure = {
@@ -1326,7 +2369,63 @@ export const p3_47_hobbies__leisure = {
     ["爱烹饪", "ài pēng rèn", "Love cooking", "Me encanta cocinar", "J'adore cuisiner", "Adoro cozinhar"],
     ["做园艺", "zuò yuán yì", "Gardening", "Jardinería", "Jardinage", "Jardinagem"],
     ["爱园艺", "ài yuán yì", "Love gardening", "Me encanta la jardinería", "J'adore le jardinage", "Adoro jardinagem"]
-  ]
+  ],
+  accentFree: {},
+  tonelessPinyin: [
+    "aihao",
+    "yuedu",
+    "kanshu",
+    "dianying",
+    "yinyue",
+    "luyou",
+    "sheying",
+    "huahua",
+    "changge",
+    "tiaowu",
+    "pashan",
+    "diaoyu",
+    "gouwu",
+    "youxi",
+    "xiaqi",
+    "pengren",
+    "yuanyi",
+    "wodeaihao",
+    "youaihao",
+    "aiyuedu",
+    "xihuanyuedu",
+    "aikanshu",
+    "xihuankanshu",
+    "kandianying",
+    "haodianying",
+    "tingyinyue",
+    "haoyinyue",
+    "quluyou",
+    "ailuyou",
+    "xuesheying",
+    "aisheying",
+    "xuehuahua",
+    "aihuahua",
+    "quchangge",
+    "aichangge",
+    "qutiaowu",
+    "aitiaowu",
+    "qupashan",
+    "aipashan",
+    "qudiaoyu",
+    "aidiaoyu",
+    "qugouwu",
+    "aigouwu",
+    "wanyouxi",
+    "dayouxi",
+    "xiaqiba",
+    "aixiaqi",
+    "xuepengren",
+    "aipengren",
+    "zuoyuanyi",
+    "aiyuanyi"
+  ],
+  pinyinUnits: {},
+  distractors: "*IFSBC*LyTAC*K1*K2*ME*Q1*Gj*HP*HT*Mk*B4*ONZabcABDdeAfgABhiABjkAB*Q2*Q3lm*Rrno*RU*Qr*RQpq1*Q7rs*Dj*E8*E9*FjvwABxyABUWSTATVXBSVXRWSTCSTXRUST*HmYDSXDSTaESTZESTcFSTbFSTeGSTdGSTgHSTfHSTiISThISTkJSTjJSTmKSTlKSToLSTnLSTqMSTpMSTsNSTrNSTOSTVOSTVwPSTvPSTyQSTxQST"
 };
 
 export const p3_48_sports__exercise = {
@@ -1393,7 +2492,63 @@ export const p3_48_sports__exercise = {
     ["爱锻炼", "ài duàn liàn", "Love to exercise", "Me encanta hacer ejercicio", "J'adore faire de l'exercice", "Adoro fazer exercícios"],
     ["体育课", "tǐ yù kè", "Physical education classes", "Clases de educación física", "Cours d'éducation physique", "Aulas de educação física"],
     ["爱体育", "ài tǐ yù", "Love sports", "Me encantan los deportes", "Aime le sport", "Adoro esportes"]
-  ]
+  ],
+  accentFree: {},
+  tonelessPinyin: [
+    "yundong",
+    "paobu",
+    "youyong",
+    "daqiu",
+    "lanqiu",
+    "zuqiu",
+    "pingpangqiu",
+    "wangqiu",
+    "yumaoqiu",
+    "jianshen",
+    "yujia",
+    "taiji",
+    "bisai",
+    "ying",
+    "shu",
+    "duanlian",
+    "tiyu",
+    "zuoyundong",
+    "aiyundong",
+    "qupaobu",
+    "aipaobu",
+    "quyouyong",
+    "aiyouyong",
+    "qudaqiu",
+    "aidaqiu",
+    "dalanqiu",
+    "ailanqiu",
+    "tizuqiu",
+    "aizuqiu",
+    "dapingpangqiu",
+    "aipingpangqiu",
+    "dawangqiu",
+    "aiwangqiu",
+    "dayumaoqiu",
+    "aiyumaoqiu",
+    "qujianshen",
+    "aijianshen",
+    "lianyujia",
+    "aiyujia",
+    "dataiji",
+    "liantaiji",
+    "kanbisai",
+    "canjiabisai",
+    "yingle",
+    "yaoying",
+    "shule",
+    "bushu",
+    "quduanlian",
+    "aiduanlian",
+    "tiyuke",
+    "aitiyu"
+  ],
+  pinyinUnits: {},
+  distractors: "*OTRSB*Ni*OM*NRT*PB*Q7VW*E/*Fs*LJ*OJDFHZDEHbdeIR*Mo*MpDEhiGR*Jh*NqjklmAB0noApABC*AA*AB*AG*AH*AA*AB*AG*AHvwABxyAB*OzSAGRAGI*OlUBGTBGIWCGIVCGI*LiYDGXacgafDEYZcgcFGIYabgeGhidGhiZgDHYacfiIdehIdekJGIjJGImKGIlKGIoLGInLGIMGIRdehi*OUtNANABC*OUrOAOABCwPGIvPGIQGIRQGIR"
 };
 
 export const p3_49_nature__environment = {
@@ -1463,7 +2618,66 @@ export const p3_49_nature__environment = {
     ["爱自然", "ài zì rán", "Love nature", "Amar la naturaleza", "Aimer la nature", "Amar a natureza"],
     ["绿植物", "lǜ zhí wù", "Green plants", "Plantas verdes", "Plantes vertes", "Plantas verdes"],
     ["种植物", "zhòng zhí wù", "Plant plants", "Plantar plantas", "Planter des plantes", "Plantar plantas"]
-  ]
+  ],
+  accentFree: {},
+  tonelessPinyin: [
+    "tiankong",
+    "taiyang",
+    "yueliang",
+    "xingxing",
+    "yun",
+    "shan",
+    "he",
+    "hu",
+    "hai",
+    "shu",
+    "hua",
+    "cao",
+    "shitou",
+    "senlin",
+    "kongqi",
+    "huanjing",
+    "ziran",
+    "zhiwu",
+    "kantiankong",
+    "lantiankong",
+    "taiyangchulaile",
+    "shaitaiyang",
+    "yueliangyuan",
+    "kanyueliang",
+    "xingxingliang",
+    "shuxingxing",
+    "baiyun",
+    "kanyun",
+    "dashan",
+    "dengshan",
+    "dahe",
+    "guohe",
+    "dahu",
+    "youhu",
+    "dahai",
+    "kanhai",
+    "dashu",
+    "zhongshu",
+    "honghua",
+    "kanhua",
+    "lucao",
+    "gecao",
+    "dashitou",
+    "banshitou",
+    "dasenlin",
+    "jinsenlin",
+    "kongqihao",
+    "huxikongqi",
+    "huanjinghao",
+    "baohuhuanjing",
+    "daziran",
+    "aiziran",
+    "luzhiwu",
+    "zhongzhiwu"
+  ],
+  pinyinUnits: {},
+  distractors: "*E4STB*PyVAC*H4WXAYZAB*AA*AB*AG*AH*AA*AB*AG*AH*AA*AB*AG*AH*AA*AB*AG*AH*AA*AB*AG*AH*AA*AB*AG*AH*AA*AB*AG*AH*AA*AB*AG*AH*AL*AT*AU*A9stAB*E4*HR*IvuwABC*IHyzA*PA201*FJTAVSAVWvxSTBSTWCSTVCSTVDSTVDSTV*BL*B7*Cl*E7*E7*O2aj*EP*FB*Hc*II*O+cFA*EP*FB*Hc*IIeGAB*EP*FB*Hc*II*PB*PpgH*EP*FB*Hc*II*O2bin*EP*FB*Hc*IIkJAB*Bz*B8nK*O2bjm*BypLAoLABrMSTqMSTtNSTsNST*FIOSTxSTUPSTVvSTUzQSTyQST1RST0RST"
 };
 
 export const p3_50_animals = {
@@ -1536,7 +2750,69 @@ export const p3_50_animals = {
     ["怕蛇", "pà shé", "Afraid of snakes", "Miedo a las serpientes", "Peur des serpents", "Medo de cobras"],
     ["海豚表演", "hǎi tún biǎo yǎn", "Dolphin show", "Espectáculo de delfines", "Spectacle de dauphins", "Show de golfinhos"],
     ["海豚聪明", "hǎi tún cōng míng", "Dolphins are smart", "Los delfines son inteligentes", "Les dauphins sont intelligents", "Golfinhos são inteligentes"]
-  ]
+  ],
+  accentFree: {},
+  tonelessPinyin: [
+    "dongwu",
+    "gou",
+    "mao",
+    "niao",
+    "yu",
+    "ji",
+    "ya",
+    "zhu",
+    "niu",
+    "yang",
+    "ma",
+    "tuzi",
+    "laohu",
+    "shizi",
+    "xiong",
+    "daxiang",
+    "houzi",
+    "she",
+    "haitun",
+    "yeshengdongwu",
+    "baohudongwu",
+    "liugou",
+    "goujiaole",
+    "maomi",
+    "zhezhimao",
+    "niaofeile",
+    "tingniaojiao",
+    "yangyu",
+    "yugang",
+    "gongjidaming",
+    "mujixiadan",
+    "kaoya",
+    "yaziyouyong",
+    "yezhu",
+    "weizhu",
+    "shuiniu",
+    "chuiniu",
+    "shanyang",
+    "fangyang",
+    "qima",
+    "saima",
+    "baituzi",
+    "tuzitiao",
+    "shulaohu",
+    "laohuxiong",
+    "shizihou",
+    "shiziwang",
+    "heixiong",
+    "beijixiong",
+    "feizhoudaxiang",
+    "daxiangbizi",
+    "houzicongming",
+    "houzipashu",
+    "dushe",
+    "pashe",
+    "haitunbiaoyan",
+    "haituncongming"
+  ],
+  pinyinUnits: {},
+  distractors: "*PA*QrLM*AA*AB*AG*AH*AA*AB*AG*AH*AA*AB*AG*AH*AA*AB*AG*AH*AA*AB*AG*AH*AA*AB*AG*AH*AA*AB*AG*AH*AA*AB*AG*AH*AA*AB*AG*AH*AA*AB*AG*AH*AD*AM*AQ*A+*KO*LC*H9r*AD*AM*AQ*A+*AA*AB*AG*AH*EP*FB*Hc*II*AD*AM*AQ*A+*AA*AB*AG*AH*BK*QiALUdegTdegBALMYZapCALMWZapWYapWYZp*Jv*O/EAEALMTUegTUdgGALMTUdeiHALhHAL*BHk*BvIjIALm*QfJA*DD*DF*DH*IzoKALnKALLWYZLWYZMWYZMWYZuNWYtNWYOALMWYZaTUdeTUdeTUdeTUde2RAL1RALTUdeTUde"
 };
 
 export const p3_51_numbers__math = {
@@ -1603,7 +2879,63 @@ export const p3_51_numbers__math = {
     ["乘积", "chéng jī", "Product", "Producto", "Produit", "Produto"],
     ["商是", "shāng shì", "The quotient is", "El cociente es", "Le quotient est", "O quociente é"],
     ["求商", "qiú shāng", "Find the quotient", "Encontrar el cociente", "Trouver le quotient", "Encontrar o quociente"]
-  ]
+  ],
+  accentFree: {},
+  tonelessPinyin: [
+    "jia",
+    "jian",
+    "cheng",
+    "chu",
+    "dengyu",
+    "diyi",
+    "dier",
+    "disan",
+    "zonggong",
+    "bei",
+    "yiban",
+    "suan",
+    "shuxue",
+    "yu",
+    "cha",
+    "ji",
+    "shang",
+    "jiafa",
+    "jiashang",
+    "jianfa",
+    "jianqu",
+    "chengfa",
+    "chengyi",
+    "chufa",
+    "chuyi",
+    "dengyuduoshao",
+    "budengyu",
+    "diyiming",
+    "dediyi",
+    "dierming",
+    "dedier",
+    "disanming",
+    "dedisan",
+    "zonggongduoshao",
+    "yigongzonggong",
+    "liangbei",
+    "sanbei",
+    "yibande",
+    "fenyiban",
+    "suanyixia",
+    "suanchulai",
+    "xueshuxue",
+    "jiaoshuxue",
+    "yushu",
+    "shengyu",
+    "chaduoshao",
+    "xiangcha",
+    "jishi",
+    "chengji",
+    "shangshi",
+    "qiushang"
+  ],
+  pinyinUnits: {},
+  distractors: "*AA*AB*AG*AH*AA*AB*AG*AH*AA*AB*AG*AH*AA*AB*AG*AHaFGHGHbcFHdeFGfgEFGH*AA*AB*AG*AH*UVlmE*AA*AB*AG*AH*KQpqE*AA*AB*AG*AH*AA*AB*AG*AH*AA*AB*AG*AH*AA*AB*AG*AH*Di*LGST*Di*LG*N0RRUVX*Nn*NpTBRTWXVYwCRTVYWXDEhiabEbcddfFaegFabfGacgGabdHaceHaZiabZhabkJEFjJEFKabcKabcabcdabcdqMabpMabNEFGNEFGabcd*LKOEFxPEFVWCP*Fp*L/vQQEFG"
 };
 
 export const p3_52_time__words__advanced = {
@@ -1670,7 +3002,63 @@ export const p3_52_time__words__advanced = {
     ["在先前", "zài xiān qián", "previously", "anteriormente", "auparavant", "anteriormente"],
     ["此后会", "cǐ hòu huì", "from now on", "de aquí en adelante", "désormais", "de agora em diante"],
     ["从此后", "cóng cǐ hòu", "from now on", "de ahora en adelante", "désormais", "de agora em diante"]
-  ]
+  ],
+  accentFree: {},
+  tonelessPinyin: [
+    "baitian",
+    "yewan",
+    "lingchen",
+    "liming",
+    "bangwan",
+    "huanghun",
+    "pingshi",
+    "yongyuan",
+    "zuijin",
+    "jianglai",
+    "shizhong",
+    "rihou",
+    "wanghou",
+    "jinhou",
+    "dangchu",
+    "xianqian",
+    "cihou",
+    "baitiangongzuo",
+    "zaibaitian",
+    "yewanxiuxi",
+    "zaiyewan",
+    "lingchenqi",
+    "daolingchen",
+    "limingshifen",
+    "dengliming",
+    "bangwanshi",
+    "daobangwan",
+    "huanghunshi",
+    "kanhuanghun",
+    "pingshimang",
+    "zaipingshi",
+    "yongyuanaini",
+    "huiyongyuan",
+    "zuijinmang",
+    "zaizuijin",
+    "jianglaihui",
+    "zaijianglai",
+    "shizhongruyi",
+    "huishizhong",
+    "rihouzaishuo",
+    "dengrihou",
+    "wanghoukan",
+    "congwanghou",
+    "jinhouhui",
+    "congjinhou",
+    "dangchushuo",
+    "zaidangchu",
+    "xianqianshuo",
+    "zaixianqian",
+    "cihouhui",
+    "congcihou"
+  ],
+  pinyinUnits: {},
+  distractors: "*BL*B7*Cl*E5EUACVWAB*H+YABBZaA*CnbcAdeABgABChiAB*NkjkAmABCMNQ*UTLNQ*UTLMQ*UTtuAB*UR*USvwLMN*UTTXfl*MJAUVRXflBSVWCSUWCSUVRTflDSUVESUVESUVFSUVFSUVGSUVGSUVRTXlHSUVISUVISUVJSUVJSUVRTXfKSUVRTXfLSUVMSUVsyMSxNSUqyNSOSUVOSUVPSUVP*USSUrQSUqsQS"
 };
 
 export const p3_53_location__words = {
@@ -1746,5 +3134,70 @@ export const p3_53_location__words = {
     ["在上边", "zài shàng biān", "Above", "Arriba", "Ci-dessus", "Acima"],
     ["下边看", "xià biān kàn", "Looking below", "Mirando abajo", "En regardant ci-dessous", "Olhando abaixo"],
     ["在下边", "zài xià biān", "Below", "Abajo", "Ci-dessous", "Abaixo"]
-  ]
+  ],
+  accentFree: {},
+  tonelessPinyin: [
+    "zhong",
+    "nei",
+    "wai",
+    "shang",
+    "xia",
+    "zuo",
+    "you",
+    "qian",
+    "hou",
+    "pang",
+    "zhouwei",
+    "daochu",
+    "gedi",
+    "bendi",
+    "dongbian",
+    "nanbian",
+    "xibian",
+    "beibian",
+    "shangbian",
+    "xiabian",
+    "zhizhong",
+    "qizhong",
+    "neibu",
+    "zainei",
+    "waibu",
+    "zaiwai",
+    "yishang",
+    "zaishang",
+    "yixia",
+    "zaixia",
+    "xiangzuo",
+    "pianzuo",
+    "xiangyou",
+    "pianyou",
+    "kaoqian",
+    "zaiqian",
+    "tuihou",
+    "zaihou",
+    "yipang",
+    "zaipang",
+    "zhouweide",
+    "zaizhouwei",
+    "daochuzou",
+    "daochukan",
+    "gedide",
+    "laizigedi",
+    "bendiren",
+    "zaibendi",
+    "wangdongbian",
+    "zaidongbian",
+    "wangnanbian",
+    "zainanbian",
+    "wangxibian",
+    "zaixibian",
+    "wangbeibian",
+    "zaibeibian",
+    "shangbiankan",
+    "zaishangbian",
+    "xiabiankan",
+    "zaixiabian"
+  ],
+  pinyinUnits: {},
+  distractors: "*AA*AB*AG*AH*AA*AB*AG*AH*AA*AB*AG*AH*AA*AB*AG*AH*AA*AB*AG*AH*AA*AB*AG*AH*AA*AB*AG*AH*AA*AB*AG*AH*AA*AB*AG*AH*AA*AB*AG*AHopLMqrKMNsKL*KaMuvPQRSOQRS*CxOPROPQS*KT*MnOP*Dj*E8*E9*FjVAKLUAKL*ESYBKZbdj*EOWCKXbdj*N0*Sbbc*N0*SbXZ*NsadE*NsXZbfgFKehFKehGKfgGK*A2*TLjH*TLXZb*Ft*TH*TI*TJ*TH*TI*TJ*TM*STnJKXZbdKpqrKoqrrLopqLopMopqopqrNopqNopqxy02wz13wz02xy13wy12xz03wy03xz126Sop*M6xz14Topxz13"
 };
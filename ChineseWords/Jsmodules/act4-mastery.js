@@ -74,7 +74,63 @@ export const p4_54_opinions__views = {
     ["表示反对", "biǎo shì fǎn duì", "Express objection", "Expresar oposición", "Exprimer son opposition", "Expressar oposição"],
     ["做鉴定", "zuò jiàn dìng", "Make an appraisal", "Hacer una tasación", "Faire une évaluation", "Fazer uma avaliação"],
     ["专业鉴定", "zhuān yè jiàn dìng", "Professional appraisal", "Tasación profesional", "Évaluation professionnelle", "Avaliação profissional"]
-  ]
+  ],
+  accentFree: {},
+  tonelessPinyin: [
+    "kanfa",
+    "yijian",
+    "guandian",
+    "taidu",
+    "lichang",
+    "zhuyi",
+    "jiaodu",
+    "zongjie",
+    "kandai",
+    "lundian",
+    "jianjie",
+    "lilun",
+    "lunju",
+    "chiyou",
+    "jianchi",
+    "biaoshi",
+    "jianding",
+    "wodekanfa",
+    "youkanfa",
+    "tiyijian",
+    "youyijian",
+    "guandianshi",
+    "youguandian",
+    "taiduhao",
+    "biaotaidu",
+    "lichangjianding",
+    "youlichang",
+    "haozhuyi",
+    "chuzhuyi",
+    "jiaodubutong",
+    "huanjiaodu",
+    "zuozongjie",
+    "laizongjie",
+    "kandaiwenti",
+    "ruhekandai",
+    "lundianshi",
+    "tilundian",
+    "youjianjie",
+    "dudaojianjie",
+    "lilunqingxi",
+    "jinxinglilun",
+    "lunjuchongfen",
+    "zhaolunju",
+    "chiyouguandian",
+    "changqichiyou",
+    "jianchixiaqu",
+    "yaojianchi",
+    "biaoshitongyi",
+    "biaoshifandui",
+    "zuojianding",
+    "zhuanyejianding"
+  ],
+  pinyinUnits: {},
+  distractors: "I*IFSBTUACJ*Cj*Eh*PkGXYAL*OCaA*Cc*MnbcDeAB*Eg*O8fgA*Br*Gx*IFCM*Cj*Eh+lABE*OCABJ*FS*SmqABCD*MpuABABCD24/*NRZdhiATUVUBSVTBSVjCST*E3*P3CrDSTUDSTURdhiESTUcFSTbFSTRZhiGSTUgHSTfHSTRZdiRZdhVJSTJSTUKSTURZdhRZdhRZdhRZdhMSTUWRZdRZdhRZdhOSTU*NARZdRZdh*BLQSTRZdh"
 };
 
 export const p4_55_making__plans = {
@@ -141,7 +197,63 @@ export const p4_55_making__plans = {
     ["看档期", "kàn dàng qī", "Check availability", "Ver disponibilidad", "Vérifier la disponibilité", "Verificar disponibilidade"],
     ["行程表", "xíng chéng biǎo", "Itinerary", "Itinerario", "Itinéraire", "Itinerário"],
     ["安排行程", "ān pái xíng chéng", "Arrange itinerary", "Organizar itinerario", "Organiser l'itinéraire", "Organizar itinerário"]
-  ]
+  ],
+  accentFree: {},
+  tonelessPinyin: [
+    "dasuan",
+    "jihua",
+    "zhunbei",
+    "jueding",
+    "anpai",
+    "yuding",
+    "quxiao",
+    "tuichi",
+    "tiqian",
+    "kongxian",
+    "youkong",
+    "jianmian",
+    "yueding",
+    "yuehui",
+    "paiqi",
+    "dangqi",
+    "xingcheng",
+    "dasuanqu",
+    "youdasuan",
+    "jihuahao",
+    "zuojihua",
+    "zhunbeihao",
+    "zuozhunbei",
+    "juedingle",
+    "zuojueding",
+    "anpaihao",
+    "zuoanpai",
+    "yudinghao",
+    "quyuding",
+    "quxiaole",
+    "yaoquxiao",
+    "tuichile",
+    "yaotuichi",
+    "tiqiandao",
+    "yaotiqian",
+    "youkongxian",
+    "bijiaokongxian",
+    "youkongma",
+    "meiyoukong",
+    "jianmianba",
+    "qujianmian",
+    "yuedinghao",
+    "youyueding",
+    "yuehuiba",
+    "quyuehui",
+    "paiqibiao",
+    "zuopaiqi",
+    "youdangqi",
+    "kandangqi",
+    "xingchengbiao",
+    "anpaixingcheng"
+  ],
+  pinyinUnits: {},
+  distractors: "*F8*INRSTUAC*NeVWA*AQFM*NR*HXZaA*AQDM*GodeAB*F2fgA*ODhiAjABC*Ch*O2jl*AKnoA*AQDFNM*I+*LBrP*Iz*I2tO*Izvw*HWxABASTUARTUBRSUBRSTCRSTCRSTDRST*AxDRSERSTERSTpFRSFRSTGRSTGRSTHRSTHRSTIRSTIRSTlJKRyRSTjKRSKRSTLRSTLRSTbMRSMRSTNRST*JZNRSORSTORSTwPRSvPRSQRSTkRST"
 };
 
 export const p4_56_expressing__needs = {
@@ -205,7 +317,60 @@ export const p4_56_expressing__needs = {
     ["迫切需要", "pò qiè xū yào", "Urgently need", "Necesita con urgencia", "Besoin urgent", "Precisa com urgência"],
     ["很紧迫", "hěn jǐn pò", "Very pressing", "Muy apremiante", "Très pressant", "Muito premente"],
     ["时间紧迫", "shí jiān jǐn pò", "Time is pressing", "El tiempo apremia", "Le temps presse", "O tempo está pressionando"]
-  ]
+  ],
+  accentFree: {},
+  tonelessPinyin: [
+    "xuyao",
+    "xiangyao",
+    "xiwang",
+    "yuanwang",
+    "panwang",
+    "qidai",
+    "kewang",
+    "yaoqiu",
+    "bubi",
+    "buyong",
+    "jixu",
+    "wubi",
+    "feidei",
+    "jixu",
+    "poqie",
+    "jinpo",
+    "xuyaoni",
+    "henxuyao",
+    "xiangyaomai",
+    "henxiangyao",
+    "xiwangni",
+    "baoxiwang",
+    "yuanwangshi",
+    "xuyuanwang",
+    "panwangzhe",
+    "zaipanwang",
+    "qidaini",
+    "henqidai",
+    "kewangchenggong",
+    "henkewang",
+    "yaoqiugao",
+    "youyaoqiu",
+    "bubile",
+    "zhenbubi",
+    "buyongxie",
+    "buyongdanxin",
+    "jixuren",
+    "henjixu",
+    "wubilai",
+    "qingwubi",
+    "feideiqu",
+    "feideiyao",
+    "jixujiejue",
+    "jixubangzhu",
+    "henpoqie",
+    "poqiexuyao",
+    "henjinpo",
+    "shijianjinpo"
+  ],
+  pinyinUnits: {},
+  distractors: "BQRCASTCDEGUCEGWCDGY*AI*Gx*MA*MBCDEdzefAJL*KR*MvI*FJ*KR*MvN*IQklImnA*O5*QVopKABCsABCuABCARSTTAQSBQRTRBQSCQRSCQRSDQRSDQRSEQRSEQRS*Mh*MjFQFQRSjqrtGQRSHQRS*CrHQRIQRSIQRSJQRScqrtKQRSKQRSLQRSLQRSpMQRoMQRcjrtcjqtOQRScjqrPQRScjqr"
 };
 
 export const p4_57_asking__for__help = {
@@ -263,7 +428,54 @@ export const p4_57_asking__for__help = {
     ["多费心", "duō fèi xīn", "Please take more care", "Por favor cuide más", "Veuillez faire plus attention", "Por favor cuide mais"],
     ["指点下", "zhǐ diǎn xià", "Give some guidance", "Dar algo de orientación", "Donner quelques conseils", "Dar alguma orientação"],
     ["请指点", "qǐng zhǐ diǎn", "Please give guidance", "Por favor dé orientación", "Veuillez donner des conseils", "Por favor dê orientação"]
-  ]
+  ],
+  accentFree: {},
+  tonelessPinyin: [
+    "bangzhu",
+    "baituo",
+    "qingjiao",
+    "qingqiu",
+    "zhiyuan",
+    "xiezhu",
+    "leyi",
+    "qiuyuan",
+    "xiangzhu",
+    "xiangzhu",
+    "laojia",
+    "youlao",
+    "feixin",
+    "zhidian",
+    "bangzhuwo",
+    "xuyaobangzhu",
+    "baituoni",
+    "baituole",
+    "qingjiaoxia",
+    "xiangninqingjiao",
+    "qingqiuni",
+    "youqingqiu",
+    "zhiyuanwo",
+    "xuyaozhiyuan",
+    "xiezhuxia",
+    "xuyaoxiezhu",
+    "henleyi",
+    "leyibangmang",
+    "qiuyuanxin",
+    "fachuqiuyuan",
+    "xiangzhuyixia",
+    "dinglixiangzhu",
+    "xiangzhuyixia",
+    "dalixiangzhu",
+    "laojiale",
+    "laojianin",
+    "youlaonin",
+    "youlaole",
+    "feixinle",
+    "duofeixin",
+    "zhidianxia",
+    "qingzhidian"
+  ],
+  pinyinUnits: {},
+  distractors: "FIJOQRACD*KP*LyS*BtC*KP*LyH*FN*MpWAIJY*AF*MnaAEcABAFJ*LJAFIBijAB*A9*O2kl*FJmnA*AC*AJ*Eh*PkAQRSZTXbRBOSQBOSCOQRPXZbDOQR*CFDOQEOQRPTZbFOQRPTXbGOQRPTXZHOQRPTXZgPTXPTXZePTXPTXZjKOQiKOQlLOQkLOQMOQRMOQRNOQRNOQR"
 };
 
 export const p4_58_giving__directions = {
@@ -327,7 +539,60 @@ export const p4_58_giving__directions = {
     ["用导航", "yòng dǎo háng", "Use navigation", "Usar navegación", "Utiliser la navigation", "Usar navegação"],
     ["看地图", "kàn dì tú", "View map", "Ver mapa", "Voir la carte", "Ver mapa"],
     ["用地图", "yòng dì tú", "Use map", "Usar mapa", "Utiliser la carte", "Usar mapa"]
-  ]
+  ],
+  accentFree: {},
+  tonelessPinyin: [
+    "zhizou",
+    "zuozhuan",
+    "youzhuan",
+    "guaiwan",
+    "lukou",
+    "shizilukou",
+    "hongludeng",
+    "qianfang",
+    "youce",
+    "zuoce",
+    "juli",
+    "fangxiang",
+    "dizhi",
+    "mudidi",
+    "daohang",
+    "ditu",
+    "wangqianzhizou",
+    "qingzhizou",
+    "xiangzuozuozhuan",
+    "qingzuozhuan",
+    "xiangyouyouzhuan",
+    "qingyouzhuan",
+    "zainaguaiwan",
+    "yaoguaiwan",
+    "daolukou",
+    "guolukou",
+    "daoshizilukou",
+    "guoshizilukou",
+    "kanhongludeng",
+    "denghongludeng",
+    "qianfangdaoda",
+    "kanqianfang",
+    "zaiyouce",
+    "kanyouce",
+    "zaizuoce",
+    "kanzuoce",
+    "juliyuan",
+    "youjuli",
+    "shenmefangxiang",
+    "kanfangxiang",
+    "dizhishi",
+    "xiedizhi",
+    "daomudidi",
+    "qumudidi",
+    "kaidaohang",
+    "yongdaohang",
+    "kanditu",
+    "yongditu"
+  ],
+  pinyinUnits: {},
+  distractors: "RBCDCJ*PrTBIVAXABCYZABabQScdNR*Gt*Gw*IOfCJghBI*PriklAB*KT*R5nAPopAqrGRstABMuvAFSUWAGNTFQUWVBGNFQSWTCGNFQSUDGNRZEGNYEGNbFQSaFQSdGFQcGFQFQSUHGNRhiIGgjIGgjJGhiJGKGNRKGNRFQSULGNRMGNRMGNRrNFQqNFQtOGNsOGNvPGNuPGN"
 };
 
 export const p4_59_describing__situations = {
@@ -385,7 +650,54 @@ export const p4_59_describing__situations = {
     ["有转变", "yǒu zhuǎn biàn", "There is a change", "Hay un cambio", "Il y a un changement", "Há uma mudança"],
     ["恶化了", "è huà le", "Worsened", "Empeorado", "Aggravé", "Piorou"],
     ["情况恶化", "qíng kuàng è huà", "The situation has worsened", "La situación ha empeorado", "La situation s'est aggravée", "A situação piorou"]
-  ]
+  ],
+  accentFree: {},
+  tonelessPinyin: [
+    "qingkuang",
+    "zhuangkuang",
+    "xingshi",
+    "zhengchang",
+    "yichang",
+    "jiandan",
+    "jinxing",
+    "fasheng",
+    "chuxian",
+    "cunzai",
+    "bianhua",
+    "gaibian",
+    "zhuanbian",
+    "ehua",
+    "shenmeqingkuang",
+    "liaojieqingkuang",
+    "zhuangkuangruhe",
+    "muqianzhuangkuang",
+    "xingshihao",
+    "kanxingshi",
+    "henzhengchang",
+    "yiqiezhengchang",
+    "henyichang",
+    "youdianyichang",
+    "henjiandan",
+    "taijiandan",
+    "jinxingzhong",
+    "zhengzaijinxing",
+    "fashengle",
+    "gangfasheng",
+    "chuxianle",
+    "gangchuxian",
+    "cunzaiwenti",
+    "haicunzai",
+    "youbianhua",
+    "fashengbianhua",
+    "gaibianle",
+    "yaogaibian",
+    "zhuanbianle",
+    "youzhuanbian",
+    "ehuale",
+    "qingkuangehua"
+  ],
+  pinyinUnits: {},
+  distractors: "B*MxCDACDESTABE*OF*O0*O1D*O0*O1*PA*F0*F6YZ*R3aAB*FR*ICcd*Hc*L2ef*KR*OFhAN*JeiAMv*Iz*L7L*Jf*JgmKoABPQRVOQRVOPRVOPQVCTUWCSUWWDSTOPQRUESTOPQRZFSTYFSTGSTUOPQRHSTUHSTUISTUISTUOPQRJSTUKSTUOPQRmLST*Ez*JDLSkMSTMSTUNSTUOPQR"
 };
 
 export const p4_60_talking__about__problems = {
@@ -446,7 +758,57 @@ export const p4_60_talking__about__problems = {
     ["出现纰漏", "chū xiàn pī lòu", "Oversight occurs", "Se produce un descuido", "Une négligence survient", "Ocorre um descuido"],
     ["有瓶颈", "yǒu píng jǐng", "Has bottlenecks", "Tiene cuellos de botella", "A des goulots d'étranglement", "Tem gargalos"],
     ["突破瓶颈", "tū pò píng jǐng", "Break through bottleneck", "Romper el cuello de botella", "Briser le goulot d'étranglement", "Romper o gargalo"]
-  ]
+  ],
+  accentFree: {},
+  tonelessPinyin: [
+    "wenti",
+    "mafan",
+    "maobing",
+    "cuowu",
+    "xiuli",
+    "gaizheng",
+    "zhengjie",
+    "nandian",
+    "biduan",
+    "jiufen",
+    "zhengyi",
+    "yinhuan",
+    "loudong",
+    "pilou",
+    "pingjing",
+    "youwenti",
+    "shenmewenti",
+    "youmafan",
+    "yudaomafan",
+    "youmaobing",
+    "chumaobing",
+    "youcuowu",
+    "fancuowu",
+    "quxiuli",
+    "xuyaoxiuli",
+    "yaogaizheng",
+    "yigaizheng",
+    "zhaozhengjie",
+    "wentizhengjie",
+    "younandian",
+    "kefunandian",
+    "youbiduan",
+    "cunzaibiduan",
+    "youjiufen",
+    "fashengjiufen",
+    "youzhengyi",
+    "yinqizhengyi",
+    "youyinhuan",
+    "cunzaiyinhuan",
+    "youloudong",
+    "duzhuloudong",
+    "youpilou",
+    "chuxianpilou",
+    "youpingjing",
+    "tupopingjing"
+  ],
+  pinyinUnits: {},
+  distractors: "*I7PBCRACD*IFTUA*HaVWAXABC*D7*Iz*L7Z*AH*ILbA*AC*AJ*Cj*NcfABChABCjABClABCnABCpABCrABCARTUSYceBPTUQYceUCPRTCPRW*H0DPVDPREPRTQSce*EVa*JDFZFPRGPRTQSYe*AW*P3HPQSYcIPRTQSYcJPRTQSYcKPRTQSYcLPRTQSYcMPRTQSYcNPRTQSYcOPRTQSYc"
 };
 
 export const p4_61_money__payments = {
@@ -507,7 +869,57 @@ export const p4_61_money__payments = {
     ["有花费", "yǒu huā fèi", "There are costs", "Hay gastos", "Il y a des frais", "Há custos"],
     ["开销大", "kāi xiāo dà", "High cost", "Alto costo", "Coût élevé", "Custo elevado"],
     ["减少开销", "jiǎn shǎo kāi xiāo", "Reduce cost", "Reducir costos", "Réduire les coûts", "Reduzir custos"]
-  ]
+  ],
+  accentFree: {},
+  tonelessPinyin: [
+    "qian",
+    "jiage",
+    "feiyong",
+    "youhui",
+    "xianjin",
+    "shuaka",
+    "zhifu",
+    "fukuan",
+    "lingqian",
+    "zhaoqian",
+    "fapiao",
+    "shouju",
+    "xiaofei",
+    "huafei",
+    "kaixiao",
+    "duoshaoqian",
+    "geiqian",
+    "jiagegao",
+    "kanjiage",
+    "feiyongduo",
+    "fufeiyong",
+    "youyouhui",
+    "geiyouhui",
+    "fuxianjin",
+    "yongxianjin",
+    "keyishuaka",
+    "yongshuaka",
+    "zhifubao",
+    "quzhifu",
+    "qufukuan",
+    "yifukuan",
+    "youlingqian",
+    "huanlingqian",
+    "zhaoqiangeini",
+    "buyongzhaoqian",
+    "kaifapiao",
+    "yaofapiao",
+    "yaoshouju",
+    "geishouju",
+    "xiaofeigao",
+    "quxiaofei",
+    "huafeida",
+    "youhuafei",
+    "kaixiaoda",
+    "jianshaokaixiao"
+  ],
+  pinyinUnits: {},
+  distractors: "*KO*Q/*RM*RvRSCD*Bv*Ci*QXT*RHVWB*GrXYBaBCD*Ca*MpbcdeBCJQAfIQAB*D3jkB*AM*SmlmNnoBMpqBrBCDRSTUIJABBPSTBPRTCPRSCPRSWDPRVDPRYEPRXEPRhisPFPRSGPRSGPRSeHPRdHPRgIPRfIPRZisPZhsPkKPRjKPRmLPRlLPRMPRSMPRSNPRSNPRSOPRSZhiP"
 };
 
 export const p4_62_at__the__restaurant = {
@@ -571,7 +983,60 @@ export const p4_62_at__the__restaurant = {
     ["快上菜", "kuài shàng cài", "The food will be served soon", "La comida se servirá pronto", "La nourriture sera bientôt servie", "A comida será servida em breve"],
     ["要订座", "yào dìng zuò", "Need to reserve a table", "Hay que reservar mesa", "Il faut réserver", "Precisa de reserva"],
     ["已订座", "yǐ dìng zuò", "Already reserved", "Ya reservado", "Déjà réservé", "Já reservado"]
-  ]
+  ],
+  accentFree: {},
+  tonelessPinyin: [
+    "caidan",
+    "diancai",
+    "tuijian",
+    "zhaopaicai",
+    "weidao",
+    "fuwuyuan",
+    "maidan",
+    "jiezhang",
+    "dabao",
+    "waimai",
+    "tangshi",
+    "baojian",
+    "canju",
+    "kuaizi",
+    "shangcai",
+    "dingzuo",
+    "kancaidan",
+    "nacaidan",
+    "yaodiancai",
+    "laidiancai",
+    "youtuijian",
+    "qingtuijian",
+    "zheshizhaopaicai",
+    "dianzhaopaicai",
+    "weidaohao",
+    "changweidao",
+    "jiaofuwuyuan",
+    "zhaofuwuyuan",
+    "yaomaidan",
+    "laimaidan",
+    "yaojiezhang",
+    "qujiezhang",
+    "yaodabao",
+    "bangwodabao",
+    "dianwaimai",
+    "songwaimai",
+    "xuantangshi",
+    "yaotangshi",
+    "dingbaojian",
+    "youbaojian",
+    "nacanju",
+    "yongcanju",
+    "nakuaizi",
+    "yongkuaizi",
+    "shangcaile",
+    "kuaishangcai",
+    "yaodingzuo",
+    "yidingzuo"
+  ],
+  pinyinUnits: {},
+  distractors: "*D1GQROSTA*A6UVAXFQRYZAB*HHab6*D1AcdefAB*Az*INgAijABklABmnABopABqrABB*QZstzuvARADFQADFTBDFSBDFVCDFUCDFXabhDabhEDFQEDFQbFXhaFXhdGDFcGDFfHDFeHDF*IpIDFXabDjJDFiJDFlKDFkKDFnLDFmLDFpMDFoMDFrNDFqNDFODFQODFQv*G5PDuPDF"
 };
 
 export const p4_63_at__the__hotel = {
@@ -632,7 +1097,57 @@ export const p4_63_at__the__hotel = {
     ["负责接待", "fù zé jiē dài", "Responsible for the reception", "Responsable de la recepción", "Responsable de l'accueil", "Responsável pela recepção"],
     ["找行李员", "zhǎo xíng lǐ yuán", "Find the bellman", "Encuentra al botones", "Trouvez le bagagiste", "Encontre o mensageiro"],
     ["叫行李员", "jiào xíng lǐ yuán", "Call the bellman", "llamar al botones", "Appelez le bagagiste", "Ligue para o mensageiro"]
-  ]
+  ],
+  accentFree: {},
+  tonelessPinyin: [
+    "binguan",
+    "danrenjian",
+    "shuangrenjian",
+    "dingfang",
+    "yuding",
+    "ruzhu",
+    "tuifang",
+    "yajin",
+    "reshui",
+    "qiantai",
+    "fuwu",
+    "kefang",
+    "qianting",
+    "jiedai",
+    "xingliyuan",
+    "zhubinguan",
+    "zhaobinguan",
+    "yaodanrenjian",
+    "dingdanrenjian",
+    "yaoshuangrenjian",
+    "dingshuangrenjian",
+    "yaodingfang",
+    "qudingfang",
+    "yiyuding",
+    "yaoyuding",
+    "banruzhu",
+    "yiruzhu",
+    "yaotuifang",
+    "bantuifang",
+    "jiaoyajin",
+    "tuiyajin",
+    "youreshui",
+    "kaireshui",
+    "quqiantai",
+    "zaiqiantai",
+    "fuwuhao",
+    "yaofuwu",
+    "zhukefang",
+    "dasaokefang",
+    "zaiqianting",
+    "zhuangxiuqianting",
+    "jiedaichu",
+    "fuzejiedai",
+    "zhaoxingliyuan",
+    "jiaoxingliyuan"
+  ],
+  pinyinUnits: {},
+  distractors: "PQDECRSOBTUO*GDGLV*A4*IxXY*Jj*JkZaDLbc*FLdeAfgAD*DHMhi*F5jkADG*L+l*DHJnA*AI*Br*Kd*L3rsyBQABCPABCSTBURUBTRUCSSTCR*GiWbDVDBCY*JAEBX*I/EBaFBCZ*J8*J+FVcGBbGBCeHBCdHBCgIBCfIBCiJBChnJB*F5KBCKBCOLBCORSTUiMBCRSTUNBCORSTUsORSrORS"
 };
 
 export const p4_64_at__the__airport = {
@@ -696,7 +1211,60 @@ export const p4_64_at__the__airport = {
     ["去候机", "qù hòu jī", "Going to the waiting area", "Ir a la sala de espera", "Aller en salle d'attente", "Ir para a sala de espera"],
     ["走廊桥", "zǒu láng qiáo", "Jet bridge", "Puente de embarque", "Passerelle d'embarquement", "Ponte de embarque"],
     ["通过廊桥", "tōng guò láng qiáo", "Board via the jet bridge", "Subir por el puente de embarque", "Embarquer par la passerelle", "Embarcar pela ponte de embarque"]
-  ]
+  ],
+  accentFree: {},
+  tonelessPinyin: [
+    "hangban",
+    "dengji",
+    "dengjikou",
+    "dengjipai",
+    "tuoyun",
+    "xingli",
+    "anjian",
+    "huzhao",
+    "qianzheng",
+    "yanwu",
+    "daoda",
+    "chufa",
+    "guoji",
+    "guonei",
+    "houji",
+    "langqiao",
+    "chahangban",
+    "denghangban",
+    "qudengji",
+    "zhunbeidengji",
+    "zhaodengjikou",
+    "daodengjikou",
+    "nadengjipai",
+    "dayindengjipai",
+    "bantuoyun",
+    "yaotuoyun",
+    "naxingli",
+    "quxingli",
+    "guoanjian",
+    "paiduianjian",
+    "daihuzhao",
+    "chahuzhao",
+    "banqianzheng",
+    "youqianzheng",
+    "hangbanyanwu",
+    "youyanwu",
+    "yidaoda",
+    "zhunbeidaoda",
+    "zhunbeichufa",
+    "yichufa",
+    "shiguojihangban",
+    "feiguoji",
+    "shiguoneihangban",
+    "feiguonei",
+    "zaihouji",
+    "quhouji",
+    "zoulangqiao",
+    "tongguolangqiao"
+  ],
+  pinyinUnits: {},
+  distractors: "QRBEOCDSDBUVCBWQYZAB*BD*Gyab*A3cAByefAghAB*EdjABkABE*D4*L2nANpABMrABB*I5stuABERACDQACDtBCDUVWdVCTWUCTWDTUVoqTUZECDYECDbFCDaFCDGCDQTUVWfHCDeHCDhICDgICDTUVW*EvJCDKCDQTUVWTUVWLCDQqXTUrMCDoXTUpNCDt*JQOCSsOCPCDQTUVW"
 };
 
 export const p4_65_at__the__doctor = {
@@ -760,7 +1328,60 @@ export const p4_65_at__the__doctor = {
     ["挂门诊", "guà mén zhěn", "Register for outpatient", "Registrarse para ambulatorio", "S'inscrire en ambulatoire", "Registrar para ambulatório"],
     ["看急诊", "kàn jí zhěn", "See emergency doctor", "Ver médico de urgencias", "Voir les urgences", "Ver emergência"],
     ["挂急诊", "guà jí zhěn", "Register for emergency", "Registrarse para urgencias", "S'inscrire aux urgences", "Registrar para emergência"]
-  ]
+  ],
+  accentFree: {},
+  tonelessPinyin: [
+    "zhensuo",
+    "yisheng",
+    "hushi",
+    "guahao",
+    "kanbing",
+    "jiancha",
+    "huayan",
+    "paipian",
+    "bushufu",
+    "tengtong",
+    "zhengzhuang",
+    "chiyao",
+    "dazhen",
+    "chufang",
+    "menzhen",
+    "jizhen",
+    "quzhensuo",
+    "zaizhensuo",
+    "zhaoyisheng",
+    "kanyisheng",
+    "zhaohushi",
+    "jiaohushi",
+    "quguahao",
+    "yiguahao",
+    "qukanbing",
+    "yaokanbing",
+    "zuojiancha",
+    "yaojiancha",
+    "zuohuayan",
+    "quhuayan",
+    "qupaipian",
+    "yaopaipian",
+    "bushufua",
+    "nalibushufu",
+    "youtengtong",
+    "gandaotengtong",
+    "youzhengzhuang",
+    "shenmezhengzhuang",
+    "yaochiyao",
+    "anshichiyao",
+    "yaodazhen",
+    "qudazhen",
+    "kaichufang",
+    "nachufang",
+    "kanmenzhen",
+    "guamenzhen",
+    "kanjizhen",
+    "guajizhen"
+  ],
+  pinyinUnits: {},
+  distractors: "QRBC*D3STA*HYUVA29*KU*KW*AA*AI*EcYabABcdABefABgQRSiABC*EgkABmABC*Az*F8op*DHqrAP456*BwO45RAISQAISTBIQSBIQVCIQUCIQX*JZDIW*JaDIZEIQYEIQbFIQaFIQdGIQcGIQfHIQeHIQIjlngjlnJIQRglnIKIQRgjnILIQRgjlI*GUpMIoMIQrNIQqNIQtuOIsvOIsvPItuPI"
 };
 
 export const p4_66_making__appointments = {
@@ -818,7 +1439,54 @@ export const p4_66_making__appointments = {
     ["约普通号", "yuē pǔ tōng hào", "Register for regular appointment", "Concertar cita con un número ordinario", "Prendre rendez-vous avec un numéro ordinaire", "Marque uma consulta com um número normal"],
     ["去约号", "qù yuē hào", "Go to the appointment number", "Ir al número de cita", "Accédez au numéro de rendez-vous", "Acesse o número do agendamento"],
     ["已约号", "yǐ yuē hào", "Already made an appointment", "Ya concerté una cita", "Déjà pris rendez-vous", "Já marquei uma consulta"]
-  ]
+  ],
+  accentFree: {},
+  tonelessPinyin: [
+    "yuyue",
+    "xiazhou",
+    "gaiqi",
+    "queren",
+    "denghou",
+    "paidui",
+    "jiaohao",
+    "yuyuehao",
+    "houzhen",
+    "jiuzhen",
+    "wenzhen",
+    "zhuanjiahao",
+    "putonghao",
+    "yuehao",
+    "yaoyuyue",
+    "yiyuyue",
+    "xiazhoujian",
+    "dengxiazhou",
+    "yaogaiqi",
+    "nenggaiqi",
+    "querenxia",
+    "qingqueren",
+    "denghouzhong",
+    "qingdenghou",
+    "paiduizhong",
+    "qupaidui",
+    "jiaohaole",
+    "dengjiaohao",
+    "youyuyuehao",
+    "nayuyuehao",
+    "houzhenzhong",
+    "zaihouzhen",
+    "qujiuzhen",
+    "zhunbeijiuzhen",
+    "wenzhenzhong",
+    "kaishiwenzhen",
+    "guazhuanjiahao",
+    "yuezhuanjiahao",
+    "guaputonghao",
+    "yueputonghao",
+    "quyuehao",
+    "yiyuehao"
+  ],
+  pinyinUnits: {},
+  distractors: "*A4*Go*PsH*L8QRA*BB*BC*D7*Ef*NRUVAWXAB*BBYZA*IEN*KUaopAN*Hf*IP*IQJ*IP*IQIK*Ea*IP*IQIklHMmnHL*A/*BA*IEG*G8PAH*G7OAHBHLM*MaBHL*EV*EzTCSCHLDHLMDHLMEHLMEHLMFHLMFHLMGHLMGHLMdHhjcHhjiIHL*H9IHLJHLMcdjkeKHLcdhklLcdkLcdnMcdmMcd*Bf*IXHp*IYHoN"
 };
 
 export const p4_67_weather__conversations = {
@@ -885,7 +1553,63 @@ export const p4_67_weather__conversations = {
     ["很阴沉", "hěn yīn chén", "Very gloomy", "Muy sombrío", "Très sombre", "Muito sombrio"],
     ["天气闷热", "tiān qì mèn rè", "The weather is sultry", "El clima es bochornoso", "Le temps est étouffant", "O tempo está abafado"],
     ["很闷热", "hěn mēn rè", "Very hot and humid", "Muy sofocante", "Très étouffant", "Muito abafado"]
-  ]
+  ],
+  accentFree: {},
+  tonelessPinyin: [
+    "ganzao",
+    "yusan",
+    "fangshai",
+    "biantian",
+    "zhuanliang",
+    "zhuannuan",
+    "zhoujiang",
+    "huinuan",
+    "rudong",
+    "ruxia",
+    "meiyu",
+    "taifeng",
+    "shachen",
+    "wumai",
+    "qinglang",
+    "yinchen",
+    "menre",
+    "henganzao",
+    "tianqiganzao",
+    "daiyusan",
+    "maiyusan",
+    "yaofangshai",
+    "zuofangshai",
+    "yaobiantian",
+    "kuaibiantian",
+    "tianqizhuanliang",
+    "kaishizhuanliang",
+    "tianqizhuannuan",
+    "kaishizhuannuan",
+    "qiwenzhoujiang",
+    "wenduzhoujiang",
+    "tianqihuinuan",
+    "kaishihuinuan",
+    "yirudong",
+    "kuairudong",
+    "yiruxia",
+    "kuairuxia",
+    "meiyuji",
+    "xiameiyu",
+    "youtaifeng",
+    "guataifeng",
+    "youshachen",
+    "qishachen",
+    "youwumai",
+    "chuxianwumai",
+    "tianqiqinglang",
+    "henqinglang",
+    "tianqiyinchen",
+    "henyinchen",
+    "tianqimenre",
+    "henmenre"
+  ],
+  pinyinUnits: {},
+  distractors: "RBCDTUACVWAB*D6*L7*OxX*D8FAB*D8EHAABCDF6AB*GpJhi*GpIjklmABnoABpqABrABCuABCwABCyABCATUVZabcUBRVTBRVWCRTVCRTYDRTXDRTbSaccSZbZfSaagSZSZabSZabbSZacSZa*G+ijIhkIR*G+hkJijJRKRTUKRTUoLRTnLRTqMRTpMRTNRTUSZabSZabORTUSZabPRTUSZabQRTU"
 };
 
 export const p4_68_phone__conversations = {
@@ -949,7 +1673,60 @@ export const p4_68_phone__conversations = {
     ["请拨打", "qǐng bō dǎ", "Please dial", "Por favor marque", "Veuillez composer", "Por favor disque"],
     ["已接通", "yǐ jiē tōng", "Connected", "Conectado", "Connecté", "Conectado"],
     ["无法接通", "wú fǎ jiē tōng", "Unable to connect", "No se puede conectar", "Impossible de se connecter", "Não foi possível conectar"]
-  ]
+  ],
+  accentFree: {},
+  tonelessPinyin: [
+    "wei",
+    "qingwen",
+    "zaima",
+    "buzai",
+    "shaodeng",
+    "fangbian",
+    "xinhao",
+    "huidian",
+    "guaduan",
+    "jiedianhua",
+    "dadianhua",
+    "liuyan",
+    "yuyin",
+    "mangxian",
+    "boda",
+    "jietong",
+    "weinihao",
+    "weiqingwen",
+    "qingwenyixia",
+    "woxiangqingwen",
+    "zaimani",
+    "nizaima",
+    "buzaijia",
+    "renbuzai",
+    "shaodengxia",
+    "qingshaodeng",
+    "fangbianma",
+    "bufangbian",
+    "xinhaocha",
+    "meixinhao",
+    "huidianhua",
+    "denghuidian",
+    "guaduanle",
+    "beiguaduan",
+    "jiedianhuaba",
+    "kuaijiedianhua",
+    "dadianhuaba",
+    "qudadianhua",
+    "liuyanban",
+    "qingliuyan",
+    "fayuyin",
+    "tingyuyin",
+    "mangxianzhong",
+    "dianhuamangxian",
+    "bodadianhua",
+    "qingboda",
+    "yijietong",
+    "wufajietong"
+  ],
+  pinyinUnits: {},
+  distractors: "*FH*Q/*RM*Rv*CY*CZ*LyRUVBD*Bu*Bv*D5*MvYZBC*DLabB*IE*I3*I+c*JiefB*IEghBKeijJeklmnBCopBCqBCDtBCD*Gx*L3*M0uJKRUBJKQTijkSijkCJKQCJKQDJKQDJKQEJKQEJKQFJKQFJKQGJKQGJKQJKHQHJKQIJKQIJKQkJSTJSTiiKSTsKSTLJKQLJKQpMJKoMJKNJKQSTijlKSTOJKQPJKQSTij"
 };
 
 export const p4_69_social__situations = {
@@ -1016,7 +1793,63 @@ export const p4_69_social__situations = {
     ["相处融洽", "xiāng chǔ róng qià", "Get along harmoniously", "Llevarse bien armoniosamente", "S'entendre harmonieusement", "Conviver harmoniosamente"],
     ["被冷落", "bèi lěng luò", "Being neglected", "Ser ignorado", "Être négligé", "Ser negligenciado"],
     ["别冷落", "bié lěng luò", "Don't neglect", "No ignores", "Ne négligez pas", "Não negligencie"]
-  ]
+  ],
+  accentFree: {},
+  tonelessPinyin: [
+    "jieshao",
+    "zenmeyang",
+    "laoyangzi",
+    "juhui",
+    "lianxi",
+    "baochilianxi",
+    "shunli",
+    "pengyou",
+    "shuren",
+    "moshengren",
+    "jiaowang",
+    "xiangchu",
+    "wanglai",
+    "shuxi",
+    "qinjin",
+    "rongqia",
+    "lengluo",
+    "ziwojieshao",
+    "laijieshao",
+    "zuijinzenmeyang",
+    "nizenmeyang",
+    "haishilaoyangzi",
+    "jiulaoyangzi",
+    "canjiajuhui",
+    "banjuhui",
+    "lianxiwo",
+    "changlianxi",
+    "baochilianxiba",
+    "yaobaochilianxi",
+    "henshunli",
+    "yiqieshunli",
+    "haopengyou",
+    "jiaopengyou",
+    "shishuren",
+    "jiandaoshuren",
+    "shimoshengren",
+    "yudaomoshengren",
+    "zhengchangjiaowang",
+    "huxiangjiaowang",
+    "haoxiangchu",
+    "rongyixiangchu",
+    "youwanglai",
+    "jingchangwanglai",
+    "henshuxi",
+    "bushuxi",
+    "henqinjin",
+    "buqinjin",
+    "henrongqia",
+    "xiangchurongqia",
+    "beilengluo",
+    "bielengluo"
+  ],
+  pinyinUnits: {},
+  distractors: "SDEGUCJSWBJS*BAYAEZaADbcRUdADEfgADNhADjBCSADEG*Ce*RC*RF*RK*O7pADIrsAtuADvADExyADFUWXABCJVbckBFRWTbckCFRUFRUWDBCJEBCJEBCJFTVcFTVbGBCJFRUWgHBCfHBCIBCJFRUWJFRUTVbcFRUWFRUWLBCJFRUWMBCJ*PHFRUsNBCrNBCuOBCtOBCPBCJFRUWyQBCxQBC"
 };
 
 export const p4_70_invitations__offers = {
@@ -1086,7 +1919,66 @@ export const p4_70_invitations__offers = {
     ["感谢招待", "gǎn xiè zhāo dài", "Thanks for hosting", "Gracias por atender", "Merci pour l'accueil", "Obrigado por receber"],
     ["盛情难却", "shèng qíng nán què", "Hard to refuse such kindness", "Difícil rechazar tanta amabilidad", "Difficile de refuser tant de gentillesse", "Difícil recusar tanta gentileza"],
     ["感谢盛情", "gǎn xiè shèng qíng", "Thanks for the kindness", "Gracias por la amabilidad", "Merci pour la gentillesse", "Obrigado pela gentileza"]
-  ]
+  ],
+  accentFree: {},
+  tonelessPinyin: [
+    "yaoqing",
+    "qingke",
+    "zuoke",
+    "yiqi",
+    "canjia",
+    "chuxi",
+    "jieshou",
+    "daying",
+    "jujue",
+    "wanju",
+    "gaitian",
+    "xiaci",
+    "ganxie",
+    "keqi",
+    "buhaoyisi",
+    "kuandai",
+    "zhaodai",
+    "shengqing",
+    "yaoqingni",
+    "shoudaoyaoqing",
+    "woqingke",
+    "shuiqingke",
+    "laizuoke",
+    "huanyingzuoke",
+    "yiqiqu",
+    "yiqichi",
+    "canjiahuodong",
+    "laicanjia",
+    "chuxihuiyi",
+    "laichuxi",
+    "jieshouyaoqing",
+    "yuanyijieshou",
+    "dayingni",
+    "yidaying",
+    "jujuele",
+    "beijujue",
+    "wanjule",
+    "zhihaowanju",
+    "gaitianba",
+    "denggaitian",
+    "xiaciba",
+    "dengxiaci",
+    "ganxieni",
+    "shenbiaoganxie",
+    "taikeqi",
+    "biekeqi",
+    "buhaoyisia",
+    "zhenbuhaoyisi",
+    "kuandaini",
+    "ganxiekuandai",
+    "zhaodaini",
+    "ganxiezhaodai",
+    "shengqingnanque",
+    "ganxieshengqing"
+  ],
+  pinyinUnits: {},
+  distractors: "SBCD*CY*CZ*KPCBWAD*NT*O9*Pk*PlbABC*D4*HcdA*Gx*Kd*M0AghABijABkABC*D7*Ef*Iz*Je*Iy*OyopqABC*GvstAuvTX*AI*Br*GxQ*AI*Br*GxPABCDAUVWOXacVBSWUBSWCSUVOTacZDSUYDSUOTXcESUVOTXaFSUVOTXaOTXaHSUVHSUVISUVISUVJSUVOTXaKSUVKSUVLSUV*JCLSUMSUVOTXatNSUsNSUOvTXOuTX*CAyPSzOTX*CAwQSxOTXOTXaOTXa"
 };
 
 export const p4_71_agreeing__disagreeing = {
@@ -1144,7 +2036,54 @@ export const p4_71_agreeing__disagreeing = {
     ["获得认可", "huò dé rèn kě", "Receive approval", "Recibir aprobación", "Recevoir l'approbation", "Receber aprovação"],
     ["得到接纳", "dé dào jiē nà", "Get accepted", "Ser aceptado", "Être accepté", "Ser aceito"],
     ["获得接纳", "huò dé jiē nà", "Receive acceptance", "Recibir aceptación", "Recevoir l'acceptation", "Receber aceitação"]
-  ]
+  ],
+  accentFree: {},
+  tonelessPinyin: [
+    "tongyi",
+    "zancheng",
+    "zhichi",
+    "rentong",
+    "fandui",
+    "butongyi",
+    "youdaoli",
+    "meidaoli",
+    "budui",
+    "buyiding",
+    "kanqingkuang",
+    "tuoxie",
+    "renke",
+    "jiena",
+    "wotongyi",
+    "mingquetongyi",
+    "wozancheng",
+    "biaoshizancheng",
+    "wozhichi",
+    "biaoshizhichi",
+    "worentong",
+    "biaoshirentong",
+    "wofandui",
+    "mingquefandui",
+    "wobutongyi",
+    "biaoshibutongyi",
+    "henyoudaoli",
+    "shuodeyoudaoli",
+    "meidaolia",
+    "shuodemeidaoli",
+    "buduiba",
+    "zhebudui",
+    "buyidingba",
+    "yebuyiding",
+    "kanqingkuangba",
+    "yaokanqingkuang",
+    "zuotuoxie",
+    "huxiangtuoxie",
+    "dedaorenke",
+    "huoderenke",
+    "dedaojiena",
+    "huodejiena"
+  ],
+  pinyinUnits: {},
+  distractors: "*AF*CcFOQACD*AO*Ca*FNSM*RC*RDUItWAO*RYAYHaFJGcFJ*Bu*Bv*KREw9gh*DwijFkABCD*R6AB*Gx*Kd*L3AFAYGRTVXBFGHPTVXCFGHPRVXDFGHPRTXEFGHPRTVFOPR*AvbdPGPRTdZPRHPRTbZPRIFGHIFGHJPRTJPRTKPRTKPRTLFGHPRTVPRTVPRTVPRTVPRTV"
 };
 
 export const p4_72_expressing__certainty = {
@@ -1208,7 +2147,60 @@ export const p4_72_expressing__certainty = {
     ["铁定会", "tiě dìng huì", "Definitely will", "Definitivamente lo hará", "Va certainement", "Definitivamente vai"],
     ["断定是", "duàn dìng shì", "Conclude it is", "Concluir que es", "Conclure que c'est", "Concluir que é"],
     ["可以断定", "kě yǐ duàn dìng", "Can conclude", "Se puede concluir", "Peut conclure", "Pode concluir"]
-  ]
+  ],
+  accentFree: {},
+  tonelessPinyin: [
+    "queding",
+    "kending",
+    "yiding",
+    "juedui",
+    "dangran",
+    "biran",
+    "buqueding",
+    "keneng",
+    "yexu",
+    "dagai",
+    "kongpa",
+    "nanshuo",
+    "baozhun",
+    "zhunbao",
+    "tieding",
+    "duanding",
+    "woqueding",
+    "quedingma",
+    "henkending",
+    "bukending",
+    "yidinghui",
+    "yidingyao",
+    "jueduishi",
+    "jueduibu",
+    "dangranshi",
+    "dangranhui",
+    "biranhui",
+    "shibiran",
+    "buquedinga",
+    "haibuqueding",
+    "kenengshi",
+    "youkeneng",
+    "yexuba",
+    "yexuhui",
+    "dagaishi",
+    "dagaihui",
+    "kongpashi",
+    "kongpahui",
+    "nanshuoa",
+    "hainanshuo",
+    "baozhunxing",
+    "baozhunmeiwenti",
+    "zhunbaochenggong",
+    "zhunbaokeyi",
+    "tiedingying",
+    "tiedinghui",
+    "duandingshi",
+    "keyiduanding"
+  ],
+  pinyinUnits: {},
+  distractors: "*AQ*A2*A4*A/*AQ*A2*A4*A/*AQ*A2*A4*A/*Mr*MvWXF6*SpYE*Spab*MwQTAefABghAB*Pj*PsijklAB*Eh*O5mnoABC*A1ABC*AQ*A2*A4*A/*AQ*A2*A4*A/GARSAGQSTBGQ*MwGSBVtCGUCGQXDGQWDGQZEGQYaEGZFGQFGQRGdqrGcqrHGQRHGQRhIGQgIGQj*QGJGiJGQlKGQkKGQLGQRLGQRMGQRcdqrcdrvcdqvtOGQUsOGPGQRcdqr"
 };
 
 export const p4_73_time__expressions = {
@@ -1272,7 +2264,60 @@ export const p4_73_time__expressions = {
     ["尔后决定", "ěr hòu jué dìng", "Then decide", "Entonces decide", "Alors décidez", "Então decida"],
     ["此刻开始", "cǐ kè kāi shǐ", "Start now", "Empezar ahora", "Commencez maintenant", "Comece agora"],
     ["在此刻", "zài cǐ kè", "At this moment", "en este momento", "En ce moment", "Neste momento"]
-  ]
+  ],
+  accentFree: {},
+  tonelessPinyin: [
+    "ganggang",
+    "like",
+    "zhiqian",
+    "zhihou",
+    "zhengzai",
+    "yijing",
+    "haimei",
+    "zhongyu",
+    "jishi",
+    "shunshi",
+    "dangji",
+    "suiji",
+    "xuanji",
+    "jier",
+    "erhou",
+    "cike",
+    "ganggangshuo",
+    "ganggangdao",
+    "likequ",
+    "likezuo",
+    "zhiqianshuo",
+    "zaizhiqian",
+    "zhihoushuo",
+    "zaizhihou",
+    "zhengzaizuo",
+    "zhengzaichi",
+    "yijingdao",
+    "yijingzou",
+    "haimeidao",
+    "haimeichi",
+    "zhongyudao",
+    "zhongyuwancheng",
+    "jishitongxun",
+    "jishigengxin",
+    "shunshisudu",
+    "shunshibianhua",
+    "dangjijueding",
+    "dangjihuifu",
+    "suijilikai",
+    "suijichufa",
+    "xuanjifanhui",
+    "xuanjixiaoshi",
+    "jierfazhan",
+    "jierchuxian",
+    "erhouzaishuo",
+    "erhoujueding",
+    "cikekaishi",
+    "zaicike"
+  ],
+  pinyinUnits: {},
+  distractors: "*PoQRB*AE*ALPS*A7DUVCOWX*Dz*D5*KR*QOabAB*R3cdA*RH*Sf*Sn*SoJ1ABI1AB*NVLMAKMABKLABABCDDABCBvACRASTQASTTBQRSBQRWCQRXCQRUDQRVDQRZEQRYEQRbFQRaFQRd*QLGQcGQRHQRSghijfhijfgijfghjfghifghifghifghifghifghifghifghifghifghifghifghiPQRS"
 };
 
 export const p4_74_frequency__expressions = {
@@ -1336,7 +2381,60 @@ export const p4_74_frequency__expressions = {
     ["是最后一次", "shì zuì hòu yī cì", "It’s the last time", "Es la última vez", "C'est la dernière fois", "É a última vez"],
     ["日常生活", "rì cháng shēng huó", "Daily life", "Vida diaria", "Vie quotidienne", "Cotidiano"],
     ["日常工作", "rì cháng gōng zuò", "Daily work", "Trabajo diario", "Travail quotidien", "Trabalho diário"]
-  ]
+  ],
+  accentFree: {},
+  tonelessPinyin: [
+    "tiantian",
+    "meici",
+    "meihui",
+    "jingchang",
+    "changchang",
+    "youshi",
+    "ouer",
+    "henshao",
+    "nande",
+    "congbu",
+    "conglai",
+    "zongshi",
+    "yizhi",
+    "diyici",
+    "zuihouyici",
+    "richang",
+    "tiantianjian",
+    "tiantianlian",
+    "meicidou",
+    "meicilai",
+    "meihuidou",
+    "meihuishuo",
+    "jingchanglai",
+    "jingchangqu",
+    "changchangxiang",
+    "changchangshuo",
+    "youshihou",
+    "youshihui",
+    "ouerlai",
+    "ouerxiang",
+    "henshaolai",
+    "henshaoshuo",
+    "nandelai",
+    "nandejian",
+    "congbushuo",
+    "congbuqu",
+    "conglaibu",
+    "conglaidou",
+    "zongshishuo",
+    "zongshizheyang",
+    "yizhidou",
+    "yizhishi",
+    "diyicilai",
+    "shidiyici",
+    "zuihouyicile",
+    "shizuihouyici",
+    "richangshenghuo",
+    "richanggongzuo"
+  ],
+  pinyinUnits: {},
+  distractors: "*Je*L7QR*L8CSTBUVA*Dz*D0EP*Dz*D0DP*A9*Ch*OJ*OKcdABw5+*SB*By*Eh*Nc*QVKijk*LKJkl*AHmAB*L0*NTz0qrQRstnq*Dz*D0DERANSQANSTUBNSBNQSVCNUCNQX*LoDNWDNQZENQYENQbFNQaFNQdGNQcGNQfHNQeHNQhINQgINQjJNQiJNQlJKNkKNQLNQROqrupMNQoMNQNOnrNOnqOtnqOsnqOnqrOnqr"
 };
 
 export const p4_75_describing__amounts = {
@@ -1397,7 +2495,57 @@ export const p4_75_describing__amounts = {
     ["还不到", "hái bú dào", "Not yet reached", "Todavía no llegó", "Pas encore atteint", "Ainda não chegou"],
     ["不少人", "bù shǎo rén", "Quite a few people", "Bastante gente", "Pas mal de gens", "Bastante gente"],
     ["有不少", "yǒu bù shǎo", "Have quite a lot", "Tener bastante", "Avoir pas mal", "Ter bastante"]
-  ]
+  ],
+  accentFree: {},
+  tonelessPinyin: [
+    "henduo",
+    "xuduo",
+    "daliang",
+    "yidian",
+    "yixie",
+    "zugou",
+    "bugou",
+    "ganghao",
+    "taiduo",
+    "taishao",
+    "zuoyou",
+    "dayue",
+    "chaoguo",
+    "budao",
+    "bushao",
+    "henduoren",
+    "youhenduo",
+    "xuduoren",
+    "youxuduo",
+    "daliangde",
+    "youdaliang",
+    "yidiandian",
+    "youyidian",
+    "yixieren",
+    "youyixie",
+    "zugoule",
+    "yizugou",
+    "bugouyong",
+    "haibugou",
+    "ganghaogou",
+    "ganghaoshi",
+    "taiduole",
+    "youtaiduo",
+    "taishaole",
+    "youtaishao",
+    "zuoyouba",
+    "shigezuoyou",
+    "dayueshi",
+    "dayueyou",
+    "chaoguole",
+    "yichaoguo",
+    "budaoshi",
+    "haibudao",
+    "bushaoren",
+    "youbushao"
+  ],
+  pinyinUnits: {},
+  distractors: "*O4BI*SBAIRS*NaLTU*AC*AJ*Cj*Eh*L0*NT*O9DGZaA*Bu*Bv*KR*Mv*OB*RQ*Rq*RyABJf*O4IOh*DB*DJjA*Ix*NaCl*RInoA*Bu*Bv*KR*Mv*Bu*Bv*KR*MvRAQSSgAPPBQSQgBPCPQRCPQRDPQR*AW*E3YDEPQRWEPQFPQRFPQR*BvGPQqGPQeHPQdHPQhIPQQSiIfJPQgsJPKPQRPQRS*NzmLPlLPQMPQRMPQRNPQR*OdcNPOPQRiOPQ"
 };
 
 export const p4_76_quality__descriptions = {
@@ -1461,7 +2609,60 @@ export const p4_76_quality__descriptions = {
     ["做工精致", "zuò gōng jīng zhì", "Exquisite workmanship", "Mano de obra exquisita", "Travail exquis", "Acabamento requintado"],
     ["很精良", "hěn jīng liáng", "Very well-made", "Muy bien hecho", "Très bien fait", "Muito bem feito"],
     ["制作精良", "zhì zuò jīng liáng", "Well-crafted", "Bien elaborado", "Bien conçu", "Bem elaborado"]
-  ]
+  ],
+  accentFree: {},
+  tonelessPinyin: [
+    "zhengpin",
+    "jiahuo",
+    "shanzhai",
+    "liezhi",
+    "yiliu",
+    "erliu",
+    "xingjiabi",
+    "zhide",
+    "buzhi",
+    "naiyong",
+    "laogu",
+    "shangcheng",
+    "dilie",
+    "cucao",
+    "jingzhi",
+    "jingliang",
+    "shizhengpin",
+    "maizhengpin",
+    "shijiahuo",
+    "maijiahuo",
+    "shishanzhai",
+    "shanzhaihuo",
+    "henliezhi",
+    "shiliezhi",
+    "yiliude",
+    "henyiliu",
+    "erliude",
+    "shierliu",
+    "xingjiabigao",
+    "kanxingjiabi",
+    "henzhide",
+    "zhidemai",
+    "buzhide",
+    "buzhizhegejia",
+    "hennaiyong",
+    "tebienaiyong",
+    "henlaogu",
+    "tebielaogu",
+    "shangchengpinzhi",
+    "pinzhishangcheng",
+    "hendilie",
+    "pinzhidilie",
+    "hencucao",
+    "zuogongcucao",
+    "henjingzhi",
+    "zuogongjingzhi",
+    "henjingliang",
+    "zhizuojingliang"
+  ],
+  pinyinUnits: {},
+  distractors: "*Dz*OFQRSTACUVABWXAB*L0*NT*O9*PkEabAcdQR*By*O5ef*Bu*Bv*KR*Mv*Bv*FJiAkABC*GCABCoABCqABCPsABOuABRAGSQAGSTBGQSBGQCGQRCGQRXDGQWDGQa*RUEG*SPEGQYFGQFGQRGdjlGcjlgHGQHGQReHIGcdjlJGQRcdlmKGQRcdjmcdjlcdjlMGQRcdjlNGQRcdjluOGQcdjlsPGQcdjl"
 };
 
 export const p4_77_making__comparisons = {
@@ -1525,7 +2726,60 @@ export const p4_77_making__comparisons = {
     ["较大", "jiào dà", "Larger", "Más grande", "Plus grand", "Maior"],
     ["略胜一筹", "lüè shèng yī chóu", "Slightly better", "Ligeramente mejor", "Un peu mieux", "Um pouco melhor"],
     ["稍微略胜", "shāo wēi lüè shèng", "Slightly better", "Ligeramente mejor", "Un peu mieux", "Um pouco melhor"]
-  ]
+  ],
+  accentFree: {},
+  tonelessPinyin: [
+    "bijiao",
+    "geng",
+    "buru",
+    "yiyang",
+    "xiangtong",
+    "butong",
+    "chabuduo",
+    "xiangsi",
+    "qubie",
+    "youyu",
+    "shengguo",
+    "biqi",
+    "xiangbi",
+    "duibi",
+    "jiao",
+    "luesheng",
+    "bijiaohao",
+    "zuobijiao",
+    "genghao",
+    "gengda",
+    "buruni",
+    "buruta",
+    "yiyangde",
+    "douyiyang",
+    "xiangtongde",
+    "wanquanxiangtong",
+    "butongde",
+    "jieranbutong",
+    "chabuduoba",
+    "douchabuduo",
+    "henxiangsi",
+    "feichangxiangsi",
+    "youqubie",
+    "meiqubie",
+    "youyuta",
+    "yuanyouyu",
+    "shengguota",
+    "lueshengguo",
+    "biqini",
+    "biqita",
+    "xiangbizhixia",
+    "yuzhixiangbi",
+    "duibiyixia",
+    "jinxingduibi",
+    "jiaohao",
+    "jiaoda",
+    "lueshengyichou",
+    "shaoweiluesheng"
+  ],
+  pinyinUnits: {},
+  distractors: "LOQR*FH*KOOx*Bu*Bv*KR*Mv*L0*NT*O9*Pk*Ce*LJ*MqF*Bu*Bv*KR*MqcdQR*Ce*LJEMghAC*FK*OI*Sf*Sn*PtklA*L0Amn*Ce*LJEHMACD*FH*KOBxlACDAsGRAGQU*PoTs0StBAVCGQUCGQ*QmDGQDGQRaEGQbcdf*MsYFGZcdfGZbdGZbcHGQRZbcdhIGQgIGQJGQRJGQRKGQRKPGQnLGQmLGQZbcdZbcdZbcdZbcd*PoSt0TsOAZbcdZbcd"
 };
 
 export const p4_78_expressing__preferences = {
@@ -1589,7 +2843,60 @@ export const p4_78_expressing__preferences = {
     ["我的首选", "wǒ de shǒu xuǎn", "my first choice", "mi primera opción", "mon premier choix", "minha primeira escolha"],
     ["是次选", "shì cì xuǎn", "is the second choice", "es la segunda opción", "est le deuxième choix", "é a segunda escolha"],
     ["作为次选", "zuò wéi cì xuǎn", "as the second choice", "como segunda opción", "comme deuxième choix", "como segunda escolha"]
-  ]
+  ],
+  accentFree: {},
+  tonelessPinyin: [
+    "xihuan",
+    "ai",
+    "zuiai",
+    "pianai",
+    "pianhao",
+    "taoyan",
+    "buxihuan",
+    "wusuowei",
+    "yiban",
+    "haixing",
+    "xuanze",
+    "qingxiang",
+    "ningke",
+    "ningyuan",
+    "shouxuan",
+    "cixuan",
+    "woxihuan",
+    "henxihuan",
+    "woai",
+    "henai",
+    "wozuiai",
+    "shizuiai",
+    "wopianai",
+    "youdianpianai",
+    "wodepianhao",
+    "gerenpianhao",
+    "wotaoyan",
+    "hentaoyan",
+    "wobuxihuan",
+    "youdianbuxihuan",
+    "wusuoweia",
+    "wowusuowei",
+    "yibanban",
+    "henyiban",
+    "haixingba",
+    "juedehaixing",
+    "woxuanze",
+    "zuoxuanze",
+    "woqingxiang",
+    "youqingxiang",
+    "ningkebu",
+    "woningke",
+    "ningyuanzou",
+    "woningyuan",
+    "shishouxuan",
+    "wodeshouxuan",
+    "shicixuan",
+    "zuoweicixuan"
+  ],
+  pinyinUnits: {},
+  distractors: "GQRC*FH*KO*Q/*RMDSTBCEST*Po*RQ*RqDabACQRAcefGQ*L0*NT*O9*Pk*D2*OHiAklAC*DLmnA*MzNopMqrAPsACOuACGRAcGQAHCDTB*O4*PhCDVWCSUCGHUDSGYZceXZceXYcebFGHaFGHGQXYXYZcHXYZHXYZIGHQ*QnIGHJGHQXYZclKGHkKGHnLGHmLGHMGHQrMGHNGHQpNGHuOGHXYZcsPGHXYZc"
 };
 
 export const p4_79_giving__reasons = {
@@ -1653,5 +2960,58 @@ export const p4_79_giving__reasons = {
     ["不能归咎", "bù néng guī jiù", "Can’t blame", "No puedo culpar", "Je ne peux pas blâmer", "Não posso culpar"],
     ["根本原因是", "gēn běn yuán yīn shì", "The root cause is", "La causa raíz es", "La cause première est", "A causa raiz é"],
     ["找根本原因", "zhǎo gēn běn yuán yīn", "Find the root cause", "Encuentra la causa raíz", "Trouver la cause profonde", "Encontre a causa raiz"]
-  ]
+  ],
+  accentFree: {},
+  tonelessPinyin: [
+    "yinwei",
+    "youyu",
+    "suoyi",
+    "liyou",
+    "yuangu",
+    "yuanyou",
+    "jieshi",
+    "shuoming",
+    "genju",
+    "jiyu",
+    "jianyu",
+    "jiran",
+    "zhisuoyi",
+    "genyou",
+    "guijiu",
+    "genbenyuanyin",
+    "yinweini",
+    "shiyinwei",
+    "youyutianqi",
+    "youyushijian",
+    "suoyishuo",
+    "suoyiwo",
+    "liyoushi",
+    "youliyou",
+    "yuangushi",
+    "shenmeyuangu",
+    "yuanyoushi",
+    "zhuiwenyuanyou",
+    "jieshixia",
+    "zuojieshi",
+    "shuomingxia",
+    "zuoshuoming",
+    "genjuguiding",
+    "genjuqingkuang",
+    "jiyushishi",
+    "jiyuci",
+    "jianyuci",
+    "jianyuqingkuang",
+    "jiranruci",
+    "jiranni",
+    "zhisuoyizheyang",
+    "zhisuoyishuo",
+    "genyoushi",
+    "zhuixungenyou",
+    "guijiuyu",
+    "bunengguijiu",
+    "genbenyuanyinshi",
+    "zhaogenbenyuanyin"
+  ],
+  pinyinUnits: {},
+  distractors: "QRBC*OI*RHJKMUVAFNWXFYABDENacdABefAB*AM*FSNA*OI*RHBK*AQ*OI*RHB*NV*NWnACpQRDFIqsABCuvSTAMRUAMQUPTZbPSZbVCpMUCMQaqDMDMQRaEMQPSTbWYqFPSTZGMQRGMQRHMQRHMQRPSTZPSTZPSTZkJMQjKMQPSTZPSTZLMQRuvPSMUPSWaNMPSTZOMQRPSTZPovSPouS"
 };
@@ -74,7 +74,63 @@ export const p5_80_personality__traits = {
     ["悲观情绪", "bēi guān qíng xù", "Pessimistic mood", "Estado de ánimo pesimista", "Humeur pessimiste", "Humor pessimista"],
     ["充满自信", "chōng mǎn zì xìn", "Full of confidence", "Lleno de confianza", "Plein de confiance", "Cheio de confiança"],
     ["自信满满", "zì xìn mǎn mǎn", "Brimming with confidence", "Rebosante de confianza", "Débordant de confiance", "Transbordando confiança"]
-  ]
+  ],
+  accentFree: {},
+  tonelessPinyin: [
+    "xingge",
+    "kailang",
+    "neixiang",
+    "waixiang",
+    "huopo",
+    "anjing",
+    "reqing",
+    "lengdan",
+    "youmo",
+    "yansu",
+    "wenrou",
+    "cubao",
+    "naixin",
+    "jizao",
+    "leguan",
+    "beiguan",
+    "zixin",
+    "haoxingge",
+    "gaibianxingge",
+    "xinggekailang",
+    "kailangaixiao",
+    "xinggeneixiang",
+    "neixiangderen",
+    "xinggewaixiang",
+    "waixianghaodong",
+    "huopokeai",
+    "tianzhenhuopo",
+    "anjingxialai",
+    "ananjingjing",
+    "reqingzhaodai",
+    "reqinghaoke",
+    "taidulengdan",
+    "lengdandairen",
+    "shuohuayoumo",
+    "youmofengqu",
+    "biaoqingyansu",
+    "yansurenzhen",
+    "xinggewenrou",
+    "wenroutitie",
+    "piqicubao",
+    "zuoshicubao",
+    "younaixin",
+    "naixindengdai",
+    "piqijizao",
+    "jizaobuan",
+    "xintaileguan",
+    "leguanxiangshang",
+    "taibeiguan",
+    "beiguanqingxu",
+    "chongmanzixin",
+    "zixinmanman"
+  ],
+  pinyinUnits: {},
+  distractors: "*R6*R9RB*HvACDD*IWABC*JC*IWAABCDABCD*I8ABCABCDABCD*MEABCABCDABCDpABCABCDP*JCABO*JCvA*Nm*P2ABApvBTUVWSUVWSTVWXSTUSTUVVSTUSTUVSTUVSTUVSTUVSTUVSTUVSTUVSTUVSTUVSTUVSTUVSTUVSTUVSTUVSTUVSTUVSTUVMRvASTUVSTUVSTUVSTUVSTUVPRpASTUVSTUVSTUV"
 };
 
 export const p5_81_culture__traditions = {
@@ -138,7 +194,60 @@ export const p5_81_culture__traditions = {
     ["去放鞭炮", "qù fàng biān pào", "Go set off firecrackers", "Ir a encender petardos", "Aller allumer des pétards", "Ir acender fogos"],
     ["贴春联吧", "tiē chūn lián ba", "Let's post Spring couplets", "Vamos a pegar los pareados de primavera", "Collons les couplets du Nouvel An", "Vamos colar os pareados de primavera"],
     ["去贴春联", "qù tiē chūn lián", "Go post Spring couplets", "Ir a pegar los pareados de primavera", "Aller coller les couplets du Nouvel An", "Ir colar os pareados de primavera"]
-  ]
+  ],
+  accentFree: {},
+  tonelessPinyin: [
+    "wenhua",
+    "chuantong",
+    "xisu",
+    "fengsu",
+    "jieri",
+    "chunjie",
+    "zhongqiujie",
+    "duanwujie",
+    "qingmingjie",
+    "yuanxiaojie",
+    "hongbao",
+    "liwu",
+    "bainian",
+    "tuanyuan",
+    "fangbianpao",
+    "tiechunlian",
+    "zhongguowenhua",
+    "xuewenhua",
+    "chuantongde",
+    "baochichuantong",
+    "xisushi",
+    "dangdixisu",
+    "fengsuxiguan",
+    "bendifengsu",
+    "guojieri",
+    "shenmejieri",
+    "guochunjie",
+    "qingzhuchunjie",
+    "guozhongqiujie",
+    "qingzhuzhongqiujie",
+    "guoduanwujie",
+    "qingzhuduanwujie",
+    "guoqingmingjie",
+    "shiqingmingjie",
+    "guoyuanxiaojie",
+    "qingzhuyuanxiaojie",
+    "fahongbao",
+    "shouhongbao",
+    "songliwu",
+    "shouliwu",
+    "qubainian",
+    "bainianhao",
+    "jiarentuanyuan",
+    "hejiatuanyuan",
+    "fangbianpaoba",
+    "qufangbianpao",
+    "tiechunlianba",
+    "qutiechunlian"
+  ],
+  pinyinUnits: {},
+  distractors: "*Mw*NgRBSACDDUABCABEYABC*QcaABcHIJeGIJghGHiGHIklAB*I9mnAopABABCDstGHuvGHTVWXAGHIBGHIQVWXCGHIQTWXQTVXQTVWEGHIQTVWFGHIQTVWGQTVfjQTHQTVdjQThIQTgIQTJQTVdfQTlKGHkKGHnLGHmLGHMGHIMGHIQTVWQTVWOQTVOQTVPQTVPQTV"
 };
 
 export const p5_82_chinese__arts__heritage = {
@@ -205,7 +314,63 @@ export const p5_82_chinese__arts__heritage = {
     ["做陶瓷", "zuò táo cí", "Make ceramics", "Hacer cerámica", "Faire de la céramique", "Fazer cerâmica"],
     ["丝绸布", "sī chóu bù", "Silk fabric", "Tela de seda", "Tissu de soie", "Tecido de seda"],
     ["买丝绸", "mǎi sī chóu", "Buy silk", "Comprar seda", "Acheter de la soie", "Comprar seda"]
-  ]
+  ],
+  accentFree: {},
+  tonelessPinyin: [
+    "zhongguo",
+    "long",
+    "feng",
+    "xiongmao",
+    "gongfu",
+    "wushu",
+    "taijiquan",
+    "shufa",
+    "guohua",
+    "jingju",
+    "chadao",
+    "zhongyi",
+    "zhenjiu",
+    "jianzhi",
+    "cixiu",
+    "taoci",
+    "sichou",
+    "quzhongguo",
+    "zaizhongguo",
+    "zhongguolong",
+    "xianglong",
+    "fenghuang",
+    "xiangfeng",
+    "daxiongmao",
+    "kanxiongmao",
+    "xuegongfu",
+    "liangongfu",
+    "xuewushu",
+    "lianwushu",
+    "dataijiquan",
+    "liantaijiquan",
+    "xueshufa",
+    "lianshufa",
+    "xueguohua",
+    "huaguohua",
+    "kanjingju",
+    "changjingju",
+    "xuechadao",
+    "dongchadao",
+    "kanzhongyi",
+    "xuezhongyi",
+    "zuozhenjiu",
+    "xuezhenjiu",
+    "xuejianzhi",
+    "zuojianzhi",
+    "xuecixiu",
+    "zuocixiu",
+    "taocipin",
+    "zuotaoci",
+    "sichoubu",
+    "maisichou"
+  ],
+  pinyinUnits: {},
+  distractors: "LRSTC*GA*GB*GCB*GA*GB*GCXYAEZaADbcAD*EfdeR*Mo*Mp*TWf*PohiAjkADlmADAnoDpqADrsADtuADvwADxyADSAGTRAGTAGRSWBADCADEUCADYDGRXDGRaEGRZEGRcFGRbFGReGRSdGRSgHGRfHGRiIGRhIGRkJGRjJGRmKGRlKGRoLGRnLGRqMGRpMGRsNGRrNGRuOGRtOGRPGRSPGRSQGRSQGRS"
 };
 
 export const p5_83_time__expressions__advanced = {
@@ -269,7 +434,60 @@ export const p5_83_time__expressions__advanced = {
     ["做短期", "zuò duǎn qī", "Do short-term", "Hacer a corto plazo", "Faire du court terme", "Faça curto prazo"],
     ["与此同时说", "yǔ cǐ tóng shí shuō", "Talk at the same time", "Habla al mismo tiempo", "Parlez en même temps", "Fale ao mesmo tempo"],
     ["与此同时做", "yǔ cǐ tóng shí zuò", "Do at the same time", "hacer al mismo tiempo", "Faire en même temps", "Faça ao mesmo tempo"]
-  ]
+  ],
+  accentFree: {},
+  tonelessPinyin: [
+    "suishi",
+    "jishi",
+    "anshi",
+    "zanshi",
+    "linshi",
+    "dangshi",
+    "nashi",
+    "cishi",
+    "jieshi",
+    "jijiang",
+    "jike",
+    "pianke",
+    "shunjian",
+    "changqi",
+    "duanqi",
+    "yucitongshi",
+    "suishidoukeyi",
+    "suishilianxi",
+    "jishichuli",
+    "yaojishi",
+    "anshidao",
+    "yaoanshi",
+    "zanshibu",
+    "zanshide",
+    "linshide",
+    "shilinshi",
+    "dangshishuo",
+    "zaidangshi",
+    "nashihou",
+    "zainashi",
+    "cishicike",
+    "zaicishi",
+    "jieshijian",
+    "jieshitongzhi",
+    "jijiangdaolai",
+    "jijiangkaishi",
+    "jikechufa",
+    "jikezhixing",
+    "piankezhihou",
+    "shaodengpianke",
+    "shunjianxiaoshi",
+    "jiuzaishunjian",
+    "changqide",
+    "zuochangqi",
+    "duanqide",
+    "zuoduanqi",
+    "yucitongshishuo",
+    "yucitongshizuo"
+  ],
+  pinyinUnits: {},
+  distractors: "BCDEACDEABDEABCEABCDABCDABCDABCDABCDK*FdABJL*FdAKABCABCDO5*JFqN6stuvRSuvPRPSehPRehVBUWCTVWTCUWXDTUWYDTXETUETUVFTUVdfFTGTUVbfGTPRShbdHTITUVPRSePRSePRSePRSePRSePRSePRSePRSePRSesNTUtNTUq*DqOTrOTUvPQRuPQR"
 };
 
 export const p5_84_frequency__duration = {
@@ -333,7 +551,60 @@ export const p5_84_frequency__duration = {
     ["忙了整夜", "máng le zhěng yè", "Busy all night", "Ocupado toda la noche", "Occupé toute la nuit", "Ocupado a noite toda"],
     ["通宵工作", "tōng xiāo gōng zuò", "Working all night", "Trabajando toda la noche", "Travailler toute la nuit", "Trabalhando a noite toda"],
     ["熬了通宵", "áo le tōng xiāo", "Stayed up all night", "Me quedé despierto toda la noche", "Je suis resté éveillé toute la nuit", "Fiquei acordado a noite toda"]
-  ]
+  ],
+  accentFree: {},
+  tonelessPinyin: [
+    "pinlu",
+    "pinfan",
+    "fanfu",
+    "chongfu",
+    "lianxu",
+    "chixu",
+    "duanduanxuxu",
+    "shibushi",
+    "shichang",
+    "changjiu",
+    "duanzan",
+    "yongjiu",
+    "yishi",
+    "zhengtian",
+    "zhengye",
+    "tongxiao",
+    "pinlugao",
+    "kanpinlu",
+    "henpinfan",
+    "taipinfan",
+    "fanfuzuo",
+    "fanfushuo",
+    "chongfule",
+    "buyaochongfu",
+    "lianxusantian",
+    "lianxugongzuo",
+    "chixufazhan",
+    "chixujinxing",
+    "duanduanxuxude",
+    "shuodeduanduanxuxu",
+    "shibushide",
+    "shibushixiangqi",
+    "shichangxiang",
+    "shichanglai",
+    "changjiuzhiji",
+    "bunengchangjiu",
+    "duanzande",
+    "henduanzan",
+    "yongjiude",
+    "shiyongjiu",
+    "yishichongdong",
+    "yishixingqi",
+    "zhengtianmang",
+    "mangzhengtian",
+    "zhengyegongzuo",
+    "manglezhengye",
+    "tongxiaogongzuo",
+    "aoletongxiao"
+  ],
+  pinyinUnits: {},
+  distractors: "BQRCASTCD*RNUVC*JGWAFABCEABCcXYZeQRS*KbghA*CjL*JFA*CkklAJmnA*CW*CX*CY*CZO*JsqrN*JsABABCDAHRSAHQSTBHQSBHQVCHQUCHQDHQRGYZaGXZaGXYaGXYZGXYZGfXYGcfXHGXYcGXYhIHQgIHQGXYZGXYZ*DCKHQKHQRLHQRLHQRGXYZGXYZNHQRNHQRGXYZGXYZGXYZGXYZ"
 };
 
 export const p5_85_comparison__degree = {
@@ -391,7 +662,54 @@ export const p5_85_comparison__degree = {
     ["愈发觉得", "yù fā jué de", "Increasingly feel", "Sintiendo cada vez más", "Se sentir de plus en plus", "Sentindo cada vez mais"],
     ["极端情况", "jí duān qíng kuàng", "Extreme situation", "Situación extrema", "Situation extrême", "Situação extrema"],
     ["太极端", "tài jí duān", "Too extreme", "Demasiado extremo", "Trop extrême", "Muito extremo"]
-  ]
+  ],
+  accentFree: {},
+  tonelessPinyin: [
+    "xiangdang",
+    "jiqi",
+    "youqi",
+    "tebie",
+    "gengjia",
+    "yuelaiyue",
+    "yuefa",
+    "xiwei",
+    "luewei",
+    "chayidian",
+    "jihu",
+    "wanquan",
+    "yufa",
+    "jiduan",
+    "xiangdanghao",
+    "xiangdangbucuo",
+    "jiqizhongyao",
+    "jiqikunnan",
+    "youqishi",
+    "youqixihuan",
+    "tebiehao",
+    "tebiexihuan",
+    "gengjiahao",
+    "gengjianuli",
+    "yuelaiyuehao",
+    "yuelaiyueduo",
+    "yuefajuede",
+    "yuefamingxian",
+    "xiweibutong",
+    "xiweichabie",
+    "lueweibutong",
+    "lueweitiaozheng",
+    "chayidianjiu",
+    "chayidianchenggong",
+    "jihushi",
+    "jihuwancheng",
+    "wanquantongyi",
+    "wanquanbutong",
+    "yufayanzhong",
+    "yufajuede",
+    "jiduanqingkuang",
+    "taijiduan"
+  ],
+  pinyinUnits: {},
+  distractors: "*RMOBCCN*KeABSADUABCWABCYZJOMABCI*KnABH*KoABgFOS*SuiAB*QjABCGABCBp*KeAAFJSQRTV*KyPRTPQTVCFJOPQRVDFJOPQRTEFJOPQRTZFPQYFPQnPQRPQRTePQRPQRTcPQRPQRTJPQRPQRT*TIKFJPQRTPQRTPQRTPQRTaPQRPQRT*BpNFJ"
 };
 
 export const p5_86_cause__effect = {
@@ -455,7 +773,60 @@ export const p5_86_cause__effect = {
     ["由此产生", "yóu cǐ chǎn shēng", "produced from this", "producido a partir de esto", "produit à partir de ce", "produzido a partir disso"],
     ["因而导致", "yīn ér dǎo zhì", "caused", "causado", "causé", "causou"],
     ["因而决定", "yīn ér jué dìng", "thus determined", "así determinado", "ainsi déterminé", "assim determinado"]
-  ]
+  ],
+  accentFree: {},
+  tonelessPinyin: [
+    "yuanyin",
+    "jieguo",
+    "yinguo",
+    "daozhi",
+    "zaocheng",
+    "yinqi",
+    "chansheng",
+    "dailai",
+    "yingxiang",
+    "houguo",
+    "genyuan",
+    "qiyin",
+    "guiyinyu",
+    "yuanyu",
+    "youci",
+    "yiner",
+    "yuanyinshi",
+    "zhaoyuanyin",
+    "jieguoshi",
+    "kanjieguo",
+    "yinguoguanxi",
+    "youyinguo",
+    "daozhile",
+    "huidaozhi",
+    "zaochengle",
+    "huizaocheng",
+    "yinqile",
+    "huiyinqi",
+    "chanshengle",
+    "huichansheng",
+    "dailaile",
+    "huidailai",
+    "yingxiangda",
+    "youyingxiang",
+    "houguoyanzhong",
+    "chengdanhouguo",
+    "genyuanzai",
+    "zhaogenyuan",
+    "qiyinshi",
+    "chaqiyin",
+    "guiyinyuta",
+    "keguiyinyu",
+    "yuanyuci",
+    "yuanyuguoqu",
+    "youcikejian",
+    "youcichansheng",
+    "yinerdaozhi",
+    "yinerjueding"
+  ],
+  pinyinUnits: {},
+  distractors: "L*TYQRCJw*UGBJPwWXAB*QjYZAabABcdAB*Hm*Ho*Hq*HrghABBCw*UG*LTklAA*HmmnopQR*IaqAB*RIABCC*GH*RI*RJmAMRAMQS*FgBMQBMQRijopCMQRDMQRDMQR*Q/EMQEMQRFMQRFMQRGMQRGMQRH*H3MQHMQRIMQRIMQRUjopUiopKMQRKMQRQLMRLMQRMUijMUijNMQRUijoUijoUijo*Rb*RzUi*R0Uij"
 };
 
 export const p5_87_conditions__assumptions = {
@@ -519,7 +890,60 @@ export const p5_87_conditions__assumptions = {
     ["哪怕只有", "nǎ pà zhǐ yǒu", "Even if only", "Incluso si solo", "Même si seulement", "Mesmo que apenas"],
     ["无论是", "wú lùn shì", "Whether it is", "Ya sea", "Que ce soit", "Seja"],
     ["无论如何", "wú lùn rú hé", "No matter what", "Pase lo que pase", "Quoi qu'il en soit", "Não importa o que"]
-  ]
+  ],
+  accentFree: {},
+  tonelessPinyin: [
+    "ruguo",
+    "jiaru",
+    "jiashe",
+    "jiashi",
+    "wanyi",
+    "chufei",
+    "zhiyao",
+    "zhiyou",
+    "fouze",
+    "buran",
+    "yaobu",
+    "suiran",
+    "jinguan",
+    "jishi",
+    "napa",
+    "wulun",
+    "ruguoshi",
+    "ruguoshuo",
+    "jiarushi",
+    "jiarushuo",
+    "jiasheshi",
+    "jiasheshuo",
+    "jiashishi",
+    "jiashiruci",
+    "wanyine",
+    "wanyishi",
+    "chufeishi",
+    "chufeini",
+    "zhiyaoshi",
+    "zhiyaoni",
+    "zhiyouni",
+    "zhiyouzheyang",
+    "fouzehui",
+    "fouzejiu",
+    "buranhui",
+    "buranjiu",
+    "yaoburan",
+    "yaobujiu",
+    "suiranshi",
+    "suiranshuo",
+    "jinguanshi",
+    "jinguanruci",
+    "jishishi",
+    "jishizheyang",
+    "napashi",
+    "napazhiyou",
+    "wulunshi",
+    "wulunruhe"
+  ],
+  pinyinUnits: {},
+  distractors: "*Eh*Ei*Ep*UGCD*RP*RQBDUVBCNWYZABabABH*LMcdG*Jr*LMe*TYghAL4*LQ*LRklABJ*LQ*LR*LZoABC*Cf*CgDqsABC*SmuAB*EyRASQASTTUWBSV*Rn*RpSVWCTUCQSUqDfprtZEQRYEQRbFQRaFQRdG*LMQceGQdHQRXprthIQRgIQRj*Ln*LpJiJQRlJKQkKQRn*Lm*Lo*L4mLQRMQRSXfrtWNQRXfptOQRSXfprPQRSXfpr"
 };
 
 export const p5_88_conjunctions__connectors = {
@@ -583,7 +1007,60 @@ export const p5_88_conjunctions__connectors = {
     ["此外是", "cǐ wài shì", "In addition,", "Además,", "De plus,", "Além disso,"],
     ["总之是", "zǒng zhī shì", "In short", "En resumen", "En bref", "Resumindo"],
     ["总之说", "zǒng zhī shuō", "In short", "En breve", "En bref", "Resumidamente"]
-  ]
+  ],
+  accentFree: {},
+  tonelessPinyin: [
+    "he",
+    "yu",
+    "gen",
+    "huozhe",
+    "haishi",
+    "danshi",
+    "keshi",
+    "raner",
+    "buguo",
+    "erqie",
+    "bingqie",
+    "kuangqie",
+    "tongshi",
+    "lingwai",
+    "ciwai",
+    "zongzhi",
+    "woheni",
+    "heta",
+    "woyuni",
+    "yuta",
+    "wogenni",
+    "genta",
+    "huozheshuo",
+    "huozheshi",
+    "haishishuo",
+    "haishini",
+    "danshine",
+    "danshishuo",
+    "keshine",
+    "keshishuo",
+    "ranerne",
+    "ranershi",
+    "buguone",
+    "buguoshuo",
+    "erqieshi",
+    "erqiehai",
+    "bingqieshi",
+    "bingqiehai",
+    "kuangqieshi",
+    "kuangqieshuo",
+    "tongshiye",
+    "tongshishi",
+    "lingwaihai",
+    "lingwaishuo",
+    "ciwaihai",
+    "ciwaishi",
+    "zongzhishi",
+    "zongzhishuo"
+  ],
+  pinyinUnits: {},
+  distractors: "*Bk*BlBC*Bk*BlAC*Bk*BlABWXEFFG*HK*LKEG*HK*LKEF*HK*LK*Ev*Qf*RJ*RV*FZ*H6*H7*MDKL/iJLklJKmn*CW*CX*CY*CZO*Kk*Klq*CdN*Kk*Kl*RNuvDSUWXTV*Ii*IkQUWXRV*Ii*IkQSWXRT*Ii*IkXDQSWDQSZbd*LeYEQSbcF*HFYad*LeadG*HFYbc*LefHQSe*Q3HQhIQSgIQSjkmJilJQilmKjkKQiknLmLQSpMQSoMQSrsNQqNQSqtOQsOQSvPQSuPQS"
 };
 
 export const p5_89_modal__particles__mood = {
@@ -647,7 +1124,60 @@ export const p5_89_modal__particles__mood = {
     ["算罢了", "suàn bà le", "Never mind", "No importa", "Tant pis", "Deixa pra lá"],
     ["而已啦", "ér yǐ la", "That's all", "Eso es todo", "C'est tout", "Só isso"],
     ["仅此而已", "jǐn cǐ ér yǐ", "Nothing more", "Nada más", "Rien de plus", "Nada mais"]
-  ]
+  ],
+  accentFree: {},
+  tonelessPinyin: [
+    "ma",
+    "ba",
+    "ne",
+    "a",
+    "ya",
+    "o",
+    "ma",
+    "ai",
+    "ai",
+    "ha",
+    "o",
+    "n",
+    "ei",
+    "dele",
+    "bale",
+    "eryi",
+    "shima",
+    "haoma",
+    "zouba",
+    "haoba",
+    "nine",
+    "shine",
+    "xia",
+    "duia",
+    "haoya",
+    "shiya",
+    "oshi",
+    "ohao",
+    "shima",
+    "haoma",
+    "aiya",
+    "aiyo",
+    "aishengtanqi",
+    "aisuanle",
+    "haha",
+    "hahao",
+    "oyuanlai",
+    "ohaode",
+    "nhao",
+    "ndui",
+    "einage",
+    "eidui",
+    "deleba",
+    "suandele",
+    "baleba",
+    "suanbale",
+    "eryila",
+    "jincieryi"
+  ],
+  pinyinUnits: {},
+  distractors: "*Bk*Bl*GA*GB*Bk*Bl*GA*GB*Bk*Bl*GA*GB*Bk*Bl*GA*GB*Bk*Bl*GA*GB*Bk*Bl*GA*GB*Bk*Bl*GA*GB*Bk*Bl*GA*GB*Bk*Bl*GA*GB*Bk*Bl*GA*GB*Bk*Bl*GA*GB*Bk*Bl*GA*GB*Bk*Bl*GA*GBO*H2*H3*IxN*H2*H3*Ix*GJuNORVZcQTYdT*H2BNRSYdVCNOQUZcXDNOW*MsDNRTZdQVYc*GE*GF*GGbajmFQVZdRTYcYZfEeHNOvhklkloqjJNObimJhloq*K4hkobjnLmp*MmLhklqn*MmMNsNhktNhkqOhkrOhkPhklghkl"
 };
 
 export const p5_90_structural__particles = {
@@ -711,7 +1241,60 @@ export const p5_90_structural__particles = {
     ["跑过去", "pǎo guò qù", "run over there", "correr hasta allí", "courir là-bas", "correr até lá"],
     ["打开", "dǎ kāi", "Open", "Abrir", "Ouvrir", "Abrir"],
     ["离开", "lí kāi", "Leave", "Dejar", "Partir", "Deixar"]
-  ]
+  ],
+  accentFree: {},
+  tonelessPinyin: [
+    "de",
+    "di",
+    "de",
+    "le",
+    "zhe",
+    "guo",
+    "qilai",
+    "xiaqu",
+    "chulai",
+    "jinqu",
+    "shanglai",
+    "xialai",
+    "huilai",
+    "guolai",
+    "guoqu",
+    "kai",
+    "wode",
+    "meide",
+    "manmandi",
+    "kuaisudi",
+    "paodekuai",
+    "zuodehao",
+    "zoule",
+    "laile",
+    "kanzhe",
+    "tingzhe",
+    "quguo",
+    "laiguo",
+    "zhanqilai",
+    "paoqilai",
+    "zouxiaqu",
+    "shuoxiaqu",
+    "nachulai",
+    "zouchulai",
+    "zoujinqu",
+    "paojinqu",
+    "pashanglai",
+    "zoushanglai",
+    "zouxialai",
+    "paoxialai",
+    "zouhuilai",
+    "paohuilai",
+    "zouguolai",
+    "paoguolai",
+    "zouguoqu",
+    "paoguoqu",
+    "dakai",
+    "likai"
+  ],
+  pinyinUnits: {},
+  distractors: "*Bk*Bl*GA*GB*Bk*Bl*GA*GB*Bk*Bl*GA*GB*Bk*Bl*GA*GB*Bk*Bl*GA*GB*Bk*Bl*GA*GB*En*ErIKJLOe*EnGKLHO*Nl*Qk*EnGIL*EnGHI*EnGIK*EnGIKHJN*QX*Bk*Bl*GA*GBRAGHQAGHTUVcSUVcSTVcSTUc*G9*G+*HCX*G9*G+WbZ*I5*Qg*SrY*I5*QgE*GIbFG*GIXaFdGSTcnprfimseHSThISTglmoejsJitJSlKSThkmoehlndmprhlmpdnorhlmodnpqeiqtjrsOvPGHuPGH"
 };
 
 export const p5_91_common__sentence__patterns = {
@@ -769,7 +1352,54 @@ export const p5_91_common__sentence__patterns = {
     ["令他", "lìng tā", "make him", "hacerlo", "le faire", "fazê-lo"],
     ["朝前", "cháo qián", "toward front", "hacia adelante", "vers l'avant", "para frente"],
     ["朝着", "cháo zhe", "facing", "hacia", "vers", "em direção a"]
-  ]
+  ],
+  accentFree: {},
+  tonelessPinyin: [
+    "ba",
+    "bei",
+    "rang",
+    "jiao",
+    "shi",
+    "bi",
+    "xiang",
+    "wang",
+    "cong",
+    "wei",
+    "guanyu",
+    "anzhao",
+    "ling",
+    "chao",
+    "bata",
+    "bazhege",
+    "beiren",
+    "beifaxian",
+    "rangta",
+    "rangwo",
+    "jiaota",
+    "jiaozuo",
+    "shiren",
+    "shiyong",
+    "bita",
+    "bini",
+    "xiangni",
+    "xiangqian",
+    "wangqian",
+    "chaohou",
+    "congzhe",
+    "congna",
+    "weini",
+    "weile",
+    "guanyuzhe",
+    "guanyuta",
+    "anzhaoguiding",
+    "anzhaojihua",
+    "lingren",
+    "lingta",
+    "chaoqian",
+    "chaozhe"
+  ],
+  pinyinUnits: {},
+  distractors: "*Bk*Bl*GA*GB*Bk*Bl*GA*GB*Bk*Bl*GA*GB*Bk*Bl*GA*GB*Bk*Bl*GA*GB*Bk*Bl*GA*GB*Bk*Bl*GA*GB*Bk*Bl*GA*GB*Bk*Bl*GA*GB*Bk*Bl*GA*GB*EtijL*CYKOQ*Bk*Bl*GA*GB*Bk*Bl*GA*GBAKLQRijKWmBKPijK*GR*GT*GVTSCKL*GR*GT*GVSUDKLQXmEW*OOEK*GR*GT*GVSYag*RPZbgGacoGboHKop*Qf*Qhf*RJIKe*RJIKZahJ*G9*G+*H2*H3jKPRiKPR*QGlPRkPRiQWnM*GR*GT*GVSbcdp*H4*H5do"
 };
 
 export const p5_92_describing__things = {
@@ -833,7 +1463,60 @@ export const p5_92_describing__things = {
     ["看材质", "kàn cái zhì", "Look at the material", "Mira el material", "Regardez le matériel", "Veja o material"],
     ["质地软", "zhì dì ruǎn", "Soft texture", "Textura suave", "Texture douce", "Textura macia"],
     ["好质地", "hǎo zhì dì", "Good texture", "buena textura", "Bonne texture", "Boa textura"]
-  ]
+  ],
+  accentFree: {},
+  tonelessPinyin: [
+    "dongxi",
+    "wupin",
+    "shiqing",
+    "shiwu",
+    "leixing",
+    "zhonglei",
+    "yangzi",
+    "xingzhuang",
+    "waiguan",
+    "daxiao",
+    "chicun",
+    "changdu",
+    "zhongliang",
+    "cailiao",
+    "caizhi",
+    "zhidi",
+    "youdongxi",
+    "shenmedongxi",
+    "guizhongwupin",
+    "gerenwupin",
+    "zhejianshiqing",
+    "shenmeshiqing",
+    "gezhongshiwu",
+    "xinshiwu",
+    "shenmeleixing",
+    "zhezhongleixing",
+    "shenmezhonglei",
+    "gezhongzhonglei",
+    "shenmeyangzi",
+    "zheyangzi",
+    "shenmexingzhuang",
+    "yuanxingzhuang",
+    "waiguanhao",
+    "kanwaiguan",
+    "daxiaoheshi",
+    "shenmedaxiao",
+    "chicundui",
+    "liangchicun",
+    "changdugou",
+    "cechangdu",
+    "zhongliangqing",
+    "chengzhongliang",
+    "cailiaohao",
+    "yongcailiao",
+    "caizhihao",
+    "kancaizhi",
+    "zhidiruan",
+    "haozhidi"
+  ],
+  pinyinUnits: {},
+  distractors: "QBCD*SCACD*AGDAB*A+CXAABCDABCDdABCfABC*AD*AO*APgABCDklAB*Cj*DP*Ka*Pv*DJ*R4opOqrAN*R3*SAs*R4*HhuvAXdfSTUVRTUVRSUVRSTVRSTURSTUDQdfRSTURSTURSTURSTURSTUGQXfRSTUHQXdIQXdIQXdRSTURSTUKQXdKQXdLQXdLQXdMQXdMQXdsNQXNQXdq*SGOQOQXdPQXdPQXd"
 };
 
 export const p5_93_quantities__amounts = {
@@ -897,7 +1580,60 @@ export const p5_93_quantities__amounts = {
     ["少数民族", "shǎo shù mín zú", "Ethnic minorities", "Minorías étnicas", "Minorités ethniques", "Minorias étnicas"],
     ["若干人", "ruò gān rén", "Several people", "Varias personas", "Plusieurs personnes", "Várias pessoas"],
     ["若干问题", "ruò gān wèn tí", "Several issues", "Varios problemas", "Plusieurs problèmes", "Vários problemas"]
-  ]
+  ],
+  accentFree: {},
+  tonelessPinyin: [
+    "quanbu",
+    "suoyou",
+    "zhengge",
+    "quanti",
+    "meige",
+    "gege",
+    "gezhong",
+    "bufen",
+    "yibufen",
+    "dabufen",
+    "xiaobufen",
+    "youxie",
+    "mouxie",
+    "duoshu",
+    "shaoshu",
+    "ruogan",
+    "quanbudou",
+    "quanbushi",
+    "suoyouren",
+    "suoyoude",
+    "zhenggeren",
+    "zhenggeshijie",
+    "quantirenyuan",
+    "quantiqili",
+    "meigedifang",
+    "meigedou",
+    "gegefangmian",
+    "gegedifang",
+    "gezhonggeyang",
+    "gezhongqingkuang",
+    "bufenren",
+    "zhebufen",
+    "yibufenren",
+    "youyibufen",
+    "dabufenren",
+    "zhandabufen",
+    "xiaobufenren",
+    "zhiyouxiaobufen",
+    "youxieren",
+    "youxieshi",
+    "mouxieren",
+    "mouxieshi",
+    "duoshuren",
+    "daduoshu",
+    "shaoshuren",
+    "shaoshuminzu",
+    "ruoganren",
+    "ruoganwenti"
+  ],
+  pinyinUnits: {},
+  distractors: "DQRB*FXSTA*DT*DUEFABCECFZACEGAFABC5IJKJKfHIKfHIJfHM4mnLopAOqrANs*KzAuABCRAIJQAIJTBIJSBIJCIJKWXYaVXYaVWYabVWXEIJKVWXYYVWXVWXYVWXYHgikIJKHikIeIVWXgkJeJVWXgiKeVWXYnoLImpLImpMInoMIsNIJNIJKqOIJVWXYPIJKVWXY"
 };
 
 export const p5_94_extent__degree = {
@@ -961,7 +1697,60 @@ export const p5_94_extent__degree = {
     ["略有所闻", "lüè yǒu suǒ wén", "Heard a little", "Oído un poco", "Entendu un peu", "Ouviu um pouco"],
     ["颇有成效", "pǒ yǒu chéng xiào", "Quite effective", "Bastante eficaz", "Assez efficace", "Bastante eficaz"],
     ["颇为满意", "pǒ wèi mǎn yì", "Quite satisfied", "Bastante satisfecho", "Assez satisfait", "Bastante satisfeito"]
-  ]
+  ],
+  accentFree: {},
+  tonelessPinyin: [
+    "chengdu",
+    "feichang",
+    "hen",
+    "tai",
+    "ji",
+    "zui",
+    "ting",
+    "man",
+    "youdian",
+    "shifen",
+    "gewai",
+    "fenwai",
+    "shen",
+    "xixi",
+    "lue",
+    "po",
+    "shenmechengdu",
+    "chengduhenshen",
+    "feichangganxie",
+    "feichanggaoxing",
+    "henzhongyao",
+    "henlihai",
+    "taiguofen",
+    "taibangle",
+    "jiweizhongyao",
+    "jishaoshu",
+    "zuizhongyao",
+    "zuilihai",
+    "tingbucuo",
+    "tingyouyisi",
+    "manhaode",
+    "manyouqu",
+    "youdianlei",
+    "youdianyisi",
+    "shifenganxie",
+    "shifenmanyi",
+    "gewaixiaoxin",
+    "gewaigaoxing",
+    "fenwaizhenxi",
+    "fenwaikaixin",
+    "shenzhiyu",
+    "shenweizhongyao",
+    "xixishushu",
+    "xixilala",
+    "luezhiyier",
+    "lueyousuowen",
+    "poyouchengxiao",
+    "poweimanyi"
+  ],
+  pinyinUnits: {},
+  distractors: "*JF*Pv*QZ*Ql*DOAIJ*Bk*Bl*GA*GB*Bk*Bl*GA*GB*Bk*Bl*GA*GB*Bk*Bl*GA*GB*Bk*Bl*GA*GB*Bk*Bl*GA*GB*J1gAB*JxABI*GN*GOLA*GN*GOK*Sy*Bk*Bl*GA*GB*D9ABI*Bk*Bl*GA*GB*Bk*Bl*GA*GBRSTYQSTYQRTYQRSYaVWXbUWXUVXZUVWZ*EGpQR*J4UVWUVWXVUWXUVWXQRST*HVUVWUVWXIUVWQRSTQRSTQRSTQRSTQRSTQRSTQRSTUVWXYQRSQRSTQRSTQRSTQRST*UuQRSQRST"
 };
 
 export const p5_95_emphasis__intensifiers = {
@@ -1025,7 +1814,60 @@ export const p5_95_emphasis__intensifiers = {
     ["到底怎么", "dào dǐ zěn me", "How on earth", "¿Cómo diablos?", "Comment donc", "Como raio"],
     ["果然是", "guǒ rán shì", "It's as expected", "Es como se esperaba", "C'est comme prévu", "É como esperado"],
     ["果然如此", "guǒ rán rú cǐ", "Indeed so", "Así es en efecto", "En effet ainsi", "De fato assim"]
-  ]
+  ],
+  accentFree: {},
+  tonelessPinyin: [
+    "jiushi",
+    "zhengshi",
+    "zhishi",
+    "jinjin",
+    "pianpian",
+    "qiaqia",
+    "jingran",
+    "juran",
+    "jianzhi",
+    "genben",
+    "queshi",
+    "dique",
+    "shizai",
+    "jiujing",
+    "daodi",
+    "guoran",
+    "jiushita",
+    "jiushizheyang",
+    "zhengshita",
+    "zhengshiruci",
+    "zhishishuo",
+    "zhishixiang",
+    "jinjinshi",
+    "jinjinyinwei",
+    "pianpianshi",
+    "pianpianyao",
+    "qiaqiaxiangfan",
+    "qiaqiashi",
+    "jingranshi",
+    "jingranhui",
+    "juranshi",
+    "juranhui",
+    "jianzhishi",
+    "jianzhibuganxiangxin",
+    "genbenbu",
+    "genbenmeiyou",
+    "queshishi",
+    "queshihao",
+    "diqueshi",
+    "diquehao",
+    "shizaishi",
+    "shizaitai",
+    "jiujingshi",
+    "jiujingzenme",
+    "daodishi",
+    "daodizenme",
+    "guoranshi",
+    "guoranruci"
+  ],
+  pinyinUnits: {},
+  distractors: "*GE*GF*GG*HK*GE*GF*GG*HK*FW*FX*GE*GFWABCYZABbABC*FZ*FbHP*FZ*FbGP*ONgAB*EqiABklAB*HgmnAopABqABCsABC*FZ*FbGHSAUVTXajQBUVRXaj*GY*Gb*GdVUCQSDQSURTajZEQSYEQSRTXjFQSU*F2deu*FycfG*F2cfu*FydeHIQSURTXaJQSURTXalKQSkKQSnLQSmLQSpMQSoMQSNQSURTXaOQSURTXa*F2ce*TERTXa"
 };
 
 export const p5_96_describing__problems = {
@@ -1083,7 +1925,54 @@ export const p5_96_describing__problems = {
     ["人际复杂", "rén jì fù zá", "Complex relationships", "Relaciones complejas", "Relations complexes", "Relações complexas"],
     ["一团糟糕", "yī tuán zāo gāo", "It's a mess", "Es un desastre", "C'est le bordel", "Está uma bagunça"],
     ["事情糟糕", "shì qíng zāo gāo", "Things are bad", "las cosas estan mal", "Les choses vont mal", "As coisas estão ruins"]
-  ]
+  ],
+  accentFree: {},
+  tonelessPinyin: [
+    "kunnan",
+    "nanti",
+    "nanchu",
+    "zhangai",
+    "kunjing",
+    "weiji",
+    "chacuo",
+    "guzhang",
+    "quexian",
+    "buzu",
+    "yanzhong",
+    "jishou",
+    "fuza",
+    "zaogao",
+    "kefukunnan",
+    "kunnanchongchong",
+    "pojienanti",
+    "shijienanti",
+    "geyounanchu",
+    "shuobuchudenanchu",
+    "yuyanzhangai",
+    "saochuzhangai",
+    "xianrukunjing",
+    "zouchukunjing",
+    "jingjiweiji",
+    "huajieweiji",
+    "chulechacuo",
+    "jiuzhengchacuo",
+    "jiqiguzhang",
+    "paichuguzhang",
+    "xinggequexian",
+    "xiantianquexian",
+    "jingyanbuzu",
+    "mibubuzu",
+    "wentiyanzhong",
+    "shangshiyanzhong",
+    "wentijishou",
+    "shiqingjishou",
+    "qingkuangfuza",
+    "renjifuza",
+    "yituanzaogao",
+    "shiqingzaogao"
+  ],
+  pinyinUnits: {},
+  distractors: "EBCDCADEBADEABCEABCDABCDABCD*RVABCABCD*FZ*GIAB*AJABCABCDABCDABCDPQRSOQRSOPRSOPQSOPQROPQROPQROPQROPQROPQROPQROPQROPQROPQROPQROPQROPQROPQROPQROPQROPQROPQROPQROPQROPQROPQROPQROPQR"
 };
 
 export const p5_97_solutions__methods = {
@@ -1150,7 +2039,63 @@ export const p5_97_solutions__methods = {
     ["去策划", "qù cè huà", "Plan it", "Planificarlo", "Planifier", "Planejar"],
     ["有提议", "yǒu tí yì", "Have suggestions", "Tener sugerencias", "Avoir des suggestions", "Tem sugestões"],
     ["提出提议", "tí chū tí yì", "Make suggestions", "Hacer sugerencias", "Faire des suggestions", "Faça sugestões"]
-  ]
+  ],
+  accentFree: {},
+  tonelessPinyin: [
+    "jiejue",
+    "chuli",
+    "yingdui",
+    "kefu",
+    "banfa",
+    "fangfa",
+    "cuoshi",
+    "fangan",
+    "duice",
+    "jianyi",
+    "gaishan",
+    "gaijin",
+    "youhua",
+    "tiaozheng",
+    "bujiu",
+    "cehua",
+    "tiyi",
+    "jiejuewenti",
+    "qujiejue",
+    "chulihao",
+    "quchuli",
+    "yingduihao",
+    "jijiyingdui",
+    "zhanshengkunnan",
+    "qukefu",
+    "youbanfa",
+    "xiangbanfa",
+    "youfangfa",
+    "zhaofangfa",
+    "caiqucuoshi",
+    "youcuoshi",
+    "zhidingfangan",
+    "youfangan",
+    "youduice",
+    "xiangduice",
+    "youjianyi",
+    "tijianyi",
+    "gaishanqingkuang",
+    "yougaishan",
+    "gaijingongzuo",
+    "yougaijin",
+    "youhualiucheng",
+    "quyouhua",
+    "tiaozhenghao",
+    "zuotiaozheng",
+    "bujiucuoshi",
+    "qubujiu",
+    "cehuahuodong",
+    "qucehua",
+    "youtiyi",
+    "tichutiyi"
+  ],
+  pinyinUnits: {},
+  distractors: "SBCD*Ta*TiTU*HX*HZVAYABC*BqF*TWZ*BqEH*TWeABCFgAB*HH*PthiQ*UTjkL*P0mAK*P0oA*Az*SA*SBq*OUrsAuABCwABCJkxAWXdfATUVBSUVBSTVCSTURXdfRWdfDSTUab*TpEZE*TWSZcg*TpbFSTRWXfGSTURWXdbHSTiISThISTkxJSjJQSRWXdoKSTRWXdmLSTRWXdMSTUNSTUNSTURWXdOSTURWXdPSTUjQSTRWXd"
 };
 
 export const p5_98_education__learning = {
@@ -1214,7 +2159,60 @@ export const p5_98_education__learning = {
     ["继续进修", "jì xù jìn xiū", "Continue to study", "Continuar estudiando", "Continuer à étudier", "Continuar estudando"],
     ["靠自学", "kào zì xué", "Rely on self-study", "Depender del autoestudio", "S'appuyer sur l'auto-apprentissage", "Confie no auto-estudo"],
     ["坚持自学", "jiān chí zì xué", "Persist in self-study", "Persistir en el autoestudio", "Persister dans l'auto-apprentissage", "Persista no auto-estudo"]
-  ]
+  ],
+  accentFree: {},
+  tonelessPinyin: [
+    "jiaoyu",
+    "xuexi",
+    "peixun",
+    "yanjiu",
+    "xuewen",
+    "zhishi",
+    "nengli",
+    "jineng",
+    "xueli",
+    "wenping",
+    "xuewei",
+    "kecheng",
+    "zhuanye",
+    "kemu",
+    "jinxiu",
+    "zixue",
+    "jiaoyuhao",
+    "shoujiaoyu",
+    "xuexihao",
+    "aixuexi",
+    "canjiapeixun",
+    "zuopeixun",
+    "zuoyanjiu",
+    "yanjiuxia",
+    "youxuewen",
+    "zuoxuewen",
+    "youzhishi",
+    "xuezhishi",
+    "younengli",
+    "tigaonengli",
+    "youjineng",
+    "xuejineng",
+    "xueligao",
+    "kanxueli",
+    "youwenping",
+    "nawenping",
+    "youxuewei",
+    "naxuewei",
+    "shangkecheng",
+    "xuankecheng",
+    "xuezhuanye",
+    "xuanzhuanye",
+    "kaokemu",
+    "xuankemu",
+    "qujinxiu",
+    "jixujinxiu",
+    "kaozixue",
+    "jianchizixue"
+  ],
+  pinyinUnits: {},
+  distractors: "QRBCEIKSVABDWXABBIKYabAB*UPcABefABBEK2*AzijABEIk*QX*QYmnwyopqrAB*Hp*Qk*Ql*UK*AQ*P2*TjuARSTAQSTBQRTBQRSdtvQCQRSDQRSDQRSZkEQYEQRbFQRaFQRGQRSUtvQfHQReHQRIQRSIQRSjJQRiJQRYlKQkKQRnLQRmLQRpMQRo*OYMQrNQRqNQROQRSUdvQPQRSUdtQ"
 };
 
 export const p5_99_career__development = {
@@ -1278,7 +2276,60 @@ export const p5_99_career__development = {
     ["提交辞职", "tí jiāo cí zhí", "Submit resignation", "Presentar renuncia", "Présenter sa démission", "Enviar demissão"],
     ["想跳槽", "xiǎng tiào cáo", "Want to change jobs", "Quiere cambiar de trabajo", "Envie de changer de métier", "Quer mudar de emprego"],
     ["准备跳槽", "zhǔn bèi tiào cáo", "Prepare to change jobs", "Prepárate para cambiar de trabajo", "Préparez-vous à changer d'emploi", "Prepare-se para mudar de emprego"]
-  ]
+  ],
+  accentFree: {},
+  tonelessPinyin: [
+    "zhiye",
+    "gongzuo",
+    "jiuye",
+    "qiuzhi",
+    "zhaogongzuo",
+    "mianshi",
+    "jianli",
+    "luyong",
+    "ruzhi",
+    "shiyongqi",
+    "zhuanzheng",
+    "shengzhi",
+    "jiaxin",
+    "diaodong",
+    "cizhi",
+    "tiaocao",
+    "shenmezhiye",
+    "xuanzhiye",
+    "gongzuomang",
+    "yougongzuo",
+    "jiuyelu",
+    "cujinjiuye",
+    "quqiuzhi",
+    "zhengzaiqiuzhi",
+    "zhaogongzuonan",
+    "bangzhaogongzuo",
+    "qumianshi",
+    "zhunbeimianshi",
+    "xiejianli",
+    "toujianli",
+    "beiluyong",
+    "zhengshiluyong",
+    "banruzhi",
+    "gangruzhi",
+    "shiyongqinei",
+    "guoshiyongqi",
+    "shenqingzhuanzheng",
+    "yizhuanzheng",
+    "shenqingshengzhi",
+    "huodeshengzhi",
+    "shenqingjiaxin",
+    "huodejiaxin",
+    "gongzuodiaodong",
+    "shenqingdiaodong",
+    "yaocizhi",
+    "tijiaocizhi",
+    "xiangtiaocao",
+    "zhunbeitiaocao"
+  ],
+  pinyinUnits: {},
+  distractors: "*NjCRBESTA*LK*NjAUILOWTBYZaABC*LS*Nfcd*IneABDLOgijERzlABDIOAABCD*MxABCDILsuABCVXYZ*OAAEJBEJREBJRCEJRQXYZDEJRQVYZEQVXEQVXFEJRQVXYdGEJcGEJHEJRQVXYhIEJgIEJJQVXJQVXQVXYKEJRQVXYQVXYQVXYQVXYQVXYQVXYOEJRQVXYPEJRQVXY"
 };
 
 export const p5_100_banking__finance = {
@@ -1342,7 +2393,60 @@ export const p5_100_banking__finance = {
     ["在柜台", "zài guì tái", "At the counter", "En el mostrador", "Au comptoir", "No balcão"],
     ["储蓄卡", "chǔ xù kǎ", "Savings card", "Tarjeta de ahorros", "Carte d'épargne", "Cartão de poupança"],
     ["定期储蓄", "dìng qī chǔ xù", "Fixed deposit", "Depósito fijo", "Dépôt à terme", "Depósito a prazo"]
-  ]
+  ],
+  accentFree: {},
+  tonelessPinyin: [
+    "zhanghu",
+    "cunkuan",
+    "qukuan",
+    "zhuanzhang",
+    "huikuan",
+    "daikuan",
+    "lixi",
+    "xinyongka",
+    "jiejika",
+    "yue",
+    "zhangdan",
+    "shouxufei",
+    "licai",
+    "touzi",
+    "guitai",
+    "chuxu",
+    "kaizhanghu",
+    "yinhangzhanghu",
+    "cunkuane",
+    "qucunkuan",
+    "qukuanji",
+    "ququkuan",
+    "zhuanzhangba",
+    "quzhuanzhang",
+    "huikuandan",
+    "quhuikuan",
+    "daikuane",
+    "shenqingdaikuan",
+    "lixigao",
+    "suanlixi",
+    "shuaxinyongka",
+    "banxinyongka",
+    "shuajiejika",
+    "banjiejika",
+    "chayue",
+    "kanyue",
+    "kanzhangdan",
+    "huanzhangdan",
+    "shouxufeigao",
+    "shoushouxufei",
+    "licaichanpin",
+    "xuelicai",
+    "touzihao",
+    "qutouzi",
+    "quguitai",
+    "zaiguitai",
+    "chuxuka",
+    "dingqichuxu"
+  ],
+  pinyinUnits: {},
+  distractors: "KQBCCEFSBEFU*ORWXABCFYBCEacdABefILghHLijABAklBmnHI*TZ*TdpAqrABstABuABCAHILbefgaBHIVZBHCHILTZCHDHILDHILEHILTVEHSFHIRefgGHILGHILfHRbeHRbhIRbgIRbjJHIiJHIlKHIkKHILRbeLRbeRbefMHILNHILNHILtOHIsOHIPHILRbef"
 };
 
 export const p5_101_government__society = {
@@ -1406,7 +2510,60 @@ export const p5_101_government__society = {
     ["讲民主", "jiǎng mín zhǔ", "Talk about democracy", "Hablar de democracia", "Parler de démocratie", "Falar sobre democracia"],
     ["自由平等", "zì yóu píng děng", "Freedom and equality", "Libertad e igualdad", "Liberté et égalité", "Liberdade e igualdade"],
     ["追求自由", "zhuī qiú zì yóu", "Pursue freedom", "Perseguir la libertad", "Poursuivre la liberté", "Buscar liberdade"]
-  ]
+  ],
+  accentFree: {},
+  tonelessPinyin: [
+    "zhengfu",
+    "guojia",
+    "shehui",
+    "gongmin",
+    "falu",
+    "fagui",
+    "zhengce",
+    "guiding",
+    "zhidu",
+    "quanli",
+    "yiwu",
+    "jingji",
+    "fazhan",
+    "gaige",
+    "minzhu",
+    "ziyou",
+    "zhengfubumen",
+    "difangzhengfu",
+    "guojiadashi",
+    "aiguojia",
+    "shehuiwenti",
+    "fuwushehui",
+    "gongminquanli",
+    "haogongmin",
+    "faluguiding",
+    "dongfalu",
+    "faguiyaoqiu",
+    "zunshoufagui",
+    "zhengcehao",
+    "xinzhengce",
+    "guidingshi",
+    "anguiding",
+    "zhiduhao",
+    "jianlizhidu",
+    "youquanli",
+    "weihuquanli",
+    "youyiwu",
+    "jinyiwu",
+    "jingjifazhan",
+    "gaojingji",
+    "fazhanhao",
+    "cujinfazhan",
+    "gaigekaifang",
+    "shenhuagaige",
+    "minzhuxuanju",
+    "jiangminzhu",
+    "ziyoupingdeng",
+    "zhuiqiuziyou"
+  ],
+  pinyinUnits: {},
+  distractors: "GBCD*BrTACABDEXABCFZABEABC*MsAcd*R6*SFef*JF*Ka+giABCklABnABC9oAB*Mu*MvABtABC*AQ*NmABRSUVQSUVQRUVBXZcQRSVQRSUQRSUDTZcQRSUETXcQRSUQRSUGTXZGTXZHTXZ*SN*Sj*I0HITXZQRSUJTXZQRSUlKTXkKTXQRSULTXZMTXZQRSUQRSUQRSUQRSUOTXZQRSUQRSU"
 };
 
 export const p5_102_describing__processes = {
@@ -1470,7 +2627,60 @@ export const p5_102_describing__processes = {
     ["赶进度", "gǎn jìn dù", "Speed up progress", "Acelerar el progreso", "Accélérer l’avancement", "Acelerar o andamento"],
     ["终结了", "zhōng jié le", "It's over", "Se acabó", "C'est fini", "Acabou"],
     ["宣告终结", "xuān gào zhōng jié", "Declare the end", "Declarar el fin", "Déclarer la fin", "Declare o fim"]
-  ]
+  ],
+  accentFree: {},
+  tonelessPinyin: [
+    "guocheng",
+    "liucheng",
+    "chengxu",
+    "buzhou",
+    "jieduan",
+    "huanjie",
+    "shouxian",
+    "qici",
+    "ranhou",
+    "jiezhe",
+    "zuihou",
+    "zuizhong",
+    "wancheng",
+    "jinzhan",
+    "jindu",
+    "zhongjie",
+    "zhenggeguocheng",
+    "zaiguochengzhong",
+    "gongzuoliucheng",
+    "zouliucheng",
+    "caozuochengxu",
+    "anchengxu",
+    "caozuobuzhou",
+    "fenbuzhou",
+    "butongjieduan",
+    "zaizhejieduan",
+    "guanjianhuanjie",
+    "meigehuanjie",
+    "shouxianshi",
+    "shouxianshuo",
+    "qicishi",
+    "qicishuo",
+    "ranhoushi",
+    "ranhoushuo",
+    "jiezheshi",
+    "jiezheshuo",
+    "zuihoushi",
+    "zuihoushuo",
+    "zuizhongshi",
+    "zuizhonghui",
+    "wanchengle",
+    "yiwancheng",
+    "youjinzhan",
+    "kanjinzhan",
+    "kanjindu",
+    "ganjindu",
+    "zhongjiele",
+    "xuangaozhongjie"
+  ],
+  pinyinUnits: {},
+  distractors: "*Ht*Hu*NiB*NiATC*KaVABXABCABCD*A4ABCcdABefAB*GH*ItKg*H4*H5*I5*Hk*ItIL*KfK*Kfmn*EB*Ekop*Hp*Nl*PzO*Hp*JF*Ka*NluABCRSUWQSUWQRUWBVXcQRSWCTXcQRSUDTVcQRSUQRSUQRSUQRSUdGTVcGTVfHTVeHTV*GfhkIglITjJTViJTVglmKhkKTknLTmLTV*E4MTVMTVXrNTVqsNTrtOTsOTVPTVXQRSU"
 };
 
 export const p5_103_logical__relations = {
@@ -1534,7 +2744,60 @@ export const p5_103_logical__relations = {
     ["故而决定", "gù ér jué dìng", "Therefore decided", "Por lo tanto decidí", "C'est pourquoi j'ai décidé", "Por isso decidi"],
     ["事实上是", "shì shí shàng shì", "In fact it is", "De hecho es", "En fait c'est", "De fato é"],
     ["事实上说", "shì shí shàng shuō", "In fact say", "De hecho decir", "En fait dire", "De fato dizer"]
-  ]
+  ],
+  accentFree: {},
+  tonelessPinyin: [
+    "luoji",
+    "yinci",
+    "conger",
+    "yushi",
+    "name",
+    "xiangfan",
+    "fanzhi",
+    "zongeryanzhi",
+    "biru",
+    "liru",
+    "piru",
+    "huanyanzhi",
+    "yejiushishuo",
+    "jianyanzhi",
+    "guer",
+    "shishishang",
+    "youluoji",
+    "jiangluoji",
+    "yincishuo",
+    "yinciwo",
+    "congerdaozhi",
+    "congershi",
+    "yushishuo",
+    "yushiwo",
+    "nameshuo",
+    "namewo",
+    "xiangfande",
+    "zhenghaoxiangfan",
+    "fanzhiyiran",
+    "fanzhize",
+    "zongeryanzhine",
+    "zongeryanzhishi",
+    "birushuo",
+    "biruzhe",
+    "lirushuo",
+    "liruzhe",
+    "pirushuo",
+    "piruzhe",
+    "huanyanzhijiushi",
+    "huanyanzhishuo",
+    "yejiushishuone",
+    "yejiushishuoba",
+    "jianyanzhijiushi",
+    "jianyanzhishuo",
+    "guerdaozhi",
+    "guerjueding",
+    "shishishangshi",
+    "shishishangshuo"
+  ],
+  pinyinUnits: {},
+  distractors: "QRBC*Ei*Eu*EvS*Ev*GH*Iu*Iv*GE*GF*GG*HK*CcYZA*D2aAB*DI*GPdAefMU*FR*Io*IpJ*FRIKi*FRIJkNnPQopHULrPQ*Ev*GH*MBCuvLNRALNQALNTBLNSBLN*FOsHMCLNP*GY*Gb*Gd*LeWDLNZELNYELNFLNPHMUcHMUbGLNPfHmoeHmo*FjhikgjlI*FjgjkhilJ*FjgilhjkKqeforLHMpMefoMefmefonNHM*FOUHM*FPHMUvPHMuPHM"
 };
 
 export const p5_104_quality__standards = {
@@ -1595,7 +2858,57 @@ export const p5_104_quality__standards = {
     ["做认证", "zuò rèn zhèng", "Do certification", "Hacer certificación", "Faire la certification", "Fazer certificação"],
     ["规范化", "guī fàn huà", "Standardize", "Estandarizar", "Normaliser", "Padronizar"],
     ["按规范", "àn guī fàn", "According to standards", "Según normas", "Selon les normes", "Conforme normas"]
-  ]
+  ],
+  accentFree: {},
+  tonelessPinyin: [
+    "pinzhi",
+    "zhiliang",
+    "biaozhun",
+    "guige",
+    "jianyan",
+    "jiance",
+    "hege",
+    "buhege",
+    "dabiao",
+    "youzhi",
+    "youliang",
+    "cipin",
+    "xiaci",
+    "renzheng",
+    "guifan",
+    "pinzhihao",
+    "gaopinzhi",
+    "zhilianghao",
+    "baozhengzhiliang",
+    "biaozhungao",
+    "anbiaozhun",
+    "guigebiao",
+    "anguige",
+    "jianyanyuan",
+    "zuojianyan",
+    "jiancebaogao",
+    "zuojiance",
+    "hegele",
+    "jianyanhege",
+    "buhegepin",
+    "jianyanbuhege",
+    "dabiaole",
+    "yidabiao",
+    "youzhipin",
+    "tigongyouzhi",
+    "youliangpinzhong",
+    "pinzhiyouliang",
+    "shicipin",
+    "youcipin",
+    "youxiaci",
+    "wuxiaci",
+    "tongguorenzheng",
+    "zuorenzheng",
+    "guifanhua",
+    "anguifan"
+  ],
+  pinyinUnits: {},
+  distractors: "*JIJPQ*JG*JJRATUAB*AA*PuGOFXYAE6aA*AADHbGdPQ*TffgA*JI*MwAK*MwJAB*I7lmAnoAByqAB*PuDrs*JmAHQAHPRBHPQZcdiCHPQCHPQDHPQ*QGsDHEHPQaEHPScdiY*TPFHGHPQeSZdHSZccSZdIHPQIHPQJHPQSZcdSZcdSZcdmLHPlLHPoMHPnMHPSZcdNHPQOHPQ*QGWOH"
 };
 
 export const p5_105_evaluation__assessment = {
@@ -1659,7 +2972,60 @@ export const p5_105_evaluation__assessment = {
     ["做分析", "zuò fēn xī", "Make analysis", "Hacer análisis", "Faire une analyse", "Faça análise"],
     ["考虑下", "kǎo lǜ xià", "Consider it", "Considérelo", "Considérez-le", "Considere isso"],
     ["要考虑", "yào kǎo lǜ", "Consider it", "Considérelo", "Considérez-le", "Considere isso"]
-  ]
+  ],
+  accentFree: {},
+  tonelessPinyin: [
+    "pingjia",
+    "pinggu",
+    "pinglun",
+    "pingpan",
+    "panduan",
+    "renwei",
+    "juede",
+    "kanlai",
+    "xianran",
+    "haoxiang",
+    "sihu",
+    "guji",
+    "yuji",
+    "yuce",
+    "fenxi",
+    "kaolu",
+    "pingjiagao",
+    "zuopingjia",
+    "pinggubaogao",
+    "zuopinggu",
+    "pinglunqu",
+    "xiepinglun",
+    "pingpanbiaozhun",
+    "zuopingpan",
+    "panduanli",
+    "zuopanduan",
+    "worenwei",
+    "tarenwei",
+    "wojuede",
+    "tajuede",
+    "kanlaishi",
+    "kanlaihui",
+    "xianranshi",
+    "henxianran",
+    "haoxiangshi",
+    "haoxianghui",
+    "sihushi",
+    "sihuhui",
+    "gujishi",
+    "woguji",
+    "yujishi",
+    "yujihui",
+    "yucejieguo",
+    "zuoyuce",
+    "fenxibaogao",
+    "zuofenxi",
+    "kaoluxia",
+    "yaokaolu"
+  ],
+  pinyinUnits: {},
+  distractors: "BCDQACDT*FfABDABCXYZAB*SE*IZab*HicdA*En*Hm*Ho*Hq*FZ*Fb*LQ*LR*HB*HD*HI*HN*EAklAMmnALNop*R8MrA*KltABuvABARTUTXAQWqsQRXBQCQRTCQRTSqsQRTDQEQRTEQRTbFQRaFQRdGQRcGQRfHQReHQR*F2*Lm*Lo*L4IQRTjJQRiJQR*EYlKQkKQRoLQRLQRTmpMQoMQRSWsQ*SRNQRSWqQOQRTPQRTPQRT"
 };
 
 export const p5_106_abstract__concepts = {
@@ -1723,7 +3089,60 @@ export const p5_106_abstract__concepts = {
     ["追求真理", "zhuī qiú zhēn lǐ", "Pursue the truth", "Persigue la verdad", "Poursuivre la vérité", "Perseguir a verdade"],
     ["学哲学", "xué zhé xué", "Learn philosophy", "Aprender filosofía", "Apprendre la philosophie", "Aprenda filosofia"],
     ["讲哲学", "jiǎng zhé xué", "Speak philosophy", "Hablar filosofía", "Parler philosophie", "Falar filosofia"]
-  ]
+  ],
+  accentFree: {},
+  tonelessPinyin: [
+    "gainian",
+    "guannian",
+    "xiangfa",
+    "sixiang",
+    "yuanze",
+    "linian",
+    "daoli",
+    "yiyi",
+    "jiazhi",
+    "lixiang",
+    "mengxiang",
+    "mubiao",
+    "xinnian",
+    "jingshen",
+    "zhenli",
+    "zhexue",
+    "xingainian",
+    "yougainian",
+    "xinguannian",
+    "zhuanbianguannian",
+    "haoxiangfa",
+    "youxiangfa",
+    "sixiangjia",
+    "yousixiang",
+    "yuanzeshang",
+    "youyuanze",
+    "xinlinian",
+    "youlinian",
+    "dongdaoli",
+    "jiangdaoli",
+    "youyiyi",
+    "meiyiyi",
+    "youjiazhi",
+    "meijiazhi",
+    "youlixiang",
+    "zhuiqiulixiang",
+    "youmengxiang",
+    "shixianmengxiang",
+    "youmubiao",
+    "dingmubiao",
+    "youxinnian",
+    "jiandingxinnian",
+    "jingshenhao",
+    "youjingshen",
+    "shizhenli",
+    "zhuiqiuzhenli",
+    "xuezhexue",
+    "jiangzhexue"
+  ],
+  pinyinUnits: {},
+  distractors: "BFMQAFMS*Bq*Mo*Mp*M+JKWX*Eg*FYYZ*PDABJ*MlOcdefABghAB*PDDFKDJkA*R/mnAABFoqrAB*MlGsA*NmuvARSaAQboAQaBRjlptVCQR*M9*M/UCDQRSikDQEQRSEQRSQSbFRaiodGQRcGQRfHQReHQRhIQRgIQRXbkJTlptXiKQTjptnLQRmLQRRbMQTjltNQRSNQRSOQRSTjlpvPQRuPQR"
 };
 
 export const p5_107_success__achievement = {
@@ -1787,5 +3206,58 @@ export const p5_107_success__achievement = {
     ["累累战果", "lěi lěi zhàn guǒ", "Plenty of results", "Muchos resultados", "Beaucoup de résultats", "Muitos resultados"],
     ["颇有建树", "pǒ yǒu jiàn shù", "Considerable achievements", "Logros considerables", "Des réalisations considérables", "Realizações consideráveis ​​"],
     ["学术建树", "xué shù jiàn shù", "Academic achievements", "Logros académicos", "Réalisations académiques", "Conquistas acadêmicas"]
-  ]
+  ],
+  accentFree: {},
+  tonelessPinyin: [
+    "chenggong",
+    "chengjiu",
+    "chengguo",
+    "yeji",
+    "shibai",
+    "cuozhe",
+    "jinbu",
+    "tupo",
+    "shouhuo",
+    "chengzhang",
+    "fendou",
+    "nuli",
+    "xiaoguo",
+    "chengxiao",
+    "zhanguo",
+    "jianshu",
+    "chenggongrenshi",
+    "zouxiangchenggong",
+    "chengjiugan",
+    "yifanchengjiu",
+    "yanjiuchengguo",
+    "fengshuochengguo",
+    "xiaoshouyeji",
+    "huihuangyeji",
+    "shibaishichenggongzhimu",
+    "jinglishibai",
+    "zaoshoucuozhe",
+    "cuozhejiaoyu",
+    "mingxianjinbu",
+    "buduanjinbu",
+    "jishutupo",
+    "zhongdatupo",
+    "manzaishouhuo",
+    "shouhuopofeng",
+    "chengzhangjingli",
+    "zhuozhuangchengzhang",
+    "jiankufendou",
+    "fendoumubiao",
+    "nuligongzuo",
+    "fuchunuli",
+    "liganjianyingxiaoguo",
+    "xiaoguoxianzhu",
+    "zhuoyouchengxiao",
+    "chujianchengxiao",
+    "huihuangzhanguo",
+    "leileizhanguo",
+    "poyoujianshu",
+    "xueshujianshu"
+  ],
+  pinyinUnits: {},
+  distractors: "BCJNACJN*Eh*Ei*Ep*FQABCEABCDABCD*Hp*Nl*Qk*QlABCDABCDABCNABCD*NdABC*Eh*Ei*Ep*FQABCJ*Eh*Ei*Ep*FQ*MtABCRTUVQTUVBACDQRUVQRTVQRTUQRTUQRTUoQRTQRTUQRTUQRTUQRTUQRTUQRTUQRTUQRTUQRTUQRTUQRTUQRTUQRTUQRTUQRTUYQRTQRTU*LIQRTQRTUQRTUQRTUQRTUQRTU"
 };
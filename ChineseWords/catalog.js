@@ -0,0 +1,125 @@
+// Language catalog - generated by PythonHelpers/build_catalog.py, do not edit
+// Acts, packs, titles and word counts for the selectors, without decoding the act modules
+
+export const catalog = {
+  "language": "chinese",
+  "acts": [
+    {"act": 1, "actName": "Foundation", "url": "./Jsmodules-js/act1-foundation-js.js", "sha256": "6371511e1f15a01d2724f18bbb71cbac79dffa952e49f943ad7b16de750557c3", "bytes": 37576, "actMeta": {"actNumber": 1, "actName": "Foundation", "wordColumns": ["chinese", "pinyin", "english", "spanish", "french", "portuguese"], "translations": {"english": {"index": 2, "display": "English"}, "spanish": {"index": 3, "display": "Español"}, "french": {"index": 4, "display": "Français"}, "portuguese": {"index": 5, "display": "Português"}}, "defaultTranslation": "english"}, "packs": [
+      {"key": "p1_1_greetings__goodbyes", "wordpack": 1, "titles": {"chinese": "Greetings & Goodbyes", "pinyin": "Greetings & Goodbyes", "english": "Greetings & Goodbyes", "spanish": "Greetings & Goodbyes", "french": "Greetings & Goodbyes", "portuguese": "Greetings & Goodbyes"}, "base": 19, "example": 38},
+      {"key": "p1_2_personal__pronouns", "wordpack": 2, "titles": {"chinese": "Personal Pronouns", "pinyin": "Personal Pronouns", "english": "Personal Pronouns", "spanish": "Personal Pronouns", "french": "Personal Pronouns", "portuguese": "Personal Pronouns"}, "base": 17, "example": 34},
+      {"key": "p1_3_demonstratives__pointers", "wordpack": 3, "titles": {"chinese": "Demonstratives & Pointers", "pinyin": "Demonstratives & Pointers", "english": "Demonstratives & Pointers", "spanish": "Demonstratives & Pointers", "french": "Demonstratives & Pointers", "portuguese": "Demonstratives & Pointers"}, "base": 18, "example": 36},
+      {"key": "p1_4_yes__no__responses", "wordpack": 4, "titles": {"chinese": "Yes No & Responses", "pinyin": "Yes No & Responses", "english": "Yes No & Responses", "spanish": "Yes No & Responses", "french": "Yes No & Responses", "portuguese": "Yes No & Responses"}, "base": 18, "example": 36},
+      {"key": "p1_5_essential__verbs__i", "wordpack": 5, "titles": {"chinese": "Essential Verbs I", "pinyin": "Essential Verbs I", "english": "Essential Verbs I", "spanish": "Essential Verbs I", "french": "Essential Verbs I", "portuguese": "Essential Verbs I"}, "base": 19, "example": 38},
+      {"key": "p1_6_essential__verbs__ii", "wordpack": 6, "titles": {"chinese": "Essential Verbs II", "pinyin": "Essential Verbs II", "english": "Essential Verbs II", "spanish": "Essential Verbs II", "french": "Essential Verbs II", "portuguese": "Essential Verbs II"}, "base": 19, "example": 38},
+      {"key": "p1_7_numbers__010", "wordpack": 7, "titles": {"chinese": "Numbers 0-10", "pinyin": "Numbers 0-10", "english": "Numbers 0-10", "spanish": "Numbers 0-10", "french": "Numbers 0-10", "portuguese": "Numbers 0-10"}, "base": 16, "example": 32},
+      {"key": "p1_8_core__measure__words", "wordpack": 8, "titles": {"chinese": "Core Measure Words", "pinyin": "Core Measure Words", "english": "Core Measure Words", "spanish": "Core Measure Words", "french": "Core Measure Words", "portuguese": "Core Measure Words"}, "base": 19, "example": 38},
+      {"key": "p1_9_basic__question__words", "wordpack": 9, "titles": {"chinese": "Basic Question Words", "pinyin": "Basic Question Words", "english": "Basic Question Words", "spanish": "Basic Question Words", "french": "Basic Question Words", "portuguese": "Basic Question Words"}, "base": 15, "example": 30},
+      {"key": "p1_10_time__essentials", "wordpack": 10, "titles": {"chinese": "Time Essentials", "pinyin": "Time Essentials", "english": "Time Essentials", "spanish": "Time Essentials", "french": "Time Essentials", "portuguese": "Time Essentials"}, "base": 17, "example": 34},
+      {"key": "p1_11_basic__adjectives__i", "wordpack": 11, "titles": {"chinese": "Basic Adjectives I", "pinyin": "Basic Adjectives I", "english": "Basic Adjectives I", "spanish": "Basic Adjectives I", "french": "Basic Adjectives I", "portuguese": "Basic Adjectives I"}, "base": 17, "example": 34},
+      {"key": "p1_12_basic__adjectives__ii", "wordpack": 12, "titles": {"chinese": "Basic Adjectives II", "pinyin": "Basic Adjectives II", "english": "Basic Adjectives II", "spanish": "Basic Adjectives II", "french": "Basic Adjectives II", "portuguese": "Basic Adjectives II"}, "base": 18, "example": 36},
+      {"key": "p1_13_core__radicals__components", "wordpack": 13, "titles": {"chinese": "Core Radicals & Components", "pinyin": "Core Radicals & Components", "english": "Core Radicals & Components", "spanish": "Core Radicals & Components", "french": "Core Radicals & Components", "portuguese": "Core Radicals & Components"}, "base": 19, "example": 38},
+      {"key": "p1_14_emergency__survival", "wordpack": 14, "titles": {"chinese": "Emergency & Survival", "pinyin": "Emergency & Survival", "english": "Emergency & Survival", "spanish": "Emergency & Survival", "french": "Emergency & Survival", "portuguese": "Emergency & Survival"}, "base": 18, "example": 36}
+    ]},
+    {"act": 2, "actName": "Development", "url": "./Jsmodules-js/act2-development-js.js", "sha256": "174edc6171451cf282aaa905bd1cc6545c07fc542b1b5fa5955bd30be7923171", "bytes": 40176, "actMeta": {"actNumber": 2, "actName": "Development", "wordColumns": ["chinese", "pinyin", "english", "spanish", "french", "portuguese"], "translations": {"english": {"index": 2, "display": "English"}, "spanish": {"index": 3, "display": "Español"}, "french": {"index": 4, "display": "Français"}, "portuguese": {"index": 5, "display": "Português"}}, "defaultTranslation": "english"}, "packs": [
+      {"key": "p2_15_family__members", "wordpack": 15, "titles": {"chinese": "Family Members", "pinyin": "Family Members", "english": "Family Members", "spanish": "Family Members", "french": "Family Members", "portuguese": "Family Members"}, "base": 19, "example": 38},
+      {"key": "p2_16_days__of__week", "wordpack": 16, "titles": {"chinese": "Days of Week", "pinyin": "Days of Week", "english": "Days of Week", "spanish": "Days of Week", "french": "Days of Week", "portuguese": "Days of Week"}, "base": 14, "example": 28},
+      {"key": "p2_17_months__seasons", "wordpack": 17, "titles": {"chinese": "Months & Seasons", "pinyin": "Months & Seasons", "english": "Months & Seasons", "spanish": "Months & Seasons", "french": "Months & Seasons", "portuguese": "Months & Seasons"}, "base": 18, "example": 36},
+      {"key": "p2_18_years__calendar", "wordpack": 18, "titles": {"chinese": "Years & Calendar", "pinyin": "Years & Calendar", "english": "Years & Calendar", "spanish": "Years & Calendar", "french": "Years & Calendar", "portuguese": "Years & Calendar"}, "base": 15, "example": 30},
+      {"key": "p2_19_telling__time", "wordpack": 19, "titles": {"chinese": "Telling Time", "pinyin": "Telling Time", "english": "Telling Time", "spanish": "Telling Time", "french": "Telling Time", "portuguese": "Telling Time"}, "base": 17, "example": 34},
+      {"key": "p2_20_numbers__11100", "wordpack": 20, "titles": {"chinese": "Numbers 11-100", "pinyin": "Numbers 11-100", "english": "Numbers 11-100", "spanish": "Numbers 11-100", "french": "Numbers 11-100", "portuguese": "Numbers 11-100"}, "base": 18, "example": 36},
+      {"key": "p2_21_more__measure__words", "wordpack": 21, "titles": {"chinese": "More Measure Words", "pinyin": "More Measure Words", "english": "More Measure Words", "spanish": "More Measure Words", "french": "More Measure Words", "portuguese": "More Measure Words"}, "base": 18, "example": 36},
+      {"key": "p2_22_more__action__verbs", "wordpack": 22, "titles": {"chinese": "More Action Verbs", "pinyin": "More Action Verbs", "english": "More Action Verbs", "spanish": "More Action Verbs", "french": "More Action Verbs", "portuguese": "More Action Verbs"}, "base": 20, "example": 40},
+      {"key": "p2_23_daily__actions", "wordpack": 23, "titles": {"chinese": "Daily Actions", "pinyin": "Daily Actions", "english": "Daily Actions", "spanish": "Daily Actions", "french": "Daily Actions", "portuguese": "Daily Actions"}, "base": 17, "example": 34},
+      {"key": "p2_24_places__locations", "wordpack": 24, "titles": {"chinese": "Places & Locations", "pinyin": "Places & Locations", "english": "Places & Locations", "spanish": "Places & Locations", "french": "Places & Locations", "portuguese": "Places & Locations"}, "base": 18, "example": 36},
+      {"key": "p2_25_directions__positions", "wordpack": 25, "titles": {"chinese": "Directions & Positions", "pinyin": "Directions & Positions", "english": "Directions & Positions", "spanish": "Directions & Positions", "french": "Directions & Positions", "portuguese": "Directions & Positions"}, "base": 18, "example": 36},
+      {"key": "p2_26_basic__transportation", "wordpack": 26, "titles": {"chinese": "Basic Transportation", "pinyin": "Basic Transportation", "english": "Basic Transportation", "spanish": "Basic Transportation", "french": "Basic Transportation", "portuguese": "Basic Transportation"}, "base": 18, "example": 36},
+      {"key": "p2_27_colors", "wordpack": 27, "titles": {"chinese": "Colors", "pinyin": "Colors", "english": "Colors", "spanish": "Colors", "french": "Colors", "portuguese": "Colors"}, "base": 18, "example": 36}
+    ]},
+    {"act": 3, "actName": "Expansion", "url": "./Jsmodules-js/act3-expansion-js.js", "sha256": "5422fc5f5d8160f9f7fb34e2f553c5b068f8eff4557a68fba7aa96a052bd069c", "bytes": 71284, "actMeta": {"actNumber": 3, "actName": "Expansion", "wordColumns": ["chinese", "pinyin", "english", "spanish", "french", "portuguese"], "translations": {"english": {"index": 2, "display": "English"}, "spanish": {"index": 3, "display": "Español"}, "french": {"index": 4, "display": "Français"}, "portuguese": {"index": 5, "display": "Português"}}, "defaultTranslation": "english"}, "packs": [
+      {"key": "p3_28_body__parts", "wordpack": 28, "titles": {"chinese": "Body Parts", "pinyin": "Body Parts", "english": "Body Parts", "spanish": "Body Parts", "french": "Body Parts", "portuguese": "Body Parts"}, "base": 19, "example": 38},
+      {"key": "p3_29_food__basics", "wordpack": 29, "titles": {"chinese": "Food Basics", "pinyin": "Food Basics", "english": "Food Basics", "spanish": "Food Basics", "french": "Food Basics", "portuguese": "Food Basics"}, "base": 18, "example": 36},
+      {"key": "p3_30_drinks__beverages", "wordpack": 30, "titles": {"chinese": "Drinks & Beverages", "pinyin": "Drinks & Beverages", "english": "Drinks & Beverages", "spanish": "Drinks & Beverages", "french": "Drinks & Beverages", "portuguese": "Drinks & Beverages"}, "base": 17, "example": 34},
+      {"key": "p3_31_common__foods", "wordpack": 31, "titles": {"chinese": "Common Foods", "pinyin": "Common Foods", "english": "Common Foods", "spanish": "Common Foods", "french": "Common Foods", "portuguese": "Common Foods"}, "base": 16, "example": 32},
+      {"key": "p3_32_eating__drinking", "wordpack": 32, "titles": {"chinese": "Eating & Drinking", "pinyin": "Eating & Drinking", "english": "Eating & Drinking", "spanish": "Eating & Drinking", "french": "Eating & Drinking", "portuguese": "Eating & Drinking"}, "base": 18, "example": 36},
+      {"key": "p3_33_clothing__items", "wordpack": 33, "titles": {"chinese": "Clothing Items", "pinyin": "Clothing Items", "english": "Clothing Items", "spanish": "Clothing Items", "french": "Clothing Items", "portuguese": "Clothing Items"}, "base": 16, "example": 32},
+      {"key": "p3_34_weather__words", "wordpack": 34, "titles": {"chinese": "Weather Words", "pinyin": "Weather Words", "english": "Weather Words", "spanish": "Weather Words", "french": "Weather Words", "portuguese": "Weather Words"}, "base": 16, "example": 32},
+      {"key": "p3_35_shopping__basics", "wordpack": 35, "titles": {"chinese": "Shopping Basics", "pinyin": "Shopping Basics", "english": "Shopping Basics", "spanish": "Shopping Basics", "french": "Shopping Basics", "portuguese": "Shopping Basics"}, "base": 15, "example": 30},
+      {"key": "p3_36_around__the__house", "wordpack": 36, "titles": {"chinese": "Around the House", "pinyin": "Around the House", "english": "Around the House", "spanish": "Around the House", "french": "Around the House", "portuguese": "Around the House"}, "base": 17, "example": 34},
+      {"key": "p3_37_furniture__objects", "wordpack": 37, "titles": {"chinese": "Furniture & Objects", "pinyin": "Furniture & Objects", "english": "Furniture & Objects", "spanish": "Furniture & Objects", "french": "Furniture & Objects", "portuguese": "Furniture & Objects"}, "base": 16, "example": 32},
+      {"key": "p3_38_describing__people", "wordpack": 38, "titles": {"chinese": "Describing People", "pinyin": "Describing People", "english": "Describing People", "spanish": "Describing People", "french": "Describing People", "portuguese": "Describing People"}, "base": 17, "example": 34},
+      {"key": "p3_39_emotions__feelings", "wordpack": 39, "titles": {"chinese": "Emotions & Feelings", "pinyin": "Emotions & Feelings", "english": "Emotions & Feelings", "spanish": "Emotions & Feelings", "french": "Emotions & Feelings", "portuguese": "Emotions & Feelings"}, "base": 18, "example": 36},
+      {"key": "p3_40_health__sickness", "wordpack": 40, "titles": {"chinese": "Health & Sickness", "pinyin": "Health & Sickness", "english": "Health & Sickness", "spanish": "Health & Sickness", "french": "Health & Sickness", "portuguese": "Health & Sickness"}, "base": 15, "example": 30},
+      {"key": "p3_41_school__life", "wordpack": 41, "titles": {"chinese": "School Life", "pinyin": "School Life", "english": "School Life", "spanish": "School Life", "french": "School Life", "portuguese": "School Life"}, "base": 17, "example": 34},
+      {"key": "p3_42_work__office", "wordpack": 42, "titles": {"chinese": "Work & Office", "pinyin": "Work & Office", "english": "Work & Office", "spanish": "Work & Office", "french": "Work & Office", "portuguese": "Work & Office"}, "base": 16, "example": 32},
+      {"key": "p3_43_communication__verbs", "wordpack": 43, "titles": {"chinese": "Communication Verbs", "pinyin": "Communication Verbs", "english": "Communication Verbs", "spanish": "Communication Verbs", "french": "Communication Verbs", "portuguese": "Communication Verbs"}, "base": 17, "example": 34},
+      {"key": "p3_44_phone__internet", "wordpack": 44, "titles": {"chinese": "Phone & Internet", "pinyin": "Phone & Internet", "english": "Phone & Internet", "spanish": "Phone & Internet", "french": "Phone & Internet", "portuguese": "Phone & Internet"}, "base": 15, "example": 30},
+      {"key": "p3_45_getting__around", "wordpack": 45, "titles": {"chinese": "Getting Around", "pinyin": "Getting Around", "english": "Getting Around", "spanish": "Getting Around", "french": "Getting Around", "portuguese": "Getting Around"}, "base": 17, "example": 34},
+      {"key": "p3_46_daily__routines", "wordpack": 46, "titles": {"chinese": "Daily Routines", "pinyin": "Daily Routines", "english": "Daily Routines", "spanish": "Daily Routines", "french": "Daily Routines", "portuguese": "Daily Routines"}, "base": 16, "example": 32},
+      {"key": "p3_47_hobbies__leisure", "wordpack": 47, "titles": {"chinese": "Hobbies & Leisure", "pinyin": "Hobbies & Leisure", "english": "Hobbies & Leisure", "spanish": "Hobbies & Leisure", "french": "Hobbies & Leisure", "portuguese": "Hobbies & Leisure"}, "base": 17, "example": 34},
+      {"key": "p3_48_sports__exercise", "wordpack": 48, "titles": {"chinese": "Sports & Exercise", "pinyin": "Sports & Exercise", "english": "Sports & Exercise", "spanish": "Sports & Exercise", "french": "Sports & Exercise", "portuguese": "Sports & Exercise"}, "base": 17, "example": 34},
+      {"key": "p3_49_nature__environment", "wordpack": 49, "titles": {"chinese": "Nature & Environment", "pinyin": "Nature & Environment", "english": "Nature & Environment", "spanish": "Nature & Environment", "french": "Nature & Environment", "portuguese": "Nature & Environment"}, "base": 18, "example": 36},
+      {"key": "p3_50_animals", "wordpack": 50, "titles": {"chinese": "Animals", "pinyin": "Animals", "english": "Animals", "spanish": "Animals", "french": "Animals", "portuguese": "Animals"}, "base": 19, "example": 38},
+      {"key": "p3_51_numbers__math", "wordpack": 51, "titles": {"chinese": "Numbers & Math", "pinyin": "Numbers & Math", "english": "Numbers & Math", "spanish": "Numbers & Math", "french": "Numbers & Math", "portuguese": "Numbers & Math"}, "base": 17, "example": 34},
+      {"key": "p3_52_time__words__advanced", "wordpack": 52, "titles": {"chinese": "Time Words Advanced", "pinyin": "Time Words Advanced", "english": "Time Words Advanced", "spanish": "Time Words Advanced", "french": "Time Words Advanced", "portuguese": "Time Words Advanced"}, "base": 17, "example": 34},
+      {"key": "p3_53_location__words", "wordpack": 53, "titles": {"chinese": "Location Words", "pinyin": "Location Words", "english": "Location Words", "spanish": "Location Words", "french": "Location Words", "portuguese": "Location Words"}, "base": 20, "example": 40}
+    ]},
+    {"act": 4, "actName": "Mastery", "url": "./Jsmodules-js/act4-mastery-js.js", "sha256": "a025dbe041c4e97b337ba3b9053e0943e3ecaeb30b8a2ce960d9a21a1f8d26e8", "bytes": 67428, "actMeta": {"actNumber": 4, "actName": "Mastery", "wordColumns": ["chinese", "pinyin", "english", "spanish", "french", "portuguese"], "translations": {"english": {"index": 2, "display": "English"}, "spanish": {"index": 3, "display": "Español"}, "french": {"index": 4, "display": "Français"}, "portuguese": {"index": 5, "display": "Português"}}, "defaultTranslation": "english"}, "packs": [
+      {"key": "p4_54_opinions__views", "wordpack": 54, "titles": {"chinese": "Opinions & Views", "pinyin": "Opinions & Views", "english": "Opinions & Views", "spanish": "Opinions & Views", "french": "Opinions & Views", "portuguese": "Opinions & Views"}, "base": 17, "example": 34},
+      {"key": "p4_55_making__plans", "wordpack": 55, "titles": {"chinese": "Making Plans", "pinyin": "Making Plans", "english": "Making Plans", "spanish": "Making Plans", "french": "Making Plans", "portuguese": "Making Plans"}, "base": 17, "example": 34},
+      {"key": "p4_56_expressing__needs", "wordpack": 56, "titles": {"chinese": "Expressing Needs", "pinyin": "Expressing Needs", "english": "Expressing Needs", "spanish": "Expressing Needs", "french": "Expressing Needs", "portuguese": "Expressing Needs"}, "base": 16, "example": 32},
+      {"key": "p4_57_asking__for__help", "wordpack": 57, "titles": {"chinese": "Asking for Help", "pinyin": "Asking for Help", "english": "Asking for Help", "spanish": "Asking for Help", "french": "Asking for Help", "portuguese": "Asking for Help"}, "base": 14, "example": 28},
+      {"key": "p4_58_giving__directions", "wordpack": 58, "titles": {"chinese": "Giving Directions", "pinyin": "Giving Directions", "english": "Giving Directions", "spanish": "Giving Directions", "french": "Giving Directions", "portuguese": "Giving Directions"}, "base": 16, "example": 32},
+      {"key": "p4_59_describing__situations", "wordpack": 59, "titles": {"chinese": "Describing Situations", "pinyin": "Describing Situations", "english": "Describing Situations", "spanish": "Describing Situations", "french": "Describing Situations", "portuguese": "Describing Situations"}, "base": 14, "example": 28},
+      {"key": "p4_60_talking__about__problems", "wordpack": 60, "titles": {"chinese": "Talking About Problems", "pinyin": "Talking About Problems", "english": "Talking About Problems", "spanish": "Talking About Problems", "french": "Talking About Problems", "portuguese": "Talking About Problems"}, "base": 15, "example": 30},
+      {"key": "p4_61_money__payments", "wordpack": 61, "titles": {"chinese": "Money & Payments", "pinyin": "Money & Payments", "english": "Money & Payments", "spanish": "Money & Payments", "french": "Money & Payments", "portuguese": "Money & Payments"}, "base": 15, "example": 30},
+      {"key": "p4_62_at__the__restaurant", "wordpack": 62, "titles": {"chinese": "At the Restaurant", "pinyin": "At the Restaurant", "english": "At the Restaurant", "spanish": "At the Restaurant", "french": "At the Restaurant", "portuguese": "At the Restaurant"}, "base": 16, "example": 32},
+      {"key": "p4_63_at__the__hotel", "wordpack": 63, "titles": {"chinese": "At the Hotel", "pinyin": "At the Hotel", "english": "At the Hotel", "spanish": "At the Hotel", "french": "At the Hotel", "portuguese": "At the Hotel"}, "base": 15, "example": 30},
+      {"key": "p4_64_at__the__airport", "wordpack": 64, "titles": {"chinese": "At the Airport", "pinyin": "At the Airport", "english": "At the Airport", "spanish": "At the Airport", "french": "At the Airport", "portuguese": "At the Airport"}, "base": 16, "example": 32},
+      {"key": "p4_65_at__the__doctor", "wordpack": 65, "titles": {"chinese": "At the Doctor", "pinyin": "At the Doctor", "english": "At the Doctor", "spanish": "At the Doctor", "french": "At the Doctor", "portuguese": "At the Doctor"}, "base": 16, "example": 32},
+      {"key": "p4_66_making__appointments", "wordpack": 66, "titles": {"chinese": "Making Appointments", "pinyin": "Making Appointments", "english": "Making Appointments", "spanish": "Making Appointments", "french": "Making Appointments", "portuguese": "Making Appointments"}, "base": 14, "example": 28},
+      {"key": "p4_67_weather__conversations", "wordpack": 67, "titles": {"chinese": "Weather Conversations", "pinyin": "Weather Conversations", "english": "Weather Conversations", "spanish": "Weather Conversations", "french": "Weather Conversations", "portuguese": "Weather Conversations"}, "base": 17, "example": 34},
+      {"key": "p4_68_phone__conversations", "wordpack": 68, "titles": {"chinese": "Phone Conversations", "pinyin": "Phone Conversations", "english": "Phone Conversations", "spanish": "Phone Conversations", "french": "Phone Conversations", "portuguese": "Phone Conversations"}, "base": 16, "example": 32},
+      {"key": "p4_69_social__situations", "wordpack": 69, "titles": {"chinese": "Social Situations", "pinyin": "Social Situations", "english": "Social Situations", "spanish": "Social Situations", "french": "Social Situations", "portuguese": "Social Situations"}, "base": 17, "example": 34},
+      {"key": "p4_70_invitations__offers", "wordpack": 70, "titles": {"chinese": "Invitations & Offers", "pinyin": "Invitations & Offers", "english": "Invitations & Offers", "spanish": "Invitations & Offers", "french": "Invitations & Offers", "portuguese": "Invitations & Offers"}, "base": 18, "example": 36},
+      {"key": "p4_71_agreeing__disagreeing", "wordpack": 71, "titles": {"chinese": "Agreeing & Disagreeing", "pinyin": "Agreeing & Disagreeing", "english": "Agreeing & Disagreeing", "spanish": "Agreeing & Disagreeing", "french": "Agreeing & Disagreeing", "portuguese": "Agreeing & Disagreeing"}, "base": 14, "example": 28},
+      {"key": "p4_72_expressing__certainty", "wordpack": 72, "titles": {"chinese": "Expressing Certainty", "pinyin": "Expressing Certainty", "english": "Expressing Certainty", "spanish": "Expressing Certainty", "french": "Expressing Certainty", "portuguese": "Expressing Certainty"}, "base": 16, "example": 32},
+      {"key": "p4_73_time__expressions", "wordpack": 73, "titles": {"chinese": "Time Expressions", "pinyin": "Time Expressions", "english": "Time Expressions", "spanish": "Time Expressions", "french": "Time Expressions", "portuguese": "Time Expressions"}, "base": 16, "example": 32},
+      {"key": "p4_74_frequency__expressions", "wordpack": 74, "titles": {"chinese": "Frequency Expressions", "pinyin": "Frequency Expressions", "english": "Frequency Expressions", "spanish": "Frequency Expressions", "french": "Frequency Expressions", "portuguese": "Frequency Expressions"}, "base": 16, "example": 32},
+      {"key": "p4_75_describing__amounts", "wordpack": 75, "titles": {"chinese": "Describing Amounts", "pinyin": "Describing Amounts", "english": "Describing Amounts", "spanish": "Describing Amounts", "french": "Describing Amounts", "portuguese": "Describing Amounts"}, "base": 15, "example": 30},
+      {"key": "p4_76_quality__descriptions", "wordpack": 76, "titles": {"chinese": "Quality Descriptions", "pinyin": "Quality Descriptions", "english": "Quality Descriptions", "spanish": "Quality Descriptions", "french": "Quality Descriptions", "portuguese": "Quality Descriptions"}, "base": 16, "example": 32},
+      {"key": "p4_77_making__comparisons", "wordpack": 77, "titles": {"chinese": "Making Comparisons", "pinyin": "Making Comparisons", "english": "Making Comparisons", "spanish": "Making Comparisons", "french": "Making Comparisons", "portuguese": "Making Comparisons"}, "base": 16, "example": 32},
+      {"key": "p4_78_expressing__preferences", "wordpack": 78, "titles": {"chinese": "Expressing Preferences", "pinyin": "Expressing Preferences", "english": "Expressing Preferences", "spanish": "Expressing Preferences", "french": "Expressing Preferences", "portuguese": "Expressing Preferences"}, "base": 16, "example": 32},
+      {"key": "p4_79_giving__reasons", "wordpack": 79, "titles": {"chinese": "Giving Reasons", "pinyin": "Giving Reasons", "english": "Giving Reasons", "spanish": "Giving Reasons", "french": "Giving Reasons", "portuguese": "Giving Reasons"}, "base": 16, "example": 32}
+    ]},
+    {"act": 5, "actName": "Refinement", "url": "./Jsmodules-js/act5-refinement-js.js", "sha256": "f069dfb444347ab7667495e09ea9f113620da4a2572762666d664517e53f46df", "bytes": 71604, "actMeta": {"actNumber": 5, "actName": "Refinement", "wordColumns": ["chinese", "pinyin", "english", "spanish", "french", "portuguese"], "translations": {"english": {"index": 2, "display": "English"}, "spanish": {"index": 3, "display": "Español"}, "french": {"index": 4, "display": "Français"}, "portuguese": {"index": 5, "display": "Português"}}, "defaultTranslation": "english"}, "packs": [
+      {"key": "p5_80_personality__traits", "wordpack": 80, "titles": {"chinese": "Personality Traits", "pinyin": "Personality Traits", "english": "Personality Traits", "spanish": "Personality Traits", "french": "Personality Traits", "portuguese": "Personality Traits"}, "base": 17, "example": 34},
+      {"key": "p5_81_culture__traditions", "wordpack": 81, "titles": {"chinese": "Culture & Traditions", "pinyin": "Culture & Traditions", "english": "Culture & Traditions", "spanish": "Culture & Traditions", "french": "Culture & Traditions", "portuguese": "Culture & Traditions"}, "base": 16, "example": 32},
+      {"key": "p5_82_chinese__arts__heritage", "wordpack": 82, "titles": {"chinese": "Chinese Arts & Heritage", "pinyin": "Chinese Arts & Heritage", "english": "Chinese Arts & Heritage", "spanish": "Chinese Arts & Heritage", "french": "Chinese Arts & Heritage", "portuguese": "Chinese Arts & Heritage"}, "base": 17, "example": 34},
+      {"key": "p5_83_time__expressions__advanced", "wordpack": 83, "titles": {"chinese": "Time Expressions Advanced", "pinyin": "Time Expressions Advanced", "english": "Time Expressions Advanced", "spanish": "Time Expressions Advanced", "french": "Time Expressions Advanced", "portuguese": "Time Expressions Advanced"}, "base": 16, "example": 32},
+      {"key": "p5_84_frequency__duration", "wordpack": 84, "titles": {"chinese": "Frequency & Duration", "pinyin": "Frequency & Duration", "english": "Frequency & Duration", "spanish": "Frequency & Duration", "french": "Frequency & Duration", "portuguese": "Frequency & Duration"}, "base": 16, "example": 32},
+      {"key": "p5_85_comparison__degree", "wordpack": 85, "titles": {"chinese": "Comparison & Degree", "pinyin": "Comparison & Degree", "english": "Comparison & Degree", "spanish": "Comparison & Degree", "french": "Comparison & Degree", "portuguese": "Comparison & Degree"}, "base": 14, "example": 28},
+      {"key": "p5_86_cause__effect", "wordpack": 86, "titles": {"chinese": "Cause & Effect", "pinyin": "Cause & Effect", "english": "Cause & Effect", "spanish": "Cause & Effect", "french": "Cause & Effect", "portuguese": "Cause & Effect"}, "base": 16, "example": 32},
+      {"key": "p5_87_conditions__assumptions", "wordpack": 87, "titles": {"chinese": "Conditions & Assumptions", "pinyin": "Conditions & Assumptions", "english": "Conditions & Assumptions", "spanish": "Conditions & Assumptions", "french": "Conditions & Assumptions", "portuguese": "Conditions & Assumptions"}, "base": 16, "example": 32},
+      {"key": "p5_88_conjunctions__connectors", "wordpack": 88, "titles": {"chinese": "Conjunctions & Connectors", "pinyin": "Conjunctions & Connectors", "english": "Conjunctions & Connectors", "spanish": "Conjunctions & Connectors", "french": "Conjunctions & Connectors", "portuguese": "Conjunctions & Connectors"}, "base": 16, "example": 32},
+      {"key": "p5_89_modal__particles__mood", "wordpack": 89, "titles": {"chinese": "Modal Particles & Mood", "pinyin": "Modal Particles & Mood", "english": "Modal Particles & Mood", "spanish": "Modal Particles & Mood", "french": "Modal Particles & Mood", "portuguese": "Modal Particles & Mood"}, "base": 16, "example": 32},
+      {"key": "p5_90_structural__particles", "wordpack": 90, "titles": {"chinese": "Structural Particles", "pinyin": "Structural Particles", "english": "Structural Particles", "spanish": "Structural Particles", "french": "Structural Particles", "portuguese": "Structural Particles"}, "base": 16, "example": 32},
+      {"key": "p5_91_common__sentence__patterns", "wordpack": 91, "titles": {"chinese": "Common Sentence Patterns", "pinyin": "Common Sentence Patterns", "english": "Common Sentence Patterns", "spanish": "Common Sentence Patterns", "french": "Common Sentence Patterns", "portuguese": "Common Sentence Patterns"}, "base": 14, "example": 28},
+      {"key": "p5_92_describing__things", "wordpack": 92, "titles": {"chinese": "Describing Things", "pinyin": "Describing Things", "english": "Describing Things", "spanish": "Describing Things", "french": "Describing Things", "portuguese": "Describing Things"}, "base": 16, "example": 32},
+      {"key": "p5_93_quantities__amounts", "wordpack": 93, "titles": {"chinese": "Quantities & Amounts", "pinyin": "Quantities & Amounts", "english": "Quantities & Amounts", "spanish": "Quantities & Amounts", "french": "Quantities & Amounts", "portuguese": "Quantities & Amounts"}, "base": 16, "example": 32},
+      {"key": "p5_94_extent__degree", "wordpack": 94, "titles": {"chinese": "Extent & Degree", "pinyin": "Extent & Degree", "english": "Extent & Degree", "spanish": "Extent & Degree", "french": "Extent & Degree", "portuguese": "Extent & Degree"}, "base": 16, "example": 32},
+      {"key": "p5_95_emphasis__intensifiers", "wordpack": 95, "titles": {"chinese": "Emphasis & Intensifiers", "pinyin": "Emphasis & Intensifiers", "english": "Emphasis & Intensifiers", "spanish": "Emphasis & Intensifiers", "french": "Emphasis & Intensifiers", "portuguese": "Emphasis & Intensifiers"}, "base": 16, "example": 32},
+      {"key": "p5_96_describing__problems", "wordpack": 96, "titles": {"chinese": "Describing Problems", "pinyin": "Describing Problems", "english": "Describing Problems", "spanish": "Describing Problems", "french": "Describing Problems", "portuguese": "Describing Problems"}, "base": 14, "example": 28},
+      {"key": "p5_97_solutions__methods", "wordpack": 97, "titles": {"chinese": "Solutions & Methods", "pinyin": "Solutions & Methods", "english": "Solutions & Methods", "spanish": "Solutions & Methods", "french": "Solutions & Methods", "portuguese": "Solutions & Methods"}, "base": 17, "example": 34},
+      {"key": "p5_98_education__learning", "wordpack": 98, "titles": {"chinese": "Education & Learning", "pinyin": "Education & Learning", "english": "Education & Learning", "spanish": "Education & Learning", "french": "Education & Learning", "portuguese": "Education & Learning"}, "base": 16, "example": 32},
+      {"key": "p5_99_career__development", "wordpack": 99, "titles": {"chinese": "Career Development", "pinyin": "Career Development", "english": "Career Development", "spanish": "Career Development", "french": "Career Development", "portuguese": "Career Development"}, "base": 16, "example": 32},
+      {"key": "p5_100_banking__finance", "wordpack": 100, "titles": {"chinese": "Banking & Finance", "pinyin": "Banking & Finance", "english": "Banking & Finance", "spanish": "Banking & Finance", "french": "Banking & Finance", "portuguese": "Banking & Finance"}, "base": 16, "example": 32},
+      {"key": "p5_101_government__society", "wordpack": 101, "titles": {"chinese": "Government & Society", "pinyin": "Government & Society", "english": "Government & Society", "spanish": "Government & Society", "french": "Government & Society", "portuguese": "Government & Society"}, "base": 16, "example": 32},
+      {"key": "p5_102_describing__processes", "wordpack": 102, "titles": {"chinese": "Describing Processes", "pinyin": "Describing Processes", "english": "Describing Processes", "spanish": "Describing Processes", "french": "Describing Processes", "portuguese": "Describing Processes"}, "base": 16, "example": 32},
+      {"key": "p5_103_logical__relations", "wordpack": 103, "titles": {"chinese": "Logical Relations", "pinyin": "Logical Relations", "english": "Logical Relations", "spanish": "Logical Relations", "french": "Logical Relations", "portuguese": "Logical Relations"}, "base": 16, "example": 32},
+      {"key": "p5_104_quality__standards", "wordpack": 104, "titles": {"chinese": "Quality & Standards", "pinyin": "Quality & Standards", "english": "Quality & Standards", "spanish": "Quality & Standards", "french": "Quality & Standards", "portuguese": "Quality & Standards"}, "base": 15, "example": 30},
+      {"key": "p5_105_evaluation__assessment", "wordpack": 105, "titles": {"chinese": "Evaluation & Assessment", "pinyin": "Evaluation & Assessment", "english": "Evaluation & Assessment", "spanish": "Evaluation & Assessment", "french": "Evaluation & Assessment", "portuguese": "Evaluation & Assessment"}, "base": 16, "example": 32},
+      {"key": "p5_106_abstract__concepts", "wordpack": 106, "titles": {"chinese": "Abstract Concepts", "pinyin": "Abstract Concepts", "english": "Abstract Concepts", "spanish": "Abstract Concepts", "french": "Abstract Concepts", "portuguese": "Abstract Concepts"}, "base": 16, "example": 32},
+      {"key": "p5_107_success__achievement", "wordpack": 107, "titles": {"chinese": "Success & Achievement", "pinyin": "Success & Achievement", "english": "Success & Achievement", "spanish": "Success & Achievement", "french": "Success & Achievement", "portuguese": "Success & Achievement"}, "base": 16, "example": 32}
+    ]}
+  ]
+};
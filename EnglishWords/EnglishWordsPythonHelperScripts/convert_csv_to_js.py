@@ -13,6 +13,8 @@
 #    - Clean version: Readable, for development (Jsmodules/actN-name.js)
 #    - Obfuscated version: Compressed, for production (Jsmodules-js/actN-name-js.js)
 # 5. Obfuscation uses: reverse + zlib + base64 (60% size reduction)
+# 6. Runs the PythonHelpers build steps (jsmodules.BUILD_STEPS) on the new
+#    modules: answer keys, pinyin alignment, distractor lists and catalog.js
 #
 # WHY THIS EXISTS:
 # ---------------
@@ -40,7 +42,9 @@
 # 4. For each act:
 #    a. Generate clean JS file (readable format)
 #    b. Generate obfuscated JS file (compressed format)
-# 5. Print summary of generated files
+# 5. Add the build-time pack fields and rebuild catalog.js
+#    (exits 1 if a build step fails, e.g. pinyin rows it cannot align)
+# 6. Print summary of generated files
 #
 # ============================================================
 
@@ -54,6 +58,7 @@ Usage:
 Output:
     - Clean JS files: EnglishWords/Jsmodules/actN-name.js
     - Obfuscated JS files: EnglishWords/Jsmodules-js/actN-name-js.js
+    - Build-time pack fields and catalog.js (PythonHelpers build steps)
 
 Dependencies:
     None (uses built-in libraries: zlib, base64, csv, json)
@@ -67,10 +72,16 @@ Compression Method:
 
 import csv
 import json
+import sys
 import zlib
 import base64
 from pathlib import Path
 
+# Shared helpers live in PythonHelpers/ at the repo root
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent / "PythonHelpers"))
+from overview_arrays import load_overview
+from jsmodules import run_build_steps
+
 # Configuration
 BASE_DIR = Path(__file__).parent.parent  # EnglishWords/
 CSV_DIR = BASE_DIR
@@ -226,34 +237,14 @@ def read_overview_csv():
     pack_titles = {}
     pack_word_counts = {}  # New: stores base/example word counts
 
-    with open(OVERVIEW_CSV, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            pack_num = int(row['Pack_Number'])
-            pack_to_act[pack_num] = row['Difficulty_Act']
-            pack_titles[pack_num] = row['Pack_Title']
-
-            # Parse base and example word arrays to get counts
-            base_words_str = row.get('English_Base_Words', '[]')
-            example_words_str = row.get('English_Example_Words', '[]')
-
-            # Parse arrays (format is [item1,item2,item3] - not valid JSON)
-            # Strip brackets and split on commas
-            base_words = []
-            example_words = []
-
-            if base_words_str and base_words_str != '[]':
-                base_words_str = base_words_str.strip('[]')
-                base_words = [w.strip() for w in base_words_str.split(',')]
-
-            if example_words_str and example_words_str != '[]':
-                example_words_str = example_words_str.strip('[]')
-                example_words = [w.strip() for w in example_words_str.split(',')]
-
-            pack_word_counts[pack_num] = {
-                'base_count': len(base_words),
-                'example_count': len(example_words)
-            }
+    # Base/example arrays are parsed once by overview_arrays (cached sidecar)
+    for pack_num, pack in load_overview('english').items():
+        pack_to_act[pack_num] = pack['act']
+        pack_titles[pack_num] = pack['title']
+        pack_word_counts[pack_num] = {
+            'base_count': len(pack['base']),
+            'example_count': len(pack['example'])
+        }
 
     return pack_to_act, pack_titles, pack_word_counts
 
@@ -499,17 +490,17 @@ def main():
     print("=" * 80)
 
     # Read overview to get pack-to-act mapping and word counts
-    print("\n[1/8] Reading overview CSV...")
+    print("\n[1/9] Reading overview CSV...")
     pack_to_act, pack_titles, pack_word_counts = read_overview_csv()
     print(f"      Found {len(pack_to_act)} packs across {len(set(pack_to_act.values()))} acts")
 
     # Read meta CSV to get proper translations
-    print("\n[2/8] Reading meta CSV for translations...")
+    print("\n[2/9] Reading meta CSV for translations...")
     pack_meta = read_meta_csv()
     print(f"      Loaded translations for {len(pack_meta)} packs")
 
     # Group packs by act
-    print("\n[3/8] Reading individual pack CSVs and grouping by act...")
+    print("\n[3/9] Reading individual pack CSVs and grouping by act...")
     acts_data = {}  # act_name -> {pack_var_name: {meta, baseWords, exampleWords}}
     edge_case_packs = {}  # pack_var_name -> {meta, words} (ONLY edge cases)
 
@@ -579,14 +570,14 @@ def main():
             print(f"      Pack {pack_num:3d}: {pack_title:40s} -> {pack_var_name} (base: {len(base_words)}, ex: {len(example_words)})")
 
     # Create output directories
-    print("\n[4/8] Creating output directories...")
+    print("\n[4/9] Creating output directories...")
     OUTPUT_CLEAN.mkdir(exist_ok=True)
     OUTPUT_OBFUSCATED.mkdir(exist_ok=True)
     print(f"      Clean: {OUTPUT_CLEAN}")
     print(f"      Obfuscated: {OUTPUT_OBFUSCATED}")
 
     # Generate clean files
-    print("\n[5/8] Generating clean JavaScript files...")
+    print("\n[5/9] Generating clean JavaScript files...")
     clean_files = []
     for act_name, packs_data in sorted(acts_data.items()):
         # Extract act number from act_name (e.g., "act1-foundation" -> 1)
@@ -597,7 +588,7 @@ def main():
         print(f"      Created: {filepath.name:40s} ({size_kb:7.2f} KB)")
 
     # Generate obfuscated files
-    print("\n[6/8] Generating obfuscated JavaScript files...")
+    print("\n[6/9] Generating obfuscated JavaScript files...")
     obfuscated_files = []
     for act_name, packs_data in sorted(acts_data.items()):
         # Extract act number from act_name (e.g., "act1-foundation" -> 1)
@@ -609,20 +600,29 @@ def main():
 
     # Generate edge case files
     if edge_case_packs:
-        print("\n[7/8] Generating edge case clean JavaScript file...")
+        print("\n[7/9] Generating edge case clean JavaScript file...")
         edge_clean_filepath = create_edge_case_clean_js_file(edge_case_packs)
         edge_clean_size_kb = edge_clean_filepath.stat().st_size / 1024
         total_edge_words = sum(len(pack['words']) for pack in edge_case_packs.values())
         print(f"      Created: {edge_clean_filepath.name:40s} ({edge_clean_size_kb:7.2f} KB, {total_edge_words} edge case words)")
 
-        print("\n[8/8] Generating edge case obfuscated JavaScript file...")
+        print("\n[8/9] Generating edge case obfuscated JavaScript file...")
         edge_obf_filepath = create_edge_case_obfuscated_js_file(edge_case_packs)
         edge_obf_size_kb = edge_obf_filepath.stat().st_size / 1024
         edge_savings_pct = ((edge_clean_size_kb - edge_obf_size_kb) / edge_clean_size_kb) * 100 if edge_clean_size_kb > 0 else 0
         print(f"      Created: {edge_obf_filepath.name:40s} ({edge_obf_size_kb:7.2f} KB, {edge_savings_pct:5.1f}% savings)")
     else:
-        print("\n[7/8] No edge cases found, skipping edge case module generation...")
-        print("\n[8/8] Skipped edge case obfuscated file (no edge cases)")
+        print("\n[7/9] No edge cases found, skipping edge case module generation...")
+        print("\n[8/9] Skipped edge case obfuscated file (no edge cases)")
+
+    # Add the build-time pack fields and rebuild the catalog
+    print("\n[9/9] Adding build-time pack fields and catalog...")
+    failed_step = run_build_steps('english')
+    if failed_step:
+        print(f"\n❌ {failed_step} failed - the modules are missing build-time fields")
+        sys.exit(1)
+    clean_files = [(name, (OUTPUT_CLEAN / name).stat().st_size / 1024) for name, _ in clean_files]
+    obfuscated_files = [(name, (OUTPUT_OBFUSCATED / name).stat().st_size / 1024) for name, _ in obfuscated_files]
 
     # Summary
     print("\n" + "=" * 80)
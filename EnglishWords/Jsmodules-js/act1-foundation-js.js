@@ -1,2 +1,2 @@
 // Obfuscated production version (zlib + base64)
-export const w="eNq0velvHMmSJ/ivBN6Hni/vAdPTr89vuzO92Af09M4OejFYDBpCMDOYGVJkBBUHJXLRgKj7FlWSSiWJKok6SlRJ1FFSlXiURGBTBf0fC0Zm8tP+C2u3e2QmparpXqBKzPBMN/fww+xn5uZm//Iv//zPvwvzcC7IyjTqxfBPkWat3/3+dyGVxFwUQkH/+ULQSftvSvg8OHmlXr4IH7IywO/hB//99//8uwaNIA/b9AujgoVVIeVTyTGtIJqPO0Qwagdh3Er737fjooixGtLI2nlUtcIiYjpVO0g/XZ6Fz/XLzfrKJfjQy/JZ7hhUQkKL2XwwScwRgk4VUT53NJKe4f/px2fYxY/XugWUjl68qH8+vnfvTf3wlfY0bgdRK87m+eX7D/tPwjJuxUmGLzmf5XM4bu3Klc1IWX8rPgykPy0fhq5f7y4GH5/N4Ti8Pj56+a4+c3pwbhPbKKLqcJTDcEC1OR5iR9dRo2EM0v79RRyD5YujH7+FD7NZo2LUDttxEqZZkUdzOBZAO+viTBf7f/XLsxK6+culbivoP+3gfD0/GniFPDrBxyUc/eH3S/XpHwb3fx4ce8Kfh9fv1VeuwlfdIkxawUJprVCXerhIYmiaFhwvmRY3/On6Avy7u3EZK5fxkYAoUK0CBj7KozKN4efdFEjSO7iySMp4HpMg66/GJfQ/Phr01w8HuGCwt3fO12efjl6dqC9d2Xu/DEsHyZRKJu0gEeulNYS9jArXyERHXUVYXVmrsdBwbBcyaCPI/tHmrfr0VQcXcCfob87IBF64N7jxYHcDl3Iezc7COoON1olmdFNAJ2eJMHxO4SHmp/6W7Ckhtbt1GagxHdoSTMz1jnbk30928O/9DRp8+uqIbdLBWZzPvKKqf7IBUmrNHRpE++50Gismw0SqHo2sjD/S6W9hUdF/qiU6odwr+PeHjk0kUK1PveZNIzOY9XoN4r0oKIAbZXOOeAaDB7/Ggk+XYZTHKB/fNLLttMryjk80yoEHAEdp5/03Ms2uSCe+/7SLc4Hjmn5cig/CRofdDttmaZb+rYi31F/hJA1vn9y7+XZ388Lga2BjOEhpFB0po5lA6WGzrkFYlXFOrFobxMVPJdpsBjwBhqy7aI3sHbtfn/0JX0iqRCXVaUykTNzkTCLZLeK0y2eHz7/TecQ6LW/Ry8/HVgG8eH99wduOyFXPvN3dOMa7UDoFFWC2tT9hDEMO20+6E/bX6XnazluQX/Io8QNMOg6Q1IK9Qm+BnABexc0I9uTVMowQTwA8CjHtCs8sMqt5b6bdc3+L2NberUfetEX8LdVHyRj18mw2TiuvXhElYdWJgyIqUQg3aAJvnQ3SX54dxPE+e7q+ewb7laTRfOSTLvqreRnC0p7/A9BGmlgAC67I0pxL4v5qEqCwgVc/CIJitaK9ePfx6Md3w+1r9Z0HtMLjLna6xDrU5+IPUv83Usqjbhl1gGM5WnmYgBicC2GL40iAGIhxGbmHwH7BjHEV5qgiTkY8DaTNIo3vpcH5G8DWhttnqbqRXUiYJk0+DqVPD5oJGwVIFBYyiLLDzCYHK5fq12cZ0DiqsqLjdoT0iqoV5WMCfTHscqEn0ftPq4Ow+w6aQB9u3x1c+MoX6EU1C7V4YJRsSHKlE6W0RI2EVcaeuXphWWRzIN2hD2UcHWQKSF8KrWMAC2DblY1erZ4dXFk2wkkopMoWEWLyICqyJnEpca98H5YAcJgZn/bu9rvB+cdGGwVO5hNmlNTL49kwCIPFuB3CTmLAGedZ2dICWFtv4hbMZNJiXtTfbCPr6BHbxA28CcAjhW3cCpgTDO98GN67M7yzMdp5tXfrLDMG2nYlDEzgSOviDjte67D/YmjJnifbe77YaOTM94ixEpizKlsYp56VgKjaKazLsCiyNrEdV5bgYmwn4VwhM/Q0RwBQ4Yr/ATjsOryTcKXdra29Y+fqY7cGF5cG11/ymhcy0DSR5garNk5h1miwxYVJ1Gzv0/Ictoet3DkEY7iGpfW1pd2tJ/WVl6MXyMO0rt8IMzHYS2WV4CpuFVFcHUZeHKZhJwiTsBcQlC7nohazaBi3H3AIQboi1L0c9whKb+xtf1P/vFVfOIdvxHSA7y8kSLyF1D3o5aDFBGUjJvtDKVntJJqHxR/O9QyaRMlMbAUTMsT7Fkl41ZVxlRlyPPe7ZjkCiFwEC3LHw/gvoqf6xWZ96uf61Fr94mKzPnCuCvjWf/+73xXwpv8tSuZ6Ieoh/zymT03oUp9XokQMNvQdfATJIdCE1RxTbZxSs6+i4esqpqX4SgbCq3xWdtSkEmFKgqoE0pKCaw+7O6Bu4NyD5IZ/PfDrA19DvVMA7yQwmTKG48jUIKM1pCDREKIHDRugsAkHBXpwNxlzcE99jMcgynXUg0+GmQwtNfCOB3a85qwpB2x45A1r7INkPJghAED+NMS/Cf4p8p5mdapkN3HeEORjQtEXN1NkYkOQmqj6QiVPGvnyZx/+b0yfaja4fO54rc9fp6vjPiPNPdaZe9t5CldrsrQmOysavMxjPcZvGpzG4zFFCMvvX1g6RnknLOL/FPxZoI//0+/+DrobVZ2qzElb+szv0nghjb/wG6AF2LL1+R91izjp4Fj+7V/++d/97lArnIOeHvnd//V3gDyiHv71KrcPHLCnA1DhwJ9DF9CUhYNKTH8VENpcyGrjOhbCOISuDHcvsj/AEKgnAZgAGLFMDOr62t6x47An60cnB+u0CQDPWnWqr1OhjUzIhnDqF2ONNuSDa9YTEdYiwVskIoA06a/OQynJh6qTM6ugUlBpG8UMkz4utRCpITfYIl3+xqv6yvHBjbODm/dlWvD3AZqB5uUFXTP0EjALiay0z3yjbTRfjhuyN5NW4KUirWojisKkB2/WDsuk4v2EAzEzWfzpq6rDakhEivvTlOAMc9bBtyvAlUCjHp14D5iGWWwELZVVFjiCE+3KC5EM8tpdqHo8f64RYMa4z4z+4NulsTpJtxN31WKzGAJzo6XXeBBzBpCtPn21EMT9p9hQff4O0B2snBv8sCqWPKDLdYht8eeJ4d+vfEorY+jEa7CxAJne2EQVSB9UoNmqgC+RBVazxI7Gi7NZEiiLvNw/PkNlm3Ttn96gKeLM1dGPJ7EiEgikMtU2uGnk+JVQHRC1cfo31hhAzaP4zus9a2/wzYfBN6IUWEvwboA61LSYyWty/8lO3SwrQ4YaH++AOMbBE/ZxkPQRWupvYfSwtUsvYJeR4hSilUWJCE4ymiHo3bR/XREgjXBKK/Ahp2nM/XaGJ3/a3abV7QgkSVwWosdFec7toMJYiCrX8kpBZSycprjahragvR+qFmuKw/Xro5cv967fIjR1pABN2qrruwgxYXZV2QpnWf9ofBPOx2V0cCbDaVqrUFvur3UXZS8hT3xOIzhcfTFYf4ic8MW3u1sXWGALHWSDTN6kIYhg3Mgs6PTzODvwuQDqCfhT/u0YHdB3wuqwTy2IC0Uu3ub/5VkX1nKDAexuXq7P3NeqXJcWVyrsFBRcVLORnWdx3l/FMRF+GsbeN6F9ASCENu76HP57v61v82Jr9PJk/f4avxD+nBURacFkVKNNn7X5LTJvY6kkZkNEaSAQ44/XcB5BLtXLZ3FCNjb27n7LcM215DM6eq+iiFpRiocqiGhxZeFLUSG+YAcATS4W16N0gjCLHBxEB8rGGXnHvVtP9x5eRgb+3VK9c4rf9BCQCxYQdhGxalqbEyLJa3uKuOI292GL3PYYW/TanyrBAIa2QhXOISIobgzZKamv8l3sfwltH6GZPopjgWaAIvh4Da2TtoZ3N7ZGqxdhROorNweXH9t6zrN4PiTLnTQALVST3ZmAKNqXxhdey7zgJ4AKtw6rfhyraNMNrEKmONpfKXCfuE1Cjwpxl3AZQBZ3dgEAyXvlrcuAi7w3naWXTOJw3n9Ho+04kMhv14LPnAyK6W5GpQT0zc0eAzFusD53aXjnhbycNEkWCmBGlRiRYFg89ODJf1j6hJwd14j798sGN6offW8MCdbRoTjxp+3fCI8oYX+TghQr4vmIAdV8EhYs5SbKkOVUh2hVHqYDDDL49Tf9cUO4B7yQeUUgumN9+sfBiVO4d58s7T04yf0ZXn5Vn9kC/mE2cpA62Sx0rZPGeR7OiGZUHYZJOgw7JGrRaWyO6g8UtaxfZLrvr+UA2Ek8Pie74/sbu9vbg/UHw+/ovUFM+XT1cLaI8EgAqWTAmtt4dBwTTXgrUEoX5NRklVTm18+G5zdxKF8+I/0e9CimACASrUW8wkFF7m+1hapHErp4hA48EA4Lyb2bL4ZfXwUszCTLmSprN6hVERDC7YDrByY+yBaodzMw5gtyEEey5h4fxP0JIHGQZ6mYRVKpHadBnBpX3+La9sAjNvjmpVCiD4ObZLqHnYLm+1iklpjSO1US9KpuSsRp1YdSClgFxpna2jxMC+PTdTwtJjWjvrxNC/0kqxkoeYH4EeluVuJxM3c4bIFOLH1eP6gQrloghnMeujfaWREDUZMG6ON5REf77ZAIwZ8gLNChgYmhJg4TEfXIWFwoxN578A1Mxu7m2d3tY4yyO2mWIw+Ou6UQL+Kwp3QLNAXLZ2gN9I6ZBmRHvnz2mUH2qEiiJi06gwA0XaUCld0TgK2OElsjMfCmJTzp0zJZfHbOIOWV73e3LwNb2t1+TGppNgtcP4/mI7+72gL1Vxt4XnVtGcRsmNj9+TZPf30amRCA0E7oEYMNA+OYZx2CC/SxK4xz/SjND9JhDoA9XEUsWq+swTaHR5ieQN88XIxKnNwMlg+sZ6CLFPOqExV6GJ4y4ecwrggMxYb34jZAQdHc8qpggtPMpGP6vunfRtjTun1Ve0zJbmq9vp7ra7amzjpFdpxrN3j1F9DomC7qNEP3SQQxNY1a2s37vnI2oSqN6UdOKTJFaEwFGtNIGrrIpBri6x4NraOpDDTw/yTi93G+j/D/Fbh+DNQDZ6gOR+1QZtLwLr/RUttfEQCl3YqYRNENgNmElMwNxrDrGGodB6w+LGtisSYAc685hvimAj0fYI1jq3Fc5YOqaYDqi+t4fzDTQDIMgUkIozx8E7dacV6K+cYT3ia2fZHNApVlqc9pjcf6clPFnhOWJihZqokpH0UYSy4+8wM5AS+OEox9A3zhpWLLlzeelPG7FVS/XGqbjLFO7gFKJgnDr2bCQPmy/nV06HydBIARGdx9DGyfkJDPnIkteyLeJDqOTINTirG3SPOoLMP/gt51ZdiJ/nHcyjvtB2be3ae22HWnfWsG3b/Zz6ArteYOHJBq6YG/8Wy56LMXBuSUQuhtrmplgFCRN7I3Hx8Ru+L047OjaOsEadr03at3TtSn3pjvHjRL7kvOd08IQjsxvG7WbEJKBP5OOgY+WRqcvOKIZ1TBIx6ijcdsLyBj3ROZW9YrhIbD9ev1nW8ZJbGdRQw4sDwRJ/XvN2pSeYRH/T45RTtKN+i/mVHnSEY83Mze0zfsKImgFp0S/Cbp1NWjmo49EzdhLqLHprCCSvUcaMdzaKjy7U2uyIxN2jHgIojJQNHALlK39o7dq3cIHhPV4FALNAB3AB0Cg25HvdgfVf8L9AH0x2RzVoYCceXzhHb2JRiD+tKb4bMLzLK4JtDUejxvjQEfHwM8PuWpq7fc1PkEuFfw8mEe5HEn9LoqI5KHMAHAxz2azUFh5QoA4qK0o8MDutTu+xXqPY1PUBIV6bc2FjZbkBNVPk5F111Xhw+K02guapMTpTle8JmxfhEm/ndoV0bdh827SxUiQRjT4YXn9caJ+sVDOr/yakdSkzS9rI3fzfv0oIw8Cbwiwh6EGwochm6jrdGxU6MTK6PL76y5HIXykUZD7ETQitPKcwIo/JJJL4CSvzVXPzMxNyjtU4xn3SVKhE6ADAkYBXkZ7R27Pfjh3uDWq8HGKZo3sjtPtIVuMO1oJixgFsu4B5syL/lUN6/asZSD3OrFBuzxaJhxA1pqiCEPTj0Z3NoaXD67+/N9cv5sF7RNQ4NH5FrQirq0u/2WCvEyaGXylTWGRlryXxxrbPTy9PDeY2ss6rSjBATmoUZ7PgtHF5Eimo3TsKfAwPvKOWKvodMI8XNkaNmnyzGhobNngJuPPnwYra553LyQemLiUM+JgNCXUCw8Dwq/JXkhcsL1WwLcdfKetVSADE+iaLbRFO2cB2TJi2kZwGt1CLTgN6F84ZezFzVhRmSl3UWGotro4NgTQI97Zy4NH21xu5GjsyBUPFdLn7Q6Nvhlzo/XNcMfAXbwrlo01wdusz6/Mzh3oV667R/ZNtvG6YzyGO0eASpxHX7hsGtPHdUN6+Wr5KwQHiEDQEXfC5GeSniplKWowyZB6pV5fYVBQ9vP86PsuiH9vPJud2cVQDcrilgL2LA6gpIBMmQYKQ/912wB8ojZgNDxmxLc3bowuLcslkcgom9P9ND9dp5AI1N0z44wzq+6xzPVvWNL7BLP5KCjUdF0nEWnZLJRguI8gx5kPBqk0zUvYrCDJHku2wTWj94Oj2825g0Yb1uBJ0wa0aRBD6c2lNuNjwZ5I9wOo64RjEp4Z2KwpNDYbsbi2PMEY8/I7OPSgmfcJtbxbu/4MdZvnI0N67KCM+GMyB22AiHvXBEb1NkZ0aiLM6IjbK6d7HX5r3fsXEhF6GSo8YVGOSuwTXbEgxLxaCRbD4l7Rxgg2ujFjhEuuKKjqz1GD0p1ZpooIv2WDSpkKEXlG6fw0o3RiwejF49A9abhgCUXaC0a6PkcrbINWtPKxFazudAgD7T3Hpw08sAsD2XZTKMB5/3Ji0Y3zAxIopxunhQVDZt8YeQbO4mbsJ2EK11FDlS2HYVbyZNyjL7agS/e5NzTfwfpPS6UBl3HTchg1H/KYlmettoepjUkq2gesE9mnrVFBsssjwElGiVSBfljAN/HadRho4mB5Ofkd3fQKKNwX9niSWTiwUJpJukyYe3FR6zTMLFhYTxba4UzwUIy9yvA77TqdIjhKvvov4H79wXO6APloPevUyKYWIdPEn1FAglfc4qE0lZVYpoRERQ+VvtYkfQUPFPtnErX1MQ8rWaKPudpVgAPqrwUHzWc8IYq5C8bT6HabxKnj6Svf5gasI+aYSoFWeBCc6RzeNx9JFcKNyaDby7LmPiQ3gPB0wGxwWA2tDWAbwOEerBzHNkqzPTBpUN4Pnz0kJzDcD5081BS3oRMHh4zGNbAP4pXJjCKwRKHRhxmMLDgowTDBoYKpshqBQVflM4imJ2wdFKyIRtNKnryUMWV/iXOCG8lTLde/o6O1my6nURoSJ9p/LQhBYQrt8OcjxfGOTIA/6N6bWn06sHozNsJNq8T6Djx5/lwkwn/FsbosTXfheZLLM3xs/0NcfyT/7q/Ic79YIohrlF7whDnvjVD3F//CkOc9PrAX3uGuAwvO5FnBZmi6PiGSnK1QimcSftbeji0lgqaeflg78RaffoUGXNZvc6BC9vFqhnAWx5pLvApo2eAWPW0DbnbeOoNN8DG4JlwCmVgYdEMaG1tI41Hhlb0aQUtGKTXopukWPRuXR2evjc4dnfw7jXbXTNU07XW54jnv5F2ug9lvM9a9t/MxV0ainA+SqyNIva+Syq8VEZ7BloCbnAwsPGi/fehXjrDY+VGaRFPsctsbqFrbgxQVkZQFHflhBcvkLmGyO6Dh5YJzcj9NLD2cJqPP+SGsImwW060AEoirCyaX7ziBrypHaGmRSODd3hI7707+OGcjElR9bzRsN/LY1HtW1neUOuHvQ6gqYAq82e29wQozci29umrI0H88Q4N1sv10auV+szW4OzV4fYt8hgNoqTdjnOfGKwH0BFo62cHYzzbDP0ypR5/XDoUfLwjag5R/vnY6AkZxYhmQHUMqsZ5/2lZ0AUZfozkCYnZJcUVvp4I8HQBf7DQsyMqqkwYugVKdCZ+V5GWhgksY9yTv1yqRLodJfcElKxkTHv5tn51Bd0Tjj9HSYQ/bzRiO1MmI0c1DE0vchEf79ShhS7tbx6SW3UnrtZ3XtkWShYXqzlftv0hzGcikhMF66DRHHccdWd2x9gq0dxOl+PPXhlsbNR3PgwusF87UguOhEUHhlgH0b+DzwNpSl1DlzMVTpR7UeCmXeSPFsmb0VMOYcK7Tc2QrbTrpXeHf2twZdm/8ncolKmCDZ9U4vBPCqF7ZPa5Kka1B4N7dM4P+2kB/WJEfQAOV/A1fa9m2IYfFHjE3yw3irDOqwIxWGG0h28fDJbJhIzUg24LdnjhzXRW4qoifmo7z6es/B6tJx7LYZZM1pMG11nweLPSsdH1CnhwHXn2OJCTQiY+Wr042rlDPSea3uii28IibKywZL8F+BzwA4olvGBhZ4OjFxt8PFiie9jMgpDoP+zC/gkdlTAFyBb2PFJ4yaJk72KPZP3oKcBio3oky/Osh5qNkf5c79Q5x9Hj47xGL4u5sKvRE0B7D8uAnD6MpJSh7wf8sxjT3qJLhdnHJeTXrrPLl4drjniON3Ca5HnC2XnDWwLwb69qx1baUUOX570xviQGx56YN8eUhVGmMbOSyncYwdOGXtVh1ze/0QB/HLf2axvwLbzks4Wxdne37vCtKa85kAvCgNGKSYb8/ip5pPABazpWmuoJMdn0qbVPyy29qDZ4fHuwgWf+g/VHcmMNbVRRoi823oLz/W40ov7fYy2Z57c2w27f0oDn8y27t6j0Ih5whBZJKTQVpVpsvLrxDsSx7QV4gtqR0GJdiz4HlYSJcDRd5AijjK4jGj6CKNcfzrLjmtIMYKf9SR02VAULMuQDpFoWEbtv2FfEMvGb0AvVwqPUUTSwu3lucBKkxanBh5NsiUpDEOWgwOV66RAlENMP8mw+nA0YejPlRpFP2wkPos3yQ8ii63iUzDV4CAjPyGcheF50lA1b6DGy1go8VoLs7fuLgx8vMCPxWchibOwfMDE6QxllKoD5niSN9y1+eVY6sme2h9+jlwVSC+ayucZqAaxALv/w0gHGg7EC9P4kXdVbJvXjM/Xj92PLpKi4Cq8S+myrxFEMMtBF/smn6y0SpmuLRCi6NUIn1RkFK+JTcQIiKKRcMR4iMVh0Ln9r6IF5v63RNxD70DJB34zdja29pWt4gHUCedJC9wgbu47IPXG/MQ6WEhdeS/+Z/Tdm5XRlrBV9r+XvgJtbM/x2s3JQfURfTkTsmCrka0LmzTgmcvlof4Kz6ul+05MgzGZ8B4IwjaoZnzhAw64Rhenw3QTaWdaZbj/zVLipaqEJb3oxBwUa6thv1s3GlKc89NWYLyhKph4hnTGFRVSML2gqY2qGpxA4PcDQv+H+JmL3YDoxNOdDNHzyzfDxt4zPDIR/ETk7wDwGlc0spGj4y8jYR8U+2PwCYvXQ6j6VpqwJHx4annH4yCEXwywOV/263/voZgzXfBHRjIGJJoyYKtxNrMtNgKY09+W4E+K+gG2IVl+omiz1pKjeKnYi08nIMdloUtGXhipN0LNR9nrLEyUmQkR4+CyeTrfGZYWxcsfEedi7STwPPSN1PHGfpzBnnyd7/Nhjj1MYo7Etj2d9xgAnP/nf9zXAeT+YNMA1a48b4LxvzQD3V182wGmvD/yVb4Ar46qHMicu9B4Lmx/oTDjIkkYpnrsf5tNQEq0Ue+oa2Q8G6+cG51+DfAVZMVy5R9sOwcNCUuWlcyXNvdt83FCRwSbJMDSfVxqRq+L9GXEHfd4trKHdrdODh1/Vj74HsccNAQhbREjkmmL3mVYa5rOATNMw4VuD+Gkm7Abe12a1iPurZNot2V4xvPW+vvudnDWG0Ry+yCGqMEbfnHV+HTmhgvGLdLHnMUbJy4G/yAjkYv9HVcSVpVQatYOGvzOOjLWYoNiekdAbOA/kBw3jBD3AQEpnn7OeEsE40V0qpspnCNAqjFXWC3oVu0BgACn6AYZ7insoVNiTdXp7Y2144+a3Q8qJRnsBnjInlwDGi0xppaupunNZbx2e/GnwzQfRW/naVKhhQnq6jn1a67C6gHeOl3eECek4Npu6/260cwvXmLZGi7nRmPgG4hUEvdypVxJQ/3DXO/G0nC6wLLOvtLvjCXx/dPzl7ja5YOs1z4VEBEBQFlkvcVEWbZHQt2OLxHRX3ZXeW5FfuiyKlXv8VvX7a24tSIONaxW+K9p8XMZpPKvx1gqC6+RdwNMCaH24fVdcHvmX1PnmpDTJrI+X/idZ4OP0odd+E0W0ELhm9JjObrQBbISKznWzhQUoOkl6jU96f5Pgmk13/YpC/eHdU6n579DubNeKWl4z3k2EwGts7E5CMxgDbUm73Vh2O3jvlJty6K0Ifp/GUZe1G5r0dvD7LsWb6xnTDX45Sfj/Jk9qffMlDT9y0KBbOft7ZsTIFhf5+kt/zZSV+uoJtrEfsdoMfvB6lgNAQa/XcyAo+H9/vkjdYCgET9wNAlDw067uk9AiazI1KtKSXu8/yy0vcldngj89HKycY2rAS0r3465GSElJcfpDdDTG4WG6Vhwe7D/l02W5DKw6EwmWnBtBhYl0ptGLp9zUITxIQnWsjPBemlhwZpR8JhpNOEO6jL1+vfwEIIm9fpJER7S2DOLv6Y6TDiJPpg4izQKPIM8CD1+3st3TFT4mFW2TrLndQRW7IewNqQcIDxeltJxByyF8l7F0JfkkZkYYE+h5/w0LVxBVg28uw5jg21xDmRWBpvonrGkMvCtcm6jRDdE3bPjkCvxNU+ZXYcWXPvrrkRZ0JiR9eMSX8PW1M554PyI4TXcIU/Q2iFLU/UHEZHNcO+M2hxIK55KqFWCIKAKN9MSq0g/wCcjgyNA4o3NZ/BENHHvXb+F4n71KQ36svnaZ+jATLPSCYi7jt46QFN4Y/31I/v0OTBVz/0cTRjnKAqCUJqMnR5LYSzxPMQ4y/BtQuLSCL8C4mBQEzIgnY0gKwGP03oiUuY7CDseThej4s66xhlTktWYikTmxEOfJ6cRkbHdyHqV/GScaDDaq5rw70/jVP7iLaBrOFGePzRt8G1zEFtk2yn+XSlBGpqsmvqpstEeNZRNl5PiLPjgc2eU+veD9uCdB+OqzZwC+oLlj4/ze3Qf1+k29X7OAd2Rcs/5KDAMWP3ySiio32sxgusMeB6OKKcACRZOmV9O4eB9OoUxbucdx8XggsXJJxw4sc3r9p2h/+j235dMHbp5Wob/gCZjZmgdAhhyhg3eZAiPuAxdQLbKu8zZHJbUwfEc+2cDkEjnAe/Ht6Bjf++Z6PoRliB2MkR3D21b+efoecJQa1ESvAKacKXSPed1DKUydKilYDGzNhDxOM+yGGYFaIOJhbgcrz+t7WyQDQ1jxXQbCTLC5L7QRh1OMvu4NXUGuEd4gsHqsHd4jjSZQnggLBXHCXNSTKMRMnUQhlkoSxbFg4utAh+i3UmQwgcomGKf+/ZTl+t7xh3TYAK+JFPa1r+H0qxriLQgr4Cgq4uv54lt2vJmqb/2P6UOOiqo/qnv8eo2jqWiMg/3x5yZbU4a2L8B3cFJAdhNWK5puAulJzDsNTDucOwVENy4nEbQcA5qyDNdYCf/mJaBLfg9DlAL+CDgwWCGMoiCPgQ2jOu9rxVny9VhlwTa0iLsMePE7xiD+d4RbaD3TMpYVzKJb5DWJaRbQTjJnZFVDYekkpMnG6VKx8bDf9Pqyakw0jD3C1j40ISLsAuVw5YKJCL5DOU00eOya5mpcAKy8muT++zPoX8lAG3yzycqmsMkm+/IZ1wTTIk4Se/DX2JQwqGn2sCxG/8//GvxZQF8EeZQk8f8yaRbb93eedexztMxItu+PzFb2l3/cz1TGdfMDB7DqkQMHqO7sgb/8o7OX9eKyv96JkmZwm32KP12fQ5h3aCz2z6vXe3ddzLoyxnqNMHyOGtpd55oNaJERt8jZuGSNvkTOXrlgTRS9SG+ElDFIWEqYwfeVsyLrtqAoc0UcSR7XLEq7dTJcIIv5ehOXLSCMr6/WV0jXa4XJXLDQbZXRoTHyrvuOvpUJzYnuM2G/+0I7KA5lWaLumXP9p4DdxbLHj1kRtljoxGSi/HSZDg/ePh6cQPaUxIBR4JeiaEsdEKaOQsq+Dr5O4isk8BnrB5m+Z0jpKwj/sVU9z6uZ0FkbIs4RkVCkFrZlsmjeOj1aOo+RCx99zzIa9mXStDUgbe2dErb+NamOUVRy6gJ2NEzYqlrk4UH5TEEn2Bn9l0uMZGaJAVxAkHT3w+D6Bz7sw+P/bssjFBQhqNgsU0HLXqWAzSRdAVOwk7Oj3X+O4Z4+3kmM9t7dW/Xpd8QxgG5QFtVBQ0WE4n+vn4TfBE2mE4wzH2NBEQZ7J4uKpslgoOTRM7BEhJGjTudmhJh8UjEwcTKmxHIuzOocYC5EpQVHc3VnDZzzAa0Zdt4wPL45WDnHEUwOoaOJLiJKRUGEYLDR6Ya2e4ZeXwWoFuymwlfemnTrE1eMKIZG8Im26dajdtceW6BKUJRdjMPWGyO3c8vILRSAS9GH5BCTm4tLNaT+pg4ZhVysZDiEGK2Fjl5cUYeLYBrmArbbjN5drT+g9pVWeDOjzDriyt+gEfW0QCjA1oDOLAoR3BQ/vmI6Wccng5HwyiDL+aQTIzZhAcZPo6hQHrJaZd8MRhKjlzfqV3flOD8vgzBNwyPSsXkjl8d4+9goSeQFNSzflaOniC/KKYGK7ofA64TBAn1Eexhe5eRoRyOKYoEvkabyEqR1kptbwJVBVcRbkgmbMNDAyY7jS7d3f77NVs2s7REo+t+3qGIRtSPYiLTwe8CLiUVtP999j9boYgFjCGULck6ANyLmgpgAGnDNLt7uy/5XqYrb/dNXVReDdnWZyOjF6u7Pt+pvdpTUQtRt2HHCPGw19OZO3GuoteT1j2wK1pvgHdFwXzyqT51U1KPac9Su2nqlqhXEZKVFkthPcq4c66PfQaxrHQxbFcadD0ExothyLdjxIX/Gm1NiUmRDwiqFM+OohoM3N2CGsYsXjg+/RhGJtYKFxVCyoYR51aqAmJMcWILU06ohO3zCHqNnuszoiaovOMIuXnTBK2BFzMfjeUh3v+QsgsKfd3GY6E5TBzMXkSn01O7WBVRfj31fPz6jZo+gDXqh2N2UsAolpBvJChdCykiZCPNSoqCyyBkEM5DdM3wlx7MKZgdd4f5CeCY7SA520ZFwjKobUo/o2JBOpyn0/KEEZky4SUey8K3WhQwpX8SnIC14cfGQGuBGj3d2N1Yw886pd2yGm52tyiJIMg3pSMRlMJMQr+bJcEIxEnKdRBLUSaxsYt2sjOoUYGbGLG1aGdGowJ4BZGSER40fhEbGaC7zInNVkSOYBtkCPP0jxUQ+4sK8OXpkCAViRhJN52jfU5p0PwyD8BK3+j0DBK8QWgOxYmGw6AAAiImFRUJirZyDIjat4DQcAnAe0G2AuWjBc5EQ6vwgkfJUS28SZYXdJ0pxwIwcHfRMkiNlvUEIVHafCp/noBW+abrHv75RVa08XNGsPGy+z/ZJ2aAqgK8OeHqAIX8F/A0s3gDhDn0b3nYw20PHBoxF4M+Qsy/5ejz8avTTKcHDDrB6WJWmVEAqdo3AqSBT8WxKOIWOh0qbgLEJFRso8bO6qA/cxpHVGGRr4BcDLw5ITQAzQ1D71DTE04ApHkL55RleQKNAtKvb9c4pak5xiQESxQ4Sy0Hhx3dLjB3GYYNhBpb4LO6doBepbSJ7TFr7glqktAlQlZ6e4DSZKQJTFkxFwAMGKBF86YlEk4ROCKo4EUniSxETICo9mkxejg+BhxSRBRP7ImN3PNfYLYEsig506p0w18kgWBIhl3ibMjVRc9YLt6VtM8OHObf9ae9P/xVziXGLCVsp/j4A5IExTP8U/Bl8rIrwP46bTD73Q7OZfIGaGE0+9yuzmvxxH6uJ/ODAAakd4yeo3DrwR2c2idphK6cQFEXWyQ7SgFAJPEZk+7R7ORTLnS+S8r2cwcrWaPUmid9eCCKSKgoHCfNoLk4oRDwRyjCtCN9JooCuSiygSNcqUYjg3oOroyenXU+oqgTU7P9IsQTwbSRpZZHxfuQYFO6rrKXfILQqKSyP3Lzd3VofLL3ky7eH4FeHyHFL6nJDYdyCSiguG41geSzF4w2kGM4Zw5FxC3s3twdfv7IWiiMSx63Xf7oY9njIgSeRER+qtpDp8kUeLuOLu3zJaJP26xLF2b3+oj6zVW9d290mJ5EEz0oAYHejXPgOB+BLI2tFW7RbtxQDRJrTpnnHcTOB+i1yi9RWfXxNWtTGgqgT5lmp0VHiVs56E0wQ+ed5RYt8hbDDCajwD7KTzSMYuYPy6axs1Zs7w3NPR2/XyVUH7VaAcufmsm7hMpkCpbajnyUzeGSZ4JhNbYCdPMwJkhvZu3GmvnfZGkmPaNDqxSih9H2I+3iJYpGUweLiMgyPzJFYcrxBSP77tx7ULzaHHy6T/yHOx0JZhZK3E33I4L8E3XUlohMspyqJJFD0mySgSzpo0VN6H24NfrhVX7nqk8xjjW0DwDKfBdUnD9tkrNMCpIyRtObkrtLRgEPjAXhrIzjgyM3UwA8rsDLrrZv1xVN7dx8Qm0ESC3l0SGzKCatU1og8N9oYI0wGST12MeL1yis5fyHiARESFhEfhVGcw1aidhrOhwlfmqCowNyUlnJbaLf6tExZ4BbJ5E+QlHBJf5MDG9wcrT4cvL1Zn386OvM9yP3RztW9W+T4OkNhhEu8JNlOq9CMlSWgjQzmq9mNImxHacZ3KH9NT8QxakaTHI31pP75Sr2xxGmPXBeCNFaxhowu6gHLrAqfL0yUC2/IJBteSy4gCPTbu35sd+dEvXGcASDxBsCNeE8fKXgz6xO26R0rdKSbU0vkbV49+t7kJnRtnlK3yKlekYlRqe2XSp49db5eozhjbwi3vXgNDHpwfWfvOJ5oHs1mMLoixfIp5BYL8FWmWRAe8FoIUwx0m1F0Izrf2TrIIkziINevjwHZeoUDbRlVOnQuRYIdjPJODJSCrEzM47kTo00VVKQYI+QQzzxCSSURVZWUboeOC8+vYnLJ+8cHN25xE/hzvG1ZCVoW8hjgkawMAJiSDoXaC7nEIwgTTae7RK6+vI0blihhgmDBkcosyYxE+aqiBgumy/uUhdB9C9sHg8PmgbFNZEUUJuJhfeox8ssbpyUUGaU+TRLxvTfWPNmEhuTk9J0NJr9zYndj3Zg8Ehvj8dVhShKAojXlUzEuSbwidNSk/rL7HlvJ6b7ho1N7N3bqO+v1qec0Qimw7kN4oNGUH0yT/ZOqmCJgRV6pR9Q8CUR+EGlY/iw/kDRmtxaTQTYTlRUntYjbdCOAcOtMiauDS8WoLaNNty/6W4ssmYbLJ0Y/vaHzW/ohjvVMmWV8/p7Nx4gt0VriiEvhVNqbyJ9KJj06/sMubVUlXRAtEU9lGJXUP1jkQBmUUMb9Y+Ut+QLoL2g4OUyAQ3hq8PN1DCB37gnAQjKjd/HCNFBQw1cP8GyLzwFaHgZUYYpzSoxVpOn718PrP8oFVdySUTwv/qrApIHBFjE5uFcRX9ihJKJSlkmZgxgYGOTTMrFn0ly/Ow1LsL50u77yQ335NA0L1gHpR0TkbJaRk7agz9OpU7otdnww6oOVl6NzW456qcC4FZVZnMzgGQdBjZI1Oa+c+Hx0MOcrLZfJJxldPJizXFrd3fyuPnaPo+u1MDNKPhObOEtm+lsYrUqpSZCUyVJ+BSa9JZkNbS/Ba2Ardz7Up17zdpJmAqSl9/kxRDbuyoADiVJYF4QMVAYzjLZUiX24ijf+rjGbxBstnNNw9WJ99jT8u3ftJ96x0EZwKNX0DUQn48QIRDJibu6IKD9nGszPsb7PyAtAi73mrfOomieDLto3KN4oZe78uFTAQpmheAbkTPPT7sa5wcvro7dPNBd4GBizQrhQRrMO1ekDXr0pOTXGxyWKS3X5VH1jtf7qa9Q/cWtEGJKu5WN1sblJRIjVnKzhCALiUvgTXtLJ2ZhPvRW3H4KiNJh7N98ObkKPb4+W8ToWZqiFDWH4HOclQkZtKQQLYtoCNugQibENB1xdXRQU8/bJ4O5xzjwArANQXCvLO2Ms1Th/g6VOlwfPNTgzyALgpbzLUTQ5JJ7iBTSUA0jfAf2s/5q+4MtkQCvTW0MA6V8h40ESJKSK6Xa6Sa10ikJqaqgpoCqcVN37LZplQ+XzND1f3TIdy9eu9OIf6zpTFRzTaewHYiJR7vrGcrqImmHaheoVtjZEl/gcwPdhvQF62wsOwf8KvDyJkBvAeAITj0HhBjg1SNoEow2EOBUderjQIGETD3pIzWG0JjYzXGag7FcAJLtXrnjr3mVGWgawDI5MwyWGRQSFyJmdAwa/CQ54OMAEv8lmiU8JMvncEyeQJWsNy8KpMtEXhSYExwRgQ+pNSCRfCjn54wSDSoWGPDBRIHJgugBQftffnHOw49oWrEjh0DLvZC4d445uzmArMDo2HmsMi9mg8inmUMKeJs2KUPpPAR2FtcLkv4zbEie+NQPitHpiNZz4ykyFf7GPqRC7duAAWgipztyBv3AWwiLqgjpHoaHI0B4l8sh2esrGifrbL5cqOnBdo7BK548Pt0/Xj24P7rxlBx+sAmPVE0Oe0OxFHkXxxSNVcJX9A7dPj15+5wiIeW5afgD0xd4/OYAlBJDYPxJAekqY6iScA2kcy0V2P0p14xs6YyB+xmHK6DgAU2XLmcObNYxX/d3S7sa2F686jWWD47EyngTTjXC+GoslGZkhuICzP2/iren75Cy1BvtpcPsm70P4DWo3bQ2WS5GixTxuj6m3Lyms4YtVTZFNBPR0EU+S3pSkO/J9eUDshP5BXlKaT2AGXQRbRyTg0ejl3frR13sPvuFzJhC7wDNF85dBCoQqsUAtQ7pydZdI+qMG1ICsDRmTtQFDQMG+Lo1PHCgo7q+J70H97YXh623Jnzq3UJqTDIA9Zo70WdmjVkaJ+hUON+9XpjJ8cmm0Q/o7EILVr9pM/0nKuchBV+8/RYP8YY2ZL8UJHmxj/jLeH5g68rDLRqU+OWef1Re3JBsVe+YwBSSBAJbOu49MtgmcsJL4W81GSUuvWrKNyDkXuD+ZkPEgjt7s5+P1O7QgD859mGyxVL2woNvHJDa7LfpAu1sO0GFby7k5yMlM3WoXQ0xEDFKWBUl/vZ0gEi/Z64UsSP0fDolz7dMtuiWagAY914vcNqxAJGBA+Ix9E8NWGGDUbXqkWwO4BpE9zEqarN2NY7sbZ/a++UESZEEVZH3mvIY0aO5TIQgPokfQsXYj4Z2ugvupZczauCCZ7Z5c2jv+UExGSIZOuS0DEuzjddTPxbzFS60XQ0cbReRoKGcEg2NLwJJItYh7wSwFBTRrelWGrhZnMByjQh1nKwiFcWDrHBAdnv+pPndJ7pAiyaCRvvDfFrWbAQQhX94JxmRggIWeyxbCnv59MSMi7Hn0hMIqwC87sZqec/QrS7NF2q09UqrSX54xXhJHrau7m6ucqh51khJ0Mz2E7sR5RqdZ/XXGTRMl/TfADz9dp91w5/3w8dfsMYY00HWl6xvAI9DGnPlbnhrWULWDwpehb93G35obI7yMfkYshtwA9iYJpXv3gAmMXj5WEsZmovmwiyE/AEczEpxHZwfY+/LcX29JdkaL+/jy0t71FyzjUMAHC9EhRUBEJYAP6DdKQrcQUlSY+bc5iDOjdYdWGPuwI8O/8nhw6QGlbkbimDEwcxtAolcQAxoLOIjTNkep/dou5ODLM8N76zTyqFeCwHJ6tVh4wk7KCEzNO2EnJ52CaRM97iv7Asr9lXvr0Ne9GztGm8hoJ0EscTfp5MgEuXjzgeBmb74yjdkcrJGpS7VMIg2OTO0VVQ4ScDQVJPTjOyOE12Tz0IeJ43E0AskybUmR2WfpsAkLyouMScbo9i0HbwYYU802rqBThir0JekGGsH5vl5IkE28u3HeS7KMNGIVsL14Vrz79AObtp7GeoHq7r0hqanArQAXW4zjWYYa/DHRsMPo5bjIYecGK8eI0UUkZlwUoAT5TZWxfkcPmZg4ZsxNmW5RfNgERl9f+U43Pa0+RwX015YSkc+OiJyrMY3ByytKo9sKI311SgvG7+x9BDA76/K71WdP75G7Ooo9MyzLMhBGx4/yoNWpF+iBrPKTCOELPXrCgpRqKQfMEhCJR6OgRzGb6Okgiiy6QxYjN07MsWZ9effDBXGyZkuHhGvy6IgwFTr81N/KNTHSd8eBhFcfEeD022iM2R1g/wJanwTX45Ca+KFCaPLPXGP25cNzQbPMCRw2prVMq5jBrI9kBcEK0nT40kOWvve0/GlgSQOShiIdBmsALw/iGahrICtFCGJJViec++iARaJw78wVloOGpTg8hfzB6WYVAOZpsHpWAIgu/lKj5U1iA8MDigT2UVPHzjn0hMNku0pO/csWyDesVb34CaSoE6FO+ongE9OampCGT16y/QilnahCKuIawo0FmoiypmjwhIIFvdjs8HoY3DilnN8xfWX5yqWZQyt7Vie5WeWdPh823ivsUtyHZimy9SwvYGORxh+VOSJDEr4kJoSexla6+2D3wxNhRY6TKAvxuIcxDOET/t52+9pYg3EFt6Wn3f6qsn8M0qzXy/4jauX/efLa1+QPvPteU2vbRa/Jb80A8R/2veFVZSlGQsLUAAcOoKHgwH9wNogE3XFmYw32W5UcVl9LmalIKXsqkgsLsfDVVENo1Q9O1I9OouPv7Q8cS4v8frBegIe8sW1XAeCNxhiEjzclGJyzHsFW41y4Hl0Pe5O1n+L4CFTCB3JZzCO6EiAhTOuTO5Sp95hEwEdHhDRrkMhSjwSqs6LSrFFkT1oy24P1Rx4BdyLiqejoTxA1NHQrQm2tjbu8qaXX59cGb7dNS6dfOy0djZ0RnVM6yuMlHmFinP210ugC+xye2zS6UlkPERPKsm6y1kpUybBMiMxWOZYhcVb9pYpYcfyQUuTswFBa7FTrfZH1X1N6UdhZMdoYvZBjsMfq9acWeKxNV6aknlzPxXsmvf4WOyz6TxwOguOYkhKxfAljGzx/TkekGAd1pldJrqU0m40SOYr1yGWz/acTxZ8u9zi6JqFiNW0O7y/VV94BKNZDVSSOC6o7p+lNk2iOLwNG+oluqfApOFlk0bmNMq6v1O8e725+N/j6DFmfSRGYE6ZEldmF6knYppMaV7SY0eUBSgFLVtRFWe3DrY365/u82okW6cKtKLZjRpAQsR0tkBlYzbHYNzbGQp/slApTEIlZGyoqjqLzS0FR9E6CodDGTACKMhcZeiqybopxPjLoO0ac64mY7b/G0Kl2GcIbKDJHabyPtZ4NFwLnE28GD76T+xE9EH2CCphwkHGUdqEKj5HmCFfa6ldIBNmvEEmpU2EIPcdbl+hjScewFL4ADYxUkojZDC/pIRoWf6U3pDtJkE0EuI/fDz9cxqvqb7eH1+mIGUYjwAgas3rETPQ4mCh91ECijpZrBiUiUWLC2Amg44YYtnc7raA336d5JXctqCDM4446G3C0yTUyMrOT6M/X63erwxsXdzdQdc8rzMCZKEjIiABMGmZUzIMs5HAXUJZEAcUdsRvf/bVOgzDq8ssnjTDRJL7JZ78CVuII09WhFx8a/ljNwugGVBhTaYtLAU8FiLNB+qiv/e77G4C3Ry+22ON+IQQlXZO+tslttf+GhQ0l78FkezEJCIFo6CYoRioRFT9fGXy9OXxySSItoFtmapfo1RCMd2+g492Usauah6HXsIeSyHmzU2ZCCiBIZiV2bN87cwm0lL2vXtO5MluOF9A9zjwckXDAuZuFaKqXPOLDmsMZCHAOZ6obuGRyPVgT0CEObZxHakaDErnb6B31DW7+JEd9FTCJXiy2EtrnSoNYhKvvH5hjuoI177j8/a3djdvkiY5WYQBXLGvQnBCSPMA4oezuC0ilOhyXkVCkxHaxRmrqyPnvcP3D4P4Z4Of1E4SBnRAjVoXypj20js5khWSZTyIXT0/rD15d4ZpYKygL9VPsJuT3F6aUX5LPkXP0etRrd7tbW/V3Z/jCHWaCOAJbIhOT2Dy5daf4F5boQdJDPi0vBp9upxKcFOcpFaH2+M3o/Xa9+dYIdVK9YphJN7KDUTyv2YikA/Wjt9a6tV3AIu6/6UQ0gD0yrv2eCjMpo+Ht6vvY4Rq+DR2uITG03cZFpYd5fMuxsDDxBWyVIqeiVIqIGIWEF+sJ0NvduiNG9mQuozhkeo/EKJqKhve9QrF7Ey3f+I19U/u30FpI9ZCCQwzolQ7tmXAc3FmkJI7OfL+79QPBRP4+9q6dTdRWFks9UZkFnZAgzfSbqBVrCqhOlaDfEmd0ws+lniXFEkWab5EO37/YfU+R+ekuKccKyO02KWaEp1xNFnaAyYEim2YzjSgEerOQ4g+ILYKoWa/omh5G9qfg5XS51pga2zCZm4Gatbv9k4WpRNcvYWZKAWMNhV58oYmbkxxgiFJlNu5O3n9XL190ZHvhPj4iDcw/CfblpAAXPB0L+FjfB+gOnQsqR/4jsPzmTwbLrcp8JDXmIy/tOG8GGBFWP+lbHwt7IHifgLg+IvXwow9FyRCxyc4hZ64MbrwykOhAnSI5AXCM2hSvOailMEsQFoMrQVbKQRQ4TYNQhnAY3hjiELTRxBmGLgRXOPGvIp+jitlANiW7XnWK+YQh0w9O0pp4ZcHakHYm6VTKsYBT6SbWJZZHUySRSSCRPSYgTOR46fckXZwKFRMoedRNOGK5MHXiEMDVlUG8UR4ugoBZbZPnon7Mvx9ef8e/99mix2ClBv/YmJ/AzybPGv+plBqDUm7iDtKfi00GOIiyD7fvhWv4V3rtGq9u6c/bOD5n3tjPsrGvUcO3Z/z5r7Jn/LmzZAB+yrJWwT59UVHQntJCvGMfcRGs8BaecQCux9gkxHJG778b3N0ZbVzZ+/4qW47yQKqq9TMvUS8MohI6XrJOh4UtKtXfNqiv8gHKD21TGLmZwfZV0MnNEZf6R6RAR+TAG0fRCwqREQYVp2h6R8OxAjRhUVu/PFukg2hyZNiEFoZP7tVntjiZ5GwwI/ZMpgmqcx72+NIq0URfzXZsw6LEAuFe6ollZEcfTtdXMAko51JM9PIMhhRnB9t2mKvH2zx6tzcK8dBkkfttSvSzW0idRmMOdcxeqBHWhKZPjAS+q+9sq0xjdxP9JpBCsCD2iILOyv01sZDn0SxFEzwYxnxJbAsZNXloLvokXww2Vuu7y0yVFgXVbRD2CPqkxqgwCf7hgh5GVK3+OgbNQBcD/JyXcl2Xnroc4pMlJdrQcrXQ023ha22dJBwOup/6anhrGyYIhkKFZ14WcQdj1SStGOip5XQRbbyoKUgXyHWn5Fs51riTYTTevJI5ZBY3goalFeZXRD0gGrpf2DM6Io94SUM6vZTzmWbEwcecpY/d3t16ZJ7SVsn3lS7QXs0ejAEfMTnKBSybVsrf5aH/DTnToTuumGA2yVyCFyiejD5cG+0s02Esquiulhw2FGn/gazqHuaZIKWDilfHi1GfLAM+yLF3pNOce8M32/x2hCTKYgEjYHrt/P8yfvHE6ClqCLKAkjGz13QrS9gJRs0mCWJV2yzkzoFtUlxCPghFMXrhETQ4vLK+u3FeLVgUjNQlpSUf7Lg90QwwtVhTSZO/bSE5va0pCUrTf55bS/XGxuAmeaZwC8ECcKO2c6CP57N2lmsSOzrCKSLQduhOmm0s/sLjSzqQPITMnWgUn1tG9SJQpSkJ+faP34iW7UMfAdCCuH9YA/WjF7sb614DQsSQUSdE5oWsAkepKDjPFTCwQm/xWEJ7vPPBoXDWDnmJKh6dqree1C8eMCcqwwiPejspM0XaSdVMnPbfsuFTW6SzqS0bM21SoLf6nXC8YDpPoQbqh8/qd29JvEkLNmI89bNhDjCFc7y04lndOiAJw5JU9zXMrtYe2zf16rf1/R/dvgkPBniyYJumkHBGnYgo0kGfFEkjLgoU+jmNUd+5NdxcMupCOViYDyNNu9nhLYAxD6Mc74iga6RKET7k/HQb+X9iC2i0enFw89To3UteQHPAxYN2mGlibglbkxpO9u9ikIPBZuI8ps4jHXKUQhJ84p8pJUoDPA9MPKw4w3eoG36hwsSbHHmC43Xh9XAJ4sNjwSG7RqsYWJ0Hgpy+oxyvJrjVbt6G1IR7nqTe8D8kyu5kg8na0UbWysdFNBd5oI0TVntS9eymJ5XLULUgIeWR+FxlrGdAAcYO5Bgho1Y8A9Amz/13YgLrR8XLHt/p/XeYOpFc7LslGuMP6SFIiSIRqVikbSuhxyY5ibvNKIZJcsBtjimGgbb/DboYpeiHlrQWWhO9pOTDbTJ/uUJKLcuFY901zMy0BTMz5QD5hGRlMswZjUHOkFBokkzAzgm8yWCT6oUBLbIxMNshnUgJA1kKQtmkOg7rlLYiOyFv8adVfBBa81l7GjGf2oe1S6AQQbRLzzx+DotduFSPaSg1B2gpPlejl0vPuH9UWdepz6blBN7n0GNQ22PN0C3jywS0zfJnFH1aqYXaFSkvPgxEgvuFAfMWZsauW+GwNO59ilhv2cVkujlhS0ovT4AQXFrR25+5emEQl+WJrjh3ZbeF3t5YktCZgDfbNrmcgR6mFM+Ip1ujnMa2n+7m62vez2z9ycIZX23+CmM9ySkznibTUGNMfxHlxSkYqjR4qoXpFPadr02Q38JUBG+43SF29Y5wYLLx4INjg8X7AGIfBZurAGy8DnsHjHbOOAT6OSw4BWca4nNYz88sLLtwbEfygnc7cAxJefCpgWUMwvjgRU8UDVX4aMKHEOPgwRfyDUvYJqnWHPMRExmKROffV7k4gjUkqslRk6BO4qm4M1nHQk4kXJPZ+zx+grX7bF2Ez7+itidrfsOOoZ8opxQ26fNIY47KGX0m5nEwj30Z32Km5ViLMhSl33+u1qDX75mJTLlWRAtKdsE/BRgu+n+euFw0/TfuitG+NPSi0fQfmHXs3+933civVx44QMGsD/x7L5gzHr1jIt15vm5Ddz8LRgDzejdnlYKOVHyS3Q5+uUTyY+X+8O5q/WirPveYAj5FCdTDOhqy3aPhf/ZoWG10RPCrlvF8M3UsjDbuyLKYaeaPJVyJ8fg0vSLBykucYRGXwyyaO1zuWJRExR8w5eOMBNiMCoyYL89oJO1JbLL61KW9JfRu7mX5bCC0NHRqRsYYn5SwnGyeg2GM0aXg17ycBndP1D+fkJw+8HMMl4+/+hXdAwIWphhocIBi7Z4RsTtfeVzGvYwvIo+V2GWy/lr/54TCzXEGULpONrzxeLiCkL+Q62BUi3c+fGom9Z0o8UnavDBJyXyJNZqTQvFi5X5ZiLPvPFhYHRmsP9j75gd93VJ+zWFnrWqWeA8fl8qgQaJ+ccKolHGDhkSXj0n9yuOZmA96NNGAK+9msieeo6flKtmJcMU9Jpr8PSWzipUjAwatZj2a7llpoQEA7e3UWUnFPjxxr17egO4Ov9OMIFkPjUJSjSmjbJRISv0nXgtaTmvStURO3oHEFxTtlM69HkErrJnSwQRGAJhXTsr9ndKIFE9vA99JXgXJn7jH74G05V0sMziRxQHO1RccCLasRJMia85vilAv35rY52fxjMDQ/0ZBHCToXJbjNbODSH32p71by+wd4pE0bwny3c0SNrqy74RkWm6U9tfp0tVmYa6Je8fuAWFe5eiDE6lfHZ1SNajxedUYKdfRxikW99fOspi4O9FqB4uITTg9KT/Jw8drGHZf7oQMf97i2yDIcDuhdxuk6vANKo8MlIVBg9anZRQCSJFcKN4COWxOCFEokiPeu4alxKbn99RH309kdVbJiaPI5hUhio4iINISfT+t7X30als9eDGrpQEr0yBcYI/tRfXzPX1J72firRXzDcIagQv9+qVqeq2zncZQAnLT4sJneJs5jztVMR4Y/vlC4E6dAznkHb14UW9vYUKtK99btrcO1l5IIgwmIY6ORh8Papp00cdqfaFBdXfje7yIoVRDnxjFvRYnqAogK2cq/rSccrAvpfD+Pqago+pVhll8xMDk94V8LiXTsfSiQYN7oWTQ79LIVOiuGrXYv3oBPs/JA8bajShDdYtj7GII4FuPJLou/4oVDq1tVV01q4MXkRuVilizSHLcTS7B1HRaQLdIaJ7Q66JwN0pejZ4s1a+usl9KionhcFRDZkZRK8ILWmGDeNSOWjCTHnXx30O/jgZ19OC7ctWoYx6/ubDrN5C1w6Jqdh3Pb5K4rDQXMhr9FzgSzxjxtd33O0YcsxsHvaydWEKMf9NBaVCO21Hewlt7HMcgb1HmAFvLfCTCAco+XaY71MgeOIcAiZCd1eGdjcGNB5gI7c7b4QtK4TofxRg1EEYHlB1RxXtVN0WPJ8lFCksT9lKqeUhpWaKXnJd+FBbm4IdVl3g0DZsUcUQwjEWFOJnfwCuyl+BRr/i8BbpNPJcvYlxfqx/dq3/eqi+ck2xkacRzKspQ1YkoYxxT7z/NO8hbvBGKWD9Uy1WDPCxyGP966ba1gLnT2ug66Jr4NxqWdm7BEdPKkeOnX09M8sgxtanWGNUVPqs0NDQGHzV/EdH7YH7/mtMwu4+zDUw7VN0E0wajDT77MNd9nA50mxjXcJeDWj5eNKTYQIhNyDaG1KZWt5hQDVQ2Acm8qxgMTJooynM4pe0yCW78ivw7ThRq4ONLAKaJXgQQfA4YGCpgbKLYAK+6aoQNCXenoTX2buxwUA2W9p6iwOGdxgW7E7wmcj2B68RlIlLXk5EmHU0y/jrB5gm1hsTxuXiDUyuP9mWW92Of2U+t57F19sFEPkgWS3s/t+29bM4eQ2Uu5zHOBjszLuZxr9/U0hhXUR8lXGT/gBmxgGuUYSf6xwlPpWm/cP5K+9RXr6VpX5t15m//Yh/fJVr5GAqGK6UH/vYvnGWmTZ45LJFzzOtRpows6axkojzGqMgELFoSqkDjNmwNn7yqz13iuA1tsiQC98UYTxr1EJSaqJtm0xoDdWfaF5Tih8MJuqaG9x7X736wplJK8zPWUhqqj4H48Fal4OXw4Fh5K2xezSAg7jJKY1THTXf5o15Zw7TS5wAgvBCNma7mYzrDQvkoBVBPs7kC43D47WOktvHylpPrmKTLbxJl+pWX1hjUDpM4nA/HmsubeBCJiuNpfzUXWDj+jYcNLSgE3e5mcDjcPst3vA0bWl12qHdtuozgzYYpQc7kF3Qtbqkca3X359v1ixPWapLERwJKDd5oNqRrCUF0MOsCanG3vML+OkYbChawfPySF6df8QQC3fTCE+eVNb7dVyyE7RBWUVC0NaUA+4y75sYaiXj+OoHcA32aTzSDHpheG+Jark0Jry4BIZGvu6RMoAIMmKLBmPQKnMCd1a45A1M05G80EV+BiQ/wluVvVTGlDqYSkZkFlVGTFcEUEqsmR/z/e6cBu0SupIa74F92PSfchWochryQ+xwgDItAzgjpKbZHCi2Ae/zTcsuyPtbLl2F3D9YfccpH4AezYZDrOrAUoy00pbTpBDBuN5KPxvIVjCYFstSYkHEpEaYllsH5+4N326OdqxLRIGq3ZXe1onyyLQzupLkpohYMD+aF7qqlDmkKgl5nfZvoAm4ekoBXugHoUamkDq8O266V+8frE0WcRTyh6y7mwoOJF+4+3t26DJuGBjXiXYpV9KI0+kj4hCSSxBht8afBnImTTZxdrl9cdK2kWbvRSoEnUphcIOWg0P3XIQ2MXRaiqygwteTrcu5SvfmWJWjWgVq5pm9hsESX6gNe5GLMoXBFTYq0VK7TbDJoIEGwu3mKoQMSdiFC8G4p3UDCdCEqAaSkvz4ftjNLG414WvawbLT6w6nh+jnYwrzR0FwSh0cwTZ8YXWn2lDJPnEf103JCAagaNPfOXBzt3DKaNG1jBGELOnILE4Twis9BEYVGbbh9BWSirYN2GGlalsV4Vijy7BNFf8p9ejzdjhhNt0cM7QIgPPnQIA8xxFiKt1z+wdce1xU8osK+c4+DFeAyi9O0yo07IQ9ts1+x0gpBuetJRAqEan7OxcGt25JlBIllGvEBpFsA8CrijDgpxgaElYQeGuToQUN3P+WeSWyYT5cXeegwABTszeObg5tPaXvCegxwAMuglOTGRF+DPciWGusn0vP7efOp5AsjctrRPA6yXlXiZRnKz47PCZ6BZf+nZKCzDHg0HeSYU1/erjc2YDrYKyfrsEAsKs3F3n+iycApJ0jK698XvFKqzijcghxvL6E3I59wy7YG0iJoMQJwdRjTCNC9Q8C3QY9DArUrzGgTWrlGbJSuU8QJ7DOBh5LiYGn6cp8sCagxkir1nrfZVY5yiaiehGHGNpf2HlxlbUloawRCyqhVRCiuCgqugeIcmC3fn7V8WmQOlltknE9rcPMnCcBDNXpxaVfJeHirqElXxtcnDpCGsnZ5xAHQYMouJQ7j+6dx6sKgSTaKHSwJRDjSETFd8cLsqte77FcpRvrh3WP1ozP1mdN2+4j2KIKLI5pFk4SIkhaZYqSbDAWVXgrb/dVCk0GtDF5tKEvxaKO9YIaDTsk7LND2iOk+lXLlnWfMj8UQlWb62mh1CruS+IDr8wPJOCLCyRuBBOn7mDhNvS+YU2jkSliBSdS2dUNIItOAnsuXh2uX+DAHTwycrd6keCeqMLNoD+fWErlhBFmPDFoclRKRYWQjymmYo7ghBIyxfck4kGddKEoWSWSxS+wmUG1iUNh6r14bOETsSSkjHVG7E0f0FLxZ/UZNTML1mYTznj41/uyrVaZQNVSppvrS0Fl8TcV0lKZmMo7+J7WQhuqh8H9/2N/E4RzW7iDeyqYTwPP1d8c9PP9rT2d83Gx7xgFfCQJOp5lPKSU5MGSKYjsVkI6jUB8dGib00KA/UILJGniwicgEiE1iML5m1fXur8GcML8ShyCGKR5AkZx9fLNrePKn3e1LrHuVem0aubkABgcSDB58DhmoHV/QQAMKmGT1RDabgshI5YSxPzQiyJpP4xJNxZkvy2wySO544uZLgku8HBzr91i+L0aUxzfZuy0kx3blKuKnr8R4Nzi2zat1X866L1c1dtpkiPzwOW7oWKGymS8ymOnJ5gvc5Ef/Hg+H/2lakvmx7xvJ5Sfreknlx74089bf/MX+yeS5TnTgAE7Bgb/xzFugaBVFyCF17LY+Fo6ViV21RRqQxi/D+FOggm5dlkDDHCsBQzoSmvVjDks7mRFEYzaq5RyIU1tRfT7qsAD2W2O9fnfje5C/1iZARDSvTGmxHbejObwaHmQa2igh5wTUY6sSNOIEJCcgTPiW833kAUd1pFQlGfpOkB/EetroxuD18dF3S+gKfnzNukEGBiCAF8qxJ21E2LlLjjzRg4xuGIy3PD7A/ujqsHqk5Sq/eADJ3XjxdUObiwQl2d3a4jCA+gu9xhq3tS7KDKlINgCpWT96yjVBYlg1yUqnYaJDyu0tQTbJ58O+4lwtGAjYE2Zss1wBoPDLJbaMru9uXhjdulrvPKElLrGj25jrkaMqhC2aQ9dMRlcy9qWON9fRw2aza/R3N18P3r3jul2PuAUcEkc2izQkTlQWWYjcZo2Tcnih0c4ZcYDF6EJBKGn7EuA2f7A4hK0Ys6fRPdJAgvLrFDGawjxNi9Ma2d3+CdM2rS/7TSHxyJqKcjy1pDOXFB1FmPe22GkFF9DFpfrubeGXGKeiq9oA+vWTPkRalmVS50ijMxzogJ1hdzfOD+7uYKyDs3RXPsuSWdpxSNPzYsD5OBqHdGrH/jR4U41Dw6AjjRir/VjDODHv7/PlGdw53TKMUkklF1G0M860FXqk6cxXipN9WuHIc5y3p9Ha3t0HmLpHMmGFs5hrF1/Fb5hDc2J++UyD2eFdu4xiLBtC4ttJK2uAUyWqXTSjUFOJVJjgNVQaMctUDtTJ5mXUijSny4fN0dYz0Imkc3hxEmmOR4nF8Ezk9BI2YsXySNAxGuoPfLBISYAkYDta0MmiR3mARk+OD7d+1MiBQKCsMtREcg0Bi4aAZlPIIjSmEMLjnE4C1WS4Ssd8wC/qU2vCL8hO0CTbg70lCb9AmUlYM5HnNVCyNOzN6KfzHPamnWYLmGi344WkpGjORMlLrk0qPewfo6oeDXTYKUckqTgxvH8BSH7vNkLUWfZe4HaEvbFXF0XCwvt+bU64TaenFjK6zde9U7pWzI5immzt9Kl667u9W8s8kXy6FOCd/fiIeKekYQt6yaJJEo5hAadJWT9I5xyAnuiiGcPDK+frKy8H5y6MnlB25lZILnVGsui/SUGIcp6zAsPKFpkraLBGWFhsPBG+uP2cjSdFhWZBY7mUp95RbDyy5xiRIys3QuQ59h0DivWVC4OVC3RVF52vZj2yeH0S2V9YUiwEe+y2Ko0SeigQT8PB+ZvsbFgWAMxBi8S9NetJ1FxiMAsVvrKzVFJ95GHiawpE6iuXxNeUSYlDpbyNfcDUcHIQX596PNq5w2wzdsYuaJfi/vafNmQOxWNxlTFm+KmfjAQqrqUFHeZo5JwP0wUiZ4FAZ4cVkRzP5XnnbX11zXJ5UuIfL0oXWTNEYK27z5oq0tkyWL/au3WSTRhqvPBI5XoRI9dbGCiRkIXwxtw5M3y6I2aLHIP2602MffpgppSGZGMjihOf2AmfT7BAEetXJy4VHR2mKIIoQ2BgsDs/vsOA+CBCvrpoIkT2BK5ZJdAbI4DGKI8Acl0iAJvD6qNGja5fpO7AIpXPFvJOsjFhqDvKhA2sbiYMDqWWNwH0BkwoIdZleyR9cSxIl0Fc9r40cIvel0S3EfWamI//mS+N0oEsiJVFCV69/nC4co8uhCIwzezYI6wOp4pO2Bqjy28/C4pWDhNMHOpxf1B4EgbwViSZug65K+gYw+zlB75/XlAFQLF51XaCxquuYmZcwsT9VfY6ejq89d4TMEpqamwjPM/ndO7QbffQVGFkrMfUB6cLMUD/TDUPkPNAynBKREDCz4qdlYVOB67GlXF+DaFiKP+n82I8QPOE7koDo7qPFBX2+Fqk2BjYvCAYkBeBYimDThKqV3yn7z4AtMT3Z8dRkQNEBmXQSDDHCGZwc8nAkNQCTiWqAQX9LkKLSchMhcA6Xep/ujN6+5I30gRmaACGL6AFzfDEQroprT0ZTezPF8syNWNSk6/VMk+n0qYwGxNADeFjkscTO25q9hM3zADXdVdiXMc2mZF8AWEywVL1TVkr8jEI910wjXHO+IoTMcrrrJldpkVgA8RbAl2/MWlxuN+ecBxLo87wHwpHyNIdf0vS3bOjKk9p7HzEGeqXTtxsYsOLzQWPpf634M/ILIIRVenYPy6yuSifyDL1hd+aLebLNMUu84Ufmo3mr/ex0VB4f7HOHJiFTx6BuQN/3XBHwpS5GmcbM1kknHCFdRSKM8e3SnJEKRp/hBwv8Q7gsYuj40/rzZ+k0xllBSBVA6F+OEV3waBcIWV9OPhbtRdHMgSOw+nMJeHSwVAzsGjOpZhT3cBiotjVj74erJ7WTMgYwg7oYeoEPizkhOVYE2FzIUeEcm8RjwU51hLXUfVBd7YDfIdtB17e5h2IVShahcrwWYnBQmzEwp9iu2GMHg78RRgIj4F3wIEnZqOp9h59DcMOLGd4/bVG8qRWNErdYkN1zjAfODJmmUn2a/j4jGI830FwsPv+Mv9uMTgC6ruqiG10O/E1ZRIyeH6UmJYsTKVDJ4d8jyT9hU33UOAaqjffDF69re+egQ/WYtSBN58PvUbxvgFFSurFrdAZE5zZUONlPBdDAsc7I47VCaJ55RNZu5IoPUKHlEzf9Bhx0hKN2SqHBYNvXmKOEIrZqp5RoUdX7oeQ34Q4+xTZwSih4BuWLmxBDjxGOytyryScNYcfPYqX7CxcffIovlrwzriBEJ9xIyE94UaAjBerOV6cHDkKK/0tYB0Tu0tUfg4NZRR7U+lJDAuiJNEreo5ImMS4wmNgPRxfkZ/1EWDXnMXGHVz+is9MjmR5gPZ3dwQGal6oxw+55ERhTKExcel9AFmgkwu9DBHQWKBmQbLDGrYg0SMNM5nrhe84G1K9fBn4TsOG1AaeLMtTRshoyhBNJ+qYGRP1mZlHs4LFHUh3FcwtBAsBLuBJ/RipshMYK8d4hYbjjyLRkA5L0yg6Uqrx4bOKvEfY6fFM2NfjfYJRkjE84b2kT46//HCIDnQJqF9+Ul+56f0KE5uKwwMFIhXeQhiGS6YY4D4tt9GeiVmLNKPY1o16fXmwelF8NEti6I447oz91EZdOHrqbrsANjlX9sChs2BjGMGU5dLe8YdSqXS1Ggg43BcAE6fDVL1tVwv0Qukw1Q2o27+my0YGuRwe2EKncSBnMGAMW66sI6Y8UVfO2wvMVQ0K0hEl8Wt7IlR6eB5WySGXJDxns5Oaj+sXZ9l8vIAmMg3YgNtKdBz9gOtcxB0sQxZ0sD4kDgmgWVYNiTu3OaaEuh6pSyM7HLE/I79sTzkMsU6PaXoExEyiFPBoyCg4Aj1yFAily6F0WC1NsNEJiyLiKQ23woxQWCk2T3bI3cqOjj8ck9PjUqGCC9rmh7Z3caNYmWiEfgVVT6O/kpO05KsIMd2e7LHQDFviIiEpaIQxZV2rVCJsYCND6l32VI08lahPoIzXZ06rbUHjVPFyovC6cSuNxpahx71JhK9xrBqtDbNrehaaNEJvct0KdNkEcy8nlr/1f9UeivdR9Z122gCqU3VTD5YKGiVAZ2+NKE6E1aOvHYzcR6/kOtBzrgJdNhj5m1mNzYbb1Z9jCU2co+hEUQ0jGkYhYvthpDAOEQwe0G+j1JPqJtKb8txEucrxpqOFE7BcBwWMVFm+zBkgVZyOa91OxJlo47uMJtGcCPqC9cIJGNRHBVeGadzjjJ2kEZsJYecMmxCaEkKZhk6d+q4T/SY/V1VXJ82mi+dKWK5vIJqukgvLFLueBFKPWVSMznw/uPtYoi80FOxJU8+YtUF5B0OvCVvEFocjJ+Ny9rmqjQ0oqjelXf6Szr3fj0zZ/gwV0bL3+4Wp13+1j3rNOZ4nFeu/coo1aXroYBdmedjxlLx0EeO7JWwUASVitcf/cGyABr+4szZ4eQf+g+UxzjuCKFlcjCUNSjQfNdrpxMlEO2JdBpr1K8rgx/XpFERu6XF6qCKW64tRCwtacYkYkrU+l+JyjbKic8rIwY8X9h6cZM+aApMutCKzDrOfeZOwiBJSIh15XnEzlGwdA6KQmZbObR4D9cGr6/Wjp2T7YvKUwTCMJLMZXnWDHVOViDski8V8iCe6jTI6W/t4jaL4Y3YR/Ezpb74bbNANla8uwgfiHlYtaCexuLxyK7040VyJHA5BCqzTY9S56z516bqjTCmEOkE4z4ci9NjFM/nKJpAC88oEnt6Wy65orV6MIqc3IRmC47F4XhGhrL9Oj+hxj24M7Gx/+l398iuK5p61moSydtzrb3lvitHuu9Nf9CNlApL8ofaqg82dwfsX/qvGvarrEzcfbyHOLq2OmjpPxx+v0fVZIoj+Zne/ZWN2BXVyCW4GTDiZ4YwYoGqwWygUxGkMQxIsymEgBlPub+KUDJde7pFDIa3+oKPHEej9QoE6iRwrJVRAxCSiMKJDUsDufBj8SFlKYDUeaukxDY15xwbfhh193mZk3E+/0nGHTSZrC5OASkX5HEvlZzM4JFz31ejrk7w3g9RrsZtgnOeC+B48HqSoz1FVsOhm74uPnFGAXS9gPM31ooyONOmwt6LS4SfgMDQ5FQePR8f7zZ29E+8pThne0QjNl2ceoAyeteF19bLQvRe6OOohe8WWuuVjKMWe3X67dwddanqUhYrErSbzNUpe+jKhounLiBTO8qwkMEN6DyVFMpPU9GXsnegt8Djpr7bsGdFOyoyiwYlufw371ziRLu1ertFR8L4lKRTVYfMrjfFaJn4oU3IZ9Gmvc2LxGUf74tLuzl3qLmY2Cl0ORg5NE3LihIIL8GhL0xbmHOgVX14z3oKGfBNzZ8EYsL8kHnEtAFQ64hH1rlpE8Xyg2co12SqTJJsjZloFUuSGCjTc5sN1PgPvJJ3TJ+6cuHNIsqVHT/e+eWs9qbKk1aBQsbuvPuIWaImuc8hxnBStiphRhs54tpjh7G5drR8R3DlU+KQLeMmK8w8BS8+jGTqOKKKZyULyNibq2NXXx4Gk4LdW4AhCjRZwhB6SJWkLjyCNZyr2Z8euPSNviK2ru5sXyTUQqgaH8tBkdarpmWSXYcl03nqnOqoo1Fjr3p3vFY7y+ls4kqVFgzbPBAbS4Ed/KnyaOB9KjaZkklI7Ij8cR6sN2lmLwWZCxBADLL8HOmwsnQ0ckRLlNJKiu438onhsx/Z56QkLte95m2JdLxZzWGQoEpvRvVksahRUHUfOWckL/yEISfZOxPjXCygpxd+Cydk2YkqN8UFZ6w/Pmjc8RogENVn+wjLr8EGp9ElLPj5rS38G22+5P8VclrcDI8LDozJfX8uND/dEZT4ND8l8NzwZRoFNMPq1v5witKHrekIzQxJoih+Pl63cHNx6O8HLFtK0KsZp28Zmyv5oWTKfR0+BnI2TEhFrftZN4nyG7IAFw75ECgDvUnJeDpjOXmUcfe3E8eHSTn3q3N435LgAwq4IlCzyUiIZcHgiAj7es0+LOYa0QkejSBL2EbdAMZcK9rPT4NJxp/8GYEQWlegfGpfw2hx7s/EFXdlI418LW3PUEBqglbGxJFdkSCyZqigBoE+sfvx+Yqo4OdRU20ULoLYgyX20DV+7cMqAunI6pN6A5w70G+JvgH1UQ5hXJJK9T/G1Al8HpSk4BYNVC7Joj5yEgmATgZ5twEx8UjuOUR2AbIBHA4wKFS0ubMbcyAd0DOUYx8khFMMwH4Ex+GLk5YMlw0nSPrfMoGgMuXiQpYFWDKkoTPEgigMnDehggEGggnK3Um552acGInBAwIEAFrVO6O4vsp0IVNnnCT0WeCrtlDSPtX0Yk2i+LGtKHhU4IiRYQIh08Bm5x8SNX6qWK3SbLNs4tbkkiKSIXRwu4XqO4zW5qPFOou4xOmZvcsfFDu+A1/DJnf5SGfOEwDcZ7/b4dKeEMPpv0/wPuLjhamC/9LwKuMwsHH/5GQcC6MGBv/QsGuzCG85VGXlAUerLNiZGkBjJ6H6DNyw4fqTKB45//PDUYAWT5aFD7/trnr/VbBaU8axaQ0PKjmdtEG2XMg9Jw7LUNHWSuWiOpuTSaPUh4cAXg5+Pk5fkLJlJLIVemxPfREk8y+b+yZL+ZswRy+g95O7nk2PYebr1eQSjIaYZiCIxgBIJjE7ESJBuG8ujTyZAH9zs41JHRuLmT8OtJ3vPvuHoSkgtAPkjoRuyMiPTYB6m+lGs5h12C/50PU41of3G+Xr56t5XLwYXz5FNEHpXlpXmRKJMExzis+Sw5FzEp2yY4o9KKzyzY6p4e4l8RYmFnns43Ho/Wn02WuWsKEg6KPNYwjP9P8cuwH9BEWOuQwQzaHkA1hPOkQNFAZpjr/9GixZFVXkKr4AGEjyE1/TD68t732KWwb1jx0dnvyKAjkNNZ3tAVy+jJn5DzoCQUVoY1ltghXA8c76/hevi7FeabNKoOeUFEQmiNoqm/kYgCsG4WbKmdTSsqrelb6zYri4wslXSMWSCiyCOkiZJLGxJYYMsrhDN/wlUR+dfcwpQpYq+gGFkSUQ4156CTA4z/xpECi9jLft4rToqE0kmD7Jgv61fvx7eottvJWZpxjA6suAaWHZmAsvOcFThowJmYZ4EzBIdY5x5VPafcoRp5WxalHhlTr3BfSxIhNke7F8GIwpw8OZcdKSwPIOsswtVT2t3JUozYEkpqjUTBnnJqrWQdWp7kYbRQU5PGx4UQ+3hcF5KuhKevSSrbBBj8IH+Fmd7fXyzfvT17vb14Tnyy46AkR4MiJxPuP+EY7wXUVItYugOpk/85pAjGGA2nFTs8g8fMdnRuR9G1+7SLSakFVWJgNQi4URsfj5FgMCu2M+tGHC0I3L+4TyLw+tre3d+slzC2PVszkBSQVy3ENiby7OQ1/AdcgYzenCBz2CYBkZp1WDykiW5m4Y9jDbhZ06GdYtl+6VO3mxhBLWWnz65frlRv9ryMihHi7GtDSYmUQsxJnbA2MkoBegcC4iUuA1R2t08u7tN8SaBTlCGXVkMeDuWTFfAJbMWMzKvzB8BNAZiZEgeBcortk5Ji2l/zc1pGDtgvz2/coZZeXGS9BlTb+BNRTorxx5ePDW4sjw4d0GoYXQtPnfqP53D22akU9Fb8wRhRkree/jyjRePKUJOz94bozFtvPfe22eDQt80NXVV4wZ4rnpNbgjEjBsCNeOERXiQ4mjGUU9yFuMjZlWMWrwfUBiQh54cB60vjx6sjE7i4UQBSwkUdxA1bSHWSkNQ7xw5eE5mptJTx24ix77dTC4qY53kOIxblJteZVWOV0fZX8iEFXE9FePsDs8MEEX4+kOTUngXVrqJeegbEhAT0Y+TlFT0QIjz0DMVzUQfteMZTgkBfLAlnlguw+/g25+An0nwwhBP6/V6agoiLY05v1ZYSE7WPIq1EBXcsMHLWLKxPZd5Wb3+sD79nBNKEGNVPUG4I3nsyKpV9qg+O+Ps4dNXhziGxirn+gE+ceVhfepC/WjTcQvmmcJ4KtljxomRU3pFtDCRpNx1mCN1HgkOb79wDJjlR2JRQGlqOQqofkxR+fp0mYzE514Mzl1j8ORmEmQLLQgMAc139uT5fwSKElkPiZJA8IcSkFiC9y3nzDgyMZK4uDcPuXGE1f3wkRvHAmvLVmnHzK4KJ3kkHGaEfgr0S5Y9fMTC8mbvxg5JdeyFhXNSvOizGwcrldl8utxjXtOEj8P7S8BvDD4yvzHwKDuaqXGwWdzR9uzR0i3NpHhLEyF/S5PKwKCFXh9Jzo2X6KyB0O3ZVO1uvmLjAnFsGKVuadbjkDa0qTy0nZGsR0u2M9PSHU0keE9Ps9A09Jum7mTKkukwpmmIzuJ5wUoM+Ve3WT/xVRPD/AbzPb3BNAZPXfDBtcBq9oLykboB9HFo7tBuE+ICEltgdDtc+dlBWw3HRx3TvzEm2KokZCBgVkWZPsB0uNLDewbyHLxzAIz9HqdCLh9pKcZy8MqDVP5WtD1ou89HIZxrRT75QMbwi+EWhQOhBwNY+LPY9yW+J+Z5oFSmqzRXQW4SclIymlBUiSgT56SVL6ZYQql4EsuoypUJWWISRGSHLzQ8WaG53FkkNISBSoG28mj3Ke1vHeatBhUZHt+C+R7tfKvMVV7dIW2P0RnnNJ7pmKXjPlPYjnEcZTceoxHu4tiAcQC3/SetN5RoO0smsml75Wa/af5WDDheoVlw/riPBUd+2zrwR8+E047hZ+h4ixw8jvJsJmRVKmyh2QWLQyslwUPs8uOdnp7Hp5+WSe5eeYj3HF9eqV/dra8tcTjoGdKrOcOPO7ns4SFyozUpxIzarjUS7NCYuOutHbGmzm5DU+i2d/UNNyX1yQHXmkLBNxNJhsm5/mqbEz95xf2tlPYGzDHFHeREhOhtz/GYLt0YXVkZfH1r7zGiCYpZwzcU1I9OvDSIIF+dQzd1fUQyZrQGGmy0VgoYK6GlmAR2AyzbWYldFLaK/lN5+rR8kJMvcugBFi9kKCBO/+716AyaTHHsv35Vn8UWZhNANnRTVWiqIRO26TylSfoD7IVY5hkEGpaVgO1gm6txk3x6KAvRx2eHWVMKgMkS/6a7dGfxAGKwcWr4+NvRk3ODk3hzStqDeYzUAQV4zlwYaHw1fuKmGcV4oVWf9ngZjU6c4HimvIZKjH9r6VqUIDNIJeidkhhZPiVhej4lTO+spsUIwzzQmW8h6TpbUpS0FqOeHFqgfweHOqF4jeS/f3b07aXhh8v1CzrRTUH6BVJX734rTZgLo6bXgznCw9OuRhDhS8IY62H5LAcRQcwadegSdpSYo30HxgHDwNBRzEyOh2mYx4sLME4R+w/wYeWNFXbsmgOYBcCsp2mKOoBaAKvxGpXMR9AIwGSkqOtWqHEkwPs9+keWMRBeeTU49QD+o0hPR7KkCOZi3XVF1KOLNRMbD5PXZXPTNx5HhkR+XtrOGx7fHF5f0Z1X5oAUNAtAC+3O2hAdwiRVO+AGJBmAo2Z0hAQoGQoIMJEvcp92JPcOye2BnyhIz8c7hzgiz2DjrSQYWShBbzA3FIyqi3EY5S65PdNRxSHKn4EENt7CYsTR4sqBBY/CyHqzUhmfQKSHXUF0R7T5lTte83knlfMrqhqK2ZNrBqE6bKypyXPv8f/H27s1t3El6aJ/BU97v0xHjN2z53JeOnr39D7TEd079pzYMRHzpCgCRbAoAEVXAaSpJ8my7ldbN+tmi9aVkkhJpmzzIokRB3b4jxAg+C9OZn6ZuVaBoOSeOefE9FhAEZVr1aq1Mr+VK/PLbeWClzujICmUYxbkPqdYvtVKu/AYkelXZtYmkrd4JG9f373CwHKOzUWr27Uqg7PpPEeH820QyrKOhIsQG/LCrvp+jeTtnfhycE1KvohEmoiqXwseyVkpW1ckcziBTLjGNhMahEtcKE0C3+VhVwbHbskC6nRoDhzOVckW7C09wu545oulG9WlntXlGscW6UUXV5P6hss4bxK5Oxv3BivMj8Fiucp5p/CN5byGLLaSKboHfZ0KjJ+6sRpcfswG8uVdrd/RLROrqEmbMtdrJVMiRFpNmNyCVts7doVsnyxfuj9SaexWycS/2lBuggmX2E0lpxApZBoX0+6Z5b373/CZzBdrpNt4Nuc0wcqeSvBDRe6pe9tdvgfsiQ6aGYvXG1w+zurY4vVcaDQdpX+1glm1ZGdT+UqqQrUEv40Hl2lRWwfp3RV5TMnV7jkZpF7hwrFGzsc6h/ciDQ/rIG2zGkK6i7zWEQ7l1lw0C3XqYX4sCjeuZEq8Ht6UKCPJPcek0zqnQgUXbu6vyAUToo+zYJLokUgShOncDUx9/cd5u5XA+ZaUPUSMH6E9DF81r5z94edn4pyXmKM3Xwwu8NI/nDCv3Uy90zPuP1bMRU0lY6BwRcVaH0lQjcueGS0o9ZNE7h39BuSgIpKDHZVgtn+ftz3sIOgvTyfimOSUEdSiWUxY+8pcLJQ70kkqpDFjBhaSCh4RYSIESQVtI+UpJjfDdYF7c9VmuKYiH76V9ixCFCwTFOmYaIFmJpIyvQkyZodth8OQppbXccCg35qS/6HpdyAvCW684atjw6/v7H13B1v/lIZmFkhMe04zE95eCE06yRHz/44LNr0LmaNzGy4wbRGWUY7ImXiY+8tdH2Elx4/LsM3oG9VjcRno0fkf6JVi/stYJ2kcuVpT1aWxw9SApMMpa6P4YUiAxEIkHB1tARH2ZiqTExfHp2zURUa3MoNZbxDOPcxFjL2rw2MveE5fWxp8eX1w/a7PbAKc04amcSwkDcUhl3bB5fafFAKTWNbucak1I1Jq3fzAckW+OYk+VrYmtiMJ25CwO7APlU2Gby8qOwsuomL7gfizAnGpnk3Ie3jpcoDdMUAO4Fj0/aJ5hobPvyMVH8FhP6RUABzjXgWnjkmrUNQgaBUwOkQE8PTUTgdqvw6iBXClDDsBlil11WFFVeJ2qUCyCE8ZmOKKOk+0ns7DbYdCMQoK4AcuAlt6TI4nkCeCO4YlAoI4CIU4/BCjKfNCt7yRQa9ac7OyanP/pvI5NtdupasGumB4Q8+PZCcxjbHRc3tnxm6yjTPz5JbJzVJskSIzFNkLtxJmHyap7EhVx+rZtXKsj1UVQweP6UjXjqYaXSlCGaqugpaCigrayRRSpBZcJbg+mMC+2krSv3ARoMOdrPjnfdyr438NzKsT7jPe1fE/uTvntwexrtId7UOH5IbGod9GDB5S0ivljXjiZqFI7cBysuWVA+HY9O5efWLmgBuKioWJ5BB0D5im30SWxqjSFJAYVb49CrRnJkt27au/hC7gBYCe0uAjgNnmDYaNsostCEzTMFi8l6KV1EXphUQo4WxzWa/AFgEsIiMCLLYtYPObthCegU0ByrWChUY4NHFobpr0uw0+Mxdl2spyVLt1E5SlRyQEaD5r5fsFSfCYOlJIzvDR58Plz1VOyrd4iENBKwYAJom/4LwVW8vd25eH30u1Zfobme5y/LH0/lIoU2IBFtB0+zIeQwSIH99sUH+TwIp6b+TrEfPeMLjvaond3bXrqK/LsZhc+cEihnGiY3LCmY6KcjF6nENycJYjIqKzHCanXOpmnR7PtKB7Wzi0Zf6itoWJLk1L7TQ5ppUIutPbg4tPhq8eiDKcqXezw7W5Xl5Wsj7mLGgYSEG/iwhFCSQAEIHvBUCAhzGRMWOXwvR0b0rD2ltM5YbFVggLAs3dn461ak4F/Xh47szwu5s6reUG45LmNA5c+JvKV03ShhAJDfnljuTIiKTRme92t7aFtI071KE34UcqzJBI/9D/6dlKuGAksbwjx1w4c2p0/YWEpme8EOlHepxBvWB6ZZeTdxhgtvSKlhHiCPcuL185FHl1cnDnm93jD8R+syDChocT48Bs95oIgdLhLpmTqdC0lvgNiH9Ij5voPYwu3RldfW6vQqZr2tQtZKkIXaXLjJMLKhv+jLpFhEWoHVIDajexEXLvZq05WmCdpCMDMPaVCUp5xJQPiWWz2NMbo2tn9h7dHL9BYReX73QROb7nnaTbX2rN4QTIpcFvhqg/cDZCMkeun/xmePoy9hJceTudU47YsNngs7ludbdBl8zDMze23Xj9Lmw3aHKEzUYy00rb/JIgWXiW8qKmUoX1wOSI21R8XyJqd/NbFOFiF6yCVZqEvWJaEzdaGlpTvVSd9iJdSIV85pP04cvXPvO7Wc8Sl/XNs7xoIujXIGls9ybifB6IuGgOSJA3ra1aPptZNHbCrOOlfuPEAlLMHVsEeyeeDh7+gEVA1j5lZuiUUxOM8DNvC7esiUvwdZ84kDjTJ5dJhoP+G8S2CSmp+TmczJS/OdyC+3lGIw35+EymGe+wVNLwq6sqg2+pHbZo/BZZc471ELsFIlXWjjURxlOGuyQxakqGrOS89KRnbo8+/wwUvSyO5k6uWjyfz6ETE+TYzae9mfiCHTUgVW/9xOj2OWxUZhZqzaZVdGblRZKwwZHPJAZqrOGsInTr7gmGxnQfjXdm+bCdQuNfyYbgjNUvJRZ5sSQxXFLOYn199NkZZDFN1bqGgnwNyL22BOwL3+tTn27HvOebfdofyZlLRdpMm7L98SsM23sa2s9kIPd4ru5+e4M2FNyPBXbN1o0AWp5fbvXRsG+yGWEvHDZkK7uffQl8XETDkTQzSUKU1EzCdmBnahEywmUCKqrYAX5IwcmhhYSnSWI68MveFmcyD86f2Lv7rZL09yRGrdaI0DtcJ2hFv0F8EFddihDoS7EBF1YZJTeL8eaC9hXrDb4ZrG213i9fw3pL4Xo33whwILPkMljr43sQAdRnu3WSRKjv4aoLY9zXiVJlOC2N9l9ZC2+YvooruFScLGcisJdShbYuPK+9JqC47ezubA42ttkXK/u7rgRCsavTeCNakX+XXnhXoq7sCrsizJfCIcWSMnPlGIkb3Hk3+Pq4uU0PM43J5Hwhx/kO8BVPA0krqMdrCAjckXcVxBuCj9C7Am35t+imNskwnQCEVQ9JFoVDVqBVhaoVkBoAqqFKAEpDk5jwgBUxugCmUDThh7pAzPsNkFsdszd6kKiYyKEQoylE19YQWESgau/K8b3l546F9PmAXf4m+hTDHcc6VZgTEMNkqODYwCFBhAYCCKiYazfUZqX10dR67jObbivNSuLNulkct2But9xi+VapZWYqtixuTtSQmAkxy2EqH3VjSOHvrS9B4QdVb/pd1TIUsmrjoIlN/5ra/OVyW5XmqzVVmra4BS+PKS3XVKajMHCqUmJVAv1hmiM684hXmR3O+HmMLtcJXoh6Vib/nfXC/9jngqj8Kfgfxu8w50PlunsePj7I88A/nzp0iLt16OPgeOCNmFSfyBtKsSDhUhrFGJMu8AJtsRfvCLgXBltnR9+/dPoFrsfT0vilIFQZiKwEgUjWxQ5ZGntZPW8TyZxJcm0bEY0qvFKiMpuS0OSGViJXtjPakaQtK07+rMsYrBWRTn/7YvjwjXHv1Mois+x8FVRjXEhKsQ4Xl0uj662a1kGOJVtet8qVUCsRKnEtgSKuK5wHvO1NuIwpYqNo+ey/iqBAdjcjsPXU4PJZmcFMmZ+1stR8k1J8AunC8pmlGVOE5KR4BjonLVnm0vDu9ujsK01Cf/YV8pdUcMhfSkBzxBm5c1pGpIXCLXqlv9mtOQEVfK633zG9zcaadLbFFWfyltERZWnDouUzUP/6hXGCC1RGU34LIRcCvwVNXMvFTPkYQhw0ogDwHQHMeqm/IaEwnMyL41wwVd55MTqzObh/bPCt7O1outCsWrDQR9KDMlxoQFdC0YBgu9bUAq0S6smP/e3N3XvXgTcX2EVluqSV8jF40pHoBNqFQ4WD8qFl1LkIXSgT8xIrExwosGkOHJYK2hcGm493n97Yu3sPerCsLeSe/KkNFRrMZ23YdwmtMYkZH6EgYnpw6T6JHLw5irhpCKx10rncXVEcX1BHvkfaw4AXU+2s6wy0HYT/sJG88USGIJ3i196oEIBiH4vTYeHY1X1s2tOKRBF72I0nYA9jIRGXaJvPZWmwOlw5OAXr2IpcEiY9uYqyb0y0LXtjRr6Lsg7AuU3b48HtFZr6fu7LbvZEHS5pIdVrGjW0hMAXvaRNqbsgyDRpkFMr0gWb7+HJOX4xg00ttO6iQ0lmOF8Mj35TidNI2GL06BUJSOGp3G8kajeNRI1v9/Qdjh/ur5WaBN5f0vJIZB/KQKsGZg6os2WtN7C7vEkKbe+rYyDYmitrdL8ShKlQpTQ0uWAkNClG1QchIAkTCbWI5o95gqdwQMCYaK0MGieoA6lBynF0OAfRmkOrD5hB9E6oPCTl6srw2BIk1IlEWw8rAgN5osozEloIizvb5rM+BN7wACh92axdq05oDlD+6Qo2cjSnN6+M3j6yaQ05qnQK3snKsarKR+SpxLeIlpvVi5FEF6c9YrAURd6kiLJSknhPeZIrQr9a003BcOk89gVgX23nuVBR2XFRJE6c1J1IYiCwZEtoTnsZyYsn2G0vwxhJjEcS4rgqz7TVfFOHrF356dh0zXIfn7E7V054Ln1BIJ7kD+QcLKGfep/nlf0s9FSFVjvK0amhnySn2s95riQbTU/JyqNZwAf1IGXqv6KvsoamknmQrXPyou5bZWaBWuHxWybKXn0w/J6xI2020deZrs1Ql92J5MYzdGMxmpwkJnSVhVT6SeqMNtV5ULQ5F4DK2vS2EFZQnZsi/rsFnZurDwYXHtvcZPENPc5uJXNZnXbJHGxXICsvuuQteIe/W6gpmyhk7qxvaYcbbBb4nLQ9fsyh0zIc3ugFYwquhdMBJUNaOo/TAZ+2ekBQkSwzwMLEWjYD/JzBdJMIUgJDPWaIhlWcE1P7GekmX1aeKaDM9WUagjECOh6I+HX1cN4lnBndbIrAbdaOVDJ3lsbDyZyps8zIJmTOMl8X2zEtrBtGJYetmMQZmk0gc+/W1Nm28+bW6NitwebKYPUHt4hp2cstnZhtLfIENF+mtCQE9M38PfRKTm+r/51v9xQ4BvwS8lnIOiFFRX9EyKd8NvpaySJvhyjS1R+Yu/3OHYQWgMyWQz855nImPDK0Y7eVz9tDM8M7gcl5E9xfgZ1e/WFw+2sThZLIE+NEdM8SdkCVfYpvS8JuJN43xHuFaH/gWwPfF/h2wDYA+yF7jNIDOA8V+mSnnsVW0u2imcMIKBtAduwK0KqINYKQATyOwUZHi44TQ2qww0PVLlAqqk4i7BYg2wdw1DjoUbCDUog9pUQjtKNQZyLKiXCIQxDDHxE+COBgHBbEiCCCAzEOcOP/Xts8wZAGK1qxn246q3bTBJRpdD9sW2zV3KBVrVnF1JidiSyMG5fIskQ6qmJJIj3vKj7o91j9uu6taF1XuEHbVpuKVGFVD7oC1OZcCejKj9SSayRTR/FvOeCmg6KCi56lvbf0/d6j66oeJvhrqMH/S0q45P+yz2FT/Vvw2Oy7x1w21T+4z+ajg3w2/LRc/yWfOfRRcNmUSZPfCA7csk7/dQt0eLg8o5fzlkY4bVqp8t13D0a3jgnjDf+x1tXi3XlTZUGs1niPLs2IM4wLpMmKJSG7x57JuuDqf1p+j09YphI9BKxjlz9rV/iQFNe4EpnxOz4XL+udU6M7n5HCh6pjz4lPJ5YIb8E07Te5ssBsqlwqsQC9m+6rMROCKWah/CoQGB/2dUmZz0lUxoStXX85k/NaVUt3fxhJ/qLu8BZb0zgmsbw4FZ9oerFLtgsmbkJ+MWTH+cUuvbbY7Vol+KSYUlxk4yfwY462gjauHA7WVs84O45+ucjPAY7pNw8GXz4f3T5liV3pYffmw6+cmWIpwJ6YdPN6yWNjrSCqsKyBMpXWjJxh3z61e4Ygzj0cQnbKWtdqB/cfd3pMdlCkRxDKTTtZ4bu3SO6c+d8xxHs3NkbHl7xUFb27w5287WE0vU+Suhah59yzKGfmCNvWmXBYsXJ59/xrnFdAhqQ5qPrjbTfX8pXHnGrnhYK4cHFOL/ZXppSdhzv3Zmv0akmwe4823cxVN0c3VEX2n3pCjl5YxgUl+bEekiR0z8TUFqfCVpUrx8wnxVQ4EJtnWh+41o+AsDWV+mFNeQdqBHfPrTIivPbt4NwppA0T4BI5QW6mAahrXNxGPjflsFTFslK4eA6ysPwOMzOS2o2y6GG3+zjRRNFSDoPzI4knjsqIrcEHevbV7kl2VTZ7Uo7GChDV+5utdM5OcEkoTg56dpF5t9GxNba+Kw0jpSBpo+2nw7WXCN2lhdFoaCCgZLniCLSZtCztVVxUvU86yjEpzKw/HZP92Kt7e+srqAXH7CZWZnCmnhSqIXIAjaSdN6OvXO5b4yJ0Xqyv7N5aHS7L1KgzmE2npnoWGkEaSw/MGx1dASXn2eDarAbc+SEiB3Q1Nbl6cGdz993ZwYktsMFN1+bS1LLsiyaTi4pwUYfydRbflMcDAdckYW+LtwhyM/uBjGqGboaTP6mDuW427eR1jTono8aOzraz9km6rQDR119zdvKJq7LfYiyeTU0lxSQdgiYiJYImBB91qwqE5LkCgcCgQZjejzZNmgBMnzTqnJC6rFLBBXJWp5xLgwcbe2/ugXNpjh1kbPjbdg6RdHtG+4LrUt0yvsyp9dJeLrUhTHQHtbd5DO6d4gY+/2L36veKK9q8nxUJDnxa6geil6x7CKTNVcKicPA1fPUAB18SDdVJmXa6HodKNGmiTIdoCRYlmwra1NwDf8n60u5n62Ka5OYoQKDM64W2HOZg3rCkrrE5+PMzMcdhCp5/Gk3BZjY38U3XDfnri26gcoQIq7xoEucvmoSFt1xP5i3EEhFf+v1DJ4q1BRtymidC0sW3AiNI0Ix+lTgXPcKku3GEuSCcYZly+OakZ2XbmGepVrfNOWgE11JcYVYM8AXuLT/fe/oFuPs5HbcwcElfCw0SEIm6FSwsbAUyVRapthLCRt/fRqKpbIttSXHQpFbvoTHV0rJ8fAN6xt0363uv3ohVSro1ApAe4VT02LX4aZYqeTj7fo6kc16MUSYe3bt36gvJPsimOZfZ3ZBJWXJNL6lu3dUZTMiIr6XhErsQUEBdjobX7++to/giTeNGkU1NnCwqO54vkIw8OebMiqcMifQpwzJ9zpAuwAqzU9dSrkA72DXZ4rb4sEuS475b3T3/zGInuoktslScWrJ3y0WZ2he6zVXp+WdQpXRbpEgRwfKbnN45GY9KsgqvVlD90OaiqWEsu+duIIylyScaOmf2DZELC0MUS6osKRLoS4pl8vBMpCdxOD+G4hHccOvY6NZngCRjaPsDGLuKfiPcGyFeR7gxsA2INsaxijABKw1QGlNFAIAB9znic7hXAWURHAtATPkrCYZJdHsFzQlSMpQUIJeDLMVWjokAhByxAKgoRLGJOoeQEUUQgA0KGGKk4PDA7DhMuNnvyHK7xTYujK7yhohljo0ybJkbtdhSupkMFjKYmmBkYF+CcdGXoR6TSNdDwUO1u1pXba46GOoXujfSukHXQi9CJZo+xPtUXeZKDPpLlZd6Nly1jKkU6BHVIK498FJsoWONY4GrOF+G8fLDmsNqm5hW0s46vyfY3G7nf5iQVlL9a5xWsu++kFZS/ZM7Cv724LQSuiM5dEhuqR/62+AskCDStB2S1XPm0VG29XtzbJAk3vfotcEqH91P57VWb5rmslkWLn/WEN5GcE+kmVxIM2WjMCFId7YECRE3OP0SHBMqUQIYjGaiDfbPdLrMuvBq8QWy4X6Bz+87yvH0+aXh1pKWHSawUyZpy6yCiahUQZBChUhu5gyqTxEDMZbdfOL13rOvQjUSSA25zdLDMs/KToLqTNE3IfTgBC2Ws318eO6E13rnzK5PzbWCG3wEa6mlX/NV4TLDuP5yp6Vh6PEwjm5+sfv5Ix9GlVwZxpTsF0d/9O9nJUF7OXSQK6yc9Iqw9WjueP9JC8EL4GRhFttbn+9sXB4+/xaKju6pyxxYzGcrLThlgXzF2MowSFSB8hbQWAzeHAV1AWSE8URF4hJQAiVKLdGPfbuz/F9wUJ8cHH00uHge05F0kNIzs13kWaej2C7S6U4aj6ITx/Y3pirMJ2CQ3Vm/4LQnLDVwnuRIVhGm+/592R/xZ1BC9DcbJLVptBC7554PVh4oM0QrlVKygd/0iJDlV9620DLGnYS4CjOLyPTOqdjKe5aVO9PqNSU3EF9b9pX50plxRozc09Gppxi6Ri9XR5LfG3MA4HZ9lSZibJFAXFgkLHFsiTSStAtaKDBzlCko1fmltiQKJz4x2tl4Rat59/gjmiq+ZrppqaXQTFq0mkXe/sXM79hmnaxker2YeCIt4ihoS4gxJyFZ/Ra9JCEsesk4grnKT1zTZe/uzcHJH0NNF76RrLM6r+WrVYr5T0r1SjH7Fkr48v6l0khpltkw8i0RvzK+YxQzaAEZu93XLzBqcvO+V5s1Ui3FJ9kIRdETcPi+jqiOLjTx1oX40lIxYeJlXM16wRbY6NjZ4Y17WGAixtYXVDCB9wIUcvy1kQkHCHKapZS88NACxuxsXhyt/jA8flZrlaZlhpuxJCApGiOXZUTUJmt8UYjQ2HJA7r7RY6vsPU1Iu9ZzVNDrP5kWyeK/fHiOJrCvBRqrrP5pamPHIuLXqEJMAbsgXwsizV6piNpn0uaLtBOZNP0qHuQjHDUvvG5v7u2+fhxbNfmZEfcXvGvS96kifIm6GHujkIU3qoLsnepAzfXqOYhhdKzChfeYWvZ6FLkXQdB74tGyS5G5krTqYK5Ing2WCBuzV6LC8SlrH4yZGhnB6CRAJn6sHqmuPwbMRAjuf6sA3swdhoThsctS3oJvr7X/65/iliPQ9oHWU+YbsGHolj3O+otGga8k4tQnRSNuYEdtwtUsTP9XUAkWyO3daU5Ru/ONnh7XaWq3WsZirgW0k3kuZKO5/rTF7OBVzuYaxSJEZFZE26rqvry6e/WbuLZuNxF2pMR7T28hizvP8mw9BplGDS/yAlVSEqn9rN5f6XKd7C4tT8mjy+pZ5QJPh9zy9PQAhZa4lPI69mL4Aw/CzpsHw8++44m7QLO2YUmfIiKAInyNZplKC/OMD2Mwz5JITxwhC8+F0TtiQKrf+puzfCKFVeRpJq+O7m5doaWENBMml+fhmZvTeASI0JWJL+gVa2xHa6EovQI2YX4WKbIwJxfT9Rk5todQwiuaOZdeBLQ/Bs8jYF614xUbbksxAviOucMnqcRAChkT9uHu3aMBHUeY1dGqYOCW55UT3EVeeYxyqW9yyK2wEiPG3ZzSKYfx2r1xgiacAsgx7Ijz8sQ+K9BzeOfArorIYiyGQxXsBHhMPvtu7+nnBrsq+Cggo1+NtBxjCU4xvFIFKQ5NFJTEYCLACIUQQA8GHarGPrLzsY138262vWKKq0Y4NsBudGNzG5vIinE80MJWbKvbwQ/bwIr1i43Thy1V1UaFJfQejV4xJqrOI0V+0F1VI8BqNCjQivJ0vWlKM1JprszCkbJqRFeEpgNFu5iWOWiJqWba5zbhgrt5+481yWLZ5zYZ/2twm0y4z9wm439yt8k/fXyA2wR3pIcOITnmnz4OMRas+TIOU83mNcOyzjs6/d5f682YJUKZHNmzy6Idvt6ioWVGtgvXdlelOME0H82KQA03h3A3cibd7IdJc90okqwAitwbUMpsPsNmlz0nPN74VsBL58RMXg5qFraNCZkeLO9snUURH+asTEuvjghplbh9qSNvkV4pfAhNywBgO3JiDYFfkBPSAPJ6wmdYpPfnJElwqr8sBwq9QCjU/65XgE9o8OaVuGczPqX1EmsqAYNlEkjRlEkbBbFbIiK2am9ewaSxkFquda9Rqy/YbC7RF/aVWmIjdhC92XSM3+zkRTcedpHVlqghlyXczhLZeFtjVyXcbnT0BImSvBjOl2FBajnS0J2cPscIjQOU6g7Ldta/ABpbbDV7MRZLWEbaSJQpAR9qSTodnN8iA4UhvpNgRpwj3F4niZwFdPMcSZd9G0c6cAOeYtWKMD7ZxRmtyBEHsxjGRyALMD7Z1azb4yN7y8+UqlMaJsNH/CovFLQEC38F6dD8XD/K68jADlebctHYEWZa3KKr1e0KMQGd3rRdL6VNDij/+ZmE/j6ZorWlccqXvhic2hw8ODU4dVIwLLNDLnqxHqb4db5KMrpk5vULulkR9fCtyxEJtW7aDLq4mYT6i2wvxqp54uH7GwI4lioPv/vt+cH2TavJWPamYhs0vtMZXxUirQL2birSI0HRshA62YxjlSX/INMPGdtQXqJyBPR6Y3DigkQ2FuyfoW1HqFldcOi8Va+kVaDfsu4YaxEtiE8lOftwoC268d3u8qbRFoXKgEWvSRqR84BboNmIv7JlmpYEDjnAX+pJRpYws20M7nDq4ODEk8HqGS0PP1dLp43LGoLMZZPPS8ZApbavias4bCDPHTYsLyrty1VSCM4lU4hRQJ2UfNa+a1rXzxeattFAlpdkd90Z/MgFfkefXxp9xodNh2UT6lVTpAJL0n/cy1tRCZa8izwZiYtdmovrr+ze/krrr6RkARuxKIRJ05xuYyVm/GFfaDei1Zj2HymDiKjkMT11dLDxnUd6dwijW+aJSiwgUk4aUSyb1cXu5ZPD9RNa2sxvyrMjfOiPycdWDbiov1KfcFkmsxQQxtsBpTPj8eVNeTXnJYp9jh0jrdTuC814lGkC+QcGm1ZmJz21TE0E3LN009tMR7kkx7cSbySHlGmrVbmIwkgdFNZYNEYYzyreWhr8+N3u6iukFxP+n66VWY0P9t0HwO2oA4ClmzQeCQTUkowTJ/TUhgSom7zXzGwAZfNWvVTHtaZQoiohfxjS4T1htbYhpRt464+b4PFkTiouyadB5SqbXllZkZpx5DxzZ3eQxgjBw7sPR9//uHvnnMnmhIvycK6bIgkJIfhPiKmh3MrRV3bv8aFrV6lAdzYvDi6fBw9oOy8kCYx+O51FCYh8ay1vYjM4fgEb9Z8vNHTOu+TRw+2d9Ts85U2+i64JJX/aDnRUXHBequzUmPNqjUzOjB5CR9dzvayh100o/E+squfO5rnhtROsBn64r+U9UeucI2IhZX9zAcmEptRRopINQEIqAGQkMoYzHSvrlZSZndCHS7ZplwLEAL1RxS9+vcdP0DPwA0itLytzUHMh483EnddL5g8OlcTG3K4oI2aQLLrRq5iTDemvxZMz6zDZfwdJxqSHhUY2TE6JoOfVfvUmvWfMzsFlFE9iyqCSY1P9IF70eQ2NyIk8Lljpein4uyzc603FBO9uQGNO5bM1kahLlGm0wgmHlMvUp5/AwhxRMHP9odjF1VD2aQFVSj79VyKqg0sQ6z4l2qFUdie+MfFdidMtYS8S9iHsRcGOAaHoezdWaMNA+s83DAHpO8bHCxO+V9kW+IZAsLej7kpii8DsMYgNcA0+iYB/HfZWAS/iWRSb9p+3bOx21nXIqgDUgachzV8BDWMEF7CbPoa8JwA+A3sl57T8KmRWBU8Om2JQ41BGQYzjF4MtqsTlKFFgRMAPE8x8FSgYPhgz8m7W5Qay4owJxLBGNjWCAGrr2CEFoioxTNdewyS5oRNTJB67kv3r2p21biBUIe1N2xw1NVWbEJsDvxHKf7/O36d6q0o3Uriua6uKdkz5VdReVeW5mosVXKTbXKk5wr83FSH84f0vrYpfRdlouiQtSKE2MUXomk9Vy35Hzce1Mp3PuvV0tvH7GrUsZAZ/HHfYHPgrd9y8T446cA78iTty/vEAR87Hhw75rcmhQ3Zveugfg0eHPdEFgzNXu6SlcCHaNDE/5xEPQH/6OQZzgfO0O75hSkyUEBpIrHkQ1tEaRLybk1gOJuwXqbz54df744u9Y1d4a/f0891zEpSeELxEG+qf5bhGVsTipOUvmX5T4qmsv+xMY4ON7cHt16PzUjCFw7moRSsMTgpyirlAUaCgSLOpZB+0lgMBhAOLBj06vPa1BH/N5ZEkIQTxoZuVrOgwbD8986j9nbcXbdBaYcTk9iNI1pz1j+pBo7u55fsv6V5MxHyexqMVEZ10aqipim+a0tvfAHmj6J4Hn4PLhPYYTmOSZw3OeKZ3AkoowmEJGfQ6O/JaaQ+5moKmj5icnfUVyGnl9E7LSJYYM8lhaJsvvJ7PM/Fa9NKfI2n92DTwnTB6YFgv0daU4dGLF7TikEQqvqCFinTg0haSiBL7zom7Hau6w2v226/2bqyaliEZY6BUsm+EODarIytO0m8qV1As4zkQtRjZY7eGX10ZrG7Is4krpEygnHGT+YL02z5n5S+XSadsFg4LhisPBo8ktYnkmCeIXsR8DoIN+tRfQ/LVcuFFi5Ykem9nc3P0dmuw8RrYIk95i9vLF610vYgwUR+4H143uzlvZt34RH02zeYdNQeX6/DGYz2LauURvmzSi5ZMh3k99ExqIgEOOxnM5TnPTLh0bnjnHEIuhWhNYq6NFKtTE/YH5cbq1IT1ARlydWc4ffsIudUcTG6Z1WQIyrK/Mg/qAL7Xzx6U05GrSgmboxxZdiwnKOEeOMkV6l5VWfNwAsTUBSd/dLY8r3mVZ5EfNpf79zmcONAlcjid/BHKgGVUHE7MApgpU3rRk7iZSS6xJ0VN42KDR+z4yu5nBl4tolpFRpsKjckecxM/ib3EJEmNJTvNtXO6wAN1lX1FHrsMM+ngRfjVeUPkpZbYgyf4anW0fWdne3Vw4ofhm2f0P1L5YcWrWhNSAB9McZZx+KOd1Uq1HXetntzZOAHXqnjJgpRu0YtDpYq8+sjc05BP9Y09bsElMv2B0ZN6D/G92pN6PlbjQUS5145keZGPwksLdqM4Qfmie5romNfPeKXAc1hYciura0XT8rWeEfhSTS8J4PDSLLvW3135YrC1OXj1mfNYNVpZb6omNU3hmUxbpPrA5tVIGlk9b4GBqch69GbLrBHVNZBqWbufbaBIFrN3sRkKRfBalRjTVnWoeQLoSNP9bgOjgbZqLSHeSL5bTNa93uHxnd/2s7DbLZPpSt0dpU4PXHTVC5OZ1JEI4eVFUZgsWtOv9EL0YJLE6IWiX17Ck0lxsvBoJiiun6mX9hfSDJmbKGYtqZFSWTaUPANXvfkmq9/cU4mwfvgnEdkPz6QR14srI6K9LwPpveb7N+B7cdL7Rri3w/mJSnvSDkEURqZ2JFYka9d2175RTZcEz3rpMSgldnalhaCUSStpVyJQpBSHB54M7l4KISdKPJBHAIy3+r/OY8B1pqJ1Zk4MLVplHoyobNV7PBioWTUxOEQhcQSFfer8fKGHAreXdt8sO5pWewqtKtUFMGllvg5W3yLTKkKf2l2gTQBNrDBXIKo4VONA2fC5VhXC4YUaayPgmaOygMgcKPmHyZ4PB0njqKQKSByNREjEYIQCCEUNihcioDBm5mHgYd3dLptF1n2z2CGx4aFipZjIyDjKkb0cvEqCkicnxZyNlikoSYdCxVi1PWZ1zNbAzJiN+dCbcTUt6tTUqipT6FFVorECDarT1CZUpSrJWCFFisimI2aiabBI17iakfgKUSyiFUwhtDPxReWYPLZcsVCjNWqrU5cTVpGuw/3b649+1fb6ow9urz/68Pb6ow9ur//hgO31Rwdtr//h42oBk4TxRy9t13r5FOrr0t7iiFzl5Pi1Kebc9hA50BvVUiUC7f18oYvAGRAdkV4dff9ycOxHUDWmM7VFYSZXzx6aqCHNC6JzHPV2RSRJq4EreLB6nKHosR93tq5rBT+WQoBbvVraV/qQ68m798Z7QOAt4aIqFqItjdNDd2QrI613ZEFln6BtTdq7LAdgT4+TlMG57dGLH2FnqPnuf+1oiESPMEnTCnYn/vmXy105KUDtAPEPQe9dGdzeHJ6+PDi5JcFCkl9wxAgDTRiAfk22j2t6ife9BPhxMAW4/mwKMYZ2LCWg/eXu1hUcS4ncGvYBqRZrylu/oc2497hVhC5L8Y1loLTvQKNznMMVpac88EfcRxndJdVW7Uvldr+XdvXRvazI5+ipsxzZzbMM7dfABWXT6adnPT3vx1Pxm7y8Mfr2mb3MBSuMxbF1nLUhvJk5xssu0N4QE+y7XlNFSl4kT43tUyRw775YIa4lKwyaNkhF1shbc3LSViRd+8ijbDncwxfHkMNNz0Yqbuo9t9GsaqN1od5doXYRAx1uTPqPC9TQogWolCAaldJfy/QC+7OVGp3DfiWORlO/z97evfqEkDnb+y+fg11Jsv0xRCLSFxvqT8fLTWhHKsvty+e+3IR6RBeb9c0/9DcK78SJh2g71zIGVrFZWtO1xgEuvbby5oHsJBOv7ZfPB6efGdNJWFxwd3G5Ak0W0HSGyZd/uaol8riKrCwL2RA/vMW1DR7f370sXvwWVxAVdvduyUVIcX6gUmq9P4rLRr79ETOSi+XUkD0NRjcGjTffDr+6CEa3IKn2J31myEL4OQFxrvMMcawz476d/sI7xvUKmP0i9CmP+6Rpe38U8zXWoUpvXIb2hlbIFLADvXumS8Fhb9py1MpvXCyhbJrSw3kx9Wvu1CmDu2niSP4v3UJTxkNw2IcpZw2sJuxzf4PmNZP8Erjk/TDXG5f8+FvDu9+MPn81PH/fahuFamSp9CXMJOkPeyk7OpHRp/53czjc7G9OYT5T53bvvR49OqbnAhmERrOM8HXOfP5k+fqPldyLr7WY6pdsIHMAyvRaBMkYbYNKCcVmLHT7CVONPT43eMOAssNR9VymNmmmNoguM4hiH4EJiYZRpGAkRYCNpDicmGs6cVnqduJr3j+XqEHs/TV4hUUsoU4cTFAXm1xUyjrIVcq5+mpq5Q3ymWSiVKmhbVQq2tc7T3YvCpqlDlZETtNgNgVKs77PulqFUQJorkiJiItnhmeumiZMC1W9GSEn2qxgGS5zUlP+Z7d3V4qwAulmTHh6oXK7LT5um0kKZ0UNv7dpmJLc2pamgRILVHzkeVW9l95O6HkW3dzjCGaemf3led6VJayh5YqYH622QHZnuM52oyzzop7U2onWxeYzbSba/p+ifgjeyu3/M76ddUaNGZjkRWAgIG/v1Pm9z+7Ty8CIpFzLXETrmHjxNnTIvhYJvsN7wQZFe8mui3c30FFxXbQzK9/Nt9TKvC3ngfiW+Hcpv8yeVOkuH6txHXH0lGtwra2RzMHFrZ2t50qGSXJr5X/tpq1I3UvoYs9oK3CNY+wzGlfazPfXnNCCCfR82ys88aj4/Fz3vleFMLoVIhqbHT1KbNMXNMGHCbLxI8MD0VI82zbUbmsh3swkyz+NJgYPN0CfvSDia078U8/K/ma7lrR7fGyjJffWsro0wfWRE73605UmKO3CMwxXzu89uo4HEIYOSRx2ZxbXo9WbXYp2UCvecyevvkKZe934mYhJLgDH/ALGFYkBRQN+g0KoWx6AuhX+H3OEPI6NIxh7IE4MODiClB9ElxG0BBh0EIjHMOjFzyHQy7FjkejPqQ18sN/qDw2fOSgLaExhk8oV4GOQZz9MMogkP3NoFEOXCrqJIUcMNypYI0YaaMs+Cr7g7bI4JB7fp/sruOCvRQUBENCATVm1kU6iZRbY4oKWnswsCOmD1a5av45+jA1oMJ1uMiMzR3bo/Tdlwc5CeXMziRW+EG0vujpYGJbeUVrbQgnxK7/cp9JNkQfdxj8WZcY6LIl1o2nFg39uqtQ1XKTQTIPpuveSO+NrnTVGrCvshsryVi/F39XKqSL9N6nX3UyL4k/jDopJP3DfxAF3q1ti0l/dI/H3B3gk/u7QIb5r/tAhuy079PdR9gb0W0lLAgy7eqGTF2k2y0U3hHMBag62EDXRmAFMdv0SBEnIZOvU7hupR0TmMG0SKiNMt6ALmqt3JLYjYqkEJVXvpw0IhKrnQ6utU1DyvAkmEUHFd0vOrGhLrXvpK11JXL+ns3INYb4t7yCH+b5YRde66WGmqmf6YwuQYl4UpgLsosRS+Myu2Jqz+g6/Xdld3hYPaY9nbCSB2ReRay1gQr41kjkVIyjiCQIlCEagaN6p86PtmzRmgwtLCiCYaK8bJVuTuaxnGhhW52KWZC0bjMhNb8gxD4mLtu07by+RQGzbRVytq6xV0kWhOtNYbnQz7SaN/rJoGInyA//Ppmiy4d2HhLR3r90MpJOH61nX30RWgvaFkEIqQeFJs7+s5bg/UUkrcjqr+XmEQ9bPDc8fG9y9hXdLMySS2OjNJszB2KsjSIwuLPJD10vxD8rjcrTAFHeQfcWbgovPLg/WV4evPhu8ENcHF3Dv8isqA9mXCpSB7E2p03dODNURqQkhIcYXHo+23w4u3cBR7nRSEdO/35b9Cu2vUHtcKj23sEgaeCeAFKD8HZ45N7zEr7YkO0DvNjcHb5ZyNTGagrbx7dWZjeXPyPtbFPcA/wsQN/ziFEPvL0459BZJBr0/Vc6MtNHfrGvV7SVEFOc4CGYB60fpv7qauAqi0pjxI5W88xh/Js5YsEOJ9zxTkIW4Pprzva4F99EXYU7sP+dYnifKMmJH7rtvV0er7/aOP8HBezeVw6xA2s0hLPlvaKoqLy9hqVmNcbyHnIh7XPOgW0O6AU+rq+94p3D2rO2q2ZOS2hxIOb+c1GJdH7OQU1yxA/NcO9IUnNbnJo2G+tziu6A/K40yaTHSNjUhPpGglxKe2gwE0xoiewW4cmnRzrw4SvbCqb2v1nDmxeJqnV7p3q+SENU8vYpeg9e8DBupOb5Ez9Ff6wBhPUchPUmOwyc523i+tLP+gKHDFQ1LW+AdvvJbibha2smZ4Ksrnc7pS3+Zv0nXO4baILEme3rjcoTY0Yu74HJEuFQnn5nzrjMXZsv8LkmbVIj4G1wIAxXxW2c/3RaOHpFFoIXm8+7WTXhhyIwW1To6rE7o5Wt+jFToTo2LM1TTsT5TS15Yh/o7PH/GyuvwtixIL/KpdqpuUElAKy2gS8vYKXkhIZ3dR1tOYSib1rShc0C05HKXNRXHHOkqxv6RlsFfWHv0l2XbKBtJjnnQDdnn27RppA0kiY33jSzaFjRtzOpZPZuCo6Ehx3zhYif1ixL3wkPxqdDQoOOjt49GS+dHp54q9+LhTCxdQweANunGJyYfp5ymEKEZYSdDUkjE2GYmktMoEqlLHz55jDjtTKBOJTp8ePUHG8Fuby5YorC01Vy2kPFYtZVNDdpza0mr3Kwlr2+VWPLWjPfEtGhmeMtT5jho0MtZPQ9X5aUgOAJZjD+Bm43ey+jxscGZCzsbkm5R0JphOkUwv2UqObcXDpGittWpC5lciURdJlvX2ZH++NjesVO2+ebqDG3zEbR+03+qYtupcEBr7hxhG5EOMhtGoPC2Xu5YYtgTKcA6xgmw8/be6MXJ0eqDmBygly9yRQjmguIq3E117TGxQHCYcqEpQgF195j6s5jLlB9CGShSHZK8m2ZcmcNQCoe8t7KSUYrOCQ933kfmE+WGQUp3TjmCslTuNn8UvsTDzOBERNmqEgc6oRQS50aSxekwM3+0cNdaDluL5iyZoaYdwJg8PX8RQZDixEVpjymqPM+DzC3P4GaGWPHnNpP6G7wYJft++zbNpN2tld2tx9gn5M1I3LwROxDkpk2kZLDSbovQ3NUjhuaGK9/ufbVlUI5rqLf0VIAhEmflyRCl84Ty8jIaIomd7YTR2b17dHhu24eGxdjQtIuM03A16t3ScrtJQQMkkW5CS2PF23ZfPx6evaIlDLsc6DZjUUNzJU3gfD6ZrmkO9P5LFpTkx3yEVUlT44yPZdWMxmKiu0ThPvYOKMAadiC+8fD9hm0PbEtw0M89a7pMA0RMuol1GGgdsNowtTlMDJnMGXu2AV2HuAHcToahMY51BBuhzl7aTgt9bMGJTjltLvzB2Sd7d3hlBoBZ2E2FpNL6LQoI6Q6gwQDfiqyTTSN6iTd+6vsx4OZwDUDNThpkNz0v8QdVHJV6rpDTgAAAKfQJwERuHQMgjjoUb1gJ3Lyr+cqlBlnAKa6/y0yqGzjuEzxI4CNWMmKrKhRIjJW6uPqzLLTb0tMJtU+iJwAz3aBBieM1dXqpenZiHeoK1OxJkfpNTHbHdx18iyncRqZJt1Ab+Bzrr6C8TJ0W9jN6gPfe4copaSRHMs2q51k7xSGBDhN+uToLeLCz/k7WbWo6QJVI3E6k9F3dQ2uMu0x++yGXyW/f5zL57XtdJr99n8vkvx3gMvntBJfJf4viN3hHwaZqfEex3BXN13j/fuJwvpC4tcvrvxdTp3fW0r/4erj8aTh+2Tv5pYJGvls1ONf3XmtnwQjDmrInJ1mUygHgK+9K9rcx18BGkV0YbW4O7rwkg0z/E8jMBUUIgreiExJ3FzDEFVKVtJbOGFSzwxFpBEgNByMk2gEuS2RvicWV0YJh9mSNepOv9i1s73xbZxu6hvUrU/CoBrDszUVHVtHGMDq6ss1hsILcpT8FPOoL/T8BRxe1f6x3EUJdci0iTBF9MIwSPRjGRx7M7uvRhoLLxtdSp/bJkXTh4PqXL8ELJth6tPmdYeuGxuwFER57gO95y/3cpp65FJ+NlJ+IquQblzBeHpRADURBCdZNAhrzChz0GvvVPtDhlGWpVyovy4xzN/Q5OTqm20J6H3cNndTC9NQj6tfercvqybBnzujeom4zqdD8d84l8lg8tigPHiMij7PqF/Ki6XOR7zYukS6qPRBQbnHYZakp1XECUBBcTQVHA54KLm3UFkP6nR4BsgtBO4mzN1zmYypc7m8wwN/41BpBPBPPuqPfjLZPUBvD05ftmHDB0tZUbHjvk0YiOviWzuLtckANJ++m0fLsfcLvst7p4fSSeXxauV9QLXJvoSZlePncW8JCV18Otr8a3nm6s3VRDvi63bwph8MEeDtmKll0LJTWjk1Ol6uoQeRVJLkSsT6SAcHxCITlNMPLpB6UwUJNSXPu+ZHU9ldMnfPjqgRxilRao231Pplc235A6p9jga5V+GGhTyDmT2P19rI0LrfHkyqvlNvz+GOpubd338vudbw2bi+XW3Bvzfh/+T5l2sTSYPNw/+vdrUvIEZb7a6UOFR/mtdAjF9cRee4DsSgw7RDiv9AhC/4K/fEaBRb9hUtS/cBC5aSHxi2O3oFhnCVJ8QP3IGVMca8HWyvFVE8/g4znp2PTUnXn5eDSFxq5wJ7oadsH6TbWghf0q70vSSjMZeaHl3b65fDMu2AHWJq+uSLxbTEyv1aQ7XrQ9Uh8h3dcRj8lLezdeqcZUYStZfNd2PtQaRr3oDvvNAQ/qFANphFp1lmlctfDdCF30XN0WvhzcUy61q2WY3mcEcqBuWwunGyw16ZJ2u39GbnPDa6EVe/p4PWwzbjHu4Dn7N14Mh0Z1Os3hqe/Gpy9PXh4TqOgJABOpNtw5nPsW5ZO4jOXMdLa3WIEN+Uv03xbZsfQtOJSHHTXaRuGkddqLrSSZbmc2hpcumC74uhejhCnBwpc0kU+m7JPL1yh5/r5Qq9hMQyBUlp04i0aLmeV5ioM7ABqGTcjmyoIVxeQfK7MNZdYmW8QGXwTzDJpzKUJPd88aSd3T4AOKO2mPC8yI3YndVGC2H3v1iUL1Qrk8OzpLH+TKMe8zIiIQjsOqwhPjIgKf1xJfHCJpAa5iiF49FAad+zwSQglmafUqR7vHt29u4SdRKvkWvEqq7+S1G3ImP75L36Y3+DT5R4oT40V+cvhFxpmJNioFQaryOC5TJEFyLf/dEUWIt01+vF8uEWj2pOMM9EsfK3J39gH3rG7tXGLiJSmERTJIixcbZI3IiD/GPAL6BHUDsRDiN3geuC2ShvGTQgBjtAdkSNirGW3GDBl/kphgZPDlJ+fSV281Xd7VzbBgTiGPW3DOlH+OOIcg5sV2OWYy/BWEW4KaG3yLWnApftB2j58Y8gmwLNwW0A0B97mWMgRTAQzfiXAGAMpDgA+AFCimysW29zNmcdAw6juM/BROHawwfit217ejAfLEX+ZaCuDnSyin8afc82zx+k2GcVvHqq9snCJHrw7aluCRZCcGrYA5q6yhlTbJx+6Q5sIdTL8U0WNwpq6jgq6WDVdqBIQ3eE/d23Wy9QltHiw6nB1lTQQcPM+PQMVM4H84f1OjI/f58T4+L1OjI/f58T4u/cQPYw7Mf4udmIk/cf0uKq+6OsRZoIBFHuScSCXFBq6/9nwy2tIK5lLap3CEzSTZsnBtzjozbu5f7a7K2e+kONnvizHD30LEYXwI+8DYnWlDxxOG/WBJpj1oddlTzxuzmnWtZGeH+JIVQCiSEUGbXjIDLuMIj1CPytRQbmgxd/g5OoCs4DrqpfBNTl68Xp4fE00KGc8MF+TOecYHgRRGkKecelRBo6zTKP1Z8S6gGFSDnEkr1JDyoVBfLT6YPjVi4AVWL7avzLtf99/3BEmqjKR1Cmu+cfHLrikeVQgNr43o4BhcP1zA3/eWfQz12f0XuZNvtqyfE8+y5HTQO7R0btD4behTrmYDxyoyhGlxY/Jkero7SNEkeFIdT4vGmNnqs2soD5Eh6oc3zND49cjo/OHyOvEISbegBV+h/PporZTOWPltvbt0Aq0FzZp9Pq5oXplm1Z5Dtmr+XOgSvp8ps8hgW44nOEjp2RWpbMRwmU+1osakRA7O4t0yqG95R/2lt9ViIfiRrh8osRA9aTYqERBpXIozkFQkkLWdavAXNJKENCqaaDh7ub28O7SzvpRhm1XJaRTRLIfoKFbqxlSrKm9ieXZ3pRMjVr+75jDcsIfJu7VrTg03Aaa8xHa2ad5IdEl7A2rM7OGHZrloLobbX+xd/cezEantpBoF3LtAT0nqynxbqIb9JBHZCuM/IPNaXk8e7arW4ONE8x9gAcret16NsfPZoJl85TOtBTD6P6JZkKIQZak3l8u9j71LdTe0TO2itIy1ypfGYTYdG3yUaOPEc/oI5AS7ZvOLZMkHysRZbMy40LnU4lOHe8f3EQZ/yHVPgbB7NWVgxoLXUUDgzsvhzc3EcC62ErLTHpt3eYRdfE5jabLfcLhCouh47JLe8rxQyJWJkoei+LM92KaMBq/Js4kQPmxNb0YNgvM+RB2Wie/1E2HFNYmAKHU6ZBgk67VyoJnV07j5CQyjCafIJ69EpSlCPLNPK/FumTRCt1bSypIKSqWUM7Su7R+dvT9D8qGU7cCZ/Y07JS0UD45MPae6Omz9AJdCHeTcj3CBWTzBukQsmh63ovCoiXKw4TrIeejB0oueNQ05+PBa3jUWHpR5wnC7I1M3aAbLBVkE9G+2ly0rDNLJ5mtHJ3vHb032NqMtqdMCWFbrtDF+DMcAvfksHP32Tm6HYPX8D5xcEP83K34du4P+kEAsal+DurC15/bEbWJCaqaZ9o8aIncn6YXgqbmg84yeNRQvY9VtMBEzDC+yWaYfLYZxjREYSN66YvICKcWcIe7LWqiv4IOWHyTQnCENgGFS46ZHZpqf/OW3ykd1tuou+rlysI9vFPMm7aVoY/QnksLCFusmWv8/ODqKpx/4iNr6QEyx7jPRyl28/60GS/J8LgXrkcBAvl4GovEus/HiSx2IWSyZEhCRyYLyTMXNenMMsS7mJyWSwhIzSQIVFMJWbgf7130TKG+eFwSo2eXAi9vi4nE2s54IbQwL530QqM7p8yTKPWNzY8oX3ykhJLWdc7Gy4rCyadCGhRndXnXNKvL+8VSeLrXuBwHLSCh/X85er0yuLBGa0hTuhZ7lnxn9H4tFgF1IEl3+ky0dOVp+NyJ75lcg8Rgdfg0Cdg7pE/aWdEEdVj0cdItjp75uD2bzjoIhuGQsvDtPSgyYMjo98Wvu9nv7Tl8y2cdtkVgLcA0R5oB8UUoDPERPwv7MgdULL+Sewxw9RSKiGUTCKLYA3ADrgfjfPSfFsnknxoMiSBIQB8xaogRA0InZqx+tt1IT5NWEYFDANzhdrpplY7NkslG263Y6Zce2WO2mLZkKTji7ZaK4XOrF5m8qqmL7Zsm5ZvN4HR8sRnBiB1kaqp2woxEZGjcDIRPrlWNP1U0q6pH06yF/brYd1usjCNNnAUlqJ+EJL+iiE9tuiJ2JeyqLtaasohFx7mCC3pNMvadyluXvCuwSHEF/TJB07iGYRRY0RGBTuP9DouP3uew+Oi9DouP3uew+O17qDPGHRa/DQ4LrqQlYID+0CtLcYlz8CJ9kc+cL8zcilEFrdGLlZ23F+MKWrRrZ49tNrPgBGZCtxjJNM5FxNtWxHPMpYd4g6+dmtjdOjm4/3L0dkvwNmIw4kbSblY0NSJLPsjE6YCKSIQphQpNn+tnSZQWXiZTTv8/UwYhgUQD3zqgkplxLzbdLi5suS9KuY42vUlTiXuV376dtFoVGFUN3w67XovdNlTVagWoHEeBQx6/hdwX/BeDS8/wAvyuXKvZFXz+Ksy0ZObiC6QzmCIRXhKPDnt7bfDos90HtL15J0ZTzks99q2MBcRf1UX/ZGFM3Pqmy+IKHN1IWphvM/AgtzlN+S/6bCniGQ8r4rt71HjauUibc7QjugT3I7YkKYSH2ENLVAaCSlSGpAPlXvuKgyRmoXuESBUS0mZFAO3UXEDJZOKsmZ0vk7Rx3fzhvbqRyjjHz/Zx0PzwlAv34ZzR+EB1p9x/lZadylbZ3rKeNl67GZ82KmdRQnvjLBVRBrMgSHYm/x4BQd+dPNwgUQBbhSb1JJZ0bsVjEyl/lTivcX+T4+ntWn9Z9sgo9fBIC72Sui04KnqmbhhGu+Ww/lV/uXRgH01hPBm94HBr2X9KKi0DIEajJe1cxy6x5mB1wQd5n7J7G77EldG5Vzsb96hrqNNNt/2x1mHveQV9R8/oaeV2JeBvlar4W0QK/g7yUG82KxQ7VL4Jd/RPt+HkPHpicPImioDyyUhmrKv4tRPk4hvPingyqBBNCBc5KoSh/IKmORSK5XvpfKpd0IuC5rMp61jHNO60ObG0gZ3tpcHLY3BioRk5sW1JJprRkmWQbjsgSI39WCws+LFITvDNsBDD9irG+EWm+ivaPd/6ST+1a9gAcgdP6oRJfRATf968FckJyXcmQ5LvdPw0nymSwoyPbKHapA0yCcL1S2y0UsTlbiLyp1W1MqMXW8M7N9zKNHqc3BGo1kXbZEowxg8NPmxVNiTTdc1I4pVF11Ru59QVPkHN5nu55QdKPktriismEkzMa+m/2OGYudhRWoDTMF681qICnOIhlUuZ0Co6hSe56mCn/knQQl1qh0aijK5BZOlLTWa6EGW7+W4veqvJTL2/aZOONtgQxi/Y+kbbbD4AIFuG7lEv6N163/pP6xwKw8VntHfSMWrgf1tYdAdxAnEPxY91jxC495OV06/p5f4Oxr0D1OmkwrSviXVyfJDAwcjddPdiV64n6K8zPfCU/uXyETA8EMbZ2bpq9A5cPa8ivJlJkkVLHLUksTUVXLShozQNNQsMXR39+I139bDR2xVJSRgQGTuguWDzrQLp1bDziP8Dpgs5kOWd7ejlafofmC5GqxxtyxIjsoukIbMyKeYTBO3zBZ6RSTGlV1hR91BtltTz4NJ9iWzJqePp4XzOXTIsRrWgihjXgvLIrgbpYUUNsoygBSNSJV6C01Wepf6aPnFEsuTcGCYeVEtgxkAjxrYU+msJMLSkk//Blrm/LMcQZKamkn+xGEF/TSAlmwmzEy9rZ+v64MvzIY+J0wrlcf5UtYMJHsSNYOJPYSbQ+g77h16b8TucpN5rkeP3i4IU2OyLPGg0UpYEnXmtm1Kb65msSY4RgHqg+ryC74ufbmvXjq6JSQkg3sG7f+goY+H1swa4beesdR8UCQNKs59e3ADfj06hhlEoGOoQOAK/MUp1iBrAqWJKxYKMAQ0IEgQECnQEWWScrS21MFH4Dj/nEiP4/ejxZ7qVd8BoqI9PiSPEF6G9F28AiCKUV/htRXSXISj5dcBOAddEUCkCSA6NIkjkgCWGLgAcMdRQD4vb2hhRVH4foEIwzMWBv3XzC/MYmdn+k94iTOveV1LH1Oyh2cBGUK7BBMD1An0dbFyh9xQfusXvMGU+psChuDEqpqhtgRb7NbQrZlWdkbYLmu4AJRnpR9NlrsAkFRpuldGTo+oX95//2g6NrWZ1YXBN0qSedXrtdv6H2v8Bn8OBzKAf/LU7N36NXPV0fPCn7vb4+AC3Ryyh7i6QQBz6cXCBqJf5U9pOFe5lJts9yxyThdZnKDUPosIfNrz7jtMgYv4wSBFtKx8lhgBntSaRsLKWFmZo+myxFslHIoOUKXuHTAhI6Za9WUWpnSyiImSCSKUilMIcZnHUdTF6eZE1OFgJs1ZMF/dXJlSkOtd5/y6UFxKiZxv45TlH7kwD0cB/FbavnKH/AZJIZGqWRAwfLsc28vYVVBeLKq+SNOKDRHI9byQkjVTFJ3OR8GRiAspKt8IecuyOyZrLnTyEILKAMYjgCIqpyhbDxOgeQ2RwumtgmwIdEHLA/sO8d8zoV+sWVvbx/zXau0gkr2ve8GkJLZTcZQoLpq7O4D8WngAc96rB27vxZGf97OCEWPicJwxHiHhdLZPGB79WGZhBkVXlwvELinL5Ob4VA9YeMaSsdCjFBemOMRneeILjCe8DV5HRsUIhcFpOU1J/Qo5+JNJFHXJchx6uOI7IsfsmpGzFcbuVlC2Ly/OUrd1nNz1eRmiv1CttyZ1tc9zYhb/EmT4IFVfWEtQtfKa7aT4ZZnlxwtWBNDTVGR91EjM+dBLknYH40rJRSVaXTA6+VLsXd0375TIwdBZPqEOHyPF9Q8fVYOKRG9y97CPXTcK4eaz4MgT9xZUFl5NRhE0r8O7lKOSZBFQGyrukA+WB4dWRCn1S1eB9IjUTDxMXho3ysl1iNVsbNViRqU2ikKZNgjxLe8yn3G3FyS6MA1Hjp3I4z9gORcPgUF46P1x5aN5kghwLcXIuh5QUCY7SUFWE47PAtIK4wnscYCgVXFYeDq9x4BeQywL/kmtXNwP9y38qWfM/nKvJRMx0v4f7cxd8J98lW5RZ+18uqJDI30hi3GueHnZoTk/DvBtjTyO28Vc9jwpiooWuht1xhL84xPgSQu76K3axxduQhTjWf3jzFmL9afK0mGyhFUgeWdY/u7d4Rb9VqR1FlLt5ldmRJGLQ4DpmoR6GggwESTbUL7wUUqXAhNcYQjEhBpcfjx6fIYmYE5KSwFtWnRHcz6RdyAkRsiXapKcbFkiMXTwHQ+kjkyzq5s76Uzy1dFBkasVBrv1Ry6bMI4BiIPTwuGJJJ7RhDZkm1+/KXoi5mdn30bFjYZbi7ko+kLDolCvRlpzuDnxQfKsOVH95OuHJ0UYUbuWbpGRJRK10Y3BtafDldXQjTaenCS8c7niIIcjQ0X3hQC9SfEHpI4jgwkdyPwjPw+1ZWpeEOuEGLPSjINJfrgqD/U/PELr/cGVw4bTQRB6X0ej0OPVFM/FCQMZKG8FMttr49mgwLh+PnLaJx3+RQQAjbSetW/sykUPrNI/RdJF2Ohmr3jSaHzh/5ulRGAewO7khQp3cIgKzlgVM8jg4YudlOpvsw+oO0A1FHwx8DfNqhrViXcemjkqr4NaRrWPOQiGmZOyr0pgJGHO48i2Q4T5YiDDtcdgWk0QGhFZYddNiX3FTL2yKUAUrjp0p9EH9PYsnVthjmMcBjyW+p9kcY9TE8sj1cA4el7tHYe8DqJFIk3BboXf5Hfi5YwPmuoARjhCBGlzY2W5UMbO0F9aZ8LvMx8UsZLCVsYV02+hm8a9NOnKqJtwUWwdYmo4GprCZufoAjCDalKp+zf2y5Jco12sJJBOtMlLQrpzN5xPrzyg3TJ0zUCiRkgz6UbRK0ImmfOxf1WD6K9c6xnqaeeSELlPXMKZbCuccb2t2oZLQHkct0P1+hpL36PXf1xZbWfLPH/QzfPDX7mf4NXLVz/DBn7qf4aMD/AyQkBw6xCIaExwNHwVHQwE6xrRB2xk52KAe/K4AJSNNItrV/N/bEiYm4XZtJWbkOJ8On3PIaN4YEBJdXx0df7vz9p5xM/LpRsfiBtCG4qFGf3MxCTvzY1MaOLC+Cgg0Z2QjifJNdnpNMFCmLcawm01w+CC89ImeIe/dWNUD5MNlEp3TJHxSk/4vyVwQxow5eq4/K82WlI9UC/P2HleP9JMZkmKnguhGWWoIGtNAtjxIuGRYgkTLjdGLM4Mvzmo3Gi0r7CdHZQTdwGMh90cnRSaick4ESaE3LEy70ybs0uxkHQxN7qmPaaac4UlTeqhBI1wFkv38yEOxtiIm/53NzZ2313a2ttCm8/mnnXyxI/md3Ti+hIVX9hWtsQvehm0rVC6KvLQEwvrWAltWHVk+sp2Vj8Et+NoP9DJjGJfNCQ9pT05Uy5oIwY1pA2EffhSFA9/hVy9wECUhNYsizCIMmq0ECT1S3Ym+ZP+MecixbIyBUKwLOnHj9M7W0Z3N2+iY1xetLUadk/Qa6xtybRZ/fdcWvWd6zthG1AO/bZ21mfAg0izZPf1K5wcXVQheIf61TDYllQOikvXCcX21sInhINzn3w6u3wnQiiR5uQ2oBrKbJadlBrJWBixMXdmp8rXKrPr5WaBr5aLNd46aSmikVppLXl8OoRiqXAWG+ikmLPQU0kIAM4nznYNnOeEjsrw4eShwSF3cQk5X3tSUroVoxOjuf0XgvhDrVDoRdyBO2bL9nkhIiymuvcNnIbIKOLRkTrOszKlaYb8SbyFvso6vxWfgEvWnnAlc0jRRmfpCpwhFNJN2Jji5XUs0vkEZMjkNXk7vK/lm1AJN3NH2TU85o55qO9EjdGrWeTnJp2mT0He4yfkcSdvwJ9i9c44kj3X/MC+JsE55LEPv+yt6KS3+EK0IFRwvCRZsPRWRUT8J/nGajGp0+4xAV3A8ciVpSXIVzbGQdpTySrJrMI6ERzi1rxXfWZNSt5pjJiIGL19FCU+dwxHlgWQfK7WXfc81bWJzUavIkAqBTr84uHxh78aWEiF0FnLtkkvxc2YlsdSDZqPM7kk15l++7JWhIjonZFEXv3gyPHN0580N+JWoj+HgmR/RtIj0rMSlza5dEOEiVkyR1CkmoSzx7T3UKRaZrGPUrIoIoYhxwCCX0jIwyUQjOqWFYUHaDsiAwSUzM9q+M3y5DtQg7QiFTM1qAWbzUqmL/2lZ8kbXST0RDUeYjwzv42M4CmXDu5CUcQyJquJ5z+6W3smMjtkbeDb7qx7Twf2nFp0wr+yi6IM6/plP9OQF08QWRzxrGRl5+m/uPfqyESWJnfpMUxc970TObzUCPWsQ5A0k4M8/Cacx1OE3x7GJZM/TfNK0nYM+LHL4Fi3T/HYELna3otgnutMfFPBfHHHwQt9uWqmym/bzrGlB3FNZAT5LemOtfB59fs4xaivYbDw6Pbj9tbF3+J051/Pm3I6uQXO5gmAwu2YlKGuWqAbW1WkvSYlkNX6Ysy+wn+lyUCDbqkR5XDkL01Ol0no2U339sWNWXj/X+fZhISn2QtKCgE0v9WLhSW1Ri7T37xWy8bEIpNXlnTe3jLot4fjXrGIgPLuxhaxG9go0A7/B4Ow3Svgk7N3tyf4FMclmhivG122uWlv3jhh4xmdYcYXNwMyGl4WDFv4PgKkI3DqydVRrkEkyqQ/4MaO9AIERKTUB3zm0G5dZ/ZlhrAKQiMMuEBnJOus0cjksECIAFg6ENagS4RNHJg5KitQQRJL69lnJt2HjHDGgco7aSjnutG+/XJyOOLvXrumdkU0v7Kf+IWduf827OXp8eFS3u/p7s2+wWAcZOrdxsVmKTJLZEaQvqOUwEqmOcUiiAft3ckP2aynOmimZxbhKdn284G92vhKUAvgA3WcUJZKi3gg6y/UVGFyb5ugAH7V4jORH9gtTMd0Mx3oz9XQm5KRoWA6npJz+QUYk8SR5BCbw+rYjEf31zts7+uvqihzzFnTyXxWW8OGf7/MXvFfymMPg4N+6x+BvP+QxEBmTYhP+NopNaGZcZGuuygTc3wR38the8FMlU9GSn8KUrFzAacpEuZXdoAUptmrWSBy62OJY61TZdeFEkwRzzo72cvPwqTEx852XwxPfoljuYktqjmuT7nMtGVnMaNKOfa/hu/gua1ovfAkVfz4bXPpsePch/Hv0W7FXYFj+TSqX9MSHgK581uOeixKjoX6O0er28NwdzSCQe9RTWfam7OwDX/gcTOJwPrHjjkvXcdAxU++mfu4FL35hZMPw41cliDcfvtXhS60lBG++SLLgMcmBIHhd5DNgXaleiOrec9LVz+pfv/F6eOMHTrw6tanMHZz2TNv8dtaNIgIgLkQE2FcTNRYPIPLG4wFIshVZ0kyPfK6dZlziAacfURcFLQKLSA9ZLZ0VK8F1Bg5bNXLLRUd6XZsPj1oRVV6g2AZbXkyxzTI8g1byLfwUhv3C703AkMBaBi5jOehJu79mBfKsA7r5lMYdIHTHjmbTT2lQunHedH8FBBEREaGmH8mp7GD9kadNS6kbzUgVORiPdJYL7lU4RVlEBGHvPiQx1UTZYsppx3+TNNGFtJ32l+QTDuo5mt5DOsX39yiUiNCUcL01b9mtyhTKER7+IMc5wENupubDzf0liWhvMIuB8cFnfKqN7BHsbuUdaaku0SBLPS17pIVxSIMMLn7DcxDxj7252qIdFfw1wQ0qLsQ2XPPYhqq8JEtCCICdgcvaIKDZDQFHzhtwanPv6FHIBXWAxgF8mkYLT6XashuXWl12IrG67EyaBi+hFppFL+m3jYLXcLkvJmpw4uHo3ZV9AVGFVFRDF7OS44djU1KmRXPsmjfgsQoiGJakQFHYKGCBSyuI1qolHU6ES0VTqa5I5AoKmCw1dD8g9RZ+uYoSEe/ecaYsKbVTJ01f8Eyaz4oiCYfzvGgh187m98vls/kaDtpM6vLw0uVwSh9kchTrVK0NZ5jU2Vnste1N/fRMCrrqUp7FmxpefDJ4eXJwYU2iE3MenMwsUk67x3kmj7SsmJwAwL/F5MDRGsYCxt21dhLz57RTrjeK51TN0l/TpxQNq7pFN1KiWZwwp+2RzxKZIeOlvQnBGT2VJkPF5+uhdzRYnGhmHdQhazv5h3KmFAlteHlvjrpj8dVUilVr/TGR3Pv5QkMY/GWL21auXD5RO/528GB5+OISSpLJ2UmtTCXCbiZapNwQsrGxIEI57GjyL7VUMKY+R+AJCa/MfhNqND8kMJ7r49/96O8TjWuSSQ8ZYc5rAiLAC1YnPld6FffIuuMoJmPmXSZ7nnWep1qyGBnDMS5askjORZt28mZtkcOhjWE3FpZLBIRsoEEMmMwl2GP9xIs6p9fBKSiLFssyePBq+MNpkoyIFhHO9LbjzLu96TAtY5bb905Lmh4LIRSsp9t7hIJBogWBCR/NJxXWKZZ2cSumnGJxzu1T7/Sf9j5h1k5JxUhsTuaNHuex0Bvy2QjnNNPy6bhqBdSLW4P1dR5XmYadtDud04zJmz4LpduJTUKlz6Ip2F8e58061o3ZssIM7JrAyEoAeVqgscwc4I8NdXS5jeCa8S9fVWxEbn6hCnyMvtgM4iR6KFv2/IYa9EdvkrodfvXC3fMAjxOTOsS3o3uDaEMQqrJ4PZYY7yeGz/1DB6TWYJvdu7FKwNyQfQTJHY57aK0AMlZKgsbGAbQ8OWysMaQ5L5rDY6tioTRKihlJ7RHUz365aIfZl67vndKiH90xsoZ5MzTSGelJQJMGBfPZJICuALgUMEWgT4oSoY7Ke+4I+MriKri8RSdpw8Ek9SYsrIQwDsJKHOEkDEgFiDR0fDi5wHYRg0v3df9gcKMwcFHEKEOLGrD5375ttt/HZkZrXlWtsBtfpftwI95xZNDOPmVumfDkTzS+dXjnqZtGi1qUBO2O+T5UrcKSYv+n/FuIWwvGcvyXpWveIkPIW8dZ9dG66nknptBCjFUVigAI1aIWecb6UzWnqWModaPZ+kR/KftJV4kZyk3PQz9BHUlPfYVLP8f+zH8c942k7Iv4L7X8//ygW+S9v3SPyIfkqTPkvT9zP8g/fTTZD5KK8yNvTnCA/NNHIWYiwykWGVtsbuxCUy/Y3nG5ETTcuxvh6NHeCSoLB3zWrVTAUo7URoXFi13VBIl8x5U3PXc5SwqkfNa52pMYh2Q2F2TshO04RpCUulAL4uXV3avfwDosEvJOamU3deug5Y8NW9E3HpG4qmtcVTlIRWVlL++qIkP0FJvI1KzOTJ0LkGNPptRtyVStEnN2+bGHnaHMFgm0ZUzy/gi+e+3cn2OW9coQjo9fauPXFlYIpkpn6GwRgYv4nmbwDY6Ft2rEl9csP3YLcUUFo5UsDzyEsci/UpzWPzdpXMQ9qZmPkwnGkgb7LKrOTklsziQHgQCGuj1Xzw+/WxqByDhd5AKPjeAw9aKeLMj4XWNpMcUrpDnFK0tyitcjqefMiqjxjNn4KfURSbGFQ0s5KzlCMzg6ufnzrz25YUm6HIQxlcAdy+OR0u8ey/SdJLctIoBp9+qT4R2OmjzMScA8XVMbHOkOpxNjsguEjed+6FSouiGdClM/lbSPMniba+wv/NQIvFkkGQ0rfKrP5/nOeD5kOrMgLs0Xx3rwsZLGUDQTPeaKBikentxGhwOXW1Oo5QqdVb2S4aIQrHHUl47U7vFHe5tbGCn6tTiKaGqGij8dgkBkYbVOblrSlf4yXcvmxbEvrjCgouWGF1TZ5hwXDgy/yI/I7yyS6QLbHmu+zEkD8phBni+iMaGnXa7s4oX9nkkQIpYBEm/urvleN4R+9OS82qNk7gQ6T7rd3H6yh5WwfMB8eBh4T9iFzo0ckiJQMbl4JEmmYnLum/DfRv1qeyFtiAuzznunOwbpXZhuIqeM+ieGSqcIOmiWarx3utOx3uk2h3vHFVni08xYJixXC4jOKxpHA1a52VylecNIwcN3m3cTXaZGR0CzQ0vTs3ejk88EUdF3kMutoEavHrGufj16ISoaP4sFsQoERoLa4kEsx1RgvP2FCoy3vzT3UlL1Vo6FYSRPLfa/pO8trIXysWP7zNH2qbF9pkiPRrJMj2RcNUHIE8ThiXrCfnHKLo6VEDVGBYHRWkEUdAoMAObm+NELJsCNchapCel4aZtO8S8gDJsaa437P3i7mLYrPhDaMFIrkRtEGlm0+jAEwbv9NX0HBLs6jBcMrrIunLIyywxZ7n+JGsswtmXCStuHXfsaDbt2VCIiKhleFULpO0/i8S5DfJf40vL+/WgEMFvpcqcyBOZdCw8PtO9Prk42msjh0WWE+Y11o6zT8H3/sHqvfVhDx0V0uhDX6xYvoBfsXtRvqM0xI3VI4foMEzwysGSnH5wanDqJqa6ThP08wVEo/VdXY3gAbueP+7o/1vWo3y4uF+9tf9lMd96l3U7BNCH0BjFCHBzC8IZFXb1JsEbLDRQ1Uk0c9AXklU/FYpg3vVamVdyl5TVRJGX7plVIYTFZoBqzyAB8RnAhtb+gugVhglFo3yapBw4WlNN/0I1F0QPQPixMUzOYLrjDmXnhEjivVyxeFCnyosBeBwUmkg8opOrOhYwL2GpAgMJhJReQLYltRtKpFInAYm2m8gN+XhrsdleEhdocJD+C6UeUYcABsOAUS3nWV0HIiebFyn0F+o2Jh/qSXQJTP3xxDaXYHNAewU+PZDPGPaSgk5WqIU78EmwsoTPoAHa8jQPDA/xX1jsFUZEJE0vIIT6LagvPPcQDGbBh2wAEH27ATyVoZUb3Dl17I+M/MTtTaP3bCVK8ilqhJTtLxMuwK29TDOKdJ4OVr9AvtYQwWVa7JrUBNDcKDaC4UdgYoYdJITAH/6hTD4481u/qYNSEJaM74VVTV7bX2+/kYRaMu0gqG+XlfmGJOs342uL+H7Q16H9ZXt74X8ts30BUxU+gzaTh+5faf6ml//3DHoz3/TJ4MD4gzzwY7/uZezD+8SAPBr3zQ4fSqQkejH/8KC4J0uSCbFYPsQkaML7aGr8q0XjPySTcadW0MtfZpZ2NM4N354Zr18TL2tX7Flu4ycqGoIlQsSo0EKpWmXhZMAjN1Iow0goj29MvlUbeG/KSL/AN8qFCN2tbnNu+S+Y4rP1y9VM2dYvuQRytrg9OHPMzRK7fxswycp+bNhcl1gTZFlo/1P8iUaEmXjbLZvckNpBb2Vm/ALvnie3WVK2bd1QfzXEtK3ZD0I/wDaeATMWOrBvVLHJwYJUFz94eHX/LQ7W+vnf3a+zOcDOHXEX7zkZNhIZ9Z7igcU9xM6qOTbpp5No0vUE0YBYtn5McF8mwqXGirFeysusl7SND1ZLe+CMMP780/Hzb+0/tSPxkhwO40yJvW/AXZySw/wMtIhSMMxLkGprTMlWWq+Qtyl6CE5XQlmUl5LKH5db+/3jjCznjUXvfnKwQT93qV3EiRlN29P1Ln6/wJKq86A0nGYdQR46FqRTjz261nqY0puqxyHhLIGxdyot47NboxcPB5lW4GqQBGmi6z6FQkM/bmDG54PKOhUp2i0oEDqpKTEouyM7ZVTWt66cKvOjpH7rSipb4W4LqRq1PcGLCsfRcjDIX/Nx+RmBuKKGdi0XRk1gDLvBnJpXGGEHdlfaSRT5Qm9SWvARvRAPY2aErrSB0nV6GtmKR61i6ZKyAiHUlq9WqrGTdiNkaU0BMqysA4l+5doV1XiTrun3wDcn0V8kybQRoh9TucaKxhjZzdPIK1wOQHZJvSLEfEGttUc6yLaW9ANltTdDQiVj2vLdlkK+gGdKD+XexmCKQF0+RnocvsxcEc87TDaR8sFVD4hJOUxp+DmgBrWKT0N4YocSXdzEX8dIWObSpi5glf28FshuiRSTfQyMhtaEyzxEf61NdchlMuNOOdWWeO0+SXtFShQkqp6gi0cTK4bVvSYegv4SAGpKHEREmob5TCRoxlLSq5Sq37dSRUaVKTjW79q3u4jhpg4X+KR7sA0d6wihzdhYj8XiI95a2BtsnwhB3y17bh9ciAWuaMaDHzSUfoEzZYZasOBNdOXnWgrXSwtj5s7RjocZcbYczWpWcqNWSN4gLoqyFm+U5yEpoIf50W3h6bj/hpKw3t2jVDC69QH3GQiqPtuPdoEsuI7GOa00aaz6Tk6J+absak88b07wSmU/aH7Uf7WhaQj74aFpCPiQltbZoccuKc1TI7xz3RDm78EUI8qFNPXXM1M1ljqoh/LOz9ZC6qKw0mYSCVJr4/3j9NVpCX+6rzyfG76CSRLQ9DGukWK49CRcCE7mukP6kguEny9spAs/Dp5ACpLNA/KCRX0zygWgqDF6eDN4VPkdrJRxaumCS5aT0d/zh36ybNoNtxCOpl29gBmPUXTCHYixAtJWISrgqq6eqFZ7HaRCq/6QFB4Y6Wz+/tLNxefDutArsIo2TRyHEpgi1RNPfIi6QppeNI4+vQ7OgfwQpqf45nLVqyEXuOeuAzI8ealsu66z409hciJNkZBZ4ngxPgShNhkxuNh+y0AkxFlxIoTKZIcz7d/chCdP+CZEI9c+hXFhpPIM5w12s3e/CetP1ay0gHXx8pdD6i5cJViEPgp7dW6hW7W+sGXsEAvhlL9Y9lztY1aopWNebwZak7x85h379Asw2grt8yOuV+oPJNFa+Hh63Cg2ugv4Ih1KaqW+zmhEe4YzoQKgTldISdB20kgBrEznGALBvlACt44ESdP0nkAAcVLaGd4jRxlCxabQlVGBqe8F4F2hREY6X488kJkLOJMKRc3WDZwjK/pWc1LE9kHQg7IEmbX0kUzXXvCGRETYdnNFqO454p3FQ12PEHzodgL602St9hyUfpVowweJZlAseHDsld1WwNhCvFcxGR3MUp+g/aeqDEqy9/drrYv9nxsjcAATm/sb/xdajiRNYfTPbp3avPkF3e6arFH9F5qWCtxxpBYRFewlQsEpCViYoCHuFppDSfqsYyoJt5U1BtIINtrWCLcTD6nCioQkutopjK+8mPth3VQLyrFg6E28wG/trH3TMohkGmdJMNTZgvBBfngTlcDAlaWniNdQdUZFvbqnQOPCHMwB7YHhTl7bKHT06ZqKzhbHHjPXboj4m9IC2YCQg2uVoFDEg4j+sT0ivUvdXI//LvlSqyp9C2tT4HZYiVbnuTrR/OMCJ5q6zRt4+9A/BbSZnMmzx/iZpcx43D2kr4U1wA/DCYBHZ3jKnm+W/XfwZu6rILhqxuZU/6fQ3yL5tLhg7vphKwQiohTJa3RzeuCfrJCPDSZBhIZ9Z7CRWQlvYQER/Z5M7yDnFaZ026/v6lrZCVNC0U4OPdUqqiH7DiTlcDHGsR51UDg45eTp0yoMw0BvaEzK/Bua7/6ngCEKuB+F/ywWf2wk3mYOmdMcSymU1n2Zv1+rx4TXaalxDMjm/AovfoE4wL0ec9p9O6oXRABzQDcua5Le0vxfY9EnBkEovwBRQ6QOtQuaVgOehjZVYJiCb6BhbxQpv1qKjpBooasKseHkMh0qMFWzohYdCSgmQJmnnM1bRhakROEYaid2JVP7l1miCtFKCVo195DCec6l8MMirNLGynY1ywFvpfH9FEIh4gTiaH8HXUxlfNO8QX8/KWAm6p5dxJpxlohPphbKWufTUpLAY4QNIjZk9HsRKqzaUHNIpSVchzjht7BtS1moNif6XYt8cesxmyIZ28PbK8MWl8aH1XiSzaVefrpBONDo5yLr0KvrClxt6/PnLRT1uBn2Bv9C9U+cHV57yKczqcX+hcvQoTRbWZH9pPnrquFV1XB3YqoQVVGeRNnpxK55FtC+wB/VWQ9lnjm6RRtgbihz932l+gLh2adfZ7q/9QWC0JO9qZWgm0fnpdhwZJWHQOxunh0cv4jy8O80Ms0hC4BUzTlwx1ioILJj7ZLzdsFqt1QrXBJoMRBNC1RC3qXsZ9s6oF1B21dFeN+9wtgr/5X9Ji07rUtnsbEzVnDtIw4hB9aIKff2Ckgitb2pZR3aScElIm+XZvk4UExrf+GRiW/xeq02wbyQST1bKPD309mz3GuxWVtYSDrCi1v5VWpLQCxvTSfbrly/ZsAl1yODs1xjp2HoNv74DJpFFWK1pOaJfqDhrtCs0/XqtD/XBPTiTGoYTx5ss4cLJKo2WHGvCurGUFDFoYx4GjktH2piM9e+lbc9PjXSKDXq0t0e+qigTHX33G8wnPMcXahK9l3VDR/i4c6wTaWgfTy6u7l8uz2LoK+4wdnefujf86oX7wjj8KxtvhPEAL6G5rBs1I199gIVCiBOqM/Ys+PNJm1i9DPC/Prf7agtPx62uHvcmG53scGgyaSDIpRE3OvGibPVUTXOQz6K3zU2eWd67/w1vn+79iFYRnjHNB1DVFjVYjtlZOHSGNDfalJJEEj7XSBqpPK+s3AaoWtkzRpM561go3YPHgwe3djefDjZeI6Aupb6VUizXNYWkrYlyGmsNDZV5/xWu9pfEFnlraEljbDreHLW1s3UWuknUUpFU2qsiuzjHiFWEqWMgO/5r2qvzH2UKd3Jox/7zutL6O8r75Wo2q4S1SIF7viTl1Bnh7Wyc4I7JCw7ITgJZkZBkfeM8JOXZm9yvMpn/YKfESHlvMDToDWsz6Yqfs/AA7etFyrlhrDWBq2h32+K4LJ1j4B8S2bpZHW3fIZnYqS4mC5wQOu3CNHe4IvJ3uBgkB830XuFYHLF03oULizCNi0Zn+mSV8CIN0OwqkIkiNBnBkHmTtiImE0Rr7l3bplad1YQ9zhl8a/Ig1rwQukft/qssTGaDrrRNM/cP1cb9/YR8enkxmnfk06PSmiAVWyr2mGUKrFb6M7IPooyeK0A12dF+gQcDOIthGTW3yKA9Wphl9mkatbVIEze0I3A3akxfGAFeNKKuC4n+kwC9WDgWX7fkSFV/Y+x/qccDRiv8k9r482gU5Jev/FlUdfIBnA2cZEj6a0I7Emj7qxuL2/C5VxF7ECEYz3QGUv8xGEWdj9WBScaSMbk0kuJqCpyhD99WVd5/Aoh9AH9NRF7jsEuBZmgxl2BPacnylCKxMI162u9y+dBHTvuFeI6Gf9ERPA+GQlqF7k5S0F8TyG6bBB0i2RhUhyjaETxtJH/QSVE7aKsxtsMI+MDFCBiUrGzZOX2ihySSkh02U8jXtJT2UI+NdlGSpP0DsusAeGj35Gl2DHp83+Q4xFtKJ+7Xgv2P0ZR3HvImcmNN9MmMe2Em+DWqvozYf7HfYbDfTTDRPVH1B8TOiFndNIluVE8A9m5VPwDqglU2/zy7rJeV3b4QUtFz+rMLi0AiVXF1gKt7XtvhVja243vLRHsqkf2VuTVpC1vpWTRPsU617O8f1AFpygWOSGgVO8JxhVtVAGHRy1rsTN79fPHt+AYrXuLYZdDu4t/j5RxtIxTb2u6hsmmIYXrYIySigX7N9B1D5QEDRx8nouAx/FvBvSknT+jN+4CnFPxrmG2QtNDHsA0xvJwM3PZjNmUuX0JpPonxXV+HuPehMeg3KTbxLxW85FBJzpoCQhpDRRVQcjAiGgNC0tcIiUTwI0iqmE63m1Wr7934wF0VO6smUApdB53jqgYqIaw5BBBEk3vcfxCbLX/xndxHd2x9xstSAc2CZzzjaf4avTumcc05z19qzBtWMnXuuH9+/K/BRT/hPvPSj//JHfV/f5Cjni8wa5nc8smhvw++eonjUwzS6EgaJ6plIHXFAD0uVnMUhCIEs0yinj1bgSlCVn9A5UkweWQc/8ZBlmkAWJXmoiut1C4GkAU2EnHDPmmaegbWosbYFbv+FKq6FLxVaa2Xczl24QPXKhxciFL8vHqhUuAd7dguxYq8Uxt2rsqVKmuLjXwqWCs5EQ4t4Eg4NBCfCMfS9TDYRMtJcEVw4f5/sTCI3o8utKrHAGlTJndkd3ACQKND0zy4TsX9z+MzU/dynlzUvR7AlzZXJrOZOjVzrXss/tLlI8JXu8/3jpaG55b3jp6JHadpmbMDy5yncbvirK5YeHf1x9scMfc4YqMtDpl5ybLgPQ4LNBMPmph9wKFpV6sQAqESgiPiMbv7kI8QfLTE3FYaQek22fCKcZPwrH/f74KrckaZ761KG2UmSkF1rn4n92xVnUwVJB1gdKYJPQteDZ7Zf1q+YWZdnfr51gabnSWyFvQqeUR/fDG8u0SvDdv8Wng5nMTVMDEt89Mo2yxuBscsbqa5Gd18hJmGGMm2veWkLgGWdsSittfOc3jlbSrzA70Agsqjt6tS77Qn9ejGAHIQ+7scGWc8UJlcNGddtm/k+AQDEFFGTqp1l1kkHtoinEBZptHvaNecQHGgld+rd7uiO/AwoBLWgC5VINQqV0GXjYpoEAlYYUamfYdRSOHlJhzm6qEThHAaB46agjbVmS6fo+Vj/NK6eDT+EosH0Zdh+tl5m47jv1YwtkNrn255ZZL01+SAyYqba53MNNLaPGdCvh+9B6htZij2fMcO114vi8xS/lS2J6e5fDZXmp/XMKnj7xliw6sWsdzz0khjOZuBtyns5OZ4no6lCIWrBVvMjkZkMHML4Rpl8A9ebSaKvXZzZ/suV4Uwf/Zcmkpwa1lo5IW0EGfaQfb+Z5Fz1H3PwkcE4Vl6eeVJehKiDW9AwmOW49i2LdLp2iJ7PVsa8ePyN6d4MP2NoAnaGkiEi/h1uWQpbw7KIlQbid9IMumFTHgZJC7qPTBB1PtSnAqaUrXY61blCen62IC8vVcZjcUJAoOsv06MBrHamOrbytpjndr/luJXJCO3/xW5pL9KiPYIyyHJUtrMCM7gDyjW7YTKtbAgnFvZF4PdM77CwA1mJGEiMZOguKXpqrzByuXh6e1YXlr2OEvTBUKULiblILM1NC5Tz4QimXoUBJm6btI5PrF1mTm+hpVJO2XQUnarcve++mZw+9tYbjth9kFbjt2s7K/NSeavpsWHC6WyXfY32pUVsnt7lSezeIk4aqzozdVKfTvYkaksbMdETky22qgwGwRRwmygcuSN5AXn8CNQq5dA0E9XJGBbRYzePpJnuw7qLZ5o4XbCLB3gxWKKP+oDHVH6GRcyWLkxuHzB5aTtpOOCEkWECZ6iv5bV63zC3UM1PUOAqZ9FCOrDogInCUO+wnM9GA8gHk8seq8bivuMWX+OLqhYfxeCCcX4xmaXfIon1tikimfUosaSyYjQPIkGKGuPD5DJ0QEykgcaoMUDWOdtm2T/jm9Y4n1KZYcSdg5hz2D7BL1x+I2wYVZ2HbGPLGC9TL7YhppDVrCj3tnaUrdTwGgT3WwVBxvsvt6YRy6wXDfjEUR1YArPLn77/9T2rk1SHFna4F+JfT+svqjNpnt63tuXtZm+7KvZ6Z6eVe+7n9awqMyoqoDMiFJEZkGyNmYghAAhBOiCxK1FSSBAogABkqgChNmmxvRHyLr8i/Xn3Px4ZhZSz75rpktGVPhxDw/3c55z/FwUPfKQWH8wRYEsAjqYej8bDkZiTfW9R3zGKMkgUj7zaIKneCLnvU8CX7jbNoETHkQYfIiCPArwRHB7cS0yxcRm0ks8LiZBa/JV+MeIt4fuLdtVrW2FIfmm1mG1migxASKiI3nBl7/ev+vt9OV4zLNvRrzNs7V5T8n0lstzSE29/NS7l/PffDQvBT0CtsM3+N+z/znD77ZFbsQ/zdhj9nwsGmZeRkktNHs+Y6aav9vLVCNNm337YsuVfX83ZbFx1gzJYTrNN0Y+zpJNDGmQJRcuM59Tqi8cGQk55WYJO1FfdmeMcQyGPFnFGKPMBk7zvhtSVGzkpqvwZdRWvIlEDtTURGLmHeOC/79Yd3wHLdTpwzWrN5QXm7WQRnx54XLi07hMvvt658SXkW8Uq72i7UP1GC24tEU5otIoA01b9DVdSoW0GVyFJfOduWDU2Q45InXvbiXhl+VRmfdCzaCGcjL7TiIFlbgWYANx6CD+lXAk5l9p/LCa0wX8h2KdmTkvZbvZv9R0v/JOmqH2YZtRxW46AaH+7JI9OaofLqP88huUp5WqxX61deXO5Pi3k/vIdb8YyMLHbEGNSJifbIjiq5nUsCddJ9wMMAh3EdWm1eydO5+9CGddYV8+fovdj2/5njJyBq4zrXbve6aDYCrVExcarVt2o0Oq9K7iiSOB9PbpO0KakqW7b4I0czl9Dkmwe5gXVyQ/5yvMLiuWUdqBTr5mz7JB89SjfFm6kNKNcUFI9cvZsfLSKZKxSjJ60p1+eqgpfRuqVXyXykBxqHBrkTJBSjUtF8QzoEWDFnkFjmL9TR6zuPdo9SIiT3nSDscULkJf4o6JrqdIkUZTU4rDfGTx6U9Nqd+XvDlAZtS3GZU1nOYJ5GHhmHzPLTi7/RLySfZAcC3Y+L7kQPce15tRc4w6ShNLErMV+Yyob7Q0R61Mbl/65q5SEpOweklExYom9UmOKAPlC+GZTqTELFssUJRPkjyJ2bXI01B5cSTEp8xRq/7knsvRlXvWWv1CX6euUIX1Nh/GqVUneSfkK9R3aofxjcA5qZTqL1DU9R+JmHBPSjodFKWEZpNJ+Im4Fhy/MXnnGtOsynq/BcPQ1BhXni5f5DVnnSP+9CxzzRWi9lRiuHpsztOjOasszZbPLRl/JjkmLcGkRiiobVLtf/YxBNg4Q64+zaHozNj459Ra8OtAwDe/oaZd5eKJ3Go//aTfHCUuyvc9cXykEqnW0m2H2RpxcReEvWebINkDsgVmlr9b+6FtrBdGBQXjq77kRQUVyIv6grvxPee9JbeTt5zyjlLHqDQIxPtBJR5QvtowW7lRZYJ/cb3WW1JhmM9w6bCoXoxFUniK+vS/qd3kt1LRjzMUvkUsqCzN5HOEJlISq+8K78UqnFJ9k/KXUeCHJHt7vLlz97rEuLqSm2UhNTPHt1+fjorxQTA6Ia/NtyGkKHwK1nu87WC2g9g/25KQIlyPQadw518BcBNic9HfXwUueVpbqfWh8jqBdIbkDFmJQ1JEPLlrOA+PJNDGyXPZFz/ROkEb02ggtt8ceNHNjmvcnnaIIgBHYOh77/PK5UVrsthkqB2M5FF8mtQUeTnz8PxHoyTT76eCJ0ocEzQkYuY9Pf9Zy7ZIrJzxnKVmpWMltZTIuUL8u/qYK8fk9jQofYELzBzTJ6b+Lh9YP45+FokrZ5Yj7IY0636WT8180Rf7A9lopv742rzSd8M6KHV/ynpB5IUVNmtxmPOAK283t7UVtJv9q9kXfr2XfYEbrSBsk1qt7Pt1tC308mahQFpJDT+duYGI5ppNeAhkfovMQMXBoCEhhESwJ9ogGQ6OYQqOaxYyARFLoDO5EQQeKecyGugcKE6u32SLD4c7E12yAGca+BxgWsDZyHXZrxfYNn2YLpG7UhPjspPYWkllF9lh5/kxHP+euje58BbXmECuqaq0kpAU7WLEyfZewweSqTvC4zvDIAMfrBjR7c/e2772yIhWxQGtGVEv5f3xI/Y/DeKMy6dT+TK91at/KzgIUh+YaPvjyzvHecl38iz826+lOsQcar2c/16g3HjY4XnfMNLGAv0rgnX3yJvItHXs1s6xY2R4pWbZoGhXhlMVY/JBjzxwY9mYcKcYyi1fNiatGYMqtuIGSF7bLepK0Sjzbi9fiW/ctTdGXlV55WPvWiHcRkTT+DayvcDiT1Hx5UpGhyNduCXg3Gr89ZBOv1CQ+twyZaAiJLz94YOdb7/feYtSw5dhFIUclgvB8JG7HNIrJJt8qTekzDLsJqa0xLeJiYlLE1KhlQvRpbRsViRkJ1Cn79vkPVxyVXBxvws0OzER0kfPJ/c3d05/rR54g1qQDlJ4NqWRWu6EfaOUeERD3SmXJmepbCpCfSitq0x9hVwebS4n2GExr3DSY/yhxF968qeyI3/iIyrk4TwgmZWGckq1fXsTK+b4c7Ksh92giQvzLnAKjocqzseAG+XwjcNlxv1wQcUB/EYpevX488l3VB6lCG+7KFTCImnLgSQk7JQrsvwoBsrHPdEHCRjGBTxtvXti69RpDXVqiqWqlGSHdTeQ6sIDXr4xrsbryccFVTDud08EUsTD0D47VKAEAU9jF4WtwkLpS5wzOQX0+IKGEr4RF7A9dXrr3CY5neZh7yPMS7Ko2SSBTDJHoGZ0ZIoCHZ4iomNzhMzf9BmbBRnJYfzsSTahhUwG83C4TGdyBzO7iXk/8Wagu331yNa7z/g3vmTQysI4+1riRdYcd+KWHfWkvciyO/EmLzvQiKuuLpvFrMZZGh9K6BXZPjYoouoyldU6emLyNlejk6xG3Z7mbMHzWa0cg5vPMgxESA+4zoKovYF3bF94imX65m0WGIiIdpkgwnvhJHPFEQ/wYth5GXEkoEmI7352Uokf6Egx5NC2U3YaOu3LO8OKks0V3RKzgl11GWxkfI3K1Pzlo51zz4jBFVW2uFgqR+8FFYpGUgxE6PSKFX89vrYYJv/hAN+Ws1ecDTLy0eQUZfZGNc3SKgsIK2KixopA0RNijmSUAjOiE6B8OVYPCxuzwiprkfCT7RnhRk9ucN3rtRGVNKEdeXH7Il5ueVAgZHYQPcjQPGwjZFrqSO51IpC1wAK9XrlSdIQY6pDy/r44OfmdUSPRv9wOteJliUCMvEOSP68QgiEXgd3QBiDf/U8ebT1ZI1+r4WK2PBhKbkwYbWHUlebhqoyXRIDsuDD+8Qx98ggW3KfXaDiBSgarLR9ol00QLMDGnfAxx2s9zDHfJNG0vjRsSuZiXDiAw2/WD9FmgBct2BAFQly5h73/7LOtjx5N1s/tPoVWt1Dvh1taZamTkdw7sBLqgRw5wo2KFtr4zgCUtILm1rcfBRJb38jBaZWNqmrY6Jl+kK2Q5/SDat/Ijf183fxwOSOPivCDSm0/nNzbCP/lit9waAr/m5IARiuKAEdNBUCgRNwNZIy5BUUXJYLrgRZVtxsdvROmr5P98AEJKKo2PN6g8sU3v9h678bk+Knty7DLyvNZMeLR9YaH86xe7tVUEgG/99cc4PHVfiwSJB6i+lHbVy9vX3m68wHqiYfGWTHsLfjyO3nGP+h0nbFQk3Oc3DVoZ+x9co0OI3evfhZmK/yX02UvUkLJ8H/lslW9QElZGy6whkslFvZ2T8N7S6qXQiJ0563H5Cp3d+vpm0p0NBgUUq6tbkrCHzA865Zv5M5huVFR2cAhF8ydHD8ZdjxF1TVB3nVz0YlKij5gItHB4jBf9qAND8WSwiyS+IjYii88DSRFHxwglyio7uklodpB1ApEHWD0r4g/BfoO5AsMZ+itiDsFxx5jkwmH49s87HUoNaJTfpasCoZFE9SYYsYZsGhAkVGiNuUmit8YugluE8OoICiPmxgyMV7S6qAkuVynKuMNCjkUJIjD4wyGGIIvVDCKwPeCPkEOLOmjgDbJLMg2iuGdt4+wAJ4re03osrvO+OECe+nsvHVBhKITh/Iw/1KxZfJKhJUTMFGs8NR0siBPsB+fPQ/CRCUJT7Zw/sjxmcsrf4+sXbm5DHhdBszc2ThzykjJImDMc+vKN8Y55VSG+NE0KzIuxCxIwtn5IKkRdkEMghmC8AHu3va97XedK5oo3uAzZomwaf6EUIN/mLFH+L9EQ8TU82qB8LfN9PC3e5keoF7v2wcfpn1/G20O8LYdkCUabJYLPVQ5Isjpi0r186/eQEaAN8TNi8KjyO5y6cXmg62Tz3eeX+FwSvKdyISkVkyhooUp/Q6sEa4DIi5VEwPJnefnPb3wtXsdQR+98Xo/p6pslG9yP33eslfiZoAjwnE7jMSpzqMez+xeP7d18dJkcz0ozexpXOFcnpqmxI0BC93yD3YCDEWtiLXFNwOt6PnCT4tpcPzlQkH+vQhGI8M0rlHmpYsKilQlqqCQs4LLc3POSMpY96DNAo82dfXF00vb15/uHjk6eev55PYjsfkEPDNaUA5JndWrZPwr+Dd7D7HDNDMKZtt3r4Z/ti4gBALts4Oy94OCGgAF6a7jm1VeNh0J15O74VcpuxH12jB4KCWcMII352T9No4uN55ONh6RFbLp9krSu9W0Z7RDL0K+hFdCT4yWQpwNl0zREzL7KPSAtmbXWQ7X79IdEuJyM3FL/LAv1p3omnjvzPbJb807sZX1Gcmzm5OSphUhZOISYCK2BISIroE2cByUOQwjqsUKUO/H8VO8obOJw4Ufzx3OwkawuZy8/y5+UEnWtlsegGabFYua245IOHdMuuRhMqHEHzOQid5pgYaOEaFHKHuMpO4NSaum2B9ujOINJYcx/ttXi1zf/rCRxTCvf/Xi8UmljGGGfxfaYVSMchjV+5xEEhclVw1XYm6oRMqGKnR0tMO8WaJItaWCs2YBbHGsIN3Sa2IoEPgLUzwL3GXtlvGsblCM+mAxnaoOOnlrGUwJxPGIc/otLqpdoRrH+/TTQNDGyzR0uDVVbaPXRilvqZTeShl6ycnzYfhHM6p3qqG2XQBapZIq8VdsHCQ4UOqCUZicPrb74Iw8TYSEqQ0cP5MxIBjkh6PuHW7e2v0kuusOqmGuo0AC3j9kOZeBoS/Hv4UEDNKi8hGNF4+fbb93mTIXhEdBSHDFsFuNvyTFui6Xxg97XMWnpDv7a76EBYzC05H3hQJE3/8Uu+sGY5QgBDKkvcgXw6Jo+MRw/GiVyh1I3shAaLjgbwgtLtl+jYQYxD0RheH45NdhQdCaN7rQsLri2LQKdq38JGfi+ct4DI874TE3op9++wr6qftu/NyFDle7sBslhcviP+kbTG58G/6ZfgOhHN+Avjw0xHJRI1Ly/VRxCPLlx0uVWwNBttx4mDiwIoNRUyB5aa7kwM5sOYGV0a+fIqZEbFsQnV4elmNgluH/fAa+TAHVSGsCjivxyWA+cB0jp0oAZHxSvSE86DjqAE6eHw/flX+LAwllg+ZPS79d57Ir7RXCh8RbJBzzrbglQM0GD9+egO+5zHANsVVTfell4RBYx6WrDfj008nxt7g8IH0lWBJ7g0EcT7FK5UgyR3WUe6o/fLAUdHAqOPPBjfCPowS4XxsWFkIpnTzSuRzwC/5DG/Zc+Ie/Tlu2ZlQnL7j09SKBoKAhx/Wtfny7Lzbwj7wdUXIvh++LYit5NycoO15byVc4Yik8ysAIHqIcRovoTeZp8A29c3775OPwDwnhA/V+ZMcyoiUdU4JY3mMzJ7dFqZZl2uJoOvnkOaFw8r/UthhAVoQ35LMaGtEIFUTp+oejOJbtu7FMvjgZ/rGxgBokXF+0FVDKSnLIBwkdj9Ipfzi6bEQm5IWILBga5RGUzgFeohku8R6dvkEWiUNiuiKxxjhm5+u1ybPPwt4XEEPPy2K3WeJVzvuJlrkS8CD2gUcwslsUHHD5EfZ0YZWWC4/wnUC3r6uqJhMKlR+RVycr0ecoLXjlCL8+F4VbyNgRhjlWnEPlK0TWDRd81Q8XTNUPN8zmXtaOqHTM0WZMg3G6RqIIRBWAv0PUJUyLcOoDYXAF+sIUFcEbcDfEPg2yy+pnIWCDp4ZMIyo1OBqBqAOKBhEjoDMEJ8DNgTUDaglKM3gWgVlES1yhnv4PdkUwiRlWwEeGjBQW8TlFgmkMyigSUgDDoiuiDkMbglUMCRgCiJLfpH0q5E34mtCVeeQmJren5bWJ0kSKmsRzsi7KGpEzJmRMukgRObUXNaVYjKYlicmQyPZ5/NLmZ/F35QnK8iLLNG7JzM02pHK0yMyMjzETcyR1KToGZazJ8SQhq4xDt7fta5vxWaMJ7bTfTxtM7K4ZS/xzYiixW2Yk+dUeRhLezvt+5YrQlc14rVsViEuoA1cuF6WKZNgcchuuPy1SuYuDxvhOk3HuUT0xeu/trY9vbH16Y+vzI1yzgBvCkfZAp1jWTeF6gmGAXOaSfnAU36G6kTTN6If7I2vXp6ET7or4XY5jdW4qtv6qPgyPTJSrIFM/3EApNxfcnFcl0UqLGrwscO4cwhkr3KboLT68u/vhka0jN3feeXNClS8LZCIlR5a8aNM+wNy6VBPOdVOXC/2844NCFpIO3r0wOftJpL5UhbdN6SNBP3KutuMv+5KvH1fsMHRrOKJ4vyX1ONm6cpJC3N8h62IV5MSgzeWALRDQiGfyN5MykqAhrm2hNbu2cVOLJEY6TbVqST5NydiBzEbi84ccmhTLiPfaeLT1yXtshxxlg0Nqa4UyL+ZytJTfMf8mN33x5B1t6obQFKuohNNFJaSKgzrDMMKtHt8jcfLDZQ4QhYl4QLyEEsVc/hJGmuu3J2/fYXdI1HQdVMr/hTYM7iWduxjtwm7ReTIsP8tTxCdvfze5974Rx+lySrweDGso8CUnT/m6HoRLZHgj/sXE/u2r8o1M6jdoMrDrt7dvnsZZTFAwv8dkVv0hQnN7w8Uy/F9LZDN94EvEzy7GPujWfkaKt5DNk+OBY4ckfb7dunaeJyf0xt6QSIvLfdmxFH3rz6VIT1s3Q9qyqC66au9AoA3vcAsuTGQOx6xcPwud7dj69pu0IIp+f9hmg5hMrEGmFJrm8VpDo2W6cjPne1oxHJuf05sgFdKT64G8hjMzaa1supqLZLbfnOK2LzVbfSJyHn+FbMI+83gY/dYnN5T8UhVoTJHnOQ4jv7043VNLiXPyDtVvCEPeH+kfPcFkD+RFs+Dp4pyjOBwakwcqAoURnIVgSN2ozfiWeZKErb757uQMx8qGRzvFbzPxJTFCdGiEkhC/TwhOj494K8Y428mnGK7rahQ09R6VSeYuY3+rdeUHjss4cAokigN/fMQNfLX+ow1cq5MqRXIjCuMMKr6RJZrlIanLNkV95/5nW2996vtoD1C1Su1KBzzEttHxDged2o02jtSGWQ86/+ymdyibDlz+946Gt29XnE2ISsB4spO7j7YvXzbi4XFoMdRDnM1B0frZHKxQpQAdINK+ylRuXNV5DM+8nqyAAVsMc4TV/y4lRbeLIXtIjG8HrsnZ4R3xyfoXk6dHrIseEiq1mfVkNW+WcvGY5t/umx8VoTI5/hWXblka/r0NkJ9mhxjKmZne4cw/zEkyR445SSSKk1+mrPBzuF/GU+KnX4Jv6Oo7RhBp+I82GGpFWRAGnHyXG+sdGgxhjzbztAL6oA/JFJcHzbAOimQgrGaTOJYqGct4gx0n8BrrJFL9YCrpGr5+Qdz/xgjgq3XlHLFHDCXz5LavP53cvmREA2fpdouDGYgL3gpaJo8HRpLqd3E5HdQMdbTXP+QMdaP8DzYoNCW2ET7O75WC3iB8dnS4rOuHTr/f+ZppcbD5wfBUFggyaKKQRhoJ/3Qzc0d33uXL/OcVWzP8LPHc1eHyb6w1c+HVYe+fpJAgFS3PHL3dy0F5+saotnKaRNT11LixyTmMn5VDR0eNb52iE/3GTQw3xJdphp1h/U9GQG7RHaNDttMh+ftwfV0iun36ze0LVA87sGWYAqgLc7hAKoRFGVsTNnG4SESCSQO2Qg/DE7+PjEDbh/H8+peOBMQDXMnyZHWvK7MSurTEA6OyDgI2LApZ6dKXdVTl+22YVZEw1JFxfhlklf+jHyOa0nZj/xKjQff0FkZJvN7R/PhGoGmU2ctE6O/hDxK1jkTbiLqMKTBOdfFgP8H4lh401R1gr3GKQ4LpBctHEM9zo8BbsbLAZEXIDI4FGXvg6gCrgTFDp4pLZyCpAcUEhBrwNLzpcJphswTzGc4zeLc3BrOGBoYUY82BQR6y/EwAlKARD0V+Jg7x4j1K9Z+ABYnATcTsT4prJwpNAr5UfEZxpULqJeItihOVIC+TP8bnhbs74WBygYVCZMbKgl/GvR2bVN74Us6asq3IsH6C4XlOotzj5exnXvQMNunryKKBnThb3mz27y52Zl5bC52Z+aNZZn65Z+QMcYx9+6hJf98vnQtLhwwFOR8BsxErfF6MsnZ3ycECPj+o6EA7506XnSu2rmyiksPmu9t37pB3D9HrVnXHzA58utwfuqNmiomQI0sYO/uZBBe8/+n2zfd5bpkGElrI2h7iWK0/lIR9mhK7GiLXxwrBUj4IWWef7a4V5tlep7T/TCAHyNufkuRcVfjtBwbBijqPPK7Jybd5XEJHx0WZovOST7v5d1eCsGAPosRmFVsKgzI4uX92cuYdTgiznC321NueGtJA+CeNw1GQYutEgIdBBGwQS6Kwt1UekHhX3Hi7JukOgSezsntj6+i9F08pGG+xDkBKrK1IoJ6Xkn6PQmo1ma3KAXj+CqP96JFGf4T2mdatLAYl0gRey4r9yJ7NZQj2E5MvljtwN+aUvP2CKquII+p+9jcSq83OzaNbFy+x4QY++kHCcCmnoo0leSlGM+PuRHLy/diNFnbXWPOkj28klb31xAV6pT/3Ljnhwc54fcBCgMn3BCd2yoG8xW2ifSiTMsOhL4pBebJ14T7ypV28RBHMBexacGASL+QeErrmzYDfhKzpdgc9se/cwQxGF0EG+9EFPuPFS5PrVwI02L16cXL3FIs9UM4GlAOLc+Og7AciMHD6UXNhT7rVo2q2pF7q7m6FO29fXZucAYBYyYPWXQMODBZzT0+RirsA6qe9JyJZDHBnApc8HZYLz7ERi7a48efLFJqCmKFF9hOo8gBUJFrF7pbYidAqkayrgy1BC/Gjtcn7F7Yu3tr6mBJsFGE9d2iGG4U+3aKTSSccEtbNl4ZqQCdaS3qaFcg8Pi7z2OBYrGeuj6FRWOrIrofTAtZ5+3w2QUEK8W7F7mgP+kg1RJk4JFxh68pXk/O3OFwhwMADRXEwRiwkVNWWmRA1G6tRLpYskQCRfvH4S04noNRtkoVQHs2uU3c4DwyTVRgGgkBuRMrMrtqw9SPU3SY8k+y/oT3bf9Oh9FHnKLwSV9FtilFuFz+eo1yx+MaMBx9ybWPKrz65eRqhDEB4t148eY+NRziaKZAPpJIDGhT9Gj+kcnbUEYHlsCnC3h7CLjKShNbXFriyduwIs/j5+5PvT3IXbA1olsIeP5hZT27F5ilz00U7h7MJ62RjduBt1MF7ZDpuwiqbYm62VGXR5umOoE3Ll/ImLB8OT/Xz4vE7YUtYV7qitUvezPspQgmbuGWkNoo3xmv9xLL5wwdsJDs4tcE5jfzmZeJGss3DfCHSohjIaUG/XpAs7cV+McoWQwTjZCO+RNEY9z2U9o1n/D2YarcOLBrlVkBdXOaDFCbPdslcKNetlGYdiOzjdSmmcCihYWlSHsMR4M3rWcxlqBSooOTNut/7e45RLfn2cqcaNgvqIwuWR1NvfbCbbGB6Ye65H8KhaJRxX8pNFsZr4btVfAhDFwwwN1B/XUgFNM0UsP6Gg/z1TER9XCPc+PXZNRL/4NdIQl6WiHZiTE86E1BSFou/yMPux8EXz3JB6mEyyZiJZJJh9XGTXDa/d5NsGAF0X/cytaGiokQ/jpwWnfUgAw9Sm7pQiJBxL8mgK0qxqIdUqwVsXsJD77QyXmGgMEucv8XcM1Bqm+HynyPPigOOlP9lWpRyD1PDto5s2NyTE9baXTL0BgVeAnMe9Chbjh3U9epOM74tvh1HWxMxcmIXFB9i27IJYf8p/s94asfjde/R5PPew3XipXp8E5bq3Fki1a1P/zJBWUPhvih7zKe9LQawbVG+A2gUifyBOq4iiOgO/xyl0PQXQR9/nl1Jg8azSfoi1o9bSO9OLST05d9ANJa4AYa9ZPnDDpAu/8dHEh5T/8Et/7h7mfCc3UtdTO1d68S2LveSbl2og/MNVabIuV9QuwD4br5vypbTikwlSvUh04VMETL9RXSXRG8xnUUUFvFKkcrMXVUuWKvg+fLom3FGAuo9jp9WFGJTbZV+f/vqcQfGraFbwS18W+1+nbvPGL+dwUmBpgZKPRqdBo97wkYDdRHOOQLWUkEX4y0BWxFnCcKKFjYGOgZx5gKb9JUSVDEDXQxHMHiIFjmR4AkicBL2twSc9ZeXnyY2Z+Tl6yYsX/9JSTklvF43ufXfvbQyQWVSalp+/IuKjn/0UsMEhpMW0+ybWwor/UPCr41Rey49zTH/zFFhMGE55mh8MTLFGUYlLzv8J8+ZjCkZR5o1WBX98s8wKo3y307bqtI/mZlqpoVYqNL7Zpz6mz2MUzgS37cvPN3d9zfRLgV/xoZVw7pc5ahhuUOaYZhajBtxfOcGWaXH4vvh742VuHPqxM7J+5O3L299g3DslRIRP6CjXsiB1C8QXEuAlAiHq79nC3kvJfXBVaODCNtIp1iCP2bRVTfJpTJcIyq/4+7C7XqJKzmObyEdBO2lz49OPru4c+rB9tfwe2t7vaBpUPtImANGHVGyQSoFa8v9xbZhlwROS+iwOFzVHCMZ7smtjtwCpYB/yLx/2Awjpx7sXD+39flHuyfIcTsAgwou0uK/pxTJ27THdJkgCbQiMIqeqD6HsqQDyJnN50aefeSp0KqEtpdNvZovZpq7xi7ja9PxLbtYULDXIfKX5UHvfgZTyNadzyYXrmxReVSZFSEk/rgdqaMmf7SqMkY9ZgNnopYTnFvEomyDCs6M4b3rwHEoGSBu9dJbVKOHSklK8eW+hIFzpZ6tK/AlCix1cpyrkqIZ56VYmOqF6iYkneR8Y3wHVnU2omKtbr119sXjJ0F30nIJjtzhYY+PxAcrw4YOcRAmOu8mx6prNoEPOEiczoCOP0SB96P3tj/8hpSbQXmwpT7EHb/Je51Mt5W/kDnukV/fG7LUPri69c1x3VWRCs46oS6qUQyXtVnEYAwTP/XJ9Su7T84beDvQqC2zWSoqrHZao9xcrjjyPfxXaexe/Wzr0sdMJkxYG6nkg1xcfZqGjKv54YoszXyUWHZKpBBoBGIcJCNrpSXjSYRfnjx+Nyx7ttcCCVBExWqvbG0/UR85cv69Ktc9XPcQn0ncYwOjpUOHycZHux98S/7MRUP+E0apbtiHpFfwWV9TcyWbXlnlljbmFtkjGDi9e2Lr5Pu8yXFcltkeD4pv2UH4RMPneoflis/2cACwydXnzu98+5Cd1JYy+PHEjNMoBBgYoAQMwzuoacg4Mp3FgDy82sggKI6Y0lw9YB7RIqlBddDyUa3mnTZQavLOeHN8k1l3AexLdw5rvTKCLA8pkOHhhe3Nz+igc2nYOlIYXd6WMPFY2DZdunwjkiBkcvY8JwihLCMjc2YeVIEZlp2wE5vxmjbHqS7t/GvwwOP3++ErTjf1+IvJlftg20fvcw6MPFKrUY2D85bwkuWrnnJqjAVVJkjAgsbFZ9ub94gjlMuBv4QGTIdTn0DA0RkrJz6p+YoqPNeYn/Hmir7e7vH3d869tXN+jV8ysOWDLgmK0EPyjEKO0rG1RjI6PZeXAVIZRFzw1uJxTt5/F8yUNxiNFgEgAQn0NA9VoGyWXqY/Y/fVDU8WX6HF5t5IKG/rRhQrEk50XcFBF9kqNBpE8lPExRdWCsxP7HWNXBW8AsO62X5wijNlIkOcT11BlHPJheF+hy+9hMJd/ZTs9vn72+99ZQQLtABVcQQomqw+RO3pd2B3K034QBpqwOmtxmu0iLYffUVR0yfIg5hquPTyUS2hF4cwlNXhMueFQB3yjJxZeuLMIu8cyLIji7zpo68kc0XGJCXGohdWaD9HIrRyabxGB5MkfPL+3+vNPwk/tvHtrn2z++Qt2rpL+Up2EKkQRpodgcgF7X9twEkSSrlBOhdViPm3rw4jmqGjn4aJolzMzU8nJzZpHYE6Uns42vn+sEoltLAj8YZ0i9PZBO7Qjte4MscKpa7ZZL+Ku4g1vP0JZr5A4qKl0Kaeplh3qKSDI1j3CXdQitQlUvvAUr8+unX7Iqfsgq0p0gpaZbEKp/bfsIqJi9tknYSf+49XKDXCu99uP3lObAGQqxC2wE8fHvas5WExDUAqc1NIY2pKAtQ3HgSWhPJzv4DLcGBXreaTCSuwi9oig4qPfzZITxihch+xZgCU3WNHJ89v7tw8tfXWpyqig6gIE7XoktRUAf/FNDVBcbzdqYULjwg/Zyr4MUWPTgcUzYKf0GUBN0fNWYMIvD5eUTfW/j03lt9TuqG6RZOS4ZkiKn7SjECYNmrN00bN59acZl2BcEgTlCJaUXrLqwmmIyTqgSJ4SVcumFhBEG9AYGLGQR7EG3gv2ibCdjBCONhxTbwn57cuvs9AXSGuglWHaw3O2t8SdOlxZaxQXPZM8ZcsPqT7p3iSAaQUnyZcy1jWI0LxDGUYpoX1DH4BASv8SpEX5RnKe1xAgAAQo58p2MNwJ06vIByeWUY4Bm76hEQ4IY/8msYgDn1EtJBD0IuIj21ErgsTJaEe5bmJcpXi0kizjnEjFrlR2noh69rYVJkgTaWeiCE/CSx4uBcTY9wJyxonZhKx4GWCEwfCvh3j9pOn0klG+BYZiabZc2SiSVNmnzLxzEGneKcyPzdU5nw8VGJ+ke2JwiH/0wmRhFm83zhhljKeWjgGZ7dpksE9dF+YuEXKJ9TZB7vqNzMuPno3Ova459SdR2+ZneS/7OHDQzt333+JFpI+IieQMm+8tgqBXKyQ9Y5uV5xJb0CZpLSkJRZ5ywfetMXJa/Tq9zvPnmx9+D1Wb4v0ZmVWHAh6f3SSWSqDlGayqFFLwtvdS7pirwsCBLdXsnkdTs6e3rpy2nfbRXDpYuZ7V/WoyrhgbZCXXJyY7yznVG18WXsjyUC1fWLJ93NU65kSoJPpZaNPpdpILzu19WAN9X64FO36Zy8eb05Ondm+fHdy8j5rRMsoHIma5aLX9JEVpou0f348lIeGHWdsUP8tOdKkQQXN6w2y4L9kUHzcifLTJ0/AC3VmUHQAWrd+UHB5CWJ9gBNnxNGz6qJ3EYbUkz9xNaEHSEB3h6NfKMROXGO43nn4C1lTnp/YuffR5P5Vqchw//zOCVL0CgITB3GghDSoMaJnqv+6R8Uj0L/vXPTiZABJx+yqxX1br6NmMNVhs9KnVCWwsQUdfPxQWCXul/KHcL/m29LReLOxryBl7b94k2da8vYNkXUWPtNlOzQR3ObNIM+GlKHYdWyHZqGTXi/zXXM9HcqgP14HunufEildY3dRGc2S5lfSs663UTLw+adwSLr2HSy1YXzfH5kcO8uxiL2s/8prmY5Sc0HWK/2Sq6Yu55wPku+Ea3IzvUPndoqbxg9JHX4yOf4wLP7JB5yrFbVZEASHJrG+E2xjK8NODb0Mrxz6SDrQMg93RmxUCEhygVOhw/z05PTk5FdcancwrBeQzUa7SbcSOQXoLpI67nJA64fux60ABB5nWfvKII/FT8JCzJQ06R8BMQ3Ic1yp4x0ondMy2MT4GrlBn7sZdl5gBLtvfk5DQdEp7YFDdDucKfLVHuLqyQ40vt0tV3s1tternBZkpTeUT8+mICrx8ICztGro/duT55+EL7z74cWYK6ZeaurF7LWsGwYmWQNiN5F09ip/0kiRv6fRku9JVOxbDpAnzNfspXNMm2VxKINB9fKBmZq3dy/tvHkvFnNthiiMtOjnfFivZsMCuRqpI8l6fLvJqfIRxfk13nvUdSZT8vSSdEOTEWDFwTAV2hWvlWEQOFWGJL/7Oa8s4lgGwyDPyFNY6oPn1RDWtXlPoLosefzwLkDGS2g5XF928s5fsBnubWw/uSoVxJFyNAgzac8QJBedjSsSTY2JXWbxAM9sNjMmwbwBxB027ne7onp0lObcJn37yqeY8SADzqKSsUz9MLBAnvaMBxh3KpLAsEX7f0HPuAwv9y9U3Zu5jpRzx+sGzkI13LnC5UA250E5k0UUaUJQ/CxRX7R9CeXMO1n6bszHMnpXJh2qIxXVorcTcDg67NFRehhp/cw6VHE/sTo9eWpxyfvNMIdcYL3SWhbnP7P6CdMtgwQAGwziRJJvyWUHJQOGIl36pMx1LaPO84vbb25wFp1RECVIAzRoTGBjoqj+NYyq8NEnFYHoAT1AvZSDVznjSIjzAYfRJ7AU9DTfxf+oMbvaAjl8ih1BvjSC5fhWL6W3/eie0Qt4OXw1TxCHALy4lnPz2yX+lmOXhr8SbwuceevqDWZs8BmEVBLOZhS4VlXdBwB+Ve/kC8mazIQqk7RVyeR5bYbdhThl7sQVMqE9tszhFChuqDt8WdVN4pkPRYv95B4PlsWH7FjlxYjj6GVUHCWLxGk+m2LYgQmwB/Lj9Va1ljv7afjSD4b//cc7d++j9g/1psEfyMD2WuZ7lUIy5AzJclW8FWOV6Dz6RrYIkA5Yhl+RVRfnJElf5MdzyDB57QDXId/YT2iGyy1xJoIKMeHmRRlmdueb77avnEY15LM3CNY9evH98921TXOtPFCHN8amA1NzJSZN3rYogJGn4jYZZCptXzIok71zxqISeGoUEG4swvLerFxDddmVoZYKJOkWdlVDp3vdKN223/p28uyDVLqhWE4n7AeFLVXSTV1Nd/Anq4ixueA6kVJlj89wH/Qm1RT1Jl+BhzpVJcDxV5jFirRFWxEEL5sSvAdp3zSzZls07I4oOTulyMn6iM9eycqDOm3h6+48fy8wJTIf1/spZXTYQj1EijavWOHrhoK8uTIU9VSVq78AVgsi1aoNSTSHVW2F5X52TGEUyVgkynCdTLRbb97i8Wx9/O3uJY3mHyFVxOyoqBZtHnblAvYDkjEIzuWqtPaXEb4734efwa2DjCRchdrdzz7Z/fguVMqkSK0SEIHdR0mruR3WgjborOInuoWlBVtx7aDveHL81uTuu7TKIL6mu9az9BXUml0I6IhLNMXbsAXTfaoLBJeKN5i5/XB5JMt55953WHAbn2pR8qCThQ7oi6fx9kkfGnGf9kAx9/yfqV7uf4aoe9eRhNxrR3MttN4QMmUBUaMEJ8XPKipkJerK02vbj26yrjJre0jMDonFwSnxHBBF0QOkr7948s7Oc0o05JX0RDc3hTjRfU3fTXXd/pBK0dCRA+uWqaqparSml3r8ePv4TafQmrTk0iSHSo6B8IrcS3WtPTS3RGdjaSXuB1QT/JnX0kT8NYXmA/X6Uqoiec3IKUT9sk14JBgZqzKVTgIOWvmI/O4lidHyWoTEpInr3Bx4TjCctYLAUidvPzRlQFQyRcU/H2EnWDen3IxwN+HZwuZGAXoBoz9NyCBpgiBtQdXqsZ/CMMVgCT7sDKlgdsSdkokrRYRvPfetDbtF1MX/50bl+NrwAHc4ef5VxGtTUIq0co9wbg3f4KQWh6fVz+21u1vrn5v6OQNuQA72uR4zsIjQRCKvs3ViCpucPRcWh4n+KYlvIjgV7onINWGbCloyS2p4kS6pO3D3OgCxja7vfzi5GzjEGa42NS2LWmP7skb1shpvYpVOiwHP+6lIXippPAOeYrwpu/WMdobDxkBWlHJvVg79Lmy4fn+OnXveEz6YdW77GM46+2ezhf/nPeNZpVGxbx+16uz7zzHrWLcqOnCA7eQaeAL2QVoybM3dooMSaAyDwi6kPcgLcH24bPqmX5IvNk9PLv+FN6WtyrDKw8dh/cGUzXXVaEWT/XdTXxl6ukN7I3oXGT0wDNWNR2f0B1IiambLgEkix8nWQ6Unfzi6KH1vUJIedrs9djyMAfvuw08nZ89Dlbn/tUSTodT3Cmo6haGEERVaajJvyxoVRZKR5BBXeU8nd53vyoniKItbPY5NtKdr34X+Qsc8FDXC0wb1nWJ/OehE1waVzPhvhwKYXDbyk83f2faZqHATxg6RKosIo5vYkLzlKNqMEnJk3Ix2N5wPmNXNTwTXc+dX52Lu02ZNKKCU83BvIvotjRJ/PTYPOFpkoRK2TafsdkWKHf2HdD3Vm9EJDsOCGreNAxspqrxzl2MtW1ab54qFKRV8SvV2Snd8S5jTFoMC0yKZKJu1g6rMgQrLnQCnc5Q7GnJVddiktDA5TLm3uKCIHARh8D++j7OOzYbrlYc1gImhNQAj+1+uTL54UwwoVd3NBq9U3fCxX8sWy2jzKFbIzXVgMF1vjtcXdGWQoR/m/ABlZXFMTt7fOhZt1cMapjaiz2pHNyi4XXnB33GmUL5VyLtFSANvDHojSnIvE3n3UsAngfwOabS0Q7l96KRYxVtwP6tRvUBRokLVCRwCsbu0DBgHPjeP8oArfFchJHrwUkEIU6eATjyS17cRysvT0Dg7fNmg0NorVRuLfCEVlZvScK3E4gcUYvy9mFgY2IKnJEa9tg3Ke7JYYOILS2W4iFVSj3ihkNVCleip5RGUWNak/cIgY2CYhqY4GFcFNkdY35yNUXVF7NgqX+CblWCp8bWKkiDBvstoavfNzydXbgkAaApeEyAv3D0w0EWblRFfVVorWkeu3PrkeR6xKJt9nhirOa4W+XT1MmT2I5VVBhQm47x7KQAvHeSwFbou7J6mOtZHxh2ahg3wcmjjMFLETf/ekxdPAyA/Y/ue5SW9utVWB6cEWbUEkJUW6n5W/5GEJ1Jy28djo+25j3kGnOmWaPqDjzX9TsqI/TlTFQ9B+EwA00ud0LEQ9Jh7G1gUn9zjkyGGoJiQMjOeKkOnQa/j/BCUp8fsxyvHYqASWV9THEbdlBKKVte+F4qiFp2wOQK/aYoF/KVSnuf4f/nD0SXOlKwf8egllgM7925MNj+UTkmHZkYX6xtRZF7aLSrMTXfJG3O6n7A7fQ/EelLy9HIoe2ArG3TzyOam30WXkH8LXkA8b/EFDlp5BdFli37Sh7tbiZc8n1Ty0OmUksmSiptQbQxqlbkx0aAFFIwbZes4MGWDZvRkI1bg9EqllCnTUxX2dkrZbgvtfzujdRzH64eo+i0o7qxRXa8AhR1J1v/8C+ODdusVJc8PFH17BPNDf/8jp4/2jOrFxnvGpYIkxtF23tHZ6cg7DMpVOMAPrYu6l9xkhoDPuUkmZGayZ6FYP5cPudIrlmfJdosmTHpYNbUnDV93lCtT0pQda4kLw3HaRh7687Xty4+3PvrMVgsSufZYauTaCXvvcxdcbdjuxR7Ce4/X98sXkDQym29Pzr4Dc+s6H7zkBx3dCM71mz4s5y8WD0wFayswjaulK9Wf8hJ54uOypquek7zkgMqvv3v0g+1Pb/C7U354T8eWl5CaWm6oQ0Rbkcx+G7ySb714dmXnm++Yoi66tqi70+4Hf/yrLEqB5QzyvtJSiVWyl8EfydDe8tJM3lAtRPqWLE30RQMhBj1zvBbaeG8gC0jytHQzeXVmm8+PbZ0+jvemNx41us+6842OKHehWuWMHuniiEjFliAirycm+luiLXnN0LRBpwMxOBqZ9xPzYnsmSiYzuahXhYk3k2pOP5gx7UypAR79R+yeYAyPjP1KtzXucHANTzJtWPxEI4OjDjv+VEeKFPt5Y3Ctot+VO1KxcxTpSBFZWdt2KXSn7NFGEVJ43FYdKp68vJ98CkC0Lx+Y4IUpaZ3K6RkRnSCARDQHOuVeQjnKsyh7vXzE0Zg2zUb16kubRUnthVIUFOwKIcM99izprqMowsmDyKX3aik8WRu8dC1qmT33rEgTm3fleC95JmERYjX7VQYb1aCTN0EwzFjMZv5q1rJ57cRSNvMns5L9p/lWsl/t2+dadPb9J7OQwdkjJwNaTh4eUqmELA3IYROwv/0NXI7LlgADtanRl72pqG5JhP1sBp7ceLZ15Ygh/8BQhzgFHAyCSO6+ItuM6iv3GbK1MAqwaiE3hkuSS0c0bOdlcuxhtCUM2AvCiBIsBDXVKCK5YqDOOC6GdFm0CosgxQImxUIdLLpmqQ3bhlXPZMryUU5n6LNzpZaQOE+qwcAeInNEfYXx2uxob6y9NOUi5BdbCyoCcGE7LbKrOBUTD5+CnAvvVHr4HETkW88nd4+qn1nFxW2aQPw1nXmbJ6LsJukPccptuqfn+jVL5olsMEVPsu83qI+AmLpeoQGwfDxeoAbGgANfMb9P7rx4ckGs4Vmv98rIJNdajxLEc6o4JixqNqAyJ5Bj8nQGa6p22s3uiXdF5/adkeaNSpJTHdKilwQT3Jm/M78fgSRpP3I66vopTH8u2MdcfmX5SFEO2d6m6E5O3of/hCcaQE2k5zRHKBM5z9OacPKcJwjaLYAdZ2+keYFme/QSXO9ubJhWBbIiGeiLyTznbvLjvT2mfnbauYdkLrxmGAdfpIPv0aZ62dj5a7qxCyjt1atcNJTHanSLVfzF6PKyhDU+JQ5/o8t/MfoooWwDtwPQoBGVPGxlL+yfIJ06zyD1OHT85cXm6SB9jL8UlNmNetAtT6M10i1fzlsqwkdsmTBBXiPGPzDPZQENnPa4erFMT6/wbZ1eYRo6va/Zwih5SwgxWheyKgIQ+O9zl8XsLpndIq8pUCtho6ooewIzFNQHGciA1a2ajQY4ev/x3MjteHajDm+w/eTs5LsHtulhcIED4mrc8q26xQEcrpaO09hfwv9xu8qXo88c5Siz/ibPL06+P2ndkOMcmSl9T6gSMSBmQmETVDOCLjmOgtNFkg8LgRTHVz5+tPUxqvHF/Y/SEfImygS6GpBOqF3P4+NteQt0uKxhyaTTyhdaJ6uL73fy/fGg44YvtX35EU5LneWOtF59Qx0Be5mZYVcXrviW0f1W51BdynjpsquYCFpyCVPatnzDekPSBiWMFVbzrRYr48/OHPCBKNdM+8Xztcn9o5g9It+Du6VMnfn/dBEjUfApab1E2kiyztYqt8yiE/fJ+1unn/MSs30ipONGkUU1jPxTvkSx7HYJB2RsvJFskp3nJybvPfGbRKfltei3BH93Lx5xr2I1MhGOZCHEl04EI46bwlb0UhGn0XHRwkFrqo+KS/Uo9aIXD4ts+/EZEROl9D6dhGxbBxiKxF8IUJGcrYOAYd0NTD6QEkrZZxUltohLE7N/49nk+onJibcjruwiZjp0o4obpiIS5KmJ17OzYnNvsxLn3tGVrLwxkgDXOuaYKFFONDFUyo3Ifpq0dYPSXL7UjealhpNRfqCOJOgt+XvnbgnonTkLYOrjR9mMo8vl1n13T5Y/ep5+c/+9mY587EjJja+YGR/L4ZcOzy3MVoWvH13hRidifc7gkpUY6Yw/PxyAsOdW1fghbhFT4bSRFCbQFW9SEbX3NuCBe++RsCw6EHBOHOC6nQq5WVIPS9wPKLchjBDDUDix3njtIOdZoVkw3QDlO9+7jZSnYS6oO6rAUR7wHRbwomqL36r3ZB42D5WtYDMeHWxQsmNY8cLoxazVIpoofiVEN/3OvtBIrtKvM7VH3AYhUvPsY6rWLfrjIrY0tHUzqNtoNXA73MHdRJ1bjIhIiIw3B7HueyVtaaai+sQtiQmrkWNkjbRD7c0UGlNncLC36gcpa8spFF6PiImpqa3a0V7yihHNRwifZ7ltOIdODU47FB2hMzXifZC2sVFaAdeILZHZYXWPOXQYksN81Nizx/RFEDf+cmAiQ+T+LFSbQmgpNCPAZGummKUhaFVpyGo0SOI3djs1BAHi3JQRs4MbZJIccsbBtJnr0bp7LVr99IXD3lIBSRqA03o/uefkbfK6aGSvW7e+bfTSilLpFTs2JauhOXVpN5O7x9hCW6qFkRdWFAxTz9Oyiqwbhm1toEvKP8/vYNzUuXCr2/gdY5l4nGe5ceupZf1hVL9uT+t78kumTMX5oe1lT9vLmranLW0vS9p/3NvfzMxo/zFGYJedavxlF0dfqKzIeQ5ws5B7cmu8yYcYiFFgf0ew5W8fwkpz5u7OvaNcN4FbDZDAX5fW+GZYkmF3w2mT5RSo447R3qDEnEANqKT+wwfkp7r18FZADi82zm4/3aSFifQfg9AuUpcRZ9QLTyMTzagX9X68tUhDh7r4kOpDs3Hi7d1jlD3mwluT7+9KD/Akb4qlXBzCtQNUvWlodYcFskRRwTZ4IZkh1ACZCinzGtGcHL+x9eG3YiCqSk+4SEpUQOZMl61Y7lD1TCtagdFvHqZwdPr8XLYC4//24eQ4Mm+MBtI6NCcx5rQ3JMcY0CrkQshB/8fRntb/czrcdD+sxPl+CAnGDtpi/E0ZZiNAu6Cx9cebVSkps/Rui5JFQ5aVHa68ON6k3XJnbeuj+1sfX1MnyryDBkN5nqkfhjEuodyhOz+PKsNWT5EKS4SZJm9mtiLIZSfmVxJ3290TZwMpdiAO08tN7PuJPzQXB+bPByqZXCspio0PlCbXb/JXknZIu68yXgqKSUtIeq5Jxtf0cgHHdTPS6iT286P7k+uXAlEJ/ESawP05lThdTcjmniKlsEjoeVKejrF3+gJkaz083uzaF6DyEVXRqbvyCSguQWoC3VmbnLgmBQfpE1TFYT13JTJaKIQIaKmQta6UKtk69QH7wFOzLFcX9lpWMspCvSo33MeDCzj2ylL14/sc1XJ198T5rSNPuE50QDMZtXHkCMLxz0rcEh8sGYHJ8a+5tTxhJenKvgsn5CtaR4OS55sMBeLPf+YdqbOTH5wulvLvq7hS5ZGObO+pNS1GmrlLO+51Xpa8wXVfw8+eZur/4zKX6Y6LXMJFS+JqcPXPamFxtBAhU5bUt4D98K5f2rr8CC465D1HOfJGgXf1Viz1j3A0JRSz/vBgUFlEx0Mb2Bq3KA7TUukzhlhymcdaXmE1SymvE8RIqEYMTG1aw0UYk9EQtiREZEPYXrCN4GnU/ZIyatYxCqIXY1FaTQ4Ko+b985wTlINropXDbGeVhra6G0ZOkzuaUiVkt65c3rryKWQ4Ee8Wg06xcqjgdBXOOQevmnc5w+D0DRkqCkuxUZoruCEc6Nt3EEX57TvqioOkefjBH5AOmnjY+K2vMN4c8euTDvxeoMM4fBCbYgMO35gTBMLHesxDtt/ckCJ4ZZD9vcFAszl1fm5DbiTcB2bsAfQNLJUKgXBx4VTDDG5uUprujSxZQafO2CJCPBYtpIOSgKzlwdi2oAGN6DdP65I4ecBViCd18uyD7cuo1H4QvsYDq5OD7cAeLLzTJCOW3qMNp4tLKrE+YH81zZj0xdHdE7IQYsNBAPRToqDN6dyNZUsVuQ1VnqZQTSdqHLIwICasgvgOwzDeowwslpkJtZJw/CeihWT1PQgoiQXaAw7uDPvl5AWwkJMXdPUhoaimMSe/l67SpOXH9LD6QEgW3/VLuvisqX6shH2JBzezLXbVptyyw77F0IWuKKoGFYhb+R1GRc3L8TU1/0MOf2lt62h2zLlCiPx4Sa8jOP7XKZfSBSZMysBlh/uHSVtYVej/+5PGrUBrj3T8pi0YFOZvIbSwVImQUwasSdEscJBTxOMGwx1KrgUY16X8SJBpBKQRi9YRFbqfRTd5TSpmra+ZQkMnQ38aFCaIUHaEw1oeaBnIcgjLoSFDQhSp0WUEpPAnohUFInL2Rcfma0NJwodtdPyWPSLvM2CxIOBiHiyJkOSveHWPEaIgzsNnbTl2bAgYxXl2J9c/5Ty7XgDXLU6tCE2q3KUCPZzc6MXmZU1r9DJp2StcEOpQglCdnIwMRJt46Qrz5X4TrzvfHxNGEaWEiAhrRDyYHj9r4sHxceXge24FZftz1wqzL3mNwLjkNZQNCvdjLqULmlCTregAlwQo7c2odEi6/ulvwmJUCPnnf/yQK5pe2rn7WHjLvNxxRblIq+dfZhPI+T+5LHJTLSyVnL9vNo2/2yufnD79xr6/i+UgOV2A1Z6ZvjY5RLsB5x5mDgibYnKOQlZJjMHc0LNMFKG1FvCo5VKq8aCooBLaOXKcSXDrCNWqYS//xSFqXfXD70NF9KulkuOUVBLw4cdzI/GtXf8CX/bUmRdPbtCmK7rDAZJm9y0sGPdKeDox6Xgt5H98f8DaDNMmE+CnQacJRIUiPe1phtW5wiXVYCuSGFKkYxt2suFArknZu0PmfmwkhM5Ovvt658SXL55d2716jVNPZg3CGqTmE8dO15z6BgHTSsEO7qk9m8/QeNR3QXo9knoUm8c/Y0yg+t5zFKIF4ln8XZ4td4atRcnR5+NET8iodoeyqnzx5ovvTxOgiw+jxsn4NuE8jt2m4sAlZeugLzS5foE/DAEEnHPWWhsGT1NeT1SIoaaZuhchZx4XVT51hosqAxFS67hY0Dqrc4apdNiQjQho0tRDtSDNcP365NlTWmsICMyn6nnKEAir8+Ah8CWJG703qp4+PjI5+4WiLyHEhvYesjBU5OGLH6Sh4xy4rNjRN+OoXq7niEPAh8PozH3x+M73G9tXj/h4oQa+eDhywVUpEfnh8wJDdyUpFTswUHUicgodavCwhs9QOkLaceTf1TMv091jz8Lme/H4Oh2r1Ukn/aFl70g7yC1ZhxQbCdyh4VojL548SSgpUy32x0wgHDHNsZYx7YdETwt+X6QNGMb743sVArl7YqeaPD27dWFj++aZyQdf7tzdZIMVjASuO/hy4HA5/LPQ51RDXUqDzDfMZoGDOMpfy1l2zp2fnH2XtdaDWfiiC26m1U7f9YdYmEh/wvP8tpnr2yHwuBFJa6xidc8vsqppCqnQqhpAYplVIsPGi9qrEEpK3TrAGi5Le9MPlEj4qqqEVvYTdgTkVrFKVl8iFyVVssK3XO7kOrW0ydqwy1qpVBsYSjOoipfssdicNWAaq1OGscG0TN+dNemVgLQrHodzzoB5rIKUNubpk+aYOC2/5VojA46Yz1gFDYx5uMQcPC5ki7RHNnusaE2KwCH3L559FBa3eNzD7N2CwY0qjT3TNDaa7maP3DapeqddmWrHvdgECPU2D2pAsZIhNzsHC7QoBt/QrVbC/Ruu1sie/i82NwMeZGf/gB9rZDkPIGXgLDlFpEUKOdEpua6ho4RU6R/fMGKkintSJGlaqdjVkrBpReIj4IKqyAs9OQC58fzF4yuBoEQ4SMB3q3wco+lb0ciWPnYroe3J8ESL0/EJOR6fCQXO1kev6thOTrU8YkQ1R0dc+47fEQzA4iP6ZUuJKyR/hQtbs0SeEslNaTsp4g6+svGkXZI5rcffHCTN/F8m5Zv7gfVrKUJXOZX2yYBLpepvNd9LrMidNQ0IhdleG4qjMlUDI9fknkvZ4q1k5ItMsBnuRhYa30rj8KsUMwjyIg+cYeXcu2xVCVuztZY4VsIMi6katVP6Yqum6FsEt61kwnAw/L9c2Tm9wRyHF+sKDuB/XnVsR0YqZH/pimTr3ozGK6ABZgFoycam0IYtTTAO5XvZSecqAoOaLF1zVf1YxtF+vQTyasblAdVtCZoOSvLkmjXdAVwHbR38rAV+ktqKRG8JXPRQkXGiqsdi8ArLg7zWp6Ghx4URDwpEEmxHGWHX36BIoQuT498q1/9rnq1yl/WTJZMimI254GUKuXjU4iBLglNUxDmWy6vFWG4CIRQ58P8lnfNSHAHSSKM5uo9gQQSxymNnbIiWBpHDIr+cAI7Cl4WYic3ZR/eQ1VHkuVlIJsG9vL62CZkoEODLwD8TkaLyJHL/ojV/vsKeVrVCOHJkxtZBwTyMyEqYtbJboaglW4U7MmtX1kaFJ2b+rL3QRmdGYdzB+IKtNMzn/Efyubp6VfbDlix+iwJ3RQ/p9f5+jto+/ymvwe9JJyrz8x8xvf7Xe+r10rC7b5+0y/f9Omr4nAwrqvTJybnd9Wfn7N7IksKOzgPXYnkhBK3OLEkno5NeQVxZvVpSoN4xz2arU1s2CALlCr5yLLOEBFp8idBccMJK69Vv3pxsPHqx+SHxLTy6PFgsF53QlIbJBR0xocrnna6MZPPD7Tt3dDCRBJ1zkb0tqIiBhXfGt8kQHTDo7F0elxSy5UPCMLbJ+Vt8mjvSNqHRMhwy/HwJifSKxDv7lco4A6VknEpFoSEHBy73KMWdoUOcNwcA3+sFEd4r+woUKS5+XU6LAlB8zuMUoBjAbQ90eIc3eW/8sOvoiyR1f5jpYm3I7Ml3NDl+bPv796yvNjTvBX1KOtMDo7o37IwfUmW6XGV2vpgv6R1NZXtHSomNNxZFadr96Mr2laeTU/d4F4M15b0lqGFNCVOWGuzylbxN6dO9w0kP49tRN1T6fzkd9EMlXof7KWkCKJglKuOsiEVvdGI1XWQHE5IoqPskASxEtGAStCkOUz3rgjOdQYUY/RSlQctmOK4mrWloa1Y+6UxLTjTIck4e1ybVJkfOiEjDSUqbZ0WnPBhhOVcp5tORoWliiJpyFHmvs3JMyplUxcOuv47asKbXevJ1UxzOyLHqs6bosRSlZCYlKqrIHWQVoOoc9F+qOTl5fmZyd2P38rfCkejRDNR8CsA82knovCKsuJLCS0MXnukpVeZ2kSpS4ShJlJTrITqv6DQUzME3Gr3kgo9U+JV37+RcmNRTsns7qPPXbRJ4H0nxpV5hJh0dmsFTjgtEMnFM/ZLAn45JLqkYZdA6eMs/O7P7xQUbzKBtPNuMNGQwcqVmMDeWI24skcoMR+rrPo5MKXxCYhh8jgyWRIft5Y/vLYgBA3zp8Ynti9+bWhBZU99sdrPsqT/LnqY6M+Y03aVwKNdryqT6ykSUNrO7qUvfQVj+bxjhyZljjmS3ytthnZwRK7mO/ZYFYPUrSA4cUx5ES0DI2NBAqE+LmgnBb01tLPFVA6H4kkyoaLpV2AXRnNHhzLFFRywZnGVRCSoxTtVAcTi4BcFMhF9snJ6cfDv8Zot5Bx9e+7CvB54CI/kq2dNY1Y/XUr0aYhAVDMWz5MzRFxtXVdEfDQroCemQIwU37HjTCM4OnYnPG7rrqM1pmVGtlbLW6nh8Y5mqoMGJXuLx18mFdkG86E9/HXqYHP+Kq0SX8M1ZXjIjqR8/U54aP1NXmnOHH4jPH77108LmTV2QytfW46/9dWCFrQz7K1q7D45iVh4f43paGWqSjcgtyJx6hgBfnmI3vTHe6CYUN78wii2qNyExqqfH5eeJQGAkTNLdKtq0Mr0ApQ1Wy6hGPU3EOtfSpoajwaFSqVO57DYl7+9x7rkgv/oJ5e2b70ey3aruhOcdWWUCdObzhpQNS252+KZHR7wSDzoWcZQBrXKJUcSjyfLQHqYWiPahhOev8M0P5y+RRWPgZGsZIFsFm/79jc6UBYZRaut87o5OLl+mdwCkGQ3URmELT6naylOqtvSYHi89JuaXXiRoq6JsBukyKYtmMG+ZQJz6ZRIEarJMTKIqbxLKypqErmNNQlFYE5Nj1sS0fq5xaErf8pqWqUimDNmPqMuYIuN0mKi2RM0iahWmUkRtwqkQKaZPNAaB8F5P4JLnWvh82NWTjHviFgagrEnaxN1SYTH4ZFyn/OlNgPDX94g4wZ/zcaehTa7K6RCmoEpBacQwCOMZuHOwrjYc5jCYAbCIvRzqqg0tRaRkMCkiJEEq7Njf018CRqjJCd6bgjvYWkePycMKLAhSJFCC5bUT0iyRuSIHpK8VMWZpOEcumiAk9xOTe1EszcoiEz7UxGRNlAFOGjhJoGLAs3/HlyM79ozYuHDkvp4lzuODxviolW4Px4umeZswIOU+kecYR4i8IOECygJmdr9YkhBOXQ3r38C2gyoewz9OW5HmPmEWpL3ai/Vo7p/NcvS38y1H0qizbx+3qfb9rcsYgxPyAdeRZo6Nq2I14dfN+FaECpvvzkCFg4OEYUd68ZoozrBrJhy5NdGO3NpTRu7nVZyVK45m2Uj3+A5BVgJ+HlMDrm5cNVitGLUqCgf5aBYCpcB7unEiVoswjk5RdnUyiLjaOx4cJbpHk9lIyRZ0yBI2lZDl67C1jCo8hGGjBN7TOIErJ3FkcfwrMaQsw7OfCKcYz9Gl4SZ0MVpHE59OCaaDjTQhELGHW50EkonhTtkqWdX33zC6UPePyUAhFUHSQz1aXY6mrDBHk4fqSD44aiTToTq6eQ9iofSD5Tvj25HwJkwo13qabA4ee9zF9rHLO1fWtj68F/iMxmP0uuS+H7qJSBKe2eX04NM+aIs40jTR6/NGn5Bls0+ckI6ZL4cM7NxkbH44j5yBOd1jkaLcUJp+0znSvOmMum66lDYNtakHeTJY3IiA7k7rX/7y5XmjDVBx0a0yR5KujaLgLkcywC4laQtsmlohGI5IeQDHgt0t1VPTlAwO8qsKJXlP4f94y4QSVuipua8Z0SUZBw8TcAmMagi9OqOwnjbvuY9CLvaBC7qvAlf7zXeZ/IFO3eu8UgdW1DNWSExESMuFxBspM3H0mJkYPWEmnpwsx9ovxjruy1Hy1kdm33oVUaX+nas6fWe6tlgC24MUUJC+pSeGYfltd9hvuLjcZoaTSiKloFdld44U8hIo2QnJtzSLg7wXhMP0hxR0JR+RAJZ9wSgUgG8PF+zhQp4QYh4hrIsx8l8QOSCdTFkzFKirKUPgesFBAvDfYa+gaNHAG9Rmc+A3qJelpLt7ATFl0PgZ7en4vaBw1OTCoUVWG5mQaIxsECF1cUqGJUYKEgtOIpgwmFlxggqrHJVbyWitwot9EnA77yEVfpRhifjio5zoVQSJc/4WH7IeKIqDmcSkeJFDiUFKth7oHMp1MofRUkGTuO4mMVoTsG2lcXJhe1ioKBhYj5s3ESS1IGGBAIqLRYyYBElmsFidkh2RSHo9JTm80HD7JJLjtdAMVAHUhYY7nXmMj2G4zBQhcZ0px+K7eSM+cUqZ4mg7nPCcaIvHpaD69c/FQFHVbY4FMvQWinb8ZYMatctRohcogJzEKtF5n2L+U2dwEEmwn4KVeBKLxvkzwV+O9VZQnz04UUki9v6Zc5NTU+cmsoGtj1YWNdRiHbveqrvp4HltxyOfMPzzt1hZpuHT+q6V/Sfuj+z6SEd+ddcOE80tIsnZs8nuEVMukUa3QOSTnL/1eoX4rXpzgB5ysb8IGQRePF5nr5G+RDypJZlPT4eZ8/jncLvq/7DT1BHlNIkOvG+fMfdIhEkSqXnGGtVWot7jVB7VSZwu4vSEREPwyoFpBok+EBG7x+oepitGT5C5B9AJdHao2SDzFFD28DUBrh6zKmD1MNXwpOFIhx0NNXq0yKiOqpk5hBiltcK4BMEp5HK4rY3vdMq1UGglyEcwj4M6BnIcuhE0IiDEoRnDHg5zHBYnvFLtaLwAWLTap9fPLl+cPzbn/ItfWT4xf13+sJJaKH5S/Zr8IfkbyoDix6PvJlZ23s4kCvQrKafW/zOXFqcJ5cuRI0dmKV+ED6aFOwrrauOX4I9A+QeNE5UMPHX2eeJB/KBzz7GtzlPNbsaz1pK/+dUvfrmXnWTqb2YhmW0jtpGpP5hV5FfzrSJ/86tfRoPIr6IbTfuLpuwiXLjL9cDiBSpuIa5jiUJjvpqcf4fcvYqDlIixK5bSeqnsBy47LLrkIsxXdUlXFMqNBMcrWULs7OmtK6eNJGpZNYuZUnZ1UajcX9Edb+b4NP9TSYEnWXfYy9v/Z40yRX+AVHxHlygEBYfClJj13mQDWXFePN6UohqoOdQUxXLHjfjVSFduRLpcs3a4nFkH8Mq6u/bi6UWmzvXs+7NUy8ImIe+Rw6+ntWxkJp88p6Rv3eFCNtKkRpR2hVvJw/wYB06MLH9YUy/48qNcfVfuaaFRWo77KaNgd6roKfyeLj6xiqfdJkdpPinnJtbvHkS87wE5VXwH/0B7nSQA10T3VVXvfju5/BfrIFBeTsj3w1jBAMPH9SVN8qpAPhJ2lENFRfgbWtleHEAOuLoiYtWpMu/k3B1LKdetkJEnlpwaf46siAdq1jQqWM+yJE0dkpfBdRgBtNckX9nkxrMXGyfZha+iSQ+007Kgr2qic6kI+ipl+Y+VQCUZP2UQ5zKgloxfa4BWMSlyINqN9XIbFEASR0tK2cauoTv3HvEzo7yNNf6yPvFS/v3qeL1Nqvy5estc7c+KLVvNv4C6RlN1VV9lmu4G0+VSqrE+5s6976xEppRQjcSWEZpS9H8hed2IcQbgiZt0R5RSCnrj+hdTmd4Q9Xb8pM/31pRUjKBoh51DxfSYY1e/Tcde9POV3ngz9Phbl/qCziv5haYzzN0/Pnnv0/Buvmt5vbR3Tvwb+nDvaLnrenz8EaBpjeBCzneLCh8IKJGuttZPbb3zNZJwvvUpokuoK1fOnhLcxQhOchts1X07I1NwO9OTRnAzbfLo5kR5saY6r2EL85Q1HIPBb2k1EinJGvjQIi/kMNDJ48e7V/8SFzIHgv58whIEHYhxEDS5m2dMLFacw7QKwX/WinGi8waa/ysTI2t3psl/A39tuaS3bkMSWSdwVkXJgLdOITs5b0eNCSTnYtRWperdfhA/9TIorGITFcP2ZZJc5H47RZoiizJboeRUN32H05FCatAa5UzjO88vh2VJ5am5gjyvSglRHO4H+06ohJUYxNsoSDV/l+tgAIAb7ZPnJ4/vMu1AggraONpt2MzI61aBYwecFxhWvSCKJJh14Ky9IRwmA/irKBXQcIG32q0+c9fQG+aJBPNnXyDv6d1TWxfx9dt+XjTdbBDUs5bsJFXWreslSy2a9xukN3C9coLqcL/AH5CvYapfiuaWgBDYFO4MmcXoCHZungKHf/zl9tU1GwdwR7ZSFL2ZUXgQ4oZRDvjeTO/ol72CtUPq7R3uR4AIAgGw8KyXnvqXJfPLOGqqB+ijhifmdBeUU4EXrt/2QK9enO225SC+sIeafGDd8r2Wb6ZvRvrQNbJ1QexT/g58zzMnXzw+DZHP+TuqmjdWVddVE7SlPHaposH1KIJhusNEOiS9m3iwrkU8zOnPfT8Kwkq/ngRizfl44ffh+PE+vp1+PCjX8eOF3RFp42qK7hLntAM7HWXzOjl+aveTh74r4Pu2GraznQ0DAxpk9F8yCjxklK1VEMkYsHPzqFgCRmHLak3gpcBppQh4vVQMe1YEPLbV/CyOCvL+XnqTCxQRo1R6hPaR+J6TN9BAIniZpzaElniNiGD+x41oZiOxoVaWsuBpmvmphTuzZEstTNSrIxLP5bNJTtvzR/CtJBkkEKI04g0rTUWh8H1DOkV1SFbXs2usCkUlCLajf88opN38svLlIQ7l1wm3lfNSDU+EiyhJpBx5lcs0LQ7yUDWIlJhRMa3CjHzy46BS/ANXzYzKSqpBeN3B1Ib/7Z9J9lKekDml2iNUlxI3f5wqcaNlpdnovv56LHEgoWEEjxXH5shZ2QmAUSrWR+jKTPAr+iJNxqlaAh9C1NKp+5yzJUWLUyARyO3n5DdO0EjEIV7bMB3DQNlf2SjFJx4r+N+KFgQnOOzhZda0sIpy12TtlIB9WfOfkKYz8iyRYy+TX15skU/SjNyIDP2vExLzGfbPYtWRrf6sx62HUnjEf3N8xpgLNuE0M9nrwWkGopFinbLN/wHuN/CqKYqAv6ejxOY9ESPE9miv0WHz/myWrF/uERmGRgv79mmbpX2/ZHOWEf6vlMc177VV3vx50Bvmi9h8//qvsPnxyP8UnhnlvRXa0b/+r//hUBEYE4j7d/vXINDHX+cr7e/803/rng5DrcLf8ejWhaBurPsHf5mSpZFpEl4eW1gb/1c6m0YwTmGcLZ0YfCSkj6l/Q1PDWWtzGEB+j9nt538cdHLqn62DuOL5+0P4uW/ff/i//18pCOmZ";
\ No newline at end of file
+export const w="eNq0vXlzFMeyN/xVOvzHfSL6+MRl55z7n3aBEKAVpCduED0zPTMt9XSPepE0euJGIDC72Wx8MNsBYRZhEIvBBgkDEc/g4ItoRtJf71d4c6mqrp4ZGc577xthrOnqrqzq6qrMX2ZlZv3Xf/3X//mPr8LI8UY8p+I55a++xgLbDrojz85mra++/qrdt4fLPZ1t3kT20KFwshDkxkZL7c6kOThaHBnfVim1Y8m2LaV2fAIenB039+3t2I918M6hHZOFCP6Ouk4+hrL23XbfLDy5pdK+d3TKyR/aERZmveyhKTefOWyObLXGd4STPaNTrtO+2++OgrHRWW/i0HjROjx+uJiBNrdGQW4UrjPQHrbdNj422rY7GjGHZrvNvR3D+21sf1t318He7q6B3j3dXd222d0Vl8xp+D3VYw4N7u2AX/7gvo5Sfx/c7ho4WO5sK/Tt6bL79nQfDsy43NM2NLhv75ZK6RD87vwKBinwo6wVRKGT++rr//zPr6zAKhs+jFLJgf+Fnp+FsbKoxOEiHLzqk4pR8KovI/hd/+Zi7dK38MOPDLwPD/zvr//zqxQNI7By9ISigoVxKMpbkmNahj3tFIignTMsJ+tVf845IfX2K6Th5wI7zlqhzXTinOF9upCH37Vny7WL5+FHyQ/y3DGohITm/GmjmVhCCDoV2kF51hY9w3/ex8fYxY/fF0MoXX/6tPb7sY3bL2s/PZc9dXKGnXX8aX756k/Vh1bkZB3Xx5ec9oMyjlsuTsoyoqy64kwB6U+XpqDrV4pzxsfHZRyHF8fWn72unTpZP7OMbYR2PGUHMBxQrcxDnNBNqNEwGl71zhyOwaVv13/9J/zI+6mKds7KOa7l+WFgl3EsgLZfxC8dbn7rj8cRdPOP88WsUX1UwO/1ZNbQCnl0jI/zOPprP8/XTv5Sv/N7/ehD/r125Xbt4mW4VQwtN2tUItUKdamEk8SBpmnC8ZTJcsOfrlTg/6tvLmDlyJkxiALVCmHg7cCOPAceL3pAkt4hKbNFGX9H1/CrC04E/XdmjerSlIETBnt742zt9KP158dr5y9uvLsEUwfJRJKMV0AiqpeqIeylHSaNNHU0qQizy8+mJhqObcWHNgx/v/pu8afvCjiBC0Z1OSM+4Lnb9R/urr7BqRzY+TzMM1hoBTsjFwV0Mk+E4bcHFw5fVVfEmhKkVlcuADWmQ0uCiSW9oxXZ1dzBLn2BGp++m1GLtH4av2cQU9U9aoAktfQKNexNVzqNFZNhInGJRlaMP9KprmBRWH0kS+QH5V7B/38pqA8JVGsnXvCiEV/QL5VSxEu2EQI38ssJcR8GD57Ggk8XYJQbKB9bVmRzXuwHBZ2oHQAPAI6SC6ovxWdOiuSHrz4q4rfAcfU+zjsTsNBhtcOymc/T/2PiLbXv8COtXf9m4+qr1eVz9X8AG8NB8mx7JrIzhqSHzSYNwqx0AmLVskGc/FQim/WBJ8CQFedUIxtH79RO/4YvJKrYEdVJfUjx4Zq/JJJdIU576fTakwfyO2KdrDbpxeMNswBevLpU0ZYjctVTr1bfHOVVKDoFFeBry/5YDgw5LD/RHau6RNetVl5FPMmjxBfw0XGARC1YK/QWyAngVZIvgj15fglGiD8AXApisiv8ZZFZTWtfOrmurhDb2rh2T/tsNt+l+igZ7VLg5x0v1uqFtmvFBccI7QiFcIom8Na84f3xeALH+/TJ2q1T2C/Xs6dtnXRYXQgiC6b29F+BNtLEAphwoe8FXOJUF1wDhQ28+gQIioWY1uKt++u/vl57+33txl2a4U4ROx1hHepz+FdR/1+kFNjFyC4Ax0poBZYLYrBswRLHkQAx4OA0Si4M9QQzxgX4RjFxMuJpIG3maHzP18/+AGxt7e1pqq7IVlymSR8fh1KnB81YqQIkChMZRNkUs8n6zfO1F6cZ0CRUxYx2cjbSC+OsHTQI9DmryIWaRK8+iidg9U0ogb729lb93He6QA/jPNTigZFkLZIrBdujKapIqMrYs6SeFYV+GaQ79CFy7AmmgPRFoeoYwAJYdlGqVwun6xcvKcKuJUhFWSLE5EFU+GnioiR55TswBYDDZHTaq29f18/eV7RR4Pg6YUZJpcDJW4ZlzDk5wKECcDoIS2UBzK2XDoBUkPrMi6rLOWQdJWKbuICXAXh4sIyzBnOCtRvv127fWLvxZv3D841rp5kx0LKLYGCMhLSc3FZBax3WnwMtqevm9p7MpRo59TNiLBe+WexXGqn7ESCqnAfz0gpDP0dsJylzcTLmXKscii/0KEAAEOOM/wU47BK8k+BKqysrG0fP1I5eq387X7/yjOe8IANNE2luMM7hJ/RTDWa50LXT7X26VMb2sJUbkzCGi1ha+35+deVh7eKz9afIw2RdvRFmYrCWotjFWZwNbSeeQl5seVbBsFyrZBCUjsp2llk0jNsvOIQgXRHqXnBKBKXfbLz9sfb7Su3cGXwjpgN8v+Ii8SxS16BXAi2aKCtiYn1ISqq2a0/D5LfKJQVNbDfjqIImGaLdRRJadcm4Ih85XvJcuhwBRCAEC3LHKfw/oqfa0+Xaid9rJxZrT79N1wfOFQPf+t+gl8GbHrLdcslCPeQ/G/SpJl3qz5UoIQZT+g5eguQQ0ITVHKXaJErNpoqGrqsoLUVXMhBeBXmxopqVCKUkSJVAtCTBtYbdE6CuwLkGyRX+1cCvDnwV6m0BeJuBSYsxbESmCjKqhiRIVAhRg4YpUJiGgwJ6cDcZc3BPdYzHICrpqAafFGZSaCmFdzSwozWnmkqADY+8whqbIBkNZggAIP6kxL8S/C3kPX3VlpJdifOUIG8Qirq4aSETU4JUiarPVNKkkS5/NuH/iulTzRSXDxJeq/PX1uq4zkgDjXUG2nJuwdXSLC3NzsIUL9NYj+I3KU6j8ZjQgun3Xywd7aBghU6n8W+GvGz76j+gu3ZciKOAtKU/eU7a2j5DC7Bl9s8fKoaOW8Cx/PvOrf/x1WTWKkNPZ776P/8ByMMu4V+tcu7IEXV1BCoc2Yrmvs8bAPPbwuEtlamSMzNd3j5XzO+Af8X87vBw354BKN6xvZg/uGvLVGmf6xzYOV0+4OycKU+Vivnhg3v74bltfsmb3FIp7ds5M91XCrxJWEpwPbVr36yzB68nzMED/b3lfbPuju1zefjdA3+L41C9s6N99EB/e6fpdJq9A/s7x6BJKO4bNy34ZY317cnC47n2CXP/oNnjmN2dHTM95vjBvbt74Gf20IH+/dFBc+vgQdMeH96bPTTY39+bGTg0eCBC6tbY4T1QfhCouvD4BPzrGjSh3oi5zzHbDgZm6JizRbMj033APFQE6gXX3OqabbnRXY5ZLuHt4ph5cMBsYR7EiUqCdAFQb9liVXwJC2FuWUkZckQUKYDLUPcEgAbQ7BIx/SuLG0ePAZ+r3fumvkSMBXQEVZ3qy+ktG2mSt1bLGw2NpmRu0qwmdlWLpDIgEQHy3erCNJSSzI0LAbNfKjV8L1XM0PPjfBbRL3LYFbKP/PC8dvFY/YfT9at3xFTH5w00rU2LF0yaoZeAme2K1fsnd2Qb6ZfjhtSbiVbgpWxZVY0oCugSvFnOityYeRQORKa5+NN3cYFVO5uMIY88gogsrer/vAmcfu36N+vH3wFOZLFlQ0tR7BsJwaZ2xQuRXNfarcQl/n5JIyDgkHcp+vV/zjfUcYsFpyitYHMWCAyaeqkLYSICsvGn7yqGU32EDdXO3gC69Ztn6r8sCOso0OU6JAr4d9Pwb1beopUGxKc1mJqATK/hQ4VIH9TKfBzCTRQrcZ5YfGOxnychPcfT/eNjNGCQ/eK3l2jeOXV5/ddvsCISMERlqq0gvCLHr4QqllDFW99RjQF8n8V3Xiqp9uo/vq//KBQt1RK8GyA5aa71xWty/8n2ny6LLIZvH28AxMHBE+xjgnQ8muqvYPSwtfNPYZWRMmqh5UoSEdhT0bRynkPrNykC9Ga1aAV+BPQZA72dtW9+W31Lszsh4LpOFArd2A4CbgeV8FCox1mtFNTwMNG+F3LQFrT3S5xl7Xtt6cr6s2cbV64RQp0JPctQ1eW7CGKC2cXAkfOs06XuWNNOZE9kfPxMizFaIKqLxTmxlpAnPqERXFt4Wl/6CTnh03+urpxjECToIBtk8gphAKzBhczgQf5uZAc6F0DdCx/lZxvogA5pxVM6NcMJJRrUFv8fj4swl1MMYHX5Qu3UHVmV69Lk8gQ7tZwATRfIzn0nqC7gmAh+ajnaHUvdAGBHC3epjP+/k5Nv83Rl/dk3tXff8wvh46zciRaUjEq1qbM2vUXmbSyVhCkWkS8IROfj9/gdQS7VLp3GD/LmzcatfzIETlrSGR29VxjaWdvDjSrUEnBm4UtRIb5gAUBiIKzYs7Qrk0cODqIDZWNGvOPGtUcbP11ABv5gvvbhBL/pJJAzKghliVjcqs0mkaS13UJccZubsEVuu4Etau23lGAA7bOWFM4WolJuDNkpmQTEPUe/CW3P0JeexbFA00pofPweLb5qDq++WVlf+BZGpHbxav3CfTWfA9+ZtsgaKhqAFuLm7jRBFNmX1A2tZZ7wTUCFW4dZ34hVZNMprELmTVpfHnAfJ0dCjwpxlXAZQJZkPwgAkvbKKxcAF2lvmqeXdB1rWn9HRTvhQEJ+Jy3ozElBMbmaUdEDHX65xECMG6ydOb9246l4OdEkWX2AGcXCMAfDoqEHTf7D1CdtJOEaTvVOlOJGtXs/K4YE82jScfXP9j+ERyRhfZGCFAudaZsB1bRrhSzlmsqQ5cSTNCunaFOIjKjVZX3cEO4BL2ReYQh9vHby1/rxE7h2H85v3P2G+7N24Xnt1ArwD7XvAFLHz0PXCp4TBFZGaJvxFHykKVghdpZ2uANUKaEoq/pF2yHVxQAAO4nHJ2TLfffD6tu39aW7aw/ovUFM6XTlhndo4zYLUvGBNedwO94hmvBWoOhXxE7UApkhXjxeO7uMQ/nsMdlMQDdlCgAi0QLHMzznTFdXcoKqRhK6OEObSAiHBcmNq0/X/nEZsDCTjDKxn0tRi20ghMsB5w98eMOvUO8yMOYVsblJsuY2b27uAUhsBL4nTE2eqO14huMprr7CtdUFj1j9x2eCEv2oX6XtEFgpuCXiCKklticKsWuU4qJHxGnWW6IUsAqMM7W1PEUT49MV3IEnNaN24S1N9G9YzUDJC8RnRHf9CLfwucNWNrCzos9LExLCxRViOGehe+sfbgqjW5pGzgoCm9wlchYRgj+GFaKTCBND6wZ8CLtEBvhQQuyNuz/Cx1hdPr369iij7ILnB8iDnWIkiIeOVZJ0QzSvi9/QGugdmRRkR758+rGC7Hbo2mlatK8DaDr2BFROrgBsFSSxRRIDL7OCJ326RFa0D6eQ8s2fV99eALa0+vY+qaV+Hrh+YE/bendlC9Rf2cCTuKimgcPGntXfr/Pnr51EJgQgtGBpxGDBwDgGfoHgAv0sCsa5NEvfB+kwB8AeLiAWrd1chGUOl/B5DPnm1pwd4cf1YfrAfAa6SDGIC3YoHQw8JvwExhWBobCLPr0OUFBobkEcMsFWpucGfV/p34qwpnXrqnaDkp3WenU9V9dslTqbKLKNXDvFqz+DRht00UQzTH4JQUxNo5Z29Y6unDWpSg36UaIUKUWoQQVq0EhSukizGqLrHimtI60MpPB/M+LXcb6O8P8buL4B1ANniKfsnCW+pMK7/EbzOX1GAJROZkQzik4BzDSkZG7QgF0bUGsjYNVhWRqLpQFY8poNiK8l0NMBViO2asRVOqhqBag+O483BzMpJMMQmIQwysOXTjbrBJEw32jCW4ltXWSzQGVZqnNaxWN1uSnFXiIslaBkqSa2R1CEseTifVSQE/DiKMHY30IXXlJs6fJGkzJ6t4z4j/M5JWNUJzcAJZOE4VdTwkDyZfk3oUM+CyQAFJH6rfvA9gkJ6cyZ2LIm4pVEx5FJcUphQA+9wI4i6yB6LEZWwd7faDlv9YAymW9SW9jKW91VRvK/bWYkF7XKR46Iat6Rv325fXwuyo145m7409XRNjSRHevsmLRHC/nx/bPlONPRNjC6e1eU69vbdbC8Nc6MdXojneEU3Nua2b1rLjfWOT2FdeBv6Bcz1lS5aI11zoxg/S2HO/Z0bLdHA7i/DwhMlX2rBOWlwvj+ju2TQHcuCibGOrfGVmfZL3YW8vs7gols5xa3Y/shEyq0T9ptW4Ca19N9sL1/T8/OIfjf3q4tbT3dw+1IsQTN9ORKZqVk7hk0D0DJgX34r69raLC/50CbuSc0/xY65mD/nmjCHD7Y2w739mbHMtYW9/A4UDnYsXN0oIX9G31HLYOcowjxluOsD6geh4u9StlVISn2Pj6eRfswIJC0D2ntw/HaiZfKhxQ+FbnRJT6kgiC048AH8tNNiBKhMjQ7qD6cr39zMSHuUwWNuIV2MWWvAlySXJGJailGOL22dKV245+MLNk2JYxesKQRW1bvpGpSuY0uJzo5iRAlXaP6MiOddBklcjMbj16ywy4qAugcozdJu/8aVa/hmjgwc165fQ+rLpIeLDmnjMY93UaXFCkDnewYcF7EsaCcYRepWxtHb9c+kEpBVI3JLGhNiSOEBUItZ5ccfVT1G+iLqo/Jcl4MBWLxJy5xw/MwBrXzL9cen2M2zzWBpqzH3y014I1jgNv4/OlqK8mn0wlwr+DlrcAInIKldVWMSGDBBwAWoNFMDworpACq50Q7cnhA/1x9d5N6T+NjRERF9Fs2ZqVbEDv7vK2PLuRJHXZY8OyynSNnXuUAxL4L8obl6vfQFo/6IpvE52NEzzCma+ee1N4crz39ifZRtdq2qEnasZ/De9M6PSgjjxatiPAaYa0Qh6GYamv96In14zfXL7xWzQUIZGZSDbEzS9bxYs0ZJdRLmr1RIr6rXE6VWT5FaZNi9LmIUIoWDGRIwCjI223j6PX6L7fr157X35yg70a2+qa20B0rZ2esEL5i5JRgUQYRexcEcc4R5SDrS45ShtBFgbEWWrdIiNVPPKxfW6lfOL36+x1yQs6FtEwtBSnJxSVrF2l16y2Fwtsl64tbqjE0bJMfbUNj689Ort2+rxqzCznbBZAxmWpPZ+HoqhTaecezShJMabeSgIBFdF4ifo4Mzf90wSEEefoUcPP19+/XFxY1bh6KesIsJD14DEKsgmKoefLoLYkXImdwvSXAqt/cVi2FgHtc286nmqKVc5esnw5NA3itAgE9vGOJG3o5e/MTzkZWWpxj+C4brR99CIh749T5tXsr3K6d0KkIKprLr05aOtjoZYk/edIM/wSoxqtqTrngcJu1sx/qZ87V5q/rrgPptvFz2oGDtiIDFd8Cv7BVVFcFqU/XLl0mpxlrhowmMd0XREpSwotKvod6v2t4WpnWVxg0tJc9mWUXItHPi69XPyyAosLKNdYCNiwdksloazH0FhfVF2w104ipAaEtS0lwdeVc/fYlYa0FIvLtiR66gU8T0GaKyXVCGL+vDNNgqhtH5zk0g8lBR+0w7cCNzvEECq05YANZORqkB6cDgthRlzzo1Qes3Xu1dmw59d2A8eYkWIePRjRp0K2WDQUq8ihFXhHOWXZREbQjeGdisKQEqtWMxY7mkcgeuv7H+Yq2IUCs4/XGsaOsEyZ2SazLSmGTUyx3WBUI8olLbIo6O8Uq6sIpNiGsXIzZ+/e/72Bc8YTQ8VFLthRlP8Q22SEUSoRnLdnHSNwnhAGirT/9oAiHXDGhK3uMnrzSqa6piGwCbIQi4zIaLPATnv9h/end9af31hae0nDAlDNkLRro6QAt2SlarcqEfWu5kiIPtDfufqPIA7Oc9P1MqoHEC5knjVwwGZBEAUVAhTENm7ihyKdWEjehVhLOdClyoLJaUbiUNCnH6Ctn6OJN7BXr7yB6jxMlRTfhJmRkqz5isSyuVnIaplVIVqJ5wD6+8vAOfZhmgQMoUVEi9Zl/GnDf8ewCG5oUSH5C/p8TijIK95sr/BGZuFGJlBk/cll70RFrK0yssDDuR2atjFFxy18AfltVp42fpLKO/lO4f1PgjL54CfT+MiWCiRV491VXJJDw94kiIWlLVaKV4RUUPlb7WJHUFDyl2iUqXVoT07SaFvqcplkBPIiDSPhK4gdPqUL6tNEUqs0+YuuR1PUPpQZsomYolYKslpZy6EzwePKT3E+SMan/eEGMiQ7pNRDcGhArGMzGyRTwTYFQDXY2IlsJM3VwmSA8HT5qSC7BcDp001BSkIZMGh5TMCyFfyReacIoCpYkaCTBDAos6ChBYQOFClrIagkKPiudhWBOhGUiJVOyUUlFTR5KcSX/EmeEtxJMt3bpAW1Hqs+dSISU9GnFT1NSQHDlnBXwlkwjRwbgPyvD59af310/9aqJzcsPmHDiP+fDaSb8rzBGja3pbkefY2kJP9vceMmPDG5uvEweaGG8TNVuMl4md5XxcvcXGC9Fr4/s/nLjZSmfHc2Mj5RHc0M7xkd2DjkTg9tyzuD29oEtfWbOM4uHD/3dMr3utoO+PdgLVwfg6dnIHRsqwA/404/lc/AA/oWiXVN4HXS37QbK0djQHnxsm7O9dyK3rffwob/0mT2TULS7lB31B3u74aGdu0v50cL4yOQec09PV0dmpDdjzlpm5A51zBYPtc8WD7fDE1lorw1u90HbO6Z8u3dv50jG3HPQ3N8+5x0y4c7s1oPtbi/R2N/Zvhf+DMPffX3wA/qWL5tdHcV8nzkXeG19e3o62vftHYC/XX8vmD22OTNhenvxXncLY6aPgYvk0UPmPNo2pJJAWvIkJPSqK3JTctETiPDZ3Y3ji7WTJ2gTgU0UAUgyFSSZAcyqkeYCnTJ6pAjLqGxDxCmfeMkN8CZExmpBGcSAnQHNN6dI41a1Kvp0E61AZBtA91xhFb12ee3k7frRW/XXL9je76OpQ9b6M+LBv0jb24QyxqZH1Zdlp0hDYU3brmojdLR7bowBosR3oCXgqBOGGi/iYe9r86d4rJJRmkPvicgvV4rKfQbKIhuKnKLwLMBg0KQhsp3hZrlLX+SOZ6j28DMf+4kbwiasYtTUAijasDrp+2K4KvD3nI3aKo0MxuOR7eBW/ZczYkzCuKSNhnpeXIbxppXFG8r6VqkAiNSgyvybbWYGIgKyT376bsZwPt6gwXq2tP78Zu3USv305bW318hT2bDdXM4JdGIwH0DPIvbpTzi4p27pZZK683F+0vh4Q6iKRPn3o+sPybBINA2qo+C+E1QfwZIrCaTvAFvjKySmAo5vcqgxQPwKPlApqa1Rqkx6SNazSr7w97NlqeXCNMY1+cf5WCCEWXKLQXRCBslnr2rPL6JbzLEnKM3x8VQjamWKjxGgKovmK5FUA+Nj0crpVZcnRYTs8cu1G8/VEnLn5uKyjg/+agUZm2RtyHq8XeaOo/2B3YBWItyyoEQXpy/W37yp3XhfP8cxKkjNmLHCAgyxHEQ9nwYPpFKMU/qwUoOFgUQowa2Scthz5EWrKdjwwYtp7Zot3UuRlo9jpX7xkh6+O2mJTwUL3o1F8A4p1ckls88FYZi8W79N/iWwnirojyVUMOBwIafc0GpaOXggRNeSdLmiCPM8DhHHhor22qu79UtkhkfqRjELKzzUvrQf4awifqpWnk5Z8nu0QGksh1kyWaBSXKei8WZJR42uVsCDm5BnTxexQ83E1xe+Xf9wg3pONLXRRXeZOVhYVsT+MvDb4AsUSxgspfak15++4W3pCN0SMxVBovpTEdaPlVCxPIC9VkkjhQFTEXu1ayRr9x6BaqGozvhB4JdQO1Sk/6x30iksocfbyKlehmWrKDOh2DmYOgY5GymSogx9juB/cw6tLQoQ9j/OI79OOnvpwtpiQjzAaLo0ef7g7DSkTQH4fynOOaq0II2FmtdQ45SoH32ovIhaTIzIc5iVxLqjEu7YlOICu1zqjRr4sJPdrG3QEeAlH1ca2l1ducERkFpzIBcEA0ZLMG2GVBfIE4o39r2GUk96JtC+CLX26VJWBp3W71+vv0Ffk/rSPRF9inY+25Uv1thCEnOQakTGHTS0pCIOZDMcbiAa0GINxOoNYxlUCxwhS1IKzW2eLFa8OvUOxLHVC/AHytmCFuur9NuIRcqXhGaSBUZRRpclmQqGKNfen2aHSUnTgJW2RzoKSTXW8JEPkHoe2uw2pG4Ry8Q7lpZ2iUepINHA6vKZ+jcgLU7U33/D1jzPAlEOSnAgA4hRAjF9I/CnrbzB6gtTThXptBPhQbRZfgiyGLJgu+UUDwHhaessBPfcZtk4iJ5Ki1lDYyXI3n7+tv7rOWYkOguZcxT7B0yMTniKMhXA924mjXE+fzyOErKn3q79jN49SM0o++XUbAGsQKEm8NIG5nZSBeh1TPq+Nk1q90/V7r9rmCZhzFV4ltBvNUsSioYP+tywTlebJExXTRJBMZkjtNvvU+Ix9iwgIIJCKinGjTgGi4mr6SJ6/t7JyUw6iH1omqBP0OqblY3573ET8DjypEpxhg2GMyLng94YJz5yQq2lfvYbyosdqoZW5HtdegDcXDXDb5cXm/0z8uWEiG1QhXRNSHnRNohcdo9o4qzSQyLtjWH5Gd0Jw/LsOKMTB2hYVEThc+iuFjnfL7S2QWoqXEu1UAlverEECqTUsX9ZN2tQngJLV2M+oygp9QjpNCgsQsX4jKbSoGZoCkGiByj0r3B/GrFrMJ0YWuK7tvbwx7X7/2R8pkD4Z5FzApgboLIyrUk0/HlkrKNiHWx+BrFqaHWTSi3mhA4PFZ5J8FGCXBRmSXDVlz2vo5sGXPNZRNMAJtIwoqVwV2JdRKCkpbkuxxMhrgvYlGjVhaqSpZoUlRkCEpGZyMgG2aikoi4NpTRBj1qx1rOaKFEiRAgPncXTDmGjrFCsPGHiPOxF15mGnpE67ia/WzBnnSdr/Fhjjy0Yo2JbGs/6EyOmeGRgUyOm9kCzETNdu9GIqd1VRsxdnzdiyl4f2aWMmF9t3boNqGzfAeT55xb+yRe7t6ty+N/n85lODByIy/ahw3MZC/9WZsYHM9bhsZnxgS32oYGth3dmrK0z4wen8rkDWyvjB2bhxxZ4rquz3enwhvZ3to905HPxuHl43NwS24dK7u4uczQc2j86ZbqjI77pw3+l0YEhc19vD9xq3z1woLM9Gh42gcJQr9nZPtVmRr45Oz2Vi8uHuuFv3ho7vG3nnLXdNw/vnMts31qZgR5ty1hjh6CH7UBkZ5e5q8v024OOLf3m5CjS7Qi9/d2d7V0TB7ZuAcrDU+buiYEZKB2Cm/t698L/+3sH+s1dBfMvB82RfjPsMvv2wBX87O3bu7WA+QsGM2Z5zOw9ABUmoUJXu90JNAcPdrXDn2Cku6vz0NSI2TVkdhzEPrSyjUZOXEI44IQytI0tQ+TyYPhuqhTdSqZ4s59QD6X4+55MO/WlM/WzLwD6gBhfu3mbOCLiuoobB1HiXR5oAb7cUOgD//IxA6pWapP38p2M8BB/UgxVQ6srJ+s/fVe79zMgEm4I8PEcotWkKfYOy3pWkAelwbNcDiTGXxmraGi3lUHJqS7QzkXEpqS1a+9qtx6IrXTLLuOLTFKFBvrKF+3LyAkqmCZO8qHAwWSkAbB+MQKB2N5CLTEp86jUzhmpEAgcGdWii4gqIzIc4Xeg0AgYJ+gB5qs7/YRVSBvGicIrmSpvkUGrMFZ+ySjF7OGDefroAcyq55RQ3rNze+v2GtrQxk1vh/RGmVQL2H1ZxAU1Fil7AkWrS6bKJoW1b36r//hemBQ4ktKS2ZhKch7rtJZgdoFYaywvCPkgxzHd1J3X6x+u4RyTrdFkTjUmXF8xKknGe8soJVQNk4hvdAahmLZLHD6RhH2DSF4/9mz1LUVlyMjviitksxGFfslNktmqSUJ3GyaJMivIVam9FYWqiElx8za/Ve3d98lcEA2mIq10T8tpB7iyk5dpLUPSpMh5hj8LKFJrb28Jj15+kjqf/ihpMkuNpZ1igjfSh17rTYR2xUiakbvQKsgVED1UTDyTs1iAqIaAReNHry4Tklafu/acMqpiOLqo+b9wS0BFGma1ZrTgJENrrCFMKZ2fhZakCniOigUMReemEmAdGl97jl1kxZM+es74ukhpPUuK6Rp/fEOq2VX+qLWrz2j4kYMaxTjZGvEVMTKT2rpqWV1UemTt8nHe/phRtRmXYsRmgk2NUqmU4FPj//n9W+oGo1S44m4QtoVHi3KdWCqBMVOjIllSKvWLwE+KYGGCv/1Uv3mGqQEviZKHizIRlUc67V/tWQeHh+mqYmui+oidJ0R+AKnOkmAJuBHUZUmdXX/6iJuaxD0+1JQjG0NVhXEtI8n7Qtm0MqRmqtevXXoIaFG9vuvaM7K2GMSvKexRDiJ/TDmI9BV4BPkr8PAVY7V6ioKPiYpqkSwmq4MqFi1YG6IegG+clKJlH1q24J7P0pXkk7AAw5hAz6svWbiCqKr/eAHGBN/me5RZth0ae7CmYuBFwbWJGgWNv2SbNFfgO2mZH1sxx4FVl2xZUGiS9NaMLuFr35/SxPuMgNByhTBFbYFIinJ9EDGxOL4/lSwOScgqu3HWwEx8hOfpirXYX+AXkMGRoXFG30nnI9qeNq5cw/E+fZmG/Gjt+wvUh4xRKRlh2ee3tpEUJpH42qLwlQRMheWRNIxKKAsAJWkyekpIEntxpintiY9/DcpKGXJMXJKmhoAZ8WTMUgN4jN4blRiuI2FHwpMF0cZrOcdSUpHnmhKJzIkFcf44BYf2QRI5j9I/clyZc9uOy1oaBby1L4lNlVmj8eux5YkTRAixRWan6H95Ivct05XW1zhKtUeN+U1l5NeOLmac7OkOveAdpyRyndZOnwL4gpaoN2c3bt2tLV2VIXcVDJtLmtVnomWw+OFNbrSGoDkTPrdV4px/DuVcoaT99Goy/ej7EyjTbt7m9KM8kFg5oh0hljml6iM0DX7Nben0gZt7saVPeAJmas4DIEOOUMDwRkMR14ELaH1+MQmmQPtBqPAdhRwAk3PF3urTf64f5VQQXE+HsAyxjQayDXhblf85fQ04ihrURCkEpuxL6O7wvIdS+HRSScFiYGtKyONnhtWQEVALRDx82/rNJ7XbKyQDLZjxRQbCTDC9LmQjCU5R9OXakDMoaYQXCMwe1Q6vkVQTKE8ECwVxwlxUkyjETBOJQiyVJErCgomvAx2in/WQwRhSNsE4Ve94LNc3jv1E+0DwmkhhU9Mnfn6phmgTQhVwYiXhyvz0n+xX1lLf+v+mDyVUpPojdY8v1zjSikYj2G+8TrM1ydA2BfgJnBQgOw2rJZpOA+lmzNsKTCc4twWITsXeEbRsAJpiGi6yEv7jM0CX/B4KUQrwR8CBwQphFAnyGNgwqtNuS5wlbjdUFtiGJnGRAS/eYwyi3yPcQvOZprGYwSy6hbwmMc0COpHMPhk8UVgmElLJxtZSMXWx2efVZVWDaGi4hKU92SQiVEz12s1zSkRwWHUr0aCxa/pWjQLg5vNm7r85g/5CBprim2lW1oJNptmXzriamBZxEkeDv4pNCQbVylTpO+jePGj8m0E3jMB2Xae72WK56XOa4fLPaCn75aYPKTPmzh2bWTG5bnDkCFadOXKE6uaP7NyRNmXu3Mb2S/y9g39v24omTu33NvpNP7duSyyfX2Dh3Lkje3i0kM/thr+7d2YPd80FZWtkMCyZY6P9nWaux7RGBsbHza7tQTkzPjaayx6eyR6eHek18Qr/wX+9fNW1fa7ctc/bPgBPzwVUsnfq0IQJP7xDQwe68B808+/wJ+6jGqO78rnRXYUclHTvKuS7du/ccbg4jidEjXSOjU61mTNls5gZH4XyrA0PQZ0DW6y2bWWzb29Pt33oQFdvZ0dbyTW3OCZ08i8DVN4V95rTvWalh67kv334r6+nG2vsgX/7+vbC9d4eG7rV29G21zZ7O9tG9plwa38b/O7w97a0YZacqLpUsN10DrJNij9dKSP0nmxI0fb8xcatJLVo5GC9VLbUhBpuU5TTDcgiRVwdGoFsRNEXh0bcPKeaCEu2DEKLHEA9dFYUp5XwQ7+YhSI/KeJDVJCPIAJZImMSsv1/LCMrAdT3j8u1i6R/Zy23bFSK2ciebCCfdD+hr8oEzabuM2G9+4K2EU76vis9wsvVR6BPCWsrX/qhlWUg4JDZ+NMF2mt7db9+HEWG6wBuhCeF8UPUAYCTUPDYNUjXE3UlEX5jfcOX72nRyU2EyXkTKgjijJVYgGw+HsmlhFpsX2a4tHJyff4sJpi99zPjJuCVbtr+g7Rl7yRh1b801QaKkpz0mJy1XLZ0h4E1IX5TbiCOf/njPKPLPDHlcwhcb72vX3nPe+PoLVPMaoSM0PJsgXOsCfh46LJHiAdwHsdVJLSrTzAr38cbrqK9ceta7eRr4uJA14jCeEIhVdKsvpa/hAww0oLAaBQISizYeM4JWbnkCVEMXjV6CsASYZRyrSUMoVidlAOClQxcjnCjYBUbcDBqCiEnMk+25vi4I7Qwqe25tWPL9ZtnONHUJPplyUlEpzARIRhs9FGj5e6jk2QI6h57dXGUbZpu7fhFRRQz2OhEcxRoLburLrOg3lGCeUyXWWog9+GaIlcJQVdAl6tJJld2Imnc/pc6pCgEwnKJQ4hJtWinMikqcBF8hrLBtrT115dr71Ej9mIMBov8gogeStGwS7JAUIClAZ2ZE0RwUfz6nOn4BZ0MJiyNDD9gxwBMrIcFmOaSkvdpaHeBXZkY3a0/+6H2/Jbwfgkiw/I8a0Z0bFqRCxxMeKAoiQQ50th/S+zU2hybKwnEFJIGr2MZFfqJNkqMHuekdOuUbAhfwvPES5AlgLxCDa4M6jsGZrtsVkKjM8eqzF9f/f06W5r9nEYgrP6cpYqhnbNhIdLELwEvJhb19snqO9whCCuY6s2viL0bDMIqGw6BZuCaRQwo9ntFVVzun76Li5hbschE1p8urP5+rfbjB0mqYhdTtjUrsLIpW0bBKaVMDRRohGwK5pvAoMLq8PRe7cQ3EolKi4adi3MyijNrOGQ5R5LYT/JFbuij3kGsqzpoZWM8csUCZZVSgGZhxVv8G4M1hZmXjTsLlHWSk8/WX/4AXxi7eO7Y2j9QRGItozJniYPArCDOxkAskRxYgtS9OCU7dMIao2e6zOiJqi44rCLG1mHUaeiwN0lgUbip2B+ikz+KOEwURlnAQ/vIPH1ideUcmhSO/ly7f0qaoowc6OrCFioJS6GEdG0xwwUhyUiZCPNSoiBlUWKk9UF2ZzgKULPU+hNJ4eZCOONPkD+qPWM1UE2GVCPaMKStaQp6+lACMybcJEcy1HcSQjGknPuDcmlhrPSkNIqu3/+w+uYmHjp34jWbRvP5OAoN15eZd4m4GEzXwmhgMZxQjISSTiIJ6iRWVmJdWX6lD40y/fpe2vKLhh52pCHDL1zKNG9o+LXLvpZAMbYTgp7hV+BqP6Wun0mycSb0yDgNxBRJ3M5Am6ukSSGpmCuduNXXDBC0QmgNxIrKVkibMkBMWL1E5sKbZ6CIzV34GSZBYTIoeKZsVzSPIkGdL0RCU2k5SRNlI4pOlNI1KnK0+dZMjgwoKUK1Z8s6Fd5jw52R9HYK/tUN3dLyxhWV5Y23VPxNTiuSKoCuDmh6gEL+EvCnsHgKhCfoW+HtBGZr6FgBYyHwM+QbT65RP323/tsJgYcTwKphVfqkAqRi1wicCmQqHAFdPj1OQ6VpwJiGiimU+Kf2AR24NSKrBsiWwi8KvCRAqgmYKQS1SU2FeFIwRUMofzzGmFfKF77wtvbhBDUncYkCJBI7iPQxEn48mGfs0AgbFGZgic/iPhH0Qmorkd0grXVBLaS0EqBSemqCU8lMITDFhIkJeMAAuQJfaiJRScJECEpxIiSJLkWUAJHSI83kxZYu8JDQVjkfP8vYE56r2C2BLEpIduK1YK7NuQpFInPibZKpCTVnKUyWtFrM8KOcLH9a+62fYi7RaMViy1GXAcgDU03vMf4Nfsah1dFoxvqzB5Ud6zPUhCHrz55Slqwdm1iyxANHjojaDv6CytkjO3Z8aWjxTDHXj/8mtk2HtjUy6OSzgxM7p8N8diJvlrAE78Kf2f0m/prFZ3duC+G5/eHURP/ObdP98HtfGE3sC+DH4dH9+/pLhUOFQ1uBANYf7O3pisNoKijns7Mzuf5+r3QoKDtZuNU9O1Psh995rOXaI4P4F/+NIRWvVBg7vH+fNeiMmjtHzfYDfd1tAwfbrRF3v+lnzLahg+1tQwPtw33d5Qlz7PDoPqCWg9pB+/CB7sNZ0x4zJ0fNvw+bHW25khn1mn3dPV29XXGnuTdvHujLTpntAZT19nS0bZ0wC/vMPZ1tbcPmQadkdhbM6cNmR3enubtg7h5pZY6yc1Y2oGxCoV/wJ2iiUQlc2mTnV+GBdJQJ5wTg8MD6zZX1hasEa0oWQA+qKDizFdhlx6UTUoiQjyeVcWgk5TOXxAw66EFKaiK4cffy+sOTSU+oqsgnXf2V0sLgLBHnYIc+8zlOJ5Tc8rPyDkLWiDKsiSQKqytL9flnnEdhEp6aJP9RUZcbspwsVEIYkmoEyx1R3NiAh6cZYGZJbmHj6tv6P56rFsIZkca0VH00Z5V4yIHX04YVVM2iMON4Qi7jHAwc67hMfHCe0sxfeVo7tVJb+X71LTlEubgvCIpL0Q4EP+f8s56tWpEtqgQKlM5JNCebZk7GzRjSfZpbpLZqxxZFi7Ixwy5YMJlkoisnG7A+Ch+I3IS1ojmOZC7wmZb4B9n08gwmYaIj+m6u1JY/rJ15tP5qidzS0B4I2kO57BfD5HB0oJRL6PtuBrfnXRyzlg2wQ5PyxeZGNn44Vbt9QTXizcgzG+Zsl04ERjzNUxSLRBlMLi7D0wE4qVaAgcwURnTtbu3p8tr7C+QGjd+jEsWWOAoc/SXhPxejBkRyPphOsWuLcxJeugbFCqKlVNJ7f63+y7Xaxcs6ycCRacoAsAd5UCkDK0dGUFmAlDEpYlmETM4anOUUQHEOQRcfXEAN/HITZmZt5Wrt2xMbt+4S+0YSlcCeFPsnLquqqhFxnWqjgTAZeuUWoyJeu/lc7DUScYMICRbhzMIolrEVO+dZ05bLsVuUFJ+bkqXcFtoDP12ig2XnaHuLoD7hveoy56i5ur7wU/3V1drZR+unfgY8tf7h8sY18r/PUBb9CGO1c15sKSNwBCjOh++V7kZo5WzP51DuL+mJcALMyHMTG3pS+/1i7c08n6SYdMHwHAkXkNHZJWCZcajzhaZywRt8ccBuVsRBCUi9ceXo6ofjtTfHGFgTbwA8jilXkIL2ZXXC6vM2FCak05+WyKvvqtHXPq5LGVDo5DKxgx36wliX00vF0b0yBmSRUka+JDz89AUw6PqVDxvHcPd+1s9golxKyxaKYDrgq0wzJJyltWB5mOfdp0R1tJe5MsEiTBwDUHtxFMjWbnLOREWVHCwiIcEm7KDgACXDj1wVeFFw0FYNqqeDyc6IZ87QOdWIViM6bY62xs8u4HnVd47Vf7jGTeDjGPQdCy1EkMdcvWS9ASDqFihrqsUlGkH40OTJQORqF97igiVK0DVD4HPJLMk8R0dg2ikWTDlE6GDj5C4sH8yNHhiKbSIroow/P9VO3Ed++cNJkVWSTlN3XRECpFhzcxMyuzKfCJ5i8h+Or75ZUkweiTXw+HiKzshB0erxDjCXuFoROiVTf9lVlXcfKOz53omNHz7UbizVTjyhEfKAdU/iRlFafjBN9sWLHUpmaGulGlHlNSPkB5GG6c/yA0kDp3eEKcbP2FHMZzo5OQpMIn0gE+Hs4FKxWSBGm4LAqitzLJnWLh1f/+0l+SrQgzjWmcj32dfEn3YQs6MVKiEuClvSXkb+FDHp9WO/rNJSlaRDoiXEU2TZEfUPJjlQBuWe9amG8qy4AfQrMjMonv9GeKr++xXMBXrmIcBC2p4oYt4GoCANiiXQE7K8v5LVMKAUpvhNibEKafruxdqVX0WcPC5J25kWvtnApIHBhg4Fc8Q2xw3SueSizBdlCcTAHE+fLhF7JovAg5MwBWvnr9cu/lK7cJKGBeuA9CMiwg+BkZNsQV63pk6nTbKTj6Jev/ls/cxKQj2SwDhrR77jZnDviKBGxBqyVk583p4IOLLuAvnfozsTc5bzC6vLD2pHb3Oi1CweDBZkHCXO3Ex1BRMPSmoi31VzKb8Ck14RhyWrtQSvga3ceF878YKXk2jGQFoyrQieEIGr0uCc0JShCyEDlcEXRhu1SGO7gIHH3zObxMA6PiZ54dva6ZPw/43vf+MVC20Yk548vYjo+HwuEJG0mZsnRCQ/ZxrMz7G+zshDQIuldPILO54mQznajSh1NB0G/nE+hImSobQq5Dj22+qbM/VnV9ZfPaR0ebEPk0AxK4QLkZ1PUJ28wAjAiE+G+jhPKQYvnKj9sFD77h+o1+PSsDG7aFbH6sKWKRLTLAS0y4AgwIkEf8JYwYA3Sai3wsWNoCgN5sbVV/Wr0OPr65cwKhQPvYcFofA5fhcbGbU6lTgkpi3ABm3OMbbh3NkLcwLFvHpYv3WMD94B1gEoLusHhQaWqjh/iqW2lgdPZJ59kAXAS3mVo2hKkLiHcbAoB5B+AvT96gu6wTGtQMuXwYsA6Z8j40ESJKTC1vbPZq20hUKq1FClgErhJNW9f0WzTKl8mqanq1tKx9K1Kxl/zLpOSwVH6TTqAWF6ktz1pTrSTKgZSruQeoWaG0KX+DOAr8N6BejVWkgQ/Bfg5WaEnALGTZi4AQqnwKmCpGkwmkKILdGhhgsVJEzjQQ2pJRgtjc0ULlOg7AsAkkpvIfHW7QuMtBTAUnCkFS5RWESgELEXmgCDfwkOaDhACX4lm0WqYZDJZx4mAlkc2saysKVM1EWhEoINAjAl9Zokki6FEvmTCAYpFVLyQIkCIQdaCwDJ76rL5QR2fL8CM1JwaPHdyQzdwB2TbwZLgdGx4rGKYTEblHyKOZRgT83mWigdNmiLMWu5BxtttE13lWG2VT1hjW26pUyw2zcxwWLXjhxByyvVKR/Z/sWW13Jx5EDeGhseOTDU6ZiBVxoVJYOT8L8DbmH88PDgQfzZaU459gz8mx3Y19ONd/FJ/LcDapXsUSeE34eG9rbtCEqjOwJv9MCWwngMz2EZ3J8KyyMHDmxxx+NJa6w0OuVAcXZ4sCuH9OLJ/BjcK8Bfa3iwPewx4e5IgD0aKR5oG80eHtx1aG/b/sjcf9Ac7TNH+szeTjMDNXu7OtqhF2PjZleIEcp8zjoU/mXAzAzw/dyhoTb48+8HsXzKNfd1/72zAHf39XS0Z8fMwX1mR/v+cMTsyZtTY6Z3yKyMmlCv4JnQ9/aWwcyhXQQ1mTL/0caQ7YpL3leiQ75RL/7jfEwOAouUNe/ssbW3J2v3rtdvvGKHNKwCc7AkDKSCZsnWKAp/XlKxF9jH+O3J9WcPEgLC7NnqCB2M59j8/Bx1Zo5I7SbOWGhxkoNrlQHlOCJPiX6QQ+oO7YmRnOAslLR99ekKLSPcI3u5iEc6PJhfffNWO9LBcwTjRDcI9FyghB+c+QBLfDLvcAGlyEY+BSuanPsWgU/Vr19l/gbPoNaYk/nk6TAFsZ2jLj2N31Hm36cLIrUEE5C74bjz+TIinZzToYAmRFoV4BA6PRyYbBFB7IzIZ7f+7Fbt3j827v7I+6IAZ0AWCYuKGCRDUCXRIsuQrsjMQCT1UQNqQFYNGZNVA4ZAjX2zUr84D5xTXRS+MrV/nlt78VYcy16uRMqpC0A0Cx36LcWOrIxI5TscbuaDTGXt4fn1D2QXAUIw+6WWWH3o2YGdh+9voReGK2KU8VgZUeyiIwYei8rrA0+knkoOuZQ+ZKcf175dEYdcsicZU0ASqBiQf8ZMc5sgYWKRXjHdKFk/4qxYRuTgD1KVTPO4cUxv9vux2mu0zNfPvG9uMZL6dkgZDAiOFLP0g1a3cPiAZS38PAB/+NI1f86axmiZIGABXV3KuajhROylRZa56i+TwkH/0QpFmrtGJSqX7GQZxiBq8cwUn31praxl4MEUdEmRRzgHkT3kxembq2+Orr45tfHjL+LcTaiCIkU5WyIN+vaeIAgXQj8jN4zUObpyFtzx1EGcb86JA3Mfnt849pMwxSEZ8spQByvCOl5Cu4cwG/JUKznQ0VQROcaKvZf60XlgSaSyOSUjTzlf1S5FHFlJLT4YuYEKdZytS5Slh62eQHTt7G+1M+dFHDqSNFKnIv/PakPKsIRQOigYDdjCwELNxRDhZPWOMM8inLz3kLLmwJMFR5r0A/SD9Pw5Wq0lUla9Px4zDhWOhZdXl+kg15yDul4EOq90mig4gU+7hNUlxqNNJdWXwA8/XaHVcOPd2v1/sIcj0kBXq6K+sWCDlptsK4irlJVZ2pfhpqXvGuCzyu0WXkb+RoyL3ADWJgml27eBCaw/uy9JKDZjT1tFzOgE+gkj7Gl0zoG1L66rS1lx6LNK6/vs/MaVpyzjEDgZFXtSIkuiYsAP9HMmoRsKUlTo6xFhxJnRakYzjONgkOFfvF8/jxoVhXHQQcR+sgBEciJiQA35ZPGzlenE4FySUfbZqbXbSzTyqK+DwErsFcJyZhU8RrbSbGYVAtLVmDbR476y76qIgbu9BH3d+OGDok1kZCdBLHE3aUdOCXLhfQqCm71PI89hM7s8vCGSFl+kwYc3aEVxAgk4WRYS+vW1IoSh9oGlw+/GNElAxcqpkEDhtShj9zk8kJ0WOYKfzzcAGBPnU2ks6OBL9H0qGvKQgzsyqEks4tU3Z5mYouFIAVty8sIbVf5gk+EjRwZh3rq9Ruo/cCvQN9QxAHmGGvzTlZn50St3jrOK1m8eJUZnk5hJkry5yG9in/VmuvCF6Sij3OopEuv9MjD62sUHctHT7EuoWDn239F+J0TEfiXTqD+7KGkUs5YtX51OG+V31n4CmM0nx8bWTp/coPAKFHvKYC+mgWB0fCkuZHXqBXrMS/lJhPCF7j1kQUq1JAf0XRCJs7ZRopR8dDWBIoviUB3kxq5yBFu6tPr+nAgKYAuSyMan0RHCVNDhq+pKIM8OfHAMSGj1EQG2jmhlzJ4A9s+g9WZw3QipiR9KCE3+xIvMvnR4LtAsc4IEG9NcplnMYFZHsgLBCqSZ4EsNWere/uJPCksqIKlQZILBUsBLg3gK1KWQlUQIwkIvncbuoMMgicKNUxdZDiosxSluxB/83KwCwHeqL5wWAERO/kgmQ23GBgoPSCSwifrfsH8kd46UbJeSU/5ly+5L1qqe/gZSNBGhifQTgk+YLKVpbu3hM7bLobQTqpAUcSnhxgJNiLK0aNCEgkqcs1zg+VD/4YTk/AnTlyxfcmnm0JI9S6fOvOSdOh9WvFewS+HulqeDC/I8gRWLVPxRMkdkSIIvCdNMSabOu3V39f1DwYoSTiJZiMY9FMMQfEJf28m6VqxBcYVkSbeKII39/Ybnl0p+B2rl/c2ho80PaDGjLWurYNHmu8qws23TKNHY9zDRHZ6ec+QIGgqObPtyrzrX3+Xu9ns889DI8JA1Vskehh/ZLTOuNTbg9pjZbTPuyPDBti7TGtvB97ZtcfFvIT8+Cv9NjZtDBzs7MtbY0ICJZXhvG9Tv7JjuMUsdfx8z4a+HJXlzojiwp2OyODAyvGvMLA6YHZMTA1Cl0mEWxkdzQKNn3ARieWirYltjo51mYGfGCvnRDjtjjTtA+fDI8N/HsZ2e0Dw07A6Z2N70pJmDanu629smJ4rQ66HODnevidc9e21z97DZO2j29uzt6u3pGDadPrO9baJkdh402wbMngNmdq8Z7jHh4UzG3L+v52DR7J30ZbDonnb0uWs7iE/N9sK7drj4/87xvj3dbdDC3wdbWX5cdC7LOzKDfhzxeT+ylFm5KGV/ZnLIIsG54Mm8lLW7x2v3vsHwgOvvOUElebFhPQNdFhzFJIXak2qMVZ/GpoTmw8cxAoNbu9BAV9N4aO+KMrAJgIoX5Ngc2BQ4JPKC1775sPr7dc56IJ6yPT9Fwvc0EmhEEIrkIqXLpoX6tr50TyOQ7O9phhH0jrFTdhFVhDpyDnlr2jZSO7tYf/VW2Ubo6cQ2gqZ7m3bdE8qNJRphElfVxUjRBaG1dmZZ0RWV5Za4i0fMJwhHlUjVTh3RzMKMEwSTPJNPSmAj3JhEKcpTYONZdr3XbvjVF3RWPPAzBy3mWh5P4Gy1pUcqm2eOAitFPZFYAaPRStUVdmvWrziRDycHJ9Xt0nnMSvPkCW34Y3LxTCkWh0B6ft52hWOBRs7PVx81FX+6UOKU1aSLSEP92p352sXXoIpIFwEkjhOqWJZn1bt2mUOGbfmLYtnYp4P2F9BVE8Xau5u11/dXlx/U/3GK9lJI/SoLUUCV2SHwoZWjfcekaM6nEKNPl8jD8OM8nbpHqs7Km9rvd3i2Ey2yQGRtR22ag1x21EYZbWrIzQXsG28tQJ/UniuejSg2aaCiRK+0Gy+wK72TQK64Y0KwlY5UVJg19IseZmjyoe+YxrUkwE31BeYjVyFT2kCREVBmalosqeFCdeX4y/rdByKKqgSAQ2AxJmz4fPSJoAqXduylaUsvWSLIXrJISrrIWtBzjM1Gj2FyKqDEM2jWpRJXGCsxlBd1EOF995I0VpG5GtWK++/W3l/AJCOv3q5dIYcJGA0Dcx/lpcME0eMM3fRTZudOaCXNIA4hSkwYOwF0kiGG5Z3zYujNz14Qi4gsKrACpyBdZziF8yKZ9tnl+fcrtdcLaz98u/oGDSZBjEeDuxKa+UQAPhoe9RwYvsWJiqDMtQ3KGKVydVQXCynCaEG59I0iTDSJb7Ing4CIjo3n6KJPKppbWbnFvDRU6FBplksBxRqo3YD0kRE5q+9+AC1n/ekKx+VUrBmjIk+jz5ETdvUlCxs6VRBPAXZIQAhgjE6vwjQoRMXvF+v/WF57eF7kyEEnY0+lP5Hmd4zQg44XPdYYpFEeeg1ryLWTmBc6MplSv5Ixj8NfNk6dB91w47sX5CXB9voKOnsqf10kDMyPI7eIqCdDwZwpYJ2PyIn2uxf1XxCLU10jOeW2BHMCOsTnBQS2NF5CiYiA1jau61d/ExvXMTCJkiMsVLTOJQ1iEUl93f0DzwBa1Jw/3l1bfXOd4lXQFg+QlmUNGnEskgeYfJud1wEfxlNOZAuKdOKuI3PsFYQ3w9rS+/qdU8DPaw8RfBcszDVoiTctoU064/PevOO6dpIJVdavP7/INbGWEYXS67bokher5dHB1+wVEaAPrwzOXV1ZqT04xWG5eLzSDCwJXxgipylIwcO/MEUnSPv7dGnO+HTdExm/8Tt5Qqjdf7n+7m1t+ZUiVPBkILIvuuFP2M60PCZRdKB275VqXbUdwiSuvizYNIAlMml+TYW+KKPhLcr3UVvF+Da0VYzE0GLuhLHcmuZY6FCdvRLCUgkDKvJEERGjc1aEzQrora7cEFsbbtmnDJIy2kxRVIoxRoVaYreBaOlbDtg3uesgaFU8uTXEiUhk4JfsmeA4uLJINV8/9fPqyi8EE/m+owWnNtWWLJZ6ImUWdEKcfEDP2FlHnk1ZiF30wuOjJvF3JHfwHHE0A8ear717uvqOjruhiHPOKBKomHN7urpAh0iq5CRMzgf1x8+kcpXI+GPKUiIsQERN9YqCefG4HDoRhELwFVNjyzFzM1BuV9/+phIMoyOjYGaSAmaJs7TMcE3x1Zwajs7wTkVY33ldu/RtQrZkbeLxlML8zWBf7M/ghKfNGB3r6wA9QecClSP/EbD86m8Klqsq07aoMS3OSEnEEo4IK/10V8fCGgjeJMu8jkg1/KhDUTL/LLOr06mL9R+eK5CYgDqJ5ASAY9Qm8VoCtSTMEgiLwZVAVpKDSODUCkIphMPwRiEOgTbSOEOhC4ErEvEvRT7ng1QDmZbsMiDS4X0dX/5IJK0SryxYU9JOSTop5VjASekmbHosj1pIIiWBhOxRAkKJHO1cYHGOrRQqSqAEdtHlY0AEUycOAVxdMoiXkocLQcCsNs1zUT/m59euvObndbaoMVhRgx9WzE/AzzTPanxUlCoGJblJ4r7wRFjCgINI9pGse8E19MB/Fewvl/SfW5b+zKi0mT1pU1OSbkXa+kVWpK1fbD9ysuO58szUbP++vV1uMT+C/+zewbGMdaAPigZmpnbN+qXsOPyN46g8NQ7/m47Ks+PTcRnLvQlnHxTNTMdRH1z2BRPOXj87PlQwtwMlpNIXeA78m9ju5ke22b09293iSKG3u2ufCW3v9kvjnYfNyQN9FvzLhECyq2Nin7kN+9PdOdCBf6FGHv+2t+3PoCVnT093Z3fnIbqXsfr2w59sj4l/+vd2zbkmtOrv79/XBY/NDZsd2wr2nu7O9jzU6/QPm3Bn7yCQODSwO29CU22FcTwDwR8xO4omNzC8r5VNCJCo72dD9vW1w5C4kyzEnCY2FwGvyOIeHWhImAuKmPf6uwf1Wx/W31zc+PkyWz4DQ1SV1vsgQg3bsCOYAhFrx1iYpVL5bIr6Am8A/pJTqjc3U397uXZ2UTnoU/+IFGjbnOhoFr0jEWPimSeUUXbWaihAEyy19cfjOXKkIEecZWhh7eHt2qkVPi88b2SEPZ5plmIQ3yVOEkA00Yc756hhkcQMIQekh6Yiu/7+ZO0invPOx2W7MqgOTzxhx3sACdITdhqjXlKFuOk3x/1W5ojH15A6jUYZtfWSJbOMCpo6MYJOSf1kb4BprC6j3w9SMCrCshOSr4c+JypBYOcpo+6E5XDw6AqKPPLcntNJPq2/WajdusRUaVJQ3RRhjaBOqoEKk+AHK3IzLc5WlzBJEbrI4O8gEukR6KrIaa4Zc6A1MpA7TJSd4fuc/Eg4HJQP4PnatbfwgWAoJAzB1VHA3GBu1gF60vI/h3sUqHOJLpDrWcTReqrxBA3QePNM5rSR3Aia6G4y5yfqBtGQ64UjJmyKlBEnzbcu5SPrfZKFDUEUR6+vrtxTERSqkh5DEeJ+C3s2G7xFmlAOYdpkPb4XWPodcrJFN31hzFomwxMGVj1cf//9+odL5EyAxo6kltgsC73qXTGrS3gMFqlvVLzQWIyaeWTwRqR6R9qNvL328i2/HWGyKKxgFmitnf9fxs9pGj2JvwzfwBVqcDRF1nfZiUsaoFxE/WqxkDsStkm5eXkjHwHJuXvQ4NrFpdU3Z6UtkBJyxyjzVLqpBSfX1AwwNVEKoAv98Llca0okAas+CVRLtTdv6lfJs4pbMCrAjXJJYI0z7ef8QJ6xS1uQoQ16I8WqqoXFNzS+JAeSh5C5E43iE7moMAAsVi5B5GykNyLLNqGPULIi3JdUA7V7T1ffLGkNCCIKYxYsZF7IKnCU4DcDzgkrlNF9lHjIEvF9nHpscVI7R+veidrKw9rTu8yJIstGV4WCx0yRVlKccbzqKzYhyxZpb3VFjZlsUigx0m+Kc+bTfiA1UPvpce31KxJvogU1Yvzp81YAgI+PoMs6ebl0QBJaERlBFvHw11zDuqkt/LN259dk3VgTBu7RqEUTivRxBZso0ka1KBKNJFn30E+vgfqHa2vL84q6oGxUpi1bngpe4CWAeX/tAGPH0LVXShHepP90Hfm/qybQ+sK39asn1l8/4wlUBi5u5Cw/kKZ2ThPmKY1Dj9EiB5llN/H4O4t0yNEPSbDHii8p4cBimJ9hxQEpSJZc8JUYzwXnTD+cHxHTRoikaTwWnCJxfQEPF+GBoGAQO8CQpWS2K29ZaiK5bqae8p8lyskeEZNVm0R+NmgU0VykgTYM3mAhJKTq6WVNKkeW1CcFKY3En1XGegoowNiBHCNklHUyAG2CQH8nJrA0K6Jv8J3ePcCTnSn0phjhtsak3E6KUCQiFXXahCqhyzQ5cfYEoxgmyYdOcA5HPGzif6CLtod+lG62km3qJbQfWDkyJCaFeHS8KGzorsLMTFtgZqZsIJ8Qh0YqzGk3QE6LUKjrNsHOJrzJYJPqWQZNsgYwWyDtUhIGspT0N021EdZJ2hLZCfLqDAYpPgit6azds5lPbcLaRWImgWjnH2v8HCa74FIlpiGpJYCW8iGmejn/mPtHleU81dm08CDROXQD1NZYM3RL8WUC2sqGqijqtDyVbl5IeeGDQyS4X5igtJJpCMPEYUnFgwuxnlUJCyiiSk0pGVQFQnD+powKD6QXEXFZ/tAxH61dzGK0Apa4tLuifW31ccmegPoJ7ra3tuslGttmupuur2mPqfknJk7jbNNnGOtJiTKjaTIpNUbpL0J5SRQMqTRoqoXSKdQ9XZsgv5uWCF7h9gSxS++eBEymLnRwrGDxJoBYR8HK6QIWXoH9LNY/nEoQ6J9hwRY4UyG+BOtpDnxyFTasSJ7wyQpsQFIafEphGQVhdPAi92YVqtDRhA4hGsGDLuRTNsVlUq05xy6esywkOj8fB8KRMSVRlRxVEjSReFLcKVnHQk5IuDSz13l8E2vX2boQPv+N2pqs+RdWDD0iOaVgkzqPVMxRckadiWkcTGNfim8x00pYi2Qokn71ibQGvXjHTKRFuCFNKLEKhg08MqG9Keiw9TNJ6OGmNGQAYusHlJ1xy2ZhiHq96MgROtDhyJYvtjeO9R8+ZI9ui8zhKPSzW+fG+uXfbfDPbTP3ZszRQfPQsLlt61i/PfoXxzyYnRmfyM5OjLv26O6MmctYI8An+/1s1I+/p6EY/vRtj8Lsgb6OSofZ3ra3E6jsyfebk30de1yoPzs0eLB3GP4H/0ExPNftjnbny1BxO8YR50bgVUcy0MrM1rn+jrH+3Yfg3+Ep124rQyODB3dtGzELw4MHC8NDB/fv29szNDjrmpXJPBDKm+NjaDWc7TXnxqKwq7O9LX+gozzQ4/VirrfJwpi5f8rM7jPbutqd/fsG9uL9wJxzzN629u6u9rbJ/IG+kgdXXZ1Q2NXe6kgCdA3xQSZNcxAeRdqHjKumZcTeAqV4itnTImf8cZ6k8s07a7cWavdWamfuU9pC24V6WEceBqPR0H9rNFRtdJTRq0bONHpNT1t54VwNcxj5XBRmrFQ5oXXMKivP1Cawfp6P1cZFlkcjUmjZbln5pYd/xXO+MyJNtB3iWTziGo34JZFhs3bi/MY8xjyU/CBvCFoyAbhPJi6dlGDk/jSnHmqgS0c48CKt3zpe+/24OC0QHseDePCpL+geEFDJ9oEGp9mX3VNEVCRo4EROyee0Dw0lKsS0ulj93aWkqXzsOwWZrv1wf+0mKlKhCBKlWsxP4VfqCzSX6CTVd2GS4rhzrJH+KJT1XESdWvj1Ew8rVvLqS3c3fvxFvm4knubk6aqq72oXH+cjI0Wi9vS4ohI5KRri3BqHlNrAyTi8ESmPMErKi75YE0/Q/3qBrG844+4TTb5Px2Q6Us4Bso/zGs3kWtJCswruB1FnkTISPX67dukNdHftgTxrzC+hqU1UY8qIOETeuupDrQVZTnMyaYlCPwyRJVfo/LQvew9aYX2fNs4w38q0lE/c3xaNiOLWbeA7iVdB8sdv83sgbfEuQlIKsjjAgYwQAYJZVYJpkzlXMkkXytco7yowxdfCcwcPFVIUhAMP+Q3wqQPswFQ7/dvGtUvsvaSRVN485NHvu2zKZt8e9u9Pl1aXKBRzOVSusxtHbwNhnuXoI2ZLv0/aRU1R4/3UBlJJR1O7rNxftdfKxJMd15wxh4iPz6TnK3Hx8Xs8PEZEiq39vsIxYshwC5YWIxYXOK5SIwNllpGi9ekSCgGkSC4+r4AcNicIUeKnGe1drUicsMLvKS91P6aFvCQnHJmWLwqi6MgEQMGV7ydraz+12qoevJiqJdMue4ZV4TiOOen9f/K8jNrGWDblu4Y1jCSB+eeqyWDvnOdACchNdbqJj7kjAgfLGo43eVIxEq8IQzghrD99Wnu7gkd1XvxZnSNbwNoV18bUPcIRV9HH7a80XfQBXKqkqK6++RnDsyRVSydGpzcIJ70YFAGX3Lk+XfI4taKk8O4OHm5L1WMfzwcUZju9L+QTzPVlL1I0uBeSDPoFKzIxulPbWY66qMDvsrjAjPGYyX6FbcCnL2Mi+2v3RI54forVOFlbVU2qqTqYniBVKXTk+dScPZpL8NBbWUCxZfSd0CsoTOLMnq8/nK89v8x+Ux4eOYujajEzsrM2hm1aKeJ2zs7Cl9SoC/9S9DtKUUcP04uXFXU8IbhsFfUG/JwVxumu466Y60QxHdAi3NIrnPesgfji6rsPinjOBkIlP+eqY53+RwclRdnJ2UEWY3k5a0yQpfNv1FzmjSZOB/npAmVWQPbAJ+GQCPmwsHbjTf2Hu3jE6o1Xa0/pcPhp28EcrTA6oEIKA0cpLnrokSdOOYepCWvJkyec07REL07tYHOYmPVfFpIjzT0rTRFHBJMGxYiT+Q20IvUSPOox72JBt4nncnjWlcXavdu131dq586Ic049m7+pUDHjgk1n0TL16qOggLxFGyGbtW5pD0yRh0kO41+bv65awFNZc+jamjTxPzQsuUClovXihBxffTkxcUItU2tp45K6wp8qDSmNQUfNn0X0OpjfvGYrzK7jbAWmE1SdBtMKRiv4rMPc5GdroJvGuAp3JVBLx4sKKaYQYhqyNSC1ltVVBr4UKmuCZFqoEAOTNIrSHKJpuTSDG70iP8dHkCvw8TkAk0YvAhD8GTBQqICxicQGGAAv8+6I5KIy4c7GDx841Q5Le01R4GR6jYI9EbxK5GoCNxGXrpC6moxU0lFJxi8TbJpQS0kcnYunOLXk0brM0h7WmX3LehpbZx9h5INkB1bvlyz7hHvoDJW5nMY4U+xMcTGNe/1LLTVwFelDh5NsH561CVwjsgr2/iZPulZPJP50m9SXXnWtbiub19+3b+JbRzMfE29xJe/I37d/qb1rOp7YksX/bd82B//5obll57a5LTu3z5Vz2QG4sXv7trbQPNxpWuODB0tu5lDBHurK7oonsrumJ+AyhH/RyPDA/v69Pbt989DWXNYdNp1B8/BhMzNsZg6Vhgfh/x783ytlDh2Ex6BmjDXGB3sKQ109RaDc32UOdfUfMKdHza3lriz8y3kl91AxPz5YzFuD8PBUjwlV26E0s7dnPDQLg+YYFI8M7O/pNLu2T5jWpLkfnh0fGxnGvuT7zY7u0Pxbh/m3ggmtDY0e3Nuzp6Ntx4DZ0dvd3t9THDdH4Xf77JA56Zsdfd3t0LdCR19v+1Aum+8ye3u629sO7LH6zO49vZ1md84czGBur4kxs/dAy2M5c+RZxtgnwHPAIo8xPO31NZU7mO2fIFxWpIqReXNW1h4+r505z3lzcmQJBzmHuQtlNl9QH+0iyvrmxkCxbHWDjgTkNLlJU2u379de/6Ka8uhYwIaWPEv6yAhv/jgSmok10VBOM0oL0iKVRyTl5mary0kYWO3mYn3pJ2h87cZTYZug1Ch4JHUoJRYduOL55RDzIOntYwbSxvJsgqDwUE+9SURPF5+pxqC25TrWtNXQXJBG3khUuKBXFwIBwBvvaChcJeWh7BoMw9fenuYcGwqFq7ocWpO0ScdTtWiYDtRrvkEBsvNRQ6urv1+vPT2uWnVdZ8YAKNfQrEUBSoY94RcBHybxnlZ1CbO9GRUsbwz35OPaNNFLMZ/oMXFzkeN8w4qVs2AWGWFOHkHE0SNJcw2N2Pz9CoaIw38UNDWDvthaGyLIRDYlpGIEWJSiXsQRS1SACatkMjwZDCuA5UJRhQVQlv8f5WHKIR6UhFHu/6oyL+rg0WPiy4JyLg83hE9IQpFCcv7vhxTAFRLcUwgX/s9BKIRwUWHGlEMisgtgR2iIPW66ctQlpXbBNf7pUlad3F27dAFWd33pHh/bDfwgbxmBnAfqmPgsGq1ytIPt5FIHyDviFowmJWiWuY6dSJycIHLJnL1Tf/12/cNlkVHGzuXE6sraQXNbmFxPnmVlZ2F4ABBbRWkTRZpCV1liywbRBQ1ljaCUpGuAxurFQv2ZUqtW5H9YaiqyXT7qFwPflAsaHtR06/7qygVYNDSoNq9SrCITVaCPj05IZPJpoC38wfCM5eYmTl+qPf02acXzc6lWQtxRxUNzPD7soPrCooFRYYMUlAaflny1zpyvLb9irOIXoFYgj3tjWEpJTQye5MJsRuni0hRpqlyhr8nwjATB6vIJBmlIOEnRhFHmFIuIx4tJCSBKqkvTVs5nv+w7lILrhljDYqHV3p9YWzoDS5gXGhqmHGsGj/UV5m36epIyfziN6qdLLiUATNHcOPXt+odriiZ9tgaCsAQTcpUmQhjsNyFEoaK29vYiyEQ1D3KWLY9xm3PygiJ/faKof3KdHn/uhBh9bo0YWmBAePL2TGBhikcP49326Xr6koTpaBr5cJuTxeA0czwvDhR3Qh6aY794ScsCNbokMgIhKNbPaK5fuy5OJUNivsy4A9LNACBr8wl6Hua8hZmEHkbkqERDd8fjnoncXJ8uzPHQYQI+WJvHlutXH9HyhPlo4ABGRmQXEvoy2Y5YUg39RHp6P68+EueLEjnZ0cAx/FKM27JG3MXH1fou7jb6Y+LEWnViLn0OciyrXXhbe/MGPgd7lfkFFohhbOwRiupDKy/XM6Afj+e/LnhFqXSm4haEe8Y8euOyh4ZY1kBaCFrMbB9P4fE4FIEMmoRR4pRsuRhPwLNUucxELLpOGX+wzwQeIspDiFnDG8mSgGogKaXekxy7etIZWVIjxTSPy/Mbdy+zXipoywywdAJnaKO4Cim5EYpzYLYcSa/O3yTDu4gn5fM361d/EwnQqEbJiVRQKQ9vbKfpivHViQOkoVM+NeIAaPCIT0kcxndPI3XBoEk2CoujawjhSC4OFOyJp7FfKbJfsNgOWbt1tHbvVO3USRWHSGsUwcWMPHWbhIgkLWSKIp1mKGheoOMovqukGdTN+vM3kqVotNEyk+Gkf+IdKrQ8HIqslFz5w2Pmx8Lk5/nytdG+ZxXFgT5cny9IxhERPuwZSJBlBQ9ald5DzClk5mCYga6dU/OGkIQvE1VfurC2eJ63zXBvJtkVUVK8YMd4EnkJv606+BUzo2tk0LYrKREZRjbCDGAFKG4IAWPOejLDBH4Ritw5Elns0r0MVNMYFJbe8xcKHCL2pCOmE6IqOpboSfCm6qdq4qGdm6RYa9CnGq91tUopVClVKq2+pHQWXVNROkpaM2lE/81aSEr1kPB/c9ifxuGcVnQC8zPQXuvZ2oNjGp7/0n0wHTerNZMAX3G4Be0bP8pSPy/WKTt7S0DaiEJ1dKgwoYYG9YESmCyFB9OITACxZgzGAZdFLZIVvgnzK+HQxjBFAyjijF+O8Vz75rfVt+dZ94pkAgXk5gIwJCBBwYM/QwZyx0SggRQUUJJVE9lsdCNzYCKM9aERgix91SjRpDjTZZn6GCR3NHHzOcEl/EkS1q+xfF2MSB6fZu9qIiVsVwQlf/pOmEnrR9/ybN2Us27KVRU7TTNEvvgzbpiwQslmPstgWgXl+k6Ii3y2C7fhh5sDc5vua8G5reqqAN2mm8qQ+LfNDImqjn3kCH6CI3/7YkNiHOzcNRUHu+Ng1+7JiZGhsSHHNXe6Zt/e7ja4HvHM7c7YUGU2LM/hv0pY9qB4fHjffqgXlHLZ0cpsuR9p7NgVB/BcH9734V8E9/b3du3xPbj2Jke2jA31HoaCHn/A7Bk2+3tMG8jk4V9Uyo5GpRw+vTc02zoHR8y99vC+zJC5xRnaNWZm4Mb+QXM8NONRc7LfhGezQHFifF9cMkehh1ucsZ7Og+3tB3o6ezoH2wc6+4pmT+Zwb5ddMsNKr9ldNMeHu/4yaLaV/71gTu+BNqxiv9nd2dZxeH+XAxUOtOUsMxg1d3Wa0Ed4sn3gQA/c3/PvbeaeEEN4ewpmZcjsGjT7B8zJvS0NiaDShqHFacxUhhQsbCgTewVZ0jVlpk7MtAjK/soFkVKf89Ng8mLSG/Ts+qIdXxHEDRo0gHDKadmKtJzYBYY6emtsQVl98zMgHdUmgHE0ZLVoMefk7DKm4zB8mU7OJYcbtBjEkZN1XMAogOXhLp8YFhicv5gOO/PRH4h8e5a8VDfqL46tP5jHoJFji6obZMoBApjEA3uSQ11G7H8TzmjsgU+xSI0tNw6wPrpyWDXSIn2K8GoT+UiEVyxat0QiqNWVFU54K5+QqQOcnKyL0llUJGuLqFm794hrgmxW1cS5tvJABAtjiUoinTT5MalbfNobprzXYANbh28CJPvjPNugl1aXz61fu1z78JCYiTglIYencHMmGytL3zBpxqfgrU2pY7YQ9BpbLir6q8sv6q9fc92iRlwleRPOmSq7m3AMVNncyMFeySxO6bb+4ZRwlceMboYlDv51ga//VWXczTp4/ipFnBviWB/5iRi34kmPc60aWX37Gx78uHRJbwqJ26opO8CdeNpH9ND5iaVclh2xcAJ9O1+7dV1IJswNVJR6F0YAkeZJ+qzASxQGx1EZT3LSbX71zdn6rQ+YX+Y05SfxfTdPKw5pap45+D1mHYt2otlHDGNaOR0XOoeJbQE9qz5+mHd3OMwOV04xsmxPHEZrU4ZJPqvT0kiTH4ModjdphXOs8sl/qdY2bt3Fw//EWZpWPkAjO7yK3jAnoYb5VvBl2laMyvXpNAGFRTmO8eYiaAQif6udkaBeEolhcoosaHDlMHrhlNRsyEf9U54K9355feUxaJ+icxhijTQb86FjSjxy5LJSWdF5JGhrGDU13iynYwTF0SS4V0G2UzpJcP3hsbWVX2WOXCAQxT7qfIFMdo4ml3RTyCJkHjdURALa3ZbG2QXaugZ+UTuxKPgFWWTSZEuwtsSRoaA2uqwDiutFUGdlqrH1385yqrGc51dgXEXSOk6+TOcWECXeXakuCfccTOGmqEovHdrAF5tRnnDMefcUdKaN66gM5Nkjh9sR7I09FSn7IEYG0wau8AhQhyPkODGERwkI2PlRHtd68kRt5cHGtUv8IXnH1MA8Kc6M8LjyrCz0kkWTOLIUC/igtaUJ2lECnEohqQzEL56tXXxWP3Nu/eEDOrvLIjdRRTKsvvRAiPJJqSEmUA/9pCDFGmFisZlK8MW3T9hMFcZogFUstwAMUqOYumRvSCJH+wmojJTZHxIo1i6eq988R0H96FCY18hioDWyPyui/DPqspiNZT7sSUN4z9bPXmUH2igEFQj0dVxbeU2iBuK0AUGFg/vmI6qPPEz4TwOR2sXzwn+aSQknYfE26gceLiucS2on7q9/uMFs00nMitAuZbivPkrJHMqBlVTG0zFO/KZIoIkgUun1+dwNPlE7OXKDBQLt0sZEsvE08BuvapcX1WngdHSglhmR7EZCYC0lv+Vh04nViDXZjWvfsLFImok0UoEM2QpkvBZKJGQhvDA/nFp79EEYiAI8nkbGbG3SB2W0Skk2Nlcl4hM7ofMJFijCzlhwIomOpihzK8oQGBjszq+v8egXECHffatEiFgTOGclgVIDATT7aQSQ6xIBWByqPtou0J2RFEuYpOK3SjMqznPE9KLHX3JWxIxlTHrqhCDQ0PDoJGHHV5ekmTckRlQQlz2KFbhFj2KimzrfgZiP/pvDy2nrG8TKnDimYemntZu3KXQcgamvNpiseMqT6ITtXnL6bWarkpX/X9LetTuKousf/irz6vmvVd7XujgJly9zJCHhkPPhDatnpmfSSc/0ZA4JyStQEREEFBQVUBAQImdBJUHkRbyW3+NZzCT5Fs8+VlUnAbmf/5KY6crU7urqqr1/e9c+BDGWHve4P6iWMQN42yS1PmdcsgrMG/noT85UUaMOgGLxy1bQeN1VzGyWMNHqDfakW1r79qUnYJTUtvnk0EclJlsODNtdpFUYmetN6oPThRigv6WbB8h5ImU6JQsr4WfFzspCtweulivj+7UIFYvWLM2JmQYNQborLRjVfaSosMQB1GLNYUOOYEBeBIqlLHSSpPQSD3DtR0BLHGm/GRU5QGShDJpjKoxgWpdPWDAkvYBTiWpA5S1qgc0Dy0yFwDql/1h6tf7sEW+kLZghBRj+AS1ojUgW0mlp7cloYn++WJZXs0lqcgA+83RqTQuzTQIoJXys5PHEjns1bxI3zAAf6K7EXLp5Mtj5AsLKBFvsd5u1Ih8zwRsXTGqeEw6GJEZ5iTWzc7QI7ATxlsBwhhxsleBNe8JxLM1Pxb8oBSxLd/wuSXfPYq08JbXzEWdorAVxsy0bXqxbeAB4OPP/kAEKs1iTg0VUSyphdUudyn/4rrV6/TNNsYD9wxetNWzfG6xhVMhG7GBHC/DJI1A5uu+dLWPl90uVHeXFYfhfKT+8eyiOcoPT+eHBGfjfYqk8FJrhHeW9s9Dcv2u/me8/bODXsbkJA5+gcWzA9Jdic6hx0OB3Rof6DuaH++nrO4A0EOl7f7G0A6i/PxvlZob7us2uNhMnM/nh2TjXUzOj48NmrM0Uuw+bkbZuMzXUt2/IBMOmt6ers81M9pmucTMyaHJAMl/oN+XY9ObMfwbw70cG4C/99YOmPwtteztMP/z1PxNmrNMcOXjgvSkDpEcGkPoI3mEUyE/n4e97C6N9e/rDktn9nyn85uy4GRs4eKBtZsZ8MNxvJrJm74g5NmySA9B+5MBsNG46B8zeKVMYHUqg5eChnq69kent6u40E2XTFlTMZEWy4MGY/3PE9B4ywaHeng/azB4Y6YA53GZ2dJj3jpihg2Znh/lPm5momDb4BNcfdJlaF7Zu77QXZ6iAGyfrrCdsw1D9kvKycpRbFRGmZpkiR3CM9D5+dv3Dpebyb7LgEqpdRGoiqmnBNnonJrEMqDbV9P9W83QkA5AWpHNpWcjpQOvEaWXIiAvyASOgWg+3vm7dwBTCxxIubo70sMATH6lTmWfqiSpPTQ7SJTodD885ox73UdVPubID67OWe557wdwTu1BOIsVfBcm0RSLApgvH+wYR+gHxH4KMyAd4Bpx4EhRaaPnW1zDtIC7WLj3RzNd0F83qupgye0BDjuwR8ibZ++eve1QT4QoCu9cvz/H3FjPzSWzV+zw6Z/lWDgIIeMoaWwuHCIQina9zXFv5v3zABQ3uRs3lp63Hz5rXTsEHe8ewCE8+F3g3xfgnyodXinKBMwQ5k69mRbovRiDOD0rSppgJ55THJ/mG5GITOmQg8M3GIZdW0xzncqTW+uYRVjKjHOfqPxh4dCVejbyLxCWulkyHMaVYskVNF+RYcP3VVYlzCwrWLU4dVqSGHHff6rDSWPA8QYAQe4IgIfUDQeUG02dwflU5mBcx+L9RtKqBFA0oRZwA0FIsbUtPMhURJclRVHJEgjjCFR6B2OB8xHytlwCZKzaXfOvcl3yyOJ9UM3hK5Q6KQUUP9JCuKpXbGA9qDnl6HkCF6ApGD0MENHe2tf7ZI022/tElTTMdagnfcfa/5oVzwHdS9r88yFNZnjJDlqZM0fZEHTNjoj4z82g2YHFnZLgKxBcyCxlcwFttG0iVXSXZsIEhfZyvG4kG5FJQDsP5uhqO3mqE8Qg7GwwT9m0wPsEwThha8l7SK8dffpkhtwdSss7daZ6/7H0Ly9qLWxAl7hbeQviTW7Yxnv59IY+2aKytqHVPV75qPrjQunFWPJnrxNAdcdwZb1L5deGob4rdBbDJubMH7N3pAyaLLbNc2vjwpnSqu14p7SV4o/JCnC5Tnhf/DHn6jAyY+mZo2O8yZEsGuRy6NcCgcSKzmBaMrY52IFbxpaF8Zh+g0khRkIEoiXcdiVAp4alxQ46CUUNlN1+Kf5Ecew8/ZdP/Apo3NS0PbivRT/UDrnMRd7AMWdDB+pBsU6CJsFpP3DnPmYPUQU8df9ktj71++WFLymGIdXpM0yMgJi6lgMd6loIjUCJ3mkCGHMiA1UoIG530CEQ8datzwBuh5IFsWi6SU6J1sPjzuPhY1BUquNScfikYlx2QFcFUqnRQ0zVbOoUSSH2nAIsCyx4LrFFSHImkUJ4wpmTKdqojbGADUdkLPldrSlly+7Uu/9Y89YnahTQbIS8nSkcf5crhpmXocW8S4Xc5I5n2hrdrdWQ0RwXey3Ur0NU8rnqVO/2t/057KHqDmcZZFlJAdVu7ggdLBY0SoLNPjShOhNWtrx2MfINNgPvAyLkLDNnCyP81q7Fvw+3qt7GENM5RdKKohhENoxCx2zFS2AwRLDyg74ZlT6pbkZ6W51aUqxxPuyM5Act9UMBIlwvnuE61itPNFhMn4qxo49hqK9GcCPoHy5MTMGhLEFwZlKMS1xUna4Y1/7w6xeaftIRQpqGvTiM8iH6an6uZQl+afV38roTl+sa97c0pwjLFJiuFRyIWFeunfm5duy3ZYFLGka1muk2WIuUdDL222JFWuHwHHQwkb+ua2oBiNsF0/0f+yV7ypi9ZQ8lbqIiF5E3fsKaRvW8wjVA9gm2MInvf2SgyuWf36GJ1ahL+DU3u2z06um/PVM5U8osjU5MDO+BnJ/xlV5gNxibGhwbwp7cx3NY7N9yGn9t6jxwxh8bN1GR53OyfMNi2Kz8yWzDwYW9A19g3GOudgR+ASGMjeL1YHZlUehFcT+6qjNB3g7FawURhdmxHdXEK/9hrchNEY67H4DgnK/ldvXONttzE+EBfd2dfHv4+PtSzv6vjYPuxKXMwa9p78mZk0ix2mdqYicfMoQHz7y7T1TFZNlHJDHZ3Bv0Gv9/RVsNfvT1dHd21yOzPT5i9WD2yo7M0Y7qwtsCoOQDfOHzoYNBnRvtMW6c5UDDtnduZL0ifRmffIKkGRU+VLi9irtSYzYagqt0o8f84I0yKK1+523p0Bf7BJtzMoTNhvLgYSXG2cC5M3acYxVvuI+cvQLP5mKo5c386J5TYbC5aWYskaD3MYUMuqiNSZ93alTu/m8tI9sVHz1q/ntn48WP28qthKahcaM9POOYlTVgENqnqjjzv6yySxZh8jmOik83bQL31+FLz1hJZh5k8VbMOQqlyiwHOwJcadUR3UltrLkCfh1QbnT7/dZFqC2HNM/xMRfl+aj2naLkvz8IH4tG2WyYfR+J+z3cpRbHWzeYkONJgB72JOg/dpy5Dd5SpsGExE8zxsSFdTqHXSsO+QEpyLy/wkxeS4gDPcxbD0GmnSIaUnki8QIlQsvqALjH6Bx19OPDnk9+bj76kGjNJLk0oyUel1RXvSbEGz9T2D/oX1SeUWvL2UVvLr1ovH/qPGpUaUz5xG28ixNm93lHTQI7or4uUNIEIou/rte/5uKcBfaqSKBREXZzlOl2g0LGLOjRE5QimJLMox+VYmGB1GV/J2olHG+TcTKs/U9QDO/QPo6TXRI5VP2ogYpKdHzE4qblX/mz9SrXTYDXO5PQgk+a8aCffTjv632Zl3j95rPMOm0zWFhaEl47yOZLO97I4Jdz38frXH/PezJS9O07FWDOhRtIFLqepgkLYqDFAYv+kv7jOETsnwXxa56R6OJ+mw57TSoevgMPQy2lwSRsMAlp+tfHRS8r5ifFigfV2mwPAiKfRmKSkXtO9F7iaJAF76Nd1y0fQiiP77tnGFXQ6K1FtTAI1U5r+Sil5RVWFihZVJVL4lgtSVhXp3TwnZVWJpBZVZU9pb4FH8eqNnL1GTFlmRpHiRN99DfvXciJd2qWq5sTC2G9S2xqz1sc9whBx/FAvk/uyTxtdz4AxZx3tsydev7pGw8V6i4Grx80JyQIu51TjBjz81RLWVU6ajg8vLttoh7iMFT1hDth3Gw+BFwCQzntEvbCvMJrjUERCf1xFjkmSZfcOVla8STXOkYbbfLjOs/BMMji94sGJw5OUgLy1tPHNMzuSRhLnUhQaHHqgl7gFcqJRzjiOU0bbLda5o1PQFWY4r1e+aN4iUDlT80nX4CEbXBURWHo1zNKBXS3Mbm2kyAeijkN98iGQFJScyziC0CMHHKGEZEnawiVI42yDY2twaPfIX2jli9fLZ8l5FrpmZqqBldVlLRopuwxbtuetVxrHFOtb1rpx5WcF/bz+FuaTci1Fm98Epk/iS/9V+DTxfSg1eiVbKeVD8lRztPKgA+cY0sdEDDHAhZdAh03ShYwjUkc5jaQozpofFA+2+RRERsJC7WfeptjXq2sQ1BIUielKGSwWNaO4ziNX0uaFfxOEJPvvYi2JBZSU4pHE5Ow2Ykqp+UFZ60/PXW96LCES1GRfDepJkV0JZEza8te9vIyn9eIZj6dWSar5jCXC06MyXx/LzQ+PRGU+TQ/JfDc9CWZUj7GShL+cQjyp0PWExpw4o4UHPV529XLr22dbeNlCudyobaZtNzZT9mfLlhi8tQTk7DwpETkzSabiqJola2uNYV8sDYB3EZBc5+Ij7HfJOTc/+nDtxKvmydMb35BrDwi7WkbJIi8lkhlOSkfAx7v2aTHHkLuQ8wCShH3Ed6BMezX2RNVCDVFx9SnAiCSsowd1VIfH5jzWqT9Q+Fg5elfYWkU9LAVaGRtLyWeGxFI/k8oS+8Sat19ueVVcsnJbC1EOoLYgyTdoG7524ZQBdXZ2SD0Fzx3ot4g/BfZRDWFeEUtNYcXXCnwdlKaURAxWbWpde8kFnQg2Eeh5AZiJfRk2Y1QHIFPg0QJGhYo2x3rC3MgHdAzlGMfJUR/DMB+BMfhi5OWDJYuT5P58ZwZFm5CLB1lSaMUiFYUpHkRx4CQFHSxgEKig3K0uEaf2UwoROCDgQACLWid03yyynQhU2ecJPRZ4Ku2UNM+1/bBJovmyLC15VOCIkGABIdLBZ+QeE7f8UrVcoZtm2ZZTW6cdkRSRy74oXM9xvDQXtbyTqHuMjtmbxNvZI1LgNXw+qt9UxrxF4FsZ7/b49m47QTi2nYcON6eccew3Pb8bbrN2pPff4mIDIzj6/jvbjXKjC3OFcGykUp4cwJ+2pDiIv+d2jA4szI0OwJ+O5Eb3zWFbMDE+XDRwtQAXU0Ujbbt66BN8M1+F37uLRw6buDI58F7ZDB051Ab/kv6uqNcknQa+s2/S4P3w51Db7mQKP4+N9PWZ3OTA7L6FuTx8v3O+NjFerZQH5mvB+ESc7J0wU4VwZOfC3A7o1zYz2N+Vha8N93fthm9NZocOte3v7Ghv686bsGz+g59nhge7Otq7w5Lp3TltggnM2b53yMwPmf0DpnvA4Hfg31yXae87lDWzMwZ69Pfs72jv2d/ZDn8tTJgsDH87GxGHDQSVRkJel1TiPI9lm6SCA7r8YVQX52FWicvVGW6ebF3FosgYRPDyoufjWUgy9aigVvyAqiDbexBtVxoZScNG13LEUlexQov88/UbNwlZP2z98SF5ZhfI8GRLJee5LF8YRwU+ptrasrocceZPeg6J7L9zHAdPMf3zmFW4nIBwF8M9kcAsf4ytKZeEXPpkMuj3n/x1oigzcfm3tZU7G/e+4SyFSC0DEl0S8yT1hEza1aCsH+W0p8ihCH9fAnBbpvBXPPW58MXGlw9bZ0+TLRtGV683tGIj1cHiVNl1LprCTXw6jKWcqbWBZ81MFWNTyT+dhNLpm2srL9dv3Fu/wTXbkHSmXo0kzeH/e/wM/MvUIqxpjfAQbTnAzIMKOf7UQBcvrT7VpkVR/pbgEdDkhM4jUswYlL+N77Ga9MbxD9c//ZJUHpxqOpMGuppqIPZv5EwyCRWtY00QVghXW+HoXFwXn36pRcUtNacOIsZDHEy1Xp4K6CNgXCD7ZFHTk3tM8qurlk/WMENkXLRYDxdBFMZpktiYk8YUWVwhWucdqK5/9oRLvStV9D8OQlvijGsqK2znIjhPQEjzMta2vy42jsmLJCMSnbw8az55svYtxTbXk4STnsuCS2kH2S3aQZaz8x8T9QDek6gHRMeKompYX13iSg0qK7Qp9tqcwoj7WLAdCxLYvwzvFDJiXHQ4X7P1pNkKIlQ9O4hrUZoZxh5irGDCgEDYWCFknSGkVg7Cadi2aAyZFtP3bDAnLVNSPKZOdu5MhKllVldI2jdvX27e+vr1i0trpykWJATRNJ0hcj7h1TtcgaYWxo1FTMzE9InfzDiCGazVV5bzpJu3mOz66V/WL16jyEmkFTZigf21mMvE+nWzQalwzX4N7QznsiOnNa6nvXbp7saV37SqdgaHnlQs7KwR162JIlGVayGvyZnk7HD9xzN8dsg0MNu5lrpBbTcCdaoclDCXECFKaYN1i21xqDUzxH2MrDjl1eUcZiLNcf2MjVOfwwZuPnrefIwIuiaRyOFiZNcGE5Psv1hbIsNo1FLKoEM+YHziNkTp9fKnr19Q3magk6kHU7IYMPcBGQOBSyY5ZmRemz8DaF7FDMs8C1T1FFPBFrmoQKWi6WCB/Zb8zkk5YAcxvcbCYBgdTT4eOMKzJ1vnL7ROnxFqmDuRz0tXlyoY4UpaKj01vyCsPM57Dx8+9eAR5T8r2efGXHvPX3rP7bNBoW91X3Wx5BvwuyqluSEQs9wQqFlOWAumKR91FHIp3ghTHiK2q4c53g8oDMizVI4xH1xY//Hq+sd43FODpVTLLICoyQuxXDkAhdmRg+s4uy09DSYhchxPwuTCeqQvOQoibHGyqorh6uznZoUVcT0V4xyCwwwQRfiDm1ZKYaYDGWYyhxmLPAk4FzbKm0mCrnKMCbW+fmypzOvxfj7KcsEq4IM58SC8TkfvpMt+/xvwM0kCHKCXiYbEl0GklSOu/hlw7mtsi7QRTQZBipexZGMLOfOy5oObzU/uc7krYqyqeQl3JE8zWbXKHtXXbDN7+PvLGc6QdIMrEQKfOH+zefJM89ay4xbMM4XxNGSPWU6MnNJrooWJJCW+qkIGEiS49t1Dx4BZfsQ2mza9Ws6mrR/LqM7+fY7M7qcftk5fZPDk3iTIFloQWEqB44Tl+v8PFCWyHhIlgeBPJSCxGGO8K9bctGUmcXEvz7h5hNV985abxxr2lq2Sj5hd1ZzkkbTSIfrX0DdZ9vChFcubja9ekVTHUdhkfYoXfXbjYKUym7/PlZjXpOHj2vUTwG8sfGR+Y8Gj7GimxknbcUfba4+WbmkmxVuaCPlbmlQGBi30+EiysrlF3xoI3ZJ9Va+XH7O5hjg2zNJU3drjA9rQVuWh7YxkPVqynZmW7mgiwXt6O5tXSr9J605WWbI6jNU0RGfxvLelFsvj71g/8VUTi/ktzPf0BqsxeOqCD64FVrP3no/ULUDfDM0d2k1DXEBiC4xu167+4aCtJlulgenvCMt/NiQhLGBWRZk+wHS40sN7FuQ5eOcAGPvrbgu5fKSlGMvBKw9S+VvR7kG7+3wUwjXL5JMPZCx+sbhF4UDgwQAW/iz2fYnviXmeKJXpKs1VkFsJuVUyWqGoElFenJNWvphiCaXiSWzNKle2yBIrQUR2+ELDkxXCv0UkpISBSoG88mj3qby6MstbDToyPP4W3vf6q++VucqjO6TtMTrLOS3PdMzScZ9t2I7lOMpuPEYj3MWxAcsB3Pbfag8r4iF4EndsNoh57dYilv6umMS8RmsT2/MGm5h8N3d0zzsbxQB57M0G+yZKZrFRHMKfYN/eyREzVyqMTk7sGGgUB3bu2dEoTsMXO4cGFibM1EhP5y74654di8Xc5MTBns497eYgNPbDVRIY+NSXh4/4s2uuMHqwd/+wSQapHxDpmYafGfgM/Ru75kqj8LXuYRPCrzA/OTEdBZ1wr84wn0MK1bw5dPDfeTMxYsYHDx2E7xemejrbevd3dfR0HhsYHzt0sPPY0E68PtD+/pBpbzdjgweH6mbwUA2G1dfdNhSY/u62nZ1mPDH12OwbNj2D5gh8f2ZqpPNIb1dH2+E6VjAsHzBHevd3jPQMjpn2CfzcdeDw3hHT3W46+vu6tzOO5SN4AeiKj7IxCqtJNmAlNcihQQubA9tKIp0E0V9XSuo7Uv77AiGa8zcxav3R+ebja82LJ7hgRZYsFlyD0J2yl9DhIXU3aYwxpt22EmSCm4kD7915e6tPX8Ct0JH3i6d8K+lPLvn2VggpsqFUFq+s3shzwU+veXWlTFwHdg/l6+UC1Bh/w3kMP/9q/fzV1tffbtxGnEa53jhmST1rxaOICHIgNAau6CWSsQcsQIMPWJQCZr7JKdoDPgMMoSA5/4JcbXVJrv6+MM1FtzmRDAtuMsGQDP39yfopNO/j3H/9uPkp3qEQA2akvANCU43uwADnqJDjv4DLRPKeASpgWx1QMzBQNcST/xnVSfzr3izroBkQXyQZKTL6Uzwsaz0/uXb7+/U7p1sfYxys3A/eY6jOUsDNK0FG85LyFd+a8aGXknypxMto/aOPOA84r6E65o23BeWUIIseJeid6FmyfKLH9HxK+USD8epRiEl7yD+hJmXac9IU5xbDkhywoS8SJ66iPMcU0fPp+vefr/15rvmQvA/KgCsy0lczeShNeBeWmiZ74Hw9S1OaD4pTPmDmngufckoo1AbCIqXUCGMbelOEecCkXnRsmK3iwS9WGuUGzO/Hvi58sP7VVXZCrACABchb0kKKRcCDgIJ5jUptRrgJKCBIUdetUOMMutdL9D9ZxkD46uPWyR/hH2VInE/iWqYS6a6rhSUKtduy8bBocVLZfuNxRmWUlHW789Y+XF67dFV3Xr0KGEzrFOXQoq83ogPDuJHP8A2kXJGjZukICVDfFGqBIKMK1PlQosjJRYevKOXaX1dmOL9a6/kzKYG2UAeNzLpMYTZ6zF8smUHsNR2rzVCFLyTw/BksRpwt7pyxSRcxI21BOuMVgKVgSrDyvN7+6hXv9tViWc5aqWsgBmXumQnUueiuGpM3br+SajXU03PoKwRVWA6kE1VES4rjsM62OABVktG8yOGcOJNXvl67iJC9guIirte1uvR0OIfxItiNiSKtRdfIZF2k6CWrCQO9jZNfNr+ionREERai8NcqzuQ0FdatBhU+LQ/KIaencU1YypVCYehhHzRPfEcbqFyGNTCTCJOtoh16EQ86MM86dJTDiihHbegHJ42WXIbqWi/x2SjRfb18vfkAsx0h2Qx6xVWtyj4n7rVxkIU+PNasy5QtKmvzwh0UkI+vSYWxei3QSuqg7lq+VsMENx5XowyojqttnLgIso+2L/T3WBoarCKyXOcl08w2TWgApPOdkGlqZr2100sbN3/A064vngJvw9WcwAKrNYSCPQDHkdpzDEvfOpcSD5ra5FvavPARsmP1LbVEveVI48tUMUci6YypS2AVwiXwbdy6AJtaBwjvrpr4CRZLDZtEWVrKjUxVk9oiz0EtL29dkIDbPHRBHtUkU6baA3HFW4Wy9Hh9LFBOeYqdetb6ljziKJMILzqpb08pVF3n1QfUoETkceaVEjwSUGJisnZdhtvVO0kpDtisGdQaHEOyCNohtqq9U//w33t07EH+cX980fwct/5MgPlgp3LlhubMRcZczQhlnihuEbI6RiCUwcKsmk4bxgkkN47/wEm1iSQ65kpi9tWbqFCi6WV1qRCQyReDyLha3kKA3JfWYlVyLtuUQ3QzzahPKYdwRiiDL6ccAgWdnmL728BEx41K+jZY9RmPNWv6LJRgnxYoB2jzHWBlcpi2vQUIsxnVHRHSZJIcH93IVZEiwiQgl1NROQNp68mJ1vdXN365ykaVEKZmmpGYjBxWJtvRmWhQDhbVsr6ZsPJdprl+ZtkSDGPAMpJbecqf5tWlup1hKSrjF4qdkjcqLhw00etnf4NXyuuf5joIfS/rjLAu8XOHG1CArGQ7JgsXECC/nQA9+dV5R99ManFy4+Yl6w0R0S2tYOQbgHNBB7g4ZYfaOvEI1/RXN5pfft38+ppd2QA4C4qm+cCNbuS7B2uDpbt6t0owCWmtfUTV8IhKpp68saCiVU68jynVRDUSp4Y47UA/pJQMq16kNAss86b6gP9ZgPgDgjW3v2+dv+Bgtw+QHTgmfr+gNrfW/V+AxXtw2B7/CgD2ca+AU4tJ01BUIWgaMFqIyMDTBntboPZuEM2BK8mX5mCZJCKcEVRFBq0UJPPwlIIprPl3Vyr+3X5loZCPghz4YeOLbj1MdUqQx4M7iiUcgngTCrHwg4QmrQtReT2BnpbmKmVF5v5P6rMvrq2UTgvoKsIbeH4OfyTR6As9K+9U2G0v41Q8WclkxZIvkTwx5MkLKyVUPmzHsj1W7bNny5V9fiysmHnwJh5puaOyRssUmRkKr2IuxSzKcSdlSB5bsCzB8oNtspbHQXgQyxTOlKNq55ac5Zv/6jKWb9NP85Vv/pM1lO1+U7Zy6FE6epQ65I/ufmdrWXZ8ZDw0O+dz8xMmDxdJPDOBP/i5Z+98rhiM9uMPttVrlahn786cfu8YXB+rV6LJ6bH+6vTY5DFgGw3piz+NZGaikcQTs5PVMfhbBelMwY/+PaR77JwP8+MjU8VRpDEL358J89mRyep077CZKgb9cDXe2da1Z8Qc6O1o7+ps64afvUN0tR8+4u+O9r4e+O5o+8GeMDHQ0N5lDh3oaF8cMe93mIURM9Rm8KtF/P/g/JAZnhkzQLGtu4hhiuUx09u+OGxmxpFqPYJvTUyYsH/bHElUxDVEw0ZgxWw11KP17ZEMuS74UGbt0l0Vr/jivPKwRNkF3DDslSuiJf7psKXIPx27e0E2mOcZD6HE/gQNvKA5ebPCcQa6K5cRhpNVoArKCSwr9fUU9BdaUtIQUMJUVdZzKRhIAJBoeABQ1SyEM2HMjkSsZFGpu4hztFGGaXbvUMn0yzJ6d5BwiqOEXH0SK9KjcJGc1eaiONlKiBxHxTAFdFo/fdxa+ljohNjFOuNUgQMxIAz8C/YMYFV97cqF1q8o7hA5AhSqbX4s6V+jpFQ+AXW9u3KBH4MI0ImTyvTVFQB/Yg2jy0W1hqGyVM+srlDg3NOvW5cpqQuiTZBNGi3AZ49Kx50+CilLRg4egQ6fOhIJ79QRUzffACbRwJXmZFnM7gWY3a+kLuI3ClQtlxwKyHv201fNc3dbT26RcJnK1aOZTKWR1FIRXxUNGGDkJddEQlAXEGDIhX0ZcLHFNqA5QxNNodDISkhLjIlOebNVKc8MrN2/TsQZW5LiTuvM6dYv38qypg5a0wJDuLjhf1KXkgaDiZAT099XKT6OKK2f/mXtxStKaYoDKsObsId/mD8YfsF/cgroGjSFOlo4eC2cPrX+9SMKS4lwI8KX5OANRoHFByydpIyAPZYWKWeI0S113L50fPfkk+bVH9Y+ukV4CAkB1p4JNEN0qVFkZz2Z7hpmLKxKSJv/BsjeJgej8B7Wz19dv3RfXwUt17AoKnlNNB6hTiuOGoQ224dy6rvoaUFM1WlBStbThOpRXIENVg7KNAGbLjF9N86YZJxD2kj20+X1r05v/PTt5g4CY7FguyWR8HVSDuqrN+IKn1VaamyHZP9UzmjMlDFq5ZMfWp9eYN0MSGXCimRQd8obniLX09obNKnFrLJJfXv2p1PfYHE45S2YisMSviSmTJnskmpGqFJeGaVDZmiyJRKptZUfuRgomrQF/MMibFQLErQVixNYuim97Ik6pW2zKx+otx4/syu/HjU0NYS8eaTnLQS5dJQ2acNEzq4DIuetAQrwgL2VSaYjjcQIsCZHTa4wqAgYc1k3wcbJn5u3f+NNAOgpxLoJIYYlaTrspESZ15VcwJdbyHGJA/hkaYLggP87siVAniJ+ZoKp2r9mYjbnT4lPLB700jJDjVUotb65JDSwS2ZGI3FikObolURyi9OMI3fMEDFcMjgk8qaUUgGSuh6e9PSV9Y8/5AT2SA7WTiJcPJlLmCcGHF87Fzam/AY9uuEw3ecn16+cYcVvaj5TLIailiDzAkqsMNJnIMNsLG/zNkHXtZOoakA/mO9IY+HLVfHUBhnC3gC2KVAfoRvkbUhltZ4/X//wNEcwZjN1RUF2D1Bf3QJ6gX3t0ofuvO6xs132iwlmq6J7hkVSJ20LqkENCevBdEvXca2u/XgZFDQcxzyaunNaHoGen7ra2dArUu7QqskK7oO1D79kfaPqTUdQjCgAmcKyAdtx/rsYkBE3A1ARxs7gBxgcHQKRIyUlpWD8svECsxg0z57cuPajlLBpkDdlJu9pQ2yK4rvIFZN35NJbkQnarZhnk2DNS2xAwrtRXL2Rkt6c0Yv3tkjvx89YeqPXyrwV3+yKA2LJ0kCuz9eOBKM+tX4AJUB9tx9aYoj7yl6YHIakgj4bxfyG4ZJM6zXByXTGxPISjy0Jqfx9DngRQXHVlK+uNJdfoW2b9OU6ueyh6Vgz88SevRxeeJ38A7UFTTtqm0LndwqXu3gCyDWv/tn8/iM1Q89goqjtYwUtzrcAX/A0I2kB9fwaHAK3yDsN4hXBe+hdgDb9rtZDXWS8nBgICx+iCCoLWRmtClRNgVQHUBVVMqBUNMkLnmGFjy4YUwiasIfkjJi3CiArdVTeyMGsYCILhRBNsR94hl3gAFRtXPxoY+m+xULyfIxd/sf75MMdi3XSMMchhu2hgsUGFhJ4aMCBgJS4toJapbQ8mkjPLWLTykqVkvxmrVjcLMGs3LISy6pKsYopX7JYcSKCREWISg5l+Vy/Dhj+xvMbzPAdq1f+LmyZGbJwY8eJlf8q2/z7QkmY5pOnwjR1cxNe3sS0LKdSHsUTJyzFZyXMP5RzeGdI/i7Twy57viXbdRurTi6qBe3IF7q3mHRSf3L2nM091JiTareWnF1vsuTg17NHj+Kwju56Z0NOrZAN9u+q50cOdA+VwtzoeM/+wf176/mFRnUG/sVFMzzY1bkDP8Kf8GcMvrpQnZmaMvv37srvg/47Fhoz2KrfQDpAfzSBz0CnNypO9kxP9hRzk6P7pyf3R7Vs0F0u5Uahf71cCkf31QoB/GSno+Jc0Rw+2NuRxD37Z4Ei/DV3oHtk0EwOmq7OfKfJdpmDve//e8gsDnd1drT1tX8wbPYMmY4jZh/+pb1oqvvNkf6OtqHDvVGPOXKoo62jbaB9dmyke2Lo8MEkHt8PPz1wfWB4sPPf/UBnsOvIof62gb6RrBnImv6OI1OYuHsbEw6qtFTlKslLohpykRTPZT91DbK6GO3Li5zBpvnis/VfH9skNlhhMRafRUdUsuVpqSOiLGyTaYm/dfokmChj9NhXr9iLWYinio5HWQpHyCPcdpk5QbcLY2n6614d0WzsFbf48VHr9h+aJy5Tq0aa40QIZRBhg3jJsfHVUoP2mApxTwuwFcqaHUPoknslESWPK5fOtE6ZY9CAEGBhevaHBEa0tZUdgfEghJ3ZTzUvfEa8AEvzRHEUqtWcilxx0gX6jNQ03w7Fodk8HhioqNGKrWuv1j97Iqk87n3DMYtC2MUsBpySD/MaVKRcWcwF4qRldaWesckS+TTgyp+YJGz5KQ02xsp2Sayp86IwrxEyEZcYsA2b0wRxrVvJEkSJ8DhLELAAjWgP8YCMTF3ESvmagxakaXWZnLQwJQI7GnBW5auP1k+vNG+eaP5IWjIsF1hV8+ruDBKFpotvIDuhmmfC2sbEuMQOBbn8+O3a9a8Zuc+jsU+5chyig0ZQJr+ZWi1gYciJc2JN885ONbVAzy8kaymX2oA1gHrd65efN1furP18eePadZYotcx8YkPo5UZVceDVe+g1OX0pxQgP9zhKonn+JpBs/nGcYyWYYKYcVhJr1EPPlxzHeIUNnvBqthTVbbb0MjumIdy4fJemIMzia8+nklWzRYD9FigfvFgEwoZUPvQyXV6+y5kukYiX97qEHgMwWeUMJjPgDJkPqImyvlIrF/LFgh5kZUAdYoH2Adf2aD37s3nlASx965GAB0CBmK7CKlXJy2f4TuySJU1yKzG8OJpKjelkquG8rnf35OizHDE6qUolbQvKsZLKgnv0byXJJxBb8B49RYHD9lL9NeHnt5rwE7vbkD2MGVh9WpNUGqs3pAwjSNqaSwHK+Y2YnS1JXaO1pRVgaBvfnOBkkJVaBvpLMkshKul3lS5nz1UqmlaWiXBCS6KQ8VLSYk77LB9dIbp8WnMcx7EDqiqPHp58Qie1DR/ewmzXV12FQypAXHOPTe5rZY+0jjBF0CX6FXqaMJ2J+YMt4Sk0u4ThBEiqzWltSy9oDEr46yKrxLCmVy6uv/xJlzXTEaZTRZsAHfgLffY2J88r4nLT0uhRtORkRAg7PZ+wkP3/pBiNDXOkFkoVnhH1qnXjLGtYnCm8lCSU0E8PMj1yZO4vexRdsmWUhHr8QTN57iQegNA0ehT9mWRyWP2voLVlxbStLX+dKGQ03vkeGsbp7PH8F6AOAf0mndAG8FU75jnJIelGKkTTA0W/aTdOoJMeJ1BJLU+KxIVVgC4knNpu9Qlc0h7KBnNcGAQDlsUCQCuLE9TceYlFHR7eav2KKBzUdh7rVF1XqKVd9uj6K3R5wVucQMYNFYmkxgnsrDFLo5RlmWChyagEb4sdXtJrk8j/Mi9r8+Gt5ud3dG0i+bw4WsRBJcqVoyq6gVY5EtdrsnewA/5lPiOZr5nm6+cvZMB5FAt4gl/afGAky9Idg0mDZrXPuHMWSSl34yyfs9hlK0ctKcq0AtSBMdYVYE9slDcRIUm2Kwc23rSSmSe7Na/n9s2SrY9R5vMlmIJNaTxxIvzX1eCTQ8o8VI+yAG6jkseScbAwH7bwAAwW81pS4QFarwslP4W5FYySyDwlEqdgNXHhkXpGzJav//hu/cR3zZUHzYe/WYkY1hqJphBAWcuxQRIjV9PAIx6bWs7glXz6Sk4ysLsNe0XAT87IVdonwKjgj+yMTJ811Tpljig5/+aHv2GdkatX2emFE6+jUzJ6A0+5R2buWI+TOX1orEYCYHJOCa8+YDn98Lfmle+VFB3fbe/BJDqL04BSeopVS5w24usNvq7g6QdWNbB6gVUHVAHYCtl9lO7AuasETDaPyJeSVi6qOPSAsgJki10ZtApi9SCkA4+bYKNFixYnunQAFh4Kd2GmIuzEw24Osv0DjtoMegTscMnlhiSWBLQjUGdblOPhEAtBFH94+MCBg82wwEcEHhzwcYAV/m+VzdsIUidFU/LTis603FQCtdDrz7LNl2pWoKWlWUrUqJzxJIwVLp5k8XhUSpJ4fN6yeMffffZreW+K61qG67ht+lYeK0zzQcsA5XaWCcjO99iS5UjKjvzvoitYmYsXL9jMDBs3ft346WthD9tYvuCGg1QqLunZYvpK/83Zvrb0UeNX+g/W+rXzTdYvfFqsM5dMHd35zsavOJ8bLEyM9wSTY4fxJzo2swt+dkPzkXGDLdML89H04nwEv2YWF6LD8JfxGfoL9sP++Dk3mJTxc25wtgw/CXw8UIL/Qa9jswm86YX5MG+wx+iRAyNTcsdSnBuM84OVMtHL4k8wdniqMN5TmOjZMWGyweRh+Pq/J8yRA8XRsM9Uu7EA274O0zGA5dv2DGIdtxLcuK+3qz5mRg7kek0SY7+xg/2dHe1TrkLcoYOdHQO9XTuGTHF05EhfV27WfDAFA+pubwsmzHjF1CJTmTA9h81AX+8Hhw72d8BPZ1dB8me1HTHd7b0DZn9xO8NYLSjiuucD4qi8+izm1K3cPCXNSSwejiuzGT63Wfvz1vp3Jyg7G/4RFBPhOUWhxWTJKBY2vKYpMt5iuVvii0Bk7cQ94j5Yy1mKKeOJYDaQQ+sc21KmtQUP9bkN68pqLuL7dCpw9dT61Q9BrLJAQfuU3bRIkW0yBdDqsdbQdChZqnwC0hv6ZTDHjIo/Sk9Z5cAYpz0HtaRCXkTbKNCrSxH5Fwjzv/bbOkWGix69EBf4WE8jjoV8IIkbLGVtUHLbZG5g2n7mBks9s1CvY4wM26eygj51/gjkVUDh1nlFd9CSnOSgee7vc/gcXHXij1vNL++vXzmlgZ3hjD194nOQSNl3lTP9BvUkV8O50buwV3Etw+m9gTORz8WVU2unAUhe50Pzci1TlxA6LKzewDQy1XCRQznq5YQq4GgkR4IVYXiKNy4vr390wxYehXc3U05K1u2rMRvk6HwmwbRBfszcIiKYKXe49uDC2tlnfL7GNCjMSYQMGjcKYcyPmS0lVYHKrrEijasPspL3DAf3x4v1JzdIQ2pU67hXpirQIU1y9WcbkCcNS9wg6dN0hECJh6dkMgtZZxDAWnJzQTXrDnDnMGEaHwUtcnLxkKrBFukdCNRYO/MQcfdXPzbPnOKEDABriY6jG4kD+lMsd0efi3S4L2SRKZw7w7R4+81gzjmRzrVqg20KdwIJwa+R80KyGNiQfJqxp2xp/uzJ2idoEC42qECdliTMra7EYUU9DoAon3Q1tBErcfDAniLGeZDXdD9Abf3Vz62nj9l1HzZGPi+OwJQ/gI/si0GsCQXIENiYLUs+ZMoi/tcJ0nqfXN94/oAr+2LeKC0aPQV8VThEwnAuKCVF7xK6Z8SPR9bF8wdr3z1sLdHSyKHKEGazDXXlAY4lDh75suyAGsbZcdu0OIjaQ290QCxK2orm1ZW1Pz9rnnzBmUsLmUoYav6SahETYRNxYod0Oc1XkiGJAy6AwsYLVMSoM1rbNIkXdOajlCDHWVanwzKZS7j4ZhHNySWbYZYSGRDcf/Y95n04eYm0WtR4omw2qG7HQ/gWHhPhWxAKracZCNCzDIQJOg6CqWhBNZXUCvBJok5AH6JdSuiLzpYlm13z1vLGH9c5m10FzZAIr0p62hPUG5pQi9upVrnfjElL6H4JVYtS0pS/hE86rp/CG3z8xdqlXwW9ldBqQBQsvIzF2gYvWTQ1DptNufHxQW3ryS0+qCXvvXKIJRJyvmtPERZKwXn3IClS3UB1vM6ZoZ7fWPvwOYkm6uw5tNSSXFXu7NZgktegzk1r8L/3SBy7JXj2Z28JFqPKtm86p/qVvOg815IiYqkXDeTsiwZi7i3ngjl1CWYPRbn+pxPwzLxOOawTSn+IXRkjkJOXXJJflhy5Q28+cp+nbIyR5JtPgM+Scp5EeAoixypBlttCbsF8Q5zbdmPp/sbPX3CdGQzHryqEh8uqOLUQRVG4q+pmxTSFFrC2GhNb//UKB5qT8UG3FDr5Sj0/mNOwIiunmOFUwmt/PN948gdJpaCeAZhuPfKqDTTgHotCKXSBFrbFsGJLa9PCg74bp76g6KOogLkMrLE3qNWwymctoWhqSQoWTGNb6JrQUFMiqUauDM9vbjznUtqwjPPVKLvtYhHa/nphyhwni9kI/SUDJO2SQZp2zQAv4B2mXgI1amHuoG1kSIjxSJGCY395uHb2nvr61APdZCGZDklDToiZ6gV0s6z07D1mpdDNY6TscfWvBN45CI9UsBruVk6iBipcUdyu1s5cZrerIp4byZrZMkWWmJsin1JqSwFBu6WQJk7PtomfLJzfhOLZGee7E+vffciQZBPa/geMnUa/Hu71EK9FuD6wdYjWx7GCMBlWKqDUHEAOADrcZxGfhXspUObBMQfEJDMwwDCKxkihOUJKipIc5LIgS7CVxUQMhCxiYaAiEEUXaoVdnARBMGwQwOAjBQsPVI6zCFf57UluK7E1y1BdMjKRZPaFMssyK9R8SWnFpJOQTtQ4IcPyxQkXeRlil/J4PTN4Zu2WrQs3Fx7M7Jd5r8d1Ha9lvsgsUfkhv0/hZZaJMf8S5iX2I8taNrEU5iPCQSz34JeiG533OG9wIWe3ob/9eM/xbts2rKwUldsANpdKScc2YWXpv/phZVv6ubCy9J+sOWbHm8PKoEdw9Ch1yR3d8e417SZ6h+dndu0MR8eGTW7GxFE4WoDFOWvmZ/buhJ9dE6O99a7OI4dnzGw+l4V/h6cKwUzP/u5DE73dk6Y+YUZ7d7RVDVDaOaHfKRYNfKNvorcyaSY7TRH+CNcHgHhvMN8b7gYSe2K80264E/xx/+7pKWiJRmdz2a7ZPP7kOqGtUC5O9BYne2dDpNeYwP/DTeGbIXxqg5998NPbZobg1+Lhrs72tv75MdPZmDbHktj0Hehow5/2tiMfDJuD8OlgX0fb5MThIyYeGtzfPdjTXRwa7Nl/uDOfGzjclT3Yd6CtY8i8P4gZzMf7DFx3bGOAIUfysOQSgCSY9U2qrVyvoJAnn//jXzUfotNJIcnEjQLwB5XWWGQ2T1mGOZ9PGFFDGEmGHyXCKSQ0SIrINT99zHl7hCK53mjqnhLnqg4LtajO9lhsAFxkG9DzpCwZCT8+33qB23yqHs0DgKwFYaySVkmkqiBROWhOGIFRqcfYe2dTxoiTzzbufeOqkTFVly+CRlhLolo54BqY3hUlScKgV6Tz6qPWGUxOV8e6nZTO4piaq7iDncFMqCktsJUyb/K8/n01llAUfxrXv/1i7eOf7DQK5dQ0hoAJ0G9p9WZUA3WJjsuoBRm+tFBuOcnHsXo3ZrcbznOFOde/+/j18oXW/R9ZeECfHK2BhWQ6dQebBoYueW5pGsgfRnLBwFw0/zjO6WCYhptPWopBjeEZF4LX4Gk8lZjG/3MNik+ax39qnjvLyxH4upRnQKyBq05msVQNC+XQn0Wb5nx1OZvKJsX5zl8//9ymkkKqLo9UwgFrVOlm9SbpnPiZ0+ysruSBalFT7aydud98cEuy7cSYUk+T7SRkua9tftuURNgfJJNLZbsimnZwQjb1nmnnTsWNIsVb82Wsl1gvBbN4EXD4ef3Uzzx1+UYixjnb18+rwt3lVSqJTZuEyblNghQ3bZF8ENY5iSFnO6qFXFIFX2pM/mP+Wefr5Sewm9c++gmWit0z9bAmBWeVmrebid7WzYzvWFcd7WR4vbzwiJqX96VEYQYYiKj126SJnK+kSTPaY5U/v6bbxrVvm5/87mq6YUdAPHLsQpdaKe7/kqqtFLdlo7iLt2+VfAirTKcRu3jVAPiaZzFiLkBzt/bsEc8add7yaqN8KAWPKSKpWm0Q4H7bQIRHVyWZgSVit5aQcQsPtKDVlXndYOsnPmtdvs4bjMjo/mIWDApRlROe4mU+orxKnCcC1UfOms7Q8PXKufWHv7U++kwqwoe1iDvzlmBK3hxZWlo2QWlt3hRE1JccTHfL7CHSsSMNgLvmEq5TvHq3QJTJJnz7DCxguxdgrqLcsVDnDkn4r1GIKAO2hOxeIGr6SonUFpE2Vw3LnkiTS7LKL2LkDGUh/eP62rM7vlSjr2nhnipqovI+hYTdopaMvlGmxW9UCOk7lYmqNHIJJ9uSuXINbxG1aEmqJrYIkvTxZ0ubPHFFqSqcuAJ6OllEbJO8IhbOn6LSmzFTPgLVJHCQCR+rAayry2EmQMXDQgAV5Bmm0DpxgcpbYfdM6f/0+nf2QNs/3D3EHC46DfVaAyN/vVnAloAOSoDRkGndojaqLEB1aS6SkiTI7c9PMUz16g/i95CDpR3HWnOjFHE86hwWspP8KaC2l/lVTifif0XJHS9SFCg69VCpx9bjS2uXfmh9+kXzEQWulDL1gDLOBXb08BYif/BIT/ejo6mFTIieSz8XeGw/yq0+qCdlzIEWkTkWWqJUAy6HRGN15VAKtjiV8jzxqPUbTsLrP261PvwFF+48rNq8Bn4TCQeK+NJbZULNrTM84OJ1Fnh8YhEkfCETB2USIOmr1ZVpPOXjXWRDzZ4cX3txEbYSh5phKRScnkpFPGmYhOxMvuBRIce2aE1OLZBrM2CjOgVEhTbmtkFmbkVu0iEkiSCsnPOPHNrfBM89YJ6W4ykZrlvRA/gWc7tPVDcIGDIv2Ntr1447dOxhVotWCQPHNrcEwF3OLeGjXBgbuWcIrOQZw2FmZcnxfK1dPgkLTgDkJuzInh6BfhagZ+GdBXZpROZjMT6oYk0A5+TDXzZ+/lhhVwofOWT0zkjLYizCKYpX0iDFQhMBJT6YcDBCIASjB4UOaWHvyXlfxlvxrrI9JYrTQtgXwFbo+uLWF5Ep4fhGCZuSrVYO/rMMTEk/Xzj9s6RKyyi3hd7C0VPCRNi5x8jf1CstBJCNOgaaYp6WbyrT9FiaZWbumF44omWEygOJuyiXedMWE860xRQFb6qelLoyFMm2xRS1+a/OFLVNPzVFbf6TNUV9sOsNpijuER49ygFyH+x6V1PUzsV4Cn9KhfFO/B0d7uqo12ZG9sBn+DiwZye3wZ8Pd1bDw/DxwKSZTcZGd8G3dtVnRsY758MGXMNfdsWmMUufCgVzDLrs2bk4Va+N9E5kJ4OujmLO9JUNtMXDQwP7j5XGO6FvdaLr/bqZr5vJ6SALP52T0517K2Y6H0yEk/mOY6VC52wyeqgElJOxXTC04tBAe5f5d8EsjpjisHlvyOzvbiv1muGh8oSZOWD64LKrY/5Ybw+mLepui2dMMkKt/fvbug9B86ED+NPbDn8bNTPwLzGl2PS9N2AOdxyum9mSgdmAMZThweF7Pd3dRdOTN13t2/oFoWSJ0IE9mpMo9hxqzHK9+rQxpZKei+aRTYSYYuvZC1i6mEX086/WHlKpogK6ExBBCURh4hZEKHWVz0rNyh6ipOXQqK9DgdPJFMIatEzheuarKluWbTJBW25zmrEDJhG8tfT6xWdc0g/zLIc1W32aqaUievDM0/qAhmyjKWpsEMrpk0/ZJZTpuAChBKa1gHYRIhVH2dUlOgRruCR4q780qpwDr/nHEzpSiNCzwJawFQo8WUoBGHktKFH8Hma3AxI+avjjCUMGJJJJkrpXC9lhIiyB7PR2KbjlG+D+WLE6VLGcwOrwpp1olcif0NKiSg/k83xFvNrJEXf9+EkgRRFzGEmHhEQyh244CXz2ETC6LuYs7H39/AtGuwtxseFj3QBphPlAstHwh0xAa0EObIgGl4n6hdyc+ezrynOgiPGB354B6qQXo3cO3sAGX8aeDgW4Y0rqc/kOWKpDsfMV61CAW6J6A91MNAaealCKaxe6pQg9VzCca/KkkCSsz+fHcR8pmMTak5Y0a9yRlLqqS/XgKonYcqOg7TW6J4aa/PceBQXczcLekgiG8180T600b51qnvqEdATMaLxgS/dhWnqbYxlADcAoueBhpkjdfmnpEIVMPSw6WVcMXH1rlMebqqXzw68uE6C7kXr4tR/PNl99qzWva42sL+M3a5KbdwVRS4HpbwVJAyFvW1AK9AijGCgyKZIPEWIU3KJ0bPlsuXnyc/J5rqL9C9Q6WyY5rGJQjVYHh10gV1F9U2Y42BDHKAHGjEsNd/mXtaUVTQ3nKi9XG0XgiJhrIeZURv4lSv4ChXaR08mNBsVqUjbR5eZVDCpunrzbfHia49owqLWg9ReYkJrEkjmKJaKdJyYxSy5lEGN61iCG9JxBLMGaaQCXgyz71XDVtGRaryXg87+fF1WR4/hPivu82vz9NgZDfHx+/UM8IJ0hJd/WUKN6bMHqnUYSewXZkjpH0JHH/I2KX41t7co3Uo0tBISR90lxAAWs6RLvxAg/bAn6YA9LLALEwcTsa41zeup4c/kXGwNSBh1IY9KEYpVJ0ul4zLUTkNVc+KT1/KQUOrWdkmgRHVV48aFUY9y5+iC3TTMtZgxglLfDZQhQ31laoVdzluJbKmh4ikPt525j/c8Dpv9GN/TU6oSnpqXJoThIXfk2plC+QS4H5CNHB+thHKcauUximctsLWjWLZu54cWN5u+/rD18wikcQL8qZGpRBp1RrI0F7yMGFqSu1HAm2NUeaJw8KadiQECOIRrFSCeQlON0U47bipTGW8rzuCltXadKDDql0AFNK9yJLcqY9w8L9Eq4idCGV1ZLUY0wpgbrPZQ5wJkJt67dXv/197WrZ5Q2hmLVZhJROsmNCdQrQEx5qQfgXaL5FB0F6pK++vXKueaFs5y7upRUKTwUvluIvNBk7JpJiqxsb25gQ8h/P8/LmreU12+/ev38Ki55pW9JZ6hAT1hyKf8CrGVE2a0wr+BTEDlT4jjhtSfSLEEZRWb4s1o1/fXKmdZXJ5EN/HZTyqdjlwx5cTOVrbdzSMbdSgxRQlkBJFNlAOmR9OFMWYt8BrVIvUpckxpFHsxyZCH5str6n/h6PzoJz4APQJU/tehRxhLZfBt/8NKk9nZXV3STWZuLiiok8zrqYyQgQ1af+oszKmOBmjKnHwA+TKnP3eKk2Brc7Ze+hffMq7N5gUspYlq2GvpTW+cR4ucZvgl5kXCDuAESKkBsCiu+KJjgz8vMMbPJdIYoyhbFVIXuBImKZ8vTb1M5wCsbgNUIfRNiXiomEKiSggn/S0TFBQ63s6iJnuJpKCntxComViuxKe1YF3F6CFqpWGPg8ImNyw9AYQD+ZxUGh/QtxucXRjnKSS2wCgFhb4u6UyFvBLM3QWwG15yzx+FfC3vTgJd9sASbrt6Pde5eP5cpSwNQCzwVab4DNPQRnMNu8hj0nhjwKdirYbTbOyGzNHiysMkHNRbKCIix+EVhizBxOqolGOHwwzZiPg0UFB9sEvJWrFMHkOKICUiwejLVgwAi69Dgx8kASTB99YxFkhV0JIrIIlrD8wsZztO6S1oF3BvUHBE1aZngiwPbkZn/Vp6/hfWmma7HcC2vTTPaTcwvxfbSLM+yOZ/BebzNMjWL8K9nPYTfuvml1vRNMRsJpIYNSemjlBFaziesZashbFemFs5F9Vw4nW/LwJ0pzUnXZoPYG79lDWNvoyMGsjd+xRrK/vMGQ9muo0dt1+DoUe0bHv3PO1vMomB4ptdUomBHDf6Xy06Ojg+XQvxdGh8egKa98DHeMVfM1wz/9XB3lwn27ijCxXuxGRsZLQXmffgifL99ir5Ti4Js3oQTYyPD071mKmtyvWZ4eveOQ/Dt/SWzCF/pnzJ4i46S6Y3McMFEHdRz746FOfwNXXfjb/g3nTX5HNCsRMdC+JQdDcdG3subcml4ZgruMVIOsGc9httVy6XxsIQ5vhdGTdRnKiWMkRvMYozc/u6utrZDPZ30+0hPZ3HMVEdM95Cp9pj2/wziF3d0Gr8VencVzJEB7X2o84PQvDeMJrYPhs3csOkaMm2DHxTM7LjpbiuWTH+HOdQzVTZdR0x7d8EMZU0F/lIwg4G4gnV3deWR8na5xusRVkgInXAEWcINnmqLmaoXbWjLzx/zkp/HPBtlq9YGSooS0lAUiyNWlrqRqHOTRxOWAiKqqKLiJvz90caJi6iA//zx2hkKdwlACeB7yCkFekyjuKSjCryI5EpSMEarSzbnZnP5VfPKs/WzVIoNHUXhjhJiDboJxvaVuDYGXETZYIsCRMdiHGhAcu5466vvya20kniUKKGTnbppymrhpu2vezYe6PXLczppsZsx6r7IwfbT9qPYOaE33vnmY+jL7CKZg/mIvURVZZi92KaqkpQMq8ucxpgkxK2PORcVaII2DVUS5TFjBbwTTo4IaDkA2JVDc2scNjjWnnSeRaXz+vkDphMn8E5rHi2CHBQdVdIToVwyhylIvZd+n5OOnCgwCqeMTDyt51tfLyOIffQI+CInASCL3XyKOmsPMYcnBnqNiRfKWs8POeuP32xcfqiyAGhsUh0oro9SqEc5jmqmwL5UC5fhus96D0GhE9+1vrnYfLhMz0YGq1rAIpQ7qcVOrraYlP++AJx/pWrBW+vBreZPFDQJdNReBy9iLuEESfBp9SmHdS5VbTnEG+QX/HplZf3li+byM0aASYiGiEayICH0TEJJ/UN/to1q56QY1X2/kukwmrO6jTOMty7fkRPZOPG0gCK8aIqhmpOj/yBDFNisSpO5VLExT+fPtK6eYWduSjlK0RyaHrKcoew9kiWynKGsPRx7m7O5vl/+xLkxMExFM2OAuK7VVh/MceoX7GtP4CS7MdarpLzGdHBf1mjDAEdg0z1yRc10/lg+B8XUM5/8bvPG2mqaSeRZyxPqv8UsiO5enlnwk9+ZGSCNlFkQ8+FGUoOl2iDvse0Ml3erGfG4d3bLjx6sfagqhsZqCElP9ZNoj03G/Lu+LR8oCaTBow0ZnGxwl3pQLzkPCU0z8OAFPv1AtdUWcUQ7K6Hgh+uvrr5+9bB58rfWH/fgH7B8t+OFrVFSFzuZZNJEJ2D1WKA6ftYA/snr5ZNsACdbpqNSrzZ8h8Fqkn5kHKmL1PxBH7eKZc3tA/NIcg2OHJCR5JJN1aOIlLWtAi1bPqxqy0HXPW9ZuhDN03N2sJ4OWCre21jUFdm16Dx0mYsAIgunpwQebEtbslx/7cEXzRcrzScf2jyE+ThqZDNUh57tx2EMrI+zMeaDfJRLYs6gV40a8GYJHdiKSVSHc+3DZS6/idkXUQy58rpxytM6Tk81LgCZaehvZaA30VoHznnd0bV6Jl5vzGzWz1/dczaJWlBIVfSTIiIuK2u6YfuaIhxiZUvCc8lTb08/kQbvwSg8Wp+s+fg8PxmVPXWPpoT8mufStLX4uYsJpxLoHHSNVdC9YqpctUUtyOkra0/mgCG2InPMENuPtYQLGZy8AjA1V/5F8rXk2UJmy7/kXd8yRj5L2qqScyXSZJiLPiN5+tXa0x+E0wXu/KNmPbFqrH/X1BGrFsRBKeWHRUW+rPtV89p553gliWMSD4ChQebd7DpYwdLbZ2pqknKYamfyCmK+xc7E1TC3dZESSOxBYbt0/vs56f7wmtf+WLJoWuQpc1Wqs8OLltZr8+FLjuH00KcMl9EmA03eYZaBCOMQjsPMBk8f0xCOX6jmL2Z4ZlGZQ2QWKNkP29unLEjajErSgMSiEQ+JKIwQACGoQfCCBxQ2iXkW8CzdrVxWiSzWDZJDJMNdLWwSkZ5wJMcVOh6n0Ecb9ujn3NUYZApnplS6admjUkdlDYsZlTH/9GYsmyZ2qmxVmCnzUWGiPgN1rFPZJrNKYZI+Q/IYkS5HXonKwTxeY9kMeRkRYyGuoAyhFJHFMOHFo9uVN6q3R3V3ynbiXST7cKsRZOc7GUF2/qMRZOc/G0F2/qMRZN8bjCA732QE2ffORpCZ6bFKnB8d0Z9s0N83PravMjkxsAN+doaTEwfGDHyrd8x0DRyeL0W5Yw34H/wbGzMF+DP8qwybfZVd42N9Sf++/qSv0j/bh7QaUe4A/OoMzWwyPTabzIw1SrkevAP2K8LP5ERubNSU49GRUtQVTsFfRgZMadhMDpuJAVMshBPwM1nZVe0OgMbMdDnOwyg7xs3o/u6uyTLGs3XhT2HS7Nwx2N52uDZquqYwN1B+whw5OHTQvPf+kGlvO1SZMUHSNztb6U/w+/gvb3rh//DT07O/6702gyF2B9vbOuCns7OjbXbMdHa0V8beWB4tQEzXCEuZRpJtJBI1ukitmMrkaRYreljnW075lwklOXbjv5/X2SWPk/+BrFr/9XHzxO+cvjicyixQ3ROxafMtMhyUy6QTdnKoE0mgluFKBM2HHyG8P/H76xdfS71lpAJKjNhzZazwIRGfEzsaOwIAxAGWbNPgD7o5PHSZ1EO6e5mYVDTL95YQ6wt09PvzR0CleebV+qPfWXbD7ev/pyzOQQ3AecVyYquryue/L9TpjIwrE5FllGXJxeaVldanF5qfvCA3RIpcWtQkukqMlacMqeRPpQltCaBE8ZEsq0D3suy9rAeypAg9XntxkQ9kiW6GdatQSmsm8b9Wb7gRx1U3ZCrttcTI9xdOLfcROkLTSHHiF6113uuFBXrtRaq77Vtp+H1ROFbgqaOEc1FMo7r0lPMj6nL6615DPF34qfBNXlhe//Gevsx5LWOKXrsYD0a5pBOeL20AfZsX2C+NopCkKHZcGq9OAcGNmyTZgVaGskrrJFWjfBJX6Iy5GtT1I86yZtxoPTrBGTfg2UBsZN/SDVZVie9O6egfwH05usJ1DFbvVLniKWxASeAk/lirTyNpwJMcKbyCAQXkQSaJOj67snbpLmg7iKG+vM8ZByk3C08RkbSbjeilthsliUptty/v2+1GiaJks+nY7IfV5aodxMnbfO9EiiTJo/HdZK+ha1ejJLlkOTVVROcVX95vfnpP81K5zcUmRCyGJGFIEii1ffPfl6Sg8Wzmryu0LcjIcPs7rJx05+baBTq/irHeO9WOqdewZDyfnAmVTKOLzGB01cUrEkvxZTjXBWc5RSD+7cvWN+c4y6mjlOmVZ2ZaHNgCyg3wgIjJIc/0x/bpF3ZgWA0JcxW5MSX+mCQguIsgwaYBpUZjachoYIdkGY/Bu8fkVuzmEMZWE8A3TuiCFNFwJqlm36WnLBnuDQuHsjVAF1gy1vkM7cJ0yoZsQj+vLsO6xsT3ANjRxrB6l5MH/PFd69oP6x8/aZ29qZUTXe3YkMbiVhKNBy2/ZVnIPKbVXyp8rL+6kuX1DINbu/5s/acTciIWMVFvlYHOkmC1IJB8q3ck4SW2xZj+HmQg5sWl5bXAiTdBtaxRkAfiyyt3Mf3mnTPNPxCklzFeJ8Hz9GKok2hpOlJod1Ei3jQSFZ5JIqAzSUY8rL8QWFpiysM2Oz5LUcJjVp+ypZ3IApLnIzkYYhFLVuoAQcLDdZgLtXhSMhVsSxWzEWc08ZWM9erdtXOkIcAAUyQLMJlFUk+Q30d1qZlNrmMXqQDVudOt05eUE4ZVYb0RoFFQAHkbLmG4ZNJv5d3FqtuB0JkXPLxQ6q6bD++NiXuniQ2/9dYsShK9N92akXeV63Pjukr3hbfjRh55nRsYG4Erc3VpDjXdADk0tZD4kVpOIHdaz1Fu1GpJNRdkSsF8TaodY3q2fHCI2A+oDNT9kN8deUYG8+XRi+CJYHobp85ufHgTXgbPSFhFlyQkLXNiS8PygPSyGvA1W4RQoMgo0Rz052UeKJmDStG81paCLplaUqKTcL4K7HWQ5Yx0PFw8UAY+LSPFCp9PnwLN5rkXr1/clwTRQDdT+z/1MPbYPTntNjTJELdh9E4E8xqUYEPa9EOYVNaaEqh2Cq33C/fFnnCJiijEzpe3WJZD9BJc8C3wgIaUaRA8TDqDRcTVSGFlLZNXMYn0P+VbNG8vc0mJeSKfsWnaclFtdaWUCUoNPAqTgr5PoxzdAtgzpdtlQ3yR07y6Z2g9OLvx09f8AJRPiVISWANhY9qStFRkgOgStHqf3uKlJ+u/oseaKNNKYjuzisX8BMYFiTGKZvjNCd/qtTegboH/JyxC3oyNPRj7RpzocLAHKf8RXXrQksGgBYH8GAq98DkIelnsWA3k63AP/qDflS8qPrOgzKExgU1Cl4CPQp6tMEkhEn3NQiMfuqTQjQ85fLiRwho+0uB76UfCF2iCICPPnZvQP4UL/reowAECmLCs1jIrB1J6CCUul2oBMctFWpzUTku/snz0BagTnVZkemIO5NDbO0VOzjLzxtsEWgyKuD3xaidhkHpZUr1XpUhM6ptbWLoycsfb8MvEzJCHBT5vVK745q8rK7UczmNoysFk39uCfpv3OnIMn1doh9T2FsvPnkwtWw1HMb19oxhWq72bjT7bfcHae97QW0w92/3VWnn2vsHKs+foUew1d/SodouO7n1nA8/7e5KobrITo7MDJr9vT7Lv/eRQZOJhEw2akWmTHTaj8/H4zMhCqYBfmhnpHDMzIztL8KmxKx6fHTSHeodMMmiKAwbajuUmj8wUDX738LQpjJmBYTM8bI41ZkawLb/v/T2TRw7Eg0hjYdf8eHbUjAxOmbFuE4xSL/g3P27mwmCM7TxTg2ZyzBSheW4qGIPuSXnySFexMDE6tjBg3hs1+0dN7khnRyE7ujhgRnfNxzPU3DFqikNIsafNzESBSYbM6KBp2z1k2ofMzi5z+BD8r3HQDB0+NHD4UCEwg+8Pm74jpjJqKiNmaHDg0ODA4VwWU0a/P4TZqQ8NmPa23pF++P8HB9q6Bs1/+trb+nt68mZ2wvQujEL7we5DB01X0Ryk73b35k1XR3sbpk1q6xkyA/3m/S7Tbr1otosxY1lUA/bFFQKkoZxUw2gai4ZR5h0WSYxbuDou5tYkCw25agOKfHFq7Q+qTAnQJSwCggb8PS/MF6uPBaq9IlWA/SKjwzwTZLGMh7YvTrFARoMFkHDiuF7D+C8QxphJkWLVAdpYWRxOUxsHI8R2gBiM8OghD60ezmCpHSzfoG6cmHEMk+zWudim+4xHERlblaD144O1pVd0QtBA7uJRwLzGnHGDgB9d5YOKkCHEd5cdhQDycfnkU2fXX30Lc9b8/IaAPUxhW/dSbgC0yUXivprDsuaAbPKoPSmPp2NOIOeZWF6/PA8E2cRC5DJ1yQdJQ6QkohJxwsMM60F+dYmkAfkic2a9FZI6rWu3QSta++pbl855JhfV7ZuIapxQDVBdSKErQXF1qRKIFyJTekDeCRKlDZjx+ZnW2RPNa9/xu4UV4lHMN6YDzG7cyLErKzQs4EPnamQfp8dFb5ksDhDPSlZIh/lsqfn8YevJh81HZKaKYSbr+IpqLo2mEKSJbGTl0KNCoGKRalpRIMTnd9ZfvWyev8yuDIUgRWb1Zol0S9CF6RET9BPBFDa4SfL8Thj+ccmC1ukzrfP4amsgs+HdJnrAEYVYVxaWoBopGjnMydXP0d8LZMrB3wy4W1+cQjXpi1NWTSJKqiYdk8xJYX51Jce5A7Av+kMk7AiBBJ4fh//LbsJ62JIgFB+phlri5mfCuCo9lHvLMzla7H0Ma75RVxdkuKCcxKv30ZftruSaUpeTtZcP1x/+ufHRXXY8qYd0mOuKjqALV/IvWKqS8R5w77R4Yl/nyK3rWLOpnuGgKFxWl/5Ere6zz9QCglavUNdAiFlGQITl5DGr5MVAMnsOq4grgwPAtcgcrXV5Se1M8GcpAwFcDLhNhtJfkdNXja3qERfIEEf+i6wD3FjQM1/05f/81MY3T/nMF8llyo2atVTWAP3Owato5HHP07QBm8MmeI7Vp2VGw/e5pDKF8PInOtu7f+P181sI8y6K8+w8WmMkcySRy4TlBFNn1mnQCVysLuEVDb2sCJspZsj+olmSmez6o2ucJZndBcvJVMUOHbNMx2ojC0rAQsg2ZIkgqKQzhuivK5SpjWgBwIT1vPbiW7aYAeSppusAIjuBly9RfOg3giyGp8ZVA9Qxw51sYUAYb+vsaS0PiCq0o15NsqVQTNYUJltTh0YpaCxpgQGVrv30wiYHJgNDmJc1QFxyqY6cCn3uZBezrg/b4CByj9UlUvFJ6UefH1GeP34FCj4o+0DW1/GRtG5oUKJzUS7KslEoT8fcrrEc2kby+8KpOEbJyHjg6y9/Wr9xdv3Uz5LVeCYiSZeXCagGRc3USR+zNgEwuyY5rROoAIlNiqdHJ18NGkVGyfLJRrKAFsnslGJYWpd+0xmsNypOErmtLeIy5rjstKwsitOqlZawy1Va4v4WijVUo9F+AZtmCtXTWsKHQtIc5RLXSi+FnYM41vovznoK72X9zonm6c9fL1NQWBX2DCYq5pyqkVBO9IUzSWLbYoBnmlhJTcxbL77GQ487JzZOnFJDCVaXKqk9J/7X6s9CthRSdQWJ8AVsQ9Q5pRlqC2wZv1DW8NW71czWzDCvX15ff/TJ+sNbfoqYRrKAFa0wI2AmH8RFMcNiehln3MZCmYACcta6bZ9Fzdv4EJKHKJQpSephhJXFFKVgYE4c1RClyJqwQRlbUrp5EaxMpV6RTHFRSL3VdsgX/jQjOCFSuqvosANQCpCzQhLJyTRjZQbKCq+RtjGsWRBDRT0sU3pyVkaEmIpNXxc2MFGhjUYDcYsruBhxRMt9XUmry7gZKQfLqyuwktZePFh7cYd1uqTokZvT9D4AuUHhpzh70IwBzV1aVDTXevDjxjcvFMoBXsjHcoKDEAljh2mKwjlAeUnNmyLyHS+72Vm7drx15pWdGiSjU1OqRpgsQGJzNHlAPajCBJGnJyUn0+Kza8/utD67KCWY6+joOaVec5UaLOBkLihkJFPD1iZ1yrNHsoBVgVPzeSzSymgyo21NWwL3WXcgI4+ngVjFw+obqh6oSvCmr9vcDrXQQcSgHuiAGa0zrFZMrcYtRSYVrUuhQNdCXAdut4ehPo61CNZDnY2wFFblsQkn2mIOetzS/OzuxlXcmQ5gVrVTlQL+bRcBhNCD0aCDb9WoHBXYew8VP7HTKXCzcI2Bmp4KkeVjjvxv0jgqtBGNNhkUAyCBPg6YUNdNAMSiDsEbMtn8bcyqUBMnIz7AkO9FStUKOBwTW/s407+k+deqiK48gBQFSH8tcveN5SRJ5BPxCYaZVqAxE+fXVG6EYoXzeahloCpPqqHthClPsdebuyjDzUeSGoDZBn/2+ZdjXspOq/o1eIC39rDMKcgHi5Hk/sBVm0WXWAsT/r40zfDg9fM/ad+GygOEifj38Zi+ZffMNTabt3b/k3lr99vMW7vfat7a/Tbz1vtvMG/t3sa89f47m7fG+8fFBNXXvXvIDJdzY/3VymxuwIyO7EiGTRLUBszMAJqZdrWZtnH0LkqC3fCXhbkkgH99E6bY1324+3AyYA4NmYUkODRVyI5PToyO4E9Y2TNb2dNf3TM7Ey7MBX07gT62w78jEyY7Hh6eMPrdBvTr697fNQrtw+MmO2KgYQb/Uh7rL2dNY6owvjBg9o6ZXWNo1srDX/KT0A9uWM71j05OjIzl4es9XXvRjNW2r2AG29uGOodMJTYdQyZ3wNR6Td8AxlT1HTIDB82RsITWqfKYOdDTNdtjOtrbdo6Y3Fhf37TZH5numYMmGT7U09XetqPTVMfN8KEDXZ3wJTaFzY2hKayn54hp9JjOdrO/o619f2db++wIBnjt60JzVjBpwgnT/sHwtn5QqO0hjNis7S3VSSrl367rzSTzgUUiSa6NYIj0zIQHLa+6cMwdY2588qUAeuwt0jXGgJVS5AASIx20sgULVC+Jq7TUKX+I5pZj/AAye31lpXn1MYAl+EfqDJZRA/Uo9k4arSkH1Q9KexZmwimF0XrISDdhFM0HjEDaKh9IES1Z6vMKzAxrRohHLl3qlVO9rcqtynZexxUJsBdwUmtUvKNfT2n3joBVcXcIBYfU63QFy4T/L1SFBRkfykQO76hhnUteIvJgPEvwYDw/9GDarwHKXpLD6bXJ9xIOCLOKz99fcuZO0nvWV35RvScv/sSOhPXh4esktudFKjqxzLPOlPUsEMqXz/N8WeceuIHn3KPDBBA4J6BO2tDm+Q8DDpGWWAyTWi3CuDJ5TvQyq8ccII5D40GWOY4eRgTj2vjugliZ9Jkj6FvN6UqqSgYVjHO0fsIo7W/dYW9hzMsyn1SLdi1ib81GVecaV6DExOgSXpOkHH5woiOcTibCN7DJROgemQUXwC1H6WjekUHyGTY343EvN68uo/K1fExvwn6BuOqO/7D+6iTco/XpBT1un9fAZyHr3vt2M+E5kNBg+e2iYxqmfwi97dmYxXeZKzfYCwAzwcWJbRAucn0e9Yh58h8hl/WHj5uvvmld/fn1i3N0UF6vJ0VysgBlpKwwBkn7RGHv6OK0dAXREb0UJctEdIwg3PmYkYklsMJrQc4xg/mMpF27bo92X32Dydd+f0gO5kQV9mhJLINKV1VDptrvE7RcBR+W+QmT6d1UyzkK/VLOuKiSVClnGxtB9Zw3btqSzrB2Yj2npi7cN6MZ+rGf5MLmrYHi4eb3ay/Oc5YJ6p+pyVThoXjMI7LkykTP2qfUm1IGxH6UPCB1onTjsZWZ1IuSm6jmk7qc0gi1ogqPjuuqICUq+WStexEW9pED4gfVbEM+czq3v04UqNbg4+b5L8QDCE8JCqqjiolBnYDkUt8XBTsntPLdS/v0cev0n04OIDV5c9XAmiw4KvUB50t4U7tHvozasCYwpDtsfPenRGuC3kOGkaq+D6Em/kNiFQmdE5EQFac0oqaDlQI24pRC6cHEHwU2fsWPl+GDdnZv4bN2cjwhxc+mA26UYJHWG/2cPSOP9T9zDZm8BquA11FDu4+Wp7sFT6B+fbn16TfNz640b58Rb0JyJCXqOp1JBe3+NEj+jMUbOaEHkXm+Qn8pYLdI3Tlgx4XsMJIDFZlnXmrYwU6m7XLqRfP852qx8Ppi9Ao8kKv2UE2mQ7S3uhZ4rv9+3sirL5Ar+kA88TuYLlv3AWtPoXEu1uzJKKqYuJjn6HNqrVmKqfXGJJ3dCPNAa27xAJ5vDriTNR1xQrmwHuK6iLT0CrCLGpde2fjuvLo8uvItaIWu/SuQKjC0IrwiF757knti9kyyj0tBWZYisEGskM2ZbqlY9uaDQUr5jJnEbTLma8fXrt1gLS+uBZlYJ271QZDTKcMCDQetU0wevTQanJRc6xZ82fpC3PUIG8VusqoRW5VDjlDG7n9dpI0IvdZ/P+u6SMRNEGGUrLqBFvEKzyfK2lturp7FdGt2LkYS6va5naXIIX8f8BPoIdTOiAcQu8J1lx0xzGv2YCZgEbpF5Ox5GWsXBaaYYZryiNJB13/vUTXgh39uXFzhLMWbsKcaE7alvxlxboKbKdhlMZfirarr5NDa9l1Ch0u3grQt+EaRjYNnrptDNG/sZrGQRTAezHhHgLEJpFgA8A8Axeuckth6FBDZWAIWqlsEvBfW4GQwf9fKXjSUOMnhX2wrK52crHpf9T8nkgOEPQ9AKP5wW+SVuh012PImssVJBIr3QwmgpkS9kXD74J96yC1cJSv7KcVGWZpaHuV4sXA6V8fH62G/brlZIxJz3cKbWYdlV0GeHdfexmeYxWyTPujtBqZdbzMw7XqrgWnX2wxMe96SKmizgWnPOxuYktLY+0VQ0+H3PpBNk/C7PLkjDIcMXHQNm9682TUwCK3d46ZSHu8aN/B5Hn6OVeF/2WDvuJkYMtizvFAZn4M2+FgcNgu18Wq1NNYHDbuTA6VBA9/tnYGfeKFWGZ+F72SD/cWe/dHUbDQ5OIhWo/dGDdz24H5zoL0rF3aNmfzEVDFEN8BdY6YOtzjQ3pGD3uVB0x6VgORE34H2/t6e/V2dHRNl0z5lJrLm2LBJDpj9MOwdAzOxGRzP4yPAlw7Dz5HOjvlRcxC+f6jvvSEzesjs7ZD/9+dNPxqMRk37+8Omv2f/3mFzuL93P/z0dNTGTNfeAdPZUSiZ7mgCkwmxD9QH1pDUPagmp1HT8X7RFCdNPLO9USlYvQPLT8QJXC5ibjeGxncjdFClcpc3P2x9+RWHy1WCTLlqg/mDYg2DCtgpIqkn9rP2TvlHMB3rH4F0rINElUixW6UdA8cg0BgwTMAbA2x4HUOjjqdW3DkBLlDiVC7OP14IsHc80QAFFGCRpVENF+FrtYh3ITDjPCbiqPKuBPRGng9aIP3Rs9ZHT0miYSQXZmBUQzbCNUdKQmOiaoiFkzPhNCbG7Ge/MM4ZTQeeFIMvoTJUc2X94a3WN48cdkP6gkdq4eqvq3fKlFuyFlCYLVaexiNKbpKYWy4FcX1KAFzz648VjNvB8jgTeUY7yqSIrbHmBsBzTzo5xxEdv9aijHUwKEvmH5wP6Dhf/WLJ/WD95U/sHcvuB3NJNb/J/6AYVWEMngMC+sJNwfw1AAR0eFZAdMeyN5ApFGPgOblPyh8B77VFY67y/ZzSDK8fb5RLqc2p5yDd2T4Hqc/hXCTPQQ68fJCJx7PBtFBHUMDNeATu3YRch/Xc3iYR3Fj6bWPpz1QqQf8mWMSb/AUbVPKePAZDciBBh0EKja1bKY3VNySZTJwRB+q1lVetazdePz+OMPoSuaoTSbTL5EXVnQJBF+qbWJpuZGlpZJIJXsPkDeMW7qUXfsiLTjTGWZWiY0mVPLHQOpnDLEx6wJxw8tr1V19sXLvOYrycmQ9kCImMAJ4T2RRZm3kY8JCLZJrguKqVAj2ePtulF83lk5gnhx+s2qjnogo+mxImZTacigVTij4LK8HFVlACiL/PNY5ZlXbj+GndRWEtkVqzERPR5VrEY3k7R7iiF5mKp8eeWQJKdq6IlK7KCLQeEH+ydOz42GwX4R9CGaMjjFZ2OtRUl3y+QfPq49a3K+yYvxCHtYhGrcPGGbXkE5hNS/cuuvYsuIGT1vwz+toRWVooiU8Ks6RUC4CZ8TVhhBQXwX0qjU55w/xATvP95EtRAtGqjoBOis0wBV10cRw5SzudXNOpvZtNPG3/7KJjlkTIGldwL+Yo4wIlcI2p5qZoKeSiXrNDev7Z+q+/Sea0nJbZ1adBI7G6vZJzhR2JeGrQKHgIrjcw18UMJhHLAw8BiSa+EVzevsYF9Vy7i2VrcJJNtnBKLNutZ2zhROrVHC4QzMeMaX5E4RVCuhD1UteiRtNqmNx0ys1k4/j15osVz1yA6YNUBXZD9D+zgeY6OQas3TsD3Xny8nZM6AjkP3fsd8fx8DgAsBfF7gRD+P5jdedQMo5V40qb4xR21r4pDY5To1NAzVk4uYY0smiC7bzCsJOuMPqsKwxT1jnDwPkvPCEcqnMq91YPo9UHPAD1BRSViN0AWSui2Fl1MJDxJrHtSQOWbjBcsTpGrg9q7klRVUv4yNzzxjy7+Gb0qOJs89JDNsaSzTIWZwuM3ZnzQofn7NNGuCXd437+tedMk2wOz6MYnjk/QE8bXIRexAlLOEIP6OmRAfDMmvMNUzqxpeCQmlIgqCYUItef3zvxmaqcjXATCT1tcpn2Y0w6WbLZkSiF2GObIEk8obNq2a2U7P5Z4gs7U5Rk3vKc5ccphpNkXXgnRqvaoUm0qh0XUsHlnsECZrCBqFDS4/VnD5qfP/3/eHvTJieOpX/0q+jVcyPKzwmzGDi+b07MyizMMPv2xtGSWlJrWt2abmlmNK/AGIM3jBdsY+AYbGODzWZj+7AYE3HHJ/xF0MzwLW5utbRGLOd57v9GIEZd6sqqrq7KzMrK/CWsIQlVbTV1ULEG7A2RBLMDCiaWZ4KlS0+D54BYp3vWNq1W22/dFHuj0nu1ICkzzKTztVsVoz2ja0pQCiJ2HEP3S3v1HC3S6pDO/cnLVTZ1m0Z9i6tGbXOUNaumGU3TanyOFsa+RP+mfArofHT9J6qjFa6mqCIk2UgFEd2D1Q02BWkUZ3Nr4nW/VashjgpitQ9Xa3A1BnYzEqFrhTc8jZ/VCIwKwDWMnBZRZgM4yPBhpNjpO8YLTsti2JL5nPVFV8kIPiP1HJGXFXWufBOwES0zEGaEZIYVYs8SNVk5oYWEI2iMGLDfDFfViOjEWYU9as6a6LuTXdVcZuxw4sAyQflGaW8yjPjUA8OIDRM2rM7lmrSIiccZBmf5GiGRmOQcsuQNA3MYl+UvXTiN4TCoBWZ4hIVeer4Bae/zDEh7n2tA2vs8A9L+58AsdRqQ9r+0AWkuXp5fmAN1H7TolXq15O2bm1FLU2r/1CuTqjqmsByK9+JffQ/8GUlVcWmxfx7/z4+qysLcgTE1Mzq24KsILrDGolqplkbnDi3PJ1CCdWdGh0cDNXconl9fqZdgS+El0cJcE0jAdbUG6nqzvLQIvTkY+B50owaVmuXiInyWKnMzMxjQB7WXoYUknBntScPZ0cO9PaVFtVBQeQ9dgZbn1DAU9TdCNeKroSkFF2uzYth5fX0Wr1/vo3tmZ+r4Z7i3ZyQeUpUlVR5S6TLGyfUMwn/BEbRHHZzFgnhE7RvvWxxVQ4PQxmvTcDXQO3y4p28EKHQxEmG+V1LA4GU005SOhdC5Gi7oO2JPIPaxk+d15/bNJ4/OuHle40YOTy2CypoBGCU4ZIemxkTmeIAMefQJNyEonPUGmth++Hb7mzs7jx7SHof9kNxG/EaQlMVjlL7QYo0YKpCICcQZLNnP3gVSjHWG6hN8KqklYgGZ+CpiqLeKOcmB6nSMQ/Uc+A7H0OCVJf2BZAmqeWGYUV2z4SXW0qBjS7QmG4Z2e+JGqTA9fAuxYbIftT/8kV+AqRVLzuUEfRDI6AqqhVsAfBohjNkyZbxXH51rf/fm9rewpfyDFBXyGTC+ualLwL2UY6prax3k7j0wtDCPWcOhZudbhU9Ragh5MSbP5rO/9bJo2ZeO6Ww3mErYZLphDyuuz/5VXkLZHIx7ldBgxyqhQeGKscnQio5CVeb3BHTOFPxyhgDsjg2BFFOyoDQ0eNYgAQv6TKhZ0ABlBoPv8QmG4cMpZ+vxWbvG6xbrxOZPfhplzBP6LcuJ+7nz7om7YAp6oQ/KMpHSqi0Tot3goqN8mx3h1ftAihXcRIIOPQ1ggst2AxEfKEmrZ7JDbD7AeB9dtnmd7BKcMOu7nVMYHVYCEZdg1EaloPVG6ZbZSv20eT01mylnCvOTwQu2VdPNH0CMBLwJ4UbTzeudRcg5kF3gYfY6HvGw/fbmzns/Pbl/GbqGugsJpIFchCdImR2P84wGokSX2D2PUJU9D5GkPY+lRxnNgW2Ivpa5ogwcf15gw/Kxk+23z3OqejwdDDQqOt9tAOz5CmeFOxmEiICLEB0hgtunNQnDSmT/1PRXfemCFNIOKsjrjkWa45a04VAaePL4SvvOcTYccjPktRBSpKyGDQ2Yut51MlXXdojErO0Q6Fh7GBLR+ykho7Gq8ps3pXtmu039lK7xphs7+LZMGN8MomeeNw4dOjY4WNOg4GAZP4m3dKggIjNKqBpwg4CCBEwRCi2f4wYesPdbmJUyO7cfbl383EiZYhODz2zCGuI2gQCA4kNzVhFhNkDT8JodiqcgXpOpjqF16EUQrDZjHb9M8XZhHvN6g2oe5/whfUCsjzU4QROGid3+RVIzYQhanPfQf0h76JEnCtCVQw3oHznuFCjDvUNKQ/8QLXmpXqXBpLQFpdF03qpXKWw+0JPuypr0C1+w7lv71vt46AKyjLsHvYB3a/q2+UMB3cEwhZ/0jjoGDczosI2IfWXcHpLt8DLsekw/kTm9TC93d9DtHas6kU/5iiTwl45sPDbqYjeNSbdB5R7316AG4ZT+6+wGowWBjvPk4acaKghzPGeIlwMKAgvJOA4Uw7w1i9uOwjSUKFXu6s6/vjJdXdbws4mXgt7NEYUMmYTiWwjCq0GDHf7HqEnklIDWhJ07p+Efoybt3EKPc6ToACd5RZqVXrLqcVARFuCM9JK8lCCjbv718TKz5/aH35B3Vwwd95fjujGDIRnhgkKikwvSIxs2CA9LbBBpWC7oAPThEixlMfs278oTO4B9BmdJk2fYPkZZ4kY0cp/trw7QgyXtDaJk3rxORz8gpvLekPaTNa+JAS4rdnbyy3ry8LP2x+/bOEsMe6bHGc7KQY8fxAhBzzyFFoG67yz/uNda+C17vuk10TH1iUGS2mwWueVowCxBdca1rplavalpdTNGsVLPWn2c0e+TPy9I147dJZFilXijvJsvkSAKf/auVri1tUKyZ4kmzKo0no2Q6eXXnVOcCdKmtTcqsKP8ulqqUVGtcio6peiCqANqRRBUQNYCjQaZBIgmQRnbOX0w346J2vj+ne/fFPOJURi11ocn847G52h7t39nhcjR8hJTLXFqaQ2K7ra6k9VrHFXJUZCMauSoREZhcVUXVjhcVUOsWkbWuhpF5n6rKljBnDzzXiN+WTw6YnbzWrPFovXpFyfplFXkoZaBRctcrQhgcxfzayvjEqmTvKiKqaGZeQcDZ8bNo6IZtV6gyW4ObRizsE6H21lO9wwm6fBHzcsMAyOoBjZl7Vw7JmcR5vaX7VDHahazURQHDa8QRM1aLe7L/d9s53kmcvcL7zYGpZehK9alF95qTE37nmFqcikUjNnJAnvve3m/pdBbKBULc1EwO7yogtn8vFqcV1Cwb3FSzfeoemVKwS3BlKrMT6Y1hfdincWl/OrR2pKanlPBtPLzi0t7KvPj/uLeBH+tz1bVwgJiRwWzR2YqyluI9tWhvKdfzVXUSAUpD/eokbwKPFVYVgvVWTU0qwbH1FzDX2zV1ZEFtDGV11ai2T3N+cOLU1JSLUP7jeXFQrlUmCsV5/zF1aX1ehwuQA9WG8u+V1Rw5ZUn1WSgGJCqWBj0le+rlSgozqnBgf6+kd6eJERfplen8H8votL+PnicjVk1iQjfcE139vRNqwNTmKYsnVejvb1q6PBCQb06vH9Obcyrw8NDe6bUYegc3t/fN59XRwYH+uDT37MnUPvK6tUJTJE2nlejM0e6eTHJucs6bHYTc+4CmlUV0aQTyW6VSqRWBil069IfGKjlIoUyFZKF9JW8ath7QVOEnQxjl9DG4cdWzqHPoVaUivcPjtViKo20WZU9RBQ4oMMIBS2gw5TWTOsDYljauXMG5SvjDwehCwz7H4Z8+cKJ0LpCgEnkRKzNK9frZl+FIEJF/l82VTffgX+sMJLvfOA5+FCGjjaz6EsGSmoJvUxYmxkkoGsi22xYW5a8V3eIe11D5G42MthTxy9qWvXYQE/BBoZUZSaBPkX5zAZQk5EdINFAsASLK8nAfxxB/D9GuEXs3lwj0anN/z8DuHVIItfF7bikiUUcpGYdAZAw8UfAJyqEMsMOEKKOPP382pN777ZPkv4V44RBnymTO1ZTQ1cIyTpLKqvOPMsHkpx41ni2SF3dI1T4Mx3yuYC6ozGLP7/GB3amD5iDT8Yqz8wWqlH2LjoMJd8vMZeewJF+RxwxTL0uQaVuZEEmqFR7Dpug0u0fzxsPMgK4lHMaDQ1Q02Y1XTDmxiJyMItgXnFu7h/F1oG+EkjPDQl9JohZdsY7neQZbzvJMN0W4lpjGQCtBigEfJHtnts16ZehwUOnPZ5l6Di2ZdfQYS49d+Tal86akWt4dtxMNMt1JjRmmAUm45P9D6zAS2edoAwgkBko0yUZKBO6kh0p2ydhDaZPwGbcYYKOuKgehmIW6wM7qHE+gBSDfAAhg/HRYfFvhG44HmrpnCEx466CmjcnxmVz/5X3t25e1bZ+UAjXXGgHdLJKPD5c5pxs6LHIOF3saXsZXW4p/93Nq1vn0BWS9co1vBO4tw6D/V+Hk/+Po8kx5QLUNwFJ2AVjZ2mALAp0+x+vCRHHGgxkzJmGv2w2TvA0iNrU8TQkG1/qeYQQwvQ0xBEVY5DIXIlF7IS6eVMXhrhJXHOjkbbOf8nRSDB5QoTqCS2cM9LqN7b8m3KVBXEmUsYILxjOQJEHjQ37SNQ4ZnGMFIVDywUuBV/Artmmz0R5QrTPfr/z/TtAkecEBU2hQUFmBPbTqyV0fsfxXDXg00Ud6sA2FnQPlEcGWtDNJ/d+4KemDhJNyaqNmdNyQV7baziVGjw8l+iwuD8/qdhYuM8u0U4VszCgZSrSjhJIxRiT8bhI+2t94hhMoLZFE8SqMlCb10seTo4a+6VnriholHzMqRvtc1faH3/G3fD9Ugn0heXION1y2hPuPmU7SXy+4MSRTALTRlJ9Tm1iqwd+gUJ+CQU4ka+kkf71KeWq+fNHDi66erP9wWkChD5BoxE1MThPYoWti9LNGrv36dWG1Z3BOHvCMal7xiMSBAJjz0d+QbdPE9m2DvOYm078CLR9YL2+Mz/YIwOnR6LR/s0RBJOQIwgiwbMWCXSzBxmNHZdp1dulqxsFXWvRz1Z8tc4rGBCi6xrd1GilWeXWaLZG50xExSS8F2EaFatjbt38mjXDXWohBy50qm0uHLTV0AiIkjffokq5apTRoawClQSi+nD2Yu1hL2qP1nmMwqOhOfygjjqqp5Eu5OiU7WGXjrG8t0oN+V7ZaonUMjX4dqMbIFISC2FHIxCBy3K24WSFT/ULi7rcF5hx0RLSykpXQhrZaMTifxoWaYD+uJIrHVjSROKqhWLm028ZT0qaEtYv0ak6PM+JRr3CEEVh6jBow5y1Rc7ln070qpjOmKE4TNLyR+Iqlidq5qP/CgeTuwzX0fjmgfElkmVqOIzmLYnJLlKT+GeBmz/B+e53W4FStKAUenKtMPD6X2gFeuHdxgr0MnTFCvTCW40VaO8zrEBMwXvjDSRR7GIG2vvy3kd74tkJtTQ7Ux1TxfzS7LI3P4qfWlhdjMoL9blD8Z55hVfwbw1K9oQKfm7hPaPlGYUWF/wVLvfNK/gyNalG/TmMQjs8p+D+vXOH9oyulxdGAvy1MqaSGt09PwffwsXFytzqmFoM5sIxFa9HC9CFuVHoz/IkkvDhEhG0i0uz/UvNeWjLq4+p2XkVIJ2wCjXKeCv2oroYVCYW1PzhGTT+9PZU5jGsrOfo4AAHnCWzGHAWzqmVWQk56+2Z8tTeOYT4HmTsJGhrg/K69fTOqIOTqjGokkEEQTowo/ZUMEatZwgeoRxC3eoiujKNHB4qj6nXS2p4AIgBpaMFP482o6kxuKdvYFL1bAyo/p5edbi/r6dv37TqPTzVzSCUMOiyX4RtJx0Pwsv5R8LAy7DYYff5/zwmB1dyFK4J/DJ6KEZ4Wkiz/vM27Bju3do58ejJo8sagRnPCCPtfcNtiN5a3HzQ8qwF5Xhe3G/u3WJVta4hxTxBlY6aZcaZ9kPcazwoM1IfO8ZfE0+Mp5/fEjeM5dRzTjs9PO/0JyjmirCX6vBcRwRMk5Kkiybw6DLmSDfnm0BFn61zN9JUnGcR7Dk04Q0pqo8csn9/5/Y77Y/elW4UQ52+mg6cQcVmRCSq75y3ahKZ01amZHuDxKQ7NdAxy1EQ8dDEJojeDySLi1emHorrFeY6x9MyjqDTbTm5lZ48ePDk0bknDx9ymybDkh/FrYiQAhqulxYSz+z/wo4C04be/gldTrsX0lbDbAHZtCAji44PVfpqjeu/mGPxQOd8oU0kDmmT/BLSHBHhin6RnafMgS67TWx9cZuPc8kxrUXEtJ9OOfQ4FJFymMJF0M/zEL1wUVfllLQsu+6ffvLw2JMHF7hj8BoqwBvjNNdyOkeBgbpvHCXYevmutUzP5LS+xr5D+LZl1gaEdgyzZPv0TzI/MM2Vtd7h3TTZBDqWNV9aL+iRnLObTQwfuPF1+7OLVgUGSiYBGrMG0G9SDPC3kOyoWCJAdZRFZadZ9e8fLSg7TKanF49pllD0dQJaen0xE+WhioWgzWinidmeMjUbegHkzA7PxGfyV45PxbBHixR55iFHo8ZlCUZdc0YMak9yyBFBtGU64XbADTbV+3Ki4Cd5zIaIJ4q0CtBBqy7xodr4ncG4JKsuboZP3HU9SchfWdB3angkKjTlheZB2yt7tYD2M7WcJ15CgoONgCrkA5OJlIUWYOLuPD5vgmWhp9KO8whRTnee/GFg2nhwzYdNeBorbZgn2L74HlDu6P4yLgm7TnEsbe83b0qRn/Q5K0IIu0sCCeueEkmnn6CmY4CfcHT9nV30Gcn56fFPtgkugTjHmh8JsCXFBfI4gt6IQcmhWxPYo/HtYxLtOz85oZrRsgOeQzgWAuCpr2MJ+HrQkrx+wEKYp59pn/3g6ecPBVInWoulS4aK8dYQqGpx19CJMRBTGy1+Tdrv/cy7jC/fwi5+dG3rnWNPfv+c7X/QR+u+gY+ouQj1LOWiBw1dQMSJLImiB5Te+aurSPHR5fZ3b7LJfJmkuYhVIkFgY0ZhoCI/tZhkzojmKdSiJRnFWGXgwQUxs/P44tade6w1UDsERpbTGa+DVcqdin9CHXbWMNDd7FMKujkI3u+Ps0MBCt41L3U9sYQVrxqcEOodzWgXBwhns3nVHTx48wft47MqGOLcBzmgQdTwtz/QnFhHQFR1LFnszxkr38dFJ7z11JsSdG0i5sgLQmJngiJsTWyqjxsr9tQMOvz7Cd7so4Vw1SvrHZ48LEcftzRmyQVHudh+6HgQQk3zoLxNI4MpnxZcKOvksef17UFZh5/kg4RRq+GNhfEq9/kGenre5E3hd6fbF/6pcaBMzRh28RT92tBbKCphl0pdphOt53SILWOrl0zidQ6zxYd59zbvOxvoWouyyhO0dowfN0GefiGoZF+/a0Cn198+/qUdFqCiX4ifgGLT5NRcBfTEyrVoypNPF21QtR/fretPfv9Sg4B66EUeZASEicsOOR4brTdli5TTfvcrgQ6kHB217nYgEslaDGeEr5G5Im2NFUsrz/ydpbiozawza32ZkObZTsXKlKPcGs3WaLVaZSIMiGfcjNqeVYHZ37CLfmdUu06a2du0jpWwSoTOS+xfjDzrNEehaXciq7CgO7lWVRz9xGgmRilJfK1BeL4xc0iKDZZxRmPgXIYiK+lYWl/9dabkZOa4e05qOjI90beaLzFm8JGIwWMnto6JWULu1/KNJdazBJ2Rca5YckSSliMceCWSQ8MRRhopmhvQf7s3pO8OKDRLYJE6WbLhx2vmza5mXLtYfWDep8GuCFyjaHmW4VeM017WBinOOkGWPbpJ36FZTCPg49dKwa/YaDpxbsNgutO/0Yh4Bt6D3XtwfeujK7n7yaOLcnd2RXZYdaL4pZx7Xnz7LrvOcyl3GHaefa+x7Ox5kWWHaHTz8Nnz0qadcOFgKVw4VJrdEwXxzPg0fKaq5eJifj5ciILJYEYVvKVZKJ1coG+hryYW1OEZdJ9Z9vPzi+NH59Qrs2p8LB1agP9Xh1QjhduXZvMzmCCup18tzKBDT21GJTPjvVUVjFRUtaKWKlQ/P793AZSpeWhyoKr2REMDg2pptjqrCgVVLS5OApGFQweX84X5xcKy2jOvwh4F3YBf/fmZqpquqkoBLr3ZoTlVBMqLk2r6sAKqYW0570+NjQxWoNtpEo/j92n4DBVrGDU2m6heDj87NKP6evdNq7/X5xR0/5UptOWMDNbnVT+iEfX2TSvEu56eGhtcmxzaN6vWJofHJlVcU7VQLS2pAaA8MDhRUcMFdbiv9+896sgkJnhrzKpXp9A6hK5Ck2piUu0vq+FJdbSnq69POcD0tPVsXobNB5zJomPPvi7wabxl57wVkpnB9zFtQWbXrl2yw5xuxHXUDjGyxJdcB2yUJggTxN+ICNyCIzoxU83jCwi/cfJr+EdHjGtxmOakSXOGkaIGWJGwUH2d42s6C8B9bYHgk0kde7P94Ztbl66yvRzuJb2C8138zaciOUGFDQl9l+PTM+TzJPaonVuPt967KPFSVEcs/2kzr88S+QLPlcnrcEUfH374GR8cVgoN35wj86lYolM/8LlYlgKdjvFZxdYdycLJp2NESbvKUsQXbIOSuMI4a9mCSA7NKxzW+285r/r8l63Pf8PQ3lMPBBsKgTUaMDpBw/GwYXLWw0ZfalId/jVEr9O/Bijr9KQS1xbXa36ACbf4NNHpImn1rDNSD1F8vEvSHLM+LcdxI4N2wgHcNTyMDR1wXJvwhPFx3YQnSMNgNFB0mTnVxHOW54abURgBKpgdKCdebfOuTi2tOyBGAmrcKHKNDlcHfx0GpeEic2zeZAgiB3pYgi3Jy6F97zsDzEGJBwXzgOjwePhVTFWdQRFHEs5W49JVIJOFYkjyJgnM37wyd8Gv+ZtX6Bs7vmDskHFgJxvtdzZhl4COSNU41FUFGxw9psyDnECHKaoMzdvKm1cofqeIODk6O0+AXiIcK8dWCHpHkuSWOMiVpiShlDSFwEHaZ77COcje3s16rqWP3v4TZyEhZ32FzhlfoSw9L/CsS432KaG1ARuChnXgM8g0px48PXaM6TI4jfjVrPvOwhOqetl1Us0uO6KYXXaamjgDchZh7Q0oV/cTXMPpLh/D9smrO398ssvBMKFcxNzFIMVoCVeUpH5S7igzDRjfHyLMkoSoZRyAMNEVca2cF2HYr0+cSniFRyWcTu5KUfZtlP3qr085YdcffyAWAzC1U29rfoEzaTVIEs86u+CiZbra12U3XfR1yfHBtaZ6fevDs9brxdJEn/18rsZGS8p62GrW9Jv688dmg/ZjtJSr/Ka2zlxr33m7/cFd8sWOcXACLZFi2OWvIly0jgGMQVGbc9MBOGuYFzDXztU8F6GtBtVjeU7hLJt35SmJwwpvkQ0vcRYDyVYzcR7k6UTjJb2xzk5NoUZDhf4qtncwWBhWqzsoQ1Yz8FKCypV4QTGHNhTOAuuW+rCJWtXZYIly898fFCmfEpkiaoKOjyfUJx61v72+dftDThBLZ5G51CeP1YqzSLEhxvvgBUEthH521V8JhTBPffRoJdh9mv2aqAaSA4LuXO+8NkfpK+InSJOeadg5L+HWrLzw6uTvmV65PdLdMVpMgFj7mN6hapAEc17LEYYd6PMgkQz6vB/F5VwLgz80pr5LLCaPIjJ0MBSwV/d4L/wnLuoYXgcG3LW0b1j725+2fjsNlNlDjIgjoH0n1n6zZKeli2v/3GkJ02PNulY2xQzDrpVMUTtVEuLZSgbXEKmdeeiCGiI5gx5XiDZ/aK4gTjcFnnl6TsbFJkbtwRsys5EPERCIV8aVJwxQb9+7h+NK0zDyG6UYZkxcNrOQuu3pSSgAjTAFN693IjMeb7h4jHYGNjRBR0qw5qkd92nmsP5xXwySRkbAa2/f+SkjI2Jtv8uoj86FnkEI08LMFi30Zhq1j50Hdrv1xW1zjMLKY9cQNrLByd7A2RDYHHkmO56r73taPzdfIk5jwfjyTz+/BYq51uwdldyo48ZVnRQyZEqkjXUq0PTkLGM1BqdB3jTqsc4pJkB9ojMC2wNVP/jrjHYO+fCzp6ckBVujAw5oVQsa6gz1xGqTWhWMq55VuqzCJQqTo/RRikjOavecGla/0n5KmGws8mpsCKTsX9pNC3QcdtMyGo6HCikpIkUZHwyl0ruI9offyP5BqxuJVi4SV8uQNEYo/h9f0LLfjE1FMpBmpbARvgIoZYR4ZDSDWrCO6GX2ya+Jv/jWxR+MaNRewARHEWkblbBVlqS8/xOER/YDtcKy887UcN4kYBfSyOTR4daFzxvoI0mLnWWh7FAkXFR7ciL/FM6p2TEzdQ3kuCJ30n7SsMSAoo7pP9ly0u/ILqSj1M+On/HHThuWjzaj/8rFh19ovnruncZy9SJ6YrR67m3GXvX63u72Kp+MVHG5i6Hq9b0va6hqLC++EquJQZWOHVb7gkppwas1vaOqtjQ/98oc+hFB+cGF1eJsFBa8dbgdPy34ePMqXRlU8d7i7KuDyqt5C+q11vry4uH1ATU5VC37eahwJL9Q9Zf3DarpabW24KtXi2riqDrar/YDfW8ZvvfV0PIVTKvRaXV0WuUX6v4B6MWBoLSQ5Avz6uigOhBUFqqjg6o8qMYH1cLe1dmlGTU5pfZRxriyn4wN4hf4rVpRcF9tfm5voJaHKeitZ1CV+ofU+GFVP6z215bm4MlK00ilOJCqek1VFtUU9nlq/yCal9J5Fc6rGSxJh+C/v/eoV+NB1f/6gNqYUwujahh/en0sj2anvx/tUfvW4r2DamkRfx6B30cHRsdVcwBahPv2TykkNDkwpcaH4ZufV4cHj6rmmNo7oEb766EaWa6pkQm1Pq28I8qrY/xaOqD29qnZMTU9pqBZuDxQVjNjamJMjY919V8K+EQZFCrewOqCshRo+8D1opVif3xu3QD0uitGtDsxOngjk3NWkO+LGSxQPDYCtdfsquOyQeMIvIRBDAqYX5UUAK8a0+7HpOHhIz0KErcZvu58uv3pV6wBtGB35eXShm80AF86KfozXOGsx7M+0VWYeeXl9NlQ3T7/aOuLM6yoQEeFpPU4RTXI15pFpZB4Ndl3CwCsl89l/HTPfm9cdTmxLRDUrBroDXAWI+ncETd3TmYIO8fP1+NXI5wjTICD2yPtRd3iaz9gO31HSIB4yepogPbxL9kXM0GNNIgtmrFL8j8kRz7alpoHlLycPm9AmFKviHap7MEDQXUEFLcFSqQcQdx6f+vnKzucnsJvYUr1oj28yCFQuz7B0CjxLjUXKJ6pGaB4pGSA4jd8gwJBpDoxINynlEcE4WUdCOjccgNmsHOKeuRlT1GRkiwHwl0HBR7p4UjJtfEr/JnCtVvsTLj96bWti+hpvoywFjhdfT041B0EyODJTtsUd+7bTtlcatQpO/V9CpVL7clPDm3C6zotC5IExaDK7EI/n0Hw4Odj7A4khMmwXb8rPOIVf6ayJ0fOziC5wxPr0cFgjzCPdgRaPRTq6pYEXEgwreiBKSO1feK7pw8e8kjB3WQMhKlp8zhGoOaCFlWUzVYKJZvXoSxYpUM2Mney5nu9aNLkPca4QAymOYOPiO/MoWkI1kx8znUMtKLHtPTMIuogetrQJUsN5TRCWB8HNwfIa5PmarNh3bCa5DtiPNYuWlBwqK5Nu2SnoFAm3sqxFQn3/Q3muY7RmQjKvouszkBT9l3YN0LRd/qFVGXSETk760zvZFdIvbPTjeikTv9IUMkU4Q5qSdXZO9nN6t7JVhZ7h3n2XM8ClyZLrpC1dk3EHbBMZW0Oj4s61Yu91vOuq1lcA+zA7PAFWrSB+RUqlpRzzRC1N8ksqN0dbv1z5zaxaL7NJYQskPVgZls4iGkHC3RNHMwCXRMHzD0fWL1OsodbBZxaaGPzn5sulfCeOm0JO49PddgSiLozkqm/EWAuLIIDIqM2KeMFU5jXhWWC4YItQJnXiWAE0Vbpl6c/fgHLhAGCUAGo1/HRE4TRd+K8oQnqeKoNC2RD4tAVaCzstHGhScCvZexc7YvXoBXH1EWNtHTWP9hmNTbvyjsA1TpCfUFvSZAX5pGsVlm++bj97Q9G2KYeMm0z7NJXZ9ilo+SdlImKzaSluHjNHe/U+lqSvTTe/MYZAZ6tUBxlhkBbUO3D847OPLkYUmEi20enEcY31nAi9e317mE1vTbDajtOpH3jNIIcnSy9vDxgF96SK864hgc/1/Js3rYT3BGwIKe/PdU+9TZPdZkkaMuzxmDqv5iT7QNgOwO7ut/RdaffhlxMFvrN61p0g/LtJwkCX8Eb5BFCRy1Ub5DUp+dBrZEkUkkOWBM6YLLmFeddMph9JZf6Wb1LEtpz6rvH53XeOyQTWPBM7aXD39nRF9pfE97CLruOm+0DYA/ouEueOAyg6XjyMPdBYhLOhkkHIoxmtkWcOeOm9t1m0BdiYL9YBkaUu1vCrAEpaJYDjfgs6rDA5dCWRG9G/LzP4AkkbfLxM25PtdptzE3a7e1Z9B01fUMwc4wCTHqKhomQVwGaE8yLm9+Iol/s6mBDEXks6rdun+MEu0ah3eBbN4KKRtMTpROZqtY4+U7GF7Od4Q6wVaP4TFcdc5funShRjggjSYjudi2Rhe9d5QfSig3KBtbgbQW+lRzIKrJ3aOg30nmLljOJ39ABkZ23mNy4ic8+Vin7rqG59gEJxIvX2je/4H6JJGSRpTMS+noAtakMBpBMZSiMuIdeQmoO/xHDLRtrkb+LEVmCPDWAF66agmDGX/iDHmZNo/FRvso43U3ME8MolrV231CTAJzr9PI6f02DXQORJd8FfBuGbyj3Xzm/98VWqufdaa1UL6CnrVTPu81Yqf7+LCsVvPM33vDzXaxUf39pK9XeA68dnN9Tn5nfe+g1+ByIo+pifWN1fh98vPmD9fq+1Xksy3tH17yVo+v7NuajQQUFy4OqMjkxtTQ3e3RhZnoF/8L9e5rwUzOuLuL1zHS5WIAfm3G0ODU5MRTAfzPTYXF9Le9NDy4dUauDajos+4PKh7vW10oefPI1qAk1qn5hZroO3agtzR6tLc0d9QsL0/CZmZyYTVUjqExNVKYml8sKfpsd7J1SjZoa6ldHRob7xuDTy9Dc9Vk13PdqY0iN9BVW1Ea/6o3nVHNI9feq5VDtmVN90xghBx15ZQYK+3vzi+rggBoaWAlV7/D+AUQAP4TXwaLqX15We6uIfrQ+9IwUbmVMaKzziZcZQhRLw85S8kG+AcL3YpiTzLbvXnly/532H+9t3T1HZxYNqdcKuZJO88ZN2IyvtgGb9VWTJ9bEDumSUZFawT3E6TuS9sc0ZFImsqUdj+gaQU179+4q0mb43F+frqNS0TL2+J1b99onj5sTecx/jKh0VM8oEYYUyW2OMWNtwv5CvvCaPJkltIZBHtHYypN7H7CGYWBXdFO5RhwJ569jLlg0+MBNfMVn6pg6h2MNhYfTMZzOzP3uhZ0Tj3Co7t17eumfvA/myuho6uzwizkianf4tkC8Pd1mRPBp6lr25UrwBrkBrTvEdYrso7jCHMI4mEywujyFHbvNMtfsfISttz7ceuux6T+0Q17jEYat+Elc0y6vGIeFliZukR1gMQ6Lyrg5SfOqIzRNi7Rrw/BMbkvHYsVkLcDW/v9442sxav76fWOIljt1s5dkrnWm7M6vd8x8ZZut0HPesBdg4Ihjwsn7PP5owGxKwL0vtqEAN1+E9CmYyse/3Ll9tf3gUzbqUAMw0FDPKJ2WPm4YO+hy7hWXKMX0CUXWOLMUPRABSR1jSnOSF1tEZdKUHxrUiqTIvsJCElVayvvTXBaIkRuk/my/eR8xta/CZKVsgUnSJM8dTJCtlRcYYw5lybTntfB4ultb9BJMIxK2g6ZzaoUDduBlSCs6XoeXLqgFvPeQlSz6QWYly5ZXrzHZesDqsluPl1y7lCWIKMu6/fYroGleJdLUIwB70VoTYTAkoANjMm5i/ibai5qtP++8SC/SsR1kAIBdF2hIEpYmEzFtmt6mlr5sT5i6VbQMWZ4iTM+dIk0TtIH2Jp5zJsgK4cQaOnslptzMS9ANK3HMVfQk1G8M9PE7l3gu8ktroaNggz0AzXtLOKbLWUR0bRuxAV2Zec5RAWaqUwSXJm4gSxs0zw2Kn5RIqm+PM90JI5Fw8q1zXwMP4f6Crlmk6DMHzo/zcaYMQcopSHOx0K0Z2Gkn0zsG2J77WvbLGKqGRIfdwX7mSHcZZYxJxT2PO8RPrzxsPz5ph7iRNmtmeLVfbU7ipMR5I8Wjqrw+GqYVp0ln/Dj40Ipb6PDmoHZ0gAVmR8Q4foHOC0N6g1xAzJqQw24wlBYsxD8vEIrchWsYivr7l7Bq2h/e5vzmCb7DoObuuw3l1CFrdhCaGnI+TQemNVHJRiKhCSDOxCMB9+fc6drRgxyo0NGDHKgoED/X0tEaoucIkX8YvcdBKmCrD2k+Z1vYMc1uzqKPGug/Tx5ehS4KZlpAjlWZJv4Pr79iSKlPzOozE+MfzJKItH4Y5EguXf0kmLiV6BqGNCyE2SIZ13wOt7HfbOCjzAKyODsWSIqChKnQvvO2tWPhiWXooaP2mqZMfgf/wC9zupt6BusRd6ie/ZxnMI+6IYyOTWtMWqf0hIVR9EyAbmKi17UKtXktZFORmLXf+vDJ/bPtP04LwQYHr+MoWE8vAj4qm7fIBcDpaYuO42tUM8t/SFMS/rMchDlGYGgaTByaH03ODX9dZsVwx1xwQwNpFpjoQJwCTnAgiNxg1WJvgMaYYOKrzGRmYqZ/l64CMekfwVxB/4wqZ1cazmDE9SBp9w+73mT96hYYBKNzpcD6c5cJr0IcBPGE0Y6Puf/WzehHAAU/bbq852zEq1o4BfJ6LbAJ6uJfiBxy7wMW2+wqaYa8kMkX7ZV45csxfZiIqyLzD3v8J/gkelajhgd6hnP0FjmpT0m7tlyJFGtNsgP3ZNcosWrtDhRp18MMffKsNIO4Q3Q2hqKbOltCUUz1XtDdBWofI6Mvu9+BjKM5AwmjOWc3eFqD0n8pEr9jD0QdsHugblsfis+PJVqSaNhNB8bx6x2Hu9N4Vtddjd922ir61GYzNTss+gr7DoyXIcDDnVt/tI+foloZXZs1Xgo1rjIETZE1WzRzluVBQa298IvO0JL/34yRNgOAMvff5i9vPcp81i1v5vGp7U+vcXebmleJ/uWIl4y+ZTQtq2HBXoLh2ykMNSAtiPcKZQK0/1p0KO26Tm+KSYuygbKWdAuyZRt1oijhYnoVu1LeiHgr34UJ0LPy0ulaQcvYl33QDommdZC8xOeiAMOFeOdtTldgRYmfavISOMI+xr9/KURdNzqMe24y/qgcHgjdne+Oa9LBWsdjuvytJY/JfEBa0NBH0mVnFHlAyFJb6BJUKobGYjy2K4A085MNFu2soQNDM+XGXHnoGeZKY6QsxrU3Dr20gXKutZ4W9+0tVWCx1mv5uYr/+rjaUzy4t1Q8uA9KW/uhcGLu0Ho6d6iV+gfifFRYWDoyOjy+Cl+gbH1vqVycO3JwXNXnRuH/lYp/YG21UVio5+e8UlIu7t9T8RcX5gP4VPfvWfb3lpIi0N4L3yvwvbzaiBbqtbm1pcX52vx4c3XYW5qHskJrXAG5PZNqdgU6NjzP1+NjI0NHDw8ODE9OLI6rYfhMTdD/k9NQCj82R4YWxtWhQTUxOrxcUpMTR4bHx4bK8/htdGTfYRVW1HJFTR8dHDh6eGBwQB0eHIL/BlQaqKm8qi+iX10POrjNjKuRoZ71ATXU39ctXSCdK6Iu8d9eDXFBcLKGHpoXiqy4aYUTtJo0htdC/zf4Z96vOhqHTjejk9JFm/dBc3iwpnMWkRJC2hdnqNu59WDr88vEgQJQSUAZW4srrUhs+36B0KVIMgbdO4gYFX6hme7umx9az7aSSdjS0Sl0TPv0KwwgxLTgHT2KfDr8RjAO2ynjSMS9gd024jUxJzE/JejpjFm6zG8x7Xy0lwYI2jJ1RwOUEJ88jXbEWye2zsEm7hyDk+Ar0D5I0AnEeXJhZPxuvdCwMs/oho7Cx7e0uxe8naY0bpleMPJMpg/A3xCniG06NeZxqcfgRZFGP7qJ22DnODTHkGd2Vtw5zgejqIXpoSdcI0rwBDy6Fld0nj2E2sFYDgYK8WBXQO3g1jv0QWkt7gIbMzH8gi/GcfqaLBkKHEyR0F/dvEm6HdnXMOqIg0TyARZquxuWB6krXowNHTV4NkOStIEXivz7wx80FSRD+DK+zpfjDmKmVT2U6HpOwaE2HsIv7hpSlBdFilJCWUQhEijg9dC2H32ydfvDzqE1vfCqfkOeLqFOFKOYQTqllPuCxUU5wv/rjLhMMByOeaFPT73f/uQHPEm8dcK8UDo+pyYT3eTmlVXnqd1WxST4zFbJNSY7i6TRMw/dWQQ7Lv2gplXQxPI1P0cBRyE/GtqZGfPlHxLHREZz2M/XNu/20QaFwCA4PgP97WD753r3UbjGk/unt46dYZ+ORgmR5TlYCldMJxBSR6sMiIRYWp3t2tWqW81gF3GTFriIoH/cNmWXiHYvsa+SvcKxIsQRRtXhLxPUooEJy2wj7+dzBotOwh0YOkwY+r0PBJTu3gNJcI7mJ0yOrmd5sKsTSZfG7690bQvfa7YJtDo55EFKaRsavD1tF7ByK0hzHjoJQmuT1BK5D+kx7Sa//voYBRtBUbXf/SePtCu9tv55kZGpWiy1SuRmspYxg0lXYPo1wxf1wdjGujXM5jHTZMrGsSDTaIr+UsgbUwplZW6Mw4DxMxzeSmPdQ22bOHqHp+hBd6wmHFdPzERG31hkVj2c42s58kANGrYjeGTf0Qnfts9PTocIf52t8tBnDI14kHDq8tYXt42VEV0Yg85GUB/AJVQPGk4zdGkGmCDpEPghQJuNeT5qk1cvbp3++d72Tw/56bDVWydMk8UoWLZNekV21Cq6jXYtpE20sGl0VGuZtrHJd64//eYr3Jhe/he3yi5GJTzay7YoDp+I9oXuX8C5uU1KFEkuoEWv6NPz0sotMkQ72hxhMgeRdgf99vv2t19uP/ihff8Xdgr1oW/4fGFsOAWF1xJz6miNG0rjzZ+4dPMKySLTGrckfmKRaQ7aevLwXeZNxJYSL9NeVrNzYyGRRWh2zJod/uo3C/gjTeEoZu64eaMg6XyMlvfXp0FVgOo5VPfGFUxbQxrek/snsWP0gq1mR87YHDip+4bxkoLb2r1fqbf6wk6RkDK94aHh3iA3o66YEywcoF298DGGFbkm61VxFSGOPD3HGM+OaIsZYOfxRaDJNoCWt4aB6yVDTDAOMiT/wYWWsuVMzyXOi8OljvYNyh4A4yIexmaykoucOBk3RJFxvIxRgwHxRm05yFjscfz03GNo1aBkoS0/YKslPYhunhK5OO1O0sLELBCZtmHm9mUbN+/H4n7Qi5H4SDM9Mq2RpqKXin7M1GddLTXPiNad1Hkuq6qRreAjfjBWzly1DJprodLuLMw0WPedtlowcW07pO46jckLA4WXGxGjEHmwkpOpS5wXXyNFb2vzxtCyVXAHDFb4Sq7zecST9+OfzLMI68SjTT1wFMltXhO3Q87iL92Y24aZexmyzwKYxJmOitT/TI2CzrvsQFPmJaPpwkiSEc9iUF99lGV5/wtF7AX6V1fNq1PtEkXTthiTwzK1pOMpHbIsGsWPwtDF4zTyoyAgUxj+ltHgcTBEpRXV3YCpbN4llV1vEmSIaGOQHSJnR/BD0euTSZF71lajY4dh9QNDhpRBQo+gndOKHD8RdITdTHFcuYbesFlyYRdFYBK/cRQwKzywezLhwKj0mH2T0UNMS37X/ZqV/642ZTrP9LpiLXa1yXRaYbrYNbK2DNd+sdtgsNtM0NU8kbUHuMaIqmyaiDeKJYD3blk7AGdrzWz+cXbpXmZ2+wRwCM9pnp3QTnDPbwY4u+fVO9zMxrZzb+lJTyk6JTO3um1hMz1z5imvU4oFZ05AZ2PCXNjEy1xFH44ZhptlAHbR01qMuu9+Pvq6c4PlLnHeZcDuYtFdzs42QnRbvXvIbBpcNd3uETziQC8zfTu0cqsDO1+7asEd+m9G7/UxAEgq71I8KQ1zUcsGCl//nmWDq152V9x262ySseQKJ0wmP/V795jc87Qx5m+UZGoooy8ZVYlO8ayG1KEVZZSSZ2tEHYoQ9dXRRBz1w1LKiE4jN7NS33TjBbUyclZEIM74guU5htUwS7Brjl0znMndaT9wxZZ58VFsRrdjfbrLUhSaNYPMwE/zn/DdDo6rjz3wIoc4lClCsXeefHT+ag8/utTT5x+dP5kjkIPPOgLBAkTBpCorbxx86VOQgwf2N/buacSH9jcGxtXePfH0wUMHGoegtPpavAc+e0cG1eLc5PRK4bBaPKqK8zPT+JkOSlML9bAKd++fHR17ZVHNTEdjKhlTc5NwW6sZVkdjtadWXa74+YX8wnJ1oVmvLlTjWhgs11ZLU1UoLhOl1WBquQIX8J3bgioLBfg7mM6OFqCISvLl4sz04uRIQc3mVbo0WguhL9MLPQqJzB1Vs0fVzFG1Nsd/oaB3oISHIa/1qd7xocGhwY1ZdbBPDR/uPbI2oPrGXjkwqFoDarpHDR7uHRo43HtwECEABkd6GwNqZLh3oFcdHR8ahcth9WqP6nt9QqUU3r8xpwYn1eQY3g23ws+vDNAdhREM+u8e7k9+qqIJFiMKCOdcZRwEp7dVXJiNdiJAKV7rFD9h4p4QUOrWb5yVnXGfAvTvRCdi36q5meacktDXhVbVZewqMoZfK2shyRovNIYG8Xs/sMBMSevNtNaMy0GYoywfkgMNk7STtV0KMByJM7ZjtnNqR+8Vb1/a/vTXrXc+gTa03wBmcc+1inHe6gzk8WBbYJcH24Dr8eBSF2cHTZo8HTKEE3MKQ3Ke44CcgjB7GOOXicU40p/PYWB0gNlYAzYdwuD4VAom1b1fCeOCVYGludSrBmJaZjREbmHz+gah0O86AeGWtt67/vTYO6752k9jNCNqE7bbLh0ZZPQsc+DibjZJ6eIjZNhogrJF8Vq400SCWtFiULFd6ltZl2YVOXYFIm3OHbNLV/Egx4wWKT2ZRjhxLpkdSMUg98PF3YbQLMKgtoBmQQa1oiBbm1isf8a+mDX1ZfYzdjMTSGigSBFOZZYLjdkCJaZvThnvo/C/AjIbXiWO6L9ub126Aq+NjS05+3IwHLSoyYTaWiYY8lyZkeO5MsxNp/IG4tLhfqJmWvYK5ECsD7pEA9KnarjyHghOELwA2LDsPEI49ShpUjbgjm2KJfuPmGNXcaACKtQm02DXyOE5EivqNHJpwNtAS565hT0H1DGL//BBQWLGwa30yBlDhnfww3CCAHFYFAYCrW4/PM/bReIg5JCF+H27jgQZDACbMJsNOfpjIhgQxgd+lpvKTKfvzvLRWSNk8Yh/MS8e9i6200+feso4TmZ2OmaDY6ZbnJkkm3fpmI8SnaAFmf20fYdr45yxkcPwHphtY94BEzkNGiEoyEmgg4eFtglzNfRRXEmkb1FT7XzPTNa+aiKLPU81FDxG6+BmEY8a0F8t0sGGtjRBvSUSjyPE+QLtUvLy2LMFhH8/d/7J40uY60mfKtR9n5y300Q8i6gFN2aXae9+FjrN3vUseFBjn6UZZ56kSSEIbJPxcMxiPjyvEXUoa6HtORSPNkP/QR4H07wRbgI2aOTBRdZ1TBiPW7Q0sTnE3DfidXshXV4GkHN6zzqB0/uUTDsSnNlqNrL0KJVKx4A8upwZjVYXgpbWf0ZGnLT1mMrbCmodndr9ltxXRCO3+xUZSv8REekRLwcv8GFLSXoGfiG/PZsmIWcXhMmYYBaDrtO5whhJUkNKEsWAnD6vlLL02jfPbp1+7NLz0ybGexuCTEoWkyBW6jXUSVNO5hyaciDHNGXd+HU8Nzc0Y760K3PzBh/doJRw6T794qv2ha9dujUPsWr1cmwE6ebdOmEICMCGLUgFG3nzfi2zQrYv3MLJTLY69IpMmvVcKm+H98VCizfFRMeF5i5mMFIsKcJIETr0RuIE0UDYEbHpMaE/P6GABCGx8+g7erbPGKgRJ5qtDjpLxPpiksev8kAbAmRliLRvft4++4Gh49e8yBDyRCP0+Ck27waFAvoZNDmXsdYAfXMiRFofLypGN0KVLzGxTKgPsL8pSfRmw6bs65D+6OORkf6GCE8o1G/07KJv7sTqmFTujGqJrySNCMwTZ4CCWucAaToyQBouBgao9YxcMnqbpP92bljcfUpmh2J3DnbPoPcJUnHrK8JOzuw6XEul1fUCutBmDXQcYrvGk4cPxfhndbSuxs6MmZPlvlSMHUNkLCYRR0U1iinb1/lerT1yl3j/YDYKZJfRnYmrbL5piU3bbd3qZ6wlGRXJ23VrRp/igez2PBn1hZtNM+qEq0QY9cEKcivAM4LbFdciU4zYzLRiD+1J0Br5KvyjxctDry2zqlKzFJrkex3DbDWixAgQER2ZB3z+4/2Pnk4/HPd595MRb3PZWre7ZHiDShdSHQ/f8exB9ydvdUssg9AP8A6mcv+Vw+9piki6E7usYs+8zZrHnkdJ28meeY8xmB14lsFMqiZvvGFr1t848NJ2s/XVySn4zOxvpCvwr/eoSlf2TjXX9rTSlanJ1/Y118YmVhO43peMHV1deW1PMxnfWE9XXltbGVuaVen+lbFGaezIxgEgEJXGiqWxwnJd1ePS2Pi+ATXWj7apiSMD02phbmbiyJGDUyo/OzK7PqBa82r66Ph4RfWNjqwNqGhsY1zlocSDwmlVh2/xOBRVS/3TavKIas0oH8rmpoHa4UA15xTQDGZVc1qFE0f2TSmo5E1jit4DFfX6lBodCaCtiSPDy+pQoJaOjq8cVquTh/YfXF/dO7MxfmRpen18enXiaD2OSnMzyURfeV+fGsH/pnrUqFdXS3V1sKxen1CvDqi/T6j+3j10xaCY/asD6rUpBXf39qh8HW1pr8BNQ71wOTjw+itU5e9D/Xw3FO7pe6Y1zbE0CRp5J09vuTHebP7JBnhzqljj744J3hwmTwEBuQyr13E0jqHMYf7kRS+GMi0IMGDHbYY2kabnZh/Jl3Yn6Zqv5MhZm6+M6c1IqP8jlje3gRRNHRsxbz0pwwXvEBOJI0CnLBesq/2vn3ZO/WB5ur8a+mkNt4WtvANO52FELOGMpX5Ng2JFCI7Eee9ybmNOIPzuBjka/tnNCqyjQcvq9kBJI8aN4+5nEg1FE9cpb5E47g/dR8JDY/eRNu9GXZpADzub2a/LQxlO6z5UZ7vyTBpr/m6K7oJyRkjtmUv2dYr+vJAH9XiFENfxzT/4cevijfbJ39p3MGtNCciiF2ZeG/hwfHLNIMl7OQ/5Nm9cMOwcVFQsxYjaRkJrJHQcXs2DMLYWe7vyUzz9/JrbUo7c5WPoJYFbNtyWyVWCkiPaiUbzlh1NMelJUet6x4D09ns3hDSlPXHeCYKJevQ6BCp/gyeXJd/lLeyeVqw/6Ab04GuMRNNpHnpMGJudSNmF8ZmQqgW7+8pTx8/0VdLK0L72xV3N0jddlbPfv/mSi9F2FR2/JDGjpppN0MgjoNM0lngGtmzGc+6zOMDpfJFEntAwNyxQl9AXzAOi61KkKMeOIUV3F8Rqq3UMqbsueXEgmVbNjKjM4SwaLHcLHUmeuQR3L78M+QxGLHIttL/+wCAbIWf406YyHUpALElMiuRVpaMHpDpmJ+f6gVvdyU3JJEyGSqJi0lTWSI5oBsoXwjMdkWKxFFmgaD5J8sRiKJIvrubFlhD7YViLxxe3HSRGz2Wt0d/048QR5r2/zsfV2uKWeSZEpdXPlDbtEyHnpOT1f/MbUXOEiAn3pPQRsInN0ExyEvomzjcnr7bfvcw0oyCumkA8GhrDlTsTRrpWDT1G/OpZ5hpnodilYqEybHUeHo1MaMAUXQRh+zWDJGxghHUMj7Yba9useRmi2DhGdn03w2AwY+OvHXPBnQeyMeIn1ODanK6aa1XpK31nhAoxjNwW12BKSm9qOsthd1Zeuwpg7ZlFkFkDsgR2TX9n7kNdm6GVUjjbR33Og4pWIA/qPKdvn7PbU3I9ecoO/0HtOpgNk3I9BTM+gk5uZjmBwHxR/A0NNNrR4dFl9nKgg7y4ZNOd8RDV6E/HanKXkl+zIwTvgpEI/Jqnq8nrgCqShLTmpDq2ec8l3zmhVFJolEB63nuwc+tbia93kpwHvmQp37w+3Rk35oaJ6QEZ7m7fyWrhHWq9q287arajYr+0lSer4bo6aIfe+R8ouBliXbW//0i55GFNJWuXltcZlc5ockazEpc9q/F4TsVu+khGtXHkuayLF9TOaBud2oCt/6Dhim527eT6tEK0BuAQaLqt13jm8qQ1stjIUHNo5VnxaaSmyMtdN3e/1Uoy/f604LESxwgaEjHd7u5+r8HUJVbO+pwB4KYjP23FkjMf+7uOwtAck+tTp/QDfMbMMXtHx+/ygvXL0a9FMC2Y5Qi7oZ11jVpwR96viW2I7GcdPw53SzbcjGFTN5ELQeTBDNttDepyg5NQuGttk0J496/G9vPas2w/XKmOIeNUq/7Gay9t96ksLczP7otqJb8wN78/nZ1/LZ2dPRjVgvzI3IwK4U/RW5w6PDgWL9BVYa6nqnrnFRSOFRT+hhTmX9s/i3/xDv05uK8Gn2gkhu9IHe+Nw/xIAvdBeW0ZypZLhbkqlC+X/Lk4DEaqxcWppLIwXy168HdpHj4L8FsB6KeHBw+VVG1ZHR5cn0EzENAbGlA90ZDKR2q9qvomKpgPZV+fGujtGSiqidH+vtZaVQ36KhrBssOTqq+vrF6ZUK9OqCA/OIFolkN4c2/PUJ+amR4cwf8P10dUb898rJJ5FY+o5WXVV1Fr02p8tL+/B+7vKdcUkKrMq40ZBV3pYs8JvSTvI2CzhhvYVYAIFjGbtBG44i0yi2Lgfg4D20TfxzoIfobHkj7jWAgZ2IUIsAW51YBcknNKDWwBFNvffs8WUIa3ILp0IpLTQBegGsPeBlGka3Gez2o26BJRoTXkPLuuXgkouTi7ET4+ge4Q79xuf/YWZ+hCbMEoMInPKQbPEKezqBg9s5m6Q3jzRhP0jp/rhuj212e2L/9iiEb+ss64FZe92uYv7BUPKkSRUztg8lddFMb9onuipoV66PbnF3ZOMpspeDn41GLJrdWFWujx77A5R+f70KsZvfR+nj6izDw99iYiK564tnPiBB1EULVcw0/rzY58e14jpLgAm3QPSvymFLlJ97IZ92CV58U5mWJJUszKSb30iqFXt09cNE+MiOXyyCcQ+BlJIHSlpMC7juheeAJGKChBPUeHhUV008Fz3M2fmnQaHFQpdpvyDFBmuE9/3vntj523KOlKAL3wxXlECMJLLjLQgJBMvHLYJCQxdl7VtMTXj4mJix9CXwZ56+geJHUJJATq9H4TL8RLP2DIDnIKBpoFC3x37nH7zoOd937SfsGNWLRLBMdOAkOqUoB1oylxj5p6pXzZ/vAueZTHJQJKS2ToI8RuSj3x6IDJXOd0AvhDgL+E8lNQkJ/4yBYRrpcFSa8pp7bb1x/gjDn5mE6aYDVooFqviLohHpdGjL+DBUFzZSPIcTucjrqB3uwUU3/ycftflFzOh6ctCRWYJGnQEADaQlCX6UeRmW40Jr0Q0BudMMyt909tvfOeDsBM/HIUCLhtXARSRYzLkXeMV5s3My8XqaKwfP8UkCIehvVz6z4m9+FhLGJaUJgoNUFfICeZkC+oK/COyNMNurF19gG5wnuw9jH4VFAzzSAhmcwYITVDR4YI6PAQER0zRphTg15jkpeebODXUNDj8jnpzN1mhc6o13KmEMf91JtAd/vSsa33H/F3fJOwE4Z+1nSCPJlz3Igz7agl3YpMu1Nv8rRDGnbWxUFSysV4tsyHdPqK7E33Kc7zAiUlPX6q/Tbn8hUUu2KoMbrw/lysOQZX380wELehwRmMxNQAvGP7s99xmr55nQUG4jQ4yD/wXHiyX3eIg0rXLDyPOAKOZYg//fq0Jr5c8BmIFuoWgkJCp99eoRkRuKhfDHBUcFVdQDayeZmS/P3z3M7ZR8Tg/ChXKgWao4ewbaWe+A0ROqFfd683L5dg8O828N0yWtGHICN/ab9DOTMwF3lgcvYIK2KihhUhRZcQcyRDCZgRnYh6FZt7FRZmhLMsRYBntiFBQSgFtO3dvNKiZGG0Is9vn8eHqzR8DORvWI9KrA7LCJH1CpLVhAjkUtQFwjCo+wUhhlnceX2fb5/+l6FGor+SNnW+8ADDw7wCSX4vwsAwuQB2QwuAIoq++GXr4RXyPWyWcpVGU7CQ0VCOhnSpDleBvSQCZDtHgyuP0Be/oNX898vUHaCSQ0s5O3gECQgW3I8U4GVuXglxjLmQRNPNcjMJmItxSh4OCry5TosBvcqRDVF41sXbuPYffb117pf2zbNPf8eddD6uoptmZJISYNoMYCXUAjk2QUFEE23zRgMp6fzjW7+dAxJbv4ojQZRrRVEz0T4uIFtRntMXyionBVW+Tv68kCMPI/iCy/3Y3fbt+/A/cWiC+oY/HRLA0LIiwKGmBQBQIu6GZAxzC71mivlYGl6DI3pMQUGXwPAVcn9+QgIKpghiveIb3vn+u60zV9sn39m+gLZwuT/nt7h3YXPDy8WVMKZkQ/i9GnPY2Y9VnCQINEfZN7cvXdi++PvOJ5dwtFro+x3m3cR2Xo6/kLcJ60KJx9G7l3FHzN5Yl+lw/umlr2G04H9ORFEiAGH4q7lsFOcJhDvh9LR4qYnB2g416EBAmchIhO68dY9cR29t/f6mJtpqNHxJdhsnAekfaOzXSz6Rkg0piCjpMi58wm8/DSueYn0TkHdFT/ahAcVEMRHrcLTBlyFaIJpivWIWSXxE7POf/Q4kZQ/eQOxopPpMryG9O7C7AtkOsPavNf6sou8o+aKGs+qtNe6scuzq2GQ246hbV+11tFSrnfK9ZMkxumhGa8zqjLuURaMospaoq3IVrb+x6iZ6mxijRYNy9SZWmVhf0rnVSXI5jWoZb1QhRwsSjcPVM1jFEP1CC0YR+K6gz2gOLOmtgDaSWTRbK4Z33j7GArir7DVCl93XNu/m2Wtt563PRCg64lBu5m9abBl5JcLKETBWrPDQFHIgT3A9PnoMwkRLEh5s4fyW4zOX1/zdsnbNzaXDN6XDzJ0NZ84yUrLCGOa5dfFXwznlJIz4UScrMlyIWZCAbPDhXSLsghgEMwThA9y8WfdmveuxooHiBb7LFASLZgJDb3p32YDcX6zxp+N+bfVxi425Z/+zzD24vX7jDfTpe2P/S9t5qrXlucLC3tIGZQYZml4aGQ6SifHBwsLB0vrI8CQU1yPVLC5NLOwZGe7tOdoXquXSXLVVXBqfi8IK1BmD24/MwpfentEDswq/LVfmRg7NjSzPRY3KobnhGtRYHRnePwTXYW/P4pGFg3sLBzYKC63m0oC/MDGgSlz/7/tiNdRqFnt7ykcOQJegbLZ6qLY8OdQzPz87iUaZ1/r7jo7Oz84MDb7iq9b6oJoaTUK1sqiSicEm/J5C3cW+qaOlvFrYsz4MnxGgHfQ1A7W3rA6U1Hh/v+rpg8/aDBqA0iFMkDs6ibabdFgdHT3cPzOteobghn5MidILf6BGF2sO+vU36FwFBRgnp4o8RAyhtcIlf/64gggwK+JQSuGwZEX88smDn7dOP955fJHD58lLKyckdZY3SqadpV9AO4/TABGXbN5AcufxRy49WEdhQfS6cPNmzaNMsoTcXKWFE4QBFoKiJ7KswHscyj+uDxuffnt26/yX7Qc327d+45iGCL1MqGqWuBFtQjcYM/4MuAU23nWIwXHrN+tjx3eLoXvzh7xPkQQYfEzHLHiNqemKmNmbMlv6FGLsU/Z0QV8m7Nef0xxIP2MIePL7l9vf/v702PH2W4/b138Raxpoiq28lj3UWLxKpmyfv7OfIodmMAtmgXjrEvzb+gyDrbB+bk24Kmz9QVUjq8Dm95EXJAUJz5ZS+BYIn8Mcs9h53O4xQBCzvfbN63gQf//39v1fyKaeFMOALBraUG1oQytCPkAfm1BM8EKczfBM0SVkrP24w0pjdtJneJYilZB6JIUZB+hPa2I3s07Qtz/YPv2b8YNOZX5a8uxQqUnTjBAydgowETMFhIieAynwckzNDD2Kxb4SV/Ew1Rbo0cSjsr/ObuRgIZixbH/8Pn75jpKuF4NltBnk/JJGiSUSjuM3XXI3mVDG8xvIWD9YoKH7iEGOzVqOsvokpAckfhUKWrZAk8M+/vvHEqmfvPEhstjNb398cu+0pozdhE8+bdotp4dHRDWGY8YL6qcl5nSVSJmuCh3d26aXlCkmtuwzSiKqsRwbTkX6mhgKqlL5Dp6F3OXKNcOzirDlrCGLKURxLgpSgwVO6jH32KPv4gxfFKq2v79/BQRNf5mG7m5MmWbpseGbPDMG4v9IFh3GYPsU/uncJIWoqevmcR9AaeDsN1sZdCPU//OGQvu9E09//kDuJkLC1BoOP5M+YNjZn8edZ/j+2tMvbGBAI2p6uhcIZT+W8zh1Hb05/i4k0NQvm2mi8eTeo+0zFwipBm5FQqKxNYvR5g9ksoiD8ubdkDMPBlRSjfkSbYsER4I4XwQI8PFXuLqusvYHQiCHMEdeCSZFwuffm7+sUuIgQWAGQs28WyC0chT3eJmEGCpSRBRN8qd/gglBc97Qxb1rUdz0VpFda37iMXHveTyG+53hMVdtRFD6f2E7cc3pPzehu6ubMAUBwSPgf9knaF/9Df51PoFQtk9Abx733kFJx755VcqSiPLlry8jZw6AbLl6N+Mqj4h1iY8w4J4mh+zMTCdkZfTtRcQ0EbMsiE7owXQEZgl/2aOjQgAaCGOFHFfwKJD5oCMkuQjj1gNfqS4QHnQScxe3H5+E98rfxR2K8irwq6XvTuOyKs0jwIvEp8hwzLfskkBqpvPoqQY7pyQgvHcUW7iDSiRPZZFs5IGTz/j3r9on3+KUxvSW0EYbNhq2P/4qJfbKOVRbnkv1z0/KOfgQwtJV+OdQwo1UbHYZQihLx7N0LoD+gv/Rgj0L//jtpEFqjivIpzP7eJYAbH0xW8S1mn267+7jP3k6ouQ8HL5fTFvmFT3aJGxeqXt1jo2EW1kxQn9nDtjHOHHmaejpfOOj7dP34B8J4eW4imiIhmhAh+5IzAvZgMx1MelZhZY4Vm1/8Zj2N+RNrOtiB3I+PCGfglGPWpj1nK7/PI5OBjWnL+3vTsM/0xekhhKuJvtApJQLKPQHSej+aDrBn8crhkibfGoR9UjHk8F2voEPkTTLvEY7C8jWsy5GQRJrrMfs/HSl/ehrWPuixND9MtnNKPEs5/VE01wTcJXYn10NRlaLVg44kRf7bbGxgFN4cQnQrelZFZNxihJ5yaOT/e0bTId88Rg/PieyzefYrYs5lh1DzVeIrNNd5Ktud5Gput2F0XyWHcluOrrsZswOxtlrZDYCdgvA78HuJcwuwtk+kA6uFX1hilqDN4q70dg7lewgeikN2KinRjO1WqlRR60i6iiKRkW0Cp3R4ERxc5Q1o6hltDSjnlnFzGpL5P/Df5FdkZrEDAv0I6MZabWIT4AyOo1RZbQmpBUYFl1W6zDahugqRhMwGoCV/EbaZ4W8Eb5G6Mo4chUjtzvltRGlGSlqJJ4j66ysETljhIyRLpL4VlvikkBscZ2SxMgQy/a5/1Lnpfi75gma5VmWabglMzezIDVHs8zM8DFmYg5JPRUdBmVYk8OThKxmHHp5m3VtRny3OYpW2mCnKcqUGjOUe5+YoEyRMT/te4b5iZfzG/te2vI0v76y7C3OzizOTr+2shwfWI3mhvEzfWS0Fz9BubAA/7ySei1eWT4At8KP41iKn9la6C+E9SOvxevLhYVkFIi9tjo3PDKbAtf1k2EoXwEiQ3W4d2zocKke4N/BymxaCwen+vvqQXlhaaSn/8Da4mx+pKfvwJo3C3R7V5YPrR1Rq9FwD5QsYj9m4FPs75s7onorajGvDs6id8/4CjoQFY6oxVE1MT42dHRsaDVU9Xk1MKXWKmp5SU2P9ibTR3rr+aWeKJo7Eh4dH6v2900Owuewmzp3sDjVB59+aGshvzQy1y0xbpBsXilGPsYrxSDfgpLkEAc2I8XoEphiehlxItq8keQYtVufap55e+vzq1tfXd365hjnUeKK6GC/XPArmr04LaGJhVxpM+2gu0iBsobThMV2uD2yyH4FjXBTJDk8dP3gqnIeFcUb6KmNKbToOArdwwnVEsMfVgWiDHajdKoCvPPGOvoBoDslPcWnt55+emzr2Pc7777ZprznPmJ4k4Ob56fZNlBMFClPrdNMHORrXsENFstnGnj/s/aHX1jq5QieNksfkwYhWnm6+UNNcgjhFTsSXmu2KEa7rL2iti6eJliSd8kCHoHEbaSeHAIDAY1SQX6okkQcaYjLK9Rml1euatAfEIha2wcFiVpQlhATUHyBEX2a4s/xue7/svXFGbaVt3KNdX0egGYROdLBmvLdIldz1ScP39VVnS4k/ipm5ytidsaIA/GhG1AUchkJ5j8vcFA/HmM0iCsTuNeFH9Dc9e319ts32E06xf1SpCWp0MZDoYDOBg1t3xSRzwPa0CodxNtv/6t9+2NDHD0gssTjRjNGU0jAgFc/xQ24RGxUkgRM7N8/Bis5ySmlYTS/vb79/Xt4Xghb9T9wMKNaE+EUwmYpgL+SmEroo6aOmAcl2wYVVVnnvoY42IzhYBskOf7b1uWPeHCgNfaSRkB5bsscndK7/kYSB6Zx0qQli7nlV80zkPqLz3AN3ezoyAZH5dsPcfd74ub2mzQh/FqtmeYaFoYzQXQrGubNKwn1lulKocdlgshIi58hqRBE8OG3QF5DUDBpndd+1RMdx3xncHiEtuhM4cH9jxCH383ZAb3f+uKqJl+OgEYHeR5j6Pn1UmdLKYGdeQXKKQVdrlr6x08x2WXPT/IuXTyL8zegMnmmI7gDBm1iALteqMnmNePtBEv9wfvtDxjfAG4t+P058XcyhOhgE9NUDWYIdvaPeCv2cXcjX2F3naZaXjEIEeBEmrTtrcaR23G8tB2nAEPb8XvHnI6vxuOm4zpjuqZIrm7Qz6ScM2SJZrAuuWI7qO/c+Xrrra/cNtJlyqCtm9IdbuKy0f1tNgqx01vbU9NNkJFHneFtyqJDLj/o0HBPCiJGgKO0dC7Z9q1fti9cMMThdtwPUgt2NBt+6o5mo045dnQHETBdhvL+JT2OcM90ZgY02PbqIRTKQJYUFftN9uLZvA5ck/OqOMTbN79r/37MNBEiCF6aMy2ZPHxlTyIp+Lvzzo+LUGmf/JHTyZWbPaaDfDc7bRHadLaE0dqYk+QccsxJLFH0TmDKWpFvVqU/AX51p+CKnn0nSNlsjpjOUC1CrmkwbD1X1iXUGdI90pxLC7QPepFMsdJImjFsyYGwNkDZvkSZvmzeZ+cefIybJFLdzkTSNPqjgrjvMwTwrRXlrDskhpJzyW1/+3v7+peGKHCWYtFfyyFx0bdgv879QXNTNGCn05rGdqW1/ilju7a8MdMprEpsA17OoKagC0g/O96s6PlDHhrv/sS0GCBkDe7KAUFWmijUmXrCX52RuaFX3oUL/HPdzBm+l3juarPSZ2ozF15thkckuXFEQJ8OvacXYBv6q6GayrkcUdeeDYkZnA38Gjna0XHDt94hr5PEGRiuiG8maRaa8RFDQIqoxNAhK3STfNI+KRmi2++9uf0ZotOlwJbRqEJNGKcghK8pSd8SWMRwkREJRhqwPb8JdwxaRqDrQ39e2+uQQPGA7o5eZnbf1MxK6NIUB0ZlGgDd0PdlpktbpqHIq5puRn6GobYM55dORt6I20esSsuNfaAMDSrTRdhL4vUOzc+vAk1DmT2hhP4zfJbsriOz27B7GbOBcbYurrKf0fENsHZ274CWL2fjkNHpRZe3SjyPjVa8ta4sarLWkFk5Fs3YVVwdhdUoY0Y71XrpLpXUKIoZJdQonkbfdPQ0o5tldD6j5xn17tk6mKlolCGtY3VRg1yV5SUVoIw24qoiL6mHuOLdSvUXqAUZgZsRsy8U144oNBLwueLTiistpJ4j3qw40RLkefLH8Hnh7o5wMHKBhYJlxpoFP497O2xS88bnctYs27IM6wUMz+Ukmns8n/10i6rDRTqNyEe4EnenXN39uxNT162uCanb9aOxce19ZkQdcYw33qAqtTf2vrSxq5yfX+5T4yN9M8XCwhz8nR4e7PcG1NiR3tF+NX14oGekr1pqNpZm8Xf8pFAF/o0vzY4P9qjm0uzIjFqFAvwN/sUxEKgjkaXZcNn3FuFvFIW+N9K3p4T3LCz2q+Lcapqf79tTHVz20lksqcxVigtz5fn+Wr+KoF6zMdsHtWuVYgFbLFCtCvRjoEcN9KSz6mBFQeeOjqvRsXE1Mo4A4Gy5WhhVhRF1FB5gAj6vjfStThyF70fHeieHpsIldfC18b56PNg/CtUny+pgSZVLqice7i/NTB+Gv4O9cMcI1O8fyufVq4vqcDcXqwKZXzx2UWAjKywafPexU0oOQOjthxmmiB/dKLLzz9bFB5hZ6sH72zdukF8f0StGccEYc9j7odZ0XCEoGkqO1NEYX8tJWNHHX21//zHPWKaB8EHCMZp47FtrCnStTtERNRFZqU7KPh/U3eRojaJJFLh9k9IQMQEPVedqliSjNuJ3t2OormBGb+5X+/Tb3C+ho/tFmSu8gL0x+HtRQl7RykYQnxFbsmGL3b7zYfuDdxkarZIrhTrOhipSR/gr9cOhwMPDBLgbRMB0oixmkDTyYH9TFAf+otEf1lHSsQnh6tbx209+p9DnUgzqqZwGYEIXLxAgWgIw0LDuWrqiz7+Ir3O/6LgvqJ/TGcr9RoCAuZdzfhWzeXBapCqJTr9SwEADBqev+ZTpTVzQq+wPJ7awne+Pb53/ks1hGJ0DcptTS/omvt5bpYj4HDcn+giX22bYZ9iExmfb+FVS65iW4jJm1pH2nGfxSMsubN5ssGhl8qFo34WgIU9xnWivsysxtUXRZw+3PruDyKHnvyS8CB+thehgJ/EHIUKbe0mDn4ROe0wJtsRes2s5NGWJvlXFJvA1nv+y/e1FULieXjrfvvUOKxNIOdcgNEhGIsM0ZBh7hadzMadwp6IwRzBMuGnXqzsVmbd96Ur7A1TL6l6Ui2JUsholz6Wn9T/nAvdStPZE0RGz5gcge96D6cJjbIhZC+fmNxUKSsNowRL7sUQeqH8Sp2ZKA1yJuFdH2MoCLgmaiOeutD/+bOv8ta3PCc7Ih/lcoBFOtEJZ9As5aYSDQYteuakPeIhWWZ+2Apl7J2UcEzy2DY3TM1SCqY44s3iaxZaEGp+dUXiSLY3YXfLnGgK7Ee6RBCptXfyx/dE1DlQC5XrZ99dsrFKGqrYQZ4gay7Wh7JcNbAuRfnLvBwZv0dTNIAshzxqzO0oYdYvJauUWCaI+TKSMMVtXTN0e6tUmPJOs6lCfrerZrtQw7yI8UkovI/Fbnrn46yyhpuM7Zi37bpPclyjfS/v79zCICfXma08enmGTHB4d+oi+FMkBIiYh3bxL6XWpIdqCwKKAtd1Ea1NLUjtcRn/TCxWnIRzFbz5u/3Gam2AbS1KGNb6WMy05M9bLMjc9abtwNmGdfEQAvI0aOEMG+QRmWQdzM1NVJq2XXRG0aPlSnoTlw0ZHO0/uvQtLwjSlZ7RukhdzlWITcRGnrP+2bMHmlVrGXvznJ2x6XOtY4JzW5sEF4kayzGG8MMbKb8gZTC3OS74Svyqmbr+JYXi5Fl9iEjvnfWjaVx/x+2CqxRhYNKZ/Q+oSLANSmGJaBMNXrlNJFd8Q2cfzUg4YcGsPU5MQfVuo3kznLKqvpkAJrr+Pa2EPR6cHXFwpRM0kr324keXR0Js22I0bmB6MPbdD2j1WynFbmpvkN6/Ae4v4aIsuWG2HDYohBXsUpoDzr9nwpnMi6u0c4crTu+eI/cGdIxnyMkV0I4bpSWOilAR+6W8erH48TuRR9mnTnRlkHInMIKMtzRnkIBl0BtnoCEh32pWpCSU5J/q25zTpTAvScZDa1IRWEXLcSqbTEYEN66O/VR8ticJDb6TSX2GgaOz56BpzT6CUJs3KjOVZtsOW8mSnKOUWOrptGjLd5pYcYa2by3Q9wYRzwJwbIWGTmePPMC4km9fF9+h4akSMnIPCdpLYtixCtKr58/YslPvrPEfidXsOpxFXqtsnYanOjWWkumnTfRjYAmMiYSt7TMxF6jfQYkjoMrijyMgfNHJoEUR0mzNWCnW+EWxjZvdMaiQum6Q3YtpxJtL7HRMJ23KfQHYsdgE0w8z0R+tKdvrfO5bhMfGYM/3t6mXCXVYvNdGxdk0jZulyK9mli5vs7uY/s5FzvuG2CxW+7z82my1nV2S2RNn9kNkLmY2Q2b/I3iWzbzF7FtmwiNdUkb2minpzwbsKHi9X+2Y9I6PUu3p850bBVtW1su/fvHW7Au3S0EvBmfhmtrvz3HmN9t0ZdVJUU6OUutpop/L4TLXRKHVWnXMImJpa6WJ9S5Qtq2eJhmXtlqzoGBWnq2KTfaSMVrFLdTF6BCsP1s4pEjyjETgStp8UZ/3NlZ9GbO6Sl9NGWE6/UFJ2CK9pI7fmXGllBJWRUp3yY1KLjhFXahiB4UiLTvbNNYWVjmX4tWHULpfu5JgzHA+KhkGHORq+aJniLkYlD9s84nImw5QMR9ptBvRrwQya6lpef6cFMPuTMf7tqiF2v2y5MfnteYbJDx0N3ngD7i6+seelrX218tIsfmI/v4ifcLkwPzjQP9dIK1X8vgBfsLxU9BbgMphQWIo1FjbSysJGo4LfsQw/LbgTryP41OG6HhbmgcBerA33plFtaTaA7604vxiUvIVweX6gFfvwvbgQ1crYi1n47gGtuKSgH/ugdOnIyOHe0eGhvuVQ7a2qngk12KvwemhCHe3vVfVZ1RfPqSFENleHe8uRGpnAuoujanFRledVMqsGpxVUWJ9T40eA1lDfnhk13LdeVeUjUDLSO9C/tKKqoRrsH6ionh41NjiwMq+OQiPj2PjUxgxip3ex+qE3c8Ib7zhYZTQGKaF9N0xcnBUYH322kYu0K0cVoz1wne+8c2rn9J322xe2fkWYi3qA8X5IR8cgAKm/IWgBqftEGK56+FQnzJL65JKhg8gFlo5fRm9sv6idpMsBXCPaScEpxaCLMuft3ryGMDvEqb453v76/M47P2//hF6vaRjCPo7qW8IciO8QJbu5pmDqcnu2LvAgkGOke/sbUcyx51AmRQUpQkqgXdKR1IYxO73z8863Z7e+Off0FIVtgNoVYYCEeO9qiuRrHjJdJkjqgg9sOJSN5Xou0wBK8QePDXmOkIFh9sQA0AiSeNUr5TQmmLm0j00uB+wWRKGe6+Qtz51++jUamrZufN3+7OLWxWN2VISQeOMXJGuu/Giy1xnqNusIEzW5R7iGTcHbiNCVGZ47Bn5OwLZYFGaLKBcgJQ5n09jNmsBrcEbArYvo/wYCq32Sc9BjNcb7yXe0QvmZMo14XLB5A0+C2ESNc3XrrQ+f3HsIO1Odlskht9EM2Y2jUW8mdPCI4ffdChkDRKO0fMLgG3RuefJu+/dj28dvb3/6K20dG8FaSm1IME7ihYWcXlbuhYxxSL6oKzLVPrm09etJvaosFTyfx824NjniZWzsjWhqlCiV9rcXnz78yKjGy4m2FCdlP8LZTnOUq8sVI4rA/5rG00tfb335OZOBAUstFa/hiXtakpDp2tuIyI7Px99BIUBolkQUuDUyYfPUF1P4xQvte+/DtGdrOOpZFE+1GgapWU/Uhof4tf8t1yFehxidTdzjPvaWDsra9889/eQ3imbwE/L5MZTihP2eQp/Pp5OYM+aFQeQZOK5rZO1htfT9U1unP+ZFjke8ObPG483vgwIGTyV8Fr0hV3wejccrDzjX8Ec7v91lx8pyDn3PbPYETPsMDFCAGNCjLUnI9NSJDkNeiallEITPQPCBPzOPSBEsJlozOH+rXiEFSolX2Hyw+T2zbh93FlSyofOikkJ4l8KY7n62/eBrOpwvN1OHFPbOSwM0oBk4DLp0cJwEeKn94UcMvEToTS0TygCSfiMKCrASk80rujp6ItDKv4xeo/x8f/7IMH73vmtfvINs+/gdxhbyLLUYs34xHhRPWb4KNafGvmA2K1JfkMb5R9sPbhNHCCrAX6AC02FIKRRw5BfAgFIxX+F5N6bpBEX7QV0/3tOTH++cfWvnoyv8kMCW1xxwKaGHoES+uH/g0mpJ77QviXSQkl7jBS8t7mf74/eRmfICo95i+BfoWaHG9wPKxo7O9HdZ1fWCJ3u60GJjuiXkpXEi21YSTnQdoVM5ogDpWDDB/bGTD2YKGvc45gIxgHgGwrzZ/vkdRn1G5E0XEogoe4Ix5HyHN13GBKG1LNntj+5sn/nREPSxBlIV5xU/ycXrVJ++A7urJ/CCdKARwwZuXqFJtP3Lj4SZcIq83ilXXOi1Ygm8WseurDYrjLfj4cogB6xQHLDkmYEsO1/Jk/7yoyAC5ZikRFiFMENrHgJMBuXNK3SYTsLHq/Xowgnhx6Z/T6/8+vThW7R0y149t4YQMy2NOkPkgnWYgAw+E0gB7WgpE92/f9zAWKaCfjVMFNPSff9V+9QDmkdIHSGTHNpeFWapBBYXJNqYihgmDLhDunmFM4DVCRLsAfsC3cJI4+tf4Mj7CAhXhjpxJ8W4QKmjHIJxjfQOgvsu06YaWepPx7eun2coRLTkWVqwZ/dXMRCjjzfweHGdbL8Ym/HXRYKcef+37YePiS2gyuULW+C7N5qhqbkhhheUylwVpTFVJQHqVgZlGs/p0r+hmzuwq1TjdMEMLGIOs0bEh2v3aRfWwgzBxJpRQXl64nj78fc737+z9dZXWkSDqICBKjngXxHofxb+C7bl1wuxcOEW6c85LfhxiH55D7RoFvykXfromquxwDD+toaPqBdW9ZkLy11TekEV/SRLhkeKqLiDZgjAsFFtHjaq3s0wJRsR0kMS2HLSjNJF7jbB7BEy2wOtwUvqDdGJtRLECxB1YtaDXCXeKO9+mli1HRkhOoVy7t2HH22d/5gVda3iamXV0WuNOmt+y2iXrl5p3OaQUWqziqCjkWUlq0+yAsljy3ot67KuRijezKyG6QS+Rv1CDVirX1nNi/DbvJCT4ZACxNpPh9rD6o4dXtFweGRZwzHKTY00EQY6k2+dOoijfVhtwUNBLyLe1hG5LkyUhLqV50aUaykulTSaI1dikWulrStknTpmqIwgzUo9EUPuILDg4VaMGONGWNY4YiYjFlyZ4IgDYd8O43YHT0sn6eFbZILrZM+WiWaqMvuUgWcO2sE7NfNzusqcj7tKzM+yPdlwyB89IAJEyOuNgQg144mFYzBqWJLp3F3nDRO3yPIJ7aCGq6pvl1uaLrXOaM592gVNFxkr1OvP8DujlfvG6y9rf9q/Mj+TRIXWcrnUF3hzswuHVuarM4NTK/NJoW89v/D/tvatzU1c2aJ/Rfd8SdWeTB0whEzOl1N+v1+An1W3qLbUktpudctqybZ8a6pCGAKEIYSEvIAkkAkJZDCQkEmwCVB1PLfyRyzb/Iu7XvvRkkyYc09ViKWt3mvt3o/12usBTRPw+7HZk5NqrF/15bvHe8sKnz4+OTqGf/Hf8szh7OybR2a6hyudKs53D5fnjtXn4YehDgAGf7vLKjzZ11VW6wBwuLenv7SU7y50A9C+KDc/F837cwCj0n1obTaYnuqJ/O65KOfPH1pb6AK4y+uBNwX/pjvCxb7+sZHO2uTokR7VUzs+2jPUtQ7wglj1n4D245NzCXwa6yyO9/Z0lbJTari/GKuRSK2XVH8hVkdKaiarim9NKn9UjVZVth9fKw8DKY4P98C/3hK80MTQdEmthghppJ3VqYQRVJjedfvWCgo5fpnszdQccdbXKmU91OXIkXAk7KJBZJO8x794tv/0ye7VZ0gREkzFGWT8Ja/quHUVApB8GCwwGNL+3LYUKvYTIiHrbjnTDmHj8sXdGxddtDkM189nXOxa5YxAIMKIDpBBPJYTqaWICcgTKl5F2IjbUu0/bRXhDNFSIIXMWZslKrNLuu6F3R9vYT1Aspjsbny983irceHS3vX7jfMPWcssYtHvCmbsTHQlJ9DKMUWtOx7K7MWuXmZQA6lLeBoUaLPLdOf0kkHxBT0MqnH+HHqjtwyKruzjxB0UOmnBGaqijwRmJmF1ULdiOGIoP3G1wR8xWeo9joKjUFtx5sLhUpl7slA9P7f/4OPGwy+kYtPDK/vnSHn2SUBbxStQTNltI/ua8MchFZdC/C5ysTWkBpBCzM6FjNtgrVeqTQgr5RIlf0K7ZRxktx8J+8H2QH6A9pibBdH2VsWsAqm3jxvfvsMzLTlma5ghHWMngqRmxJoEjpuXqVE2fQexueYFJGGYcVFzvT2qsLO9gRLzh5Sa7ia7jctoCjpjnb6dfRfLPT//Cl3obv6CdwswvmdvN85c5pjkMFN6bTCjR6nzFsflUsAV74se5y7mFvhO7ub36KZZy6Lbj8jE8KRx9hFs/sZHnFcca7dhMCx2sfUf0d5YrmVj1HXxlQFHCoEuA3WvzoYakM4XuFQKmvSeXGycJ2/zIFOtxQuYH0yjSR8lcmPRp4h9WmJxKXCH7o5bC3XoI5lJXqt6tjgabMSMBk06HUihVYog0dDxHShBXhHJxPZNCof44Ds4eUAIXrzzNxoKFqXUGDjpQZazGr8eYqYSsq1t380FK2GMx+t1TrRUDmuy9GxeoxJQP3JGcZ3M5N3G889ghV9c/dxm34oLlTifGczkYGCSh8WisaAzr/OSWoi8ngaWrCdBMWtZxcyLtkAZCKB4825mWVwg0Uh9fSnjVi6j2sXX9t95YEqY+ZUaFk7Mu3Nei1cyNR/zChMiydB/t+JRZUSK9624/s4OMpmSX68JGpoMENVWYSo0Kt4rNWA4UQYT0i9yDnSMZ6vWgJ9RxIBX8cnjMaqhxbLdE7+9nyd/YTkFmJ0ZNUdkA48+brz3JR6GB5t7T74giXgVj08dmJn0Z7HOEz2YKxY2jYmdvPEBntlMy5hEjwDBeN1Qv7sR1aulkhxm0vdufIUzDjzg8oOdx5dk6mtAAnnaMzxAe1IxrRbfEvwnYsav8HKT//VcDEh8S/DP63QZDJRl8/zu2+9zdfKqHM5V8SLAaPIUQPEMxtrwyUsgZ1y3YBeN8Qq2/sAphNr1D7fifxqfDXTNOQBR+vrc4Gl1AWQ85v6DfQsJzfYWzCGBhgWUWldXvjb1lZp7AgdAMgjsRNIZytcslrepCXcpkYKcMznKnn++984m5yWrAyvBxGrVimHYOFG1WFKAYawOqV0ED6UHVNnFVUDujVLA+dLIwCdhCXRfF8X/1JidOjgeesE7APmrARhs3wnT8PZ+emDggQ4Cq+YCxIsV3lxFz3iaE33z8JTCr0TbgDLvfnGbCRt6uSJXEspmIHAty7iEAvDrusVbSO3JjEBlkGZXMnjem3C6MF8BI3EKndEZK3JYFRY/1ie8qFV4opmPxDLw2QMeLLMPObGaFmM8V5ih4mkZC5zms+LXsmhWDRH89kaiNcF7izR8wYPDf/bp/v2HWBuQsOkgMMxpOZhxsUqhOXLfZb4q/rXVINl+VCbPa+vNm2CiBJBl+BVZHXTcemlFfvsAc/beXKLaTNubiyTNcDlGzkgSYW4I4/cLM7v/j1/2blyEo9W4fJvEup92nj1/cWvLOAMvxfDGeOiQqDklqA2/TbBYk5dmt6lBprntSwZleG+bsWgO3DQKZG7Mwrywla/BlNbKNV1KmLgbnKoK3ZjmLHfb+8vPjacfpbkbFtPLwnnQYkuUQhNHzQgmTPWmrQUHiZQyfXyJcdCbRE3QK14ZYyqogg5eKcIsRqQtmh1B4mUlQNqDiTR1ruLEr7ADrWRBloJcG3W+zybLGdZxhdXdf/4+ECUyyceLVN4AjlCIEeOV13QiYArB0ZUjCVMUrPwRZTVgqaYaocQfmarueBvSOiYYRWosEm28QWbv3Xfu8Hh2P/35xTWd1aOOKWNaR0W16j04lQt4HjApi8i5XLXe/FLHded29N24s8qShFPB/sXXn7349D6qlKki9hqAMOwSlrxsizAWaYPuf34HLVqv8CjeWnURN87eadz/K+0yZF/NqLV/Qhlr0S+AdMQlHG0z2tepneoGopvKMhO3f16vy3bef/ALbrjNryRnKOpkgIBWPJ13I4VDZ95IY6DcG/y/JiwPv8bsGw4iSb2hEbW1eruGkCYLiDZKcAGXTESFLkVd+fXm3k/fsa7SantImR1SFgdHiecQPop3IX1958l7+88pdZurpKd0c6MQp3Rfo++mdd1Sjcqm0TUO65ZpVVOr0Tph3+PHe2e/cxRawy25jNZawFE7riL3Ul3rAM0tpbMxtxKXDtQcyJ8jrUOBZObrDMuuvpRWkVzNyFGISphm1KGRSMhYlYn0JODlNbsd3L8mUYWuFiFRlOLs2UY8JzGctQIgqY13HxllQFQyLRW/uoSdknU9ynaLLjw8W3i4AcyyCKO/D8iIpCkJ0myoWMeYpMUwLYOl5MNsDelAzcqdktswLRH+5bnb28huVuriv9wp2L5ZW2KEjed/t/JakyhFWrkr4dypLXNym/Vm9XPv1v3djb8Z9bNFuEFwaJ8LmYBZCU048gZbJ5pkk8sfwOYwrL+J4xsWnGbuKZZrmG2a0ZJZUgfE6S11D13olpBtI+qHVxv3gUJc4sqIzbwoMWRf9qj+Gm1v4S5tZgMu7aciumlO4xLgJsKbJrcuoW2hsDagPUiA+5bXeuHAlUpt7g7aPeEGtbftb8PaW3829wt/OjCuXTr5p05Rr+ypP73qZUO1EgXr/b0nVxZncmF24Uh2oTqmji4XC/Ml3xvonTw2ptaW1LFD/b1jI10TC/AY9lhYW5zJzyajXWoVvs1NT9VWq1FQmB/uU5PHVQwNZfi3CtLUYYCyMD2gyv3q5KQ6cUJ1TKr6pOqfVgtrKwhroGO5MN+xXJyfqs3OHy55A2uA4+iRcAH+ZQ+X/AEYS74cT03X8n5lEnstxlNdi2oOsPhD3bNjanKoe3JMHf9Dpzoxpuq96sRQ99FudbKnc3xSdfSo4aHu0fHRoYFJNdQ9PnxsUq31qrVQDQ11//txBb8Md0/09XT2Taj+3vkRtd4zoQZ6e+AneLJzvQu+9Y8toIdtT6+CVnh+aGxkCH4b7BmZVH3t8j3mYHLRST7r6eA0JNhkl0Drfs7PYoFUFjyB7hHV4yO/USsaDd8lAjtbFxvXv2QyaOgA0BU4DqyxGfV+Q9sQxHbw34Zerrlwa+aN6F1k9Cg1IvRHiIx+ILUtZkaIgqlITmRdo2Lg/zydF9yblB6NXfPPnIUxIKW7+lXj8hVUHh/+IBGnfuSXy1jxEYYCI/J18W8vCWKsN5YaiYcCghfqyd3gVrkXr2cscbVjE3315i+ADxDzUPS1B5FEFylSNEdYpe9GODXXLeYaBieXr1XolsW5TWGgQr9ZWrNQmSkbuCmrnWurs1a6FDgyJ1tLJ97IGDunOxGbnESFXh0mXCTmJsaSoby9BwPRa2kg8eqxQcaBRTZBYZTkK2K+kSpN/yPtWlsqEAle6YLivIdXZLfZVLF/n+OxEzZUtGXETUaPJmOHY+awb4kGzDyojAkmxOaLhBoc3ETqfRbRkBks1EjrJSsgC2zrZDy/w+XG5OoNB//bh3i7tEWZj05fgz2AE0N7AK81vrzR+PYdMVlFcS5TfS3KwWIPZvKBtTL5ZXLWrhrFSDdubyzonUFXK3iBAsqDbI7G+Ye7Z+ztQC1G4ybBZ0UvF2QpBhVfsJezXXOTL+9mhUj0KaI3okItMpH3r4FECOD3yYZAJ5T7AxJ/Bd+C8axYhQ5LFvpagcNrN3b6lwHjFdt3p3nAEa6rABLLQ8EnmV5PAd0xpV7fjFBenobGFU6CCpZhfS1KbAlQTALoTCl818DsAgowXi8GBgNbcCGJGTVJ4nx6s6BRFbZKLY+7JK7zRiE7kTZbNG2Pnac32Xbhbgwyv8I0VPxVuyvwcMD+5jy4WjvHExt5C9wYifS6fTOi9HNoUWf59cU7f2vcuCMiV8XnPYHghboDAc2bWanzNyI9aEzSI9fU+vwVHrGo9yWemFVQGcXnhu9A0ruXlRR3pLLLUO6Vcd6/BqKuHmQtEbhOag6aaszPYUylvKk2kZaj/QPNQvbQv/9k51dQgS6Zc8/8kl4dOJmwzLsMVtteyC6OBpZMPEbME8tKmMVjM/kHn/IMOMZyguleNd3S66QJsXuzF9lrJ76FweklJHQRh5rjg03cFJ894Ls4FvpxQoKMoakydBr0Bt7YIuTmMbvjlYtIhGJJX8Vfx9pfAaq2ObNeWDLdz8LhAHpT8Rfwl0jTPIf+B/88XeBs/3oRT19jPrD/4HZj66ogJasFEzpb/ZCid9Nosf5sM0o+mM144HS6GIj0pMHTy2HpHrOzEa5nyVzzu+gt5L4FbyCeN/sCq6ZEkFgP/FIKh9MaSawH3w3z0OlemMGSUSEFtWJErcAzRBT0Lp/lRjk6jjBlBs3SkxmxFpxeizRkyrEXwdlOQzbNAvv/XtJVnrc38Er+xdsIcf8WVf0E5cMByRq3+8K4oDnME8Dg+QG/ZB7B+aHfx7gEgkuodjbfN1QKODE6E3hZPTtZeYdqsIJhHDWDIg5TjUwQcDm3yGjPRPYymjKey0KWQ7/YCjbnV2DSYdfELmiM2MBipho05SUscNlYTpjLQ39+a+/6492Pvza7BVNoh8w1PI2EY1AYRcg1x3SbxQDvvb2xKCsgqaa23m1cfg8N3Bt81eWtOnCtcK7X9FHQfrO4gqnI2lowtbslJxUMvQBrndhtTd9Ch/OSGzW//ovTH+19dZvfnWqcuHDM9hJQTdsNa+nRUSRD6ybv5Ds7T2/s/+MXhqg3XeLHuWaHj7F/yYYHJKfqlTQszbEC9usYo6uNhLdm6g21TU6/JXMT/aIAiIWeNn4iiW2rygaSXE6klPxoyObzM7sXz+J70xvXK/qc5dqbebFkk9YqW/RIJxqOjBoSCufqiSn9LaUtuZqh0QYdHYiFo7rxN2NabJ6xnMkYubQfi2Fvhqs5+kGLMa1JDXClfyu7p2QMVzJ2d7rZ444cHKPvnu7o/04nI446suPvIdKSYsmrGHEtos+Rc4llbq4EkZbIgtgcF1+flAP6aAkJHje7Dqt2vRyP1yRAJC8fmMgLTdw6zadbWHRKAkixZoATHMSULT+zvNflj3gZqbtm6vHKS7tZTu0yJcso2PlEhnvmaQpdVksRDj+wVPqgnkKTdYeX7kVdKtZ5VriJmXdN8V7yTIpEiJ2yI4NWQTJLRa02ypZfjX2yXT+xTbb8ZOySb7a3S3acOuX0yJ5685UD8ONwZUKt5ec6lovebFCYqU2o9Wo5WvQXjmHLVKfyJtX66iH4sLqcy85Pd06rjhlVWVmGlkPr/kJlDR47MqOOrJejFeg2Px1PqpXZ1d5ZtX5kvRodKr0Zwt/yoTfjED7Hq4Ak8Rc6JlVhZjk7qfyOTjUziVhm5rzZSXVsba7bU8niAjRWAF8lNz+dLPrzy8XZuWl8tlMt5P8dOhxXXg2GuLoUFLLzI51qmX6bKqqpSTVYVN0nR1VvQRUGVF/P+Chm5DxUUG9NqBOjqnNsfLh/eUr1nlDdE2qsCz6O9U4o+DNwAhsnesYHu3q74bc/dKs3utXkQJfq76nPqPUZAtbV3XFcdXapvoJ6o09N1kfVcE/fuKoBlm7AkIwikr7uvDo+qrr7JtXwmDreqcY61SiMYmJMDf5hQkZyvI1NEx2iPDIye+QFJfXRyDaEmclAWzO/IV/iYmkotSbpixH2OKRqaVZR46uSxu2nuzfeNroasMAa3pRXqyBE5V4TwojJEYFDkJCdoBmHlUFpqBUkQ5rYRBxPrDOPrPWnyp5CBigJ8ghN64AWnF/VDmtO7HpR9EATuY4kh1RB7YSUM7cZQOjYWJCaMq/ukZ9J61xp25WdJ61zogVL5ohwwXjN7GhsrG9WgjxKHGzfiUjkBgKY5xAVFGeAp9bIAfdepB00QKj5y/PG/dPaFzPiknoVAD6oZ97ME0F2JmnUTrmZ7ua5HjSJrzHHlx9KpZoK1hLCWF5qYI8nciHxsfJWlQPucX6f3Nt58oncGGXC8LW6kTVuhVRMhROAMmAxjKByw2lBGTz5KRjjSBrNi3N/FSuJi4xsJVi/ugkhbXpJG8TI3Jb2eESITOMRDwIHj28sHj7HtsinjFfXcilZS5vgNs4/RB8jFyiIoRaeo+uj+ufxPN0S3uvxBKE9AkVxzslL84K2iNPX0D319qbRgxGs8HJaMZlnz5l823bA1LdOO2NIzYWry9vB++nBh3SoXjZ2Xk1n7KJGhPEKlyrnsRq4/gr+YuDytsT7kzRw9Mm7/qWBD1xwwQzcOAmADhvwsDV5YR8eQep4z2mvXIe+7GxdBHnB0Bef8nUSBn3kabQGdMJf220VoSNmmzBA3iOGfuA8Bz7aTOiMa0+v5ukVuq2nV4iGnt5BszECPhICjPaF7AoQ3abbbovWU9J6RAa1aB2gVTGirC1MULCWVlUGrEMP2MyD7im/fVB3TjyHGsAb7D253PjlR3Po0USGTror9sgn2nUUxfmVwKE05hf4i80RKUbiV0qZJw2+xvPPG8/OGzTkXEqGZRcTVlSqEjGh0CKqr0RfOdaIkwCTnxeJlQ5d+fSn3U+xBrA9/1hmSd5EE4GcToRBepb2WbHN8haIsKjTIZAVQlZog+xkLt7Gs7N7Gxdgpfau/4QeBY6tlewU+g31CNgT05ji9cYV/0tqT/QcardL3rrsTimMltwmNWyzfWG/YbIYDRh3WMxNCe6Mk44B5yMxhzDsnee3Gg9P4+wR+BBdkmXqjI9cDuOIfPYkiAukP6b22a3I2WY20OH8w92Lz3mLmXMioO1BkU1Vs/RTVsIvOqeEg5Y2l1OHZP/5ucb7T9xDoqdl0Pr2YUyIyx6xLWLFP8UcyaaLK51ijHhBCEfR5YrosWE3LToxNuGIuKydhu6H9nrPHD++1WOglLQtmwKbxKA4YDpHDOKSTNwgkoZOA04+SkrB9h3YK5RQx25NnP3bTxvfnGuce9fKlTnM1QBotKqNU2EB8tTY762zYubezIqdeweu5Fq30Tb4XY/Zpr+VO2gcKmW8ZV9mOrrJa2KfOsjV7KWmrrq3FFsQ9Ja83p6zBXRLmw3QtPiWN+NlczFx1t0Fy4vupdfcXW+GI4ttITnj81vGx3z4pcNzNmaima87Ot8ZnbD1NoNL7UQLZ/tv6yAIu9Qq2n6ETURUOBkwhdLkxONaWO2DTfRSf/CTkCy6wnEcnZDqZiPMCZX2QsZ2kHIrJCPYUC1Ol7p9a5XzO9EsGN0Ai4a/fxcTWcNcEDqqVhUsuQh99DRM/B7tYezB4aEST2x4pasoSmGPdlcYvRgiE4y4s6uEEYC9ZoXq8i29Ok1nxDkgBKqdRVOrdXn3go9tQ0lcqcaJtfM4J9wRd1PqXN5KRAJke6uq+wvJ1zKQVZ+4JxFhbZaqm04aocZmFBqjzuBV7Io7SNlbjkLh6hG23AD11ZbPl7yileatCO9lPHPgHOnUiNOOFG1FZ+rE5yDdx4zSlI23siVmlFk5YA4dGZJD4bR57oDps0Lc9vdVwzKE77eKak0SWlo0I4HJ7Bm/FYZIqxqG7EYjkrgHO2kaggji3JUlZkfcICNyjfPIprs5GA26QWun1S8MZ0szSNIAHK33swcOv029LnYyrxsnbl/ryWi50mvmopvsvMbxUaNp3D/DNvVA24R5Y1nG0PQ8bStLuvEqQnfQW8p9nt/BUFMnzEGHVtwzJBMf51muOPspYf2hHp8wT+v35JdMExXHV/MgC+hB9s8DrZ8H2T6PHeyTaQyfx17V8HmoHnj6n7dWXvKOHV7IT036qpJT3rEjC29Ae5Sbn3jjUOCVl8ZX47A4Dt9XAzU81DeGX/2ZwVH4t5BV0H5ySB1dWxoM1Go1LC7n5kuTE+NDq9W4uFae71EhfBvrUW8cqnvQFs7B1/GOqb7KzGDfynI0j98B/xH4PYDvuSx87+1Rg+OqOKJm/MFZ+NQZhmpoXA3Oq/GO/EyPGhsdqPSpaRzM6MBYTmXnJsbnJsfXswDs+OhA7eTxsYGe7q5Of1gdLap6UR0uquG+0kSXSir+zPGx0ZFuBT8f6YP3GfaV35lMq6EetTiHrYMTqr+nq7OnuxOG0bUUYgGjN7vbZiANstH29zm8EsZaz5zFBht9aZOm7S2+3MNoKfa8Rub38yO0hV26v//gNNcc4l5VLH6jD/D2d3DwgYai+zhLAwgdWwzsTUpqjbLZ9q185p8fkcf87qM7IJ/tbF7e+3WLjj8md6pCPwtdRpwhLLxZGWiGsGg/7Dt5Gjoq5Y8WMM8Mm4DefXGGcoN98pfGs/uCAWNaKn7Bk9AUjQDr8FWIhsAxLFB+AjN4AZnBoCfM8kt5NQlm4+zt3as/ixkuClzAfqq8E3L25pJPxSzV8zYFn3D0W+uUGIMOGZd8wvH//KhxFvMq1avSG7qTsODoyJj6qEpnnRIvBNkgj1feuiKxoyk342FV2cVD8rZFkPjb/whgNkCABr24tL0VBZIQUbcmWESxxhJJlmtBb28RTbp3a/fjh7uf3tTu3F4WO9TkeYa+jibPFOQstbwaVFYOXIhUlAlmmuIq2FYjX7M2e544/r84dxlAcSgDTC93MesnkRloDyjI8iGUjHzXoChLB0BqfPMdr5L0w5I1WpKSEqfSE+UprpLK3+nlQFrOZUh3lij0jx82vrkGQCUEHZPALnpUdH0lBdZzIVKCohQ8F5QLxzBRWgGyaK9vb+XMClDpJaDGcU6WgCKkpErhvVuNczelBDItQeSva38EAqOLbBEAXWbrVk7KfO1e+IijcahbxtPBNLHsZCxU+bo0OIuHwSh4VgrRbx9yfN0XL85d2X37CWoUUQ1kxgz1ccCRoMwfI3HX/bFgADTO/sC95QlTJDcoOYHN/I32UTXg+SZzjEQWXXpPKv95q82Fxv571coiz8KR4920p8UU1nZr27PO25IPuD7XGPFDM/X/uc1luu0ml8D1gKgaBh1lYiFxtBGRpxS0zw37p35zbff6T+i6Rl6llAG1DrQrLJvEbkLRNCCb040Hg1W59HjoAJvOCRZWS6gYKwuy8tWz1UVhN0tx0XNESKi+Gho0df0zIUwGhpAlASIHwpwFcxBcGHEpoHzJsY3HCm1UXKJTP6Pp+OEVzvjMYX7WlmQslJEOsncaDDiduteorgJ298b13RtfIQ8n4Dm/mvXLaz4nznGc1vBVvRznj21ukKFiqUs2/XNNWQxM/Pk9jOf++T3tooYpUfEDLyBd5/Gw8bN+he2tOr8+WRreBzis7VRtVzyAteU24Wh8eco0ZO+dTSnLGwDvD6tVnasv+6oduZNQH7wsqKJWh1slwpBcu3GiWgbdP6VY7nImtYMuXDKbCCNDaSOtSnrJhAdjjgUNqE6feVoL4vyELnQ8qY2nH+1df4weVeiDXzU15vA4sGcXnzTJd6jb6MDpzSW14X9kP06dD+/b0y/OyUawHaugNjWxgsSj203mLZGlNiElUcF4UYfVOJKFEcSEVBDdYTGMzygLFkUmQokU6/iduEXZfT+ClMQM7UcOM4fzcv4TJCHnP9G7D9NF6xIg5A+W0zBp+zE83H0ISDbfN9f05jNd9WKlyJdENjDZ4hAGyhxeK5loXkBF8X1wRINEPsOoqHuwfVNfsiAf/t70ja1x1+PqWvLhJVjrGBATp6mU3mBCpIxwmWX8eHEgpArwPztvqBXCOqCUjdEWjCjMayGwcKsSIEcZMF38ygKHW1p53IjhjpQci2AcB/IhJZlagdTKorGVCp2Pfi71mkhPzWumRUOHh/6+UJiSCOVEOLKWK2gZIcuRsBxpyEhCFMGUYwlIiz9WWtGCiNwwknPCrZqkWMVjdPaOeUTep8psQYSLdmKJFUn+hVd3ZQTLiD1Y1oSjWGsoRnEW9cY3X3EWdZcBxwneDZI0qfkuFbfjNGs7W9d1grWXccvQd8LhaxIO7/BJS0B0F5e7opF40bDX/WdnhFBYLiEswnQiGkyPXzbswaHjmoIfeBQ02W+7V5h8yWsA4ZLX0GRQqB9TKb2hSWoyOxrEJRGUDiZUekh6/9NvQmI0E3Kf/+0q11i/tn//sdCWdplB/SBPu2eyNT2o+5OTI7Sph0kU6rYby9EbB2UL1U8vn3rjVQ1Hh9cwUOqkH6nVYn4R/nujFBb8icH+vjfhlxOjk4W8wpZF+PlwLR6vF/MxPHQ0HiskqjrTqYrHVVLzR+N+VV2GUVXg38kTowtZBZBX52bHxwp+NO6X59XCmDrqqcoyiAb50WWVX1TjY729aqSo6qv5N0OVlEJ/sb5aLIW5QVWAjguV5SUP/uaWskG3Go/g+Tf61Mle+NtXH1Vz42NjOXVitDqoTgypod6eQz34/3JJjU2o6WFVDVS1pE6O/nug+n3VPRepNwvqcAGfeQteb2oYnoP/zQ+r2fGjeTUK7wK9sHkSHvHn1NK0euukOgJD7O05elJN9PcdC1T3n7ryC2pwfUpNj6m+Dpiont68OtqnZsfUyFDv8JiaHlUTo+grlx9RHYTxUEH9YQI/w/+7RkfbGZ5YUrDV9Zq/G2mBaBbeARqjDZCuxgeU4oCEDTQKhSZzEfTWJcpi+Sr1BrFssga0//ZZBsG9rUAd1ULvj2vUOyrB5zXfRgWA4r1GtVlIyPvtg7pEBmx8i+fvwqWdJ7eJNPq5WhULV5RMGglsC9Drj0Hb7wL+tw+rrHMybDKHfwWaJwAViPS0CxNoSJmLxqLdVHIOYPrOWjZTq8p3Usnv0dUXkjtMtdD45Yf9c9/vPL354oubnP45U8GgLKlqybk2Yk6Vhgk2NATjxEL92ZSMneslJ8Q4JNmEIov5o41o1pFDHENtwohN9LCXKWIKeh3jS8vHiQExA+c9ysL17Ts7zy6S2G0fxipu23dJGudcH9WYfTFWZYUa33zCC0NiHN75x7r6HT5NubWxBh51zWhXO8yxeq/C8vvup7e5YBf3tpsFe2dij5UJunjL1EkdoKlHBZD0941vGk9/pb2G4cxeU8VyGQJpVDx4FMsk6Se9N9Z1f/x24/K3WkYWQHzpFGLWnojiE/AD2VHQJyKIOEwhw1kguGI1Xog/qtlQlM/P7j/b3PvibTfasYJ+qXj9iN8CyeACy4uaTk6SGLIzD9VfJJf2mk42oYP/KH0tnTjydQyNj/yLM0/h8O08/oaumOMUklLNZHtKI/BMcicppwbUocLV1HaePElB0qzPX7SZozjDBkeK2zRRkm1DtKw8HUAY72/vR5j4IxRrYuPXy7ufbO59d6nx0ff797fYrIimHAcd+jWhowX8t1Di1HQ5KkXADcayhJfSlEOes7J9cKVx+a9sW1jNwIouODOt76xy7oUuTqR72/n8rrm6SmqoNRkg6SryuLvbl5HXaW2plLw2U9lC8gSGTUyxq+hpUNrFCUnDdelvtDgNBFZVmwoi8xGtPZiLy9Tq/B5zF1OtTlzLYtbTU0uHLIFTlrCRcAMISqUa+S85Y7Y72ylorI7JAg+YLkR875ZgJXXHKY+Ld/4gmZoambozT590x4nTBUad3pgxTYycbCgAwlwrMAW3G9lkZsGKMrijdRIdTtGy8/Rj2NwSL4SXEwkSuHqkI2d12jOdHu2AXGhpJVyjMgo4YzETINATD5Q1v5zB+igc6pR4Ecrs2JRIepgK16PmOKWdrS2Q2jlUCaT8GCuNgChZdextvoVFZhOCE3DlZgcSliv59LYBRgYTFxRxmkRqkibEbBLh+BguhvphTuDJNdXt5zuPbwBAic+SdBWJpuM4mpIpi53QYieSmCM1PNG19fgEHI/PMAXO7kqv6pAdj+pp2XwQHNt18xd+RyQAJrqrFCSU6EjyHTlBtybxs+ShoDTPFC+MfuPW60SS/23Yz5zigem/TMo/HgLp18WWndrwdE6qXAxef9aXLBLpdu+WDmfHyxXdUZz2qd4puemHToov15ZJfvmk3KDrnUnskUhn+BSIsQprE1Qd89cHf2XbFxzNxPTEyz+cYblQwPplJblRoNwBGJpbzgjBweF/eWP/4iZTHN6sZXRGcVgyQ2KftFraJu+AIbO8ASOW+WYTI0oDTAKwJ5sEoQ/bA9GE5x1kzW6rrlVjske2NcjYQtXm00tEXp2hv0q100AfxbJ4nq5c4gi4jmjriJ+xiJ9kXMDEoClx0RUVWU7URgwxS8L2oAiOZtHQlQutPCgiksh2lEF8Y5niHD9pnP1ZU/1/5dnIc7JEM2fSEsxmW+GlSXJxpRZHZEnJKZrFOSSXd4shuSkRQksO/FfS/xfsCLDsAHZH9FZYEEas+bFjErL2IOHDwr8cBmyZLzMxwzZbHz2AV1uW58xCahKcl9evbZiMZQjo18MfUyxF8xNL/f3E+Lb65mmtVghFtsTYIPCZhhFYSRKhya1A1EXphToyadekjYo/tfyssdBBZ0JhqIOhC2an4Xy2f8Rra1GJghIcSb8HS/j6IaZj7WxjXGn/lGtnORCONbm0f8RYX44eaH2RjrlTp6Sfd+roq9physXZqd7BzpKaWFL4eXmoT3XEYZCLZn01MK2OH1dH/ZnpaC3MlWaml7IL3vzcoVKYw79zs1P5juU4nlcFeAR7479afGxOjfeoCnwGYH+YV8eOBrkjhwHCoUNrpdzM9HoWnw9zR6JKeXZqZnrOB0gr8LcQdqnVLnWkS+W6FDy3NNfRpea61PTqwvzc6oI3582j+Facmq7QU/Ndyp9ZgGcAb7lLTWA9l+ycGu7p6u7p7poZUeMDvUNdJ0dnR9Tk0EDvMDR2d52cwL8j8A9+xeZjk+NDvV19nb1diisQ1wawCPHQwFqourvUyHB3F0A8MQLd3vJVbl6NjPptbSmcptIaT1KeJKbV9SVhp2rmycaVBPgDc2YBCBwptDKBgZP+hoIB13bXqup7Jp5C9/eDCiYLoGrey3JNWcDUlvwVUzggz4kyv10lM8PWd43Nn3a2rhKHwEeL1XyQd8QT6Zj6QleuWDH+Xk5GsnV17949PRgLgu59yf4Myjgwy+z2XbqYAWm/tZXHReW79aU5jK1x5Q57N9R1H+hURAcld74ERPobCVLszS7jBEipcWooWgjnIPJiSMlnjRyO/hegKoUhCEvwT4vklD9lQ25PQSR/zuMUkRzUiBDhMC2teOH2o5wDX2QW54cWFLdqzAhcRI2zZ/aevW9wJdA9BM1VkOkL1DisZbcfUR1eT0tHXt4r6BadZP6eFE7d3syLevri4xt7N35tXHjA9BKZgBcWUOGtBGg01AZsr+wlafjUtp7CsH3XauEa/pcXQRPXwGNoT4MmURBnCWvKL2vZUDdkJREMVZ9d0iA//Kpx/klKNCSgPoOgQ7GOG5dSEDKcTP33IFUTNnhWWOGTBPExq/l0xys3fHSTRHEeRn5ovH1JhAe8WUy8jJ8NVq0ChJ5v+rawZnRejNV0IPJZZzMEqcFSAxhP/TegC1sLggs+rvjrGXI0/LrihyyvUNKrAOvHSQtmn6FaZPR/qrDdeH6pcX/zxfWfhSLRoxmE5ibn9axFiu7vYMcFlIYAULhET0NlamehYso0DRIL6IYYE+xnKxRCxg0V/ZXLW8Or69Pb+AAm9YKc3ixWNc5VUoqUBcVf9TecSQcOzeAFhwpYMHZMpYDEbD0m+Uqlt0G/4yP/9NKLbz8xg6kmFZdsWhgyGPmmDY7OWN52xmKhtFCkkj7HlijBEhLBYL8KJEnkfBL89v6CmIqQLj0+t/f5M6OAWdJUMtbRVvJUaiVPTcgMcWpGKRTKwZomUiVNRDRsJndNX10EsP2XDeDGpTMOyFzkJbU45TOhwWXNZ9kAprIU8YEzmgbRFhAwZmgIqESbmgGhH6e2ZtlXBUD2JRmQX8lFcAqs4SjLOd39rNiMOP+xBqiBcUofiv7DJmTMBHhn82Lj/Lvwme8msrjwGodZPaQpeB2xQpZLNqrY70w9iA1ivWbxtLp0emfzC21SqVd91MjSQ7YQnGHbRgOwdegMvN3QHUSJR9uMqqAFsa4FzA1FqvmKoTuSt2WDHPcXJHbn4g+AoXH27zTr2KeOMUx+m/Ez5KbxM3QNs+3wAXj74Rs8Cd4uEApSrpN4+wf3O5DCRIb9d9q7P57GWXl8hquHZrACa53c5IyTWw2FLxdiLt2wvZlLQdz61kBMsFYlpix34cXVWiTzCYSEQTpNfmI5IL09C0qbrAAjI3yXJmKD4HPHenUt0NBzEWdOdMG7bZyjFPhXKQV577sPLdhcFGfheQesJgJ0u7YsRVJTjVludKUj3omrDok4zQKtphJ1K4+mtofG0LRBNA4NuP0O37rafovkDQEnq1YVsxrxJYvbkG2ydbGUmjg+qKcb16/TO6BIU69qa5DZeBqq2Xkaqtl6DI+3HgNzt54FaHZFUKmmt0ngV6rttgmyU3ebAENNbRPDUTVtEsiaNAlchzQJRCFNDI5JE8N6VTNck77lalpGRTLKkPlgdRmjyDg6jFVbrGZhtQqjUlhtwlEh0jJ9SmMQEd7VE0ByJqmjrGM35c7ogbhJoqCsk3mK+7EWi5FO2n3KS28YCK++KxGn5M/2cqeRNrkGuSNhilQpUhoRDJLxjHDniHWxkcMcGcwIYFb2cqSu2EhLVlIyYpKVkERS4UCXUH8SYYS6nOOzKXIH20XpMXlYCxYkUqRECebXDpNmjsy1spD7SqIOzQ3b8EXDCMkdy/A9y5ZaeZFhPtTF8BrLAxxu4HACzQZc8u/QZUuOXUJsqLClvi5JbEcHDeGjXvp4OLSombYJAdLUx9IcQxEsLUhRAU0CWk6/2OwwiUNUi7vRiob1tWpjzfa6tk8YW91B/cVO1/ZnY6M70t5GJ52yp05xn+jUkVe1z82Nd6toulvNn+xWpbFuVZirryX1tY7VcmEO/h49VpyfrB/tgCew5WhHstaxktQLc6Xs0Y41OLZj1dzoaLeqddTXVqrLOaAJwIpz8HgRvlVmp95EanSsFCzkod+hrDc7NVkKF+iJ8vpqec6fngxH89OTZRxHcZF/Dxazs1Nzxw4X4YnCYtabGhmeGB/N+5PweRYLFgx1qzd61PjxsdHxE2Oj/vSfutRMvxoZnhmHfxPjJ45D+/Gx4cO9qj6jOnpV98mR/q7OLl+tDajenql5NT6m3nLMcb09A91dneO+euOEGuxZ71Udx9VaUY2OYUKy6qDqGegvzqqhvs4jBdV1uKDenFQjk6ptVjD0/ICdtWL4I37zV1LcsbJ9xwpmW39tEcxWqyn2aOHZ7wSxhTkyYMsbCbbljS5krMiwgj4gWmthSYTauIUUBBKzXQ0GlYPNL4wSozWCyPcdAZtmASABpc/ZiVjxYRxZP8jpySDg2rr042mCezo1G2mwPl0eAgkTsPwdCJmBivEJaHtH6VpHKd04j1dxZ/8uZqsixhUR4LRE7cCl4abg4mgdmLh0GmB6sBYmih9IMRM9CSSBQEuQaLDaurJs4KJx5YwMFGUQBOkK1rS7HJiywxyYPFQH5I+nDcj0UB24XohMOHAHyy3bdy3gLTRY3Qx1Clj0F2YUe2eu79+4tXv1AVB1HQ0W5ih4CNBYuR3jQoLmwadx0BFxQNNEb7QbfQosG9nshGSNsbjGYrQzGVtX24EzorM+YxaiNGiY7qFzQPOhM9D1oUvDpqECyfBSg8UGKz7fS9yXv3693WhBMM87u8wBSd8NRJFyHZAg5GqQZoM1Q/NFYiZQrrjMYpSzVS80QzLCN7+qQJL3FG6Lb5mChDv0QtvXtLI8mWLXSUwEQlVDK0aGggoTL3QWhQJ8gAo6q4KBPlt/ZfBL2TjMvhYDKQoNKSQiIqDli0Q7amLiwGNiYuAJMXHByXaM3c0Y23NZT731261vvYKZA9x3juL0O9N3E8lkziCFM6Xf0gWGw3KP3bp74Ox2axlOmhNpCPpbkGvDhVwOlDoJqbU09h15L2QOzQspsqwsIomzZgUtU0BtYt1nzy3y8BFjFGkWOEb+BeOWBEmT7UirRdpwJMqRzyFK6JfG3m7WfoRvEBsLD79BzAJ16gXEcETjZ9laj99lFA40+eLI5qykMyDRz9n8RMp5Ew9LmYSILTgcwTCDlh0nMnjkYQV7uiLQzIt9bbDZC7FAjeVhKfbFF2fWWw45zpU77Dyw5PurGYmIc1kOJX8K2Faj51C+p+bQ2oVoEjecSbS2Gzy20jn1xZxhgaKFgQ17eFOMJBa9Q0QArYUIGzEcJDWD/koT77BA0t+bOIfLNJxzYsHxXqhUtbqtNxq2ZNsRPlZ6ZKZI79Ez5ZD4nFcRX08NmaL4s1yGhGCLJ7HoUBt/E3NQFCcebpCaaw9Ktr+vVDMczCscHeh8U6Qk3a5qDevCJbz2JSWLQiV5Ev2K46eHfqBsJUDorddUmpPI7UrLLdWFplsqOcAGRyKbGo0Qeuy6Kc6lB897216wwfCv3GHTBA2f9nesyX/KrZddeumCNc6Zq1vj7pPKy7bFbj9Nrr4Gro9xl3LbGYa++GO7xhd9pch+UGR+2Xm8wd5QJYm31HZ7vquuZZx4Iw72jabM3XWd8lZZx/R3Lxm3XwzSJlDtTGNaW7F6j6PyaJ3E0UUcPSGlIbjKgdEMUvqAldhdWd0V07WMnpLMXQE6JTo7UrMRmZsEZVd8TQmursyqBVZXTDXypJEjHdnRSI2utMhSHVV1dSREy621GJeS4LTI5chtiX2nC04PLVqJ5CMyjyPqGCHHkW5EGhEhxJFmjOzhyBzr4lwaaKslbwBmrWbp9bLLivNic15Xu8qyxLy6vLCSPs4uqV5NXkheQxmQXTxaN7nT4ONMrECvkqbU+i9TaXFR0XTZUmRLLGVF2A1AqKOQrsSuBC8C5Zg1lChgwVPPPk88Al913M7MUeepZvf5VtvUoY4/Hj7IKtX0m7FHtfYRS1TTD8YG1dHeBnWo47A1P3W8qvlpur/35HpSKVXhQzw/O7V2cnRodKivT82ES3N90JjNqmPwO7bDf8PDgyOd0Br1qyFvYBA+jR5br5TWk9LYgJrsHunqUwikDP8Lsov5YwC6dym7pKaPq/DQjIpP4KcgymcLfi7r9xdyfq6/CE9GxUKur+D3FqP8YtB5YnhwqDbQH6h4dqp76XCfF89PLYyp6aIaKioY2+xJtVLt753N9qmOfJ+qr40ODU6OqZEcltvs4Ti5Wq8aXJ7pHhvp6UwCdaSgjk6qwUl1vGc6xt/qayeHhgdXOwfX3jqOUXbwfXS4GKojPSrwVM2rDKrDM4BluneuPKiGh5QPn/vfKKg/TSh/QZ0YQeiTw2NqclSNEsLB1ZE3etu6jSV/rAQ5TBeR48q09gvWfsWIsQIF3f29ceU9ciT1VyndcU5uBuJCUAI+V/NzFHzA3+KAvlEqDyz8UM6kgF2+uHvjogGJNT4r+YyG7NSLo8LTfm57y8PD8b8CCmnL5Gqhl/zXLaqg8REmvD1doOA2dIKg9OcPGpuYe27n8ZYUG8NajBXfL2adEb9u4UqDhYvizW8f1ooZgwD9Pe/f2vn1c4ZO1MQrtUINfDMJXkihBC6sogHT+Ow5pVbN1RYydZ06kNJucS95mB/jkKy6ydJZiRcymO8WOOkfSz75i5s2XfKeCMIi5e3NuSXvScrd2vv8Cde6p5sOD4tES2Fhue0JUchyMWBOLRdBF1Fb4sHwbmkEjfs/N65/aRAA5GIKfAnGiiwIFtct9eZFPuajYhdcrO2NnsyUTgTzbeKFe5XrfGOuki9u7//jl8YH90zi1lyEee9sKc7tv2Hu4aWYdb0I7ZeZVDJYTBGKQQmYQOGmZAVt3H66s3menYMjmnSAnS5Q/7ouACO16V+n6ke2Jr0UKaLKKlyQ3hQp0tXoI1t6AIDmuOgApULBwpDiwk2JUdnpfP/BT/xM3UtstelMibgZf359eyNJ1ZvOSI50U3caveo5Va6uPg1yr5RciFe4EnbmdYbpNDBckEg/WM7YSu37D34xxdp9jLIvO8CKGPTml/4o2VOJdYHoj43UImYBCqflumBN+VQxnvbseTeraiWgIk1+Usuu+c1jtqh60mP3S1453N4CjD1O6iO6n+cXas7j+vBs4/2v4N1c1PJ6aeycXh9wOO9oMsSGfN0HykGMYcucVR4rn2GomqDa3biw+94PmOr6L19h3BqhoigeLtlOaWRtBD+5ySY6MCRDxvikBZPO4MGwKVaE09FqUHoPmzB/2cM2GcgdXaUNE7IXMULuozxvZBho4/HjF198aTcyJwJ4dcCSBAOAcRIMCmTJMDBbiRenVQCO60q6YnUAmP0MjO4bMjrFPtBXSoiZMceQWNY5vJullPu7F7AGCB9HHW1MYQsAOZ9BFuEO4vdeBgvOmYmyaVtkkpzMLUkTaIpZzJgdSk6kzS2c9Bu5Bu1Rruex//w6bEtc7YAoaYZ3pQQ/1xaRfKegwE4E9lYHrua2cn0wVIEM7PNXGo/vM2wAQYX+HNgJHGbMnhohxQZJGwhWvCCqPBJroKxhDR2EQfyOKBVcbYGP2p0SU1fAhvNEjPnrbzG7+P0Lu5/j6iclz6/kMlVQkBOyVEWZXBwXTAJvr1TB9DYOVi4DAe0+/oD5eprwUjYPCTVDq869GpMYPYL97y4ghX/8/d4Xt8w4UO7IlH0/bBmFK4Q4wwiq3NaCHfGyF7xGSNjeYzwiiGCIEW48gyXU/pSp+WU5qgkDWgSMPNEG3c6TeyJeOHiTpTDOt6JNODwYzlDFqxq03JZwY/rNSCO9SdZGZPuUvwnX89L5nccXkeVz/qYo5oMVxXFUAX3Vsyg1a3AwCmNoRpjiDinshj0Y1MIe2uBz1o/CO9OrJyGebRYPPq/bxfv0bnrx0LxhFw9Oh4WN35rgFjinKZLTeqYdkrMXXnz2yEWFGlYS1ZJWZDUgQNUM/Z/MMo9YytbVockcs//dabHF1OHI1rWMDpR2+26VJXS/FmJApxixdF+dn8uBgtn1r73DhRuJUGp4JO1jeRlO3kMDscJLO7UBeuJrWAnmf25ELQeJTeWylUWepplv2rgtWzbQBRvD2EriniybZI6/8jaulaRcRglROvGBla6iULi4kTtZdUh219ObrApZJQitd/+dUUi/dhY3rxSscZIQPeFm57xUwxPmIkoSKUeuymU0LQ4f02oQKTF1v1mFqbslBkCl6OJq4lZZSWsQru5g1IbhceK9lCfKiqJGDrWiupT+G2sq/SdyN4u42xsnbCEhCTol8VjLsR7mLM6CwMgZSBzRlYng32lFKhlO1QV0COMhLzzknF1pabFJSETJ7VWqCKSkESuHuNqG0TGMUPYvdkrLJ66s4H7W0oLICY7s4fKsZmZl+a7htU0M9mXdf4ebtvCzFB97Gf9y2Rb54LXwDUvQ/zUm0Z5gvxKptmT1lR43GAKhEQMOnTHEBQ9hMzE56MFmAqJjULNB4nWhuxl6kfk+yN/N8aftnrCxpwf013Gn7X42tsTDB8ScYqeFU6d0n8Kpw2xQNID/g/J4e2ESeZWT1bDm5fHw/fnPaHXlkU/AM3UvLNOJPvof/7bmA2FC4O67/RkY+vYPXjnpdZ8+4jwNQ43gd3x09xNQNzbcBw+nwdLIdKp7Hhvsjf+dnk0D0E6hnS09MbhImJgq7qap4azlHhpA+nB2S95YFc2ngJ/ts/iN528UPp469W//5/8B5i/CYg==";
@@ -1,2 +1,2 @@
 // Obfuscated production version (zlib + base64)
-export const w="eNqsvetvG0mWJ/qvJPrD7pfuRvfsbnfPfJs7M8AdYPtigB3sxWIxMJJkikw5yaTzIZm6GEDy+yVZtmW7/CpbLj+ksiXLZVdZD9v6QBf8f1woSeq/uOcZEZmk7OrpCxRcZFBxIjIy4pzfOXEe//7v//Zvv0rirpcG/R/7z/3E7wbJr379K/zg+Y1OELY7AXz/vFLz+httL2jAl9Hq0+L90+HdM/A5iae8FP6u7f/qf//6336VBnPQMfW9BD5Mwe9pUKeGCFrqfsuSMnTwj4iAFxz320QlaHhB+pskgGaYTuLDn2BTFmSd/nqoTeHnpab3eTlHooOVncGpFfgwFXsZ9SJC+GRVStRWJdVfm/X6L/M5r7/bSqHhYHt3+OH70Y9L8ogVmokfdk8GQsx86f+QN71m5+fFDB9u//zh/F340Kt5QSfOeH1sR9PJGbU0pNMJBonTJG7Tq6FvGb6ZsKFtnf5ayyzFwhovBRGRbkhGSGDnEEcrEfGSEL6mLi0v7j9qeB1YZUO1uLA1OPMQX4fQioJgionD6wWyNDOgaZdbRsmkxZM/pIEetWAn9GBTwar111t1r/PpRmsORzv38XDhNuyw0au7w/s4YBYkTRgvkN40ZMNvhkktdkimMlo9aPhJ0/dS+1N/LTxJDzNhuNHWY3gsd7j0eMdvZaXhaN90o7ye0iHgbeRTQ9jgxwlP4JrV8AE2Lg4uvdaXMBc24yjuyhHxhQj87fPgX3AwpeLFjfBfXFIN7/P1WSZ3uHBjcOEaLr1S8/6ZD0vcSAKYC54oOEWd/hv8jgft+iw+6KMw8jr91byHdC5cG22dLZboFcJpngmbMEGXzK+TeMaf8uDpkAt0uNFtcykC+c/LJ2gBkejo1Tuky0Rh6/lB1OU3BWckgf1MGz7y3W8/L+aZF35aOI5Uzrwu3s8jCVz6TP9IOILTqfwNDk8d32yIK3B450lxdhE+tONkqkKEmFrc/w74XD2M+PhRG6xZWLdt/Zet1Pt0L5xmdnd4/tLo+XeW3XXiMPM7Pv0xPZ1DEebFe8ES9PxOLs2WcH+tCU99r2nIH2x/P9y7g10tdXo//PgJ7GvcHXCw4NNvIp/edrmVG4GfwKnamcVt3vm0AGN9ekGb/OD93dGrV/AYh7ffHuxcxqGCYDYLavAWgYKfpcgm8zRsy+lyBgPxEHXbzDWc4TzTWhmV2EY47Y5aLN4cbs7TBiqPpkRw0DyoA+m4DrIARmjAGuJj8kdojAIPFjZJ8nqM7RHMHE4wLOnClBf2HyELx11+sHtuuPKwuHqteHJrcOYqtDQCYD9dv+UpKeFZiV/3SLKYweJ6mKX9jSicidtxlpuJ0I/A4FsejFhHXv10e/ThGXImnR0QI7JteCdJEtACw6Hhj/3dHq0PkKjTFJdgWQ5X6I2H8lc0p47fRtbLveSbISIE4GHXZ2HXriPvZzogsA52d2mHwt961E+2Ti1OlR5/GSMHS4DzgxeXNw1FeGcwy+LsG3zGPK6RfM7M9sBR2rCxQZS247od2G0yAwDPmLKEL73CqTAxK/SRoRIj5AOuH3nhaBvT5HBO15eKD9eVubb9qMbHG3t48B7Cdp6m+L6kJeImn4Vb4vXX53iTshhAont7o7ffDS6fHVzcZzYa1ehxlflMmBguGj4bSn3cD3CwVu6A1BcQEuU+M1a/1YHH1F48JWJVuvTM4nnFmcVTZ68nYEjFxQQOv3wC1qaGyIVw2Y/vDrYXi1c7zN2RefvdCo0/M3citg5HGeTGf/8yIabiJXkM7B6YBQsdEvN+JPKdP6k8N/KbfvVYcgv6SWnYTj4VJ91J4MD+5KIDPuX0rwsOBu9ew38WHHQD4NcGMPW/k1XCb3bN+jtEaiE/TqjmZrH5QWFsClzCkYhCwfNBTHdlJVAYho1gTBD2d0Fgl6Xh4PUpFogOXe946ltR5Fs0wd/TvE4CKP98/TiICGKgxdXvivmHBs7RX5jdjq+0Tagt5c4egx1DwINPPWQXbUNqcP/i4IdVwnDUI+6YNUv9Mr5x0A0iZMbFMpXeREgTEIZp4Fs2yMugG9+FfgpwJoA/AjsuGpOxLBz7338HOkMS/98oOnxcsn9D1aOswdTDqbARt/lNrQJ9UDxwERb2Qe8wSgcfj6qykSZmTx6laLgawS8D9RbQWzD/i4B8CcSbNbSfqmhWl81Frw5yDbLkq7C1DFkTP9azJJCwsv/Nprf4TzoalPZVzFeCahWUdhRAM/CpDJzGAUwFuDiIxWCUCdCEV24CEiE+0vRwHrhqN88e7F52oICRkCoWHVloxKD57Rf+sSt9VZok+gHQD+ieINhwOvPfgzBTMVb6eyNUHcFlpJYVWZZ3Wr551Ot2pMzXdL8jZIQjICYNPJlhV5m1y0u/yEYdFuqyu0knomGYkeVBDu9JfTgy//6rtAOAJ/P/hZnzP3n/SVjj3//q72CwIG/mGWtOX/rDTtjrhF/7I6DWCQmvfOmvWmkYNdFo87s//P7vfnW87ndhtrO/+n/+7lc+4DL8v/TuHjvGi3HsmDzcMehy7G9gGmgV8pMYNGhgjUE78mnLQ0sLAbHfjvqrvOtWIw9W6ySy8JfTCMfvRYjE5xDxhSdx/R48Pdi+fPjgTnHuXXF/bbi0BY2zccfrzMYguyLBzEbD9H7tjmibnVHdsVTk8gCigJLiWRkgTtPQ86eDGdqWKWhlCYGwAE7NWovme5z+ISH3/Wj/zvD+ZfgPFzsEdRQQsHe8HrTqIr5xbYDEVIeALq9MPIcndAYxsN+qM98CqiR8+hug9L1EmAREBw+fFotvhi8uy1qUiQN2BpDhk5yEjyA00M4C6gXsV6K5Csxh54T38wug+9vf/haYP5JdWi+W9orzu9BSXL8CLa0snCXSzY7PugCaR/JpJS7fvkyfkCFpVWYAQofIshPQ04NmnJUHCdqwLCCq8yYBE5A2Qc6aeNJfbRIT+LwMcH4hJ2k1fPt8cAkPWNZqhhmAVq8Rxa3KpgBJ1k2D0obwtQk3AqCOTwvAJnQ7DDcuDtcWy9vBIQww029Ffs1PMi/IO2HGbxGbp7k1CWX6wCTnyKYH+2TnJCwFKbUf7hfvng73NoZ7z1lsHIcjhkP0EtUCgZWhuRTgWdNvIqcgZY60zWm/G+YnyKy6jFu4v3ESDw3oE+tooyKw29/ISbQ8WBqtXim2nw2Wd0e7Lw7vXqU96zebeVQeL2jnUTzjxTj1DkIK0j+5kd7uNE1C2finFz3QqNAG9ShkI8fVw4dvDj4sjbZOk+igjnSGOknOepAPr3IKbTnANRhjacMc7ndsAWrTBCbgWWBv9XdoufbeDS7Bcj0YXCatLZiCTmXSAQgRWHW/GbRYt9KvEekYtDgb9FNxYWu0/5ABQ+R1c4eGWQEfBVHuV1YgrOVpZQVg1zQrS3D44pvSErgjpHErgr0NMC8hLhxPhy3zLZyDl7jawj241AOwiQpvsbFcbKwXZ/cGl+7SbJJGBBwcicKmSVg4x/Ww23+Tkck8QdOx3w4yfmd1Oqj9jQy4LMAVOpHwDSf7+JvRqwdwGgdXl+ErkIBzWCIL4C8NkrqXo4mo4+cn6Pj0YA/6QcpNdbai4OrirIENss0QdGM2oxRPnh/e3AeltPiARxToz8ZJ0/tnrxO0ZhVldfuriSejMc7SFm5wyKNVqIF7nYQ5Ux+e2in2XyADSOFoyxDMCAnMpyCD0P5E/NS08MxBwrNiOAUzagNPyXjeg4uXiwvnDvZeHuzd4nkf94Ok5vWAY1ke68M5AUkofBb4STtOGDYoUeCln1cIrBBB+HqwvaSsVak6gBVo4NHAU+7PqB6L0NX5AbUOgifx56XjopSM5k+zUgKSiV6jsYrA5oK9kdI+g1090wlxgzTkswc/x/irgmJEpWj1q9E6XAZkOnyPK9DDPysRRmyWgxCDiXdwMhHQB76KtqJGkHdRLYSl6P9AS3Ev8T4vTYFGM0tQ6naxvzh4c3Nw+5GzFhl0yv5zx5W3AY+h5GHH0Re/5lnCSHD5OdPEBQg9h6CaxIB/t2HuSVzzZR8gR0ezqmmiA8LAoP+ygdB8jrjF9dHmarF5t7jwk/ZT+mSk4jUG2O75bRTbHdoPPjWQLasDa0IvEqQgvC3YxHQKcUMzwDlz9WAbxeLg9BvtOTZC3M7CBDgT0e+wOkJNcMpBeZOm/uoUWWGQQ/EOJIPX++XBBoCoS6N3xPbwPg0N5EC/GwTHmfW1Oj7sXsJMuJf9/kbDixC9wQPoiBWySlAna4jFJ4E9xnwF5yczYUQAJwe4i6Y0upujuzwGzp9eoCyPPFbqPi+Rjn3/Y/HtaVDtBtfOwdfjCDOA5TfggQEwmP1BQwQyQtRfZ1PsnKG8kJWpblqSsE0qBNtBDa3szBpwDUD1qOFU/RkWIvDu6sTbQMaac108OTO8t10+181ODEvn0kW1RAhXiMIZbuE2hq233vCcIZD20w/FxwvFx9s8CD5jFFTJyzo0QmLG8It8wocn4niiQULxbt48DUQPVz8Ozz43ixCQEdvYKmFFhQQIyAbAiDrhDESfcxMovns9Ov+9S3QqgsdDY98YaTrSZFpT6JX6YdrxPUKp1ObFESujDQAXYhBj3QDH+nh2cB8viQY3X/LsQWSBoJ8lw1gMXUVswW7GPYwmsTROYxyDpC2oLfUYf0rjNsG/fxJtrU3qxrSnA5NC8Hj0fIGHZIiWBSAhJo3Y/74Ocj6wb+GvXDgQKVO+JZ/6/ecdxAhe6uO9lQySxv3XYcd+V/hQGoTggxkhbYTHq9RjUGMaPttX5BOe81mGIcif7t872NtiUyxKLO0IJ9uP0OiIUL3OLM5PatQGrz3Na4Q86mwpj0l8oyZDJonFYvHm4OJH0GPwcgWxryE9yTTnqnSTFTmjwuEbLSluVsk6Qr0Spc2oa2VlSnSdLyo5rnIjBKw2o3vd6Bv9HVyJDTK4LfAd14ergysLxQOCeI6a4agWfn/XfLZ6hNEgSkjeAfAusrZ42iDpMoYmwOV3aTPYj6SI28fc4md0Ua3fiRFfWvyJRr6w3qH7BgdyGrA5CWbqoGXAZ0CeBY9iFzTQawLsMnjLgW7Ci5s+aE4kzRI/ivQzstwc38ojMpwWz84VVwT32esl34ARB4qUcYiCkCoCCSzyMp/KKMDI/zHR7+qXKvJhHmq4nSSRS5K9LIer0teVj0Y4flEyHi0VjTikmblCyuGNhl+5fMrywDFxRLdDzMNxEomsuyM5EnOyHPZtGPdEEeH/oslUOCWMo3zO8LcSWzMMbZyXianvb7y0lgT/E5BV6ietf6ka+MZ/Nma9iT3FmDf+mzHh/f5Pky14f3PsGPaZOXaMO3WP/f5P1nDXgXPRXyVbA3D0gDQ/UBlC6OB7+qtuvzmPLdknYOXJnn73PmgNxZ21wf1dZTGsPNF8zWlK4hZdtuLtmFwAQ1sUYZseaaT684vjeK14nO7q6Y7hzXfFjY3B7uni7TpL5h7IRjuOmBpka8BJURsbnt9KG/BiT5/iJf6zxgb5C++K7eXhh83R5kcyy+cxXtDjiQ5SVdfCTo5uT349IR6Cehq1sLvGXNjxm0ksuJ8uC0A8d5Hn41Hb3Dx4f3ewdL3YvOigC2cANI0gholbQNAaNuJuOwgzWjexbVj+jEIFmAHqGIZVD27/VJw/R9YINo4RF22lf63RxNBogzad4F0ZOSKkxBoavGVIRsLq/kBAefPKcGVN7rZBQHZysdh30ViBVGCNiYo8IrA5v+ajJ4fo6pac+KXg44qZgYgf3n4Lj6vPWhkHRH8MXAJeD+5pY7UHfTnnZtBMbDssKpzqBi9rLJJosHphuLGCi3rxI7GHWWRBgRh3A9pWoq0R/DTU4nb/Td0l318HnLabGLxPULf/Q4ewwM3i2anB07uD7bPF+zNk4G1VB+A3lYZoi7FUpRVPbhzBaP1d+YE8huApQC1DecW2TtyFz7/DxVteGq4tMr+DVcChGh0dKD8hxlJn7tLmLhfawvgiu7Rixb1HxdJDs2K91myFPHH3MPFDBLYt8UpyGgFGhPUkmA6M96feIj3K2T0JLwLvYbfhqfeHK3vFk/XBK7Rx9qIQRBZhOeR9KscYmeRTKsnEXkvHFMnSXRGbmkTpuAD4ebd4fXO0f081sBJVUjNg4aMYrwaQec3wRzk/jCgubBX3vmVxBPy4ZiQjcF/RVCwJarJ0ZK8znc2fmA6wzFaZkrMnAqHkbAggFuQz5soFqJW3wuDBUyBc2QpE39ogmnFkSMfAX5PuJLJqnBOKZJnrxHFaoYZvOZmCgw/nbIbfuh8FDd9gG8L2sKfCE47hHF5CcXHRwN6GH7QQBHhxs2rwt6jJMfmPg2hr8SeaVYu/0EW9Ab0TfNg6HUIfsIUTWAzTgpIKBYkaYD5fJ6b3/vRg5ePB9uJga1vg5EzYxFcbdEqExYhm6cZlorCX0EekZmiOni0AWYdm9p87MTuv+I18uqSUNfIeMD3VyFD7QLxWY5+TTn+XgNul9WJ7c/D6VPFqD6lGAXqNOZjJ0gNgV095LmpkmDNkNk/DUWcaWVihgOcaEEQOQuJkCMdOzzq3Jf408xe5DoSnVs7IkO5g+zI++Ic9+I8OOPRtstw3OLsTTwURLh9to0jYL7T21yO2iftN2LF1tfchN2l4dkhSTh8MV37kwdjposX2svJI9rShwOyWT1sSNGPWuj7dYLPCXOW4LT0tzi1WjhvCxno4/iTodeCPPQecF4Dg5Qehy7bVjnmK0Y/vBpf3S0/hDuJHMEvafOGMLxBmBr0kG7h8CKrJcwcN2UgZLXUhq1eH332LtO/vwgeU6YjbAbIDxPPFZTcFjbnrp16KgivM+LoQWuagJSKUkIWEEsI5vraiWxSy17Hh4vDby4Oli6CTUBAAwA1PR6nSRwiJ2v7YEGh7dUYw2hLoenUzCGhNw/V9M0gnNu8YNP08JoQXR4wgu/DV0u3vTnko+Kp0B/cXR6vfOXRbWRzVXcpyNW63KN//wk5inbv/ssbOlM617+HtjeLsm9K1L12DqRY+lyN0Rg2VSNBX+E++InhuGAfN4cIr8ctswRRoX5RoAZ6DE972ZI7sDcUtEe1H1O7JJz7v8UUYeuN4n5fo2mdn+fDhm+L9/ODiDbpZSnP0JazOFIND6s5MHbI8WXHwwbmSg4+dq0ssbgR1UgzZeB13/IQQJe0wPSK4e4FPzbFr4uD2OvGPxA8YcTfdl2I6GW+FDKQQN6EjWC6X2iUvhWL3EhAu+Sc4lGV6rE/FLbYgkNLacNoC9HxYZZeEk8wuCNCLkxDeSj14enjuejF/B2Du4JtXxkAxi2ZJBL12RYKxBcERQznSX1wPJDjZDJcYbVAOAQhzAYUlBU1Vs4pOVtK8ymqYo3sZrctRhv5Cy5RRThLSIHi9Y3YdmKiTuIpCgiEh6sMYWow7Aau7KL2C0B3A7BIpo2PFxSVMbHDwF7GvAbxqsFQ4qgDNwEeDzAwmwxuVEnJUuDgG5sa6TLJKfd00qegsZLQjDpJw3hMX5BhsY1FNBXlUzC6COQzgKKGNGCGGImtl4OMYw+AK3a7KolWqW1HuCFcVq64wTVia0ihGdpaEmhFnJUFmZ2clS1WiGFniyBAYRaXHuNww8kJGszZen/k5uasyt3VYt2HaLocl86HhiiW+ShuF8TPsE1gWPbYlvufyO+1ETI67AUuznGzcZvb7L9vMfn+0zez3X7CZ/f5om9nvjrCZ/X7MZvY7azNLfDkQHkNa9OREr8UG2Xon/Bo6P6suAoonivydmjk/w81Vhvl63tDJPGrgDkuMZXXCgG6zO1JpBKUN+6NCNQ6T/iq01YMO04lIbw7pegh+9I/6CdWUn1+cpJsoPCjPFg7vz4/2v6EQmkYAfXoRdcjCRsO3aoEh4tG1IGBoVAV7bNMlhk0YqHhyq7j6jISVpQKs06HkN/z8BOmR0wxGgUEhrMjrQcq3umyuCuVHc+2Pl/44Ts+xZvPl//2tYneFzdq9CF18E7IGGqgLozXCNnAfpN9GRyH2UhgbNs/qcr/2Q0PcttwRvc8rJ9AWT9j00hr6bdG4xdVbh+fPV0bPxEu4HaYpxT2EeVQXJrzBLUHPNHX6OxGC4GkxFOJd83IdQMYb8sXd3B3u3QBxVHy8Pdh4Mlx5Lb7M3N9Lc/V6ocEC1v/RVghKdY9YY51gIPm7PinuoVsHdjKvJoYDk8GkQKpQIBt9p/BPxDg+x8nxnVh/tec59Eb7D4u9nwzVnk/aCcb3weqqwyDALUMa0AZ+L1HGtW6bpxbKxfIiPy9TxsCYCuE8BlE8ZU8SbKxUlvhNhL9UXrGCuEc1jJlLvc/Xyaea7/h2z43ePi2evB58ex8Wmw5EFGKUTuRQtnqybaT1rm6mo1bdpeYeDAAVARpZMWRUZGkUtjHeNqxzQ3+96dElOPtDwpK9IaH16P3B3rvhxsVi+QpNuh4m8NIj6c9gBze/57fTABSEhhc45NEnn70WeySf0LEmhSVao+N8f+vg/fvh6z2Bn9zFzBqOFbBbWECvPABtPwCzdWVAgLpYGSEksUYGDuRE+gzD1c3BxneDR+/4GYIc3TbTcDY4HkZHPYBMHNpC0XroCcqELUmhZjd8hhun4f1agh5b9aBF3+lrQP5FqeD7NYLUGI/0zati81uYLS00smwvDXrsY4DOLbwePlmK0FXCU7LGe8uh5xJLQy8LPSZZXdtf01HuBGxykoVF8k1Az20NCMK9hhZrFiDogCu77tkpkCPF1gddV5QkcIqsiUsYFK1tysDWUia3j4nkEeY2KmMcfDjHnvtmBEBDtTGJxS4x7f56VBZXIlaqcoojP2EGrsDCyM+NJ+T45qsgTOI2eiwn+ZTjeUPDjEmtT/fCE17SXyfstjKapz1i+5dOJgKZdliZtfNDZdooPWCHOyPgpM8vmnFsT1iiGEf9D01XO5u5Ak7t4lkEJeGE7EGQDrhzqIX5H+/AR6Qd3f7p8BQF1iBXRfVBb86wDwmRZgC6f0+u0ZH1szff0vDMT9rPSpAU/X3QD7VjBRCKEQwR0ZHNwbz9kxzMKGzNdnyMVUfDQWiN7hhlW6FJ7XgSqrTJBE8Kf2kUtMbfX7NjoU0epJwZUx1cxSEJ1r7W9jOHuSRZLBFv5JdE3nDoRLvcoxjT/PN1VFCGD58W734oLtwplp+xmtI5TvwLd1Osi9rx8ngCabHS9jdOYLxOi7ypbxVnfxpcuCV8i6iAKC+7XbIfB3qJ5ymvCcY8gPpPwkKjHpjriIGCoh5Gr27Cf2ybz1LkYBj90EtMJOwcsJ22CcInN3QTktXfrck2BO4F4JR3IrojMDGeonrex84hF7d7BAf2vDi+9+ilvMu6FPnegzg+vIPnmxzvQTEBxbRWPScEVAKvRJOYhbylutIEbnGwcxkYBtPMMPVDiSZeCE7aCOYHckvDjCLyAwVoU3R6HY56TzKKPN862KHsEr7HuyBOIzkeLcCEQtfL/4lmDpu3a2h68f8SwYN+QEBSwoYBAo2eXwSyHDl8vIOvC8lqoK7LWIW1lLgqHxYQRvID3VSAHkqBoy6Qe7ZQ7J/F4FGDVVzWOhUk6lutwzhAk8kfiXpMf8MuomAGYHAKfWBReGZBVAuxAb3X8V4zjow8B8QzV9K+QLAP5pes9oVdsS8KnVnxzvKnhVAU1vsbU7Bp+DqAM19Uf+NmYHEdvGWE89tGs0CjNOrh3Y/FPXjFF4ond83YWZSDukIkdPCJLnKTtMBfrAJWtcqqYjfW8HW1bCKWHUeyggqrmtdkncsCClFzvqB7lLZSZSMdtY2sSvFL5v01/D0BWk5Cxkejyi+hbPtSGP1+BZi6oNTBo0ZiM2asoE+7hAYe/sWgcAwPlvlrhbEyCjPg6wuQq9T3S/jFAR0OZvkS5vj/BW9Y5pmQ3QY03rrwTWmIZP2toDciviLc6amN3HSEZgeDKuyhubrIJ8aVlsGk9XKkocpBV1xZ+eRIJEkEQHYd4OJs1LHy5y87aOP8nnLRjO0weKf6iuCt8isaZ4MaSJvEGUiTTvwPY5Gz7i82VLby9xob6zYbq+Df/vGIWFj96/qxv/2jMQfCFMVfkhMzgDTwe7yIU4qX4FXzJU6MoVutzEREMZbj7mTZ0JQM410z+D2Jy93dXYsiyNmzoi+wOoIYxce3MCupc0rbvedV+mJkl2CzC9eYxD+XCIgbPPTCZ+a5O98+L3coeknyLB18eISRDZRqCZ3eAV5G9vGdfvQRLRcdDsejEDOigjiZ8OxLDDA7u3iwh86X6J+jtAzs6mCYN8EfjHaSyCqJyiTf5IOP99g3mfxvG3AY6I/UBypoyL0Ffsb7NElaRDp3xm4qjFqBSnFxUUFgiRCeYAwSIkr0pZMrD9ZbXnO/i3zKk3QP2hHxhZxjT/rTLOqkm+D4L1eLc4vkiefjXSbQ+I/DbkpghjvLTxxfMJ4Cf+5x1BEm2HnUkNQ6T57brhnsDrnDgffHTp6h+dTk+zuJjOAg+9NXMehliy5JQHXw/0J2RN5Z0kv1THlzRlnVBmTddYzNoC20NDr/Pa86TBA5zC+iQVdCovGSLKjrjSqqvkBVtVgn6RyT7K+TS4eh6GcpXfEZaup9OWc06eLC1vDeW6UYhRm8fXtvLQT50lqpfV5uzXGuJ3tbbRMTPAaVgq+sgbTcWjtkGW4kdLHZYG4Q4/nzx8RYfiJEW5VAXvtXbHYFmAvPRO+LACP5kKj8GXyzNHr1Fl4gAMjDB9+yLLJaKaIHmY9lL3aA8jfkMC5tYDGGJLIYh9h/YD+2mnlMLNMcBrJp8Sw6OU+A+AGHdOzDUbbdOrqlcswcENfalslKX+RqGPb66QUHbl+4BuJudOcD8VmmEmnuH+lvOqOG73YuNk+bzhgQ6fYWh9tc9TX2tu3o9yRgZ2WxkZ/ZP3h/l6P1CdqgY6JmzJCILcd+wi1VkBRyPMenew1BSh/PDjfU7Tn0Z9lgwmqb3wmnaIM10KUBFe/1vGsOLF3TkOLy4uGArAwRZgNEP30HKaVh3GWUq8q7oUGYT/LZAebjNHaZcKspo1+w7KV7FCBhQi16jtGDbfu7CYPt0f4d5P3f3gfoSwN7U6H4EIHmJT7McQTtVnDQ4XTJfPOquPq9odGLQAAIFXjRqP7236T81imILuKvlHqUfHAMVbYWANRikpy0xK8HNZCM+bRJSYZtqq6imKwFDZeeoSJxGUyiDKcdOW0XyCyJrm3MrA8vaDzt1Ssr3zm6dYvdkHTv4uoFth4ChVmlIMyTDF3ArPDsHomgMVirZBzzxBRfQVQ/0P2fgVUXbgkoI2Cl5ne1rKTi6q82FbZeHwmNjXmajeDo3ekLDdpcnf6ur0To/GImpkRN33CED/YW2egdAWNOrbXb2lCJDttF0KRDxx+A0ODiPO9DNYgA34GTjTyUGU/PI58EZDvojQ68k5lOcf0K8E1OAAd9Yd16R8XkEfc8CpmWIGkZkGLqgATVDfEEckCpiyerGJA/usjPYD4D+I7GamSXksOBpig6FpPgmcVm7HHTEFY4uP1M+KBBVfQsPBK9ALIcvVoRAGQsf2LnU6seWiX5bB18uE/PLCdSvfi/hk/kQojlvUh6Fy4YoGCF+ZfEpisyjbx0ZOW4uHFFjZEzLGT+8h6OAil7pCo/fvvb32pKCZAemJ6GkklYqWEY/tc4vWXydve6HFh5b4ntGpZ7FHOcyBkdQ8Pkkyk3zPhZMoPSAbxFjkwiO9qcpq2rIkPvxAClE1dQfoCj9DiuBB+XsvfQwR/PNRWHWb2TT09Sksu/ORmlqn1MEqnSD0ZV/tNRqrL9+/qxPznKsr2eZpNWMONnpO6prYzNcVFNmvEKWVwmJDWfuCXjbfK97WJ7G/ax070HPY8nvqbAwziQykAc1VgehYBgmT6CQSVOukaFctxAxha37TW7bdF7dtQ6zc2J3LnTbto4nD/Ft+3uPTultWuIGctYk9XVhX/69dE/lEbbaSBK7JjRit1nh3c/lmzMlQHjmVjcfPyZMPMjzjk4E+TjrXAq2Il7mrKAWrPU4NbW6OPp4tUOG6dmyQko0I76WKtTYxSPaGZDcf9NUh3nmxvF5o4Zpwey5EsDia0cXkpCR3PCb/BTTKEoJiExZbrdMFHfnJMYkxM/Pc/epzIqINs0ZMpsh6hNHhSYcF6bOCbtvspoTz+4QzXiuDk+lGbP0Q0eJnUy+5faYZP3NwL5BWD1SY5+REYlNxTriShr6DSjIT0H+6vDD5vAw2DXHOzuHuw9QROOzb0DpyFsMNnSU7vTcB7YncRXDps8a4m8c0UulnA4YhwI/IWf3Dt0hHGAWDNzh15ceDG8uFO6Q8crDelsor2qNCc2klkEN6icdDMUWkle7SA019EoHWp5nJQVoJTTLvG3kE3IfLEG8gT3hQTd4rXaxfmDnaXi/CPRisifu6NsaS4k1cpQhCaOoFeqlAyb04Cii7R55bvnBheWi80r/JobAXB5pONQR3dOO9E2hY8SVc//X0yYwIlDEaPhiBzf2WXQy6IACiv762YZdNCR11KlWLMA2Vtcz/FKMJfbE2lsRmKteJNR+BZnmcolhmv5ysH24vDUDqwxp+jE/GPwOyomQVs1kyRUnxq2f9MY4k0jA7gOSqUh2D/JDEF+NCXqSYzy0Z19Ek9TA6YmzgUW41brsf0CjtCsCTYCwoBcKZvMpok3wrztvYhiKtJfskjMhZOA3YftWtFu7K/130dmreAphjefltaqNBLeza7O0Hsmohl7vIAorWFjL5fY8vWO9+necR4BU+TgMT39obj6Cs1FHy+QjkxOV70IiJvMfOijToICKepXocppXgCIZpjXkzYTW25Hi8uDpbXh6QvFe+Kt0E36WdoWNwBCyEqoQVvYGLw2SxmTKSL2BO1UTrh2eHtz8MNqcXYNdipt05DPPfZ1rl3hK+gVSVzXrIJJkHP0SHkskYNZeZzBmavwGuwgAdaxcEdhAzuvfB7Fac0XW32lyZiGmYut59PGQIxCdu+B3D8gZJBOfIQxcL1KDOY551OUtd/g2TuHwR2Az4IdAFY/qQ5RQTuAvjKuDFFFQeYXe+9OjjAb0+a2HV1hvl2oYiDpWJJilpojxNxBfpkMc2nT3TyMCryczHJy4pwmipwDXQZVlLly3Hvx5OHopzfloHdUqTrjtD14iHG0wb/qxHUQmTURFyWtE3g4eY27C+kogUzygSu3NY0IcXjyinpyt3iCymoP77dj2XVpgFp16ktvvU1Ppjxf6Xi83znUfwr+2egqTazIsLNw+PgaU+6AHhcb0rShgQFPCeRGy8100P7y7QbdnNnLDXnLqE6XVkobOOExhfZy4n8BnVQ5YREUUrl5xXfsks3b7PSvdDr93bEWdrqlbVOhjhmotrcN9U6MTAllbyiJli1oVXLjLRYvV6gLYFbqAl0NbYeE85HedIUQvnGlksUUhkjBnbqwumX+qlW1JA25Vj130rPrkdPzhr96PZDINg2bdCS+zQLB5F8z+daMakc9j3S1sbrjmHIKey5gWUzB1oG9x/kGC5kAgx68WUPkPP+eZFhJhawqcNXvqMSprQ3Ut3k2FZeUtqrCNK5AuWqTVZjKutJEfWWSpsKAGoODrdpAQQU/DU5fYjVBvXhcRaWqGfwSxaSig/DqVXSCqiJQBuV8Y3tCIx8QhZ/9qdh6Is5LDgJXDCrI02Jtg7IdDPz1P3ZBrsVXggzLaNBATRcCCv4KBYCV4VgJ7hmUNwbvDNRyPuN+wiy2sp9efEMdDeYpIY4y+HFBh4EbY3DGwQDjAMOKfSPwK6K+InnHZK4V50aQHyViS8JV0r+CzNNEtQ+NsBOboog2V8wZCYdCKLaPaXg5MpZUkyOVeaQyM/dGfSKHParjV1nzUR3HOWfvS3yzwvjEcog4MvhHzKpDQXCNsez0k/7A2BCP6C2GxEm/GmviH4+wJlKnxrFjU7HE5TX8Y3+0RkW/1fETydOuISjwKjXWUj96WsxBgkamKA6s/4iy4DY5HHmw8hH9EbdeFltv2TSHWWB76DA5e3xW/W9lOCqOx6V2QGnHxD90M26q431eCTuoe0iCa62Od3GjuPBi9PwiV8cztG19PJMIre4nJAw5eN7n75zsKutyIyelo9QT+DSYTjr/ebHHGeow9cT9rcN7Zw/e41nHPnVSEPKpAGlNGi39jT8Tt8vDBRmoceu6kX5oUK2d6nCX1obP99zh7DheMKPyivJ/UAJkTOpG2XjwxEWkDuJyUg5k8xuJQCyVaFL24Apur472z3O2HinmwR1Qg8viuJ2qTV3ocuIqmw6oPKL7i80MxDF78LlnMgONVq+M9peZadIwJpA84LIVuPGcoPXJrU4SL7oq+flFZmLah2d+Gn6/QOZsrEEGzwPit+FIUSWnl2X07jqh/sIpfMVfhbf5RuYOM9h4XCzcN8N0MdPz2CBAEXPifEEvhYMZdaVu11+kmgbaUVhUMDVGUPxVK62uKag8EBuDrKIdN6rjKK0kwVxdjQ4lB7NCqs4/BPaHksK6ajI7ie1mY4Wj5EHmSldODzY+Fj3g2ED0gJVHckY0z8TDlQYKNPGPsU/4OITcKhsTBQ4ljV9RVMUuoX/vPAGT9YIaG+NcsphJS5KCYHKzlycoL5fBB8sXiqfXhh+XFCVorzTTnGlo6gswMI9FfDij0jcDntP16+aHmmZoo1wIOxzIr2ZWZAvE/iiE+vRocwPEIKBk5A1Xb3Mlv5C5AgxvXPx++Qti96D1hl7jktJwu1i4yxKaaNpXgk+FTDQKErN7k1AerPpLXX7izC9ywcVcXC52z74BiQ4MnK93GwGhdX5V2LX0KGgO1MxahrqXcLz5iTLdpT1DVIlp0gYKpEhIiCEdW8fRQnU155sf6I3USHenIWwxx91zg++uA3yCsUwxxzm/jVzA1HAM8hMkmSvjpZpcOPXJ6imFoCj+qFIzcvTqLQpsLRiJieVd+gyd/QiGiKjGcExffFDEWuVEH0TfJPoAsor64c+PAzceIxhzhSgL0LGRci1wq5OJj0SlGcpm47u/xaPxFa7UkvJkVIdFSpIQYozymT3XapXtiZq07lDhhA2NxWuEiXJbkMJJky+KEuW12oZ7kcUfXpswcOaYr/dPMPQQpk2HK0vylkPezfgFLzWrJvyqUxNyuC6qyvVKwq/h463R82cm4Rfo83HG4dJNPVyYvtUjg0oYpHnH5g+0OcVs7npNKIa2QB2DM4oNLu+XkooFUcPkb7bUYDzeL5g00JvD8iYBNeq+QfxzUmuKmtf6amO4d674botH6ATHQaLgY0zp1QFlKgnGSSthLt1BW32M9gPc60qbiY7tzJSSMUeIajiZNTdj9mMCSIjkNA9IfyNCdRDrV+G/nBNk+GxvcOoM/EdJYmAf4vQDo1T85fOPJeuxmX+xxTkbiarzADEoqdZ8RF8cdUyoye0SaWZA6slzMT9GjRxjpNVKiL11lvhZZpkcPU32trCTJN9mIVtZ5AhY+ZQRHZSwB4ERW+Mqch3v5O07ZLk+ePCR36GcUHjG4Cjq2oR2vkm44Yv0mXRJQk06RNrMikWUd0Nux4JDxLX4ul/e43AZFOgzxf5pfY8I8imPsz1I7kD+dGikoBkmqOcNRpbsR4tm0dIoh+s/Ha5/nDTKTJi40o9KR6GfHWbJo0Q1MTfFVLVU2rjOB5vUCUHAP22KZeJMm3eLB3cPPpwbnH08fH+D7QpJTj548H5m40hTTDV9DvZQHUnkLQwyWUfiYeAfoyDBEPAfDYF0Hc1IIE/XT9xqM6aZyuTY9hIeLlXKEfColXLMJe7xujnFQo7rnPWfs2DUxmiOjwgG1FZq8CzcNWSFHuYawN11pO0Uy8+EwbSv5SSRw3YTvhaymrdRuMuadkk1LamkEkro6p8TNc8KXy+JDFfdMzqeo91VlK6SQqd+bqK8qT41QZWyKkz1+1FWtSN1lypQLWsqRkFxNYZxRF8F8yQNLHofx+2/aBpoSClNBV6HM5tJ+DtsVACrptBUC3oVptruDjItwVHXK9r4Q0+EgyXUpi9TE/TD6xx889HiP3FXJ+cr5phUCuzTAq35m5vDN2LIcbEQOmQGzfEN16ggH1ioSp7Tr+7Zr5CYiiciAk4zx+CgFIs7bauuwBl6cAf+swLayNOyKC1JZCOMjcisiLOyIBNXNUdslQVWVYSYd5VKI839JLxoWv+9cwd7K66McLcZs//SF5IELl8GFF5mylV+XGHDxoivfLHKFMctqknQ6fh//oJFddIfGIvqEb3FojrpV2NR/cMRFlXq1C5bVP9gLaogQ7N8isrjdcKm3w5ZrmIbFUYxjZTgjTxluZKMVvIYPHg6uP/94P694vVNcv6hvpzQM0zDGbG8cwoKO0Tkd/ob8oXMZJpzldw/5XgebF8+2J4fvV7lKhoggUo0rR8LhzWR9a0W1C3vk19NuqIkrIV1U7lWnF0o74OYbMUv6OFTNdlabxfAI0za5H5wBuPvljotlEmhsTt6fo4TPJSJwPp2wzoa+5HhBPw15K98g8xGydHzhcPHZyS8M8jMX9n6Sw4dzulhCdmsHkpOcnpsrjJRyuVRpWq2RTAjF/B2U8BQDW60m6K/VhfqsiF+vCxTthsiq4fUz05biVPkoSXrEFMyFHLiEgiSWpwSijXXgmMtSAfdgpjQYGmNkyCihYX+5q8ilOVxza/QQgsXlXGI0PFDUgxQW1RuFJZKd6tU8e/TCzJurTw82N0dzZ8ezOO1GezeiEbQjmwQBFjaETtgmapDydCQ53UpyPOFgD6m2DwqDwyn66S2ARk8FFR2Z/5BcZUCUGPMA1nnP/krKU2ig9fdnCtzAgVcMCYxePdaUgF40kFqMknnSZM4Ymmc/lwOkyvZ/QbzzbGOQRUxJRexFjNVboVsSk3GzKuAUbHJGEthelHk102FdiSICUI4jwuZ2QFgxv9dM4dNO7lbNrc4cQsT0KQt1hkmCfQjZRP1MLcwAjK6dXr5uLh1f0CAioLQp8yZYwIygyNpyDwMHZ4K05GpAEYLJS2q+SQVFuXmFxStc294BgH/hUmb1NAloM+Uwcb21UWg/jwy99dFoGBA6DuTN0zkUc7h1hSuxfb7W9cG8/OGbdRyoxdDv3+kwel/po8My/14WOqlo04HGsfjxYEJ5UExCMhACqoNzuyL2y8I5VmnnzwvfPxH0w9VYFlnEJ3bV3hM7KhL7JbUw8C+uY5T3FhImO4yMIBv0cu1EJ758KVhsZsMa2sqf60AE5zf7snAjhaYfcUDmnp/uq2xqywtddURW51whvPPUBUS33wN0CzZ5lDC8NNCXeLZhg/mD3YuYCafK/c5qo2iCVNEWTZtEk+miSzrf7AdrK4v+cp9ngb1cPaV50AglKHm2y8GKLjbFORwkVL6LJORL8GfbVyy8BCeGNORVyJ/LLPrP6ckU3StIOWzKbuUuMTiyuhF41rCNnnMxXB+d7SpgdLBXNjhrMcVijy5+hzTMxwJKbks6YlMTMmUFs6iLmahUpYJayY6cWypFA3HwkOvzg3OXDVrhp7sOjOmxdMSOj0sPPrnKiWdnVIzE0RaOj3m6n6Fn/vCfzWmjEjiXuuvq6PXtAZ/cmp22HIHe/PMnDkWlFg8YMB20C4z+b+Ew2t/nO7k7OxmFzofVfRIYavTbzi5egkdO+jUAaYu2DUwt4RKXSzpAlKLHw1yrIBGA+e+AuUcFOeCrK8BrjLUKgGfr6KgKgRyIMvXwYqLVI7EKJNGddBFYnagCyXQm1BqAO2fY+BQwgwqoZNQxPjXBL4j7X+5jHYENNbOY8kKn74gVo1ExcsYzVdeEowV6WREItU9NeUzvybUjECz4ujLgsmRSo5gSaxQIUGA/7AkgP9UEkjZSz1j7mkrc33D711WrxVqeU853JnrtzFbBj7FDLnMjJ2jqowTC659hXO6TNOFrA5v46qkL6UcKTAdh+NMiCOV5OkwhT+PxZGWf7NxpGN9NI60/IOxU/y3o+JINQs72l+O/TfH56tU61wWVSucs2KVmYITXOtc3XreSDYsrHg+2t86PL9oip5T9T9ZvBQvD2YCl77TpJGQEgRJQ5TI7/0EIxjyKXd06eNtYg5sMvG9dlDjCxJtQFcOKvJN1XTRgWyXLhO4lNvHj6PVNQwtu3XGMEDqhs7M1WvqRH+tXFQ7zc4tuBnR3oTTaM5luB3PNVRi0cckbOeOZ0210eAlSk6OdbPmynf5jJuGezcG83vmRr8HnDTEipJzYeK322Jbt1Tj6IsjVMiyvahMC3PaRIg8TfUwRizjjW6SG77+7a8yC+C6CJTgZrh3bvTqmVQXy6TovMd1xkw9TK1NH1D5yEYnn9I8VZNGqNA2+rvQMbu1TSIay8/AGAkn7o0pvn78h+rO7e+cdLdtcfWO3bY4FPYiVugcPCFljx2Vw5RWc+6a1iWEjtzmD+a8uYTxVg2kQDCjBXAxG3d/l+6s64DAZjD03FbZxopM6rPBBbaxFhO5bZjq2phCYcZkZ1Ti7LEZtBPMASmjUW4MhyLAMEMOEwq7hMj/jmoAhJpjy3wjIIXW7YyR1OH8XU6pIn9BBz/6TX/V9s+c7vD2O16JxuDUmiGDj+TQUYNGK6IUlL5j40hAU+HEmS97nkad2Axoo83NYm/X5EHDzQQIUfJ4cvKl2KWakTyXb5YkJ2G617QUPzwa7t1RzcKSlPxRVBmEbxKkIczI9MwijXYK5ZUsrl0abTwjT3rObtZJfFGdU6xaptqOn3IxM5xIiQBqOUoD5+L0J4OzKVlN2UbsVxGsGctUXh1SRdDHtBO0x2mYcn62IeL8dZh4cSOjaGBxh7q6XFx4YSzWSM8p5Se2Y+CZppKoGI+1gS2qeFZjYAptsSHvwzSvihlZ/5bW3KEUuWQskyyTIp1VqSGTdKkhkkCvZoCRUpg9gyOZiuGJKtj010JSZSSPyXBv8WDvMuYPpGwmzpnMGzG8/tBW2iaqcCp/E5wM5Z7VtEOzP91fL028Mh4CscTh8zru5jplUZHhUI/LAlsUekZ1hCzkIt1cCemHnHcROcWI4Xq0fx7Y+eGpebUvBtyHmQFRKokJJlmRHErSSAsmqXKCejhCAgEQuRfStsQwh6y/3mYhIQ8N51AypVy4hhl0N1aEWQHj1NvWWMiw8ilfSPcU91YQ9jU1NLxaONh/IOoy01Crk98GzMCSnYqKAzuQsr+PcnofhBfm1waXXhsbOJxc5xqbCdjTMk0mASl+acm41S+Znql+qfScM0N2viRs5qnJARTIN8OlDHMydr80aDZzE8oNH63ps0lWIYfD8cJQfzFScW+1UjXYSzplZ05KQWk8pXt05yKBYuokLTmnyTuan4uyUJJ/dBqqPZJJuiYDl+L/VaWoxjulKu9QaMpcMQm+9ei2EQSGkqEgBlrsbueDDzdpPv9Umow7EWcWOgXm+bmzXu5XLFwD+zHDLECfV6RazWhzDb4ebC/pUqUpd6iU5kzjduAQcyt0ThqiXByZhqmU6CyNo3WQBRW6tZH9ujYZSxFzasNnEQihNyjFiKG9CPNBEbM6PH9p9Pw7KZdMG1y11EnwU0YqtY2PYhiMOwSzGRnB8JnJpiWj7jgfy8qNUWtcfcbVKNzPVolBM7NxZyS1YnBni91fK0qFhfQOuHcxvUHzFbXAQmvn4y8F1WVEbYCsRbQWJxuE7CJYF1C6n0vA0qBKF1I6ELAKJhHXSGGIa5fggwMAS9BvIkRzmZ+Dxwxw+ioAM8ApcVCS+5nS2TJgunpJ4aTFSi6gKYEQF3sY1FGCHBYayFYMxuCGgRmuoD9awpfkupHojjCHgx+IjHU+AiboSCoS6rc7uLhvReSYgPyadCzJRTThscCynyaLLldqWZEjzBivk0iXzCT09WhxU5I0bHUci/EZo+OKBisXHMY6iccaxkqmNMtME8sxnY+T2WWZSxoOOdlGhRsPCHbydntCyrOJf1KxWE2gUDJcVX839qv/+mX7lduvfuy/ls1Y6xlVls7ytka9QWuAjWzGsu1cO3UHZQvWgUb3Vcpx+HZteHG9uHJr9OGlZHyhyvDaUaR/iVSn8p2z3cFLqFm6mPXu6jdMNCYIXSIJDwSYFH3oKZ4PqRHhJpVmoTg+bSO6P7/IOHkph0sD6eH3C8W9R8XDXVEpcpi1OsDRhJHZVWds/Wj4mNRkpu9PAUU7U/rTsicYOT3HU0ncptdTdt9Ny6Np+B8tiOst9uExDFP14m11tfpAedqcDBbTd46TZ/ddnj/67NrJl6kFrSjmaCsM72vKZ5AnKbq+cvTT+/XBCpU0CL3jnTDRkri2axICe9QbCQw/XOTkwVtXoa8p32u7cpqrBufvgCfCHKh1qyD37CbBDJTP93STeNlUKCTiesweZEwFo0KmKJ+2Q4796GJJdeJQHZ7aGZ55ZggD9wBiDm3QJevkGcKeiXGtnSfsmqZNbJ1HXsQvMZTbrd390btX+ApXdnhJc9K7s8gfi713qDkx+JUxmHI5CxOTHwvOd4dBpzSUvZIHpSG2EC3haM83p8TkdOODxcewHgiHKd04iB9YFOll3ppL1y+R1TPu8g44OUxVXl+VWoBphMlkw2W25Zu4/H26RwhllVLXIKmbb0dbp4UU/KngjTTo/wgMQqtAe5YOcwnzAzM8+c1Uiq4OxGWjzVgp5pbOgtQdseRrXWEkX/rN5YDe52X0auZ8fMQHi92bhTiqqpO2Z3sfxbWqZ/8Xsdoy2cqUwxzjzxvjz2J/+LxMib3zuvsUg1cLg2vPJz1FL+aODC/yzCVFCemc74C8TpCkNmMQGziPjk40AMf6tTLMLhCUSTfxWhi5QphnYZbWOCfRdBDO8OmdowtZtTRganbZsP2XmRROvP0cNuzgHkKwRhR7FKGvKgiqYw5h3msOTUrK6xLk7c/UWBF3yNEhnUG9Uu28nbAdRpzxj+JiOFKO0m46x/TwzpPiwqOD7Y3ySRVStA4UQKL3F5YslW8zpDm7O1MTm5wlwWc9nBO2jifdsHhk0hghmJqrFUzDt3WtOH9VdHv+U7k4SJGXGkrYQHtJycHhq2kqvk8vGuzuwpkIX4LgOviwdHhnkdOe1F3KWPbbV5wXooqpkWfqJVy8n2f/4A4WRfdV+UWX9f6bZtDxHBLQFmMTbROlRlhorccE0XhHisil1YPtu0B4cPkG3+J2wjSvuSNQ5d4cl70hyIK+CaYur5wuW69GenOil+IOeHBojbWO0azEHhF5J/CIo4LGB9LIIPyS++ORQaadhCl6kiJUTClsmhblUfH428P5h6P9s+ymT/R4IKdSKKxyFLC3qqHoNEduOyVngCEoHEKUQMxT9PDwxTesCjaCoJuWB0G9HDMciorOybsoCkEk9Gj/HstmvJbA1IFylU6X2doVLcTaWW+ENCCBJ0JXQsXieZ6INT+7FJ13FcxE8UwnKHFVxYVRFCeJRDDxTvu0MFVGha9vFlevVVFhF9dMXmKKWdD632dBV+z8znApLXwU1ny8VHNH48yIHKKBsU7Av7qcGnFwab44u1c8xIVKoyg8Xh4uxuycU1z+mhzX6CsCyLrfsiYRSTa7vMhpZtOc/wzTIdbcbJRKh1NRJkHqZBZYa1IQskLZ4umHwb23GIVMgFbSTzok0xiraRtcmAbyVTGhqdJdwm1Sn1txW0qdgmbHb+mlHMeNRpYQV8pwaWyeNgSQmUrvI6xgVjcqK05lwW2kdlk3Uk1F/+8qK0ZTcZWUkl5ypCpiFBAUV0ZLcHG+URAm43xXO5AX4KDxIx7N4m4LfSeBYIN8+b1H6v9lEehRINdgWwosDxy7mIJB+6kCBg0MdNBfef3GEB4Oq4rXoqxmGW85aGcSpjJQCs+6A29KqKYEPFzMYQBHCboYoDERZRhUQX55BgRYqV1S8CaJr/+YYHZkpiPkfoG0LEkwR2ZMFFRGPpmOXxYWaP/TDXfrjGhyDmMvs9cyS0XWjc9Km/UaPCilwbGcE8QMvAGOUKVcTo76RHVaxQ6IyPHCMpcCNtzyiCNVPRxjnEcTb2H7P2go1/8cS7s19rNNujWpp6bcGvvNmK3+y1EJt2iCTnjYsf/iBIex2gQQv6nX1CglA6yBYKJBm3SwCSvC/+Cw9vgf9pqTsLs7p/G/a+fhv+I07RpM8RtEjYZYnfsbPt2xwMJy1FJpnCPGwCPmUKZdnMeJ7xIWTVnCV337kQ0cL+sM6+sCnS/sFud+ELUWOGi3nH/ddtbE6yYsVukQTjJx1EQOcJKTT90lG/kzPt4kouN+5NMiR1gHuU6GNdNIjLCOfoCg5C3hvjv8/vLh+tbh+kve0/Bn+GaMr6R2tJ8w2ccU8eCe55CjTP47o/37TBC5nD/re0xSiNXaekQCX/xrKcKeMgzNXx/u75nb8qjWzlUs1uQYur0+3SBOAr1G766oMcrtFdQD4M98TdEI8SO7QoqZnaZvcquKrCTr+f79wfbyaPUK/IsgEI4AyLLEMCVYeKnXxFZ7TdD4y8jRmrj05sJI8GPqfOH0ZewqO9o/P9jjIIM4IVs7HMRf1ptru6HFb84QKgBoXVuTZIZJK3PoBYjlPHTsSSlTGKwZOl9HBOzjaIodZZ0MYTknV2Kt8/5asXB/cOrlwfYle3zwZbYcz6PqEOJ8xLY5UNP8VIpF4R5j2qglV4flzQYjYbUXHdhGcumYmOQPzn0bVZNAbpH8/mtpizjzjrSzYq6M5vXrg+3LfHuA95VcHl7/uKpg+f3nrg5gTrgl3hTPOTYv2lMNSjCMY061JkhwB0r9hl+nqmno2JNLqiPYdtwYmdZPL/CG+k0Ebx6XcPD41eDp++EFMoUm8BipfQZ/XBmt2aBx1W7kT02IobyOsiq6eB7eQlUVdQbBjEec70xyy/SoX46OnIZdjn7cYl5Jx6MFj6yRJWgPb+cm4YSPbBMrB3RyT1JOlNmu8FwkgWmGj/ttowdiGhqVB6263/Q5KL/HbwVeP7ltnN2CF1K8f6UsBaZfszJ+JiEghyQ6YSSlKZCG7c59aSOavgm5qtcFBM/pR0w0hLm2YDFaTlji5X1MuHXx8sH7bY0Cq5uQlozu1z0M3ZSKuAlVVOA1baUSu6O0Ll4GLY0JYaFGSwhZF/AyBo+gVDQt3+gyr+Cto1wimvWT+pE9medJ19Ur3FVYgNsTlyHSOUslJpqwRGjAZE1IrIcITL0E4oRzCQQ5GRTUqb3zeaWpAmSwd9cRIE5nREIG12P4g4H1bLJFJwGc94eXw70b2r+XOFkB/LCBPHBGEwP4IFOlgbIDcP1CzsqGiEIk2pPnxdmLg4svATPiciT+LFXyMJT9dlj32GJ+Mu/KvgLqPA7eO39aiKRi6GXM+NvN4bly4xEcZgL+636qzmi8mtRt8OAprif15PU0XcWpP8Xq076HKVLQijCdd9ucNJd1Fnoj977lNwKQrwZH05DAVznjl9YjxCQ6apmhIgpUPsHiNzTTLK0VFxeLZXdFDNU4DbqeswT/7/xl+M/DHA74SxpnwXQtdv8CjXmSdgzX6/MK3e9fXD88vwirdrBNGTlm/KCFQtekmJDOlcXmzqYbBihrn/465QTAnBbExORbXcp29NT/Fu0tmJYa6bw7fbBz+WBv62B/lQ3FgNgATHT9wKa6SKbwJBuyupLaQKQlAyPQO/zuW2fVDCHKXEVJmDQJVuILAU46AquPr/LwxTejd5yzP2x53baUetSephPtI/J6kI7ozvjjO+4Lq8I9J1lA4D0Jwv8Pgm4HbePLQXgbyIvSz5MZvgOFg4mQ1YGpBqA62DQWaCoQcyJfKWHSGWAkrCjqJ7yLxFtJXEtM2vT+FJtBvgL1JB5A46L2VxjsuSgPRKe8IAZhZSBUAj8tBb+KmCdiEIM8uJSJdZ+xMn9c/IuNVK2jjow3ukwyrsRUpbIJYYtFzeYPP784oTJ0cO8HlqFfF58NLVY8+viRaxR/WcBNFFOufGI5A7IllowtHN62+I7C6YxEaRIK4bfPIoACyECQ0AvZfjZYpqRQhtMn/kk5YwmdKGHQxJpdjp4IB7a8WEMXiQc77PcXMjHDwZSlfJG1GJYyxhOUFQgTKHMAsUSgw0r85yMtEeM/G0vExJ5iiRj/zVgi/uYISwR1cRPVHPsbp5pgg9Mhx/3vTgbMnqQF75W1iZJK4ckk9+6IWPssJ5ga7X873Ls//HBNJlcPOojIjsMkMkn3nwaoeWY52e1R/Zb7NnR+kSgOj5sscY8rJDzKUwmz40EG93eHm7dHmyhDZAi8rc9tQuQZzGQNCIeSGXiVa3Mqx2f/wDrZOH9g78zD/lpNQ4H5wrx4cp4Dgs2FeVAPzYVBPez03yZZAIqbMwrFgIdYUQTDXas/mTG8kCuOkxpPwxQby8OVH8nuiGN4QCRmGryqnaAJR4SFrz8dU4RifwO97rBVLGdoUICV/LxC8dG7tw/PXzvYJS93jh4C6QkSVPhk+S3pTzR/+6acdqPhv+yNva+DvZ+Gqy/d96Udyy8MWykPJwzZzGvyd9qSxPAsekuJ5U94SGRFHPb5Couf7P00+oAsson1UqR3mThJGD/PfJe+NtZtWiAizHkUkc83+UGA+uDWFgcC29llfqObm01HbniYcNNr+HGEypLxzeBfEKfDi2omvglGAS1edOCTejuM6I0rv5OH5YcPqH/tXh2uXR6urBX05pS+1+36Junwm7ZnZ0GFbajNmQCt4qRxPJNskbaIHYvTLSKDw9iSKKzJZUk49ZtwFp/Ub3GW/nAKvvv910HKUUnIfJfasBHaDrvwxJ1ol1JFPFooXp3jMz3c3R/cfkRQLp5FQ4iH9KSsBOy7pOnRiJRRKfPpK32bRBsPLZnjyC3WHWD0dqc4u6izDQBsli2QiNZUkJUauQlzdPOBmmSOvLMGR7U4e9bYLpKgiXq1hwYyGqcbZ13eAqWRInzCjBzjG18cLv681PH0RN+rcdYDqqFsBh+duQYfBvdfjja3hi9XnFnw4Bp8CDu35vmyFw3XwDa7RQ370KfdEF87KrVNww1ePxL+xIP0yGuyJo6NPtaq4rE00a2OQ3JcnCAieaYSffSHOH8Vn0WHENrerCTGw/A89GVuh6wxIiImt08M26NmzpVBjXjphMnO28KkMMHFEkX9bL0tHq8BjyoWtwYXb/DlHrInhM+adyqh9Np2QDJCUJNnRqMnsqSBodPtClmBlfro4g/Fh3W+10P6HlExccz1ICM53Ir8zJdQZm1r+CEGAiN3iTGGycaeokM/bUKUzl1jZj1c2RwsvoOdOLz3DXwmjbcOuwyWAThwXOsFx3ngcIoqO8hgzOqTWhtUHr8TOs2WevkYE3nnADNtTBkTBYkmJoj4MUDgBBn7g/tY96bjy6YHmSbt/Z0Wh1P1d9pk4CTT3aUnB/sPip2bxeurjOt9TL+ITvEmA3rmxVj9Y6a/AWIx9XBIPlx1OF2eDieYt+v9vNimFNpk27w6uLY9ek6u+kTUo9TZpTJseYPjVrADMFPM1MtAHd862TrY6Ht+r7h6hawD8keazSHMT/iWRH8Dv9Lf+E3Ohr0ccTI52kbo0olv8fyV0f4dIDo8tSPlPz2izMuaAlG0A8BJRpNAFkmUBxn1U6zjFlR+4eLd6xSVxb6vKdfxHu7dGL59PFimlA3857AKmHiCV7gTRr/BpF46Jo4SdDD7NbkU11MS3Iao2kYVJjLtg+1LDBORXCd2B1A+D4pByPwiC3Ni9RPlZYnHs4w03N1IR8vhZ2DSaHxX4tCAY+MFnCGue3udyqTOqV4Iwn9w6zwPwUXUp6x855Jyfvs3ASPo55QpLRgDfFocg6WxJmql6iKSSROGxhJbJQz4YL64vwXjH57aNEgQWVCjATsdyy254yc+paeZPLL5ccJIJPxTMdG5ox3OL7ChjsZC460m9QyRX3idZsgrVwtmYZchpuVVABRAD0BpbdbYQi7WII4EXAVsO3xxR1QGIoPhoGnNZF7AEagpnJEBmD7GoXCbQ5MriDYltwwTPrwNaH2fI1OQrsf9kDpoDMSA4Q1j9mYO4DONwGJTrPBDvCjhsg86Cmk/O2TmP/sUU+t+uDZaWDnYvc4vBusCKR2VHQQiTKPFFdL0z2IMcqhTiiQHWZhBhnfP2OtOna5BF6CnTQWGz7pIBn7or7u/HIEvkPGQydxFFCC8BhcvO0ACxmnZBENRIDmC8JNnhhK+qNQMEeqMGTbqLiJi+Z1Gca0Eh0rN8aeF2pcQ0JUJ2KcJcMHBPZYyVmmvDGUVHx+rtfOt6qTBSDXAXVweDrQDLgWEDzQram9ZnfLbwM5YypXUKafdgedVbYphuatNSbeyMgUzOJ7Ki5ZmdPsEEUtRYTSP8m/2MSloKIQlMY9XvL9aXOXMNvIcQv+IZOWsw1c1eQPDrcpe1dTLarmrFRtl2KjBRq8THXSyOmoUUPcvXI3Q0eTKyp/R+Ny/KCt5ZcXuSL2qok2xHmUVKNFEjtBjKsqL/rHuK2tyO/pIuwfZHmFXCXCwP+dTshC8irwrqNuF2hXw62Jei3ZdnGvRbQlZGjzpIEkDIB3QSAtu4aEBhmVI6IA1wVgutDKgyuIpF9yMQxqDYsiqaoCLwRTJJKBi0ImDSxypPVlcT5bTFemsctkITFdOluWjEYpWHJYEoSNPxsWRK4HcP3Rljitl1PlU5zx69UB0RCM4DN89igcfzX3HGa/huhWOy/tzIkVDxGFs49bbXhO0s06rHvxr1XBb+sXYbKt/L+baUrOx1P7+CEut+evs2O8dZzEsCiJVX1P9Ih7I8pavs0fL6fnRqX29qm8Cyo6C2dT4DmA3ihtRh0eqMk7EyPvDuD+W6FaiIHgM46Oog7hBC34zbPhYqBpdlpMGHFPckdCa+WSrdFu1Qtx6i5gW+aRi0he6Nbp9vli+MNx7X1x6M7z1A/sJQs8e1kciahpDiWZXPOY4LhuW8VBRS8aVOYQqMeaTtpwI0h3MP2eXcyHKdlZllEGao18CoZE4bIDyzVfF+kOqCIaSR/mYgVGy4PTYjPjpHq7a4qti//Rg4SfWfuivPCShGaGEGpXDdMlTCVY60EyLbnhMTnUiiVl2KNkk03NqYM4EkUcpm/hyKcZsOVRJPIo1Z2HNFqW5fZYLxXCVAXQa7IRtpyy3pSRVucdIubW5mSJX5HaIck1uU00LtjuoDFFeB3W1rUkP0rxNthEh/AOGvC4gG+7/kEjg6/D2vcOz26NTF0enKJ46ok5BIqIaxQSw46ZgXs7+57S4tDHiCCt0vWkx3eL6neIW1xNmf7DElf/ol4UgiiqB4cjTPmhGM6ZNnHmOe1ID7NPCHN6CEki9+t3B+yeDi0uAVsUdZNYLmuiWWSsPkBhgoeRtSyjeFTdqJdrbz4Z77wxtoYpl3Lo2fDANyLwXU/YxSb5HOZfkh8BkTaBEBpRLRh5DC5gV1y4NLj2Fx9ACZjHWcukl+bTKBNxzcf+7lC/jaMshVkqlhpCEe3ECC6AjRSuIgLPjSCxuYMGVGT5YgDM5zu2oH1BnkptZcTImrebzSo0kN4CZh8O9t2gkXX0q+xG6Ql8PxkRymqSSaSc+X4CPNYyPg3ivvzvlDgOAb3CfE+5w7+C4n2lOIqx4AG8Boy9oY0qDfDehG5zd8vNyz0RuHH738PApgiMK3MB+xvq/2sj9VGPIMYkdR9xGNb+RR/ALjWJSZmJ9cHwVx629kEgXu++KBVodnFOvlUV+0NIaeqg/JGNsDiRsQEmJxrkfOy1iYkRmgINbO8WTM3RLkzQoDUBXiCobR+7qYZGdutxJpmGd81XIKOjnBlMBXTvoGLdISr1II/78QjwhYZzRs4XD+/NyJ6kDgXrfCET9QD/CBBMEoHMvGZzqav/mlo6EVFNt4LwnyXYPb78d3P5puPtMEvW2Q/RnDtrAuGM9bPZRojyVW0dpApRHQbowmnUloIB+OwTsoeLKnhnCoU62Us0Py068LHsaYRswdlsCROwPAJnDjH1IWSJhuhBkp/xKhvcfFZt86R6ibAy7QRAZx2whiQ6HgZwGIUcvQg4E0f104zg/xQt924ePbx9szxfLp5W6bw9BqoJU2RHowqxUbQBuz0jj77/Mm/xWgS6+1Yf3UYhe2WMUGqIrt0pSMWULTT2pqbMnTaNQ1Fny/IxENjMMUug9LvSx7Whx318/rpWTkPT1N4ONxy519B0UVFHHm2Mcg9AKVl9j5gIUtJzX9TfFzg/icYh3K6L4wlZusrSBbYqJlymX74RGMvNSDBjG1vd3Q3Kdu3Sq2PgO4MLgxwU6Gwg0vDyacoijP0fXUCW34GYsmQaYEJJMTC1uIjZ4eINBCNAix9pWPfNNUQy8o0YbYTLlR1wLF9qwoho0gv45FZP7Ltt5SGhOCSL8dC8S0+Tw9HOMNbl+pTj3ju2SGBk9hRGpHgbvCV5zB6nQ5uR06PBCgWSUgRxduR5vYF6WV9clChCYSUPvZXIp1khPQIr+m5CLUJPNkh+CPDgxU+HLPPPMA3C+wsP5eZ44BWbEmMsVZy2iACssImmtC8UEzTLEUlL99PPDF9+YB0ZvNU3GGdApIIwztln9Ofsroiz0Jj9i4zIQyjlJDbIFQEFP3pYORqsOeyuYOHAAKGBqwoAYs5aLk3yLio9jjGNprGLzTbF0sfh4244oA3laCIweDbnETH+DPZ7kaaiN5ZwBcusZp+9Sd2wgO7z1fvT8O3bHngpCLADcQf8x9iWneOsUQLOgxEbkd9lMVgaJaI9ieqPTV9gPvuuhC+hXJLDfQeELrFQO0HKXBUpZ+hY3FkAAG+nbiNEt1pG+lj4meG1hdVwu3WrkO6oJmZZuNaT5UhXv08gUheQHVzBBIWVLI/peD9bgCO9FURlLiuKXtM6SwmmVsaoOZhQvq3K5OpCj/Vi1xyg7Rs2x+Wj5zVV1kf4G6wlnh7c+Wv2jpHhI9d6qNrCemZ3DbjJl+G9ReQmNGxBu4bco3oKFLQqm89C06QneAA42ILgEQx0AOg49XcBpoaZFmQouXdhnoJ6APJ1i/7lCMTFtdu33Eo4zIG4cv1mwI+jGhTQTwIyY9vKI94QDVaSO4gFpjggedFGUazkfkYEx13L4lZXhLLW5GEWKEhpX/PYHkK4qWq3kU5nnijoj4Fi0qYzpovl1XMS4AsvIKUc6KbevMHpXwimfn8Bpx3ms2bbCT8fYqLJQ5ZtH73PDFA2zcRlMma8YbmL5yLgBjdr/z6rxzLQaw5n7d2I0M03GYPa7IwxmPPix31ljWeSjibpL1gq/m3PesiDyAeok5DOfALpXmz2X5sVSYVzwYXTjTHFq7WB392D7e3HyQ18D7W3LLCBhT7PjC01bnUUcGYRR6kCUo+rd6O0zHkVTP9YBv/A4TB4QBwUugoLe8ac5qeq0xC3iGcEQLuI9xsyQcxFbPGwAmtnSMPz+dnHtGwDN8HU2bnRCLKgSoYGW1Wu0DiBBHI3UE2ngwaSyKhNkgw6MwP5hRHW0euXwxk+0V5God9ywO8cHkh8lYZcwvZzGi684y30ZqfTzn71/9f6e7I2wamxD+vO//r03uPhx8PCpfIFHmZo40j9Mov8PYvYnynwxAUSYU8ARaXv4TRTcGsITfoesspWaxl4rs0VJocgvFpnj/EPnxQIF9Q21xIDdZnI3644QTCc+OSstHWf9nykXi6ujzS0m28BYrxJNQHtJ3SEqdijASg2mb/5ABuA/yCWBJPk6YKzI0nExZEi0RnFptZjfhbGHK2scsJHBqJ5MoBGIh/ikGaDGyBizyXrnhElQll/+GaEaPPDO1PgkBi8/Hux9U5oEkO0B8hqbRxIGsIOxSDMPDTPpcl4Q9I/HdgpQKf2ESX95CVYpDOL0Gjz16O1jlVL0d57QFS8VYS4pMYEOsXCXuchgrGxg2qioxF3ePh4unzPcRWdc4i4gSWLQMBtBzKVy5Vsn5gwYNfSnbHlSv5YyVxfbC6O3z4v7W8UHCjmsY4AhRo9iX7m1CzEYPaHylULZh9OBTSeDMnnYD7NMtHhyyyXXaYYB4nwRKBjrD1xKvOEbtKV809Bfp2ob+Fb1JvTw8YODD3fwfbL3cc5LG+nNIoXx+ZamlmtpjBPVI2io8umTJQWKnpw/hQEBO0u0yVc1hRdCX9nSjviSdBO6ch0svCourPN9a6b9YvFijwGgKZFAf3SoKAXuju5HntIwZR9WidFyIhsn9A5+8s0vgfODMBsJzStxYpQkH146nFjyJVpeDO+91WHr4tiIwB6dn4JKGCCyINKg4AwOXp93yfdot5Toa8QdQuR6MEUpBCUYryOODFiKbeWEBM0cnr82XNoqrt7i0JlWCqd51k8amD3sCMo8W4cuT5LI4RyJEE2tTCnFSDlS1quG7xjAZvNoszfyIXQzM0ZvYEKjtzvW6E2lQiWvB71ZrIfLg7HPhY8RCDiIpiGm9CB8OwLLi5MYrLzCNCHb24PbT+l2j0h6PdBUpAIBhgsz70pjuXbHODmyVFKsOKYzz/kXfGUpKdl4a43gbm0JdOvBRTSDnkTeD7xZ9iIcKboNQvrCxHJqSfFSv0nLgQ5QlB4T65L3xO1p5afB/QuSsgO2PxZ61/2QiuTh4IEZAs8pcQZuqYWq/czJYQEZ4x4WI9gwl9NMKK50zFw6gemL2+mE9H75SGWTPBiX3gBWNMPvAX+KIy53gTUutPPBh0fcmTJazcblfae95ZDUtFp9eMIQOLz+mgnwrlMS7K6bkWcE5kRrcBVjaTINVH6FJTzm2CLxThnuZhFM1nQZlI49EFWCejKknecolGGKTFkOhiXtAzn0aQ4DgSI+aM9o2cRshhGl9QnIzNemGyYOXJUSHHurxZWzQJpjtaawIkSkpUEoEyiZ0A3lOBE+jsSlyZCE3dpUmwARPXywPrzL2ilSxdStmUZhkeyyglyDp1l+aTtowXPcjuKM4xtgvC4LNYxIuYTWhG4YTcGW0atImDcjI5aOcaJfrWTsSMrd7QVgX6QwxWQplIDJGTyXdZdIGrdDrPBRHyPFs+pwtBnPqrhwTmkiHRE4QpRk4YlOyMqG21jnRiSFZWTabF2SYJ8L54Yfl4rFBY73oU69bEqwTOJH/TcCPWNO0U4NnZwOq9kGGOnWJbOmKhk4DjKXp2uH178tzp6GQVhNr3HmtYZLv527pI1eQXNlwz5TONie1zRDDXQynGyScpW6MUXO6G9Wc7MaldGjrGrzqGOSt137Zrj7hvO3lbSkv0DDMAJJo2moggu6PpJ0Ki6tcRGXisJhtQBjaVGVwigTXwL8kwG2qBFlSO/g6Cp+LuFZC2LxajzRjT/6dpE3vouIDZysQlQDTB0MKUxNMaOL6gyUsyCuDN4c4GZBmwFsDlozKeEdbFXGN+UkyZoe2fxBNZmAfqIsAJrK9t63g+tosythDSv9U5X7JRxhEEQJOqgEniB3jcg18tbUQmcFb0yTM6qbSEXhTRL8XDOe7lRqjaSXEX2/QGjJXbdUDVhZ4/3pihVHoDiipCRCjPBw5MbEbWR8KIlBCnd0mS0hTv2k3JT4qGGhzHkMCyrxH8N7DOMZN2LBCwE4/X94/4lg71jtxvGfjVlrYk+xb43/Zgxdf/uHyYYu7lI7doxE+bG//YP1DpsOEn/GjQHN0pA8KQjdhZmJ5CInDnKbjDgWtFjZPLz3k4kFBdSZaV4VQ5SiGsRpOar1d7ugWJLs4V/1gl4cFt0BDvbe2QHqGPDkDkAXJY0Q/TSRUDvIQuNWK82dgFyDgKfy7TDenlgPkoW68SMpbiwUN88d7N3gQihIi5RLKrY4Nlx1GLHviDm/jXFbhKMli4kzzOKt4cp68eS5GSmgu5fSSG30sm2XVq5jm0rLhdkRarxQg0fnzSp18+OJ5OmhW0GeO/oqcArfcCroBGSsE8IxJ5G0NPXmkAnz5SFTtbeHAV3n1IOurSeFWQHQlaOjxDqUNIvpYsEfzi4ilXH23o32v8F/N9eKy/tSgytqNv2WW5GN1gAL7Mlo/AjcxuMdMVhlCLM6PIQ4+TaDGa7Q2F+fQd2UQnqkDVh8ZK69n18Y/HjVTfKVAteqlfLjWWpunq8vUtOceJaYDZRSbww3TErbQsTVcFia1Tipg52t0duNapwUMKNWPZFUB0zE89s5YOM5yQLFTVQ5UkrXOoMYupwZkki5yaBijLHAHJtsbFHm77Y28gz2XUSu8rAIJ6S8m7EUkBb++hRsAkA7h1zIGPjkCeiNdTnlzEeANDPPEOZqapw73W20VEE7oG3B0goJA0gozq7x0gNZzOGjcFYWga64jbYUcPLSRIMw4uk88qiUKIj1sM2VgfFR4LeQEwCOfnwHSjOsGCKXHM5S5gEznprStKhNilpkCIoZkYE9ESHMapB/mRzT8Tqa7wgzbGp1wcB8IaAh0UwANEb7K1LvMMlL3DOnDsS+EJRuRLG5vZv8E5b+Vn9btiLSixtu3Bqs7ANU4xfXwxfddUejLGiAqCSJOGCz/nrOblk1qX76ksHK8vPRq5vwH0+452ben9hfLi+k+3B9n/t24lJfdOHH0hp1v9YIAra5SnMaRxzkGHJSVEngkFMa1imyFfbXKLPcswvF1cXBhXfF5mPJ3oS0YIe0KXm7XH2hoZhJk/UV/SLNVyGmF/iSRZBJFpvfFvuPCGQxPZCSPTG/xrVQ/NmioMsm8bEWjgXcmbblSHa3B4ubDP0S/CMv65JfnEsSldTEpysfaaHM7jNJIBexhiK77YgnABMe3rzDngBCmLx2uoEGBqtS0eb4K/0KOmfNSVyNUQJlLePph9HFV9ZgTzqG14hVTXZ0FZDSbeKn1UaGD5QZfb1CHa+RHzjUgUD1HoAtnrQZSjbJGABgWrZI8tKIyxYbJWFhiqvfU+o+jFBN/QphKk4hFxtKuWPbHOJo/EaznyF9sPfNYOWV2jt7ftfg/zLQmgCu0EhiARbKeLofefReMNbKvCMfVe0lwv1HhmInUFHbXxPxOry4oyimI2oA2uHVXtqE9/KGVUy0NYw1i4Q5js5ac5zUYXDxu8ElSszdIFNGHpuaVQ5pAEzNEllpMMQ8zmPE1ABx6Z0aJm1phmrexovSLI2JFH7BynMpn6a6J34SWCcEgCM+78cLxdPHxbU3ABcpFCZFk+hM6ChjQjLkPOj0peGHqd/mPFUR34cCSszYFjZ6+2PxhO5ylIwXS+R4nIEoqjnwWb7rOw3ZGbPr6cslV5D7Bx/3+bVaOOgHrXqJpM6Pv/a4nJOSw9RehlTx8QKnMeLsDDMuJmNrAfpbBhaUlRvRA/aEQEpnmsONjwArzTSbuIx1E+JFHnP2safdh6bd9+kFBzO9O/iwZJ5S8zqQ90HGKjF6H8hHsuJJYkpTSYPixS4Nbl7gIhr8GvBIwplExy5ZNOTGsUZ+k8MXTmq8KIdbjUNLcdC0JjpHkYJkXNwRQKpexPvY1bRUCxrTf0AlH9NHxA5k1Q6rbUxQaVQtaOgnXuIFLv0G3OHSIwP+teChheJ/OQa36Nti46+gZAceO7B4DAtPgqllfOqi0hJONPDQAEOL1TQF+dfBXgnlYfZyMQChXcZagKrArIKTyOBUCxjeEDYy4TCAbYotcr0rYxvJM1sCGQZYOJDCkfxG4Lsy3kh2K9NLMteRtMaWI3K1Iq9LIs+RdCUBZ+SaSDQrdFTimIOgAsuKKhVSKhNcYeDKASMDHAFgOLXwaHUWx4Wma9EfB9+ccnmywzwN23RYpuGWyiodLmk4oyOFjeRV5mX5jHKYMnMxjEW4ykQzU7cbt/7HBPuStruGJedvrUVJG40p6U9Hm5Lwb9Njf7JGJB92cYouTZ5TLsA0Ur02qRzApSVf0C2cU0Lg0n7xfN8WEpCebkEBQ40ApfkmgNKQDbjskoBLQ3p49wxDS4e6QZXwQinbCucloS9zkoUAc4Ws1igfz88vyAh7987wDhD6YXTqCbsxnjSVv9QR1aHgfs7ZcQ64skPvcP4qcOeJ9Cqsmu/AMM+ccvx6uQ3NK+wu8kM+x9cInL0VXUY+3C8urfHDw19T+Iw4OHB/9BeThaVvWdjhOApMmoauLuSRoomQMWna9uLgwfJo94UlCru5YxPP0q1VIsYA/R42Eq6fE2IOWBMUeuoph4OmqJBhpT6JMeYMtoFLxnybTIE7g4JunFdyco1vcPxhEkyxZ6ttFvM+O7o+QodnzPKqT1q828REr/yY/JfwpzxHcWeXYB2iSAe+wTXebYsh6HV+fjFtIs+ZcPHgfLHzRqfewpA+TFEkFyvNPAGlgYMG6HYFGhIfwLhpopwzOeXsZc1BbqWGuzvDu6/RUYIvpvwAI4DSIMICNOrdgA5ERJNom2+JISwMHmjtneOLfuqOsTNTyrhiNPpBR1AmU97zFArVwYTqDBQ6aMHvr+WUnLtnUp/Dy6NLmFvXDu/ND+5fPNi+NDqzzWVZcI/SbOuah4cHQHd7NA2RYyaSR2+q19piB9K4VCbOoalKzosivy2R/g3QRwBiovMwFfjMyt+Razf5fhS9DlqW7qP3h98tFRvLo9OrTD2IepQVvo51ctQ2BouDXiJIVHYwxgdk8l1oYs6Wl5SR4A3CICaKLOvVucGPN8QfF4li+qaWRALWEna5xPgJgkSlBoU4AMV+fkGbAj2MCNpf/P5gf/NwdQ/GQGt3mKCFypfksExFEvwndUp6xIn+mTwVaWjYqTdNvRqa9OHNfb4fDJAIALemBizJtc5MhJuD3JCJJb7JJNc3Zep4W5y9SLkOMILD+HZRZ1tIi0g4xSeIyM8vMqYwfH6ayhKi3iBGAzi1WCUhkkFjLFmAOnQcaVP/Ed5/32hxRZpDShkM/BzeTJYFnVzgp8+E+H/MROppbL8rFWLvhoEQPWDwg3evaX8xQe94oj46SRhH5un8sAYnPsiCmai/ns8I1Q7nCeOCtZ+XEqF7/hqggsFD2iGNThzZRyaa9omJaPlx1R+ByJjHJSqmUEIU1/Ew00HOwgSZQ+Zzsg/8eS5Myj9wnOBqmOGFOko4tvES5HmwOrr1CpMRU/bfNMBevUivdTHNGG5yMsnprHmEmOUyzVkzCF+9xmRo0pYK4mCfUrBnwKdj2m8o50pNrJ6glxYdu4jjWVHUI2+Sa49LT/H4XbpXvL9ZLG8Da+Ir3imsh8cUM788pFGrzYg9KTtWGUFduCRbsDtIsb19+OBbVURpEEfvJpEMwqBN4aVx1wfQGiQ1/vrpBhkWJI/cjacFqXwdvDdqxykmfdD6EWjI07kSDbEAUGej/2+fZeVfe9t5UCkvyrPeFcZDDR1qYDdnixXYU8NUqyTAgF4l7PvfgOfJ1BVAyaL5YMol+5cHJ2UYG0iBSZJoisL72eqdZKkWpZd2Nnlj1TCxeq42KITQyReACbGvXjP5AhpRmJO3ChHQan86jC6uaeEFVnKV989EzZs3szLrjaV3kqYviazn/CbmtOcbayeyHtf1m2eau6Mdahgu+S5r3Ta6kYePRmZIcR3MmMjkUFbgen57eXjxAtAESSHraUiiGQEzeakVDp3tOqRxxGqHwydsk6RskyOoruKVF4Pt3YP3dwf3d8UegRlOfU2kmsRNs3o+fyubzxA3dF372elbbD/DtBvWcobAzotxzTQysoehrbhwisZy1F5Zu8SPDMaKqxdgDeFf8kfyMwoO7ajAJYLO/IheaYZMT6aHlGhuSIAnN9EliZURq9I4yozRXqzSQjOZk8RHb1RXoMsZ1Sgm6BIOzjcQv3RMzdk0YN7Ab0EtmvE+kvoQpL5fPTy/aDC3A7cNwBY7vNwno/mdLpMd9GzBZwl25jIGg1gHeDpIUAGgC/sM4HPQnoPzDMCzAEbxXAnJuRiOgI8CINPP9FC4U8Y5BFK+gE0cPMHek2UE4eKQMgRBwa4w4QhJ7ghxlapGmmptAJXKKo/HZagryiaJsYroKgktK2pUyEh6MSOhBlsrLKFK0kllgMP9j44cy8wmFT7r8txfxMbLDFz4RWwZBSEZ/LctAObybQLMJsVBwncH8n/iThTQeotZkuHAll8ol2AGIdxhQhVCNtV2u3+PcRhh2mv9y1glwol/YqsRHkVBKxJO/N0Yf/54hPHHdPOPHZN+3WN//INTDiAK21SU5LncpqbxHHrVYpy0/EiVLm/M4ka3Yof94j5uFovXUCfmWrjNTtjphE30VsFiIeK2IUMEeSeUUCvTZJEC6jt8/+DihNGdu/8fa2/W3Ea2pAn+lXiap7rX+t6qW9392NbWNWNjNvMyZvOaFgSCQJABBDIWUuSTdolaKYmZ2iiJlJQSmRQpiVRKJLU9INP0R4iF/2J8PycAMDNv2ZhV3RQOGH4CEee4f+7H/fPhmxeGE1iqgwotAhuhMvkjpKm7T7jyif5Jl//Xc0df13ntI5dmO6rz31qbI/xENddCy4SpkTyYwa1rc59T1DqZkqWNeA8EDy/9jLnSxL1nsh07E5m5tJmUrJW4Wh7zL8pMaNjoEJHrw6/3PlDwJ4/BUa+XqdfpRg2aCXD2TDuVrNXVqPWevcE2TGTXUIwZXewI1oIFwR2MwlbCRVFEl0eZeDPCGjI4e3D86D6zhhBUKaIY1DbfDv7T8B9S/JGnV4R1cIW+l9JsElR5qSzPgT+SYu80qpeZlW6lyuaWReSYS8a3+0I5ebYxJxjbP0mfUSyT2T0z2L1LRzbxXNikFKoy8+fQcz+WzahPpIyAPpbl4D5e74B+PUQyNJdLk3c3Ea8xUI0LdodcGk2KWWfflhNLohnuXhs8/+Ql0UQF5mRUhevdyme+WxXFjor4AiwO3RP2CEhY5XZh0dExrDRbSPUz9Q0d68CA+4gfLLdfgH3EDxbpU3KAjMz+HdbGxLt7tqEqQCTZqSz9KQ8pwhxg2o/2r/Pa1Rls/VISEYsl5FT5ZEJ50zNGwLTdIMHDouqNUlODwt1lwJ94J1REwVYwaSIo0O54uC5r8XSJRMZg1GZCxut80IOZlURA5f1VolXnyKuwoCdi/R+e9q5e6j1/Irlr6E3NhYIlVK6nAkQ6LwZPXHX1ilTnrIJEzz8s8u522ogCLnbkjFIZkUpFAnmUwPLrVi6p7keHh+ByD16e4Tx3KYkEg4R946uCDYPbgLcKRKLBcBLIb12E2UsPc6x+iRpeuGBshNyX8rfrC3hUwfXSdLp2bu3o073+hY3+hQ8WGshLvlqfLovy/EEeEH/bxI0+XRJqT1eFugdMuWj06jlnZOQjH1qstXkP//Wvf4WfUOeVOzy9DNsYm3y+PtAljFcWkkyiYoJwhowTxcZpQBZxVbZwJ5jg4YszbKtQoC5lzAFvp4gInsUATVJ+bzSE+kyGxKV/tUBBGc6QkrOv4csz/fM3MRyz83j4+gE7NnhZwGI0Cs2zWHIDf5YYjBM4Gn0hmfaw9SrTbTkAGezDh+F8PsvM26FmsoScRY8woyD6qoioFRMy4/Rknm8e7Z+GW+9fut2/QGy4YT1YWBS6UV+63XgD9t+oVkOZTpeBMF7PKMhZYHjujThhFvIY4IJsaBvjISLZXWnSQRnaOcYcdMZ4HvTjR7zZezeGZ36m3NM6wJrMQuWeNF9l6Bg/a0/o6MImue5Zo2DvUcdZdxPrEdtlnvM5ShbJZyHp2f6e0wX51vnAg9venbtwdHgVGc4vXT/a/4mJWQGF4I5EKdUJ5EGTeFkfBzmJGgvNnANp/k6ka8Cn0upKbKSaAWDG8ELMrnKK3aAaGHNhoC09+vBghqjZv1f4iNS2r27BTQ/fPxMHajadCRba7VIDIibeWT5qho7senLj31dNNYliO02CPLU8Q2RKWVw2JSUGSW4IjR+f+dp7+Fj7xS40HYMb1iN5c/Pn6uKk0wWipHErdPDlMVIz8SJtOoVL2TkNAFxIzZdllGAXYrELDoUw1E61O9qpgHwEanqAZ0Xy0OCJgZOAyuDH872b0lIBl1GCtQri63vT6DJNpkIaEJiDJ8STYrE/fQah9sJVqHuICcL2hrNsKBdvfcyuSW6jdnNm4zZceg237YwbOMizvlj/bu1e3c8fvVl6AnazKExudDK5uvpe7l/mI5lnZD5R1YdhNGOOkLgs5qb4Doo5FuZSVBwJ8yHEgfCAP+X2wn9d5bo5DeYxOGeBsLeBbQe0DVwLrPZBr4O7o1DXR7kGcUfgZwV4qjHkGQ3BTkKu7roTsWQFRo6jvQoWM/ylyKuCjTxU5LCQwSCHgSoQxQMnFWBiYMSDIRWcoPco/xR8awCB0iXOGzxw2MA32c5YVw21GWczy6M2k297MeKdB74FW1+yB2/ASIqFHLVdVatVtVhmpdQ+eZZDbYZnL8xGOOswork9k+Cpa9PUqqZ9hetULW1R0a74LEmrskqt6jlPw/nazTSap8s8fWOaRtumOn1lmopV1Bi5OewP1nljYanqV47efPQK5TevjFv46d9PCD+5P+989+8u6iTeWwE2hdtrdfyPmHd70JYQIOKn07f7X6lUYSqoR4X8nRYx4gfm0Q6MopbGKA2QgzbfbpdNbifi02kPzmz1z3wyOm0T7WI2dGO1uJF014ucq6bHRhAJtzHbhotgv/7Sp7xEjIbi34X0Z5x3Ip+M9bsywrTf3c1SGDwJfFC3L5Y8fLkE94lw7+5LnsLEj9wwM7mm7sG2yoxav5M7Tx0OiJ8CPG5q6flzf+n04MlP4GzrM24lUXMe++nqU+b2E8pA4T9rku0/6/FJKg/dn8579Daj+y2ySFo5wJeSe723x4eQIoaLM4LuBjXzOLwxXP8wOLfNbb+nsO9WQRc08Qr5QSbCD/elbtR+jsDYjaz6K85dgBns/v0ZRl5GwZpEXkwtqsPn0NWQk7Cvp1kMrhk0LXSNJjE2KndoIvBIUO9RZYE6OKxpxxqW2tu+B/pcTBZJcwFJ7DIXc8GhxD/4czuUPh0Zw/dvy7Wge4jPdnD+/fGlK/3t570XZ+m1zTHDZppXJVbuWMdaLobK7Ta7a9PC87jyxZfmCO2zRoRVeakAoepHauHLrx9fkf7ssy/655fg/fDPrqdpC59pFkXGyUdSvFvUEXeDf0q0SnX3S/odbErcCjjdSzS2DpUS9KkR/A+s0Tg8CY5RbIAnwN3GB6tXKxfPpoK9FuERTbcrGs+bwv2EbyuzgZLpw1ymV1CTXH2BxIFfLrNKqUiw3wIOEqDJmhznt8KiTNJ8Sg+lJ3/DzRbovBZjGDQpVV2/w8Pa1weDj49YzzbRmINPBBZdLlZtLoIr68dmi5BeI86rM1UaJPBMnkaXmdySwhBk1Apacg4R8DEbxjz52IzPq4kK6fQPbL6nU1CJ8XSMfyM3GrVMifsCKnpQJFX1Bsn0blDEjmm9WtqsObWBnAEddr8akpG9wcnS564cr15StT0LV9lORAmwIP6i90lfUnpGy1NuJmxEvaFY7zb54tGbbCYxAFo6vhFLg9kt5P0TcxeTwosZvzHceQ9y9V4XEcfIraoc/yiBJVVeusmr3CuL9e4VJY/dqmILsiAATxOhHfheGFb5iHOw8kTDbPVoIW23w5NhBgv5T6AMkuttNKpgRZQMjhRmG3JGJj3ORTeE6nKeDnOrB0/91Ye9/Wt28KQmpOPDb5EyerLFg76lG5+huiy8uewHyWwVu3IqJKvgwv8zNKABJ+0YOa1hkP6jL2ADOAxSj/hq/7yCR6paYUbGvPtnuZSv7ak7ED78/NF0ncr37xdZRzh9FD/ovzG9kwOQe1S0ikyvlHly6Tr8Hx6m37jKIANWC4sYETiClWTQVxIstKrESLC3YFhYRYflUat7GKsKwxS8mpZQEg9y78Xt3tYS6y5wdJIwmpG2IHSd6zuDV7olIAKqt0Oi7HZE2rguaKcNeGOEyUQZLPIQq9WGEd2/edV7887AGf68EMDllPS2UkEV/SqCquqVJVbvlWRXHp3IHrvfNjh5HbDSEibwP+pGkGaGD3vP3/KJcT0SKmOrSvEu9Je7G7QYq0gcDbGSdBcT8iaobAB4/2U27SE1GWCohuKRBYqquJp0APqyv7sDvqS4NXp5PiqvsjxlsLKlTLD3lEW67zfJpfyQJ9bPORXs/RPdPFSYZBlvg5r03TDlZPJ8reqnins07hVN8F08l+VPukMTfCHf+wgL74O5CuYgjLgGDtNXoDyH6GbIVfLcgt6bz1izoc5B1TEQVO0BbDFnxBIc8ZGGJu7cfIZe9CMfZHtQ2BCwpCEkRFxIi/Nu79NpD+mOgFwfOCqwjZkaHaBs/+xu5Q8qCI8TbOzfHpzTfFZGcmIRBMbZ6k3nuJTiT4C3UeSmyOpPoaoRSOXhnQrW8XCOgZwqwrG1/wfQo4I6qpjgPwUHKlBA7KhnPqvW2Ayxs5K/byDVennpZTeucpSsYhCdtfo9U+XbqRGD8sfGZNSM0EpLqW/Hn1Xwk7Q76zVfPfpa0XRhRQuOh99yrN5KW/8Le4uNcUqNfmkhuAlXSRBu9BsLw/3jhDCcXBB99x3mLX73Dy//q5UIWTI1BZiKibMjJBqmhIvApIn1QirdAfBEktFbgxIMrYPovTUEcZ/fcqtFzAXj9uo4hWQip1R1nsa4NMKMG2YgB1mhsxT6gmwS4Y1k5leeYuk687+6KRaSLJQXnyAfBh15Um5YVta1xouHk8gb555PiBj5cCA+xQUyNUf4gQ2gVp/0z7w++nSrt3p4tL/NJ9p5HotEuA2UxsoduZPtHqozg+rNpqRKcXwqOTpj7t86U93ZlBj2e3B28GRsblhEop/gzYpPzs1wiJ5RPnRf1ei8m+q4atTwnGqo17Fl08rb3sXrTAqGAhoIuzRvHJM6iesmS1VrYz4TNlWhEvYCNaj8UrjvBToqASv2cFZOgvqfVobrG72br/k8aIJMTvmXFirUSi7RHp54imD5rHjSQFUgtOjwX9zcov/g3fFPO/C/vCCKEJ4B/Nfl5bTCuVhkItLNYzmudqMzaSL9Mdc4uYM7ca9eHVw9S+1fi3DeE8p1CXXYD0zqgklQyNodhEw4HCmJl/yNlX961+R8EdUzZilfU/kj0TPTwW/XGRV0tzFtiB5vd4PTuvlb4hX+0r+93V89PH5wEx/35bs8QgZ4ehrrRHC6BWw5R61g5QPmPrHtHr0/vr1YDl/H5sQ/+Xab2rt70+EqvXyLzn9E/oIwBUd4oJZNRQlTpgIiQpq3lHnIxr+LCwmtb84Hksa5mXH6A+3Ij/0f3xwdHvaWcd3m81E7WChEhCYKtaj3qEnmg2scrIw5ufK/3YOmJDeBcPi/4a27fOohNwhGqqUt2KfKBNzCZ0RQ1OZWpzikVPMbCTH84JkegJppppw/Olg++vr2aP/RYBf3A4loi0AQ5ao0UKD8UyXIeSxfzEey+FfGj1JLMGrQFjbqNhYEUv85xQvS7lvoYo/2r/RuvhlefswNbApHCcNyMDtQWRc9cd6whHFJeXmCMc12f3tENiqJSNkcsZdj6HonIeek7EhkrRHVUha1sKpVRF0qG4GoltVD5iSoqBYko6a5mu0IzAtlHrbiortn5BsoXh8wl+HyJHjssmEJziAa5qBUgF3OcfangW0reDzqxEktjerUt0f+3d2masBtbkKN6HK7o9RXwy+3eks/Hz+9NXx5Ua4I+HImTsvwEamIkY8mJ+gecq4uaUKS1X99e3AXgR8JC+hKa0sUz2H35pHe9NSmaOI32HNbmsph4FCs/ODhzvDKWZiKrfw8BRVTFTE6l6dv/YkyIotwcjUCzmI59u2EUm85LiRZmJpKmx73JZKk4wl1Hkq9eoUAU8gjU0l2ERLMHy6CYzy4/NZ4MEmoJz6d403kRKdzUdnmHASSpCcCLAiUEUU18dp56TZJsaoMSc3p+DoqMniU/InP3DGPEKnbpfcRphZ8Oo2d0W4guy0e+WfIVL6QzrSt6TfRK4TMqVZ0D7PpnAT+eqYwKk7NVNg517t594jqg5CZzaS4hCRKsU5V+ec8GPnjXOfL2X2ozYi9jXyzpf7d96DJ+q+eaktM70zc5E9OgaLTXcmC8irDOBGKC7DKaXjlWJmnpCEZ7LpU+MKippDMwmhMw0jEg/C8HRl/dRsr/CkVVCAPqhEhsb67cfTpAaAe0B+UoTJbw5aePEVVQemgU002qWaaeuJH9ZPNYirKfoeqp4x4mLV3Zy2WrshREku7HhvCZgqsXvsPd1mxwnfYAxn0Ud01KuI8x6QMfTHgh7BZ2phFLVcXScPXX4YHl1lYnhOlhhPGMwfhnFhi0JltrASXnYDlq3ostn2Nd0Cjnea2AcDPCM2vYBSqQypMxFDYROScu6ByYK0n46qVSlhwZUxQhnhm12aOcVaGsEKPn+yZMqQrKz8O9meZcv9w/hzCsuPOXiaNPHtapCStt/zKHn1aYJptLu8S68G766A8i7CFfckQ2BUgtk7gePK3JX/Z3VgY8aWO9h+YI7Ugf+j5UeS0iZpyvpq+G0+UKSoSxq+JLtbXJHdDi0bdejeSuFC4HNkSUKp6fU/6927YzWZo7KN4TlpE8J0id6kzBN4NI4MpmYLKLbMtYJFyDooCg1ANwaQAYwtwRpwVhmUn+KvmQPquY9VprDhsJ7pqI87ZiE8mrYOm2AnzvC867634Xv1HP/m+l5wHZeH0iPNDmtd5JqB32TP5A5/kRGB/AqofgfMekJdzBx86n4CjDTz7sFnhrQvFxNOhh2wN1TKkdTDUB59cAGsos4IvR8Ce0EvFrVjY1h2KNOBYxXIsQLXKuHoxpaLqZATpVAFOBdwYrqmAGr4eQx9hLg2bDW94SMNAhiKMMSwQFqUCgVEQoAhggvn3DfMJiW5m0j0z+Dvmz7d4ztZ5lokLOIWXz7NCaoLGjI9nd8QCgrlgCwi2QgzFyAXuX749MEvgbABpJl8bVbWQKSBRmP/sNaICRyOBiK3aMRarFO3/NRoJHP3SIoETrpJI4Og3Fgn8txMigf4F0Xf/5tHKU6RkEWNUBBk6cfl9xP1HokS4onWMkzsw+HuH+87ce9K78rB/A9MqWyEA9gUXO66KRZ2RSZmpyQ0zOqFhTovcFzz85aEJjkAZeoLz6emUQgw5eqqNFP/cxoi1NKLkExL5bZlqy5h9Abvtsez+6xWcYflGb/sZAdmwEaiM0UnagSJMb1B5vgvtVuRmCLCrQ9um4kl6F34afn3oy6D34JGGNbC5AhavtCWaxE1hqXEbKwickmJGtZgtZ3cD0Q8SPPPjowb2TAg5PLc6vPEBf+nd98wMiY0hEbDbgZb0hMvAd1F+8ZzHchoMAzq4qIoe+XEs3X6cykeAJPw2Ufl9WDB9F7bVVeJERu3qdbDJ9UgUAyqaJMtrfIqD5XPHd3aJ8rCFNSMBkgZIF/cEo0rI9sXTMatB3XMO1IhLi7o7u9xogkUgqZKUtScpUSqFyVSccROJPeQnIrZlx6BJNyf9bpfPDb8uMw3FFDErR8kUXSyMJiLIvxxULry1RuDL6d34OPx6yaQV5Nd6kvCUoyMczVFOdV5Mp8cy1kuusm3yLR19WuMzYLrK0efpz8u1/a77dTziiTNJ/o+jC+Uws52C0eUWprINvcHRjUh0aqAsiWAAt8VF+L813XuduIknFXClnjWGYMAJaatE8gEmDJJ0Zq4FhczdNC3YAit07dLxyovBD9eO9n+keIubKKgnqCM59yAJMbULyfajZps6umBNM40R2z6PAQzpsJmd0R7n1KFvsHSt99OP4MQPf3lKN0oXBu14vtp1iqfx+k4lOkCS5SgRpDE/BMtxrafiCNlK+dnyA/cG+GFT1Xt3byEYeS7EM3qzv79vz0SfPenpNtxhMTKJcjfzZ/k0+ri5Apvjkya69/iqUjmrbAtWUqUxHiVwpH/kIx2MLkod+l//+lekdSZguTTYegyfj/YPJdcpkmtElUmpfmSss6Mjo5K/rSxUBTMVMJhISrF1wnOwoAmrMLZpbTzEIm1Z+SJuITmIqBviX2ljwypuQ8OtolRnfDw33Nnu3bqHvaK+6nlWjH0tsJVOU2g5MH8enYtpMgs0F60JHI2qg6OTBOhYgtJe5J5XPA+4lsMz1zgqhZMEMgHJUjTVrnU3Cw8EgH9Sl981jgRw2iLgH5sK6wdCgodP4Sf2f7ivqKBZC1Pd1x2AdcgDTXLlSUbT0QwZVJvLniGJpTpIfnAg9Wj/I53NhNiWTVtfg/2MvQgIfFwYDYCw/Trkir4vR58+D26tWgAEL3CCrOEGigE8GxJxl1xPrJ0EelFC78wD/UNthdICLFaLa1XYQ+4Xjo6AHkQosDJrupOoCEggyucXw/VrXA1EIAiWSVJbqGnndxTHgesM29BzG3gZpEx2irP4ogMOuJjg459v8epDsUZJR3ikzaXB7DdSPvPM+Jg5x79uTaG7TDSuq4e9i2/6h/hskQgooLO5WfW3sXquHXhzcHuNuCltLnUaiT2Apyr1FSDz4y096pvFbjzscMOCzCPrfPpUEhS2dVSOKyVtoR4IbPr1YXnKRK++Abx0/PBnngBAOSx7vO14VonJeBKuWZEPgo9MEAY3cf2TGDDnfKsgwqDQqZRjewWlg6f6GYDBlHJa6ILYmrF+KLwWepc+9q/uyZkkhmLiU9KKq6ImUOaIkkhlzGRWlAOJNc3AYscVQwy4qrtH8fe0RplnC5QgQwNJqJxTUwZpGkgpiDbn2W0AEf1n18F1o1TkGMPudG1lPcgEI2tB/tA4NGA5MCqBxeDdgy6EKOm+o34K2NQHn0I6BWMpDdUjJVuZ55tEg4vCPt/CG7xxmyLCbeQbnVqIErhKSndCJstn4bjF1M9Q6Xp7YsHPFAGePfB9gtz+x83+7n3BUCwZ9aHSR0yDcWfFynBm9LPsMJrht63pIPv1oZF0rR7io3i+1XuzwmxddHRQC6YVMLD0LGSwQB+41xFDhVGZAfjm8nxVaH/pjl7JvtGkCFx3U5KLyLHT9CB25MyLG3fgPG9o1IfyXSf/z9geOydlxGcZc1d8L8XzT1zqQTbNeatIYsc1DpRoIHHpK2/7d26bm/A7iH6SQ1D1AwRxG87eJR7z367jXgLgf3z6gaD1EXRdQdVoFX0cbSB6DD87pDkCMRvKw8yQVUGmD/0M843DPR/kVeCdNGN0sG4y8DLExSjEATgFMiciGh/IOAijTcoNSZyEIAw8KHIwWy/G27PvZtr1K9+oc7GY/vOfsK7KtOaMnvfv37V0vgly9sc3PWZ2zOaYwVFD4xsA0/um8X0lb4rVW9iqzn1d7mlxTxVO0oqmCyta0Gko0TBURFvVcJ5uY6U2lmCHEbT/Z3J6XeUrl1w3eoWm1lXGLZz2rycl1uGf55JW968evz61X+cjj4BzJvKYtQRxtOA3o190DxIJHGEy8iaHcD//MNx507uy2bt+k1tWYOcmOUphy+RNJFT7bgJj2z+grYeki8q3r3m2IHp/h9n2OdtWZLkWTt1n4su35Gh9Txz+qhPgayRE/6qUCPpP9upFMu+CskXZJSq+ouQq7jxLNl9+kh/f4HwscY/pI/e6K7goj2MR0nAAVNnwzIr6wbB0tP+081JQAqmVBQBd8qFBZ8xchs2O7+DhExDELi+LAVdmRrvuZUU8lXXXMU4S1kN6GP/iRpNIhpNEDrGRBxwpdyinmcjZeje3erc+9S4/Hz47w3sIXgoS3Fu/Pb1fFUt6fcKgSSWKAkKAJLV/+iM3Z0eZzqvi3NCIcl66a3jOmHCjuXV8Nu7Ijf4AO9WDp0R/UOO/0PMmzXgmxoA2snIyY//LwcqT4bnPg4vU/ljk5NiwEFEdclSKYxrD7cd1m5sWOyjCupuMQP+pwJhPKYr4iuqCD9ZA9/f29/t3OZzMgoOFJNZjB/bSfM8mFzfNH0uFX4/OhM7cgeXDDebQb4f/lRXYThPf7WsAYvB8PngaHa9TzIdbzMMu7p22QsA43WiUjr3ZPwrSGYQQGbIRCuTmxqaR0jFd8PSdTHTz0ooKmMe2mWJyagzNNG+qXXKAPaN+TRxVJV7IacFs/Udfe5cvgt5iqlV0b+Ap5OqmxNPi95WYoc1uCna4cOK1wznH1ri2+1XJy/Qi5sh8vNxfPS3HpnmQeO2paYdLLIZ7NlaGWDZRu8kbHJw94DdIyd90wtwakdW2gg0a8ENg6KWNxr7AS9PAl3hpFvOq44ugSCntKGYPpuFyRrUf+O3GKrwoDc24gfkhEb8MPu8cfb6OLcyXz7H6K/CCIIsMG7ujfD3CD2QS1w1dXalTdmzLIvk8nxiZ+IDCeBlJ3VOYgX8HHVlWxkg+2JVF7mjS3WwGLkCET+f0BexrsnyZo0NuErQR0iIzJosaudhTykNjUacKKKQTKAGFZHDYMIvWaEV1WMSouvDAltm4wbMN2624IbxgORKzc8ObzYb0u6HnJKec69PaEMS1BBr+ch6eGdJjX/6KHKjEcosYPItQVtBaaFRvIOREH64E0fkTiSCMTSKRBBPOwQQQSiF4d7aCdCXd7VoWneL4B8DFlDuMw1KC4RkbLjMvKLnGz9ApyMHZT8crH52CxAtSrLCMSbYxq6AGdlPKCT2P8XT/zCQifLIWzmPENrRMaIieXg6OUCdcpDfFWZvUmuXxVdCiFKpMycDE7baQCcnFJaFRlRRIN3pkp0BdLM96+yeQYlEbFKFPGZ5fjfW/+xeRmip/4x4x/bxd6+/t9ff3CQOnqOPjViueV/RelwZqdTzf0/eu1+tNkAC7Cbrc3jU9ET40rYeE4WFIUjebclLuBwu00zBHCbjNcEHhAbiuLbtOpKqZYImV+ABHTCwwAHI4JMBCAtM8YG3glXK3ajDxHIVKp/K4u8lBr0womJHMSSRzJn9v/zO5FbepK1eNIjAE7yti9RZN5shdottudwnC+C5VlrvPCJse5pJkp08Si7Nq7VSs7MTHCUs5cU/z9Y49TZyiiGb1hk2+3rAnu3LLbeKAsOf6esfdMYurPtuinPbOfWCk6B5OT8C2aJdIfvfQBZIxJvF+T4EuTZGmSnoNCCqLsHCeZvkPvGV/DOb5D71nkMkpd9grQmId7/d6n24OvtzQe0+RDJyv/x+jd4+YpHr3jG08+SZV8UgW1WqS7KGSvLUgH91jxVvktD0WM9xna4NCfieEBRuTGy/gPxZC9ZzUGVM3zPO/PB9moufih2eqoRn2IuQ/JzgkzhfxwPskHG8I3sF3BW9xETJSngSRDRd7iNjXwnSGVgGtAptATTJscpCX3ypjTHkP/PzlHXqnCor8qpgPnjW14WHK2jeA9RTi+YDMITFvsdsaV9DlAy6HsSrwxyCP4RAP5xi4qRxy2cGWwIyKefeM+iRz7ptytuNiUSuWdKIJNbvpWUwNJEXymlKiC8vSmmfVzKI5c+a9hCK0zF75d9WUqR2rmDAzyWQkKubBTIPZhYru9rR2RV+brvYUdUWHVrSnrzdNZ1YUpq8jnJb5Hd1iSvDPXqS6aHIUanIAajz2NCHs5Eec/v77Eae/e5lbcZRRd/B6INHvlAf4/EAKIjisSRFxzWmVMe6Xfvdd/+57zmqFfw9ff9HM/jx3nUW7L9MWd+GrZMwuZlGJ41QdRHP7qbPU3FZy11n+8+Xe9cvMvoj3CYa2VI+35CShRLqFSK8/Sf6XYcrIxoBuQ8sAezcu9G5d6V/5iV8pHhyVRS3SjoJYdI0J9uRZmzPuZHMkflFTOvC5eN557/DlcGd38PqS+Ogs2rnp1JUCth5Sicek8f2R7nbJJUbrbeo8rrTG/Nh71+/2r10abFyVB14HAUGr1MtVPvZMDVLKOqThf7FBAPn1spAzTvbT3QRCY9vdLIm+nGbpr633tjFq72YB+542nZKtYfPwEAkuOUdLBuQz1spSBISOD/kIvL/6pHf5zdH+A/DuyGzVKZ2k3XBhShJXqSYI8evQkta5GeZGZhnrV9aPPn7kjHUnzJUX0CMmfzxL9YzyX0aGdZSINyjllPKUf92isNP+5d7rT0j0+vIMWYiixMQL8EBdGkTRXccE3RZ7uEXJ+R6Tx90k+LwxiutmgScOBs1maaqBymNanK0IuyQiaSUnfiduNMJkaTAuc/6OEoabU7aj8AXQS52F14RgiS8XaJcWnHcUiVRuqZcWo4MqlqLQMNH38mq3X/S2nw1eXmWaZr4x2GXT2oYlagcpYWgLBDA7A2ayL8YdHQXjROcPZ2rcwEr65vTvvOg/+iot/CIMuAUUNALlp01xGnHRDgN/JpQ+E8VzgcyhUSju5ncgzctQav/uSw1DkUTMo1JmEXiNdXRcszk8IEKlVhbd7Y4ct51ityrNpuBbUm3e11QYR/VlixinBa16Z9bOmIZXzg621o4OXgxe3uLDJnhuHYxRz6ZgWU5FRXVj4/zenq5OTech/gTVXW2z2MbWOfxtnbYzxCh0YB11GETRUFkZIwVFnYxxCTCuGhzu91dfDXfeDF6t0C+BP6XfERXCsYJVhhiykUmkYrHDSkmn0RbJIpjwFPyIPUqCsAn6d68OHx/Kj8AJAhYlzCM4dYT5TuyZ8cBCAAuA4QDdP4ad7NZ7t6/5900NwqJOtWAHjEDuSU2nw6zR3WY4i7f621ZTwkFEaL0yuLnWW71I/WY6gSHbnG6CfvJMytE3MG88SIGLqFkrtUdpk5+BcDkPHt4Gscd3LnBWJyhk1LnGZxxPh0GuPxG7rOCA95tFkLZHbAiEZpF4tHN583jlKvWjR7FBJwuN00RtR9opOcgZjw19W1nUFh3bzph8PI/9OQ7WeM11SuqggtcaE3XB/rX85pQq+jBQpA9BhNE9f1tpsyuCyubKw96Vn3nTNj2ZCg7SthePRkvsTB9xt+MKqxrZy7eHO+tmZPFvgzYaDQ90wCqLkDXVlwuqSIYob2wLo4F1SRvbPz149YqZwUFOUOSZtddVPvywxQB5u9DEteOn9zhrTdjuAUfMTJV5RRmE7TjpxDUu6LDBGBluWlKUq5rAvYyHO6gDVAGI2IpZLzzDC+s+TiQ5txISd0+OA+ODj5vSxZxi48RWZOL0tJH+aV297dFrFjKJ4Cxkut4dLOZoSwrK38duokVS5nxAOhWVGZ8jjXzz7TYeBVpJcneDGG8erw4+3hm+/qH/y1VC0vTX2GtC+yzgLK0S+0lzNp/Ip+IzzulTcZwciICV881BJCa23zzLnNYAYALseaOkNqFGXEM2oGCto1Z3fWS0lAMMhge0IG9tgPDhafQ8Z6NoPqAAhDseiTggoQcj+tFEAO5qIQjgmwQ5/dUtMNTklMLk3nlILq+ZjhsSZL0MNMQRMiIDF5MHXbijId35DN/xIbHhu04SNYNZ8Euos6k/TxbN4WyYKE3FcP403piKtg65XAPNE+By2cEsNJ0Be8roDyIWASRH016mmOgBSDYkRVhIKqrS14uF/HwHU1FXBCJxE9N25PQKeB+hQlOi0GcVmFo5pUlTcMrCDJzi37uKSs+HwUNoQDR8vp9HXGMr4a6cMAUMyen/JkasKB0Ii9xUc90fvjzfWzvLmgs0DXYXT9OMslUl+rAYzgUjjhN4HTUZtXVD0IE7Hay5//3tOs2z8xwQBNIcXF+H/xtsogm2eYIFrLU4gddN3EN1OkccP/MvRzxLz6lU90wzFya5ZOaFOf9L8gY9l+h3XSHzfyqej+eb6FL1lqctyYoLIjctqH+Sl2GwXwG/8PMY0J6AuQ1qeyB7DF87TO3jXYO6FZw7CeOOwdoxbOkDSg9K+hjSg44jmM4Hch6E09SuyeiKgQqDKQ9HwcA4wjFQY1hGj1UEU0yAFwYraOvrnheF6Fl7tvJs3c2un2DR2Qab4XUm17e1aV16CFSMqlpUZ0vJPplZ8oyRmSAxPlKCyLZg3CiYMRAzMMkA/MEir+h01IT6MJ1WrOpDU4VOD06K44geqmg21WmeNhuNp+HRNnb/+F/B/8ZYZiy2NvEvLM520vUSc5v4tcXf/nZC/E2vir77jvHVd3/zQnF52mwj8VwrwCb2YgGxfT0OEXbVUU0XrNP/tyVZuPf5aW/1Df7fW+YcDYkdGis222XqkShGdQBynjgbrIxi61jkpLTJcIrdH3vvbvBE3hTYbU4VcgzvO83oZAbL6rU+eRFRKH9RK7Oa9XzBLFYU/PTc8OslDhjneZrVAA5gPi3v6u42kwqZdOqTiIMJl4DqIKV6tSnXlO3HHkkf/HBt+OWgt/O+9/Az6UgUHSxk+FysgyfeIhK41InYKuGVK4M0TQQPIjHGn4aUd1OA/fBr72CPn0mEPdflOs+dwcJCFcfnYzPofXhDI2Klv1iJdGXUfMQmQVP7dfWYTgL0BmUOaWwKjz2WKgsweG2tvRgfJJ/n2zL3gpeU85WP/TfveAlh9mibLuqENezcm1QnCBMKzatoWMEA0ppS2DzDzqR6lnLe17//+vjZDfgJR/uf+cjPZCP3dFyUmteOPeQA3mDiQz0tuFEwKlwaS2hQe3gSBwHWLHGKae/hu+G1c70nT3rXDjkwOo9JhA1LdathM1MWz7wgWIzLonXhy95COEsL/9qh7K3Pd3j7423QlYYtuUMtLaBOqP3SZJAWEI92DwsWf6C5f72HX0Dy8f2LnPjTQe9OrxyVbhlF3lhbG86QQBHK4qyGTi/H8LXU1W+Di438MRGfB8JAE0eYWA4WlraP/vXMPD+B/sEXMQLBgna1xj6wAckiXS0tnQIWxmcH89hNsSnwkQ3aNh0vHXzp//IBG7k9ug8rmxL8pwIUKD7SqTiSbLE4mqOCZUR+NBThPGqs6YBdMiiO3xIPcDvldpISA8TWeW1sj8o5eG/pn74QMS/SaJZPbNfvgTzu2UTykkR7BOXI5poVupeYwjZPaxh0TYsyk5Pq2iIlBZHnSXTTGLtpg5vEnmfvYLe3fLn/ATsuncL2CRjQ1f4JyK0nqYM0lySNg+pqR7mUAGVOix4y9SPluH85j4fWX1cJ6ODLgG08G2sH9iRF1NsI0bdgRT86Jpm62A8b6cvbpBTe9C6u0oOAR9nKJH4LkCmJkRcPubO43M0NzciytAIvEEXvvtC6CirzWu0dboNmRmsOYjGXRznyUq0CDgskvjCyqbLG4GWdX9Ys76ZttoGvnwCKwX2685gSquDn15ModmwUU6EVxhAjhff514cLAf9usEqzymR8fOkG/PzjeyvMZ0zSMA4oJfBz2GQUthEsjpgL6HiEtpEN4gmFJp1tU3LpHkG6pc3elY3+47tH+w9JE+GfBxGgiHJGMFib6t4TbtFZ+eQksY5tUXNgWlsoD4N3ry8OrxHXC0kMIrze7HSKzeJJAxT8eGHZ1RDziQqQUSbyYo1O3IQH1Pf85VlQ5b39c4PTiGHnMZ6OcX2MNc2PTGE6SycwhUXSVAuSLFZYJsnyH8M2Evjy7VpJPp7/0O36JF5EYo0cA+R000On/GckUBhsvuu/U74QLkidC7UAuOQQGs3D5f+1PKUzJg7aqzQhW1X/iWUSyepddqToRmczyUlL4ScjuYwCmCkNxCK/Kp97MtTR/ALGL9ihkuLcOMWne4hf3v3YP0uUA416FExPx+LFg7uX4b4KdCaeoJOFdCBgU9GeEaGM69diYm6h50PCcc3sbR/fR3tAEwSdKLJQR5xQtAf2C5leHeDV0ool32nZIdLj9fcMJOACWB2x9nRHin6+msxz5SPT7lEnBrytt2+PH/Hpfgy6M1LOREKCeVozrIYgkD5XURq9J4kmAn7a3QeLoyAtMvpbNhAEWIWhGwcSrq4HfMXiMOecMPB+/+BHzi7B/qSzalD/f7ilIg/N5OdRintQmgP6n1RCIKedJGL401cmfYAZ4a/nRUG38Hch7fo2Jw9yoQQMxNp/rCWYU+7p+NFTMMZ8T/BnGMqOcl97yhMS3cmf6G4wIEQUO7986F14RUghd4pSHAs6KsNE0CLCPmOcXURGRxYSJoTCd/IVJQQT3R9x7aOm/7Yi6cD91aX+0mmCZdQAK2rPp4GB1BCtsZo4+xAXUsPbZqp3uLp/960atgWstZsYqXK+0rgTZq6X84iqvpCshTEfxTwT80mqvojvgvyh3+G7HArQHTavYnLD4T789kG3g9oODxsKNvw7gk0roNThUcOiPhB1ENSQp4BFBoYMBvmvcDNSZsAEtGY4TUCaVi4KYmK4ZDDJoN2X89KL04NcimAmAhdDK4JTHEBh8q0qfjDUoHjBQQUFCBX7bTbbTHXVgjrT6aymWUzfXPqmUu1jxXaZvRIzVbFQFcPkWwuzD2oWPINghsB0tz3lt2/lKavmVwXmtCqXhRJVGVq43X3Vq9W/H1F8pvRU46myYxUnColVEeshXwWZxhFVwArF9AjvhbEumM0OkttG//tYD0zvC9cBs/rX2v/SG7VY0X85qful/HHju//ixYjgB3Q36RfMoK9WSKy67O4lAdOV9X/6dLTPTSTTZBr0IZ6uKn9b0t3LvRAPdvOadnrx20qzRrwB2pa9LUB9sH669+SQu7L3Hj2gh0SHtiDReFbTlulI79/cH4zVB7YF4xjJLCZ8NAvl3ecoEoV5E98g2ABn0r3S0nISQpcH8ickpaTCvUXKCsCDGbEoPKCEtBvsJF1Y6q9SxSJ2BwnaqcTHwhib8oUiIkoSPOpLjBHu2w3C16uX+x8phZYaBCalO1+qE3zWCprFsFFOj1Nhwq9JhP3ylzPKe4mxltT4+OHFohKb8pk18WXL2Bi3Jv6vnM9w7RpV5VA9Drb9PDrckcIcnAp/s7QSxubNjm2XPoC+kr2GVvJwQVurnKE10v+wfnR4C9urPEeuYZDUDBakWDgpF8Og7G5SegX+22ThxZb//nxzeAd7+S0gA0cppw3w4DNJDgSww9qrbUNJLGMpHlxovHNtnWkRogS/RdOvjH6gweExoUgy/m3M3SFxlEPEXOZ05LB7f3D/M296uJkibs6rA56ETBsZ1tIs4KbvOkTd4+E3kQ7e3eyvnOZY2VQLEfNsTWKh7PZgiUDUMUFsWpDNiKmR2fV5/m7wZI9NJF5uXk+UhHOEmOptyi2FBQkDlE8E1m6azjdQgVEI9fCH4ZsPtvEX6G89wB1xc2n9wJ/g0uDbKiWOv/kw+PiVirJpEoe1EeoRCTqmYiXOc84JSLpBSsDDR0MnzBJNPLc9OHuj/2mN31QRRs2AxYnlifJA5FOLJvkY82cVJN7KonZuYXmwrgeXfuod7DJjJN7OQqYkkFiWFdeZGxl2Ej1/fyzJYwMSvDwp/U6ty9pZWKa93YeCzfUytA15rFFEBKmFinefWfS3lQURyQmPGVlEwPsPe/svuL0TSwv0So8tJGx7OX1MFxISX2Alp08KvepMGaK3fuZS7/AFUobQrfORQ+gThoR5SjuLpvL3WSg8Gj4DiXGP0PXBgm0yci2EfFoiBeRdhPaRAada4vuv+YYoUtAOo5r2xIKVTRwzPPYvlRHQJam6F9bv6JcP/Q90wIEXoINarzhxoWgKc+H4829b85KJJP41O3NvrwJGAeghLl1eIhuMunQkw9Vw4icNXRw2Ze/ChVK1DVe5fgpxVnUou9vZBIdyU6HM7h5RHVGxylwsGdNUBwySaG5MO0YpkgJmGcZwKecW04VeAbAeJnkOux4m/VmXvXJ0FKJ1UKkVaUUSOvAntAvgtxPngooI0FLIximQEgxUVBrX292fa23ePjTKgxGPxb+eWQyoMSZBZVgApFLOfMG2mI/v9p/tEFoECMPXKpAvhdmMp/GXFBYFpEJqULMCCye79/w8rC2TLbdkSwzjvum0BmW5xnuGKYwAxstz+XWrlARnyeJdu9i7+b6/dotZ1TvBtNXl1OHpYLwgIVXu8mpRqDtmJaN58/1wGQ0VXuwSaKnjAtExFpLSQqyPxMaoI9hZjblvh9eXeku7TBKTcSVoIXkMEoRpydkCf5oCRdxUEWIlri+xlWARzkjIK6WOkqScALzVQqbh3ewEwv4/eHhxeAVXV0FFx/P4erjYJqEgsjAl4Ac7SyL66uohEsjwT5BY0MjxEdzPHJIj4B01E6JeTNIpGcEfylkXi/qa+o8f8TtqMnqIoqwYESR7X8RYENPMOFwvqiDKhK3wD4IJSVTmFoYRkPxIQgkecg/H3JaT8LACYUHAQqqFLBOMexEIEu51iHes3rsKKw1GCnqkiwTkKb6jVCCDiIPNQwaHigsNiAkCixcNwm0vs3Vx2M1DS+zYFBbbJ5QkEMngkaIiATOqxwDOsB7zcJAHNMYxhsEKQxMWS6BnUzHqZsvNijvjrRZbDakaQLXIzhA7k2eWrkEASi95d1WMuDOXHAuR/7ANE9NlRosNhpkKthFqICq2wdPiqsBZd3uKWx1x1aWmQn29OaIx9cmlHE9RZcZ6TJSY01+Uv+KpGlYzqmNMP4hmEI3AWsA2v79TbYvK7uSdKdty3LPHnLDw/x51623UfHr/78ShtyHz5v/7PyZ78/SX7e/++z+cKz8Ds4EOCaVxVTvjAMwMBvN1sJDM+hJTXyioMrzwdfgEA4Z5AwzBVJjVhHgp+4uTSPYUq7pEGEcdKQS0Pq+JyE8OBjeu9vbRE0MxdEooLUySlM9duy9DajqXdhLh7Vjkge6rKWlxj0UMKO3S2eO3nwZbaxwfC/IS8IOsWXRcG3EjILniyNJnlCrtvqUaQmKqB8QCSvKQDuPDBnV4JImY6RCLVqyleEoqjIIZJRHDTsrLhlCMzJQNSR3arUsnZtpVj4f3t0htgOluGe8PS3PRB4wcxNink0L3SNQuZS3DB3eGD17TD03nvSgGutGwN1pM2omgnjSNN5iVNsw9X37d0hvD6iI6Zr/9qndzB25w+OAKPSuAqirDpZNIQ3EZdg3FvaF4kUTKYRWprYI1LkjGUM6Na8OdDf8OQV1rGh04umnrLyGnjfMn+QCYrMOcxfTO6IFevT58dGl49bomp89jT8Vpq4PKu5stxOU1vrEJQyxP2fYeXeLz4AXEEwjITWeJmxJbahSAYonFI8UA1VqgTWdSxuHDh8NVxKBT0TymE2kpSEhZkSyPXjd9JGmc08hC9HyPxWiNEUoJvCTJmAqWOlKaHhPOyNMslboNzF6bkXbgWKkwTy+da0E+HR8sHR+84DYUtaBIsyzs2DsGiBeodI3+UGf3jBakiSJohGk8v13HNB7kHMHNQ6IxU+j1o+Hrd0efHhDowhlooyehuptT3fUcAGcpaDGeCgHEN7uHUwIDqKa3QFzfkgjTNreMrdE0b9AqX9vC4897N4ZnsPQimU+R+MOC0SVl+dsMSTnVAq+7RomOsEpJsliH7WWQ1Xu+KlIwUCUpoHHZMDCXSqqJjsyk2qXDHu4qPFyKNC5EeJyuwKgWob5lYRyJp3idfubf+xvV/sP1g5fnOCAfRkFdS3Va8MdtLkxL40jS28CjjrufbFxJlg4oto2d0IJvy8IR0v+0dXxw4egTBv7gNcyDkwUCNRsVEz+jTisOZBopP8cxrJGSSciwo0jFjCSQdbmIC7KULtJTnSycKgvJnAmFHnEPdGZcHeRmkadIuSscuPRx+HQbtPHx7gaTVSFz/qyrA3LCrSWeSDZnecHCOMR/9evDeVbwIBJV0fOXR5+eUA5piN0mrTMeZkTGSmeK3eK4TgKGIm43hincsJSkr7HX7q+NWVYKo6hly/DtAwlAUNe5uNlJhGw5nMbE6MZfovpfFrFfzF90VqkJRaK2bZySfprIxUq3eepqRsmzJLy3/LG385neAUmHXQBYPykKzWMEzSUEIVxFPwc4cyolFYuxZvmKicAxiBK67tIYvMZntrs/fOn1FU1CiVhSvJXla/RVZHodqin+iiIo/koXexHYRolOY8gZ3nLYFBIgKsTDXUSdJiWMs1RxgOvj2d7xF2oynkT4jpMik6x1PAjPiPROJPNZkQwVTA9KdQt69vzliQTcSIg7ee6EHAMsJCcYFpb/GTMZMGI1b3kDww97w4f3OXWg0ypnggYevjpPFyV6uQfsDer16uuSAHZ38XI/JJoYZfSiNNJK4jqbp0Wu/NCsL6Yez11P9cervUcPjsHVoJ7qRdkGdx3MOcjjh7aIHbRkAmJDQA+fxfMZjcjC508PjUQNzryhA3uWFCxYtVUOPzWjtJka87JmWboolIHwKugV0vlgykxLAOrZrRhsvut9eDq4uj+4ukxJ4/XglIP22OZqLmDpBFtTgJsoWoJjhGpQytXlwSFSXsC1xKDM+3oqTTSMIiDDhupY/MRbjZKPmavhy/PB1U+sfjrITjxvHWL4eU1xS0d8WPJvulQfElzMTwgvdU8HVGtE7fqwvks6y2CXIrqRxdBOsTcoMHF88HVwjTj+2yV2PIlcvi3lfJE0PnOfwxodliUyfn24wCKOL3HMAhmlE7GSsK5iSSeUFltuZCHMtJ1tSslpsARQy9FjOTzoP1of3r8xPE3sLZjvhv1S4drqrZE479b0s8rSsie+SxY4WHmi94r3wjc7MaDhOx6TfI4O+xvDx+fE2XB+hnoXFT/A0L/D/ZLpxB3fGOULrKLsz4zuemu49oPg8goi91CuQ8YGhv1vObLNbF8hc9BWwa4hXUO4hiPHEKSBR0OOFczIPTwqYM6Qm6E1nsPA02Rg5iMxhk4eaHJgSS/kP1do46MaerajIMMAhkMXFcPvWXzP2JuBV7uubdbUtE4wqmZJnQ3VABIbMmfSZLFszeg8+2rRqsbM2TC1Nb9tzbOpOTq4ZqbGzIxYF98cmCkQO+BbAKf6K7rZ1LKnkz11rGqYspdN36qmVS0resxXZ6zJRI05DUZMh07XsJ4RJeP0i2oVb9vbXtddPoGYhpJS/8dkfuTqd46kZuwapaqpfmFhk/92QtiE/z4UjuT/5qInmHZNhXgcEQq725hspx+5F6R2nD28y5GiTsqtzDONF3Hif+iuGxtwgqrVACTSqgHk771yADCt2HYHGxCAaommmQuFO/qkzVrUVIpOzEuqB0Zsy6xavcvvezsPhodbx5ducrlXCw9ZY/HZ0hwzOcBRayLlSBxO0/ELhjQ7WD0MFkCYbrqb00zUyzGAOFHW3MGnR8NnZ/D89OM5Js5l8WCgYTEr9Te8Z4wA6eOtxe1MuMrwoZTd3UwexdklfbpZBLi0nPLLLLLYE6RjThjSdWtFhD3e51u9t2v2eEWo93hzlFoXrzte7B7W2euOEDvwaDuqpRTe3SAUlmsQ+Wj/56P9pd51UmbRIp5pR7Ph6B3Xw45/tyTWqjSxwNki9u6m9y/3rl3g6L3e92w4VVkUCLcksBYj9qeyVTca13SUi6i5v8bg5nbv9CfqiFnWA/pr1xgxKxt0ATXUxH/zI6kLsAM5uM+J5mhn6ejrIy7zhPmwvWZZE3wNLiYmys3BKkNkx06njsxELUtN5iaRSOaPhA4zlBVeF179lZ3jldODw5fH6++5BjJDtwzBRkfI/fNU6ZBVPL22guv9vLHxyYglv/vqe3+u4ecX/befR+bKtHoklb683NmbbMakMW5HiMk9UnDsNQK+ByZiubfz3jpA4jXg1MauEyTsRYCgCWyd1JpHThqrCufjrAUu7eTOL0rEp7NhQOXwaX/j5971G/2l63QIwPPCJmXxSmudImuBsFzllFubpW2KubuvEvku1K/i7gbSJm/MB90DOht8d3B8d+d4nZikomkqKONrHU/sHgbKmLVIvqKGalmYRxnGJ/xxFR1wf2JFBDQFNij+4SLhaJ0EmcLa8Osc2bH0kufWcHGdsyT9LyL/i283WpxoIRR9B6e8utm1M0cfn+GyObw52KCWwHVs7BW1tF+9zlmU2E5COYdcN3suhcZur+145KvR+aTvzholK8/IcqV5+6uHg527w511Ug06N/Itla6JBb69NpZKonMFShLgQU2YyicMU050m3KkGQ/u8mnH0unh6yu9ax97Fz5T31JsH4Hr1oT46s6b0uk8709R7elmrJbEoXxXEuffo1N68Oga3b0EGbXrKU225xYJWlpMmuOMpthfP9LJ8bfrjYCIWYlBheogezvPexde9a48hhsYLN1n8snp6TQQYfIgk+42liFJIQt94VcnuTGRPFKaRLKtNEnv069OouzuuGMHONTJJMvI2KfZ2HcxfUmG/2BGfllDuZqJQvvCh96Hn3rX1vqrdN6RpGnBLT47qtTSuvCvlN8H3vye9XcT69EviR9DADxNBQHoTBUQQM1Qwhp3blP2D5iEzg+nZXCU/UNe27cbYGeouNRoQOAHDnbW+2/eKRMIsl2XylFLS89m9A0wTycnzRXR1SWp4j0bTPJ9KwzvEnBjESWR5gZMhZQtrt/U9KsZ/UbYJPiVyZLkVuufV/GdwbTUuBdr4Nk+sBQjYYKfU4sZWcrcnGuNKfto/vyp3a8knNWQDFpJdqephq/P9K+dUZsgd1zH6q6aayjf7j6tUe9JbJidshYDbYVjGXpRhUE58tPZlQI413/6BlSVIjq4JgTAqpRz0Vx3r6UWO9VJmF4kHvtunb/jn/NtOREGOs+Ww89Zvnj0dcdsuc5nhjwtInTOJRO0iGZEJcOPlnGs52TKIyqFpNZsCNRoRSp9Kujd4c4XAGmD7Vu9j/jzkJEDRJKcZi0LvVboAKHFntrsrh26/2XNfTsyZXV2m9dmt2nxOKYOzuSUpdFQpXzMlDh8k9JF0fsC1o79ap5ZfzoY9rZ1O9m/LL/74gVQm1wkwz9bpdmewBRbcmfraesPpqBUal6TlVmGzy707773Z2mncTO3nuxCmVZwlhegfib3IlKPvYLVSepIOF5xa2LdeXQP3DEb74ItgWxAwN6f3/ZvnTcSMvREKH++SJsdr5m0UlrYnBR8r3MXvcroyHS0fNu/bTUF6tN0g+efepsP2EWx2eiF1rUAC9y/rCacaNgdKU2mGJi5YRsFAMNN0aUHwq8P6ch/8PT68YNV/KUX73P2S0I0jXEmc2AxYxJF2XSgcqUUB1PpOgCqY/8LorEEp4AUDL5Gpo+nppHIaLnxtX/7zWDlLTeN5HkCm0J/VehT/2FD6VAKy3iku0EkHzOCx6TH+3Bpd/jyNiAibvMeJWkW0LWKpdE0o3BG0fKp5pp5ySEfHkHi/mJ4BcJ6y9eHt+7aneRlSmZ6UrDS8+69f8oCX7CgAazppUPJVfNCBp7DPcHRNtfaPGqDCs4HnuD9ms/rvF27sC6BwpOcUN/1VKfTczedi8mgfx6r6Xj3XN/q7VxWh7DiB3oO4CRvzHfCqu6XbnT1hE7wf3xHx/NsdG0ZCJzkUJgXUfEfRt2Gqq8wAaf7yLwCyF2rCgeAT4DDBoJH4K/pVEGY42DTEKbDlqOgsoIiK2DO4JuP2qpozQdpk1CTj5UcShrFRyOYqApMDIxUYYiuAAMGPhDgXeahjf3LhjYqQMM3u79nZX3T6htV+yXNtmT8nWzOfAvm2S6+D98i/J558K3CiD2o2AFP99uuEJ482BBEpORrdlaF4zrQFJ99Oxa3/XuQT6X/52jE1kYtVuv/nURpbcjis//1hPjs37/7Dv505rv/6uW14daB95DGyRTmLmECPi8E2CBuXB0+fRSYvbLoO3z8Y8nq0rolrjHWlf31a+IBIgX/RVjGRwcveg/x7c0S6sC9SBRlFXLMyo35lLn+jfmP2Zu1ypkJ8x6/uMiTGnOmzVrhzq3FRdn9uRYSuQVjkGYSocoKJbCAubTy9Uxk3u+CwEhbqnADZEJ3dmCt41pbOju8/pq937l6iN4viWn6zlRleudQ+bP62wHnGAtq0jx+rFum8Z18/F2IH+cYnpLB+16CblixAgbCvrJvaPVTHUPA+V9bhEUK3gzD9WvHd94Pfznfv/ID2zUMvuFEPI+zrCIurbUlgeLEKXzJTib+j3ahEB4UdLQz8WvICIF6a7AHYt9oaxchSGxVCoX3zw7f7XO5cBHNYsYDXKR1w+roqlx7MZUhSbRC1hT/lfTf3ELSFOfg0tLxmIimqYIxS5tc+RxOR5KAth63mTxbTn56G/f6j77y4c9CPUyCPE+NegmlWFt1SevRazXdnS7mjHe81IpfkHe1wSHBPA0D7jE1HbUjDsLWQ8RjkXZkQvdUvsMUf+zqomqAWZN7lzcHL24izL91j0ha+e+DKFpIE0txIosNwtolbKQ5ZdHjmRwbp8k1qngSy2ycKtDoOMGlxdwC3ycM2TNyUYOqV8iVNfgXM+4PNjP5RRXDBVgbDajaLliMFD1I40Klafig+zJLp6UPm5t4fBIK8lBYl5rIIpjH3pxXe1efuwmQGNnFGgsk3swlwsgfTlDNrAlftVj/EtHjPVW4C3qtvYo959+MzMPhCPkitHEVH4wE/pRU8p6F/XC1unul0J8L4KpnXn1MNjwpooOKDzwvyuNidxKwACdMgmmjQDjSxKmTwiG4AkB8wG7zVCh8B/5XOquvXWkSYgpW34VgB0zVu3itv7chgJYnC+qRyPLRZMz0YkjEgaaLaybBrd6W7yjOGGdTpXzJlBG/npmW0w3M8xH2yRtvejdvISXe9gumoVzAttbEj6tzuRBgTofdncBuQ9viqNL37sJwjUyGQR/yA0X98oSDzfeDtRWDvzBZgMAtyrVdCDLltECpwO5jLiw54qNB6XYotAvSQXl92tyT4ecXx/d2++8vk78M2wn95WYDFIdRbZv8HFaFZFeodLwhLimxHtIqXGj5Gty6TbAATYUnNj887V29xBhOZ0OGoUxrnGugFznnAY9U4bFyf+vuITyude4HRx2ye29PI5MV4wqs4CxoqSepGveYPzBbbyz5+jRMob6qMJWUSaDck9QCpzQLRw8l4UGAyZJQiTuVRBIrVM/qS9EnbrfRX71OvbXxH4JJ4BqKUggrBZ+hdFpxHsik3OAc5gl0Ps9P45m04XBpz5qnkJ7DN6WtBMwRLCTUxIjfLtnACA+pNzvaLBfQbU3UgN9IjrfnIXuE+58R8dygrRg2AzKCmsm4yBdHYhlDExexhUUZStYOIpisnW7EeuGGM5zjhgssi5gRqy21Bm6MgMWieVnHP3ztHd7lBA1MjcPkiUIbosKYdyV+bsMIugSw9upUO5Jwnox160XE/PEmd+tVkXKhb/RgfwCCaHAcXoaiGEdi5/7QiZfatpYyaYBHtnEV9Ci4qErNAw8fRAUkSDJSwvliOs0VLtpc1S9+b0YGyIjTM3/Wo4/vh59f+7OqSK/jZQF4CVFz9byUWn5NhcHEw1K6AckMfXeA6+TLVTkszaKFea2+QhEouZVOeRKF415lKMM9S2GGexbiU9xbcxqXMYxnkBLcq6XS8lUH2xjdiKnacktJu8lj2O49wftlWmbs5UWsgBhosjZkfh+cMIlKsd0TGKqTEVcIbNjpM+YEiVDfBcIcxBYSc3O0s8hVbyF01WHpJCYByjXlvGeuxMHW/d6zrf6V5742zLOy7QDvX6gHA4kbF24QmPaVJxi3lgomgd5WrcV17NEdughUKkNU4q6MhNyx9oAbulAGJYW38Pz1zVvkN76G+4z+nLZlqsQHLKtVwvatzBC1gnaJJb3RnONLxrARPJZZ4Uy+9nGwelVcf8QDAIXzE6Kdo07vZGd3ops97l1XHetR5/J33Urfmay4keN+3D/nvrmgoTpOWPlllQjbzi9jz8l8Jrd4xM/xXRxzb8S3GfMxPPei6liYT+E5FIajfg+9K30a+wUG2H8Xq3vA2YCyj48rwNgDw2Ow1EejFRxaRZ9VvDmK9Hx85yO7CuByOGsSvPIBVRVHKYJC+ncf+JyIdsZRjodsRpGGDy4MUxiU8PCDPTlFDAIXDCo4a+z+ZUbYzK+zvfZwzAL+rtXzLZ1n4yq2x9kdz+SYtTFTM675Uyz/Dlu+tjcV75S7cZM5fZu5f3vqtapbfb3ntGlFx5l6M902Htf828S45t/G4pp/G49r/m0srvnvJ8Q1/yZxzX/34prdZ/W0IQ0M63FN2K32/MEZofif5wJCDLm0mOV18PFS/9kShbmzqRAgdFoU6uCjJnQiwV0okT6WCQK0j2fcYqCDATJEO/0f7x8/ego4p/9kxUk1kJNS5U2SKn9/wfsuQcuuveJ5rOzuztLeIZW39Oz4KTWngtsrsdtwkmhmUk58xCGVORJyzZWgmMUKk0jCFfgYiKBnDvKG61vD9VcccMVbKrJY+d0aCD5DrnnCdknsDskw00ESYbUz3gekI8BwD5/+SKQH8B7hD+eiKDGZmMPb4CISadcon/Bqx5wCEqQrI13tNWWMOt3tRQ3knCqZkgxzJlqgVa0lHWVSUw4+p9b8eobprd4d3/nSv7pEFVElJnh1OvGinHBGlPGF4o3Tr8AGUipcE2mQ1tiXevT5Zu/6uglmmcFsTZsmdN/FoRYeZ9i4k1fPW46I5tFMKHTV3tfSDGnGzvPVpR1eOdvbfoan+Xt7fL6HTJ5FXObWyjXsvsRwAMKXeoCT/1/4exajmHsj0aqTyWluOfriJrHSbIf7Fa8/g1mOPt8Zfn1MQIknAR8VZUVtZVku2aGT8jP0G1HlYKUk+HeltN0j4IjzfFshXfJ5E8QfP0T9DLC6GRRhWkPwa8QX6HyOyka2MfrCm0RuH+kf8GQblxBTEJD44dLu8cfz5DOy/GAe98QCTbOIN8fNk5AeDB8T3zD3TpKx7qvvhYZKaHTQNdVn1H+zgqRp61vgn/JjAk1chNF8EMX4u2zLF8hxDnMVWAzOOecJ5n9XZsST5HqZO8Yem4pUTBuz0efpt8l8/Qc/9veRz4NnQ/rveXGlCuwAil1luTQzRc4Z4qhKkJqQa2BnSSxRDjx7PniyLR1rMRffET1STfg6mDJariowlJbI7JD9jvCRXsk8kbVLlum0a7LSw+UlZV0oPZx89NQXvWthimMlBm+a+eKwLj2ZqjDGSe61Sh357IstqWiJO4my3MHH/SOq3hW5s0ms1Clhjh2s+G0m4bT8m4rjvi23Ayb6Gz67f/R5bfiVCDGzeBZuG//O04cxl7awOkRBrsIOFSvLYHXIAkwbRuhexuiTYARH0NfEQQxtSrqabnbig9n+sb/yFbvefcRgwALHq0RA5YhOpXqHc94QBoTI9yQKxuvgc3KtF92H36+uFc7ETLcNcIYzfHiIk0GRj1USv2Psgc7N+eRU/PVB/90X2NaDR+uUck9nFHi5lGK5bcYyednHlJFdC3IbNKHax8PbVyic+MJlX4l8b2OBWiiQ0TsPsTki3zcAA6pI1jSwsJNKyH9vhsvtXhUB9our0S/CPDCKJC71r3yGOXsXLzBbSpiB/QLlgdy4/PhD0HBJoHPSlLT5aLgyn/wwzjGTLqZcIEUT9N+d6e/TNCofmd4SZZmlbeeagMvGy7GAqgDlu8g26ZQR5R8s+Dvw+PHV3pWN4ddl24Q5JrtE7SpxI/UxJ4WhE2XU5lyOm8Ym8/qdwwzW8txk+73PO3EyjcR8oFSJsIh6J9Qwb4FUK34Tyhf6Q1iD471fWuICKKKaREke3x8lCXtimfJPRieIDHyKPhZuRH06hcczlJXySMDWJeJi8wDSSpQSCy04NSjg7hy9n+72l64OHuzQIehcmjQCtjqJNfSSI12TCkOxjk0U/IoTn+smHmBG7+IrfwZYaVWFCq5bmzps2QCgTcAWzK+0NaMdmT98YQ06jbT3ToF692mS/BvFZzVdTqkwaidTuc8PX3oP39l9snTvNgG5SrkwcqpPay2kG03iKcr6JqDNXJDc/WTpGRJB0vONEkByU0GRjL4wku6/MBPO6YIqzCShiMp7wuNjQGndn+msqI5qyGtdSQhwoxEwpdXg452j/Z/7S3TOn7ZnMbAkhcSAUueEqqkIp/i4JOYugOw6wB2w64Dh7NmaHKACOJb2fA6BFkg20azp0gAp84ZA5Uz2p7u95z8C/hRO+whctBnCn+owWSkKvsqC+/fVUhlTwFkV6sSBHK/cZGJBszpj426Y+V7mdVUdLnOzzB+SYiL0g56ZE+TcH/V3uDBZ/BssTCb/xnNsnNvgewu+kzDiHjjHwPcFxuC4gXAPfv8R6HZ42ECwB39HcK+HR/8cDvXBp8FONoz/SagpLqxAs3FIZkDMIJihLwVeWjh++L28n2f3FStVYJIHjgSzYKEnQ5be5fcOsnhYhdoDjgIHgwoOIcglVTt9koE2q+zbY0njNxN8sun1La5nD5XIxDeBf9bqybVsLSZZCLMLZhEkHcVMwJiyNhWtytlpZV8Xq7pKfz3DoegXwwtvRF/+8wrOLEuhms1TN/hzWN/Ab5E9NR7GAljRLNLkf06sqx790oJaE66S2NboNxbi+scJIS65oCa11f/wIl1NCWh1nzEjXchdUemDK36VIjcmsKb04+HtVc4GqocRID3A+Rh0lQ4DmJ6Okin0x59mOM1JxJD/a11yWdbx7iqn5rCsoJlrCjro2qlI+s9z26XERtJM+GjL75mpipYkvffVy8Nbb/vvrvITyzDdRkMMp1LsK4cyODSTEVGuDnhyjNuERTG9CQkyghO4eKq7xyeJzMNE1mQxnAqleXYYK2tRKpTtXOeKHPUwSVvszIv7gzurvet3OZ7dQeKi2U6r7IzNEgrFgT8HMal3eCF3qqLffXFywTE6UWonzUdvnIcagkA9mW+fm0xQTQBA89BoD0SmBr3w0YpM5nNkKUhwUigdAsnqr58bnkMNyMKCosRdp/nxEbL/TzEXEPGzs2mAse66N9jmXNuESajSKWwLSXGVq0sAmXvXV4fLVBhNXZebxPUtRl1obnQeI7rhGYicgYTZkmBhvCRYklsTU0TjGk1V7hZMIiw6MOYn3S68u5p1FeE7Ht5cHays2h0Xkeowo+XRqZh+MwtsFl4MItAtZBLId43S7J4x+trJQ85PyAkzpg2Q3V3vSHKX9ICHF4cR6hU8GCGWiicPB6+uDq+8YOMDCzcvGyEJsxRBuNusEeQ8R8TPoi1U53gybxPRwRyL1m61LHxw7jkxxIhkrlz0KEP/Es0JkF7E0nNhEI2T6hh1j6Sn8usdKwA5/mkbnkr/+RuuAYHNlwlhcZyUlm7fQXr+NjIpYXaIm5Jmwi9Bk+qU+uh1Ej4wXuTHzxMNb+8boylNA7+oFUau73COJ5cdjiYm0QzWGzAtSijfcC+0NnwV8VegXRJuPogl0qi9EWVuEpHl8YWfewe7x5uveh/eIaK5dp7OeEUU9RZpNCLrSEivy582h9EcmwZ684l061ZPYvk9qcDKayKOsClJuhCL08YO5KZwxgwPLgOkmBJngU3PlRfDW1sM8Nn6xGgYa+XiyO3rdNqFxh6am5Rgm01h/ZF1Bv4xKn7kxySY9+SpSUI5ecwEDxXVWRLQkoZHb58P314cvr2mqjMUih3hJ2OxrnmDyGSvkqVoZgqJYc4yEOJTlnViX6WncSccuydRDZQ9ivd0c3V45UDvaQHcDslGVFkpV5GaLGbVblD+fkXWs9smaxZDvRVhzSTtsP5DLyohEKtHVwl/RFg/IyLxndBnUrcfQHDv6zn4B523YEisEU5NafEoGnWZgGxPFiKhayDtipAgjPaGKcI7jwYr91gRihzThYA8QkBhovfM2oS10dEJ+vu361O+9h7eXHP2hq/3YZLNJOSrOGbzqBoBkSOIieQaYhK5HmTKUzAPZSOtVdZnGzzDGFzf5rh1/22rAdatpYvh0vDeLV0M2Hm7qSVbjgBNJtA29XNJnKPDz3kKJGyEaIyEGtGYSnXEaKARZuKIEwGLlLiHk3Qm5g6rkYwgJiu5udXwymfYAsSrl2YIl4wOnmn/WJxj/utu12kh0T6iiqBXOW8jDPk8fMjk21P+PoLNyCdtDXkdi91tOXurZeli2LIt8G0ZyxQXeAMM3u4NbixRUnGNqPcBLrYz7faHaTwkmWxNUoJ1QqmUO0BCDAKwHLb/eD2af3HYczQz4PFMeW9ywpBBt2YgFHmn5BVfedu78IaVKL1lvLiWZlNVa5eytbPZfGPnjVUm8IydTsLGTqeoWjpYudzn1/bZ6FB1k0mLUjmV430GAJJP5XifUY1braxV/BES6nkk+tmTV91kLNQ2mQr1HZOsTNvihyR0xI4ULU0w0YsVTM5dlcgnFQwpuHfvh+HDq4wjGfqC4y3swHzz3Z+nYEXKPEw8x/2MbSIPmKIVs4ZsKpTbsrHIYGEqPCkMJu5a1U8z58zcMs8hc45Y1Wcyb0ldpTG3YII7YF4A0cGNeyh/4jLPB/FB/Ch+t4djsL0K2X2gXoHQBp4FOYuiNUg7GcUagPXR6whq9cDqKHL0IWMVL+rBtocMx6CZoTIPklWhWAWCVdGQD4Q8FOSjHyGrHgUoBk4YmRiOEPzgniohBoML40CBI6zyr3FI4OMBHwqMGNUxY2oW1NlOIfozm4YNeZrOlJn98iyXb7TMVslj4CcgFsXZErUgTteblhcVX1XunlIf1bK+evV0q6dTTZNWlZxpNk+n+drM12JV5eKrFdMpE1gEMXhcRI3o/x3jEPS/cQyCI3+v/IH+sIW4/u0k9kD967nv/s2FtyLshyXhDdjoHDahwbKho0UufJE55rQzKe4Gta/Y7y0v959uHO+dl96TBZUEpnOhntwgW5/MQSc3boDbEbAwyps5tOQ+tFokFSl5Lj7pX16WgiIQHCCtq/UfYg8/D7XNfIRhvLTFkQ/09V0HejDUheTRSkvlqYBoiRva2BHDHxff9B+v9n/h0CbLAnieqS7D3M+WzEdbpzhFnxdIsidupLs9SLTu9iQOLPwpzUnA/NxUiKbpCAB3mTSdaFE5NDPwY0HoLgGot2ewV8yTB+yLl3QclE1HHY/nOAtELj86HGCxvP8WBIcA0kfOLGqC++QBOnSHTwe7SxypFZHBLC5DzXM8FQM2kXY9mZBsIrJfDCRtbu0W3tyjG9r6xxXT89sPVYJ+NkEsY3wxsDx/MRCNka0EUDHw0ziQWEgyx56OzIR19prAXea4HyUhXoItLnmxAIzx0XiiiKiUorp7/Im7ZVJeMVw3XCW8iRcFC1FbjmPi+RhdY/kPBe8wt0WSUvrr5wbX3g2u/aCPNqA/9PCXXlj95Iupoi+TaAAMr/HBVx6lU+CFMjNV3N1MuMoGFI4bBjyIm6jlSBVoFX9bJl7gDmjgaQqOvEWq7u1l7Fn1AndHK5zhjQHGWvAB37jNStlEOlTqkC+4+ntMuv0ek+/9qDSJi4x9jnY8PV22JMhZB9XNtEg2jIcVU0IPHmN9gXK+//Sp/+jL8MYdZn7nv+cfY/zvioF5Nh8Uy0xkLEXmiOtJgqs/AuX6P0Jrr6Kku0fCpXiqiCMqhScWGuwMdYf2++4BboHnRGoepxj3xSsqovDSxBfVrNHn+NuNtojp/fSeZcyi01YR0n2G2S1OA4X6sUEwgvSPJF7jSULOSqi/ef/4wr4poahltRD8rEiqtwz4ky9nZEWTPHtyKK/iS8QRtwXCAq2OdRvbFq0DJkNVTqaYSlVM1v2542kcuXzbGODgWiF+wziRKZZwJsrYe9EThTxc1KHqgQJtVCWU7r/7Aruzv/FWThRwDTQ955blmnfLMnW3M521BblJDmNqFuP5uGPvDRTWCW+OG9u35cX9/Kr/ZM1eXBuQ/OQ3J59ZrLw7kTTy6kiivTqS6C/4RpTn8A78R0lZ17VU9LQ9Td61XKuLDVHgkfCePX5xAXfB+jmCZckUhg4wrccxWiWA1PJA52LapAbRLulM0mQFHzPMSQ/nt+t0Rs6iMRENjOvzB9KaDF4dPiEvP7sKMlId+x100V1v+eBieOW2Dy5IQmWtSv6DYKVUPjphE8ASSa2AJb4vXcfxKUN5usExzjW6TgjGSnTu7RmEsTfdIgFfuBNGigTUSp1SaKd7HOXi3hJRI6qRRLoNriL9XR4TuVbFmmNgqs1NLyaYc8H6bNIZ63tW3XWC550n4t3eY9lq46V1NJ8IWZSJ5OLzXRHv1on2dyPS/ktzK9/anmhpyYBIkzewsGg4qNWb2dZ57IBQ2Zg8RcW0klk1UeO26PpS1RaRUP+Jz5X+wpBPHvCUc8iOLovzw1vrblk40GkHbnOlHbXRP1WAiyyTDIksE8R0Z8XIDkapY6Cly0bcVD1PG4DJxw/nRePjun/bv7vmukxOe52UWYz+u8mLpjEmqHew6wuCq5BuIKtPDgM5Z2bMizG3xXkrojiYrn/MSTDfQF+N7w+YH8A6S6C/4f5RxG+g2kfTMdcU4UVPLwhsrsLcCsLlpa7L+58EtQZnKwDwBOTnwz0f6PkQj0NT42jLIJYPrgwLCQSSxpp39JkR7hmHPAJ1pLFF2zJ40ZZRiwPDNA5CKHbg1y2YwYMLXPsxatDNlJsdr97GJBNrdlUtasWWVkyoM2xmy9SEVbLrxs2J2Q/71rMYaik8jW5q3FfgFdXtNLanVU2NVrSnrzdVWfrazFRYRXmp2mJ15SkYUy2qV0Q+KwLWAWN6pLr3J0RrcKv9x1ikRkddlMb7O43Q6JBFZ/71pOgM7efv/tVFZqileN0LYGAcMSup+SjTt+fUPGrsG1xuVDmjtkB7od+4cPx8GW0BtRRx12CV/bR2l8rF0lSml/no6E3m5ZwikV41OjyFGR2R7lmcMuPDC9gE3e1SFgpoSxps1uJ53PS51xWCXd+c6MSxBTbhqY/9ezeO9peO99cHZ7ZoseOFABMWollrYlIP8zwMSmknSif0OJE0d6N22nKkzXL4PJslBBjRkuPOGvJc4u3BqprnNiroYEkjyyJJ59pR9Wi2oS3a+Vh2sILuBV4dRLWyKLTnazusxQAKQHZNqDQbqNJqcSBTaFRWjgpHw7tYImoRXhYciATl6GxxcEkOvMYG+ASM8hTgX9Ny+nXt/OCHn/XoK6VrKqeyPPIvY59NzggQIXm2JligD0Ko5hEWQCCZQEzeA/hbBlKOqmGneYqs0SlK//ltPMC5fW3wcFkyfWFlwSIICuXfxNpvpOoh8a7BpYivCJYWlyxUW1ySRNfiErdaDetpmpzEq5/DPFH6UyKmXEsE0315xi8GU5MkUOTegJNi72REjvdWUJq+FRbovZYFzF1tcyZ5WNdW9GHbYgkYBmhLUTnGE356Dy+DsCZWcdYxR1qqRpC0M+O0CISsTe1u3N3+nh0blPDhav/DJXBoTIKut7CBpJ16BMzwPcH2QDaKJYXNGuWEw7OvM+OuRd57l0/D7XHwPZqO27OBl+LWitN6mzYLnTiTSDLGOqGbyT1DPWOXVKYLSEShZ0VU2AuwwFJMiqxspFQLUcThdMaEvjC0UB1KJU9it25PltDzYO+H3sWP+HApLiIXBCR1QVlqsPlxIDNxNING+G8kYsPREaKoNSIFktq7tde78YSSrem22nFojPEWrEgi7mzkhqhfYcEaaj5g5wnUCgU0n94F3+n48AU3y8ImLZEybSVhG1vS6RAisnIhzMlflxqiyL5zUtn6gGJdZMcMhIPp6d/ddPcEunV6FnOTrHtWFtbkLUo2RhrV4+kxRZWKayblB2+f9x+tcwUCqSq4HzA4Ul8/l0oiFQsnKxOByqcKSpRu7ebp7FkaaD16Onx4FcwBH7GgtEBPBanLV8sSSpGsuiaJI/54TfpwrKCTh60xqTSHN9/xhdu9N19A/PA+NcSKw2IWY3adVpxpX7Ai5iCMsjPkPGLTMNfEKaTJoiyC+18GZ/epuSPKIPdFvWnMAg+zrGwq40Ueip1qYC0ZoPHDGLXE8YuL/Ru3B0sPJem/Gcy6DARNGIMNOTWWKwaPIYkZtYk4NakskE0qSavmh8Xo4GXoHzSVpib3R5iPHzv24OuR7lW9tfX+WzqfaMfpDHb3y5QfegZpU5gpHqR0D0VMmuMwVVlUxJtgJsGRHnUsv/dsa3jlEfNSwAUB3JgF8Ay0eEl6Blom5+hVYYzl6RmGsTw9xTAa0iqpRn4UKqGvEM78EViiRumjaGl44esIWmoJA6LbgrSv1TSFGJaT9s1V26S/jRgwkS6ctSs2fbq82Xv+sn/+plkqklI9JchDP4whwb8xmSPI0pNtWILv0IMSi4tS3arhIx0gXiWG76yrumv43juspIbLG/0rWxY9oqtGFhaP6ZLyBkRQQAmmqMDJE0F5mFb603t3F24h5aSecGFKPyZSTQuYd1OTACnrJEY8v95pEJ8VNeBD9QSwp7920HuCiQE5ZZIC7mFphlTSrGYTEJHfTAkjbgYVipVzWGhD0UQSOniwMzzP7BdwebDQAdRf0/TReDqniFHGp5SRELhjD48S7DN9WWejgJ3RtBd5boUtw7NLg2s/92//wOUtsygIdUOp0UWRHCLzdpELo6TF4qOE9RlpnN9446KyufYzd+qoBSiRH0Nb+s7AzYEZUYYWTJyX0emUmbboTkl9tbsHdblJUF9nsfRsHrXXtOWW17vbGOiT343MAt5HJwieaO4EPb1B1Dh4+NsuU9SCkwJMkxyvMYfLvCznX5lnJb6U5+KYd2OujefUOGem6mmYe+EcCw+9Gmj1Ib/hfEP4Prb3UL0Puw1xG9y2/BYOCfhKh1WMqhUpNePaP60BNLhrQFcxagWfVnGpXuey5hSDVgosFLKNQzXDZ4bMJE9FwZGHk5AS59sKH0NvDt98MFBU1cMGgTjA4YMeRTwVsOPBhRGcwBDB8IFwfcWsFEaNt9ltNdpSb+mb1BMMqZlPM5wjFtO3lOMWy7dTnoUaeypqLLDjij2T42dP+Jl4pkaU84iSNtVsX+Efq5Yc142mElUZVlWUU34jCs/UnCg48ffjOSRVlYtyTvUe0xymNERjjEel4L3/x8RyOf8Li02N/LWEp/xRi1D9/YQIFaoZKY/7u58/hP5YwaQCsEFC4drl8XpY1qJ6GFD3WfkGyV1+26JGS1SRhgwZuHA+nTvafzpY3+lvP6OGwqALkOyxjhfGdU0lRCc3AC1exBWheToTxXOgNJMS+Syz6pTtb8sd5jY7IJIfvgGc9M4Z2IL9uy95dhTUQtH1JK1OHFFLUyJNbodcKANuG46lSSPiAYop/nqG62evvO3fpPhxg/5eqmUcaUaMjKQYZCv5Yn5eWAhUj8safLEYt8NGRvS17HcTteJGnBBqxwX/ebn/w7ve5buwW+mBFSFWfPN8ykjTLgEiYyoiM/PZSMJJht+WvyeQBWqf0iERbnDF8C8fjvZP91Y3ejfXemsXhWQnaqRYzh6qTnCCTaIvxK7tlN5VaZEgn2n5PSu2IolKbFTZ4NROztZoUBUSdvnShp39R1/6K1/6185w284oT1OsMxPsiiyOOYPUDI9R22QFK6MiXwscqPvbGufIMnXnwW7/Pkxwtn/2FQWb6774shGeavMPbYTlTFtLFeuAsk9RigkfxN5Y6r+727u4yzn3gPbacgL7nxJB9MSeCCTUzpFkg6S0ozqtD+HTe9gUPltYFag9GwAxmgXSCinxIT6GiggaUTHYiI/KrYk3lZZY//rO0ZdHvcObssSmnDR49al08IBVIdToW/i+kLcJn+elw/61W/IcZmuiZXPmbUVSBn4fOSZRtmkExFD8Wo8mAJHG0v8cY/RXD/rMeE+HDk4ksyVttlJlhYX3TXLgOYMXS70+setCzb6gvmvEbaFHLWvcDffrzuDju+O7G0f72AY9i0OqxGkpp1Tyl+56kWlXijTJTCIFUA+mqaMb8T6e6z2/DuIoBBSwIPWkaccTaQYHJOr8BrC9mcWzhEzmobS6s03w7gy8XNsEC3XABJ0ompXlobrkj5YGbEe8VK4Cvc8XyT/wcRRa9D44tzW4uCFvEUCFxPiIhydDH47sa4eKhVHRUMmiVPpzFgtXfKxex+p9kpRHVGntpCGJasr9KBP+R4w5VaSbUJuA90Nr4NFPoJVAp/Sv3OMfAVpaann0hkSQuyERqLeD8ux2enSEpbdjwqIiCVuSGN19W/L5ig4RSPx2A7Pklvmudg8GK7v9a5c4Vx65nJI4bKv+DTvUhfdUmDGbJQ8t4q0WOWXacx76KdVJv56RhMfjx1ePDnf6dygrPkLGLhavaAhXBao18Hq5cDoH7zKJZEjZW7FXBovsP/raW33D8rKUrBlohylwB43DLkunqZgSwIRKBYselXgYVKRyhotV2TXy0DH8yclOd0Fs78rDwcoGN9BqenKRICMRyo0O0q1gICZjOiVeba9muOxMfvql06iK73ATmQjeTNSR8qcslIvc5Ry54R94dVuumgdVYBdJl0aABrCS9jr00JisEBOioxK/4YSpOXp5+ASxwRIT0SLtGTKZk3I8w9E8Yh19c+/4/nNsUrrzfvCR2q6CVxW3s5KfK7zcuuUzgNgQYBZN+nuzmFxR/SYEQDr1IuV77+ScPDvVSvFMita5jsJL5+7heEpENHrShveUe12vqX/N8n7v/gZMB//g9yZz4N23yrIWzhldrpvS+1ARjneu0rhrFL05X86kd1fH5CsyFrAyr/7Iu7qTtv54jePhbnGCDLe6VRRyXlEDA/rHlK9hQLPmplz6S1tyD36GHd+FirB7UFF4CyIFb4FEeLfgJBEYCag8MEw0MaUdBUQUyY8EtxfuBd5VsA9sEyxkdYd0FNsonpGdo9sG147+valGntNpRv6sihEmNr0IM3t6sZnLKT0oiDJ1V6ImSzq0eXSIjhZY0uDpXRODTTRYyuRwh8Ppk9wEcw1YtRgk9xGy/2/yY+GpsBvb21lyIPxE0MpwU1ArwExGrT7Q9TClAEkEj/jX186SgN9FilWAp+juj5GdB8UMhDk8B/uio/iLy38ULRFOMoCUeYhI/+WDFUUqHkyZhCU8UGJQRECIIgmGAx4MmIwlfsfy+wbfTL2Z5kworuG/pYo3m2nW0rOTnu4wuygmzAwXFqGatfqTJsasS9Wi/FnlbordKW5PhftKVTWqp0lBI9mPCtup/CpRgqJFT9R7qKhow6veW9oCP0/0nqmqSUqGFQx7RvJHvOv1v6JC3kmh4fyksqcsbf5PRFpNPGH6P8aLn8a+90qgJl1rhVBjX1o4428nlkPBNbXvvtOLmt/9zSP9mcE84iLnI8+45n0i2qt1Qj9ri5LG9npneJ5JzLF0PFgoMlFSIcox1koVEZJAZazUUSlbU12MQlUXq9ys3i6FqRxMcdwpC2roiOHiNC/lfI9IlHNtI0/DZPoRseboUeXacQns/tHnr731x/0nb/nUD72wtuUIEs1+jGdEaR7OCdOzzUopymk9dT2YdWZWRdKZknhPkW4DnxVN1V9/f7z5ijUXThZgCFKzS9CDEzyG55bT2lOMx8IkiZipm/3D7gbSrmWUW/a+/3736GCPstIK+CNqHiasrRir6WCESuRL+IaGRDwpRezJjdnuByjyeHV3ePZ5/722HYJbWKhL8wM8Fs+08IKpYLyhUHZbm6ua14XRiM8s+o8u9vbvDX6+SwG4DA/wkTjYmO+NZ47lCVFcvTrEQlmvgrT+L++okIUkUaypaWW+HWalyOVMTGCja3f+ikzs4y0AL8RaB6546oWqhCfP5Chz3rigdWJxweYFwnq/wIL7H28d39vt7Tznu8QZmoU2GazFre5TOdfBeyS3C7B6It0LMTrkOzPWbNv5NIO1Hwd3PjjUlSglGRj6rM5gRUQKERb1PSGOx7Uf+WfjRd7vRqISyhFAbPP/tXZtvW0cWfqvEPM8AWZ3B3PZx9ndh8ViF/uwrwujRTaptprdTLNJ2xoMYMfR2LLk+G7H98hxbMmOIsf2WhYT2w9MkD8i3v7FnntVNakgAwwQOGKT/VV1d/U53zl1LuLd6HIPaTYXuli4MOmwO3+LE5Ep/mP99uj8PpVij2OMb+ppgEMaL0nJKAWEQx2Nh2EkQoF3hcJjz4Ote4VkKWCgD0EZBjW5ZdWc0B/cS57HBxv/0SvP/bPU1nhXm4Cej5UZ8ZBGcsQCRz00JBDs0SueBMIEc1gqZBlk+ABZD5RJ3OTQnOP5su2xUowP/fMj2SQl77aOzp+G/2Zb343Wz1IFCqx+ixUjiuoQWHgK5hdVxoC7loGSZSeKB08evY+FAtoQo7Vt5oI0BIhogOlai4qGFEPmCMR8qVd6D3zBVxw+QUFAHIg2+WZr+tdL3MI4ht+QVOhgike5aJACN606wbKy75CdY9u6zslYA41whXE/Dx5kvEl9JGyIWrwax1ZdrJ9nNTeerTbs+ljzRqsuOxxEM/HO7+MoXDkFlx+Poo0gMWKxxPyGWnfBONT72H179GBaXVHaJ9OYowvb3ETZGzZopozmUxYXDe9hxMftCMWQ+I+I+jsrh+YOz0yjgcFhobdIyIyKxxyRPHEp2Lw1k4rUGH9/iaUGne+JDTT2M0zljfxmCXkzKVqkjaPjiew1UgVglGnUMQHTIlLrRT1e3xhfuICdE97f5o7UcdoAAwP0ZL0nFVbBzBhusRjmIVFNSMY2jafNGEJoH5TRai4Mm8tCYfEealKVcCTh8ThtxqCl9FCLM7PIb4OIZy/Nbtzj6gLtBK66KBK/i0tETY9zBjb9QdTkuBxKVhktUBu7lwHWdAbDcp0dVR0YOU93YDmNOBLVBQFGsoP3/Lgrpbn/nmMNUtCOJcZKLIcqzuGYiguAZGIAQ1NiGDebHClaNyAuw4GrJFQhLrwu0eoUtgf05cVrkLVM+ITBCGgwAJhZPQ9bPgZ4Ncf3qF+C4DLdwwvUuXalAirdym4kaqCMs3zJige2JXBmKaK2fkC4ZPEy3X/zEpcrTboT5V13XxUm4EMEo9JbS7/g3lMy3ME7NrnzyfSTrxSriep3yd4selAR1dkqOIiDHhR3RomH37eEe7p3nlhXS6sO0as/+f6tkSV4d0FWOC5iY2QhvNjwqYOjDTOkiOc2GXBE/ecFjQsaJQGj82lcGq2i4rV+KT9c60hRo13pmTK6uQ+g4/0NDgxbDikdFdyndatRPVgcjuCJxTKSrrFt6pBDaHALJmd3pUjKsgtIpq70z5JWgtslHX4qeGgnOIQebw2mxcBUfF6Dtxh/fvE5GylRwOWxvQI6c+Ah+sYCCULQGlFdXZclb/p0a9wyQf0k66dHn92QvTRCpfsKiiFtHtHe7e9pbc1ZWRXzSo2cqn1TMW58q8bZMvImselidotnsHjkv8L5nSFhVoRvQRhRtz9MwT54zuxbYtritLfKBY30r4BbG6s2Pu0R10CZs/JWnW1rlOqcC6VMVpWgUiraK2GUupMY9emVCxikHKsQR58yOrIYsqsFpMojUkaiAgbls36fzfw8hTHaEhAWodskpBaKJRNGKoYC8qCM4ZdqcCvOKgq2qlZNm5oetdvOtCHQcjlnhKGa27urao5Dy/BFc5qnqnR8TeN0TKAKTAP8nNQPRLGTwxL+rcLcxLgvwKuy1hOGJgJN+C1ycTgp5UkkE0UmhxZ4ttpx+e9KT/4059eqfuu8WgvOU59W9SvzaP3mKI8Whq4cO6Yk6dhvvCidooeFa7wIEMlWDwJAqEwflkc77keAjDc2x5fXggiQrqWKtCOuuQF3LWbEuFhqR6kelGF4s0jRKRK0pU7F2zLC4dv7s6uPqIk6wON+2YmKtYGrIpVmCc7KwFH6BaWpYBKPaT1nWXz5hhUfWxbIreKV0KrwkCMscVYKmPRGA4Tp5ht3rt/2j4smKWfIuVpSwBrotXLB4Bgb7/GH8b0BB4NPzj5mFlHEXEnJZxHDLzvK9q1KUxbJsdwr0TQ/lPtMOzzeaPSHN2DD0jHofrj0Bhoira/G7TkiG6wZZLG6WoTCYp39WBsIuL7RhbSHb4AFz1m41kA6cssGL8dbNuJcYmc6XAmPNT7/gZtOylBw45frpeYi4w0DFoMh5lmNsijYxV4CccbNNzsk+diTNQzSpQQKiuMPQdy57HJv1fS82fU1PhWfSgtecKvMHuMR7BQIAlHkbS59JEqOuG3hFiaFg969CTg4Pij6UiMGCUH8PXVt3YMoOgdps01ToJCTnKawkquGVWMx7/DjVEORRV7yw7UlZ3ze32PlgrtRLc86xKi1PtvYT9kTqJ8ZlFGuc1L7/b3Z2lUDibU9DLUmpUcc1Ye7pEx2OOuNc5PoewKSvsGbbwAKxBBVySvRIOgIzwHNEc1h6SFGIyD4p1n74cwKz2p0Y2t0lfeZ4Zdxs5lbYTcq7OXnThW64vF2z6VPeYv+0S1b9JQ+BbfeSnt1uHW3geoB2jxVOMprEqRvHysMZjOx85qINZ9EjUn9A4yCto4EpEzufg6snMOzU2qvGOleWJmx8aU4kVbm9GEy3uoCmNnjyx5MlumehlyChXBhRnxOcXaa1QfPsWtXNdoY8FVlwAm67rJ0MRiOroUKjsrgjQHLYIYxEVyPmjV4jZvS0VZyC2unSCVlJMkxJpM8kLSpuA4c0nILMWVipdDtRXeHBK6gW8QRhCEcp1fD02NMzG67fYcDfZvB3XIyT7MhTdJVEyEx+J457vTSPZtiIM4w9SJSJBTK+LGKg/VhKD4H1j7jTe58Ojq/M7u+YaidQtkZtiAwqtVO6llseTiJ1N65/2h06QXtK5YUuNYz6m4XBxqqzg52X5IbXkIJ+l9LzQET4gA7fnjPk+CEHV5y0vGM/hz75OCWJ5mRzjvn2fw59ng0cUY8e/z0HQs1NvpXMu0n6D0cjhQXCZtKq4qGbho70IoWImS7AEQOZt+NGln+UV7UE02rKnqtmEtlwzf+F2Unkj7M5Lymwu5YQCfhRnnswJ58sj5+9Wj0nvpkNdG70o9OEMrccNwPKm+GY+GhZali6qH7uFmMeUkBLvMOEGK0tr5sD3d5ufS5xxSWkaAuSNeojQJlqWim8PT168k333KmMNgBLXQotRqJV9OLgdXpgpBVn4vC+W4XwmTCxHg+X4oSrJNl4KSt4jStcbvuIhddHlOTz3Z1yoeDv46/27JZpylGwKHQjPE8r1CNN3MfGXdU/pb5+9gB68PHx50b2ZCgh8cOFIzLY5m9Y/PXQga3tgGdsy6LHE7HB+oDZhy66QEiEyqiWNYG0cYQE9AMk9YH7vquOE9siyeaK8dpgj6N1TWXwL0BHdHrSnWvhlT9nW29gXUncgVAJdqmO9yCm1pjVFq93C+AMNV0ZIuCqhZPzgC/vz45R9tIiFLrRkflVpmZ4khmoMxNkzsb5yjbwCxyMi/MOKgYBr5VsJigV1i54+MWfxcSZTzSq9PfIT/2SbGjwyGHrLBXfBbE45k+jgY3RuyJijQdnrvLO7LJP2SSKVWLORra45LofJQqYvf3JlfPTj77Trmg3B2lbMrUVon1aaXPPSZoOnNmTjkoElJxonSBLAlTkqwC5jTKZThMo6N1hj5XJiNxMUZdlGtw8Rx1UQHZUKbB6MoHjARgcaEzWpwUCICofuMkHhcRtcyaWBXw0arXVKXpR6cZVSP6mjDQTqaSRBk5rcDC/Nfhh5/RAkcoABPS4pDxxKYJzEXyXbynJkKPPntO0qoWU9VVkUy+WPLEkUkhkxhcafyMyByRN4s9OazC/2OxI8d9WfHjBGcFbhz3jXlx/vjbn/XiCIk49sffmhMnjfvYFDqtg5bg+6p9CPVgin0+Ue1QM8PPKCDs8dp0MODoPtwuivm3Ylh4gFlelBxdlzfy9vAVUOheu+ahoxuygo8BwAWq0NRGOhwMxueucgwwn3dqVUKWaDi4k01KxZ8fLxxAmqQOmkxn4W/xIMM4uOW0/gZI7ez0J9PzV/Xq2gW3KccxLOxBm4f6A3r9QxeOONxpaV9SHWx2f4d7itpIfl9RkJO4MyC5xSn+iZ6F3seZeC6H2w1xYnA/vNG5V9NP70zfXqKy6KizOrHLjwLlJ3KhsPCborcUlYZFQgL0CEOBmBhdfmpQhdPLy/VUHS4lNgiRomH+4bo7TmE8B8tWciFpSEJsXSJ5Ljw+/HAfY4UGF2hnqoOtQ4vSNhUw9EBHtZgDHc+GEEyLNiA8jjZQOIs1yPtwF6VZVSPqw0tVcPQ5pW5xGQLqewhy8vC7N+Ob55hnJhjZApZ4KhUBfVMFnb5tgnG2CucCKLKy+4f3mNcrYGiYIMfElJ1SYjGRYVIEgh1TgkkTlfXL7HL84M3hwRNll800Xu6u5BpchivAA8aPIa7hUQwKJUgh3Ow56jkDq6XYkUhZBDDGjtvGcp9ow40aNVIZkKsPZ7e4MxFGf8NtSiNpGRMX4nVIWlg0sCA/mRw7nqci1AlMgqMBjOOjGQymI4kcOQy/lPvtVCOrGdTIek31i6EWZzk2uXsTucHeHomWPnV6Wcm0KpPrQ67QkpWPijEqraEsCa1qC3LG9VuQC7RrQQ6rh/NfMEYib6eRP1Pq2Klx0dix88ENiqaE9XKCNo20Ty8m9oPchjXe5+wF+D9uTQombvjkgkQzLHi/B/Cm7/C6Ga1WNvNukBbSjjV0jtoJ5+3FkXOSGuJygSgRxOLmGGyu1R97KbmYpxfyp3kmWtGTwbRpHk3L2ubJ+xZYMljRAA7N2zL0/kmX4Fvb8AZKo2A0ZMq4m0v/dPlTiDzcUX11uWMsBZIU2M6cX2NM9/r+0mjtq/HuVzTDLqWgJR+t6JrklvLqmz4pE8Jm8jRJTn0pLXYHm+1Yi3kJ2tlY5/7yLmKHG8xro9r6fOv6DpbAnm9Zj23YyVKynvWzs9tgLrme9R3ds8yLPhd8dtIBji1hC3vyEy+WGyYyVF7UnPTRifIeANNqm6zDwsQ1Lq813Km72cLL9ODN6NtPeLaM3XHRveIAxiWRJW3KgIs1MjXqtLm8J3quKDK1NnzZY9aGq2t6+R3VMMCwARdz1eVawfhmgcXDwkSOzUGKQwvh2KGFWEQZrKdg0serpneqEYHlSpuCZT1pRDG3v6YeLtgHA2vcSdN57JB17yFuflLTeWCw6IMH8i8sZLjVxCp6Gfm48U/1EHDuqUGpg+Dw7QUGYwcBAUmbLG2UDIsEkbhZsvugutWbHChXm1kDeyWp/DBupCcbMdIDNi/a6pGeVQwGbGhy7yGx7LwbkCGtg4VO9V4hOsw7VteDunyEYOC6IV4RU3OChtRawZ2MmhSzCP/mK82pghNWC9ou9Wr3R4+fTtYP5ILxrGCtBMsPVjZuAtWlad0vWjIrqDpFUmJbJCndR6VP8+N2xEGz9UzxMz9eJOZCgmlrc7T29ejCA3I4wAkraAw4u6lOnk8sf8Nla1LqIMfOyUaKTZW468827t/QhsnZTWCsnLvEMcN1E8Gv/ItU6wEJUNLMNSTLsXt/lo/XbJZsRcRwTjN3txR3tzKuPMOfOVi/lLChXlmji8cJrn2Ai8abG/svnvO8y01EQ7stBIGP8O2T3QnAkN0JhMAHTP72RS6fI4ycnzdsAsPJN5k8hCOMB99o8MwFoylqE3iUniM1tkV8Ap9XJh+weI+5V5m0kWiPQQeq12lcEdziXsBi0vccv7W6UfLS/kLdYarDY4ZVQrhL5yEhvPVGCWHABZUDOqJm1MwxMgvzcBxqEXsy3mSkKYyNWkBkjMIYfzn6BnoUxfiJR01Mw88rdlPnpsj97XZWtXMa1rSq3m/1HXUk8r4qs1hciaxy+keVjyfXTZqrkvnFvzYlItI4FMosh1n8aq0/kKNxwflkf6tc9EWiykFtF2QFvtf0bTO5JOJI4s9EAlFt7E0VHfMOIM3jniv47H9hjp/Kr8Xp4x81h88fjnD4WOL4sT84Xw/aurAkQPj3gIX0ebNPjtTt0HALewtzIa2vU/ZooFvZKlqMt746HDyePN9AX8n9R1zXAqynpaiGyZqFuczw8ST9HPOR3JDY7AqoWy8ynSNT0MDdcHhMn+LHODxwhqnOYLq/B890dvohG6k6fO1UdGIZC3PTQ4uLYrjTrMnw+mm4y1f7BZZKQescBvrhLpHx2Zlr03fbgD27dobVHmhegEwTbUokV1YUcVPqg/DLlcWsoykiU4/BbcOi8aDipGza5Pnt6bsnXDkNwzMj7NYbwPfhtedy+/UELO6kkGpQVLsPkdC/juGLqzrdJ9Otzek5quKb4Y1dSbSoXNLBTu36vPnTAkQgib0VQxt9eK5QWFNVEmVxlxE3UUDj8JvpDukRuo1YmI9LMODTRA29v3d4sDH9cHe0fpFTrk/gptFyqVsCSN4acQdWQdGrF5aJhARPdjhx46GrM5bLJ0MMJ7y1ySYYAhIzMwOMdkYp94BvAH+Oj/NH3BKVpL9BWfvpDkVKf7M+Ong1O319fGuNStvBa5QDjdDUHpCRWQEHolZGMbeEVcN+lFrx/yQiESJKLi7dBDO8tQagsxsfPFCCYP9cnorFMnyaxbwT4x1EN74cpOUEqm+Va/jKvUh4W36y9nS8/nR05XMYcPblA04IxzNrhKW6P+lH0u83ZRM/hpcC3siYYrz9b6pjSJgdvpD47wpfIt42HRMb+K19PdkZTM8/oy0dugagOyBH2brsLSXZ8LXE0aLUppp83eFgieSCeBB7DS6JQ1VuYVBJmV6SrS0Y5cvno/3X7LpJwHrt9tTT1U1Oskq2vxSElvqPzylyuG5I+DY+fTg6N3BgdJ46mHdLwEbmmIM6E6KXuGM5l0VsaLkVrOeC9ta7z2bnLo1fHlB0Ta+Jjpt5SDSykb6VFVj/uGxOCO7km28ZFNhLWUNkje5Oc9zWbNN7Yh8zUmsxT0ubd6C/8OXB+OWWbIViYZBeHuJwYHsu/SnkqAk0QtP4tue3sSjihS88gdaVprU51SCjUkmlGAotDoqlso1RHbPwJMCKN9mwPLUJuZJu5EUUSWe4tR5YKPSKF1FnwQAO2DuC9BvNVx90dG9goCWV/XKQKbwHg5JcSw2Q/WQnybE09g8CQV8hn1DOlWW5ZOOlL0drX4FYmt15SjPO6Odwapb1ymCAlDuPOejucAcpaC1SSYeY6LBo1SxEn5GnH85Ndj7w2VlP0hg4P1NE6lJOnhXZDmEtS3keTs+KzAd9Ot3fFicoR1JYyD3VmcGtfeLGWlWuJxUJVntF3aG97Il2hsnplh0nrnS7uZbKFEaA5l1juCt1+UNOgE5W+oLuL1UAW8gD8E6fG1RIQJmcjEMCoCNmuttOTZk1HkS8JfMDeH4Tfwj2nsgAvv8EdFTZGb4CYRsvs6EeS/GK4BuMD427VkpVcl9IoMMNXPUacIFsunhucvf16P7lwwPabIb7ibFSnZyg5kdt96iqUprMj4rfpHl/waiUwi82gY0523kz23nPm8QyHKyDU5rCTQ2VqHpQwikVlJcjQqu3JIoDn9tLbqZ8/mD6Gt+GToL7Cy1nCvUxhJYCdOvZ8BHtyWsWcApvDi8u6tEjq//6HQAjax4rgtQQUFWo9C1BGcHsRg5h8hyrkt4KJ0eyHrgI7w13GZ7cvQ7GHQiE8frn4yvsrm/Tc0zrp+qsovxBiqhBc8OqwXWs7QmHKdyFDwfwNem3rOCzZ1dIICsw1nFqSNGWLOonWcI9lLb0T0LzAjxYG2vLcZRiFOcxerDBXccBpEanWsKUBNO1CtpbsEMR5lDIQRpEnxbQSXpaiOQ9LEwmceQPSa544Bbpa2a8FopCWnZ0ccup2BX02ck2UIbtutApoeBySMbQ+WEMkfRHJzBukU5AtZYw3uHrAp4drSlAI8pEB/B6Y0nb4HRTpPuasz/4AGRf0vbhrBqd4+N5D53x6HELj1SkyhvMkPb6yjyWS/e8HbhvRtiEF9gR3pyf37Y5e2bEUq8b3AeqvNYxVBLbXGL5l82aIXnaK4Fx6/exnzcpF9pzvvHmGWwmp9Giov4FKKL1k2eamVEW2Esnk8id5Vs1Zs+IMWMOM15TZrVIqvAB8f/3n8IoYkxYejhdm5oN0myU7YXJ9kZgKXh83jj8AiLtU2alyUZflRMveK/sdbIXaY5ThkxSKoKmGtk2vnmbw9rmmKPHGrUq4fDrj7ke4fjbd0wV/16ca55vGRPyuY/xHWM6jpgYF9F1xqvLmIev/X2WIUtqjk5UiITPIXxdWlGt8xrV16OBBnUqT/WcKUrWkaIg1eOnqiVUNFX94uuWQLGoRuHTQ0kfJPCYCmGRbx7iiqT3pLBJYBW/nshRUeNJGJMq9t0v/rlKtKpLjSVekXe6oCj+Z2HR6sU/MTfbkQjicFv8vbnefn+E6y04rZTi1r93XjiyHtgSgqUgNY/Y1UEVDIa7chDXqOftgD8LkYDk8Zh8d4OKxuclnNXQnmIMiUQQU2o4koAAmQGy4AdavcrQCvp/LwA0QIxE2stGSgwyqRZTjkaa1IdbFOncdd94h8kjgPQEQ3JPSQ+P6flno73vDwefjT+/xmGTLaZ+Ze1UN4qtslhu3h9ncPD1m/2D106Wj5ajUTARTWCy5qD22vGSONjB+kI7He5mI5d0m6aGIsMb8DH9Q+bExcndt+MzL+A/mmMCUIAVU901H5wLAGHad8991DYjlCOKfGzvgDk7mmEM5QnPVe6ZoenbdbiZIMwSM0vEtMSAAN7pUHMEjB4UVLu3RhfPsC2CK87Op0KhkdYFpiYJfeCYblDp5ZXQ8qR4vGACC4eOG9IlOONH7M8B00A+3J4cnKnO5JQ6ZLDMfoJl3LHCAKd1gsXMxT8x7FisPjwO39AOyo/PPwbVAZwh5igiilrZHEy3bk3un+Z1irs9bFxS44tofqh2cnL4ipOSeBzKu+61yCFiIwy3MS7vFC6CkzbK4dtnh29PH77dsIHKk1qopoMhN7jd2WTFTAcwk7RMe1LGGc15Co8ZfrFiuUZ332Mwy72N8UNOS2YquFLX1i2EAy9uTMU36BO9s6tJmpQ9DzWoxCGwWoYDz4qsCAdGwUh9MiwNT4qgzmX15aHzUau/grsy8VwV/ctXxjcPsFOxFtLn54zF5ktQkYX6RYGvhYNRv1pshxEOR1XzX/bqNX9cfLP39mbXb/NwwSitLC9OWDvQ4aMSy3+qA5Y6hMqRQgqQeq5Xc7rG+jPzuvpgVOwgAJMKCdSl7uA4BU8R7X7y3XT//uThrg8Jv9W8dJkVNg9I8fUS/12TAGh77+bB9MM9Vm3oWtGg5nypHcNi6fM+Lge+n1nBTWBuZXAapLSelbesk1oTXiV312tUhJSP45oEPrZsNUGQ5JLYV2c/VgV58W50/gX7+xtg09ALVUQn/Np5BIzWVJvhsbeGIv909QS9pPwo8fLOX4F3FB4iBV34WFwa3m0ecKV4+UQ6KWav9ilWSQAzfvmB7l+eRjVz6guBp9wQ/IplielQlp+4BgQKffmEA7eOro/wrMhD0eSrovBIjn23TS+R5rzTxQK9nWPTNPRnSSPmHjmzUAmg1dhDfUA0LI3qbo+LvstrVtqOoUnKcpkPxkftTpU+Smw93XW+s0iZeu9jzIFpUI2TvkhRPSoREkDs+9RFjbtc1yVIOJH2bBi2fsA7wI8/nT69Ot64jD0ZXnDzwqyQqCBPqsoAlatyRyUB/xrn+D+9CgLUYfGVyN3uxqYugw9YpIUDdw/fP5V266g44Tcn/FN5N0hfEjyEYZN9XT9SkpoXIqwgQOKFiDj60uB5KW49sKVEOUXyAU7l1rNoG1DoxMu3Y6xZQF7ibpRTi8HYg5mbUTghwgmmBFg6pSi29xhrgfKdKNyfeFNgCWd8V0YXb+ldWS4tjRd/LUF5rNfwfIr0jVvDXRa3iOHmADg8AULB/HytrVRgoLU+HO8DziP54e6SzGPTm0chfYLk98FM+FhlLojjzWXT5oK/9eYiryWw7g7vZ2BMeWEMjrwKoj3YdUosc7R+EfDA7OL0bsSLSEVFbgkqssyScWNhBfTQxIZDCUQGnALo04qk0crwCy4KEhfkraxJuZtkifqqK1+bvj8YXXrFTI20ZRBzZ1BYm6JfwaOXvCV155atXfv03deAaHCZtt6KGkVMgoAnBp/gBV1Nwqn9dLW36k9t/4lMrYnBU97MHJhNLUCsTg6BZXL7TxSQ57bQY2S2jxk8vkVSMUf42XU/UoMjsD4Cm8NsDc/KmBP1/LeXlDzH2gPCTjrQ6HGVLsP1Y3sayQfnDbFP4JmvHw4eVzhxlaMaNfUIqXFQpZ5GDoUVOiZo9I+JX6iw3UznOZ6ROp9lVSiRT4YcDTIC5LGfed6j3EVqj31/Gs4R6sKjVAmLsgmZpHKey1eY83gkIg6UPn0qULvyGvcIRMge1CAKdHRFL4fbbLbBNq9/nc7ls1JX4ObyO9B/pvyc6lJ9Rd4iUgWk5AL9plpRItwatPckmidWcc8iXqQ6i3OV5U4Sq/QVgcuSVsWsGKGyLEj+cd8zrvTgSzxfRjnZxPHKJG+dGAqEhi8suOoRPU6TCwtS5HQZ/utcfpz/jUuOq/xeM+P8w+aq+d1RaXG29o/9Thw0hiWOnJScP2DZRU288L/ATIfPeHL/Db85FaUdej9ghJNxA97wP4fT/8uvUmpS0v03/9f/5P0aZpnB9/jT8c1zh293/R/+QwhLM9OJ89xAHf5veMMM0Isosxuk9wTvf9bupfm/0E2BO4ey5k+4Dd5Ikx6VjWpH/1XCwv/1P/4zLOeldo8+8e37T/jz2LFf/fn/AVCgWC8=";
\ No newline at end of file
+export const w="eNqsvWtzE8myLvxXOubDeyL0rrU2d9ba33y/YGMb4+uJHRMtqSW13VLL3Wrb8okdgWG43xlmGG4DnoEBD9jAMDOADfiDWMH/OGHJ8r9481JVXd2SgbXXG4GwulqVWV1dlflkVlbWf//3f/+f//zKL9mFkYJdLtjFr/6CBZbldZYKViplfvWXr8YH+o/OTZujY73D+wb6h/cf7m45kk6O9ULRUN7uaxspB/7IQuBPzQ2MQtnAQH/b4ZGFsj8/5feXg/7S5MRI38TIob6ZwiF3plA8NDEycwiq9QKdnt1z5mhf23xpV76vDWnOAjMo78QPXHZ4UDk91tu+e256NDUx0paaHGnLDvS3ppO9rdNmy7yXmpwY7mhvhX/7e7o6F6wE1ExN4v/9VqJ/vmVusLtlNjs+UMrbbR5wLuSATeuRrs6hwcMtrUd6OuHT1d6aTvclhjtak32TE7NAbwzudn8FHeO5pZTplXw7/dVf/uu/vvLcouFblT8qj0zPLFoe9A5+Mcx0wbLzBQuuP15PGpWVvGFBja/qSw+rbx9u3foGvntuxvDhd3nzq//9l//6yrcWoKJvGh58ycB930pRgQMlKTMXklJ08EdEwLCmzTxRsdKG5f/Vs6AYmuPh68KiklUqVJZtWWR/vJQ1Pl4JkGjt+pva8evwJeMaJapFhPDJ4pSoLE6q8njOqDwNFozKWs6Hgs3Xa1vvfq3/cUk8YoymZ9rFeUsQUxeV34KskS3882IJH27j9PaxW/ClnDSsglvi/gkrqkoa1whLrRIwceGl5enV0FUJ34ydlmWFyuOc6orFx9wVRERUQzKCBFa2kVuEiOHZcOnrtAy3cj9tFKCXFdXqmee1b+7h6xC0HMvKMHF4vUCWWgY0w+4WXEqixBA/JEb3czASyjCooNcqy7mUUfjwbW4BuZ16v714A0ZY/dmtrTvIsGR5WeBnidrEMm1mbS/paiR9wS1lpU0vaxp+eKvy2J6nh2nCrv78J3gsnZ0/XTBzpQg7GjdFJ0j5NAl4GJlUgPMIH8eewT5L4gOsnK2deyFfwoKddR23KKaIKYjAbx9Zg8hMUjHctD2ok0obH6/NMbntxW9rZ65i10tqRg9PFjftWdAWnFEwiwqVl3iNE+3aHD7ofdsxCpWloIx0zlytPz9ZvUSvEGbzrJ2FBupk/uK5s2bGgKdDKVDgQr1MpwjkP16ZoQ5EovVnr5AuE4WhZ1pOkd8UzBEPxjMNeMfUr/55MSgZ9ofFaaTyzYvq22NIAru+JH8kJIJWKXoFkyeFb9bGHti++aB68iJ8ybteJkaEhJpb+RnkXMp2ePpRGfSZnQrLKk9zvvHhtj3F4m779Ln6o59DcVdw7ZJZMOnH9HQaRWgXj4WQoGEWAlEcEq48zsJT384q8puvf91av4lVQ+r0fvjxPRjXODpgYsG3vzomve1oKReCPIFZ9WYOh3nhwyLw+vCEBvnm21v1Z8/gMbZv/L755jyysqy5kpWEtwgUzJKPYjLw7byYXRozUA9OMc9SQ2NnqNIYVxIb9pTOtXrxu63VYzSAotwkEWQaWCkg7aZAFwCHtE2aWnyFQscyoGM9L0i5WO5Ay2EGQ5cuZgy7ch9FOI7yzbVTW9fvVS9frT74vvbNZShJWyB+imbOkKSEzPLMlEGaRTFzU3bJr6w49qybd0uBagjdBAGfM4BjCmX1w9f1d7+gZJKtA2JENg/vxPMs6mCYNPy1slam/gESKWriJeiW7ev0xm3xK2pTwcyj6OVa4koREQTgYZfnYNQuo+xnOqCwNtfWaITCbw2qJ4ZO0vUlPb5oIAddgO2DFxdkFUV4Z9DK6smX+IyBmyT9XFLDA7nkYWCDKs27qZCxXqQYgMzIhITPPcOmMLFQ6aNAJUHIE1x+5Y6jYUyNwzZdu1R9d00K17zpJHl6Yw0D3oOdD3wf35cocbjIZOXmGZXlBR6krAaQ6Pp6/fefa+dP1s5usBh1kvS4Uvg0aRh2Gj4ban0cDzCxrt8ErS9AiBOYLFjNXAEeU9biJpGokl3PIp57nEU8VTbKAgxJddFEwl+Zgb5JInIhXPbHq83XF6vP3rB0R+FtFmM0+lk6kViHqQx6o+/ThJiK4QUuiHsQFqx0SM2bjtDv/E3qc6W/6a7BmlugH5/YFoKM6xWbgYPwlo4OeJbT/zo4qL16Af9CcFC0QF4rwFT5WfQSXoV9VnlDpBaDaUI131VX30kY64OU0DSioGCYoKaLoidQGdppq0ERVtZAYUe1Ye3FcVaIGl1j2jdDVWSGaIKv/SBFCij4eG0aVAQJ0Orln6vH7ik4R79Qox1faZ5Qm8+VDQY7ioAB38ooLvKKVO3O2dpvS4ThqIZbUH3mm1F8o6EbRMiMi0VTyk0hjUUYJo1vWSEvhW5MHfpJgNME/BHY0dGY4BXCsf8NRgzg1jFUHSZ22X+h6RG1YFJ2xk67eX5TS0AfDA/shMUNsDuU0cHTI25s+J4akzsZGrpF8GWgPgT0IZj/IiAfAfGqD8NvcTQru01HrxpytUreZ2FrFLJ6pivnkoCEsfGvBn2I/0RFhdI+i/kiUC2G0nYCaAo+RYFTI4CJARcNsSiM0gSacM81QSIkR7IGtgN77buTm2vnNSigNKRUi5ouVGpQ3fvCH+vaV2oTT34B9AO2Jyg2bM6xX0GZSTUW+b1SqpriUlorVFmh7Azl5k6vW9Myn7P9dtARmoJoxri5wI4La12WflKMaiJUF3fNZkRaCaNQBmmyxzdhyvz3V34BAE/JHGTh3GH8P0I0tnz1n8DMCrJBiS2nT/1Quqk+R61gE1751K9yvu1k0Wmz68Du//xqOmUWobVzX/2f//zKBFyGf0Xt4tdfc2d8/bV4uK+hytd70Fv231/t3r17H1Dbvx/Y8ddd+9TXf+z56rMONjc/fXR+yt6VSg7vg+/DRfhvyi5N4t9U8kA2myjD7QX4lKfswMmNtVkj3e2p5PzslL1nMpNOJfGXWAbSb9or5qfha3Yg4RXdafhxD9ztKc932/CZmnNk7U7805lJdqTgkwYq7aXJiXF7T6mtNG5O7ilNmk6urXWgs6PF6m4fHYYvR/FisP9QX29XS/+h9EQi250Y7uw4kElAAfzfcmTwEHzrzeK3/q6W/SOJfZlER3vrdNYaae/rbensTAwPdFhHgRgwT8KTTHa097RkE0BxtIm7zfTcrIluKSvvmNRVUJJDS8PMO5Ulns5LjgHDcB5149MptHNuO2jiLCCUtudxYN59uPn6/Pbdm9VTr6p3Hm9deg6Fc27BKMy5AAocYYwo0934i84xLNa46rwklmEGwrIniz7GwPV92zCnrFma7z6Yux6hWwvE0eMctXea/iP08Gt94+bWnfPwD0exDXY+mBbGdMrKpQQuwr4BEpkCWRDcM+4Cir5ZNC7MXIoVAlAlrV5ZAWv6KeJPIFq797B68eXWk/OiL6LEwSgB9GYSAIGvoI3RgQV2GwgCorkEUvfNjPHPJ0D3b3/7G2hVJHtpuXppvXp6DUqq1y5ASa5kzxHpbMFkIwv9TsGUJC6uPk2fIDeZq4oBwW7UhZ6VK1lZtxRlYuWhWwADBVlCfKDGrYBdHF5lKUvS9eMVsJMWA4IBW78/qp1DyVXKZe0SWANG2nFzsUEBEKHoW5EBYcoiHAgA5z4sgvyVw2Fr5ezW44vR4aARBvxu5hwzCaPdsIKCXeK3iMVTXOrZovmgfRbIWQrj5M08dAV5C97dqb56uLW+srX+iPXxNMguZFH2pHkNOgL90IB7s2YWRTBZyWTGT5lFO5ghf/UVHMKVlXmcNGCoLaPzj6yIykpAOvvupfrSherrX2pX1uprT7ZvXaYxa2azgRPlZ+UDx501XGx6AbEaGfZcSG93ihoh9eOHJ2UwVdG5d99m79Hl7XsvN99dqj8/QTqZKtIcKngBG5gmvMoMOslAHDN4lQULON6xBKhNEUqDZ4GxVXlD3bX+qnYOuutu7TyZw1YGKkVJW6CdodfNrJVjo1VeOmS8Uees0K3qmef1jXuMxByjGGg0VA+YqOEDM9YDdjLwYz0AoyYb64LtJz9EukDn4Ls5B8Y24GeP1Js7ZefUlb0AL3Eph2PwUhlQPHoSqitXqivL1ZPrtXO3qDVe2gHViERh0HiMetyUXay8LNFahIc+eTNvlfidpWiiVlZKIGUBB9KMhCts7E8/1J/dhdlYu3wFLoEEzMMIWUDVvuWljAB9bwUzmKHpU4YxaFo+F6XYPYW9i60GMcjO2A+LafZPVR882v5uA6z96jucokB/zvWyRo9RsHJzEr4WK0ueIbgxgJUlXKCRR3dbGsc6oSSmvnX8TXXjCQoAH6a2YMGCkKwkH3QQOvZInqoSbjlAJ7a4M9CiPMiUEre7dvZ89cypzfWnm+vfc7unTctLGmWQWKGMNWGeAMQQchbkSd71GI9JoiBLP14nFEgE4XLz9SUpWiVVzRIAGjg1cJabs9JBgDaBdgPNOcJ97sdL08Laqx87wdYeaCZ6jcrdBIMLxoZP4wxG9WzBxgGSFt8NuO3iXWltINxHd2qS+uE8QP6tt9gDZfxZhDCC3gCUGDS8gI1xgD7IVXTCpa2giPY2dEXlN+qK257x8VIGTMU5wqg3qhsXay+/q924r/VFCSqV/ldB17cW85DkYcTRhZk0QsJI8MojpokdYBsaQelrBPmdh7Z7btIU4wAlOvqrVRFNEAYGladptHkWSFpcq68uVVdvVc/8KetJ+uT94z4Ge8gw86i2CzQeTCogJ2EB+oReJGhBeFswiGkW4oBmgPPN5c3XqBZrJ17Kmg0c3HzJ9kAyEf0C23lUBLMcrGJRVFnKkHsLJRSPQPIkvr1SWwEQda7+isQeLlTiygPQL1rWNIu+XMGE0UuYCceyWVlJGw6iN3gAyTFGVhKUjVXE3HkQjy6vbZrerO0QwAnAjkAfJS160iIpWyQfnqAudwy2lj9eIufFnffVH0+AzVy7egoupxFmgMhPwwMDYFDjg1hYgoNTWWYf94KivFiKUl0NScIwiRHMW0lcvmDRgH0ANl0Sm2rOshKBd5ci2QY6Vs3r6oNvtm6/js7rbMGFrtPpor0nCMeIwhzO4TCGobecNjQWSPvhu+r7M9X3N5gJPqNjxcmLfkjbJIzhjviGD0/EcUaDhuLRvHoCiG4vvd86+Uh1gkWrA8oJDD0qSICCTAOMSBHOQPS50ITiqxf107/qRDMOPB56URtI05Qmn6WEXr5p+wXTIJRKZYbrsJWfBnAhPI1sGyCv9ydrd3D1rfbdU249qCxQ9HPkcXShqlBbMJpxDKOv0Xd9F3mQtgV7MOXiLd/NE/zrEGZwnsyNKUMyJoPgp/qjRWbJEK1kgYZoxrHyawr0vBW+hX+z40ClZMyQvG9WHhUQIxi+iQuCgonvVl7YhfBawocIE4IPioOftqfj1F0wY9ImO67EN5zncwxDUD7dub25/px93KixZEWY2aaD3lyE6ikWcaaXpDJ47X6QJOSR4iUIl9Q3WjLk67lYvfhd7ex7sGNw1QqxryLdzOepm3TNDTllwuEbjRhuoZG1g3kljDZlrkWNKWHrfNLI0Y0bQSC0ZuRYV/ZG5Q32xAp5Mhd58fDd5dqFxepdgniamaGZFmZlTX0P7QhlQUSQvAbgdWQd4mmFpKMYmgCXWaTBEH4lQzx8zOf8jDqqNQsu4ssQf6L31E4VaCFHg5wKbDaDmZJpFPApkBeCR+FwVdCrCexSeEuDbkIWZ02wnEibeabjyO8ocgN8K/fJI1395VT1gsB94bqdqcCIBkWiOESCkDgCsULkpb5FUYDS/w2qX7cvpcqHdkiPeDONHNHsUT0c1766flTK8ZOacWetqNQhtUxXUppsVPJKl1OhDGxQR7TsxjIcG+GJftc0h6dmlia+leBuqiLML2pMTFICHynnlHyLiDUl0BplmfCh7jH8pGeNArLyTS83GPecNt5W/tKmNYWXtPGe8o3u/ntz1+ier7/GOrNff82Vil/v/rvwiH7W4TlxwDazE7ZppUYnxxIZ+AP/9uTTyfH2sb4h+L4bfnAQ/g7iPSgegD+Bk5scOTro98OfUmpidArK+krTRwfhvptL4F0Xvhbgb/HoYA/8wstOHDALzuTIlG1OzMDPZzKpUTefHLdG0yOdiXx6vD17wJ4oODn4RdZ0oQGd7bv7ZoAplE0Wpwf/YyLR1tLR2tbyH9nEfDt83z3amZg+Wv7H0URPd2c7fuBfCWqNDXe0pvsTQ11tLVAy3dPZ3tHWsr8jkexM9Pd0t7e1DLfCr9vacon2odFEaw7pDvd2tf0jm2jm+CyAXKkska8GNKJFljOYXDZ0uGnIu3L6Lhi8xDIDI5cWem7dAaurevNx7c6aFNFsfNL7VtLIc3MUBYDLtiIyAcocB8ukSESq/3wyjevd0xREQotfL3+ufrtSWztR/X2ZkU0ZsEXIR7hqxNQCSSN9lCj/YmWgywz5FE/xv8e8UnTmVfX1la13q/XV97ReFLgYOYIS0fKluWsXAozHM1MeyWC0c6mE44gW7IKZ9VxhN9EqFsCbIupMFFWrq5tvb9UuXauuntXQmcYAXUuIAd0cEAwdQ24xb9kl6jfhGwr1GyplEKZooylVV7vxZ/X0KfLmsHORtFDO/3edTopG3vKxD+wMRcj4JFrTPGQIY0Dv/kaGxuqFreuPRdAFAIxCIJaSiujsQSrQx0RFPCKoCTNpYoiR8HWE5ETAFD6ucNMQ8e0bv8PjymeN8QHo5IKUhdeDY1otJ5VAfnExWHZhOXQqSMU0d6srNHlt6czWynXs1LPvSbzOoQi3hHPcomElrF2C74qam6+8TOnkK8uAc9c8ZS+RqVD5rUBY6rvqL8drD2/VXp+svv2GHOS5OAN+U76NvqyQqijFmes6wK2yJm5QKBs8BZi1qO/ZV4yj8NHP2HlXLm09vsj6AnoBWaULklEwI5zNWttFmd5d6EvkCItIj1Vv369euqd6rJybi5En7Wh7po2GQU6Ey2mFAMPslGdNWSosWS5v3g84bg5XqG9jta3jb7evr1cfLNeeoY+47Nig8gkLo+6QOICRXZCRSED4u2maIllaxGRXnTDazoD9sVZ98V1947a0YCNUyUyDjndcXFpB4TXLX8X8YUR25nn19o+szkGfJRWyAO0lLL2QBBWFdMRYZzqrfzIdEJm5KCVtTFiCkjYggJgVzKolK6AWHQq1uw+BcGwoEP3Qh5N1HUXaBfnqFZuRlc5NQZE8mwXX9WPU8C17GZj4MM9m+a2bjpU2FTYk2wjGlD2jLTzAS6ievajMhrRp5RBEGW42vmASok5tyaTRCAlXTIhmfMVE0EW7C8NmTBg6BUJvMIQ96AxVgpoKFYl0YH28RkLv7Yna9febry/Wnr8WcHzWzuKrtQoRwsIJGdJ1o0RhLGHwUlLRrP+yCGQ1mqX/VXA5qspMB1MRozYdlEHoSYsWrTfEu0kOhipU1gj4nluuvl6tvThefbaOVB0Lwxk1zBnSA2Cc8rkt0kmzoMisnoCpzjRKdowCzmtAEAEoiXkbpp2c61zmmVMsX8RyKjy1lIwMiTdfn8cHf7cO/2iCQ90s631lpxTcjOVg99EwcoT4hdLKssNrCmYWRmxK+ktRmqSNkCUZ93e3rv/BzDgaKMf+xiincLahwixGZ5tnZV22Wj98y26Zhdh0u/SweupibLoh7E7ZjU+C4TBmw3PAfAETJvogtFi5VFBPUf/jVe38RuQpdCamA62kwWfPmgLCzGL4bhq7D40SCinDhQCkjJ5Om83T7Z9/RNp31uAL6nS0e8DkAYhnilhy3y2B/e0bPiouu8TLrVCyACUOoYSSTSjBXuBlP1qFIn8nO362fzxfu3QWbDranQJww5Bc4vQRQqK3pIEF+q41DsraBFs5pZiA1bm1vKGYFFz1jn2zGLiE8FyHEWQRLkO6lbWMgYovTrd252J96WeNbq7kOimdsggtCIcor5/DSGKfReVpkqN8tWXz7Rsr1ZMvI8vmtIwovRgLAUJntPCJBF3CP3GJ4DmtIoe3Fp+JgOEcNIHGRYQW4DmY4XlDtJHD9LjEofGI3hHarBGUeSERw8SMj5do2ezNle17L6tvj9XOfksrc36AQa7xluKupZTWUo0sN1ZEnmFbKfIsbKtOzE1bKTKs2fnvFkyPECWNMDlFcPSCnFrgmNnajWWSH55pMeLO6i9FVVLRHiXQQlyEEYqBCAqIRHlU184B4Uh8h0ZZNI/tKTfHHhgy+tNamYWRI0sc0jHP4oIAvYhew1W9uw+3T12rHrsJMLf2wzPl4JlDty6C3rBHrIYOQY62mNKf7A8k2NyN6SlrUEwCUOYCFEYMNGmaxWyyiOUVNcM020tZXZox9C969pRx4pEFwf3tcuhFU5tENxQ83Kskg2vtEOM2weo6So8hdA0w60Si6Fji4ggmVjj4k9hXAV7p8JVwVAI0BR8VMlOYDFekIshRwsUGMNdQpZlX7/OuXYnObEY7InIX5rungxyFbUJUE0MeMbeVwBwKcETQhosQQyJrKcAbMYbCFXK4ShEttXqoyjXlKtWqrkw91qbERenOiFJT6iyiyMLWhZolrlGULtF0CHCR2qNRbyh9IbiFPnKT5TnFUbO01US3Etq6hCX3q5KKEblKA4XxM4wT6BY5bSNyT5d3shIJOa4GIi2UZI0+x92f9jnu3tnnuPsTPsfdO/scd+3gc9zd4HPc9cU+R2f//PjwwKGjB+GPmx0dzo4e2ZNJ7z2Sz2XSHe0t9hjcxM/B/eMDcH9gDn80cOgwfPonj/T2d3W29nW2ThzNjo4cms2Owu/mx6Fq73xxfATu97S29PcAnV2785n03Kw7ujufS0N5J/zNQN0OEy6S+DGhsHXmKNQvAO1W+G3WyY4WW2cmDowNHNpnTvbu6Rvsbhvq624bGz40B3WD1pYppN0xlhgeKLpAKQ8l/UNtA1bCP5pIHe5sPdzVatntLalddkdL3+BQ9+GuzjG7o92ZaOZd9EwhOgwG/xiMjYHHaVpVaHLX1m5Lqw1MdARHb5JK0mytLrFBJCUT7hNx0jgXPeXDb8JQL9Y5RThI2jCTYlRd26ssQVnKKjAdhzwMNi1Ewk1zp1to0P3zyTyteaJI+WVx+86x+sYPtAsubUGdskMVSnY6bYYGlCJi0AI0WBtoNJd59YBUG6HF6oPvq5d/IbUeUgElo1Ey02YwQxb3FMN2EOUIwIKU5XP8ADv2bHFTBZhgeAnyKWvrJhxmcud5de06L6CUHYzS98hvqowC4Ja28yCnkX4eQ9I4HqaBbVBKiZXc39IiQFDnaHy8PoOrPoTizz3GCEHiW738/fbp0zHuJRHon7d9n7Yu2YGTEupqhUussioqVN44aC5MCZcqRjVcSQEce0nh9KtrW+vfguKuvr9RW3mwdf2F2I7A9Q0/kPFVxMxiTwl6Vd0ivSSkhYCZQtYfVG9jABFWUq/GBdFSgkaB/qW9qHRNO7gRDZq81ZVXXytLZUOjV9+4V13/U1Etm2TH4RZd6F0ZmgrAVJEGXIbXEcrY13n11IJy9cpFfl6mjHvbYoQDF0BLJpxJMLB80cUvHbwTe8US7t5P4rZX3/h4jbZF8Gry2qn67w+rD17UfrwDnU0TwrFxo52jUQ49CmEh9Xd8MO3U6zo1fWIA/LLQHY27vgXqcOw8bpm3U1xQWc4aFG7BkbfQZS9Jvd9/u7n+amvlbPXKBWp0yvbgpTuiPsNCHPyGmfctMKXShqWRx201HB9bJk2OIVw+dNFjms53nm++fbv1Yl0Ada6iWg3TChQTdKARZUDDD2B/SgogwKdsthHmekyuIJRE8hm2llZrKz/X7r/iZ7ACDBD27Tlr2nZ2egDRcCizhX1ITxAlHJIU1MIBX8KBkzb+IvYt51JWjq7p0qJINl9YQo/J+MAthT88q67+CK2ljkaRbfhWmaNZMIyK+8MknxoG5RiSrIoT1OjpxHzbKNkGk4z37V9oKhcsds6JjkXyWbAz8nJPH4419O2zAsFQbzHqfjkOeqT6/J3sV9QkMItCZ6AQUNS3PpsAIWUKMGpKHg2CdIzH5rtTvPlGcQDcmGzQWBx8la8sO1F1JdRKXE/x5m1oga6wcPP2ygMKsTSlIvTcPMbGe0FGi/EiNg1a68Nte8bwKsuEcq/Xj9EYCetHZiZCvrwda7V2I9Zs1B4wwjUO2OjTFxWfsCZ0kYtc/0fNlZVVWwHRF3Eugjk1I8YgaAccOVTC8o9H4H2yI2/8uX2c9sahVEVDS64xYh1SIlkrcKgB5BcA0c9xo5e2vvlT1gs1iI+RZRjxXAgVEKoR3OUlOauJeeNPMTEdOzdXMDHdBLpY7HB5AjfKx2hSOc6EOG1arCDXSIQLrlvceRzywtUL0HKKpwylFqFv0PfJvFnShItXcsWmVYqAo7hLDNe+UqZt4sHHa2jKbd17WH31W/XMzeqVX9igK0yT/MLR5MpOLRiB24S08GdXVmZwy12O4va/r578s3bmeyG3iAqo8miAL0cM4X6EwOc+wd01SZjjRW1/DUsd4cqh/TX1Z9/BP17FKPkowXCfTdlTm9kXQOzkVR4N2vCgdlVW1pJiGIL0AnDKIxEDX5gYN1Hu8XC1SS42eCA4COeLtssD4+HX2OqkXR6gjrdv4vymLR5gwoEJn4zPEwIqlhGhScJCvKWUpAnSYvPNeRAYTLOE2VsiNHHptNlAUDcoABKTAokblGOBEkykYKqXRVKgR88331CCGNPgUeD6jpgeOcCEgq4RdFDLYfAWFU3DnRCKByPOgKTY+Q8QqP7oLJDlzf/TBXxdSFbutdcFqxAtEanKkwWUkbhBazpgsdPebx3I/bJY3TiJ+78VVtFFa8byZBS/ZKMBTSa/I+pR9ZW4cKxZgME+1IFO4ZZZTtLGAtwngSvArqP0OSCehYj1BYq9duxSaH1hVayLSmdOxAGaU4KQY6cqKxkYNLxwwslr4ve4GERcAddjYf7m0YGSjnDdvvW+ehte8Znqg1uKd8kJwFwhEpJ502DMZlbgF5uAcasybtg1FHzeLGuKZRuRrECFccuruc0VAgph5nzC9ogMpdhA2mkYhSbFl7T7c/i7CbRshox3RpWfQtnhS2H0+xlgqoNSDY8qjc2YMYY+wy5U8PBfBoUNeDAqX2OClVGYAl+fgFyRup/CLxro0DDLpzDH/y94IxSeHvltwOJNCbkpChzR/6GiVyo+ptzpqZXe1JRmAbfvhJPm8kWeMbq2tJr1l6YNpR7U1VWonzSNJHJ5kF8HpDg7dUL9869NtEZ5T+mkGkYYvFP5iuCt8itqFINyLzz65KxCwW1r2Pyu3wl3u8d+L7e368XKf/qPgztsZ5e/Tn39j4Nq+zpuUz/4+V3qU9nU0d277IP56eF9I0M9w+NHhzsmD/UeOWAP7YLP7kO9g612woGf7c9Pz03b6fnMkcEBE36CZfDvP3J0dwwqHwBC2dShvUO9Tk9q//x0b2G6J1/ocVwnm0rDTfyN60ylZgWF/LQ9B3WRnwl80olkEv5iCybgk4Nf9/d1d+XGhnrGhzsOjh/t2DfQM5Doakm0tCRyYyM9s5kjA0cG2zPoLu1sb+tuTYzC70f7u7uS5mRvoSc/luhNJ6Z7nUJ/X9d4XwKo2ZOJlsPtbcAj1XK4sw0+7VCzpa2153DC7G/mVoVXLSKcOUcNaFWzzIMxI3EnTBleNnRxs2WupPYwMibm6uQhktlpGquW4L7nRqvrsx9VuTb3hd3FZh1iPRNH85zIIhYRG2UjVhf3YgqMe+Yqk+iJEBAbV6AWPjO3Xbv6eKVA+w1FyrnNd/dxLxJlncNtKgDTnfDxtXr0FT1ABd5AS5tCiQraG2QXPMUtoScvbq5juDRGhElaCr4WMOMFwUjcnyj2Qop91LSbYPP9bd5NQBHzaRAq9CMZdWelxUoZfscVXJG/jXwXJQ6MYvQPVKpnL0owHSGEkhC39REluigEUpfJuAIVUYDy3hCZb2RFxGlCHhqiPrUiRTYe8n+6VD11kWI/TVw9Bxr/c/OFcjniyDI9LfqQm8Dfy7xPEHON3U+LLGMPHoVVSzA6xKohvD8OK7bVtyyvGIu9TJxv5MRl3Kb2nJblwAQz/0WxTvGAopa018WbU0a/LEAVmMLdVDSELtVP/8q9Dg1ESf1FNGgRUngOSKem5Bo+uhCAqvQGaPk3mWRlmYKIFEWz5NOisqIm430XlEeieub51u3fJUXHLsHbDyMlBEEOk5DUPl7JLXDauzA+IszR8hOYZhwkAaRFnIRGlmGbR0vpaZYGLs4/swEOBDM2+vyE6RD+it3XYC7AM9H7IuBNUUtSj9d+uFR/9ju8QADi23d/ZJ0eWveIwkR7QvESMoheoYTRaYOIUSRRxGjE/gfjMZcNXBKZajKQb5BbUQi4ASQPeBPWBkzlsFpBDqkAc324yXwoZEVdlGq4Uf3DE061cOYqwIb6zXckZ5mKI9OgifqqMnpK9MrV1ROqMm5h1muLEO9A2r0c312Q157F4fFireGbjc23tzi/BkFEDIWVyYPEHkvND8UlcbBp8w6sD7fTAnG+P7m1IgPtbXOOHU9s/poFO0MDLI1BNOjAWA6KasLSchcZgE/u1chb42BiVNxZoyFO33aLbC1IJ4iiQdhZpPYE7MwZPUtCWmWUnca6l9ajgITaHFXWnEe8RrLmsdFS37iJsv/HO2BCEGMjY4uoNbBgRdS860B5qDhocupkfnhWvfyrolF2QAEIKvCi0Y1QeenzW6dtrw5fUhZmivpSVNnrApCVSXL+JjNlJUEzBlMqOyOWSbMf1WTSSuv0FBWxk4pJRM0STU+HHaS6RPaty6IPF7oMWascdWIEuJFA+F/Jh1G9fIa9sEBhTlIQwpMchiCscO7uaIng9sqIk9EQSxoxRPUbraMqWHXmewHKCFjJZQzpofLF5hLpm+JVgB1NDOXm58UEjCc2BQ0aXIXKmimJ0PzFpHSeXEKAKby5fpEXDxwQzH64ahD6ookO+5fQNUbTH4BQ7ewxHofSsQRyB2Y2ylAWPGWDomBQ7OD+B5CdLHSq1y6A3ORcmFAX+q280y5akp47IdMIJI0CUkz24aHZJmLPNFCq48k4BuSvOvJTmE8Bvp2xGvn3xORAlx5Ni2bwLMRmHOOVFqKwduMXIQcVqqJnYU70AsgD9+y6AEDKgyr8pdI7it5dnlub7+7QM4sZKfeNfA6fiIU11vdC0+twQQGFUJl/Sm3qKlPpS01XNqobXdUoPcNK5l+voRniYozE9cff/vY3mQQGtAcmlKL0L6HWUAL/c5I+FPLh6NUlsJS9EbGrRO5OwrGpZNQcNs1nplipx+8iSTJNwO8pdE7ojjxnrCxKlSHXFgGlk1SQ8gC5lHknEz4u5duiid+Yds+1S6lCMNXM2RC9pyXXi9dR+fQiN5TL4e87uRzC36e+/vvBL43W2pUDSyMoHs3bu3d57nxuKrvnSFA8stfeP7QLPruD4iDcHlwA5Ltv71R2YHys6/CehXJxcKDbOQL/7coddKcnh/qgLIDv3gxcQAUbbpUKk0POXNbuzndnhhNT8567b+/cVBfWwk97W8/Q0cToSN+hsa52EwqSM4XpIbwzm+wag894Cu6lRvsOyRrwb+/05O5dw0fwunuus73tSCrRC39GRw6ZViIFxOCivRVdD2moMTWbHB9rb0Ong5Vob2tt6e/tbIMPORja2zpamzkXwrAIdqVas2aJzGPpo2U3sJMUxRi6IEJ1RFZXsXEAoxhuv66+fg3zXqtehprTnimzp+JOrRgj3rcd5ULAOUofwbMkTrZZjLKbRkXg5sPwjrBExnegla5W7ESsB82+le1jxznKQ4/voIyoaeE+VasYMsSKb/1l5xsRbm/SiKoLilt17ZftW+8jaxsxhu6sK8LLzFm7ZDqcrnbWChpLQYrwNospSiAdukNr3z+vvz9RffaGnaJzFHxmyYrysZYyDRR3KOYFispLL87nh2+rq28UnzLo3k8xEms08FI8EmVN7sEtlzaLqVz2lCR9ReW14HT2mNf+4WmODxdcwRLwbabMfptkc6agtIJkU540+mLcHr7TWaVdN9vISuYHkwPc9lK03BQph0FeWbHEHTBD5nl/Mgp2sTK27AnjFoO15Ka7zY2lrXerIPNh1GyurW2uP0CXV5hdDGaDnWaykafWm6E9sN6Iz0w28awR8lpohliBgSnGqQ4+cUuP3UDYCwi/pGI3qmeebJ19E4ndwKU0UVntx4zTbFpIbiQcoGKmK1boVXr2Bk0ZyY0yaUf5+Gww+pxYjq9sXrrgBV3QvzguxLZ4XM49e2zzzaXq6fvCiqQdFwUplhZsMkUVRSjiHCGSKp2jwBmkcRODeuVrp2pnrlRXL/BrTlugFZGORh0DrsOG5mmDN1E1zAkmTGBOo4j7VYkcrxWXoFaImmjj57/XSquAofYhVdoNaqF4c1MBLkUHYtVOFGYd4d15WaINlpxHLxC7LK9c2Hx9cev4G+hjzu6MGRbhPhpyVl5acp4tY7l43YV4iCguwUAPjIuw4Lg4xYLityLUAQo4mF4pbL3nTlEBZrUPhBmBQ63M/h6YQnNqOyAQBqRP+bJW1Y5APPKj7NCuJ/9LOomlsGdxgH/YVzQaK48rbx3VV/AUW989jPRVhBPGBCzN0nsmoiWOtAJVmsTCciCyPywXjA+3p5kDJgHDaXriXfXyM3SvvT9DPgUK9is7QFzlHsVdJKQokKK8FFQ5kRUA9xKmhKbBxJ7u+sUrtUuPt06cqb4l2QrVRL2QdogbACGUIqhBlrDz/PEcJdunPeszNFI5peT2jdXab0vVk49hpNIwtXneY11tuR8uwQ7z3JTMm+pZAe/vivISerAU5VP75jK8hpCJhUcg6Vx4QYJ7PnBcP2mKtY1YkXKlsxRbDqaUQx2V7PpdsV6DkEFU4imMqSXixKCdCyblQTDT3HptMugMeC6EDKD3vTiLGNoB9FXiQ4XiKEjdCeM9KABrZUpFeWAI1o+LcQwkKka0WEhNU2I6ky/TYTptigkBriDLyY0pZpxWRHtbwfZDk24hmpmi+uBe/c+X0bQUaIIWGmkb8BCNaIPvyoZLJqLVRFwYtQXLwMbLnbE2TSXQSSZI5bxMlEQSnqLxHtyqPkDjvoxxFa4Ydb6FXgjfFLVlFIeXMUxJx+Dxzsk4MvDfSlHSxMN83ixu/3SVKRfA7nUVaRrQIIAzAnKjp2vKyn96NYhWGsPFIPGW0f0Q6SlZwLnyafM9nxkjQCcdunMRDHix4o/vWCcb5HmziaRTqKw1lHCwNw2bGHXMsff6taJecFEooe61RY7+ELRKco0lIV6OUReAWVIX0FXR1khoX+lNxwjhG5dUSi5tFKbt17Jj5ZD5t3o1JKnI5VKBdrKHnHJyvuFdowwaOUw0KSqS3GaFoDJMqoySyrSjmjuGeIW2Y4NxCmPOYl1M6RCscN3rBzwDCwR07eVjRM7H3pIOi5iQcQMufo1GnPRNgvl2jF3rEaMtbjA1GlC62RQaTFFbqam90sxSYUCN2/dDs4E2s/xZO3GOzQQZPaYbKnHL4EsMk5gNwr0XswnihkAUlPMK94zccYMo/OSf1ecPRNCchsAlBhXIM8TaCmVrGPjzP9ZBboivBDKMokEFNXUIKPCXLQBYFI5F4J5CeQ3wTkEt7TuOJ8zTLcbTkx+oosI8EcQRBT866FBwowHOaBigEWCEal8p/Jiqj2neBp0bqnOlyHdSsRHlKhJcg86TqbjvKWUnfLBCtelqTmk4VEJu+JhKlqNg8WX6sqiMlMJMj0BoKmF3qvhZ0bxTxUbJWf6U3IwJPuFpRRxptWPeK9qmmm442KTZD5TPdYfawvHa7K7yvh7cwftKldJff51xxc7ZtPn1wS92wpa8yfGgOHrUy0+O7y5PDE+O789nUyNHRveVJ3IZa2hyfLC8e2JwAX42B78bgM/hWfjMQwHc758vTY4PDw70zc0GowOH2w5BWQpo7IXvyaPw3x4gVoBCgPjWnqkRkE85y85lsofbOvJHE1CSHRsedJLwX8kbnxjdt7s8D00yhwf7zATQLO6ZyqbSQGdssH040dYy1N/XcqS/zxwb7hpKtM30HT7a1jfQcmSo78hQ/0xXR3tra2fLkXQCv3XxkcGpzkRrb8vRREsX3Dya6O7qaB04PPz3YfzW3t7a29ksNV+ugFd0eofcLgbDX+4gl18NeXaS2OCVoT2blfuUGz3LSRZq199j7PDzp9Xnv7M7E3ODlzG4eW56TsbKC3Z0Fi2fbOemKZ0ZRV+ow2g/XrcLaK+JYw/kYbRnV6pnntQfneXDaBXt8DhalR4THpIABKcEMfmaU/iVilzIqUopoQ4+DR4yEPzzYpnzlmJCnTvPt2+f3HyL8hHrpMioCuC1mzImKMrN/6s56+aj7KwSmL7LcvL9lqaj7eLszj3eerSuswv5GNas1PGU1YjS4mOqT8oxhlLKIRMau5My46t7BBvwZGKViAx78PVSfeM05yATZ2dxBbR6S66b9+W6jaDL6fjCJGdRjvqdMN8Z76+F72WV76y+dKG+cYUVDbFR6TEsPiUKB56WiqN5qZaakJbj/vmkpDJ1bH3z59avi7QEgEd+wvMAZElryEOSkwuy9O4KtrzDid1FTBQP85WSzqa28lN18Y5iU8T8/w1MgCJm+vqELQ/CzCmKYzL/JXPekhWFWLcyDQRFbHmsVHefRRmxAy10TrjpOB9Jy/MwA2G6QCkPQ8We4htWeCNi5C+pfHXC37VynXN/AE4RVTnpYSMvesAGRvSAsUfSOKpnYnYRRpZMZ6Z8OiayEJELyq2DrEThZ4x74cuRv9eegMkaVpIdmDpZzA8oUh1hysanM5RtUGGqK2eqD69uvb8kkZWsBZotI/26BdvCTbQMi+xZiVhKIHOKZkrdSMq8k5Th5Q2nJ5GuaRQLJP4o3cGJ+uoKQAewLFA2XL7BB+faLBWAvQoj/fIXxCFoy2kZKkCG1o3q4i1GNUQzfCX4VChEHctTo9ezxYPF76TELc5nJRYFWYqL4IGTLwEFgQDnEIK0RRYOvyqsGnkUdKHKfIGKuuFxboiZKN1L64qoJCZT0dCmJ4+UGNIJj00OzRu5BKJu0BtJkr+DWIRnJ6+dqv18DSAn8FJnJy+YeZQC6shkK5ghzRzj58uU875JnmJx7iLtFYwd0Vx/9jsqbHk+Mx43otNnc8N0gIVjUh5VujDBeM1F0xcRfZW+CMhKSwl+Pg3SuIGgywcyhkYNFlIGGS7V8ouSqlSswhyjd54zNw4TEEc3GoKrJiJF6iMSjOI7R0cmY8MTvQ9yhApJmJb7ZtO2J6UtaGEvy4trnpS1sgzHIqs/XGpiY4P3Z759gNuEodk0uUpekNPI63kM4aWW4mkMU1SEEq6I7oVULI3h1k/P649+UWkMc2Bqlji1QVZOLkzqbZATyrb8oBBmRQ0zJYYnmsg0ieg/lTw4T2Lt/EYkVaLlpFVW/5Aa8OPxgqlQjQU89MqiQjluEP/MyyO81Wt9trK1fqr683PmULCmQaPgY2TkcgvlX7IaSUvCfKATDfUG2ndxrEvaTLRhZPqUot9BVMNHHHAx5sQngIRITmY3qqw4aELjcZH4P2c62vplvXb8G/hHqa9gHGLzLWWI/evtd0UufNX+6nPOREtUtQdwwbAPXW50oZmwgppYkSNrFkg9eCRctk46wHwG0rOKtWUr8btopbdzMzmiJ2wkxc8LsrFOdkCUZ5TqoDRkCIzYgxnT6xjHEL5D1uu1u+/5HYoZCs9o7URdFqFvtBlu+CR9Jh3RUM0mkSxmw8IJijaX4zF0JLU4REK8x60rp6oPvqlunJDvEUE+ZfcPJ5LOyJyylRZUbKxUkGZkybHa6EqOcNle/nN7+X0zLrO2p2s/OlAQYzkx9yel33K5yKVDwkUZn/7EyxCEIOC/PO075PzBt6p3b22+O1U7+dPW22/ZF+MFFOcJ72fOdWTivKzJG4qkjST0LTBpbiMxG/hPGUjAAv4RC6SrWUYC8hRNTz+DTBXT4WlheQQPR85PE+BRnp+mFr6nU2oWC3J8+mXlEStGWegs8BTBze+xk9kWbymygh7mBcHRtaO/GQ8ls60pU57ejBK26PFSWmh5K4M7amlHTNOISSq2/er2Z1PLMybXIypDN/eUjadZdzGjK2LQyVhKYbxJe6qJKRWaMPHrnTyRO9oucaAatVSUgaJbDI2IPg7mSRuE6L0Rt39RM9CREmkKvA6tNc3wt52OAVaZGFiuOsRhalhdQ6YROKpH3quY+6ZwMILa5MuUx7bA66z98D7Ef2JLBAWsscSkAyI/LFKfv/xu66Vw5OhYCIN+rWzjgEvHkA90VCx782fH7GdIZNymiICTZzI4iOybnwrP4oI5dPcm/AsVtNKnUVUa0chKGSuVGVNnUUUmwvs0tRVVWHEVot6VLwqp7fPwoqn/109trl/XdYQ+zFj8Ry5IE+hyGVB4VCjH5XFMDKuFDykX40Kx0QvtWYWC2f8JL3SzHygv9A61hRe62V3lhT6wgxeaKuWjXugDX+yFLu+f3+1NHDlant99EP4Oj84d2TNXPrJ3T/ng/GxyfAD+Dc7P7VnYXR6YG907j9fBYNvs4Ykjftdk4uhwS/++0sSRw+2tffD9EPw9BH974W9vemSw7VBvZ88QXGR7Orrhz4EjCbunowt+0QlXnQ7/omNhdnwAytoHRifaSt6RtoXZJF63jg9MtqQH21rGhlsOjB1t2edN7LXNBNScHUmkR/Bn43ND7a1Bpz9yOGEeTvR2HhxJzPR2Ft3OQjCeyNvZjumOLtvvSAD77KHejGVne1JDh1vNkcHJCWjX2NjR4ZEmXmjAHaUgQwfNFuysmbcZi2AZHTGmCinVJ0Ww85ls8kys2t2HtTu/1u7crr74joLMqC6ndrZ9e1as8HCKnZCFYxYqK+KCXIsy+zaFGQuRtvn6/ObrY/UXS3weFWjtCM0wXoq3G5LHMmmlQn0h7qp0bJ6dtMXtMKiK8toIN7eIP7v3ULq5w6gqwHBMWuW20ZjxdUidOkqlCFqrPzrFCWyiRKB/i3YKF5VQSFt8afMlRyqwI7f+aHH7p2/EtmurpH4VnmSo0eGcRSGhMGuRJCdyFq0uMVHKVRSnqoaFNSsCPcJBAazSXBgOisrjlKAuBsQf50WTwwFRStlUL2y2JE47gkOyGjFJhraC6QQsL+n6hPzV8nNDCdLB8DMmVLv0mNPholeKfvNvESoFbtKM0UKvIB3o42CAkUihQmVOtFCoIVrDp7NzPzwhh+D1e5tra/VjJ2rHcHkWRq9DHGRFdqIClC8I32mUqkZJ0RDPq1MQz2cDYsuwS1k8MMyueVkGZHBS0AF2x+5WL9PGcBczAqf4J/8mpWZ0MKyCsyY3oYAdxiRqr16IVCeGqCBONxSVmzVih67R6vPB0nwm7F8xnybbZXS2tMhKL48Fl9IKxZR0s7OsAkHFbnY8VNpwHDMlNysQQUyAxHmqaGkCQLnbJzMjTmm5qVafc2IqJiCTUoVBV54lv1JeaQOzzCOIpZW6pz9Vv79TIxBKySEyas4xAdGCHWmIdig63BSmI5oCuNYWCbLVN3FWsYgwAOP01EtugcW/UGnh0rIL6Dtl6Arryk6g+syZ68tOoE26UHc2SKsdgQGnQaBtlLzm8f3V2rFjSmwkA+VLgHrtxJz+qDqCLddjtlRLcp2y5P46w7XUFjtUg4CmxNGktW82RHg5AJk5rZ54Xvjaruqh20D0M6jO1xeYJ1aUXawfTosbbhcK6nBBRUJVF4zBYBG+DHmkrPryKbZYTbBVZ4R+9ihDmL9FEfYhDswNIgzVyblyWGNV0bVUVXLMFexZzq9F51GZ6tJCV26et/jaHxZTYp/p1t1jm2/OYKayC3d4tynt8vURmYZp4bgxWRRZw+w7TMmXfOEON4NqaOPK0CAQ6lB19cUABUebBDl83Dd9F40RF1Z/mC9AyBBuGNMRr0T8WLSu8oiS6NFSDGEbcXywCL3GnpGLs489XsfAHCmn1+qrMoGBtWAXOP99jCI3LrXA9JREQkq6SHogGibJRDouRF0sQsUBfXj6sLa/FFdCyuIIumenat9cVn2GOyZky5gWN0vQKeMR3v1xSrJ1kppqINKSzWOpbsbkuSnkr9zrSSRxrFWWZUDhlNyUzYd0wJDbXD/Gwpn3aJOIBwyYt/JRIf+vSHhZH5vb/JwONQq1r1L1iCMOT7zkYzYi6FhDpxow1cGugrkRVKpjSR2QhvhRIccYaFRw7jNQTkNxOsj6HOCKQq0I8PksCopDIA2yfB6s6EhlR4zSjKuGLjw1AnUogVGr4jS4jVMMHCKYQWpozxZq/HMKX9P2X66jNQWNp9CyZoVvn1CrSqPiApY8uSKiGGPaSalEOkFcHUT9OaWmFFqojj6tmDStpCkWL1QqpAjwP9YE8E9qAnGAtJxj+myLSn0l73VRL8965zGlSWc+yZPFMsgpFshRYaxNVSk48ejNz0hOXWjqkFWTbXy+91NxsDcIHU3iNNnfLY7RgCb0N+zvjt4L93c31JH7u6M3lG9n/077u+V5HOiz+np/mFWO0srt3fP5vHK2lRxbcDMjmZHp4d175519u535Ynr8yP6989Pwd+gA3MPfQPneqdHhgc72w8FQz+HZzvZ+f6inv7QLftTV0dqyy0uPH1jIjIwO9+bhU9g7vy+YTEDl/QW4LgOFoZ5sV29ne9eBBXfETo517vKK43DdYVtj7UM9E+1ApK2/u70NytPAcTw/NdwCv80g9fzUaDqZMId69phHenZhCdSc6++edXoSE4e7S4f7u9uwtLO9kM+ZR4ZaJg73t7bksqmB3vau1pZUb+eE2d/XPXGoq6MFPs22eJu2V3kJVzmMuJPDEApdKiNTtKQOa/L5zF8RPPZS5Ec8X/vuZH3j+fZpCm3GmgadnCuGm49LVLOWTl8rknuUxfZkYhEhv/4ncFDkfa6o08c16wAUi2caeSvJy3CyAAOGsOlLaVp3w7MPacmKj0F9/76+9Bg3fX7/jVIZVA23GcSDITx5NxYOoRVrsRaKYxhvQdy0kIuQn+4OxwOTPTsfaPFb8UKFMOm4CjxzciEaMcJIc2v929qxdRU3UgbdY+NpzAu2Z+bzYgUnpOo6n+QQI8setigtzM7lIFZXJ28yxmss1NN1cZBBZYmFJp8pRKm6ttZP1Z/9Ik7mLGGmDxOPkKczOtVZ0lgmnRsLdroQZGTGvWYcYrSVx0PQUaM1T6AGj24DHh6ncncpU0jjjfjIrbyZ14dt9fLNcNgiK6xFykObeIJUOO3oKGlRquZdNgw8oim3+puabzphXLsFvWnNCoRD5zNU1igyIgWYdRaTaOCyNLYaJP5aRkUGVV+9qJ/+Fc8xpOCgjAOqhcyBFKhEla9XEue4YCvvYVZgwY2y/GgUAbgqcphiXidEUZ50KowtswWqK4KeuIZSYuy5fewWJ4cSv6CJ7/y1shTWL2nV4e0XjAiN2vHHigw+kkZHuoByDiUlNjWvkAe2HadSfkpyg2ZDmMuxvrpaXV9TGR1xMAGmFpmdOY2cq1MtEQISVyFJTid3OxtSfHd/a/2mtMVCkiITHp2qxetVosAu0QIHgwAaKZRpuHr1XH3lF9rjwnkaC54pnA0+nvgp7UPT54NAsSERAmgXShrYFq0+uehpuU2maTTDSwFFSoxCuHfIeMNI5oKVb6ShjsINCxzOxImpeFdKtE9fBN1dvlI980T5+JGedgyu8LaDzFSncAt3uyxgHzTOVReEQl543TegmZeF413+lvpco+ToZEIhGSVFVr6khkJSp4bYC2PnAXjziMBTJpd94aqj098qj20y/kRGpq31i5vr5zETKuVl0uZkkHbh9QtEaUqqMCv/as3bYjVflUOxOVVZjjQ8xg+hq6fJecl3dZnyQQl2aPmWRBIssgCkVVWCr2rxh0JXSZ7jKrJw9dc3ToM43z5+THpkLa7DwoAoRdQEk4xpDklSaQsmKfUE1dCUBEJGCmKlYYkbkEqV5TwrCfHQMA9FzqczVzGn+sp1IaxAcMo1fVeQYXNdXJC1LoKoQdknpWvm2eLmxl3hYGAa0k9n5gEzsGZPE26f4oxe5BnE90F44djj2rkXatUAZq4WLMEEwtkyRU4UcXB0SEY/OZrpqZOjJT1tzpBn1LOzga+ymVniSkkpJZyUp9S3stlAJVmAr6GzOEt+NE3CccdQfeHW49rSr5fmWHyfQ4Ypma6Kxy/TKpXYwilD8cUpBBSDz89F+XQpCt+3pQeXSepOFp3i4ThF6e6UVMU7FDRFW/FYlHDfQLhPRVFSFIRLG6uH7cGHa9aejkhj9IZorZBNYJkfaP2lX+JRZjAeS5jP7ON1cX5ZffUxXG6+viS7yve5QuxYa9/NWxox/XTrZiwix1szm9jx1hE+lM23aEhUKP24dEp7ShYp3xpLaiVnEQhhzDHt3kQPG2a2I2G1ffpc/REF4uTmeMJIu74Z/BScImWNXJSA0VmwmBEclJxp7oxT5o72NWrcKLNGt2d0i0L/Hhox6JhXQbNkVtRuPucg65hREUJ6DdzrmF6h+ZhZEEJr7euXguooolZANkS0IU5WCFlHsDqg1L9HgKVClTqk1CBgHEwirhFHBV09B180ABiBfk0hmi78NDymgNNnAZgCTp6GkvTvlJibAdPlcxJOhlhJBzQREKJjD4U6IpAjhAZiKFoNcEPBDF3R76zhI3pdaXRNmcPEt4SO1b4CJiiIJEFUb612diNUkQ0K8nPaMaIX0enJCiv81lx16VorVDlCGOMCHNmSJbEpfWd1E9E07Kdt2EnWQEdXDaFe0ARrMxmrBCs5H0Nh6oUSU/vaXFxGpaSSkM29ejjwgGAhyOebJG9s+pOYj68JhYirL35fefz2fdrjp9dLfb0v5vg7uA9P+BXf937eCWilzQOTE0dnCo6dwc9sftRKJYLk0b6Rzo4hKNjd2942iHf2wq2Z1OTEfH406Jv9x1DiMPyif3IiCySK7uRE3wEvbbrwKcKPe/fOz44Cywz8pgc+3QUnMwV/uyYnoBscuxP+ZrPWQXNuZnIiONrXbh1M7zYTczOpCfhMTk6MjsFnHKjkc50dLXuCZF93V2tLa8vgwO79bYmZicRcZ6K15chAy5HBLszlGECDWltK8x3Y9mA0cRiaffgQ5nicbrETUHWqu7UllxvJdEzlRjoP9bYlDx/qbe/uavFGE60jf+9IFMcTO7gGl0t4YJNZCvJyvyqUWljIrsGwnM9yf4P6Oshx4DllwP398dbZ5eqF7+vvnor8VhhepSoKRBUhVYhdcy5UGNjJkC7mRL38AxN1ySyJkIRBAjgfd7/QTlykRoSzdAAa7cCVZUT3n09KnNqak0MA6a1fF6u371fvrQkzLYBWy9BVajAqkHiLw2guFj1J0dK3x4Fi2FL6aTSGk7YruBnPzdOQjwbe+1FucuMudYge5/nuJ2ATj7/PFeUZP9Fmc6pwTO7cSJ4D77n9GG0fNj5Kzco5Lu+TxI25WfEddLSPQeu8b/Htcu06HRxkG9MF28sJhBFW9WxQOXJdDDcOX+TU8s8vQ115PrtWlZP6pTlbETwRZshOhU6HcjhIMD/xo3U5SIxSxhYk3JTLcYxMBfdzZei0BY0cR8C6IrGTRnXr+Jutb35RhEEiAzGNNtjnKYpP4phiN5kPPA6QlEW8RoTynV+iLdZY1zbqr57hK7z+hrs0IF9GyTEbMo1o1LSMIzEeTDmac47JN6Qi0dlgaCTiGZH1KS38S/Kg5HB+c8JkPoyidvEn6A80MegwClDp0CmilnprOl0zQlbOcV12wMxhquL1xalZmGSe3GA0huWVCDz9cJtQ3xIl6kJS3/1ef35CkIKfCgznW5U/QEB4QdbOCOeaoMNSQt1ggSfusbR7zLurdEZb71brq+8VLx9PHihZvs4xsksiJkg+dU+XgMbHK7gfgbOPkhysrn1XFSHmcnuFEdbeSWrF5/4Xidoo2ViT7QAzR6QbnyW88fEKHfsQpPSnqD1brF191Owpyi5XZMgWlHRSlH5TuwY0O0PoR/EgMXAaw+2IAe/SzZUwl4oVJZ3F4ASUCnZQskt+kjOwTVn2LM/eBQoLkN4bPLhDDNjK05I4nvjGIxiwtdsIa9OOa1BuDWnWoYmrEeaxptGklO06QR7+TI2dGxo5mqSzaKtL33nBztsO5zelHW28x5WSDGvTdPvmg+qZ+5uvV6IzVZCifqCtX3JNKCRLh6Qq0nz2B1MTfs6QBM91e0GIdZzpSsSjkMa9vb5arsKko8+vVk9fFv4S/qlYjPFRlipKWEBjSZKDyZeUiUc/PElz0BXnXX0Kimvz3aXtmxc5yVNKp+zZ6YIpsbONZrvcMypj1atvj3GUesE1xG+5SXaq8jJrFQyNBJS5WETDRFIjLPS4zATRIUrG3bmlzde3gHDt/LccS1Cw/SCpc8BpagfY7WmBLOhK2CnRnpPdVk6SL8KToRkaeNBoNZQ20IztGiTy2pZB3s/XyEju6cOLwGzc06fKSZliPDNCRZ8SHlCn3K/+9OP2sXv1jZO8wYboMSPtPG7oZcfimGlFUSt29HJKqwIsaCOTMKwxK9u97Sc/sHmdtqyiH2WCvg7M5yrcHpyqkPYPCQ1d37jNuhmXejBRqgjooJAKWRW97rKyXGWTW4m4IbTMVr14mhsSuvR1itq7smYdd7ZgRaSqxIWO43qe2HvII+3DYiaKCl98V718NY4Ki9hn4iX6mPOx8mvJKoq1E42dTx3v2EkTFyp1bpwHljdX4S5FkF9FTgRbO3esenK9eg87ynccezrKzsVcxBncMW/Ttky+RACZMnOhm0mk1r5ykZNq+wH/DJO/JvXcu5IOJ971LF/LCfI4S+kDJJStPnxXu/075g8gQCuS7WokfbeA2ZAkLoTZyZcSEwrpPBXFbdUz1+qrSwq3+VTJyhbMnFzo5B3fTkiIz1HSaayeUARQmIraO3gWQ9soajhFFbfS2lHbSFoq8q9urChLRTdSInbJjqaIMkBQXSkrQcf5ykBojvN160C8AA2N7/BoIe4OoW8zEKyQL793R0Yhhgh0J5CrsC2lhLA0X6MEg+G3GBhUMFBDf9H+a0B4yFYaXhdFb0bxloZ2mmEqBaVwrmvwJoJqIsBDxxwKcESgiwIaTVGGQhUUHapAQKi1IwZeM/X1P1PMms7UlNwXaMuIBtN0RlNFpfSTqvhpZYE+VTngvv9GWHKaYI+K16hIRdGNz0qD9So8KCWwCiUnqBl4A7y3nLKwaeYTnYYufKuIHM9coZWUUFruMKXik6NB8sg0g1jeJjdhjjYkGWy4HaYYbFZTJhhsuKdcgXt3Si9IDdQ2dn69V/cD7t4NRA7s+7z3b9+e3bvmZqasbHJ0+CB8t83xsYP7du86uG8PfnZPw43AzUxi+QH4Hf6d/LuV6Mgk9icTU9D/UIgf/8DclIW/LgeZSfwrPw58eqyEnRxNpDsSs1B/qK8/5Uwj3cn2XAK4z7cmhvo6Un396ZwznR21x8egpAxsjwz1tc3a5hh8xuFOEq5bhuG/ob7907jBdKivb19rYqwv0X40cbinuxM/A/AZyqX64Hf9rS3BSMLvSLS1thxsTXR3jvYnZroSA4d7OtEvCH+74Y87luiAP+2tLS0tifa2lsH+RAfcbrb1k81RMJ2yMqQC0YeFJw+p/fFZEpiEweEPCMEy/8cxsWIj8s0T+O/qafhXPUGzERPFW046LVZIKismrQfCgOU9iRE+O/BA0aVRJukQuJ6pExYeCLGh3wy/suPoaYrNpZQwSc6sVU/9JtwFoJmK0VM8wsry+A6VKEDSIfypMksQOcCf2qkcOlnHnDVx1Ru35TgmdbLjmEkoQ4elKiQFk8IoXzCeL+F83v71/Pby8+3lpywr4Gf4ZlQktKwYfsP0RxnSbWVDI0fnwbypb9xhgqg9zDnTYJKCWDIvRY9liuh5yjlCOdeOXdvaWFeRHU4yH0i4kRTiTa/14VuS0FCr/uqCdPLptayUBXqPl9TSNn7lQGexJETNVxm6BQahlZ6NO7XXV+pLF+B/BNcgWgAjeErYQ8eLUxJ5hUmm+f0yctQnOr0F2xG43NcuOKEjB8LXN07X1nkLkevRuhAIuC+rzSeqoid1QRGqAoC9+likxPVyJY2ehRjZwCA0n3InQp/h1gqHDCbXyXAYvJYzMeB0c2zN33lcXbxTO/508/W5cPrgy8xpUXJxFiJQjn2eYP6avjiiEccY00bvQ5wtDzbghGesScbhPk3JE9OewrzPo8lniRVPs/JClDmci0yUs8NDCpoXLzZfn+eVLlxbz9OeYvnjuOFqVh7ptpWa4SHxrIjyZLdtOKu3b14EPmpWy5QxOiPfTJspOqsUg9ACkfwNhh0XOqr0wxOMpnjpwJvHLqz99Kz28O3WGXIxe/AYfvgMZqORnwzTaEirUfxUbSAWryNq4l88DW8hbuJrTDAHHGeAFNm2ylQvwKBjJS7rfzxnWUnTIwePLPeN4TpDPlApeEwUm3j+TCEwRBKeqNgVMhdJYLL6aTOv7GtMzCX1QS5lZk1OU1LmtwKvn0KMTj6HF1J9+0yKFGh+MsROsx4BZCRRsB1xwBHSCKtzXRqIqq5HG1FSwrhYkF8x9RpmH4TOyGmbjs9vYArCs+c3376WezxTasNaiWJBDNyY7XEWPY/O5eE+zfliZ56kdfY8WL9MCI9HDgmh6AJZxqAcjLVsKDeKLCt46Egp4cyZXmrHmizzRNWlC1xViAC9JnaDI9sszj+kBov9V9BYteHdQGQrI1pcj7OrWAE5auSWlcLH61mpQGrrtzQFolVGhKnsJdzcpMwldoVjQAu2+93TrfVvZf2yp+VJMe00ysBZmSrFBJ0qCihfCp8azHkqEVEIjfbgUfXk2drZp4DFsTs8c47Og1KUzbydMnglYj4oinEF1JkPxkh8WHTEOd3nMW98MYDnClT0ul0SRlXK9GXgJPcmVavdfYj9STW5P1VVsWXHBzlVMg1MGoXemamgmOfU62wL0hu5/SO/EYDSSZiaigS+ylkz0h82phWTHi86iocO4QnxG7q/Lj2unr1YvaL3iKLq+lbR0Lrg/x47D/8MzGqDd3y3ZE0lXf0X6CQViRixvz5ep1iUs8vbpy9Cr22+phxFs6aVQ6Wrku6IyrHO5sqqGqYfkHUqy5TxA7P8kBATVylx+FNZxoqjHwsPN0A6r05svjm/uf58c2OJHfCA2ABMFE0rTP7jZXAmK7KyJ2UBkRY5aYHe9s8/ar2mCFEuP0pLJ9MCeqYgwGmYoPfxVW4/+aH+ik9+sXNGMS8OWJY1VSUaRxShIypi6O0fr7gu9ArXbOZZgvckEP7/EHRraBtfDsJbS7wo+b25wNegsNUUsmowVQFUDZu6ApoKiNlUrkQw6SwIEjbA5Tdc48XVXuxLTGP39ji7lz4D9cTeFbnrceM6gz0d5YHqFC+IQVgUCEXAT06CX4mYm2IQhTz4QKww1CvU+Y3qX/iepddZ0/HKlvEajZi4VlYbVF3hvuAv/3wyI3Vo7fZvrEM/rz7TdAAdRzGCyUVpUT+l4JqqKV0/sZ4B3eKKHFa8efXiK9osqzRKllAIv31WAbQ9FBQJvZDXv9SuUJo8Jek9c17MMY9mlBDQJJp1ie4JCRzKYrkxmWSwJn6/UIgpCSZFyidFixIpDTJBigIhBKISQHh4MLjK7d/Rw9N4W3l4mtYUHp7Ge8rDs2cHDw9V0VN3fb3nixN37dtTdN3k6MjoyK7kCHwPSlPpkX1Ft5B3hkZH9ifhb5c1MT6WSZmTh7raWxagAH4yuzeYSo+Pef3jY34f3hvZt8eFT3FhNu8szBbwk8d6e4NSGu+bk10L8KcrC/9Nc/lUNmNOAo9dmdRkexZ+NG2Nj1kTY61QrzV5YOT/PZRwkwdGD/f3dfR2t44mE8gfPz2dbQOD8B/cGJlMHO7r2NWZONzfMXooMQR324a7W1s72zrbEtmJhNWfYE/O0KH2lu7WnrajQO5QV8vsaAKuOtuGe7uBYtdQs3gutAVJ71V+nrdYsIsSjHSQRZSgEGUabeJwSCnOcbLC+saPW+t3tt5dFa81ZRUQy07D6yuJ43Z8C232UkArSei4ECvAGI4l9moZXBQSN/iEovuBL7YfM5PanbWt1Rv1VdS+ggXGjwRhcv1ZPBUBsCEleTFigRx0HG74gzDsS/tBGMVhVx4nZYoEDuGoPjjNiRJUCIeVstUSVsouVH73ShaYvBoXyo1h44lemAYgfkvxMOwF8i+QA4TYVFeubF3/gzzhyMMAIi7T4F4tWFkQLgxbzCmXdm5XVjC2FkuFLxddMdCTH69T3oi1G9unr26u0V4W3iMIuAOwh9Aw0bckb1H7wzellSvfyNNyw/vaXP9za+mp/r5kxegLw1LK6Qwss0FS/E6WeC48i1w3x+PHmCUKcd4O/wwPH1v/s/4OlUsWzysTtaPESTebQcnU6cvCVJgujQhzTl7UkFl+EKBe+/45J0gIW1cy08VADToKtsXkzUbadB00M1W0EN9BCwdeVNYz1Zaz+wvSezAv4xUQ95a5S8l8eYeW69rlrcfnt64/rtKbk/SNYtFUCexf5o2wFXSwHJVpDaBebMbHUIl7aYiEvDh1L6oG3EHm2EmxfGdn/mrP4ZOaOT7xxc7AtVl5AUrDE+jw46U8DIS8Ji4MEeC2Ril07i9Wn53iOb21tlG7cZ9AsDuHLiQD6YljnWDceVmDOFKmuZJJl3TVjDZOWnJkUvC7zqD++5vqyYuytaAfMlHfLeJcCQEihVyE5z3whGrmyL35GKZq9eRJ5fXxrCx6JAx0LRKfolsq8hCIcHLwCUu0/SX9SXbux0sFQ87o20nOBnMlqTOvf3MVvtTuPK2vPt96el1rBTOXW4xh5CYNU4xFJTWwLByiSnzIp10R0Z9pyjKH7Gov7gv5xEzKFMebFKG2Jp4Vybxk0nTJhxCQCMtxxDNF6GOEzunL+CyShaBtzIkkq7gJF3cs5G22tdGWoEBk3JxLxZxDiApxGRQPzsgLIYWJfy7R3r7nv1d/egwyqnrxee3st7zcjOIJDQ+Zj8+joxpChuS+oSJDcaMnCkmDQKf1PvKfS+r1s79V3y3zSjPSN4iKylaQskqkh3OOWTJFwgJZljZt3O6P0sXFnYrhDnPctkODELVzUTmot6+v1i6+gpG4dfsH+E6+ghSMMugGkMBusmxNM2M7Q6cECWYs6r1kHoxFs2BrxSH16DQm8toEZtqYSsuxPJmwxeHHAIVjlXjXh4nnzhVMMehBp4nyypscb5qsvMmTa5icnucebG7crb75rvriMltEJqbyxa0v6jSNkuHiSVKzlRVQi76BLHlypWB2GZKdsBaKxj8v5uk4BvIKX65dfV1/RBtyiKhBxzBEjkEN0rw7DSuAMMWs72zi4FsnLxG7y0+vVy9fIL+K+JHMcmMHM2ZIorKCl/QbM8snK1xxOMkmDSMMMsa3ePpCfeMmEN06/kYcv20QZe5WH4iiBwVmMjpTSo7Yy0XLIT6eo2rF7ny8hr7AZdp7ydHY5E/88c7W+rdbv/9Uu0KpbPjn0AuYkId7uGA7f8Vkh5IncrEKeJICBbmnfFLciqj0KkuYyLQ3X59jmIjkCq7OQMp5MKlslhclOyBR31RfRmQ860gl3ZV2DCX8LDQaly0kcShA3rh0qYjLsb1Mx5QvSIsalH/t+9PMgrwFMGGUfucjXc38Xy1G0I8og6TVAPjkQUusjWXSbzqpSmRlBtZ4xGUEA949Vr3zHPhvH19VSBBFUDoNIx2PO9T5eyal7WrOWd1swomUvy+cmzq37WOL7OIkXuj2lgmibZQXRiFrc88lrTkYZYhpuRcABdADULqvx7y2IPxovN93CbDt1pObwmQgMrjp20+q/CrIgYrsWcGA6eNuMy7TaPIJ3lmRc4sJb98AtL7B+8+QrsH1kDpYDCSA4Q3jSQC8TVcVgoj1hdFYeePxEUKSC1k/b2iB5ORDTNP+7mp98frm2jV+MXjGnKQjdQeBCFUY4gpR1CPcaBp1Sh2nIQvFZOvWN+FCsWyuQhdgp2UsJWd1JAM3Ksv6nR3wBQoeWmzQEQUor9rZ8xqQAD65MPGaY4ncafjNUKyEXJTUFBGqjHl0UjoiYv3tO24yAocixe6HxeSnENCFJtgnC3BBwz0hZXeWto3rrELDx5y1ggKvRzdjRqYBjuIoO7AO+Fg5fKA5YfZGzSkzD+KMtVzEnNLKNXget6YYluvWlKgWNaagBdO+eNGiGAORQcXS3k9qR/Re+Ji0NdCGLlGPV317uXqZM36J5xD0dzj4gm34uCWvYHhossct9ahZrlvFyhhWZrCy64QN2twcVQao/gvdItQsuajxpyw+/RdRIy9q2O1oV8WsKbajQgNKWCI72DEx40X+WI6r0Fm585TWJ3I4hXUjQMP+nGcuhOBx5B1D3TrUjoFfHfOGaFfHuSG6jSBLhSc1JKkApAYaqcNDeKiAYRQSamBNYCwdWilQFeIpHdw0QhqFYsgfrYCLwhReM6Ci0ImGSzSt3VxdN9fTMe0s9bJSmLqejOpHpRRDdRhRhJo+aVRHugbSf6jrHF3LyHBo2eb6s7vCRlSKQ8ndnWTwztK3UfAqqRuTuDw+m1JURDTB1uj3LmfBOivkUtbRuMs7ckd5u+O/F47uSLHyce/ewcetfl36evcXO7cd+9DR3L696fRkYSp3YG/6wL60XU4lx2fhhp0+lMPvC+IaP3PwmRgd6S1Ounn8O3a0uw3/5qcmD02W8ocm90/BvZI7N2sf6m7LmJP7C15bwjnUvReo7cJfd7dNm1gjd2Df3oUyUC+nxqEsU8hPFaG4Da6TWfidNTHSa02M9mbHutuGBvpb2lsOdwzD39b+wUTf4cSBjsTwEJYe6RgeGmhpH+xphfYVocZIX2tqItF/OJEdO9rW0dr+j9ZEX09rpi/RcuQwlPZ0tHZBO/b1Jgb7etrbgcpAf7PwRDyYS5xW78sLsZdAzI5rHEN14lj9+IYMDsmCdeJYc76KVsFqtANMhi7DjF1gYhRvpAKZI3Rj+5mYh4o2lkz07Udm1k6bGTTnMDlCGsQbzmQoLZnk49VL5SmtyzkS9hRdjimxaJ3yxunqlTNb62+r515uff8bR/xCzTKeUUjU5G5odFejeES+7JBHYUQlJT4dS1AlhTYfHumFdGvHHvHmEUGU/dNSwVh+gJEwhOJcO11Z5lhxX97wJfKj1HomZvQVOcLK7H79cBt77eKz6saJ2uKfbDXSrwwkIfPlCWp0JLVOno6OJ0HItGhNUZ3RQSQxBxklL2Z62jnUs5ZjUEI7Xs50MZeYSWcIuTIHbjI8GO7GST6sjU/6wTDVgi02QweEKBWlQmWNCuKkFG5ZIpkBFOuPFquvX2tEC25erXCwSwpMLSdIgZmflylh/CBPPiVB+DfcvL6I6qvymye2sG/duL198nX9+Nn6cco24VAlyxMQB9UrqLGssBU4m6xWotPGvYN4SubLHNOtXrtZ/Z6iUkyOQPR03ISRgAg+6TRO5DxlgkU5q8pE+Ni0Ic7h/LC4gOvuBO4v/7z59kHt7CVA+SIAac6wshgInIwy8BQgk+TDElvE83ybjNB+/cvW+itFW1DFo1SL4UZg3yK3qEu5GUVqUspIJ25YKqcMpXmhTFviMeQhotWr52rnHsJjyENEXTxPrewFU1KX4phzKz/7vPxLQw4xpi/O8RMbNzm9D9ARB0cRAW3EEZxYwUPPZnliAT7nHas73UBbU8QCiO0CZA1+vJ4kxAMg8N7W+u/oXF56KMYjVIW6BvBEcjLpMdP2TA65aCho5IM4ubKW0dkAUK7d4XRkXNuaNksyYxueoANvAfdR0cAUBeJabcLibMkfr5TVHqztn+9tP0RQSVuwsJ5aNVlKB6Yvs0Fgik/eO+8kzXTgwB3iolIwA1F6sdOhn5VIV9deVRepd7BN5VzJMa2cPMcW7S6vQcwBMrEoZVuj9OMwWUwbywKw9v2b6oNvaHXLS1OSlKIgKsU4SlcDD7pLibVc305xNh/BBSMroSk+XBRUIC4lpiWO/3wiYm+BT/2Xxe07x8RarmRkmEbaEmYbRq56mOoDw8nJUZeS6wZcUhDJEXAWfxuURfL27Ru/1278ubX2i0j8nrcxgt7Kg+B25WQLH8UJfLFaK4oAHdN2e+AWBq9Qao6QBYyh6oV1xUKjTj5mmW+cw8ZZ96TtPNgmebHVK7wBpoZd4qhl1kiYTAnFKb+SrTv3q6sc5mGjbgTQYjlqK4AgiSGulpgNghy9CDEhiO6Hb6f5KZ7It739043N18eqV05I6mY4CXypSKU4Wsp7bIyugL1TIk9J5WmQ5bcKdPGt3ruDSvTCOqN3GzcPSE0qlgAETTlTfW1MqkJBUbaS26c0smqh5UPtRqWPZTur+8rytDy9EElfe1lb+UmnjtGqAlWkcMUdeRBawRNQWbgABXmk5rWX1Te/iRhXXJMSDgMYylnWNjBMMZE/5YZvUkjucdrNiVkyKms2BWueO15d+RngQu2PRZobCDSMwMloxDGCqKioUiB61hU5Q5gQkvQkCGFitXvfMggBWhTKnUuVTHXIEq7to2/Vy5gOn0cPZXiqKRSC3Z5xKWCc/WOkNDMCEX647QiX7taJR7hr7NqF6qlX7M/FHAcZ3Ftu4DZcgdd0JjHanLoTQ6xoSyidaIHBgz+tYNaqZ9fEfl4QJmm5nhWIA5PpCchB8hIlklmkXFriIShmGPO4Pg1KhnoAzua6fewYN5y2ArmY6RpbLVQBnnKMpOXZjExQdYPLIwEIbD/5QT0wxkfKVMUWzQLCOA2D1VwI7yLKwv0LOwxcBkIBp/BCsQAo6MHvkYmRS8HYspoytgAFZJowxN2ngdiWgSrNod3KEV7V1ZfVS2er72+EHAUjQx7GSY+GUmK2ssIxduJpqIz1nAJyyyVObig3AADZre/f1h/9zBsAMpYNqAdTKBbF7gXKnOADaBYoMe2YRXYvRkEi+vGYXv3EBd55UTQw6PgzGtgsoPIFUSom0JUiK5So9q1+uwgKWGnftIuB2Jr2Delj+uscnlDPx6cr/Y5mQkken65I82I0rkOSCw/J1y5g+lbKJUn0jTL0wQ7xssJkjBiKn7I6IwZnaIzFbTBleIUml24DadZPaPYoY0eZOWG2bn5zcVukssJ2wsmt79+H9kfE8OB1jAZrYLmkRg6HF0Xhf4jKI2hcgfAQfgvDW2DhEAXTfMiGiUZeAg5WIDgCQzUA2gg9dcAZQs0QZUpwqcM+BfUEyJNNrDySUEy4hIvhdQTHKRDXiN9CsCPQjQ5pmoAZ4RINHB4TGlQRZxlvkuWI4EF2ipRa2lcUYCy1NHkV6nDW2ny4kY8aGnv8xjvQrlK1hppP6jxd1SkFx6pN6pgiuq0bVYyusJSe0rSTlPYxQa9rOCnnm0jaRhmrhq2Qpw1iVIpQKTd3HudKKCphowuYqFxR0iSUI42ORyrvjjsdValyOOq/E85GVaQcjbt2cDQy8693fbGTccGfC2xzwZ8pFqbTydHBowP9PfgXLuezibGR/+hIDJoH/MG5YH7h4FxQXvAPBig44O8c/KzfNg8swN8++H3f9KGBQwkXbhZnitO9+MXN2yZQtgcTu8ZGut28Yx7uO9Tb3tLVnUl0d7S34JUH1ZGjlx4dBMq7ehJYKj+9u6ZGvHRycNfUWMteaBvW6mpr7WxrbemCWrv2Hu3vGYff7T060AO0MuNQuzczmRiHyvAs3kiivWV0MtF7JAFVhtpaj6T6EsPd7S3dHS0T/YnOrtap7sRQZ1cb0A16/j/W3my7bWNpG74Vrv/gO+C7937txE72PtQsyxpsy5p8kgWSIAkJBCgQlEQdeYjnOXbixLMSJ5ZjSx4TS/J0wGTlRsRBd/HV1I0GSSfZ3/rXsiyhAVQ3Go2qp6pr6ORH61q4NVIka49VLHNWTNu1ACoGFOUSgHak9opI9aLSnVyAqXnty9rx1e2tre2Nn8W5FH1c1N1R2SMknFC1V4RmVC1NHGhE0KiOKFvf6+arn7gXlVg4DfiP+2HygNgo1Nhybc+a5ZTdsxJpjDwGgy6Jd2szTZkeYgWZFSgdbKlp/HyjdvVbUDrgcNHPeA4WOHNxY4DNE2hdQYLYG6l30sCdSXV4JsgGMeiB/RKJanPlws61X+lbR6KJOS0uDN9bfpSAXRGVUwRuuPph2ZKeYqdHEocTXWSvhVljG9zI4a5E/ez7+r0f5QAeJduxp55O9Htku4ko84YYEGFOCyymkMAjMRCkEN7xO2SVN9bU9lpZrEiCXn6xKFyO3jNeLFBQPskRMRBXofgEmD3Ys4FFTnKX5th+wpRrF1ea68+YbAajM2M0AS0HaYOo2PEAa2aYvr5AOuALypKemHxsMLrr0pwYgiS+qnZupXZ0C/puXF/lEKsQek3IADK2xHR0GgFq3IzRc6y3dxgE5ZDn0wh14YE3s+2DqD95v/3m29gggGwFkGvbOALHhhUMS0O6hpEUOUMSRrRgO4WUxU5hSnmeghUKXDqxCk/dfPW9kvJ0XULoineUMJcSMQGPRKDJXKQzVtYwgZ4b4y6vvm9cOaW5ixpxjLuAJPZBQ8/YPoIDfeT5nAsohX68+QTnc+C6CLWNY81XD2u3n9XeUZBwGkOCMd4b75XdYgfTcgRUTlooW/B1YNOSHScP62GRidYefGOS83KOjXqSCGTMegJcSuJXMrSkLN1QfUS1nPCtqh34ne/vbL/7Dt8ne72XeWpdtaNNgbdWRFOVT8u0E1WfoKbKX59MKVBMyPenYJTNTjoF8pEuwQuhQ96pQHxOuh1t9dePPa2decT7/KG6z5foCR8AriJiq5MGFUWBb0e3t4SioYsKrRCj5ZReRrAsnLL0Gds4IcxGgmljnBglybsnBieWzLERL4b3nvfYOtvWI7BH45TdEriLLIg0UPgG689Pm+QrtFpi9FWMLKoYaTtLyVQlfNYTBxosjXp9XsLcdk5fbVx6Vrv8DQe75UvwNS9aQQbzKH6EMo/WoMuDJHI4RiJEQ4tTKmFsKxk7WjcOfADruY9vGyAfQvdGvWkATKj5ajPaNKDS3ZLhiN4s1qfnztjXx8LIF+xEJbmnREm8uwTTi4OoX3+KCZM2Nuo3fqTdUSKZqAAUk/o2GODPvKvki7sHRraSpZeyO2CxjDKfwVdWIiMFeksgOF69VHt/o34WzchLyPuBN8tahE+KdtOQvjCxMrWU0JkkR9OBjneUKDiB8Wzibnf91/rtM5K8CJZ/xc2Haj2URPJw0MoCKR8l4gzcknKU9rgsHwvIGPNj0YINs9otOOLCyczFs/W9uJzm5e4n95Vskgfjwk7Aihb4PeAp3+ViSlhBSd28/e4+30y5/Rb9+LpTd8tHkhLXVIy3VgR2vnrOBHjVKRLsJh6SRw5mh8yQLVI16QYq7sUSHrMNkninXJ+LCCZTahoUneiDaCWovgxp5zEKZRgiU5YPIyJtATn0pXdsgSKWB0AuganZ4DclOLPJTFqgHToONZcCT29WahdOAmmOrsxivSFXFZ6inMi0BaEp+4HwcSQuTZokrNacsqkQ0Z07jxo3WbtHqpjEOlRxkyS7IkGu0h2w/FLtTgGFsCvijONqoL8iCzWMhDqH1pii42ZhyaitXBg3IyOWjn6gDiPJ6Eny8Y1jwL5I4fTJ0iohzgv4XaZNIiXQprB+VLqNFI/K4/hQHlXtzClFE+mIwBGiJAvnPYeVDbMxzY1ICouUFdg6J0FmZ0413l+qXTzGcWZ0UyXMCpYJLLf6UqCnzwVAqMEr08eqlwHGphbJLKyUDOwHmcuPqztf3a2dPAGdsJkjxTkoMyb9QtkkrfUKGitvjDCF7Y2jKuFaBp1bO5v0TKWuTZHT+lukuUUaldajItXmvqfTWF79trH1kjNZxrSk/0LD0AJJRXFRfTB0uSXpVDu3yiXCWhSOSAvQliqlUmhl4s8Af2eALWpEHNIbOLoVP8fwbARi0bUgUAu/efciL3wTEWs42QpRNTA1MKQwNYUZTVSnoVwE4uLgzQBuEWjTgM1Aa7rgiIGt4vgmni5eJYrXF7Sm/1B/Ud4OldT71t36V2jzjGGNSPqXlNyP4QiNIGLQQUngDnJXi1wtb5U/uyh4bZqcVt1EKgpvknQFKR1hQYU8SXpp0fc3hJb4CkhNmuurvD5NsWIIFEOUxESIFh6G3Oi4jLTvLjFI4Y4msyXEqf5S3JT4qGahzHk0C4rxH817NONpNwLCCwE43Z34PwR722opt5/WZsGOd4p9sP2cNhT+57POhkK+JfXFFyTKv/jPZ3/XYLgrdNL4U5gc3wM/e/Hv3eXZI5/AD/yZLUx+PpOsZKzPZpLLhcm51PJCYXJ5sTD5ye7ZI5/uctIz470jY0N9wxU3Y3X5Pd1dxZ7uySW4bnFhsjKfsQqTS6lPdpfh2jA9BRcO9k3sg3t2DQ/2u4eS867VBz32wVVz826mF66cLWXHe/HKafgBKoXBvty+wfx0cjqV3NOXLGVnekeGB/+TS8L/qWH839uXnJ4a6jsAfx4YHR4cHRkMBvq7wj5oHYP+chOjI8PpVLK/y5nhpIoDXXBmaGbcKk0mu4o+jBkGPtC/f7STwdCftQNrwYzdhlPkyUPo2Al1BCY5EZG7s8sx3LXr6zu3ftUx3IDaQ5VJShOlaCQJNnBT1a0iKOYku/mschARR2Ozg+03r6MO0hioaHZAG3UZB/2rkVDBDh3tDi/Nnk2uaSCT2DsBd+8iD6Zjae3HVLt2rPb1qe0317hMGdIi5ZxKIbd119qN2MdkO6mA8Zakh0jeJqObi980rj+qPXioe7Jp7y/WUwG94wuxmfOipth0YT6YFE9U/f5pPUvF8lwgmcloV5rHjr4ynAzeydqeTcZOIexzOuKIptq5ZsK8ec1Uo91rm7YT03YxqvaIeVDQlchTxDxKE8h0sRwf51OSunVvXjc/fIv/r6/Wzn+QCpluLmflzXqpNAdY/lZ640fgNu7vI521dKFnh7sQ5/ycvcD1k6uPFlC3p1A8aQMR6Wq3i4dn6r9cNtMaloDrp2IZQSNqZmbDP6WmsoBGxKIAR+UNZIY3qjYH9RL4WHKt8Y3bm8+ar9Za4xuBmefTgSR3YSIJq1AG3WJZ8t5xE9V1xkwEXPFBdaLpco5hImWmv/MxNgqzNbOxSglPszVTBlbruBTiApMwL8VXtaWFrBjPj8MiALS4c/Qo45nyPNyNVbPlm3cBqYcJTZhrnXIVDrMxograFS0LlvZIGEBW7eQqTz2QxaxlSh2QSSAXC61t2pwGO1DBU/5s2U1QoW+ARU4hoEfFR4FzDqc8bf7yuvb+BswYIr8yfEthAoRZNqsSbOco2pghPObWB/ZEhDAbSfnPyTGdhKcyvGGuZlX719YHBNQkChGAWvPDdalGHJRj3LNMNxD7QlC/5vp697jzqeoqhRWtcsGIvHpxjbVv6tc/ANTlF1fBF100e6O8j4BIpRwFYNvqozK7BaakNvkTBntXHjaffg3/eMAVs4ZLx/tl80dubzz6wPd6fuxeDL3BIk1pK5WxbbZZS3PJdzk42eH02pJ4pUwJvbNka62uUi7Nn87ULl+sn3ldW/9e8tUhLVghBSoDIluvaGhn0mS9Rr9cfSjElAOJ5E1lkrX1u7UP9wmkMj2QkhUxX/spR/wpXbvIWwptLRzDuzkbFbba2qhfXGfoHOBFibBIfpkmSVTyA4u2zKSFaoQsBLY4AmiK7DYmnihMuPH1d+yJIoTJa6xoq4B+pZQVOG5SHYLOnjJKIGB0T1xL+/Fd8+zTaMODdLRExldmBkPXAyldIH7a2sjwgWpsPGqhjm4MdwzqQKB1H4UtxrQYYjZdHwB0KW7R5akRl0E26sLE1C7/TMlKMbK8ZLUQpjJHsjGkKHtRm0EcNw/QbKpJb7/5tn79qbIXV6yi1p/iQKsDuEIjUwSwUMbT/tL9t4Kxrh815KMyGxDh6n1N0bOVqK2uinhtnN1UKMYTNQr3MZS9OQfv5SWr6GiraWsWCTOHzoLLnIylfvaH+jkq8ZAhU1DZ1xUlDdIAmHIxstKgiSU4cxtTA8Sl9iQx2VLOUdsDuNEclnwihQdYF7bEX1M6IX46WHEKgCM+7/sztR+/r119CXCRQthKaFJecAxlVkg6XFGDDjKWU7IKnJnP5f1kQIkh2xKbr36pPaC9MEUm4UvGBz8EUZQy4LMcq3fqsDNwMaFeLrki3d5+/4FfawQHLTufjpFU4+PDChcGVOQwmaEmVXt/hhO3cVaVBROTsbUF/X3tCJTFG9EDe14gpTHMxtp7gJV6mDmcxrQOzSSPzeixZ82HptX322MOQny9/e6SfkqVj4W8X0I2KaD3i/xJVlBJxatrMlGc57n612e4HBO/Bvwk4ZtEx0KZNOTGvsrYQA6HOKj28k5mXSdV1ImG1dE5jxQkHWKBAFLpRbyOTU1LaUFt+k9gp9r0EbGjRWpHpG10UGmUWpBRf/EUH+PCrMAdzt3X4F+VI46g+H+PwSP0HWHjv0DJBjw2YHEbFu4EU+P41ESlMZyo4aEGhhFWU8Us/hrsxVAe1sEQAxratSILWiswa8FJZLBL2QxvCBvpcCzANrVn5PoZxzaSWTsGMjSwMCCFIfm1wDdlvJbskUyPyVxD0mpbmMjVFnkdE3mGpIsJOC3XRKJFQkdJHP0hKIEViSolpJRMMIWBKQe0DDAEgObUwqNVsAJONG0r/1L/9rjJkw3mqdmmwTI1t1Ss0uCSmjMaUlhLXsW8Ij6jOEycuWjGIlylo5muWPTz4x3sc6rdNMwZ10YWOdWoTXH//rgpDq8tffHvv22E27u0kBsfyE7C/3ty+fG9XsG25mbHB9TPQm5PvhyWUp/vXcjBqbHP9y7lKnBcKeNPmOrvdabxupGh/t6DB/bth2uGPPiBw33z0D4/Nz7Q3xtMA50B6Gtg4LPJfq9g9adnJg5n4AdolKDPXrw/k544DNc6h4DQ+MBn2Ux65jD8TMzNDkxaSWjcO5A8tK+7K3mA/j+I9+DPKHbW0zXY3dM1eiA5OtLfe8Dt6016+5LQOjwPwxsZ6h3uS/Z0dc8NwPmh/r7u/V1dff2Hkv/bm9zf05tNjtkdKxkDByihO13CKNqjG6lqqtTv4aLZj2kH2Cjkc+5D7eGHqJyP3GmW9dHUCIzrIwHjmqzNxQ8FmGvSjZtfMiw3qGtEDh8DZZjiXEx0sCyZVzA/0kqKcpD9/pg2AG5+1/gOCL1oHn/ALshLuv6mciI3KJh/l9npFSSaQW/n6GWQbB3ptYg53n/F3JpKWqbjbWiaYlelF+Vl3sLiXN/orvTudu3cKj88XE2hb+Jcw/ejr6JMLB3Bt8AxUJgoEt2syBtKpc3HRJEbF+t3rjS3HkdEgRN4UZpy2jENxJCijp1MwFXsHMwYrgO6j//IodwlVGaxXq7kVeB857ZJRh91psA3J+ySdpwqU1hLhmOHAzvLXulRs2wtsZP6fQxWwJzg6klrr9cxLTg/Jl8Jl/IYJRRFAu2IIjHLDMaIF40WTTDh/f54VmfbYMK1O6drmy/V0PMYjotp2WRTL1cOQOHigB/a2YOGwAJFRjdRnq0yZXhnrUt2RBtbm42bz9FJhzdFLRuj90q2i2XglGcNOq8RTaKtjwJNWIQj0Hpzip1M6HaMe8sqpu+jwRRuBEW8xGuewhg9LL/BIMvD3aPqaplKOVR0oQx4ebQB+M3VnVtH67fPbm+ca365wcXRcI3SaNMq9xh3gKEyaFYjp2Akj558z1VL1JGKKWfiHFauyCVc1ypIdpMM6HIAz9Hxn8psh/FjlHg53ptHj5d8RPf+250fLtXWrjRPrDB1261QDZE0VqtTdkWYHPRQQqKygjG2J5RjoYl5qp5QFpaXCCGZKLKsp6fqv1wTX3okiinr8hLFmwrY3RdjnwhOxhoUPAQY+/tjWhTo3UZq0dmftz+s76y8gT5wp8AJ0LpnSSpxpiLlYII0JXrjsjBMnkr6ZKKh53TVOBr0ztcfeG/aRiIAenMq2FC2FBdcXBwUQkAs8WUolSEoO9Gr2smzlN8Fo6+0XyHdHJWzJBJGqSIi8vvjkCk0Hp6g4sCoc4nBBb5arKnjSqc+FrhB+4PvqqbqffS9uJbnunA7lGAe+Dm8mTC0vbJAd4sJ8S9mIumSHx0rKsTeNQMhesDg66+f0/pigom5QPmHBY7v6qeznBR88XZoL7jVR+UFoepxbkQuG//HpUDonr4KiKp+j1ZIxvPd6JGJZvTERDT+uMoXhsjoxyUquqyO66fxY6YPOXQCZA6hxQmO8PSyE8RPcIzvihOiMwdKOLaPE1y8s9L85immrqdc8SUb76q4yqUAUyviIidzpho19+CzXKYxq3zzl68yGRp0RAV1CIsKdoTAp31abw4BFaOJVTv0EKTPzuVYdBT1yJtky+jcj/j5nbtVe/t17coGsCZ2L8hiVVqmGFrxLrVJQvdYkeKfLT0o90HJLW92UtvY2LlzVynx1IlhsyCRDMKgQKHhftECwG8HKT787RoZZSR35rUfa6Que7jnVvBLmLBFVRtCI6gaK9EQ6wndrG0nGyfZcKLujsZBBTWpKkdRGA81eNTALvYRVmAvIV0zmgADejRx3E4GnidUbiiKLJpesibZ/z6wMMS4XgoqlOR6lJqDdwwAtEo5UtXO2wVYu1MsxisZCv81cn1g+YTLV3Wuj4zrlMlTigiomruqGzW5uoUnWJFref9MVL95PSo931ioLchZUvZg2cphBRT2ljCyYuC8fvuTyrtTcFQIPfnNq+qp5A0Cf2qZIaXYMEssk0NZgfN593zj7BmgCZJC5lOTRBMMZi9UFkx09PRIW/OVDROfsECSskBOyGoWLzyub2xtv71Zv70lthzM6myp5NGBn9OzZ/FR3PSIuKFo2h5PfMO2R0yZE1kdEdglfJwzFdVcwbB0nDiFxsqo+bNmjn8yGKtdPgNzCP+TL5wVUmC3pwQuETTGR/RiI2R6MjykRGNDAjy4ju5wrIxEKo2hzGjtJVJaaCTLkuztpdIVaGNLaRQddAkD52uIH/tM9bepwbyG34JaVH0UV6oJkenj8s7pixpzG3BbA2zZw5C9eNy6oI14Az1H4DMGO8vSB4NYA3gaSFABQBP2acBnoD0D52mAFwEYhediSM7EcAR8FADS9+k7FNyJ4xwCKX+CTQw8wZ67cQRh4pA4BEHBrmDCRyS5IcSVVNXSVFWSUVJZyeN2GWqKsk5irEV0xYRWJGqUkJGUilpC1Z9dZwkVk05KBhjc/+NRn6FepMJnTZ77t9h4nIELv/AjRkFIBv8vCIA5f4MAs05PEvC+i/wm7kTB6N8wS9IcOOIXikswgxDu0KEWMJu5i8UujAFySpX8gbZ6wB0viWoCf4yCqgvc8bw2nH3+EcOZvs364gu5r/jF559F5YF37wEyn3/619WBZzPTC4u+Mxm46XH4exxA3/j+fX1uOgl//G8W/983kUxPF6YmRoe6PbjkM7gafn0Od4yW4T+4YgSYDP6uQLuzP7noTO4vwp/Ty1NDME94Zl/RgzsX/ckRIA7/8pkk9pSFn6I3Ow1XuVkbju3UOF7Re3hsEPr6bCg5vVzohvucCvQ+Mzboz8CI9k6NJnsODHR1Dff39hwa6Br8n57krr5kbihZmRjqBvrpZKnrYH/vkZF9fZWJ0e6R/X1zh8cOjiRzXcmeQwe6ug4Ow7n9++B3P5BJjcB9o0NwZqBjNRnXKVA1sIeyqV/yl9E5HtNFyEkq3X1tEXlGJMHZvfX9eu3iVTQvkPaPztSe5+TQaQqrdIn3kHRhlz1HIiZ1UwS6UHXkbTATcjW/u9l89pOGXEw1Ql0Fwm2WKgSD6DATHSEToSx4ipN8OLH9YYXZCKZi9uwMX6vrC+IRpZ6Q7HTo4cyNAQxdVdVDl+JljnnQeVuBcPP0zxjyQKlbNe0oSR0hBj/vlpnBc9IQdAMqB5LFk/ayOU3GxdprsqOVHN9LZMq+UWJOYQNNIIIGqkTY/YzCB7UfnmH9Q4IISEbjFyzFWYBvi0sHWgWXYxsp2yo51M5K8qTG8c2dO99x8iRCfaHtgATk4eCfGkpjhlhSmkMrA1rlvGSoIEKxl8r0IhxNVPQ7tTPlQEdg+ioZaGCTjUMCN6ITKjXZGrr2Y91FKZyO0W4vjjVe3KCdQ2fBypMnXzkw+1Dbz0ybAbRQacHPTCvSnPD+SGfKWJgTMnLpKlUfIfRlzO+ErFlG3lw+Oj/+ccXVvlzNFxcaD94avlx2iK5BceJqtHLMo1WkWOcTtYrJoabHyhURiw0XFh15A0itHl8dU8HutgI++B3xxHL1HviOeGIxi1QJ0DcXj7DSbeSjMeumONYm2r4s/ZQBuqEPQEnbGxd57aoe9PolXzYmSyA0dqSJ8kfPcAu97xMu7lnGB0o1ccJolAk+4i8hRgo+BU1NCCVUWVpcl2knW8Y8+IAPZi1WfXi/ER18KQ+fcZWrkm9gepmK2pitf/197fzp2oN74kKJiumCJbBM0TVYgFDnxWCQi69eoRrp/UDRULXDUnXNz9kJjllmx2ZpkYBjwsvkR/Xb45JErGxvbTVuftl4eIzDVSSyGWR71rVLccJandENxioQilqjIYL81oWYfulWCYPY7JxheWlrIU2w/PvFCu76cNoD2uQ9cX/77bf1k6v1k6+1laVU5rvV7DIpQ7XmBjFdaHKts0tE9ewqotEEk0skvXp2XWo55P2f+x5/w//617/gETK8cptHr8BnjNW1n26qJYx3huLTpMgkrFkSTrTNQA2yiOO0JYWMJtz86RjLKiSoljKGcng+IoIfHABVPr83akJ+Jk1iHXlSIfsWO+rJFmzz4bH6l5fRsrV+t/n0JuuIeFuCySiDPveifWz4WMxZEcFWQxbR1JOt7tK8rQRABgvg4s4Ib6mXPEs5VFkcDIMwI6QsfjZlmHVJjNPMPHi0vXEUhl4//VX9JCVTtzKJyrJkqzap64Hn4Ptr5WpIM+JlQIzXMxKKJDDMe85xuYiFA3BBPmjdxk2Uo/16nvYcUc4x5qCt7i+BP77BwX57qXnsZ3KBzgCsCfSug0HNZBmqjefaINq6sIluNNdI2JhqJ6g+wrBir1wq8ZZUYMux5Cpbm2evVR467x1xvdkTJ7e3zmOBjNMXtzd+5LzegELwi0Qq8Q5koom8rI/NEpFqs3KdAGrml0j3gHqqgqSxgnkAugdaahy2OvhYTDCH5ivWWaQ4Lu5xUWWPeQUfMTP6k6sw6OavP4guOufPJiqeV1a2JU0+knwOMKYFTDIqA5+Pi2oixXKaCBlseZZyygVOOS+eWZjri9D4zrEPtVt3VaH2Sj5KZIlhhUbffBxfnLRRQ5m5ohXaeH8XM9TxIs1HDJecxHIAuDBDaRCQn6eFMWvYZEGT56uypEsJ0hGoZg5uu8mkwYyBkoDM4Jsva5elIg8uIxdDZsRsYnSjlqmbsqhBYA5utncya//4DojqF66IRpPoImzPRZIN6eLQ2+SauNjS2LVwa559CsOOhFvGc+ZMsuZo9Vijx28dLM2AHiwSk4F2rs2hdK/oL60jac1I60RxHYbRjFaERGXRaoqpoGjFQqsUMUVC6xCiQBjAn1zM4XeUgEIrDVpjiJQFwt4abEdAW4NrgdUm6I3gbivUNVGuhrgt8DMGPJUw5B41gu2EXKP7PoolYzCyHe3FsJjGXwp5xbCRgYoiLKRhUISBYhDFACcxYKLBiAFDYjhBjVH+FHyrAQJ5nnyp4UGEDUyRHQnruKDWwlmL5VaZycNetvnLA92CpS/Jg2cgJEVCtsquuNSKSywtpZR8MiSHkhmGvNAyIpIOLZzbEAkGu9acWrFpk+FGrJY+UeGuOJfEVZmlxvmcweFM7qY5msHLDH6jOY2qVx7xK82pmEW11caA74N5XpuFL34qqo7ReocqjxFr15a8zz5iyYsuL37x2d/2grMO9Rye9w9PTB7sHi/N+/hzaGpi5tCuI1MHZ+AHzh842H0gN5fvGhtbmrfhulH4l5v3R+DSkfDI1O5CJlnyhxfhyv1haX7/8P7/OZAcysDh2Gjfvp6lfBf+jT9zXWEqOYB/wT/7UM9iFn73AcW+keH9vXbmUM/MrqmeqYlPevyZie6ZXUe6D3ZPdE13TX4G5z+Hn70Zq+fT9GT3LhdIHxjtW3IPjPUdHh/ef3h8ZP/4yHCxv9eDzgf6e90h+G+wvxc6HBoc6IXrRgcH+lM2dD55cGp6aS4/2cFCJ5puCPKXK1kWzUN0ld/0xPKMWPPoV/UPFF2USmTsUK5Tcdt4wKUXEjqrObWR5y4buP74qpznyl1mBYbGscf1Y291BQZNOrJv0cDSTs6troQlThTR1oJag4dOXhz3/+GXOrkSoxEer7PoMnZ3kiNdKCLWwpUiqo/KkvSZgBoV1mTKzYdnYZwIjW885C40+ZYBc/JvP5rYQjlIWcoljYoJUUqe6iYF9Fz6uX72aOPej9sbF9UcF1w7vwhiXEfHc6UnlXTHnGuibc51eyexSTe7M6Ze9xg9iyySQgmgXjnk0oHtTZgVi+OpEtVVqpu1dam58rpxYo3qjfopLHEZ0g15vEMeSJMwTaN+1KofRyD/ahB/ihMnoQc9frOHlpcRMteVF5OGDyPIWVHaDCL24SiTwTWDYpjuUX7HudgINQnciVZjVLSAdW6lVXE4plpb+xZkn4h3ohYZb7Ggq8MxwmIr4mPPkpJYAas6f1xJJ6pbOLeNL3/dOX2uvvag9tNxem0LnJTZL8Upxkas2gqRvZkrW1fvZyU18PX3JrWoBkqQszGQ1hfQGD/EvEwJfv34itRjH/+p/uVZeD/82BnfL+CcBrat07gSFWOIqiUa4N8irahG4yVZCPLXKSTYy1Ckm2oqi4EsTapSgnKaUyhs9T7bc1ZBa8Ks5r+8btw+H7t5zhecugxTlPViHM/oInqEP67PJVT9FehL8xXkJOd/wlyz788wS4lR0M8CyiQg77R4kRSssOz6pZTyheh8huvzkJsA2nuoU0o08Qp9BJ5uNt7cYT6bR+AD+iOgH7lZcXMhHFs/ujcbMwo5pXhPsZo63JPB0aWnaEmhudYuJAqyZ5Pg3V20D/NuLbtJUPa3o18z1Mn6wBKdrIPXyEDtgmbiJoEYHxRKcb5BNI0BCtk2rpf28+mIbWCalCKrqjkJoljl+IYT53Zun1Zsew7u0l8iUoAF8U81TjpJXkEFg7lpYi3sDckaw+SbWweZdx0A/7TVJZIGnarIUkLJCrmOiIjxS831X4GuGusyYj4ZqqJjbrswpdhL1/RiY2WyxliRcttQFbYgCQJQ3pVMK/OSlJt31hvX7ymTZMau+J5nfRxmMJH/B5RBdI0PjYLOUaMApROdXNkRmKZzOWpCdrlIPgTxTbr67Vu1jQt6k06JkKKpqgiV1l1AbjQlXXsP8WVh9KUfSHqLyZUli6RCtFUySw3KOKeKM2eVyah+5z3IADYZZWy+29zb4ZY4V5iVNmP8TJfCBAx2B8Sb795oXqfom+PFREvstYwH6m/0KmZj7UuKM8fk4OTwdPoi/EMfjkvnGWTAamESLQRbsJI0mkyCicaZGBE2FgwTi/Gwkl2objmKhaHnZ1pFPVPq/NpPX9Uen2XeBUqha9mzUkmK7otKleGd0RIQAvHhECk9HKHWzgs8PwdvjDCZMINlbmK2mtO1UZ49qT17pcEZPp4F4DIlZSQVoRh/FUJx9soU42Ml2rGpE9pt4/VAIS6ClBaTinmoPgSpG3yr9uA5765nbMl+rwPJjBvN5R41anu0UGw1RxP1yH5mdBD7AOD9l4OsgdSkgaEaksfEdxR4mafN4of1F+ugd4tao24vtdKLLU9pjH1SmrAxy0Ld1JvkVp7kjiGvEQs2/kQ1DxkmScavgE2aaphKQ2foWvGjmHrUrhV10F0MleVvqkMddCFT+7BC40CrClpBaFENIkwfg/JszpwlVclQC2rP3mGokFIO4oqBoGoDYIs4o8ToNm//KH+xyz+gFn3HBNkGFNYIWFw2XMrVSovzRu3tUQPptoBcEzgqYOtwNQ2AsvXjL2IXxBAe+3Xpvw04p9yoGcmJRBAYp1evv8ARPH8DvLUiN4Ws/haqaoFUBt6JYR0D52iQE0c4eu3/BfSIoY44Jvh/ggMxKCBy1BCfcWmsBXEkJf9cQCrpZXg1XjrPFsWYQIyk1Z+JKlNOtQiUvxYmrWKEVppPpZ7+LoPvxN2Zr5ns0eSKmhfGuGC7qbKEQYN+oQ/LUbal0Ws9qc2VHe4Sg2XrGW2y3PsRk6XcYH/xBbrLfrH3b1stszOHP8vOeJ/PfzK+Zy/8l0kfGdo7vyco2RPD8Of8gaS3GBTgrwOz2Zkxbzko5FNT/X09XYem+kcGJpO74brCJ/PDi4XhIDd5eAzvz858NrS8GAzh32P91oHPl7IzcNOgA/8V4ZrPl2Zndpcmhl0472aODDn5qf6x/rkDbiY9BOeyMxPD404+1V/MHR7bXbKHc5Nj7nRyYnj6YFeyqzxyIBlMJgdhCP1zVgX69AeT4eHkQG9v8n+7qB3umcDf0H82RS374Kert3sUxp4/ktw32NMFDd37Bvvwdy/87unkZVhwJbM+VeBJOZSgyKKccy5HbXKsKXzSUooH970Z9+bII1iXOf/2PsLfd8+5HjR6HFIV8QR2IaEDPqXY8B38qKyAq1NhwspQ9RKqpa07kSTDnCacuzh7kZOFR11U3MCST8bF5D+0sU4eiEE5o4Iyudm1jXYusIhYm7egnCWOaEtH2Y2w2uLte/VjT7ffXq3d3treWGO/iVLJEYowDKTGYhET7esxxHsGoRWkJKy4vSvZoOVE8RnOi6q7RIPpzeONe219w+cnnB2+CbFmcOU5yuUrB9UnafKqoMDLNEoXEhBPVrA+4vXntVMXOQMiEsghYFWBHuiFTYm9Al/JO/SawwpmlK8jRNkjTwrjrtCGHMj/W3Oy31h/e725slq7/JR3HTvQ5BgdqVdGdVtdVWgc96q0AzruZ1HYFi06/IsrSdVvvtr5cR3+5wURWjAH8Dvy/ipYC47QRB2h5IhTRNQ667tSjPo+uxCVETg0bp9vnD9ONepDa9EgyoFEGfgeOIMVutphiYeExdnpbZWxUK7R8drGPSW+iQKQ4ZOke2IXCYfOJn6/yHiquobOaTS91VWOw+CzlIT+ff2rtfrtrZ2bl3G6z9zgFoIu2SwGdmF3FazvSvXq5QA97Bj1tI6Ph+fIFn9bn3jJH19hvj6zO1ylZ67SLqPQr0haeRu3bYOU7XJ+bcCSmNPS56SL7eecUDYlHi0mxFn4UcBONvRFvql/82x7a6t2BddtadH2EpVQSCh3tAIV+taU2T0CG2NtEV35v7qZFxc6IA7/mldv8N6aDBDEe0E8++1U2QWF+gfKxuZxXXFsUnVJVl1KZ4Y7xwAHs1yfZHvzyvaH59sbdxov8HsgEp4QBFJRWBUSlD8VBdn155t54x+v0smg0i7aWzwpXeBhBC8Ve1VIi4KTVkLJLb69ca52+VnzzF2uFhdG+a+YDvqgqhS9BjmjWQzgxLwMwujMvbHWQhuZhK1S/2LhZCsqVIgJiuWLxBRdwlrKYdqKcxVhlyr1irCW21ucgCXGWrByAfWV92wQL+TfWnDC6kudaQjJqwnmuHnuBDesVrUbPZCGPsjh5AV70pvdwGcrmoxddNy0b2eoSJ78XV2j8N21Wc5SgDU/iirPX/P91drZn3e+v9p8eEruSPDtnCUywClSJFoONZ1EdYs9wokTEq36068aNxAyE7EE3alrADoLNhZ6wq+7AA/u61J7nc9UN+Fz4AquaHIVKd+4td48dxy6Yim/SOZYX5Fo7cvgt2ZHAWXGieiqvQMmy7sGEVEq5MqRX5VUys8biX6xogb6QZQsSTARy/YrmXJ9camSjL9fn6r9+K5x5rlO+ktEDfL+An9EEWl/wS577OlClNReChMCZkT2YLx3UUo7k5UvwAoY5CRhhwFMJR+xZwd6q2KdDyk0iA4sb49iGdJLmAodHUsCLGtR8WdFRtqhQ/lQLE4gGVa3giyhuP/vt2Ohzjus/GHWT9Qu39imgD5MQ6mpRG5v5MjvK+Zf4kbbbOfAfPYhRW5GqSpJqz1bv/ErcLL6k+9V/WnD80LT7+xoR/vi4mtnhHKyux1HTJaz8MoxlFZlSArgq/MlOaKdl4zk0OpQM2YdQ8XGs3WxAw9TcpDDsUAeZCNS8eDG6vbbm4B6gH+QH9RcGutncxdxBqUaI9akO1X+zAb5Vv6ke9EsSj+HYk8BJe1XhbLTTqm6xVPkSG033YSVd5i91m+9YMYK58oFSr2ciarasTetW7ZMMqDBsVhanUMulxFKzafvm5tnmFipRDlwImLcc8JaEEkMPNPD1A3yJWC8udpQXLvAX0DO80v6AwANzdJ6BaNQ1aSICRkyOAmdEycVHVjrbjtrpZgzXBkdmCHudnpckIKZIazQnXsvNTOkO2MPB99nmbyo1bEFy47LaGpqZBOhRUrUalee6Kn3Q3TmLsm7xAQO1RVgnqFVwCKgCOxCIJshcNz5bJlPVlcrLbrU9sZNrUhV5EJDjyKlTdhUpKupd2OQ0oyKiPFropvVa5LR0KJRBpGoxY02EWSzm4BSXOu7V//2kh5sgMLedhaknhCPFBM1R4LAGDCmayZREBsyywImKTvISDBhKUHQyTRbAJzhBKHGsh30Va1AmqpjXGmMKWwfVdValLMWnUzqzKVYCTO0L9opj+le9Ts/mrqX7KQFVrZF+SHOG2kmwHdZM/kLneSjwP4jqL4FzhtAXnZsTOj8ERytwbMJmxW8jYxYTtYykK1GtQxpIxhqgk+OWNcoM4YvW8Ce5NJzCo6U5ohQpAaOcSzHBBRXaWcvmqkodtKCdOIAJwZuNK6JgRq+H00fVolLDkd4w0AaGmQohNGGBaywrIBAKwhQCKCD+DcF80fcKbVIN8Tgn4g/U+JFss6QTBxxLUlIDSmkRFCb8DHkjkhAEBcsAUFWiKBouSH6y5QHWhJEMoA4k8mN4lxIMyBhmP/tPcICW22oiK08B0OiQq+v1YbaelLbUDvcJTbU1jPahrrnIzZU8wb7iz1G5DYGbsN//5A/d+356xjuudncDP58khkdH909P51NHTm0NzN6aHTP/LQ9Odw9PRX4eWhMT4wfgl8LB5Jlb2p0wRrdcyCp7p1a9of37J4eHu7en55OTk8tBwswX1MLZQvPzjhTyXRX0upKunO5mb7ensFFIDQ3OzOwmE8dgS76p/d+Mgrk+/LZI/MHknBfYRG6hHt79uye7w58r7toD3cvpccP9XSN7FtKTxyCn3GgtKc7uX9ooH9k32BXZmH8QHLvgWRP1+F99mT3PDTDWA7sH+jvOjzyn+7kyL6xrv1D/Tm4Hm5M9zsH+3oO9vX+51ASnnJ639jg+HDHsiRkfFpGsx+hsKJTnre5/pftSq0B1caeRrgTcY3rvn17r3buVv0S+kMXLNCBKtFGRpwssuFA4sM1XSug7ULO61MyCTd/uaUJ2zBag3Apm/XJalNC5T/n4+W6jbJe2+QJRST/uEJBoZyBBqvdMu360+vYw5VLtbUfSDewcglFo7UTL6FAu9Go6kSEqlpg1EMCqyp5uivupHbyx+aHWyYNWtpG4sQcFjfCqDNPDHRc1J4KpzLPxS7JDJd2GIxUVxFQYoEAnr41qpDO83fidvPSa3zSG79yZmEszIw6kN5dlZqssPZ1fYoSt5Wo0UrQLlqcdMvDMXX9cIo+Yk7J8WWX562QUxgugNhQiXdZEVKKHKMYIwlvgqKdCczofLyNKyd2rr2glLkFDPZKYOIUS+KM0FCHGQ+5O87skjH0LYWLpETstRdc6IlJYGI5Se3h+pRWznJTTsBFnF5ijjbK1h9lYKbBVTdJVbtyovnhCqfiSVFmfttN0c2S1UkImbeDFIO3lkuYdGqX3jQ/nNbUQjIVGJRwy60oOf7tEgVockpRprFS5vD4PA9p++19dkigu6IUourxRJabT8ctBjlNyXw4ulF21j0fcAyXEJfP0Ghs/RAppSTIH0qygp/FKfh3X317RSeP22Zwp9r4tgATkfKiKJJa1aGRqHPmc5BxXM1a269ghd4/vXP9p8bXF7Y3viETVtRRIuOi2GFHGNdCP0Ms1mLnPaqohskIqI2qtXAbILsiI5dZMovkpEJu4+yF2o/f1N7faP7yPQ2Ubkx4zmK86iN3Y9R9dFUDUZZ9baDGOXKYTlT60bEx2zXPLU+40cCTTekqqi8riZZ5oTzVl+sbG3pO1NwTn/ZghGFLJyr3Px/LUet0c+oENvlq0rW751UpAEVb238pRQDuzvDmScsh7dIvSwKJf/3rX1gWgLD62cbju3C8vbEljne23COsTHJs2DpreWtLK+U/rlfihDmVPKAO8veOiJcAlLjMwlimebgvSNwydsIpYIIkYTeUg8rDgpFcBo5LNSqe8eZEc32tdvVbrNX4QW0ROlgXCUvZ5SU1EQa+oL6WJbFAfdGawFY73tjaSQJ1dWDay1xzkvsBbb157AIb+rCThHRAtBRA9dLVR6EBAkDly8hztSMB7DZM8MP6kvkIIcGt7+ER619/p1BBPm356rsuAlLGOgJEV2bSztqzJFB1X3oOiSwFMPPEAdXtjTe03WVhWVRL5bfN+Y5hVILDSqtNieXXFofivt9++65x9ba2KeENESFdsAnJgIpgUfJCuZ8yF5MegRRqx26qC1UprQLA27QYJzTsIY0WW1tADyIUWJlp9SVR9J5AlHc/NVcucBgfgSBYJm66ImseXiKQ472AwIKvlTpRjRRWQaYrk3SCbVia8M7PV3n1IVmdlpPwiMcx/ayKk3P9bHubtjf89jiFFghKZX17q3bqWX0L5xaToSVou3NOmTAw7NVLGH1weSYnL2WmVTdizgHlX4J9gOabq2r3dA6rubENAxZkydaVx78Xb5k11So7wOJDk0kIbPrtVnlJk779DPDSzq2fuQPQc2DZ47CdOZWckTvhACo5EHykCaG9GNc/kQFxzkMFEhoKLflsLg0pNsFXxwAMUioZjVoQj2d1PS1eC7XTb+rnX8o2L1q3nCUphRljE0izhUn40qZpxpgDkdWcgcm2MwYHcFX1JW1p+Glyg6yQtxY1uJbKu5fSkCaHaVVR5vzwFYCI+g8XQRsmv3gHdzLo3th6kA5a1oJcqJPfwHJgVAKLwRiDWgi2W31F9XiwKBzOgp+CNp+aMrbKkrTIg0SBi8TeXcUBXvqKjOwe5lxOVWwX7pI4MouLrTBx/MSUnqGoq+GJBD8WJnA7h8cJdOtvHtVffCcYiikjP1R5X7Ig3JmxMpxpPZYvjHr4/XE2Efx2SycqvL2FU/Hgce3Zdc5YSLsx6URWAQamHlgMFuiAa+UxVGilmfjjUkbmVxGtn72m7mTdqJNRs/pIPN1IsVO+aqzIaS2uXYEztKFWHcpUnczLWB5HSkqLztKmrphaiqGfRN4cQZadqDGRJwfckO+GmPrPPa9f+0qrCX+C6DspBHE9QBC3xtkvqA7G7xfxWwLgv3P0pqD1FnQdQ9UoFU0crUF0G36OkGYLxMypXPQMWRXINKGfxnztcM8EeTF4J8WQI1jXGXhpxMUoJAJwCsh8FNGYQCaCMIIoIyTxMQShwYNCDlrWi/A25LsW7eqUKdQ5clH9+V9IV5VtMhJ6xt9/KulMERTJH1P0aLGjZY4WOErQmAJA833N8U0mrxmrsbAVOzd5ucHFDVbYiStqXhjjghGHEg5D0e9xDmfwNmZqbd6eaJQc7+zrGTsVeXq23qH8PGPt2kL56ce8PPHykvh4fvq3fTzzWWs6PTnRY02PDx1MVlxn/mASj3fvyqQ+wZ/dmdTM7JGp6T2u09Ndzg3293YP9nf39nQv5eCysX66Gn/wzKxzZAb+9ODHx7bpPRUHfxdnpo7sqbj7ppJ7ob/upfJA3prun+iZOZjs/2T3rpTNPfZmp3tnZqZme44UeywYWXcRurbTEz12erLn0P6+LuwDfqWGk73dXQN4NLxvdGjf2NAnh5NdwwtTyeHR5FBf10hf1//0JFNDyeF9Y6PDY6NDB+DK7q6DucHebvvwof1d/d09CzCu3gNAAo77OtVmQfD2M+++Jdh9p+Qwd6WkVHim9UR10xWDG0YUPOLdhHdfN9ef1c49ql28zKWisGKi7OqxRDc6kjItUQe6UssmsSxM2KtqtShneSC9sc6VWthlXmhFpROrP4gNpCBeHi/FUBJXnkxOjlqTYuakMnW2hghl5h7lAjk6KfIx4RAzgzBlbQPpZP/IsWugmBXokGvMhhxZyzYcKVYDIqB57LqyH8AnZ9lui3aHFIgdVwCsykGO3B047wQbDBq37gEhNhUwGVABZ1W12yB0UkF1Be1LVsaiyfhH1Ora0uy64k+BNSQwxxgFJlA2ytrlx7Wrb2tnHjR/OMa8B14KFkfRdW7VeBVZkocdGjVVyslCyJmo1o8izheakTbKbso2uV9V7+OWt8sFXldwbqLdX7rAgrkGDZMuSPMVautThS1QihQPMzpztZeHjev3mifeNU5hHEModEpYKBjRMH5YotA7MHwno/umxQ4CJBN1RsrSUkJnzSbr6xMK7t+8DzKztrFRv8FmeCacAK6ldsBYuzU1wpKot2abLwlFaXvy2DVYPlzYFe0d8L+sQM93TXU5B0jL0JVhNopGhbbXV7mGh6jFqowO2jdbrZtsBfgr46aGXkJDPoQQ6zpgsWaP3onSQ64FItPOXlcEFrFctYjqNENa5cLnlXljIqA6iWyNpkS4WcG69TsfamdOAd/iNN2oFsIslJR652RFXy5jmAWrd1gdKSLPifazYpPkBA1PyrxMT6G71psz9dtHZQe/lKD71RvEL1xsWFwrOdbEtCmXpbzBxvFNfoMUwUHODoUWWp6OuqIG03SI2m2rzRC0W2UwFO1W2woz+CLIwkxfFGeep+byrOJ+TtrRGemXpZAooUd8W6TirW+/uwjoEV4Ys78Qb0gEttYpIq8S5U2SkE40FNUq6JL2IGCS7FpCKeh4Y0cnoiV2T+YZfg7aPY+1EX2QK8tcDav6KJ+IDGs4O0dPYk2sK2fYqhZ1gjJCSlM7hETsyGbnc1ObtS4GpmnnTsA0CRwGNMI1CnYGFjGyLvQd4EoOPshHr+DkJBFiCYt6cLG0RzmplUbzJBvuK1lVTCoqxdf85UuYMyytcOYDJn2mDOmouwQ20koUKrn4ACz2OeNwLtW/K5aXtk7EAqOJsxEGiNLWRbQnhfmZqmvpwF5iuxHAbJ+y+6PHBzTP6uZyYBhz7/McRgyycfztzvU3EYPEG3wMk3aItk4lhRw46lKcRbiNu/tvOhHinblwyUFsQ8uEmmj2SqBAFq1lelPsQExlve6eBy5KJl6fBIzjeZI9TW4uE4pXlBKuVRKfceLFMtdrPwIVbe1CEmqWYf7SzP+jvyiLs0pY+5JSmz2/X3/5sr6xQbqDjzzeKRScRaX1ZKRwaQb3RdV7V/erQRABPQi6Xb9rmhHebM5YpPtAk3gR58VpwzSykIlIW1ca79giiGYVuM+Tr06oKjHBFGN2FbY0aYMK0GFTChNJaM4D0gZeqc0e3Y+4mh20lZzqIzYWBpK+H7PXCWUOKqltvCN17CuqhpkmyxWpRTGyaoiaZsso0dyhRwnEeJSKVjROG4sNl8TfU80kRlimPV+kbMfphKXsRrP5dF3PJnYR2nNqwJq+GrBBOzZkjxK56Hl9uh6NmMnF5zYsZ439MmgJq1vZDtgW5RLRr25FBni05fz6UgFd6sL3VcEEQFCBjdkvqJd+HLLZBv30qzEDTfb+xDpDYiP69WXt7eXG+0tq7D4WkuD7u1pHj5gkPnrGNgZ9TVXhkQA0TvE7UpSMtSCH0bTiENmDlMk0N1jaIJE/Mf3Bh8lFe/CPiqU0J6WMKTXM0L8MHaaj5mKateImLdYi5NdHFJJIFzHAeyccrxF8BN8VeHNCi5FyJ4iscbGBiE0uTHuPMdAqsAnYJMOmCPLyW2WMKe+B51/eobEbo5BfHPPBXFMJN87R/QywnoJ4JiCLkJix2PUaV6DLBFwRxorBHw15NA4xcI4GN7HNQb0hKDAjJt4Nod5JnJuinOW4SNSYJO0oQrXcNCSmMsDZ8pp8yo/IfyuppiVaJM6MlxBa2slc/o6LMiXHYiJMi2QSEjHxoEWDlgsx3m1w7Ri/1rzaYNQxHhrjnibf1DwzxjBNHhFxmT/hLZoJ/t2bFC/qbL3rbLhrt9l1MNeZlrpP/txS98nfttFNHTo4WnAy0+pnciI8NPFpuBDkcwfxJzO9eAQ+4q4yHEwvHxmDc5/An6MzkxOfzsN/S+V8rgS/8d6e8YFupFeEv/E33kfHhcz0UjnIwU8ej2HgXcWCM21bXal8cmxkuGfOTndNLy/2lOYnJ+BMBi7qLs3PTMDPZH/30KA/0L23P5mdOjh6aHT3rr7eff0puAtolVNjwz2psZGevt7iYLK3N9nffXiwr/cA/BoKBpI9/nh374F97kCyv/eQnRzoSu7f19+Xwi798QHo1erkI+jYAdrR0BTD+yw+N/BOlUQzsQGd9l6UQ7q0UZ10DFG+8Su7pMPfzafvVVhOqRTVQK8+9Atc8zbm7r4c2GVsp9A+6tv0e4du0irwhOk/uFK7eIYT9OI4AZqUlY2gzO5ortTmksq6ErkjzRROgVsHORXDW7t0snb1XP3cj/wR4BZlOUzbqn4v5prA6BiyRWjzRUSb93yWlfMQzothz6htPWyuv2g8PS1WDSYdGTaoBhQwK6w24ZCMNFuqa2WOD1zxgLXzXgtmvudpr128Ub9wurF6XiY8AwQShbK6XdHH6u4Jn1yGqfkfuhHUokw5lN10tmxEHUim8+qjMlW4oF7q91dqa7g/FPUCiMjPR2IJpmUhYWEOZPYGlAY5xkB3shnRRjU7W9Rv36udeba9cRP0YRL0GXJc8nKRYZfIxUKBLDxt6YgTLj29Guhwk3Mr22/ecLhJRCyKDaIpJgtG4Kvd8H+0NKtWyjdE/uIUZPDbYzLUbZypPX2LucAfHiOZGpbRxQd09sjhJqyuoHd9gW0CYZk9izq3R53gfKPdO+oFZhwggO4lr0R6yaHFWbCxJjHmNeaoDTdqtTHSAcTxgvlFSWKvJf1F4QuglzoHrwnhJd8uYNgP2cPNFqpcwNYPWxsVWbLbQ0fz8mrXfqqt/dB4eJ4z+fPA4CvLqqJntpfwSevQphNOSoNhKMtOUbWCOKedrmNpLhcpVerq136q3/kgBXNtNFEmyMwGXFeVoMs5oWclzJ6Q+qztLCSkD2W349q5m1IqFKnWbzxUhjuiiB57KqESvMYMqvrBAm5FIlMrh9W1omzsLrEi6gcpOEuszThNUa0UHLqMlm3gqtfm9G5m89zxxuP725s/NR5e5W1NmLciWvXnfJDFS3YY/7Cxf+ObjndNO29mB/GvWveiP2zVh/lZ+16AqI5cI+wiw05qKsfaiEF5v91K0RJgJNrY2qjfftJcf9Z4cp2eBC6l57BDSS2FIcJo5JJOJNy4yExJdUMyKCJMCBQe4iW52+gO6jfON+9uyUNgBwkmJQmXsGsbPetYl+WGSgIWAAMoGj8a6vTQa19dMMdN5TjtYjzaDoRAyaDqZ60gV11jBQCH+vvjvBjQqObB9cbl+7Xbp6gkWTGhdYESDYIeedZneyWIN24kU4+dT5dVRfA8z4Gk+2/c+grI7lw7yf7DwJCR5+qU907WSpTUI2IhLmwwnlkIqWLEOVE6mCRuhp15tHMdv14mmygGlk7lpGSHXyyzWdhpa/rj+rKq4rQWCZM3X2IJp837vOaKZSqyhffqYgUhWyTkmX0Kx0XTmpoEIUZj/uO6x8obMptzt2rnfuaPNm/QVODA9wwLPkriSPRReQ9cYXEhe+ar5vqKFrJ4bcJDoWGADlhlNiaLNukCK5Im8lB8jPbTjDgobhxtPHnCxSOATiIsBbqYvSqZYhVYpVgLlYvkzvffsn+kFEQBHDGbKpdizMDyHLeIJrmMwRFANqC4kYh6xQmil3FrHXmAYgBCNibWQ0Pwwrp3XHEDj20iRDPHWwmNN4/qZ67o3QRK0qbJqf1Z+lPtzEZTr/zdiQT7u9P90VZsCWVJSJEiWLs7dMsl3lJO2eWAd95azvzxFW6e6nwC1VVK9HX3duPNtebTr+u/nCfdg67GckSqFA/2UignsApA1qBPkaPsParIsRsqAlaObACSGEJx+TiXPQAAk8CyaCqXl6Vs1BYLUJDWdqG60tJali0fhge0IK+uAvHmUdTV52x7MUEmm2hDyWYTjtpKUoeaBOCuAoIAHiTQqd9+DIKa1Hjo3NhBKslrpg0aF5P9JpRRyGJEBko5N0YGopzUwtX4jrfVNb4runY+MQeaHNURN/sJ7AXsDV3yKZLV7MZoU6R1PXpOYMAd4HJZR39H1QOWHVMPRClAMCekqhyOLkWAZC1ihKE4PasKJyIh311Dp+frApG4ZLhnR3wFtA9LQVOqssIs0Nex0JqaAqdMTINTvD4KhzZ0GNy2B0TDHhElmwPkxUBYIkwBTeIv8QhtfOR4hhGqinN913z4Ze3+ceZcwGnKAbxEPyC/aLHXLFsLiRbFCbSOtLTqdUPQgYvh3I/+//0i9bP+ABAE5ii5uAL/Go9QBOt+EhWM6vlIOktRD5XS2aL4af2yRbM0lEqlnilfj04qmdbCIv1LPFQNlehPVSGt/8Q0H0M3UUvVWJ56ScZUEBm0oP5OWoaG/QrwS3ItDbQ7YG4NtQ2Q3YavI0xt4l0NdWM4txPGbYO1bdjSBJQGlDQxpAEdWzCdCeQMCKecCDujKwYqDKYMHAUN7QhHgxqNZdRGlGCKDvBCwwr69NU3LwzRkPYs5Vm6a7n+EYnOMlgL3kjkmrLWz0iZmZhQVRI1kqUkn7RYMoSRFkEifCR+mGVBu1DQwkDEQCcB8BeLPMbTkROqyYy4YpwfalYY8cFOdhzhQzHOpniawc1aLZDoDIAFovoS/4exTJs1suMV2jL5sfvFStnxtLZY7v6IxVLdZX/xBeOrL3b/bePl7N5PFpdcJ79n9pNF+DVrV+bn9szuXfxk8fNd8LN7bNC37U/n5+DcGLR/MjVx+BD+BMXc9OTBscEQftufVubCIDc9NrhsYxv+fLbk5KF9HigPLrl5OHadMCjSPXCdjzTUtfBvYSQJ/1e68f9sVxKuzGXgihk4zEwdPpSZmjg0k0q6Q8lyf3KwKwnHhyfHBof7kr094/sODi71HE4O9HV174f/hvp7e0bgN1azhrMHDo7BSJIj+6FlqLdn/0CXP5Xs71mYSo4cSMK1/kSyr2u0OAj/20lrJDna3THoueTnPcxaWgCsbweCI6rPuYk0ANWq3Hsz9OOJc3/t3fe128/w33NOWG1RaQEMWvfKvpGB184AHDbI6cZYK5a7x4TGujPs4sU3tVeXuCOjCyzrqsSaA1+NH9COIGYWUSkalhHL84l0OUjr4mrodY6Evz/R/HCaNypKJT9IA6hC/3fmjdU1zqumqVNBYmx0OWRbNZKLoUe+4SyFXxL1xtcXmu83a+u/1m69I0mDpBOVAOdFl8rGIWIOqwzl9nP5+5dG6saGiXB10rOcZLigjZ2tD7XNlzwn8J0huKT7DKUQA4EVOd6XnUUdzmhqISuFPMuYsZGqfOlOELB8uL1DO1BqgNKHVBCHaXckKgpgg6dipdobSXP840qZ9uwkROT6m/qzV7yE0Nvbo5uKVrqU8aSQme7AcmlLSJGGFQxQNy+5HWZZJVf6uewz1797uvPDJXiE7Y13vNWsaWPhAicsqzgULNYKIBEdbjI+qDK2iC1qc6lRFcumNCwYY8gu4bVbr5oXTtTu3atd2GLz8iI6r+a0i2Uaq4YzeU6NhMHzTFotfPm2UCmghX9hS76td9eYieIw6E6N0LkUPC2goqUKk0ojLSBurW6FTH5T+ZzWbr0HyjvfnWKHsyLqyOrOVurak81o81RlNyIoRJmcjnlVt+MmgKQWWbNSlHvT5n1oaMhjC+fWhIUlUwEzsMgzUN98L6I0URHzj4UF1xNEiySe1E5MMDHegVnEssV5AeEMC9ZoW3Pzff2X11gx9c53sLIpICeVQIKiaS45tngpOvYCJRhA/ExNNvajIA85dojnzs5zSiLv+Vy3WSypWKPWwzrk7Pv5nP40iYiQloru7Cmw8i3Q4+KIRM91VTG+EqYCD0L1LXH+85KfRtO1H5YD8ZBIL5MzGunvVKsALWAeKJusv9c2X9SunKm/xtKGS1h7B83iqvgOphcVl1XqS4I8gHV5dklC9oKIi25x9luKSXn/JTpLfLhNcBFfBnzGc05eRu76qDvkLNTQmNG3tomH+IoTUu0Lj5jCs9qp2zQRMJWFQKzgADxdB1ODYvpADk+NmmZlWeqATCBF7z5UcVAUlnm7trUGnBkxEZBFHzKVJtRXUftWiLl/dL69cpoh4Aq/rDn+mtZYBj69B1gQv9P1u+TIB4+fcW0nSsiTsnQgGyXlMY5/u1VJ8HODVJpTafB3Tl+Cx9/59jonwydqaE2VlBULWM0bPiNYHA4HvHILfUa6Efd5lLPjGjk1vyRgfPZR7dxq/e6N7Y1bxInw8oQNWKw8K0jWozwVLtfCjh1FlJjHojP+feKxRA9NoE9PNS9QuiuimLDxfi2nAcbht8tO0QucAiONyFlYgLRyLkPm6JSedbNIiZmOAyuvbZxoHEVNYBF3JXB3BC12iy1daJ6lOtAMi6gpLki0mGFpStrv1vIw+zsPV6fQwF00Gq6Zx5AqIGBOEDJd0KST3z0mPGk8elV/pVImcQD5gqUC9stsiKR+OF1HuuTTTh1vfShqkm9aaaFMk/JM32B1lAY6F4gvpA+PjPm1FIBJKXM2ppjm3WOGOsqvhfELloKm3QLs4u23iF9efVM/TilCchk7kc06YgsBpTnA7yqheuIOioFF2yq6K/pmhChrR/cdSl5F80PEcc28XNv5DuUBdZAo2rY2GDku2czgeyHRqxp4tRQc8bO7EiHSnZVfGUjADbA6hAfB0+LOKt1N4jl2yJlHqYwPDuv585077FXiAO+0VdpYQoIl7F2wGoJAOo6jNHpPYpMF/PRiAySOAmm2zgDOAoIAq5R3wAaXs2EAvmJyGOtAGHijvvkNezVhIfA5JVD/fxhSWLK0yC/ZPn6DUoXXPFIUErJnTCSaP37gJC3QI1y9KAy6gM+FNTvW2GmVA3SgwVHFKwuCOWVMO3e+B2HMY4LLcEPALpncU2ZIeCcf0WjQrEZZxn55XTv5hJBCKWKUoljQhiM6IIc2FqlkrzYSOrKQ0BEZzskpckSnjKdUqAU5/R/XxQ29fvts/exRgmVUPdH2Fv2EBqkWSmMl4vSBE0rMvcd1QuDu+o3nSrBVMDa2o70v0pXalTCtekUaUVwXkrXQpqNozUTrJHFdxFRB/lLvMFUOBdAjbB7H5BqHm/DbBN0R1I7wsEbBGv+2YNMYKI3wqMaiJhCNIKhGngIWGRgyGOSr8GMk/4oOaE3jNAFpKtJYEBPDJQ2TNLR7/6UUvTYgl0IwHYGLRiuCUyKAwvkH4/hBowaFFyKooABCTH5rma1FdVyCRqIzkppaYpri0hSVSj7GZJeWVyKmYhIqJphMaaHlgxILhkDQgkDzbj3Lz5/LLCvOrxhYxFU5jJuyNaKEe7Gh+Gr8+hbGp5me4niK2TGLE4bErIj5kMmCNMcRVsAMRfMR/hbayk3ni5jf2x5oKzZtnIhKTcevVoWmjVZtcdv1sTLTcnHui11/29IWlrJH8CeTnpnE37P53PREyurPHlmwsa1SdiaW4Qf/xnPZI7vtijMx0Z3cA1fvCflOODFse1M+/BQXir6trsYf+OeMJpcr5Ym5WWyZXjyQDEtH+o/sXugvwHWFzMzkxCdW/8Qnqf49MIRCJo33dtte0Ye/Z2AEeweSw/v7uof2DfQM9nb15JKj8Av+VcaTvV1ddvLfY3AAF3iTSfj/0HCyr/vfYwM9uZnk/EByfGigZ7S3a7Q7ObSvZ6g7Cf1Y3d7+5KfjyVwXUOo6MgNnBrp7sY+l3uQYEO9ka4OFUH1EK2EWdd5Qdk7K1ZdugjNf1n98u73BlZx9NwtyBff6VSpQt/qyZJjKsKRmNpIvf1zPpylfis16CW8J4ae3crR2bwtB1vrd2p2btNjIhQAo6pTdfkHLGuNvLtLJbBhrc7KtaQ7dj/KhKuHC1jjadHBNwaob2BP2iUqpQUTo9oRcQlTKFHi7TD4quE0okpkbVG7zVVY2T56t36aIYyzRlfB8sTNaDlbGtYSE7bq48ezq5KJ/XCI95faZ+htygacqvW452u3MkBqiIuCWrVw5255VGZ7GlUTKvxxTKZTRZuXr0i7wYlEYpMwkzfiypa0tTTP+L7uFHHtKUXUUT4e1t7e31iWwDrvCZw7EWBVi6RKVuJ0OgO8Lz0K0sVVR9c2O0Rqpv17Z3rqKNc4eYNp6oJRPVCRJgltethLl6iNy9sG/NS28WcevPHjUvIYFdSuYeagse18w8YG4qgJoZCng6SbXkTYft9GU3fj+CqeDsV08ixBKJYcFSQjThCQJRHnoSUbkyKONy2LQBtiL7xrfvWPmCYMJnfyiMmS4FmcgttJ+QOkioyaPBMxvx0iWvXhUv36UbY6pAmoec2mxKbP6iCE+dlETYhGNWdw4yz6rkA9eNe69ZKiBt2vt0XatBUKeGY98w2FBQgN5twFqyNJuGwoCMkVvfd189lp/+BW61lBckJZWW/gkfvK5xB+3KfDj2evGmw+UjII6iXQWhMxUTwMdA93IAlEiQB41kjsoTg35O4hV9sRa4/il+tv7/KZCy84nmJxIcLuUEPpUJ1EOHT5WhETrW1bl05gerOvG6R9rmy84+TAOpxKofMIYVulkOM0+fEk0/2abW3I0IOPlSc6gSkrfPw7LtPbilug46jaUsSVHWWMR7IeKfHTMpP+4XhGS7H4bELIAvelWbeMnrrHI1BLqTiNLkuUZHqacJsmiPKkxD1MJ1MxwqiQ19GOna1s/YaokGjpvgFlmoiSr5NOXRV2Z35kl+YPMzEs65xLdn6joj4xUNKljIBYX0tIsfcjAXSGa757ygMji4ll2WhWmhJVNubW47R+xFuAlvlLTdNHBX17XX9NGEd6Ain4mpgxbwim0KszHvz9eFL84sVOwUvz8PGA9gHCiGpfKmAVLqcZEI4rBxiNlAtrKy7cLN0rWBbgrKs3jBHHFvLoWdFDMHylI+OIlpXijYLMFR/z3KY4fKFHf6ASPVMQhUfu7w63s6U43GgH8alPOMHyoTbm/a/qIbcFZKB0U1Ri10LUiEC3pZp4/51wzikQCJYV8OCGmQgQW5TsZr/pz2uPPh1q50eY257djywmqTk0qBywAYinH3mNt6rs36j+sE+oGCMP3KoWoLBkduRtzSWFQjy9JSdI6QCqiXXvwJawtTVuGpJcY2s/9rDJuc46GWU7dBuqQzMtvj8vibi8+5fdP1S7/Wr9/lQt0FBNZHVeXgdlBu4tLrDzy8kai0aY/Cc3LvzavoKDCmyN3bireQ2loQ3Gwomy3lIVWtWB5U06j3rx4tnb2BSfHCjiSOxSvGjFmFWSPho9SwIjzioRIiYtnWUowiUhIyCulss7EnAC8pS3O6P6omJBCMo1bp5rncHWFlDRgEV8PB8u5ZIyXTCd4oPfkqBJCfDMOaJg7cUyoZRsOxrOAyU1wRHmXUs66fkpa8EHZB2hZvab63Tv8jvKMHmw7CFsIybcvZLQxWItxuF9YgR1Ilta/MMq4drmkzVkCku+IScZA7lab+vcxPKyAsCBgSSaIWWIY9yIQJNwbId62fA1xWKlhpKBHuklAnsJ35JimIWLj0RaDQ4ULNRATBOYsawi3doWlS4TdDLTEik2o90gIJQlE0vBIoSIBM4qPAZxhPmbgIANotGMMDSs0mtA2GZqbmFDXslxL8Uh4K4mtBKkSgEoiR4I4Enla0uUIQKlbXp0XIR6JS7YpyS+WYSK6tNBigaFFBcsIJSBissHg4oqBM+82GLcyaCheqlmoyTdbOKaaOZ/tUoqZMR8TJhbxL/KmMlgNsxnFYzR/EM4gHIG5gP74zS9Vf6LydfKXKZ9lu4UEPRSt0VbziG7VthHzOjGM6CZtFfnP3s5WEbrS++I/e/+uSWR66mAf/iwUZsczk7vT+LeTsycm96QP7vbT5b1wAtugaczNZyaXC7O7B5NwZlff+P596m44W55K4vnd6V1l/L13eWHWg99w6MPfhXm4xHMzk449MYB3zDu5CTc/2Te5Z3efNTY6kIIfRW0Gf6YP9nlACMYydai/p7sv3L/vMPyemZ7q6x7pdaeSKWt0YGxgVz6ZG0we6P3fnmRxMtk9NNjVF47v6x6m3/uHh7oG7STQ92eShw/R3Qd7ug+MHOrv/vcBaAGCw0ODnQwgs/COgPNaUjnSC9j8N4tbSaoxlOiYMrqvkUmvefJD8x6aq0s5EJ8pK0hLmr7gnxFFQiEYmSnE2OZNBsiVRRVMcG+zcel8bQP1VyRDe9RSQ8z1ede/+tCiqq9+0ZVsRcvcUH2SoqTHHIiE1E4f33n+tvH4PltnE6UyoC750lHdzzm5BNEV9Z+OkSp9+4qQ8nTapJzRRA+TAL1epeLURBH9bByRJWkf9+gl/2xAgQDAf0rlnCRWmi3nxP3vBRkUXjLMfHW3+d1jYrYAeAo62xlTi2w2aG9xsMQ4bRxhpRQJTWvevNa8+ZQe1F80bD9ofACOUuAUz6gKEX82GoOybuaia789VgPDCEFy8vjqSe3yOgywefMczRUAfEUjcmbCYuZRs65qbjY5y0RStkqJ2Ycsp4AyGsAuXWiur5ojBCGnXGGtNDT80+LQDz6SA0CyRc5wT++MJvT8xead083zF1WAySIWNc7qWMZS9VEBtZk0D6xDE9NTuVnvnGZvhAqiMFRjNKcX5c7RjnmgSshOECZWoXgpREKcwrd561bzNiL3lL2IzmwqnMsiz2amR6+bDoka+yUzEbW7zGRUnCBSSRiOzg4FHRYlIYdD6KzkB77EXqEH6iw/4UuMNlqkl87xXG93Ns/ubP7EdaDSidAPAquo3zEA44SirmxmSBFpk/wWUgQo0Yns94voRIaZlvDjIdLop/b0TvPpq+23NwmqYg/0obuWUtJT1ZUSwPSyYGwnZYHqk69upQQ8USaDELWhgtjl1rjafZq6eYZY5sJj3Hz/9lLzGIZPuYs+pjvSWyFlitTRPbjlVKG6Ap+yx6uUKItMXbsCtGoPbgsVNO+JG7dTzmkI7Iujk2qZ9VWZLD25t2FyyT5bsdGZQ8HJtI38lonxPhBZOdUxP+/vlPEE7m88PMHbQZadyKhwuwJc7HFwqe/Y4lxZ8j2n+la3q9Rym7SzgqVIE39ckcxI9bePdzZPbr9Fcym8hkVQTYGg8ihH5227WHAS0o0k3cA2jHOUTggOIUmFtIkg83Ihlwh8ukntKQZWqhyK35YlyXRfAs904o1crXmJmLsCUaffNL9fA26882KVU/RhnZW5KJYvIq5r0gplbWKoaOMXZf377dYiM3ggiazowcPtt/fID9zCcs+6NC364zoq+TWWa+VYJ2iyud4nhmHAUrKLJTteb9dDHz8FPqlmWvP5TTHbUNlXJ190JTW/lcXghtw/7cw/l7Fg2z9VrxLXjekp17BLejShi9Gqi1RWlBzgiXjtypva+jt6B0QdvgLQkNwwVF60wLkkLRLnDlkAdJ7yicWihV5OcdkIND1ZsiZpt5pTgr7YaD40Cnu7lth5yUrN9JXNWmhGNNhqjSTIak03G3brXBlVbYujNGSr0yIYGYpdYBl5moQhz1HUEK6PH17uvL9Hm4w2vmM3DCTyBN0wAkr1KZR5p1KaQk4mTbFHyvPh/T0xUxKRyO+haLHlNBS/flhY5jH60aCdb1F7rTRfv2ze+o4dV4qF8mwih1v/kX0AKRqeL6xDq/uVhYAIsJEAbzcNya4uMLAslSxdJ8PiaZmjt5TPIReqKBHLLInb4Z2bO6Cg3cE99rDsJUBZDZAeT9oylrCUDigHDNpFmDzvbAktnH+aNCLVOPaM3EWYUqKiIyZL8KgBOW2lOYt3EPjLkigVXgW9Qtqd9jm/HKhCrIw1Hr2qvf6+cX6jcf4KBX5kEkuRQoR1JhcSTJ1gqw9wE0mLSZFQDVI5f6WxhYl+4F7Kt8/fdcp3lfFJQIZuymAAI39q5PrOGWreP2icf8vsp4i57Bd1PTGerxTXVMbJkr/pVjVJcDPPEN4azQ6wVpvq5WKMptQhwzKBNJBlS/tQrJI5Z2fzQ+MCVYTxylgfy468vcnjkKixx8cCxtkxLaHx260Kk9g5zZYerD/gipSEdeWIM6vUuIxaKlag6sn75BoJSwC5HE3L1mb9zkrzu0vNo5SzCr0tsWA53BsfGpEzhqaOFS0VusijZIKN6/fUWHEsPNiOZiBT8eikcxRZ32jePSHKRqRnKO0ipgdo9B/hfvGz45KrjPIFVpHvcUCjfty8/7Xg8hgiN1BuhIw1GDbP8n4A5zi0OGN5HOxqpKsRrsaRbQhSg0eNHGOYkSs+xcCcRm4arXEfGjx1BmYmEmPoZICmCCypG/lyBW1MVENz2woyNMCI0EVM8BsS3xD2WsArua7qnCrR2kGoakkayVBldmNBFok0WSyPZ1U/G0qixYVZJMOUrPn98SKLmu3NC1rUaDEj0sUUB1oUiBwwJUDE+mO8WbNlgycb7FixYfKd1/xWcVrFZYWPmeyMOZmwsYiDUX7XiNcwnxEmE/EXxVWMz15/6+or75COi1yiuzpn04+fi1Jztd2jEnTFT2hj078/Ymzi6y3JqP/vv29zmhgbcLL7e3bvGhmuhF4Bj+FwFxzu703uHhke2Z/sndzXtwfOBe7YIvwswflRa2ouVfEKIzPzxSNLi+5wCX5NJ0vzR/anjqT376mEBfjxppYWA2uqnBKqQCtjTQ3ALTPO/p5+aOxP5ZHSER+umkvlM1Ol+WIPnEcT1wAcW73L+/rs6bGBQ0ODB0eSQ4Nd3YeHBnf1J7sPdBWHkuPdB7smBpYWB/v6e3fvGg73wmMsONme7sOHBpcn+3p6kocPDfX0JW0YwGDfaG/v8uQ++N0P1+z3ppPjQLE7mSU6Bzpl1Yf1ToHIbIO0qmvoJqsOuZC1GCZrWzfYNllE0KwuikJ4rOi+toaIUDyOh0jqOB653gjkAViCBe6w1A+wZTvLuaC4dp6fT9t5ldQZPQozCZ0KnfMw1s78Wlu/2dx6vHP6Moe7FnBb3xF91y+h7xAouXlMueRYWdrwQyN6EbMnwCRJpq/qoyyndmf7ieOqPOuNt3eaPxzDHfs3JzjVOpMHcAOMQBXZgG8ErWdqetOOF0h2S5yUcvVFIFNx/Kya3cAGTF9OmQFSgWMQUm0RMSyMoWKZ9PQ+eFx7fl9PrxA1preEVDNisXCWq1sZtljYiLu4Fb4inzYUVgnBltS2xfbGz9sbZ2sXSRDYy+hFYc9ZrSPOWEVztERWR6ljgge9RxQNeuNM7cJJ3i9S456zUrFFgVBVjJIO6k0Uth+1OmnVykkkuJJV4/Ja7ehbKuddziTo6qiqc1DO0Q1UDRz/5inJCCgGOsgjKc3b+tntD3c4zB36w9rg5bToJqCeo4vrAqwyRMWssKuWWbuggwq4wjWWzcGENrMUz5GRCjbX13euH21sPdxZ+ZVjwANUaRGoFaWMTslXCfQVeXptIcc7G23tnVE9muqTebOv5ruf6s/ftfQVqLgvnytRMxz3SN52auPCv+hOJgkXoqrVO9+CeL1SW/9Vl6/GexKe5URlrOFbBIbtwqfj68rXndrixHkDtcKh7VxjTaVuVb2hMWrr+/rqz7WLl+pnL9K2E/cLHymTV4UQfMzaIln+SuQVH/ge7fJEp1w5Z6lTTnUVE+2vLiaqm7Qb/Wpz58b6zgpl0rOzFArK90aZxV+ikZGztskpKl0aWCU7QNuO2a5I0957TvszUBfbGzdrX58iHUR1gpkSPXi6KD0+7kWR3wnmOHYy7N9snrDNE39cKrBrjyR13Vwy8gbcP7b95gdcNluXG6vniaNiCU27IKR0n2EZCzepnGvq7D8kFQSWqvecllOt/UmFu/sUZjAry5X6rd/eaqzfaK6vEGtQfWO+uXJULgrfnodBzqiYApMEaJWW2hYdmimawaPoBsbSL3h/7ezR5tNztQtvaiffUdF1LNSE61YTMdmd0WXE84xLke2pjzEezIr0o2BWc4wR04Opy1VfuliDIeNTZy+jRYKSFt002YfOMdeP1Ez+/WIuQam8KYMURTDX1h/UTj6pnbsLA2ic/Y7TFWezfkKIyUS61TUMIJQQNDphxhVGbUK5JaiQaOugQjVOM66Q4jKcot78opphQUDC3g/azjl0kgT/5qw8WU5l96eiCydf117/WLtwv36b9opc3w+5mHZRMTU/I/mnyvMJo39D+kcdK2cDIt+GALibGAJQPcVAAJUds9JcI1VlP4JOaMc6K42t2Y/ktf1xCeQMhYXrNEjwgI31lfqzVyoTEtZHKKus5rT0dI+mAObuxLchRjq+JBV5QwYTfVMKw7sE3Bjarq28UVIWxXmoM2l1aladkWw6/MpkSVKOMaxhAe8Mur3+i+QAYfnAVHQSOnictMPIUvrmKAkMtkHxZ3YdPSXhrJz4bEuYCnXVfHqsfuGYkgky4gzGZUIvuuBt9fs0VXmGS7I+czHgVtgWoAYaaihHNg5WQwHO1b9/BqxKITq4xwLAqlJu2gvVlwUlsX3VCadXctrOrfA5fpw/rriSgdOQ5fA4V05tf1jXslz1pwW5H9po2BDf49CeFZYMDy3tGInNKd8oiJmKoCJQoxWpEm4D322uvweQ1li7WnuDj4cZiYAk0cmnAyvKbVMGCC3yVPeus93ETqajsy1dxnvX/eredbe4lZUBRTylHbcox4XDKcF4kFKv2DgBa0c/NfesHh0Eu6frY22ckec+dRLYJoe38WMravqbQKduMgVk/MJfdEHO+7wmY700fzhZv/Gr2YvnO/mSYpgqZWTIfoWA+jm5ISU1ehkyO/GjJESUyif68mgMOdrExlGwJJAPELD3u+f1q1/qJIyoiVDkS+jni9rMWtApfXSftHGR4Xq1sdaW7mj5er8/zgvUp+4aD97WHt1kFUX3Ri80o0InQf0L0pITEusQ+m6KgVnUrFsBwJBIUFVzfrtF7hKN7y/u3LyNT3rqO/a3cilNrRNIHxiG7Np2kE0ouhJEh86bRQDVjnmC0viCUkAMBl8jFxyh8syY0Xf1Q/2rZ43rz7k8M/eT0F2op7LM1KeknEtIKLdUVynJ0azgMdzVwo/w7Ivmw68AEdXfXmfnhSBB9yosjaIZiTOKlqN0VDZTNkhx+xa/L4ZXQKx25WLz6g09klLZJzHdydBraPfGn7LAK9poAGv67JZ4RxomA0Ph7qBoa9Vaa9QaKkQ6cAftV+u8kbarb8yIkfVjSqipeiql01A3IxWTQf8ixsHy13PxcW39jFIIY3qgoQB20sZMJSyufqkPXWlCH9F/TEXH0GzU2tIgsJNCobWImP7QqjbEdYUOON1E5jFAHhU3igDwR+CwBsEt8FfzVEGY7WBTI8wIW7aCyhiKjIE5Dd9M1BZHayZI64SaTKwUoaRWfNSCieLARIOROAxRK0ADAxMI8FdmoI2NMxptxICGKXb/TMqaotUUqvpJ8p74mH5cnJkSzJBdPA5TIvyZeDClQos8iMkBg/frr0LyhMIHQYnkTM7OrLCdB2rGp8+22bw/SZRS/lCrtVu3aju3eZ1YuHWTtm1//hHb9idffAGXzn7x+d+2as9mZg6n95SOLHmF9GelI+P425oYH54cyk4vTg7tG0725Mb6uvL9PZ/CmV2TQ2Ppeb8IF4TTSbh3JP3ZniPwezjtLxThzEIRrloqpIeWvPTQHJxw8WcuM3Nkxh48nOyq9Pcsj/U5U8nJod3TmSMzjjs3O/MpdHp4ZH9vGcgCvRK0ZYZ2ZwvdSWi1upLDuxaHytb4cGpqZH/Zmhju7errSc7tTw72do2PJnu7ugd6lnN9vV3WKKZ4S00d3g9PEEwdHsnsx3snu4oTyV19yf8ZT3YN2EnnSPI/cM+Brkq+B+4b2zfYtf8AjCzfPzjQ27VvsPffHetSBPjRhL7jptB7DgNn+HMCNhO1K7VZLSj0n1o21WZeMoRd6OunjJUsceorF0SPxtI3p4AZbG/+VLuF38AcYTfkaJToMpZiOTYwM/G6OTBzsRq9xjMvQ787P53iTnX+Zd1rLAN72gnL1Z/TFiX3YSSXd21k/JaYZ9AHXk7P2tqGUBEwrj94GAABkfV14Bj4xZ493rz4lG0ICxkLbQhEJm+qpLHuI7XU7NVkKthHm2mY+jF3DKQb01SCz4UofIFBPsGGeTFdYqQZiFl9Sp8hHkLxRwn2QHxMiC5kltJcubBz7dfmL1/Wz33N6ABNmNgR9xPhEyHnpz1x4floFybliCb+p6o/SR4oNFcEoh2SKAchkWM9Tp9RJdUkzW4hlihh43jz1QanSwjtOfS5gZtU3gRlLlB09YuJNYmrH2aNMl9J/dlVTBoVmQlo6RiZ2LIUeRz4ec78YGVtcYFccTwuwSB7j7XVb+t3PvD2YyVjuYlSydep55AKLi64WzmS6XtVmArdzJEqeKsOWsPs3Tk2rJZ8K8G1HbO2Z7MpO2MhqrVVJURU8uUchuZgNTXFBjj3fu3Mo8ZPl1FZuvotpfrm6xO2XfFd7WRHuAeIeWX4kBZULlbuKcrprOnqgiNElnM6K4I6qbPrLKB3i6lZW6xfRraXuG7NEXF4xWx0waNAnigm/kFjQRiiEAAsRrLB+E6oqCkjTPVh4Gel/mnUcXsnZCoj4zgVvf+/rb1rcxPXti78V1Tno/ZZtcmN7P1+8xUbsLnaYKreSrWkltR2Sy261b6dOlUhCQFzD5AQAgQMJIGAE24LsFnAB2VV/gi6+F+ccZ09W5KzWKdOFcLSbPUzp7p7jvGMMcccA00irIl9unn6btIBptdPPLZ1TN8ciZ+WP2whmlkSPqyw/KV0wd+rwF3Sc82teJpYiV39sFNHDjimXeEzXe5TTU38vXGe4tOajJUcqIkbXP0b6ctkmvv5xVDwgf1KkYRslAOj4pBdIAi0nIBpMtXUY0dmHUyhDDsfco7ke7EPaa+2dKVOKN+8WoBE3qCr5tdnWk/viVnAnWUKrmDZnNzj9IqYiAhVF+919oqNNTlG3lovzMVykFPm/HGsKGtEGGkmOYzPPWqe/wZTgq79zMmMl0BGB5RlXftKHKkRhVvUMmYYWo5Ohb41CsMOpTN0nZE1LeKXO2zff96+ddkYEdBZBumvG2nRKcwUVgGhArOPcwHKQik1SpVhSTtzibPUrBaNkdd5/fPm909az0+S1wGmE3odyiUQHKZgg8GP4KmQ+B5FxwHxVjCWFRa4pCUtcclU4QLUFa57fXu7efoEM2HtDTOshZqbIA9ykaNucGEaLmuF1f0GXK5VrsN6gUyDx59jJj/mFbjzuk6Puh+ocvf4A+d892THCDWTwzQNpkihLDdYSBUw7UOne2kXLgSoLHE4JWu7mMQPxbNapPSJiza1rmM1Z34jnATOIV+PZOXhlahaxYsy0in5UXLQT0b7s6xd7gn7x3Df2Fxr7oLk2uvmeSlOBH1klnwqHsh3l3Sgi0v992tapB5shLyIAbuAK0/PDbarX75GxnOOpqJTzpAS1FjaZT7ZFc3oGDiXNSxiaMkPgOCSHzQQU4PemeUoS3zAQpczAlZlt0vSRsRi2diqm9++bW5c4RAhDM7E8J26FiKHNutM/FyFFqTk8OwVaPeSz5Fa9MByCcCv26/Otz5/ZUHKibbSg/kBDKLEqxnS5HrY4iVGJK0bqm6raCYhsGvvnQY5Coa+piaDiw9QGQKSmChnoV4MIqWLpq/0gb/qkQky8vTQ7vXdq+ed17/bvSqkVWm6DnwJWXN61ZlKbeacTN8lZxqAxCY/W8fn5M1pWXIO3aUF3TWJEIhcCXIWolRKUQytk8IoXCeFQexCKabEWRKzjiu54iLNB1JqXRur6CPyaJf0Ay39QBbDWvMmjpeT+2MNTcqKiu46U/7Trqbm+G4surtPnQO/yxQCHfb5MWMECahtAmEUbAXLO7DPuB6p3ELqqs1SwVPcvLe0cgrnim0/uNq886B16q4tDaMwriaE929UyYfgesENBaZ5ZQHj1FJgArSmat4rNO5TUgL14wXSRKkpNCMrV4pf57JgFMNLTkJcxX70GLPkn8F5Rl+naRlowhLGqsQwfVM9uJVMNcat+O58knUfnW9wWeYk8/6ZV+3rp8WBgnwAqHC0hc+42+jtb+z2NbN7reu0Yd1tXP6lWWkbkykzsteO+/fMt8T1qoYT7j00e2HWEruMLSdjMyUPj9g5toljzBuxbXpsDMu8SBsWxqawDArDo/6KvWv6SLYLDGH/S65uEWdDlG1+nCLGFhnuoaU2G03x0DT7TPPNbqZn8zub2aUIV8Kz+tErm1CleZQyKCwiYhOfLdlOL8uxmE0307DJheEUhkpY/MFcOWUMQhcMVUi0cfLOKGGjfhPday6O0YB/qfVsTWfpuJTuSfSOpXKMtjGqplfyB5i2wanY0t6I+ES4m9yMibwNk/eWeE3LVlvuJdI0JeOMeDOyrdc7/EFf7/AHPd7hD3q9wx/0eIe3b+Ed/kC8w9vf2zvs5qe2x0ePTPvwZq7ozOBf/Iwv/FwqLHgL3mwJmveUCstetVIufCDHgtzYBP79ID4yHeXGAnjV5uH4fLVcWIQTQji2tOCV4LyF+WoFkGbLe7PhnDOz6OenACnvu1OFqBaMhXNFQDk6DX+d0b17dozsHB+Fz0cWYTiTE7tH4N/cdFbefTSaHT28Z8fo4b079sHH3SPbR7K7J7MTIx9NZbcdzI4MDQwfGh8tONmRQztHAT0H39wD78f3IcDQwK7hwYF4LDs8NPAfw1n4MNTPG9y4UwhKUjy44OUll99Tu3FWyuss8MZfdFRVODd4+9WJ1p0VWmIJcw4YHkG9rm4R1B8JJBhZMSYd53QoWnXcqzA9RLcicsTWd1c3b9wGdti6eTlBNdQwoB1zfqC1c+osrXzkQ7RGjMl5qC1uPJkjiUOKYuXO5m0qDAnDi3MZgPA1Ki6iLPYObU8mvh9pWnuGlbxJPucbQfcNPamA11l90Fl9yG5qHFI99DQraAkpu8N7FbFUIRuR0sxJhKnMQUJ51kmyAt3p3P6OUrzA0w9fnHdd32Bi/HiJN39JqWT5hGcneaIAQSoi09lWQWS31lhbVvfXYswJGDFepwK6yJSDpR0QtHeGw7r+OMbJ/J5tXnrTOr1COxljDC6s1bxlWV13KdoQ4U0m2DoWb1RwDeLCZPg26rvX55tnVw0wY2bm8lqwqPHMczRhQIhFs/npecx+5MiddaTIgXVYChHOmlgSdQR0Tn3RXLuDkSRPn/LaMuZ/rntxZArPO41f0ImCpK+Qwc4n8Pcsux7XJaSnTjqnvmXZlUvaS6E7irPvrN6BXt69vtR5+yPRS+4ELHvEcquamz9mM1i2jaK1jYIadziDVRxLyVui29jPn5dJAr++D/Cb11CrgTFSztSdII8mg0nzgyZ7NzbmVqQDVicyfEx2g1EV+AhxwhWC76w82Xz1FVnajJ9ZwDmxRN0s4+C4cCEmQ8TLxAPmuoXS1nh4VJLuSdIwNOj1GrUeXcYUkasPwKrnywT6q+64CxnXw99lpnwdK2NAX3VM4sD7HXzce5DqEaMYCnGU5CczXZGIqeJOiAX6bdJf64fvWi8xexH3hkUjFsQArWP17ageypbqADNsUUY+HxOx8t71OYKlVCF37rZvrpHjmxKu15P0wJTLYRUIAD2uCuh4kVOtSONfgZvEZWIoUkedjQdNKq0j3VWWSqlkmFFMET+aDFM+WuKL7rXkxWQhBneas2NiPgk/l8qPKXH/itr12YaNabMhV/Fm3Parl+9o173gzvmeJopyIqweyXfTd4rynja1/nmhmuG0pp07V9+9vtV5S2mUQ28Oho3fs+Shx1vSWBwiULIzFgUrY7A4ZAAjDV00yj205NDvJZy1byM6hCVUUic7Zb9a+651+S1WnH2FLpQl9vIJQGphU1GtJU2rCd1oZLFTwtmzYKnzHk0ah10rtuLMelykAUggR5dxEwciYxZv2XQAFkNNCuNKRMbv661nb2Bat2+s0nYPWtnB02ULZTLNGJMfe492A+QzkWk0oFr9yZpXCE5VJmReCb41sUAs1LEORORgYWIeNxADyiSgIYhOLZCFkqezvE32YT2DtVrz9IswBpH8ryutU6+hz+bXxzk3lBOC/gLhgRnV+fI7IOH8jPZJXdLko+ZUf/LDOL5RKojzxkbqoPXsWOsldaP4mNfS19zkNO3gaW78KnXoaeJFuPGxDsJ3mXXSoimvsr5kz8DNH083T93rvL1gJmGEgVZuNZ2m1gtD2YahHYGhFJLgo1vZ3Rkm1wDzoMY9tNZ+6rz4xsZGL1M1ZpVR8/wipiEFoUrp2ajiTh5jZki04hFHDugPYQmOYz+xwhsXKbEuIlnZTSlA3YLlBKfS2gcyYyckZXCTllS7sLKqhbFcEtB1vjgmuAHTwcTiQa5zWFqGazo1f7rSWjnd/uE3WjqeD/xShrWOb4ppykK4QYUmT9v6Aj/koPuCgQea0fz6od0DPGlpgQoGb5WqW5oGYJvALTib3INZkaPNF29YghaxWEoiQK1xGiR7oHitinFOwagIWWqcL940rz0z42R0a5jAXGWbP1biKOoe5qTV93K044CINme+5ZpZK3cw7S1dX9cHJpfL1P3uG0bo9g0z4ByqqmAGCSFS9wkX3YGlNX6lFbYCiiGrbDQxwHulDCfwa7+69O7lr60Vio4IqnPojpMEAMBS5yUxXd3J8SKTxxV42XSAEbDpgIsAc3lZdgZyLKVxEwZaxyQx5bw+GoCyYBiorGT/dKV59zvgn1IJxQXDdpb4pxpMZhsU3so6187NB9KmhDMNmsABjrXVqW8iAjXGes0wY3sZqyttcBkzy9hDspEN7aA7xghKzB+1dzihgNg3mFCA7BvLsEnMBttasI2ELvMgMQxsW6CHjhsSbtHvf0W6Ez5sSLBFf7t4r8VH34+H2uTT0E5WjP+XVFNMWKFmvZTMEDFDwQz7UuKlCR82jsr9uXNVuVKKJlnkSDgLbjJmytI8+TyhLBZXodK83cTBUIWEIcgpaT29lYI2WtnWx7KFxKjgrVWvrXEtfagJiGwV+L5aT85lbdFPQxi9YDSCBPEYFdAjrI2IVuGcSGVbFqu4Cv44xg78nzvHH4m8/PcFnNEsdZVslrjBn8PyBn6LzKle5x/QinI98If65kPoPmhcgX3OEo9g9xHjGPxkC8egnJCXnAifvLd/cHludgJfi3lnctfo0KCbO/Lh9NT+j7zC9FT9aDCzHY7Bob1L8F91/9iOYObwIWgO4TURzMT4N95WD2ZyRw4f2lY/OrMA3wGYPJ6/fXl2Yvvy3AS8HSsCML7g32gRXr43PbXoTFZKRffI0mJ+Eo4NwflB7kjtELwOe4Wp/9yd9QFm397xgfGR4YGF6tiOg/D+4L7xgZHh/whGs3CeA/izOO7d8Bqu78ju2ZPdOZk9uG8vfH//DniN7d41NHhg557hnXtGKtPZ3btGB+E1NFzOFmayQ0PZwu6+RX/L4gZs3OH8mw7XcacPyXZ12ZbKRQ5ow0Dn4nWOPCs4LvBjsI7QwS/VfHBDCSKTm5k/zXJIncCQ12BRY8AYa/PJdQ4DY6xMOdJNI6Chcm6et41wiUPftASh5CyPj3JePprINFuun+x887j17DQ/ZyGGdqljZjHAGq6IwQ6tkJKpa4OFYzI5MRQncyIgk84JTs41nvKqNWedIx287OSw0AQHWmmOtkDKevDOdKxjAp1URTv/fLV96Xrz7BVeO6lhmra5WiWu9fTiSEIXuw+qtlHj6V9LQz97k+CCObklai2IugfOTSXh7Rbm47sGEwQ60PbIMUleBFNdhXhpBZNz/jIKpnOqa/IXwmqtftn5EvUGg2XqMcoq3dHiYoWYHGc+oxoerFChrbFqNVY5Ot7nlHtBDkswkzfq9AoYGs2z1zsXKJUBfhcrtBZE8Qea1Ev7MWm9uAdKRUNg5pFgMH4kGCl5JnKU6tvNpUYLRAIeOqBAWw0X7l3eVPDiEXfOX29fvm5GXHdV8pskZNoVp2gOM6YXfhgEMHmQCZBHjWhmzOizrkUOx8JExLSDEmA3VmsSSFivxly/dhX9+pdxEY5y8ty81n54unPqZ1bZ8OBGcckhMBOOCqMNS5mI+3D5WlSlHAZGgZiOaBGYoam4KuUKRfD2l3cpH5Yg815jK63039x5MT+WMVmEZJn2/HQbVWqmq/LHJbNla/OnNbgqrbuPeNcWTL5Qktp7fmw2yNSwhEsV88ZhJFLSJfWEB0GSapd66bUTDk5Y5svPHXUuvjRZr6kb+EUVR4tdgjyOcJW8xj5Y353FHUKcBMqRI1x3tAqHXD4E0sXnQr+Y1AClN3Lz+5S2d/P4r831J5v3HzZfPEMeeOYriicQKKo/VSq5pvov3S672whaIyzQa/Un6HqfGJbvkwKmbhNlRMxJgI9oHOCE+UTg9CgefAwwoZ6YWKx6Tv3c+eYBm0WsfTykE/l4uWv42p1WfDMXLemUyK7pQn+J6YF/jMJ3/RgfY+wsMUncMPI4JUtKdMZET6W44OO7ncdfdx6fUdHpSEIxycbIsEmBH8FkW5xRNAqKYDhDI4DYCRprni3SA6/m9IxJRANFKuOYzl/vnFrXMS2BsSaRr4oV8L5vg8WVF0q0VySFdeeiwZpDB3kKrOwHNZZ/aHv6RP11wc/nj2gMzQok3hP6TOL2BQA3334Jb2iVCh2JJSeX0+3eqNSlA9I9oYPpqzNSGhDTIdLcMILw0o325e9ZEAqOkYXAPBzgkSL3jLZx8t2tfeT3P8/mbOndOX8r0Td8vk2TTE+SahrbTD8qRgCyizERrmFMgmtRpigA9RCXgnzq+ayCPe3VKk65V7v/80EJtFtFH4YTne+/0YehEgRhWTdZJukepQPZz+rO+16EbhKOiSGwrrSKBGrSKipqkgYSJMKs53LQaT2gTOt+MOtxNXNXWpCTxVxIsnPqNUwByiIahEiXTMkQTnLKcEme08ZagR4kmke0h+9hxNMIHWXXrnGBhpw9j2Ay8vpkSW7HcmNNVizzYbDsVMwU+PMCbixe4gnQfvy0fW6FAtjzVJ4F6GI11Mq6GDJGyKRr/Bi0E6JSnAqBGArAOKz/8XxU/+LmiFDNgJ2Ys+5knyZD3coZSQi6KLf41OPm8UcsROku48n5IMyltV3A2s70Zis7qy3VgaXstBNWdtpFWtPBk+vWUvOsuyk9yaQcuKxl8jwDAslrmTzPaFdqPs6n7BECtSwS/WzhpScZg5pJpqC2YRLGQVXsEJ8CEzCpUhlU9HKKk3PlPbLkhUMK7336befaaeaRTH3dOc2FzoNv/JqDJ1L64TSbbnwUF7G1I4uYohYzxU8VlEugMmRmKeds5TwUcy1tpxnjzJhllkGWGGJpm8lYS2oq9ZgFfcwBYwVQ8steC+U9TrNsEJvEd/N3c3EMbU9Tdpuopyi0Ic/CnEXQGkrbn8UaAmuz1y7WapHVbuZoU8Y0X9RwAIsZ9lAzw8osSpamYikKlmZDNhGyWJDNfiQ1fzdBMeSEmYnhEcIfkqtKjMHQhV6iwH5peddLCWw+YFOBLqXao0yNBk10p6Q1NToNi7aVE1Vm9JeluWylZXSVXAa+AqJREl2iGiSR9UbKi4hPC3dLqHdLWVu8WrLVkqlGkqaFnJFslkyzpZktxdLCxRYrRqb0yZmKLve6W3KnezKm2keSfKld39dsqXazcQx+vFWuVP32/Gcfv7dTsHhkvjw8dHSukC8eObx/eMiZObw/KuT3VyuHpvCFbfhyJydG4F/wafnIZCE/E32Uc2Y+LOTj4aHdR4e2z4VwbHZixFvYBudsqx6ags/jw0Pbj8KpNXgFxSOfziNOIf/JER8OfhhHeXgVnJnl4XpuZviT4vyQMwTSAb6zrVqZOrj7vw9mSxPZbTiI8endYztGB0uHh4cG9uzaie8H9u3a6U6MAA+bHIHjBwf27dm5b8+u2lh2dLAwkz2wF74DZ8xkpyeye8d2DML4ndFs6fB+/DVHAGHnnixALRzs5xJ0sc6kuIRAOLKriRrjkrbWI8koHOGeE06bfo/KQr1sXrjQun1v8+lXUhu7Tlt2g3lH1wgxJ6n0QWuESQMXrGEwitDaMMG3qOkJFROPfX2zdfKCbPgD4Awm/jZ1/dgrEjn1WIgjOoyDCnuL0D+CaSP5EJCbusS5c26iB7kMJa4vacFkdBl9/aj14/XW39mJzlhg0oQq/zE2uyL9kbipL9LnJUK24LBKJK5RlDkNPiA2L5xsvXhBgi8kR8yiRr9g/HwgpQhosQklk5QlqlDSB67Rghu2nxDpfHwMa7Dd/IH9FzEtPIZFt2Zlwg8zgsuXDhsYlmXWknA3sI4wMyD+GMBDI3jjdvvJCq8JCGRmDieUxiEvesDnpAxeKGmY0RpazkiA5q1vcHA3zmlJvSRlCN99RxH0swFijN6HgfHsh4GStZknAcQy/DR2vtYlbOiptsw6BbY0G7c89pVSuOsJEIsStw7GBF4aC4pSWZMn/Cl/4irUFPcP53WuE0fHkzJLblUW/rwFD90J8occnhhFJeFPrdUv22eetc98q5c2Q1+0OKuemP5kw6QZq0E0pBXPsQlr5AY5sNw5/57XuO/zLjgQ0kkzcGicRJUkdQw9xX9eoMzxNdBaRXIoPcZiDmsXsBbkzzg7Ks4sTwwgOMKpeOCmV4pb06ZYm2zg9O8x6Ob3GHzrRwW+Vw/ZTqt6xWJcEcdwAdQdJ38zzbgslpMCEh7u/9GqID/9o3XjTefcJa4Nwt/nH2MqhKjdwL3ZhoT0RARDMLvMdQJO/wjEtX+E7o10/cZTApfNjXXPJV1Fubaw4uIlmu9P1nEK3KWyF16AvnI8IwWFp/o2VDlPn70/z1UFpvnTc8aYQ0M3BdK4g3FUiQRy9GOJqBfJH9kYgasvEQuh1v2rm8dfGiHkVsxeJb5WhGo9BvzJxul6ognPXDnES9lfnsuF43ADZc1U8VwTqQMqQ0VOqDxURUzY+LVmSRw5fc3kuYRzJb0l+taMYHFm3ZAtPl2FiZxlbUovwtBE1ZIDrWdvYHa27j2WVRh8BsqWQ4BxjUeAMXW2c8EDszBAOGyHMIzlF+i5byCwtrhztDNrrSo37teHrZu3zI2rgvXT/87JZ4aVeydIXbeOEM2tI0T7gS+5UQT3wL6UFN+fD0ROm6vJs5b30mPJLLgkPGc3fz6Os2D1S6Kyfg7dLRhAluTt84HdRhnti5PDlSi5nPYkZbjwMkOfdHH+eZaiMRgaQx5Bud79QUp+wq3DK2TtBEiTjEDb/oJdNFYrNrnonLpokwtCSD2rEmkjXCmQjwlYH7JEqCmyxOPS59hbNCxPJzj6BrufE6L+4tF8fAyp//nkIXH9Ws1xlQmollpUaqdzHHFxbglUl2gkyGSCK6Q9yz1KIZjS5ujMq3JZpD7qXOwjVulsH1laHax8iVjlmSfwydxjbNXxyIoohg1X0YxnjnDx+l4Wj0ACbc9GLAwj5Q9tbbulpiUFIsVTQcOi4qASqka3LiBTT01M7iKlWkmtGqheXXR2Ja2LCNS+4vOx/WDIJ4t4ytptTR+LrzrfrCaPRUI6zSLlfGyWJ+mtAiTeeMIQbzxRzGR9HXMgUpAiSOm45JVVztME4BILGwsi8fG5f9y6ciup3qz6FX3WDKPvy/zQlHqAmutPbCA4C9OBhIX+rrPEmOmxYozZklgrIji4oEuPkWBsA701tj1g7ACWWUL9De/vZvyGVNts2uM9f3jS7eNCm9M0N8Vw+VHXx/vfJLWGzqYI4BbMz6Z7NtGzKR6783rZlqFYNrkyXEgokBSsvqTXjHhPL+URqiOlj6omVhx1GRXBMZwmoRDKHfh2C2ew6ALvMupW6EaVGz2eHkY/FWv0qmrUlC5NqdBEsRldpiosFcfZq06M/jBHLY2hmsKS6EaM2wI8JboTiW1JVSNGU9LTlpsqLG1pZkRYSnip2GJxZQkYI1pUrgg+CwKWAT1yJD33+3i4cKqN9ni3tDXxbFnfU6+WNhmP1kdbebRoPn/20Xt7sz750A8ir3QkKH7ol11nBl9B8RM/d3hqAd+XjoRF/Bsfmh6FPx/gdxfhPbbNw/vSkWU6nocTip8wBrzdCRgfavt8VDoyh9+PPPx+WHZmRrG9gK/84am5sovHSvDXKeRzU4vx9OhifGgU3h/eMbp/5+5d4ztGD+48tCeL7+BfNJ4dGxkewtd4cDjr78rumIDm3eM7JuGL+3ftGBzMzh3JTsLxXePOZHYC0KYnx4aHJsdG8DU8PDTwX0PZ4aHBeKyfNyukXaqW0wf91WFMhdC5sEdEJRl7juAUpX1tqj+lRFfz3PHNuxdQf1KhruQczBxS1JqNkWjnVPfSHy3xSr8cuyboaUXNXRhFLeiWlo5DXiQDwdFYi2VygYahxnLeW0BBGVn1gthdEFGhCXjmuaL8q9b35969XNl8udo+9oAEBJ4I1GrJnTOlwQpOFDmZWIp0UyQIdiQlUxFLQycYh+MmGCGDXkBZVs9jBmQcHszEBS5OhkaplIeu+8F81U2HAPASsln+b19GkwzPzrj5uF7X+vNVJ+8BkQLsvCRZLqEayHsZ6UK9/7Ik3b2MgNvezUoCA2cEQbM3V9ghJwurPQ280krxMPCuKKusZ75qf/urLrEGdE5q9Z9b/mfPZ4PTRd4IzzwTDGgTN9qRDA9ARiLOOCEZ2CzSELAncqMs3kharWvdvYgLhRfPtK9dkDh8eLLgIcjUNTMz5rPA9GMEn5SNFvgUsBSOZlAtHE2ISeFonGp53O1W5hB7/exEvibGppTFt3zhwW/u8I3BEDhxriV3IEEx96QLx7oriKZ3hQGt27KEkeVV3ufhUKoOzEDjVI3/BV0nVUmUgT6Yn57DzSB+jnusC7iDQfZ0YTrnkMNvkOYz10RSuHaUjUFEeHG69eIEGIEGQZ83p4TpnDXUgE0eH4vumVbc8FvO044NuPYFzsVuVniaJz+H4fEij1v0qnMZK5Sy4gWFKk0WimwgSCIw2mHSU3INNZZDQuaOY3IdXZOkbfdApUwoUz2MSwHtVKp7TjHkVO/QtJRuCiQe50nBXFmyONpPv21+/QovLvmS5IQMoS5p5q0Y7ktGemIPELXwd8TLxR4lSl5uksMQavObp81zN2krBA2r6jmmlohx8Pgu1wtMmqgKcJ0l1EKGDU4QK+QEvn0F7M3NjZ+5BCWW73I1e6DvVLHQqzYhi42XnIh8HLLDzzXHElTWPiBYl9mYBXBQPa0r95MxgWwtzmEMnKlJGTp5uYsS9RO4Ba/YI6gCMWdlc9Dju60bq7w/iEQVjAcUjuQMmQ8kYI/BScu4IPJpfzOiy6grHOMgZSlv3O5cOw3qgJfyEC2jq89UO7NiApexjEFeApTs9rxUaLqMhjEWnKaNczz5No9fbD56A/Cdq1Rm0nPqc+jnrFW8UKtt1j12XGnGmYhbTDecP2cRU/9RtMrVN+0vXlLJZMQgk089ELhHwwnDuKxZfCJH9FQJd3qCBbPhoZTY/Pnr1rmL7ZVrsiWnnJlLIl00MBEmZK4nJhEug+8x0xU4VakMyCqV0NJxiB4axSHaVGVNvRXZLVypBWu54e2RuobNW6utx7SmU/WCWayZG2rlgFlMBcU1RAClsSEwQYTNtAcqBW+AObGXVH5l/OadB51TNzjXDpyQgYEZp6chLVYwqCEt/WNB0zTGxIMaDmPiQZXDqBswpgwW3VQJ7Stn9l+RpT8vAIXpZkud42+72FJFsromU5DmtaomB12Z3NSlm/S3UVZfLCTB0hXLAZ6837z7S+ur80ZTEUp6ZSVybNePOEx7MLuYpYVtuASP0KISy8uy91xdbtpAueLY5GFZ1biF973GQqpz4V7r1APjcaOzuh4sbtNHymoQoAwFMqMAJ+sN8TB8+afnySiSByki8YQPplTqI9G0hPFdeXEqs0xixvPHpRLl6KOytiiegPa0bq03b2IASkQRy8B7GM0wlSDMmw4oOelsDC1JDwqK+1pxGxx5YAm0/cNvna84Nw2cnlmqAevPa5iyV4zIyxbyyq4rpT2wulMM+pkOFlgpYM3MjJRWjsy2s84XK+0zv7Yufsubz+YQCGVDrB5ZQXawJkM9kiy5Zv3C9VmekcT5J09cFDZnfuUaTvkMIvJlqEpFMhgcqBHNOoUbNKS1GHD2QBopia9qY70ggwTx9QVuDF1A6VU0exgKjTV0jsrvxrwf1scECK5olADdPkfpvnDBvBoHKAX7OeX6GV49BpexshL7ylhWYktZJo6xboxpYxk1iTGTtjSMeZEYFhZ7NaTVpvyG5xuGb3N7i9XbtNswbkO3TRwVu1FsocMiRsWKbATlnbm6Q9fQXUN0laOm+Gmal+p5SXSmctDURh6lbL1UzfAzw8wkHkrJkcWTMGHVn5d56f5+59ELQ4rScthQIHYK2aRHGU+K7Fh0oYsnMEUw/EDyF3osFLqVt9HbqrRlN7StUrdQpEZ9GsXZpTFtTdmrsWw9ZWmonquiygJrcZlrsnnnJl8TS9WIcO4S0kY0m0P4ZZWSvbLRiEQVhmkRlQi/LoFnxJwIOLH3vXlMFC0nRbyloEdyGKEhEqPXkwf3fbTvZlb7gPHndX1bXHp2q/HqfbiFVw/FjGxe/fC9PXszxe2FmeKnhY9m8zP4gn/zw9kjBw/sPzzllV14E5YOL8Frec6ZLoxkx0f27Mnj8f8oZuv+VLAjOx37U3B8YimC/8ZHdsOx8VIWvj1VysLnnQG8nY7rU0HFmf74o/zM1Afl+t7s4akPvKUoPDzz6fZCDU6BMWz/+KPZmf17x4aCytz0wQND20vZj/LOLHyrVAUgaHUAx6+5Rw7A62AOvrlzx+hAbv/YEPyZP5TFT+Mj0adT9A5fu+A1MfIfB7Klndnc/r1Du3ZC284dA9VDE+OjA4N7BrB1bHRgeGkqO3owl/VmsvFU/8g1tGrrnDgFxIwjWdi5veDEebfgZEInOYIJrP75gAoZ0v5RzAKE0+8fX757ebu9+ltrDf0OSz5IVEwDXMATvYIG/qKrIAO6sO6lQKNg1vXmQfX4MWY6DtNdVv+8UOOsl+uUyIwHgJ1eOgaCrHXlF+4dgSoIXfCDdMculQyndPpVh7e1gfGLbYFfcrmBvNl/HOMcAacet87TykWJvi9725LEQB7mqkZXZcwn8/XCbXsFL87DgWWv6pRCSmzO3gtKunvP88n2QbHx+kLr22fNk1dA5tEFqzuY1YL706xb1RgMDQwc5pytpsXnkOA/LxwlqgrKk4KXkbRxVoS/v3j38vPm9XvN87eat76WRGJuKcCUHY5K1gTYINog5txabJ0V1H3MdB0fZfVQ990YC0GXOBCb44RKtGcQq2hqQezWjTety29aZ45xWWw3CgLcFSoWAOb3jZjqh7iAXyUukWoVfN2ORNVVb3FEOyd1Xn/SugodfNH64iEtcxRs+LjkLFb5h5aceLaqG4sLYKssUnAThwCcW2k9u9L8+gnvkAHOXJW1//8rCEpcb0FgqYUIEwkRStUt0PMhmVavlSXTOTwVqINKQNTKdUydpilx8TKkIKhFYbDQLaWUoIza9Ii1zv727s2N5sZ5ecRyCRrc+kAqZMFTIUUzHuD9wtx0eD1PbLTOfCPXYS4vuirijN6YeIbvR4Qhz1VqARhaBdBFMeD1HkynZVkdOr3e4lootNyVQHJGuPuVQPOFw/0mHLjOQZlraWM9nrw5QHVNKX+PLvLd4mrzb39rv3q2eeXeu5en8HzPoX1zFc2b5/+tsVoPtV5R4IcGkdzQ60WqmEoZgb9s3j0LcORIyzCQ+iNoxlNiIHbrFPgOYPlQ4xWUhFnXpJSsmQTPjsHNNZNgqQDMqua6c/J4qCz5V48GTEc8Vc4C7cknyRu8HHVN7NH+8kH763tyF4GaiaeUco2FaAkTS6nR1n4UNLTBWLKZcPwU78+6fhYzlBBS5FI2iQQN02sHXO/Z5zceRvORbEJpAjYkPQM3fgKpBDKldep7/hEgpWXnnQ5IgJIBCaAOB/HMcJq0eKrDMWBu3Xcqso2h8TjmVSptIqr95zmMz7zAo3qy3r78pHXmBO9swXx1vudUVf46Napyv+iEnOeYm5ZxqPWI9sXwrpFFlUl/HJNQ280fT7/b+K11ifawuJiVkOGVU+JTgWLNDYuc5iACG913pUnzemMVJYZs3XjbvP6I8cKAtBlIhxwY1SZPZxgUaeszUDJFBY3uxrikVg8kegBzKOTJz4FOZA6zuwKwzVPX2pfvcYHKsoWLSYB8SStUw5RS6M4KOWUcP20PZ3mTqPz0E5+jKL7E5cVcuDNuTTYrho6clJzO/i/+gafX5KwFEAXmJKmCDNQAnqSnNbponJAVty+4MR7hUL15unl4BbGAIacox9SOWOOChOMx9olSPupH329evYtFwH973n5FZc3BNvWqYczXFW5uwUTSAKwDZJU6/ateDK6IfgMCpg7V+uax1yIO285VAlzZo+dcW+Gm1/mmP1gkoqNl7heT2/U7VTa78LJ59R50B2/4vkkfOPpKHOedeZNIPenS+pACx5ErGldlpDtn4/S7dwUM+yNlAU/m6e94VteCyr9+xjGsoL4FRvJ0KxTm9aPSNvQmZ0sYkKyRES6tlQcyBju2k0ehEGYMCoVDEBQcAkFYQ0iQiIxkaDOv42tIVNXNUDJcviQ4vXAu8KyCeWAmwVJYSJiOchvlMzJzdNrgs6PfN6KR+0wkI39WwQgdG7kIPVtysRxJfAgIiDhIzkRJ5tdo8mgTLdAwUvv2FQOD5ZUYpb/TKOHp/cwEYxqwaDGU3GbI9nvyBsBVYWdA87eVhIRvSVqZbgprBZrJrNUmuhanFCKJ5BG/feYLAvhLppgmeMru/jWzs6iYIWEJn4N5UVP+xZv1lC0RTzIEKbQYkb6zyYoyFYum9OMSFikxVERIiDIJpgMWDejPJf5C89sK36h6o5pDKX4Af2OFNzrTaEtLT1qyw+hFUWFGceGWcaOt3lPFGO2S1ijvK9yNYE8EtyXCbaGqEtWSpCCRzI9yqoH8KhGCIkW3lHsoqGjCq9xbeQB2nsg9I6r6CRkWMGwZyZd41utfESHPZFvwQr9NimFQHkKmVcZ1urHerYo9x60Ni/3ONdsWew4ap9AHW25ehHPyn32mJ5U/++C9fUNHvfL0x9uqhcO7dh6AP9PTs0dm8vAB/u3b/nG1MDIU5Q7sGxkqus4hfOEx/AunFUazI0PLOWyp48fS1K5aaary8bbCTvgb6LenPzoyUz9anq4f9aarhdqUc2jxYNb1AW47dAxfAJAImvyie2j6o9kZeB2Zy1Mvg3BOGc4pje0YHIBB5HZl4c3SWHbpwMjQxHD9YHbPQHZ0Yrgwnh3YPT46PrpneGByfHQuf3gn9FwdmNw9OjjwQTn74Wh2bHDg43IWWsaXDuwbgm9OwN8RfwZLJuwsZScnstDHnn4pzmZxB0A94oV3L299otSIq8Qeby1LAOrvv3W+4vIgmCgjs1QPRcg7iGMyGyuEQ4Ca1VhbZZOu6jIEVV2muGGhGksNEKAyXi2uU8FpXLQIolhWmSnRPscJaDNRJ2T8EVqkkdYyBN707vXb5uqPrZuPee0Zrdiqie6lAjYerlQGkTMv1QBMr7S5ICgEnF3W7plFuVTOptzYmFwIrxV11Vp9vnn/IUt+7CyDjnCNcUILWPgsrp4XtVontzm+73I1B7avG/cwNWdIUaHPW8+fvFt/SvGkdfgSleWUzN7o66qhh0/wxf1FTQJPSsUHpYL7VNYRcvP6k84Xd1vPtaAfDGGpIGWFMDgj1C1TnPjKanJEWlU5h8Oq5G/jlbPWja+bL79v/3qF3MAhhpFgcnlTU8bkImU8SSZaSDcxKOslQGv9/RltQSMk8tWVTVKDGufgiWRlVmi3WeQH+ocYPz4A8keZTSsZYn/q6pNcqgZHs6v2Aq1SziosCyT1ZJYYuPXqm83vnzR/u8ujxB7KdS3fm/cqjduyuohjJLMVbB1f6gKjd802BiX1ZGMtsQnbt75rX3qRsFZf01YCUQoLTPYEUtL+UUUxygN86zv+2XiS9bsxLRNFqiA3FO8QtXkFNrciTG7r1XhRaZXTLlAU0srV5skXVK7DdTHKLtYwG9/NSYI8BYSmmkZlMRKhwFyhwPaTL5rnvyFdBBjog1GGhuNgnlL16A16SbCklPhIbj+13Ge5ikaqmwHo+Zi9F5s0nsgVOKpOJeGIt5/yIBAmNYZcKI9BFW8g69G65xY5QGw2KJuVfoo0o//+STZdndf8myc/h3+bq6+aK19Svh3MkI75ccLuLjDNHozP6eoDrloVSAo7oSx48ogeFQptumgev8dcmroAEQ0wkSn+VJCE+RwHG+TiunXD+xziIB4KReNwyPZvq52vz8Pdx58C3yGpUMPNWfV+nYS4dFpLPVbmGFo3WBC2tuhquBs+YVwpiztpnaEKTaaLjLvsuiaX4nxQzST9macN6ylnrN66HzvsRPfQnnyBvXCeKHz8uBctsYxxs3XcmZSJ+vSDB/PJ0a070wy8XDKT+2yeute+/Pd0twTo+q7JJVV1w4J1M9xZ00KRTPYt+vNCTDm2yAaBm9R69IzNEGDAmNbSETKo4jFAJEtcCjYvEPoiNVr/OM9Sg863xAY6S6q4Cd+xC+oERS8skTZ2Zj1Z8aYs8SjTqKoObmjyeazEaU+3Tp3C6jpvrsJ4SToVwEADPZmPJQs3mGmNVRbD3CWqCcm1QP1pwZ40tA3KaJlkAwUnwcNUZVT+0eN41lkXOBpoKW0q8Z5K8nsh4pfnN7+9zrlUKh786jD07PpoMIU5dZXJZor6g6jJrDR5y4yWUhtrFwDW6AyG5axiqjpwzwtdgbLvcDx0EorqyDryg9kk3fKLNxzx4oN2rGPETjmt4hIco+JSQDIwgKEhMUwymgApWpQiLo2NJG9aF3Hh5xKtdmF7QF8ePQNZy4RPGIyApjoAMzW2sOVjCi+T8D2qqSO4TPfwB+pYI8mSTZcyckQN1N1qkDOpUisSvpVzqGAuEC55eNlcev4EH1cadM0JouS6KkyKDxGMSm9NdIVrd17jPl6x9g9fdL74SbGKqH5zZmbRjXIoq2DIoUR0o7h6ltv4R0m4ZzLniXWVNMcaTf32P14asgRzF2RFwkVMH9U0vPhA/ASOFhyRIp44w4DN6/fIDic0Tt/mpRidTeN8ZxkVr6mp9celmqRwW5O6Ws3vXgBo68VpDk8spykdFWWh51ZjyzAVJsETi2UkfcbuURU1QoNL0P5yTVJClZOweJDZ1cavXsnD5aYa3xVsup9qwhUDDenG8Gi8XxsvcRfE2QdspDgpLo8leNAZBjfRNhZIEILWwCH7xvXw50XMHnYvb/mZVj5vnvtW1iIJla4rKAa/uEXh1P+X1laPldVlXqmR023fdBk3tlWT2DIyk9h0MXaLZbBY5L+L8yeGhLEibAvCEHXzxijYHx8w+5bIStePlzl9m75LcWvDqg2ftohrSpmz8ladbZ5RqoUhlBJEvBBU2kT6VBilrsQ68zTlUgxS2rqIo00ZE7KYZld9SJVFpAyJSjEom/XbbOavKYyhLSnCInSbhFRfsWSEkYqhFHlQxvC+GtykohYF261WjTY1etRcdqYNKS0X8F5OVHO/X1M1xwGOONESzdOtdGxNk+iYlCowGuCvpH5KFCdyWDYhqDA3YtwW4N2y1hKGRgQa4dfPxZFIKUsiGVFk5FAfz2DFrY8rPRns8Qt2H028gn3OU59g9yHjEdy2lUcQQ38++0xJ0mfb3tsf+EEhPzuajarFkUJ+Wwn+HPBnc0P4Gvq0kC/kPylVDk9P4fEdAweG57zyIfgXw8d5bMc32Ibv8e+hIdeJo+LIUfj8IWDUoM3PDbm1ufKhOe/QDsDbFkfVkUNDgfPpByN5eBU+9GeH4LO7rTQztK10ZOhohbB27s4erRyegtf0rp1jAzsGFocPDO/bMbx/x7aD2fKh7Oh+LGrwnwPZ0cG9E/CFPRP4bs/46GB+d3YSGiZ3jQ3sHh2sjWYnd+0cGN6/b2wAvYaD0H9xYPHAyGAWfuUR9CPC8bF+8WFhjMm6rNgjydCRCj2idK6YRnPWjj1qnT7TunA8FXsUma1eFYfzDMHz5jKiG+Yqjq+N0g0vUyo6RXKX1J19VXp49/LG5kVcXyJ4XKld6LLTcD75Uooosc+wl/mQtpnhJjzDFxKb7M5zpgxskyErdefS9piF7GAqzLqASeVRQOiceZ6ca5ci5kRxyrYCzhCX4lskkJLNHLi3xWJeresbvJmj/eVd5l+hy9njbP7VuFNTO8lkpqs60hZYael6u0o+09qi1Ru9sTosmO1UdD2S7UnUhZ9fdis9JkDqmUH+r0+LkH+sYuNqeZ5ylXLqqqPVK3oFLz7KmQeoxrX+Hs0f82DWfmzELcfLOPBLuK/WybdcCFu6ggtfztc1/wJeMOB/uEWkmqFdULy4UweTA5d9TZPkoGgfxyB72gBF+3DSIMm5vNhTyuh5m5eP86l4V0ogo0wFDxdbsA4vqBLRVIFUaapzxHwJF88pnPvad4CD/QNFqmvELyGIpyyvhfEQRcfw52VyhNMQKNgpoCHMBcpN1MwOanw71cRmZeH9cSmXmO03fme1jOugJcuuxnjJefZO/MI+VP3MoIxymRN53Ph98/hFA+Jq8TUql0632Mk31kgN3+ddq7y3kI4TECeJgEkHUCCGKJtqHU2pmjBE0LlOD5Y2MRoBwX/FzB/H5nhUzW9Xmxc5wgG+6RaLgUkASskM7b2PoT7xeLl7tj9aD/3tK+ahp+2PcOlNOsNaEKVAtYGW7RWO9iUK0uO7CoO7EdntTyYJn0TF0u0GRkErUUKh2te+B3uGt1f4VLzY0VXYepXNVsVxNIOzDVPlRVaA2bx7wYKpVnU1SH6CCR7ELCABRXjqrly4j5H5Vc3TG/yrqsCmouRn6cNgcPRZ6MJRGXx6g2UwwxgRnHeKGZjGxZCqbere4MwSqaQqSXKMBibfLS1nrwD7NnuDccvTXKgL28kVEriQLhHHrqbhOD0C3D3GxN2pV3/gQP1i6molMk93MxtJ172RGTfPsHXQOX/dDDElznDrlKNIKJTxYzcO5sSiyDB49hmv/cNXzZP3Ny+fNqi1UHktlqoxJLXi5TkPAekPT/KN3bjdPP+IVrTrFDIZG6PH/DjQUHlemrAlucHzKCnJQ8mzYoQ4wLZuXrckOGGnf7JXs9wlAVahw8V2MsATv6blLQmwgrIRZ2ShtH55zUKN3SVzVa3Wa90c3ukhEtaXkkYFDVdIQLu0ECGbH4DIqdFHTqEa/C0I855uiwzjksslFeCIfaBe41UocftTARBMGuZxGVp2/be/WGk9vd18Q1Uoi+iXmncWCKWnO662GBTTfWFTWbJdW+g2btXFfYUpXOYdIMTo2bpTaazx4zLPFRwxdQ7VGLxE5XZol5nu9O88e9b+7THv9AcLqoSuuFLBs/IYMrC6qxCy21ulcLbDijCZMDGezZccD3MDGnDSVq7vZ4A2FhtrYSC63KUS2pXuIb/b+Lr1atWM2vcx9hKFpovnWcm5rJHbyLgW9e+M38ZOsT68fVwXmU0wunnsesKIUJbZ9834NRHJlXuAzrumwwBOxxtqA1Y5aNgCRCYUOq48G0Qb05iAZjDp+cD18rnEh13igQbKcYqgT111anpwbUBHxJFkNCxIdvjN1efw3IlcAVCJ84oaq3BRM4xKTy/XlSFMNbrZoqDs9u1jwO8vt0/QAhyiZCJnq72RxkxJSGZKmRtNntg4W9kGxpdB5oUxDroMA9sq6E/Qu1h5wsdN5GeaKGNLnKf3aX5sk+KEDqc5ZBd7xXtBPJ7pY3Pj2yb78BxNZ0HPnUU2+YtMMiW7PcfhW1wS3baSOfHG7+2LX7bPvVIuKFdHKZsytWVifZrd+HcmaDpyZk4BKBJScaJ0gSwJU5L9LMxplMtwgEtNc6t9r0xGIrIMdVGuwQnD1LkHZEOZBqMrHzAkABOqHdOEzEAARPUbTmJxEVHLrIlVAW+teo2qNPox0YyqEW1NmNJORiWJMkq0Agvz/5n+8BdaYAsFYIS0uLIssWkEZj/5Ln5nI0K3PrtH0qoWU9XVJZlssWSJIyOFjMTgihTHROaIvOnvA2MVvqu/Cyw52OUBS52VcoAlR4z/678//kv/l5CIz/774/d1f/nLiwv1in9wcWHpY3i7VC4d3jN98MC+/KEpevmfLi7ggU+XF/Z8ury4JzwKfcB3prZX/CJ8YR4+z4dVF99D86758Kg7tb3uw6sCn8fhux7iwfvZkWwZwGt4FsCMO3snasVDU3h0vLB3Av/ia65c2lMr5qdm4D38PTQzfWDfzPTBfWOjgwPw98B4wZlA1MGBucPZvQPZgrO3tjO7czw4lN01mN29c7w0hsnSgin4f+fOwewknDc4MDI0OFA5lB3Zlx0c2DG0Y2SoPIPvRibHRgfgNdjH/eW7843VqufnQb/yE6n1kbXRx/rjqLCpyPI5CuK8e7yzscERubhE6fJ3xSSzAKtBWOeI2KAQVBpPwfiIgeQk6Oj67sLHoP0QyYdvenq3sdE6cZHj9vm8pWUJk6Pu4BksUhKS3v7SHUjx9o0iGwLwXlYtoB9c5lx5DubA5udfdE5e1F9XQS8elpGAPkyojRY1tzu06pr37bFxv6T10rWzzRv3uda56cmudw4aBlejJKuCj2/RJxMfrYq3vHGvIO4frtPbPPG089UPnZfnqfAIavuam+xpBNogEjU0IV9hnHPqBovEK2hghgIB27zwi4EKE0ZTzvvqqqpjCS5JMWk355N2Ch1bL5tkM15BUgHkJXrs1N13b29gfNrGKVoNrWFJ87BuFrIw3EV7NXEu2p/pQjBNhAvhcYSLwpn4lmAerqKUgyw48yCOQt4xQtstOQEL1WMGDfPu1fPWdyeYoXsYTVWCR1Dyx9pGHi40VAgmsfJ4/44iq1108zpbRAqYNumQneM2u7rETyM3p6gX06bUnAYqzy/z8taPz9+t/6y8vOi75Wgu0IBGfAIsYPyYxjV4FPdEmxoRbvMBMgQDlvGx5p/yL+DatWTpNPlEi7xUQJoSIF28uXmFa//hjg24TL4jRdncUPw1XglTzIbkYZS22cAXdUhgsqEBwHhPA4PBcGTzVQDd5wK7zLtjsqUVqnFRPYrIf1iOta99h6zq999JtMxTLbW5quajo23QtBSv0JKPBCmFUzeF7klo4cT/8xw+mGKTEi7mCf/hu9bL+3S7CRp//YI+PbxnDeNygorv2COlSuK6lwErif/4LUXwwvOyQAuVsryFSYVwWQye8XnecQR/cTlcMHGRMRAkGmHIa4yA13mNv5vRMvViEKW2clVcDdd0yNld6R+tKdu5kv17tHnLxGoyWE8xXfbvcupnK8xU94Zp/mcG07K0NCxTmFbmW8oGxFwu0NRrBdL8Y8cpmIAwAzurd9QErLsRPEcEKm/FBIIrqlOXK9lT8FIIrxxPY9yi+Y/zzeM/tdZ+ohFGtG3U+9ucPpNw6ebZREuixeC3zVJQJjdydASrCSxnhwGOsYmQON06vdJ8vNI69TqJEgvdBbOkDMxY0vbMCwv3yJzMcC80fsHDcVMJeKLbhLn55T0wNHnFFL0/NV0nD8J5Lg+QSAdoy0Ebe9j7yw0jMlReZBLpowPl1RM2SMxgEyzcbMqJBRv388loYTL9+Lz5+AseLWPXkohycZ3jI1H1KrRr1dVoaKdW4WTQ6POjaOhM40nMfBefrs6F15S9BUNVkji/iDPL48wCW5GFibT1QIorEOHYFYhYRBlM1V5vHn81zamCAzY/LUTX817BwXatkoZVkzC7J9YGkBqU12/igvuTq2y+4eoFmE3CQhqrRcwfWqXVAXyrvhXeL26g1LXy7uUpBmPXCgFJIUq5R/BYEhKl/LE+qG61BgfK1YysgNUIVX4YbqQnG2KkDWZctEgmVSEZDNhQ+/pNsk+CKEWGNAMgLkfEoegwqy2vjfr4CMHA54Z4hUulbAqSZQrXgDKSxif9nn9pQLnrME/avbr+2hfNu7+0V9blB+NZqWcl9fjBk43LZ3kpC/tej8wcqk6RlFh4UJKWUqLsYNa0JNDsd6CYrX+eJeZCgmn1TPP4w+apH8lVAyfMoRmVWJx58hlj4i9O2OVTjVZ26xZ8LFvIdfXu4coXLTV9eQYYK+835Dj1vBHBT+0fqdYDEiCvGGgYYMLu7VHePW5GyVaEC+cUg+SS4rpglXNu8WfeIFKXULW4nqEfjwM8/hZ+NF5c1554yZqFXER0UVSEIHALXz5Z1wEMWddBCLzBtFLRz1m2hZHz14ZNynCyTSYLYQvjwTYaLHPB0BS1CSxKz9FB90R8Ap9XJp9i8RZz72bShkRbDDqlehONK4JbHDNYeuB6wm9NxjyZtO+pO4zqsJhhNyFco/OQEF55roQwxQWVAyZEzVCzhJGZ0KKEQ/VjT4Y3GdKUjsfrQ2QMhTH8ZesLaFEUw08samI0fK9iN+rcKHI7UIFVbY+GNVpVr7d63Wqy26NbZrG4ElmV6B9VPpZcN9Jclcx7f9soEZHGaaHMcpjFr2Y5BTnqhrwH9N+Vi7ZIVDmoxeVMOYjjOtuMXBJxJDGPIoGoksIZFR29rjPNvdBTHsA+YFxmXd8Wd5ndalxl/7WFq8wke/jsv97bS1Y6ND1VLhXyCzXv0Fy5NB06MwfxtTR7ZGkmuwx/tuFrefYIfmMRXiPFw5O+u2PkwN5dY/jNCF74eXHBOwR/dn0MMKXt+UIAHz6ulkvblpfg3EOHB7LVudKO6lx5x46R+cOBv2MEvlUpFbYTUhTOHIRvzobOwe0TWfhGcRE7/HTq49KhT6cj6CgH35oYHZ/MHpzIDu6fGM0d2DU2OjA0ODC9KzswlD2ArftGJ0aHJ91s7sDescHJ8YGdA+P7sx/Bwb27JgtZECQj8J0J+LtjdPfo/uzwcHZ0YM8gvIYGJ3eO99syWnCQxYHqjIHDzfMis7TkTVNj1TuakQSMD332B+Fyhsnh01r96d3G3faD0+hpunGbM/mA7ZlzMrg9PTSuWny4vfkAdxAmXWJhSSC+sWM0tgxBQ+3T3eOGR54EjfXErNcRdF78DjNi8/ObbOJr95klZ6GMRTDokXfDsHG/mJHu9VNjjX/tLUwOhb4N6OiPa2TKbB671Hl9D7A3Lx1j0gC8BSB9TwsAyi8LQ7coGZFYNFVdZjgUQ61tcNmwQAsQBEm32X5wtfP6Z864iQHV8MUu+HkQmlzaJu/lMpRPOa+jJSRc18GA42Ud7s+d1TOdE5T9vYoXds7TZKRerbEaZvR+86c+iECx4zmD1nz7QKEwF7ekBsDVbVy8A33Nci1p0ha6jJjQlZPO4N1EfvPi93frpztvrzVXznKSiQVcrCzXdSkKqW/BrcFTEMb50OwdRHosK+u44BXpiOXnkxmLA149wwYsAhKvNeYrrcjTbiG+APzZneWPuBQv23Q36pk/f6C9Db+tNNefbn5+uXXlOKVEBSEUAAnTzXigYaohNDilKkXJE1YG62VrdZ1FRCJElPucrA5GeOU4gG5++9YCJQj2bga+2HuNX6ourwBajbh8JI30OAFxWObc73ItPA4HaR//pbXyS/Ob76HDzTs/cgoMPDNDWMqcvHmOEeNGmhWN+zAjXdqVYR/p7kPCO3FC4v9z/BPxsmmfWCz3+MP2/Y3OyV9pKZF+A5BF0EJsm8c5r9p4JpHvqPMol2vU2MiRXBD/a1zgJGCUHR06lSQROVlShV7uPGi+eMaOLw9s/yhWP2HkLTKhMe8UhB71fz6gWP+8QcLZ+MvN5omNBIzOU/f8Wh2wkXcHQAaEJntJW8DpdAuaYAozWKG1+vrc5onzrSfrFNUVF9Ht1QuJLgokv/UuWLtdFsUEt/3bYwYF7lfPILLux/ADXE6v0DwxH6tEClwelhbKQm/rk/XWk1VZgsdUSHGQxuGtKIHUgpJWI9AITeMqH1zFZLqnblkCjZbppVxhxaHkcHUxs0ocxk7pfp087puVwD5e3MWyBkbI1elCnkWRdIzL2IJ9R1M8dGp9OkiArRY0XtD4t0Gb1zcMaJ0SHSaQPsyDjTo55gog+8nKlDbftRvBvJkjj1rAGck51e/5O83jP4FY2vzhFxpxlb4Op1arcT3Vgc9VPhPoqHEfCXzGUUmHmOjuKWXMphpG7rw90b7/ls+uxrLxiHdUi0jNBeSXksUk1rK0MyvRsyLzQZ92XtwTFzJH8JhNMpRZC0NKyLLQPJqx5GBZjsN8gvYkFu0Mg9OlYt5qFkWBplgWRoDGcaGxJvVc0pwAXdR0gK4v5TzsywPwSp/Y6CIBdW/RTRMA7bGqUR6o/EwckviaejuwvE52F+x7kg5s7xPoqHqt8RSErVtmN4cr6XpSRzAu2Y1MCm7ZrUYCHS7gslXsEmTT2RPta8+aNy68W6cgB7ieGKNXCwiqt9dKTHnkfK+3VzziB/N9eqWkG2JRmT437z/fvP+GgxOkO3gOljTpAhUvpHxpHm+Cop10IrTinCgOvG9PiPJ0Tq53nuFsqHm4OlNKDMl5DN2mwPB8tXGbYkF0374PM4cfLqqHJ0//5R8AjHwhmAMpg4CqQqXeFcoIZjfShNtdWZXEc7ydmfXAWZg3jadU5uTaZTCNQSC0Vr5vfcOLHRW6j35+Kc8qyu4kdAo0Nsw2n8ec0NBMYVbcnILH2jh4CRR889dvSCArMGauK0iaqqoz71U9rle4qm8JzQosYm2M66aLjMvxRc0fTzcfnacAn/kMnWq2OEoQZymklRnT5OCuJ2mkTvRuAZ2ku4VI1s3C7V8J+UOSK/7LfvqaGa8JgSIt2zy7mqjYOfR4yiJaFUtjoktHwaVJ+tDxYewaSEX51WdXm3d/IYIeU0lMllmNZyHcO3qmAI0oEzXg73VloxVvEEe6r1k2Nt4C2ZdEG3BWhs6x8aybznh0u4VHKlLXDGZIM31lHOV6cr8TcNuMMAPuY0dYY35w1YzZMiNycZS6DpRrsmZQSWxzav73GzVD8rDnUq4By53Yx6Tsa8/ZxptlsBk5jRYV1b1BEa2fLNPMGGUpe2nRc5KzbKvG2DNizBh3Iz9TxmqRzf3rxP/ffAW9iDFhEjrQb1OzQQp7s73Qvnc6ZSlYfN5w+D5E2qbMSpMNfVVO3GdemelkJlIPp0wzScmB7GtEZeu7qxxO2cMcLdaoeVgbD49yBtbW49dMFf9fca5evmWYkM19DN8xTCchJoaL6HPGT5dhHrb2t1mGPFI9dKKLSNgcwtalXaq1V6PaejSlQROVp3rOKErWkaIg1V+qqiWtaLr1i61bUopFNQqfnpb0qY1jRoWwyDf+9S5Jb0lhI4FV/FoiR0WNJWGMVDHH3vvrKtG6HZIs8cKgFoGiONi32EH/rxgn5ZYI4q7sf9w4Lj/dwnGZOq0uRRE+fW8f5qQ/c/jwvsXKkeX5eD6em/X2RUdq3r79c7P7ts3NfrDvyCfzWCp0357s4X3bK+NjQ+GRT5ZjeM17+yaifR8dqUPbwq7xsd0f1uG0iaFdDnwdvrs4+enM4fn441l4zdVr+7aPZQ/A4R0fHcjum8i68KXSZHZsdNdktgTvc/BxXxZPLeCbeGc27+37KPrUPzw0+ak/k3PgK86hSURwobMp+Dt1YGKo5m3btT87Mjw4OpQdHZgfyf7nMIIczGenDuwfGtwxOnBwfCzYC19wD+4amx3Lbh/KOpNZfyd8e7+bHd+THdy9Y2DvzuHBvTtHBgF9Bv4O7xiFY85Mv+IIZIuxXQkTS3K+seOIMrg01qQRZ7zlO4K3oegT8h+1X31LpVuCOpxV0MqeDIm0GjfGcVQLATKfZjUKRsoyQyvo3x8BaArREd0pi3ouSPiMSzutfC/fWKX9ClFyxGom/wqSPQysX5JKWp2TvzZ//8e7jXOt7y9x8HOJiXQ9sxQ5rslMGRhfWmK+8e831iT+drIjNR2Xgomgj4JaACSi4uZksQdsWfR6wNUsBLJprqgbCkCeHKX/yDg72772snXsEfyjMXoABVgu5e20wTkBGqa9iJOPWuyL9sgju/19nS0gNGoZylJFy1y5StNX5OFigmrwjJEnhjoGp/Cqmxp3YEKi2F+70jx7jC07nL/mfEo07WheeSpVNA+MPelUKmp6NNkpNjQ1gL5du7xCSUZNsWsMuJnr7dX2+rHukSypewuL3XhYBgQzrPDm7DATcPJo3DwgNjS2wxFazfvng6OgiIGBuRzRRhFUZzY6q1faNz7n5xRXHtlUp/JTTm9XFW+x8ZS3FnI/lHciLpF7yfTQuIcxokv4ECyaXt69/PXdy8/fvTxtOqovaqKuGoZ/4dJ7kWkONeB+8LofSxkAdI5QqFbj1pzZMXjtDQZWXT/duslpGZhYz+W1gBrhwMR1KfkQfaI5u+z5Xj22UFOZiARW0xDhWY5JQoQRWZKfEUuLkFrNc1kWuencavJP4Qqh21OF5cI3re/W4T6bQix8n7FYSR0IR6heZmC/6c4KQIkx7tNNd0dVV57E+YzdL87s33/fvHyVu0v1UqoG4YIpZN64jcLUuLOptrm0hJLA2nJkGxe2q18zPmwbjJK9pMAkQwzVil2fpUA+MmJ+ftV5caN9c82GhO9qXg4ZFRaf8XF6iTe0SAC01PzdeuftdSYK6KjSrQlBruLCwzLPMQW8feXYHAYkcCmcz0FK61lBydQzLcJUSq56hpJYczs+k8BuyyYnEpoMJPZ16QSzIj163Tz5iFdPCmAh0oQKnQU7dygBo21aYXiscKXIf15coEnKtxJ/3slvYI7CTaQAIBuLS4skSzFcaUQ+kU5yeY1giVUSwLSevKXrF/hOxiyRiDlEO7zwEMsSo0NZfuIzIFC4MkI4cOno9xGeSXITFvlXUagu72AxS4gizXndkAV6JcDSpegddGQ7O7kGUQmgDR6jPiBS6zv5ZMWQjgUZk9qToUnKcpojxkftTpmO6i6uMCWeSEftnvgo7mQrUI6neZGi2irROmAmzVMtU5pqXCkEqxRIkVTcfLLO0Qh3v+r8crF1+gLW9HnEJYSroUSoWVJVOuj6VUmrpNG4xJk6frkIAjTB4l8iVztyjbpMfcAkVRxE/u7NL52f3qrihO8s2Kfy2ppOEmzCEN55fX6kpAE/iPAEARI/iIijkwbP83Ehh+1O2hkoH+BULgCPlhaF8Tx52cLMI+Rzj5yACv26FkzPiNIDIpzUkABLh+S4Zh5jLmS+EmHyFi8KPMJVvirNs1f0qpTrZjM+flsCRFmv4fkUde6WGmssbhEjGQPg8AAIBbNsaG65EIP+9eZYH3Ac3h/XcjKOM9Y4QqnWJ99PjYTbusaCONZYzpix4Hetsci0BBumxqtDuL8hNAyOfDSiPdgRTSyzuXIW8MCI5SQNiOeQinKSR1CRZZSM6woroJsmFjFKIDKHFUDvliOFuhq3OCmSG5LvNyPpvjxMQPnEpLPrvFlvnn/KTI20ZSr+00Bhhpn5Ljya5CXJu0krWFSso/P6ISAauKoWwHQKoUuCgAcGn2CCLnvpof15MV62h/biZxlaEQP5rJElYGZoKcTuwSGwDO7FzwrIY+vrfzO2jzF4bIukyxzhexf9TQ2OlPWRsjmMrWFZGT2int9bqQV6WHuKsJMONPS4my7D78fyZpLVgZcXv4B7vvJu424XJ+7mqIaaWoTUcFClnoYcCitMmKChf0z80go7GWkvxzOkzmZZXZTIJkMJDTIEyGI/vbxHuYvkXvzH53COUBfupZuwKJuQQSrnufANcx6LRLgppU+fQtSu/IxbBCLNHtQgSunoLr2cXrQ0y5W9+jfRuXyWn6SpuvAa9J9RfonqUn1FvjdSBaTkUvpNtaJEWxZoJU80j6vinkW8SHUW5yrLE0ms0lcELktaFbNihMpjQfKPq49yvhZb4tkyKpFNHDtP8jYRQymhYQsLzvpGt9PIhT4bXfUxHO7Z5WofSba4dn1f97fazcbxtX2rza3m2f9su7i7DJa4xXxypYFl5xTxh/9vGGnjVx7cXvjOkuPXaH5AD4tuAWb4/0oP/3//D5+KXEUj9rc/sr4No6zCcfxq67sT716u2V/8IA1LI9OB89hAHf7/6QtmAK3oRnOB9Jrg9a9WYj8YoosCVw5lzSAGFRR8L6a0eRVnso4evg//P3icc5WYPvHlm4C3n332P/7X/wF7kpNN";
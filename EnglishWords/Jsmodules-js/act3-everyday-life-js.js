@@ -1,2 +1,2 @@
 // Obfuscated production version (zlib + base64)
-export const w="eNq0vetvFFuWL/ivhOpD15eqUlVX30f3t56+PXNbmprbmm7NaNS6QpGZ4cwwkREmIsPGHrVk4ADmYWPAHF7mYPM42IBtwHDwA2PpJkf8I47M9Kf5F2a99isyEjh1u6XuU3hHxlo7IvZe67fWXo9//df//t9/5Tf8cMLz27mX+p04qXtB+7fB6TBo/Oo3vwo6Wdiqe7F1zR/vruOl7kre8pLuSnja6641vWb8eSEc9z7fmIJ/dldS+MVg60H/5fWjneeDzTe9ueuDzXWkeDIZ93wvioIOEPM6QfSrf/kNTCKsx93n+akgHfPawMdMKkC+cGPSyGO4wffMnGBKQV535yLzgDmswo+a8acX43oqMI9iZ6e/fw1G4qAzlnjWbHga3WdxkAZjYQNG06AW1NNgwgvyZpDh03ef15NJuBlnq34W4atJYi8LGkH+j//jEC+3ve56WPN+fnEK/h/n2l05iVNaj73PizH8oli8Xcy9KK7uFRf3+stXBucOjg5W8O0wXSQctDr8lvJk2ov9Os0vSOGRvcpZ4t181Z1cmDfjEF4ZfTM1q6Dh/e53v4Npwd/xp5tjOCWaT//ed3Bh8HGtmLtAbymY6gQ1r2Je8tnS7jZ+D3v95DAHWT9wPeHLMX7J4UX0spV53d3mqCV0tHeld+t8aQlNI82KNRSktQTGnSmp1aOvmenwZHASe/CCP53JeRbdjWmZCfFfKM5vA/+jnVmYAox08qTme/YU+EV04rANS/Axft3MT8MOLtbMb8IbS3AMScIi/Xk+hyeGpTrtdfdquDJfLQy23g5+PHO0M4/zDCP1ZJ1fx0mDiQs56x379ThHsvoSPlBYh++qrlQy9HCQnu/GdIn54HC592oHBtNgMog9MxF+tw2/ARdgiB4pTSb9Mfgvrjp1JfJKF2hXdjeAPU8CuC6e4s1YbP6AjLfew5+tTp52zHIPMj+IJkpMg3SiHWSw1mdoHdOfYeYZ1vTsFTxLz6s5q4fNpv2pyPfcORDzMD/lewnw6XgJvnXc1NuwWHEFdjfUxRDugOWOV5MoyXDLfDoDi5im0N2GUfjzNOz6CBZXa8YLuyszHq36z4utGfj58e23vds/9R+v9X6aO754dXB4t1he693ZKq49pwcNWrDEkUsUnvQ6WT5Ok0sasQ97PgvcGZKYtK/w9NQ1a2owjwZKx/sNM0s9m+Lj+f7GJZ4TraSwE/pTZh40hSzpxPm48E/9LPPxm1ujIQ3TaFO2F72UXWTcfdNEmXP+ErLb+7E4/5pWXqsTNJMOc2rE8BjEChVCiU8sQxaTz0u0jdUTAscW7uCdBX6oweXXtNjCqTJ5Ju2TqJcdbN5dhksMVBFtYucFro2RmIrs3Sys3u723j03exrZgdaCV2j2tPVMQYPFd+x8Mz1axbPEil6IZ/jwY6Vh0IpxT/ozYTuBNwb0M9gnKZJN0oCvpWnSgrXcCbOgHtBDdlfDU7Q2lOD4+QWtjRuv+8tn4KmOl2dRCgdx0vaCSR9+BG8zgHtZVvnwsoZZk6yiSzbfEjvNBRdDMuYZHtaH6q46D5SF5nvhJfU8WeC+PHkgUIGIDnh8zd6C8GyXzxavLsAW1B8Nnw5W/JQHSqNjzSGwHguEnVmK+qkqGZeY4VuseZoT0++ENYAuHon6tBbkp7worHc3xkjwqaso7YOJdpLaF2Fh0CY7TVCo4YWfF5oAPVZjD2cAP+id2zraXektXOot7R7f+1h8xN0NFH1QiN5JH3QkfcrUb7H4HU9anjWfgKaDk7bGUa/jRBz+So/a84AX0vEEjvFEWK3ydIon60f7l5G234A5OJNicRygPvLH4zAdi0O1T6dxNIJNqsdx9PNy5H1eGEPYNQbyBgCYtUWLj1d627f6l7cGz37UW3QKiKD055dgdmkWzIB+yborHvNPwyYzMrwDGfFw/4AuquTffanUUs6ayJ7F0Yd7sCR6y5dQfuJqCNqAVZwp8dbK4GqSCizmtaFxgLoE3wPEIa4MdQlWwLQSvTWjCtdmjx8/hKdnPRhkId8vr4BAwDBXtSSr2MqCrGbbXc/Hba79/QcGari8+cX7aTNI4VHUg2poFfF4pB6Tvnh3fcb79AJWX4zvPeyuTzmffO7u4Nl3xTXAOA/0J8+CKE8rP3rZFjFzkce3rRFrQqnaCBWzKdkj9oxKJklpXjSjPABthdge34K2QlDVTpCOwsshXac3D+CVdSwADlik3Te4Ld/kdTE++md3jy/OH+2BpLt4vHSXLQ/AryDHkC1I1DYaHSwDEF36gLAn8E2E1jRoAjJOIlDNpruhfvV/lCcDe2GGFPMM7QN8NW2UUPB94b9TZm4H13qXb8KO6L1ZLc6vFZtXcb9FAYFdz50qS80maIs8aaIGDxvddVJxPk63DjsTkGMS1kOQkiivP98gY3GV5jPFc0JLCL9L/8yL/oPZ/qX1/sb1Yn+PEFg45rXqHR8/XtiIwrxmvZhGOOHDEkTuqd9kI0xdAGUEnFM1izJnwKbd3dOa5/Hsw8HheXrMk3XAnp5hLIgPjJexDJYabUN60ixL/pFUVaqu+d2NtEGDsPzbuP6aLHvY+Px0/ySaV7gAL9zoffcQJA+YnsW1LbCtEMlHaFnI03ZaTVgH/2AeFjQNQPvheahnRk20OsaPTL8ozQJheHc71cx7d24Wm7v0xCFgfs/mzo/cfZzlUZ3MHWDmgwwGQxx2EbPz43CM5Mx2qH+GTgGaVRSVf7Ubse4ngxysTw/Nvmb88zxhgMHmXn//JljjxcfbYPT19+cIUxnKHsFS+Nd0xDSNxTk0T5xAy1ido2bomJ5qWtro5Lloi7NqLubbeG1EjAgjwALUXgpyj3gxXoIdCWKixjYSrvjuy3Ev/HSmSSJpWiQD7LvB5qvB1tNib4nFQgPNWthCE0FwEr5QnqAKU7IBV6ni7reABT4yagfNmMc0Q2UBKj5o/nX8FoJxw0Z9e3RydMjdA4jVMSzxhdbpoj98kfczvVPFrre9Bi+U2cF7hNl14N5pQKOWsdkmseYwxXfolZk5LDRxkoaeQ/xX//Ivf/OrrJEm/zdKSf80yB7H26ZdEyUf2yjfWsmj5vrShr1XaKdXu6psRxAtOzKVtQsIFh5YyNXOqJFOn7KvxzyK7eEp+VbEt6N9K8NelSHHR5XLo+Ts0H4Nx51S4cUo+S6GvQe2x2DIUWFZA5b1/SWbe9jQ1ia2a1qXbN2SnTts49oGbqVtq43JP9++/LpxOWRUfsG4qzTsbKPqzzaovmZNVRlRru3yZgLAe0NbKf2Vt71LN8uGkmWTVNgEqR8l4WSVJVCC/mXTYyTirsTauGLf5DEpd9jG8PlqhDZp3e71Lh0Ozl0FgDkM70sQ2/D4NjRbArDDYFrefYywEFdaCTUKUDQXhlCrhqwaEjJWHQKqBv1pLDICcmmk5YC6EdhK0VE4JiAvD0MZEl0XGMOUQFM1bNFw4AtAYBiflEDJCDjiQgClhIcUMOheeAkR0XzVv/SopNkrVW6FoiVS0wSZcX98dw2UX1mnWmov88H6+ldy6/0377dehr/z60kUJX/3q7+BFwxwLu+w1h7xmzicjsMvXAcacUjvdsQPWlkYNWOQKH/5hz/8za9O1v0JmNnUr/7fv4F3FLTxf/HG5MQJ6776CfjxiT8CWzweCzphMAl7x9cmKHxMGUHZz7727ht4LS8dX2B/aa2YWzdewCZ8FX+yAXed9G3vvmaAH06RtolqWvAPPLNyCGm9FkYgn+ApJsgOAKnUzjM0nycDUXTuDyL+BfyAQWHcXUs93OogaBtKovz8AuThy5qnL9JPj/b3B28f966cBwlzvLpfHJ7nkf6971AEdpBRqBjxw2Y571Q0FEdPFt9Swxs5VdYCanK4AGkKylc4zJeXdSv2a7DR2gkepU2KvdSq5wiSptmQ/rwwAwgYnnWX4OLH1d7b28XCPi2rKYS88tGABMj6pKlVYDsEococENEBD9aCNA77pvu6u1qzOcSi/4XHefLAZSiOHE78ssKmjyd1PqhAnIqfd+p6wCP/JsglXCb0TkB3fV46hd62upeDFBXQ8ZI0L0qsy2uD1avFte+PL14sZu+iy+nOluzeunlAVKACvpKmz5jYR+FCp4uEv9DBmsFXaoDUkWe2Z9HdGJdlKyznt/svrqCqS2LP4sYPCeTa8EyhP+n6cSdFMBq9r3zRrt+WHdK20xYfhJy2ndBySRPEwI80mQYs1PU4AQ1+DosdKyQHYoEqYpSlzij0Y8CMgzohelymYLChjFaPAWYGH4LcJMw2Jv5n2tcPi2vXi1cXCG770YSZPZN9DGurTZQs8n4MC8tvo/bII7zWYDGvFsG4eFvxb8Sg8A2Odj4WT9Z7dxboMwCowu1gOIqzs/sOvjVYCHiqPAMWFXyXIPstKPR2EBE6wINu3koInPM6vUfULp8Xa6ivUUKgpSeK5uVSceYeKC/4NwlOvF2tszQAqm0g4OoecrhZEwGbxh8jhxssONRp5JBDQvLFNPeX+Ng3yZmzluoJ4H+XHw42n5CjIcrHgtRHDmoqzD4MEGuz+m94WdKm1ZiCod+mL6lGYJ+jNxPgHBo1pzzUu+JQWXzW23jau/UY5MbR/kt2qJyM/CklO7Jf61gHFFegjT2XLa3IIB+DPRfgaKxGNUf0UrXx6I68mwRRieXxg0fFk++LuVckQMOskyeexVr2WT0L09Qn6JCBjOSDVAA5zSwwF4JcruDqP82gB1U+4mN0Gx/fXSfkc6333SGbiCBKXfGoFy9ASmJJNq5iQ18MMNmnF+OWOxAl1Id7veU99vzJeZZNXJBx7gsspvVpHWdlMTwgLD56a7hArRMtMqTRy/EJhMfPL/i51LHW0c4VPIU4s3X04bo+3GKXsHks63gLhaKZh1qeLBTtWcAjt8FMrmRPp8D4NcsTKJbX+guvRFTak+AXKi8E+KJA6GhPD+6NmKBUwicARibol00OV/pLfD30vnvLl+AfOvhE3vckGDpR9Gvt6GmYb6H9PKyoNdeInUxljjYjkZs2F8vfHoLBcTrw2tZjke9CxgHogZzm4JoYvx650vmpdEzN8fOr/f1r+Ew6mkZup0fCSBp1/MpxMpptIo+l4mdkWD1TiSNuBMUKr4ZeiZUyPoOxwFNfix6/jiNxbgltsFCa4uvRnwh39g/LvVtz/HkQI8CNeKf+OLLH0Gul2bT5y7BTUrNSz9DkLY1OMTqBujlfHLzmneZS548CIr+GJiPSxaAeEA5/T69fxoFyAsj6nykcooNCd0r7ePirkFw8fnTn+PamHPUtX2K5qGjI0/yDPhG3uepPYo/j4lYrQbMldr/73e/g1TU0S2AGQ8XWrjr1d5kqtQMrGDFmhUhB44cvqpfoyBRc5eGnMycdWfLhXvFhVksRDJwIOGYNH9OWI+xtNMx9s/6G+Trs4KFQfGhu+JDLa+RI9VyGIve7z5J25FtKbSalAUerkYPi89IUbFz0Rdpq7fjpRjE/Vyye02qtVY8Bd9AzGa0mkR9AU7E04SCKJ+8ki9HnxVOoXvCjKS6Dd+9hqdjRIIadhFql4ST6JDMWFB4dD1LMC2OUNODrHXPl7wnagfilV4jefzxvQsFB/i6cDX6/4vAcvFEALP2FdRAhveX7xQ4ePcX5mJEgwUTSUoYbwhBQmoiSZFq4AVt1Pd4JOimY9XyhYgawJ6fUqbjNvXf3Hp+H4zFMjK5lmYJ81CwNJikGJmXHDVnqetRasfAy2OnVXQ3RPMX/iiRgbyfvmcGZy/B/vXPb6PCkPUP2sCaoVzCYnlN6uwZyXXbpiEloxyqwEhMhRrQGK/fzkgrL2toFlDo4vA+DRzsLas9WTOIXAIF/GwhQ3rp/DgRA3PhlFAAb7etAQD9+w29FifgHG3bAbjID6y6cZBjUqgdWrCUFodJ/7AjL/vIV+D8dW3kySSL10FZoJapLw7P7nMCqZzFDXjYPTZkFk0W2+lgk9S0vSPpVN8gv8oF8yf0xwvNR8nJUuzXK7gX236BfQYFQy/LXNn/ZqaBNfRJebFSrm6tse2NWkyXvGvCWN90xdf88K9c1cW0LlC1PgyyUZatNWseerbYuXYOyZEfaBqRjOlbYa/h81RaTtpBcW8wxiFwr6FvNky/ZJtpk/TZroCSAStZHGfgzkCwD/m/B3l8B3kz4l4PfLyPfdgn3VoFRHRNFiJSpfgWRymQtVKjfgA0KbTA4BDurEGCnEvfZ+EvjriF858AtC2iVQY8NdhwwxZ/aQRJfgQ8l0GAhFRcmjAYII3RzSSlXw4F/t2VfoeZY5XyjwqnWNnIaAZvqn72/wIv/9StnEl/8pT6Z+Bo9OZ/44s/0KcUfRp1SoCg4cQKfqHRU8QfrqALeV6wAUWoFzcl4HYEM4UEJmqOj+fWWuPfRe6eQ4W6ND+iPDm6BHgQZDMiQjzFgzbdQFicNBw1SrCjxoWWg4zPVqHCP+chyhrxo+c/ziF081LiZGyAKHIHd8bmDo925o/3ZUnSomQMvk4k8SUHyT4JWN0DQn0hYz/O4BQX3xjwOeXFAYG95frD6GBS0iXAGEz3HexsO/uNHNTzVY9r8Smzc4FfFqPRUhp3YUzFCO9hedX1y2n2N3km/qV4lIMgWOZPpVJyObBIElXbs4+b20YcnvbnF49kV+yyqDZTgwayoR485prij64zviB99OsUs/rzksjJmN3DqzT9kTtryRoePYiaqu97dqKcB6ZcSdA/rIVwZD9RqsWPSV8BuQSdkw/5m/bMfjpf29QcLspApl78YheSFeC7slfnriD192Z4D+mcWOx7jG3sS/EXDT/fbFM50c7D3gieDXvataxzVRt9PT0mAdA3H8lOZhPyHCB6bIRiLk3RgDaJx3KPYWUCOLfoPPuj6T/2VpeLpAfwf/BlFwRSYxamP8E6RZr+PRZwHqqlrmuwAKtOCTZyTDC3vKjDoEdVlSWljSajnVHlX9R/dtrdUFoCo43Ci8jdqpOgkD/225zInXyNd6662PYu/XNRc6cwrwb2g+RaLC/21eULcHYwYtrnLeWQrAgmUY4SoSK7Mj4MJAeNBPkE+hDQZDzDBx5vBZcl5PpLOdyPPyI0AQIa05rmD3qXZo4OV4tUBHe3B907Z72iyd1Q20xBzK7VpBHfah+tTHqACOm8mQ9pNcjra2RvMXi0u34cplPOc7PnIC8DIOW1HB41kQrtf+Rpq8TZvSEpxnGAfLAY0tyU67dOZ2lB24+Hdo53nxc6mTm1kaj6+CDujkQ7h9CzUWzCsI37oEjsCPsJBzn8NfRGfsNG3m4GjEGkBh/WEh40+lLgGsWMsTchRDmjSkArE+1GjZ3mtrADp3MrlKV4Rl2MFK+0H0axcJ4jF0j149jPQDUGDz2gp0k1jMDmCBkQFO8dXS6e7Ns0s6T/qLPpo597RwTKe1FnH0ScBgARtTPRoOF6PURzZ+/FFfqVTD8XU8XSUubIFO6Qq1DjjWEtZoBz6dDPHGJVpRw7t/Xj86DsthwhBKRpoZ7WHk5j0dcfHY19QzHl9vmwgUzJcHwEvWZbDnIz3rIGxc76zWBoIcGmM6ZJrG/fWBIUOWk6z4tqV3vKVo70npcWCqQDpmOFkxW5nSdPmZ0dt60sWW2aIIdIUc/fiFHMFlr0HHwcH+yZ0e5hp9lvYbuFY2AGKTnguvojuXjPAsDMnpBch6Fp+ymSJbj7pr25y0G6QgpSlr+Rkh3oOGz6UAkEv9El3x6hBa0SZFPXK0eEDIIuPiK5cRbcq+XtIHpZDaUFntkUmAtjqKNFMa530ghxOTXPcPZ+67ezBsgcVgSc7+0+La1tDid+yHkFA6kjrdinnWy3H4WxvmlT1TErczbmVw7cc3dmK/WZV2iANl5MGERu1ZkpJg4N398pJg+X9BjQjQCEltvjKAzBJIwxksxmX+aEvk/OLF6Y0z6Ody/0D8kMxccNaYv4wZi3zWK5wEqEM4fnSP6tEfszcxcN27aRYvN1fvHB85qZ4PzK6Ax+ogylgSq1KaKNNNWLfVNhdrenIjP7dA47JwLguTUo8E89AfmSBVovOfklmMFQgI58KghInAh5wweelWO8khAKXn0u0PdAUv0ppO3E0TJmpDpNx+Rkumj6DfZe+WrwZvOEgbaLvRQs7DJGeiQHEMYajuA3AMuja+LxE0359a3B4v/h4u7j2PaNUTcQVbgLd07DBl0uQHgwaPc6OwZfjLn7vbTxFTi5yr2AGSy8OKJtIRQLmp5JJwA+BjgTkdKs6Sp0mFYHg2Kvjpbu9xR+KuRfsCUAZr/Z5VbJhlqQpHR61yXeT0p/kTgk4PkZlGlICE/LjAONyluFgaws49y9vVacYujPRwatcRqCtAimcDNPtUC7HFZdFCa7nKoqVUIaVgFps3isuUGbLmXs6ARXDWpmmEQwqBVXHoJlJScAZ4w13QsZrrqYhvgZQY+5hC88DwMer1w7+KM1lZAqHRpXDDpbRLo5hv4bjTyn7Mso+DNenYDsSHF+F5TzQpnyFIT/sNSg5C2w3QaXlPmyx6xOLGNGXuPHxsOJwkd34ZWsYJqit1RFWsFARA5iofNlYrTBSLStRm4ZlY3SEOWiLWrbD8s4oO6xke5XMP9fcGjJ0vs3M+ZKJM2TcDJsato3h2jLiy3XRvSKrUb0ma+N6G8yj83UEhNeHtVXwfRSCHoGeS0C2CrxamNkGy/jrL4JVDlYzENKBjwo7fg03jgCL34rLvgmUlcBYCRNpGOSArjLyKYEeCkcq4Z1qsDOEULREsHCCWYRDSKECJtjqu1JlG2Qg+lohg2FNTfqSD3TKKtQMObrTVpZDOnqEZqxWiCP0YEn7Deu94ZOK5L/ggcFJ/09fOaf4wu/0KcWXackZxRd+pE8ofj/qhCJpnDiBz1E6n/i9fT6RUsrlb/3JIK1nJOgJT6V+lNfDlBPmyOgE4VdnkIyLkeTg5ZXi2tlicb53+amY1hO5FzfDzAIKLm2GCLibO1l3o8mxymt1Pte1gtQvXMUcTjtI3abMR93tvBlxFHz2WzwIj4KazyVG+HoMAgN+wI+D19Xln19QMbKXVG3nDGK0Bsl32F4UyksL4/V5WBu973eL5Vcg7HsPFzmiC6v/TBFSi6cSUFRRpxNkllGPechkA8M/67626GUYVmNE2j/EWGMpjobsYR5u8nPvwdOjnSu4PDcv6eRnyXMeYp00fMbBKUW1w59jFOrEfwL+DTHiAXPRJO1g89XgEeLeMbBxJsLU6wRN/QxhVKfsSaIoD4BjESrzMXmF8L3gldExXzjhsR+iN/e+ACXx/Hbv5R75d2HnZbCXhQkHz69jLlPYoJD5ToZWUoDhG7xpUMYBVq5jbluHMtpeDQ4f9hbwxUcgE3Oi1ckn3HNiNCl855Q4sslSepTAcE16sLmJmfaKujo2tulTtamgkyV1eg9cYAoEAaqxDkX2gBLnLdEh46WGGwNPPQcHPxZnlgcfd48frKiKUWkwmXhRpOaeYsg7Jakq+kkn9zkFD8zUX0IeKZWod6jgQh3Jhyq/kkcoDbYBg2GkA3lgBZ5mbxIVfmhxVM/R4Wpv5/zg8A7lWYIi4C9J6WS4u+tBJ5nA1GI8zqAsWDMU2UzQFX6Sq1t9OoNAuVFi1nv5cfD2fe/yh97ld5olAN0mCNO2wxSDcSa7Gw3DspEHos15ADUIgukZpi5FPkhYrRaze0C7OINuhE4N7gOZWdO0EzDBMixTgXGgml7S9nmU3xwPWk9U4sKPornEPuBdhwsmjMZoF8f5GEcBZJjLURrrvpzRonY1xPP/XbLVNm6jtH1/off+PVuNPgnG06GGEY2A8jstWjKI07c57DLVrMRh79rx6p7mgBnJic0hQJvez5SaxRMTP2WIxmr1JW/ci3vHs7PsQ8HMh2YS2R5rpmCZi5V0bH1A9Bx9YJOFLxaHTbQ3jBNO0QXQF5LqwWxOxN10Lnpwq393XwoEhKXpuaTKsxwiZ0+TyLq5VYY6wroQ86qUlMbvkum/m1yTQ6zhN7dB/IuEnob1rSQ0rJYEQzD8GqhQ+BZEkVcRjI+rYaZMn2k9Ja3SpIz/T/clz3+veP/0+P7FwTOMwwL1iCaCbLVIpQrD8gIYjbnQeK4SB5OB2JfopLSG2MDsbvNGgH8qH9da7+0+/LdY3KIkYfg1sThZV0n1aL4KMRHmKOn5Heuga1uE2/RZhGv6tgjXHACShRG/Cb8ZcWVSPi3G5HLcsN9v9K6eZV8WrPNmrGJ+4mQsiKiQgEUjgdHuOg6zNIhMaYiY6mo5tLE0xNI7zQFItiYcJhnCoATNpDCvAdjiNB8aDfI2fl1AZ/QC4s+LE+RTnaZkNVUf9OaZ3sp7zFajyqAZeUQy2hoNzSPpBK0ID+McHlgniEcND4y1JHlWJyYg31DYFfO3jj4A0Lvee/uR18p0NObySMIU8EzepjO/oAX6TEUPIIykYXpfsVRYWW+iMw4UGixHFD2rZOb0Vj4MVteKC3eLVcQmdBuyiSIp7UJLMsRDQzp+MnwaeQeWTITVRCPDhnytEifgMBpsve8vbWtGDI3DaGLCd/nBG+uATqjlJK08+ZP+cid+//Bo/7E6XAqtCVvvJcHwqIoXw9PlVf7t78XhQjs1EzwRYUwhxYo0kpr9N1qRMQhXVf6SzLb+kw/F+r3eT3NstmE5pUbAgiCKTPK8wlmamIZa1pjepDYD3qQ2A71JNQOaOx/jdSJMHmiQ7ZqST5Gu4YUglyt8QcJlMQSQ8+6KzZ+K+z8UOz9SlGzSYr2LdSBUbQWskdLG2MAhLlkiqZOaPD3MBmVmnUKXIZXGPLwAHAbv3hdXaCcEIebJtsuMgihJqSBsYkU7qzHaB8pQxSJb3Zd8WvLmJMUMgIi+SSK69+BcMfdTb+FZf3O1t/DUIkFYz8TwGo+TZqZcThEK1ibiQ7KA2PJHE3tt2mUG4Oho557mpJ1QJVY6uBOLGaRjMSd3qMGhcE/G87sm5BPw/PEZDI/O1D2wdkHQ52wctME8F5MO0YBf43qRQUijMSc3+BPy8kCvkcFmcQG1hoaa4gIClyw1w6TKdUzWo7FQkQVKSdc21TYp/MO2RIdMz5Kpaey8GIusgojVtt3x6iHYdvgoJWvOmF7a3ELJDwp8Dw/yYOGTtfVgpf9it3frjTHj5G42hmwDyLZ7lMVjWzqWFYLz/6X2h2N7KIys/rcE9RW8d0wJvR8V6GYnGhlDk3CNdW93pUZbkp5CALaDreHD5egiIu5RfSZoS5KNhrca2FqQ9hfhWRt1liDnaIRoA04LDxrwZuG1L6JAHc6sPGj+TADmCgl3rBXEsdDFsyscC+0gIfTlC4rRwKUaCdkIxQENFlawQYiCHw4ksNWz1siOWtMKzdW5Q/cxv8o7bS1oKSLrn7Yq0krIVT7DKmdI1/AutnQN7GCta0rS35LCJcnrSFwta10RWxJ9jsizBJ0WcRWiTTyVf+VltTT4v7wINGja+seyg3L4svZLVt4p7sjha9oL+de/H+GF/KsTJ/CmyRMn+K6JE/BT7YDEg348FYuxthF9ssj+69OZDnw+3Pht0vHnBqtPiw9PySfhicfRdqM3qGK0LgFmkbWuqXJg8LfUS7Cyb7Bawu4pTAvILM6ShnPvu2Jhv3jyWs+C8nE6dKxVmkwYhH47o4gYn30w0/J32wszRkzAh8oqES7jtJ/uCrsrFvYHhxd7d671z+4W7zdlm1CGDZoMka/NcZ/ZSKgNrJZp9TdgyQaTxsYCn17Qypm9AUQxFvg+yu52kjLIprpm9A75e1gHf0nkN0EHqD85M1VH+BeLz0xWWci6FoP9FTSlijdJiSIO+2JDmWGCJhgAL0eNKx0pSbfxpPfw6eDVOY4apcLuLpuGDyC+PhHU2SwN4Sty4XV3PFAXVIIpVzBpqBpSmFz65DVsLi4jRYoZ7CSYaDCma+XYRFWpaXfIoi7mN+f1MXkAKdIzoeYpDqYGBX5DzBvUx9h4duNlwTgORXyUnXffRKqWs4op7324dnzmto4mx08aTPowdzuWoRXBnmyw1yBhg7E0QuWu0B3YXet+iEyVuMHls/39C/1bT7lWXBaFdJ9m45xVplTykr65LlCjjyvNmD6xVCeCfGTJJ4L6yBK+s1Yq/hiR+Z+hi7YSorfMdyhnYcAhExjNDD9J2lRA19TQD1RMBfxAEvf4Ol1GiMOpexxZQcKE6qXtkrpYfgjC4/jex8GlV7Cri70fVcwHhVV4rWaepHjk3VRbMKgTOo4Caw6JjOK2sXhLuEB3L4zo2FvVM+6vXem9O1MsXOBKxopmiZddMzdAeZiV6+WiPFYXjMAiWQXaMD+phRVKqsMXVrlcUm3KcUVyRXMAmZJ21/nfKOIxiqK7dpJFfG95vjgv8sShgWgbMDGZ49M5WfuiIsPIl0YPXKSuSYiPTpxJb5zfRmn6/v3gxl0VlTntT/mGMu6BZj5mpOh4QGliFOqGsdz4Rn+Ex1xWUtO5v3QiBQpcnf6QWRvnchJF5WtSlaFZPnvqrjZYHvExEKJPOguyTqEGHz+CfOrvz/U4vUIfR4HqacDyl04UFAmjJoF/hxgIY3GXgGqbTXHmnqaLJbUaLs2gzqkAKXauUe4wP5W6mDE2uahJrmYH3Rh03j0727tNsg4WUUDiYiJJJQgBMGgW0PGBudlHHx2ORi7N9fy0xuIbPzIWj5KkVc88cTFruiCMAePUzVmY9RcDXoBgp9RpGKDeYu6iOQ3r5HX9Uf2wicYQ9TdKuc5pd0OGqG5rKih6NZ92/H/IAGnvLbL/DzhIivGEnDDVxaDOxAMczuQNAiIgfjK/iUVUZQDUyAxnGHIrnk83cwo0WtrCHMOL14pLl0mYINI5HYhGEfqGrKGH2SucYkyG/6vrQIPdn+6toMtSNuT0v0g3N2MxZ19Oo6wnBRd+uk/q887W4PVqMf8KYBJouf7+XfIPALZIUkyGVrURE9olWLscCRMiIrhMJ4zk44jF6N04xYAAXihnKloYuHfuPGbD7d0/2pnVeJhCt2g/lJmi+4dDiYzXx+fwIWCKNhktDzSj0AIjyK88S99/11vaRcxPgB+FI6XCt0OPC0HbTib0mDdym0sS1rBiFRgDyWQiZUywydMwn2t3bD5Bk5KDh1lIgBbVeY18XjYBAhANpuxLJm6LQzrFSpTorde32FbUAVy4l6bxdJI/VYxRW3ROCUj5NBklOAI6SAqq6apwkrM6rivOsddk7sZgc3WwerV36Zm6ucSigREs+JCcxo5nNp0oz8TxTzVwVyPyIEzzIsM3tIAALaDmGEguBstfJ3NpWpzKJbqBcrcQz3hU3kdK1WL+1se53g/L/f2bKovLIajdWwk7I6ROnRplvza8+5xTkEzdHQw1keMW8X5d2ObjliAnXdjiqYMUyf69OKl7HT4ouDgbGKvV6/461jCFzyu02d2jOrarE5JPxImox3ef9BZuYCaRwZtYbxbgpuqLJgUeQmKiiJvCD2FGIMaMN+UcWlXF14zxq88+46r4zNcq/oBUFHf1eBGW603tGhypH/nd1xgppWtv/MzFblozTu2N4uJe7+pFXXuDXhxXtzWVNyhuiWpfc2kM+ps+DzOxA5k0Fx3NxBysgCbNY1QZDmPE2v82tqk2RssmqG0bOoYh2TwwNW0QWval9hZpu8w10lY5NpU8Qtosc+2x1LWQRhhH2iKyTC3HEEpVyzpQ4hEPjHO1fNc40WaJa45YJoH1T5VBg6KezMsnRzuX2ZdknFcKciuMbeNqjahLSNqgZAsva1irMa0DaOFJawgXleNZQCepe0CEMww6j2fPUUaygzeVuLQBpY3mNJSzQJwF3b6KrhxMpbGOBXpsoKMgjg1ufgn4sJEHgXzCBdobrxBBlQesrOctNWv901azRpGXNKulNMvKzdFpWpu5isx8E9E4tp7RGsZRLpacR2cnbH05qKO1PcOxnr1bb5UkGhLhtty2ZbWW0JZsVq8HzxRsmWjLQi0Bbdk37Fz845edi38c7Vz84xeci38c7Vz8z6Oci38cci7+Z8u5SI2PuOQYoExOWQbj1uehVv1vKWpJ/YZ/AFtwkhOb6UdNkPL5Pyn8wCtwr0ZFcTC7d8YzUWtSqUGqtAGwmHuFzZy2lnqz+xLKdm6by7Vxl6UY+2xQGjS6tQC5ZPgWpfbeyLn/BjDOF+f9myQO8tq3THnUPEfPEAFSdXdYPpvE/HrVmlXmTlZjm3NndIU4Wn/jQWzS9ejXJOY5qzygUtiqqRMu0vm8Qd5ZxDtYUVfnN3OJovUGmp3TTl8nlf385B66bu99KG7McvYzPC0GK994ya2eOOOPuz1NYT8bSfWTF6Di0IJOWNMZgKwWMWPL6UXrPLbfwFs1wvriA/v8wFJbIaJkFTy9GvfoyWP0k9i1zM+dha+Gz/Tk3uCtaW34telbVc6lmRxYKwjCJxNaECBP4Vt2V7mkTJBHkTed/Fdp5sghb+sTEsEXoL4hc9CupnF8f6148qx//0Ix+7H/YBbjWN2yGlkT3g9oHy+THk5x6KelOrzOtGCID0LtyZFbYzKJIr7qcaXer01U1+utnCiX7bVq9lZOFUssch3rtg8fPEvq6JDLEpyST/UN/ajO1g6eJFF0QZ1yX+gHWCIQlwxp+puSI2bKg+vyKz+j6f//fbgaoxsO3UVUSfPxDxj1RMXCOWOpf/U5/Kj/3U/FwU1ytYzBrMMJLw5aU5ROK4ZRWjlXXUIMy32rtMs4GDFxnxAR/EydSufURHmDcoRv4Eteo3AGXVabA293TTsT+LYYUkEPTg+oHqy48A5M+v6z+cHhXS5Yhs/56jUmyT14Onj3Hp4cHrXqIQETT0gFVg97F8lSwndMLX0ITYayS9lv1cblwiXhQahM5p0avBEubCHiEVMbFnGymBiyQNUVtut0fEc4QDrGkqxH2TL3CuTJ8cWrxZ23x+svj/YXegtP+/ffornKBTphNcEm/zUgGth1aPzx2UurGWK8AaaqdhIt+8tzn8yTinmj45fcZc7MccV3lG8PUOTJqumbWS++PNrZKK49tmf9bfMFtRNIAFg9Tya4HyX1udUFO5QzHTMBpQWusl7HVdu1dWp4LTX4Z5/CRsSmR1T3IGPulK7ViOBful6HTq4Fbecy10lZ0gHP5a+7mlAFbare1V0xebn9s7voTjo8N5hdlDx3Ssf1yjMRF6afeX6M38nHaEFTXY1Le0l7GkqW1r+BqUyr7CrqJoWJPd3tDvm3JD09kjMEVGWUB/N6FQRV8eQtV+yFZYbnkXOH5ItOuMsLGDDAojVBPHz8clittXqeCeqEuBl+eaZYkFb9zJps0CjPUE6L2KDkucLi0rME+6w4PBg114A1FLKhDIHtDMtTYSwrV9fjKh6tKMD/Ra80N35GgdThgKMkRd2TkyYF0TuOvops6Id88gjfPvbS7po0a6Iz0eOdh0d7V/sPt7nIbRBjy6sAS/Bw9YYUQ1+mpN8z17qaTq2O1F+fcsB5NNKjesR0Vb+qoSnqVtWluXJvat2S+kvTVj78tEl5lHkSYcgTYEbOPAjSOoxjo8htukAmL1aZb2OzSj5vXEMX7BmyEbcu9J/dwRTq5Te97e+O9imyz6/RpxR3PGpL8nAF2EqpxD5g7qZlpWKfqSuxNQPD3q6hRXPgCWjo84U52J3bJ2E/TOAXwzIYdGIZBv9EZ601c8WX4D4Ss/Be/yTVMMHEyjiHGN1GGKiPxzeStY71MS88PD53ADK/2LiNRzaUvo5WC1iKGADdQaHpTde8qSQ+KeJezwIo/720bbN4I0j8k4rgFJHFzfuknjdoncNzxfIasGdlg8qkgk/SQYeydNwKG4hexxBOn1IVJWHtcWUtMgQXrg421/rLDynIBZvC8s4FBDRB3ZUEWWA8Uk1OfhPOxeuuKyThz5hrUdLgYuGCH1h0APRVHPvnfjze2x/JEVCXVu7M87fkhKP48Qb8qG6dXXKwB0DEaQ4EolgIEFkIC/daJvt79sbxo5XjjbP9pz/QwXagcnUa+P6od4I/ZqIMTsNUfM9mwv4p+GA+y07nQhVX/Hx4/DRVYt+fe320Q/1NAdTiY5cmo49RY1ih+bhvF2FE/Eshp4QQTC1G0CckQ1SjVz6rInOfMBqq3EtXjnavFJfXe9fegu1/9IFqU4Xw5kmOoFOMLIGwqaKB26bKsV2LRfPmKsfDlalGVaWyS1JZ7JyaVCAYYrDYo4TwGqYG8yly1N1oUls3q8ckyAo8N2rrTpDF3EWQF7wvsInFNGlI3WWLD23CFLuYDDPJku5reOVU3gw0ZMjs0CgNMadutUVQAo/fqULxy2JjsdhYx5zuW3T+1QClQet4mHGChYWp6zw8dp0fCSuUkws+bOuIWrD/Mk6JiQlfYwEW3C4f1o9nZ4/vvDvaeavdWZ0gGOO+rRhrrU/fFacQH+t/pTWLHLrb6BblA7gqLgrgWpxEwmg2glorqzKMcGF8yXvx7+K2+GX2+ldNdatOdbWdPmyef90wV5l7o61xbfBW2rglexbvHWlmV5qtXzBYOeiopQPkKqw3MkgR9Y2y0lS4CVg0WMAClH7YGLZplK+WRNTXbRj05YLM+jMMmCq7pcpgwXe90GbQG3tKypDbGxjiSffBytHBtf6ldxX2SiX6/iLo/hrUrgTYI6D1L8HTX4PR/xbYuYQCMUyXsaaFAM3gEPwrob4v4r0SrKrCVKp6M6ZdK2DHxZuP9hYYyFFVBAtGyZqBz9nObQgV5+qoWkEaDlxkPFMBZv5N8cRXUYyrtwUxOMr6fwIpDOEDUZ+pKLRUq8zqFs1fUouKBp4CgZaocaH7b9SGSkENn178pZe14dv9A6jkdnu4dsPwZX16UXmnnF4MX9OnF/9p1OnFX544QTeFJ07QXfUT/8k+vYgRw1KBJawCBuYJiqqcsuqp5VwahNx7dhr7PsBl7GK0jbkcZC1gHBaGzJMNiUWlu9s1kJ5NaxQsI+kzMDh/2Huwis6PG1cHFy4Pzm3zn2DmceeBJnXWRXXSTn38XshH9/OrnCrmleR127HoY0i8ZJSOJ9J1ibJPxCb4pllTU2Sct3TtU8bxqGcYvMXuCcWrC2wuVz+J6z38NYZ8geRMar/22sEMqSocCzDsEEyf9q9BatdpmKbM56EhTko6VVPHHsYCWGzp6cFg6y329dp/KQYzzYILrE+DSJlW3hq7h42aRLmFjZkHN6qV0sR26xpmOtS0xmIrXy5soqTH2ACUCNSBiJ3t1iWsu0J6ylylxDWMQkZ1Nc7+NN2jaHARXVWDZ2cAB+seRUETa41ghqrCw+mv1WlSeRZ07BuYdkjVUwlkKtyCuvumqYpnYSSlzEaHdgy2LhTnX/fmMIaS58QxHkPTAtBsNVFiEQzzkTMJ8p+NBzgrrA1HV6YRtMEfpFW6L+tcVZ/PaxrqBXGDgJiqBNDO2sf+gPCO0HF87yPJQiwKlEdYcZ8LQSZeOwTwYpcYsaditbdk/zy8FpwUbC+cUpCmeT2RGOExDk6mUiAawcw+wqjkg4NiHkMMMnGkV8yDYSO+ewpozeFr/BpdVgD+OUxWriTtiLIcWVnV5QXg9iX3JoHIl9yTEr8NFVL4dIYKTM1f6q/t91bIAbu40FueBYiDfpQfNouFK5RqQTkWU+x+zrhHN68eZzpeiBAzYziXgewhvxbNC3E8/whuzvFXX50oV+RfiStn2LuzdXz2MXUMtycFdqQlSiQQCqu9sq2nABAfmdoNA/lXXKFYMBGC8Gw0KPK4nBjYcRLbxna1hZN6d24Wm7vFxzk2sFV52NgPGDyB3JvI9KGm5aTjHNZ/ax9dmbF1HKmaoeDGJveNVF/EIiaczsFnweUuh+r3EovL1Z24V7l7GGzJp7ld7l4ux79KRPEJcAckrm5n7omIChyunl8nBxO/nvKEsBMrqGY5yy1NyXpDehomccNhbV4O2GoAdhMSjwkK6QbnhKlh+DH6/QN9RQqwCnejO3GtdNiDiF5MSo+4DPMQxbl4tVheOz53oKei5SLm2vnVc1EqoWo2bSuF9SvzMZ9neEr6Cw3NyigRnXjN/ZjHpFFy3gkzK32aLuLmZyNMrnIGNuXs8I7fo6idhWeYEHT5sHg9q7CuGBtUNYBudnO+Gx5I6O6Gj+XiwbxCn5LLPMb65mgSBvQT+kWk9ClPAyuWqhQ0EwVNUU+YEY4VnCgLjUOgSxND8ZZRHLTEaXAqDma1xoHVu9rHOjqRSUkY6mJNsZFUHO/zosjHqh7WvY1HRzt7vY0neJho9bCe9rGMWoeWTd3tYu1OSet4mRBuZx3U5teq5kEHyibmYEjVU+dfa1qvXnMEgq323fnZTRPDoIE1Pu2mKVlCYySZA0SOqrhsQkH53TfoxD4zhdqVW4fqHf7sRu/ybvFhq3dlUW/yFubW4/JtxDlY2iBvAjsuAz1RVNUoSeH1aPdqww8zumBPxufJ8Bcj/xNsJcq/GJ6WlLuG1fPkXvHkuT011g2IJ70E2ztWTVCrCOlVjHsv+y063rFaIRVuaVMujvyJwY8/04barXHQjk6zmx/M3YBXMXh2iTPt8KTSD6aIJdZpzsnxrrLuLIaS3Pcn4aZy+v40kp0IlBJLFYRV5oos1RG8nGqgRzhEz107QNMLk3n1KUOn7mPh1Ek/qou841ZnVFkOtsqMh246dpSgp2hnY7C1wY6S6YhvplMGwZ1R6LOXoBOquiouY7MWLJaBZGdTCdmE+4KR24ztp4ZYIwIMNrdpFeIssAk4mCTsdh8xDfPRIwDFtGlr7C81p69RAL+jXP2JNjqhGnxV6mjsjWsj7c2Eh/6L7l5Hy7PXs8W5d/2Vt71LN4v7Hwdbt6jUJgfHs2nknreWpqFEh54DDuAsqjkPiQmLvWMRODOwuoTPgJxvW6dbSSNESBf7E3SqJdbIOnbvIzN1hapOE0rDhclWav/RQ7SNri0Xr65hygwf4Z6EtYae4DrZ9F4WepkW4cwWYK3LMqB8tX8bdghYwxFe/Erb3ldeiCGLHhV+zgVhcjLIVhUKC7liwODtu96ds4C8jh/8MMocF3vHMn9H2bzKLatNXljR/acPXAu70sistislg9TFJmgrrb7TaKTCaqwy0EbYZd9ukI0yxGyDh4rUfZPRVWnCOMbLkIe2IwFTf6aDtgT2q3B0qqD7UOtyGf/E1TqxSS7Dsze0uHrLe4NLWwCCAD2XcXMFSq1Cp9+ESivRaAUOrUSgFbDTwZoaYroYrgIlSUczimmKQMp11zkV4uvgiIrzVmChMgRSyVgCO5TvFSAHBjziF6F8nUbsj4A9JbQzAueUNLocXuf6LxZduwj7OtrzfDyLh2nc06tKcVdqy5Ke/GbV/GWV7CigYfVXqXhKqqasYSwh7wj4auFeEullYT7s7v7Dl93dfxjt7v7DF9zdfxjt7v6Po9zdfxhyd/9HuxKIVO1gz3/cVEalLtghhYnrsVzh4toE98R22uiQRxJrHZGpZVX1IGclJeUUl+bx3Hj/h+LMcv/Zfm9hDc/SuL7Hg9nje9dUWQ8uzdLhqVgV6OoZFkNNpCi7manMjLpRIDBtY4cWkcvWDJuch4lBsnSESRM5vnVYPPqBK50TQa/VmUrSpu5MH+IxB6dQYeuVLA5M2hy5F7lk0PHdeS4ZhOoCMDTeIZoJiJKFalGyRisJ0suNP92f0pR7G0/7a9vSwgXLakzDdunY7skGWMUxgtU0rFnVBOpZntZIowTt3JdKR6ZRDGVKcXrOT2sgcIvd88WTZwSUJ1K/RU30Ul30G+eKifbqwDb3lTinwGOhSU6FZiw4qJi/iHSX13obj7nvQWqr7owTGrBHDEV/wGIG7cxN57BuvLqQheYKHh/GHMFN4dqUC/XDYjF3obh8OPjpCgXSZNORHyO+CQTDRvCCfM+wI1smx3bRmpGSgz9z6azwlDlnJ8KwhPmEnah6WI0tVWlXCYUrhNFE2IkIa7Dcrlsj2P/Iaqr99Gj3DtcjmVa/GSoN4VB06kPQlrQu0rqm9HpYPahadwkYPPqhmJ0/nn04ODxPX5XpOgzTBINAWLgmKlO0EzO+ZCbU1RLwN1n9xANfTM5K4tGD44vXgUtx7SqlaedYWpPCS6NarvxorRgUWodPKIUNtuKQMcyXbWgkJafwJT4gdDEYV/EJZsACxd1mMWmHpzFOBJhhfS5JumSRgF/Mkx9IKvhpqfrYpLVEx7so5BdeYdnH7VfF+/PSKhpLPyIWB60hR8j1kMv9YqwPKTwciKSPTz3y5XuMUYCzimxfpYW0/ep49Sc8gPj4kRv9TnitOma/lb89pcWFusBd+dvbF1Ux8/tTzrffvAcyw/r2XB4kUHeK2wUM7pTCUVyaWOCQL0SlK1gvk0SVYcvlMo/23zNPCsmoU2SJwyzHhEKpuJY0/DqFqGC5r3pJ/kkoBgebsATs7x1ygInkrLbbubRrAiHHVD3zMBRU006iCa4E5VlPQxX2Qvoo6LDgZ0EQ9f5q795bfgw6yCYOHj+IfUJIQSNpjs0bU3+CvQByShjpaz5f8nSNYW4GVvPEyGGJCwyLJ8uMf+ikUNJUT9aTdPqkZJD4qSJWej7NovR4TVVxAEWkeUDgd/z4B+sBhYv7iKxLBD7j2wMZmUe6SV4w7k+iFzX2u3udOl/g6sA/z+PDYTWc3XEpQ7z9qH9urrjE+qSBB70BOm/pNn40ol1+LqE89FSai3km5qKfSZO3n6n7lnrgcEkwqi3dCTIOSZEBTFUKu6sdQgoTXDmouPaq2N3mTITWhJf7GNfmELQFgJAkgalFAMdyJJ/ONB0JsPDw+MUdLQGEsCUESht/eK9vTHifzlDh693t3pVLqpYf2IfRNxAgMcFUMAaH1SdsWiCGETg/qcKHhl7SDMZA7KDr1Us0kACZx6ORVPlS+AL1kFiP2CVYQjRBE/UOZ48vXuu9w5xxuHkMa2ajBD+pbNSEfJoTKKnr3KujPCBII6G6mJSg9fOLDqOM48d3+9/91H9+hqA5nnGBUm9IsDQ6bOlMC4N4pf0pYqJJMrFwlTe6G0NiCDQeWvHMz8A80HjF0ubxErfxpd0QehOhxLk36LQzDYMmPTcTRiO0qWr/a/qwQ6dMFCHRLj5ucj9JoEdBc5GCwFSmhd2Q/O+I/nCxl8FzgrsUngNKWIgoMTLFlihfESfWO7f3Hr1zvfeQuL3tAD5GeTOlGFcR8SR3hwU8SN4hAR8045HynbC4X/8zhDpTtWfp41E9lta11zBa23wU4I1Y27CoT0lfR17Yvddnua+j3IrruqmSAK1lbLZPxZihby9tom+WNlK1l7bgfAyJSwE0WdH4gv2H1StIaCyfbxbdpWe92acW6tcVCNr8ns0iGfdrVe9dtov93tFqUe8d6ZXUjBhABK4IFtpmi7muhmURAkqbsK0jWIO9pVltHU1HIdlFXq0NZpKqTIPr0lo5QLB6hTNxZ4EjcfUQRFM/RXXNEG2UOhazsUK14WmZnOJFsczDyTCqf8nItC1M9YJKL0pX2mA5IJaXlUIu9k6V7aPtHWXpqBIGtnVTMj6UVcMmjW1eJGI+EMaXAmyC6BnIWwBepD7/D6V7NlW529kPAJ0FMVdouVGAWONgNhksMJr6/wZg1MahCqap+hnqD1t+arFpAzC5W+GsVEEkC/NoqGODHK0YsLyTBiEO8NB4wyANNoaDye4GemfhH2GsYcXnRfkyACxeveXLCgQ430ZLKi2glNbl/T2JZwCiaCkIukbTos6AvXc7rN++8taognTSXUV4crjUP3wtSmbo61GDJ8b6th7Q4l8LfuNM+roIdh5MS/I0lFLH/EQj9qcp4FLanFwipD/3UomTYbch9uRL/xkP32phCgD8v5Qdh1U/0K7DEXeL87DqqnYf/odR7kO6q3PihL6tceI//L7UyizBPkdtrpwlfwdtVUiPDw/YQf55icv/HfQWnvduXR+sqgJK03yDau9HfRUM0SRVI0L288IYnRtE4t2TmqO97Vv9728XexvF5k8oiOjnWKWmpbtHtyJuN0nV5/iIgnOjJDdscO6gtyw9fIM0j0LJQ4PXEU1QyQ2hEPkd+EkC8/LTMT4Jrkn94kWsLkmvfPD2KYay7N0qCNUJQSzKQcRM4dGcMjz8036H+0adBvCJAxkNfF6OpJ2MFrX9hYvF5Ye9uUXp04hVTOoqOdCQBFzXNBTlL5sUhebT+QUbVEgSc9SfPCver0kFUyTVAfvE+EUz05aQ/KKmSeGeqninGoHuLXD/Yrdzsd6LkUNMjRjq3ZU2lQJtuWR75x/1P9zUlHXnw6kkykwXZ/vUS61Nd4jbv2E/LqqZwDsfW78trWEHjeU9tT47ctNEUnGe1g473e3SaZq8a0XWY6/4ek4MiPTRwXZ//wFXVVPErfeMBqpdzY2LDVh13HigVMCNT1Z05TbuBmWVbRNnKG6LEnEadMmXi8MxOwr/l+RRzQiZbjzmLFK7Slyk7Fpy28MDcj1IlY5DA+P0d3d9hr70aULdeMisKrFeWT+evYSL8ukBn51iGBi+q0ydbAltUONxd8+irQcc4ny0sz5l08ZTxqUtQ3s6Uqe+k2Djx2mAVpfwocatZlSYmSQiZkSdyrovO3SKvQtcjvYf9+4fGhaBoTHEyW/nrZgaytuj07qvsn6c7t6Uaq/Nz9K7vSLtte2Jx1ZrczpOaVBhYi2wxU2qBq1tsXvaCJ1i71p/7Upxfrt/f0c2Bog0uUtgAgrtMg972GGjiYs0l3LpxAYl+VWRmg0pwgzfE2S6WNp+luMH7nRXO4wzEOB1eKzOg1wiAfuJ8NJ9g2n9unzdxvfw4XGnH+BXaQRAD2/1O9qyAgMcaxhYbMqjIxhttElg121OvTsLgzPPyfuBTKhit5gp9BHaQRMzIbkkr7wrDHjlqpqYLaW61Gzf6n2/yzqqVffhzUz4IpqFgudPchf2/FQyhhJ6Mshj0ZtcAhmzsDSp3vevKBCNSXlTQSze4SjH58tqiWfK61WPYno1WR0zVlnp/qP543vLugpfBo/r031YOA6dnSbzyKbFWbK6WQCXdhynfNSTFvXeuWe9M4umxp8fjLmEdTFt3LZSwFON0aZVRT13MYiNLOPMlNd+Mn90uHk8+5DLa58OxzzyoOtScLquTZT6UTNIU1+V1RZyXFeb6XAa9Gndb0NXoIO7zR90t1VYFG9XVUXhdvqhW7W0qmapNfZLypVa1Ekk2C/NeV0xfWqqM6SoEooQXvhlVuewfDZxwGNeYiiN/0D25YqR5uGUINa8SqPDXBOBBHunS0x7lz4WW/siaolUI5Z3n6ElrLp7gwZp8nmhjCFvGaQcUO4egsden25OcWVAbCKyvFfMv1ZViZs+JS0TDSmmyNQEApA7A7R7O1Q/4vga8v9x7SCMjeDwGqAL2Ov44ryZFihI3e7bbD1Eh52MYX9pOA2oPKIcBVBf5zCicyHPbFNcXst7/f1zg80N3qdsS+UYNiP7VCx4i/jwI5nLrhSgoMjPSxINh/QpBpIEuhID5skQjGDvY6z1H+BZoBioDaxKbA+HrP7QF4kdIHd1eg8ovf7es2LvR87qIdMVgA/dPSbWps3F7qYVWGxS6wI3FujunkQowilF1Jbk3sfi/qtia/f4wSOCO4qJB7J6TLdSD8d88S9Q9FPYocMjv7uhxlUtE3lhnxe489zc9cHF5725O72rGC87FtFHmUafKHaOaInVwNQtiC90FfC0iLoYnynbGF9T9pqSEU+GjggGaYlj/YnogKuhmC2POH95Te90SkSmkssCOCfCeoxHgrzpyDNgBmXXcfyi1chMLyCmaxYQ1XKOQ6dZuOWJs03HX2SK2mZopk27CiNP23bGqrMtL21ylawtbWIZy0rfpm0gy/qxTZ4hY2fIEHEtEMv40CaHa2wMV4x2C0UPWwA24neBvo3DDQAvYWINhTUILgNfF/A6Yt/C0yzqNZ4uA+ky+hyJOjXWtFGm1AHVuNICebsUtbgisnoLdpJGcy7+MtDLBl02dHNw2zdWMXbAjQ1BLABigw+FPCpgh40RbMChq6VPDuloWzNX6+OSErbUr1GLWq1ZSlBrPnPRVTyEkyrVjFYullopi3pHjdAr0kqDJbkjw23paolVV6JqMWpLT/W6lHyzJaYRlFpEinQc8gDKO/sn7y886dg4VOp3xG+MH3AkDeUKrP6B9gb+1UhvoPqiGFTIj3firyx3ILrYus9AgdbZNUQHDPKXNDzns9Sjw1U2IsGOGgvAoKrp4PMxiwQFoI+5ZFbCmLuni/dDQg6pjMQ7pAuqbfNe8eAeak8iDT9LVPURseL9KEipPi62seVDfOrWQn/WfVkmlNYDbH73u98hAiB58WNv9gywwG5eW7tUZsyfQmch3dkxpjyV2rfIq6FqDohmxO+sOPR+ONN/tkVeHiZNHoNQCdvSg7DQkywgfhYRfCoziMXexin3gfr7z7EC6PADGXpi2Ue17t6Ey8cZNaxi7MIIKIGKs+0NuFGhus3De6RvJZci4geph5MszWSQhI0epA+uvjN8ZP68mO5LJoX8Tgss/ptS+VWfyLoZ44jwX7aSDBdnNcEXCcbxTBEjJEM+tzOD1J9SRrGcPRcsiKXH8+X7VMP9CbXA8Ov0xpsNqbWJsaGZ16Y0DGz/jalVXGDaJaS9ZRyub9Nll9ngkjQCJ9peI1FNqKx3r5wF+r2rgsghOsZXmrJkKOQd5FjKb6j341leN0c7e4PNJ/b3EIdThIEPFgv8Ow6a1TyoUFn35bQmPph7ycFRTNGTu3n2KR3s4quuBxMZZy1UDnLvA4JS0vzg9S12RmPrBB34r7ane/OIYQzsG5cgUWfz9u5uFZfm7c0rTNy9yxNF+21SYgwSM397OJ8wZhx+d1cWgf324oq9dWMpHj8VhJPaiZUGbO+UmVVeyid0sVau68ZJGdx/pH92d/DsbLF4VdKmFSuPSRkzq4JbBRvaderRpDYuPRJ7rYk8JrXJVnNIejk6jWi3OWQ9zB1vaIV9kosfo6Tl7AkpgUBFrZDl8hWsZrX34+DZDa58cLS/oB6NeHvTbaphZX03Ws/KA8+fDHvgcttf+TTqcwR1/QBBOw3HrJ+W/7YkkPteWAbpV8MkPbzbCDxu7IJ2ufat87qNuKAdj1sriYrnixecSfeununvv5XtRjeDhdVhK0vkhWbAf2i6WjAwWS2nSS4AXVtaD9H08Ul8JYBAj8D7yGyimpKigRELWtzT3VzCMwHwgjd7yf/jTErlt9NsKAtVKEja6fA0zF/cxAnFLWqztVkQrWoaCMAzf3gW+O+/dW5VBRDodkmpp5u/YQIUQFCX8t64ZJ+9Kh6/UnNoh35k6T2+i0tFYjs6XfZMxrH2lHTGDbGI3ecbecb1pjg8pfiwAiY2dqO4hjYqUUe3hWpuw8s96Pg1Pnt3/yS9T322RPN/XNclEuVHLJTwn7Y3if7WjgtFRPktQo7kYILsuDj68NDcaM7MfKkHQAf6TTKIZCgOnFH254Blxnu1uEbyLIOF2fQ9/TuDSO17BZM65HZRG+ySfMbNRRWlSSFTdsL8JswdJw6aeflS8WFPFDLeXUYTomQooVOd/9hjrnSzBFtTlYHXko3F2tHO88HhXRZrgUWMqo0ayWa0gatSR4xLLtpLLk1oKwlgOXh2AZ9W6Qmbq6sphtTEl1SRVkBU1hF+NqZbpfDyD8H6STy/FZOXbkgviClO7y1QWxJDBpavsOhXdKflhCkMGiEsQEy4VyfIOOJjgiu1bOdBtu8pcUF9BHt5ocl/bpu/gl5qRIiyJDLjieHYNzpV0xx5kDSFxVLT55hrvdKYPoZd0xpj4t50ZK0xrcLobek9jFJCBsoqDNQBXal8y+o+L1SJFVyVSr9gLkelX7AQo3dcmfesTb9Km09Dc23bCeJQZtawdaVNKsuSstxEypKptpW0gWRbMGUzwzUwRs63bKdQlGYzoogARvi6xZNYCNo8cC0DDaerYLRGzxo3l0WLK1RGI2QHHv+5G9WFo18n4wIfBXnKUFBjJhs9Vd1owS+NXSzcYoMgA39shELHAZ2MnXMBwwsJY6R0Vj5IIa1pYIXcqTT4V8GEwRFVN40EAEb3G4X8ZVVsKWFbfdn/lu8It8tn3LS11VfX0ohlYKkAnU9I9Sl/icDXncpENFbIQ1udW6LVEneWoNPSSospI6AqHHPyDv4WfWb8q/825Jir/o1xzI2koRxz1T/Qjrk/jnTMqS904oTcl5z4o53ny76iLMT6DKmPHdp8DQ71cE2GSbOgkfCGLMCf5zuiKl9cwdJZs8ohou40jextNhKE4PDwrUgEcmToOAS0QCgOwSasQhEibsIJwpsTZzuhVDIuX2jVAV8Yd8sqQGlR+uwTn1vvPTgH3IrN55J1lfKZtFCwLCpNFLNqpXUQe8D1hchc0Vw8Luoa//xihh8MWBWbc8dn3imHuLp9KomiRE6lk0Y4STkOKM7aIZ3qNvxGHjR8GgxyHo2peB8e7GQC/DCDhBLKXn7sry30P7wt9pbIiMCY+9NyMqHoYst27q2uaOoRpslF95DQHifyAQVv2nxdPHzClscSnZYGtTCS92KuYPtnuZB3t6flkJME0irl/i+9Hlx8jlJpjdvgBiAaEM61kwao/DH55HgqNuGwwa9NMLKaw3qKfSE0g6O9PYBdVKeZyHrqdmupousUvaVpHevZaU1OfcOdcQ7GppoqfPiJsh/L4LY5OnuwShXTdvZ7r64rZU/1Q6Y1EQm/lz+p02HI3UztUdyH0zysWbBZjXWCyY5FHqCuehSwpul7dKqnThSxuD0GqIJgoWDnNhdM8OOAdFnefUMhZNNU5bW7TdK2eHqt92Gpt3G1uH/AfZ2nMTmtDUA19q19iOWZmK71d5sGLGqaDt9Pbx8P6kSFh2j/1TD1xg/j7tt2CIYpaXQZ58SsMIZH4ytcpGIDPjZ1vhJtWHy4dgQI7fbtYh77J07L772mH425U1Ys7WkLN4ICp/TEgRi/AKDhTpsXTdoEqEgzx/wVjr4J06RDF6xBzCahhtPyDal294N17Df96nr/GSIG/i0XtsO72+EQH1SOYQoGFoVfa4GKF2O66seAHscSqYJh8Spez2pGAR5vJUOMGlhJCHF206Oq4xFKJ0LKKdZZ7QTj2ChAdYJVV7FPJhu5tDA/L5z0Pi/jZhzMngcLFz0+86v9/UMCTdRDyvApswX6MH0+VHS52leEBfeM0iVKmMtg631/aZtPLjRVDNqN1AFrolFGI2wwapEBNAgUD4u2iXPlEkHMYrB1pr/xUakoTIGZ8D2kpMFtyjUwiJ+gGxnyecSm65Ho+nyPXhyR7u3s9G6fV9OjmxNVvi/GgvIhRSlhBd4OF++j0ZyHAdvlqe4Zj8GIOhCR6sRs3eq9uwILojj/krwdQcebCFtZHMyE8BJKbOyXb/Mh+WQuxVgVWhKoNLPSVzraPxjsvWDG+ltZnEsfK4PFz3PAQviZ0fVZomeRVSl652lF06unzUTVW88agYCMPMWMpAINKCb0dPqRuIgN14NgqsXyK64HoR6D7jfhAxsRnRsQBrIHGADh59GLgTBQf+P73tIhY6BpfL8TFvwhY5ESxJueJsZpCHKllrtXLAafl8ZMSQ5mU+wtw38NJ6TC5EV9hB2KAoS1nNbagdTIoTHK+MXB0GQbofVFToPrd4rz92jb413eNN6hDhDlDQgdPj4cGiNKVgGR8/dknswbnxAnzLZAHEboY6fmxR1EjCSKA2qiIoVrzDi+ECqHL9myyIm83xeu9rax/En/4Lqk18XYDV5uFCswmeRayxjZBTSxXRX3ATYXbGbYrHuCW8xh5C6qKzptfbrWu3wLGx3cJaGMdycdl1mb+pxzt1bu1k7/Dj/dp0xyIUueibtMT8Vi4w9Z3CVS0sPMB4fQ+wuvrx04E9TTUhOCp6tLrGT3HQBhLL6dkZ6mXRig7qzzICvp7gZvxJQ6xKpQn97tp0c7HznaB4teESRSHTKykI4GDQfJpubzQcNDIO9pyWsGapzRrIg5h4KYWpBJQVgy+XJ+9nEejeR0U4apgxB1yuT/UOoOyeLNTawZD/+3d6W/eIGRUCeA5RyF9ThP6iamDWj9CT9/u/vo77QXCbZkPu2r+Ctmw4Lwwz2gXeygQSukMDdD+YPCYAyzUk34rbwX0KBYU8AcivOwftequJHiQi8daxvtnLXfVJpMW9GWKMobnmLKgV8i3wnbR7qSiU1bUyVi1uRFNCWMVVbx88V0yo5XwhpcihjH+OYSiw4+ZnREFEqRzTtaREV+yOClJKTw0zeCMU+Yy/myGkGm9JYUYWmFpY/Jifzx2R8HZ5bEwyEPIVRGxBZaFm7JuDVmrbZoXXO2wrgs25S2JanNx5Lh6Fh0ti2HuP7neSoUzJmcvaWfwJRTdpz+9sp0qrCitPFkzKaS3eKYK7aRok0T2yhRGfDaCPmijeCYBsYYMI0PyMm9swwIXeB5GS2X4LHS4YyHNRguo2DGnRi7xYHTDg416FMjTgdrGoTJucTDQE/jO0F2LtRyAdYoTFXCUS6CUm9B0avGMBq5GMziohUbqDgIQsMGDRhslGCwwdf0t4p21GqpWkNrpUxAoqyHldr9ohKztprV/aksObW0tOSko0mM9jDiXOsJW0PYmsESqt8mR20RaolMR3ppieXIqmE3pVkVf+f9hZGY/1vZVfmF32l35ZdpicvyCz/Sbsu/HOW2tNbwiRPmsU785ZDrEo9eQgBKtaBOa0V186IiEWHdAl26rijWTkdxyGvj6MNKMfcKJCJVoA2SCQzQCiZDomcdoDMfBZNsNg5yEi50ds6xvcLj4l5x7brDQ4fBh5it333OuD3GTgZpyPWawRgkxzelmJzrn92l/lXhScxgwF/qo+g2G/xyNpsGuT2AR1anYXFy1frrvY19Dm0lXli9s6F6YE1EOefAdDCjLg1ML4xa5TUu7Y3hZtSfA01/DhfGMLOD52Dz47KshyQ3gWOYKxUdh2MOpeERQ1tqaEvep1Dfn+OkT0WdCAiGnCRT0BiIQSRDf551SHeLdo0xBbNsffKQJq4Ir6fUFe/c0d6eZWrirxnQwxM2qWgPxvyrtOmQxnyu7qp8j+spvts2ZaJxc2yg2Xu4ONi6NHj3nnu9Be2EFpWuPGjT1fVi29LWTwV5GIqDd0v9t480RbIcVFdZDpYgwIXBgrwlTBSFIYzuUCZKIQ/UgpFTggebH4A2nv9v7R7fmLPjKsI8m1L1jmXKsK3Sml11hw7cMpaehgm6EzhChcnD1DlCRWh68OUlkKEdcp1QWPQchEwDEe+SuhQI0XlRp3lBwz/H5Nxw4RUs6P5lCrzFGzwiIPbQJKAGsE7aHMDOf8ISiWStCSVV7Va5u4ne8cX5o52nXOYUu57mAIblLNlvxTm1VeroikNhMhHwqsP+mXIBnaGh+H66G8Z/gMtGa4nB1jyADVg28F9xiDIFeONxJ5SuHZPU9UXz5YeJ4MU1FQOLqjRTUodyTPt4aZObyQldb1o6yWHIQj3B/Fhy4EsQA4+I/108iD+/aGICM/sNBx8B1q2QIlaRInCPqvGsKKgSdXiA1U7qNnFs4OerIjoNRZwVtkrJpafB0pIcbsg8e3e2MDd368zg0QvWrsTYw36g6YQjMlNhwZX9gkhJyyw1vGUZUNwafHqOW2OZiJ0HIpcizjpohAIxNEX7YbTIZSmppk9iFyQkz1oxABQyZnKxN1LYxT5+4zBTidilMYx/xrLP6F3lE9T+9v7Rwc3i4xWwPgiad7LpDISCsmDoX/IlVCWL34wYJYNovaVl8KoE3RSLc8X5tWLzqr5zOnLKYtBgyFUKJjm2Q4ZkpO7rUxkwJlp0zCe17rFYztt94MK17sFKpd/zI0ShQx/nS7U8DANnTJEdegKg7T4B3Dkd8W36sAw7quABCr18+Sum1471FD4vnZYmSaoz9bWtwSb2RuIaJABJFYlOnrTU5rUop+LOTkp/K+qELMgbq6n3Xp8dbL13qZ9UYYwdX3fUyRLpBqMHUYayZyZsiOlKp5FcwV1iwNZbfBbZe7CKZdsXUQFk1OoGvkBqwjYVUeyEk2W+zYdDH/jrMkkrOp8ehAgPNh+xSaUIe3FTOgMZBWY0ozXm1/XpP6cxYX4Or/2j/Z96q3PF3gavfao700mNzyfOa2HaoSNh8VjJCLeqhvefq4XJNK1aXESUy3ERSfT8JU0TD5FKU3VShVKjPU3Z7wMWqWTTAaD5vFSjdDia75Pe/K3jWcowj334+ZTHt4maDSQHjkklXLmICZAYgbtF7PEvTGl3rLBAQYeq/jCn4sif2HNVJy73D+5xynKA4G56UvU/pR/rE2b3LznJxtatKzGfZcsp9sG9/t52/8NbTc+3ch3rScQ9HejTng6oQr6aVOkHQ9fRf88sd6kkF6cAzt/C+c8+HPx0Xgpz0XKGrRRMWCXI+cyQQzA1RfH4VV4iO0Fidxi8gIkwOPiRC8AZPieVZcxZh+QCZINY+UMpv0/qfoh7aJolB2HZuyiOnl8FuUGVpXLuzhtEuZR8Q2rYPa1JkoeIcTM+HkCqn16A8nAiF4Ds4Nl3OnIBqVHEohW1EFKdL0GJeByGK38aByPtrNTjpAmkgfT2rR7VhaXgxnpKNSo0MmTErSIMQBlSGLOgbgkvUKMYS4UNd/LTsn+P7z4qNn7kzRslcFPGhEe78sjgsy29komnLTvLprMyZ8X0kv/BtfV5iW86uFc8+c4YYPJwxu6ptIG03WMsHuXuM4bIsHWjTRptf4i/xLIMDHi3bAFtV+Rlyamh/zDm1zDcAHCDvTXmthGxRsEK/5ZwLwXvVyBPjTYNznTwoIX/sEmxwZMKTDooUjCXhbNsdKUxlUZTLo5Sep7hpQAbqbdEgEb/wOALDSosJKHhgwEOJbVuFLpR5Vp/O5rb0aWWDrWVp1aYlqp0tBlb5eqftjbUetCoQNFURqdodcKNBLQyMkpICUQthZXk1/JeJH3lr2kv8ibUUtOINSXPLDGmZZdILSWqWDZJOTV5PoVxXRmhIv7g7v/T+wsQIP+7Vw8z/38ZCver+IGJ9au+WwX6VVzV7rI/jIzyw+c5cQJme+IE3lU78QenFh+lHqdUBQQDvgNfAuH1aApCR8QIvKoWt/lDCQIrZS0nH/nVp72rF4v7j452F8k70KnnDbL9kWALhLVSVXH37Rg2htNs2X0My46HzahhoALlE5VnSXyKm/NHe0/YzcA8PDBbWxPtaeXkoHwkbuSKh9xZd4+bLOhxsu/1BWIVcz9gqvVwCkMZSZrsLh4/3C42f+rdf3N0sEz5+xmikoAJqS2fZd3VCCMTFAe2nipGHQ7sxYM/aRUqLsX5neLaE3Jmq+niXDMVviunoHCN4+f8yM/0SevQMOr9jg7XLhbOc7g25qDTGWtYC1unA+Ux9HWSJxNiJGcOE/Wo+Kd36fiIo4du9Za3Bpf2VEoY0QU0LLs6TAH9Ng0ASGFj+CSHfZCXfM3CAeZyd7eNTbtPUjRdBPCPeqEXu7eKD7PF/uX+0j4fuYLShIWQYnZ903kcYW09iuIopUOZqPMwRFc/j1DVDxNhIDnoA+7zLQXOMebKGVP0FHykfcQ0i9Xrx/dZUvpYFK2D2kVwwkycYPu2wNNMODIdR6lejxnVhMWcUuXBmfzxzeXjBze4WAUz8Ji46rIRcEkYbJcpzlw6dxsH2V41Dmv1FIUn8Nt6yd/h/bPe5Vl4Wf19LG+RgXo6iQ6UcMpPVavMCXzFviccsSm3HiJe+CQrJF5q2mhDii+Xjm+e54+L1Og8PdCluAGHsQUUhdLbp2IMY+q4u4Y96d7Kh+PHC3rSQTTdoTljIL8oySDqbiMIZpr4+DQS2UNEEo9Ceb69N7ty+I9kYLYmGUJtLMAGezJZZzTXtZ8zFgwcRcRVIK1lufkE5cP7pygr1OLk2z2mJ2Zc0vbHPGFB8KA04BAWd5c6SlOki8X5wfXbpJtpphn2ahlTpdI6Pq9GqdubtDvoEbeL48NzRBSBQj1pZ7DuIFX7XjzoLVwqnl4bXD6rqn2bpmN1jA5J/boqHCC1gLdn/FTENp4dUjNeJN1R0VCD99vF4TlKc8Q+rak2KethuwO7nYUOVztQQ3LGp+PSsFS4PdNi7sLxuTU9Uz7xy7x2qzPdSssdm/D53W5NMmL1W3GIU6FpTZyJ2p2asHhhdzvCRhGtmLsDmBGKWdKtaRChoNKksLC9Q4Qpt1XpbyCZRKoIYkj/Rr88E4R3zQPkvWkJ2CFS+HHDT/fbeCY2LdjnNma+9T8uHH2gwt18b5SPhZ1cfUBQyWLlYZXssTAWI5KHI/FYWFdw/VGUNHqoP90kh/HupWLxxWBrvrdxVUS7D4wyELHT0v9XdDcJKaKt9R+2IrJHDVlNkAlhJqWuuB8lHN9pMAG+4KFBAxS44/NGR/d7Y6TQX3zbu7bILd8YKTBth0+KodYWCypdqIcsstK5QxPl/h1CZVqV50b1xvuE1FpHXDZNL5xRxemPP9wsNhZ7P/xEkBiWcK5qTic16arEW5pQkhoyK5iCCxil9M/uAjW10TShJPZZ8pqXVTFUen8YYdO0393xjUf6xdHtFm31iviv8jsjUriQOvzCgFLxYVf/3LysFMNR8yYrCQ5XHR7ijbrX8KjEIjU/gJ3av/LyaP/7YvESFRiigoMdbfZ1HzvfVhPltlg0JsTQwmVfHNLiWcqP9TQJ8OVSGTVP8UiMI04rRrsvTyk0XtxdYxxufuDJTVYWF4/r91kxpkh6Ou5fE+egf5eFnnY7r0XdVQrrIhdY91lMolrGVfOXsI19byJ9BE1loTb4xIgPpVavFteuDz5eP9q5yW7VgOrWABnfYcThsvoviZXVpLR2IEocK0tEdKisr7IKdNyqb+UTDMetUvVZOsBUr/z6nd7c4vGdh2IAcSArhSEhfazaz9uLA5PKf2tS8JaXMGCTjgCZXG//Xu/6RW4TUvPwTmXeoJCDlzxDUS2kckTs8UjM7VFp17KTjiUgmjKPX/UuXWE5GNTDBFZs0IxDUzMDo5InnXJ7ir5qxVrXeYxLrzmPkUnQadWINF3b5qsy9LRtZ1t1JWPOseDKlpRtP1mWk1vx4nRgF7tQZkykjaPBszlV7cWxi4wBUWk4aHvBWAoaoyqkXonaNVK3MboNzjUap6iPjsbc9z8ycLVhtoGlJYAqN2m06+BcAwlHgEMbEWosaIFAhf0o5JhaorBj/so8AxsD7eRX6n8dMOTCIBusWDDFhicakWggIsBAgYGv6n9bJRtlPKSDbf2rla+lO7XGZKXLypbEjK0ZlSJy1JXWVPqqraEsJWJ0h1YbWmeU5bor0b+qHixpqgWpI0K19FSi04hNJSxtMaaFl4gtS2JZogo/vyWXtERSsqjsWutQhivqsT+VnWruJe1OG7pDHGnuuHah/X6UC62DKbKkQE/83vadNeDlt8NIXCWNgEuK8xhLmIaIl5rqbaaCdPuX5o4vXju+u6gETSPwGgHdaomrRkAZaO1QGhswScxAU0NIGgU9mBdM9Whntv/ypUW1k+miP5QNlmPlYVTOrRgEjc+B/vpCikEEKVcQwyw0blOO/6JvRXmeh9Sc/BA+GL7LMTTKOxOKgg7haoZp4hnKEsY1PGqI0zvKKchmlRYRMynm7hcLWLrFMPEUKaddPACXlL2X5QFsocjpUz9zIdbj1Xf9jY9Huz+qBvEn4Ycnk0Qt1QbdiVFSOe1t/TfXi+djQSFXKhJPZHWFeEXXC7Jcta9Nu9tt7iaYpJO4fMjHmksL2zSRi2qMwl7IH0Al8tCVtEHCfDB7Hh0BB7eKwwvF/R9ooi24x0tDpKFyJjglVvNVR9AcMaMYkkYy1O3EWM1A58YyfTc11g/HsD9KWKMa9ZJ1SIWLZVRawZCcIPiL0OzTfdoNg81XGAZ5AZscTbcm5BbYDumUOTZLa4D/OGlN8ZJCzM41zdLlpA6IKOac+cHzFIvzDsvpjpBS2hQITvh14w9tiB6n8Y7xiNobnVGnOmqFPTl4fL7/5qO1JzFgtd5I/VYFG1wSZR4AQWlQlpvLAJabZkBLzaWeZFFSsyknURSasUrC3NOSCXNPSyIMsrEG39vX3rdWXbyU1suxydvv5tP92hCH3vJLzUG9G5cJIqkg+y227VBAX9owkhlBLWoU5KeHoMaLnmBUQf7wIMdLs/1b5xn8M00iadoWNELu9xhiXfaEK89FnFIvV7BRMEZsBOZiU4l2SvAGiTM0BXzIH5fBlOkt3NDTYAiFVdbURNRRI9e5/G27uy7RyWoI169ELKOHymrHAOsLa29xO4aMfzwdqQdjCZMKFeqLVHMHUMvTtOlZMDYZib6eRylGpNXXF+IKDPtEma0YOo8mWEzUAy6VPslld9sgRzqk+BpK/Bbz3/cv7RZ7t0UCY0fMAORdpkUw51UqNjrRUvMQtxdTdBItmapOtNRkrVRLWvhB3H3e5HNZ+mNd/ggpYplbkOIx7duP3H8UoyNSnTWmHt7Q4RcbOeTYsg27a5GnXjPO8Icr/df7/IpphhiuoZ+cmgOwcFYmdDgZJZPKFgjG1WXiFUUJAEQp70XHMWRIr2WqcRAYM2hGX3ozeHZDUN8EhrughgnwbFeVITbGnpmCawOOm1EKPhATkAqGsQko9DxdC4e0Diz2loeZ8x14DgA0k9J8Atu5Khs7bMopb2uGq1Rx3VmuPz84eFlcm++dO8+tgYHeVMfrJNpPomZIJJ05qxFNzakRzxR1jXikaE0dJTLmIDZDfr2I7ahrOyqD1wF3naOjkDUu8h22dffBwebqYPPj8YNHxStcPEyDJbO1gBKW+87qES6ywNvq4MIsHyaqlw/RNMtHYR/yZgTt7l5sAaLAHvy8gDuTcNbKGQBE4rjIYw8RUQlZpZybrv/OuP4H46oxQVSH+wpOxWB9ilWB3R46IO75MWP3b6mJZCHYFysawQacUjuh62SrG3G5KARsBjUo/iJRIWjBYsJZMCvacD6BBwZefCHicDC4ZCIMN9oCJzU2o4CJeQB/DMqoNxB+dI8hmX0io3Bd6U82uPnYxz2JQZCnjmEE4VnHMFJUDJvbPY5t3Cj1xTCz0YGTmg/JpZ/nVVmY0zoUlliCiBpsvQWDl6NOhDEXJBuLk7iauQIZJeYKZ2hlM4q3KB6XN4nvUZz50Zw6F8PD5qEtnvpRmRcvDoCcipU6gRnrbqC/sq5qTo/ZfKjkHAWA2U9DoBMM25PkckDqxe5+/5mu8oITpPtUEUfsBY+1AynbL2kENMB/27UCqfrt4rTdiuncNrXL+Z4RABUJjPB21nR1bGqPTlMEGxT4QqTTgP6yp9zda+jJDqgRDv+0Qd3YRsbCCbpzQTDDEgPqSuanY3I6JqA2+hxzzzHKLHvMMcO07WVZXSMsLsvQKtk9trmjDR3XvnHMGsfG0IaFbVK4CN8G9sOgWOpBEyhmPD9kKBDilpzLrLuXfguyHomoHSxcBaBt7Oz+WPf3ZRBp40mGpxqZGljqIEcbMDpgTkM4G7yJzjRYSyEsG61pqGZwmoNkHPxiAJKGRi4cgk2YUi8OBSHQTakrPA4un5UKjwqFqM9bpb611laf1NauRq+yRmVlKprUVXy2vtOKjhWcUW1GqSkdZjsRtN9Ay/RhQe7Kb3rLo6S1I6dHiGiLnCtztLwx9/KLYQH2G/OPETeJoCt7CjEO2w8wVA4Xz1AI3vBl7TGsvFO8hsPXtOfwr/+62nHIt6QnTtAiPvHXf218h3heG7QirlhsWgD5YD3np8TqV+2AuhvoJX3B/RUbnPJIxTJ+whaUl9cGB1TbGUA2Zj7ntZNg6OgulynbyqMYJrFPGZIUK1bBO6awZsyL/fTiFOJmErSXLhZPnvWWH/buXZd8a+GKKKytMgNDrHrCdd86IX3HJDZDLS5DihgSq5RRvsa0VgPFk+Wj3Su9OyvHP34vVfcASaRB2A5SBfvBMM/bnrDhdA0aES4SdyE0Oa9FRT4z4f7iueI8tbMSwl4jwk8ocjJEAwUxejjZXefcbNCnkz6/LTRjJrhCvTpD6u5SvlWItThWmvgnHygdP/oOX9n1y/APKUwZUNc9YiFx0BHutoYexLWQ17sbiEullhZc6a6mHf1VFBMFClCGytchVsXB6/4S43p+FuCb6FaYdC7rcW/3/BRHxTToTBb4BXldqtrW9Mlsd5cg0845sCeP71/o729wC0w+l4VbTgWZ+ywu8dLjWEyYeOkxmIV+BqZvPYIKxY/LUVVSvdxcGBFYRRiNtpQdVdVf2octZUKqqO4DEqtgSg86xFE/qNQHk0cq8aPn0szoscq8sCoKndLUk4au24R/OCxkhxKKGZfPf3Crv0flOPBDTKf6Rv72M3jOiPa4J5WdS4zgBxTc6BN2N2zLzHA3paoCiOLa/+4nLgVisfWYoWimNOXcVPX2zEjVY9W4iSez6M1+3zuzqB4Mb5Q+3d9K1fkeFm3+HJo8fw6LfpBh83huua042GOjeCD9zKTdMJez9/5/3t6suY1kWRP8K/l0++WeY73c5fTjTE+P9ZhNz4zd29bzKEsACTAlAMlCIilRT2JJ1E6R2vcjUaWFWkhJRZXERRIfoDL9ESYA/osOX8MjAVadc2/PmJWpiMhM91wifAv3z4enL3oukM3fm+lbhEmsFiXqBl+SZACdjGyEtPqNOLWIPszmi2tstcEl5NbEpmqoA1s3ifv4L3OB8dCxRFqowsJU/JsLL9ySHO/9GQPvcBIGWGha/ff/hi/C/f7fYPXMpU4wOsnQ1yGk9oZDJQ0iB7DvuLyRTvTf/5ts+w5eQs6zI3g8m6H2RI2ER+BU3+1uHs2CGsZ2vq+gV/T5xnh1zREvb4GVAwSwWXzmoUu6gyfgFgkffnr3mDya0CDTjLClOJjE/BIc4eHn18NfXnH/P3dfcDm4WpzB2AX0pAAJDbBMkt5UJDTJrbl6h7JqOH9EMbVUnhLdKbKUqXOCbi3ydCtCFV4MslG5ClysYgAEwTTpZz1OB3CzBjefsV+B8w1qPA8+3/IOM7lqbKTjxVEGelkiAUVLPE50VgiEFrM2digd+g1Mhbe7B3cW1fFjxxPtZNnacRqrQYUeWJZP4r3WkdpM3LeCJhDUa4dK9rHA5Em5fAf67GA7w6TVhQgQVupr1oR75zHDYrCX1gefKapgAChZ+R8kpXMTnwc78N/nU4oCwPno9F7m0r5Td1hc2C8a3GaQBo/iYF1GcauKxd8b9ulOSB3c/s4OiNrzH2FPAaOhvYSuxHZByEL6/XYJ49EwNEO/wc5OGOVnjAnhp5PGkcP6O5D0zsjmLB2sGsEJL4OYUYAfXxZug1ILyguvYE6+/Yy9P+q+5mTiSbgSxT4IDynJyhMQYX/7cmMdgX84mfb6MfWKncWwJgzUgxFxF+3C+n6vq94jr6lnm7ib4aY/YB6rsKVAH7Kh+I785DbdlmQl+id0NQDIhMNE7Bj66oKkbRhr2A/DMpluEoMOdytSDeJy/Se3GK1B7DzmWCAnPB8ff7WDMoZ9xzX66miapASgZoKvEB+GhOY8nU0kPpw2Mv5JTbKEkDMIg9hwwueRrcREZJdQqAQJgSTDMHTmiDmZQ0EzJqS7gaQS4W0ScAxoatR1bbKHaAyAczEmgP00uHHD+1Oj3evl+dujTepajMg1pCqNksyRwz8LCDbryYQU7z//nqpkzSu6UlcHdYSlAkcegq/T73oEooqj8GzNqwEqLSZqlnDGdev4o80/qIY2NKZ+4FJapFhe2aV2lkiCatanJgX+NX6w+qLqgobOp/U6vbMZznmd6maSW3+PvaWpfpb1rbxXJVh31tOpeDbqzagfU3EmAh9CcvbEnlMn4S91D37HKaj6A2zmisnMXp9YxmoTT7GGjXWpPEOLF2x2MXcDQ5fsRgjl9WPmeVQWkVuX55fFJgwMQm8IeutMTTI1xowN5i2vQ60tNbMytXvIZgnMFY6pnrmnBoraJmqPVEwENQvEINDIXEOAlw7VwlbzGp1rta3RZVb7qcazx1XNqXabUDxW23g9Ewp+K+9JzpN8V8keymIjhmkt0DrwEtdIWxGyqGy9PBVJakQoiyiSSNNkkZVDKoQmo4ROFP8NSOK5bCKfMDyk0cGJKzgyGI5rVPBPh0QF5/pHjuDZnSN/8hHBIsNOp3nWjf4NOMz9wQblrm3KeDAM6C+yjbc6C5Z55NY0NirEQ4hbCi8FUQe/LJU7L4ZXrpUbF/Z330DLwq2d0fL6wRP4GHkBqYeglw0HeNP+J2iBpN8tWtI0k0YBYBbEzmCnRZghnis1ZHdHMEcFWUE79reQ52roCopMDxozdQClLJPa0EYX1jK3nnaSo+M87baWhpqjhMry7XXRxz7rzrHgNmNgni2tDK+slVvnDxav7X9don47HbwyUp7VOwie1fOOIaul4CcNOQVPq9z0gT1teV4okCvadcC3AsRQBG6MGykPQSsW5JJCSZpsKa7OwOYMNuf5sA1biiuvy8uLGINr0IXz/bQAkFL25JBwRPC5aSOmjYZZQlBrxIP3ccgBN0nBxet7FhcfDz8RIiBRjhqNWHAY0pPkj2ezeAW0FAgGbPbLG/jjcd1nv2zujpexA/fsvFPyXWcEFbIrEqduTqURc0DKMoQsJCKOlWnYcga7vOPGyU+PRl+vlOdfQngae/Mw6YhJVBJGAPuAypNm2lmdg8jmYHu2iqAMiAGEoAzPo4kkl14enLrgnogSSaCoAjzMBI2vKSwn+dBelhL0pJCGz0rJJSewhznXlZ8xZAPP1P3+9sqLcuU0b267g3g602lnM914Nk948G9xyE0KO+SJRdiGCpY32c9EdnThrlvb42d7eitO+gFV+ZQtwMRtpB35jsFvJydmI/yU9A+ihJTXF9xXhA/5ATa1GlnWjPA6eo/J3GC1lXZiKA1rYYpZnjFZxMDuI3AMdjeWZhNK+dmXcvmSUp5vO1GQ9ix1SMB3xlEC5DIoT270OG3Fjw92uoniAuEnsyyWbrovpywKEMn+Wp3fygMEHXUJNKM43ahHlU42w4PmmvIAo3A2q3IBTJYEvqSfbn7Azzb0a9f6NOGcKzu6sE37tQ1EEcVL2IelZCgGsCFa6MzGgv9dOYL0UTdlvEvpWIwuXB5eus8AN3gqJEazVdlPms2i5su2q799Gbd794zLT8FnKuU+eLpSXnxJwWeq5iYKSHzw0wwkjrtHGLxsUqotH/WMAIKdM+mAgZtEJy0XR394+6Wy4Kuc+dg8FidcUO+mEq5XThJ1Blhmo38aeiG8FQjdfnuNmxJk7uP3fbBTLm+NP7w4OMX7xWmvAZgGc4gZyVU3EgslfqQ9JsYIfcdJYGcgyFpDRPyFg8UlWmhUroSkoc93U7fNU+lRALkvs5x72oudq9qmA55hL2sk3MWOSk0AiKAXYe6n++c4VZ2UG9vl0q3yKcUNsWOeu7xfZMkxlkmWLVMXcLopjOWQsiHEN0ovdWzGG0+okyzQB4wyLheoSn9ncHQYKq0q+9sGRo3i4NuYu+TlNCz4jScqrZELQDsCVJvK7H+x8MeFWKWWQ9QwleCkFVPhkUlBxf84S4WjliSu4L/TpylwiRKrB+jKiTbCUaKKHDgxElJWXGKlTOjEStd8jeRE4VzAqJMNXvTiVpRhtRvuuzp7H4oMSJasthEtiONvg21n++4gFtDDZ+XWcwD/v7g6fLBEO8UFZKW7SS0egxLPc4oNEWmEuym66gkxVcLO63AvUiU9uneGTGdakxCB6XGnyyyFPfZ+0iU+BELfc94risasixvESZv6ioe8yPHa3zkLDyKsOI4I16MblsbHza7NbCfNQ26ATNUBTApiOvFAEFZMsOnvjMIwG16Au4uqUdw+xy8S7chVJLDniGsPHhxFQT45RCgHtAmO1RZuGlBzjCcHT85g+Qgg2mTH+9i+B8MZfDFlweHf2oXa/6bu00peSUpMhE/UltM4ixNY132sfoOVoIXHHTLkWgSboKsD0262aUUQgmkaAR3+wrzKOI2OKOqehloCO74kmJaW7GngHemOBn69mXqXN8LFHgKp2AhG8AuuU3J+0UK9h0GVl2AiPT/rNJKYSHitSZ33LDR5HgrvegWU3vY417rFmtSkzxNVTZ+nWzKp830A8APxi2oUJt+Ms4yjrhlB6FMQA9/up31nN2Jo4eZqee3WwfWF4aU9rAHsw7M3OfISF6gahYBbn0ehgtaTpJtVwrgPFX27TrgGz88S9fHX7fEqxMiBrtPuCfYvnhZ1DDxp/1fgM6t7XHGKvdfofcMJf9B6gdb/s46Zd8cCN0x9L+N1aSr9ajclBLpJT0i9H+/0/M/wPLzTISZ+4BaoJ6BH2Y4m21z/oPyzN5R5b61ZSEbbvuA4eoN2mjkeGuHy3ETCXBnYwFVbdZqBOt0ADm3fwSsyE91kxP9XrU9rdxqL05hm0wwyax2xQSbWUWDrTRpFU80hawipCeTtn3/lVKiYIGoAWGNgwgywBoDV/lYnqzauKi2ro1TjeuFZVbTTdF5FzRntZtWNVzR/gYoJlYEoAqsDVPSz0K/IexWpECM5XCLL2mJpzMnpIuFFKhLUSzJNRFq5yBJxSkW1cP+niYJqe8TXU1fOl3JqO6zRz388JPrpH/nIP5p8SIjPFEd1p7j6G72kNQQF2996WJ4/xxvFSddZKW3uci4X5Y5DJoF5GuomVOo64wZOGnpRVgMo8LabMzNKu1x6MF55OD69isioUF9VYYTuB3Q06mAcHX813Net6d5Nd7DWjf74xz9ibTDMicu3ytcv3cDoBuzkAC535NYDICcnnADYBTaxocsjbUsc6VKSQzH4uSdVx452uXxn/OMFqjruA1RSSL6TQA1yznecQEVuLL8GOwDystnD+zw1XL6A0IDJcTBYusfY/8/Be46SOYLLwV9tSwNQPCjlWUjdf3Lw8AlRA5u8Ycgx+h/4xFSVxDsKDPsXjKd9zvM/SnoDQKgBKAVF1MHtD8PbH8un58pzZwknts/9SpGG4OBCEV3bwxrK0b8Nj1nupJOZUSR2GCamAi8ywbQtFN2w+s8BbkoCiL0txu6ZPo7IY4wrY+vTyvNnh+dXfH2aXmNEcT2HNsUhvamDzvvgWFUXU/ylhuThChiTPz+gvXDDYyaXTl553MeeN2EFRd8PmSri7zc0zgAFxO/e03uiIniKI5ARRBRNo2wmaFCmhRa8FGopAXIZSY4WXwwvX8AAMtC0ENMZBPV66RztJmVOSJqfSM4Zu/fbZDmUZwHKuNGGSIZRMd2k+MFfhC8S7FEdgYR07Qo5WIOtuzXa8Vu9DG0hT6+PPy5gecCMoYuL0Ak0ijHBIpxHdHMZwog2Z/S98RXZYI1+vTL6+evBs3fjnxYxdpnU0y4GW3sMNIOxGKWNIkl+WVpWKBG5UChZklkKuShFO6Y8mAi7TM60C0hfw729bopHJVEGpKxT1FisCl/vmlNIsGNBkLGDzVoknMc/bZeXF0c7W6ONG8S8nYJHmEazcc/DNeeYJW1ZAvhxzzKBlQnbTfJ4vEPi1ufo6WcogcEdkn4zbXnSgJ2Kyx6Ig//SE0mQ0lgXCl0wm47EzuM2Jd0jNAXKo+HTa+OvP5WLi+UqAOFDVclsMhs544+R+wpsraDUs7k4IAyf2L2fmSrdg63V0cJrpTufHINewJ4s9plIoAN0Cp053auJyZqtHEgRmplLVLcBURPbUThB3/2Vqowubg8//ujEffkQe2C3u8lcgh6qRHxbKZgnOD15cwFzMmSw3y2kB2ALUc+dCsU38/P2we4ZR5tyM/pFzVKF1g01MlfhhTvNbEawY4/zEbBXOrRwELTIXz5BocODtXLl/GiX3NIZZ+dnuHNUkx3/3Mg7S/awcXwnguaF/Ua2Z1ToOlbDT5/QAPAXW26wPdWD+k3IRyCPzH0OVIo84oRMU8uCIYMW+ivD3Pz5glOMB+eWh79AyMXZKu0mZEjnsUQbwFNxxg0s6Xjwgjvp0liXI58dRp8iqhF1ZEGNiHRHu2f3d2/gh20XzQQtGMMheCV5hvnZedqZfFnt+slEELXb5LiYVzW8dRf8lmmv6kTaMSJPqLPhIVR1QsJr8okWNCuHly4PVxbFFBF6MmnElNFZ5HgQGHkwi/hGdQbRjer0mcml2LsfM5jp4FUP69hyHJqluESPoRK6YHUBVjPO9M1n4/dnywePCES9n816elDX1oK6fvewiLHDA3CnbRppsU2zCW+ifPFg9NOaoB+1nOoWtz87mqIuYjpuHsD10KmCMFdBOKXfr3QB4itnageLr8pnH0dPrhBNJ0cT2I5UmtRxB1LToHBP2i2FI0SOTG5HiUzuxFkvHWi7I8jrCFDhvMcZbFiYHY399T93yMKG/Iycs7aGD147QuNrDyh3q562IS6LVKWHGqRHzQIER0yNCwbvwxFQjw3ZkxSPYAH2qvEO3cvp5I4iu0rumTsZbpB6ig0o6geAZjikFPFencD5QSragaq718tnRjdf0RdGSkLZ3dmLuJGwVmQ3Jc9OQjS7a4bcNCyOqZihGy4f3gYRgzecO6MH3iC0EOzLHng7qyV1T8N98nAAtAa2CFmdF5rjq++HHy4RzS60/VJqlGUGHyZ3/xGUQRcKfWCMShYG65As9kOEKltqSEf3Nsoru8M/Pxhf2sYoM0Tu24kA/tCKsVRlyVSpmjVDNKvLhohOzQ8k/817cof4goF75l2oaW6ZemNwWeAjeamifs2362lXHJrh0jJ5M9P9mIr7EjgQ6jeEHoMuRm+lH+oYqGYKjHRrS6sJbSxntZfVUqYnFTtW/8DQjfYdwsgPlqio7QpIc0kTba7plqUalLRxpVaktd+mWYdqDgIQtJho3nIyRlPFVlIryZtHxiDqQS1gEw0g7I5IxglaPfQJp5gk5k9jfqjVYdW/6OBJXaw6mAAdVeeiiiI16DWgtTtEjYqq89MRFZDug6Bk5lQ/J5mHSz/hG5f4NCsK1TNGL3iNoKpAxPXvi32WejUwTAKRByNW4nl5qlKUcmIaMpG4RED+EKkoUR25MRUsVqCIge8EyYVnmE8byA4ObflF9v+AW/6/VwNcU45rmGv6tRzsmnJQQ17/cEjIy6z4I0cgSHDkH3zkyz3nYAdqvhBczilhCizi8EmCHwkOwETrazOM0eat0VnENYlbUInmz5QkH9IblkLu1UlI2OuUkAmpFmB1Bqryc1IvFV5ZqxuDox1D+2LKv27ETfwbUYpmxeuBeMr3FWo2Du7O4sbw3Qe0DY/V3TuOZupxJoEbpZBncxkrbz+SIGADICmTm0mNa8b3LzlhMl5Ci7TVSgxB7jTYhaaDml1mBp09n0kN6XYDy74Q7frWcPEJ2tLHszZkrKSx9k9oZ5QcibG6nslZ67mhpG9IYrxusOP0CSTEIGzgJt7vjxdGF+6PTr8Y7QCTZoKROmWBRlnsJlCTnIwmJPV345qmPkJ++mqtYmGMLpwb3zqjRoabvGi6tDXxnLLemGyX7FxDOKO29+C7dLknGa3Ry4vOd8G85HMsRmuGcJ50ilbSViMQIrHYgVcGUM0QZhebLcsPxjfeiCnkVDXlQM1mMxVTSAi2w4HfsYR4rio5cEecbaG+SDzXToo5fpd/sTPSSwN3XOH+mXJ11PIQymgWYw0qpnQB9eGt9f0txCNs67WeU68Ju4VY9CYLzMlHHnPqsvgBLB19xUs1bVaHKR6PR2egkdYMXRHhZkSt8s0MYf1sVboMEaKEb7whwubbGdpY9x/FvNHRQO+bgFuw/B9jfROHABFg8DNthcwTFMB479x48bLgAACEBpjvdEEgfIQGShzzGxcfiB+m6Radkz1EUwRPSNH5Wc4Vgx4OaM/CnwzG7I+0K4cEn+Hb/TZjNXy7T5Po7G559pP7d/wCk+UT5yY0o37u/uVtPhEglty0MXyQgLZ7FCWMgX9L1n1JqPB2poP7kDEFumgox/A9iL2YDC2xANc4osnpwK9PkKTiD15eeDk6vQ55wbfeUf/GHD5Hv+lmkOM+wwamj6tb1py5VeWsWQ6HsKVge4UtZj0YjhmA2QJADufeJSgvM8C+4S4lbowKtwCnGIFj3Eo8RtIYvtHb7eGHr6PTT50oxj1gzH4r6gkQmMKinbgXXbdMADkB3iskLFJACxowYAqkZXTwam145Zoyymtpr8Kn4cxYZ95HSTOVwFsPt3qBQR268NKCXJ1lheLIgxhxVEGTQJLNMeghAu1nWI0kJ9KEYqmOMCNL5glBueE+5rxQOXj/mUg4u6ZpKUxTnhn+zlrY5hPiY5SVoOqTgpyBIh0tvA7UKSCGMPZ8diJ1rzFruS9LsWbOMXf33phghq7LjDvrKDdCn6KxiXbU5wZ7OWCEFy0Mjid93zFr8D51LueMHca+gJsdTJqiqX9ufOfq6Mdr2Js2y3oz0IRh8LJfxHmoqNzd8zpTVSVErbJSwmRcEWHSVoaqs1bjOXiz8PmoV3sM/ewj/n786VrSSd19vPG1Lfl4HW0kI3RY2FtKIuwDEa8EScYTTSPjPWWYozlVizfcXCJLKDR3aF6JnfNUjJx+Hku9fANcnYikOE1O+GmsRpmbzl5EAiKzPQ2vxmSKh8tm6mMG65LVma5L/7RAqPU/e2kqTbBtKV2xSUmczq7l2S3mrRjOZN6S1SzmrVuhbCkWrcGqJ+R+xp4MWtyUnSnP68xuSM08zVWU8XFPCu4IMOOcz08fBO8JNhYG60mvaW+rK04C3xfkH8FtdeNovueBx5vm65JuFkq42/WYZq8j8OOW+bxKAQCFEcSOUgNB9sJ+E9yim3BYvZhR85fHDXnno82b7qbonSfHcHPd/a+mvVGdOKdt8Dzm/Uzs7+YpYjsZyAerCcly++eDZywenTY5loF0QprTgldVj87+kgpP42aVl2+pj1Vxrnrs9SAZ/TNwpdSP8u6OezQqY7R+zRoKyDOYFeK9jJ64Ar2Kb8F2v1r83tY3frwJHcj5EjrwhjzZxhQBqhjDagJjQEVjOQ3/zN4MpYksJqh7ZDFs1ej0Vp+xKd9gIxiyJ89/JMMvMPhCM6tq10GECyCkkOnBgwcHd7HbrrG0rJ0TWjdi1MCGBLwatGPKs0tkr03YL8aioEoWv2JVNgXmgpd4rMxl/uM09Qp8unad1KuaW5h+u34cZ9aaqlIS+YXoOK/aRJ2RIpvQYIA56Rmq7vG8vMJBVWM0F6/Pac/mpf8hQt9cNPkSvQRWmaniEvMxpbjr5y0StyoeVS6qEAsfX8SWv3cVUnAnAuCGd3KHpFNtSi/ZRjbTT/4rtvvOsv800Ul24rDvIzvtSukiO3FM41d/f0j8ii7pHDlC19SP/L0PX2EEvJv2TyQwqdpBNTsNY4JIKwWwmq45A4x+8mNgmoHFz/v25cW1cun9cO8aJswgqBa0vHbao8HpqAhe5jydGJGqnXcNWA3ctuUQtnG3QPHmuXJrpG/352mLr0AgBwh3rLfDuxndeHRw7gp0vdt9OFpwPvoHujlnArQb7fT4xO05ETnYBJ5pDXCQ/3bKyDcKM6QNQld701agyOGDHcBPWL5aXrx/8BNn88JVUaObHg8ZpC3o9W4ZDNZlaDr1CulectypYiXspF4GRbbYGehv/c9Ye404N62u0FaDl102Zp1ow/D6w73h+8eOx/j0l4M7m+XTV6iru7QnJIW2SNXfO//2dz6FsKVH9+zpOUrOPKhzu1tEuwRiOpZgz1yQw8eQHH95xJH8Ojy14D4vpoa6s6J5uiyk6xQRI8h5uk5fKqzcSyoGFcLOssTwDjbxgsbyyGL08uPoMW7IM4X5RuGbPLYGm23oP8Edopxciumr4oF6UjkAERLwjrtogXFJx/7WvfLsAzd9qB25W6sdyE+ouwXU4mIb55Wm3cET9zNSBx1NThherQ778kzDharGlAt64QGLZPALNBpPONmu14hnpS+jDMedHtbhUG5dhsn8sPXURGcZmJw7O3x8bnjjqzObgQlu4zmbOecu5kmFVS89WTTI6VI+GN9I6zzuyaPjlRMMEUxZZFK+u1qeW2YPjG+fLqU89KyG7UhBgWImOv1GJBfP7yj3KX0Mdei0ObO5/+UKbhrg+cezdkCP3hA90HSq4Z13eZXhLTvivq27M7fxYhGPLUAGM6/FaUUw4INXgsj1O5hV16+8lPHe9vjjpuOg76UPWYt9+Njmvdj5iTwrcxaZGk6V1YdMdAF6DtCs0K7DDnhVeQ4kARwg7dWciIZMJAJ3gINwDOt7UkhF5GMYEafdbEQl6UsZur2J1dVye3O0+2i0uau3Aiif7Rgam/Tz+Vzuow0Yvc6PMfeDNkEwSoNTuaGa+bkAwEQs4bBMoQTr8/vxmbNUeURco8QRjyUFMwNjQkD8oRSk6Hc5gDHHlYC9WMZ+fQ3NDmbgs9aoAh/sbNr63hlefLq/93D0fvdgi8o/3WXuifOo0Uul+waq3QqbtsHUPISVqteAE2rRgFO7iqgJ28xdRg8YvOhlTYPkaY+d7DkjlcSuAfJk9oh0ARiexBc7fWXNZuIrzbqSvKUQmJIRLEcD9Evbi9yfoE9r4C/5SQX70jK04JeBvTLxJRGuaK6dBod/50UbO2bynZPlErx5MVqm3A7EaluAgDM7eS8gOfzBqVaU+QqWu34LNZf6daJD07poDNZzziMe/OSYtlAjFY2UR+H18zDiimCdA9wB2OjYPu/saGMVWO484gYngPoddyIIEhznTNY6tJSGyp8GBPRVMCIyBo/DVqtKx5QzLx63q7Lxw/bwl1cqGJFHIBTJsMHN1Y6T6XUxHHgUQJTioJloF3cMwL3ktok7K87eGT1YoHaI83SlW+VsLsxCfzlj+6U0YE0/T5pRy6klPFEeflgYbi16yt04aUutWC1rt/g7YHqZgix3knaNP/56n+BOAkDlgyd3Dm5veEDlwqmliOgFpNG8QE8Zqetg2mGfmUtZpMohRG2+d6tcvqNMyMQ5HrKpQ0kdAJmlaPVNDBSDn6Ed5g9UT+ycc1g2p+4O390ot54735ziAnByJNdayFQYT/K0V/eIqTDkRD+NgamEDo3w4Yr+pffEBCY3nhsxFw9r4Z6/D3CyU3r+tGspHARwmkMa/myfINv82/1j2vRntLs+vLxQLr+t9P2BwCbU3+cM1B1wZ0/KsOSRwSZGrHC9V9gNP+yCEjPs3KfBDkkVTnkKrOYAmc2Zmnmv4NxrOG9ilKbxt9cnhSsHUGAW/3LGMaQYSp7Ue0WGwsJROe5mdM8/FRH1i8UzOmS9GFbycLQckR09nKzIgB1gIp7AMojkqHMlUq6NiHuJgEh2sYihcL5/Ls0mRq/vDm98pGYTXcDAa9fn6xoQghYPq230deoMwDB9EJNzoaNsQHx46265elXpw5UIaGN5YAuPok1djeCNrSv6v/twHcJooENoPsAmC2cauMnXc74OVhvuPB+tXRo+uj58v0qw/FgSnPYLDOHz8ukNXjbzrNOPI88WNU0aG2An4UrTGzlEhCnx6xJ+DuTiVtLo5Q5r2oICyml8SJ+SFtQnRp3kNwIEHO0Sx18DEBXXPuO2Ziix5jhshe0d0J0OHWnxbf8Cl3bCmbXOJu1YGKNVDVXrrqprR7OE/DkWSOy7qdc21WGz3lPgd6jLYf0j68h454X9H/J91PExXon6It4tUFfAOgFVyz8w9Q+zsCtGtbWlPWKimFPWtPp+DZLetkFeYzrGhVPOail3zlnLadJYrRqoxjRUi7BiC05aXROm1iHmVcWqMvZUaEcZ4ymwYvh6NJG8XWSsiKniUMWfSj3pKooaVzQ47kIaPa0a2mhm0b9VPazq1yveCaUU6CPGYjHqxyqeqboNJb6V/hJwDgS9FfGhbDey1vwZClsRs9PF64RQNeJNhZoVZ9OqdZNON+ulc93/PFmuaw+Zet3KFVqwa8c1/Pt3h1bsyunJkb8zJbu9rO4kDsrRFm9xZY1YyrYQbcPd5KzsvmBdOBVYZ85qIljC8cLl4bV1Km/EZlE5SHKslZbmTc5y71MXMeZI7ZucOpPGZsoUC/NqlGLopu9xrXFEFge3d7kBKNKPcm2SSXiDYBR0nQES1z3mfoMKEqF8OFOY8Tam7FKJHjfJRsx1z3B/+/3w06dy4+n469XR51vK2RGZgbqerKfMnVycLepZpDdBO+k4Zm4Cg5sorA5jS93BoEup+4f6uAXsIcawd3e0DWWJcgfRfF7ULBat85e72KoQnMF+LJVShE3rDwL0QJ+KDGfqRRvVDMAjOXmMyTw/F3XasyY80oW3+3ur47dvD27cLc/tDi9cVzBbIpl2Ikjsak69E5PTHScALNVLIntDkcn0nrwLmA9Ynlav3AjMic+PJ2/EZIbTnXADVswgihv6NszwTD2hjWwoPOoFjVShR87tZ9oJy73SBkUj6r4lVsAmJvjqgEcsENbuoZS47//60raANcQVzzruFlDfGiP4GE+xPO52cPSwRnldBCuSzH5qlDd8vExN4KVRHpKQlt+97CjB5eMgWiEN9xhge+Fwh8cNZaoMdfYrakykPtrZGl6ExG6+P+xcpqulDUX82CfYvbUU4FPISeVBeG08SKig1NjNdy4Yv1gYnlmmZcGFMu70SCnYZ8kaZjx4nHYSHuoi0DIkztnnGW/sjJ5+1efxdxk+kpNqM+Cd9tuDHe7URC1TMYu4egzFHuEF87IH9+/X11g8iuscHL9XC2i6OAGM+3wKT+fFac5UpzDJ/youKEYCJpBIMYt5ftRXISM/vJ/1g5GUULWbmmbMtsP9W+PnZ6FdGgUSWjF1OIU6RoHTZ+FvqVmNYMczTAiBTAMrnw8WrruPomJZmehHSRrpYBPyfya+CHRuRkTVOAdcXvyodIgE83aL2AmEx/7OpeHNRceNIX3wozTSDIhPstIPRBkpIa+pHyZgRk+kzPDbWF4nAV/KCe4mF2QgRADs+vtukGT9IVQZkgesAOq55izB4cNnToYOP0Jvx3wewonoe0+qamFiPwvxUgOT0dCMlkb6/qMgafNJ3OWNbuY0Qa8HybcNxKxBYeYUoz+ADSdIngffnyGIjurnH59aHG+8oygxgDMG9BURHLKWsGVZeJhQquDYCdjUzu0R4USohNzKgbiVT28dvGQsB/Mw3Vaa9MTroa/OEij2SMRwoJGpADJgxBSOW+8Hz3h7Y7i8os8IegFiehFTL7KjCuUTt+DYHIIRC2/VQXqMIS3pDuxTDlYJtoIg/5Dh8NGz8bvT3OecuGF7EqXGK9kZ2LMdJI2FpN2CgWLxwMQw9gm1M2a0tuenC/chy3MprLPkCZ+/lzS7FQbYv1XHB2+gjl0arFuD7vM9bnzmp6dcZ1g6x6gLqH1uwpNWbyVzcZd3T+BID7euZZTiy1zWlhG+IbXv/OVVefZnN00PnlylaFqzh/DX3a50eAyWGxKvLDcZU7pVCeho69MwZWMTz6VzUNiSNZxR3sm71BpBeqdAJFvHcQmCncUtapxlNbr/AYsH0zZ2MWrEmoMkZGnfU+nCcJf0txmeRlTpwYRq84qhNQImq5PUs0nvX7tajuVo/6JcMH07hP4/TXbuyPT0YP2v9sM+HiwFlt9pNw+5Tvp5QDuMOvXFtV/TTbG4XfQJDMcI/9W0D/WpXjEPH66WTz+I8HcuX9tZtDNV0h6JxpOFV0Kb8SHZJ3dgM17ICkUnLjPem+Qucm5t92IqdcdANbSoohHuyM33vYA1xqxXRq8fD2+dKxc3R/e3CK4M+jA5HxuulGiJvln7Rg5lYAUEUvdrluj6WY7dG9m74v6tZmR6J3bwZQerJ7Wna7l3e/jwR+3E7t7PybglsAKNrCOCk7veT4wIQUWTYZwhJFu+uze8/ZFeO5IF72Emj5sVo1tfPgWI13nmH/aOrJlK70jNVHlHoZGKoTNEgmTlAOEzgDFTo5gkTQ08IIx+PXN+D74UJhPNt1PnPk2v8lbHPm7XMTtM3Hh13tVtDz320FP/fSd50i023vA093PS+53mZlZ8ywmvcsLPq7h4VefO+nWhU2ccOqwHnOJUqSulTlToOllfxDov6rIEJ0xxUSZ9BvQcxUFQ1yD0CoxRHroBuGYx1kwOAWKHfRhfPk2ugLHPQ3sZ+4iwccuTT+xgtYADQ1sM30k7VK1PtTunmJwVQ9N3UKHepb8u9QlxcLzx9uDUvaqNV7HtAg1ldIbqiMB4CuwZtV+odPpoKPFuXvbRptz3yiVbYMImUEvA2wAyV61+nqKXW7gRT+uz3N6zmplzar0unqYc7YMGqtZoqSm6SRWSUUVcAigScLrMU0nnZZxVAV70G5GsYtgIYCN4g6AApicYqSry1MjRakQXWhn9V2gdczz5v6oh3coxjelOXsNB3coBjer+h0OiuthH6cgRuLMj/6GSzwtwvzVqbArI9eiXO23YcJOuF8MBkl39tBbPKDgfxB5BBFDLAkXnO783evFo/OUNy1moxapxbB6Me2KUUW1ZLyZIUcsqPETdjiHpJ2BUvr1eLr5RRnAJXmG5YeciRGoCk1/TS6BwHiGdEfjTfUDCxyofvNv/sly+X0SJAPumTppB8W/DyHJ8AdAfEhBqcBOFwWrg/tO5lIqNVme4jYAi5m4sAm0UUEI1QuAa1bWbFJGjG5Sel872aWZUPVlPa4VM1ZzfCNZTwLdACJsaqTr3WsqLfx7vLQxX3pDT32xi8ax787pzjfm5zAXw5t2raufc9Z4LJzzR8blNJQeAOJYU46EkrbTXZH1Mu3YeHGXqMb+dN1grflB8PtrNK5c+EEof7ebhh8gEhiOO4ijkKlvK4GqFPEkg3PfZ0FCTi/21mCTtIfM+L6epTHmIetyETJXDHoHSV/Cb+B3Je7f2v94PnqEvkquNPfrqE7kxNGo5am4MfXCQbrQcSOkjj/Lpxv7WOj0TsIiYkLYFkbmPby2Zzbup6eNBzYLqMoyuPXXshH34Fu8sOPd++NOp8v0lt7phudH5UdLhTh6w6bbZSQlgIq7nWHbrFnVC3Ycm+UhLVZAgnidGz144HsSPinITJMEsg1ZEPd3b41ZEyMfv9yHxnRko/UtPGNQax6C8sra/t0HYNV2nfvrpMZjYdK32P+mhQUcc6LcQT0+q+AtIl+srjrqSxl4nIeHsKCWfYffDdI5QtLJ2XBn79nqGsh378AggpDBW+uiZszQOTq0cvHxPixt8I+zz7DRZQD+DDGrHlBB8lAV2KbZHhDrXQYDjgwDVwGJ/64NzedgeBQ4wjevShTRtD9ZrzrnpJBCocJqMcsudAE4K57akOTawL37AYZDeuIsBTfykOkrgEJwcd3Zvufip3PhYbj0nUARsb9iLGgliCxXNbiFSPW2nwNfN5y71p0FkQstYB6U1Gr7baayhU9rSTdgqC7n3AVWxyjvzvKv6C3nHhyqvKnevwgznQJEp7wpnrMrG4HrAmIu1KRDPluoPziH6QfkigNLawZcV4oe5LswimtdgO5X3JP0C8ymdvDtBxjZhZXYJDBLd2ayoS8IBbI6mZHJBtuTFp6NdjBwkkD3ejeGq1FfdQVgmsnzY8MNhy4eELLU5hDZUP/iGL4u7+3sPhw8elRv3OH+bmURMSfBkpOsaoLcJ9JUbTmUUnKzBDqDNOWXLxxG0NOJUim/3G1z/QoWIti3b6Maae97R+gVo8v7uw2R/tjxJ++679QutxhBufDdgjVC9xOSd6DG8E3sPsIkCAoLeNzHf370zvEHAHMwzmo95v7HXSxkSAaKiT9ppCy0VaFZbh0ZaKeS/8yAEJY5zu2Bq67eO3tKD++XG+YNzlw9+xEY1dSgfbmTZTC+rzbRS3a2DimziRzEDgElwfmU3q0lG85pmxtd5DZaXcd/s3hnnSdPqs4QBbaar+P5J2iOVAruY7XiuqmcSPw6BxAg3Bblz92AVQdVOfd7f/eT0zPjDE0xcdWdHomdExMwhZrPnR/Ywjio7VWMItIzNx769zkmHOdrDBxdGLxasDgM9kAoPyImeTWciaVLC31rHuc97S0qximP02a8TlAx8kjdf4aMvrxMuMhCZBwSLVtzq96S7u5DrTaEvY0QdhSLYF99XGnaGOTbjD5+GFz8PL/6ik0yY6BzLjeTDGz+homji0FE9VDjHnrr5iaQEhs8+l09fkHgEdDTeXFTRqD1Hd/rY3iyQxFSlRWj7hwnjrjQ+9GLYOS5ODQQCmEhx2hvWmLgFnQGuZD/lHqx+vI2Ak4BgxzB51PeHEvid7sMq5JfDh6eH5z85bYfYqW52wx5ULGiEhgu3tDYDkhAwQ34Qb6AhMcHxBkKRid9lM7CHqO0159wUjDmQ1+cF47Mwa3wU9s+h0qxPSTXwgYDRmeVy5fL+1gOy/9pIDJSUW2sAuFhhCTgCdcl6CvjFwSFlQWY0AOphXRuwgYaRCzewGIx4RHKdCa1ltEj6lJyieoq9ycoxTA14iZ013eehjzLe2CiXlse/LNBHwVqCpNcCpyhmDBGaRZMUsZaZyn0P5YoWJBrD364X8/jpKCEKHSyMGjwHJ3bjyWj9q+xpweag5LKhVaUyAmsdxajy/Y2KmDWlRyhHSHF6xOHHtf2tiwfnrtIjAose6Ka+z5smLiIODAMvIpieFQxEUkUCWmsoDqZDI5Dnzxid7OyzYahuvXfoTdDAe94ohac42upiG/9aMAWdMuA8PnWhQ+9WPeXAr8WP7pxISqvkD5yKzWx9VvVWrZsaunaHu3TqxXn/TSANslS9pUOdNHXNvFPGl4uj4v/C/SOGuoXssL1deugJ18S4C8Y/UKfAuAMTfkBohnPL7qrJXbG0DzWyrX3711q0E7Zs1YZlYcpWqzdZK+bqFJMNnxFbC4Fdx+hlFJQBs1E+6/7Wvf2dS85CJC0WWoIVC0kqncjUUiNrwrwKDZLphojaH8byCEwBYwRM1f0VlW+UvVkZqm+nq1jVq1ajhkrO6jev2VSpqUYLVEuoThhgqaFhClVQoV4yArwqrHFeeW0gesBLf+/YGmfWSFeVqyROqxFft6bzIvsv1WCvH9Y4b3Amh3j9mEZ3//0h0V06debIv7f5utAfd/BTmjvBhpswMQXI+DcVyzKORblynhrXc6M+d049q3SW9aR0bCo5wXvsK93hxkVqtCWUI9tvK2ug29ApPPAXjSDcz1GtfIJuJvMRdvEb7JCpsPPiYOH2/tal0U3Yg5uv42XQtUa1d69wxABvkGjS5kRlxBNPGtzTbX2mrvShE+T24vDygmcBsjqP27qh4GYxF6ymncErnJpZr+XME0DuSjsJT1YMrA22KXjOGM/PbpXv3hPMc6MXH4/R0E3mEjcF4gn63ZjA3JA2/zD00JZOv93HGh2k6izp/c9q2hBVQNHzwPBxvQf93mG/F5D9CKwDwSzdXO2g5/w+BlVekBHVs+XNbxBj6rqikVIrPciA5Rrn5dGTq6O1S06mwcuLGzP9HpQ9dSFVvJ129CaYWVZntEgz1EdBVeFC5aOP0Vj9mWwHYeT4jp8vEGigMoqUoFSaON+XsmbmUgYPnDLE1ZTfV+Z9RsfFH8sv7ymXQ86MOm1OZnZWRj7Y6VTITB9F4tA+Esy1eSK9v71y8GjTknaXFvye2JRPGxSqF+NdflNEmpKfsQAerOvv1zoUlN7//Hj0Ymn4CCZaM8OgIV3IcFDuJcXNkIGO/hYbTKxhcGLkUu6skzZWFpAK0ImbRhrnHE1Pu4MPnbRHrbsaGQcpuplbMUld1KITJ0D86efyJUR75vkwLMJGIzkuG3QZ32JItXJAKXPCwHxkHweWzefl/d1X9CSWGdIxb4z3INxR6cLMX5W3IGpJO6lXYShnwGw7Tu1y0RP4gVLNhnfvlYtb5c5ZxaEkCGkkMpUdr/2AmYx56igPCOITjSVg4STC6P59RbamS1sMBABZAFRdkbGz3qU2gcTI2WUFpp/wKIKaQeIThsHdA6LIP39tvLG6//nqwalTiDXcniWZ1kv7El1vQDoSLPLIhNhxMIVBww1dBCaOLiLYgH18bcCgvLA0XF4R+YYc3GzrxaYArJd0C5jYar6BCcGDPugnfQTBgYINZCwMo16C46tvhhurFG/HwFybLpfNHCJFyKfu23U4c4DGwbFKYcso5ulMDCQEUaeZ7VgARtjyj+ZKaFPQJxVwMmmkc3GvRVm1ObZOy046hV5jgBVnJPdmdVavQbHAdQxWYrnz+O3N4S+XyrXH5fOLuG+fuCUJlm5LexLUszokSAojar/Zgy5tkTDiigeqRQBTL4U1QzUP5fmH5frNIX5wpWw/hF31bi430j4tQ8C/dEu1T1FlzP5syjGcuCdx/WtnoLcLTggwOn9fT4agF1jSHU56bju5qSxDLngQ/Rr81m+wL9q8Cpnny+X2Vvlil0SNkI3mZ2fjGTFW5lJOuExQV2Z52nHWKIuBrN0mFUo9sDBdAx5AQtfDy+eG56858tSu3MmwXsQQBi3Bk4I0Dkj/ZF64/QRDkGWnzGBpKWGnEk9QIzGYtUi8vPVgePqiB0hoQQVzniJlTdDB1TchiWn5FQ2ecRMCGQUM+T01lsyLW87hGb69aUUmChikot5Lu3BuMARvlTnuzwO+GhkfRWSYq3cFUO/FCe4pQ4zK9efUU8ZzcbMgaUv2kzVorHg25sykdAbP0ls4JJvHC/fInlHZLGbMJB+ZXJaJTrg1bGkOcdyAw/ZKuffacxATyc+4GPYrojjLc0aEnYdejN0spyQUbL2dfb9C9vDO+NQCvhQ4CgswabS5hjMjOtQYJy2oUxZRy5kcr0E+Ct8a/DKQul1hMVo5C7Wy2x+IEXaasmziftt9DKlsDX9ZRAHuGM5WMAEKuNsnQxhKXSO8lFNC5yA5ngZgwzb86SkR8AXdML0OaKf4ZdfdLiwEvJdWt8jmWdlBjnjd2YcZEsK9cv5JHYTcV6TClQY3UqQ3wU1T9nd/gl6U2x/Kd1cRFztO5gE1xbmtiWagKcGsns6S5uK/InOU4htCmx+D6vvWT9CCQzRSYHXw8BqY1n++5BYdNZBChoReMd/3j/akSVn8OdazdBLJhYlhnPYX3FzoJQy/QKVThXxvjAJjQtTZ8v6fHevR62cUyEArBDd/Gu2U88dI5ipbd6IfiZvc20bJou8g64EezFFHPwtWA8c+kLoVvRRUc5N1QotQaKfOR6paZL0TsS5RxDaadXeuOIUCZcBSrKcKxS/wk9As9jHky8BDFYQy2aAcAAhB+qVcrq+U6y9pHbOfM5e2DsEo8M7077rkgTvu3dgJ71UdVvVTQ/9RHMfQZ1RXMXQSGWOA0fWn+mDW6bK+FttF6udYl8eJPkG9uf2M8G70sK+gbvgsxKluh/oa1svgiW89iin2vpr4RlNZC5tM7tCyDo1qtaRDG3rSfg7NZmvIqvkaGK7WnsRv1UtSaiOudqNai95ODAxEYxdSpq+30ibts9AyC8wkCnKpWTRhEFlTKDCBAqtEbZHACgmNj9Dc8BpfFX2g4idUbqhsgwCFBiKMWjWaEK/sonw6TItavabqZpreUV0jWqYq/TkL+TekvRXvRqqH0twI8FCgqgy1orMiNAM56QERJP1cpCC/pwlwWkBC+c8AJ/Z/TgDTBoc8KG31CgGkDcY1svnvDgOjhdOTI0fAJjjy70ziKtSFZ+h0zQDqFu524CDsWzmHRga1NBy8If/BKHN/vPF0eGGPIHmhWZezIRtJ+3jWPVa3mYE17FTci3Nnv8J7rKXBb7AbCR0CecD+EDrC74Y3PjoOo1VAE+7Pck/lCgeyx+awsCyjRhluEfJ0hoP9dA5zVVj1FFTxgNMPME4xJQC0HCmAnXLjyfDKs/HeFXzX8KGifpIEnSDzDJIk6pQ1pLw4tSht9KjBeSFNDCBMgilu4M+0GUPLMRi+eTI6fZ4wtObbCM3lOVHPdMgHTOsI4tGtDnCzXUgI+eMf//j9Bt3/09HTr+7n/tYV0zedr+GSu05IJwcMhGDk16WC4h6tyDPBzjL3hvc/EA80XrNOhbo0bYuoD3TuO7f9BW1GG860hA3gdkvap6FTmP/BtILDOK4h28KIEN2lvoXy6yl3k5W34KkmvKNRNDMs6DrpxONsJ821uVX1ELejwo3h69yKqg9mZSui3ejrcgjLOW6Pd16XK5eHZx6VD94NP713/+EXnk0g/nAynSGa9ivrDXTNAMMKrWPi1s+42Xl6sVx8bz6sISVb5tCfsclFJ31+XX6M9pgY8OLr6sGdnzGi0U3jVhzxWfiO8j/EelHSNxS+r4CTd9LiF5af3o/PvVIEn2bbsXReQkAPFwdkP/IdZrpi0jpkgvpRp+GhnXEjkmQKWC6jL6/Kr7eHd66XG9v4Mp1NlyCDZsYxMbgcsxqx8I1/UvH3YwhgPe4wDKSbikDx4tvy7LXy0t74LU0+IBX1/003ozvuOJ+5hQ15nGJ2crFPSiNJcRTCUm7d+3EQJxAt5kZVhOQBWu3RyvDWOmF4OBMv6WR51J+VCxmgkOn7u1fS9AQZQN84khSzH+wg/ANSxWb3mHEpNM0juAXabUGeMfDuxM6LcT8Rv+k4o7Hs4Pbt+avjF2eHtx/jaRFdZQnIbcnPrhiEYKqYW3JUyr0vekt8ur8f33w4mc3CptY6gmAaYMizwGCQ0pXzJCyCZtZ9ucwvJaXTDX8qWS8qkWpFSAQU8xj2v3tOc0JVQeomqujEXMqgJ47AnIVeC8grk+7n6y/K82fHL36iIu+ca6Hh6kSv1X2EOi5agHKipefpQ1Uuzzclr5vnq+SLXLvsmIzf3izfIYioXure17zE3hsQV8AMdCdbwUbOySHSUR38fsPNuxvHudjaCTz4yl/f73/dAO185hEZbDmmcLELkvCAThr53TX0nBNTM6Reezp+tmSA7QbNEBPc6m+kFBDqJgW2jPl2H9faSXRZnQ8XASgorOuvV8a//Blc/Gdfyq/n2XZOKQtOkyF7iByXBIQLbRnKW41OZx/jPcanWxVC6JqqMqGObPW0T6iWUwcJWfnb69mI89twz+rtmeGF7fLKhf2tZyjXZnJoi+5EO19HDSR+wB/+nepANyBs1yIS9mtRCJoXPHhVz6Bn3VGsJ014tnUk/trF+/x+A9MxvjwuL74/+AxSDCQ7VBgWeBGDLfeLjMwvTwxGM7S5tMnBS3Rfa5awM7jOv1baOSzurEIe0pBh/6kyW3FjisZ1uAttyrCPMP6DbQp42pbL98enL4+fvB6/uEAzdx6K8Wt+5sJyj1OEKADxTn4zNH7mMSnDSMW9drYqhcCFK0a1dvf3VokZqtYCNvCQk5irzsRLco7BOGsxLgjC17mwdRoHz0TG6aW96VBOMb2x0Ys75cZ5KpZLkmMRXcnvSqjz9UIWkwFkEOgpTdXib88SYcaCpuviCFhMK7SK61kza5pKKyy77+Tkpjgt2Iqwy2hYcYUpX8/LxddabAVdbwC1EBqbp6rOkbgFs2LSFr5KeQSoVURe8aqYtsGpIk0BHnDXqAon+6ljrbMl+yhb28aifPpyvHAxVBZ9Lf5spLMAbZ3NxrN/ABQwat2HY3G7N0kWoEc1doeUD049osAdEI2O1VPnAVHwmu4Sl9HgRUIwQTH2Py8oe5LcfzkPenmnEJ/Eni4d1CEp9TulHKdvC4jdd/dL+WCn/HyKq0mhWwCGCeSt2ERu86pkKGDqu4Wv9ikwTYnc47cPx+/O43xdkDCE3Kcmc0/NdgycUuOLVlxQdT4rLmHFCfS+GIIoAp4FoSge3EbHUn2uwAk6xNdSJ4u7Tk36Pn+942N8k5gsf4DO4HuY8AQwXKGeQOgEGDvd/EllPIPHGItaej1cWmKDV3sxie3t/1KjWU1lNZL5GmsWV43hx+hASqEdNGpdtzaqvK+M7FH/12Bt8BnSyVCR33zmrEm1I+UaseimGHdq1XHLbm/KhUZaxWQzlpqz0ZwFZQ0njV5R8qj/i00ZtWLUhDHGizEvpHRf6xzRTAmMCm0wzgbDNNtBNbvV6ZK0Clqwzimv0jZINa3q2FC5ip6rqDav0FSVGSXGWsarF69TVJGoCjHy3ItxI71VZKuwlmZQKl5608SoCk8Wm4HArApGn21RNEg0lW+3K0JpStQOU3VjmLP/B+bcZf88Eb2beoqP4h1GQaJ5U49rVO/fHhbV85elR46QEDryb22XdElIahd1N3fmbDqSGcO9ue83KA7qM5EA2n3ni2YiNbpZzSYhAfxAQAYCBEUwohUJVLsHIG8IG0F1CWCd398ZXXgixFtdZyyyBZMHCQGAtyzo+lnlCIN01QOU/Z8xOZxVBMHsj9/ukKLICWcfc2rTjiw5CPnPQr9FDBEa/rQd0J5FwFY6Zg4ZTlJdt8qhUWA3fPDo4OaeZPAiN3hMzqss+pDQBrUws5wjX/QLGJDflJgHOwgUalEEoINzS+W7i/s71xgBCDNJe27uAAGJ3SSGcAficW7RQJVj3B+85HGJ4xhGGsohHjaUw2y8/ZT2i3qOVli38hPwUag9nbefxhs7+zsXKs520WJMCUJAMjQmBgxRpebhj5SQm+KYeCWe8zxtI6Evg/jHVHrhvJnh5QWqu8CHc0t5VuolUk7d8qXq2fzEkCnAN3S5dl1Ic+26pd5JIdE/SlIBUFvvYLu1wToPQGgGfQr93sPzV51DQR8bu1UXslfn3ZXKOvE+y6HLRJ0XXSTkuJhFooyquSCJhw+GXDBzJIMKRtk0oJz8x2kXU9xot6VgkwDQep5+Lvd+Ge28gn2bq4Bd2W+mrWheCAp00bQEEct2MkEkZEV74srE0K/ujWOCFWAI4pTDfEra5nefp6G6p4U9U01mpVNC5ZfrPr8ybgSplXnmTNkcUgXCnCrAvsi75Ek1sprJ1kRbHeviufsokh6e3hw+eU45T0Acegr3JK6mOVVM3bkfTlOwrIyPQl4dfhWouG+GGVXl83Pl09e60ejscGccRA2z2cgblX/oDF5yAwVL3QlABvg2+VSCHYVUqcKOKTo9IkV2sDmT1nvu5t0sTbmO1wwl3Azt+40OAZ9iJhvV075dGp3/CLlsz3d5TwwcnkZC12olDJPCeAzuIPL965HK3VMRP4A0vilO0gM4DuO9q8MHp/AZ+LL5NhOjPWd56QQLMfV1f1+Zty+7/PSzfdnV7DuAGZCJQlTxEf6q7DumCorbz/NemvShfyDOOswqArChcCTIM+J/sdiT0oxgdwOLPTHNCH2XPCQeN7ppbEi79TPn5jhalkqP2kGB/sTtMCQ6OvNxf3dJPCJs+ixWQS/rcHrKHIF7zXIXYko6V3QwrqQ54VOaqKwI03MgSQ1KCbEHx/JoDQuMdm7sf7432oGlBUWZWEfG8fNu2v5DN4uIOQNqrxO8OTCWvDesTuTSQdyQotQ3R3N/6+Loy1WpTmsgvmCXM1Fwd4YEgFPXlKfYdS5kHaB6mfraPOqW8M6fPtjfvqT3DIWwXVDtjZAsfA3wgTGNLIWwgfz09zx4A7oL/t/QWx6+WXW+6ejNG8Hf7ue9tOknOqVE9SkdCqc6ZUK5z5IcrWXsLEPLrU70/R4mXqxjV5/H50b3N/a//uRcV/hy7RgiPrgADHHMVdMktYmlFCao0WrSBDVeTSZDDSGMqG2ZvcE4nWOUyKl37Q5gOTrMoFn3DF29e7Bbly8NH1wqn23qM0BJZa/Z7nFA2DOlMmRiJpjkSNiRVAm5DLRYQiohX4esxOA9A8pcQuklmTyCGUPa7t10tbaEfGLHY3TjEwAEnPqRnGO5iO99XtqYCzepoEYmmb11JO/v3dG19+4IRV66p/XBZiuhResmY50+JTgrPQxkZbKzDUBM36/h/vg8Gj6cPPph//NdaNN58yyGJrqYPpqD7yQw/Nr4zdGf6UryuB9NBu9lEOYicjIZlMDl60+OEWVPGi4g2yTt9qRzfCjpNk3ydkHFgxDpicU+6Ml4F1sLUVgVJA53kjm4/nV44dL43UX3yqg8N4HkqGg2ncnpzUnPjxODTYJOAKYoEeI6JNQxQ95hwk8BDjenvhBl53fv7/yMXrSQjZI8a5tMFkLHbhOelJ39nGk1ecAvC1I3CwRiR8thc7dc9AsB2KI/HZYBK8tOVgs4xbyVo4R1K6clxezEgTZzxhfe8rMJE0iiPCxB0Lui09xd9XHZAa16ntWkrNCrVH+y6kgar2uaI6fem/fbTLwSvRhs6D7d6ylXfiGvx/s76KyIh0KYHeqMqBti/Q/vM1g3wW5m6BaGbF5Myxkz9jdP+mlGfsW8n7DsjTVcsYBtvZK1pTNJmDMG6KEpcxUTli2+wPwzZp8ae8bMk0utISaXsD0nlpw14cQO8hZQYPiotaN2jrFwxKaxalpVs9oRgaZnBX/YFWoZqJkqStVqZ9XLRiOLJhMlJjrA6kWrDiuKMPOXZ5OXgyLR650asTpE3yKrjOCOeROJ5LaX2FZYewFt5KWKyUBATpFTVkZZ6aTiqCKFpoQNzeF/mggYVg76UOHkVRIkrBzR8OB//NMh4UF7f0f+459sE6JWzOjuDcowAGhaGoLYfz+SnuLrVCYs+xaPqa3B6uXhLwvlg7XRFdD6xzPsZQHF4CbVEimjLIdMfdyusORlWwpiEbxv9LLDWXEHT+6M3z48uL1GWXHQT7IfcoDEpLmkV2ccPtz8rcGeJMJhYDmoSIKDO4skCSBXBM9RbEt8DRVS+B6SflIbrE+SQ3DkwZu2ki2XNkevL/E7CKn3UMA45daGSgGFDg9hxBM5QTBe1emHalngBn8xBnp5fQmKZndeHKx+pC0xoe7ej5aZY5v4BoSUuM1TangAoj6ekicM/fw7t/B9pQ/4Dp0wBVBvZv/L9fLVNd0KM7eESKmR2RjLGoOdRDoj4n31SJ4imIQfTnraDYK60YBLxVWymz3Yj+jyHezulOfvlxvb5dlFTFuFimyEOPIIN8qzN8Gux5w82ZAf4qEAbeJDer7Pu5aJbrc4iy+bjVpxfybHpJHJEUJK0Ybt61p4P1r/6iwoWkxwI3RFxBSQvh/Li+CUk4KcYanDWkI4IHJ3v69Qdz9k49bU/pZz3Nf2v+wZSkleSMY89BiQ90WZ8TjC7yt8U5w3Rsn8Nf+qPi8P314b3V40bwvpmI3VHsOmAXVISoSWrYyOzOXQE8RpF98S55tjFZO46T6HHSJ63FiRR1KCx8FtM+4oIAXXVH108ASS3hxx56LTdY5sI86c+mOdgOkHnjD+FrLupWO2DU7VkPDowrnR4gtPuJ/NzAaEGda86VsVDH6B0omiJcYYhmzr9hwup/CnEOQy5P56qEtMk9wYb3wlnEsgBOZCP8mlhxbSw7uYyYvZKLgVCMvDoERSZNBAacLkAoZYgSFgmgvDK2sec53uGAgJ1igi8YEZFDPib67gTmmtg+/2+xVKR0khoxbsXdS1jxecQzO8sT3EPhag4vIcAdoUdZuoU+Vw8QO1PAsYNKAtsGEANioi9Cl96C6xd8fS7yctaS3TL7IWY2QNfuqr95LTI/USiTzRIdxGc8SpB5AgKx1c2xhevnBw49Rwk15Tv1/UIqJsdFGcYoICKaGQCTthRNHqIaQZ6CFDtpvyrecpKV+SeUIasTYwUwRnYNueA+n4tOEs/gcG/5Y2ynPr5Zebo7u75PLBdjNcEiEv8zDE2/kacXPKMyFbZMPEzTMR+eCZPPF22sSuJShMij6i/oZDVF2APjj0QeYc/xY1/5CJNbx1d/zLGefu72+9ggYg1HvFUWKQwYYsVGx/mhfY2Az5SBtUN5bYsUmGtGPnRHGV3/lPThAbfj0Rw9Q6GPLOCs4O68UM5wLeYUH5Z+bgUc7nniHRw5jZ5EfTfPl+4wcCBCq3VmCmLG4OP54vl2+hiHZGfj2OjkN/bIGO0oznyVuwac/VW/Cpz4fcAWdBh3cgudDBHchLiFu4y1Z9cHrXUx4YHQn/mBMPSJZj5w9MN+k4e3ywnvN+W4JkaG6cv6oknBFjrs5xOoCjkEkV/uAF46Gm5MBnPhJNKRGEC7xNXtYsQXWON3bGb88ICph7k3Blx1ZdCykB8/HU/RsXmoiRju2XaFvUkR6vrpXLVzk4QamqguaDv2bagOUvnjPt3epvtgCxc4spKnldnj9b2bztxTN+v75CNaMGYPo7aUVcPqrUsT7t1XjvLhHHNu8zfUsWdROvdCjrybPZiUaP7XDlp9CaNu2Hyx3KSrdu+YWOCzxCctovB7qo/lYnSUvYksQYSeY7R6KsVRs711ZWwWBbXazHCBI7YWZL43ZnQFgr23ld3LdArOuom003/rE0MO4Tysik5R8cxqZLNJmmm/zl8rtye7Ni7wMFIDBp7cdQLptzMXwnT7tx3Z2AyJ+UYc5oJaCxBzs1bqiZdRgE1Jzz/ZoTJAwhBLlv5JZA7+ni1yWsT/zzg9Hu9eH1K+Xnm6MPT4YrD3AvEK+HrRbYbpypO3NfcpDyohbeFlvXU+/G2trTbiC0te1dqK0d3INa3BAYqUFvuWNd9AYcP3e79biN80Igail1BvI1qaQEeFx5dnD9KwJDnRreAgcZKLjpdEy6iOBvMBmLH6htNJGFp3H/ulntpGkLfRPDBuDYpEaeWJTndkc/bgv9xC3MY3VsND21G5Ez7ahbvHr5vj4EgQ/Fna868s4FUPf7L/Hjf8PN5m7K6W+5tNZ9DVzW0GO0vmLg+6iz430c66p53+oQ56zikZnzWXYYB0lLrq2nVXWD2LdSH8V7PaFLos7IYW6IkXuTZr/a+hUr35vgod3t7W21so19LUmH+YQxHdi5at9Slo+YgD1szhBcOmFOqhkJp1WMRzUZp5ptFWPNm2l80xNm0VR7bKoRFho/gdGjto3+ERg2ao8YY8TYCYGFENgGahF4W4DfYaCsD1H/qvcJpWRGcpxZD/dsJy4xQKjlIyvFUCGSbprQRhjzn6Z0KupmUsuILEdpPVWEHyK2K7K6KqVVjKrwDISlikgWjod1KaJUzuhvnDvZxeTO6Q2Lpp1W6V10CKWgjdG0czRI/Kc//WZHI04ePcKXpkf+5MPFlDcDuh6ghdz8dAK4zyl6hx9ysnKWTMjur6+P6mQ8WFxy06l8eM5ZE1jqBIXpzkzUK7lN5+xgsx4ShMGsMtb9dr9GcMrQepQm7PDBm/LCWzcF2aJM8LIKB27fM9NNOzHvnoAUmesmvpcV0hRU5fG5TUeSgJWzfgQokxIgaKdx5w9JSC1z8shpDGfbQ/Ea9as19CnSWAw256P0JLclCNjt7348+HHDmZijG78oX2CUBKyTE4lATRZHG9C+Zw5qaxkflTojbje12hUwrO+eoVLXmXrc7zNG96zsqxU/QBPDmKm6AVgOWE4P5PXGsXcaLVTsPOfuFvpRXnzsqLO8jIi+31kp6hk1Z+knRwl3NhgGve3eUk061rp/6pHnRn1rx0sXiBULM7y434w5Ay6b6RZ1p39s1ovQjTTxBcn7fBdHVjNdkJRJdXGayq2TCPqaxpC0g8I9zyBABEgCbKvgaIH7uyAFndxG4x3E9sGrp8P1Z+O9d8PnP+IWTtLPMf3HaTNFKmkpQCCikbjfVWRArOhjkoQMOH6+QCQRGdBSBIirutSttwUeJJs2KHinsMHDvKiKdI3MlLVLsM1z+RaYHOs/UW88pJIoEbKZ3OyOK/wQEqkyqODxIR/Cj1cmBj8+YJOA0pcOwSniOCQnMbZER9jIhbmkeIQ/F21OQKd+BZqi+2C8cOPg9of97UsY10iOQw1gAorKO8lZP+Ziega77uJgXUY9CLZno+4ysai4y56+L3nOanG7UgWtQ1zSAgZEUAcNaPvT6qDhQsFug/IhQ6qbTKMcFMt0swki1HqRcYqphpd9e2c9nQCSfkzQGAvq58eYr4jhsfFxf+v68OZdkjx8rVzpi/E8rW7192DnBBpp7oW2dBvy7ZPy2pobKVeuajmeISpyGbpHV7qQT5PO7jSo2PKds32LymiavHavsKW2MbWvtFJ7vHeOrGWS2vO1qNLWkjFIbWdMxWkI2mW+8Y0y9/dWiSg+bIUgbyFQ/1TcRqr30nqlF6sd146sQeUk9WTVyknTkxWmB18cinVDc+qg0RoE1Su8SJo71454eYUQMOL95ITATrlwk1p8yR49Ap7igal7FhbzlNwYxTwFtPq5BoSro3nv0SRAXzETckhd5Thh4BINz19Vr8iZpoaAloN2OI4hA/CINEK4lgxn7WtB93cvjTZOaS1oM0l7NVMMCuXC3QJCG3PQJZZeQTCgSa5gTTS0yYETs5AO8mjdUeccksTdM9Ine7ce1xrQb6qX1DhH2kY1QdsJvAHk13+/0mS8HjCMQdk9d47N0vDGR2cbg2Es5JK5VLOkPY/Ydwmm4rc4g67ofMCzoKJh+nTEYf/rffp0lkNL5FVGbYKorrpbMFIDlD7IAXlhwasaPGYe9JqGq+eJh7ymdkyUNdRG2YvCEB2wesaJjsqO5j76/kFWI5HXrEYhXk1rdLYA5hx2kj4mJwzWG9RuJnEqV3qXsPuF8HyPU015Jm0xur9xsLrtNLl7LCpGSSOiG04mSGykYTOhOK9Rxj3hSN4bWQmONr017i3Sovxp99rM8u0lsGkJnd8Jy9txaWIfeEHRMA1mEEaUkkIYLxzJj98+ZMhwxF3yl1W54D6uhKLCIfPFeVNYydNmMIkEviqiyzAlP6Ns0lSMeRA0vQRoyiE6gjFDaYpLBTyRz9J31kHYrHG08R6k+qPN8dt17UOCOqOeOrrH6omgQ1ZvgMMPPJ4chf7GHY1BTOdscP/Ha6dGN+8SY0X/94wN/D/1DUcpwKHjPoWaaPlOP0KICGhzFay6xksrZpu4QdEId10TEMj6/YAdVxfFk+z4yAQ3alW2gy2BgNnC5eF76jAPpCPTC3vWydIENpiwhh5gwDMC9mwLhCt0HDDjHE15fJwAJZKGQhlgL+xv91sUbir37pRPz0Fo9tOz8uqd0S680mYT6uqdhYbEpkAoWE4GReE3bmAKmoIwt4AKCDEqcApTS+ytLx38MP60etIVFzrwd41vG/ix6rtar1UdTONYem9V/VR1UgPnzvh01ldUB1HcOJ5LL7IapQR0JDkAFkaLYZBHOz8TALL1oAKfJXRgJp0k6x5V3KKq+/DbroP6DBgGV0fBGu2/Z8BXrXdrQU+zptWGlqp1uS60QP8ig7Riixrjz/wZGn9q9oXWnjXher8bi7YmlxhW00wsNazEpJrYzw3NHWuDqOVhbI7A3KA+6FWVr3reaHij2FVZBqpVNao/XNVuoWIzOk01WaDDpiiPqs46RF1UtJNVD/z4JH6tGKY5oWKXbWEvyQ6XalaKsfCajKvy1oNz0TrZfxJz6X+thlUPPUujqr9Fh4Oqh56iMdV/PCSmaq+sHzkiRt2Rf/yT7RgPdQbOqBZ8EtzLcCOY5yBgEbDp08HNRTHr3OpB3JKrX/a/7EFvmo3LjG4MF8OtQRRfu94klgX+xO1yRjD2ZR0hdSrsUOpY11EhDR0cYY8XNrMzwyMYb5NPpo8D2hki/ABPhR3rYBY4LT1+vjD+uDncXeUqTsDyRRLtdtqUrrqwT9iILC/wU7Abc4XLy5NkDFC25fd7aO18+MlZBOPVy+V7hNjqF42Aepy2Bi+h42CeMHwoKEoCi20lUw8QTAlloXzDbk3rlPt389nw/J3hrS/lBmjheb488tcqrhz0j69QzTAfjqzIgNtLVPaQ52F4HTx8WS57XpQWV+EkbY3ZbOwX9eREovhk/bo9cNTkfaM9RV36JFK3enl44cVodYP0HUD7clNWoknNySAiadjgb3ocYaCBTc/JRzaRh0Y2DWVJkXQ8KSQLsx5CfbNF7vMl+XCbjHA5yPirAHz562tqHYk+8cqz8d7K6OFPo/tXBYeDKCSYm8ohVQpZT3B0Cj2ZpxagITfjjVlu7IwJN3c1krWs2Dad4ETDE3zeFFhBW/QDPgd3HpX3nyifTgyJ+HoZGVPtuAaoadkkq6N0ZIIXGBxkc1peYHx8eqa8jjlRWOFF+J7OneglKPEAzKupe0ftmo7nsft6TSrQqoF0wCqrD8+Gp7FwSM90Sqhp9kzRTSNIPBJsiof3sguKBcF5Tn8ZPnhFWzd6eSeJMFhe5Ay0BOHlfnpi8JIsNG6N1zIY7xcfMT419BZP6nUBdPiXU+qmASUhkyHSVzeutwkuG2lRNooMWoqIlEqbzES5/HqbNpmBHhAMm6GBHnASE+uIflsx0CxmacMFf1fekbSh4l0LdU8YKl3YpGvXOVQ820kQd6RnOqsbdSNNIbAbM2qc4e2P1I056UC2FUSlEw+NJIsxC5gEK9HzmQyLsIajpagaTpei5YTw6o3UGSxoxCcdyqtoFH3no0FFOzk9tGO+8gNXyfMGNsWS3n4a3djc33lKRiDbBW0oMO+nHW3Oiu4gljIqxUSjtTyQDR4DfI5bGJZBefXi8OIzZQDmj6NiaMeyXxrzFif0xY0JObMV6R4tOh93aW+WVgmcl/N0aSbunQaEaECJAdAH1g5aguXF1f3dXaV5LI8DqtAL1D0jalWMZ7EFfhJAhGg0lVHCr+oK1ulLDP+XF++XF1+N350ul5bRbnDUmrBLoRf6nQXPQJoOy29P0uDUIM0JUNiAbFKD1eKcYecDc0OVtEbC1FkKLXJNZyJu9UPJqc++jFbOjrALFrTXBYDLLlcLqtwnw75VkfmeqhH5ljaLfCFPIt+Qp16rtTgnNw1rGmg78/AjBMPujKlflxw37ojoPqkzpYYX7pQvbqAdBRencrF7S3Q1WTg8cZRiHlcGzMQBrDFuuogTZ/jhK7HIceYElAlAgUDBZYkGwAzQCwnXaGVxVuAZeH0KPAOTnYcFqtlplsEhZJUSt/70BLByoGd6WWT9LsoZgAac6MzW6vLSPupbs707Wy5t4rwFdA7f4iJrJPUIYdzpJpUDg5drG7jprH6jCRw2HAtYtaA/URbT7CyoEzINtsNBMhnXUW87Y/vrn6W1CKTHwtpnihCuRBjXtEO57b9LpZP1mpYC1P7CxRF3o3OfCPsuR9KIrgW5ukfFsTy4fw6Al59gVxz3aE0o8Kiku8vN2Cz3hjRztuntRFpT2om2SWZPNH0AowtglUIruhzwFGAyaIKchhsRXCE4ZOOLnMgMaaaOOcJzQXQR+k/fWHPcNcZ4HHYfeulM+GCGqnk0O6rPZpnQwykH83Azh3Unh/AXQyuyHVFxK0XdVnxJ49FZz9f7buK1Be5g4B2Fv6yHpL5R6BQZB2Wq56PeDgU+1QmpmsuBjRwY+2ISW/P+X3B1YEur8ezWNP2BtjI8L9nK5dP3FKZpBuYkWaV/oUlq7VFrhepXDWxCtQatIWhMs0PMPjsdAqtLLR5v+hiDx5s63sYxhomxb4wlojaIMT+sTTDdHlBDgCKUVvtbNW2Vs9XIqouNGvaKz/9lNZ/qvFDb/fVayGugQDU4VUBi/ZA2SkboW4H8uyLey2UvRo3wNCLTC0sRklYShRLQyyIvhULpEwB0/i+YATTrPND/dzo8Z3hCBZxz4uoAmjM8qgHAf/jTbwJzHjkiVx0/8g8m9lfZ/mFfvLL7c1QGjeM9ue9D7rfd9CEP3GBoE6BSZLhiL8y4jlX4xFESzT3tChSoMFA0UOIQOZ3A6iaBFZ9CQm/FoCR86mT+8ONtespj4NrUIgnfwXq49Ka8vEihO+zVLDTSwOyUJGOKgmJF3QQbTjrG/ZGpRzVq6N+3hg3pLVMyaWjw1rKjxkZClECK6qmJhFF3LnHFaiSO4iEcszzn/Q/l8p39L0v8nBTFS9r9tO+pc0lVMUsb/+2iTyIRoWGoiXQnoDp68a5cWfJUgZzeMMAY9SbvOe7pqN413S9t6VHHUo7XLd8Zf3mzv3UvuOteAu0sJ3j4FEf4Sgl+JGj0Bo47z/PtNnWYMCzGn94eLFxXFoBxbRkAqM9gvdcruGts0sCE704RjMcAICctmL9fcTNsp0PdF3hjaPhwb7i2Wl45S9tDsB2FTXt5G6nCyVaeWk5BEZqSr5ShIQ9fhtYp2GuSclNIuJujfMYYEda6RYsKFeyRNsOvuYOEwOmBb6nK/TECkAvu7c2Dh09ElAE4qDMUwagQCO4MiHAPZGViIoHVcc8j2HMnPrrtrjx0ygHeWNyOc0LALGKGIKsM4fuS8OytV+XFx7wh2gNUUEBwZxgbSHZAA5tQ3d2rl6GYm3sBJdhyJErDB+cJfwj4zbdnnJ7p+ISDrMPZQSgauqg5EPkqh45zmIYQHiCYHcxsZySxN0e5EfmDnXLp3PDuJfKP6ZJZ6haPbCoh2G7k74CSgFFIYbaDDBomwRonRrrGlYUXTJLh05vM7+nFHTDpGA6Q82LSwSoYTgs+FerKtXLjgkmFStpFI5mpVyLJKDGgU3g2E84d7BSOg0I6FLFEX0WsUI9AkQVxBJ6HbR9IMCNUAkut1TiogCb8Wnn+NgUUsCLFHYZwQhDXMgZqPDGiEYrK/hvFKMSC5RCFMWNziVMyVC7HdCROGYxSZ0qYSz5eyRbk7jJFKqWbofP3OVYZBkMZqk/IC1qfiX9y1SoHPqlqlaOeHmewC+BzGabd5NizfBblYdqBuIqT7tCM1v0BYHRxxL1WEPFrvY3o19A4knp2c6vxvav7Wx+GDx4Nbz8brj8Znn9F88j5CY4LsOmm7UbMhi6Fj703SLDbE/t7f2HwmClHmocGzhBOd5mrFHSl7Hg9wJHXIOQ62G7I+qaIa7nzfLx330dchfJEPJdqG4OILhcNBAycdXzCEz9711N2L793/JC8KGfGpO18WmJUDm0AIOoSM4Tc43SWYRa6PonFKah5xipZeFtu746e7gw/Y8gNCRNeiMA8T7kFyb8P2cfUZEYVhWMiLZjpFRIb513TK7RcfCYnbPZxWito8Fh3+CpjVB/pEyCcpao5EJ0s6wWZiBxlDZNDMx2clhjq460+TxBjrUYgQrSVNSnCQTrXjXxJ/DnvBwzymWQRUdtRxD/b37lUrlxWCDRANI9NL3YjaD2Ho5NjnnIoZ4m8l7NC3QvaHrZDRlsAK7VTZ9o0ky523kJoJjCLqEKb9lr7DAAO1g6hEWvUCvdzXwIYMQarMECfIjE3beaztvQq4cp+5UyavF+nMeSIqCpYXNMSxHISkPtbu84tdHKYcMiELmx/g0VmUN2guBF1e5Q0kxnNUw/Hj5J9WLQIRIkAybZrmAWzCrxurx3gVqS7rxlqH4CXs5JyX41Sagxlyj2efgBqhaifZCag/qfXyhsbBzekozHfHfgt+RQ0VZPfbHKPp05i7HjIucc0iZ0Co9xjmcRB6rHy6RTacsikOOMK15LbtXmDmQU5zYiWJfSiOMLOQuyM0vSCdON66hyYNpVByjAlHJsjg7W6tB3/9jr3fVPWbw1v7JXLW84rxW7MqTs9mmfsV8spgXyjluHBP5UaZwISLUoGZDpRK+jha3FFQ1/6MB/aOs7qMrN0m+aeHu6Uqic6xQcV/4TdQf+XtRNDLzDwzrzXBwxX58WgNW7Y8ONbwMYVN2yqBxZ6Q9YFUr9HPZ6KqxN4N4GDoW6FdSh88TOpAG/xQ4WQeu6/nCFBZ7yGwM4+zL5Wq9ra04zMC+ZyN+tJvTXbumh6yt4NrbHVtYPbH5wtYgxaY3OKpWnsS7Up2Zq05p2x7AKbTs05b8t5O6pquOHrmbTQKrZZaI9ZG2mKXaQWi5orU6yEqn1g7QI1BipmQOC5GI/lkFzHoNhA1OAUfahK0Kq/iuazqs4oHtU2Rs9M6JeKWqGtFdEhqj0qikNErRev0m57bZ4nxdY9I0+tdPNizUo0lWZelE3GTFEY/d/R30TT4qXVgxornXIVx0mrRzRG+veHxEhJGh45gtHRv69Um0NzbayEdWcf7WUtNigrx9w9UVoW15s3EQjpBCbkY0/m9PuVY6j4jqEA3S7fLY9270I/5sW14eInDJTnBZObFbnILGPUfYK+xbzIuD2aVDgGdRXIRysqZqnpjlZT8FSTsNjghRSrgk3Vz2oCyiYlrDATnGlFW4HkKTpbmmbG8MESbAQ+vOKMafoGcFU062zFNjfpaif9bAbMOc8XTCwcFUuOkOtE7CtDKHL8foO2o248YnY7tw8WoQkc84iQEgfya87gdXYr2o7OZqD667gGKRKM6wMFZLOczIjFIXEtor48mAn6+PP+7qdy5cX+l8fjvU/UJBdxUokIr5eTMYA9EjMUR+t1GsFz3LdSmrgesL+i0By93DE3Nd+XZey+z0z9DwDwBx8Gq39h64yTo45CVADzzCCbikTaGjaRvtKMYI6lYMUNHiPK++2N8cZeubRaXr57cO2ZpGDFULdfj+a5i6Z+loBx8GXckXY7Yu4Ip+L5hF9HmenXEV7m8/SLDGuJKoEaMDli6vtBA16PKcIaaQpSaOXWymj3uiRnCVH+Mg14T27sDzRIFWswRlzId19tUgoCwpRzA9zh+b2DU6fGe4/K3Y+E9cL36rSPT2BpZIyuFp/AN5LLOsGxZkrvCZcl7QCvoW9IDYhqtDSHt76MN74612T/K2IzJc0IYnROrFS+izIMPgrGABOElPYsgo/BDORLMHHzIdrJ3GAdTLcUnLYYO6e13XykESgMqeMgvSqcwQJd7V6Tm8DDBxfomridxnPOwazTJaT+3FLosDwhUtF8PMMt0BGRZw0WxHB3tUQ0Jb44khqK9mwBnkovLn4I3qpjlwkCad/ZqDP+kC5mumNMJ2hhIXiui9rdOTT5Xb7MZSoR+uaOaCF9ni3jXgxflcyOCb7mIM1Vy1BwmrdpKX4gpuONJwdPzkhEgLhGxzLGGHf+ZiOdSxvQnnrywc1Rexf2FH0BXamBb+iDu3tgkHfz1Ar3PsnaPN0hnKc/PzbTmfLwSzerD489dfThE+csFLliGZq9DWc9FrmHnbWbG+sa9aZP7kQSFuXsvADL+fxe+ew2btc5c3m2iJCQ1s12k0ZKoR7kzL1AzGhaeEEBhCNqswb/nqQ14MiPdh8NT+3qXTIMaarGY9LqJdRDPQM4b91FccKUMobbPMz6aBsM+Nc1bleGrdF2xCXf+Dp6+hk3UhB+TCkfyysyAzYz2IIyYpw5TnIxQkPZqNzwbLzkiE8ms520XbEb3Giqw5OGA0PnSW/CJgsAUufDDwvDrUV4pQStxuLUTRHo95w424g5g8IAeUV3gFURvZgGUh6ZxgjdDWjSjskNnhe4HG+XyXRXTtCjSroa6DqUB6Wnmx2sNkhPSgRKFqOqAnjng50uFhjhokgHj+tq1QSvwK2N5Qf8IuQVFF2qmURasGIOux+bhXHozdiTJm4Boj8t37HC3Mf4w/o4+CC4dHuQsOI9rFkoqncGadRNVd/iUuUDmAiJKR/Ot5aGfOjN9GQCwi70qiQDCt7kl+Vy8dlo5Szs9i+/Ky8sEeTkMciug+zFZtRHtASv+MF5hxcwy6gB1d9ku8rze5boP95hwxJZYf5C0oa1JdzEtozmazXKTW8XtcF6P0/m8Fv3sNM2JA7AWsK325eYzsoLt5jKxz9SWMcTCVat0PVL1nNgQYQEKzYXUvVqHoiYpWq+EGiKxC2f8PPAaDc7yfiw2JKGYRTKyzvl10XCUIAoAYbhZ32fOblvzyK4ec9DWt0obpm/eaSvN68MrLnYg02RKJ6lmhDa2UIGNMTb2tDkhfuZf18B/dv99XWdlOFgG7/B3un9rfXRrdvDdx+GD6+WC+dKbEjiqETEgwVMTDsXPOZOmMf6H8iE0c24gDiovD64eDO4hc+kh7svh78Qygw+wEw9Zk8IGuYkNUSpBLxSCF5zGx0chX11J3B5+Nt9QGW9145kyYD1eH5peHuR1ge2eOyDtOnn/MaSRgGR3uIoRDeFLCbj0agZQquR2pisYtddbuCEDMrtDwcPr9E3dbSjmb50MoOv06FIMogj/uwdr6NRAKldwOYYRbQdM0wTGbz5gW15Z3I/P+v4jb88H77/IvYBUpT6ZVgxNPC31Z+TZBGoFMt7MVRgiUNF/MYDsrjplmdjER40c6sPNfM7DxUoT3wYnc36GLwSTxSoGmkE5nL425OKoDAZJjPuIyG5cunK+P0rvaf5XuGoHQaAimEDHysIIgQaF6CIgPa2aWEeg/f+VVoGnr7x8a1vb5zgad6v9XvNKRPuLuZuHu5rWgfTuJbiVKru0b+xZMH5zjOBv6denvHvKq4dVyPI39N9uIoDZ5038aamuVDqPXmfZ8LvmOZuTPUyrG8RehXTrfpDjflJG95a7qHNbsx1sXsDO1ltYz0aGMLG+NVJJsYoK2K0QK3taa1OY2lOM2YqFkzFtDvEiPoN0+kv4zFpqFmlWFGF1uxQayO0MyZtDGsBqNoXhf87LJ3uqIeq/ekZVe2hVle1p39UFalVnkZxGq3yL1QwXrWIdJ4q3isiXc9VGS5SMpCpKkn16EQkGob/SzUCLYMaeTZnccRZRjTS/HeHRJqR75G/8yHmXpZiSj3tyFoU3MMOwLqve5lMXZkADw6zAs6/J/F8sPqxfPrBhPjBZILNYp////81525aCzlibmdPAIoddeqU24672AQB5K0eBUy8wp8BYM6ChUoFoSmZwavFD5whVu7dHj4+V249LxfXKEkMcsGjvtNQfQVcn3IH4Ccns/HhN9Am12WmnvVqsRiyypn6Q/JenTCH8rpNzPJi7s6k6+dx0+BnuFXt6GMLzxZ7sfVuoqM8+P0a7eYB7vr147p4Ru+2Dp48Lr9ujL/sMsAGXwnNd9v5JB9EHowR7xrha/0VVK6SIhBiwBE0HaaCeYZXIAssZAh/8sUogTKTX9AGQDvcoGwnxZw3o/y4IFIDS8zzRoOHYKlHy+vj82TwwOn0aE3l0quSNwOeWgB6TRR9zxEkGPFVlJblPFRqHM+gfjhCPpIMGSw/GzcmGJjx27cUN3bqABoPOc9BNtf4zSALvem2DGmXeiAXvg6iqa8DSdq3EcNuyow0ARE4ZxhstxmaKkFktuL7tWPOsmxgbjOqnp/GX5398o7LPNxCm4OukVWqscTnPcmJAL0hS9F5Txmi85ZyAtC+Nc7ypVj8lCHcK4VEREhMofQFyGY9dZfyuwtoJuQmoN+9hBbz3Pw5/v0NBYCG+vU1gf/QbsLy1fLcjtxvhXQoNxSpnjDXArnRzqRqxEOrBXKKgNVUSJGZ6kzHXlEXKYV9fjC5t5fEkWfOsS5/SDmTmqSAL+4FYdtV3ANwvJxAerDjXh7ZqMgInNvZXhpr+kXXGYUxP5pbSXXeasRR3+9LDjCgPG+8L27SxjtBVuA5Ud7J+jknPrlp0+gOnjSh3K+dGEHE9KHcn+QTjhLxFOXqz1Su7Dj88mm8B1veTDiaaRVZb6YvndcSeKCYGnI5n9d/hpyP0IGpnyeT7j36eUaLL4YXn4LsofPxdWm3gMzNq8HqXOR5Ut2nHYwZ0Z8IIwrtCdk7IerDm+dp+0RoRzBd57QJTCumDdgZZ0dQ8VJyNA4SBKEBW7/OeY8AJ7LEpdjirY33VoYXvMPGG1mOtKNd5QPNVbkgy/JxM6yVkQ0Jchp0fjv0CJdvHTw5qzw6qfv+///xKNTwxdgD84JXD/nJhEWIfDS3GbM/aXuZ3BciO955fXBvmWrkgGzUzf4w39PykX6ezkIw5WTR5qgiTif6SdmsWDDirAH48KMFKBYZf7oqasYpguPdQiO4vH4zShqfZRjjgkbbiRkWouGqJuJ+VSPxYE2zJsDoXC/pDHa6hI4FRTuJHYONOGxihdpBqgga3Cpj+ZNTEo4Jda9wNn2n6GIB/IQk96onEOaB7rHULV1UPqHIDUj7PeKA9qRQN/RJqnsWINWh30svlu2m6s1T+CG4eQlCYLlA8G4uXFbSuHYD0mDSdnpJn2Oj4kjIaNz+K1+NXDlJHPNi00ZiyYPfymPOOBdYKDWunn0evb47lvT3RjstaiEDCBG/jHEtsWwDYTMXU6WAswAw+JFhIjebh8/WaCL2k2N10J7dtK3KhajF6QynMmoaJARH4NV00ojgEmD2B/mQtOPMhhzkGnDXGsopGr3ccY8xfr5AvWuYqVMlR2OtpuHb/lc9S9yeteSwcr6Ok8STQ2iMBlTL4AP4b+k/JIJI+TkC9mCwOP9HbVfzHEURxf+VLc5eBE/eLEtPanngalFDdhMXZ3dwP1IJFlUJGCAEEAskAhEMkcJABUG+QhRyWKv4R9gh+S/s93sf/Xp2I3rwlGzPzOuenu73fu/1+zCQ7JpoXyZYMGxIA4KyG0dwsZ3JKi72h7SKi/35LFO0w1nBxXYum/ArWykjLMtdqS67CiTRFWj8y5au52A5F8DmIiA1G4QG7vkrMgwpGMMdIanX4BHjB3S0e3VheP2FCFxaKaDTEzp7ZBL4v7Xkt2nIe+qlI5qoV0Cd6jmiC6a6JqfCQ1ECNow+mS+fn090PM2iqdpVZ4wCZ1qb6WtOoYp6FEdtm85k2lJUk0TtiOoGoJrpFqZVpKoK5t8Qv2R+FXgfgf0emN5PsdgjbUJ1NlOAbngWyjRAbIJbDbJGvFoBqWB/Y4CioUOHCz2KcsjJIxqDMQpgUuz1b58SNKXgYwSEGPIwzOGxhgGMfyPTEhHs5O5e7HOsfHWs4+3CbpyMM6lkKXv+SQZVJE+UOU48mEiQF2lqJaCt3bUbKgbk/sfTyqQT3mwc2XhxyoYT1pvwPGN1kcmNGjnDTM7mH1NtJtzxQdXeOea6mT7HPytW0DEXzSB6YA+DKJ6ZPHRIRnvoQJKXdHCHMjfMAIw1dPlC84nthbZzeBTXC+MziN0fb+5eXS8v3NI0VEgAVDdjVWBkhRSdltZ3pM31Iao1E4UrLydFYsrkwHtjXnML1aUSSS7VxuhY7Vi/I46O0yi/GT7aRF9KH2/lKORBfO3F/XJzEydyX1JhxmZfyrqjPsitxkRRU2Ks3AzWJwqgDnoDI4myIMipPAU7kh5Jb24On62Wj5eYJTH5WjsLZDUJUnewPg3jF7EMpKePjeQ0fIQb6bAbQY+gulr+ehcAuOhQEOZUNltE/bU5Xcum2jjDwNM1Sh2QW2YbBgaDrR7/N8FZbsKq3527vPvDNrOkQK8GGkSUYtUo0o9yhIoLVTO2SJJlHCXNo3Y7FUDagtR9evbN+na5cXv4koz/ajn4Sis/ZoEJUAg2ebAEqcO5xLmGILcDrWfazOeAq4exGKyMwtPFnWdLYTkMH1LaG6JdazcpLr5oWaW6bFJCVcmgfKQB+RE45bEgqmDuHf45t/PkAZIoFSgUk0k0XJDjLCjov0xLavUR4MbxWnPXd5d/R8BeeLnMP0z5fYPs4t1iXxc5fq1ZP6+lOsKHQdEOyT60vBC+y5ubG1iiHWwlflzwRZ3is1iTknYpEtHuq7nC2rFKyR3rr3uzvDrL5dtcQ8jIBoW5bqkP2w1G7N22Dj9pHR0979ggt1px+FfXh6f47AdrusEU6lm1Fw3S0hb5HUnK+RsTlJztSowDtRBW1cnIjKCptjpFzszEXeBMW3aFkOOkLKp7M1wgUDhZeeU5cZorD6hGIPhZF/lcJM8WU7ATbJTtjnRDU785IUk1tVFDUSh82fc03DwxvHnBugm4ZwL1Vn0nWR4YftFK1pNrG/0cSKYSJOFh+xqUS+XkOV1MJBkom3lC3dURjU3TjAiNIJ8DaRpGEA0guLy4xfnRQbUW7TjdDjxgCjYKHwFzStso4LVn54YBux/FcX9bj3i2loeX5ofbT95s3WUXiG5Nn3ewMgAZzLbWn0YJMqQ50KaUMjHqFpzwqA/t4PXzBzuPN5DASEY4q0E3zbD3zRStVS94y/GVtB6GFT6iChjENNoceYWdKJnNUBFjeH65PHcaO3JhtDoGqYSNeujbM3matSbULGbzyOKygYaxHVW6MJo13pgxpK4TgEWv6TO2INDNWqul6WQ1m9EQOZwpgz0ALtTvWX2+8gIkW3tFx79D7CvG+fOKdu/C1O1djHzyLhPNXnewQYdlRVP5eBYbM8pSPq1skbbLFGsSVnAV5IcLizt3UESkX8CS1Wh0CR1KOGGr28RpnsTBx9/q/BJJBskIxwMQHF4QdK3k1KDuRiinApxvNTZzYXlpJ7aF6Nhu8q1XHuycXEmWEz0QYEaPxlc476M25zXPcKHHQOkINc74RvZVJfHxiHStwc/IgHH/FiGc6y+Gv1zh1BqYo/ZUsxELA+KoMxcVo6gX9DMwCNE42IGwDgs980OwmFcXIP9ub7/eXClXFsvFucBjysVLkjqiN0tZFcC+xJcJ2174X4FT3Ph7SirSmQvE2gKf37KF2Kh0CYHUC00tAJcsqibbQdwPJQTJWq5MAmpIzudcIaH86VS5hJiMbjYBf/QwzjwXlxSiBtnQ6pPujIAiNOW2UKLhAhZVVNUyPbFcellefuqp26BJu5oMG5XS+tRF2/K/AZxhcWqpr2YA7Md4jby59i0lc/7jTLkyp1yHn4RVabK6W41q3K1jO0pXIveS8jbtZex2FbbmW4SxgXDBq4OW3m/wVQIXs1WtophOvOLGd8IY1vmmYdfwIXNZ21E20zK5c4a6gFzW7U9iWcvTBkV2Ug9XKMN1L7oyUTRN5Qpc42EaC/iLRAL1cPbEcGMtYLDh/GlMTJdcFmbJmKI+OWJxq1FJ8w4ieMc0ids9OWCK4Y0ob51iq5vQM6tbdfxhT4ZJBq5Ph89pu6uW/q919Grov8mjl0zdlN5a/eoGax1OeyC9sQalbdYXZEno4NVlLPlArrz2veXKpri+IAfJl21sHH6iRab6IwJUUGSCk1G8nN/ZXkl0xkRbTJREVpMkBIRsps9WTYNz20L3QiKrVrUoGtsqonqWKDmjio2pM6LIaMJITJH+3UsBGad5JPqGX+q2vD30TwC5Q+IJCDcA7tG3lSnKVZm3fz3GNXQ7BtRGtOlhpoFLBysrcM/BvBF450Gdg3MG5RS4echkSMljpCo4SjBRBacYPPHAxIOFCBMqAMHAQYoMzDYoRuQRoWyiOArhROwINhkVOk7Wmnw1ySIisCr3KM9ckNac+DUIvu8ulotLTjRJBRAVC2MFhJcLqUSQiW7Ew/1RPu0Xr71rZDEJY3H8yjiVZ7D/4bHI20bdF4MUOzjqvyitzoEx3mcejNJkFrv9e7owkqg8tF8MdUZDag3l3bAfDvbyfjZJs338+L7u4C4P5vNwD0VSoKzbe+/vmwmcoon4ezfc8BbF4GF2tPuRv/uAuzuMsI3Aj+NBLT79enPD3/huShYj0yyoPLawYL9IJ8gIuuQCNjE6HzTX7VY/Lz7EhIRbJpufkIwkCEhjbbSyzxCTGMaKkzn84on7FBlY933zNwifhPM=";
\ No newline at end of file
+export const w="eNq0vXtzFEeyN/xVOvzH2Qg9u/uCwfae85/uF24C3ZBOPEH0zPTMtNTTPeqelhi9cSKEMferbVjbIGxkg0EGIbDARhKXiGdw8EU0F/31foU3L1XV1T0zgPc5Z2OFZ6qnM6u6qzJ/mZWZ9V//9V8f7d69e+/uj/7jo08/+ej//Y+PgpLtjrl22bWLH/31v6DBsvy+kmul0+ZHf/3o04mxPf2fTYztnZocsSY/mXKyRz7z4Z/hvs7DYWmg386ND+NfIZ0yP4YL+cxINzQfDAf6D3QODR6Yh9+aHfDr/fCDfKrjSE/XPvwNfBvys4P5yfGjFtw/MA1/I939zrQ93j/vO33QPuPmR7qLhZRZLKTxLwX891pTn3TbOWv8s0/HuqbtXOdnn050Htjfe9jNZ7p7vZ6u/b2H9u2eBXa9h/eNwoXeff9udgQHemf3THUcPuTBl67OYLAzGMpPdOwKS/0D+UH4NNyZ9SY6Rg/CDd6RLujfJPy3Z3a4bwweU+B7pbTplwI789Ff//f//sjMmHbRMAuh4Zsl10sbVuFv1nHbgqsfWfCrfNpwtWvmdGUFL1Vuh3nDq9y2jxuV+zkj5769bE8bb7+ah4+V2z78orF2q/7wy+3nvzQe/Vo7+2Xj0QpSnPGmDdNwHKsExIyS5Xz0n3+FTthpt/JLOGv5WaMAfKJOWcgXbvQyoQs3mEbUJ+iSFabjfRH9gD4sw49y7psH06or0I/q8+f1rSvQ4lqlrGdoveFuVO65lm9l7Qy0+lbKSvtW0bDCnBXg6Cu/pL05uBl7K3/m4KPxXCOwMlY4/H9e4+WCUVmxU8YfD2bhD/tauT2DXVpxjbdXXfhF9eo31bMPqhc3q2c260sXGidfbr+8jU+H6SJhK1/ipxR6ZcM109Q/y4chGy17iXfz1Xjn7DDn2vyyP1K9sjLG3//+d+gWfHfffJ3FLlF/6je+gAuNV/erZ0/TU7LmS1bKaNEv8dr8yjq+D33+hNAHMX/guseXXXyTzZPoYT4wKhu5dlNoe/NC7fqpxBQqI80Wc8jyUx60x7okZ4+6FnWHO4Od2IQH/OZEyL2orJZFT4j/5eqpdeC//XwRugAtpdBLmYbeBX4QJdcuwBT8Cd9uYPp2CSdrYObgiXnYhiRhkv5xKYQRw1QtG5XNFM7Mx5cba08bP5/Yfn4J+2k7cmSlv7hehokLctozNtNuiGTVJRyQnYb3Kq+0ZGhgI43vq3KCeeP1Uu3xc2j0rTnLNaKO8LPNmBm4AE00JN+bM7PwL846ecUxEhdoVVZWgT13ArheneXFWH30PTJe+x2+5kuhX4qmuxWYllNMMLX8YsEKYK4v0Dymr3ZgRKxp7C14JsarOMvBBmVz3jGNeB+IuR3OmoYHfEqGh08dF/U6TFacgZVVedGGO2C641XP8QJcMm9OwCSmLlTWoRW+HodV78Dkyi8YduX2gkGz/u3V/AL8fOebp7Vvfqv/dL/229mdMxcbr7+rLt2vfbtWvfILDdTKwxRHLo49Y5SCcJo652VcE9Z8YMV7SGJSv8Ldk9e0rkE/Migdb2aiXqreVF+dqq+e4z7RTLJLtjkf9YO6EHglN5wW/H0zCEx851qrTc3UmhPLix7KBjKu/JpDmXPqHLLb/Ll66gnNvHzJynkl5pRxYRjEChVCgo8rmjQmb6/RMpYjBI55XMHPL/OgGuef0GSz55PkmbRJol6s4OjZBTjFQBXRIo49wPtZElOOvpoFq6cbtWe/RGsa2YHWgkcYrWltTFaGxbcbe2eqtRXPBCt6IEbEh4fl21bexTVpLtgFD54Y0A9gnfhI1vMtvub7Xh7mcskOrLRFg6ws27M0N6Tg+OMBzY2vntSXTsCodpYWUQpbrlcwrDkTfgRP04J7WVaZ8LCaWZOsoks63wQ7xQUng5c1Ih7ai6osxwYU2NH7wktyPIEVf3hiQKACER1w+319CcLYzn9efXwalqB6aTg6mPHzBiiNktYHSxsWCLtoKqpRtWScYIZPMWUoTky/ZKcAuhgk6v2UFc4ajp2urGZJ8MmrKO2tYsHz9YswMWiRHScolDHst5dzAD2WXQN7AD+onVzb3rhdu3yudm1j58ar6itc3UDRBIVozJigI+lV+maexe+0lze0/ljUHey01o56HTsS4y/1qN4PeCAlQ8Ax7girVe5O9c7K9tZ5pG1moA+xTrE4tlAfmdOu7WddW67TMrY6sEhVO7a+XXKMt5ezCLuyIG8AgGlLtPrqQm39ev38WuPez2qJzgMRlP78EKJVGlgLoF+Cym2D+ft2jhlFvC3RYuD6AV3Ukn/loVRLIWsivRfbL27AlKgtnUP5ibPBKgBWiXWJl1YAVz1fwGKeGwoHyEvwPkAc4syQl2AGlKXoTUWq8P7izk8/wOhZD1qBzfeLR0AgoJmrnJKt2IoJ2ZptZSWc1rnWt25FUCPOmx+86ecsH4YiB6qglcPtjhwmvfHKyoLx5gHMPhefu11ZmY+98rPfNe59Ub0CGOeWeuWB5YR+y5eetEWivojh69aI1iFfLoQWvUnYI3qPEiZJol/Uo9ACbYXYHp+CskJQ1RZJR+Flm67TkwfwyjoWAAdM0sqvuCx/DdPC+Kh/vrFz5tL2Jki6MzvXvmPLA/AryDFkCxK1gEYHywBElyYg7CI+CVvrBnVAtJMIlL2prMpfHUx2BtbCAinmBVoH+GgKKKHg/cK/81HfXl6pnf8aVkTt1+XqqfvVRxdxvTkWgV0j3lWWmjnQFqGXQw1uZyorpOJM7G4aViYgR89O2yAlUV6//YqMxWXqzzz3CS0hfC/1Ew/qtxbr51bqq19WtzYJgdlZI58umfjy7IxjhyntwWTsoglTELn7Zo6NMHkBlBFw9mUvkpwBm1Y2jiueO4s/NF6fomHOpAF7GhFjgfjAeMkGMNVoGdJIg8AbJlXly2tmZdXPUCNM/wLOvxzLHjY+39ycQfMKJ+Dpr2pf/ACSB0zP6pU1sK0QyTtoWYjRlvI5mAeD0WBB0wC0b+6HHDNqouUsD5l+kegFwvDKuq+Y1779uvpog0ZsA+Y3dO485MpPQeikydwBZibIYDDEYRUxO9O1syRn1m31M3QKUK8cJ/mrDYd1PxnkYH0aaPbl3D8uEQZoPNqsb30N1nj11Tdg9NW3zhKmiigbBEvhU9lhmpHF2dRP7EA+sjrb9TBmespuKaOT+6IszlZ9id6NUUDEiDACLEDlpSD3iOHiJViRICZSbCPhjK88nDbsNydyJJLKQjLAums8etxYu1vdvMZiIYNmLSyhomXNwBsKPVRhUjbgLJXczTywwCGjdlCMuU0xlBag5IPmX8nMIxiP2Mh3j06OErl7ALHGDEt8oGm6aDZf5PVMz1Syq63fhwfK7OA5Qu9KcG8Z0KhmbBZIrMWY4jM0ksxiLBRxkoZGjPhH//mf//FRkPG9CZSS5nEr4W1TromEj62dby3hUYv70pq9V2int3ZV6Y4gmnZkKisXEEw8sJBbO6PaOn2Svp5oKLqHJ+FbEb4d5Vtp9qo0OT5auTwSzg7l14i5U1p4MRK+i2bvge4xaHJUaNaAZn2/y+ZuNrSViR03rRO2bsLObbZxdQO3pW2rjMl/3b58v3HZZFS+w7hradjpRtW/bFC9z5pqZUTFbZdfiwDeM8pKqd9+Wjv3ddJQ0mySFjaBbzqePdfKEkhA/6Tp0RZxt8TaOGN/DV1S7rCM4fWlCG3SvN2snXvdOHkRAGYzvE9A7IjHh6HZBIBtBtPi2bsIC3GmJVCjAIrRhSbUqiCrgoSMVZuAaoT+FBZpA7kU0oqBujbYStKROMYiLw9DGRJdpxnDJEBTa9ii4MA7gEAzPkmAkjZwJA4BpBJuUsCge+EhOETzcf3cjwnN3lLltlC0RKpMkBnXxxdXQPkldaqm9gITrK//IrfeIeNvRoC/M9Oe43jdH/0HPGCAc2GJtXab38h9vHfQcG16tm1+kA9sJ+eCRPl49+7/+GgmbRahZ/O4TwhGTQH/izd6x45p96WPwY+P7cHtQ95cBDof7wEe/HEXf+Qvez9+/57jfLp79Oj44OjU5HBvx8gn/uRId5gdmc4dPTID/2QmRg+nzPHBw/u6huHzoZHP0t1+dsTp3pMdge8H8Dd755zJ0aHCfvr96L4J+M/Q6P7ZoezI3CB8HpzJHR0AEgMTo4PjHf3TR/P94UjfUWjpy0+M9o58Nt9twRcrNT64d/KT7k/8vd1AqZgZ7fKslDl4ZP9QZ2bis0+z0L1P9naN7R8q7+va1dNZ3pXqOHigtxP+v2ey49DB3s6xI7ND5cNe19iRwn7o80zf9O6pDrsvB1zz/SM9HYf6OqyDBzp74I7h+XRuoGOyfHhiH9Bote9olWxrDoSSqWx7WCWiBZUqb2JUfoX59jDmZK1fu189uxK5V3Mw3c25DNw1Y+rbJooBrghJWieqaMEH3AyMEVKAwXZA8MP0KJKBBeK+EAbol5izBIKI/8DhX8APGG27lfu+gTIUNFhGiuo/HoCieZgy1EX66fbWVuPpT7ULp0B07yxvVV+f4pb6jS9Qt5SQkS0Z8WCDkEUgWuDtO4tPKWO07SqrV9k5XNnUBemEbebL8iLvmimQYAUP9yjnhCGaT4eIPsvsoXh7eQFMCxjrBuHwV8u1p99UL2/Rep1HW0K8NCABStTLKWxRsEFbMQeEysCD4QW1g0CqPKksp3QOrgBWgscpcm0GKOdjnPhh2TkTt0BNwBbYFTOEiSkbDHIcg8DHaULPBEDB22uz6MZMGyGoJ4HmHhKkQVVw/n5j+WL1yj93zpypLn6Hvrxv14RYTEcDRGQiUK2XM9nYMFFq07YtAVv0XAfwljIgzsWY9V5UVqfFtBUsL63XH1xACeO5hsaNBwnkCjAm25yLO8jnhMaJAJV08scd4uzp173hOBDyhpdszddP2A1f0pxvsbZU7YTgeBwaO9b0MewKOp7hq9z8UcOAHltpMpVwmoIljMpPDgPsN95d+prAcFY49mld/1C98mX18WmyY0ynGPWeyf4Ec6tAlDTypgsTyyygWg4dvJZh/SknwbRwY+N3BPfwDrafv6reWal9e5leA6BVXA4RR+FFrjyDdw2mF27XL4CpCu/FCv4GSKlgOQS7MIKAlxJaJGGaniOq7bdXUwiEUEKgCS00+MNr1RM3ABXAZxKceLucZ74FVAtAIK7UyZOpdQSMRTNLnkyYcAgWyNOJhMQbU9wf4rC/Ji/ZfV91AP9d+qHx6A55cJwwa/kmcpBdYfa2hUYM46qMEXgFmo2+CeCD3qRsgXWObmLAyWgtzhoIaISn6uq92urd2vWfQG5sbz1kT9WMY85L2RH8RQWRoLgCmGPE2dKMtMIsrDkLW13Zqjii+6+Ae6LkNibsTyx3bv1YvfPP6tnHJEDtoBR6hsZarLN0YPu+SZgsABnJO9SAHnOBFV2wQnEFZ/9xRpOIpdDwQH/8zncrBCmv1L54zbY3iNK4eFSTF7A6sSTngWRDbwzA7psH05qfFSXUixu1pU12qYqNQp24MDlCU9gbND+1fcLAhQHC5KOnhhNU2yokDwW6j96A8PjjAY9L7hduP7+A2zsn1rZffKl2DdnXHg1L2zdEoRj1Q05PFop6L2DIhcp6qSV72l7Ht5nsQHXpfv3yYyEq9U7wAxUPBPiiQCgpFxquDZcwqsdbK5FMUA+bPNn0TTjR6HnXls7BBxXVI573HFiQjvMX5UHLRO9COdBYUSuuDnvvkhx1RkJu6ly0jQwbLLnjllHQhkVOIdEOCBrkNEctufj2aI+CR6WClXZ+uVjfuoJjUmFK4nYaEoYoyX1tDkBSbD0xLBmYJJrlmBIccSFIVnjVNhKspFVvZS1Dvi0afhpb3FAT2mD65YQTTb0iXNnfL9Wun+XXgxgBbsQ71csRawzdgYpNgd8Me3sVKzmGHC9p9DbS1t7Xl6ovn/BKi1PnlwIiP4W2ONLFaCkQDr30+EU7UPbAZBmlOJMSCt155Tzjt0JycefHb3e+eST2UJfOsVyUNMRoBlWogc5VvRK9HSe3nAmKLbH7+9//Do8uo1gCM2iqrm3IcIo4U6l2YAYjxmwhUtCq5IvyIcZkCs5y+82JmZgseXGj+mJRSRGMSLE4GBCHqcsRduNGzM1o/jXzjbGDQaH4UNxwkEv3yUNtxBkKuV+55xUcU1NqCz41xLQaeX7eXpuHhYtOXl2t7dxdrV46W716Uqm1fNoF3EFjirSaCKkBmpJlFGcjefJK0hi9vTqL6gVfmuTSePY7TBU9zCZiJ2LYfHsOnb0BCwqD9l0pmIgxim/x9VJ0pZegHYhfeoS4rYIbeSg4yJGIvcH3V319Ep4oAJb65RUQIbWlm9XnuKfnhtlIglhFLy8NN4QhoDQRJYlu4QLMp1V7ySr5lRVxoUUPYE3Oy3ADnXvtuxscaID7Wy767EUXxEsNfGuOgot89oiRC0S1ajMWHgZ7EyvLNpqn+K+QBOxG5jXTOHEe/l87uY6eZFoz5GhQBNUMBtNzXi1XS1wXq7RNJ5THGlgJE8FFtAYz9+01Ge+2tgEotfH6JjRuP78s12yLTvwJIPDfAwGSS/dfgQCIG9+NAmChvR8IqOFnzLzjCcdrRo+E9hZg3tlzDIPyaUsLYqXoXvpHD12tL12A/6ug1RnPc+SgtZhVVJcRz8ovBFYNjRny0nkoyiyYNLKt95t8U/OC+O91g/wpH8i73B9tPB8JL0drt0bSvcD+G/QrSBCqWf7K5k86FZSpT8KLjWp5cyvbPjKryZKPG/DaNkXM1P3XrNy4iatboGx5RshCWrbKpI3Zs62ty7hBmbAjdQMyZjq2sNdwfK0tJmUhxW2xmEEUt4I+1Dx5l22iTNYPswYSAihhfSSBPwPJJOD/EOz9HuDNhP88+H038i0kcG8rMKqCzQiRMtX3IFLRWQ0Vqiegg0IdDDbBzlYIsNQS9+n4S+GuJnwXg1sa0EqCHh3sxMAUv+oYkngPfEiABg2pxGFCe4DQRjcnlHJrOPA/Nu1bqDlWOR+ocFprG7HNA4tq1Pg3vDjwns2ed/5Sbfm8j57Y+Hnnz9T2z+522z8oCo4dwxEl9oB2x/aAeLPnE975oQ2hvdHnz/a8fxMoa2X6Z6fNKfnfnu6uIwf37zviHx0bgqbD5tRwubtrYXhoJjcJTYfgJwfxGv42fWjwQAif4eP+TP8+r7urc994fmIoNW4d6hjK9M8MHs9NOqVZ+uXAuDvRf3xmsh+ojqc7nGym38la/fahwd7c5HjP7PRUz7SZGe/onsl1T/ljQ12FcTc/kSp0Hh2yUx2dAyN9vQOjfb29BwY+HoYOwv/LgAEHDw/v39fXe2Rg+OC+3d0dcMUbGzjUUYAOwNVDcOUAjCw3OtK7O9Ux0jeQ7u7abXaYXXvHOtLjHVPlnu6j3V1em/QzV4JNX4v0FO1pBImEtUWkJ8WTrOTF1gl6RiXq3khxVMn2y+uAMUC/AermLSKQJ3nUc14mhrQpwJn40BJTQcWyVXB3eZ99gTyU4R+XEBcaiGaCeFQzcAR2Oydfbm+c3d5aTIQ0R33gJVgMPR+06hwgpghkm0WPMRS3azB7M2twnFYMYNeWLjWWfwLwE4Xl+xk3xHszMWzNQ414ymHq/BJs4hHbklFiVBE7Yau6CJtBdKXVdn/lCXp+zZx8lIDO8+Sop1AO2g7zELDrAbuP1rdf3KmdvbqzeFvf5ysAJRiYFqprMEcfpWWasTPxo1cnmblvr8VZRS4N4FS79ANzUl4NdKZJZgIWpSurad8i3Z0wi+y0DVemLTlb9ESK22ATooM3o7+z+ucvdq5tqRdmBTZTTr4xiiO1MZjBSPJXYabqst4H9H1dLRmMHfVO8Bu139wsUAze143NB9wZ3MFYu8KhmPT+VJeEkZLCtnA2EHkqNgLznA2G+BxFWYDamTYo4BtQeZ7+wYGu/Fa/fa169yX8H746jjVv5NO+idBZkmafmkacG1pTVzTZuZakBYs4JP2UXFWBV0LEHHiJhSXik+eTq6r+4zf6kgosUCMcA5d8RxkfNyBss2DEmZMfl65VlguGxl9cVFxpP9HDtaD4Vq9ert+/RNZMCcPcde5irzfvgAQKMaxZSK7AdK2iMHSssEj+Gd+btjArzVjAacnJaSIH9aswIBcNgERCJCdf1s4tbr+8XX38krZN4X377NONUs5kCl4Tcy0frw13Wocr8wYgLtrLJydFPDNv+/lmY/Fi9fxN6EIyOU/vj3gAGO6pfBRWxisq1zZfQ4RU4AVJeblF9m9jFH5BhFS+OZFqSsl9/d3281+qzx+pfFymZuKD0NNwaYNT9UI+hYi1w4NOsCNQKTiIvfWIvhCfsNDXc1ZMIdIEttMeN0f6UATjCBtR04QcmoPmIqlAvB/RUhCmkgqQ9gTjPIXHKc6xBSvlY1Ks4g4mjWV8U98MQDdYGd7/pvBMhW/F9j6gVVg5ppw6lftlZkn/yH3+7ec3tl8u4S6ottU/A+DOKmB2UibmUWrHkT1L7+SX2FGSTGNepCRX9g40qQrZzjaCpixQDr35OsTAqnJMDm3+vPPjF0oOETqVNNCGLTRn3qnrMf+ZfkEy5/n5MINMySnwI/AS07KZU+SZzGDApxmbLBk0HqiN6dK2Aa6tIsW7ag7J6pULtaUL25t3EpMF81f8bMRJSzgIvJzOT081UJc0tswQ4/opUPTBLHMFlrVbrxovt6J8g2amwd9gudlZuwQUYzHl+CAqmzkLYyVjcegIQe+Hs1Fq86M79eVHHGlu+SBl6S3FUpqNGBve8ANBL+iT7nZRg6aIMinq29uvbwFZHCK6ySXdVhULmuRhMv4bdGZByEQAWyUpmmmuk14QG39lThbhHc3nmzDtQUXgrtnW3eqVtaZqBWI+goBU6QGFRKECOR2bSxRQp1r3JME92hOM8U2GJOddM9cq15Wak5muiI3yC4lM18azG8lM1+R6A5oOoJAEW3zkFpj7DkZf6oyT/NBPzEnxl+cVz+3n5+svycfHxCPWIlAVAy0Dg+UKZ76KJty7G5XVJzDdHAMZlAPo6jf1q6d3TnwtPEsB3YEDKmHeolSrIh5Xp+qw38+uLKdU1Ev9u5cc74Ixc4qU8PrcA/kRWEotxtaLt4BhGAH5qxCUxNI2ABe8veaqlYRQ4PwvIkUEaAqfVWI5caRRkqkKQYrzi7go+gz24/Tl5A3gCVt+Dv1aSthhXP+CCyCOMRzFxACWQbfR22vU7SfXG69vVl99U73yT0apikhcuAno7tsZvpyA9GDQqHZ2uj6cjuP32upd5BRH7i2YwdRzLUqBk1GW4aw3B/jBUlGWnCOYRqmTo8olHNe2c+272tXvq2cfsJcFZbxc560yZAPP92ljrkB+MZ++kqvK4tgjmR5LWXfIj6Pik6mxjbU14Fw/v9Y6LzbeExVxzbUvCjJIJZYWvW6Ly26Ly0IJroQy9JpQhpY1XX10o3qa0rFO3FBZ0xiLzTQjwSDzplV8X9QpEczHeCPeoWhHQnZD+BpAjcU3srgfAD4eP4nhj0Rf2uYdKVTZ7GBp7+Jo9mvE/ClJX0bShxH3KeiOhJivQnMeKFO+hSHf7DVIOAt0N0FLy73ZYle7QS6iL7FFghtBr6/yFknSGoYOKmu1jRUsqAgDmKi821htYaRqVqIyDZPGaBtzUBe1bIeFpXZ2WML2Sph/cXOrydD5MDPnXSZOk3HTbGroNkbclhF+8ji6l2QVqldkdVyvg3l0bLeB8GojvBV8b4eg26DnBJBtBV41zKyDZfz1O8EqBwJGEDIGHyV2fB9ubAMWPxSXfRAoS4CxBCZSMCgGupLIJwF6KNQrgXdag50mhKIkgoYToknYhBRawARdfbdU2REyEPpaIoNmTU36kjfLkio0aorpTl1ZNunoNpqxtUJsowcT2q9Z7zXvAnk9uBkzYx54zx7QO36ndoDeTUvs/7zjR2r3Z1e73R8vc+wYjiOx97NL7f28d18n0z36Kfx9NrF30hq3Jia7j7jZyY58yhybC+1sbmrGPO4Ml+3s8EJ2asGB5o+HOspwpTxnZ7uD9Eh3KT0y3FXu6zjc39EN/znU3+F3Hu/r2D+JH6eHu4rdQ3uA4tiu3BRQOJ4a22XCheGugbkwOz0DBMd2FaaAV3rv5NRox9HeDre7Nx2MZDMz+TFzbNdMalch1w0922tOjI3vnTw6Dv89OgMdBGZDA73dpSDNnwZ6D3VPdvjItWug9/BQf19PJzQfp4s+/B2A38GPsB3v6J0ehE+D/fxt4P853DHY39e5B8bhZojKMHzvabXj41Pm9d/MOctPB6Q6CaH6phOmbZ/zZsmMB3WSZrMDlzdplvO3q1c+r169VDt/VzgriqHh5uxAg15x2gy6UD6WgspqjiPr76c5CkFLqTh9EVO59ZQKnTIHZhTCnMM5G8HfMGzDsVImVxri6y6IYPgBDwevy8t/PKCahA+p6NYJRL0Z0pggsCjwnJbak1Ow2mr/3KguPQb1WfvhKscfYhGwecK+7rwHqt8plaxAc5NgOQLyKsDHtKl8JKIZ1rdDeMrGyHhRIxHZQz/iNRBqt+5uP7+AC/7ROVUDQZQ7aGLtZUy2LHzKwYCvWQrM469gUdgYn4MpqSJJ5tHjxo9oSWTBaizavlGycmoMtpOmJGqiKAaAbQ7Co6x4hPC+4JHRprRdNNizUzv7exXU7i/f1B5uksccZFkA0lEw4VSPFUxptDOU4FEK0O60MNiIxRBqDbA+0pjiWqLE1seN1z/ULuODd0DLhESrFBbjUQ1opJmxmAZHJ0tZksKwUaQbjx5hwQ1JXQY56PSp6JxVCrw0PQeuMweiFYFBieLQABbxkiiROZjChYF79I2XP1dPLDVebezcui0Lx/nWnGc4juy7jwkalKsu6Xul0ORMXDD8/wx5pJSgXqK6K2kkb8s0a26hbPgMNNqOCjuDGXic/XNU/yXPMWjbr5drz081Xn9L6dagWvlNUlYpru60VfKKWGEAN4goGT5qcnQmuLkww0Xu3pxA0yOTYFZ7+Krx9Pfa+Re1888USzAdcqCeCjGmGDo2V1nNRCwzoSXwETegTkbzZIGpi1o/JKyWq4ubQLt6Ah0zpRTcB1oopWh7YNQGWK0Go5YVPa9gcis/OW7URpTgwkNRXFwTLIgYF8wbd9HT4IZZjlkJMPMo0VZ5uKBE7bKN0SobZP2ufoPS9vfTtd9/ZzvcJMF43FbALGNRmrdGSzRi93UOG0w1SHDYvLKzvKk4YGECT+dgoZfEDCRwwT0o02fQy0DlIS/cM5s7i4vslcI8nZzn6HsATEEzwFvS0fUB0YvpA50svDHXzqEFF7k1JV2A0TapHkzqRkuGdppfXq9/tyXqhNiJ7sVJJXvZRE7vJpGNZwJG1BEo25gFKKU0vpdAfc9xaR7hX/j1GxD/QkKXYX5LCQ2zxcOAITMFKhTeBVHkWQTt07KZKdNrWvFJq+So8Mebm6Lcx2b197s7N8807mHUIKhHNLrEUnNkxQCYXmCYYEkE3KlyrTlLWOzo9tWa2GSvrPNCgI/Sa3i/9nQL/q1eXaNaAfBrYjGTlrU10CEgiAlhjpKen7FKEdBFuE6fRbiir4twxQFAru3wkzBzDhco5v13rDGBC/afq7WLn7N3EOZ5zpURaq6XtRyqJ6LR8KC1soLNLA2cqEKMS+X1YrSxQsy1Z4oDkMwXY0wChEEeGp52mLIFKONWKyzg2wV0Rg/AfXu1SF7qMqVWyjLBX5+o3f4dcyupQHBAPqaAlkZG8fBKVt7B7c0YDywXxq0RD4wMJnmWJiYg31DYVS9d334BQO/L2tNXPFfKTjbOw7N9wDNhgXZRrTzoMxmPgTCSmul5uaLQ0koO3Zug0GA6ouhZJsOxdvtFY/l+9fR31WXEJnQbsnEcUeGJpqSN27C0oRfxyYQlmDIOFhV2IjbkvRaRFzFGjbXf69fWFSM2NmynWDTj/OCJlUAnpEKSVob4St/iHb/5envrJ7ldZ2sd1p6Lh8F8LR4Md5dn+Yc/lxgXWqmBwBMORsBS9E3GS+nf0S53QbjKKrhkCNfvvKiu3Kj9dpYNYayqlrFYEDhOVEND4ixFTEEtrU0tUp0BL1KdgVqkigH1nTdGSw6mumTIG+CTl5au4QUrFFf4ggjuxoBVzhKtPvqtevP76vOfKabby7PexXIwssQKlkoqYCRrE5fAE4m+ijwNZpXyCGfRCUsVcl+fBg6NZ79XL9BKsGzM6i4kGVmO51NdaE+LzZdttA6k6Y+19ioPef/p1xmKwgAR/TWJ6Nqtk9Wzv9Uu36s/Wq5dvquRIKwXRZxHPjzFTDrxHBSsOcSHZAGxLwWdFvfLcWYAjraf31CclFsvwUqFImNNEz/rciqSbGwKTmY8vxEFKAOe3zmBwfyBvAfmLgj6kI2DQmVFmnSIBswUl421bGp1ORXHLIqHB3qNDDaNC6g1NNQkFxC4ZKlFTFo548l6jCxUZIFSMm6bKpsUPuiWaJPpmTA1IzvPxVrLIGKVbbez/BpsOxxKwpqLTC9lbqHkBwW+iVujMPHJ2rp1u/5go3b918iME3ezMaQbQLrdIy0e3dLRrBDs/5+1P2K2h8TI8r8JqC/hfcyUUOtRgm52S5IxNAfXWPdWbqdoSdIoBMCOYWt4cSE63Yi7k16wCiIlTMFbBWw1SPun8KyOOhOQsz1C1AGnhgcj8KbhtXeiQBV8L32S5oIF5goJdywZxpH71XsXOHI/hoRwd0SgGAVcWiMhHaHEQIOGFXQQIuFHDBLo6llp5JhaUwotrnOb7mN+Le/UtaCmiLSPuipSSiiufJpVTpOu4VWs6RpYwUrXJKS/JoUTkjcmcZWsjYvYhOiLiTxN0CkR10K0Cd/vXiNI+da44YAG9fPDSZdv82Xl6W15p3DwNl9Tft1/39XGr7v32DG8ae7YMb6reAx+GoXz7/3A02JS5tFRMPYn8unJ8Rn44vX3HTleKk7iZ3v04GE3nx4uTE+NfQxtY/DDT3MTha6OsXkr8/Hx4iT84gD+Ev8+Pl6aPLinv298IZ8uwx0HB0tTHZmpjlm4Vi5MjY0etA52DCy46f5Ps3MTn85N5Mbmwwz8WQtuvnd2xjw6O5OCX06PAaUifDY/zc1NjndAzz6B1inHPvhZT3dXf1dHb+ee7FRHd9eugSO9nQMTHdA6GDj2KPw3GIB/ursODYr/9uPv7MN7vL78wT1ef9eR4c6hge6uoYEe/OuG770t3LcYeIK7tC4WiKMJ7+jf3pwoweRHsVkghHSysXy3+uIueXQM4a/Vt3UyVHZf1VHUyGrXZE1F+C5qo2iZdlgZZWMWU4ACjbNIubvxRfXyVvXOE9ULyr0r0TZrojO2ZZuFgCK0TPZglcX3gmEHjDeBD9WmI1TLKX6V2+zsubzVeH2m9u2V+ucb1d8fCSFD2XRocDmmcmaYzEaEfsFaK8vvgMQzTBpPZ3nzgNbd4ldAFGPTb6LmK3g+myhUHJKeIb8PbSPac8wcaFD5lbPQVTZP9eq9KIPUZqSCiT0S2FN1Ky9BEZtNYYFGzQTsMCFDbH3fLom6nqt3aj/cbTw+yVHMdDpGnE3GBBMoXbTSbNTb8Bb59Ip4uyUvyGRyrlaUkYX4MJH8zhMQTVyLj2ANWJnQUSur6mLpRGW9/niTRl04LziHl8kDxBMHz6QMySGqN4PvEHOEVVgF7iUagTWNTQ6HVoSVXx1ZEF/mONReXNk58Y3KbsBXas2Z0Hc9tibvgETLsM/FY3M70UI1A9GZWrlfeeFEpTYb5z+vb52uX7/LBTdBAtB9ik1s79ynusH0zlUxKrV9HrWpHXS5Q81b6LxDrbbQ4T0rlWxmicz/DV20NBH7BmaMcmBbHMKD0fXwE69AVcijg0gsGeMDPxBJunydLiNA5DRdjvQhYUJFJzdI2S79AMJj58arxrnHsKqrmz/LGCQK8zHyudDzMQQjJ5eglSbbwrG0PniiFZeNxluEr1Q2bYfCMGRR+Pr9C7VnJ6qXT3M5eEkzwUsvPG6hPAySRcdRHssLkcAiWQVYIpxRwgol1esHWs1xAgbS7UdyRXEAmeJXVvgziniM6qncn2ERX1u6VD0l5EmMBtoqYFGQM6Mckq9EAAzbMcVpOVzpM0d4mSIgSG+cWkdp+vvvja++k1HCZXPejCjjGsiF2UiKTluUEkqhl5hbgE/0ZxjmkpSasfsT+3kAf+TeGTkF3FDs41GpKl9mYyd37irLGZZHvImG2J120rQ9vMarVyCf6ltna5zuozbzQPVkYPqL43woMkt2Ar/bGJilcRcB/jqb6okbii6Wz8vEaVppTk3x8fgv6Uw0fVFc2MWTglIiL7uETiCKv1hcrH1Dsg4mkUXiouj5IigGEHxg0eZLdLOJHk5sdeI0V8LjypJZ/ZktGcfz8unAEA56RReEMSDEdLSTqH1jcwEA7KzcSwSboXr2TLSXWArT6qWadg5NSTokzudi0ZVV0UTFr31hgyyH5Zj3FBkg7c2r7D0FDqKcQFHsz6WFOyIQ/nN7IcwQEAHxE5g5rEQtGkCNLHA2MZ9n9ubrkALfrq1hPvGZK9Vz50mYINI5bgmNIuhHZCN6mE3F5QTIbfL4S6DBzuP4raDLfDaD1SfSzTlXOAMellHWk4Kz39wk9fntWuPJcvXSY4BJoOXqW9+RdwWwhedj4QNZYNajVYIHQCBhQkRkbND+LHmIXOEyWJ1lQAAPlLOSNQuidvIUZmdu3tx+vqisCQolpPWQZIrOMw5ti3xmJoezAVO0aGl6oBGK9isZTNIv988vatc20GIicwmFI5W9KNgGV9PXXXS435AJdS6encLqdGBKeXOeKFmEJ+U187nyrc7HylEhgGYWImCQimU7Jk8bCwGIAlP6pSiOkEOMhY0togmfXGdLWwUU4loq494uvyoXowhplxeQ8nEy6bAFdJAonqgqQIr89GlVXZJ9Tme/ajxabixfrJ27J29OsMhgRBUOkktW4I5XyQkDsW1ChcSXHfK/lHmS4RO6jADNohOGkJzrhyWVXKhocWqh0A2US4h4xqBSXqLeN+YTvjpb+36pvvW1zCqMEVTOQY9dOaImpWzlXQF49iGnxEU1tjD0SWxWCd/h6XXerLJC0oV57jpIkeB/ipO8N8YHBRdn/uORH+qQMq2Z0jkk2qxsUjHw5aLIb+PE6J3v7tQuf4WZbRHexKLdADfl4ZKimItNTCTxqMiLHRCIidpzYhdfHi2iGONbX7zHR4swX63QC1KR3OXwHKx57uv1dnzTMStPMHJP1dn5gwtb5RdidXaqZzZrF8+oOjv04LhEeFRlh+Lo6AABLoND3+n1MBM9sE5xUdF1zEELsFM82pXciYxY/XNkmypjNGmC6rZhzDAkmwe6pgxCzb5UvjZll8WNtGWOlSZ/mjLL4vaYH7eQ2hhHyiLSTK2YIeTLcz9BiTvcMM1HjsSNE2WWxM0RzSTQPsqMLhT1ZF7e2X5+nj1xketPQm6JsXVcrRB1AklHKFnDywrWKkwbA7Qw0hTCRem2F6CT1D0gwgUGnTuLJylDPoY3pbjUAaWO5hSU00CcBt3ei65imEphHQ306EBHQhwd3PwZ8KEjDwL5hAvUXoZEBK38h0k9r6lZ7aOuZiNFntCsmtJMKreYTlPaLK7IonciNI6uZ5SGiSkXTc6jqxiWvtjmpLm9wLHHtetPpSRqEuG63NZltZLQmmyWjwd3ZHSZqMtCJQF12dfsmt3zbtfsnvau2T3vcM3uae+a/Uc71+yeJtfsP3bFKq3A/z7G47z/8QFVVXIHD/kDXnCoOGNN73MzB1MD/oHsvmJmamh0/0CQOzhr7ZsuWrMzk0cODE0c7h8aCJyDTu7gvuLs9My+ojvgman+gwP96TRc7O0Z6jtyoPfo+KHeyUP5w/39Rw/1wH2DPVNDhaHeni578sDIofwE/K6r8+h44AdOrmhPHvG6h/u6cgezM709U/D1wFjuYCozcTiVHt7fNTU8NNIDf737+7o6h/f3jcB/u1tFxOKZeVxUEbA1Fw4Ak97kpny6kyLd5G/4ByB45ri8AP0oB7otHJGoidfdZorKfmGO/YIRRTqKeimiDiXAqbOP8RzAtWu1xS0R/nhynQtS8gF9Lh7RRMUI0JkHeC3AuSOqi7bt+18B2b2z33/1XCtMfUiX2/WzfQ8RFrY+WJz3s7HKhTzVW/SdbOUCZ7CpGpi06qYtN0qapV+TcuPaDhYV+5fnAeLSvBRmyCeNKA9rhqsqA1yEbSWDxnY5diSgrEFw5wY6rG+8qH61yDUIYLSYMvDVQz4lkPNu+aDAeTwKTSTcigcgYxetkp1SebgMBjBvMnaMeWzYZgZvVbjynQM2ecCiwolDKWO44zlt0Mhd9A7ppzWc/BzeGo7pzo3G0+hU3Pd1XzvHQZxDCjYamh5zHk0I0CLwLivLXDTLCh3HKHsD4hxgDpNcKYqoTwu1LBnBek2bnZv3q3fu1W+eri6+qt9axNjneHGbIAfPB3SuEYjj/1zb9BOVxmPdgibePNc7R86cOc9x+KrBtcjf11FVkbxlR7kwuVaVvGVXsYgsV+ovmPDCAy+NbsjAwy6ZVMHVdNJs4+HuI0WkpCkDjX6ARVBxyhC++VpkakYHIKgiSH+gw+P/e3HRRecjOsmoVvBP32OkHB2HwHmD9Yu/wI/qX/xWffk1OZiy0Gu7aLhWfp6S2oU56LfsqyqSiAcayORn12rTcZNwIPxMRjKEMwZ7J1Cy4EO+TyEw6uAADtbeiE7CgneLYTg0cBqgHFj19LPayVP1e5car7/jkow4zsdPMFX11t3Gs99h5DDUVoMES6AoakwbeOydmEr4jOk0OMLQtlil7K0r4HThQy9AqMyFpRQ8ES4vI8QjJhhdxc5ietZlqnGynqYtX0I/4rBxkvUoW84+Bnmyc+Zi9dunOysPt7cu1y7frd98ikY6lyCG2QSL/C+A42DVocnLO075nI0KCxPGS56S/cm+z4Vei36ju5uchLGe44wvSY8mYOeZVt2Pen314fbz1eqVn/Ref1h/Qe1YImgwHXpFPsqYjkhXZXPkFgLm44rT06XNPi1P7MQj89QpI4t3YSHieXlUfSRg7pQ0mXHgk6qao1LcQdvFmavUSHF4apy/OhCLzgig+oSV21F2fP3zDXSivT7ZWLwqqk1QUryR7Ilw3JqBYbr4nkyMMI3qR3LxQnGyGZUsUL+BrpRljiMdRIjpdZX1Enn1RJEIR+ycoCqjbLQnyyCoqneeck1ymGa4C3v2NXngPT4gDMw2YJEvEg8T3xzWo27dTw91gpuz391TLLktf6Z11sokeyj2yNiM5r7C5FK9BKu0+vplu75arKGQDWWVrAdYJA7jn7l+KNfSyTsW/hd98XQCIAmkEgepeT7qnpA0KYjeafTQBE0/5P1WePeu4Vfui3P+aCd45/kP25sX6z+scxlvy8XTEi0shMU1VHwMl5rncwTFkRFlvxTllby/yxbnXnHaSbvuyqMOm7pIj1seIaP1FR6wOEUGk1Le2W25c+HnKJs59BwMkwPMyNkqlp+GdjxjeJ0ukKGP52gU8Jxj3mW9j47nE2QZr52u3/sWCxks/Vpb/2J7i6JBzRS9SrEJgdqS/HoWnsKXYG8x9+i0Y8k+kFdcrQcRe72SHfWBO6Cgzzv6oJW28+dgPRTxjWExGtqnta0R2mFORVdMERBKYhae6wFR7xcMy4Az+dFZhskduGklakdgBeDTP+ycfAkyv7r6DW5UUREJtNXAPsag+RIKTaOcMuY9d0aIe9ULoNwrTvzUeCNIPCCjfoXI4nNfxYkFoHVen6wu3Qf2rGxQmbTg45XQjS4Oa7QziF6zCKdnZc1cmHtc347M38sXG4/u15d+oMAoPE+cVy4goCIdzCeQBcawpcR+t8cZsZUViSTMheia42X4OASBH1h0APSVHOsnf97Z3GrLEVCXUu7M82/keqScgwz8KK3t2HKIC0DEMgePUQQIiCyEhZv5qAbD4lc7P97eWf28fvd72s63ZH5XBp8fnQ5jZqPYiuPQFdPQmbBXDl6YybIzdqEVV3x9uOk2n2BfP/tk+zkdjQ2gFoed6IzaPHZhhobTpl5mFvEvhSkTQoiqzYI+IRkizwjnHTpychBGQ5V77sL2xoXq+ZXalafVM5vbL6hCnA1PnuQIugLJErBzMoK8ENVx1ysiKd5cx725Ply72nB6YTiNXawyHAgGFyx2xyO8hgn6vHfuVFZzdCKodjwxyArcLSuoQ4SrZ8+AvOB1gcf0lElDqgMaeavK9vGcpmYmgVd5Ao+cigyChrSZHRqlNuZhLucJSmDQAdVgf1hdvVpdXcHKCtdp1y8DSoPmcTNjD0uno7JAHZXmIeEZDLTxYBdUFDbYfwGnUbmEr7EMEi6XFys7i4s73z7bfv5UOfFKlpXlI78xPl/FHEhONg6rj+YscqisozOYtx1bcZEAV+MkJIxiI1Bry9oobVwY7/Je/I+4Lf6cvf5eU12rxN/aTm82z99vmMtsz/bWuDJ4W9q4CXsW721rZrc0W99hsHKoVV6FBbaw3sggRdTXzkqTQTZg0WAZGVD6dqbZppEeahJR77dh0IMNMutfMGBa2S2tDBZ81pcLDHpdQ0oZcvYDQ9zff3l7++WV+rlnLeyVluj7naD7fVC7JcBuA63/DJ5+H4z+78DOCRSIod2MNTUEGDU2wb8E6nsn3kvAqlaYStanx1R9Cey4PP325mUGclSbRINRYs7A6yyEOoRyQ7lBLyENh2synmkBZv5b8cR7UUxcbwvEEFPW/xdIoQkfCPXpC4XmK5UZaWilmMWxee3UoqSBe1+gJVJ8lMcHakOpoJr3bD42ggK8u0FQyYVCcwWV5stqz6blnWLPpvma2rP5rN2ezcfHjtFN9rFjdFf62Ge7PrhCSjp1+JA9MTZatMxDs/DX62YOjHSPe+Ojk/sn7YnRfGa4d/zwSPekMzEKH4cCuOHI/p5B81BmoNcbsIJc6nCQSx8uWoemBnr6zPHRQu/EqD/m2KPj3W7PBHw+6tgT3eOHp7uz+3u6cunUcD7TC783g759/fl9HVNDA96h7JGezr6D/VMHBvJ9XZ1zqY4DQxkLWvYN9nd1Qh8ms0f2A4mR0b7BznKqo79vsKvVTo2LeJ1KumHdQTDFUCyHVHWCDhD1LZuPaC/jKT5wGc+kW8dcJ7KMMNIOU0rIXsYy9pX1FGiKnNYKVqA4NaZx6nXt1jI6er662Dh9vnFynb+CScvnyOToAHpUnQXfxLmJfNTprC27inlXYVp3opqYMiIyrqc9cYYeZWcJ++eDeg2GQpb6Lc5glY6AdmNoPMWzcKqPT7NroPVI4p7Sv2BQH2gJL/UXo2AtkFrGNgsDS8HMK/wFNFSamqnLvONtY6cCxDwo92DFMu7B8m53XzbWnuIpjVsPhXOAesHHZZRBfJalZ0o/kUx2InkgWdQPPs9dFEPXDyJjpk1HkGlsxZuzc6jVMPoDpR+dJ8cbC9olrPREOjm6SomdGGeOqnmafYfqxLnGGXTLNe6dAMyvTpyzcliLBzO4Jfb3/yJ3zpK9oI19KzrcrnVXLNGVVQ49/DUny/VhrKzojQreaaydrp56UjuLUbLcJ47iaeoWGAjakXisbqA/Yv+FfIXTFvYKq1HSlTICVPhCGrTyMM1npPDeVEY+ID7uxaUqGrSytvC0V3hG6CS/8YrkPpYhCx08P4VLz3pGwQagppfg0buiHVbMexHwWLBTsLywS5bvh2lPRIFnOfycSuUotLb4I8adv3xZvYRBJIHYNGjRD4bI+OwpZDmEt/EXdM+BocOB0OKKV3AoC5gVc1o8AFy+5MolwPyQTxjGd0OFRt6coJJ2l87V72/VbpOz+erl2tIiwDn0GX3/qHr5AiXTUBbNPLvaA5Qi0vMR645hI5wOGLoGIHvIh0f9QpuFfwQ3h/ir93aUzwC57bbsYe3btZ3PMZQu3imwmTVRIkLdsL4027US7PH2sH78K/+Ka6IL/IcGR9AeABpcwBBsVhG9yD4EDRPWvv26+mij+uosOxNkQWrXtBgogtwrBmoDV3NIco73f7c/MslY23qVR1vhwiZXlaj3ikV+OGGH972TZ9bK34toa64nl+MIu9jGtyafzm40Xp/BeDve6pYiine7SyBx+T2itBEiyopxNcw0OdP48SQ7hOdqg2oW+9aJLmlPSHUjSs2JsY4eDtilAOw9Eo8eCukM50zKZvgx7nFY6ooo+Sy4R7oT50qJvaXosaUEmPPQD6E4r16sLt3fOflSdUXJRcxFNVv3RaqEVr0paCne7+lP9Hqau6TeUFOvIiWiChNgySSqSUHH3oclO9DKC9BFXPxscIqrXKGAsrJ4xW9SXNble5jydf519cmixPXCsKKqGnRzvCZCxgAJXVk18YAKMCXRfxZn7uKJCmj+WvQT+oUj9Sl3A2skyyTDKM6d4tqwYgJWOKM8Qw5yT3QMxVtAke4iJoWTrTDr27XEo8lztkJGhA1TjKC8ZHCev8PRr1SO8+1VIR8jh4foEHSltvrj9vPN2uod3DgljwdIRQ5rgGVSommTxi0izGhq1SWl40WHcDmrsEUz1aoftHkexVc0qXo6x13r1uMnHG2hq/14//QjcG0rg1WF9WOaAo/aSDJbiBxlOWuP0i4qv6LD/sQ8alc+CFqt8Htf1c5vVF+s1S5cVYs8j7UncPpm3NADCFpCkail4tlmgap+eT48HuVKzph2QBf0zpjcGX5j5GuDpUQZNs3dEgX2YfbcuVG984veNdYNiCcNDw/rbdVBpSLEyfO49oK/4SYD1kelwkYFyrYSXzG89Q9aUBspDlBSiZSXGme/gkfRuHeOcylxV9a05oklVoYPaZNB5lVqDEX65gHBTWZtHmjLTgiUBEsZcJbkiixluIHYwUHvt41eyoKFphcmu6sdFbDWsFTznOmkhbzjgyup8iIslQUDXZLsFEKv2PPVxtoqO4XKDt9MOyoCdzq2yR6Rki3rDsUZR3NBY2mJ6gVUtNrjUx7JRcj2U0ZYIwIYPFqnWYi9ANiJJglvMbTpRvTSHQDFtGhT7BuOdpodC35HtSyKBXS4ZfiqqDOzOa2MtF+LBvpqKpslJc+eLFZPPqvfflo793X15qvG2nUq7svpD2waxfeWE92QokP1ARuwF605N4kJjX3MIoj1IBIN5gLI+YK2k+dlbIR0rlmkHTxhjazgWaxkpt6mOveE0nBispVa//EHtI2uLFUfX8GkKN6unoG5hl7vNNn0RmAbgRLhzBZgbZylRRmJ/z3sELDabXYsWtr2pvRCNFn0qPBDLpgUkkG2LFGYzRU1Gk+f1b79HJDXzq3v25njwt7RzN92Nq90QSuTF2Z0/e6tuIXd0shsbVeKHOE4NkFbafmZQiMtrMZWBlobu+zDDbJ2hphu8FARxw8yulqaMDHjpckbXRLBYf+iMzoB9lvhaF9C9wSGVu1vuJotHnnO8OxXmly1pc3GuTUAQYCek7i5BUpthU4/CJW2RKMtcGhLBNoCdsawpoKYcQzXAiWJMxQpfssBKVdZ4WSX94MjKgfeAgslIZBMtxOwQ/qZAXJgcCe+EcrIyrhmG9iTQDttcE5Co4uN+lB9Y9G1gbCvpLzsO4u4ccinCLZS3C21ZUJPfrBqfrdKjimgZvXXUvEkVE1Sw2hCPibgWwv3hEhPCvNm1/7ud7v2d7d37e9+h2t/d3vX/qftXPu7m1z7n364a99zC6XC1Hj+wL6hkd2zU+N4dK0FX/bC53kHHkFqYjiAH+HfLviO/8XrbuEz/FiCn6d2T42b8L00F7iFOVhF8Ofump/Bk//C0eGhyQ47Mzo8DVw+9Y+OTS4AyRAoTNujwwvZ1EQ2PeEDp9m9u2fH4XrOz02OLWTTKfg+BZ+PTtuZ4f2Dn/yju6PzYG/XQH93J5Bb6O7sKfZ3dB7p7QqtfUOHekYGQ+vAEPztg8/7D8OvDg904w37uzuOHOzK7+/o7jz0vzo7Dg/0d3YeOdgL/22VxiGr2PCekJuTJrgqYCPKnKddcYUPPyBwLCzN1RL5b7FyGhmmWpUbcu1Sklr13CWMKNj6vnpiqX5vq3b5Pu6ycr2bW4s7N67IMjdc6KnEXdHqWaYDLK3siUMzop6KntFpQQjjC3iCltBiWg9znJeM4dO0uU0d2bn+uvrj93wSBRE08qV5z8/JGlOejRtgnFKIR2MFMIlUGik5Y7kA2c53l7gAGSpXsDjwDqHHgSjZ8xolrbUlQXq47pub84pybfVu/f66OGILy8yUQbiUdGduxgxxhmP1zZRWXSMdhH6K9K9VCE1RNy06yIsyBzld7bf7oJ6qG6eqd+6RWVH0zTwdcuqrQxmwr1h4Qm7lh6ZUfhSSLmiSCybnCtRYvXQG6S7dr63+xOfS+DrQCTjVBc/worggWPqAZfhQUDzXQ14I7OgKbiy7HNtPgfyUG/j91erZ09Xzrxu/XaAQq6DsmC6iQUsgfliZJdOI2JHlF8JSMBQjqTX+4EJ89mwUgUGEYQpz7AVRNbC2oy/TED0KZLGdol1yCJmxlktrLXg+HW8rUDDT3e2Nb7k+T1n+pqlUSoxirF4KLUntIs1rKjcBsweByAbBqB+/ry5e2ln8ofH6FL1Vphtj6HsYHsSqyJOZ0yWX0TgzoVOHwVohHwnxwAcTskr98dbOmS+BS/XKRSpbEGKhXgo8dlKh9DrmXVD/Jd67FmzwqCTRhvnjGYU7RXxGgg+oKAzTlnysBbDXcbVpTAr2cYwgAmZY7U8kIbNIwDdmiB+I0gjHRQ3ZHM0l2vhHlXj5MRaRXX9c/f0UHxBjYiFZtFxAx4rggrTNxcMxCoxUCjY44py1tGOK95Gl0HeZ87BME2n98c7yb7hd8+oVH3JfNPJpzAZNvntKE7VVuczku9cvyqMRbs7H3v2jGyAztHfP5XIseadwUlXuWT4FKsVpYrlUvuAkrmD1XRJVEVsuvru99TvzpGCdNMUcxZiFmGAr6jd6GTNNwUtYPDCdkH8iSIfDkFgC1jdfc+iRyOEuFEJxnB4IOaZqRIOhcKuC5xS5MpqhjYbqddr0UtC9w2NByPn7xdqNpzwMCnEgDgYPRN9PpXAiP8TDdX2zyD4TsafqqGsmXzJUxXI+rDFlCJOQJS4wrN5ZYrRI+6oibXsm7fnlGZFbZPqSWGJ8ikVieDlZgQNFZDRA4Lfz0/faAAWX+BBZlwhjA58eyMjQUYeYWtPmHPqcXbOyWUrzBa41/sclHBxWh9qYFkXN13+snzxbPcf6JIPb4ha6uuk2HhrRTo5LUG4aleISjYm5qDEp8vqYKk/pjDIukUeV6ktWwMFKogGT2OzKcomQQpEraVWvPK5urHOOSr5ohCZGPMYI6gJAkCSBqUQAR/l4b07kYhLg8g87D75VEkAQ1oRAYuE3r/XVovHmBJXR31ivXTgnK4OCNe18AAESE0wFo7NYfcKiBWIYm/WbLKMa0fNyVhbEDjqqDU8BCZB53OqIqncSX6AeErY2nuIugndBE9VeL+6cuVJ7hjUU4OYsVuBHCT4jLXqPPMBFlNRpPksp2SCQhkdVdil1748HJUYZOz99V//it/ovJ8iQwR1BUOoZEUaP7m3aAcTwbnE8NWKiOTJIcZZnKqtNYgg0Hvo8mF8E80DjVa892rnGx6zTarCNoi0yIDK0N+zbVo7GzYTRZM/Jk0QUfVih81F8KdGuvnrE5/0CPQqndCQEprJF7LTlzw59iWOvCM8J3CXxHFDCwlxeJFN0ifIecaI9c33t0TNXaw+J68sO4KMT5nyKfhYinuRus4AHydsk4K2c21a+ExY30/+CUGeqei9NDGzAQt36HEbfBG+cGG3mNkzqWXHuLk/s2pPP+dxdcSvO65xMD9WmcbR8WrRF9PWpTfSjqY1U9aktcD4GS/oAmrQ8DYH9m9UrSGg8jCOadOfu1RbvaqhfVeQo8HOOJsm0mWr13MVy0Z87Wi3yuSO9hJoRBhCBK4KFutkSXZfNYhICSivq1hHMwdq1RWUdlR2b7CIjVQAzSVZqwnmpzRwg2HqGM/HYBEfichBEU42idQ0dZZTGLObIClWGp2ZyCp+TZh7O2U76XUambmHKB5R4UKryDMsBYXlpxQWEvdPK9lH2jrR0ZEkP3bpJGB/SqmGTRjcvPGE+EMYXBQkFomcgrwF4IfX5P5QInJPFsxdfAHQWiLmFlmsHiBUOZpNBA6O++d8ARnUcKmGarCcjv+jyU4lNHYCJuyXO8iVE0jCPgjo6yFGKAcudKRASAx4Kb0RIg41ha66yir5s+GC7Cla8vSreDACLx0/5sgQBsXejJJUSUFLr8vqewx0ToWgpPD5F3aKTW2vPnrN+e89To3r0XmUZ4cnra/XXT4SSaXp7dFwcY31dDyjxrwR/5Ex6vwiODUxJct8WhdN5RG3WZ1TQKLE4uWRO/exDKU6anax4Zqo/iluVKdsHAN6TdLO2+oFytLa5W7haW11VztZP2jlb6a7SsWPqtsyxTz7c2zq2v2u06Ga793dZvR0jqcn5qfTwoQMzOWsCGg9bE4d3TXVMpSaHj85mhicC89DeqcOTHYfwDvybzThHJ46bB+Dn+6eOljMhtOG9xWz3EJAZms2UjsLXwaHBvp59vf2dPSNH+q2J4VTHLrOj6Hb3zeQm+o6WZxf2dxTg5+bUwuTkxPFgcu9899RCCqiXHKDWBX2cGuj4ZHx/18F9vfuGO3ryRz7pyY/8o6cDyO5OHzqwkB4+cHxfbzDa8eloB/Q/GB/r8jtHD/bCdffwUF+P3d956GDHvl67c7Ane3h/B1zbdxg6FcIgxsf2T8CV/naHSnp44lyBq/CJ71ZBFuXkbSreinl7jUuJvqxd/qV2/cvGsizGVuYb5NG1dMJNRNTzZYsg+/ZylnaoHOEZFfWLa+vX6//8prq5Wn30Gwpx+jlWvMpLbygep8USCitZ8mYYZxyKjMvGyZe1JXE+veWHji2yO2EqOUUqZCMoOGYJfuJBv0w/yzEHKVEL/SpWqqXp2nh6F4OmNq9XCRELgljqhohFRYxDypsyj5slPsHvOAB3bAio4e2SIw72UmqqfvlM9fwPtbNXxRnEWBsoLVNuI5KAiXMRRfFNJ0UJL7RTxsYoksTKD3fuVX+/L6ohI6kS2HaRTzmIjtwln3J0AO+mrJ4pD7nevFx9cr3x+ibncqgbpRxzYsRkS0S9crtAZYXzcbK1Uz/WX3ytKKtTfec9R55IinvS2kaqnJvxJj6IE09GpEokLDXxEM5r9/Eso6VNOT9L4qai12LntmCXKuuJfVvxrCVZg3cUVkJiQKS3X67Xt25xhUZJXHvOaNzrlSG5hIdWE5IbEsUgeQ9PVYHkc/m0EpDCkYzLIkGcGuPkk4UmmR0l1YiUbMUIma7+xLnZesVJR/oEaMsDBsi1ZWWSGzVM0/fKygK96eNksWA4g6zqfGFlZ/EcTsq7L3mXHgMO8VkFcg9V0AYI5FY2NdqqIUacNxFX5nXauJ99bS2iXXZkfMGcXcKwD7RYBR86lDxqFcyi1DxmRGdGVh6WKF5iA7hsb/1Uu/k6YmFFNJo4mYUw71puglPZzItYYzWcyuY8lUhRY6l9c7t69gFj8KjjbrQoeCsqQ0XOlcAWLmbZqC2LjeOR0KluXqnfv1A9tV6/+VwsDBBp4i4BsVBoJ3nozTE2iriQ5uLoBWKDkvyikJoZUdAd3ifIdOGlMIMQX3CpslxijIbguMRtaW7kwiN4shNP3V+xWIYqhbn6T3jxuNJf4lvJWEAPbzVLyirN2Q5WBtHYJFvbMFotkMBO65xq315unPiFPEfIhKr/CxOPXkLBymF+MZf3Fs8KQ6u5Qi/mIMrzwtav1/65wToqnzbhyRRNIZoFBcOco3kC8NXLooSes0JX6E0up465jYpU7Z+PKeSRSRnzlis8606I4wtSnhGV6mzdikULyGJb0ErU13+8tHNjSVX0DGC4Jt2HRSjRURzl8+m0OPdcHTzCZWKnKct7RqNeO3mvduJqVC/UtLJxwqowPy5bUQxYttGilQWCNzBckrwKQVSq/86l7dePdhZ/4FL9x+2sQbsPqqykqhbl+KaTs3zflCX6BTmu0c90uLjAcXXykapmCXdHX+hurUgx3i4rFMPt9MN4BeRW9Y+1tj9T+lijTiJBf2ixx+XSq6bqXZIqoQjBC9/M8lksxU8ccIucGIojWEH2hZKR4hErZ654JVqbuXoCEmweTzCtnXtVXdsSopZIZVzx7AP0IqTFOaSgQXK81yrakLdopMxqPscJtwzffD3PVUbxOKelzeqlJ7LCec6kUgBEQxRmZWoCApArCLR7wZY/4kgu8p1yRS6MwuFALqAL2GvnzKWoW6AgRZlifekhOgQUXkysSI6tolKrYhslbbAXG/fUjGiZ4vRa2qxvnWw8WuV1ynZoiAFaYp0K74dGvHlI0eW4FKDw27fXRNwl0qdoWxLoUgxEI0MwgqfQ47khFu6jCuM+gxXO9Wab1R/6cfEs3g2VSAZKr755r7r5M+ePkdkPwIfuzgpLXeein2toaWx87QIfUlLZmEEowslrdMTRjVfVm4+raxs7t34kuCOZGCCrs7I2r2VnTeGboTg7u0Qbb2ZlVbbLCkHigb29zGeAnv2yceaX2tlvaxcxMjvr0Espoz8ZT6HJC6uBqWsQX9CVwFMjGsf4TFnH+IqykRN1JsjQEYJBHE6mfUV0wDWGoiWPOH/pvlrplN5P5dsF4CzaaRe3U3nRkVclahSrjiNltSMl1QRiutEEorrwro2Tp5UXUzcd/5QpqpuhgTLtWhh5yraLrDrd8lImV8LaUiZWZFmp25QNpFk/usnTZOw0GSJxC0QzPpTJETc2mqvPx4vON1sAOuKPA30dh0cAPIGJFRRWIDgJfOOANyb2NTzNol7h6SSQTqLPtqhTYU0dZYrqugpXaiBvg+JjbwtZvQYrSaG5OP6KoJcOunToFsNtH1gRPQZudAiiARAdfEjk0QJ26BhBBxzq5IW5Jh2ta+bW+jihhDX1G6lFpdY0Jag0X3QxrngIJ7VUM0q5aGolKepjaoQekVIaLMljMlyXrppYjUtUJUZ16Skfl5RvusSMBKUSkUI6NnlPxTMbMf7NEGfnNpUNb/ObyIfaloZ0o7b+gfKk7m3rSZVvFMNXeXjH9sbqiOMZj599glGx/PkT+Rlri//7Xu3C3vfXGR8e6h1dKPuFo7vTE5lds+7Ex2FmYk+Y+SQ9cTizd9aFS8ML8DedO7w/PXF032jH2JEDByf2fJyxpnoOzLpmaqFc2J/Zu8sFSvvwV/B5FigOZeEHQ717+zoGPWg9ONg5MA63etOH9ztwxclO9QCV8Ognuydm3cCEv5STtXoG+rq6C+mJeWhPw887x+Gvr+uzhd6OGWCQHx87kNs/M9Txv4Y7ZkaGevu6do917OrtsAc754B6Cfj7QKE4MzLce7BzBpjv6+uyB/q6u/YNdM32wz3DQ8BlCn7Tf2jfQN/g+BgQaOF0RUdm5R7AlDQ74GgLTHxjeS12+7dfL7OpDtZq1gKzNaWSSbIaCUooycbJ3LYR+jw8LgzahyIolkrgPEO6ACAe3ajeuoEYhUjDzzxZOUn4SkzH8qm2Nx7bzmEmdL4WfU2bYjFSmh6w+fvf/444i6Tyz7XFE8ACz19c26ASieY8umTpzlLkMKHDUTTysqk1B8SMYmdEcqh9f6J+b418aUya/DK2VGmJgbBqEVl9PBahXmSmHyuX1dn4gOpbv2D14uYBRfSE/8RJVTaLcT6x1oiVi6cOAxajwpKbDT6YV95m4D3inGYuo8YDSdtzrDNEI4l01UgvXL5neMn8ejF9nww38TulFvg7leaQ5yKnozbO8PhzMyniEptN8Easadz1xhhem3eWo0Y6j1m04gEkXIAE/i0S3rpJp27coUOLzDQ98VxG1AnG6OXAKFBalWeDfY8JtFQcP05I+SQ5/Uany47Jxrk18fiRtpHx5LGB2rOXLhn13GUxdxu3H27nxJShFBbQFj4/odrPn/O82X6+2Xh0R38fwq3nYGiOxgK/u1auNQ8qslh5WFbEG2cfcvgeUzTE3dx7n0IP8FGnrWLAWUgtG/m0GgKs4riaJ9fZ5Y+H3ahEHrk84ze3acbQ02kRxhxbvLXv1qrnLumLVzCJr13uKFrJcyIKxov6rzeHxchYxvcel0VgJT+4oC9dVxz3MW/Zc8pV6FtsVSaZtbwUFlWhaa5JyUlWfGJU/fONxr3Pq1cvijIIkpXBpCJjtgW3Fmxo1cmhibreNCTeGyDymKQqllqMpBGia45WW4ysgbUgMgoWzXDhdpS0nA0lSppQQT5kuXQBK/Ft/ty49xVXMtneuiyHRryNcoHq72nvjeaz3OfgV4ZnvvMx9+LVyNdhpdUArIJvZ7WfJr9rEij+XFgGqUfDJA28OxJ4fBQXej/UDgbPW4eLcXK7NpPo4A+x18CkaxdP1LeeiuVGN4MdW2JbVsgLxYC/KLpKMDBZJadJLgBdXVo30TRxJKYUQKBH4HkEOlFFSdLAmBol7uluLj/sAUTEmw1vMtYpWa+CekNZ5YKCSCNv7kb0jY/dQ3GL2uz+IohW2Q00cwKzuRf4uTN2qyxoQreLEhl08wd0gEJc0uJoApyy9x5Xf3os+1CwTUfTe3wXl7nFA0RVyUbRjnXzxEnwNhbgfPtVGHCtPA6gqr64vf18C88PuoKeAKKOziF5HBlPd6tkpjg6JP6V9D6djCg0/6sVVd5V/IiFEn7UfXb0XbmHJBHpHbI51ogJsnto+8UP0Y3RzqQp6ntQyEmOzE7R5FqxVvaagf3La7V6heRZABMzZxrqdxEi1e8VmDRGbgO1wQbJZ1xcVA2fFDLlz1x6BH3HjoNmXjpXfbEpFDLenUQTQslQgrbcZdPb4tJNE2w5eYSFkmws1raf/9J4/R2LNUsjRpWSI8kWaYO4Sm3TLnJLH3JZVV1JAMvGvdM4WqkndK5xTdGkJt6lipQCopK08LOsOtyKp78NpppnmHmXfKFNekE4POi5WXJJYmDG0gUW/ZJuWezj2VbGhgmIBTTkPj22mJiwbsFoXG5kLwql1siXoE8vdKycXOe3oKYaEaI8niDyd3F0Ju1dKo7cSJpCY6noc1aAmmlMHxMDaI4xcaPsaHNMqTB6WmoNo5QQDUkVBuqArrR8yvI+w5apP1xlTj1gLi+nHrAgRs+4ZR0DZfq1tPkUNFe2nUAc0sxqtq6USaVZUpozTloyrW0lZSDpFkzSzIgbGG37m7RTKI4451DcBSN8dSifsBCUeRC3DBScbgWjFXpWuDkpWuJCpT1CjsHjf3WhxuHo+8nEgY+EPEkoqDCTjp5a3ajBL4VdNNyig6AI/ugIhTZdSgG7QC2GFyLQltLTebuKtGYEK8SdUoO/F0xEOKLVTW0BQKT7I4X8blWsKWFdfemfxXuE28VrfKRrq/fOpTbTQFMBKuOVauv+GYGvzpYUorGFPNTVuSZaNXGnCTolrZSYigRUC/eneAad6JnkXx1qcn+2/k3k/mxLQ7o/W/9AuT/3tHV/yjd07Ji4zzu258MjSV1z9FNr6rPRYHZspDA2PvJxuq9nD/z5RTwfHtfQ7JhrjtlTI87RXNaaCmdGioMdQ3MzIwuzYwH8lXbBrxZKwdgu3zUnRw8M+UVzaHZs7/jI8aPFEfhlODIxvH8AaJThojvcMQ9U5nP4l53qOTzYvefjvh64ghzTYx3QaqXg69TIcadzenh/YWyvDdRnJw8MfRrO/GO0Y2p/x0Bvf1dPZrC7c3pif39310B/177e1OToEHwf7u86iJ8P9GQOd8O1QwO9R7r2fJzugfZ9MLaZoQ64Mgit/cMH9g+1ytxn31pgY30a38QzSE0FplVzSjSTJkaj6leymP+4VBLQ4sEFLB24KB1I8k51SG+MjQiNifEwtfgYcvyo6Bi02Cg6RicsA2QcPmYalB2nwpdsUbU+eSGfBjwWuaeWwfQQIIl3as6u1G6dBG7VR7+IPEqfIyUEBc0CVUQxT14cE8f7MuqCE11RXAwu4O3+8WCBBwasqo/O7px4Jrdp5O3znuN4IlbCy9hzlLWE4r9gU6xBxsyEVsakRivkVpeKl+J2YyCAMuaEUYrow1f1+5frL55WN6+R0YVZNMfFfpmkC+84Z3Ikg6CpWpgmFx1FQpucmgsUjHL0dnFLtHicSvrhxo9vpWxHPJfoSgZ3zPhCWFkvi613EuDLVPvk2pPGmV9Qit/ng94tEKUIfwteBpZxVrxy3Kstxtjg2ybY3ZrDio9nACkG25ubAFOpJj+RNeTt2lRFVzN6l/001vNUyMc03EQ7p1dQTSnekkddiSXPC5xv0VimipHPt2qPv5TgiOonlRURkVAjvtJZvjaf16234josc7NiwW4IrAlPdj/yAPVeozBKRd+gvWa5z40HmWDYNAhirmPCBWNM1yLdH1Z+pcDGMlW5rqyTdqrevVJ7ca22erF68yUN2S5jumkBgL1rausQy9MxXe17gRo0aooO309PH7ePBeSx0V5OYTKdabuVpwUbDHlCQKKdUy1tF4bGV7hIzyq8bDrlUKCH6osr24Bov/mmeglPCC6L3xs508nGuyxZ6t0W3Ag6zaqOAzF+AEAj3m2eNH4OoDX1HDPSOCbMBoFLF7RGzA+zsR6geId0TsOtldq1DXiB9XuIsPi3XNgT7y7YTXwQTNg+GKSUUKEEKl506arpAtrOeqIKkMar+mRRMbJw09VrYpTBSmpol+QMOmHCQelEloWPdaZL1jQeCiPPOpdX8SRodgrQxHx7ecZ4u4SLsbF4qrZ0Dj1kl5brW68JZNJ5gRGfJFugD93nre44V/2KYMHnA6oSTcylsfZ7/do67/QoqhhK7shtf0+hsoydYZQnGtCAkjw02lH0NZdIYxaNtRP11VdSRWFSW9E0kJIyBnyuakP8BBoUTSa36HQNEl1vb9CDI9K1589r35yS3aObPVm+1MXDQ2yKncMK5CUuXkqtITcDFg55E5wr8aUNFR5LdbLWrteeXYAJUT31kLxDVsko2vnAtRZseAgJNvrD1/mQfIouuVgVX6REKmaJt7S99bKx+YAZq3elcU68rAAmP/cBDz0JIl0feKoXQStFHxut0PRytIFQ9dpYHRCQjiGZkVSgBsmERqeGxEW8uMILU60uPeYKL3IYdH8U1LLq0D4LYSC9gQEQvh41GQgD1Vf/Wbv2mjFQGZ9vUYM/ZFxTyYecoYhxcoy4kgrjVzQGb69loyI7zKa6uQT/RpyQCpMX6sMuUWwqzGU/VbBEjTBqoxx+bLSj/EG0VsnJ8uW31VM3aNnjXUYZ75AbruIJCDq83drURpS0kkCnboh+Mm8cIXaYbSfXdnBPAkwogro5FsUWHZglSlFF7fhA6OgTkf+OnGi34PTF2joWNKq//FIkzAJR3xI3CqvZm+Na8xhvCDTxaEI+6T66oDPzAAoW+ThRjCdHdUW703fv185fx0NtviOhjHd7pTizAoZjl/hkbqoLxJ/tNzepNoQgS56c75iezBDAH7K480SRnqg/2ITecnh8XJQpRkmSoQ7B6NIigrfyDIAwHj4QkJ6mVWih7kxzIyvpyiovRJ9OA5cBaLVv7m4/f8UxaFj0jyCRPA0psGkrNeIg6iPwfmrEQ0De46JSAVDjGgWSWGwTFRNeAlEQm0zkkMc+za2O2A0WzXRaHJ2KzP9QQhnJ4keP8MwM+P/mhfrV04yEShZMZ8dOu6GXjiItgdYBfP2Fyo/dyusGSzIsmzIqkNmwIHxxA2hXn6MDQJDCjCHpP7OtLOaZR0Hh4rmABsUqIVEQATerZy3LlUku9NCxWtnzz/Un5XtlLQYYRXnGkEw5HFHId8L2jqpNpNNWVImY1nkhmjzGKsv4+lyKSsArdgouOYxjzOgSiw7elo2JKJQij75VIsoxbQYvCSGFrz5jZQ3BXOzHyxZkSk9JEhbHHqqwAiK/8/nPjRPXhEdIDEJQaRPxqlm4CeM2MmuVRRs3Z1sYl0mbUrcklfmYMBxjFp1uyyGu/+MSFUrn3Ozatd/AlJN2nHr30nRqYUUp4ykymxJ2S8xc0Y0UZZroRomsaaGMkHfaCDHTIDIGooNfaFPg+RIgdAHPk2g5AY+lDmc8rMBwEgUz7sSIQg7nj+HQCH0qxBnDmhHC5OoAzUBP4TuB7OJQKw6w2mGqBI6KIyj5FCS91hhGIZcIs8TRig5UYghCwQYFGHSUEGGD9+lvGYOr1FJrDa2UMgGJpB6WavedSkxbatpJf0nJqaSlJidjmiTSHpE4V3pC1xC6ZtCE6ofJUV2EaiIzJr2UxIrJqma3bjQruo1/iyRmf9K1+47fKffuu2kJF+87fqTcvB+3c/Nqc/jYsWhYxz7+cFfv1HjByWcmJzw3fXTi4zCHnyf2hjn8jn/BQH9vR29vx+F9vd2zM1Pj2Da2EAxM7P0491nBmV6YGziA7b64VsQ/L310avwzB/4K/iz+65SA7IAN/+z9OOy3UmO9nR392dSYnZ+cKHruUWvMPLqv48ihA4OzM+OTmYmpo10d0J62oTs+kO/PWqkDg/v78Rcj8FeG3vT1dHWOHDkw2N011Hfk0ODgoY4Dg6P95cO93d1dB6HlwNBcYFv7sXU/tAwd3tfde6Sjr7PreE9HGYYz1NfZAzSG27p7cXvPBnCZstK0vuRpl1Qqx05rQFXVosbzNlCF8HrafnG7evYxaBGqWm55RQwCtOZsoqcFaTAfCS11NjG0KbhQfAZH6QseZzarV76M8VAJLTbWLKn8wraOi6ff+DbX+AcDmjZXKFnsZP3zDTrf0Z7BXCT8pQp3KLCTROz/+1aoN+C26HFY0HzSyZe11S0OUideWPE5I8+ILDohZ7OVMDfWt6Lzk1Itr/FxEBjSSGc6obuEA/8xlPHlL7UlqsaWtknXAEc7lLDGtbMxSs0tEW1x7oLI4BbUt85y+rakTgQE7p4j8zkyqi1HNP1rFjXdLRCJi8nUSYudmxRxSXjFp1NjT25vbmrmOf6ajSAYYY5Kl2H2jiyAYFObyRXBpb92xcdnW6Cc0rdXZylFarP2w9XG2rnGs9/5LFSr4NGkUvVXdbqqxnhBHHsrA4kiio1n1+pPf1QUydqSp65zQA6BVAxI5SURRepEhNGFzEQprIaOKObk/sajF0AbY0zWNna+OqvH7thhMC9r5Isuw7LyU3rtMdrUDVjjREzQBcNRUEweus5RUIKmAW9eBMsUbK6WDJOeA92pweFVkhZlklSG43Ge0PAxK/amLz+GCV0/T8HdeINBBIQNOQdICyy6Aqei8FeYIo6Ya4KSrJAutwiI3s6ZS9vP73KxZzwVPAQDQsQrmHk3pKP4Sqrumu0VLZ51eL60uIAOZFv4yyqrkc8Fp43SrI21SwDQYNrAv8KJzBTgibslW5z0NEcnhSm+PBgHHlxOMtCoigP45MYv09659ogPWxV0jbI4aRXDYtIeZrrTpocIlOEWsWchvK5/PMhhKQL2tTZeARS+TeBFRiPBPfJcAElBFurETb+Cl9aJ4wG3piwllpHEGeTI5HoaDRbY5ZBW5ln7dg2z7NdONH58wIiEGBt4XrZfjIlMX7Dg+qaWI6Vl4Ee8xTSg2Eh49RwbyTIRT6tx4hSx11bGFrBMUdQHo0QuS0nZfRK7ICG515IBILdsVFVh1YdVbOI7tgNZUiHRhjH2eFQAeqR5l76+vrX98uvqqwtgsZE5UwrKAQgFafXRJ/EmZE2av7ZpJSNyJa9k8LII7KpePVs9db/66KK6s+zECtxQo831RuY4fkg0iZa0qXaywADL09aoOB8FS4Y93QIufD4KWPb0ex6CY8foY3+pKk/EINYmyTaNAGjHRwB3lh2+TW0w4ilcuOlED198c+mxY2WUt9eOi4P1RB2h6pW1xiM8T4+rCQGMlyRKoZeXi1ej7IstAC/xXVInZEEebEW99uTzxtrvceozMlS2ZKpT2AJPnCCmGlGGsjfLzghzn3Zw+dQPEWe4kuf929qtZTzq4yoqgICORyNQF0VYCaJ4eloQmDofDq/ht8sktQwQGggRbjz6kc1QSdhwc+I0uUiBRZpRazPTKsKEExIx047n/vbWb7Xls9XNVZ77VEGq5Ed+MjdM2X6JttGFl0+0YL1obM2EcmIyTa0iIRHlooREEr2l0keNMTc+J4xkSBWKcz18n31lYMWLvFgANG+vpSixlfp7p3bp+s4i1YpwTfj5vMG3CTVriWxWJuVx/TYmQGIE7hZij38RHQeCtVIosFVWYed0L/EVzyRXJQjqL29w8QELwV15Tp4PTj9Wu/Lxb2L3H482v+3y/r/Y+X95o765Xn/xVNEztazltOfwOUD0ao9bdKqK7FTiB03Xcc+DWW5QYUJO5r10Hfu/+EPjt1OiPCFNZ1hKVlE7iIH3WTnMV1EUXtKWl8hOEPFhDF7ARGi8/JnLYEZ8ZqQ3gfOHyW3KTgTpQ6ZMXVHBR7jUyiw5CMt+h+Lol4sgN6i+Xsin11tOKApfIjU8cTNHkoeI/f+svVl321bSLvxXuPrinLV43u7j2Z1zp1mWJ1mWJUs3XiAJkpBAgAJAydKVHc+zPMROYqdjOR5jy3MSS54u6F7+IwJJ/Yuvhj0BpDp5v3PWimJyg6jCsHfVU7Vr4AauPIBUvzwF5ZGI9gCyrUcnVbQHUqOoWCPSw6FqhwIl4hYizvx5HHSVg1eNkybgYpIYdkvVsSmANh9QtRmFDBlxy6gMUIYUKi9QtwjJkKMYr4dN2mpHxfpd/+FevPyQF6/rw0khE97Y/UkGn2nppUw8ZdkZNp2RAy9ML/EPzq2vN/ikjz/G909qA0zcnLZ7OtpAyu7RFo90kWpDpN26USaNsj+Ej8mwDDR4N2wBZVfU0pJTQf92zK9guAbgGnsrzG0iYoWCJf5N4V5KEOmAPBXa1DgzgQcN/AcfDTwpwWQCRQrMZeAsE10pTKXQVBJHST3P8FIAG1E5jQCN+oHGFwpUGEhCwQcNHFJqXSt0rcqV/k5o7oQuNXSoqTyVwjRUZUKbsVUuP5raUOlBrQKFptI6RakTbqeilJFWQlIgKiksJb+S90LSd/w1rUVehEpqarEm5ZkhxpTsElJLiiqWTaIworg/iXGTMkJGlcLZI5n/AQJkTybvhFZ3W0hphx/oeNLOZ8tg0g5HlYtx84aRpHg/R47A1R45gmfljmz+687Fyo5tucrObbm52apb2bkj5262RuDjSMXdah0a6T0Q+pPDWzdbFTx+FP/mqm7v1Ni+BTjgT+aHs+MHshPjB/fZo8P7u7NH52bdhSicPAynwlnz8L2Kn0d6a2P4b9eB/SX4cRk/986MDuO/+Aect7lbN/fCuT7+AIa84Wxp4uA+OHMqfxh/bQ+XJsb3HerdMtqV7esq75+xRxe6ygeCAfjd+MHBvq5tI9n+noHuXfAR/4bw376uHRMwuqe7r7urZ2jXYFce2MFnGBrYOpDt69+fHd2bDQeyHeuRUvmFgCohYTqGbYk0FTWKZwgBDJOszE11UfbCGntcox2Ziw8aF8/Et++trSySXyXK1wrkNUGCZVBzUsl79bdFbMOq2PJmBSxYHtajmoFMY/FlFjTxia9fWlu9zw4a5pEBg79crcxL9xBlC3LbdAypCOur3KRHjZNnRB0gVhiFyaUnv96YwcBZksMri+s/v4mf/964/Xrt4x2qYRIinrOZkBSWYVhfcjEORnJgu7PDaIID+z/hK61fySU+9S6+cp+2TuTl4rWGMrhe7LnDMY7WtFwrVPv6bcOImCKVTBFfPsXJFFiHg3b0nZxTPmpLX6ulUrCZEGNgvXWtRsVuyAptVnKs2neNOy9a51ZlwibRBTtCyEMnALuhpKFTACLFIg1mgabhYwaC0ofrKxVQIcenKXbTBeBcI+m+8l384Vj8/nzzxnve4Ae4ARMhwAojpcTtCNbGrUiOovQ0E03cDNFV9yOoqptxMc0DNCli3ygQDTIwwi8xJulJ4E3riGnGS1fXb7OOsbAwZIR6WSCsBc/HZql2RjHhvBEcpZplelQRFoaobC/B5Nev31n/6RoX7GEGGSYuuzTZXBYLm1MLNzjt8k6BVuw0DnN1hoJh+Gk94/fwx6PG+WPwsJrvscRPCIp9Gl1PzpwVyMbUVXzEVkZwhF8tqCHihXdyl8RLTpm7SPHZjfXrp/jlIjWK3rBVKwdAsGw7uo7oDddhDCM4uTuTedGNux/Wf7msLtp25yO6ZkyzEfDCdutv0Hxgmnj7NOKaQ0QSN975ehuvV0SoCZKBq9WpSnJhAapaFRebGK2p3gEhCwaOWeNKuMa0fH4f5cMfD1BWyMnJp2eYnjCA/YpVzAgWBKxSAwnCwlEoN24l6XjxUuvqLUI1dKUh9voqynKRkcWzUdR99ysR7iWYzVXgPlyKd6IO8AtYe5W6RSx+bFw+Fz+40jr/rewWoVt85jEWKbDysqyHqCX/ZsEKhNjGnWrLFRgpkrF3rT/exJ9PUBIydkUPlDGedyoRrHYWOlyLRA6JHWUVBYmtJswrjc+eXj/xWF0p7y+HmUo5mi8H6Y5/eP/Jbn9ixOjXlSBOjQoUcSZqdvrDAq71Ny42Gip73F1Gj1CEnGpthtgOlSYFIa5+RoB3S7aOAJK+KwvBOvQZdzSYIDxrHiC/V1nARCKFL9f5cruCu4nzAjXewrzU5qfLax+o8QOf69aKTlSTLxBUsrCPsctC0fGE+c3DrvD1GEdw/lFMPvr2v1wnV/vKuXjxaevFpcbyRSHaLWAUgoidd0WHH9bdJKSIttJ/2MrOHNVkFUEmhHnOqmOL63M0scYE+IDbBjVQoLo1aDPI7qqMFJqLbxtXFrnBKiMFpp3gE2Bgv8GCyreqIYOs6PykiHL/J0FlXrZ3QPXG64TUWiScXaWMsyCbm6x/uB4vLzb+9TsZEzCFa7JngZ8TXfl4SRNKkkN6BlMoC6OU5rcrQE0uNEXI9yyWvPphdRhKPT+M5yqZz2792j314Oh0g7Z8RPwt/cyIFE6kiB8YUIo/rKif64cVYPBzrcRKgoOj24d4oa4WMlRmlprnwEptXni29v5mvHiOiqxR0dVIGcz1XxLvVhHltoo0Joihb4C9mEiLr1L8WF0mAb6aqA5dC3AzkeObO4zWn81INB7/8JhxuP5BRpxk5FjyuHqeHcYkyYzKMlHEOcUkyUJddqWWc+tLFERIzsP6I49EtRiXzcOcCvZNc9XmPZXGW+a9Nt7OW7oYX7na+nR17d11dkjbVFUKyFgJRhycrb6JyGxFSmkHosSR2UREBWZbModFRUlbRvZKe5Q0VeCmrV/5yK9+3zi7uP79z8IA4rBpCnpD+tj1hZcXh8GlvytS8JRvYHgwbZ4yucb7HxtXz3CbqVwGz5TmDQo5eMgLFENFKkeIPR7xuBk5rVp2b7IERFPml5eNcxdYDtp5x4cZa5c8R1e0wRj42UTJUUlfNj7PqyzjG684y5hJ0D7fBkn0ps3XydBTtp1p1aWMuYQFl7akTPvJsJyS9WiO2mYpGmnGuMo4aj06K2sxJewibUB0NByUvaAtBYVRJVLviNoVUjcxugnOFRqneJlIYe7bnxi4mjBbw9IUQBUnKbSbwLkaEm4ADk1EqLCgAQIl9qMAd2qpxVsaFy4xsNHQTvxK/psAQ0kYZIIVA6aY8EQhEgVEBDCQYOBP9b+pkrUybtPBpv5VytfQnUpjstJlZUtixtSMUhEl1JXSVOqoqaEMJaJ1h1IbSmek5XpSov+pejCkqRKkCRGqpKcUnVpsSmFpijElvITYMiSWIarw9RtySUkkKYvSTsmI8s9Rj+1NuyOTh5Qjsu0M4YJMjivn46aNnI8RJrCTAj2y6a97HUN/YjzI56zJifGDNXdyHj6O9MyUR3AMj+GfO7ltYXx7bbI6fXg//O0b334UP++FQ3s3w+/29mwpR9OHdy+EE+N7+rqH9u/btbs2uW0+qh7etX/f7l193fYI/GYGPx/c21PozvZ1OyPwqS/IWX2D2c1B3srnpkeym7cfrU2E/njPbFSdXgDWeAb+AdXpoWyxAKd0O3Z3V2/Yl8XxYTy+e1fvZLZwsCfyRvu6gXelvxfbHu3uGxro6u/vHeqCfwe90T3d3V0HvN3Zvd2b+rP/HM2O7ukDmnC8YwekAkzZiuMKB1PB5mYUPMZyuSCEck52FJWB9M1zZ9fPXFn/YVGK54KdKdh0qiHkCzZliVYc0RKHSWKWqBxC0qgewShjqmvvjjWfPTOoRqEqZEYZmzWsWY+QpuyBeLY4GUcdCDBoJeCqiJgpCv/LZ+gTzXDKxf7cunQO/g/THGdgEV0ZUVVSUCGDJSfwM5qyCBtsH9XE6RnVKKhriZYeM4nP3o4vYzkqzSQjSfHqhc/1JYLUAft80wPYuJhTHP/NJbzXl35rLn9aW3lIZXytamYafjjt+3KBF+hMjMqrkURU37nTCG9DC3Kp9iJEVvUWkXQzdliTTeOD+psK9/D1g1mcPuSZronG8YEvDsoxCrMiLwqV/UQH3DKpwNaxU+g++fhd/Pl0fPtfdKFlOCcTOEhD5jVx2rriK0MeOEJLMiQ9rqmbyeuKgcpfZ/rJ9HXLKWJnLSdH3U1EZjCVvBejogEbSVcyGhDQfrlNq6H1/CWG3Z7G1oLz5ao4BZZDMKe3aYMcoGZOLJW8RAn/xDHFMslJbkhSXgjzg/uJFy8lWM5HgpTEIECwauW1F7kg0A+NR9qPbC50xupyax/WZOuXU83Xn4w1iUHl+UJglTuwwSmR5gHAnQbFdEsygOmmGNBUS1L3Q9fPmZR913X0WEfC3EmaCXMnaSIMGiUH79tSPstyXvh2jYdjkjefzZfbuTYOjTvPFAf5bJJMEH/a4d+x4ZM0j0TzYzK+qLmZNJToJqjdcUYge2EvwY2s3zjW/O4Um0xMk0jqhjcFh7ssO9jRw+dqmi6XvRBH6ksVihCy9cGSFO1UhAEkTtsl4E0+vAMGYOPyNXUZDDyxcqS8ELm1zbV7/16pPxHR8HII56+IkEe/ntHIB+YX1hPkRj4h/3jelTfGEiYQVKijXi45gNiILpvuBWPhkeirSyjFiLR8+4K4NCEsosy2H8U/kDFB1G1usjHLBdsrIEciUnwFKX7jSzeb51bi1VtCAmMfahvkXahEMOc+SzYqGVrxEM5CpphIhmaqKhlakTXSoWni21791xLHAdCXJ+KLQxHy3PgbwwLefuKu3xiNE6jMTnnzmg4/WDdBjv0BTv2xm5GPGa/wXxear97zI6YrxPAgdefUVoaFs3Q8OLOuPystKHtKHiZerusDrBYlC2kTi9wPj0PZcg5MQHQ+nHvdenRNYOUqhlehhrERz8gC9tpE1peQtJyn9CgFuwjDmYogsuEs6GVUfS/SOjDZyxmsbhHBfQCgmRVti7CJuvRMOCURVVBe4Mp7XEubO5e0Pj6Lr1xqnDgVc8hR6MxFmchX3iV5hUQycc1yRFFLdBdhiqq7CFI0Lh0lMuYJlxx+vIjtAp83ZOqvbO71ShtIj7k9hFNRPX9bz5dazz+t/3QvfomTh2mwZDYmkM9yPzF7BBcxwStyu0dPHyaqpg/R1NNHYh/yAdmV+qpnACLbHPx6GVcm4ay7xwEQCXdPzcsgIkohq4DrR6jvIdfoYVxVFIjq83sJpzyw2YUthn2CIhD3fJte8ruo82Yg2Kd3FYK1Oe29qjosyBNxukgErAcVKP6PRAVBAxYTzoKrogVnEXhg4MUHXA4/hEM6onW5IuCkwmYUoHMJwB+DMuoqhy89w5DM3MeSuC71ld0UvFmW3L9CkCc3rwTCMzavRKFEbIv6i2fiRlEzEbOPE3BS8SG59O9LsnTTURV6TSxBRLVevI1fXuEoJ8GYiywWPd/rzFyCjBRziTOUstmIt1A8Sd4kvjfizLeWqEXTPqxv2uCpbpV58eQAyClZyX2rYn0Zvbx5WUe/aPKhMpoUcGjeDYHOzJfr0+SoQerxyvvmI1WJCS+QzpOFaeExUT1Uysj1CzYN8Hez/ilV9F6cN5v4nXhDjdZuMgKgwqcuns6aLg/Wko+uZgQbFGhFpAObvpmXXF8tqIttUQs1/mmB+nhuGHsp0F0SBDMs0aAuZX4mTM6ECaiMvoS5lzDKDHssYYYp28uwujawuAxDK2X3mOaOMnSS9k3CrEnYGMqwME2KJMI3gX07KBY17gkUM55vMxQIcYu86LC+GvwVZL0hok5g4U4A2sTOyR+LPuYSRJp4kuGpQqYaliaQowkYE2BOQTgTvAmdqbGWRFgmWlNQTeO0BJJJ4BcNkBQ0SsIhWIQBdXGSEAKdu6pqbev8t6JqrUQh8vV2Ut9Ka8tXampXrVdZo7IyFZo0qfhMfacUHSs4rdq0UpM6zHQiKL+Bkuntgjwpv+kpbyStE3J6AxFtkEvKHCVv9Ln8YFiA/Zf+sMFJQtCl/asY92/ZGJqJk6ct5LP9sPKzdjxT+Frbjyl/6zffdHa38inBkSM0iY98881f97jmRheOzpW3RaX8dvibhwHHPjyG/xas0f1+7uj8Zvjs5xb2LxzdUZ6enDiE49u3lfKb5/k3I309e3B883yYmzg0MpodHsnuHegfRjqe+L0Ln+H8ue3bYOqP7u93Do/1F+ED8EVXK7ArFkb3T08c6pmePNTjOvYYUOiGfw97QLpg7d85DgNdM309u3q7u+BjpQhk8fP4wQHMJx+Ev52Hst1dewZ3w0f4b8/4wb398DcwM9Kza392967urq6Zkb6u8bF92SH83tvdydeKUQF22eWq9brZnuW6Tm1GeElk4736Mvrin3In4wKnJFMBoN+x2fP5x62PVN8fjBKs5lDLTYNhqPpJB+xb2Iih71mUwUwRiR14e5R2gHnrX57OoJ1Biuncmfj+o8adnxs/XhU1JARXRK0VmbnrYCUnrmUZOTTvfU8PlbkUNWJurLxI+VTzSm3G9++srVxofH93/eFNUUkUkFdgOxU7kGaSU/BqlYxgw+lUNCK4iOgeQZPzzmRmAhNuLp6IT1HjSEE4U3Bxygu94qBBhzaNM1t/wvUmAH/MWvy00OyrcpcSuVNZX6F8SAfrC90t4Vfetly/dxIf2dXz8EEUJ7apvy2xEHkKLkqnghrEuVDL15cRx4v6gHCkvhRE6q1IJhJEoc4Rb4dYxR9fNW+wHcT3Anx91XSadv8J79V/rc1w7FWBdv6Bn13Li8rmObX/X18hiPnuBNjf67dPN98vc7Np3v2HU2bsMHkvSeKp2zGYMPHUbTALdQ9M37gFmSrjpWP3RAcLfWCD8D3CtLSkzNi95o33sKR04B7VskFiHZjSjbZxVDcqah6KW0rxo/tSzOi20ryw0hPtBeb9gqpFh18SLMQKJdQ3JV7/x++aq1RiCF/EfKBO5He/gLvZ6L/IiOr+KUbwAwqhtcjW0WzTzHA1BbKqkeTaPPk7lzcy2GaYodDkQcC54/Lp6ZFOt5XjdtnMonHsZuP4orwxPNEv/7eoJt6HQZtfhyLPr8Ogb4eeXQ1rocnBHNuIB9IPdVocc/n2x8aJ85oLZtsE5cismkvZ3EzdqJnLMoB/TGwkaWVn09Ri+jibzz8WKBdPYTPQMrL6KrjVZcPLfxLK0kRqzJbNynFhqppe5x7Bkmx9/hdtVOCPyCHF02pslB4EfO/F1TPrgGAEyRCpIaL2TLiWCkwOW3/Q8iY6mbFRGVxQf4KR9UBwzi9zi7qCLUbwp7qv7DzBqBz5wr4ukhX54UZr6TEQj28iKkQCmXk6W927V7+HZqTkI+4eblOM2jwoaOIFU6b+XfEQgHDjw9PGb7+KTrtwXXg6mqYiTtbDinCJ6o5Yn8kOOlZ3lBFcV7/n2C0RpaTqBCp5ynQ7yFJBXYSB5zKabkqo4oMhNkquIhdTMWBVVMeO/EAEncCsoRAH6lkDtlROzIMPN7WDgU1bYdTQyRkf9bL0nNRK0kIn444La1Ns0CoH3T/DqfDi/fr3p5ShLAx1sivkVhhorAInYlHZDBbvuYrMnaZ9PmwExP3WuKQGJYDdi698j73WqHGwXfLQY0aVNFRsDjxzS5StEVZthDZmJlWjQ5GV/2Dqg2jkdmcV//twTFXpEFkP/FxmnQjUHSX/RrWCaOjLg1M0mJejtLUnxN8zYQMflXmqa6urKGrP/o57MOQ9Dmw+k1rGEQu+qQoA/bz0lAnSxtB/YGdOGMXPABOSn5o0QI7yY1HSg1EiYsEoN4kmvBykuBV6+XLhFjiAJT73K87JFx+o/1NeZza13YnIdzJvRAwpkqk7YML68uWFVWR5lgUniCzuyl4lNzAO5BMj0rw2F9bXHz1lbYs19eAN7f7A9Mc67krYsmOU2LA/TH7NWwkZgCRT3lJJVzlMBeFkuL+FHexR0hYMNKyHcZl0hsSow2FFKkAcL/8Ci9EExJ4P+C5M89H+anNQjiFZ7a0GmkYQB1IznNXoT8ew+dCp2tKf7hR88ZUbJUpCAAgTvnRb/I6xkiAid1UllUTYKcswcjUCMZA57GQUhNTuKatEfJpc2Ak1Nek6l/EQj2ExcPKhUE8l0bzn1bHm++vx2VvNN+95IxCLBbCqNJRkSBwOysL+Qk/arHgP/pmqFJpX6kq1Orj3OicgiyF8O5GnK4SlDIUHj7Ua4NR/pmYS9kVdCfriii+c454EUzMi1Z0oxpffc+NoIsE1JTqGnv537GBliyoTNGl8mlanNjaTc15NdWOSm/aesJY62lmmbaWtKlm/07R0UpaNsmaUHZMyJhI2hIwMlXhOGQl/1Tz4E6MgbQ8ImCshs7D6JDJWmLgDGjbQpeKZRLyI2SXcTQBdxo3o+owswXNKLiJYl2evSEyYAIQaCGp0piCZAmMGBtPIa0O0pWCWr3APY5YEXBE+6JM/KoCisInCIymIoGCBBATKk1mQhdE21MKm5jV0rqltDV1maj+l8czjSs0p7dameExto/VMUvCb8p7lPMt3JdmTstgQw7wWeB1oiWtIWylkSdlqeSolqSFChYhiidRJFplySAmhdq8qiOL/gZJ41m+LWk0eUt7UtjOEJzU5rryo/9zAizobHTlCv64c+eeGHtS/hTUMoERt+T/Rfo5wG////O0bbEKvBqhI0v/52z8Tg/irzX9Le2Dz/pR1aO/gaOjmc5XpwkELPmyu9o4Mbqn2znhOaQ4Gx+EHEyNDfQvweezgnoFCUC7Cob3WVjdfKxf3RPBlcMvm3vzOKSuagXOmC0PW1jC/MFcp+NagM+OVBmtBcSACgoVaUAYS/UC3D37jwn/5qQkr27tzMos8JuEPecwDz8P47/jewf6+A7vG9gxsm5wY6uvvG921q3t3f0/Xvu6erv3d8+OHBscODgwczO7qHu6fnBjBXxyA0b2Hgczw7m/G9mVHhroOZvuGs5urk3uyO3qy+/d1d8G5++Dfng4+2JpP/cVD3xOPuP6coyvfyPHEMNbDkhvNS1W0hTIgRak9MB2i6tc4Dal27cdL8eqjxuVr8fNza++fYaPgd6vNK8vr93D6p98tccC5rb+i3rUjr1aSrap5FMuUo6Cvr5a4ipLmivXdsIHtKkVREav1W89bL+6pyUEUZF2tANshVrBuoy9zvgseSk8SlSSrK7VQFXXPm0e5TtWXp7UIXbeYeyaaeyIgvrTYuPw4fnd2/dS1tU+XuMtdhc7MKJ7pK0jcq+ZtYdxVTdxpklPibhU3dcOatrxfTHytuXms+Id1p6n8r1VwxBA2QCMuDqaayk3vpTJuH1JLvLcruOm9+DS+eIq8ngU+cT5yaljqWtjORDjDRdidgsVbYVWuKVmw6q+sJAfaxkejOtIszt9t/ME1UplyplCwZGUaZ4E9IH6VzsDGNIkBMz7rGX64m9fxWW/et66gjrSr8wCrPICdNblvZzkwp5yM4ECU5RCxkHsQlHFKjcvuFkT2yfovPzc/XY7PPsENAeqIJ0hnBIlUSBNWg+G0w7Lr54Xb3jjoVtN1+LGGCtfhx/tRoU4XnqwfOwd3xKFOmCyFNr1NcLcDy3Y+vNuqCGpSREPHTYUyajWgXIrUVwvj1ct5HYGx+ChePCHCL+Ag/VzQcf2yZ1VDWwz+Fw3BpDCHNLEMNX/E5c0WC5NtnvsB1nbrwWd1KaBvkKp8lSWsrF5wKvI9Jr6DnKhm6FXy/6huUnz9OLxFfJFvcdu14PvFDJ3Hz9GerS+VnIqFKZ8lCoIMfUGWOilEVEoLLrmsWhYpyg8+xlcuKMrzLogCJzCpY2INwFEbyflYdqAQiMAqPV5f9WxVKY1emcni0nfw5hSLGopkfa6a34oHCjruzWuM0nTjzpBqshk8eK4pHgjDq36aC1apsvFN6ummB/RsI0/C44gnXOvc6+a5FY4oKFBdZTpFeA04XE+U9GJa5D6wZBeJ1BGiT7rJF/vowKJ57mLjwm1R8ot+iqH7AsdHdrFYy+lyDOnvujwDPHvR3YXd/VyiYf3+Ynz+Cbv7uUoDUyDi9V/KmNoAt1B/UuRgcHFUM8JGHiLWExnAJFowuQD9xq0nioU4CwB7cdqyRaEMmEq0XkUYM+h43/S3KmcXV6BCZ/mXp7QNxAYWvd87q/GVd623j9aPiYgGJyhgrZJZqqIrsumk95n5sfZoG+N6ZCCBASDItUZ9VY6vn7rEC43TEIl0BteaCuxwZKcbjM6qiujowJoFdcgHNMPAL9iidyynkGGBkSBD0cnwvznOJoufr8SXbsb32VNLfWrh9Kjm29NCJplsBXVZrrMDY3lIseEamBwADWxaz+9x/3akj1UbRUJLWvoD4KiI4pFp2e8ahSV552GFouu0nMYF//yektbEBYvdYvFKJbP/fwt/WohpaiH6aR3pDjbFVPJIu6AS/wOkIvzELK7wvxMn2FVMEivAGv22aqemiKpaqm0jScqqUruizPXaFV3jbdhHa2B0Zyp+/VFglTI+ZbHSTjdYWJgGw7JkyaX6acLjWV8B7LtK1dF+ehC/e4gtZM4vNe5c4r35GuZNwKSWNpoiHobsjWPSVMaq5inbU1DlaqIV0QFckW7+eJKhM69J9HkFor+072BUQ2R7zIdbmQRWhUWj79GWvI13sOQm70CYumurp/FGJCvhucXzyfB1rDljn6xaccIkN6zVV8FaM8y07YbQkYtTRSpF87aAF1YiJ9UoDW3gl5HaUeQ54S4vrT28cRIFYfsQVy/hsAPKB4JpwC2W7q3fO0kJTlipyp+LqAkcOZDEyRynSZ9x+lHpSv09TzWFFHlFUnqhxA9hofMSoVls47qOKKsVV4IqKFBhIFficihqdVBg2AqvCK7p7GSQjnjDYpWJQE+mqHaRFBJY1an+vLTkLhJdkdpDordXznsi9EDiIZSKhcQIvcFlTh+plUjvkRvrCUKkh6dBI0mIROcayR2ahUrvwITaoIYp9YHIBigJTWokeDBVleDBl2Qkd0RY0hTFL6lRnHxlQMYZzxihYtAoBr7cdiLAjeTM+W4pvnZz/frxxoXPlNsb4b0Xha/LqpFqlARgfU5hZrwmyRerCNPOX+bLda5X8vA0U299Wmkt4a4E0gXtjv7Wzn7ehCWtPyVsZmUep4xibTVq27DNHjStQNP+Mw0zbY4lzDBlexlWl0r2WPIcrsnZbgkp60cbPf8vLA9tdEiInzALlCWgjgoczdhcfeAIyWecG2KiWQyXXDkHHDWg7QTHkyBc3jeTMM5MYOA0Vu0EUDsD4CT2rf/KMBEmI/2bRp8m7jQQpwHNOgEyEx0JQCbRUQLrtYOijnDIBEIKAmn88385FVIQRAEAEwy0wQATAJja39TJShunlZapo5TG1cIzrWg76byUmjO0m6lutKL5CyomqQykIjB1gBL9Quin5L0Sqegj2Vgiy7UlpLFIn5ASXkpFLuFkdxKRplwUErFDpQTJfaStUIJ5RNdJSP1elkkwh5W/eecG/mZ9y0d2Sn/z3zZv3gbn7kTPMX/ctu1vfxrGm7MOjG6ad3dGhw9ug7/ts5NjB+2JQ8Pz7lhX9sDmefeAe3i4vMkdXsBRrzJVhB/UBmfGR4vbtx3Ow+k4PlgbH8Vj+L0K/1a9qeKOzUDXWShXvUoRPwKdhaG9uwbh+1QA5+BvC/iXx7/cga2zYwcD+9Aw0I0GazOjW2cn4fsE0J4Zh89j+3b39cLvYLJOHOrrHVrozcLA0P7sUGnXYHd/T9fIvr7ewb7e/UOlvYPwt6unq3v2ULZ7T0/Xvt29Pd3ZESDQvae/C346AP92ch+Tj6w2pYIb0t/JzHxM1RLX3v0Unz0jYhtsD2Ae/FD73uCkEF6RL/eSeMizOZu9DAMLBr2Mn8PuEi4surKiHV+601r8qXViiYptYwplihHZb9hYsEJbP/StAMsjp7YbvfpjL/OPf/yD0v9xUV28GT99AgPNG7j5iK0eMiBQsBi/LWJWPWRjGXTFiGsSJ7ocl1Orvw5kYQGgHV/5vvXtOS4sEGENuST5io1lBkJxxTYm3VvyW30Vq1+9Ceg6jzWunKOaqfYcIj5vWjhQQnQ/ZOxZriNG31yTBpY34qwGSer2vfWf7jE1NGoKBjlRFhWdCpx4KDbBRD3UxLgTiVSeKVa82NcAK0iRjF+/9bZx6/f4/pn4zGkuPR6JtuFEQ5ZWxzxZV9d7lUf/K3nM5M6gRjDKSCBLsdTIizGs6s7IF6wcEImCUjYWgS+Jomadx6kkoyi4ZaagxmdPN84u6hRUdY6hy/Igioopeh0HwXwTzj6PsnhkmthPi4jGX9/h8A2DRzmUDTVDK6I2askkqUgPGYUCvt5QjhqsEfDyFT8nrnPBjhhGkUwRjfBaiXf6maDRuEDSwofCXYpQsRHJ5qlHjYvnyAOPNM2uBT56RQNnljdAfdAyxlciB9bCbZehV3waq+MXXHQFGTras2sz+iR6kAjo1QjmnKjmzPXHuNv8mDeply5id+YTy63fj1MGUNmgS4sQBBo76XARzlPDDDlEWwIiCPWZLrqAcP7T5ebrT+sPXrZ+OUXOXzvveOStDkQFLnJmKdokkuQ3k5YplJhcUiiZJH0Hw6dqrsWhWxlq9lx2axhxSdvRnkNHZWwXSllAOpSPjm/vGmh03PLhWtr1N7mM5Nz6ZSW+eKq5+q75/AYzdx00qZ1M1Qp0B4CQAvtNllhPPzCZ4MrE/Tp5e2KLCdZn8/4HzHKjLaao6JQ0aSwqTcseiaMBGEhJ4PCYh7lsFADKYueuy3kiVH2G5FHj/rXWp1/iU6fiJeytgoljVbuaAfQsSprWqFuPou7PWgnC+Irh+ZTTdNffLTWPP1V05+3pAOSqJkuti+xK4BcdbJANj8ZicyB1wKFq/yILfQVLDVOHIxD03r85kfD8SuP3b0Hcxz+doQnl2bM2mfjSZV5yEN/R9BS7MxRGJAcjryZb8ZaokQaoUHoyr1fW358E2hxOFNVyJlXsBpRjvI8PHDSzMUJN4MDIAiC6QF2BZBnd3/7A3Jw7j+PFs833bNeXwVDyaestJ4NUQkPemWQ3GqdnIsscUgurlbISusCq8ccfBAD0ySY33N8LMEUbQ2jYpIXXQUpRjICQKarMfwz6BkFB/o/X50Axrp+50vgNfVaAVdwiBvWHlnTXoKkH4AaXtFV/JBra85gnXMcVUZaPqWa4yRdpRKLbfH967f0NerFurWgTgjE4JB5J6FNKQehU2h+Wm1+wZZMGly0/41E1bv6Ahl+nR3XUqRgiT1IXwENSVRMSH5OODeJZ2bhwsbF4SkIRSU9OGgll1CwCHtzfIjGLxIWqGcQXqqZPOZT1HCJLVHmu/xpQqmpIQ1V27ASiGoqHqAuL2NNMf/Og9ep0fOdn7ssR+VVND1NXS1i6A26WymiJAbxSl0dKAtO8wScRP7rT/OWxLAtXAtUt/Sb+lEO6SNCBeYDnY/MjLkaNwsn5etnD2oehoLZ+6tf4we/Ne5eZJshRG/dzFU1u4obRlJibKzv4JUeYHENuoMSQ2wb0UsFObrKZB9WgAfO7TH2D/SlLn/+6wggbQ4pCEWjYuPMUCLWu3eFww7zjomObqMq2nBjRV8UqOxb3wqm/So6geizITV1pERzHzX66Qng4lRAoClsT7rni0w6zpljAuh1YuR4PKYp0rSBwZmTRCqQK13rxZPO7X/kNEyVJGa7skVWwhVYUZkroL+B2gGcMwTSsTSsxwxcc/3QLRQxdcAigB58gdqWNZBCB6+fsvKYBrzw5gFqDuk4tzUuarauvGm8vME0PO0kqahwYiS8mhP+4WomHuWk4xlk29WWMb5zJkMqWaeLNH5/Hl983/nWndWGF3PS49eHasqYXrxiTqlwyaarGmmGa6WXDRDuGtLL9pi25DWzBhHmmTahOZpmyxvC0hI2kpYqya75cdzxp0DQuXWFrprMdkzJfEgaEshuSFoNajBqlb2gYKM2UAOkmllYQ2kDOCi8rpMx3KnGs+kC+L9XKjlxnlFWlsCuW4LSLhLk6I0sFKHnnT6FIE791QocKDmKFfAnRNHIyQFMKKymUpOGRAYgCTF8tEgCihrsMTgj18CvsAEmMjwb8UKjDVP9SB7frYqWDudKt0rmkolgNag1o4g6pRqWq09ORFJDaSCLJLKJTQTI3Lv1CT1w6+IWiUHrG0AtaIyhVIMX1n4t9IfVyCEwSIg9HTImn5amSohxUVJATSWS1yA9SKkqvjrwwJVhMgSIBPgiScw8oBDwhO4RvUC+yYTTL+9Mewg7HlZ+w87nCW9jhoPIZ7tjAZ2is+CNH0ElwZMd/CFWt+H5QxtLndlSzQqC/dSs+ZpbpcmzLVnqL/GVHW4Bq1c6Nwl9ta2UqXyxMjG2Hf11rfBQ/4792bq6M/04e3jtk5xbK5Xzgwe93wH+1nfChnJ/1xkdLh3aGdg5/B9+DrVP5IX981CJ6Wyt5+GcQzp0bH5055MCXsLqQc4oTY8BzO3y24bfuUaDvFAtjRyf3DoHtNgqfJ+D3Jfg8PtDf1zu4eSy7vS97sCuL37r393R1D/d09Y7sHjw6eXho7+6hwd6Rffh5LxzuGdm3e9uB7C74uGsA//rxr294f9euYTpzfyfPIsyj+iqmgVJ9TgA57Pmm4QWu4JQ4gAs5Ul2Ymm9uNk9TaSirhMmp+pcyCo31skkh1Oo6SVjr7CQTVt3I6uRD41Unefklz0JHhlVwLQ71w4JU9JkKvVWlVYn+qq+LNQ6VAXPy1PPGy7eEvafzMIcz5bzlS8eYohD6s74AR3rEppo3WMKfzXjuNde6fQGEdesSIf5SyTYIiubAHvYJVuGPxiDYS75MK18pUCYotVm42Th1j2yVOd/FkCrHUo17XJ+jd8kXGhhBlQEM2ZFBkvyh9VXQ1xixRZVX39D1fnuuee5288Sj5ioyKdrkCVUsCPRasECLbMQVMc/Hs3IqNhdTVpZyKQTXPHemdfOkAnEgHAgauioXhcMyBVmP7QiDMD1Ptg090UaUZeDFU2AbUqrCGaGmcgbh0K7USrarQDZ6urGFpBogNc5lDwUsvHKndeOZhJoAhThIr+qXU1BTEnSTA3+CNMVcVeTQ3APspmw9a9a1a7PiWf5lYy9wEu4O1WdGUE6PmjwkZTI7KC2dYg6ReuPm8to7KunqqnM1p6CI29mUBysXGOgfMQZwpDaDSFI94ks51V+WYpDuNk9i78syn5Gh3bJc6p0ZhNVrS9MVVZYU4RvPmLDx7gzaVAokY4mduAJ5N7j2FVUEIV9q2yEsElJ/zXt181wdpPX5TOvURVkaBKsQoXnEJySEj6RBEsf4TosPxY+gCYsOZA/TlIInSRHsWDB1sXkQ2Qv4UXQB0Efc1CFZsuXLbVeUb/lymyfR6ffx6T/g/61HlD9jgxlWzEQh/F/sQ0sBYpLrNEY3kqANt6II08aKSRbeJBZ9AGgGL9JiRyIPhbQ9gmLPYiArEfZj4TEW8epPj7KkEi88PvekeWIZA9dvvuSWyyG+jqgIMwi4lwWA1/sWJmsRWpjmrMJwNmDLmxkpthSWY3D0sR441hgTwaE2yUsfy4eJ9lgwxrmcWCCfam/BSpxmaYzv6MVK4+2n5on7IIopSIHCM2t5Gwl0YOHa8KDzJhMspoLPFSNq2WGInX8oRtdktP7r48bla4pRmHOCFJ8CmAlgPmXsoiMdmwHFIiCDPPB1eEEuVYVCAfIoRoAqahKMApvG5lXY90yoEfuoY7OvGgiL4ryhzdUwaaN9XlJZf/WBSQBuLJoUOilPn777JerMjf5HDptR6pOdyAlF2jz+NKFOsYiQaHriH3XgMfoleLPsyxdJEHDthTZmZBqW4VdTvKXQSWMz7UwkeuKG2JyiVqLNBzvSrRrrrxww6cvmMLXyfVOhqD6e+mda319tfnuN2slLCFx/QhA3oajg6sU6U6pKEjWVlSLM4IoJs7YyqII1YM3ik8XXR0l++B2WlXh/4tVRg5kFfnmta+/ky6uoDmaSjhD2JiUp7BMiXhFkGc80DRmvKeMcDbmARAHmEiOhJNzheSVxzn0JcqLQkiU0CmhKZliK8+TErwZqlHMT8CIRkDJb09BqTE7x5LLpeJuJdSnUmVqX+m6RUOn/9dJUNBHbcjxtkaOMAdeK2S3hrQTODG8ZNUt4CytUIMVaqb6kCcFXS5MhxM3hw/J+AXZj7PAJkVhtzWlSeEVYdtOKHH4hdE24cVNftoOieVmeNBLEdWGAHF6WZ2XmA927oWi8XdbNkhLtJt7l2QsEvn1nvF5FAWuyUx1Qjl1F2Yv7eXiJMOEoodnnrmN3C/KZN998BxfFz9yepuAF+Cen2pmDOOcwg9AS+8XUWFRTpD5mGLCYkyTjldfrD4R4BG0y7aN0IpqdnINpi878JpO+DTMrvnhT2Vgp4yoQVg+RUR8TppSyo7S5A7fGmc2mXfOYBORJClvSVkYgTYEgZVsI3K8Qv8b6hp/EcM3I30vXjAbyjI3Zw5YCwwoCk8NK+coK+p41DOWJLCEo3LIEtgp0atRnYMpn1IGM8eTZ3xn4JQBfEmalcR16ELGqHDFdv3Nn/Yf7lE2ukZaJc5LoRoIa3PDBR0M4Jj59ifFaG34xEAWnWukVq2RTAi5oiSeUuZz/NE21Au+sXdv1qgp+db5cn6OZ9VipUhb5NanjtGqT6owVWZsGw7K9mqHSPZqXVjikagzNJdZnp3vT0n8DoW+c1P4QtQRWMlOJSwoYltmHr9+xuFXiUclFJcSSty/Flr52JaTwSmRNR7qS71k65Tq0fy/45cjei5WFQND0tDV/bzusW793OlM2fm87pvyD2zfwD/IplSNH+Jz8ke1/uRaoNRHMWF5l0ikVe/fs7ukqHx7dAn9bezcdGurdfGhoojY+hscqk641PVWYgJ/sm1gYH8PPO+A8a2LnDPwFQ3Z+NwxVd1Qmh7zJIXt/tjJ51PJhaLow0T+WnQcaW7ccHp13ir3zTqn30FA1709PTcC/NpAJ4deuBQRhrLClPNo9sVAbg7/xzZuGurbCFQ30jwwO9A/6Y9n+4b7u/gN93XAlO0eyfd0D/Xjde/FvT0/XoZ7R7OD+bGkw29fT3bUPTuvr3tcPfwP9B4a7gXNx757dXfC5b3fPoehQp17vtCfjOdFRG5ehmygJwsMUslRysOKXZ/wCzSS2/HBhoo0kIkni84/jS68an69RCBdVJizYuFGLady6AiTYhha1R5h1sb5NQXRY24Ct5dVIIWiuoovhl9vzvOlco2o46CBadpNX07zx8/qZy9ig9v1PzePLa+/e8sUBaHILrjPXdnmgVOpvkKeTw+L7/9Vh5As7ZpwCl6h85qrqxI07q1iE5srV+Pzt9V9EgD6elSl4zlySgVMKbA4alyP1ZTnUmXqKdGDPAXhRhEFP+Jg3T038/kt/tVSDKzBs86o+YP2JJ+A/KAPa8Pnpc+PVXeDROvFx/fs38f1fCd14vEspc+eJqr528V1feQfCJj2+Zk0PKAGgyovO9FRiGYmpMZva26PmmiZy4s1T8eJPjWPH4fVStDf8KjPPpyXpguoWZTg1XUAYqjbnE87vloQBi5NDjPptxssPmUXzye/NuxQiIijMF2q6H3Op/sbFpkeimSNIcovfKh3I26kD6FNCf4JHmFVkaa29+zE+fQemT+POOa6RXMGImTwsoJLInwM73vHq9+BrRrk0CKTj8FJ6WGdcG1w4EVRxIb9FgoVd/y0MnYotwj+DAk0eaqEsh61KQKl1HO3pU34OboYWyb2ATM6cbtw907jxCQwNZEIby2BloEVJxFOsAmehVmAzVfEhj5CTF+OaPJmqIddywylLTOKXV+MzV4TNKi6fT+XUEj9HncMRclByCX+nclia35RoKX4XS0vwduGbtY+XaRuLfj/nuwl6/IT4hjpTTV65J1YZXTIQ5w0yvlw+WYrHEpZXNB4L4Ag0eRKPhNqlrFKcZ5R6KK3PK63f3wAH9VwijKON8GUbz8Wcn8QzNWeJqcEptfqIiVqAmgP2FTbXYQXt0DBEkljvwwlyIKIxNo4r5OBBPEYpew4Gx4pjtIfA8RVU2imSlSXMi1hailfeNN//3HzzXl0Klkp2LeymFYXzobwOFwvDg+VnXA+hqMQoD3bkRmrmdQ2rzlJWlskUsyo/vGqdPM3JhMw1YwNxSwYF+wi/ZOcYzO6qRZ5w+cyK5N7AkmP/fooddsr4WnNcVAMtEw7GWG2cv7/2+afmq/fr7zijG06DOw4zhcCRLZ9I7abYuEZh4g1YKfWa4ERaNMHJTZclxsAHTxQEqT8K/KJRDtk8thAArGexa1RDFuypeA0WQma+1JTTLxZtnTzqyXBCVUdYxqjLo4kSwpxymbgKwhDibo0awuJOZQFhk6FZQTiBV9reJNV8m3WdxOE/edAGjml/5oxcEk9egpYOl4Pe7RKWEau2XwtKDn2wI4oy3oLJXb0LBZeiPNPhaV0r1JdDEdle/wWYlkgj1QqOGMXHL4apVBClLuEVoFVDnW5PN58vIcvVn0VXLWw1YeGWfijSt3wnX18uBJjMV8AtECUYqdiNGMfNaSUdHRELdNdNy8a3K43fflWCkXgkhCIDG9qOroBMz0vgIEaxEp2V6Pvt0R4LGuSiw/HqIuCd5p3j3Ll4ns+EVS7gQhWbmhrYz+EBE/pp0qJVxpenM4py4+3xxrtTmrJn2a5M/8z5bkm8Bwp4VJXqK7abEy9/OeIKRomq9Ov3vl+/9VxXpa+BWsowvQRpghfkWyDqatCpCC+DyE6TeTfJ0vc/3oyvfK+YMMSZS7LJY5YsVoN0CPW1DdTqr7Fz9QyXCKg/puSZYz80Xt6I3z1snlhmTwr+OCPPNetO47gdOkFel53GIRD9PIZQiQwayUcU6bj0ipng5KbfZgQXXakG7j/CmtwdGs25OQcPYr2pDbrMrRxlbP7l9rTqNNd8v9y4eDy+8iLVbA5dwVhSIxTdDhLchSVlsBQj9Tfk46P1nmLXePselZjBDl4NteVLcQodZDWL5S0BaoZBTWQD4O/aRnkaf3m6ILkKlxPO4t9OAkP2OoV2Pqj5JCyAyhzM6EDfFRPVi0Uz2mC9GKzkzfFyJHZ8c3JFJthhYdmjlJhjT4Ep4YhsHSuwZSVej9Jqav++RDWMuHX60x8aN37nDkceFhJ18/N55ULDvkJLLtk6eVFTpfMghYtj8/cE8cbNH+Klq4o+nkk1qkwe1Deq5nIrPXxiy6rlDLy4Cpdd4UMEH3BbSsRmwOQLwNahBOLVh83HFxo/X2+8WuJeMJTl70Q12vQQyyeoPymGfiWyMpotaRrHMmq1Sa48vYlDhsvE/PsSvQ7iAiup+WRVaNoau+Ada4PmWCVMOc5U7P/gIBD+QWn4KwdEyrT3RS9NklizwtFHPYXInE4a0tK2/QsmbZsxaxqbvMdjgFYFVE1zVZl2PEvYnhMCSdhuymrraLCZ1lPC7lAmh2kfmYaMNl6E/cO2jzJ8DKtE2SLaLFCmgGkEpJF/AupvhLBToNrE0rrsrIRTJrT6eg3DMFdQXlMAy7ljgFri1TMmcmoHq2mAakBDhQhTWLAddbVBrQ3gVQpVGXgqiaMM8JRAMeJ8gkgaFxkooqM4VOJPST3Zypo0rtTgtG9r6GmloQ3NLPVvWg8r9asVb5tSSugjUV7JUD+m4umo20jim9JfuugTgt4U8UnZbsha42NS2Eox21m8tglVQ7wpoWaKs04J+HbF8wNn1utrz8A3Dxkp+KkzVA6+Oa4c5ts2TMKXP7ePbPvLvvJN5UMjVT+/y7YOD03lJg+63pYRrzKydd4ZPwCHDgQwOLLZGYfvY2NbPVf8bl9ucm8If1EIX0qFiQM7gMaOan5Xxd065G71tsBv5+CfShjkJufHZ/uyA/3ZnZsOjczAb4FEP/6VJg70Vf1dfcHUZG/RPjwEvCYGszOlwoGibQ2NbJ53nPGjEzs3lUd6hnf/7+Hs3r7ebvh2CPhtGugZ3d3b3d+FY/vgr7d7oKdndLgylrUOb+nLHurP7oDbgpHd3Xt69nZne7v3d/V253f2AJXuf/bA9z0D++BkGO/vlHof+HmQ06R9SmIr1S9YMv2Syg7Bq63KXT4qkMGVJnzAmlyftXX8YuPaMqcpU1/HEPUfFY2QfRbB3om44afgyJ0WAQTIHqSKKSXY5jiUFRb9nMpVJhbrt96LXt1EPxOqftZceBWhlAewzcrrdi8FTizGMgC+6nDhUug9p9pSNwXy+5kM11ZeNf74I35+v/XpavPDTcUZiJQxP88PFHPQJtVa3s+oi+CIDRozLoJcwiTiN2LLjTyxoTj8j1uuJtijZ+bzD80VTC+WV5CZD2s5swx64Bc96iqMJnRkyYxHLouuD2INloiThcv5mkvKGevEgRajoLHXtTzHRnAp7OMv1j4vtV68WL/xQ3zmfePcdVVHnUk6lQwGEBY7XomRm2HZWGEvsDPmBWWMjI32q8D5QGmm+dSF4Jz4cLf9QowMD74S0SudItWsgnoaxnA5b3PABCYQBome59ie7dYD1bQSHmmBfTh53b0ywcbizgkJHpbsngA3pYjrVu1PzG7tBnHVSsHyapinblEVRjHFQsur0OhGPW09qtomM3S4p23j7pW1d9eNnrZEQpirXuBPcacWGiTsVoDbQMRKwxUxblDmDG9A/YQziHpz9V3jPCZoiOujJqNqtbhYjAO7v+J6cbCOFJv2YhAfmxjk8sjcg1U3zWk9Ot44eYWXhUh4g59nFAXzXvyCMZ64HddOHvKoxj8GaJr303q+2rz/Sd2PvsrkLYFUK6NNH7n1VdEkkLubU7R6+hiJPS5VL5Y9Gs3/fkpJ4LTO0Vz+9TgBPhDAtJ+s6nRqcRoKqh2YhP8tLiRGEkwwYKdK8aTc0sdn70XkR4kRhxs6FFU4u0Bct2+2Hp7GzqbsfilZ3Iwc85FlJxch/E1qpkYwx30KPMKIFlM+rx+/Di9FiWXFRL0Uu+DU32CcWdsbgX9dKi1thVignF4qH2LBvFJidrKW0drqhcZ3p4CbqG1GL6Xg+Ei8nZV6QRz5lOTV8cUkmPEdKWb0bkxeC1hoDwR3USRWUakPjC7RjZsZM1PNRiKPNT+4PSrg58ZPD0CGNn7HNszhPDphyWPRrqolE/O1MC8Fy0VZSENLE339Uoi08Urg9ILngyYIAgzyLlDxLhJmoBj1Aep1xPI88f5FLbYp9fpbx061nr9k3zpWqU3QV80oMDqOumUmD3O5Pjx2FEMBQvOI5MTlWUUXIeYW37+5/kTUZDFuxis5diBtRX7rQgJZuiQ7Hij4SgAZVdnZibkcJe7x1vPGlUV1j6gX0BOaEdRr/pSqaWaV8NgsVWWXvJUOUsdEbV++AvMu60tcfoZrnxLDxs8PWi9PUCSQ5EadsRQ1sZLBLKlWiDQlhHs1UTGbDrQNU0tvc8Y0H3/W00W0wAxDmSBrkufWMIFd9FIMqNW6Gq8/w3oUot1mAtB9+FH03NTTU55nsARz0sPypTDhWauX7FnLE3tOeCSgDX85yl55kZ7qc6FX7rT926/x6dcwTdfvXWUfZDGgPgCeJ5sxJ5YbEU8tNzmm6KYlINBWdyMoG5h41pnFBCq/AKC8EnrclUe27UL/vxqnJYg4S3RHA2TVvP2WkoAdlxroFSwV6ybJ8m6xoovDHutvY7gTUUUPJ5QrVgyvEYSsIKmrdvB/u1qmQ8K/JBeMllGS/kh70yhf/Tyx/peiZAspIQWuvFSNpOR5spUUdmLKcwt7823CFLPcWsRFrQzhv+REmGeuFXPjp6X4/lsp/MFQdgHRltOkdUUpTRYfCYcwJMne+x5DGCRZSRHEpS92dEUDU1jbgcUlK8i9j90ReYR7isv5d5xqBQi90nx6t3HzTHzqTfP2O67biC0A3TzRkj4m9WTNJ7IhA1NAEHW9ZpmunuXUOFhYV6LVujHSqes6t+erLy2o9uvx51uNn76VTdjxiS9YJVkepOBXpOCcFaZdekQSVFWhRL0wIhu//LFx63d+7EQWrYdyaBVToFs9fHarL4uZv9EzMmEqPyMFU+UzSoJUcjhSSVyhHNDpiPUcFShmSZNDC4h8hg/A7qGHIshk5l0HzKfO1RqUYW+5eYqpk2a8Mt6V2Z602JOW+p8bye1msWENdzI/263fTmZmyrZssyrb7LyUiZc27ky7LmnUGQYd5Z12MKqUKaWMqKTpZNoipvGiTJbEDzqYKO02A1mO0kBQpkHSKjBAedIMoDVLHno2CKgG4NvWxRNsChj4PImXqYWVALdi8kkcrBBwAmhL4NuOQxX6VLizA+RMAU3dvIvbZv/7UsSlV1vPX6wf+zGN8VLYLqGhDJ2hdEQCPCXwjMIvXAJhKinxvruovU2hbtPOWKANEygkoDGAnKumfu6gl0sUvsDrM175bGpmEbutdXEn5WjeaELVGlqqg25SCslQRSLVVErAzjJPSTot40wVoEW/IZKVGDYEsCF4E04BCuowpKqUp4YcTfvBsYveXuxaNmfvSzvCU8eUJ7z9HOEKTx1QvvCtG/jCqYXfkSN4ZUe2/mVfeN+WTX092eJEfm9vdvNCrYx/gHYP9+3cNLINZE/fzi0H4N/NODZo7xkqFfMT+Ldt8wL9DnT34Ul3aiY/EewJ3CmYUYf3hP7hIfhcLUwGU7mxwV2TgTs4UZgchHNqM3DuTCk/sWeoMpntz084k6XixI7psUH/YHb3rr5eGCnMAIMI2+HAwNB0brDnwPD+/d2923uzewf6e/p7tuzrOTS8/8D+YCC7vSd76MDw5oEsHBjpGT6Q/WY4u3Awe9Qe2j2+q2/PUXuPN767b3o6N+bs29vfs2/vQM/47l1berLD+7tH4Vv//tHeLvjr3ih+HCvG57gbOTY/IY8G4IgCLNfAwgMs9SMnZ5VVeVL02qLw5K43qj7p2c/NRz+3Pj4TGgqzJXNiLwjNImbkc/ZnYHFVapNV8hD2J+AgswSj+MX1+NQzxQhPoTNMbtRukGrVobGkwpmwtAV1BaDa0TD1uUJgfOfl2scr8atTJEtxnx70AKbnFwwtSA8AmzpjjS7atBPluvD6nVmH0wGXyqITjSq6/vwU0ibRLqlmqHSXQilv2JfJFygbVQNqLPqc35x3cjW5yEPxRCjjCd8FFfHKMUiAxxKf/1fr8/HG4jN2lxSLlN4OT15FSlA8uOCCLUvgUbkhC0mZ2qSJts68UeSwJJhJSlSEsktOUBRIhneJdXmojsf09nH9cW1GVSjl3eP40luuU8q7x/QifFmIyMpYmSRXGcKARmqSJ4vS2zr6HrPmqSmmIMkxCyKuQIRFdbiJvFXEyKiNboHDpeid6B3wH2+ufbqduIdIynyXGuvm22KxeNTkqGKx+IWjXuDlwHCJeMT3n6+9W+Z7QhYZQUh1lpJzn56aXQ09x2gFxf3m8nKYnCLcZhvjPkpiT6bx84PGL8fiVxdgdeNy499n7IpoBoWbvG8qDpeAsfIhJcbDora5gV07H9kHHSWI5kl+x0fAg/lx2rxNJATLRDe7QO0li252xEfvLxPx1TIm5zpHjbpdwCC+/Hjt83Ou3uWB4o6caZzYfK5qoRUQFGYO/F0SdxaU+EuQjpcXgboiTe2ykoT9KQ52pJbFzizXEfRdKzX25WmZo2sjvAUUUuRl/vkBYLT1Y4vrT17x4karEnF2HjBAgr6PEfvAlGuYKRaunToiqYu8GzQZqccBslh79xaMRYHkkQNO47xsHe649eUcmIUVG108gAE4lwEEsF0Dg8/BXHwMBadhlN60/4Odd2X+oixYAnIcLIb41B/x89/jdw+5bAn1JA4yBZuqq9WKXk1Kdcd1kC/MZ49bnFFtVpOxGpTdNenZdmKNzTYvfYebjEnuEdaVTfP2Ne+0/iLe1obKK81dqzCDc0KRKd4pzlQ3gbYlEoxFOQXewhAYfwZMyRnFl0rIPV7/uMj8KLZKsMjMq20KTiezoxrF74K8O8pmClcL9rgcLjkC/FpeBrjgtrLDYBWjc8/fb74nn4uN2QqehWc5Oi8WHVoZk4+AzDRs8mEhy72JsZPhjO4Zdur92uefGnd+jp//KPIFBJOMoCQrPsnGnVi/Uhb/g2FHjqJ5Wl/FepugbMVxKtucEaE7X24XRL4VpwqbnT2bNx7D/TaXzzVv/Ibp720tPkPbieC9RTWV/SO5iatBNML5Oe1Xoo7RlZjXgNtPKCD4eTPztfffN25w6RzBMzNviZ3aIHBE0RL0J99znRIhFewwn8dejA7mW4hBdOfMcb/zDHeGXSY7887t+PnZ9TMX17+lXmd5TPAv+H458HPlkqP2ObFmAvNjbwsWMgGL3PNzMoL+scrEyIs1GF+kHccfT67f+IFXn0kY60F5qkWM7QSsUnD/17Vm03rG1uPogs3QdiprG6wIT8FOH9be/wF6pvX2HgVKw68zUs9IETNLVes1P8bDNKrYKTVGpeapf+WXpyHrMKDduHOu+ei4qcNQDziSB8bgV51yRva5Eu9ajfO9+CWZ+leb5td+nYs94St59glf+pVlrgyPROaxxkzJKkUIfBNsgg705RhTJ6GI+OLrYsGcYcCm9faPxvkPjfO/qUkmmag5FhqSjy78qBJFbYem1KFa/Y1oCCslJTJ88CG+/4jFI9aHFNuySjSqRuGrEXXITEhizgrkhi0bCWNP9s7VYhgMF1ADCQHMpESYJeU0wYL2sbJu5IjG6XrcpZK7WMNTFArl1nGcMAK6j+oEPGn8dKJx9g/QdlQ9GmY37t5Zsh6rwYWjKcwBGUpRZjtIbD0SMdnJAAllDM+nX8bdV9WheRamoCVcoJFYMDrqNyeOYuQBZjZGHI6ELwgZnbwSL15ce3eH8Z9LxFBJwVrDkrMplljpIy+j7BL8rMQhxYJhNJYUpTxKZIM9h4/foORD5pGR5xlOSZ8XScRhPUpPCWsydYyCKp5Qc2Z4PfxSWs+fx5eutH47zi+FclfsoIRGkSWq/PAsaqdI1QY4IX9DroQgCQx/uV6bp1fHoWRkYJG/5SEasc/vNZc/yd1A3FaVsZOEqpSMoNxaCap0i7yaJTSl7tFATRX4Fhu/P157d379zFW+RWQRoG6KdJw+c5HiwGCgRYSgZwoGJqlEAqE1Egedi5ew5S+qFAtjXwBDZdZrg95wGmjLm6RwB0NbmdiGfS2rqoIyEHGjyoROWrfKUk7YtfTSwYjkMF7xgh2JmU2bVVmrppmaNO02NumUFaftN1l0xHeUtbShkaZMM22UidOloaI/0c6bKPaNcXWf3/NNt5kmhrlg2AfKKDDMgTY7IAnDSWC1Q+4U0t4QZJv49r+LaNuwbBrDCmEqUKuGrCm42gGy0T1SdzrEdaK+IDtlEDbK17r27se11QuAEFmLJZFgCiHJzDqGWgpktcGrJCDpDEQU/jCQRwIKGCCgo+5PqXxD2RsrQ+nbzipW6VVToyaVnKnftGZTSk1ptIRqSaoTUQKtoNwUSkEl9ZIhwNPCmuaV1gZSD2jprw1bw5g1pKuSqyxO075yWNNhzR9Mu8n1sPKQJ34pnON6TPnFt2zgF+eflo9s+cs+8fzI3tG52ZmJyZG9C0W7MLklGhvZCn/lsdLh0mGnPLJ3+zCOw+/274Df7ZibmdjkuOWtW8b2VqbG8W/P3OzEngA+4O/gv6GgOjW+ySnX8Hu1Mj5YOrypfHiTUyuPbT48DWPTRfyzJ3ceHdl7YP9Qd/eewQH4XtgBFwK/KQXVytThrVsiPLZvV39PX2/XNyPZnUfzew+Jke7hA9mBo8Pw6Wh+JOy2BgfwZ4cO7O8e3gdHrT0D1p7B/cP7dvXA+O7dfQe74HM/HB+Cz70d48GxEX39FycE8U+bfBa7EcV3TmEX9XjixbPxnVXa1KWOuPCbvJ9q4a5JqbGO5GTd2kjRbTw/zx0tJeWM2djSL5BxVanpAoY8QmXLplQ+Ina9ms9Qu9z6KgOq1Ufrx2+tvbvQ/A73eOfzdBp2N1MYJ6gBMaybyjR58ys1oonbBdE8dbmcV/Sx5fLKqcbF45oFarTQctWGFax1kUbuVOq/0gL2gxKAOKxA6FRssaTJ/Vhf4S0G0Qvgwc345StuB1AIrDmLzAF71oaFYrXR9ywuSkm0xReDHlkczpfblDlHVMHeWPugACBTxWqguoGIlQcox9niWKGUS+hQUV5Y0RXyL7yyEPDUGGoGZtGBZ1Qr77qqqsw9azHCWlQeuNK8d7X5+AJIfnx4VqEcBZiM6GEqgutU1EUIZn5eVL01hiIS5ykunNR9lyD9a0ZYkhHwbT08zsVPFaOMIijzvzyH0w/BchVFUDsMiRznr4vzOmLo/Lfxx1ccKyR/mam4IlgesFhYX62kyHQeJeLYpxlB7TyTXltZXP/5jUkaTq2J5yQMHqfAGxrSxJHf2W/PwfVUlgJtkK/XKuy6X/twt/noUuNnnGhFn1yrfKIoawcPySomGajR/8SGArdEkXXiEq8uM2ZRLDDUpGIVDZ0Vij0Hx6u/rTgBt3gs+MKV4/mwYuy8BA8gTpD4/Q/xE/SJzYvDuAgLBXtObgD74hKTVFMHFGURkDKfMW8Hl82HK2vvf+U7MZkRHeOJiZ0aOFrxE6V0xUZNznbtfLqcbhnB7Rz3pSd7aYZDGRs//Bifehevnlb1dLnVABHpyE6s/QQzOaapkzzgUsUEKZEFSITm7duqAwKfWhLlOTDKhLN3fOHS8LgfLzMC9Fqj8CYxSsUZMbCONgvgBknkn73Wer609uHq+rFjVDPdrbJMC5xI7kEUMNwNF3nG2IigQQcHDW5kSAniZEgjUo7osSGD+NylxpVFKd+IA8y2wDLSMgPbq+HEViAXgZYY1K5R2bAXzUwMUKB0TW7a27r6rPF8iXclyH3p8ulyy4tJcQVneHcVEZnC42h+OrixZonpzAykoybPMxtYYK3DK98aZ2I7m4hVwIJdcGatoMRR2yG12PQXQKHnRNkjMCWCqprVjzEZ5Tq5dKkIQevFd43fLsSP78YPz1NciA1LEu2Bkupdk/fzGIArGXGf6wC7eWYkI5FRw7kuCIgdXDOcUxOf/Sle/q5BL1xRNl+EuephLheciJch1vGFpRqx752ii4vyGE3cBVr/qoPci+MgBEQXl0j9GF2DaG9URFC9C3JTsUxyoYNk/dG7fkb9M+eVkHl4JV55Fz96z6JGks3MV6tWWYKVWUcE9NqkK/3QqQBmF2LAd11WodwrkcKB8Aakg79x8Uzj7DUg33p+j4FwkBGFRUqyyhuGCWF4seBFm3Q4hFGcihkuLUUYVOJRbjiJs5aIxzfvNE6c12VLSlhXIHSIsgoAo9XXJol5+dUKYsa1CWQSMGwd5oRkPvUOzMLGi+9MkUkChqgoG8+t5S1szJBRzCmKAetEMvioZQzmygbFlhW1o6L3GDOKlx9y7zHNBWaB7croOhPQmOLZgDPt0hntb41wWDa3jv/IeEbJZglj2vnIyWUyURPuMfbdwx5iSQ4ri/Hnp5qDhEh6xlm4q5Ox/DAUla3nsWev54cc5ASQKMB9JMbDq61jx+mh4FFcgHbBFZnVPtPhBmpOjTsqMrVQkBNrUBzFd43WK0pdT7JoLp7GDPaVt8yIOhKabKzIhZch882T38w6H3TZCgVzmQ+4fAbCmICeoVNFyPEsJl/wAG5rJ79qSlyOhi+YHwe23f34Hi4XFwJdS8mr+fNC2WEOQh7woU+EKKJAfOVOc/AWOTGqIBru8pMQzbXW3v+CPYtX3sYvr1J9f8uex1pGYNzbKsJREfTzTpU1l/iUMY6yF0jSFrfB+aPLR3nBUVVlZLX+0zWE1v+6AIuOGw0SQ64pMx/pW7tX5CyRkPKlKraMGLJwnHdhYC4EtiiKwql5Nfm+yVdOAXen49v/AtbNpw/Y3UMohLbICq4j4hNZ5iq28EM9YhVFDzRFlmwHuR74xoA62Vm4GoSHiKibopddjzBZ27QIO8Dy4khaiyxXMkKXqDqKPOu+vwwKBZPzZTKoUih6gS9gU/G7GFWEN1XjarkFjpRAR61eyvHyYrz8hNexsHNmndIGlUO0Mf2nJnnCHNdmbJv1qgxWZacm7UdpOCZtRmUqJo1EUflDdAnpaIOZRpdpawlcpOwc0+QB0SdrUd16wFWo1GFd16Cgo1w7mh3K1jCtDDHxTYuiA95XEN/QVCbCZsidRNZJUK2QdBJDt+PnJGw2gayCrwngauJJeleBDWjYNnGjQosaJyYAooELOZJco7R2fJZEZgmYxK5ABYvaAJEJhRIQKIFKFBZJoJAk+EjCDa3xlaJPqPg2lZtUtgkHhXJEGGrV0IR0pkfyaSMtauo1pW466R2la6SWSUt/EeX+H6S9Kd4NqZ6U5oYATwpUJUNN0ZkSmgk5qcuUyPQGKQXFc2orso31ifqwyN+etgLbiUO6uHb6DFlYOzGu/L+bNyqqjT+3jxxBTHBks3QC/23z5m1w9vbtQJA/btEfN21TH7du+duf+ourY4d2wN/ObXlrdDv8+aWRLfC3NTc50eVOFwannDKs59LwPPzPrkw5cnyhapeP+qW9A/2H9+D3HVF5sj8blnYf7Mvu3DF2yJ6bcmZgfMYtDM5VBh34m4JzoqOhPwAk+oHuwow7Pbh9mzVahIHt2/KjxdxEVzE32TU00B/shv/t3OEd2uGNzVlZOGr19fZ0w+COvmxvz5592XAgi7+B0X3wt198DuCf0u7s7oH+kT1Z+L61L1uI+rPdfdktA9m9u4f64XfFPbuAwq4+/OuF3xycnPjnaHZyT8c63FjgwSfrtoxFB2nzjQZxGxUsRzmoajyg2alXBqfgtJ7fb5z7zDXcsXsmgPWC7c753nTeDFTNoQ2N5ehr9Gr8nJP4jgCdi+MQD9yuJI/Dy8aN34FDcwnLz0dVaqPaxoGB7yxliPrcWQmknZAbeDByZil0Suj4Gqcu0TrHEs8UoYJwgjXtavz8XuPyg9bnyzSpcUVkIttOtGYOfYzZyXMQm+IlIt2cQkAb6ZIRkeacITQcXVFCEBg0nt1rnjjLJQTnXapMqDlVfNGhEEQD1TDy0gM+V5HA+KR//OMfX2/w9d9v3v8EX9feXaZV78xRp0I+R+TOVpJ0Qixmkhj596UaO5hKGc2EWpH92Lj9lnmQlYDxfQnqsotqhrwvGKktW6n+hb7fBcDwGI/glmQ/U7K+w78bvVnJYW6QLZHrja9SPYX40zG4yNRT0FRtscFWK/qUmbkAeqhaof3fzodE/0KKU7guehdGiN9LGQ6OuC4PUV7Wrdbq03jxYuPkz/Gdl40/XsF/9IarNjp6Fpwy0zTfsroAzxgQVdWWKY7wNe29nzgVn3plvFiDlIzgwIbJRZE9FonHpcd4y1NUrvm0tP79a3IdeY5VsjLiV/SMwr9b6iQ7Mih8XURresEs3xr/8ap15ldVwKzoAkswxxL0aHFgMK64Ql+tGCePgcl6FKAUUH9SyMjYHlwuzY+/xp9uNb6/Hj9foYcJ4NkmBkVfOB/xdAqypQxW8ZWrONxFT+HdiqiCC1MRKZ5/EZ++Fl/43HrBkw9JZaL/6fl8xZX6k1qJOrgBAgK5GLF2th0aRf8frHs9juIE3fKisyGX5EH48PNi4+YyF+MBLG1X/DATVeWJoj6roK+vXpHmO/Cx8heQ5M2R+irVcSGqrYfHRQCwpGncAixQr4Rh78i7YoG5CF+pfN2cKKu0StEEZ6+2Hp1u3LpLP8vwWSYBeVnyqyeRN2JC45KASvz5o7ok8XN9PRhZV5vCmrZ21VexdskRqoqDFpMQGKJG8+JZFhYEosqRXeLMDnGaXkqKjpf8qshqUUlUU0IiQTG0MBwjAIiCSS4OTFSpE0NZz6DtCM5ZbM5DvHzRCrux/Cg+e7r16Beu1hCKogZ4tq3OVRs2eVq0WMmOl56mj+n1Yr4p8iqWY4mNvmsXgUnrxXfxS6qhrE6F5zUvNzkK6MChhAiQrWiMhGx5qlE1+PUGzLsbc6JqAgg8fMufXq19eo7a+eTPjIxDiigUtp4tBtSkkd89gx5YizmD1FNNR88WH0tbYvdcmyJPCg573jy7Rj3GvtymtbZAvgEwljNYExnX9afLrd/+hb6UBx/jT2eFkeJwUKaKzQ2ocKadIFxTPbzFni7o7GmxmXv/XYoQ+QCUMuEWnnkn4qK+HQe5sPyXp9WMCLekzcEXJxvnVuLL59bePSC5VgblVkbRLs7jjkMz9EU/UzXgJQiba5EI67UoCRoPuP5r3scmp1OUGG6L2VaRjm6PrvPrDYoO+ng3Pv9q/QNKMZTsmCpco5NErfmo5jP80sRw1CfMpXq8PCE/Qc4kDIDr7FNFO8TF7afIY1Q8bvSlZivtAPK4Gvawr6VTf5zj/1GXFjFt4yu3Wycutu49bT06xzN3Hqtq5PTMxeVuOVRrBMU7OyisBTUms4Ic6ccArMp7DZIruQ/fr31eYmakWmu4U0qcJFwFiGeHwtkFaNGqcQXzyA7yPI4moBznh/aswiHu/MSaj76Pn5/lrFfbns7wmeJZSerifEmWoi7kINJTNJUWf3GaCYtS+HyelUEWnfL+rLxf9ItG4h/Vz6iEbA+CFixlqC11MgGQIhAfxqeeqtw/tNWwaGspw8l/YscdiZtV6QRpsw6d4pEoP8fkVeE5QdsoOMeaAl0NnqEqQPZzC3nAkhHJVtdAlPeftI6fTyqLSGVxF5wqVvb3q1b171jOj3u90pjlBu1ksfKycpIS5fVjP7OHFIlmpvMOWEC8S8BXScuo/sjmel8YAQR6k4N52c8ifxdg6Q50BFMTsArpEIcbZHPI3ZfjVLr0h4/xndX4wzGRFo7NUsgfI5+KmVdgPCo5lGAqt4ypnR/NV84raL34qfXyLM3X49LfI69T5RZ0DL5NGKWGLZoyQZXxmTIJU0agtsWohiwWpuEisuu3yLBUNlfCCNrA1lJGlmhT2G77/PcNH8M2sRj5Yw0ccQ1tlgD5hZQlkDQCDJxufOSssvpdcvpdetq4dEkAXtW8T2Jv/UmBZgWVFUgW55iwOA2G75IBKfM+sbP3solR5fPyGY/qT/XH9Q8Y3UiK/LsHgCYVjpTnSETXAdwpVMdufwPKJUFaCrIZSA0wGiAoEzgpNyHHMutPAsooFKMgjAFeDHgha3CotFuCKQlQIUPAJWDohB2UZjd1uoyhRi2YFxHYsmua0rRKxyaVq9RzKdWmFZpSZYYSE1pGqxetU5QiUSrEkOdajBvSW4lsJaxl90AlXoJOYlQJTyE2EwIzLRh1WEutwKIpfrGSEkod3KMUOW7hnN1FwY3+wTY3acefaHfpRhSk27TjceU+3bSR+1Sf5hw5wkLoyKaUG3Xr9j/3kroH+7rxb6zmH5ocrxycD7x8YXL8wK5sudT7zaEsHoP/hrfC+J6hnv1Fe2IfHN+33T+0D8b3zjhW19Z5Lx/Cv7NwYGx77dDW+SCfnxzfFsEP8PdAaTCcsbo2T5V6p8q9pf7sNIxOFyf2VSfH+wLP6vMPHxpzuvK9s9XC+HTR3ucfyo1VC5Pdhw/lurbX/K4D+we2H8j2dUf9WW8wC9dRGcoODvTv3wsf4d8DcM7EMHwe3jvUs2eoF/7d0zPYv+1Adm4wu6t/YCTrDWUP7B/t6c727BqcH4O76s5PlUsW/G4ogluEuzjUwUeq4+fcWh5W4KwZPWeM0Vby1xvstteBc9gfZPWjCpwreH7OjJnDaiwJMuhmqSVGVJoRJ+RizUuqosPJRmjj3F5tnrsniZc8gNwCB4aJ+BUs2i9btPipI6JmYT7RquU1ZXwIRcu9WlovVlndhtyshQLlnYoUXLhDVcU2x+RoNfjz7pVbpfrVfMw4ZHCSKbNLwsGM7Bp3fl7/7rMMyydueJsiDLgWYfwlJrhVReJLLarhgPzOcaS44cUOK1UQbf3Mpfjl+bXVa6IgGgU+B7ACkYD0gNkG4Qp6NUH0YOqyFdWfiHHpDTMYKYcY8zAdYoKNRqFOVMvTbGMQanzFclHcFVaj0Nbz1bXVcymXRa0kSuxwQTiDRtuAQVRR09XgFCGY4hQnKP0P87zrSRYhFdHnfCqwCRsXj3MyFd0cCMSqTIJyRKShrj/hz7cNGVU1DLqiIIUkLQpSmNQrDmbvZGxH1pNcrlDPzvqyGEAHF1lm6n03zl4Fs4xftl3JkFmWNvpS60RbfhsuE2UCqkXC5p+xSBSjdOiSraupY+iiccTHtGS59cKJNncdjyIyeXOwJoAVFi+7/yH+/Ftz9VfcZryKpXyjolPKzEuCspJbp3gmk217PFOSFYdwKCYG/XQoB8UDYklVmnIU/stRKfB6CkqDl6hVuREIDKo8/nhdhwNbhUQkcOiDQRBiZEsyBBAL2oQe26MFP2cEF5PFQ8UuRNNvIt048aZx7yGH6CHxTAXsQumdVCGAgjoYcaBvhay0pjAMlN4KltEoJgMA44dn4vtP1b44WDMAsTIFY29c7Kv/vVJ/IrrwmNRBAIouEUb4nyylR1Q5bVZQBD0iM2dxi8vJB3DxMEsdkZxvDNmio+bXGxWuA02Bl5wk/+JS8+zvGHr58L3YwkWzsWDzuSq9TZAirxZteIvrV0dSV8+VObBm7bPaAt8AcGh9vtq4c4zuQZw27wpiHCIhHzrXeun4uL8uzpsPO/7jtfmw08GiWDtEThSmSrfw3woWFVRRcet5Hjh2hE1oadZREBzWXkuOJMLixP8pg5uj4nCPiDK4KSqOLMAwSdwqeI5lkIb1MwtznPC5osc9BVF/0qYiEW2e/H3t/SVpV4YZ15VN5f3Ar4hoqlmudUiSPbQizpFQxRJFetxRHYHHuYIUTYYxlZgfTI2crjQfU9bg6o21Dz82V3FpYaY1JYeKXQjPcf/u+RlmLvoLLHO3B2QswzQp5VjkA9O2HkdqAs21d+ebH6/KlNMClVv1ROAU7XGxAAB1zWG1HhjieaxcLqg/nifdkrzy+3fWVi6oa8bsdg9VeyFJFt8GehIo6tFB54v8qq+5/gx1F/5bUJfceLYEFn7z2TPZjiAKA6eoJzpH8EUcvUdTnQP34LXYUzlfuBywb2Ml8/VHihNaptZwd880bz9f+/RL4wRW7ghdC/1mtAAM4hRaqWIq25ZSMp6SV5OKpxSryQiopLpk3PvSvEDLmRVFczteNRygGhM4g6pwD566esStVy407lyIH7xR94B50kHRDYRbXTPl2gLMTLZoIMJAUknIK0hLSEhFSBcXUMTwOWPRTZujoXx5C8YY0YZn46lUKPYsAI/mjT+w6sexb9nFIE8S1z7v55LcZFkEYuKbl07k9bUDXfPagVBGS3cnX39TsnnRwmTM86tEky8gd6Av4wOwutrXaxRlME/AR8Q6v1378AP2ev7uNDl4PIp2DtEClV1JVPdQoF/2ZK6DHrXrr+QgzkXiZAT8IpdPvwAjDvY1uKBsk1HiC2D4cIy4Y4dujTOC0V9mSXwQyHGP+tOxcxoljmhHtn79U+PchdbL8/DIOOfexli+TNUph/zkZOOoo/U3XA8FmZJEsPIY/ykYin06ehXothCRWkw5fnF6bfU1+SIk2Ywd+q4ReMXNAlwuEmfOfhEY2H5ALwtWN8e5picvhzfv41N6ISBb8kokc/sVy4qfS3CyxIaYIqw2xEqyQgVz4C2x1rkX4t4kE4z53SieVZuincxdZeMKAzRteaZjCJNWpbIn04akYXV1MuSU9abtNsPrS1YMOiQ3sHrixd/Y6tH2Dhkr0kLhQjzKGFFmiGl/aJvBNBPMLSG1ESS3gDqFOBr4W0z6TiA/Be/bkL2BhlMI2EyvM7G0L+M7DQC6YYRnCsIKxJeAfwbsU2DPgHnyVBOIyVMEnpNIzoRwEgdpBJQAPgrtKJxjIByJaUw1rVSzwhEJTS8U/EZnKGSgYKpUqqZ2VnrZ0MhSk0klJnWAqRdNdZhShL4+3W8/HRWJOh/UiKlD1FMUKiNxxWIrjuW2ltimsNYC2pCXSkwmBGQHOWXKKFM6KXGUkkIdnK/G4ZE2t2vqoHa4tp8lXa2pI8rJ+s0/N3Cymtd35Jt/Jr2r3/yFGNTadM+oW57cOd1zcNve7oPb4fOIN3E4Wghmilvhy2b4Nzc2Mmwf2ts9vKt//3Y4YfvsdI+3ZeKwM+7t3bwwU9y8EBTx+MHdlfJkdsoZD0f3DBYns1s3lSe3z9Z6is542StOjW9yJ6fgyAD8fqYKv/fzB7cOZgf9wsGe+bGRA0B+k1sGytFh+JsoTjndPfO5kaq9t7tS2jNYyG/bPp8b27rrwKFs/6bRrHVgV39v11Bff9/ugUPd4f8azpZGBwe6s337BuAqerv291kHhvtLo3sG9u0uDVrDuw7A2ND+ob6u2dr0JFzvOHzuXL/AL1miUUiBY1ywyjkP4e5TxN1VOUcGKwLInbO73CFn6WLjt+PxncfNy4iY5nxqi4TVMYyoaqJMehCTcmjDzCQvN0bRjyN2Lp9URFzm+r3vWy9+Wr/1mOMysaFzlOSAoXGzdpAXhUkp/CCHu+JUH4gyv6UUXf/+FEtRjFai36hiv/QYUqToOdiRnasvt5OjOvv1Z64iG19603x6QTyDJPWAhDMAAxeTglQXimRHClv+QJYLVw4TTIxHbvhJtNOIr1/C/PjVR+tLv/OmrKQOz0dVlEAr1SmgO050DHQMHtichX4S2qKLwJ9cwtfFCAveVJJBqOpi1j5ej3+9pjZjjUuiotsZY2vWL9RXbdmamK4rYF1E1XX0sB2oxkLc2AzNUZEQ/ybAHTFPXMH71fjs7fj5Snz6FAVOY/EFqvmmS34pnkEbu0Bw0mST/KhAFNJmPoyRIrFvbqsNP0DLfjVTsqJySGFL7SNcOorRp15RKIOXPwH65MWEF8JnZAQFoq/HwlriJwuylJBJHdcS1UdjV8HXRW6vS2xgTa29e9+88Xjt42eDkh3WZHIMtquRz4uTYGhEPK/kkxKRi5y3k9OP6sOVxotrzVunjKdFdIyt/UDUkUTqGBaLPdNFoX1R+aCNOMeRmMTFxQn1bMN0n6VmQ4HobCxGHK4XRhu3ojmNrK3AiYbr9zDsEoivvTvP5wHZguUDdBD6lAJgNGH6LsnCQ6d4L5qqScLNc2eapx5pwpFfriYIiw4ZRd31pv4bZknVShLIkrs7b/5GZE7pn3D1fow+17V/KVD3eev5Jy78i4QQakV2KNsxEj26inJYq2YSl4JbGjgovVBy0KgtjJMLGVKylawufLxx+bFu38FXjIRk8WUqTYoQ0hIl0ENV7c7JVejZfr3MAVEOxnSjrUA45e5xMAYb/19vX9bkxJX8+1UU8/B/UNyJGAw2c+9bb3Q3+75F3CBKUkmq7pJKraW3GxMBtjGLWW0MxuCBxsaA7QY8YJZmoB/aE/4iLbX6W9zcTp5zSmrbMzf+N8JtpFOqzFrOyfxlnlyuve5QSySEB40GVazUBg5MnYsEtKa4e6bHAN5pnDgMEN9TyVKlj42Klr906TfDkulS1mwlJSkauPJNUy2/Bt9SPTReOz5EW5BAnNvJmVJz65897lw4t37tZOcZP6Zms5XLMGVHFwURhciwEvKZiAHLFF09RDQ9PeSQrUZy6Y2IlS/LPEOayupQrBLNwNj9DSaEcMiDsd3IcXrxcfvMYvvtF2s337C5jAEPeEqGeDk3w7zBTguKfe6J2BIbIe7cE5P37skSj6MiNcAiYdJq0ga6P8T5LeS/+OWH+YxkmZS4j5SZWJ3rN7s/f7y6tLT66nvsJcVtvICSVF0tmIVK/ccbLeqRSXxMH3IYC92xXoa82wmiOM3v7EsQxA6/uhHDVK2SIh9bEp9YD6RyE1rWLY6AdA5OSEZBmUWPNBFgHwTPl1+vTXGFtParKzhTTj/rvDjbvnydRDQYSPkgM5PEcWJq6WnMfe8luIH36UuwwfcbXIHE4ftXYKLxvSswDyEo0Q5l+sb5Wfe5YTLC7G323CAjx8qfhW5YAVtmZbEhe5UhkeG5cfaqkgAQ45zdoOmARlZiCm6sPJAC0RE7PxLrxeegHC6U/pot1BrXLu4+Xuo++diURYQniWdW3AILhpSp22Wp2yduaFLTCOrkx1vKQLq78LB9+ao4djhY2hTuom/lGNvCGK8D73vrd0GA1ATMSWv6oX32k9TGdz0o21iHFNWEe0nq97CUkUxxpU6pqN93l28ycXyMUbnpkiXdJCsdE8saSa2nZ3Dsr/wIe8NHTX+5Ywb5q+t2odMCzxA5bb2GDbl/qymxS9glSf6lxDYhJlmrGLuhXRG9wVhNrLtUNbsHZpPJRQ/ovIuyweqSFjgGXWeqSX/wT1nAQZMLCvUif+8w9e/jydQf8rcvP22/fpbC+0gBCfSi/QAz4xtS96LSiKpBHn5ApZA5x0EKE6HGXlnKSW/mpCJVkZ3f/PoZCBKpFobRl2yWfNZqoHeOUpH/fnvtzeedzy+1//nF2vN7nSu3aR+VzsdtKtyqLecB7psouEYr51+WoOu+V+Ni7X4X4GNt9yoUa3vXoIgbnUo5bFM6WSVrAPjB5eaDmOaFqdnNYUcYMcxJTcjj0v31z99RDbiTnetoICMFmE6TpiEVfUfI2JqK4rw0p6lSVin8H2Y1SNMS2SYOG6xPacphMIv2mTdrH7429ENYmJN47gaN7QDaZShIVq18m6FElWCNOZ825MEEUPP7j9jxv2Fmkxnof+8xaV3z1TNZfYvRtRU920eNHWvjuKaata02MM5SFpnze5EdjoGk1RVcSyttBoltpTaKtXp8k0SNkY3MEEfu9cJ+xfoplG8huI+7Ld5WlO3gaxP22ugB0x7OVXzLEVIGAtapW413ag+cVBiJP0uBR4WMfWFbCqxZmCYX3QOL+uKxviDMBz8e6FFsox88YKN4xAEjDk7wEIKHDRQRWCwgz9BT1huof9X7XJCobKLsRQ/X3aaOBoBw92BRir5CZN3Uo41ov6Sf0kmpm14tY2Q5Seu+InwDsZ2S1WkprWJUhacnLFVEinDcqOEdBxNn/gvMySqFF/fvfdfvZ6k2eBtQ8jri9fuNOtj/+tffbI4n4csn5NToxF9TrvYPbOWH97b8vtc9+GA2DLbOhnu2Dx3YPB+VtsDfoYM7hqcb9Tz8MzKW3bI5Kk0dObwr2PpBGDZrlU1wBH9RmaluH89O1/O7Nk038nPwi9mZsHL82I7Cjmxl5mgTvtWOlYvB0Oi2cfz95vnSfJCNi0FpPhotH4vLAVCcxSNwfj05fmy4XBx+b0c2SHLH4O94ZaZZnZs6vGtu6siuAvyqcGjH8ODene/vHh8ZHBkcGBsZPLDz/e1Ds2PZkcHj27OFXVm4ysbggb3JWPbQwWG4iuH39wyNDE5+cBB+MbBv+9DkNvgb3b97fLCAbN/fsx0+j4wM7hvr43vnAC4ETliSDRY7aLOmxIpufAgUT43xePVfP0zoyl4/fRHWZvvrMwDNKHMRC3oA5tYzpX12beVZ3ieIg0lqrPrLrRwX68eW4Lz6O7d/bJ97AutZ4HlIp6U4SHO4cjWqBLKNhyJ5uhraHpNE09Ts7555BiS5bH/SzGB1XuNtiaOg8ufQp5aAcAf1C4YS5qJyH3mHPrttWyvP5jLRvDS98ditvnmx/uFjwOtr135Wvsgo9FiHs6Ep0duaKGBzuGlMlZfq29yx+HVRk9exQ8LNjzlzvZwPmk3pAFEzG7ytKWwuHAhVGEDZQtUxkLxeOPU0ZalHHWHharFP9Pm7QF2UT4bp2y2+Vj7h1l/NcIKrmnvDCILgKeVMJ3n4Xz5juXE/+e7Fc8xKNAOd3CwGEoqZlKutPChzN/zK0M1oBBaRt4FXQFZDroiUE3MFah+ETgb7jQcYPUaaspGgtw0Lgwjwo9EWBRqgSgElSJYQ6sD177/tLN7vLj/tfPch7SWGzQbFoQE00ApPJS2sSlWc4Hu6oiol6ApJrqja/e4Uk6SKqi5FLA2YN2UoYlNWKek3aOpE426Z8OKk8IeM+R5+intmF64jflv8hnvWEpVQiTAAhdkdpPhRKbnUoLYm8flwdxJl4nQn8diEiKDE9VuKqCxLOE+OOj4iFgPOJa3j+o9WLJkQ3A1HY8Vvd09dW7/xfPX1p+QkCmcwpTdErW89DkkzkNoY0kqhSoN5M2pbLFg26ntgFinfg6VvKxgkuSBOFTXQIclQQzTmlTXAXi79yhrgiabmJWYDOqSqYT/KXu5bNekhwi2Rpb47p+SLowSg6CyStGOmim2L++xKrWwqyfP4xeqrzztf3GTJI+eaM21uraVVTX9fWZolxAsPtKR7uk/utT97CCPtK1c1u9YhauRyUqMyIU5r6L7SGX6GCZhwqKWIVFpHZ/rJa3iEJTU0uK20K7W7y2fY9GCpPZfLpNpNS+1mt2O1ll3x2lj/aBtYry4vMFG62RRB2Y/hvua0J5evR/lUj3R3XDule4nQ3CtdE6GdXuk4PeRkX6w7NPsOOlqDS5wbXizNwU5mXlYheIxkcz7kItGSh80NJE2wCBWKpgN9N4DcWtFsE2qtaOyFMl1A339mzpqHIdLXEigNjKEWp6tnX3bOXlUTE3C+Q0CzuyviFDIDeIs8wvWApQ2ATe1effPp2uOTmtpdDKN6zsntxuz/agv9RNPYvZ0fgTeg0daIJgraQgfELMYl3VkE6hLMFMI1E302HvJBroDdDOthToL1XRcxajtTrQQTPX69VJTyW2hloLL7DqzEi51rL8DQQCvDkAunIw3XtzyCgr4+zmUNknqTynsVPBZcA4BfHXNYfXeLX53LoWTkVcJN6LhMQrUlhVcwB8ccMA/Me1Qrd4UHP6bOwlnmYR5THDBl9VtyGK1hSNZsPpGIW2XHc58cKV54LZPX8FpDPB1fC1iAgl8rYZMiPVYWC9zMLASVazpjiS1LZU3vRhp7z9pi7dbj9YXXoMnhtjgrKsowXX8yYYQtDzsTSgJszbglnDHPjVEC0OanJp2rShzID4/NWb71EHeAQeA2uQcCcCnit4wpiuO0L6PyyxxhI30WiHz3ydfSaoHKqNnT0lxoU9z49fwh543LDruS5511FglyVoZPo9yQhMOaIwPmUdDUQ6RpDvERcsCaZvWcSZax6SKADvxWwGuPf0KpfudZ98midrkinZGPgO5kPjRVddMXIL4cGQ8ngkaVPMPs0OnP2emX0n14cu2Lm8xYu6ZYxk7bFIJcBZIC4odvst+Ol2//I1zghDBXS1RX9+IVZ8+9wK4dOK+IBQWbTY+dpLkFvezkSA83boS5RA3nkNmpC52fPuRCFUAaOEzLTAlrIEtD3K2jkhjYPiHhgsixKX2NnVqccXFN3Z3h+jBhQSuTLIA2i365VWLfXXv5y/a3Z9DP/fJ+++qXa2/wkRaLWCYDEBoR61MRxeXkFEX5jQvoUxzFMHfro1BpZlMdpW/FDNeW9r449rRa0ikT2rN3HdvWs2PVdnWtVjUwHcPSWqtqp6qR6hl3jk3n2opqIBozTubSgyTH8RUVE2mBC6Mk5ePXlv7BheNdC8qzWXwDptdIcs2jlFmUNh9+23RQm4H2FNRQcEH77wH4NHp3EXQ/NK0Y2hShMOf5CPQPAdIUFnXAn/PRB38K+3y050K4+u869l3IZYBVP4ilwMpAqp7NcR/uuBhEkYeDOTy4QVv+PSpf9byj4R3FrsrSU62qUe3htHbzFZuj01STeTqsj/JI66wN1EVKO7nqQW6fxa8rhnlOqNgVLGwl2cZSzZViIrx6ndSyjwMmWiUZMnBpMO2j3vBX6qL+LTriod7wJ+qg3rqBg9o9M3/ihAF1J7amHNRbNv++V3rzfHWiFh0/iP8WgiOHtsK/0fFNSXT8vYS+b65O1OEH0+GeGfibPTw7E44OD+3ev2dXA/6ac3AMfzdXj47DOZu2bp6fgK+Hj+7YNn7s4FgM36u142Pj41n4VoK/8sT7A7lsNZcFStNT8NMYfooHpgpIpRaVcnBafse2QlA9kD0EP6jQpyOl3LGxfXt37Ww29lTHsgfg04F9u3Zuazb2D40MDsDw+4eyB+AHcf7otlGsTJwdHY6H4KyD28eHh2B0x/DQ4MD46NCR3dnto8PjI7s3788ODI3sHuxXh3jlG0wYAqPElGuijTUYoaAbUzsHdyArtNNtYDFIHyrjdPXt6ttl7In2+IJU1ceT8dXilpJ2WwtdFvSVYjekcr7Nz/Kpc4aWUqcErRRp7K+MAQcYWZE4PLzxmG1avR1EN7jdhNX6qJ8sriJAOd3vTnVfPOu8WZB0bKwhTyTiOCqanve4aV3IuLzQzivQFrvP5dE8gykO/f31K0KLz78BRNVduND+iSoONsGydKkHUWnlEfYDboRSTRmBBhcpL4V9D3DVJg6J+oW6BC5yIOoX9ztnv+xcf9t+jChmTk7P2HO1zGZQaFVSVBMKzmQU7nF7RGAJg44cXutfP2pftrw4RjPFicsyNg3sbrby4Wyo5RqbeffAhJOEQHiUe+gaT+fChc65B2sLjxkvYEl5aZnONLl1KHp0HTb0nW/HMFDHsOVkPcPEQz3DDmUTrws82aWNsx5dpbVWwwbvyuGYjRhzUMpRYx3gf/3AjZ3Jp3Dlfnf5ytrX36zdumrKEjGFkAKlxSXNLv8ejrCkwzlu0O1zc6xZl5sYs4YbnE1kXVaC7Xs48XAPnx9blArfanp81r+80751T/lUAswK0dMYjMZBDotIJr2sJvhIDy8EbIzZXV4I3l7eV16ToEpSvLjcMZhj9ZAkHtY2LOreW5zT8UYAb6/ImZY5lA6ULvn8fucjygDUX4ISLzob+GTmcoVQFmxaHvRRFRUz1Sr76G3n9ve89aWnV8IMbTa0GlJ3Dt3zzWh25REjXGlcW3J6i5y/I30RggyAqHzeVGb5zylVI4+SIZNQ4cNqkI+5TQPR4tAoM+hSpMLRHPHAlNvvbnDEA9JDgn4TTtQDIDEpIfC3FQPPYpE2krl76SlLG87Cd1uscDGkKm5yxnlxtdcqIRUQwobAscY7qLoxzYjukjsSNU7nxovOBcpVrWDoH3r1Q1spzizGxGPirUTLp9etJBqOl6JqOF2KLidq61GIAPCRERRWOMin0GqCjYulKdho5PCNK1NS7kKiKdgX9+Tl2rVnq0vfMogWXBVjpYhmVNHW6WROU06yUgzV2y0DycpdrIMFC8Nl0L56vnP+vjJA+AhUHNqB2W8OZIsYu9YHXEi4lNE9bjLebvLeNq8S/F1DpksxhGfqEeIBJYYVeygJ2CXYPr+w+uaN0pxsBB5V7NQN90halfyBYsHMYzUwHo3MKJfzq5rSz49o+6R9/lb7/Pfdpx+1L14m3ADUirjLoyfanRnLgJ3slrQl6RScIpo9NbI9smEOVwvguWpUkUZeUY6FKSCFEpv25Yy0mONI6ftv1658skbdF+M4nMF6v1VJ+1W5z4ZRKSXzLVVH5Lu0ReQb8izyHfLcCT0XNNjMpQQb3g7e+Ah3pQAw9a+LwE068cIrBSjVOfdl+8E1wlF4cmROhqfEZzPCkYmjFBtBasCZOFh6UZr90sTpPH/HLBo0czzKXAmFeySYJepVWMEefLRGU4szVWdF1qepsyJk53CBaqiky2ADskpJWk5bApTGUnd6KCXNKskZrJTa0xG0VJWlPWFbgj79pH3xGc1bLLNjWyslhTCfoa4WfJHKQXo5aPvR/qx+o/koNbr0WJWwL14S8OxsVXk7iAZjf5Ah4yLpbQDb7/5uWlphrDaufaGI7l6qah1VONHid6lUknrRpYBJ/HhyRrqgwivCPV7zHYsG/nILnqUY5uu3zmAd+nvUjQ1urYjZRqncC3MxbsoFE03lWjBpza9g2k5mRajhF+SdQVSKLVAbWBgFJ4NGa6q7lqqkeIdc/6xE1WPMMzCnOnvone1cf7p27SFwVx/tDO7e1KOyf2MOVefW3FG9N5cJ35xycG6uvIEzljyNUmlWcETKrDTqNmVLOhada/la281YbZ456FlH/jfXQlLbyDeKHAOlr+Wj1g47jtUIScNlDyN7YN9AYhfe/wdne1hawTOsaf5AWBnvl7Fy+9uf2M1V9OAko9I/CEldPOqiUH2rHiZUNOgCQQeabQD73OngoS5FPBb6OIDHQh2LcRxg4uAbB4koBnHgh4sJ+uMBBQLs4XW1v6umXeXsamTVxY4atorPfnI1n+o8X9v9+1rIaiBPNYAqYLG+Qfs+R+i7Avl3RbyVy1aMOsLTEZlWWBoh6UoiXwJaWWSlkC99vHrFAxRBVQML9Ej/asX+D1K1invO9ioV+0fVgfrBX3+zTvGJE+asmRMfGN/p73pM/1I5NIR/5S1xs1mOD0xHxXDn+PDgVDI5+gGMVyeOH8HPB7bE5cnRbYeyezbDL46M5g/PwilwYFchOHYU/t1JZ8FJw9l5OOcvh4a2zzbLW6aS0fH56vEjm6eL4ZZ4dvRo7sDo5ukohL9iHc4cbR0eOXa0dKBeOHa0OnFkKDg6dGBHFmju2ZadR+ajrfxfKkMD+/buHjtaym3Zu3vH2EH4fHDf7rHBXSMz+/aOlXdmB/eMNGrAHw7sHx7cNjA8+N7h7NEd2b27j+3Ibh3MTpaO7c6O7ckObh+obs8ODe7ZVds5Pgj3nd+ehev+n8ezw4Pbt/XznKY2H8WTkdp7nDCDjtuid9eRnRfuliP7L5yGDFxXLuNwpQ7WQZ4KajBHkzNiaacqIhsGWhSZOWRAo4qyDlFeRhibn4Lj3OwgnNv4eMx3OYmGYS5jnJ8oTT79sX3hNDs+kWfB0Ig80G7yBdiHTMmxPWwkf4B25/oeVZ+rfd7qdOWnzKHMvrmQSyYchEnFUtknqgCT9nwkW50SC8UHSrX9zX3eet6+/OXq24tyn+wDDeNm1LTUJTuyVeOwk7jVZIVCFbIoZWex4lFde/C0feWipYrk9IKxmlu995qDuo7qVfP18oYy9xkXb+flL7tvf1x99ZV31fUQm1D38LABtviWQnpJ2J4V3R4yz1/H3K7IYdF9+WT91OfKAhsmuAywttnKYr3ekl7vYYFyNyotbzzAOprCHu4CZthShVv5yLZk5+vlzsOF9qVPeHMSN0NrFTQ/eRMzxclNInc5efmkSj6VUUo8bEZppSU2p8kcx3DPaY6mDajQZLVV4pwj90gsVSjhIBcitvW/uWDFXepmYcp/f7H+9T2jCLBGMsBshGSmn0OCRCqhhE0JE8ePmh63PLyID+ajQR/KQ6ccll0M4qDBhYBbgVRiTA3R8zLO7evft8/fle34OhZHxnYgUs0LQ23IPOEWIfDozVAgnSKREm54M6XO7bNchg35zcVl0NIVG+6SVCQ2jURDlfQuFQBsYJ9YCoLxD3C1McqrkIKKP7LR+1Xn9lL74pnOzU/Zu8Cn1BKqpEFsUg7sasZeAYegk5CiWBsz6DDx1jgz0jWuLKxgMvFl9d7osnpQQUAsVVElKitaWUDYecoG4l36rP34nBOIF8atQljOp/zwJDHgbdSTsj938IXwoCHti1imryLWUM+gIvO8MDIPY+uGcUY4m537dIpLhgygh+2zN9gdQ8llcBidMZ5X0IH3Qc+I+ndSu5fs4TH4Xxw8jhHQMF5eqRguHjHj5fVGuZ80ziXr7RX8/eYy+3lND+KgkhFPr+9KloqlhrwpWup4jyUBXdzGnIAuPmNbbrWKNTgTCvqCNYm+cJKHUQW9UiDdsYU8fMCanEFGGndR4cPFmJoAYLvnX6+U501X8e7y1dVXzzu373Ru3O8s3uuc/Z7nEVhZwAXZVKO4EIiZwM53a0tz94Ge3dE/6HoXyhmNgkRTkqa7mavssubcDD0gfmvPYb3yumDWN/ur20vfdZdvWX+1odzjDec0Zc8fLikrHgOwLWYt8U9uWsrw8OszG0TlAYyJ4ka/sLwG9pRBn1UglTTvRjWpmFK1IVSgoOak7NCpJ+3Xb9a+Xer8kxyWRJhL/5hq930uwWR/+OwD7limigKYyC6pPEJm0124wI/Q5WLjiHGrVIKqUYMHuj+aGuNUZxt+A0hVI3AqSVL34mDFR+2HJic62C8s2XqrbZQqeaodgYi+atGkVBUXDF+2xOnrnB1wCkCaGDZuFk5lIFeXPm1fuaCVILGxQxBqKJkraC2Hid4xS9mXs0zeyllD3QpajOoTLEBFFyKANsWwSm0cqcoawiIutsA71U3pg4Boh4uyq8+PdsMfYU12cvXR9kZExGDazCWxaXwlRTqUM2vyZp7HiCMVSKLUrpJp3MACcvXVGzCqQQ5zSUFDF4MHEJE5xS0xT5l0eyYshmXNkvDHJxgftkpcD41rC77OUQzWAvK68XCdNnLhusrcRYVOFyUFb40DuhzKHPne/wBmqnFz4sT0NvnoYfva4/VrJ01tXb46tFsafYpKO9H1TuR730lM7XMl8p0nMSgwjnw3k9gLfFc+lZb2r3MC7GmFa/b8wzmn/B1G1FPhO0MvE2SoTZ0Yozy9MNg9H4EBE3NGsxnmcHfnyMrDvARvYG8624Rr8Xrn2nL78iuwShFloTOplpmTEtgupxCj3UoOD/mq1CQOlWlxKKrQyZSi3AbllX1beiMb2jWc1WQW6dbPPN3YKFVLtI8NauwTMQftJxcn+lagZ51Zqw8ZLswZQOuYYZ0XT7BEuDHD+lpgvjXkmkBq96jFkzJ1POvGMzDUrHANClvHgFWARfyYn6aW+88fs6BzrAYPZ2+ErxVVu3haCpQjXK4mdVM6QbAuQU+z88VrbOHh+o3ngEUcQOtgToM0HXypmFLQpAvvHGTnYTqFcxbLWRyVBm70eHoRWgqb+XjMxUh9cJEiFoUrfVBCGh+4uEDBQAoGeJaLY7FsEGnrpboYNdhHH6oSdNVfSvO5qs5RPKptHD3To19SaoU3powOUe2RUhxG1FrxKrMC1p9MildfOfLUlW5WrLkSTaWZFWW9HmcSRnsy/5Xp521OH1RPc5+zxMucPqIe5vc38DCzNDxxgnzL7/9h3/L45k2Fw9tHR6YqpfxMrTo+vnVTgf/dTP/Cf3vx78iunXvm4EMyORHBz3eX8rvq8DdVyu9swl9jbqY6Ph2VJ2dq49vrMBolk+WonIxHpfzY5MT0WJTEk/WpSh7O3XsciG3dvGkEvpfg+/D4sUNjIYyNB4fG4Pvh8PiunfDv0fHg2Ni2wYHa4ez+fXt2H8C//Xt2w5Higf37dsNY6/iRnQd3ZEMgOAQ/PDw6Up3Diw6OHTp6ePvI0A4Y2z46fyA7ODC0dSi7bRj+3bFtYMe2ocGNqkIEjYQz1uG5TtSTkkDv1DF4lhz+J3UhilT9bZYSZzALH+tnThJEmCRV87r99PLam5vt2087px92Tr+kDZlGS8jVjAYRlgGhBFNyUHixGTARpjh6+U/ERzOfatylTbOeZFEaB+LKA5NUjuizmeRMJUqTao5rBkAobzmzTQ1WB6+hzu2LuOH89SUwO3i24lmZGqDqWHpjxmEzKSPwtXwRjNKowbxcrtMoSGWIyci/XuNtz2t3hN3SjfXT2HtVeGSIkmwY5cA0AIRPKBvQFddJCHIYiiPFzDDRsyZBs5TEFeQy3MiNIo7v/nP1zcv2lQerb+92l19yb3oqDs1ERLLMB1jhlpmR4F7M8wj9Bt6V0iTJQW2NDc21R0vORc01jcCD91PO/xmrmuKLoSx93KKVILwJ9J9QPGNDFiy5JUuUSIpzLEK8u3KX2oLceNx9vNy+uNC+cHP9s/sm1C/A+hr5zJw0r9bX4jH23gwcieOMcKcaUpaP/3aUmb4dw8t5Pc1WQjl/KZcWgrOAG0XxgNX4WlaSdSqr/varK2tvPjdBgIaovJkCPicY+zMPcmYpjjEX9nIsFDnUhfpaSN/5ztnl9ZMnu8t32m9ecIEruVbQ0zZQqpBISclglp5Iw6wTGitG/JxoWXKkwUOyorljXY6XZuf62+7jd2DErb6jgnRhMYPeTBArqfeiDL2XQt7SkHoQWBbeyxAG5k0IcedFxOH0yiKC3AjN24BabcYwH3kEE7jyNMiPimaw6XUAjwkmcOf2OT4niKNgGkzxPJ/CQAGWQkXkCZPKzAVlDr2tUhmyh7ggOm8W2lRCTk7OmFynuNZCm64etKa8pwrsElN2uQlovmwP6WLmK6awlRIVbGjoooYrX11aal++IOlkGfJiANFWUuhlXA/wrTJA6+HrHOS56jI0xelf81J8zky7j++t3/vY+E6Ya2YykaYUYJkXoumoUI363bhz1L0K9yf6AKqmVkVBbxyuQbqCOHet/UF6WTt3twHn/vdP3df63PzFL9I3T03Y9OZDMKtaDS3g6uwCAc7mA8zc3QZa1P0BfuUgkih5bukB2hhnl9v3b9DGJhgWtVaGCGl+ezUsROwUI87SPMoZjVpWUCDhDPflxP/P8xoA8mtv7nROvtGrlNrLkcLssFQPqWU2xseFdr8JhClHpscyLProNZo6P+SkvyX10lwyzovH79a+/SdtOVHNRaU82UjJDNz2EazpiHHh2MvFERrKRuWGZWMlRzAf1ipRnMINMBrpcC9wkHqhppltUQQAq/PO81OdV6fxkXI9SRGnMEVqYTgZAjYSzqgwUF7xFVD2TT3ggUhG+jEiwwzgGGl3hxcaZ08us5GjnLCpoWmDo+vQ3CjfXW1locB60vjqzGJUVYDPfGWpSomAtCiilbt5RTXeI4C1cfm2PAjzCFpVzm0mWrhiNroeN9pnw4txf9RzCegnK9kWR851dJ8vdr0XQku3joFR1hatYfELAKSZaqT6lpaqHKCAWwotAmxtOriS3Vc3ExD36xdM0Kkpsvv2cvv0/bUrn2BcxOWn7XMXuc7uJEZxYpRsMdOkqiZW8aObAx9ATap7pL8zdjX3b1mSpf2lAEtiRZEeYYxry3Az2DIzl8txDkTcyq0sNhvhNL3rOlp+f8IQC1xL9HSbxvt15QEspvbdD9kBZol4q9bQtUvWchBBRARTmIuoWjWPRJyl6rwh1BQhLB//9eBoNZmXotjUw0zKnbQvLLXfneZaJ+hPoQ2Lmm1Maq7bsvAu3vIwvdG0WKO9eKKvF68MXLhYx+2jTFDj3CPeAyQGPCQBANgVjML/Y5hTqH+r//ohz8pw5TW9g+WPVl8trl2/0Xn6vPP11fapM23qYAVUMsxDBEzAezwyBj+YozwzjBnSbUuPOKq8Jpp4ZQp2ENKdN486P3M1KLqBcj4QSwg7rIU5Ks2LRZrRzS9912gUIxBA4MrwL7ewFPVXccYsGUSPZy92bpzm9UE9gZsobZoNeWJhoYU+8dYE+oENWQr65FFniFAj971aoDbt0vGPGLRfP1//+jN+p0A7U26a1pf4dirsc0dxJK+9YnU0CSDFBQLH2PcPzCigZuXHKcHyALm/+wT4dd9+1/nprcEHRNHUGcAVwwP/I/21lyxVZ6Y0fHKquMSxcsXj24y4+ZJrgREePHPTN1X+nZvylCfdjM5mvQ1ZibMtUo08gnPZ/25JZbCAAE5m2nEjcu2Ll7o/fa/XNFdvAbWNqj6T28D6CjwPgfoF2COgzdBKFPFhrX+Vlp6l79j4rm3vGMH9rF/X7nV+0mPuUozwxrama2A6pqUxKlX36GdKjQHbuezZe2rlOfZdyrSTrBfzub8NlzLgXOPNWFP9TCi1nqzN02N39DM3+loZrm3hWxX9Uf2GYL4Xw7vI3cfsDlw3uNfDyYqN9agHhB3wq5PMgFFRxIRAXezpok4HafYDMykEk4J2G4Co34BOf4xHL1BzlWJKFbqwQ9GGjzN6MYaLAFTtG4X/OyxBd+R91f7tx6rafa2uak8/pBWpqzwdxelolf9QwVjVYqRzX/GeEun6W5XhRkp6MlUlqR7t8dnj8FjaV28G1Ufv/Ep882ZEffJbNvDJE98TW/6wMz7/Xv3QzMTxg4Xg6IFS7vBk7fBUPl/feggE1VH8m4WD+Dc3cXwG/mZrh1ulKLe7lESlXH4af31oa+3w5nx+unG4CWNwSiU4Wo3xX6C3ZW525ngzKeWOHdmf25eFM1vB0W0h/BWDoyNAbfNUVDq+60C2GBaOwm8ndpeP7IfPwe7ysf1AswbX8t6uHdtG8A/GjgyMDQY7smOjg0Pbx4cHcPQA/OFn+M2x7Py27M7hgXH42z40sG9w79Cu3dmp0eyBXTtG4G/bzu3jA3DuXjg2Bp/7NUmsJxGluvBev1sqfaMDKCfzVodx6z6sc0nxJmd/YnW2vvCi/e1zZ/MIISaGIdi8nP9uztUo53OkqOG6qWIP1LkVfRxUqVMO6ic9irU+W/YXWPHf1HjmRO2IzYaF1pTEHraXb3Tunmm/+q59+iGHH2KORqYJGr2pXTn6XAH6FcJasPEFxGzqlfNJPRcY4K+cuQGz7AIb5pj2+oziB4U7QOBmIyg6dYFACgJ96pFdEqs/Xw11VAZ//Yz3ibE5x+czKmzWnr5av3e3/e5x9+0bKRwkZ2J3+7jRy4cqqgbUFIHKctszOI0sogKvHkdEBhRkaBlewvhCnyF+lJNJYidO5EqMhTpp6zsOW9MWdtpx07YAWVIGAQFE7l2wdnmxe5YBIv6cb62oXOpp8s6ApeZ1RmCKtjEVEczIWRzwB0uTIuUSKVZKI2xTmiGnRqnrZ+fyVt0nT9jPDuoTu9OBpWW2beXJEAu96NgMiVabIXL+42Ca+jiIpPs0Atx9KptOUabmPw7GsZTcC6niZOvXzyYBiRcoap5U9Tfdd4D3nkr6FSy0aWzLnKYamP0MS7JnQ8Mhy7sZljLuZriUQyxZnpP4cd676DNEu/AY4oohTxwYg3HSJ29y5kALO87BBLT74rB6uRW9c8Ebb8Bgybt//cBFzXj35fLV9pklc70p0r7c0HYmXEvSkxtxYrK5bMlIT05xwUgVUgzrAWrXW3kjpagZHIWN18MgY5mLb9AeUs4MK9hBTntn1Nec9kyAFwik20vw8BjTEyN0BtTqUaCBPVUA0YHcGqykvGzN0qhtCmkOSNcRCek4/YxDOriUDP0m06gkzYaE1MG0KVRX7hUxDTcOHUEk9LEMB8snGmXiEcnVf3AZAeDw88vuMgZTCOFMudRK6uWmac8Z4g0F3LWxALBeX0NDjvCBvq8nMS3e9PWsnX7QOf8tyh7+PT0ubSmTwLxaWZjOWJ6cj+0OBtL2hQlTde1Zs9fE1DtfnOXtJkM7g9N1WjuFlQLesC4D7uKkwnAi8EJPsUsnoAmOqMUyPxelRIKxbrvLVzrnrIErG39AGmin+WD3ckmUdPnADCsljLlRTqPOj30L+vL19XufKI9KBO///x+PlhoK5KsRXvjoMfKda6wSH42ap7hi3o5nc4/Jdpd+WP/qMueuItlMNfnzXF0TkwCw1dD5NN+KxQtL04m/cpw0pSIBGsAXv3YK05C6L68aNQOKYKbaUo+3rN+E0xFqUp69xaNx6Awbov6qZuJ2VRNxb02LJiBvZj2srCxVueofpoOF7hhuXFKnQ9IOJj+lIP2ULr8EJQFMuMUR2ECVVpUKU/RIcqt6PGHu6R6XukuXlI8vcj3Sdk/do90r1B36LNUtC5Tq2BSsHpjtufTFs7vGu3jjtKFEFO/ZnLugpGnteqQR0lbqYVN8ycbwMqNB/G8+GnNmL3GKuI4KoUse7XwZA3BuyrUpuLr/z7UfbnZNYkUhjlo5nwG61B8FtJZEtqGwmQ44BwUQADmLEkoREHh4/yFPxGY4mUftWY1iVS5MLYjKEiSrAbboTMJHU4kyXMYEZ78Xacs79ALkMDZDWptxtNraoyW4je53p7jBmTAFVTIRaJ6WXPb/070Ecc0lRxUt8jRJLDkqWVPAPCy6Afsu7Yuk4m52jiAe9BangmRnCNelhwVhQSoQlNXYg4t1D9vgYndT2+Bidz+bKepmtuBi3cf25JXOlB6R5RxJT7sUJDEzUOWXTl1XglHiZz7gTlEZvQiTEuoekcuQrmLMiIrtrTxj/ECM1m+ebt96KwoXZwrRaQqdDSp8/Hdbyb9nIW9ol/ZYoq4B6piePbagb2tyiUpqtsKO5J9PdV5f9Gw8Ux3YWFf1PgacWm1qrzkGlbWjuJqC2kxqLVkzScwOa24QVFPbQq0K31Sh56+IXypaC7y3wH4DTO8+YvHf6gM1T9MH6IpnyZgmEOvhVoWsFq+mQCqJvz5AUdGhgwtdFOUgJxfRKIwxAMbHXn/0LEFTBnz0gBBFHoo5XKyhAOOP6DRPBTt6dyPx2Ve/OqLj95VdPx2nWklLaf2WDkppHqtzHPWgKkFuJDIdzpbWv/m7UQPy++fTRkh7slklsspiXwx7oteTeSrqrJDrdQrDk5yLt2EDP/rFQNo/3Oe4uor7nyte4z4H1YG8eQMHMp1TPHFCrvbE5j/sSi4VDx2cKBw5ODb83sFNydhwLX944Fh2bPj9g1vgWx2+7t4+vhf/jaOje+CfPZPwcxwuBEdyW+F0+LxzFg7W84d3bBob3tHMlQP8zVR0dLwC/04WjoxNxUfHjjRzwdZG8dDWRunQHiBamZw4Uq8dHjnSHA6ONMs5HNu5Y2RgdiqO4PzwYBa4DsCvi++/t3dfdvv+7N5Nh7ODB7DL3+jggb37924bgn/3w2kze7aPt0YGRgePwfnHdo4MHN+zexz+tm9KhqORgV2D+/fuGzq2c8fAFrhF+LwNxkbh+0j/+sorD7ACzSyB19Asd7IU7XhixjlRkZtw8h7X+pd31m8+6ly6Z8rpUSGzgjr3QPCjRWH5sDLAQmeWh7gimCiFinNxN6aMAeJ/P2VqpBWkI1UsLTxx23a+VZdA2mnqaQ2TPN+qSw38mBo6oR54+7jz6hXt+Jax23GEPyES2KbkXphPMoYYG4Mrj/IJoTS8AyVJ7aGotn6J/G4m5OHVq/bLhc7zT1mEM/lMNQCypphbY+XRNDkLUcRSmxI7iEHpEzyIwRSUfkxUFzoPvyeDIaljOnQpmEusvR9NZ4JSlfbI6OwMFvGItUIXA6mVpSZ/ynO1LpAS6yevrX+xzCIc6GWIBhLFrFHMucVaxxKiF9kRKbZPW5WnsIUvNcJbIpTy4vzao+XO4v32O9xcMp6WSdNOOQChicUQMEIKtDT3lODGvDxO1k1ghnmfeSFHk0Hb6bw41335KUyH9k9YvgtpZ6oRVqhIKtr+NShK0jg64CdC0regWeZBtZN7vP3Pk92fn1IxuIQahgWSlwq4hxUrfgpMa8UWpZpy5uTJW+s3/kGps3BzgXsy1ikHXc+rRd8u1SrXYfN6tWQbvRhq3iRV1G6chveydmeRpmidlhKfLnisgJmSbHnKuDQLqraMe0fHaZZiuN8vP8zx7OzcuM+95JRsZi4oaAnXasgWTqNqLt8b7b16XrGg5yv28m8+an/Ce4s0p0OmUAjSXEy6pBmR75ak7O8yQendYYhxyiQlONYDdLuYkoH1JGZh4hzgioF6BJF2USbVD7PcdVckWef6a5Q0159i412SZw2qSyX1ApmCRkjkqTqg0oWhFo7F7qBJCsNCAi6n9qsP23cuKRvAiXlqYu4yCWJQkEnFm0/OWO/roLJGgBxy+jawqtFHF8xkQk2KXS086k5zbjs0zQhaCfK+mSknS0TBaOhcWeI+GUQ1Y/1ejTpFWCXsRJ8g4eSPYep5U/elwdapUThJ1WyJLd1of36qvfzz2tL3HGLTyJjzHRgOwI+etkAxbkVJBUfMkE8ZBXWFgjyRh2Gw+vpp9/kiFWKTK5wz6W8RrH113ZvuR7zk+IjfF0kb4GEnJBQaVc6BpJUoFRqpM1L74o3OhTO0Ik/3dklCEzosAG9XyONTi8gsZTFP9ZQWaaAvoxQLpZnhhWmTW+sAxJqRWzuJUk51NN2iVGazOlmpFj12MiGDgNwVc+b81A2gbm0mdfceLC9bcYNntHMvTF3vRcl795KPmo2VRdxcTCIjxwM7GGC3hWkjFnG5lNjy0i7mRL59+lz3ATWTaiXk+QvDBqJpSeytNCLa/ZSKFPa7Ca6yJEEzUmALEWxfEmvEkDMbEM4Vyi4K1422wzTF8jKOYovy1Bveu779tPvRbW864QkAM5p4fYkT3Vbl/gwBHWgyUJrAwVl3kGOhUX08Q9t05S7Vonl8DxHOrbftb69zkRt6RtVSFNoGsbQ1HItJlhQS/AoCQiw0DlAt0I4Gy0MSMb9eIv13f3n11e3O7XOdcydBxnTOfS5FXJpzWN+ExJfEytGyF/mX0K63/V6SzqQaYvPNad7vZo+6UmkgAikkpsgHhfxhi/Y65ZVhaZ6g4rTLoV7Cp2LulNP5+pPOp5Tz0wjylO8A1xnHEvKE1Eg3VFroa6CENRqKdaJYRw95oKm7otrVnU/fda69cKnrRaM1WoSFigW2CmKdut8JOJOHrmJigQGwz/McWfvqYyxK/+Zs5/ZJI3X4TPLCFdOrVana1dqXkT8TmYsv2wyXvstVxJo7IoKNCCc8O3DqPaFYOJJiOquNKsYdQrvwHWVMuxmRYld4kbHMbaubcZo8OIssSC+b5Y9q2bQpB8O/aDajsFJ/04bKYbZW6gilXpArEfAXqgTkcP7D9uI3gMHap87Qg2lgiMccOp9MzJd4KOGCgSHl0vcZkrQODPAVRyVSXvqEvZRCT72U6euHNQkPmXC9f/ncfiC9MzJlrt5sjNzhq5eOA1im38RtrnxT5wIkwo0tKDOmvEiXAINfr9GUB3Kdr65qzX/MGwU9iLGSfStieFakbz9SAhQ1y+GyMO9OdZdvezajZy16RiKbSZJihD7mlwtqwTnLwqwFT1ctmOaY7Nux5pln5PQaNmrOiCFjCt/SIzL/bmSA9LM8PHvDneo6vV3o7wFyB4l7IFwBuIu+tV1dbIx5/ehiXEW3fUCtRZsuzFRw6cDKFNxzYF4PvHNBnQPnFMoZ4OZCJkVKLkZKgyMPE6VwisITF5i4YMHChBRAUHDgIwP1pYrTvUcpqyq2SthTO4JNepWOo2tVv6pmERWY1ntY8RG0NRewBsV3+Urn3KeOapJORkYt9FUQrl7wNYI86NAGQ/TKaXfy6r1aEeMJFkdeqaRyBey/cZqVbb3hsaDFDvbGx8qoEyBrf6cRsjKkHs73NgyRRVV54j1xbCoN6TkXN2A9HGzGraCIT/tvf/tTY+V7vpi98BvM1CEH35b/9adZkBQRVcJwLhfuIln5Kag1Rtxfb3Z+DVdYpcSiv4FZfGb11aL7w00+WboyU82Zrw0m7P/2H5ASdMp86IMxzwOfdbXSipMheiDwk2K0E3UkQkC81rAS7KacV7hW2smkb/zgdlEl6T/9n/8L0wc21A==";
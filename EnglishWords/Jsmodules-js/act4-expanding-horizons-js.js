@@ -1,2 +1,2 @@
 // Obfuscated production version (zlib + base64)
-export const w="eNq8vVtv3NiSJvpXiP3QT3sDfZvunn7rywHOAHMajdMDzMOgYVCZlEQ7M5kmM+WSDhqwyverVGWX7SrbZcs3SWVL8q3KluTLQ7rgPyJmpv7FxG3FisVkuqrn4QB7u5RBMmKRXIz4IlasiP/4j3//9z9kjSzP45koa6W9IvnDHycJg825aK7z6dpsNNg4Fg1e9lvRp+UZODC8/+7w4dXyzKXh69vlm9dASVqLvSJK+scz4PCH//XHf/9DLNziRloM9tpwziRlsNFfjDqfni5WBRzsrh7ee2UFwDX9diigV6S9TtIo4k6SR0kvj1GGEC1tsDtfRINni3gvT7+KBruz9Ksz2DyB93JnZ3xhrzzzunx0Bf4Y3jgHRLgwShqduChS5ETysk6ctuJeGmUgoJ2yXHxslp7CAaFPSoM/WtHgfhMJcIKVWZ7fLB+tD0+v4LP0giPhTQNImlHcTvPun+J8JsPz4HcObypuR0KBJ7gUDTbTo1HSxKf4/s7w7vPRD6fh79kMbihJu3nSK+K2vCF4z4MtvNeAr6VP4++eqUrhx0ijVykRMkrxJcjwsx4wpIcT/JjrDO6nX0UZ/UsjL0+tjL++oSPvpXBqnnX5PfB1UR73OmkXX0CVEPAb3O/Pe47X9/HtCrsIzo+71WeRDR4WRZJ3v0rCZ9EZvEqVPliDG/h8NZ2xT2L84cN4bUOfRCdLhVH4IDIjC6YMvF/6+GqIOHk6n5bTXiDl50vlo02VwidXJAweDtaTPG1G7USm60JGnyDMznk3UZkkD6v/+dslfEyr34x/fg5/NPP4RNaL8NoET6wZuONQIVvOL5vw2HYX7fDLixvjj6t2+CQg8tMkbuIn3ExhKkRJkeYNHI4lFqlQPz09GqWfrp0AIRv4pK7NF/RF75VXXhzsvx/vPYWffHa02GMGJKQVZ/BqupEXBie24k5W5EC1RM8ZP+EcFNUcznlifrC3d/D2J/jpeEeOBT+uFKYMfFi9uEvc007Gv6Is7aU40sEzeD6fr843osEWPZs7zw/21g+Xb+IXAqdEyRx8/HkyX+UXwTMn3WN4MkXZ4YPC+UMKHIdMjOGTKncuH7zFV+yYR/N4KT8WmLONtAmfRxR38K+kLQ+mhjzY7H8VofKe63z+tgePZ60/j2+l3HpSXt4f7d87eHcfxcgV9HDgxpENSUMVp3zhQ8la8QK+r6RVS4cPoT8HdzYPKug+qKCK1PH61+XJdwf7b1RwkfThygmxWSdPmjDhOnPwOTdJgTMhG7yA6dak9wIabgNeeYramj4QlLC9Nt7+cLD/cHQVHx9fH/HFrESEkdidLPypZihgyh+CMiVFYziC2SsGa60GaOA+qDmYFC3WSjVUeh9kZ2ASwLf/+focvw20L2feliuP8G3oFfBgkHvcalRFGYudVkneZFshzl6LEDbWFf5JZ/AAlG476XWyQAgcWKs74EXRE4OJvNxUWfDEyvfXVNZiHiuLOnHulYSyat+Mk6NvhuXgm5mQgqpvsAk2MnKzdJLiZ2z66TZMu0+3SUvJZP1wtdxew/dCcxUuTubR5Fa4Z62kGwfcs4W014ApTeMHWNH5vLoYIeAIhVy8Xb77rlx9q3JacdLtxlVBavJI54L+y5MZmlPe6OGRZtxzB/qDV6DWny2hfm/hV4j6a3T9xfjcT+PtvfHGydAAghFvZ80kyWcrArNePw7kCMEb2M/fInBa8vb1/DcgpMK+lRTe8sV52i06bD/gVc0K/0ZIT/p8YK2PL34NH+FVxLuDLby/4d7q8O7j4el7o+WfWVbPXU5QKu9nNRJhfuDc6CRVkcEBlYN3OI+PcI9UAQkbXvhQ7uxXRDY7KT+4Ih6sd+ImzPhcjpEVmGnHjaiVWCKCd1QyMwCpZ2FmHAXa4d3NcuVWufLN8ONJMgCdGIxFItcwfzaMBYy3n1l+RZb3sii2JDKIn5Z7hGtZAprE/RvlxRcsAWzhPFxlJfDz6qRzgDmJXdHXh+WoLUdGxgJQ5lDfoL3pz+Md8eQev1gbnno1vPwY7sk9MmGSAAOU1wYztwDTI7KC8eaPAjkuIiu5ViLMlk+30cjBTDlmxYItPTx3dXTp64rkZis9wToIvtEYsQfa2Qa5VERKctbcjkiw+tNtBKvkpSBkbTCyLs9+D05Bef424SkwY/mJKBEe/DidDEJkcdFJCBI7MQzIHDlF4/DpaVGRM9p/PTx518o51knne6GgFo641QeWFVjjyZlSPQpBGc7VYghSXr7BTpbiD8ejKmemPXjQAFvVSUNBONsdebAHliwDjHw0EDX8eflg75ERhTMdFEW9KHQr6UlMUhBiznV+vYK3Y/iX5/bLsy+V/7FGBiYkMby74F44WX+s/FJGpAXgre+RSmVu47XLMHix1DiULvo9/+vv/1A08+x/Jq1uO0YPxDvw3nP/T7rsxpeuurS/5clWvNfQaeW5H3iUU9xI9R5Dv9G6ed6/qzh26tMZh67ipQS+ibHzatwJPli/yXo19a6MejDGd6n4LdZdCTwIdRyMy6DI/rV+PPVfkn4/5supgvYQq9O4A4ys0HgKJvaglZSFgake9XpwmjnEyM/Z/cm4EOfMUZomb0f7KyTSosEsgGcTyMyJV8znUNgkznOIyKIjvNzCIEU/02BPgEAs+lDUEeCNCcNfMfeBkVfLHtp04mGMqfkTDfbn1eP49Fa+KVd3SBnUW9CK6awzYNZkhZYqMCDGahAXayDUNNRaBKM3rXJTjWaP0yvTc3/jKtWnqv0KVHL/IQf+KfqzqJf/wx/+/g8JuHpzfdIAf5w42EkXOSxUcxWYuUbNkfkibc0hVvvzv/qLvwflHndB+ok//H9//4e4B64v/FeGduQIqI4jcNaRvwYJGFVFbDmb5TwJMUKnP3xcbnzxaw1txUuduFe4DzmdNVfz7woDdIf6g5fzoMf6S8zr4O3JcvXq8A4CLmYX0aX8egGCLUQUOswJCU8QBs9AK4oh2kUB7Dm8WynfPyhXHo93UOPguQCp4FLjmYBRI2766RmCZeWY0PXkeoiqbidgEuDCtYJewkxWmN+DZw38/m/PciTjBIao2njbFCA8vzfefg9PcXRhc3hvtdzZpamNSLMXF14zbLXI8jqedTQvB57EEj6JjfklFTF8uT+8/pG/QOBMTi04z+YGQFvn9B3C34Mt+REMnvDDkh31wdstvCKNFul8He5aO86bnqWlTWM9eMbvDf5rJQxPrpcX1ofnUfWSEHzuMbLSWHKaZ3NJK5Z5OtjSn+jNRRi249m6cbLcuaYTdpFOa8XVZ+y5GWId0/ApM3d9yo775HMGCOsUHvxI4Bc8mdSDgsFeL3zWp1bK2x+CZ50nqvUKMNALg60Fw9aTJpnz58EoYM7ZclCp+Ilc3Bhdv0dDTxj+pwspfyUx+EwYY/QrKpMUD9hc5KZQtAZacPjdQ7+6ghcbxjj5vGNBJJyDtY6FZS5uhWOuboVnD4Yw42FSILlFBhlepiOTyWkIfbClX/rh7bP8paORgeNwAjx1/dyFLyiBxI1aeObpjBszsqIx4xPeuQkjpWfbI9E4UFZA9PxIjaV9jEAZwmCLKDDhOmBGMfjinjFOiys3h5fP8fOlmQ+XR/R8ZVGJxhG+NPdEp7w4fcr64vgJ64uTJ0wCljJSvu0M4Zn8yDr0a/DsePT5OqHT59fHO1sEilM4BQMOeApDxXywWcj18AMd2+By1paFC8kwK/gMxl+fOnj7mOKxWS8q+nQt64IckGiUzWWtwRqFPycIZJ1R89LLJ2cLXhN9vjt3QfeiJ3zz9cHuJfo6kxO9ZAY8KLg+TlndOF723Xuaf/lekM4A5C8PUziaaeCmKLyiuXSWgaObn5ZGOociuqTSRu+3x9sfVKXh++nJwwA9NngFLsF8FANv+LHWSWj2g35jcku/gBhdBHBGWU88a7IEsqeDXYq9bv+AEeO9S8PvzsiXBnJQhcp0o0+4AHUPgL4TixEJCGD0iCc/e9VuwwuX+LmrdjNXMZjopo0O+GAVftPoALe7qCBm0btahInEYl5/KFeujJ8sH7ylhTO9IuqkcVstiaOjAvljDWWw2T9KLMWirH8L/Pzqnjl3ytCZzdQDnr8dPIuZGDzpSTf6rNmJ87jbxmBwK22DOqIPXij945ESMwrhfl6dISMG/yXX4NRw53p5Y3946yq/X8MrDeKDTJewFjPVINcuYe2tNhkY5M2widiOrm8cvCf8QSw1rIUcQddns4O1Hq3G0Gqw/4lMKSbM66k39g9/WOUnjkguz+a7BGWZlVzmBjRBUGbVASJTN0DHU4dI2jKbkecX/oKnCR/63qwMb+XN6NkTnRB42qI8PTBK4HB2g2traGSUl5zjgyqQvEfQL+RGfVgGY41rX4/Wy3fo9rOIqNWfzZMTYp4IEyc9eZb812CrZybu4YNbduKC9z/fc64QZh24qyo/lQnFUfQbZm7lx1P8DRO3SC718cM8jztk1PviBoTUhiODUzAna/OsgMgc/Xh6tH8NFFC58r34OXQBh/aQCQvioC9g4gTDNoQs9ASQKOuicc6HO+FhDqvsfsXIqMHrpJTU8Yy+9o/PQfpo/Tktl54cPXvmHEm6Ceb9p16Ri8eCGniNV6hc+Ag+q4AAc7EbSRRJ1rzwLV9bRsNL610YkwOXjVZsaHmswjkBDw9Ue8xGVLjjSrGj4pti624kDH9cLc+fVQlw/iJ4WrGRUhen8x5d6Mux96ZOm3fXnJf2JTdKvlx1bCbdGfUG1HmRh+Cci0mPwl5iPBMD7WsAvYJ4A98ZY3toXQPXOZfhxRrnvFhsTlDWQVpeZvDAWCFxBa16MCkYkuGjYkeDGhUtWhSn2M2hNrbPDLOm4zOFZR4s1eEmRTIGxiicE4RRhRSKWVDg9zvlnT0PITQByhvwabBBwUJgv0MG8rynGFU1paERnbBuatisTVNDpiYstDnW3Mh1bFvxqp3rxq7IG/RmYNKaqClRDS+xaFLDFW2sGtjp3lDnWk1rlJwqNKvE/Kt0a/GqVOy6vK7GSyCzojJMcIuO/fe6yJYeCcJa9nwT01KyBrT+619+IaDFIzoC59hwlrrzWTIntjGkGIc+4uVUVvzs1I/e3SrvPGeDWYhPj9ex2ZzJWnNVfvXUWim4dHKcfh6vCBytnirPYNTWyIyYszg9FG1KAf4l8JePP4FWVBIxNvZ/ePeU2n/QwVm02OvMpQn+WZhYPJpmw9gTp/Dm1atX5LWyiHL7l/I2aWEvQBJZnMnG2dYDKW1QMS5LCg2lo00mSWFM14HkJllpnyy1ewGkHi4DVNjzKVMdw29SaNzsH40rQoG2KCst/i3VSC0vbg5XXlekNtN4UmQbEyma8VdpPNNO2EHC30flJ0JRTqmExycRwl36tgGUItq7/X54b/Vwc59WdOjSAr6ztiwANOOknXVCCfC3pPbUCkJPr40JZ7kX8s37g/19UlWOfdTE9cms2xVN2+p3B3sNCamknT4nQeYz7X6DfEmhgMKe9xlb734oXz0XpZ8AsO6l7XbfTbS02em3BbJxCJ4pzDTgBVZEYKFyHX13+eAtL50hz6jZQn1gogGs15Nuxj41EcWtdkQBYPMTQQFEYavn64ICvP7BDOz3Qqu5VaHhwWnCKVeLvx2We/j9Gf52jDD9dnjZ2KnrV700BwolhLSy3C1FoavPB1pwxB9wKujlMZjRPVxeWaV12/O/DK+ul3fuHT44S4aHzicvn7i4qdbrd4uUgwoimIwuU/GZq1ycb04AOTOcvIweDkxxzhREaRjW2d4+2LswvHOB0ZeMG2YfsWUcBrLTuf4sZkSDeACmDcrnqKOizcYl3i2c4vfR8I1XHw+ff3P4wwdcxsY0kyShq2pYOzUUUuuyNT171j8qQTSPlcGZM1GRDH7G3BdGu0LCCcKkdLDW4NByEigDAV8Pl+EtoQNI+sChoU4az8VRQdHKjuDjAuxOe/AK+CeBzJBeJxhnolv2ZIHDn6/y4qeKiIBJhjwMekobAJo79BbADWs40IvT3R5yR+AVbeKS8Ms+Jfh0Uc/ijBltXBp/PFeefzR+fh5F8gX8yaU95OM0RwP8OHh8VjorEDlgZdNQRAjNQ1DjBOpIzvDWtfHrt+5bYymYPybLygCOEgyvAmToZEv04iqEX5+i+b7PEfvLe8PztxhVL0V5zPqolS6kmC6DFxLCDH7StVE62KC5dP5WefYMraWeiOhEDrnG3crDVUrlmXb4FQ62uqha3DO9Xe6+Kr+9bJ5p0oiTbqCHl1yOr/mljAL9y8xU/xIro34L+IRbs5ScKLHNfgvGmdNn1Wv4Y/SS9BiB9U+3QcyvT3uSsILCzr4arz8c/bRcnn0pb4kviRwrp5zalL0ttD96SkNJnjEty/fhuX++jpiW2Y8fnhluIfDWQTaTtsvpJvNBqWspLzgxYcn9xuePKmEtbU1Yk9Hte+Pl67Uh5gZeL94mwgbwL6wUJdXKoTBJ51f6XFkGxknO3pZkFmSMjj2xUBWOKcn4YgA+N2J+TkRrMTHpN2JZPQcP/6vo07U+fjFraY/yh7fLKyujvSfDu2sueyTJQQEt4pp6L5irzNZMVSV4luFMJbY6U5mlmajAAJzLgmKzcTtrddlXBayTEjXjpUZ34NMyKjRCcZR2zRlW6eA+hUEuXAVEVW7fwhSrRziLmwkpgF4RKXOJTyTgH9F8tWLBKjtyRW5VGnw6i5TzTdF0EXjw9ofxMt6lYxnl8CBjk5IrDOE5rYNz6ZNDlL4Er4rpmC/x+XonvEPMm734k94e+F+zs0m02AhuLnU/KY0Rl1fZjTb0Fh9o8BFzWx2KJsONESQjOeM3P5fbP+K70+sTd63LLkcgpH4RReYmaYONhvOTUC86cDTaugHOEehHcSwa6BTRthHQ+Q4oCDvQNJ0+AFlSOgGNwf0J/ngs+/LiGn0+wr7I03h2Ng75ZzAd5jqUDBYVgy1OdsqTo0j6ypPIersXcfs9v4JF0Bh9tE3oDmWz/onAhfbuc1zXqhLNIwleMz8Tfc3yTKyICkDtpbirZgKbZvMN8NGQjgsoBpEOX32ncPRE3KqBoRVGYIJBQ9XA30yMs2gXtMKBIDLEKotMcFVaXWyy4mT/n3n2VbfeOr9TfF71dEMf1wdSnA/IoRT/q9adrDiSE05k4N/VeXXqygVOnOow9rBqPCvrpRnvrOLITHFd1GMJfZWqdxJ4JNYzUDfAQn+n7Bl/s4rXvwPg7SB3gOct4K0DuQptLaidwLIV/GoxpELHEDQauKgw0S/rOISIng4hRAcOGWhV4JaCLAevJLfTg5taVKNIxmAYHpZHFLVIQvGDQQ4WMHiYEJhvNdpqriUoa8zzl42jtYnGGlasU2CSAiukpscaHZNDu4mK2ysimgdG4ztdP03HB9qdl5hP6MWPboiTPk3ZVjWg25bF16umm6bjJJhKczRuJf9voAz/WzWyOv00DbN+kZPEXKefowHYv5sWgHXX5keOBPd05O/CcCx/Z0sppvjN5XHbZjwEVEmpXKNNVMuUylpevgFKe/xhl8OxJMVc49zDrKiTIkc03bReSkTKUZYtVB4oydGjD+6T92wjZmoUyBwg4qTA5AtQh6pHHJW8Az5A+cEIoCLcSIPrOIO9JdoUyKpi/+Hw5i+jJ/uHP1wf3lwZrV9h3Mk3zfz0huM8stLlZoFqpdPSQY2kigzDP2Iuzj0pkj+10WvBxeU4n2PPk+i45lOhy9LRUd4zzksb578db6+V5zdHTzCmIOdGgHxnW8kJ+/ZUmH9tKkcgL669B6+K2Op7Eqb2/VC+KId0AghaTzaQC59Y+vmqB6GHdzeH13c94GIO9gaEqR++JzhuweiZo45ehmQnF9x9T3Lv4vkGz924jsipfrK9jZOgcdcPbst4+xZcuOFFXFSksyO53qnM2cFWA3fiOjLhKSHGnqhsAweOWavhckNrgW32NqxdpLjmRI6T3avA9IYeqN2Dbd82bWHQ56WbsB0f70lRHqeT60ySJarDS6iM5YGSnq/keTJEA7nD1/ua7anDDrM9BQDmWQec96zbz+cUBoa0z6u4uWHvOO8vx810nN94bfTh0fC75+Vz3BTW7Wf5HG7/pmtd2mqnN9ikpFWk/dFTcIGbSfiRE2AKmMN3DshJmTu24Oh05nsa1Sv6rQZvNLTfBG0xqD1ivhb4z6scjfyMd9q2d8vLZ4yDkgmbirgY0+uytg8gOnrLHvACON412KVIEckYf7x98PGU7HWQkfb4Qt3jgtkHUlmAdKakkZtDulQghzqYHJIONruRsRa/XuHI7PZWeQ9E3yjPnCof/cCrHR3cz4OvjBlWNmt5SXbHVkDltGj8yFhQuDfs5Prw/hsQphsNVFK4P4ytLe35yLyZdT8HL7vRp2WXJP3xaXn1kmYGua0icKLdaEL7J5Me+BbqFwgZU1sopp2DIuq3DHvWFJiZp2JQT6xcMTtSgENvfk7yZzi2Rk8pj7uFyegMSJRZsjzfmEzpfHO3fLNdF2/DyR7rskILvSzcQRmKUnK9tE9Plwhvz6mk8c+nyzeP5Vui87HsgeygXEr6x9NcY6FpfyYFaMmgVo6ZhExzFJBqVxJ4dmdxfy8+8MMzVzB/Z+fy+PUDFw6VS6L5XitOQqlwH/02R/RqSI4v7rh221+Z9ej1zmgdd+0wT/iE+CrRq8Arn+FE6layAP4x8ze0tKP+zOfVPpWe2D2GyqjLvs3w+evy9vPxa9xIBqcnLXg1+IV3XboDxVOEJ2c+VChseJ5x5YTXT8c/P6IXQEwwr40gu0dlAEu5lEgKDk7WSDTQNY+BibR/NBGdg1EtnE10J6qeg6WY9eVyeQUzV1lNu9UYKTiSNNIms7N1OkLBWqhjmmxTqYPFaaUOZR+W6pCPz+2samM+skQq6YADvf4AJ9ltHf/CfZ4dbq1P3qdbdZJ9WI7jBBS1wgI0WjuKAJGy6BCR6lUWlOKX24r7vNpNizIwtVuszAM6xrdm5DMGX5zTxZoOv+zOeLWxdQHm58FblNuNyewCo+OJ2Kq42ZGlQiOBooygxubYLoZHKoLg/3nUB3edtvU5YeWZx8Prv7AKEXERBsvcpvasCTOLMmZVLi9TOrKhWoE0jyTGJMJgIlGMCVcHMJPWSRTnN+kgPrU3yF6wI08RNNgEB4CMlkoqzz8FQ2XuCSwHPL25IETW53W89XQhJwdFYmVMho9DyBSxBcCPq22KANeGd66Ul/cE7/O5eDtwdVuX5xtZi/U78eRtnECyFMeU8nHchk1mXN55Lts2HduIrq94moB1KX/HeJhIakiyFuCiEyHaf3Dr8Oa291X6RZFasO98hma6YDwI/kXQlLfwuG3jkmL3en90/d7B3iNhOksVUrwDgXOl3QfUmzEESegQ7RPuH0Ud0S8itrEJy2u5SCE/nA1KNLzNYJiGDhpp+B0XT8vmTwA0KHApKPEOl6sfY6Q5miF5GeGOXZbh9u0KYy0uU7uhfNLp/w1vvxJTqAsoVBzreo9a3ejQgQ49Z+stey9WfVfvtVp31XuoxndUj1F9xcBJNK6hddfUSfPuWeCVWUds0iciv9I6QuBRGhdIM23FH/F+yO9ycgL3Rj2CwA0IoL8ifov1qxg/QPU1qNpiaYuiQ8xrga7HtQpmAxjrR6DIsRZGqr2xsNFiNw/ZDFJTgKbQzOIxj8LkSVFmIUGu0eYbBlsWZoWYZAoUUQRisUewi9sb8+nmXW36hDWfMOOh8Z40oNZsBgYz5GTYhDz0enOxf2vOJtTZB7UK1h4Yfa2qml0tq/ARRTltb3SyVYx1ClG1oNd/NRFiNB//jVX9v03EhSsHfTR48ioXA64c0cjv306N/JIBw7AvjvDI35p4b7zAnybWxVqQ3VXgyS062kzSZx21e9TFD8hVWsPMcc6JvbI93lnGzKdzH0dr2+SeUshLOUvWk5dUwDg6g5/AXiZ0P0ZgUSdxUpzKgg8kQT5VcbS8BZoPR5J14pbWrAFZoO2YoCFQ3lwHX9WSj4Ju/zD8gQrvwLm8mwUvnWSuiRrKvSZNIxDAaRoqwKdphFLIdSv6JB50AC1BJa2ZlElxB14qKe8Wr1Ri3h7gL7yhgstNfV49TulitBC0evZw+drwzoWD3asH794N7z4e//ymXH0W8CyaHVd0yghnPdJIW1y5wp/O6kQPkC6hDCHyWFoSdjw8dxEzhH44DUMwS5H4WLHml+PG31v/eJSn7X7Bao5+Jp2sS3dKCOTzVd7Wsv2hXKY6qjGWEZIriAVubsqwIJbhU0PD6gZg3U/IqxG+o/c/DW/eh1cj3Ok6wvpeAj8amHP09uNeq88ZUngrjaRZJX/+tj/nSqZGGIbDUOmn28dot8+d0T5ufB/+fOnwwelyhQpxgNLCyljALu5hXcMasQmVYupxppMXu9hvS6hPZMB/m2iNaQHfySj3nhw+vcVXOgnRYmt+Lp1XQQD9FxJOmHVflZzPdDX6EmbabektYpUVmIPksW3v8f2NTv9SfrRIgHYwOm4TUkFz0rduBKZF7Eq/oAM8I3c3QzPeFYK5crj8EW4QDA/M8vLc/ZBFr8jaLa0Um2NNHviM6FmKJppCRlNN1bL2cY9JO8tnI3cQmYEqgOFFeda1FyFQg5FuTRzAV5MPNiPZ3SQ7UcYnL483TrLJlHN9zTm8GkbFg2q34KOblVnNqk+og7VZxQaoeUiKFGgBjIAZHCcvD29JPB4YAsfFVtqMBZ2qGFRlFNxXCjyBpZgW+KkwI+HzpMnc/Tac2/fLq/dwOt/6wPtxOlkRYyqgSDP7IjLwjdOFflO3RSCBfmJ6cIr1hPBzvPHN8CRWHYEPYibGpYreTN+tAwuH4GNgLu5DcJzsZ8As9RtwLO0HkPXnBluYYs+cmzGVJORKngBX6o8M9shvmacnz5uzR68ulqtPh6dXeHN20XdXL7aSnl5KANFJdLudWg1iGssFkt/hyITTOaGUdEr/uGzvlUDJx+eH32N2PJhIeA86qdoJJdDpOGRfWbyAKzoxOp+0uQx/z9HTxHsavGpLIU5JDIe7Gm6sjb7e5ZRwwDJwAajhE6C4xK1ECkjKuqwB3e+kLwSYohEWQMLBswjUT2vnR1uYhckCaAPMiaITRyRBvJeFmcGrKJ5vZVLdAQiZFovg7XZLONz+V5PTc3hp8/DkBTs9sfgBPEMsVQB8xLSTiAQfSMGlz0iGIRiuVP+JkqOQY/nhPL9muSIFJaaqLV3gl8uBftDZ4JLN8tDZa7ED5yVCMRJu2ODOsYVA+9nN2HTGyWwggydmI+00eJ8xqL+AOtjs6RIkqlD0tWjfGYVXjvI6JOnQi8M7O8OLJ53FB0Ewb3EZrTPfEIRC29dRsEOO8Bslzvic547cxfjUex581sPpf0w2zOrVUZFypoFcHhWDtXaUtSwbhjiuLBExhDnIZYmYJ+l4v5jTSI5yEVa8+7yv1QQnyWgzPz3t0749/LT2uCrVz5eGVzfKFz+O9nbctcIT5OGVVVHoX7sN2k4OedpEJDuJyEgKP6aflhtiJlfPYr3Hy3c400r2aTu2xv4XWdcnbTuXDv/m6SCh9/sUJqOtxUcVktnXAR/b8MauJG/D1HJvx+VvM7ci61ZEU0hFJEVFEnGRaYTRVkDEmGcv512pKgDwTvnka8cBWcymlWlQQTY8F1idV+aBfHo6D/jr89dUAA1xjwFqNuxZjhCaNfuk1KjpM0rwGj/POXaXdtJZKrQiroYjVD2NQF+rs6G6Wv2NHl+vO0aFndWqAbVWt1pBXr06QU69WlGyRXEp6eWJlDrJ8j5H0lwFEoJmAJHZAWPLDB9D4UIdeGnEnjm/TQw/JbOcawPYECcH2pHTv8B8wEDJXD/D9UTHQvAAsqGYkv+dapBJBuLwEw1G7ByNp5PGdH1fouZ4CwQs/5RjVUQKq3qi0kLOkgHK4TyVUZ5/Pjx9j0qiiAzQgaiFawOeCwYmGz9XY10KnTnUxYiZd/5OcWddSpr+Cp1X51VO8yWtB0dVDK/NElDkSNAzznX5kYDiDjiKwekULPUu1G+4ZlN8psBlCd0V66WE/knVRQiQfZ1fUPEHwvMd2HWw3/9ZQQwOKFi47zCxgcdfvNAjX4N5A7TLdw7AlG87RLmCDD32xBRPMtwgkQoxbrYEQdGtPho+fMHwaRLnCbzzyE7hnANyBgM56DP95ixuEvxhsI2FGQorDJoIVbNRytOQg4UNxjZaW2ssuZrv0HCH9swbs2lCJ+zg7x1trX0wloHLz3v9rGo50MeZ6GFVwqRB3RoYutW0+qW602vN36svjaasBi4x+prSXfxr9Ge4E51O/adqCHP6aRrM/CInCWtOP0cDnH8zLcDpr+0eOeIubRz5G5vY2otn0L+Pk2bcAG1Pb0CJjWzBJTVRsXlX1RxrEjFCG3/YxFqp777zlx3DVQHWCbi6QLsocpTclTXnweYkcbB7XGoq+qrp418eYrFjVzW955h5AewXUguaAvv1xJr130AqbQNa0gPIf5FrbRHwgO+Blib2rpcrVzAT6utnroQeXp0sLfKVmouO5d/jQJatAO8F+RLwVo4UgXdyXBF4K8VtlQRuKXgUNGGFQiIcsbJt8mVTytbKtsmLG1y8VrdNYrZ/6tLW0P5RwpOK6DWqJLbBuFsPo6Vc9n30an+8fB3jo1Tz3V0UMvcvxMwd9z4M0bwLlCATil8FiqAJ5V/FMb5OYF8csIrz1P4c7Ha4LQ2N/CkjiG+Hpx8BW55IOT76gCdvv6D1SpyXSW8m03UhJXaETBWK8AF9vn4cdwOTp7u8c/BxrVy5Mb76xoVy5cIePNNW4uq+EExVCYpQJx/NYIvr7dtHc/tH/60VHWZl2Esx8Y6Ume3FTVNS3FHBS52lm4CxP8tdnUYGWnfuDW8+Hm49GJ7/iT9nwMt9AdsRGmmOvuCfMxLdWaSMXdrQcHV0/QV7su6idhK1kznw/SKuAINbTzspEXgRes95Fzx9gcdwbxXeE1fWS3pytgYn3W+OSQJUarilYtknhVrj3E/AxEUkQx4ZIMe896e41W8NNnlrURPLo+tvys7kyX+fsphO/TjaP1vuvqTMEwTwSa/ww1lIefcZRUjhCcto3G3pLbnR6NVZB7E7XLTUb/I3OHiR9Av6ysFxbcoS8hqhtz4vPzex/jCFmu7cH91dK3fejXfwgXeTpAWeKV8l1g6zoS13ooTMqb65TK6DvXWeVjl4CS3LS1YX0aZhVwqpM1ChutLVpOuOon+wZLspvPtheGfv8OR9LmVNS5B4JcZqfFHrIpsDQNtOVEiGDkMyyZ02pu6mU8QcvP2hfP5ChRUz2VErJU7n8EPGZhq8726w5QmdRHa2p02n8q7/zMqOitVFFJ50qUCcUuUYaSKVZ6QZUy7thR45IXDMmqKkl3VZ2eDZ7pkXnWSG3x9PKdmqQK9PtCqWYkPE4xj7+rjlteXyu7PAnOvjFs0sm6N3qupOF2ICGZaqcvw6TeUuZJXG3UUhl1o5uKNPcQXlxzvHIu7U0F2IHtfLMEqzy+91/xeqo/fNeP0Juw4LmJI1Bx+1LDvOtzBxhQsLpAtu8QceYYGaqiMth/xRmDhztJPvqJVTfnNxvPVE5WA2NJYzCCV1UjT31J8FXB8qOMUk7gEjNARLKe9uHL/ZKd8iv0XghfEreCJSFA/1R0JdpeSz9LVO8GsnVfYavnLWqXodbvSCcWApW7DYnJgr2+tg/uCe7Bi/LvG++sdoIzmp92cfhldQFS2Cg4rdsfRSrWsZsIvDn6zVpCjzyzlR+Ze3x6/XROuHDGXzvC4DNqcu/9klP1fgkRb7tE4+xdXs5bVE4umqdFBx5KPMenh+dfjjMqcG6zqicPBVuXHtvX8cDauEeJCU9BuOQuypBLwbcrl61TR5hHPlaq1nhlU5qoyDA7Xs8SnjosWsSjm8+2D8+p6s6wsrXhZ3WzhJU+qTwKI2dQ9bn7SUruUTfA18e9EkxaoCLKXpYs7y8vbPc8xZFAGoRzcyzNihQJeLWUnca8550FwvdbLY/LUr5fsXk8Xm8frZRMbdL3ANwUnQ3yKCxiwNKTHqK8VAcFJ8d368fmG8fpawLDKM+GKdES4q2qyPh9ooqMwBOo32xyJGdVctDbbML8Oj8+n2DObKzymr4Z1nw/u7Gk3tZVk+bf847trHGYIpWNwxx4BFBxO9q2S9lsBXsZ6Q+ibWKfFegf/LewXqDwR+gIGz5k+PyBWLWxRef9GvTz1OKc/t8X1Z1Otw6RdRqYOkBkKaPy0IVQRagZ/Fn+y1v4X2HNDzGMxDL4vlFMUZzOUQkIM+HWm76JBOub8nXUE8sHE4xMMPUYSKCkAJMh4IgIax/wG4CACFQglr3MXs8oO00QNrU501tVbUmT36b2uayVN7Fxih4EdojdQUVexQYDZ+SylawzOhuKfoa9XSoX7+zws36lj1WY0iU/Wlikuqt7J+mdQzql2cXpmMaRGf/yv6M1JhE6GsiaMawaq7TgJXE4c0XvVfpsWr+G6OHKFBHvkvlXKY9DoK7e+S0oRz04dUKe8Ie70BWjSwy3iRf6Pwi8r3UbfFBfdiiehplqlW4sCaCFbCcOvh6I4zy8g26csclx1s6I83zQ429xsTL6gnHFuRvSej/dfBHjY+0aXz0i9MRHQFHpSS9DuWHda5VobDG88ltYjPPiFQQdYSkzynkA8Vm+jP6rIUvISJI1jQe97ulNzs6Gay8u1beA4Y4L1I3ThaWE1D6p/R5RKZnklwAYwCRMxUaRRnUUGONWqEjtQIYe7j099wpRDHGtez8hnf5DotBq+6Wgs/+E2h3t22tCEARHF725jtrOtXrV2pe4SYyVEK09QSse8Jl2W3te8PT14fXd/Q2vfC2te9J5iNSVCduCFFeCsEmnno6PLcOP8LeLW+gDydON9wFeSLZJZ3CgUs4YXXkJWx1Ahem1X+5Ye1w1svOSue2cNDISY1pSl7svyolSkbSuTnwXVWdmm7xzJXhQ8Li2Hl+jsHe9+Obr+t3e4Yt7q+UA8gnlbXl81zouKjQv69Q6Bk2d3ZSfnDu1+Xjygn28mNRKSfWaCsuHml/VGBrxawSoMFPjP0YvTyGlLA0bswzFZdGD499GCoIRLZq9Zsx3VFIoMlv/9PsXaiPIxNxN/ApBPTbnAvJxJKIMx+HizFfx56YZ4ddX0t3GT7KulUaqA6io9OT0wtilFPq4DaSDrqnWJpsUBKDyuTBWI+XcPdBCRHOxoMrz4ef/yRexl4lnAcC8w79UoOOLyhwSa82684/sDhXqYrkXKz6PngtGWLIx0qHba5zxXVnywfnrtSfjg/vHHu4O2lg7cXuclrr4fVEL4yjZFVXofQg/zqsLtFXluVPYYqaHPU2y3lXt7BBUK9OlWfiNs6gmDMu2v4stQhkTPjBhs90bdf744u7OpnQa0f5ez5RrX1yASzLx3zguwsY3k6y0J5toNK3KSNFJU6tEymkFFtDVqqpN9yZZm4Cu3huRWABbYKLe/RqAiSFB4nQX4y2MCAnmRjAqvy2jKnYgqjyOdhFjmgUL83OyZnyKc9oWHEHY99T6dq3fg1Hq8Y7+GLr8c7b9R404ZAZI1FyZPZQFzG8KPyDhSDWMstMITZMgwRjgEI6WTcs6UnSfxKcs07MdlE3JjP1/lZnz08tYGezP5pbg3ejfxV4UQK2E0hkxSREKip82dBiO9go2O13XcSfMKdOVcJyPzKSPthlgxbhecrgFs83NAzJTOI9Cg1p0qa5F26E0i9CQ2tgZt4u7w5Zw9n3fA7erx6CQjI6RJe7yh4E3+e9ShYkM0ViVI4G4F6Vrm+8l9pebXR6/vgNBx+v8mtGfj06Bjw4/tfwE/JsYVfrUYdS7chi1ObmOX17fLMK89yMTlm7GzSLWK1s/KD42GcusftYO4+GN7YNWaWTvTDMnxoYPWswsExTx0cX6GDKwZreY9S1il810hn4SugqCod0UJQ5gBVspE60hTWSwcbM9yrfbSKFaTBYxyfwq2I4PfPY30iKT/ls84b8dGZfjEhkg8t4qHpUnFWN7T9LQstX3w9fEPBBicKW3AhYm92bHejlBvo8g/+GxdqtS83F1jkTtyCS2PXUpcujuIMbzWmP8HEzwQFBD9fnefeprgf8/F7dyIuUxgsnzQ0EJv1uknD+/wdtFhz8m19/Hn4xHf1dCe6NrmDtRnLy5PqGJK7J4iL2IKXV95DSy+ng+VCf7k+IGfc0xrfVN1G7y2G7l3g2RmfTt0568v5tXZ2m+o9KFXBxmVy0QXvGdW5SeojeRdGd9w6d6LOtVCHwroSQWXGnu/Z+xuYvQLULT6Xm1AgXYufFW0qYq4i2AC6fuHqEAIbzFgPFhUlBhAxQGcGmrk+OyHeszDPwrtJBPQFTKRIaAIDhajEAxLXJkjBjcIaC2cEEdQKnzL9LKAILHDFHFOrt+tcR+4XMfKBfbdG1/yJX4vsSd97Uu6esSZRliLZUk3YKLVL/qDMLjEZtcZDDYaaCr/oY7TxhHpGzWxi//zJoGam0D8rm9AOqDKu6mFVwu6g3RtN467RcaravFKr2ZnLR/4J/VfwamYmOj3XneB36NZf7Xbp1hzVwOBfT92pK2M9ckQui4/8td2t20jnBq9aGUbd027itxtMHAj3HFAVQ+kogrlsO2fH24/8VoPFuUwvddkDnhLlMcww1001PJC6I6GY6NenrCQWrcDR5i+j+1iAwcqLFpGF++bhG5vlFn9NW7ejciTudfpzkj2s5TuwB5L4eZjP7KohcCmPcusJ6Jjxycvle1eXCVljv6Bi0XYqNILMbQdUvedakcGtW7F690amufmsSHEVn3cK6nZ/Kvset5I+12mY1xq5h+8/Dr/fozIDGdYNyZpFKsUG5lJsn4lTo5nMcDeLvtBgVvSbKRN5E7v0swCogkXKyVM6sw6cccPDyeVy5RFl9CBz9D+wWq/khKQL1L+06VLnmdKSUvKoCbDHjdsD/cztq3jWNqstuxcAGyFA/Oa9LLtgTRTul9qJE22g2Z91O4QqvP0x2i00TS63n1OYSCOYswMYPltjyDi8/VpSImJ810k3SZrhwjlM2q9sZN79xtgCbhxqCFy7s1Fu3QqC83wm113hXkYBQ0OsZYqwuqXtjRz70Yt9LhekEiJflRotQ84vimoBbrItyfVNKZXV9R5uRWhiubE2a+uDd0/KD29GH67ytJ3vYeQfrw/Z2+L0nr8tTO/YyjdC9o/aZiLz8drl8Zufae2Srg2L0g/WyaZE0jKzoJeL67OTVKxP1aOsNrQen56SQ7B/b/RqHwxIufJW1isXCxKBhsoW8xFBpqCPCPElWjY4F8AXf4AJtPXQ1wmSQZkKEpgZhB9OnkVZ2h1skW8uFhhjDam4624HIJlMWjfFhEWCmd+DzSx33g0v06aKlvPvYZJia+nQA7AiDFFl/D6z7ESIF0B5o3nWihfCx11LpKe/2qOWCpG8ZngBB++vlSffHey/Me+g35INB66bKbGj58/bazHA42jKj3ucShVuYll+PDW8/5bmDw0nNxgS1DIqgJ96KSMvQ9t0NHqj/FRgjp6I3Mcgtde/uVWuX+ePgYqZ97AOO5aqoA/CLRHHM1hRMuv4bwruipIMlYAfAW0psi0nPrzBqvKu34R8ZMe0VxbjVUzxbmohhtmUl+78MdMx2h+mKjqIoI46w8xrqoc/XR4+PFlu/8h1m441knmJ4iV5VSjmeuGCd0VajhnR+WzM70VYcw9pwo60xwD5lzu7AB8drKasOcGd9BJoETKiLhBU2Ip+tXxdGml2TZtOdoDjwd4lauEUzff8AqRchs2UC3LAlRGqICbRK6VK79LPb+8rnvijO/eGL74ud/bJlALT6FiidZsxjtlKaMMl734HUoP4Zt26LfF2/Xlx/kTE29+dM7WEuTHZDHwrfUbMRJCggQ2iSLDOlYzXMMr5s+WZM35XvYYRBPyFxRoccVqlBgyzDV5RIVDedDb+8M3hyf2wRgNu952TamqZk0LfJrjnomOUmCqVlmhB/VohuE578q4KAe11DJByr1YEqGJALo0/4bqpw390AJt9xUt4LAFHKRf8RzvfvSRAfOPnd1RS0lpa6qMuc1JwHmPNBmHK2KVCcezCUibM05YyIa6RL5sin06eUZs83EdLW0X086k5YHacOAXhd5yQdvA7TugryrP2hKwALQf0+lp3XpDgYyfISYikejuxFB2dYQJ5VhSDvRlRb5RRfnSwR6UbXSeFtY5LtvdCvj1fXrkJFkzlFAX3K/e3w/ykmFuay3o00qSiW9ri5ehdbjRp2GNrmN0Lypvru+Hphn2RsebHHRB5k+LwhRiDAncwUMYBh+24yrxhf+7s8L4ZehM8A6wGQHNXTQDzAkPY8p0VzO852sNCZVYt6wenytvPlXXcptMDxnGPMmbpHc+lTS5FEvcaNVSuIXCd+vJsnlAXCCHEubMHb/e4IJy7lCL0zlTSjgp42wtVOfV00qIZVw/mTl1Y9nBJFlqeLI8fnhndpbS3JlpKQAquacRsVmStlBZuYO5Iy2dDBN+8xfv4jrFPB58e5aLsfABvqrz2kidPC0zWfJcum+9WWAf+qieGfhuyjRCL4i921YD5we79knqMeebOR6uPhVrPueof/6b3PeF2ez8z9DqnOZsVFzN0LrXgn7qBte6funzq6Wk7L+to2V9pId21QaNzd23rsFXcmlp/Rl0Y67lYp0I9CeM8qMOgrkLgIRi3IEDsitM9QpdtrhYs1wFxhd8WFQusZ1Q6gU4VlDo4apCowk+DBRUCKvgLIZgBXgHYUoTlsZWFQ4qCLPZRxOOwjkEmikgMFlHwoZjDWmlv/Y29VCPJhVy9zfW29ovX+Cu8dbMWbcqTC+yiO/FLF/izM/dGsi+9mkDTqxas0byqbkX3haopUElWE6kCClRPTcQSh4G5hnrSv07ELGtP8VHLaRxc3LL2uEYu/2pq5JIe0JEjfvRH/spELmUBP+vEEsDD0it5Muvb0ptDKR2b1yKAuNTOHgF3Xi7PvCnfPD48d3H4ijMRsh5XuwYmEqCiVQeTOZB1YrcW4X0loSrriLfX0VoUcy+3bnIBf8+eslDEhenGzYwbk8ChSGNEcF+8atCBub5GlcqTFIuK2dMSdxZ4+7R3pcFjyFwdhZOnypWvYQzj0z+IlqQrsF9Cp5dls7Vj4GTGtBlPFZ/DwcEL7aFN4rhBOK5G0b55kllevD98QwBa5EXNpqw9A3+4y26sz5fLwhAZxkNBSynKVNgUBzKGu7Oa31C+/+7w+9O6elREXwGHRAuFqZg8dfVlvQxPE664rHZMS88S5+GlZ1yA1vHFlATf1oJKXHeoIS1oyiSXmlKDFwlvDZtJhURWnAucfrrN5dTQjJ8uz36PbfcSrGuBdVTyEy5YgluMuFIPFb3gYIkQySMTKqZBFcKack+pOwf1MNteAwlYNWH1sheSJ66ePNj5YrDWwk61fcxz76UthxkmqKRmaPGNl8xcD2FQOTC7yzNvuYdwotdg5IdwGC+VK1myfWXw5oCPQLiDVFEKP90liQ7IdzX++Hy0/250eZu/K/fw/HC1DbxwpiYm2nx+gmjejd6mf0F0g1yZKu1h3+fF3IoRNoJte3msHQqF2Oo3wGnKuR8btSzlx6hC0UY+vQ9CWCDtAOhiGXgRKLVPKVcAd6P0cFmXuz1PkEzqAfb0pYeni1/Y73z/nV6YLKVFMt/rLBZ1+7ot13Bztz2i+7sDabzB20mzG7wrMlmZ5jHYpnw25tQmptEeQUt2epUdN2lTTKoVkBloWln8RfCfA3jFi2oSuC3Hagp3IA2nHndwkgobjAJh6g2v72KhDcKCiy13eUVshmqz1fXWw8fU4FDMR0zC3Brt2+E421eogXjb6L3Hw4cnxw+2hhdPa5itXcAcJh6BJKoWx2UjWQA9QSEp00ir3ODNEGOuccNJCMI4aqbZQuzm9yx8R3MZ+MLg0mK9wl4ncV2j6g5g5ji3/sW/fn3KG7LZPFEXwu3h3TX492D3CdsnaZyaIFyIHUMJs8SiXAH++EN/tAfQvTFHJmXy6o0zz7LV1MrHDFi21G/FbVOG2KPeIgKXQsgtrFzroEkKy6PKFqQxOUfi3crw/jvUlrwti04W0CFdwOG++scBtvpkRb7ZfgOJ8pszQDjtOZico+sbwFonp+Mc8SYD41gJCKA2G9jqp+2crLoDGeU4YEsc+xqHN74f/3xaX6A7P1KM4bRWIC8GJ61FCiiQ5sgIJGawEXnLKPxA7Hhtozx/k1W/CserK4J9HDNqJ7bCvMvvxRxoakbCvt2lYTVuWWlchVOt3cdYdtqr8Is7SG/ERRAcpa144AdocBT34324GQo5EWtQAx35ZubXrQURSThAj9RhIq4JSJqf0y0YGoFY1Ps3dg06WmRm8+rbF2n/ODavIUSpknwPBArccHsuPMWMRq0N5gfaFWsWGq7Us8gIO9IlhX9Hg3XcI9fjnioZfsigUmJfCKVyFCy6FCekVYK1RfdpDbd/Hm+c5O+KPl9Kx6ObFhY1Ehe4XUxFklBhEh5ljUz5NZdG2yfdY3SnziapbKjJepxoEWVtt3/N5V7AbHM0timYPEfpsyliATEpTzDgNfyGUpjzGFv0upwPV3kLkQWu7XsJDlcwVFYpnrfHGZwUD/wZZHCSFw+PoEYFycDnNFjr+EZ6QCtSTySbjzXfXPm5+4Bpn3Zpq90qZgOfXC/PPxpSKhVct9iKO655ntavaMZNjtQp1yLrMa1WFPX02ZXtyCTkyjZn86oEquHic/1AG9GufxQRd2K19yQ77TekCFFFDK08LqmU0f7Zg32axC3scUjt4JdInLkP3i1sbsJwduOOnAguPw9DZwFkPfC+DVfR/XlSUJsx3FGdcLUvuFf2PWXXkqQrzVC1xuBtf9gcbV3Xty37k8TWMGMXocuzHtYu9m6uHOYAR6+R0RuRPCCHW9m+vZrh7DsQUj58Wl75QY2OjN1xkE3BCPW8k8Q3E7hIjr14SMKaPKSCcKPxkJLCOuda11gf0fR6x8GDojrH/rPwFY5J3pda0IjnXx8GUO8/8Pvr3G18PSl2+nK/Ag/e++7WY1e31rqz3o1V59W4rWrMnNdoPUjriqgTwm5VxX0LXDbrFqorGDiBgWIxjpF2jmO9AQJZXQQuT+BoBD9c3QpaURueX+WFtIpvQXDemRN4neaXcSHUeagH8AqnLYhW6ByAZhemC3Dqb6LTChat4M8QdQrU1E9FbJ8DlCGSDKNItcEijRDZ2FAF9YRYxyIcBTYBpKmimQqE0QrGBq1YnFLFJ9ZiV23177LSkoqttT4mzaQaR2MWZQJ541Rjk9RIGCNkqkfQuTU2xl42Vet7vQK/5adXWqquJvR5wop6QmHbiyY0m8SF5zr46f3PqJG2sULBRCJrzXGNCNdfK+HgmoMaC/7LabFgvujEkSNyVXzkL20SK7pOYDixiYntNt6nBlf2qElr4ROoqQrl/1AKH1b376nyG954Prz9ulx5zr2DsKpbt0+tn3vaX6STtjpZ5GVQSnEHe4ThNlJL9qzdqpuuu5CEg7cXR3sfpb0XDZeZSzimEc/yDlu8A9cpackQsQ6a68HELeJcOZwN+TzXxtsfDu8+GH13mbvYU6tEx9dHMPtFn/JG9Qg36UMyXLDkqZ69bD7gwhwsYnj+DXigpEvcIGFq9kPElzU68Yy2hha9NBfgP5yQJu1gzq0/fb6KdSBw8duDQVyM2l4r964pHiQTPoeZkBiTmVFUWBkBfKT4hK1gkovJVlwtT/qnenGc9zAnXW5V5uHN7fH2R7YgJA7Xql0b1S58PQAn9HsG8MO7AAXXYRU3Ug6FW6PYWLTVS1belmeeYZ02LgfX4YwHx9XrWqzVjyy9PJfOTUc82UsSKeKowgT6dO2YigR55fm7w4snR+vcnpquj7RsP5bDTfAmZG9lixr2cVlpOlI9wEmb2Ali8LLP1etPcBCZUBlF8368hF0h9u+M3n8z2l8ZPf6ROsdiJ0FMZusBVxbL7zPlIRQ6BppQnTTJSQUmOpTgjBROSSRSxbs3qPHz1EGN9k+Nt7cqg9LuzzXjohkwl85Yt8DQJj0DzOab8A7KR+uhg4BXW3PhiYEXZclfdKSkWIR1prheRAEQzTtUyEtWq6VGXEQfEq1bEwW9T/qEgnt6dpyKntMaOIcyWcT3G8PT9w7e3XdDZSamIucCpxwJXUtyVskVAZFvIY8TyUnhDvJ+rGgvXeYTTI4m7yOdi9u8lFooEUsIAv6jfVL9wSvS4s+owoC07d0jwPvo9eF3d7CQ4t7e8Ca1CpqLaZmLGEkqvWt1LUQpMMkzUiiWL1VJpfshZ9cxH79ePzy5jCJojIvYw1Bbv9Cycwe7wWBAdL0TU6lnbIZMkTXQslg62PUpxGN8LtYOwLLClFjh1u/6nIHVP44/zIdBC0q/HLy9Vp7ZKLcv8CdBG4uRAfXdxoI/wHnRlAE20gb3cXBx0o4nR0JqN16KO3yUGp6ln66dmDaS8anlcmO5OhJQr/O9upEwKu91U16ToZ2vnJKSz6aORDlDhAtxiwH+Hx8JpZ49LnfO4v8u3qeSgMdoJnUX84bUbVPjYiVZ2yKSaOYyX2vFmLWaMM/cBzWKuJlkbX8LmE2TE57GI536Q3Ncm0rq8s/w1DI3Vt7ZK99+Xb5dhtmlt9dLjuVgPBfRMsNzzGgoEp32Q8jjXDaihfI9fUIgrqe0cXsvV8LxQg92n49fb+GTDWRGi33WPaBr5xvHGllrhgwOVxx3FCYY/c1aPQXjdgx7CZMOxwlyeO1DefdmeXmPSr2x3vZ8qoK8WQ3FiTMjB1zPmxqh3PrGCiXfhjrfVOWC1eofx+0n/PaW0GfPZW28jU1TuZcSRePW4En34dDRqaehb4W2vdDcNNLHUuHx1Xej7Zuco4Z6krefzsvVEVfyTFoRgXe37f4Lw3P2/Utjq8EAkwNj618ZGFv/2kEhlqedHppUrrkTqVNp7pzqKYmeQQnustfA5aB/Xu3AO5Q0d9x0QElSw0v3xt+7LIpUdR6xFTnTx0VNGzIxArNTRpY1uEEdWoP80+36IcFzGZ98VRlSLymacTJfO552sgBos+1KEvX6hCABnGAGeTIDx2LyXMTf5MOuGHza60u83U3zvUUp5PR5lfHR9k1wMw72vqH9xx/F3WMuzX7WwgBs/wsDIfTge4NPGxCdNtkrPByZdgzXQZFRl67hlXF5y/lqJstxr1s8D0bfrW06Mm7YTZGe2jKBVLiDDLbO39HGpfLNYzDWOnnhmjyBKQs8caNHL5vJ8orUYH+g0nyWqVcvXla41kJaRqXaDYIkz+4OVAkZBkxn3EfLpCWmoNLuf/6WY6X29sbnvh5euGRvr53Hkb8nXADsFViWMRq8nslygeBKLPhUikn4W2Fvh/c/K290d948xmlNd+CZmDiJKBq7a8g5+b26g35bF9XwZLg4eLaku7uwnCegxXM/+c1FnLeAvHSPF/ZwwcQeMwh9d+2s6UqEKnvy/ntqbp2Mcm8LoJSmRvBw25mUrHGqnF2W5KirOB3QJ11/Vfvq+bOu956/qnmZhUV/pmo7wJb3j2N2/nSj8vlb+Kf/65VCrcno9YPh6p3AjvBCnz433NSdx6Ke5wC4cksL0kGV44k/rAqIN8pLVSH99gI9ND71fvj9Hn+BqooSZsf8jBynkqYOTbWUW//8wjg1vmTO1U80qh06devGL9WOGpcuZXk0mjLwKRnkQSiqPgClMScTbZKlBB/dMYEe0AHHIizTQBc+HF59bOM6NQGVaiClEjuxARMTKqnESH4rTFEJT5grKjGJSiQiBIhVBz9w7b/g0Rv3uuK/W7fdnuUdZ/VBJ31X67D609RHJS0x4SVa19A5hXVO14SnJQV865y70Jn6shflnSfj0qgnE/gwVdeBtUzH/Kx1TUKnpMYbMRiaGpofZ/8g4gK7Gt6xmNyi8d8HwacjW1kQqqDYCn79fci1Bg+GuyI9/KsAv98N+KZDqwl8Z0HdJJwLAYwFLtPwyiRKMfiEV0QFMNRBBAsM9JQKDpg0/hOG2FrfwO6GJpdK9dQYPTV11sh90YRMNxjT7FnFiE03X5NLN004M15o/kOkLub/qK7e1J+iCzhTOcgaTv1xXcb5i2nLOHJdfOSI936P/IVdyWGPrUWwaiKKy85acHBaAPeZ25UudUspbltevI0736liqQZtE+VpVkpFSJ72AWyaGtaOHrdaWQ6IJWmavosbuci975ovHt5bHz29VO671yeXN1tpf8ZHOeMe1pbjragwC3lRW24ODsX+yGBL1rvv97mk4obkMNK8JL/j4i+jm+eGJ++XJzF7sUC12gb02utnnVyEcrPHIqU6F2YEZoe5kc6brEQCV5rSEogk5uD9HQHoLCOayY4GK9VNqbFCmtP3tQqPNOSQK+agLW1dOzvQpfAWMW/57GPZd4UlHVzGZNNvTxuspb6+Y5MXnXFZXjdpCNEKoI5OsiWMZWA/p50Vv5COY11spYJSYNa1pG8u5RbhdEwbg61GnkjtDTzOxcX88RQOH02Cu+QCQ2ZfGd4lFhri3WVFShxxEanT6s+C29OulR9zfjjXxqgKr5TOsCIjHYnUN9p6yEPgHmhOZlhBg0MG3LDFbtzH3frUgotM/265d532haUIstKuFvKiCQdf7SwHwoPKaDLviOX0KsyBIC7D7MT5MsxGJs34RqZWsIXFfiTEz/TCLg27w5S56ZKXeaIgbhhf/Hr8/NRo/6fhqTNuftAlsqKQhGVyB+tZOwnL5DaYQrCPuHJz3aBa7ul7wB53hp8672vm4lBNwdw8a3OjZNdjjxCj0LjBnmQIN6Nfr8wEdwHWb/jqgd4FPK0TBVYAaBvObapFyH9LWQEeLq2Yu2qEp86UH09xNUK83pcRwF61LUYL8tZzX6/slR7zqtwf99uNQeV0WRdQnzPaczz++JSfSZ6lC/E81ygWdqZW+OCho2FLHiOSPADDVfnxti/LyW26KZKCO9tJ3Wz3G3XHJ3ZGxh/fjG6+dlOedCydxGoJ7jBrBqwAoLTzZFYQWJUhlzf6tHxMqm1yo02WgbUb9t6Uy4+l46YTFS3O9wABzktJSopvznBSuv7FG+DQoaspZT08tT5cXq2Usp7N6OL5blDcRthVfjqtokIyXt3g6jZomkjCwd4jLnDDjG19GwDYncED3ivRyTMwvzEZf6KvGTqTtbA+LlWxTBF05jIIou0zAEMw/xAYuHQuLwPUZtyLQ/5KI2uHCc18L26XE1q8lW+A+/DURdqIEfdAy3r2cbtPpVvioLs2EymzzzfXNs0cpSMZ34nvrnnw7pG0LHF9C5lTRbEJ8Y91pJBz5NUO1aNB9qxt7CitKvPvgVZ8DUhxL4LXfadjFFaiMK0LxSigQstHLyxGcS9K0qZoARgeVzgL0uoBoasACZRLm1UScvjw3uHjbTsV0I2JbWW6Rlp0aYUUkxXRbDY4u5HXd+Dov1I+jz/630lJuTJx9A9viybH7OD9FXT8tp5gXY+Pp6jKTz6H9TaQ3XxjsehWhU/UxBNqWGTAyagUGmAxvtaASrERX+x+1uIGWJkCJKokxR3QjvIxfJXZUderhaYnV0kylaSuc6beNvbT+eYWduL5cIZBGaB7rLAEl/edBo3hXgDfGvmEGxw1UVmhBN97im7SiRneX+ObVClRK4ObLVxti6SL2aaU7U1dYwS+64EW6Fs6lnLxUXISFnnuZFSyXooYjPaeYOfwt+dHN24OX0o16zZM/Qw3fmKRBeA336vK7UdJndhOn1KJFni3iRWFz5dybZyk0Z1LvI+FBSC4S0xb4B4+NlefZU7aAiNR3lwnbodJUuCUfFpe9PlR6AZdCpOjmO9E6Sknz7gGIoymBvENfQJmrj4BX+/LT7H9y7tompx71+NPmI0gH2pZUOC/8JbzksXILErVCHlsN88dnloeXvzGvakYZIsdRrYuWIHZeY3Ij4TDFkz1g7DGjOv+zUl2CZ7JNobFlXsXD96+VjtMd4AbHDppq2FNJkZ4krSgDBwhGcrnOy0xloHJHH//zej0E7WXi70k/Yo2UKjBVLYTJnPyQGAzVSLfDEuyWlKEyT3gIyWgmWRNLalGd8AoRqzZDFVOoniqGszRzTOjGx9Gj38cvfzgHIsWBjGQhWWfNAd7tHPKce+34kIsmANCRs0yCFIdy+BH2U6vNS3+fuDUB468uu+B41512UM3PXCU1Tv2fnHVJw794Io/qm5o4IDWuX6T/l7FxVPHLnTpJp2xqv811aWz3pz3b2odG/VkvAPj/QuKryHqkjArqxXvYahzIZ6FapBWf9KNmIrpK4A+APO/AeSrGF6w9BSsawGuQluLNz3KlCltEKvC1SqMVFA2AeQUvflTQrRmEZoEdvHTuX2CAg0vRq8vmq+9gkdCHFKFHxZ1BHijijQssnCWD2vl4Q5SNnnjnQfltxvWnocG1RrRSdtpzaa1mYG19CbSWy01VWqkKvYpsEgTxsDq/0DzhyrZKGGr4lWve41utKCqPy2181RqC/LTntBvvpRLEf9jRFrw/2Yt+P/U1HKpO8cWc5nCw1dzqTtBY79//oVyLjDOI0dYSR85wndx5M8nS7qAsp1xSTBUxtNoSjw0Xz3G6fvcV3WXHSnCU4CI326Vj66AmaCJTiVBRZsKI1slKwrl+4JZUUU6edEih9KFtH00yTp4f22899QrbjdmxARYSsu8aq5Iis2OWJ0vJNirR7tvFInT6nygpZXeqfcGp/JRP7KIc125Ccfw1s7hrZeAXSU9sUjprpmLrYUEZgCz9NymCTmBGhsgltSqK3oA29aigZsNpI7e/zS66EV6WVHSdtu3+lmepWK2Utew+VWeJdipnIQQVYp13qeKuBIbI1TBSzbD5V8wKnbzDC1CdJICJhndG7OUl9kcbLZDSY7oBTkf9VjkXFVWKlzXvjz7M3qpN26Wl2UjOEugd6iGOMJyVflgk3Mlgl/gf1Ju+9xkiOW7lfHHcza+kvWwlmSetDQVQ/jIhHRTUYjSAaIaPlCJGjlgSW4HFH5RgRiE/kUmCc5Y7IPWOtKg9r4ex5hCQ0/gkPmvV/o8/bjrAWGeW1fHO68Pz62UF3AbWcF7r+iyiMW5wgZNKtgAY5JhcGUDpRYp0zx3QX+fnvZ73F0BRIyvrA6vbnCmNQ61mSAD4iBJCfSRNdxCA+4SAIDUwgqC2ic0OKnIWpJdhiUZccUbz9Smy6bZxiy9WUwQ1nYb5YUdeK/jKztUrZ8bI2OKEOscP3Eymoy0jtTOetUhOCLlHjtEcmWnXD3lVIrcz7G45zEYSMN9+c6vn4ulLYlUCJjVTfuSneKOY1jY+TWfr+YUHMIX+e3Wwbv7w3vXAL1xS9m8W0gnOO1o14m5L8ZM5IfAdccd3UtnVJhLqsOvFMUngEcixiuXR/tntTLBLK9wMhP51pJOnxLw+S/e78dzn6oDj248Lc9ckXbqcILrWeL2vcDFNhrHPKaF4ixj/paUvUbhjBDXoaWrzcVAqfX0Q6oc4IoR7ONRPeJdrCxOaPjw5uvhzV/AigyXH1BL3bRHuf06ocFqZL0okEf4yDZ0NAcca5c3P1jjjQrInxI8LlOJARYQ4aZ2yS5nL083VKv+LxLv70UT1kFtQqSOIN4U2QV2ASvWoYgTRZ4NgJtNaoumLqan1XiZqBmWFBvdPDM+vSKRNuYa9XLAGZoFg7eDJTsoIelPuXlI5o6wdgedkAcPcVFN0PD0eTY+zoVtg6MU2TcEhjufM/fAv+vH/5LDTDfPHJ67YngWfdA+EvCJm/252D4S+j3F6Wb/lZ86P29wYocnHxveSa/fiA3nPOP+3/x3y+ncl5QottmrsLw9uvFOWXZSrErl+aFn8zpvTBhemCN5Y8Ly8hPgghFtHi9yPvMgMLdwdZbPN0IBMmbHefqwlbUbN3PHcVvGPgrFgRLOljPRJ5rpsuubkMmzoxUX5Py34+019ULw3EgjUM4DZFRiI16WWA10SX8dh0B8PCtAIAQK9vK0MakTwHnr57yXxtc/mNQMlKRDOb6qGTA/58Ilqxngj7m8rzsMc2bcxogmfkwJQPyZfhFI7fBBOsaNFFUQ9XQrXD4hSytXbnJWoYiKsjnTWi3lEGqi62fkXitR3Hifks2PMAzmblyCh+lfEXv20aKN4TJHOMJ1NcOfJv5I9bt3T/jA4+pZsPs4eAnYBkg/a8btPJ2lsDs1fXrVmYu5ovPUI1jFb4nqOVE9hIujtW1CvO50hEd8Lmdt4lvqVpks1VKlXA4J+PT0OIbbqcLJjS2QM7xzb3hzk7eFs4BosZXHiS4n6tKP+1G73MOtS2mZRxuWyCoPQ88+ReeVWWewp4Rahoz9uJe2X0FaXy7fUgsOWUDqZG1dtkXL/qd2MuOLgoC/s8C78Hu4oY93RWbYtXO+UnTNRBu17BqHGrXsGuvT5MSksLiNaZHcksNKMnRVIqEg1iIqSM4PRXGAFHfH4Qp3QTknsyCDuhRgsJT2zrljqTsEH19DYtiBxEenR7cvqsSixxewdz8fCMyMBE0FsEFZ4wXz0rTzgiUqy1kBXyig4t3uL7jb6mRPuNe22I/gkSnoRDFJgEb89c5KfcFZVBfRWiutZeycwFqHUF1ALk484Y/Jxxc6P+rxqK9jgGcjiCa7X9Y7cU5J1Q+xqL0eqitCt9hc0pEZj38ZjU9DyVVwbEyS2iFjgSyMCyCbxT+KejwI/E9fJzhJFHefovruvxYLKQqaBEAG9Zg1BUIiikHq4UeIOgKbo7bGYoHAHhvrG1hbNbHeuFpr5w3dVHnWRlYt2FTboibFGhMJazu1P1Xfq4r3yj1UtFa5hppI9Y++zEBzOiU2/SKn+yaiq8zsf0Z/JsHPidBqzQk+rlp/tQuq1hzViOp//YtpEVW5PY2pwpkaS5Ve8L00pwUh3wm+0UjzWY2DN2gDZrUXfHnx9vDak+E3m1PbwSMP6ZoIAqIsytOlftN/13gC5R2mDSE7WZg1VmiVHhZTPv+mPOdyLenShC/TWGXRobbRUStZGGx1ZB+DIaYdLSL1ebVPXjVmepMDv/tq+Pw1NrfcOUubSBeSFu6NxKtNEk3c6nezbqTSVEO1ZogcmQPCPKJ9Ma6BGgkoVx5ytrYIiCQ7EFgH6wuECJrcXcUtMzBtsOWbiR6VlYrD76/wSkWXKhLAJ1w4iyV1AIUtvenU18sWGq3SP6Osv6uXhs+vc1UuHgiczp9lq9/OB69mKYbU6jdagzXSKY6cBGS/SUBi0Lz6z1sFyncr5ZlnPjWyQQ3bkZFULAP92B5sUTMk5s46c4ImhVP7vE+Pi6ZiXs3lG25k2SyB7XYy73Bf0mrgzga0rKTmlQLKUUj4aJtSL2x0/Wdu9ZUnJzLMt6Gzfz8vSd7nbj6n3jOvRToaMCtiV6GxKynPuLJAG+anHNAFN7TkKZaSb+myG1j0cmt19PJb36AjAllpzxUsQ6bFYA9Tdz1/XkrDoH8zpJIuuHYs4u7rWGkBn8zLbw8f3MQO7B+ombGwj0Cj9WyhCWydDiZWit8a2hLmuwr3wVaD9croIZWtaOCbg3MTbTOb+SuzLieu1pBcDQNmd2eP2TVbSVpht8StlmIpqYwfLygWwC8tClxhJhd3swXFR50Quas59Wi48t349S5MDNQWgC5RWbhrvUZCSkJVlbliUSABiR0i81zj0mbAslyR3VR+MD0512OktBnnWB+D0WiRuc3pqI3oGNXHYHjqjmIZNYB7M7z7kxv6Ht55Ofzhdfn89PjDqnzyeDbrJGSk+VlF5CVLcpbrkC4kx5acsEXcdEA15Yn34a1X5SPdSEMjJA6uVEUni4q4ab4jmPOZS7me+JZQ87UwXVm+qJ9/Gr564D+qZCGWtqR51sHMU2BPdQjtL4xqa1dQuLx8+JxjcSeqrbUaWUtaETH0T1x3ED0gboCkaDBC2miwgdktGJkPf74E+v/w5D2XVQWPGvt94otGPlV5ca8VB3KEgK2Vs0/LOHGA2eHTWzJZ6Jz5uVTimUUBn4TLZsfSdvRpI1GNvKPy9zLnUvwP9tYPvaWlkyLkpn1Ouli+nARIzpcQYrn9lxT/4CWYK+DjcfMk7DubzVhr2ksp8CmgvxdrZqo74hqZc6It7puRutgXb3MBwxZYTXyAeLZ/fhxebXqNg5ieiDiXrMrRACtw5ACrMKM+VQ1nixIp98MKsZWwq4jltFUfvH/BygArWTbSblA4qId9uzouwx0rE3FtWUNNHdmXJaJM/MEWp/lSWaLR/tbw8rJmyUSOA7/wJSqi2QluHIitWMitibunitYwW3O33+3ibYBxo9O/8JY34Rc8CbfabZU5EyxjH/xCbe4iX6zQw7gXIHdO7QktENr5V7QrxVDZvqGZ0z5JZN/gX9ctScwPcI0tfyzDncK8YH+EaR1LczylkjjX1WK+44dfc1EtZBr10la3UOsJfjt2o2NT0ZfkEXOgpWbEHcRaNlzt+/Pqkq/ueBqrfW+5Go/uAjDX4Pe2ZBrF/TnzqFAAN1mOqzS6GbBVBHLlPs6fBXxLj4g5RrjGKToSV7wotJYvxC1BALjkxbQZoYE5pZYNvFluvHOlXD3P2+TQ5yCV6fOnHE7LhDcbaqUlmo2FVTmQKUM3hCzAlaCbYxhiN/qC0CQioG1lM212DZVM6a2GPrg/TxaJ+tG7WbPyZvTsCbalP0OpMnA27n5jDtXxC/WPtTTlGgBQ5qwYVIcW3Ies2k+sBDbi6auAfvXRrwPSyqNbB3SL+CGADjMEmDYlQSDA0cRab0MTBPx9TA3UiftoXUlx7dSdM45c6MEZv817Ueo7ea8pcJWMh1SfvhX4Q9ajqDgSmqLs3BPrkjis/kfzl1QUZvfAYPlQn02qMdVeRm9VMG6Abk1sqcFRIoa1AaC1oLMCN50BdfYK9DLZqypuDTBeLbpTSGfBnCwXMsxSfMXASlBVBd9YaONe9C6HhgUkBcDIwQ2PMu77MBTAlfHrDYEZIQ4w1v+3bH5YUzCoJBgYZrXHaoldCNEZXW8KWYwzfsYmqSEy1kdtjlib0M5Y00JZf6zmVcEb7S534nXvf07lBprWaFer8VTPeQ0XKDarzwIdo5rF6JT6PMXF+X/FjnBgCFHf/BM1Bv/HumTFaScGGYtf4GbSFqedpZG2v/uLL+QuAqw5csRd3MBKxJjO+Hcm5FbASy/wHy68J6XGYyBWaJRVTWXGNigSlnNyNa6YXHg5vIeYOqfFdbnU2ZVOjBsxvRTK7yWaCqHJ4xmjY9tyESrlP3qxLyUFVEBEfEgMrqnMxPPeJyJ806SKinAEW4r5dmx6LOVFrZdd+G65guknKrJR3l0Z3X9d3nk+XN4Z3ldjw9dFIksLtiAmdbQ/hhSQS49OmQfo1vFXgOvuQnhU9pRh+6yYEx+7WU82iOvBDh9khNfmKimflikT/vNqUzZu07e2xRvanu4crv1yeO0DfHCHD++5ciK45DWLEBtFTJVP39QMDDIn12PqQNxyCTuKHGmXpNeJAQ1vbB283QoGhAVY+jnmxfix2R0Jfd6J/1Xs85YcrSAaJi9ze4lfn+Lv0dVz5cqt0U/LXBk7l8TaftvGhpI5rTvS9tGhZE5rjrS1aQVwjajxuRQAJN7Y/Pyer20OAyKbKNESGFgn7eHu+CQF3clFTQOiFDrFJHtKDj5Bm143sZDBBi9UrV+BZ4QbXvfvjpa3KMWJLot6DWIjieR/ytP+HBNwccn+Ctg5LnJ1ROmMMwYFYaXWZiZLwk1+5zUH0mYON+Ty3dEiFpLUMkdFCn+90ufdu3M+9/jFwdt1XGG6/6Z89APe1fV7ZDYzDnc7AXWDiUEzYVk8xliVY63g4BdGQVXAs89XZ2SpywxkePHRwce7gvD8rTq22putBbNiljO0et24qY1agI6rt5iZ5ehsdhTZ8W6j42yCDk9+Pbz7Yfyelq9aoKmTiC+TXELLP57CVTlxUqG/vsARNTtJAzUYrXtkeddvJ9IjME97blMQprygRsaowtostSd4WK5eHa9dGe0uS3XAbjFL/rjj5xvWNXGFLhSlB1AJ4oRs+GPUO1hWuwsueURdkW6ALIBf5cen9FiONVLwFkJ5BXyucwCaKQ2uh4lMbidJAaamcoQPcKfirUXNSadNP4+ujNb3y+1b5fcbhCIcpwi5ZC6ZMV2IRCDva8DfLEZ0LvHjDkke2xHX8ZNlRnjEMKKLZdk2lfLn2L0ha/MSbnrU0xJWO59uz8g8pmDJ5+u0aHnnGczb0f650f5pbtLcjsFZBw8jdUocQ+ugiVgOR0uVctRtUiF++NpzVxGSWI6/vjD++jL1NkGOGLQvnMrsDLaSHgbkqkGHRir0+mgD5SSlgzVMt5Uy3hhzANQ8+v79+PalIOzQYV6iP1UkZT0mbjU2PED9I/w6rfRaqRFLrVes2MK1YAnEZkFOLhdlRJ/fpOeaUzr+nBY3h6vfPK8VHSdzd6mk42QGrxR2NCkKUrOjZny+fkft0MKakm4EZGzuN31RDzsSrOHwaJ23qAUjsQU+in4+2Frw27U1bRsOwLfS+mI+92Cv6RNXOZ9751vZO8H53MSF77ybclyVJeLtMoXT4fvSN91x5DTuwR7FlJkrbvP7eVmH1m/N/v+QJB7kiBfxAjiVnajAGkCbRKapnA5e4I3pucBAWKNunMdVXKoVQOzL7VfDOxcYiPHwWv3Zdh67apxYXgb1TSa7l1PQ9YzE9VBL9y6Dgsh11WrJWUkC6NZ0H373EUwkwHM12vO9Exk8fcfSVVNZiFQKSqwSJhhbljo8MDUL0otJcRN9/97sexiU6Mq3OzBh/z24Csw+AStr8B0gc6tCUv09AG+cscXICXd4YZG0Li5q1IM5rgn/6emMIrnyyovhx28NjGtiQ5EObiwxHYRa2UJCWjbNMx+eE7JbldJD2OHoPiXRP5M2R+BSjz9SCw44aZ5jc3S1m/Lkp6konu5UREfluDRA6iRgvTTmrS6asjYeWgCuKfT1VTKBrpWM3eC4laaB1+MPH7B5poHXwidSdO3ZmVQhTGzatBRbxsCz59whZe/yYpX3P/zLP/sC3f3jyb/BSf/yz/+gFbn7DSJRxB6XSv4h+pfonylF8ma5twJXy75suLSI8CcyFQagS5P/YfjNJP38XzWZYKOhzMY73w1/vsTMetgnzjFCg95KGtKZmma9I0mjNK6169YTqEe4qCpeUhif+lFVFZ0eteBqfqzYHQi8B0rV7LcGmw1u3zgDRgXDWI4XZv8SQ2I1XjtJS2IJeW5YpbI2QGtDA9NiAjYSEMQArPdvvP3Q67bOtneza93bWm9W6/QZd7Xecw69U+uVWp9RXUXjJLoYlzho/q8vuWo1blHVFfqy9zPp9FTcHfeQnF/zm16HdzkC6F+P9RXh06dhMb1H2DXYWvG0Q9IGQytwNpBWkaxi2BC8kq7zf0+ARAsPfwsUTgOC9Wirgq+qsMrgKQdSLKJRHKMHpWOxhRKTCEJxg0EMIVKw0OD32miei94s1hk/NXne2FUsXGDXrL1RK2PtiyT1ctIK/2uiMU6TqwYH7co6ViZTIT3fscY0/4XOLnwilCpw5u3w/tvRqxvw7/D5+vg01n1y2tZrQaMPjUJ1qpQ16JRN71SBIP3HKdvd/dHqRvfgunCLuz+kAeK//Yvf2NzO18wc+VubiVltNJvPgDps1LWg1SOdz9dpRzIVftMutOW5s8P7a3VdaHvuUrPrtQvefWKZgndVJQHwkIwhI5GCSefG2x9YniwC8LWhJCqNjFXZI+znONhs86aWCZrvDB1UaZfW0K4+ezMp+tGUbtSeV6UTdXDsd3Wgrms+TVVDsVFb0oniBVFjCBxAeJ7gnWOQRXc+a1UztAJcpwQ3Pi9jTOLOSbqVnC+azbTXeiOdHWyhW+A2a6Gcttslp8dYbFUULd5ySzYWhXmA1IyNJERUDBivlwSGdoLwlbxqdztCajlMNCEDMztQFzZVCJac2P5BhRAHkwg+WGtTl3dh7atjV6jKWNagtVkfMMc2sVQEXphza2i4dr7n+s00QS9gaMDDdUMKcTolp3D7A21JunoWp/LyuRCuC4Mpr0YO0g35Q01PVyH2zbAcfTNGTPX9ZL0kx7wq0JboYvWPY4g1k9oLDT6mByiKxSvmG/3jkVY89K8On+ba9nDrIb82AjXMJFlQA9uM8xzcm4V4UiTgMnAm8fu2AzJyd6kRWaMqdLyzc3j9exWKgYsTRiQma68BAlyI8qxHyZZJayZ2BE6/pEVHNDSM6D7dPiarj2BxVm6VKztUGaZHUWG5mC1VC+t/cPVQlUMZH0rW83VJWdpjSw2xl8dkWw3IOf/L8Oq6HaDwcY+ukbbQOcpAEQ5ed5JZeWqG+oqp5GV8us271bB+nWvyeXju4nj94fjF2ujqc65ekcYtzsbEogedRAuD8KKXFRXQRJBlb5fCWIKug3nuwVIYKTxMxyPbn0fYN3YGC/I1pciiOSaxjHymL8dZpqjzZ1yh1S0KPcfKmCfXR/dfMybnHTy47jQ/1wcvo3csTnJXC2u9A9MRXlWHV/CpOngcyS/h6iJoslma+JaP1jn2a3nCnDoqKqOQyC9nAMNU4c5kHPqVBZa5TLYdbVErskZE8WAsz4P47vD22cNz5ygYrBU0khYWjqCYjwNbSa+ohpqd2ZgSanZeqIaa2QvlbsSy8lRIW03fR07vwTXVkK0JWIdL76L/6xVag9EeG3ATw+u/BI3k5CYqfVDzioDcctbOFk6E9rdg/q7FhfCWwBLcw+BVN513Hrk2IlaqGiF6Lrzz0uruw58uDx+eVN2N6234sDmmnHUX57XHMbPENaxJQZgqzW8Eqy92Ksrbi1b1zWI1eI2C/BsJyhjjrhdaGKP6YWEJ44iSwPWgLWdM+0zR/dJyxuXOvfH617accSJXmj2NvTjiutvKNHHF23qxJXsBFjqSiDroaCWBUnjVkzqPWn2fgB9rhcwedHSPIWlu8yzfkjVJgpHbj+Chlts/BkhyUblNgj0zjnrE54fiVK6KDaCfilb058WGCNDtHGUBCT1Vu4e0SqeEK26PyUaRU/zL85sHb6+BReREfz7dVV+yPascS1F2GR93uk9ZuiWElKu2MWNeOjh4d89vYIVLcUvgnG7Utvrcx6NrdLhqbd6mrfpa8kcdG8SRHZ83JYyiDLsXBybBVeRgS3DjeWADTkgTnbCdEq07YP2/lmvMHr5xWYSwZ3z+tk8VBjepF5DB+j/eGZ5f9Y3PQGs0O+lsBe3buaYttWqmGai0RYlj7LadQbfiRre3D9e8awHnI7MJ3wJxtyt3mi6AVe0kYmkbONURqNuGErxaQA9TQC3OrBffwQNlQOs+JMygw6LCHpYHnoTCZUusAcwWwSJ7RbCClyfAK94G9zzMKu/FHmvVvjRasrRKAl7ZaP+aaoiCT488owmh3Dd5Qp4he23ASleiHiyECsjflmco1+JeCFNBrOIOmF5e9uAXGn2ZZ8qzQ5+pdvWqPtXA01Bvupbq/VzrF5Kbq3LEzbVS6kLGJhhQH3/QuIPk+Vjv3/v8EyPTAelQ+NkGznXFA1W/03mc1pf1Lqz1KNWP9B6kg+zeh6vz29Teh46axGgXXAGHmeyLo6zxdYwTUXE81Nuwp3Bin/EqpkB8RfYBprc4ehqAVtRcwcuy+8UsvgU/LBr2ONiCX9f6u9rvW/GhIMMQpwXwbNobqYA8g25qgY4CHHol9YAmRDATsMGChQAmVEx2AAmspVbrbI1yxYhO2M9phrhihcVeTRgpq3JU0xgdY+wPlweoqH7V+Krrq7o2VLFWs6o6DRRpVZWFKsztamWFpaqqVkeF8V0qwtz4tynxXX+0Gt8Nrgvju/6Qxnf/5rfiu3xNceRvTHyXng82WKccmrQFfnWsNf2EDvNZD+BCGq0a0j+S4PAjZnnD/zjUDacvtuJOHAkLjULkXMfQsZYoxCTVtvo2YqTDtxPjBsg9vvmbblJ/Ot5RDpOQd89S71asLZ11I8p+S1sNLbykZ3V4geHz1T6tUGAFz2OYYUHrU9zU5sqD8ftnw/Nvyu0H5Z2N4fs7skTKPCIUrns/hBZmpVqqz0s1giUz9fINEGQyU90oDfhs9XFdNqzMgwq00Yqn1ethYAa3dMKX6wFY9uiGKdczj0nvvX7mwyy9tEP1jqxc18pCDolcxX4oArsUuirwLKW8vMdV4J0MzOvExS0FLtiqndbQ5wabvVjzxzw5UepgY/CODBMv0HVx/yXe7Oi7x8Pzt0YXLpfXKH4jl0SEpOPcbfLMCgTQxFq2dsIj9gTlKM3/Nqg6ADE92Ns7ePsTe/TEMXJX637hZIE2DIcJNpjYSwdMc4CaBJslKS+GtusrTq4pH/xYXt8+vH7SZ9bgjC6sPPx4nUcrkqyTSyn7mFfVq7K/da+8/UDZt2MMUSjzDNsKNLK8F8sqRp41qAYVfLadNDiQ9BuxVNEBiPyVawcD3xEleC9Jw40rK+V3Z8uLm+Off6TnjommGWW0qepeIFhuRTgHkzF55UhVkGuT+Ip3ijlp2C/q9b60JM26tKlOVg2zhVb8J1DzrZnBXpcTk8CrmvnflV3dcxNHEv9XVHm4t3u4SvKS1/uoe7mrq7q8XlFraS0vSFqxK0FMKlU2HNhwAczhQAIkYD7t8OnYIbb48INI+R+RZPm/uOnP6dmVIPcC1sxu9+zuTPeve3q60wqK/jW3Lpr4LrsZnYjvHadZgfDCMcat27f3oX7pnSVnUqFKmGtHfGMnrmeS6hQ5kcgLGGmTlXyWPok+pU8iz5JWo7BojGLEYbUVTzVDKQhzDfPO0QksMmlGtx+MX5wxJs28wyacfUelKB7E9Ppd27lMULUVC9JJKWsFyVXKS+bIkzDFRM9AvOLeQtrJu1VTzBA2AjC1cqCfSKDHUuB9mpKijH1cB+DdVXJ3UK5f1FmQu+/57qB3/uDxD1ZzOfyUEHWNY5ZxNKI2BHkRwk5rfFnQPIUr7biBbQL8Defxw8XBDk1OYQvnHPSMNr7StOIrkVHGF42khm6uC8OeVfJ9Quom8qTpa4fq4Ge39LU7EJuT/UA2q9T8sN/XCX4nprniHLcLK26n8A/Kx8iM3GofvL6hjMD/GcdNyyN3yJ+q2aNwd1K636shKsTkb0FPlzqgxDru5uBZP6itfmFtdAsPyklt9pjuDF9dxMK4xgUm9KVFFWEl+0R4IlcegsjrQzDtcJamHcpDkNakCC6mxUklP0GDQxAbPjGORJyhgoEFrwcFUcE8kmK43eMVphJyEl9WVX6zF0vpaZUDJEduLLlanVg4k8D4Uo10whTROFVs93KVRez+ihTi237l/h2uPCdQ5uT0XLXVFduDB60OWeRoh+9r5Zyinv7uDLmP7PsZ7pxxxoW+H+IQvJ5cWIH10ZRC88Il48JikldCX1WdygxxZm5iMNzdo8zcuQ6yQ7canWvZeOVuWo2qpUDJ/i4+CWrb8d7NASb8RXUb0MeszwyA7OoL2ieuPg+KdAUSIDIrUCARssLGYxNxV7GriL0gFpGeDYzIecJeB0+vwbOtPChgL4PRRdP6GGRyKWo9m1o3Cg6NObmaSKYfPIqLZzWqvKvmTejew8GOs2BPD15fJ1uaC0TVIe0KE/6gwpc2Ju4/oWhiRx2yvYomFsKBmm8nnbROqdhb9YQtZ9OY9jcxvR98uqO6+XBKHRYOmIMvYe86uy2QRgXuZl0fZ1B3AM//EVU8fsytsr8hHZ50RSvRY30JIE8l6GF8MLb5VtQO4Xj/Dku1uEZ5RrAVM/gAkACLhz4Le7P5TJ+F5O7DjJ/fGO7d8ajc3Tjv2HlEzmQVNMdzLd7AU4YGNadcgIHYUuWbEs/hysWD2w+UJ6Sbi7PoZGS5zsHz8knGQDhF/U3qKQknlX0FoIkCUFEmiyf35ZDMhLXGrEsLjRmHAjdcZ8RF15kwKawzLw5hWXXFqq+WGh0qqYsUxOoARjhCjUAsX3fBicTh4g0Sj4OdXiAbc7c+4xMc7Bm3kkYrtQwwZhhrtb+PK2hG9HjvXwpYDnYuHLy5gsF7SNhwmxhEbJwL/k/xIlQMwEYjGHwJBK69R6Fgw4e2e8FTwMGIb54EroCSoe6N88BIVtvYWMV+Pcjstwap2qHGAjVKSXVRqH5U64i+4SpWgSX1AcPKWlPejlKBauQoRUCqxDRWS8lcMQZKYCiogaCmQRGHB+h7OuYuIO0AY1uM6EEhpR8VK0Wgn8GtAlvRCVIEjwoaPVy0MMjgngCFKPLwQI1dxyKRMhFAv0J1XUErSz3CKQZwGQBi/iygHME3AewI3S4TNb5qeaPfbeF5ULFGjxcUqapPozgDjWn0ZKC4VF2xovrta6Qs7I10D4SsClYjUvkbqNB6j/yyIotKn5eklPiE3QL8Z+V3Kq7LVa4mXOA9w5PvFufwhF71D3861T8MIuHIEdUfRz61DmKowUaZf9iTiXggmcHCe1IXDHP3PXVi8d1j+NhbfMZ+dOHB8OYP45//PboASdFaWRdIQcLDeeOrd5IL4rRIiJCOt02Abyk6iJPLHdy8MFp9SfnlkJZPLgdGJScjjSH7df8p25OlRowK2l/B6FT3CTlb+jcvRl8vje68HryCHN1fxGxSCvLHSkNRSKgBQaN51p2ZSBzEWdsZ/XWlfvBgfXx6Takfq6ayhij2D/WGnkbgeECnWOrShhirKhWZhud+okJMUKYogpxb9ZpkP4e/yEHXwrQvESZqmOGq5bVWSikkHx/FwvQh3cOlK8PbPaWOpb48aQDWHAXqJ4YTyNSkCVwTqYe+Pisp4+kA1/buQe/Hg1eXsbYw1CA5lso6zRvpDCCyjMNMEdtCGzn/pI08s0IzeM+DXo+o66sm+uZdp1k3zePP1QiJwMKI/4QF/7CjEZd6wC7Fc3uURPbwzPpodW+8fVeSWsN1EM4AyROlcAayocLTaaPb6T/tCAuKZXZQdoZO2cNE3CJLZqE3vIn16F1nSE+IQHwrKz4H+9MGxKRqC+ATDbRN9i81Qfoi4eWd8fPFwe6L8TbniugkGVaJmucCn1A5Co7EJTNpsyKUfQ2CalqPW4an2mjaA2uVKsDaUeDu4tVB7z6NgLELnKf3Y2CP80yzf9fOKWhhHN5OdMfkCWUIcgJmc0n2SeCg5FyVN/Fy9+aPGjJQQdEp+KS49YJ5kGDLZXlD6DiVh5fyitcnxUkYPrw07f8X0wlPe/TzC4Wnl6HaxV+LU9oHo1eAceJxy7dFHnoiysH07z/hexhdvDs8e2W4szjefmSpz1cBLnWrmq+g7S2apt+ENT0KdBP0opIop9hSKnlJonx064n7Q+Y9RRwxlSKvPHV6tx5yyUGNRtTshbvhQgJeuaBgCxiA6SnB7qYAAP6QbKR12h0CqdYRzTE+s3C4cIM0B/k94QbVHp5iKZ2MNvrJowz6G238FMSLJpTjND637j6I4xfkmGnM6tQiZeJs9sx/DC5WF6G5hBgCm1W8BQoWxZtq1xxnUwWC6XK/fZ+AzJyJci4pnidEkMIvE+gwbPSTS5Q51vLlj/5db/TtJQy/dOjmpGWSJo3+1izAFxYWUtobjtlmfmpxsynuvTGHmSbsQ1GV75VlyDchj2ZqfTteKbIyp4VM1FuUJchSXiXNZuqRjglcC/yUScXPcIlvd7+aCRQYdxhFsnROaYZ9CPhmlCsQAcbic/fJwD2BFY3lWqhTA6PrHpfYFOlQNVSnhFxhT53dYrPkAmF+mKDl29Hqc+LG728+ald0bEEUvSwl42mLOIi+GpW9cFSOjSHN92eIA9Tzy2FHF3YcSY+TYwWFJeXeixM488++nJq7EtwC0o9HQWmf5NfHJ6lCJyrD18OlheHmf0bLe+QXx4NczXQu2MqNBZRyegy7q1vugiLZbu6dstu7g1evxtv3dHt3nkqzJI1wf7fhHqFa4kbH/bvka6BL3ncFVcqGVEMVGQmmyd8Y7H1Pw2B/gVP9bu7qUORwK704MLc5O4xvqEaaNRlmN5s3Pcme7CY4GDmY6aIT53lUgZslnwJS9Oq+mjbIaYR0vbIHf2TkT8eui7OIZfebZ4dnLxIvLdqSNhrgInUMdX53ZwnQiahAOBo0UZgcgDuBqCweXl0mcIrAjqQCAlx8PQ4f9ZqKeN1PTG1Tgrog5ODt1D3UXfl6eHZToG4j6spZbIb1vH3KA7dyJq1FhOX9Q0wXNvowFTUSCvKHhkPGQiCLkDdyKo6LhlXQJMVhhRqlPAwrD+0YVCp6/gUlI6oMwx7QALOaTGIe0AjDgBRIMsxi6hcWH2BjGThkLC2/O24BqTbiXjlRG+6cZnFH/lQL9xNYTxBLTdL0aMwl8dyHSrjHF4615fLePeYyuAz7IXDmkVtFa4T8HZBtYcW8RsR0igzdfG50fTXxRJvzOKdkeOsnHYOAyeH1Z4drb5UJlDg/UYssj6m+TzSdQ0PawixFV2I726lEH6Jow6rlKjYrW6tsS1q7crp16k1HY9dNNeesEafmmyitiIwqjgmMM/7R3z2mFlTvKllQE40nP5MKxpKaSIFxRGwJC3r0RyiPkR37o9LMWyxkQghil7rpDqk7O8BgdAuXPUiWCFaSqIqDLQKeAn4t7i3B0gImDeGokRwTAKGiQMo2UgZ+tJT+f4DFOs1jpgn4SXGTQUwFXQjFqwB+UbRQ4uwm+TERrRic4rSbU0u8D0h/sDW+S/ijN96+bQGB3NURn3eoc1XRioqVJyR9VNBEKmpZvE4U7BQoSYK3pMrsMi1ojoK+oCnj099as0KtCawRWBabgeyiSbaVVcSb88NFxxknaFk+lSJhXf9fpkfCcu+ESFh/XykSlrvU0/nJb4iEhWEe+cQ6OpNq1t9oskcLUmtHHdID8FgQ81ENmxPIFkFVmzgnxiLtKl1+MdzdcsJ7+A1m53e3wB1QqyBumkT0UG8Ni7AEnKEo4hY5U7hILFVaSWUMdI34W2DbgaNieMcmOWVyaa9RkAzs3DxdobzasBOa5OiupPH8Pma5DNFjDkzJqSv/wwHI45IqYPM0JQmAXHN8AWfYhr/F+C78FAJihxMV9uDSlb4+iJO6uK2Ix8BmU0Nt3jcpxf3VeU4/LzvbRByCAXqrg7c3PQv3nzO02u2uPQlUjTtuSlDQrCT+gQx2SStpdikCKUz9EzI7vPpW2VD2H8MBzG13awQ1xhSwQGOWzoMpOzHuD0Jf3j1u+4Dny1dG53c9qgFnfdxI505qXHUkqJ2Rl+EQYC5P2eEuJUvQK6QKKTLNfJM6ROXmuCsbZqx20AGmS2G0/Mt4++Hw2UtaCp1WNwVE2AHll8VSt6UKYRGeNK64chsiBNmVfILbfIs1AgowvW+9GGI9F6FdQRqy0QnfEp3rdloDCtCenGIzypO+gsVm0YUtm6k0w8YLZ8fbu6OXy36GOb5drXuSUn1kzwNVUy0uNBXIs8NqfxW+k7JwGnv03TOEQjxeZ/g4JR2FMTWArTjxkDZUyeaEoYAHG40eP32vrx+eWXd2D0WB0OUVuLuriRdOwPxQyv53mfBTyLiTK9nxyoODR4uerINKJ2QrBelhpG9ccxqcXA4cw0f2gnbgC3LWMmWwbqC8w2K69IKGz18f3j3n5Nx47Wt8QXgIQAICZWszbaQtSaxqYw0jSdEEncVYQ+SCqJTOfBCT0YUFOWDIA56r8gnrBsBTDsSRVEY5aRBtl6xG9PLu+KNwRynzAjCm2LrR2jKciTu3NX50z7EevF70KY9yCITI2gAz43ArjblTkKBGBXGMIBOXAEGiSgGCnp7GCObg6HBa33HLnYjJZqDUFibvJ1el9qKXCjP5Uy1VqGFog40O1i9ppJFD0uQJpepMtroqlWvSY8WcNJxauU2pVigjF5Ed3n8kgFaI1LOooS78mj0Xa+NZs9Q7CCeF1HGhaQ+CMagOlqUgWYmrQ7eF4uKjGERcM072GCZTRfiJPFOvACQVwjKWHRJpRH/wZm94f4NWELvZwXIwH9w/FzqlWoioUhuzkkgSTN9Hj4YAUp8MonVv9fSx8GwGXN9Oiz5QQIX1FocnhlsJTiQdhZ4v4ilbCYJRKPiFuIH0vn8t3E1o1ZNYKzt1HAqFLB+lMxXO8svq6OD40KmK/m6m9i+fqTj7gKxgPlPh1gdUUuZl3G1BCDvy5W11aBGGqPIy2bfor2H9TiI43MViRkQMvEgt/ly5PIZJna4PMCFremt/NQ+GPby/Obp4W4ctLGbTCiRJZ+ikXgdhYfwbkzkYk5s4jH6+RFY35l4vujWqVJmwCeurySEwVHYbVpC0Urr93cxvsI1ePqQ9tlZSx7MLyazGNSNRSsipW0OUgHyGZjIRcjrxeEUrWBPB4eVr45/BmCV6lfiYhM1TBVksAaFBQtRozg5QnJOP0C+WkqWooWl1ZG0cUQQJisCVHpxaKJ5UyLq1CSwxFad4PZjhwZnl0d6CFOjm++EAbKd0nK7ouzd9USclgLZBhbfC8LfDu98PXr3R8Lc4i+aC43SWkA/YMq3vOUIecuJT5MJJT5FbZpQrM8Maj6EdxKkzbVfB/MFSthAZ5Y2ey/eGSz1r7tD9xdhIbg1jI7XRhEIGLChKXFnInYaFf5wmZ2MQtemfRntCxcl1eXG/CBXnPTrwD4qTbtPsjvItMqZHbtc4mbEtnP9qLiR8fmO8/Uhp51Dg3lL3Nq8e+wqa+MCXJEZLKJVlSpXCITPaxcujb6+Ot3dk984JOrBSInbGxdmJpOEtX5IkbFnAKX2JJXAEQXPMc34oonmwusmFADGIwNGe5hGdQF+xHdsoMFnQOgnsc28HvN8MNiaw2JMtKrbkjUhNkaqx12IxWmuUDDnU9WC6gTkOeWc5mtNYhWq4TTPZQkstNJ3UYDKmUsFI4tDKaQaKNUuMQeJRvQJ+Yx2oTeA72ZtroPgk9K2o2+BtGwXvMa5HtwpsA1RbApoFhGnBpQLLEFXqi/KuUo/nSlDRgMQQHIaYaSJQCvytIfwysGQCHFEg4iECz2fGAxNAgKp+VvpeK1sFbzSxql9VvP7lem07Xc+qogv1m1U6XtGE7hF1i6hDRBITi8w2fwYyW6S1EdJGSJo/rZhUAWlE4zSh4uWfSj6Wd1OcoayapuV9Nd1Fd2h4Z+gPNX3qEP34Qw5R0ZJHPhaPqBL+jDcKoADK551GN5oFYfiVe4r+jzTmf7hr5qFECjgdP/mMN4m+DJ/qq48aKcTd5n+2V39srp6D/MHtHC4dXVsa7Dy1F/4hJIsjg/H7sbk186/wPSpB//7825J3A9+m1XQW9R/x3UC0UXrKada/8pnx9hcw4LgZ/R0d/e7xsnim2cVf9CL/5v48cuSjL/8Ha7N90A==";
\ No newline at end of file
+export const w="eNqcfelz1Faz97+iyof7Ye7z1AOEJPfeb95tDGa1Dbx1i9LMaGZka6SxNGNjv3WrcFjDnkAgCSTgQFgCNgRIwDbLhyHFP+JZ/F+8vZxNGg3JfaviMGrpdB9JR92/7tOnz//8z//83//6JKq6/rjvzvtu5ZN/IMFxwsGq7+Ry9if/+KQyMTK7JxPBP1PF7H6vVFjYks/tC/1SoX98aO/Ip/kc0LaX4ST+7Rzs343/Hjo4me3NQKNd+LcNrgaKV40mRnp3DI+GpcKeHZlZuG5yZmTaPuyNzJaLWcc+PLUt9AtT2aEdAxn4VXLtw4Mjn27JwV9+qmj3O4f7s65jH6odnDx8uHZoEv4OVqPKSP/WoZ6+3oEekP4Z/H26q6936xj8D//gv38fyOwe6+vdv2+wv/fAAFwZDMP9TMO/O7aO7x/LlIcy+/ft7O/rPdCzb+dgdmxXr70zA217+g4M9H4CDygMqjk7rEZu/pN//Pd/fxLkgjC0s1bgudXIgWfUQag/LFpF//2VglV/MG3Vn9U86/1iFk40b7/evHOxcfJc88WNxssXQHG8+WpkObWZADh88n/+8d+f2IKbnXOj+loZrumk1B/U5i3//aP5pICN1cubt56bAqBNrRwXAHeC7zeyfSe0nGqI71kSTVp9tRRZ9cfzeC+Pjlr11QId+fWHc3gvN5+0v1prnHzRuHsBfjSvnQYiNLScnG9HkYucSF7g265nV10rAAFll+XiYzPpLpwQ9E5p8MOz6rfzSIALTJmNMw8bd+83T1zCZ6kFW4I3dcDJW3bZDSv/tMNsgNfBMbxOxy5bggJPcMGqP3SnLCePT/HNzeaPT1s/nIDfhQBuyHEroVON7LJ4Q/Ce68t4rzG+Jr0bf/lMlRR+jNR7JcVCRi6+BNH9oAoM6eHEDop+/bZ71Aro/9TzxvFL7S+vqZ5XXbg0DCr8HridFdpV+tY7CTF+9du1kuZ4dR3frmBnwfV2JfksgvqdKHLCylEn/iz8+nNX0etLcAMfLrpZ80m0375tLz1QT8IPXMEo/iACQxYMGXi/9PGlEHHw+O8X3WpMyu/nGncfKil8cUJC/U79vhO6eavsiOE6G9AnCKOzJAcqk8TDqn34ZgEf0+Wv278/hR/50J4Lqha2dfDClI5LDgmyyflZHh7b6rzZ/cbZB+13l83ukwBLDxM7j59w3oWhYDmRG+awOyYxcgX1/aMpy31/ZQ6EPMAndaUU0Re91rjw28b6m/baIzjkq635KjMgIZ4dwKupWFoYXOjZfhCFQDWJmjN+wiEoqiKOeWK+sba28epXOJS8LcmCH5cLQwY+rKpdIe6uH/CRFbhVF3tafwzP58PFUs6qL9Ozufl0Y+3+5uJ1/ELgEsspwscfOqUkPwueOekegydTFDt8UDh+SIFjl4kxfFKNJ+c3XuErlsytEjblxwJjNufm4fOwbB9/OWXxYFLI9Ye1oxYq76L/4ZsqPJ6lWgnfSmP5XuP8emv91sbr2yhGtKCHAzeObEgaqjjFFz6UwLNn8X05XiodPoRaEe6sBCroNqighNT2/S8bx15vrL9UgiOnBi07xAZ+6ORhwPlF+JzzpMCZENR/c8g4wnsBDfcAXrmL2po+EJSwstReebuxfqd1ER8ft7e4MSsRwUjYnSB+qMxQjCl/CIopKRqDI5i9qL7k5UAD10DNwaDwWCulUOl9kJ2BQQDf/oerRX4baF9OvmpcuotvQ7WAB4PcbS+XFGVYbDdJ0ibbFCLttRDCxjrB3/HrP4PSLTtVP4gJgRNLaSe0KHpiMJAX80oWPLHGmytK1nxoKxZp4uQrictKfTNSjnozLAffTIcUVH31h2AjLTlKOyl6xLrvb8Cwe3+DtJQYrG8vNlaW8L3QWIXGTglNboJ74DkVO8Y9mHUJzVH/AVb4Hy7PWwg44kLO3mi8/rZx+ZWS49lOpWInBSmTRzoX9F/oZGlMaaOHZ/J2VZ6o1Z+DWn+8gPrdw68Q9Vfr6m/t07+2V9baD47FDSAY8XKQB0heSAgMqjU7JkcQtIH98A0CpwVtX898DUIS7D0n0pbPDt1K5LP9gFdVEPxzcbpT4xNLNXzxS/gILyLerS/j/TXXLjd//KV54lZr8XeWVZXNCUqFtSBFIowPHBu+kxQZO6Hk4B2W8BGukSogYc2v3jaerCdE5n2XH1xk1+/7dh5GfCjOkRXIlu2c5TkmEcE7KpksQOoCjIwpoG3++LBx6bvGpa+b746RAfBtMBaOaMP82TBG0N9aYPKLgrAaWLZJIoP4frFKuJYloElcv9Y4+xtLAFtYglamBH5evlsEzEnsopp6WJLqSTIyFgCliPoG7U2thHfEg7v921Lz+PPm+V/gnuQjE0wcYIDyymDmZmF4WKZgvPkpINuRZUpOlQij5f0NNHIwUqZNsWBLN09fbJ37MiE577lzrIPgG7URe6CdzZFLRSQnZM0tiQSr399AsEpeCkLWHCPrxqnvwSlonLlBeArMWDhnOYIHP04pgxCZHfkOQWIphgGZJLtoHN4/ihJyWusvmsd+NOVM+26pGhfkYY+9GrBMwBpNDhRVoxCUIV0thiCN89fYyVL4Q/JIysmW6z/nwFb5blwQjnZJrq+BJQsAI0/FRDV/X9xYu2uIwpEOiiJdFLqV9CQ6KQgxi/6fF/B2DP6N0+uNU88U/+lcACbEMXhXwL2Qsv6ROFKMSAvAW18jlcrc2kvnofPCUmNXKuj3/B/w3/NhMOl4lbKNHoh24LXn/r902Q1fOunS/pUnm/Be404rj/2YR9nFjVTeY9xvNN087d8lHDvl0xkOXcJLifkmhp1Xxp3gg+k3mV5NuiujPBjDd0n4Laa7EvMglONguAwK2b9QH0/6l6S+H+PLSYL2OFanfscwsoLGXTCxBq2kLAyYqlGvBqeBRIz8nOVPxoU4ZqZomLxqrV8ikSYaDGLwrAOZSfEK80kU1onzJCIy0RE2N2GQQj/dYE8MgZjoQ6GOGN7oMPwJcx8z8sqyx2068TCMqfETDfaHyzP49C593bj8hJRBugVNmM40A2aarLilihkQw2oQF9NAKNOQahEMvWkqN6XRzPP0ytS1f9FK6VOl/SJUcv8jTvRZ/2ZVw55P/usTB1y9Yo00wD86TsqYcForMHO5lDOlyPWKiNW2fLr1v0C52xWQPvfJ//2vT+wquL4YXOauHTkCquMIXHVkO0ad/zoOvWOg50CQzw15Tu+hsQz+Asq+cb9YOLx7ZO+hiXJpNhzeU6geHIcrdk9PHZroXQiH4Z/p/kyxMJ7tpza9C7PDeA5/V+BvfFuxcGhiS+mo0zsygxcfmhgu2MPFiS3locLwkDu+zS8e9XoHg9zQQJAfGgCZ/aViwd26e6RvZnpqojo5Pl8dnz8IPHugK9Vdg/1f7B3b2Qf/frof/oXrF7YeHjm6d2dfX3/mwL7B/v17x/rwiuyegZ6th3d7s+HQVD43XDqwb1d/ds+Onn27BrNwzc6jnvPvcDyQEn9GFF4IQv5cMZapDnQEs332SxUEtBd8uxpJlecWjNZ8nGCAjmOt/qwEGr+2wLw2Xh1rXL7YvInQlNlZ1JQ/BACrsxYFWUPyGToI9cdgP4TJXkUB7GO9vtR483Pj0i/tJ6ib8VoAn9DU8OHA/BM3paQMgslKMqH25KQJo1Z2wHhCw6WIhms2iIzj+uMcasobBY75zGEwr4y3TaHUM2vtlTfwFFtfPWzeutx4skpKADF51Y60Dl32CKNInmk0LQeexAI+iQelBSWi+Wy9efUd6yrgTO5/1fWMGwC7FpLGgt/1ZXEQ6zwhrQWz1xuvlrGFa83T9aq7S2U7zGuWJq0b6/pjfm/wrymheex+46v7zTNopEgIPncbWamouxsGRcezxTitL6tD9HstDHDyaH1wrPHkihqw83SZZyefseZmENOYxp8yc1dPWXLvfM4A9qVpgAMHjuDJuBo+1deq8Wd9/FLjxtvYsw4dZR8igDKz9eVZg60mdTLnz4PxUlGiHjA++ImcfdC6eou67rCj5M66/JXY4F1iNFbPPXVSNLSVMa5I4VqwF81v7+h5KGxsMMbBp10wIuEYTHXBTObCAZPMlQOm2QNkCLibFHL3CLrAy5RkMs45Qa8vqy9988Yp/tLRHMN5uACeuvrcBV9QAo7steAZulnZZ2RFfcYn/OQ69JSebZVEY0dZAdHzIzXm1jBWZxDqy0SBAecD4MAwlXzGOCwuXG+eP83Pl0Y+NLfo+YrpN+pH/KXJJ9rlxamnrF4cP2H14sQTJgELASnfcoBAVhwEPh3VH89YH64Sjn96tf1kmdwHFy7B0AxewqA6rD+MRHs4wBBArDlry0gGr5gVfAbtL49vvPqFItdB1Ypq1JZ1QQiG3AqKgVdfokBxB4FwDGpeevnklsJros/3yY+gezFmcP3Fxuo5+jqduaqTBV8T2tsuqxvJy3z3mqZfvhakRgDyFw9TcDSGgRyi8IqKboEhthyfJo10DsW+SaW13qy0V94qlYbvpyoeBuix+nOw5iXLBt5wsAQgh+aYwNAT2VNfgI3OFLjtrCce51kC2dP6KkWpV37A2Prauea3J8WXBnJQhYrhRp9wBOoeXB/fFkYkRgCjRzz52Svt1vzqHD93pd2MVgwmKm7OB281wa8bHRyTCiqIAvqh8zCQWMyLt41LF9r3Fjde0RSjamH5rl1WlkTSUYH8I4VSf1ibIpbCotz/BvjpeVDj2i5dZzZdT2j+ZudZTEfnSU/K3gd53w7tShnD5p5bBnVEH7yg1GYsRQwo2P3hcpaMGPxLTtTx5pOrjWvrze8u8vs1eLmxSCrTRQCQmapw4Cp5JctlMjDIm2ETsW1dfbDxhvAHsVQBQOQIuj4o1JeqNG9F8+b6EJlS9Jxnnq+tb/5wmZ84IrkwKFUI9DMr0Ux2qIOgmCU7iExlByVP1UXSlkFWPL/4ETxN+NDXCqJ7l162Ht9TAwIvmxdPD4wSuOaVWNsUGhnlBekiogokPxv0CzmcbxfBWOMs4d37jdcYIGERllcrhM6cME+EiZ2qeJb8q75cNQbu5s/fmQPXKYPbLZ1GdIZkq8ShYkIRJ/UNM7fGu+P8DRM3SzTVkdYwtH0y6jXhBsSpOUkGp6AoshhYAZE5+ulEa/0KKKDGpe+FR0gNOAiKTFgQh8cBEzsY4CJkoS4AiWIG2Q75tB8/zQGo1aOMjHI8o0zpL4/pa3/3FKS37j+lieVjrcePpctNN8G8/1mNQuGxoAZe4rk8GWiDzypGgLFYsUS8TcwO4lu+soiGl2YGMXoJzi3NbdFEYoKzA74wqHabjajgjnPqkopviq27IaH50+XGmVNKAlw/D56WbUhJi2hqjy7uy7H3ppw27a5JL+1jbpT4cpVj0+nOKG9AOS/iIUjnotOjMJsYnokB7VMAvQLxBnxnjK2hdQpc56yP35Y4O8jE5gRlJaTlCRkNjBUkTqBVDSYFhmT4qLCjgRoVWjRRnMJuErWxfWaY1R2fKVimwVIablJIxoAxCs4JhJGEFAqzoMDvnzRurmkIoVLFtAHvBhsUWIjZ7zgD8by7GFVlSuNGtMO6KcNm2jRlyJQJi9sc09yIdmxbsdWTq4ZdEW9Qm4FOa6JMidLwImpPajihjZUGlro3rnNNTWsoOaXQTCWmX6XMWlBKxcxgUHkLIuSbUBlGGJDO7UyLAaozsQCgeb0R/VNkFfr7z20fCf1xj47ANX838OdO9hyozeTtQvbQ/srU+Jap8X3bsoc+3dfj7dsLx9sjvGD/7tGp8X+NZvI9GSBtARUx8Tm0QfoCnJ/F41re/vTo1HhYnBgd6NvVOzw00Dfas3XfztH+vZ8erYwvRJM920DIbBhMlLKHJnoy2Prz2ow92XP44LZS4RD8zk/25PB3Fv49vBC5PUFxvKcy1TMBl37hHNgNDL1to/3TW3eN9A7uHx3oyYz2ZAb6dvYP9Pm9fWP93mjGAba9ewZHdsD/ytCH8vBA30jvHntnZnior79vbOdAGboG1++CO5tID/+p8EfgFAWWiFOMAIjFE/VsKDkI0nr9XePmUwYYkYiBYDuGGdnAKyb5pVNTpeCk3AwdziQEti4fb5zE+QBDpsWchZNI0TkX4LIDv3S8DqyIIhFjAy81fzyu8BLYrMCar/pF18GfkTHLg1DGYKyJXXjzvOhz8vJZRGPlj8YNslpagEiRkhAHv04Yy3YZVLLMv0NgIWmd6Xc4WyCdijyhGp2Gt/oVSN1cBGi1ppPxfINfp1A7X5uyE0KBNi/m8PRbSpHaOPuweelFQmretTtFljFFJ28fde1s2WGHEo+nxCFCd07WhccnIqqrpAsBxCM6vvGmeevy5sN1miukphHopbKYWsrbTjnw4xLgt0gaSxWEnnEZUxlDLeTrNxvr66TaJXsrjzPfQaUiLJNXq9TXciIE5fo1Tq8Ns+VajnxvQQEDV9K5gK9/aDx/KoykA45I1S2Xa3KguXm/VhYQlyd3mMJMY7zA6goYrbi2vj2/8YonZZGnlfdQfxrRE7aDTiXgGAQRRRhCEgVgLXUEURC1Xj6TFkThmTVmYH4vlCeQFBo/2U04ZQHyt8NyN78/yd+OIUx9O5yQIM3b86obAoVSjbwglJOcGBrhEx6c0SekCno2DSO6ihN3lykj4MwfzYv3Gzdvbf58igw1XU9REeIih1q1VgG1ahmCCaQwFZ+5kovjTQog54/T4tEjhCHOOagoDcNgKysba181b37FaFX0G0YfsWXcCrLdYq2AufYgHoB8jjKF0qiIcTB5YBmH+G0ECu3LvzSffr35w1tMkMAEJsehVimspRqKU9PygDV71j9KgtA8pgzOybIip/47ZlWxdyBIOECY5NaXchyKd2LKQIDVO4vwltBhJn0g0aPv2kXbiii66wt/IgK7U64/B/5OTGacniYYR6KcUGeBzd8v8rS6EmEBkwB5GGjTzYGT4dNbALc1J50EHO7mKXkGXtFDTDZ4VqPUsQrqWRwxrQfn2u9ON87cbT89gyK5AX9ybhX5SM2RA78XHp8pnRWIOGHKpq4IITQOQY0TCCY5ze+utF+8kt8aS8HMRJGwAGDSwXA0QAY/WKAXlyD8+QjN922e4Ti/1jzzHXshC1Zosz7y3FkXE7GwISHy2CG1tdz6AxpLZ75rnDpJs/RzFl3IIWq7kni4ipJ4pj6/wvpyBVWLfKY3GqvPG9+cN56pk7OdSkwPL8jsceNIMYrpX2am9C+xMtRvBJ+wV6C0VxELrnnQz5A+q2pOn6OXpM6Rc/P+Boj581FVpEKhsFPP2/fvtH5dbJx6Jt4SN7EkK6mcyrQuQND+oSk5RdKMKeGjBs/9w1X0AZh9+87J5jI6KqqTeacsVwuQ+aCkSJcn6JiwII/x+aNKWHK9DmvSunGrvXg1NSSfw/bCO0fYAP6YKUWRUuVQWMn/kz5XloFxpVM3RJoUMsZACLFQKhyT3fHFgLtBDoOkeUx0ajlb5GXUH2Ie5JUafjFLbpUy01caFy611u41f1ySeUlOCApoHrM1qrGxymyNoaoImmV8pBJbNVKZpTFQgQE44xHFsu1y4FXYtwes4xI14KlZeeL9Iio0QnGU0M+5e279NoWNvroIiKqx8h0m793FUZx3SAFUI0sxF/EcB/xJGq+mWLDKkpyQm5QGn848rSag2QchcOPVD+1FvEvJ0grhQdpGsrdgCM/pPjjjOu1I0RfgVTEdM3E+XPXjd4gZ2Wd/VbcH/mqh4FjzudjNufKQEmRxOprDDgbd4xM5PmPclk/Rd7gxgmQkp/3y98bKT/juVHtHtpXrFhAIKb+IIpmdtPqDnPSTUC9KcNRavgbOEehH4Vjk0CmiBUmg8yVQEOxA0/g1ALKkdGI0Bvdz/PGY7Btnl+jzEeyj0LULBTvOP4DhUPQpzdCK6sucRhc6U0g6qklkveWLuPGGX8E8aIwa2iZ0h4KCfiLQ0Lz7EOcBk0TjkcReMz8T9ZrFMzFFJABq1cX1Wh3YNCjlwEdDOk44GYi0+fxbBUfnbC8FhiYYgQkGDZUCfwNhnIV2QSscE0SGWMkiE5yUlhbLTTjZ/3+efdKtN53fLj6v8nTjPq4OPEkfkENP+ijVnUw4kh1OZMy/S/PqlCsXc+KUDmMPK8WzMr00wztLODJdXBflscR9laR3EvNITM9AuQEm9JfKnvE3q3j1Owa8JeSO4XkT8KaBXAVtTVDbgWUT+NXEkAo6xkGjARcVTNTTYBIhoqdDCFGCQwZaCbilQJaEVyJrWIObVFSjkIyBYbhbGlGkIgmFHwzkYAIGDRNi5lsZbWWuRRDbMM8fN46mTTSsYcI6xUxSzAop02MaHSM7+yEqbq2IaBwYGl/q+m46PqbdeUp+TjW+e0046d2UbVIDygV/3F5pum46TgSfaYzanrMvpgxHkpHo7pepsPRHOYkYdfdrVMD6P7oFrGXb8MiR2D0d+Y+/H74OZ4oHPKdwwD40uH8ODrLwo5wf37JloTIF/23buqUyVZo4UNmd8adzh7fDFdvgNF4VAJloczPF7XNhcapvL5YqGAXyaAT02fz4DuQY+bnDW4EdtqkGEwe2I9FzPvc+LwzOlscHIn/6sAvn3OyhQfidc7P24OTowP6hvtGBalA6sG22nAdZX4wOHPysd89wz3DPSO++4Z7P+jN9PWP9fT27+/v+NZIZ6s1Mwf/7/r0/8+8DmdmhTIW7s2vnUF/P3t5gMNO7b0/Prp07+oD/oXxuNLN9NNM/NtDXm4HfQB8a7tkLjPcMp4e0WVctuJhWWgztspllE6OKhOclWuK4SInmjfPXwPC1365ySJvelNFGuthBlCZFnFHJ4OlSLDIwYqpMyQND07r7VqpNzdZipoYSLoJX4USY8AMmReliSSUPi09Q9j6CUAuXueHcYX1tgZbssrpdv9O8/kfr3vrmD1eb1y+17l9g7M43zfzUDduhZUoXNwtUUzpNV6VISsgw+FvMRbp4kfPPMnp+mNBgh0X23omO84wJupiunOKKDjydduab9spS48zD1j2My4hrLfAeCp4zZ749JUy/NiVHuA2Y7xF7VcRWvSfB1Hw/lKPMYbEYjE8nG7AVn5j74aIG8ps/PmxeXdWglTmYNyCY6u5rguQW6z1zVL0XXTIHF9x9VeR72qUcj107jcjppWLxKS9RwDV5uGjq1Stwg5tncSKbrrZEe2l2CvXlHK6Tl2TCpIJoa6JiG3OCmbUy/rJrHuAbjQPKkYvznOR8miuJmJ5TJ1IrJJhvmxYYqeelSiRIPtobpdxhKVeadZOoggaEbFkeGLpSIreYYS7Ibb5YVxnGqtvxDGMBosPAd8tWUKmFRQWl47QPl3Hp0doMV3/Apa6cU3ul9fZu89unjae4ZLNSC8IiFmegtjJV2q/WH1KiNNL+oSmYVMEk/MgJdMaYw3cO6FMxl2zBWfRLVRUZjWpejpcBm98ELQBKPWN8LfDP8xCBUlY7viurjfMnDScvEGwS4mxM6QzKOggr6Z55QgvgmGF9laJtJKP97sbGu+NiJZLoaZUbqhVomPEi6n6QzhRLF4xTarpFnPIxIcmtP6xYhrX48wJHt1eWG7dA9LXGyeONuz/wjJGPq+3wlTHDxFJKLclcTxmjcio+fmQsKL5y89j95u2XIEwtA1KS4qs32drSiqxAm1l5WH9Wsd4vysT8d48aF8+pbDS5kAsuNJeB0epmpwr+mfKtBBnTqWheIARFVPMM9qwpMBtUiUE9cemCsV4MOFRLRZGzxfFJekqhXYmMLOIYibKZFku5zjTilz82Xq6kxSxxsNtqasZDTxXXN8dFKXK6tPePFshnKSpJ7d9PNF7+Ir4luh6Lkoj1zQtObcYNVTzZrWVdgYbUOSMJ2DgLaL8iksZWC7j6Hh/45skLmDP25Hz7xc8ypCyaWKWqZztxqXAftTJHRVNIki/WQ5CL05l168WT1n1cU8c84RPiVkKvAq8wy8n7njNbX/aZv0FzfeUTfrhco8Iwq9OojCrsHzafvmjceNp+gcs84XLHg1eDX3hFpthQTErw5GybBIUNz2Oua/LiUfv3u/QCiAnmUpLbo1EZQHsu9OOCkxjkHBUsLGFwx61NOULnYGQQRxPdiVLPsems+4uNxUuYLc1qWs5oiXJATs7NMzuzik5csCqj0022UUeHxak6Oop9vJCO+Pjkuscy5sCLaC+dkKBXn+DEzuWZj9znqeby/c77lDN3YpWk5NgBRU1hMTSa2osYImXRcUSqWpmgFL9cz65xxgBNbMHQ9liZx+gYI8yKz7h+m2dRbuQlflnNarWx/BWMz41XKLdik9kFRjOOsFV23hfTrYYEitSCGiuyXYyfSQiCv9Cq/XmBF91KYY2TvzSv/sEqRIizMOAoS04EeRhZlKWt5PJUryQbVFMgjSMRpxPCYCBRnA5nWDB7W0oUAQTHR3xq3iBHEiS5i6D6Q3AAyGgpSY0zj8BQGfcElgOeXjEWZqzxXOh9dzYkB0XEG5kMH4cgU9QbAD/OWCoEuNS8eaFxfk3gfb4Wbwdal1WKQy7wWL8TT15kDSSTIplSTpNcTs2MGzefikXVkq1F7ROeJmBdyoEyPEwk5USCIOCiuTja//m7zesr2lepRZFrgn3pM+TdWcOD4COCprxsTBZ1EGmdL9ZbV29trN0VTAtUv0g7EDhWyjVAvQFDEIdO0Sr+2hTqiFpksY11WJ4no638cB5QcusNBsPUddBIzW+5tGFQmgNoEOF0mqMdLlndyZAmaQZJy4ivp2cZclW9YKxKP6WWe+h0+v/C20/EFNICCgnHOt2jVm503IGOe86mt6y9WOW7aq/VdFe1h2r4jspjVL5izEk0XEPTXVNOmnbPYl6Z6Yh1+kTkV5qOEHiUhguksruFP6L9kL/l5MTcG+URxNyAGPRXiN/E+kmMH0P1KajaxNImio5jXhPoalyrwGwMxuoeKOSYCiOVvTFho4ndNGQzkJoCaAqamXhMozDxpCg7kyBX6+FLBlsmzIpjki5QRCEQE3vEaixoY97dvCub3mHNO8x43Hh3GlDTbMYMZpyTwSbOQ7U3Guu3Jm1Cmn1QVsG0B4a+VqqaXS1T4SOKktre0MmmYkxTiEoLav2XEmVH8zHCqn5/R2w9cVJH1DtbyTh64oyKnn/RNXpOBgxD59jDI1/8/Zj5p1uqB5ztC4Fnj+9fCCZ6MlO7MxNfbKkGFfdorbxncOKLT6vO59uDfMGBYe1uqxacPNJn+dyWqeyhCR8a47+Bu+0oXLsQwvFsbc9g6Nvj43sGD8/AuW0LR4OB/r6h3OSB3UF+3oG/AvCag8MBrAYR+h5cOt03M5Wd2L9vtKeYO7Abfh8C3j25yd1TI5mDQB3tGR7oGxv5z4HMbK08WARm/X17R4aBMf4d3L+vZ2Sod2pHph/rPgBlbMdICa7cM9zfl9sJTeGvf2xkaAdcOZoSG7dnWY1hhb9ZsfoRntS8pGWdGuvz1SkZayG3cglXdnAO9oWV9pNFzLQ7/a61tEKuPIUHFWeRZaclRfDO/PqvgC0ceveGwChNYqc4JQuUiYN8kuJoOhWsBPYk8G1PVd8CWWAZmKDCxbz4FTTQgo4Yr/zQ/IFKiMG1vNoMm3YyV4lBintKWlBMAKcFKQE6LSguhdzcqEbiQV/SlKfjZV0m2T58AGToPJ4ZxzxRwKp4QxEXzvtweYbSE2ni8fKpzcUrzZtfbaxe3Hj9uvnjL+3fXzYuP47xjPK+LJ9nCGedm3M9rsGjL2fVq06Q3qWMNPLuPBGi3Tx9FjPSfjgBXTCmvvGxYvVCyY11U23GCt1yLWKTQIeOH1ToTgmtfbjIy85W3jYWqSK0jQXRRAtigd95gKX9DD4pNKw+AkhoTrwawbf15tfm9dvwagR3akd+kZbAjwbGHL19u+rVOCMPbyXn5JPkD9/UirL4s4UhSwwrv78xTavxbrbWsTBF8/dzmz+faFyikkKg4LHGH7Czq1ihNUWsQ0XlqpxZp8XO18oiLCpkwL95RC6UMCJlNNbubT76jltKCda8Vyq6JSUI3KRZhxO05Vclrme6AkgiJLfqqVvEelEwBsm7XVnj+2ud+KPxzkRNtMJYcuuQClaGvnVDoBvZsogVBguy4u6yNOJlSasLm4vv4AbBSMMob5y+HWdRjYKyp2peh1hdDD4jepZCE3UhI6yhun/ruAasHIQFS55EZqAKoHtWGFTMRghqoafLHSfw1YT1h5ZYfShWirWPnW8/OMbwQlyrq2dia+gVd6rswUdXEKOaVZ+g1pcKCkeh5iEpotQU4CnMGDp2vvmdmLsAhsBx3nPztkDySgyqMpoIURR4Ags2JZRQiVnyZZw8c9fL5G7cbly8hcP5u7e8Xs4PIhtTT4U0Yx1OEAXQ91peLcNBAh1iOrqLldHwc7z2dfMYVgWCDyJr47RONVuTeQeCQ+xjYC7yQ5CczM+AWapvQLI0P4CgVqwv45IO5py3qbgq1yQGaJd+pr5GPl6JnjwXT2g9P9u4/Kh54hIXT4hqsvW851RVUwLTUqJcjejliKktGoh8Ikkmn4YTmEmn1GbE8nsRVHr3dPN7XI0BJhLegxpUZYcSNlU/xLpPexZnv2x01GnxJx4X6WniPdWfl0VJYbEQAe6q+WCp9eUqL0EA3AcNQA3PgeISLjhSQFJQYQ0oj52aIMAQtbCUG3aeRaB+WjrTWsasXxZAC67mIt+2SILw9Gaz9eeWXfICUX0FCIEq5sLLYRewu7WjncOzee7h5rGvzOGJxUngGWIpEeAjTDuJcPCBRFzEkWQYBIMrVbKjZDzk2Hh7hl+zaOGCElOqzZ3ll8uTIqCzAYYVuOvs4Zkd5+lUYSRkt8H1ZQuB9rMSsOm0nUJMBg/MnOvnuA4AqL8Ytf6wqqZrUYWiX0rrQikUNcVztqRDzzZvPmmePSYtPgiCcYtTjn4pJxAKlZdAwRI5wjFKzOoce1/cRfv4G+58UMXhPy0WtKvWVuRyVoZobkX1pbIVeCYbhjiybBgxhDHIZcOYJ+l4PfGVc6a4nDTefVhTdVE7yWgz3z+q0bpa/LTWuL7e7+eaFx80fvuptfZEthU8QR62TIrCWIQsoCDlUFSCiGQnERmJErbu+8WcMJOXT2Hl2vM3ObNP1FGQbA37HwUVvUhAur/4m4eDmKa4TSFFWvo/pSCZ+TrgY2teWxWLBWBoybcj1wswtyioJERT+ElIsiLH4nL5CKNNARZjnrWQV40rAYB3Gve+lByQRcFNDIMEsuGxwOo8MQ7Ep6fGAX99uk0C0BB3G6BmzrxKEuJmzXxSyqipZ+RgGz3OOc7p+m6BCiEJV0MSkp5GTF8rZ0PpauVvVLm9WtEt2JlaNUZN1a2mIK1epSCpXk1RYknsglMNHVGKKAhrHHWUFYIImgFEZgeMLTN8DJEMC2FTi6MY/DYxVOcUOC8JsCEODrQjJ/6A8YBBpWItwLlXyULgAWRD8Td97KqAnOiIxE/UGWHnqD++a1P7mphhwFsgYPnPEOu7UghaExUtzllkHHPoU8lonHnaPHGLShYJGaADUQunBodnDZhs+LkqLqigM4cFGTHzyvwu7qxMgVRHcedVepXdfEnTg6N6rFcKBBQ5avaY84J+IqD4BBzF2OUUWNYu1F+4Zl18ppjLEndXTC8l7p8kXYQYsk/zCxL+QPx6CXYl7Nc/E4hBAgUT7ktMbMDjjzbUyNfAvDG0y3cOwJRvO45yBTLU2BNTislwg0QqKfvQEwiKbvVu885vDJ86cZ6AdxrZKTgngZyBgST06X5zJm4S+MPANibMULDCQBNx1Wwo5W7IwYQNhm00ba1hyZX5jhvuuD3Txqyb0A47+Hd7m2ofDMvAG2lo/azUckwfB0IPKyVMGlTOF6JbTTOFSndqrfl39aWhKZNBXoxUu3QXe6x/w8oHdGlfMtzb/TIV+P0oJxEC7n6NCgZ/3i0YrNtWjhyRTXNHPv/7QeHZcKZ/suZnFyqF3Hx52t22tZD7FP+2FXLelDOZsz+rbAc6hl5xKze4fMzPjs0e3L8PQ6s7vpid6f9iNuyH6xbG+kuDk5/Xstvnp90t0Hb7fNnd4tG/02P9weBoX+/Q1tygMzVZGDw0PjbwKQj7vOb35z5bqACrvvz4WB/827sFBIO4nsH8obG+3rmeg/t2OCOZwwf374A+9Gf+vTezcxT7smsof2h89sDunqE9cNz773syO3ozO3bjlfuGB/6jP9PTl5nYOzIAV+zqD0oO3EM+nBkeyGR3jvYeBh4HgfuBtMTpqp3FmIjt5O0cWEgatYqYC2Zl0hxtNSL3tMA6a4xq228fYqXs19/qZtM468R6FGevaKVTiG+rInIa6g87ifXVGVEnVu+Z0f7jDpa6l3tmVCUzLYB9adqALMLd2my1MieHVFqqt6BOIP95rh9IYA10CE19rV1tXLqAmXZfPpZlQbG1szDPLdV6Edz8w47JMvf/0IL0BiCmHLEFiJQjtwAxpcjlzMDNBS+MPnJBIRGSmFja/CwvipaLpc1nH3DpcrW0GVfkuDItEjEDJdQpEdVcksS4BVfUYoSZN/1oPV9vL17FmDLt+CEbxZnrF2KMHfk+DKLxLlCCGFD8KlAEDSj9Kqa5nYDKdoyVHbrmYX3V503JqOePGHV90zxxF9jyQArx0cd48hIpmg/HcelUs4Gad1REX5Cp6ho+oA9XZ3DFPkUHFp9svFtqXLrWvvhShr9Fwyo8U8+RtawI2isJCtV3Ppr6Mu+2Yj6aGz/pby3ymZXBXmwl4YvS2VU7b2woIang2RfoJqDvj0NZe5bB6c1bzeu/NJd/bp75lT9n8DFqwkGxENhwxAp/ZkVEbJ4ywmnR0cXW1d/Y+5eNyo5VdorgL1tc1QqXh/suETjJYU16ZDx8gUdz7TK8J64W6lTF1SqgK485jgvwMidTEcRaRtQap38FJjKKG+cRANoOq/+0vZpXf8jL//K4OYY6puxfHvy3KUvu+E+t9VON1WeU2YROj1ONdHdmXV4hSlFleMKiN/K21C3J3qjWgY/+DjRaqOX5G6z/5tQi+srB2c+LFIUlQrw1Tm/IY011Cs/dvN36canx5HX7CT7wiuN44M1zK4EQMNve5E6UOHPa3UIMro21+zysQvCsPJOXmL1GHIB7EolaIAmq3LiAdN0U+lQL5l46r39o3lzbPHabNzKgKW5sifEtvaVBFBTBCSg7SkiATpbTyZ0Wj6+6XcRsvPqh8fQ3JSzKBlOmFNst4oeMWynx2tj6sib4jqg+4ealyrv6Oys7KsBpUUhXpppxyp5kpBL1NCOVkSfTquiRk9eCWXmUVHVfzAbxaNfMI9/J8vvjISWWwtDrE1oVy0siSpSMdc3vxpXFxrengDnX/I7yQVCkd6rUnZq8iskwqUqOnttK3IWY2ZJ3EYmmphxcdatwBa2/kM6Y7afQ5bQGzjFiZGuV3+v6H1Qb9Ov2/Xvsbs1iyl8RPmoxVVvyMDGKi3+4s3LCDB5hhJrKFxvO6bMwcIq02nbKlNP4+mx7+Z6Sg9n2WHIkLsl30dzT7lzgLlIRPSbxDmCChmDJ5RXI7ZdPGq+Q3zzwwpgfPBFR6BP1h0N7CorPUtcjwq+dVNkL+MpZp6p2uBgT+oHlucFic+K3WAIL4wfrJtj4dQmPtTZNxR5IvT9+27yAqmgenHrcG1E1VbV6Y+zs+CFrNVFo/llRqPzzK+0XS0LrxxmKAhdq6jTfdcrUnCaVRWtpglTtkkKxSLN5KpF4yko6VPB9ilk3z1xu/rTIqedq7lVw0DsNYL5CbQYNqwiLIcmp5SSF2NO2FrLLjcsXjS1+4VrRWtVoxMo5ScaxE6ns8SnjRE9BSdn88ef2i1siF0Kw4lQCucyaNKV6Elh4Ku1hqyctynHzBXpfD7NRJ8VUBVgeWMbpxctbP8NxeqEIQD3KnmFGGAUHZZxPxAqLMurANaA7N9C4cqHx5rfODTSwfcER/a5FOO8iJahjIYL6LLYjxki5KNiDg+LbM+37X7XvnyIsiwwtbqxGhIwk59NjyGbkWIwBuozWsCNGla0W6svGkcHDf38ji2sxiopV8+bj5u1VFYGuBkHYrcYDVtbAEYIpfrxfmgEWJUzUrpLptcR8FdMTUr6J6ZRor0D/0l6B8gdifoABZ42fGpErLG6i8PRGfz7SOKVxeo3vy0S9Epd+FJVKSGpASOOnCUIVAk3Az+ifZtu/QnsS6GkMpqGXieUUijMwl0RAEvr4YtNdiXQa62tiTygNbCQO0fBDKEKFCkAJMh6IAQ3D/sfARQxQKChhGndhdvlBmtED06ZKa2paUWn26F+vm8lT9i5mhGIHcWukTFHCDsXMxl8pRdPwdCjuLvpaaem4fv7fCzfUsdJnKYpMqS+luERFatYvnXpGaRepVzrjgMRnwPo3UmEd4b+Osyrql9ZOBPs6TqkY32fdYnx8N0eOUCePfPb3Q3uDfTtHMwe2VKcL8N/+wsL4/rkZ3xnfUSoODfbt/QyIhe3je5CGf0fhLzu5b6ziTe3YMl3Yhf86/mBm624s/3t0DgYyUKDl6NyMsyM85O+IKnBltbBrLBNVvB19+Z3DO7YVh3ZsKw2BzMGjwHSwz90JLQZmJ/f1w7/93pSzA/yD8ujIcE/PbHYf0HqKhe0LcPjFYN/2z2azk/8ayAz3jO3JbIVzC7uwcf9sb08GflTzn0FvBjOjfZmR4aDHmyr7wz2lHZmdY5m9oyM9uwb7agOZXUN9hZ6x/rGezNhAtqc3sxtY9IwN9I8MT4x2KfpLAzpSu3659MnKD5CMEa/ZfPEA7FAM2WAj/U3AERUppd2KZ+WnQURNM5mqekNY+cWU0Fy+07opgQ2ydWpCS4g1phjRyBtrTOUxpvvQnqpsh9futdZfxFaZ8oUy4Z6OMP1VlrFRFKfmm+xw9wPFsHntqUho46vnBNgSM9hOGFLQjErq1ApqMhSGcccZ3OahZK5lfuir5Z6NV6/gOeC0wlnao8nDmkGiyiM1F/MhWQenXSnExkwVjSJVSpBkjTrVF5WQmHv7xNdcD0myxlnUMKseOCDi+vOK2iEldkwTDKtlsTkNYLIbKwbwCSo6V0JugIIg3ZmiQFcqEXfD4s06zB1RNo9dbV19oHZEEaz1bijkqGDqnW/nRGn2BIFGHoYKeGyc+aN5c01vK0IXlnJyX5HIKfBavhhLeOEpZMVYVI5fKij+jbdLm98943UrzB4eCjFJKcBbFZPeqv5uThH5eXA1qVVakLXIe4XEyyfifiY3N9a+ad14lbog2fYquhwZYEavoouDSlH2lCD/3S5QivZqoVN+88cvG3dp1YSUawmRemSBuufNn82DhANgQn6x7Q5fGfcDVfMUUoyjdgKZrXIC+fK4D0jb5JHF9wq+3CuPTL44/v/1VhzFw0AVeAxMfJvqNWg5lqDEhJmfB0vRn4dqGAZTcrcjOdiOOn6i0rOk6Ph+x9CiKH+3Os85x1f+PRZQjEmpYv3FmJj3V3C9D8lR+9w0L/7SfvcT73CjWcJ53HZEqlcKYcAbqj+Ed3uUIzgcMGe6IlJGID0fHLZsccQOzxId3uZ9Nu4tbp6+0Hh7pnnt9MarcxuvzvIm6dUq1is5qre11fJ8wl/iyGeHlfzeJHsM9tDyxVfLinvjJk5Lq9au8ip5W2QQjNmeOV18P07kfMz6g6rQt1+utr5aVZ8FbZ0sri7lkhtSdTD72DktyBxlLE+Nsrg8c18tO09LnRLVtplMQbfUStu0v4oni89xre3N05cAFpi1tnkVVUKQSByTEsQhgw0MiYocYGDVuLLICcCCkaWzf6MQcLyunmCTO6mT7dAw4prkmqbTngT4Nc4kjHfzty/bT14q401LdpE1blXhFGLiAoYfiXegMIhpuQUMYbYMQwTHGAjxA97JqyqWjiiS3PwaU5yEI/jhKj/rU5vHH6AvuH6CiqCC7dSt4gMpxq4LmaQICTE1deYUCNH7mqm+mnuyOfiE/aKs1WUcBaT9MDeLrcLTS4BbNNxQV4p8NNKjtGWhkyf/XF5A6k3Q0BrIgbfKy+fWcNQ1v6XHq5qAgJCa8IxRxGU2AE5TuCUoRo6icA4M7WRI3pbQ2VxEsvXiNrhdm98/5A17+HJrGvjx/c/ipyTZwpGXS2Mpl0xyQh2zvLrSOPlcs5x3pg0761QiW9lZccARRU4Y5U3Cfvy5eW3VMLN0oe6WwYc6ls4q3jnmqTrHLVTnovpSWKWFEhQAzbkF+AooLk1nVKk24wTVmhLV8ikw6tYf0DrNq7+1LmOdfPC528dxsXAefE6sICaK7Om1Djl7KluLOkTyqXk81V0qjuqc2j6ehTZ++7L5ksI1UhRuzIiIPe+be965vAE9H/BvnOoWVp3jx8+/xXxghUttuSU9NbbsAG/Vpp9g4rOxMqkfLpZ4b3BcMf3LG3khTvQYWN7JqVB2UK04OR018dFiFcW39e735j2917O8UG4zX1/Kmrw0KY0huXsCcRFb8PIat9DSi8vBcmHEIT2kabinKb6pchu1txh372KeneHTKXfO9OV0tgK7TekelFLBhssk4zPaM0pzk5SPpF0YtSZeuhNproVyKExXIlZ/tqr3vP8LzJ4A6iY+FzehgHQqflZoUyHmJIKNQdePtI5DYAMzpoNFhRJjEDGGzgxoJndfi+M9E+aZ8K4TAX0EEykk1IGB4qhEAxK5eZwCNwrWmHBGIIJU4V2GnwkoYhY4YY5pA9CrXOnxD2HkY/bdNLrGT/xaRNWItXuN1ZOmSRSTuWypOmyUskv6pBhdwmSkGg9lMJSp0NNmhjbuUM+omY3ZE/5kUDPT5Akrm7gdUMo4qYeVEpYnzeoF1O8UHadUm1ZqKWvn+UyfxSG4bE/H+vmUC/Qa+vTWch19ylkVWt3edS296OuRI6KZfWT734+vflbKHThcOjAwnPm89EVuvHp4f1gu7N8yWzuIf1vhr7B/z87Mnrkof2i/nz0wD/9u3QJntswenBjffnh+Ln9oAVpMTe7ZVbQnxne5Ts/+o9kDC2Fh/46hvhGkw3/DuwKnp5o7/HkFrlkIy/t3BW7P/Fx06PPPSl/sP+ofqBQnxoFfFWh54F2bnkJ+4z3AE/j5WWhT6Ns9OjwGTCd3+aOZhX2jw5/2Z/bC8TQIGRnsn9iV2bd7uG9sqC83mundOdjft2/36NiOvsHenSP9u+A6+HcQ2o/CP/0g30lbUZ9zi/XnXoCzPG7F0UuCOk7E1wVRVVaxyxTmTj451V65q5cDzRcD1VRmq2iKFdrwPcodyeMnXHkmLsb68xGr1HlTYOvhH63bWFDGlGfNIwupIUEjFXib3LxZhyhxxq76taLI8FfliHAfQeEV45oDWd2FSxM1lu+BRm4fO994I+vMIWvcQy6aN3f7NQQZtx2jqntOFRm7dVOsuntDpnHzQeRi1giv5lXlS2grENtzalx3pqTqpm++edf8fo3KpgRYBynIR64onlJ0cQtqHBp5J8s7HNUEDUZFLe8ykYtyiD2OANjhxhXkV568D5xxUdKxxcalu5RBhszRW8MK7iIHyZ2lPcDzcnkLUzyxvQjqTdz3TNYpeCzXPj0uG7N7q18BkkQ4/fUbMc2HNZ54z3HfdtQm1LWCXMWX4K3P0Yq+bnJ5C1cFqqkHRbMDzcdLDLCbN16IFBwb37VTcWQcVc5iwKA9as5jyGOMxODivpwAtzcfNJa/i01l8JVcR4r3t4sxNIipTNEJ8dSWd5J967d1Ln+mJFh6pwK0oyG/KKpt+pAtb6jelKKycVvD5UJ5LJ9YZtu28fpe4+3L1tuLPGxLVZwnwfZx9uaGJZq/uVmJZCu+EUILtPU0Mm8vnW+//J3myqltfKOS+n2ywJbYdjqil4v5AJ1UrLdXpSxKtLXvH5H7tH6r9XwdzG3j0isxPz4fkQg062ZxMiHIKFAmhOiSUw8490QXs4EBtHxH1z0TnTIq4mAmGn44YWAFbqW+TJEMgVcwMuOK4IZcpUsAg+bpMUGWQPn3gDAaT143z9PCJ09GQ2CQ5t1aMe4vmSIMopLx90CMFCF8JspTDgPPno0/7lQiPf3LVdpmxxKvGV7AxpsrjWOvN9ZfGu+g5olFQXJHcGJHz5+XwGM4TNIUP94nXOzMQCwb7443b7+i8UPdCQ3EDWoZFcCvVZdxqkF7KGn0RvmpwBids+THIPbj+Pq7xv2r/DHQBhdV3JsDy8nQByFTEuwsVsgNfP1NwV1RUqsi4EdAy/7MbYjevsSdRuQeROIjm1b7JzK6xyUFeVUspeDyRKc+pwuuGqepKhjizSlpmHkOf/PX8807xxorP3EduumcUxIxTydMCsXcQkywSEgLMQM/LNj8XgRrmo7gHDJaB4T8G09WAWxLJ4SyNAVKp5dAU7YW7QxEhfroyNN1tmjZIHtV3z0Bjhtr52hbP6tU1dO1ohmMp5mIwhWKEaogJtErpd0/xB6va0d54Ldu3mr+9mXjyTqZUmBqTTuqDj1GfT2HFkVzhQog5YhvUEkrW2HmO8yX5iwuUSFdzwXMxQqy8K3U2L8gggixmCEnEdqU24iooNOZU42TJ3XlCxV0EeAvXlBFErtVU8GgZP05FTbmhaHtt19vHluP11HBJflFUR0ykFLo24x8R+gYRXQVlSa0Qf2aQnBW+9iPSghor2nwK6qpIkAVA3LJ/RNnmSX+oxO4AaS9gOcccCtDgf+oOoWWBIiv/fSmkuR4Cws11GVSCo5jrKsimDJ2SVAku3i5IeZplhsirpYubSQ+nTCgrVNxrTstTVKfT8oJY4WTVBB6hRNpB73Cib6iMCh3yIqh5Rg9vXanFiTwsRQkJVhiNwpiKXR0gAsWgiiqr2WFeqMVDFP1NSpFK3fXWfLl4g4t5JszjQvXwYIpOVFEu6Jb+naYnyhO6YZi9h5pokKl6/Hk/SpvPmywx+3CVr9SvLleJV5usI8C1vy44ibM06xFJIxBhCtmKD+Dg5y8a4bB/vSp5m2j63nwDLBiB41dZQKYFxhCT++2YxwXac0UlY02Wf98vHHjqWJtl+nyGGO7Shna9I6Lbp7LBdnVXAqV63xcpb3aHs4pFwghxOlTG6/WuMClbErzGdJU0goeeNuzSTnpdNKiAVdD590bsYzrgpiWurfYvnOy9SOlWebRUgJSkBsJFYIo8Fya5oKxY7NTaRCdyPZ4re00+3Tw6VHmzpO34E01rjzjweOBySpVqFmpkmAd81c1Me63IVsLsSgesasGzDdWbzdo30nNXPpo6ZFj03NO+sd/6X13uN3az4x7nd2czYSLGXcuVQFT5Qamun/K5VOentri0XS0zCMXzfI8rW/7ERwo7TEZYVrl1qT6M8qFMT0X06lQnoThPCiHQbkKMQ/BcAtiiF3hdI3QxVJ0EyynAXEFv01ULGA9o9IOdKpAqYSjBhJV8NPAggoCKvAXh2AG8IqBLYWwNLYy4ZBCQSb2UYhHYh0DmShEYmARBT4U5jCttLb+hr1URpILU2ubq23tR9voFtq6mRaty5OL2UV54cca6KsD+UaCj72amKZXWjBF8yp1K3RfXDXFVJKpiZQCiqmelPgudgNzW9VFezoivKmX6BhvNw4yypt6XsV5P+0a56UHdOSI7v2RT/9+nNcvuwfwb6HiOYcmhvaHM/lx/NsOB2O7dg4DeWpvZvxo9vD4fPbwYO90Dk6OHZwMCtBqV2myeBCOd4bwt+A5owcna4XPq2X386rvfrZQcXrnciOFXRl3fCwz7JeHp7yic3AyOhj1Z+DKAGQOzoYz44O9c9Pj80cPjw729sO/2a0TQ/tGMqXJqBgUCwe3bz00BFfloTPucGb3joF+/Bvo7+sBSs+ezD442gM/94zh367hKXuwd/dAf89AZsfwQP9oX2YKpEMngM/ElD3au2/3jn74G4BL3J0ZoAwCr70pMV+RKBL4tgh9YmGp0FFzh7FTLp0rqRKnmNLBvtQqD7KTLxsvf9k8fbb5nDNegirvewBMRGiPZreMDBXgLue8tJcpqIq1xQthac6TuTeWr/NWLpo9ZTsJ569i5wPeogpOWSq6BvfFs1M+aIkl2rPCcbFkonmZI68KPlykVWY57kMgq8QcO9649CX0oX3iB2FfqAXunONXg6CQ2gdOmnXzdlfxIZys/8Y7jUhxFqWw4awnVQUhmY2zt5svyfUQ8qx8XuQ4AH+4y4qtni8XvSIy9IfCvaLkXGSm0hCMWC2oPJrGm283vz+hZikj6yhwcFQZRCUmdGWlcS1D0wRXnL6dVkXIiXPz3GMuRS75YuqL3uCINjvwaXt3sDFOKCrm1X9zeBFn1hUkwj9c6vr9DS4WiQDoROPU97iJrYNVe7BKVDgnw0y4GJDrkFFJHw4zCSL5soKK6XaRYE05zrRPE+0IurIEErAmzOXzWkjoyJ1FACFF9SUP932v4YqUqutJtNVBJQVNk7w8NYslb6dYWcPobpx81Vq/JOdIqQ3GzAjBckqGIousctF544SO3ciTVC8PP90FEVcR31X73dPW+uvW+RX+ruTD090VeK++JDjTdlYhryAJ7Q6i8W7UbeoXRDfIdfdceD853L3cECPYCK+gGtpqv19B9Go5cDdD3t2UNgDnx6iEIrp4dBuEsEBaq1PBDUGEQFHZmXJScN1YFdMHKOxod5CMFBewpvzw1CQreOrw3FRDZ8GNnFLVn4/SKjCYXONlGMwzqhJDTBqXYpDSzFIMCZmsTEMbrHpYsDmFjmm0mtckS73KLi/Hwli1AqYFTSuSDNBtCgH2Y6OUhQImx+RSgZg0HHq8l5+oH8T4GYZe8+oqlhEiFD3vyeYJsQGqTa+irYeORsIpm88YiZlLtMKOI5RHUQPxAu9bvzTvHGv/vNw8e0IFKMsRjGHiEZNEtTC5KC4LoCcoSIqppWp44c0QY67gxckugrGVd4NZW47vAnxHxcD1sm7WwmqsVd+R+wemncAVCrQTL61V+PMRl05g80R7+q40f1yC/2+s3mP7JLYhdxBo2ZKhCFDZQrkCcNSn/mGeQMfQONMpk+e9pHkWi8JN+ZhpzZb6lXB4FUMr78QQgUxV5c0M5SZynRSWRzVoSGNyLs7rS83br1Fb8gJKuliADjcnb7g2A4BfJ8XyzdZySBTHnGnE6fWxwdm6+gBYq8EpOVu8mMVwSQUIoA2XcNO3snRP004ElEuDm6OZr7F57fv27yfUC5TXWwpjSK0Vk2cDmPNIAcWkSTICCTDxD1zPUPgxse2lB40z11n1K+HYOiFYR4CtsmPuNSLzyDHXnralYq/4XDMZ8U1sYYhDrVzDWQC3muBn+0jP2VEsrEyLZsGDUmFlXDn79npcyJytwkEYAskHesZfICIRSFFn0jARVzwlzc9pPQyNQCzq/WurBjqaZ2YlFRWJ3NoMbmNGiFJJ0rvhUMiLN2rES4zeKGuDeajmXD8Ljec4sEgL9yZ1Iv2O6vdxNWuVd9cK8EMGlWLrkkWJs2DRRelVml9ZmpefVnPl9/aDY/xd0edLaZ9004JFisRZ3jgsIUlQYRBOsUamPK5zrZVj8jHKSwuOKxZuBVVO6LGCslxpKnN8YLRJGtsUTNKkNG0XsYAwKfcwVNj8mlLlQxs3vJe5RbKuICILzIrQEiSuYKispGjeGmfw4gvgzyCDkwm5ewQ1EkgGPqf6kq+3VAVa5Goi2XysaCmLa94GTPuoQotiL2PW+bH7jTN3m5SyB+3mPduX26iqSjN5O88xTsU1CqpMSxVFu7utisIBJOTCCmeNKwlUbUnnlII2ovocKML2bWXvSbZby4lyYQkxNGe7oKS01k9trNMg9nC3W1wrQAvzhT3g++B1/cZNGJxlvy0pgjfXgK6zALIeeN8GV6H7QyeiDSex9oHDtQzhXtn3FKvjRFpclmrRxt7224et5avqbYt1cMLWMGMZ2wQnGyuzazdXnObQUDUX0BsRGVQSt7J9e57lLE8Q0rjzqHHhB2V0RN8lB7F8H6GedpL4ZmIukmQvPCTBmjykiHCj4SE5kemcq6rt6hF1r+Yee1BUxV1/Frp+O8n72GZkwvNPDwMo7z/m96e52/h6XNzzUR7FPHjtu5seu3JrTXdWu7HKeTXcVmXMpNdoepCmK6KcEHarEu5bzGUz3ULlCsacwJhiMRwjtYco6w0QyOoi5vLEHI3YgawwQ3ORzTOXeQoy4VsQnJfmBF6ncWS4EMp5SAfwCk6bIFpB5xholgHOGE79S3SawKIJ/BlHnQJqqk9F2D4JKONIMh5FSg0WqQiRGRtKoJ441jERjgI2MUiTRDMJCKPqsxtoxcQpSXxiWuykrf5bVlqk/KuqPJ1mUhlHwyyKAaSNU4pNUkbCMEJGnRe6NsXGmM26an2tV+BYHGqlpdRVhz53WFF3KGyzUYdmExH1oo+f3qSVc8tYS6QjYTrlvIqlp7cVgfSUkyqKvq1bFJ0bzR05IlrZR7b9/SD6oR1Dg/hnH5wczu3Zub+QX/jXUEZSq6MjfYX8p3tcp6cIh1tGMpPDh7eNZHqBDldX4a9Wgf+5+Z0z8BfCz1G4bjQ/7e447BV2zB0uF4p5H5pPlPL+9DD8OwUH84fL3mBpvtgz7YYzUWXPzt4D+wY+gx7Af3NYy+Ize3L4M/vgsDNV6umZKk30ZvcNjAz09fZmDwzsGxvYHVVyO+Hfvbv6h/oyYz2ZvbvH+oG2Z3akr3JoaLDcOzvaB3fkBod24H0UoN0+uGbX6EjPQGZ2JAO89s8XnYm0dGl0NQFo4JZW0mTiyKzR1pDmWSOBii/gWQkcvZQsinu9VJWxaF572rzxonHpKe+6h/UqKzUL2VXVblO+6/mBpWVQqr+Pu2vi8m6TrFnL+V01w0cSNl6dba29ExtjUneZuQhf5ewCr3zHO5B7DC4YRKzwKHcv5M1VZaGvB0KdLbVX3m7++HPrW4yX+mKTYclXR3xrUY0ylNUZ3t4WydBgQVM1e7EoiEsOsYjmmZfgsZPulZ2ET7kWR8hBzrezlqjRVxZ6vBjDy/gBGwkuRTnT+eEiVrjBNAsNnnHac2WpsXZF4WeCPEXMucUYVlah6EQPQKnhEzYFk1xM6+M6oGLncS2OM2yKYn94JXPz+kp75R1bXBKHWRFyA/IKaBuAX0r/AVjk1bkCB2N9SlKmkZzTeTBv1mW69Kpx8jFWoORClz7n1kiu2jbhzi3IUsuTCwfojCZrSUKKcOxhAL2/Mq1EgrzGmR+bZ4+17mMlLtHeUpu4YHF0B29CrHn2aKtb3mSAziRPcHow7gtUf1bjvUzmOOhOKJainz+dwz2C1m+23nzdWr/U+uUn2nMd9+DFtMkqcGWx/D5d7kKk+kADCtRYSCbDUV2JXeHCJY6I7PGqKrAnR7t3qrV+vL2ynOgUJkW4mBWa0i8aAUU3a7pRBq3Tk8K80Q5vqnH3ftyhwtamedXEmNdpkj/qeIoiLqbzyXVcIoC02gFFXiIvQlS/tOhDogwJoqC3Tp9Q7J4ez9AWGJRtwaFfFvH9g+aJWxuvb8uuMhOj1vAsJ7cJuio2nCQnBIiS1fAqKTAppeDWv+8u674ivpA5djA48ry+u2iXedI+UkQsjgp4mdYv1urPSYs/psofYsP7NXIQ7r7Y/PYmlohdW2tep43jijZNCxIjsWiDS2XgayKiKJ3LI1JQTL5U/5nuh4IDknn7xf3NY4sogvo4j7v/qo3AKMHBx73BMIB837ep8L+F9UcwlghaFouiyx1+8RxfizU9sGA6pfDI+c4a5/rVZvDA+DBoAu6PjVdXGicfNFa+4k+CFvwjA8xgxBWIyHneKHBuSKvfxs7ZTtnu7AmpXXvB9vksbX/pvr8y160n7eOLjQeLyZ6AesVFT509YS+mWnF5DotWpHPyU1hwJYmy0whH42IW/MNHQkmOvzSenML/zt6mYqfTNJIq82FOVKRUxsWUZNoWIYlGLvM1rRizViZMM9dBoMjOO0FZ3wLmbYXkf+AZP/1UkavuiV1asjy0jBtr3FxrvPqy8WoRRpe6vaozHYLxnEfLDM8xoK6IaL7uQmiHYoFoXL6mdwjE+acyLrvnClVa6Mbq0/aLZXyyMZnWfI11D+jaUm46F3hZMji8/4SkMMHQ36zVXTBu02DbqIY9DZDNK28bP15vnF+jIpastzWfpCBtVuPihPMnTsgd0FKE8kZoplDyBWkftKRcsFq1GVzoxG9vAWMcocglKON247yzHkUvl+BJ1+DUVNfL0BdF2x6pLEjSx6J27fNvWyvXORsS9SQvCy+J1hbXKHY8i5wdWQ7jI92T9v1jfUvBAJ0dY+uf6Bhb/9ROIZanNUVq+YLKNXGlSpPXJC9x1BW0lEKsapGrHT5c9uEdigUVuLyF0vGa5261v5dZJ67SecRWyOneL9rCJxBGoNClZ0GOtytFaxC+v5HeJXgu7WPPE12qOlHedkqp/Sk7s4A2y7JUWLVGCBLACa5VcLJwzibPRfjnfFpuc+FWa2J+Qg7ztXlRYO3DZcZHK9fBzdhY+5rqArwT7jFzydcCDwPWtY90hNBD/b47G3LCTJcO0WVuTl5GqeJrapiLnnHCePPmBdUpMurcykr0S1vO59kgxFWVdgmMvpwLlmRcSO8i3TULoFJBHTLYavy2HpxrvPwFjLUavNAmdGDIAk9cUlQNskGYkBpbiapoOp9ZqxctKz43RVpGSTWXopI8cx2qkhBggDkrP1omLTAFlXbtwzccWzZvr336y+ZX58zbK4e2pe8JJ0yrERacteovskEoILgiRnwpxXD0rbC3w3UJFG90d17+gsOa7kAzMeJKQtGY69Okk19NO6kXEFJ1YoaL9ccLah0hFioGtHj6V72MjfM8kJdaTYg7emEilNEJ9e7KQV4WP1bsyfuvKnMrZTTWlgFKqVQS7m45EKWkpCpnl8WZkrX0Y/RO11+pfeX5s67Xnr9S82IURrVs0naALa/N4DqQ7kblwzfwv9qfFyJlTVovfm5evhmzIzwxqp4bFlsIbaGeiwBcebMe0kGJ844+rRQQF7AQ1b7UtxfTQ+3jb5rfr/EXqFSRw+yYnyFHqqSuXVNaSs4Xf6SfKr5kXKs+USu16zjq6Es1e41TvWI62erS8S5rFWKhqPQAlIo5GdEmMfWioztGoAd0wLSF5VOo4Z3mxV/MuE5KQCUZSEnETsyAiREqScRI/ipMkQhPGC0SMYlEJCIOEJMOfsy1/4hHb7jXCf/ddNvNq7TjrHzQTt/VdFj1ZcpHJS3R4SWarqF0CtOcrg5PS5QmT3Pu4s7Ux70o7TwZLo3yZGI+TNJ1YC3jG4eprkncKUnxRgwMjbamNsP+gcWlw1V4x8TkJhr/exC8O7IVE2gJFJvAr38Puabgwfj6Ww3/EsDvbwO+7tCqA9+ZoK4TzsUBjAlcuuGVTpRi4BOeQRaAIQ0imMBAXZLAAZ3Gv8MQm9Y3ZnfjJpdKaKUYPWXqTCP3URPS3WB0s2cJI9bdfHVOdeXhSns232MpF/NAcrYr/RI14dWVg5jzSj+vpr22dpv2Eu3sI0e093tk69+f+fq0OnOo4EweKML/dg317f8Cjp3JfYeGMvlDWw7nD209vA/IeHaqlD3k5w5O9O0cHBjorQx/8enMob3B+C4g7fzi0+qh3trw6MTeaByOXWiy9+DkhIvtnMlSdnLC84FD1pkc2j+amS46k9PFwuShrVsO+wcnBpA3SsECRMBpJvRzE9DSD1Hc3ijAc/09u3u9kUzPQObTgcy2QSylXh4d6e/p2d87P5CBHzv2DfVFs4MD+8fwqILn9oz29wz01ioH9u3q65vdOTC7czAazOzBcuzQvwxc2d+zfzcc96fNgLGn6xEc7Yh+s5MbO9kt8P1Y1o0QdZgp3t04ewNrU1AFZhXsdhRPY0ZeCAndGvTN2NVA0m3PC0JAek7e2L34QSjk3pZbGG/eut96dK6xLoe9aJ733FpWR4ftKtbK5MXi8PVy8oS4OThl6zP1ZZFXcbvGJWIfiFxZ+p7JXzv7R+v66eax241jmCUboTkqA+qv1gI/FEJ5y+TIpUo0Rg+MGhCGdF4GKSRw5TxV0pXEbLy5KRwblmFlg6lYRkReVEEii6N3OoyfyYlTstyK2hhebgoLNgjeIubHn/pFrIzEoisyMzevF5DWl1xdrzbPyQ2Y/qEWAwmiKYD2+BOLNlkG7vD35JJO2MC+znuuQHcw6jyx+zzlsOFwdHP15VzoiOo4eJ6LJerzLpyecmJ3yQXTjJWfeJdYOI3Xf0YuccTJN9+rFcBdLKfKt3kdAlevSQpPFLcxRVqqJ6Je2/Id7gLviillxmvccKiFt/AyS2tgPQ3alJEg02pj7Sqt3HQRnLoVVZiQBhx8tQWeQIhVehTjjlh2ryofE8Rl5aU4XVbekEkjPhco9OBhOS4xNcL0yJxSl6cpQ1gmyfNAQbzVPvtl++nx1vqvzeMn5figJmImxomX/a7fD8pOvOx3jikEl4krb1Efq/594hawx9oNx8/oGuDYVaMAeBhgCSbK+OVdVwlpCxpvuSoy0fPWnxeysbsA1NB8/rO6C3hacxHW6CgbnMtUW5V/i8If3F3KNJDVVY+fbLw7ztVVsb0u9IE7vnuMssRbD3X9xefqnFbl+rwuCAAqp8K6gHa+pKoA7XeP+JmEgTtrl7jmumBn7H1QvyNpuEmbIZI8J4Or4sfLC01OcnFX5ES816nYB0Aeo+54z05c+93L1vUXcsiTjqWLWC3BHQb5GCsAduXQKQjkmmTIBcjeL06L6sG8XTXLwOoqay8bi7+IfaulKGu+VAXkXBIldikunOXFD+oXL7RERzilNH/z+P3m4uVEaf5CQI1LlVj5KcEucSi1ihIS8KwQ159C00QSNtbucgkqZmxWoALHxK//zGtyfIAHETh+VXZYfLHGkelMVhuF4BQfyxSCTp4HQbRMC+Ab5rkCA5k2qGWA2rSrdpy/opG1w8R5vhe5mg4t3qWvgXvz+Fla8GNXQctq9na5RsWVcLKZN7KlEAYRKYNUbGYb395X7FHJd6L3W954fVdsYiV3smVOCcUmiP9II8U5W1rtUMUoZM/axuylqcr0e6CZcgOkyBfB8+XdMQorURjWkcIooEIbd38zMYp8USI9jybO4XHFR4GbPCHoSoCYYBAbb5OQzTu3Nn9ZMYcCun+2WTsy50YVmlnGpFg0mznOouV5MTi7h/Kg9NmdpKRkIUf6HxcuIId2480FdJiX72HlnXfHqQ5XWMSKOMiulJuPKknhHVUrBTVeBkTKSJQCYTG6GoiSYkbKcT9Mj7dEDBRAolpvvCfmFJ/DVxlMyd27aHhyHTOj1ttVzghdwR3Wvv4O92Z7e5JBGXhFWAMNmtekBrXhXgDfGvIJN0iqo2TFJejdCOkmpZjm7SW+SSXF8gK42UhWn3EqmNVMqwpoHzEB39UJD/QtnXO5mDI5CfM8dgLagkOUGWmt3dv8+UTj1ZnWtevNZ6I6fxmGfoALjLEMCvArVZNya5aTJtavUQrWLK9qMkXh86UcJSmpdfMcr5diAQjuHGOj+Co+NllBqSg2ikeieHO+XY4nl4FT8n5xXueVoRt0Lp5Uxnw7isNJeYZrIITR0CC+cZ+AmSufgNvrAnFs/8IKmibp3lX5E2YjyKc8ExToL9yT0QVhZOZFXRfx2K6f3jy+2Dz7tXxTNsgWdhjZyiAPZjXmLN0TDvcwVXfCNGZcmbMosnLwSrYxLK6xdnbj1Qtlh+kOcCGN73o502RiZMxxI8pcEiSD8uGmJ4xlzGS2v/+6deKespfzVcc9Sgt1lMFUbDtMZueJmM1UEvlmWJKpJYUwcQ/4SAloOkFeFT2kO2AUI6xZlmqbURxaGczW9ZOta29bv/zUevZWOhYeBn+QhcneydfXaIWe5F7z7EhYMAmEDDXLIEjpWAY/im332vnC34859TFHXrnvMcc96bLH3fSYo6y8Y+0XJ33iuB+c8EeVGxpzQNNcv05/L+HiKccu7tJ1OmNJ/6urS2d6c9q/SXVslCejHRjtX1BcElGXCE+zWtEehnIuhGehNIhX63QjumL6BKCPgfm/APJJDC+wdBesawJcBW1NvKlRphjSBmJVcDUJIxUo6wByCr3pS+JozURoIiCOn86NOQo0/NZ6cdb42hN4JI5DkvDDRB0xvJFEGiaykJYPq1niSmU2ee0nPze+eWDa87hBNY1op+00zaZpM2PWUptIbbWUqVJGKmGfYhapwxiY+j+m+eMq2VDCpopXel1rdEMLKvWnimE9EtU/+Wl36DddbCmyey3SgsOsBXelVFtKu8Yst9SFh663lHaBiplv+UjBJejnkSOspI8c4bs4suV/UXQpe/SAn/3iaCE3uR//itn5yuSWqeL4/t17J7dNFSs1P1vMflqBaz63Jw7s3g4XLfjZfQOZvTt7d+WBNBN4O2GY7YSr5g+GM15loZZFOvwO9o0N9U9u21L0gN2BQweH4PfU9tncJJ534G/7bGESrved/MSBof7snkzfxIHSQfg7NFvI/WssA+/8QP/W/bvh34mt47s/68sAw8Joprqzd+tA366e8f2fDmS2DmX8nRmgwumh3kzfnp5qX3Vv7/DgQB/819u3Z1fPDvhxeN9Y//BA30BfZsfwIB4NwRWHq3t37oAr9o5lupddAkOVlYlXVKTYsDJ4qpQ8x0tGeJfyVXZCCYuCN/FquXH3AphYUhJU8FhYIsHIrAFoxeXrcoBWQjpFIIQcSlGT1dVZ1sabK+21R9royT4jnsJCgcZnwvWWceM7NoWzDu7bpnZiihxpEfmEp3b9oH2YOH2U9qa0OL+aN2Rqfvdk87tngPtFSmzk0l0zF7PSG5hQzAyVC3XEBbTJDeJwVRlJncBN4BEcFGJSW29+bZ3VIrUsyynLJZa1IAxcYfLdvPDLnoeBUymLmySqKEV8m+p9i7giITKeJmwu/oERxesnaeLLd2AEUZSqyizFy8zXH5bjkiRRC5L+/bQl3XxWyLzHSePU7+jhX7veOC+KNbAEeocKxFhYjC+sP+T8nNgR+O60nqLYGZ769lL73WkzNhVUsVJu6Hgq/UfwEQNSDkVBFLsBJUMvSqKKurAkuUoRv6iYGHSbokAk1WNBHponcmP7sKjzGI/JqQt4uuHPCzUefrwDDuHF7y62n7zYPH2p8RUu9Yx4fSQ1s1icLD6Sp6Iq0CfRDa4+oqiRyzTNXSDn949qVd5pB0S0L1xuXnzA2f3Y1byDDIiDSIShjywnJ2lwZQqASw/ro6pdt2MXRYEnMhqx4CxmWeCVYlvu2MZLBXqzmJSutl5qfPUE3mv7whPauYX2t7YwLY11jh44AQ1GmoMrB9VkFySR8t0lmrvwpHH5uFQp4n6m7arGryANa2fImEjRFltUiSoeBVVYQ2REyfMYUpc+4YeLIQXW8EV+s7zx+nbz1hVAvrxBe1iJxK6gandT3+Y9krKW7gLvqiDpWjoj6lCk1/xJMyAEjklE+9L51vopVT2kwLPqzER8a45fo0Uf/IvX5PLYp9rnrWuPGicv8NeEF8j9q+RaK2hsRjKZR7cwpsmYvyXFXkUwDSFyt66K2mgSlFpVfUiJE1zVhf1jqra+ivsmkCexef1F8/ofYEWaiz/TBvVuldaTqAENViOoWjF5hC3NzX2NE5K1XKtRX+LFMcifkorOUxkQFmBh4QmxooE9ZFX0QOn/yNG+stVhHZRNsJQTjTdFdoHd54R1iGxHofYcQPU8bZGp3HNNS/HQUTMsKFx5/WT7xCURpWSuVjUEjKYyr/B2sKwOJcH9MzQeknFHWF+HLghjD3FemaDmiTNsfKT7XwYn0zLfEBjusGjcAx+n9/8Zh+iun9w8fcHgGdVA+4hgmZ2vFW3zkdBxl4AF+/781Pl5N4/dbx77xeDtVGs52+AcEtdA/Pakzn1GyYkPqwmWN1rXXiuWvouV4zQ/9ApfhLkOwwtjJMx1WF5+AlzUpcz9Rc4nf46ZW2gdhKVcXIDos+TcvduKtew3c8d+m4x1BI+DTJyhaUTuaKSLygyETB5PJdy3M9+0V5aUB4fXWip6J71nRiVmtNAkJoOEYq81iUB0LDCGQAgUrIVurlMngONbC3n9lq5R0qkZKDGM8sqVZsCcsK/OmZoBfhTDmlrVGjLjMkaD8WNywD3K1qKYVJ9P0jneVFcJov09I5nDytIal65zJqsQZQVFY5tNl8PPjpp7pNCEIooQiF4GwI8wHgh/cA4epn5FHBWx5s34N3OEM1w1OH5oxG5pd4LVOR20vXwK7D52XgS7Y0g/yNvl0C3QlAVtAPjcL9pcr77rGay0uUA116hmydnW0gohXnk5wiO+ljOF8S1VkkwWUqmipBUJeP9oBqcqqArRtWWQ07x5q3n9IZduYAHWvBfajpqKVdNm8iB1qoy3saYpMrUdk5ghY+hZo5kNxcyvrylCKkPGflRzNKdn3+4vNl7RBkNi8s0PymrKGy37P8tOVhfuAX9nlitlVHERKa/EDXAH51KiMKIRqVWlETlMq0ojsj515jqF2WVMxeUNh0xJBl0pkbgg1iJKkLg+LoqDy7giE7MDIsrXKYAM2oMFA820XlOec+Up+PhyIv4fk3j3ROvGWSUxqnIDjoyUYgIDQ4JKozAD2oYXzNP60gsWEW3OqPhIkSPtdn/E3VZOdod7bRbkEnikCzpRmCSGRnR7aaU+4iwqF9G0VqpSu3QCUx1C5QJy6fUOf0x8fHHnR3k8ytcxgGcuFomXR6Z3Ip2SpB9iovZ0qK4QuonNRQo84/GPo/FuKDkJjg2TpOyQYYFMGBeDbCb+UahHg8D/dTuBk4TirtGMiPzXxEIKBXUCIAP1GPMxhEQUBkmHH3HUEbM5ytaYWCBmjw3rG7O2ysRq42paO23ousozbWTSgnW1LcqkmMZETAlItd9V3ysVr5V7XNGayjWuiZT+US8zpjmlEuveSOq+jsg0M5u0/k0EjjvC0ikX6Jh0emsZkE45q6LR/7m1WzRa3J6KR8OVfzcOfbQ6+a/RzIznFsv5wxOHxsMs/LNvYmrXvijE+HR1EukFxz74xZbq5OGJ3Xn4WYO/2S1HJ3eF2a3+ofHt2c+h/VRu186+ntxOoEXQZMfnM25xR39fz+GJbbs+n/GKyAP+dUvwb6lgHwRec309wU5oH5YKzsFyfqIvzE6Ow2/7iy1HqyC3B44PAQtvNLNnuHfH3gz8zu3K7IeD/XuBAIdCwlSQ2zqEWd1DgyMDY0AbGhwd2L93T+/wYO/8UGZ0ZGgAKCNjO/p6xnb098CZYfi3LyX2zLUggqob0uQjH7JOdMOCmnPJ0SJpxJzkwGNtV56FaV651/z6IRb4vf5iY/UcVQBz5qqc1lclHmLHYRBgBVboLtTyWg/iBZTj6uYEWcrCDMVIVR5jMY2nXzdOy7xeaupwMxXbjXyH3HfPma0v+2KtkUF0fVUY78PlGkUhcDUGBTxWnzefvsCNoZ+cooXes46H65extZGwZXu1SlCxlDSl0b0skS3jhGBu0do1uZ0mCWhcusMrKoQAS2SiAuvYXBYhqDzvtSWntJhWX9YbcU+JWbHN7y/wrFiFqoaAyoukhRe1TQVbetOu3gNA0Cgj5DFlmF4813x6lSsNckfgclZjXq0c1p8XKObm1XJefYl0sCQ7MbJeyCNi9pxpwst5Gq8vNU4+1mm4OQ/DIMhIVGEEe1KuL9PWeMydbUwHTRSDrvFaWi4EjTlc56/JngUFck7KTkniZMfL4eojRCJkFhUFjIkg4aPNixqIrau/88aPoTMXYG4XXf33eYkFNry32/E3zGuezsaYRbasOlsR6fU4E0NFLbqcUJO7iHxc3B7DU1O8gIAay5dbz77R2zVZIAvX7FTk28xF9TVME9f8edoWJ0nycSrpgivTVDuTq6Hgk3n2zebP1xtPLzXertDmRczeAg1cNYvBFG1KQREFvQ3aAuZWC+715RzrldYdKi2TwzcH1zpqi/ZAtwwqnCSdQpJ1RpjdzTVml/ccN8FugTfes0WZePx4QbEA3vMo0IdZg7wTPCg+2heX1l+R1W9c+Lb9YhUGBmoLQOOoLGRbrZGQ4lCleK4qFpOARJ/IPNa4XCOwbFwSKx51Z6riWo0p3bwdYg0bRu9RIAtIoDaic1TDhuG8PIulIQEeZ3mFdn2N9qi/+az5w4vG0xPtt5fFJ49Xs05CRioXMLK0ZJEIGFlaINWLZLbktM7jAhfaJ4N4b373vHFXLXajHhIHWU7GD6zIzhvfEYz5QKb3d3xLqPk8TI0XX9Tvvzaf/6w/KmfWFptUh4GPWc7Anmqrmkc4C6D2iIbmjTtPOXY5l9xoMRd4YmM6dpUcuVeUOiHcJpEOxIjyQY4NzGrEnkzz93Og/zeP3ZIZfPCocfdnfNHIJynPrnp2TI4gAEPMRsCBA8w2H333/3r7tuYmrm3dv6LaD+dBZ606wCJk1X7zFYwNhgAGU3WKakltue2WWtbFYO/aVUASICxua4WQCyTgQAIsYi6BJGBCeBAp/ogly//ijNscc86WRLJfThUy0pzdY/R1jG+MOS7ysNA2s8VI/L+1GrwSJnMCy3XSq42DquTNKL8vRZNOsr52d9NqWtoog9S061UFWzIQA4kvlIFATv9H8hfxktVFsIm5lR52IU9yrjatR+QoFiOpHmgUtJmRZT+eohwtqfV//joXZY1Ba+IFxK3t9WN3dMFKHLSBaBCfJVfkqEMaKLJDWohR18K80UWhlORigRiHbFpjiwCVB6+esDDA6rz5qOIV96pjF8eyyabA6mFcL9sZjcywLR1GWR/NVQ4pp9JhGy9X2xdOaURWxlDgG75MhYHL3onDYBzIcNx19lSlH57WqslJPX8dYNzGRz9zWqrQ866EiQ5whTkPuIStsxClufEUskD3/YRg6XAYma+BUM8/pQwoZ5T1G6o57ZpH+g3+mt55on6AauDSx9YCETwXbL/xWNkdMzSlOwLXvmO6ndunufAdEs3Uo7hSU+3ZvB9jb1JWFQ0JVHImYlUjZhLrTXEHg7dXlm3F2o+wg8GqqVtrdgB13QD5L49R0Cg6lwoZILMG5xm6Y3QyoKsI5Mp5nDsD+JYuEVPM4JqwyEhcISRXZHUxiAUB4BIhj+VkDNQptaHhxMzOo4utK+c4JRNtNBKZNlbP4LREaLOi1rFQI/+wcg4SZeiGkAWoEnQzBH3sRm8QqkQEtHGSK7EprcMUSu2MN2/NkkZCoalPzeVfNn74fuPZrdbHFJYFW2OmJVNIH7+M/qXnmFL1AChTVgyqh+adh0Q5dK2c5oP+q6Z2tdaum9JKrVk3NUEPPoD2Iyp4rE9AhYejibSehgZU2PPo69gU89E1JcW0U3POMeR8C86x26wVpbaTtZo8U8mxkHqHCnr2kGtRpAwJDYc35olrkhis/hfnm1RJZ/PAwfK+POsWYyq9HLmVwrgeunV8cXn2qjGs9QCtCzpTcNMoUKOvQC6TvkrjVg/j9UR3CulcMCfLqwyzFF8xsBJUlcI3LrQxN/oFu9IFJHnAyMANizJuWbcdwJXOs3sCM3wc4Gj/P9L5ft1Pr9qnp5hVH6smNi5Xo3StKmQ2Rvk5OkkVkaN9VOeItvH1jKtaKMKUxbwKeEe6y5lY2fs/E7mepHWkqyvxVM5ZCecJNleeeTJGJYsjU3rHxC7N7sP+oOivAnkzlKEI1l6Bsf029KJj30HNCZHtt5V6Jv++9R1xsgBrjh0zO+exujqGzv79z7sow+DowWoxd3A2X5+fgR/4OV6P5yfH9s8PZnfAFI4cnZocK5cKk/X5bfHY3PSRfbtH9s7m35s/AYM7thRzH+wZPpjANhX4nKiVCidq5cL8tuOHdmbz79XHxhanjwzv3zk6X8gf3pndsaWaWwaayzPBUdiuVJovzMJYcXkmPBoGQ/uz+f3ZscW5I4tz0wcnsgeAVSWZHBsFFvBv4TD8Hj20ZzjaORqPZQ8f2D0yNXbi4N7s0MDEruGBoWx+KDs9Ab/27prYvWvkwL6RI3uzcGTD4zg2MRztH4XPTqD6v4eyhz7Ys7QzO7FrEPbF/Qd7uSxr8NLU8A8XF5X2EwEMpsYoA4JKKd4jT2KVEyFwhe6TH9s30SapUjCH7Gr0cjnApGnLhWLxaUyZ0MtnCaNjIDYePqW/8eSllE1RBhmiQ2xwDS8XzFqbkvBhgarGwgy2mbQtOnUu4kXUHysg97hK8xsqJNT6+vLGrWetG4/bpx61b6my5v0ywkuLUiGmN2N/8UeAL106Je5ZB4a+GgjmLIRGKv8TWyoGHGhbSepSzEEnyzzJCLnElaDenKKslbdXClJkgWTVKiefPni0ufLz5qe/gcDavH3TlEzCJdYZNFGQRV/+JJNycJBVMt36HohZnmNDm1d2JMi664Da11bXn696B4RFphpVjMOyx+ZmDzW4asaJwMbJmbEajWGiAbcc+v0B/t64dLZ1+YuNf5/i6v9VCeRulFzfWljU2kol610Li1pXqaSNjIAqRo8tmSKnRLt1/Vbrpu13AQdEmEK8TXBg5aiOlSzCCHQPF272BqWYMybEUDD6cUpQv49FR+7xwujdi3CNMDn95dcbp1YppI52y9TzREaSPv5ajRpFHsDFTPeXR85Qkb0zFD6bc1AkVqMuJBKCUOB73mMiKlThhExuCiKKmgRRFakQ6+8XG5xpX7Sx7k/Wn9/FFc1bv7TufIVndfUmwY6ElwsMg14HE4BkwtKfjFFTc7E3+Y6joE4HydtLOVladQ6kff7O+uuvBSHbUzVktV9nDE/FDEcE1itBQZt3wThGC2AkoBlnta3ImDMDF1iFb5483f76t84rWi6NQdOFGd5NYldd+kEfqkqJg1jt/jU8ogKoRZRgtG6UVCs29U9n4DmtmwQ+DLFCiYxemZUZallzu3XlUmfl4saLU1IBtVKbIX+GoWebmBZwRdhnpRMoBPGBzNs5kAKE2ti0pLJu1CnvGvAC+Np6/YAuy3w+AmvL51eD17UIRgeFXdYxcM5kfdVA1aRmeIK4NVeXNAeCEvTuXNy4+7L18IvWl/cIhRlKGaSSmODZaDEjDDkHCX8zG5G5RI+75llsTFQ7359ihEwEM7SzhAlE0uIBdXNS4pCBaM6OhSx23lzPyXNMzqa3V2mR/MYP8NxuvDy78fIjQq1gPtYyIVhokRHiuDQBkoj5sLdZR+ZMQhnRw9teNVVviWTn9Ced0xeo3xVSxEWPmhGZ5eZqWEeHZtppk49kvLe3hmLgouYKhndLqwL02YDVsfHlq871f3humzLTEvmpLCnKNjSr//4E9RSycQHSf6sHW2rH5bKtmbZcHtvEiwHnwrPoM3HCwZ1NynabmBuG9i50oVVru2PFqWxtd8S4FK91QmKkvk6P47O1dnoeml831xwBKZtbBVuAxz0SrLdy5y6nk3pH4hbjqTWqzdVFW1pB0wRgAt6V+J35A821gg2U5vyBR/+SXB3OHyAqfOaViP3SzBFPl0c4/YK2g1fdUOS0geYa+eSZKqbk/nRKD60Rz/x/SErwchJqwSIY5eVMDet13adhepSj5hM8Md0WCAhplI2zuApOdT2IfOvh0/aNTxiI8eHFjZlSNTAVh7EUFMqbRCoNRCDrGYnrVKx1BkBAVHXVb9loSQLorure/Ow1qEiA56q0Z+vHE7j6hqSpfLSYUS7IMT3QRdglqYcHqmZR+vMpbqL336p9C4NCjRwwE13634IrT+0TsHIVvgFkZlVNOlx44I0jBBk5YUYhFoKs4KJQbzDHfS/ePMgpkmtdfNJ+/S8HxhWwaVIZE5mcrnJxshiSlI2qiXVvyrBZ1dMp7Hp3i5I2fpDWd60L1zqvqc0QbDTLvk3a2zzyZKcpK37cqeCV8jFhp9QtxbXSmLaaaErasdA8cE2uwxNhF7rWYewQyu2VHXjd+e03bKjswGuhk1F0bck5oWkYSHffHXFLjljyHKum5E0cttIe2DtsmxA0FsIDsNHe4QHtOtDI0xCteOBS00Bmb2aYQnI/b61dhr2lhgLsWsvgTyQqBECWhgcdermwUd2nwRj38kqs8+iz9k//YGJ17B1qCKFCj0Mu5yGLMGZImmdyPXGzHoNLnjkRVbwk0/nwGxVVtHkmhr35smIHNLAeKDS4ETfv57mlbw6UCroBDS2MNieCRKqzcpKWFEOy3LASb08Ht+sa6OcTcD0Bng/Atf4da9+3ul1j25rZPc3bntas1tR0zNXelrNvnbpWqWszqqnoGInGRygGmv32LlOth1mUNoXebf10Gz0pc8dcJGPX/KHVYU0OD/r3xvqK8OnVcDG9Rdg9sLXiaYOkHQytwNmBtIpkFcP64JVknf3eBRJdePhHoLAfEOyNtlL4Kg2rHDxlQIqLaBTH6KR0sXehRDeCUNzgIAYfKbjQ4M/qaH4WrVrspfxU5Vlll9Jwnl5z9Y1qGVe/SBA5B/3wX8cbYyS5SnCQrixj5WGqkU2ASLcu39DYhVeEQi0+ft6+9Xzj6TX42358t/MR1mgz0tZKQUceOgLViFKWoH0KVFC1kGiwT2kKO5suSuHt55ejsFPqYH9/6x8UouB9csfe//Nu9R2V4tT78BnbOTiwWJ4P58P8RDAwfehEkp8oTtVn46NHDm+pz1a3wm/cZjtss21uJihObTFzS/DfxPs7ilMn8hPj2xfnw8GBwr4FGFwsh2PbGjPB4dz0Idi+/v6OytS2xlywHRgNlPaNnEgmRg5H04dgbGYhPnI4ym07tBAfPQyfI3Bc0/B7enBgdGT/5K6hA7uHJseHdw0NDpQKu4c+2LsvOzoyPoxHtBUOdWTv8Jbh7IGhDyb3wMj48ND+PWODAztGs7sHsCjF1tHsaH55NFsYHdk7PrnrAMzuHIDPYK/I33Sz9moO1Ee+Vxt3nSm/vUoVA6iopXZyb50907610quTe93s6mSlVyJAEy5RsEbTQwDUJELN4UjOt7Odh78xP1l04n19TlQuHzt1ZLAncvN+iZPOusa0R7LfuYN7JWvPjkJYa2ScjslBDVjWQi5nqbT8jhv+nOXjdcphNqZBDnPImI4btiIyNu8My5lgUcQ+Ai1gXg3xzNEppZUJtGIjak2uwYSFCU6hD+fGSTqVKu80kxiFgPUOmqtoRplkSuRTMlmsOsds06woWIDbdDIrjDulBp3EIUMF4nF/CZgphQj3yQthTkeGYoMhu3hgJBHqjoIywXI6D79SJkTBSdRormCL+VJGSNuOCalRJSwxD9rAFYhjq3VqDCLEKeQBdoevpgdZAeQoulKseeMM+XYNBUNxSxxt633lDD7Kp8765o0Q6HNrZJJOyE4V7Lgyce8M89E747BJ35+kHlYxjg+0C5qkjQV0SSdSGyXPczpBXj+O0LjXWMhoNVd76/Bqrjxsr97m20YgkImEiwpICkG1CubgYtDNEnAsGN/4frsH5PB9Qc0p82mmnUePNq9+qUzR0XPcYYnJASuAmBczIBIpuDeMc4EZ4HBfWuRGxcwI+M31eVntBg19+YvW5UdU9apOXnTZmTV7jPV5uDKy8qEIIx3W7TWEgXmY+og/zkvaG/A593P70l33AIWOuXT5KEZjMgFB2HxWDmfkqjmjT3mUrLI31zmbFGtzmsbPm2fPd+7e7jxZ2bj0mKvLREHM0b9YlKQcauEeXiR0WXljwsgl7y4dMgddN7TUvaVDEngY/klYqZrB3us5LDZakAKyzpz4fqq5hswzTxHnP3D1abOI9hir/p68u3HrGdswnGGH63SzxQZYZfX5IKyaOn93y/A4wq0qc8QIdYwIMvJLqBqPoxQzILqtO3fZV+7ShGdqTkRGTTzlHHEOjwp3q2RXuSxIFRNJC1yl9pT5DPnPsfQY4uHN62c2z54l57lWuAljLOxCPjIDTkOysz3XvFEbfVzzxmpX1zxb7QRSS7JSV5NWy7a3qJ6DabQkqTBYY1DPovH7RVqz0r5LcBLtqz97zUXlJFK9saspBlWXsnY7Miy05xHTN22PhLY44uAcmk8r0azxYNTFfW5HVQnRdeHMaFd2b/77Qvv2SZXduD6JF5t98EllSfKHlSSu+XUzwtB8viNYWbacEt6WtYpvZqvOfmRk74hXoh2zrGghkWoj+uXZM5R0oJNuqXbKA0dzVUu1tx7d7Nw97ZZqD2VPJ+e4HmS4p4ASDU1hynrgDlsGLnQkFr2go8sJhMLTutSw1c4iBPxYKiTupBm3GJKebX7KV2UNl2DkwztwUVsPv/GQ5JJS6wZ7znH0Rnz2UIzIVbYe9FPWiv4sWx8BmsxuZhDSVXVzvNPjFODHLZNZKXJKSevc/fXnn4JG5MQS3txUR3P7GBqSIuwSnjeyT0maJZeIK1IyYV5qWf/1pk0wh10xZbeohRRceW799z1kuEptLqOg8lrilQ0ZxJFlG6cnhDIJdrT3VIKpmMOa4NpjTwccl8Zqfos9WqfB2qZxo+akbttpqZnlbPH2Xw2qnnqf+sM5WP+bG+1zV2wzTJAahXI0k0L77rOmbRZ7PGYg0pbE7/OiZBS6y27j+sPNFWtawPZIrMu2QNxtSjlHi6BVy6Fo2jw+6gjU3WY5vLpCF1NALT5ZTz6DC8qA1rxIGLGJBdMtLPcsCYXL7mAPwOwiWCSvCFbwchd4xdPgPrhJ6r64c3HPm0ZLvK6QgFu28fJTlRA13jxjCXUxpf6QQRc/Z9hKAxa64iViJtQc47pcQ9kXc2+cCn8pc8Dp7+hOvqP5o3NN+enQa6qdHtNX1bM01JruOWrtXNcuJDNX+YiZ63Lp5WJ3nAG9/Q/qd5C4KNf6tzZ/15HpAemh8LX1jOuUBap2p7E4XVvWmrCuRal2pLUgDWS3Nlwvu031vW+oiU970RRYySXvPMoeto5jRKQMD7U23E04ENKxKvpAfEX2HqZ3cXQ/AK2oOYWXJdvKWaz0frho2OJgF/wSdjSY0UGKig8FGfo4zYNn/e5ICuQ56KYn0FGAQ7ekN6DxEUwXbHDBggcTUirbgwSuplbt7CrllBLt0p/9FHFKC4u+6lJSrshRSePIGEf/cPmOlOhXia+yPi1rfRHrSlYVp54gTYsyX4SZLGoWWCqqesoo3x9OBebzB/r4w+1s2h/u7ef7w+2U+sN3/JE/nPepHdvx5/3hpdmZQ0fqYE1PHzmAH/y9GB6emjq0Bf4e2jpxYi4YHRkcmFieC4JG8eg2GA2OF48e2UH7lA5PVQrw/8ThqWrhyI56BLvXBrL4dwHJTYz9fTg7sXwigLmkXJo5FBxvHC2XZg8tHp7aCvtUFuLpIwPzByZgmzmYKy7E+SPwmd62GE7B5zBsOzO5e2xnbmJmPDs3lt0PB/MBfMZ3DQ/BcH1Xdg98HciO79q7J1sfzc7nDowMZIf27tl1cHJs5+TunRh0vnfPONAoTmQ/2A977x+FvfcNwW774PsIEFvqVY0Zn5piWONYrShurlAB8Jo7DnJAJ3DBllan6Y8E0nyD2Rjwj5dUYPOlOCgHGSGh3psq12c1pMV70z1q0tlJNFg2rRtrreenlY05wHo4XzUehwL1euXKD/DycpY79UHHfgNJJUNRllGc14JyulWZF7LeXmrQShhWJp7HSB5aB+VGZxe/7bz6oX3ul9bDb1s37rVf3ZCleKaRQeaaoyVjfvSzO2rjnx3GEgF94RowciKgzVE6oD1u4Pq/X3EMFU8+DvrVIWNAC6d03JYhAzh755pThmwWk1PqjcS6p+C1ojpuLl/T3kimhK9iZmSBHX9NZxDm0rqwxp1BDA+MH8ZFVAV8cBs5VqPYvF8PNE7RDoc62rzX/JUUOi8EVzBPGk9247Pv2ue+2PjkQutT8nvJLhmyQIKqScZOamh4EGlJwYZLbAeUojTSvUdVPIjo+tra+vN/syeEKGbM3prXHy5SYr8fyIUB5DThNIzpEci1LGUTUeef4CCu1rfftK4+3Lx60kZw4RNdc/nhy2s8AcLJdQ5QagjG79XT5L+42br+rZIvBejaUeIJtprJJ9V6IKs/1YSEaRVe23LkTYSNfCDVwcC0OGFahMF7RIkEy9KE6eLl1mdnWufvd376hq47BjQnFDmpKm+RzBmXhTHM2ZZJzaQZmZbDTzmj03DDHoLPXkp776RCya+yOp0sxsFfQT3GueZahQPgwBrNJRlSmSvwXpToWjaqXLlibYGfCoJlwJhCBH67g73Ab50FU5RU6WwlkB3rYbFqSjgTJxZ5HiMdciWfS59Fn9JnkeeSVmM6bcRTZGu+HPY13znYd4XqaXKmJJuC7ZvfdR5/6JiCS4DppKqYSlFKmLa4SMeldVy+HBqEmHB1GZarXG8RyLMwpQL2SDwDVyGp1xp5p8EtLqBQyXhPP7FADzljO+6rpLgSqfSGefMpu4m4hjnpLKxJ+ujF+tonGw++cTUXKMmIqWu8vDmOOKhgMCFbJklBNvOG+3DllUq06ZC/w7nz/an15/xwGraYT6O1FOiSJhnbnZIrM2nEPk5LrzDxSLPPGEvSsQdSL/vG05fYOsBcdgD/Nba72NY3faDc+wuCH8S0dCGVccNKxjnMiOvMCiN429d//UoZod84DEsujxpYTBGaCSzcQUo31wqEpqmopTfT4InmvSWO8KKc3PXnX7XOr7RvUEKrbITtXxdNWWW9dIEI44I0HdKLFmQMK7O+Rpnz5iSYvJ6E0Paf0qTO9UKSgmkoT+WrElNHJJZQ19gWsDKRjaRg8IXXhF5SMHdNY/nGQkao+JyMDzBvfov3T+lp5xsix+4/s7U6/+hJQqNVNdKi01hpOT1u5aqI2LdXTHPWZy/hb+vKIwZlIKdn8+WGsdnkoNWRTRzdw7f905Z5pvkix2439/q0nn8IRpleH+bgXZ6aYYVWW0kC2pVLVZpNmvoveqmK3HpOOg4wg9aL19xxoKYHWeddHZ3rsrHK3Rl1VC0H5DZf0JmQtu28vr5OhcxJ3Xr0qZq9ACD37fPGe759FhTpG8iAyHkDDSQiVjQ43xN3pafS2AtjXvnc0PheYuy1sXoNz+3Kdyns5WB0o2ltrDu7YrXHWaEReMmJIFcjU5GLUuYpJygvq5HW9bD2/fpzsPxPr//6OfsgpGlgEcsjCeE/VPhmTIjbW2g0MVDHKtZGExvCnpqvRPWkyC0mysVIPA7OYNJ8QmVL8dbN6aLNsjp6AJijD+b15+LuIRoZ3Ft0fVjFfiqUZ8pUqUyAjJp1ITNhScND7tR7IPKty8+56gMd21I5qPhwvHlLpFpY4HpANEqVthBIoMXDt0VWASR31IXkcGM6j75qvb5lUTnsuATsLCIXsgqaw9myLHwqQwc1J9JYhtlyN7Qunq0rFzdufqc8sYxmWA2OBy7XWTxfyZj1hFPQfMIzXcJJZV8KaJIAVJQp4gnuHJHp8a4J664XTRj7Atd/z5iLvmeGSeo9s+IQX6uGserzXYOASopGClLXE0c4Yt9Yaml6HkRi69RXLB7Xn695srEG72e4KEHFYTmKy4nLgGLT4wyV/uvPFTUjrRS8veSxXH9+fuPVPylIlAg73HoGqzvOBfvVeBEyDsAmIxh9CQyurUchZcP7tnvKUyBBr69+8FwBXYa6Nc49I1ltY8cqtu+Defpdg1TtUMcCdZSS6iJf/ajWMfpGOht6ltQfGFauNWXtKBWojhzlSFuVmI7V0mWuOAaKZyiogaCmQRqHe+i7P+ZOIW0PY7sY0YJCLqtsrBQD/RzcamArOUHS4FFBo4WLLgxycI+HQhR5WKAmLncjkapGAP2OHdcNWjm7xjjFAVwOAHG+plCOwTce7PDdLj01vmp5R787thqpWEePpxSpqk9HcXoa09GTnuJSdSWK6s+/I93C3pHunpBVweqIVLkHKrTeIb9ckUVpGN1SyvjS4QU8kPlfKq67Ox/22MB61HvvbZzqPWbVr/5eX786ioRjx1R/HHvvzzvWZwu5w2OjQwPF4MgkfhYbCyX8Df/249z0VHgUhvbVK8nk3Mz0FHzfs7S4UCqdqCT56alDOLa02CidqCfj9cp4PJKtwFsFIwvL4dH55TA+WoUtauVD+S1AbTtwmJueWtifnZ5aPrplNncYZqIts4XD24tHJqeW4fDnZqa2F4NJGMvB92ngUTvwwcjgQfwcGBkcGdy9c2hgzy441hMwNDw0sG/Xnt27dg4c2outDreOZgf379w9kB2HE4C5PYP7d0/szY6PDQ0cPPDBIOyxd3xsFL+PwP+96rVQH1OuaCaeX8JPUY6a15remlSTdBXUyJsH+HI8ldoX7fPfta5/0/npo/Z5LPZYrjaQFBZyXXLWhEDSYzwgC13GRO4Q2gMchSZFMzeun29f/ZnrZhItWzQTjXApshxiF4TmqtjfXYMUffb2CkVBwyMvXTM+e9y+cLZ969f1l9ir4UQoJrixlKjjXOATijE4uVZt5HoSR/Ffyby9WlTqG9/d65xeUerz+cTIHI4xJT2rWUISdwqKuGjGCJPmTWe+1pkfuSEftqsLsJZgsWC6YOA3dmiWqZxVQAVUcuyxh8GES+M+wJLgcxmf7ubZf7Zuril1avloSaMhItHG9sEABcZDWpg6YmVGhXeldQgnVj57sbH2742XWKM0DLEX1Xxi5FotTnKIYKsSzky2AI6xs9SMsSfb0PSu8/raGlPXS830nWudVBtJLTyoRluAFlk4TE1zaSIOu2bQjqd8Wi6OvfnhvfbV151n35rmBrgdhs1gUVjTQInY1DmgJW7Um6t1w4Jj5gH657j6BT6IT9nyO7nWuv6KrjmctUfPEME4agEKYCYlMcY+6wjiOQ3ojt5eKqG2IsLnnncenVp/8bjzTGq41KMqdQtckibZ2EEQU1WjXFLKGMq2F00+KYZlh6fatDqD7yp3UXePglaxP11fu8NHIFgP61zYYxAPfa7U/NZ9pnBE7JZKpCtMP3DlMxAwT86adSVMYJ7Ny2JxDa78nEMGuxADIIrSS1VU3w2XqM7dN3QAItCm8sbrmdJD6J+8GXr7LyqT3u/UPzmZOntzqO7LXwgTXjfkS0D5CGHZjgUWqhMqpDYgP9J1aF/8tvXxP1vPT3We3XWpL+URXopfD0t/VKwFWLKL/c6MGgYReZ1ZlHMMM7eNZlHevvEDfDHPPUe2CZU0r1oCOKXoc6kh7Ah42Ap3hwsLeOVCgs1jgKa6SapwGsHQD1NluciraSjV6kZzdD48uXnyK9Yc7CfGHVR7WIpdZZ500D48yqB5v0K3gnnxAwWcOmfuwQ0Bfl7tp3hGHy1WJiWwI+3NkKalAZmXhLloWMWbp2BJvKl2rdHTlMGgzZoNE4lQZuaCGq9tgFpnghzmG+GEw0ZvuclmWC3Zm/7lWvuLSxTmC2jwuMskieLm0xmEeyIsYK7IwfFhvWofLRmm1tqMNO/PUgUY96SunNl4uNK6cg7rwJhTE9dXGWvER3FCrJysNCe6MqhGxNJcSn6aecZM9OCa4qdMMvYJN3kU8KsUVVGml0NTfbjPMK7b4D3jGqgEME49gluG7pzV2yTheVvsV4ZH11gwMVBmQtVQkQvl+TNFcSPOsMtI+FHhpC/aVx8xN7l+S0Elo8fmZWuYV8nxTAaSrJEPur2W3JZTIM3XHzIH7OtawxVwXKFlPc6OKBKWXFM0jLAWh/i+CrAlulHMPKVo87rS7w+Oc6dmUoa/ts6ebD35R/vca15HoITBUjLrLX2HBpRK2Rp3Fbx7CiQzYIf7y+5y+PrLl51nt3U5fIlbdEWxvx4ewynku7hxGY4G+2Z4k3dtUaYGDFgCLGOOhNp/3F9//TUfhvhXQPXDs6uHYpLO+cKhe0KqNtmBfKDV4PHpFnNwzVSFhwccjUKqQFMPa7UggzubOidE0ar7fBKzk43oWmWP/tvAZq3fM841kd2vHm5+fJF5afOuJI7RpQwM9fluzDCgM6KC4Kg3xOGYCO4MRBXx8PIyg1MCdiwVCODS5QF8tFZSxAs/qeRUF9RFIYdXp2ih7pULrY+fGKgbBw1TI0FgvSw3y4G7ciYpBIzl7Un0FzZ6Mhk1ElLyhw+HjQVPFhFv4pQ+Lj6slCZJH5avUboPw5WH7jGoVLT8U0rGqDIKEyEDzNVkJkaEjDAK4MHi6SKmfhHxgTaWA4ccS8tGE7iAVAcptoCptZ6fFnHH/mcX7kf4PmHMPkvTuVBao8KNimTGNhB326a+eSDt0AX2Y6DRXXiLVhj5A5AtU+fUOBA6aYbwPMeNGrv4EssNbYAaF6m8dxwYeEw2P3+4ufKbMoFto8VC4PLo6ysm09k3pF2YpejK2M7uo8Q3Im3DquVqbFaxVsWWdO3K/tapNR0du66vOecacWq+GaUVsFElsadhVX40X8yrBbX2KVtQPY0n+ySljCU1kTzjiNkyFrToj1GeIDvx3yVVa7GwCWEQO9kFjNTBDnAwuguXLUg2kdIsURUHuwi4D/h1cW8XLE1hUh+OOpKjByBUFMhVgLqBH79K/3OAJTrNYqYe+Elxk4OYUroQmxgi/OLoqgjsJvOjJ1pxcApoN1BLsm7KX8Qaf8H4Y63z7KYLCMxedbNG4OtcVbRGxZozZH2U0kQqakW89hTsHFjKgrdLlbmvaUpzpPQFPzK2rLdrVqg1Qb1iu8WmJ7v4IXtazRhvzjcXgTM9oN3yqSviGuZH+0dcy2yPiGu7X1fEtUypZ3j7n4i4xsM8tv3PO4bL80k+KeTnjxzaf2AknBjbuny8nDs8PgL/bQmOTk/9bevx8lw0W+Tvy+XxkdqM+T2yOLMnv2O+AD8n4Of4/Pv5cdjmOM7vmK8WgO6OEnwvzeEnKsL438dHFmsj2yfG5qv/Zzy7dTI7/34ysg34VYBAJcDP0an3Du0f3JYbHwEec5PZsfeO7N83uWf36PDQIH7g96GD8Pvgvj27hwanx7P1XdmD+yZ3bw/HFg6PVA5MZmHr0cHsyPZwAreHfwN74c/hcZgaHsqOApmh7N7RYaA2O54dwm16OYijfLV5vySeQGy1ENRZf+LjgLFFeX84wuo33MVPavyc4tXLy49bL56C0mt9Rt1aYBfcA3vXhCWnMQn2K6WmXB5nbCr8lJ1Q0mSdO28l5hh4G+OnwuUtib6SlcFo2emtsMLBWLhCuHqF+yzgintUIzcvH89fQ9FnGKUIINRkRdofALwXTCmPJ6e5iAfWzpQNpOMCfjdOi9RPQ8D4L5iKeL55S9svCrQVLV9TmuZM4lBbskNK8e3VJWlHYiIomDgGnaxdXf/tumUB/4GBWqk03Ey9fFiHV4mDs00hM6zIGZWjUoMj3fxSZj6zzU9/UzZczczhgG4K2DXAnpMK9HCwmiyhC6BnfCmGWL15ULGB9Zf/2f7khUWDuCgUxsnscY3fD4y1I4jV4eBhVUsZ8KqSZcjqU8WSv87zZvrSdQ+HDbMwK+qaHIf6KrTP/dJ59n3r4c/8KtTLjQSRdB1BQzU0fbzyGH5jSdMb1z1GyMqsfv9Ay8mnCgyw8PG+8bhF/b0M7QzRMAvqeC9pUcJ9rBE96UyNY4C6H/oMNWsn179ZtOcnrHPy486zF+2fz9knDPg2tA9WEhXgrc5YHqTSC2FqKEVeHH1vr+J9UhaAdNpfPiQIKccLBiOAm8CP3UJMKoXUdCDPtjoeCnr+yVi0j+/n9zY/vAf2Ikcb8eYZ3LuhhVEW8flQyvZ3N+FVrCBWU7KdK99t3D1lyQLEXDRLUESPIsrDAiAfdtVIrCjbWTpBFyh5e4kr8sck76gZPV+g1qNfN789A3Kus3KBLhAlm5jAU7OEnsRJ2RSKdmNaA1NyDifTMa3EhdA852Qxk/b5kyYBWA54Ni8VEGKE9RLwZUqz1ViD6Lip0sYX75ZNVZ3jyijImGM42yvnMGf1zNPO3dvAev3XU7aEWw0DbqoVhOehvwQp3DkYVaPPJBZViJtAVKbKgaiWnsai1tBBBGgJuNVAxFRz2HqRmrmwi1dnybtHnV24Fzn2tHWD2jbuXdKINrBA2IPM3frc7uTcvk/T/qUJAo/KmFLNcIVBJtu6c9cYAoZIsRrEuvRRcPPW3bjpamIdq71CN+nZc40HCt7E19JYACZ+k9w9ak/MUbB6wVmcCPFhyhh+Rp6pNwWLflFb4zqLNKa//up16859foNkeQItLueG2/MiZ16ZkGjixkZFpqivneNTI+CtZ4ZR4TfW9LQoBwi3ryRp3zGi6WJZwmD9JRgQSXM4cyLsswRjMAoHWTE3lN53rvmrMOViFGqnvzqgd6zC05W7AxZztUiOoT/K3mm+qKrfQHJ3Pv6OvQeSuwPvR7goSaFx0ChjqgTxlfANHDEMSeVVzXpPc4X6OTPB1gtqbsfE0PtWlttVM6fhtILQE+jRBaL89mrNO+zWnSftizf1sA2LmSSDTR8EOqm3xrBw/EK9OTiuCubQ/ukSeyuol0TaHZTnTrUlfL9KEmo1E5ZDWtYum1FuH/Kiahcm2z9/z2uT5ahIOTLRjMbPE1EuMKxLatxQIcdPMhMCnbiQ4U71KByJYOvytc5P6ARgeplw3qRncEdxammjwWg86OSocDydzQRJtxbn6LR+fcXdeLUAC4jhEoSXHZPOiKk2Cj1YUmlh4y0Shhsfnmu/PilCzSSfYIJ6vSttM73m4cwF9YQB2n1uxOiHWW5++/X6y1caZhlWg1kvbdMlZAMDndF3lHjwOUmVB8NJqzy4zLj2b5V6/vp2kJQCdqdS5g+1NscIPGv0XL7dOrvmmju8fzoGV0b9GFwddEJuPRacjaAszJ4OC3s6JamWYtSmPRud8RWn9GmndTZSnLe5IAcqTt5Nq9Wae1EVeuyuDqOcOyL16WZ9wp/c7zy7q7RrhSQputStzavphd6QJBaawoURl+ZNmrcoLe7hV62Ll9tffNp59tyseoKgQyslECdmWF2MYmv5siQRywKraJgYDCCImmNJ6rcxzY2rT6QxLAVfAO1+nuQe9BXbiY2CDwtZJ559bu2Ad5vBjgls7MkyN9+zRqSWfNYYf2MxutYoG3Kk69F0Q3Mc62hL1LBjFarh1s9k8y0133RSg8kxlVJGkoTw9jNQXLPEMUgsqlfA71gHahPYSfGCO1C8F/pW1O3gbTfbwmJci24V2HqotgtophCmCy4VWPqoUi+UdTFbPNcFFR2Q6INDHzP1BEqen9qHXw4s6QFHFIhYiCDPs+CBHiBAVb8ofauVXQXvaGJVv6p47cW12ra/nlVF5+s3V+lYReO7R9Qtog4RU2jdyGznqyezjbR2hLQjJJ2vrphUAemIxn5Cxco/lXwi7/o4kUU19atj7Uyn3cj+nr4f2ZlTR/Lf/siRbLTksb8ZT7IS/k9ZYMGGTgfrcSOYQWH433AWzX/zMe+DbZaw5RM6Hbf/pyyu/Zd/Vv/9H3GC8d21EXfrvzlbz2I99EoNN21fO7v+fNXdcKtPlo4Mj98eG7wz/9e/jkrQXj97tcy1wXtTLoFFPUTXBqO0kmXQrLukNkHlBB5wWAr20gIJnF41zJUa9Isv5B74euzYf/zX/wM6or6g";
@@ -1,2 +1,2 @@
 // Obfuscated production version (zlib + base64)
-export const w="eNq0vVtv3NqzH/hViP0wedn/IDmXJHPeTnIyQIDJQYAEMw/BgUF1Uy3K7GabbMqWBwEkX2T5Km3ft+VtW75KtiXZlrcttXx5aG/4ewya7NbTfIWp27qRbNv7ZAb4/7fVi1xVi+RaVb+qVavqf/yPf/qnn/ysmQzWPb/pd5J49qeff4qhwfeCWT+cg1+tzmBzpuF9vRN5QdPrfHlxAv6zGOKNo42Lxa2zoztnxp/WxudfQct80EmyeNZLMyLy03//2dCfDhK/B/f4+K/n0/WffxrszzI9b7B/3OsMNhJozN9vAL38wvrw4AB+Hk2hg00yToL24Pl04MW9TtCO2zhobNpymgYbR73B1kxK4x48OOl1vl7Jmkh++aC49Q7GXdw5Nbq/BS3cx4t8oBLMdAMeuOLinwySrOd3cPCKDbTB3dI6eDkD1L+sTVVYjd9uFHdf2qyYVIlV3AiTwWYvTmn8WZriq7Ea/XaAr26w1fO+XgdewCYePACW12ZSaD98eHu4dwBc8idPivev8YEawexUlnpAIkAKNVyCdtgIZjpxw2WFV0K4FPMVeoFfXgBPm+F4Z2l0/4nmFrSaQXQ87hx1+cGUChudIAmmw6bXDlp+M4mn6Mma/smw57e9IDsWT3cCaPp6ZdprwUSYxmcLv1w7DvMh8ejFDl6egBuK3RvFzX18xk/b+dkn43NvRwdL0D7T8OOk2/W9ZtDo+FmnyjkePEo7QZB02/REvmLeGeyGcEG1f1mDSfh1NZo0gPGzR6PVpeoAWp2w2fF7aRI0O5kzigBeZQr0w07s+WErjuJOg76jnzXCqczzB1tW42Af3vTg5Szxxzk02J/Cr93wBv3j+ALu7hQXFpD/3Y3h3uX88Zni1gNcc0RjBojgGumF2TGgXeU/eMY/LPb4iqSpjmGJTyB3l7nAj+ZgsxPSzJnDb5kiY3gReHMnTM0FWBq40F/ymhy8jOAbrIfHkB+8eZpZw4N3w/5FeMrhp4v5+cvAOl95wyt0LoC3qyl3mLvNqx2kamLDQBsTRoKTm6+2YJXC54Vpd42WVPb16jy8+g0YzFVYOzQ2XF03PucP7+Eavnu+uPu8OL8AA8OZ1zseJ626MYXBHHxamBTwVtI4bKDE6ARTNKBoKrSuhOrC4OU8rrDwBAxnsHVCPsFo7UJxYzn/+JA/Qdrj+z1DpY7hHEzvCi9obGArPnMDVvRJh9Gw/2z8+xmLUQAyaDIbL/XnYpo46haeTc2QvjMKdaC+MaOY4JvFKXx5e7yziFzunpcZhT00nwoXEBS9KIOPaT+O2wyfquWJkiJhNdigr1bcu1ssr+bb9/Llc/RE1MFlFYW9wXoUz6GIGDzzs16IU1C3ooBoqFZg8aCJjN40eQYP+qgDx5fX8wsb+YXP+esFfLsxvHvsAYzgL6BSYtT0GyD4bS6mqcXfRq0P5vXH5Slai/187xQu/gsbxe5DXBDB0QQlqM2Gpnvkz4VTbR/eEi0FlAFqJTiXQn0Nv9ExVFkt1l/7KDPXcUTF6bPFmfvAdrT2aXR/DemAuIuCYNoz5FjWJFMxjNpq/bm2bfCSVfDOPj5DBvqgTCnuBVGcTsVekP4lQUyCwlE3Jn4TlIZSTIM38PEHm6R0Q3xPoNfHn8/ln27lK7dxBJoWyHhYZ6QbVJsrknXrRKGsOdrCmBm6YlhxVULYB8XQhLkXN/XjNMNm0E0DfBWD/jx85KzpPMfw46/54zv6OQyNoOm39bdWjWkw+B3mbzsBZRrSY+tLPIf1FYJvoM885Arz7SouoWJxZ/h5HVku3VJzmHt4mhC/OpBXg60IVj6vmKzJQsBqJ34NdeGPFzCf4T+MwWh246PiBDjXH3+6hnK+/wyelCZDF+YDIIjpECkpxKIIw4sLE5DrjFZqWhlEvslOlhhtvxt+vKu5ADwJk+Mul8jvhKg7oqDr46gjH1cOPvi0F0cZiO8eYVUQMghR9yNcmi9JUj/IgFP4ZfEovsab58bb/WLhWb68ln9YIGZA0BPyDqt4JvKn/KRX5jarWulBWp0/LrdEFFT5wWPl75/gHLRYHk3i4yWOIcCudqi+md/NGjErfesSTxNzCZFmBzWhhflxqb3MTjLePLy1jdLo8+n87G5xl0RfAvI8bsCUyeK2n/j8blEtDB72krjbDgHGZqnLFy/7fBU/7ODBPIk9Al3Eavx08fDcZeYQ6HtLTIBgI0saFvavtmhrgEEIPY+2BQ6vA6TbtQ2BHihMRdx8n7oZotpw3PMyAR0Wo+sb8Kk0C5ANicMAVg+ognbL50+UAjxp8qLSzQRVpR3nAgqLzBJK+4TXtu/kS7v4VUDpXVjnlUy9YLrDikZKFYYOLLfaDTJHdQDwsFfm1n9aLCza3DQSd7lFoM7XQ9GxGQhGRg1gXfKskyZ4Z2IA0KMRGueZD/jhyxotsPVlMAHgGRGKg9W5filf2RGBhVQ8Jlvl2o1LPKlhsMl22okKn4ubhwvnyxy6sU0fAH82FaM8HvT9lMyKMBrspl4zi3xWqrBKZSZ8Xe1p0ynvv88Xnww/Xhv3XxCIjPxgxmNqov+YMtp8KUGPagtK7h7aJfRRGJcwWB0d3B/tkin4+Fn+oQ8t2Gk+dTikKNXCXtDm9eHPBh0/IkFurrBEQDkp11D2ALhqsDyAx3sxS+vn6mjrJsiB0ZtPbAx18H40EoQSvy6LJX6RTkAQtcxPmkHrnhSJQ3aCZQRuwCLCL6OsL/wy0KvnOxz/+9/9lMKs/j+DqNv2T8As/qd/IrfGYF35N2zXg/Y4IL6pcTNY7gWcRyUT3zbuJ1n1jonNgs5MCGVFu7a6WKmWtYxmWo1dWjJHJxigjArkVzv+MZOvZOmVbK2qfUX4rs6oc225qsUUGfvFNVwEnSozRRsoJctE97d7675ifRi7o84GsCC5/sjhFLzjef7GAMSK29eot4W4S4DX+WUDaY2fJ4BdC+I62Pbr6rxBte/fWJC2BC4d1GehSo0lbRRZwlYOpNImouqtkFMJMmkF6KpDfne1eKWEVOpBigMPxOwiY+u4F39ZbNHEx1HtXYCJcPji9vgcq20XDkwenKuatVK29bGlBl2lqL+MqFvRe7XqTiscPQtZt2iVYukSke9G0pNwahnhtNbPf6MPWCfDsZv9w3ZZKaFQKxtTHyyN/wHrBV0DwWzz78V59Y8//d1PICiyVoZgi1ZUzR2dcL4TTrwK/TvhTGPS5Zk0jFqILv72b//13/10FJAnjOj4T//X36Ed1sZ/dTf/yBERaUfg5iN/CyzRax0GEdiCrShr85ydL/3+ejfy0KeIAg7eI9nQny4WuzfyvdOHDxfh53E/AktNdyEB5yctsJlsOqkflZsQN3x5gWjYor386/jZGU0bZFCWlKmzPZ5MA1BBO/ZkiNOSPjoZ48l0hiYIXEniWfqSX68fJTTcI21LFjrNh/HFp6Nba+OPB/m5Fda5STCNvYFhEoN5roQLatqwiaDcJ7IzEdElVSvtkcWP1utRWbaEYmGyh1+vEE5e+n104V1+80xxfV/ULlOo48keEOQ5B2/UVyylGVlOgbFAivkn5UvxUB2rCU/ulPz8s/zCA9ep0tM9CVW0YRWRNWqx0o30Li1GyqSxGLEhoxmpniU2INAStNfJRqEfWdRgmn0Ub4N1nBaHvz4urlxFKnGCXmy4J5AvD0Y7oMNwKkzTuGt1183Qiq9FX9Dyc7ODcsOz+YAMHZ/+CEJEM5zvGeIO37gF4AiQUei38RWF8A576RTZYHEm10C24WQEzNYOWI0A4toHGRkirvx6/ZhI7lvPhgeP8pWbZNY2IwDDzSAFAzdjCQ5zIEEFVOaj2yPcM3G4MEygvQWXF2CF4f5FzQ6EVziHCMPlyE4PnoSJH2Vd4Mne506sprfdzpIf9HHY89iGwkXMLufit3WwnmAFY39nbnN//orZMYdg+bdDVJPr+TO9EiH0X0ZZDz8X/Ak2cBKTs8lqh9fjD7aknVwOuDMx2IC1ooTAdn+0ujTe/pQvkvsJ7lWMkIIzYmrgAZtfLjEhY0arieComkgm7vpJj6ZnGvfKTbioyFmGwoPeQo8dvsWNV8XNreLKBjnZoBtSV/3U6rIplX8bgvjZdhvkaUGC//Jf/svhwRW94MpkSesDJZwFATotm4LQqq1k2mToayEsTNKWDPeD/OKn4smdYu8svuIIukQ0K6QnOz6BpMNCGnog0yPbYgcmYqUv46rtBMHxHvryHXLk4USjGB+dJBj9CoXOVpu9W/gSbl85vL2KDPmTSS/RNDEJRcTY8KxscwBIEqFoSKJKQQuL3C4W8dGp/eHegmYBODvulpik5Np5Tg581CEgORPeYFM7AW6ztSlAKIr/NrsC2/fgv86uQM90Z1dSMtgFA3hGtJnFMIm5PSqxJN0CSMplOOxfLG6c1QznsXeFW5vEhwMdKy3k8mEPD5ny4XEkg3KVxZ9RiO0knPZp3C4YZecsXYsqxL8swrui/V53/PmHB8O9Az3+dujzrHQZk9JJU5gCHaA8A1OMJTI1S+u8n4g6QM/bH+Qcxj0otvXhL/HA3V0Y9T/DtB3uXST7DToH8KJ4z7PGz+cwtHx8/JSaK6s52+uHW2CWNwN1HTkAx69OszfD8gGWRtCmRZcG6LAglIN72WkQqt9k7/LjfV3tsbE7uvJq+BGNOnR1q6708nDvwSIGisf+Cao48si5zQRjWEa0/fDbk/xcH6iO13FGTEdB2itRBgs8BguQJmoXnkAsXtXYSfwGud3E4bqFX59MFmvk42en8oUPw4P3evwA17H/fDOeaisZAMtlq4s7+jbZTDeTJDDsBps0xb68cFmNntwbvfmk+UDvsJs6fNBViKYhaPYTIrRMy2yg5RbYk7SXAqrs+izLr/HO2+Gni8O9TyLF5jUZooxLsEQ8boMGKNOHoQNCSrx6PsOPN/Knp0rcjsczJW6kHHtxh2W4/YOkiPrCo8d9/raiKekecdiQs6wFMDXRfetbUd7y/y3Kw/3zxZkVTR89aX7QtlkoGOkDROniZmYbiEcMS8uX/MFrHxURfdqNxCNn55fFpmyVEuw5GL99VFw8W5z/bIFI6R+FKIzEHk5DIKhZxS1YVYnXMS2oRcgleG3ao6WBeI4g8ebhoyu4KPaeUhxP6BBmZYwuOtBUrQ5IBV+r6JCb/QZAeDYgHmCAyNcrsCiAegvR4wx5BNfy/c+jtZvFu98JPIAMTlMfYzqEC+CXuOf5UzFbnD/RT0OYNv1pv98he/d8cX5Bk40iv0Q19tqAPyV0BKY8fCMTSjJ4A2ZUzJZhcfFlfumsUtPwBugehsxdlFCxdAoQGiV+F14sbr5NJKNJ1Dk5bTvVsVktU1UZqSXz1DIQjUno2oDK+ivZfMb2cuwty55TBlbJsDJW1XdMKseqce0L26iwzAhtPZTMFAuvfx+7u7Bdo3Ne198G0i6GdgDtBHSrca30tsGsBS9t2PoStDQaNORhPLhdrKxwXwtPWmjyR6Ckg/AcLOUCKxePaOhWwlAuoHF/TSZRwk9NC0rg/ijtFNB3qmIVG6WU4IGjvx1goKQXvBF6F5/gdZCzzdLajrZ21KalKpWStLRjQuJfqy/zkxWXUVJKMblKyaiM5DvqyFITRi5bMlvwncZz5O7WktgSv7bIXZ9R4idffcHix5WCKPS01PsBEViVXcoJCWLh/2AH4Vzz7ysOyPJV43ys6accj+VL2un4NxOdjtBlTvyNc03/yN9YDsfBOkwIL8yOkY5q+KC9t/jH19WGBOyJhwkfeesxwEt2LxE8CyOvEwZJMCOTGl12oGaFnv6taA62ZoUchhx8WaNvsHKhWFktbp4r7r4kFJ5wH4tuO8SwrRjjEWGpZUyp3EKBEhz0lgw2tVENEjp/eG+8cImNasAfqR8kMOO9+Slk0HM5hCfVToMwCEBwcAtMTnQEoEh0Obz6JT+3YnOgHg59eBMclZpSjOsjtKUHmz15SRSVildQV4HN1Ev9GYpqIR/SBm044V/00l5gqCHZ8fefYNze1sPhXn94cGH8GWV7B+NVOxlaEdNxz/oyPrqP4F0hj5avmFsMPXMPT/QWmi1N+V4PwraOHMRNm+VX8NEOf3vIMYPNgDcs22W+jHpA+DUDNJOaDMM0HOIL8C1QoKlLg/1pnDAg/XC2vIzwFT++nK/dyy/vjl5cFJN0BhbRtKd6yTvuhW3CGxbTKi8nSgmsaNqTN7wO186Nnz3SvEDPpmE7BfNNc9XAGmwzH4nBS+0oeC2/YV0EpLo36JvN0+ZOP197oDD2TCNrp75s9E0g1gl+iB5MVIcabRuS2xTdcDbNiJ2yMUUDl0gbtyxJVZxy+K3JJwvCNV95riiQt9efjtM/O3qHsCKZ+g6xGDfvfZGQUcC/cMTcglJJnh+FET0/QVD4Ljjrjsu0S3ybjvltKEkM3LxHu/RoJoYi5O7ujM/3h/vLw4MFeMf4wfDggMMgC5sUgcJLGantSkuK4UK9TuCGtMh2wLyOZylu7wz7V2h+cT+YyJklLwxleAcWTYuQJoHP73ZH1zQFp8tqV05CH/CTTx+G1j01Z4M3M7ghy6JFC7XVK8ODJyBWWKjRvEcX1oyHbkliMlgHtcLLDZFy/A0eLT4LQaxUhMWrJeJxge0QeCrDw5rF4RyuWEdg0hykdldcsidcrRAlJcfPFkFKGvkYBCmIx7iH7yqc+ecL56DpfU8+3znzTRHtjEFkVCeIkA/irJ/tNlhPnUwMxjZqzhmUxgkibASQxdmH+afl0Zl3418/kkv3eBylXi8MpiJfwgEwWjtsGuK6xSK93sE4wKMO6cM7n/K1V5p0Dzdcp7GfRZ1BBIpwUikw4gw+I5iF1NZU5ijG/ZHX7xibosO9rfzsOxdHHLckinhdhITTW3eluW/1jHzoGkcBCDl0Esay9Z410DHEywKDdfQlFWKN6g4G2ebzP6DhivtoObAOR9ubO2jXkBke8bOkUzbYFek0uv5aeYCmzAhhXCHuBaRB1xdJidMubITZLFh0EnCClND5w66BztfVWZF4T0+NttfzVx+VHlHnNFA7AVhWI2Rjg8QIHfCJ6pg4xDXZYAJVDERg3cq7X2wm+tUmWuagwVOWI4d3Vsg28eYjnBnHAmMEwQqY4sVVIYLXwqms/iLbJxhVR34ZZMiWSr7yC/plVlmygnxCL0+zhjOGta2TbOk1/GmYEN2Ql3ttM1tk/eOeitugeImXFAVU3Fgubj0Y7l0AY2/YJ8gQRn6JhgozZpeZQ3xCc6Bki+xilNmOflvIf9ktzqzYnFPyrZX4wiRoxZFo01YSfEOL0mXZaiHd6f0sfW3l+U0qoiZtWmEwR6uYdUHcCflnk3/TF8RtwK9XOmYr7Lcnh+cu5dees/oBMdjwSDUcVwaaUPuzhIiG0WFGUQ62fEeBwbsW5cUbui1lEzeMjjx/OV/9BR6daTcT/zhiUuLRE8EYMY3BFvragiajTtr0fGAGCSM8PPXIGmHPHaHsDLCRAiA6FIei3jLQq71TCjeuFSMSfFwSJpoayLoIhgCQvmPbRu0UplZKrgWyjUBpeDHIklphhRZDsySxhh8pZsdQ93rZVL2/L1Tmovy7j0c1V+mdPz4DNGlrwzUPS3MUTX7LRtPWmW2UTbKE6IlqFHpJj3/L1KlYHcr4ZXOmYshMwtE/Av+/Z0mUaFiPxgGN+20y9PQDwrQerW2DhUduEwuZGzxdA8pD7SFgzOziZY1mQcJmrYBl3QQ4W4WyNehSqRmFJhWULIHI/8lP7EA0g8s0YqrVnxYw0kDh2yCmFsAINvgmtrBxRVnlu0Khfqh1ar6ibH9Mv9cod1uD2j9qtJmtxMrqixWQZQPV6R2tbf4nVQOLbdYFf1Zol6Vl5SP8CKhzpG/Fn5jAywk6nfg/eBFup/xvFZdizQ3Gq1jfWzkWa65q3+JfT/Qtql6NI0eo2/SRv7bci/5MlLUwQsCfo+Mq/iz9BK04F2QmrHNrnuLG6dAq762Mz+2Onh0cXl0GO5FkghdEvEGPxj4SoyVpk2eYGPnkRHIZOZcUJzyGqOJvNigy/xp5JpDphY3iykax9Wh09z5ZnA5rgJNEik8AoGj1CBvHrQi3/E7yUSf6xZcjDB0IuFkmP27n0tZlg71stMfDJxD+uAx/XUN8+2IeJuyUxAWvXzp8vApSOd97On7yebh3d9hfw2CWCxd4IcOcacthkR4NNSYYn0xVxokD9AbPG/EcWy90YkGNM8VxilVDyEs7R2QDFNZRh/Z10T/Cm6DDjxK8XuLsZfG8B1YKryp/LgEzzGc4n0zDYvLQr04R93KNrBSR8oQ06Qa2VWBi4NvBZShSVMLw87PLhw+XRgfL+TPCwPP+cVy2RBFHMx17TT+Y8ScOArfdKaADEFzWAnXDbwIWHVqHPdlOsfiD5GrgXsWU5l5cWhx+/g1fQoWtN+/LTlvbn+n4LY93bkVR24Gl7Qw0Feon2oLx3XtJfXt2wGkn8zCHggkDbFPAqZz6mae1RDEDGy1aYaxreWMKPbev8aDn+PeH+cql4d5ziovaGX/+1YlM7YTH/wL/x3kBwDAUGSd7zziX/DSe9VFFl58k8UM+q+7cq46Glx8k8dXZdXvkKtIe1yrujPFgMdT+7OsJw8RtwkRt04HU9dg3oUFzElLMJrqnBltzfpPOrZKLjrAVYkaARdkJ9oHg96fMHUu7xd3nACKLUy9HZ94NDy7T5q7vsfvB62ZeFKkNVeaLiAcYp7GcM7I4d3hMacBHimid1Q2BtwBfzpYGkC9fHW+vVwYQAN+UmJEKo+WNoSZxD74P/AuTLZDQCQqgpUsNviauRXrq0Jrf8Hur4329TtFguwfjxes80YtTG8M9VHy4wDlADDQUeqFjMXwewVRv+zbzhBxD8LhtH08PwPQevMaT3tgRJje2N/hrkLFNE1YNCBdfT8XygUj6epVN8YRk40WYuzy6/PFmcRuQ4Mti+Zfx9iZFxCRJ3MY1pAfopf+iF0QqvMtPGnGSTVFwV4diGzm2S7dH9oXBJqV0SWQHa7A+zUHMMUoHnKEXTo0+rBU3z432F3Gb/90yfvouyEXcEZppZXECH6yXNSrseyHpQ7up6Ydgb7H9WOVLh6vxBGOJLR6wfvzcYQsGghfHPctMaYZdP/HiRpgO1qe8GNcHiFoTpwLXcf7rG1AwqztgCGQxoO3w5rgn6SYG+xRqkuFpkMNbG6Pnl4uV9eLKpcOF+/nnFwQQjzbAroNp38UDhjhvMfBUuWNcfrTzlnT/ni0GugaCJkwDmUORdYM1niByh8Tx3tlR9pjCrNGDG/aXeHz5q9cwvvzTMkwZ2h4H7FkaovefVEhsiicdMD4K1q4XZSd9xnXuFRhe0oLrKZ2u63fU6opELsv+Ph+5adIxfLUVurw5WltGN9b2vbz/NN96xHuiCe5f4KsDAewBCoumZN2rw1Z4VqCjQE6HtFl1EO51HgvZPwCCjsIiDztyfB6VKx3uWkZbqL9SnN8CywwULAY7WdwJByE1GgUG2STBHMk+MCqSgE6jwleLE2cU1kUt7TE67+v1lEaC03n1yehgpbh8H5izI09xBFjR495lniLnU0IMtYydO2Bdk1UkTOE/KZ9Lp8hdZJyv7OVnX7rsQQnOd3wd6sTWJQa+JEAvRiHigw6cNrZmgqkXCFaBHiAYyk7TKQIvdITMMxGcZE89AxiTf1jgME6SYGhzhBGdr458fvm9oKUjcDRvhJ7TRsCWeMN/4/ZgvVUzgrJI1YOwJWndGCxRiliGU35wZGbYJoO3Y5r5EJDf9cnyt7OCcLQQnv6NdFKQ4uZWfu8MQ3+VFASYJkFHheHY7E6GUdzFB1QxAT2JUiwxJi843qHAeO0gYB30lGVqjyZf+zTeuWFlKdEDEsg7n/TKTjvQ5rRIPJ3dhQG3XC5fi4KSB0/2etj32NTeO9zu6X/O+zfIcsOTwjAc+EKg8nu9mDH/BNYpw8g0ixp8Vkr5YWwugAUN/dAm7ZmYBr8dnohBKXgc5guoL/U7vK3hm4t+Mh02COXFeJScuJ3kUxUUm0hBBjZGlR3ifOsWnrJ4eip//EwDVNmGTrIWPBd8hC5NRx/Pgc9OHNXgOeD99qRRobqzB8WJqtxx4eoIv6y19LDw7JA9suVfRge/1o4MgyLmwpalfOdgRYP9PNPoYEoCsEDg66AthqM4CdIM5iYowNlsCnfnmpYNCfcFGdz4D+zQmZJ5SuFyFKlBeJHDdsjB8Rlm7OjgNlqNa/eKl+v50mVyN/kgtsDYgY8Jk/a4nzSV2QbiXaeTkfGJ0ZjQIClYrTowkMF8ccKoqoNhf3n9AMCQrncLf9ebYJv28Nm0MT96dlA14yt2sTbd/5TVXjXPa23hCdbnZNtXb3P98eIYKWbLAuWYwGLtDehlNkBrTU/xkYAh+Rc2PZ2EUN+1zMr2mLbA6mwvY/o4xo7xeeI/R9XUHO5tjTb7oOPKZoxym8aUmIP9Xj9ZdoqHYa+swmrslZKZQrF5jl1i4LWDtWsRdglXW4hanaeugOcSRjWYWeAyhYLgsf/NjOI6n18e7ywM9x/kW09JMNcgYwF3lKwBAR2DyQ3U3NdwXY3Pvzk8+KWEzMroqA4PCRl0ZwqdUf+hA3cmIAx8czMN1H9oRfdosx2tJPks4mvFc73XQXj2Ze8sYY/r+Pf3xcGd0erpyaBisnKv1+l/BkzUI4mSlpRT/G6LrRy1Zixr3LLyqVE5deqvpOyqaqQkkl2V8S1N0fz/SibX+KLbcdj8T7hb2AEs8e8rnujKZeOHruupvNCVa9oH/VcTfdDYJzxyRDpNHfkrywMdw92M+xAYowUg+yNwIcj4ijhkYp30FD2vdLZAMjvOc9YBUPTDvcsYUXSGQtLnMTzNw3+CIPV6/wL3eHgalHi67Eyj8X4rRgqLa4bMjYG4OMJdtgGL3p9TFpEpaBeZvbT5N9iC34FqizhStuf9Px8uwVz2SOqB1myZQwKn4RLM7tHBteLBfv7xKu1oefN+U6sWlMK4VEW/YC7Sb/PkGKO/px2QMk+1U2yz5J1i9JZg7Mw3OGfH0FxHPBCAQCCfF58/7MGk8ShyjiPsO3TeEL00mGVScm5g2lnyZefnlooH54b9pcMXt4uVVXZnJyKRgjT0E/RkizyO5OS54Z4Qe9JTkRw9t4agLtpDUPw1b2ZMpv5MK5zxHOYqa89JD6QdTlRY/zSHGHP5zZAO2KBpw4dh0eRrW5AspCmezdOja6SYYWIvM91Gp/bzK2D4LrEwyFeW9aQLcNahByLVEA29jcHxEqgtjbEO1tYNNqkbai2i5THWwtnqGM3gcLfGayXBVNAIKSZWzHDVhHPVp9FQ8gyzVRRTsDdKAzy1ygcJp8SRzkk5M44xvAorNX/9Ol96hTbK9r3R+ja5vBzOMou7IWOR8oDQUlfmU+3IlPn0jVGp4NrSgMhoqg6DF5OynPwToU/g1McoFprjQdoJGIj2yZXMccMgyKZ5mvtwnUQ6DEn5UAAqHlX/0FlSxD49dlfiThs58hdOFwu/FetL8D9Mmfh+N398p1h7y3EDbe9ELNO/GaaYPfFoR209uINMcAAY6hc2OMFfzUDVPT06HvyPPzRY+1xJZaj6pEntKHH2oZnBo42CXgbjpSOfIAcoEo+byP8e+W0QFEY86qR0AJsi9sATtkXQfwxlNmcG3Z8ymepu/Ir++EuL4533cH38+RxoKCM8QSCl+LFhjSQtmGDsqz8qSaKc4dFWnBoldsMl2sFuYCN31B0Ypsaj/uZwnf05d6DljbpvD1GnVaNBpnRoSgA2iP2QBpv6AZgpEW9veDpqFvoEdL0jR0Pw4A9t3yH+6qNxn/Emw9dV2hO79XYMVty5S4DFxjsHh7fPjg6WhgfXeSFnmOi9gZs28KiEjyXRQVNtBbuD64BYI8O0qfWSO84EBof6iTHat4aIB9gHL6dEWVWHebh+kH8+y1qrfny4yNtGhzU7foraC4F70gxwmxVT2srfJ0IOg+bYIZib6aA/JfuPGFHZpsM5fHvYhUeYxftlYVGCnf4J8mqHOCE4+SE+H8XXnP+U7xyMt9dHv37CpIeXT8vmNdgTMPuamGi/hz6ZDiYvQJ/2nLKEqiNFHWgPtm5wMaYBbCpoF5EhTY4mRHda9+UX1oYffz1cvAWLR2u9CYPRam82Bj0d4KlA9PI0Aj4hNo+tPic8pXbMghTL3uYblZHR8r3S1pYKY7qwgZm02AH8eJNDmuZxl9KjFIRZAhgow/TcJLklMEkPIvEHz3AYEo4ASkVOzOrhgDHVse8AjKIzeXUG+/PWwPBj4o7klEfIhZN8jT+vyuiefMwfnwPworIjVoaGgnBeL472YBPW+mB9zuz5Rz5ntPG9+CRKavRLZt5Jf8ba9eejhB0eB60RjJ3hHL/z/OHyC8/zhcv5hQfjz3eLV3ucyg6POfVOMFqMWx6LGmsgCWZzoFPKKR0crR8Lnumd4RuDTO6sjohQOxid5fEAbC/OfK4dD3/PKFJuk3gOgCSH23KdBC9GrkGCWUzW5yjhkLqFZTJjPH+ebExEsioHyX6CwSPHWGVwLqhi61F+9km+fA50BLtEgqiLvpWZhjLx1I5klT28qaD9FxIKFLwrzKnZnx1sivQyGWhxN44mkLOj8Po1GDKHtzZg6ugdhfII0FWqthOCXhh3/gICvo3KPg4A+uCuYDvEWIjsP1K8ciOWcH45v9amWPr/jBbONfQGbMzrgeDs/fg0f3yX+dP5h9jrAdbuNMO2+FyyKdnpQwHZzOhMQ+0wAhoGGXU4Ar7TDIf8eCHMHfZStFVmb/b70LhiStnJnh8Y1WjpJa+jeSTm1Y7NHD1Gpyc96lzIeZR2T/oJaccu7UE2ZeLyPdl/I+ZdDB5ExEf+UUzLj+tb8OLoznb++O3ot4XR+ktc2YQX4VNEmSCcHhotAGx8iXUFdUDObUyy2zawdV7aEX4lOu4KXbi8miujKPFGqdvxvTJnA1HtU1fonom8DINJm2pzj9xUnDABb8Q3QMHKP8O9s0HPy3rWTqByXblHtfAoFCVOADglbl/lXkJfVkABUHIytk9KjU90DQ+eFOcXoBPGMt7tj1ZPYxrwjw9wI2/1tBkTqK9ekmHSHQye4E1F4+OhHcVvPBjvK37/aaxhl0fsbjjKaK2hOjuPtUPlLaDabLT/fM9HyeNR8a/8qLOh1stQcjCwVv2uW0Eb9pY5X+NQ+IY1/z0z3jKR/7xlXDKIaw31WkuzzsCcZFeWrMlaO7LGMvuG5fjjRmOt+TXJ8PoTBtdk06VqrtCZt29ZKGXYX2uUJN+3RGqh/UREPwESB9/DwwasT0DoJWz+LUReBb8JnyDHjzwJ+VqnIBjsqrMQ3wC4Gjx+CzXWYbMSIqvDYvWwx4Y638RZJYRVg2q+AWcAGwiQ+C56cBCNjWYmQRlZDkZL01KwlbPJxrU+z4d2YBkQiD27Ozr/6+jts/zqyyoO0EljJmioP6WbJqnUSTp0guacsDcxMfFG5XJ5b6I+9Ublmt6b+Nff25vQyTf+tR0dT/I+OxZTpSmKg9YtDdWEVpkol5sHolZQwMKMaTaCzrzO4ilU0OGV8eERRYX30MJeJhXJhKTHtR3ETYNJhIkBFXb4LJOSWYA419noOCVeJ+YzVx1ugEVJP3mfGndPNhld9K8c3t8dv1rlZHQB35n6OqPLYB3jVF2aka/aNFlMhQYUmTapQXwfV0F6rAD9/OxpyaFHJGDhHJdE5pRsDZZdN+757ZjOJ3PTvN2EZzIGW5Qh85qEHXMw1tNT453L+aNX49cI14OjIIiBWKy7MlzQpNSrt6jbr77Cwv0AmpX+ADYv/QlQfrfTsB1MZzpvP+VbxJxPDE6+rIWU8rDJaZR05s986dfi/XqxsjL+iPEQoNIInvdUmTe1tEHBY6Ylh49vmn+MH6eC22+V+KJVfOOs1CQxrClRJdO38o9SLSO/4+v8o1zGiFu+rk6hpJcCjosEXTjz5s710WssFgH6dLh/0UpKOi+dVYb8vs1BGiZw4E+lKn4pDvCpOPm+UPbQT2h9KEpVncZdn0wY87W47QRNY1ULAm2QKckb8HE733/Hn4jy9srtsyoRfNyr0vZxa1wKADoM8DGwQJUKoJZYZXiIfGcfk2S9uatyXys+uPOs8gPLY2CmJpXRjWcANFgt6+Qt6khe5Xe/50tnzQOoezkIBn5jKINLVjeXiLN7ZX1GktAM9qc5q2C++uLwt4fjt/dVNAr3IKsY6Zgz6840LjdwyCstwyvTkmURdBOFe3EJuSv4kXdvjHfe5pvn82fXRQATjZlupgtbYNYfh3Q62OxRbKDV9vX6vCGPKLftcTzPeGeLyY/fXBo9/oAJUBUDVLuRyn0MXwMQN1iqxxI2dOl3YH4qZx7LSMw7fe8i2Aj8LYLuPEYRSCWQcLCbBJj4p0QzTlDglkhbdClohFMj0ik85nC4dmZ8kTIeKCa4ITijhw3fhVBI6W9V/ZMHyzU/ebDTdJPaxUOsiRGMuiu1ZU6bXUlUBU8hytif5jiXhl1VFOOsz/Xzx5cPz+GOCXGjWC0iqoNa4TMAtGEHRqf0myePCjp7oFRe/mmRNQaoPLld1LTpjbHutMVYaVFpNB3CVDGGHuPLtWmdVpMZ4TfeuTTce8WThtl5M0iN1gCVX8rIMvZV6KdvBX1ywrXizi1O04DllbIo8nV24nWsLhbZVMLE5zabGpZ24LzLm3R+ZpPOA984m5/dy7eeFjfPSekmpO3NCwU1O9BWnUn9iKKLnF+0B4xokfaS1u4d3nrO4zQ30ZvFZZ+AAeJ0rm81JGUvd/+Epj3sX8xXfuV4Ku7AEgWJyOEnLtpJvj+wdTq886iaycsRtvxUbUjq2qDCat6UA33cP3xIudm5K4bdYF5ATJsrD4W4qI8cFLRQpB1Ih/K9P+2iidHL68MPKxpKOLQdLHECFT6V+kILfdb+RRna0ZjitYll4E7d5LWpetEo5QdHNfoc/ztbbdPkpGyelZ6QSaPiUHkKFU3u3vUNnIvBmAFRpLFcx2pQSO6PF4RITKUahHKf7g0/b+uSNYTmqO/8iVhH9KWD9chlQWF+UYlNhYVMfVU/yuYF8390sEKTn5l5yMePGq56pTQgccoZFbSOLbfSmTA8lSa7gbj2L90c9vvFxfuWurW6mWzdplHNpjIP1e5wceeV5qanVomhnlyYZ60TcPxiO0VskrJ5yFnmsH6r1R5KMq4mxXvAe1ybpkzZv2H2YHjI5f54+yPny+K+qquIVfpBi7LFlpzTFvTiFkk8IS2hgl+v0Nwg2sXtneJgnUQo90M63TBpWslvQLSCauyGM9pUs1sMlJAk5+jO0hAi//Agf7ynrDfsB3pSMguEc1OD3RJ5aIvdJotqafkwbb12NHWPikxIVSWeBCR1+RyEzt/J06B0RafyFDUBNmPGvrPhJxJd93/PH1PEBvt/eeIRkcivMnRmnG7TMkzTd2cbM3GnmrDgeVbnhHYs6u8a0yVD2jVF64xQbXnaNmfZFHStwDrjz7b4SraehgoKNdp//6BxV2PZWbZOnZWj7Rpjzlj1dixDo2JguOaLsl2qhosL+Es437YgtPlQth0mvZR67F5C7SXEbkPeCUBXY1sb1Wq4wQHJZeypIabClCXg52C+SXCvhPBsYKfepMCuOgSmcZeFuLTp1Qi6aZz0KL7t+zirBLI0HrGgiKlIMc9IkkFNDZoxUMPCGTbI0AjDgRdG79o6mBxZyLei6+GzHz55Zet6V81X1W2Nri0rWlvL1qpYS8WZP21dplWYrbkcAT9J2msJb8v2iogtSVdbqGpJWpKhdWXTGuFc8A8Kn//v1aJpletWybS6vrpgWuWi9p7+q8nl0rBT88gRZS4c+Ve2+xSr+60nrThpYpWUEONScf8p4IKYmMs6o+1P1aKqQLTZA9qn4JfRsx3MhnD/fvE7bvb4GNnaDGbwUJ1/3NSHLvFJghZgCikTTXzoCIRu5EQRX1dJJGEBgcH+jE4Z8WarePU2X14qLjzmUyqanwfLs6cTDXbikzFnavXbvLfGsjjD88a8R4F3RLxlGIRtEJWUsD7k1AFvupTBgOIHr8xTmjza4fptZfTgbf76VPHq2fjclswJ0KC49YAUZa13Bm9t/poftnR92dipUrfoJsE8bjcYmiC24iSgE1ARCCGjCLiZPG3mgtIrb1SNY9F0y++KK8/GdxaGn6iKAd9Pdmuscs5h3dyY3he1wdCjgArRMbCWRk2VngGW+nXacyTK+aPH+V1Z7TS6KIxTU/EOd3CTOJqm4uVg8g2egZhLDZqiy/qqbFVZe1S0ORjTTjynfRH3BO9XFfduHS48KG6+Yt9EilmtpgViKcq2StVjQVAVxl2/Og6uUaMulZm/4XI8De1DtQZQXFosru9obawIokTomnT2dCwHZ+JMI+xYJ3WsJvuYDufcMkd08vv9fHnTPqKDfcQsaw12o7gRGNrVJsqdQTu6LVWCdvjxMu7kXr/PKC/seBEsZSxo3whc22suCUSTacPLNIHGM9letm7zilWGlrqNvUUtfy4KUgxyn9Or1SaO63YuCtUd7LousVOCAutxemrnlHDjlzXyPZPQGJ3fxHON1+8fnruivozQ8ILpMGqq2DLrVVmll+saTfVl9zVy7WX9JqXwculV2l8kTKZgfoXZsaD0qeBCqNop8SoZMN0Sv/H6er6/a74cQGzctywx9Kc57ApFXxjA2qD4YMzZY9q4wjEYnEkg+TjxRkrSnFJyHc6KSs0SBEThFVz7AFPCifHz5RrXBr9e3FgefrxWvLqebz8u9mi6Qudp3PlvoUESz2DlgNYPjBDr/GFm8e8Nkv6giudtGeMDynrarR1icf1TceVqaYhY+o9Y1Y0SRPoUBjazmG/hNq1MXJX23rohAiE6Y89blRsfgwkGfYoq6nlWonzKFr8/frc7erjLefJlsnKKfLDjk24vBoOYmUwakZfovPy1w0nCf9ZAyuy9oKHrCKdSTj6MGh7XZEQEguEAPgp0Pb/MXTGWP26QikmtOSWGOoaVCabEAsycQ49yDubXLucfXwO+zFdu5wu/wpcjic/zCitYzFAZNOTxvZFhETy36r0zMOtyzVD0HhHFYtnjyXf2Ye7jWnRGg6f0kmbTd2UpyLiwE7abvi1N7UYERpwBj3zaxynvMjFHYbO6NNpGjzYIuOL+KnBmYQuYOMUEq0EvNcWQ8bkk0VJLlUSmNmQqjYYbPtks2XUzmlH+8PToCqo2i77HpZXBZgjnpCAI7xqxqu36TeNJb+jfLDxU0oj+9cOFU9qd3pO7BEzq7+ISNBcmUXZmDbHQ88VwceYKs2hhYYR6mGJdMhgFMAAV6m5wbQR8fXRc9ObH4srz8bNHow/XyqCE6Ih/nApr6fnAV9BBzgW29JxQFwwPz6q4RXFnyImrbalH5PFiyS3b/skIlbCoDWal3DdPPPtSI5h3sn5TwhfaVkEbklN/5++f5I8vg/HIsh2JiWcLo8CZK7zpcMqfMc8oXCgnN1xCT4bZKDcXkdOXF3SkjZP9CZ59fLlYfJjffVUs7hQPbmobjRh6wsxdZE0s6dy0V5hukaxhWa9uecGqPlxYqC4vYigkKsvL5ueusQrbjdIqA37F4ju9yiw2NatMP10HLZnSZrPVRlD9jxfH6x6wuH+teL0+4QE1DVqIWWuwblCaRd/HAOvom5zJsNPswJpTD6du9oz5KOaC36ZU5qC2Tvi9MjyX49t0AWt8Y4KvDoZHElKH9UBA7Mq54YfV0YPLAM6LR9tSmcoxCppVjrHHNT+n+Kh8iS0f3A96kulamBn+lCUXUVqPjQLgK2PYepgv3i0ZBU2vGysBjQXj5+IObs8OHmFYZAsZSW4MudChcAtp11vLmx2FeCkkjCpF05G3or86Pv0RYGG+dDlf2eGTbvPUn/JeHoc/EpW2ujyAOOV93dIATDPz//Li5De4/36mxD1oJFlMAqbMX5c1xKNoaZaW5a+qko1X43SimUhHqjBAc7B/Qiy0taMmrvH1jXzll9HBFthoMCZLKnPhQ5iP6LUt68zy2JyF7Q5M1zO1+ZdWebHwTA9Br3V3AHVKtR2HUyrKgCqcu7/ZD0vxN6CLcK+5f0yMIrEU8nsXR68PxqsfR58ew3oXe6E7D6IPaclDN8JujIefqOnnakMdcc50OthIKBuZoZ/vPR2d3qK8qDhYRWtCupqq30i7i2pcRLZnyPYJ2d4Y5YMRZGm8LtrlUnG2WA4W2+Oh/RzGw1Hn3Kj4EWq9B+y6KDktapwVynyXfy0fgLL+LbO/ZDz/kFlescmN+enYouwjs4xObW7+sJn5bbuNkGfVPitbZj9gj9XZPCVDxzZuasyab1oNdaZCvX1QMgoq5oDsMbVjFW082KK/5yl/rsbhGnu7qNv2Zgnw/RGAXULXLuSchDM1tnRQZRVQllGkBeE0bHPRmkVDI6MSUKJh0C7PLI/j8NfLLjSyiNjYYxIY0TCkjEEqWKCi/vGB6pBGCWZUEUZJuZaUKu9e1KjQsvL8ns6sqMlabVTSQBXdY7SN0jITpH5J2CsxX90lobMNjf/qKLX/WN4qmXST3i/5BhXZNJl0h945+V//ZsLOCfdMMSm7pXePwP0mM47eBwM9MycZhEBAbmJyRMtErNwR6BsGG4MP+BYfUDlvkhiIoTDXA37tG0+K5dsoM86ezh/fIazGfU2QChMWIzvEPKdmn8O+AWVlwped2Bh9ucTeQ+/i1+snCc/JFpgeSb66PDo4A2CuuHDD3s6Tp4zDKJ6mj+hEIieBRBSUG1AB9jg+vRyKnK9ioEB9KHJixRwwLZ0022rQebG1a9JiR0pYsmRrByXzBE2cL68pfIwh/CYzNpkbstJA36USR17TxItN0uli7VNebhiotfAMwGdxfpNXHJhYsuiwtzgCwsZgFyN66/hFGEQouVjL1+q40jIdbMzzYtes8wvrw707ZskjCZU9igHgyaAZZsdCTq+X8vu129JQGhGNhKCm5aEliyBvEhZ3+/nl18j4wgbvE3I3fGgm5WYta3qKhZOzzGkus/Gs7RF5SmLG+yP8iDJs3iNR/iS9ZGm7Cw+ZsjvJtBMAlAuDjYYkojOLFz/p1s18aZeXrEBCOq7aUOvdwCnNjVTLbCAZziscZUedr9L6pIRPLl/MZv7sjOZLp8AwLbrLFwMXulmCtbwEF8ZUU8dqF3wYd+iCQqYqfzypDD7lRm6Cm69gdcArHj9dOnz4QCNH7E3xnky0zJsiaOJOg9LL2u0UTqMuSGXJ2Tq+d3eKCws233nqOAM9y3z5XB9uKmF+fRI8dNAP8+0HcxJvlv1xeZ5DzIYfbsuZP0+6NE3QR9gLMGuxTc1utmiSmxGIWvEonIH+wmfgMOyfH72gk6aKBY1a6OiYaXEEc8Q0bxTwTzRrO1xsko8bohn74cbo/O8cLU1bA75k0fXJWAYZiLkrlTrCq5hfmFooYEyF8ik7ebOJQoMR2lsYNtvI+adb4yvv1e4DEsG8UZZ3F1Ynw1bnl4np4xiX3bYV0LdSbKxLQB/fLzEyWuppMtAYl9sUQTrWR9EehGyJKsi0/MYS1Wxr4gF7W6BJOtYkbJEbWv0lceIEcFn1/DL++JJ90L14LpS6AG/hr6qmD+iOb+p3DnAVvcbrdXRqnzeGtV43jBJTmRm0GlrFVCW1LTLgAX0kgm4b6yAA8sfPQKCjSZB5gVYhrBGweoBWJnyMEVt9T94qLTlSDp5iQDML3yJT57o69Aot6jxNT4agisDoDI07VzdJsScM/lb1EzuhPtCKOZnAAG3SjOYDrfnqTr7zAWY0PUkPD9F4WPA+BXOMv57+JQkbJV25zca06qzkDCxezCo4Q2qCvjJlKUeAce4X9E5t7Y/PYdyWpCkvMWfoQsFj0xrJcASZ5IR/OeXJ2Q8Xx+y/Q9BUg2OSAPBF25wV6AHsxNgLxYOO9XCV+VpOduJ15qITrzNpOhlG/UunqlTRcn2kChrIUgSDtYUyjAH9263iunOUCm5r+Cr5L+GPCk3rwkTazsiZix65xchJGK9nGFaIdDfIJF0oHYiB1fbHi5ZEdy98GH54ZTmxM7yRLfrS8DXVtDx+TV7Rdl87sXAGT1ycobOyp3DYcFq8E83YmMjOlY5c6EfiTx3skift4zbM0fE9KhmOx7y5zmgm4YGJVIazGJE8pmaHCyt4Xg2WvOc1oCW9EPcC9PDqw2wJwDGJkJFfHZixSc/vqiiSL2ulYJjhXn+8cFaHwZBSCnR2BSKoxxUngXoVJdouWcKz4WCdqxMKcZBZ47cPaepTlsVIE+bsJ0QSn0ntjZR/S8CiVTsH1xhlSebpNOz3MYHT8hostPHidZ5XFCIcT/9F7YyoEgmGvrUmePffulDlaU8uw9Asa+Lmzi61ZwjmasixZbJdaBqUJVfeJSQzTu8Syv340QnS6LmLhxH4CeI5zhyiHmguyEiHbMwrX90LzoxyZ9i/CEiR8/EiNe+4PlcY00EEtczQgCGFxylampz5WZk26gq5HAmZcuKoDYxzP8bex/zz6Xz7HfL8QDkngrTZCdtekqF/pMuVe6R8cNDg3QR7DPjCMCrhBIXZWBrEYiSqhDc/KW+N8Msv3C+W6WC5xQ2PsiKvBjpQanO9VG3079vlthleNb0da9iyg0XlzuNCP2kZwORS2hh+vMs2r7F2XW+Ssit/xM4s2ZeuZekYlJYdWWPN2RacbbtVzCjll96sQ10aasEfrkWEC3AKZiVHK8fGdFBD0TGgMhIK+qQ08Y6VYVsEVStAA38b8tuO0p6Ny78L8G10b7Cx/gOemI+vErB5n9+7qBCwwa4arDL8J3XGiv7j2+Ieyk6DQfWH1n9Y+FAjw4mA0IJlBDFPyNJxQV9/BaMGNOhz8JZGQTXIR+MdjXTs0xYCRH4I2ZRhjQsG6gGAVvu2wq8q+rJ6txSv1rdG0xp1yPr1mwrQ1nta42kKolu+pWZs5WLUSo3A54K1QUgt0sA2l6YD5hYRsbVGSbxaUr0kV21RWhKiVdexyh4yMXF63Q3aZTyht7iL665qV/G/m+Qq1qlJTAL1f2e5iVtxxEU5ml7aCXohxfLj62x2KAcnZ3ijd7rfVqeVvyziTjrVml3bPlzfz69cHD2j7ek2kPCEpjpPmzUxyoYSRLELmM/TNqx21SyEcfV1PZVDpqdqau1LuW1ml19bHPafYYb7/ufx+x1APzhV5XGEuuUAQN6EW7kkRi8jQOLPxu7ZPoedcQYoLoIPu3676ceyHyQPiPHomol+PM7AVWJmP5F5VDqYI3z44UjiECfngewib3xyolzZTbfyRvcmHtu2KrgNDx6NP29VarcFfHJE+Xk0kSo1TUNy1lsdoxADb3iJYnqzTsBbU9KO9SAQwNBe2eI0p3DkbG5fV+mw48ovmMXx8vvixoocdOuCDsFMuwHQ8C0m7K9rxj2CX9LGvjrViMeIOAOWzaPYvVHc3Nc85rkHlli1eMQzEedV5SwvWCKZdLFkW6V4S9Ms0AURGEb4UPIzLumifHgAY94/Gf/6y3jhdH52mZXuUVisXnASBDzTYcMPcxH3HOqpX2lChdUhX6Rho0KmOoMNqm75sqlymIMeO1zvM180Oy+sDw8O8u07nMk8PZpiPRt3HOKIOgmCtRerdSO/qb4bIRAFIy7dFA8lHn9V9/BrBEHSDjhWySJnyWz1LhVhFSRE7lWLyfj0R4Q6ihUKNixJTKeSbZa0fSleJB3/jruR5TYTE1/dA6GweBsoSmS8olPmxEHVUezyIvUqrbDm9VzMZjn4ko/KlwDq+jImaFvaxV1s+FbWGFCXIzV3FCqML4JXqVI4PU8CDufw+fgMNgbUplMQ6jyHkp343FJ+v09FEjnnPm5CzECvKeX+6aWDPpgtdArL5YHXMrrEmQDrmWEiRc6pKPp5ncuUUHmGvTvj9Uu0JISrNy9EXbQfzslWTzRYpwOu7gXcuFFX0BSj01kavW+dUO/43iqe0Fp4hjnqOLIqTOcpxw8bBCEsuek6zjElhK3wjUPV/scLypO7Pl/DdrT5bvTgus2WU8JWearwYZVg1cnMYzVyMO8W7ynd/Jhv37PT8ugbJb1qk4zLNrzcKnlfDMxv8CibmMxQ25cuT8fCFNMWo6W6JAcSYCY1f1SzOegWok9I0jh2ZKvlDcvTWc7hOP68Vlx5Nlr7hX2/TACzuwhZKa40qxQzKccZdkn4rJ8pWriGqcXLM5gHn5YYMuJhVCzcPIkkNvA8awQnAilxpVE2NM66jVjK6Ms1Dhih5Il8OGv798Pb72CGFOefScZBDlImqpVH0/zKj2WY6nA7sg+ch2I2+qE0G+eZeLVjdU5KwURFFtlrhAvdbY8tK2KW8kGqMwdgT4CAKRae8GkDct7Nm/4TOKntxxIne9+RgqUsRlxCWTOiDccyIzuMXc4SlELYKycMXMcURzlpxxRN+5aPpThN+DrxwNmurDXl9UJ9hyZZIMlfhSz5bunQFL4uIg023HgHkS1SReSvshEESggjUFfB4vSWdAPANfTQkur8/ebwE4fQ0auQezgGjrBFlZ6AjolkNdTQ9BlWoFTT93sILUqpUOLIcY53WmEqDeFgo6uiJXE74uxljpbUiU9iddadvW60h6gzjTUleRHlc8/osJzLQZOnjO7qTDtzGW3f4pPthhGWK2tmyo7hSOLylDGt9XNGRR3rGcNxxu6MUWHGIieZZKJeVGpa1IOYYGb7jTFp/dJM8LL94jDJNvo6/ZaqF15t+Xo1U1Ke9rdj3iwSzXkXpP3w4Paw/5hVWJA1CY+gjy/SJwwohbOYRpHfBRaMW4M5P2rQ/d9hJwnnMYdpie3h9e387K7gLOHqzQdHDWz12z6ohE7M4TaVFmPuYVLkKSXsWYuyxTde3zi89ba49U5hWswC3JZkyJb4deg64te9UuJTFsLCTMthxc5VLd24oaJV1e4rguBG5NunxE+CvFPhgOuUgrvNlaDxcCGKx4N34+vX8rW340uYWLMbBAl8EKRd0S3EsPxgwpLWk1B1H4dJm2dBKuZBap3NKcBUmevyl/ExaO+C7Vew7PlvWNe2SW2MadnB/iHrtmLaKktTFZVUJqUyJo0BaVtr9t/19mHJMiwZY5bh9F0TbIItZNslrHZcs8O2M1zzooT1f9iQcA0IC0c76Nn2rht8bkPkEjiuQtcfhMU1mJiBoQVGJ0FBjf8c5FdCfA7Sc0CXRlo2xqoinhLQcTPMwfw8Lqn0OcNc/vgmp9KvBTcabrgYQyMLwRTWILSG/z6MKGEIR7FP0Lla0zo61lZ5ZAxUzutoxWapNDO1tRL5AY0yUYGVlFfcBVufhDvmfqf8Qe0gZCREad91wVBHcYCY0SrDVRdKjNZITi0ulaCs+pQ1UPjPIkT/S9mpXHuH9ipP6i9u5drL2q/8byf5lQ18OXJEZPuRf2s5liUzPkDfsCGH/Sot5ALBPFc9ndf05awbmjJ+9mj86jTVJlqrRKeAcFbECKMFVGKBDkobJtJqN4kXZqPlmRGQoNjPV88wR+ooJRtcLlg2VrkFcW8TfnAUaE+7BU3zl2tU0gGfUInILk2Vp8Vv61hO4vw+STiA2j1vnntZNUZdDlxoo8SBjk1Q8myL/nh7O7+8ounTtwIj2bdZECzisyJhU2QPN3EKflv+8BMErBnfwdDZ206VBGl/qmm+gSYIdu5f2pgFnIsnG7JgvFGrF6QlDiYWz3C6vsFnQeajLnQpscPQsXZCcZnz8GcnbCeDzZ6kc0MIflR/3fzqpeLlJ6AoZWhS6ieWiaZCfxsyFgl+fCbBjw9WiSESN2AFDLYoYS0pFXxcdMlR7Ky+xsIxkmwGJzzJ0Y+1ewf7M1zhGsBtcfrBsH9VztCQtETnXkSEwoauUW1Y0nyhzWa7DSeMPUcsPjxFNB8zRUpMTJwq7iP5bLpRm8BNSuDBeWe+XiGp+6Albr3fHlgxqwlV7FCb0kJMJz51aDmpAzXRUkJ7om+y2QsDnZ8y9Zs+eoYom6SWDGS8hZ2M3j/d4t4hdpzcwEeSMLJ5jQvDk1Yh1MaXIn6Rww93xgtnsbDC2t5o7QKfdUOFHARtDL+J4hksKJJOHlhYsZASLIuutlXrWHMZS1W8zWU/frrIKeos5tpCkkKKaeqLX5HDBntU0kkBukF/lvnNVqMFXy/kp3+vixbEo2JB5Jto8h4oy7hr8TJt5otLWIRhqBJDbVjsijcHxfXPDMiZBx3PNKmz2/YjffN5uAy8mCpEPD/75PDX91LEQIjQm+K/sXBIAuBihm08Qxdrk/ClKPphHoroTEMVesFseAke6bFfFO6to3D5kQfxpOwGB3bgeXmpqGuzHu5dwICn+6v53Q21LI8CBmv6Kin//x9PqzhYj0tlj/i8XUKTIwmbcnrBFOrShbdkhzHq9VSRqB4V6/MsMjVNuGKaKspd77egfH2xM+yf590Vmk7c1WYA82sKjV2bg2qLArsZs0J2MKjQ5nD48PbhrW3DIUtTPHUQaeCKjvZomtMIaFK4I15t/eNFj+utNtyHeL6YL73RLHRPm4t+KQBLwikKcqlpsnJTYriiJAsTsdY/P360ODx4Y7+nnurL5pMasqFoPYdptJ7DZcNPotmYJ3H4aOjYpF3d0k8LRhpBJVttVHVKjipqOMmCC+HeyiVeDTaibKqAZ/22hI9qkGKpqlk8t+GsiyZH/fej/gONJq0XqDlQbADY0rGfmIQYpZYOJoMKMecIrZDR2u3x59saf8Ct0zGqkkw50LHqJUxU2fZLgpO012AT5fqB5D0IzSn/4cF7IEyCwZDEOlhtK4gCjwL3IiqC4rUzOlbMPynEAD9wTx0ozujrnr96uHAnX71SUEnluIe9hAbPH/7hJXhEF9WAoWra6ohz6n/4wiUumPN/5RcmJLRpAVq58tNAzABJl69+YtFYVdGy2HrCVSwlY77cpKK++Kd+u5zCS7XJy1XUpEjBG3ohTBcHuSgBkoqWftMYwor5vOAjtsVuIrRlNxGYAyOXcC0A/adPREyam2TLTf2GF+/Zcl2MiZJIV2S17bze1BzAaB5/+kQKTBM1Qp2zkOgTGx33p5lpHqP9r1d6HM1M2urr9Xk9A/G/2xuYjPX+6nAPvRRUkA23pBPfOiLjzzTQgKX4SFQjfosPDdWxKhEXy8UmyfjfHrK2ApzHsswB+La4v7De01ZBvvx4/GqZwqCQGK70XqxqlWiLThOzvoH9qvAkqDjA13v4DBRCfPvasI/Ui7cfKQw6aNr063yqtsFbb3RreciwyjZybQvT/ts2Mo35aoxK156caEpq607y19kGpLLEJphh+m2r91wyhRwbiEqyzKRUVJHSJr/KF65KDSrLxnGtmx+0axyTxsb0BOm5Yk+56Zt2RMWCKFsOFjqchAk1ALOR8j+rcxUG/2hXB1TaYM/CTRaWMUDJQLA/08uCPBbgsP4s4RqDaGyEobV5DaoorxMDEBxNXfr5fe3qqEBH9/2wRi2pU1u7fV+3lRWbo3W+r29KysYWyH9OGNuC2JKEtty1RKEWgnXyT1ym5DGhi/9Y9pW6l7STtNJDvKNuu3aL/ptJblFzf+fIv7Hdodkxzy4ZxpnqsJW3q2PJtK4KGAD85gIGPX+mp6uEqZ1AdaZRoT0+cU9NOn2/QxEzdBAQ0aRhFuTLv1mJ/HmjFv6WiCs7K2Imez8qOEh+D3axfPwVcu1v7uYrlxkwgczpZVNuCmPsgdgIt45is2WTyT4Srx2LpMreRy+DiQ8/rfErUfQZ/eqQ2OxYHAWc8YtPSlBjo9RIKTspU8y8qiM1JRWv6N28KT5cx2o4nzYP1xBkw4wOuqmn6Je4YQR7Eju8dBMJ+++wWzhb5ZiAxK+yhHfUCJPBLqf2L/3UFWvIRpDyNMpGaOBuVTCTmASV5ICx+9e3Uu5+2kN2PTLj7f54Y0F7ZBT9kkNGLAbcqIbV/RcjJk2jkZXqq0vpIClOZKf+4zmAqf9O7WMhAZX9D88/CzlXrLqMUQVTaFKJObYHFMukxzDYoGwNIPmPGb6nl/MPffGTWrzgvlid2RGcrk+ZYOK6lsbvPOHtdtp7DdGxyTUCxXXDRTYl6uHiy+LpKTrYh54bLD5GgQ+9LJ7yOSTGUHTPuFAbmKp8NLvE3TNntvUgaB+/pZI4Medidy3f16VZTHfcRZ9SlUmNUMukJItnF0KkRpg5qacy9W5/yhfPlUWbzjVuiOHBgLZdkcQ0aXoqP8Aq7cQb8sXtneHBWfifJeGwf6BO4tgC2W8n4bRfGrtuVFEUNA1x4t/csgef6JAsBHxZXCJ50m9m/kSKOOOw7JMhPT69lD9W28RE2wMUOKWKWuIraIQcUE8/emnYtaq98TNhEYSQc5Jx7TeMI376a/5pmxOIzaC/a0olDmRCg2e0r2/Tlq1+Pum3GWLVZXTgYBaVwUty9i2/yN9vA9nRwZIkNEKZzP40RT9uhO3Bc/H5Zlx5J8Zy6MGc5PbHiGzbm0brQfulpConu9WoUBl6prgwJzvXQG2lmlqJp9CeyJBCKCYxHO/8VmKIGQF7NQytJDiAD5OGk3NHtUg8KwU5yFGW/tPh5/V8ZUdLa4l2aJpsPhYN0qBRMOU7IcjWJXUFK2Bw/PzLyNPZyJ6fB2ajFxfzg76Jq6DOCGy4r1TkzlpUoB4DwwROBiG1Ybbupp/p0irKhscSdVSjhw9ugbQq7l4e77zlpIVBm5JgSj/eBsGAYN6ttQiiHkWxVeYTtNlf4LA5eImcNJuoG+NRAJsLRdsGoNt6HQkxTEPrt5QLoTJYGMVGiua3h/iKdvbNJh90memFPamY5GMxDSpBb1HSjQ59TRkx8DH8Ly1JIp+f3ci3L3HkuZAHZcRUviuhtBZTapqnLitnmKy2gMKCarGVMJp/O0F5+m+XsNHE9l4TK2C9xWRYoEfFCFe/p9KEww8wZY1dwodTNgWMPi7Of1bDVXeJBo+7dkfehLApcT1KqiBr04QBDvcWDOVOiNsMLml+SC/RWLYESO33MNif5bdg4d3i8ja8BI16NUEDfDkl4xauTM3EtKVUsEO1c6GELy+6Novxzpni/L5m0U5DhFfQ1+LBqR5pcthsyO9SaZaaQ+TCsfjkHx7Al9R80nZIEZrca9LrMm0Uj6Atgj/xqiwOfGoFA9WmddVxn39Q7pd9zmJOOwg0yXd2xq8wL8pwb4u37ebhfuygk2btRjZJq6lMFyPHB7tZpMmOP/1yuMBRzERT1abgNz5YxwxFqMxC+GgNfM/0yrHdxGB24pPUjJHAX15wtm4y41W9zdWl4soGauXVK+PTlygkIZwJ0DTAslN6Z1CG7fLSrRN4WU/EfPQTaerOM4lM8amKhLZLqUU1cDYj0s/r4pDcAWMsP39ZL125Vz4AvI8pm6Jp0iQVNUC7a1MSO8g0i7svOYJQiGJJTX/qG3kKjL1bb/7aBnXZlnZN3O8buI51qy1B2wQUxWLbecq2c2y6kgVWsea0KWcZWbXGTdWsmTD2WkupYrB8w1TRlkHFJiiDdxe3TzIBatG/hZO/j8NdCE7AVQFYTjpgoLBGwHXgtIwR3b1RgYQ2EqzDgC7cq6A/xmQaibkYjN1fFuax/7ZhjwE8DtKxYEctBtHAw4EcZVhAfmsQKz1bxXY4lJoVv6PyxVurVfL39byth43eSL655Mx6+9Eelm6xtUBF+muhb8S9TshtCdx6Qavlqy1ZJceOEXxVgaflnJFw9VGfsFT/3vtfcKNnKviHuqDP8g1OzGdNbyvks3xVuzb/9lsRnyg8jhyhTs0jf2v7N01ZIbtwRUN+D14C5OiD8QhKEINwx+eeH/4KMwI9+O04mfZU1aCmo8FtkqqtRHeefWu2zju4Uny4rnWepuzovASzQqeY25vmkvVDzm9S3u3R5rviykOeAaEXTJVO4GNqpoSit9pYfKfDh3/da1g9OvEDufj1apZy9SIKdMG4GSka++UapQR7+xAY5ndf5WefFO9fF2tvaVF1AzRkplyVlfU4p6yTCYQaCVuq82WUB4Ny+m8dYy+8OmGWL/1enD6LbvgdffCJ+sOk9BNVlZtyi1T4pHwyzEk8QsTtI2yYg+TgvT7CFlDaMYc4A9iufUaOwSs12Y8gyQ9PuGfk1vcPF85rBrSV2KV8BNy1dADdOog3eK0ancN4nIMXo5BtNsWN5dHBpnkO++C5zQoVQIInqcB27YDxzB5n1Rg5rXRGTKKT8GgQAgY5JHb3fr78Yvxpg/a+M8xlKb2sUBiLUrXFoahpqRgXm1rEYaqJnVtWt9l5ZU1klhxrhvHrGC3Mz726ZOeVJRpqU9gwoaWRdoKuzUakqzTTyRhOMWbYjBdOY61wxQaE7VEQZT2XDTuc01gOL/RE4M94cVOy/vAmbMvE7nc5k2a+iKcoMFV93POaIIGluoRFjCrdtyljW9ATtOC30iCtXtAH18IuZ0inWgac1ICPIIyfLQLL/O5GvnV7fPojn0Jgvt58hJswTEvldw1mAa7wJ1K5XbmJv9CcJLoAxkdld1lM9WL3xujuxfGzU2yqHw/wsDpVCZ5VAMihH4L2iCscpFEdRZl3ecDDFGdWNA/4IHh/mc3/vXAR/geiEg9thBTipY3XeJqzMUVTPl9RuE8u0Dl+nAwxPqCc4ljcAQR1+NsDkxhBOtDZwjCyD4mEElLGh5MNH0Ls0/qwSQg4weHRXy1+e6J58OETlzw9zxa50FJ/jm2OFO4YbHHTVJBJto5Z2T/RDkCxjHcW2QEo7tNmOEfVbgwkrH8CZvDPfQBDXdZ9QmX4KNAjoRxhTVAEvQYWfidlYi5IWo4NdGeRJ0E/1gPJ3j1a387PLcGDHT6/xLAqyRoNOnuQSPIl59M75O1P71zQk6DEj+aBZmbPgyo/DEUJ50I6SouJ++YsX4kfNZx2lP1tq6a7zfP2FSzsrnhqh4n05SiWpt+L8AyyzaqukY4q0UnCEpN7d0cH1wwT6ehwYRygv5xdwB3et/5w0q4FqsoBq8qP4skb9biyxceilpPC5hc28Oza7SswGJ3mjU6SpKbyO4v9mpHIhR8Yi6VfJg6F1Y01FCbvDAZ3BPyTAhDjNJD6kU2TcgGdJLRWKDSP8r0JngebEvA8LBoM0dv5wNie/RsGnSKSCE8apGvoo8FPGccOrihga/WjkSUwKadV9jnrlzU086cZEf1XjYX76KFogvaPmqGYbpizHpO3twDsIdDqgQCgSCXJZ6+usW/PuqjK2XORXw7F4VL2h+cucEAOWkJ+0PZMN7UgmiViadyrtKGglAzrhgPIyeLGK83Bx24l8nKCEaVnQiVS6DSmCGDxtupmSxoP1mEGqBqiLI+L+0+KRwuOPJae7Hsh2Ne06ancW1RpzWGkqXs832lCE/3RwdLw4DqdawrSGOWHxSTBTLmtiJYK/p0Atokachpz47isFoxA5Py1uC6WH+NIpgBOeZi2YFblh8eF4ZFM5FELWWlPAkpAQBdO0gVagypmamPmpEkkvLQ7frRYbD3iRK/zURL60w4vGGQotcutP2mlMa7mOgiyUwGrbLh38fDpyvjqHi6A4zHgRuwV2odKmYzHm+hlyFDSFpqlVhaIWSLxALKqGJ36YPyAqqvN1p5KdJTwT8+mL2vsp1GzKadqSGY2nQSEBLhejlfz5KH1EWZmGvxcvlCZVnJyTE2rfOc+gDBrWkXoAsFcuRa/iR5ULSBt49oy2LW1XjLUxa5V/7JFI9bz4dVltp6N5WossETqIToWqbZFXQvU6qQMtQndbGvMtoh+wDqqsYosK8XWWVopqev61KZjfBiLw7YIlCeRTAD2JNoWhwLekvVV/V1C3IK1SxjbIEUb5bJVqyChAYNllLyltq0FXNK4NVQ1INVGjzZAK4FEC8oYKGgQmQFADuRSvRQ00L0ZAvAnNgDIwRRlgOGACAUZbKRglLiNEPa1cw/DjEjpWjrcKNg61a31NUd6inJyNVxZoRo1pxWcq9ushV+rWrRK4XPnRokoUa9Fu4ScsNqAgYrO+K4Ed+W2lti21HQGOXgdJs1McvL+gAqslVDiBxVb/79JdFnyH8p+0LobtB90Qm/xg9Zd1X7Qv5nkB1XeB6y+xTuyR/7G8oRSZADKbNIt7AqHJrcFUe+gT7uvAGxfPuVAtvmevkVFeXLYhN1VWqv0Wh1OwUtnfDe43MjqcnHj7fDDndHjT7zbIF08pmKfB5XditgcsOKWOWqplDMqnwrV6bBry2H1hHT5sRRD66EmcrQfTHOzn42I2U+GR2na8D39DBQv2n5yNLTchoiWbFkOMdloOZvNgG9B3A77/eHec3vL2aXC2DDNQNVVGcTNLPlhtpQ46o8XjSrr0YX3oze3OBbAUPKaQauViT9ijtig5oj4CIZuaKgWb87TnKmK5dYs3yjcPl47XFviFt0z0lMyycASbZS4lJsVrzIfVUZu87h5OGKHlaRvnuMn0xw9RdaKEfCTRpxkUyZKQP/WvDBmPxJ4VP2O+ek7+fbtUuhA0sj8IMmm7NRiWPkzbrk8zKWprHSJkndjyjub/dfr05YOuncGC40R/7x/l4NnLeYUx8pcSwWzg7CUMU0acKrM6wzpn++Obq7Y+ylyn7XmXHrSOImms+CYul5thnx5vQlob4cc6KcqRHGTrwwYmgeU6V8MmEs389VLaqOFEx4IDXfalcjrCyUmhr4z5ZiNnmw2H3eyqU3xDmbhr5T1ttutqt6ci5DdRRKJdOUcstw7ld+/4hT0Fgo1vCSFc4WXaS/zcVI7a3Y6u7PNz6Ok0WqLjcsXt/EpBs86fjNrc3CJaZ9QMFYcVgBlj5Ls0rVjYYqPDq7lK49AZCGOmQ5hlI1wpuszQXEF2CzIviFngNvao1bLHYBwH9P12lzZMTDeXh8d3NdcyT1QZqqnppxlkxKYdik73YqvtcF5Am35kb8+hXkCLcmh61uYwg3OQnOoOqttEj9HeRM/d8npfo4Cxw81lzobr75q4LqvvNUxenrAWx3imerAXTphH49bdXNGqxq/rlKBv2zeFQ0fN8bvLuhxKrL2CHURiIRSa2FxL9XSIriPWo+qsD94Xzy9qyujgRoRyyoJMEsW1ZAJumRUUdMmN1EiuMFGKqUPNzn2hkMtzr8ZP7sKZh5ABjJf4oQq4gRayOK6z1SlNP7ZUL/NZOfsLzS/dWBooG61X6FNzmqqIekAGqJsXqLqUQVqUppD7AdT5AtrdEijgKb9mkpfFzaG/at1EE2qd2irw5nIirA9K+rYxVI4gecv8Rr2H5v5K32cqdHNEvqIPkbiPOyQie42rnOjlPTm2mwUSsEG18Iicvp4LV9DX0PawEiN+abXzWIpuq0eBYmah1A/NS3nezA9/T2IWK2q451Fdn4E1ikPaVMimmW29b2XVylhn9A3ak/3LZcsIcjsUYEgK9StdFFdU2zfUDW+Eu/RxsXx53M2e4ezhyHPQonkdYblobm4YTzVHmylku9KclGaRlNUkjZYBxvTnqq8nH9aHL9eHx58HPdRKWGf+dRj0tX5hlEI5kvxXYHGDrhR4Hyqy/ndV/pZZLjWW6SkuREXWNe537GOe7kN4/PpqBNnE/6yJiH6+fK7Uf/ZaOu8SQNPFB1zhlt+Nr/5Jwt3yvJcEu6Ht9+ZQdNgXJmOzsmOyCT5k87oUIlFPuh16TRWV1XiiG6yJZH0Kv00RBwpTrT0gPDeso6h4D7cF0w7dj5y06IxsBKWgHf16Cjtodxa/uAWVVvE1FAuyUxg4Exi6aFHXufvLNnT7i/Z3uRJIBua43Nvh3sLjv3sxPuRHvuW6VqtFmWs4aqt+F0zsWQYlu1BTdbYZ98xy0rGWMkMU1F0xtb5rt1VsrZcO8eSbNrocEwQhCxi1ABiYaOmZM9UzIxJ8F+D/hLcryLvMuKuQdo2vi4haxVMqiFsCUrTi6qDsCXwWsatdaD1WwhS48YKYpS4xrnUOPo1sKNzXTog5v02o0QXIArscrGWBlgCrSQQxyCgeuijAY8NdezCY4IsJgENjS5cXGEAhcIQlACCDq0cnFFqvEazVrSp+fiWyJ6kMHVaSM6V3NTKivHKg0wcZIujC++0gpISZpzEWXQFqDcKYHx9oFSCJKRiwV0R4Fpsi8C2YrCN6JwgSbX8dCVn1QGbYvD9v/eoSA487X8t+19rrmv3a31f8b7WXNTO17+e5HylTlNHjqhe6ZG/dqNQg+xYmHZZPem/OdjuhZyPxr2Ez6cNip9pzKcSbNXx23gcUPUr/9Z08EupFSzkXh/wCmZyHvW0cgyb7JcuitOxxXLZnwzkkLvOLkUYDlhLrlLuwMdH7HQqIIPSdLAO4KI0DJZP5lLoXqNo/Y5ElZn0WhQO3upIoudXZ/BYPiVyyc/ujQ5WVCC0jID86mYex1NBA2sx6BVa+g0rlex8QnkgjXjZ5udPFWdf5dvnNQyXfi7NXhhMBzZR0F7TqgzkvGcCOy3qef96cWPZZoCdpgOHA2cbUgmSrahCjP77fjih2drTRxtkEqQgCeecUw5qdghlI5X5gJuq5UTyebz9WIo3YdSgbGaH9t5BEqedQABWN2gkEnWp2omtbufcKi90ehrMeUNbjedHuIF9uzhzXwQFd/HmmUyJmd/0JQVzXRvGO7NnEbkJi/zsk/Gna8CIWfSyLvpkHeo4MWNd2agVRtocta8E5gLXW+eYZ2RxY6k4fVb24OGuSIxQfBzoXeaCSTU444zTGGTSyjOKcwVw2Ujm0r+OmQIOnguvtENkKnxoHaLwxJ0i2/PGq1Bdsd1v7HkLMQ8RZY42ZTRvF9f3sYAx1U4KWh1/htzmoOf9mWCqliO6AGWDGjVvs+M04lMxknM4YSTpzVua0zzeTgG4DqtS2TfKoU1F2hosP035Ny6RwMXa5CJMCg4JIwnL+ek5wVu+9ZSFbP76Bmd3I/HPgpYfT2rE1Y6C3mRrsC762YwBh9AFzeIW48FzOsxXKvGcesNMsURqWsOPj/1ZZpH1C41VDv3FU274LHdfYR2zuy8ld0WjY0yiWA7JWf1rmgw5++QcE9Un5xRddXROAk3CBszKBkX72rHY1UsmIJumAQZkc90KOm3Lh1hGB2+Lhd/GO0vFmZXiI3rtejOtLIZpkWaxJlfDO5CKyfWtFT42ByqbXCHPgoHb2Ec4N9jqqEz2YcM0hx193PbrajZjnooKtu4Wr94yN3JBYj5hrJqp+dUy04DPZVaLA212DAg1O4cR+mACDRNjLHNDCXTiLqViPsm1Tukkw0nMXyLXgln7EhUfwEWlzCF+ncP9B7Cg0JChjCaosBMfnpRSQDcoIEodP53j03meGoBEpXCbMLbMLTzMafL2EoNi65HKLq1IU2g4krCPX4YNLpilv5wcxLTaK58OjKlVCvHKZvTXO1y6ml9/rL9ehBk5Er8k4S2ejpC3eBLYO8bEHSk//v09MNBSXhiUhHwcZe3BFjrIYt/WJ6Y98iepFPZyNLRCKT4v5Mt9W6GkGZAJ1dzogNzGuuCKNLKpaROylAgKK0ngBCTKh6c38sc3yS5hsvgs1N9Cr7ZSGjxKmn63VmHBC5RqwHxgeLdd0lcfVoqNda1FkE0Pc/M7OoQxt8OXnkk3h3a7oe+AcuahQbniYMFyK7/VHH45lf+eJ4FqwtfGZqebpEfSed7tgx2q8/NwUk9OGdoTErzXBt9usJUg6ihxtK5MYkxnSODZOpohnhxZUpltuAfK+U6YKCPYx9PE7YAiO/H4EZdQS2LdFDaTwWZXVUpB6ZRKYC8h+8evh3vP8s9L4+1XJJriCCFZW1WxPulTqogkYweqMCNpxNg7QUzhCUcdN4wI8xgd4yLHKpEv7t4f3cf9NKbvYUrHv0D/mdQ5mkpmETncwCj0VX67hrriXLCrLJ3gktR8CBZLlnEIE1dbOtgqLi3mF9ZQu+xSEKDfTVXOjJ59Qo34UPp4hLIV9qYVoQvvGBIv7Q4D8DLc2wIunMBJ8/AoiS/1tt2sGpcrJ6sB6nyUl8/xiltVLrKQy9JwrgL6qdElxGAfISVvmnHRBUD7gMMBjY+fLbmAn4kYvdBpxY2aOr/WNbvWr4ZzYmRw2TjGc8ATrJlysV9FR59SYqrOHDDNdit+bDluZfO6sAYYSfNiJ6xv86l1Fmt3gvoDZQ1jVHxdi7/Dl9VWf529X2fjiytBG/PKjK+a72KI/mz9VTZiLfPVsYzBIkYswoePlU1phaLqKFQxIl1TzjbhdACqMtmUPVhrptkq1cqeStoTuim9OdkockwTR8Rrwc6hH7bawERY1cloY317Fuq5p4N6SgaExt91uFvDbQtoV2FuGeB+D9p+E9U68NKipGmUEaQDHC2cSGZ4y1NJW9dAnzwoI7QyMHPhGCdRtJCXwVwW2nLwSBWHaPhhAY8q3qiAjImzwYUQjo6doFe1NnX0qKM9jdI0KkwrLq2yXD1lqwbVi5WO0TKOgnFF9QQZrSWzI5NdYWwLX92XZZ+WenXSrsbPi8Lsv3zL0atuqPX0Wr1rXL3qqvb1/tUP+XpJvh75K8vZC4gQU/HqM+jl33Qm3UTvLHzguB0+hd6x0viqfn6UNSLWK9JEBz10KwUiyfkb0vBSRZQmRXHj1fDjZWAx2r41pgMfQgPmgVAox3BEQZJYlbF0aaDE2ol0kkXXxdxyyugJAR2KmlahbMw5zHV7ib/D2Vh1xI+tOouDa9OBOdkJI0m2n7TElUZtnJVY2ngTeouNRzmtQ2bCx6v52j08Y9H/rPMUYx+PKVvJjqnVLQhuWEwsCK4Z61LgzNKuA264quJigA6DBA+JeNBOWREUXGvgwS8JYuuCpPPtO3gTS+4YbOhoeJ6eFB8vDoHfLxaPFmCi5nt7+QeVYqfBh8qCMOplsS6skyIXNCTVhZ9VMwdm6IGUVoNiZwLqeG0wS96MpMMLRJUD49NQeyJMGMAU1nwP7ZAztwntTFPJN9877VTy1fey9qdogwphaS8TV5Q95ViRmUksioVFMzlVJ48pqWmD5qsg16baZ8H0HeQhVNXA9RUx/jfpGAPtc2MJezLPV0YbFzEL/oNzvI/JfbwmEjO+G+Gn9loNp1Kg3oMqh/fbmjwnlkZk7JA3VZXDqKtSA6sdYmnhaIZ9Aj3L7/LHl+2KynwT72Bm9PwVilLb3hQVr5L2dNV7zYRr3ZttaOzhUbl7nYhYT2JCOg/VsVNJSKznstnwlqssLQLWjbKto+YySo3fForbn/RcpqqL+kRraUI7w7CEiLOYamWIw5RkiOaoZUiZG/ruYEbGbbYam3FvsElmc4A75FnbbeU02FzFBoMkM6yfw7744uY+hkpewDzozXgGFCZu/aHdkhoE0/ODyPcMT/qUSczNiqUOwSTqUrSdwCozAIx0eEc29oi+145h+iWlmq5q74oRbzgdxA27yut09ZqE9Z4Q2W+nLbjxarR7AB9SH1aTjthTzpKYs2sBPAZV63QHg5OIj2v6kWdSscJFPYEUS/brgGTm6cNcxzs3QB4bQxH5ecjKTfdKshV+nQysH5o8lvfl834gA4F0cWOZj/xxoldzkI08bpi7whBVTYYyhqfJPiY58cgjlPefAlV04pFHSFEVJ54+fZ3AFBk8lBJ3EmSRtdSbkuvrVgm8hn2dl/kGeVRwX/jLIkW3f9web3/Cohorp6TgXQ8PK4PCaqMrjd/UHG5JGf66wJ1hqSYDki2X/SbiuuC3Jq2L2cn5zCjrIrIhOWXCgaZiftxQtWsp5YTgsKTSITgkowQ+IVl1AiFoeeaAA10gI5QSYhuGxL1/jIO14DGmRLmPPj0G8uPllxxKZsh7dgI9JR3Q0zTT8dt0uMAX4cATOR68lvYWn26mTaCWnLU8PLeC20AP3vOxOsz2UScUjETwtUTwtUAwFB15QHS1PAgq0oCSm65zNCWJHQD0U0qY6guYAHGaq/Rq+SYbCBgbxVHbLOLySzdBoIIsoDz8fowngr0G7nRTEGaVKafIMSntVbvkyZHNCnVy2OHIZ4g1O0yVAwu+xIxdBSGYXuhd1/HENY0Yy0AvUBUHPjhz+PwS16FWwcSmWw3xGeXDcJsHrwNBQS850NrhAhoIVqRmhBqPAvFLnNLQ7+CaCFudODInMGASOM2lIxgtXWvwzUl99iJf/WXU/12durAJqOVpKOrl6bbWrM4SK1mgihUv0AovTqGJqZrIoq38BmjF+o3O+PI57tH6Qn6/P97u82nuFA1O1tqA34MZVVxICEWm+DnPam6OG4nfNjMLRNdRm0dx712xvqR5HAUrF4XYdIVPiua7T2kZs2PWwRjT2pjwVSLOCGGlyljJt++orxJYZLUpqPnYoMfhVAd6ytwI92huGvdUOKqHiOqeLJr0YAIOzHOhwVt5rqj0WMTDT8PsWMr7HhYXltPVbH885yx+POU0v5n/t7Vv620jS9L8K0Q/7FM3MNXVc9l5GwxmnnYGi93GoF8WRopMUWmTTJoX2/JgAMsul+SLLLks30p22fKlJJUtybZ8E2XLD6yG/4iSpP7FnrieOMmk3bM7QLdLPMmMIJOZEV/EifjC/cRxm/cuVWdRwphTBz6JUJA4sOkCTRTYulaNwb+WErBJgDAiz8XIQVxsQ28Nt4NAW+57jCHpXi8IJ9HR0Tx0F0I6Dzf8ed8Hj7Ya0Udvk6I5jeBysZsNomz0pMPINFiSSCkfftlQ5i+IjPJhkY0QcoGBLerVUl4aLzYB9husr8A7+XytTHD7aH7eAO0ChB1AaluwbtGzwc1jWNnDSw8rC9CqhaoBTg1wXDGCU9Rm8Zq9uRk6BZApaCUUIJaDYAazFCAVBSgKTcbgQQ6J+MIFjwIs4viC72dvGSxYP6we+MuuN+cKfTGhOD51eWPOTpyP8UPCXsGUieJvxryZtc2hzfeYUsygmvYxi24MupdSUyHWdIsRLbadPv1Mj8z/Lv23Epvb/1WQgi58k01DT5LiU9GF79B09DdfSEfzQ33smPiDY9/YhDTXlLsPSwG+w+mtatpIW2VTYK5HXSwOVMuUW04/X4MyTr91nWLe1S2gZVnboC3ro5Vzg+uX8RbvVuKZcluaxlCqDFAEC7XZatZjH+zJO8DruugBj/tQzx/1aks0dDGh4TSkePD8YPT6na9/p+/SiASB4YZVJ5ZyEHfnk7eJKpG7tritS1iMB0ohuR4GAJtnaUYGWeLhyoNs6fro9ePB/QsGlnVb5bJ8yVb3uP92tW6dJt23Yx25CHW0qJPxC5UAIEB7xsyBMCl9ey3rrdCOI0iHED9sgoybkBnqnnRX2zSCpy34asBJhbMAqq2IC/h5g7vbf4U/3Ou9wcrO0TkMmOLpUmc6agEbbMp7lpA1qdOw8qm0TIA/Qh55KitgJbKdA1Kx0RIHfiOOQOmDhXej1z9jxzXLLyHBe1nGNDuLeYZSe5Va1KYpzbRWi/1ifxOnT9G96BzCFE7BuX/48a67AQeXn3IyrRYRV4EpUHMWaM0dgTpFFEuppoiXyrLm7qsKf3aai4IJaffLY6tVtnjTfYtsZ2+0dvXoxlvZlcR2vhONSEpMk4q7ecv+x+/ioBB6oCC+rfGACv8+oUaG+SF4Wwp/WAqDr+CLKrrFqLD/SpnaM3fTX34KyT0XHK5sEGs7WCPAgg5mtUsdQ6Y54bNZaiT7nvh4RDNNLAFm0QcJaersp/HMP+bDlE6UYcwvQY9ureweB2ZOa8IMEcifMDnDLB/FwAZobttRTfj+U0hefF6pYgUNEf9nVy+Ozq8Nrs5hnovPdXgF5pQKeZq7EzAlk1epXJvU4qAqmXW5iaoAf4i+4dMNUHbvEukTPTC0XpK3WMLlrudWm/bXfQGXe/Jp6dcbSceJxj37169Ha095+u9sJWkrcVbA+GEFhoQfxZJDlg9S4vk9SE2e2wPLHDvISg77Su4uqTO3VpkXYb87oWeygUkYIWMTIq9H94/mrxMtmyRJu+hZnBDD0OYMJXTcYyV292TDxZ1ovXARnn3VSbqS/mYTb7Q659ZTasx36kZvVrKLi0d3Nw8/3ecPy8TqYBRaXa1ihokK5F1oM79K43DrCS9WGTCyqUSjyWoO9+84i+asJumA02fdT1rv+uEi/NnxeUdF/vugy6WJRig0+AZOqH52lpf/4J2k3d9tOilYuBLhBIVWVKVvIscaXNQCJD2LNARge21wCZocTztPD/sVUoPnT49ktoLKhF1glUnviLucFxcTGWghG6+62L6XSKdH991GlL/yBPrlQO7qNygjsobVtXT53X2V7b02l9+FAN2GTL86g8l80gTf6Lh7rRqoBI4FCqnrXhWRJAgFospVHj4GIkuV2Mlj09Gh4kQKGRvJdKxJgvj4VFrS6TqJGXTGKjYYMU05bXXiJYfU9MP54eq2SU3XolTyrFAc5UD1dAnhHdJJJLwiGhkOocwSTIwAVkyM1EBsdnlt9PoR2oiUqAHw7NDqRm2AD5XA1jrr5X7/dhoaWjL2cNuqqXUW3t201tTGUJPvI4k2jEUzOiAm6dIiKhHYkPw6d4J4O5JfV+uEGrIP5wb3FgY7S4SaUG5ptjaDpoi2A3G30d5IbgnMn9xDBBDpTjqpM7afH8BdBBz2L7DaolLi28iU91TBbgPtfoebtmAByWahp5IidRGuMs0NGZ+IpHs6xLoV5//wk1qMC4GTC+iZjwHLuhF4BgB3tPNuuLIbAlzIAjQNvjUwx+sNoI6o1S8A0kOUQyoU4oBwj2780NQISrfEpaVYKg4E0DQMZlaxARag7M3i0L1r7oYZbt8+evQd+7gOUPtJXR/eF4FouVlC6SozuGNIrt4xJDm4X+rIFUx3XcP8LeXL7i6Zo3TTPbitR5df4mUuuRCoySjSPZQzzsn7c4Hjxb6mFgOWc/TDSxIy62BF3cjBSxafIkyLL1yg5W62qjBIICG/eJz3vWzrDrkF5Mg9xZkDMDzdkzj0jEXBCgR+RhzvVkFJWiB0/+3g1rzKdc9lYiQ7A9cBYta6FNCKh3RWx33VEgQFeTONUxHmZO4hWOlscS1beGceikpLaow6sHfQav4u5sKoWlSVMcuoAfdeTsDA1KbMcXDCbswNn3yg/FnZBSoJI5Ukqv8utj4sLSdY5w+TKGEbuUXBXqEDw8vT7e+6+4heVciTZe+X3TU6Or+dbS0PV94Yfwb6Yt2uoqdNvac8Z0W6wocMnaWJI0g4PWcTSXBNHDw5LtZgOBcGBykuDkc5xyUvbfiZDzyL4k0bZ9oQUOM+G/HZ9nkhi+aNXHlpOe2Vx96GWV+KYibHVJOillyokgtSLDH/WIxgVyAuAKE4OcMFBNfWTTTAdtkj9q+jf4v8DSaeCIQt+g1wr0W7AnAFenrQGSDOABhOxINfAZgB2LP4LkBfirk82rIUw6lnGA6AjuIbRjaMzTzGEGQRABaFKgFECbBDDjMUuPW8R7d+PHCo6kXZfxpl7NomuDR1ZOrChKCXvpNxWt5fqbPyHkZdgvcEUCYGO4xwwo3vsvMbVOgQWHxv48kCk+Flk+szQpoDCgycGk5vz8azqARq/7k0G1VmnVH4p3wCteC45k6Lz+W0acFBzZj+1aSMKUPsY8f4rPjYX5l0qXvIaDNlt1GVySm6AnV0tVgayXB0Jv1+gzs72fI1+gnbCexSpnS6r4wkec69Tul+DQl013SKcq3crlizkrOnH0eXrHCWXKqk/Bg4Qxp1kmY71fa0qNVh/BccSfwh1ILpTrgLtRh8eOv24NX+0d1Hhx+X+AnoOOCLw+ydT2kq93OoEZo7O1y24Q/ZgnMkzt6byWlb/n5w+YlqQ1r4UJHkzrpTpioEXwEHG7S8UE3wKvEQ0eC8y0e3N3CjpJHUVKDs/NUCGUm11W0l5bzo/laVl3H/qPv5B9xFMloG93YGl66oLncbOUntvLKonSZVSqfiIPMUE6l+0ZnIuA6M3BIz4sjAFuacKdl0++LgwY3DDw+JjiXGKt+unK/s7iyOqPk7yFY0YZnbYYlJDLdtA33QGvvTHOyziVavDWB1NZnxO7jgOignQYUs8JK/CdahA384RjMzCGi3RuuPhx9uyIYuvZ3vpxgLLbnIk47hPp1bXitrhaese8Ey4cCFwNg3BAqGt+eHd68GalpYbEnxQLdOFL5QAI9Ilxk6HFBG5IvbH90yJKcMV4fzKdBciWFlQ2p11ug3cjDi473s0g60Lb1/7+k64grU+KT1uh/GXqBXt1y+qJMYYkSTksQYTTZQSys6ADy/gCOz8QISV9viDly1HyU2izswblR8sjM1MUbWVgAtOZBNM10nSMe/+j2vw/072EFCJlbhLk07kU3UBvTCKLSLj2MePHLXJChWnyXyAq74I26vurTJv/husLsxunJ7eAuo/Dqpe5NzE84f0R5x3ExaVfnMpA8+DK3W/IEuHVDR3IxIfGkkHtrFkDKN5Ze6NUqw/KnknrqICvx1qhL2sfW3pmHTLakUHPWzlmibFb/fn3TY0rD3yX23P5lpS7NR63dnUOGZCOwjdbuqAvdOs240h7z3VarY+BOWbcIjS3UbmLnPLl7609GFjdEFuJ1RHexAzSjbdtrEVlqoLW+18HrpYhq7R41qEvASOrfWJmZMwfdLS4NLzw4/3iDORXh3abaScqYBhuK14Op0mRYEP309/SPt17mDeoi/GR0zyv5Y+kdV88d/FBXuL1WgAQ3+CIJt2n690cVwFzrLEK6jz5rF9jQsdCH31fvZ+eRs++3h+xviLGGoexO260SWdgGqbOf6K1xfTX+V7GEk2FEtRJRAoRkpQo4EqAPw52DFlrYN+VTNDMw+KKNFjgL7yXWzYkRxf2B+93D/yugj83+4X5PqyRi+4Mccl8oHpJWtxb0kKlj3UvELkALYRMUvIDpKzvGW04qWpCQtunFbifeN8XG/7FepQBpQBblmrtd5/MyhCueaqWonbre6jRLJNdvBVScH8wesUjoZdZ1UenSBxfVb8M2WjxPMwL6Op8PX60TCAh9wViSwJvd3jfeV6tCziamf/KqwlBIVh4wb+byM/fzYY3f5rXNqg5tLo0/zONkt7TSBp3QWBNVkRAYCsRqBmrgmaGx8VSVj8phLQ0j48NLm0WPsoCXJgDGnfQQPZrmE9ZRlTBN7q8yjmnDQLbGhOpuidprYUKEYHG00+oCEagTKaOpDDS24KqH4VjIF4wAD49/frMDXmFHbnx3cHl17p/1JIKoTK9euc7ytSJq/hHMK17gCDTsb5zC/iDmCa1dGa7SF2cVT4GLUmLOmW21Ebdq05alILVmxBYogSsfNrJ2jcTPYGOBlOVfUSVtWVoRTR9AZasIlsNvIoPK8ptZ6tHb18OAKlvDiFiv4PQdBZcwpbLE0u7+j3dff8oIXTVKRc3OvokG6Ewtkw72fKVQXyXAyo4NuWoUVapLxCB124glFO8S/W3W3EX587BEAKiNkhofghkauHxxkCy9GH392j+zg5nUcO+QMiftVYhHkH1rSAvdHNFPOKXMWm46gvkANFpGhMlGTLT2TogE8uyZ9kGbHrtWl6odwH8+sJpRefZjb0MtWX4+uXvD7kdUI0mDl3KZeXOn33P1Cko0r0AUvEx31CUKdOPIKJGe9d9mcVD6g2NKMQ/jxjJSXYWwEDoyHs+pKDRgwZLk4csKjJYqfRB45Kh9zFSzRFGmUSPElV7RcOucku8iSzD6HZeqzCtOeYQBugmWiitTYeCwqFtJLaVzBFh3eJULHz7GpORCEpDb0NXGojRq1X0leTbiIYSjo47EgOPPlsz4O43KDveNc8oih2ODepeziuyAgCyMxG4YFMZIGRjYk0u6RXDTy9VDExiFhrMP5LhMNFEUGGhCYUMDEAAr7LQZX5O0xN8Hf3wHcpoSlRbk5HO0RtEfOLb4bqjSILSpArQoiGUKOQbkcagyhmyK2AKuZnKAFUraAn8JLGfa1uExzuwJE5jGLohRiGeLO1pf7jH0s6vGoYAwJKADwrj/0yYE3tl5Yna91u8ZHqmtkb0iOENsDxQEa11Tk7+wcMfZCeY8QuIK89bd23xp9Y+/VxAd2V22ttbKBeTV2NTB/avTU3I2nRMn+/cvElGjBcU2JFp/LKdGCg5oS/e/fTkiJsjU2KVH3Vk2JSqCPuy5t2jTiNYL+vEYkmnsQ7hGj28+jnUujN7gb6K5dVI1w071TVj5wKCCuJ62cbLcaNyeLVu5r4toQLYe9K9nCdQnEUEdJ5POe4amETF0roT2D/ssIq1xm45oOK1+DEdK/PjvJ7V73LxwewEbgaec43U/TCSXVqBeKXiannAmKeOw1CaGPCvtbOFkUZAEn14vrVK7nAi041bfBgXF2XgzDWxeZdoEHl57yVieZalH5rjlAmw/EgivDUV/RDfj8YHB/bfR47nD/FUZBXehupKmQKMr3ptS65Ybz99QOgIeQIkbWVTkNTRUdxDxWo64YjJCN2yK9OKV5dXD/gYuU1X+ZjwDNwe5X4grKpOp8BY1wg90c3Gdwiwms1TBY6rTFYfIWD34UvC90s2e0/cHdDpgsaaf8hVEGe2EgB4PSVtaGzhjWGriW0JKK5RnQWzi39ThxnvmaOlTlvqTD36NPq9m9DUNAQZ/bfcG02kgN/2fKhVX+ldhW4KkQWtAG7jfFHT9+ktzvVtmo35lzXni0s8gjJOUc/M4kTHdvk0r3eKgSNt+J94IV51TB6Cj3QKie7OCKexz42/FHRRnSBAHWAMct4hXkBdXdiCu4AwZgp0YXE9N6my1mroOyWxnleLj/ZPjzHPLX9YC/bmfv6IcFY0TQ0TS6x+0kyqTGUxomqSOYR1+JFDis578SyXOPeDcNOc+Auak9ZQeddWWhiuifshDP4efpneYZEysHR/OXhx9/Gdx+qLlahzY6Sfck76m7p713XFkNvBIHU6GGvPYXKaMBMTjZF3eGc6qz1UfZ9trR3V+oZJS0l2ZbOpLc3fhUgTE2vwV49UPKb0M4AQ8G7v61lW/CPQiH7y8bym8Xi8igXNEDCULLoG+U8BsiLhFBdaKDxqHTsGRSk833aFgyKSlBHYupMwCXgYZyptGtx/wYYS08VRrKk4V3n06Thnp/ARzQEr0zB2wGCDuAwaqTnCaKEAeNJc7w3stfPvJdwlXrL16B58q5LSM99FtdfHC77guUutSL1N/VFXe/4PetxTLppswT0bCK3FlJADLD9Rejg83s+uXRo2cYY+O5zsZXGvG02gn+NqyEv0lFXDBeLhWac8K9Hgk3Tphlh9/F+bwufGgpw0Y3fSohihA8J6ozDTOXXNShTKRF8XazhCALPwTc+xgYvFkZvn7ktGfXkOSinoCjm552cUUipHPwEaouZiuhem5cwgWvU+ruRa5KVFElOSto4cMptYXPUHCscASSzDT3049wmLl5jLjgz4/CrVEtKJUw0CBdWsIYokO0eHZYOpE+PkdiUBI/3F8Y3DvnqwnpU9a0TNSbJkBRLi75t9AuyfKpQFOBLSJ11grBme5Eb4NIlyk5o6/E2hB1OpMuY4KbLL9I18ITpyW0eJiRFU3K0l6NG76GqCoxEVGwwzHonPH3hL/rnBnSoZZ0z336yKMt8ZaLVYTs/fLzZDXzz6XrsS4j4yndFvbJyp68dPeFPlZeSfhc5b+QlkLxa6xUciYIcRu4iWvrg6vzwRQkeCvHfTEg2ZxAXAowuZHJkJCZdkj40fzi4funiocwnwzJi1YslYwG8dG0d+freL+s023CXrf1gpT+xYEAqzi2atYPf4Y7bf3xaHv7sHdJTCme4h5wlBQiIRavMMi/xjQ/dl97ADTsvRv2HioAYokG/eD2G05iSE7JuD6cuE4voXec3UzMTePOu/hBH/JOKmk6BY+9ekLsHmPGmNA9qky8XcBHetFPes5F8t0CoktyoueF90gwDzg9yMxDNNxnx21QBJ0K0EbzvwzuP5UBjgpEyUyqE4b6VIT0ClRpwaBORZsBno1PcdEn501qQDkNLt6hBk4QHscl6Fhq6/QnyqP0ewmwnvTQ4W5vZ/u9wcvz2Q7OqS8np5zhOxHHbZ/l3AK7gwyjOJ9NUrO4zF7dHYt5vFMPNudCsPwo+2HD3yukwtwqRLTn0Ck+QvoyllLMWdgJHufUg4++uFREqIdVkjEEnrpXRx9WdNAtXqDDfGqUrp9aRcoHn1ya2rYVpX9BGiAM/10EXe5v1RLoz8NbYzyC1riZI2bTuS6hanF8qlFoGHMGsaaPMG3Qp6FdEMsZ3oD2eNjGFJ46YXd9Z/DqUhAt/eWhigYoQWhi9Guw8NUIIRcQ2DjAQvMAkQfgWzG3ou0c0PZcqHmwqwg3xLYEaQliAuNGAL4YripQDRFqANb+M8jNln3WGEwYhGZxjMKWHD7yaEXhCd+neSBiIEgh+AjhBj0vAiwUUuTAROCKJzh2dbyBy+Wktfg3/1fgP9VzWnfZDpxasUdTn2O8Tc7uBzbf23vZz3LnjtaDBAajA7bz3rxbu67WXI0s7/yw0Rs3d2rmrIErystW4//xhaxs7qjJyY6fpxnZ3CHNx/7d5Hys+/FMNvbvTDaWN7KI4cvd/7UpdoIT1p2lA8JdSE1QAgtbQihG/LzSxDryO0e3tyFbd28j27pzNLc4uLuNQ0VRBjhgh0uE2TcK9OAt0q1R4/LYoViOVCmvDn1Os7RpWsVacrjnbyxmH18OdlezvU98F+FZebW4Z9dIOjw2IHwZ0ML6gQifV2aVHZaGIRy+v8YjbvRs4VHl1xKaaju2OSRDsfgIEhAVkd/M7Rx+Wgv5b+iknFoQDaQfIJtYsWnes11GhmxmdXEOewWjl/4G8+3hHIGG8GZfXs0u/wKkfvMLh+8XYYzA/R/JccImnZc6ptzcLxOWi28jGWUwfhfRGANzF+W0R6dgBhuGWoT5U/i53dUH2F6lXaa9FvI/tnXkBHmHi08HK2+zyxvkI2IXPfLd0o5C2WfTU8S05F8gO6u7LUKRg3Nzo50tL7KcpKcCic73VRKkP2vWhcXdWatmf1eZWRsyMmWzwbW1RJtBoTcws59bP/y4S6E3bCjBHUEjDEASVwy7P0GmhEPUwIF61NnL7q67NLMqfv3x4Yc7PqyH9wWCfeabXInnmtL89xgLFW7CQfFE5Yt58MGDp6MXFybnwVHceCocvDd+IDN1UFPxhfmSL30Injw49iHMCEJV75t321BgvtlJWuWgpxeWY141dE78mPc3Tiix02j9fLb9iGqt8Ayk4ipj+4pssFCbcMhnRmqKuMysDiZwFR0BkZnXkXY7/V4dEiX9rWlnerGZoNvp4lIiK7xXw7NDaVjpwuZh74fBhYc0srRD74UaH3dyIFrdKok1zpUmEishrDQD0nBiIEtcupqLKLzweoKdX8bwibEr8bHQ6KVMq0u5LLF12Ysluu/ZysFd71B2qKLjnGyd5hiPrajUkvVSuLMNksk/YfIKzgjkY0awFWGzarcsiUVeYL5yooLCm/g5zbiYYlaoheWjuxdHB3u4tYG7JXRyKBqCUYeF6la6i0GPxzRFAJ4ErFA2wt0DMFjZ88Lh6kNeoZ6EOtDabGF4KNlMzcam/pimYHGA4Vke0gxzBjfxNvrw8PD9vgsds+UFnw3rgPBEN4hympoudI+lP42PkP3xR/ykGvjxsYME9dG4GvfLw/Q9VNloxTTfLFSamjFGSsdfsIascZgtsEONgJp//50ONZpxt9fp3Dyj/1IFNAEgp4DrmGCrmZnV/FJZ1/78rEOZ3rLl4B3+Mpd9/0o5eOX9eQ5eltd2RrlLGY/cWuRBu8x7WvlEMtutJJqejkKR2CGbYGcL1mC1o2k0kLpSMN0Q9so9CyEOOBzce8CjEXDAofttVYJve/dCdURbGqwVTNY7bsYv4HS2YW+dNNF0tjFNWFPtYG2Vd68i+yKGb9A9iaWoRNu8N0XMysMPvcHCrWxpx0ExLauuqlQIYOkl8KpEDL3ySw3Y5oYf9ddns6UJuoDs8sKGs7fjSjvBR6cv4wKFU6lTYblweREUFxDh8vwoKFA2TN+3XmQLq5YDF5nUUEpOUwBnvCqLaJxwYd3VFG9e7doCOBRM9apyBTs55Zhf0cFmPOuBlnh89/jQ1ClJo/KIu62n2cJ9neWNM1NhTkmogG/v3Etza7vY3Odn8c7O1q+QYPfmmWYgFcF3VGNO106qgDy3RrkiaOViLE6De6Dc4uM9AD+YQwXJeEaJRAQqAITVsOdzfIV3dDZbofjBpUXY6RPx9PZANiBFh5GJMQyHTQL1BU0Z6s3Sb/t55SQRQ7ifMlu6RXwLTgjQoTT87vv/m6BmNy8qci/7W1ANBNW7tS5NUhlfQ9ZF5ExAx/N5pUPMi4Nb86Prt7N7D3gqfA1oYbsp5Gckj9n28hyIJE5Au1SbiqkfHZAHXlajYvDiOuw3q4paM4Ug1GgoTL+aUJt/QsjwJ416qpN5ObqXcD6Mp4PweWIsrdEz/dzFoWsYNOL+NA8VRWR+/9zg0jqdbwPAlMMrBMT0RxjmaTRm4jBEJbs++oJ6YBMGaQwUhD4m2jBBBvuF4tKeMIgIYpe/vFG9CKYLiNYmar7KDoLTVR4HyB61BmhVASp/XcGkyOVZJe5nIs/mF5gfVYw4/HCH0GGACBX1WQTIvkDQF+O8yWArREGGbKVBPCuEHQqRjgc4TMLLZymKCZBGCAEC368TF9XXw84J4Ym8fzfePHTs0BRRlZJO2O76eGNw87V9G9U0kJuzbtQPXVTvJR6r2FF5F4Ld0t5lqLMocBPedqNZnFZDffhhSU20tftiF3+bf1Up5awqbu55w5qzqd66WWMqmJ3smlq0QlPG6dbfl9r8lFT+wWHfelyJyv+Qz7pOepMmX78ghXOwk96hqdi/nZSK/f2xY3pqdOwYnxsd+1tbIMu+udqgyQjhS7yyGziEWB/2a9nCPD3vCAuTDr9b7gh6CegFKCNO8t3BqwBgYLls03JS846/P+fiep+cGgwt2u0kr4Y33yAobPc3E2aBlKWCyYzaMY7BMQ1pBFrnH5d5VGMJCa0gqqZNBy+s/7jdcPE/z8ozR7BloaFHEPZBpJdT9RioAkQVVo26kKDlEEI3p5NosIGPkYYu+KE9NWYkkMYX8HHB8z1aP6/PN8xZKCGxrpC5GCn5GRK8XAScAwUEm1WHHR3h9aTwjE+X0lZc7/ca9JuEC0RpHfBi33xxdHeZeLFb8VQd+h3xLI7wSELbb/YVLJFzgM3sUHRvefTmO5XejsutLtdVqAKeywwJ+XRaRsTQ67g7rbKhdiCY89xbHtx/qnOeSXI45bktI6NhblkHgXW4VMY12HAE/iIrffj6Ybb60E+Rpjfnh0jTfYgctP1eLN05djlpxL5PZ7eF/ojoR/eQoWrbBSQXj37ZOLr3is0thNh0U8q3iLxA2lvotnh4Z3gIaUj1GO5iYHVNf6OLE8wRAAyf9KByZ217cAd2MtoYnNBJoVocNLEFFHR26oAufnnmwAYPhdeZA6OdOeIO15kD0DPQSpr1MW3BrmGwXFARg/zkwD51XLcSj365OtxfsuUroSqIkh3YAe5QzBxy4MxLmEH0lOEQKDnMVMGkFVOHX17Ndj4cvqcaEGSk47Nz4sGbV9PjgXxcw71fanQzokfnLqrcVjwLFYOB4KiChLrObp1KkIUbqZbCl76pUKbXu8vz50UaroydhRCRPHyXPUHqcmfM3aNIIqT1zeiQsS9p7jW24+OUBIp54PFkJc48DQ+eOCXZxQukhObCWCXAiSkTB4HlqdGlW3l8UQYCQx0RjPLGoQyHHxezxZuDm49pLkPbWZKuMxZ0dl4BZD8d1EKWIrvssKWuO+81JWPWVUu28Gz4ct9riUVQqIpmkwKrJzDRVnV6M630t5hPb61Bj2Ly643TnhJ88bZ7FLONOeIDd/cqpCr1dDMimqR12mmTytjCVRcctqX1qwStssEDP1hbGG6t6APfik+3G1GBmnZSlqnnnUT2vWQNsoWn/BDqjXCSCQI/2hAYXbhHzPgO+tEsWTgT98JAVqiMkitWFedWNJaTCAuyIcBzwXHd2tXBra3BT/c0uRIqcHcxsdNB0Tz2go+v8DSWzz+cxdR38utqjVzh4Nw+jLx4vUPVLmmHUkN4up8RgC9N36OuRUHj4/NZHkEB1T2sI+utDG4uDNd3SId0QIZKaAJYw9lW5FL3iCE4UIQZaPCDUvIQahjuPyA+HkUNNKqa5IxrhJ+8Ek9F7bxGeHC6lYSO0F4Qkd6HSi+uD+72VKmzYO3k9LhKzPRqc5i7HZsp0w747jBe5Gq855jEbMi3pbKM9bnBd1Dbli0t6oY5nFaaZUFcAJCqOkoKiR5k40OGCdncD06U3AR+TLuDGxyYuIuLfU60zaX7uLDPiDtcua1cL5Dq1Jh9Sdbgm+VX7CefgS6DnAx4dwsmDKYNGrROCzNweXny+kP8Fbmj5iEygq8lZAN/gEfBfdjXO6NPOEuHvBIJyMmXnoJAh11Vl71XG9cFdTzbPatLexQCfXzPYP9XxGN/6I6hpVqVC33P8jxcLPnBedHZwt3R+nfuXjnc36dhEy36pX0/mxGOAQAxTBr5FAIo8STbvkAL2j7VAi3TaNpCTXEXZkqUTjTwy7tXMHELOub6W6eI4ZHofPBK9V+5T+oeNny0rj09unEAd/uHl6PvcPQWTCB2QTLIsLLdFzgTc3yO8uGzyworWCtU4K6/VUCNuQ249wI1cMvXonaJYxsHjIGVs0yFPGVwTJWCY7BHCi6q40edAko8vze8tEczTjlRGsFkCVIR6kuZuNMudJsqGvt9/vysQ1Kz+d7wlzm8nRJKZJPAoqRoEHYHL6pBeJwtX6fAeGJIHATDAsZlW/jDEgWiQejpI8EgLGS0pUGghn8FUZ9Ge9rCzlGYxl8m6uI4SBJmZ2JNmGH8o5HPhIgniHP8F6Qf031D+hmDgCIVLC/TffjvAMIreJ+A2S2YpnSm4mcFzwFqbjN4xdhP/yxAxxYXW0QsaO+39k8DFBUiTsCFOsCeX4TRmMCyHB5LT6mVMX8GOEgRUAh9PIwIUAnz9DIEUYDzBdSR8/wyXU1565wpJbq6Mbce+FnrZUO/re56krcNXawpF9ECEb8rkHd31gnxlTO+xrgY71lSb/z1c/MLY97VsBfZczG1xIGvJlUtaZH5NIaMinnFeBnLlbdZMl3q67nPr2Q+v5b3/ErW828mZT0LU55/Y1KePGUIts+A84F+MFyDJVmB1KcUNJWF0wKynxd3Yaw8Mlt0ug4YQzOHCKK9Y3mJjF+4b8xiZYGLdRIYz+ssCOTEegReL+wOr97LXv407O2wK2JRcUtY0upVoAqhucJAzRlVcEsmWE+TqXpU1t00pjTjjv6HSDW2dGf08bmzli4uR9LrxB0TETlF6am0EWhIT7lbTS0v8gj9+oytr5M3uAUc2Pru01wJzgOF1mppSzL3yPOaymjGvRpeZ4atVAdLg9fc5casPpTBKkyu0Zm8DeKcdiOUbxYLlLgHEh6Ss17Bd29H81T6zqJLLGF8Lnw9yc+FZ1cLz+raDDVLHe5dypafhY1quYSv+wzNvNg2HCjjEe4jDeTT/49LisspcWbh6O5FHlDrldA0VAd9mr7Tq5rWUhfrc6NXf8u/xuJS5ufawjaMWW75OjeXfXw02vmeAh0etS0n6hdxgKEZKDCrX9PDYZzUZBqFg1f7PPWHJdCXcuDDfCmYKdCKkxn9VrRwnAiXmJ+y/xy7azbL/K1++m64f2PwfC17ed5/K0gQoiTZywCbYOXLmtUB1GPsHZCZcrXChYob3GT+M8xf660Pty4dfvhx+ATAiWoqkUTDf9iq0ABAelUwCJc/P4zA9eSnOgM330ol4sxSgUzfT0WCtZ/KztbNNYLBXdtIeOgorRFtsqxhbuvPz06OdYRlC8+yq72ijjDqGUp0TCky7edU0doEVVIFSRCHFDk8SEDHSHfmP2aGMDL9uJ0g3yW3gEbDwb3QMpXUQ5AJGW17G0V+gspDgMUx9eDMPZxT/V7Tyi9agzpvQYqvqrgVjHp2tkY797OLL7OLz5khEmWXQES3aX6fyMHQDvzq+uu4u9YvIWMMFO22+htjPxBslC98f9i7WvQbzYKQmbL8QqKmFLVrVC2nanQprwzZG191yzlVo52do5W78HiICnfxQIJ6j1Nt6fskyysLztDQRh/g2p/3s7klaelEgwhzdxhnwQkwBhBalLQhiVZhID0u/jrHjQlNSppWuZsve7ftJGcH26OP+2JrcaRPZ8adGExQ86XZslBUlI2fnaqx/aPc0DeTFWrCfd4KhQarRZKRs0yCEyr3/nmOQhSVX2okXDqhXcBAT5qYNmB5zTVh4Df9/Q+7SmWOBq5t8I2/f02ufKzns5Oo9ndrOT12VZXBJiqpcga1v4vMnLCJem1jdHD96Nw+b6/g29EfVNOaeZKjpO0u1KlUkL9fjf2ibyH70jMNnWXjzzROg5w14nJOsAwDLGppM3SCE/WH3o+Uer/nz8q7Pm+FAWfpl1U7XDbLDXBSaX+tPvaoD1cPhg9WJ9pileFbOHkFc4Hu3ta2vnLxEas4MM6qObTPKoWEcNemdH/ACGvab9BvKSuezYktjLLzYCMuMDlBkemlTeLlkdq9BGYfB1lhHXuRU4mctDoFY0w9TyRIzgRDpJzvP7q77GdkqD47S0qwZRNrwY2B0wWOGBDPEAC4sAsYxoJLfjNPOYApzzmpshqKhs/c0DYwBGbEGJ59ejNaPw8bHm+kpZROKrXMEGm0y83+FpojQfVsnage6Cx6L2EQuL2Rbd/2LPCxxKQ1+NnjciiMp0VWGt3pSVKxVonru1B29unC4CEW/eH8zbilcRnGRlEFKvUjNc12wc9q3m3Rx8VxzXveOM92+M085RK2aAKRHUjq0XyEYrHuh6yr4MH+Gg2TwbeWarUuO7vuST+4r51S8Sgvaus2VZTCfhhz/4y2D7I5yA12ohni0mrWsS6eDVS7vzaVk5nKKt/YVmIJG0AoN0aiB/eeZw9kkDjJhqr/SSOgggjbxtYm/tWgNwh3wwDUxp426tSA00SbPp0iIV9h+KdRn433cvPt60kw3z6I8DS8C2Mu4av0UdBXYp9cvGMiHZ2mpMHH1yKbXFhjwwxmjNRYYCwCUORvMb+/Hgq0i2G3Qu0QZPvuPca54/BWIa0FsyGwDCBlDkxaAGlxowF7IcgL0J1COgvm9AYSrFWMsBRXWURlGuYV4RQhGwU0FsrIU+rBwyTIYLve8zgkDwgmQwF1wXnPa+Sot53gatWzBq7NCzBOZoI3U1cWeBj+EYwnKLb+avTF3PtJXmJ8JxlitcHGAIdEGX762ZetrTW0Y2nSRjf918kZ0vxRnxwtOE/yovlDmhL964kpUXdKw2RD/9pmQ3HYWTKVtNswWDvp1sq4q6LLwapWXmw2qIsHhign/bUmET6PLnzMlnZghvK1H+i6qmQcuXpGRq0ZkcELlaf0X3vEKu3DDZJ++H4re/JdLuKwKjrAVgIzUeNKzIrcEgSKMBZVFw1sw/x3CuZBcVs23xu9xQ40lFaJ47JWxsH2hXNXWP8G/O0t7vHIHamZQ0irujcbahrcewCzOEQTVsXJ6UYhjd10FyoVTotoBlgrU+xDOhX7hmPN+dLcxuVs6c7gwwqxnUCzOb4b7/RmHbZ+kcNMBcNi0oGLxLSYRoGX7IzvJnbPSsKWggp0azHmwvALk+rRuavD9X3K4bowY3D77fD+uaMfsU6u7nRhQGU+FxEk1CIYFxorYYJ/TeNaoTQrKEv+eEPLks3bZb+DX/NIqUpUT86kRFL15aNWEef5cF4eqRvNv86erEtDEcmAYVN+hIFDHxAu4GSOCCjDY84jtmLBibSGYwwQFmzQ16P87scb2fZPh+9/zG5+T08UBHhA65i0OXow5E/QkN4UintcKpCPXTzMJkrSez3K9rF0Q44K+ws0QsDd4n7KIkjl5RrOGNYjQn80RwMAYMcRG3Gckb50+On+cG0b9cTTMHICeKnN8MWagyfjelzYO6ZFKyT91BHhvZ5fGr3eACouZL8GCwRSrap6K6XIua3TDGmKRokOca0ZDNSASPJhhZmBofjy2hWoTniynr3bsPM12t2UTjUK+OcmyMV/l40KkluSr7JH2WIU7b7E4OYLP4E+EI81irUu1EpWiFitRXVYcKDjD6Avp9nqUAPo/P4JGmRBgenRjwfZ6ots4cUROrG2e+jxXDw5xnmIolCoNEJtZtWr0pp+qwkr+r0mPS/UgqC92+6CFnAb0Qzum7vnJ7/IIxxfydBmYmwaLLyDcc0rG9nyDpZNx+40mGvOCpCsIcIp2WCgEY/GOCA3DqTjx6/yfrEX777CaPuTF0/nWvlYMkUjdH5Lr1r6MvF9Dtwcc/i+N7z2gsjunP8ws3eggVDOA+eoL4ybmugdSWahd/Qa2gCzW8J5TPPCocqULoUuSr4G5wf1yGWhtT26u3n0+Bo44rfQTnUChMUdOZF/zXJ/q9LCIadWZjvtVuBhs2vCh/2wFqoZvd4bvPlF1cSddnQ6p0d35VrdIDFML41TErYXDuvJCyHPS7hBBydy7cVxuEnTUAEUWM7SKM1QlXSBV3G2PdXskHPP3j0drm4fre0pmxtMcC+jeH6g62nDWb0qUJPio9iawhWHAqKKFPXhnGEAXzjJSUKQ5cVs/cbo4PrwA7YKON/VKPFZZhowE/h4FZYMyOpRViCrhCiBVElACeRVpdjmB5erUZLZz2a8BJRFwlHAFVxR74ImLuDZwkFb2C4wq+PD9maRzYIK9L4fPnjqnCBMEXvg4BJNx8KOToeSII+d5rdX+OME2yuJ1O6o8Nz2CgnX7RUSHOytIAOl7noFr+AR7BCzkWQfmcRp+erh+0XKPFK1JD6Q4U4Xy6Fpmy4gNHtdEkMq+RmFsOFW14fzLpbVVCpHlWDMAzVtT1gNTLhSmpRb8h01yGPkvpb20wCD0eWbuX6aVONmRJReEINJI9k+kSqaHkcVjaDQSEVQFpfTckw+qBx3SLqDA6xQ18hGQjGyAwS4J8tGcen64PZmtgRsgLO1VhSX+JQxDyeSChfVv0FRiHBuk4ODqhDi3FbaKK+Bmxsa1aSN/ofmzRWvyi4/T6BjIE8b/cOVB6O1Reoka0RxHWq3W3KZ3M0jMtDoeoFnPef0/C/uh1Sf4M+GZ7XbgomlzYhnjAWvzSgdNLoPZ5U6l6pkntN+Ag7Ygc28n+eO5hezi7uj+V2seE2RhABkBvqEUUNep9RPLbwR2sRHhWdbzgqcO1rZpp2YpnMJgVAMktpj22/t/8z+W2STOTRGpkYjtALBPFTGHCrSALXAUH1zRhUNrmwenbtkaZeoxrUWT6gM9cFxQZis8TD+5j789QGuCXWBiEqiztGneYo3TYjpo8sw7ONWG6T3zK7eGn2iXmCN18LoLBercY5xFSti9t8Nty4F0ZJH/xSljMcrGqZogMIfVqOBFoUoERVlatCh4cYY+EcbE+Jwxd5UKufhdurBLfwZdxnoOg/iriX2Zc3NH81t4aW2gNZiSvu3BZUKJw2ObMFkZxyFXgD8FOFhC5UCOgOmzJ85zKYwygIoC26+Ap1yuMnAGfncjC4MoLA4QhFEAWrwCMF6Z/XI6ouFFUF8rvkTyrppai9Uc195joqM6/NOyDq6h+RDN5At++p29pRqldX3GNtv3YCx/mr3jbn3tvcrVnjcAHtTKKPHisxszrpaG5gjhvtq9trbu3zy8g9YZdedisrpvwF3WCv953wGs/gtmsacKIFzmcXHNaH5h0kJzT8cO6Ynnjp2DM+cPvYHSzVap+yVc61MeRi+TijKgy4KZqB1AVm2/SOR0EJA1pE3o2OJXXBqzx9boLzeyVCmu3uzq16sOykvOIAASSeptxs8537SAS0CXKv4ridCB6ODA+p6EnQw6yujoZHLWcF6KCw+XrBIUQA89VaFCwNG2zuqAsS1QxXOdJ9yQR+Qoye1VIYTV7pxbgngcdJ/SLmb51PCxXZ5LTvXy/beEkdHZwri4I4/j90a7GqH4mgRQ1erhGiGgHJqr4pNYlVmGbp/IVvtZe82qSMRUtM5LX4QMXgb+R6ymNhVwmkMkL9bckhfE5B+J8RKEir5QBAvqjBk+aRhvST0sLcw3L9LjhNPUGL5KIGqyFY8JXsryPYJM0Vbia5RLkMIAu3Wy+5N2H2RDRg814k2ezDYdWXE4+tQujZx/fqsLYKpfWtw7j7v7MBZgWDE9MJF4qQ5IN+VynkXxMagFbZUcdHFUgCE//zsrEw566+dxn6nhaO5N5hcxO0/2nqf1W10LxYvcoE8FSItbCRDNwF3O1ENQ6NawjwPsUbNuoQU3u6fKerFEgN7/fLg8tPRjjg9ZzAhWOKzyFI7tGMFtdNOuAAJQtxss4IHi9uDmy9UcATnWLF0CYkpBj6nA7D11F9bOoDf4GyDjyBrSwKzWrHmCgf0AnvLh3PZ4u7w2RW8uEw+42RCdFnXb0E5BheKw3MpPDBcupxbhWgVMP3ebElVgjdbfjr6tEwKdQsETw00cQavhXPWaRqOTeH5VZPCo/sFBq+2NYnnLMDg2oJJ4sGZM3CqIVuH3RarCBbyanCEXX8vr2Xw/OBw/45qAXmzUHsSqIE8d3cqaWEmMnihrukMNgeQa4LO5pc/kXGJO/jeTuSvCowWsjLSTnKmv4kf2C9Scduz2RJ300C2iveMKHkOuyirD7OPP2SXHwwWlgeXZSwWyA+1st1Jm8R1662O+915zVgdMweLTI7OwcITKw42NyUdBv2/ENOraOiXdws56VjKARkcO2NruwfEmiJ71p0308lJx/RKmSYut5JpHaGDizWzynVRvtNcqao/vQGK7O0fiaF6OnZYeqoEp03riAHqu7TCuHeT1/z8XO7ihBYf3S3BNs7R9hMKX7SNM1RBpKfgu2HbHcBzJbLjAcaOgNtVQAk3AXFkXNocLe64QGRw66MZHABnx3oymRUafGJF8ngX2uS0qnCSw0bZkB5jGu+mA8tEUCbTxHNKqNqEfAImv3wBx9hqv9fhPAmy4robjYZYH0DjwJ1rozWZ7Epnnk5P6QOjoyqNuLRw1QXNDU+CC17DwXAagdYbXPo0+sVFpo9lPEgCpsorasveusNYSJ/gHsY6E5Xmj8AlhINsvlqUOaCtR57Mcbi/P3r9eHDlotNrNtdZQHwi6iCtUJC+plnBxIorqWt4F+5I4j0hyWpifFRllLIeXHtKyjhfndMCDqUcHZ/CwWZK90Srs7BaTPcEZWWNX29Ufers3vPBwz1le3LodbZWqCVqd6NyqEKWGpQtIp44rwDs2bUHXgG8O68gPRMrw56L4GmsBk/wA+v+eRmiPYRjh+8vH939brD1ZPRiA5MnM+XImcQSYAfo58vLE3JDF9yUCmVjuxDvlpPwbP4j7Y2LzFIlbqc1SSsAyEbrhd2HeB4t1cA6uiXkJAXLUpcMIu57AD0LopKPw5UHsO2xD6288XRSg/w5SvJgtdwGc5gGWhiylmNMCobKPl+jQYQ3zgbKjm5+yh79pMpmOqeBj8Wqa9M082Ta/ZIODjWQ/ya/iDw5/d5ZIQqGfl3ITsNT+HY3u3jxaP766A0OU8dKUT57umuat0ka5qel69EvJZ28Akl+eBWY+ZDkdE4D9mu7LzWFbrIBI87r0saN37Uk+79m7/qh1Jdy/QDu9GJXN0kSRkQvOpxqAgSJKp8HbYUERbxf9NwTIhFLERTqvN6gjJohKjKaC/OQPtY1f4bhrgS6YYwbBJdhLGsDTA0tTUgZBnphEGmiOonn8pFcPoj7y+I3G7yZ0MeEPCbS0RgnCG985PG1qMMEHAb42xjAQH8F/RbvG4RfBOkVyvOvXffneSgboucAzAqMDeGrgZWTEKYFlDSfx+BHhXcG0hkkpxguAG8eT/m/BJutnqAbcHQe8qkGKoXIJHwF+FGGuTjkONxeozSuhSQtyHNMyx2of6KTVnfpwBo5SnX+6GXFzVqXGzp1deeTPGvg7bjIy+H1Zdy6eHk+692kfI91aMR/kSYA4pSuAt0QeImUaijLQISBeypPhpf2jL+RvKdafmPqrXVXu24NuresgZnViuUe3vxPHjiryu3lxXY0MJ9aeBjYMmPFio0XpzG//Xoa89svpzG//Uoa89svpzG/nZTG/LYwjfmtpefUBiKoIuzQxE/fVFTDrdXppIL+hgE3st3DXIU/PyN+k61bg5VPg5W9w09YfFWGHiIXFbko1xS8djsJ9aVERhXRnOuRUB2F1wAdrTaox97+RbUhybkI8Drb/d0mB76YoW7jzwA2hwsBtCMLCHhxD/3a4d4V6sTK7m1olq17MvbOMvYLOAAgZkepOmgVUQzs6kSG3Yk3OuAjINZ+63QN97ecXiR6A1l5fchxoUlaM5ZjwnowSQr2nXTcHw3qcEjgaH7Rj+sAwMBS/Mh7lRsWCoSHCgsGLOcNlQt4zhtTLpBXim0zbvVUXKM2qPxCOMAqV/qADNy29AF/Nj5XfjR6WTS9io/8VwyvMjp1jA3mTKoxc3/rMqVN/LowZNNITufbqEsWybIHL8+PPn1EG5RWSy6AaXGpSNRK4hZM7iZReOVogbKzvAglL3T3WdlQ6+LudZHdcp4Eige9dCl8Uj8q9Ui6gNNnlnmT+/DgymBnJSh1anm/aiQBd33Uqsqzz4u8hHulJJb2S0ksX2oRUG0JbXP3JHkiHItNZQSp0jPJSn+jTSkQwz8yuvRqtP6DspBg8QByuNflIxPtez0GjbD9i8xDhvtJluB+xIJXAhebmMFx9yMMA3AY4/4L2h92b84pwGAEK8CUaM+vKMueHQ3ncASgnxtUyIlP9OjTvcG7l55pD9DMdIEGtRzjS/8ZHWg1Ah04jLzT4LnK8ieNX5hgaC8tjhtaMKAMwdCUuvCWYhGt4YLeGfgpgsIuT69EjWuglYioiGsJammduv2nbILoRKPN9zkHYZVfdPcc9WVtUlTI/6xiKfCj+y4wdP9z0b+NsKSRJNde3X98NmoF4t0TQEsmtxA0VmNuwTRWt2nShlUg2/HK82Foa82xLw0wM9M9aF5ZMN3Djymb9fLYshoFsNfQqXXbUmE44QgQPHFbmdH60z3oKhOtbXr3mL46ls8T/xUXVo+tYG4bALuyZwGEYHqxxezeC2LSyhYfIq4s2bMDMi6+oESJHaw6A0A82cjIxrvmvaQmv9rw/N5o/fzgDf9qyJedV+MMCe3muxvaobIUnxqz6OCXrBIpVYnpNitBYVj2/j042oUXWiNQiVnELAswBN0dMF2BQlqv0HqxTth3QwZMVQcEW/sPMLLE91PfeBuaSmR6Oe5wNLFZwQWq7r8Vmp00tgTzLJDIhDqPHc7D3pgn86Ptg9HrraP5eU590pky1tprcY9Btx0q4fgrXKZaw9OBmtEb6NZWNe3YRdIgLdASFrjGnal0rLwVohdcVtjweYUGEXnIsHRrdO1dDjJAWCMDMKBZIKkDT6boSPW1il894SRDM3JFpGdLO6Pt99nBbZUuYqxw2mM1yHpsQbdYLdLmPVZF2nDSLJ3h97HQQtJ8cZXGU4/lEO5q+aOy/bQ2E2g7fN+DVnDR1oKJ1zNAB2I0tloxFhm3qNu2RQsou1PmzkFi/pA4BZi7Ma8BzB+DrcfD3kM9cZbP8vsdLpCgRhRVQb80rddCVTi/4gTuDpzMqcu+fzO4cFHV4Y+OMgKVdNk6zibojI7xJTZoUMC8mlCGuHc0f3m0/pjLSLq2JzKo9wwkmyPUj2AOetono4Z4n0STloNadXUQpENBwBi3zWuov5VOyOzi09FPi9oi1rEzQqAOFmjurKyiNeLhlfZAzOQg1tp/MNzdh4GBq99TcWynPdvO6QCGsVJarWHs6cLyiC4K0IyNL2O3mXuUPy+flAQXsEjcepEt71Ca63TcQAV8iuDFCnX5QFobWhI1Qc/rVgd9GeJopu2YvYS/zeDc/uH+fvbiJZk+PtmqK86eSkwdPGs2cJZHy0fJJp6lR04jZROqapD6peg0H5WGtWVaUEYMlkH8ZyO9SVFfOGrJBFo2irJ/h3GURDkmvAljm8LARqOaIPzIBwc25JjMcViA+w0axyDlhIfdC/sEuAOkLcBYfyiDtPUiXVrMLi7wO3IA1CJP+XWEnV8Q5iRoGWBJLp4W7CaoLY/WcsDs/wenjaEnA2EKUYtiFY9SJGsugMD8GWACQQMWBIhL9q7YumB1vt7j2kfwq4+jcXDsX7jINfQ1xr2oY7HuJDTpeQPvDbua9MCUGztrTfjmjKfnzZYXiJ43NK3Wqtm/IZ0BW744SvLmYInHS40bMR139NUs6u+/nEX9/VeyqL//chb1918Yc1SQRf29LQb1JTLY0Vqu5WpkorOyGFTF2NsIK2L0ZpKiGLippCLGfRwCJw1qL6SFmpXuM0kUK6xVNI/kooTRwYHkkaxc4lOKeX4nU8uKJwSaZahwZCd471K22pPQid/nuWlhqCR0/nmG2gaNS8Il2+5nxFKzn0rGZr9QdvckdfjQZwpehbUZWpWBBDVxh9+GQqCRlis85OR2fzO/1N876bc12yp49PZxdvH18EmPxYusQAUHJJRiQMIWrosoXMbcBde/Y3fiLlXA/3I12/4pe7Io3lLPjTtystT2cZxshBavmqAb9zf2pjXozhbeOl0m6A61REm1v9mBLa0YSZnqNFPGLcfjq/2N/oeaVOU8r2jHzs2nw61bUHO08Bb5Z+hU0MSn2iBFpeVfa4gSCKcYRYVTHWgg2FI8GTrbkPkpYLNFK00D1TEFbIo9lu44sw3Pwbl1X/JRbUQzwJ6mAsf0/kWcU1iQ4+tLiBcpW7hL5SXEi+QQH+eO8uqg/PoszmhoRlS+kdQSmgEVH/dHtBeZx0MBVdBm9wxzOuCUDQT/D7Otnw8PPg1u7TH4Bz5LuLJyri0Sa3TrvK/jJUuZGB+rBQfBCHZKXbCEoeKjcz8OXj1QxVws5mTQuIhAO041Bj4X93jUcbosVQfVphJeLcEsviblGdakkM9BF6fzBLziazy4/xRbmheH964c7l3L5h+yGJidDS2Tsw7URFNeqawHOyRW74T9kUphT6VlqDP7JOYDmItN88bxWldrOJiGcxG8DkU6p2opJduS/mYTKNU5/w2TazHtsTJ8/QgKAB/P2ZnkzpBh+RD5mm6TWExZiy546ZZi0IpH5iAVH/OJOQVt2O13EAVFQnPaFCBoavt0B8r+iBwgTTQHhkAjzv/CKvyHhGx+wCHIOx9gCNizK9l+j+qEHSbF8UPg6UkaX08cGJHTr4MkQu1mpoRVyQMlRJmZJhEqC+gnIh1aH9BPyNx6Yoz5vNz05VW4ZfF6I7sxly3Oc+2pEE+UnfWRVjKd4IJIRNWYAS5kAESVneXioENVVOEgl6Nnd0iVneJi1UVV5n2lKsCkiqBEFomXphYTPz9M5U6x6inBrAmXuo5erx/2nmSfnmWXEc/CbIIa9mXASOMzhlhBiw1JTcpL9HVEjcAqyMYGeoYbVwZv5lSPCAzU4IbDI8r4w/YZRDMVrt6NeBmrKOGIdmTDlTNNVL8+q1C943GuIMCw9/DjtaO7i3wpWdQMZikT04GMe6wVh62tdu5j6Jp17kz7fI3HUhznJtZ+j1zii+vZ/NLg/fLROfj1RA+0LZAYm33CEKDOHUz9XV7iFYD//V6rJAMwsE34483s5/MwaQ8pf07DdMeOF+NvduhGDBXklkUJjd1y96GooW9xedXdhk5P9vKmFqNGY7og6ZDWeTuuwU0OtNaIZ6UwAIO83VkZnwn3CFdXDVdeAlPawjLVWEF9H45005oCY3trKZRBGk1kemkZ5rRZfVC8gBPrQn2D3ZujT/dVHzo4FJDTSDNoo5b7yjLcSJtZ8rONKEojtjLGQ8sLw/0Ppi+m3YhneJJoXjrucejktXY3mjkTyzRQsvNrWLG4yqM16zrjbfDgaba9dnT/UXZxgzc6AECOaaMyZXjmYiCdcHbrVMR0MpDcglWiseq6I7Fkb/78DMr6iTK0SVmco3vnDj+8GO3QLxXDee1Y+Cfb7jpBn7TVkPZf4poVDo1h7i5baQfSs+3dweIDle7AVB3O9OLjNmd/nYkCKW0iGGlxw6aLZ6bpBmZ4ypX2yz8P7uw4eEqV9i6m6cQzpzH6Atcun7wTTWN2sEmfeqYcz/CnNiqY0pFUuKCHZ5Ugv9IVBx/cz4E4HmZ55hUg2HSfP62RBqh55ebCiPYfseAVJgU2kfwQEwVQ9Hp0cTFb+F5LX8GNp86QjJE9iGRdUdnK9WCF8/BUFW7IHqwC2gTuxLTFYHZ5rI3xy2JHjtvIGrzZ5XM+sq7VkhOwyeNOKke2JtkFnDktUsyT5g54QhGz00MkIrrTE1crce102jjhVRV330s4b8N4H7xr2G4idhOv22jdxNQaTQeBtA9zTcBrw1wNcIO41kSS5k8TSmoQGQaPJngzf4bhmwRuE2O2MGDCe1WDIw2L8sGQjTXCoCSIciTMKAosBHoHkYD89CSHSkLdzz462MiWdnJvpc/B8Lml4Be8qgfLBiYH8DjEpAEStfBTgWeINg30C7DeGg3avoFX/kMve8QF2oroDMAyqCpAUoqhAuxkAMsEjKLAxEASXz4rECEEBh51KN7I+/9WYnxu8CLnd8XjTvSz4YT70NOpjxt3bt7beBdjHYt3WN6XWEcSmPjQd4jXCI252lpvYgOrLSY1MKTFiW9jvLzZGjNWnJ/95uv52W++nJ/95iv52W++nJ/9ZlJ+9pvC/Ow3kp9VDX/PcAuaA/7YqXUjHFr2H//xm3b/F/oS/9O9B4YT4937h7//zZkYbOC/h1/zP35TA1zRbP+Tffe35t1wf7vj8NbBrfnD91v2jd+EYvGTIYWqfjYXgv2f8MKqQH8x/WWTCwQ/WKPeraX/iBcIo6lOO/qXUgUe8VMVZHmtR//agYf6r/+exqHjK7qW/+L+PHbsN//+fwHbw06k";
\ No newline at end of file
+export const w="eNq0vWtz1MbXL/pVVHlxdtXs/J8nXJLs53nnu8HG5mowu3ZRmhl5RrZmNGhGtse7nioTApi7Ey4hMQmYSzABY8AkwTaXF0OK73HKmhm/Ol/hrEt3q6XRAMk+519/h1FLWqslda/1W6tXr/Vf//VZcdw+OtCRy+zYVnbxbyf8jXhpc+eOsmsdmpmwDn0xMVkqjBRGhqesQ8PT8NM3K2OTpj+2bU9q545t7sj2tIlUpicLI0Bh4Dj9Lo0czg7vmsn1pQ53p6Y6U8eL9tHjxfGjw6NHDg90fJVJm35lYmTq0GFnOAPHuZHtnrndS+/YnRq3/b2p0fyRw0eH86OH4e8IUCvAtVbnvr6ejl293XsGd/d3Huzr6R4a6Dhy2MnuHejApqH9e3b37x3q6OlO7d8z2H+gt9vvw1+7Ow/u6+k4sKt7X1/fvpSzLwW/e/t6Ov+9K9XX07VnKNW9d2jgs//8rOy5lYzpVcp29rPP/+t/Q0PFLh4q2tWiXeIGy/J6K0UrkzE/+/x//a/PTD/r1RYNM2sWPXf8s88/c6HBNKxx056Eo1yx9jCfMd7/5BhW1ii+ezQN/zlh44WNpfP1H041fvq2+WahefYptFStoue740bZJyKf/c/PQ/pjlmdW4BoT/zVMOv/5Z7W1caZn1NamjGJtyYPG4M8loBecW9zc2IDDiTLcoJN0PatQ+23MMlx4joJbwE5j03KkqbY0YdSW82Xqd+32jFF8f8nPIvm5jfoPf0C/6z9907i1DC18j+GYQMXKlyzuuORizlieXzGL2HnJBtrgatFae5wH6u8W0i2smi+W6jcf66yYVIyVm7G92sOKW6b+++Uyvhqt0SxY+OpqyxXj/VXgBWzc2m1geSVfhvatOzc2X24Al+D+/fqfz/CBMtZ42i8bQMJCCglcrIKdsfJFNxNlhWdsOOXyGXqB7x4BT51hc+V049Z9xc3KZS1nyi1ORPnBkLIzRcuzxuysUbByZtZz0/RkWXPGrpgFw/KPu2NFC5reXxozcjAQxvDZ7HdXpmA8eAa92Nrjabigvnqtfn0Nn/HNk+DU/eaZF42N09Cez5iuVyqZRtbKFE2/2MrZrd0tF2HQlwr0RKZkXqyt2nBCtr9bgEH4ft5p14Hmg7uN+dOtHcgV7WzRrJQ9K1v0I72w4FWWgb5ddA3TzrmOW8zQdzT9jJ32DbO2rDXW1uBN1x6PE38cQ7W1NH7tjFFbn8IXcHOlfm4W+d9c2nx5Mbj3bf2H2zjniEYeiOAcqdj+caDdyr/2gA809viKRFMSwxgfS1wd5wIH2drDok0jZxK/ZRkZw4vAi4t2OTwBUwMn+mOek7XHDnyDRfs48oM3TyNrc+OPzfXz8JSbb84HZy8C6+Dyc56hkxa8XUW5yNx1XgWrLAc2dDTTpic4uPlsDmYpfF4YdldoSvnvv6/Cq1+CznwPc4f6hrPr2tvgzi84h2+erd/8rX52FjqGI68y5Xq5pD7Z1iR8WhgU8FbKrp1BiVG00tQhJ21rZ2x5ova4ijPMnobu1JanxSdoLJyrX5sLXt/hTwCinK43QipJDCdheLfwgkYU+J/hM2dgRs9EGG2uP2j+/q3GyAIZ1J6NUTYnXRo48hIeTVmbvjMKdaC+lJdM8M3iEL74pLlyArncPCtGFN6h+LRwAUFRcXz4mPrjRJvhU+UMoaRIWNWW6KvVf7lZn5sPnvwSzJ2hJ6Iboqwcu1JbdNxJFBG1B6DLbRyCqhUFREa2AovbWWT0PMsjuLaOOrB5cTE4txScexs8m8W368K7xzuAEfwCKjFGWTMDgl/nEjbl+NvI+cG8/rqYprm4Hrz8Bif/uaX66h2cENaEhxJUZ0PD3TEn7XTBhLdEUwFlgJwJkVO2Ooff6DiqrBzrrzWUmYvYo/rJU/VvbwHbxsKbxq0FpAPizrGsMSMkx7LGS7vQa63188S22mNWwStr+Aw+6IM4JbdiOW457RpW+V8eYhIUjqrRM7OgNKRiqj2Hj197SErXxvcEer359kzw5ofg8g3sgaIFMh7mGekG2RYVyaq1rVBWHHVhzAyjYlhylULYBMWQhbHnZtXjZO2sVSpb+Cpq61X4yH428hybr38M7v2kniOkYWXNgvrWsrFs1X6H8VvwQJna9NjqFI9hdYbgG+gzA7nCePsep1D9xMrm20VkefoHOYb5DkMR4lcH8qq27MDM5xnjZ1kIaO3ELyNP/PUIxjP8hzEYjW58VBwAZ9abb66gnF9/AE9Kg6EE4wEQxJiNlCRikYThxdkeyHVGKwmtDCKf+zMxRk/+2Hx9U3EBeGJ7U1Eujlm0UXc4VsnEXjsmzhx88DHDdXwQ3xXCqiBkEKKuOTg1H5Okvu0DJ/vdiQl8jdfPNJ+s12cfBHMLwatZYgYEDUE+wsrNO2YaUHqc27hspQfJFf+6mBOioJUfPFbw530cgxrLCc+dinG0AXYVbPnNzJKfcVnpa6d4mISnEGkWURNqmB+n2mN/hvHm1g9PUBq9PRmcWq3fJNHngTx3MzBkfLdgeia/W1QLtTsVzy0VbICxfjnKF0+bfBY/bO12lcQegS5i1fz1xNaZi8zBUtfGmADBjO9lNOzf2qKsAQYh9DzKFti6CpBuVTcEKqAwJfHw+ySNENmG/a6KARhh0bi6BJ9KsQDZ4EUYwOwBVVDImfyJygBPsjypVDNBVdGOYwGFha8JpTXCa09+Ck6v4lcBpXdukWcy3QXDHWY0UmphGIHlWnuIzFEdADysxLmt/1qfPaFzU0g8ys0Bdb5oCx3rg2Bk1ADWJY860QTvTBgA9GiExnnkA354t0ATbHEOTAB4RoTiYHUuXggurwiBhVQMJtvKteTGeFJD7SHbadMtfM4/3Jo9G+dQcnX6APj9tIvyuLZulsmssJ3aatnI+o7JShVmqRgJ7+crynQK1v8MTtzffH2luf6IQKRjWnmDqQn9x5TR5isT9GhtQcldQbuEPgrjEgarjY1bjVUyBe89CF6tQwveVC1HOJRRqtkVq8Dzwxy3iqZDgjw8wxIB5aQ4h7IHwFWG5QE83qNxmj/fN5avgxxoPH/DxlARr0cjQVDi16WxxC9StAiixvmJZtC6M0LikJ2gGYFLMInwy0jrC78M3FUxIxz/539+VoZRfdhySgVz2iI/h0t+COnf0F0PyuOA+CbBzaC5F3AcxUx83bhvZ9VHTGwWdOGAkFZ01FYXVqpmLaOZlmCXxszRNgYoowJxVHA/zeSLWXoxW6vVviJ8l2TURW25VovJCe2XqOEi0Kk0U5SBErNM1P363epeYX2EdkeSDaBBcvWR7TS84yp/YwBi9RtX6G4NcccAb+RIB9IKP7cBuxrEjWDb9/PVENX++VyDtDFwGUF9GqpUWFJHkTFsFYFUykSUd0vkFINMSgFG1SG/u0S8EkMqySAlAg+E2UXG1pThvjuRo4GPvXp5DgbC1qMbzTOstqNwoH3noqpZKWVdH2tqMKoU1ZcR6lbovUR1pxSOGoWsW5RK0XSJkO+hpCfhlAuF08J68DN9wCQZjrfpB7rLSgqFRNlYNsHS+C+YL+gasMazHcJ5NfTZf34GgsLP+Qi2aEYlXCE9ym3vL9r5TLvT+bLt5BBdfPnltv/8bAKQJ/Ro6rP//Z9ohxXwX3WbeeyYEGnH4OJjX6IT+zPzyFcHK+WDX+/4YrqIfzvhr+BUJw7v2ud3p3ZMFye7U0fc8VzB2T6xc8cXRfPIsP8VvL0jQ5NTX03uKcNfZeJ4wfEKjjOcyhzeNXBkZjwHV057x53dxwsTu7ZXdzkzbq4fCB89sL+/78iMO56FC/Hv8K4e+G9PFtore1JTQLU7NV20j3SlDkKTb3Yezuw60tm/Z3fHvr6+4VRvVwqavx49uL9/9OCB/p7Ovo7BgZ5O/IP/7+1I7eof2Y0NXameztJ/dOHxnsxhZ2dnCq7f37mvI9/X0d010JnNdPR27exK9XX0dsPdhyX1Fq//Z9u27YTGnTs/+wT/v205YFXnHL/As78aO35/0zHQO4uqAkYkeSPenK+vXgtenty6cwIOp0wHbF51C6kK08uB9anTKZtOvAkR2LtHaFdotOd+bD74VtEGae57cers2fDGAPKhR2DGxglO04fcGt6Yj8YcnPHccZoT769OkF1RIdxCvg6aWc3zvzZ+WGi+3gjOXGb04lljeDcw9FzbsaSYRsxiZ9G8MYls3iG6BFpEu6PxI8k3IQQg2QMgNuz3l8jiOP1749wfwfVv61fXBIBhCkk82ZeEPCfhjZqSpWhGlmkwuwjifCa9UgYCGyk6yDEVnH0QnLsddU9V1J2Ezwogj8iu11ipRnqXGiNpHGqM2CRUjOSdMTagGjz0fJC1Rwe+k2Ga66goaos4LLZ+vFe/9D1ScT1cD4BrLPHlrSzibDttl8tuSbtdNUMrvhZ1Qmmih0WUwIbOB7RR8+RrEMeKYbUSEo/wdXMAMwFj2mYBX5EN77BSTpM16/riHGgJHIyAfgsWK2TArmugbWxE6O+vHhc68IcHmxt3g8vXyUGQdcCsyFplzyr5rAthDHioyuN8VLuDq08RLgy4aJUmygtQ1+baecUO1IA9iVgtypHdRzwIPdPxS8CT/fhFVw5vvZ11KCAbu2KwNYqTmJ339Z8XwQ6FGYz3R8Y2389f0T8eIRg/jhBV5CpmvhIjhJ5gx6/g54Kfhml7LrnttHZ4PWZtWbST8wbXeGpLMFekEHiy3pg/3XzyJjhBjjy4VjJCCpEeUwN3ODyKEhNkwt4qItirLJJxSyCqaXiW3Uq8CScVuR1ReNBbqLDrvH7taf36cv3SErkr4TakLu+Ts0unFD8OCRr/9m//Bi95NUNuK6QJDZsbl9Sci1MmCAXEcCBY6AHOCrjb2kp2oo+OKzIsSOCSF2QjOP+mfv+n+stT+JYduMWhgSHuZC8ykIywEA0VEOuO7v4AJsLlMYcTt2hZUxVcGImQI3cxehjw6UmI0ZEt6CwX2FWIL+HGpa0b88iQv5q4Sygbl+QiGizwrGzAAeIUcjEkiVoFzVXyYWnEG9+sbb6cVSzAaHFLMSZl8pP9RqshqEZAeHq8WimXVaLN2goLQVL+HS6xPPkF/htZYqmEt7NfzqutAlzIC4WmMQQoQe1OjCWpF4ClUYab6+fr104phlW8u4VbgSRIBIe3tJD/jN1l5Bexp5AMilaWgKFOLHj2mEn9jiJ79nTTOaeF+LsT8K5o8Tza/+DV7c2XG6r/BdvkURllTHqnXIYhUATKeRhiLJSpWbRWTU9oBHRj/kWedlzQY8cJ/BLuzJuzjfW3MGw3X54nYxhutuBF8QJygtM0wlBzmPJTKq6s6XQXKq4naq4hVHfkTW0+PcmuIc2hGutBgSZd2ULvDwEdDAwoW7Y8JucBP977+Qp7DhqXnm6+RgsZ1w3krfTycCFHIwa6Rz8EbewYtFLABF2YRrSW8/P94Mw6UG0u4ogYcyyAslHKZeg2mNM0UEvwBMJ9IBuLnpkhH6bwXi/j1yf7T+t588E3weyrzY0/Vf/B9sH7q1k3XZAyAKbLcgnDI3SyvmomSRCyqz2kIfbuUZRV4/4vjedvFB+42y6VI3zQ74p2Nij3aSG0wpZxS8ktMM5pYQq02dVxll/NlRebb85vvnwjpFhVkSHKOAVjxN0CaIA4feg6gCTPSOaz+fpa8Os3MW5Tbj7GjfRjxS2yDNcPSIrIL9y4t87fVihLukZ4v8jzmAOk6ql7k1tR3vKfRnlz7Wz928uKProlTaugs5BI0gSUUsKV4QIQdxiZxk+ZtWcmKiL6tEueQZ7jdyeyYt2ZkM9G88Xd+vlT9bNvNRwp7ndsFEbCuVC2gaBi5eZgVnlGMWxBLUL+1StjBk0NhHSEih9u3b2Ek+LlrxQUZUcIszJGfydoqlwRpIKpVLTNzWYGUDzbELcx2ub9JZgUQD2HADJP7tWFYO1tY+F6/Y/fCT+ADC6XTQyQEVwAwrgVw0y7bL5/RochYYqgoOCJCNmbZ+tnZxVZxzFjVF2jABBUxOHAkIdvFMbl1J6DJeWycVg//zi4cEqqaXgDdA2j5hJKKFfcZCE68swSvFhcyWxLRpFI8hjrpmrEbNWsVWmnxixUzUYMrcKoGSgNwJjZF5pfEZNLM+mkjRWzrULD6iNWVcSwiZoYul2hWRLKgIhZKhpk/zh8jyJ3BdB5Xn8YS0dhdATTtgG4CteKu3Uwq8FLHbY+Bi2NNg25azdu1C9f5ns1PKmhyU+BkhGEF8FSUWAVxSMKusUwVBTQRI/ak4jhp6wGJXCxmZZd6Du1YhUdpcTgQUR/R4CBlF7wRuhdvIHXQZ5LTWtHtHVEbWqqUipJTTt6JP6V+goPWXGFSkoqpqhSClWG9xF1pKmJUC5rMlvgO4XnaO1ASWJN/OoidzEvxU8w/4jFT1QKotBTUu8TRGCr7JIeXRALI+xtncx2tHhz42dDT27CfdKLGz+lPLg723pw4ZZJ4bydzJrHdirv7eH9g874WOZQJZfdcdwt9MG/X36RG8nDr+yO7flcsXdvdf/gzF48N7SnZ3jCHvKLvUOThb5t2WLvxB64dRBODcK/7vFCX2nSL/dOH3f7ejsmvh7c5dglOLF/sH9iZHtfbvsXfflDw52p3m2dqdz2/AjQqJTGxw4dGN7VnznUe2QUOnN0/+Bh+G3Cv6M5a3se+taxu6tzVxquGT08ODQFnejvGage2NU/1TPp79831FM+Cjfu6u/Z23+wq/PAcP9BuPaAW4C+jwEz4DW1b2jPQSDSf3A3/nUN9jqH/kl0dm0Rpo5h+8dJm2dMwDnLfPB+PiPiRIU7DgfH8j0A4uyLIyBrO0bRtjwrL6Y/+jcBkAh66ljSrC2PC3IY6fJugUbr5XP1y/P162fqNx+TveLxPRrdgo3Rgi6GwYJQ8plSvIXiczjW0qs9NKT7AXRZcOeX5uwFdj8AUiublgeywaimkUElysGekQtcgoEFIpZbYBqj1wSVR5TD0++CM5d1DnRHhD68CQ6GLlNo9V30OtQeVsRLomBoPINaHazLStnMUzAVOdyWaJ0Tf9FLe4QRruTxuHUfw0WX72y+XN/cONd8i1qwiGHSRR/trTG3on0ZE31t8K6QR86UzDWGRngNi4QcGnhZ8b1u2wUVsIprhXNP4aNt/XyHQ1WzFq+TF+J8GR+CmshaaFBmGbAq4Mgn4Fug6JenamtjOGBAT+BoeezgK753MVj4Jbi42nh0XhjveRA3Y4a8S7zjil0gZKYxbeUVCY5by3EoSMhra+FM88FdxQsQSdkuwHwyFFdlgoAVayIxeKlFaYiIY5gXFoGcJfpmVVpTXA8WbktrJJ/xC2VTrC+3IVa0PokeDNQINVqtJh8z+ix1mg57sF0KQo+RDn3YpH9wyOG3Jgc2qKHg8m+SArnGzTG3/Hd7HyEsSZbNCDEXY0ZMoUsci4+wx9yCUkk8Pwojen4C6/BdcNRNiWHnmTqd8DikJEIvqwYFh6BBbQshd3OleXZ9c21uc2MW3jF+MNyvEmHg21kKfOKpjNRWRUsZo9QqRSsaSSXWTqoqjKp+Y2Vz/RKNL74PBrKvyYuQMrwDjaZGSJHA54/ejn582hMhZrt0p5qANE36MDTvqdmvPc9jHACLFiXU5i9tbtwHscJCjcY9OvvyBjpwiUltERQwTze0KdwP8MjxFhxiJQN7np4mHufYYoOnCnloo9iexBkbEZg0Bqk9Ki552UDOECklmw9OgJQM5aNllUE8uhV8V3b+nwtnK2t8TD7/9O0HRXSkD0JGFS0H+SAi/Vxvg/lU9IVpXUDNmUdp7KEtglC7fupO8Gau8e0fzR9fk/N7ynXKRsW20o4polBwk4CdDYmrFo30YhHDTycipLd+ehMsPFWkK7jOP4b3adQZRKAIJ5UCPfbhM4IBTW1ZabhjuCn5R4+z0b75cjk49UcUR0xpEkX4pwSJyN3qVhr72p2OCbe6jgVCDt2proj48DPoQuNpgTFi6pSM7Ed1B50s8LYz0HD1W2hjsQ5HLwXfoJxoYfeInyad/NqqkE6Nq8+krywd9hD6ZePCSdkqmUJS4rCzM7Y/DraviHNCSugmYydK8f38uJB4v37TeLIYPH0t9YjcHoTaCcwK2UM2y0iM0L4yJ4lJhLgia7WhivEvrFt5qZANarO1iaY5aPAyy5Gtny6TFWdUHRwZx63QXIQZkObJ1UIEz9lpP/kkW3IYzEkeLGTINl1w+Tv0YM2zZAX5hP6wbAJnjKZcJNkCeHkMBkTJ5ume2My26/qUIcOFKEznMQWf1a/N1X+4vfnyHJjFm+sEGWzHjNGQ0e3sXIwQb9NsSdki1nvibBs/zwbfrda/vaxzLpMXMsYXBkHOdYQ2zXnWB7QonRaLUqQ7jc/Fvbry/CAVoSZ1WrY1SbOYdYFbtPkwy8f0BXHN9P2lolI/8BG3zlwIrvzG6gfEYMYg1TAlTVlB7e8SIhqhDgsVZW3ZjCgweNdCefHqd056DzKhjjx7MZj/Dh6daWc9cwoxKfGoCMHoMI3aMnolrSyjTlohvh12Enq49c1drYeVaA/FGgobKQCibeF6VYsrarYXY1HuiWJExLzHhImiBrLOgS4ApC/qtlGhDEOrTE4Yso1AaRguyJJEYYUWQzYmsTZfU6hYSN2o+Olkz6gtzUXx7xruEJ6nd37vW6BJi0BR8zA2RtE5otloyjrTjbJ2lhA9UYJCj+nxD5k6LVaHNH7ZnGkxZNrh6E+B/x+zJGI0tEfjONq1Ahl66gFhWDcWnoCFRw4mDZmHeDoBlNvKQ8CYOYqXFZoFCevnLJZ1beBsK5RNQJdSzUg0KaFkDET+H37iCEQLcZlCTIn6UwNGCih8GMQkAhiBDT6ILXRcEVf5UaGQ3NUkNd+ibD9Nvycod12D6gcJ2kxXYnH1xQpIs4GS9I7SNv+HqoHFNuuCvyu049Ky5SN8CqiLSN8Wzyu696xi0e0yHFx46m1xviZcEPpfk++WLtiEs8oLu6OtF1belTl2jG4bO7ZDOWL3DHYPjxYPDDv7Rvbu7Sg4R/Z37Bn1DuzZ21Fy4K8A5wcOHejJ7hns6c7AyaOHD/UM9nd3HtjfMXqgZ7w/L9rwz4S//R1WT2Z/R8/RQz3dpYKz1zx6uAdodHnF/Z2ZIx0HRvYeBy4jHWOd/eWDcGJosLt4cGhPd+/uvq6Bvt6uvq7dvd1jncO9uwfw967Dh46MDu0ZPAzHfcB37Mj+fXv/UYqLvOPnMGLEnKS9YOY4HYLun7T8MGZ6uUqbMmhHOK+1Nc+sNh5sbH0/B9YwST7DcjhgA10aSIwEj06ewbBjkqssyihySnLCPb4UkiXCeagdhy8wPbdUv7RUX77buHmL7OoIawDNRIq316ACMcgCcHMOLgHP8D5COuLTDoaSWNwspjgu79NSdoZ9ibTmx9t7/roIv64gin9UhWmZFkH3ixe27s2D7gle/tq8/3bz5c3N9QUMbjp3jsUVzIyC2IlVoa66ZKx46ZZ+YgeN2m8Zd5JtNNoOJPtZxn4K243wpXIBiQVxkBZFWudHLxAvim++FjtDYpwN360aYIux7DAnPTA2TTZavDEQGQaus9B2FnGObDGhywhP0wVskcHAwLeDwkboCrHHJTg1t3XndGNjLnhASL9qTqFwIorYmzHXyJpW3mzbCQzDoAAfwKl+DpQqvwkQLWgDV8TymsYf5HMG167Sinv9wonNtz/jS2hha1RNsfJaMPNFM2fwSr6AI3qsccEHfYxamJbkzOi1BFIMPQa56BuYoCSMDC1QDLLYUleluUQxJEs5mmGMKHihEv3Tz3AXdfP3O8HlC5svf6M4uZXm2x8jwcpFe+pf8IfjAuCvLSS5iEXAsWSW3XETgUj8STzT5kQQkWtl3oX4g3imTAyh91xuY8G5iiul3Fncx3LqWZtu4rKxJ5dtQbcY7IFRpoFnUxgvOuFqy5NmljaFkyOSECQiYwB//jR7evD7U1qc06v1m78BVK5/87jx7R+bGxdpsd802MlilHzDceQCO/NFXAeMy67YxKdxLnKfyhbv16N5ltQFXhJ+PB7rQDD3ffPJYksHLOBbJmakqGl6Y+iRW4HvA//CYLNEKA3FVNOpDJ8TDlR6alsb33C8XDTeX6XowNWN5omrPNDr3yxtvkT1jhOcAwZBD6Ov3RXm3V0Y6gVTZ+6R+wset2Di1hwY3rVnmEYBb4TBje0Z/hrkUqABKzuEk68iYztBJL3/nh0OHsnG8zB2uXfBvYf1G4B3H9fnvms+eUgRUp7nFnAOqQ4a5f9WsRwZ7md6Gdfz0xTsV6RYV471U+2OfqL2kPIleWKdrrY4xnHtLkoHHKHnvmm8WqhfP9NYO4FhH3/M4acvgVzEda98znc9+GAVP9PCvmKTPtSbsqYNViVbya18KXMBbg+OscXsBfd+i7AFM8hw3YpmjGXtkukZbsYu1xbThovzA0RtGLcE53H8qwtQMMsroAtkF6GF9HzKELlcamsUeuTjVqutH5Yav12sX16sX7qwNXsrePuIYPBEBqxXGPYl3L2L4xYDkaXTKcqP1he9UgfbRXQOBI1dtsQYcrQLtP5YTrRLvAXAn2C/MIwa1bnN9dPcv+DpM+hf8GYOhgyFSwDCjnXR2CVDpMu4+QXj5WDuGo4/YzJ6jZ6B7nk5OF+mravrRTm7HCGXRbwH72fLUo4LueA797CxMIfOuie/BOu/Bst3eeXXw1UafHUggA3Amk5azHu5kxG3jxQlyCmSNmvtRPQ894WsPABBEzDJ7aLITYHKlXZOzqHFt365fnYZ7E9QsBj8pnEnHITUqBcYdOVZkyT7wHTyLNrqDV/N9SK90E4qaY/Rmu+vlqknOJzn7zc2Ltcv3gLm7K6UHAFWVPjuOE8h58uEGBIZR66AeU22n2AK/ylz0geK5EbGweWXwanHUfagBKtFU4W+sQ2NgVAe0HNRiJigA8dCi9rDvCYEq0APEAxl13CawAvtzzTCiF6yGh8AjAlezXJYL0kwtKxsh5IXOCa//IqVUxFZijdCz7FQwMZ4w3/dQm0xl9CDuEhVndAlaVIfNFGKWIbz6XCkrl0gs74YNvO+MLNkkn9DT7nD0WO4td5RGXfq15eDX75l6C8z7gBTzyrKsCyd3YztuCV8QBn5UBFRqzHG5OvHKyQYT+wEzIOKtL/13gQLb5or17QUQKpDAvJWvUrcNQnanCaJoVInMeAWp+PnHCvmpxQrWuxhzSofJS5qrb8N1q+RfYrb8KE78IVA5VcqLmP+NqzLDCPLvpPh7XPS26RzASwY0rd10kYYuWEW7GkXlILBYd+A+spmkRdvzPCk6Y3ZGUJ5LuZpIG4zvNGGYlUplELHqGIdPFj+ATfe/PpNcO+BAqhisd3zc/Bc8BFKNBxNTLIw3rZXtd8A7xfa9QrVnd4pzgIX7RfODvvdQk51C7eT6T2b+66x8WNizzD0Y9LOacp3Ema0WbHymSLm+wALBL4O2mLYixmQZjA2QQGO+2lcg8xqNiRcZ/lwYTe7rdJinFL4JMWjEF7k4CRy47yFEdvYuIFW48Iv9ceLwemL5FQzQWyBsQMfEwbtlOllpdkG4l3lahL9E0ajR52k4MXWjoEM5pNtetXaGV4VSO4AGNLJzu+PehN00x4+mzLmGw82Ws34FrtYme5/y2pvNc8TbeE21md721ct5v316DgpZs0C5RjR+sJz0MtsgCaansJHAobkv9j0jGRb+6hlFrfHlAWWZHuFpk/E2Ak9u/jPhByamy+XGw/XQcfFzRjpHHYp6w179z7T7BQDw6BZhSXYKzEzhWI1I3ZJCK8jWDsRYcdwtYaoZbKCFvAcw6ghZhZwmQJeMKfGQ5/ifH+72FyZ3Vy7HSz/SoI5ARkLcEeZUBDQMZhcQs19BedV8+zzrY3vYsgsjo6S8JAgg05bQaexficCd9ogDHxz+QzqP7SiKxRSgFaS+CzCo4xbva+C8FwXK4Qe+5Wbv/9Z3/ipMX+yPahor9yTdfrfARPJSCKmJUWKjGiLrhyVZoxr3LjySVA5Seovpuxa1UhMJEdVxoc0Rfb/K5mc4HEvuHZ2F66JFgFLdLb421tOh972pDulr73lnPK0b2/racd77GPHxE3pY9uVn90bHBguw9/urtKQnR463t3Zs2dod1fH/l19g+JvYG/JTpfG07v37TV3Hz24awz+ctmjBzM5+AX/WqVxu2/f3nxvbix7EK7vyafNvYf6e7sP7O7qPtzf2wXtR0d2d3U6o7v6subRg2nzSEdPd+eewYEO4DfsegMFp6fsDR7oytv7+3JjXYcP9Y7u35U+fKjfHOjudAfcns6RA7sPwb/d0LdiQlKJ7du2bYPm7TvhDW2j/22n4x3ieDs3QtNX2z4l84QLr5DBMFoLaBaJpTE4Yfl8RnipXJVmGd3RtAFH5JKtcp4TQD+bLy9iMNm3tG+jipGJBv5jWWWj8t9weY/nRoxnlF3YGC4JSEbSQFEMmRtbJ2J1IMrWYn30eZn1RhlUrpjStO5bW4ZjS7Y5HCRdMf6fVxdgghukCgBK5MKdNCfhFEz5xsaV+u214PX3tJhpVM2s0reomlB+CaWL2Y8/zJPDyzpo8SvOUwYJ6Cw5SABdSBg29QHO/nH0YSBIskBKkiOQN+nCcHIMCprkbShF2pSLrivMayuy/GCia3LwB2dO12+f2Vw/vfXoRv3yPPv4PSGmrbJteujeF0rKERkaQu4esSfl7YgUDVoX5Em9C5K/4s2Myf+Rz9l5I8Jc5gmbMUAF4EAFoUhjiIGombVpFxrae7xjHO3ggoZTbRrifpUeXcFnH1MJhsOt8c1acOkWvASWkMHlOTXoLBx16JYpK9yKLlhrKob0Y31MwvpJnfWSupoI87mPiRi/tY9h53AJy8h5VtrK2BQOLXwTsgnHqkm9oSQz4fqZS3H+KA1wazfvtk2L1QVOA+xzeOn3MFODZ8+C00/RcHvyS2PxCfkBI5zFKC7ZDNDiHUL3hbQpE3smbcoP9ErGVcc6RJZkazd4Mklz0py2TULsJgYw0Ri3ykWL0fk6+dc5ZBwE2RgPcxPOk56DLknHEuDnCfkPbbhGQFhhHy4uP9LqxuzJ+uzP9cXT8H9M0vrnanDvp/rCCw4ZKRjTrhj+WbuM+VoninI9JtpJDzuAUZ52hlOKJnRUXlOhPfRDn9RZffNVS1fVdqzEXuLoQ9uLe+tYFR/6S/uiQQ5QECY30aKEYxZAUITiUaXBBCzp8LIEAX60hI6jzOZcxGvpMDfmtR9xkeLCiebKn3C++fYMaKhQeIJAKuPHhjni5WCA8QLGhEhLF+kerU/KXuJtOEWLeFvRp96KBUrZ6w92N7JoGe1ofPXyw11UiRypk2XaWSisDhD7NnW2bFpguzm85mOogGm4x6LzRbErCHfH0ZomgtJ19Hj4vPLyfp4WCn940QTT9swFAKjNlY2tG6caG6c3N67yRPaxtEQGV7LgUcloENlAsnJ9PNq5Iog1stazSi9F++lB51A/MXD9UBcxy0PtcVooq9Zubi1uBG9PsdZK7h9O8kKow7JFs4zaC60ZL2vh2jMm0Ra/p22OgOewMRib5dp6WizKYjBtgfZl8eV2CR5hHK8XE4sSUa1Pk6vfxgHB6Vbx+Si06uybYGWj+WSx8eMbTLN68aRY0QcjC0ZfFkt7VNBRVcQMH+jon5TmYWtPUQfqnU3qnIuJR7MS2jnkXSDvG6I7pfuCcwubr3/cOvEDTB6l9dp0Rqm9cRf0tIVbZ9H1lbF4G2UVW01OsUztmC3MFQu+z2UOWM0hTet9MoLt3BLm7mOv+L2HHM1WxaVbg5Ke+h5gIB8LApDkFjFpqhOeWXuA3RAxGqBUxLZy1R2wMIv6FYBRVO7AYm2tqnUMPyYu06YNQi6cVrD5dl707v7r4N4ZAC8yH2tL11AQVtXkKNQewlyvLU6GgRCOyZmfTMOdQUmNzlrfmDHzWigE77ctcj9ojmDYFGcVr/KHC879FsxeDM7dbr69WX/6kpNn4g63yjSjRTdnsKjROuJhyhPayk92R5u+4Mb3PF9o+eLK1h4RagdLPN4fgO31b98m9oe/p+NIX5I7CUCSI625MovhIlfLw1Q/i5OUmEtewjKZMZ5ZJcMbkaxM1LPmYUTNcVYZnDOtvnw3OHU/mDsDOoL9RJZTQodTPiPtXrlM28oe3pRV+BcJBYrbFsyp2RyvPRTSK8x5jUuUNIAiyyzPnoEhs/XDEgwdtcwS7wH6j+Uai1Wx3eK/QMAXUNm7FkAfXCot2Bgg4vdQqHrGFTs5xNbFAm2j2IMWzhV0kSxVVUdw9L7+Nbh3k/nT1hfXqADWLmbtgnBE+Wmx/IkCMuvTdpbEbljUDTLqsAd8Zdgdcm7aMHbYdVOQtQTYGUb9cilJMLvDoFeN0495HlWRmJHYt3B/PnqC6VEnbc43tjpjeqQdS7QwmxUDl6/xDxLzEsaNIuIjpzEWAsH5LfBi46cnwb0XjZ9nG4uPcWYTXoRP4fgC4VTQaAFgY4owZ1AH5PHHtN6FELZWRTvCL08Fo6Ffm2dzSy9ivFHqFk0jzjmEqPqGO/RZOYaPccRZueJJvjvOKoIX4hugOPXP4dpxq2L4FW15VPrzorv0cBccZRcBOCV84dLnhg4+i6LCxKbodVJqvJlvc+N+/ews3IRhrDfXG/MnsfDA69u4ujl/MuwTqK+K52NmKowo4ZXW0PFFy6wfeDBebP3402jdjvc4ugoreqt1NbIcm9hVXhdLzH/9zz0fMY9Hi3/lU50NiV6GmIOBtepH3QrKsNfM+QSHwges+Y+Z8ZqJ/Pct45hBnGioJ1qaSQZmO7syZk0m2pEJltkHLMdPNxoTza92htffMLjamy6t5gptd/yQhRKH/YlGifdxSyQR2rdF9G0gsfUxPByC9TYIPYbNP4TIW8Gvx8kD8CO3Q77aBhgGu3IbzAcArgKPH0KNSdgshsiSsFgy7NGhzgdxVgxhJaCaD8AZwAYCSHwUPUQQjY5m2kEZMR1CLU1TQVfOYcq6xSrv14JpQCD21Grj7I+NFw+C7x+34gCVWamNhvpbuqmdSm2nQ9tozjYLNm2z07Scji/YJOenaTmnFmy2fWzBRmWo2aYWbArDfQfxrzg+dKB7xt03kTu8f/RQ9374d5/p50e6d7r7jsMF0DY8YpvDw32DPakh28yP4BaKo9AMdw7CBYN7e7sGunfO7PPGh3YfH+7Dkp+7dmzLHfaKQ/3pkSnT9Ef6tk0cxhO9eN8R3D4B/+YOm9323n2pdHcGjjJHD3Vn93d07tg2kbOhA0dHuzs6na+/gru+PNKxY/vOGXdbT6m3q9A3MpSa9orjk3CmAn9eCTow2N9Z7OrscQZ3d45Dr3OlvV1jvV2du8zBFHAw0z1w0eDu/iOHrMFUqS+1rS/1jzZZkIb0j7tUDZDC6VVLRjahHSvU8fUNoYhRJcEcy2asYlXlBxZU0EXo804rSYWXYu2KL6pGCpIG198Rji1MT04MqPjOWzGNmQUoQJXkkjNtFl3eoFjkBhBjdMjhDrje9JDx2PqlrVurzafznOPS4ivLpkoUVVvEcOcoTceUbYosZlgEikybgAO+j+9B3l4G+sGpkyI1J5EAUTMlik1QDkcQVCW3YhZc2szPTVW9CTcw1ZYp8e4VEb3OMX2/ftNcuRjcfdp8hgaONQGqC4i56lYGWIqUfPUadf3Vt7CIfgDFSn0AnZf6BKjxCmW7YI35qrYKpXHFVHIM594t2JRJNcvZ2VRC4eD0j/U/F+uXLzdfY1gNgAAyaCqyFKcUhgCJMIFbhI8ZNn8aP84wuZaL8UU/wrVTom5UyJry3zJ9La0x1Zszi6ZKa8yl5rjl/XwadaMosnuCwB4n9F252niGBX0AgWyunddyHVfFzbKKybrOQTS04cCfSlZllBzgU3GBFEHZQM+q9qEoCX7ZLZlk9IVfi9umaRjLej1otaVFko3XT4K1P/gTUUZwcfm4LNbhVlppmxhhIYq0RhjgY2ARQRmHL0Le4SGClTXMvff8psyqL/lgAIPMPC4eAxPAyUSRPAKgQWtZJP9aUWRs/+P34PSp8AHktRxLBccYERMlq5pjxNkhtZgXGZtqa2OcrDSYf7T1853mi1syqInvID8C0gkTPESGcbyBI6dpGl4aE8lbQZtT1CCX+byEH3n1WnPlRfDwbPDgqhDARCNf8lXxIUyRFSFdrj2sUIip1vb+ajUkj3ZBweCwsObKMpNvPr/QuPcK8ypLBghUHJlVHb4G2Chg2x/32DVAx1Z4KN2fLCMxo/0v58Gq4m9hlaoYjCKqNdm1Vc/CLFkxmq6HAjdGWqNLsUeccZW2rDKHrYVvm+cpPYhkgkuoedVt+C6E22K/ZYVm7izXZebOjtFFct0T0TkGwqpbqc2PtOnVnmUMHuKytTEOl8rolZ8xXP/MenDv4tYZXGMibhTyR0RVbDR8BgCD7PIpxo558MjYxdtS5QVvTrDGAJUnLhdqOrwbt0zQomxLi8zOGyFMVb3oMd5dGVPZepkRfuOVC5svn/KgYXZGHqnRHKASeT75EkwZQWxqscOcx7H+0w+c0wRL4PmOY6qk54tYAdLRqdieyW06NSy/w+ncH9I2rIe0ef7aqeDUy2D51/r1M6K8HtI2qoKCHB1o3efLpkNBapEjWjVHfE2rbwu/bP3wG/czvIjeLE57D0y2yM3JrSFJsfq9Nq1ob66fDy7/yGF5fANLFCQi9tBxYWXyloJ1WOS1WtlMfiE7Z5blEq6q3yxYVcOSzffWt+5Q1Qe+FaO3MN0oZuMWD4W4aB05SGghSUcgHcr39bEommg8vrr56rKCEhHaESwxjQqfyjGiT2NcP6LaD2h+8tzEUp3fXOe5Ke+iXooDDo41OYx8vLVNkROlTbWsp0waFYdMfypp8u0lM4RzLph/IIoUlitqDRLJ/fWIEElYTQyh3JtfNt8+UWXFCM3RvdVpVwWGlmuLTpQFRYs6MTYtLMTQlzX+dF4w/hsbl2nwMzMD+ZhOJqpeKWeOW+b0I0rHxltpayFubhTrpzj3L1zfXF+vn7+lqVvttrAIQNgoR1Och2yPcImOK8VNDa0YQzW4MClh0eIw2EIZsUmZDWpOyYg1trV2W2Suy1KEDLzHhTFKwP8zJiWHh5xbbz55zcnl+F55qxCrdECTMse2b6TNqrg5kniCtIg4fX+JxgbRrt9YqW8skgjl+5BOyfayWqYoEK2gGkt2XplqeksIJUTtBHQAKggRvLod3HsprTe8D/SkSMNhT6ZrqzHy0OZGmzSqsenDtNXcUdQNKl8jKt/xICCpy9tpVFpgHgaxMypDsFATYDP67G3cfEOi69bvwT2KcWGPOQ88IuKYrQwjI061KRmm6EdHGzOJDjXBgsdZkts+YlF/1JiOGdJRUzTJCFWWp25zxk3BqBWYZPzpFl/M1lNQQaJG/fcnGncJlp1m6yRZOcquCc0ZrZKXZmi0GBhR80XaLq2GSxTwx3C+bkEo8yFuO7R7KcnYPYbaY4hdh7xtgK7CtjqqVXCD49rj2FNBTIkpY8Avgvnawb0YwtOBnXyTAnYlITCFuzTEpUyvjFUqu16FIgI/jrNiIEvhEQ2KhIVuqowkGdQkoJkQamg4QwcZCmFE4EWod3UdTI4s5Nui6+Gzb91/quv6qJpvVbcJujauaHUtm6hiNRUX/tR1mVJhuuaKCPh20l5JeF22t4jYmHTVhaqSpDEZmlTaMmNPWt0Snw+2FrZsOa+VtUy6VxW1bDmp/M1ftC9piTdljx2T5sKxL5TDeaCn+2DaHJzcMW139g7t6v8S/p3Z3dc7VXJH4f/mdvidHRya3GF3Dn+BDYNfVSfG02bm6Ogea/T4kcPlguWOHhn8Ysod/WKqNAr0dh+Gz9k93LXLh+sm0ubR/tSO6c5+M5c5auYzR3u6j3aneuGaQnVw/ECqJ5872jNu7useT+/rzmW6RoHzUWB0HC6woEMH9wBJ+Hfk4P69HQcP7O3A44P7D3R09U32paZ7d+7q3wctdmc1u29PT/dMX29x51C/M7RrdCD1RV9q+8zuXniese7hodS27lS2J23u6+l2hr+EBwYq/yyrD9asXfRyrpfFclU2xj7jGqfFZZ6xqIBPS+yyRZbjKbDPeJ0CrBoPVjANya1b9d9xQdHE6OmslcfdrOaUygsZ5+NZOUBhJC4EH9p7pBo5Q8v7eRLiWMmltpZXuVqeL9efvgjmTtfP3ePtYYqfAQKtovKYFt0ZlxNBmwVev2Xt5eNGf14HwyscXpa27AIoF6ocYnPOjuclSh1CMaqXqpSFk1ZRf77cuP0iePZN/emD5pllMYsAc+DyFlIU0rFYe6HzV/ywpWSKxcNW6hpdz6riklZIEwS961m09dABsR2qTm4m32R4Qmri5xMc0i2xwdwf9UsPmj/Nbr6hcjJ8PVn6rkxpidXgXXpf1AZddywqCsqmiGhUVOkZQDhepXVtohzcvRfcFPKReufYbjmsPopRAp7rYCJ8MpJrD0AxlEP8SafVWbEcqq2D0gK0S9EenG9JOHR4TbT+yw9bs7fr15+yN6eMSfPGBCiVlHUQovqCMNR2S2ZrP7hYmDwVZ/6c66JllNdZ60D9won61RWFXyRBlKGlsK4I7YfDkZjP2EVti5zWpO+P45R+4d644NZ6MPdQ3xuH9whDNldbddyMFdJubaKkNRQ1kJOF1TdfX8Rogau3GBfbRcOBqQxYEO6LWquTniV0vzJVwybACGGapeUbPGOlaSovY/9azpx0rDJupJhUs1UnjvN20rHlFezsj7GTggKrTBtydZ6Q9rsF8taT0GicfYgbiq/e2jpzSX4ZQcOwxmwnK+MXtVdlAoQuM2RLasS4zQrFXEdfY2PjVmN1Q71JvL5ajr9K/YvYXhrGl+0ft2KfCk7Ysp3yOpPJV4rxay4uBmur4ZcDowTXxmMMzTEO7UPRZ1swNygGHZNlhW20W9UCE92zRLpfvJBywJcpqxUnXaZmEWhGITxchAYzTgpz8d0VikRev1q/Nrf5+kr96dXgyb36SxqucPMYRpfk0IRz81jCJfcJPcSaq1i44GOdpB8ogvjSHJXuwopOiV2sX31Tv/R9rItYhpVYJfUSRHoag+dZzOcwFEAMXFlVQ7vAASGa18etLL2BASu1dYpcqxhaHQ4qRrHW/GO1cWeVy3CIwcoVOCpF2ytVXHfMYCbtemR4quxHYnc8+x91JM7esJgMhw5x3XfbyRhcHxcxG4acmCjQ1fgKr3LtNGpphwR+OKaEawNDFwUKv22nOdM+pzQNrlwMXj8DRB5cvhHM/ghfjiQ+jyssJZSnepTI42M9w2qknkv1hpI6pp1O6IpaVaN4P70/wcoajH2ci5He4PZYL5s1o7IUAVzRLmRNXZrqjQiMOMEmrQJMUVp3Yo7CZv504wmuAYCAq9+aB84sbMGKKGP+Zkus4zkYbIvPJTKc5WilXbYhU9EYcsMnGydLOK8YBXdONi6hatPoG0SnAFaWPSkqM/E6G6vakpkN1x4y6piFh8zWsn51a/YbtQBREVcJMKm+S5RgeKId5cioIRZqvIRcImOFWeSw7koyTNFOhRgFMEAZM+5nuPQKvj7ap339df3Sb80HdxuvrsRBCdERKwpU4VCNBz6DSwpc6VCNCXki5GFopQ8pthE5cdlD+YjcX6x9qFuMPqESFrXWuOuFVnDkVMaqRooKUKYlWohCq5srCwR/3g/uXQRzm2U7EhO+QNxpwFzhTdtpMx8+o+BCKf/hFPp+wtCC8CRyeveItk1ylk2BZ+9drJ+4E9x8Wj+xUr99XVm1xNAQzKKTLGt6OZFDV3BRLSJdn19Jml4wq7dmZ1unFzEUJFqml84vOsda2C7FZhnwq5/4Q80yjU3CLFNPV0RLJrY8r7URVP/r0VTSA9ZvXak/W2zzgIoGTUQ/V1sMUZpG38QgfueDnMmwU+zAmpMPJy82QvNRmAtmgSolgNqaNitxeC7yJtCJ9zcdAzPrFTEEl5A6zAcCYpfObL6ab9y+COC8fveJKBEYMQqyrRxdg4svpzlHRYwtZ8ywKiKRvmAW8qck3IjSKmwUAF/Rh+U7wYmbMaMga5RcKaCtydripFvEBe3aXQy9zSEjkZRGnChSgIpoV4vxD4sS8VLYIVY84m2V9fX55snXAAuD0xeDyyu8m7JK91PC2Sn44cms+PEOuGVeCY91IGxm/u8ezXyA++/fxrhbGc93ScDE+av6srjdseyX4/JXnLbxrFtuaybStj0MAq6tTQsLbWEijJ19di24/F1jYxlsNOiTJpW5Ai2MR/Rzx3VmvG+RiR3tmCosrfOPzfL67APVBTXXox1IUqoF107LuAycdrFj9lxTxBLoIlydXz8ujCJhKQS/nG8822jOv268uQfzXdgLpSqIPqQlHjpjl1zcYEdNn7c2JBHnFMO1JY/SAIb0g5e/Nk4uU0Ji7Kyk1SZPVKvfSLmLElxEumdI9wnp3hjpgxHIMvS6KJdLi7NFc7DoHg/l5wg9HEnOjRY/QqL3gF0XMadFgrNCmu/iX80HIK1/zeyPGc+fZJa32OSh+RmxRdlHphmdytz8ZDPzw3YbIc9W+yxumX2CPZZk88QMHd24STBrPmg1JJkKyfZBzChoMQfEqlzBlRHttWX6XaXE1QqHK+wdRd26N0sA308B2DF0HYWc7XCmwpYRVNkKKOMoUoNwCrZF0ZpGQyGjGFCibtC62Dj3Y+vHi1FopBHRsUc7MKJgSByDtGCBFvWPD5SENGIwoxVhxJRrTKnyek+CCo0rz4/pzBY1maiNYhqoRfeE2kZqmTZSPybspZhvXVei/TOZAxGl1hNfXGp3kVph+gAVsczU7gq11vQfO9usNfGdZaz5oOndY3C9WHCa8r86NOUf+to8OHqkMJ7PwP/3T/m5kS9s8+A2+JvIWVX4m9k+MuVvH5n24fwQ/DvVe3h4T7Zjz+HBVE9X5x68s6tzoO9wCn9By24X/oW7LfOgY7mFfGbbF+bBwnimb6Y6Yh3d39cL7RP7+8odLtwwtKu3e9sX9sGOsf195sEvj8DfaG9luBP6sX16yv8a+rJjf6oIZMeO9u3YC5fvg7++3srhfXt39XZ1epX+7oHd/d2D+Dewb+8QtHX/967U2NH9ebh6rHigqxNu7i8e6Ok80NPV1Z0Cztl/stQUrrKCTp4Uac5AmTzEDK6aOd1yhaUuqC3VXuGIu42edpauiDcx9wrOjGv363M3UL6eOhnc+4lwLd8bhkAxYeGQsDEZc7gmpF+AesXj05HIK3U6xt5AT+z7qzOEfcUCq+pJMD/X2PgWgG/93DV9sVg8pWs77hgN+Eicu2eJeJV4A4KFCu9+iAe6B/MYhpIc6O5pES1MS2X21xpU8n7lxtXYEWARqfyVM5d5AmoJ5hakLYEbRML0/WSaCakE2KAsdikkNLFgEjm/sWA3iyYMA5x9AEC9fvYhSycwR4WAwruF08TO1FYxXjyJn4MhqiJhdPxcElcSabWlKgtGxTo4t7j58qdQPCIJmeKOwfKMlbX94zbnAC3z+9XbyrZoRORmA6QRDy1SnfKCav3menDxGTI+t8RrqnwbPjSTiqZWzBqSRSSxYqQ5zsbQlpLEUxIzXkviRxTd5vUk6XtTU5aWBnHTN7vewnYCy+JEbSkjsmWGkxc/6fL14PQqT1kBn2n7eEbO9xB6Km6khsctUYahhaOI1+CzND8pAVuUL5ZcePCt4ku7MrF2Q5QvhsWUfA/LKgoM7VJ5M61dYGm3SCckipdFLki98q5TcqlcfwqzA15x89fTW3duK5SNd1M0MRON86b4LLeYoRzYejsFa8kTosjveBLfmyv1c7M63yrdmIc743x5ny0uwGEREBI8tPEWi4JYkyKa0f/rYpUDGDdf3RB7cA1xSzYMKbIrFqZW16npzRpNcskCUS3aictknHsLHDbXzzYe0c5vyYJ6LeioiHzhNOd4fF5U4UN0ARS57i9v/0WT/9W1xtnfORafllFMkerbJMcCyEBMsCvVEZ7FJOjUQuGIMlBU+hQeZlFoMJp9Ad1mf0Lw5ofmpT/lSg0SwTxumiccZidD/MhRGDHKEVSrBS1c9HJ9aVGEi/L1IgJLST1FBhrdeJskSNtsKZaIrACiCjItuHaaymdmMeGFLtBEzmjPzpHLXv4SuxDIGGDV813z9WP211fcSVsUL3kBv1o1vUVXfFC/c/i00Gs8XxvfrPEiutLrISPKHFKginWg1dCDQAWrC0IG3KaPRDB3aREEQHDvAQh0NJ98w1IqhDUCljhRyoS3FWOraYi3SlOOlIMhGdDIwrfI1LnEGb1CjToP0xkbVBEY6Hbo+lZNou4ebi2QpWyLttpgjjnSwFjP0ojmDebB/Eqw8gpGND1JBbdoGSV8M2C68tdTRyKrrKipoLMJW1XpBAYWj8YlnCE1QV+ZSikgwDjzHXrylteaZzAqUNRSiDFn6EKhiWMKyXB8oihc8ThtiJ1FURyz9geCpgQc41mALwrhTpQKQHSMU5E8aNMYYCncZpXESa8OwVxUdQgmTfsO6f7Ynj1RrzPcsAcNZFWDcZ9DGcbGz4vl+tXIRj24LGPKDOWEP1poaifa0o70nLmonmuMIlUt1AjDYr3RxUSR05i2W8Fs++tRTuwdmH21+eqp5vD38UL2fsS6r6iW4/1X5CXt6GsnFpHOE5dI11nZU7C1PSY8OVk3dCdEzhTFiXVH+J5rq+R1fP0Exmjzl4uUd8d3PS757IvgU08U6dQYkTym5ggXVvA8GzR5z3NASXpB3LDQG662SnoAx0Q0kTgqwoj1KmZJRty8W4gFDm2+XG/OnlIhQ6SULJXthAiqfrmeJV9FjHaULOFZu7bIhWIFcZBZzRd3aOhT1lNHEeZsREQSn0muI8WPRTisVuAL5xilcufhtLm+jgnV5hZgojVPXOVxRQHo7ti/5CqSrOMS0tfmBEdKaCdaeeqDK2QYTmviFh1dcn0VTHub4/DE0mrYIC25+IoqmXFqRVVcjx+dII0au7jVhZ/AneRMPvKBJi2fdMhSVfo1H3Gmop82188DUuSk4UjNmFK7Vl3a5iKnGRowpPA4ZVKW09NL00aeIfcsIVNO5LaEuyiOs6c2eHsyePIH8nxFOWCscrZoFwzPR19SicuLiUruVoZXXvQ+4AvDCI5pCknSNIjGSKgSXiimPFKCX3DuVn2O0hZo3HCjNPLKoLMpMfdSq43+cbtcN8NbTe+INazZwULlVnGiz2gGMLnfljZf32SbN7R2o543aVd+ip0Zsy+jlmXEoNTsyARrTrfgdNutxYySPvyHSahLQS34EbWIcAKmYVRyLLwbmg6yKypeVvSEAmSplkXEytAtglYrQAF/HfLrTuWKjss/CvB1dB9iY/UDnpg3RxOw+TP45bxEwCF2VWCV4T+pM1b0r1/Uf0HZGWJQ9aHVDw0fKmTYFhBqsIwg5rSYOlHQt34ZIywU6IvgLYWCEpCPwjsK6eh7eQQQ+SRkE4c1UTCQDACU2tcVfquij6t3TfEqfRtq2lAdsn79oALU9Z7SeIqC0C0fUjO6cgnVSoLA59rhlk0tooFtLkUHzC0iomuNmHjVpHpMruqiNCZEW93sMptP2+oOSRco93qbu4VrPemscqv/j3ZudZUqKKzy8D+US71rLHvIOjo6sLu35wD+i397dh0eTO0vIS34Gx3YW7UP750Z7O8aLqa9dF8Kr8GPeTiF5zNps1Aopqfg52DGdHpSA3DgFdKjfamhwRScLeP1JSDUnfr33tR/70312/BvP/wYxzN7gfXX2UO98LO3fyAFBHq6+1PHSxOmVyjmgcPhjpQ1OtBlHR3ogj50DlTHbbyn6+uxLFZ17u48uP/gge3/0ZE6sL+vYwTO7Brq7tw13N3Z3bl91/SRfrhztDSyt7cHjvcMdgHvUi9cu69j7+6esU4gPpjKlvpSu4aHOgf7j47Cv91Aad8/cbnnXIerMGWNctGq2LTrBodmtkj5hTl7JY3PtYLMK/DuBEZwUAn1hSdbi2vBpfONBxQWUQAShqApd777WYzuouR37E7nne8ZrV02C8IoyUqGzI9VkUUU1xzOE8jsgisnNtcfYEmT9bfNP1cASeK0F48jqGvOFORNNgDXQKr4BO7McTe6CzfCLnSsSC4Ca5fMQtZ0xTqkeEDcB6GYqMfj7IIxZvoThY9KW+gEH344kt7EKfJAelVP3uMUL+WpWjnA4iEmWNBKdm5u3G2+XW4p1mnxHi/pM1NEWqkpGqIeh3ajY2PAF4s7TN1YtHhJVLRjASAEg7RGe2KM09Nypsr387Qt+fJ3mKH24p/1a5fFltQS6GPMIm4BDVNjwr7PrFshKCva2O8pG3HDH2f303nUV6/Vr68pHlW+A2tqazzcvMM5ozkfkwcglnCNyCRNcb5hs4CBiGYxsowSO3INL+kPBUj45/3mj981Z08Gp+YYwEyA4DOsGVCWTIeNaMyzXolQL5stTaj8i+TXDdnIUL1ibYnKGT/OyvoMgAm2FteZL5rw5xY3NzaCJz9xlYbyRBkLmEX7IZx6M6CkKq6cN+KYCnoSmpOQ7MJ14e3FjeryGn6NIEgKFsfIaeQ0/SffpSQsg9PIVa0xaZ58jbBRskIlUQB+lD9AZ0nL5sIjp/Zd4Cp4vC3ci9G6nkTbMXTQLXZkSDpxThzM77hRXgRVRCvMeTUW/XEO+uWkFjGwvziHySdPr2L0BHwrrQ+Ii5BatBcyfNSBVymTrf3mWRxGZPK2LWy0qE2lV1U5XEXm9TOng1vrVBWX64nggk4e7kpLV1qlXFsHE5B2/0V54DmfTnGW02RmmCSW88UKrLPIdamo9MzLn5qLF2hKCK5GVRCNWk72pFg2c2qLtBU9egIXweQZNGtpV6CyhJan5Tv+ZR53Bs4+wPybHNFnl6uUjYuNKxum3FgSZ5eSXbfwdW3Z/tcjygG+WE1g23j4R+P2VZ0tp7tu5SnD1mXy6EgOLa2Rg8iXeX3u+uvgyS96Ai11oUgdnSVDvQAvt5W8KYz1D/CIm+vMUNnqUZ4Ra124CTBKr0RyAHCKLYq8yeZwg6WN/jWRorYolq2eszwd5/y0zbcL9UsPGgvfsR+dCWAeJkFWVNMbl4qZlGOe3Tsm62eKUk9gqvEyQsyDT0sMGfGwhSG4GSKCPTR1/Iw1bYmahspigcbxaCPWrnt3hQOVKDEsbwp88vvWjT9ghNTPPhDZVDk4nqi2PJriF3+skKkK8yRbK/JQzEY9lGITeSae7ViOmZKlUVVd9sDhRI+2u5pFNk65buVeF7DNQMDUZ+/zLhdyhFbD+9twkku5MU76Gi4F6WmMcAH3yaJiRIu3cUb69gmxhyW2daJlZ0vUycfRdcrJR8M+Z2Lt5XDbBPHA0S4tX+lBRH2H5q0lElsLsuQHp816+LqINNjDzRVEtkgVrSiZN8SSQhiButykQG9JNQBcQ283qc7fr2++4dBNehXiGo69JGzRSk+AjrZkFdRQ9BlWoFRT1xsILWJJi1wnstBQzNll0WDXlkoySheXdk5d5ChdlaLIlVkp2INJ67EqJ2BWpBmjWhU+bdKMclDkqVqFzD7BXBpPfuAcFCEjrE+Z9aUdwxHs8SETtiaPGRntrkYMx7dHR4wMbxdykkl68kWVwxb5IGEQvf7GmLR6aWHQvP7isIAA+o3NHLsDPk9oef+9L6U8xQq4vPAmNOdNkPabGzc21++xCrP8LOER9Jc6amcLpacXppFjloAF41Zr0nQydP1H2IliGpifOcZ26+qT4NSqwFmCq1G1JkLYahZMUAlFl0OXWlpCcw8TvqelsGctyhZfc3Fp64cX9R/+kJgWM5wXRKJ3TfxG6EbEb/RMjE9cCAtmSg5LdlHVUnIzMkparmQjCM44pp6dYAbknQxDXaTyAgUYJlTn9jaFv2/80bx6JVh40byAKXBLluXBB0HaLbqFGMYfTLCk+SSoRh+HSYfPglTCB0l03JcBpoqxLn6FPgblXdD9Cpo9/wHrWjepQ2NaRAN8knXbYtpKS1NWEZYmpTQmQwNSt9b038n2YcwyjBljmuH0UROsjS2k2yWsdqJmh25nRM2LGNb/ZEMiakBoODqCnvWVihCf6xA5Bo5boesnwuIETMzAUAOj7aCgwn8R5BdDfBGkFwFdCmnpGKsV8cSATjQXJIzPKVEmhHNBBveuc5mQRHCj4EYUYyhkITCF1gml4T8OI2IYIqLY2+hcpWkjOlZXeWQMtOwTU4pNU2nh0FZK5BM0SlsFFlNebglsfRLuWNeCMn0VLJuREJW0UBWiI4oDxIxSGVF1IcVoguRU4lIKylb/vAIKe4QQ3Rt30CdeoTz07e4XLvrE08pH/3U7H30IX44dE7L92NfKSW99Ze/ekxq3vrad9NHe7ROjh/pShUOFgdT+idH9OzqKwwO7+jr32ZPl6lfwH7hkOHtkaPirql3OmCND9ui4Bb8n+3s6BvF++P9A747CoW3DA7t3uIc6+lMlaBrZuX10FCAacPkK7poaSY3BP/D/3tHKeO/UkaGe3BgczHSnBntS3WOZke50b99Iqmvn9omurqns0N7urk6445Bb6BiB37u7Un2du/+9I9XdtQM62td5YPfB/d1dHduKA1PZI74HnYE+e3A83HmgeHAoNdjX2dud6unY1pfye1KDuzq93an0UWtsT39Htmt4KJUGznu7gePRLwZ39e3p75nu/UcZ/0X9FDAiYFpyWEVLCzmTMLdfReVyfjweDZhqPrjbfHqSKtgttMRMgZqTxAjtWlSIh1IdhExEq94k/FlLOSPsAYnctWD+W+ZIN4rCPlEuWHFdOlhxxR0OODa5ohysYfO7K1T4B59QKpsSTbpf6z8vYtGhs2ukK8BoqRhVvkurRB3lwOWYYhxo4xMVDNDoN588CS5eVvRp1FteztRZEMDk3V52VkhxbuJCLbok5yewGGP8AV3ndQuqN0urptnwGyiChlX+VwErH9AapkYWzGBqNaxyjEMYIRpyurrEu7mqTgluibHDgMaCR9HCVfhZtAte7WFFpLBEY2ZCfd3g+wv1x2+AoihWVqb7hI2nqNDvkIxGgh+fSfDjg30XEnEzIEtqy5Skm9QzPi46NymiW51jNeOIfCTThqjkgmXva2uUe2J1A8yE+snbm+vfi11wpHfQTeoQIVvm7NZZ0nihEAi9DQeMPkY0PjxEFJ9wiMSYhNHTuLppshFMbQK4Uwoezhz1/hLpr9s54SD9+bYWSe1RXScZKiGIqWTPEVqRdKmKaKyIB9EPK3gIBionb9nMmuhjowy6SjKQGWwXfXr/dEn0CmERiwt4UyHG2+OKO3+qHONfPuXwi9x89VNz9hSW31l42Vg4x7tVEdpYVgGDwhw3j2Wnyu07ZrfYmiRv5WJ/EmsudixLfEbZN389wWk5NebK1hTldstlU3hoOZi1QoX/JDSurY8zv/HWGNZns8HJ35NiWHGzp+WY4R6HCsAOt6TxCtvCLy6CdUKGMrXbksau/nyjfvUtmzbMgzZYh+UCCvojffB5sASUMvqIeHDq/taPf4rCLYIIvSn+jeWlPIBpebaWQ7pYwYpPOc4n85BE8xlZDgwzgHq4KU9/URjxgcLlUx7EEMWZONwIM16Iuus6682X5zAM79Z8cHNJTssJQLNZUxYi+f/jaSUH7XGpOB7vmPVocHh2VuypCcs5qvKMYq3WqVRkKcEKlXQ1NDIJTThjsnLvhVq5Qvn6aGVz/SyvU9Fw4lt1BjC+0ug20DnINsfSmzETbhFDXXUOW3dubP3wJOTgl8u4F8ZRJgAuWThjnAhEkcLYgtbWvx5VuCp3JvoQv50ITj9XLNSdOhf1UgCW2GkKvUpo0vLxYhCtSPcnxNr62ebdE5sbz/X3VJH3siEquxxS1J4jbNSeI8qGn0SxCZ8kwkdBxyytj8cONRgZCiqxaEm1CcVmYwUnWXAh3Lt8gWeDjiizMgxfvS3BRzaIktqyWfjA7fEommys/9lYv63QpPYCFQeKsvCsMdf0wpQ2sZYipnOzMWsQzZDGwo3m2xsKf8ClYy6qEl8uRWBtZBioYgHVs2Zo1UYnylVmyQ9jh3k6Njf+BMIkGEKSWC2xoIWj4Gb+ikOFn4yCT4kB+JCCNfADV2RKAJ++7tnvt2Z/CuYv1W/O8g4auEvQ4PHDB4aHm+xRDYRUw7Yk4lzuBL5wjAvWObn8HRMStGkCavVBypYwA0SJEHmIpcVl3eP68n2udSyqhIiLZCwiH6q3y0n4ZJt4uZKaKMzynF4I08VOnhBhu5KWetMYWI0Z+eAjFoTdRGhLbyIw9/57n3AtAP1f7wsxGV4kFi/lMbx4Q5frwpiIiXRJVnkhFrOKQ31uvvnmDSkwRTQU6pxHSO0jKkYPw5FmMNp/f6nCMfakrd5fraoRiP99soQJqG/Nb75Efw+V7cTFfc/UNm6Z+Qy6AihqF9WImeOtbEmsYsSF5aKTZPyvd1lZAZHH0swB+La4UrNYUVZBMHev+XSOAsqQGM70iivrMymLThHTvoH+qnB/slhKWKzgM1Bg+40rm+tIvf7iNQXnW1mdfpJ3Wjd4k41uJQ8ZVulGrm5h6r91IzM0X0OjMmpPtjUllXUnMlDqBqS0xNqYYepty/ccM4UiNhCVocqXqfQupYp/Gsx+L+ruaTZO1Lr5RLsmYtLomJ4gPVcpizd90I5osSDiloOGDtthQgXAdKT8j25uhcGfemsEVOpgT8NNGpYJgVIIwf7OXRrk0QCH9jOGa0JEoyMMpc0TUEV8noQAIaKpY4cf164RFRjRfZ+sUWPqVNduH9dtccUW0Tof1zcxZaML5L8njHVBrElCXe5qolAJwST5J5zP5DGhk0Nxr3P0lHI3t9wh/MzRduVg/qqdgzm8vnjsK+VYPrL34GTJtbv7Ul5/34FyMTtgjg5vd47s3QHH+1z78Ix9+Iu901OFvQV7arhgTw8f2Tv0NZwfyg7s6e1JwQ17vtzW3wcth7+yB1z4K5WzA7vt6vSUf2QvRo8PW+lD/VNfldzR4b5qTwr+e6gnNXJwaPd4+tBYuThg5uCa3ePWoczocLZvT2dXLmMOT/rOXqB5fAyug3Pp3TN9qaGBztT+fbu+7Diwb9eB/bu2HTH7elMzcPXoCJ4+2DnVnTo8kOrqgP93Dw2n4Gm2d6cODtm7U8WOA/v3bfP6xuF8pSv17zPdqe6ujv4uuHIQfgz2dPd2HO3vO7qnu7eruOufuZX944ZebpJzdmIrB1C4okqHLH4DZgwXv6mY+YqqMCnXpuWOZYmaOZ8GNanSLxGKmKuIAJ0iDbMpmPtZKwLDoQPwW8QA6vlhfbEaKcPVxHFtNY3OSlpsergaXL7IwBNkd8VPR5O54x2IMXEx0w0XEX2xsskySCMp85jSy2Dim28W+JVI+mxFqCBt/7jrWJz7kPdBUWMm1kjJiylnVlXWIEyLaon0bp7XX13FSmpvHm4toLECksEqlQ1JP8YN96d4boSXaiKl+RF2s6daOXqgOVtZwjvK2F5tlcvCxA5VtTOytURpM2lrZXD91Mp7YapecmTp9ye3Ut0XimqIeraaT9abS7PKsyXpxxxbwvLC0AmQkv8K1U3YGOoc+dVF2TlR2E5PgspjAJOgfrOGRWhkHlTMbiDIRdVTlDFCGQqWizHHdoui61QfakuUiwU06PGQ78m54NW68DdrvOA6V+7IE/aO2kOGKTxzyg7iAa+3UzSAjQ5iri8rXGBcoFnE4Zx/XP/1G9q2ix4wLFxJoTgV302bHKQVUozuYKM2MPk58UKMuxFmZFCdoMiSnExnx5zrqwvBmirrFd6OcR1pWdU6FGq+KOdl6EV0qRFGTtmQOcufvAlOnImLNlV1ISSGW1UKejWrsEnRk9k/5ik2JCRfv7GyuXEK/q9JOLzfkvvsdIFsFjx7zIz1XTXKuB4ahjjwry/rnfdUkCACZ9+NkZwxs77ZliKOOCwZGJJunjwd3JOBC0TbADSdlgWR8RVkbN7iQQeggkpapVB+JiwHY3N2Rq4bipHtv/4YvHnCqRTz6DdMyxSqTKj2gCJNdNoi+IT38T4EwfXuBDrCMEdS7TE5TeceBX8+AbKNjdMitRvKZPZLSvpuxi7UfhO+c5+rtrlZfLhJUeUE9wjoXkmaD8q/Jyo6s3uSilyih4+LOrOTEtRWWVGL8RS02zKkoJ52DJsrP8cYYm7USgJDLcUV4GwvE8moJVtEhDWF3YjNVeu/br5dDC6vKGkt4m+yYa4ujQZpUMdKm5GgeO2UPIO1gHhHx2PHUHkZfzsLzBqPzgcb62GkD92MAJHvJbsSLJYcLnLhB50UsNyyqQ3rFmRNX5Xlkr4QLG9K9d14WyZIq/rNi82VF5y+1SpQOmBxHy8nYYg6r3prBFGPotiK87EK7HeJsNl4jJwUG6fk4uYUnQvFf1ug2ypFEfRatrVjUTiJSihiXCUpmp/v4CtaWQsXS+GWfMWuiGp7JpYVKtA6cUhJNUboK8poSxzH/9KUJPLBqaXgyQXeCyHIgzJiKh+VUEqLSTXNQ5eVMwxWXUBhMU5XS53Px5EwUfU7SjjUxPqaHStgtVQXskDPVChczYosmAAHnpUN7TveLvVQgNF79bNvZXflVUKDuyX9Rl7M0SlxLWOqPq7ThA5uvpwNKRdtXK6JkuaHNDyFZWOAVH8PtbVxfgsa3q1ffAIvQaFeRTAEvpycdhlnpmIStpWpdJFs55Ix7x6VdBbNlW/rZ9cUi0LZRngF92o8OOktDQ6dDfmvWppFvTpyhWl8gle34UsqPuWCTTHDfFe71xW2UVyHsgj+xqvSOPA+KgydHONVUEwszQeU2WmN6znQSgwN8pWV5lPMerT5cpmXP6twPd6gUuKtOjpJrSlOF/cy1FZ9R5Ftvvlua5bj6ommrNLDb7y2iPnHUJnZ8NEy+J7plWN7GBVcdGeoGWPT3z3iugXkDpG1mudP1y8toVaev9Q8eYFCO+y8haYBlixUK6yi21FeqrUNL+2JmI96IkU98kxCpphUT0fZpdQiGzhXGennReHYXQFjLDh7UU1dca34APA+0jrFsEmRlNQA7S6kRTQr06zffMwxrYIolmM20x/IQhLau8nmr25Qx23pqIn7cQM3Yt0qS1A3AYVi0e08adtFbLqYBdZizSlTTjOyEo2bVrOmTd8TLaUWg+UDpoqyDFpsgjh4j+L2diZAIvrXcPLHcXgUghNwlQCWU4qEUFgh4CRwGseI0TVmAQl1JJiEAaNwrwX9MSZTSCyKwdiNqGEe/bcOe0LAE0E6GuxIxCAKeEQgRxwWkP8fxEpFV7FFDu5nxR9R+cLrrVTyx/W8rodDveF9cMqF8+1T79B0i64FWqS/EvqhuFelCTSBmyxolXzVJavIoBUKvlaBp+RcKOGS45BhqnYY/xcumKWt7qQw5PgFkSjkhLu1IOT4WeUi/vJDMcgoPI4do5uyx75UfuLRg7kjPanpqVJ2zDrYs6fj6JERv1z4ejwzak7Y6RHvUKEjdXT0yKRbdMyv4KqvpkvZ0SMzuwdTIzvKBWjcM7LDLxwqHO5OTXWm4NidnspOHsZfx0Fcmjv8Mpw67hbNbXb6i47U9syovW0iPZ7b05EfSeX3dOzpTn0JnL8cO9jzFXRj+/hoj7ltwoY7nD0dO498vX08A/8ePTRSSHemCocOlw6PfOFZPe6u1JfdqaHdfb3DgwO78K+/u6tzH/zbubtvYiCVz3Vs603tGx7YtW94cFdX51AfXJPfncJgZjjaDXce+BIeeW9/V+fe/m786+rJ5/b8Iw9xWKJOL4KUEce1xwDa1sH8BhiBgfXNM79t/QhzCteSCq43ZsgKdNkIBtJJyrYY3Sp7J3XUsHGp/uqqQg2KcgQ1eFhhoIx1Img2agdiTzbVcGg8/KN+6Q7PIduw0rGsGpi6zqM4wgIWcivyhv7oudoinrPEyfff+2WuhEchVxjBJUq2v7tCKRNf3AGGwc2nwan79T+f1RdekFgqWWgKpqNK369wzu1IpiRqJHQu94xSniCqD7N8nNeD5K7R4PTv9ZOncEFoRW1mpPthWpteqSTW6DD3UgufMu/2jCRmIuL6tlTM0bTxp9qWalFaxghxNgFK+r5Xhv/UpD+CSA47Hd33uri2NXtWMaBF7RLlGOFbY0kltM21tWeyMbLBlnOUYzy8zqZ+ba6x8TB8Dj2ZhM4KVaiHuyPB+i96lvDZy0Yn0kr7PkWcHG73Q8glNn7evBXMPWq+WaIoDB9z/Yq7tKAsjVJrS4SioiWjrXRqDgdMe3rubdWm590OYwRFqgLov4oWxFoP86f1vNtEQ4YnhExoapSLVklnI/STaKbdbpyCMWTTnD1Zn/1ZsQF1NQHKoBJlwy57TLVL+40qQmXmDTcrsqJxOEAu3I9T4kzDwQncGYVlT9yKkQUdJioVacQMmtaU0dKqCLxl5spWufWE2oxql7jaBtXF4UQlvK2o+eAEsAxuLgXLN5onX/POIuZrVB1cxmJaMv+1NQ6Ajz+RzH3NTfyFJkXyGmA8IeIchLOjvnqtcfN888E37OyYsjABBdydodtb6dsg3t0WDqJRbi+rRnnAw9S/vax4wAfB6+Ns/u/Z8/B/EJW4EcumYENl/rtjnK3OSZt8RiJncYJyc+BgcPEBxc6sEyuAQbd+vh0mOxE30H5h29E3ftkiuJETDoR8yOYZUxvIbEBaER7r8/Wf7ysevKEsSp6eZ5mckGVzkq22MlxRW+amtOWLDDzjYgVKuVCFb2HlBLtQhQM6a09S5bQQVCc/ATP4pw8QUhfz3qOSrhRy5FEOxSwoAkAA0xYrk/CESLWzhA5B8sWox7otqhs0Fp8EZ07Dg239doGBqednMrQLxhPJ6SKfPkJe//SRE2oQxPjROFDM9HHQyg+DouxJm7bHY2LTSc3bZDqZSDvK/oKsPRbjeeNScPep4qlcTuJejqfKmhUH8wrorJIaafsh7Q6OMfnlZmPjSshE3BjhwjhAfblKmSK4RULL8MOJdiVQZY5sWcoa94DJxxWLpCxqOWl2cG4J96PeuASdUWkwaU8T0tUGUTapJ+LEJ/RF0y9tu8LqRusKk490BtdUzBkBEN2yJWoRZ8M0KuhmorlCQaKUD1NYRGCVg0UEkwaDRVdesXXEHqIQnSKSsGdCpBvSR5cJZWTcuCSBrXYf9cyDQTkms3NqR1rXwp9hj+i/si98j+qKIqgfJHQlvA1remBxixyAPQRaFRAAFDMn6n3Ic+wd1U5y4JzINCyCwjbXzoIC2DpzjkPD0JY0rYIR3iYnRDZGrOxWWtpQUIoKFCEHkJP1a08VBxNvi5EXu5JRenpUbot2WAsBLPzVqlmTxrVFGAGyHjXL4/qt+/W7sxF5LO5k7xXBvqxOT+bTo6qdEUaKusHjnQY00W9snN7cuEo77Kyyi/JDY+JhJvGcQ1MFf3uAbZyM2GG9NCVmC8bCcn5vnBdz97AnaYBTBqYiGZf1M3BiGCQTudeCrGj3LEoqQidm6ATNQRm9t5SfCROtn15t3j1RX77LibCrjmebYxFe0Em0o7JkUqmfNNMYV3OdGLHWA7Ns8+X5rV8vN79/iRNgygXciHfZ+kZxJmNwGEIcMsS0hWKplAViFkf4UFlVNL55FXpS5a06W30o0abWvz2a3i2wp0uOpoAq64WjaQYQEuB6kTKBBw/ND9sPh8Hn8RMtw0rsYZTDKli5BSBMG1YOOpEwl7jGr60PWglI3bjWDHZlrccMdWHXyn/ZohHW89b3c2w9h5ZraIF5orZuxCJVtmjUAtVukoZam9t0a0y3iD7BOkqwijQrRddZSinJ82r/cMT4CC0O3SKQvlgyAdgXq1scEniLrNjydwxxC6wdw9ghUtRRLlu1EhKGYDCOkpflwr8Al9RvBVVDkKqjRx2gxUCiBmVCKBgishAARSCXvEtCA3U3QwD+xCEAimCKOMCIgAgJGXSkECpxHSGsKfcoBmqR0tV0eKhgk1S30tcccyyUU1TDxRVqqOaUgovqNm3iJ6oWpVI4l0SoRKSoV6JdBO2w2oCOCp3xUQkeldtKYutSM9LJ2jPby/oiZ/knqMBECSU8ycLWPyji87yuuCc56QLlSW5zt/AkJ51VnuSd7TzJ0vuAlRx5TfvYTuVL3je05+BkxSsdt/99OOUMp6YLA0P7Ul8et/f7bn4/HO3bXvXdkf09e7/w3cy2wsD/29qbNUdxNe2if6XjuzgXvd8vPkbzfvtO8zwwSEJEnHCUukutkrq7Wj1ItHbsCDDGiBmbwQNgkA1GGCTAYINaDBfyG/4j6kH/4uSwVq61qlvwbp8dYZmuVVWZNazKfDJXDiP5XKoLThjeV94TLuRzQ6nk2FAxNzi/P8gPAqWB8p7SQH9hKD7UGT/eFT+w9+TA0ZH+3raJYyODPW29B/fPe2NHBuKjXfEk/rc4toTEYVchNdYFPMoeXBL8N4lj+Nfd0dneNnds5EjX4EC8baaQTM1NjBzqTPf2T4937feGh/bCQUt7jmC4cddoPNcTPzy0sNgZBzrFydGetr0nMzk4+mhnd0f7SH96tu9wfN9oPN0bDw/H+zrbO8aPJBfbuzuOw+9uOKYPeI7/HY8yxaig7iMdzYsyMOSOoPWwVaE4ADAQnv7CIZXlohyi4405gMc+VY0200tludQ7Ze2vclura8u1m6+23/5Qf/Ce173UKTGmYmd4q3Wz0KRM8sgCjTS1zYvmeUvbhZZtF4uKdPS2NEPrpnblaN+YcLPvjYjZd4bJcRn4LrwSABi0oVWyd3QMLQPyCXCw02rKCXsAOwHU1nalsv3mVzv4waXCGLtQAsjQzCBMlvL/NlsqqvevJ4lm1vULr+u/fctRKYZSLOmnUiXl11kgNqiB05xUJQMJPRJbiAln6iy9NssHKm7vru/c/opH5My0TMl8CSz6RIRLdFjzivLR7UofL5qbI3bVS7dqt87xnQnHmCZrRat4+USYL02ZeBXZFl6YhZNWMLP5PVbP/FBd/y4SxJJPlDw/X5qyyy5iN+4w5fIwu6ZKkV3UJALLgdrs/7oxbenyH7/EhpbEv1q5w2HcFnOKqGaubjHJrB9EqkmqAZwqZenE8eFO/dZVe11KHWd9cy49NbgbTeeDY+rytRny0e9NGT+ZgENOdSdCHvK0IUjzgDrKKEPw0q3qtUt6wYpLmCga7rSLkJcdESaGvjPlmI1MNpuPO9l0eEYWu71QUM5Jr2gFaZhxtgaw3p2q08puNxUTd+UcsnzzRfXeFZVEpuPHiUILXqq8fRMvMx7l45S9F3ZS+d7mF6OC+nqpchropcIM3sXWo6yXLGU4zMmM79LEXTn+wCSYI9kl/dxhitc3r1ev/gwiC/HgdABXmQhmch4TVC4VmwXZieRUcUeLNGq5VdBswlLmNld2sDTWV+qb94QruVmiTGVqquxU1WrZbpkqo/hYE1xD1ZYf1RdfYA1VS3JIHyXTIMj50Byqzte2Gz9HeRM/95OT8xwFji9qoeAsYHt6gHux85JR/ZdNXjJSHr4sHCXFTPm69WnO1erBv65RI9lS2RUN71Ybf1yQ69Rk7SuUZkN5KjuITST1SIrMJtR6KEVr91/XfrkjHThBjSgLNe9jBUHqVebnyDilocc8REUyt1YLqsXuY44C46Cf8781Hn0D5jJABjIDwzx1XvNFyOJ3X9IdOXkzobfNZOd6TjS/JUTZ14faj9AmZw21IOkAGqJsHqI+oxmoqRZQyg4zzSSxF5QaVKBpo0VHyQur25VvWkE01SVKrDdnImvC9qxoxS5UDXp4/hKv7coDM3/VOc7UyJXy9BI9jAn7KUuuDndwhQepj5vuAUpBPWy4njqNnN5dr95Gn00hgTFD5WQsVwrzKedWkKi5Cb0ptJz3wfTkfRCxlqqOV2jZieRb+UZqTItoltnW+16+RsVMFX2j9uTcaGssgswxakRnBV1Gdup9mu1v1PU1wru+erHx4ZzN3uEcw+B7RYnkdamIBZSoiW44ldlaK6gKdqpOrxk0zYtpoXprdZrDRHAyvD/deLGyvfmuUUGlhOeUCzEm3TzfMJrDvCk+yhfsgAsuzqu6XL3zXO5FXa71FKmgeJpKqpu+GDDYNIaZIpR0x5XW/7ytkkWqy3/UK4/qa+dNiwyi6JgzPPIPs82bLNypAn5EuO9894e5aLoYV6ajkzerZJL6Sdli1MqXUw4vncEu3loc0UG2JFJnRTYNEUeKEy25IDw2qmMozBTXVwtZu1eDGREMrIUl4F25OioJqw6NvnCLqi1iWlCOyExg4ExidYZceSu/ccSedrfUMjFPArUw3Dj3avvNKcd+diJPSY99zHRt7kporOFmW/GTZmLEMIzag0LW2GefMMsixljEDNPxnMbW+aTdFbG2XDvHkmxidDgmCEIWZdQAYmGjJmLPNJkZu8F/Af0RuN+MvKOIuwXStvF1BFnrsGaBsBEoTQ+qFYSNgNcobm0FWj+GIAU3NiFGFWG7UDALJgLsKMNQAoterzNKdAGigl0u1hKApaCVCmgyCKg19BHAY0Mdu8GlQha7AQ1BFy6uMIBCYwgq6ULpU5tfajXeQrM2aVPz8i2RvZvClEKvXEc+KcqK8cr9knKQna5f+EMUlGqVyQXula4A9UaBoC82tUpQJeZYcDcJcBHbSmBb2QBGdO4iSUV+upKz2ZFdwDSQ9hg1EIO7PRr1Y7fYL27s1ucqL3aLneLE3r+bE5tOmvr8c31W4fP94sMe7Ok+NjzQ1Z5LTPbEs6Px8ZPpueTxowMnhvr7hrvaDw3FZ1ITY2OLpUkcHT+QnhtbKk3S2NLi5AE4OjGZHYIjB/GMzPjBBOwaSEwW+mHP+PiBk3Pwl8Zz8ZwA/2YmxuAfD48/OvBfh+NdcFYuDyRgdBoGO4By6ejAYFe8PZhJjc0lMntH4/BrYrS389BA/2j80Eh8fCTe3TnaO9p7rLO780hve0ebNxSf6mrv9k/09/V05w92xIFn6J8Y6oO/fjhmtO3QYPehwZ7hhb74np54EhgfgdPbRoaxbeLYcHy4a6kzfrx9pKO3I/43o6L90nxQyLGal98c/PlEVTzAta0PZ4w1NJMoF1TwX9bLYIKvPi+6LXRwxmtJqMi92GRJyORidKZVx97UBXbRsGQLqN3e7oAYuUvdPcLCwFpVceYTOCHMLjQFsrxQ2FoBkBa5DJbzZlfg7qP8m6yKcjSFBynBI5VVzQSef4mFNqjEVfXsm/rmVZ3aoK6A1nmMPAin/AT2+xFJF9kGiUf+EkLLINVZ/FXPf1E7+7y6fl7MGXWeS7MY+NO+TRRQwLRu21yOmUBji3q1cqN2c9lmgCdN+w4HrsOmi/BbUa4Yjfrp8Faz1CzJSmoSFECjLDh5S3p2KMpGu3HKqu4XSHqusf5ANQjEKFYVXBHYazD5sJD1FVDN+Ym8igLW48RWxrnq1BMp3IXVwGjp+3wdAyq+q315TwlcPiVWZjIRZl7SU2X+W41h/D17aJGbYlE9+7Dx/jowYhbFUg592w51nJihdM9LBWkx6+09vtlBuasFjsFHFje/qp05q2JC4Ki0MubxduDsKBcsk8O1uJxBv6RGeUZx9Q9u88xcKjew9sfmr4pXIUtkmvjQd4hKCFfcbA8mf4V6j+3GZA9mgBXaqDuBaXv9Xe3GxvabCvfn81NZb4aWHwAveTP+VEuO6EpVAROIYJJZZxDvihGxwwkjm299K5zKeDgFhDusIq1FqU8DNQJNsPw0LUa5DQ83BFU7YVJwiCJJWO6BwqUvq2u/sJCtvrjJdS9JjbKg5dtTfUhbXgU9ydTWisI55hrwEnKgod2Gb5h5x3xVt7cvfmOm2NK80IIfJ/Ja5qW1hUY/h6Jj3irey53n2CvzzlNVjSaRNaZlqNJerfNbDBlydi4sE5VcWE1XJ8OqwKcgAbMyQdHndm5A8y6TIEDTABMEuDcS5c9zWlp981Xt1N3Gs69qX16tvUPvZ3EmVQphWhRKoZBrwZsirZrY6tEmPjYHsBMzzeRZMPAY+1oXttayultKkDDDQVYS6P+6Vpoxd0UN1l/Wnr9ibuTKxUrr2OVa+LVkJsDZZdYST9vsGFgLO4cR+rJ8gdshtlKjklhhjorUL3FvcsqsWcKKRGqfP2vvogY3+FFps5If5/bGffig0CCkGkWosPMe3CkVx09QgJ5OKF/gfNuYvgAVJcVjirFltmJ6tqloTgxqaz/ruvuaNKUqIAk7oTpIcFNGeXMqtdoab3p1YJReo5BDKj7Ib2/nq2+qNx7I20tjjZ28F5HwFk9HyFs8CezNM3FHyjd+fw0MRMorBhEhH6ZLma01dDSGnq1PzHja202lsLcoIQql9uFUdbliK5RCCcgEem5kQW7DMxLSyKbFmCJLpd2wWxFOQKK8c2a1+uAW2XdMFu+FzrfQq62Utn7OJ71cS4UFDzBf9EwJgJeZiL56e7W2uiJaBNkUsWuJo0MYczt86Z5kOLDHDX0HlDMPAeWagwXLrYp1C/jmdGcQngR6CB8bm+9u2S1V6PhOBex5qbjF5Y65mHJRkeA1S3h3W2t5RB0Rjtae3RhTThPcW1YYYibTV7pWFZ+Bcj4b5LUzwcP6ABmfIo0xHY7bdOZDGQqS+a3HOd2NC6VTQQWaE7J/8GL7zaPqh68a689JNIVphGQZVQ0LM5sRYedL7IhWzEgaMfbOI6aIKY4Sx44Ic57SCslBTeRrd+7V7+G6JNOPYbHb/4TzZwpOsjmZReS4BOPa05U/E3qPs8Pu5EctvhKqaA+2xeSQOu7ot7lWu3S6euE2apeXFJTq5Qq6Ck7RzpgkPtRYA6FsE3szitCFV16Jl7gVAbxsv1kDLlySTXjEqLw5nW27qwWXa2e1AeqcnM+Z+co9rXaykCsVgoUm0E+DLiEG+wgpefGR29EA2gccDmi88egrF/AzEaMXsqkw0aKXvLXP7icvcE4ZGdyalPEc8ARrJtpQXtORrDmm6swBM2yP4stW6X82rwu3ASMJL3Zmezaflk53cSfoHyhrGKPi4zr9O7xZsfpb2futbHzlShBjXpvxzea7MkT/Yf2KGrGW+epYxmARIxbhcgLaprRCoyUqWhmRrilnm3ASEK1NNm0PtjTTbJVq1ZUm7Qmnab25u1HkmCaOiBfBziE0ttrA0nbNk9HG+vYslLknwVERA0LwdyvcLXDbAtrNMDcKcD8FbT+Kah14aVESGlEE6QBHCyeSGZ6K6XLWt0Gf3I8itCgwc+EYl0W1kJfBXBbacvBIMw4R+GEBj2a80QQydp0NLoRwdOwuelW0qaNHHe1plKZRYaK4RGW5espWDfosVjpGyzgKxhXVu8hokcyOTHaFsS185VyWfSL1Wkm7Fv5yFGajH3OY6wNaesyts1u4zPVe8Znv+7d85iRfP98nTvOhgY624+Hs+HRitCt+cjA+OVEY86dOHN9Tnk7gv/vg3/x8ejA+ugcOWQyS3kn4a+uKJ0fjw+muOBwyPDY5kZs4MOa3x2fHl+bHl/IpGCl+Njs+cKS3ux+p4F9XZ3vfZ+F472LSmxiOZ2EXjMzvKScSE/E07F8MvK7ydFfyxHGvM0h2TvlTxzsOFMYmpk60j8O/k+Fs2/HJiQOF/sM9AyNxvO6Z3u6F3vjIYH9P++HB+D8740uH+wb72w63xRfgAofhiMN9I/1DHW1HhuGo7NhQvL+3ey47c6R7sP/wMfi3NzXa2T7a1T41PDTQ1tV5vA2otv8dhzmgaiz0LnUlottUZ8JEkp16yzFkXFkiaxWJ1+d56VIizbpZDVHyloxSUJzKqSOUpLp904dVu/l8+91lYFFf/7ZBSVyKBnxLikI0nijt5/NW30VpPJe3VsWdVgSt4r+5IcEuwUWamsAQNogd5jIe4e9wNpYx8WPL2OLg2sVgkmeDtGrlkk8pdySNcc17NcYBEWtsgKsMPDK13n1Tvf0j5k1VPkgVfDwnxpStUvo0SrUvg/TWStaTsvp6RyEwe8g3hyF/wphW5K5Vl79illwwqgwK3osZrrp1JSBsP4+JXzEYp0onGvImMJlTBVTmQFt49hG8oKqO2FqVDBeenpTzopwqv1+s/XwKJmr1zZvqW114LMGJon6QLpZCadtWQC5ojOsd/9DDHCQkFxL5GjQ7E9zJ3waz5IVxSkgiqpzsUgjEm2NCUqYC9amamBRnCG11tTiOydhvzvD6uA5K0ccygqLIlybCajxKXFOOaeeUmpnEonbqtJmc+qQYU9LTBl0ACv0n9VoVluQhL6uy0s0e5UB5TKlJFHMBXwR5QytX66sXscfK/XO8ps7nxJJIzPi/FD+97m84RYJG7zdzeL0u5LltAVoXDnkJWMd+nbpguo5WUCMcWbNBwHH5j+qDy+Y96IN4Nb1E999EMQx4T3p30jFVCWmlLEzqj/+o379hQiLwjFgZKUl5dpnEhBZ/0qnkqky7zGUTfKH2srTwGV+opTE9l1Fq3D1V++69zGXqjixZ6pEJ7VyGJUScj6mlDHGYkgwRjiJDotzQ/wkzMsyw5Z0Mi1uPyfXgY7RGKeOOcnMA7pGGAbsl7M7G6xm1WxsYtnsBu2wkwxkAHbh8irZfwaDAouenvZjhSa8StCwNa5YSDkzU2YO3RoCfGQDO3PlBLY4S/VgmhOmXj/Re1+t/bDUE036YsLuxTzfvUyHmJ5Xst0uR3Hxef7kJL1ISUNWJeKbKazL5qD7cBnXVdi8GJxGnYHvpmClQDTtlAmmW7BsDyczTh7k2nt0EeWyMbeQXQ1ZuEWySrbC15FsbQh7mpsrhBRkIpGs3lzmNl8tfm+RU8lpiPRpDVA8ZyhgqqdaCyRFKXrVq5Regio5Q8qppqsoRKhUV8jBFtn5SDVRVwE8ppZ+U2r9iNVhN2Pv5M18lrxSurf95mjIt3q031t9jy6arX6h2qkUsQAAKK4PuSH5SC7isZ/hL+1TDUk8GJBsTI5+L8xPxnRvr7HoS0tIqVeVcp0s5RDYkp0xo2lTItxvocZFSTjgYSyoJByMZpeATktXZMH4qZpJtaAcZ8tQmwDAk7pV5DhyE25hSyr3+/gGQbyw/5bBGQz5mlxXV0gG9dTNZL0OJLp4SDjyRw60XajzFFQtoIS2l8qd3zl3FpbT7rzlVFiv4tBIKRiJ4IhE8EQiGoiMPiK7IA79JGlDJ5xWO7CWxA0bRlBamsgPLwk7TkrqRb2oRBuP0OIOARVz10i0QqCALqDuJF2KWfyyB0QIUENzMlMtemUYfelzVvlILProagMOR6wIIOyx/BR98hBm7WwIwX3GFQmLbWwxiPAg9QHR2cDDIzq+Xqus/WoHt5rQWxGe0H8gd3nrhKxT0lIP+HS6ggeCLFEao8SgpJMKpEHhZ/CaCVDZMm2wgmATOcCQdKCWdbH9bkjyg6rWv65XfdQaQTUB/noaifJ7uaIuvM8JKfaCaFX+gTby4sDCWXyOvQNM2QCvWb5S3z7UZ6iunqvcqjfUKV2gooNHOWhvwuz+jW9cpQmndJ0I1sVPDYSLvZczMAtE1Z/Oo/fhHbeUr4TGXDxdRiE038SmgC8SjYrWleStJy4wmdnkraa7yYpW/uVpd/0G/Fd8iK6ag8LFBj8OpFeiJciPcI9wE9zRx1DeRbnVn6d1uTIEDc19o8DbdVzpyW8TDKwSl+QKvHVlcWE43V/DkOWfx4ykn/GbgFfsFtf4rPFs53ZXrwDgRWjgObHeBOArsGGuxwT/lErCdAK5FHrGRHbvYNr3F3HYMbT3vyYbkud7CnCRFt7WWZhMSNFz9l01jPNqRscZ6282aEwsuYrvZRpRtPUmrSzGWtKUUNb9sU+bfsIyiZpFtIUQMAzvAXMLKuXnlLrDfwvoCvIO/riQYbu+cO2cB7RYI24HUdvKEjZ4t3NyElQ28NLCyBVq1oaqDUx0c1xrBCWqz8Zo9uRV0ciCTk9aqgVgEglmYpQVSEYAi0KQJHkSQiAn+MCjARhwf0f1KWzoDth4WDfxx1RtRhSYgUys+UXlNyk4rH0sP6Yo0qgyq1jdN2syWza7MN5hSi0ER7U0S3RLohkpaiNiiWwvR1rLTuPD5kzka+39iStweaeHGb3mQ7crfjYpx57c8Qlz6ez/i0lcf9eefa33w+V5x6s8vlQrF+elj+zPjx07OBtPwz5G95eL8PvgL5xKH4Z/S3uL86AHYtwcGZryhYRhb2re3PA/nHgqmE1n4XZwY6R3YszgH5m4if3D/+LHU8bHRPYth4sDJYPrAydnpBW+oJz02ehx4fJaDgyePHO6C/XP9PW2dCzNDU4Pwozd55DAck8r5I737M8fG0qnjo+Of/dfh+ORAHPcnJw/v701OHoHxsZw/0YtjCzPe9FAcfvQNxzvbunLDg0Cwu6Md9o8MD/a3dfZ1tPd0tg10d3W0d/Z1418HjPf8Lde9ygSB18quELBo8qkwG+YTVlqI7A0DFOk+e+HDv65g0LAJlAjJQw0DJINXVjlAYufGqdrXF0gYlJL+TKKgUz2Jqm5kjLL8cT6X8Y1ZrI9AfAJ2Fu03RrHZa9jGuPlxwM3NmHHt6fvGq9cma4XvJetprErLo0VfBx+BjGC97CU9mIUURMCoVTUkpNKiZCo9XuIeS6yz6jfuVa9+3Xj1c+3uGQvAlvL4qJXpX5o1d5cuZUoJLp0trY8xapt4KqTHAScEZZ+ouqnV5ceg3aqVG7y+jdTRGeKmLvs59KGV5uFpW+UbwjzeGlbko14yqbyn0m5UOEVp6zd6ca82ajee7Zwi09KfjhWnvTzWwg7VCjn6l9D8Lub9qTDBppFHfUg4iEUx0YuHSJXSo1GgMeIi6rXl141Xv1CdBEU/Rg1C1NMKMW3rJDtBk2mPVAZN7ZPs/tSDW4+peyHPRVCdU9RF7e72u+9hAtYuPFRux7THFUascEiQ1SuwB6NiiSw75Tw1lNBjMK+S6tq5rxa57uHNU4Jk9fJNuIvqs43GyqWd63/oNXBKwp3LejqgOUjC5E2Yl1+iRlP8QaEnIK0aHJnjdGF47D9F01JXTwyxcSLeqNgBZD9v/SadPqow6S88RDcomNE3VrnrB8ptRM0ASAuxolVKeJdrswvD2cf4sx73xLLL/7a6ELdIp301pu6ZdTGxuQTMVgXSSukEfA6qbmQOe1Chp0mVVCmrvWQCYpHvgpfW/WJCdPP8dSNF8VrcOKZ66Wzji5XapdPkEVTnArLDfuG6dCTMBHJeRVlKpWFOqBGWquZ8jlghUtP86g9Xkdmd88xP84GbC7WbmwIG4XmuFTiaw4QLwpfPQ39eD4pAmiJEXr1qrDyk0ITpWDkZFKRsoFOnxybolulpTdmtzcNMTFUeZhOtyENBtUXqyYArcDBLMqqyYEINYnRFwN9kltxVuhSlLmP4092dc19zUUrtTi6RZgEiVn1KEJRYJ4Pi/kvzWbDQSXrRIH77wpN5BVuPczTRMmoVIuRyGsCu8fuN6tnLO98/3v5wV12saiuBQiFfkph57MjD2oVDR1Lclj4TqMGUgtZKVJLQVGy2N78DiQZSk3ng6WV4pZmSaU6lrp2+d2Jk7odULnfEI6LOHQBRuXZFL3rhxaCw9TIHVChMyqMOPHkvxXei92VVCBWW1rrMTWTWV2rnMTV5ETQ9ruzoiE9zuqd78whNXC8XmnyEX1IrCFpEOlxYxgsvJd9jzNPYQaWsF33ybB7pHZGnn2Xf0QrFcvPjh3lV3XhlPX4wlkpZ3T3xJC17MCe8IwB+MeHAAZeKoC5pvZEizI1EsUzvbdW8EknGkj7QU6KjyKGwbFxng2lf3Cn+7FQYk+5sgdUoU7FYVYhpCrhluCsDOvHvn6vfXrec+Gkv1B5pDMUD82M6RkCYisAEakRzVHCIaMaw4xDWBCabFslWL6w0Xv1EMiLkgh50tit1vQLCh6Qja0F6wfsvhK6gZWGP01ZELUh4mLS2qPUxA8TYXAVsq2nxQOutxIPERMOG4M/Tc1xtJ/jzdoZRQ/Xtqdqd5dqzq4yaiG6snJ4hUcQLp7Qua08kGELxp+cQA0SeSdhFmIAiQEScRdjB4znFpSRjahpZwWQplNvYdKSoUgRxgEptYyY0+zQ0caFpTUh/ztM1D1ysmwT9R1dqY1w0MRNBWlVRoSQCAp4OwG08e12/8dIFuOgvyVn41oI5hq8DdTRbuQGk7qIcZiEQB4kbdGOabnsYKKhVWkiJCVj+npuJlQUbUKjORpmatl6BCVNf/3bnpy+VjitiYVMdRUrzwiGtJ4tLXWg6M4bpyoxhys58yVCldJ51Weu3DpaHWXKaHXN3cFo3LrygxxwDEyinUCR8lDOg5M25WJnJ3uaEFkVn55sXTKQMsCJj0aFH5i8wpqUNMLRgsqV03RdqR6I1zptKde07VgtUIXxB+VhQ8JTmqWmmIoUjaCJb5NS6HgZAOkQ3/6jdOid04bsMLMog4IpYljqjw7W1hgSpA7caQ6MgKqapJ8xp3TcXpXT18kp1+bX1USTzOhqriKss+dx/+iqELO2psCHFgVap5rDhdk53sQFi10/XH7xlT2MCDJVAIZXAy/ynb+uwMBFQVgl2MsYF9zwbey0VGD2e0tZLmEe8lWRNVn1zDZ7Rzhfr1bVr9Ru/W/oM+fmysMdfm2hP/Z214uV+ZKQsLTuCifN3tmsJcMsO3t0uFmM4YgY7zkBljipvoN60zc+o4dnK3rTtTNsEFLvPtvjsohe6VL5a8tabdkcP6eJhm1kfs2J2t6l2s1oipkrESLHbkjTZCPYI2gVIlPoGgUFw5ZFlDSi5bBD7p9G/jfwtTLwrELbRr4N7bbSrAa6GngZ0OojTAYa74sFPAEwH7Nn4zkFfgrkM2rILrIemvroDdATfKGSjsJnBGBpZOIBFoIoDURzsEMEMLdR6VKPbetxRqKJFlf60mCnVtotKE0UmKkyXJ+d7spSW0VeirIyGEZVgNAEG1OFaLJ5w/cvqF6scEuJIfCPjWQKz4FUi13iExAfkCDgRnEaeNfubGdR2x8pesgxCoSvqam6xX7zMrc9VDuYWO8W3vGc337KC2J9/rs7yP98jjuXZ1Pgxb3Ls2L69mePw79GJPSdPnIDfJ/Zljk/sP3kC9o8GMxNLE/v3nBgf80dge3hibG4qDz8Oj/QPFfGAbmrj2NfZ2zYApx48sW/vcdjXNzFWmirmU+MnyjMTJ8rBRDE/Ow48usfHFrun4QeeB8fMTScnx4D+yaQ31gHnZuDYGTg2NZ30JuGQQ/B3BOgdTR8Z6e9oz/XHl44c7l+EX329bT3AtGsA/gbTcEx7bjjd1Rm29bYNdbb7E4Pxck98EPbCds/R0e524Li/Mw5H9P4dxzKII16ge5lN6Q5bMoKxmWlfJ3hSk2qe6bXvnlWvXeHJXghw5Tvk0020LdMDIDIla4BMEGbfFHulVRpx2qZcffiucd4mrijHkqESGKByvGKQK4SSNgr3q5Cysycwu4gLOYbxe5Ukjfqtb2u/be58/9P2u6tKVhTBRCiiWQHaNyc9AlyOmHRdVKFAZpedCEINFjZmItyufVW78EC4UfsQl5H2MpamrEgj2sIak5iKxnHmt7nOGreovbDz7SotvmWDtBDUq8lph0aQypfyQSJKemstpYZpTbL01ze0Mmlxqd15Vjt/UXjBBweUClFmXiEMUux4xkoXfkguZzMIysTPYOcGbV1Tc948eefZLfft2dq969tv73O5KZ8ix0v6fOkCoshxC5ciVWPbZVilqXOlRAoFcPhhyvqPp3HtVnM13NAASQUzJioAlSx7bzg4CjfVnVBuA/aZILtvhqD/WuPRz/W313WQAB+u5pNPwbsqcJj30dovDK8kJGpYjxvCuhNOsLVC+XzIoP7tufr3lxw2eQrgZcuplOES5ZhUQTaBqpwDJgXZCLRQVEqgG8+qoQPaF5OeyQDP6vivFX5HALje3amef4bphG/emDI6fhLjxsJMRgoPtuIri1Mf5cmVmzQnKd5kcbJN2jCpG1o3DYQUkndbl8ZtXH6GT+0HbcX6RWzsrdELiBqffBA2AR4Cc4S7p+9CnX5tVQwP+H/tGRWcUyzg0RQCvTCfxRw1AcH+LK0YePBMnASIMhcVUVGkXLswo8tXPP+y9nK1cfHb+i0sVVoM4SBQqCDWOe7AzwX5lL5m5ocXw6Nps6PEO4S0ShLmepBMHtM4qSSkoh8rpdkVdTwGX53HSSPSfY/yS7fWpnF5Mki22Gt68vHSPd3fcWnKV698gHs7bnXlK3v5/zxJDE96KB85C10YwJHWuMXZ7Y+S4iig4xQKjJ8sxwLRGkf17PnjO2dWG2dwOhM7XKubkW4CYY5S3DFfIZ+n5yWDoQ+fGse50CMEtVbgyr/aErp6tXb+yfa761xTFo+OlZOh8slg89Q8Pp2SKtdDV58Jj/HKJuyUXerOeJ/F7FisQ9gc69As4JcwENOPXoJGgQUzni2RYwAzPsmwIZ1VprRRCp5i9VX5BXRydf2P7TfXtbLMwozO4cKmpiXZuUIbVH9Sxezzr5i9mwpfCRcuYMJGLDOi2iUYW2LOoShASUUzTq0Z7JGTIInsOfJTxWJrIUorKedebm9ebLxTdXngbXKMooIvdJnNVNUOnWKaV/lJQlhWnekGmAEuN9MNaB4xRGhhUsKcgjxP3HxgdKM/a4bNKAfdI6pg1axiwH5+AqgCVDNHgvmFfCkbY7rWwnkK6JCnRbHUGcYyziwNuqCEjTW8s2uzDDMoV+hh/dUjLo6EF1jWFBQn+J1WK3AZzKUmJ1l0VFdh5hI5ui3VX9eozgblvl74A5Ra7ebVxodz1AE0LOawDnMZCaV1KyUCYmkGNX5ao7HmUaFMbnYVbsTE6+cf7/xMme1MGTHmtPF1oFiOUYxughzqRiqrln7UEJ2rPYNMETnN1Z4xwYBkNOmAgKMpEiTqXQ55fCou+XwwhW1jHeG/9TiJtzEjsr/6/tvGldeS84akir7UEgfFm/d0QqGuBUdjKqqRMo5PkyeWvClXLjZWeLG3RKfgw0irWlKlVNYr8PK26p6X1yN20CuSkrZkK6e4LRklmxhaoIqKYd6m5VF3KlKG4ppy5DZVNnqaFmndWLm0/f4ihYXTYjTqPYCguh02LkblSv/J69T/UAOGNFOlmsIbSXFnAFkspl75hZ0amjKerNBBKUzhCCdeGYSOMQuMogHxv0zBNKLLp7wTLDFGnS/QuKHl9cb799Xl5413v8AnW7v5NbWnA0ECb8XXhMxHy1xwfngziQgzkNi8h/g5bCgwkZhpNtWrT3R4BZ2d1rm11tpmvsRxIu6KpzUasCP6fmTps3r7VePSGbNym/LQYZiILH/6ya0KzBembKkCGTA0SVHPMeqk1ohIuVp5XT2tY0SIbGwGEL4/o0MWyTZCBaaaeMtIGivT6OHWlhPtjbH9pOmxojI2V4shwDHaSmL7UsX+nD8FlMGyZLGvzDLRWS0dxK4BbhnLXApXbOMmq1gX9dXJUJT2pdbTSPEr29Ta4Ziktulr2aG21Sg5cHprl4fomoLGHnOMMxOSbewwFZixMavCaMkUq905Xz372jHIXEvMNsMcG0kMI9skkoykiDXyaVPEtkNcW0d5Bi1roJVlIAaBZQpYNoDAfhuDC/I2mJvh738i3GbXro1yIzjaIGiDnPNqNqS4YafXArUKiFQQsgnKRVCjC90EsTlYzfKe2kDKTgph81I3hbx8jfs7OojMYBZBKVz9S2VLv9hU2MdGPQYVNCEBAQBG9bs62dHGthYW5WurXUtHimpU2pAVIaWcagVoqaZW+s7uN6m0UFQjOKogKv1tuW8LfUvei4h35K7IWlvKOuLVkquO+BOhJ+Ku2XnM8m9oV+dxi/3iPG59rnIet9gpzuP/3r+L81hJY8t5DIcq53Fmzk8m9+VTQ53tXQP9HW20/Vk+NeMdnjoSh40TPfF8aj6dnfFGcR/8OzJxZHC4eGJyuK90YnJ0pKc7+dm+VD61lF6EnXjMYm7GC+FfGJvP+Mm+BTgBaeeyXg8cm/cH41OH493J0XiYmUvCnz843Tc/EgdSnYu57EypONlRKp7oQNoLs0cGZ/yk552YHOuJ40jXUHvvxODgSHzPkXhP9+RA/L8Ow79Tw/Hx4fhoT3e6Nw6sFjoPdrUvzE4cgd8DE1R2ZHA6MdgWh7OPHh4d6YaTp7tGsTQ33PnBro62qeGB/jY4awj+7fg7rmXtMKF1vgIvU6oxNqHUGBcJ3kCzmStW/tJ4dr7xO60/wxz0Uh6FeRQT0jcCg/szQT5CG0b93O6kpUcC1xLSXLYrF6vLX2uDlnjENH21Sr0QsMrIB7xKtfXCo7iqsp9WSZkUX4zxTvMqFfPume33uPS8CAAEpnjRpZTmPEXeDBZAlPOKribCl4orqtTJG2lhzcHnX3OAKBiseKpJUUUlB2iA3ARg4ZewzjdLy3wxmMpzwLi1g5e7uMq3bkb+G3/IT9/X7q40fj69vfkbWZMlzDzmLsxEyuSNpUuJLOAmTtWhXVQCS48Lc25SrnlwZcU0Z6yRp8FS/8wXq19cuF27e69e+UVwgHUJmLgPb0nF7AYp0Lnc6hPXD2llCwYDHEuT0VksaOChFhXpUmheyPJiY/0tTAdyOhVCdcNEQ6EZLH6IwdSKG4EaHMvSWMBDQpY7sqHdkuX6bfeXrChOYgU3CXZM48Pt6p1VqzgMXzfcYJjKhlZ941CF8pktraOwhowue5ylFU6/aNo9M4xZS1jsn50GNNN4dlm1bNbn0D0zMYkXCJKlWZclhntwTRrFOMIKWwzCByF8qu8vwueg7k5dKtHQCUooDai9MT1BNSC8syAzQwUa0/wwyT36OK8qc2Kgt26dvL35oP7LaarPWcH6nM82dr5ZtoQIKexsadbu/BykVTef3dgxXOZbYgaAmc0tMT34xEuhW9MRK9MVpuyGmCU9kCIrir05T/H1VBZVL6Ib73fOXai/+7X27X3xeQNqKwaleRXFAV97ZVYqjhgmAPcxayH9bzHjRmKouwsUixBhXb39U3V9Zef7XzlImbnHynnV2JsmPsf8NPX5wv4rbksDqxgMfhi03lyQWjDwIWy/uWC1NACbTjem13zQ0Wp3WrGYqAM8FZRE7DQPrD0PPNcIVhKb6rlK7eo1rqyEXkuMnLIiW1BlkKCcyZYyvvqMKPuCY1v1l0WzT815TsbXwA3LFTw7jZVGCL5hhb5isMjle8DE0Paa0V7m8bHu0rW4zcNrobkiasui7uqtEn24JbiBWInzBLdeygjMF7rftK87oiVU50zKWwApiYCw/uh54/3j6tcXGj89IV8FnQsyPpn1p0VOqLtRTNSdJLUKpsclRCNKuFJh4pYSVrTdewGdV8KL1oH/pKYXAi7fQ+d4GVVmXgX5ZDAwKc9+i1yMwCpdBM59MrB+v1F/9RNwr16hAjSZABXd9DTYZ4EuqomXkALbN0bsVVIhDRieOtND0xWKQiqmz3LSa6krfMtvyNnXslUeVnBV8cKqS95XL0F1Wp+RCjE1refTHH3MQTPcuJ6HyBYrctlPISxFbZ9S4WMmX99crt05ZeJX+SrTEphsRBOiKLDvxl25pIcXHE4tZBGzs6UQngknGhnEvKwgR74lxY1QJ4h0GoNZnVP0W/FafgBcXIlHnm3NSbpQpPysiVpLaduSW0zgPszVMnPCzDoQQ9L8mOfch3eqBTJNOV9I6DV09T3ZnNXrknFfhqmiM08L+8uqPngB80I+K8PE/a6iNyTBd2qbYuNABBFuQzVx5VHt0jmnWx4equxnH5FshCANOZjcoqkgoaqCxcR3zl3efvNQ8BD55dEJlPd17KyF+IgX6jq17lgs5TBmwNaC7Eanhie3qb1hmZdp9MR+9HNjfX27cl6LUjoFPnCi5CIhRV5gkNmm5RKqjGAAUL3yul65LwBIUbTQDy1jUqeZYEG3dcV3qzaxroNSM74q6ADaxTQy0kdyEN0CfvaiCSlfUVVzctWj0KTpgjrSkH5QARWpZguSjukTTd8LgwSjgNOAzChEo3gFWk4m0CkArXHu19rdh7rRrwBRFpOihDEimiC9AFUesFCnoE0Hz/oLKsxY+Z/SWFIfVTygBuVonaUhzJErSJdA9kdtVQKsSFQhhbu+Xt2s1F58UX22SU8nWADBN+f7BeMtXkO5QxWUqY+ndnHTsNLqsM9XbQAruMjpguWfqt+smrnCLKypwkUwAZ3SJySbvg7+LeOKenO9S7z0y1dbFbukuFwfDU9Z8+SL1Tx4irfgYV01UZerFpL6wncPhi7YMcz/hhvANf/Bgk5sraUDzAilqdFsQYvdrCxmq6qENlVb26dihbo2p2NrGgvTNvrEtHNsOaumR6HZbFMliqUT+6Nntd/OO9bSv2+qiIHimCYWfzEWPmkhRAwC2w6wobmDyB3wLZhb0HYEaJtaz1GwKwjXxbYMaRliYjUcB3wpuCpA1UWoDlj7P0FudqBxWoEJC6HZOEZgSwQfGbQi8ETN0ygQsSBIS/Dhwg3+XjSwEEgRAROOKt5FsYvidVSucv5r/WZ+OfpTNKetLguOUmut0UTnWNomIvcdmW/kvV4XhHMbjxwHhkIHSs4b8W7LdZHmImTVCpoSes3iTsScLeBa+bdT/uBHvNuRvZZvu/k88WxHdolf+5+7+7Xh5Vle7X+KV3t8/+zY+FIy0dXedvRkeSi+2B7PTMTHD82OZWZS4z3F/Lw3ebzns2RicTSeDaZOJMIDk73xE+m5Cdjd1xmno/bm56dO/HMkfqAn3rO3OA9/eThpYOlkMgGn9JfgmBOLcxMnFtMT44f2jxWyUycy4z0p+Jtpb+v+77b48Z7u6fHPlhLwB7L8xMRg3AcCBWDoe8d7RobjvaPxifa59mA0fryELA/tn207OtzXd6S/PX4QLn2xKz46Mth5GP9GBzuPHe2bHIrDRsfh0ZHOvs7ebri/rpF427Gjw50D3Ye64j7c1sA0sO4FEm1w1CAcPdQGdI4DryP9XX+vkDYvrnIlQ5Al6SkFKHYZB62BxdnRzcPOQEroYnv7rxs5ygL5bufbdfR83lmtrn23c/py7ft1auRNNBDMAMbTVeA9hw99bqU0lx1o2uXrPSle68EsxTIv5KcoEwTlx/XL1Xcvai9vVzc+qC+SzoqypXXkbFBULWbcTaf8tWme89eNslTB5sY522+uqHZocrauF622tZkvxRSsXbqBotpDhdZaFfk6/Wz7w4pb54tPirBF0ljcCGlzBwVa2nSGqZuCql4F4OcGWYJbq6quKPWcyeoeCxduVy/8isVLzy1vv7mMLWfu/sAgBBeODdUm5tZ82WW49TTSbW+aZxG3vLFmUYS7t4D9OslsZfspxNcNTx9NoBSvfG7kqc5tQdoTsaY9+7B244/qhVXWtz5Y4mq2FDyX9lK4wBXlzAZVoYZp4ZKsnTrdeLZmSCaCcMGhCDgiGVCZx1xGd/wAyZ/beikVqLO6vdbjrIr35qI37MbALh6nHm2/e8luDFzkxBnB7W6Qkopih59IU5uWnH5FfAQ46YgDeDRlIf/o5+233xkXCR7nEDarCKyWTU09WUtoqrZHC8MY0JP86JpC7d7DxvMzu68pELnmZQVEQnRBVodaWdZo6Xv62EWoLrVNF2G1qxX2JvW+gEkPj4tBPuFk5OOwr0atsnXqM99anZMCdo1HX1TXf+L4PzqDSg4mKPlML1Zxkr9bt5HZtKrZaPNQhao1D6dgo+ERlopblQw6nbbWpkH0UoJLqViioUCPqHUv1a+bG4QvP96ufFM7c5/bhBf5WIw7g5Md0gJRmKwFVKjRYFkKX+tU3sa5V9tvTmFR2KuXItaZIZ4JKG/TEnxa2MXUPlfohap8OPsFtayrPr/K815JOZz1YLG4LEDFctmRFiNCNWZrKYq2QMqsn8gRiGc49Mm7mvco1byU0E5aNaD6MnDJO5rET7kf0pSqfrd8bef7s433G7RMRCtPfLJLGg17wJUZmzrY87M+d5zBL4Gi5i3i8AHUbmwY4vj00UeTCVweJG3WyNTWnmHxbIdmn7izqdntUoy+COpJ+5im0dv72282wQyvXls2nsUiEg9ksS3CKVdKhL7OLlV7WP6YPaarGb58ymoiftzaDN48dmolltm8z70wXaah1fJO2o60GKPqmOR5sRvgYQuSzdfSAG8GptdipPfd/1UG3OkkwkDF1uGyvaogaYYSMvavJ0X2mifsWuP1X09Xv/pNao3r46O1xhW9AgjlEnuPImOeMYB0b8AbH5hmIR9409OeS5Ly2wPKtqK4wII3TQJSRlp0wsW4A1NtlZrh1u7cUy1gqBkuvFuhYIpWGKLSzjN0xlp0YZ212sxQJ8965RFz4k6eTZwozh9gbUqtBHr2ho93UJqn8GguT78xxRXk628rteVb1avPAIpJqH9KqKIzgDexKpKnoFd0KIshA/hS/3xSju3CC4v6nlkFedvMtOhcOt8MGAoLIbCwa36rQWTcouC36jWIQfNWR4Nbz6vLt+1a31QxkqhEODlwxrCyEQ0Q19XFxV0eZbuyjAqF3ObCXMBOhDn5qqQJpuppw0McXec1N9ie0i5p1Q517WF1+a52aHnUXxt7WrkM1PSObFpT+69rlq+bZnb10UUmDAfP5ByqBL69tKpdXQwFkEfG2O+G6YUKi3OTNwxdeXcHwQ/5o5EynRFjEg4LBGFpythuHlGrY4/zLvna+cu4aqrJ8+EObUSKgJG53h81JsbCNdyRrlLmd/vXjXku6wKvsnr1FldLASJYzChrIhn+HqFcKUrKg82tNYyswojydIk7RjWPUXVZqnhCiuevG0WuMFu7da7x9bfVO/c4PwGPxjUh9HVpn3DB0AMQybVP7aH0lM/VJBB50GO1WNSef41r98IinQvRCLU4tHRlW6a2eoW4WhJkM6F0cVfWvTbnXXvaMZ93taXFeubX3dp0dY1GWutXDagJmd89VTv/iM+3DcBQmVcEiPmHa+aJNWbZYYRKXhrrC2PULTNIbCDH9LGsDcvIUHqhdZiUa0Q4tsu/X2aiFUzXIFpKIKinDBCcn3IzQDao1UGrAlDV7WpMSjWLU1zjnpsEqA3yNQtGrL/9jtGhgwgF9dkIUOkCjb4UztsdbLkoyCqVlOUqSYwdWiIdA3BUsXF1lqAYB2m4EMDR/dKdV3Q9rkIxnojqd0ubu4odE3VSOswYlw7fXa/dfGUfxvEhrOZsNWoa9Ir20hqrtaIyKoQy+I3KEGXRQk0Y2U1icVoE9fbbqyKibbmv5eI/olvJWESq0kKpEawRmWqkmy1MNWZnuSYSraUoU67rfbGC+kqSbYB9M37SS7RFPdi7HSSO7I9QUf7s3Y4Qt/ah3dza+z7/XE71Pv9cnet9fkjc21NjPcdmp48dGus52tYVTy3OJGHkyATYQfPwIz07faQzXphLjGfhJ/6lDiRnvNLkhLcwOTHWkzuxBPvwyDz8jfUUT8Cu1Ox0f2YffMjZ2em5pQKeO907sS/jwbmLkxNhz0kg1N/b1Q3cDhTmxrvmx3o692WC48PxnmKuw1soTfT39nTBv5NLwDo/P9UDRx/q6+4cGYD/dQ62t8E/C91x+P/R7q7ODhzt7mxvG4J//WO9XUMD+G9/V244vtQZH+yKjwzHB/o6/d6+jvjB7vh/w/FH2+JdncODI/HuzsE2+PtbzmxPoZpUlnvnuJs0J1eDeVtMXqkun2NJSYA6KKqj9bfEm4j7sFTOvPqu1ChCPxxO2A5NncFCX47yYlY+ABsyygqFIMpGLQGjOV3Yehyo6rd6qEX/Y6n/QG4FboWMhf9/uKYaIseokB/6I3jpyxDb+rmQhWemOtJaeygBKSt7CDCjjRxh9TMW/tCsKHYZjKk8YKtShCc3SsA6tNyWx7R1S6v6IjqNDdGBIxkbj74QyYideGJUel0XsbKoRLsMqeFWJofDgA0O4WE3FzJ8QpSO07Ew72e2Kll+J+4ANz1wOifcfL7z/TXunJD3pzKYvUxnKduYKRTMknOLIVarGFLhkq5ca/z+pVAv+Il8SUX3CAPSZSd9XMoIp3UTMd72S9NCGyNYlGF/f5FJ1+4+RJX44Bb5kpGyssF1Ec1QkcLOlkUySdyhBI3hsjfWbbOp11/dr96+L9T5k552yevpTrW3tyq+zrWzh4Osb7LuXuZJk3PZ5Q2qzLcOptzZnV9Xd+78phQVOid4Uuq78AxBXpUp5VWLbHcXlV+WfbT+QzFeW6ulefIZU6nHBxWMH1tZr32Ha0AFMuv4JJcttSJaw9Kbdl8aGfx4V5pVRr4F6UrTeHaau0tIVxrMAMoHuUwTN2ft2hluEZdFHSyw6t6sLGjv/HqpvnnVDqJyWaF/AWAi1kwmn6tyOagh8r2aphJoYgLaTJK7TzWXuHC7+uzt9huORKJKnOrsCHnEQalw1qFPYxSBwGmrFunGqbNCN++XMW7VIewlqZA4yK2FgLoPUIk5d9OkCKs2Ifh4/nW5lJQ8YbTl7r+uPqDmFiDM4VNkEjqR1eKhG4OFkW0qrkF9dNhaxM9TMQHxVH//AJhUz55hJtw5zGaCtYB1T1qsbpct8VRuHuR6nlhWHm6koNr2bL+7XL18s3bzZ+7cg8q1BMKCz44yQL8xgFSqzmYPAyqXcdBeBLHTNpfq8pP6i03DxdeEXFbcARyrGWMF7pTuTaxGttZUHdGVLH+KwZ/XF00rhMvfwqdYXT3NfRBgrqKTV043HZAVtWIhzHEwpTsKZnVBJ3LGMPHd+eBrK8v1tRvywef9xYJaPHHZFIIE3QTWcQn0iqEeQz/rgvK40Jfn9LoiyMxLKY0zd7h3CoBm7tiOZ9IqItJymbFbymalvFJiBWvbFP1IWLVGWcQrl2q31mo/3hG3lMsAZjFX5cTUDars0Dyi+nX99c0SLRoEf95OsyqsndrEpkivnnHMVVhkpxqdbrrI0KaVxSxjnpPG/LSsmhRhjJniUa3cqN1crj96xjx0PrPLhHtEZkG2Ug8JgxicHa0wA7cGkgJbjBrqm/e4upagBqJTZDrNHPGVJ/0prxDliB9OKRnwHl5F42YfLtOzj2rfV4QpSLBCsNjMknzkkqII0zEXqiIiJkdRDaqY0Kfk/s3qu+XgoEena19ihGX16mUJNcDTYmVFSIVOhMKO3WmaD1UhpXoxOizCOVF7degy7bVvZ8eu69+UbccLhLICjiu0tDYYWQQ3BDlaUtVS02N4Z9ER+8pnMNclQgOPzmMP2jCL8XT/UAMz+Hh5gIS45HXdp04IKwHLwG/wU4CLffWs8YG6rbFWYgIR+jqzxeFhj4rK3kg388JosvWKzUsyZRx+as5QFqKnGsPxjOGhdEqFmy+pjukUeLZKTbqWv288+hLmyvbmJjfZyfObNlmVFnEyALiyrkWfTQApuKtkn8OFZJ9wwQIIJNpcTn4Je+nE5rJ087CFPRkxb3NrbYEr23JxLnpSW7/BlcLHRp/WlYc719/jbH/7ovElNWfEHvWFUog0bNpwAyd95dkg+njtekQxWGnJAJ6/zYDT7LM49xw2OOXTXiGmbBsAxliNOMEhUAlUTMkW+3B1GVVU0TTDRpT4xUb9/AZ3wVYuZg876jALl1+oChbbA6WckKass389KTLV6rlK/dfTNJ0CXgJggq3cyY7Z7WykHPO4eu1rNox3NYkdY1iDcb2g/vYqG6KO6WksQccsVGhLjEAx/1pYfWLtSUEKZYWJ/WVZXcoO0q7Gk764Gsn+EctnF4vHsXPMDfLLhDvk1+gYFKHG8rr/m/rtQHgB77tgdhtMsyNY8LOAZwc1FxR4JdtPfrZAxzYuthGxRnv/sH9aQFEg4i64UKED2XCtMQ3LIngsXBApY/10cJAgIBf6GBjhoBJVn1xBEAE4H0EdEc2v+29KFUoQpVx8skmtO3rW1rKu3hZ1vZu2dVWsFWgjoTVmPSWq7mwlpJ6cpWssFWM0S2iEv1y32rDEuwj2VvJci1ru/SEiVSRpK/FpCTIOKdfCy5JcUZml+w9+2mv8CZ/xpzzGn/AXf7abv7ils/gzU+FjZuxYKRw/lp2b7T481HMU/o4UckEi3R9PjsYP9w7Ei35ququzbRQGPdg7Mg+nJKcmhrs/C8fL3v8Yip8cjMO+Idg3uAj79sEn0P1Zaby7f/9gvHc4vjg/MzY10dffGZ/t7guH43Pd80Px3n2FXCIzdhT9w/6e6T2pIwNIp7gnNT0x0B3v7oL9wfRIvNwVzw/EO4F++ehoe0d/X+9/AZ/2dHKqvRS27R2Ow9W0LcHl9fWOtsPe/UM9e+HSe4+2L8HWSfhb6DnYEc/2x491xmErPwj/6+v9Z0d8Gi4iDRe1pwPGj7bFZ3rjxw8PwQXNzSb/eRgOb0uOD8SnekfQ1Qy8T/T1Hh091tU5Nhz/O45l1cMOl3exTg5/FjSGQ3oEHcw64C6h6wChj/nsy9rvF7kaULEE5gcmbmlCHNugN6lKIsU1KLJ6QAWTBX+eTqCcRs9jhU2EMy/rl+5UX/xYrzxTCl+R8vO6smQmheWVvByXFX2U9ZK0ZOiMh8FUxkvIaq8qA6mqd9yn8oxXv2u8ewo6qXHpDLVUCGCfJhFhFC6EWYdDuAAftOg3qr325xOl44Be7RZ2WJCjF1XWh2pXt5IO83pliWpjh7pF8kaanrMyDjhOmxugwuOmVScM0xZjJM1nqmU6gEZZl7412IIJiD0URUuGwZd/NM5xmosiHVMU3JRUBU+spFQZYYm4MsOJkdsb56vXnrhJqRG3OlxDLkq2gDsStEfljDv0+W9WOxKBCQjfne/Pqkbxhgl3JYcvI2eyOlNhOvST6uKxvrZsU/Czqmm4RilXZZXeeep09d1PjWdfsTnJ91LWJ8qNACzLOQys0U/xUcayjhm2GNZ+21Q95RQFvimAeNZNYceavB/MyF3xwCwXqVM1fbeeUibd44S6qx+/rG9erz1dqb74wtwVumGJkl4xQplg09djNg8s16h0MFXzvZ1UgbSrqqDEL9jds/KovnZ+++0P9QcIAYVTjClaNWPzSW7Ey1stGtKr68dW9KZgtPSij6ZNanLWUAuaJneSCUvupN3jPpL0ibM2G6jm3zzGpeb1GHkQ//Vkvin7s7r8pHqp0ir7k/MDA2kXTn1cIqx4bBdWOkqXgSQzAtTNcNKiDuLfV1UVWfTToo2+l8gACQ0A1a5kiomGYBHSWDcyivUEhy9h5dvQQGD4OKe2KjmbfqsxzEPQePy3FIUqEJ9na41nd6tnX1TPPlVVdYl2DEmUctb78QDsF/Gty9uBWWuGqDoUBpXnt1abXhAGcix/tV251OodlZHITEK/Ic0m5hXSHM0pbGQoyowq3v5WSkRYNZ4927nxPX4emgU8PKQg2mOhoHO8WfLqARA0vJyK1sMvm9XTV3X6NglE7Oqm0CyegE1mMR1Rkg95FD5IHvzztEqcybFrOqUyd6uv14Fy9f16492mlrXUMK44Ayc6/TlN6oAeaJU0QNfO2QLmU87KwSyFcjjP8y5RZ7QVZarzqE1ATkf45TQbgkI/lg1UaI9k/GNJ58BK+dfbKmYR9aaZ/7h2l1A215VVNfE3r+gn78v5Skmktl6mI3zsUWGGS9XMCgTq1kuqZoxL1VdWG++/3jm1qRax6HDSB6kwbX3JXlCAB7UQavvKjPpm0KSLfuybxizS5m+aeg2XLXIRJZjA9kjpMOcqwV35u9qPmRq9Z86Kqj4jhRFnyc2KHE5Yw1lUUuHWSqbpU6/ffl+/d3tXWSw0TLq2GiGPK8xtSeFNtN5jM3aEs3B25bNQYSIqQ1tnJwX5olrVkbvUI6Zym5IwUomLku6xahsGQZ9/zDW4dGxpgKaD43uXpkoRllTHW3osNbFXXVyCk06LQtD9O99fMx2YhJ/dqVBjyxzlKlgCTgaUxUB4hgHAmZeIYWxwqQ5WnWFKuTAXoapHXdJ4zVlJUyRgxl0Wqh9+bzz6ApeVftfp43xSTBEycjm3tUbiSKN6JZ04Xm2JtJeuFvLtanX9W9M5w9eWfxpfu59wialexMlsaXo3qhRLp+IPiXb1w5nafQpKpe7Ofl7sMrKNvCRmkngimu0BtbzNQQl0ubiyvb5hhHO5qA5WPZRxIcwhWUTXKfeUaU0WXmRGCNc2V7hVGR0aS6dLStmV5k1b2ELIwc1qUMo0cMQzrjqqOl+N9ffV0+iBLXozXDcvl6G8DSWgClsrUxGaoR5VE9umGKMEJfZAMunanafVexU9F4g2ZqXs1mDQsbBt29qyf8Xodcxd1wC1bU/b6hSD07I2jdNKm3wtzT+x+mx7zymEpUyuXSw8Me9cm0vX+DVW0Cdsn4i9Y1k60qtPjI9PWTYRs8Y2M1SVXbEFmiwAQf425jfPQ4B2a9gtUNsF2Sa7VOHcZngrkNYGsy6wdCBlBEzaANLGjRbYc0Geg+4E0tlgTiaQxlqtEZbgKhtRWcUxBOG0QjYCaGwoo79SAx52gwx2hYsoDokCgt2hgKjgqOa16Ii23UXVimZ1VJshYCmZXbSZqDJHw6iXYGmC1tJfhL4W96ZPpBa+uwlikcGWAHaL4pjemh+XtragbXJGZ0vh8O5+6Ohe44JucZ72Pkd3ieP54K6OZzgla/mcD4rPeeyA/9l4/PjE+KHx+BT8E4wdArt48vBSKePNp6YP+4VgbB/8xn2wvZg9cTLbFg9mkmP7ljLe2KEDvr8nGMO9J1PT+b7utgE8e/FEf2ap5GXhZ99McqEnPjdK1MtD8Skq8IFlPry55N6T89Pzqe5/dsaB74G5mYm2eKo7HqYnD8/C0fvwIhazqfF4OnG4MBSfnZoYn506Pj7RdqAzPt4V31MIjvfEOzva2nu6Ojvgv6GReGJyaCK+V23/92g8B5cE//XjwAQcm+s8HO9uGzo8Hh/ubkvjcb3wN9zXNj0Q7+ns6B+P9/Z0dcBfJ9A9NtzXDaz+lo+ZGpQGU0EBpk4sH5TSCVoRlGFnVKKGHmc5d68CIirYWslx64HGmXfVq892vn9Qu/INz1ahTG3ST+r2qBZJZ0PoSQHFDe5vYIw4pr79Zq364MuIHWezKGK9J+xj7id9xQiG0PzGVuYyaIFhWrsJUegKGq6eqzT+oLxTopb0/YREdeLSG4AAit3ETiJ5ldkV2ZO2dlFh6o2yy6l25x52hdKcKKJTn24x5FbZ8KBCXRXIm8G6vyFlHy74psyAeNK51/K16tXvam9vcL0oLDFBR5P8yGUwbIGqQAphHAyK+JBUYWGLgaEMKu0x5cxrNzibagQWfPIw0g0z68apS/VHm+wZB+Ot9u0f9bundn6gGM8M8CIz1bouLouS9rDFty9lUsw2t1jHsEInpP7ddQmptw7Xa3VqWzU3THqZ4GTIZf4+vtdmpLyn1OOW2TXOvao+eKTTCJkGtj00zXQA06ERRj2iPGxe4SvvbN7X6JvHqKEOga1Vvj32mr+7Xl3/cfvND9WbX/EXhWYzFsYNCsoms8rnYRmKnG62QkMt6FPunqrHzNQrFfahKupWeWlcteFmNjDFTWdkpKqGcX4vmT26gNxpbkWDq+WUfgeq7/z2h7v1lXXi409j8yPskGA1TE4D6Gvmk/YSTVwkutf0v9IdGM5dbbxaxWKG1IcBJRBStVll8iH7IwrSgZj7OcV4l4qTxNZOaJ/fT6ra6hg4fOUiRtY8eFR9vWp3eiqUQj7VYqBeNwNZ9TthsWC6MX0rG+yDJ9JwE7Wbz1Ur4Yznkqf42nQJ43yTXJoyzzGEuKNodhBCyvo6fhXQ1By3VGJzf+eH99Xbz6vLz3cIGhTgo6dz6WSfehhrhrqAjsvNGjWsJB/F5kTZKIaTnOdyIVOoVCghF1Qb3gzFfMD3Ex1UbZd/K6v/c8272vLr+o1V+K967RmF/PtwGrDyFAMq0eKhRiABTSjfp6b2vkOdLj+lYh0MebiFxvoHQ57PtelTuB83c/sHb+VlMzA5OiolbvtNpX7lOZcLBf1hdYHDtGF9HipH2bDU1K7akWm21I6GQwGNl7yuGk+Xm8IIaX4UMqi9YNTJrsIqi6TtzvePd36+gor4D0yinENiflGfqN5mYmstmafG5DbNQlhK4sdmj+mOAvfTLpvGq43a778KG79Y8BYjfGStM19y3O28aSklXeNJOUtYC1F1J3fZE09UcUOzOElDlwEGB5e5qbPLStd+wMyQDH/UJ1m5V18/rN9e31nZkHqYpST2YZ3VNRkLoAiyIPVSWNyZPsX8FI0ACvCSOiB1LaMCUqmnoDbsrl2uPrreeP91/S2luYDuysbUWUzaqgJmsbBLgNl8pBaYzYQLgQkTpxCYYRVSci8+rqx6Ykt2oyMM6cW9iCtUNgiYoir4bI1aPlKqS1kaWW6UqYYNB5d+Vb/3EJQg9rO8B3CJ+zRSHjegJFwdCKOLVupynEWrQMedCfHIohUTl0UrJuysWFENX1lLdLbwEyxyPTPt01Wl265d2n5zmf25HOlLH6S7fqjocN9nMLOtFURtmUv5SHYMuAuIb7+ovl4XB7Wy1VGYO2wKpuQ/1hLXYXWRIZMNRtXL4LYkFwzrll24GckFC8UbQYjSEFJg0qJsf5FCmj9HIU2g0KJKoMxPhAmfdVDCLzJ1gAOKoYyxjMRAegAEtNKthOLVr2vfPq5exXqq5XTe82PqlCYNpym1HBT9hqE2umsBKziMteGuBVIsznBQiTnZVFAg/cOdT1uP6tgJ1QtVAXkOn6jfuNdYucxZkFnPz2DeQV4/Jpg8mgYJXUNwyVTtP/crvEjRCeZs/FZLeeydnfNUt0tn22rqRkL3flmKj3Ps0VNepaFWb7hE+svpnXOXq2dfNs69pGjtkEqPIE2Hn66jo7dDrqKgq8VIAioHTa6BFDi1c2Od17dyoBIcomQkFZoWNQv/J6uanu0i44ZmaW7m6BBW7c2sXa04YBw7xjSdFEa1i493Tp23i61xfHba3yWq2RjHLcxksYfpnRvz1xi4lqmL5ee01dn4cI7tTcvENNala/apNDEqkFy9dKvxgSsAiL3mWmcRW015bm9TnNHm6/raecdaMuifrZRme0XMFDFQ1MWKNZBnE8XjgGIxOsTcaAL/JGNcHC7Ym8M8DdwODbjFn35JAV3QIPAsKafw9Lmd02v0qG1Aa2NK+7cNKgVOWjgStHSejOdWwE8QHqX/CaCzwJT1M4LZBEbZAMoGN5+AThHcZMEZfd0KXViAwsYRgiBaoAaDEGztLBpZdLGuhaJ1rvUTUxK4fzxmIlx8Sows1WeUkK3o7rMOXaV+A5fWqw85zl50jyX7bTVgSX+R+5a4N7L3E1K4WQAbUaibYLYSsxHpasvASDnIT64JGHkXdQkfoNjF0pSXCMexYmA+7I76hVsfIs7hXSkoD3Hr/eImPrCbm/jA55/LiQuff05nTn9+QJzFR9o+OzYzeezQgYWZyYPwlzi+78iUd2T/QPfIcPxw7sSRtmx6tAx/S/i7rber/eCBmUn8PV6YHfOK42PJxPF5f8rLw9AA/HuoLb5UTvfPBamJtqVyNgP/jheKY3Opid4DC5NANDMXTBTHZqfH4/MhnHa8KwF/yfnQ9+AP0OORtoNwMclE+wTQaIchDzgVB7qPjMcPDXeM9OVOtB0fiXcOd+wd6u8cHo53HO0bPtzRMx4f6Rjt79x7bKD72GB3bnSos689PtxxdKRtsasd/unbe2xwoG2xt71jdKi/r/PwMPzugvsYGf9bzmC2Wj0EJKo8rLsdsG2MeVOq8jmYsdX1H7j4OZqxRX0wqWMfTHr7/KYB9obOuzThm69eMmThpChhBzgFxSBTAF1QjCIqe4cEpK4kTZ4jY6rG+/ec56gxVdnkQmDqJuiOjEvMn20xyLYTykqbBRhPjfVnwgLJFVwWoPAWwFTGphxBOlSpEl6y5EeG0KgItu6zx+vplK5beWGleqpS3fiD6xkVp9B7UDTnKTCAERYuOR4kg99mwiXZsDzfRorSQlOqItvdM9Xblerrx5yDjA79CBcOH6MGJ1jHS6+le7oplzXK6FaZFV9eBftI3LZmVc6mpFuYOITUoBCjish/XZsVotuV5frm9ww36ARpaOIFGKGb96f0Oh9VRsae4PlAxtgDpIup2suAL2/iSqBeDKRzgbS1Hkh5lhZ52napS9rmn08KmjAnbNZO3VWrjHiWQ5gsIV23CaiB+VPSuTJg+vvIFZf3aRAsUDQf/vVkSXfX3FpZpAzH5Z3Tv5NLlpaiOQykLCEdhiw95Bb0hIhOWmUasiD9suilyaBMB6qyiy++Bhmi1hHwvynOvtRq6esLtQsPG880VAA1gyamOov1G2BEm1AhLLoD6FalhV+bcO3yeu3mcyHs4Tk2WX6EXFULrxNgfyY0z5Z30B0sZdUeqnAVYK91iv97mlaVrt6eql5+WX9ykR6uKtQFNNEmz8hdsGcm7+fwu9Q1s1QYfWQUbXy0hDbKMWGJGODaw8aHa8xQFo7oVIeT8nui/1x3YbMdn2bUcnzyfMHG6QVxfYIEqF1ZtlyfeOYMnmo1+cA1KpsRDkTZUOvUrY0ol9rT99ub3wkXpFfGOCiHDa4OlKaCPPlvnQ1RTScpUYVVE9YyePEjCxe/SMcWPfNUsKWdTSMsBie3HtMFm0EOtHxSjqn8OfTxqZU2XnLAtafb96vvvqleuFdbvla7oNsxIn2Xq5I7YY7rghupA+9djVlSx+q/yCJH+i/SiUkwNnLaiYgZ/+gJEdJYIQMGItQprAj9XnZvx/UKFiHWtMtw3kwxQp2cUglcnAGoFUxL6zYaTFujKkbP1JaQsv4ffsd2Aus/cDX/aR8skKkYnjYtrW0409omprK11ZhU4tF525jUJ2tMlLjdWH/ARp8kbrssuEA06m7CRWByJD27LU3THlS7AsNxEnBVnPOPG5efgflWu/XOaliDZ/tyMosVbrhlk1RtxXhp2GZFHYRWE1aBeHJ+3gQTg4s5UpFtpOcy4cgn1gnkMjTBRE2jW5Wi8i5RBXGYaCR2b7/HJJbvrjRWdGd2PnMxXJAPRlokW+TClqNbv5WypmA4ag0wXrj1ZqV2/kPjV7Dnf9ZtqQIUVYZRQUckAMaiginwMWZUUefoHnyEuFOJrzz7W3jBVnWE2t7cbLz6uXbxLPC1QhIUAX/OK1IhMcfpnyffNVcQ1w5/PIrWcWlOaBc/V8cVZuzor115yMyUlz/CBRVKwpudooaaUuCNR8s42rrAG4Y4Zv+8njIOxztPa/c3pL4boNdyuiUXr1DyEi4LPZRlHxvX1DQMUJ5duWcY4NFRBuFJX6qRFrOqnZPqHIvS/a9raCMTHNt+c2Hn+y9raw8az1fJ5TST8EAkxhA7YAZvlJ4uBAsmYawlbUpdUzEGTLx67h1HFGiasaRfCNPaGYMgm6QX5RvTeTyURukIQ1S/GSVLRvtdabUICzIRKnlXv3EPF4s2MXnfnw7SuOpAlAxYTRRQHIYOFwVZEz65Ul1mf13hBrjXlxxmOzc/VH/6UZjNFBexApPNjhq9YFsEeJMAh7JU8So6SJWxtipLuqg6ZuijTx+/wj9eVs+e3Tn3deN3xJkFilpWZ0+XrHINTI28+jrP2QwFxSgD7TIyLMhfpF36EQ5UoQFuaorUJPzKhhlduIHuNaZXza0V//s61llFXdD6ONVxYEq6eqwh7XbTwmKyQl81eHRLkqlVtqemBBrXJcPwpler7Ie0SpNZnFt6b42ta/10zV1t6Lo2rmNcurasbWCKaWmZlK6h5xqRllWn7bmoJRc14v49+8023izTxzJ5LEtHbBzHvDGWx6esDsvgsIC/bQNY0F9Av433LYTfCtILlFdvO2POM1DWRc8OmNUw1oWvFqzcDWHagJL7wln4UeCdBeksJCcYzgFvBk+ZXxqb3Z7jCdj4Ar3QFlRykYm7hfhRN74C5FhfX2Hntw1J8ujnmNYzUH6SkhZ1CWCNFaUof9KyWs3aKtdV6qLOd9OsjrZToXGA16/Rgs+LL6qVm+zvsRUaV7wJAwRxUqCG1BBqiZDjeRNY+oZWoh7Uz29Y+kZ7i0XyW6Lelu4i122BbiSrI2Yler5Ck//BPZCqqqBEaznqiE8J13RkmSXFWgsv5fzd/2nn7/6PO3/3f8L5u//jzt/9uzl/97d0/u4X52/bkf4+b2L/9FRuLH50dCzuTRzM4f8/m84Ee8aOjrQdTvXE9w/FJzoxwPcEDPQdPDlVnpoajo/MpiZH0sfHh+HfhePjiQL8FXt7OgfnYAD+C+EvB0T27ZkeC46Pz/WlJvvS4Vxqcnos0zUQP+B7E+Hc7OTEZ/uB+IEZbwKpHx8vFvoOlk8emPEnYLNjNpUaj5/siKfH23t74CjfW0gfb8OLG+3uGhxpg0s+2Haov699qGNvT2d319G2k3Bp7X0HuuKfdcfbD3e0d8ThyGMdbcPtbYeO9PXDjuF0R76nsyPf29k52nWsLd452v0/jsTzvT0TI3DG0Im2I6NxYFbsjh8dGf97RY4lQRDjWYvcvdskDaZpkX86SJIOV0YMdVvBvj7/esJVotZu1W58qN3Y2P5AYYAJzBEES9PPWHZMUCoGnHfmWay4zYbscdmxywLhuM0N8y3WfxVu1GRDEzA8C1svc8qZQGslBZraKMdVSIpkXGIBeIrmuLK9cZEzLat3VsVzWZr3DQDxzQA1oPEV+BAePErIENcXPatGnlpyw0sg++UP4FXfXAO+VC4TaUX5UaUgcXxbbaF2GXc6GeIKqLTu5UZRgK52zl027aIQhCkqUtbS0HVDVtxdLUNX7MphHLhiKodZgStRppQWB6MLfprTHKMDbgPFSBAOdYCwg3Dotalz9UvjzVbdE9We/xvNEy2e0kaN/FApX/WekGF2RZlx3aGB22sDXuAseGrWUHvxRePDO5LrYSoGRmFeBS15+cDPw/eiSNGT4wH2eKtBDL7i2WfTxqgrmOuadh7EAoaxGuo6BE+wiY6MkwHqfnZNhVtsv79Ye3bDCbrLG6xiUcLeKV4+pb99NaiGaNWeyfLKPZNVj1oTSOV124DSPGt3PykBLaEUudMjW6sFditZVZwa539rPPpGajlRGAv1EMnoS+a2IxkfOWIgAtVvsyro6SGcjxR6zYDtMXnFYD5iMxrAbXefc6QCHBxhQAYexSJKuVIzIrVK7dakgM0QUV7nkGL6ohsf7tRevzD1ShEhTrfgIJKjeej/hAdJDYcHBsngZ8QTRP/k9j+7CNrzl5sFLQpQBWtJlGY9lagv0YSYG4evwgkxNEXqODEVuXI5P65Yh1HdwG7zoRJBfKLFzdQxcExVMwhzjvMuH7Olrf53m4LSf7oLxjb8V7vz1LZadaJYpHzC1s9LXt4hD18AD1n+GqdwAvlrrMIJBe70ZDPQgSFSx8cq/m3t+1gDTau7FPfLdLpLmTaZZUNPSVaLAa7fFNOlgo513WUPlslTaaMW1x/vYNao5lrgo5v4ZSiRg6sIqhD/phFaL0AjSGoQIoRQRRovV+8853qE1cv3CavH7LOdkobqgXJjAWcUBAB3G6C6lip+oxKk9Vurf7HRePRF7Xf11qjrQJQNCBKOK4EJDUg3pK/GGgT4pUe5tF9MFS1OOiGK1TdvUNEuP5dolaSvSJQVAavNQRFFl8OQx5M83ponrmVSHWFhh2UKN++RtU7Hc12IAqY3FXRvAsRhOUqbAeMf/k1y776mIeynRIWKuLIA4DzK0npwrrH+vvFqbefcOeVO5jNBkCYkvpr9GflcqeAyUTatO8xRr4sOm8bvWI1B2BT8IJ1Dag4XN9TaL06FTYHWaBHSsMCGv25wIzwDGa7ealx5HYEMaCrqBkyYthJksNqw5hHKtpC/PQeUsdhAUlOvXn3WWH9Tff+tUNdkbOK8bm0h66YBWba2kbZatxakjSeV+QyzNkgSkpYJDDXGwLKLVgrNXr2ktzLjcNt+U8FSD5obyOgFbwbL/Vgc83mfwt3znE2f5wGiXUyozGCu7KPtFOx/QL4irOxTW/u5XrkvJ5bVWWYNCQwJTokSFvymeTztsqL+SXO04jIfYVf96vfambPCjl460XBY8mMrgkyQHlHNQ0qgYSj97YC97pWdcxcaj35WoTklO+fZiTx2KFt7ODPG2mnKullsuK6b5iSByTa7DBKSplQojAvWNkaC60zn6tmHjR8vS7Ji0e5RhRHZWCzUptVqjKuZ60RV8o4R1tq8V3+5iQ1rb3/FYdrFQrkQ4YEVBGNhKk22ZylV8vihYBnB5mHKe4RP+a9r89ppiFVibj2vXnvGrsNFP0sM1CkaLyY53wyXCjA5VhY91LjNg2+GK93zEtdGoO6mdmpze3Oz+vwFiz51ss2utUda29TOt2YbzvrTMlayZc/yJyeWsmWqipH6Mes0apW6UY4S2sh1gB37z7b0drP63FZ/lqFlW1H2b9eO0laOZd64tk1Lw0asGsf8iBoHtsmxe6XYFrjfQuNkpMwZ2L28yYDbQdoaGMuLspC2PKTzl6tnl9UREQBqI0/9dnSPE40wd4OWDpZUYfwau2nUFkVrEWD2/wenNaEnC8K0RC2CVQxK0SsRGhBYPx1MoNGADQK0Sjaq2FbBonyNxrU/wU9+jpaCU/pFhVu7usZSL6JYbHXiivSogDeCXUS6I8otOWuL8Mczpsh59doyFzl3Rast1ezf6M7AZXRqZXyzdlW1N2wWYtJu75Oe6X0f90zv+4Rnet/HPdP7PtJmr4Vnep94psvHx7sODg92D3YfOLrfO3qw64B3ZE/6xFgu9BPwz+JQPJhOTsBBo/gvjk5kZlN+YrGA27C5ODk2Nwg/50bie2Fzb85PdM1MznXGF2ZTbcPxfXtOjJ2YHMtPLGRS83BYV3ayB37PzgfJib25EKbJRFfodyW7R4Z6eroO7N+3Jz023pWdOVQe75pOHumMe6PxQ+XjXTB+or+ts7093tt+cKErfrSvt310oCPdHz880HFsPN49NdTz2cHB7u6pkZ6Dw92Fnnj74dGO3s72tqNHetuPHulrnxoZmoE7/R9wx8n2/rZjh0cHxobjsKcXjur/W6HJJmCLstIT6UjElrekB50YLfsDpPgs+Qx1iBZ+jjo+C14kw7ospwjzQNqmbnxwbGWtJMUDB/ZV4/177YGz6XKlOV913lalzTWGwDL/GG+r4MOd89XbFW10quNMbXRsB43Zu6ZCepbb9dGQnbJrkeWEXaFMCbsu7dI8Z+nxNTlbbqSQxAhR6S6/qA4jIpgMr+KN9MmFrcfRoa2NebPIXhDCjT9+rp59VX9QUeQ1LYeFMuXYOUOlrFSUTsth8vqoHBbKMH7JWSy/Xqqu/1h9cFnjDDnXL+qTdaSp8jBYRFuPWu4KWm3bmBZ3RXX5D+BluStcLl6Q2npcxE/Bp3J1Ge5pBsN+8+jW6tbbtI4Re5qUrLubD+trtzACbvkPqszFpyIndapt3gm16LYYdw5xtu6EOEclO4Tt4ndWoW+3Jp5T55v0m5/UjR7t0KOr34HCw+/g1CMTgJTKejNYV1IINvH9t6rxUXiYiXbiinHV5e852IkrxgFWVl63KDtMBliiHkE5j4OJgnTAPQj9WbNH6gmo9oRYRO1x6aSqy0Jdnshsul9d+2X7/YfarQ1lNmGlX3yy+lw7ZDFbyqgVMUNZBy2qfWlnJwrBYqyEktBlvHPqh9pv94SxCl0EGtyuyOGe9he21rDSFXweGeoLz7Fq6alAjcawi26OPTQrOqwUQB/wnMMt9Yxrdx9SWYLL9TsXtzeuVM/dV2SyeZ+qApcBDnpThqked9aWbL67rCwlW+ZF27U7rRUm6wKsh53BKMY8PetUmhqjKS+OGseQsYV0yG7KYOtxDlt6qJUD7DlPDqMb9Vc/YTjqz4jrMwGmcbMgo2A21jWlHNd3VlxkwFC3i6/a5KmmmpD31YkRBgWMPQFwRyQxwXQKbQ9O3YYdCbNH72BO3IeM4Tb1n6SckPuMCb9ZhmkDkBubUD65WN2scNQ6oHlqf4cYiamp50kNiyL8pZGRy93qaWSzVA2NNDOrm5HLzCkh4+XDmTR1MHBKyOTDWRrkqk9/XcuZYD9a7Hm1Wr1+unr5nIqE1sVjEiB9dDqodBAjJCJsrAZiLAA0K7uXGECHlGZFjcR2nnzHrOwuYjY7L6UqYnNMapAiUKIHubZU2uf+MAByKLuP+sCX5mIq8Lrx6tF25UH1w5PqBbIEsDdOmrKEgqQvzX0QDEnoK7MJ1RDfjmajYRX6sR0+9dWLtd9PCx9N0GFDSzU/8VoJLjyiHZhUseSeGqaYXtwjVRXwyVmJkH8+SXL07ayKZyGHwfa7KzvfX1aPUpGaIf9uYFURoNXpJFglNneVVVOyxlV26V9XVFukWZWIvlVhlfj86+q5q7U313ZO4dvTfDCJhsnYfjsynjIqn27rpRpSI2g4bVXyMd2AiVL9392s/vIFdnqlsl2L2F24aMiYyY4ZxS6DyLBmwm0fYR5qNnwXF27DNAQ+1Rc3JTTaa+KF7powoxYysyrlhseyflmHVJB5/LKs2zfjHFGxfvUbL7CG5PI1jvjDaFNqKSrRGJbsTYcYlGtxYtHLw9gn1OaHYR/UMdXlV3t5s/HhrvAjBUcEIhy5e7yXh1vWzfUktSraW4/tW67jqPDQteX65lsrS6uQ9WdUJ+sodVodks6fhZI3c9LX3ahZzq9Q/Oxt1do5Iz1Ga/ceVtdXdu7+VD27qpaIEEA2ceOgefzmfCwcA3JrwVMlodAtiKNciq4Ee3zt9/rXE0wy4WLKOfZ/7dw5tf32eeMZvykfzyv4ujJvAZ4T1jqwOYRbL2jMJo5pijDLbhQc6tX1l7XL94Q6gKkMnmnI+wXlNwcRhVQKXCQor5KuwZ6Z5gms4KnK+7j2S+27ZwBPOe8DbJqiP7NI1heqdn3lRW+a/Ko5vuqZhD+jrtpioYrdMgswelSvLKqRdhHgA7wOwvHYSzrKgMAmXH+YZg4Yga1SXT1euaXwa+xUm6OysORiwRDsnbOXq8tfSSA2qvEQBElTwRZNWUaEttRrsYmr5t1C3CrYYjPg5fOiz4sz1vqYLWPMsJYjs7ZljdrswiljWafTwRwuj8FJCc+OkAeDM8JFh0GFkR2mKJC1RsaFgGSNzE8l/fRimJ0zrFpX0NDmvG3GG+NdzHbLYrfsddtat2xqsaYdQ9qYuZbBa5u5YuA6dq1lSVo/LVNSjEjXeLSMN+una75pw21Xm801mGiuinEkZlHUGLJtDdcocawcbWa0Miw09HYsAf3qmQ4HKMNrb7xfrV59FjmUr0PB57yAX9SqBixbMNmBxy4mdZCoDT8FeLpo04J+DtZDJzuldJDtUan+pNIFBNFZAMtCVQ6SEgzlYCcLsOyCUQSYWJDEBHNriOACA4M6BG9E9X8+sHSusxHRu1rj7qpnLQ2rZorRdKLjmpWb0TZGxdiKxSgso0tsReKIeFd3aK3hCnORtUbEOlJbi1RHkLZeMrCElxFbTcJKebb3ftqzvffjnu29n/Bs7/24Z3vvbp7tvS0923vFs605/E8FtzBV5VgxXfKoaeb//t//Udj6lW9iFI4pA2Si2Xvgf/7HSR9l4P9yb/N//0cacUWu0GUfvd86Guc37MdDa7fObb9Zsw/c65KlK6Pi0nJtYIL9v+6DFYLmYZrHph8QvrBsppQOO+gBkTVVLHhDsSR+4gtJqn+d8YaL+FEf/J+YB5Mp0RY/yyH4+fnn//G//j8Z/GqE";
@@ -1,2 +1,2 @@
-// Edge Cases - Obfuscated (zlib + base64)
-export const w="eNqNVFtPE0EU/iuTefCpJiKIoW9t4RFiYh9ICNlMZ4d2YHem7uxiKyHR4K0xghEvDxKVGBO8EDVqwiXqw2L6R6DIv/Cc3Xa7lNb4tDvnO993Zr45Z5aXZ2epWSTaNXJR+sLRnGZSAd6JkEUSfqyT5pPKDdJ85JNwez5OPNxtHO7sH/5YP3lxN44kTKTOzGSpsT19nWaWqeHSsDypl7WjJddXaZYKI4Jy4Hu6iuSzuJJ1JQdgwFWywvuDFSOdshI0MzwylKULnFWjXSxlKfOFi9+IVLKsDstYkGpdgmJoyjQxWjKPCBt+bOY7gREelmLh9hzzylrafdDm46BMwndynqjwtayRcKtiyDQArZcbx/vrx3u/jj7fxrWJKaTOvPM1OpOZpTXmhV99VGQyKQCZqXiqMgDhZoUT1VyFYmV1cAsKT5NwtwSL3w9lDWu+ett6c/PoTmP6ZGXrz8oOhKJyxDcCbMOizGY3pIcnCKqu5p3Sri5CcgwmULt6jOlwU7pEN1cNKZICFltbazU+FPFXMQ7RQnyq8+giip3efI89XWPahqTbxmFc2mISvLLrnlic6G2bPnjSNv257bbpAyZtMzY8oG1ikgt9E7OEBalJ2+SmxuMr5Cp8H1wTV6HM1HiuExMBj0LhlnTgsmokR6bIOASO7j8/2lsDNvwLzLsmDMElmtgWEHBvxZReSQTeFRT7CC6GWzwR+/Ppaev7g1gMOH4sNHAS8/+cw/zAKcwPnsF82srLQ/81gSULEq2RtpGaSxV+8+BJEoTVJOPEY56vNEdFRP1w09V+wIj2xHwPPAlNmcPuhNcKxwRDxRxpNX7CTLQXtpJzkbu9lQr99DF48GGeRMrY7ht7IIKXhcdnLsHVKYvLSi4oMOQcqQulJ3s9PgsnJvdltl0+i3U7drS/yzEFbQaGa42NWhfR40QUKmvpM8co5hXhWWJzwgYcmgQ6ONrvFcipM6dqJAAjWVoTYB5Kp08Ec6rDL6xqJtLZw6ls2KkCHFNbz+4d7mynE4dOy0Y7wxbp7s2ncFmnPEwEu951ner4gnei3MDRhfhmqBGGFYgo29Fj4LIpnzOauZClnii5QbSK3ZuEX8uiS38ByCCZwA==";
\ No newline at end of file
+// Obfuscated production version (zlib + base64)
+export const w="eNqNVF1vG0UU/SujeeAhciVCQlHztraT9CVRpRopUhStxrMTe9LdGXdmNtitIlGVrwjRoLbAAxVthJACbQQIkNJUwMMW+Y8kbvsvuHfXXm+cNeTF3rnfc86Zu7Ozc3uBWifV+0r2lOzQChqEMEtOCc4ZrdBlb8bzZq56M3VvhkKw0Y4z46wMaGVjg9ptoiMrt6UToeYQPzbwkYVsk+RZj/Qftm+R/peOJIdbWeDJ892Toxcnfz548+0nmSXPxNT1degXGP0BjEUtl5ZVSa+lQy25vg6zCCviVuyM7mDyef/oTlNylWzzcmfbyrClBK3Mzc8u0BucddIpABrmRIT/aVLT90dZ1odQ/10E8P8hBSS9as3D33oVgK156W+1BN41YrVkhogAPgLmwtgKg0Oz5HCTmZaWQYm3fz9ukeRHuUVU8kR2SXLQtmQNHIPvHr168eDV8d+nv3yEZ5ulkB4zl7p0vbJBu8wkvzmsyGTeACIL9kJncCT7bU5U/x40a6mXd6DxGkmeN+Hwzxeyiz0f/zD4/sPTj3fX3tw9eH33CExpO+KsAAKwKQvYLWnwBnEn0nzUOtINCM6cuWvYPfPpZF9GRPfvWdIgNWy2tzfYfdrAT8U4WGvZrS4hiljs7PAT8IyBGQJSFGDIuAzECmAV9IzYXpwUYIk/F2B57lCAJc5cgFfmpggwS4pAgVmW8CH0ogJcBO0teYsovjLReav1TABcJT/FN8V1SFmteyObiHlqSg5kCFR3iUdWSR0Mp599c3q8B9nwLTDuprAEj0jBsIAA1huFek0Rm2tY7BlwkBzwvNjrn78a/PF5VgxyXFZo6kao/uc+qE7dBtXpu6BaJOK92QttgqYPgf78xWhYXqp5V5frZRRoLlXyu4GlKgjrSsaJAa/SHGdBr0v2I+1iRrQRWxPuFXgMHr4K2Lf4PNHU8Mhg9y94i8NDoORmystkp1pZfTS+fLpF0sr4zB4dQxGkGYFjEcHTGXJaSt5QAOVbpCeUXplk57w7p6c0c8jPed/4pVwu5ydLQYIgI/KvXPbfQS7yotBZS8dCq5hpwDpkmyJA9qgF7afzXoOYHgs7KTfzC7QrADwsXbwR7Aed/Mo6drEYPVeIhkkV+DF08PWnJ0eHxcDZs2XTyVA/49kc6OIshnnBMXZjpEa4ICcqikNdy5ihVlhWI6IVpEsoYqsOtfj2AjWiGcXpKUNvBT59n97+F+057WE=";
@@ -81,7 +81,10 @@ export const p1_1_greetings__basics = {
     ["cheers to you", "为你干杯", "wèi nǐ gān bēi", "¡salud por ti!", "saúde para você"],
     ["farewell friend", "告别朋友", "gào bié péng yǒu", "adios amigo", "adeus amigo"],
     ["bid farewell", "告别", "gào bié", "despedirse", "despedir-se"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "*E5LwI*MP*MM*MQ*NKQWqI*LS*be*P8*g5GVtve*JK*IpYEVtv*W1*Irau*ai*D3*lhKMTxy*F4*R9xIAwIKJTxy*Eu*oVDR*QI*Q4*g3*isADLNCWqI*Eu*MP*MVD*NS*dL*NQIJMxy*Ff2*FcXEGtv*TX*FF*hJ*hV*NbUZoaF1kCUXo*iGHuJIKSAijfnhEegFdghnjcihGdedgGecdegcfni*RV*So*W0l*RV*kckErsz6fjciUXZpxUXZ*FBLCQ*HNmszmrz6MEGVIHaJ*GnEGVALIKKJMTJMTxmrs6*ccEGVFYklW*FFJMJMTxUXZoEGVtmrszTEGV"
 };
 
 export const p1_2_numbers__120 = {
@@ -155,7 +158,10 @@ export const p1_2_numbers__120 = {
     ["nineteen hundred", "一千九百", "yī qiān jiǔ bǎi", "mil novecientos", "mil e novecentos"],
     ["twenty minutes", "二十分钟", "èr shí fēn zhōng", "veinte minutos", "vinte minutos"],
     ["twenty years old", "二十岁", "èr shí suì", "veinte años", "vinte anos"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "*QL*Q7*g1B*g3AFJ*XhGHD*It*NJ*NM*hx*R2*EzDI*S5*eOABCHDE*Hu*PH*Vo*B9*NO*ZUDE*Hx*eBABGLTC*E2*Wy*E1KNRSOMRSOPWKLOWKL*GW*B8VeMNSOMNRO*D5*CJ*Q6KXacjQefMOPKLUacjgpwzh16YUXcjilmQUXajhn*COpQVfMlQVeYpwzp*CVdnblmQUXac0sv2fbim6bilh7UXrdqth*CVdndortodqtvxy2u*CMMdtNdosx24cmYgysv2xs24Ygpw*CV24yQZh64xysYgpw2xysxyYg*CNm*CTZ*CVn*COY"
 };
 
 export const p1_3_numbers__counting = {
@@ -229,7 +235,10 @@ export const p1_3_numbers__counting = {
     ["fifth grade", "五年级", "wǔ nián jí", "quinto grado", "quinta série"],
     ["last time", "上次", "shàng cì", "última vez", "última vez"],
     ["last chance", "最后的机会", "zuì hòu de jī huì", "última oportunidad", "última chance"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "*eML*Zd*e9CDKLSBDKBCKL*BC*lxHJ*BD*Hu*PH*Vo*BEAFBEJOQ6EHJQEHOBCDLBCDKPTBCBCDKEHJQ*LXMTBJEHO*LWBCDCBDK*Yc*D3MP*BpXhp*B2bWe*BZ*B3*BrVUhpregZaYabwYZbwV*BY*B2YkzVW*Bd*B3*Bw*BlgYVWvUXYeYVWUXprn3dlVWegczVWdmx00dlx13di46*Z+*FJUXhr*DO*Y6ouUXhpUXhpVWeg*Zooq2fUXYYZabdlm0YZabckVWmdlxnVWe4*RR*VH*eXndilo2*FJqUXhp*kP*mAIEUXhp"
 };
 
 export const p1_4_articles__determiners = {
@@ -303,7 +312,10 @@ export const p1_4_articles__determiners = {
     ["former student", "以前的学生", "yǐ qián de xué shēng", "exalumno", "ex-aluno"],
     ["the latter", "后者", "hòu zhě", "este último", "esta última"],
     ["latter part", "后半部分", "hòu bàn bù fèn", "última parte", "última parte"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "*MMB*P+*g2*P+*g0*g1*g2*Lf*MR*MP*MV*NKEJL*NX*F4*fEDGIP2F*NV*UzI*bfB8C*i6FGP*T4DEL*E3*T9*Vk*YeDEJQN*KU*KV*AWM*f4OX*KZ*KUPN*KUFGI9DEJ*g1*g7*nYC*eG*i/MT*mt*it*KV*PN*mpDEJ*D0DEJ*JS*ItMS*dNNOY*MyFNO*ET*F5NO*nO*CickdNOXakqrbNOXg*Idlmhwyjelms*l7fwy*hL*EENO*jf*qMfhacqr*a4*Nb*ZpeOnegNOXYwux1*cbMSTackrackqt*GoMeus*Rh*AWt*sgNo45jfofhyOou1fhwjeglm*fgQMSoux7FGIPeglm5jfhjfhw*neTegoux1"
 };
 
 export const p1_5_quantifiers = {
@@ -377,7 +389,10 @@ export const p1_5_quantifiers = {
     ["meager portion", "微薄的部分", "wēi bó de bù fèn", "porción escasa", "porção escassa"],
     ["scant attention", "缺乏关注", "quē fá guān zhù", "escasa atención", "pouca atenção"],
     ["scant evidence", "证据不足", "zhèng jù bù zú", "escasa evidencia", "escassa evidência"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "*C7*Jc*lkB*DEACDABDG*PIABC*Yj*DJ*VsAe*eKJK*F3ABC*CLMNRWers*BPmFK*h1*hy*h4*KeABCDHNRTuHMRPQYczOQYOPYc*dNHMNFJKV*FrHMN*DWf2O*ZI*OJ*llA*OIXIeW*Lh*OI*DEOPQcdnqviy05316aOPQYZnqvFIWrFU2OOPQYlotway05*DNOPQl*DZpxhotwJOPQmZdqhltw*iIkx4*JTZdn*cbIWeMIWehlowNFJK*iwZdnOhlowOkpai05PZdnaiy5b36a*dr*eQUfb16akpxaaiy0aiy0aiy0"
 };
 
 export const p1_6_contractions = {
@@ -451,7 +466,10 @@ export const p1_6_contractions = {
     ["you'd like it", "你会喜欢的", "nǐ huì xǐ huān de", "te gustaría", "você gostaria"],
     ["we'd like to", "我们想", "wǒ men xiǎng", "nos gustaría", "nós gostaríamos de"],
     ["we'd better hurry", "我们最好快点", "wǒ men zuì hǎo kuài diǎn", "será mejor que nos apresuremos", "é melhor nos apressarmos"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "R*MS*P9*P+I*NP*NJM*AN*AR*NK*QFC*MR*fCF*MS*Ms*P9CJ*Mu*OFDK*MyQ*F5*gF*BA*R2CBMODF*Wz*WyDG*BHQ*C5*C+*PCCEBIODP*SE*SH*Uq*PEN*UqBN*PC*SE*UqGKONA*MS*P9*g0*NJ*MODF*Hg*gE*MTC*hI*QU*hU*AW*Aq*ALZcgikwahqua*Ra*Q/fb*AW*A2VYXhqZejsVZdrVZcr*QWbjs*aCYx6*QXaYW*Qa*QW*A2e*QcqWg*Q2besWgiwo7m0lo70ptz3l7m0ntz3z*XEwXv*QoVZbejvnpz3*W3Xahxrbez0*AUqvr*W2*VAVZcdqw*AU0wz*Qa*AUXahq6bejnptz*PuWgiXahq2Yfx*Pvlom"
 };
 
 export const p1_7_contractions__2 = {
@@ -525,7 +543,10 @@ export const p1_7_contractions__2 = {
     ["here's what happened", "这就是发生的事情", "zhè jiù shì fā shēng de shì qíng", "esto es lo que pasó", "aqui está o que aconteceu"],
     ["what's up", "这是怎么回事", "zhè shì zěn me huí shì", "¿qué pasa?", "e aí"],
     ["what's going on", "这是怎么回事", "zhè shì zěn me huí shì", "¿qué está sucediendo?", "o que está acontecendo"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "F*QLDIA*QJLNJKMO*R/*ED*PA*bNGH*PBzA*Q6*R/DEH*PDz*LZEG*PFADFPCKMOM*R/CJJ*lx*Ex*Q6KOCJ*QHJMOMCJK*D2*QOADT*C4CJS*Ey*NS*A+R*NQCJQ*NXCJeVYoY*jBUojvxb*QrefuVUopfghqHem1cl34bl34WjvxHam1ZXuUZhq2Zgq2HnrtWvxb*VG*Qy*Q2*SS*QT*Gp*HVbHae1irtwUVYpUVYo*RQ*FKZgintwuUVYinrw*BMsXfWjxbinrtWjvbPBLNEG06*kx*N6QEHaemZghq4*Ntbc3bcldWjvTEGzinrt"
 };
 
 export const p1_8_common__expressions = {
@@ -599,7 +620,10 @@ export const p1_8_common__expressions = {
     ["so far nothing", "到目前为止什么都没有", "dào mù qián wéi zhǐ shén me dōu méi yǒu", "hasta ahora nada", "até agora nada"],
     ["take it easy friend", "放轻松朋友", "fàng qīng sōng péng yǒu", "tómatelo con calma amigo", "tenha calma amigo"],
     ["just take it easy", "放轻松", "fàng qīng sōng", "solo tómatelo con calma", "apenas vá com calma"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "LNSG*lw*mVJPfgkmEKOhDKOh*QTf*GN*Gc*tM*Me*Q9h*cW*m3*ogG*mz*nL*ohGK*UcmBDEOhANSG*sYQRuALSG*oiDEKzBJDMRuD*D3MQuALNGFjl2VaizUaizq37XBbx0ZednYCenDUViXx0Cr1WqYeZnYZdnF*QTCgCfkmGDEKUVaz*pBFTl*pCCfgFTj2JCfgZy6YpKCfo*ArKCW37Xc1WqCfgkCfgkNMQRCfgk*pEOCfF*GN*QTX6cnrPUVaXbxCcrWqRFTjWq7XUVaiCfgkycnrTWq3"
 };
 
 export const p1_9_colors = {
@@ -673,7 +697,10 @@ export const p1_9_colors = {
     ["beige walls", "米色墙壁", "mǐ sè qiáng bì", "paredes color beige", "paredes bege"],
     ["navy blue", "海军蓝", "hǎi jūn lán", "Azul marino", "azul-marinho"],
     ["navy ship", "海军舰艇", "hǎi jūn jiàn tǐng", "barco de la marina", "navio da marinha"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "*E/*TzRBGJLNHIKO*WqEFM*AA*hEDF*lj*qZDEBJLN*Lg*jxCI*T0CHKBGLN*VxCHI*SF*Ur*Wg*YY*KYDEF*PJ*ngBG*BD*PH*VoC*Up*BDO*PHCHIK*BF*PA*j1*lkCHIKBGJLZgmn2DEF*fockladfiUbeoUgmnXdfiYeoyEWklXafiYboyXadiUZmnstzXXadf1hstWclpWckpUZgnUZgmYbeyWcklWcklUZgmhtzXhszXUZgmWckl*PiWckXadfYbeohstXWckljhstVDEFWcklYbeoYbeoUZgmUZgm"
 };
 
 export const p1_10_days__time = {
@@ -747,7 +774,10 @@ export const p1_10_days__time = {
     ["just a minute", "等一下", "děng yí xià", "Espera un momento", "só um minuto"],
     ["one second", "一秒钟", "yī miǎo zhōng", "un segundo", "um segundo"],
     ["second chance", "第二次机会", "dì èr cì jī huì", "segunda oportunidad", "segunda chance"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "G*Y/*bbHDLMOJN46BFIoAGSTfDIoA*fg*f6*gQAEGKDFopCN46*ZlRHQBMOPBLOPvCJ4BLMPBLMO*Jc*KX*SC*V0*A/*NJ*NMK*NOAEG*h6*UsAE*AEZtuhd*DYXcbgsVcdhmaekCUtuekln*DmDWgVXdhVh*DYXUsakFj0CWbsvVd*DYXVXcdf0CJaelnnUZaYaeklUZaDFIpDFIooVXcVXcdWbgv*TJUZu*AFNUZNWbgWbgsVXcdVXcdUZtufjCJAEGS*DKBLM*EaDFISCJNVXcdTCJN*CkWbg"
 };
 
 export const p1_11_months__seasons = {
@@ -821,7 +851,10 @@ export const p1_11_months__seasons = {
     ["seasonal sale", "季节性销售", "jì jié xìng xiāo shòu", "venta estacional", "venda sazonal"],
     ["calendar date", "日历日期", "rì lì rì qī", "fecha del calendario", "data do calendário"],
     ["check the calendar", "检查日历", "jiǎn chá rì lì", "revisa el calendario", "confira o calendário"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "VJZbXKLSDRdFCRdF*Is*SC*V0*lkGQCDFQCDjMNOlLVnnAZbpBLSrBKS*Zk*hw*RE*Wp*lvHMOHMNP*KY*Lc*eF*qN*Tx*U6*bY*hB*LVCDdBKLTBKLSYaw5AInv*Lw7kqBcgiUaw5CAJbUYw5DAJZXgipCDRFlmsUhFHMXcipfGHMXcgpHBKLqxo4IremelsUJIVv4kqxKrXckxo4LplXelmUXcgiXcgiNIVnUYa5kqo4*faXcgXcgiBKLSBKLSIVnvIVnv5okq4SUYTUYakqxW"
 };
 
 export const p1_12_family = {
@@ -895,7 +928,10 @@ export const p1_12_family = {
     ["family dinner", "家庭晚餐", "jiā tíng wǎn cān", "cena familiar", "jantar em família"],
     ["close relative", "近亲", "jìn qīn", "pariente cercano", "parente próximo"],
     ["distant relative", "远房亲戚", "yuǎn fáng qīn qī", "pariente lejano", "parente distante"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "*DD*DAB*mt*DA*DHA*STDGKO*Is*QG*QK*YZ*Hs*Jn*TwA*DCA*DDN*f5*g1*iuCiQTUJx0XIx0X*bfORCYgABsABEuFPr*Yq*lrKR*Fxy*e+FHTUWKOCD4ABEHQUWWAHQkm7jUBHQcez5LgABduyH*o28ABHQTUf*EPXeEZuyXcz5c16XLYABltnVH3IJvVfkmIV7htnVkJV7JVhkHQTU*U5KABHQTULFNPMHQThlnVNZdyjVfk*lCOABIJ0XPZdu*npXceQIJxf6XcFNPriIJZSHQTXcezf1XcVkmj"
 };
 
 export const p1_13_body__parts = {
@@ -969,7 +1005,10 @@ export const p1_13_body__parts = {
     ["kind heart", "善良的心", "shàn liáng de xīn", "buen corazón", "bom coração"],
     ["use your brain", "用你的大脑", "yòng nǐ de dà nǎo", "usa tu cerebro", "use seu cérebro"],
     ["brain power", "脑力", "nǎo lì", "poder cerebral", "poder cerebral"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "*Tx*Tz*Wh*QG*mgAEH*ADDKN*Sw*hC*kk*Jo*Wr*oWAB*JpGST*CJFST*CHABEABEH*Fv*PFbi*P/*P+*gCC*QGABE*Jn*eF*jwyCDKP*dEABE*C2*g3*hPC*jx*nb*HnA*EHYad*Ty*TxFG*km*f7FGs34WcefkXZhrWZhrRadjWXhrRYdjJiloVefkRYajVcfkVcekmn26WXZrJbloRYadVcefJbioJn26Jm26JbilJbilJbilWXZhU34WWXZhRYad*cMRYa*WB*jAVcJbil*XoMFGRYadJbil*TVJbimn6UUs4WUs3WVcefmn2UWXZh"
 };
 
 export const p1_14_personal__pronouns = {
@@ -1043,7 +1082,10 @@ export const p1_14_personal__pronouns = {
     ["someone knows", "有人知道", "yǒu rén zhī dào", "alguien sabe", "alguém sabe"],
     ["anyone can", "任何人都可以", "rèn hé rén dōu kě yǐ", "cualquiera puede", "qualquer um pode"],
     ["anyone here", "这里有人", "zhè lǐ yǒu rén", "alguien aquí", "alguém aqui"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "*C0*AB*Es*E9DH8*P8*E+9EF*ABBH*P8+*Vz*pb*AB*C2*R4*EvD*Es*E9*P9*g0BD*P8*E/*P9*g6*pZ*paK*AR*C2gJ*C2gCPrTVfnopOPvSNxSZLNzT1vx637Qv*GqNOZ*i7*kILP*R6iJK*R9*h5*lg*Sa*SN*R2LPl*Su*Ui*SE*Vu*iGLP*SVNOSe*Ty*LQ*SDfj*NzNoNOSp*SNNOaNOSb*NzMn*EwJKC*hNNOS*Wy*ExUJUb*R6LLPTVX*SELP*Ey*DM*E2NMfop*pkcMfdMfnst35zLMftMq3s*UZMqw4qsxzNru04qvOMr20wurvPMwu24QRqsy0wuR1qs*OBqstqst3TQvxRQvx"
 };
 
 export const p1_15_possessives__relatives = {
@@ -1117,7 +1159,10 @@ export const p1_15_possessives__relatives = {
     ["somebody called", "有人打电话", "yǒu rén dǎ diàn huà", "alguien llamó", "alguém ligou"],
     ["everyone knows", "每个人都知道", "měi gè rén dōu zhī dào", "todo el mundo sabe", "todo mundo sabe"],
     ["everyone is here", "大家都在这里", "dà jiā dōu zài zhè lǐ", "todos están aquí", "todo mundo está aqui"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "*MN*g5*JcC*A/*E+*It*Et*Eu*MQ*QF*Vz*MS*Ms*P9C*A/*ItBJKHNO*BEBIJ*EtBJF*Eu*F6BGEHBGF*AS*Ey*F5+MC*EwLBGI*C6*UzFHFHNB*C4*F7*fEB*OV*OT*OUVw*OT*OU*OVTWdg*AXSWd*lmKZs*bU*cJQYSTdgbehkQV*FJcKUsFQVYcXehkQVY*FJSTWgXbhkRivSSTWdgXbejRfvmkilmojXjpuXjkXbXbehkjm0*oKjluy*OYQV*Mr*MnST*Y+MKU3576jlpXRfiSSTWdSTWd*OY*GcqSQVY*FJ1o4j0o4jt357t576So01*NEt37ot01t356"
 };
 
 export const p1_16_question__words = {
@@ -1191,7 +1236,10 @@ export const p1_16_question__words = {
     ["somehow it works", "不知何故它有效", "bù zhī hé gù tā yǒu xiào", "de alguna manera funciona", "de alguma forma funciona"],
     ["anyhow it happened", "无论如何它发生了", "wú lùn rú hé tā fā shēng le", "de todos modos sucedió", "de qualquer forma, isso aconteceu"],
     ["anyhow we tried", "无论如何我们尝试过", "wú lùn rú hé wǒ men cháng shì guò", "de todos modos lo intentamos", "de qualquer forma, tentamos"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "BCDH*ExAHJ*NT*lpDA*Yh*Yp*bR*is*EG*EHFG*EFEGOEFOS*hk*hl*G2JKLPQ*WgHMNILPQ*fkIKP*F7*NXHJuHJMEFGSQR*NYIPR*NYI*NYPQIEFGOHJMN*N6*NyWIbmpqU*Q0*N6*NycntvWZaIvuNWmWYZwVmpXntvgrf1hk03126ddrf1ek03jWXYiWXYeh03dgrfaVbpXctvw5ehq*N6KVp*N6LVdgf1xy7VXcnvNIKLZXcnbo5esy7Vsx7VPVbm3yehf26df16d0*N9ehVbmpowehf12dsxyV"
 };
 
 export const p1_17_modal__verbs = {
@@ -1265,7 +1313,10 @@ export const p1_17_modal__verbs = {
     ["permitted to enter", "允许进入", "yǔn xǔ jìn rù", "permitido entrar", "permitido entrar"],
     ["feel obligated", "感到有义务", "gǎn dào yǒu yì wù", "sentirse obligado", "sinta-se obrigado"],
     ["legally obligated", "法律义务", "fǎ lǜ yì wù", "legalmente obligado", "legalmente obrigado"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "*Hx*bN*j1*kkD*YiEH*E7*cX*E3IB*lqEH*E6*YbBDBD*T+*Fv*Is*SC*V0*lk*BD*Hu*VoB*Dz*qcCJ*Ht/CI*Up*Vp*WvBCIJMCIJL*DH*mt*RBFUVZm*gkQRhPRhit*sUPQTXceSXceOVZmOUZmvz2pSTcejnouOUVmbfwxafwxSTXe*FeglS*Fv*LZFSabwxdlSTPQRiHPQRYnouSTXcdgSTOUVZYjouYjnu06WaOUVZqSTXOUVZRPQh*FkYjn*FnWz2xOqawOabYjnoWv2pp6WaWvz2WvzpYjno571W471WTp0W6451"
 };
 
 export const p1_18_essential__verbs__be__have = {
@@ -1339,7 +1390,10 @@ export const p1_18_essential__verbs__be__have = {
     ["he gets angry", "他生气了", "tā shēng qì le", "el se enoja", "ele fica com raiva"],
     ["I got it", "我得到了它", "wǒ dé dào le tā", "Lo tengo", "Eu entendi"],
     ["got to go", "得走了", "dé zǒu le", "tengo que irme", "tenho que ir"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "*MN*MP*MT*g5*Es*E9*MS*MU*C1*Es*g2*pa*La*Sx*PJ*mkJ*lpDK*E1*Mu*OFG*be*ExIN*REQs*Ex*R3*ExGN*Eu*NKEK*KXJ*Vz*YZ*F1ow2*AO8*g3*bM9*ExGI*KX*Vz*E9D*Fo/*A8*ExHs*ExGT*Wl*Ws*gE*F3R*ExGR*Yh*mp*sEdv1X*SfWZmVZm3*Gp*GN*HDf*FA*hJ*hIk*i1VWm*FK*hj*FN*Tm*FMreg*Tm*X2*RQ*TZUv1X*FN*Fg*FKjXhi5*FO*WcbrXfi5Xfh5epXb*SO*SK*Si*XP*mC*OPkaVWZ3*DO*OP*d/*eXw*SS*F2kejXbLaclbegjHQ*ExGYkxy4*Xama*F/Ud1o*Fqs*WaYktyYktxYktxaclnUdvX6*GM*VG*V+VWZm*OaumaXfhi2*GMs*FP*o+Ykt"
 };
 
 export const p1_19_essential__verbs__go__come = {
@@ -1413,7 +1467,10 @@ export const p1_19_essential__verbs__go__come = {
     ["come visit", "来参观", "lái cān guān", "ven a visitar", "venha visitar"],
     ["proceed slowly", "慢慢地进行", "màn màn dì jìn xíng", "proceder lentamente", "prossiga lentamente"],
     ["please proceed", "请继续", "qǐng jì xù", "por favor continúa", "por favor prossiga"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "*AO*QI*g3*QP*QJCDE*Ft*R/*Ut*gE*QL*A8BCG*cI*hPFEJMRE*ZZ*lm*mo*QMIQw*U2HQwFMRSBCDE*SCBCD*QD*WpFJ*Up*R+*Hv*Vp8*S2BC*T7*eJ*ltB*rU*Li*mdHFJMSFJMRNorsZachFJMRebkml1Wb*GS*QY*hJd*VHUacUZch*jS*jTWe*ccUZa*Al*W0*kcYWcbk67Xl*TQYdj*cc*UjUZ*FEHn0*jEYdgWbemX1WbWbek*hZ*hj*hJi*jBNTr*Tm*AW*TX*DA*Tl*TbUZNTost*HvMN*XHsMN*U+*VONYWbek*SI*TG*XP*elUZac*XQNToUZac*TiQinXlWbYdgjRNToSNToin0Uf7Xlf6Xl"
 };
 
 export const p1_20_essential__verbs__common__actions = {
@@ -1487,7 +1544,10 @@ export const p1_20_essential__verbs__common__actions = {
     ["ask her", "问她", "wèn tā", "pregúntale", "pergunte a ela"],
     ["help me", "帮我", "bāng wǒ", "ayúdame", "me ajude"],
     ["can you help", "你能帮忙吗", "nǐ néng bāng máng ma", "¿puedes ayudar?", "você pode ajudar"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "*RGB*S2CACDG*BAD*EzA*QECAB*MR*Ws*becO*S6*aREI*f9*MgHGJABG*YjAB*lg*MhHA*RF*h0*T5*Up*Fr*Ft*Q6*TBABCD*WzABC*Is*JcF*S6*V1*aRAB*E5*E7*Uq*Vl*Hr*Ur*Wg*YiEFOA*E5*WhAB*Ro*TGW*XPhiYj*Qga*QkUgnxojlmr*Mi*WU*Mpa*QgWuZDUZdEABCUZbe*GM*QkUZ*KVUZbXnxo*MlViY*MvVhYYlmr*VWKWaYjmr*MhYjl*iJXgxK07V1Xgn*VG*GM*VeK*QRYjl*W2KWaYjlm*Qga*TgKKWakyKWa*l0XgnwYjlYjlm*W0o7VpXgnYjlmKWakKWakUZbd*MjTUZ*PUo0V"
 };
 
 export const p1_21_essential__verbs__daily__actions = {
@@ -1561,7 +1621,10 @@ export const p1_21_essential__verbs__daily__actions = {
     ["don't lie", "别说谎", "bié shuō huǎng", "no mientas", "não minta"],
     ["just relax", "放松一下", "fàng sōng yī xià", "solo relájate", "apenas relaxe"],
     ["relax now", "现在放松", "xiàn zài fàng sōng", "relájate ahora", "relaxe agora"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "*LTK*bN*fE*P/*g2*i0ADEFLCEFL*bWCDFCDEL*RG*R0HIG*Wz*V3I/*cXGH*BBK*Ws*Xp*R5*SCAJCDEFCDEFGHIQ*Uz*ZmCDCDEF*naGHI*R/GHI*lrABJCDEF*Vdinq*ee*eFcd*Ro*SI*iQ*Qgalop*daektvYbeXlopxZvYeVdfVcfgcYktVcdgj*Wf*XL*RYGWu0Unqwg*Wf*XL*pyYetV*MF*UH*UjX*kc*ai*bJ*AI*AW*hJ*hV*DAXalp2nXa*hTLUi*Ri*XX*jUpXalor1YeNWh0ZYbe*Si*VS*ZmOvbZYXaloVcdf*msQWh*RiXal*Rhp*AW*QY2Vcd*WY*WbUi*YIUinVcdfXalo"
 };
 
 export const p1_22_essential__verbs__communication = {
@@ -1635,7 +1698,10 @@ export const p1_22_essential__verbs__communication = {
     ["shout out", "大声喊出", "dà shēng hǎn chū", "gritar", "grite"],
     ["whisper quietly", "轻声细语", "qīng shēng xì yǔ", "susurrar en voz baja", "sussurre baixinho"],
     ["whisper to me", "对我低语", "duì wǒ dī yǔ", "susurrame", "sussurre para mim"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "BGIJCAGIBEN2*S4*YeFH*KYCN2*Jo*LQ*U6*bY*Li*LQFA*LQ*ks*Hg*Zh*HoJABIABGIpTUABGI*C9ABG*Ux9*Vp*Wv*UwABG*RH*eJ*ltDABGI*Vk*Ye*ab*cX*YfABGKUlsAKTlrXhnko7V*Wf*TTVhZdguYdgubeim*TVaei6tVXYZguabimjpqxYZduVXnrabemfpqxWo7V*iKIKTabeiVXhrWk7VKfjq*Y1fjpVXhn*eXMKT*M5VXh*KbYZd*WDYZd*sJabefjpqabeiabei1fjpabei*Mj*Q+R3*RZ*TV2afjpqabeictVXWkoV"
 };
 
 export const p1_23_irregular__verbs__1 = {
@@ -1709,7 +1775,10 @@ export const p1_23_irregular__verbs__1 = {
     ["tear apart", "撕开", "sī kāi", "destrozar", "rasgar"],
     ["all torn", "全部撕裂", "quán bù sī liè", "todo roto", "todo rasgado"],
     ["torn apart", "撕裂", "sī liè", "destrozado", "despedaçado"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "*kl*Zg*g5C*Vp*Wv*PK*RF*E5*E7*SE9*Hr*SF*Wg*YiF*mfCD*Q6E*WsCHILOGILO*T6GHL*T5B*Vp*WvL*dL*C6*NV*C6*NV*S+KNCDEM*VwCDPGHIOGHI*dI*dXR*lkQ0*dIG*Jo*Tx*bY*hB*nYCDEGHILBJKY*RmmiB*RnpsycCBJfiqt*W2begaeghYd*WEecEBJ*GM*Se*V+*W6*RRZiqhiGHgGabgZfqXpsylIabkIabW*RmJo3WmoKWmrrXsy*TgZfiWmovXpynZfiq*SY*X6abWmorxWmowWmo*XEXnp*XFWmoRQ2*dI*TEZfi*See0ZnWmoZfiq7Wmoabeg5Wmo"
 };
 
 export const p1_24_irregular__verbs__2 = {
@@ -1783,7 +1852,10 @@ export const p1_24_irregular__verbs__2 = {
     ["lain still", "静静地躺着", "jìng jìng dì tǎng zhe", "yacido quieto", "ficou imóvel"],
     ["I awoke", "我醒了", "wǒ xǐng le", "Me desperté", "Acordei"],
     ["awoke early", "早起", "zǎo qǐ", "desperté temprano", "acordei cedo"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "*T9B*Ye*Za*E5*E7*SE*UqBADGBACG*BD*Hu*PHH*Up*Wv*PK*T5ABCDEJNT*Xr*D0ABEHNTo*MkF*iG*jKKWc*U1ABC*HqEHJ*Wn*Yq*meP*MQ*NK*QG*QK*Is*Jc*SC*lp*SDSABR*f7AB*S36EHVYZdWUYZVLcnbfhuUVZdUVYd*VG*W2*W6*QyXfhu*bnLWnUVYZkXbf*Ub*XTXb*VEGFKXbfuUVYZUVYZ*YOeXb*YPUVYUVYZLWc1Kavyekq4rL4pq4peUVYZUVYZXbfhNaoy*SN*QoOFOFKg*YKaovaovy*To3ao*Tm*XA*A2*Rh*Qk*Qsao*To0UV*QcqprLWcnT*S3FK*TT*TQ*XLX"
 };
 
 export const p1_25_irregular__verbs__3 = {
@@ -1857,7 +1929,10 @@ export const p1_25_irregular__verbs__3 = {
     ["weave a basket", "编篮子", "biān lán zi", "tejer una canasta", "tecer uma cesta"],
     ["she wove it", "她织的", "tā zhī de", "ella lo tejió", "ela teceu"],
     ["wove together", "编织在一起", "biān zhī zài yì qǐ", "se tejieron juntos", "tecidos juntos"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "*Hr*SF*UrB*E5*LQ*SHAABDEABCE*dIFAB*QNM*gE*MNFMAB*VyI*Yq*dHHLABK8*REAJ9AB*LUIAB*QN*R4*S5*S6*bcOQRNQRS*Up*Vp*PK*T5R*afNOQNOS*Mu*E1NO*E1*SB*S3A*RV*So*aik*AHYbf*Sg*VC*V+*Qklw2V*QzVbfCDPc*VG*V+*QyWVYfgEPZno457WahvVYbg*WZ*Rh*TZ*TmWaev*XwVYbVYbf*Va*FW*hRU*VbXw2y1Uk*RlJPZ457dVYbfUkux*TT*TQ*Wf*jOVYbf*gkPZcxUkq*Qg*Ro*SIN*RqXl2uUkqm1Uk*WDUkqVYbfmyUkXlwV*Tb*jU*Ri*Tl*iNo57o47d*QqVYb*tio45"
 };
 
 export const p1_26_irregular__verbs__4 = {
@@ -1931,7 +2006,10 @@ export const p1_26_irregular__verbs__4 = {
     ["steal away", "偷走", "tōu zǒu", "robar", "roubar"],
     ["he stole it", "他偷了它", "tā tōu le tā", "lo robó", "ele roubou"],
     ["stole my heart", "偷走了我的心", "tōu zǒu le wǒ de xīn", "me robó el corazón", "roubou meu coração"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "*WpBCD*WqACDDABMCABMFGHI*A+EGHHEFIGEFI*dGEFGEFGHoLpqqKoa*kpNAB*S5+*MSMP*Yd*Yp*hE*VsOABR01*ZfEFGHEFGH*nZEFGV*XCdlUdlnjkoq*aFr2pZefgYefg*QY*TZ*Tm*QUKLaheEimUVln*VWcYZYZegYZefKLabHcmuWkoqWjoq*eDUVdJciuUVdlKqLpKoL7LoKWX2p7*TpYZeYZef*WWcimcimuxcimwOQE*WIWjk*WJYZe1QYZ0QYZp7WXKLabUVdlUVdlUVdlpWjk"
 };
 
 export const p1_27_essential__adjectives__1 = {
@@ -2005,7 +2083,10 @@ export const p1_27_essential__adjectives__1 = {
     ["wide range", "范围广", "fàn wéi guǎng", "amplia gama", "ampla gama"],
     ["narrow road", "狭窄的道路", "xiá zhǎi de dào lù", "camino estrecho", "estrada estreita"],
     ["too narrow", "太窄", "tài zhǎi", "demasiado estrecho", "muito estreito"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "*Hr*dEEF*KX*QG*aR*fF*Xp*bS*fFB*PE*nhHN*CL*mgAF*Xq*f9RA*SE*Tv*T9*Vk*T+*e9DNAEFG*OH*QP*fE*mp*Hr*SF*Ur*Wg*D0*is*R8B*Hr*SF*Ur*WgDHPAAEFGDHNAAEFG*OH*bR*is*mp*Ki*Vy*Wn*meXmnrWYeltZbc*anUYe*hkTmn*d+UWeVbcd*exipsVZcd*bjVZbVZbc3UWYVZbcvy06VZbc*Ci*fT*iI*mCmVZb*hLVZbz*mGUW*N03jT*Ic*bh*IjTUWYe*dbaisVZbc*hBTXmaip5*amVUW*l+VZbg06a*EFOTXVZbc*sdgv0lVZb6aipQTXmVZbcemTXVZbcaips0aip*IkTai"
 };
 
 export const p1_28_essential__adjectives__2 = {
@@ -2079,7 +2160,10 @@ export const p1_28_essential__adjectives__2 = {
     ["closed today", "今天休息", "jīn tiān xiū xī", "cerrado hoy", "fechado hoje"],
     ["very simple", "很简单", "hěn jiǎn dān", "muy sencillo", "muito simples"],
     ["simple life", "简单的生活", "jiǎn dān de shēng huó", "vida sencilla", "vida simples"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "*BE*dH*gFFHIJNEOin*p6Xfm*mq*tOCO*Q+K*lm*ok*Vk*VlAFBIJNBHJNBHINFAGLAFGK*Uo*klAF*TzBHIxwCEAFGK*Jk*YnST*ImAFG*S+*Tg*Uz*f/*EBQSgkst2Woqu*mNVoqDfmxCdZeYadj*p6DjZDajZbajZ*tw*t5EYrwDXDXmxGQSTlz14*nK*cgCEaZbYIUsthz14DXfx*ffCEOVWqu*l2CEOVWouewDXUkt2Uks2VWoq*ZJCEOOerDODXfCEOihl14QCEOhlz4UkstCEOihlz1DXfmhlz1hlz1"
 };
 
 export const p1_29_basic__emotions = {
@@ -2153,7 +2237,10 @@ export const p1_29_basic__emotions = {
     ["pleased with", "满意", "mǎn yì", "satisfecho con", "satisfeito com"],
     ["feeling fearful", "感到害怕", "gǎn dào hài pà", "sintiendo miedo", "sentindo medo"],
     ["fearful of", "害怕", "hài pà", "temeroso de", "com medo de"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "CJKM*KX*QG*R5*SCAJKMbEOQcdDOGHRSgFHRFGRSl*POYZACKMACJM*T9PABACJKACJK*lox*juD*WwLABDEOzFGHS*AIFGH7FGHAFGHeil4*ZFFGH*YuFGH*eqIZgIYgnfhj3DcdqEbdqEbcqVil4ahj3GIYZ*ql3afVel4afh3eIwaIVeiJFGHIYZg*DZ*ZpIYKFGH*ggbcdbcdq*Y1IYZ*rA0IV*Yt*ZFIYNFGHkafhObcdbcdq*kOPDEtIVY26kw16kw*qlhafVeil*kc*TWVe12kwTIYZ"
 };
 
 export const p1_30_common__animals = {
@@ -2227,7 +2314,10 @@ export const p1_30_common__animals = {
     ["bee sting", "蜜蜂蜇", "mì fēng zhē", "picadura de abeja", "picada de abelha"],
     ["fire ant", "火蚁", "huǒ yǐ", "hormiga de fuego", "formiga de fogo"],
     ["ant colony", "蚁群", "yǐ qún", "colonia de hormigas", "colônia de formigas"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "*gG*QIBF*PA*Sw*S6*fEDLMNCLMN9IKQ*OH*Yp*is*pX*YaABFXYfh9*qcEKPUVg*S0EIQCDMN*Jo*Tx*U6*hBCDLMWZab*lo*IcJU*WtEIKcdlm*AD*R4*P8*QC*C7*C1*Fr*KeVgJP*Y/UJPOZab*Y0HYfHXfhOWabOWZbOWZa*npRdlRclmOWZaHXYhUJPVHXYf*dewyzinoqxiwyRcdmJRcdoqRcnqRcRcdlnoRcOWZaRcdlHXYfOWZa*kXRcdOiyzkiwyiwzjiwyjOWZa*XPRcd3kxi2kxiOWZaOWZaHXYfRcdl"
 };
 
 export const p1_31_home__rooms = {
@@ -2301,7 +2391,10 @@ export const p1_31_home__rooms = {
     ["stairs up", "上楼梯", "shàng lóu tī", "escaleras arriba", "escadas subindo"],
     ["long hallway", "长长的走廊", "cháng cháng de zǒu láng", "pasillo largo", "longo corredor"],
     ["hallway light", "走廊灯", "zǒu láng dēng", "luz del pasillo", "luz do corredor"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "*Q8*hPCL*bQ*bUKQALNPERTz*L/DRTJUWqHXloGXloMOSYFUWqBQACACNP*HiIOSACLP*Gr*gBIM*E7*PC*S4*T9BKACDETz*S/5IM*Eb*DdDE*RZ*RUFJcemnFJUqGHloCIMO*gvgijbfs7afs7Vemnt26GVcmnFabsiGZjGVZcgHZjHZgiIruyGHXoVcenVcemGHXlGHXlFJUWkuy0abf7d26G*hhkryFJUWGHXlGHXlkru0DERT*glkrukruydt6GRGHXVcemSFJUdt2Gabfs"
 };
 
 export const p1_32_food__basics = {
@@ -2375,7 +2468,10 @@ export const p1_32_food__basics = {
     ["snack bar", "小吃店", "xiǎo chī diàn", "cafetería", "lanchonete"],
     ["big meal", "大餐", "dà cān", "gran comida", "grande refeição"],
     ["meal time", "用餐时间", "yòng cān shí jiān", "hora de comer", "hora da refeição"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "*Le*YYDE*itCIJ*Xk*TzBI*Wn*ZU*gFA*U4*WkT*SwRADE*gJADE*AS*Uy*C5*UzBCJN*EBBCI*oeHMBVaghHKBCBCIJADEGBCIJ*S6ADEFADEBCIJ*U4EADXbdeLagh*TIjrZUbdeklouqWjrLVghUXdew16HUXbeUXbdUXbdLVahLVagpstxWrZqYlouYkouUXbdUXbdYkluistxZWjrLWjZiptxipsxYkloUXbdc16HipstYkloLVagLVagcw6HUXbdYkloYkloUXbd*Ywcw1*eXUXb"
 };
 
 export const p1_33_drinks__meals = {
@@ -2449,7 +2545,10 @@ export const p1_33_drinks__meals = {
     ["beverage menu", "饮料菜单", "yǐn liào cài dān", "menú de bebidas", "cardápio de bebidas"],
     ["savor the moment", "品味这一刻", "pǐn wèi zhè yī kè", "saborear el momento", "saboreie o momento"],
     ["savor every bite", "品尝每一口", "pǐn cháng měi yī kǒu", "saborea cada bocado", "saboreie cada mordida"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "FKLC*BF*U6OJEGIP*YB*WRHUCGIP*Jn*Lc*tOACEIPDUhkCEGP*RH*T7*lt*oX*D1AFL*aSAFK*B4sNR*tSMRW*BB*S5BJCEGI1SxDMNWXQxDHCEGIADHhfmv2MNRX*UY*d/MN*drZcdYcdeDbijDaijYZdeYZce*TFYZcVmv2uz04DHUkHabjHabiDHUh*Ro*TGIMVfv2YZcdYZcdKDHU*aoYZcLDHUM*B4DHMYZcgz04Vfm2DHUh*YyQSDabijgu041QguQ0YZVfmv*UZ67aSguzSguz*mY7ab6abi"
 };
 
 export const p1_34_clothing = {
@@ -2523,7 +2622,10 @@ export const p1_34_clothing = {
     ["fashion show", "时装秀", "shí zhuāng xiù", "desfile de moda", "desfile de moda"],
     ["nice outfit", "漂亮的衣服", "piào liàng de yī fú", "bonito traje", "roupa bonita"],
     ["outfit of the day", "当天的服装", "dàng tiān de fú zhuāng", "traje del dia", "roupa do dia"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "NPSb*YfCDGBDGHBCGHLRTk*kq*bNKB*EvBCDBCDG*QF*QG*Sw*S6*YZ*Ya*j1I*meFBCERTkBCDG8*ne*dFABCDGANSbZnpr3ELTANPbELRkAWef0vy1Uefh*Y6olYXaswQnprXYswDANPdvy7qQZc*KKUWfUWeho3ANUWefUWef*Z7UWe*Do*IiELoANPANPS*n+QZpl*OPg3QZnrdUWeQZnp*H2XYaQZnp*ghQZny7Vc*gTXYaQZnpv7VcPUWeQVvyQV0vQZnpRgoAQZnpQZnpUWefvyVc"
 };
 
 export const p1_35_weather = {
@@ -2597,7 +2699,10 @@ export const p1_35_weather = {
     ["forecast says", "预测说", "yù cè shuō", "el pronóstico dice", "previsão diz"],
     ["light drizzle", "小雨", "xiǎo yǔ", "llovizna ligera", "garoa leve"],
     ["drizzle outside", "外面下毛毛雨", "wài miàn xià máo máo yǔ", "llovizna afuera", "garoa lá fora"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "*DB*fJ*DA*KV*KaMNOEGHJ*V2*LjE*kmDCGH*R6*YdG*isFCEHICEGHsACCEGH*LaDFR*mi*nZCE*E/*QN*Wl*Ws*Ez*ZU*dHB*bM*hxBMCEGHSXYc*dKDFKQXYcAuvI2dpZZhrz*HvabeQSYc*IiQSXhzr0Wbei*fsWaeQSXYUp2ZWabiQSXYQSXYZUrzWabeUWablIWakIWaWabeQSXY*a6QSX*fqUd2QSXY*YG*XnZh*XN*PPIAQSXYATvIATuIQSXYQSXYWabe2Zhr1QZh0QZhUzdp*ch47VV37ZSZhrZhrzV34Z"
 };
 
 export const p1_36_prepositions__of__place = {
@@ -2671,7 +2776,10 @@ export const p1_36_prepositions__of__place = {
     ["outside the box", "框外", "kuāng wài", "fuera de la caja", "fora da caixa"],
     ["alongside me", "在我身边", "zài wǒ shēn biān", "junto a mí", "ao meu lado"],
     ["alongside each other", "并肩而行", "bìng jiān ér xíng", "uno al lado del otro", "lado a lado"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "*C1*Es*E9*MS*C1A*pY*A8*C1*MS*P+*C0*AO*QI*Q4*A9HINa*NI*P8*AD*Uo*MU*pZ*paA*nY*DFEI*i6EHNMPQWoSVf*h6*QD*XiqJPQW*Jo*Tx*U6*bY*LT9*kkAJMQW*XqJMP*h83*meL4KVf6*Y8dj*FAVg*AWU*AW*QU*TX*h+JMP*DW*Y8*lnL*C6*cIbL*MtLRU*QPEHI*Q8*cI*ln*Lfdilqc*RU*XE*KZ*ADEHI*Ta*S7KSh*FAU*OFg*AW*TXV*sHclqTdkol*A2*FKTkciq5n0p0mz5KTdjm5n0LcilqLTdMKSVcilq*MuN*lmL*QWcil*OL*Yvx*G2*OLw*G2Lcilq6n0T*eSnmzTdjkRTdjRcilS3Tdmn0pTzn0pm5n"
 };
 
 export const p1_37_prepositions__of__time__other = {
@@ -2745,7 +2853,10 @@ export const p1_37_prepositions__of__time__other = {
     ["regarding your request", "关于您的要求", "guān yú nín de yāo qiú", "con respecto a su solicitud", "em relação ao seu pedido"],
     ["concerning the issue", "关于这个问题", "guān yú zhè ge wèn tí", "sobre la cuestión", "sobre o assunto"],
     ["concerning this matter", "关于此事", "guān yú cǐ shì", "sobre este asunto", "sobre este assunto"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "*Jk*QM*RE*Sy*gG*hC*sI*A/IADFGOQB*R+HNX*D6*Vr*adAODQBiENXCADF*MhaDA*Iv*g/pA*R+ETZ*hF*Hys*meEHXbG*hKDQBRDGDGOBBPDGYi03*nV*muLZjknocdmt*Mk*Vu*sZ*RNEHNb*Y6Si0*SbLTeJ*URDA*sJEHNVdmtVcmtLTZfLTZe*GM*TG*QoGEHNXHSY0UknoUjnoIEHNVcdtUjkoUjknKsxyru64uq65MpxyVcdmrq65NLTZUjknpsyzpsxzpsxySYi3*nUUjkAFJK*l5*liSYSUjk76ru7ruq65ru"
 };
 
 export const p1_38_time__expressions = {
@@ -2819,7 +2930,10 @@ export const p1_38_time__expressions = {
     ["presently working", "目前正在工作", "mù qián zhèng zài gōng zuò", "actualmente trabajando", "atualmente trabalhando"],
     ["formerly known", "以前已知", "yǐ qián yǐ zhī", "anteriormente conocido", "anteriormente conhecido"],
     ["formerly called", "以前称为", "yǐ qián chēng wéi", "anteriormente llamado", "anteriormente chamado"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "*OH*Yj*Yp*bR*dF*DHIF*KaIOABFGH*EfcdSBHKCgJMPBFKC*ok*SxBC*QV*ZhGMBFHC*Q4ACIGJPVSQTU*g8*C8*sFC*MfGJMNTUYZafhN*ka*j3E*DGNQUNQTY*Rg*sZGJblmnBGJM*GqNQTRafhRZfhWlmndEp1cEp1*Vv*OMES*EMRZahGESgGRZNQTUuv6cGJMPWbmn*RTnWb*RTmWb*Tb*XX*Ri*Tlcd1W*o7GJMNQTUtWblsWbljv6cju6cESegWblmPRZa*DX*sA237juvQcdpz350z250*soz23z230juvc0juv"
 };
 
 export const p1_39_negatives__limits = {
@@ -2893,7 +3007,10 @@ export const p1_39_negatives__limits = {
     ["please refrain", "请不要", "qǐng bú yào", "por favor absténgase", "por favor evite"],
     ["deprive of", "剥夺", "bō duó", "privar de", "privar de"],
     ["deprive sleep", "剥夺睡眠", "bō duó shuì mián", "privar de sueño", "privar o sono"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "BE*izDEAH*nmKOfkABEFBAH*iz*rOfABJQLNiBEA*Lc*qN*Ygk*Lg*HnGQpCOfABDEstYz*Hx*PA*YZ*fFCKfky*lxRSGJLNPSTgPRTg*U26PRabdpAelqX7MYW7MYCMz1wjxcbUdpaUdpost3UabpfFVlFCKO*MfPRSPRSTHPRSxZwclICKk*MfIV*bDJAB*CyCKOcst3KUabVelvUabdMtcoMscoUabd*b7VelZjxcjZwcP*i+VeMY12*TW*RV*bJ*AlMYz2MYz1costMYz1costT*t2VeWXMY"
 };
 
 export const p1_40_basic__transportation = {
@@ -2967,7 +3084,10 @@ export const p1_40_basic__transportation = {
     ["cab fare", "出租车费", "chū zū chē fèi", "tarifa de taxi", "tarifa de táxi"],
     ["electric scooter", "电动滑板车", "diàn dòng huá bǎn chē", "scooter eléctrico", "patinete elétrico"],
     ["scooter ride", "骑踏板车", "qí tà bǎn chē", "paseo en scooter", "passeio de scooter"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "*LT*PA*bN*hC*Uo*MU*ZgA*Lj*f7QWFGIRJLMN*XoDGI*fBDFIeg2C*TzDFGELMNoOab*lzEJMEJLN*GcEJLNKabEJLMCWDFDFGI*PA*bNABEJLMfhl3EJLMCQDFEJLM2*LjCEcmosbKOkaKOk*XDZmo7Zci*LEFHgUhl3GHe2Ufl3jnrKinrKKOabUfh3*gSZcoJijrKZcmKtuvwptuLijnZcmopuvZxptvptuZqptuu6qwZcmox6qwQEJLKOabYRHeUfhlUfhlEJLMxqwpdZci"
 };
 
 export const p1_41_common__nouns = {
@@ -3041,7 +3161,10 @@ export const p1_41_common__nouns = {
     ["one moment", "一会儿", "yī huì er", "un momento", "um momento"],
     ["current situation", "现状", "xiàn zhuàng", "situación actual", "situação atual"],
     ["difficult situation", "困难的处境", "kùn nán de chǔ jìng", "situación difícil", "situação difícil"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "*R9BFIAFIKZDPS*HlCPS*Hx*Jc*PA*j1ABIK*Q+*ZZ*okH*hPGLN*bbABF*Is*Jc*OG*QA*PD*mjAB*Ki*TCGHEJGH*RH*T7*eJGABFI*JlCDS*GlhjkABFICDPd*kvUWXV*SlTW*sGZfg*Z9TUXTUWiZabeCVfgYber*DVYaey4YafCDP*ZGYabdVZg*CyVZfQjkC*Qh*Y6TUQhkCIQhj*flw02n*Gv*Y9Cm*GvCDlw02TUWXVZfg*QSYabCDPS*ZqVZfVZfgTUWXl02cTUWXc4Ya*EAPTUlw2c*GlQYalw0cTUWXcyYaSTUW*nGo7l6olw"
 };
 
 export const p1_42_more__common__nouns = {
@@ -3115,7 +3238,10 @@ export const p1_42_more__common__nouns = {
     ["concern for", "关心", "guān xīn", "preocupación por", "preocupação com"],
     ["in detail", "详细", "xiáng xì", "en detalle", "em detalhes"],
     ["more detail", "更多细节", "gèng duō xì jié", "más detalle", "mais detalhes"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "*EBJSW*ngCEH*Vy*Wn*Yq*fG*UsNBC*LR*YcBCGLQb*gD9FL*lqBCE*P/BCEASWdBCEHFGQb*Q+BCE*QP*Yh*Yp*sE*ZYUhpBCEHFGLb*DH*KU*KV*PN*tNAJW6RXcVAOhUmnr*rUAJS*GsBRTafkugl0OYfkuFGLQdERTcAJSiqVmYakuZl0OOUpsqVemAJSWYafuZg0OVnr4Vmr4AJSWOUhsiVemVmn4OUhpOUhpYafkFGLQxeiqweiq*DOYafPRTXZglOYafkRYafOUhpVmnr*iDSOUTYafOUhp"
 };
 
 export const p1_43_places__in__town = {
@@ -3189,7 +3315,10 @@ export const p1_43_places__in__town = {
     ["information kiosk", "信息亭", "xìn xī tíng", "quiosco de información", "quiosque de informações"],
     ["video arcade", "视频街机", "shì pín jiē jī", "sala de videojuegos", "fliperama"],
     ["arcade games", "街机游戏", "jiē jī yóu xì", "juegos arcade", "jogos de arcade"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "*U7*g7*DFC*Xv*gD*miP*TAADI*Lg*j1ACGHFK*rB*qcKO*fJ*DuEHEGFK*Ht*mdAC*T9*Vk*Ye*cXFOTBrNVXdhwxLVXY*jpFKTBQSABPSA*bo*NlUaBPQAFKOB*V5*ViRaLNXYgmnMLNVYLNVXLNVXRUelLNVXfiprMhwxFRUaciprWmnMMdwxcfprqtsuEGHRRUae*fj1WgWgmMLNVXcfirLjtsLcfiMv25MjqsNcfis25jMdhxMdhw*NxRUaMdhwRUaem*fjcfsv5jRcfiRUaesv2jMdhwMdhw"
 };
 
 export const p1_44_casual__informal__english = {
@@ -3263,7 +3392,10 @@ export const p1_44_casual__informal__english = {
     ["sketchy place", "可疑的地方", "kě yí de dì fāng", "lugar sospechoso", "lugar suspeito"],
     ["seems legit", "看起来靠谱", "kàn qǐ lái kào pǔ", "parece legítimo", "parece legítimo"],
     ["totally legit", "完全靠谱", "wán quán kào pǔ", "totalmente legítimo", "totalmente legítimo"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {"20": "211", "21": "121", "22": "1211", "23": "1211", "24": "2111", "25": "211"},
+  distractors: "*JoCDH*ANACD*LUADH*eJACHOSWeGJKLFJKLACDIACDHFGKLFGJLFGJKFGJKFGJK*Gy*Hv*HuEFGJK*Q+*ZZ*i0*lmACDHEOWeFGJK*p2Aa0OYZbEOSec457VZbh*pw*AqVYDU02VYZhX457Efg6FEOSdg6Vdf6VVYZb*KuEOS/Xc4EOSWEOSWnVYZ*jWqJEVYZbrz3E*Q3nLEpz3EVYZb*HHVYZVYZbVYZb*HUxXcwXcdVYZbpr3E*ZZQUa*Gd*DMVY*msRUaprzEXc57Xc47dfgVXc45"
 };
 
 export const p1_45_filler__words__reactions = {
@@ -3337,7 +3469,10 @@ export const p1_45_filler__words__reactions = {
     ["frankly speaking", "坦白说", "tǎn bái shuō", "francamente hablando", "falando francamente"],
     ["truly amazing", "真是太棒了", "zhēn shì tài bàng le", "realmente asombroso", "realmente incrível"],
     ["truly sorry", "真的很抱歉", "zhēn de hěn bào qiàn", "realmente lo siento", "realmente sinto muito"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {"21": "211", "37": "21111", "40": "211", "43": "211"},
+  distractors: "*E5*PC*SE*UqWDEFUrBDFBEPRBDFDeBE*E7kHL*OH*Yp*bR*is*g1JKH*MU*g6IK*Es*MU*P+*g6*MQHM*E7JHL*E7SnsCwQj7*qTBDE01OjEBDFNnsC*E7GVk*M0CrBo*E6*E5*E7BepuWYab2Xabwy13bz5X*o3az52XYafqvxFWpudqvx*ot*AqBD*HSBDE*TTtBDOQ7B*E7GHL*SQVmo*oo*oUVl*qVNSsV*E7lmWeu0*ZX*ZudfCUBDNSnCiBDEWep0dfqxOZy1OdfqPZw1ab5X1QWe0QZwYXabRZwyWepuabzXWepuOQjB"
 };
 
 export const p1_156_question__patterns = {
@@ -3411,7 +3546,10 @@ export const p1_156_question__patterns = {
     ["deliberate over", "深思熟虑", "shēn sī shú lǜ", "deliberado sobre", "deliberar sobre"],
     ["inquire about", "询问关于", "xún wèn guān yú", "preguntar sobre", "pergunte sobre"],
     ["inquire within", "内部询问", "nèi bù xún wèn", "preguntar dentro", "pergunte dentro"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "Fnrz*Jn*jw*eG*g9EGIKQJLBCGIKAnrz*KfhCE*pfReoCEGKLBDNTCEGJBDNCEGI*HlBP1xCEG*WnzBN*PI*bUDJHeoq4YltKCEGAZbgcfm7BXhxBWhxCSlt*ax*bHUbCEGI*IkUZgVfm75VcfFHRoVcm7UZbkG*K+WXH2djH3i2lUZbISYtVcf7AFrzHReq6UZbHReoAFnzHReoMSYlUZbgSYltxUZbOWXhHReoPAFn*a9WXh*nd*K0QB3Rid2RjiS5UZ4SdVpUZbVcfm"
 };
 
 export const p1_157_response__patterns = {
@@ -3485,7 +3623,10 @@ export const p1_157_response__patterns = {
     ["answer to", "回答", "huí dá", "responder a", "responda a"],
     ["voice opinion", "声音意见", "shēng yīn yì jiàn", "opinión de voz", "opinião de voz"],
     ["voice concern", "声音关心", "shēng yīn guān xīn", "preocupación de voz", "preocupação com a voz"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "QV5CPTFGZXl0abYcJKLOBHPT*jtIMR*is8*sI*AOGMRSEKLOEJLOEJKO*RI*my*mdGZfgmEJKLBTFGA0EJGIMS5GIMBPFGnwDY0AekBEJK*W3Cl0DcjrCNfgDhopDau1DYjrtz67Vk3CNZgmNZfmaopqEJKLDYcrVe3CICX0NZfgUwDYahpqabhosvDYDYcjqvDYdz67b1pxNqsDUnDYbu1pPEJKdt67VQACbupxNZfgVekCDYcjSACEdtz7*nUdtz"
 };
 
 export const p1_158_negative__patterns = {
@@ -3559,7 +3700,10 @@ export const p1_158_negative__patterns = {
     ["invalid argument", "无效参数", "wú xiào cān shù", "argumento no válido", "argumento inválido"],
     ["totally inapplicable", "完全不适用", "wán quán bù shì yòng", "totalmente inaplicable", "totalmente inaplicável"],
     ["inapplicable here", "此处不适用", "cǐ chù bù shì yòng", "inaplicable aquí", "inaplicável aqui"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "*QP*Yh*is*mp*i6VdA*l1*lgDF*hW*OFbC*hx*is*rPA*iL*UcCD*RECDFjCDFlKXYPTZeIXYaJPTZtORWQbHMMRWcJTZe*PR1*PtNMOWcCDFG7JPZ*GwCDF*iG*RN*jBdMORcIKYaIKXa*ZKJPTIKXYDNQH*Di*DBMOVBCDJPTZhz34GMORfz34lxLpHMOR*jknrmIixL6qy0krmoknrmKvw5Lmy0knmo27fhMJPTfhmqpw5iOpv5OilLmq06Pfh34mqyQIKXs7fhfhz4fhz3pvwimqy0Ts2f"
 };
 
 export const p1_159_agreement__disagreement = {
@@ -3633,5 +3777,8 @@ export const p1_159_agreement__disagreement = {
     ["dissent from", "反对", "fǎn duì", "desacuerdo con", "dissidência de"],
     ["give assent", "同意", "tóng yì", "dar su consentimiento", "dar consentimento"],
     ["assent to", "同意", "tóng yì", "asentimiento a", "consentimento para"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "DGpuWmy0JLRSAGpu*rXFIKeEIKgADpPQEFEFKMmCLRoEFICJRS*GqEFIv*muEF*eFEFIHQEFHPEF2CJL*eNTCJ*FxS*Ut7AVYZAYdrBcjnbahZVdrt1UhVbhXZXahZWjnxVYrtFo7BilqVGks4Za1U*XbflqWcnxgs4WfiqVJBy0WcjxKe7BADGufilVVYdtgk4WVYdrADGpNCJL*ZxADGWcjnBm02VYdrBmy2ZUhVR*kiBmVYdrgksWWcjnADGpTeoB"
 };
@@ -81,7 +81,10 @@ export const p2_46_directions = {
     ["easy to navigate", "易于导航", "yì yú dǎo háng", "fácil de orientarse", "fácil de se orientar"],
     ["take a detour", "绕道走", "rào dào zǒu", "tomar un desvío", "faça um desvio"],
     ["road detour", "绕行道路", "rào xíng dào lù", "desvío del camino", "desvio de estrada"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "*Ya*eRFGDEJPYMRSBEJPBDJPAGLB*OI*eRAF*Jl*Na*C6*HjHKTeBDEPoHITAFGBCRSU*cTVWa*D/*EvAF*CFBDE*RK0ipCMSUCMRUHIKeCMRSNWabNVabYl7NCXl7s3Qic*Ju*QgNdNVWa*QgNVbNVWg*NKFH*NgNVWe*MQ*S3GCMRS*H6Qptk4uvj4uvXY7Nx6QXNVWaKCMRQit2LHIKwCHItZ3QsMQivz5Zuz5ZrCHIm6QX*OQNVWuv5ZQ1jk0QjkRQipZsQijkuvuvzZmxQXXYlN"
 };
 
 export const p2_47_more__transportation = {
@@ -155,7 +158,10 @@ export const p2_47_more__transportation = {
     ["railway track", "铁路轨道", "tiě lù guǐ dào", "vía férrea", "via férrea"],
     ["highway overpass", "高速公路立交桥", "gāo sù gōng lù lì jiāo qiáo", "paso elevado de la autopista", "viaduto rodoviário"],
     ["overpass above", "上面的立交桥", "shàng miàn de lì jiāo qiáo", "viaducto elevado", "viaduto elevado"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "IJNBCOAFBOAF*DD*RFLFGeloMQRBEelo*dNKPS*C3*RIAJAINBHPSb*eNDFMFQRB*MS*CA*KVABCAFHKSbFMRB*MT*NIFMHKPbYarsV7Wg4U7WipwxfvEG*M6Tarjyz0TYrsHKPSE6dgmc6gEGloXvEGGhknGgkn*AXWpwZyz0ghn4EGeodc6gghk4KEGeWiwxEGelTYasTYarHKPSEGelNXfEWipxWipwZjz0Zjy0Zjyz*YyZjyTYarTYarVghkWipwcdghUVWg"
 };
 
 export const p2_48_furniture = {
@@ -229,7 +235,10 @@ export const p2_48_furniture = {
     ["comfortable armchair", "舒适的扶手椅", "shū shì de fú shǒu yǐ", "sillón cómodo", "poltrona confortável"],
     ["lazy recliner", "懒人躺椅", "lǎn rén tǎng yǐ", "sillón reclinable muy cómodo", "poltrona reclinável"],
     ["recliner chair", "躺椅", "tǎng yǐ", "silla reclinable", "cadeira reclinável"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "BFHNAFHNEGAB*YhCEGCGAB*QE*WmABCEABABFN*BJJKL*UoIKL*HgIJL*BK*WoIJ*JpPad*AP*XkABiXghMadISTVYABFHQTVYQSVYWcfpQSTYUcfpOghkQSTVQSTVMPdIQSTVUWfpMPaInqrvUWcpVOXh*EjOXgQSTViXghIOXgmt6Ult6UeqrvKOXgUWcfenrvenqvUWcflm6UOXghenqrOxz7Owz7wxz4wx7lQUWcQUWcQSTVOXghywxz4ywxTlmtwxzl"
 };
 
 export const p2_49_kitchen__items = {
@@ -303,7 +312,10 @@ export const p2_49_kitchen__items = {
     ["electric kettle", "电热水壶", "diàn rè shuǐ hú", "hervidor eléctrico", "chaleira elétrica"],
     ["wire whisk", "钢丝搅拌器", "gāng sī jiǎo bàn qì", "batidor de alambre", "batedor de arame"],
     ["whisk together", "搅拌在一起", "jiǎo bàn zài yì qǐ", "batir juntos", "misture"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "HJKNFILAZbjl*BESxAfnsuBILA*AHQRDAJKN*FpBFLAHKNAHJN*LcBFIOPBF*MOAHJMPBF*A/*OO*RF*Wh*T0GRDGQDSDxAGAHJKVXmqUXmq*LJhikUVmqCZg0CYg0eoCWCjl2dE17cE17aoCWEnsu05cdGWikWhkpeCblWhipCbj2UVXqEfsuaeCWWhikUVXmWhikEfnuUVXmvEfnuWhiWhikDSAGEfnsUVXmg5cdcd7CCbjlCbjlSEfng0cdEfns*Fjcd1"
 };
 
 export const p2_50_bathroom__items = {
@@ -377,7 +389,10 @@ export const p2_50_bathroom__items = {
     ["plunger use", "柱塞使用", "zhù sāi shǐ yòng", "uso del desatascador", "uso do desentupidor"],
     ["laundry hamper", "洗衣篮", "xǐ yī lán", "cesto de ropa sucia", "cesto de roupa suja"],
     ["dirty hamper", "脏篮子", "zàng lán zi", "cesto sucio", "cesto sujo"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "OBGH*MN*gJ*NL*YlEQSyMOFICQSyILNA*h4ABH*F2*h1ABFLNAnKXcJXckFINADOFIFILA*IdDMF*AO*TtDMCESy*HyABG*KbCEQABGHgpdnhiqtBaefJKckZj3VYj3VWefl*TxszCEJKXn046fWale*TxWaUpdnViqtVhqtYZ3VJKXcWaefoUgpJd04mUgpKUgdVhitJKXcbzCE*FdVhiWaefJKXcWaefWaefCEQSbsCEdn46QJKXJKXcYZjVVdn0SJKXdn04Vhiq"
 };
 
 export const p2_51_household__chores = {
@@ -451,7 +466,10 @@ export const p2_51_household__chores = {
     ["flower arrange", "插花", "chā huā", "arreglo floral", "arranjo de flores"],
     ["discard old items", "丢弃旧物品", "diū qì jiù wù pǐn", "descartar artículos viejos", "descartar itens antigos"],
     ["discard properly", "正确丢弃", "zhèng què diū qì", "descartar adecuadamente", "descarte corretamente"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "*Uu*Yi*bTF*UyDAFHPRb*AOBAFIMWnAGJKAFJKCPRb*Jg*S+EMAFGKAFGJAFGJ*U7sEIAFGJ*WvAFGCHRbAFGJCHPbTZepSZepltuVakmoEIMngrsyjac3*g6CSTVkmoCHPRYj3467fYSTZpd67YXrsyi1UX*Pth1UYc34VamoUtuVVakoJEIM*gUVak*gISTZLEIMXgsyMXgrUluV*GoUlt*f+STZ*cOOEI*EdVakzXgryXgrSTZehiUXRSTZ*DvYcjYcj3Ycj3d7fYd6fY"
 };
 
 export const p2_52_more__food = {
@@ -525,7 +543,10 @@ export const p2_52_more__food = {
     ["turkey sandwich", "火鸡三明治", "huǒ jī sān míng zhì", "sándwich de pavo", "sanduíche de peru"],
     ["fresh seafood", "新鲜海鲜", "xīn xiān hǎi xiān", "mariscos frescos", "frutos do mar frescos"],
     ["seafood restaurant", "海鲜餐厅", "hǎi xiān cān tīng", "restaurante de mariscos", "restaurante de frutos do mar"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "*HuBCD*C8ACDDEHNCEHNCDHNVWuxM*NaIKCDEN*Zk*BBGKRTFGNGILGIKMG*Kl*XoICDEHCDEH*IsGIKGIKL*OWJTFGIKLJRFGXbcdFWuxFVuxUbcdaehkgisvYehkUXcdUXbdUXbcFYahrzZgZisvYaekZgsvUXbcYaeh25foJUXbYaehl25fUXbcYaehfzZgZgivYaehFVWxZgis1YaeFVWuYaehfrZgYaehwUXbl5foYaehYaehl2foZgisol25"
 };
 
 export const p2_53_fruits = {
@@ -599,7 +620,10 @@ export const p2_53_fruits = {
     ["berry smoothie", "浆果冰沙", "jiāng guǒ bīng shā", "batido de frutos rojos", "smoothie de frutas vermelhas"],
     ["ripe avocado", "成熟的鳄梨", "chéng shú de è lí", "aguacate maduro", "abacate maduro"],
     ["avocado toast", "鳄梨吐司", "è lí tǔ sī", "tostada de aguacate", "torrada de abacate"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "*TwJKO*OJFGHZDRXCRXg*FaMNeBGHP*MV*YgBFBFGPS*YdBF*HpKOQJOQATVIUENelvEMeJKQABFGHJKOACDXgBFGHLVIUWmn0*Mg*T9LTUmn0CDRgusCaCvf5DYbtDzYadsu2csu2EMNlZ5cdCDRXv7ZfoCDRpCDRq6CDIEMNUWn0UWm0wiEMjEMNrk6CqLCDucd2Yab3sYcdNZh7oEMNEMNeCDRXCDRXUWmnUWmnRcdsRXYaCDRXZfcdkqCDhvZf"
 };
 
 export const p2_54_vegetables = {
@@ -673,7 +697,10 @@ export const p2_54_vegetables = {
     ["onion ring", "洋葱圈", "yáng cōng quān", "aro de cebolla", "anel de cebola"],
     ["fresh garlic", "新鲜大蒜", "xīn xiān dà suàn", "ajo fresco", "alho fresco"],
     ["garlic bread", "大蒜面包", "dà suàn miàn bāo", "pan de ajo", "pão de alho"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "*Ld*CC*Yd*hDCFKLBFKL*VmEOJDOJSBCKLHRnwGRnwAPQT*NJ*OO*GtDBCFLBCFKjkz6acxy*Fo+DEAIQTAIPTGHnwADEIAIPQVdil*L/UdiXpZbWpZboqt0CbefNcxyZefgmNaxUVilFZbfFZbeZbefZbefHUVdMkz6Mjz6UVdicBCFGHRwYqt0WXZbYot0uYoqruYoMYoqrYoqWXYoGHRnNacyPNacMjk6YoqtUVdi3RUV2ZbeBCFKNacxMjkzMjkz"
 };
 
 export const p2_55_more__clothing = {
@@ -747,7 +774,10 @@ export const p2_55_more__clothing = {
     ["collar button", "领扣", "lǐng kòu", "botón del cuello", "botão de colarinho"],
     ["soft fabric", "柔软面料", "róu ruǎn miàn liào", "tela suave", "tecido macio"],
     ["cotton fabric", "棉织物", "mián zhī wù", "tejido de algodón", "tecido de algodão"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "CBDK*D+ACD*HuABDKACELMNQIJWEOPXFbopsFJWE*adFIWDACE*T0*U3EM*NL*E6ELELMQGPXFGOXF*F3ELMELMN*VkELMELMNcelxZqu1FIJEGOPFafkrVqu1YfkrHopsdUelchmnUclxYakr*PhjiwdmnvwzdggiwyYafrUcexdhnvdhmvpHbsoHbsVZu1YafkMHboYafkVZq1dhmnizdgOUcegjiwiwdgYafkVZquVZquUcelYafkUcelVZqu6Uce"
 };
 
 export const p2_56_jobs__1 = {
@@ -821,7 +851,10 @@ export const p2_56_jobs__1 = {
     ["pharmacist advice", "药剂师建议", "yào jì shī jiàn yì", "consejo farmacéutico", "aconselhamento farmacêutico"],
     ["school librarian", "学校图书馆员", "xué xiào tú shū guǎn yuán", "bibliotecario escolar", "bibliotecária escolar"],
     ["librarian desk", "图书管理员办公桌", "tú shū guǎn lǐ yuán bàn gōng zhuō", "escritorio de bibliotecario", "mesa do bibliotecário"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "8DHIADGHFhyA*PKAHIOgzCChyAPBAD9*Zi*eGA*S+*E0*UpAVw0L*KdMTWrSUaKTWb*AH*NaADEgzCGBAD*NSADH*Kk*CEADLUauKMWbLSauJw0L*AaKMT*Bmf1Jdjkls46cLSUuDKMTmnx3YjkliYZdX1JV*WiEOzCFyA*THeYZYdklYdjlYdjkJcnxJcmxcmnpvoqcpvocLYdjZ46cMYdj*XtLSUpoqcOJV0cmn3CFhAEOgC*LIJVwXfJVLSUacmnxSZs6cmnxZs4cTYdj"
 };
 
 export const p2_57_jobs__2 = {
@@ -895,7 +928,10 @@ export const p2_57_jobs__2 = {
     ["tailor made", "量身定制", "liàng shēn dìng zhì", "hecho a medida", "feito sob medida"],
     ["local florist", "当地花店", "dāng dì huā diàn", "florista local", "florista local"],
     ["florist shop", "花店", "huā diàn", "floristería", "floricultura"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "PQBS*Jf*BJ*MS*XnKfivFNEHIVzDDNEHOUXe*ECJRT*CCEVzHRTBCfivM015tL01DFEHwxGUAQBS*JpAPB*F0HJTBAHJ*MQHJRGOXeEIzDadhbGOUegZpqCpqsWdhbkuWaoZbkWahbFGOUFCKiYZpqGWad*KMCKfGOUXbuWarwxWnty4mty4KcZbKZqs*XxZpsLlwxZpqYMmnybkWaNCKfxOlrwOlrmnt4EIVD*KMLM1*DKLM00CKfGOUXmntyLM01CKfiGOUX"
 };
 
 export const p2_58_more__animals = {
@@ -969,7 +1005,10 @@ export const p2_58_more__animals = {
     ["octopus arm", "章鱼臂", "zhāng yú bì", "brazo de pulpo", "braço de polvo"],
     ["king crab", "帝王蟹", "dì wáng xiè", "cangrejo real", "caranguejo-rei"],
     ["crab legs", "蟹腿", "xiè tuǐ", "patas de cangrejo", "pernas de caranguejo"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "HJLBCFRT*P8BFRMPBCQWXYBCRT*YoNOa*eHAJLKStEAHLBIStEAHJB*Vp*C/DP*Hg*h0GOGNab*WlDMBEWXYBCFTIKtEBCFRWegidhlnEQXYEQWYEQWXEQWXGNObGNOaE14VEVhlUgiqEQWXGUeiVdlnUegqmvz5ou0cVdhnjvz5Vdhlu0c1Vdhl*WuUegEQWXEQWXIKSE0co1*H1jmzVdhlOUegEQWXjmv5uco1Qc4VUegiEQWXc1VdSjmvEQWXEQWX"
 };
 
 export const p2_59_nature = {
@@ -1043,7 +1082,10 @@ export const p2_59_nature = {
     ["earth quake", "地震", "dì zhèn", "terremoto", "terremoto"],
     ["solid ground", "坚实的基础", "jiān shí de jī chǔ", "tierra firme", "terreno sólido"],
     ["ground floor", "一楼", "yī lóu", "planta baja", "térreo"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "DHNO*DxEKL*DBGIJ*YZAHN*Ag*S3*KnBab2U*BJCIJ*BNADNCGJS*Gq*YgCGO8BE*LRBEK*VnBEKADHO8*eAAD*SyADHADHN*gCADHCGIJBEKL*G5iuyYcdmopneBghjVcdmfst4Fb2UFa2UVYdmVYcmFv1ZFZst*PwXhjXgjkUuyz*NiXghXghjXghjVYcdeopvpWneoWneLXghVYcdZft4Zfs4*BUUiye1ZfXghjVYcdUiuzUiuyVYcdevZfFabUXghjZfstVYcdZfstZfst"
 };
 
 export const p2_60_geography = {
@@ -1117,7 +1159,10 @@ export const p2_60_geography = {
     ["border crossing", "过境", "guò jìng", "cruce fronterizo", "passagem de fronteira"],
     ["rough terrain", "地形崎岖", "dì xíng qí qū", "terreno accidentado", "terreno acidentado"],
     ["mountain terrain", "山地地形", "shān dì dì xíng", "terreno de montaña", "terreno montanhoso"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "*BN*Ma*eAE*HpNAE*UoDFJ*PM*WvCF*WoAGKCDJLAEKM*ehiOQPSCDCDFLAEGMCDFJAEGKBAEG*TCxHQISCD*ELHOVTUWd*AH*Fu*Jl*bYRUWdRTWdHOQYRTUdgprt*AfHOQ*ByHOQ*MvHOQHOQVHOQVRTUWozHOHOQVXprtilx6HhlxH4hiqy3ehix6HOQVHOQVezHOXgrtky3eXgptHOQVXgprRTUWRTUW25j4Ohilkq3eeoHO17w207w2w5j4kqyejhilw2j4hilxw25j"
 };
 
 export const p2_61_school__education = {
@@ -1191,7 +1236,10 @@ export const p2_61_school__education = {
     ["lecture hall", "报告厅", "bào gào tīng", "sala de conferencias", "sala de aula"],
     ["lunch recess", "午餐休息", "wǔ cān xiū xī", "recreo del almuerzo", "intervalo de almoço"],
     ["recess time", "课间休息时间", "kè jiān xiū xī shí jiān", "tiempo de recreo", "hora do recreio"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "acekGSoCLMObEFIK*AG*eRDF*GlIPDBSoC*GrJTBFPDEHTBF*DD*HpDECMObCLObuQRWCLMbFIDE01NRNQWf*F5BGoHJBFVYqsUYqsBNQRdimpUVqsCwzXAcekCLMO*hbAaeXimpAackNQRWhruxgruxXdmpNQRWAaceNQRWXdipNQRWBGSCXdimUVYsghuxUVYq3UVYNghr2t3UOZzXghruAaceZwXdQghrQghrvt3URtUVXdimXdimXdimNQRW"
 };
 
 export const p2_62_sports = {
@@ -1265,7 +1313,10 @@ export const p2_62_sports = {
     ["champion team", "冠军队", "guàn jūn duì", "equipo campeón", "time campeão"],
     ["good assist", "很好的帮助", "hěn hǎo de bāng zhù", "buena asistencia", "boa assistência"],
     ["assist record", "协助记录", "xié zhù jì lù", "registro de asistencia", "registro de assistência"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "EKRTDFHPDUVcvCBFAKRTeBDHgQABBDFPJNOLNOIL*Jb*C+AEMAEJ*NL*WvLA*T2JOIJNILBDFHGABD*LbAEKBDFHAEKRCVceCUceZjYpBafhaCpZCjWYYDXfDd01CUVeb012F*QYCUFXahGuxBXaf5*WIly4ZWYpCUVciy4XCUVcoCUVnCUVYZijBDFHCUVcCUVc*FOCUVgxBCDBFHBDFHguBCil4XWZjYbd12bd02bd01CUVc*Qqily*QJSXaCUVcXafh"
 };
 
 export const p2_63_more__sports = {
@@ -1339,7 +1390,10 @@ export const p2_63_more__sports = {
     ["playoffs game", "季后赛比赛", "jì hòu sài bǐ sài", "juego de playoffs", "jogo dos playoffs"],
     ["relay race", "接力赛", "jiē lì sài", "carrera de relevos", "corrida de revezamento"],
     ["relay team", "接力队", "jiē lì duì", "equipo de relevos", "equipe de revezamento"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {"40": "411", "41": "411"},
+  distractors: "*LSHOIXLVe*R9DEQCEQiFcCDEGJKgFJKAOIM*B9MTAFGKP*XcFGJqBVeITAC*P5*PSvdAHIMFGJK*B4CDESUcxRUcxIMACRScxBLepBnorBq14CgjkbfhwmuvW*PqZfhERSUN25XFBLVZbhwGYjkZbfwHCDEYgkl*Aa*Ac*WiYYgjkauvWWorvrzWX*XcKBLLX14LozWYgjkYgjk*P4NavNWnu*PvZbfRSUcZbfhorWXBLVeXq4NRNd5RZbfXq1NSNd2YgjkYgjk"
 };
 
 export const p2_64_entertainment = {
@@ -1413,7 +1467,10 @@ export const p2_64_entertainment = {
     ["during intermission", "中场休息期间", "zhōng chǎng xiū xī qī jiān", "durante el intermedio", "durante o intervalo"],
     ["early screening", "提前放映", "tí qián fàng yìng", "detección temprana", "rastreio precoce"],
     ["film screening", "电影放映", "diàn yǐng fàng yìng", "proyección de película", "exibição de filme"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "CEHIDACEAEHIBACEACHI*ZhWbhNBDAACEIACEH*bfZcdACEHUes1ACEH*A/*DDG*Tt*HoTVgyakFACEH*Vr*PMuA*AQXLU*XlOVgLes1OTgpFbhiSLUYfjx7JcdlPkFOFWhiJZdlJZclLUs1Yjx7OTVpFWbiHFWbYfx7PaFOJZcdJrwzJ6YfJZcdOTVgrLmwLq2mLUe1*VGMFWRACEFWbhmrznOYfjPJZcmrwn*PqJZcLUesr4q5JZcdS2q54S2q7nYf6TYf"
 };
 
 export const p2_65_more__emotions = {
@@ -1487,7 +1544,10 @@ export const p2_65_more__emotions = {
     ["nostalgic for", "怀念", "huái niàn", "nostálgico por", "nostálgico por"],
     ["feel irritated", "感到恼火", "gǎn dào nǎo huǒ", "sentirse irritado", "me sinto irritado"],
     ["irritated by", "激怒了", "jī nù le", "irritado por", "irritado com"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "VhkxXWQVRadebFGHNOPlDGHJ*btDFHDFGJlDFG*P+nDFpLMSKMSTKLSTEOPlxENPENOl0BVc3Cad5KLM7KLM6VAXAUBQBZ0YBUYoC2UWCW0YCRdeDKLMEBQVECRafwCReCRaCRadG*btAkCRadCRadAhxCIENOCRadJ*P+KLKqstKCRawLos*dm1WZtMoqsMoqgNBQNBQVeqxOOAhkgPBQPCRaQWZYQWZ0RYUWRoqsSoqsSBQVUToqTCRa"
 };
 
 export const p2_66_personality = {
@@ -1561,7 +1621,10 @@ export const p2_66_personality = {
     ["confident in", "有信心", "yǒu xìn xīn", "confiado en", "confiante em"],
     ["stay humble", "保持谦虚", "bǎo chí qiān xū", "mantente humilde", "continue humilde"],
     ["humble beginnings", "出身卑微", "chū shēn bēi wēi", "humildes comienzos", "começo humilde"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {"37": "4111"},
+  distractors: "GPRCJNUy*MbAGPFLQAIKMZDLQAAPRC*Ag*MQOTkEKMBNUyEIMZDFQAs*cKEIBJUy*Jg*E0*C+HAGRCDFLAAGPC*NW5ab*YoHOYBJNyiow6BmzX*J6djnHOTDEIKMSbefSaeflrtuXjnpSabfSabe*dhEIKEIKMVow6XdnpISabcrtuJWzXXdjpKViw*KiXdjySabcltuMSabclruNclr7XdjVio6XdjnBJNUWmXc*UISab*f/Sab*clEIKSabeSXdjSclrViowvXdj"
 };
 
 export const p2_67_physical__appearance = {
@@ -1635,7 +1698,10 @@ export const p2_67_physical__appearance = {
     ["fair complexion", "肤色白皙", "fū sè bái xī", "tez clara", "pele clara"],
     ["good posture", "良好的姿势", "liáng hǎo de zī shì", "buena postura", "boa postura"],
     ["improve posture", "改善姿势", "gǎi shàn zī shì", "mejorar la postura", "melhorar a postura"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "*eO*fDCK*D/*RFEAAKBEFJMN*GkBAC*ELDJMSjkqLACI*In*DElPDFMN*PNACBHACIDFJNDFJMDFJMQ*ABIRP*ABIR*G5IPQ*aVGjkUYcdTYcdf6GSIPQRirDFTUcdDFJMDemnstuyTUYdTUYcFamnFV6GGvx5G4gvXrDFGSkqGSjqIDFJJaenJaemKIPQDFJMGSjkXiDFbtuybsuybstygx57Oaemgv57bstuh4gvGSjkGSjkGSjkaemn5Shg4SgvVfGSgvx5"
 };
 
 export const p2_68_shopping = {
@@ -1709,7 +1775,10 @@ export const p2_68_shopping = {
     ["clearance item", "清仓商品", "qīng cāng shāng pǐn", "artículo en liquidación", "item de liquidação"],
     ["retail price", "零售价", "líng shòu jià", "precio de venta al público", "preço de varejo"],
     ["retail store", "零售店", "líng shòu diàn", "tienda minorista", "loja de varejo"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "*NKFGBCopABopA*VsaSYJOWXAGBC*Es*YiAF*bcLMNUgEHEOWX*EtAFGrHMNHLNPHLMPEJWX*InHLM*LbHLM*g9HLMDYfs*E4*bX*XhHIgEHmvwzEJOXEJOWDSfsju12DdlqkxVmEit0Ealq*RlFHL0DSYIUEHEJOWct03Zu12bxVmadqyVvwzbkxVBCpABCoAadlyLEJOMDSYci03Zj12VmwzVmvzbkVmz*Y6ady*Y7VmfcitZju2Zju1cit05SVm4SVmcit0cit0"
 };
 
 export const p2_69_money__banking = {
@@ -1783,7 +1852,10 @@ export const p2_69_money__banking = {
     ["teller window", "柜员窗口", "guì yuán chuāng kǒu", "ventanilla del cajero", "janela do caixa"],
     ["savings account", "储蓄账户", "chǔ xù zhàng hù", "cuenta de ahorros", "conta poupança"],
     ["personal savings", "个人储蓄", "gè rén chǔ xù", "ahorros personales", "poupança pessoal"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "*IuDEHCGFQ*HjBGF*MYAEHADHS*LcRBCQBCF*RJ*ZVAD*UrMOTKLNX*ZfJLN*XfrJKIOT3JKLXIMT30VbdGABCFBCGADEHIMO3AWj0PbdrUj0JJKLNJKLNJKLN*I0ilmPVdrPVbdPVbrJKLNADEH*fHGADJKLNalmoHUW0*PinpqaimoailoJkpqpailo*KOKkLknpLPVbz6aiMPVbw7szailmu7szyuw7zxuwPs6aP*E/UW*gxknpPVbdIMOTPVbdknpqszaiuwsz"
 };
 
 export const p2_70_health = {
@@ -1857,7 +1929,10 @@ export const p2_70_health = {
     ["fatigue syndrome", "疲劳综合症", "pí láo zōng hé zhèng", "síndrome de fatiga", "síndrome da fadiga"],
     ["reduce swelling", "减少肿胀", "jiǎn shǎo zhǒng zhàng", "reducir la hinchazón", "reduzir o inchaço"],
     ["swelling down", "肿胀", "zhǒng zhàng", "hinchandose", "inchando"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "MOQS*DDILP*J4HTWGBEI*NMNRA*LfBIL*B9DBECTWg*NM*YcBLUVYepilvBIPDAOQSERADAMQS*E6*NL*PMBAMOSENADAMOQCHWgJVYeJUYeCHTgbcyzCJUVpjmnfkCHXcyzXbyz346hJUVYakCHCHTW0Kdi3HKl*Crn5ZafCHKivwotZpJj5ZKmtZKZjmJUVYCHTWJUVYmoZpJUVYKilwKilvKilvXbczXbcyhKdiKilvXbcyid46d36hjnZdd34hTKil"
 };
 
 export const p2_71_technology = {
@@ -1931,7 +2006,10 @@ export const p2_71_technology = {
     ["device settings", "设备设置", "shè bèi shè zhì", "configuración del dispositivo", "configurações do dispositivo"],
     ["computer network", "计算机网络", "jì suàn jī wǎng luò", "red informática", "rede de computadores"],
     ["network connection", "网络连接", "wǎng luò lián jiē", "conexión de red", "conexão de rede"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "*QGDGKHJSCFIBH*VvAGKLMNTCIBHADKQ*Gq*MV*Me*Yg*CFCFBBHSCADGQ*KVEMN*F0ELN*ZUELMCFIPOCFIADGKADGK*bVBHJELMNV6bo*K+U6bBXYeBWYeWXekacfgDZcf05UVZafgjtu3WXYkZacgGZaczGZaZacfdtu3WXYemnvzlnvzlmvzp24Uo24UZacfLsWXMrWXdju3vdjtlmnzADGKZacfWXYeGlmnb5UVQlmnop4Udjtuop2Ub0UVUVboop24"
 };
 
 export const p2_72_verbs__of__motion = {
@@ -2005,7 +2083,10 @@ export const p2_72_verbs__of__motion = {
     ["sprint to", "冲刺到", "chōng cì dào", "correr a", "correr para"],
     ["waddle around", "摇摇晃晃", "yáo yáo huàng huǎng", "contonearse", "andar por aí"],
     ["waddle like", "像摇摇晃晃地", "xiàng yáo yáo huàng huǎng dì", "contonearse como", "gingar como"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {"46": "11411"},
+  distractors: "BCDE*MPACD*AAABDABCE*WoABCHINOABCDFINO*Gq*MVFH*B7ABC*Es*UuABMQRSLchQFHIOFHINFHIN*TD*LW*B4LLQST*Zk5LQLQRSALQRbgklXaivWaivCLQRfouy*BxWXiVgklhdMLcELQ*Bxjqw*hDZouVbklcMLQWXav*Ed*Vbi*eIVbglVbgkVbgkVbgkZfuyVbgkejw6sejqrejqrsej*b5*fE*e8ZWXaiejq6WXaiZfouVbgk124702470147WXai0127SVbgejqw0124"
 };
 
 export const p2_73_verbs__of__change = {
@@ -2079,7 +2160,10 @@ export const p2_73_verbs__of__change = {
     ["gene mutate", "基因突变", "jī yīn tū biàn", "mutación del gen", "mutação genética"],
     ["transmute into", "转变为", "zhuǎn biàn wèi", "transmutar en", "transmutar em"],
     ["transmute matter", "转化物质", "zhuǎn huà wù zhì", "transmutar la materia", "transmutar matéria"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {"37": "4111", "47": "411"},
+  distractors: "*Xp*E8UB*VrAGHDJKNbCJKFUhjEfUhhABHjABG*iAkABCDKNCDJN*VuTbu*ExtAB*Q9uCD*eGPRAORAB*Fw*Yq*C51OPABABGHLbu2AEFhmvx3XVYZWVYZZcqwYcqw*a1d7eDLTuYZqwa7eggsYZFilnesYZGEFUjflnHEFUIEFUfinyVvx3Jfilpadroadr6LYZopadegYZMEFUN*Q9vLuVmxYZcqVmv3filnPCDJ1filQEFULTbu*ceVmvfilnfilnqTYZ6ade"
 };
 
 export const p2_74_communication__verbs = {
@@ -2153,7 +2237,10 @@ export const p2_74_communication__verbs = {
     ["well articulate", "善于表达", "shàn yú biǎo dá", "bien articulado", "bem articulado"],
     ["recount events", "重述事件", "chóng shù shì jiàn", "relatar eventos", "recontar eventos"],
     ["recount story", "重述故事", "chóng shù gù shì", "contar la historia", "recontar história"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {"23": "411"},
+  distractors: "BEGKAEGKYHLMaYFJcABGDJOcghABMNYAQRahmnDFABEGCHMNtHNY*IlvHMwDFJABEG0IRa2IQa*bdVjmABEGfoz6ASjmXbeidpr0CDHMCABEDYIQDWeiEDFJXpr0FWbiUoz6GDFJGgIQWbeySVmn5Ufo*Zu4x3nJSVmJSVUfz6Xdr0ABEGXdp0tMIQsMDFvNIQuNDFOSVj3l14WbeiUfo6QXdpkx35RXdpxl14lx31SkUfUfozWbei"
 };
 
 export const p2_75_mental__verbs = {
@@ -2227,7 +2314,10 @@ export const p2_75_mental__verbs = {
     ["perceive differently", "感知不同", "gǎn zhī bù tóng", "percibir de manera diferente", "perceber de forma diferente"],
     ["envision it", "想象一下", "xiǎng xiàng yī xià", "imagínalo", "imagine isso"],
     ["envision the future", "展望未来", "zhǎn wàng wèi lái", "imaginar el futuro", "imaginar o futuro"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "USTWWDNQYZPUaBNQcIgiefJKgHEI*EsiGEkEgim*XunFopFJq*U7FJ*Na*NUsFuBDQwXbvzCUd*UvBDN*ai3Yr4ATW6ASWACPdAZOXBASTObvzCRrtCYVODASTOXvzEFJKCPUlFBDNFASTGEIi*R6BDNHEIgBDNQIFJKCPUdJBDNJASTKBDNKASTLBDNRYt4MAST*ZGsRYNvCPuOXbOx3VwOy1z2wxPOXbOXbvx7y23Ryw2RwVSRYr71xyTRYr1x5y"
 };
 
 export const p2_76_adverbs__of__manner = {
@@ -2301,7 +2391,10 @@ export const p2_76_adverbs__of__manner = {
     ["gracefully accept", "优雅地接受", "yōu yǎ dì jiē shòu", "aceptar con gracia", "aceite graciosamente"],
     ["feel awkwardly", "感觉别扭", "gǎn jué biè niǔ", "sentirse incómodo", "me sinto estranho"],
     ["awkwardly placed", "尴尬地放置", "gān gà dì fàng zhì", "mal colocado", "colocado de maneira estranha"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "FJBDDEGH*S8SNOBEGH*TBBDGA*TAJB*FcBDEBDEGBDEG*dRAFBBDEGqMQRLQRAOLCTNLqC*QGSWaLMRALMQAC*SDPWCNOdcgj2puvw*aLPSaZrtxy14VYXrtPSWblPSWgUj2*TmECNgfhiehincUj2efinefhnUcg2CNOTbCNO35XZcefhKCNOVuvwLOPSXZtxMefhXZrxNVpvNVpuOVpuwXZrzPY1yPXZQefhYy4VRUcgm5XZSYy1XZmrTVpuXZrt"
 };
 
 export const p2_77_adverbs__of__degree = {
@@ -2375,7 +2468,10 @@ export const p2_77_adverbs__of__degree = {
     ["moderately priced", "价格适中", "jià gé shì zhōng", "precio moderado", "preço moderado"],
     ["remarkably well", "非常好", "fēi cháng hǎo", "notablemente bien", "notavelmente bem"],
     ["remarkably similar", "非常相似", "fēi cháng xiāng sì", "notablemente similar", "notavelmente semelhante"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "BECDACDFDFJMCFJMABCD*eJ*WmCDWXbvjOPRdCDF*BDCDFLUVc*eaKUVCDFJ*cRCDFwHPRHORS01Zk3HOPHOPRHOPRKLVcKLUcXGbvWGbvHOPRQknqbHOPaDGWKLUV*TQICDHOPRHOPRGjw34orxj*SfHmHigwlQZntHOPipuyQZkqr7h0uyz2LQZko7h0HOPRlHOPpyz2NGWXOgj34horzPpuyPpu1Q5i0Q5i3RpuR2gjhxor01imTpuyorh0"
 };
 
 export const p2_78_conjunctions = {
@@ -2449,7 +2545,10 @@ export const p2_78_conjunctions = {
     ["whereas the", "而", "ér", "mientras que", "enquanto o"],
     ["whether or not", "是否", "shì fǒu", "si o no", "se ou não"],
     ["whether to", "是否", "shì fǒu", "ya sea para", "se deve"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {"7": "41"},
+  distractors: "*Ma*NIBCACDFDFNACFNAcSTXCDNA*ZiHLM*LXGLMnlJk*dJ*WmInJZabGHMVGHLV*BHCDF*Ts*fDPRORfvIUWh*AA*AG*OIO4ETX7ESXIQWhGHLMIQUhESTYESTXJKabb*dPJKaJKZEgjlwikmJKZaOPRvcjloIQUW016dcglolInmIknJkx5cIlJQ3Kcgi016IQUWcgjl*h/cgjcgjlJKZaOPRfxdikwkm5cgjl*iBPJK1Qi60Qi6RJKZESTXSIQU4Skm7i01Tcgj"
 };
 
 export const p2_79_connectors = {
@@ -2523,7 +2622,10 @@ export const p2_79_connectors = {
     ["additionally needed", "还需要", "hái xū yào", "adicionalmente necesario", "adicionalmente necessário"],
     ["regardless of", "不管", "bù guǎn", "independientemente de", "independentemente de"],
     ["regardless continue", "不管继续", "bù guǎn jì xù", "independientemente continuar", "independentemente continuar"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "*YlDEiWFGNHQPLAEi0cADieBGNBFNc*Ts*eOCQMjABmRZaopOS*WEADEIjABuBFGwKSWCHLQCHPL2JZa4KOW6YqBpVglgovwBKOSnx57TqBFJRabJRZbJRZaEBFGfhm1FJRZdhm1Vovwdfm10ADEIMABIJRZUXpxJdfhXx57KVgvKUVgTYBFLBFGMJRZMKOSNKOSVgowOVgoOX57KOSWKOSWiADEdfhmR3df2RVgSVgoSXx7TKOSXx5l"
 };
 
 export const p2_80_phrasal__verbs__1 = {
@@ -2597,7 +2699,10 @@ export const p2_80_phrasal__verbs__1 = {
     ["set up account", "设置帐户", "shè zhì zhàng hù", "configurar cuenta", "configurar conta"],
     ["break down crying", "崩溃哭泣", "bēng kuì kū qì", "romper a llorar", "começar a chorar"],
     ["machine break down", "机器故障", "jī qì gù zhàng", "máquina averiada", "quebra de máquina"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "*g9CGJSEAC*hB*VQD*hCCFHIBSACDHIM*Fb*E5ACEDFIkDFHACGQ*MdBESW1DFtDFHDFHIDFHI*T9yTk*FV1AC*Dx*g/ACBEAC*Y/PkpZhlncefqL1DFbdmoagijUhlnYi6gDXdm*FUdVeXbmoVcfqVceqYaijUZlna6YgrVYcIPTpUZhnXbdoUZhl*hoXbdPTktLVcejVYctUZhMsPTUZhluVceOXbdVcefPVce7ai61VceQLWDXbdm2VceVcef*WZVceaiYgai6Y"
 };
 
 export const p2_81_phrasal__verbs__2 = {
@@ -2671,7 +2776,10 @@ export const p2_81_phrasal__verbs__2 = {
     ["check out this", "看看这个", "kàn kàn zhè ge", "mira esto", "veja isso"],
     ["calm down please", "请冷静", "qǐng lěng jìng", "cálmate por favor", "acalme-se, por favor"],
     ["calm down now", "现在冷静下来", "xiàn zài lěng jìng xià lái", "cálmate ahora", "acalme-se agora"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {"29": "411", "40": "411", "55": "4111"},
+  distractors: "VGJL*gAIDEZWhlbHUeFOSTeEOS*FFAJLDUegkBDE*f4*U5AGMPRA*gJAGJKPRA*f6AGJ*f6EFS*Hg*YdKMAGJLKMPAEFOTEFOSVDHeAEFOBChlaZt2ZaXtCt2iXYZtDcdfdEbfcEbfFDHUeFbcDHUeCWlwjHxyiHxyImopICWhkopr*OgDHUkmprkmorDHUekmopbcdfZ2ijvxbcDHUeCWhluijyijxzijxy*gg6bckmopZtijkmopSkmo4Sbc0ijxTkmo"
 };
 
 export const p2_160_apology__excuse__patterns = {
@@ -2745,5 +2853,8 @@ export const p2_160_apology__excuse__patterns = {
     ["repent of", "悔改", "huǐ gǎi", "arrepiéntete de", "arrepender-se de"],
     ["make amends", "弥补", "mí bǔ", "hacer las paces", "fazer as pazes"],
     ["amends for", "的弥补", "de mí bǔ", "enmienda para", "reparações por"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "HNPQWDESvYZLbBES*LddBDGIRBFIRBANPQFGRBWbdhnqUYrCimtOXgvAHPwAxM*eMAHN*ZcAHN*ezFGI5BDEBDESYZcrxAakBJbdBMOgCUZcCUYcVkw1DJWdUYZrEJWbFAHNFAHNMOXvJWbdCLm0txCLVaw1IAHNJCLiKqUYKpnqoKnqLKUYLUYZtMuyMsjxsyzUNCMOOVakVOwjsuzUsuyUCLimQVakJWbdRAHN5SMO4SJWVakwTMOX"
 };
@@ -81,7 +81,10 @@ export const p3_82_travel = {
     ["cruise ship", "游轮", "yóu lún", "crucero", "navio de cruzeiro"],
     ["polar expedition", "极地探险", "jí dì tàn xiǎn", "expedición polar", "expedição polar"],
     ["expedition team", "探险队", "tàn xiǎn duì", "equipo de expedición", "equipe de expedição"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "EKLYGMAEFQPRHo14AKLYCQPRBMAEiDo1JNOZINOZAELYAEKYBGAEuIJOwIJNRSBGCFPRPSBG*Md*SB*V1P*RJ*QP25fgs7Acpr*TedjkilqxAEKLIJNObhtWaDtWEVprWjkmIJNOUgs7Ufs7abtWHXlqHWdkWdjmIXiqWdjkahbtKDH1KVcrXilxLVcpUfg7bWadNVcpWdjkOVcpOXilVcprPIJNVcprDHo4T5DH*YAVcpDHo1T2DHTWdjTUfg"
 };
 
 export const p3_83_airport__flying = {
@@ -155,7 +158,10 @@ export const p3_83_airport__flying = {
     ["seatbelt sign", "安全带标志", "ān quán dài biāo zhì", "señal de cinturón de seguridad", "sinal de cinto de segurança"],
     ["overhead bin", "头顶行李舱", "tóu dǐng xíng lǐ cāng", "compartimento superior", "compartimento superior"],
     ["overhead compartment", "头顶行李舱", "tóu dǐng xíng lǐ cāng", "compartimento superior", "compartimento superior"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "DIJLHQACPBGHAIJLFKMSEKMS*Gq*NMCPBQACJADLIADL*Fz*YMEFADIJEFKSEFKMADIJCBGH*KaBHAWYhNEFKMEFKM27rcpsvcRYhNadefRWhNjwxyXdef*SMZgiq3VpxEXafFXaeFXauNbi*QbRWYbgotZwxy4VbgmXadlnXamXadbgitVsvcc3Vp7UcqVpvcbgiogNbiguVpxZjywZjyZjwxZjwxXadeXadeU7rccqVpkVbgSXadTZjwUr2c"
 };
 
 export const p3_84_hotel = {
@@ -229,7 +235,10 @@ export const p3_84_hotel = {
     ["bellhop service", "行李员服务", "xíng lǐ yuán fú wù", "servicio de botones", "serviço de carregador"],
     ["leave a tip", "留下小费", "liú xià xiǎo fèi", "dejar una propina", "deixar uma gorjeta"],
     ["tip generously", "慷慨地给小费", "kāng kǎi dì gěi xiǎo fèi", "dar propina generosamente", "dar gorjeta generosamente"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "BCFKAFKCABDF*C7CAB*SzGJVABKCEJVXUYaInpwynEGVABFCMWZe*KTLWZuOQRNQRSfEGJNORSNOQSNOQR*VpABFHYaIXEGJLMZeVEGJHUaILMWeHUYIDEGJgmqrE137LMWZPEGJcmqrkloiHvjkHcgiIohihkoicgqrJIpwkhivInwysLcgtLcgqMcgrMcgNEGJijkoInpyOLMWPInpPInpInpwd37IInpwd17IInpwcgmqEGJVd13I"
 };
 
 export const p3_85_work__office = {
@@ -303,7 +312,10 @@ export const p3_85_work__office = {
     ["responsibilities include", "职责包括", "zhí zé bāo kuò", "las responsabilidades incluyen", "as responsabilidades incluem"],
     ["home office", "家庭办公室", "jiā tíng bàn gōng shì", "oficina en casa", "escritório em casa"],
     ["office work", "办公室工作", "bàn gōng shì gōng zuò", "trabajo de oficina", "trabalho de escritório"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "FJBD*Z9DIL*JcUm0BILpMOBC*JnAJB*OH*NYgk*B7*KYNP*KX*V2BDAFBDRHNPBDIpsEOB*LhHPQwEMBHNQTHNPTHKNP4bgXHNPQACm0cuGWZjnz*FOYad*KSCXaCWjnXYdrSgXYEVuGXYarfiv3eiv3GSbXGxl4efv3WZnzIGoq4htxJCU0WZjz*D6GkqBDILLGkoXYadMGkol4hxVcGWefi3O*UFGkhl4SGkoqWZjnCUm6GkoqBDILefivSlhttl4hCUm0CUm0"
 };
 
 export const p3_86_workplace__actions = {
@@ -377,7 +389,10 @@ export const p3_86_workplace__actions = {
     ["fulfill requirements", "满足要求", "mǎn zú yāo qiú", "cumplir con los requisitos", "cumprir os requisitos"],
     ["accomplish goal", "完成目标", "wán chéng mù biāo", "lograr la meta", "cumprir meta"],
     ["accomplish mission", "完成使命", "wán chéng shǐ mìng", "cumplir la misión", "cumprir missão"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {"34": "411"},
+  distractors: "BNECA*R3NEIDGJ*NWCGIABCDKXclCDIJTYbgClDG*JrCDGFXclMPQS*U5stLABECRstFLMQSLMPS*HnOstLMPQHYbgW*SnadmUWaU*SnadFKclHTbgipryUWdqHTYgFKXlUWaqvwxV*bn*bA5jhHTYgHTY*IIHZpnz37lHTYIFKXVUWajz3712ZiZiryUWadZipytMORsMORNCDGewxVxOevwOevZiprjn37UWado2Zio1Zijnz7UWadjnz3TZipjnz3"
 };
 
 export const p3_87_business__communication = {
@@ -451,7 +466,10 @@ export const p3_87_business__communication = {
     ["forward to", "转发至", "zhuǎn fā zhì", "reenviar a", "encaminhar para"],
     ["distribute copies", "分发副本", "fēn fā fù běn", "distribuir copias", "distribuir cópias"],
     ["distribute evenly", "平均分配", "píng jūn fēn pèi", "distribuir uniformemente", "distribuir uniformemente"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {"42": "411", "46": "411"},
+  distractors: "HQBEEINRJO5DKTUdBINRGkCJFkCJQABE*T6kBECO5D*KdDTU*HoPSBsVWq*Md*JZBE*HxCJ5LSBEHABEBEIN5LPBDKUdDKTdMWqyMVqyntwmZboaYboa*K2DfhDYZorsv1DKTUx67aahlYhGizgafl*azgz3DKTUIFGCafhYpewxtXwm*KdKYZmewxMVWycsv1Mcrv*IJnwmDKTUcrs1mptee67aMVWqgi34*HEDKTcrsvDKTUgiz4giz3SCJOex7aex6a"
 };
 
 export const p3_88_internet__social__media = {
@@ -525,7 +543,10 @@ export const p3_88_internet__social__media = {
     ["subscribe to", "订阅", "dìng yuè", "suscribirse a", "inscreva-se"],
     ["trending topic", "热门话题", "rè mén huà tí", "tema en tendencia", "tópico de tendência"],
     ["trending now", "现在流行", "xiàn zài liú xíng", "en tendencia ahora", "tendência agora"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {"29": "411"},
+  distractors: "DEJOWMUeZkuvAEJOJOADQIPaHgKNGLTgFPQaEOAD*ZhGNE*BGHTg*P+sBUGKEFEJADFIQa*T0F*UQI3Vby54cdHLgmBMepRbyCBijfYt2nXt2nChl0FIPQRVyCSdoH*H3ScoBMUpqrz1GHLTjZl0WjfnhWifCuv5Zh03*ZfHLTsWij*ZhmKSBMUefrz1fqz1MnWiXY2nCkv5Cku5OFIPBMUePRVbfqr1Zhl3fqrztXYnRZhl5SBM4SCk7ZhlTCku"
 };
 
 export const p3_89_relationships = {
@@ -599,7 +620,10 @@ export const p3_89_relationships = {
     ["commitment issues", "承诺问题", "chéng nuò wèn tí", "cuestiones de compromiso", "questões de compromisso"],
     ["strong bond", "牢固的联系", "láo gù de lián xì", "vínculo fuerte", "vínculo forte"],
     ["family bond", "家庭纽带", "jiā tíng niǔ dài", "vínculo familiar", "vínculo familiar"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {"53": "411"},
+  distractors: "UaiqESltJLMPaghjcBSl*VyHIC*BCTOQ*Jn*RGFI*Hw*Q4FHCLMPCDJLCJMPCJLPYefkQFGHCJLMOFGH*JmCJL*Hn*FtBE*Q5GOQAou5AbUXBZdpVbUoNefkWdpvDcAiVUXoEanrEWZpNYfkNYek*FgDhjDgj1AaqsHDghNYefBESt4WZccry3Uu5VWZdvAaiscny3AaiqMBESNUo5NWZdNYefOCJLcnr3PBESBESl*U9Dgh*IQWZdcnrySmWZUouVBESlBESl"
 };
 
 export const p3_90_social__interactions = {
@@ -673,7 +697,10 @@ export const p3_90_social__interactions = {
     ["greet guests", "迎接客人", "yíng jiē kè rén", "saludar a los invitados", "cumprimentar os convidados"],
     ["acknowledge receipt", "确认收到", "què rèn shōu jù", "acusar recibo", "acusar recebimento"],
     ["acknowledge mistake", "承认错误", "chéng rèn cuò wù", "reconocer el error", "reconhecer o erro"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {"23": "411", "40": "411", "52": "411", "55": "411"},
+  distractors: "*LZ*T8YZSCDEDEILCEILCDILfGJKFJKM*G2*EB*Ftd*E3CDE*LRFGK*KgFGJrCDEFGJKOCDENCDEFGJK*Gs*NLCD*E6FGJBCDEac45*awVn6Un67FGJKrFGJAZbfAYbfTc45AYZfTa45HklqzhijFAYZGosxtepzjHmwiHmwHdlqHdkqijweUV67*ESKgs*FZht6HdklLXFGMgoxhepzHdklAYZbijmegosyPgosehijHdklAYZb3Rgo2RgoTac5Tac47UVp6UVp"
 };
 
 export const p3_91_life__events = {
@@ -747,7 +774,10 @@ export const p3_91_life__events = {
     ["leave a legacy", "留下遗产", "liú xià yí chǎn", "dejar un legado", "deixe um legado"],
     ["special occasion", "特殊场合", "tè shū chǎng hé", "ocasión especial", "ocasião especial"],
     ["occasion for", "场合", "chǎng hé", "ocasión para", "ocasião para"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "DSEKJOQUFINPASEKKCFICINPOHLaGLaBCFNPBOQUECFIGHaBsRcxCFIPxG*QPBCFINBJOUMcx7*R9ADECFINBJOQt23Xjmprg1Vhqvw6defkGHLBBJOQMRx7ZefkZdfkZdekX1Vhui0Xh0XgHWmpZdefuhi0WjprJZdeZdefWjmrLYvwLWjmMWjmMV23hli0Yqw6Yqv6OMRcZdefP5MRhiXgXgVhRVt3RVt2ZdefzMRZYqvwTMRc"
 };
 
 export const p3_92_housing = {
@@ -821,7 +851,10 @@ export const p3_92_housing = {
     ["dwelling place", "居住地", "jū zhù dì", "lugar de residencia", "morada"],
     ["sublet apartment", "转租公寓", "zhuǎn zū gōng yù", "apartamento subarrendado", "apartamento sublocado"],
     ["sublet room", "转租房间", "zhuǎn zū fáng jiān", "habitación subarrendada", "quarto de sublocação"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "BDTOADTOFGMNTBOP*C2IKWCGMNCFMNiVbkkEKWnLexLEIWKJex*Sz*P9*QPCRCFG*G1PQU*C5*GrOQOPUCN2CFCFGM*D5DBOOPQCHbkJEIKanostcfgqdiYcDEIK*SoHVk6YfgZiYcF*ZmJLYcgqYcfquz14HZdYHlrZIHVbjrZdpjlrJXosLXnsmjlrLrYcqjlZXnotXnoshz14YcfgYcfgJLeHXnos1hu4Q27Ezhu4R07EXnoshuz1huz1*DMcYf*CE02E"
 };
 
 export const p3_93_news__media = {
@@ -895,7 +928,10 @@ export const p3_93_news__media = {
     ["newsroom chaos", "新闻编辑室混乱", "xīn wén biān jí shì hùn luàn", "caos en la redacción", "caos na redação"],
     ["news anchor", "新闻主播", "xīn wén zhǔ bō", "presentador de noticias", "âncora de notícias"],
     ["anchor position", "主播职位", "máo dìng wèi zhì", "puesto de presentador", "cargo de âncora"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "FOBDDEMNGLBD*C8BEM*C7cBDAOBD*BMCLBKPTCcop6*FU*E2Xa*VmPTCCGBDBDENBDEMAFBDKTCG0YdgUh07BDEM*P/KPCRh07YxWiiy1RJaefQdgq*HYbjrJXefDZjrEIopEQYgFJXaFJXaQYdqRU07*FG*EvWyZbrsm2n3wn3V2n3lJ3lmIcp6Ico6QYdgZbjstMZbsMZbNZbjJXaeln3VVWiyWi1RZbjrQRUhQWiy3RmnR2nlSZbjJXaeIcopRUh0"
 };
 
 export const p3_94_environment = {
@@ -969,7 +1005,10 @@ export const p3_94_environment = {
     ["wind turbine", "风力发电机", "fēng lì fā diàn jī", "turbina eólica", "turbina eólica"],
     ["endangered wildlife", "濒临灭绝的野生动物", "bīn lín miè jué de yě shēng dòng wù", "fauna en peligro de extinción", "vida selvagem ameaçada"],
     ["endangered animal", "濒危动物", "bīn wēi dòng wù", "animal en peligro de extinción", "animal em extinção"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "*UtUCKEPQFAKLMfgiyBPQFGNBEFNBERFGNABCE*Hg*OH*TCUACLMACKMACKLFGBE*R7ACKBEQFBEPF*VoHFGHRFGXh23AJ01WuzYVuzYBTh2djkomn6alxZmsZmnepJUYjkocpJUDgiyDfiyTX23Dfgy*VFYdkYdjoaxZm*OeJZnJZm6pYdjKceJr7Yaq7YaZmn6YdjkVWzYNACKYdjkalZmDfgiVWuYJU1DJU0D3TXh2TXhACKLDfgiZmnaqrYa"
 };
 
 export const p3_95_cooking__methods = {
@@ -1043,7 +1082,10 @@ export const p3_95_cooking__methods = {
     ["poach chicken", "水煮鸡", "shuǐ zhǔ jī", "pollo escalfado", "escaldar frango"],
     ["caramelize onions", "焦糖洋葱", "jiāo táng yáng cōng", "caramelizar cebollas", "caramelizar cebolas"],
     ["caramelize sugar", "熬糖", "jiāo táng", "caramelizar el azúcar", "caramelizar açúcar"]
-  ]
+  ],
+  accentFree: {"6": "saute", "32": "saute onions", "33": "saute mushrooms"},
+  pinyinUnits: {},
+  distractors: "COPBACOPIAOPEFGIDFGIDEGIDEFI*Q4KNRCDEFMXZxHNRDHJKMJXZxHKRDACPBACOBDEFG*AS*E5*V1HDEFGWalogqTWYdfiTaloJMZxVdfiJMXxlTWoezps5jm3VYfibzpsVYdiUqTWwzbeHVYdcm35VYdfaTWoJcj3rvchTWalbes7UgTWnvchbep7u6be6bepnrchhzbeJMXZTWalhwbeTWalVYdfTWalcjm5VYdfcjm3ubepTbep"
 };
 
 export const p3_96_food__preparation = {
@@ -1117,7 +1159,10 @@ export const p3_96_food__preparation = {
     ["tenderize with", "用...嫩化", "yòng... nèn huà", "ablandar con", "amaciar com"],
     ["julienne carrots", "胡萝卜切丝", "hú luó bo qiè sī", "zanahorias en juliana", "cenouras juliana"],
     ["julienne cut", "切丝", "qiè sī", "corte juliana", "corte juliana"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {"44": "411", "57": "411"},
+  distractors: "CFLBGACFAFLBEKNR*BCDKNACLB*UvBACIMgJHMgJODEHDENRACFBHIgJ*OJDEK*DzJDEUYerabcdDEKNVZv3WquHPYerSZv3TquHt45fPUerSVv3QbcdQacdQabdQabcPUYrjmnpHIMJzPXlly01fmnphzily016fjnpfjmpQabcfjmnTWuHPUYeQabcX45fTWqHuSVZfjmnPUYezPl0hPXlQly1Q*AVlyPUYeSVZv5SXt4SXt7ly0TQab"
 };
 
 export const p3_97_restaurant = {
@@ -1191,7 +1236,10 @@ export const p3_97_restaurant = {
     ["sommelier recommend", "侍酒师推荐", "shì jiǔ shī tuī jiàn", "recomendación del sumiller", "recomendação do sommelier"],
     ["ask maître d'", "询问领班", "xún wèn lǐng bān", "pregúntale al maître", "pergunte ao maître d'"],
     ["maître d' seated us", "领班为我们安排座位", "lǐng bān wèi wǒ men ān pái zuò wèi", "maître d'nos sentó", "maître d' nos sentou"]
-  ]
+  ],
+  accentFree: {"19": "maitre d'", "58": "ask maitre d'", "59": "maitre d' seated us"},
+  pinyinUnits: {},
+  distractors: "CBNONOACABNO*C6*LZp1*PE*SAJR*NV9KPLSVXMUWyQTEFERYZFPBI*SGGSVHUWyBOACBNACFKBIITEFEJYZ4GLVIQEFHMWyGLSXHMUyGLSVEJRZEJRY*Z7D*aYjcls3ls3aEkmwFGLShrudinqtGfruHgnqiHaodmwzcs3aJdkwgiqtaj7cD12HgintLfhucl3aMginfhrdGLSVdkmzEJRYHMUWdkmwginqDp2HRDp1clsaSdkmbclsTHMUajoc"
 };
 
 export const p3_98_movies__tv = {
@@ -1265,7 +1313,10 @@ export const p3_98_movies__tv = {
     ["premiere night", "首映之夜", "shǒu yìng zhī yè", "noche de estreno", "noite de estreia"],
     ["summer blockbuster", "暑期大片", "shǔ qī dà piàn", "éxito de taquilla del verano", "sucesso de bilheteria de verão"],
     ["blockbuster hit", "轰动一时", "hōng dòng yī shí", "éxito de taquilla", "sucesso de bilheteria"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "BDIK*OJ*NVWAERqAABIK*OICRqGMSWFMSWLABDABDKHLAB*U7ABDHABDFGSWABDITadfmFGMABDICEqAFGMW7OadYZknXeilBFGMVeilCUZkCUYkOTdfosy1*Rkgt4OTafFVXiFOTact45w6xzVXelOTadUYZnVXeiPFGM*RP*TRUYbsy1UYZkLCEROTadboy1cg45OTadUYZkh6xzOzbobos1yxboOTadbosyVXeibosycgt5cgt4hwxzTbos"
 };
 
 export const p3_99_books__reading = {
@@ -1339,7 +1390,10 @@ export const p3_99_books__reading = {
     ["manuscript draft", "手稿草稿", "shǒu gǎo cǎo gǎo", "borrador manuscrito", "rascunho do manuscrito"],
     ["first edition", "第一版", "dì yī bǎn", "primera edición", "primeira edição"],
     ["limited edition", "限量版", "xiàn liàng bǎn", "edición limitada", "edição limitada"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "GJDF*JkELT*T8*F0BM*KnQABBLTnHAGJAJDFFAGJEKNOAGDFmINOBETntCSd*ZDIKOIKNPIKNO*EsDABeiBECMdf*JkBELIKNOIKNOYoszkptvCWosYux51*Rkbcacr1*HEabrECMSRiBE*BdCMSIKNOq2CMReBEIKNOIXpty4ZuKINOJBELWYszKXkth2CMabc1MWYoMXkpZx5WNXkpOXkpZu5Wz4ZlWYosWYosabcrRhqCRabcyZluSWYZabcrWYos"
 };
 
 export const p3_100_music__art = {
@@ -1413,7 +1467,10 @@ export const p3_100_music__art = {
     ["composer music", "作曲家音乐", "zuò qǔ jiā yīn yuè", "música del compositor", "música do compositor"],
     ["symphony orchestra", "交响乐团", "jiāo xiǎng yuè tuán", "orquesta sinfónica", "orquestra sinfônica"],
     ["orchestra conductor", "乐团指挥", "yuè tuán zhǐ huī", "director de orquesta", "maestro de orquestra"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "*Gs*MT*OFE*G3GLCFABERUXcAHIJCABEBLCF*Y6AEIAEHJAEHIAEHIBGCF*R4AEHSWYg*GrQhAzTeqOhAE*AT2DUNWYgPeqDDRXcjuDRNSYg*PnDRUNSWgostzD13l467mDRUXDRUXPTqDDRUXhNSWgOQADRUXVuDRDRUXpvwxya13DRUXZstzlvwx*BOPTeNSWY*QW*PcZoZoszNVjDlpwxlpvxlpvwma13PZosQDRUa3lmRlpvRa1lb67mlpvwb47mb46m"
 };
 
 export const p3_101_basic__law__rules = {
@@ -1487,7 +1544,10 @@ export const p3_101_basic__law__rules = {
     ["penalty kick", "点球", "diǎn qiú", "tiro penal", "pênalti"],
     ["issue subpoena", "发出传票", "fā chū chuán piào", "emitir citación", "emitir intimação"],
     ["receive subpoena", "收到传票", "shōu dào chuán piào", "recibir citación", "receber intimação"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "PBDFDAFJEKQy*DxBAF*RECKQJNBCLTIM*LeisvJMORFNBCCEQyGTIM*OIIORFJBCIMRSABDFCEKyIMOSIMORGLIMbefGZkqrYdhicnop*BXZWdYVkqIMOR*KXaUeXnopWYhiUbfG*AEUbeGu24WYdiHWYdtlm7VZqrm7VZl7VZXcopXcnpXcnoVZkrVZkqMHvzjlm7g24WHszUXcnoVZkqCEKQ*EE*EGHsXcnoXcnogu4WWYdhgu2WXcnoWYdhlmVZ"
 };
 
 export const p3_102_government__citizenship = {
@@ -1561,7 +1621,10 @@ export const p3_102_government__citizenship = {
     ["constitution right", "宪法权利", "xiàn fǎ quán lì", "derecho constitucional", "direito constitucional"],
     ["new legislation", "新立法", "xīn lì fǎ", "nueva legislación", "nova legislação"],
     ["pass legislation", "通过立法", "tōng guò lì fǎ", "aprobar legislación", "aprovar legislação"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "JLMPGREHIQdD*JkFc2KNBGDc23BREHOBCGCQdDMTYbENBGPWjAJTYbEKBGHBCGLWjACIdDBGEH*LZ*T8ku6JMYqstzi4UmLPjAlxSZJMTbefgw*UcnprDJMTDF23CIQDZfgwZegwZefw*PnJMTyUanHLPWSuvJ*SpXxSV4UqJaprJMTYanr0Ustzanp0tUqzsUqzSkvJ*IpSkuZefgXlSZiUanUqstanpranprDFc3DFc2SVUmSUqsT7Ze6Tan"
 };
 
 export const p3_103_opinions__arguments = {
@@ -1635,7 +1698,10 @@ export const p3_103_opinions__arguments = {
     ["attitude toward", "对...的态度", "duì... de tài dù", "actitud hacia", "atitude em relação a"],
     ["strong belief", "坚定的信念", "jiān dìng de xìn niàn", "creencia fuerte", "crença forte"],
     ["belief in", "相信", "xiāng xìn", "creencia en", "crença em"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {"45": "4111", "49": "14111", "55": "4111", "57": "4111"},
+  distractors: "*U1UVIFHKOGBFHZeflJPSk*GqBHKBCFHiBFK*F4kANEPSkpBFHrQgjtRUVvAIi*E0*U1BFEJSk*P+*JkLgMUVhEJPk*Ez7BFAMRVAMRUc15XwWcmCBFHDeflbsnqasnqW15Xu23WDZflDZelLQjoMRUVHAINLQgoI*F4EJDZefJryzq04dLQgjKEJPn04dLmyzbanqMDZed23WNMRU*TKXWcLQgjPmrzPmrynq4dQWc5du3Wdu2Wnq0dWc1XmryzTEJP"
 };
 
 export const p3_104_problems__solutions = {
@@ -1709,7 +1775,10 @@ export const p3_104_problems__solutions = {
     ["failure to", "未能", "wèi néng", "no lograr", "falha em"],
     ["home remedy", "家庭疗法", "jiā tíng liáo fǎ", "remedio casero", "remédio caseiro"],
     ["remedy for", "补救措施", "bǔ jiù cuò shī", "remedio para", "remédio para"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "GiEKWLUVfnpuFIJQKNTA*LQfDIAiEK*NOAGiDFJQnDFIENTArBUVsOPc*T6*TsEKxMPczMOc1DFI*D8ShD5RhD*PKEKNBLV5*HZBLUBegkltdqCbzZCw4YsxWYYzZaMOPm*LzqyXFWgkFCnp*a0*bPWeGRSDAGEKDFIJIWegXtdqJMOPJCfpWegkCfnudyXZLWegMaxWXldqCfnpCfnpO*YQZ4OasWPdqXPYbZ*Z0QWeQCfnWegkMOPcZwYbS*EeBLCfnpTBLU"
 };
 
 export const p3_105_describing__trends = {
@@ -1783,7 +1852,10 @@ export const p3_105_describing__trends = {
     ["decline in", "下降", "xià jiàng", "descenso en", "declínio em"],
     ["growth stagnate", "增长停滞", "zēng zhǎng tíng zhì", "el crecimiento se estanca", "estagnação do crescimento"],
     ["stagnate over time", "随着时间的推移停滞不前", "suí zhe shí jiān de tuī yí tíng zhì bù qián", "estancarse en el tiempo", "estagnar com o tempo"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "CGHQENRAAGHQ*A+OAC*LhBNR*CLBENACHQACGQLSDOKMeuJMeuISDOJKeuBERA*GpDACzTdiACGHBENA*C85ILPdijXYgrZq14bcfzUYgrgUXrVq14qklwrWcfWbfzPTijJKMuWbczYUXr6VZmjPTdi*YJPTualwakw0nosvmosvmnsvt7mnaVZ1bUXYtmnos7mnJKMemnosakl0mnosmnosPWbcaklwVZq4JKMeUXYgVZq1SJKMhVZmtmno"
 };
 
 export const p3_106_common__idioms__1 = {
@@ -1842,7 +1914,10 @@ export const p3_106_common__idioms__1 = {
     ["they say break a leg", "他们会说好运", "tā men shuō shuāi duàn tuǐ", "dicen 'mucha suerte'", "dizem 'boa sorte'"],
     ["that will cost an arm and a leg", "这将花费一条胳膊和一条腿", "zhè jiāng huā fèi yī tiáo gē bó hé yī tiáo tuǐ", "eso costará un ojo de la cara", "isso vai custar um braço e uma perna"],
     ["it cost an arm and a leg", "花了一条胳膊和一条腿", "huā le yī tiáo gē bó hé yī tiáo tuǐ", "costó un brazo y una pierna", "custou um braço e uma perna"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "BIFG*byAIFTSjQVLRfYPdhABGIKNFAedJM*bvABFhHMZGNFADRfOoHJZ*KhGKFsaepQEdhPbcgBDLfCjQVCWilXrTWWDnCVTilUrTWEmTVaFDHZOepQcgsQbgseHoEHdOaIDLRQbcsJEPdTWlYCSQVEPdhTWiYLYTVoVCSMdnEOaeqOaepTUWiOQbc"
 };
 
 export const p3_107_common__idioms__2 = {
@@ -1901,7 +1976,10 @@ export const p3_107_common__idioms__2 = {
     ["you bite off more than you can chew often", "你经常咬得比你能咀嚼的多", "nǐ jīng cháng yǎo dé bǐ nǐ néng jǔ jué de duō", "a menudo asumes más de lo que puedes manejar", "você se mete em mais do que consegue dar conta com frequência"],
     ["well better late than never", "迟到总比不到好", "chí dào zǒng bǐ bú dào hǎo", "bueno, más vale tarde que nunca", "bem, antes tarde do que nunca"],
     ["I guess better late than never", "我想迟到总比不到好", "wǒ xiǎng chí dào zǒng bǐ bú dào hǎo", "Supongo que más vale tarde que nunca", "Acho que antes tarde do que nunca"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {"38": "121111111"},
+  distractors: "CBFLSFLPABFLESJPDSJPZBLPcbQWdbNgUMRYiZDEkfNgBFPCoRYipglsrsVXABDEGWhOSMYiBDEJmJZDIMRYDOXGGQhOYEOVXEMRFJDEGQWccGHNGbaoHnpKkjqpKNglNlsHJGQWJMRYkqepjKeqNgsHLTJZdpKfMrHbNdnKjekpOsoHrONg"
 };
 
 export const p3_108_phrasal__verbs__3 = {
@@ -1975,7 +2053,10 @@ export const p3_108_phrasal__verbs__3 = {
     ["almost pass out", "差点昏过去", "chà diǎn hūn guò qù", "casi me desmayo", "quase desmaiei"],
     ["make up for lost time", "弥补失去的时间", "mí bǔ shī qù de shí jiān", "recuperar el tiempo perdido", "compensar o tempo perdido"],
     ["make up for it", "弥补它", "mí bǔ tā", "compensarlo", "compensar isso"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {"56": "411"},
+  distractors: "EPRBCDHJBDHJBCHJAPRBGo3NhFo3QiBC*ZGOBCBCDHIOBCBCDHsBCDTilsIBCD*WHAERH0BC*Zf3AE*BGBCD7NilZjmy5Ych*VYvg6abkqptx2UjmyXbkqXakqEhnzeuwUduwUgWv6Wvf6GcnzH*NeNTUZmyXabq*Zd*ZtINUZjychzVFG3NYtx2XabkXabkMNTiYpx2dewU*BmWg6deuUYpt2UZjmPchnQNTiXabkYptxRFGoXabkVYchWdeuTXab"
 };
 
 export const p3_109_phrasal__verbs__4 = {
@@ -2049,7 +2130,10 @@ export const p3_109_phrasal__verbs__4 = {
     ["settle down somewhere", "在某个地方定居", "zài mǒu gè dì fāng dìng jū", "establecerse en algún lugar", "estabelecer-se em algum lugar"],
     ["sign up now", "立即注册", "lì jí zhù cè", "regístrate ahora", "inscreva-se agora"],
     ["sign up for", "报名参加", "bào míng cān jiā", "matricularse en", "inscreva-se para"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "DFGIPj*GOrdn*GQ3AFGI*Q/HJ*FyADGIADFIjEJ*FyADFGOEH*FyMEHJrEHJ*FxEHJADFGJQEHBj*GOr*YCOEHEHJ*FycstCEHJ*FyabhkXUWaVXY4VUWa4WeVCgm0bk0UaUhkdfSscECn*EX*TZY4ciuvZm0UUabkjfuvHBP*GOa0UbxzZfZg0U*Yf3JCpBPj*GO*YL*FxAr*GO*FyC*GQ*FyBPSctCScsCfivyfiuy*J2UablzZfzPfiyPlxakZgfiuvUabh*YfnRCYWeVeY4W7TCd6TCd"
 };
 
 export const p3_110_collocations__make__do = {
@@ -2123,7 +2207,10 @@ export const p3_110_collocations__make__do = {
     ["need to do laundry", "需要洗衣服", "xū yào xǐ yī fú", "necesito lavar la ropa", "preciso lavar roupa"],
     ["do nothing today", "今天什么都不做", "jīn tiān shén me dōu bù zuò", "no hacer nada hoy", "não faça nada hoje"],
     ["want to do nothing", "不想做任何事", "bù xiǎng zuò rèn hé shì", "no quiero hacer nada", "não quero fazer nada"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {"37": "4111", "42": "4111", "54": "41111"},
+  distractors: "UoBCXCDyZ*Vc*U4Ba*a1BCcHFS*b1ESTgdefMREFOcis*Oem*OHUoLNP*C1KNPHREFKLPQIcisyKLNKLNP2HMEEFTHEFSHA*biJXAmbWhnVmBJUrZCgkC*VdajDZjqDVYgEIOiGeflGdfl*cVGdeGYkxGWnVHIOcZaqtlYgxIkGdJ*OeVbJWhVKABCoKGdLZajJUXuMIOcZajqJUXrNZajOJUXYgkJPzBCyPZaQGdeJUXrRKLNRBCDZajqGdefZajqGdef"
 };
 
 export const p3_111_collocations__have__take = {
@@ -2197,7 +2284,10 @@ export const p3_111_collocations__have__take = {
     ["must take responsibility", "的责任必须承担责任", "de zé rèn bì xū chéng dān zé rèn", "debe asumir la responsabilidad", "deve assumir a responsabilidade"],
     ["take advantage of", "利用", "lì yòng", "aprovecha", "aproveite"],
     ["don't take advantage", "不要利用", "bú yào lì yòng", "no te aproveches", "não aproveite"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {"24": "41111", "30": "411", "32": "4111"},
+  distractors: "UEMNKWQyY*HgcwPAEMDAMNe*FO*DSGh*VIgFi*Z1jFkVabLmRUBoQyJqRUAENO*Y3AEMAEMN*b0yAD0BKyJLUB45*EPf67WdAJLRIabeoBTdpgjkC4r5C5Y4IVbeIVaeCw7SETWhFIVaXFSuGhXjG*VITWHIVaHXgkIXgjIvSfJqLTJXgjWKTdXgjkLmJTYlv4XgjkMTWdSf3ClSfrCc7SOTWdPBKQIVabQTWdXgjkRXgjSfuCSYr5S*EPYZTIVXTCcw"
 };
 
 export const p3_112_collocations__other = {
@@ -2271,5 +2361,8 @@ export const p3_112_collocations__other = {
     ["can you tell the difference", "你能看出区别吗", "nǐ néng kàn chū qū bié ma", "¿Puedes notar la diferencia", "você consegue perceber a diferença"],
     ["tell a joke often", "经常讲笑话", "jīng cháng jiǎng xiào huà", "cuenta un chiste a menudo", "conte uma piada com frequência"],
     ["let me tell a joke", "让我讲个笑话", "ràng wǒ jiǎng gè xiào huà", "déjame contar un chiste", "deixe-me contar uma piada"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {"56": "14111"},
+  distractors: "UFPqDRoEYSdhBRoELMNT*WofAP*WhIhHGtu0*WhJsAIsAB*a9oOQ*Z3qEMs*a9KEELMTKQELAFq1KOELBDoECdhnQELMAW67AgijBU67VegiC5Ze45YebcmpacmpabmpCShnkXVYFlrwGVijlGCSHVgjHVgieXVYhIfrJabcCSdhKBDR*bhabcLAFP*aRflwMIJAMGHuNGHtCSdhflr2abcmPVgiPVgiGHtuQAFPRflr7RflZ5YeSYZ4UW7G3UW6"
 };
@@ -81,7 +81,10 @@ export const p4_113_business__basics = {
     ["demand for", "需求", "xū qiú", "demanda de", "demanda por"],
     ["e-commerce business", "电子商务业务", "diàn zi shāng wù yè wù", "negocio de comercio electrónico", "negócio de comércio eletrônico"],
     ["commerce platform", "商务平台", "shāng wù píng tái", "plataforma comercial", "plataforma de comércio"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "BCDFC*KhDFBDFN*CFBCF*CD*OSKWBCDNABCDBCDFLe4E*BFMOP*OSpEWqIe4JOPT*Ht*KYBCJMPTJMOTUX5IBCDFBCDFJMOPQX5I*OjYZaEKb2BQU5VZapVYapVYZpEKW2Eo7k*O1*K/rkIL4EsvEK8hijgijmghjmghim6cdodrk6ghijwz13Kc7kKVYZLghidk6cMfvEVYZaghijfsEKnz13VYZaghijnw13VYZa0nwzEKWbnwz1ILeESQUXkcdocokn"
 };
 
 export const p4_114_finance__basics = {
@@ -155,7 +158,10 @@ export const p4_114_finance__basics = {
     ["price index", "价格指数", "jià gé zhǐ shù", "índice de precios", "índice de preços"],
     ["high yield", "高收益", "gāo shōu yì", "alto rendimiento", "alto rendimento"],
     ["yield return", "投资回报率", "tóu zī huí bào lǜ", "rentabilidad", "taxa de retorno"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "CFIKERSTAFIKNBERBRSTACIK*NLJQBMPACACFK*AJGQB*F1*C5*NUAGHJMHPACDBERxXagHMACGJBEBESTBERTBERSsVYcYfjrbdh0Oag4VfjrkezVOXg4Wdh0iUnsWbh0ZzVY*QqVYjOXa4Wbd0cUnsVYfrZlezkZezquvyciop*ElKptKotxmuvyVYfjUVYcopxmmqvyMmquVYfjOoptPmquZeVYWbdhQACFACFImquvOXagOXagACFIWbdh"
 };
 
 export const p4_115_marketing__sales = {
@@ -229,7 +235,10 @@ export const p4_115_marketing__sales = {
     ["lead conversion", "潜在客户转换", "qián zài kè hù zhuǎn huàn", "conversión de clientes potenciales", "conversão de leads"],
     ["market segment", "细分市场", "xì fēn shì chǎng", "segmento de mercado", "segmento de mercado"],
     ["segment analysis", "细分分析", "xì fēn fēn xī", "análisis de segmentos", "análise de segmento"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "yBEFEFQRPDHKCPHKBFQRBEQR*LgIJOKMNC*LYGJOGIOTHMNC*AESbk*Ft*MNHK*ADHKM*HtGIJCDHKBEFRBEFQ*Ij*KfLbGIJOfhmnWev2Vev2YclqXclqguwajxzLLSkAXYlqprVW1VWvUhmnZuwaUfmnot6XaxzL*D8ILSXYcqsUfh*AsUfhit6XdrVWLXYcdpVWmXYcio6XZgwaVWe2ZguaajzLABEFajxL1UVWe0UVVWevUfhmSXYcSXYciotXUfhm"
 };
 
 export const p4_116_science__basics = {
@@ -303,7 +312,10 @@ export const p4_116_science__basics = {
     ["method used", "使用方法", "shǐ yòng fāng fǎ", "método utilizado", "método utilizado"],
     ["calibrate equipment", "校准设备", "jiào zhǔn shè bèi", "calibrar equipos", "calibrar equipamentos"],
     ["calibrate carefully", "仔细校准", "zǐ xì jiào zhǔn", "calibrar cuidadosamente", "calibrar cuidadosamente"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "BGIMAGIMQSHOKNEFd*FzcF*F1*BG*AJ*F6ABIMQCDKABGMORCS*D0DNEcox1ABGIDKEF*PNRCJdmABCHDKOCJSCHOQEFABY2biYgp6XZlqWZlqU2biWXlqfju2UYiWELoxEPmAknv4aju2Vp67t0VgUYbWafu2IenvWXZqPdABekv4KLcxVg67LWXZyht0WXZlh0Vgafj2ekn4ABGILco1rht0WXZlhtVgLcoxUYAaLcekeknvABGIVgp7Vgp6"
 };
 
 export const p4_117_biology__basics = {
@@ -377,7 +389,10 @@ export const p4_117_biology__basics = {
     ["habitat destruction", "栖息地破坏", "qī xī dì pò huài", "destrucción del hábitat", "destruição de habitat"],
     ["human chromosome", "人类染色体", "rén lèi rǎn sè tǐ", "cromosoma humano", "cromossomo humano"],
     ["chromosome pair", "染色体对", "rǎn sè tǐ duì", "par de cromosomas", "par de cromossomos"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "CBHLACHLABHL*GyMRU*C+JPSGQiDFQiDLNAC*KDOVo*NXEPSEHJLHNAC*LY*Cc*CADHLAC*NTxIVEJSW*IlFGiDMUFEJPWqDMRDMRFIOopEJPS*LTYjvXjvI*Qc*QCaeZefzgr06hdkmmnsxZafzZaezbr06*GWcdkFGQDXYvIIt5c*GUw2kdnsxdmsxIOVpIOVoTDMRbg06dmnxk5chNEJPXYjIl2ktOdmnIOVZZaefbgr6*BkQIOkltwZaefZaefktchTbgrTZae"
 };
 
 export const p4_118_basic__chemistry__physics = {
@@ -451,7 +466,10 @@ export const p4_118_basic__chemistry__physics = {
     ["density level", "密度水平", "mì dù shuǐ píng", "nivel de densidad", "nível de densidade"],
     ["reduce friction", "减少摩擦", "jiǎn shǎo mó cā", "reducir la fricción", "reduzir o atrito"],
     ["friction between", "之间的摩擦力", "zhī jiān de mó cā lì", "fricción entre", "atrito entre"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "CDJNHPQSADJNACJNIKFGEGIK*GyBFHBPQSEKFGACDNEIFG*F2*G1coj2VZACDJACDJBHQSBHPS*McACD*QJBHP*KlACDYWbrAZdmtx07aefhUWbrCVdmXefhr4UYLoACwOVZXafhXaehilq6Xaefglq6M2VZACDJgiq6JVZds1brLcACLMcjgil6b4UYn1brMWx0vXaeuXaedOVZWt07XaefVZdmWtx7bnrsRMjVRVZdbrUYVZdmgilq*K/Wtx"
 };
 
 export const p4_119_health__wellness = {
@@ -525,7 +543,10 @@ export const p4_119_health__wellness = {
     ["prevention is key", "预防是关键", "yù fáng shì guān jiàn", "la prevención es clave", "a prevenção é fundamental"],
     ["physical rehabilitation", "身体康复", "shēn tǐ kāng fù", "rehabilitación física", "reabilitação física"],
     ["rehabilitation center", "康复中心", "kāng fù zhōng xīn", "centro de rehabilitación", "centro de reabilitação"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "*NQMPCJLQtZEFHGNRZCFHJ*CECEHDNRZCEFJAMPCBCEFCEFHBQtCtAPC*BG*C5*Kf*Ln*G1*E3SUAMCE1BLt*KfDGN*C5OU1VadeOS1DTade*N/cfvYhTVXhTVC*PbDGTVdenuzpWfv4TVaeTVadWcv4j02WGXYTOSUlg02WDGNRoqrXTVadbuzplqrXy3bgLlorLloqTVadMBLQ*ERbnzWcf4OTVa67bnp3bgbnupgj2WQOSUgj0WpybgSWcfSWcfx7bnTxbn"
 };
 
 export const p4_120_mental__health__basics = {
@@ -599,7 +620,10 @@ export const p4_120_mental__health__basics = {
     ["burnout symptoms", "倦怠症状", "juàn dài zhèng zhuàng", "síntomas de agotamiento", "sintomas de esgotamento"],
     ["build resilience", "建立韧性", "jiàn lì rèn xìng", "desarrollar resiliencia", "construir resiliência"],
     ["resilience training", "复原力训练", "fù yuán lì xùn liàn", "entrenamiento de resiliencia", "treinamento de resiliência"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "DIKPOSAD*NS*QCGMAIKP*FsFLvELvCCMRTpuBEADKPADIKpADI*NSEFvsCGRJADI*EyBSAADIKmCGM*F2*E3*EA*IlBOADCGMRosQVXcnrnefgVcnrqt3701YdCGMRhjWeEVXnZ01YWfgkWegk*KSGWebjWenlVWbhWeWefgiVWXQCGMiVXcUsQVKHuBYt37LVXcMUoQYq37HpBEEFLCVXcnYbhjWefgCGMRZ1YdZ0Yd*GYRWeYqt7SCGMWefgTWefYqt3"
 };
 
 export const p4_121_technology__advanced = {
@@ -673,7 +697,10 @@ export const p4_121_technology__advanced = {
     ["interface design", "界面设计", "jiè miàn shè jì", "diseño de interfaz", "design de interfaces"],
     ["online platform", "线上平台", "xiàn shàng píng tái", "plataforma en línea", "plataforma online"],
     ["platform update", "平台更新", "píng tái gēng xīn", "actualización de la plataforma", "atualização da plataforma"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "VegySCEI*Iv*EAIKMNOQRTbBfGJYFJYoiWXaCKvBmFGYpCIvPcpsDNOQ*AN*CGDMQENRLcpsOENRETbBBCEIERbBVhjAAhjeHXa5HWa5CFGJwHWXHWX5ERTBLPpsqrikAgyhFlmZyAeijVAeHkndhVAeindgfmZwJflZJikdKFGJKLPcrLdiqLdiLPcpuLPctLPcCIKB*I2ZHW*I0FGJgAeiP3dfCIKtFGJYFGJY*G/zdfSLPcHWXaFGJYFGJY"
 };
 
 export const p4_122_academic__writing = {
@@ -747,7 +774,10 @@ export const p4_122_academic__writing = {
     ["footnote reference", "脚注参考", "jiǎo zhù cān kǎo", "referencia de nota a pie de página", "referência de nota de rodapé"],
     ["text annotation", "文字注释", "wén zì zhù shì", "anotación de texto", "anotação de texto"],
     ["annotation tool", "注释工具", "zhù shì gōng jù", "herramienta de anotación", "ferramenta de anotação"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "QCDEFKaj*LiADEEJORDJORBKajVY14*Mf*NUj*CKDEHJ*EADEOBFajHMNPHLNPHLMPDEJR*PAHLMACDEDEJODEJO*HiHLMdqrvGY14XfgogsWh*IRGV1bxyUDBFKZxyUkwBFUqrvFlpzouWX*DsXsWXegljHmnH*NUi*MfIcwBepz5int6imt6fuWXKelzLUdrLUdqXgWhMimnfoWXNUdqckBFZbyUZbxU*QjelpHLMNGVY4UdqrUdqrSGVYelpzTimnTimn"
 };
 
 export const p4_123_philosophy__ethics = {
@@ -821,7 +851,10 @@ export const p4_123_philosophy__ethics = {
     ["metaphysics question", "形而上学问题", "xíng ér shàng xué wèn tí", "pregunta de metafísica", "questão de metafísica"],
     ["study epistemology", "研究认识论", "yán jiū rèn shí lùn", "estudiar epistemología", "estudar epistemologia"],
     ["epistemology theory", "认识论", "rèn shí lùn", "teoría epistemológica", "teoria epistemológica"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "eioMDFILKGJNFILBCGJMDILBFCJNKORCDFLB*KcCGNCHOR*MVDFIPWjkCGJQ*D3HKRz*KnMWCGJNHKOCfmrzbnxSAVagAUagMPjkuv01dswyt4UVUVgpTnxS7h56YswyAioMSmrzUVap6ZctAeoMHMPWMPWjICGJSfrzTbxSAeiMUVagMPWjSfmzYdwyZ4UVXv01Xu01YdsyTbnSYdswP*LPSfXuv1Xuv0Xuv0SfmrSZtUc7h6*HEThZTch5"
 };
 
 export const p4_124_abstract__concepts = {
@@ -895,7 +928,10 @@ export const p4_124_abstract__concepts = {
     ["dimension of", "的维度", "de wéi dù", "dimensión de", "dimensão de"],
     ["true essence", "真正的本质", "zhēn zhèng de běn zhì", "verdadera esencia", "verdadeira essência"],
     ["essence of", "的本质", "de běn zhì", "esencia de", "essência de"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "KVHIDENAFGMO*BAbEN*ANDNAfCGM*EuCFMAIKQ*NL*JhAHnmjlAoHI*CK*F1*F5dtCFG*ABvDECFGMzCFG1*PNAH*E/Wbv54CF7AHIz4fgACFGRbvAAHIKmrenJejlDCFGDRWvECFGLiCFnqwxFkt0Gh2JGg2JHLdCJlps*NMft0JjpsJnYrJeqwKCFGJjlsenwx*Ad*O1*FneJjlpMfk0JjlpNRWbenqxenqwenqwPU4ffkt5QCFGghJUenqwSUzfSfktfkt0T*KLCF"
 };
 
 export const p4_125_cause__effect = {
@@ -969,7 +1005,10 @@ export const p4_125_cause__effect = {
     ["catalyze reaction", "催化反应", "cuī huà fǎn yìng", "catalizar la reacción", "catalisar reação"],
     ["spark interest", "激发兴趣", "jī fā xìng qù", "despertar interés", "despertar interesse"],
     ["spark debate", "引发辩论", "yǐn fā biàn lùn", "provocar debate", "desencadear debate"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "TwBCXCKLZBKLb*EHqrdHIQehoDMAOTEIQV*CA*D8EHRSXZ*OJ*BJ*P+BBCKPGAOTvUYdGMATBCKL*B+*DCEHJSXZ*IeJRXAwBCNYdFAEHIejl0BJRSCNUdCJRSpz5cDnu6f123ENUYFfWjeFc1GBCKFoDNkmy4Wel0imy4Wej0iky4bu6WFhDNz5acDrv7Dqv7JRSXJRSXvNbnNDqrATBCEHIQikm4p5acWejlcf23cf13cf12ikmycfpzbnuWDqrv"
 };
 
 export const p4_126_certainty__probability = {
@@ -1043,7 +1082,10 @@ export const p4_126_certainty__probability = {
     ["tentative plan", "暂定计划", "zàn dìng jì huà", "plan tentativo", "plano provisório"],
     ["conclusive evidence", "确凿证据", "què záo zhèng jù", "pruebas concluyentes", "evidências conclusivas"],
     ["conclusive proof", "确凿的证据", "què záo de zhèng jù", "prueba concluyente", "prova conclusiva"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "KRSXJGINDEHLCEHLcCDHPmuvhIJNCDELNQCD*JjBGIARSXCDEHCDEHIQCDTWcgFmuv*E9INCEHAKAKRX*IjOWcAalnYbjqOTcgAKRSVbjqCkFPUlnrVYjqEOTWweftfydoeydoOTWcGCDEoxz2VYbqZFPUUanrFPuvUalrz46ex2ioVYbjUalnVYbj037VFPmvFPmudeft2ipobefdo46et37VFPmuxipot07V*Oj*AVozSUaloz4eTt03"
 };
 
 export const p4_127_social__issues = {
@@ -1117,7 +1159,10 @@ export const p4_127_social__issues = {
     ["segregation era", "种族隔离时代", "zhǒng zú gé lí shí dài", "era de la segregación", "era da segregação"],
     ["social marginalization", "社会边缘化", "shè huì biān yuán huà", "marginación social", "marginalização social"],
     ["marginalization of", "边缘化", "biān yuán huà", "marginalización de", "marginalização de"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "HPRBIQAHGJLM*Kc*BCEND*K4*KcdYabiCJLMAPRB*FoBQACGLM*Gm*QCp*Gv*E+*D+CG*Ij*BG*I/CDOACDNAC*D5AHRBIAHAHPB5XEK7Vhodmv2ThotEKCGSEKWFabicknsFYbiFYaiZknsEUmvFf6l6elgqrw4TVotFYabpz01ZcnsgqrwJUdvZcksKTVhK*Gm*QCjgrw4gqw4ZcknTVhoFYabUdm2gqr4Zckn*OpTVhjp012jpzjpz00UdmFYabgqrwSFYaTfelTgqr"
 };
 
 export const p4_128_international__relations = {
@@ -1191,7 +1236,10 @@ export const p4_128_international__relations = {
     ["sovereignty over", "的主权", "de zhǔ quán", "soberanía sobre", "soberania sobre"],
     ["global geopolitics", "全球地缘政治", "quán qiú dì yuán zhèng zhì", "geopolítica global", "geopolítica global"],
     ["geopolitics of", "地缘政治", "dì yuán zhèng zhì", "geopolítica de", "geopolítica de"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "VWisMnCEEGHmELNCDCGH*LaPBICEHmCEGmFPBJIFPBOSTe*KlDNCBnCEDLCE*AK*AEKSFBIM1kDK2l1AKOTe7KOSVAjpAUgoAiszZcAWbfh2XcAWdqu6Yfh2XZAWaqu6KOST*AVYbhVorvYbf2AWszUpx3QDKLR1AKCEGHBMCEKVgrUjx3adu6VgovAWizKOSTadq6Vgor04Uj*Ad*K/UjKOSTAWis4UjpQRlAR3Yb2RUj0UjpSYbfadquTAWi"
 };
 
 export const p4_129_literature = {
@@ -1265,7 +1313,10 @@ export const p4_129_literature = {
     ["verse form", "诗句形式", "shī jù xíng shì", "forma de verso", "forma de verso"],
     ["final stanza", "最后一节", "zuì hòu yī jié", "estrofa final", "estrofe final"],
     ["stanza of", "的节", "de jié", "estrofa de", "estrofe de"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "EJPb+elxLNQSbFMRAJPbDMRThHcdjGrvlOZ1AEPbCLNQCNQSDFRT*DCCLQxIZ1zAEJCLNS3DFMCLNQ7DFMtfgnAYjkXyUtyUWtVjkqCIO1ifghDAEJEGdoEGcoFBlxgn2UiGHfGm0VgHafHVYkVYjqIBexh0VYfg2UGcdpGcdoVYjkHvzBGcdo*DbUfg*DkVYjHrzBVYjkOBelUXtfPHrvhmVYQIOZfgnURAEJGcdo*NYBelGcdoTAEJ"
 };
 
 export const p4_130_art__culture = {
@@ -1339,5 +1390,8 @@ export const p4_130_art__culture = {
     ["renaissance art", "文艺复兴艺术", "wén yì fù xīng yì shù", "arte renacentista", "arte renascentista"],
     ["baroque music", "巴洛克音乐", "bā luò kè yīn yuè", "música barroca", "música barroca"],
     ["baroque style", "巴洛克风格", "bā luò kè fēng gé", "estilo barroco", "estilo barroco"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "BETCACMN*LaBMNbFLRATBCDLRS*Gm*NSU1JoBCkVpsHoBCAETBDFRSBCNO*E+BCMBCMNBCMN1BCM3DFL5DFLAEBCAG1DIpstXYuZWYuZZWXuYaeibDZeDagjd03Ic03IFZaihnr2*EJGbjfnr2jZaebgmvIlZakIqWbgjv*JPfhrKHJBIVstlWXYfhn2MIVpMIVp*BbWXYbgjmODFLbgjmbgjm4fhlcd3IQGUDfhnrRcd0zfhlSbgjIVps*PvIVp"
 };
@@ -81,7 +81,10 @@ export const p5_131_formal__vocabulary__1 = {
     ["inherent in", "固有的", "gù yǒu de", "inherente a", "inerente a"],
     ["attain goal", "达到目标", "dá dào mù biāo", "alcanzar la meta", "atingir a meta"],
     ["attain success", "获得成功", "huò dé chéng gōng", "alcanzar el éxito", "alcançar o sucesso"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "JBDHHIRS*NUKPQTAJBdVXy+LN5hMObBIRSBHRSABDHCPQB*GsFN5GObFFL56GMbF*VTCKQ*JlCKPBHIS*Ev5BH*BBDAJZl02EXy7*Pa*DRdfEVy7hnEVUl0234EGGMOFdEeoEWficop1WdiqjmvWGYnEWdfqgmvWrUYZUZ02*NAgjv*DkYhEcep1ceo1*OkWdfLkUYwceoWdfiswcegjmWceopWdfiPEVXWdfi*MwUZlceopUZl0Ra4E5Sa3S4FLFLN5EVXy"
 };
 
 export const p5_132_formal__vocabulary__2 = {
@@ -155,7 +158,10 @@ export const p5_132_formal__vocabulary__2 = {
     ["subsequent to", "在某事之后", "zài mǒu shì zhī hòu", "posterior a", "após"],
     ["amend constitution", "修改宪法", "xiū gǎi xiàn fǎ", "modificar la constitución", "alterar a constituição"],
     ["amend policy", "修改政策", "xiū gǎi zhèng cè", "modificar la política", "alterar política"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "BVOS*Ft*GH*PRAZMQB*OWGHr*R+FPD*ATEPDDHrCDGrClN*E4JIR7ABNACTEFP*CBCQB*F6*E4IB*NbxASEFDG1CMBIJ7A5*UPAOLEFP0imfAXlvaeh4*GHBVl*Cx*VggjCAOSWeh4xy5IstVXAOSZWah4*DW36WYjkoWae4*KEmUfYgkolIYgIkVXiUf02U0ipYgjoYgjYgjkLDGHtcVXscVXvYgjNVXlOYgjO*Nbbybx5IAOSZ*Wm*DW*M3*GgQAOSU0imf6Wa*Up5Wa*UPS*Upbf3WaIJRA"
 };
 
 export const p5_133_formal__vocabulary__3 = {
@@ -229,7 +235,10 @@ export const p5_133_formal__vocabulary__3 = {
     ["convey meaning", "传达意义", "chuán dá yì yì", "transmitir significado", "transmitir significado"],
     ["designate area", "指定区域", "zhǐ dìng qū yù", "designar área", "designar área"],
     ["designate as", "指定为", "zhǐ dìng wèi", "designar como", "designar como"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "*VORZpEHwANQDIJMPCBHwAKLT1IOSCBEwAOSCN*BIDMPpFLTFKT1DJPCO*VGCQNISC*NNDJM1CND*OXAZpIOCN7*VRFKtjsVabeoBgikWBcdhv45ARpubeoqaeoqdEXrcEXraboq*VfjUtWikm*NOYv4HWgkUtsVWgimnyzAWgikJlyz*A7abeKARZrabeqXcdUVtaUjsVARZpYh45BEHAARZpzPlnyPlnARZpQ*NOFK3RabR2XcYhv5Yhv47TYhT6AR"
 };
 
 export const p5_134_formal__vocabulary__4 = {
@@ -303,7 +312,10 @@ export const p5_134_formal__vocabulary__4 = {
     ["exceed limit", "超出限制", "chāo chū xiàn zhì", "exceder el límite", "exceder o limite"],
     ["exclude from", "从某处中排除", "cóng mǒu chù zhōng pái chú", "excluir de", "excluir de"],
     ["exclude possibility", "排除可能性", "pái chú kě néng xìng", "excluir posibilidad", "excluir possibilidade"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "*D4FINTACDDEGHCEGH*VJCDG*KfAINCDEHCDEGlAFN*VQMAF*QDpCD*WECDEJAFIAFIp*P9CDECDEG1*WMYc*OMCDECDEGBACD*GXis0*EV*D4AWVXbjVWbj*MsQcl*Vgnwamuz2VWXjQYlo*Fg*AWhk47Ui*D8Fgqfqx1dkam*Bw*Wm*Bb*MyVWXb*Pk*GvdhIQYcnauzmJZwQYclKAFIrfgxVWXbUi0ee47Uamz2Udhi*AnxZnwfgqVWXbamu2UiseQfgqamuzQYcle7UiVWXb*V7VWX*V6e4U"
 };
 
 export const p5_135_academic__nouns = {
@@ -377,7 +389,10 @@ export const p5_135_academic__nouns = {
     ["paradigm shift", "范式转变", "fàn shì zhuǎn biàn", "cambio de paradigma", "mudança de paradigma"],
     ["mere conjecture", "纯属猜想", "chún shǔ cāi xiǎng", "mera conjetura", "mera conjectura"],
     ["conjecture about", "推测关于", "tuī cè guān yú", "conjetura sobre", "conjecturar sobre"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "*NUDETPSHIZBPS*NO*OHb*KVdADT*Q8djk*NSMQX*Hh*ASIJ*C0*DJlH*Mf*C8HIHIJLrHIJ*DT*Jn*C5GvHIJxHIJzBSH*Jl1GM3HIJBPHIADEzAhmq*N1AouBbdlBGMQ/HIJCBPSycipD*Kr*Ey*Ofips2EF*FKWfg0t*Lx*KRg0f0etG*NSUmcps2H*MqFk*NoIFj*DJIWbUhqw*NH*L3JFVu6Fcis2UhmwLGMQMcip*Lx*M+ayVo6FNWbdUhmqOGMQacipPADEfget*KHQ*Pd*JlcipsRGMQSGMQFjknTVouTUhm"
 };
 
 export const p5_136_academic__adjectives = {
@@ -451,7 +466,10 @@ export const p5_136_academic__adjectives = {
     ["implicit bias", "隐性偏见", "yǐn xìng piān jiàn", "sesgo implícito", "viés implícito"],
     ["tangential issue", "切线问题", "qiè xiàn wèn tí", "cuestión tangencial", "questão tangencial"],
     ["tangential to", "相切于", "xiāng qiè yú", "tangencial a", "tangencial a"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "BLDFALDF*OLNDE*ASFIK9*F5*CIHeDIK*NO*EL*Dz*NpEJTeDFKMEHTeDFIMABDFDFIKCDEFSDFI*FvDFIABLDDFIKODFI7EHJGbqrckszYuvaEGHJWuvaCptG*NXim2DGUqEVks4hwgFEHJjlnxGoWYwd4gam2WHflnVcszkfjnnai2mJfjgWYuZtGUGUbrGUbqVckzZpGUWYvaWYuahd4gfjlnfjlnVcks*DRfjlGUbqaimWRGUbdhwg*EASGU7TfjTGUb"
 };
 
 export const p5_137_academic__adjectives__2 = {
@@ -525,7 +543,10 @@ export const p5_137_academic__adjectives__2 = {
     ["pertinent to", "与某事相关", "yǔ mǒu shì xiāng guān", "pertinente a", "pertinente a"],
     ["pervasive influence", "广泛影响", "guǎng fàn yǐng xiǎng", "influencia generalizada", "influência generalizada"],
     ["pervasive problem", "普遍存在的问题", "pǔ biàn cún zài de wèn tí", "problema generalizado", "problema generalizado"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "BEJR*PHX*EwAMDLOLOPQABJRH*A9fKXYae*E7FKDNSTA*OEABEFHDIDOPQCDLO*MYISTDLPQDLOQDLOP*EwSAB5*BJRIINSAj37VghmuX*PiBkBW*PH*NOGXaebinsGXYe*LWZindz6Vcz6VfFGX*A9FABhGVmgGVmZbnsU37VWlwZWkwZVghuJZbicdxzKGXYrt1Gqt1G*G4*O8Zbqr1GVghm*DIVghWklZ*HY4ocZbin*Pwcd6GXYaqrtGVghmUj7V*Wm*Bw*MyxSABEcdzVUj3V"
 };
 
 export const p5_138_everyday__legal = {
@@ -599,7 +620,10 @@ export const p5_138_everyday__legal = {
     ["tort law", "侵权法", "qīn quán fǎ", "ley de daños", "direito civil"],
     ["criminal indictment", "刑事起诉书", "xíng shì qǐ sù shū", "acusación penal", "acusação criminal"],
     ["indictment against", "起诉书", "qǐ sù shū", "acusación contra", "acusação contra"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "CJKNME5DAJKNbACE5BDM*Le*PEf*R0FOPQSBME*ALcfLACKN*WKACJRWjvBE5DvACJ*HlFGP*NV*NbFG*Q/*KYFG*R0*OLLWHBMEFGOP*GUYZaadehLRjvFGOPCZtuCYtuhnpwDFGO*OqIfLekmodkmo*PdF*Qb*Ler26dGanpACJKLRWvIdemqzgrdekoahpwdekmahnwlzgrg26dFGOPYZuINYZtNLRWOahndekmPahnlqgr*GZdek*RbQahgr6ddekmACJKEBDMgr2ddekm"
 };
 
 export const p5_139_everyday__medical = {
@@ -673,7 +697,10 @@ export const p5_139_everyday__medical = {
     ["inpatient treatment", "住院治疗", "zhù yuàn zhì liáo", "tratamiento hospitalario", "tratamento hospitalar"],
     ["good prognosis", "预后良好", "yù hòu liáng hǎo", "buen pronóstico", "bom prognóstico"],
     ["prognosis is", "预后是", "yù hòu shì", "el pronóstico es", "prognóstico é"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "HoDE*D3CFPBFPSGMAHAHKL*Gy*LWeBDMAHAoDElNpBOQRlLEAHKEAHDGAHIpBCwJQRz*JpBCJORlSJOQRBCF7BCFYadfgjrthiyZm12ZCUadx03WUYdfkuUWBCFPUYafFwUVFUYaVjrtWiyZWhyZVgrtbuUWIJOQX12Z5Xm1KAHDINBCBCFPVgjtMJOQVgjrbkUWNVgjOeUVZ03WzWhiPVgjZx3WXm2ZXm1ZZx0WSUYaXm12TUYaTVgj"
 };
 
 export const p5_140_everyday__finance = {
@@ -747,7 +774,10 @@ export const p5_140_everyday__finance = {
     ["accrual basis", "权责发生制", "quán zé fā shēng zhì", "base devengada", "regime de competência"],
     ["loan amortization", "贷款摊销", "dài kuǎn tān xiāo", "amortización de préstamos", "amortização de empréstimos"],
     ["amortization schedule", "摊销时间表", "tān xiāo shí jiān biǎo", "calendario de amortización", "cronograma de amortização"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "GJLNCFIDBFIDBCEFKADGBCIDAJLNOWepBCFDAGLNpEAD*NIAGJ*MfahvAGJLHWepUXglRYdH3QYdAGJL*KY*Q/6VPXglUTm3HOepgPUlQRdHAGJLbMhvDAGJkow0EQRYHOWp6ijxXPUlGMavfjx4fix4cow0PUXgTV35rcfickw0KHOWty12ncfi7uzqqy12zqtyNMahcko0fij4Pqt1uqtyQckoqty2qty1RTVmfijxTVm3Tfqtsuzq"
 };
 
 export const p5_141_research__statistics = {
@@ -821,7 +851,10 @@ export const p5_141_research__statistics = {
     ["correlation between", "之间的相关性", "zhī jiān de xiāng guān xìng", "correlación entre", "correlação entre"],
     ["calculate median", "计算中位数", "jì suàn zhōng wèi shù", "calcular la mediana", "calcular mediana"],
     ["median value", "中值", "zhōng zhí", "valor mediano", "valor mediano"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "BCKMAXDEAKMNbBEPBDPgHRhnTQJLFRhnkFHJ*MUnLO*NRACMJOIQACKN*EAv*AQAJLIQz*D8*LQBGJLO*HvFHhACKM*OKGQJs4WYXAjoYUs4VBZbWUs4CXbebDdiDaXZdEfyEaiwXZbl*Wccy0qBDEFHRn*NWadwHVo6IBDEXZbeXZbeJFHRKVj6tWYUgrzVqzVj*BeU4WpWYUNXZb*ElN*Pd*EAadixadiwPcf0P*Llqrcfy2XZbecfy0XZbeUsWY*Lx*EPcfVjoXACKM"
 };
 
 export const p5_142_psychology__basics = {
@@ -895,7 +928,10 @@ export const p5_142_psychology__basics = {
     ["conditioning process", "调理过程", "tiáo lǐ guò chéng", "proceso de acondicionamiento", "processo de condicionamento"],
     ["human psyche", "人类心理", "rén lèi xīn lǐ", "psique humana", "psique humana"],
     ["psyche of", "的心理", "de xīn lǐ", "psique de", "psique de"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "*CHCOBX*DzEN*NU*Le*NOATHPR*Q/d*G0*IvNGL7FL7APRDFJMZeIMZeoSXd*C5rFGIJZeFBEb*MaACBHRDFDTHPHPDF*OV*O7*PJK7DHPWghi*P1mckUghiB*ELKSuwzUCIJMfUWgBENrp5VmE*Q/KSIJMZaUWgUWhiUWgiUWghKSXdlx4Vkx4VVcklJsYcKUWgc5VmIJMZLBENMnYcklx4YwzUUWghYuzUkl4VKSXdYuwUUWgh*M7BENIJMZKSXdklxV*Pn*GYcpBEKNTFGL"
 };
 
 export const p5_143_sociology__basics = {
@@ -969,7 +1005,10 @@ export const p5_143_sociology__basics = {
     ["mobility between", "之间的流动性", "zhī jiān de liú dòng xìng", "movilidad entre", "mobilidade entre"],
     ["social conformity", "社会整合", "shè huì zhěng hé", "conformidad social", "conformidade social"],
     ["conformity to", "符合", "fú hé", "conformidad con", "conformidade com"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "VGLPICFDFBDIXCFBwdRVCBDI*Qo*Hl*P2*QIjlJOBCFDSHlDpmx1AGPYtNQa*DwvMQ*Gp*PE*KW*R0zAGL1MNa3EVfJHlD7OWkgdshA*KLEROTkABDCFAGLPAGLPYMNQMNQayou0EUgsAGLPERVzUwEd*Ed*EP*KRUaq35HAGLOTWAHJOSKx14*EX*DM*MsJKu0yKrtvLri3qLptMUdgMprvo0y2NprtEgprOKm1cou0PERVouy2QKmxRhouRiq5*QNKmx*Ol*O/iqprtvTMNQ"
 };
 
 export const p5_144_critical__thinking = {
@@ -1043,7 +1082,10 @@ export const p5_144_critical__thinking = {
     ["probe into", "探究", "tàn jiū", "investigar", "investigar"],
     ["logical deduction", "逻辑演绎", "luó jí yǎn yì", "deducción lógica", "dedução lógica"],
     ["deduction from", "扣除自", "kòu chú zì", "deducción de", "dedução de"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "MghECDHPBDHPBCHPTef5SGJNJNBCBCDP*JhKLOGNBCILOQIKOQ*F1Agh*KkGJBIKLQBCDHIKLOIKLOFGJN*D5*IoEer0VWpWUm*BbmVUZ4AMcj27X4AMlnoqik1aEYj2pwx6ETf5ETe5*DMAMh*VhAMgjbk1iYc2*A0bi1anoq*DWsu3aloqqaln*Wvdwxoaln*Bw*DWmUmu3VMalnms3V*LJzXYdpx6dpw6alnovXYZ*AmUrVbikaYcj7msuVXZAMETefdpwx*EXgTY"
 };
 
 export const p5_145_debate__argument = {
@@ -1117,7 +1159,10 @@ export const p5_145_debate__argument = {
     ["rebuttal to", "反驳", "fǎn bó", "refutación a", "refutação para"],
     ["initial proposition", "初步提议", "chū bù tí yì", "proposición inicial", "proposta inicial"],
     ["proposition that", "提议", "tí yì", "propuesta que", "proposição de que"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "*InCFDMZGHZAFDELACDLAC*CHACD*Dz/*Ct*KWjGr1QRSAn*JiNT*D2dns*ONDAC*AC*KW*DwBT*GzJVYacgz*FGaX1IRSIQSA5IQR*BKN*GzJbejJJNTfqPXlPluvOacgCBMGdOYcUejJOYagaKnsfUbjJNTV*EUGOY*EyGOYop6wHUbeOYackPXuwxyiJKdspKi6oKi6WPXlGH15MKdn*EFMKdNPXl7NPXOximOwimPmwxP0WizWioQGHr3PXl2OYaKdnsSGHr*GDiopvTPX"
 };
 
 export const p5_146_negotiation = {
@@ -1191,7 +1236,10 @@ export const p5_146_negotiation = {
     ["ratify treaty", "批准条约", "pī zhǔn tiáo yuē", "ratificar el tratado", "ratificar o tratado"],
     ["conciliate parties", "调解各方", "tiáo jiě gè fāng", "conciliar partes", "conciliar as partes"],
     ["conciliate between", "之间进行调解", "zhī jiān jìn xíng tiáo jiě", "conciliar entre", "conciliar entre"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "*FxEHMGIL0Z*VGDP*Dzb*NOCdAHMfeZb*JrBIL*Eu*G1AE*DFBGL*NTnSBOn1ArBGIAEHruXdwKn1ACDRTJSBG*Km3CD*A/JBG*CJCDPVAmoUacfBCDPNdwCCk24C*VGFbDVcfD*EL*DzFVafgENXwFjtYFVacVacf*VwVac67ejgetYY24VFZbp*HAUo3JKO1Um3FKFZbFZblLAEHviy6ejYiNVacsiy6ONXdOFZbsvi6ysviQBGIKOnA3RYkR*KmUm*GUYk2FZbli7ej*MJi6e"
 };
 
 export const p5_147_project__management = {
@@ -1265,7 +1313,10 @@ export const p5_147_project__management = {
     ["roadmap for", "路线图用于", "lù xiàn tú yòng yú", "hoja de ruta para", "roteiro para"],
     ["product backlog", "的路线图产品积压", "de lù xiàn tú chǎn pǐn jī yā", "cartera de productos", "carteira de produtos"],
     ["backlog items", "积压项目", "jī yā xiàng mù", "elementos pendientes", "itens do backlog"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "QGRSDNOIYZHLBNOI*Gpd*Le*ABfEJPAQRS*Fp*F/CLM2BDEFPVpYZeCHXxI2BDBDOIBDNIEFJVAGRS*A92STRTBDRSBDdf7CEFJPijyKBCHLCKZeCKYe*AWckphnmrakpq*HDE*El*KHFKYZFUd7EFJPKYZej*F+H*F/iH*F+*F/*DYacpKYZesabc*LN*GYbmrwbnK*ElacLackwbnmmabcackp*WbackKYZe*GbrbnOCHLzPWiyPKYackpackpR*LWIMKYZeKYZeSEFJKYZeUdfC"
 };
 
 export const p5_148_business__advanced = {
@@ -1339,7 +1390,10 @@ export const p5_148_business__advanced = {
     ["synergy between", "之间的协同", "zhī jiān de xié tóng", "sinergia entre", "sinergia entre"],
     ["portfolio diversification", "投资组合多元化", "tóu zī zǔ hé duō yuán huà", "diversificación de carteras", "diversificação da carteira"],
     ["diversification strategy", "多元化战略", "duō yuán huà zhàn lüè", "estrategia de diversificación", "estratégia de diversificação"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "dsGR*DCCESBESnHBCEBCSnfINPhRZf*C+DBCFNPQKLDHJLDHJKDHtrBCFIPQWtFGFINQFINP3GZfBCEn*R3ai07uwx2guwBOtFY5TaX5TaGRfATi01DFINhjmoAsGRklTaFGRZeVyzGcjmTa01chmoelTaekTachjoJBCEchjm*WGKBCchjmMBCE*LWMAdMOWFwxV2NchjuxV2uwV2zegkyegkTai1Tai0VguwRchjchjmXYTa7UuwU6uw"
 };
 
 export const p5_149_environmental__science = {
@@ -1413,7 +1467,10 @@ export const p5_149_environmental__science = {
     ["ozone depletion", "臭氧层破坏", "chòu yǎng céng pò huài", "agotamiento del ozono", "destruição da camada de ozono"],
     ["protect watershed", "保护分水岭", "bǎo hù fēn shuǐ lǐng", "proteger la cuenca", "proteger bacia hidrográfica"],
     ["watershed area", "流域面积", "liú yù miàn jī", "área de cuenca", "área da bacia hidrográfica"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "PSRTix35OlDEQabEd*D1*NODfGJzFJz2*G0*KYINlHN4nFGzDEMQdyBiDEKQHI4Fx*GvGCASRTDEKMAPSTAPRTVHINDEKMTHINemrsqYopZopwYCcgDQbjDQajEZghE*SjLymrsWF*DZDEZchaZcgaHBx3*HZabkabjuICODersWJDEKYpw0Yow0LXYoemsWXqYeMYZcabjky6LaYop0OBi3vNLdFGJ2aYopYopwFGJzBix5HINFBix3vLabTDEK"
 };
 
 export const p5_150_literary__devices = {
@@ -1487,7 +1544,10 @@ export const p5_150_literary__devices = {
     ["assonance in", "谐音于", "xié yīn yú", "asonancia en", "assonância em"],
     ["use synecdoche", "使用提喻法", "shǐ yòng tí yù fǎ", "utilizar sinécdoque", "usar sinédoque"],
     ["synecdoche for", "提喻", "tí yù", "sinécdoque para", "sinédoque para"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "*G1*Gp*LeUXHJLFPpEba*QP*LaIBCFfCPpgOmqjBJLlEBCnBHLCFPprBHJtBHJvjnrx*NVGmCFpE1oz423AX5BHJ67lBADYZhuaigk13BARdDUZcDUYcDb*QPiDaWgDUYZEARXDUYZFBHJGWk1GVuaawVbHNnrWg13ITBHJGOqJNjrQz4DKCFPLGOmLNjnDUYZMARXVhaiN*ELGOOaiVODUYGOmqQo4DVhuaQWgkRDUYRWgkQozDSNjnTGOmTGOm"
 };
 
 export const p5_151_advanced__idioms = {
@@ -1546,7 +1606,10 @@ export const p5_151_advanced__idioms = {
     ["at the end of the day it", "归根结底，它", "guī gēn jié dǐ， tā", "al final del día", "no final das contas,"],
     ["we see eye to eye on", "我们意见一致", "wǒ men yì jiàn yí zhì", "estamos de acuerdo", "estamos de acordo"],
     ["don't see eye to eye", "意见不一致", "yì jiàn bù yī zhì", "no están de acuerdo", "não estamos de acordo"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {"16": "11111121111", "32": "12111111", "42": "11121"},
+  distractors: "nCJNDEoKUJSVBEoKoBDKaHUWbIRYFUWCfgGRihCSLrsElmKroOBDqAKLMBDEAXabTZadGIYlBCJVZdfgCFHWDCJSDFHUPabhEGIRTdfgFhPQGijpeTZdTZfgcTZdgITZfITZJaPQJbjpbipPKGIRLGIRLGIRACJNMEBDqNbiNpCJOKLsOKLr"
 };
 
 export const p5_152_business__idioms = {
@@ -1605,7 +1668,10 @@ export const p5_152_business__idioms = {
     ["bring to the table something", "把一些东西带到餐桌上", "bǎ yī xiē dōng xī dài dào cān zhuō shàng", "traer a la mesa algo", "trazer algo para a mesa"],
     ["really move the needle", "真正推动针", "zhēn zhèng tuī dòng zhēn", "realmente mueve la aguja", "realmente mova a agulha"],
     ["move the needle on", "将针移至", "jiāng zhēn yí zhì", "mueve la aguja", "mova a agulha"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "PQRXfDHLGKJFWLMNYXUWIJCGCKJFOBfDFJCGCFGKCGJFDMNTnDLNDLMTsHBfAVlmAqPVSAXcBRnrCDLMEWZaPlmpDEUZEARcEeAREUWaEUWZEUWZARXhHjESYARSBDHLEUWZARXcDELMdESUKDLMmpAPlpAPMSrYMARXlmAPPVQlOSnYODLM"
 };
 
 export const p5_153_formal__connectors = {
@@ -1679,7 +1745,10 @@ export const p5_153_formal__connectors = {
     ["thereby increasing", "从而增加", "cóng ér zēng jiā", "aumentando así", "aumentando assim"],
     ["herein referred", "本文提及", "běn wén tí jí", "aquí referido", "aqui referido"],
     ["herein lies", "问题在此", "wèn tí zài cǐ", "aquí yace", "aqui está"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "UlFLCJTHBJTHBCJTMNQw*B1*BOfnghmoSIObTHOSBCTHPEHIRWYZsENQRuvEwHISyKEHEMNwNLWYHIObIBCJAcfjh2egYLRZaFUcWLRZLRWYXFUcHIOSUfjpt1GmVh2g*B1F*BOUhG02gG2VkHLRUcfpilIL7kAFGoqxFsuvpGmqoUcfLGmoLUcfMkFnd1GmvNFnuNikOEMNGmoqPzLRyPFngh23dtGmhVg05dgtGmoq3dgtUcfjlLRW"
 };
 
 export const p5_154_advanced__verbs = {
@@ -1737,7 +1806,7 @@ export const p5_154_advanced__verbs = {
     ["elucidate the", "阐明", "chǎn míng", "dilucidar el", "elucidar o"],
     ["delineate between", "划定", "huà dìng", "delimitar entre", "delinear entre"],
     ["delineate clearly", "清楚勾画", "qīng chǔ gōu huà", "delinear claramente", "delinear claramente"],
-    ["extrapolate from", "从...推断", "cóng tuī duàn", "extrapolar de", "extrapolar de"],
+    ["extrapolate from", "从...推断", "cóng... tuī duàn", "extrapolar de", "extrapolar de"],
     ["extrapolate data", "推断数据", "tuī duàn shù jù", "extrapolar datos", "extrapolar dados"],
     ["postulate that", "假设", "jiǎ shè", "postula que", "postular que"],
     ["postulate theory", "假设理论", "jiǎ shè lǐ lùn", "teoría de postulados", "teoria dos postulados"],
@@ -1753,7 +1822,10 @@ export const p5_154_advanced__verbs = {
     ["ameliorate suffering", "减轻痛苦", "jiǎn qīng tòng kǔ", "mejorar el sufrimiento", "amenizar o sofrimento"],
     ["promulgate rules", "颁布规则", "bān bù guī zé", "promulgar reglas", "promulgar regras"],
     ["promulgate law", "颁布法律", "bān bù fǎ lǜ", "promulgar ley", "promulgar lei"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {"44": "411"},
+  distractors: "*CF*OGGQWEKLDFAG*C4CFAcdBKCDAGhAQBRSTY*B4lWcMVHI*C9pBE*CLBEKJVHI*APBEKBEKLBEKLAGBEHSTYHRTY7HRS*CF*OGGQAJMHBXIcWBauHRST*CXinx*DNXuw*MtHRSdEIWcEIWIWcdIWcdjozXGHRSZnx0HgozlIy2IkmqJlqrx034gjzXKIWc*OllmrlmqktMv6sMv6wvNXust6uOXan034k2lmgjoX*Dvnx3*DuQIWkylmnx04nx03nx037TstT6Xa"
 };
 
 export const p5_155_nuanced__adjectives = {
@@ -1827,5 +1899,8 @@ export const p5_155_nuanced__adjectives = {
     ["ephemeral moment", "短暂的时刻", "duǎn zàn de shí kè", "momento efímero", "momento efêmero"],
     ["arduous task", "任务艰巨", "rèn wù jiān jù", "ardua tarea", "tarefa árdua"],
     ["arduous journey", "艰辛的旅程", "jiān xīn de lǚ chéng", "viaje arduo", "jornada árdua"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "KNPD*NMCEG*C/BEGFISA*Ql*QGGQDISAEQTBJLMR*GuDFSHLMR*DEANPHJMRNHJLMAKPdlWXAKNDEGTBHJLMDFIAEGQBewVkmpvxXYhOWYhOZWXhY*Puij*J3br2ar2Vg6AKcOlWUwVktuabc6AKWXYOZjnqZinq*Bw*DW*GgzIOdWVpvxZijqKs13VmvxZijnab2Vo134*M1fuavftauVmpxOUewOVmVmpvk0UekzUeos34abrVos14os13os13cgAKZijn"
 };
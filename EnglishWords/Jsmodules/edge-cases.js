@@ -21,7 +21,10 @@ export const p2_69_money__banking = {
   words: [
     ["ATM machine", "ATM机", "A T M jī", "Cajero automático", "Caixa eletrônico"],
     ["find ATM", "查找 ATM", "chá zhǎo A T M", "encontrar cajero automático", "encontrar caixa eletrônico"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "BDGHACFG"
 };
 
 export const p4_117_biology__basics = {
@@ -35,7 +38,10 @@ export const p4_117_biology__basics = {
   words: [
     ["DNA test", "DNA测试", "D N A cè shì", "Prueba de ADN", "Teste de ADN"],
     ["DNA sequence", "DNA序列", "D N A xù liè", "Secuencia de ADN", "Sequência de DNA"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "B*ABDEAF*AAE"
 };
 
 export const p5_139_everyday__medical = {
@@ -51,7 +57,10 @@ export const p5_139_everyday__medical = {
     ["CT scan", "CT扫描", "C T sǎo miáo", "Tomografía computarizada", "Tomografia computadorizada"],
     ["chest x-ray", "胸部X光检查", "xiōng bù X guāng jiǎn chá", "radiografía de tórax", "radiografia de tórax"],
     ["x-ray results", "X射线结果", "X shè xiàn jié guǒ", "resultados de radiografías", "resultados de raios X"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "BCD*ABACD*ABDBA*AACBA*AD"
 };
 
 export const p5_143_sociology__basics = {
@@ -64,5 +73,8 @@ export const p5_143_sociology__basics = {
   },
   words: [
     ["collectivism vs", "集体主义 vs", "jí tǐ zhǔ yì v s", "colectivismo vs", "coletivismo vs"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "*AD*AH*AA*AG"
 };
@@ -0,0 +1,178 @@
+// Language catalog - generated by PythonHelpers/build_catalog.py, do not edit
+// Acts, packs, titles and word counts for the selectors, without decoding the act modules
+
+export const catalog = {
+  "language": "english",
+  "acts": [
+    {"act": 1, "actName": "Foundation", "url": "./Jsmodules-js/act1-foundation-js.js", "sha256": "ca4fcd487eaecf6b2f47f04a92d8452ad23800ae8293e18014116831a0f0dc5c", "bytes": 123932, "actMeta": {"actNumber": 1, "actName": "Foundation", "wordColumns": ["english", "chinese", "pinyin", "spanish", "portuguese"], "translations": {"chinese": {"index": 1, "display": "中文"}, "spanish": {"index": 3, "display": "Español"}, "portuguese": {"index": 4, "display": "Português"}}, "defaultTranslation": "chinese"}, "packs": [
+      {"key": "p1_1_greetings__basics", "wordpack": 1, "titles": {"english": "Greetings & Basics", "chinese": "Greetings & Basics", "pinyin": "Greetings & Basics", "portuguese": "Greetings & Basics"}, "base": 20, "example": 40},
+      {"key": "p1_2_numbers__120", "wordpack": 2, "titles": {"english": "Numbers 1-20", "chinese": "Numbers 1-20", "pinyin": "Numbers 1-20", "portuguese": "Numbers 1-20"}, "base": 20, "example": 40},
+      {"key": "p1_3_numbers__counting", "wordpack": 3, "titles": {"english": "Numbers & Counting", "chinese": "Numbers & Counting", "pinyin": "Numbers & Counting", "portuguese": "Numbers & Counting"}, "base": 20, "example": 40},
+      {"key": "p1_4_articles__determiners", "wordpack": 4, "titles": {"english": "Articles & Determiners", "chinese": "Articles & Determiners", "pinyin": "Articles & Determiners", "portuguese": "Articles & Determiners"}, "base": 20, "example": 40},
+      {"key": "p1_5_quantifiers", "wordpack": 5, "titles": {"english": "Quantifiers", "chinese": "Quantifiers", "pinyin": "Quantifiers", "portuguese": "Quantifiers"}, "base": 20, "example": 40},
+      {"key": "p1_6_contractions", "wordpack": 6, "titles": {"english": "Contractions", "chinese": "Contractions", "pinyin": "Contractions", "portuguese": "Contractions"}, "base": 20, "example": 40},
+      {"key": "p1_7_contractions__2", "wordpack": 7, "titles": {"english": "Contractions 2", "chinese": "Contractions 2", "pinyin": "Contractions 2", "portuguese": "Contractions 2"}, "base": 20, "example": 40},
+      {"key": "p1_8_common__expressions", "wordpack": 8, "titles": {"english": "Common Expressions", "chinese": "Common Expressions", "pinyin": "Common Expressions", "portuguese": "Common Expressions"}, "base": 20, "example": 40},
+      {"key": "p1_9_colors", "wordpack": 9, "titles": {"english": "Colors", "chinese": "Colors", "pinyin": "Colors", "portuguese": "Colors"}, "base": 20, "example": 40},
+      {"key": "p1_10_days__time", "wordpack": 10, "titles": {"english": "Days & Time", "chinese": "Days & Time", "pinyin": "Days & Time", "portuguese": "Days & Time"}, "base": 20, "example": 40},
+      {"key": "p1_11_months__seasons", "wordpack": 11, "titles": {"english": "Months & Seasons", "chinese": "Months & Seasons", "pinyin": "Months & Seasons", "portuguese": "Months & Seasons"}, "base": 20, "example": 40},
+      {"key": "p1_12_family", "wordpack": 12, "titles": {"english": "Family", "chinese": "Family", "pinyin": "Family", "portuguese": "Family"}, "base": 20, "example": 40},
+      {"key": "p1_13_body__parts", "wordpack": 13, "titles": {"english": "Body Parts", "chinese": "Body Parts", "pinyin": "Body Parts", "portuguese": "Body Parts"}, "base": 20, "example": 40},
+      {"key": "p1_14_personal__pronouns", "wordpack": 14, "titles": {"english": "Personal Pronouns", "chinese": "Personal Pronouns", "pinyin": "Personal Pronouns", "portuguese": "Personal Pronouns"}, "base": 20, "example": 40},
+      {"key": "p1_15_possessives__relatives", "wordpack": 15, "titles": {"english": "Possessives & Relatives", "chinese": "Possessives & Relatives", "pinyin": "Possessives & Relatives", "portuguese": "Possessives & Relatives"}, "base": 20, "example": 40},
+      {"key": "p1_16_question__words", "wordpack": 16, "titles": {"english": "Question Words", "chinese": "Question Words", "pinyin": "Question Words", "portuguese": "Question Words"}, "base": 20, "example": 40},
+      {"key": "p1_17_modal__verbs", "wordpack": 17, "titles": {"english": "Modal Verbs", "chinese": "Modal Verbs", "pinyin": "Modal Verbs", "portuguese": "Modal Verbs"}, "base": 20, "example": 40},
+      {"key": "p1_18_essential__verbs__be__have", "wordpack": 18, "titles": {"english": "Essential Verbs: Be & Have", "chinese": "Essential Verbs: Be & Have", "pinyin": "Essential Verbs: Be & Have", "portuguese": "Essential Verbs: Be & Have"}, "base": 20, "example": 40},
+      {"key": "p1_19_essential__verbs__go__come", "wordpack": 19, "titles": {"english": "Essential Verbs: Go & Come", "chinese": "Essential Verbs: Go & Come", "pinyin": "Essential Verbs: Go & Come", "portuguese": "Essential Verbs: Go & Come"}, "base": 20, "example": 40},
+      {"key": "p1_20_essential__verbs__common__actions", "wordpack": 20, "titles": {"english": "Essential Verbs: Common Actions", "chinese": "Essential Verbs: Common Actions", "pinyin": "Essential Verbs: Common Actions", "portuguese": "Essential Verbs: Common Actions"}, "base": 20, "example": 40},
+      {"key": "p1_21_essential__verbs__daily__actions", "wordpack": 21, "titles": {"english": "Essential Verbs: Daily Actions", "chinese": "Essential Verbs: Daily Actions", "pinyin": "Essential Verbs: Daily Actions", "portuguese": "Essential Verbs: Daily Actions"}, "base": 20, "example": 40},
+      {"key": "p1_22_essential__verbs__communication", "wordpack": 22, "titles": {"english": "Essential Verbs: Communication", "chinese": "Essential Verbs: Communication", "pinyin": "Essential Verbs: Communication", "portuguese": "Essential Verbs: Communication"}, "base": 20, "example": 40},
+      {"key": "p1_23_irregular__verbs__1", "wordpack": 23, "titles": {"english": "Irregular Verbs 1", "chinese": "Irregular Verbs 1", "pinyin": "Irregular Verbs 1", "portuguese": "Irregular Verbs 1"}, "base": 20, "example": 40},
+      {"key": "p1_24_irregular__verbs__2", "wordpack": 24, "titles": {"english": "Irregular Verbs 2", "chinese": "Irregular Verbs 2", "pinyin": "Irregular Verbs 2", "portuguese": "Irregular Verbs 2"}, "base": 20, "example": 40},
+      {"key": "p1_25_irregular__verbs__3", "wordpack": 25, "titles": {"english": "Irregular Verbs 3", "chinese": "Irregular Verbs 3", "pinyin": "Irregular Verbs 3", "portuguese": "Irregular Verbs 3"}, "base": 20, "example": 40},
+      {"key": "p1_26_irregular__verbs__4", "wordpack": 26, "titles": {"english": "Irregular Verbs 4", "chinese": "Irregular Verbs 4", "pinyin": "Irregular Verbs 4", "portuguese": "Irregular Verbs 4"}, "base": 20, "example": 40},
+      {"key": "p1_27_essential__adjectives__1", "wordpack": 27, "titles": {"english": "Essential Adjectives 1", "chinese": "Essential Adjectives 1", "pinyin": "Essential Adjectives 1", "portuguese": "Essential Adjectives 1"}, "base": 20, "example": 40},
+      {"key": "p1_28_essential__adjectives__2", "wordpack": 28, "titles": {"english": "Essential Adjectives 2", "chinese": "Essential Adjectives 2", "pinyin": "Essential Adjectives 2", "portuguese": "Essential Adjectives 2"}, "base": 20, "example": 40},
+      {"key": "p1_29_basic__emotions", "wordpack": 29, "titles": {"english": "Basic Emotions", "chinese": "Basic Emotions", "pinyin": "Basic Emotions", "portuguese": "Basic Emotions"}, "base": 20, "example": 40},
+      {"key": "p1_30_common__animals", "wordpack": 30, "titles": {"english": "Common Animals", "chinese": "Common Animals", "pinyin": "Common Animals", "portuguese": "Common Animals"}, "base": 20, "example": 40},
+      {"key": "p1_31_home__rooms", "wordpack": 31, "titles": {"english": "Home & Rooms", "chinese": "Home & Rooms", "pinyin": "Home & Rooms", "portuguese": "Home & Rooms"}, "base": 20, "example": 40},
+      {"key": "p1_32_food__basics", "wordpack": 32, "titles": {"english": "Food Basics", "chinese": "Food Basics", "pinyin": "Food Basics", "portuguese": "Food Basics"}, "base": 20, "example": 40},
+      {"key": "p1_33_drinks__meals", "wordpack": 33, "titles": {"english": "Drinks & Meals", "chinese": "Drinks & Meals", "pinyin": "Drinks & Meals", "portuguese": "Drinks & Meals"}, "base": 20, "example": 40},
+      {"key": "p1_34_clothing", "wordpack": 34, "titles": {"english": "Clothing", "chinese": "Clothing", "pinyin": "Clothing", "portuguese": "Clothing"}, "base": 20, "example": 40},
+      {"key": "p1_35_weather", "wordpack": 35, "titles": {"english": "Weather", "chinese": "Weather", "pinyin": "Weather", "portuguese": "Weather"}, "base": 20, "example": 40},
+      {"key": "p1_36_prepositions__of__place", "wordpack": 36, "titles": {"english": "Prepositions of Place", "chinese": "Prepositions of Place", "pinyin": "Prepositions of Place", "portuguese": "Prepositions of Place"}, "base": 20, "example": 40},
+      {"key": "p1_37_prepositions__of__time__other", "wordpack": 37, "titles": {"english": "Prepositions of Time & Other", "chinese": "Prepositions of Time & Other", "pinyin": "Prepositions of Time & Other", "portuguese": "Prepositions of Time & Other"}, "base": 20, "example": 40},
+      {"key": "p1_38_time__expressions", "wordpack": 38, "titles": {"english": "Time Expressions", "chinese": "Time Expressions", "pinyin": "Time Expressions", "portuguese": "Time Expressions"}, "base": 20, "example": 40},
+      {"key": "p1_39_negatives__limits", "wordpack": 39, "titles": {"english": "Negatives & Limits", "chinese": "Negatives & Limits", "pinyin": "Negatives & Limits", "portuguese": "Negatives & Limits"}, "base": 20, "example": 40},
+      {"key": "p1_40_basic__transportation", "wordpack": 40, "titles": {"english": "Basic Transportation", "chinese": "Basic Transportation", "pinyin": "Basic Transportation", "portuguese": "Basic Transportation"}, "base": 20, "example": 40},
+      {"key": "p1_41_common__nouns", "wordpack": 41, "titles": {"english": "Common Nouns", "chinese": "Common Nouns", "pinyin": "Common Nouns", "portuguese": "Common Nouns"}, "base": 20, "example": 40},
+      {"key": "p1_42_more__common__nouns", "wordpack": 42, "titles": {"english": "More Common Nouns", "chinese": "More Common Nouns", "pinyin": "More Common Nouns", "portuguese": "More Common Nouns"}, "base": 20, "example": 40},
+      {"key": "p1_43_places__in__town", "wordpack": 43, "titles": {"english": "Places in Town", "chinese": "Places in Town", "pinyin": "Places in Town", "portuguese": "Places in Town"}, "base": 20, "example": 40},
+      {"key": "p1_44_casual__informal__english", "wordpack": 44, "titles": {"english": "Casual & Informal English", "chinese": "Casual & Informal English", "pinyin": "Casual & Informal English", "portuguese": "Casual & Informal English"}, "base": 20, "example": 40},
+      {"key": "p1_45_filler__words__reactions", "wordpack": 45, "titles": {"english": "Filler Words & Reactions", "chinese": "Filler Words & Reactions", "pinyin": "Filler Words & Reactions", "portuguese": "Filler Words & Reactions"}, "base": 20, "example": 40},
+      {"key": "p1_156_question__patterns", "wordpack": 156, "titles": {"english": "Question Patterns", "chinese": "Question Patterns", "pinyin": "Question Patterns", "portuguese": "Question Patterns"}, "base": 20, "example": 40},
+      {"key": "p1_157_response__patterns", "wordpack": 157, "titles": {"english": "Response Patterns", "chinese": "Response Patterns", "pinyin": "Response Patterns", "portuguese": "Response Patterns"}, "base": 20, "example": 40},
+      {"key": "p1_158_negative__patterns", "wordpack": 158, "titles": {"english": "Negative Patterns", "chinese": "Negative Patterns", "pinyin": "Negative Patterns", "portuguese": "Negative Patterns"}, "base": 20, "example": 40},
+      {"key": "p1_159_agreement__disagreement", "wordpack": 159, "titles": {"english": "Agreement & Disagreement", "chinese": "Agreement & Disagreement", "pinyin": "Agreement & Disagreement", "portuguese": "Agreement & Disagreement"}, "base": 20, "example": 40}
+    ]},
+    {"act": 2, "actName": "Building Blocks", "url": "./Jsmodules-js/act2-building-blocks-js.js", "sha256": "72dd9f801e91fe4f79b18ae4cb0dc37956d62c4bf7f79f1db653fb23f3e7bbd8", "bytes": 96660, "actMeta": {"actNumber": 2, "actName": "Building Blocks", "wordColumns": ["english", "chinese", "pinyin", "spanish", "portuguese"], "translations": {"chinese": {"index": 1, "display": "中文"}, "spanish": {"index": 3, "display": "Español"}, "portuguese": {"index": 4, "display": "Português"}}, "defaultTranslation": "chinese"}, "packs": [
+      {"key": "p2_46_directions", "wordpack": 46, "titles": {"english": "Directions", "chinese": "Directions", "pinyin": "Directions", "portuguese": "Directions"}, "base": 20, "example": 40},
+      {"key": "p2_47_more__transportation", "wordpack": 47, "titles": {"english": "More Transportation", "chinese": "More Transportation", "pinyin": "More Transportation", "portuguese": "More Transportation"}, "base": 20, "example": 40},
+      {"key": "p2_48_furniture", "wordpack": 48, "titles": {"english": "Furniture", "chinese": "Furniture", "pinyin": "Furniture", "portuguese": "Furniture"}, "base": 20, "example": 40},
+      {"key": "p2_49_kitchen__items", "wordpack": 49, "titles": {"english": "Kitchen Items", "chinese": "Kitchen Items", "pinyin": "Kitchen Items", "portuguese": "Kitchen Items"}, "base": 20, "example": 40},
+      {"key": "p2_50_bathroom__items", "wordpack": 50, "titles": {"english": "Bathroom Items", "chinese": "Bathroom Items", "pinyin": "Bathroom Items", "portuguese": "Bathroom Items"}, "base": 20, "example": 40},
+      {"key": "p2_51_household__chores", "wordpack": 51, "titles": {"english": "Household Chores", "chinese": "Household Chores", "pinyin": "Household Chores", "portuguese": "Household Chores"}, "base": 20, "example": 40},
+      {"key": "p2_52_more__food", "wordpack": 52, "titles": {"english": "More Food", "chinese": "More Food", "pinyin": "More Food", "portuguese": "More Food"}, "base": 20, "example": 40},
+      {"key": "p2_53_fruits", "wordpack": 53, "titles": {"english": "Fruits", "chinese": "Fruits", "pinyin": "Fruits", "portuguese": "Fruits"}, "base": 20, "example": 40},
+      {"key": "p2_54_vegetables", "wordpack": 54, "titles": {"english": "Vegetables", "chinese": "Vegetables", "pinyin": "Vegetables", "portuguese": "Vegetables"}, "base": 20, "example": 40},
+      {"key": "p2_55_more__clothing", "wordpack": 55, "titles": {"english": "More Clothing", "chinese": "More Clothing", "pinyin": "More Clothing", "portuguese": "More Clothing"}, "base": 20, "example": 40},
+      {"key": "p2_56_jobs__1", "wordpack": 56, "titles": {"english": "Jobs 1", "chinese": "Jobs 1", "pinyin": "Jobs 1", "portuguese": "Jobs 1"}, "base": 20, "example": 40},
+      {"key": "p2_57_jobs__2", "wordpack": 57, "titles": {"english": "Jobs 2", "chinese": "Jobs 2", "pinyin": "Jobs 2", "portuguese": "Jobs 2"}, "base": 20, "example": 40},
+      {"key": "p2_58_more__animals", "wordpack": 58, "titles": {"english": "More Animals", "chinese": "More Animals", "pinyin": "More Animals", "portuguese": "More Animals"}, "base": 20, "example": 40},
+      {"key": "p2_59_nature", "wordpack": 59, "titles": {"english": "Nature", "chinese": "Nature", "pinyin": "Nature", "portuguese": "Nature"}, "base": 20, "example": 40},
+      {"key": "p2_60_geography", "wordpack": 60, "titles": {"english": "Geography", "chinese": "Geography", "pinyin": "Geography", "portuguese": "Geography"}, "base": 20, "example": 40},
+      {"key": "p2_61_school__education", "wordpack": 61, "titles": {"english": "School & Education", "chinese": "School & Education", "pinyin": "School & Education", "portuguese": "School & Education"}, "base": 20, "example": 40},
+      {"key": "p2_62_sports", "wordpack": 62, "titles": {"english": "Sports", "chinese": "Sports", "pinyin": "Sports", "portuguese": "Sports"}, "base": 20, "example": 40},
+      {"key": "p2_63_more__sports", "wordpack": 63, "titles": {"english": "More Sports", "chinese": "More Sports", "pinyin": "More Sports", "portuguese": "More Sports"}, "base": 20, "example": 40},
+      {"key": "p2_64_entertainment", "wordpack": 64, "titles": {"english": "Entertainment", "chinese": "Entertainment", "pinyin": "Entertainment", "portuguese": "Entertainment"}, "base": 20, "example": 40},
+      {"key": "p2_65_more__emotions", "wordpack": 65, "titles": {"english": "More Emotions", "chinese": "More Emotions", "pinyin": "More Emotions", "portuguese": "More Emotions"}, "base": 20, "example": 40},
+      {"key": "p2_66_personality", "wordpack": 66, "titles": {"english": "Personality", "chinese": "Personality", "pinyin": "Personality", "portuguese": "Personality"}, "base": 20, "example": 40},
+      {"key": "p2_67_physical__appearance", "wordpack": 67, "titles": {"english": "Physical Appearance", "chinese": "Physical Appearance", "pinyin": "Physical Appearance", "portuguese": "Physical Appearance"}, "base": 20, "example": 40},
+      {"key": "p2_68_shopping", "wordpack": 68, "titles": {"english": "Shopping", "chinese": "Shopping", "pinyin": "Shopping", "portuguese": "Shopping"}, "base": 20, "example": 40},
+      {"key": "p2_69_money__banking", "wordpack": 69, "titles": {"english": "Money & Banking", "chinese": "Money & Banking", "pinyin": "Money & Banking", "portuguese": "Money & Banking"}, "base": 20, "example": 40},
+      {"key": "p2_70_health", "wordpack": 70, "titles": {"english": "Health", "chinese": "Health", "pinyin": "Health", "portuguese": "Health"}, "base": 20, "example": 40},
+      {"key": "p2_71_technology", "wordpack": 71, "titles": {"english": "Technology", "chinese": "Technology", "pinyin": "Technology", "portuguese": "Technology"}, "base": 20, "example": 40},
+      {"key": "p2_72_verbs__of__motion", "wordpack": 72, "titles": {"english": "Verbs of Motion", "chinese": "Verbs of Motion", "pinyin": "Verbs of Motion", "portuguese": "Verbs of Motion"}, "base": 20, "example": 40},
+      {"key": "p2_73_verbs__of__change", "wordpack": 73, "titles": {"english": "Verbs of Change", "chinese": "Verbs of Change", "pinyin": "Verbs of Change", "portuguese": "Verbs of Change"}, "base": 20, "example": 40},
+      {"key": "p2_74_communication__verbs", "wordpack": 74, "titles": {"english": "Communication Verbs", "chinese": "Communication Verbs", "pinyin": "Communication Verbs", "portuguese": "Communication Verbs"}, "base": 20, "example": 40},
+      {"key": "p2_75_mental__verbs", "wordpack": 75, "titles": {"english": "Mental Verbs", "chinese": "Mental Verbs", "pinyin": "Mental Verbs", "portuguese": "Mental Verbs"}, "base": 20, "example": 40},
+      {"key": "p2_76_adverbs__of__manner", "wordpack": 76, "titles": {"english": "Adverbs of Manner", "chinese": "Adverbs of Manner", "pinyin": "Adverbs of Manner", "portuguese": "Adverbs of Manner"}, "base": 20, "example": 40},
+      {"key": "p2_77_adverbs__of__degree", "wordpack": 77, "titles": {"english": "Adverbs of Degree", "chinese": "Adverbs of Degree", "pinyin": "Adverbs of Degree", "portuguese": "Adverbs of Degree"}, "base": 20, "example": 40},
+      {"key": "p2_78_conjunctions", "wordpack": 78, "titles": {"english": "Conjunctions", "chinese": "Conjunctions", "pinyin": "Conjunctions", "portuguese": "Conjunctions"}, "base": 20, "example": 40},
+      {"key": "p2_79_connectors", "wordpack": 79, "titles": {"english": "Connectors", "chinese": "Connectors", "pinyin": "Connectors", "portuguese": "Connectors"}, "base": 20, "example": 40},
+      {"key": "p2_80_phrasal__verbs__1", "wordpack": 80, "titles": {"english": "Phrasal Verbs 1", "chinese": "Phrasal Verbs 1", "pinyin": "Phrasal Verbs 1", "portuguese": "Phrasal Verbs 1"}, "base": 20, "example": 40},
+      {"key": "p2_81_phrasal__verbs__2", "wordpack": 81, "titles": {"english": "Phrasal Verbs 2", "chinese": "Phrasal Verbs 2", "pinyin": "Phrasal Verbs 2", "portuguese": "Phrasal Verbs 2"}, "base": 20, "example": 40},
+      {"key": "p2_160_apology__excuse__patterns", "wordpack": 160, "titles": {"english": "Apology & Excuse Patterns", "chinese": "Apology & Excuse Patterns", "pinyin": "Apology & Excuse Patterns", "portuguese": "Apology & Excuse Patterns"}, "base": 20, "example": 40}
+    ]},
+    {"act": 3, "actName": "Everyday Life", "url": "./Jsmodules-js/act3-everyday-life-js.js", "sha256": "37d3f247f8dc144113658fa4e8d889cf54e7778a4b56fb28ce53f0766d3f7e2b", "bytes": 87700, "actMeta": {"actNumber": 3, "actName": "Everyday Life", "wordColumns": ["english", "chinese", "pinyin", "spanish", "portuguese"], "translations": {"chinese": {"index": 1, "display": "中文"}, "spanish": {"index": 3, "display": "Español"}, "portuguese": {"index": 4, "display": "Português"}}, "defaultTranslation": "chinese"}, "packs": [
+      {"key": "p3_82_travel", "wordpack": 82, "titles": {"english": "Travel", "chinese": "Travel", "pinyin": "Travel", "portuguese": "Travel"}, "base": 20, "example": 40},
+      {"key": "p3_83_airport__flying", "wordpack": 83, "titles": {"english": "Airport & Flying", "chinese": "Airport & Flying", "pinyin": "Airport & Flying", "portuguese": "Airport & Flying"}, "base": 20, "example": 40},
+      {"key": "p3_84_hotel", "wordpack": 84, "titles": {"english": "Hotel", "chinese": "Hotel", "pinyin": "Hotel", "portuguese": "Hotel"}, "base": 20, "example": 40},
+      {"key": "p3_85_work__office", "wordpack": 85, "titles": {"english": "Work & Office", "chinese": "Work & Office", "pinyin": "Work & Office", "portuguese": "Work & Office"}, "base": 20, "example": 40},
+      {"key": "p3_86_workplace__actions", "wordpack": 86, "titles": {"english": "Workplace Actions", "chinese": "Workplace Actions", "pinyin": "Workplace Actions", "portuguese": "Workplace Actions"}, "base": 20, "example": 40},
+      {"key": "p3_87_business__communication", "wordpack": 87, "titles": {"english": "Business Communication", "chinese": "Business Communication", "pinyin": "Business Communication", "portuguese": "Business Communication"}, "base": 20, "example": 40},
+      {"key": "p3_88_internet__social__media", "wordpack": 88, "titles": {"english": "Internet & Social Media", "chinese": "Internet & Social Media", "pinyin": "Internet & Social Media", "portuguese": "Internet & Social Media"}, "base": 20, "example": 40},
+      {"key": "p3_89_relationships", "wordpack": 89, "titles": {"english": "Relationships", "chinese": "Relationships", "pinyin": "Relationships", "portuguese": "Relationships"}, "base": 20, "example": 40},
+      {"key": "p3_90_social__interactions", "wordpack": 90, "titles": {"english": "Social Interactions", "chinese": "Social Interactions", "pinyin": "Social Interactions", "portuguese": "Social Interactions"}, "base": 20, "example": 40},
+      {"key": "p3_91_life__events", "wordpack": 91, "titles": {"english": "Life Events", "chinese": "Life Events", "pinyin": "Life Events", "portuguese": "Life Events"}, "base": 20, "example": 40},
+      {"key": "p3_92_housing", "wordpack": 92, "titles": {"english": "Housing", "chinese": "Housing", "pinyin": "Housing", "portuguese": "Housing"}, "base": 20, "example": 40},
+      {"key": "p3_93_news__media", "wordpack": 93, "titles": {"english": "News & Media", "chinese": "News & Media", "pinyin": "News & Media", "portuguese": "News & Media"}, "base": 20, "example": 40},
+      {"key": "p3_94_environment", "wordpack": 94, "titles": {"english": "Environment", "chinese": "Environment", "pinyin": "Environment", "portuguese": "Environment"}, "base": 20, "example": 40},
+      {"key": "p3_95_cooking__methods", "wordpack": 95, "titles": {"english": "Cooking Methods", "chinese": "Cooking Methods", "pinyin": "Cooking Methods", "portuguese": "Cooking Methods"}, "base": 20, "example": 40},
+      {"key": "p3_96_food__preparation", "wordpack": 96, "titles": {"english": "Food Preparation", "chinese": "Food Preparation", "pinyin": "Food Preparation", "portuguese": "Food Preparation"}, "base": 20, "example": 40},
+      {"key": "p3_97_restaurant", "wordpack": 97, "titles": {"english": "Restaurant", "chinese": "Restaurant", "pinyin": "Restaurant", "portuguese": "Restaurant"}, "base": 20, "example": 40},
+      {"key": "p3_98_movies__tv", "wordpack": 98, "titles": {"english": "Movies & TV", "chinese": "Movies & TV", "pinyin": "Movies & TV", "portuguese": "Movies & TV"}, "base": 20, "example": 40},
+      {"key": "p3_99_books__reading", "wordpack": 99, "titles": {"english": "Books & Reading", "chinese": "Books & Reading", "pinyin": "Books & Reading", "portuguese": "Books & Reading"}, "base": 20, "example": 40},
+      {"key": "p3_100_music__art", "wordpack": 100, "titles": {"english": "Music & Art", "chinese": "Music & Art", "pinyin": "Music & Art", "portuguese": "Music & Art"}, "base": 20, "example": 40},
+      {"key": "p3_101_basic__law__rules", "wordpack": 101, "titles": {"english": "Basic Law & Rules", "chinese": "Basic Law & Rules", "pinyin": "Basic Law & Rules", "portuguese": "Basic Law & Rules"}, "base": 20, "example": 40},
+      {"key": "p3_102_government__citizenship", "wordpack": 102, "titles": {"english": "Government & Citizenship", "chinese": "Government & Citizenship", "pinyin": "Government & Citizenship", "portuguese": "Government & Citizenship"}, "base": 20, "example": 40},
+      {"key": "p3_103_opinions__arguments", "wordpack": 103, "titles": {"english": "Opinions & Arguments", "chinese": "Opinions & Arguments", "pinyin": "Opinions & Arguments", "portuguese": "Opinions & Arguments"}, "base": 20, "example": 40},
+      {"key": "p3_104_problems__solutions", "wordpack": 104, "titles": {"english": "Problems & Solutions", "chinese": "Problems & Solutions", "pinyin": "Problems & Solutions", "portuguese": "Problems & Solutions"}, "base": 20, "example": 40},
+      {"key": "p3_105_describing__trends", "wordpack": 105, "titles": {"english": "Describing Trends", "chinese": "Describing Trends", "pinyin": "Describing Trends", "portuguese": "Describing Trends"}, "base": 20, "example": 40},
+      {"key": "p3_106_common__idioms__1", "wordpack": 106, "titles": {"english": "Common Idioms 1", "chinese": "Common Idioms 1", "pinyin": "Common Idioms 1", "portuguese": "Common Idioms 1"}, "base": 15, "example": 30},
+      {"key": "p3_107_common__idioms__2", "wordpack": 107, "titles": {"english": "Common Idioms 2", "chinese": "Common Idioms 2", "pinyin": "Common Idioms 2", "portuguese": "Common Idioms 2"}, "base": 15, "example": 30},
+      {"key": "p3_108_phrasal__verbs__3", "wordpack": 108, "titles": {"english": "Phrasal Verbs 3", "chinese": "Phrasal Verbs 3", "pinyin": "Phrasal Verbs 3", "portuguese": "Phrasal Verbs 3"}, "base": 20, "example": 40},
+      {"key": "p3_109_phrasal__verbs__4", "wordpack": 109, "titles": {"english": "Phrasal Verbs 4", "chinese": "Phrasal Verbs 4", "pinyin": "Phrasal Verbs 4", "portuguese": "Phrasal Verbs 4"}, "base": 20, "example": 40},
+      {"key": "p3_110_collocations__make__do", "wordpack": 110, "titles": {"english": "Collocations - Make & Do", "chinese": "Collocations - Make & Do", "pinyin": "Collocations - Make & Do", "portuguese": "Collocations - Make & Do"}, "base": 20, "example": 40},
+      {"key": "p3_111_collocations__have__take", "wordpack": 111, "titles": {"english": "Collocations - Have & Take", "chinese": "Collocations - Have & Take", "pinyin": "Collocations - Have & Take", "portuguese": "Collocations - Have & Take"}, "base": 20, "example": 40},
+      {"key": "p3_112_collocations__other", "wordpack": 112, "titles": {"english": "Collocations - Other", "chinese": "Collocations - Other", "pinyin": "Collocations - Other", "portuguese": "Collocations - Other"}, "base": 20, "example": 40}
+    ]},
+    {"act": 4, "actName": "Expanding Horizons", "url": "./Jsmodules-js/act4-expanding-horizons-js.js", "sha256": "7f3c27f43b918f676cc1f28972984736e0bdf1e1c45ee2143824f7aeddb13119", "bytes": 49488, "actMeta": {"actNumber": 4, "actName": "Expanding Horizons", "wordColumns": ["english", "chinese", "pinyin", "spanish", "portuguese"], "translations": {"chinese": {"index": 1, "display": "中文"}, "spanish": {"index": 3, "display": "Español"}, "portuguese": {"index": 4, "display": "Português"}}, "defaultTranslation": "chinese"}, "packs": [
+      {"key": "p4_113_business__basics", "wordpack": 113, "titles": {"english": "Business Basics", "chinese": "Business Basics", "pinyin": "Business Basics", "portuguese": "Business Basics"}, "base": 20, "example": 40},
+      {"key": "p4_114_finance__basics", "wordpack": 114, "titles": {"english": "Finance Basics", "chinese": "Finance Basics", "pinyin": "Finance Basics", "portuguese": "Finance Basics"}, "base": 20, "example": 40},
+      {"key": "p4_115_marketing__sales", "wordpack": 115, "titles": {"english": "Marketing & Sales", "chinese": "Marketing & Sales", "pinyin": "Marketing & Sales", "portuguese": "Marketing & Sales"}, "base": 20, "example": 40},
+      {"key": "p4_116_science__basics", "wordpack": 116, "titles": {"english": "Science Basics", "chinese": "Science Basics", "pinyin": "Science Basics", "portuguese": "Science Basics"}, "base": 20, "example": 40},
+      {"key": "p4_117_biology__basics", "wordpack": 117, "titles": {"english": "Biology Basics", "chinese": "Biology Basics", "pinyin": "Biology Basics", "portuguese": "Biology Basics"}, "base": 20, "example": 40},
+      {"key": "p4_118_basic__chemistry__physics", "wordpack": 118, "titles": {"english": "Basic Chemistry & Physics", "chinese": "Basic Chemistry & Physics", "pinyin": "Basic Chemistry & Physics", "portuguese": "Basic Chemistry & Physics"}, "base": 20, "example": 40},
+      {"key": "p4_119_health__wellness", "wordpack": 119, "titles": {"english": "Health & Wellness", "chinese": "Health & Wellness", "pinyin": "Health & Wellness", "portuguese": "Health & Wellness"}, "base": 20, "example": 40},
+      {"key": "p4_120_mental__health__basics", "wordpack": 120, "titles": {"english": "Mental Health Basics", "chinese": "Mental Health Basics", "pinyin": "Mental Health Basics", "portuguese": "Mental Health Basics"}, "base": 20, "example": 40},
+      {"key": "p4_121_technology__advanced", "wordpack": 121, "titles": {"english": "Technology Advanced", "chinese": "Technology Advanced", "pinyin": "Technology Advanced", "portuguese": "Technology Advanced"}, "base": 20, "example": 40},
+      {"key": "p4_122_academic__writing", "wordpack": 122, "titles": {"english": "Academic Writing", "chinese": "Academic Writing", "pinyin": "Academic Writing", "portuguese": "Academic Writing"}, "base": 20, "example": 40},
+      {"key": "p4_123_philosophy__ethics", "wordpack": 123, "titles": {"english": "Philosophy & Ethics", "chinese": "Philosophy & Ethics", "pinyin": "Philosophy & Ethics", "portuguese": "Philosophy & Ethics"}, "base": 20, "example": 40},
+      {"key": "p4_124_abstract__concepts", "wordpack": 124, "titles": {"english": "Abstract Concepts", "chinese": "Abstract Concepts", "pinyin": "Abstract Concepts", "portuguese": "Abstract Concepts"}, "base": 20, "example": 40},
+      {"key": "p4_125_cause__effect", "wordpack": 125, "titles": {"english": "Cause & Effect", "chinese": "Cause & Effect", "pinyin": "Cause & Effect", "portuguese": "Cause & Effect"}, "base": 20, "example": 40},
+      {"key": "p4_126_certainty__probability", "wordpack": 126, "titles": {"english": "Certainty & Probability", "chinese": "Certainty & Probability", "pinyin": "Certainty & Probability", "portuguese": "Certainty & Probability"}, "base": 20, "example": 40},
+      {"key": "p4_127_social__issues", "wordpack": 127, "titles": {"english": "Social Issues", "chinese": "Social Issues", "pinyin": "Social Issues", "portuguese": "Social Issues"}, "base": 20, "example": 40},
+      {"key": "p4_128_international__relations", "wordpack": 128, "titles": {"english": "International Relations", "chinese": "International Relations", "pinyin": "International Relations", "portuguese": "International Relations"}, "base": 20, "example": 40},
+      {"key": "p4_129_literature", "wordpack": 129, "titles": {"english": "Literature", "chinese": "Literature", "pinyin": "Literature", "portuguese": "Literature"}, "base": 20, "example": 40},
+      {"key": "p4_130_art__culture", "wordpack": 130, "titles": {"english": "Art & Culture", "chinese": "Art & Culture", "pinyin": "Art & Culture", "portuguese": "Art & Culture"}, "base": 20, "example": 40}
+    ]},
+    {"act": 5, "actName": "Advanced Mastery", "url": "./Jsmodules-js/act5-advanced-mastery-js.js", "sha256": "646ff0d443d0ed0bc9058795c6e2f021af7dc64ce15063ebd1730ce6f4087861", "bytes": 69720, "actMeta": {"actNumber": 5, "actName": "Advanced Mastery", "wordColumns": ["english", "chinese", "pinyin", "spanish", "portuguese"], "translations": {"chinese": {"index": 1, "display": "中文"}, "spanish": {"index": 3, "display": "Español"}, "portuguese": {"index": 4, "display": "Português"}}, "defaultTranslation": "chinese"}, "packs": [
+      {"key": "p5_131_formal__vocabulary__1", "wordpack": 131, "titles": {"english": "Formal Vocabulary 1", "chinese": "Formal Vocabulary 1", "pinyin": "Formal Vocabulary 1", "portuguese": "Formal Vocabulary 1"}, "base": 20, "example": 40},
+      {"key": "p5_132_formal__vocabulary__2", "wordpack": 132, "titles": {"english": "Formal Vocabulary 2", "chinese": "Formal Vocabulary 2", "pinyin": "Formal Vocabulary 2", "portuguese": "Formal Vocabulary 2"}, "base": 20, "example": 40},
+      {"key": "p5_133_formal__vocabulary__3", "wordpack": 133, "titles": {"english": "Formal Vocabulary 3", "chinese": "Formal Vocabulary 3", "pinyin": "Formal Vocabulary 3", "portuguese": "Formal Vocabulary 3"}, "base": 20, "example": 40},
+      {"key": "p5_134_formal__vocabulary__4", "wordpack": 134, "titles": {"english": "Formal Vocabulary 4", "chinese": "Formal Vocabulary 4", "pinyin": "Formal Vocabulary 4", "portuguese": "Formal Vocabulary 4"}, "base": 20, "example": 40},
+      {"key": "p5_135_academic__nouns", "wordpack": 135, "titles": {"english": "Academic Nouns", "chinese": "Academic Nouns", "pinyin": "Academic Nouns", "portuguese": "Academic Nouns"}, "base": 20, "example": 40},
+      {"key": "p5_136_academic__adjectives", "wordpack": 136, "titles": {"english": "Academic Adjectives", "chinese": "Academic Adjectives", "pinyin": "Academic Adjectives", "portuguese": "Academic Adjectives"}, "base": 20, "example": 40},
+      {"key": "p5_137_academic__adjectives__2", "wordpack": 137, "titles": {"english": "Academic Adjectives 2", "chinese": "Academic Adjectives 2", "pinyin": "Academic Adjectives 2", "portuguese": "Academic Adjectives 2"}, "base": 20, "example": 40},
+      {"key": "p5_138_everyday__legal", "wordpack": 138, "titles": {"english": "Everyday Legal", "chinese": "Everyday Legal", "pinyin": "Everyday Legal", "portuguese": "Everyday Legal"}, "base": 20, "example": 40},
+      {"key": "p5_139_everyday__medical", "wordpack": 139, "titles": {"english": "Everyday Medical", "chinese": "Everyday Medical", "pinyin": "Everyday Medical", "portuguese": "Everyday Medical"}, "base": 20, "example": 40},
+      {"key": "p5_140_everyday__finance", "wordpack": 140, "titles": {"english": "Everyday Finance", "chinese": "Everyday Finance", "pinyin": "Everyday Finance", "portuguese": "Everyday Finance"}, "base": 20, "example": 40},
+      {"key": "p5_141_research__statistics", "wordpack": 141, "titles": {"english": "Research & Statistics", "chinese": "Research & Statistics", "pinyin": "Research & Statistics", "portuguese": "Research & Statistics"}, "base": 20, "example": 40},
+      {"key": "p5_142_psychology__basics", "wordpack": 142, "titles": {"english": "Psychology Basics", "chinese": "Psychology Basics", "pinyin": "Psychology Basics", "portuguese": "Psychology Basics"}, "base": 20, "example": 40},
+      {"key": "p5_143_sociology__basics", "wordpack": 143, "titles": {"english": "Sociology Basics", "chinese": "Sociology Basics", "pinyin": "Sociology Basics", "portuguese": "Sociology Basics"}, "base": 20, "example": 40},
+      {"key": "p5_144_critical__thinking", "wordpack": 144, "titles": {"english": "Critical Thinking", "chinese": "Critical Thinking", "pinyin": "Critical Thinking", "portuguese": "Critical Thinking"}, "base": 20, "example": 40},
+      {"key": "p5_145_debate__argument", "wordpack": 145, "titles": {"english": "Debate & Argument", "chinese": "Debate & Argument", "pinyin": "Debate & Argument", "portuguese": "Debate & Argument"}, "base": 20, "example": 40},
+      {"key": "p5_146_negotiation", "wordpack": 146, "titles": {"english": "Negotiation", "chinese": "Negotiation", "pinyin": "Negotiation", "portuguese": "Negotiation"}, "base": 20, "example": 40},
+      {"key": "p5_147_project__management", "wordpack": 147, "titles": {"english": "Project Management", "chinese": "Project Management", "pinyin": "Project Management", "portuguese": "Project Management"}, "base": 20, "example": 40},
+      {"key": "p5_148_business__advanced", "wordpack": 148, "titles": {"english": "Business Advanced", "chinese": "Business Advanced", "pinyin": "Business Advanced", "portuguese": "Business Advanced"}, "base": 20, "example": 40},
+      {"key": "p5_149_environmental__science", "wordpack": 149, "titles": {"english": "Environmental Science", "chinese": "Environmental Science", "pinyin": "Environmental Science", "portuguese": "Environmental Science"}, "base": 20, "example": 40},
+      {"key": "p5_150_literary__devices", "wordpack": 150, "titles": {"english": "Literary Devices", "chinese": "Literary Devices", "pinyin": "Literary Devices", "portuguese": "Literary Devices"}, "base": 20, "example": 40},
+      {"key": "p5_151_advanced__idioms", "wordpack": 151, "titles": {"english": "Advanced Idioms", "chinese": "Advanced Idioms", "pinyin": "Advanced Idioms", "portuguese": "Advanced Idioms"}, "base": 15, "example": 30},
+      {"key": "p5_152_business__idioms", "wordpack": 152, "titles": {"english": "Business Idioms", "chinese": "Business Idioms", "pinyin": "Business Idioms", "portuguese": "Business Idioms"}, "base": 15, "example": 30},
+      {"key": "p5_153_formal__connectors", "wordpack": 153, "titles": {"english": "Formal Connectors", "chinese": "Formal Connectors", "pinyin": "Formal Connectors", "portuguese": "Formal Connectors"}, "base": 20, "example": 40},
+      {"key": "p5_154_advanced__verbs", "wordpack": 154, "titles": {"english": "Advanced Verbs", "chinese": "Advanced Verbs", "pinyin": "Advanced Verbs", "portuguese": "Advanced Verbs"}, "base": 20, "example": 40},
+      {"key": "p5_155_nuanced__adjectives", "wordpack": 155, "titles": {"english": "Nuanced Adjectives", "chinese": "Nuanced Adjectives", "pinyin": "Nuanced Adjectives", "portuguese": "Nuanced Adjectives"}, "base": 20, "example": 40}
+    ]}
+  ]
+};
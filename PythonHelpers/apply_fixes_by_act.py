@@ -10,12 +10,22 @@ Usage:
 
 This reads ChineseFixTableAct{N}.csv and applies all fixes surgically
 to the individual ChineseWords{pack}.csv files.
+
+Chunked reviews (generate_act_prompt.py --chunks) keep one fix table per chunk:
+    python PythonHelpers/apply_fixes_by_act.py spanish 3 --chunk 2
+reads SpanishFixTableAct3Chunk2.csv instead.
+
+Fixes go through csv_pipeline.py's fix-table stage, so each breakout CSV is
+streamed and written once, keeping its line endings. --dry-run prints the
+diff instead of writing.
 """
 
-import csv
-import sys
-import os
 import io
+import os
+import re
+import sys
+
+from csv_pipeline import BASE_DIR, LANGUAGE_CONFIG, fix_table_stage, load_fix_table, run_pipeline
 
 # Force UTF-8 output on Windows
 sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
@@ -47,50 +57,56 @@ ACT_INFO = {
     }
 }
 
-def apply_fix(csv_path, row_num, col_name, old_value, new_value):
-    """Apply a single fix to a CSV file."""
-    # Read the CSV
-    with open(csv_path, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        rows = list(reader)
-        fieldnames = reader.fieldnames
-
-    if row_num < 1 or row_num > len(rows) + 1:
-        return False, f"Row {row_num} out of range (1-{len(rows)+1})"
-
-    if col_name not in fieldnames:
-        return False, f"Column '{col_name}' not found in CSV"
-
-    # Row 1 is header, data starts at row 2
-    data_row_idx = row_num - 2
+def apply_fix_table(fix_table_path, language, dry_run=False):
+    """
+    Stream every breakout CSV named in the fix table through the pipeline's
+    fix-table stage. Each file is read and written once, however many fixes
+    it has.
+
+    Returns:
+        tuple: (applied, failures)
+               - applied: number of fixes applied (or that would be applied)
+               - failures: list of (filename, row_number, column, message)
+    """
+    fixes_by_file = load_fix_table(fix_table_path, language)
+    folder = os.path.join(BASE_DIR, LANGUAGE_CONFIG[language]['folder'])
+
+    applied = 0
+    failures = []
+    for filename in sorted(fixes_by_file, key=lambda name: int(re.sub(r'\D', '', name) or 0)):
+        fixes = fixes_by_file[filename]
+        csv_path = os.path.join(folder, filename)
+        if not os.path.exists(csv_path):
+            failures.extend((filename, row, col, "File not found") for row, col in sorted(fixes))
+            continue
+
+        mismatches = []
+        counts, diff = run_pipeline(
+            csv_path, [lambda name: fix_table_stage(fixes_by_file, name, mismatches)], dry_run)
+        failures.extend(mismatches)
+        applied += len(fixes) - len(mismatches)
+
+        for row_num, col in sorted(fixes):
+            old_value, new_value = fixes[(row_num, col)]
+            failed = any(m[1] == row_num and m[2] == col for m in mismatches)
+            status = "[FAIL]" if failed else "[OK]"
+            print(f"{status} {filename}, Row {row_num}, {col}: '{old_value}' -> '{new_value}'")
+        if diff:
+            sys.stdout.writelines(diff)
+
+    return applied, failures
 
-    if data_row_idx < 0:
-        return False, f"Cannot edit header row"
-
-    # Check old value matches
-    actual_old = rows[data_row_idx][col_name]
-    if actual_old != old_value:
-        return False, f"Mismatch! Expected '{old_value}', found '{actual_old}'"
-
-    # Apply fix
-    rows[data_row_idx][col_name] = new_value
-
-    # Write back
-    with open(csv_path, 'w', encoding='utf-8', newline='') as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(rows)
-
-    return True, "OK"
 
 def main():
     if len(sys.argv) < 3:
-        print("Usage: python apply_fixes_by_act.py <language> <act_number>")
+        print("Usage: python apply_fixes_by_act.py <language> <act_number> [--chunk N] [--dry-run]")
         print("Example: python apply_fixes_by_act.py chinese 1")
         sys.exit(1)
 
     language = sys.argv[1].lower()
     act_num = int(sys.argv[2])
+    chunk_num = int(sys.argv[sys.argv.index('--chunk') + 1]) if '--chunk' in sys.argv else None
+    dry_run = '--dry-run' in sys.argv
 
     if language not in ACT_INFO:
         print(f"Error: Language '{language}' not supported")
@@ -102,70 +118,38 @@ def main():
 
     # Determine fix table path
     lang_cap = language.capitalize()
-    fix_table_path = f"{lang_cap}Words/{lang_cap}FixTableAct{act_num}.csv"
+    chunk_suffix = f"Chunk{chunk_num}" if chunk_num else ""
+    fix_table_path = os.path.join(BASE_DIR, f"{lang_cap}Words",
+                                  f"{lang_cap}FixTableAct{act_num}{chunk_suffix}.csv")
 
     if not os.path.exists(fix_table_path):
         print(f"Error: Fix table not found: {fix_table_path}")
         print(f"Create it first with fixes for Act {act_num}")
         sys.exit(1)
 
-    # Read fix table
     print(f"Reading fix table: {fix_table_path}")
-    with open(fix_table_path, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        fixes = list(reader)
+    try:
+        applied, failures = apply_fix_table(fix_table_path, language, dry_run)
+    except ValueError as e:
+        print(f"[FAIL] {e}")
+        print("\nResolve the conflicting rows in the fix table and rerun this script.")
+        sys.exit(1)
 
-    if not fixes:
+    if not applied and not failures:
         print("No fixes found in table. Nothing to apply.")
         sys.exit(0)
 
-    print(f"Found {len(fixes)} fixes to apply")
-    print()
-
-    # Apply fixes
-    successes = 0
-    failures = 0
-    errors = []
-
-    for i, fix in enumerate(fixes, 1):
-        pack_num = fix['Pack_Number']
-        row_num = int(fix['Row_Number'])
-        col_name = fix['Column_Name']
-        old_value = fix['Old_Value']
-        new_value = fix['New_Value']
-        reason = fix.get('Reason', '')
-
-        csv_path = f"{lang_cap}Words/{lang_cap}Words{pack_num}.csv"
-
-        print(f"[{i}/{len(fixes)}] Pack {pack_num}, Row {row_num}, {col_name}: '{old_value}' -> '{new_value}'")
-
-        success, message = apply_fix(csv_path, row_num, col_name, old_value, new_value)
-
-        if success:
-            successes += 1
-            print(f"  [OK] {message}")
-        else:
-            failures += 1
-            print(f"  [FAIL] {message}")
-            errors.append({
-                'fix_num': i,
-                'pack': pack_num,
-                'row': row_num,
-                'col': col_name,
-                'error': message
-            })
-        print()
-
     # Summary
+    print()
     print("="*70)
-    print(f"SUMMARY: {successes} succeeded, {failures} failed")
+    print(f"SUMMARY{' (DRY RUN)' if dry_run else ''}: {applied} succeeded, {len(failures)} failed")
     print("="*70)
 
-    if failures > 0:
+    if failures:
         print("\n[WARN] ERRORS DETECTED:")
-        for err in errors:
-            print(f"  Fix #{err['fix_num']}: Pack {err['pack']}, Row {err['row']}, {err['col']}")
-            print(f"    {err['error']}")
+        for filename, row_num, col, message in failures:
+            print(f"  {filename}, Row {row_num}, {col}")
+            print(f"    {message}")
         print()
         print("Fix the errors in the fix table and rerun this script.")
         sys.exit(1)
@@ -0,0 +1,353 @@
+#!/usr/bin/env python3
+"""
+Asyncio construction mode for breakout CSVs.
+
+construct_breakout_csvs.construct_breakout_csv translates target columns one
+after another, each a blocking call followed by time.sleep(0.2), so a
+12-column Chinese pack waits for ~10 round-trips in series. This mode issues
+every column translation of a pack - and several packs of a range - at once,
+with a shared token-bucket limiter deciding how many backend calls may start
+per second.
+
+Backends:
+    google  GoogleTranslator via construct_breakout_csvs.translate_batch_backend
+            (run in a worker thread; every request it sends - each chunk,
+            bisected half and retry - takes a limiter token, replacing its
+            0.2 s sleep)
+    stub    Local fake translator with configurable latency - no network,
+            no translation memory writes. For testing and benchmarking the
+            scheduler offline; always builds into a temp folder, never into
+            <Lang>Words.
+
+The translation memory (translation_memory.py) is still consulted first, so
+only true misses reach the backend.
+
+Usage:
+    python PythonHelpers/async_construct.py <chinese|spanish|english> [start_pack] [end_pack] [options]
+
+Options:
+    --rate N         Backend calls allowed per second (default 5)
+    --burst N        Token bucket capacity (default = rate)
+    --packs N        Packs translated concurrently (default 4)
+    --stub           Use the stub backend (output goes to a temp folder and is discarded)
+    --latency S      Stub round-trip time in seconds (default 0.3)
+    --benchmark      Stub backend, build into a temp folder, and compare with
+                     the serial schedule (column after column, 0.2 s sleeps)
+
+Examples:
+    python PythonHelpers/async_construct.py spanish 1 50 --rate 8
+    python PythonHelpers/async_construct.py chinese 1 10 --benchmark
+"""
+
+import asyncio
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from construct_breakout_csvs import (
+    LANG_CODES,
+    LANGUAGE_CONFIGS,
+    HAS_DEEP_TRANSLATOR,
+    TRANSLATION_MEMORY,
+    generate_pinyin_batch,
+    translate_batch_backend,
+    write_breakout_csv,
+)
+from overview_arrays import load_overview
+from translation_memory import TranslationMemory
+
+
+# ============================================================
+# RATE LIMITER
+# ============================================================
+
+class TokenBucket:
+    """
+    Async token bucket: `rate` tokens per second, at most `capacity` banked.
+    Each backend request takes one token; callers wait in arrival order.
+    """
+
+    def __init__(self, rate, capacity=None):
+        self.rate = float(rate)
+        self.capacity = float(capacity or max(1.0, rate))
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+# ============================================================
+# BACKENDS
+# ============================================================
+
+class GoogleBackend:
+    """Blocking GoogleTranslator batch call, run in a worker thread."""
+
+    name = 'google'
+
+    def __init__(self):
+        self.calls = 0
+
+    async def translate(self, texts, source_lang, target_lang, limiter):
+        loop = asyncio.get_running_loop()
+
+        def take_token():
+            # Runs in the worker thread before each HTTP request
+            asyncio.run_coroutine_threadsafe(limiter.acquire(), loop).result()
+            self.calls += 1
+
+        return await asyncio.to_thread(
+            translate_batch_backend, texts, source_lang, target_lang, 3, 0, before_call=take_token)
+
+
+class StubBackend:
+    """Offline fake translator: sleeps `latency` seconds, returns tagged text."""
+
+    name = 'stub'
+
+    def __init__(self, latency=0.3):
+        self.latency = latency
+        self.calls = 0
+        self.in_flight = 0
+        self.peak_in_flight = 0
+
+    async def translate(self, texts, source_lang, target_lang, limiter):
+        await limiter.acquire()
+        self.calls += 1
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.latency)
+            return [f"{text} ({target_lang})" for text in texts]
+        finally:
+            self.in_flight -= 1
+
+
+# ============================================================
+# ASYNC CONSTRUCTION
+# ============================================================
+
+async def translate_column(words, source_lang, target_lang, backend, limiter, memory):
+    """Translate one column: memory first, then the backend (rate-limited per request) for misses."""
+    if source_lang == target_lang:
+        return words[:]
+
+    results, missing = memory.lookup_batch(words, source_lang, target_lang)
+    if not missing:
+        return results
+
+    pending = [words[i] for i in missing]
+    translated = await backend.translate(pending, source_lang, target_lang, limiter)
+
+    for i, text, translation in zip(missing, pending, translated):
+        memory.put(source_lang, target_lang, text, translation)
+        results[i] = translation
+    return results
+
+
+async def construct_pack_async(lang_type, pack_num, words, base_dir, backend, limiter, memory):
+    """Build one breakout CSV with all column translations in flight at once."""
+    config = LANGUAGE_CONFIGS[lang_type]
+    columns = config['columns']
+    source_lang = config['source_lang']
+    source_column = columns[0]
+    breakout_path = Path(base_dir) / config['breakout_dir'] / f"{config['breakout_prefix']}{pack_num}.csv"
+
+    start_time = time.time()
+    translate_columns = [col for col in columns if col != source_column and col != 'pinyin']
+
+    results = await asyncio.gather(*[
+        translate_column(words, source_lang, LANG_CODES[col], backend, limiter, memory)
+        if LANG_CODES.get(col) else _same(words)
+        for col in translate_columns
+    ])
+    translations = dict(zip(translate_columns, results))
+    translations[source_column] = words[:]
+
+    if 'pinyin' in columns:
+        chinese = words if lang_type == 'chinese' else translations.get('chinese', [])
+        translations['pinyin'] = generate_pinyin_batch(chinese)
+
+    write_breakout_csv(breakout_path, columns, translations, len(words))
+    memory.save()
+
+    print(f"  ✓ Created {breakout_path.name} ({len(words)} words, "
+          f"{len(translate_columns)} columns) in {time.time() - start_time:.1f}s")
+
+
+async def _same(words):
+    return words[:]
+
+
+async def construct_range_async(lang_type, start_pack=None, end_pack=None, backend=None,
+                                rate=5, burst=None, max_packs=4, base_dir=None,
+                                memory=None, skip_existing=True):
+    """
+    Construct a range of packs concurrently.
+
+    Returns:
+        dict: {'created', 'skipped', 'errors', 'elapsed', 'calls'}
+    """
+    config = LANGUAGE_CONFIGS[lang_type]
+    base_dir = Path(base_dir or Path(__file__).parent.parent)
+    backend = backend or GoogleBackend()
+    memory = memory if memory is not None else TRANSLATION_MEMORY
+    limiter = TokenBucket(rate, burst)
+    pack_slots = asyncio.Semaphore(max_packs)
+
+    packs = load_overview(lang_type)
+    pack_nums = [n for n in sorted(packs)
+                 if (not start_pack or n >= start_pack) and (not end_pack or n <= end_pack)]
+
+    stats = {'created': 0, 'skipped': 0, 'errors': 0}
+
+    async def run_one(pack_num):
+        words = packs[pack_num]['combined']
+        path = base_dir / config['breakout_dir'] / f"{config['breakout_prefix']}{pack_num}.csv"
+        if not words:
+            print(f"  Pack {pack_num}: No Combined_Words - SKIPPING")
+            stats['skipped'] += 1
+            return
+        if skip_existing and path.exists():
+            print(f"  Pack {pack_num:3d}: Already exists - SKIPPING")
+            stats['skipped'] += 1
+            return
+        async with pack_slots:
+            try:
+                await construct_pack_async(lang_type, pack_num, words, base_dir, backend, limiter, memory)
+                stats['created'] += 1
+            except Exception as e:
+                print(f"  ✗ Pack {pack_num:3d}: ERROR - {e}")
+                stats['errors'] += 1
+
+    start = time.time()
+    await asyncio.gather(*[run_one(n) for n in pack_nums])
+    stats['elapsed'] = time.time() - start
+    stats['calls'] = backend.calls
+    return stats
+
+
+# ============================================================
+# BENCHMARK
+# ============================================================
+
+def serial_estimate(lang_type, pack_count, latency):
+    """Time the old schedule would take: every column in series + 0.2 s sleep each."""
+    columns = LANGUAGE_CONFIGS[lang_type]['columns']
+    translated = [c for c in columns[1:] if c != 'pinyin' and LANG_CODES.get(c)]
+    return pack_count * len(translated) * (latency + 0.2)
+
+
+def run_benchmark(lang_type, start_pack, end_pack, rate, burst, max_packs, latency):
+    """Construct into a temp folder with the stub backend and compare schedules."""
+    config = LANGUAGE_CONFIGS[lang_type]
+    with tempfile.TemporaryDirectory() as tmp:
+        (Path(tmp) / config['breakout_dir']).mkdir()
+        backend = StubBackend(latency)
+        stats = asyncio.run(construct_range_async(
+            lang_type, start_pack, end_pack, backend, rate, burst, max_packs,
+            base_dir=tmp, memory=TranslationMemory(path=None), skip_existing=False))
+
+    serial = serial_estimate(lang_type, stats['created'], latency)
+    print(f"\n{'='*70}")
+    print(f"BENCHMARK: {lang_type.upper()} (stub latency {latency}s, rate {rate}/s, {max_packs} packs in flight)")
+    print(f"{'='*70}")
+    print(f"Packs built:          {stats['created']}")
+    print(f"Backend calls:        {stats['calls']}")
+    print(f"Peak calls in flight: {backend.peak_in_flight}")
+    print(f"Async wall time:      {stats['elapsed']:.2f}s")
+    print(f"Serial schedule:      {serial:.2f}s (estimated)")
+    if stats['elapsed'] > 0:
+        print(f"Speedup:              {serial / stats['elapsed']:.1f}x")
+
+
+# ============================================================
+# COMMAND-LINE INTERFACE
+# ============================================================
+
+def parse_options(argv):
+    options = {'rate': 5.0, 'burst': None, 'packs': 4, 'latency': 0.3,
+               'stub': False, 'benchmark': False}
+    positional = []
+    rest = iter(argv)
+    for arg in rest:
+        if arg in ('--rate', '--burst', '--latency'):
+            options[arg[2:]] = float(next(rest))
+        elif arg == '--packs':
+            options['packs'] = int(next(rest))
+        elif arg in ('--stub', '--benchmark'):
+            options[arg[2:]] = True
+        else:
+            positional.append(arg)
+    return positional, options
+
+
+def main():
+    positional, options = parse_options(sys.argv[1:])
+    if not positional or positional[0].lower() not in LANGUAGE_CONFIGS:
+        print(__doc__)
+        sys.exit(1)
+
+    lang_type = positional[0].lower()
+    start_pack = int(positional[1]) if len(positional) > 1 else None
+    end_pack = int(positional[2]) if len(positional) > 2 else None
+
+    if options['benchmark']:
+        run_benchmark(lang_type, start_pack, end_pack, options['rate'], options['burst'],
+                      options['packs'], options['latency'])
+        return
+
+    if options['stub']:
+        backend = StubBackend(options['latency'])
+        memory = TranslationMemory(path=None)
+        output_dir = tempfile.TemporaryDirectory()
+        base_dir = Path(output_dir.name)
+        (base_dir / LANGUAGE_CONFIGS[lang_type]['breakout_dir']).mkdir()
+    else:
+        if not HAS_DEEP_TRANSLATOR:
+            print("\nERROR: deep-translator is required (or use --stub / --benchmark).")
+            sys.exit(1)
+        backend = GoogleBackend()
+        memory = None
+        output_dir = None
+        base_dir = None
+
+    print(f"\n{'='*70}")
+    print(f"ASYNC CONSTRUCT: {lang_type.upper()} ({backend.name} backend, "
+          f"{options['rate']:g} calls/s, {options['packs']} packs in flight)")
+    print(f"{'='*70}")
+
+    try:
+        stats = asyncio.run(construct_range_async(
+            lang_type, start_pack, end_pack, backend, options['rate'], options['burst'],
+            options['packs'], base_dir=base_dir, memory=memory, skip_existing=output_dir is None))
+    finally:
+        if output_dir:
+            output_dir.cleanup()
+
+    print(f"\n{'='*70}")
+    print(f"SUMMARY: {lang_type.upper()}")
+    print(f"{'='*70}")
+    print(f"Created: {stats['created']}")
+    print(f"Skipped: {stats['skipped']}")
+    print(f"Errors: {stats['errors']}")
+    print(f"Backend calls: {stats['calls']}")
+    print(f"Wall time: {stats['elapsed']:.1f}s")
+    print((memory or TRANSLATION_MEMORY).stats_line())
+    if output_dir:
+        print("(stub backend: CSVs were built in a temp folder and discarded)")
+
+
+if __name__ == '__main__':
+    main()
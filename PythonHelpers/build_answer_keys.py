@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Precompute normalized answer keys for the word data modules.
+
+The typing and pronunciation modes call normalize() (lowercase, NFD accent
+stripping, punctuation removal) on the target word for every keystroke and
+every recognition result. This script computes those forms once at build
+time, with jsmodules.js_normalize() (same result as the JS normalize()), and
+stores them in the pack data, indexed like baseWords.concat(exampleWords)
+(or `words`):
+
+    accentFree       normalize(target, { removeAccents: true })
+                     - typing: compared per character with the typed key.
+                       Only the rows where it differs from the lowercased
+                       target are stored, as {"row index": form}; the game
+                       uses target.toLowerCase() for the others.
+    tonelessPinyin   normalize(pinyin, { chinese: true }) - only in acts whose
+                     target language is Chinese (pronunciation mode), one
+                     entry per row
+
+Multiple choice compares words in normalize(target, { removeSpaces: true })
+form; getActWordIndex() computes that once per act, so it is not stored
+(an older matchKeys array is removed).
+
+Both the clean (Jsmodules) and the production (Jsmodules-js) module are
+updated; re-run after rebuilding the modules.
+
+Usage:
+    python PythonHelpers/build_answer_keys.py [chinese|spanish|english|all] [--check]
+
+Options:
+    --check   Report packs whose stored keys are missing or stale, write nothing
+              (exit status 1 if any)
+"""
+
+import os
+import sys
+
+from jsmodules import (ACT_META, CLEAN_DIR, LANGUAGE_FOLDERS, act_packs, find_modules, js_normalize, pack_rows,
+                       read_module, update_packs)
+
+
+FIELDS = ('accentFree', 'tonelessPinyin')
+REMOVED_FIELDS = ('matchKeys',)
+
+
+def act_answer_keys(data):
+    """{pack key: {'accentFree': {row: form}, ('tonelessPinyin': [...])}} for one act's data."""
+    columns = data[ACT_META]['wordColumns']
+    pinyin_index = columns.index('pinyin') if columns[0] == 'chinese' and 'pinyin' in columns else None
+    updates = {}
+    for key, pack in act_packs(data):
+        accent_free = {}
+        for i, row in enumerate(pack_rows(pack)):
+            target = row[0] if row else ''
+            form = js_normalize(target, remove_accents=True)
+            if form != target.lower():
+                accent_free[str(i)] = form
+        fields = {'accentFree': accent_free}
+        if pinyin_index is not None:
+            fields['tonelessPinyin'] = [js_normalize(row[pinyin_index] if len(row) > pinyin_index else '', chinese=True)
+                                        for row in pack_rows(pack)]
+        updates[key] = fields
+    return updates
+
+
+def main():
+    args = sys.argv[1:]
+    check = '--check' in args
+    positional = [arg.lower() for arg in args if not arg.startswith('--')]
+    target = positional[0] if positional else 'all'
+    if target != 'all' and target not in LANGUAGE_FOLDERS:
+        print(f"Unknown language: {target}")
+        print("Use: chinese, spanish, english, or all")
+        sys.exit(1)
+    languages = list(LANGUAGE_FOLDERS) if target == 'all' else [target]
+
+    stale = []
+    print(f"\n{'='*70}")
+    print("ANSWER KEYS")
+    print(f"{'='*70}")
+    for language in languages:
+        for module in find_modules(language, kinds=(CLEAN_DIR,)):
+            data = read_module(module.path)
+            updates = act_answer_keys(data)
+            name = f"{LANGUAGE_FOLDERS[language]}/{CLEAN_DIR}/{os.path.basename(module.path)}"
+            rows = sum(len(pack_rows(data[key])) for key in updates)
+            stored = ', '.join(field for field in FIELDS if any(field in fields for fields in updates.values()))
+            if check:
+                outdated = [key for key, fields in updates.items()
+                            if any(data[key].get(field) != value for field, value in fields.items())
+                            or any(field in data[key] for field in REMOVED_FIELDS)]
+                stale.extend(f"{name}: {key}" for key in outdated)
+                print(f"{name:<52} {rows:>6} rows  {len(outdated)} stale packs")
+                continue
+            changed = update_packs(module.path, updates, remove=REMOVED_FIELDS)
+            print(f"{name:<52} {rows:>6} rows  {stored}  {'updated' if changed else 'unchanged'}")
+
+    if check:
+        print()
+        if stale:
+            print(f"❌ {len(stale)} packs have missing or stale answer keys - run without --check")
+            sys.exit(1)
+        print("✓ All answer keys are current")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+Build the per-language catalog the game can populate its selectors from.
+
+wordpack-logic.js loadLanguageData() decodes every act module of a language
+before the act and pack selectors can be filled, although they only need
+titles and counts. This script writes a small ES module per language,
+<Lang>Words/catalog.js, with everything the selectors show:
+
+    acts     act number, actName, the act's __actMeta, module URL (relative
+             to the catalog), sha256 and size of the Jsmodules-js file
+    packs    per act, in module order: export key, wordpack number, titles
+             per language, baseWords/exampleWords counts
+
+Titles come from <Lang>WordsMeta.csv (Title_EN, Title_ZH, ...) where the
+language has one, otherwise from the pack's meta in the module. The game
+loads the catalog with loadLanguageCatalog() and decodes acts on demand
+(loadActData) or all in parallel (loadLanguageData).
+
+The module URLs are plain strings in the catalog, so build_deploy.py
+rewrites them to the hashed file names like any other script, and replaces
+each act's sha256/bytes with those of the deployed file. Re-run after
+rebuilding the modules or editing a Meta CSV.
+
+Usage:
+    python PythonHelpers/build_catalog.py [chinese|spanish|english|all] [--check]
+
+Options:
+    --check   Report catalogs that are missing or stale, write nothing
+              (exit status 1 if any)
+"""
+
+import csv
+import hashlib
+import json
+import os
+import posixpath
+import sys
+
+from jsmodules import ACT_META, BASE_DIR, LANGUAGE_FOLDERS, PRODUCTION_DIR, act_packs, find_modules, read_module
+
+
+CATALOG_NAME = 'catalog.js'
+
+# <Lang>WordsMeta.csv column -> title key (same keys as the packs' meta)
+META_TITLE_COLUMNS = {
+    'Title_EN': 'english',
+    'Title_ZH': 'chinese',
+    'Title_Pinyin': 'pinyin',
+    'Title_ES': 'spanish',
+    'Title_FR': 'french',
+    'Title_PT': 'portuguese',
+}
+
+
+def catalog_path(language):
+    return os.path.join(BASE_DIR, LANGUAGE_FOLDERS[language], CATALOG_NAME)
+
+
+def read_meta_titles(language):
+    """{pack number: {language: title}} from <Lang>WordsMeta.csv, or {} if there is none."""
+    folder = LANGUAGE_FOLDERS[language]
+    path = os.path.join(BASE_DIR, folder, f"{folder}Meta.csv")
+    if not os.path.exists(path):
+        return {}
+    titles = {}
+    with open(path, 'r', encoding='utf-8-sig') as f:
+        for row in csv.DictReader(f):
+            titles[int(row['Pack_Number'])] = {key: row[column].strip() for column, key in META_TITLE_COLUMNS.items()
+                                               if (row.get(column) or '').strip()}
+    return titles
+
+
+def pack_entry(key, pack, meta_titles):
+    meta = pack.get('meta', {})
+    number = meta.get('wordpack')
+    titles = {name: value for name, value in meta.items() if name != 'wordpack'}
+    titles.update(meta_titles.get(number, {}))
+    if 'words' in pack:
+        base, example = len(pack['words']), 0
+    else:
+        base, example = len(pack.get('baseWords', [])), len(pack.get('exampleWords', []))
+    return {'key': key, 'wordpack': number, 'titles': titles, 'base': base, 'example': example}
+
+
+def build_catalog(language):
+    """Catalog data for one language (acts in LANGUAGE_CONFIG order; edge-cases left out)."""
+    meta_titles = read_meta_titles(language)
+    catalog_dir = posixpath.dirname(catalog_path(language).replace(os.sep, '/'))
+    acts = []
+    for module in find_modules(language, kinds=(PRODUCTION_DIR,)):
+        if not module.act:
+            continue
+        with open(module.path, 'rb') as f:
+            raw = f.read()
+        data = read_module(module.path)
+        act_meta = data.get(ACT_META, {})
+        acts.append({
+            'act': module.act,
+            'actName': act_meta.get('actName', ''),
+            'url': './' + posixpath.relpath(module.path.replace(os.sep, '/'), catalog_dir),
+            'sha256': hashlib.sha256(raw).hexdigest(),
+            'bytes': len(raw),
+            'actMeta': act_meta,
+            'packs': [pack_entry(key, pack, meta_titles) for key, pack in act_packs(data)],
+        })
+    return {'language': language, 'acts': acts}
+
+
+def _json(value):
+    return json.dumps(value, ensure_ascii=False, separators=(', ', ': '))
+
+
+def catalog_source(catalog):
+    """catalog.js source: one act header and one pack per line."""
+    lines = [
+        '// Language catalog - generated by PythonHelpers/build_catalog.py, do not edit',
+        '// Acts, packs, titles and word counts for the selectors, without decoding the act modules',
+        '',
+        'export const catalog = {',
+        f'  "language": {_json(catalog["language"])},',
+        '  "acts": [',
+    ]
+    for i, act in enumerate(catalog['acts']):
+        header = {name: value for name, value in act.items() if name != 'packs'}
+        lines.append(f'    {_json(header)[:-1]}, "packs": [')
+        lines.append(',\n'.join(f'      {_json(pack)}' for pack in act['packs']))
+        lines.append('    ]}' + (',' if i < len(catalog['acts']) - 1 else ''))
+    lines += ['  ]', '};', '']
+    return '\n'.join(lines)
+
+
+def main():
+    args = sys.argv[1:]
+    check = '--check' in args
+    positional = [arg.lower() for arg in args if not arg.startswith('--')]
+    target = positional[0] if positional else 'all'
+    if target != 'all' and target not in LANGUAGE_FOLDERS:
+        print(f"Unknown language: {target}")
+        print("Use: chinese, spanish, english, or all")
+        sys.exit(1)
+    languages = list(LANGUAGE_FOLDERS) if target == 'all' else [target]
+
+    stale = []
+    print(f"\n{'='*70}")
+    print("LANGUAGE CATALOGS")
+    print(f"{'='*70}")
+    for language in languages:
+        catalog = build_catalog(language)
+        source = catalog_source(catalog)
+        path = catalog_path(language)
+        name = os.path.relpath(path, BASE_DIR).replace(os.sep, '/')
+        packs = sum(len(act['packs']) for act in catalog['acts'])
+        titles = 'Meta CSV titles' if read_meta_titles(language) else 'module titles'
+        current = None
+        if os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as f:
+                current = f.read()
+        if check:
+            if current != source:
+                stale.append(name)
+            print(f"{name:<28} {len(catalog['acts'])} acts  {packs:>4} packs  {'stale' if current != source else 'current'}")
+            continue
+        if current != source:
+            tmp_path = path + '.tmp'
+            with open(tmp_path, 'w', encoding='utf-8', newline='\n') as f:
+                f.write(source)
+            os.replace(tmp_path, path)
+        print(f"{name:<28} {len(catalog['acts'])} acts  {packs:>4} packs  {len(source.encode('utf-8')):>7,} bytes  "
+              f"{titles}  {'updated' if current != source else 'unchanged'}")
+
+    if check:
+        print()
+        if stale:
+            print(f"❌ {len(stale)} catalogs are missing or stale - run without --check")
+            sys.exit(1)
+        print("✓ All catalogs are current")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,426 @@
+#!/usr/bin/env python3
+"""
+Build a deployable copy of the site with minified, content-hashed assets.
+
+The game pages load wordpack-logic.js, game-sounds.js, their own JS/CSS and the
+Jsmodules-js data modules under fixed URLs, so after a deploy a browser either
+revalidates every file or keeps a stale copy. This build writes the site to
+dist/ with every local script/stylesheet renamed to <name>.<hash>.<ext>, where
+the hash is taken from the final (minified, rewritten) content. A changed file
+gets a new URL; an unchanged one keeps its URL and can be cached forever.
+
+    1. Every HTML page (outside BACKUP/) is scanned for local <script src> and
+       <link href> references
+    2. Each referenced JS file is minified (js_callgraph tokenizer: comments and
+       indentation dropped, line breaks kept where ASI could need them) and
+       checked to produce the identical token stream; string literals that name
+       another local .js/.css/.json file (e.g. the Jsmodules-js paths in
+       LANGUAGE_CONFIG) are built first and rewritten to their hashed names
+    3. CSS is minified (comments and whitespace, strings untouched)
+    4. Pages are copied with their references rewritten (pages keep their own
+       URLs - they are the entry points)
+    5. dist/asset-manifest.json maps every source path to its hashed URL,
+       sha256 and sizes
+    6. Offline cache: for each language, dist/precache-<language>.json lists
+       every file a game page needs (the page, its assets and their
+       dependencies, only that language's Jsmodules-js) with URL, sha256 and
+       size, plus the remote scripts (pako); its version is a hash of that
+       list. dist/sw.js is built from service_worker_template.js and the game
+       pages (those loading wordpack-logic.js) get a snippet registering it.
+       The worker serves those files from its cache and, when a page loads,
+       downloads only the entries whose URL or hash changed
+    7. The language catalogs' per-act sha256/bytes are recomputed for the
+       deployed (hashed, minified) act modules their URLs point at
+
+Hashed files sit in the same folder as their source, so relative URLs inside
+them (module paths are resolved relative to the script) keep working.
+
+Usage:
+    python PythonHelpers/build_deploy.py [--output-dir DIR]
+"""
+
+import hashlib
+import json
+import os
+import posixpath
+import re
+import shutil
+import sys
+
+from js_callgraph import tokenize
+from jsmodules import LANGUAGE_FOLDERS
+
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_OUTPUT_DIR = os.path.join(BASE_DIR, 'dist')
+MANIFEST_NAME = 'asset-manifest.json'
+HASH_LENGTH = 10
+PRECACHE_NAME = 'precache-{language}.json'
+SERVICE_WORKER_NAME = 'sw.js'
+SERVICE_WORKER_TEMPLATE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'service_worker_template.js')
+
+# Pages loading this script are game pages: precached, and register the service worker
+GAME_SCRIPT = 'wordpack-logic.js'
+
+# Never part of the deployed site
+EXCLUDED_DIRS = {'BACKUP', 'dist', 'PythonHelpers', 'MyFunctions', '__pycache__', 'node_modules'}
+
+ASSET_EXTENSIONS = ('.js', '.css', '.json')
+
+REMOTE_URL = re.compile(r'^(?:[a-z]+:|//|#)', re.IGNORECASE)
+LOCAL_PATH_STRING = re.compile(r'^(?:\.{1,2}/)?[\w./-]+\.(?:js|css|json)$')
+ASSET_REF = re.compile(r'(<(?:script|link)\b[^>]*?\b(?:src|href)\s*=\s*)(["\'])([^"\']+)\2', re.IGNORECASE)
+BODY_END = re.compile(r'</body\s*>', re.IGNORECASE)
+# Act entries in <Lang>Words/catalog.js (build_catalog.py): the hash and size
+# describe the file at url, so they are replaced with the deployed file's
+CATALOG_ENTRY = re.compile(r'("url": "([^"]+)", "sha256": )"[0-9a-f]{64}", "bytes": \d+')
+
+# {sw_url} is the page-relative URL of sw.js; window.currentLanguage is set by wordpack-logic.js
+SERVICE_WORKER_SNIPPET = '''  <script>
+    if ('serviceWorker' in navigator) {{
+      navigator.serviceWorker.register('{sw_url}')
+        .then(() => navigator.serviceWorker.ready)
+        .then(registration => registration.active.postMessage({{ type: 'precache', language: window.currentLanguage }}));
+    }}
+  </script>
+'''
+
+
+class BuildError(Exception):
+    """Raised when minification changes a script's meaning or a reference is broken."""
+
+
+# ============================================================
+# MINIFIERS
+# ============================================================
+
+# Line breaks after/before these can never be needed for semicolon insertion
+NO_BREAK_AFTER = {'{', ';', ',', '(', '[', ':', '=', '=>', '&&', '||', '??', '?'}
+NO_BREAK_BEFORE = {'}', ')', ']', ',', ';', '.', '?.', ':', '=>'}
+
+
+def _word_char(char):
+    return char.isalnum() or char in '_$\\'
+
+
+def _needs_space(previous, token):
+    a, b = previous.value[-1], token.value[0]
+    if _word_char(a) and _word_char(b):
+        return True
+    if previous.kind == 'num' and b == '.':
+        return True
+    return (a + b) in ('++', '--', '//', '/*', '<!', '->')
+
+
+def minify_js(source, rewrite_string=None):
+    """
+    Strip comments and redundant whitespace from JavaScript.
+
+    rewrite_string: optional callable (string token value -> new value).
+    Raises BuildError if the result does not tokenize to the same tokens.
+    """
+    tokens = tokenize(source)
+    rewrite_string = rewrite_string or (lambda value: value)
+    out = []
+    expected = []
+    previous = None
+    for token in tokens:
+        value = rewrite_string(token.value) if token.kind == 'string' else token.value
+        token = token._replace(value=value)
+        expected.append(value)
+        if previous is not None:
+            if (token.nl and not (previous.kind == 'punct' and previous.value in NO_BREAK_AFTER)
+                    and not (token.kind == 'punct' and token.value in NO_BREAK_BEFORE)):
+                out.append('\n')
+            elif _needs_space(previous, token):
+                out.append(' ')
+        out.append(value)
+        previous = token
+    result = ''.join(out) + '\n'
+
+    if [t.value for t in tokenize(result)] != expected:
+        raise BuildError("minified JS does not round-trip to the same tokens")
+    return result
+
+
+CSS_STRING_OR_COMMENT = re.compile(r'("(?:\\.|[^"\\])*"|\'(?:\\.|[^\'\\])*\')|/\*.*?\*/', re.DOTALL)
+
+
+def _squeeze_css(text):
+    text = re.sub(r'\s+', ' ', text)
+    text = re.sub(r'\s*([{};,])\s*', r'\1', text)
+    text = re.sub(r':\s+', ':', text)
+    return text.replace(';}', '}')
+
+
+def minify_css(source):
+    """Strip comments and redundant whitespace from CSS (strings are kept verbatim)."""
+    strings = []
+
+    def protect(match):
+        if match.group(1) is None:
+            return ' '
+        strings.append(match.group(1))
+        return f"\x00{len(strings) - 1}\x00"
+
+    text = _squeeze_css(CSS_STRING_OR_COMMENT.sub(protect, source)).strip()
+    return re.sub(r'\x00(\d+)\x00', lambda m: strings[int(m.group(1))], text) + '\n'
+
+
+# ============================================================
+# ASSET GRAPH
+# ============================================================
+
+def find_pages(base_dir=BASE_DIR):
+    """Repo-relative paths of all deployable HTML pages."""
+    pages = []
+    for root, dirs, files in os.walk(base_dir):
+        dirs[:] = sorted(d for d in dirs if d not in EXCLUDED_DIRS and not d.startswith('.'))
+        for name in sorted(files):
+            if name.lower().endswith('.html'):
+                pages.append(os.path.relpath(os.path.join(root, name), base_dir).replace(os.sep, '/'))
+    return pages
+
+
+def hashed_name(rel_path, content):
+    digest = hashlib.sha256(content).hexdigest()
+    stem, ext = posixpath.splitext(rel_path)
+    return f"{stem}.{digest[:HASH_LENGTH]}{ext}", digest
+
+
+def relative_url(target, from_dir, keep_dot=False):
+    url = posixpath.relpath(target, from_dir or '.')
+    return './' + url if keep_dot and not url.startswith('../') else url
+
+
+class DeployBuild:
+    """Builds assets on demand (dependencies first) and records the manifest."""
+
+    def __init__(self, base_dir=BASE_DIR):
+        self.base_dir = base_dir
+        self.assets = {}      # source rel path -> manifest entry
+        self.outputs = {}     # output rel path -> bytes
+        self.pages = {}       # page rel path -> [asset rel paths]
+        self.dependencies = {}    # asset rel path -> [asset rel paths it references]
+        self.remote_scripts = {}  # page rel path -> [remote <script src> URLs]
+        self._building = set()
+
+    def local_path(self, url, from_dir):
+        """Repo-relative path for a local URL, or None if remote/missing."""
+        if REMOTE_URL.match(url):
+            return None
+        rel = posixpath.normpath(posixpath.join(from_dir, url.split('?')[0].split('#')[0]))
+        if rel.startswith('..') or not os.path.isfile(os.path.join(self.base_dir, rel)):
+            return None
+        return rel
+
+    def build_asset(self, rel_path):
+        """Build one asset; return its hashed rel path."""
+        if rel_path in self.assets:
+            return self.assets[rel_path]['url']
+        if rel_path in self._building:
+            raise BuildError(f"circular asset reference through {rel_path}")
+        self._building.add(rel_path)
+        self.dependencies[rel_path] = []
+
+        with open(os.path.join(self.base_dir, rel_path), 'r', encoding='utf-8') as f:
+            source = f.read()
+        asset_dir = posixpath.dirname(rel_path)
+        ext = posixpath.splitext(rel_path)[1].lower()
+
+        if ext == '.js':
+            def deployed_entry(match):
+                dep = self.local_path(match.group(2), asset_dir)
+                if dep is None:
+                    raise BuildError(f"{rel_path}: catalog entry points at a missing file: {match.group(2)}")
+                self.build_asset(dep)
+                entry = self.assets[dep]
+                return f'{match.group(1)}"{entry["sha256"]}", "bytes": {entry["bytes"]}'
+            source = CATALOG_ENTRY.sub(deployed_entry, source)
+
+            def rewrite(value):
+                quote, inner = value[0], value[1:-1]
+                if not LOCAL_PATH_STRING.match(inner):
+                    return value
+                dep = self.local_path(inner, asset_dir)
+                if dep is None or not dep.endswith(ASSET_EXTENSIONS):
+                    return value
+                self.dependencies[rel_path].append(dep)
+                url = relative_url(self.build_asset(dep), asset_dir, keep_dot=inner.startswith('./'))
+                return quote + url + quote
+            try:
+                output = minify_js(source, rewrite)
+            except BuildError as e:
+                raise BuildError(f"{rel_path}: {e}")
+        elif ext == '.css':
+            output = minify_css(source)
+        else:
+            output = source
+
+        data = output.encode('utf-8')
+        url, digest = hashed_name(rel_path, data)
+        self.outputs[url] = data
+        self.assets[rel_path] = {
+            'url': url,
+            'sha256': digest,
+            'bytes': len(data),
+            'source_bytes': len(source.encode('utf-8')),
+        }
+        self._building.discard(rel_path)
+        return url
+
+    def build_page(self, rel_path):
+        with open(os.path.join(self.base_dir, rel_path), 'r', encoding='utf-8') as f:
+            html = f.read()
+        page_dir = posixpath.dirname(rel_path)
+        used = []
+        remote = []
+
+        def rewrite(match):
+            prefix, quote, url = match.groups()
+            if prefix.lower().startswith('<script') and re.match(r'https?://', url, re.IGNORECASE):
+                remote.append(url)
+            asset = self.local_path(url, page_dir)
+            if asset is None or not asset.endswith(ASSET_EXTENSIONS):
+                return match.group(0)
+            used.append(asset)
+            return f"{prefix}{quote}{relative_url(self.build_asset(asset), page_dir)}{quote}"
+
+        html = ASSET_REF.sub(rewrite, html)
+        if GAME_SCRIPT in self.closure(used):
+            snippet = SERVICE_WORKER_SNIPPET.format(sw_url=relative_url(SERVICE_WORKER_NAME, page_dir))
+            match = None
+            for match in BODY_END.finditer(html):
+                pass
+            html = html[:match.start()] + snippet + html[match.start():] if match else html + snippet
+        self.outputs[rel_path] = html.encode('utf-8')
+        self.pages[rel_path] = used
+        self.remote_scripts[rel_path] = remote
+
+    def closure(self, rel_paths):
+        """rel_paths and every asset they reference, directly or indirectly."""
+        found = []
+        stack = list(reversed(rel_paths))
+        while stack:
+            rel_path = stack.pop()
+            if rel_path not in found:
+                found.append(rel_path)
+                stack.extend(reversed(self.dependencies.get(rel_path, [])))
+        return found
+
+    def precache_manifests(self):
+        """{language: manifest} - everything the game pages need offline for that language."""
+        game_pages = [page for page, used in self.pages.items() if GAME_SCRIPT in self.closure(used)]
+        manifests = {}
+        for language, folder in LANGUAGE_FOLDERS.items():
+            other_folders = tuple(f"{other}/" for other in LANGUAGE_FOLDERS.values() if other != folder)
+            entries = {}
+            for page in game_pages:
+                data = self.outputs[page]
+                entries[page] = {'url': page, 'sha256': hashlib.sha256(data).hexdigest(), 'bytes': len(data)}
+                for asset in self.closure(self.pages[page]):
+                    if not asset.startswith(other_folders):
+                        entry = self.assets[asset]
+                        entries[asset] = {'url': entry['url'], 'sha256': entry['sha256'], 'bytes': entry['bytes']}
+            assets = sorted(entries.values(), key=lambda entry: entry['url'])
+            remote = sorted({url for page in game_pages for url in self.remote_scripts[page]})
+            listing = json.dumps([assets, remote], sort_keys=True).encode('utf-8')
+            manifests[language] = {
+                'language': language,
+                'version': hashlib.sha256(listing).hexdigest()[:HASH_LENGTH],
+                'generated_by': 'PythonHelpers/build_deploy.py',
+                'assets': assets,
+                'remote': remote,
+            }
+        return manifests
+
+    def service_worker(self, manifests):
+        """Minified sw.js source for these precache manifests."""
+        with open(SERVICE_WORKER_TEMPLATE, 'r', encoding='utf-8') as f:
+            template = f.read()
+        versions = ''.join(manifest['version'] for manifest in manifests.values())
+        source = (template
+                  .replace('__BUILD_VERSION__', hashlib.sha256(versions.encode('utf-8')).hexdigest()[:HASH_LENGTH])
+                  .replace('__PRECACHE_LANGUAGES__', json.dumps(list(manifests))))
+        return minify_js(source)
+
+    def manifest(self):
+        return {
+            'generated_by': 'PythonHelpers/build_deploy.py',
+            'assets': dict(sorted(self.assets.items())),
+            'pages': dict(sorted(self.pages.items())),
+        }
+
+    def write(self, output_dir):
+        """Write everything to a fresh output_dir (built aside, then swapped in)."""
+        staging = output_dir.rstrip('/\\') + '.tmp'
+        if os.path.exists(staging):
+            shutil.rmtree(staging)
+        for rel_path, data in self.outputs.items():
+            path = os.path.join(staging, rel_path)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'wb') as f:
+                f.write(data)
+        with open(os.path.join(staging, MANIFEST_NAME), 'w', encoding='utf-8') as f:
+            json.dump(self.manifest(), f, indent=2)
+            f.write('\n')
+        manifests = self.precache_manifests()
+        for language, manifest in manifests.items():
+            with open(os.path.join(staging, PRECACHE_NAME.format(language=language)), 'w', encoding='utf-8') as f:
+                json.dump(manifest, f, indent=2)
+                f.write('\n')
+        with open(os.path.join(staging, SERVICE_WORKER_NAME), 'w', encoding='utf-8', newline='\n') as f:
+            f.write(self.service_worker(manifests))
+        if os.path.exists(output_dir):
+            shutil.rmtree(output_dir)
+        os.replace(staging, output_dir)
+
+
+# ============================================================
+# MAIN
+# ============================================================
+
+def main():
+    args = sys.argv[1:]
+    output_dir = DEFAULT_OUTPUT_DIR
+    rest = iter(args)
+    for arg in rest:
+        if arg == '--output-dir':
+            output_dir = os.path.abspath(next(rest))
+        else:
+            print("Usage: python PythonHelpers/build_deploy.py [--output-dir DIR]")
+            sys.exit(1)
+
+    build = DeployBuild()
+    try:
+        for page in find_pages():
+            build.build_page(page)
+    except BuildError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+    build.write(output_dir)
+
+    print(f"\n{'='*70}")
+    print("DEPLOY BUILD")
+    print(f"{'='*70}")
+    for page, used in build.pages.items():
+        print(f"{page}: {len(used)} local assets")
+    print()
+    total_source = total_output = 0
+    for rel_path, entry in build.manifest()['assets'].items():
+        total_source += entry['source_bytes']
+        total_output += entry['bytes']
+        print(f"  {rel_path:<52} {entry['source_bytes']:>9,} -> {entry['bytes']:>9,}  {posixpath.basename(entry['url'])}")
+    saved = (1 - total_output / total_source) * 100 if total_source else 0
+    print(f"\nAssets: {len(build.assets)}  {total_source:,} -> {total_output:,} bytes ({saved:.1f}% smaller)")
+    print()
+    for language, manifest in build.precache_manifests().items():
+        size = sum(entry['bytes'] for entry in manifest['assets'])
+        print(f"  {PRECACHE_NAME.format(language=language):<28} {len(manifest['assets']):>3} files  {size:>9,} bytes  "
+              f"+{len(manifest['remote'])} remote  version {manifest['version']}")
+    print(f"✓ Wrote {len(build.pages)} pages, {MANIFEST_NAME}, precache manifests and {SERVICE_WORKER_NAME} "
+          f"to {os.path.relpath(output_dir, BASE_DIR)}/")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,321 @@
+#!/usr/bin/env python3
+"""
+Precompute ranked wrong-answer (distractor) lists for the multiple-choice modes.
+
+wordpack-logic.js generateWrongAnswers() used to walk every pack and word of
+the act for each question, normalize each one and shuffle the whole list to
+take four. This script does the ranking once at build time and stores it in
+the pack data, so the game only reads a short list.
+
+For every word of an act (target-language column, baseWords then
+exampleWords, packs in module order) the candidates are the other words of
+the same act and script (a Latin-letter word is a poor distractor for 你好),
+compared in the game's normalized form (lowercase, no spaces or punctuation -
+normalize(..., { removeSpaces: true })). They are ranked by:
+
+    1. edit distance, nearest first - a BK-tree per script finds the
+       DISTRACTOR_COUNT nearest within len/3 edits (at most MAX_RADIUS)
+    2. length difference
+    3. position in the act
+
+When fewer are that close, the list is filled with the words of the same
+pack closest in length (same topic), then with those of the whole act.
+Words that normalize to the answer's own form are never used, and no word
+appears twice in a list.
+
+The lists hold act-wide word indices: index n is the n-th word of the act
+counting through the packs in module order, baseWords then exampleWords.
+Each pack gets them as one `distractors` string, row by row in the order of
+baseWords.concat(exampleWords) (or `words` in the older single-list packs):
+DISTRACTOR_COUNT slots per row. Most slots point into the word's own pack
+(the same-pack fill above), so a slot is written as:
+
+    one base-64 digit (DISTRACTOR_DIGITS)   index counted from the pack's first row (< 64)
+    ACT_INDEX_MARK + two base-64 digits     act-wide index (< 4096)
+    EMPTY_SLOT                              no word
+
+Apart from that the indices are close to random; the pack-relative digit
+keeps English act 1 inside its module_payload_report.py budget.
+getActWordIndex() in wordpack-logic.js decodes them once per act.
+
+Both the clean (Jsmodules) and the production (Jsmodules-js) module are
+updated; re-run after rebuilding the modules.
+
+Usage:
+    python PythonHelpers/build_distractors.py [chinese|spanish|english|all] [--check]
+
+Options:
+    --check   Report packs whose stored lists are missing or stale, write nothing
+              (exit status 1 if any)
+"""
+
+import heapq
+import os
+import sys
+import time
+
+from jsmodules import (CLEAN_DIR, LANGUAGE_FOLDERS, act_packs, find_modules, js_normalize, pack_rows, read_module,
+                       update_packs)
+
+
+DISTRACTOR_COUNT = 4
+MAX_RADIUS = 6
+FIELD = 'distractors'
+DISTRACTOR_DIGITS = 'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/'
+ACT_INDEX_MARK = '*'
+EMPTY_SLOT = '-'
+
+
+def normalize_answer(text):
+    return js_normalize(text, remove_spaces=True)
+
+
+def script_of(text):
+    """'han' when the word contains a CJK ideograph, else 'latin'."""
+    return 'han' if any('㐀' <= char <= '鿿' for char in text) else 'latin'
+
+
+# ============================================================
+# EDIT DISTANCE / BK-TREE
+# ============================================================
+
+def bit_pattern(word):
+    """Per-character bit masks of word, for levenshtein()."""
+    match = {}
+    for i, char in enumerate(word):
+        match[char] = match.get(char, 0) | (1 << i)
+    return match
+
+
+def levenshtein(word, other, limit, match=None):
+    """
+    Edit distance between word and other, or limit + 1 once it is known to exceed limit.
+
+    Bit-parallel (Myers/Hyyro), one bit per character of word; pass
+    match=bit_pattern(word) when comparing the same word many times.
+    """
+    if abs(len(word) - len(other)) > limit:
+        return limit + 1
+    if not word:
+        return len(other)
+    if match is None:
+        match = bit_pattern(word)
+    full = (1 << len(word)) - 1
+    last = 1 << (len(word) - 1)
+    plus, minus, score = full, 0, len(word)
+    remaining = len(other)
+    for char in other:
+        eq = match.get(char, 0)
+        xv = eq | minus
+        xh = (((eq & plus) + plus) ^ plus) | eq
+        h_plus = minus | (~(xh | plus) & full)
+        h_minus = plus & xh
+        if h_plus & last:
+            score += 1
+        elif h_minus & last:
+            score -= 1
+        remaining -= 1
+        if score - remaining > limit:
+            return limit + 1
+        h_plus = ((h_plus << 1) | 1) & full
+        h_minus = (h_minus << 1) & full
+        plus = h_minus | (~(xv | h_plus) & full)
+        minus = h_plus & xv
+    return score if score <= limit else limit + 1
+
+
+class BKTree:
+    """Burkhard-Keller tree over strings with the Levenshtein metric."""
+
+    def __init__(self, words):
+        self.root = None
+        for word in words:
+            self.add(word)
+
+    def add(self, word):
+        if self.root is None:
+            self.root = (word, {})
+            return
+        node = self.root
+        while True:
+            distance = levenshtein(word, node[0], max(len(word), len(node[0])))
+            if distance == 0:
+                return
+            child = node[1].get(distance)
+            if child is None:
+                node[1][distance] = (word, {})
+                return
+            node = child
+
+    def nearest(self, word, count, radius):
+        """
+        [(distance, word), ...] for the words closest to word (itself excluded):
+        every word within the distance of the count-th nearest, at most radius.
+
+        The search radius shrinks to the count-th best distance found so far,
+        and children closest to the current distance are visited first.
+        """
+        match = bit_pattern(word)
+        found = []
+        closest = []        # max-heap (negated) of the count smallest distances
+        stack = [self.root] if self.root else []
+        while stack:
+            node_word, children = stack.pop()
+            # Exact distance is only needed up to what child pruning can use
+            distance = levenshtein(word, node_word, radius + max(children, default=0), match)
+            if 0 < distance <= radius:
+                found.append((distance, node_word))
+                heapq.heappush(closest, -distance)
+                if len(closest) > count:
+                    heapq.heappop(closest)
+                if len(closest) == count:
+                    radius = min(radius, -closest[0])
+            edges = [edge for edge in children if distance - radius <= edge <= distance + radius]
+            edges.sort(key=lambda edge: abs(edge - distance), reverse=True)
+            stack.extend(children[edge] for edge in edges)
+        return sorted(item for item in found if item[0] <= radius)
+
+
+# ============================================================
+# RANKING
+# ============================================================
+
+def act_words(data):
+    """[(pack key, [answer text, ...]), ...] in module order."""
+    return [(key, [row[0] if row else '' for row in pack_rows(pack)]) for key, pack in act_packs(data)]
+
+
+def rank_distractors(pack_texts, count=DISTRACTOR_COUNT, max_radius=MAX_RADIUS):
+    """
+    pack_texts: [[answer text, ...], ...] per pack, in module order.
+    Returns: [[[act word index, ...], ...], ...] parallel to pack_texts.
+    """
+    texts = [text for texts in pack_texts for text in texts]
+    first_index = {}
+    for index, text in enumerate(texts):
+        first_index.setdefault(normalize_answer(text), index)
+    first_index.pop('', None)
+
+    # One BK-tree and one word list per script
+    trees = {}
+    act_keys = {}
+    for key, index in first_index.items():
+        script = script_of(texts[index])
+        trees.setdefault(script, BKTree([])).add(key)
+        act_keys.setdefault(script, []).append(key)
+
+    nearest = {}
+    result = []
+    for texts in pack_texts:
+        pack_keys = {}
+        for text in texts:
+            pack_keys.setdefault(script_of(text), []).append(normalize_answer(text))
+        ranked = []
+        for text in texts:
+            key = normalize_answer(text)
+            script = script_of(text)
+            if key not in nearest:
+                nearest[key] = _nearest_words(key, trees.get(script), first_index, count, max_radius)
+            chosen = _fill_by_length(key, nearest[key], pack_keys[script], count)
+            chosen = _fill_by_length(key, chosen, act_keys.get(script, []), count)
+            ranked.append([first_index[word] for word in chosen])
+        result.append(ranked)
+    return result
+
+
+def _nearest_words(key, tree, first_index, count, max_radius):
+    """Up to count words (normalized) nearest to key by edit distance, best first."""
+    if not key or tree is None:
+        return []
+    radius = min(max_radius, max(1, len(key) // 3))
+    candidates = sorted((distance, abs(len(word) - len(key)), first_index[word], word)
+                        for distance, word in tree.nearest(key, count, radius))
+    return [candidate[-1] for candidate in candidates[:count]]
+
+
+def _fill_by_length(key, chosen, words, count):
+    """Extend chosen up to count with the words closest in length to key (first listed wins ties)."""
+    if len(chosen) >= count or not key:
+        return chosen
+    taken = set(chosen) | {key, ''}
+    extra = sorted((abs(len(word) - len(key)), position, word)
+                   for position, word in enumerate(dict.fromkeys(words)) if word not in taken)
+    return chosen + [word for _, _, word in extra[:count - len(chosen)]]
+
+
+def encode_distractors(lists, pack_start):
+    """
+    [[act word index, ...], ...] -> a pack's distractors string (DISTRACTOR_COUNT slots per row).
+
+    pack_start: act word index of the pack's first row
+    """
+    slots = []
+    for indices in lists:
+        for index in indices:
+            if 0 <= index - pack_start < len(DISTRACTOR_DIGITS):
+                slots.append(DISTRACTOR_DIGITS[index - pack_start])
+            elif 0 <= index < len(DISTRACTOR_DIGITS) ** 2:
+                slots.append(ACT_INDEX_MARK + DISTRACTOR_DIGITS[index // 64] + DISTRACTOR_DIGITS[index % 64])
+            else:
+                raise ValueError(f"act word index {index} does not fit in two base-64 digits")
+        slots.extend([EMPTY_SLOT] * (DISTRACTOR_COUNT - len(indices)))
+    return ''.join(slots)
+
+
+def act_distractors(data):
+    """{pack key: {'distractors': encoded lists}} for one act's data."""
+    packs = act_words(data)
+    ranked = rank_distractors([texts for _, texts in packs])
+    updates = {}
+    pack_start = 0
+    for (key, texts), lists in zip(packs, ranked):
+        updates[key] = {FIELD: encode_distractors(lists, pack_start)}
+        pack_start += len(texts)
+    return updates
+
+
+# ============================================================
+# MAIN
+# ============================================================
+
+def main():
+    args = sys.argv[1:]
+    check = '--check' in args
+    positional = [arg.lower() for arg in args if not arg.startswith('--')]
+    target = positional[0] if positional else 'all'
+    if target != 'all' and target not in LANGUAGE_FOLDERS:
+        print(f"Unknown language: {target}")
+        print("Use: chinese, spanish, english, or all")
+        sys.exit(1)
+    languages = list(LANGUAGE_FOLDERS) if target == 'all' else [target]
+
+    stale = []
+    print(f"\n{'='*70}")
+    print(f"DISTRACTOR LISTS ({DISTRACTOR_COUNT} per word, BK-tree radius <= {MAX_RADIUS})")
+    print(f"{'='*70}")
+    for language in languages:
+        for module in find_modules(language, kinds=(CLEAN_DIR,)):
+            start = time.perf_counter()
+            data = read_module(module.path)
+            updates = act_distractors(data)
+            name = f"{LANGUAGE_FOLDERS[language]}/{CLEAN_DIR}/{os.path.basename(module.path)}"
+            words = sum(len(pack_rows(data[key])) for key in updates)
+            if check:
+                outdated = [key for key, fields in updates.items() if data[key].get(FIELD) != fields[FIELD]]
+                stale.extend(f"{name}: {key}" for key in outdated)
+                print(f"{name:<52} {words:>6} words  {len(outdated)} stale packs")
+                continue
+            changed = update_packs(module.path, updates)
+            print(f"{name:<52} {words:>6} words  {'updated' if changed else 'unchanged'} "
+                  f"({time.perf_counter() - start:.1f}s)")
+
+    if check:
+        print()
+        if stale:
+            print(f"❌ {len(stale)} packs have missing or stale distractor lists - run without --check")
+            sys.exit(1)
+        print("✓ All distractor lists are current")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""
+Build a minimal JavaScript bundle per FlashcardTypingGame mode by tree shaking.
+
+Every mode page currently ships the whole of wordpack-logic.js, game-sounds.js
+and FlashcardTypingGame.js. This script reads the scripts the game page loads
+(local src scripts and inline scripts, in page order), builds their top-level
+call graph with js_callgraph, and keeps only what the page can run:
+
+    - load-time statements and side-effecting declarations of every script
+      (the game's own wiring: DOM lookups, event listeners, init calls)
+    - functions named in the page's on*="..." handler attributes
+    - names the page's own scripts (inline and type="module") publish on window
+    - everything reachable from those
+
+The roots are taken from the page, not listed here, so code the game never
+calls is dropped; when the page starts calling a function it is kept. The
+modes are the page's data-mode buttons (MODE_SKILLS must name each one);
+mode-specific code is only separated once the page's scripts tell the modes
+apart, until then the mode bundles are the same.
+
+Export lists are filtered to the kept names (Object.assign(window, {...}),
+window.x = x) and the CommonJS module.exports block is dropped. The classic
+scripts become one classic bundle, <mode>.js; each type="module" script
+becomes its own module chunk, <mode>.<script name>, so its top-level scope
+stays private:
+
+    <script defer src="bundles/<mode>.js"></script>
+    <script type="module" src="bundles/<mode>.FlashcardTypingGame.js"></script>
+
+Two scripts defining the same global name is an error.
+
+Output:
+    FlashcardTypingGame/bundles/<mode>.js
+    FlashcardTypingGame/bundles/<mode>.<module script>.js
+    FlashcardTypingGame/bundles/size-report.csv
+
+Usage:
+    python PythonHelpers/build_mode_bundles.py [mode|all] [--output-dir DIR] [--verbose]
+
+    --verbose lists the functions dropped from each bundle.
+"""
+
+import csv
+import gzip
+import os
+import re
+import sys
+
+from extract_functions_to_csv import CALL_IN_TEXT, HANDLER_ATTR
+from js_callgraph import CallGraph, load_page_sources
+
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+GAME_PAGE = os.path.join(BASE_DIR, 'FlashcardTypingGame', 'FlashcardTypingGame.html')
+DEFAULT_OUTPUT_DIR = os.path.join(BASE_DIR, 'FlashcardTypingGame', 'bundles')
+
+MODE_SKILLS = {
+    'flashcard': 'reading',
+    'spelling': 'listening',
+    'pronunciation': 'speaking',
+    'translation': 'writing',
+}
+
+MODE_BUTTON = re.compile(r'\bdata-mode\s*=\s*["\']([^"\']+)["\']', re.IGNORECASE)
+
+
+# ============================================================
+# PAGE ROOTS
+# ============================================================
+
+def page_modes(html):
+    """Modes of the page's data-mode buttons, in page order."""
+    return list(dict.fromkeys(MODE_BUTTON.findall(html)))
+
+
+def page_entry_points(graph, html):
+    """
+    Functions the page calls outside the load-time code: names in on*="..."
+    handler attributes and names its own (inline and module) scripts publish
+    on window. Load-time statements are added by CallGraph.reachable().
+    """
+    own = {label for label in graph.sources if label.startswith('inline#') or label in graph.modules}
+    names = set()
+    for handler in HANDLER_ATTR.findall(html):
+        names.update(CALL_IN_TEXT.findall(handler))
+    for item in graph.items:
+        if item.source in own and item.kind == 'export':
+            names.update(item.exports)
+    return sorted(name for name in names if name in graph.definitions)
+
+
+# ============================================================
+# BUNDLING
+# ============================================================
+
+def bundle_item_text(item, keep):
+    """Source text of an item in a bundle keeping `keep`, or None to drop it."""
+    if item.kind == 'cjs-export':
+        return None
+    if item.kind == 'export':
+        exported = [name for name in item.exports if name in keep]
+        if not exported:
+            return None
+        if item.text.startswith('Object.assign'):
+            return f"Object.assign(window, {{ {', '.join(exported)} }});"
+        return item.text
+    if item.kind in ('statement', 'variable'):
+        return item.text
+    return item.text if any(name in keep for name in item.names) else None
+
+
+def build_chunk(graph, labels, keep, mode):
+    parts = [f"// FlashcardTypingGame {mode} bundle - generated by PythonHelpers/build_mode_bundles.py"]
+    for label in labels:
+        texts = [bundle_item_text(item, keep) for item in graph.items if item.source == label]
+        texts = [text for text in texts if text is not None]
+        if texts:
+            parts.append(f"// ---- {label} ----\n" + '\n\n'.join(texts))
+    return '\n\n'.join(parts) + '\n'
+
+
+def build_bundle(graph, keep, mode):
+    """{file name: source} - the classic scripts as <mode>.js, each module script as <mode>.<name>."""
+    classic = [label for label in graph.sources if label not in graph.modules]
+    chunks = {f"{mode}.js": build_chunk(graph, classic, keep, mode)}
+    for label in graph.sources:
+        if label in graph.modules:
+            name = os.path.basename(label) if label.endswith('.js') else label.replace('#', '') + '.js'
+            chunks[f"{mode}.{name}"] = build_chunk(graph, [label], keep, mode)
+    return chunks
+
+
+def write_text(path, text):
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8', newline='\n') as f:
+        f.write(text)
+    os.replace(tmp_path, path)
+
+
+def gzip_size(data):
+    return len(gzip.compress(data, compresslevel=9, mtime=0))
+
+
+# ============================================================
+# MAIN
+# ============================================================
+
+def main():
+    args = sys.argv[1:]
+    output_dir = DEFAULT_OUTPUT_DIR
+    verbose = False
+    positional = []
+    rest = iter(args)
+    for arg in rest:
+        if arg == '--output-dir':
+            output_dir = next(rest)
+        elif arg == '--verbose':
+            verbose = True
+        else:
+            positional.append(arg.lower())
+
+    with open(GAME_PAGE, 'r', encoding='utf-8') as f:
+        html = f.read()
+    page_mode_list = page_modes(html)
+    unknown = [mode for mode in page_mode_list if mode not in MODE_SKILLS]
+    if not page_mode_list or unknown:
+        print(f"❌ {os.path.relpath(GAME_PAGE, BASE_DIR)} data-mode buttons: {', '.join(page_mode_list) or '(none)'}")
+        if unknown:
+            print(f"   Add {', '.join(unknown)} to MODE_SKILLS")
+        sys.exit(1)
+
+    target = positional[0] if positional else 'all'
+    if target != 'all' and target not in page_mode_list:
+        print(f"Unknown mode: {target}")
+        print(f"Use: {', '.join(page_mode_list)}, or all")
+        sys.exit(1)
+    modes = page_mode_list if target == 'all' else [target]
+
+    sources = load_page_sources(GAME_PAGE)
+    graph = CallGraph(sources)
+    if graph.duplicates:
+        for name, first, second in graph.duplicates:
+            print(f"❌ Global '{name}' defined in both {first.source}:{first.line} and {second.source}:{second.line}")
+        sys.exit(1)
+    entry_points = page_entry_points(graph, html)
+    keep = graph.reachable(entry_points)
+
+    full = [source.encode('utf-8') for _, source, _ in sources]
+    full_bytes = sum(len(data) for data in full)
+    full_gzip = sum(gzip_size(data) for data in full)
+    functions = sorted(name for name, item in graph.definitions.items() if item.kind == 'function')
+
+    os.makedirs(output_dir, exist_ok=True)
+    report = []
+
+    print(f"\n{'='*70}")
+    print(f"MODE BUNDLES: {', '.join(label for label, _, _ in sources)}")
+    print(f"{'='*70}")
+    print(f"Page entry points: {', '.join(entry_points) or '(load-time code only)'}")
+    print(f"{'Mode':<15} {'Functions':>10} {'Bytes':>9} {'Gzip':>8} {'vs full':>8}")
+    print(f"{'(full)':<15} {len(functions):>4}/{len(functions):<5} {full_bytes:>9,} {full_gzip:>8,}")
+
+    for mode in modes:
+        chunks = build_bundle(graph, keep, mode)
+        size = gzipped = 0
+        for name, text in chunks.items():
+            data = text.encode('utf-8')
+            write_text(os.path.join(output_dir, name), text)
+            size += len(data)
+            gzipped += gzip_size(data)
+
+        kept = [name for name in functions if name in keep]
+        dropped = [name for name in functions if name not in keep]
+        saved = (1 - size / full_bytes) * 100
+        report.append([mode, MODE_SKILLS[mode], len(kept), len(functions), size, gzipped,
+                       full_bytes, full_gzip, f"{saved:.1f}", ' '.join(dropped)])
+        print(f"{mode:<15} {len(kept):>4}/{len(functions):<5} {size:>9,} {gzipped:>8,} {-saved:>7.1f}%")
+        if verbose:
+            print(f"    dropped: {', '.join(dropped) or '(none)'}")
+
+    report_path = os.path.join(output_dir, 'size-report.csv')
+    with open(report_path, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.writer(f, lineterminator='\n')
+        writer.writerow(['Mode', 'Skill', 'Functions_Kept', 'Functions_Total', 'Bytes', 'Gzip_Bytes',
+                         'Full_Bytes', 'Full_Gzip_Bytes', 'Saved_Percent', 'Dropped_Functions'])
+        writer.writerows(report)
+
+    print(f"\n✓ Wrote {len(modes)} bundles and size-report.csv to {os.path.relpath(output_dir, BASE_DIR)}")
+
+
+if __name__ == '__main__':
+    main()
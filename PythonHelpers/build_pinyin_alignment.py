@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Precompute Chinese/pinyin alignment arrays for the word data modules.
+
+coupleChineseWithPinyin() in wordpack-logic.js splits the pinyin on spaces and
+walks the Chinese string for every card it renders, and shows '?' when the
+counts disagree. This script aligns every row once at build time with the
+validate_pinyin.py tokenizer (Chinese character + trailing punctuation ->
+one syllable, Latin letter -> itself, standalone punctuation -> itself) and
+stores the result in the pack data.
+
+The syllables of an aligned row are always its pinyin split on spaces, and
+its units its Chinese characters (spaces removed) in order, so only the
+unit lengths are stored. Each pack gets a `pinyinUnits` object keyed by row
+index (rows of baseWords.concat(exampleWords), or `words`):
+
+    (row not listed)   one character per syllable - the common case
+    "1121"             unit lengths, for rows with attached punctuation:
+                       早上好，先生 / zǎo shàng hǎo， xiān shēng
+                         -> 早/zǎo 上/shàng 好，/hǎo， 先/xiān 生/shēng = "11211"
+    null               refused - the build fails (exit status 1) until the
+                       row is fixed in the CSV
+
+expandPinyinUnits() in wordpack-logic.js turns an entry back into the
+[unit, syllable, ...] list coupleChineseWithPinyin() takes.
+
+A row is only aligned when validate_character_mapping() accepts it, the
+units and syllables reproduce both columns exactly (spaces aside), so no
+character is dropped, and the stored form expands back to the same pairs.
+Any other row is refused: it is listed in the output and the run exits with
+status 1, so a misaligned row fails the build instead of shipping with the
+runtime '?' fallback. Fix it in the breakout CSV (validate_pinyin.py reports
+the same rows) and rebuild.
+
+Both the clean (Jsmodules) and the production (Jsmodules-js) module are
+updated; re-run after rebuilding the modules.
+
+Usage:
+    python PythonHelpers/build_pinyin_alignment.py [chinese|spanish|english|all] [--check]
+
+Options:
+    --check   Report packs whose stored arrays are missing or stale, write nothing
+              (exit status 1 if any)
+"""
+
+import os
+import sys
+
+from jsmodules import ACT_META, CLEAN_DIR, LANGUAGE_FOLDERS, act_packs, find_modules, pack_rows, read_module, update_packs
+from validate_pinyin import (parse_chinese_chars_with_punctuation, parse_pinyin_syllables_with_punctuation,
+                             validate_character_mapping)
+
+
+FIELD = 'pinyinUnits'
+REMOVED_FIELDS = ('pinyinPairs',)
+
+
+def align_row(chinese, pinyin):
+    """
+    Return (flat [unit, syllable, ...] list, None) or (None, reason) when the row is refused.
+    """
+    chinese, pinyin = (chinese or '').strip(), (pinyin or '').strip()
+    if not chinese or not pinyin:
+        return None, 'empty chinese or pinyin'
+    is_valid, error = validate_character_mapping(chinese, pinyin)
+    if not is_valid:
+        return None, error
+    units = [unit for unit, _ in parse_chinese_chars_with_punctuation(chinese)]
+    syllables = [syllable for syllable, _ in parse_pinyin_syllables_with_punctuation(pinyin)]
+    if ''.join(units) != ''.join(chinese.split()):
+        return None, 'tokenizer drops characters from the Chinese'
+    if ''.join(syllables) != ''.join(pinyin.split()):
+        return None, 'tokenizer drops characters from the pinyin'
+    return [value for pair in zip(units, syllables) for value in pair], None
+
+
+def expand_units(chinese, pinyin, units):
+    """Flat [unit, syllable, ...] list of a stored entry - expandPinyinUnits() in JS."""
+    chars = ''.join(chinese.split())
+    syllables = pinyin.split()
+    lengths = [int(digit) for digit in units] if units else [1] * len(chars)
+    pairs = []
+    start = 0
+    for i, length in enumerate(lengths):
+        pairs += [chars[start:start + length], syllables[i] if i < len(syllables) else None]
+        start += length
+    return pairs
+
+
+def store_units(chinese, pinyin, pairs):
+    """
+    Returns:
+        tuple: ('' for one character per syllable, or the unit lengths, None) or (None, reason)
+    """
+    units = ''.join(str(len(unit)) for unit in pairs[0::2])
+    if set(units) == {'1'}:
+        units = ''
+    if any(len(unit) > 9 for unit in pairs[0::2]):
+        return None, 'unit longer than 9 characters'
+    if expand_units(chinese, pinyin, units) != pairs:
+        return None, 'pinyin does not split on spaces into the aligned syllables'
+    return units, None
+
+
+def act_alignment(data):
+    """
+    Returns:
+        tuple: ({pack key: {'pinyinUnits': {row: units or None}}}, [(pack key, row index, chinese, pinyin, reason), ...])
+    """
+    columns = data[ACT_META]['wordColumns']
+    chinese_index, pinyin_index = columns.index('chinese'), columns.index('pinyin')
+    updates = {}
+    refused = []
+    for key, pack in act_packs(data):
+        aligned = {}
+        for i, row in enumerate(pack_rows(pack)):
+            chinese = row[chinese_index] if len(row) > chinese_index else ''
+            pinyin = row[pinyin_index] if len(row) > pinyin_index else ''
+            pairs, reason = align_row(chinese, pinyin)
+            units = None
+            if pairs:
+                units, reason = store_units(chinese, pinyin, pairs)
+            if reason:
+                refused.append((key, i, chinese, pinyin, reason))
+            if units != '':
+                aligned[str(i)] = units
+        updates[key] = {FIELD: aligned}
+    return updates, refused
+
+
+def main():
+    args = sys.argv[1:]
+    check = '--check' in args
+    positional = [arg.lower() for arg in args if not arg.startswith('--')]
+    target = positional[0] if positional else 'all'
+    if target != 'all' and target not in LANGUAGE_FOLDERS:
+        print(f"Unknown language: {target}")
+        print("Use: chinese, spanish, english, or all")
+        sys.exit(1)
+    languages = list(LANGUAGE_FOLDERS) if target == 'all' else [target]
+
+    stale = []
+    all_refused = []
+    print(f"\n{'='*70}")
+    print("PINYIN ALIGNMENT")
+    print(f"{'='*70}")
+    for language in languages:
+        for module in find_modules(language, kinds=(CLEAN_DIR,)):
+            data = read_module(module.path)
+            updates, refused = act_alignment(data)
+            name = f"{LANGUAGE_FOLDERS[language]}/{CLEAN_DIR}/{os.path.basename(module.path)}"
+            rows = sum(len(pack_rows(data[key])) for key in updates)
+            all_refused.extend((name,) + item for item in refused)
+            if check:
+                outdated = [key for key, fields in updates.items() if data[key].get(FIELD) != fields[FIELD]
+                            or any(field in data[key] for field in REMOVED_FIELDS)]
+                stale.extend(f"{name}: {key}" for key in outdated)
+                print(f"{name:<52} {rows:>6} rows  {len(refused)} refused  {len(outdated)} stale packs")
+                continue
+            changed = update_packs(module.path, updates, remove=REMOVED_FIELDS)
+            print(f"{name:<52} {rows:>6} rows  {len(refused)} refused  {'updated' if changed else 'unchanged'}")
+
+    if all_refused:
+        print(f"\n❌ {len(all_refused)} rows could not be aligned:")
+        for name, key, i, chinese, pinyin, reason in all_refused[:20]:
+            print(f"  {os.path.basename(name)} {key}[{i}]: '{chinese}' / '{pinyin}' - {reason}")
+        if len(all_refused) > 20:
+            print(f"  ... and {len(all_refused) - 20} more")
+        print("   Fix them in the breakout CSVs (see validate_pinyin.py) and rebuild the modules")
+
+    if check:
+        print()
+        if stale:
+            print(f"❌ {len(stale)} packs have missing or stale pinyin alignment - run without --check")
+            sys.exit(1)
+        if not all_refused:
+            print("✓ All pinyin alignment arrays are current")
+
+    if all_refused:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
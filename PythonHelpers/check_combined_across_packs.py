@@ -12,23 +12,8 @@ Usage: python PythonHelpers/check_combined_across_packs.py [chinese|spanish|engl
 import csv
 import os
 import sys
-import ast
-
-
-def parse_array(array_str):
-    """Parse a string array like '[word1,word2,word3]' into a list."""
-    if not array_str or array_str == '[]':
-        return []
-
-    try:
-        # Try parsing as Python literal
-        return ast.literal_eval(array_str)
-    except:
-        # Manual parsing for simple arrays
-        cleaned = array_str.strip('[]')
-        if not cleaned:
-            return []
-        return [w.strip().strip('"\'') for w in cleaned.split(',')]
+
+from overview_arrays import parse_array
 
 
 def check_combined_across_packs(lang):
@@ -40,61 +40,30 @@
 #
 # ============================================================
 
-import csv
+import os
 import sys
-from pathlib import Path
 from collections import defaultdict
 
-# Configuration for each language
-LANGUAGES = {
-    'chinese': {
-        'overview_file': 'ChineseWords/ChineseWordsOverview.csv',
-        'words_column': 'Chinese_Combined_Words',
-    },
-    'spanish': {
-        'overview_file': 'SpanishWords/SpanishWordsOverview.csv',
-        'words_column': 'Spanish_Combined_Words',
-    },
-    'english': {
-        'overview_file': 'EnglishWords/EnglishWordsOverview.csv',
-        'words_column': 'English_Combined_Words',
-    },
-}
-
-
-def parse_words_array(array_str):
-    """Parse the Words column which is a bracketed, comma-separated list."""
-    array_str = array_str.strip()
-    if array_str.startswith('[') and array_str.endswith(']'):
-        array_str = array_str[1:-1]
-    words = [w.strip() for w in array_str.split(',') if w.strip()]
-    return words
-
-
-def check_duplicates(language, root_dir):
+from overview_arrays import BASE_DIR, OVERVIEW_CONFIG, load_overview
+
+
+def check_duplicates(language):
     """Check for within-pack and across-pack duplicates."""
-    config = LANGUAGES[language]
-    overview_path = root_dir / config['overview_file']
+    overview_path = os.path.join(BASE_DIR, OVERVIEW_CONFIG[language]['file'])
 
     print(f"\n{'='*80}")
     print(f"{language.upper()} DUPLICATE ANALYSIS")
     print(f"{'='*80}")
 
-    if not overview_path.exists():
+    if not os.path.exists(overview_path):
         print(f"ERROR: Overview file not found: {overview_path}")
         return
 
-    # Read all packs
-    packs = {}
-    with open(overview_path, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            pack_num = int(row['Pack_Number'])
-            words = parse_words_array(row[config['words_column']])
-            packs[pack_num] = {
-                'words': words,
-                'title': row['Pack_Title']
-            }
+    # Read all packs (parsed Combined_Words arrays, cached by overview_arrays)
+    packs = {
+        pack_num: {'words': pack['combined'], 'title': pack['title']}
+        for pack_num, pack in load_overview(language).items()
+    }
 
     print(f"Analyzing {len(packs)} packs...\n")
 
@@ -207,14 +176,12 @@ def check_duplicates(language, root_dir):
 
 
 def main():
-    root_dir = Path('/home/user/LPH')
-
     # Determine which languages to check
     if len(sys.argv) > 1:
         arg = sys.argv[1].lower()
         if arg == 'all':
             languages_to_check = ['chinese', 'spanish', 'english']
-        elif arg in LANGUAGES:
+        elif arg in OVERVIEW_CONFIG:
             languages_to_check = [arg]
         else:
             print(f"Unknown language: {arg}")
@@ -225,7 +192,7 @@ def main():
 
     results = {}
     for language in languages_to_check:
-        results[language] = check_duplicates(language, root_dir)
+        results[language] = check_duplicates(language)
 
     # Final summary across all languages
     if len(languages_to_check) > 1:
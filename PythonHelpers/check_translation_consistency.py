@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Check that the same source phrase is translated the same way everywhere.
+
+"gracias" is a source word in several SpanishWords packs and a translation in
+EnglishWords and ChineseWords rows; each occurrence can carry a different
+english/chinese/pinyin/portuguese value. This checker hash-joins every
+breakout row of all three language folders on its normalized chinese,
+spanish and english cells (one linear pass, no pairwise comparison), then
+reports every target column that holds more than one distinct translation for
+the same source, with how often each variant occurs and where.
+
+Values are compared normalized (NFC, whitespace collapsed, case-folded), so
+"Hello" vs "hello" is not a divergence.
+
+Usage:
+    python PythonHelpers/check_translation_consistency.py [chinese|spanish|english|all] [--csv OUTPUT] [--top N]
+
+    The language picks the source key column to report (default: all three).
+    --csv writes every divergence (one row per variant) to OUTPUT.
+    --top limits how many sources are printed per key column (default 20).
+"""
+
+import csv
+import os
+import sys
+import time
+from collections import Counter
+from functools import lru_cache
+
+from crosslingual_index import FOLDERS, KEY_COLUMNS, PLACEHOLDER, breakout_paths
+from translation_memory import normalize_text
+
+
+# Most cell values repeat across the corpus; normalize each distinct one once
+normalize = lru_cache(maxsize=None)(normalize_text)
+
+
+def scan_corpus():
+    """
+    One pass over every breakout row of every language.
+
+    Returns:
+        tuple: (groups, rows_read)
+            groups: {(key_column, normalized source):
+                        {'source': first spelling seen,
+                         'columns': {column: Counter(normalized value)},
+                         'spellings': {(column, normalized value): first spelling},
+                         'where': {(column, normalized value): [(folder, pack, row), ...]}}}
+    """
+    groups = {}
+    rows_read = 0
+
+    for language in FOLDERS:
+        for path in breakout_paths(language):
+            pack = os.path.basename(path)[len(FOLDERS[language]):-len('.csv')]
+            with open(path, 'r', encoding='utf-8') as f:
+                for row_num, row in enumerate(csv.DictReader(f), start=2):
+                    rows_read += 1
+                    cells = {col: (value or '').strip() for col, value in row.items() if col}
+                    cells = {col: value for col, value in cells.items()
+                             if value and not PLACEHOLDER.match(value)}
+
+                    for key in KEY_COLUMNS:
+                        source = cells.get(key)
+                        if not source:
+                            continue
+                        group = groups.setdefault((key, normalize(source)), {
+                            'source': source, 'columns': {}, 'spellings': {}, 'where': {}})
+                        for col, value in cells.items():
+                            if col == key:
+                                continue
+                            variant = (col, normalize(value))
+                            group['columns'].setdefault(col, Counter())[variant[1]] += 1
+                            group['spellings'].setdefault(variant, value)
+                            group['where'].setdefault(variant, []).append((FOLDERS[language], pack, row_num))
+
+    return groups, rows_read
+
+
+def find_divergences(groups, key_columns):
+    """
+    Returns:
+        list: [(key_column, source, column, [(spelling, count, where), ...])]
+              sorted by most occurrences first
+    """
+    divergences = []
+    for (key, _), group in groups.items():
+        if key not in key_columns:
+            continue
+        for col, counter in group['columns'].items():
+            if len(counter) < 2:
+                continue
+            variants = [(group['spellings'][(col, value)], count, group['where'][(col, value)])
+                        for value, count in counter.most_common()]
+            divergences.append((key, group['source'], col, variants))
+    divergences.sort(key=lambda d: (-sum(count for _, count, _ in d[3]), d[0], d[1], d[2]))
+    return divergences
+
+
+def format_where(where, limit=3):
+    text = ', '.join(f"{folder}{pack}:{row}" for folder, pack, row in where[:limit])
+    return text + (f" (+{len(where) - limit})" if len(where) > limit else "")
+
+
+def write_csv(divergences, output_path):
+    with open(output_path, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['Source_Column', 'Source', 'Target_Column', 'Translation', 'Count', 'Locations'])
+        for key, source, col, variants in divergences:
+            for spelling, count, where in variants:
+                writer.writerow([key, source, col, spelling, count,
+                                 ' '.join(f"{folder}{pack}:{row}" for folder, pack, row in where)])
+
+
+def main():
+    args = sys.argv[1:]
+    output_path = None
+    top = 20
+    positional = []
+    rest = iter(args)
+    for arg in rest:
+        if arg == '--csv':
+            output_path = next(rest)
+        elif arg == '--top':
+            top = int(next(rest))
+        else:
+            positional.append(arg.lower())
+
+    lang = positional[0] if positional else 'all'
+    if lang == 'all':
+        key_columns = list(KEY_COLUMNS)
+    elif lang in KEY_COLUMNS:
+        key_columns = [lang]
+    else:
+        print(f"Unknown language: {lang}")
+        print("Use: chinese, spanish, english, or all")
+        sys.exit(1)
+
+    start = time.time()
+    groups, rows_read = scan_corpus()
+    divergences = find_divergences(groups, key_columns)
+    elapsed = (time.time() - start) * 1000
+
+    for key in key_columns:
+        found = [d for d in divergences if d[0] == key]
+        sources = {d[1] for d in found}
+        print(f"\n{'='*70}")
+        print(f"{key.upper()} SOURCES: {len(sources)} phrases with divergent translations ({len(found)} columns)")
+        print(f"{'='*70}")
+        for _, source, col, variants in found[:top]:
+            total = sum(count for _, count, _ in variants)
+            print(f"\n'{source}' -> {col} ({len(variants)} variants, {total} occurrences)")
+            for spelling, count, where in variants:
+                print(f"    {count:4d}x  {spelling:<40} {format_where(where)}")
+        if len(found) > top:
+            print(f"\n  ... and {len(found) - top} more (use --top N or --csv)")
+
+    if output_path:
+        write_csv(divergences, output_path)
+        print(f"\n✓ Wrote {len(divergences)} divergences to {output_path}")
+
+    print(f"\n{'='*70}")
+    print(f"Rows scanned: {rows_read}")
+    print(f"Distinct sources: {sum(1 for key, _ in groups if key in key_columns)}")
+    print(f"Divergent (source, column) pairs: {len(divergences)}")
+    print(f"Time: {elapsed:.0f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -21,6 +21,10 @@ import time
 import re
 from pathlib import Path
 
+from construct_journal import ConstructJournal
+from overview_arrays import load_overview
+from translation_memory import TranslationMemory
+
 # Try to import translation libraries
 try:
     from deep_translator import GoogleTranslator
@@ -29,12 +33,10 @@ except ImportError:
     HAS_DEEP_TRANSLATOR = False
     print("WARNING: deep-translator not installed. Run: pip install deep-translator")
 
-try:
-    from pypinyin import pinyin, Style
-    HAS_PYPINYIN = True
-except ImportError:
-    HAS_PYPINYIN = False
-    print("WARNING: pypinyin not installed. Run: pip install pypinyin")
+from pinyin_service import HAS_PYPINYIN, PinyinService
+
+if not HAS_PYPINYIN:
+    print("WARNING: pypinyin not installed, using pinyin mined from existing CSVs. Run: pip install pypinyin")
 
 
 # ============================================================
@@ -92,61 +94,48 @@ LANG_CODES = {
 # Batch separator - must be unique enough not to appear in translations
 BATCH_SEPARATOR = " ||| "
 
+# GoogleTranslator rejects payloads over 5000 characters; stay below it
+MAX_CHUNK_CHARS = 4500
+
+# Persistent translation memory, consulted before any backend call
+# (see translation_memory.py; the file is read on first lookup)
+TRANSLATION_MEMORY = TranslationMemory()
+
+# Memoized pinyin generator (see pinyin_service.py)
+PINYIN_SERVICE = PinyinService()
+
 
 # ============================================================
 # HELPER FUNCTIONS
 # ============================================================
 
-def parse_array(arr_str):
-    """Parse a CSV array string like '[a,b,c]' into a list."""
-    if not arr_str or arr_str == '[]':
-        return []
-    content = arr_str.strip()[1:-1]
-    if not content:
-        return []
-    return [item.strip() for item in content.split(',')]
-
-
 def generate_pinyin(chinese_text):
     """
-    Generate pinyin with tone marks, one syllable per character, space-separated.
+    Generate pinyin with tone marks, one syllable per character, space-separated,
+    with 不/一 tone sandhi applied (see pinyin_service.py).
     Example: 你好 -> nǐ hǎo
     """
-    if not HAS_PYPINYIN:
-        return "[PINYIN_NEEDED]"
-
-    if not chinese_text:
-        return ""
-
-    # Get pinyin for each character
-    py_list = pinyin(chinese_text, style=Style.TONE, heteronym=False)
-
-    # Flatten and join with spaces
-    syllables = [p[0] for p in py_list if p]
-    return ' '.join(syllables)
+    return PINYIN_SERVICE.generate(chinese_text)
 
 
 def generate_pinyin_batch(chinese_texts):
     """
     Generate pinyin for a list of Chinese texts.
-    Returns a list of pinyin strings.
+    Returns a list of pinyin strings (memoized per phrase and per character).
     """
-    if not HAS_PYPINYIN:
-        return ["[PINYIN_NEEDED]"] * len(chinese_texts)
-
-    return [generate_pinyin(text) for text in chinese_texts]
+    return PINYIN_SERVICE.batch(chinese_texts)
 
 
-def translate_batch(texts, source_lang, target_lang, max_retries=3):
+def translate_batch(texts, source_lang, target_lang, max_retries=3, offline=False):
     """
-    Translate a list of texts in ONE API call using batch mode.
+    Translate a list of texts, using the translation memory first.
     Returns a list of translated texts.
 
-    OPTIMIZATION: Instead of N API calls, we make 1 call with all texts joined.
+    Only texts missing from TRANSLATION_MEMORY go to the backend (in
+    size-bounded batch calls, see translate_batch_backend); their results
+    are stored for the next run. With offline=True the backend is never
+    called and misses become placeholders.
     """
-    if not HAS_DEEP_TRANSLATOR:
-        return [f"[TRANSLATE_{target_lang.upper()}]"] * len(texts)
-
     if not texts:
         return []
 
@@ -154,55 +143,139 @@ def translate_batch(texts, source_lang, target_lang, max_retries=3):
     if source_lang == target_lang:
         return texts[:]
 
-    # Join all texts with separator
-    batch_text = BATCH_SEPARATOR.join(texts)
+    results, missing = TRANSLATION_MEMORY.lookup_batch(texts, source_lang, target_lang)
+    if not missing:
+        return results
 
-    for attempt in range(max_retries):
-        try:
-            translator = GoogleTranslator(source=source_lang, target=target_lang)
-            result = translator.translate(batch_text)
+    pending = [texts[i] for i in missing]
+    if offline or not HAS_DEEP_TRANSLATOR:
+        translated = [f"[TRANSLATE_{target_lang.upper()}]"] * len(pending)
+    else:
+        translated = translate_batch_backend(pending, source_lang, target_lang, max_retries)
 
-            if not result:
-                raise ValueError("Empty translation result")
+    for i, text, translation in zip(missing, pending, translated):
+        TRANSLATION_MEMORY.put(source_lang, target_lang, text, translation)
+        results[i] = translation
 
-            # Split back into individual translations
-            translated = result.split("|||")
-            translated = [t.strip() for t in translated]
+    return results
 
-            # Verify we got the right number of translations
-            if len(translated) != len(texts):
-                # Sometimes the separator gets mangled - try to recover
-                if len(translated) < len(texts):
-                    # Pad with placeholders
-                    translated.extend([f"[TRANSLATE_{target_lang.upper()}]"] * (len(texts) - len(translated)))
-                else:
-                    # Truncate
-                    translated = translated[:len(texts)]
 
-            time.sleep(0.2)  # Rate limiting between batches
+def google_translate(text, source_lang, target_lang):
+    """One raw GoogleTranslator request."""
+    return GoogleTranslator(source=source_lang, target=target_lang).translate(text)
+
+
+def chunk_texts(texts, max_chars=MAX_CHUNK_CHARS):
+    """
+    Split texts into consecutive chunks whose joined payload stays under max_chars.
+    A single text longer than max_chars gets a chunk of its own.
+    """
+    chunks = []
+    current = []
+    size = 0
+    for text in texts:
+        added = len(text) + (len(BATCH_SEPARATOR) if current else 0)
+        if current and size + added > max_chars:
+            chunks.append(current)
+            current, size = [], 0
+            added = len(text)
+        current.append(text)
+        size += added
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def split_batch_result(result, expected):
+    """
+    Split a joined translation back into items.
+    Returns None if the separators did not survive intact.
+    """
+    if not result:
+        return None
+    translated = [t.strip() for t in result.split("|||")]
+    if len(translated) != expected or not all(translated):
+        return None
+    return translated
+
+
+def translate_batch_backend(texts, source_lang, target_lang, max_retries=3, rate_limit_delay=0.2,
+                            max_chars=MAX_CHUNK_CHARS, backend=None, before_call=None):
+    """
+    Translate a list of texts with as few backend calls as possible.
+    Returns a list of translated texts.
+
+    Texts are joined with BATCH_SEPARATOR into size-bounded chunks (one call
+    each). If a chunk comes back with mangled separators, only that chunk is
+    bisected and re-sent, down to single items sent without any separator -
+    so a bad item never costs the rest of the batch. A request that fails
+    outright (every retry raised) is not bisected: the whole chunk gets
+    placeholders at once, so an outage costs one request per chunk, not ~2N.
+
+    rate_limit_delay: pause after each call (0 when an external limiter is used).
+    backend: callable(text, source_lang, target_lang) -> str (default GoogleTranslator)
+    before_call: called (blocking) before every backend request, retries
+                 included - e.g. to take a rate-limiter token
+    """
+    backend = backend or google_translate
+    placeholder = f"[TRANSLATE_{target_lang.upper()}]"
+
+    def call(payload):
+        for attempt in range(max_retries):
+            try:
+                if before_call:
+                    before_call()
+                result = backend(payload, source_lang, target_lang)
+                time.sleep(rate_limit_delay)  # Rate limiting between calls
+                return result
+            except Exception as e:
+                print(f"    Batch translation error ({source_lang}->{target_lang}), attempt {attempt+1}: {e}")
+                if attempt < max_retries - 1:
+                    time.sleep(1)  # Wait before retry
+        return None
+
+    def translate_chunk(chunk):
+        if len(chunk) == 1:
+            result = call(chunk[0])
+            return [result.strip()] if result and result.strip() else [placeholder]
+
+        result = call(BATCH_SEPARATOR.join(chunk))
+        if result is None:
+            print(f"    Request failed for {len(chunk)}-item chunk ({source_lang}->{target_lang}), using placeholders")
+            return [placeholder] * len(chunk)
+        translated = split_batch_result(result, len(chunk))
+        if translated is not None:
             return translated
 
-        except Exception as e:
-            print(f"    Batch translation error ({source_lang}->{target_lang}), attempt {attempt+1}: {e}")
-            if attempt < max_retries - 1:
-                time.sleep(1)  # Wait before retry
-            else:
-                # Return placeholders on final failure
-                return [f"[TRANSLATE_{target_lang.upper()}]"] * len(texts)
+        # Separator integrity lost - bisect this chunk only
+        print(f"    Separator mismatch in {len(chunk)}-item chunk ({source_lang}->{target_lang}), splitting")
+        middle = len(chunk) // 2
+        return translate_chunk(chunk[:middle]) + translate_chunk(chunk[middle:])
 
-    return [f"[TRANSLATE_{target_lang.upper()}]"] * len(texts)
+    results = []
+    for chunk in chunk_texts(texts, max_chars):
+        results.extend(translate_chunk(chunk))
+    return results
 
 
 # ============================================================
 # MAIN CONSTRUCTION FUNCTION (OPTIMIZED WITH BATCH)
 # ============================================================
 
-def construct_breakout_csv(lang_type, pack_num, words, config, base_dir):
+def construct_breakout_csv(lang_type, pack_num, words, config, base_dir, offline=False, journal=None):
     """
     Construct a single breakout CSV file with translations.
 
     OPTIMIZED: Translates all words at once per target language,
     instead of word-by-word. ~40x faster!
+    Words already in the translation memory are not sent to the backend.
+
+    With a journal (construct_journal.ConstructJournal), columns finished by
+    an earlier interrupted run are reused, and each newly finished column is
+    checkpointed before moving on.
+
+    Returns:
+        tuple: (resumed_columns, new_columns)
     """
     breakout_path = base_dir / config['breakout_dir'] / f"{config['breakout_prefix']}{pack_num}.csv"
 
@@ -220,12 +293,23 @@ def construct_breakout_csv(lang_type, pack_num, words, config, base_dir):
     # Determine which columns need translation vs generation
     translate_columns = [col for col in columns if col != source_column and col != 'pinyin']
 
+    resumed = 0
+    new = 0
+
     # Batch translate to each target language
     for col in translate_columns:
         target_code = LANG_CODES.get(col)
-        if target_code:
+        journaled = journal.get(pack_num, col, words) if journal else None
+        if journaled is not None:
+            print(f"    Resuming {col} from journal")
+            translations[col] = journaled
+            resumed += 1
+        elif target_code:
             print(f"    Translating to {col}...")
-            translations[col] = translate_batch(words, source_lang, target_code)
+            translations[col] = translate_batch(words, source_lang, target_code, offline=offline)
+            new += 1
+            if journal:
+                journal.record(pack_num, col, words, translations[col])
         else:
             translations[col] = words[:]
 
@@ -241,22 +325,29 @@ def construct_breakout_csv(lang_type, pack_num, words, config, base_dir):
             print(f"    Generating pinyin from Chinese translations...")
             translations['pinyin'] = generate_pinyin_batch(chinese_translations)
 
-    # Build rows
+    write_breakout_csv(breakout_path, columns, translations, len(words))
+
+    # Persist new memory entries after every pack so an interrupted run keeps them
+    TRANSLATION_MEMORY.save()
+
+    elapsed = time.time() - start_time
+    resumed_note = f" ({resumed} columns resumed)" if resumed else ""
+    print(f"  ✓ Created {breakout_path.name} in {elapsed:.1f}s{resumed_note}")
+    return resumed, new
+
+
+def write_breakout_csv(breakout_path, columns, translations, word_count):
+    """Write a breakout CSV from a column -> list-of-values dict."""
     rows = []
-    for i in range(len(words)):
+    for i in range(word_count):
         row = {col: translations[col][i] if i < len(translations[col]) else "" for col in columns}
         rows.append(row)
 
-    # Write CSV
     with open(breakout_path, 'w', encoding='utf-8', newline='') as f:
         writer = csv.DictWriter(f, fieldnames=columns)
         writer.writeheader()
         writer.writerows(rows)
 
-    elapsed = time.time() - start_time
-    print(f"  ✓ Created {breakout_path.name} in {elapsed:.1f}s")
-    return True
-
 
 def check_breakout_csv(lang_type, pack_num, expected_words, config, base_dir):
     """
@@ -296,13 +387,14 @@ def check_breakout_csv(lang_type, pack_num, expected_words, config, base_dir):
     return True, matches, errors
 
 
-def process_language(lang_type, mode='check', start_pack=None, end_pack=None):
+def process_language(lang_type, mode='check', start_pack=None, end_pack=None, offline=False):
     """
     Process a language in either 'construct' or 'check' mode.
 
     Mode:
     - 'check': Verify breakout CSVs exist and match Combined_Words
     - 'construct': Create missing breakout CSVs with translations
+      (offline=True: translation memory only, no backend calls)
     """
     if lang_type not in LANGUAGE_CONFIGS:
         print(f"Unknown language: {lang_type}")
@@ -320,27 +412,30 @@ def process_language(lang_type, mode='check', start_pack=None, end_pack=None):
         print(f"ERROR: Overview file not found: {overview_path}")
         return
 
-    # Read overview CSV
-    with open(overview_path, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        rows = list(reader)
+    # Read overview arrays (parsed once, cached by overview_arrays)
+    packs = load_overview(lang_type)
 
-    print(f"Found {len(rows)} packs in overview")
+    print(f"Found {len(packs)} packs in overview")
 
     # Filter by pack range if specified
+    pack_nums = sorted(packs)
     if start_pack or end_pack:
-        rows = [r for r in rows
-                if (not start_pack or int(r['Pack_Number']) >= start_pack) and
-                   (not end_pack or int(r['Pack_Number']) <= end_pack)]
-        print(f"Filtered to {len(rows)} packs (range: {start_pack or 1} to {end_pack or 'end'})")
+        pack_nums = [n for n in pack_nums
+                     if (not start_pack or n >= start_pack) and
+                        (not end_pack or n <= end_pack)]
+        print(f"Filtered to {len(pack_nums)} packs (range: {start_pack or 1} to {end_pack or 'end'})")
 
     # Process each pack
-    stats = {'total': 0, 'exists': 0, 'matches': 0, 'created': 0, 'errors': 0, 'missing': []}
+    stats = {'total': 0, 'exists': 0, 'matches': 0, 'created': 0, 'errors': 0, 'missing': [],
+             'resumed_packs': 0, 'resumed_columns': 0, 'new_columns': 0}
+
+    journal = ConstructJournal(lang_type) if mode == 'construct' else None
+    if journal and journal.entries:
+        print(f"Resuming: {len(journal.entries)} journaled columns in packs {journal.pending_packs()[:20]}")
 
-    for row in rows:
-        pack_num = int(row['Pack_Number'])
-        title = row['Pack_Title']
-        combined_words = parse_array(row.get(config['combined_column'], '[]'))
+    for pack_num in pack_nums:
+        title = packs[pack_num]['title']
+        combined_words = packs[pack_num]['combined']
 
         stats['total'] += 1
 
@@ -376,12 +471,22 @@ def process_language(lang_type, mode='check', start_pack=None, end_pack=None):
                 stats['exists'] += 1
             else:
                 try:
-                    construct_breakout_csv(lang_type, pack_num, combined_words, config, base_dir)
+                    resumed, new = construct_breakout_csv(lang_type, pack_num, combined_words,
+                                                          config, base_dir, offline, journal)
                     stats['created'] += 1
+                    stats['resumed_columns'] += resumed
+                    stats['new_columns'] += new
+                    if resumed:
+                        stats['resumed_packs'] += 1
                 except Exception as e:
                     print(f"  ✗ Pack {pack_num:3d}: ERROR - {e}")
                     stats['errors'] += 1
 
+    if journal:
+        finished = [n for n in journal.pending_packs()
+                    if (base_dir / config['breakout_dir'] / f"{config['breakout_prefix']}{n}.csv").exists()]
+        journal.compact(finished)
+
     # Print summary
     print(f"\n{'='*70}")
     print(f"SUMMARY: {lang_type.upper()}")
@@ -398,8 +503,12 @@ def process_language(lang_type, mode='check', start_pack=None, end_pack=None):
             print(f"   Run with 'construct' mode to create them.")
     else:
         print(f"Already existed: {stats['exists']}")
-        print(f"Created: {stats['created']}")
+        print(f"Created: {stats['created']} ({stats['resumed_packs']} resumed from journal)")
+        print(f"Columns: {stats['resumed_columns']} reused from journal, {stats['new_columns']} newly translated")
         print(f"Errors: {stats['errors']}")
+        print(TRANSLATION_MEMORY.stats_line())
+        if journal.entries:
+            print(f"Journal: {len(journal.entries)} columns pending in {journal.path}")
 
     return stats
 
@@ -409,9 +518,12 @@ def process_language(lang_type, mode='check', start_pack=None, end_pack=None):
 # ============================================================
 
 def main():
-    if len(sys.argv) < 3:
+    offline = '--offline' in sys.argv
+    args = [a for a in sys.argv[1:] if not a.startswith('--')]
+
+    if len(args) < 2:
         print("""
-Usage: python construct_breakout_csvs.py <language> <mode> [start_pack] [end_pack]
+Usage: python construct_breakout_csvs.py <language> <mode> [start_pack] [end_pack] [--offline]
 
 Languages: chinese, spanish, english, all
 
@@ -424,9 +536,18 @@ Examples:
   python construct_breakout_csvs.py spanish construct
   python construct_breakout_csvs.py spanish construct 1 50
   python construct_breakout_csvs.py all check
+  python construct_breakout_csvs.py spanish construct --offline
+
+OPTIMIZATION: A persistent translation memory (.translation_memory.json) is
+consulted before any API call. With --offline, construct mode uses ONLY the
+memory (no API calls); words not in memory become [TRANSLATE_XX] placeholders.
 
-OPTIMIZATION: Uses batch translation - all words translated in ONE API call
-per target language. ~40x faster than word-by-word translation!
+RESUMING: Every finished (pack, column) is checkpointed to
+<Folder>/.construct_journal.jsonl. If a construct run is interrupted, just
+run the same command again - finished columns are reused, not re-translated.
+
+OPTIMIZATION: Uses batch translation - all words translated in as few API calls
+as the payload limit allows, per target language. ~40x faster than word-by-word translation!
 
 ⚠️  IMPORTANT: 'construct' mode uses Google Translate API.
     After construction, all edits MUST be done MANUALLY!
@@ -434,10 +555,10 @@ per target language. ~40x faster than word-by-word translation!
 """)
         sys.exit(1)
 
-    lang_type = sys.argv[1].lower()
-    mode = sys.argv[2].lower()
-    start_pack = int(sys.argv[3]) if len(sys.argv) > 3 else None
-    end_pack = int(sys.argv[4]) if len(sys.argv) > 4 else None
+    lang_type = args[0].lower()
+    mode = args[1].lower()
+    start_pack = int(args[2]) if len(args) > 2 else None
+    end_pack = int(args[3]) if len(args) > 3 else None
 
     if mode not in ['check', 'construct']:
         print(f"Invalid mode: {mode}")
@@ -445,15 +566,11 @@ per target language. ~40x faster than word-by-word translation!
         sys.exit(1)
 
     if mode == 'construct':
-        if not HAS_DEEP_TRANSLATOR:
+        if not HAS_DEEP_TRANSLATOR and not offline:
             print("\nERROR: deep-translator is required for construction mode.")
             print("Install with: pip install deep-translator")
+            print("(or use --offline to construct from the translation memory only)")
             sys.exit(1)
-        if not HAS_PYPINYIN:
-            print("\nERROR: pypinyin is required for construction mode.")
-            print("Install with: pip install pypinyin")
-            sys.exit(1)
-
         print("\n" + "="*70)
         print("⚠️  CONSTRUCTION MODE - READ CAREFULLY!")
         print("="*70)
@@ -461,7 +578,7 @@ per target language. ~40x faster than word-by-word translation!
         print("Translations are APPROXIMATE and need manual review.")
         print("")
         print("OPTIMIZED: Uses batch translation (~40x faster!)")
-        print("  - All words translated in ONE API call per language")
+        print("  - All words translated in size-bounded batch calls per language")
         print("  - ~5-10 seconds per pack instead of ~45 seconds")
         print("")
         print("After construction:")
@@ -473,9 +590,9 @@ per target language. ~40x faster than word-by-word translation!
 
     if lang_type == 'all':
         for lang in ['chinese', 'spanish', 'english']:
-            process_language(lang, mode, start_pack, end_pack)
+            process_language(lang, mode, start_pack, end_pack, offline)
     elif lang_type in LANGUAGE_CONFIGS:
-        process_language(lang_type, mode, start_pack, end_pack)
+        process_language(lang_type, mode, start_pack, end_pack, offline)
     else:
         print(f"Unknown language: {lang_type}")
         print("Use: chinese, spanish, english, or all")
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Checkpoint journal for construct_breakout_csvs construct runs.
+
+Every finished (pack, column) translation is appended to
+<Folder>/.construct_journal.jsonl as one JSON line before the pack's CSV is
+written. A killed run therefore loses at most the column in flight: the next
+run finds the journaled columns, reuses them, and only translates what is
+left. Entries are tied to a hash of the pack's Combined_Words, so editing the
+Overview invalidates them. Columns containing placeholders are not journaled
+(they are retried on resume).
+
+The journal is append-only (a half-written last line from a kill is ignored)
+and is compacted when a run finishes: entries for packs whose CSV now exists
+are dropped, and the file is removed once nothing is pending.
+
+Usage (CLI):
+    python PythonHelpers/construct_journal.py [chinese|spanish|english|all]   # Show pending work
+"""
+
+import hashlib
+import json
+import os
+import sys
+
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+JOURNAL_NAME = '.construct_journal.jsonl'
+
+FOLDERS = {
+    'chinese': 'ChineseWords',
+    'spanish': 'SpanishWords',
+    'english': 'EnglishWords',
+}
+
+
+def words_hash(words):
+    return hashlib.sha1('\n'.join(words).encode('utf-8')).hexdigest()[:16]
+
+
+def has_placeholder(values):
+    return any(not v or v.startswith('[TRANSLATE_') or v == '[PINYIN_NEEDED]' for v in values)
+
+
+class ConstructJournal:
+    """(pack, column) -> translated values, persisted as JSON lines."""
+
+    def __init__(self, language, path=None):
+        self.language = language
+        self.path = path or os.path.join(BASE_DIR, FOLDERS[language], JOURNAL_NAME)
+        self.entries = {}
+        self.load()
+
+    def load(self):
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue  # Partial line from an interrupted write
+                self.entries[(entry['pack'], entry['column'])] = entry
+
+    def get(self, pack_num, column, words):
+        """Return journaled values for this column if still valid, else None."""
+        entry = self.entries.get((pack_num, column))
+        if entry and entry['words'] == words_hash(words) and len(entry['values']) == len(words):
+            return entry['values']
+        return None
+
+    def record(self, pack_num, column, words, values):
+        """Append one finished column (skipped if it contains placeholders)."""
+        if has_placeholder(values):
+            return
+        entry = {'pack': pack_num, 'column': column, 'words': words_hash(words), 'values': values}
+        self.entries[(pack_num, column)] = entry
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(entry, ensure_ascii=False) + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+
+    def pending_packs(self):
+        return sorted({pack for pack, _ in self.entries})
+
+    def compact(self, finished_packs):
+        """Drop entries of finished packs; remove the file when nothing is pending."""
+        finished = set(finished_packs)
+        self.entries = {key: e for key, e in self.entries.items() if key[0] not in finished}
+        if not self.entries:
+            if os.path.exists(self.path):
+                os.remove(self.path)
+            return
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            for entry in self.entries.values():
+                f.write(json.dumps(entry, ensure_ascii=False) + '\n')
+        os.replace(tmp_path, self.path)
+
+
+def main():
+    lang = sys.argv[1].lower() if len(sys.argv) > 1 else 'all'
+    languages = list(FOLDERS) if lang == 'all' else [lang]
+    for language in languages:
+        if language not in FOLDERS:
+            print(f"Unknown language: {language}")
+            sys.exit(1)
+        journal = ConstructJournal(language)
+        packs = journal.pending_packs()
+        print(f"{language:<8} {len(journal.entries):4d} journaled columns in {len(packs)} unfinished packs"
+              + (f": {packs[:20]}" if packs else ""))
+
+
+if __name__ == '__main__':
+    main()
@@ -2,6 +2,9 @@
 """
 Create 4 stripped-down mode-specific versions of SimpleFlashCards.html
 Each version contains only the code needed for that specific mode.
+
+Superseded for FlashcardTypingGame by build_mode_bundles.py, which tree-shakes
+the game's scripts per mode from a call graph instead of regex deletions.
 """
 
 import re
@@ -7,6 +7,9 @@ Takes SimpleFlashCards.html and creates 4 separate files, one for each mode:
 - SimpleListeningFlashCard.html (listening mode only)
 - SimpleWritingFlashCard.html (writing mode only)
 - SimpleSpeakingFlashCard.html (speaking mode only)
+
+Superseded for FlashcardTypingGame by build_mode_bundles.py, which tree-shakes
+the game's scripts per mode from a call graph instead of regex deletions.
 """
 
 import re
@@ -22,6 +22,8 @@
 #   python PythonHelpers/create_scoring_worksheet.py <language> <act_number>
 #   python PythonHelpers/create_scoring_worksheet.py chinese 1
 #   python PythonHelpers/create_scoring_worksheet.py spanish 3
+#   python PythonHelpers/create_scoring_worksheet.py spanish 3 --record
+#   python PythonHelpers/create_scoring_worksheet.py spanish 3 --changed
 #
 # WORKFLOW:
 # ---------
@@ -30,12 +32,34 @@
 # 3. Generate worksheet CSV with empty score columns
 # 4. Save to [Language]Words/[Language]ScoringWorksheetAct{N}.csv
 #
+# INCREMENTAL REVIEW (--record / --changed):
+# ------------------------------------------
+# --record   After a review is finished (scores filled, fixes applied), store
+#            each scored pack's scores and a content hash of every row in
+#            [Language]Words/[Language]ReviewLedger.json (committed with
+#            the breakout CSVs, so review state survives a fresh clone)
+# --changed  Compare current rows with the ledger and emit worksheets for
+#            ONLY the packs with new or modified rows:
+#              [Language]ScoringWorksheetAct{N}.csv  (changed packs only)
+#              [Language]ReviewRowsAct{N}.csv        (just the changed rows,
+#                                                     with pack number/title)
+#            Untouched packs are left out; their stored scores carry forward
+#            in the ledger and are listed in the output. Changed packs that
+#            were reviewed before get Before_Score prefilled with their last
+#            recorded After_Score. Review effort scales with churn, not
+#            corpus size.
+#
+# An existing worksheet holding scores that were never --record'ed is not
+# overwritten: record it (or delete it) first.
+#
 # ============================================================
 
 import csv
+import hashlib
+import json
 import os
 import sys
-
+from datetime import date
 
 def get_act_name_from_number(act_num):
     """Map act numbers to act names (roman numerals)."""
@@ -51,26 +75,11 @@ def get_act_name_from_number(act_num):
     return act_names.get(act_num, f"Act {act_num}")
 
 
-def create_scoring_worksheet(language, act_num):
+def find_act_packs(base_dir, lang_cap, act_num):
     """
-    Create a scoring worksheet for a specific language and act.
-
-    Args:
-        language: Language name (chinese, spanish, english)
-        act_num: Act number (1-7)
-
-    Returns:
-        None (creates CSV file)
+    Return [{'Pack_Number', 'Pack_Title'}, ...] for an act, from the Overview CSV.
     """
-    base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    lang_cap = language.capitalize()
-    lang_folder = f"{lang_cap}Words"
-
-    # Overview CSV path
-    overview_csv = os.path.join(base_dir, lang_folder, f"{lang_cap}WordsOverview.csv")
-
-    # Output worksheet path
-    worksheet_csv = os.path.join(base_dir, lang_folder, f"{lang_cap}ScoringWorksheetAct{act_num}.csv")
+    overview_csv = os.path.join(base_dir, f"{lang_cap}Words", f"{lang_cap}WordsOverview.csv")
 
     if not os.path.exists(overview_csv):
         print(f"❌ Overview CSV not found: {overview_csv}")
@@ -98,10 +107,37 @@ def create_scoring_worksheet(language, act_num):
                 'Pack_Title': pack_title
             })
 
+    return packs_for_act
+
+
+def create_scoring_worksheet(language, act_num):
+    """
+    Create a scoring worksheet for a specific language and act.
+
+    Args:
+        language: Language name (chinese, spanish, english)
+        act_num: Act number (1-7)
+
+    Returns:
+        None (creates CSV file)
+    """
+    base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    lang_cap = language.capitalize()
+    lang_folder = f"{lang_cap}Words"
+
+    # Output worksheet path
+    worksheet_csv = os.path.join(base_dir, lang_folder, f"{lang_cap}ScoringWorksheetAct{act_num}.csv")
+
+    act_name = get_act_name_from_number(act_num)
+    packs_for_act = find_act_packs(base_dir, lang_cap, act_num)
+
     if not packs_for_act:
         print(f"❌ No packs found for {language} {act_name}")
         sys.exit(1)
 
+    refuse_unrecorded_overwrite(worksheet_csv, read_ledger(ledger_path(base_dir, lang_cap)),
+                                language, act_num)
+
     # Create scoring worksheet
     with open(worksheet_csv, 'w', encoding='utf-8', newline='') as f:
         writer = csv.DictWriter(f, fieldnames=[
@@ -128,21 +164,228 @@ def create_scoring_worksheet(language, act_num):
     print(f"\n📊 Score packs during review to track quality improvements!")
 
 
+# ============================================================
+# INCREMENTAL REVIEW
+# ============================================================
+
+def row_hash(row):
+    """Content hash of one breakout row (all cells, in order)."""
+    return hashlib.sha1('\x1f'.join(row).encode('utf-8')).hexdigest()[:12]
+
+
+def read_pack_rows(base_dir, lang_cap, pack_num):
+    """Return (header, rows) of a breakout CSV, or (None, []) if missing."""
+    path = os.path.join(base_dir, f"{lang_cap}Words", f"{lang_cap}Words{pack_num}.csv")
+    if not os.path.exists(path):
+        return None, []
+    with open(path, 'r', encoding='utf-8') as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        return header, list(reader)
+
+
+def ledger_path(base_dir, lang_cap):
+    return os.path.join(base_dir, f"{lang_cap}Words", f"{lang_cap}ReviewLedger.json")
+
+
+def read_ledger(path):
+    if not os.path.exists(path):
+        return {}
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def write_ledger(path, ledger):
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8', newline='\n') as f:
+        json.dump(ledger, f, ensure_ascii=False, indent=1, sort_keys=True)
+        f.write('\n')
+    os.replace(tmp_path, path)
+
+
+def unrecorded_packs(worksheet_csv, ledger):
+    """
+    Packs in an existing worksheet whose scores are not in the ledger yet.
+
+    An After_Score is unrecorded if it differs from the ledger's (or the pack
+    has no ledger entry). A lone Before_Score is unrecorded unless it is one
+    of the ledger's stored scores (--changed prefills it from there).
+    """
+    if not os.path.exists(worksheet_csv):
+        return []
+    unrecorded = []
+    with open(worksheet_csv, 'r', encoding='utf-8') as f:
+        for entry in csv.DictReader(f):
+            pack_num = (entry.get('Pack_Number') or '').strip()
+            before = (entry.get('Before_Score') or '').strip()
+            after = (entry.get('After_Score') or '').strip()
+            stored = ledger.get(pack_num) or {}
+            if after:
+                if after != stored.get('After_Score'):
+                    unrecorded.append(pack_num)
+            elif before and before not in (stored.get('Before_Score'), stored.get('After_Score')):
+                unrecorded.append(pack_num)
+    return unrecorded
+
+
+def refuse_unrecorded_overwrite(worksheet_csv, ledger, language, act_num):
+    """Exit instead of overwriting a worksheet that holds unrecorded scores."""
+    unrecorded = unrecorded_packs(worksheet_csv, ledger)
+    if not unrecorded:
+        return
+    print(f"❌ {os.path.basename(worksheet_csv)} has scores that are not recorded yet "
+          f"(packs {', '.join(unrecorded)})")
+    print(f"   Record them first: python PythonHelpers/create_scoring_worksheet.py {language} {act_num} --record")
+    print(f"   or delete the worksheet to discard them.")
+    sys.exit(1)
+
+
+def changed_rows(rows, stored_hashes):
+    """
+    Compare current rows with a stored snapshot.
+
+    A row is unchanged if its content hash was in the snapshot (so reordering
+    is not churn). Otherwise it is 'modified' if a row existed at that
+    position before, 'new' if the pack grew.
+
+    Returns:
+        list: [(row_number, status, row), ...] with row_number as in the CSV (header = 1)
+    """
+    known = set(stored_hashes)
+    result = []
+    for i, row in enumerate(rows):
+        if row_hash(row) in known:
+            continue
+        status = 'modified' if i < len(stored_hashes) else 'new'
+        result.append((i + 2, status, row))
+    return result
+
+
+def record_review(language, act_num):
+    """Store scores and row hashes of every scored pack in the act's worksheet."""
+    base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    lang_cap = language.capitalize()
+    worksheet_csv = os.path.join(base_dir, f"{lang_cap}Words", f"{lang_cap}ScoringWorksheetAct{act_num}.csv")
+
+    if not os.path.exists(worksheet_csv):
+        print(f"❌ Worksheet not found: {worksheet_csv}")
+        sys.exit(1)
+
+    path = ledger_path(base_dir, lang_cap)
+    ledger = read_ledger(path)
+    recorded = 0
+    skipped = 0
+
+    with open(worksheet_csv, 'r', encoding='utf-8') as f:
+        for entry in csv.DictReader(f):
+            if not (entry.get('After_Score') or '').strip():
+                skipped += 1
+                continue
+            pack_num = entry['Pack_Number'].strip()
+            _, rows = read_pack_rows(base_dir, lang_cap, pack_num)
+            ledger[pack_num] = {
+                'Pack_Title': entry['Pack_Title'],
+                'Before_Score': entry['Before_Score'].strip(),
+                'After_Score': entry['After_Score'].strip(),
+                'reviewed': date.today().isoformat(),
+                'rows': [row_hash(row) for row in rows],
+            }
+            recorded += 1
+
+    write_ledger(path, ledger)
+    print(f"✅ Recorded {recorded} reviewed packs in {os.path.basename(path)}")
+    print(f"   Commit it with the reviewed CSVs so the scores carry forward for everyone")
+    if skipped:
+        print(f"   Skipped {skipped} packs without After_Score (not reviewed yet)")
+
+
+def create_changed_worksheet(language, act_num):
+    """Emit worksheets for only the packs/rows that changed since their last recorded review."""
+    base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    lang_cap = language.capitalize()
+    lang_folder = f"{lang_cap}Words"
+    worksheet_csv = os.path.join(base_dir, lang_folder, f"{lang_cap}ScoringWorksheetAct{act_num}.csv")
+    rows_csv = os.path.join(base_dir, lang_folder, f"{lang_cap}ReviewRowsAct{act_num}.csv")
+
+    ledger = read_ledger(ledger_path(base_dir, lang_cap))
+    refuse_unrecorded_overwrite(worksheet_csv, ledger, language, act_num)
+    packs = find_act_packs(base_dir, lang_cap, act_num)
+
+    changed_packs = []
+    review_rows = []
+    carried = []
+    header_columns = []
+    total_rows = 0
+
+    for pack in packs:
+        header, rows = read_pack_rows(base_dir, lang_cap, pack['Pack_Number'])
+        total_rows += len(rows)
+        if header and len(header) > len(header_columns):
+            header_columns = header
+        stored = ledger.get(pack['Pack_Number'])
+        changes = changed_rows(rows, stored['rows'] if stored else [])
+
+        if stored and not changes and len(rows) == len(stored['rows']):
+            carried.append((pack, stored))
+            continue
+
+        changed_packs.append(pack)
+        for row_number, status, row in changes:
+            review_rows.append([pack['Pack_Number'], pack['Pack_Title'], row_number, status] + row)
+
+    with open(worksheet_csv, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=['Pack_Number', 'Pack_Title', 'Before_Score', 'After_Score'])
+        writer.writeheader()
+        for pack in changed_packs:
+            # Last recorded After_Score is this review's starting point
+            stored = ledger.get(pack['Pack_Number']) or {}
+            writer.writerow({'Pack_Number': pack['Pack_Number'], 'Pack_Title': pack['Pack_Title'],
+                             'Before_Score': stored.get('After_Score', ''), 'After_Score': ''})
+
+    with open(rows_csv, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['Pack_Number', 'Pack_Title', 'Row_Number', 'Change'] + header_columns)
+        writer.writerows(review_rows)
+
+    act_name = get_act_name_from_number(act_num)
+    print(f"\n{'='*70}")
+    print(f"CHANGED-ROWS WORKSHEET: {language.upper()} {act_name}")
+    print(f"{'='*70}")
+    print(f"Packs in act: {len(packs)}")
+    print(f"  Unchanged (scores carried forward): {len(carried)}")
+    print(f"  To review: {len(changed_packs)}")
+    print(f"Rows to review: {len(review_rows)} of {total_rows}")
+    if carried:
+        print(f"\nCarried forward (unchanged since last review):")
+        for pack, stored in carried:
+            print(f"  Pack {pack['Pack_Number']:>3} {pack['Pack_Title'][:30]:30s} "
+                  f"{stored.get('Before_Score') or '-':>2} -> {stored.get('After_Score') or '-':>2}  "
+                  f"(reviewed {stored.get('reviewed', '?')})")
+    print(f"\n✅ {os.path.basename(worksheet_csv)} ({len(changed_packs)} packs)")
+    print(f"✅ {os.path.basename(rows_csv)} ({len(review_rows)} rows)")
+    print(f"   After review: python PythonHelpers/create_scoring_worksheet.py {language} {act_num} --record")
+
+
 def main():
-    if len(sys.argv) != 3:
-        print("Usage: python create_scoring_worksheet.py <language> <act_number>")
+    args = [a for a in sys.argv[1:] if not a.startswith('--')]
+    flags = [a for a in sys.argv[1:] if a.startswith('--')]
+
+    if len(args) != 2 or any(flag not in ('--record', '--changed') for flag in flags):
+        print("Usage: python create_scoring_worksheet.py <language> <act_number> [--record | --changed]")
         print("\nExamples:")
         print("  python PythonHelpers/create_scoring_worksheet.py chinese 1")
         print("  python PythonHelpers/create_scoring_worksheet.py spanish 3")
         print("  python PythonHelpers/create_scoring_worksheet.py english 5")
+        print("  python PythonHelpers/create_scoring_worksheet.py spanish 3 --record    # store finished review")
+        print("  python PythonHelpers/create_scoring_worksheet.py spanish 3 --changed   # only changed rows")
         sys.exit(1)
 
-    language = sys.argv[1].lower()
+    language = args[0].lower()
 
     try:
-        act_num = int(sys.argv[2])
+        act_num = int(args[1])
     except ValueError:
-        print(f"Error: Act number must be an integer, got '{sys.argv[2]}'")
+        print(f"Error: Act number must be an integer, got '{args[1]}'")
         sys.exit(1)
 
     # Validate language
@@ -157,7 +400,12 @@ def main():
         print(f"Error: Act number must be between 1 and 7, got {act_num}")
         sys.exit(1)
 
-    create_scoring_worksheet(language, act_num)
+    if '--record' in flags:
+        record_review(language, act_num)
+    elif '--changed' in flags:
+        create_changed_worksheet(language, act_num)
+    else:
+        create_scoring_worksheet(language, act_num)
 
 
 if __name__ == '__main__':
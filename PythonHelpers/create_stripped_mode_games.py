@@ -9,6 +9,9 @@ the code needed for each specific mode. Removes all unused:
 - CSS rules
 - Event listeners
 - Mode-specific logic
+
+Superseded for FlashcardTypingGame by build_mode_bundles.py, which tree-shakes
+the game's scripts per mode from a call graph instead of regex deletions.
 """
 
 import re
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Cross-lingual lookup index over every breakout CSV.
+
+The same strings appear as source words in one folder and as translations in
+the other two: 你好 is a ChineseWords source row, and also the `chinese`
+column of SpanishWords "hola" and EnglishWords "hello". This module reads all
+breakout CSVs of the three languages once and indexes every row under each of
+its chinese / spanish / english cells, so any known string resolves to its
+vetted translations with a single dict lookup.
+
+Priority when the same key has several rows: rows from the key language's own
+folder come first (ChineseWords rows for a chinese key, etc.), then the other
+folders, each in pack order. The first non-empty value per column wins.
+
+Keys are normalized like the translation memory's keys (memory_key: NFC,
+whitespace collapsed, case kept), so 'May' and 'may' stay separate entries.
+
+Usage (as a library):
+    from crosslingual_index import CrossLingualIndex
+
+    index = CrossLingualIndex()
+    index.lookup('chinese', '你好')          # {'pinyin': 'nǐ hǎo', 'english': 'Hello', ...}
+    index.translate('spanish', 'hola', 'chinese')   # '你好'
+
+Usage (CLI):
+    python PythonHelpers/crosslingual_index.py stats
+    python PythonHelpers/crosslingual_index.py lookup <chinese|spanish|english> <text>
+"""
+
+import csv
+import os
+import re
+import sys
+import time
+
+from translation_memory import memory_key
+
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+FOLDERS = {
+    'chinese': 'ChineseWords',
+    'spanish': 'SpanishWords',
+    'english': 'EnglishWords',
+}
+
+KEY_COLUMNS = ('chinese', 'spanish', 'english')
+
+# Placeholders left by older generators - never treated as translations
+PLACEHOLDER = re.compile(r'^(?:[A-Z]{2,3}|PINYIN_NEEDED)\[.*\]$|^\[TRANSLATE_')
+
+
+def breakout_paths(language):
+    """Return breakout CSV paths for a language, in pack order."""
+    folder = os.path.join(BASE_DIR, FOLDERS[language])
+    pattern = re.compile(rf'^{FOLDERS[language]}(\d+)\.csv$')
+    numbered = []
+    for name in os.listdir(folder):
+        match = pattern.match(name)
+        if match:
+            numbered.append((int(match.group(1)), os.path.join(folder, name)))
+    return [path for _, path in sorted(numbered)]
+
+
+def read_rows(language):
+    """Yield every breakout row of a language as a dict of non-empty cells."""
+    for path in breakout_paths(language):
+        with open(path, 'r', encoding='utf-8') as f:
+            for row in csv.DictReader(f):
+                cells = {col: (value or '').strip() for col, value in row.items() if col}
+                yield {col: value for col, value in cells.items()
+                       if value and not PLACEHOLDER.match(value)}
+
+
+class CrossLingualIndex:
+    """
+    {key_column: {memory_key(text): {column: value}}} built from all breakout CSVs.
+    """
+
+    def __init__(self, languages=None):
+        self.languages = languages or list(FOLDERS)
+        self.entries = {key: {} for key in KEY_COLUMNS}
+        self.rows_read = 0
+        self.hits = 0
+        self.misses = 0
+        self.build_ms = 0.0
+        self.build()
+
+    def build(self):
+        start = time.time()
+        rows_by_language = {language: list(read_rows(language)) for language in self.languages}
+        self.rows_read = sum(len(rows) for rows in rows_by_language.values())
+
+        for key in KEY_COLUMNS:
+            # Own folder first, then the others in their configured order
+            order = sorted(self.languages, key=lambda language: language != key)
+            table = self.entries[key]
+            for language in order:
+                for row in rows_by_language[language]:
+                    text = row.get(key)
+                    if not text:
+                        continue
+                    entry = table.setdefault(memory_key(text), {})
+                    for col, value in row.items():
+                        if col != key:
+                            entry.setdefault(col, value)
+
+        self.build_ms = (time.time() - start) * 1000
+
+    def lookup(self, key_column, text):
+        """Return {column: translation} for a known string, or None (counts a hit or miss)."""
+        entry = self.entries.get(key_column, {}).get(memory_key(text))
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return entry
+
+    def translate(self, key_column, text, target_column):
+        """Return one translation of `text` into `target_column`, or None."""
+        entry = self.lookup(key_column, text)
+        return entry.get(target_column) if entry else None
+
+    def lookup_batch(self, texts, key_column, target_column):
+        """
+        Resolve a batch against the index.
+
+        Returns:
+            tuple: (results, missing_indexes) - same shape as TranslationMemory.lookup_batch
+        """
+        results = [self.translate(key_column, text, target_column) for text in texts]
+        missing = [i for i, r in enumerate(results) if r is None]
+        return results, missing
+
+    def stats_line(self):
+        total = self.hits + self.misses
+        rate = (self.hits / total * 100) if total else 0.0
+        return f"Cross-lingual index: {self.hits} hits, {self.misses} misses ({rate:.1f}% hit rate)"
+
+    def __len__(self):
+        return sum(len(table) for table in self.entries.values())
+
+
+def main():
+    command = sys.argv[1].lower() if len(sys.argv) > 1 else 'stats'
+    index = CrossLingualIndex()
+
+    if command == 'lookup' and len(sys.argv) >= 4:
+        key_column, text = sys.argv[2].lower(), ' '.join(sys.argv[3:])
+        if key_column not in KEY_COLUMNS:
+            print(f"Unknown key column: {key_column} (use chinese, spanish or english)")
+            sys.exit(1)
+        entry = index.lookup(key_column, text)
+        if entry is None:
+            print("(not in index)")
+            return
+        for col, value in sorted(entry.items()):
+            print(f"  {col:<12} {value}")
+        return
+
+    print(f"Indexed {index.rows_read} breakout rows in {index.build_ms:.1f} ms")
+    for key in KEY_COLUMNS:
+        print(f"  {key:<8} {len(index.entries[key]):6d} distinct source strings")
+
+
+if __name__ == '__main__':
+    main()
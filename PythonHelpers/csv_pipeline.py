@@ -0,0 +1,423 @@
+#!/usr/bin/env python3
+"""
+Streaming transform pipeline for bulk in-place edits of breakout CSVs.
+
+Replaces the separate read-everything / mutate / write-everything loops in
+trim_csv_spaces.py, remove_chinese_languages.py, fix_pinyin_syllables.py
+and apply_fixes.py with chainable generator stages. Each file is streamed ONCE
+through every stage and written ONCE, atomically (temp file in the same
+folder + os.replace), and only if something changed. Each file keeps its own
+line endings. trim_csv_spaces.py and apply_fixes_by_act.py edit through these
+stages, and delete_fix_tables.py dry-runs the fix-table stage to confirm a
+table has been applied before deleting it.
+
+A fix table that edits the same cell twice with different values is refused
+rather than letting the later row win.
+
+Stages (applied in the order given on the command line):
+    --trim                 Strip leading/trailing spaces from every cell
+    --drop-columns a,b,c   Drop columns by header name
+    --fix-pinyin           Split joined pinyin syllables (wǒmen -> wǒ men)
+    --fix-table <csv>      Apply a fix table (Language, Pack_Number, Row_Number,
+                           Column_Name, Old_Value, New_Value); may be repeated
+
+Options:
+    --dry-run              Do not write anything, print a unified diff instead
+
+Usage:
+    python PythonHelpers/csv_pipeline.py <chinese|spanish|english|all|file.csv> [stages] [--dry-run]
+
+Examples:
+    python PythonHelpers/csv_pipeline.py all --trim
+    python PythonHelpers/csv_pipeline.py chinese --trim --fix-pinyin --dry-run
+    python PythonHelpers/csv_pipeline.py chinese --drop-columns vietnamese,thai,khmer,indonesian,malay,filipino
+    python PythonHelpers/csv_pipeline.py spanish --fix-table SpanishWords/SpanishFixTableAct1.csv
+"""
+
+import csv
+import difflib
+import io
+import os
+import re
+import sys
+import tempfile
+from collections import defaultdict
+from glob import glob
+
+from fix_pinyin_syllables import fix_pinyin_syllables as split_pinyin_syllables
+
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Language configurations
+LANGUAGE_CONFIG = {
+    'chinese': {'folder': 'ChineseWords', 'prefix': 'ChineseWords'},
+    'spanish': {'folder': 'SpanishWords', 'prefix': 'SpanishWords'},
+    'english': {'folder': 'EnglishWords', 'prefix': 'EnglishWords'},
+}
+
+BREAKOUT_NAME = re.compile(r'^(Chinese|Spanish|English)Words(\d+)\.csv$')
+
+# Breakout CSVs are written with the csv module's default CRLF line endings;
+# used for files without any line break to detect one from
+LINE_TERMINATOR = '\r\n'
+
+
+# ============================================================
+# STAGES
+# ============================================================
+#
+# A stage is a (name, function) pair. The function takes an iterator of rows
+# (header first) and a counter dict, and yields rows. It bumps counter[name]
+# once for every row it changes. Stages never look ahead, so the whole chain
+# runs in a single streaming pass.
+
+def trim_stage():
+    """Strip leading/trailing spaces from all cells (including the header)."""
+    name = 'trim'
+
+    def run(rows, counts):
+        for row in rows:
+            trimmed = [cell.strip() for cell in row]
+            if trimmed != row:
+                counts[name] += 1
+            yield trimmed
+
+    return name, run
+
+
+def drop_columns_stage(columns):
+    """Drop the named columns. Files without them pass through untouched."""
+    name = 'drop_columns'
+    columns = set(columns)
+
+    def run(rows, counts):
+        header = next(rows, None)
+        if header is None:
+            return
+        keep = [i for i, col in enumerate(header) if col not in columns]
+        if len(keep) == len(header):
+            yield header
+            yield from rows
+            return
+
+        yield [header[i] for i in keep]
+        counts[name] += 1
+        for row in rows:
+            yield [row[i] if i < len(row) else '' for i in keep]
+            counts[name] += 1
+
+    return name, run
+
+
+def pinyin_fix_stage():
+    """Split joined pinyin syllables using fix_pinyin_syllables.COMMON_SEPARATIONS."""
+    name = 'fix_pinyin'
+
+    def run(rows, counts):
+        header = next(rows, None)
+        if header is None:
+            return
+        yield header
+        if 'chinese' not in header or 'pinyin' not in header:
+            yield from rows
+            return
+
+        chinese_idx = header.index('chinese')
+        pinyin_idx = header.index('pinyin')
+        for row in rows:
+            if len(row) > max(chinese_idx, pinyin_idx):
+                fixed, changed = split_pinyin_syllables(row[chinese_idx], row[pinyin_idx])
+                if changed:
+                    row = row[:]
+                    row[pinyin_idx] = fixed
+                    counts[name] += 1
+            yield row
+
+    return name, run
+
+
+def load_fix_table(fix_table_path, language=None):
+    """
+    Read a fix table and index it by breakout file name.
+
+    Args:
+        fix_table_path: Fix table CSV
+        language: Used for rows without a Language column (act fix tables)
+
+    Returns:
+        dict: {'ChineseWords5.csv': {(row_number, column): (old, new), ...}, ...}
+
+    Raises:
+        ValueError: if two entries edit the same cell differently
+    """
+    fixes = defaultdict(dict)
+    conflicts = []
+    with open(fix_table_path, 'r', encoding='utf-8') as f:
+        for line_num, fix in enumerate(csv.DictReader(f), start=2):
+            lang = (fix.get('Language') or language or '').strip().capitalize()
+            pack = fix['Pack_Number'].strip()
+            filename = f"{lang}Words{pack}.csv"
+            key = (int(fix['Row_Number'].strip()), fix['Column_Name'].strip())
+            value = (fix['Old_Value'].strip(), fix['New_Value'].strip())
+            existing = fixes[filename].get(key)
+            if existing is not None and existing != value:
+                conflicts.append(f"{filename} row {key[0]} {key[1]}: "
+                                 f"'{existing[0]}' -> '{existing[1]}' vs "
+                                 f"'{value[0]}' -> '{value[1]}' (line {line_num})")
+                continue
+            fixes[filename][key] = value
+
+    if conflicts:
+        raise ValueError(f"{len(conflicts)} conflicting fixes in {fix_table_path}:\n  "
+                         + '\n  '.join(conflicts))
+    return fixes
+
+
+def fix_table_stage(fixes_by_file, filename, mismatches=None):
+    """
+    Apply fix-table entries for one file. Row numbers follow the fix table
+    convention (header = row 1). A fix whose Old_Value doesn't match the
+    current cell is counted under 'fix_table_mismatch' and left alone.
+
+    If a mismatches list is given, each unapplied fix is appended to it as
+    (filename, row_number, column, message).
+    """
+    name = 'fix_table'
+    fixes = fixes_by_file.get(filename, {})
+
+    def run(rows, counts):
+        def mismatch(key, message):
+            counts['fix_table_mismatch'] += 1
+            if mismatches is not None:
+                mismatches.append((filename, key[0], key[1], message))
+
+        header = next(rows, None)
+        if header is None:
+            return
+        yield header
+        if not fixes:
+            yield from rows
+            return
+
+        col_index = {col: i for i, col in enumerate(header)}
+        pending = set(fixes)
+        for row_num, row in enumerate(rows, start=2):
+            changed = False
+            for col, idx in col_index.items():
+                key = (row_num, col)
+                if key not in fixes:
+                    continue
+                pending.discard(key)
+                old_val, new_val = fixes[key]
+                actual = row[idx] if idx < len(row) else ''
+                if idx < len(row) and actual == old_val:
+                    if not changed:
+                        row = row[:]
+                    row[idx] = new_val
+                    changed = True
+                else:
+                    mismatch(key, f"Mismatch! Expected '{old_val}', found '{actual}'")
+            if changed:
+                counts[name] += 1
+            yield row
+        # Fixes pointing past the end of the file or at unknown columns
+        for key in sorted(pending):
+            if key[0] < 2:
+                mismatch(key, "Cannot edit header row")
+            elif key[1] not in col_index:
+                mismatch(key, f"Column '{key[1]}' not found in CSV")
+            else:
+                mismatch(key, f"Row {key[0]} out of range")
+
+    return name, run
+
+
+# ============================================================
+# PIPELINE
+# ============================================================
+
+def detect_line_terminator(filepath):
+    """CRLF or LF, whichever ends the file's first line (LINE_TERMINATOR if it has none)."""
+    with open(filepath, 'rb') as f:
+        first_line = f.readline()
+    if first_line.endswith(b'\r\n'):
+        return '\r\n'
+    if first_line.endswith(b'\n'):
+        return '\n'
+    return LINE_TERMINATOR
+
+
+def _to_csv_lines(rows, line_terminator):
+    buffer = io.StringIO()
+    csv.writer(buffer, lineterminator=line_terminator).writerows(rows)
+    return buffer.getvalue().splitlines(keepends=True)
+
+
+def run_pipeline(filepath, stage_factories, dry_run=False):
+    """
+    Stream one CSV file through all stages and write it back once.
+
+    Args:
+        filepath: Breakout CSV to edit in place
+        stage_factories: List of callables taking the file name and returning
+                         a (name, function) stage
+        dry_run: If True, nothing is written and a unified diff is returned
+
+    Returns:
+        tuple: (counts, diff_lines)
+               - counts: {stage_name: rows changed}
+               - diff_lines: unified diff (dry run only, else [])
+    """
+    filename = os.path.basename(filepath)
+    counts = defaultdict(int)
+    line_terminator = detect_line_terminator(filepath)
+
+    with open(filepath, 'r', encoding='utf-8', newline='') as src:
+        rows = csv.reader(src)
+        for factory in stage_factories:
+            _, run = factory(filename)
+            rows = run(iter(rows), counts)
+
+        if dry_run:
+            output = list(rows)
+            diff = []
+            if any(counts.values()):
+                # Compare against the file's actual bytes, so a line-ending or
+                # quoting change would show up too
+                src.seek(0)
+                original = src.read().splitlines(keepends=True)
+                diff = list(difflib.unified_diff(
+                    original, _to_csv_lines(output, line_terminator),
+                    fromfile=f"a/{filename}", tofile=f"b/{filename}"))
+            return counts, diff
+
+        folder = os.path.dirname(os.path.abspath(filepath))
+        fd, tmp_path = tempfile.mkstemp(prefix=f".{filename}.", suffix='.tmp', dir=folder)
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8', newline='') as dst:
+                csv.writer(dst, lineterminator=line_terminator).writerows(rows)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    changed = any(v for k, v in counts.items() if not k.endswith('_mismatch'))
+    if changed:
+        os.replace(tmp_path, filepath)
+    else:
+        os.unlink(tmp_path)
+    return counts, []
+
+
+def breakout_files(language):
+    """Return sorted breakout CSV paths for a language (Overview etc. excluded)."""
+    config = LANGUAGE_CONFIG[language]
+    pattern = os.path.join(BASE_DIR, config['folder'], f"{config['prefix']}[0-9]*.csv")
+    files = [p for p in glob(pattern) if BREAKOUT_NAME.match(os.path.basename(p))]
+    return sorted(files, key=lambda p: int(BREAKOUT_NAME.match(os.path.basename(p)).group(2)))
+
+
+def run_files(files, stage_factories, stage_names, dry_run=False):
+    """Run the pipeline over many files and print per-stage totals."""
+    totals = defaultdict(int)
+    files_changed = 0
+
+    for filepath in files:
+        counts, diff = run_pipeline(filepath, stage_factories, dry_run)
+        for key, value in counts.items():
+            totals[key] += value
+
+        changed = any(v for k, v in counts.items() if not k.endswith('_mismatch'))
+        if changed:
+            files_changed += 1
+            detail = ', '.join(f"{k}: {counts[k]}" for k in stage_names if counts[k])
+            verb = "Would change" if dry_run else "✓ Updated"
+            print(f"{verb}: {os.path.basename(filepath)} ({detail})")
+            if diff:
+                sys.stdout.writelines(diff)
+
+    print(f"\n{'='*60}")
+    print("PIPELINE SUMMARY" + (" (DRY RUN)" if dry_run else ""))
+    print(f"{'='*60}")
+    print(f"Files streamed: {len(files)}")
+    print(f"Files {'that would change' if dry_run else 'rewritten'}: {files_changed}")
+    print("\nRows changed per stage:")
+    for stage_name in stage_names:
+        print(f"  {stage_name:<15} {totals[stage_name]}")
+    if totals['fix_table_mismatch']:
+        print(f"\n⚠️  {totals['fix_table_mismatch']} fix-table entries did not match (not applied)")
+
+    return totals
+
+
+# ============================================================
+# COMMAND-LINE INTERFACE
+# ============================================================
+
+def parse_stages(args):
+    """Turn CLI flags into an ordered list of stage factories."""
+    factories = []
+    names = []
+    fix_tables = {}
+    i = 0
+    while i < len(args):
+        arg = args[i]
+        if arg == '--trim':
+            factories.append(lambda filename: trim_stage())
+            names.append('trim')
+        elif arg == '--drop-columns':
+            i += 1
+            columns = [c.strip() for c in args[i].split(',') if c.strip()]
+            factories.append(lambda filename, cols=columns: drop_columns_stage(cols))
+            names.append('drop_columns')
+        elif arg == '--fix-pinyin':
+            factories.append(lambda filename: pinyin_fix_stage())
+            names.append('fix_pinyin')
+        elif arg == '--fix-table':
+            i += 1
+            fix_tables[args[i]] = load_fix_table(args[i])
+            table = fix_tables[args[i]]
+            factories.append(lambda filename, t=table: fix_table_stage(t, filename))
+            names.append('fix_table')
+        elif arg != '--dry-run':
+            raise ValueError(f"Unknown option: {arg}")
+        i += 1
+
+    # Keep each stage name once in the summary, in first-seen order
+    return factories, list(dict.fromkeys(names))
+
+
+def main():
+    if len(sys.argv) < 3:
+        print(__doc__)
+        sys.exit(1)
+
+    target = sys.argv[1]
+    dry_run = '--dry-run' in sys.argv
+
+    try:
+        factories, stage_names = parse_stages(sys.argv[2:])
+    except (ValueError, IndexError, OSError, KeyError) as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+
+    if not factories:
+        print("❌ No stages given. Use --trim, --drop-columns, --fix-pinyin or --fix-table")
+        sys.exit(1)
+
+    if target.lower() == 'all':
+        files = [p for lang in LANGUAGE_CONFIG for p in breakout_files(lang)]
+    elif target.lower() in LANGUAGE_CONFIG:
+        files = breakout_files(target.lower())
+    elif os.path.exists(target):
+        files = [target]
+    else:
+        print(f"Unknown language or file not found: {target}")
+        print("Use: chinese, spanish, english, all, or a valid file path")
+        sys.exit(1)
+
+    run_files(files, factories, stage_names, dry_run)
+
+
+if __name__ == '__main__':
+    main()
@@ -22,6 +22,7 @@
 #   python PythonHelpers/delete_fix_tables.py chinese 1
 #   python PythonHelpers/delete_fix_tables.py spanish 3
 #   python PythonHelpers/delete_fix_tables.py all          # Delete all fix tables
+#   python PythonHelpers/delete_fix_tables.py chinese 1 --force  # Even if fixes are unapplied
 #
 # IMPORTANT:
 # ----------
@@ -30,19 +31,68 @@
 # - Changes have been validated
 # - Changes have been committed to git
 #
+# A fix table is only deleted once every fix in it is applied: the table is
+# dry-run through csv_pipeline.py's fix-table stage, and any fix that would
+# still change a breakout CSV blocks the delete (use --force to override).
+#
 # ============================================================
 
 import os
 import sys
 
+from csv_pipeline import fix_table_stage, load_fix_table, run_pipeline
+
 
-def delete_fix_table(language, act_num):
+def unapplied_fixes(fix_table_path, language):
+    """
+    Count the fixes in a fix table that would still change a breakout CSV.
+
+    Args:
+        fix_table_path: Fix table CSV
+        language: Language name (chinese, spanish, english)
+
+    Returns:
+        int: Number of fixes whose Old_Value is still in place
+    """
+    fixes_by_file = load_fix_table(fix_table_path, language)
+    folder = os.path.dirname(os.path.abspath(fix_table_path))
+
+    pending = 0
+    for filename, fixes in fixes_by_file.items():
+        csv_path = os.path.join(folder, filename)
+        if not os.path.exists(csv_path):
+            continue
+        mismatches = []
+        run_pipeline(csv_path, [lambda name: fix_table_stage(fixes_by_file, name, mismatches)],
+                     dry_run=True)
+        pending += len(fixes) - len(mismatches)
+    return pending
+
+
+def can_delete_fix_table(fix_table_path, language, force=False):
+    """Print why a fix table must be kept; True if it is safe to delete."""
+    if force:
+        return True
+    try:
+        pending = unapplied_fixes(fix_table_path, language)
+    except ValueError as e:
+        print(f"❌ Kept {os.path.basename(fix_table_path)}: {e}")
+        return False
+    if pending:
+        print(f"❌ Kept {os.path.basename(fix_table_path)}: {pending} fix(es) not applied yet")
+        print(f"   Run apply_fixes_by_act.py first, or pass --force")
+        return False
+    return True
+
+
+def delete_fix_table(language, act_num, force=False):
     """
     Delete fix table and scoring worksheet for a specific language and act.
 
     Args:
         language: Language name (chinese, spanish, english)
         act_num: Act number (1-7)
+        force: Delete the fix table even if some fixes are not applied
 
     Returns:
         None (deletes files)
@@ -54,11 +104,14 @@ def delete_fix_table(language, act_num):
     # Paths to delete
     fix_table_path = os.path.join(base_dir, lang_folder, f"{lang_cap}FixTableAct{act_num}.csv")
     worksheet_path = os.path.join(base_dir, lang_folder, f"{lang_cap}ScoringWorksheetAct{act_num}.csv")
+    review_rows_path = os.path.join(base_dir, lang_folder, f"{lang_cap}ReviewRowsAct{act_num}.csv")
 
     deleted_files = []
 
-    # Delete fix table if it exists
+    # Delete fix table if it exists and every fix in it has been applied
     if os.path.exists(fix_table_path):
+        if not can_delete_fix_table(fix_table_path, language, force):
+            return
         os.remove(fix_table_path)
         deleted_files.append(os.path.basename(fix_table_path))
         print(f"✅ Deleted: {os.path.basename(fix_table_path)}")
@@ -73,13 +126,19 @@ def delete_fix_table(language, act_num):
     else:
         print(f"⚠️  Not found: {os.path.basename(worksheet_path)}")
 
+    # Changed-rows list only exists for incremental (--changed) reviews
+    if os.path.exists(review_rows_path):
+        os.remove(review_rows_path)
+        deleted_files.append(os.path.basename(review_rows_path))
+        print(f"✅ Deleted: {os.path.basename(review_rows_path)}")
+
     if deleted_files:
         print(f"\n🗑️  Cleaned up {len(deleted_files)} intermediate file(s)")
     else:
         print(f"\n⚠️  No files to delete for {language} Act {act_num}")
 
 
-def delete_all_fix_tables(language):
+def delete_all_fix_tables(language, force=False):
     """Delete all fix tables and worksheets for a language (all acts)."""
     base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
     lang_cap = language.capitalize()
@@ -95,10 +154,12 @@ def delete_all_fix_tables(language):
     for filename in os.listdir(lang_folder):
         if filename.startswith(f"{lang_cap}FixTableAct") and filename.endswith('.csv'):
             filepath = os.path.join(lang_folder, filename)
+            if not can_delete_fix_table(filepath, language, force):
+                continue
             os.remove(filepath)
             print(f"✅ Deleted: {filename}")
             deleted_count += 1
-        elif filename.startswith(f"{lang_cap}ScoringWorksheetAct") and filename.endswith('.csv'):
+        elif filename.startswith((f"{lang_cap}ScoringWorksheetAct", f"{lang_cap}ReviewRowsAct")) and filename.endswith('.csv'):
             filepath = os.path.join(lang_folder, filename)
             os.remove(filepath)
             print(f"✅ Deleted: {filename}")
@@ -111,8 +172,11 @@ def delete_all_fix_tables(language):
 
 
 def main():
-    if len(sys.argv) < 2:
-        print("Usage: python delete_fix_tables.py <language> [act_number|all]")
+    force = '--force' in sys.argv
+    args = [arg for arg in sys.argv[1:] if arg != '--force']
+
+    if not args:
+        print("Usage: python delete_fix_tables.py <language> [act_number|all] [--force]")
         print("\nExamples:")
         print("  python PythonHelpers/delete_fix_tables.py chinese 1")
         print("  python PythonHelpers/delete_fix_tables.py spanish all")
@@ -120,7 +184,7 @@ def main():
         print("\n⚠️  Only run this AFTER applying fixes and committing changes!")
         sys.exit(1)
 
-    language = sys.argv[1].lower()
+    language = args[0].lower()
 
     # Validate language
     valid_languages = ['chinese', 'spanish', 'english']
@@ -130,15 +194,15 @@ def main():
         sys.exit(1)
 
     # Check if deleting all or specific act
-    if len(sys.argv) == 2 or (len(sys.argv) == 3 and sys.argv[2].lower() == 'all'):
+    if len(args) == 1 or (len(args) == 2 and args[1].lower() == 'all'):
         # Delete all for this language
-        delete_all_fix_tables(language)
+        delete_all_fix_tables(language, force)
     else:
         # Delete specific act
         try:
-            act_num = int(sys.argv[2])
+            act_num = int(args[1])
         except ValueError:
-            print(f"Error: Act number must be an integer or 'all', got '{sys.argv[2]}'")
+            print(f"Error: Act number must be an integer or 'all', got '{args[1]}'")
             sys.exit(1)
 
         # Validate act number (1-7)
@@ -146,7 +210,7 @@ def main():
             print(f"Error: Act number must be between 1 and 7, got {act_num}")
             sys.exit(1)
 
-        delete_fix_table(language, act_num)
+        delete_fix_table(language, act_num, force)
 
 
 if __name__ == '__main__':
@@ -1,22 +1,27 @@
 #!/usr/bin/env python3
 # ============================================================
 # MODULE: extract_functions_to_csv.py
-# Core Purpose: Extract function names from JS/HTML files and create CSV function catalogs
+# Core Purpose: Catalog the functions of the shared and game JS files with size and usage data
 # ============================================================
 #
 # WHAT THIS SCRIPT DOES:
 # -----------------------
-# 1. Parses JavaScript and HTML files to extract all function definitions
-# 2. Creates CSV files with function metadata for manual annotation
-# 3. Deletes and recreates CSVs to ensure clean state
-# 4. Auto-fills function names and CSV headers
-# 5. Leaves "What It Does", "How Does It Work", and "Reusability" columns empty for manual filling
+# 1. Parses the JS files (and the game pages' inline scripts) in one pass each
+#    with js_callgraph's tokenizer (strings, comments, templates and regexes skipped)
+# 2. Builds one call graph across all of them (they share the page's global scope)
+# 3. Updates each file's catalog CSV in MyFunctions/ with every top-level function:
+#    line, byte size, callees, callers (other files prefixed "file:")
+# 4. Keeps the manual columns ("What It Does", "How It Works", "Reusability") -
+#    rows are matched on the function name, functions no longer in the file are
+#    kept at the end with Status "not found"
+# 5. Writes MyFunctions/dead_functions.csv and MyFunctions/cross_file_refs.csv
 #
 # WHY THIS EXISTS:
 # ---------------
 # To catalog all functions in language learning game files and rate their reusability
 # across future games. This helps identify which functions should be moved to
-# wordpack-logic.js for sharing across hundreds of future games.
+# wordpack-logic.js for sharing across hundreds of future games - and which are
+# dead weight that every game page downloads.
 #
 # USAGE:
 # ------
@@ -24,165 +29,237 @@
 #
 # OUTPUT FILES:
 # -------------
-#   - flashcardtypinggame_functions.csv
-#   - decodertest_functions.csv
-#   - wordpack-logic_functions.csv
+#   - MyFunctions/wordpack-logic_functions.csv
+#   - MyFunctions/game-sounds_functions.csv
+#   - MyFunctions/flashcardtypinggame_functions.csv
+#   - MyFunctions/decodertest_functions.csv
+#   - MyFunctions/dead_functions.csv
+#   - MyFunctions/cross_file_refs.csv
 #
 # CSV STRUCTURE:
 # --------------
-#   Column 1: Function Name (auto-filled)
-#   Column 2: What It Does (manual - very detailed description)
-#   Column 3: How Does It Work (manual - very detailed explanation of HOW it does what it does)
-#   Column 4: Reusability (1-10) (manual - can it be used in hundreds of future games?)
+#   Function Name, What It Does, How It Works, Reusability Score (1-10) (manual columns kept)
+#   Line, Bytes, Calls, Called_By, Status                               (auto-filled)
+#
+#   Status: live | exported only (no caller here, but published on window for
+#           game pages) | dead (never referenced; the Node-only module.exports
+#           block does not count) | not found (row kept from an older version)
+#
+#   A function also counts as used when a string or an HTML on*="..." handler
+#   calls it by name (e.g. onclick="restartCurrentPack()" built in a template).
+#   Nested functions are part of their parent's size and are not listed.
 #
 # ============================================================
 
-import re
 import csv
 import os
-from pathlib import Path
+import re
 
-def extract_functions_from_file(filepath):
-    """
-    Extract function names from a JavaScript or HTML file.
+from js_callgraph import CallGraph, Script, load_page_sources, tokenize
 
-    Args:
-        filepath: Path to the file to parse
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+OUTPUT_DIR = os.path.join(BASE_DIR, 'MyFunctions')
 
-    Returns:
-        List of function names found in the file
-    """
-    with open(filepath, 'r', encoding='utf-8') as f:
-        content = f.read()
+# (source file, catalog CSV) - sources share one global scope in the game pages
+FILES_TO_PROCESS = [
+    ('wordpack-logic.js', 'wordpack-logic_functions.csv'),
+    ('game-sounds.js', 'game-sounds_functions.csv'),
+    ('FlashcardTypingGame/FlashcardTypingGame.js', 'flashcardtypinggame_functions.csv'),
+    ('DecoderTest/DecoderTest.js', 'decodertest_functions.csv'),
+]
 
-    functions = set()  # Use set to avoid duplicates
+# Pages whose inline scripts and on*="..." handlers also reference these functions
+PAGES = [
+    'FlashcardTypingGame/FlashcardTypingGame.html',
+    'DecoderTest/DecoderTest.html',
+]
 
-    # Pattern 1: function functionName()
-    pattern1 = r'\bfunction\s+([a-zA-Z_$][a-zA-Z0-9_$]*)\s*\('
-    functions.update(re.findall(pattern1, content))
+DEFAULT_MANUAL_COLUMNS = ['Function Name', 'What It Does', 'How It Works', 'Reusability Score (1-10)']
+AUTO_COLUMNS = ['Line', 'Bytes', 'Calls', 'Called_By', 'Status']
+
+CALL_IN_TEXT = re.compile(r'([A-Za-z_$][\w$]*)\s*\(')
+HANDLER_ATTR = re.compile(r'\bon[a-z]+\s*=\s*"([^"]*)"', re.IGNORECASE)
+
+
+def read_sources():
+    """
+    Return [Script(label, source, module), ...] for the JS files and the pages' inline scripts.
+
+    A file is a module script if a page loads it with type="module".
+    """
+    page_scripts = []
+    module_paths = set()
+    for page in PAGES:
+        full_path = os.path.join(BASE_DIR, page)
+        if os.path.exists(full_path):
+            for script in load_page_sources(full_path):
+                if script.label.startswith('inline#'):
+                    page_scripts.append(script._replace(label=f"{page}:{script.label}"))
+                elif script.module:
+                    module_paths.add(os.path.normpath(os.path.join(os.path.dirname(page), script.label)))
 
-    # Pattern 2: async function functionName()
-    pattern2 = r'\basync\s+function\s+([a-zA-Z_$][a-zA-Z0-9_$]*)\s*\('
-    functions.update(re.findall(pattern2, content))
+    sources = []
+    for path, _ in FILES_TO_PROCESS:
+        full_path = os.path.join(BASE_DIR, path)
+        if not os.path.exists(full_path):
+            print(f"  ❌ File not found: {path}")
+            continue
+        with open(full_path, 'r', encoding='utf-8') as f:
+            sources.append(Script(path, f.read(), os.path.normpath(path) in module_paths))
+    return sources + page_scripts
 
-    # Pattern 3: const functionName = function()
-    pattern3 = r'\bconst\s+([a-zA-Z_$][a-zA-Z0-9_$]*)\s*=\s*function\s*\('
-    functions.update(re.findall(pattern3, content))
 
-    # Pattern 4: const functionName = async function()
-    pattern4 = r'\bconst\s+([a-zA-Z_$][a-zA-Z0-9_$]*)\s*=\s*async\s+function\s*\('
-    functions.update(re.findall(pattern4, content))
+def text_calls(sources):
+    """Names called from string/template text in the scripts and from HTML handler attributes."""
+    names = set()
+    for script in sources:
+        for token in tokenize(script.source):
+            if token.kind in ('string', 'template'):
+                names.update(CALL_IN_TEXT.findall(token.value))
+    for page in PAGES:
+        full_path = os.path.join(BASE_DIR, page)
+        if os.path.exists(full_path):
+            with open(full_path, 'r', encoding='utf-8') as f:
+                for handler in HANDLER_ATTR.findall(f.read()):
+                    names.update(CALL_IN_TEXT.findall(handler))
+    return names
 
-    # Pattern 5: const functionName = () => (arrow functions)
-    pattern5 = r'\bconst\s+([a-zA-Z_$][a-zA-Z0-9_$]*)\s*=\s*\([^)]*\)\s*=>'
-    functions.update(re.findall(pattern5, content))
 
-    # Pattern 6: const functionName = async () => (async arrow functions)
-    pattern6 = r'\bconst\s+([a-zA-Z_$][a-zA-Z0-9_$]*)\s*=\s*async\s*\([^)]*\)\s*=>'
-    functions.update(re.findall(pattern6, content))
+def function_status(graph, name, called_from_text):
+    """live, exported only or dead."""
+    callers = [item for item in graph.caller_items(name) if item.kind != 'cjs-export']
+    if name in called_from_text or any(item.kind != 'export' for item in callers):
+        return 'live'
+    return 'exported only' if callers else 'dead'
 
-    # Pattern 7: window.functionName = function()
-    pattern7 = r'\bwindow\.([a-zA-Z_$][a-zA-Z0-9_$]*)\s*=\s*function\s*\('
-    functions.update(re.findall(pattern7, content))
 
-    # Pattern 8: window.functionName = async function()
-    pattern8 = r'\bwindow\.([a-zA-Z_$][a-zA-Z0-9_$]*)\s*=\s*async\s+function\s*\('
-    functions.update(re.findall(pattern8, content))
+def base_name(cell):
+    """'switchLanguage(language)' -> 'switchLanguage'"""
+    return cell.split('(')[0].strip()
 
-    # Pattern 9: let/var functionName = function()
-    pattern9 = r'\b(?:let|var)\s+([a-zA-Z_$][a-zA-Z0-9_$]*)\s*=\s*function\s*\('
-    functions.update(re.findall(pattern9, content))
 
-    # Pattern 10: let/var functionName = async function()
-    pattern10 = r'\b(?:let|var)\s+([a-zA-Z_$][a-zA-Z0-9_$]*)\s*=\s*async\s+function\s*\('
-    functions.update(re.findall(pattern10, content))
+def read_catalog(path):
+    """Return (header, rows) of an existing catalog, or the default header and no rows."""
+    if not os.path.exists(path):
+        return list(DEFAULT_MANUAL_COLUMNS), []
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        reader = csv.reader(f)
+        header = next(reader, None) or list(DEFAULT_MANUAL_COLUMNS)
+        return header, [row for row in reader if row]
 
-    return sorted(list(functions))  # Return sorted list for consistent ordering
 
-def create_csv(output_path, function_names):
+def update_catalog(output_path, label, graph, called_from_text):
     """
-    Create a CSV file with function names and empty columns for manual annotation.
+    Rewrite one catalog: current functions in source order (manual columns kept),
+    then rows for functions no longer in the file.
 
-    Args:
-        output_path: Path where CSV should be created
-        function_names: List of function names to include
+    Returns:
+        int: number of functions in the file
     """
-    # Delete existing file if it exists
-    if os.path.exists(output_path):
-        os.remove(output_path)
-        print(f"✓ Deleted existing file: {output_path}")
+    header, old_rows = read_catalog(output_path)
+    manual_columns = [col for col in header if col not in AUTO_COLUMNS]
+    old_by_name = {}
+    for row in old_rows:
+        cells = dict(zip(header, row))
+        old_by_name.setdefault(base_name(cells.get(header[0], '')), cells)
+
+    functions = [item for item in graph.items if item.source == label and item.kind in ('function', 'class')]
+    rows = []
+    for item in functions:
+        cells = old_by_name.pop(item.name, {manual_columns[0]: item.name})
+        callers = []
+        for caller in graph.caller_items(item.name):
+            caller_name = caller.name or f"line {caller.line}"
+            if caller.kind in ('export', 'cjs-export'):
+                caller_name = 'window' if caller.kind == 'export' else 'module.exports'
+            callers.append(caller_name if caller.source == label else f"{os.path.basename(caller.source)}:{caller_name}")
+        cells.update({
+            'Line': item.line,
+            'Bytes': item.size,
+            'Calls': ' '.join(graph.callees(item)),
+            'Called_By': ' '.join(dict.fromkeys(callers)),
+            'Status': function_status(graph, item.name, called_from_text),
+        })
+        rows.append(cells)
+    for cells in old_by_name.values():
+        cells.update({'Line': '', 'Bytes': '', 'Calls': '', 'Called_By': '', 'Status': 'not found'})
+        rows.append(cells)
 
-    # Create new CSV with headers
     with open(output_path, 'w', newline='', encoding='utf-8') as f:
         writer = csv.writer(f)
+        writer.writerow(manual_columns + AUTO_COLUMNS)
+        for cells in rows:
+            writer.writerow([cells.get(col, '') for col in manual_columns + AUTO_COLUMNS])
+
+    print(f"✓ Updated {os.path.relpath(output_path, BASE_DIR)}: {len(functions)} functions"
+          + (f", {len(old_by_name)} old rows not found" if old_by_name else ""))
+    return len(functions)
 
-        # Write headers
-        writer.writerow([
-            'Function Name',
-            'What It Does',
-            'How Does It Work',
-            'Reusability (1-10)'
-        ])
-
-        # Write function rows with empty columns for manual filling
-        for func_name in function_names:
-            writer.writerow([
-                func_name,
-                '',  # What It Does - to be filled manually
-                '',  # How Does It Work - to be filled manually
-                ''   # Reusability (1-10) - to be filled manually
-            ])
-
-    print(f"✓ Created CSV: {output_path} with {len(function_names)} functions")
 
 def main():
     """
-    Main execution: Extract functions from all target files and create CSVs.
+    Main execution: Build the call graph and update all catalogs.
     """
     print("="*70)
     print("FUNCTION EXTRACTION TO CSV")
     print("="*70)
     print()
 
-    # Define files to process
-    files_to_process = [
-        {
-            'input': '/home/user/LPH/FlashcardTypingGame/FlashcardTypingGame.html',
-            'output': '/home/user/LPH/flashcardtypinggame_functions.csv'
-        },
-        {
-            'input': '/home/user/LPH/DecoderTest.html',
-            'output': '/home/user/LPH/decodertest_functions.csv'
-        },
-        {
-            'input': '/home/user/LPH/wordpack-logic.js',
-            'output': '/home/user/LPH/wordpack-logic_functions.csv'
-        }
-    ]
-
-    # Process each file
-    for file_info in files_to_process:
-        input_path = file_info['input']
-        output_path = file_info['output']
-
-        print(f"Processing: {input_path}")
-
-        # Check if input file exists
-        if not os.path.exists(input_path):
-            print(f"  ❌ File not found: {input_path}")
-            continue
+    sources = read_sources()
+    graph = CallGraph(sources)
+    called_from_text = text_calls(sources)
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
 
-        # Extract functions
-        function_names = extract_functions_from_file(input_path)
-        print(f"  Found {len(function_names)} functions")
+    for name, first, second in graph.duplicates:
+        print(f"⚠️  {name} defined in both {first.source}:{first.line} and {second.source}:{second.line}")
 
-        # Create CSV
-        create_csv(output_path, function_names)
-        print()
+    loaded = {script.label for script in sources}
+    total = 0
+    for path, csv_name in FILES_TO_PROCESS:
+        if path in loaded:
+            total += update_catalog(os.path.join(OUTPUT_DIR, csv_name), path, graph, called_from_text)
 
+    # Dead and export-only functions
+    unused = []
+    for item in graph.items:
+        if item.kind not in ('function', 'class'):
+            continue
+        status = function_status(graph, item.name, called_from_text)
+        if status != 'live':
+            unused.append((item, status))
+    dead_path = os.path.join(OUTPUT_DIR, 'dead_functions.csv')
+    with open(dead_path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(['Function Name', 'File', 'Line', 'Bytes', 'Status'])
+        for item, status in unused:
+            writer.writerow([item.name, item.source, item.line, item.size, status])
+
+    # Cross-file references
+    cross = graph.cross_file_refs()
+    cross_path = os.path.join(OUTPUT_DIR, 'cross_file_refs.csv')
+    with open(cross_path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(['From_File', 'From', 'To_File', 'To'])
+        writer.writerows(cross)
+
+    print()
     print("="*70)
     print("EXTRACTION COMPLETE!")
     print("="*70)
+    print(f"Functions: {total} ({sum(item.size for item in graph.items if item.kind == 'function'):,} bytes)")
+    print(f"Cross-file references: {len(cross)}")
+    pairs = {}
+    for from_file, _, to_file, _ in cross:
+        pairs[(from_file, to_file)] = pairs.get((from_file, to_file), 0) + 1
+    for (from_file, to_file), count in sorted(pairs.items()):
+        print(f"  {from_file} -> {to_file}: {count}")
+    dead = [(item, status) for item, status in unused if status == 'dead']
+    print(f"Dead functions: {len(dead)} ({sum(item.size for item, _ in dead):,} bytes)")
+    for item, _ in dead:
+        print(f"  {item.name:<35} {item.source}:{item.line} ({item.size} B)")
+    exported_only = len(unused) - len(dead)
+    if exported_only:
+        print(f"Exported only (no caller in these files): {exported_only} - see dead_functions.csv")
     print()
     print("NEXT STEPS:")
     print("1. Open each CSV file")
@@ -191,10 +268,8 @@ def main():
     print("4. Rate 'Reusability (1-10)' based on:")
     print("   - 10/10: Can be used in hundreds of future language learning games")
     print("   - 1/10: Super specific to that particular game's UI/elements")
-    print()
-    print("FILES CREATED:")
-    for file_info in files_to_process:
-        print(f"  - {file_info['output']}")
+    print("5. Review dead_functions.csv before deleting anything")
+
 
 if __name__ == '__main__':
     main()
@@ -7,10 +7,28 @@ Usage:
     python PythonHelpers/generate_act_prompt.py chinese 2
     ...
     python PythonHelpers/generate_act_prompt.py chinese 5
+
+Chunked mode (size-bounded review batches):
+    python PythonHelpers/generate_act_prompt.py spanish 3 --chunks [--budget 8000] [--output-dir DIR]
+
+    Whole acts (13-49 packs, hundreds of rows) overflow a reviewer's context.
+    Chunked mode estimates the token size of every pack's rows and bin-packs
+    whole packs into chunks of at most --budget tokens (first-fit decreasing).
+    The budget covers the chunk prompt's own text (rules, validation, pinyin
+    reference) as well as the pack data.
+    Each chunk prompt lists its own pack themes and fix table
+    (<Lang>FixTableAct{N}Chunk{K}.csv), and chunks cover disjoint packs, so
+    they can be reviewed and applied in parallel. Chunk prompts carry the same
+    validation step, rules and pinyin reference as the whole-act prompt, with
+    the checks limited to the chunk's packs.
 """
 
+import csv
+import os
 import sys
 
+from overview_arrays import load_overview
+
 # Act metadata
 ACT_INFO = {
     'chinese': {
@@ -38,6 +56,43 @@ ACT_INFO = {
     }
 }
 
+# Sections shared by the whole-act and the chunked prompts, rendered into both
+VALIDATION_STEP = """=== STEP 0: RUN PYTHON VALIDATION (QUICK MECHANICAL CHECKS) ===
+
+# Trim spaces
+{trim_command}
+
+# Run validation scripts
+python PythonHelpers/validate_pinyin.py {language} --packs {packs}
+python PythonHelpers/check_translation_quality.py {language}
+python PythonHelpers/check_language_mismatch.py {language}
+python PythonHelpers/check_latin_in_chinese.py {language}
+python PythonHelpers/check_punctuation.py {language}
+
+Only validate_pinyin.py is limited to your packs; the other checks report the
+whole language. Note any flagged packs of yours, but don't stop there!"""
+
+CRITICAL_RULES = """CRITICAL VALIDATION RULES:
+🔒 NEVER edit Column 0 ({language}) - it's sacred!
+✓ Pinyin: Character-by-character mapping, punctuation attached (好， → hǎo，)
+✓ Latin letters: Letter-by-letter (ATM机 → A T M jī, not "ATM jī")
+✓ Theme matching: Translation must fit the pack's theme
+✓ Natural phrasing: Most common everyday translation"""
+
+PINYIN_REFERENCE = """=== PINYIN RULES REFERENCE ===
+
+Character-by-character mapping:
+✓ 你好 → nǐ hǎo (2 chars = 2 syllables)
+✗ 你好 → nǐhǎo (missing space!)
+
+Punctuation attached:
+✓ 好，先生 → hǎo， xiān shēng (comma after syllable)
+✗ 好，先生 → hǎo ， xiān shēng (space before comma!)
+
+Latin letters (letter-by-letter):
+✓ ATM机 → A T M jī (each letter separate)
+✗ ATM机 → ATM jī (letters grouped - wrong!)"""
+
 PROMPT_TEMPLATE = """╔══════════════════════════════════════════════════════════════════╗
 ║  🎯 {lang_upper} ACT {act_num}: {act_name} - TRANSLATION QUALITY REVIEW  ║
 ║  Packs {pack_start}-{pack_end} ({pack_count} packs)                              ║
@@ -79,19 +134,7 @@ Your job: Ensure the other columns have the BEST translations for native speaker
 ║  Column 5: portuguese  (Evaluate: natural, theme-appropriate)   ║
 ╚══════════════════════════════════════════════════════════════════╝
 
-=== STEP 0: RUN PYTHON VALIDATION (QUICK MECHANICAL CHECKS) ===
-
-# Trim spaces
-python PythonHelpers/trim_csv_spaces.py chinese
-
-# Run validation scripts
-python PythonHelpers/validate_pinyin.py chinese {pack_start} {pack_end}
-python PythonHelpers/check_translation_quality.py chinese {pack_start} {pack_end}
-python PythonHelpers/check_language_mismatch.py chinese {pack_start} {pack_end}
-python PythonHelpers/check_latin_in_chinese.py chinese {pack_start} {pack_end}
-python PythonHelpers/check_punctuation.py chinese {pack_start} {pack_end}
-
-Note any flagged packs, but don't stop there!
+{validation_step}
 
 === STEP 1: MANUAL REVIEW (THE REAL WORK) ===
 
@@ -153,12 +196,7 @@ chinese,{pack_start},Greetings,5,english,salutation,hello,Too formal - use commo
 chinese,{pack_start},Greetings,8,spanish,señor,señor,Missing accent (wrong: senor)
 chinese,{pack_start},Greetings,12,french,,bonjour,Empty cell
 
-CRITICAL VALIDATION RULES:
-🔒 NEVER edit Column 0 (chinese) - it's sacred!
-✓ Pinyin: Character-by-character mapping, punctuation attached (好， → hǎo，)
-✓ Latin letters: Letter-by-letter (ATM机 → A T M jī, not "ATM jī")
-✓ Theme matching: Translation must fit the pack's theme
-✓ Natural phrasing: Most common everyday translation
+{critical_rules}
 
 === STEP 3: APPLY FIXES (MANDATORY!) ===
 
@@ -186,7 +224,7 @@ If errors occur:
 
 === STEP 4: VALIDATE ===
 
-python PythonHelpers/validate_pinyin.py chinese {pack_start} {pack_end}
+python PythonHelpers/validate_pinyin.py {language} --packs {pack_start}-{pack_end}
 
 Expected: 0 errors
 
@@ -207,24 +245,250 @@ git push -u origin <branch>
 
 ⚠️⚠️⚠️ If actual CSVs aren't fixed, you FAILED! ⚠️⚠️⚠️
 
-=== PINYIN RULES REFERENCE ===
+{pinyin_reference}
+"""
 
-Character-by-character mapping:
-✓ 你好 → nǐ hǎo (2 chars = 2 syllables)
-✗ 你好 → nǐhǎo (missing space!)
+# ============================================================
+# CHUNKED MODE
+# ============================================================
 
-Punctuation attached:
-✓ 好，先生 → hǎo， xiān shēng (comma after syllable)
-✗ 好，先生 → hǎo ， xiān shēng (space before comma!)
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_CHUNK_BUDGET = 8000
+FIX_TABLE_HEADER = "Language,Pack_Number,Pack_Title,Row_Number,Column_Name,Old_Value,New_Value,Reason"
 
-Latin letters (letter-by-letter):
-✓ ATM机 → A T M jī (each letter separate)
-✗ ATM机 → ATM jī (letters grouped - wrong!)
+CHUNK_TEMPLATE = """╔══════════════════════════════════════════════════════════════════╗
+║  🎯 {lang_upper} ACT {act_num}: {act_name} - REVIEW CHUNK {chunk_num} of {chunk_count}
+║  {pack_count} packs, {row_count} rows (~{tokens} tokens of data)
+╚══════════════════════════════════════════════════════════════════╝
+
+Review ONLY the packs listed below. Other chunks of this act are being
+reviewed in parallel - do not touch any other pack.
+
+Column 0 ({language}) is SACRED - never touch it.
+Your job: ensure the other columns have the MOST COMMON, NATURAL translation
+for the pack's theme. Python checks find 5% of issues. YOU find the other 95%.
+
+=== PACKS IN THIS CHUNK (theme = Pack_Title) ===
+
+{pack_list}
+
+{validation_step}
+
+=== STEP 1: REVIEW ===
+
+For EACH pack above, read {folder}/{prefix}{{N}}.csv (ALL rows) and ask
+for every non-sacred column: is this the word a native speaker would say,
+in THIS pack's theme? No grammar labels, no descriptions.
+
+=== STEP 2: RECORD FIXES IN THIS CHUNK'S FIX TABLE ===
+
+Create {folder}/{fix_table} with exactly this header:
+
+{fix_header}
+
+One row per fix. Row_Number: header = row 1, data starts at row 2.
+Old_Value must match the CSV exactly.
+
+{critical_rules}
+
+=== STEP 3: APPLY (MANDATORY!) ===
+
+python PythonHelpers/apply_fixes_by_act.py {language} {act_num} --chunk {chunk_num}
+
+If errors occur, fix the fix table and rerun until SUCCESS.
+
+=== STEP 4: VALIDATE ===
+
+python PythonHelpers/validate_pinyin.py {language} --packs {packs}
+
+Expected: 0 errors
+
+=== STEP 5: COMMIT ===
+
+git add {folder}/{fix_table} {pack_files}
+git commit -m "Act {act_num} chunk {chunk_num}/{chunk_count}: Review and fix translations for packs {pack_numbers}"
+
+{pinyin_reference}
 """
 
+
+def estimate_tokens(text):
+    """
+    Rough token estimate: ~4 ASCII characters per token, and one token per
+    non-ASCII character (CJK, Thai, Khmer and accented letters tokenize poorly).
+    """
+    ascii_chars = sum(1 for c in text if ord(c) < 128)
+    return (ascii_chars + 3) // 4 + (len(text) - ascii_chars)
+
+
+def pack_sizes(language, start, end):
+    """
+    Estimate the review size of every pack in a range.
+
+    Returns:
+        list: [(pack_num, title, row_count, tokens), ...]
+    """
+    lang_cap = language.capitalize()
+    overview = load_overview(language)
+    sizes = []
+    for pack_num in range(start, end + 1):
+        path = os.path.join(BASE_DIR, f"{lang_cap}Words", f"{lang_cap}Words{pack_num}.csv")
+        if not os.path.exists(path):
+            continue
+        with open(path, 'r', encoding='utf-8') as f:
+            text = f.read()
+        row_count = sum(1 for _ in csv.reader(text.splitlines())) - 1
+        title = overview.get(pack_num, {}).get('title', '')
+        sizes.append((pack_num, title, row_count, estimate_tokens(text) + estimate_tokens(title)))
+    return sizes
+
+
+def bin_pack(sizes, budget):
+    """
+    First-fit decreasing: place each pack (largest first) into the first chunk
+    with room. A pack larger than the budget gets a chunk of its own.
+
+    Returns:
+        list: chunks, each a list of size tuples sorted by pack number
+    """
+    chunks = []
+    for size in sorted(sizes, key=lambda s: -s[3]):
+        for chunk in chunks:
+            if chunk['tokens'] + size[3] <= budget:
+                chunk['packs'].append(size)
+                chunk['tokens'] += size[3]
+                break
+        else:
+            chunks.append({'packs': [size], 'tokens': size[3]})
+
+    # Stable, readable order: chunks by their first pack, packs ascending
+    ordered = [sorted(chunk['packs']) for chunk in chunks]
+    return sorted(ordered, key=lambda packs: packs[0][0])
+
+
+def pack_spec(numbers):
+    """[61, 62, 63, 64, 70] -> '61-64,70' (validate_pinyin.py --packs)"""
+    runs = []
+    for n in sorted(numbers):
+        if runs and n == runs[-1][1] + 1:
+            runs[-1][1] = n
+        else:
+            runs.append([n, n])
+    return ','.join(str(a) if a == b else f"{a}-{b}" for a, b in runs)
+
+
+def render_chunk(language, act_num, chunk_num, chunk_count, packs):
+    """
+    Fill CHUNK_TEMPLATE for one chunk.
+
+    Returns:
+        tuple: (fix_table_name, prompt_text)
+    """
+    act_info = ACT_INFO[language][act_num]
+    lang_cap = language.capitalize()
+    folder = f"{lang_cap}Words"
+    fix_table = f"{lang_cap}FixTableAct{act_num}Chunk{chunk_num}.csv"
+    pack_list = '\n'.join(f"  Pack {n:3d}: {title} ({rows} rows)" for n, title, rows, _ in packs)
+    pack_files = [f"{folder}/{lang_cap}Words{n}.csv" for n, _, _, _ in packs]
+    packs_arg = pack_spec(n for n, _, _, _ in packs)
+    prompt = CHUNK_TEMPLATE.format(
+        language=language,
+        lang_upper=language.upper(),
+        act_num=act_num,
+        act_name=act_info['name'],
+        chunk_num=chunk_num,
+        chunk_count=chunk_count,
+        pack_count=len(packs),
+        row_count=sum(rows for _, _, rows, _ in packs),
+        tokens=sum(tokens for _, _, _, tokens in packs),
+        pack_list=pack_list,
+        folder=folder,
+        prefix=f"{lang_cap}Words",
+        fix_table=fix_table,
+        fix_header=FIX_TABLE_HEADER,
+        pack_files=' '.join(pack_files),
+        pack_numbers=', '.join(str(n) for n, _, _, _ in packs),
+        packs=packs_arg,
+        validation_step=VALIDATION_STEP.format(language=language, packs=packs_arg, trim_command=f"python PythonHelpers/trim_csv_spaces.py {' '.join(pack_files)}"),
+        critical_rules=CRITICAL_RULES.format(language=language),
+        pinyin_reference=PINYIN_REFERENCE,
+    )
+    return fix_table, prompt
+
+
+def build_chunk_prompts(language, act_num, budget=DEFAULT_CHUNK_BUDGET):
+    """
+    Bin-pack an act so that each chunk's prompt text plus its pack data fits
+    the budget. The fixed prompt text (rendered with no packs) is taken off
+    the budget first; each pack then costs its data plus the lines it adds to
+    the prompt (pack list, file names, validation arguments).
+
+    Returns:
+        list: [(fix_table_name, prompt_text, chunk_packs), ...]
+    """
+    act_info = ACT_INFO[language][act_num]
+    sizes = pack_sizes(language, act_info['start'], act_info['end'])
+
+    # Two-digit chunk numbers keep the estimate on the safe side
+    overhead = estimate_tokens(render_chunk(language, act_num, 99, 99, [])[1])
+    if overhead >= budget:
+        raise ValueError(f"Budget {budget} is smaller than the chunk prompt itself (~{overhead} tokens)")
+
+    # Per-pack cost: data + prompt lines (+1 for the estimate's rounding)
+    costs = []
+    for size in sizes:
+        lines = estimate_tokens(render_chunk(language, act_num, 99, 99, [size])[1]) - overhead
+        costs.append(size[:3] + (size[3] + lines + 1,))
+    chunks = bin_pack(costs, budget - overhead)
+
+    by_number = {size[0]: size for size in sizes}
+    prompts = []
+    for chunk_num, chunk in enumerate(chunks, 1):
+        packs = [by_number[n] for n, _, _, _ in chunk]
+        fix_table, prompt = render_chunk(language, act_num, chunk_num, len(chunks), packs)
+        prompts.append((fix_table, prompt, packs))
+    return prompts
+
+
+def main_chunks(language, act_num, args):
+    budget = DEFAULT_CHUNK_BUDGET
+    output_dir = None
+    rest = iter(args)
+    for arg in rest:
+        if arg == '--budget':
+            budget = int(next(rest))
+        elif arg == '--output-dir':
+            output_dir = next(rest)
+
+    try:
+        prompts = build_chunk_prompts(language, act_num, budget)
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+        for chunk_num, (_, prompt, packs) in enumerate(prompts, 1):
+            path = os.path.join(output_dir, f"prompt-{language}-act{act_num}-chunk{chunk_num}.txt")
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(prompt)
+    else:
+        for _, prompt, _ in prompts:
+            print(prompt)
+            print("=" * 70)
+
+    # Summary goes to stderr so stdout stays a clean prompt stream
+    print(f"{language.upper()} Act {act_num}: {len(prompts)} chunks (budget {budget} tokens)", file=sys.stderr)
+    for chunk_num, (fix_table, prompt, packs) in enumerate(prompts, 1):
+        data = sum(t for _, _, _, t in packs)
+        total = data + estimate_tokens(prompt)
+        print(f"  Chunk {chunk_num}: {len(packs):2d} packs, ~{total:5d} tokens "
+              f"({data} data + {total - data} prompt) -> {fix_table}", file=sys.stderr)
+
+
 def main():
     if len(sys.argv) < 3:
-        print("Usage: python generate_act_prompt.py <language> <act_number>")
+        print("Usage: python generate_act_prompt.py <language> <act_number> [--chunks [--budget N] [--output-dir DIR]]")
         print("Example: python generate_act_prompt.py chinese 1")
         sys.exit(1)
 
@@ -241,6 +505,10 @@ def main():
         print(f"Available acts: {', '.join(map(str, ACT_INFO[language].keys()))}")
         sys.exit(1)
 
+    if '--chunks' in sys.argv:
+        main_chunks(language, act_num, sys.argv[3:])
+        return
+
     act_info = ACT_INFO[language][act_num]
 
     prompt = PROMPT_TEMPLATE.format(
@@ -250,7 +518,14 @@ def main():
         act_name=act_info['name'],
         pack_start=act_info['start'],
         pack_end=act_info['end'],
-        pack_count=act_info['count']
+        pack_count=act_info['count'],
+        validation_step=VALIDATION_STEP.format(
+            language=language,
+            packs=f"{act_info['start']}-{act_info['end']}",
+            trim_command=f"python PythonHelpers/trim_csv_spaces.py {language}",
+        ),
+        critical_rules=CRITICAL_RULES.format(language=language),
+        pinyin_reference=PINYIN_REFERENCE,
     )
 
     print(prompt)
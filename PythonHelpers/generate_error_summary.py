@@ -9,17 +9,23 @@ Creates:
 
 Shows what the AI will see before it starts fixing.
 
+Each breakout CSV is read once per invocation; the pinyin, bracket and
+empty-cell checks all run on the same parsed rows. With no arguments (or
+`all all`) every language and both stages are generated in one run, and the
+runtime per stage is reported.
+
 Usage:
     python PythonHelpers/generate_error_summary.py chinese 3a
     python PythonHelpers/generate_error_summary.py spanish 3b
     python PythonHelpers/generate_error_summary.py english 3a
     python PythonHelpers/generate_error_summary.py all 3a
+    python PythonHelpers/generate_error_summary.py all all
 """
 
 import csv
 import os
 import sys
-import re
+import time
 
 LANGUAGE_CONFIG = {
     'chinese': {
@@ -44,106 +50,91 @@ LANGUAGE_CONFIG = {
 }
 
 
-def check_pinyin_errors(file_path, lang_config):
-    """Check for pinyin spacing errors."""
-    errors = []
+def read_breakout_rows(file_path):
+    """
+    Read one breakout CSV once for all checks.
 
+    Returns:
+        tuple: (rows, error) - rows is None if the file is missing,
+               error is a message if it could not be parsed
+    """
     if not os.path.exists(file_path):
-        return []
+        return None, None
 
     try:
         with open(file_path, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            rows = list(reader)
+            return list(csv.DictReader(f)), None
+    except Exception as e:
+        return None, f"Error reading file: {str(e)}"
 
-        # Find pinyin column index
-        pinyin_col = 'pinyin'
-        chinese_col = lang_config['columns'][0] if 'chinese' in lang_config['columns'] else None
 
-        for i, row in enumerate(rows, start=2):  # Row 2 is first data row
-            pinyin = row.get(pinyin_col, '').strip()
+def check_pinyin_errors(rows, lang_config):
+    """Check for pinyin spacing errors."""
+    errors = []
 
-            # If this language has Chinese column, validate pinyin
-            if chinese_col and chinese_col in row:
-                chinese = row.get(chinese_col, '').strip()
+    # Find pinyin column index
+    pinyin_col = 'pinyin'
+    chinese_col = lang_config['columns'][0] if 'chinese' in lang_config['columns'] else None
 
-                if chinese and pinyin:
-                    # Count Chinese characters (excluding punctuation)
-                    chinese_chars = len([c for c in chinese if '\u4e00' <= c <= '\u9fff'])
-                    # Count pinyin syllables (separated by spaces)
-                    pinyin_syllables = len(pinyin.split())
+    for i, row in enumerate(rows, start=2):  # Row 2 is first data row
+        pinyin = (row.get(pinyin_col) or '').strip()
 
-                    if chinese_chars > 0 and chinese_chars != pinyin_syllables:
-                        errors.append(f"Row {i}: {chinese_chars} chars != {pinyin_syllables} syllables")
+        # If this language has Chinese column, validate pinyin
+        if chinese_col and chinese_col in row:
+            chinese = (row.get(chinese_col) or '').strip()
 
-    except Exception as e:
-        errors.append(f"Error reading file: {str(e)}")
+            if chinese and pinyin:
+                # Count Chinese characters (excluding punctuation)
+                chinese_chars = len([c for c in chinese if '\u4e00' <= c <= '\u9fff'])
+                # Count pinyin syllables (separated by spaces)
+                pinyin_syllables = len(pinyin.split())
+
+                if chinese_chars > 0 and chinese_chars != pinyin_syllables:
+                    errors.append(f"Row {i}: {chinese_chars} chars != {pinyin_syllables} syllables")
 
     return errors
 
 
-def check_bracket_errors(file_path):
+def check_bracket_errors(rows):
     """Check for translation failures (brackets)."""
     errors = []
 
-    if not os.path.exists(file_path):
-        return []
-
-    try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            rows = list(reader)
-
-        for i, row in enumerate(rows, start=2):
-            for col_name, value in row.items():
-                if value and ('[' in value or ']' in value):
-                    errors.append(f"Row {i} {col_name}: has brackets")
-
-    except Exception as e:
-        errors.append(f"Error reading file: {str(e)}")
+    for i, row in enumerate(rows, start=2):
+        for col_name, value in row.items():
+            if value and ('[' in value or ']' in value):
+                errors.append(f"Row {i} {col_name}: has brackets")
 
     return errors
 
 
-def check_empty_cells(file_path):
+def check_empty_cells(rows):
     """Check for empty translation cells."""
     errors = []
 
-    if not os.path.exists(file_path):
-        return []
-
-    try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            rows = list(reader)
-
-        for i, row in enumerate(rows, start=2):
-            for col_name, value in row.items():
-                if not value or not value.strip():
-                    errors.append(f"Row {i} {col_name}: empty")
-
-    except Exception as e:
-        errors.append(f"Error reading file: {str(e)}")
+    for i, row in enumerate(rows, start=2):
+        for col_name, value in row.items():
+            if not value or not value.strip():
+                errors.append(f"Row {i} {col_name}: empty")
 
     return errors
 
 
-def generate_error_summary(language, stage):
-    """Generate error summary CSV for a language and stage."""
+def scan_language(language):
+    """
+    Read every breakout CSV of a language ONCE and run all three checks on
+    the same parsed rows.
+
+    Returns:
+        list: summary rows (one per pack), or None if the Overview is missing
+    """
     config = LANGUAGE_CONFIG[language]
     base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-
     overview_path = os.path.join(base_dir, config['overview'])
-    output_path = os.path.join(
-        base_dir,
-        config['folder'],
-        f"{language.capitalize()}ErrorsSummary{stage.upper()}.csv"
-    )
 
     # Read overview to get pack info
     if not os.path.exists(overview_path):
         print(f"❌ Overview not found: {overview_path}")
-        return False
+        return None
 
     with open(overview_path, 'r', encoding='utf-8') as f:
         reader = csv.DictReader(f)
@@ -152,14 +143,8 @@ def generate_error_summary(language, stage):
     # Create error summary rows
     summary_rows = []
 
-    print(f"\n{'='*60}")
-    print(f"GENERATING ERROR SUMMARY: {language.upper()} - Stage {stage.upper()}")
-    print(f"{'='*60}")
-
     for pack_row in overview_rows:
         pack_num = pack_row['Pack_Number']
-        pack_title = pack_row['Pack_Title']
-        difficulty_act = pack_row['Difficulty_Act']
 
         # Path to breakout CSV
         breakout_path = os.path.join(
@@ -168,26 +153,50 @@ def generate_error_summary(language, stage):
             f"{language.capitalize()}Words{pack_num}.csv"
         )
 
-        # Run checks
-        pinyin_errors = check_pinyin_errors(breakout_path, config)
-        bracket_errors = check_bracket_errors(breakout_path)
-        empty_errors = check_empty_cells(breakout_path)
+        # One read, three checks
+        rows, read_error = read_breakout_rows(breakout_path)
+        if read_error:
+            pinyin_errors = bracket_errors = empty_errors = [read_error]
+        elif rows is None:
+            pinyin_errors = bracket_errors = empty_errors = []
+        else:
+            pinyin_errors = check_pinyin_errors(rows, config)
+            bracket_errors = check_bracket_errors(rows)
+            empty_errors = check_empty_cells(rows)
 
         # Count total issues
         total_issues = len(pinyin_errors) + len(bracket_errors) + len(empty_errors)
 
         summary_rows.append({
             'Pack_Number': pack_num,
-            'Pack_Title': pack_title,
-            'Difficulty_Act': difficulty_act,
+            'Pack_Title': pack_row['Pack_Title'],
+            'Difficulty_Act': pack_row['Difficulty_Act'],
             'Total_Issues': total_issues,
             'Pinyin_Errors': '; '.join(pinyin_errors) if pinyin_errors else '',
             'Bracket_Errors': '; '.join(bracket_errors) if bracket_errors else '',
             'Empty_Cells': '; '.join(empty_errors) if empty_errors else ''
         })
 
-        if total_issues > 0:
-            print(f"Pack {pack_num}: {total_issues} issues")
+    return summary_rows
+
+
+def write_error_summary(language, stage, summary_rows):
+    """Write the error summary CSV for a language and stage."""
+    config = LANGUAGE_CONFIG[language]
+    base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    output_path = os.path.join(
+        base_dir,
+        config['folder'],
+        f"{language.capitalize()}ErrorsSummary{stage.upper()}.csv"
+    )
+
+    print(f"\n{'='*60}")
+    print(f"ERROR SUMMARY: {language.upper()} - Stage {stage.upper()}")
+    print(f"{'='*60}")
+
+    for row in summary_rows:
+        if row['Total_Issues'] > 0:
+            print(f"Pack {row['Pack_Number']}: {row['Total_Issues']} issues")
 
     # Write summary CSV
     fieldnames = ['Pack_Number', 'Pack_Title', 'Difficulty_Act', 'Total_Issues',
@@ -204,34 +213,78 @@ def generate_error_summary(language, stage):
     print(f"   Total packs: {len(summary_rows)}")
     print(f"   Packs with issues: {total_packs_with_issues}")
 
+
+def generate_error_summary(language, stage):
+    """Generate error summary CSV for a language and stage."""
+    summary_rows = scan_language(language)
+    if summary_rows is None:
+        return False
+    write_error_summary(language, stage, summary_rows)
     return True
 
 
+def generate_error_summaries(languages, stages):
+    """
+    Generate every requested (language, stage) summary in one invocation.
+
+    Stage 3A and 3B run the same checks, so each language's breakout CSVs are
+    scanned once and the result is written for every stage.
+
+    Returns:
+        dict: {'scan': {language: seconds}, 'stages': {stage: seconds}}
+    """
+    timings = {'scan': {}, 'stages': {stage: 0.0 for stage in stages}}
+
+    for language in languages:
+        start = time.perf_counter()
+        summary_rows = scan_language(language)
+        timings['scan'][language] = time.perf_counter() - start
+        if summary_rows is None:
+            continue
+
+        for stage in stages:
+            start = time.perf_counter()
+            write_error_summary(language, stage, summary_rows)
+            timings['stages'][stage] += time.perf_counter() - start
+
+    return timings
+
+
 def main():
-    if len(sys.argv) < 3:
-        print("Usage: python generate_error_summary.py [chinese|spanish|english|all] [3a|3b]")
+    args = [a.lower() for a in sys.argv[1:]]
+    language = args[0] if args else 'all'
+    stage = args[1] if len(args) > 1 else 'all'
+
+    if stage not in ['3a', '3b', 'all']:
+        print("Usage: python generate_error_summary.py [chinese|spanish|english|all] [3a|3b|all]")
         print("\nExamples:")
         print("  python PythonHelpers/generate_error_summary.py chinese 3a")
         print("  python PythonHelpers/generate_error_summary.py all 3b")
-        sys.exit(1)
-
-    language = sys.argv[1].lower()
-    stage = sys.argv[2].lower()
-
-    if stage not in ['3a', '3b']:
-        print("Stage must be 3a or 3b")
+        print("  python PythonHelpers/generate_error_summary.py            # all languages, both stages")
         sys.exit(1)
 
     if language == 'all':
-        for lang in ['chinese', 'spanish', 'english']:
-            generate_error_summary(lang, stage)
+        languages = ['chinese', 'spanish', 'english']
     elif language in LANGUAGE_CONFIG:
-        generate_error_summary(language, stage)
+        languages = [language]
     else:
         print(f"Unknown language: {language}")
         print("Use: chinese, spanish, english, or all")
         sys.exit(1)
 
+    stages = ['3a', '3b'] if stage == 'all' else [stage]
+    timings = generate_error_summaries(languages, stages)
+
+    print(f"\n{'='*60}")
+    print("RUNTIME")
+    print(f"{'='*60}")
+    for lang, seconds in timings['scan'].items():
+        print(f"Scan {lang:<8} {seconds * 1000:8.1f} ms")
+    for stage_name, seconds in timings['stages'].items():
+        print(f"Stage {stage_name.upper():<7} {seconds * 1000:8.1f} ms (write)")
+    total = sum(timings['scan'].values()) + sum(timings['stages'].values())
+    print(f"Total        {total * 1000:8.1f} ms")
+
 
 if __name__ == '__main__':
     main()
@@ -0,0 +1,457 @@
+#!/usr/bin/env python3
+"""
+Generate a single static HTML issue report from validator output.
+
+Reads the validator CSVs of every language and splits their packed cells
+into one issue per entry:
+
+    <Lang>ErrorsSummary3A.csv / 3B.csv   Pinyin_Errors, Bracket_Errors, Empty_Cells
+                                         ("Row 5 pinyin: ...; Row 9 english: ...")
+    <Lang>WordsTranslationErrors.csv     Issues (Stage 3A review notes; rows whose
+                                         Issue_Count is 0/empty and whose cell is a
+                                         status such as "None" or "✅ All issues
+                                         fixed" are skipped)
+
+and writes one self-contained HTML file. The issues are embedded as
+dictionary-encoded columns (JSON -> zlib -> base64, inflated in the browser
+with DecompressionStream). Only the rows in view are rendered, and filtering
+by language, stage, act, pack, rule and severity runs over integer columns, so
+the page stays responsive with 100k+ issues.
+
+Other scripts can build a report straight from their own issue lists with
+write_report(issues, path) - see ISSUE_FIELDS.
+
+Usage:
+    python PythonHelpers/generate_issue_report.py [chinese|spanish|english|all] [--output FILE]
+    python PythonHelpers/generate_issue_report.py all --synthetic 100000   # Load test
+
+Default output: IssueReport.html in the repo root.
+"""
+
+import base64
+import csv
+import json
+import os
+import random
+import re
+import sys
+import time
+import zlib
+from datetime import datetime
+
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_OUTPUT = os.path.join(BASE_DIR, 'IssueReport.html')
+
+LANGUAGE_FOLDERS = {
+    'chinese': 'ChineseWords',
+    'spanish': 'SpanishWords',
+    'english': 'EnglishWords',
+}
+
+STAGES = ['3A', '3B']
+
+# Every issue is a dict with these keys
+ISSUE_FIELDS = ('language', 'stage', 'act', 'pack', 'title', 'row', 'column', 'rule', 'severity', 'message')
+
+# ErrorsSummary column -> (rule, severity)
+SUMMARY_RULES = {
+    'Pinyin_Errors': ('pinyin', 'error'),
+    'Bracket_Errors': ('brackets', 'error'),
+    'Empty_Cells': ('empty_cell', 'warning'),
+}
+
+ENTRY_PATTERN = re.compile(r'^Row (\d+)(?: (\w+))?: (.*)$')
+
+# Issues cells that report a state rather than list issues
+STATUS_TEXT = re.compile(r'^(?:None$|No issues\b|✅|Fixed:)', re.IGNORECASE)
+
+# Fields stored as indexes into a per-field dictionary (everything but pack/row)
+DICT_FIELDS = ('language', 'stage', 'act', 'title', 'column', 'rule', 'severity', 'message')
+
+
+# ============================================================
+# COLLECTING ISSUES
+# ============================================================
+
+def split_entries(cell):
+    """Split a packed '; '-joined cell into (row, column, message) entries."""
+    entries = []
+    for part in (cell or '').split('; '):
+        part = part.strip()
+        if not part or part.startswith('...and ') or part.startswith('No issues'):
+            continue
+        match = ENTRY_PATTERN.match(part)
+        if match:
+            entries.append((int(match.group(1)), match.group(2) or '', match.group(3)))
+        else:
+            entries.append((0, '', part))
+    return entries
+
+
+def is_status_text(cell):
+    """True for an empty Issues cell or a status like 'None' / '✅ All issues fixed - ...'."""
+    cell = (cell or '').strip()
+    return not cell or bool(STATUS_TEXT.match(cell))
+
+
+def has_reported_issues(row):
+    """False for a WordsTranslationErrors row with Issue_Count 0/empty and a status cell."""
+    count = (row.get('Issue_Count') or '').strip()
+    return count not in ('', '0') or not is_status_text(row.get('Issues'))
+
+
+def read_csv_rows(path):
+    if not os.path.exists(path):
+        return []
+    with open(path, 'r', encoding='utf-8') as f:
+        return list(csv.DictReader(f))
+
+
+def collect_issues(languages):
+    """Read every validator CSV for the given languages into issue dicts."""
+    issues = []
+    for language in languages:
+        folder = os.path.join(BASE_DIR, LANGUAGE_FOLDERS[language])
+        prefix = language.capitalize()
+
+        for stage in STAGES:
+            for row in read_csv_rows(os.path.join(folder, f"{prefix}ErrorsSummary{stage}.csv")):
+                for column_name, (rule, severity) in SUMMARY_RULES.items():
+                    for row_num, column, message in split_entries(row.get(column_name)):
+                        issues.append({
+                            'language': language, 'stage': stage,
+                            'act': row.get('Difficulty_Act', ''), 'pack': int(row['Pack_Number']),
+                            'title': row.get('Pack_Title', ''), 'row': row_num, 'column': column,
+                            'rule': rule, 'severity': severity, 'message': message,
+                        })
+
+        for row in read_csv_rows(os.path.join(folder, f"{prefix}WordsTranslationErrors.csv")):
+            if not has_reported_issues(row):
+                continue
+            for row_num, column, message in split_entries(row.get('Issues')):
+                issues.append({
+                    'language': language, 'stage': '3A',
+                    'act': row.get('Difficulty_Act', ''), 'pack': int(row['Pack_Number']),
+                    'title': row.get('Pack_Title', ''), 'row': row_num, 'column': column,
+                    'rule': 'translation', 'severity': 'review', 'message': message,
+                })
+    return issues
+
+
+def check_translation_counts(issues, languages):
+    """
+    Problems showing that status text was counted as issues: a translation
+    issue whose message is a status string, or a pack with more entries than
+    its numeric Issue_Count (fewer is fine - cells end in '...and N more').
+
+    Returns:
+        list: messages, empty when every counted entry is a real one
+    """
+    problems = [f"{issue['language']} pack {issue['pack']}: status text counted as an issue: {issue['message'][:60]!r}"
+                for issue in issues if issue['rule'] == 'translation' and is_status_text(issue['message'])]
+    counted = {}
+    for issue in issues:
+        if issue['rule'] == 'translation':
+            key = (issue['language'], issue['pack'])
+            counted[key] = counted.get(key, 0) + 1
+    for language in languages:
+        prefix = language.capitalize()
+        path = os.path.join(BASE_DIR, LANGUAGE_FOLDERS[language], f"{prefix}WordsTranslationErrors.csv")
+        for row in read_csv_rows(path):
+            count = (row.get('Issue_Count') or '').strip()
+            found = counted.get((language, int(row['Pack_Number'])), 0)
+            if count.isdigit() and found > int(count):
+                problems.append(f"{language} pack {row['Pack_Number']}: {found} entries counted, Issue_Count {count}")
+    return problems
+
+
+def synthetic_issues(count, languages):
+    """Random issues for load-testing the page."""
+    rng = random.Random(0)
+    rules = list(SUMMARY_RULES.values()) + [('translation', 'review')]
+    columns = ['chinese', 'pinyin', 'english', 'spanish', 'portuguese']
+    acts = [f"Act {n}" for n in ('I', 'II', 'III', 'IV', 'V')]
+    issues = []
+    for i in range(count):
+        rule, severity = rng.choice(rules)
+        pack = rng.randint(1, 250)
+        issues.append({
+            'language': rng.choice(languages), 'stage': rng.choice(STAGES),
+            'act': acts[(pack - 1) * 5 // 250], 'pack': pack, 'title': f"Pack {pack}",
+            'row': rng.randint(2, 60), 'column': rng.choice(columns),
+            'rule': rule, 'severity': severity, 'message': f"Synthetic issue {i}",
+        })
+    return issues
+
+
+# ============================================================
+# ENCODING
+# ============================================================
+
+def encode_issues(issues):
+    """
+    Dictionary-encode issues into parallel integer columns, then zlib + base64.
+
+    Returns:
+        str: base64 of zlib-compressed JSON {'dicts': {...}, 'cols': {...}, 'count': n}
+    """
+    dicts = {field: [] for field in DICT_FIELDS}
+    lookup = {field: {} for field in DICT_FIELDS}
+    cols = {field: [] for field in ISSUE_FIELDS}
+
+    for issue in issues:
+        for field in ISSUE_FIELDS:
+            value = issue[field]
+            if field in lookup:
+                index = lookup[field].get(value)
+                if index is None:
+                    index = lookup[field][value] = len(dicts[field])
+                    dicts[field].append(value)
+                value = index
+            cols[field].append(value)
+
+    payload = json.dumps({'dicts': dicts, 'cols': cols, 'count': len(issues)},
+                         ensure_ascii=False, separators=(',', ':'))
+    return base64.b64encode(zlib.compress(payload.encode('utf-8'), 9)).decode('ascii')
+
+
+def write_report(issues, output_path=DEFAULT_OUTPUT, title='Translation Issue Report'):
+    """Write the self-contained HTML report. Returns the embedded payload size."""
+    data = encode_issues(issues)
+    generated = datetime.now().strftime('%Y-%m-%d %H:%M')
+    html = (HTML_TEMPLATE
+            .replace('__TITLE__', title)
+            .replace('__GENERATED__', generated)
+            .replace('__DATA__', data))
+    with open(output_path, 'w', encoding='utf-8', newline='\n') as f:
+        f.write(html)
+    return len(data)
+
+
+# ============================================================
+# HTML TEMPLATE
+# ============================================================
+
+HTML_TEMPLATE = r"""<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="UTF-8">
+<meta name="viewport" content="width=device-width, initial-scale=1.0">
+<title>__TITLE__</title>
+<!-- Generated by PythonHelpers/generate_issue_report.py on __GENERATED__ - do not edit by hand -->
+<style>
+  body { font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif; margin: 20px; background: #f5f5f5; }
+  h1 { color: #333; border-bottom: 3px solid #4CAF50; padding-bottom: 10px; margin-top: 0; }
+  .controls { display: flex; flex-wrap: wrap; gap: 12px; align-items: end; margin: 16px 0; padding: 15px;
+              background: white; border-radius: 5px; box-shadow: 0 2px 4px rgba(0,0,0,0.1); }
+  .controls label { display: flex; flex-direction: column; font-size: 12px; color: #666; gap: 4px; }
+  .controls select, .controls input { padding: 6px; font-size: 14px; border: 1px solid #ccc; border-radius: 4px; }
+  .stats { margin: 8px 0; color: #333; font-weight: 600; }
+  .table { background: white; border-radius: 5px; box-shadow: 0 2px 4px rgba(0,0,0,0.1); }
+  .row { display: grid; grid-template-columns: 80px 50px 170px 60px 50px 100px 100px 80px 1fr;
+         height: 28px; line-height: 28px; font-size: 13px; border-bottom: 1px solid #eee; }
+  .row > div { padding: 0 8px; overflow: hidden; white-space: nowrap; text-overflow: ellipsis; }
+  .head { background: #4CAF50; color: white; font-weight: 600; border-radius: 5px 5px 0 0; }
+  .head > div { cursor: pointer; }
+  #viewport { height: 70vh; overflow-y: auto; position: relative; }
+  #spacer { position: relative; }
+  #rows { position: absolute; left: 0; right: 0; top: 0; }
+  .row:nth-child(even) { background: #fafafa; }
+  .sev-error { color: #c62828; font-weight: 600; }
+  .sev-warning { color: #ef6c00; font-weight: 600; }
+  .sev-review { color: #1565c0; font-weight: 600; }
+</style>
+</head>
+<body>
+<h1>__TITLE__</h1>
+<div class="controls">
+  <label>Language <select id="f-language"></select></label>
+  <label>Stage <select id="f-stage"></select></label>
+  <label>Act <select id="f-act"></select></label>
+  <label>Pack <input id="f-pack" type="number" min="1" placeholder="any" style="width:80px"></label>
+  <label>Rule <select id="f-rule"></select></label>
+  <label>Severity <select id="f-severity"></select></label>
+  <label>Search <input id="f-text" type="search" placeholder="message text"></label>
+</div>
+<div class="stats" id="stats">Loading…</div>
+<div class="table">
+  <div class="row head" id="head">
+    <div data-sort="language">Language</div><div data-sort="stage">Stage</div><div data-sort="act">Act</div>
+    <div data-sort="pack">Pack</div><div data-sort="row">Row</div><div data-sort="column">Column</div>
+    <div data-sort="rule">Rule</div><div data-sort="severity">Severity</div><div data-sort="message">Message</div>
+  </div>
+  <div id="viewport"><div id="spacer"><div id="rows"></div></div></div>
+</div>
+<script>
+const DATA = "__DATA__";
+const ROW_HEIGHT = 28;
+const OVERSCAN = 10;
+const FILTERS = ['language', 'stage', 'act', 'rule', 'severity'];
+
+let D = null;          // {dicts, cols, count}
+let view = null;       // Int32Array of issue indexes passing the filters
+let sortField = null;
+let sortDir = 1;
+
+async function decode(b64) {
+  const bytes = Uint8Array.from(atob(b64), c => c.charCodeAt(0));
+  const stream = new Blob([bytes]).stream().pipeThrough(new DecompressionStream('deflate'));
+  return JSON.parse(await new Response(stream).text());
+}
+
+function fillSelect(field) {
+  const select = document.getElementById('f-' + field);
+  const options = D.dicts[field].map((v, i) => [v, i]).sort((a, b) => String(a[0]).localeCompare(String(b[0])));
+  select.innerHTML = '<option value="-1">All</option>' +
+    options.map(([v, i]) => `<option value="${i}">${escapeHtml(v)}</option>`).join('');
+  select.addEventListener('change', applyFilters);
+}
+
+function escapeHtml(s) {
+  return String(s).replace(/[&<>"]/g, c => ({'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;'}[c]));
+}
+
+function applyFilters() {
+  const wanted = FILTERS.map(f => [D.cols[f], parseInt(document.getElementById('f-' + f).value, 10)])
+                        .filter(([, v]) => v >= 0);
+  const pack = parseInt(document.getElementById('f-pack').value, 10);
+  const text = document.getElementById('f-text').value.trim().toLowerCase();
+  // Match against the message dictionary once, not per issue
+  const messageOk = text ? D.dicts.message.map(m => m.toLowerCase().includes(text)) : null;
+
+  const out = new Int32Array(D.count);
+  let n = 0;
+  outer: for (let i = 0; i < D.count; i++) {
+    for (let k = 0; k < wanted.length; k++) if (wanted[k][0][i] !== wanted[k][1]) continue outer;
+    if (pack && D.cols.pack[i] !== pack) continue;
+    if (messageOk && !messageOk[D.cols.message[i]]) continue;
+    out[n++] = i;
+  }
+  view = out.subarray(0, n);
+  if (sortField) sortView();
+  document.getElementById('stats').textContent =
+    `${n.toLocaleString()} of ${D.count.toLocaleString()} issues`;
+  document.getElementById('spacer').style.height = (n * ROW_HEIGHT) + 'px';
+  document.getElementById('viewport').scrollTop = 0;
+  render();
+}
+
+function sortKey(field) {
+  const col = D.cols[field];
+  if (!D.dicts[field]) return i => col[i];
+  // Rank dictionary entries once so sorting compares integers
+  const ranks = new Int32Array(D.dicts[field].length);
+  D.dicts[field].map((v, i) => [v, i]).sort((a, b) => String(a[0]).localeCompare(String(b[0])))
+    .forEach(([, i], r) => { ranks[i] = r; });
+  return i => ranks[col[i]];
+}
+
+function sortView() {
+  const key = sortKey(sortField);
+  const sorted = Array.from(view).sort((a, b) => (key(a) - key(b)) * sortDir || a - b);
+  view = Int32Array.from(sorted);
+}
+
+function render() {
+  const viewport = document.getElementById('viewport');
+  const first = Math.max(0, Math.floor(viewport.scrollTop / ROW_HEIGHT) - OVERSCAN);
+  const last = Math.min(view.length, Math.ceil((viewport.scrollTop + viewport.clientHeight) / ROW_HEIGHT) + OVERSCAN);
+  const c = D.cols, d = D.dicts;
+  let html = '';
+  for (let v = first; v < last; v++) {
+    const i = view[v];
+    const sev = d.severity[c.severity[i]];
+    html += `<div class="row"><div>${escapeHtml(d.language[c.language[i]])}</div><div>${escapeHtml(d.stage[c.stage[i]])}</div>` +
+      `<div title="${escapeHtml(d.act[c.act[i]])}">${escapeHtml(d.act[c.act[i]])}</div>` +
+      `<div title="${escapeHtml(d.title[c.title[i]])}">${c.pack[i]}</div><div>${c.row[i] || ''}</div>` +
+      `<div>${escapeHtml(d.column[c.column[i]])}</div><div>${escapeHtml(d.rule[c.rule[i]])}</div>` +
+      `<div class="sev-${escapeHtml(sev)}">${escapeHtml(sev)}</div>` +
+      `<div title="${escapeHtml(d.message[c.message[i]])}">${escapeHtml(d.message[c.message[i]])}</div></div>`;
+  }
+  const rows = document.getElementById('rows');
+  rows.style.transform = `translateY(${first * ROW_HEIGHT}px)`;
+  rows.innerHTML = html;
+}
+
+async function init() {
+  const start = performance.now();
+  D = await decode(DATA);
+  FILTERS.forEach(fillSelect);
+  document.getElementById('f-pack').addEventListener('input', applyFilters);
+  document.getElementById('f-text').addEventListener('input', applyFilters);
+  let ticking = false;
+  document.getElementById('viewport').addEventListener('scroll', () => {
+    if (!ticking) { ticking = true; requestAnimationFrame(() => { ticking = false; render(); }); }
+  });
+  document.getElementById('head').addEventListener('click', e => {
+    const field = e.target.dataset.sort;
+    if (!field) return;
+    sortDir = sortField === field ? -sortDir : 1;
+    sortField = field;
+    applyFilters();
+  });
+  applyFilters();
+  console.log(`Decoded ${D.count} issues in ${(performance.now() - start).toFixed(0)} ms`);
+}
+
+init();
+</script>
+</body>
+</html>
+"""
+
+
+# ============================================================
+# COMMAND-LINE INTERFACE
+# ============================================================
+
+def main():
+    output_path = DEFAULT_OUTPUT
+    synthetic = 0
+    positional = []
+    rest = iter(sys.argv[1:])
+    for arg in rest:
+        if arg == '--output':
+            output_path = next(rest)
+        elif arg == '--synthetic':
+            synthetic = int(next(rest))
+        else:
+            positional.append(arg.lower())
+
+    lang = positional[0] if positional else 'all'
+    if lang == 'all':
+        languages = list(LANGUAGE_FOLDERS)
+    elif lang in LANGUAGE_FOLDERS:
+        languages = [lang]
+    else:
+        print(f"Unknown language: {lang}")
+        print("Use: chinese, spanish, english, or all")
+        sys.exit(1)
+
+    start = time.time()
+    issues = synthetic_issues(synthetic, languages) if synthetic else collect_issues(languages)
+    if not synthetic:
+        problems = check_translation_counts(issues, languages)
+        if problems:
+            print(f"❌ {len(problems)} translation issue counts look wrong:")
+            for problem in problems[:20]:
+                print(f"  {problem}")
+            sys.exit(1)
+    payload_size = write_report(issues, output_path)
+    elapsed = (time.time() - start) * 1000
+
+    by_rule = {}
+    for issue in issues:
+        by_rule[issue['rule']] = by_rule.get(issue['rule'], 0) + 1
+
+    print(f"✓ Wrote {output_path}")
+    print(f"  Issues: {len(issues)}")
+    for rule, count in sorted(by_rule.items()):
+        print(f"    {rule:<12} {count:6d}")
+    print(f"  Embedded data: {payload_size:,} bytes (file {os.path.getsize(output_path):,} bytes)")
+    print(f"  Time: {elapsed:.0f} ms")
+
+
+if __name__ == '__main__':
+    main()
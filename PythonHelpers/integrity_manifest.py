@@ -0,0 +1,285 @@
+#!/usr/bin/env python3
+"""
+Merkle-style integrity manifest for Overview <-> breakout consistency.
+
+verify_words_integrity.py, verify_csv_matches_overview.py, verify_word_counts.py
+and construct_breakout_csvs.py `check` mode all compare every Combined_Words
+list against every breakout CSV's first column on every run. This script keeps
+a hierarchical hash manifest instead:
+
+    root
+     └─ language   (hash of its acts)
+         └─ act    (hash of its packs)
+             └─ pack   overview hash  = hash(Combined_Words array)
+                       breakout hash  = hash(breakout source column)
+
+Both leaf hashes are computed over the same word-list encoding, so a pack is
+consistent exactly when its two hashes are equal. A breakout file is only
+re-read when its mtime/size changed since the manifest was written, and the
+Overview arrays come from the overview_arrays sidecar. The check then compares
+the new tree with the stored one and descends only into subtrees whose hash
+differs - the common "nothing changed" case is a stat() per file.
+
+Usage:
+    python PythonHelpers/integrity_manifest.py [chinese|spanish|english|all] [--full]
+
+Options:
+    --full    Ignore stored file signatures and re-hash every breakout CSV
+"""
+
+import csv
+import hashlib
+import json
+import os
+import sys
+import time
+
+from overview_arrays import BASE_DIR, load_overview
+
+
+MANIFEST_PATH = os.path.join(BASE_DIR, '.integrity_manifest.json')
+MANIFEST_VERSION = 1
+
+LANGUAGES = {
+    'chinese': {'base_dir': 'ChineseWords', 'breakout_prefix': 'ChineseWords'},
+    'spanish': {'base_dir': 'SpanishWords', 'breakout_prefix': 'SpanishWords'},
+    'english': {'base_dir': 'EnglishWords', 'breakout_prefix': 'EnglishWords'},
+}
+
+MISSING = 'missing'
+
+
+# ============================================================
+# HASHING
+# ============================================================
+
+def hash_words(words):
+    """Hash a word list. Words never contain newlines, so '\\n' is a safe joiner."""
+    return hashlib.sha1('\n'.join(words).encode('utf-8')).hexdigest()
+
+
+def hash_children(children):
+    """Hash a {name: node} mapping in a stable order."""
+    digest = hashlib.sha1()
+    for name in sorted(children, key=str):
+        digest.update(f"{name}={children[name]['hash']};".encode('utf-8'))
+    return digest.hexdigest()
+
+
+def read_breakout_words(breakout_path):
+    """Return the breakout source column (first column), same rules as verify_words_integrity."""
+    words = []
+    with open(breakout_path, 'r', encoding='utf-8') as f:
+        reader = csv.reader(f)
+        next(reader, None)  # Skip header
+        for row in reader:
+            if row and row[0].strip():
+                words.append(row[0].strip())
+    return words
+
+
+# ============================================================
+# MANIFEST BUILDING
+# ============================================================
+
+def build_language_tree(language, old_tree, full=False):
+    """
+    Build the act -> pack tree for one language.
+
+    Returns:
+        tuple: (tree, files_read)
+    """
+    config = LANGUAGES[language]
+    old_packs = {}
+    for act in (old_tree or {}).get('acts', {}).values():
+        old_packs.update(act['packs'])
+
+    acts = {}
+    files_read = 0
+
+    for pack_num, pack in sorted(load_overview(language).items()):
+        breakout_path = os.path.join(BASE_DIR, config['base_dir'], f"{config['breakout_prefix']}{pack_num}.csv")
+        overview_hash = hash_words(pack['combined'])
+
+        if os.path.exists(breakout_path):
+            stat = os.stat(breakout_path)
+            signature = [stat.st_mtime_ns, stat.st_size]
+            old_leaf = old_packs.get(str(pack_num))
+            if not full and old_leaf and old_leaf['signature'] == signature:
+                breakout_hash = old_leaf['breakout']
+            else:
+                breakout_hash = hash_words(read_breakout_words(breakout_path))
+                files_read += 1
+        else:
+            signature = None
+            breakout_hash = MISSING
+
+        leaf = {
+            'title': pack['title'],
+            'overview': overview_hash,
+            'breakout': breakout_hash,
+            'signature': signature,
+            'ok': overview_hash == breakout_hash,
+            'hash': hashlib.sha1(f"{overview_hash}:{breakout_hash}".encode('utf-8')).hexdigest(),
+        }
+        act_name = pack['act'] or 'Unknown Act'
+        acts.setdefault(act_name, {'packs': {}})['packs'][str(pack_num)] = leaf
+
+    for act in acts.values():
+        act['hash'] = hash_children(act['packs'])
+
+    return {'acts': acts, 'hash': hash_children(acts)}, files_read
+
+
+def read_manifest():
+    if not os.path.exists(MANIFEST_PATH):
+        return {}
+    try:
+        with open(MANIFEST_PATH, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if manifest.get('version') != MANIFEST_VERSION:
+        return {}
+    return manifest
+
+
+def write_manifest(manifest):
+    tmp_path = MANIFEST_PATH + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, separators=(',', ':'))
+    os.replace(tmp_path, MANIFEST_PATH)
+
+
+# ============================================================
+# DIFFING
+# ============================================================
+
+def changed_packs(new_tree, old_tree):
+    """
+    Walk the new tree top-down, descending only where hashes differ.
+
+    Returns:
+        list: [(act_name, pack_num, leaf), ...] for every changed or new pack
+    """
+    if old_tree and old_tree.get('hash') == new_tree['hash']:
+        return []
+
+    old_acts = (old_tree or {}).get('acts', {})
+    changed = []
+    for act_name, act in new_tree['acts'].items():
+        old_act = old_acts.get(act_name)
+        if old_act and old_act['hash'] == act['hash']:
+            continue
+        old_leaves = (old_act or {}).get('packs', {})
+        for pack_num, leaf in act['packs'].items():
+            old_leaf = old_leaves.get(pack_num)
+            if not old_leaf or old_leaf['hash'] != leaf['hash']:
+                changed.append((act_name, pack_num, leaf))
+    return changed
+
+
+def explain_mismatch(language, pack_num, leaf):
+    """Full word-by-word comparison for one pack (only run for inconsistent packs)."""
+    config = LANGUAGES[language]
+    if leaf['breakout'] == MISSING:
+        return [f"File {config['breakout_prefix']}{pack_num}.csv NOT FOUND!"]
+
+    overview_words = load_overview(language)[int(pack_num)]['combined']
+    breakout_path = os.path.join(BASE_DIR, config['base_dir'], f"{config['breakout_prefix']}{pack_num}.csv")
+    breakout_words = read_breakout_words(breakout_path)
+
+    if len(overview_words) != len(breakout_words):
+        return [f"COUNT MISMATCH! Overview has {len(overview_words)} words, breakout has {len(breakout_words)} words"]
+
+    details = [f"Row {i+1}: Overview='{ov}' vs Breakout='{br}'"
+               for i, (ov, br) in enumerate(zip(overview_words, breakout_words)) if ov != br]
+    if len(details) > 5:
+        details = details[:5] + [f"... and {len(details) - 5} more mismatches"]
+    return details
+
+
+# ============================================================
+# MAIN CHECK
+# ============================================================
+
+def check(languages, full=False):
+    """Incrementally check languages against the stored manifest. Returns failing pack count."""
+    start = time.time()
+    old_manifest = read_manifest()
+    old_languages = old_manifest.get('languages', {})
+
+    new_languages = dict(old_languages)
+    total_read = 0
+    failing = 0
+
+    for language in languages:
+        tree, files_read = build_language_tree(language, old_languages.get(language), full)
+        total_read += files_read
+        new_languages[language] = tree
+
+        packs = [(a, n, leaf) for a, act in tree['acts'].items() for n, leaf in act['packs'].items()]
+        bad = [(a, n, leaf) for a, n, leaf in packs if not leaf['ok']]
+        failing += len(bad)
+        changed = changed_packs(tree, old_languages.get(language))
+
+        print(f"\n{'='*70}")
+        print(f"{language.upper()}: {len(packs)} packs, {files_read} breakout files re-read")
+        print(f"{'='*70}")
+
+        if language in old_languages and not changed:
+            print("✓ Unchanged since last check (root hash matches)")
+        elif language not in old_languages:
+            print("Manifest built for the first time")
+        else:
+            changed_acts = sorted({a for a, _, _ in changed})
+            print(f"Changed subtrees: {', '.join(changed_acts)}")
+            for act_name, pack_num, leaf in changed:
+                status = "✓ consistent" if leaf['ok'] else "✗ MISMATCH"
+                print(f"  Pack {int(pack_num):3d} ({leaf['title'][:30]}): changed, {status}")
+
+        for act_name, pack_num, leaf in bad:
+            print(f"\n✗ Pack {pack_num} ({leaf['title']}) [{act_name}]")
+            for detail in explain_mismatch(language, pack_num, leaf):
+                print(f"    {detail}")
+
+        if not bad:
+            print("✓ All packs consistent")
+
+    manifest = {
+        'version': MANIFEST_VERSION,
+        'languages': new_languages,
+        'hash': hash_children(new_languages),
+    }
+    write_manifest(manifest)
+
+    elapsed = (time.time() - start) * 1000
+    print(f"\n{'='*70}")
+    print(f"Root hash: {manifest['hash'][:12]} "
+          f"({'unchanged' if manifest['hash'] == old_manifest.get('hash') else 'changed'})")
+    print(f"Breakout files re-read: {total_read}")
+    print(f"Inconsistent packs: {failing}")
+    print(f"Time: {elapsed:.1f} ms")
+    return failing
+
+
+def main():
+    args = [a for a in sys.argv[1:] if not a.startswith('--')]
+    full = '--full' in sys.argv
+    lang = args[0].lower() if args else 'all'
+
+    if lang == 'all':
+        languages = list(LANGUAGES)
+    elif lang in LANGUAGES:
+        languages = [lang]
+    else:
+        print(f"Unknown language: {lang}")
+        print("Use: chinese, spanish, english, or all")
+        sys.exit(1)
+
+    failing = check(languages, full)
+    sys.exit(1 if failing else 0)
+
+
+if __name__ == '__main__':
+    main()
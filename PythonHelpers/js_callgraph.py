@@ -0,0 +1,800 @@
+#!/usr/bin/env python3
+"""
+Single-pass JavaScript tokenizer and top-level call graph.
+
+Splits a script into its top-level items (function declarations, const/let/var
+declarations, window exports, other statements) in one pass over the source,
+skipping comments, strings, template literals and regex literals correctly,
+and records which top-level names each item references. Several files (for
+example wordpack-logic.js, game-sounds.js and a game's own script, which all
+share the page's global scope) are linked into one graph so reachability,
+callers/callees and cross-file references can be answered directly.
+
+This is deliberately not a full JS parser: references are identifier tokens
+not used as a property name (`obj.name`, `{ name: ... }`), with `window.name`
+counted as a reference to the global `name`. Parameters and nested
+declarations (destructuring included) are local within their enclosing block
+and are not references; `var` is scoped like `let`, so a name used after its
+block still counts as a reference, which can only keep extra code.
+
+The top level of a `type="module"` script is private: its names are only
+visible to other scripts when it publishes them on window.
+
+Used by build_mode_bundles.py (tree shaking) and extract_functions_to_csv.py
+(function catalogs).
+
+Usage (as a library):
+    from js_callgraph import CallGraph, load_page_sources
+
+    graph = CallGraph(load_page_sources('FlashcardTypingGame/FlashcardTypingGame.html'))
+    graph.reachable(['createDeckFromPack'])       # {'createDeckFromPack', 'combineAndShuffleWords', ...}
+    graph.callers('shuffleArray')                 # ['combineAndShuffleWords']
+
+Usage (CLI):
+    python PythonHelpers/js_callgraph.py <file.js|page.html> [...]   # Print items and edges
+"""
+
+import os
+import re
+import sys
+from collections import namedtuple
+
+
+Token = namedtuple('Token', 'kind value start end nl')
+
+KEYWORDS = {
+    'break', 'case', 'catch', 'class', 'const', 'continue', 'debugger', 'default', 'delete', 'do',
+    'else', 'export', 'extends', 'finally', 'for', 'function', 'if', 'import', 'in', 'instanceof',
+    'let', 'new', 'return', 'super', 'switch', 'this', 'throw', 'try', 'typeof', 'var', 'void',
+    'while', 'with', 'yield', 'async', 'await', 'of', 'null', 'true', 'false', 'undefined',
+}
+
+# After these a '/' starts a regex literal, not a division
+REGEX_AFTER_WORDS = {'return', 'typeof', 'case', 'do', 'else', 'in', 'of', 'new', 'delete', 'void',
+                     'throw', 'instanceof', 'yield', 'await'}
+
+PUNCTUATORS = sorted([
+    '>>>=', '...', '===', '!==', '**=', '<<=', '>>=', '>>>', '&&=', '||=', '??=',
+    '=>', '==', '!=', '<=', '>=', '&&', '||', '??', '?.', '++', '--', '+=', '-=', '*=', '/=',
+    '%=', '&=', '|=', '^=', '<<', '>>', '**',
+], key=len, reverse=True)
+
+# A statement cannot continue onto a new line that starts with one of these values
+# only after a token of this kind (used for automatic semicolon insertion)
+ASI_END_KINDS = {'name', 'num', 'string', 'template', 'regex'}
+ASI_END_PUNCT = {')', ']', '}', '++', '--'}
+CONTINUATION_WORDS = {'else', 'catch', 'finally', 'in', 'of', 'instanceof'}
+
+BLOCK_STATEMENTS = {'function', 'async', 'class', 'if', 'for', 'while', 'try', 'switch', 'do'}
+
+
+class JSSyntaxError(ValueError):
+    """Raised for unterminated strings, comments, templates or regexes."""
+
+
+# ============================================================
+# TOKENIZER
+# ============================================================
+
+def _is_ident_start(char):
+    return char.isalpha() or char in '_$'
+
+
+def _is_ident_part(char):
+    return char.isalnum() or char in '_$'
+
+
+def _regex_allowed(previous):
+    if previous is None:
+        return True
+    if previous.kind == 'name':
+        return previous.value in REGEX_AFTER_WORDS
+    if previous.kind == 'punct':
+        return previous.value not in (')', ']', '}', '++', '--')
+    return False
+
+
+def tokenize(source):
+    """
+    Tokenize JavaScript source in one pass.
+
+    Comments are dropped. Strings, template text and regex literals become
+    single tokens; `${...}` expressions inside templates are tokenized
+    normally, so calls inside them are seen.
+
+    Returns:
+        list: [Token(kind, value, start, end, nl), ...]
+              kind is name, num, string, template, regex or punct;
+              nl is True when a line break precedes the token
+    """
+    tokens = []
+    braces = []          # '{' for blocks/objects, '`' for an open template expression
+    i = 0
+    n = len(source)
+    newline = False
+    previous = None
+
+    def scan_template(pos):
+        """Scan template text from pos (just after ` or }) to the next ` or ${."""
+        j = pos
+        while j < n:
+            char = source[j]
+            if char == '\\':
+                j += 2
+            elif char == '`':
+                return j + 1, False
+            elif char == '$' and j + 1 < n and source[j + 1] == '{':
+                return j + 2, True
+            else:
+                j += 1
+        raise JSSyntaxError(f"Unterminated template literal at offset {pos}")
+
+    while i < n:
+        char = source[i]
+
+        if char in ' \t\r\v\f\ufeff\xa0':
+            i += 1
+            continue
+        if char in '\n\u2028\u2029':
+            newline = True
+            i += 1
+            continue
+
+        start = i
+
+        if char == '/' and i + 1 < n and source[i + 1] == '/':
+            end = source.find('\n', i)
+            i = n if end < 0 else end
+            continue
+        if char == '/' and i + 1 < n and source[i + 1] == '*':
+            end = source.find('*/', i + 2)
+            if end < 0:
+                raise JSSyntaxError(f"Unterminated comment at offset {i}")
+            if '\n' in source[i:end]:
+                newline = True
+            i = end + 2
+            continue
+
+        if char in '\'"':
+            j = i + 1
+            while j < n and source[j] != char:
+                if source[j] == '\\':
+                    j += 1
+                elif source[j] == '\n':
+                    raise JSSyntaxError(f"Unterminated string at offset {i}")
+                j += 1
+            if j >= n:
+                raise JSSyntaxError(f"Unterminated string at offset {i}")
+            i = j + 1
+            kind = 'string'
+
+        elif char == '`' or (char == '}' and braces and braces[-1] == '`'):
+            if char == '}':
+                braces.pop()
+            i, opened = scan_template(i + 1)
+            if opened:
+                braces.append('`')
+            kind = 'template'
+
+        elif _is_ident_start(char):
+            j = i + 1
+            while j < n and _is_ident_part(source[j]):
+                j += 1
+            i = j
+            kind = 'name'
+
+        elif char.isdigit() or (char == '.' and i + 1 < n and source[i + 1].isdigit()):
+            j = i + 1
+            while j < n and (_is_ident_part(source[j]) or source[j] == '.'
+                             or (source[j] in '+-' and source[j - 1] in 'eE' and not source[start:j].lower().startswith('0x'))):
+                j += 1
+            i = j
+            kind = 'num'
+
+        elif char == '/' and _regex_allowed(previous):
+            j = i + 1
+            in_class = False
+            while j < n:
+                if source[j] == '\\':
+                    j += 2
+                    continue
+                if source[j] == '\n':
+                    raise JSSyntaxError(f"Unterminated regex at offset {i}")
+                if source[j] == '[':
+                    in_class = True
+                elif source[j] == ']':
+                    in_class = False
+                elif source[j] == '/' and not in_class:
+                    break
+                j += 1
+            j += 1
+            while j < n and _is_ident_part(source[j]):
+                j += 1
+            i = j
+            kind = 'regex'
+
+        else:
+            for punct in PUNCTUATORS:
+                if source.startswith(punct, i):
+                    # `a?.5:b` is a ternary, not optional chaining
+                    if punct == '?.' and i + 2 < n and source[i + 2].isdigit():
+                        continue
+                    i += len(punct)
+                    break
+            else:
+                i += 1
+            kind = 'punct'
+            if char == '{':
+                braces.append('{')
+            elif char == '}' and braces:
+                braces.pop()
+
+        token = Token(kind, source[start:i], start, i, newline)
+        tokens.append(token)
+        previous = token
+        newline = False
+
+    return tokens
+
+
+# ============================================================
+# TOP-LEVEL ITEMS
+# ============================================================
+
+class Item:
+    """One top-level statement of a script."""
+
+    def __init__(self, source_label, kind, names, start, end, line, text, refs, exports=()):
+        self.source = source_label
+        self.kind = kind          # function, class, variable, pure-variable, export, cjs-export, statement
+        self.names = names        # top-level names it defines
+        self.start = start        # character offsets in the script
+        self.end = end
+        self.line = line
+        self.text = text
+        self.refs = refs          # identifiers it references (set)
+        self.exports = list(exports)  # names published on window (export items)
+
+    @property
+    def name(self):
+        return self.names[0] if self.names else None
+
+    @property
+    def size(self):
+        """Size in UTF-8 bytes."""
+        return len(self.text.encode('utf-8'))
+
+    def __repr__(self):
+        return f"<Item {self.kind} {self.names or ''} {self.source}:{self.line}>"
+
+
+def _statement_end(tokens, i):
+    """Index of the last token of the statement starting at tokens[i]."""
+    n = len(tokens)
+    depth = 0
+    first = tokens[i].value
+    j = i
+    while j < n:
+        token = tokens[j]
+        if token.kind == 'punct':
+            if token.value in ('(', '[', '{'):
+                depth += 1
+            elif token.value in (')', ']', '}'):
+                depth -= 1
+        if depth <= 0:
+            following = tokens[j + 1] if j + 1 < n else None
+            if token.value == ';' and token.kind == 'punct':
+                return j
+            if following is None:
+                return j
+            if (token.value == '}' and token.kind == 'punct' and first in BLOCK_STATEMENTS
+                    and following.value not in ('else', 'catch', 'finally')
+                    and not (first == 'do' and following.value == 'while')):
+                return j
+            if following.nl and (token.kind in ASI_END_KINDS or token.value in ASI_END_PUNCT):
+                if token.kind == 'name' and token.value in KEYWORDS - {'this', 'null', 'true', 'false', 'undefined', 'super'}:
+                    pass
+                elif following.kind in ('name', 'num', 'string', 'template') and following.value not in CONTINUATION_WORDS:
+                    return j
+        j += 1
+    return n - 1
+
+
+def _bracket_pairs(tokens):
+    """{index of an opening bracket: index of its closing bracket} for a token run."""
+    pairs = {}
+    stack = []
+    for k, token in enumerate(tokens):
+        if token.kind != 'punct':
+            continue
+        if token.value in ('(', '[', '{'):
+            stack.append(k)
+        elif token.value in (')', ']', '}') and stack:
+            pairs[stack.pop()] = k
+    return pairs
+
+
+def _pattern_names(tokens, k, pairs):
+    """
+    [(name, index), ...] bound by the binding pattern starting at tokens[k]:
+    a name, or an object/array destructuring pattern (defaults skipped).
+    """
+    token = tokens[k] if k < len(tokens) else None
+    if token is None:
+        return []
+    if token.kind == 'name' and token.value not in KEYWORDS:
+        return [(token.value, k)]
+    if token.kind != 'punct' or token.value not in ('{', '[', '(') or k not in pairs:
+        return []
+    names = []
+    for start, end in _elements(tokens, k, pairs):
+        if start >= end:
+            continue  # array hole
+        if tokens[start].value == '...':
+            names.extend(_pattern_names(tokens, start + 1, pairs))
+            continue
+        if token.value == '{':
+            colon = _depth_zero(tokens, start, end, ':', pairs)
+            if colon is not None:
+                names.extend(_pattern_names(tokens, colon + 1, pairs))
+                continue
+        names.extend(_pattern_names(tokens, start, pairs))
+    return names
+
+
+def _elements(tokens, k, pairs):
+    """[(start, end), ...] token ranges of the comma-separated elements inside the bracket at tokens[k]."""
+    elements = []
+    start = k + 1
+    j = k + 1
+    close = pairs[k]
+    while j < close:
+        if j in pairs:
+            j = pairs[j] + 1
+            continue
+        if tokens[j].kind == 'punct' and tokens[j].value == ',':
+            elements.append((start, j))
+            start = j + 1
+        j += 1
+    elements.append((start, close))
+    return elements
+
+
+def _depth_zero(tokens, start, end, value, pairs):
+    """Index of the first `value` punctuator in tokens[start:end] outside nested brackets, or None."""
+    j = start
+    while j < end:
+        if j in pairs:
+            j = pairs[j] + 1
+            continue
+        if tokens[j].kind == 'punct' and tokens[j].value == value:
+            return j
+        j += 1
+    return None
+
+
+def _expression_end(tokens, k, pairs):
+    """Index of the last token of the expression starting at tokens[k] (an arrow body or initializer)."""
+    j = k
+    while j < len(tokens):
+        if j in pairs:
+            j = pairs[j] + 1
+            continue
+        token = tokens[j]
+        if token.kind == 'punct' and token.value in (',', ';', ')', ']', '}'):
+            return j - 1
+        if (j > k and token.nl and token.kind == 'name' and token.value not in CONTINUATION_WORDS
+                and (tokens[j - 1].kind in ASI_END_KINDS or tokens[j - 1].value in ASI_END_PUNCT)):
+            return j - 1
+        j += 1
+    return len(tokens) - 1
+
+
+def _local_bindings(tokens):
+    """
+    [(name, first, last), ...]: names bound inside a token run and the token
+    range they are visible in - function and arrow parameters, catch
+    parameters, and nested function/class/const/let/var declarations
+    (destructuring included), scoped to their enclosing block.
+    """
+    pairs = _bracket_pairs(tokens)
+    openers = {close: open_k for open_k, close in pairs.items()}
+    blocks = []             # open '{' indices, innermost last
+    closes = {}
+    bindings = []
+
+    def block_range(k):
+        for open_k in reversed(blocks):
+            if pairs.get(open_k, -1) >= k:
+                return open_k, pairs[open_k]
+        return 0, len(tokens) - 1
+
+    def body_end(k):
+        """Last token of the statement or block starting at tokens[k]."""
+        if k < len(tokens) and tokens[k].value == '{' and k in pairs:
+            return pairs[k]
+        return _expression_end(tokens, k, pairs) + 1
+
+    for k, token in enumerate(tokens):
+        if token.kind == 'punct' and token.value == '{':
+            blocks.append(k)
+            closes[pairs.get(k)] = k
+        elif token.kind == 'punct' and token.value == '}' and k in closes:
+            blocks.remove(closes.pop(k))
+        if token.kind == 'punct' and token.value == '=>':
+            if tokens[k - 1].value == ')':
+                open_k = openers.get(k - 1)
+                params = _pattern_names(tokens, open_k, pairs) if open_k is not None else []
+            else:
+                open_k, params = k - 1, _pattern_names(tokens, k - 1, pairs)
+            end = body_end(k + 1)
+            bindings.extend((name, open_k, end) for name, _ in params)
+            continue
+        if token.kind != 'name' or (k > 0 and tokens[k - 1].value in ('.', '?.')):
+            continue
+        if token.value in ('function', 'class') and k > 0:
+            j = k + 1
+            if j < len(tokens) and tokens[j].value == '*':
+                j += 1
+            if j < len(tokens) and tokens[j].kind == 'name' and tokens[j].value not in KEYWORDS:
+                first, last = block_range(k)
+                bindings.append((tokens[j].value, first, last))
+                j += 1
+            if token.value == 'function' and j < len(tokens) and tokens[j].value == '(' and j in pairs:
+                end = body_end(pairs[j] + 1)
+                bindings.extend((name, j, end) for name, _ in _pattern_names(tokens, j, pairs))
+        elif token.value == 'function':
+            j = 1
+            while j < len(tokens) and tokens[j].value != '(':
+                j += 1
+            if j in pairs:
+                bindings.extend((name, j, len(tokens) - 1) for name, _ in _pattern_names(tokens, j, pairs))
+        elif token.value == 'catch' and k + 1 < len(tokens) and tokens[k + 1].value == '(' and k + 1 in pairs:
+            end = body_end(pairs[k + 1] + 1)
+            bindings.extend((name, k + 1, end) for name, _ in _pattern_names(tokens, k + 1, pairs))
+        elif (token.value not in KEYWORDS and k + 1 in pairs and tokens[k + 1].value == '('
+              and pairs[k + 1] + 1 < len(tokens) and tokens[pairs[k + 1] + 1].value == '{'):
+            # Method shorthand: name(params) { body }
+            end = pairs.get(pairs[k + 1] + 1, len(tokens) - 1)
+            bindings.extend((name, k + 1, end) for name, _ in _pattern_names(tokens, k + 1, pairs))
+        elif token.value in ('const', 'let', 'var') and k > 0:
+            if tokens[k - 1].value == '(' and k >= 2 and tokens[k - 2].value == 'for':
+                first = k - 1
+                last = body_end(pairs.get(k - 1, k) + 1)
+            else:
+                first, last = block_range(k)
+            bindings.extend((name, first, last) for name, _ in _declarators(tokens, k, pairs))
+    return bindings
+
+
+def _declarators(tokens, k, pairs):
+    """[(name, index), ...] declared by the const/let/var at tokens[k]."""
+    names = []
+    j = k + 1
+    while j < len(tokens):
+        names.extend(_pattern_names(tokens, j, pairs))
+        j = pairs[j] + 1 if j in pairs else j + 1
+        if j < len(tokens) and tokens[j].value == '=':
+            j = _expression_end(tokens, j + 1, pairs) + 1
+        if j < len(tokens) and tokens[j].kind == 'punct' and tokens[j].value == ',':
+            j += 1
+            continue
+        break
+    return names
+
+
+def _references(tokens, own_names=()):
+    """
+    Identifiers referenced by a token run: property names and names bound
+    locally (parameters, nested declarations) where they are in scope are excluded.
+    """
+    local = {}
+    for name, first, last in _local_bindings(tokens):
+        local.setdefault(name, []).append((first, last))
+    refs = set()
+    for k, token in enumerate(tokens):
+        if token.kind != 'name' or token.value in KEYWORDS:
+            continue
+        if any(first <= k <= last for first, last in local.get(token.value, ())):
+            continue
+        before = tokens[k - 1] if k > 0 else None
+        after = tokens[k + 1] if k + 1 < len(tokens) else None
+        if before is not None and before.value in ('.', '?.'):
+            # window.foo / window?.foo read the global foo
+            if not (k >= 2 and tokens[k - 2].value == 'window'):
+                continue
+        if (after is not None and after.value == ':' and before is not None
+                and before.value in ('{', ',')):
+            continue  # { key: value }
+        refs.add(token.value)
+    return refs - set(own_names)
+
+
+def _matching(tokens, k):
+    """Index of the bracket closing tokens[k]."""
+    depth = 0
+    for j in range(k, len(tokens)):
+        if tokens[j].kind != 'punct':
+            continue
+        if tokens[j].value in ('(', '[', '{'):
+            depth += 1
+        elif tokens[j].value in (')', ']', '}'):
+            depth -= 1
+            if depth == 0:
+                return j
+    return len(tokens) - 1
+
+
+def _is_function_value(tokens, k):
+    """True if the expression starting at tokens[k] is a function or arrow function."""
+    if k >= len(tokens):
+        return False
+    if tokens[k].value == 'async':
+        k += 1
+    if k >= len(tokens):
+        return False
+    if tokens[k].value == 'function':
+        return True
+    if tokens[k].kind == 'name':
+        return k + 1 < len(tokens) and tokens[k + 1].value == '=>'
+    if tokens[k].value == '(':
+        close = _matching(tokens, k)
+        return close + 1 < len(tokens) and tokens[close + 1].value == '=>'
+    return False
+
+
+def _has_call(tokens):
+    """True if a token run contains a call or `new` outside nested functions."""
+    k = 0
+    while k < len(tokens):
+        token = tokens[k]
+        if _is_function_value(tokens, k):
+            # Skip the function: its body runs later, not at declaration time
+            while k < len(tokens) and tokens[k].value != '=>' and tokens[k].value != '{':
+                k += 1
+            if k < len(tokens) and tokens[k].value == '=>':
+                k += 1
+            if k < len(tokens) and tokens[k].value == '{':
+                k = _matching(tokens, k) + 1
+            continue
+        if token.value == 'new' and token.kind == 'name':
+            return True
+        if token.value == '(' and token.kind == 'punct' and k > 0:
+            before = tokens[k - 1]
+            if (before.kind == 'name' and before.value not in KEYWORDS) or before.value in (')', ']', '`') \
+                    or before.kind == 'template':
+                return True
+        if token.kind == 'template' and k > 0 and tokens[k - 1].kind == 'name' \
+                and tokens[k - 1].value not in KEYWORDS:
+            return True  # tagged template
+        k += 1
+    return False
+
+
+def _declared_names(tokens):
+    """[(name, index), ...] declared by `const a = ..., {b, c} = ...` (destructuring included)."""
+    return _declarators(tokens, 0, _bracket_pairs(tokens))
+
+
+def classify(tokens, source_label):
+    """Return (kind, names, exports) for one top-level statement's tokens."""
+    values = [t.value for t in tokens]
+
+    if values[:1] == ['function'] or values[:2] == ['async', 'function']:
+        k = values.index('function') + 1
+        if k < len(values) and values[k] == '*':
+            k += 1
+        return 'function', [values[k]] if k < len(values) and tokens[k].kind == 'name' else [], []
+
+    if values[:1] == ['class'] and len(values) > 1:
+        return 'class', [values[1]], []
+
+    if values[:1] in (['const'], ['let'], ['var']):
+        declared = _declared_names(tokens)
+        names = [name for name, _ in declared]
+        if len(declared) == 1:
+            k = declared[0][1]
+            if k + 2 < len(tokens) and values[k + 1] == '=' and _is_function_value(tokens, k + 2):
+                return 'function', names, []
+        return ('variable' if _has_call(tokens) else 'pure-variable'), names, []
+
+    if values[:5] == ['Object', '.', 'assign', '(', 'window']:
+        exported = [t.value for k, t in enumerate(tokens)
+                    if t.kind == 'name' and k > 5 and values[k - 1] in ('{', ',')
+                    and k + 1 < len(values) and values[k + 1] in (',', '}')]
+        return 'export', [], exported
+
+    if (len(values) >= 5 and values[:2] == ['window', '.'] and values[3] == '='
+            and tokens[4].kind == 'name' and values[4] not in KEYWORDS
+            and (len(values) == 5 or values[5] == ';')):
+        return 'export', [], [values[4]]
+
+    if values[:4] == ['if', '(', 'typeof', 'module']:
+        return 'cjs-export', [], []
+
+    return 'statement', [], []
+
+
+def parse_items(source, source_label='<script>'):
+    """
+    Split a script into top-level Items.
+
+    Each item's text runs from its first token to its last (leading comments
+    belong to no item), so dropping items never leaves half a statement.
+    """
+    tokens = tokenize(source)
+    items = []
+    i = 0
+    while i < len(tokens):
+        j = _statement_end(tokens, i)
+        run = tokens[i:j + 1]
+        kind, names, exports = classify(run, source_label)
+        refs = _references(run, names)
+        start, end = run[0].start, run[-1].end
+        line = source.count('\n', 0, start) + 1
+        items.append(Item(source_label, kind, names, start, end, line, source[start:end], refs, exports))
+        i = j + 1
+    return items
+
+
+# ============================================================
+# PAGE SOURCES
+# ============================================================
+
+SCRIPT_TAG = re.compile(r'<script\b([^>]*)>(.*?)</script>', re.DOTALL | re.IGNORECASE)
+SRC_ATTR = re.compile(r'\bsrc\s*=\s*["\']([^"\']+)["\']', re.IGNORECASE)
+MODULE_ATTR = re.compile(r'\btype\s*=\s*["\']module["\']', re.IGNORECASE)
+
+Script = namedtuple('Script', 'label source module')
+
+
+def load_page_sources(html_path):
+    """
+    Return the scripts of an HTML page in execution order as [Script(label, source, module), ...].
+
+    Local src scripts are read from disk (label = path relative to the page),
+    inline scripts are labelled 'inline#N'; module is True for type="module"
+    scripts. Remote (http/https) scripts are skipped.
+    """
+    page_dir = os.path.dirname(os.path.abspath(html_path))
+    with open(html_path, 'r', encoding='utf-8') as f:
+        html = f.read()
+
+    sources = []
+    inline_count = 0
+    for match in SCRIPT_TAG.finditer(html):
+        src = SRC_ATTR.search(match.group(1))
+        module = bool(MODULE_ATTR.search(match.group(1)))
+        if src:
+            url = src.group(1)
+            if re.match(r'^(?:https?:)?//', url):
+                continue
+            with open(os.path.normpath(os.path.join(page_dir, url)), 'r', encoding='utf-8') as f:
+                sources.append(Script(url, f.read(), module))
+        elif match.group(2).strip():
+            inline_count += 1
+            sources.append(Script(f'inline#{inline_count}', match.group(2), module))
+    return sources
+
+
+# ============================================================
+# CALL GRAPH
+# ============================================================
+
+class CallGraph:
+    """
+    Top-level items of several scripts sharing one global scope, linked by name.
+
+    sources: [(label, source), ...] or [(label, source, module), ...] - the
+    top-level names of a module script are only visible to other scripts
+    when the module exports them on window.
+    """
+
+    def __init__(self, sources):
+        self.sources = [source[0] for source in sources]
+        self.modules = {source[0] for source in sources if len(source) > 2 and source[2]}
+        self.items = []
+        self.definitions = {}     # name -> defining Item
+        self.duplicates = []      # (name, first Item, second Item)
+        self.module_exports = {label: set() for label in self.modules}
+        for label, source, *_ in sources:
+            for item in parse_items(source, label):
+                if label in self.modules:
+                    self.module_exports[label].update(item.exports)
+                self.items.append(item)
+                for name in item.names:
+                    if name in self.definitions:
+                        self.duplicates.append((name, self.definitions[name], item))
+                    else:
+                        self.definitions[name] = item
+        self._callers = {}
+        for item in self.items:
+            for name in self.callees(item):
+                self._callers.setdefault(name, []).append(item)
+
+    def callees(self, item_or_name):
+        """Top-level names an item (or the item defining a name) references."""
+        item = self.definitions.get(item_or_name) if isinstance(item_or_name, str) else item_or_name
+        if item is None:
+            return []
+        return sorted(ref for ref in item.refs
+                      if ref in self.definitions and ref not in item.names and self.visible(ref, item))
+
+    def visible(self, name, item):
+        """True if the top-level name is in scope for item (not private to another module script)."""
+        target = self.definitions[name]
+        return (target.source == item.source or target.source not in self.modules
+                or name in self.module_exports[target.source])
+
+    def callers(self, name):
+        """Names (or 'label:line' for anonymous statements) of items referencing `name`."""
+        return [item.name or f"{item.source}:{item.line}" for item in self._callers.get(name, [])]
+
+    def caller_items(self, name):
+        return list(self._callers.get(name, []))
+
+    def roots(self):
+        """Items that run at load time: statements and declarations with side effects."""
+        return [item for item in self.items if item.kind in ('statement', 'variable')]
+
+    def reachable(self, entry_points, include_load_time=True):
+        """
+        Names reachable from the entry points (plus, by default, from every
+        load-time statement). Export lists are not roots.
+        """
+        missing = [name for name in entry_points if name not in self.definitions]
+        if missing:
+            raise KeyError(f"Unknown entry points: {', '.join(missing)}")
+
+        seen = set()
+        stack = list(entry_points)
+        if include_load_time:
+            for item in self.roots():
+                stack.extend(item.names)
+                stack.extend(self.callees(item))
+        while stack:
+            name = stack.pop()
+            if name in seen or name not in self.definitions:
+                continue
+            seen.add(name)
+            stack.extend(self.callees(name))
+        return seen
+
+    def cross_file_refs(self):
+        """[(from_label, from_name, to_label, to_name), ...] for references across scripts."""
+        refs = []
+        for item in self.items:
+            for name in self.callees(item):
+                target = self.definitions[name]
+                if target.source != item.source:
+                    refs.append((item.source, item.name or f"line {item.line}", target.source, name))
+        return refs
+
+
+def main():
+    paths = sys.argv[1:]
+    if not paths:
+        print("Usage: python js_callgraph.py <file.js|page.html> [...]")
+        sys.exit(1)
+
+    sources = []
+    for path in paths:
+        if path.lower().endswith(('.html', '.htm')):
+            sources.extend(load_page_sources(path))
+        else:
+            with open(path, 'r', encoding='utf-8') as f:
+                sources.append(Script(os.path.basename(path), f.read(), False))
+
+    graph = CallGraph(sources)
+    for item in graph.items:
+        label = ', '.join(item.names) or (', '.join(item.exports) if item.exports else '-')
+        print(f"{item.source}:{item.line:<5} {item.kind:<14} {item.size:6d} B  {label[:60]}")
+        callees = graph.callees(item)
+        if callees:
+            print(f"{'':22}-> {', '.join(callees)}")
+    for name, first, second in graph.duplicates:
+        print(f"⚠️  {name} defined twice: {first.source}:{first.line} and {second.source}:{second.line}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,358 @@
+#!/usr/bin/env python3
+"""
+Read and write the per-act word data modules the games load.
+
+Each language folder has two copies of every act:
+
+    <Lang>Words/Jsmodules/act1-foundation.js        clean ES module, one
+                                                    `export const name = {...};`
+                                                    per pack plus __actMeta
+    <Lang>Words/Jsmodules-js/act1-foundation-js.js  production module,
+                                                    export const w="<base64>"
+
+The production payload is the act's JSON (all exports as one object),
+reversed, zlib-compressed and base64-encoded. wordpack-logic.js
+decodeObfuscatedModule() undoes that with atob -> pako.inflate ->
+reverse -> JSON.parse. Its reverse works on UTF-16 code units, so a payload
+may not contain characters outside the Basic Multilingual Plane.
+
+Used by module_payload_report.py and the module post-processing scripts,
+which add build-time fields to the packs of both copies with update_packs().
+The convert_csv_to_js.py scripts write the modules without those fields and
+then call run_build_steps() to add them and rebuild the language catalog.
+
+Usage (as a library):
+    from jsmodules import find_modules, read_module, update_packs
+
+    for module in find_modules('spanish'):
+        data = read_module(module.path)          # {'__actMeta': {...}, 'p1_1_...': {...}}
+
+    update_packs(clean_path, {'p1_1_greetings__goodbyes': {'distractors': '...'}})
+"""
+
+import base64
+import json
+import os
+import re
+import subprocess
+import sys
+import unicodedata
+import zlib
+from collections import namedtuple
+
+from js_callgraph import tokenize
+
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+LANGUAGE_FOLDERS = {
+    'chinese': 'ChineseWords',
+    'spanish': 'SpanishWords',
+    'english': 'EnglishWords',
+}
+
+CLEAN_DIR = 'Jsmodules'
+PRODUCTION_DIR = 'Jsmodules-js'
+
+PAYLOAD = re.compile(r'export\s+const\s+w\s*=\s*"([A-Za-z0-9+/=]*)"')
+ACT_FILE = re.compile(r'^act(\d+)-')
+ACT_META = '__actMeta'
+
+Module = namedtuple('Module', 'language kind act path')
+
+# Passes that add the build-time pack fields and the catalog, in the order
+# that gives the committed field order (accentFree, pinyinUnits, distractors).
+BUILD_STEPS = (
+    'build_answer_keys.py',
+    'build_pinyin_alignment.py',
+    'build_distractors.py',
+    'build_catalog.py',
+)
+
+
+class ModuleFormatError(ValueError):
+    """Raised when a module file is not in the clean or production format."""
+
+
+# ============================================================
+# DISCOVERY
+# ============================================================
+
+def module_act(filename):
+    """Act number from a module filename ('act3-daily-life-js.js' -> 3); 0 for edge-cases."""
+    match = ACT_FILE.match(filename)
+    return int(match.group(1)) if match else 0
+
+
+def find_modules(language, kinds=(PRODUCTION_DIR, CLEAN_DIR), base_dir=BASE_DIR):
+    """
+    Modules of one language, production first, each sorted by act.
+
+    Returns:
+        list: [Module(language, kind, act, path), ...] - kind is 'Jsmodules-js' or 'Jsmodules'
+    """
+    modules = []
+    for kind in kinds:
+        folder = os.path.join(base_dir, LANGUAGE_FOLDERS[language], kind)
+        if not os.path.isdir(folder):
+            continue
+        names = [name for name in os.listdir(folder) if name.endswith('.js')]
+        for name in sorted(names, key=lambda name: (module_act(name) or 99, name)):
+            modules.append(Module(language, kind, module_act(name), os.path.join(folder, name)))
+    return modules
+
+
+# ============================================================
+# PRODUCTION FORMAT
+# ============================================================
+
+def production_payload(source):
+    """The base64 string of a production module."""
+    match = PAYLOAD.search(source)
+    if not match:
+        raise ModuleFormatError('no export const w="..." payload')
+    return match.group(1)
+
+
+def decode_production(source):
+    """Production module source -> the act's JSON text (as the browser sees it)."""
+    reversed_json = zlib.decompress(base64.b64decode(production_payload(source))).decode('utf-8')
+    return reversed_json[::-1]
+
+
+def encode_production(data):
+    """Act data -> production module source (inverse of decodeObfuscatedModule)."""
+    text = json.dumps(data, ensure_ascii=False, separators=(',', ':'))
+    if any(ord(char) > 0xFFFF for char in text):
+        raise ModuleFormatError('payload contains characters outside the BMP')
+    payload = base64.b64encode(zlib.compress(text[::-1].encode('utf-8'), 9)).decode('ascii')
+    return f'// Obfuscated production version (zlib + base64)\nexport const w="{payload}";\n'
+
+
+# ============================================================
+# CLEAN FORMAT
+# ============================================================
+
+def clean_to_json(source):
+    """
+    Clean module source -> JSON text of all its exports as one object.
+
+    The clean modules are object/array literals of strings, numbers and
+    booleans: unquoted keys are quoted and trailing commas dropped.
+    """
+    tokens = tokenize(source)
+    parts = []
+    i = 0
+    while i < len(tokens):
+        token = tokens[i]
+        if token.value == 'export' and i + 3 < len(tokens) and tokens[i + 1].value == 'const':
+            if parts:
+                parts.append(',')
+            parts.append(json.dumps(tokens[i + 2].value))
+            parts.append(':')
+            i += 4          # export const name =
+            continue
+        if token.value == ';':
+            i += 1
+            continue
+        if token.kind == 'name' and i + 1 < len(tokens) and tokens[i + 1].value == ':':
+            parts.append(json.dumps(token.value))
+        elif token.kind == 'string':
+            if token.value[0] == "'":
+                parts.append(json.dumps(json.loads('"' + token.value[1:-1].replace('"', '\\"') + '"')))
+            else:
+                parts.append(token.value)
+        elif token.value == ',' and i + 1 < len(tokens) and tokens[i + 1].value in (']', '}'):
+            pass
+        elif token.kind in ('num', 'punct', 'name'):
+            parts.append(token.value)
+        else:
+            raise ModuleFormatError(f'unexpected {token.kind} token {token.value[:20]!r} at offset {token.start}')
+        i += 1
+    return '{' + ''.join(parts) + '}'
+
+
+def _matching_close(tokens, k):
+    """Index of the token closing the bracket at tokens[k]."""
+    depth = 0
+    for j in range(k, len(tokens)):
+        if tokens[j].value in ('{', '['):
+            depth += 1
+        elif tokens[j].value in ('}', ']'):
+            depth -= 1
+            if depth == 0:
+                return j
+    raise ModuleFormatError(f'unbalanced bracket at offset {tokens[k].start}')
+
+
+def _format_property(name, value):
+    """A pack property in the clean modules' layout (one row per line for lists)."""
+    if isinstance(value, list) and value:
+        rows = ',\n'.join(f'    {json.dumps(row, ensure_ascii=False)}' for row in value)
+        return f'  {name}: [\n{rows}\n  ]'
+    return f'  {name}: {json.dumps(value, ensure_ascii=False)}'
+
+
+def set_pack_properties(source, updates, remove=()):
+    """
+    Set (add or replace) top-level properties of pack exports in clean module source.
+
+    updates: {export name: {property: value}}. Other text is left untouched;
+    an existing property is replaced where it stands, a new one is appended.
+    remove: property names to drop from the updated exports (a field a builder no longer writes).
+    """
+    tokens = tokenize(source)
+    edits = []          # (start, end, text), applied back to front
+    for i, token in enumerate(tokens):
+        if not (token.value == 'export' and i + 4 < len(tokens) and tokens[i + 1].value == 'const'
+                and tokens[i + 2].value in updates and tokens[i + 4].value == '{'):
+            continue
+        open_index = i + 4
+        close_index = _matching_close(tokens, open_index)
+        properties = updates[tokens[i + 2].value]
+        pending = dict(properties)
+
+        # Existing properties: key token at depth 1 -> end of its value
+        k = open_index + 1
+        while k < close_index:
+            key = tokens[k]
+            value_end = k + 2
+            while value_end < close_index and tokens[value_end].value != ',':
+                if tokens[value_end].value in ('{', '['):
+                    value_end = _matching_close(tokens, value_end)
+                value_end += 1
+            if key.value in pending and tokens[k + 1].value == ':':
+                # Replace the value in place, so an unchanged field is an unchanged line
+                text = _format_property(key.value, pending.pop(key.value)).lstrip()
+                edits.append((key.start, tokens[value_end - 1].end, text))
+            elif key.value in remove and tokens[k + 1].value == ':':
+                # Drop ",<key>: <value>" (or "<key>: <value>," when it is the first property)
+                if tokens[k - 1].value == ',':
+                    edits.append((tokens[k - 1].start, tokens[value_end - 1].end, ''))
+                elif value_end < close_index:
+                    edits.append((key.start, tokens[value_end + 1].start, ''))
+            k = value_end + 1
+
+        if pending:
+            last = tokens[close_index - 1]
+            text = ''.join(',\n' + _format_property(name, value) for name, value in pending.items())
+            edits.append((last.end, last.end, text))
+
+    for start, end, text in sorted(edits, reverse=True):
+        source = source[:start] + text + source[end:]
+    return source
+
+
+# ============================================================
+# PACKS
+# ============================================================
+
+def pack_rows(pack):
+    """Word rows of a pack: baseWords then exampleWords (older packs: words) - getPackRows() in JS."""
+    if 'words' in pack:
+        return pack['words']
+    return pack.get('baseWords', []) + pack.get('exampleWords', [])
+
+
+# normalize() in wordpack-logic.js: \s there also matches U+FEFF
+NORMALIZE_STRIP = re.compile(r'[\s\ufeff.,!?;:\'"()\[\]{}\-_]')
+COMBINING_MARKS = re.compile(r'[\u0300-\u036f]')
+WHITESPACE = re.compile(r'[\s\ufeff]+')
+
+
+def js_normalize(text, remove_accents=False, remove_spaces=False, chinese=False):
+    """Same result as normalize(text, { removeAccents, removeSpaces, chinese }) in wordpack-logic.js."""
+    result = (text or '').lower()
+    if remove_accents:
+        result = COMBINING_MARKS.sub('', unicodedata.normalize('NFD', result))
+    if remove_spaces:
+        result = NORMALIZE_STRIP.sub('', result)
+    if chinese:
+        result = COMBINING_MARKS.sub('', unicodedata.normalize('NFD', WHITESPACE.sub('', result)))
+    return result
+
+
+def act_packs(data):
+    """[(export name, pack), ...] of an act's data in module order (__actMeta skipped)."""
+    return [(key, pack) for key, pack in data.items() if key != ACT_META and isinstance(pack, dict)]
+
+
+# ============================================================
+# FILES
+# ============================================================
+
+def module_json(path):
+    """JSON text of a module file in either format."""
+    with open(path, 'r', encoding='utf-8') as f:
+        source = f.read()
+    if PAYLOAD.search(source):
+        return decode_production(source)
+    return clean_to_json(source)
+
+
+def read_module(path):
+    """Act data of a module file in either format."""
+    return json.loads(module_json(path))
+
+
+def write_production(path, data):
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8', newline='\n') as f:
+        f.write(encode_production(data))
+    os.replace(tmp_path, path)
+
+
+def update_packs(clean_path, updates, remove=()):
+    """
+    Set pack properties in a clean module and its production copy.
+
+    updates: {export name: {property: value}}
+    remove: property names to drop from the updated packs
+    Returns:
+        bool: True if either file changed
+    """
+    with open(clean_path, 'r', encoding='utf-8') as f:
+        source = f.read()
+    new_source = set_pack_properties(source, updates, remove)
+    changed = new_source != source
+    if changed:
+        tmp_path = clean_path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8', newline='\n') as f:
+            f.write(new_source)
+        os.replace(tmp_path, clean_path)
+
+    js_path = production_path(clean_path)
+    if os.path.exists(js_path):
+        data = read_module(js_path)
+        new_data = json.loads(json.dumps(data))
+        for name, properties in updates.items():
+            if name in new_data:
+                for field in remove:
+                    new_data[name].pop(field, None)
+                new_data[name].update(properties)
+        if new_data != data:
+            write_production(js_path, new_data)
+            changed = True
+    return changed
+
+
+def production_path(clean_path):
+    """Jsmodules/act1-foundation.js -> Jsmodules-js/act1-foundation-js.js"""
+    folder, name = os.path.split(clean_path)
+    return os.path.join(os.path.dirname(folder), PRODUCTION_DIR, name[:-3] + '-js.js')
+
+
+def run_build_steps(language):
+    """
+    Run the BUILD_STEPS scripts for one language, stopping at the first failure.
+
+    Returns:
+        str or None: the script that failed, or None if all of them succeeded
+    """
+    helpers = os.path.dirname(os.path.abspath(__file__))
+    sys.stdout.flush()
+    for script in BUILD_STEPS:
+        result = subprocess.run([sys.executable, os.path.join(helpers, script), language])
+        if result.returncode != 0:
+            return script
+    return None
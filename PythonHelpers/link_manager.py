@@ -30,7 +30,9 @@
 # IMPORTANT NOTES:
 # ---------------
 # - Auto-detects repo from git remote (supports SSH, HTTPS, proxy formats)
-# - Excludes BACKUP/ folder (backups aren't deployable)
+# - Excludes BACKUP/ folder (backups aren't deployable) and other non-deployable
+#   folders (PythonHelpers/, dist/, hidden folders) - pruned, never walked
+# - Rewrites LINK.txt only when the set of URLs changed
 # - Groups JS files by language (Chinese, Spanish, English, Other)
 # - Separates clean (.js) and obfuscated (-js.js) modules
 # - URL-encodes special characters (spaces → %20)
@@ -39,8 +41,8 @@
 # WORKFLOW:
 # ---------
 # 1. Get repo owner/name from git remote URL
-# 2. Scan for web files (.html, .js, .json, .css)
-# 3. Load existing LINK.txt descriptions
+# 2. Scan for web files (.html, .js, .json, .css) in one pruned directory walk
+# 3. Load existing LINK.txt descriptions (stop here if the URL set is unchanged)
 # 4. Generate GitHub Pages URLs for all files
 # 5. Write organized LINK.txt with URLs and descriptions
 # 6. Report statistics (total files, new entries, preserved descriptions)
@@ -50,7 +52,6 @@
 import os
 import subprocess
 import urllib.parse
-from pathlib import Path
 
 
 def get_repo_info():
@@ -94,11 +95,39 @@ def get_repo_info():
         return None, None
 
 
+# Directories that are never deployed - pruned before the walk descends into them
+NON_DEPLOYABLE_DIRS = {'BACKUP', 'PythonHelpers', 'MyFunctions', 'dist', '__pycache__', 'node_modules', 'venv'}
+
+LANGUAGE_FOLDERS = {'ChineseWords': 'chinese', 'SpanishWords': 'spanish', 'EnglishWords': 'english'}
+
+
+def classify_web_file(parts):
+    """Return the web_files category for a repo-relative path (as parts), or None."""
+    ext = os.path.splitext(parts[-1])[1].lower()
+    if ext == '.html':
+        return 'html'
+    if ext == '.json':
+        return 'json'
+    if ext == '.css':
+        return 'css'
+    if ext != '.js':
+        return None
+
+    language = next((LANGUAGE_FOLDERS[p] for p in parts[:-1] if p in LANGUAGE_FOLDERS), 'other')
+    if 'Jsmodules-js' in parts[:-1]:
+        return f'js_obfuscated_{language}'
+    if 'Jsmodules' in parts[:-1]:
+        return f'js_clean_{language}'
+    return 'js_clean_other'
+
+
 def find_web_files(root_dir='.'):
     """Find all web-accessible files (.html, .js, .json, .css) in the repository.
 
-    Excludes:
-        - BACKUP/ directory - backup files are not deployable resources
+    One os.scandir walk: non-deployable directories (BACKUP/, PythonHelpers/,
+    dist/, hidden folders such as .git/, ...) are pruned before they are
+    entered, and every file is classified as it is seen. Hidden files (e.g. the
+    gitignored .integrity_manifest.json sidecar) are skipped.
 
     Returns:
         Dictionary with categorized file paths, JS files grouped by language
@@ -116,66 +145,22 @@ def find_web_files(root_dir='.'):
         'json': [],
         'css': []
     }
-    root_path = Path(root_dir).resolve()
-
-    def is_backup_file(path_str):
-        """Check if file is in BACKUP/ directory"""
-        return 'BACKUP/' in path_str or path_str.startswith('BACKUP/')
-
-    # Find HTML files (exclude backups)
-    for file_path in root_path.rglob('*.html'):
-        rel_path = file_path.relative_to(root_path)
-        rel_path_str = str(rel_path)
-        if not is_backup_file(rel_path_str):
-            web_files['html'].append(rel_path_str)
-
-    # Find JavaScript files (categorize by directory and language, exclude backups)
-    for file_path in root_path.rglob('*.js'):
-        rel_path = file_path.relative_to(root_path)
-        rel_path_str = str(rel_path)
-
-        # Skip backup files
-        if is_backup_file(rel_path_str):
-            continue
-
-        # Categorize JS files by type and language
-        if 'Jsmodules-js/' in rel_path_str or '/Jsmodules-js/' in rel_path_str:
-            # Obfuscated JS modules
-            if 'ChineseWords/' in rel_path_str:
-                web_files['js_obfuscated_chinese'].append(rel_path_str)
-            elif 'SpanishWords/' in rel_path_str:
-                web_files['js_obfuscated_spanish'].append(rel_path_str)
-            elif 'EnglishWords/' in rel_path_str:
-                web_files['js_obfuscated_english'].append(rel_path_str)
-            else:
-                web_files['js_obfuscated_other'].append(rel_path_str)
-        elif 'Jsmodules/' in rel_path_str or '/Jsmodules/' in rel_path_str:
-            # Clean JS modules
-            if 'ChineseWords/' in rel_path_str:
-                web_files['js_clean_chinese'].append(rel_path_str)
-            elif 'SpanishWords/' in rel_path_str:
-                web_files['js_clean_spanish'].append(rel_path_str)
-            elif 'EnglishWords/' in rel_path_str:
-                web_files['js_clean_english'].append(rel_path_str)
-            else:
-                web_files['js_clean_other'].append(rel_path_str)
-        else:
-            # Other JS files (not in language module folders)
-            web_files['js_clean_other'].append(rel_path_str)
-
-    # Find JSON files (exclude backups)
-    for file_path in root_path.rglob('*.json'):
-        rel_path = file_path.relative_to(root_path)
-        rel_path_str = str(rel_path)
-        if not is_backup_file(rel_path_str):
-            web_files['json'].append(rel_path_str)
-
-    # Find CSS files (exclude backups)
-    for file_path in root_path.rglob('*.css'):
-        rel_path = file_path.relative_to(root_path)
-        rel_path_str = str(rel_path)
-        if not is_backup_file(rel_path_str):
-            web_files['css'].append(rel_path_str)
+
+    stack = [(os.path.abspath(root_dir), ())]
+    while stack:
+        directory, parent_parts = stack.pop()
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.name.startswith('.'):
+                    continue
+                parts = parent_parts + (entry.name,)
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in NON_DEPLOYABLE_DIRS:
+                        stack.append((entry.path, parts))
+                elif entry.is_file():
+                    category = classify_web_file(parts)
+                    if category:
+                        web_files[category].append('/'.join(parts))
 
     # Sort all lists
     for key in web_files:
@@ -224,6 +209,14 @@ def update_link_txt(owner, repo, web_files, link_file='LINK.txt'):
     # Load existing descriptions
     existing_descriptions = load_existing_descriptions(link_file)
 
+    # Same URLs as last time: leave LINK.txt (and its hand-written descriptions) untouched
+    current_urls = {generate_github_pages_url(owner, repo, file_path)
+                    for file_list in web_files.values() for file_path in file_list}
+    previous_urls = {url for url in existing_descriptions if url.startswith('https://')}
+    if os.path.exists(link_file) and current_urls == previous_urls:
+        print(f"[UNCHANGED] {link_file} already lists these {len(current_urls)} URLs - not rewritten")
+        return True
+
     # Generate header
     lines = [
         f"# GitHub Pages Links for {owner}/{repo}",
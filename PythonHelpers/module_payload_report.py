@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+Payload budget and decode-cost report for the word data modules.
+
+For every Jsmodules-js (production) and Jsmodules (clean) file this lists:
+
+    Bytes       raw file size
+    Gzip        size over the wire (gzip -9, what GitHub Pages sends)
+    JSON        size of the decoded act JSON the game works with
+    Strings     number of string values in it
+    Decode ms   Python-side decode time, median of --runs runs, as a proxy
+                for the browser's cost: base64 -> inflate -> reverse ->
+                JSON parse for production modules, JSON parse only for
+                clean modules (the browser parses those as JS directly)
+
+Every module is checked against ACT_BUDGETS for its act number (edge-cases
+files are act 0). A module over any of its limits is reported with ❌ and
+the script exits with status 1, so a pack edit that bloats an act fails the
+build instead of shipping. Raise a budget here deliberately when an act is
+meant to grow.
+
+Usage:
+    python PythonHelpers/module_payload_report.py [chinese|spanish|english|all] [--csv FILE] [--runs N]
+
+Options:
+    --csv FILE   Also write the report rows to FILE
+    --runs N     Decode each module N times (default 5)
+"""
+
+import base64
+import csv
+import gzip
+import json
+import os
+import statistics
+import sys
+import time
+import zlib
+
+from jsmodules import (BASE_DIR, LANGUAGE_FOLDERS, PRODUCTION_DIR, find_modules,
+                       clean_to_json, decode_production, production_payload)
+
+
+# act number -> (max gzip bytes, max decoded JSON bytes, max decode ms)
+ACT_BUDGETS = {
+    0: (4_000, 8_000, 5),
+    1: (96_000, 256_000, 40),
+    2: (80_000, 224_000, 35),
+    3: (72_000, 208_000, 35),
+    4: (56_000, 160_000, 30),
+    5: (64_000, 176_000, 30),
+    6: (48_000, 160_000, 30),
+    7: (48_000, 160_000, 30),
+}
+DEFAULT_BUDGET = (48_000, 160_000, 30)
+
+DEFAULT_RUNS = 5
+
+CSV_COLUMNS = ['Language', 'Kind', 'Act', 'File', 'Bytes', 'Gzip_Bytes', 'JSON_Bytes', 'Strings',
+               'Decode_ms', 'Budget_Gzip', 'Budget_JSON', 'Budget_ms', 'Over_Budget']
+
+
+def count_strings(value):
+    if isinstance(value, str):
+        return 1
+    if isinstance(value, dict):
+        return sum(count_strings(v) for v in value.values())
+    if isinstance(value, list):
+        return sum(count_strings(v) for v in value)
+    return 0
+
+
+def decode_time_ms(decode, runs):
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        decode()
+        times.append((time.perf_counter() - start) * 1000)
+    return statistics.median(times)
+
+
+def measure_module(module, runs):
+    """Return the report row (dict) for one module."""
+    with open(module.path, 'rb') as f:
+        raw = f.read()
+    source = raw.decode('utf-8')
+
+    if module.kind == PRODUCTION_DIR:
+        payload = production_payload(source)
+
+        def decode():
+            return json.loads(zlib.decompress(base64.b64decode(payload)).decode('utf-8')[::-1])
+        json_text = decode_production(source)
+    else:
+        json_text = clean_to_json(source)
+
+        def decode():
+            return json.loads(json_text)
+
+    data = decode()
+    max_gzip, max_json, max_ms = ACT_BUDGETS.get(module.act, DEFAULT_BUDGET)
+    row = {
+        'Language': module.language,
+        'Kind': module.kind,
+        'Act': module.act,
+        'File': os.path.relpath(module.path, BASE_DIR).replace(os.sep, '/'),
+        'Bytes': len(raw),
+        'Gzip_Bytes': len(gzip.compress(raw, compresslevel=9, mtime=0)),
+        'JSON_Bytes': len(json_text.encode('utf-8')),
+        'Strings': count_strings(data),
+        'Decode_ms': round(decode_time_ms(decode, runs), 2),
+        'Budget_Gzip': max_gzip,
+        'Budget_JSON': max_json,
+        'Budget_ms': max_ms,
+    }
+    over = []
+    if row['Gzip_Bytes'] > max_gzip:
+        over.append(f"gzip {row['Gzip_Bytes']:,} > {max_gzip:,}")
+    if row['JSON_Bytes'] > max_json:
+        over.append(f"JSON {row['JSON_Bytes']:,} > {max_json:,}")
+    if row['Decode_ms'] > max_ms:
+        over.append(f"decode {row['Decode_ms']} ms > {max_ms} ms")
+    row['Over_Budget'] = '; '.join(over)
+    return row
+
+
+def main():
+    args = sys.argv[1:]
+    csv_path = None
+    runs = DEFAULT_RUNS
+    positional = []
+    rest = iter(args)
+    for arg in rest:
+        if arg == '--csv':
+            csv_path = next(rest)
+        elif arg == '--runs':
+            runs = max(1, int(next(rest)))
+        else:
+            positional.append(arg.lower())
+
+    target = positional[0] if positional else 'all'
+    if target != 'all' and target not in LANGUAGE_FOLDERS:
+        print(f"Unknown language: {target}")
+        print("Use: chinese, spanish, english, or all")
+        sys.exit(1)
+    languages = list(LANGUAGE_FOLDERS) if target == 'all' else [target]
+
+    rows = []
+    for language in languages:
+        modules = find_modules(language)
+        language_rows = [measure_module(module, runs) for module in modules]
+        rows.extend(language_rows)
+
+        print(f"\n{'='*70}")
+        print(f"MODULE PAYLOADS: {LANGUAGE_FOLDERS[language]}")
+        print(f"{'='*70}")
+        print(f"{'File':<44} {'Act':>3} {'Bytes':>9} {'Gzip':>8} {'JSON':>9} {'Strings':>8} {'ms':>6}")
+        for row in language_rows:
+            mark = '❌' if row['Over_Budget'] else '  '
+            name = f"{row['Kind']}/{os.path.basename(row['File'])}"
+            print(f"{name:<44} {row['Act']:>3} {row['Bytes']:>9,} {row['Gzip_Bytes']:>8,} {row['JSON_Bytes']:>9,} "
+                  f"{row['Strings']:>8,} {row['Decode_ms']:>6.1f} {mark}")
+        production = [row for row in language_rows if row['Kind'] == PRODUCTION_DIR]
+        if production:
+            print(f"All acts ({PRODUCTION_DIR}): {sum(row['Gzip_Bytes'] for row in production):,} bytes over the wire, "
+                  f"{sum(row['Decode_ms'] for row in production):.1f} ms to decode")
+
+    if csv_path:
+        with open(csv_path, 'w', encoding='utf-8', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=CSV_COLUMNS, lineterminator='\n')
+            writer.writeheader()
+            writer.writerows(rows)
+        print(f"\n✓ Wrote {len(rows)} rows to {csv_path}")
+
+    over = [row for row in rows if row['Over_Budget']]
+    print()
+    if over:
+        print(f"❌ {len(over)} module(s) over budget:")
+        for row in over:
+            print(f"  {row['File']} (act {row['Act']}): {row['Over_Budget']}")
+        sys.exit(1)
+    print(f"✓ All {len(rows)} modules within their act budgets")
+
+
+if __name__ == '__main__':
+    main()
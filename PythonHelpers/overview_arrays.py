@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+Shared parser for the Overview "[a,b,c]" word arrays, with a cached sidecar.
+
+The Overview CSVs store Base/Example/Combined words as bracketed,
+comma-separated lists (not JSON - items are unquoted). This module is the one
+place that parses them. Parsed arrays for every language are cached in a
+marshal sidecar (.overview_arrays.cache at the repo root), invalidated per
+language by the Overview file's mtime and size, so reading all three
+Overviews is a single fast load once the cache is warm.
+
+Usage (as a library):
+    from overview_arrays import parse_array, load_overview
+
+    packs = load_overview('spanish')
+    packs[1]['combined']   # ['hola', 'adiós', ...]
+
+Usage (CLI):
+    python PythonHelpers/overview_arrays.py build    # Rebuild the sidecar
+    python PythonHelpers/overview_arrays.py stats    # Show cached pack/word counts
+"""
+
+import csv
+import marshal
+import os
+import sys
+import time
+
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SIDECAR_PATH = os.path.join(BASE_DIR, '.overview_arrays.cache')
+CACHE_VERSION = 1
+
+OVERVIEW_CONFIG = {
+    'chinese': {'file': 'ChineseWords/ChineseWordsOverview.csv', 'column_prefix': 'Chinese'},
+    'spanish': {'file': 'SpanishWords/SpanishWordsOverview.csv', 'column_prefix': 'Spanish'},
+    'english': {'file': 'EnglishWords/EnglishWordsOverview.csv', 'column_prefix': 'English'},
+}
+
+
+# ============================================================
+# PARSING
+# ============================================================
+
+def parse_array(arr_str, keep_empty=False):
+    """
+    Parse a CSV array string like '[a,b,c]' into a list.
+
+    Items are stripped of surrounding whitespace. Empty items (from '[a,,b]'
+    or a trailing comma) are dropped unless keep_empty=True - validators that
+    need to see malformed arrays exactly as written should pass keep_empty.
+    """
+    if not arr_str:
+        return []
+    content = arr_str.strip()
+    if content.startswith('['):
+        content = content[1:]
+    if content.endswith(']'):
+        content = content[:-1]
+    if not content.strip():
+        return []
+    items = [item.strip() for item in content.split(',')]
+    if keep_empty:
+        return items
+    return [item for item in items if item]
+
+
+def format_array(items):
+    """Format a list as a CSV array string (inverse of parse_array)."""
+    return '[' + ','.join(items) + ']'
+
+
+def parse_overview_file(overview_path, column_prefix):
+    """
+    Parse one Overview CSV.
+
+    Returns:
+        dict: {pack_num: {'title', 'act', 'base', 'example', 'combined'}}
+    """
+    base_col = f"{column_prefix}_Base_Words"
+    example_col = f"{column_prefix}_Example_Words"
+    combined_col = f"{column_prefix}_Combined_Words"
+
+    packs = {}
+    with open(overview_path, 'r', encoding='utf-8') as f:
+        for row in csv.DictReader(f):
+            packs[int(row['Pack_Number'])] = {
+                'title': row.get('Pack_Title', ''),
+                'act': row.get('Difficulty_Act', ''),
+                'base': parse_array(row.get(base_col, '')),
+                'example': parse_array(row.get(example_col, '')),
+                'combined': parse_array(row.get(combined_col, '')),
+            }
+    return packs
+
+
+# ============================================================
+# SIDECAR CACHE
+# ============================================================
+
+def _file_signature(path):
+    stat = os.stat(path)
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def _read_sidecar():
+    try:
+        with open(SIDECAR_PATH, 'rb') as f:
+            data = marshal.loads(f.read())
+    except (OSError, EOFError, ValueError, TypeError):
+        return {}
+    if not isinstance(data, dict) or data.get('version') != CACHE_VERSION:
+        return {}
+    return data.get('languages', {})
+
+
+def _write_sidecar(languages):
+    tmp_path = SIDECAR_PATH + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        marshal.dump({'version': CACHE_VERSION, 'languages': languages}, f)
+    os.replace(tmp_path, SIDECAR_PATH)
+
+
+def load_overviews(languages=None, use_cache=True):
+    """
+    Load parsed Overview arrays for several languages at once.
+
+    Only languages whose Overview changed since the sidecar was written are
+    re-parsed; the sidecar is rewritten only when something was re-parsed.
+
+    Returns:
+        dict: {language: {pack_num: {'title', 'act', 'base', 'example', 'combined'}}}
+    """
+    languages = languages or list(OVERVIEW_CONFIG)
+    cached = _read_sidecar() if use_cache else {}
+    result = {}
+    dirty = False
+
+    for language in languages:
+        config = OVERVIEW_CONFIG[language]
+        path = os.path.join(BASE_DIR, config['file'])
+        if not os.path.exists(path):
+            continue
+
+        signature = _file_signature(path)
+        entry = cached.get(language)
+        if entry and tuple(entry['signature']) == signature:
+            result[language] = entry['packs']
+            continue
+
+        packs = parse_overview_file(path, config['column_prefix'])
+        cached[language] = {'signature': signature, 'packs': packs}
+        result[language] = packs
+        dirty = True
+
+    if dirty:
+        try:
+            _write_sidecar(cached)
+        except OSError as e:
+            print(f"WARNING: Could not write overview cache: {e}")
+
+    return result
+
+
+def load_overview(language, use_cache=True):
+    """Load parsed Overview arrays for one language ({} if the Overview is missing)."""
+    return load_overviews([language], use_cache).get(language, {})
+
+
+# ============================================================
+# COMMAND-LINE INTERFACE
+# ============================================================
+
+def main():
+    command = sys.argv[1].lower() if len(sys.argv) > 1 else 'stats'
+
+    if command == 'build':
+        if os.path.exists(SIDECAR_PATH):
+            os.remove(SIDECAR_PATH)
+        start = time.time()
+        overviews = load_overviews()
+        print(f"✓ Parsed {len(overviews)} Overviews in {(time.time() - start) * 1000:.1f} ms")
+        print(f"  Sidecar: {SIDECAR_PATH} ({os.path.getsize(SIDECAR_PATH):,} bytes)")
+
+    start = time.time()
+    overviews = load_overviews()
+    print(f"Loaded {len(overviews)} Overviews in {(time.time() - start) * 1000:.1f} ms")
+    for language, packs in overviews.items():
+        base = sum(len(p['base']) for p in packs.values())
+        example = sum(len(p['example']) for p in packs.values())
+        combined = sum(len(p['combined']) for p in packs.values())
+        print(f"  {language:<8} {len(packs):4d} packs  base: {base:5d}  example: {example:5d}  combined: {combined:5d}")
+
+
+if __name__ == '__main__':
+    main()
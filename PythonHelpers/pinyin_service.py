@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+"""
+Memoized, phrase-aware pinyin generation for breakout construction.
+
+Resolution order for a Chinese text:
+    1. Phrase memo (every text generated this run)
+    2. Vetted pinyin for the exact same text anywhere in our breakout CSVs
+       (crosslingual_index), if it passes validate_pinyin's 1:1 mapping check
+    3. pypinyin on the whole Hanzi sequence (phrase context picks readings)
+    4. Character table mined from our own aligned chinese/pinyin columns
+       (most frequent reading per character) - used when pypinyin is missing
+
+Then a 不/一 tone sandhi post-pass is applied, and the result is formatted the
+way validate_pinyin expects: one syllable per character, space-separated,
+Chinese punctuation attached to the preceding syllable, Latin letters
+letter-by-letter.
+
+    早上好，先生  ->  zǎo shàng hǎo， xiān shēng
+    不客气        ->  bú kè qì
+
+Usage (as a library):
+    from pinyin_service import PinyinService
+    service = PinyinService()
+    service.batch(['你好', '一起'])   # ['nǐ hǎo', 'yì qǐ']
+
+Usage (CLI):
+    python PythonHelpers/pinyin_service.py <chinese text> [...]
+    python PythonHelpers/pinyin_service.py --stats
+"""
+
+import sys
+import time
+import unicodedata
+from collections import Counter
+
+from crosslingual_index import CrossLingualIndex
+from translation_memory import normalize_text
+from validate_pinyin import (
+    parse_chinese_chars_with_punctuation,
+    parse_pinyin_syllables_with_punctuation,
+    validate_character_mapping,
+    extract_trailing_punctuation,
+)
+
+try:
+    from pypinyin import pinyin, Style
+    HAS_PYPINYIN = True
+except ImportError:
+    HAS_PYPINYIN = False
+
+
+PINYIN_NEEDED = "[PINYIN_NEEDED]"
+
+# Base (citation) readings for the sandhi characters; mined variants fold to these
+SANDHI_BASE = {'不': 'bù', '一': 'yī'}
+
+# 一 keeps yī when counting/ordinal: 第一, 十一, 一二三, 一月 ...
+# (and is neutral yi between a reduplicated verb: 看一看)
+NUMBER_CHARS = set('零〇一二三四五六七八九十百千万亿两第')
+
+TONE_MARKS = {
+    1: 'āēīōūǖ',
+    2: 'áéíóúǘ',
+    3: 'ǎěǐǒǔǚ',
+    4: 'àèìòùǜ',
+}
+
+
+def syllable_tone(syllable):
+    """Return the tone number of a tone-marked syllable (0 = neutral/unknown)."""
+    for char in unicodedata.normalize('NFC', syllable):
+        for tone, marks in TONE_MARKS.items():
+            if char in marks:
+                return tone
+    return 0
+
+
+def apply_sandhi(hanzi, readings, breaks=()):
+    """
+    Apply 不/一 tone sandhi to per-character readings.
+
+    hanzi: list of characters; readings: parallel list of syllables.
+    breaks: positions followed by punctuation (no sandhi across them).
+    """
+    result = list(readings)
+    for i, char in enumerate(hanzi):
+        if char not in SANDHI_BASE:
+            continue
+        result[i] = SANDHI_BASE[char]
+        if i + 1 >= len(hanzi) or i in breaks:
+            continue
+        next_tone = syllable_tone(readings[i + 1])
+
+        if char == '不':
+            if next_tone == 4:
+                result[i] = 'bú'
+        else:
+            previous = hanzi[i - 1] if i > 0 else ''
+            if previous in NUMBER_CHARS or hanzi[i + 1] in NUMBER_CHARS - {'两'}:
+                continue
+            # Reduplicated verb (看一看, 想一想): 一 is neutral
+            if previous == hanzi[i + 1] and (i - 1) not in breaks:
+                result[i] = 'yi'
+                continue
+            if hanzi[i + 1] == '月':
+                continue
+            if next_tone == 4:
+                result[i] = 'yí'
+            elif next_tone in (1, 2, 3):
+                result[i] = 'yì'
+    return result
+
+
+def _strip_punctuation(syllable):
+    return syllable[:len(syllable) - len(extract_trailing_punctuation(syllable))]
+
+
+class PinyinService:
+    """Phrase and character memoized pinyin generator (see module docstring)."""
+
+    def __init__(self, index=None):
+        self._index = index
+        self.phrase_memo = {}
+        self.char_memo = {}
+        self._char_table = None
+        self.stats = Counter()
+
+    # ---------------- corpus data (loaded on first need) ----------------
+
+    @property
+    def index(self):
+        if self._index is None:
+            self._index = CrossLingualIndex()
+        return self._index
+
+    def corpus_readings(self, text):
+        """
+        Per-character readings of this text from our CSVs, if correctly aligned.
+        Looked up with normalize_text(), like the index keys.
+        """
+        entry = self.index.entries['chinese'].get(normalize_text(text))
+        candidate = entry.get('pinyin') if entry else None
+        if not candidate or not validate_character_mapping(text, candidate)[0]:
+            return None
+        units = parse_chinese_chars_with_punctuation(text)
+        syllables = parse_pinyin_syllables_with_punctuation(candidate)
+        return [_strip_punctuation(py_unit)
+                for (_, ch_type), (py_unit, _) in zip(units, syllables) if ch_type == 'chinese']
+
+    @property
+    def char_table(self):
+        """Most frequent reading per character, mined from aligned chinese/pinyin cells."""
+        if self._char_table is None:
+            counts = {}
+            for text, entry in self.index.entries['chinese'].items():
+                py = entry.get('pinyin')
+                if not py or not validate_character_mapping(text, py)[0]:
+                    continue
+                units = parse_chinese_chars_with_punctuation(text)
+                syllables = parse_pinyin_syllables_with_punctuation(py)
+                for (ch_unit, ch_type), (py_unit, _) in zip(units, syllables):
+                    if ch_type != 'chinese':
+                        continue
+                    reading = _strip_punctuation(py_unit).lower()
+                    counts.setdefault(ch_unit[0], Counter())[reading] += 1
+            self._char_table = {char: c.most_common(1)[0][0] for char, c in counts.items()}
+            self._char_table.update(SANDHI_BASE)
+        return self._char_table
+
+    # ---------------- readings ----------------
+
+    def char_reading(self, char):
+        """Reading for a single character (memoized)."""
+        if char not in self.char_memo:
+            reading = None
+            if HAS_PYPINYIN:
+                reading = pinyin(char, style=Style.TONE, heteronym=False)[0][0]
+                if reading == char:
+                    reading = None
+            if reading is None:
+                reading = self.char_table.get(char)
+            self.char_memo[char] = reading
+        return self.char_memo[char]
+
+    def hanzi_readings(self, hanzi):
+        """Readings for a Hanzi sequence, using phrase context when pypinyin is available."""
+        if HAS_PYPINYIN:
+            readings = [p[0] for p in pinyin(''.join(hanzi), style=Style.TONE, heteronym=False)]
+            if len(readings) == len(hanzi):
+                self.stats['pypinyin'] += 1
+                return readings
+        self.stats['char_table'] += 1
+        return [self.char_reading(char) for char in hanzi]
+
+    # ---------------- public API ----------------
+
+    def generate(self, chinese_text):
+        """Return pinyin for one text in validate_pinyin format ('' for empty)."""
+        if not chinese_text:
+            return ""
+        if chinese_text in self.phrase_memo:
+            self.stats['memo'] += 1
+            return self.phrase_memo[chinese_text]
+
+        result = self._compose(chinese_text)
+        self.phrase_memo[chinese_text] = result
+        return result
+
+    def batch(self, chinese_texts):
+        return [self.generate(text) for text in chinese_texts]
+
+    def _compose(self, chinese_text):
+        units = parse_chinese_chars_with_punctuation(chinese_text)
+        hanzi = [unit[0] for unit, unit_type in units if unit_type == 'chinese']
+        readings = self.corpus_readings(chinese_text)
+        if readings is not None:
+            self.stats['corpus'] += 1
+        else:
+            readings = self.hanzi_readings(hanzi)
+        if any(reading is None for reading in readings):
+            self.stats['unresolved'] += 1
+            return PINYIN_NEEDED
+
+        # Punctuation after a character blocks sandhi across it
+        chinese_units = [unit for unit, unit_type in units if unit_type == 'chinese']
+        breaks = {i for i, unit in enumerate(chinese_units) if extract_trailing_punctuation(unit)}
+        readings = apply_sandhi(hanzi, readings, breaks)
+
+        parts = []
+        reading_iter = iter(readings)
+        for unit, unit_type in units:
+            if unit_type == 'chinese':
+                parts.append(next(reading_iter) + extract_trailing_punctuation(unit))
+            else:
+                parts.append(unit)
+        return ' '.join(parts)
+
+
+def main():
+    args = sys.argv[1:]
+    service = PinyinService()
+
+    if not args or args == ['--stats']:
+        start = time.time()
+        table = service.char_table
+        print(f"pypinyin available: {HAS_PYPINYIN}")
+        print(f"Character table: {len(table)} characters mined in {(time.time() - start) * 1000:.0f} ms")
+        return
+
+    for text in args:
+        print(f"{text}  ->  {service.generate(text)}")
+
+
+if __name__ == '__main__':
+    main()
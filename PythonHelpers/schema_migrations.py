@@ -0,0 +1,417 @@
+#!/usr/bin/env python3
+"""
+Declarative schema migrations for breakout and Overview CSVs.
+
+Column changes used to be one-off scripts (remove_chinese_languages.py,
+SpanishWords/.../migrate_overview_columns.py), each rewriting files one at a
+time with its own logic. A migration here is a small declarative spec:
+
+    {
+        "id": "chinese-drop-sea-columns",
+        "description": "Drop the six Southeast Asian columns",
+        "target": "breakout",              # or "overview"
+        "languages": ["chinese"],
+        "operations": [
+            {"op": "drop", "columns": ["vietnamese", "thai"]},
+            {"op": "add", "column": "notes", "default": "", "after": "pinyin"},
+            {"op": "rename", "from": "notes", "to": "comment"},
+            {"op": "reorder", "columns": ["chinese", "pinyin", "english"]},
+            {"op": "derive", "column": "Base_Count", "function": "array_count",
+             "from": ["Chinese_Base_Words"]}
+        ]
+    }
+
+Operations run in order as one csv_pipeline stage, so every file is streamed
+once and written once, atomically. Files are migrated in parallel (one process
+per file). Each language folder keeps a ledger of applied migrations
+(<Folder>/.applied_migrations.json), so re-running a migration is a no-op.
+
+Usage:
+    python PythonHelpers/schema_migrations.py list
+    python PythonHelpers/schema_migrations.py status [chinese|spanish|english|all]
+    python PythonHelpers/schema_migrations.py apply <id|migration.json> [chinese|spanish|english|all] [--dry-run] [--force] [--workers N]
+
+Examples:
+    python PythonHelpers/schema_migrations.py apply chinese-drop-sea-columns --dry-run
+    python PythonHelpers/schema_migrations.py apply my_migration.json all --workers 8
+"""
+
+import csv
+import json
+import os
+import sys
+import time
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+from csv_pipeline import BASE_DIR, LANGUAGE_CONFIG, breakout_files, run_pipeline
+
+
+LEDGER_NAME = '.applied_migrations.json'
+
+# Built-in migrations (more can be passed as JSON files)
+MIGRATIONS = {
+    'chinese-drop-sea-columns': {
+        'description': 'Drop vietnamese, thai, khmer, indonesian, malay, filipino from Chinese breakouts '
+                       '(replaces remove_chinese_languages.py)',
+        'target': 'breakout',
+        'languages': ['chinese'],
+        'operations': [
+            {'op': 'drop', 'columns': ['vietnamese', 'thai', 'khmer', 'indonesian', 'malay', 'filipino']},
+        ],
+    },
+}
+
+
+# ============================================================
+# DERIVE FUNCTIONS
+# ============================================================
+#
+# Referenced by name from "derive" operations so migrations stay declarative
+# (and picklable for the worker processes).
+
+def _array_items(cell):
+    content = cell.strip()
+    if not content.startswith('[') or not content.endswith(']'):
+        return []
+    content = content[1:-1]
+    return [item.strip() for item in content.split(',') if item.strip()]
+
+
+def _derive_array_count(values, args):
+    return str(sum(len(_array_items(v)) for v in values))
+
+
+def _derive_array_concat(values, args):
+    items = [item for v in values for item in _array_items(v)]
+    return f"[{','.join(items)}]"
+
+
+def _derive_join(values, args):
+    return args.get('separator', ' ').join(v for v in values if v)
+
+
+def _derive_copy(values, args):
+    return values[0] if values else ''
+
+
+DERIVE_FUNCTIONS = {
+    'array_count': _derive_array_count,
+    'array_concat': _derive_array_concat,
+    'join': _derive_join,
+    'copy': _derive_copy,
+}
+
+
+# ============================================================
+# MIGRATION STAGE
+# ============================================================
+
+def _plan_header(header, operations):
+    """
+    Work out the new header and, for every output column, where its value
+    comes from: ('col', source_index), ('const', value) or ('derive', op).
+    Operations that are already satisfied (column already dropped, already
+    renamed, ...) are skipped, which keeps migrations idempotent.
+    """
+    columns = [(name, ('col', i)) for i, name in enumerate(header)]
+
+    for op in operations:
+        kind = op['op']
+        names = [name for name, _ in columns]
+
+        if kind == 'drop':
+            drop = set(op['columns'])
+            columns = [c for c in columns if c[0] not in drop]
+
+        elif kind == 'add':
+            if op['column'] in names:
+                continue
+            entry = (op['column'], ('const', op.get('default', '')))
+            _insert(columns, entry, op)
+
+        elif kind == 'rename':
+            if op['from'] not in names or op['to'] in names:
+                continue
+            columns = [(op['to'] if name == op['from'] else name, src) for name, src in columns]
+
+        elif kind == 'reorder':
+            order = [name for name in op['columns'] if name in names]
+            rest = [name for name in names if name not in order]
+            by_name = dict(columns)
+            columns = [(name, by_name[name]) for name in order + rest]
+
+        elif kind == 'derive':
+            if op['function'] not in DERIVE_FUNCTIONS:
+                raise ValueError(f"Unknown derive function: {op['function']}")
+            missing = [name for name in op['from'] if name not in names]
+            if missing:
+                raise ValueError(f"derive {op['column']}: missing source columns {missing}")
+            sources = [dict(columns)[name] for name in op['from']]
+            entry = (op['column'], ('derive', op, sources))
+            if op['column'] in names:
+                columns = [entry if name == op['column'] else (name, src) for name, src in columns]
+            else:
+                _insert(columns, entry, op)
+
+        else:
+            raise ValueError(f"Unknown migration operation: {kind}")
+
+    return [name for name, _ in columns], [src for _, src in columns]
+
+
+def _insert(columns, entry, op):
+    names = [name for name, _ in columns]
+    if op.get('after') in names:
+        columns.insert(names.index(op['after']) + 1, entry)
+    else:
+        columns.append(entry)
+
+
+def _cell(row, source):
+    kind = source[0]
+    if kind == 'col':
+        return row[source[1]] if source[1] < len(row) else ''
+    if kind == 'const':
+        return source[1]
+    _, op, sources = source
+    values = [_cell(row, s) for s in sources]
+    return DERIVE_FUNCTIONS[op['function']](values, op)
+
+
+def migration_stage(operations):
+    """Build a csv_pipeline stage that applies a list of operations."""
+    name = 'migrate'
+
+    def run(rows, counts):
+        header = next(rows, None)
+        if header is None:
+            return
+        new_header, sources = _plan_header(header, operations)
+        if new_header != header:
+            counts[name] += 1
+        yield new_header
+
+        for row in rows:
+            new_row = [_cell(row, src) for src in sources]
+            if new_row != row:
+                counts[name] += 1
+            yield new_row
+
+    return name, run
+
+
+def rows_bytes(rows):
+    """UTF-8 size of all cell values - unaffected by quoting and line endings."""
+    return sum(len(cell.encode('utf-8')) for row in rows for cell in row)
+
+
+def content_bytes(filepath):
+    """rows_bytes() of a CSV file on disk."""
+    with open(filepath, 'r', encoding='utf-8', newline='') as f:
+        return rows_bytes(csv.reader(f))
+
+
+def dry_run_file(filepath, operations):
+    """
+    Stream a file through the migration without writing it.
+
+    Returns:
+        tuple: (rows_touched, bytes_after)
+    """
+    counts = defaultdict(int)
+    _, run = migration_stage(operations)
+    with open(filepath, 'r', encoding='utf-8', newline='') as f:
+        bytes_after = rows_bytes(run(iter(csv.reader(f)), counts))
+    return counts['migrate'], bytes_after
+
+
+def migrate_file(filepath, operations, dry_run=False):
+    """
+    Migrate one CSV file (runs in a worker process).
+
+    Returns:
+        dict: {'file', 'rows_touched', 'bytes_before', 'bytes_after', 'error'}
+              (bytes = content_bytes(), the cell data only)
+    """
+    result = {'file': filepath, 'rows_touched': 0, 'bytes_before': 0, 'bytes_after': 0, 'error': None}
+    try:
+        result['bytes_before'] = content_bytes(filepath)
+        if dry_run:
+            result['rows_touched'], result['bytes_after'] = dry_run_file(filepath, operations)
+        else:
+            counts, _ = run_pipeline(filepath, [lambda filename: migration_stage(operations)])
+            result['rows_touched'] = counts['migrate']
+            result['bytes_after'] = content_bytes(filepath)
+    except Exception as e:
+        result['error'] = str(e)
+    return result
+
+
+# ============================================================
+# LEDGER
+# ============================================================
+
+def ledger_path(language):
+    return os.path.join(BASE_DIR, LANGUAGE_CONFIG[language]['folder'], LEDGER_NAME)
+
+
+def read_ledger(language):
+    path = ledger_path(language)
+    if not os.path.exists(path):
+        return {}
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def record_migration(language, migration_id, stats):
+    ledger = read_ledger(language)
+    ledger[migration_id] = {
+        'applied_at': datetime.now().isoformat(timespec='seconds'),
+        **stats,
+    }
+    path = ledger_path(language)
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(ledger, f, indent=2, ensure_ascii=False)
+        f.write('\n')
+    os.replace(tmp_path, path)
+
+
+# ============================================================
+# RUNNER
+# ============================================================
+
+def target_files(language, target):
+    if target == 'breakout':
+        return breakout_files(language)
+    if target == 'overview':
+        config = LANGUAGE_CONFIG[language]
+        path = os.path.join(BASE_DIR, config['folder'], f"{config['prefix']}Overview.csv")
+        return [path] if os.path.exists(path) else []
+    raise ValueError(f"Unknown migration target: {target}")
+
+
+def load_migration(ref):
+    """Look up a built-in migration by id, or load one from a JSON file."""
+    if ref in MIGRATIONS:
+        return ref, MIGRATIONS[ref]
+    if os.path.exists(ref):
+        with open(ref, 'r', encoding='utf-8') as f:
+            spec = json.load(f)
+        return spec.get('id', os.path.splitext(os.path.basename(ref))[0]), spec
+    raise ValueError(f"Unknown migration: {ref} (not a built-in id or JSON file)")
+
+
+def apply_migration(migration_id, spec, languages, dry_run=False, force=False, workers=None):
+    """Apply one migration to every pack of the given languages, in parallel."""
+    operations = spec['operations']
+    target = spec.get('target', 'breakout')
+
+    print(f"\n{'='*70}")
+    print(f"MIGRATION: {migration_id}" + (" (DRY RUN)" if dry_run else ""))
+    print(f"{'='*70}")
+    if spec.get('description'):
+        print(spec['description'])
+
+    for language in languages:
+        if not force and migration_id in read_ledger(language):
+            applied_at = read_ledger(language)[migration_id].get('applied_at', '?')
+            print(f"\n{language.upper()}: already applied ({applied_at}) - no-op")
+            continue
+
+        files = target_files(language, target)
+        start = time.time()
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(migrate_file, files,
+                                    [operations] * len(files), [dry_run] * len(files)))
+        elapsed = time.time() - start
+
+        errors = [r for r in results if r['error']]
+        touched = [r for r in results if r['rows_touched']]
+        rows_touched = sum(r['rows_touched'] for r in results)
+        bytes_before = sum(r['bytes_before'] for r in touched)
+        bytes_after = sum(r['bytes_after'] for r in touched)
+
+        print(f"\n{language.upper()}: {len(files)} {target} files in {elapsed:.2f}s")
+        print(f"  Files touched: {len(touched)}")
+        print(f"  Rows touched:  {rows_touched}")
+        print(f"  Cell bytes:    {bytes_before:,} -> {bytes_after:,} ({bytes_after - bytes_before:+,})")
+        for r in errors:
+            print(f"  ❌ {os.path.basename(r['file'])}: {r['error']}")
+
+        if errors:
+            print(f"  ⚠️  {len(errors)} files failed - migration NOT recorded")
+        elif not dry_run:
+            record_migration(language, migration_id, {
+                'files_touched': len(touched),
+                'rows_touched': rows_touched,
+                'bytes_before': bytes_before,
+                'bytes_after': bytes_after,
+            })
+
+
+def print_status(languages):
+    for language in languages:
+        ledger = read_ledger(language)
+        print(f"\n{language.upper()}:")
+        if not ledger:
+            print("  (no migrations applied)")
+        for migration_id, info in ledger.items():
+            print(f"  ✓ {migration_id}  {info.get('applied_at', '?')}  rows: {info.get('rows_touched', '?')}")
+
+
+def main():
+    if len(sys.argv) < 2:
+        print(__doc__)
+        sys.exit(1)
+
+    command = sys.argv[1].lower()
+    dry_run = '--dry-run' in sys.argv
+    force = '--force' in sys.argv
+    workers = None
+    args = []
+    rest = iter(sys.argv[2:])
+    for arg in rest:
+        if arg == '--workers':
+            workers = int(next(rest))
+        elif not arg.startswith('--'):
+            args.append(arg)
+
+    if command == 'list':
+        for migration_id, spec in MIGRATIONS.items():
+            print(f"{migration_id} [{spec['target']}: {', '.join(spec['languages'])}]")
+            print(f"    {spec['description']}")
+        return
+
+    if command == 'status':
+        lang = args[0].lower() if args else 'all'
+        print_status(list(LANGUAGE_CONFIG) if lang == 'all' else [lang])
+        return
+
+    if command != 'apply' or not args:
+        print(__doc__)
+        sys.exit(1)
+
+    try:
+        migration_id, spec = load_migration(args[0])
+    except ValueError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+
+    if len(args) > 1:
+        lang = args[1].lower()
+        if lang != 'all' and lang not in LANGUAGE_CONFIG:
+            print(f"Unknown language: {lang}")
+            print("Use: chinese, spanish, english, or all")
+            sys.exit(1)
+        languages = list(LANGUAGE_CONFIG) if lang == 'all' else [lang]
+    else:
+        languages = spec.get('languages', list(LANGUAGE_CONFIG))
+
+    apply_migration(migration_id, spec, languages, dry_run, force, workers)
+
+
+if __name__ == '__main__':
+    main()
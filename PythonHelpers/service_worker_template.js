@@ -0,0 +1,98 @@
+// Service worker template - PythonHelpers/build_deploy.py fills in the
+// placeholders, minifies it and writes it to dist/sw.js.
+//
+// Cache-first for everything the precache manifests list. A page posts
+// { type: 'precache', language } on load; the worker then fetches
+// precache-<language>.json and downloads only the entries whose URL or sha256
+// is not cached yet. Hashed assets change URL when their content changes, so
+// most deploys re-download just the changed modules. Each download is checked
+// against the manifest's sha256 (fetch integrity).
+
+const BUILD_VERSION = '__BUILD_VERSION__';
+const PRECACHE_LANGUAGES = __PRECACHE_LANGUAGES__;
+const ASSET_CACHE = 'lph-assets';
+const MANIFEST_CACHE = 'lph-precache-manifests';
+
+function scopeUrl(url) {
+  return new URL(url, self.registration.scope).href;
+}
+
+function manifestUrl(language) {
+  return scopeUrl(`precache-${language}.json`);
+}
+
+function integrityOf(sha256) {
+  const bytes = sha256.match(/../g).map(pair => parseInt(pair, 16));
+  return 'sha256-' + btoa(String.fromCharCode(...bytes));
+}
+
+async function storedManifests() {
+  const manifests = await caches.open(MANIFEST_CACHE);
+  const responses = await Promise.all((await manifests.keys()).map(request => manifests.match(request)));
+  return Promise.all(responses.map(response => response.json()));
+}
+
+// Drop cached entries no stored manifest lists any more
+async function pruneAssets() {
+  const keep = new Set();
+  (await storedManifests()).forEach(manifest => {
+    manifest.assets.forEach(asset => keep.add(scopeUrl(asset.url)));
+    manifest.remote.forEach(url => keep.add(url));
+  });
+  const assets = await caches.open(ASSET_CACHE);
+  const requests = await assets.keys();
+  await Promise.all(requests.filter(request => !keep.has(request.url)).map(request => assets.delete(request)));
+}
+
+async function syncLanguage(language) {
+  if (!PRECACHE_LANGUAGES.includes(language)) return;
+  const response = await fetch(manifestUrl(language), { cache: 'no-cache' });
+  if (!response.ok) return;
+  const manifest = await response.clone().json();
+  const manifests = await caches.open(MANIFEST_CACHE);
+  const previousResponse = await manifests.match(manifestUrl(language));
+  const previous = previousResponse ? await previousResponse.json() : null;
+  if (previous && previous.version === manifest.version) return;
+
+  const assets = await caches.open(ASSET_CACHE);
+  const cachedHashes = new Map((previous ? previous.assets : []).map(asset => [scopeUrl(asset.url), asset.sha256]));
+  await Promise.all(manifest.assets.map(async asset => {
+    const url = scopeUrl(asset.url);
+    if (cachedHashes.get(url) === asset.sha256 && await assets.match(url)) return;
+    const fetched = await fetch(url, { cache: 'no-cache', integrity: integrityOf(asset.sha256) });
+    if (!fetched.ok) throw new Error(`${asset.url}: HTTP ${fetched.status}`);
+    await assets.put(url, fetched);
+  }));
+  // Versioned CDN URLs (pako): cached once, not hash-checked
+  await Promise.all(manifest.remote.map(async url => {
+    if (await assets.match(url)) return;
+    const fetched = await fetch(url, { mode: 'cors' });
+    if (fetched.ok) await assets.put(url, fetched);
+  }));
+
+  // Stored only once every entry is cached, so an interrupted sync is retried
+  await manifests.put(manifestUrl(language), response);
+  await pruneAssets();
+}
+
+self.addEventListener('install', () => self.skipWaiting());
+
+// A new deploy: re-sync the languages this browser already has
+self.addEventListener('activate', event => {
+  event.waitUntil(self.clients.claim().then(storedManifests).then(manifests =>
+    Promise.all(manifests.map(manifest => syncLanguage(manifest.language).catch(error =>
+      console.warn(`Precache ${manifest.language} (${BUILD_VERSION}) failed:`, error))))));
+});
+
+self.addEventListener('message', event => {
+  if (!event.data || event.data.type !== 'precache') return;
+  event.waitUntil(syncLanguage(event.data.language).catch(error =>
+    console.warn(`Precache ${event.data.language} (${BUILD_VERSION}) failed:`, error)));
+});
+
+self.addEventListener('fetch', event => {
+  if (event.request.method !== 'GET') return;
+  event.respondWith(caches.open(ASSET_CACHE)
+    .then(assets => assets.match(event.request, { ignoreSearch: true }))
+    .then(cached => cached || fetch(event.request)));
+});
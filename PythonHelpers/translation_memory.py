@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Persistent translation memory for construct_breakout_csvs.translate_batch.
+
+Words like "hola", "gracias" and numbers recur across many packs and across
+the Spanish and English folders. The memory is keyed by
+(source_lang, target_lang, source text) and is consulted before any
+backend call, then filled with whatever the backend returns. Placeholder
+results ("[TRANSLATE_XX]") are never stored.
+
+Keys are the source text as given, only Unicode NFC and whitespace collapsed
+(memory_key). Case is kept: "May"/"may" and "Polish"/"polish" are different
+words and get their own translations. The file is read on first use, not
+when the module is imported.
+
+Stored at .translation_memory.json in the repo root (one JSON object,
+written atomically).
+
+Usage (CLI):
+    python PythonHelpers/translation_memory.py stats
+    python PythonHelpers/translation_memory.py lookup es en "buenos días"
+"""
+
+import json
+import os
+import re
+import sys
+import unicodedata
+
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MEMORY_PATH = os.path.join(BASE_DIR, '.translation_memory.json')
+
+
+def memory_key(text):
+    """Source text as a memory key: NFC, whitespace collapsed, case kept."""
+    text = unicodedata.normalize('NFC', text)
+    return re.sub(r'\s+', ' ', text).strip()
+
+
+def normalize_text(text):
+    """memory_key() case-folded - for matching words across packs, not for the memory."""
+    return memory_key(text).casefold()
+
+
+def is_placeholder(translation):
+    return not translation or translation.startswith('[TRANSLATE_')
+
+
+class TranslationMemory:
+    """
+    (source_lang, target_lang, memory_key(text)) -> translation, persisted as JSON.
+
+    path=None gives a throwaway in-memory instance (used by stub benchmarks).
+    Entries are stored per language pair: {"es>en": {"hola": "hello", ...}}
+    and read from path the first time they are needed.
+    """
+
+    def __init__(self, path=MEMORY_PATH):
+        self.path = path
+        self._entries = None
+        self.hits = 0
+        self.misses = 0
+        self.added = 0
+        self._dirty = False
+
+    @property
+    def entries(self):
+        if self._entries is None:
+            self._entries = self.load()
+        return self._entries
+
+    def load(self):
+        """Read the stored entries ({} if there is no file or it is unreadable)."""
+        if not self.path or not os.path.exists(self.path):
+            return {}
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"WARNING: Could not read translation memory ({e}), starting empty")
+            return {}
+
+    def save(self):
+        """Write the memory to disk (only if something was added)."""
+        if not self._dirty or not self.path:
+            return
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.entries, f, ensure_ascii=False, indent=0, sort_keys=True)
+        os.replace(tmp_path, self.path)
+        self._dirty = False
+
+    def get(self, source_lang, target_lang, text):
+        """Return the remembered translation or None (counts a hit or miss)."""
+        pair = self.entries.get(f"{source_lang}>{target_lang}", {})
+        translation = pair.get(memory_key(text))
+        if translation is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return translation
+
+    def put(self, source_lang, target_lang, text, translation):
+        """Remember a backend translation (placeholders are ignored)."""
+        key = memory_key(text)
+        if is_placeholder(translation) or not key:
+            return
+        pair = self.entries.setdefault(f"{source_lang}>{target_lang}", {})
+        if pair.get(key) != translation:
+            pair[key] = translation
+            self.added += 1
+            self._dirty = True
+
+    def lookup_batch(self, texts, source_lang, target_lang):
+        """
+        Split a batch into remembered and missing items.
+
+        Returns:
+            tuple: (results, missing_indexes)
+                   - results: list with translations filled in, None for misses
+                   - missing_indexes: positions that need a backend call
+        """
+        results = [self.get(source_lang, target_lang, text) for text in texts]
+        missing = [i for i, r in enumerate(results) if r is None]
+        return results, missing
+
+    def hit_rate(self):
+        total = self.hits + self.misses
+        return (self.hits / total * 100) if total else 0.0
+
+    def stats_line(self):
+        return (f"Translation memory: {self.hits} hits, {self.misses} misses "
+                f"({self.hit_rate():.1f}% hit rate), {self.added} new entries")
+
+    def __len__(self):
+        return sum(len(pair) for pair in self.entries.values())
+
+
+def main():
+    memory = TranslationMemory()
+    command = sys.argv[1].lower() if len(sys.argv) > 1 else 'stats'
+
+    if command == 'lookup' and len(sys.argv) >= 5:
+        source_lang, target_lang, text = sys.argv[2], sys.argv[3], ' '.join(sys.argv[4:])
+        translation = memory.get(source_lang, target_lang, text)
+        print(translation if translation is not None else "(not in memory)")
+        return
+
+    print(f"Translation memory: {MEMORY_PATH}")
+    print(f"Total entries: {len(memory)}")
+    for pair, entries in sorted(memory.entries.items()):
+        print(f"  {pair:<10} {len(entries):6d}")
+
+
+if __name__ == '__main__':
+    main()
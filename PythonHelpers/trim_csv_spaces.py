@@ -3,19 +3,21 @@
 Trim leading and trailing spaces from all cells in CSV files.
 
 This script:
-1. Reads CSV files
+1. Streams each CSV file through csv_pipeline.py's trim stage
 2. Trims leading/trailing spaces from ALL cells (including headers)
-3. Writes back the cleaned CSV
+3. Writes back the cleaned CSV atomically, only if something changed,
+   keeping the file's line endings
 
 Usage:
     python PythonHelpers/trim_csv_spaces.py [chinese|spanish|english|all]
     python PythonHelpers/trim_csv_spaces.py ChineseWords/ChineseWords1.csv  # Single file
+    python PythonHelpers/trim_csv_spaces.py SpanishWords/SpanishWords61.csv SpanishWords/SpanishWords70.csv
 """
 
-import csv
 import os
 import sys
-from glob import glob
+
+from csv_pipeline import run_pipeline, trim_stage
 
 
 # Language configurations
@@ -45,43 +47,17 @@ def trim_csv_file(filepath):
         return False
 
     try:
-        # Read the CSV
-        with open(filepath, 'r', encoding='utf-8') as f:
-            reader = csv.reader(f)
-            rows = list(reader)
-
-        if not rows:
-            print(f"WARNING: Empty file: {filepath}")
-            return False
-
-        # Trim all cells
-        trimmed_rows = []
-        changes_made = False
-
-        for row in rows:
-            trimmed_row = []
-            for cell in row:
-                trimmed_cell = cell.strip()
-                if trimmed_cell != cell:
-                    changes_made = True
-                trimmed_row.append(trimmed_cell)
-            trimmed_rows.append(trimmed_row)
-
-        # Write back only if changes were made
-        if changes_made:
-            with open(filepath, 'w', encoding='utf-8', newline='') as f:
-                writer = csv.writer(f)
-                writer.writerows(trimmed_rows)
-            print(f"✓ Trimmed: {os.path.basename(filepath)}")
-            return True
-        else:
-            # print(f"  (no changes needed: {os.path.basename(filepath)})")
-            return False
-
+        counts, _ = run_pipeline(filepath, [lambda filename: trim_stage()])
     except Exception as e:
         print(f"ERROR processing {filepath}: {e}")
         return False
 
+    if counts['trim']:
+        print(f"✓ Trimmed: {os.path.basename(filepath)}")
+        return True
+    # print(f"  (no changes needed: {os.path.basename(filepath)})")
+    return False
+
 
 def trim_language(language):
     """Trim all CSV files for a language."""
@@ -113,7 +89,7 @@ def trim_language(language):
 
 def main():
     if len(sys.argv) < 2:
-        print("Usage: python trim_csv_spaces.py [chinese|spanish|english|all|<filepath>]")
+        print("Usage: python trim_csv_spaces.py [chinese|spanish|english|all|<filepath> ...]")
         print("\nTrim leading/trailing spaces from CSV cells.")
         print("\nExamples:")
         print("  python PythonHelpers/trim_csv_spaces.py chinese")
@@ -123,10 +99,11 @@ def main():
 
     arg = sys.argv[1].lower()
 
-    # Check if it's a file path
-    if os.path.exists(arg) or '/' in arg or '\\' in arg:
-        # Single file mode
-        trim_csv_file(arg)
+    # Check if it's a file path (paths keep their case)
+    if os.path.exists(sys.argv[1]) or '/' in arg or '\\' in arg:
+        # File mode
+        for filepath in sys.argv[1:]:
+            trim_csv_file(filepath)
     elif arg == 'all':
         # All languages
         for lang in ['chinese', 'spanish', 'english']:
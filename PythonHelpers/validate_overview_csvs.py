@@ -12,14 +12,7 @@ New structure (legacy _Words column removed):
 import csv
 import sys
 
-def parse_array(arr_str):
-    """Parse a CSV array string like '[a,b,c]' into a list."""
-    if not arr_str or arr_str == '[]':
-        return []
-    content = arr_str.strip()[1:-1]
-    if not content:
-        return []
-    return [item.strip() for item in content.split(',')]
+from overview_arrays import parse_array
 
 def find_duplicates(arr):
     """Find duplicates in array, return dict of item -> count for items appearing more than once."""
@@ -133,9 +126,10 @@ def validate_language(language, filepath):
         pack_num = row['Pack_Number']
         title = row['Pack_Title']
 
-        base = parse_array(row.get(base_col, '[]'))
-        example = parse_array(row.get(example_col, '[]'))
-        combined = parse_array(row.get(combined_col, '[]'))
+        # keep_empty: malformed arrays like [a,,b] must fail the length checks
+        base = parse_array(row.get(base_col, '[]'), keep_empty=True)
+        example = parse_array(row.get(example_col, '[]'), keep_empty=True)
+        combined = parse_array(row.get(combined_col, '[]'), keep_empty=True)
 
         errors = validate_pack(pack_num, title, base, example, combined, language)
 
@@ -31,6 +31,8 @@ sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='repla
 # USAGE:
 # ------
 #   python PythonHelpers/validate_pinyin.py [chinese|spanish|english|all]
+#   python PythonHelpers/validate_pinyin.py spanish --packs 61-64,70
+#     (only the listed packs - used by chunked review prompts)
 #
 # IMPORTANT NOTES:
 # ---------------
@@ -93,7 +95,7 @@ def parse_chinese_chars_with_punctuation(text):
             unit = char
             # Collect trailing punctuation
             j = i + 1
-            while j < len(text) and re.match(r'[，。！？、；：""''（）《》【】…—]', text[j]):
+            while j < len(text) and re.match(r'[，。！？、；：""''（）《》【】…—.]', text[j]):
                 unit += text[j]
                 j += 1
             result.append((unit, 'chinese'))
@@ -105,7 +107,7 @@ def parse_chinese_chars_with_punctuation(text):
             i += 1
 
         # Standalone punctuation (at start or after Latin)
-        elif re.match(r'[，。！？、；：""''（）《》【】…—]', char):
+        elif re.match(r'[，。！？、；：""''（）《》【】…—.]', char):
             result.append((char, 'punctuation'))
             i += 1
 
@@ -142,7 +144,7 @@ def parse_pinyin_syllables_with_punctuation(pinyin_text):
             continue
 
         # Remove punctuation for classification
-        core_part = re.sub(r'[，。！？、；：""''（）《》【】…—]+$', '', part)
+        core_part = re.sub(r'[，。！？、；：""''（）《》【】…—.]+$', '', part)
 
         # Check if it's ONLY ASCII letters (single letter = latin, multi = latin_block)
         # Pinyin has diacritics (ā, ǎ, etc.) so won't match pure ASCII
@@ -156,7 +158,7 @@ def parse_pinyin_syllables_with_punctuation(pinyin_text):
                 result.append((part, 'latin_block'))
 
         # Standalone punctuation
-        elif re.match(r'^[，。！？、；：""''（）《》【】…—]+$', part):
+        elif re.match(r'^[，。！？、；：""''（）《》【】…—.]+$', part):
             result.append((part, 'punctuation'))
 
         # Pinyin syllable (contains diacritics or is not pure ASCII)
@@ -236,7 +238,7 @@ def validate_character_mapping(chinese, pinyin):
 
 def extract_trailing_punctuation(text):
     """Extract trailing Chinese punctuation from text."""
-    match = re.search(r'([，。！？、；：""''（）《》【】…—]+)$', text)
+    match = re.search(r'([，。！？、；：""''（）《》【】…—.]+)$', text)
     return match.group(1) if match else ''
 
 
@@ -282,8 +284,22 @@ def validate_csv_file(filepath):
     return errors, warnings
 
 
-def validate_language(lang):
-    """Validate all breakout CSVs for a language."""
+def parse_pack_list(text):
+    """'61-64,70' -> {61, 62, 63, 64, 70}"""
+    packs = set()
+    for part in text.split(','):
+        start, _, end = part.strip().partition('-')
+        packs.update(range(int(start), int(end or start) + 1))
+    return packs
+
+
+def pack_number(filepath):
+    match = re.search(r'(\d+)\.csv$', filepath)
+    return int(match.group(1)) if match else None
+
+
+def validate_language(lang, packs=None):
+    """Validate the breakout CSVs for a language (only the given pack numbers, if any)."""
     base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
     if lang == 'chinese':
@@ -297,6 +313,8 @@ def validate_language(lang):
         return
 
     files = sorted(glob(pattern))
+    if packs is not None:
+        files = [f for f in files if pack_number(f) in packs]
 
     if not files:
         print(f"No breakout CSV files found for {lang}")
@@ -345,7 +363,7 @@ def validate_language(lang):
 
 def main():
     if len(sys.argv) < 2:
-        print("Usage: python validate_pinyin.py [chinese|spanish|english|all]")
+        print("Usage: python validate_pinyin.py [chinese|spanish|english|all] [--packs 61-64,70]")
         print("\nThis script validates Chinese-pinyin character-by-character mapping.")
         print("\nMAPPING RULE:")
         print("  Each Chinese character (with trailing punctuation) -> one pinyin syllable (with same punctuation)")
@@ -359,13 +377,14 @@ def main():
         sys.exit(1)
 
     lang = sys.argv[1].lower()
+    packs = parse_pack_list(sys.argv[sys.argv.index('--packs') + 1]) if '--packs' in sys.argv else None
 
     if lang == 'all':
-        validate_language('chinese')
-        validate_language('spanish')
-        validate_language('english')
+        validate_language('chinese', packs)
+        validate_language('spanish', packs)
+        validate_language('english', packs)
     elif lang in ['chinese', 'spanish', 'english']:
-        validate_language(lang)
+        validate_language(lang, packs)
     else:
         print(f"Unknown language: {lang}")
         print("Use: chinese, spanish, english, or all")
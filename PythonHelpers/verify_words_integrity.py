@@ -46,56 +46,34 @@ import csv
 import sys
 from pathlib import Path
 
+from overview_arrays import BASE_DIR, OVERVIEW_CONFIG, load_overview
+
 # Configuration for each language
 LANGUAGES = {
     'chinese': {
         'base_dir': 'ChineseWords',
-        'overview_file': 'ChineseWordsOverview.csv',
         'breakout_prefix': 'ChineseWords',
-        'words_column': 'Chinese_Combined_Words',
         'data_column': 0,  # Column index in breakout file for the word
     },
     'spanish': {
         'base_dir': 'SpanishWords',
-        'overview_file': 'SpanishWordsOverview.csv',
         'breakout_prefix': 'SpanishWords',
-        'words_column': 'Spanish_Combined_Words',
         'data_column': 0,  # 'spanish' is first column
     },
     'english': {
         'base_dir': 'EnglishWords',
-        'overview_file': 'EnglishWordsOverview.csv',
         'breakout_prefix': 'EnglishWords',
-        'words_column': 'English_Combined_Words',
         'data_column': 0,  # 'english' is first column
     },
 }
 
 
-def parse_words_array(array_str):
-    """Parse the Words column which is a bracketed, comma-separated list."""
-    array_str = array_str.strip()
-    if array_str.startswith('[') and array_str.endswith(']'):
-        array_str = array_str[1:-1]
-
-    # Split by comma and strip whitespace
-    words = [w.strip() for w in array_str.split(',') if w.strip()]
-    return words
-
-
-def read_overview_file(overview_path, words_column):
-    """Read Overview CSV and return dict of pack_number -> words array."""
-    packs = {}
-    with open(overview_path, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            pack_num = int(row['Pack_Number'])
-            words = parse_words_array(row[words_column])
-            packs[pack_num] = {
-                'words': words,
-                'title': row['Pack_Title']
-            }
-    return packs
+def read_overview_file(language):
+    """Return dict of pack_number -> Combined_Words array (via the overview_arrays cache)."""
+    return {
+        pack_num: {'words': pack['combined'], 'title': pack['title']}
+        for pack_num, pack in load_overview(language).items()
+    }
 
 
 def read_breakout_file(breakout_path, data_column):
@@ -110,11 +88,11 @@ def read_breakout_file(breakout_path, data_column):
     return words
 
 
-def verify_language(language, root_dir):
-    """Verify a single language's Overview vs breakout files."""
+def verify_language(language):
+    """Verify a single language's Overview vs breakout files (both from the repo root)."""
     config = LANGUAGES[language]
-    base_dir = root_dir / config['base_dir']
-    overview_path = base_dir / config['overview_file']
+    base_dir = Path(BASE_DIR) / config['base_dir']
+    overview_path = Path(BASE_DIR) / OVERVIEW_CONFIG[language]['file']
 
     print(f"\n{'='*80}")
     print(f"{language.upper()} WORDS INTEGRITY VERIFICATION")
@@ -124,8 +102,8 @@ def verify_language(language, root_dir):
         print(f"ERROR: Overview file not found: {overview_path}")
         return 1, 0, []
 
-    print(f"\nReading {config['overview_file']}...")
-    overview_packs = read_overview_file(overview_path, config['words_column'])
+    print(f"\nReading {overview_path.name}...")
+    overview_packs = read_overview_file(language)
     print(f"Found {len(overview_packs)} packs in overview.\n")
 
     errors = []
@@ -176,8 +154,6 @@ def verify_language(language, root_dir):
 
 
 def main():
-    root_dir = Path('/home/user/LPH')
-
     # Determine which languages to check
     if len(sys.argv) > 1:
         arg = sys.argv[1].lower()
@@ -197,7 +173,7 @@ def main():
     all_errors = []
 
     for language in languages_to_check:
-        success, total, errors = verify_language(language, root_dir)
+        success, total, errors = verify_language(language)
         total_success += success
         total_packs += total
         all_errors.extend([(language, e) for e in errors])
@@ -1,2 +1,2 @@
 // Obfuscated production version (zlib + base64)
-export const w="eNq0vWtzVFeWJvxXTtSHqZ6I6Yhy9b2/1biqpquju6dn7Hfmne7oUBxlHikPZJ4jzskUiDcmAswdzMUGm7tBBgwCBBhhIwkwH5IK/ogyJf2Ld9332pkpsKu6I3xB4qxnr31Zl7332mv93//7b//2s07WSLI67e352X/5Wf/ebJK/PTOd9B8uJEX/4S743cbq/c3LP2ysHth6/Rn82MyqZtFrJWnSrctOO4VfFVneSPI6bfzsX//Lv/2s7BaAWJVzCSDD3xremwet/Unx5vwMNQF/w7Aba6cGx4/Cn+E3SFplc4k2khWl4iMg/oHaSOHD+bJI6rJI4T/YSv9mEzhezIukv9yqk7cXcmL+xa3B2rPB6YMba9fhxzrLu1kB32StLvwYYNoES3DyS2x3DC7CqtJsIVkgPPyx7H8biJXJbl6+g8k3B6c9j4MjD4TH1myeOR5bjXKcR4COeWS0CEpYRLiIRQAMLGb1u1h8sCcaxtVDwiL0EwgDjwwzymNWj/BIcBGW8Eh4EZNIrEzW9Tu57K/l7Xgkl4XNfblnsp7EJGLHXApchCVsAl7EZO2Y7O0pYKG+a03ujcZy/YIwOZPPOCZ7DYYZYZPQR1fl3jCajCZsAmLEJmEaoxVI+7tG82EdDebVq8JnVXo+AWUCmxVrkjG4CEu4BLyIS0RUJvOqy9z1H/ZqBireHCSkpwdp9ZyAPwNG3uoGpvKMyGKeACrmSIFkGZ7wLOUEZTwhIIGRogChhF/NM2Nl/2aLFAODVv17iHn2OagHmo9P4UdSNri49yqTsMx7RY7A8zGjvgFjdwx+7ZmHZ65dI8a6a0a0MmiiiH3U9aAyDD3p3yxY3YPy4Ba2P7mFSpm0UdSJEhTIaB/SvJn4VrAPbw7m3agR7MLtJWsA2V1Im4lvAn+X9pcBzBrhCUANE/UAlIkHBn1iqKyd4oHvZnk9ceAdsA38CDaOu4PncfeNhIEPzXAT+SjbqF0i7CPLBozqKuK6zvtLE7n2uGF1j0LDCnfozHZow5h2rfBqIRUUcQ26Jhrs9Qthkc+D/orXB9JP4joCdqt87+hgO3hZ5KERY9s1w2xXXdRs8Wg/rCPsq1cNuOqVo3wjwBjjaVW2khgbgRG0fHsm35eMtDG8+P3gyVnfUg1NtRLXHi1yg/V9qPv3QYVFXUB1FS/0E2Hsswr0X7xk+ktVd+KS8dA2+KPotNRPjI6+ayasmtCQLPWyGXNOasUvmk8Nt9w7xvZKc/JCD6jG9AgwrZhPR3gOLTiOtQ3C7/QCu2mRzaWiFvvLC0Et9t5+vpC8Pdfaz8oRPFZuZ3jtxODsfdLxpfZkoc0Oa39delK2yzp0JbTn9MzC2OAfGNPv5WhHrIWf/eu//u3P6mZV/u+sPddJ94Gfxz69eN7sZge/Xdxp70XrWlYfVx1cc20nOLVKIz6nOpzmak5wMo2EXUD1/4LnN8nnUyL1yNQdU0dsogsWOrRXWiLfSL2iyf6QtcTeiroq6qRMcE+UQr2J2CcJ/siY+0DaNLbrO/gMsb8wZsjRBo4YV2dZR4zqO8zpj7elsR0dM3A/2rrFlm3c5rzf4Pxp6Ng7rcCPNgEj6n9cGf8ETRxr4THl+GM1Y6QVRzQWzdlCzMwBt4acypikLOoUBPf//uwXv/jgTz/4JSjcKuv01//pZ3/7MxCn3mwPVv0cUMpf9x/u76+1PoK/LfKFInd/M1i+OPziCZMVeasR/qausulODxFbdd6eLUAr/OLP/vZnuxvpHDCw92f/39+CfGQd/D9QfPDLqSmmKKZ+8WdTH0ATeDZRZd2ybNRJimrozflWIynoNOFmFzqOIrv16pvh9ddbq2e37+PhhH5PWjhD/dVN8diAxs7AYqxFUooMNHzhUcxvZJh2Jssr6871Vxp5O2slWZPmYVcyWwAkrY39Sf9pbz/8or9E4zG8tj44fWzz6rPB9XMba5cYf65k+oVpWnYOsZjQSjneiAeOIdWTcfTCeVq302lmGZYESOlaM7C59erRcHWRGVyoqmyGeeM/Fh4gdfRGaJ9y8/xnaTdrFqW0y+Pev5lHLX+zeeE7brmTgrxRw7AFmC/wp8KDlBGGESul7AOVVNqv8tm8ghZRUfV+owj5m4O7k6wD6vvq/qTELTAdUL39fC/DDl4e2Fg7PjxwZvvg+c0bd4bHP2PNU+E2J9kLvtvestid/A5HP2/0gL1GAhotarFXzie9LGoRWlqIGtn65uAI9myRl7NJ5+cRdJoslKwDqrRV5J0UdCV+XcOn1ER/bRpHhexRDzam5/ZJM8PlO8Mvbg0ffj348hq3tLud7sWGst2gq6mVlBHTbt2bhUGJ27FewJQtg7cLDfleLH4KLVgvFDvqhMJbH8pu2UkIXwfn96d7INQrHeyVDc/wxKXhZ0ubVw7LCLUbC42KaBeQkP6Ud8Qmw9/mDQYuxlCDuiBIVhcOjzQG/0kEsFGlvN4KVBG0UI+voVlNcTHLNge/aXsCkS6kcCv8+Bovb6Jlmaevpa18X3+xC96hcf1gP/xrwnH3xuDYOvpz+9IuSR/9oeg52iBcShvLF0EwD0RMPDBM5ocvn45nRWb84f5oWmDKt47dD9OyG8hoQgJKPCu5F/+AaZPCgG5SgIBmJNDrtPRv5fNp0Ls5nid7Xbt96yvRsnnK3Sz6K0gSA5SO3gjJcKbtOZleIZT57T+rwF5Jy1dzWFYPnRLbPn9wcO2JqM9073SvVt2OREUEUToEIw10thWFT6XtDh5rhRF8+zkIeDS/Bx9w00VuCrTIgvIk+tKTG50RSZ+zoDfr3nRe9J9xw/2H7O6Hdge3HgyeP+N24VNute6vT5fdng23Yljj5ZuDOVqy35+eZR421m8PjjwUDN0KCoiZ3IrUnVekpj9JvzS4ddxzNIIJxd9bw/2HqgG+fSU0YuCJCJuatJUSZ2BMofAqpv2/VyyDr07B3j84Ec6BGLPrP8Gqj1j0YI2DthFrfHzNWWP7Pyso2LQ0+kvt7J1G1BlQb8vQIz+HbN6kXeL20vfbSz+o1XKGSkxHs0BFBXtn7NPWd0/EMgRjYGZgdGT9aIpyqeQ7+p/p2smqWXWrKceP369VPxZlGKusMX3ldVVQVF5LOQ3zLv1iusVphR10Qil/x/9XWX6nJIsUe/FzMoDdeTrrBRDkYXDkW5NBJ39BjASACVh6VHLGNxUZ7h5qWEAfj+4nsNUuaoC/93uJ7QNXQAlEm4gCtqqph7FNxN/8cvImIqLoTv3NL20T0cYFB8KT0FFHr7/SxoXfIhd9sZXk/Zskd3debj64vHX8/uAabqaMCHREUuT+N2lbNUxA5r1hr0njSnK8+eDx5ovjI0gxDC+3Tob73jJJq5QXxs3eAsC8PbcgjnJ/DRXX9uWvB6++BTEdnHmBS47JkLuyy4cGoMPSCHISmkeKYAyDu9bL6l6HR+ztuTZulcAx7K/BlnxlWods+9in298c3TyxNDh9hUetw2Q2ZiX92M50wAQVGfOAiKVAEYqD4J41QKvm7Wl0U2LWQLBBN613Y9421r4ZXP2BeVuo0moa/F1jzoPZlPpfGpsKznwyaIw4CidblrSZw652Pi96zG9/qQeaBLYawuVg+ZvB7bvCX9e+RRa72HwE0A5bIf9rB2uIY3BjWNzZNliojFkDjx5PshFJJeLmIqKxOJRlC3bExFTaznpEFgZNcCIYQwjkMlBGz8R5o7/YqdIZ5gOFcob3F8rH8ddbpx/LIDVS+LQ152Yxp1/NeHYCYgRoWCNAMYpIdjefq/F8vjApwuMWXV0gQp++UE0hnzpNIb8JCz/geThDGoGJMVgL51V/pZtXOHB8ZIv+GGlxFGyTycEj9KYGJ79i5rJGPjNTutHCozL4RRisCHgc10NGeBGYHuDhjkknsQX0yzZiYDW3z3/PTO3G74KOILIwVAIToRiAo3ak4nNI4+ik0vmqDsm5u9tHPuemK2mZFnIVtZtWlRxuKIDRBkKjkjNUsDU92DRnVVCV4M496OImvOF00eDMke3b55gHR2SD4JECSxE+DYhCI2sEOYY3BsaD2kwbVdax2blJk/z2DPkE8GfhdGP15AD8z9VPhNNsd5V6dS4obrIUl2AND9kjnAgkQvDkVTYH+x4zgcQReAnk1NJlweonW98fYcPHcExh1i/CESsYY0ewBjmONwYmi2NX2XYmRw6wAKv2k7x+cfDFURE88FlrJ3fNIsu968CArAwMC/kiDA/gqXlV9PbAODnbDE7wgoisY+bqMkotCxx+H9Ya07tlJoDiUC+Yc8gYDsBTczf6d9NqzjS3W1azbDrjhbX2Wkcn7e3xw7Mfd91udAQ2rCqGk3W19jrCcABM3asijt6cD8oAGNlavKjLG9xk4YIOjNttPKQKXCAO27QmgeDIHjwP9BGxowzmuWHnKEX/HviafFFshyjbXxyDbaKdoBR7y64cabWns96cHp8olMIwpRLIcmWKdhZR6OIQdY5bdr84QMJvnDG/oxFmAsh7eWPU2WAWHBZLEGA4AE89eS+tvu+P8Jb9H4NP+6M9WvFmg9P5o1xOdTdHPMEf6QdGPuCYo/ZeNy120Zxf9R6vKnhUsfNjukVcH9Assevj3J7IR3mfh+L/OOJB/Ej/IfgOweK/096rrVdDv7ORlv+OWM8fYTtju+ktyPtMWzAZY3YnJk36y7uCASKQzfW7Y2ZoxASZuaAz/rmw6M+vw5SqpTAr4TT6u/W56XKncd+vb1XXqoJ8t3pU1eg0yURVZmos/vAdCseUzYTjByT/MEmbCUxkOtv7h9FTCOha3uw//DVNCsF/6I8jNj9ZG1x7Iq35Q4k6a6Ttf06g+Q/9icRf73AiQZ/PTU0hu1N/Hc4j+vcb5XzSKWGH3oYdB1/e3Oy18AQMoxbOYUzO+Vk9bn98fevxs41XN7ee32Bj0SsX8IJlNwghXd6Us3kXb4jKRt7VmZmM7ADtskYwmDYpF2QN99CzqrIagRnnXr6Ho1XWZkAR5nq7NDh+DC+eb5/eeP2IQWdhuLoLoMayZF8+w/BNYLhsz2bgY8vBX4QdQ26eOzr8Qjg0BCYODOZz/UXwiqsKQX7DUay93aAjm2hr55S71w8GP1zcev4Zo3VrGJYCzDoz5TD0qEtZchhGbYT0mXCStUAxtZOymWA8lwQ97tI40wf7ElptuNovPsPAsNeHYH2hXHTAo4NlU5joVnS7wDAemU4S8eRczpoH5w7xETNRexcREXQzljcrmFv4t0h3sUafQVbI+bizPLx8hRQe4FdZUYCVyObTFvUuI8KyyCycP93FY5KR58swCbHEA7SxfpQhgTMeqVFMRNMBSxt53V+HLUP/bq/UtQVKqsDFxVpaYNfObd9YGZx7yJhAhmdHeKfRreXe0rBaDTOAZZdOF+TCMsAZkKMXunjZFzAC5cii7/GZKV75+GW/9Wx569HXY8u+IoSw8AmRW3DgY5h+3TsIJhEW22WrSOeQZeC1/g3FIMmxzdsLIJyLOJBgGmHl0RDeBFdh6/Hy5onLm2eXt+6gIgfFBRAfJQuIQE20MaaMQHP8XWaDgeMYtyEzg7DMaEARYhvMbo7z1Wqn03i9RDigh5p44d7SGAl0E2RAb18Z/HB849W1wXO5a+/iDinZDVrV5grwdhEctxBhO0RzsxnO3OyAxSjKapUD3/NJBtvDNISpLfBNeoMjOrcWb20uveZ5rsGwQD+yFraR1UIu+84ABuY16WTdhBQ+4q7PECwIckuwQe3h1cI0an26JjgN7QzuvIKmthdfDF4fAcWPlocaRJcfJQoMgG8Xm1lIxRdr0eFJE6Mm5+jCDFYZjPYaOsvLFEJ37szwu2fD56e4K1W2t8QIoqw7kzJoCuPcxCGsYcZhUTQdMLgoZKwdnoEJEp9GK0yq/kWVwiJupG6A8/5im/z4fTzAw+t3to+iFzfXw+CB3eleN8Ip2AvkxQZZ4JBNdNsknnIPx3BE0IMTpzfWTk1AB79pJpsewTdAFgFUW7yOuT1aaTB/+2UVg7V5e26PBlpcXIIljPbmu+ciHO0qzRJUCgm0281m/Uqe7VXNtOMakiayP6AJj864pm57s/3FpJzOphn57bkebYlbivjk2eDL66p0ujAuuwuMQyH12ptNiZSZNIxAbaSBiD6Txjv4x46zqdwfZztgrUNvzHC029nepAsd+h0HqjI5N284nlwJlYa+wtYn7T//QK+Im99V4AkhORqLcyi+OHhnPh88OjHupvxkb8IZ/Hebe2fqR83zRNv8IwyzrMAin0d7XHbrYDnxxCCYz8G1e2bqxIhyfE9kfn+shcv2gxmajYycinaPeVCrYxZHzU0wNpEdiIyAaX/4w3S5Kyh9Hur6T1l7TlbLI6qYwqdZB4OUOd0bVOM7laLTiF578VpyStDpqGx3OqL6mBJ2hqI38L4Y49VAN6C2oGv256AfRtQCAnm98FNF2WSPuF3aS5Z7J8kb34zVaV6BYv41aFXcls3n3V+NXwr3nzb7K72/4wvZRv/h//TbscHJe8NnLwarq8OLd0a2Y3kXARu/Shbaefprvyf7qx33ZEKTwr4MiJpTfxU2Zmk3nU8rch/6K3xdxweHTZoinNjNF+cHq99sf32U/JNid4I7bgwASKdR2DEir9nTSHlGS9FAl20ZQMVK5Gyy/5BknDA3Vk9uruBJCx728qlk0u3NOXxw12FFZEVpm3Y8sZhFXwPdAz740ud84BawlgL0wZF7rKi6bZh5mLJajpuMuuivVL2uRcWPIydlkuFSTMeaYMnh18LWFkoOdQZbxAbx+csCOe9yNiXt4UE0S0dZTavm7PFg1ul8r81HDF18iEFnKLQo7lwcnji1eeURrYN5ULvgwrSgmTZHyvQaZsl7s/KKB6Dwl3z04RBnSeZrOe5i5MHZT8G9D+AzZVLlRCiYikQBHEsUmurnmSJKOzrJuR76nRusvoJZHh7HiIy5tDEyy2AJZkfnuA1CWOfZNK1KbIiZ7yT99ZyCOfiMbfXVJgjkrc8Ftw0akUUQATDUfpr3ltACTzDozDn8Va+/NJeSPBEqTCWftbzaOk3rBQzF3pSPctJdTALjW0135GGL0P/07iNy1H2FlQVhI1AW4D8VObXcSGsORnnAp1oUvQRq+uhDDv9poCdb5HvJpFRZrnSzua0tggDlVzuGaTUAm3tp63CuUM7NGsCqGNz+EjYS4I+jmJJN4PZoVVsfqKHRHoD26e0BM+1VQf/ebtitUSjcSFNHTg1ur4VGMtBju0bVAeK1xvSByY00KM3IgcScgbPcCPIEuVF8DWdqlrNt9rXTnM5DcaTQ36Zgra+vDW/RE9rdjRJD77vdkk/5VgIdRsBlDT0JJJggi7BcEHBEDpfPAXKQQwL3YqiIXhLLLrSH/yG1VZfddC6tWZHv40O18s1BNODbX53aen5j+wHFLma4b2lnWStpzeZ8/L3SSLsBYr884SK4wDehxlwDrlMdiOtYZizP735wKdJ9SZqn/AJ9fU+Cg7FEkVm3LsMYDG++xKmq8t110sw5dqwugUpmqtmW03twE+BXHglPcJsMtHlj2VDA6rb46RRZFAMom7ydHBFkghpbozA5ty7bGmXXKBZmQRuRBHw7VrCZ9O6XxPHsZb9r8/ZLPp9iXPI25zOJN4uoeTH177plwMtpDQPtF/HxsS2mW7eH1xdlZkCFz8WLCbYG9Es3OXWRZiRCAJbjfgw0bkHjeXvjxYXNE/SSXb7BBzQgMvNJgOJZwWdfIE41x79TiHd/bV/ysZwNYjSl8Dg8ePvj4ZdPNl58z0ziK7L6T7vJ3qyg27cUH4I5LLkjqtPZAnZ7HdBn+nfWRn8Nb43W9wr61tdfDi/edNAwvm0Y2axNOQ0YqMgdEIeZSux+WBZ88Y3H+I2xpbG1+GBr8WFQX9jUiPYSwBFfZrbA8x7iARe29sS3Rf1hJ9Fagk5tf+Faou4kCIZNzVbpOCg1N9crK55t8Du6bhuAd18t2wAMT39NC6TVLduwxgCJ2k7nlDqf7phWU0y5rQlX+z18FbQ+I7dwt44Atl3x07khgDtUvcmZtIcVtzJyJs2DZN8xOIy6RQx+Iei/Bf5868gT8c68NxZ8pchJMsfIXKLgCgUfSJwI9h/YE1G3xvsKwUMwr4D9AecEOFvt7bOZYjG/ZnK9nXXW1Uye2TtnPoMtMiNkhkdNTmRqZDidUWGVr8o+KHm5iqXvRIma2lRNTFv5Ee07+XPSg0GpqofeThum7kzJqXqL1JqOTqQeRCsEfcBDMyr5sQya3CmZCbSTgSBNJkdBiGSdT9oqAu3/HN0d9mbePPg/fj8oeH4nKCIU3cr95Q47QBW3qb8MGz9QGtU0qFA+qU3KXdm8iK/FjWzdPTg4epoik8EPQZ8voz0UCFeJkSqwq5FbG8Wic0O7l8KzPL2POq4weDAYMBYk8GA/mE28hOZXF6D1+LZ0+HBx6/VlvTmq+YmxfstriN4YK5lGTz5cFMbzdDZVkqpbhoPHOqfjBD4pXuaAmX16qDA4cHl48fuN9avDi0t0oJHjyQL512k1h8fbdX+xM3Jc6k8w7dQyOg/1ANrxslPjBRZoC9lj7icDSRvka/c2z6C+2gtdxIfNdPHcgYWXpHLdUNc5eE4S9bNAoya37mukB4Y3n8P4DS89Hjz5FhdvntQ/B51Dqn8R7y0ECEcDNXAuwaP3UNUN6T0GKOxOIr4I9jrBhxJps+yqo1wYIWUNgG1XBw+j2ZycGD6FGaRnYNlC0qX4LfQOPEad4fTU/Zvganf0pJywCt5E4UH5tRMbr46SQMFKyHDH1OWw/ayBc4v7s7kRtP5KHaHRwEhSA4bEgaF0BgFVshkYrOUywBHC3uos9ddoD3r09MaqrbQEb8IKG6hGocci+CdLOBaG6fcPWqAwdtlIbaydGRy7SStuHpZMu1mRfWBySzaW4QqqLXYePF6KDfqcIkheXxs+WRUEfsVPn+d1uJbIOr1uLQc3fMbF7gVaJxqcwerq5pG7FPLSq3swKw7FjqbJEMLmtFfOjV5E0OiwHaJ7CFjIvP749iHp1r1dakrxNSf8ZIiKxcRGQ3e07paCr3pgj0tOB0nxeOPnzvjG6brH5Egvenz7/vqI6ZVMmveXQ3JlLJKfsS+vwr+xfhRPoEn+6cJZxJ+JVPb5J6+JsA/GuVxOtI3OlA4OA3hZoHBJcSTh0qvg5YQAL06SysUXu0mnrCihA2yD8Gu74PrDlA+isAN0qwVeZmpZj/DVUIfTHQ0vnSFi8IP4+kxoi7T/rRzICjVtOXXoGUcn4PYSz4HC8JVdspA2KZqKoGBfBA7TnOsPqNeiNKz+Sm9kWSBz92xZABig1qideFkyo1W2kMp1DqDJmMlzMHrT7NBnce+MyHdPDV4eYPyNF2ci8KxRUPIOxHUzkO3CHDksQgSoE3h7iSdwAdVkwpK8AN8GKd5lkRc7UFlfFjC4YpJfTXb7nebaLDWPL5quKNzDYjzERrOtNcsoNpHNodpCZwZ5HSzuksuXXaCeF+jE+ezg+VO6+UizivItiqFSU1NgEAuGMeGy3Dz8/caL03STlvOh3UTz4o2BmQCv/IPeD1pbHpmD5HNeyNObL66Lei1UNTutHAK4+BUgWJjhgRec8mtv2ynSH6PxRtXdTqppXC+xvpLTBQwFsNAXVSYS/v8eyVed8ZOl3cv5uDyaFHoREeH48Ys7XtbiUOMS/ZiP7ar5tJ3+86hv3V/+kGR3F6yFKLvH1uPTspSjCxcET2CFRA/y/mIHRxu6nXamprAfU1PA39QU0u+dmsIlNvUXwfsGu5HN1Hk3rc2EUPrRt2c6stm3V5SHzw5fLIJJ3r7+Fd3J5UKnHmWroUhqV+g6ODSg15vWAN2xy004o/9wnO+1Wt18bxKaAOVMd9KI55opQ7hMms/ndPzIfaADnlm+lFVtcmh44QdWKE0QmrydVca6kpszHPDwSAZ0OUe5rNFz96fm3K5XnLwCemMhg89ubB87vX3s5OCbTwbHnwwPS+CgtdnOMo3LC41k1Iq23SrKWTx2D/uY/s1ZXCyz1psnDwdPnmlv6prez3Qy16H9jJE6I58oMAxiQfoTrEiDg//GunHgxeYPX/kOzJQwIZ20Vady8UxHga4dPxsV2LBqxtifpdwYby/sGllTG6t3h08fuTXVVcrQEf1FmBoD93MTmhjtijQSzYW142cj4PrpqHszFCtZ7ssxRKXDF90YKr2221YwrTU0AcNDnw2uPuF1vPVoiaeHEYDT7gyf9TfzZsG/7K/sYtS4LYkuG2tnpAUPL9EAAdpNSA3Kvuo5Eb/J0X6j87H16PvhoZNuPuqcCW06AB2xyiDkvQx+Jfj4GAm2glEL8RDphlpa0nHSzXUSmuzmIw3GQ9VEB2t0Xm7OoYc1MiMHvhg8WnHTUaWNOpoMTLwCq3onfFFaiu2ngqDdVBC0ToTAhmnYD/IfycTDfXQlYkJ95Nn2g0uyWZ+bS1vujCKjKGNTrFnCYLpSRsA0qkABmT985kKwok75clmQw2LptNOGC0XpP6RVsjznkbevXx6shZ4TifS7nff2UAKgUcist4dSwCnkm6uUq4yCbaYF8+jz4acHN15fV8yFlANODBQktwlexh5Z1+V8lRU+buYgprl+e25XNAwvb24+u2vM1j2mEn7rMqcfvbjwB2lYWR7ZLy6GtsWl0LB26mw3v05QfDxsdzq+kxfOXPXvzZC47BsRyMGdUzCJXkHmjX1ezRdl3ihR8evDGXpMJvC6Ohy8HxbG1mHB/MKKL5mDSoKyJsIAdenSeVLkD23mwYtsy9WHBYFuHTzJ9x/TJU5+XvGJdTOvqt50GoeWgmEETtD89W91rRcGyyEPYqcIdnDnlYkgRgMEIRT4IvXrMZ3rNUrQKk5fyeAcbI6rKvQcTh3xegockwqjWXGaQZxEUwVUejAoU+0eHIQvtEv83EBbdnOz8eomN2vTg6ee3V4JfdHWuYt5N5F5UnDXz/k8rUSLNTDNdVsiyTkVBWU+eXOwK+cETy5sXrix8eJLelQ1C8unW8J0trhvu0qcjroHvatdv9CpcI2I2Qro3CXoZf9hr2lBj9gQxRvfHDxeC90jp4+blunTxxXSvutZ3ugvd/HEtVtzNkgcRUxuQe/89HXom/PTdND+ePj9cYwfeHl7+Alu52q812umnCAGAZIUsxhKmk39lYi/mbSnPXxWtVjsZNJeH9u+8sOISWumtWkDXiiC7tUB63KM0MJmVii/EKelWSeHk8KUhs9ewLBtfnN2sIbnatkMCAOpc9zqBgB9FLbIb9lSNhR0K9NO5JnGw0oa4EB/2GgPL94BcN7TtLoVppSKoCnxKe7Ye40dojvNzfcOPp5SmHO/8eq13zdEW4bI65YlBNvj3bBkSa/UvG4GZ2/hSr3+g3OonSc95j9zBvPd5OISH3fBqSVacmRjTzl2L9k+mlfJ21d2JSMP0ruO3omL3DcdB3LddBzsu+CzRd6a96LMY/JeWewfKfvoddRyUKhOi2y+yV0xR8U5KXJwMJu1U+u3+BNMyp4ErWe6fVS/IZj3QCfuAhOyoyDm3Ftyb2mV1mysNErGNZhVZ02ts2iu5JDBjJxQk3kLRjOyl7GdEV/ImS1vsMimOGOitKJvpXXV4tI4KW8iLqqsofNsNGOdDzpT5oqUpKrioIOdggrbXH2+/voQaDhWOqZogoKRhlQNyIom8VeHU+V9wv0gzngHK098lGSgzvrf9e+Wnd9MeN03i7P/P6JLQ9h3HToSn2aABwBbr98m/ympMXkQQ9mxxp/vFEHKZDNTU0KVTf25u0mkNMFgXTmh0wOMj4T/2IOU4fErG+tPQ+a8eQwwx1OAjuQYzpE6t6NtAuPEgIolCaoNjHNSe7DUY2mcyB/FWfbvyJlhaQBL2c0KSXQOZgqvv3//gAtQPMTggOXLnNCq2YZ5axYUoCs1GrpZ7ou3EA73zyG510AKGN7dR7DUVUWVntb9lflUM+B36PHj2wt0mvn49Obx7zfvfMkX7jgcMXPtDL0+445xmDuH5CZAAY27CFaYE1TlDhxgcKoAVgIN8LJRYhgltmJ5iaMWXW8pZpHQduUtIK5HsNwAGl40gEtjA6jsEaAukjbdZsBMR8MHv2SHTzoM3L1wg4g323TeWzXxh55dOc6Njt7oyI0Mm7AkOLk+l2j3mqne9eGZuRQ+kRQJmv3dR7pvrK8P1p4Nj5/j9byxug47CgqdQSjMUM8CF5BdSyQhO7Yzju5wA6jK8H8c9+V/BPcCoskMumWVzkoMHK2rt1cKBwXLanBnxXDaVT7Lmqz/LbScjqB4jGxWapcYBBcuIQhNCUwg7RDcnlcaj6fL3LOCi9xY4RXOmUAQRmcD4xI59U3OiQsWY142Lzw3XhZC0ljC0KSi9/klBgeK3JumgwiXa/XZ9cGj67ayF6ZTSbTaX0K6vONASr5gmtazDCCEf5SK22YySwdd4pvPlLy4t+f2J2IPWDpxDL55YdIJvv5eEc0q29XrJJqYQEAk2YmDkR2+wohZQRjqAaNomtg2B3VioiDsx+8fzHBg4X7H0O0HG6vHyavCaC7QitM1OLeVbA+JtqcuKP9Ewxpj6WNTwZItu2BxBhYm9kosBe+67KQch0khCygIc7z4jL+zp4bXTsH6szGjd1oztAp55GCLAPtFHTkDlbHjQhMMKWyeFTxl0/DYXyC4eAgFs4wZ5aUZcwqr0w0mIuMaleH0jBooj+cEWOPWYD3DCMsja/xODmwkta0KBwdCPQtRNHdW2K9wHoXzdLxj4rwS80ZiqsxTkesgoXfse0x2PMw9CCb9R/sFwXpb1DIpodjWeiPrWlfbarYwNGtNhvbM7DlVrsNq2TRgQEFtq8I2W/OTSMpAgouYVLNXzPaEkfQyv2JkpdzudjlhDirDSCkHhWyKWFWwKs+g9KiQwhJtuUhvH349WHomKk/VneT+b7XlmJPXli0p/F3aKfeqSnIKJFIepjWCvjBlEcnzmIrwuiGSYhXhSMrGJcyLlhcqlajxnVJKW/Ju/Zskzdv95U762wlv7pa7mIcVrNWvo9d268uDR99jbiK/V1po5wCSNPGepbsv2if92Q77JCKBXZLQZFN/Fu2SfBWyqIbFfathMVK9a1Lhrqj2VVz2Ki6hM1akK9RBgRHM9tNTD2HHarNIwR8qzULCmPnikVyYpZHlTcuXrWXcEG+8hJsv3+ZqiGVxBckAKzGdKRZ8KTt5g1KbjBZu43TBVrRt8+FDurpGWFdEkmq/jLGKpWQ8pwqqhcMejDIa1ZE0TDmAybv9pTpilArkWWEZ5hTr41FtGc+pryXJ5WXGh7WLD3AjbgXYV2eLuI0rSgZcUXH7sgnchuo1xi4XsPHshpqSXMNmjFksiRMza7i+KFvErS8sGWB5ie4vcirY6KriWEUcWZihhCRGV8HXxk8XllMnYQxJwax1WB3Y9uc3BsePGmSdMZlAs+FjIIIXvqqymypnWmXHKuwIZ1RiR1lDAssxTCUDFSQExTic20sGRXUCFc9qBAqisJNpzUir02M1epSZUC0ya/hU97TG9meuUqTHsJpo0ZRFtSIJTvjA/BsUY0W5f6xYGeeW4lI/pEDaqN8oFWnWQBp8q+JKziHQ+0B2N8p24+dlwmAOSVdOGbGCx+IOhSoGSYmndqasIM0YK0VpIFp3aAREWWEwh7RDwJ2voyd6O1b9pvYjRe2rZ1nlLKeeI9VsJbOY0Gs4VW9OscUqzascp2xM03gdM6JdvAKIRF/l3kn8JFl/t6CbkDspbLxHAoP0BVl5n6CokNiqdnWrrGaVLWRZe7buXIEqK05lS01Wx4SCVL/80w8+2LkeFf3tpHJU9BeTqlEx3ngxql/u4Lf84pcffBBqUf3SZQdopkVV7kpSeVvGZQHeXmlT2nH3Ku3T4cUj2wcu8Ku0hayA4d+lD9LKbiNboMxD+DJN/UbGZUw8XwFQlK17pwDJYYgtVwjNe5xhAhEM+afk9gtCPcSECUe4xJkWM6mrHl6ta8Rz/5b8QjKdtxOkp8cux4Gc0/ArTWsERPOMgS/chaU/L6kDZyj5Dt0VvR5ev8OPc/QD/lLbl58kuenehMndi5fti48QRd+9CLGU1mNaTXaG8Wd4HJ1UadPVQrLqR1qYKMV8GJJWno6giUCmQcodpb7SkRU4UgTLSu+S4MLGx6V7pVSda+2wMd5cf731/HE4A+niM0E58e9VoVROWVlGYEIwUiPSzmNi2rYmHyGmfWJnbNylu32uudOZeyl1xGSaxllRLDaGmx/8cJibb3UtAbBQtq2cTv9uhrWuLOOuPIqm2JFznw2/XJN6Dg36jLLM4jpqyM+KAyi4VSAe8GWKemDXD3AlDHoE10zdShQEHYkCH8c15ZSiwGws2BVfUOr1ucFnr8JpmhDw2YT8oOfE/CMp1SZV+umvUXzvtSdAv3n1kdaoEDIbGvrJslsXOcWP1HhdhS+hm4UlucYnz2/PoGe4h7Pd4ykAn89ggt7z9wdnXmx9c3DjxUM+TOJ6Wgs4gbDHh385N1aRojzhW3udjnlqi4MssP6KA95YP7r13RODFDxBga2V55vfRGmIRVFOYplvGSJ26aKBeaVHco7VOo95xR8tNRpAIp9yb3HmBTJJWAyk5GAYunhpKZoPf9FJ5bHe7oT+Qyl1CMsFSW3C7vkaJgEDXAuVyrAa/M+7FIJX0RMnRmOHsIPNcR4YG0ZZRzSGEtA2m2TUOf6e2ZPzobTOywY4QAnNStkpP6T8xJJoiKTsoeTSuTi482rr9WfDawds+PCBWo515ujtN5Djwwodt3iG49n9kp+jSuAMfNzuL/2Hzuu7pzVM6ch84nfrEnyPKTkkbgx41GA66J+8rui1fMk56CkeUlz9KtTO65StqOQcI4Z6c2CmZrNWCBDK2rxQDBDWhiW3MpQFfA2qOQITeuOvGUv3kL0KaVDPvBgeWrE1UYJfX0jiJaZUd00XbDqdjCyrwbm7IyvLFmce1ubEo1N2IbxTYp5I8B+c7xDb//da/8jyO9sdWW4z2GqqzUy/tyQUWVMzgu80gWL+vNWi6WiHUlxg7+ikEW2W2avYyOxgYsxKRQbmDzEIwRj8kWr5p4lU7rWX7dcs1uKTNQ60cEsraLw8FXiGFiVCGuSnyjUHZZejeIRmVSzzSX8Lvx2P++AsziAC1e9GNwT/ucr/BJZfOkPpnNeimA/6O3A/MJkztOB3BfRXks4Z5f2/+Z3BBzvsDKoc9gWS05mUxNQH7hFL/25VzlgNFVAsF2h4Tl4dnLxPb+XLmRk7jtsPmgQ/NidKiMGBxUTcM+/GkKheBamAJ83+2e5RGZTwBGUB9eb+JCRelRdfmFn38n1OuspPv7IaU7PMlElXKlOUzRz8TEpWGaFX2X7O4BXQMd8ge3yCe2x9cPYzA1WOCdCxW6RN6HKryOQlMcaqvb0gT5TxVTAJ59nh6Rv8JhgBZ9MOUPHj6f63eCYkD8jaacdYoyh5icCUPVWp9XFWMATz+LntA7hqMRF+QhtbBnPMoQEpE0rg2yGVv9Si1zYFKhuNLP5i8M0nW4/WOUorQ5KFIpViKQTQLLuu8mT/bpF1U8zKXHPYFp3HrPEz7MNnhyv3RI3AZ1183DmnQIExPKpqWzAEDRq6EuEa7vjnW48WQzQEfS2xEExpwSP0oy04ReKEjf2HfOdBaINHVwZ8w8TlMXk+BS+wxoXfMt1GPMWIuLUFzuEHzjcv4blw0lvRw2U9glPqKsW0m9VcBGJpBwlpcJDSAzEaTZ+CuQnE+FzYF+8TmVzmdDttzia5+eIQL0/+QuQyb+DPu4JgBgwdpnezZIC8pgwvsJVikE2qBzwPKUPTxsvT25ducM0KKyfWLhuhThfQ6NqmMGbMQYrSdunG8IxmjOxldHBEhK492tLK5nRWakWGxbJ+MtzWZlrFFUl0V8q5f6q00+Psp1iCQGGk3NFV3q1jPYKTnOFT0GizwmsllZQ/jrFaShijWOTt0L97PLIWwLJ6BSP4aXgxgTO5ejS8aYYvwSeC4ptU3QoaYIhjIsgoLTShcu8JVfeBmFWig5yp+dbi3ppiIphxYJFzTJglBxe+bJoxRyYTub8ah4xwgi8wQh42aUgvXjw4peXIC4hOglqv5n6zpeZnEBtrxzdeHMAm2Go3yZ2H/3VT2aT1l7Ahe+Bi7XhGxfYzow7IAUQ7NRpGcDW417ypAj+InskFUPPtjz9haEkwSqOouyw/iiOII0geYxQg2qhxrDo+dy44gwhtNTArtxhL2GYMXh9hM7lQpfIpdImi6dMuphW2JYgMuXl1cyobsyZvzIgPtzWjnkS7M5jX/85P0ngyC3yCySl5eUZ5LteeDq7dCxu0pm3QdEqzd09omMyRmWS69W6YwhKVoOyAiFQH2s8UP5sIs/QeoohC9lo0FtBiOefpzi0kb67u9rN7Z3D2saEUIPq03+Il0tRyIoxmRcwJy20mAci2keV4/XUCk43kxFcH4ru9y2Vz3pr3pLwPZa6TOk3qL5mnpG4NekjsyIBfZB6RejDmu1gCo4KufzZefD9cPC5OijgVzgtw9t+Mvpp7s/Texr/bwgeDPGJGhSsqJEGmb/OTl9sXXjjL6c2mGT8xe2zxqHBNsHVmpoJ9Y8PGRkhsD381k3FCACwCBTtXej53cnHjBTKwu6a/IvUfdLQsGF4nNCeqi3+iMLFa/OPUljY5yhQqFdEof4CIByGd2FkUzCBHEz8R+zu6cUOC347v2PDjP0G1/y9csgLgwNn8l3jrxh8hx6tn0HId/35kA8cfoKj+OvlPnNL/H/0u7hc77eKQkDdwTfof+CdTvwgbuQ7IE0WYWgW1td0JVx13hf7OY+1xLmXHn4fqervo51BdzwAllaTUUWaMCMBTywliM8XyJHiECAaiUctdJGaFWWknkqRi+PXj4Z2XG6uUhq7KUy1pt5fmpk6rrC0obUqvEiM7QMOKgEYxdC/Tii8dUKw7dDASrh62r3+Nm28ap2bRK6tZdwHRzqi8otsdtaxmMSPRg9yv+WgmkDtae2zV1urOoQbhuSZsS/d6Zha/H3x7ipmZKcvKsdJqZN24qCUj8p0WIyEzhMBmtp1njRBck3VD/b2MX114ZighlKuE+PVlKR3b9lcyQukq7/EvRK9xVpSvLzs6R6QxoFgNAP5HCn2tJcknGwk9HOz1n1Lc/fHnm/cv4lPBA2cpU0mzyJmN1iwMspR2xbDK+cQtGQWPkQ0vQooQND0tGHPYSFCyRorD63DyoLdnuDrSvcHLA8MT5+nRbynZZLO5kjPVYoVD5MWleiQ8QWIAR+qpWAqxHtKu0aKZ2IW4ZubWyW95brAggZfror9MCE6wBdLKrCEaV1kDlAgiopfjUCrcgMHFmK04/dHVYzu4dDElbt4MzFWYK6BsOOZG8XesgDeCF4Fpqa6Ujr07mtCn/3Sv20E+uj04fdf2UghnG0lwrMtu3gFA208xWOmgDMNR63bcyMOo1dlOg4Y5P6MxGzz6Oh6zeV/+uwCNl9bxkHlwGzHA5QEDvHEwjyRJuPOsZZWQrQYnHhg47h7dHn73LHDX6kYlkcGTi0oiG6SNGztdhDIC4ehHh5xzVVFBbElWdfy19shdq6bdfBqd3vb4/DsEV8yUgKIlwPPv0WwBgKcDopnOpbqk1hZGyzYNHp8fHHlogEjCFLyqHMQE1NJjGlgEo4EUgcieRGASiUzmjfrq50zqV9NZAZdCr8MdOt84yUFLvn90kDCXtxukrO7ZgUMtxy2TthfiPbzTdzC/Qd6lV2zc32nZvVUP9ncn6wtqtT2jhldGnLOf4YMT0qIUvEdFTF6jDr29FOyk2khn1SbbNLVnzt68z9oESxPMwiSjYAbBqe73KO6gtCdo1KBP+zdnRJ/eWY71adClTpDerfkirafz0pt17e2sjUwTRTrjPRpDtYUMOWeP31lNxEI9KnvvlbxY6mRYqeLRQc5H+Oh7kS+Riwmx7XXKtT3LZtnpP/tw7PkvQiHvv/UbCulE9P4X+vM/E5TDv/P7hr/5YId3v9j9qSmS26m/+SDEsjfo0CAvGzVXCsYEOOg1TtObOTr8WXu6fefl5oVrlJ57dwm2tZtle2mX3Gj3qN4CLP9ZC1ZEKFXYAmYwAUPdHKJVbQ2b2LyCrWXaTXV2MQ3+2wv8+v/64taXj7l2TsVRtO5z3RoQKW8NerjFf3sBG9r69ujg2g3ebcIX5ZxtDog2bA3Ad+5gOEXW1WpxSznViaGnFCs4tVufHt784v7m+te0IPCzpMlpFHahKWJCPm2gvyw9itEHYr1QoB/ME6eYjqYs6jcHUaGjINyrk7fXSCWeOjF8ennrxNPNF685rwBYcUwkNcuZAY1cNXzTPANFMxSj13KcTGdGFNQs5vXalfPBRdm/2caiAhRmTLUpKGfA9pH7gzvfbz+9NvzyCRmJDGMWWkhL5cgYpM40+RDBafQ6AxpKoBdzh2QuLJzmvZyXHRdG9e7iZIA4vldPba8ubh45Q+/kZzNK+CJR4EKX9fQwY76UoGtBMXol1hfRSGMvOKQz2b6cNyvrC1SFKBqNb19i+gYdDRDRmbGxIEsnJ1MIxUtlfYHJlUpGgD8OjhF2pZwtUkLE/stDH+z7JxQBke1u4NtP7b6QtNtacIWIpUTrLqZ0ZLpbhc/NwzDpKCo6sgIJq4JcfHKChaKbUiIyCncgkaCvqZf4p0Rks2IaJRAx4C80Ki7NsVo3XrNU8PuQVVoNPZ4jUGA4sn/rBtr840uD23eHh8+SeqE4SQZhY8t49BdqoRg52r1HsJMwVX3VYf+KNb6r6WR/yVdNlDvx7TlKoT3Ntew2v13ZvPyKC4mjosjphBvp2kpHB2Al1Qp2GEZutJw/nT7Uual6WDgRuiglx8UO0prsr5O0b31xYvuby5tHb/BYoFOezXFCYKaGAe/2F7VANn+RjoAZjgORAEImHlsteEdGU/f2896s5ELTRTP86trWqTVeN+A6zqV+4QD4/sKSDCMIXz4ajAEYte3fkdD27yxvGHszo/RcSjISWYAaPnlmItvNMZuhymyEwd4a/nUa4RmIkYeg1xnlhpVzf7H1IWVvx6tI0uhbn37PujzNuiOavL+kGXblmEnjtT/9Xr7XJ9LBgoCrAiqzvzTDhRbwyQyeWMjB8ReLg8+/3Dy0TJGEMzNo1clvoaelmDmOCbk6xoxE1yqIAQRqbX/GRdeiuoFVTqE6ZC6wBg0nrqP0ad9vnrg6OPqcQqlA7JpcnyXtL9O4NbK2Vt2JEYxWCUVzIMWoyerfmuPlOy0qI5rwwadHQLptwjFH8fSoki6ComD9HMAMwWg18inIAI4BVTG16qXaf6xdSp3nwqVR77F2qSuAmioxkxmNLC4sdKrtNXM8/UjlmkAfupxYAuWIXJb2nEm/bEd05bSjpEfXUs2zZTD47vrcocGdV4oH/5l1gLDspnfMcaWOJvuY/eU9ye/plTP4hoM7x4ZXn5qHGLxD79i9x6sLHp1zwN7tfpnr5bykd/lIzj9ybsy7nRh1YMzneIfDYc5GcAsmOAXBIXCmfLIhVyMeDPAk86umV04DuIDDjzWH9n8zX7RgESIYLTVYzra817I4q+KMwLtNQFD/QU2/W0mrgjYVO0HBsnIN+vCd2lA14Y/TX6q7TM28W8mwggnaYbJuEL0QYrfybIYM605qwSR4Qgxj0euUHyaSwqo9VgMVIDEHNxcEo7dEH/rtKzeDNWhWV0dScpflb5Oi7GBwudvF/vVOu1jkc2qKCBpTfx22sbAfB77CLTnoqxqP5ikoXNLsnHgwPHEeA5059U+atRtj1+VpTjgh8loCsRnfn4xpC3Y2xvh2NkanodiGRXO3E4GXgwNML1hI8Y5ujQGoI6Wd6dAIVuy+uMjzw68HX15zpZ5xA7kbmOYOKCqmpZsdT6FZpe0QLicVpCmF5vlZa2Hj1c2t5zckpSSgYysul6S1YfWOd6Ua7SCZdBc7JNDTo0EPry8PVh/5uIe5dtYKkQ8AtZC60AcMc+nh9gzGCBrR/Aegy6cp7JAbkVwIxx8MTi4BPJ0RYq2mBMG5uB38gHOI8MK0ZF5NKk5dCqzydReu1rPLG6snJbAK+8+hvSnnV/VR+RVWmp+YwzXEUnDckkVUYB2YBIGtkLoCq6qoZrU4TckBEPyGYIms5uDsg8GTL6GveKAFuqBRJ92fF3yLnTJtEUpJYv1yQtRSzRTpWuD7DU2PyVV5rt/BkNcvTw5uPcHcCcBmr2xjslT8tyXxEFlvJuFGZAyrEj2D8Krg9w92j7wqOL9srwoWqkb8rADI223/tIAr1WeIamDk7mr+RoDDejYvzlL1YpLSquHGEQElOLtKKI6pI6O4L35N8/Aze0TTmu1hJb+QbbjqL2cVhUNZqmHiqyL7RekCpWiIVLcvtdjC60NYMoTK20MLxiO1ELhEeA5I7+3BtZ436nBXf0/r3sj04Hzx6f3Wa7x0xayvx9apsATKDWdV7C8jEgYGFBLogJCoVvJsOm3ITZDCkcxQTkrCGhzHMAhE0qIpBETnxETMiJR9N8z0GwbyU33ukE01ltSOplrJdaZxXaacBYxrLy+xm0l28RWMH6DRmXq2F4s9kyeTY+R2x5ROhcmNs6ZYn4rfI4m2oZfKd7ZeX2VNwwYRPi/IaButahmaiKzqFpmfBgUNw0+QOvaVZL2UwSdMWXtYh94Ff5Vc5xAPvzGWu7A45yeDcw+3Dkna5Sr1irC/XDo1mDbyur+OSxCgKSK0t5AUXEMYYDkFLYZfncPTavgY1hnFbWONe9q4Cj3A2sszN5vh8Vk0pfLoTGcVn5vFszofSW//Vp3j22jUqdAwZ1Cls3suJIkN0POco5sXvgNg+PN8N2k12FUhQoqFnf+PsFhtPe7P2hJhr9qQESeoQ4A1dTjXS3an2RzX0GmnHrBd1hheTNsI1Fd0TUrVHjkxxaWVwe37w8ufk48H+5eC8pW1uU50FbYdvM3jpEC8TQSOZJP45XXb8FF1e93yBfKK3iWTNPC7MJMEejQoYkByKFKARWlHhSBtFZQV3ekiegzNAsDvoWn1Zyy8svhzur6atN8zt8l5S+YnqXcUeUV5twcbRH7BxK+iOHna0tbBk1xls+HdHNmysXMQuQTmDIgXMMn6RzbbbLVYfmfz9QKNLWnBe2Ewl8iQ2Mcxw8gmjK0Wmz8zemqj1DixSVJjpDbI6fKgwaWMHujurcdfqeLmRFJO//PsqEYlXcpqdFSDOuVpSlPVpanKoNYibWY6TLSX6C1VMKJXWI+w+mCloddmQahJ6+wSYX70VPxagjUxq9JZ3gZTQqnhKTwlk7fwkRSIAPDClyWvy31STl5UjYv/laP4f8Uls6er7H+NlxpqYLzor9HsT7958Pcj1YYGJ+8Nrz0c3FiPdzeIlNCrvF8l0FD6X/0e56922uMA1TzucYAsnZpCuumpvwpbnTLHROUgMA3J8s15ZygxMabquCeJvm9jmtPByVvDg9/TwGOZ9L3JQnu2R08WYQeD1au6moFgJuFDjF7/Kb3wa1G5FXx4hQrg8qmN1c821o4Pbl+hfFqzPXnai0AWm92GScJdzmyvLRUfZiikTk6P5DHbHT4Ap5c4DdoMg4dVYPI+ItSnvm1hCF3p/M3VjmNnY/XV5g9njJ12bwbURgpOhfDEcKHIBSziNprkrFHqu5wljSqjvNc3O1RuvMVpK7ZeH8NAhyNfb748zy/3kQ7A21JEjdAYjPD35RjcMlvOSPDF5/jeV95zbh58wO85u2jhAQNNXBlwZtGt1ozY+RwWQ8MzEhJgCduk148YsUmvH/F2pFunfADEBFhYvBFDRNVbRypivH5g5TAQyJWmIVothNHGsOeZXJ64pL1uXlt+hbcX+BkOJ/OXAr5fHxrcPoxXXld+GFzVB6lEl3TbvUY+M0OK3XD5Kp5w4/bwlKHsaB1kOYeMmjr+Ynjxe98Uk0xuR/G0kUVcsrrJwidseBVRSbqM4aXzg0drXAl0oQZPliudCh0+VfY4mGAmnYtgaGMgRniPej2Mio8Vr9/Z+u45q0SCrzusGWNAjvLoAVMn+CxoFlPJ75ddB+cX2Vz5YnMFq0BonYRpfBZLAVj4mLDOAgpGYeyJgIIwMYwJE8KIGCGKCVGHJEo9dq23g976cT4/mrXW8fxXm0dL0s4sxTzeXsumBhPEn3jK2xkil1aJ2pqtQW+Xu0IuR8qLiQmueNe/9erFYO0ZH/yVGV4qcWQ4UWGevGxWdhz4cygcZDDaEwbizhCISgUjWe0s9CjThEvIStJ7fHsumRCwTwcOchoEfD3dLvVmbFeGKQPxYETvRmbzDmaha1MrLmci4lnORECznIl4QWBQRP4TyibjgXJhqXOQJNIych0CSoYvQlDJ7OV6AUwYNEw3h70SvnOEDQqm7hG/V56F464TFsh+LF9Ou+IXJ7e+ozfm9w9vnlrmPC7tdoqqEBgoJLiKEME1yu1WVpsxTUaoMlsAxlPFIL6AHhFZLR9MU0T5b6UE1Zq82sro4RaV/mTt+vzx9sHzqFAuXRg8oouNlIrZ53JQg/kG3Ut89HHdO+WDrubmIxEJpHWMFa42HpWNtnq7VoGTbFDT6nBu3ljWctnghbTY9lS4k3aGu1v14Bdt3OiTOzVjIIOznzFClWOFnRihrdcGmjlHEjxJ4h8xGAXXuOfsP9tfvB6+fKAjowmhaID9yOBfJGkeKsDiPnUMEitArh7wqJgfLwLFBHlyzDaL0hbK82LlzJq2WfzgbvPSN7DHopQ4Rb4bdqlcMBU8DIqwgDXVySZBMY4uKQDhumEMojNHKDZzuPmjNAz85AgmTip8bLx4zuU98KJjLmnN5i3dLGJOtmrO0WuJcY6O8qYZa42paUaIUL7Ml1asKhALvNvNpIQBneg/7TXY6XCZwLceP96+cBn8j1DLAHxmLCQLItjhWKCK8frfMqAmKs8bRf/rmQJTd2jFXEa3ErmASpVxQXm3OMe4VsY1sFAdVzK5YkSppBOmHK6SIIU2NSF3q2RsnUlmcy4XTSUEAAJ/KTfo/Ct+DWaH8gJE5/EMxIfxMU4cmOevJ3Ot8RG8YCnCQg6wuL7s9qqaKsrpUOkmJ/2SS+mWjfVHw5efUELALi8Z+d68Ui28QkLBTidpteBperdO03es1eYWgkO9feAGe4axVxj5VNoO7Z7Yb+JEyGPekvNutC7LQSoGmWtNmdNfbD46IO6LOS7mazARZUOQ76+fZbdCXAr1Jsx66nd6nzyrXkCw3Fbexll/tLVq/SOzb2F888FAm22mZMxmRs0ahhI0Mg9kBZ0FjIyS9NHbOW/hxiybaEaOFSW7g1ve3iydD10YrL0Wc6GWIqh2q/7bk7I4rNIjbR70rg4TMibzTFn8vF4V+5WhJrS1rjVzQAmaBlTlZ4pLRtMqGrG+c5pOIrZI9G3odXR4E2SZs1VFOGnWgktaAIjk10vuhP075qj6kJ7LV406+/Wke8mHrY/wsqjGSNJ/HLmV3FiHzd6T4dmzY6V1Wh/jxeB0rrC2bf/LHbbttGKnpkrq1dQUczw1RVhdeqnHYM2pvwx7+RRjAqpeN2n39tMJ1j084lmUHL5UtktDg0483Tp/ffPGyvD6DxwjlPXa0wm+tSUEumX0YHx5Kb9hNw3RJwF71KrE/AsTYemvNNKsQR6gomrZJQAbPv/WYHZzOsMSPy8dfcn0oXbjTbXCwysX2QojqVk/pg/2j6n3UTw3xcOe2+9Z2Hz2gLkA3V715kbY4Ezl3A+AcL0AGAMIQ0EYUqMMdpi+F2m7AdbE2IA+kPtFzwIQ5umJ4XeYwWo3LLgEs7TSyg9kUoGiikby6oxRh4HkFSvfKgNYU7zVzqvpJN0Fq421yz1LGTOr+UJwVpYugzGiJxfwZUnMUCABYrQdhmSzZzzHl2XRZ7AwPIRH4XpEPjY+HVSGHUP5/en9foiGt77gISpAaU6PjBFupyszGPjHiCGAMhDjh3A4zF8IRhZdur/IFePNA3r5ERbOwSe8cBbQT4iXTa3Huwogu1nEsN0sABgnC1I1AS9lIy5gi0eBosIERodCV9d1dDcvv9pc54RheWtvksnqU7r2tFa0x1jTMB4SZMoAYXriENNRPsQrAe+zZSxsv/iM2wcthxrGt1/NSuG4FCl963xZAa0DeVi2iEDEQDdx4aIh4kL0ssgW6Tw4LNztF4d54e7F1CELkxYubhsJRJ7d4J/jlbvYM+YOG3MMyLFRudCMrBUKvVTlcK0dLZUXr3mpUJjmyFphuhDp6VSM6VynbeNIz1EBGjUNTnrAIrD0kC2IhceMAP7BKxjJb0vUYZ30aKLk21E9LWG8YUBXYrFZ/5rHoplVo8p2V1lFzyqC4Gj8r0gOxf+6VxTCxcR8gWKRfqRJm2TMXPfMBddFjO7flYu8jqPeyGFvWYVOsMmQLpDVGLEXpuMDjah4ISIt7/S717/RYC25UzPWwKO61ylKT8l6UghJVY4oyR+p1hYyU2gu3D2QiAYSEg5zj9SPvrzTio9OcTCRjLnXGuauspYIw7HY83SHTUM4gQ4S6CbsWjvwSMsjkj6TGDddLDBMwjLjpOUPWtwTkwSWY2/BAAga/z/RXRN09utrsbeKkhJFz/3FTjdLJFNTfxH8TzpvlJ09XcAdvkJxK6HkQW6BzPgtP3mlr11e4sNXwltXJOWai7mVW8ThKXdJpbGbs4nssq5+uXWURjMrdlvWsHbeLF12aCLU+mJM6hJTE0J4k4o4/CRVYDQJWFFlcxpCTVHDR2hXlFmyMvggD2kI+HMrCdbrur4eCW9gkZ6bY3LtLWys+s/kLXZFoVl4ddiVakebF69uHVnjiM8U/umUXJ8dqVaMqq3PJw3Miqy5x+tbhw4ZNwIlb4wNTZPlpd2akvlaTC/u+iSY99wZlrppCwxvp1QVrR3T6uNgLPTmePg0ZCJraIE3hbAHzvS2qYjGAzUT7w5hSA6t8mE1+Mm1xEvD5nluZDS69kRqbTrQbx+6x/RE6tJahLdSzawZMnPjuQ4Fy356bHjiFF2OwvYsPLPyKbAtDVugdJUbCcC6LzBShs1l4+7f6kidugBAKW2YmrPawIaxpaUtS3y60us66lBkLWLAtU70kgw8FIDDxDiVvryftq5vHfuEu96p7D35fvwwpPTEnzRrwvRoz5k+vJmv9HE7gWjb1XSn1DQkZ6bD87yjB7Y+WaIBa7YxfkI5wO9bIREBUjMHjt7xQDBu9AWMGWGsMAolvZ0bW4L4XoYXkxRNvnh188uXsKK2vz6uK3J3g8+BwLz0GiMr0oD5GLK/Ms0HkFuHvySByIrwjA6p9ZVGD48/OVFprwQWlqRizLOt45+ShZkt7GEofhwethipLgkh9+UBESXoRcZiuWQoVwe3OaamFhdkHE5c1hFodUt5J1FgsaBoCBjEhKSBAC65wqvXgBO0FAK5orwmI2mjnFYVTemZLj2jz3ulvu7hL9rua6n8KKkROUfUpWcmUEwsEkUUPa3lXEmNQZyxZZmx7Zecx6vUGePPpEX+wQrVAlVUpxaIrV2CkGaFrGvP4WDvLQ/GYAzfYLDN8Np3WwdWOIhGu7qLvrOzX4wolAEWOqcCiDxIAYDwTBOGrv8mRvuxKy+FcDB/HN9ZXns5eE7ZGBaypDtDZ9L4fd7bsz9HB15NcRBGemuLEMEUX78KOGHJLQgXQB5sAJ5eaBke8tMPr3IkiL1I8i8/6XMecCII4w10YbCRWucYyXWs+3fxTmx0cffAKvLqBiERI9zk4KV0fyDQta0oJmtAHslZ0L4Y3cEDzzg7ZcQAN2qiw8Uuk3N73uEtBRcnOCwTvBtzTWJXQtwI9h+C5+DdBmf3xeCzpRcbHwx8MMvvNspqkM2qvscWiwU1A6imj22eWDsxdc5gvcPKqXEKtuX9dsnsSKTrd9T0puW9nn6ngjeNHDSpaFFWnaoxTV2a9puoKUXPBYW1o4pT1eT00s5aSbWJKYJICZj0s9yz0HN/Gpxoe0zcRVa9iIlw8RCJPJkwje+XyjnYL2G2Tky7nP7z6M4J13d/7b+CvujiOUVUa2nj1WlYmxuvzm+tP4g3UoiULDTLKEzvz3faTGEOkKkp+Hx66s/9if4fVpVY6P7YssRC+O9Wlzji6o+rSzzOWdrBq3KuhX2P6ork046xb9a2Fu8ZY0Ve9ygzNI0WUepgMUzYnTgo4Uuh5OkXQ0myaCT21ZJL+k0pd62jTL28wUg8gYLEU1h6puQH8Z+bYxwpzjhH5RhHad7l97zLmOvHMXP33val18ZMt+iluprwal2HB6llcAKCsKEImqmqJ348AUSjkndlCfE7ktqKMV+Af2Q5txtFTwfDcYC0umiUWmsuI7UsYqLmIRhtHUsVJ1qs+O0Ft3yxePCdL20M6OFXh+/5ZSioaLGywkAqVgFMfCkF0x1FAJNzBcLSuuXP5lNxUKR+cmCLayhHbKUznq0yZouhOjGUuFYKFZhSKB6siCkerlsdrLmi0kD/8XIF/zjW8LGGDhaYU4zvV7YYx0vWm6t+C4ZYd8853ghLDkUYyu2BAUuG62FTHIVIsgZHDscTCVtJGa2YLwPrjIGZeDGYm8hqOuyOHWN4ETEj+hqLMcdF0Q+/9hXRKyy12MPsTTxau3JjSWBkqByQMKRANlAMJK563nJnZflM2GcgUGQ9Dgd5L0qdttIxogCdCCCYjcNB3BFAvPTAAC2gjM4c+L3bngTlxJjYWH+KYhILnPCBVbutin3mzy08jiZKFxwva7IzJBjPD+5BS4VBCfHsoIDEgubYMYWMEJoEMIAYLwziRSzwYtrYgpjsKap4jvj+lHJ/SdySbGc4YMk2rUZttfYEwXOCQKHGGwPwKhG0HQvQ15LYWrwFcxPEQTDv4CeWCA80ZCsjRUBWzfQAWDSzZWpagzGMRdUoSVJHKEujTCkDGZsts1diqcRMqYnx5sVMi9oVMSpmA4L2N7UfK3zT9qafg242pRyrY9PFQXf6wbJhMkUZtKTTatEw2QAFJRY0WNA7QeOYqnFKRjRM0A6mGUwlsDIQTWDS6+TWBNZGSeVUhcsJlkmUjY8KUiQHUQygxf/Zqg9LfkIWPakLz5n0YIuW/eNYIj1MjUjXZh8mVi4+KhX/2aXh8XPSaHyhkiFgwlXjo2LxO16sIEUHdgNcNf7P3GsdDBzu5Pv6K9Wc1WZGfjpcl3l46QxvshaS7j7aQmYFxndTYjQszKynoRSyXaSuvjMnsAEIidjO/k+yN/snC9lGat7H9+93PA/0fJRiRCUB97XjFB56iiuE4yuKUU7qrOPyVVOxUkT1YPZ8XuFOBriaH0ADJRJm4XSYKtejdzlf/hP0jh5gpVU2V/eX/peUPsEbH4xMSKglV793cPva4PYX25dvY4Ohlu9vkvrnOhYJzUsj+zWtP/hj3uDTyxSD/zCm/Z9iVjpZ0k676T9xwhgqPkBxnff4eHWUha2Tn2w9/mpw7RYqbMeFNpsUeVKnHZD1ilI9BR6KLGmmzXw+dQzgDAMDmGQj/QiTHmCOyI9JH1TKBCi3/cyGK048vHgHeNh6vEpDf8DxgMOKPHSLHCDb7V8ZE9hY4RprS2tcf6Gc79HTfuaKlOUCF+EabXv76r3B7SsTGwY5Syu2IPl8r91OrGXtcw8zDHQwT3CGl7fp3+m4S29h+Pdyi2HAoacbq8egQWut7Db+O/bSo2QI3sBi3u7XI62WRdntlRan/vsH+R6b5FDBffPuKZ7d8fY6gJTGjYHQld0yzGk3o4VDFSQoNzK9OaYmsAo4PWW6jqO3dl2HrjuXfYR1zDAJa5HP0uNOHjn4G0XLASxqpEPJ7XED2L+ZpN02FU/g1Af9pd4+qVWDhSh948Obi4Plb/AZ59WvJnABnWyXZatBD7/l4M+xgq/oMXiknWKLWW/eDm5nMfcE7Fu5DBaMb5eiZW14+Ynu8MXS8LvnMrpHOIIZFPivsN1WI+V0soyGqSgXtIaH/A4fa6Y5mLEZrXCO8fge/9qNwcFjBk6v0RrpfMKtBHAEyuBvG/i3VuFk1zsbIP/KGthYPeQbWGj3/p5S4SrKDuhV2eZnG/fwDe7igsfePLS8+ckZw6bXg6O4TC/vOPhXtNK6dbusRXFgITRZ02t0DAfaYuvYCo3KMr9XoM+TrBDwgMR/4xpAqanpxUkTZp3PaTG2NlGppWeV+GjPN3j9xuaL8/iu8vEPoVloDec5AzhYQrDeua4lN19oOxiZk0sIMr65osGsOJszZceR1Uyn2Se/JSV8gW04CD14zuk/IuhCROrRMM+weqfSh6f44pGDpEDdnLw3OLlCIYG/HkHDIu/qp2IgGq/5slH3F/9Z4foryCO4jTwgD0WJDZ+9GNw+jYNx9SqF0FdztOrRL0x/w7+Z5lVP+hndxOwj1xItzXlOKU1VSAI8aGQDrlEFJwRvoLyqUSFb8UbpTzcvZdFgPhzJMnFQLcyRB7QYT5BZb83mGchoxQOyXxHAonpQHI8qm9d9gyHKk+VCXgIyLuja4aU7dB8BsDgaoAErzrlADRQeTXNEY+j3DNvt+VRSm7HppuVBgUK7ve2WCXj49eapT8xsc2GsXjWd/ZaUXjqfCxZMMvx2Bhu3FuK2AfvPPzBhk3A01xqO3dWrYD2sKfCKsqwL6x6f3nKrriX0iBpV2XUNSeLukrO4UvpA1BcttVWUGvvo88Hjz9kQ8yOHBqEX6d8zOOU8gZW9LGnOPLATApz9BwseGToAmIYsoFRqs674qsbQVSQmvq4J3is7ruL4Sg5v81VlpfDCUCeSUvzFjqOuKOeQTXLCvN8VOVtK7z2pCX6Md5m8C2HOr5FGHkLwCyJDrVRqgMeMbmRinbkzbsW0RRbTbFmwL6F3e7Rjh2hvFUxIUOzWF9HYXkurUja1GbqwV4f8AilIVY5BTxnuQx2ioO9UITmF4XWE6QXVCKoHYvFzi8Dm30lzkCu/5sPULdikh5WtC3rCrRPsUOjOqZ6037w3A6BRtN7Gi1e4hP3mkrYmmBsOxKfGlR1VffrlDhtMFJOpqQwfksyUU1NE2Jn6ZdhmkjFOJRE1nh3Qcc7G+pnNF8f5ZVibSz5ggFLbMjB22KHssCF/2kl6Qjm89mDwGdc9ynZnmdQpkM/VIstvKIYF6VCSaGN9j8cTCUM6Xvq0HRHWUuVhDz3t2kfJNditGl66Mbz2UDHqPALRC+o0b/L7R3toai9L5UFpRpWJ8CVpeNfYxPfADaPC1BJMNnx8Vsjw3UmmhPS1PLHKO5gtv8kZRUlTKuu4BRYo0JfcA9gGG2bRqw1WgcaRC9cZRZYX3cggoXIRD4HkAlBCHnbo0/3F2vgEmZ7MKMj4OKNVr5s6VgUrsKrghULrkgE0XjIGwswJgSWpzrOZP027+3AimUGsJDuRP9Ar4/zhQ3jlDqSqwiMK4y5CLwSb16bWr1q/AFzaGObVb5lNhRphs8h7e5RPNO6Tx/Hq1XE+wX0FKQ+czmfg144xyvjFKLoH9XDCKmGNcEpVboRT8rEmD+nqiQmsZkUz2+t4Bd8Bdj15Z5xfbqXQNnTu0X3TuSe0/62sGlTMLqh7zPfF7KIB32EBfDqJ254f1y66hqN8Cnwh4MYm+AaBzZ6NJ2HEDIJ0zYYlii7CDuN5YIKs40VGWKK99hh/il4IdhjHA8YgmAZbmgDRznaosMPnuW+u7qVNGD3M/gH2W6y7WeM7pev1rala0bOmYlVTqjZi9cNsiVp0euvXo8rQ60BVVR8FPeX0yEfvUyIfBQ0yIuAfjWoOrzBMuINkj4rd/xCZs5bBR7e1AcL2sUnaqAD8j/ev/mjpjy7Mj9+9Kj+2JTm2Yj5693LRtTLhvJz2j3RanuZjr2Tfnvt7HEYcxf83OiE/dlOG03swsFL+t3kwsCv2/ssHO/gvuLq8/wL8Tn3gnyHADq6wUj/r08mbq+SZXXq8sXp6Y+0GF+etcYPc6ub0KQYzNkqQA77U6WUKsUbUViobycO1Xo7xuHTlybRasrfTX5rGH63sKDJCMBynDYys3ZDqo2VXyo8WmJSVqKTIsKJwIl+D4NgCgpC6qBja2/EIwkbZv6VpKCk+syYn8s7wxAE6R6W4sT3gttZyx7REp/MdTLbIyXlcZW8pmyTnfFjYG1gYPPmWnvAkMJx7yxam7Em5vEkWYDNYTJxRRtIYwb9nCkv8MLx+B8uJnb/P6R86JSbrh8Hdyw+1sYJhUxJp83uGwuq+CRQPB4MwO0ofSJqSSK5GCxkqSmfVHGsxfL9guaGoHrImrzxHFQYONs08H7jMyaKwTvKhFZjFwavzrKwpmSUm+0FtXTALWFcM2yybRSqhfFXW7M3FzVti43OFVGM+xyJJuRYxH+U3Bwdn71Oaw8Z4E5h3cbwF6eYoPiUu769XHn741bXBN584+JmcZpGAJaFWSlmlHahLKB3Dck5pD0sZpR0uj0lu8RcFDQfrD6w7DlJnhb4lunTw2dckfljle2N1neJci2SBH4QRvdbm5D8m/ZVan7hQdlNZMqLq1gdXb+IKPss1pntpI7OctbB0PV4HA1rsERzJwUOXPPHKYcBBeXx1lPq2kHR704JSVtlc6CODmFYSAFFLRI1dYmpKqSTENdcxl+wsdDtGIcy8RaHrsdu8Syn34sN62ajUuAcA17oXOECQvPZM0B9yOv15yCcPxA78d+v1JfgvswKYNR+tAFso2i7LaKZVMTjPKMxZEmWbx5Sjn39qOeelOkWRJpp9npKPLlhhDNC9mWlOTLSMiKI4j38GUKw4f0cY8sBlAehJbU70aXqtwitzU+RBiwcV7jUvqyx67Pv6EqnMdurUrC6OOo1UpSlI0kUtTqfO6yEoREmLiorQ1VQ8f19qKnr9pykMU02oqIpKBMR0EssGvUFkqQgKgZWAk1AVTJJHkUNZ8k5mTFKCjLDRCJWTJeMC5VHkJczLV9cun2w9peCP4XGKcaB9HLdIx6uU5+rzTzlOBN2PCUcl/Vv7YFF/yMfN1XzaHo/S7S9/mLw5n+/CI8F/GMmoOTxzZ+v1VyPFAgAfD4W7jawo4iePv9jB8eCeT01h76amFsD1wC8oHQejNKZ+EfyQmpOy1eBr0bpxWdmAz316wkCZ2TbWr7IE15KdLeuUXJaSMVKR4hqzwaIiEUxaCSFPE786grXASZrA5aLbC0xatDfjQCNFUMB/DyYFozQm82ZA5BMI5gz8fuEJD0YCS3gyYuSYhaWRpKztNOPzLtV266c2XnzPbFAyFD2VqalWDCPsx2J1Qt8QwuHDRclZ1SAC+kZ1IyZPk8MfGEstTbL5yRqTdHMpWwU6Qo9+JA1k0vl/SI1gzr6Wjtbh1xsvrwgpf8VMKo2OU9bNy0KeUb49g5fTxOnlK4Pb1yiEvDWb6/shfPdAH+szyiIvMNE8EWcd1uEcs7Px4uFgeYnDdup2lc9acUIqxBYgcJr04RJuuXDC+zflERIe1K9f3f7klk6XgvBkKUb/bpHmVcMxQomeW8rHOWCF/qaSrF5S/67/LXRNYbikhcu9ZXm3fAWMUPtCvJxWu9cJ0XMUIjkrHcDQtzsrIAPcAdixlHp6WGW7eqGUV95Mwq29dP72ElOFXlOn21rDHt8CltqspMGCBjcvPOem9LlzeIE4yS7VvESdmJmAmfTrSlFhetfHKj/mJvCBtCVr40o27//GpFjbE6sGDbJV04UgS6B8z3c6x5RjwD5ave8/0mda7/qmnU1KuTybd6tfTUiwDEqj999GEysfvRnbgKzdQPLkV8l/gjn7OCp9OtkEwABOTeG/aXtqqp2BCWCMFH7De9K/CdVQgZtaamAVWAuWkp2is4y5xcmtODe48wr8mc071+nVT6+t1a+oQgYQY5kHec7zx4NZGrSM686yu4vZ1WZ1GQ8P3OdsbhU6H3vlELm/sj+FlR5q92b4MBM3V+qokWvca6qXLSnVBo/XyDNGlU+5VmDLk9p+l0AxLKyrVaIwDUzHkoB26O6hIaVePj1KlyoVqNmUK4ODoaCnGjpEAQCa6Na/oYWwC6/fJdenbp4P3Nm8jrU1tJaIYkrdHsYtYRl09YWZpHkU5vo35ygl/0i+xeGBLwaPVizlYjNPq5k05EPO8k5SGrMEGrGqoMokgsnTF0Zi7gQocIeB1yH51SJV2OIqBJRBULYp125uXl/cPnZWMiLOZVk7pKXE9Gm1Zw4xlbnMiscorivrsHX3BOCGuiyMK5wKrLEK+0m8cAkDiXtSzdW1KvlyF/AeWA67Kc9FJAX4ox+1rO0qAm2sHwUY4URgmBUkc3x0ypmIj/49ZWP7zmtho5otepYyE1U5VoEPjCCEH6EMk6UHPgBHVxfhMBsCEzjBg2WptECel6u0cO1EqLQwn7a00gLIS9dVWiAAPLXJwnETIf0ej5YfTuvO6dqJ7cUXg9dH5J0rAuKxEf6fxVGAAWpBkuQ7ccKTJBB20HXZuFCh0ZfnMypYYPk5gt7JFkr+glpxFLAiiH6nf7+L6L9R7h0mjoOgEbuCwdToQVgF239HrVTn/SWdo7GhReZsWJG5MKYMItQJ1Yqqtb4T5emty07WjfP0Bkx+407pehlZ3jJh0l6Cp1N1TthLSMoioSZ1f6WIeJQn3Q7JQIRaWSw0jB8MQ43VjnjwcI9KsX6EyYcG9zQb5Oa5o9sHzwM8HRaQna6RmmofJZy8WwDdTOMio1VEkG6OvySfAh09CRbuJu3+kp5d4KT4ieBpXWqGGi5UY31t8MNFruDi5vbn8dTGzEQzG2Z1bEqZIz2bpYDqFg6g1KoSYeMZJEmTw1mZud/JaavT20xuS95my03V7/ieI+Mj3UlOJLkFWrqBy9oPn1wAX0BcALP+biA5uH4hoaB2uqy4OThzg6P206yyoXJa4D0WWWVaK4ZwfUMxaGbMOGBhRm1YyAx8v10W0osFTco/PHyWc/HX6K6RWTGTYqZATAiM324xIWdvUYBCxXf8Tbl9Qm3Nal4KWt55vX3njrwP77VMM6tKlTnh+ZDJUB1pCmuHj4p3rK8fqzmCUO/QiBf+CV/VqQmR5r3fESl89ZNW5LgvnjXT5u+SLME7qRF//D/TyP0JPVVoo4/yTwnGGWIr4E18HoW56LfbPxwerD3bWD2DDJy6Eznu+k02i577bJHPp38XVXzcIfAFqcBLn03pzAb6M/XX4W1FM92PlYrLNhsRCX+R4+eN9TMbr07TkurSNzXrNy5IwQRyE6konWxaQ4N6vz+9wLGzmivh+5MbLy9tvnoUg2KNMgeLdcrMtk1jfbeeFIa6OcN14/BIE8WYorIu/DB4eWD70L3BEXr/lM2VmJibE/sCUsoxHA5P++kAwQExqMHzp4rDvRWYqLc1XhmEAiH32pYC/dljqeaQVXk3uMFMYelX5WfnRhGIOVIAI04wwagPLCil42Su1yhdUQbUVppFH5QVO3V1b9pxQhSOE/pZOQkIrt6k7RkQyHhhHOMFd1dl07PyVH0ltFhY84QquB87LfX9LlJa10YeHPJOlc0UofKAIBJrbHFgnAjHDdTFI5o3KzcPXHGMt6rskL7rr1Hu9WUKDn9xf3joCKfLljfjBR7sY3BSGhEmnGmbCOnNkBXjOXQEKxZq0u2O7jwFyjaeDJj00o5V61vjYplcWOZmj6/PYSO7Ctv17zZPfi+h8HkTa69x4m8q9cK/SDUHuCAzgyUXpQRF054IvnXi8SRw5tmjB8apao2Ktr2AV5F2D6xJpt2r2JxFe6Gj0Gkjn+65l8weN3DvtQVwbKrCAD23DBlxq/56UtqG+uYCXRq8ubrf+9c3n2+sHR8eOBN8dryOR4+YS6gU7FKXHbyvHQWfcJfhsO1OYxxbrzgKu6PtrzQjeLlplAYUXBw9RiXrideKHhFM6LshZUDSjh2hUF2zi3x64hC5/4oXBgCfOWEJJzDCqWktwqJkdsXbC639zgEH2cTKNrePDY4dNU98AW+/mG92x7G6oiFy8PJKob9IsKDeWFlPt2fQkp7B0ydkGhR2FwiGSuzJG8ufPBCjw8A/C2d2Ia9XYHQjr7dgGCAgrMgGzRhxG7Y/ZLLH5voP6Fg92jOsKGonH1qgSK0AFSmSQcb4V9a0VFI0qFmnqXlkNGpDMtwRDX2uwRpVyh3hGJoL+xK5NNt6tMr3ZsDTAteUlS+t2GLGv+lltuNVZvEl+8srwuw0eAO5lstFAqk9PDG63twYwQyeEFWiiJ2h4LI474LiyNCj4KrWLw9InUZwJ4Iv4X0ASfLPCeul5sXg5Mrml0/V+gfL7y22cLhGqn5RSl9sfv3pgBYfWupgpZ01tTIbD6elYKdQXjyyeeGG2NFgQ/XpedH/OrKAZvxG7acrlY62RFRwbInGbFBkfsYNhLugavIF1eDaE2cUIntghVRlEfICZN1gmndcP9qtW9irXHoc9ip2UiJ6UbcqKSOsFBG9BSvFeimopKADRrkkl9M1MfEj7kodPvvxghekbgx0OuFIUmZw7DI6r/qLFZ7CfIwVrOvfjO92kPBPqKYQT/a/0EkPrJl/iHc6/N3wwEFYBniDv/psZJvDHyxgpU9qD3YtWVz3cacQfyCcmlJCLhmRTU/9VYjxx5OZWfA4ak5CRndZUlkpxwdB/P4ar7Uw6/DjwZeH+YQA09k2i3w3mb1pzHSe8m/loQbBumIMesI1Ujbwy8ODs6fCWTkA2lkro4YqSfjgsYWvrGut8UnnZnTyw3U+B4++2nr8jNPD4bf62JN+qMLLF/pZeZNM31rdwDOHcFdcWUOis+pJ8qPwV4Fq0frvdDXoBpOUmXjZPJKg0Aanbss1IcwJ1obFKu4UGNHUqvBZyBPn4cOo3psh2FG+75wCcOPbwSvzro0wvmWVzorjTLfIVBtRHPvB8tLmhefs2C9gdVipsdnIu/3FOQyNKvFS2RXstOHFElIU5yQn6xcuo0/P1cwAJdTEMii/3ZnN2/C/fGSBUq4DO4SCIR1eOrN18H5YmRjpWkuCO4Nw69P/3m3QFHT0RofQw0IgWibWxerwjH18jN+WVvmeQUpdcpQGPX3Xa48DdzFQ4/YVvfwIhPgkruSkrjGguw2Jfu82D0uUQuHhPnZYhjdfQjsj8LJ/iCHCDaH+Pqf67Vw7dZmeoM760KPNb08Prr6y0CNpAKxRkXRTctEiIKvEGOOHjGLagm2nCD+ksHH4tKOKYMKeqq7zGXTRhfF79LBuv2d8Y/XK1sFPQ8xUmcM6IxrhGw2p/CbUfg3IxrJhW9YdQvY7QEW2PaD8bOm0KSSnfx9FnO11xpUZmvp4Dff3GI1C6f3B0Dd+XiZZVsFmSspk1hkQ47usorSj3toubNQey5aP7TlfqYRbGcoAZdcpNRa9ZRB1C4IrHHwDdofNPaDSm85HkOqdecTUT3QziC13kWLhRh38G3fnwWFLI84Hhy55F8Sil4IrEgDVnQnQP9KZCVwWPpragpXd0qPgbVl3uDfi9Ya7IF1nWFC27XdWHJiCmyqOxyEqibQu1YuiPRQFblNYALs0GIZLXg3ueWSx9Nfxtq3STPxxnHqYjNGZyDDMad0i5HtlrRGaGhxuu7/jn3F4uNwLdaya6wLsOWrx1Op3+Glpwo5abfsjvEaal8qklLuErlxkVOjGhV23bk3qlr6fzizwO0nzSnZXRI+LpdC71kuPtw69krvW6QTTtTYUgrdZk/ZI7OpYwQ/xc2TfQu6NODbm03g3RHYtwQcRQnI9zOkI/saoM6DtiiegVe9OsXexk2ch4W5qcbXERE57GQU5fmxj/alY6chAj1pQ20I5m0zx0GKTJxjjcbtFMaDBXE2yVSNmatyAONNhNiO2FiOmYkSbOz1uCjxS3ZHeft/G6o9Tdu9BD1qKJH18y2T7paUdAFTwe+VYE1QVRQW0ysZZmGaxmHD5A1NMicT+Gfztjybc/9TxfghfrE+6+ql1O7SxdmT4ZHX01gf+OjQ0thn6y52ufeqpKSWb063QX9pWSB/a1GPvdeL5WrthUzbh2Q6+lgDdo4kHUBenXM1bUOwqiUD4DQM95aC7SSFnGvYKRg9v6c6WrTgH9+yT89vVAxhqeWdtcAifoXSyEHQOIIrinxQh9mg/g29A/eQ8uZRfX9wD62hqPkL201gEl2MCi+VkFrP3ssgezEQWgxsDGgjNjz0oOIdhTPu9B/P8261j921m62y+TWlkSB6BOscgW+9+yFllxW+rOJDjzYOWx9y++Gxj7ZRh4ixj4qguyY+iCUTU6T9uBZbvY5Pf8o8wurr8/xd3fb11VEf8q6x4aPuQSIG2L31DtEJ9aNQipKoP1dX63rW9eO+us3s3iV0hJYGAExKTEGhKUBoHEhyDbZyEQmwIeTBSv0j22nnqV+iZv2fO3utg06BKCMX2npmzs3Nm5pwz85tgolN50SdDMzJNFSYGRoEoKdYSUXKgJaIckWTuT7j3kqPkwpAcmWA9KsZ8rBh95KZCNHVzShCEWNVjZJj7wht5W6i4MYf6j1bstNxebXqA+y+ougkDQXvp4FcJFZaFK+ThEi0PPJ6m1UFGQVeHc+TQsY6Sj9dycN0n8X9A5Myd3Y2P3X9gKjNn64rJX2DR1UweczYE0Kpi5wCl++C49Ttm7aptAahbntl4y9IyLHbFeouSoEtRmas9SfY5HW9HUp1OBjGzign1lCyIqCmj3rKKguWYdNrZZ7Bt7GIt6UY4um0xAmuBq2XSGwoiIMExLz0qZuNxlz/2S4zqXCAKnzMMaztbu6BIy4AbQ3oDL6nxZLAdGg2LSDIzm7N8S4G4OlynSog6e2YTqf3xFsLaBu+m1EPxswyfK25jTlPEjadoP+pvBMULGMP11DmMmuOnPh6aRVzNZiH7VWyMyr6eHVnltPOiTZey9/IicbEe3qauXRWvJNF/fYC359Ok2j/Aw+/KaEdGWzCoksM917hWx3Cs9kdox14dLt3OaDJ5ZRSDZuWVqJ7Gu5GXAiCara3m8rc7yxtBdOb0qHAUiwEibQlF30Zuj3z6DJLoMxefdToFoNIAFSixoiNrpFN2fu2LqhIo3KkAyIyOdlaxTz0dB/eozqfZuNzcukYYT5B5AketfNOXdHn09k0ujSNJzBqSeNDoacquDt4aCXP6FE40IC6naAH9PoDznmRszIPQL+Wq3LCYi6eRkJ89IMJa0gDmGsij2fzSywORYe2UERQ2oEhFnSoMKuoMJbzhKVI1JxxIMkUs5vxp5JvQhYWhTSm1/u19Ti11LZcZU0rtkw8e0aShgTnT5FxaKwA33RRQgQCX0Mr1mJ0zFmlzksN7d2neUKO9juiKUIsGCAOQs2Nl43byRFWZlYnWo2es0FSUg+kUrUJ0LdRprnym1ee27rxAjCLHMuUTJaqzzpQd83BipLp5OHrGonk/xDyNJcPsj6Uk+/uP5qV+FpJGMOmXMRe5PNjniYAg5+PJKIiA4LzhXj2vmSg+K/v0NU5EoZdKI8x4wrfS1Qtp65nh8UxqveHYLZKS1mdSjR5SxNrdKOlV0o+noly70VpeRUVolt+BBDxT10vwCFDaGyXdnG6me6hITJmMzXGRthQMI+jCGE68qbh+O2CCokdgFcIBAPsjMAME4MxMnwG0w/b98dgOTymMHoftIIkfyUQMwLX40pizjnsJAKlFHMvTV3Zu3N7dAEy96kSRz0QFzQNGQSTqT16ZBh1q8nA4IaSxKQ90zM2wH5F1kgHUh71YiOgegLjT6T9Eg5Tqw/Ev3Pi/veSEsbO4oTAm6OX8KTJSIcpjYzy1aqGfEJMeeLTA1ex/XGBPnz4ssI8/ZpTl9YP2zRg3NkfepolBY7LWxogxaFkBu/5p7Y9Z+Acu2g+W176BAmQZiPay4pLWFnyjpfoqVxP2QkxmwprU0iANHAd5PUXHfPOIZ9/GLTyxvfaqjRafXF0fvnsprLuEM1k37E94A169GHTI2qP0vpf3XFTYy+tup1Mf63SExjGME2equPMrDRIBfL0q1Jnyfd9nhKiJZU7UkjFJTSVzUdZJRECgWBgBSduK3H32jeHqMo2nBymhXgYxFigvYEIDlbMWWsgE0PnkvRtwjbd53V7j5XjKniDMvq/NpqiJaWHIhAX+70uHEIgEkA4HSkxGg1CkZ2bFeLw0HYL9BGOCsJ8yFQTipeZ6hZmKGW7wBhg6FLEGiAwBDQgRHjetSVdQGqRV03TbgOEMgl276UrjVvdkWpkKcwDZZ6zTVRmIKLJvSGU6jtbadBxvL1ZTbfvYE0xSfPU18+on0aPCo/7FEzzsSj3MKqqTgpqCRiENAtAUEn4UtzVPu14ZCeUUXhtRTpPjvlEwPyjaOKhz2OV3qY+6KNP3VyaZhlOlZuEtxqdO6GkgR+bXDDbfsBzExrkQjCpIAmFURRKAJIxHBe5hAxaArSeUAO4ziABsMAgeGncXPJx2FkRE9ulwQy2CkHttUAAM9/EyW6AO8EmLUgCDtUqfxyI25zlFJwACHp8gKaWIZqLPkKK9yGPnYEvJhwSdQ20R/dmdfH3aaNY93mXqQESSuEX3YycGflfJUC39GoGLt7cEjo9y9VzYvrO6ihFlgZ0karxby/3TPLgSUFzaB+DNtgAqYPTv9keER5OUiixRQa2CQv040xwV7Vjz/qAdXd76kgKz6e4gLrtQV1sy/rKNKV28XE7BJOdxG0D3fRl2WPn0yUdf4fsn5RThNc+TFHlEd3wEwmjLbFrFKLNBJmMhfSLI2pGdM3ZSGoUi9ADaIcYvNgZMrQ6BFKL41NSImeFjXm67hp+X1rS3B34ZE0YgIQPy4pWFy3IfyKFERRiAsEO2y8mvBEb9I7w/0X/WfT17Jmg/AvUjdCcSr4dwEJCeU6RYpFGqBJzbhNqOX4p/2fo07NqPPH/4CBxdgzYebTt2/OP26vz2Ztj/En/frF0dfhCeBhEx1POjQdOb8e79yPNHnEunZdH5pa/JGiRlWfj6ImeFj1E7j/lWptbOzfXh2ic+U6tLAzVnT37WpDctFva4XormpbWjkrUgw4NMCyyMdi/S5bxdydfh9CVMwcCkFGoSfGZzd/kMdRqG2sZLF3hHMD1IT4D1QlBugLPIiW5Sd2PZHxk2SlNuNJAW56MAFSrR0/FhjRReHkSHIMGdi8n0BiH6z7cXIEON3iDdXulj+AgXCu4vO/e/ac7eH967CRqIFwoRZr97yD+6VsCaNVMhJpxU1j6JiE1yekxgczCVyJllSEBgjUYOiPMjEKievi1nS5NJCHoOzRQEXwph7c0T8EpJT1IZd75bbNYvwLtAosRD0hIcNlPwR8afkkw6ayB+Iv01nqBdHVwMEEjMpWXY2G0uMMAMnNbNxTMEseq+1QD7mQilMs66DL3mJlYypKDRuze/ah5eUe3zfSwYdg0i3dm6ivCwg+HXkGhAUAm1jmUY0C6yZMy83J5XgLx0aoJuh+QI2ctPSjC+YLCHuDv4dHCEovCU0EnHOd0s9q4+/fciBE0nGbcNYKvf39xdf0DobeD3sX+Yi02SCaqOQPcPJ/MuaLg5r/udXgmXe9CmQzngrqz4/jQchngOlxZ37lxUDnC+mSntYiqps5+AbuX2WrPO3wINaBnFLd+mc8iDbkmEsm1CkfxjUQmfKJyh6sMdm8gjj10k1g9IFyU1BANEwIQbV4MV2JRyQjhafHBRK9jxgHHwcwDj/D25D4S0zFtWBQiOWJTNCWtGHFVvQA4VuTEcTK6EKuTKmShcLFSYEdG9Fq1mWTHv32jOLtBqpkVTwq4Bl0sJZeJVuFD+l9VHq2St2qNWhpyU5FKph+JyEnRM3iUZd4KTm+H6FTFSYpvIJoVuwJhttkdqiMRlEeRaaIP3YsHmKrRS+1rB4w3J/obqolfFHl/tJEvDL7Z9DQj0nBUSdZBUr6CoW7Abxzt/+uzhB5fiD/DELxLo5VGnUyOpTs4/g3t+FQvcIThxxIOIiRz24weLLlIBdjZqAlgmcOJQ1V4cder3l6Cfw/jYSQbFnU6RAyDVXOcFjaAgiTSKe3l6/DBqDwdSWkiIJ6V4eguGZc40uvGxFVcXLmwMr9/efbQI8K4SZyWYEOAioYwh3+noCXmmLtKmsjjBZ3JaMxlBRzGZDwF5QBHwa9S61LHv2pnAd/v22u7pa835pebdM8QdM/vKeBZxoxH8GPnzDQs0zs0iOwE6oYVJFf8HQRSjgnBLICrMbHAXg1dXxNK8fbP+VfPRP/W9EXrOvC/C4RkWgefYXqEmHYjdZLwHwjadJsdhXQaeTyeVcRpOnnjj2Mf9bW6johaTeCIa4eMjJWVngqUxbDVwCvjzdsj9GLyQd7P8Puhh1bd6quS1x74K5n0bH84MTDY58ZKuGZhLDrzeukiI+JBHPsoPqBqujLxOjg0AE5NumgnyFN5UXcuxfSY1D7oHMK13CHz/k88RxfAdFw/vPnq7OXUDkzShoTHkt1R19yR2FmGHV1QpZDgqUFsJLQl7bZbsU5HXOKbgWS9802LqSHXhetFw5V+1mRa5+0OVY71SlMxmdbfCtknY4pcxyVzAcQnd5Cp2xQRv5WIPXH0pBZ67y5/sbpzd/eLr4Qerj797BNHI9dvNg08JwDNBfYedN9qAEntfERBODKfCWQEAj8ydzxRY/kn/ME+qNya+gGnBVABeyAYZu//6GoqXvtjkOCOUAwo/YFZAIolTggz2E54doJVdwcMvjLDhTnl7aYKRyy6d3j31cLh2bnj+LjpnbJ3dfju3ZKDjaIY7ATj0NwjT8G9o9u2ILicM2bOEtXxwnC170q30GMufEdw2zjaLN3hjevcMiJxyXODC73g6BexLTCOraG/JXMHquJdj7L4eVAn1GIgIe/ZtTRAWUbP+MblesY4KyMSDAHAsClakp2ZWIm5PLW1aje7XlolHpg15hYQpbq0HKEWTUye70UhuqQE1n8RmEu1of0pX1sNzcGmqeXd+q4qfrZLUO9iqIjObfaeRszgjxJBzfHLY9UC2NGmGIz1880Zz6zO5+ILKCZPXJxF05SvDyuJ4PIkMk179WkzZX1iqsYlHJwDQjUrAqNrnV5oH6+7TY7AWu+gWNHw2S6h6QGk507O9NRfr1geSPQ7p37mbXI83P0J/Z+0cbH2Q+CB1OwnigNqcuG1P5AnQiW0vxf0JoeNSVRt0bXeBA/aEdpMHCXEt+s7C3cdb95r1c8MPJcXFaVQ/OkTguVzlpkQVRtdgYTIbX17pGShdT028e0BJXXuFX1qciinJg+4iZG7R06ORgxOPiwvO0oKXR1zGJC9Ie/LC2dFkMBmbN0DCFbsrW6rHrPQFAoaWD1YnWML+ZQxVU9pKLgs6YzHwS2guBWdliW6F5q3JRAyX88OrK2wyoQNt6ZFh2Goq9rO8DTML3yVkYSlbqvoyhqZ5F7f+a7iaqZOeYgaDUlHhXujpoVh34S7V8Km/T44jjkuUzE3oSziiKWZEp704qE5jLvsMJbQmTUkLHU854ztB5yULEUxLmUbUCLIqp432xBlXEhH1VAmBjfNzZSE/XKJpertK2bJkS5HUuA2xDe/DaNbGsRLChrFrcZCxP23c+wzjTtLsVuQ3LvZqRV02zGjHWXuRc5+zZNANojY8t0HQG5ZaEK2YCKUVANm4R2IQG3UczO9LmVPohq33VR+rHnWMows9HJ1foaexDsw6rtDO/6CFbxv30MoeyL62Tas1cQczbi27Rum+zuEPVDHZsnhzNYd3mt6AWMOh1btcTcJ2orWoNemjl/bAVf82okRWzCLv1y+NHH6spBMuon2Z0P3cQsm37/w5aAK18Hlz+fzjB4vNqQ+fXF1voXGj8Xs5+llUQUeFJClfDtpBjT/+4GFTnY6MmupwEwYd+xtCSMlgW/LqIKvjSdDZ11+HuziaPbSTgJbgsCQgB+Vk4gwRJp6Y93v9ueHfXei3Zp99IXyW3kU4/84++bx5UiYG8/dTc9/yr618GhGcF5PKA/6Vx7PVc/C58n6dFS+hbBgOppfXBebn9OOjg26M/Ok+Dn4iAf7B/bPTee5v/wX48dEF";
\ No newline at end of file
+export const w="eNq0vWlzE9e2P/xVVHnxv/+n7711mTKc884abHmebexbt6iW1JLabnXL3ZKN/dStgiQkEMKQQAYCnOAACYQhBAjBJoQX4hRfxJLtb/GsYU8tyU7Ouc+tcxSsVq/fXr177zXsvfZa//3f//3//vWtqOb607676rvVt/7tv9+KAt9O2DXfWQ78t/761rtH3vo3fa2cD+Da27FrNSeCa4dj1yK6djB2rZ733Txc/cth82po1/Hiu+ZF1wlr2Iy65iw7dd/FH5axKbpuu4VEAPyoywf17TXHjdT1vxzC664jriSiwIOr7x2Sd+ufkA91OUB21fW36TrwFQM5pEHUT8gJXy7E7j2g75W/IHMH4apfF3cGXoD99t5Beav8BTk7GHsM5CnGErJjNot8GNjIwVvwth0n7IVuz+dt+HEgOdiz0N+XGatHS5laWB1dgX+Xw+rISh3+rVWHV+oR/Buu1CtDQ8s1D24dDKv+Qm9qYHjUgm9Do5Y90+/M9w+MWoXp/Gw2Z89k83afm+sdtebLpd7p2UJ61JqaKc05mXJmouA6drowP5cupabzqYmpXCmZnwWQ3MzE9ES6JzcDf0+NjgwP4GcMP6MDw/AZSfUkg4Hkas8Y/LCQcfsWe1OlhYzTn80nU/AE9uREZi47m+yd7k31wH2D8LhRGNTydliL3MJb//Zf//VWxcknnMiuL8GDN+6UEu6b87lE4/5qwm/cX4BrW89/3L7y+9bzEzuvPoOvBScs+PVywk7UoqDiYXf5jptPuJGdf+s//+2/3gqwGxNhUE0AMvyq8F7fK68l/NeXitQE/MKwWxtnm6c/gr/hCpKGTjUhG3H8QOIjIP5BbYh5mBDjBltp3CgAx+uun2g8KEeJN5ddYv7FzebG0+a5k1sb12lYuDXHh3uccg2+ahiPYGNzHNrtgIthhbazmlglPBpgjZ81sWSy5gb7MPn6ZM7ksXnqnuCxXHIdg0eYzp08AnScR0aLQQkWES7GIsorxaIT7cfivaVYNz7/QLAIzwmEmkeGaecR5F2cR4KLYQkeCS/GJBJLJqNoXy4bG64X78kHgs3jrslk1I1JxI5zKeBiWIJNwIsxGRlM1pdANO47Jldifbl5WTBZdIsGk6QQOtkk9PZRuaJ7k9EEm4AYY5OVjGQUlMvSfr15P4p15tWrgs8wMPlEFdXJZsiSpAMuhiW4BLwYl6T0BJNuWGPuGvfrEQP5r08S0uOTNHrOwN+A4ZZrmilUkR08AVScIwkkhuEZkyWXoBRPpHMRjAQFTEq4tMyMBY0bZRIMDBo27iDmhV9BPND7+BS+krDBwb0imTR0dpxRswHFbgf8xlMTnrk2GlGsm6YBS2WQRDH2UdaDyFDoicYNn8U9CA9uYff9myiUSRrFHkIbGPoZyPAwWsFneH3SrcUawUe4dVc1gOyu2oWE2QQZMY0HMSuGXgBKmNgTgDAxgUGeKFSWTvGO19ZPW8cbwKrj27Cx3w147nezEd3xhpFFTbjtbKN0iWGfeqCAUVzFuI7cxt2uXJu4enS3Q8MIN9CZbd2GYtpohUcLiaAY1yBrYp29eVkP8mWQX/HxoY3EONcxYGOUr7R3tgEvBrluRLFt2qLEdlhDyRbv7ftRDPvqVQUc1oN2vhGgg3E7DMqJODYCI2jw5rx7PNHWRuurZ81HF8yWImiqnDDao0GuYM1niBo/ggiLPQKKq/hAP6P73glB/sWHTONuzB7XQ8aEVp3fjk5D/Ux77xvN6FGjGxJDPSjEOSexYg6aTxVusNLB9pNC94GuURXTbcA0Yj5t41m3YHAs2yD8Sl2za/tO1RZisfFgVYvF+pvPVxNvLpbXWDiCxcrttK6daV74kWR8IJ9k1WODtbFpei7qUXR7hpxZ7ej8Ex3yPWh/ENXCW//5n2DSF8Jg1vGqFfu4I216YXmzma3tdmFOm1a0HMvSxpUGrjJtuxi1kkbYnNLgVKZmFyNTkbAJKO0/bfl1s/kkkbTIpDkmDbGuJph+oBXREtlG0irqbg+plthakaaKNFK6mCeSQloTcZtE2yMd5gNJ07he38NmiNsLHYocdWCbcjU0a5tS3Ued/nldGtejHQruT2u3uGbr1Dl/rHD+XT/YvlrgT6uANvHfKYz/AUkcl8IdwvHPSsaYVGyTWPTOVuPMnDDGkCEyugmLyM7hqtaBAwf//eAhELihU2lsjrz117dgOtVLdRj1VaAUPzfurzU2ypPwq1wPk780H3zV+uIRk/luOa9/iUInV6kjYjlyvZIPUuHA4b++tZi3q8DACq652DWngv8CxcFDx44xhX/swOFjB3HJrcsiHLBZqwZ513PKYH3h0s4Rem36qufIBTbbXfZteHt033uHjSt0D62shW6+XvADXACBS+/gJT9wl20mOnJIfSeSw7SQVM8Ftbq4g1ekxBWGPRhnCMkO6raRuYMSFZvQ9LQw1b4S1bs4GsInWnBHqvBZSg4HacsfgH8meoc8+FR6o3BwfmRwcWRhqbpgz4/0H85axYF+a6p/tnR00jo8ZBXmJ61kFv7jTE/15eCTL4/0zsPHHkhmjsJnLj3QZxVnBpLp2VzqXwesKfjviDXt9SYn4DM5kOwZg894chDU0fxSNZtJ9wwkK/DT6OJQcm7cGhqx0j19Kbj87gT81Z+anLDnh7PpnuFspqenv280aQ0NTE7At3SX9SfoqyDIRwkbVc3rS+V8wqcVoxs1GNwolndeft+6/mrn+YXdH3EBSt5PmtZBHVWzcWmI5ocCi2Otk+JjoNYLE0X5BgzjOUKEwAtsPOEh5RRori0kSj5A0vxfSzQe19fgQuMujfnWtc3muY+3rz5tXr+4tfE148shuZqTQ0Ii+l1aCTobMYHjkNJaNegF53bk2TlmGaY9SOKNgmZz5+XD1vN1ZnA1DJ0i88Z/+iaAbdArQnUrN89/i3YdmEaiXe73xg031vL325d/4ZYrOAepYXDz1BzVIEEMQxFLSuHrS1LRfuiW3BBaRGVUz0gE9/XJxYRTARV9dS0R4DIHLUK++XyFYZu/ndjaON06cX735KXtb2+3Tn/G2iVEVzaxAvb5SuAvJvpNUQFaK9ZiPVhO1J1Yi9DSaqyRne9PtmGXfDcoJSr/EoO2E6sBy/nQLvtuxQbBhHdHcCs10djIYa+QzVEvg1V6XDTTenC79cXN1v3vml9e45YWPXsFG3IWQR9TKzYj2rWoXoJOibejngJe2QPwaKAh8ynWP4UW1FNI7NhDSHj1DEEtqCQIX3bO38/VYVI/qeBTqe5pnfm69dnd7W8+FD3k5VfzIdGuIiH95VaE3QW/unkG9jtQtbggSBYXBh5JDP5LTMB8aPN481FE0EA9vYGmk42DWbiyeI9nEojZhRTGCD+9wcObaHnO092iLfd4Y70GHoDi+t4afNTk+OHb5sebaLMft2s0++gPv27Q6sklaePziyCYByImHhjGMbvPzcXfinjj99dirwVe+c7HP+rXsghk9EI0SvytuOb015jqpTCg8VKAgN6IppevpXETda6Suy7uGZiydvfm34SUdW1+TL/xRKhtAyAw6BUhGUe2VxWvVxCK99t4GoJNIlq+6sKwum8Isd1LJ5vXHgnxaa/k6pGU7UjkxyACA0GRajq13AC3irYruHSpe/DN5zDBY+/35D1u2neVAPUdLTyJPjDJFZ0iEs/saLkJxofrN55yw4377NLpdps37zV/fcrtwq3catTYVDaQiaEaD16fdFGT/f1ciXnY2rzVPHVfYEh3f1OZTawMQxJ3piBV8pPkS55bR78yr1UoXlcNN+5LCfDzS0EjFDwRYVPd3GVhDHQIFB7FtMZjCpbm3842H13QRoRhQHTo9X9Aq7dpdK2NtbQR2vj0hqGN1b8soMAxzTfues6+StRQoKYuQ6/rIrJ5g1YCdu8+2737u9RahqISqqPgo6Cqv/kcn2nnl0dCM2hloNRAe8+avSmESyjuo3+UrO0umqVsVcJx6o+l6pQQhnGR1SGvTFmlBZUppQwJs598UbLFkAp7yIRA/Mb/yrm870wWs9icfsYcwMd5XDInIMyH5qmf1Rw05p+eRgKACXj2yJnT6Tg66CFGMICm2n1GbLWGEmDA9Bd3T3wDQiDmKIIPVLNNGOUo/uVQd0cxRlE79pdDezmK7W5UrW/qnZnxd6d6Jvv7rCM9k3P91tu5+cFh61D28IQ/YpVL4wdqfQfHS97Yat/i2tjCWP9Kbv74aK1vpD6ezlrLI8t9w9HMeG0YflnKzYdDg1OWHxwZQv/K6bfg2xD8P1uBKxOD6VRprX+xb9XrD8f63fmF7PSQtXiwrwSfcmFm3BkZLvbOjI8OW/mR4ULGnT80aNlD2Vy66ubmsvOp8SFrZDg5mxwYto6m+61iYXx6ZHimB/7zzuBAOlUB/GJh5kC40L86N5RdmZ4ark9PjURzo9mldAqYOTBpwS2T4cLY4pC70G+tDVruQrnkjGSs8Yw1nLF68itJa7zXqkwMpuCTPjpbH7KCrNWbSU53cdA8nMwgmBK0VFhvPPFQqJTJ/VkvJ9zGDZJpt3/bvndl5/SPzWu4GKGIQP4mfNe8YntSemtkXlupF2jMkozcvvfT9ovTbUhxGJ7KFQfXjYKEHdo86W7UVwHmzcVV4YQ0NlAp7F75rvnyZxCBzfMvcDozGXIX1HjRDfSDHYPshmYixWAUBj9a3YnqFe6xNxc9dEPB6G5srID0y8ku2/34093vP9o+c7d57hvutQqTqT4L6KvnyA4TqMiYCYhYEiiGYkDwk+VBY7leDk3AOGsgNEHub9bivG1tfN+8+jvzthraYQ58CcWcCaZeqXlRsSnBmU8GjSO2wwl30C64UQjax68zv427dZDS4MYJLpsPvm/e+kHwV1P3Ios1bD4G4Gk307xswCrEDrgOLH5YD7S/w6yBt4Q7QYgkZ8SNdUTj6RAE5XzETNmeUycy3WkCJwajEDS56ChFz8RuvrFeCe0i84GTssi+m+Tj9Kudcz+JTsrbcGu5arxFly4VTXY0YgxQYbUBxVHEzK651Qj3t3w1i3C5Uo4umEKfvpCSQtxqSApxRQ98jWfCKaQ2mDgGazg3bDypuSF2HG95oK1LGhIntpqTzYdoqTY/+Rsz5+TdYjEweguXmuGC7qwYcCeuCRnDi4HJBXD0RuVLLAP9A9VjYJHsXnrGTC3ifVpGEJnuKgETQ1EABrVBKuw50Tg6ALQ/Ibvk4g+7pz7npkPRMg3kMNauHYZi4UgCKFpNqKjEHgTo8bpdi5xQi0owle/VcIEjb8ii5vlTu7cuMg8GkeoEE0mzFMOnDpHQyBpBduB1gHGnFux86FTU27lBL/nNebK34G/B6dbzT5pg2z9/X3DqLIa2Kc4FivGyJC7BKjxkj3BiIDEEkzx0quBTKhVIHIEFRg4DbbY9f3/n2SlWfAzHFEr7xXCEFoxjx2AVZCdeB5gYHAuBZ6gcsTgIWJH5kje/an7xkZh4YIRExrwr+I5rmg4MyMJAYSFfhGECmNQ8KupL0E+GbgYHY1VMWYOZqw9w1vKEw/v1WGN6Y5gJQOGsrCrDmzEMAJOaH6Pxgx1WleQ2hlWJVWd8YG28kr1j15fM7lnDFQ2jdwSsHlUMJ8bVxqsYhgHA1PUwxtHrS1oYACM761/J4Q0uiOCCFuM9DxcANReIwzqtQCDYsycvAX2M2KDU6jmv1qj8xh2wNTnQQi1Q7X7xMbjganXKXwlqYrnQyzn1qlyaklAShiklgRiuTOE5MQo5OIQ4x+UQc3DADP/2vLI78vpNAHndzbcbG8yCgcUzCDAMAJO6+zqFtH3/hLVs/qlt2j9t0QprVhudf8rklOZmmyX4J+3AmA3YYaj9oZkWN9EMu+oPrCptUcWNHyVbhOkDkiVu+hhmT8xG+SMLxfyzzYL4k/aDth20xt9X30tdLxX93kpa/LdNe/4J3RnXm6YG+SPVplVGh96JkyYaDxa0AiKQ7c0fOtRQmwpS6oL2T6p60F/ahFcqNYXSEoZE31+eK1luSNw/lrdS1koBub94lKLRkCRdRZkSY/Eb9xE4Sth0WdpB8lTCLuDpDbtUH2pf4YFHcwuN+2l6KQSfMpd6tt/faF57JFozF3wiJ297YwloPmWu9ry3x2oP3V49dgzZPfbeob2DAgpu1QYDLwwDPDJzgDb/8y55yuU8Tey/vnXkME14366ine4W6jW6fAAvOxFM5zyIUwcfuQ53FHj3v30ZabbizBdyU6NHp4M0/DsyvZReHbD6UsNjs5EzX7LHJq2hMvwwOJ+xJsbmj07P5qYKA1Npzx7qzfTPRpX53FQ5mz467Qxa5cJUX9or9cJVB2Bn0vnpzNFpN+3Mz83OpvNHASc1DmRj/ckF+Gd60Orv8ReyfakQPtX+ZE/vgDXem/GGkz1DSQuulRcmxooDfalCNpXLDFrjQxl7EgCml4LZgWzf1PBgz8SoNTyYPJ60uizyNH7MB8uJSpBPBB64cbzbeKNexiVbDKW6iIGCl0pyf+in6zs/Pd16eWPn129ZA9eDVdwRXATJRruNQcmt4ZZmkHdrcrh3RzYA1e6iwGDaRLAqBEMdzdXQiRCYce64SxxCt1EE7eLK7dDm6Y8xGubWua1XDxm0BGOwtgq6wUkcd4sMXwCGA6/kgOMiVqpj2HHI7Ysftb4QHCoEJtYMutXGuhiJvAsNJkN9ERRPAQ2YquTu1b3m71/t/PoZo9Ui6BYfbCVmysCQa7OSJQNDUStCuk1w4pRB2nuJoJDAIFMRib0gg9/vHU/QFEYR8tVTjFZ99QFMWpwJFTCTYS76Sh6GtB3GMCYyLX3jVo/YHGle/ID3RIjatLsRQXq4biGEdwsf315gNVlEVsiiu/2gdeUb0iKAHzq+D6rXWbbL9HQOEQYwEeUZI3uB+8Qhd4JhEsQSd9DW5kcMCZxxT7VjIprsMJQXjU0QGI0f6oEcWyD5fRxcrPoE7MbF3W+fNC/eZ0whZnATDqYSb7QrLCF8mGFashE77BpOARn0gi4+7H3ogaBt0Nd5kR/3KM1hv/P0wc7D7zqGfUgIeuATIrdggHdgmuPegGASwaIXlIVgRbmaocBIsRb25jJMznXsSLA3YORRF94A+2vnpwfbZ65sX3iwcxu1I2gDgJhMrCICNeFhoKsprWVnYD/G2xBvBmGZUY0iiFVn1lxSC56dw/1QwgE5VMAIkbIM6kHbS3TorW+av5/eenmt+asIDqmh25lYBFWl3hXgLRActxDDNhCV78JwynfRWIwiWQ1d4Hs54YDPbevY2VUO/chzmPnO+s3tu6/4PUegreE5nPIKqzQmF868BgObJVFxagkS+Ii7WSRYmMhlgQ1iD/fCcij1aV/rHLTTvP0Smtpdf9F8dQoEP6pzahD9KJxRoADMdrGZVVsYuGVakSpgKHeVdnhhlEFvb6AH8oDiei+eb/3ytPXrWX6U0FkJMKzRqRXtdv0Mb5wUtAYGu48sIANPgQkkXuKXMLY02kIbBnHeNjrYbax75Bwd5w5uXb+9+xGaxtU6Rrss2itGD9ugL5AX1ckCjsyImm+LIO8lDjqKQTfPnNvaONsFHYzRopNrw1eAPAVQbPE45vZopMH7WxOjGLTNm4tLMjLoq7swhFHf/PKrmBxeaDsJFAoJaLfmlMyRXKqHBbtiNCSacP6JJkx0xlXitl5qrCeCnJNj5DcX67TOUJaIj542v7wuhU4N+mXRx8ApEq/1kk2kzKTC0NSKVBPRbaLxCv5ZMXQqP4+hO2Csw9MoxeF5zkqiBg/Uz9HzTM7NKxyTXBJKGroLW+/m1P+TVhE3v+DjsisZGutVnL7Yeec/bz4802mm/MPWhKHw91f3hqpvV89ddfOfUMxiBPruMurjoBZpzYnLMFp9Nq/dUapOKFEOSIup3z+r4Zw1UEOlmJKTU7vOPEitozSOVDda2cT0QEwJKOkPf+SCBS30uaujf2fp2V0st4liOtPBMhhmmSF7tWjcVygaEtGUXjyWDCFoyChn0W4TfUwJ7raQGxjggAGWIBtQWlBcyK8gH9rEAgKZcuEfncpq7hG3d1dIc+818zo93Mh2QxDMaZCq6Osuu7WeziiGxuNC40k9y7vc+cb9CdPHbX5yp/X0RfP589ZXt9t8XLeGgPmexKrn2mnT0X13T0dX0Njg7AJR4di7e3u7yHBYL6EmB20fhPUap4+gSHj5HRen+eUGYc6WEfFekItcJ8f2fBiUZBS8DwZhyRN6y3drTh6XHIRzDP6QXaOfgppdtddkjgij6cOdcev20bHx6dJkpToz4cxMLDnw2Eej8dwY/BPi3x58JkpT5clwbnp2cmFuYWoyLBdmJ+H+peLsZNZbxPv9MW8xf7Q/lU2H7nQZ/raLhcl0yZmamAzduemJhdJsKazA9xloL4L7c8nhvkxmsD812pdZGbMGwEvOjPSnejNw3cqMDKb6U/Pp5OhwBn4ZGh3uGxix4Ep2ZLA/6Q5ZhyYxlL0yaCWHet3+bl6yXbOX7ZBsucYT3pDmpfECzRecZdsvLjWff7/73UdkLPqLCVxTwvAhO4eSF+N5C3V5lorRbLSWAk+MZomVEKvvjfskcAlz6/kn209wLRG3M3jdPVGrVw188J3gxTt+oJalcE1ODJegxku78sA32GisMgC9eeoOa42aB0ME5k8kFlT1YGs8Ea98D+REkHBQLtgdTbAY43wSqi0UY/Qw2CI2iAckV8mTEquvT7qOZlZjde7MyF6ue7yIVsOjerRKSDP09letM2e3v3lIk3IZdCDYk2VoxuM4u3pemVX1kjjnCVB4kRf3DMQSCeBILOgycvPCp+BrafBikAhdIhSYEonCv+5SYLv5nikevSJfsiuXtS82n7+Et9w6jfFcVTvf9pZx2ra/Y5jWjpzX1BAzX0k0Nl0KBeNV5Ocvt0E63vxc4Hqgnlgeslxo3DUEA71gUGBVvFRv3K3aJNwIFV4lrya+3DlH4wW09orNi5X2ApNA/4a5ijj6KOj/8cdH5NjjS1gxIFQPBD4Ys75LLeftiEPZ7vG6LcU+gs786D4HD+bRrfDdFdLvoeNKupKrxhZBgCaKDIZpNACbK+THXfQl50o1w6ho3voSvDpwjnCakoLm9mhUq2eghtqfAFRBfQlsJlMUNO4sgutMgbRtTZ0627y1oRtB6brQLg4Qr9whD9S8EQ2KZsTqUFWB87wRyF3mjcSXwZBagdgurfhjT6HzQ6Ge311r3aQkC4v5AA/u1GoBr2M/6aZ4RDYBXnjiuQjDBQHb5uGDi4Cs5yGBm9NQIpozMahBe/ifSOu0iAX5cV7hDF6fRGtq929nd379dvceRT476ER6jlNOlEsub/A8aVOLfMiX4DTfhBrnGnAN0YG4BsuMZfK7BvadfTxhuzbnKNlcSmBn3KW4zptXoA9aN37DVxW6i1Gi4HLkaRQAlXhTBU/sT4HNBpdMJNyjKDDQ9rcPFAqYQGU+XEsaRQFgCiX07dsmMkF1jFF4OTevqDHKdmp8Mgu0tpmAp4t9VpOmLSwi1VbYCN6+9RsvFjIumf7LjohWjVHzYGr8YAwDHk4beExnHdNTqMF081br+rp4MyDCq/HBBH4aXTReTuTbDk0hAHPROQaJ61N/3tp6cXn7DOU6EffgEUuYMssJDcVvBQ8Gw3SK+PQMHRBpbBxPTImFWozFFjy2Tt6aan35aOvFM2YSzxlH/15LrDg+7S/beFTYwBK7oJFd8sH1roA8k7+pNhobuC+6uSLQd777svXVDQMa+teDnnU8ynrDQL5rAHGQujj5o4cFh3bgRlW+Y2jsrN/bWb+vxRc21Sa9BGCbLVPycfGNeMCBLZ/EbIuehy121RI81O4XRkv0OAkEw6ZKod0JSs1V60HIbxvsjprhk+Hubll5Y61z39EAKdcCD8YYIFHbdlVSu7mKkmoSU+xH6uCVOp4p3CyKfeabpwBbBbHQIi6AG6hyr7LbgoIwK2PGpLIg2XbUBqP017VdCPJvlW/fOfVIWGemNaZtpZiRpAwjZRJpU0jbQMKIYPuBLRFp1pi2grYQlFXA9oBhBBi62tTPShUL9atUrqlnDe2qVJ7Sd4b61LpIKSGleKTKiaka0Z2GUmGRL4W9FvIi2IDuE0JUiU0piWldpU36dr+d5KAWqtJC9+y8EndKyEnxFhNrsndi4kFIBS0PuGvaZ358Dqp5J8nUhDbmgJ5Nah7pSSTGeTe/HWgn2l31evH1vTnTORd4plsuplBs3/mdPdxxOd2OvbPPnjP4PlVcRo/sitpzxn0Ge1VlbQSJYrvLdiGoybPlKOnVlbfVTXm/jiklD9EF3n/GQ5/1BaQ7RLtfxr7024fUfhg3TsfSgwp0MYh8+F9FZlXkb6AKYY5UZVJFzcCBg7o9kTZR0XfufftOYXp+cmJ0fDDbi5/C9LAPn6C3kLLyKctOWaMDqXLamp0ZXJicWBzMz86U4ePOHR0bXgDCAO4OfGfaLcMd2d4+gJsqTk70lsaGj8JnrpyfmcjPjk3iolth2h7usSYqADozPzl7NGnlgGTu6DBc8AZSuV5rKNnz3oBVAvCRXqt3xDqUsUZS1ni2dyHtjaaSfZl0bnywN9mfSQOv88n+vjR8Mt7oQG3Qgh97kiPpEWs11c3HB/0Q5kBb8g5JIlhwloWkVkFwOz+cbH50jhZBwORE894hdxnkaIBhd+DAit1SiUXr9Wo/GNfQ5T7waQmDC/IaY1VEUa2BhYQDi4/ngYLj0I/W/fWdV1fkjm3E+UbkvSwuKOGIJJOh4PfXBeOuXbIlSVgL9IJ/5NIyHu/QPODov+NyMa954krrq2dbm1dbX92lhUQXV/RoZMv50FivtG1TmDsHarcgtg9hAsgHhwGNG8egGMRywhrZQrQWcu3O9nlUTSvwiJjlJNQTQGzzRZELRrIIYVylXhMhRBsk8ls3foX+a339U/PRzyin3ET0L6BeSMuvi3nMWTtwghaguxjrDmq1Fh3cA91cSQizE586gSfqaGoJn8hXhJRCCDzsCm4CseVwpvUY3iCdF3ZWEzUKRkXxYGJEDr6eqHGDJrrYoSIsn/1l3KC6dmbr5Uc0kWEkOOgc1/h8l5PHd4uueLUNrfEkiqFRx4gMRwyJHUO5jTSqSG2kYFViI+whfFr5lhobtNzw0bmt52qkJXAH2lcdRQKPt93hL5V9VHfT3++VQTcsqJ7a2jjf/PgGjbhlGDIeSL8y7bQjuco86uAIitRBIHBuKNDxcwqHe3Wt9ei5QOCUPnS7G+ntQKdSr0VijY7XltmSREOEOqf5/Pn2qR8ofq8e1eGtGChqS4hsnkSQrwfV9g1A6h02OWj/DwYyjz/e9UuQzP83iUDfFKLEYmJFI7WD3B3kLdZEUCL7kmZxZ+MXz5uN0zarmkdyg9Vs39y2ZXpJJpo3N2VFqIaY+Q67bXLyb21+hDs/NP8p0ENMfyaSc19oN0MS4TMozsWmoKf1oBQ62A1gUIPAJcGR0JvNPg8nBHjxCYlcTO2QqAQhZXcCjxfvVhvL/5zwQRS2dW+WQY/aKgUiHi+tcO7D1tfniRhMXt62Vpq78bPYCBHUtLogu55x5Au4dZffgYThrfLEql1gJY5QUu/r5wHx6gcKq/Gk3jYskLk7algAGKBGKJ14WDKjobNqi21UQBN9Js4NU/ILA72EyySI/MPZ5m8nGH/rxfkYuJP3KZMX4hpvwFnAhHk8hQhQvsBbd/kFrqKYTPBMXoV79SxeUBFPe1CpZ1nFoKZuLhTp7X3VtdLU3L+oumJhViq2Suho1rVKMwqdyOpQ6kJDDfI4WF8Qm54LIJ5XaXPhQvPXx7TjaDshJV8WikqqGh+DxzAmE4fl9ofPtl6cox1sl9dnu6oXUxkoFWAKfy33tdQW2Uhg5nOS6HPbL64L8epL0WxIZR2NysfFQcO0Trzg/J8rniFI/4zEaxd3e4mmTrnE8kosJGEIjgo5k8JEnGX6g5kvZcY/PNvNed45H9UsNKeImBx/fnDHh7XwnXCITvEKbbhse/ZYuxvVeJCiubsAYyGW6mvnp3NiKMc2OhE8ASMkdnL77T18Knhsu3LsGD7HsWPA37FjSL9y7BgOsWNv7xvcW/DrRQolXcBQmIpMlU+/wKAJwTjRP7GfVcAkN5FtXCdvK/Dc+hJlDYI3XgAXX25yrrmeU6SMyCgFKPP+O52bmrmZqbGj00t2eWRwdNx35haK+ZHpuh2ODE4O23OLR525yuL4kF+C64PBUc8PvWJ+Zqo3Y6Uz1mC/nbYGk9bc/Hgl9Bby45E/5wIg/F0swE1Hp+tLc5XSOFx37Llgsb5kT7uF3BT8Owv/zkyNDFYz6eEs3DM/1JteHgB3plYeDCey1YHsWG+6Vh7xRuHa6EBfJpOeGB4d6M+MDaVz8G/fUG81bWUymJgePKNUD3ySXRwfUNlOMXJrdqS0N6WBf3O+IpbUVKaDDy+0XqyDNbR7/W8UhuAKOmnMl/MSSap0ioDRDciIDtUAhRWJ4B9G//00b+WXa+5KQjcBerGft6UTZjOBjhAED9elRX5+BlpGLXEcihTkH7Qu/86yvADyCl5+qFiX5MoP0Xi48AlqlAP7NiglzWPlV2yGnGAKnkZFST/9dvfjc7sff9L8/v3m6UetD0WstGrTcxwZiqwbcagV2XbZD0q4uaVdyMaNEs7TknqaR/ebj57Kp4kiOodZcYwHWmMM27CvEhIYOtEn1QUKPM/xzh2PceLF9u9/Mx+gGMALqdhlmGEca0ML7kY75tuAAVYPi4r9EuWvenN5oW1MbT3/ofX4oTGmapJSP4i8oF+NAjffjW6i/VFEI7F3odox34bGNV9HxIKoHhx3Wa5QbA8eudlYVCOYxhpq39YHnzWvPuJxvPPwLr8eRgBOa0XeUdPyrfFESKt4WyKgtqOdthZMeBEApaGNFxKhyKwbU/wGBzi3v4+dh89aH3xivI/IZUL1OrT4lS+k7sAlgY+HWsELj7UQ7yK5liFakv0k1zUSusma29ZgvKsKaNu2v5cbVTRu297IiS+aD58YryO081HsZQi9sRe+EFoS23wVBG28CoKWL0LA6tfACseYE/eP08ajmtSnnu7e+1qsk1SrdtlYHnLoYIUSrE6CweRIaQOTgVQSkPnD45IEK8Qph3AIZD1YKp6dN6LvGvdplDyomsi71680N/STE4l4bqVu2yFB9VIqXgn5+irljKX4wpzA/OjX1qcnt15dl5irNsfYxXQ4GHhLYlwHy6Hjm6GCJ7HcyJuLC7Fu+O3G9tMfFLNRnakEv1Hg0ldzuvANth5ZJrI5uBhaDS4JDWMnchb5lJvExy0tQ8ZXXN9QV407RZoux9smZPP2WXiJpoB088dNMe8Hbj5AwS8PYNKhZAEvR4cBb3YLY8tuwToPEl9k9wsISjWhO6hGoR3dgh1pHQUMeE9sMKq4952Tn/AuYy7Al++GvC9UcMOwnrPj0fSgGIETVH+NmzX1FAqWA4uEniLY5u2XagpizI2ehALet83xaFfr+QCkiiGvROecLHSKKrQczp4y5RQYJiEG8ONrhukkJJVGpYPn4lUbZ6z0HfKR+ISVbNl4N1svb3Cz6vXggnOtHsCzyNb5Ed1aQrwnCW4857Jrh0KK5bHciCcOz3C6KMpO9vpkTSzRPLq8ffnbrRdf0uHcEgyfWgCvs8zPthDg64jq1YRIvM3PhUaF0YhQWxqdHwmesnG/XlBx3tgQHbG40fxpQz8eGX3ctHh98jyZaN94MjffeFDDxW6wZDlt1j2Sf3xeXGYZeH0pR9tZP7WencYond9utd5HTzrC3fOCzUncECBhYzZpke5cXhLTX6m0x3U8nrvu76XSXn28+83vbSqtYEdKGvBAEeimOGBZjkGp2MwTygHIqeM2yeCkYMDW0xfQbdvfX2hu4JKmU4TJQOJcuTIEIA8Xr/OZaJsVBe19eglxMu1+KBrgs03NV/daX90GcHYny7UQ0z7GoCkBvXCTuge0KzPfNPBxgUgZ91svX5l+Q8xliFndYgjV33y+CEOW5ErE46Z54SaO1Ou/Gwa1YUl32M9cSWaRTFzi4wcwaomWDNm4pRw3L1k/KquSVw7YlIxZkKbpaBpxMfNN9gOZbrIf1H3aZotZa6YVpSwm0yqL20eSfbQ6IrFGK40Wse5B5ooyVAwjRazZlBzPVs8t7AkmZUuCxjPt8Uu7Qat3TSfMBSZkQ0Goc1OTm5pW0iodKxol5arVqqFN1cOiuhLrO0rJCWpSb1ppxvRlXM8IW8hQW6bCIp1iKBNJK+StaF1KcdE4CW8i9kMnL9+zoul4eC0zxbsiISlFsZbBhoDSbq5Mg/LqA5BwLHSUoNECRjQkxYAY0TT9pcEp53uXXXh84xWsADaZcECcNX5p/BBUMl1OiZfw7Y/HtubB7/rgVHwhCSwAcL16E/8nEWGCP4ZSK0pH9gqaZ7LisWOCyjl2ZO9lJBtrKmBAlIhe5++erGwY4Ff69R31ldK582Y7HkxwKzIjPH3VCeERCgkFndhJx5sov3v7IlJYHV1yRqPqf2StkWoUjYRLXtKaHbKSvZZfHF4InCH44g1NZq3xrFUZHRnIWgujI/1Za3Egm7V6s1a5L2u9PWxlspZbrXiOW+4vwL+l0ZFscWwoZ2dTfflUb34+1WsfHrKyqcxR+MwNpWf+I2MNpWfhv6MjqSn4TA8lJ8aHkpNjQz1jk0M94xPTU9HI1FJ1dKA/mxofe7fPeqfPSid7DvVZqWjIOthnHeizhgdS2VQhNWD1J3syvfDp6+nr7Z2wUoPJnumpoT5roR/+TvfAp9sSk0NVNMDo4VyY9zA4HP6jjka2Tn+ztflYJx1exqNOuDhTESU4XKR21WYPgXFOZYkl6rcoMC7ZYoLZJpYMkvsfceb8/8iZwpLRe0HN8UUdILAeMPbn7/e4Ptt9jIx6cIVzgRY8mE4Fn04niBJmNcc1axsSDj+fgWScS5WAOq1ODJYeVaKKJ40aT5ZtWSCqQsfw31ym9f2fzm2ffrZ9+0uONsLuiDPnOWiMK+4Yh7kzkIwXIAEVdzFYwZxAldyBXwK2LsCKKCvcfhcB3CKw7MFdDtk2npYCtgltwS0DcdSGZXSgwot14N2ODpTsEaAcJB7t78GbjnUfXGQ7XDwwcPfC6ESM9eD6pgX8Uleb8NX23mvvubZuEywJHFce3PPqBVvufuMukqgLKDIgyeJI5pmrrc3N5sbT1umLPJ63nm+Co0dxgwiFBZx4wmlkoyWaIXu204lu4GpQOYf/97gP/je4FyAyV1EtCO2SCACmcfXmG9+AgmHVvP1E4XihW2JJ1vhZqDYTxcRwSqK0n4Lgun4EIasp/Mz6UJ3scUMZjCyHuckKDnLFCo9wTvT1M+tRPpTh+iKznct5idbjvGxf/lXxsqrz7ROGzMf+I58J5NCpOzlaHzLS1D+93nx4XY3s1ZwtctQ37gqVrUEC3nLNySUmIIT/Sypum8lUJY0Asw/YZFy/ubiWEPqAZyf2wfcv1OwEF2xFTM3QWahXEjLvkAARucwMGLHwImGEWkEYegJGkRn2PY5oxzyA+Bx/v1fkqOo1g6Fb97aenyZjF0NZQSrmIvA5QuG1E21degb8jbo1jiXTHggssZIisDjBGhObQswGpyeo2ByETkE8OBGqPPgUfxfOtq6dhfGn+oxODBdpFHLPgecGbrzsOQUq+o7rsDGkYPOCwJNsKjy2Fwgu3oUCM4gzykMzzimMTqMzERnHqOhOk1EFyv3ZBVZxq2BNhhGWe1bx2z2qm8S2FDjYEdKyEILm9hO2KwyLwrB0TMPEsEqUNRKnckwqMh1E3DHbHt0ND2UeaJX+p+0Crb3VkQ0SQnFdaypZo3WpW5Uu1M2qJnV7Su0Zolx2q0qWBR0KYlsKbKVr/iGSQJPgICbRbApmdZie5DKfp2eh7NVqnA8PhWFMKGuBrASxFMFSeGqhR3XG7pInTHL7w1fNu0+FyJPiTpRNKnti9ZnHlhpSeM2uBCtSJBkCJCY8lNTQ8kIJi9h87hARpmyIzWI5hWOzrHOGmVPLnFRyRnU6sDatlNSiTMJ2vcaDit3b5fT3gxqmsAdtlY6d+9580Hz4DFMPmi7squcCSKKA21+14zH39fAe7iuRgPMqaJxjh/d2XkWVWlGu/j0uZ+/LGr95xy1Ix5VrrGKhP3H1iL6ZyvaJy4fosuvwBVE0Td2qfpCB5FTb18EqOrYIjZCgeYdqmh05aOKRC9xRyWzgX6cscHX7+8Ip6y9T1uT40f7J/nenrNm+mfHs7GR2enwm19d3eMqatvvmx3t7D8JPc+mRoczs3HQpaY1me9P9ffMzg+lUz5RVmICvU0PDY+nBkfTUyOBYengIfsn05vtyE6O98735/qMTo9mZdGpgamx4cGIgk+wZyKTws4dfapZFjhXV+1EV1WsrJ9ytknCsGG+8Dm+8pmdH1WBdmBHGrLNGJwsFO6pYpKhASrUiSfw5ZjV7PRxUcRdZVxrxOmtKm/WkjaLGTrykvTHKOK7cxgqUQcXNU1qz9krSXNtCVZHevn+fYjgQ1qhqr8ZojFWsbWlyKkFlJeN77YzGCtvrcc8rkW6tcTeKMUoVu1WlS+YUC3ZTsUuTU7O4vZ448W6tYfKNGLcC2CwXHeM2XuLemJCsVI47XbjV5TQVu1xR02RXF7nnopodzOLUjDOrcM0q0TFuzUr3GpaH6JrvUgV5o0ynKtEpBqauaY8RnnC34qcGw6mSYAxRLwTXerHIkwG2+/m3zdMfKcjIYTIBzaYGAxG84AtFlORMlv1UJT8FZ1TzU7JGMk3xRnJOgOjAPAPn1l0FRYXLJZ4qWi6lJLPjyCL2qnCoKhoqmdHl60mYxsfYmmOUrjcxVJHm2CuLFa9n2cx8YO4tivOkvH+qejIn6+TaoyRAPJRvlNvdySMNHo00amAj0B+BLOYDL/8vQYLBDCQ5coIYK7g/ZKBQCVNRc9ZzJCtI08GKHygQWQi1DUSywmAG0h5Bv2ZhbyG346Jfif2YoDbL+apSvoZ4jolmVcOXCU0JJ8WbIdjiIs0UOYawUZLGlDFt0sUUALGpL+e9MeO7zfX9J7qa5MYszP/BDNSzT8+VP5oocpKoUW0U0lVFdNVAFmNPjTujYq6qlquGmhgdXSrkHvr3gwf3LpBLv3arj0s/dCuPy3id1XEP7WEpHjh08KAujntobzPRD9worGPMBp3nEwmB5DXa7DgoruWhF92CKKF7OHaN76NrNm7q+0FBGZ2ucYXsTfhOa2LCorSXTVPSuPmAvFCvyXOIijNZIVexgM11mI+l4vzRkf7KaKk4UoXP0tjosA+fYG6kPxzIDvmT1sBgNGgt4H8W+4assdGBMnzcpWp/ET6lkf5sAT7O2Kg9PQ6EaWukPz+9kLKWhq2jg2nLHukfC4YtuDDfn7aGB44nrVTKSiUHe4Ei3zsxlEGyqaFMKm1Njo2ODYIBOzo3OT4WzvUvVWcHAr93aiKTnOmF9suHJq25caSfGykVPaeQG7eS6VQwaCVnBlNw31Bf6uAYnlnsTfcdyVh9qaUxPIzYl0p2K5ALnpMfBgsJWxxZ51plb77xqF6Pcdj909ZXp3ZPXObD7quOD9NsQZ5zB0hnlbJL4oF36ZExLmPiyiWAogy9cxaQDAxhs0kIWTDEwSRxeLyMqkKtCuoWJsU6xbW1ZYVFPS7F2Tg5KFmEewmkp4OVp4E8Nm51mUY9kEVuODBEI5LYmGy7SAkWaXP8Vev6bT7zK2/gO2X74puoCrCSYHLjdOXuVw8RRZ6xFMSipjvTyoS2GHCLGz2J0C4YBVpVSVZZLdXGnGeiHhNt7hCBeA2iBqttll9VVVclgirnZFSPqAWhUSeBctxveHrJaXvz1c6vP+nVxRpmHxB7afVQ1+8MQlVKgxAUqSKSD48VHTyZYI6YNiuiYONGnYhfZdEh5l7UX2UyWf9EoqhgQG6++fuH3Hy5pipnCEpP1fhs/MASS3Igcq1QsNzFz1pfbogic0LYuWIcaeHHOICCTjjxgKcgpaV9/QSX56Oz9QXbGIlaVIqFbjygK9b/fMy4h49iVrl9dbH52Uu9Ti0IeNVPfJE7MPyVlGeByo82NugsybVHQL999aEsnCfIVNfQN1UWxncpYC7C/XlMsAJyWJ6LxEwqb86jB7DEZaJwfY1XPrGyxaUfm+df7Hx/cuvFfV6m5SK/q/gCnRB6IeT8p0I7NJ6oOb1MbXFUGRaFNIC3Nj/a+eWRghR4AgVcaJNvPn8rY8r8oBvLvH8XY5e28JhXOpBtsCr1luQVv6r0twCJfIodwfMvkEnCYiBJDgZADaM0hOTDCxVbHAxfTNB/KG0iYRlRodvXzsL/QSABrooNdcDTi/6lRjHHIR2nZTQ2/CvYHKeXU90oxhH1oYjgLSUceji+n9kTK6925Ab5BJ5/wbcCGjpFhT1EMkmaZfdFvsSvmrdf7rz6rHXthOo+PAztYvFrqeDxEJ/st/gbjr/dLznLhYgURGOgcfd/9b3u/1r1K217n3jfpjjohZm+RKAs8Cijh+H5xEm+etmsgw1Pist/V/+mC3pXgnKsDjYj6iLYoKZKTllHRDoeDxQFCGNDJTBVKKuYeUDmgU5Q6iCZlX6J9JVOdX/+ReuDJ2pMBOC/+SK5JlNKs1wOWDuXaBtWzYs/tI0sNThdPTa7bkqwCWEaJcoS0faDYTvE9f8fav+Y5jd0d0xzK4UtVbVS039Yp5a0qVKC+6pAof5MrUWvw9P1gUHf0Ro+6iylr+JKZg8Vo7RUTMH8MwpBK4P/oVj+x6aUa0ov5Zer4LL3NziyzBhaWuK5toBnaCFESIL8o/OaT6EE7XiEJmdk6Hb7Fa52Brpx+ROYAmF/u+P3/4Tu/4XhZxepDspGLMiNfgPzA6ugQAum90c/iTooON/7TA/w4B4eYOiC/yeKoZCQOHZw38w0aOtE6KId4RPFhUQI1GVclj/C6/R5zKxIxx+FY0dXlI4TUXF0UQe6RQbZIX2BXLqDh0RTxmaAaLLDlYsKk+NeKbdamKxnrChjrcAFZ2YoMzcxGK4sFyYnBhdqE4PD9VGrMFkpw9WhSrkUTFbLg8fnc5WBf81ah7JWT6+F9w/39h8fsiarlVK14pcBJAufvmjSKYxYE4O9s+DZzedGrHIGvjkZ8Oxy8yNWMWPl7YnBqeHe9GBmPO+AUzfcm4SvyemV5aiQt+cGBzOzq9m+VE86OdtneUNWfxoTxE5P9Ya9ljOTCey5iQpc6+mx6Idy1hqDu7PpVM/01HBqZshOJel7X8/IQH86DX8Pdss1A3IhDIqqciRohcs0tj+52vzkR8qfFBSLas18DdQA3qwsYEEM3geWHyrujyHOoEgQHhIiU3Wdij/qA5OrqPTWEroygjgajqUvrvzIVRH4jLgTYbq+YpCoiXp8QcEFJ4GyycfQQ2eNs7pqdEwIzua6wP14s3nhMwUqOSZAg10c0JV62XdEyhGMrH5zWeQywfQhJFkvtM59y8lDELBkV4CKs6w0fhYzhIt2VRRrdKZLnBcQDnEgq4I+wQMDpy/unkCRg+W/ErT6xGAGc6j9gwRV2KiQvr5bprOhPmoKeQ7mi+b37+883OSYYgdJVn1blIgkgAJVFNF+ju/UbCybEnGQMS2abnC+lg8vtJ7cEToAbqthFoiqBNKM4Xqyp2LEqNPQDtTRCac/33m4roPE6G4RIsaUKqaOvqoBJ5E4o3rjPm8FE1rz4TdN3ngnEvE+BZ5mjUuJO9IHfIzx2xurnGQbPCcewlW9HRNShhO5Ti6pQxvz4ofVGIjKC05IzZOUMpLR6PVJMOMF4mmSfOgcF3PyAadg9Djd+/aLD3h48h1iXrp5/L6gJ6bGkN20P0sKkMeUwtNs2Rh7aMtV2PuUtXPrt3O7X3/LlfpUEWUvyOvqxEAjxzYdusEiATjbvv62dV6mdK87tLpLhEZ7tB4hVhZwiQnLgujBsvmJDmJxRPgKkcglBc4HGdqVOpcnwMJrEkYUeb3KSy1Yhe0TTsEv0MjT5LFiizSQBmMRJ/KkaeF6+vnucM+quL7n3+B5M+perLBCdjp1r+1gypiuoJi8QvrxClCHdxJkrG4LofLTE6p04jH9VAU5k7aXOBWnclFpGwxY5GRUygwD/ysoKEuMdKzYZO6EjOFoQ66NXHvYSC9cMPAogrbzepUESr2In5vNLD60t7VxeuvFCWyCTa4C+WLwT80WHnbjLjakjmOqdkxGheHGjBpABkDMzaZuBDuRn5o9YjBi6VC3BlWO2elHDC0qAFAvShfZ7MU2xDYkE6MdIOZl88kqzIvic6ox8hOxbI5QluAjNl+dYjW5GtriVngkOvtl17DuhxqCyJDxXo13KrzqAnvVbJNpv5qeJOZaw3sd5QPU/DJ9TBjANTP4jfK73HjcvHZHe9cF5V3LV+rs/0L1y2x7k0y3WdOvMEAhKNxXIpUdbb4pPuSn39IfEMUohKNMfQEtBlWT7uJq4vXVRfPt3m5e+Emh+DD1yVnmIVKQRRQZDXwJA8tYCQAgtQYQUBUk031nMLEK0PWMnLDd9jPZDGvNtKRMG0qZTtJokvaSspSkWYMWEhsyYBcpi0haMMp2UZkOfdqj3XrxrLV+WhgpwqgwrABD/yulL9W90vSmjt9fw2uF3KZGBVdU6Y1U3/b7v+1efmFoTlNtKuUn1B5rPCrXqXWdUlNav7FiYyUkdA/fVXQ4cxCWvvUbd+iw9yfrWy+QgcWIfiLxr2W0GDA8TuidSFn8D04mFov/M7Elm2xnCoWKkCj/xBTXk7Trw+LE1POo6y1C/7Z73UjQ2+lu483/F8X+PNeUAzgwNufjfjffhBw/P4+a6/SzNu+bb8Cpmk78H665NWy64Af2csGRkL3vAv0D9smxA/vsxWKlwwVRI1xWUpHXcAuUS6hgGnp5zxHzkkrrigXO5B2HjCvS58ZdU7vm5lDceHKn1bhIx9Z4w5WaR99etkPn0xgR24sRds0B25sanbTCwmw0WpqcqE5PLY3MjQSTlj+cnbTS/dbckDU3MtJveZWh7IAFf+TmRhYG+hYH56enym5fn9U/ZA1MT01OFGb7p/utqDdVKM462d5UEm7M94F3DTf22uXcyNGBvrlMYcaetOYmrflJ6+ik1d9vVUYtez41Nf9e2kpNT5WSE/CZzPaM9fRaPePwn+PD1lh/Nizn5qpDg5npjDU8mKllrZ7hoczC0b5ytriSteYy1thof+HoQO4/BiwnZc/Dr4OZHvDy3+310uDhp/KTE+l3DoJH38Vfr4DYpPMVqjz4xiKWLYvVBt+8tPPye1GnnW/XpeMX6LsuHa8ARRZ5xCI5hBgxAJNarPIXbCwTicv8YAfkIxEXglkCnwBnnLSs9d1Prdu/bT2nDNSha8t67Ss0BSM7dDyB4lG6vTiyAaiwYkDtGNJlLcc3BlF6V2jxUm8P7l7/DhfIqJ8Kfj0IS8YmoefUI6ObBKLQAxWxfMoIMXKDVp0A95xajBlMiF5I/P3eisnM+rPmz2eZmWLAG56ClXLeqZmsSETed2YkZIYQ2JryXCevAx2dmi4u7/CZQ5MZShCqOWl+d4XZ8Dxz21RQGmXl+YJQX5wl77srBp1BJE9AYFU2+If09kZZ5J3PJyibQb3xmE6dnf51+8evMH/BiQuUua7gu8xGuQSdXBY57DDOKGEMGQkeR1Z4MaQYgqxMATYb+IuUp52i0CucTPLNea5Se6f524nWmUuUiSQQhSScasBFKsBkI16MLO+EJ5AYwCA1qXgWsmQO5Kzmqt/4COa8vvpg55Of+d1gYThzXvuNB4a8NyFVDXFE4xLigBKDiNGLLQsqoIdHa1AdKGmja7CbfFEtduargkMXq2G4Bc1ciAmMgrzBXDv+nuXd2/BiYLJksk1bUxWZ4LHxeMVYKHh4q3nuB+UyI5xaLwD/Kai5FQBUbjODBQaUwjCo5aqLIte9Fjl7dRqm+4/1WfPhd/E+W+ZFFBUnoHVzF3DVY4DLHQZ4nWAmkqi/4zpcDVVpEM5KvWpy9/BW65enmrtyjU+oiRVCMNhzpkBSkKrf2LYmlDYIg769yzl3KQqTokheevqVfCIj9EEbGx3v30DQQ4CBYkOA37+JpgYAGLQwNe2qLYfUxmp7+dzmT5eap+4rQCRhCh5VBkQX1MDEVGAxGBnspInUgUDMbOWI90bPar6zZ0Ll45IQxa3S/b5BK9fT3LX2TsIyPkYnOVFdrStFYlWtmxcprId9bQdlN4hkOSEr9301u6nVtf7dS/uCWPWKUvGKHudsuHjckqQoBVJTMclXKENv3dV6UupIQ6t112lSnxn65o+0jdY0Wi10UwpKIRii+w8EtxbaXSSqlqeNG0UhT28/iMtTLUuNibS/5ItJPfle6iWjvb2lkZJEMZnxBxJDSgvR5Vw4am8xEZ/U7XPvD2defNaJbqXKsyc5P/XDZ2J+iXnR5WRXZKcSNh6dKQSVxtNUR04ShELee02/UTxELCkJPM9EAudh1nQP/3Jwj2Qk+PjHjtG8PfaXg3tvzoZ1qoIMgxJXRkSlEPGVvTpKYAtDDGto12QoLpuQwo+ks5mURa9Ix7HIl8S/+R7Ob+KGeMYh76gUJ3QFaycbrqVg4j0ClYlLGLQzcUl5+nghNz8waU0dXK56hw/UJqePHKgdnRmfeBu/18b7rXF/oTzdnx0bGLbK0+8W5kfXRq2Do9bbB6vePLiDI1OT1vSRwwdG+rPDi25uPjt0KGsB4NsHl73+7CB4cGtAD78OwJUq3NC/5penc/PpYSu75i8Acp83An5lNtdvpVOZJLRxfGK0JxMuugCfTcO/ucGBvnT2EDA12pM8dHS8B+jK8Ns7U/Cf0Z5D7wxYh47OHMC7Jnr6B6x6r9WfrR+ZsPAKfobwM9iXnhzJLo70u9EY/JIeHrEyydRoClp1kkNwW28m2T+C3zITozNz413LiORpWdAN8pHLa3YnS+R65ChZAC3vbjzevf3b9uVrVJRpMQCzquY4K7QOlvfqVGUPJF9JnRlAKKmrBZiC0RjSwiVaqagjmJQwAOAfW05sLH725jJno7q+vvPlT1y+NuTDLMbt0iskUvYK67iI9+YyNrTz80fNa9/yehLcEVSVX0i02isEt6nCw1oWbL/rUnVQOkP6BGf1zqcfbn/x4/bmdyQL8LZEgdN6LaAVwoS8nkg/BiaKotfEcsuQvignjELuCkKevT6Juhxl4J0o8eYaacOzZ1qPr+ycebz94hXnuQIDDhObltTUZHKp3AvKKJRoCkXRi7ci6JT9BBoW88wuuLw0GTRueFhKjk77UEVCymG1e+rH5u1nu4+vtb58RPaBgyFlZaSliuAMEjkyGSbByUNkDKhQNL2wdJDMOJ1F7z1YFs42Hq5Z4Lzg2L9Xz+4+X98+dZ7yNpUcSkAoDmMJOqculyuXA3H2SaAoekksU8EgjTpIKR7GOe6yn7q5SrVnY73x82+YTkz2BkjnYkdfkJEj1p4RiofK5iqTSyrRA3yztonxUYKSbxMiPr844YzP/j4FqDmLeUx6IR9fkHieLLNJxAk+crLAlAaZXKiA25VxqWaHH9KiNMywUM+L98/wpKjZlBiXotFoStDd9JT4V0LMzZBpJIGYBnyHDFq2QYfUKEw4hOu6wIy08XAJic5nIfs3v0Vz7/Td5q0fWh9e4GJXGMbOIGxnMR79II0TRo4t3MRgu2FK8RXppYsgD92ZS6wFvJlMubzfXKRqOjkuJ7/985PtKy9JcLooKFzaw0I6T9LREjf+JdkhDEWuaLmUEt0o3w1rbSqORaJTmEA0JhubNNt3vjiz+/2V7Y++lVW0wN2qcm0QrfMb62I7RNxht4EpHANExHczccdowV1wenVvPq+XRG5eOWhaf7u2c3aDxw14DVXbHDgAvuareiMIwuEFCkYBKGq1dIOEaumG5xuGRhYl/ZuLda73qKcsQLUePVVTtuZidm05Z2MYbKjjz3YMT4Eocn0moSi5YeHcWC+nqJATBhuQRN/59BnLctuptUnyxl1ZbEOsMMrjNJ8+E/fL3DBag4BNBCKzcbfI5fXw5CouVomtoS/Wm59/uf3BAwr0LhZRq5PJquw2JuSaiEVx+EGCKABNLdsvGocfyLyruRRJSeoCK49yImVK5/ts+8zV5ke/UqQrTLsCV+W0Gw+UWShqrcYRFK0kFJIDKdpVVuNmlYdvToiM2AtvfnoKZrd64ViuJNcupH0tKFg+azCFoGhlYKqeA8KgbayTR17nOt30/DBK+OGxTNBK/OnJBCZ6JOVBJscXDS6mEYMLblbtFVxc+LLFRqA8b3rmLghH5DJQp4rlnV6MjjJSSErKNnOPE16XFQwmnLn4QfP2S4kH/ykZgDDscnvmXJWGJtuYjQdLib9TehewDZu3P25dfawsRG0dmobdH1h12qIzDLD9zS9lehlW0n42kmEfGWbM/kaMNGCUzbGPwaGMDW0WdDEKtEFgqPLuilwqca2Au6lfqXrFQhDXcvuz6lD9q9QXDViE0EpLKixDt/yhZjG0iqEE9lcBWvxrMb2/kJYCWonYLgKWhauWh/tKQykJ/5z8krJLiZn9hQwLGC0dussGIRd0dKbrFEmx7iUW1AzuEmLu1ytBKiFSqno9HUV5NlawHA+Xgaajnilz5YKbwXKUz5+3VecJgt6EH1Tw7I+xgPHeXgsYyOexY0SQP/be3isYoeuECQ4Er8jDwxTsm8Bf5HqFW1+yKb7Ol4sWfAX8Y1+lVQ0xjQjF24jNbzvvRgQUyDUKpsLi3kh0kIiolfeYvutCBbBjuwVvOvSmq/BZiuB7ZcEtwP+HCuF0acIamRsa9CtuobJQyEdB3p6fmhyfmRgbwY8PtwZlexb+nJ6w8NHSVgl+Hx1ZHMLfx0bykyMW/uwWQq80Pzlemp8an50ZG5ma7ElblYw1OzMxMjjQm4J/x/Dfxbm/pKzBCQv/HB7sTWXSyZ6+ZM/YsJXKJnsGUk7aSk5ZyZ7+dH/m8Jh1PGUNI1m2rwc+3bLVhHYVxoqOTQIdEuFOGZ2jEjkfz9xrnbmEZ4M4D6XtePmOICXbJRx9WEmcXWJ8c6FatqCWqhlfLVXT5gS2oQ5AeQkBL9bxMAW5L2or1iI8s+HI6KG/n6vL8uAgReS5pp2fru/89LR1/7vml9dEwKVHdQUTziIwzQ8gUTF1dakzzX5oezpImZvhNPuXSqqFrZc3dn79VqSdB3Rsxcg3r9qQZ4nqC7aMMRPVNtYrJGRz7aFmr640nz80o82qnlPW8WYAtWobAWcYXFhHlxn6CBqRybhAv+Yo2JsbEYm5Tt9rfnIX4GnJHqsmJxCcy8zDF3yHCC+YFtUZEiGXNwBWefcZJciFB1vPPxHhrPj8fBrG5hoM5kE2cGPgPXer86Aj2DhaVMWxYZnOBAJrIWEbxR1AfIclWTs04LAzPnZ3lyyZ5oV7zUdfwrPi+jLI53yUqP2Lz7FDNtP6MiGbnajg1iBe5RRrHp8v8PHIo0yhz0VTr9/GgwZfftK8+QgTeQGb9cDDggr4KYsoNKdeTHAjog/DAK01fRDv7/cW2w7iXXqgDuKthvn4STwg9zzzNB4dtkg4iKrAyAWROd4BDsuNvkBLgM5WJFbDvNGPCCjOM4UJih6tiF48Hj+Aev8zde60XKrDxDQqkoSNB4Y413yFZFNQSnFR0/EqxoJi2LWohffqA6zo+Pvp5u9fQQuKR2pBc4nwfIYLBXlQcPORDp25I8uSiteD74s303ZeYQwEVob4eJPq/uG84czrjQdatXB4GUKiWHGdnJ0XG7MSjuYM5a0nrOZpDD5DJFnTkoBo24aIGZEqdOg3/ZqBzFd98QP1qsHCi79qSS7fNI5Lm1PS0vlb7MbX/Khg6UP/ARptcTkriRoVgQQ3Ec/LVJTQQa0JTAqLIOQjvELaUBKX2zuvrrKkYSMFbvfJkFK0UsrQi3DCmu+Yr0GC6u4nSNn3ociMLzqftTiPvWWYNkbILcVm814UnqDx1emSR82L93c+EKVZQtsUhI0HgSEG0QhobOIQBGiKw6+vJijglWC5TAUGvV7EzSO2GOi0DKhHTxgRRA+w6rC28Tb1ee3YKxXntOVbxRPa8be6HJu9jZuRi2ljUKZCw1xlgbbS0FIrUAN0ovWj7cu/ADD8vVxLlPNsPhIhnUBY/t/QWJ7cfXM8ca5JSkNG7CIOAVaJw2o9sWg7VS5x6tkmoBdEeKiDXDuUVxS1UKO6EpSz6+snzVs/tq58TnY3+JQ+Jc9FKs8RhIbrzRkq2XUHjoTj/uV15YQv+m5YkG64Jg8plQfNBj5KrWYCnbMX04DmoZgFaEG2TwK77FPlJEMWUf4QngCcQoRGv8OTVwx+Mka7+uDKbDKsJWUnSesoZhW5tXo+Eod++SAxZ/K9u3PyExIt5bxp5gg3mo2DmEmgjAFhBXTT/jGdrXS10PyGzpf72axJfV6fAHWJDAn92KEYWYWx1mL1p5Se1FFSObFKkspI6iBDlmsJLqqcg+ze+elvUnBzVlND/vPbkRKVZCmL0XYJaghPJTSluFSiUou1mDRTMkxILyG3pIARcoXlCIsPFhpyF1tPapI6C2IyP3ws7FqCVdMstEu8NEHZTVtnceVSpI+JzQIxAXjgiyEvh3u3uh0oGteTfHaqh2rBBrnQmemsBJvHKP00qv3c63sDbcVgm5/caV273/x2M+5xIlKCDrL3JKAhO2n6ne/u5XcC1TL6nUBmHzuGdLlj7+6zge4UxQnkt9/mfRcfxwRdOfw2n36o2riKn6e0VAeMa1gX7a9v/QVDnj037xZRTGO8c71Gp6XfM38gfzzA+98Vl20sqkT+7Dv6CmYjs6vyYHWAh0kFLxxY7dQlc5R5K1hwMM0o3MU79eQ8Yz6mhE1pr2ijPgzCEEwKXGJ2qlyURAR+8xWukS2PXNOjSedYcC/PYBOPMr2WIEfCDo/54PF6YWKsJ5u2yiUnj1+c/PQM/g3/jyasg/XC2LI967rT9uyRg8cL+AvcP3x0NHkkacF/h4q5+ay3MDcl/63AB673V7y5qRUgBYJsrezkffi9Vi7lAaUO/zp+cT7rTi/P+sVctuItTC0tjibhuw3tHwCyGbg2l0kPpw5HYz19vZl0NNHjDFtLi0eT+C2dCrPWSJ+Ff8sP/H86aSEfw1Y/Xsukxyes/j7MHtubgQvDQD16OJoY63Ye28XaWSCf86LwFGeApFo5mDTvjqg9dQtLPDQ/udk6+YzmOeg6sN5WvVKdkkqAw4y1rGsyRxSPWVoapBwMZaoAiqerUd9cObv1/LOtjdPNW99QLuFSXSRfQSB1AMsDmYBOdanuiSKERQqoFgvIIt3Abd4Do+O2eVoPE1OECWUyFk8whJ6b+/pqxWBn6/nL7d/PK3a8ehG0lA02rOCJ4XTdRRhEHlqATj6Qh2/vyphiKsV0o4JOGMVQbd85u/PqYwxzO/Xd9m+XOLcS0gG4J0qqExqDEf5xF0MbS0FRhN59jhlZRMaN7ZP3OONGDQ1KwECLKtA4JfTiZJEmt4ql0XGZlPSFCNqn/BQYr0/5KXCDtBbZRTGzkIAlSQxCnJPnCmptRRpf3VMVGhHIqJZKtLI2o4dnm0jQ0LoriSCZAevNZT5ry/XlGhukV7/7oHnrQ9z1/ub35lWZMoToEjWvDtO+SHaEwuVALMKNtycEGxrWi2orItbU6Retr56ZTTFJ93YknmxkHYes9OnxnDruRoYioVnr60vNhxtbz7GY+2oEjlONwmAFHYlXA0cIVxOG/FBh8y1JI5tRMSPB9ds7v/zKGpjgowor4jggx/jVgakzvBxcwupma8LJ5Qxw20++2H6ChQll6b4cJi5xpZCPHI2CMXhLMSA9mRhGTSaEEdMIUdQkqtCMkg6iLAGLzuFpXkIuqdZJpUR6H9JzVNUzDGARPjTWLDvzmL1nIhetErVqNgIzIVjQeeypJgCmmuVFpp2XL5obT3ntP3BwX5mPfxEVZqx2SsLBxe+6lq2CkU/CQPwwBCJnBSOpcs7owGCuYREx4JBw82SuKnymEyc5URXmt/ECuTnOWhXX4eT2aMmtYD5oj1ox8sUjnsoXD2gqXzzuESooIhfJrjEPBSffUTH3rfvrzY/O0Ykqu0QLzpjdVSU3RJKYlBE7oiBkeC8UhcwKl7BjQi1hai645pjMAPxhTK4o3CyRuAcXOWCAgLu+zoswLz7Z+YWyAP344fbZB5xpz/NsFIXAgC9CawkRLHFXBWbIZpQkI1TxtgCMXxWDmDXdiUiVl2XDhQoeOjIVEhrMDp3OXqQV3UXOi7R78hIKlK8vNx/S3qaNoSsFV6wLYuZvI1cSulRGMpKT9UU1JR6KKYG0BmO+Ua4dFG8tEeTrOt6TpRzqoIII9gTx9i1tz1dAuYPRW2bdE+LCjaG4a2EdLni4rkTWe1GBNC98xgihi0Vf4wie3DmUuQ1FCk6RmlEoDFSM3DnYM1+8av12T/aMTNlJHWz2DP5ApqJMTY3LIh2QYJ1sPT9homKm6hgopqoWq7olnG2iszFDVOMxVksFr55P1W9//T249JS00HcXo0RAvn8AFgYFWcGYqjjdoBhHDikA4VLWDCLfHKGoN4drDZQoi88Vw4sTRSe3XvzKFSdxr7OaKJfcslybwOzIYdWgF80HHCBpqmYsfy1VM0LoitqeMXxM25vKH9Gm3uN6no0OowrSzk8/7V6+AvaHruMGLlrkghQC4c7hgMKWb/ysjHlRsdZvfFf0MbkaW/Mk+Sl9Jebag1cIqC/Os/Auc30lTLAccUC26QcwHlWxwPMEopQK1a8QKezIh9Z1K0S1imKiRGvsTIKFMPCiCKLhS3zkW+0BCSDa/mEg3vuJ48TDss0IBVeWndRWsKgLSgawMH3Z7JViyg9yuviqS/LFFdVEtzYftn57n1Jz13jIiPuVVSprgdKkYKOTpJq2NE2zTiZY24iUWQgG9e6Jb9kyjFuFMZtKtkPOOttNXASmw1oyrBtZKhRrPYsFAXQpzn2x/fCEMF+U4aJsDSailEfi/usX2KwQJoW0JpT2lPfJkJKStAK05lYVVw3tj7pWav+Y2leRvMtaQSvdTIVolBpV2lBXRRXvgbSgoQFjSkk8o6nnTA3XodmEZOSTAqR3cIWlXqLlyMvNjVdCXUhNoUW74EuIdGyERHpMmmu5K7sJGRPvmfIsm3JV6C8HJaEa67KMKwhBJQGl8FOCS/SmKrLL8s6QdCJok3142fWyd9gJUlWDpIgwZrOsASxr0tL8NWdul+UizCKaopw4YT5y0t1CE+6XJ3FvMsJg8uG2wIStTXD2HrUuXOio9lqewn3onCth1SrRO3usEtGIPXYsoKc6dow5PnaMsGp0HJ/BCsfe2e/she2BjsTxU5HHJPgbmFserRa9q6/ROfn2dZJJtzBccQtTuaOTo+NjI0OVwuhkHr7A34d7rPGx+ZGCNzU9NVlxy3C1nD86OTczgXcWbfi3nM9NzsMXe25iFO4D46PgwbWj9tzM6Pzs2Mj87PgI3L84Oz5WHBvpT6cGs73Z3iMT1tio1ZfsOTpuwYV0amiwNzWQ7DlAB+OX3p2wepM9Kbh/GMuxpgb6egb6km7X0+s2BkqF9VrCq6/REvIdXGNdF/VFqLa2jJc883jn0vXtb5+0rv/OgZNO3cslMMUIIdA2vwnG0QPiChuuiN4N2ESlju8Oy+9EhN/mySaWqLI2MoC1fv1ZwSxyCu4Abw8M+oDplUXZuCHtktY3X7FdgqTKHmB6bREw9XE630SHBC6umSxsP73HXIC2C+vVNja4bhU/B0AYTwEwCkB3BWGIQuJBJfYUOHztSLEBz0AGKR2TQ5jHZ1q/YNbVRRjwCawgQbJAk4l6hGGsJ68WFbXuSJ7D4l7JADh8dtlzw1zCXoD5x/L2jsqUV5Jp0vCt3L0C6pmOIMKdATFD0VWI4RkYorYZ4xl8qZpqDKa7h/AohpnIO/qnwpNXovz93JrZRa2bX3AX+aBGcm19hAsMoVKhQi7kTSgFovghHD72ZggSY9jYa74rMV7fo5OQeuCcfMQDZxUtp/iwieT+igQQ/j1iKP8eABQnq6KGHkZFxLgAp5ei5wUTGDIPj7ope3f7ysvtTU5y65ZXEo4YfZLOE2f/OABf94eIvGcA/XricfftfAg7DezxsmJh98Vn3D7IfZQwZvthSVR3t5HSbJ13C6F1INfDFhGIGOi6DlxUzXbF1oNsnTZk9MDdffEhD9wVzJi22m3goiNNIOIYKv4dH7nrdcXch4o5BuSAUVfQtI0VikeXwuGaFxsqL17xUKHY9baxwnQ6/N0QMUrmGtI2Hv7ePoHaVYMxe0Aj8OwhXRCfPEoJ4B+mgBE1GYhaj5M6vShxb7ucFmcbdIc+iU+bze+4LwpO2C5sF4IwdtZMTxx5KELMHDoUYRwtE1x0zXEtNNKfVGndlJnxeMopkYMYDeJvvuJxHHsasfwdhPohWGWIRyCt0aYvlIzXNELECyKS8oZ8N+VvrLPuGuuILIHbZa8hKE1KlpOCkERlm5D8k2Jt1VECzTgDpEmEBBIkfPYnJn7kSfSwahCpPleyIyY1lAHPUkJ3x3rdpPtQSQhjQusZaLywa57mkYZHbPapGWO8Lp4wTMJzxpgt/9Tg7prYOug4Gw1A0PhcbLMXHva7a3H7HWdKLKT47b22dmlOHXt7H4u8hJvZnFYDby6oDVv5g6t2bOUl3upsN8xHBjNp/KwsTxyEz6Gx8eSwtTY1Nn5gbrE0DZfGDtpD1ujyQSdrja6UpucWJ0ZHssNWX89w2DMczWTgr6Fqz9DIlLU0Onh4yPInRgeDsQHvLxlramygMlearo/1Dwxb2Un4ni3Dx63PLU7DH309vWvDVgH+cSZGMzn45CdG0/PwsaHpOnI1PmTBLTM9vdBKchboSuXiWM9QbzI1P3roYM+BtaUhq1ycOj4/sbIMt9eGrBT82JscHsDNzaMjmXRPxZvMWD0L9SFrdQJQ3HJPcSRjTSat1PBQ8ujIYBo+md7k5NtDvUeHLXfI6s/2TXVxAWgRXCw3URDCh99Q7J6uiOeqAzZ4L2fhoLuNciYffqPTbyApZapASlflfHaCBVH6+0YpIVz/q1/ufEQD2vEXVb5azy0ERlEZIpQFv5nUqGdDCDpNBuJwlgwBI9PP+qFTlUd76DTLKXLVHZUmF25wdWYkvl3V6K7XjGc9pdNyID03x+TyaWFoNp6qcVwQSQ5rovzw9ldXd05t8EkEG0PRA0qwQVRPYqM/Dqaqnhv5dHY++EBxI6BE2hOFJtM027WIaoCosya4FCEOmVw8z4Ivpw4seTaVKffitDJfCVZeN3j4VOfAzcuK6xJC5VyhM7d+rD9QOfCSBXTJB895BwVclUic4ynnaVnT7I2aOrq7kdP0ux/cYXoiNTJt6TO8BaegC/rgYiMd4vj049aZs7RjX/KN479m5RyVAFhT6mdnAPX4AkbURTeK+DRuVkTheA1AyRSZmvMpFsAsTYS8uBbgkcp6zaDWVc9jDBitE72oIaQrsmNKxlAmA8qpR9/5+H1+9EqoUtys4Y06mTx+k4mccu1PzvQ6jU8o8+0QiGw7zFUCmRntfE4fG//oxM77d6nDCh7GkEkO8P6yzo2E1MyBQW/wQDBG7wswZoSxdC8EdKa7YwjiOU4eTG8uLvBY3P7yNxhRu9+dliNyMc+Lk6Dh6/m2EamAeW288STHq+I7H35JE8Lx9fFupJanB+u4Js8p8usBsHBXFBR9unP6U1LyJV8lLMCb9YFLRSqHhCA30gcRipaLjMXzkqFEt+CmbaFDTK2vin44c0X2QLkWiPN7PtaSjXUBg6hJkkcAI9/Ty1eAo6UUAgkFwVhSRueDnBTRlBj066d0ez2Qp075Ds+4m2YU3q8nFJCpCcXEYkYRhZhRay6uFcg39kC8sd3fOINsIN8Y3yZa5C91ih9gKqNRIlbtEoRoVpDV1DHtMJAHmaEPX2PAYevaLzsnnnAgoXzUBbpPbUhgVLXoYEFniAAi17MAQPhNE4Yc/wWMeGZvStRJxczFvJF+7bfmr5QgatVJ1Iq0UYL3u/WlNRd9KKmK9WSkHBAIoVXx9auAo4fcquACyLUOwAUkWaWVXKUPn3N4kjopa2YkoNu5w4lA9zfQ6c5GavmOkVz2deMH3KhtH9x10Io8umGSCCVc4ABOe00TyLEtUdRcA/LYPNPSF0OOuOMZZ68kXWBGdTW42GQyzJ59rCVt4miDpYt1o0yTuCkhzAi2H7TlYJoNht4XCp81vdDxWsFrtby/UpYKWWnVP9DFQoMqBShVH+s8oe2EqjMU1j5aTionrVv+WC8pPRKT9XtKeiXlTTm9r4BXEllLUiFFWXRKianEpZJ+XSWlkHNaYO0p4qRoMuTS3lJJShMlCGJCQM1+nvc86fl58lzipWO6i7lqTjExubiLxHxSk6nTZQ2q4LJinngs+GGPtTuvOL4bG0mQFzVcKoqV4t16eQ7G5tbLSzub9+K+LCIlVgtBLFT5yF7+LKYlO3YMbs8dO7K3U2u7IHQimcgLv5ET+zbF+srfjshv9NthcSe6vwf5B3R7O7zcwmi4VBiNqoWRalQYWQLP1a/0DAdez5AX9AxV/KFU0oVPGT6L8Fko9Bcdp79UKGYLpdVRK+sU5/tytt2Xn8/1zufzvXYumzk6m83MzRwftdIzc+nDWWv2aE9qarInNT2xPGolJ6ZTycmp+eKk1TNmz/eMZ6NwJLtUHU0lh2YzVjmVHM6kB1Z7rWQmPVgqzkEb4KEODVjwV38+t9Zr9fbY830DqWQ6lTw6amXK4K0OD82OWqm+3vGxrltUVMxFavq1BO5KY64Erofw4GLze9K7VBXBKboricjldHBEJ/IPShTl0SkclW6RcYTyQhyRbTEwnBjbQyeigKs7pMb+fq/IByfXDJZu3dt6fpq22DdYSuWiOp6YImEV40ogsU6NY0n1IrCUfU9YrFc7ObMrGA1j8+in4o5uzmDs+42d9TuKMd+N6lThhXqLKGVnMYz29QwowZeEEoeJGUoUfUFiaV1Sf9GVQIRTtDP127eMxC9QIPErDEymxBfhjRQ6OJI4nRwFHRzhHKQ17QeYzNFg5oc7u1+/UszU/LotRxNGz8juQWrRORpBsCERZCrSuvCKCCDWK25NDCE+mRhJHi5chv+L4ezl/brsDIMDkhpi0Ehq0T5Ri0FM1NwF7a03nizbonpQJfHmsjF8Wz+d2779peoDOkpc4VAe0RWg3nK2ZIWB5LTSYMIylWDSP9NgYpWGsARnjafLtjD3GhvFOFvbp5+1s2UXTbaCOFsMVYlDCUNVQmmmJBR3Vowp7q6bFSx8KWcD/cecV/B/gzU8/ic7C4wTPDEm2WIcc2a9vmo6tIj1w0WDN8L6/3r72ucmjqzff0W1H57dO7VbiyEJm+eb9WbLL7Itv7vqlmskjeUx0oytkQz2ra2CEBIgCSEbdsNCskACG0x4S8gmmITwQdnKP2LZ5tP9F26ft+4eSYZkd59bibA1nj59pqf7vHSf8zu8xUSkrB0FRYuH626Zza7YymqfeTP+IpVjzqMV50sTq3UR08uLiFkvsl40ew0WY3CytsTyut7aSvx0JbCYevNZ+9Yje6wg6asso7Xia5aYDA+VRYgZEkJ6oIgQOz7+srXz6C8Zrw0IxbTHm2a9B6G8ttBiRAjUYgSM2njTLHcgwD6PYQAnkIc7OJRBvZaAdaKZ2HnyFSyT+IJjPrw6AIUxI569C2TTkYJHTMdea+xnIxmbH/DoQyEDK8RmBxZIfKFZ7GiBDCQE5dkQ0bwQEXuJGV60NNZxihrcgO1wQDRAcFcOTWTnkGIS9RaAbq0LnjMFmxMgZAptEwGaJUztIDeNVL+xFrSZwAaCtg4sXR7T41qBG9Wt9bZRtDFBgFpNywGl0bQuE9VqlGF8qeqWuFI7Woa6pYs4o6S2tL5iTcVqSlSMrV60ahG9wkpF6wAj/bXYjwt8Le21fDayWQvluDjWstjITnuw9DBpQWmkpCXVYsOkB8gIMSPBjNwxEkeLGkvIsIQx0kFLBi0SSBiwJNCr11q3esHqUZJ1KovLWlh6RenxkYUUWwexMF8d4qtnvZnyPWCSiUSWoJKVw+uNdiElA/Y1ngOnEAyqoXqJJYK2P7i8e/Yidxo/IfSAYALZyNqe1ZEDTwqhRU35Vsjv4pGDvSsvgAQNBDcNXC6D84rOpFDXwId6Bcer2GyUwkQA4dxhI9RYRXUP8RASAKEneZPU7kj3ueJYeTYYGR5Kqp+rYW5keMkrzSwvlWZKM1VvojhfOKZ+L89Ojx1bxmsrY6vB7PLSTNGfL5Rmp8bn5guTExN+saB+d1eDsrpvqVSerYy5c7nx+cIC/G1e/ZxU36fKlenZzGh5FMrN9mfyh1JOmKsNq89IfziYnBofGVZOVH861Z9Vn4FU/+iQUx90BrLqSzbdr+4ZUj9TvZIaIb+i5p9oParzm0WoQDUDEDz4693LF8jt30g0TuCmhjXKrS81AB5ltgSupiFQf4oEJ7Z484njXt68D9WadpZad2o2DwjqgKH0XKXm47MYRf8ObmwEkGzWyUnk1ayiLhGggwJVm5gGtRFy5w25iGBJVEto6JnzCm+TdsTV0+XV02FatFv3VqPW1gyXgYQzSAhXSmBP9dZtQflq3/y4ffPPz/96Ezp88m77PRCy3nomEf1axiKBc7vkpWlO1jy/RPvpLsRIQ+pPPs5KzUtU3YabJ2g9LMSG4e+3acO/k4X982/sP/hb++PPQOlZXEi3icCHhGM1GeoIiml4UMug7Jb9dddiAN6wYgDgyNxJgCICIPUplKl1YUIpiE1iA7JPmI3dj24pHvYfPMahP2nxAMMKPDQCX5GsVvs1E9BZYHVW5d6oFl243kTAHeIKFc4GFSTu7Pv51dvtm1d6dqzEhlsnLeyvN6vVhO5ZnrkJuD81KKbhQUSHOyjjzk+rhv849WgGXD3pzuO3VYe6N7XgxuApbSqWBDKXO3oF0dQMdTrPP7/w1/RL1nNsa+/zd+jtdvdXU5TcDnHX+hLknX6nDS8ieVdq3cMCIogEgl38dIk0x9lPYPS2P5Gha6x6k1DTGSoVBH4FIRdo5NRfhJqviMU6qWEFKHCiW9cTbqOKheQIkKi11TzBdTvvQb1Aq/Pd6zfa9/4O4ApX/9aDC/WQ1TBcLiEcC29FW6yALIeIsqoLPXrNdX2UUAFEKOX7U0lgNb4NTCrQw0vAGbvfbe3+41se3TOU6KGUYD/0u1xyqeYCUQPQ7g2pZ8jXAELB9ZUpQACRawlMW7Lpf3ytfeptTRyTdkvueoJ6McSBkIdoBCWuYg/VHlde2AHaqLqDncen7Q42qs0h3EoUKgdQr4dVym67DcgYNzZs2nun7+29cUHTxiTrTrrUntPd6BLOtEZUDSMWHFAUmuf0Nm4MK2mx//YjHJV7lNaFtye8gIkbSvQXqwNYNREm5pXVW6eTA0hBSMiqxexzyG22O/zk2t53H0L6+YMfTLeqN3jPniKnppCa7+XA090H0g+E6/mcqQGpqTiYdSp5gph1PJvxfOX8lyiEL5EdpBa98j7cUSC6EWtqU4NiHGLh8zN8BYnhFDmpxM352+3zjzBOON1BTVkz2taH6FSa82Epat0YF3KtR8CjMr1pQO6yENv9+rv2zfdgMK5exUyj+irOerCt3QxdKdKsR/kMprY3afWEU3Od6q5gRUZDXklkTTgCEZxA8poozWoQyLqQPT9Pww950gBKHWM/nRINc+YLnIznUK0vV3xPrdE6DcimUFAa1SYK41H31sX30hQZ2SHghGmiq2Tt7uVbeEKmyMJoKAlYJyQk7CCwqUkhFciQWSK9ve4yCCypbpweGD14zNbd/ALufrr3zhtabVOR4Ga96GVR6LnrPtNSL1ldXYLOdQ/xvhVtBPygxcYxqlZvMHZXryrtobtSVpHnNdS8B4QC6tXqCSyikrIirY64uk1IePcItAzyYll0FdaPeevb9oM/kSKmXLASUg/coZjlDTjMXYStRQBv/4sNm7J6AEVTU2aisGQbUZ0ODzV1WRI9kxCN9UqGKxu+XOhG26o8U2hiiBGJYMhxw1FmlGWQ9TLCbLsrZmxJe9uS6mHH2CaTbUJo41c3jVkIxi6IKWppJQq4S+nGVKyl7jS3rNpiGlPrMqNfzNOtyYOdRv/UqBAj2PWzsMS2pbQIZS02zSMclyG/hAJShKORU5ruXRkiI+9EIFkCw5YRWi6IRBA5EF9+1iTQ799azWZd2XPevLoN/dLNzJYJ3eMcVHkoeAoa9fLZby8porEQ3p3vnsIUth10dE0AsVUtnwhmdqwC7uEDnHRYJouLHuTbLYWLi9iwtnj4RQehZUIvepXKD5UBK6AkWL/KEytCzRS61GddokJHh3G1KQlS9/ya3IbOurmKd6LgY/gkTYRrGelbe1azTScX+vNzU2PTE6O5mUK+mE6W+5PDA5l8aWpsJLWSdwZSrro8MZrNl+bGZkdSGXcmP1KcHk3PTaXGSuqflDtTKE5PJGcnU4X5gUx/eaF/MJ0svjrgLPQPvT7gzA9nZnPp5PTwwORoxklOTCedQ8PO7OTIWDY9enzcUT0u9HDY0axxufgJ7GTh5uLOkwt7352lVOQqVZiD4MOqRv2ukWleI5Poq1qiyS13P/6i/QGVWfWOeR6XRePbxbbhKxifBu1AJuE2z22amdDQlIDAW6uxhhEXlVvDXOITCB5GBuru5Wu7H98VGpEfIyLBJzBBMOFeIxtoKANGMPCwECpAF5hEep5U0gqwjKjZ7oP3uRmk9XnSEO/mnF6/BhWayoRijzpHWIfNBCalNA89wc7jO5pm0Iw0WSHUTTmwHkYoM4QIMIhUqWYgk6R6s9zc7HUUWzcizaeSjr0ZVdKym9F6s+FarDItw6oQD4S0TBlFjaaMJkLMcQNdGMX3ln7nNk7AiyQGlUTuzZ+S0N38AfKKcKfkUx02ezR3MeoB06a5KeVyn1xSXOox9OtZYlNIdbAZ+M014RPMpN7jePVqN5/KEVDy0nC67ikPoYtRoh90UreJ2uSYVaTVwSkW1WRO0VrtPaSPz/Vg1QvK3nGLVxCByhytdfNLvQTSh7x7MITl3SO1WWFVk4qzqxQn4JkSu2AKHTAB3u3FbdMe1wYY2Z18MvmAiWs2lZVl2Gzq8UQacQbV6qqYKQrG1gHjebLHWodjNTNFm9Uu/oR6wLTNOJ7UDColq6emIlH1DijoSacLP149ju4sIoH8oDxXkt0k8S2ha8tbLWpZzmoRK5JSpBGJH2KLxaIlt9KdwtCWgSKqJo2csuTI5MuEyKSRIB0LfLJTctgCQy9us7I7l90Erznds/J29NxQi21Kr7TOBTDx8tkfm/qdE3PqxbNySk/Jrhkz+eLpInOlx+kNeuJ4duP6XbAMP10cgmGEUZyLnde8fZ2H07YF1UyZ1bbghhtDY+g7wBKE2WVbgorfxb6D7UBAs665DYjTFYQFvhJuQJgcVq9UgsiPXDEWIdAJv1FZCEqSCTA/DKEw/QiOBOB5Vfs+uhDWEdySz3MSYQJBPQ/j143EBnWP4XXcPVeRoI66sR7c2ckh+MxO5tSPXHFc2Wyp0eGBodzAH5LOK2nn1bSzkXaOJh3152n1mckVJkaK7uzUSHri90lnJF3oTzmqzVg69cq4M56eG8ql5ocHclOFidT86EA+Vy7lh4pufybV6HfmR4ebSSe9mXTGk8560hlM9qurhYm+gnM86QwPDowknUw+5TT7nf5M37ijfk32TO9K1LxAV3V9Ukz8eBX9i8sPdh6/t7N9DeuyKBMMAsEaPt4KQeKlcBVGBKZo0xMS29haTtaxuTng9yHPAYMfqC28TEwIbW3hu0VIa2EEyVD+i2Jk+xpFckNiAEPLAOA/tnrSiFGhIhGaBEUZIQniBEh4NZsCsxG2PhOIc4x7j9AVurV77iSeBvCUa92L+LR5C8+YagDkTUh8cJa0weDoVCGXd6u/BXDoyw/aD7/E7NSEGs7j4TLg87lUztAzZGHSEnwcYxaqz4VAozztfnILKkd/eIewnmohFOdSg3ucUFmgWH2ZC+fIEpDhYFI0HESE2JH2pkmZQYojsE4IaRye1auvkgaBvDANBBnCUwsw+kWsKHaqrE2jk38lZMj9v5/aPf1IvcX20w9JUSJQOiD7gaYMiAUoIQ19huXA5RDpuldursa710UzLgbUO0SJ09tqv/8AsM7/fqr9/h2E0C51dwGY3t098GN20sdCRa0ndZv87t8+bv/9DYv8ko9vEQkzeqaLFUssolaxkjhZqldik8VqJRZdGhNfR2IFOBwku9WaglXn1RIBJvhw1H77g09x+Z3d+e7kzuMnmD8QJDYo1zkQUYgTDn9NtB5FkjqIyPk8ZVjNPGlfvQ4zGAfVi5puydP1ENTUtenVILRN53fjOrhrAXNfeVPRgfX49C18to1Eo1lkKiiP9TMSES2VmACLJWwNj0StET+RG0e+WgVwVoZQbHjGi6kh5B7iIe9N8hDD44AZw05iBP6XcmuahgMg4kc2E/iLj3uYd2n/DNlR/+4/u6z+JVYUzYg2CEGpqCezEOw9qYJHGPbqnSVi1aUAzv5P7+oaU1yNLnATUm0Kge03dCE8JXs9LTmhiAdQZMF59gNFigRnDmlw4iDoNhSbPe3J5nJgC3MtyI0UNyLclrwkshDH4tllFJlV1xKzMjkiNyYqtYBEWbRMpXpoPhiByJD7IAjZjSP5RW5cTP4JXrEr6MkiqHiBaJlEawN1O60KIxBICFgrVBYmrkdehzzlrTWjV4pZI6Q0ZGnoMm4ImkxTmKavzF3an/0Kw8B2z2K0E/rQ1CMeEiCo5Z/epYgxMP16bPi1PjuhJnWKDk3q6261O/uhdS+V+PFDfwU2tkc60Np3L9zaf/a3juJgij4cbTRKXhDEs/kPHWD00ZMvLsLTLS5uKLMP7kDsLaJSWjx0sA0YwU5NFOJ2IG3t0YWqoJOrv/kBXzjMO3q0v9edBjExPjaTU/+Mjw2lnbnRXKrfyY/k8sPDQ4WR4aHJkdzs+NjE2NG8EySd3OzE+NTwdFHZUNO5vjHIw98YcU6MOIcHnfzEmLMy5vhjTmFkcGB4enQAyopnB5SZpwyw1GBG/Uj2Z9W/2WQm70DgTT7p9KeV+ZWFguCHUs54qhfOVkT4s5Gy8nHVWAC06i2dkL0tBKHdeXKV5FfEQLReDc2TyCUaLsuwCOosgBhlmrgODCQl5bKqlUB4lMrYxxNIwGc87lHApVAQgv8JJplGqJmEtyoUae+LOFMeJ/MEW3KGJdiT080BcK6UcEnWSy2VFZH1T97Z+e4bYgNx32Q/MMLKmERhE0pzc/sSN9y9e4PhOUvYAO8RzQA4sbztqMZSCjHuvbFNTRo+F+lVElI2HRnxOlGbRiEK8MTLMlpvPtv5/go3pbuISWkj4+Q1/DDg5PyfLkCACXL61yvtmx9jYtJyxZesVMimw5slOV+tFCjhhI29Gmkwil3c+e5u+94WhS9G1bpf0aXYsey0IYGLj3PFwNmHF966zqmtcNj25OrzNz6T1yVE6GUJjdbngevXSxYjWEJlWfi4qFjBv9QZwJSrfbe+5JVuKs5ZMKMaYtSuLWeqyrGNt1xt1kwUMYaKV/gBIAT41iO1BugBlK8cyr513VtpmsLFfjlhIm/44W9uUSvz1PjQvJtU8yDDPJRuGfFTdbh36VvqSkA0TF57L60c0RS1lpleYHr1y0yRxfSim2X9aCOJDpU0Li3V7Xz5PXoVS3+s01WHpNNlIvAUCF9yn7xjBA/SNz2+Y98kyb8vuqfq9SpmUvEb9f4epUuU0GgOdJYseet6XAN61RI0T/Qn/ku9sylbA77eWwGqAVxchI9bXVysekoBEg1XXaHdkNcP3gKBRNREgBiTrx/BMB24AMGNDV0HJPCaUQLrpklKIF9SXDUkfJUaRspuw2tYJJO+JbDyXxSuyyYJUudCI32mqXR6lM7S8CbcG3lN36T3TaB/VMHSSc96m/NzhVB9Vpe8ifHlSrHgq3/U/wuV4u9HneXlolfB31aK3riSXBPjwdLE+IJqAJ/lSn/aGRp24Hf1/zF3Ya7gLswXinlnOO1Mr40604XZqYW8k0s7s+GoMzdTyPc7ybF0SrWoLXnjyUB1O5nuDwpKI08mnbURZ2gA42N/P+Cof0dy8G9zBP49kXKymeTqoDM8pO44XHBSyfyg0u3JybGB/mxSXciknVR2WBHoodU9NcUiLuMctLY3EF4X/T8oxYSW8sX2rafKRN+79QkmCDerUsAZCwqqxvh2KfP33yemYXwhU7jmsgcH6MAVkU27J+8QGnEd7OnjfCbVeiTTkbFwPcBwgP0C8T3Q22uWxXFkSOD2g2109kCPIzKe8uJdvYXzyExpLnQMoH01DWJfw6PMElfGfPctPO2uK93pJjAsUWl/zEOUITIEVBeNKIOrewXiohirXvaDTt7a+wRKEUrpRaHJZU6JLq0iTkZnmHJmrnV9FSuYdeCF7578c/v+Iw0ZXvbd+pJr6nnAAXSomUWiMVaFqDAJxDivkygRd0zIcAdZRQaq9AYWiaaibYiAzZ73x9f3Prnx/O33GdF71fOqBlYd4H8jmzmgKcx5utam0LWq4O1/fk7RNWUsiS5zymQ1q14Zz2/NQMI2iyCrPuZ6DxsQoMNnZ4hKFlsF8NUeNa9qFVDdefKWIsOcMBliBZpZfNTCpRgfrdvCxvNbz5iNeiVoash30M/uss0IkLBHyINiP4YPRUdmF9IhNpiM4QTOqbgwHZrTVmG6j8+ZwnTr7rIUpkPJbQrTIQHYiPTMDipS+iecVN0tymbAx+ee3/iu/ewMQ2IAQdgJhZ+0HJmwIrXBNcWs5QSbo2qxKwXmdS8qsOQ4N1QWljLnKD3MWluw8jfENIMFFpilX2vdaQD1jHBv0YRxYGrILtOg1mAWyrn3f1IqRX5rS95R19ACc3pYgTkzpkSEWxsFa+pMRGHNa8TrTBiaBIeD5SaIMifqQtEJJI+HdFRwAikJi0g1EbUeBTEeGf3FoqSJcGthMZAcNaUYIigOS4MH2y4YhI00aR/stqCZ71186/mpDxV53P9C4yuC1lgqNkHFZ5ig9aZhkuEsQpLWO/4LGopgvRtTpLUl23HwUuwXQa91q2xKXoKaeLDd/uEjKnhpvdtfx19tnJnYmzVvteuVEkdy3ICZLsswgFzalxcbvUFcaXzewG8uxwcIltym5nrK67dlvaocHZt6dErRyzNAs0BKjymzgMqNKVuATQCt/a2BpMyxjQRmbOHZ5/X2hWuUkuYiCCQNlSUFXqKRZU1LgUWc4qLQtDKjSLIl0WGmssWdahjwU2xIUandN9+nWlIR2OCoVrRK0aqAVYgav2OsQt7/DOOd6hQyVObDbJDWJOapVLKSzs9v3WIomeaylswiUvmd0PvglyEyUgusA24KXjC/fq7kMIv6gE7sxd/jrsjVi0jqNh1Iydz1i2Zkt4Plld1yLuEl4Ii7w8n6Xzhyv8EcsirYKPkEBIBDL8qa+FMs/lDuff7Dm+3tr3ceXwAG3rkV88bkHq8C7lgl8NfdQdsj+8MBEYnQSrleFRe3IdXzLP7hYKzRMhVLcwlD9JVXqMKD5xdduUaJhDU/wAB11YBvPaIvo8XNzhmkU/hlLD5fxXIBhzuu8s19ctkt+cUmAb4cil+TW1/Hw3E87g5r6Cz+wVyRA/Cj5PLFrr1mXeOWdI4e1vAa1LsVb9G+6bC+wHf00d6sTfuQucStXu+TAWHfUD80H6nrJ+OYzIBH8jXNJcdn8q9HpIeeYZqrnjsnnzX1WZieGF0JS+NOdXpi5PUxZ6Wmfg/U1eG5oHpsqVyZnxzPDfrzuSV/vlxx5/pGnEG/Mr80uDA7tZJ13KNJZ1r9VD+K0xOzpamlsl9ZU8RnFkpTucHMLN9TVPeXFKFD/c5wJplKOwvTylWdGnamJnODoyPDGfjk4TM6nBnJDA04M1PKyUz2T44PHpl0xnPHRhwP8zXTA6m8ujkJTmk2PQDuqfr0Or5Xc27Tr7qlsEqWD4eA8jHgzpMLO0/fQznYwHsiUso0sakBR+MIlZpXlEDj5j/f26BMHMEC++b8zveX957ejxOFOuQWWQiW0AZZEWq4N7n48/Ulqg0PR0ugezDG+9IP7e9PPj99u30GM9K91RCqIVlrDeMYLXrynBZBZTVrUu1vvxI69LRMJva0ERzdmqqMt6u67tTXD7iEnlf3G8Z3oxa6wgN/t2x/JKKtf0WGPTckI44bUwktTlabpdCqhAcqVkqXKQ1LnkjULFqcYAuLE/wunBgKgkCBVNgVAUKaF6KjeYEtgbBss/KVGPhgZkGhySKevL2n6Ckra+8jrBxR8o0XWat7S4Ep98YUkTUyk9Q4IR1roD46I7iwvnYbhY7mrR7WUEm3trHg1T1MNfvuzu7pM1SjiFF8Ajhg1XJYN0xQeSNsiBnIugLq6TPtZ6d1paOabJcwKb1bQgQTTbcmBRcJxk6qeV5vUgjZrac7j99rv/WPvfPfcGIdCXaqtoT1NS35b1EmBpEyvEC/2pP4/rkHvYgTzzZ1wziWCpWlrTGJZElbkDe4pi2cEp+W9kZNSGtd1IOu4d6WFopjLSo0QZtbW5VJBA47maQ45KDYwxm9aTuF17/d2T67e/KCcTQhJA3cOKpbGZAfGNYgbqaTeI8zZYu2Plvupi1HzYGOlWk9KsfIc8QHdyDE2TshqmjyQXiHTVHZfS8myQPi1vS+H9Yu/4i2/CyK9PxCzwwAJE1D3VzW8LQakRaCNQc/XVretLxGtTahnOjNt9tvv6Xdxw2IQiC+yYdUeqiqKVIq1KMgETMiaJwxLEoPNLtJb7+r3EYaaLYwkTIOimWLtO4BHUK9+MUD0TkM9J0504FREoqAkVESjQCBWswK7ypoRqxdhn/lZXe963/hwaLOJ1Oa22zXSVVY0QJYGZYHGXJASNKCqrbErCWpaWQkeo4RnLEN3i5Bc3U2/CiO9NKJBAcv7N9/TPELiqcNFJtyp+xb+R5daXp6m0aYBWyh768ws0VlDfjH0e2gBq5ieP2AXD1txjBNYwlh+b+4MWRMFsu6wFhqsCguYOnC70/unvuQzQljS9g2AFdWo5pYXGiwff7R3l++Eu1vNL+tsZnDbRT1N7je4N6n77Zx8oGmNlra0qa6tuFdUEBc4gRafnRm79I11qNGhwoYUND6NKYBtfLr1J9GvJN5TiI4rom6dFBM/XQrCOuovExH5e2PH1pKIaYPpLnEXdEEJNmgJW+3fNTn/8bBvvzAONh6e4/lovjXLlF4FMTa66DRuFwyIsnIgE4u0eS0uuh5Ez1KZG77+QvPrLouosUEZVMQg11BQX69daMOW4dTCbgl0+2iQ8PfYCFXetkLuD2p5sxI3D2n+3ZPnlLTACKpHn/d4ZvTDRt1l/tTrrYXA0w9elDCoGq4uCgNqU6fV1w8erCPXlJTaBViDkOIV9Ano/ryBp6NHj2CcLFlNR/R08QISMsBj7wlUI108VD8IhUU4RhzbgbfmrBhXbcyD+senYqSsyscgIvcZxPsGTo+lAvmRkcGx9zR/OpovjjurPnLlSAXzY1W5laWFoZyI5XQX56rLQ2Hx4aW1cevreSWaiuV3FBusDw/7A2urbqKwHg576ytlkaXM87cSsop5p1ceXg46yxlHPV1YSHvzEwWMrPqk5kaS6n/ks5oxpmdKWRmJjNTeWdqfCyfHxks5jPTU+r3CXe44ASZYWe0PljNledXqt5CbmGoslQf8crKT00m+1OFpGo/WUj2zww4fRkIf1JE+9fGnXTeGRhI/mHImcr0Cnmqws5wRRmPEeElY4AEVyb2IVOcgHkgVgJq1Dxo/+VN2qGEyhvlwD+GFkwR6mK5dJUzeJGsVbpPdtjjZ3WKXPv9d8xZnSKoz3qIqqkyDEgYywC/g0LpepNjCnHnGaMFPmnf/9v+g68JyRruFRQQ/FI3KdH4XXjjulBSC89mDshd0cxxO119mL8yf3WlJZarblGNbQLjTazBRL3EDhONpNJN7XducuyJWl7H1Bos12l3UxFaITqegbS2yZtRvb2EZDv5vvWOIq75tsgL81YfZnzDulthHwhDk+AoWny09r2tvUvfko+2ERYTXskPeH21blgrH9+9C/VW9PBCCWYMHeaTvUt/BfeMqoErKqamtCZle64Vv6p++B0TFEGw9Ca4GtLdyxf2T90xMxMSdyLG4tYkrPlpX7d8bSHaeaKM1M1EwLbUWCarRU+zL6IOOXJNL3cp9A8xkeTY9eTnEP1384ocvpqGgJUQUv2JOEHrNDZ23fIDtxBb6+4Jsj13r3+v+ukgz65gnISJUOgS13Tu2HrUrNjRvHtfvte++lRH83IHSvgGiYaL1naMUGtLUeqmb+B6pQftGSN9gw9p0UfnOEbGuMdR5GuVQpBgarVv2ozvPL6yf+pdE4as9ANrHOYbbCK+orm2KGuWNW0NaYmUbWdeKGt33ug2K1K0dQeWOJleHtXxKwuqAWzVQIgjFoNTNlvp12FCaTDlF0e/bnCaQgPCBRNBqI+aIn1gLKYVe+9kmtGRrjkVRnhVfZwbBWq1ExGx8IxXY8w88my0pQeTyjrNjbAOcCLyY0z9QosR2bIOcnUMaw3+Yp25Uixshx1J8bC2NalDYo1VaQiKZWpI/0y71HAZ2AlKOv/HmnqYD8XzDtxcmm/g0Mo8U43Dqu0kU7Qj+McU5ImtOHkpFIMY3WHMhcKwJLJOIbMFDVRwX3mytJ6w8cR9xV6IeRmdbwJMLDmAbSprK4wk6UHyrbQjf/YDyrjic+ma9AzJDzzIqvkLTG43QTZ3pF1dOMZeJwCXuwhqh0e+PCp44ktWeCNCcYv3Fz2dS5Vw/To7ytgeJksgsR6XH+yffsqxHsUEVJYoCQnymHu5u2Tq6PKQbOewC4rmDRs22qaxzRB2QI0Nwg3R9NBGh7E3Oo0B6ZctAaka/w5ZFwdZFhxDLRpXChL66JYKkbNv7zz5irV0TEF3alDtDVs6GVOMWCf3UMbdegvTKoy66qWrOtRUtwKxVIfWGXFt0aEqOqS5Jce1AI+J7pjcfpmP/O8Ju5dQN1IKV3q396td360DCMjCb4ZdXWANTVmgda+bhSItix6Hz+oVI0rvuLK3J3ucP0dx1xagjHodPUfi2e5sn9l9+Ljz1Fn92XTU5de+dtCxc7S4KM1Wxat97aX5z5BSqKSJ1ALRl90qxugejl0M6eKh+EUd4BtLo9aKgk945ToTxuDfqj69PUqnt5Hg57xmvqPDiwnUAMog2DrEHV4E97dH+G95wZuenZwZnVqanZ701M/l6SDrTFbm51YWFqbdeeW4ro064MUuTM+X1NWyuloqgwNbzKp/jr6eXV4anZ2seAPZpWV/1qsMD2UyBWdkYsIZz8O/E3nwT18ddybG1Td198zEeD5TyKSHCunM8FR2cGBqIJedGlSf3OBAIT08NDaUGR5L9isfNtU/Vh92xrJOPuv0jUMGdQ//VRKOo6685fgi276m11mP9GV5xQwjBgrUrRO2M1HRR7lIhHI5MaUVA1q4ObUhU67z8AQDfcj0oojQE3x+8vgkJF3c2m6fhnTcmmeS73CCERU7tRpodz6nMejwOalyCNZvY5tOP6irDTvvl7Go7MQeLIa9WfReyiKZnT1ZNLanUhtgM+jEyosQ+7ppm53ffrn/9h39ZiNvvYqgkChEXVwbyqq2bEY+K6hTjjlF//34xbJN8/lHX+9sv6NpwlsGGNgGCj2hxiRiD/3vzcDwZWwSnlQHo4/vxRitBGGNtEMXm3ow0ZqNDSUZyDKUbB3LUHaNZGBOmA4aRwmgpHFkgs3uYQx6DqMxt/UgWvgBmiAMYtTsMYaBSUCWp4XMY+tQ7dmWzZZysJcb6DRD9nHcercP/cwqoQT7+Ap5ep2WBx4P0eogoaBXh7K+oCg9pSHdC8DeOoH/AJE3bu8//FT9D/qtqhRUuPQbTD4/FrgcQge0IldZLVxXu6eI6bF2tWyB4h/MWW/J0iFY7BVrJIqHdoAecy1PvJ/JjpEjvmanCo6OHiacpyRBZJpyHRCeoiA5ltTsrHH5IVSJEqOKrTslRkxa4GpZMoKCCIhHw0uPkvq53QefmiVG+b7gOm1YHTZtbu0FRbMMeuMiR9CXYF0wdCa1hkUk4fztM3xKiCiZjNdB+JgHhqBq+WMkhC0bjJrSGorv5YIiojY2dLKYpSk6bzUn8qIFLMH1Qh66xfELb4+LRVzN1kI2q9gSKj/r3q5VTu4yecq6ezNeNFw8D29RVeiIV5LMf30D76ks09R+SR/GlSY3mvxmQAtAR7lHBh3uhY4n3IQX/a6u3Nklr9CNKLlVSDSX8WwyFYOVfPKk/cH3e58/jJnUah6FimLYQNxcoWgqxR+QWVeFdLqqMqoXF0PAmAQqkGpOR0ZIp7746sHJ5V7JW1cyrYE5/2xJR7IJaa5jJOaGu0yI83gJ7esICiSYa3g6hMAMuiWGYXp0wiHX0ATn4H3d9jUJqAR8arn46mEL+KNK117hIyj+inY7AExYcZnqsSCtoyoX+wzyUYKgjw4d1gAgfIVOqxD8IOGV1UIV+z+iQgqMi8BegMaYYS8gFveJfoAHgJwBMC7eQOTp75i4X3Ubco7Gf8btR7qEZ2XmBRyiTH890NilDDFlSTN3SJhGFKUdhbRy0D096isG5oEiSDVCFLlAxAA1gb67/JZJd6FQUZ+xkdJQcX5mcnxsxCurn5OVhcJkxS2UizOTg5n0QDo7n3dG8k65OD85lJkqZ52hzLSXhe8z6r6F4aHUsawBhFrJOtNQrGNoMO0kVfv6EJzDVUed/GBuKJceHB5KDw9OKiI5KOeRTfYPKE9neqqv4EzARfUX1Sg5lXWymXQqlRzI9gIY8Db1jF/jZHfYTsVTrDLlvLcfftC+eYUwiyH2EU6IONZEr5fWDQbJIFmwapHE8xFDUzajYN0jYY46x6UaI26vO02/BgV7TnCth19Cvy7BWlYXsoQN92YBr+niJLHxaG9/bcYDK53YLGORkxhFgnfRg0HwLvERfmgoEq4LnKMwRZEe/wPjq6WQpk2ZSObpTSoSpPYpW5o5pkyk539+RkwrG7/KNI0UM0SjyIe4eJFjMq5rNs8I18Rhdn/6kvgGtKb7WC0AcBkAawyiRu2x0dJRd1b3NDJVlSc0JahjQF8HJJVOWm9/eEfjUNkIVCEixaoufd4IZ8Gru+M+1DASghacmCF8lmli3Y3gQWyRCjjTj1c3BUkHwhYxV4prCIgc15GKMJCb7lIi5gPANulXzU0dC2mS2U5d4VBIeig/gTG3+FR69YpakD7+I6hPcFqQEHCb/wguVZwioviwUsKKxxFFe3ej+mh8tPbn70AIuIXwQ0BpAPKT8EoBxUaVcSIxZRI26zLaAh2E8Gs9emK3+pNbsU5w6BHekhDBQP4I4JjWo3qC/Hsgb61HvVHeXgCR1AvlTUIPUWHX6JwSU/3Qm4aiK1iX4dSHe9du7T8EjPjoeBgcS4TEB6p55YuZAyOmQWcx3BwONqitzw3BGjDN/oW4RzAfYuehiUjbDxJoBv4QBZuyBwgxZ29fV4Oxd+GhBjRELWcOv5AKUe7p5WipFtcTItJjGi2man5+u5g8fXGzmHz8V1rZfb1UvlnCjcWRkWki0JisLWNEGHRIAXv909rvsfB/MXxXbHn9bMgwWQYye3ni0qwN+SBez1c5UbXP8YUTnkkdM0i7To2gWaHTiU2scdeJw3+8dW/K9peef3R/9/2LcQwSOEpSzSYwcCfqj9UgPwCEqxyUlV9UDpqlxcXm2uKi0FhDT+lY5C6+8mIMLq/hYRQbp4dBZbh6g83xPo3L5dU1QkgYNLGkRjPQHgCsbUTy6lEwL1Oan5ybHht1Zwvjo1MjM5kKfffUd/iZqZQmF+C7WxifGiknx5w5dVFdGFF/mffc2fFsPpPKOuq3wsLc9Gh2InM046iWR8cddddUbiDd3z+YzQ05w+q3dP9QNpfuP5xy1G+DE/kT/Y6ynwf61yedTbiWPJJxVPNXM7Dr/1rGGUiPFZzxbK8DACi9FoXa9OCgjjtUTwNz6XGPYtPzLQyksN70ElQGBLNvIclK1+06c3r37ufUnm6krE1pxJVAWNxRLRDZmyWxR+U5nv/pGsRqbH9ix2oEeJTqYZE9g+pENibTQgMTocEuSY1VsJuQDpuVTEab7EjP4oqr8RA7VPQDRC8W/RBWsAwPLq5SaLFiNbeQyrhwCKKUERmCKBMi3G5ZB0lD/rnGW6IjZTT+sNSVYjcSwCWY1hY2Fc30yGBZSw2Z04Jpha01qhUtCyt6xieYTwp0pook+Oj3rEc/gfYH3Goe3MPNcd8UWcHppEuawIxCGlQ+Q0iYVnSgHvglMxmpxgk8NtY48dZ9KZArN8psbDQD2BWEq9Zk+vHDJaahplL77Ftcncqju4EcKSursfUOQTqsWTHfEY8EFlGRkYA6Qri1CKLEDIYWL8YrIwLgjlFxKPTFuDn5YSyPeF8PwpBkICR4CSYAOkcYsSQgaXinjW8GjTW+F7fFehLnNK4ZEDDIZl5dMrWLNS6DUU4YzFEYwNNPCXIUSwJZe/3y9sktb5bZJ9cNEYPuJgVBHG8YH5whLmskY1tPBEKeYuuVk7N39y7a3yHWkWwGlkSGu7lxJCVxyGvC8CWBYkNfSXmThOPp1TUmXQS5hRoiVSmyRNhpmT9qdNriN78mM3a51HDrJQBvqXP1JdsCV95FvQJMbqLTREEdVaxR+/fnV7/B5/fqFarWtEmjyC1Kve01rrXEolWEMgtkEhZSJZKkHck5S06yQYUiieQQVy+yBJiWOgSsj8OnRY2IGT4W4sL1+HppTRt5YJYx4doTmj0vXlm4PO4N2cKJCLce9hPs5WRWAiPVE0a9zH+e+/qsiuDoCYieUHFpeA34m4CbnqSJRTNKTwIOYMXZjm+KL3a8GjaEDvX97hAcdcFszHeaQfjH1t3N1vbypG0L4fX2vY92/xzfPSZiOM/zsbLBvY2hQ32HlAFEy2LxCJs9v+rrO9zXJwYOfJHdVfW7bFLy5T40X7qtJDgaw7xnAQZ4VaIqEpQGDynMUsYIrK/VZgTmLiHO29u09l9lv1b+VHerJdmdRSzCegMU6CZtXJLtVfGaVXPtNdpgba6qZZYASVN1dcCGG0BVAOsqmmr1EOBaTNoCdkrfNRK+PORRFITc1RGCxu21bZodKhXHnexkeWjcXZhemCmMjxfd6bnZscHs/OxYdn5ubKwwnnUXitmhwdHcaC5bmh2bGZ8cK2fVz4L6++xwbmhwUFly/c5gOjWcTo1kcvnB0tDg1GguP3Q87aSS/Zmx8sSMsvBSI8MZ+KT7x7LOUj7lDCSns06hpwUXNrx6PTSJ4Er9rlEV182OOOy9G/d3731m4rBL1FBH5Mt3HdKuoYgMELaGv9bINBKTKM1jcZQIu6RmcIkTrCQal4OTMcASQ04fNUjB7n8OpQEh3PLN99sX32XHebnhHwe1hbXYAAExILpes+TKNoLVjaYpR99Ii6NNgQoBgOj28WR2PGVO/BYyETnrXx81J/7v9+9C/Dk9gd/aqqGXBSfP6i97j75rn3m0+9UNmFJ48pzANEWDkW8vMpM4JT3psTYhwqyL/TVBWsVAYaWPIbyQRRn2gNCwUq/F0LdxB3xvCazd3x4LqdYKeH83jsMjgUKiRIW9Hy60778LzwJhkE9plmCzYyG/ZPzmVaWgKhYcoL+6Rdr8gBNkwhW9+Dnsf2yfZUxS2NTecI9RPRj1rhpYxlYo4SKlcErFWJ0x+K159+Y37acf6tlnypcyTrktkgSvnMSNTVAT6ti9ZAT4uOwyfLW2EoJ8rVkTOHgkR1DYhikBxYbGBhP+l7ODLTRwax0KKCtpV3WNjef/dAGs5RMMdA41ti5t799/THDnYPDBaQIYpV6R0ljR7iPB27qxqbcFynWIAvFJnlIPuHkR/ngK9gxNDxcv7N1+T/cAxwBVTZuF93+cbtTaimsAFDKfLQeQ5dQxIhRLGx+Syxc04eOhElQ1CMaQ8QhcZYLXYqTDOtWBBwh9wqQg0OltwX2AHfjH72l8LNyHb/waThZzZDdgDYigQ6oAwS6Jsl20xYiiagTIb8PAEhxMrg4YR5ESUbhYKIM2QQEQtJplxVy61j5zllYzLZo6uIu4XOoAQhXFF8q/s/poldyLDkhqJiUlkdJaQ3HeLyomo5IsdYLMHeNEYxFSIptIJsXVgCW2WR5pQSQqi1C64zL4oC5YXMWl1M9awb0Fyc9rqhe9nti909JlaZjF9rMaxOY5T0icgzT1QnK3pNhBb+VPrz3+wiVLFzRxP1WJyKs51RXIrPQzqOcphM8C40QRj5nKpLB3Hl9Qlgp0Z5vLAPoKShwws8K8mn7zsTKevY1maeQuLoYBYBhvLB7uNJ0R3kq+vH7Y+nLocA+LGRJLEm7ZV04SIRBgki4CbOGfws4/HX7FGKzK+MTT3Bp6w7DHeOgVWyvatwl4sktmbRj5EIDNsMqvHdH2rrdabZYirAh6hO+vqRenZChoxADWyapJF4ZvwKPS5Q0JEqmH6+4S3u3V3HJzw5XQDupAqhkQapddzwDzk+gpXycDXAlliHkM/bKrYzEkQYiuHe3rGA5xUzSnf4h3wDEO0r57E9afrazNhsGq+hnNTI/lZ+tBbX62rrqdDedmpkfUZ0V9jgWV2mwmXZzyZ6O1wmgmXZ4sjHrqMzM9tZBJL09V1U3q95JqGrjTM5lKzU8rUz/tzs2k0svFlFdW95cnR/Mjw6nhoawy1FPw65i6VhjLq1/yI6nU+EC2fyA5qD653GD2VfV9aCmTddJzS5sZJzMzMjw1lHUGcoP9ucHk/Ggvw54nWOCv/w6FGtv3GogEz7nw7A303YZVdtuY/IxOcvbh7ie39p9dgDI9Yv57GNCoDPQql02kg4PuSc2VgLwlZdUZfgi9EkCEVhJ49K66L9mcgDj5/sr+qSvt89fb779BvWM6Sd1dxdprWMQK++fzcWXJqtlqM0Dna7Sc/v8PRNg9EEoyJ0KLG9xVwcAD6tJ6+vb9b9pX/6afG0H0redFYH+ri5hB09qiQrcIWGwZNYhVfIrsGduSwdNF3JoRW6ZTwljGekcnbjHR1Y8x4HV3lg3fo1tbcpn+eXtGfY09kLH++HnQ8NMmn6FKxmTPR0FZYpmW3IGVwkh9SeVZTGCEvt56j6pKQvJid39A1eqVqxeSvQWlH7ySXxW4ZYwzuKJc2OtUowD0LWD5UwHLz77AegzvKDdt/9nb7ZPXMDOoDMUS1P9Rs3TCIyGNdpgt1cnEU5Z+ubNLNvWwr16dgsH37ncdnYJYgeAQq1e+1NlpGKg/RAEmybM6wSLuP17FAHoE4lZ28EW03u6u4AgX0STG1eeTP7T/+Wf7D8/sP/h29893d354BkbyJ7faj/9OpUg8nO+wE4gyoB5CJVxCf3XhTK8aQqkKo8wse9er/Y6ZKvcwe4EtYAUwdW3bd/8f30LG/INtNn/j44CDH+sshEBYNQmq4Oaa7gCi+0PcjEfHDyKCWteLDNd98dT+yae7987tnv8SbcaqV+5+urg6bj0qW5XCUBs3YR60PvcYp/Y6AkjA8ZpslTzx13j8Gbb84Zn2hWu8X/LlGzDkFKML4RrrfgW6r2MYfERbHtyr1vs4u8uQml5m9N3W7WMAN0AAvO37n5JFKNJRoxBzI0DZTsRWpKFmrUTcNbFp02pUl+1OTI2deF9xwuRONRs4ilZOgGySJCTGCKof0rBZiQK0bUIBR7vnIORF5w2YHRR8bZGkDsAOCnZmZw9oh06UEQKnq34CcMYhRY9mhiK9++a19s07ErYA6bpWXoI4dpGBI7CMsHJzxaXodcwP3sYdPSi0hpOAq6Od32o/vq9ePfoQrnK6YIavVr3lLoOu9WTD1R45hOr9Vv+d1tPVMvvkQn/v3jnwyJF4w1cOLvWAs9lT3njCEKATpLKPbjPV+SEoBQ9083XMjIXVAyPEWFZ7Z7/cefJV+/653b9KgKKaUbXEb6kMEEMraKK6IJBVAIK7MZgepgNN11AT7R6jpFV7hG9alIqFAwEVekncoqZHIQcbce+dVZIWtDwWI/CCkGZPECo56jWWXOsJkHDE6srGh+Cu9APEOrT7QcPYJmwexqJq4amQyoLq8gwcGReXgtN4nU6pN22RiRiQ53c/2mKRqZZGUDfIkiw1dRUreRruLP4s8S5syjZV/TAWTetZ1PpvwlFx0yvr6kcwqQgtIq7pASHm7JcEHKH1vbeOOJAJb6OoH4JdlNYj8CdsSATu5WeaEhoIQZMWOoZylWMUlJYMZWA6JlPXNIKskGVr9rhVTl8n6r4mBDLO8MqD/PQ6sWnkKmX7kCxFUr32aWzzPm7N2nasmLBx2zX8JW3/Z+3e/6DdSTO7w/LrZXt1WF22mdFpZx1ETr3OOoP2EbXdcw8Jus+mFrNWLAulwwCy7R6xQWyr45fpfcmtj6thW/tqHas1ag9FF9dwtK2KmsZWYLbiisv5l0r4TuEel7K/SL52ilZbxP0y4dYh1yhdSSn8hp6YLFmMuNrAGAsjQGzBoSFjOBuW5UTHotYhe2W/DKo6naA0BMyCqzVTXXtyW35RWbQDBGmvFkrQuj0bK6R+9ov2B+d3Hl9on/zr84/ud9QVQ+E3kPivRASVMT2vPhArqd57V46bVRYXpVVlkYtp6rb/TQiLVXBLphrVprsEc/aPf4TYAOIeyoIqk3sV901e+e9fnfCUIMLNIev5/vir3b8o0++efe/h+L30LNJzxr6zz7pTGAP+DWvqXf7vjmhIGTgzTHo84LfAXY1+Ba8rqDWrYQrHhuEky0EzxOjKmptvwNZWH8AvQHwAfKMBHFW/Li7+6v/8PzQsFno=";
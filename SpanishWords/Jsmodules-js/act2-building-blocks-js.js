@@ -1,2 +1,2 @@
 // Obfuscated production version (zlib + base64)
-export const w="eNq0vWlzG1eWJvxXMupDV01EO6a7a+nlW1f1MjXvdE/NVEX3dHRMMBJAEkgykQllAqSpNzpCsvadlmTLkiiblCWLtEQtlmyR1PYBqtD/eINY+C/es9+bALjIdkdUWQCY57kn73LOufee5T/+4//+35+E1bAZhOlP/vQn9bS73CiC7nI8E6Rvj9aCuLt8GH7f3jjb//y7/rkTvaVV+JpHjWo7yttFEDXaQZrBT2GSxM2wGoRJkEY/+fc/VdRmB/5oePCZcUogoU+fdpg6CQvm6d1igrSAANytTCtLO6fO71x71j/9hllqZlnO3MSEhtSOFfoKv3s4CEH0HrGjJLIijKtp9+t6HjWjoBnhizyA3knf3mwcDrrrM8pK7+Gd4aOz/SN3mZUiArKIqYgbwoEfOspPludZNSs+yNpplreCLAjzsDUO3908VEK/+EJ5XbAG8JWzdqmRkN+5ey+Nshq9NrzwgwpB1tN3lxF9tYGMD66dGHz6enDvwvDNdfgaFWFUxDXpiVpYi5p5NJ1G2h8GSYM6Bvr2/oKPub1xxMMMRxB1mNtJp0izqowOvflmPANf4J17j5/Ah3YaNdtpnLVaoY6RESUjIMTY/jBpWEJRXqpx2l1PqjLtLnd0LGSY+2eOIBqNMTwaw5PY+20CM1pv/utPJTQDKqGUIXiS1MJWnNeDTtYu/h5f693FetDdipMgSoLuWi14d3kewY5/0f/26PbWyd7ra/3TH8MvnWSaGIvmwkbwWxwDwsnqadQmZP4e+pgG5OiN0PET59NFlBtHwEfWXW4GhMLcIB8nLyMUsVJLsH8dJw7DceN+o9EzRJz6BGU4JQAZtKgosnYQtuNOE/78xwudGnVz0Ol+A3JsbRZR7tzovT7du/aqd/kpfG3UOwA2nQXtLCFMAmhUAcABNuERfU2FkldkIH4/xvJeEGm9js4r0TRiIedvj8LifnsUBc/g2L3epY9JBs7BA412jMD4dDwN4rRaJi71t6K4/mYw5ofxPH4E07GUZ0lWI6kE6/ebNgz+PC3am/1ry8h/ESVpTMKIngQBVghdrcQLU2fvLjaEE4Do3X3FbCCC44GBHAsw0WvdtSbMnS+79+K8CqPZkk6qp/RqVxvQ0LvLKE76n2727hzvL51B2Cxut5RAOi1sR1WcDdJpMBHoe1gCM5xREJUnTCPSJOkk3fUW9mKTJCvMyAUQbgQzvPCot3gMPoC6avEqmw3bor/aBbw2CIA8RMISFgum7sp8wGhXZkVcbm9sAObO7WssLgk2LOHJRM+o04BNRt+FrSiNoXejprGl3z2e5CfUN5vMDw7fmTUA8RB8YumZCGRoXAWe5G3W8kCUwCpIkXV6na0tUADbG1/z6yBBO+Q3Mmpdufo9K4EZiEcu0kgJEhGweWzqhM0MVJ/dzQYu0i/v98/eIf2Td1Lu0XxM+XgAe5LLNMlH9GHm6A/QfmbkOqKOPDtA844+iUrrSNXx2ysoGlgJX/2id/4Frb12VYwAe9ypO/6+H7GpJ35c3l0XcZk8AANyVgwXxhksnWPDxaGxwaIISVgGPBg7Rs19EdW6W2i4dQpZ+LPICdh6EejJRdTnva3nvaN3BzeOb79CQddoJ2HUCPJOhm3UOmj2ddolrKwygvVuEcxL5Mzgtl9dGW7dd3C1LKsbXJhGncpP/v3f/+YnRS3P/jVKWs3wQ7AixeLe1y52VrEZsXubsGK+jtmuYth3ZpFs/RDZbOm7xRnSsN/2j50A43Lw7F7ZdPVNSt/68y0/M/dYc6TAbcnMK1lnu1pmKJG9h+yjb0TtY0J55pOzcPawb9S2KRsge1kfvu3h7ATPOjDLQM0CtgacKt/TBjBVrcrWVCz8d63N+nXw6UtRrqpVfZ13II1n2s5XT6KaWBuJEvJU0PfUGiUhv5+I98T7iGjeSzL6QnlEpO5DlpXIRLaVJdm7G6lJn97dp54ASsImjZiSeeJrH+HlBJcnacpSxmSLSRUVKJ4oKULoxP/Qrv6nAPaBCPX7n/wNvGHUqXfaedai6bwSJ2/v/xvMiYWAGsE2/js8lsYLKY3y4NNrwOH2xkVplRDSmKZQEjL8nwTEyX+DPzaKOKlj9/7Zr/7mJ7MwXMDP/E/+37/BadXEf5mmOTXFzE/92a+m/gLawXMGGOEQpnZWgFDOw4JV5gya6mDvdbfgPzjloecXWcSe+Wh4an3n+p3B1dXtV29oshA9kEdEPQYoU85+zMaa8HHLiGpjGLGqFvipHea1uAEGYZSrmdqhMYb/gA2MM3pnaam/+Wb7zS0UxiE8By8TH47zTruIs6ZAC05IOASOn1TnESYOUJPxdm7dNjBRwvS4quAkqoRV1HDAcQirHDqeRWh3E89wpmXyD54t4waB5n8eoTSg54I8DvHPAIMmFZ1BlJFCFUbuJ+7RA8Ezx2VA69M50NTQnZ3pPBJz8t0ivj32QvwhvlN3DTdxT1Gs9R8/2/nqOqju3uXz/S+uYl8KZXs644OdMqBamPI1G4E3SA9Jhl++CZvNqB7GnUNhM2hGhY0RaLDlTgPeHoe999XJ3vlPtzcuwOdWB6zuZtDuZLqjm0EZSgC6j3KQ4QiggTkkYcqhCF8ZWBaHkGkQmdJ98eHgjzIbof9gSooA6q0v9m8/7T2+1D97lm3yCm7jEpBh3HNZ94mApXFUMs654wTYoBRBeCMiYatAqhoOXjiXgbqBv/Oc7q4QK6efD85gnzeKTl5ptDM+tyK5T1QZKp5IFD8hEIfAAcEwC4CiEGoKMpmZxa1mDBv7RhLivl5OhO7PgMpaaWIrqILI6qrjT3FbO+r56/6jmzjJTh3pbX7Tv7UiO7JoHnDSMJKTnDBm/ITx1ZiW5vzGDNRQ9IiRny2tYlp9WQYmIr0oT1dcZO8WZb7iInt2Dd+Xn3LrlxF0CXe38M/cix00Ob35vzcgsyf0NqiwTW8GRcjgURtWeIV0Vnd1ATfpQCeI333TP3OOEVshrMtaSvwVWRpSx6fdp5VwRqYXwxBrYEvgGdsaWUU3Php+dFcRmCGms7kf592VdpwicRHOBZkd1nVXq95RXe/iJ3xU146SmPueT2PzqN1dmcPuSndB9AANqwTko0yGAHWE08RnDVYmdNXFmkH2z9zvn7kywiHOM7JPQAmlMXKZ84z7/qw6LJ6qeMKgB+swT6sBzw13rt6/9wqnB/XeLAgu13cwZnNh4vVdKMcVDgfZIHqP2Kc0866RhhXHSJ0WZHdzweNj8HKj/63wUem0G+2w4h3x51H3CSK4A1cDFclKeDipCKcMUkIw23GuAxOfZhRygvsJm1HfPus/P6fXH/NZw+sVPDyseYw4JA/IMEoAHvXknaJnkBzYlinbMc7O2NfKUAtjXO8fVOuPaXxfEe+vhr1PJWW5r6osqUmnwXbXX6q7PGWj6opVlSoZp2A8Qb+nmDcR70TwwQSwE74lIbmXiDTxOEk87CkcTIZ9H0oRKSoC9hQAtvhLi3SfJeqWZ2lF7bmedC2N75MybvTXqIWKNGr/dnSflL5bbOHe498C3DR2N//N3yH1rhyFHUjv4R3k0N8eFU2ACvDkBVj+tb85+utfTt4cIUU8NSUklam//qVtjkDNNqp4zYG6o5rlrPmWYzJYVlCapDr1P7/f2zrbv3CbT13ydptNxSCqpyExBlOCsVh9VPQIqQiTjFSxNjbWBv8LTa20raXB43u9l5t+Y7CzyVsFGW9gfHRUuzOknBV1MjwIR5mP9mAKCxPtrzCI4sPhHC+2+3gMdXEeFwRA/vECnk+9vY9Hh/2lrcHta7A4Bmtb/Q05FSvC+YZcTwYL7ZYcUcHanIFmRC3B21bDuf14yMM66eYSB91NOp5Ynvbb752427/6erz9tJNPah0WbEt6utXBO2VoFuVhlbYP2Jyckda5keHKl2BrEvxCDnMToDM+zWqNUPPa4S/wKjRHeADpJXAlYRc2Rl8D4AfHPvNeA9thzQUbFTrmMVRUYPAObTm7gY08yIdm1u6E473ovQ4PX/cb2LM9OIxTp3PI3g678Ozq8NTXvROrLHIbVZ5A2J0BtBBSA3yaYs0RTyoy9htB5SF+e3S21PDLIxOaZI+FIIWNub48wuO1jTd6oLuyvBrTzA5rMSsMlBJBdx3E+B8vVKC5K/MsHXa+/KL/9Hbv9UM8qcmyabz6midymiMTsEYayWA8oypsw+gaYjUP6Iy3u5X4DQ2OrffOLg8+OmNtWTM2oHxa5CGTpQa9BcowUSHQXalDD4IIqGfTqlu6Dw7hyOGkHhz9rv/46uAUXSfNZe0CjP86odbpDaY77ULsHIIAgQWSlEYDdC0yjQMhli7oXOAYRoItXcYbGQIC5AGopVFVrbkGsIx8pjmxKScDYEXj/QL27ODhk8GxO30yyVJAxtN3uhKEHS3NFyRtyIY5J0ZBJmAvf9Bdo6PQEiZ0u+giwoXu3rl9XKH5oj9q8BEqAbO44Y7Fn1kXgnALUMfVwiSquyZQsFVYyHELvZOPQbZhl9RrcT5tAi3srlcJIpqLUtOYhBbguqiEo6BebzOu9XaetQGnDvCR+MZErYw1K4BTj8cIyD0UJjC5v8yrkSiIIp6LkqhtbimkJ8hupGsE7IfhvZODq9+CAdnbfMoHzUIELYEZWUCX0Vl7SOBoFIFZ2hJtoc/qVFLS0KaT1673ktyovaTXaHleeU2MTa48g7+AjkVHhEYStQq5IwHzmhpFGxut40+WoLXe4kXqzDyHV5+P4rk8pNN2H2SGMOhNGA/XdNRI5ASFoWGlgQFL/+WlAfiDE/fgfw5fVvJslmEPMG6QQJ8UOUyEZnl/wTIRbBhW5CtxIlO4t/EZm1NpHLbzTjUoW0g+oRzu42fs+kaVjrYZjG1usgqW6eIiYezB19fQI+zcGa8FZHw+zGt8A8Bw2Ou5NVLQOVs7aoV/4KuZNnR2DcQ3yVOU3I8e9ZYe9z99BBIOx6OTw344BrLfISiRwwJoZtNyZUhYbZKeYRG3nP+aYcdkN7+7WBUfNmoANnHDjTUyZ1t5WNVp04r4yk1a4It8hJX5Kf2NhnIaNzuJHPXXqKHuN/TD4Cg2MFx8heZ5ExFgHOlyJ26xOg9bze6KmMI1/HIbhVyIczM0RNFkiEY6jKBGFRcjjctN9KLrrkxnfGDJZh1eC+HdE10unMV9xze466pFsPvlJz0yRKFP2LMo4ArXswrEPQtvLd6BDAk927u1iDunaiezjm3THoARWR/hZCZcvn6L251KEzQAmkwfhLU87NRp9XfqpNthReLmZxW35f0vlkC5D1497J1EqzCqZDk8Pw9L5oM2bP4qfE2Xt2FDBUswzsNmHroNDnwhZ7tK6ON7soXhTba0oyITLy8RnQJJst9kJ8jZHDhB051ORosPoIkO3VkuzpBRBHtmciOrByAMaHbSTQdtHZ+AdbT96tLg5qe4QX30CPYa1PQsCE0+78DT5GA6wburbAFGe07uSfFcDY02ahPmQ8iytPslW0v4d11odPiJs2GB1xkedb4+67WTiO5MQ49YZn4tq6MEAvs07j7FW+CE76H9rckKGTu9C5/g1uRLFAxFO4pwLWbttsinpw4I2ql0V+SqWlGDAk2JQ7L3KePL1ofxeevD+KWNj+JCA0lp54MiE7YvczA1aFaDHUCnrtBxaVjlwxWZ4h087jW/PxTXs3gR0Q74ngcn+51n/c/xdHHn1jJ+PosdOZ+ZSxDM+Zo6FwRtvliGxd7ImixW0IPkMLePXC5krVAsQjx0R+3ruLVbc+DuaY73eOQr8MngxeXB61euXdifgH0yTX0AwomljbQ5+WRptz2g7fu8HZ+3p9xzbzWyp/J3UqU91MjeqbS7GdvS+BsZ3cJ4+5bJe4Ty3sDfFozvCbx9wIhlTicyZSt8kv1dsrk909is6y1WDt8BtVrBZvk6A7VskZolKjao2p1lo3DEGjQjcMT8M6tvxNoqWVlmXJXMqrIp5ds4nm1j9oxZMma9+BbGqGVh5oQzJJz94Ol4z14wO4EtBE9jl5Sq6lJWo6JDPb3ptBwd+zn1qLpR9KJTiapBPNVhGsN0hVMRJc3APYWvIOeQjx452auynCiSbJKANdFHVBFbcp4ILQsMk2Dk/IqyyuSEJ4nGj8mKrB3NVP5nEIGgj+a6T/9p0jFZd/NfyZuguzkD0+6/jx6UnVlDV4ITz3sPvyuflbWrhP0nQQQGTAxWzD/4B2Z/tduBGZFlU1NKNT31V7/0HQoi2Ds1URl36hGI/axJh5d8xQcz7RDw+WFA36ImeqqSLYuzZvjmZu/MhcGL9cGLe9svHvRPfzx8iEYhmhM57eGzZlD8tE1jkYeHUxAPoC+4BT1gHm0cVlit3Pwf72PzFW3eGt5ZedF7c4IbHm21XeCR2rzXLmjFYCFsiKiji7haxufprBrWQT0tLgRvb9IJyPrt3tGl7Rd3e5do5uOeG7Qcu79EKSwp3AFEnZaPBy00YafU/bqaYQ/GaFuCUPhQ0PU92Jmuf+vu9sY5aEReg1zqqJ1M/M7Zr85rb+wNdKxGWxodKGvLHyVqy40O4vlj494JB6Vd7qjxIeEOGxmS0uvIaCiqe5MOyCo0wPRtdptu4xMtMlJ9DZ5G5ffw8GVyaQvjr8FtjLyGNePNKm7IfxF9auLaGVktJFrjrA47pmhW7poS0EbACWzc1c2BlwSoDGR5nVz3rtSJ2bdHcUB2blwaPv8C2Nx+8anP5oJc+hIWvHZivhiwV9GHdJaS/7l2iPh53n0lfU2TEsjnAwPnWZlGcSUogKm6WA9N182KXBpHArYRZOARTIEDhmHzUWQ8fHgbRaNJB1w10HBy24nxN7I57a40vCHcOXV++Ab3UcM3n7khBMMpIGc8EJ4hjyE0x9ixvQU25IZxZCKOTEH/BQhPkfQF2FBoxkURBpGPeojXancdzXI8p8Q+v/gClmj//NHerRt0JQd7Pp0d3fWCT3QKmWg09UamRXlKfEo3C8Zeg5jF2ZB012wudFesU206gElHM4I6VabD4jWYEdibPGppPG1d+VN/Ooyy6CYCDBVaK3WVfU9XeyeeTp4EzGZ3S8wk++vfT9ZJvkLg0eGhccuLgzh0gWXKYhm5DOcDGX8UfIO8AZ8TdwM5uveCqikxaswhVBX+XAudUnKCtiReTZyKCPW1wMFJ+CEy6Op8fGCiyISQvRxfZrqFcACSkpRholHZ8j0lwI+3FPd5F3+FFP/VrZK936b0JrvP4R82y8ZNS1Vkvxk1Kf8Lj9vPcE10H5TMSfuTvLJvTtrfYKk4ZDMn/3IXc5KppqaMqjr1l94VbFztrqcxXmjU+EgAPVH5fAg3krgFJ1P83rneyyPbG0e2X1zk1ZqmcT3iw5pmltO+L0bPdDwnYizedt2LmuJDaciGN4rkg8jCEfoRu0Y4HLcHGHfEHmjn4bhdczg1YGfaSGtq2biWRm0b6Q/PtuFGfOuZoHzT5kftbMCPm3zf/UO628H8p3d4hAeU/3n9TfCl3cpclFdws9K0dlgJR0ngWsLQDLRLOrMcRenMNQzspGZ7j5/03tzvvT5tpluaZUXAHIhYlbjmFPiI8VqLbaxyu+XX40bsxRi4hKlgvklokCTlgqyWhnT37LDxIoevbKGRtLuGRx0mz+WFjlzvX/tuexNe6IjJdm4az+8wBjJqkFwGs4I7FhqCbXl1EhPjA+c1NQ5fgi3Zjmjj4PAxutq6NCoU/Ds6O9j0xUDX19f8CaI2cC3iRmkCsskD6NSwqSxrayJ6GdRDM6Cy8RjmWR1Mv+oYJhm+eOL0oRuEpdXBxcd0TJHyXEJzbiHwZ5CtxpH5U547ZDwKc6gTddqo7ago7zNldp0uu88VbdafKqWmS22WJsn4DFEwNSy5Z1m+/WaXri2NGncvD5z1MKlrgGoAlNfNKjY75V724fwZQDpfX3YX41Jk/b5y2FReSSLuRqbTRNXLexGprH/flmy9HJQmnTSFf6io+NFW7Hu9ysHe5GBz+QdOtUkWpiyHMQOT3/RnJDIB//8p25j6V3nbspGpf9QZWnLy+9VuRiZTkZXJ83rqV87IDGN0zQ3rFvFOZwEYRKQh78NHR7ff3OKQ94gceUPYfGq8O+yXmN5CJBUwLMMZUglGfI4NRZ2fMRa/k2RzGE0UHQ7Rqup+g1EuD+i6efjs3s4RnAt4/YzeJLN6KRRXjawqpowPFu4HpC7+hqMcNdI4x+t5iuB4ewV9njfnUTrXyRCKEzmBH776CsMQn60PX5+UqHMkI6/0NkNowLVCZqOIPowCqCnDJOq43sbbQ4n2xtNQ2sO+PWrpT3obRwdbG72XyxbPX5Ho94g+W96TLJWgc0YxUiXSeDQm0+ZrUdb02se7F/SYX2t6za886H9+g5tPY8mbAYRp5sV+M46PYsRKJjNFCOWO7sNYRwTVGnniLgSdP17gu5OPP9u58l3/6nd0S4dXa1WNfJ9xo8AY2cEhLPx9xhsHAqHoAZCJbQ/EkvJcesxIEgXSyWarUcNP2TJTTlfEiOOAPtYIkEOxWxiYYjW6EwjrnNJncxrDBPEICS81xejZfvFZ/+qjnVMfs9FDrwl7oQUiyebidjWaFs+9upyDeODqfa5oozhlDF2SNKlFyl8kS4Ec9C6s9Da+4huIqpdUYwYkrokYpc6YlsmUxnJoEIml5KHMOsBw07vKQvenSBPX9C58Mnz21eDGcTVSYZovUAAxSIZqOB3IVSp+hW8cZbIctzR++u4qx09H1Tibg87ToA4m1iFBPjCYs0nR/LDWZzGykCQkXSyf+bJ/9jMwnCl+ogPPQg9LFD/QRh0i5kD+Mly1BKfZSgiORbfBSad6cJasJI+mM0k0QLkA4AUrytr2i+f9s3eZNXhuOlO+lMxxhfI2a+KWi7NUIVR3tc0ggzObtM0LC8nUxeQWq4LjKulzMLEQXm3C3JA93/DZt707X9OddVykUetDMPIkAgDpamFchE3db/tQhIO7FZL538K+pASykEdzirIgmXfwujqEbUlMqiVeoDPIFs6bVQrHf7i0/fpN/+Yz6o9WGJGOViK88vdAlA1DEVYYhLkhCOOE6YwXMCYoK03FbhnW6oHGZ9991V9+CV3Lsw+e0xkToyeoN10YhcKAHPkIrR314KN28tAuOtUgxhCvtuxQ+OgYeUF/uU6NM8n88T5JgMtPeo8/7t25Mfzq6M4S6cACr3xiPOueDzC5UTCfNciEpb+EAUPb3kRalGvFuLs6TUGX3q3i8Nnm8OwTu1UkGL5VFEz/ShGkFhh8c3ryzYfe0zi7NF8QsAxScPvlDV7+C5jXBXmljEFEHwYL2ZyHN3pFaaK1fDcpstW7mETs8r2kA7TjF/Shgy7Jo87/og5YbnIHq7D6FLrWttN0ngMDI+wabQwj5aGNX6oCaplbAPZZVWyfV4flXaC26GRLuX13scTt9uZj43ahUykz62iNW/mpk/3LwcD4fqL5Ux9PRmtithOxUDFB1332biFPqjcPR6xT3zIdtST3tiPLNmTJ2juArefsPDPO9jDNnFnmbCl5HDnkx4eUTwUNKTOinJlxYNvH7J4S7cEMFDFOSsbDnpaDZzb4Wn+Cznf63tPQ++hnp5tLmtTXoqZAPe3pK05PabKGaWAHkN49trz98jNVlKbkTC2pQkJ3GlZI/c8+8hWS6CJPhXjKw/SGKg3TF56U30vGm3z3RK0vZU26ilw1meqknyfvTMaxaFNx5gkeETUsXkSqmCTxl7wud1kXuNRpUSyQJ60+NO4oRH8Y22rDCgOgfyxlF+Fl5u+qQXgsdH4d/AlKkVYra/ze31P/cpc9NRFVaEuNNMXUL70dNQxcd/1D2RbFh9FVz89Jhv5Wtx5ZTrJWR7ZEh0Mvfl8xHIJRCo3Yl4edkZuHc3lEyQxFDr+90lmgGGZPfA62vtq5fdwkaKQkJZHscJxMlt9YKL8fclk+y++eOo3xJ9X1KBe7W9Oepu+dXekvXTBNT8Cq6pVUVX0cyU9yR8hYdc5SJbqT4HqPT3p8erqeyR13JFmA/RzEHckHWiaU14LXSe/xJRySWPLbtdDuzcMZkw9MHu5FqYMp1JbhMq5h1gsM68nS0Nu4oIc/eT2wpyPsXB7e3t44N3z4mJdVnpVyAdbSsCnxD5Z2T8FLqAbmw5QQmLYVpuwXr7lSbEP59miVpsJG7/nrnTuLpHNm4XGe4qSmuH/1DMRBZaYNGGQUwTZ2hiHcTNPxVUdTc7B74vpi7xJue2bRjS3kOHC89bfDF6LK9iCyhDFEZknucDPHmUGx27zMJqePWE6TaDpOZ3mLCMyCuetOG6q6d+Q0a0Blz7v0IUShtjeG7VSdNMm6K5Z75NwW33e1JGlxHhKldq6S7kmo+1QhtdS6oWYrIfGFV6BgtpD/G8iuI71Pb3E8dS7Z/Fp+5lqmniy7iiJM6pjdZV6bbvkzK5PzHG3VWjRS6j3MNmFTSPMArScSuTO4fGxASf6kMe5YpNEEGaAuLW/kSkuzY938TMavTQFirFcTy0LDVDJnkE4iCm9+ZjR6Soef7YyOzv8CEAlzutpAHVIUwaysuEtLgyWMHO/gaTktXdKQQoohNXM+lg9jCB65RyqX263uCp2OZN+Hje4WfqeA4rlRvAOwouQui0D3Hp31egd3JvUpyxmYniKlKdEZuf3HoJ0kb2Ye+qm5fcT3xLPEG4LIvdUUtHH2fChOWKBcZYohTClGdjAIO1NkkCTaZefCZsGuRoEYBCWNLZGENQnFA+HOcaSR/dmedMrY6U5TmEpiOtJXb7sqt/+y0I7BGs/rPwtKGtLTQXtrIKd9RvTF3tqipCmcwN9d3DtRb3J6opT2JLQnY/eSsE66OuG4n2gUsWjybY/nRbI5AbWHeFLR5GTJXstXpUh5ye9DQYt9ZF2+36r0VqS/lA60kLxFNL5NoG19B51f/zdFNWEARdKphFUwaUe3DrCZ667/hoJY2vC6v/E3Ef0np4aPLvQunsAJ528lFvJQ8ALXlL+d+MUu2wkjnJuaMsp86heldBxFPEdst5p8iHCTQhEL2jZfHN47aVEymEy8lmDyTguVcYS8Be20O9PoHsCwJCIwNhDj2vD+ZgXzDK2SK/r1R/3jb/q37vaX6NiVKVE14JktNUd9zj9bILUmMsXVV8mwmZT34yCGVthTl851VyvaUO/0496jL4b3Phrevs9t1SKmTjsmowBKE9d1umuozeQZegPM2IGGfttrA7X62lbvzhqD4yDNSpCeUWbQV5KbRH7z4inYx54jpymZMJ8e1vXIAvMJn7nQW6SoCdiMhxorbV6ymAKkEbhw6aK7krfHcSmmr7tOu28EvfOsd/NzFE7VsKKYRBp6WDBPZHDbqYTEXMSweH31jzb5pTFMnHLMY8UBWteOrtPyoCjRKR4Dd5eVMYp55Rhx4As93zbVARekVbvI42m5wRIEBrD4pzRoRngcCXNAna1oIhA43xXCVC75Q4kLzenH0GD/m5XtzS+cPxR51GCkXHshDdFACdo/TWEqL+hWBRqk40/2+ul+PWfnnVwgQFqW09mtk9yMuAbEhKiO2ICSBOGCzOYOnpw6tO4qzAPsnAmwvdOnsKPK4Mw0hr15jWQ12CBjfBM0VWaYjlgzSkElXTOJf+6XckOCjgu8HYqvGDTQXZPN/L/8gTz1YbhAg4wlVPBdNjj+DoHVawNoG9U2miyUUVKyGVA4iLBPfkxiZNLVj9yADu8d7Z28QPFgC2JYElmgDlraw37f2vtap/KLlruzYDjqS9eTzayC7l5Sy+SbDp65Vli6vVs8pKg7V69vb1wACTf89jkD4+1JUMiSI9c0PO8WK6IoYpoFNJ19R//ylHbe/jaJeYKFbFXT+NDEJYflQ/AK41P2R50B/gRA2dYECZSACMUXwuHCN/pn3MxfpQwLb+8fcq+DiuDujf7GCX4VlKJJTikoZcHwEvwtH1siKi8dHViE70TBn/KHv7eZwa9xeT4of+XJgm2d/tg+yFv9ltqjlrCNaG7XaGJWTd0HiarJ3tmbvpp02tGzl0khlNSHKQ6nMEp6InQynCUkymyeO05O86XeJJWNklllpzhaektHULkTpAcsVmBuTMB502J0KogQUE8tvmS0qeQ5afEsslCAyLlouQZ35a+g583/XzatM3u/Ec9OEQFggKfjE8SfEToReApM8LyK/mXc6Sqa+xmCjThb4a/IRtnLCn9F4QJi7l/5XDiKSqfCP9/N0yqaoyNhEpD0CRid+rl3NCxX5c1OEMlpYqqhhrB74jM9Tg8/OP+wd/fM9sa5wSfXWdjxpXtK1VTIrxqzdOR0897xDhyTMM+SaUrhITcTlCcKEzzU+Q5Vsx32rhzdfn1zePbJzjdLfhOMQPm2HZTeXuANWMhFl8wzC4wO8tA+2qG7hgev+xcWNZE+yoWw5J/FPyHP5qEFQ4Wp/jjRD+HTaoHeUDNruHIEesQHBSlNscpRrrSGbjKOS7lg79RkR0vVu+ieA60azhcyOLM2uPNy+8Ur1C5HMWKsPR3XqWxNTNurJKxThR/fpww3DwUMeJxSBgltzWum+wAzn0l9Bm6jf+3u4OoX2sBCWGu0c7rAK7LukxDlF915B9yiBf/Hcx8UISizIpQ3qdNtW6p3NW8u9h/cJjWRVdG3mnM+1mIQEaS+6OCXe+VwB4NbtUN46gmLONeIOWJKXx4JQiNvgj6twW4+tFDKVZyyqzxGj2/D//BtZlNSc3P4kiytsHYD0FEijFTAAAmsVpBeKzWtH1NPOV/0YuoCo7862j+G8W0SWoC3FKjaCplTmGOjbpg55gIAbYwTqeaFTz5IOBNcwEmV1mKLzzx7s3ditff41eD+uqjoIqpwrgx6Abn1BtXVRJVWxGHNkhYUcZMSelNbWerae3sTxNbVDy1UIsIsZDc1ZK936dHw4QbLWKyY9OI6t4x6SSCLjt96pr9C42YuoUSuRFVOU8pbK/QSRw+8kjgfPjrZP37JSfTDcRKipyN7VuFdJrneO+AMg/dDXTheKHEFl2NRClS+2//kS4OeTfA0jK4dGD6LCiqwww3oTR+rXqpKgJKDdhbDrfvDV+jrV0s7YEJYWqF2EnXmcAJrr6NEb8a4XSALjIyJP95vSAIgYFG9BC72llbRsJOQ1bDqGSlJ2KnHABloakF4VZTN1bBs19GY0cTsbtG58ovrMB05u3q7UY/zwDYi7aiODYQat4YCDtaumkB4x0qxq01/N4JTg0dumWc970iAZ9wOL14RDd7EONuq2zFEcZOwlft2AqsI36ED7ycXXzJW/jiND9Jv/TFayFycEq9xsO0JDZejLXTtYFiQtN6lyBssF171vx1Z7QtYoqK9y3lme0xFmV7yNJLTdSUdJP7Fh03zDL9dLmseX+WUlIIT0yabRSqbvJfZWpNpwKPPd/R1su1MDNRUGI4954KF/IdLs8sP57zuYjnd2jeBI4u0+zQt0Ur443W3wJHW3OprklmkxuukGgiTvVNbzGchL+SeLE9/x9wYZ0JCsy6y55UhjxucEzS9xr3k/26Cg3ztZ5jS493iSPgl/r69dRrZHnGLr5HBNhf/o2+l/cWu/vA1ss2Asam/8JJ3NEGAd6KmFOngWOCm5x+6fq23eMH8Q2H/lLJ/aIT5XlJ1DyWYEoTRKpW4UjNZEnlzuo6Z/KVEKaW9xS258xwYProFu3HzHEiSUL2pw2aYJJ47dUgp89VHFZMzkB/Qpfu9j18qpZ2XMK1VVSRSC0QincJ1UDJOfYiHdnWtEnXtu8HV1eHjY8Pb93uvrtCpHYFL3BHmASN4raol8N59P+wv59kIqXp3/tsbW4N7j+3OX1BBMVviEMYtOflB77F7gtd77y7WfCcF7sL+mSue+xy5iY44KXCf+B5/WOhy1OOv3EzZk85aKvvTcWMl3z9+Ec+frrBRABuDhEuQSY5wPQjgYfXiIekUAAbYjsikyxborBM0qpwDpNIcQDQxonVyeyPjQmPuNUaDA0M+2hi2YyJP2pFSHDjXiw42S23EMrvcOht/MzGWaO2U3o+6sqC1xHaaez0MSaKGi8x7we5aIMu7sEJM/gp3rfU/e2QL3Zry3s4FPkkr7lQIpS31ooro7uo8O4RKLzpxDR24vXmOJrgGQ6FrbOgi7rn35CDLIZONSeho8wiuJNzqbvqZO2ChA/7g5sb21mVrBbOyZUGjGkaTWnPncNwa9NrkaSflem1MuFyv9BK8SRHrcEyYbJiOEOB/Y7JJ0EZxip+2f+shOOFKkwiZS/aZQ5Pnj5hUOnegGZk50lLb59WfNL5G8JCthN/4LFFE7lUST38/LjZGBJMnlcg844mwMDKPmxPnsVh73hxmtAINZtVXjIi248QCD81MKm+vU4bGB3RSsHihd++K9JvpLicZSy9lLyOv4ZTMqAqYIGV86eLLfU/ml5oVFfmAryeufjs89cw16z3fJAEuos1bjyzQeCWyKDOpaUJME18kuwn+EYHvifqyuCgt5veVEOMLVs8HFG6iqi90CH6cN/HG8QfM50mGIMoETPUGE/CfJ9iESPazoNOgnvoNpXyLD+Ms/acRI5EfZPGHud/Y9BoxGPkhUPnA12+CP8FWw3/2jcc/39V4RFKyH/GVpqZIDU39ubMj8SSuXYTo4Gix5sgnCOiVVuAHtA5Xzg9OP/DDjpP5MK8GLrw3aqNTS1CO822ksLmpY9JOPplrhaUW6N+1zofWwPbmcm8dQ6oYHZPx5aEkZtAGIgHiFpIsd6nr3l2lfEgu/9mLG72Hx/gwJsEnNclDLcu9Y0jOUEy5kBMqBUpAOD8kr6nmQ2ZInGwbZzkbsp4C1DV7acIIWRJ1KGUvTIqA2hMhjTeQUU45amgrOUPnnCQRnt3rn70iu/V2UEso6CSCbWdnGq9R0VNZ2W1yqm86TuFCUpRrSaH6Z85tv7rEaFhKipirhFTXM5PUtz5iWGClYsykz/VDsPDLBawYk4G2PiRuHCvn+598Q2cBlZAThrdjyhJAxAgYtZKsrv4aWctHTPGiiSqpEoM711b7lz+nsyqpaytY+LatUbQi7OS4P4+oK8m79O0VruS6TPcew5VrO0duSmLbXNLk4+EBsZtottiorYmRkqxCc7UthVG26AqPxOviseHGbZYCnChlthrP8uYcf6GrdwMCBYHrJw9VRXChHei8tqqI/rlX/XOfqoqo18O8hgcwfOUixKgudDIW3TVM8IfM0R85iMrK8RI2vvLxG6zNAZwzW06zkVDnROIFps0uKNGstKLuFNiJdC3fYpcqrF/gHBI+ROfYDwP8P0tnLGiwtrXzzVL/08e9xQ2W1HkcBo0CfQ4ody6X+qnyD/g3g5eLEp7B2qKAu4LABNt//oQOdBEOE3jJWTw5m9XSrDEKGlVxNuRZlTPDUXwXHc99+7x/bU3v/YJWB1HmeebnLdwT5TjNWlbfCZ15onYae79ztjYyKThv9306s/nuy94JKj30huPEhG42D7mkS3dtFIjd1JpYAp5LkjSsDjHtVlNkXKr6YkHia9/1Ht3i2r5RM27XoooFNISGYLnKQzz+q8BOM/OKmojM0vzPdGZHVU04Up7+4/Ixb53tnX7cv/q69/AW/I/zMWNucxC9CxVZAVzspLuGLSW0bAotT5WAMOHIGsknWKEUK3Jb0bv7anvjAmZVodTmC0kNENsx39c0Ay+TOaZs8XGMnikpDQsT0i2BR5mH2Zzn8P72yrTVcNn58nMu3bKQTJvoT+hxE/1teiHOiEg1ldYwh/wVIr//GbAOIFSWOG4EC3TTJCSJl2wmR08OF+1YQweZBc0qc60vlYHhFZrxfOHeAYnk5I5EZUUK2r67vEAIFPNHafOeAsb2S7zuQQQcnHlYEPMZ+fj55JqTIg1rUpU0nKMXf3eVjm/R4WgTU6uS3Bue/nz4/Gnv4oveqS1xk6lReEUn06UHLxqHLCyrYeG9MbXhvzOjQzv24oANLVgmySoTyMsjrJwAYcED9CqTMgS6KyJx/OIpoFDNaVDZrSadnQJF1BGZ3taq3WGc1yNOka5Y5j4hL75WkyWNI83pUUFYYA/ADD3xDMabzv5mAnSp17a66x6utYZn3DFLZ74GyjhoaOf6Wu/kZTy6hj97AqwO8jj3SzrwxyCP5QQcurElxd/763eHzz/myu9pB1GoAgupDKaCX+JyVeNSOkI26nxLywwsNa3MonJmlJTNrgVo/dBt0yoYO2I5qdWk9yJkOtBcvUgGQv8s6kwxMXzTQvU4RsJx/UYycWIOqHU63nQxq2HWwaJ6PYXraUVmVtQhMkuKUNRfWeuN6x7TOji1TIWVNIyvDWgmod/hhzxtdmiMnWoZ1Sgf5FhZ3Lu35PTVGPeyRc6286gQ4sQJd22SS0ao/CPhx0UgRkSeyDqWciziVLw5mVKSJiZIRIqo5PBlhi8oTD6oZDBpoHOmI7d5/Cw9KKvGXyk850lQ0Dx8/jHPa5vOk4LkqnHRXf8H2Ot0v+3e+9sxl1foHhz+v4PV3UYr4vf+xmr71RJMh+1XV4Zb98uJtPGupfq3AdbZLhYavyvV5N4tizbRhFNTQtSa+jNv/5ThpQ8mUKiFtVjPeFYpv0pNU63Ihr939svtVxd3Tl0aPsNdw0Kbng8UgmxhQWMwLSUpP7rsAFjJEduwFAGrgM1x+fa0hOa77xKcTz+0sN6zzzFCSoWuGZrmNcG9cnSwdW9n5TuP4RanDFWcMV7xR+N1tUOBtpSScIUudGjKDr87u/3ys97Gxs6tz30wn2v63nEFKeE9YNOOVTBkFaPNWpOqxOiOSjWlh3ffbG8sYSnixfNy90mk01SkIW7AqFJu+gzMtHahgCNtCPeGO8I9Qxv3rgHLhyDYlhGhFpNr30Tuuw8w78pq4jO//fLl4MkLWW/NuCixrr8Z5w7epohVAy9zjrg3N1y/C5J2u35VtpuFXDHhTF7QCKfl5xJ41AytQm2zwFJsyfcic7Xif+QxHkH8cQfZIWl38UU9Oob6r47TH+/F2EfUOmLn2Ct2EfV6JHBeonbvj26iskWnfETUtyGYMkjHImZBK/2Q786N49xA/7NHPnQRG6SWzZjDA/o45KEiLPajXIlTNDwPM9rw1Yve5rO+JMaI6ildYki4oRcrxV/Yu3AtFxgy5qrqNr+9tYVQpxfZZ34immWwStDZtsQd2JmHx9jb+eSNz14Ns5gK3IJX9L2OaRRKeKCNwDa8Wvdf9cjR3qU7HlZWwrJbRywPzIVb3x49zDlWyLZEcU+eF0+/6N98hjblpc/4LDjDc+O4Ldv+LGoFh+H1QPma3HSLl3YhDpnwPmFIA8OkJIqU0RfHGfoUqVk+zhvmX/F4g+1qO6qUmEPfoRHu2E3JJbrhFCqSamfrZO/ODU21Q2jGHbkhOfZgCNpBM6IbIURA/5LlVJ12AWV78/TOR1+y0y7lXcHkqHTEz7R650NpXSi7C4XsrZAVSCrr9WuAobNfTtxCLuMZ5eygp9mVK0V/D0zRQPYZMyIXO3fuARN8t1OHbQrLESZQenTVFmJ0ceak6Zr0Bzc+lPSHHLNZ1WBOG6MueJ1UO5nGdFIUBHpCUX4ajoRA777HH3OgURJESbuNt+1cEZ7IMwv0lF9kdKhjaTcmYDg4MNoOTEZHyGx0eG1MYosg5fRTWANM8o6PcqyJ63GHpbJKzBGqz5ulJLpzQ2Y0YihTRM88TdzaOGOJ3KfITtk5ttrb+sQzdvyPEpTW9o0RM0A8U8P/WFIUvoowteArBE/hK2WIC0Zu4ky5j+p075NpTWvMqnxDe6CxRZKrynx/Dt3D79EWqQsn3OUg8kM3hI8vaUopEuQqxEUbtuJqygk85ARKxv2eEtXIGZ2Eq4nBklQ1WaqCT2SeJ5ZKks7km8kiFUNOAPnCB9M9ytkbSx+sH0FnbyJ9VPJYTpc04htmd6vMsoKriftLXBijJWiLT9edrY09V4UsiEnbIzAGfhNQov/JuUTAGvg93yy/W/z1SFKR7a1zw9fH+o+ulvdGaHz8gcpTK6gryf2LXfZGZLDQBRMRVaf++he2N5KoEHQ4a6ehpbLiKqh4kK3JBs9c2Ll1e/vVMt+msI9ENk1jh9kmkNiis0ie+Jhk5NINCEKdOL3zldyLUgQZxntZrI0CoZosOnKAsMC3XLCh5IppdOZ0FTaPb4ZvTu0cucF3XUUnWKAjbviAFgZAxTWdVQWa+kV3DStIUbrKuswsH3N742uYKYZZxFibsN7BWuY0yYoR1KgdY5bLgONAa6X6nPNSkfP6DbksStV65CejRjWjErVKzMdjNQxBNDgOPoy7KyQz7qwNrr+inDi1MlbYXa/pKytUqd5FKcDQRRdyTaax0ELOe5Lo0FXIADDy4etN0P+MgIVb2lSwkVQ8jqiHgAVcumvtUk2YjLMyShmY04+1+guMfatjZV/w/KjhrWeFYX9k4Ea9kw+zyxgydPrxgBZliiwlYEp26IKlmmJ6pXFEl5T/UGCwmpOfbicQlXPyEyQgxYUP6RLx45vW/LdUHH5NBqHXlHz+/JYOoADbtwk/5Cy7+OqB7vEx7yJZ6C2+e9jePNe7dK7PsTG1NMLSymkUzbMYLeGw+Ira3S2wsEjBYAABnsrQhKez1Wt38Rzm+V2khWk1G0VSJLOJ/nQGI1ePboLb3aPIB7ykoNtHlg/u9pEzMsrlY5RXMqe5mwnMFSmzx54n64fsDOyzR70T3/Ue36FDM+9BlhKGE3NJ8VLJIb/KkPa7TlHq91yqoGdgtEQf0u0vXS9C5zygAsBffbT9mkKJ2KoJeJHQ4zORkTdBREqpF+yLQgIBL8/jboWdVp5hnPPpj3uPNlkjMRA6wlj5F5bAVjImtX3Yq+XtjS2RtUwXtx0ZZqVMKpwRk2wYLCyG3h9iqO/c/mzn2kO20vVJMtKNTuOeJaC24EtqSbZL+2H1fqLikmcAC/bD7PbkB8y2O5lmVaVI2VhPFA9TRhS97ZIDfctTSSf5kjUz7xQYq+ISiRYdl/6Zgjg1eXc1wGFCJ/86noVRdND6HRiwwcOV3uNX5SBOhcMpk1q5RZh4+J/OoSiflgrCEp9IJsbGxuDFJVrzbfITh+ZpyyvrgCPl+WaQU+E9/I7DqqNmxhft5EPLexhx88KJgfPh1NcwH3BAWApQlA/XuvthYkR342GFy79K8DqrN1ntbqWu85Ln1TGLO1WSrdkMkyeWUzfB6pqccdWb4CCcKgHnU+YJPjz9QNyHQyyDVOcEvfZll8wjZYODZJ2zNVDKyeIVI8MMg6ikxkvq2xR3GMvhj6+qfZ2KwvWQCYtrz/pLX3B7Tj17qpRcqaNcUxM7RUo6sEA1ygFSpvpEXflayvSTqiankVQV0XCj/x0lwLsI04UP9WPe39rFxZiWMNVA81aVgRPfLC9RxC1YFOr21sXeiaecTpHKRTuhasf3E7p2ga31liaVk2Sq4mFGf5uWKqRyDVkSLCZKuGFZoSozZJVTCeDtjYvkaMAPaEJhblCMCDYfuOvdgqP/DG5gRpppPkYSRjhpII0FjTVN03RCpn2+z4iLrBXlvxuz29er3dVyWdDhowvbL86NX2I4BFcGdBcjHV9sagr6Af4DFvpUGk1NeRitqb/6xWhRUHQrILFCncsWuxY1gz4Gc53rmmGpmmlMvk3GmjP2cGKGfmIKSdAwqTYa5aHwSHUCSPoI5oPEFhhRzApVGXHqGGwp5GjxolPK6LRDbkeE4jPECS2kJKtDM3FIQCwOa9DhUUUFoiIpf66rmlHFwFjkSHwXO3VQZ2F1d9pYWpdRSJbuzKfB5kPVNDMCzZby9xgFhvSGAXUBjwKZ3VS7HblUVwkwvfFgZ2mVHSaiWsxHZzWMgewEFhGRBJkz3uuSuAeI+9eOsmc4eg98SGd89LSeu9fTLNGeAhW7wFEZ7uxh+Gap9+oKHz/k4TRor5iupgrYvfNGpl3IxSNj6aESo+lVGKDwPRhAyEE9I7hE2RibKLYdx1duTgeqFgni453rx1ktklDKwyilrkVZUM2jakC60UMzVhBOHdP82643H/cv3rWrBCp2rNwxYumei+riSu06GPrDKuaH34qYx6mD19uBpFqvYoSkK8FoGBF6OxUjuzRCEyXL2zUAZSXLKWEU3aDdFQS6XRyCnao3kd5d7ph2hWnQe/6V1AyYxmEzK71G2TkPx+SzoSJe4UKzUS93DnubScAiNWhYEivsYYnt1I5Jh3p8dXBr7/F16anwRZGQjrEGvCEVznBsCZhxRVCOK0BirgyJ2XJIMjc+jMNKaJJBswbfwuSXXFOai/agbeTlYEcqLFdEci/vrskROSuX429wO+qJOfQjMBBb7mEzrrqWeV+lbZ/lIurEWVhBFxbXONIF1viu1NQybakFwJMzRZSBhAhG7Bq+ytNd/t030oNFNM+XU2bnMADYic7gEUwp1o6ueOSD8ekm4HggHrGRJRNY4RtFY2Z7Y0mZCaMJzIzzkni8EBhzA0AeiqNmcxfvxMdYgWXpHX70LlxjThpgvRQjrOTsTOw4IUTjA5GYDUDxIYxU1QAG/I0xEr+9WfEYOW+M4OOjfZJTIGCpU3IJI2RmEE2YOX/Nh/HId4nnINFVVqamQj1N58wFz1QoKXRT5abHnQoXyQ3WT+ZWJ2+rkYY21OWWSJuaBnREq2IybL++JzpT1J7TU6qhWDmxZlKl5FSIKA/WFezwlKpykKdwtPiYiu5hSopARXVJrIo8ZUEqUtQXn76wEynH4k1lmxNqTjKpTLTVc06cmVQIOTkiT5r8YOHhiQ23ullCsGiQJa3L2S07Xbu8aGWtyWO6JGRR8WrSdcBrwE1VmfA803V+6twcN9lprYCt/DsK+EDzHXrs78aT8DUOw2blXynYg5cSroZ/KJ29v3q4/eoCxnksfgyro2TVi0H+O4zvII8jacSVZd3FvFdLXox6pKtN/aUz6WEG0VlyiPmVJuyMU8xEW+cMNt1NnNQLtlHe3ni2c/1Cb/OT3p0lPlWfluNm3TsjOp42h0Fip/J8RGOtUnscAYgOyXQCd2nnxXHykezU+ITAwxG/YpBfwHDefdYaO7bmLTZsIilviW2zh4uv+tfuki98kXYKd4aN4CDA2uHoQXapEXcI7ID7174bRTV2BdG9bwMjsEo1WQ9JtJt0sZ3/fnZx54VsMtJ5PHGXjTiiEEipFmtYC+udvEYXH5yMYjrQSGcGpw3rSWCWkRXWWGXMULf4BSa9awd6TdVdtbx5lCTz9AvcCTx/SFIFAzhy9hLL8EM1cBdY9MOhIPLOhBiKSpR8wUC8UFvjOJKpLq53nyaYq90uGCt8n+NiBIcrq/0z5yxAkFO6UXjgTIakciFqUJnH0DrbLpe/gN4hh1K0vVkXMXFigp0vNcq31VzJlWuwULFtuk4/Dcujf2nRQgzU7wtzxPBlx4hB310OyCk3sisrdLJL5Mrq9klDYpPQ4aBzqJ6YdTBtovPx4uiBq3yW5+02MITg1EnbbSBdNe20lEnCwa/Oa4lwgb+iBGtQPgjxpxCarVbuquT13l2cD+TEs3/9xvaLs3pJxfYD303pWzFpd3m/+y2+WNN7LbeD+CErw1E7mx2DSrpf4koWSPJfIs8oep/V/sYJqbqJbgs0aCUoPUjD9/ogjPF4F+RinLW0XEeDxS6IWXWVX7yIZ5J3lnoXTuv71sC6gAUzbW9Np40BH1B2nJ+xa4W60AMdg2uPYIV6K/hBhvQk/tD1lxcOadDT2xvrnBhYBgAvA7Mfgdr8FlOMg8PcPU1PiKAMaDoxMrh3WbanaValagdcpU2I046V4zI4ESQKMoZQIhdR1knheeVEzoSIHZ5VvF9evEhy7aRmXiciZYi/efwopns1D2sCUERbUsORy5g8a2DChXLYkHd/wlFDdnmCUUMW0Y60mEhRxuvHAdsliWHSqRbdrVZEsQV7KHxf249qYT4bVu07onp9vVtWuhYDziu+tNY9Fegprf1U1qi2KimYfdSLqhYLEMQV56wu0SMlDVIS+r5Y3lciO3HsJMI+wlTlwI8j8UYE0d5SqCSCSiJkT/nhCw9/qes65zVuC9wtb28dlhehLUBbfbbyxGWMK9a7VWKLQ5aFrIiJBX6y/0bp76LDE/YJAJV1l0s+Oaiezt4tbQeghT9wyHf0h1Ld3F12AciRBHpH7alfeeY/7A+hU/B8uYBdAuc+osujjPxpJYuNy8DWP/OaM9mwsQWb52nMYyPFdmAL0IDF6vLYKDofNHrALlU2ILLDL7BHcO52RgC9++JGwiknMZlbx+UJpf9g4JpkbFo6h2mnL76QNGEZHQiPpMWpFp1KKS1OEeO+eLwYHmyTC7yWLkay4gye3e4vLvkpcRpVmP1jRea4JT8pThO2GFW8CZckDhiTnon/8taHftroh8ege3qPXlhKh3ZM0V70SpbZgRrQTMH2HgLu2PeSRBDrBip8l/GKLDHjN1WGuyt4bLVLRl8dWayTblloWFngWyytWhYafAUYDXqLCVlvqH3L8Ou90fiQeDnH7J38sXBZK+Sl8nZWyJBTqhsMRMcEAfyCkwdDZr83GJbpxgbD0ln4g1ECngg6grgLnLAt+fdqnRn0tFFcCu2v8+X4FrnQbdE53dm13sbD/pOPAB9PVpKoEcxKLZZaZyEMCFqrzNHojk6Y8mT5lFyQpF/lvgOZS7pr33eaTJgi+86PsDw7bHKMz43SvJgwKQRpS5Pa0IVI4L1GJ+NNi+fL4DEvBcE1hyB6NvA79NclP2Elm5HoTH0ZFj7q8JDZCExo1Jsu483xtPHbKrUScn4SnooLu8WBinC2tnCbyNj9L+6KcDcprAJdZ511s3Wx9a8JvfejSb0Jufugvt+C/zFX4fu9TThpbL11MWGEJW2XDu2uS8Hm7n/G1PmpzZxJmW2ood9NyGmDBD/j1QHt/p+RRDb8V255NH8N/y3P/kF4+B+looW/2C13DZJNTQHrZNcg71O/9DwVMO6wKNCyl9t8Tn2KhUS3Fiy+/aujqLu3LnJ8+0JbSdA5uJPRnSfAGIpk+jXkUHG5VLBVCK5Fkd5oOACrX4XZlgUTBSkXYFUYtTEMju0LAmXYStAuOIAmbAt0uYBtwfWO2eQiuC2qCrx0pH9NajcQkm9nKZKaWuy13FQs305RRktWCvPqWynUhFkUiu8ZKT7wBNARxMlwzkZRwN10jt+Ar3VcM5L4DFBH603AqpX2SjYJv4At5vEWdsEewRwzSThNMeNP6nSzRgzfrBGeISq0Rjq9hDoBcQRuMlbJEmFux0H9tSBckdtZmR/twpEpUB5+MjpkPfkYanQcdNwnjPmuAx6ODXepFZ/Z0kCPjbIDUhuDOiwTNMo4VhrekaEtj+tvuZZyqQ9LUCMwPsYEgF3MAk++7SHdfMlWEjt705igeQ+atESz60i857L70VaEz9XeL3Kw9zjYjPphgz+hnpiN+qSEdUL2M5qof7w/qt3tz/LGIwre/qz69Z+DP8EZXUpS94tdFb2QT02Zep6awjea+sUvvDrFMCDiqk1e5PHbK42A3TmHF6/svPiYnToX8jyqQDNJRV20kTJwTp4IE/ogBlCm1mqLmcX9hkWUVcDOnDaPcbTA1jBpy7QWrzs5/Oqk4rQwr54yAf3NtMaJoYUHxRKWDErtjaqVIT0cvL2yMFK9+c5jy8Hc7qT0MFk1+EEPv6tSlJQBjNAjkXh9/OiSQDdDOd2mAmndTTqHu7LUJ/+kcCFshVyXVD9qc0S5J5lHxC8Zz8ezcrCPBdw73aeNgNNV91eODc4/G5zHAFB6KtQP0hx9zg5CyS9JH9XomInQPS90LePBKFaX1UNjAOmvPtm5fY27GEeroTWymVbzXAtUCcgAHKmWyuanNX1lVIAd0gq8urrtkXFeOWbjjDlzW1Jf9GkbBg3Dt7XzFSpzSIZgtGKGOWrtjxxJJev3euKx0L+9au3n2nyI3pGuTDjRMiVT6LNW2tTGO6xTlkKu2HxZqs83/fY+XxqevWxNZvy8fdI27WcHYsT2sExu+iwvGn8YVtGljt/0aYeK9frZzRdvDS8tW/OgX1shSER57e6T2L23QmUekiGUaKUbmDrRtYLd760yYwGWjLWf0iDJiPujzeSZUDOVPW+j7I9wjKXyIu17ahO990rtUgIOv2nM8igVb7vrGF7pRl3wPCzDKFH7tPbuTUxkXsOw9IJ8hPiymzNJrtNe+snR/tcP+l9QR1bjzgwI2GbELlpPlbouftUCKJlJfBSFIGLXL/i09EsR1XLMSBHOmSjobrWCd0sUfbN4fPjxyuDFGzpAa1GygCiiVFg+HfXHXMfJAEAwakpxFuZaAJqe09Wfkh7ixY98wy686k/Gi1eGF87YiJDGmCcH4ZAVBjmTd0pgmY9lGGVqUziibCZX+c2aB9CnokvLqu+Ais9Xeqav9tJWoqneW9mYujiAstB/nGjfR7CbUC+J4T2EcEkAOwk6QX6K7HQSb295Z/960mk/2aRyyZMqE2WKyZPvu/i9hbrPMrUlqutqr1XFK8pfAfvPf537k6742p38H0btaOzyd4udci4y6Pr+42flAJ52zNSuRttu8fX45PTUz/0AHV8vkQbmqbDz9DhfIsNuIwxSjqiBZzv1MLDa454i2pVU/XSFVj2H82kshl1EZoMvV0klxt1V6u1LSzBjdk5c4NmLj5rtWxVKi5NULA/HIBy9T6qSsBWHPgMwLw4J5dlNGrsoAatJgzPjVuhCPYF0bzKlUEWYRDNY0qcimhCWaXcNr+99q2t4/rizrmGqt+r1iDs/TIE8InLVhA7QwRmMDyBy1yHIFMf40ljNr4xvppdLRtidy8PXXzo7LGq1xBLDqPIYiZUZxTIkdE5oM8bg6pKjFuNI6XU+kFaDdToTR9PsMIPJYmYwmxl27ZOTvfUvezcpJXMaYimUUX0Iy92pZURRixShpFuenDR6rcxGZJgLWhxaGlQ1XSYFcZG+PTpv0/LJyeGT8zwtC7Q0ZWqQo2oRe6HAhkRhTwZkGAogfBh9kVnCKvT1kZ1hEwvYKxODJ08HF88wEylm7xQmDnfXQ7c1JQBHbHRCZM/r9quR6FLAJNiYY4Diwi8v9e6gM3o1TvKwbkthJvQbCvemEgJbCFnF9kB4R1YlvUKGx8dP+s/OsfdymsnET+R5m/b8dT9imfRKLeMbJ1m1+zSvyKtySUgMFRZ/8bNPeiceszbBR6tZbht/I7Uh1l8OCORj2P6nk6VuQwg7AlSa3S1KZV2XLWHvwhIq0GMr/eVNEQ1Znmv5ozjPGmEaHvb2RYJZRvSBHIT0kgOR2QdiMmp52wR2vfK5Aq278+K4sQRypdmpdqRZJlcTkb9lZSyD8IlFODCBioZqOM3pcsNamFAiobdHoZ+PUpT3ctUVceyfO9P/5jqIYS7lSE8HUbXT5lTNYb3TqEaJQ0r9BlSYG5rhjCNILyWgV+sgfMSQRs1zn5xF313G3PnUTagUrj4Y3LugG7uKEPF+tkPSS4dOATMfz0BK5LrFFYBktwAYs8Z2U9Cecv6e2vT99GFZd+2tuXyt5auZ/ZSMp2B8jcDx34lqhMGTF55GcNqgJL/3Et6+4H4fmfteYtMTevuIPCfufqh48uXIAaSIL0G8Fb//ere1/v3Wob9m9l0xbrVMsL9jemasdDIiAmDJABfkkgGujfxLqQTfbka4sTT1F96BdLWWzZlWospQuPOYDvALOecsD85sbr+8BB/wVWbxcbWI6YudBCPSCIoPYAQiQuizyNpmJ1eb4yoWkbrapDyZ2Oc7Jy737p3sL2GEEz5m6Q5ya7lJOZj3pZTjkCx3Z0RcxliO566SHYp37zDl1urkqYR1Y65U1LH2xOXtrRu902v95Zf9lY/7tx6xcDUcTbNePjhyf5zcxDiyh6lnaYoqJnRei6s+37pNXm8xGu6Uz21ydrpYNDbQeGwhwsGoHW0imTsK6MOskcasMbqrFKjwFNX0TYoTP/PNYOv24JszVGwBHxb9WgsL1/sejPJhx1EMJ8cJwJAcTG3d5nMFWADzAdE71CyVWu6UxHASe8aZItSi3G0L4raZpA5AGVN6YKVMb7TWPMjbOAlsZJiIfFc6hyS7JD8iA8Ffsl0e17ytVXeCl9XidlgJJNgwiN9d5Bp6V3t3yac3brSzrGmpiflptWn0j2JhkdXw9n7Fn+VgyvROPrbJbSShQ3MlL9OsaeUz8cygGD3XfPzMnWvS41Gi5TOFdgTsPYBKMHqJlIZg5k6eVZIkzs0nShVHQxm1Y7pSR/qk4k0mm0al0WEaNRrnvGuWOT5B45Wu66n3yR1aTKTtw8P0kC3lGfnqCaH11ojYAQAbEITRi5k5/2aGIgKjepxPS+wY9yOllb1fSB+euTI8R6K4ZoHVXO/GhZCVcOTGCPO/p+hjjUHAeWm6fHp95+7D4atHxuAsWFi1oD2dyZxReGGTiq42R4/DSyIIT8NVBPFpOB3gcdq1w6lQNzui9asSQ25ABuHoJU9357AbK3jLcOKxPDsXAsDadQdAp23IAdGl5QP5g3MAJLuGjR9Ug9q/B1d+rPh8hfS91JGnir6vFvlPkP27Se0y5AjaBCHu5PFkaaySuCRKS3LUxKcnOE1s/ghizsmkSRJJpNF7i6KxVT9hyfsrvbTGvRVua2HPlSDr8OAP0yobP7quxZXo16OWM7ENXP9b6eyaGB8xneshJsD7Ncap48uUYtT/fFcTmqkqU1NEVJv6c2dJwxTqFJHl84PRbeM7NewM78SbwdH7fHzWDBtmyHafNsMZd6qlKJmPYeRC6272whkTaPUYx7BpZ4hPF/T4RGz5/jebsA9iQx7TCnecc0mSxJ1DTG72vOCVsQzGMEbINWlEXg9RMzIz3c0q17PGSXjy3OAqX/nUI3xEeFAKd7xO35ma6RyR97yaRVHSfTry7pQRCtjlXFBJnFlb7Rh2fa7TiTYTSqYRAr1GoOe1p+XQmRuTA+wt1813LsMuVbuZDp+1m+30Wvt45FyBd7oM4J8qGKGdABV2aLqyoA0Pbi5yq1izRtvEj9ocn2LJJh6elkflqVCrvFa7W6CiXV5KkKLawtNP5b1gK2xNEMVh152KoNRMqFQegRkcYZJVs0ZVZwuqo9VZCqA9pMund/Zm78S53vN7vIIcjQ2p/uDyWMovo5A+mk9ZQtFphRUWMy1nkPKByeDpJ8OblP101p1lggRqmxmKVHq9wWS+5wGRO6eLWT1TZQg9vjxoy0lEiQl8ht+7acEwSxL0QlZIFQw8wVs/5BTc83P956dYxzXDKAc2qrHb4WH0jo0rw3Ae/hKOf9mjeMaVQ01DB2qBxG1M6Av/hFyRM8OzOLB9+Cj21srw00dcNpLT3enjLcsKS4Te/ci7q2256ln6gigzeCKzKxJy39KLmvDwYblt6i4XYAHzDe1q/+x9UqeHnfcLP1ii4svO3ehC90m3hqDY8u5WBSV+xtESFRxQOg1bXuk/OcM56/NOxSkFdDHQX3RFezgaVM5A/i0gAXp3bgYyCqqTpFHtrnfI0SXT2kscvSxWZP+bF/3PLm5vnKHT23i+5s4z+Gt3xWV0cmDcSwdDC0tYPwJjGWgyPJ+u/AiMOSzd4raywu6f0J2ackxwGH3/yZ2BOt+1OrJ1YoIStdIyiT4sQ09PJFaBDWwDSV4EFFUNot65s8hB1HmUpnFNEieHdHWTuOzJDLA3raOT4+57WTPB1DF+sxgO/ZbDWIC8d+F0b5F9Q9JOommjD8MURUrMx6UMCJoHYwhKXiaV3SWFgIdYPGQahFuZF6msiq9BlVVB6E3PUp1WYSTtLMBcr5UYGYHcF6uMs0uWATHz9jDyzMD7AdbY+xhSzhKaYAeZDfS9zJb9jY/3sht+uHY3TbmXelWNfNCHWYf6mu/A6tO0nK+i9tFPqpuchtlDu9i/I/pgb61Slvwj8vDAwtCX0T8Aw8SpScOJslDk4PvKsO8hcn6ocJiUVbmB10p/Zxna4mg6+t+je1zsrEO4QOL/QxkdoMHflLa7x04MH3218+UX0Hp505vEhF7Lsn/AfW8SRv9UKh2527aX6GpTU0A4DVtfoGtO/Vlp54t5G9JIFO4auq++u0gFze+d6R//gmP5EiztbTvXuIoX4c5J1mGwnlWQkWttwrNrbUUNRzAtG46Bclouh+qScjGiJuVSxIWmu8wlgLh5YD61hp3PLJex8/n1wdXgk04MR4DfHq0ZXO/VFQ8ojejYOiqEVNO48bfRBBEOs5wggpH9BBEEXk4PYW2Ugjjlp+KDEAT3tKbOwLxDBbf0bhGdqTgdbs6JNHqXruGLPH8yPPX18CEtjwSam06gCYocniU9Z9h5VC03J/Uc7G383On8LpZBXTvKiyGVLteE6pG0QiGeQSZb0LUGlVHwXgRmjAv63H71Se+rj/hFsM6lRn/y3MFUo/NcIR3RY4LPmpg4z2tSQkoxqze9iQtTfX0N3mIcs4Q3yjzHFWa2aV9eoHxIb28eDlxHSeD28vPtzdP9Ixe5r7wRl/hC5r3orjOf2QTex6eUP5XKkCUsWUUxFrXLePpLIlIqb12RVHUu4n39TP/sk97r0xbdtpDjphIzLWiImywbix5VVMecFyrHDCoYC6USjgaNWt+OzAlfvvE8MCnHUw1LU1ovTpoA0Sh/vqQsEMQnLDPznzDO2lJ7lMXgfUfZkOxIvuCgPw/AGwVvCH6rEhHTeDEHLczEJbmcdHbYhNB54MiyXXyRKO8p6YV9dFNJh4wI+/1JPXHuiard6HSMRaYenMJ7vhkd4HkRGD/C2v1RFtd7dI3j+4fMxR8wESeklUDGfz8ed0rv8zNafwD9j+WoU/mjvF855FT+xrOo5Er/1z/fJcyUSDhFFrA79dc/d2ZY98sYGoUdb4PS+aVa752STmHRJUm/3r91d7B0DosucZGPjMkWmpwAEBcB/YDZ+yxI0oOWFTlDVTU9Q+po//glM6QcahlS7iCjWhyE2a9pA4Bp1jhfIm0jj1/a3njBhVhDfAwrkOrnEGuQ+hB8a35xmi4+Yz++q//0k/6xp3agReTs2ctAnomIK74lJqKHZa/GUPZqbSx4ByresxEZwbcR+ZdsBLGu5RmMOy7PoJC+lzojaFli/saWDyV0eXu/CHj3TeUyMbHLkVu9s8tcNBNTjWCZp1LyDIKw6lP8ddRGhFGYJewRE/HIMYD3TUSGH00hZphqIVLuKiqcE8gbid2jXZJo5zgDCHtm6yT+18vTQUV4Am7V8msAIJYctmQdHj7Yg/NY7yv3zbaNreHDO4Y6Ecyl6oA9bzVUy0ozNjhYVbuSsYGhSd/6HTSeo4OY9BN0pH7GMIdfwi0j+kjjmcK4tylnAEM/TSXVOe1O3i1Rtd9ZT25vb5yDVTK8/jEMs5+mw+9zyyfAE9tL1eE1Uu50BZdOlyR3E9BKyTqaGCaBP7tJIv9QhVQVE8eewv+wTDFJChizeWaUlF5cCXg4JVKPZuXItChPCcrfIbxxkTKaDZa+A6fCjzoTpAEvdUfq5ZE68DRQGEncQcwhr6TtPBRvKGR4QywvRFCo84jQdVnGInE/EEefyVJc2NUKIw1gFZm1yNbgo83hvY+cwvC0hZPznpowDSGSXP8pC96S2DVx6wRtWch68tCTgCb19D1NwP140uZHEQE/4krcvydsjRT/1VsnP3wG/5BZNykBGPxhUvovbIDSf82+vf/7kfQg/Dd505HcIPw30aqlVKZ/tZulRjSc9IvKC/+VM9WaUT2cSygDZ8j+6pi9lLwjNtZ3Tl2kFLydWlBL+G57Bp4O5WmVRrD7qZAXmoNAx0ErfwJIgxsP+2srCpZHlQo58oTNrG6UDJdEFQ11qVJ3vL3CuRq58NPSqeHSR2xVYDw1Ow/NKE3eYSqGSuMwDxhRDvLnDWhw8RwDRRxKR5mJwzSO8oDgxJE8R2+nADoyySo5nbt312IqdrOC92V0GHbrOwDrbdyi1MPT6s7CpFxyhEGKrBXnchNiiJh9PpqWSoVYsZ4rSmEjEmywdbX/yWloZHiLCpRUo+npKLCGaN4zcIAVS6bZYOjg10omEb8U9dBpSJDF4NzLwdHHHGcxnWTzQS2sBPUYoQ5nOZ62VdSMiZpZETNM2l3L6b2p8vrWFqAIfZTTwkUqVPhYWVNClbtbCWq7GjnDFblUiH6KL7hJoSuUefbk2d6J54OLaxx7XQkWarVIEtt3lF5Oa/IwwYT9Zaj1GS2QA1D9z49yDRKCouc5HyPRiSAHq6SKsCAwOfoblR8dlMI8Hd48RfUGZ4toNkwL3QC2KPMc3qOZjMnSKMXQI4SjOy2aobce8kVMCoZPJ2vCQ3M8SPy0gYnbWVhlJ9KQw0hQTSQUJo9YxzcG56l2eRWrr0WzPKMynE5KIlMdPgcMxndmDYwDOawFJwFlePPmcOkznKMEE6ArJAcxdZ8QcSrJBLIUllA+zYWyp9VCpmnZoWzPWoPtyUr/2TdcEgGebLTw0FJoiclRGPXtwy/Efpx3nzb5NPzBAsW6akE1rhj55uTw4WNohqfqQp7Bw4E2JRWLPDD8s14zYplzTArXSETPk8qmPMcvh9cv0q58IQrQzbDNF49KMSNzJAlBppJYwz/+gdwX0bEq4a0O5oekQ97rF/vnzsBmp7f+Bd9Wofs+0v6aLkDpk6JY1fsI/fLp6Awn5UzIoVF2eM8uYwtcU5AGsXDStP/J7d65U3iitnEEszuce9g7domtliQIMU02bINyLqD4NKJag9QQTbwkdN7kJDKQF/Z7LNCBn7ro3MP+t88F8f87cg7+F3CCzoyJCFdDuCJZSinP3073mxxWN90TfnSmd+Iq2Xc4bnGlQpknspko9Wmot7Nq0V1p4eUVckaoEhi32UZpOIPxVw2X0wKAh2c/6j970buDe8yFNAWZm0dSwCjsVIvwdyQ4qDFZ9THeV+bq1ox+Oqh+qaLFnc2dl8vDI1hxsYVpZiNcupIvApUIFnsMwYbM2xr5MNddCXIU3gkzGmPxRYm9QgY/Prm9iUWimqCMZzNSHWE1akOXVmKaVgxtWm8Oy9wE3S8TdiRqWohb/9HNwWss+ZFkIKtbUURNoFctUYSpReLUMWUmQZHR2dRyRFtUP5PcjtcebG+eG7y+03uIJiiBBS6dCAEgsCbaLwqUKmyy0MiSUEGbhcd3cP7rwbE7XJm4FUDvmy80Fkey1ByIMDZJ/siiiVEEgogxkqA8O2DksKMDEG907rYVpxptMjhzk6NN5jOsABlTeYIQ04Po84SQxnNoo5Qm6RYl7sf2z2BU/bQYE0Az0nwtznOesRmsH0LA3oU+LbhPh9/e5CPUrAGSOidTMo84vBiJsNaz3vQjgDjPcHH27molEDgpzj48dh5ApeRzNawQMFdXFCytFtKpwyzEEIAPYwpWLp/G0xZ7MQnYvZtLqG4tmJDlaqosSHZOne8/fgZN7jx5CeKEK6tyDqI0DsDCnAbREs2St7hksQCrKTiM+++mSwyTd+qU/xiXlUjx7VcPWH7X43k2MmCEweo7rOlVory7FmL9GnYM2WrzKSF6UFDZsZuvB58/3tlA6TofxTA2ILeLn9ZyxsrDGRQcuBAQQTqmE7Y+EPORcLgOF0gQugrf+KK/tNr7hF1VZqtRqwYri8BARoJuRmcdxtUroqhVYFxFHTMEkG2C3iaHqGgW3vjhNHr+fLh5tr9Eka6Z5M0v4mCB+o7qnKMxxasjhylO9WnDujudapOvdZujXt8etdw/g/P3OfdPG/jStZrRWqWnmRiQABDmKdjj1fFpQIB4bQTs1j1dQoMPLfQunx+cu8aKBNuppWFQz2o65Mwp4vsDzpXZP9BWubgqnivmpEWuDY5huQmEabsLqIR6l5LrTHZHCiWFD2wjWJTuUNUK3DgwJ/5OgR0vqAQMaeOlj4ZLS2zV68agbG+rBc/GtZnVk+xp7lnPiGbbWaxesXhls+gZpGyHigVKG0PP6uTLO9rGkpk5ZmJ6VqEm7yBTEDU9mYIlK7BkUzk7TYKp1XKaYDI5O0kMG1GEYM6wFixZRs5skaExNQe2ghgKam94doFpcNPZdJZXsgN0+nLokNPIpo7LmthTlzIq5MNF+rGkGp3ioYzOYgVTzYzY1Ixs8vZUKqISPOnN4p8lv4p9J5q5Z1Eecw13fO4JThoUBLjFErkHEqYouNizijoWcmXJZstbpAILBF6lsjAFrrQIeQHy6iOw8oJzUd/NOP3bsYoqm/MYIvF3pUqLZ9Z6Z1dHnHiU2pVU/Plufjv4aDj1l94dUdKpdtcrnarcdkhdmDWqF+Bfeexce7Zz42rvsbvQiZJqjIR862E4eudhP2TjsD6eh6Qut0qpHuy4Q2nHebWI1G3nAZniWNYgRRcB47L38E7vxIPe2c8dl9V4elpunXBosMaYK6zngLNxWB/PIQmTCqU8ar0YZRCjbK50vOuw7Zc3BltfuTujNGqCmstarZCZC9ux6zyrbUMnLwAjWRy2vtq5fXyEWsMNYud3C3v+p6iZvN5yfGy5ioMFziIstcDdE1czpLLeEZSMJ6NW0Dy7sr1xwyeWHhFqS2vORSn0ghBvkLhr3WBd2oDONWYWUjDtM5lPSh43y2g+kkF4xC61Hz2emGDDDpX+QAXRJjXsWFk831s87QanKgRyoyff7DpPvmc+mKH49Hp9J1+9Cb2C53fMz9v7h0e7Zvjt8d7zu65rckohI6PEX7w5TFiZj2QQjlhHib+p7kkz1ENtKTXQXab0HMuomb+h4M0/XqA95KNbg6vfDt+c2jlyg2ILs0YrWGDfxWy6u6YIJcisBGgoRq/h0gqgJaVBGn6g64ivlcnBOT4snLmZ/OK7nY8eovq7+q11FZJH0lMRbRiso/hrVoI1GCFVrvhZlwAganaqYEFJ5MoypXzh8+hp8UQEmP6np7ZfvNKsaUKirn38zb9lph+yMiDsX+sGNnx010dyd8H83biLZqiGBi/2zaZuLayjBjcf7qxserObCWRyV6MF/GaTm/+YlbGEL0YSvgRG2RKcxPMQ6OA5rle2jQ+YKATSdlkPH4Jk5F0WniZHnL81aKsLJ4MkJc8D+skOrNhTnnDKIGUEM5bjRKPru5sN8hP3nAROP+89vO3lvuOn1Xc9KUXX298Ex+gdpQpnebbMxHvzoIQjLGQHYEGftYRfMZYYJJkZ6qymWulP/QTM2y+fgVDzgoBmwaTINH9I1H0iCJZExEN1niEVjnv1VOGz7ZfXbT4aKkt+B2va0KF+P1Yzh6kLEDCreJxkcua9mMzGmMRj1BWwwKtpZ9p6dIU0d13c2SWL2sef7dw81VvURFywahLUValkwYjom5ctxoP1QQ3KB5HpZihe5RYF+b6sZQqqPeiDZgfkzEBU/0xjanAZA4w7oCML52dz6w1sPzxzJRNTBXZPM9rzjBH6CEaqRNIvSKVr8Hu2HI21nB2gZaLaNfZHDd6DGsq+kTxqyB7QjPVM2JLFub+9Kbam3DGLjSjVMdEznTZ/YCH2PjnpGYnOQPTtuX2sOWfJleyu/awuz+IqmUiWYiHl5GP9x8+Gn35tFpKzjkp2zN5WjG/BWGrg7te1NIOuzXPNY7mLtWGWRtkoEIVZI5OAMi5/CdaAZwr4ZoCvtUs629S109Weni4p071VqadGfbWzl9JxOm+UAjUdi4iHt3dWXvsUkUfhaRIcthuJTuXt11+CZPYEcklljOoLX7SbTC8TZ2ViX+BKnjtcRiDakOfnd0GyeWLNE7ZjQvFA1JlPTfJkL2kiMuzAD0f08Oh5A2b8q4T5H/Co0gTH348dP3zTOYz8/yNWI6EIFnqbdKTGK5cP3N646GSMfzoB3fyvwZ8EJHT+Z6ng6y5nFDguU1MspKZ+5Q4q8JB9LTerIkbnqkbV28GtL/Yeb3nqOunkoiuSOth/qqYFxkEYrVFpxta6MxvDpMOuDZQXISVJklCnkKvAjBq0O6fOQz/0P7nOBm0zy/KiCNkIY2daQqJj+wnAKrwJk+U2YI0CORRdxN17eOkoJR9xhdFVHTuWDh+9Hp79iL1K0wzkcRIUsQu6ogsarVpvUJKivFGV5T1YPQc4DiEaARCdiirNP3QgfyG3qX30yfDIMRsiepi9gZlQtSp9yXwMI1YyDX6hL4nXlf5ugzNVYH+47UZv+SN4ER4d7lAalYg/+kDkkTCDbmnk07B1b3Bp3YhEq9NnDbDGnpl2GzG6yy0bFb2N075RgddjYdRWszcTcukGh5f5aAbjAVhNHyH4cTj6wQwZgOd1UOtgHUkNeb+Ce8K1TqkKx9Uveutf+ZsfJNHdTxgzgJfhjH/IyoAG5EHYPkhB1JMaK5R3yJbnfoK3SkfPGobHP/ZPGfJIKHTsDMI6y37JSpCG5aPYABqRDeEP5Q0RoAPy7Idw5kDsuJMOBvNaiF6i5cLsFb0yw+rst97wrVktDzNXgYpvUcM8Dzkphm3uS7Cq3ARuF6wSkNkOtbBa1hULJVXRv3PC9VccNnQgkyS2kzWDMQijNSpL7u2yYYLF2iyJoT9e6FBx9qNVTw71V85jHDHJIcrD6g49GMD6hL8yDwSlBTXO+6SOTkQYqF/0dpMuyLDGMiXpc71w/sTw2HnrBdTFeMutHcH02hUK50MZhk+tHSLPS3aiCFOmoJZrJBlXR5HCzxbHO9ja6L1ctvT+8DhWMpWrJEc/I15t/EsmUExvlJoFp+WS4IB1kXoz4t2i1xGDB1ddkEokx2Kwg09M8ik1UzKJPCzvS09bOYP3bCubDvN6dx3z9By0QY9E6/jELXQwlJiVRQybxLtxv+WdKye8Y9KqtX+YSaVtAcp8GKN3lMyHkKpUSHNaMXqVdLNC7mSlHugvPRg+fOz3A7rlRO0slc4gDO8eSTCzEUQfygfRU2VBMXk1F2vnUG50d8yz+VWJEz3fqcSJO3+ak4ysRMpcsHEF1MgFGVdELc0T+a5pHckG3cMCVetzzELc3z4U29C35tgmZEvQLDjPenNG114ml5lbxtReBpIaR2XDYR+zwbdh3pewRGdmwb5GQckgGFGP+yrHssr+HtSmVmWaodrbX+k5heerqd2VlCoo0yZ76RLRI77U30/mO3nvRPNEwaxC2RNxImRQFdRFyFy+zZJOxerY0744LIlCT3ztLbxMcPkS5mDyxZMtTjaIZGB5IA+rFJgUipBksN8OkjBG165/Gt14p+8WW3jx/29gEX8I87ZUtLR35ejg6ur25jJO43ICyzhptTq/D5Isa1R/XypFvps7AJMUU1NEU0z98ud+GfJ2ms3B1jDuyJ3pMl53LXcWcOZgEho6Qlu62T/+pnfnxvDhhpz25VE9jEh7Z7yRLMK4SNEjtlHtmKsMhuVk+DvJHMxIRyWIKCHE0uPe6VPstbSQEJxDcSkFZyK8fu8Aj53IGKSKfnjBpMrmZm/j/PbLGyzfoUfmA1gK8xQqguXuUa4GCxIrp5ijEZAOuhwCyeh+CCQ1MBoBaZjqYyYR+3nU+V80T1MuoywxbaKWXi0PvzqKMW3EOYaKgZxixjNGFH8g6YdodJQ8jYtjZEqOeJT7Ud8Xoh0X3actutCzsu4uJDPurkpxXo7F3N7YIhmftfJOi835PMrxLe0eGAc5wVPAWlzVKjlg79FB4xZH8Kz3j1/i0u4LiT5KzwqWX9QdhoR+G63oPhYsykWoR4NFsfMsZ0YexbjB0PAKH3cy5ijgBDQvTFQA96rsrYNdLu6NbdBEogbGIkXXCNdFivrtTGDdCjIL6yVkH3E8YrTIDJyCxyb1tl/ym1twYaLYiMaRMZCLDy0BTwYdRRyHKwWI0i8UgfB9+rpg+IZ2tIynx7Tij/BbnhqfelAORcNFeeR+3AkhTdh8cG2MMFqaCGOzQGG00nsTg0U45g5lE+xZnUwanH7iBFI0BxL+t3yETj0mAMQH0ZdEmgkzJ8hkHe4SIgoKImINIRL45qyIs43/v7Xra47iOOJfZYuH4FcTP/ktIa5UqhKeqErlIXW1p11JW9m7xbt3AuFyFUYxIDB/EkgwFonBAoIwCAwYpDOCh3OKL6I70LdI/7p7emb3TkDFfrLR7XT3/Ovumen+9WN5nViIyxmzDToGpSSR+UxPSfMEz6JnCjnQnUZf3rxA/+5DnsFMfi2swTtQly9+Pr3y1p3+5snVLf5z7j1ba3US1tTtA9sEk4tz2vDVVmO4kJqjF4o5dUFNcblSNrYT2Z/cHy4O/yeh3igQr79rv+oZoPobr5LfRL+AzvtjrS78bmmg3LDVkuXVakH41gfe8zoaH6Lj7nBNYQxxDd914e2j0yuvl7YkvB3uOr6scH8tjfQII/8ADGg/naDi1Laj5GI5hRjt/d8ZuUVFzcvTheG9ikx9J4toRHUDgCDtSKBNIImE/COcSIno6Pz97Y2z25vnRiel1Go708a9StH0+G/8p6zSWN2QCXc+TaI6Ez6a6rmbvBnjNP7yvhzAA07V3l5W46NDY1wiwZu5JhEfnhHXLBgOSn3odWzG/746unU84BHNBvSJepQ1xioaLrMCXWSyNPKzDgVu+4ebRHF04ZZAwBlFMru9OlHdOEnhcD4wlZwHLQKLG0VTiVxoms3LgjB+GElAHuWD2xvIB/+rcEHqeMPiOO+T54mMtdZbX/7WnBpuOFzterwOlmGzHeqzpS3MvemzvbjGMoWWpOQrGqhDUliyvBumIFWeB8kITZIJ3S0vWeCyB7KpijTZREuybF5NMpGabI5YKJ3aZ5OOSU0SqnlUUJxOxEnZRJs52VShsWymdQPR9J9NqTQeUqXS+8UmiZrPdDRdyGNJOziCYE95+N8Yn8Jwp+1FDk5gvwfDLcOSVZE1Q5YcNiSaS6Y6Thi0Fdc3tjcFlpQ8BKVDWyKq0/JzNjlltemanKvaMmI6NRLStD4r0sQ8HN5uxPxAnW0wE+E0sGEJeUp7dZAWVW34CfCjH7TcxcVhRetGs6HsaTyb+t6p5qbGnKIuG0qyph5DzVgn1SAUEgko+PZep0wMP47BOQAB2s4zSvT7n7j137RFa9tz+t5sbKPJNRPuGVtj0790mBeNdf1u6/H/XEvTvJukmAJtAVHeA2DlHOQ40PBs+MfRja8hW8Ox4Z9o7n5FXk033l8r6L2rU0ONyKehCW+1SNzWL4MUkyTrDAdR3JEoH7nIHV5H9N3w4Tyte/gT480X46310bEr4weXBJgZn0fUlDUT9byDihpCRHN/QbXQ+6mAKp796T+aH6+ENzYkRZ4JRoslowE4qot6L9XJ+iX0QpUtCBT38PYMFzxG+iighmRfjb8/s/PNX7E9b27J1uqRF5OWxSwwHLj+TdaDj81v3y6DzZGVyAIhbMRCGq4IV0DDivT24jI9hLupuKewxBcPI6uQC+VsrO18y+FFwXfzc9m8VJysN52gx9FcQOG5yD7F4BaRa9CyUq++lStfjn90JK3v7sd87dozXKYHl0Y31gSUqSQScXrYENx4jj2CW8eCmR0Rax80dk9uQTQzbisr35FC4oN1AXz1eGf1nKSAWxQAA5YH9TlCAp1+RAuILeOiUBEcUlXLOyu3iR5RFbUsVOOIYbYaxN2FX9zN8jaSuiWRhok856ywWXswbadZ114Q9XsRA6k3xvu5cEXLkKM0d/w66UK/a0HIA/j8/cSlKQz+Nr76vTy0Jv3CBZa30cBV1Ohye+HO7ZU9twX7Sloy5GrpKoeDhJMgXdDu/rjC7y47K3c4j69rYRgLQX/5a2GH731v7wg7bhd0Vxrb6C70Nf6XJkwmiJFDYovkyhb6uQUpyed+hv20atowGoZjK619gjDgQwq7FsfygPVGtCaAah251XNQEDf+M3p+SugmKC4WXIsz3NQCsLlU+xRJN2biw+u96iMjzqVrZUd15YxFtEen1mlTbP+AhMtFpqwnHqVqAMm5Vm3hHE3c5XARtS8fjW5gQrp9Nx/4zupJog4egJRMEmHPOOPi9dXkIUnGVx6T7+dF6oKyigTSJo8kK9v4Ac6prq9fLd0zZd0rTFWXBWcs154QcKGgAjKsFQ2/Enh+SlurCNLahChQASaYwpXcNR6deCqNk5yBDMRMDO/hez9RaO44s7sECnq6w6yfeCpHOybiJoaJeBFY17yjrsPHvhxpB2WQr3PQkxFh68TrLyQHMDxafo4otC5W9lTi0MIq3tQYdTa30l/NO4a/v/nC2VRvTuvmzqljtXanb9atXd3SNc3S241S3SB5MyLwEs67aPoVzn40dP+bTUeg2RUtZUHcu4ZKN33sdbHqUVGhTvGq2jUNOE1bOmXnNdcUNWdKyisopz1EW6j2MfXgNMOb9IJsXH3UzmOJ3S5lfwmYzLzbWLYpwu3QFQ0r22F0/++6HdxO8JvgLVvAVuik34sp3K/glnFFe7Vb7J+IYr77MSgfrNVDEBa1MOU8Pqj7onaJt2+3KGU6BLdaKmJrX/BuigGeyWZJ/QlSFQNeVXLkYmecjqFHGfXDYkgGJ+CHP3k0evCdXGQBkpC0LyDRSG0Bl5EBDFK8fkYlrVYEWtkRQv+A1+QFBuma4IbkPa43skh2qhuyfH3/5mhwaef4qksMIbmTvF+Qile2dC6MHU+U+kzb7vJ8pl8w2EkJbPMs1gPPQ65ilCVy2agZBa8ur7w6vkl2UPIK0rzXY5SkXknOeNFzOB2qKWdwXwW6OdInI5f1zxDxzMwfyMBNtJ7jA2B4ZsJ2VjjwKGaS8sI0ciZiZ7ZccEsAgiePlmU6F5E5pm+LhA+vXJyJi9e/vMAAXIlC7V5LnP1yubJ0ah3f/Wb0z6s7dGxefwIXgOwZ5812MrJIwPKI8NzZr/pR2i1gZPiBG6xIYsYqLVPYqzztW90SSEeDbGfLNAkEkidvPvtCKzN7GgW9PMkYP8SPc1rulXOoZ4VRtvcbtiplzPtKh1rTku7RuugrMJbdEOxcfjy+/IQm1+4JSoAi9WYRJ94BoFebvKeOOVRqcIyBm4aY7Ijg+1Ty0/B6iYd0l30O5gqcc9vJ4eZ9eW1n9evtrSuj5TVbZShOEkEUkaQtL//m1gk3lcJWmTzRlfGh/kyBw5o+RMv1K/KGMOqJgUvzeXD0Yml85nNGbz6rT2OAoj+sI86vEyHqcoO2x192P6BiSZXNMBKN3Bl6zhyCIPe+zHbn6jF9QXcskxQxtN0aKw0/8LeIstZKOmnMVPGsm2akAuIQjVTrtdK9F/QF9qyM9IYCNxovnr7617HtwQAvCMvHXq+vyX2FpEXxkqbl5KhL6M4Upl6FuT/1eJGrDvPi4CFSZBBkBblsFiG2roH9s69G60vuYdI485SLC+j+FC71Kj1K/nY1vAYMH9rDTmVrFcEcIy0KJrhbc5sAEnx2mgafVI6+EvA24MMQrXsADWH+GZaz7QYhnQFWYVRmZdlnuEw/BlkC9RPJsxffjerbl5PErzp3Wcn8ZeUF77ICaCmv8L29XVJ2HO+iLN2razdUqyhsxe87rvf83kYe1NFG/+XpbefkWeu16VpA9wCXTiBRRNV6uq6fQDvxf1er1WCJLT4XmC1jOl55LCaLvUDGT2SeYrO4NsH1kHposMo4AWZSN/MjfEBcZ1rZ55LJ0R0vPxgvXwxHF7pj+tjChcxJnvrgepYMveYLWBjTeiULYejqWWDtCENcC7nqFsYKJLvDR0mZ+qjHCu+nPXRRraWt5+GmgGR5e1mf0yertHTFeNq0MrqrEsSe9svYza77NVzGJgOKJNUtFoQAwOoRqbhQN1skwujzxyjd4CwX7QejperbYOX17+FuLjkaUxTI7sabmf7320RUnKyzlY5EspjlJNtNym174874/nk1oQh2EAsyabO5rhjwWsyOBLIE/Z8iiXU/ZO8Nt3F1HQ8Y+X6L78K+5u4dt7dIeC+7d571+JT+w4Xozc9lnV0GoOrPNZzSn+yx1DsOBtbtaWdU8VLrvm/o7IaetZLUIuzwKp1DKW4kpCjZt2Bv0XDoy8zVdNOO8EDSduazi3RjMHi97vI60A3mZr6WWx5t3s18dcSA9nBqZDS2N86QH1P3o0RgblTzFULfwHwC5w2ELkDNzkqUKTDpcNwcPfvH6MKGnI7td/s0tE2S5T8bMaDdywsi8NKt0bkvtrdeiEpue0vjFkKpb07+/kiK0m0PzmiZSinv5b7UZkQkc1HUP65wwfnPno2XkM68WHQ5LsjpwobmUXXHmkZ0GykWvnSw302DBLuVQcax/l6d+o4P3ow557ZcsKzDBWDTzjByWW5rdVqJ+ior9sPBZTK/nYJGjobvkY7tz7+80IhF0d+UWQONXH6rAHB4kEHJs9/X6tfvCkmOhq0WN+wJNHmWt97X86wR+BDYcr04r7pxebCX9+NZWLFPqUvDOyI/3p8W4/xQhWD3Dz7ccyRNaGw/qffw0z1AyNm4F367r/6tdMlx/ij88v3gSycYopi9aLQH/9yIpXbj50fLBgX/140P0YYCkU4/L/Ynsmmqv8wU+a8xjkme9ZHunHbiAz1Epu7DW1e70+d/yUj+gf631drzyf8APb4fYg==";
\ No newline at end of file
+export const w="eNq0fetzE0fW97+iyodn953drU2A3PabLpYs+SrLV556yzWSRtLYI408kmzst56qsAmES7gESEgC2WACAS8xl0ASbAJ8ECn+EUu2/4v3XLp7eiTZkGyeqjhIozm/Pn07l+7Tp//nf/7n//3jjVrdrkxU7OWKXX3jr//zhpmzK7aTC5lOqGK98Y833j/0xl+1h/DkPfEkb5VDZqUBT94+oD3BVw7hA5cfOCY8OKg/QNgDB3xYJHhLIeCP6mX48tYbwKRlefF6xcrlTPgplzXfGbff6TfeTcQP/WXUeH/USI8aEwljIWFkzbEDE+mDY/n0m7ls+q38RHp0OWuOrgDNUl/syEjBmkhPjo8MvzlXqsGzodH+RBz/hvpiAzY8wM/4Tl8sOQ8fk/k3S/Ws2f9OPf9mcSI9k+hLGtWYEbfKMSOWNOKFPijG7Hsrn4vlzb5cLNsXi84k4tHDiXhkCv6mG+Mj4WLBSjcmRxpRYzAVTiaMvtjBA2/G3uoD/JXG5PhSNJIKj/XFasOpcOZQMhqJDIcHwkY0Mp8bMEYTcaAb7Y8X+xMFy8ylY2kobyA5E0lOT0WjkeEUNFHNc+s506vX7Pwbf/2//xca0sSugaYqVprXSrVQ85o9F6q8OJoP2c1rK/B86/Gp9r9+ap8+1rp6G756VilXtwAgZJXqoYqLneE4dtmU4+C//ypRyw34UeHBZ8YJgJg6PYwQonbMGvP08ryDtIAA3K0WJEu7H3+ye/lR+8RzZqnsuh5zYxMaUvus0Fd4ruEgBNFrxD4lkdVMO1dp/rvoWWUrVLawIt9D61ReXCmthJrrc5KV1t0bO/dOtT+4yazULCCzmIq4IRx40JD8uJ7n5tza39x6xfWqITdkema1G765sRBAP/tE8rqsCsAqu/VAISbXuXmrYrl5qjZU+PssQRYrLy8g+u0SMr59+dj258+2b53Zef4lfLVqpgVjQrRE3oQJ5VmFiiXbQ0FSp3aBvrizrGNuPf5AwzQ7EGU3151GreLmRO9QzTfsOfgCdW7dfwAfYB6X6xXbrVZN2UeKyOkAIcZeDVMxAyiSFxAvzXUUWzTsLjRkX4hubp/8ANGoj4WAw9avm0I0Ma02/uWjAJoCCqAEIXiQ5M2q7RVDDbde68NqvTxbDDU3bSdkOaHmWj708sISgn30TfvHo1ubx1vPLrdPfApPGk6BGLMWzVIoiX1AOG6xYtUJmb+bOqYC8ukVoc+P7RVqlqc4Aj7c5rVyiFCYG+Tj+AWEIlbyDravz4mP4XPjP6PeU4g49AlK4QQARKdZtZpbD5l1u1GGn38908hTM4cazR9Ajq3NI8qNr1rPTrQuP21deAhfS8UGgBXcUN11CJMASjkA8AHL8IqspoQSVWQgrh9jaRVEWq2hvaxVQCzk/MVRmNwvjqLg2f7wVuvcpyQDF+GFUt1GYHzbLoA4zQWJA+0tUfz2ZjDmh/E0fgSmz5LnOm6epBLM3x/q0PlLNGmvtC9fQ/5rllOxSRjRmyDAaoIuH+CFqd2XZ0uCE4Bo3XzKbCCCzwMD+Syg3m6ulWHsfNu8ZXs56M2qaKRihap2qQQFvbyA4qT9+UbrxkftqycR1rXrVUkgGs2sWzkcDaLRYCDQdzMApnA6QaQ8YRohTZyG01yvYiuWSbLCiFwG4UYwO2futc5/CB9AXVV5ls2bdaG/6jWoNggAz0TCABYLpubqUojRLs4Lcbn1+DFg7l6/zOKSYM0AnhjoLjUasMnoe7BlVWy2miRb8rvGk3iE+maD+cHuO7kGIBqCTixaxgIZaueAJ1GbNS8klMBtkCLrVJ3NTVAAW4//zdVBgrrJNVLUcubK724ATIFo5EIaSQJHCFjPVuqEzQxUn82NEk7Sb++0T90g/eM1KtyiXpfy0QD2JRfDxOvQh65P/xrlu4pc9qhP7r5G8T69YwXmkVTHLy6iaGAlfOmb1idPaO7Vc8IIUK/76o6/v4pYqSd+XdRdTuIgeQgMyHlhuDDO9tXTbLj4aGywSATHDAK+HjuKmtvCyjc30XBr1MTEn0dOwNazQE+eR33e2vy5dfTm9lcfbT1FQVeqO6ZVCnkNF8vIN9Dsa9QDWG62A+vleTAvkTMFt/X04s7mHR8u77pFBWdWrEb2jf/+bzC48547ZTnVsnnEUhb3K+1i3ypWRuz+JqwwX7tsV2HYN+aRbH2BbLbKy/NzpGF/bH94DIzL7Ue3gqarblLq1p9u+SlzjzVHBbgNmHkB62xPywwlsvaS+qgbUa8woTTzybdw9rFvpG0TNED2sz5028O3EzTrQFkG0ixga8BX5fvaAEpVS2WrVCz8f63O+nX781+EcpVaVdd5r6XxlLbT1ZNQTayNhBLSVNDv1BoBIf8qEa+J9w7RvJ9k1IVyh0h9BZkbIBOyLSjJXn5VUdKndfOhJoAcs0w9Jsk08fUK4eULLk3SBKWMki1KqkiBoomSmpmlxRdu6qEQ+IEIlQHn3qpZjWKj7rlVGs6rtvPizgyMieUQFYJl4BqAXMF5Y/vzy8Dh1uOzolRCqNg0hByT4f8rRJz0w4+lmu0UsXnffOcfb8xDdwE/S7jkAsOqjP8yTXl2lpmfffOd2QO4UtRj7cgFAblggXqv2BaZBf9449BB5NpxrKyZA9lOjnGoAYKzhMs+7+FKD3/jZaF3D9Asq5hlFPQVN2vOwdN3DtCohy/8Fq03eVbdXERIWqY6pD+SC04wlipmVi1lvfeW/gxLe0sVj6XIQrAEiYbQiqrnatSCNeINzddGpoZq1nAjaWQSRi5pVIpTOas4NTRv2UMzk+nBIW9gbsScH5i3ykPJWGql31iwKlPp6KgBH5NAu5AdH+u3gCw/Ppbw5kfmkrH4mwmjMJmeTsZm+uDtYmEmHRvJDIxnxyaiIxMDY9nxTKQwMzmajKXDE5kBLxXvC1tluwIPnInM/NwwfB8djBUS0Ui+PxrJpvrCwwljOBWHp8nJ/kRkPBEdW0jik74eq0gwf00QXG4NesIza2wQzaEjBr3V3IT/oUCDeXWeFejJf+58vL775Y3tS7e3nj4nUUD0QG4RdRegECjqodtVhI4bRJQWpCKWhgM8qpte3i6BuW950glp0AyG/4GHg/Jq9+rV9sbzredfo6o14T2ojL1iew2ovlsW0ALHJBwCx0/SoiFMnH5lxtv9+roCEyYWvS4NLJ4DWHdQPCDDYVqxgmxu4ApdQYi27UfX0P0j6QajDmQ9vRfybLNEc8mqqokUQDKlqvEfcYu+FjxzHARUbboIdhg0Z6PgWcJZeHkea4+tYB/BOjXX0EV/iEqrff/R7ndfgmHWuvBJ+5tL2JaCsl5wedkuCCj9B/HV7YBXkBqS6H7xTbBZtoqm3VgA2VG2aqqPwD651ihB7bHbW98db33y+dbjM/C52gCfqhyqN1zpr8+hhiQA6SX7kGYHoALzkQRTPorgS4lFkBmi+eyV0K9iNEL7wZAU6qW1fr59/WHr/rn2qVPscWXRSXdAQ3HLuc0HHTJWamVuOAGsoCSC4I2IBFs1pMpj55mLLhgT8DuP6eYqsXLi5+2T2OalWsPLluour0qSVicqF80KS5h1hEAcAgcEwywAioSQhj6TKaenWradkFlyTFy1Eet9d+bAIFklHYAGBtnURXxk12VD/fysfe8KDrKPP2ht/ND+elX429YS4FRMS6zTmTbjO4wvXSVRnF6YAlUocgGZ3w3MYpp9rouqo6aGK06yl+fFeMVJ9ugy1pff8udvUBc2N1n/IDiqoiPa+N8fkNkT9KpT3ea35VDNZHCrbqFGQxabt5dxCQboBOJPP7RPnmbEqgnzMl8h/nzl23yIupCHF8MQa2Ap4grqGtm8X/1z5583JQIzxHRq7NtecxWsBCSugXJ21VJs83ZOW4htnf2MF2LrlmNz2/NaO2jh5qrU8z0RNUCFFQDSUXpDgDrCYaKzBjMTmupsXkG2T95pn7zYwSGOM7I+QQlVbOTS4xH3+1n1sXio4vqR3DaBcZoL8djwd03at57i8KDWmwfB5bcd9NkiGD9+25liMcrHQTaIXiPWKZXxXiKrSTJSpAnZ3FjW+Nj+5XH7R8FHtlEv1c2stoHjWc0HyhYLggrJSng4qAgnCBJAUJ7BYgMGPo0o5AS9RTWifnzU/vm03Nxacktaq+DScF5jxEfSgBRGAECj7r0OoBkkr23LBO0Y3854pZUhLYxuvf+6Wr9L4+uK+NVqWPsUUJavVJUBNelrsL31l9RdmrKR6opVlVQyvoLRBP2+Yl6JeF8Ev54A9oVvQEjuJyKVeOwlHvYVDkqG/R5KIVKkCNhXAKjJH5ikr5ii/vQMzKh955OcS91esMuFRlAL1SpWPdnpBVdenq+i7zETwiWB5saM7v+2Lh4FD6R19wZyqDu/tTJAhXBdDViO6K7v+2/3dn2Rwp6dFSTZ2fff3tP1rbilHO5psQbI4hofOKFvk8UEGr8h/Fl6CSMc3ublhjqu4jdQW8M0XGSnlPzNiuWQjVXx3BK6nfTQzoESMXF9qYKRGQfpRdOpknkDIqTKhdg1e9FyrDqCHeT1IvGENjOsPLiu5BC/g79aNpGhvVAmBt5n15m+dhCQv27Stj6Y8tJfx8+sZMDR84ARq+Y77Xm36JjUk8AqTg+oDDn5/BUeO1qLvclEspnIQQ9U6H2fN+GmC0641WQJXV66eXgyg381d3657s6vFKzSTCY3PTE9UXczdtGanlh0l52V+VS1MoXvpbzKFDyrp7zqVH4mXViZr43X3OUV/C3TKFoF68hMpmFb8FsZ/i2WC1PpzNL0xOhIIjwH78yZkxl4p5RZyk0ARmXOPJyBz9OA48DnyXB/PAY0+Sy8nx1NhKHYVHQgGUn2RaLRoWQEvg9HhwYi4bF4LDs6Eg6P9ceSkcEo/BuHdwbhtyQ8T/Tw28EC5LGIZk3O9dgou2aTLb2Kiq4ipfK/7rQ2T7XPXOflXq9eZy8mZBUrJs0ZkFZd45pXox2XhrQsrKsM/heKWq2rkrbv32r9sqEXBk63V611zBJRplykbrg4QtAcwWFaAZ2BrgGMKXvFXGQ9cAfXv88uoawGyF/P4ML4izu4Z9G+url9/TLI7e21zfZjsRxfM5dKIi4itFyvirVxUBtzUIywmDyaba/iwTOLZDYGOGhu0LrotYJefuvYzfalZ93lVxper9JBl1RFS1cbGMySZxmRI88WixObM0UuZGf1W3CDCH7Zg8kG0C4vo1c7qFms8xeoCo0R7kCqBAp5bMJSZzUAfvvDL7RqYDlsVIEPTevLChVtK6hDXSwao6CD9iJJ19WKWnW4+5o/5EGur+DQaSyo2mETnrq98/G/W8duszVQyvEAwuYMKVEq5KosTglWspFe0YOSB/vF0flAwb980KNIDpUKVbxGXVZ+UUpMv/fArHK9nE0j28zbbMugAgs118HC+PVMFoq7uMSKa/fbb9oPr7ee3cUlYtct4J77EpHTGOmB1VGIC/1p5Swwq8jl80K0udTcdPSCtj9cb526tv3Pk6osVYzqUF6m1pBZvpN0d6QQaK4WoQVBBBTdgjR7mt8vYM/hoN4++lP7/qXtj2kfe9Gto7AvEmqRalBo1GvCBCcIEFig5Kk3wAxEprEjhBMG5iBwDD3BThjjdXQBAQZUFtuAqExN0qUFYcjYR9DBw41NbNntuw+2P7zRJm+hAsi47UexCM0HuhrmtRyPGAWZgK38t+Ya7cEEMKHZhZlEuNDcu9c/ktAcYWSVeO+GgFnccMPiYzbTVkjXg4YxHavoF4GCLctCjktoHb8Psg2bpJi3vYISaGZzXTMXpDFHaCGcF1mzE1RrbcZVrQ0aBnCKAG+JoDyr6rLRB+DU4jYCcguhRdL81stZQkFI7S3j4UhPkEtD+5fYDju3jm9f+hF8m9bGw6DFUgE1nqtBk9EmXw9zp/lQmQdiKCljRw0nrVytklyoqqRWaHBcaUV0DS7PhV9Ax2IEVMmxqjWxOQueHxWK7h86bp9dhdJa589SY3oeVH3Jshc9k7b5dJA5wqCaMB7OaavkiMU9hoaZBr4V/Z+nBuBvH7sF//n4YibPuy62AOOG0BQDEw1+D7q+LBPBvGZFvmo7Ygi3Hn/Bln7FNuteIxcKGu86odhVxM/Y9KUc7akxGLuDZBVcox1Th7G3/30ZQ1FPn9RKQMaXTC/PW48Mh63uqUJqtARct6rmOO8J16Gx8yC+SZ6i5L53r3X1fvvzeyDhsD8aXqhi2kA2iqBEDhOg7BZErAJh1Ul6mjW76gfOKmybXLqXZ3MieJYKaF29vfN4jTytqmfm5LCpWrzXL0rgCCKEFeNTtDf6cBW73HDEHmOeCmr+QA+2j2IBO+efoueIhrgH/VjoMNebq8JLy+OX6yjkTBybpkIUmgzRSIcRVKfiYqRuuYl2fnO14PJaOpt1uB+Nm960q3kKXeIfcEEgb2XZJfirToYo9Alblv0C1bISiFsWai3CkhkSWrb19Xl06nMNVzVsndxTRuzwN3jf3643smXQAGgy/c3Me2ajSLO/USTdDjMS/fLbuGLU/uYqKPftp3dbx9EqtLKuB+8vwZT5W92xG1mOD/Dq4OvDFLQ9s+yZvu8NXyjKN2vq+JpsYXglW+pWzRXhpUJ0CkiS/Up2gpz1gBM03WnRvvY3KKJBwRLn58goam5w/GoxBMKARidtwtGqxgOwjraentu+8jmundy7B24wFT0PQpOX4nCjI1RwcNPcXYbeXhQBGrjki0YblQnjwWRZ2vyWrSX8XU40WpfH0bDM8wxX4Z+d0spxhO6smBqxGPm+M2g3H2L4icMBMLprskrGTuvMZ+iafIuCoVa3LJyLbr0u5NPDoFfZXBUxMhI1VENTYkH4PkF84fowPrs+jB9wfCRuwD+VIhPcl0UYGjSqwQ6gDQFouIqZ43U/McQbuBOhAo5RXM/jHlk9xFuQONhvPGr/Cxe+d7++hp9PYUMuuSoWEcZ8XkY1heoc0QKTveSWWaxg6NoKl49cLrtVU1iEuB+E2tfnVoXrAHcPPQwgoCClz7afXNh+9tQvF/wTsE8K1AYgnFjaiDJ7L3ru5QMqv0/z+DSfcl/fqsOn0j2pgA/V4TsFvJsul0Z3ZKQLo/ktvX2EoG+guwXdPoHmB3RY5rRYGLTCe9nfAZtbM42Vdb3JyuEnoJZWsLJ8fQM1aJEqS1TYoNLuDBqFHdagMgI7zD9l9XVYWwErSxlXweWbgCml2ziabaPsGWXJKOtFtzA6LQtlTviGhG8/aDpesxeUncAWgqaxA0pV6lJWo0KHanrT13K0Iu2rR6kbhV70VaLUIJrqUBpD6QpfRQQ0A7cUVkEskd+758teKcuJwnF7CVgl+ojKYktOE6FBgaEkGEXdo6xSckKTRN0ruDW3bs1lR0IWCHprsflwqNcKbnNjisKYmhtzMOxSnWu4J9cwhunYz627PwWXces5wv6vkAUGjA1WTFxfy31vr7VcInNnZyVVYfa9fZZzLTsLvDeKtJT5Pi5D8jfQLGAT1NxFGU+EWxjwsCzfpSVLu8a+Bz54Gx/QF45MoqNuNX7QwCXNAz46rWN2HXc77KSNUtqojBrWsDERN+y0kTMnM+lE1Mi+GTeGB2cmJviX6qgxMTU2CP/Ay/Ad3jCzmcHhwcMzMxPJYTM7mZ6eGowVU8Z7ESMzEjeSQ7FILJKKwq/jydFYZGrs7wPGZLwvEu6LRUZGh4di4Whi0JgYNSJ9iyOGDZB90Ug8ESkC7ehQIW6E++ORob4okPRHewcRWeCUltHKEe1Xpg0L3taHKbwAA+BIiL5ZZTx7QE4CTsed51daJ89sP1nffnJr68n37ROf7txFaxvtNI8WR9xyqPanOg1yz1ypgNwNmaIEuanUWTiIrnyw+F/vYPFZWbwqeHf1Sev5MS64s9R6Ddcql7RywdwILZsloUNo8z3v8h4a69x10Pvnl0MvrtDS0vr11tGrW09uts6RSMHFDDAfOKDRqoCsQtfKalR1PCihDC5o8985F1vQRqMdpO0RgS7rweHR7a9vbj0+DYWIalCQNJXjipNEHCmtlddVA9lXnSV1dpQqS+8lKsvvHcTT+8avE3ZKPdhQ3V3CDdbRJYHqiN6QqH5NGqAE0LKVtdlruHUPNEuRymrwMArWQ8MXg0uW0F0NLqOjGqoYbVRxQXpF5Fs9507HbCGdZbtFcEWtebG/7ICaB05IKvFuLU8J0MXI8joFY18sErMvjmKH7H51bufnb4DNrSef62wui0APlmE1jGgRiOAEypfkKKUTRbJBROT+zaeirWlQAvlSSIHzqGT5C0wVhVlW9ptZIgf6kYBVDzJwB6aA8yU44krxbdLKYR5MBxHhgCcqhdffXC1pXbj78Sc7z9FB3Xn+hd+FYJGGKLwatJLJfQjF6aqBo3NUPboHYscQ1CtAeBJJVoAtsLJdI2WjoS7wXG2uo7+DC8DY5mefwBRtf3K09fVXtA0PzrQcHc11pa54oNHQ6xgWwSHxOeswyV7JV3HNNTUWmquqUdVwAFuZRgQ1qhgO5y/DiMDW5F6r2AXVlH/Sh0Mni/5AgK5CM7AoZd/D261jD3sPAmazuSnsT/VrX2+dpCsE7h3uGn968bE8OcFcyWIQOQinAyn+6Dgl8gZ89nSzPDywAaomwKhiDqFy8HPe9JWSL2gD4lWJUyFCdS3w+iT8ElnKRV6XUaJICSFVOQ5g8CfCa5AEpAwTdcqW3ykB/rip+Iq66DOk9nd/luxfm0BN9h7D/9ko67bZpSKLdtrq/4f77c84J5rfB+x09ZOosm6nq99gqvjIyk5/dw87nalmZxVVbvbdve30mm2uWLRCl6+YjZxvq4vHndY6PLbxuWaJy0cK4WDgsW6iM2hPI316amIMbODUMFjd70yPD787NZ4ZnokNxZJGf5Yt8XfGDprvZs3x4empsUzcyJqTw3bK+EvESKfjBtBrZnkqZkTjkXhkIApvjUfjIxGAH41FR8KJaDjXDwXBfzPheCSaCEcjSTDBBxJ9kcmYEY+E4Ul8AH7pFRlg55rrFRv32fK8UoWx+7xsiesbuDJEHuKt061fPth6/MHWk7Ms6yoVu2jxGmLZ9Wg5wsaTWrh8yVi8GnDLKouoc4Ws8DqRdBAhdgR9h1UoOOy2phi3w5qqe2a3VbhSUcC+YShKk3ahX1KnZSjaQ7MMuRDd9yAo3TD8Qxsb8O0yh2H8J83tw/yvNzhNv/+99ib4gK+3aHlZdPXKqhw2YSwn5JeERxXRqmvMc1YB39jFRAdUbOv+g9bzO61nJ5ThW3HdWog5EEpJ5PmoCCEhLNRgucHqcSGqYgwcwJRgukGtIElHsIhaCGDj/iJHEkAhleYarsApbSgq9MGX7cs/bW1AhT5QmpGLxmVlzAlglUirgVGmpGlztZHrxUR3x2lFdcMHYAOWN1qI2H2MLj0F6hVKhtE5OthxwMQPzy7rA0R6EHmLC6UByAYjoLPElgpfldUTPQiqoSmgoOltem4RDOdcFya5DbgQesTvhKu3t8/ep9WzCo8l1EbLIX0EqdnYMX6CY4dMb8FcSVdpwvKWKL9lyOw5XPYeK5raVEMlUHSgzMAg6R4hEkya5dyyLN+iezRtoNe4ebnjVAuTsQNQJYDSmlmKzUawlXU4fQSQxSQru4dpLmT9K+WwUnkBibgXmRwmUr38JiIp639rSWq+vC5NpdcQ/k9FxR82Y39TVV6vJq83lv/DodbLPhfTocs855r+mUQm4A8ELXT5q6ht0ESXP8oRGgiLfmcvE52pyEbncT37zt4mumnj4QazSCld/vHGOxSzK59xFO/bvE2UazjuIp6PtHImBj0f6nhOL1NMNe5HmSDgTUwQ9+ZBGrn1GhlgeMymLix5CkGWZUkXwAfk1fouS348czA3diizYI69NTV5YGwmmV5JLsWM9JszydEj8LecHBntNxYHR5beTRiZweE6/DUyg97cOKah+8sIngB+L2ZMHDCrbm5sMDc2UHEShhuPGAMzyZQDf+XiRHJuajI5f3h6vJTNDPZPTc5PjA6kwsl4Y8DIJ+MFq+qOZUuZwb7ixIGFQ/b0uJVPFoaNcV7mj4wZ42/NTcbHjL+n0bOAR4BQPGQfni5lBw9CsW+lwm+upMLLR/pikcVIo56IgasARVVHU+HKQLjszMxV4kY6ZsDvJfhtCP41B41YJJsbMCKDYSMcNkpD+OtS2gB/I5YG9nplmpMdKdP90LIZnrGV+X527h3dev415/ux6JyL2SiqZD/NdW1wcNybHBlBOIUUgBFHchSKPBuEiYjUYFox0YRu/oCHQL+nkJedR7d2P8CJjyEwGNE2LzemO8ZgJ5j5KiB5Ak4fs7zPWbE9DBGiA44vLuKRoI0lVMVFsnptR+wC7jz9DnMwPFrfeXZcpNxBMjq0VWcImW1GQrqdiDqMBJB2K5PIc111jGAQqW5w44CWe14cVbnfWo+Pbm8+bv1yTSUzyorUPxZ9Vknf3IrIuMMoilQSyePaTCaLz1tuWSsf93/xQNlaWSt+9fv2v77i4iu2SBoGhBVXS3zDODqKIpZkYqQIQhEncMSWPYI2DB1UWQ41fj3D+7effrF78af2pZ8oUgC393My7c+c3wuM4b4+hMr9M6f1A4HQ4TpQgHUNRGUkPHefkcQhyYY7n7NKer66uWCuRkbsBtSxOoB8FLUTDEMsT9tnZpHzGW4U8BQ9rrZiYIWwcLeefNG+dG/340/ZwqVqguO7TCTuol3PWQURPVwUS4YauDycJdE6cYIYckrSoBYq/SyZhRQkfGa19fg73qzLaRnF5kA9KBEjqV2mZTJJoxKIEYnKR0hpBYHhsradjiGYlsza1zrz2c6j77a/+kh6JDDMlyl7CkiGnFkIiXAO/Arf+BDmNbsqk8fcvM3JY6yc7S5C48kzj0wsuwT5wFwHZUplBHN9Hg/ek4Sk4JaT37ZPfQFeEh0vbMC70MIihRHQWg0i5ixGQbhcAE6maiM4Ft0KTjSqBqcytXlWwRVZligRElQwK1nbevJz+9RNZg3eK7iSL0nmc4Xy1i2jf80pOhGqebvOINsnN8inN2siTSmTq6Oc2K8idyBmVcTwChgbwsHfefRj68a/KW7GrlWs6hGw6MUBOaTLmzZYFHJxRYciHHRNSeb/CE5oAGTZsxYlyrJIOyhNFJtUi71My/VVHDe3KRfR3atbz563rzyi9qiaFhlkkgjDjjQQyYZCEawwCHNDEIoTplO8gOVIKfmyakNurRiSyWluPm1f+wWalkcfvCdHjI3R6NpwYRQ6JeuTd9CqdT18VS0z1WuNXMiWptmCCN5ZoMGBMbuNPKfR+/UOSYALD1r3P23d+Grnu6O7V0kHom1Xt3FbaCmEmR1DS26p2+pTjqgoUezA283bBcpJoG3A7zza2Dn1QG3AEwxvwAtMffe9iDlrwJkWm0S8P1TA0SWTJQLLIAW3fvmKp/8yJrVDXildItGboWV3UcPr3M1XojW4jS9kq7aHj9jBLXwfUK21YRwvNIlnNdLUANfK3MBSWH0OTavWTmjxDjpGsKtobegpDa07/gBQg9wCsM6qxNZ59bG0WIMqLWNKbl+eDXC7tXFfcbvcyAaZ9WkVt+JRw518PTDeyiv/SccTvdUz1Zv0J/76xq93OMKOojmf3+2wTnXLtNOS3N+ODNqQAWvvNWw9385Txtk+pplvlvm2lHgdOeTXdyiZHBpSyojyzYzXtn2U3ROgfT0DRRgnAeNhX8tBMxt0rd9D5/v6XtPQr9DPvm4OaFJdiyoFqmlPXXFqSpM1TAkbgPTuh9e2fvlCKkql5JRakgoJQ/pYIbW/+KeukIQu0lSIpjyU3pBKQ+kLTcrvJ+OVfNdErS5llXQVclXJVF/6afJOyTgWbVKcaYJHiBoWL0KqKEmiT3k53cW8wKlOk2KZovnlS93BivRD17oKzDAASgRSq/E005dQQHgsNyKh/0IpUq26pYy+gPL2HgsoRJSl9ROkqc2+vffySaNCKfMxWF8enRaP5HFp/EpJ8ztXMgZT/Y3RRXscE+RX553K/MhCf9QYSw+Mw19tvDbv2tbkEPxSh38Hq5WB+Vp1wLEmU/bk0JCRmksPJIsDuYyRLKUH+uHNjNFfSPXnJhPGoaRc5EgYE8NxM/5uv5Ed6jdS/X0z8HcY8KdiUCq84SSMOduaMIejgBlxYkZmbCwdGc+Ex9ORTHgslohHk5Hw0IhhTiymMcAQuHaHUv3lsbQzP9g/Z0fCpeLQYMoajUffjxux0UQ0Ho1N9hlA2Aff4iPJTDgJkL1WJ2ASNNePCBfTXsHQaz25LcbPfn1PJbetNoR7uWJqqYIkho+gKAWNsNVXfIfBMxc9i7JiC5324mJjmdKlaKpoe/O73esfKW1kSZKAevNxfP0mnrGC+23IQV0nnmumiY2PpN2EOqa5WdCsptap1fbVM8pqImBpNklSaTbZlngkQhMYq8jpToUdQnCt+8c1PjW7icl97khKA/seqA6StSRyKIUWy5zW/XPYJbZIlFxFH8Iz55SsZXJzP0rZmYJapUq385hgC49puhVTcwLxxBYFW3HkOniBd69vPT69c/c+iyjPDSSVzlfMsjjPpvI3S/AAqgLTYQIITFs1K3zOSaZlU875i6M5GgqPWz8/271xnvT3PLzOQ5xUPrevXE/yoVylWRmkE0E5yQpDcFOgpcCGzALG4ebr51vn0IWcx+hZk1POYLCRWsgiKncfIpWbjshUtmR0jDnFPDablkTtxAcqfZpVsCvz7G4Ds+A6+Cs3OemHc75eoFLv+5nKiEL6MXgMM+dLE7e5qtKcnd7kjeKquP3CM4lSNq4k3ZdQ+vyCVN3RYMrEaCS+MHYATEAKuwXZ9UHr8685dYsn0kJX9SsQmLq37KrVTKeIieSWZNFVfWS5Ym1MlqpKVKTUepjYSg0hmXJw3REnMbcvfLhN2aJFYdywNdPPxQWmh0pAvlqVaVavfCH6r04HftlGcVTCO6YSYwbpxAnxK18oGrniiZ/VeietpYZAJCzK2QamBZ0Kmxcz7tzV7aunpZKlqUvWhiB1SA9rWDqMQtDINVIRFVJtrtJKk/t72GhuauZAB95rsCLJ/YRFzVu0bq4tgiqpT+lywYwXUpoy5tIxLhu0k0jA7pn6HS864m/EUzm+BCK3VlmgdbOnQ3FuJMmVKzEEUxLDfT0ItT7LII61hxfIZsGeRoEwCAIaW5wMz4uj1SDcOS+ApX5Wb/rK2NedSmFKEqUjdfW2p3L7P8t1Gzwbr/jnUEBDajpofw3ka58OfbG/tghoCl/g7y3ufVGv5HRPKa1JaE3G7idhfenqC8dXiUYhFpV82+d9Idl8AbWPeJKiyZcl+01fKUWCU/4VFDTZO+blb5uV2ozUp9JrTSRtEnW7XLRE0sCY+zE6pYoH4pxG1syBSdvphoFj3FyP0qHEOlQ3qjtk7Qcf79w70zp7DAec7pYte6bAC/lF6a7ZoT1cM0W4ODurKL3ZQ/tl/sITjVSNKiexogRarteoNwp+Qi6ZPQu8zTpmncGDjSJtNZ6RwxUxuUNdU18P+PmvKPdV19Gw6cGpwbw5NT44lhzMT+WmcmZl0MhOjo1np8YG4df86MhwciCVzEyOzYymkhND0+ODWXwG/42nR4eT6dGRZGwglYH3pxOxoRT8DcDvtVRfIpbq649FI4NGJByPhSMpvK8sEo4OGn3ReBj+Ir1zTwUaA/yTK3TuvkbrM2d3bh1XNcIre/IOpshX50J9Ql7roCZ0ZRIRkp94EB4PceNG4Srme7xNx4O+vNf+6Hn765vtq7S+Lxof9CZuDnADBvqEy5PXBaBoyrpYTIUXfkBGr/LpCdpAuJ2VBbVO3G/d+2bn1j93rt/hsvIWU1caSoADlEwg3GiuoaoX71ANMD0VekF1rQw0edY2WzfWGBxH8Lw4ka4oXWgrkYhLPNPOuPG5J04TQld28DJ1Ua6N4a0dJ8+0ztNJNtMqmTIxiDq5gPmuSiE/N0ituerVu3HpAHtznZZ5EPTGo9aVf6HkzplZiUmkpoYFk0h0br0izn+exRwwsur/3OBKY04UuskJ7/UioefTNaoaFF0ngPsNzWuSMUrwwAlRgC+Mp92QhyJAlNdrnl0QW6UCgQHUYd9KqGzhujeMARnCSQOBwHlTGoZyIMpSBOaduA8Ftn9Y3dr4xo+ypDg9PBZeX66YaL2F6n+qwFBeln4cFEjr7BxL2Pz3olpY52u4RMliG2DzOBcjAo5sQpSHYwDFCZnLYjQ3cIneR2vehnGAjdMDtnXiY2yoIDgzjWe8tULcvFunw7xQVJBhWst3KRWoaJpe/HO7BAsS6DjB66aIQIUCmmtipWNynE5PQXeBeu3KHqQHgvFhcwSWsWBAW8rV0Z6jzN4idQ8d0RPsU3SksMBpj1Fste/cOto6foYOPy8Lq5vIQjLsU7aw3raqvqpRuaLB5qwxHLWl35JlN4tBpOLGwB8auLifZen28vyCRN299OXW4zMg4XZ+/JmBcZsuVBNTjgJeUW8IE6tWs2kU0HDWD18Fh7R/AksNYh5gJrsc1D80cOkQyUKo1mPI/qEjQB8AKNvKIIEcEKFYIewurNEwrnRconRCL+4s+NVBRXDzq/bjY1wVlKKOR6nAxYThKZjk9XFE5akjOxbhG1bor/yhT40MrsaFpVDwKw8WLOvEp+qDqFWSyqOSsAxrcc/UGayamt87Uk22Tl3R1aSvHTVnghRCQH0oxeErjICeMH0ZzhISZTaPHV9O8+5xL5WNklnKThG+rU0dgcqNIFpAnd9a7BJw2rDoHApCCMj4T97NVkNJC/3kUaSOZ1l+4Kdf4J781eh9dSZLePRz+9eIR6cQAeCdVLoHiD4i5EDgIdAjntOa7A7ltBb/jGAdIZz4FNkIxm7iUxQuIOameAPCsgLbDwf3it+0FmnvgQQkfQJGZw/ua+KCYYnXjlUaKjqTUr9aXhGTELOVS+/IsEvMI48jnbbhYZKZRXBrhcGrvftel02bGZseGEsfnsxPD5jwlx1L5ybhHzMzlh8YTvan0rnDAyMptFyHBqcnB8bgL3N4cnxwfGRocDA5PGSMwH+pieT4yOjgyOhQeiw/PQl0U/BseCoVy0eNcBQPTkWWBg20ayPh/r54JDZokGWbiMN/PfcSRJxKuRGyxPJzRR6JB3ebF4H5YqrtT+62bp7cenx6+7MvWQFwxEuF7nGkEyyYpsujsJeGtkLtmJ7rFCiHl9gWpESRmOGpyAEMMhN36+LRrWdXdk492P3hql4EI9BNPz6U3DrE7WeTr3tVYZFgiNFZmKMN2uj7/ln7zHl5hRf1eCA4smMQiKO4YgRIfJIg0BrS9NxZ/QBaRAcFzUXJSrTRI9GV3OdLJLF18mIJhO4Npk1GtPQ4Ydj2ybXtG79sPXmKGvconmyuF+wiXZhpkz9O4y4U4Ji8zRpMArtCKaRkaVoxze8x9am4GY7LaF++uX3pG1nAspkv1T3aPa+5zQfdI11m/7EX/1YzXQxVFjUp0lZ3RW6UPj/b/v46qU43h6dYOB953gaxSSqddgq4VVYamIRBNggPPcEijjVijpiSlUcCU5GXwcbIm17RVEf+b+OQvc19dP86/Ie1ma+Q6l/ESrIEx1vjgI4yYVUEGCCBJQ8SfTUvb64sVvguk/MVP4HHd0fbH+I5bHGIC7e1UN3XxJjCJFtFhelhMiCwUHAg5bVj/t87nAo2xFkV12yVR+DUldax2637T7fvrAuzpWZlOVkWVUCEnIA6L6Oar9lmXmUtqtllumyGynIrfnkvroAov3REHUqzMA3pFXm0vHXu3s7dx6x38K7WJ19yyairBWStoZfuyqdQuDIhUUtlrRyn0Gd3E8/jYPhrQMXt3Dve/uicr+VWbMfEMGMOa8RAAjrk5AO7mL3HlBNHS3mRxelYCyTUuNn+7FsFPe/g8intUzG8a9Xoak8uQG6zszlC96Gh5CBva2fzzs5TDLTNVxpgVqm8gnXHaiziAJatjlqubKMLRVYpGVi/3imJDIDAogzROdu6ehuNXZFawcxphptjNoo2QIZkbmGoKsrmnBm0danPaGA2N2kj4smXMBz55p96qWh7IeWc1a0iFmDK89Uo4GDuSrMQAxwox0JZ99BwaHDPXeNRz14a8IxLBOcvCqumjPkgcr4XZdllwpbc1x2YRViHBtRP7JSKvtL7qbuTknofLbv+iVCe4+DvEBpORzXRZQPDhKT5Lq6XhunCsz7ZMduX8XK8+h4L4PUuFaX0kqaRfF0X0EEiuH9FaZ6dH68FNY+ucgJKwRfTSjYLqazkvRiteTEMuPc5QKZI9q4SA3kpDLve849l6i8HRpeeduBLP+eAP/eVwBGTtPmwEqAVx/S/9Cc40qoDTHmRWizP8yQXEky2Pt5kPmuiQv6bweHvM9fFmSChUWep9yVDGjc4Jmh4dZ9HivU4ipT/M+b0enm+I00APt/aPIFsdxxAypMRu2gndMv1wJ4nj/JkrwJjswf2sVfNsuk4IQw+LNOhI75xwObHNVc+lrkCxGOVJKCD+m1OCMBP6/LpQY24Z0qA/lgqB3/56bGkGcsks9npsf6pyeHx7OGxBZmdKzKGObumJoZHY/GhkcmZzHB/zOw7PB1Lw5OxsfTwZHRoYGJofHQyFhmZSPaFB/rCI4ORfC4J9ioYqrHDiQias2GwZweSmchQ/1gEV2nhezzROwkAWBoge62yuG2PE3yUtUj29cut82dUJDs44BWOZLcwO15FBrITTABC0UoqceiDyRxLEwBFvJKLz31co0sCcE3Hj8vZuff19qUfVVyO45jy3Ad3gn/ww6S7r2Q0PWZcoojFc3dan/4iKdWCG9PKiA4mVedjSQHzhYYuJ4rGVd+ivMz38k/bl27v3P9w5/qd1tOLtOxL4OI4LGZNJXh5+bGA16Jp7ObaEltsOS2iZuvx5vat+yqiRqCCFaOygYlxp4cjQ+tx8I/Wei/P5vUQIG7C9smLWqAvBbR3hABxm+ixyQDeFZscLCYY86tKCkb+cmGBKGWuiBb5W1O9AAYZSWKeXNpKEnerdkyflpGgg9Uaq2iyZVosB/NDLCTpMgATLfQur6NfqM+1wqhzoMs7C8NylH4Q5Yg79XCs1xpYLJVhi9Hlz7PumgnLkuZOoH7UlDWaS2zU+tXDk7K+NJMVbK6FxPSuqfty9Rnul9b+4p6a6KoorXb+eVwpHNWyIqomakWpz5q3lzh0XbSir9ugAbc2TtMAl2d0MYjf9NPocOuJlVAfmQxyQkcDUeCK9KTNDT0dF0x0wN++8nhr84IqBXPYuqFSzrR6leYv5HJp0Gq9hx2ePtTH3M7zL/1WgprUbNkdPQYbJm8G+KiSTQKtE6f2p3pSQ/CFKw0iZM55xRjqPX6E/SnHDhQjRo6myBSv+qDRNYKGrG5a7x4lEpFblcRTX7fY6BBMmlQiW5YHwnLHOC73HMfCNNbGMKPV0LuQ+ooR0dDueVNbmcLiGRIDHmhZ5fyZ1q2Lot2U7vIlY6BSqjKiGr6S6VQBPaSMLl10ua/J/ECxQkV+z/tbl37c+fiRX6z2fpkEuBBt2nxkgcYzkUWZkppKiMlsVs5egr9D4GuiPiguApP5t0qI7gkrF1MkXE9VX5Nd8MfUROvH/2A897KaUSZgYlwYgMM9DGgk+3OoUaKWilKCXHsFR+lQh0XNL7L4w0y5bHp1WNf8Eqh84Csa+i8s1RzWLe239rS0kZSMbazS7Cypodm39lskdswsb09beAE82M0HSX154LnZGDnrYRLnvAyQsLJg5Ti4PoVnA0x1mZjtFS3O7Q6/OGat9yn9XHYsk6k6Y4cnx2cynjM2V8hl8Q/+c7zqWBk/z8OfNVbKW2N23oZ/5udyWbtUxO+l+blCFv5yU6n++MLM5DjgLJjwJdU/ngobC4dnxnPZ9OjhmckpKKmW8apOLjsxCn/paCQ8QOlxw4Ngew8lwktpzI87Yk5P9Q+m+hOpNyPG0oiRDA8NTo4amCi3L45x7ZHwMNAM90XCh1PGYNh4L2PE+VM8GhmLGT1MdVwZrtdMjNBWWWZwKIAOXK2G9FQWO6ufbJ/4Xk844iyZXi7kJ/aAPinSaqCeFqNUAWe7iFnkeaW4agZKoH/XGkdUAVsb11rreL6W0TE7tGeKlEyyAEsAcQmO6/kpf19eojySft7YJ1+17n7Ii4MOvinTO+Xhs78szldm0OUc8JIEwikoEu3LCzoYEufz41N8PYdclSrKdPoOI7iO1aA7JGDehag8oQcxSsDyKLcfLW3M0bo7Cd1Ht9qnLorVo3oo79AJRAtGdaOAoQ54bEWyW+a7Z2h5jy/dpRyVEqp98vTW03OMhtfuEnNZ06MVDHEXg45owuSjq7osvmsRL8k8g7drumAQLYg4tNVP2p/9QGtTWZNvsKnblB+IiBHQqjpuUQacuVUdsYKbwUW6HIFuc718u33hX7R26uZ1LKxttROtZjY8XC+yqCkpPP7FRZDQhEcn1FYv735wRdy04Il7m3Axi9h15PUFJDaIPcfN0liti0skN2mbnTTY+Q93Hl9nQcsp0uZz9jwvFgXlj9DBOH88U2phvpQUGq8utXD79NP26c+lFi4WTS+PC4K8LSqIUSPLwVhrrmFiZBJb+COfqIXasrlE2Fjlj75igwnAOdV6ge2wIt9sU8N7XGp084EoRYY8YSNS6EyVY0LxQi0/aOgIRvcfCeEfK0C8YWttc/eHq+3P77fOP2Zl6NlmqFTDuCC6zIGvRc3xA/xNwYvNTB7BskQBHpK7Cwzb/vkBbTAgHCY+FXtDFC2br7ilTlArh6PBc3OcUZcO+9Jy8Y8/ty+vyb35ULWBKEs88r0qup2+qmA7uluFcJZbstr4Ipk7tIb407etY3RN63M+NCzo5j2T7xhsrnUCcZxt2XPz4o68EgdVorm+Tovc5xcoaRxNikftyz+17n3duv+ATES7nrey6nSbqRDU5TkmLkejmnO1W/aEzJIXktAaMl2zx2lT6H/+BSGbp1on7rcvPWvd/Rr+4wtC8LIdEL3LWTED+Pa95lqHQuUdxXKIj1mKPMxZSq4mds9aN59uPT6D+dTorp1lJw+IdZv3D8sh7WodTNam4yh6pqQEbExIu1YapWe6i9qJnRcXC+pSwd1v/8V3CS47BSX6HXpdif46VYgzSdP9s2t4qdFFIr/zBbAOIDgsi3YptEw7n4LE0dLMeRht5R99z2MQ27LMJ3e5/fixrELZXqr5dUAisZJMopIv9y1WXl5YJgQ6AE7phh8CxtYvuP2ICNg5SzAhllwKUtbJZTaqislXOGEsH1X85SXaTsCgwA1MSU9yb+fEv3Z+ftg6+6T18aYIZcvT+bCGK6ceVNQ2WVjmzJpWYypDrzOjQzmq4oANJagM3DkmEJVHWLHIhjdwYVisuBdLOp4kjp88BBTkDa+ZrJZpLR8orIaQ6WTBcWIfza5jLBXiJCq+lhdTGnua08qDsMAWgBF67BH0N61Fz4XwTJAsq7neaS9yG+dqNktn3pZ0+QTp7pdrreMXcCsFftYEWBHksaffMcYfQ54tdmSgGavYNbwjs/Pzpy061VJpIApdCUgqg6ngiU2c9E7jzEadbmkpA0uaVsqi8s0ofv+HfAitH9r9vA3GjrCcpNUk9+nIdKCxepYMhPYp1JnCxNBNC6nH8Vg033VPJo7N2RV8Ha90Math1sFC9WoKV9OKzKxQh8gsKUKh/oJar1v3KK2DQ0upsICG0bUBjSSMDT7Cw2aX+thXLZ0a5W/wgAWS2Efn+1Tw4N4mnRZYQoVgO75wl0XyHWZS/pHw41vJOkSekHUs5VjESfHmy5SANFGCREgRKTl0maELCiUfpGRQ0kCOmYbYXeZ36UUxa/SZwmOeBAWNw58/5XGthnOvE9M5u9Zcj4M72fyxeSvcFbMPzYPdH4PZXUcrIqP7rltPr8Jw2Hp6cWfzTvBmF9z7y4VBhwH8cmlU91Pf3OtaF6IxZ2cFUXX2zX2yRWMAZM6lU2T/eOMdsa0TcjGjiLbPgweruxzO0oy9YGZGqvBvzcwMe6WZoUrZzAxVK2YmNT02ODU4MAd/8+5MquTO2KmJdOrNYSM7NZjsPzBi5HOD/VZ2MIF/+VylnJlJjR0MG9MZt2Q68OHwWC47GDsMRIcn06nRkWEETzujh6cnJ1KZcfg+Pop/I/g3nM9lpxLggU6kS8UBAz8lYn2RfvgXnNP+QSMRi/Qn+iJ/SRiReNgbxjf6Y5F4r90gz8V9Wkw4lDfztlxpvE35yPIyNZlYdmqd+nbr6dndj8/tPELHarlO74ckBLkLAo3BhCiVD/1sOmCDUxkqpc5twOY8NuptkcrG/y6S2dCDaqMW5Bghxa26cyQJ8gL34tHtzVu7qz9pDFc5G73E6eIVHypebzcoMQXla16lPVia1Ts/ndr65YvW48e7X/9LB9O5pu+Nsh+mbxVs0MNFxxSCDs16MjwxFzRqfkpzd/P51uOr4Dy0zn8iwhWItEAXq9klGPh0n5QLlix2IwN2lCG4V7gd3DO04t4vQOUPEtgqg1Depgjlntw3v8c8ZbcdnfmtX37ZfvBEiKSyXQuwLp8pzn14NURqIXUbmc454l557Le7QJLNLr9Ktss1sdGJI3lZnmK99rM4XFo25albeBOvT3Z+F5k6UPlH93EH4h/byT6SbC6OrcH4dr3qOPxxd5ZD3VVD7H74lCPdtRYJ+cHuKlQHo93FKgbl76O2NcHaQzoWMcvydk4Kt/vqIy6g/cU9HbpmK0h51d0ibhPZJncVYXE4+KpdQdt8hdF2nj5pbTxqi0RSVrFCW2niSLl2Hpa/cJD0midgyN7NydM/W5ubCHXiPB/96YmmMj46eGYgwB2Y4itd7O1+9lxnL48p3gXcsqmYc4uYdiiABwobzOdLRb2qHxxtnbuhYbkBLLX3DZ62S7oYLO0VzklG5jeKewqWevhN+8ojNLvPfcE7Ei7uXth1sTLiWtXQClQP7BMlN/3JS46aj0x4nzGkAiOVK5BY//qcYRig9Fy6ecN8ZRpv4NHXrWyAOQz36+COIwv9xHCcckykpts83rrxlUxNR2iKO4oc9NmDLqiHyhbtSyIChoRdq8izB4CytXFi95/f8tkDylOGmeNpo4lp5c4jpUGjbGh0LHuVDGVSWc+eAQzZIZzojE6+uJTjit7m6MsKhmhhSiMyYZkRsb144xYwwTuMRfDkWI4wgaTHEyeCGE9q8H08Mkke+oaUJI/Ol7CqwRxwirrG8yTXcOW5fTrMhcGLlM+ND3RhQO79T/kwqROynHodYz44MNzyzTANUPQONSw5rAIMOwd62wcTvSPIVO/w3OjFFkGKBWLBGmDSIR/Lc8sB7vB62wBzhKrzplL43fhKjGjEkEwRPfPU0/vzjSWKeCQ7ZffD263NzzRjR/8oDh7XdWNEGSCaqaF/DCgKXUUotaArBE3hS0oTJ4zYD1bKvVOna5+U1lSFFVWo+vlPQGMLSS5V5m/n0H/5N5RF6sIX7mKt9ojfhffPyRSMJMilEBfasGrnKpzwSizSiX6/JYnydKaGhKsSgwGpqmSpFHxC5mliKSDplHxTskiKIV8A6cIH0yOL5UmWPng1GS1PCukjJY/KgVaxOM7Bj21gWeFyLndtigvGaAqqySfnnZob+84KMSF6eZBgDERDdIdU79xbYA1kOL7h5flIRxKurc3TO88+bN+7FHQf0fgYR02gQJX7+P6hPdxHMlhom5OIcrPvH9onk3meLmChc+G0j4kbnKbjiMOzuFN5UF4Jigsh+OQd9YQvbvnHGwfVE6ysOBYOViTdpyVOzwiC3nuf5uGxkdGhqeHynF1NV4YXFuCDNZOuLszZ7oBRymdG8a+yULbhbw4+jhXg5yL+FWbSpczo+IgBfuXQTCY9OhZfShuH8X/To4ZZLFjpHPwyOuQN56YnhnLTk0MDqWT/fCk/2l8zD8PvM/A5Aw5lHN6ZAhR7wMA3BvFvAP9S+JcM98WWYyO4NZo0IuFELJzoi/YbsUjYHTai4cSIAf/GopHUSK99T3GqEINz6xVT5dxEC4Dil1RW5JNndr++vvX0Gu/0cYiUW6BJg6mckFid7iVBrmOSd0G7cwh17MTudyIsgk4g43lhdVZTAqF9UmuIxa1l3oFt/tDg66VpPfTS7a2nz3eef7z7wVe8D1trhJZp+wU+iMFj5+V0rqGPVWuu4XW7lFe7KKa0jrn1+N8wRRVmzcaL3IsN1xMJbmodqFbdxnTcapyqLQe8TJu3FdpffiU2MivSbOc3rVIOaR1FzEu3eTzCruD48LrdXCVhfWNt+8unlLwvH8Qym+uB+eKvYy36faoOqPun0/me1a6j6ZxUzJFdlyXLS5HvPNsAw4sR8DLGOt1uT7aVPz/VhY/NtXrgnkeX00eLqx1P3Jc3OkLfVxvqKkee0r4glTB8dgO4kSc5VjhiFBk6cX+bpGEFWXLAhm/Q5l+ugnkguxH9q6IWQgpW3hRFO2eIyjdFESQg2TUd0r8eCmua12spcbiaDELVFLdMcS19gBo4HWV44LHS4G0xCuPBBNHkGlV5X2xr43Tr3Ok2n63MVyzbK4QqlrXE+iuAw3rDqjc3wbQlzY6HrXDFkAY8rftfvolrhD/fRFoYVvMWH3ipmGUMp1UwYlvcH+BqX1zIB9xAo51xlg/+zjinjhYb45aXdX2TqezAWBF3knPg2fqCWp/94l7r2E+t+zdoQVd7kaWEwsGW77xGVL85VLa7HKLrUhnQSABr0TpCkQm09Q2N8z2q3dZ3/9x6RkdR2ZwM8SSh1+csRV6WmoT0MmWQX+XTKuAmcszaI8yTceLT1r0NNgUYCOPg1JWOLIHVNZAV5QA/vbb1eFPIWqaz6z4Zps92spy6m4xHvCwYg7+Eh7R7/Yvdy3fZPZJvknek6GTeDJGQocYBFOJWAFqIkMGP2B9XTwLW7odPOepRT7hQb7gy/TtlWrDlavcKpRuTO7Fis0kl1KZdJpHe22vU8Fyfn/G81vDvqaAkAPJKmVwIuwkPRBVxEZJOUq7fgA7bvrvauv80mARAwuGQqai76WHg4f8aCxZNRbGSgwsaZNs9frz95BzN+TqdqYHiaa1BzAPOtMK71pyz9+5PnJbDKrscBEIh9Ow8iihPHBg4Hj7+N4wH7BCWAnQiku+v/s/EiFwGMbOg3UIi2vLXM6zexGz3Z+o6T3meHfO4RECy1Z1jckcl/3dMMNY5Nbw2wEE4ZUN88QMP8J0T34vTAyZebVrkmwTUlz3SegUNDpJ1vq2BUk5MXmFkKMPACqjxgPpWitu0xaqbrqp1nYrCdUEJi8uP2le/4fJ89aypUjpJYXnyDgVfkZIOrKEa5cOkSvUJdaVrKaWfpGryNZJURdTdGH5LmXrPwnDhDSebFxbUplqXllCqgcatVAa++GZ5iSJuWWUx2No82zr2kPM+Z02OwBVCVW0t9WjaZXaTqjJjq8j6LgJM6bcCJ/8SQjIoWJQo4YLFDJUyQ8zyS8uEdpaCYPgFefMBFyiMCDYfuOn9CUf/2/4K070VeP1OMMLZjakvqK9pmFZ63P/Ee212za1a3miXw7Sea962A4eudu6d2XpyunuDzUdQ3tF7e3hHWLHZWWgH+B+4RrMVa3ZWw6jOvre3sySMt5BdwtDOQ4dE6iv15ID2hP2gtw5JN78Adgy/xR5WzrNyIVKqgHRQSgVx/RP5S/yAad6mMNIsbv+LVw5pT/idgwdU6XyUq9PHymZGPPirTfcPV+FvITeVns+kwTMaSTiDyWGjHEsY8MwtmYeHZqb7S3Pwbw0obPiSdufzU+l+C/6XLWYSubnS4aG5kjlU6O+bhr+ZHACNJGLjlUx6qi8am/SK2YlkPBbOZSamJkcS4cnRxNthZ7wPaA6DxxTF3/AvBX+Fmel8eXJ0JJWMheGd4WQ8HI2EB2Ox8GA0BS/1OvAlMkRVQizwadizLyWvkIbRD44U3yKNV1sW8P4WMqN9MxxFhqmnnBKpl3rdRE0ZpjRSOTVFYijmgxQKmLfMCt1K6BtKYOUiR+fP+uYShvpRsCKh6AxxqiqeCRqaUlQExIoqD1PBykpVJZEkf35Tla2sAmNlIE4pcygYNRawxmstqsnoYLE+itFomOuAZh/md/QCQ2rdgFqae4EcItxEIS5lgBU4RbjWefU2h1lZeZtXk/N4kr8RUkfVnJDru1VFka8QiNuXj/KRHYw5OkLL3vS23IoqVlxHthQYP8t8XM5fjtt5frX19CKvyHlmAewKm3Zra+6cxS5mvSbCFRhLrrMymtwdBhTeGgYIsXfFCP5dK3jCXljdnCVgoxCSBgtBfLr75UdssJC68EyrQk2rxAtZLRqaYgXhZDirvgH8/NP22Ztqd82quY66foURA1u/BbxGSdwUDl2/IhXwzo9CAePQwUkbErf15PCcv3/hvcKwMEay1uE/E5owf9iRBlA2fzjZm0RX0P6uHAZrLdQsfSC9vNBQdg8Mg9bP34lrpwrYbcp/ylNS8hWbIr2k8pVwpvIeLjRWNDcfsMhAUVgi44WGJazauk3WjcZXAxddNL7OPRR80Xl+n7ES1JDuXvPZEmCKK4LyuQIk5kohMVs+khgbR2wzayrJIC+e+BpzftPVow5f8sn6SV3jg1R4vSnJPa+5JnaNWO1/9BwXCjQxh9FHCkRNd7Ns5/yS2eOVZZ+i09psMUnNJwtHupAqfE9qKpkWOwSAJmdqlgsSItRhcfLutlx/uflctGDNWuL9WmWBMgBY8L4pKjD5jBIF8FLk1ucbgKOBaMSKzOnBCm+yK2a2Hl+VzJhWD2a6eXE0XgiMuQEgDcWnZkcEw0S6WIFpqS1Ltc5cZk5KYFfWOljx+AiCzwkhKj4QidkAFB1CkUo1gCexuxixX1zJaox8ohjB1zvbxKMT2oFG8cT5bmYG0QQzn1zWYTTyPQ7akegKKlOlQjVN55sLmqkQUOhKlSs97qtwIbnBLnX92ckLHkhDSx3BkkibKg3oE90WJsPWs1tCZwq15+spqaFYObFmkkrJVyFCebCu4DDJilQO4i3sLV5ApK3JgCKQojogVoU8ZUEqpKguPnVhJ6Qcizcp23yh5ksmKRPV7DktQiClEPLliHhTyQ8WHprY8Gc3SwgWDWJKy+nsTzs5d3nSirkmXpNTQkwqnk1yHvAc8IeqGPA80uX4lGOz25miuQJezCidxEPHClos1p17uLQCbuQUncLjqYSzIR7Yjnp6d+vpGTyAd/5TmB0Bf0u4SqN48I7iFEUhyvF6dw/HS/pYwt1Cuvzsu/s4W7hsT8sKvMPREAftDvKJurxLP5kyE4Z64pjyEhkMu6Cz+aYMhJRP0H96SyNC2C53ybGmKzNT48OOVZ2eGp8fOlwtWMm+8mAZHo70Rwf6o6ki/JWmxg8nq06ykOzrz8Fffngo3jcxluybGo/Dm4fjQF+ZmxnvG4pPxJJ9scm5manMUHw8OpHsSw/GxiLwvxEAGoWH7nB8sJwejc1HZkYNZ8SwByLhxMRYX6FUHInC59Tw0OGZ5MigkZ0aHZyYLI70Z6IDaYyJTCWyyZ7H7awc7Z2YmI+yx0pQBa81KHLGv+YGiopltTC09fjR7pdnWhuftW5c5V2kgthekWtFiE7dFHLULhQvSapSqTw+8I6HQ2jF+dzuk48oXr2R5xUxDUec8QCtAAx7zUfVrm0aXlJq/tCgnGZqWWnn/NP25Zt0LqlWadT8PRsEB7VQNzs3bgKF+JsePnD78k+dqIpdgejXt4QHjpFZbbuDT2KLJlb7HV+c3X0iXLfKEu4wiYUnRCEQR9/yMPNmseHlaaOPE1UVQjKxB4PTAs1xYJaRJaxilTFNuaRVwyTB9ZDcD2/eVnmGKeP6iSfoX/18l2Q1HqbzOBzVxQ+5kL9TTg8WQpa2BspQdHfgNwzE4q/ajSMy+9rF5kMHL/5RkQxZ3r/0j8TvrN5unzytzsNzClw6DT/nIqmIvFBQrsbQOluEF76B1qHgfvRoWMMzsaPUJW/iBcNi0FsTrnJzvS7jdk7A9GifO6+Oe8kAU8wfx5t7HW5S81qIDkhYaosWo3kdsUV7/bhCYkPbx8FAfblC3MA0034wKZ/kusRr15oPh8e5Pj6ufDiky1UaVckk4eBXPzyScIG/WgBWQekgxJ+EkFcfiL1ZUb2XZ5dCYoW//eVXW09OyU1Ztsp4L1bWikmb1161n8sbyXIf1/fL/pOZ4VP7nhAe8Gt+izNZQFKgJIVgUn1utx8f47XrCsZHUacFoOTCMdbrb6aNCgrkou1W5T16JRa7IGblsaXzZ3EN/sbV1pkTsr55sNlgwhRUrX012Fxr+Gc+/FKoCTXQLrh6B5Ypd8H/5iI9iT88hsETh+ySE1uP1/mWCdEBuPnt/gHUKkC6gmeSMa9fWRMiKAPKvhjZvnVBOP0VN0dXZ/H1yYK40lD35Co4IUgkSBdCgFyIskYF3peciJU2YodHFa9CnD9Lcu24vMaHiCRD/E3jR2L6VdOwegBZ5OgrHLH5KC2WwBFObb+QT3CqzUI8wakSuCAtJp4W/fXHgO2R9Nlp5GrNzapF57z2Ufi6tu/UwrwXIrVvh+rV9W5Q6aqUJzzjA3NdU4Ga0nqVyurUVgEF8wr1IlWLOqyNM863uoQeCWiQgNDXxfIrJbIvjn2J8AphKuXAHyPxOgTR/lIoIIICImRf+aELD32qy3nOc1xNcH96a/MwOAnVBFSzT808EZtatuqBWaImh5gWYkb0vHnT7afUuNZKD+8LoNzmtUDwH6qnUzcDThaUMM4ZTqxx3bd6Zw/fCjkSeU2s+uw7eztVNdvM1RpZ4QO9K9L90aOa69XdmrsoT5HxU7qS8wAfItMo39KeNOrocGlQPTMHjg6nMgOxwf6x0eH+KCYItIZFvsC+gVh8ODU9PjrcN1iMGCPpuPGXiDE2PB57O22kR+LGexFjcHJsNJLsi05FBsb6xmOR4enMRGSoLxyP5IeM3JARDhsiY2BsKBkZHxh9VcZAPKwJowW3M2rglHLCSNpFdulEg8hm56etbZ98xhnt2ArNV+wC5rMTV1qCb1QCKebns5PovK6tAft3rgAiH7mAfiM4f5tWAGqBIyWH83RjBtyGn3Ce/oenq0Way6un8f6Ss09EblWX9h860uNRp+np8Wo2LsN0X9/98gI4PI1fz9Q6suNtP7rePn9VT41XyoFY6LoWWw0YlRyvDL5XDkNiRDInTJziihMkm0f0+0fufgjN07r3RKV2qtt0JJmqpDI8UQHyyglVDwHus68liyLWFajgO4hXcx3lFVQkw81VXCXd42oI2bPXVrRsdKxFsRZXb6tsdFgF6A2qRY/sd1S+uipCq1F3l2iJWlWd9L7ws1cFZ7dKeYfZUjCLDVewd2eI0a91hsp4pzpDpbXSOyMA3BO0A3EPOMG2SFqcb8xhyJ3EpfwzRY6S2aRY2k1aFj611np8t/3gn4CPC3mOVQrNixsP841lM8RCStyLTb3bOWCCg+VzikUU7Sq210g2Ntd+7zDpMUReOT7M4OhQg6N7bATGRY9BIZA2ZXI72n8LadVouOzNaUFNGvMYFo8iUiRexhAnrkN7XSR1zrpzIoWArAwLHxn55Koe6FGoNly6i+Nho5cVKMXkPGU8FJf3SlYghLMqC/1nxm5/c1MIdyWFpUCXo041s2pi1b5K6P02moo2IPfu1N824f/IWfjbamP26lttXvToYZG+U3btnlNBjd3/jaHzJzVyemW4o4JGe+S2Q4I/8+yAcqc7Etrxr1xyZx47/s1z44KHwcA164f2ymGHZLOzwDoZfMj77Nv7Gnx1u4YeUIfNJ592mX3yB93yC0K8FXwYsP/Ew54m4PB4/9Q0/C8zyIbf+MBgYiCeGgaTcDwz2jfo5sHeixsjw6nxWDmbNsD0Sw8lx1OpZHR4Agy/ocHxSHh8ODkUHk5houj+KP4lwNSLReJ9bPL175MkGg/F15hn7j5Opf89isJllZ/mu6No1mye5fw0y3VJggcoGi5FH+RtH0XcHKGQTYn7K28UfXd0l46u5i1L7i36AOoCXby9Q2Cijlm08hqMNL8UHJteBMqw2VC9xqc79a5SZheaeDlLRTAT3CZOCcBqXxb3oxGSboJKJGmF8smOssTSTTjJaMCAY151A46KUMaWxNfsNx24B2gHYm8433yTgHupY70AXSH7xYjcsDjIO+50A4EmyguYa1wBJee6S9gDuwOzy1rjay8Yv1ejK0NN4StDjUeIlOcdjR5A7YHYAdcbK2CkMbfdoPpcEFzp0kbwI5uwYwgEu5/sMTGfAhJL2GOv2+89+nzPDje7ujtQis5soKO7etkHkuYXNZgr0Cgpa6B7O7o22K+kszraMADVAaNj9ADYw2LS5Ns+0k2XbAGxsz+NEjS/gaYSoNmzJ37jtPvDZoTO1f4Veb16vN6I+s86v8eFxqrXe+X0FWR/poH6651Ow0f9LGrcYfuon6V+HQ79F47oQB7fQ3vaQIJ8dlap59lZrNHsoUP75PKtuzkXcyZQpqQDB2l1UT4ja+etg+IKcbqNQYRh83dHBmFXfIhD/ncil5EJeP8XAxzQnzgyVKHilvFCAkyA0piTwQr8kHDef0tnjS6UYzaQB1kkWVgSnOIXBAYW22V6zUyPj/5lxMhPJIxa1ChMDFcLEwvDqdhQBf7c4eSgM5keLKdiA3PwN58e7DdKA/1GqpwxbPhcnUgW4K84Ppo3D2cSRi6GKOOjiSz85UYP5xKGZeYTRv69GDztg7L6ZmKH+43JbL+Rjk2Z/UamWixMj0bfTBgTw8lo0kj0RcNOaXI0nAYgKGWgP76QMqaSC9UR+JiKOdGEMTLUHy8NZIz8gPF2wpgaLhaGBuKJQWMMaEeGBvrHEtHwYGoy0m+MJfrC8CAO//Yy/EwPpqY42ERnruwXF0shPvywc/bi7pNP+QjEsudZWRhwTlYeaELKkH8kAmFMHUQBBKnF7RxIbEq9ZrlZcMYK6nwVuilrmH6vIO9RP77z3XGJU8UMyZIJmHlMqzhRaObrYgmWFJS0PHNujreo8OL6i8vahSV4yvDGfXVhSb1RoZfJvsUPcusMP7sKQBFqJCKtEH70b0wpm2JvjK6jbm7QKv7Fq22KGTWXzapZ5ftRxEdZHFHuS6YRcSXtJXtebAuCrMeDj6UQ3+3SXv1w+5NH259gngp6y5QfRHH02X0dSq4kfZTm55yFIdOmXzJuqyxDK8ktJwBp336we/0yNzH2lrj5xVxhWnkpjIAKACkAn1T0siCWud6tGlikVdXNhBDs59UPVT/jBRPc8piGwpeYASjXR1IIilYY5D61bA8PScUVOeuOxkL7+m1VvieLNzFiXTUA0zIlU8h35WSzVH+bRco3TQW9vEBnqzCDiVbev67unLqginT5ffVJlqke+yCKWL0sBjd9FhW1j5g5DHPmmj5sYGqerH4V0Pmvd85dU8WDpVU1LdIytNP1wPbrLaFcDUkhBGhFMzC1I+cKNr82yxQLMGVU+azBRI/rvc3krqBmKvW+6mW9h228mNySbU9lYkR1oFzKE6YXjfm6l0IyREAqTx1Pw1IYAWqdVtVdKtkc7R2LqxpETvB1WnB6cLT97+/b31BD5uzGHAjYssVhsw91Fa0BigRqOoqEIGK/XYQ65xt08h4mzjIXlShoblZDL6/SWdXzH+18urr95DmtMlcppxHo7iJ99emoPRYbvgwABEVNyWpNzgiPbYHvydlfIT3Ekx/5dl+ezemD8ezFnTMnVY+QxliiQxsmKww64NMIgLk6lsIIUiuFI5RNz/v2UKO+Wp8KXRpUfa+p+HSlp/TVftpKaKrfrGyUungNZSH/8UX7KwS7EuoBMbyPEA4IYF+C9pCfQnb6Em9/eaf+1aTTq2STlEuaVOkpU5Q8+b2TX5uor5imaorKebXfrOIZpc+AV49/OfZ7BQjUG16806PCJn95vhHMKgtN377/KHjctW4ztX8j9l5pgPDNwuzBfdaGpXix8+SH0DFU/oZXH8i0PiuYZKZC9wO+qb6zo0JpfRwYZV5WvHFIf+R7RaqM9wUArkT7b/ZcLp5Jj3jwV3Mmh6sz6QW8ZSSXig5lC1ODzsIkeCvjRi1hDMzNpenf+WJh6u/JWMpOGvZUsgB/xTiT9Kei7mCfMZTqj6bj8+PG4WQsbprpvulkbKavWIhNLjixqeGB6PhA1MoYEzYADSZjEXMmPBqbHDPC6eGBmjc+MlCNZhP9yVjZGZ6fSyWMSj4XHYwVC/B0KJod6sdbUOKR8PRgcmoyNTGeyBjxvvAY8DDa8wCrbiOQNcTTcvfhRxwOlHMXzVCFT5zCu42iKRWzpHX3JZXnWAStPFnjFdCTrFnKH7qWI/PEbt6mkX/uKsze3WNnWJLgq8oPyQlKleFBYmk4CsKn10mlVqraps4AzNEFQXlqg+aR5YAFK9NK2FXTT1IBpPuTSQpplDjWHF7cmhVWCYjM5hoGYukW8M4nH/meDoidarFoceObFSC3iFxaJT6gD6dgdAChA30EIW4wM4YtTWGXY4yuBQziGxd2nn3r28RWtSqsYsyHYyOxZEZiKSQMM6szxvalqz61MFQlvRwPJAJAZs7ZVoFDHzG/4BwmwMWmfXC8tf5t6wpddFIx8Q7HTtsERK9vIiGK9A4QSjTLg+OKXt6/TWQkZjg0seTYi54clcRF5cXRJTUsHxzfefAJD8saWv1iaNCRg5qtJTFRSHQsWAEpDAkg+FD0NVflOMWoTeGlg9ewsSyZ2H7wcPvsSWaigjnxBRMrzXXTXyYgAJ9Y0Qki9b50hUuOnAp4tQxmR6KMNheutm7gYa2c7XhmUU2FOVMvyNyfShCoieBmlT+Km/o50vFkBH76oP3oNJ/uqbhi4DvifTXs+euriMWgl9Sif1HQNx96WVFVvLMGR6oj1PrOqQetY/dZs+OrpD5EnRWp6mL55DWBdAzlizbciu+cg3eGBkxzky6IKQr3vHXmKhozH662r20I0eB6nry31fbcklkxVzQfVWAGEXUgH0K0kg8iRh+ISauquWwcRKtzBRbQ7pOPFEsgV8qNXEMUy+TSXOdvbhBLQejEQjgwgRQNObPAl1CYedOh3JMvjkI7H6X8NNdyfPEd5Sw6fbL9w5cghrcvfUO7AA7mN8416nwBillslHKW4yNV9AKkMFdoCqcbQbSSAzZOEYSPcGpQ89yhsP+XF/BGKmomVAqXvt++dUY62VlBxGsLDZJesuskoKvjKZAAuVxuEADOXgdElWW8l4LWlPPv1Ka/TR8Gddf+mkvXWrqaeZWS0RSMrhE4c40jNcL2gyeaRvC1QUB+7ye8dcH9W2TubxKbmtB7hcjzxd1/Kp50OfIaUkSXINqMf/V8V3P9981Dfc68csb4s6WHL2TTO5Od3hAiAmDAGRLIAWdIFjIZuGh9L4dIsTR7YL+EqF7R38Ch3KfqkSNzn4onHAvTlWbHjEdzg7Hh9EgqMTyQ7M8MziWN+clBcEyceNSeiRuxgblG1IDXUtMT45nBWHJqfrJvyHhn0BiM9QNpfz4eTcDPiWwmHk0bM/1jRiRtxA/PwNuJvsJ7I8Zi0ohNNOB/8DcJX6Ynohn4Gx/PHB5NJSIj8O9YKhFOl6F88Ev6Bo1cbD6dNMrDyf70SKI0PNB/ZBC+DSRHUlnTjM4AfrIfvKXByakkcDaeAbow0vbaT8nl3UWlyOkWYHScCyH8QgGY17ZPbmz9cg4+YGPN4+vSiaAvaiMDkTpQdABFIKQufRbqqdzwpJl2CS8MvlSmbPQ4THePXWjdOt6+ioem8TWV28pTJZfpMphXUorVPNfzlzjFWODV5UtkumMQEczStSJFo+IFlhez8lTJsQtbm1+1Tqy1r/3SXv20/fU91kcKR973FFz39H/sXUQ3soYpl4LX1bBlsZK3czrfcpVnvcpouNBzeoNzQNvCyAEajS1EeD1qn9YRadpq0IZuqWKzkm3eplN6D9GyuUKpZ07+sL15ffuHk3TrG74sTJK8WfNbX4ORfKjVVIYTq2HAkFhX3bzOy2IgM5ZCRO+juogjclDb9V7sKc4kQt7yfE/Krisr3geQjEl6YCVIr2hV8aCibCekeoaJKD6xsSByuPMroiP4i7vH6/J2hJy/AO3m7bqZDYn8BSH75Vm+L/1S6yYdaLFLddctqwtA+G1pBsofhVFKhtaLO1l9lIP11zp+Xw1uRWL6aHIM5U3e6RYD8XyDz2vqK3X3H/nL8vS6xW3g03aA/QagAIzcA62Y4Bn0HlUiI7A/nigvMHWlVbcpNgjpnaw2mNQwCvQO00g7e1HbJVzkBWCe6XI+tT67QZOJDCRzhV5SU3lOfNWE0Hq1Q+wAgOoQhJH7iov6xiIdh7eKtlcQB6e5Henyhjs10YYnL+6cJlGcV7la+OJN//x0AEdseOItSxU8R4N5RbzAcPn8y92bd3ee3lMMzoNRmg/VC64YMxJesImZLTjTtb6bExBBuJkjRRBv5tD6M+fYXakI6nJDGEo5kZZGASkIn17chtNY8fsKamn23FXiAHIAWPvSB6DFYuSA6CrB/aTX5wBI9sxE87oaVP37+sqPFZ+ukH6XOtJU0e/VIv8Lsn8vqR2E7EDrIcR9edxbGktJHBClATmqxKcmOJXY/APEnC+TekkkIY1+syjqmvU9prw+0wNzXJvhai7sOxPEPHz9l2mWde+85O2sFel0Noht4HomsPVCjHd4G0UTsx1HMPUNViaQ9uatPb0OpsrOzhJRfvat/WLUyuac2El5n0O98AHto7z3Nh8vaayY4o13D/lP6JV3DtE6gb1EO+F+SJt6RD7NmwclsIw1YwxOGuq/TdFmXcc445Hw2HgxaUxljOnJzKHJ0tuZqYmxA0N9B8eG+tJvws/pxGhf0lh2Ywb8E0sao+nhgdRgst8eN4b6hhvwxnAmMVTLJOpDg4eSxsKhEQOeeeEBN2q4kfBANRJOleGvks9lElRefzlp2JFwJWnMTR5KFKcnE6WpibgFfwXwh+CtvvzcmPn3ESMLZQDkX0aMAvy6kDTei4lgtbeLk1PW4YnI28XpCevwVBj4iWaMXOLtQ95c9gAw+GYkvLzQb8Si72WMSthID6Qai3312tJ4sj9VdUejRqX8br/x9oCxND7YD3/JXKZYioQL1uJQPgdg7ogBmLHReHgKeJ7o4TaBvGjULJWpG6ZyHQdwSa1xH3u+ffQOLy+XzZLyWpoP5aAQMotRXB1DkQtaPwqBhw/v7to4Yctqjf3hslxeFI5b+4eN3ScfsdeGN7U0/EA4x7EbC0yunDeBF8RSMAqjg1wmHfOKJppBzExzgxZXKLPX7vHT25d4e7po4SuCB0nhbz/Rd6ZmOp9Ie1/awJbTfNhRd8ooCuxyLlHHdlVZddvKaUvtROsKSqYRBHKbjd7//7V9a3MTR9b/V1HlxbNb2tpaLiHZ5J3li2xj+YZtbFc95RpJI2nskcaMJBv5qaeKSxKuIeyGhE1MNpAQEhIwEEiwHSAvxFa+x78s2f4W/3Pry8iyIYGnKgrWaM6ve3q6zzndffp3VEvLpgwXJhs866aZb/5z6/QN1cy0OaOaWe/uqDZuWXfjlSAGsFfdtKBeIS3rTYUbNVXw5vJlLhUzpaoy8U9VHK/yyiIX3C23yl2CDdqivg7+mGGcB5OpSnj4qTyXk6/qIkhiyTSnQlDSLKikLAHtXTq4T1zIqN6Cvsd3c0QVckwNn8b55cb7FxqPv+URZGT0K1UXDEO9XGmFtNFsyQiK6lZ+wBMr5tznBcXNh59sLVNegzmz1g/mpqLnHCiltv9YzI6SInETIDan9hwYQi3vv2zJvksUTHaFf3fRgqGnDeAEBGVJLIgr3HePGW/m8YXm4zPs0BQdN4RqZDwzncfjuPq9MgynNovg2JuhCk/XyqCWHAOqKVMqmKoD/nEqRK0c4Fo1OLq8VfHFja1P75E195guWd0+r/M9kKC1f/jblYpshV77kiQDuCPQW4gUaqo2Mp2lJdmNrV8vw3SHo0m+a57/gXynJROpxzdGpDgYYDc5x/yl1gHAiwnr62nU+AEff0zjC6XV4us3mg/OcRqwsJo2RgHDodQVNaItHEWfw0D2LjkBWnvSGqQVVHWSQqZ+t0p+R6DS2TJPi0wZmj/+0vzXpY3Vc7aLwpXkr/UbhhHUgHErvRyaE8F6DRULwJLh/k36NVTMYKn1jPmgrPdn8RAQsWkxYVDzwc1NFSg8X5V5MgtEpJUsi6ib5dXTHb7O+w2+gZBfgkRG0cVs37zMdDGhWyp5WUmJ4tDWpm/yojDA3rJGTraDvg2KPpLk2cUi8ctzPnwJ4o0PzzYucxxbqeqrhDBL0EVREvlcVQUEzYLRCEo8KipLCUR242A+xhwot2hdoOMvyWNcvc3cdbk5zNSuKlKq1qCvZyMVaYF8IVYUZxc+JXHz9nDytIP3Ct7Y73GkjCfUxg/SPtAfclte7Hz8Lr/h1a27tpR7mVdlkV/2ZrahtuV7afOprZxtol5gn5RtMhZmD+ui/22xB3tblajmb9GHL60MbR39ChhanWpt2FYXih78vTrsD6icV1UO7fKlFHDbtUsz/Hpuzh1tXdDAxjqGA8SbJO4qKLAzsrZx+v2te7e2v/4SSo+ucPgeoWeDoAcXOXzHTdlrHPt2W+MguezMDAjmZmZQrjizb69lDi+DUSCypfoOn3/T12iVgjJIlpBA0wPzBZa6SGsedICu7FXwxnKgrr6z376K0vuFEDsiTBzAZXW5oi4f3G+XL0GqjNY2MHWkrz8zNtyfHZzsifc5g9198b50f99o7+TE4N9G4mlnYjDVn5zoiU+ODw6PdMd7UkOZ4SODh3u7uqeHe+JdI9m+rtGxocGJFPw4MJ4aG54YSAyNd3UMwS0dA6lMdTCe7eqL9/QA1uGu6eTCSHxhKN6dT8XHOzoTicpIHP5MHu4dLY/Egw5cPOnu6OxJ/KU73glf2688IEMYtg45PLfxqMNvl3DpbOvbc833vmQGAN91c2blwHpFsu6gMNjPUSAtYTeEp8NuFKrTgql5FzUoE8AaVEP/yoiK/lUh1oom2IQAvOJL11OlZbcry5nZ7fra4MrhlkZ0WoCfn8xquMbTjy2gkkt7RG5ZRBVhMH9rZdwymFHGLUa2GbcIPMq3pcuIUD/IpfJfHTCcOcVFhgyXZS7pt8sY7MnpLEJmJmt8dBUf5PGDrTPfb62QevKhuJwPRRAVyxz5GRo7dDPR4iRTnn4aOysVP4vOTaUaymKekCZXqapcKYWIIXjMInaBEtRZDwI9xlBFbDz9pHHrFD8I9B3NGcF9B1MFLFISuYiGQYpmq0ghosCsPPQkhtzi2VV4ip2YEbzWyjMbQaAXTa7XiHnz+fJSzDSUMOFcf7yxdrZ54hK3lfXGhZWA616u3zV6sLXuO7uU3ZWikBEsGUUe5mkPuPtLIoFjeNY7LaTIhkLo7rnm+QeNZ2f1mfhaiJN6pK5SB+Nl2GjOCYVqKmcdsOcKKjBWShEcRTWh27alT9j6jfuB1nLc1Tx4tboV23UAt7V+tqYsI4gtGK3M/8F7ti1WpIqx3/uWNZLe/yozVYAFYL0F6xX0KY2IhLFcg3nkfBXWUNU7dIdQ/cCIBbvESlLeAja9e9umiA1pUfYvFrXUuaWqdpNT71h06stLWPcX3Ze4XxTGaxi7r2Vw/Y6mMfV+lb74Ch2xDU8XVvzITrYKep4/0/gD6GSUq0J+lOeLElXIb9yLIseu3jm4CzkFiTAZK1R35p2De7nB8FcQQ7pn1/KD5aJygssedvh5Id8SV5cvWeRd5PHiVT7bIQkuynKFZQ/al4i268B+U6R2fAl7FxLX3kxqINs/kRpwuhPp6d74+KHeqXFwVnunUwPJfYlRZHYtDSO719DhVM/R3EjcS8QnRoe7B5HcK5+Ie/3x4cGFriNuIn4IHNn++NjoYE/icFfncCKFTnFiciLVkRjq6ujpTmQSyc6ObHF6qicBHm9nErxfp78nkRg6PIpcX0n0el1weduRPoBW4YZ0CsTSTdlUKKsqUqZi7mDJVdX84pvNaxcwdzDnqpT2rxWZ1xs1jvWWJKrZghb1h05UzfZaTzbf+0h7rQY1CinRFW7WizlBgma7yJ7MNOi0ZvLeRxurvzS+wagjB2+DKVZe/Q3zUsUbyBAcD3QpRyEdnn3wuvnwk+bph3r1lsT5mAcDWf44dy32xy0s/WgMpR+tgnnbwZ+yHHJGsB1yvhK0IOZVLjtdO85lpyDtI0uMIIt4IX9jN5PoCJ//UI7xUtNaWmgJT3zROH99Y/VDtgJzmK04wm9GEDqJsh5jEYcc3sIcYbf44ydOA7ztjzN8KwGuxlTuODGvUv7XmDyROJmqSXzVOMbbxJZZ/wD/b1GpUS7ZGJeqKdB4YBs+NQsfnO9FTFsd2j7y6vrWyk2N2hbMsKkVnULGUW6sItUysMrHEVIthibnxm6gnTRqVEmbQ61k890a/AhuFNFG2slzy61NtE4M/bAkeaFoKvjbNT9Gb9kYyY3VCzBKtj77B7xmm0nNbnNN+cQd22JTswqJNroCl0YXiuY2aBE+tSKemSOFrDuJ/IMaQquJ0w/hP1ATrCngnS1yRcnD8NIxfp1yhJ56ZUu3iHYJoliTuhUsw6IY1rArvNaeIAVY7GoliwX1pbuBghFuNaoc1pVcCwvFehXyeh3MxUpQ6GCQoGmygFXii0CMfCBDsbary8smlxKmeFmdK3rz1NrWt6csm2yshdHzlpnQFkI0ufonqngjalerW6Noo0rW0oeWBtRaTz2nVnCvT9u8FhXwGkfii1tCj5Hy36xx8uo9+FV6XTv6WvihHXktFkDktXPPfzjSwuDGv8mTttC38W9iVSMZCv6+m1tMMkxZi/Wd+fvufrGD0bKxoBQUVUxbKXApuy/OqmM0b/CdBZVeOyh5IYUlubiYvI/vrzghbdDFHBh1YUUf5cm4lcDz06ARcbkIb1NneoLQmYX78ZAiOJELMZ12OwihRG8eT23yPYb6jUvcr0oUqjZ9104etnA25y4EXuHgcT+N/x6Cf48VpydS1aND+D3njuczzmjq0EE/PVmey+6Da6n9R4ey6anJycW57NsgfwDuX8TfFrzC9MR4/sCx6YlDB4+nJxfL2bfDnLtvISjAx3PHl0pvh7MufHLw2xzAdsN9fi0zmjpwrDiRTVcm4TOV2l8dgu/T+emJ0uGe4lA80deb7KhlnNTgYfDMexJdR92e+GJP/FhPfAS+wi+jeMcI+O3dHZ1/740PwLeBPvz0IllCItXfmYEbh5PdHf2AMQbXk21c9KKbdxZ8yhvg8KE1zLlAIWCrd7fPXKKMKtVsLOtzAM8s3O3I3coKhWFAr9KCwFB4nSMUkDY/X2nevqHAQjedptBUpxjktSTD+W5anXfN0DB4/jEzzHN25Gtntq6dYm8SCW44HHZWyYRVlmKokocdkBBlt3JRA21eusBALp+np0QzTslzwxjBydGoEON3oTO6fpAOaXOxftujjLA3MCiAVpy/+BnAGqtfUCaZnIrZY1HOy8kg5WAeB4lszgoiJhNzc+x9okEJOO0yFiInDtevND85C4VsfUFZPDNuLufGdEGk7xg4hmk9c+woVvFrOhAKFjr6WC3IScvNC082T97nw5Y5P1iMZZ10LO8h1BKMsxwLst9TDMoew5Tqt0N6bvyysb4OKCLvhqSwUQodvWJQUNwx9XXfpdGMoc/lkGMqwJTCA67R+VXKl/HB+cb7jzcv3WYynHSsls26kqesquRlSTR0fMy/FoW6O6uyyAJU898nOVEnQdH9zCJPcmLAwRvNICwYSqbjQaeHdiOgn24tn8HH9ebK7pxTKqtVlnkihcZgAW1bgpJbwvPHCEcb99RDv1jh3eYSOLxVUJYlPn6p7tZgEkjtZPhYhMNnSdE98Im3CLHeW928+IhiqjFFuTvHPQq1shaRrk7amsA4MKCAh0GXKNEZPtbFR1vLy1vX/oV9lGBiGNzPJ5nrD7Sq5/OrMITCnENpGnNqZkTdskrJe1Si8gc3mo9+5Ax3cGdhHncGRJYq2QqjotXxC1XfC+sPi7zldKdGhBcq6zj108avH2yt3IdiuKvWwgBujqmiJK2vBYY/q1gKr0KZ2oKCL/4duWqUneXJ1meXaOmr5sYwcL7C0RVKYlb6iO+ALSW1hj+OUUA+Ro/6PMVFVnvaSfnsUvPCOZjkNu5+yVvyeCANZRMU5UF/KZSKWrpw8aQZW1LolLMOn4/WO2QcF1ujuZFHL7FstGnzk68aF87gsvXqCaTburDSOP0Re6t+zMGsRzD9pT1sGB/tTLY6i0AqA+vCkfxlPJJGTXRhpfnTY0H8fycuwH8xTiugrDziqnPcrgylEvffav3HEEY3BUOcOtd4/wr59fjevHSaqMCCWbdky1BrB5ly/cY87tBjzQhVTsevVVAbzuIh7IIhGQPgrfOnmo9+adzEtYVaqQQ6N3Qly69TzZSdYVIcVJiMes8lB0EO6mAwIrpdlKDw5tr2k+tbJ05ifAImx3Bx6AqBV4sXI2f5Fuo3YiEqb58r6j0/mVUHsLGC//hgYw0zKRfBCZsLyHS0OD4Era3eAmYtjdW/9jlasqjPuTfvLW8+wwyOfgC6et51qQg8J0IS4Kips6V5ZLMnKJpsFFV22XWMz6XQke3bdzbWLmw+u9lYwakHgcUMvxsBILDKm1Yuo1ZhV5XeLCkV9FX5/W5e/H7zNAZ1zGEmG2h9fboHc91qrjRE2NFJ/sOqiVEEgoTxbFy0d8Cbw4aOgXqjxe11r6TOT26eW+bzk4vQp2qhR9nmHORrU/cTQslbQB8l0knXKQ8bln8OqXVy4kyATEvxWS8MuccGMH4IAVsX2rTMbbr10zLvUwQF0NQhTSFClzlGUMh30o4KZ0IAiRCk/HBe/bt0TOCWOFHc1umLAMpLofBy0gQc48yEjKWSP1bz0AvxUNtxjxhLoltetLRy2Y/xgSVKxoFJFpSSXeNAeFIk22cuNu8/giK3HzwBddK4/4CD1RyY8XgxmFnkQLW4c3T+SaiswGuKLeG6S9Ew9YXVPGVtwWElWnzj6R3W33lvkZ0MeMPg9S0pvjs3rN922N+nd1vh1WEME6Pc3MvPNv99f3sVteuiC3MC1NvlP2VDxgI3HxWHNWNg92f+r+I+Eg6nVQYNQvE+q182r33X+ITj8eYy7nwWRtbOSQbgqn1Yd76MJwXzSBNEvgmG1B2jHMi4rY7d6PHjrbXzzWtEdxFItq+yF6tR2+VxuoXOFI+OELo4Zj2rOHmzKlmhAyUVpr54flKTMW5e/IHJGCtQLzVWAxqrdDcLAxIAQj8FfzyzsxsQIO7NQnXzli2hlw8lNP55cfPCVTYkWE625MTyQVa9cq4p4tsvHC1K9dhfVak4sBAdZshkRa5unsbsgQhTMbu8PrUusR22j7l0hFMRphGsSrcpCSFOHLgm9kyBo8sooydZ42untq5dY69eTQyi/rby4Nm51m51O3+aW9Zyotl3Fq9XPF5ZJLAcUvZDxQOlBQHL6+Qdclq+IDdzh4tpeYWKwYtcQbT05ApGvMCIT2X8NGFUUZ5TG5fJ+Eni2IghBHeGrWDEMzJui7wabebAVxBHQfkbll+gLbi22bSGG/EDVPflw7DGImtzHLXElrmUt0KBqmQfI6bRGB5KtiJeMGX687SZkUnenkZFTIKlvVn9s+ZXat+oZm5Z1McESjPpB9hpUBHgFEv0HmiYMvo8SkWxYkLmpohm08NbtAIrBB6lMjAFLjIIeQDy6COw6IAz1C9Fr9SxI0Hm2iKeA+uyF6M2z91unP+uJVJRSeuVp7cP7haciLc6M2/vvuCEyWu9dDXDm6508FJfMmcvodNj961Q2p933zj0pn2Nt1zflJXbKk7lfd7Vfftg5KKmkAndEnh1QUbiHfdHL1JN9vG6lLpG971zIHLNbBOrGqs9YlU1e5cXqqDSCSgEySkQWN937vtOT429BZ+3p6eOvAmfQ+MDowf+MhQv9sWPJOMHe/DcZ/fI/p7u4VqmL+4ML01PDS3C53gPnvfsHlzIpFPl6alKqqtz4Bh8wkz6cACf+emp/uJUZTiOZz3Tc90dXXG/r7d/LO4VCvneWS85m184EveShZ79Q3E3m8v2ZNzuXKanO+tmupzp6amutNOZnupyOqcHEkcnjlF1Jsud8YGO8cmjAx0TXZ1vv9XVeejN8YFER29y/77kUm1wJN7VeXyxN7lQ7e/qLI+Hx9KpeLczHJ8PujpLxcHe5NxgHxSZd3vivZlZKLfbG4pnMz2pfqezH4qEZ++ATztiHHwF9bvYa3j3VNLH3qbsefYW6vbVR9ufX2ncNxvErs/djXdRNY7aQ9UXgp2wNp6FpM6rKEl1/AtnvhUvzJRdFXN5h6Z4mOSvhPFdupaNlZuN9+80zv/b1DLj5XKyi41DHlOR6zpawMFOWBvPIEklFZSqo8qeqiqIR1Q/rlrb6xtPPt9cv2X2oEtuEdynYH7e4co5Fc80ns70Sit6ACMUYeu3tr96r0VandXzzKEVL1N/iB6P1VqmHusXdCXKqJ0w8SA3j5cJUEq3jqAErOQwAzwdRLixsfq5LSwtItI6kxWnaFQBB7gjzU1rXtZHq9C4ujI10Q/cGiLuFaNoNpKGsIQNhzfd7muDiQ0q7YGOR4XcO1OVyxcbl8+al5MRAYkQkG86PEC+BzaYRrHlVTiAfLU69A1cF+b6PP9hqbVptn56r/H4G9M0IfETylviL1YfJqzARtIQRli9Jf6mfBrbQOAWM3G/XUeP70eiufjPh7Q2ce+LzSs/bf16ZvvE58TCEBTmY7W0qOz6bYUQgQwigBpFyytiGQUgVfLByv5VjSMOU6HTQd6S1Mz05F9+3j61gm7VlZ90U6G4Ky3l0kRUNxR/DSKwGkZEVa34XkOV5BarGfDM5djndeIT5P2tnISRA0zz0zMbvzxVlLwiouKy+ZsdtUIXgiig9/xkXoNt3fvGRjKxJfxd186dpYySPNjXimrKqhtqc3ll+8aa1btZQDp3xq3hN925+ccgiiX1YiSpl8CoagmOb0Uckf9gZXfnhUviD9Cz95UV0Iw8e8ddCpcTNcQqKv7e8kyiuHohlI+ZEU4UJIqgJ2Ger3iI6msFOmRlBR2dfdxY+coiVua71cEvP8JDpH8THC1vJJVylnujlfjddVCCLVUIXqIK6l7NJuu5BeXNqV6djok201XZePIIlJp1gnYOXNVAMa259QfGH9yBaiLN0kwaYZnCRxtPPtP9UaOy5jew2hoa1D9W1cBgqgEImBlcptR65ndVMthRSVyev4EnckrVnG7RG2S583IWTCh6//Gv7eUzjcuK5RVGjY+2qiR8YS59s3j1LFgbVEPZINLdNIqVrFOB/NGqBQpUtaANGrxkzTSIsj85zAEk7wAP7dFSmInb++JXmNZa7kogrgrMymdVyzOGYyNoUSUk7YJSagz+wZLdHSUHL1EySe16cFY5vC/rKNtOcqsj+5JurOXCRjzOF/ub4mtKzIr4iERAWKNjRbSoAB5i45MPLCfROIi2P/cCb854chG/60Vel+VxRVwkTUZVYmbb5v1HW59+rz0k4x1F/Ji9vRjbg9E5QOrfZ0sBNG0YKpL0XbwN7WlEnQIxmFlyCSi1ytfgDViugO0G2FY7YrO1uTa22rLTEWO6tym1zKhtdvYyOsbmtUqgpWMVsfLV9o1ntoRrSViWBF/b577qyhvPvgbNbCnkiMlotRe2atc6PSocRIVthSskyjiMQLVhnR9/A5rNUmuWst2hFF9KOrClSZ/spU1Eh730zS7d3LqOhXTSaSccwyVwrTi6dyxr/VhdwvonMe0gHT+kp4HmTNgrXRtPr8FzbaxeMjrGXvWCZj4a+68YKZ0he+3rrV3WvvC9zMywkpp5a8+TCBnatMI06u++ceiQHIgVzvV333iT1ohyTpj3kD6GVp3ePhC5xgxkByi/yzy4mHTPIfOdV8gOGGSVjFxDSBZLur1t9FR/cuwt+Lw9O5h4c+TQEbcvnnYGDnQdPNYVHx1MjOyDz/7+5HANPkvVocWFherQ8aHB6vHFocEFZyBVhk+lPNcVHzhWKQ+EzsDhAD7zgFHsyibjpf7+ZN/c8SPxd47Ep3rjPsB5yE9Gq0qZrvjhrmQePoUSCPQne2aT8f5kdwY+2dxAlwOfdH+ycwo+09VU4mjqb8PxxGR/smMcPhM93Z0d8F8vfDnwprd/H36Heg0moIqTRytl6EHHhrrmg/HRZFHuPTLaX8j3wR99PZ0dQ4fTTl9Pd8fs4ORR+LdtlstqHsNklKfoYQBuIWPNyu9ebtxft1wwvxqK/ffz4NMr10tgDISW1VIqxUPeTAUcv8phUEQUVSLr4FNHp7CiWTVJ2T5zEfp285PPeJJSDIKwXHbYseYDF4REW3xtgJVBJky2xYDVCmRQlGKuf+tJ7xatSdv6fPhg696zrfOn+ORBKQAb68fKnjkFrcdFBErySxUyorI3v7sAOAbBbQEQPwndFHshiWJKzULFvU+2TpzWr4hu5hMjLKg8JfoS2BhaWImp06j0xbea0p5BMnUXtoeZQjaun4IH4bfDDUpvxeU/bSCKXprF0GWKf1r/dvOju1pIPDX6WzHOYMvkzOSa4j6ijmJj9aztKOJWuuNW1FQmEHFpBoMX2GgaxgLQCVlF4PXU6JUrpAGsCKVstYLJmYQD6GOc59+uRlIoXvmycfeWPaFFETWjxTxbCGDx+/KFIAqogSwIPbdVIOq0DdjVSpXmZ9xO8FSl1vWjrff+Ya8cha5IqHenIXRj6StBBFJj2Sj6BWoh/QpftW6IAA0QBq9SMwOil7BpsTfMOniSwBpz5GHI9joMN3AyeIc9GzqBSR/MERdOGDrMEqYXbCKwymERuF2wIkDaH8w6maitqEVMRfPm+6a9PKegXqTve3q1VMNoCC2rpXQ2IMMFD7OQYkQN/efDKsYKIS2K0UPNGxeRWIX0ECVuMAtZDKDbhL9yHQhKZUO8aIsaOVFh4FJhZKw0QQBajCmqTStcfH/r9EXdCuhfYUSMagiWV02h4GwojWFLqwaR+4Wu0Z2X0POCH3BqSw48PqmJNTbXVxtPrut8YHB7LohVZNvZyM9KBCxfCQSK5bWkogWcN6yA4DGWrB7x22WrITbvXDEHGV1Z6nSKVV9rPiXNkiwiN8vz0t06/9nvLIs8xPpd8TxfqkBLRCVh9eYxGFnONV5GHgOMo7FL3v74fWvpO6PLX2JRKVuAAhtGyxtJroeIKq1QCmnEqO3B5TSFnkZaoHntztbKfbsdMITPrQQlaQzCsPYGBTNoQbShbBC1UyAoWl8teKpxKJmSWbpbuxWpiVqzS3u+WVNckHwEJMq1YOcKpLEW5FyRtBRP4ruSmpMPuocHqrzPHR7ii/1D8Q1tb459QvYEtQdneW/G6drL5dLulq7UXg6Sco6ijsML3Abbh/m9ghE57Ra80CmIOAQt5vGFxjFqsv+AtDar0s3Q7L3Y6BmDZ5up3Y2UMlDamuxlS8SO2Fr/RTrf6HujmtsqZqWULRUnSgZNQV6UzD+/Yk2n1OqOu211GFGFlvraW3lpxWVrmJfTL5ZuMbpBNAPrA7lZaYF2x9X8IFPujvmOh2GgqdbFlNJvl+cxSGgKPOLj0G8n7SWUxscnN698t7F2HbtxlL7d8+fnq0difhAUMkfs5ZNDu4UOsUh5ZoZkyjOHdl9CKXtuiKdGIywNfKmVpQGuenDZYmmQKzZLg1wyLA2C1jY+Z3DYGT86keofHRwajpf6kYHBHYwX++PjPfHuRO8UfKYnUkm4JTmJvAzOOyPxCS8RT492D470KF6G9Nhg11BPHKkZ8iA6Njo4cLirczSRGhtwEvEJJGU4DJ+BvmRnB/zXi/929CSIlwE5GoYGDC/DYbjeLu0tjP5SsAATaq8q0QPXceP3erWG4w25DGkx+dpy871fGzc/31pZlXXv0M07Lvk8AU+/y45XLuGZg0KmqoMR8cBrgNdJUyOxMWV6JV6ra/cbZ89wXGjNJziDYpipZ10MRKlCHauuriAlscetVmWilxurFzeefM5WEfrRYgwUyCIdwgwdQnBiNTmFrjBbuQUMdJRcgNFtcgEqoJVbQGOqKF4hHoJOMkKju4RWsKZOi4sxf3p969ZJPC1ONcdD2KDdueIBI0rEpbSD2/qWLD8F35F2DaiOEilgRwVVvHL94TxtbWeZfUxXyfUxAp0maFSnjfUPNlbXyTIG82F1nidBIQ8iHRGBL9nH9fCsl1HJSMFLpiX3dT4be7f53kfNq9fpRatb+fglYynSB+IHKMog5SBVZN2162iRfq2clmraNAzYeJr6i4esPsBm47bHbAVsg2YRMAhg9Nw9nrbHsN7oy+YzxmtnN345IWVQR6ICdnAw3CZcw8Fgl9Om6kKBoaseQbYRd3IxlAMNTsey27W2ij0zrW0IGLAQdUKbgQzzQgS4PWgr4k64CPUC63M84/VH2rrM8AXV0EbHq0or/Jb6RrvGpxaUZTuEiIHf3OvtEFKE7g+mjJaKRjrCjl6gYISKISjicTw+zY66CWb6Ridtnn1gFJK7ABq+jzeTqMUEgOpB8hGVppWZUWQyDnchXwAD4bKFEA28PCfqbPUR79MtOGFG2wZpg5CP6RoOBSZQwDKDilbIlu7U+Lz7i/h3fqQ36PGvgRZ4CXS+4/XplReO9L1frgzx1zn2dF+LQmhRNQ70INjZOds1X6Q32h2ptfXsarbtUG0cVZeM7Q5eBXqeP+MAnGL0ySi3gvwuzxXlVpDfqJd0xf4Ldd5R21d9czeCBRKcmeHuNTODlZ95c09/NYvnkkuWt4oXWp1Vj/lE3axbnTf+Kn6L+qbZoD1l2OHerv6x4cHUkb5pJz091Tfe50w50719eA1+S6Z6BgaHnOkafO1Ogy+6ONI3PhQf6wIPFHzR6pGxwdTQ+GjfcGIgNTE2nBjsmBgkmlykBpt2eqcOd031Jfo7OybACQVndGzgcC85oSkkB+tPtnNCl5x5JwP6TYjBcR+npM5SNc4vb51+ymepcL6Hd5ZxA4SFZA7MX5BYv+ruQFEWTCGpAG8GAzXYp+FqwkPtuwv1u2XweopeDDqX6AIEBOWElFZ4YhFcRVzSANDGR/c2Vj/cWLvUOHOdoT0RrpSFn5qu0SWvLAdD7ELo4d1sLFoIrW3Iwg04drqk5r/u8QqOVVL5TxUvUo40jS4lxgyC1zkMzBREKd/q66FEf6himv++1rh1yiojlrPwAT3mtbRVrH6ObEmNYKHlc4rXd+OXbwCxcfkWk/pqRPBAKlFQ0SHY8YWz9g46pbcXpcLsUcKrRMIVeJtXOWfPIp44NVRiJK+ZxHhcqRNRuAlKh4rOfAQwWlq2Dehe7d+RYP3rkiEFozqspW3Vfvopvnut2v+E66Bat9O41MxRNJ4ZSjWTxcdDjaSBdsLYnqepmTV7seom1kLXjQ0G1c1YDNE3Vt0UmF07cVV07QhqJ1DEuUQboqq4s26s2FXdRLdT3bQBsqomX1trJUHSUitZoG6FiLiPS+6C7/AZt+MYAc7RQKvNs9jcbrpGEUtGt1KzgLbVYngkGwckijMtCk62YCiurG6sMdE/OEuCA0MiFsUy72znK4u8rp3vKtKNCCcCwaLRt8Ii2tmj4QaFD0aLtd6E/RrIxtplsrz4ijVRG+YFmNa3JHfx9kjRqtZsUfbQnq36XqnmVo3ZRl22KMmIerQ1YxSqBcgGsRCMvNEpO5ofVwR8ZJ9JKycxK/e/4tDfa4hGhmf7sdkyjHb2GXvM6D7W/k5FrNXSr1+uP/7BvtTO0csGbfizsCp/RgryPNZjsMXJox8bN7/EurX4ePQTvLsOcPBKTqft3x3c1b8DIXDv4IXPzEB1Zw7ucZ4x6xbB7DpFDABULFl8rVYtKpKsIOOBu1Ci+AOHDj4ebLlKRx8PcihnDon0SJiDtvAK0b6/+8Zb+zW+Wr40KMpFRAGsyw4HMZWfHJg6Mjo4NJcqTg6kSqWhgbmhko/XvGx6/LCfjB8ajvfDXf2F4f4+d7TPyXV46fHpkeH+7HjSgX/Sw/09cHvPdGo+PzBQGEt1HAbvEKSPpnpT8Z5UfNadGoXPEWd6uH96pL+jWPLnMJzq6FipOJ+fnOuYSHYCXgEu5ZJd4EhOHO7s7ph2++J/ScbdnvhfuuOZnnhnb6IvGYffknBPL8gPtzsDmPWK9XVpe7UrU7+B4dH1Hwugg9C3a6792ny60jjxWfP+FU47g7fHQJSsBLYl5gtkECH9QNRAlk0tVIzhgX+EGEeAV1eZG4cAY7WQaIAUak2WS4teNUQdXfYWONFQ/bsMTlaJNwK5JVnHNX+6sP3Ve6gqv3nKaq4CHqUbBjkkb1LvGqZ+qiPJzhrDcpgQA2swG0Plk7Yw1KGKasUJ3XlcMnUqknTl40WkE6Ccr6u3t3+g+E/rvkLeIxa+VtEdeBRui7SLH5N/t34L4FqwVOSEJSXbIfSlyOf57xyjPZSKJuK8f6Vx8zazcIYA4biLmrKX3rGh7C3q0yYKRMtbwmr/3DpugovoZfMgAR/gkA7w+aPtry8x94sO6aF0TFb2QRugWI1BByIvpcYozPIvJnJ7+TvAA1Q2kYzqxIhXtQVcrUM7Jc9PI5sLn3QkkGd0HDynox/SrlfS4QByP1cDz0bqsp9xqShpl8jiqryiu1At6VMi6zj/qmbVObL1fzSv/cRRE9lqoE7+pFFA5QsskTyXTvJSPMli8WWWpIQGUoUyQagauAvyuM+XaRN1e/l7OsBf0jFVC9bz0t1cHN5vnvZ7Lo7krMdlYd26C1U5oAEvjF8QUYY5OizTW6j6OuKQbzdv2LxW4QtBQbttWdowgyBvWKB3a7B7oCeF4fSYBkLBfX0JFcTNbxvPzjJuFvNkW7s1xC+6IDaENVrJIfD6jUq5W4MjD6qMqBLPdwG7cXYFBsXGL8i0UCNkmX0Kqk4/4ktOSiJnwCVGygf+r4eNm/hCSlX1PvA+FfiQxZTuyJypa8LFUxYl9sAj9YGaND97BH64qVIJkaVKCK3rwywluv2QvzOqrzdP39XKuhJoVR0GRFUS2dnCdS6pIPGYQvMLwLOzIi1VYGldCTbe5hUu+0q48cFjFs76xGDEZqJ+Vxt7La5KJtcVEWSmjW/9g8c8zSYQ9WIIxFSBdM1L6jq82dMnWEHPUuluzICQdaL+Z8Mh+zF0PwWKWhd7dltw1MJSvbaHiMjc8vMK4QjOvdZ+VTbVmNOouVPqWKzd+W+i1i5q6VrN0ouNUtQgGTPCvFLKu2j1K5T9aNH9e5sOS7MLTdoCu9otKl3rY6OLRY+yClWKV9Su1oDttKVSdkZztVFzWkkZBaW0B2sL0T5aPSjNsJde4IErESq+w4drQh5fzCJXUANLDwp7OJRYw/JwaNz7pwwHNRLMIHjBENA9dOccBF9hp7CZO2UYq6Wgc8cxkzvHEHksku2Ni4icI/GdMRkXkbXlA7sdI/GdysyMVHHmwO4TD6/sxELoX04aSRHdtJvFNeGDtJdSxF9CWio0v+07QFsn0CN95IXEZTRkx5nn1efWqYJzZHgQ/hubOjo0MjaSOToxPj1aGJkawutjI/mjg5MT41n4ezw3OlgYcYcG0xPjcD0zOZ4fHUxPTsBPXtbB36cnAKOQdY7gfVMgPz011NuZTcUzqfhUf7xjoK9j6Ug82d2V6Bno6BuIwx+d/fA/+K+jP9mV6E9249+98G9X38Qwygy0C3fADpjxcmAemMKTmEDLvDxAE8dYfX2J6NB0wNz6Bzhn/Plh4/4DXnRFjm6wTsgVC2odicqJ2cnFoAXV2ma6azX/ArGX7igNT59Ttska2PGSXeTWvW8a61e2T32tTjZCvbN+NQATKMXW71pvGHo2vUamO6oGxAIXYmYlz5HJ+Y+Uw9bL8sK4HInbvLq8eWoN/AQ+GOf6lQrRR1ZCmKwEFUVgJpYkg50CcX08/x9TdEiUoIoKM4sHWBpbBVUOpqWiQsgP4RKoFT0+s0kYPoHo9QWfCd2QHZhjDUI3HwN3Be4NsrTQQql5wVMpxH67TMykWck9cT2r7Lsie9j45dPmna8an17bPv20sfIzukhg74n4oeiBxUaSsxhGKVTL1ZhbCtAIU1wKFgU1JvL+0EV77rtVnbUSaweNrNdB3KxVIY5UoXUatFpUPLSCLPR5RKxm2tkN/8RrJqYobGW97UpWN3RI70hTy7nau9AvqsIYqleztq8+al79GV6uXtMKkS2yksNDMUVkOk2Dd1nUDqcYZF2Aeg0O2FkmPizzT/UbIca/KPoULFwYBb9T9VDv/dzt7a+/3Hj6WePcbd3LMDVlDKvCNUlzwI52e7k0qYXuZbyzHjrz1UyAk1mJH+GtAjz4iq2e1dlWaL7c+PV088L7lM7kQ9nRxkRYi9LitKlopyFpwTYJSdQPmC+x7GWIoo/Xt03JFDnEexRU7Pa1ExL4oorMunhgoBQpSqKGzIo397UQZmKZspNTrxnPsuMiA3KF3A7V3laV+WDDmKym4erbr483vzixsb6Ou13nTmyt3Oa1NT7XS10aupNC5zjFNoUaFaYuVaiTiw4z1cH4Aa4DUwPxxghX4ul1LP7J542V0yqeQJdMr5xdZHXJ7upldwnmI+X6dSQ3hDGsVLbkkPexpVnBWOvAahBgDU6eh8YHlSM7WjQMaLII/R4ZGPH9E195WjWCm0ES51johWGVeMRNG3hZVD8x3q2mdXzZslY1Mb1OLaxT+dzzrHAKZvrm4JnKn8C+cpiaFKmCJUq2WlWGWj89bZODh7nU8vy8Y7595kP91FrXIqchEvYyVxyrWoOrnhNp4KKOwYIdJ0ZF4hDPW2ZLF9pcfsQmi7xkIpamMtlmUWa0Gza6bbBCJ4tkkiXPtPAgTy2gZ1/K7mzd5rn7zXMf262LuqN92yqHJtq4pkjipDXp83Sh0Tx6XKDKpod9hwvEZTOVWy/qO9UfkvOkQrzLGPZQwUcUa6n7c32N2UONvYy+05+/hq7LxlO/VqK9F0Ac06Ybq7erfrW7sa4DpmiNWiysBDLPH+d8b1GzBVVovP8IE8cpywXjQWOJ+tZ5luS6PZpDCj1nBbK78aZC//NDllUc97PlIgegacsJthuU28bq9817H4kJxRgltiA7bTZllUbCMW1HrLpYz9+mJvrx7eKN4dalqge3CjLPzb4L+Zq7P7jeN0fvZfeHJz3e5vnRhagU8l5xlwYoV/MtTukreyzRB8cC9GO3m8Ozlxr1fW1n1/asBdJJy26bYo34scJuJNYiJN+CvEWdmCn0VEZveRBqSBjONLfjx1hf31pRh9jwMag07Wup7pGm0UxLa5ThCZ0abo2N1Qvgx0T9KK4wCUV8Bds30D6B8gZsFyBiZzmkHsl6cTreePJJ4/Iqrx7o3/Wttm1imppcjJh+f7vMFT59q3Hp4sbTX1klp42lUR0hlP1Rs77GKck31i/w4Y8KJxdWd4oYgHjqyMjzZZyaN08+aZ5GPo5aUKJwPqULWzSPqDvSNKzbQLHQooz+XWsQa7RS1h3sf5tnH9DCBJHxqiFndWu7A+jXTvy6nq/7ahsCVHDqgk50cAkm2SY9Dwr+GXRstfDb5ZYQMvlNCmtJz8O/lZH5eYyy9HgD9jR//645elBwZoYEK5yrx/Nn9st8XwO8iwwOFccvl5xwrOJXnRxasf+FR6p/z/XHjbGa48/TPPjNd9847mahbf8n+oT/+wZSvK3ete89EL2XH0mV3G3fud+6U1UMFyRM1WAM/nfLwRHVfqa1dKPgXyVnHgYUghSrftCZ5UFTnssEfgLbMet7VeTrcIvOYAVXJA7gvmy6WKVv3JIp+HNm5o3/+f90DDq0";
@@ -1,2 +1,2 @@
 // Obfuscated production version (zlib + base64)
-export const w="eNq8vXlzG1d2N/xVUPNHxm/Vk6pJJpkl/+XJeJJ5KnneSWZqJkulWA2gCbbUQFMNgBL1Vqq0WjtFWbJlLR6LtmSRlqjdtkhq+QNy6YsQIPgt3nvWe243wE1KqmYsAujzu6fvcs65957lv/7rP//zR1mnFTeTeit2/1aaWfVH/+tHb24k+ypv59NKXK9kb+emKq03N6bc98O7X23Mf7Rx/UT/zsv+q9Pum0bLUUaddh7XW91KPcsa7stW72nSbsX5dDOrVaJW3K3+6D/+l2uo95X7lr42jShuEa6ElCIM/Ia8ZnncPVDpfihYjtMkrTRa7p9DlbcfHyTg9dWPBsefDk5fch8Nq1mn0mlFByu/cV9bxKR7IGwF2mjGnUrvm1o24x5OegtV10hvuVn54d6hSu9+1b1Ey/2wce3l4LO5zYW1/uuT6y9vlZqLZ6KpSjebtQ0C+Gw0Jd3TuxvVknT6UFyJmvD6vftT7Qq8m/t789RZ9zbQJ1nSiVoRPtaKuJNqSuj6rYy2E6x4qlMC4x6Xz93sD4B0y/Xvm3uzFYWsuE5JucvXn59bf36EWhh8foc6vpVQG2macJdrE5VZ161BK2ZcRzQVjG/QmIyyNBYMsQGXIW7Kd+04jd0zcWqacWui8uYo9IibQNTA+tr99bVP3TedpCJtzHKvKXw6EnoUbgF0HGI7Sx0EgMo3MhNHdA7NRNsrNBMNxzQD227EQpbfAX0sdDvLO1mbx7ed+V7pPW2NbgK6pzy0rpNoaM17xPCQweTXGNHKCPAC7DhM5r9lO2gk3wV+idM2w7pP0ei+psnxw4Wug/Fs0vQYPnwmXML0aCuPUwYv7S0hoFswjNgcM3QfH6wkb240imvm9KWNtWsw95uwXDzDbWWx+Z5nhyKtdsJl72RsN5sZu+4dPL7BqOnx8pZ7CxpK14p5EydwfgzLP9M2SDiKPPtwbG+VO8q8ioV0b/Uf//E3P2rX8+yPcTrdjKD//vOdtR31OqmJQMGpVgsUjFEqJfG/A+FfEPzBwOxwwvu5k78XlJZF+W8QTu9dWhSFxKguL4uE/57V9b5nuZni7chZiP8l4/rhj/7mR3E77ja6nTybdgT/jwz4B9iSa+j/uEdayWwrKfzMnYL0rWSqFv7q1gbxAS1MtZO0AevgJz/5i7/50f5aNO1YOfij/+9vfhR1nIBy/wrhxIQSxhPu6YmfulbBynXcYS85AYOjs5JW3lyGNdW7NSvDfPPJ4OLy8Ouj1A1xO2MrwkFmjUozYmOxlYWGS9ahJ4GHSWfmxXVuwGFXxUhk/OvPyECExcsNxNVKp91tGmhrFQrff5Ap5cyfqcOW7Y3bq/3HnyjbnaSaTAV8owTM+WvDdt19BWzHbWWaG3BTxbPt8AefvTJsz7rebSd1yziDB4xHTha1nTCLmHvHMqi5RbTh3hzVCbixdmF97Vz/0UfMP1FZU1G+srx79CL/P9ybqoXs90+tGvYFzbCvLYQvkLuBbZb7vne/OxX0/fqL68T7wcw9ZBgnAGvi0jdg4f5zCBqYtQSrBi3Chtas4nhjlr5ig9PZEBWxZ6kBb3j2Hxx36oNZNzYtNqPmp4OLu01v0Abw2MctlCmglKoW/dTqxtyj4cKiQo/ENWYtIY+WfcS7FX7Mt5i1CO5lO/dLOhK5CGihRuKU7Ff+mlQF9HGhg2n4XAdr76rdig2oygj41C9CJj1gAW0UVGiqCpplMTmkrLn1zCYqQIEyCkebMcNtETGleyLhCY1T4mjKIKllylDADRihvZU2CC8wRN3LDB+e6V86S/Yns9IWBLE89ziIAiN2ZsaMdEgfgjkpvIgmfHmL+PGWJAKiHhSmAjDSrIYju3r9UFmAceYiynmjN1RfqCbyCoJkCUrvQGirsHZ/sJD2wplGgwUdnmPcOkxLGKbFzUW3aL30tULRSq6xzfHgyWO7IBGJ8F5W7PtaToYZPGF5cwPPfG5BY4Ob9we3vpdZ76c8tW2I3s5PK1H/8lEiGjFF321GjTLNAOufRlhm2AYZZgD/7wXLjH+m1oqGGf/obArHwe+sUfbLX46zyZAGTTLgeuKXv1RzLHN7lTyejPMKHnR1e0/BXPnhQqOCJ2ut3oLTa66vz37SP3l/8OhS/+Si+9jsKlnEH3tL9FmOvfSBLIBVrBCFlJLFSe3+qcXncGit9J52G858cf9fxhF98F3/xsv15984naSbqYo/j2sVjuLoN0VSBE9rD+BacvbW7i1H05WdcjGbd1pdOCqF6YWUzAN9yMZxIHTEAj3se6Ie1ZMa8YCjoz0K4wI92ooPJ52EmnU7Svd8Fz759yeEbFsAat9ApHviIVOAvbLgEcRKcYOS17JmXHfvBfrjCogUQAJBitbJGmDdhHk6q8+2EngfT9sqolkoRbEQIb10SD1qxb+rZC18nVtdsJZmK86qrgk7m9e+HD540L94jDiK3QQDO3mqQywhgLNVY+GIv8hKgBYrALIoBNF26qLRctMI+QLRh+dazlru3ar7fjrr7OX+7bvEmNIAax0cPPnGMOeRUTwSIoAhUgEmxPBLMOl2kk4bvo3abWTx7dwkW7E4NKIfBk8/6T/4ZuP6Cb/ldytUqfNuJuvUI6Iwbo1szDak6EVQs/g9JQ124iwwkkNvb6YVgMp6C0kHjGRYw6/OOcTB5wskAQ5GKbY4C0Q8+xHAkysRP05NIwHPrg5uk5u0aUumKyhHXRexNrqz6GSp6x7eJ8PTs/gw/JU0jdCDL6IARumFkgcM/kzlyAjbl02jtG+3vIjgd+rwfHG/S22brRc2VrjMMfCFyxxswV7mSCP2GkcxZc8YTaVZra3XN0uHQY13DxmBPTi3tHnkjArsuJZkUzWvNmrO5tZxUzSLpRie2swdomcrvpXHHdjy15JObzlFI6C3WAObZBGOEFATuFWJPbr86eDK6/XV2/3bn6L0SdzzlVYjifMMJkyeJUUwPrjy0PdxGwvYwOOTNQcIK9M9ktAT+rRONP3CKLgAxmkoRWo5OUhYNKeUWIS8fpHtCoxnoFKLzHBLOmklTeKtwXv/FbTMP3m9eXwRDXJ+JmI7kD4IQ/JFtj0Aaz6FSPfGgxLsmQWlSP2WoZ7g6Ygw8TEstbcfH8bDmy8GR9Zo48BPYVeYj8yJwcl2AsMdYoDSvfNjiN6JHUMls8QtshmQOiifr0ya2bZ6k6Ya3K/zU2Sc5HFSdR9kiPi3bCcAYp0wRBqPuXwQC3cHRnBoAFuLdWt71duq3sLcxr4U2zKwybazyKxBuFvCLCDcq9VlDKSdmUdqGoXWyza2i7FbRtgRO7EiihaEaP+xup/0vleQW6pqVtM7f5oeMppsaz1mddi7aJdQGYynTSNPnIXELAO3lZlGZO+aMLOEXrDsQBgFcnFP5HFIziJoBwLICJ/ywYOMwG8rcYUg/754CAFDgfj/Xnl7xZlzVybpkz2JoAFafz7H7duDCB7v31b+rKJM/b09jPjFmMMImSgTE/5lJn7hDyTcF3EOxpZeEb25Aafb3ujsf3TNWJxJfnCEyVmL6nA24a1OQS0anggempwOP7Q3uYnQ4KQWwhsi9yS0YWyoJ122d9Zf3qRZB2ARGnL8NGsf/Yw20w2YsUQ8PHIyICbNo4/LEuWPEfqNoa9Yb6kO94t4rAhuYlfdi9FlN+Kwj1iUd4XUO4g5lUT9BTPFsSE4jpEAJKRPw66mjcPuRy+pMl559EJPs0PhZY1D1psaRfZXNQJr72oEVxyPqMPMJQq42H10zV7OELLcosQCmo4ELKBZqNE4/jZGkHCi4jzL6HjeGQh0cXxIrmNWTq+vHQFsM1/R/aLuNvJTB0nZcwO9JX73AF9Y1QVQgAogipcx+s7+NkbfW+9h6NX1EoanMp/1JmEvjsAs4Bmw0UjBLYyARTgmGZyBICC7fx297PD6d1YAQZYYWA4yJlFxSOItcPgeRnAMjF7ECIo/XhenIDe29w/ZoSW3oPXXC35I0D8oGBhpgO9pdj2wQi8XNDTjohzOKWUpy01NkUu5r1EuA+cfagbPyIVHvraxuAZJAcqU4+5rIhVUIutQQMUsnkRSBzJ2a/FspOvepSEJ5W1449n6XkTHuy3q97TudvLW78SvJd79JBpxRUMcjPCe4Tf6ACeJQ//X8I5Gf+ZJEF7S6K80M/5oDaOfj7ulYSK8pgHOJ35urCI3IeOULQs0Dlbr5jDL2QjDh2t6mJXH9YivZiJHWTNHkAyUGRyl95RyCMK0qSUNeBhBy8YNEO6hTaZUl4QukpJVA+8Mlg06Za45mwbcSIDUmDL0rtaQSZmyt9idJcrNz06y01+Eu26lEwMmFV8TaNCbLo5UTRdst2i5xABirJY0cKF2YKFP/MM17xDPcMYVnqiNW4n7wjhIr9ZD12gYf2OmIKCKCMBKyzghiEUokXvDpPdNOs4oATxrkwAiOeADXMEkSXpL8B5ij3Tj1F83P4G7NQUbvj5VQvIIJXMktZaI6Sq1RbS31ByhCciyzPRWABfiWIQSeWB+QIdF2t/a12xx8NxHgwPnoOnmuEzF9gVTMZGYFu9raOJ3HBikZ2siSXn6Kyl1H5KGA4CS2nf+DihDsrEeHR06ehkvfLywMwJrOwpDsCs5w0dgYwkEPt7xoy15VCcAP8/DNHbxvMsk3yFve2BNSDIP7iVmadxHKfV/LOtzB/oBDKVj899CVY6/MNuhGsdfaPz+xarwn41T4Y4A1TfwN/Ezr77pmGcS7hLpOu/t/L7Km3tucullXv/7xxtf3NHLPKcImABv9AxAcFCF39CRNyMqVAAShRhyr9WIU2UJnV0areCGcX31XH/+vL9h7DaiOE2FKSZnhviTj5cirKS3eJBvSAlt/eUFvnJTtMiDyVn8VCs5nMjl5w/39sEJcWp66/HJzWNrylieVacaSdxivlpJLfYXoAyVGSBFsLTi84DEcu/zLnxk78IHE+tVbDOyxkTSuxXcw55+7A9VZrK04KRKtBpRB5/L0XS3ijevpx8Hx2AMG5yCMZD31O3djfKqcTSu4qXArOV1cPbx4NwdZbfRnSqf3x1GFHtpzMDisGugA5uKwNWsYnDTFYcFxvfGviSuMsetNzcOBodV897ia7eT/WVO3Y4k4BPBzEAhYuvNvQOFs6r5tfXVJ8qnYBtG24QjbKZxK5KFDjppEeMZBudPDU5/TEqGLG9npiXuSV5GSJVtScSzjci8A0nSzCjYk9bzk24L1vMSCsbhw9XBGTmO7iTNJi/hzFPJMjZA2Y5wxG1EyYQleCZqRyrt3O7ih3tT6JP3or90nRVtPabT1aieVf31r9Jm25CyCEBi0UG1vPd0Jqmzy5MjrPDCXbq+8fUaXprkGTyAXZDwB2layLemtZSjX7gFntjMdv/uGrEdN6Ikd6uQm265fXjeifyds0BsRx9S67V74riLpln2tWDFvf3YLSivHV48W39xzQu/uNWB50kG74vhb5Z9qfZ+b2XSyZlJ8EYCk4H01den+rfv9R+uDF/jQUE67V3gGEfdrZxQnPJqFC5LnVIHt1GvslY3PvrCq6xaK+q0kqh7oBYxZw4jM4rUY2JHwxkwKObuDxfQ7bOLiuwJMupQnWLtX1ocnDmy/uIqMHAwa+3/c2ezy7RjbJ16jaSZtJKA3eV6wO3gE69gZ5txKxblmuAH4ZKB2PGOcBRASVuRIX13JrK9MyGkhoeIOei+/XgWpcC0UaQXzw1unlMenD2d5JO+JyLLAgtCA2P8MBFHT0IYJ1KY6N35yd4PP0QpXhD16DCyxw5xcKuNeIE/3PDRWYdn/eGmk6k2Y5I3XD3qtBHI+MExuIFVrADCkqdGgrScbHIb2Fxsu0Nw4Y5+BRtP1/onnzIIeiOkfAJEHgn4KZBGipXtCMq64iJYOnqP52zbCE3bsZYwm76BHWzs1sBoVVvVWqlqo1prbhtbTu3J3dFkngZsLDLPyCRjS4ytr8A4CswitYXICvK2j7FT2Dwhc4StELE91HzYynhQw6Go7Hei6gM1X9JXW2hp1tB71K/voBm9KgMGr6eYfQK849dffTU4flJVl6qtUL9YfaWKSnSIUR5W1G4lZ72k3wVFVqCIAsGlAktFlQjO3RBkSrB7yTNCVOxEUFghUT4QaAeA/1I8HEgOAfbf21MBbiTweDDtBacBfz3O08EyOPHX5jDfdUoadTuwT5qhGQhX2W8uN2xI4+DTR4MbzzSkMe5E9emuDWokkFq4TxJkt7Rq5GJi0HFn43Z5iu42N5s3j3h0twWpxyiCDHzgV9tpgzXmPRzADQr+u4Ri5PbK+tp3g09P0TFZmrHm7cTTeeSNIgbZKYQ4IDIIa6YZtzPKIzFFBMFoXoLxDr5pwnp3xo1nrppXgLIAR+mFkvclTJv6wO5qb3Xa9VuCAazJm6P7OXzGLY+FKWdkvrmMvl4vjvRP3u8/f775+Z/cR6DrOks5j2c4ththZiUGSb7oLZFFanBBS7FjAmIOPnvoAduJhWvL2UHarSVomgufvftNpyLbRSYffrRx96gy6ebETJJ7Luv8UZjkz8IjSh0A9RyCiLt7lDgUtHZisOQmL+82IOaBucOgI1jvRf5OLvYfnPH8TUZtZY4QlDf6iKxFHMUEgKjqrhKOIED0ZeIh5BIzyR1Ruyse5CtTuA1AvXr6+40r5EMGv6OHYh7hszLBlXhLUp7YQiwbTqbdQbsZk+pmk0mzHTQrtDyVU2entDnrFASI0yU/37b1L34Pt/t44eYebLgn+cotjXqPXaf5GzfCySyKAnhqYkGI+bh/8s+daGui06YzHiiB1EEOC+mtHiR7OOktNdGZ7ubGy0sbq68HV28Nbp4ZPAHwZNIBdLrZVCc5KB8dNwY9G4NdQBRiYhP/FBcQdCuTMxHB8UKHUFTo7HcqoRNTxFnd2MIEE4AosSGj9uts95K3Zy1ugQdnXdyrLqPEWkhSEhLgFBtcWg7m7gxf/8nJisGnPqUCoABMUh/lOyctBEEb+m3Jg24kB+FZomXCHiqGfBQc7GyDJpkBfg/eM6UOKL118X3HveyIN61AbNX4Nx31eiNebMxbFV6p4R5pyQnk2zm4OwvfZnj39ODbiyYhxsEsr5ZfhnDsu9A3xffwbdD05QCx5M0NvZbBBnEmn+2/usonwNos2Aj6Sr4N7whZ5295w3igok2CMLi2SPgkkBCUnAaETP0G5ItshzDiQyB0vGr3txLxW7jMBkdqQ4Hm7mxefuUXLTyNFybOWvQnGPh1FmAorVBxcALRiQ9DK2n0FsRo6i3O8m3I5sK3bJk0nGZ204I2i/SsKBL5zMZJ03GNtJ9/6ciVVi4u6FkJzwB5ztYR57UIJNW9a1ZS4eOkU+AvDc5INBRRMdwqbyjA8OEdoRa9An/zu1fhXMzGIHqZ6aMQSexRFGKVDmEr2BtInUrsYZXP2EaLzKqe3hLVmKtgsY8Du1jNYTWEAwPY26w7tFi9tWotzC3tS29bBgYg9dyThoZW9E8+ptAKMviMtWdtMtkDOmuMN5p3j3oTzNtfxlayZpeaWkCTd2sUR0GPWTtjKyvDGza7IckMCVoSW9sRakOQiv/1nyd/3LmC56dBu6tO3k4jkzYuqsRxSrCg+AJ9F+q4ADGAUwxPbUitmLeCXUW4im0vqkPRujPBaoWqCUxq4PPj5aHKQivMSAiSAGQJ5qWXSp1Q5qi4YVkjcmaHj1fx0Aj+WzoaqMZ/rMQVN7R53Gn9pngygGg4Dr2VfwjOB5zkO3plffXj4IgAwP7MgukZwV+NOSNwPE1MMEEy8Vf+jCDKu/VoqhZPSsQxXES8nauK8rhydHD2LOurWpayr5+jyfPY7LQ9CmMQrVCJn5/SaVQ7EvUWOuCcubAPZ0mVjmBAZt6DPGjIx9Xl/smnG2sX+98/4VRaaa0yC/4PaaR7PcQmsGi23EKAbnED0DKYOStCMDBZ82wKZTu69y5j2HtVj442rz4bXP2OsNE5KkETCuBR1OUx5B1glAJ4ZrlUDklCIn+s+wlEr+2B25bPGyZvabOdIZDNdpaOMFRpeIxpR0xp/io/OOaWmaB9UIRA2/xVgBv4GSKwyV7lsYPMVYQdREbQ2Gt+KewIdTu0sKMgC3gjwUyuKpo9YpgHbLL/sLIoGaoI0iSqwVdPR+AVsSzQSJRSfiqAG9l/6oSo7+tjImgaaf4bw56BHAVXwBoFFKalGsWeZYuTUsW8MsKx5MVWGMlwFCkIgteFRxBHxXcevlEc7Xr0GEQTUyEKeZOHHIVjVhgwSgFk2TFARRCLUCYf58AYud1VllZHiXArvq1k3ZFM9QLVSDuSWNtIO5V0RhqNJWGC3Lf0XsTBe1i472dxBWtqZBcUVtK7T9p3mWejElU5pF+PylPl3g7SVFVLFyT6I79jMUkV/ka69e+sIfTT8TmqHAk6TwK7Ez811yVJXpUjLw4JRRu7mDYUrGyTNhQiS2uU8T1UpdNuLxecbmWdPOYWTA5L34bPYUlNmByW0ojNYcn4hRORBPzO0JTjxPVv5/Bk++h+Slnfv7nq0MmNJp7OyIlC6PyBCH70O/LeShN5xL3UZ/2VTxx7HkOPQ5DKxFS4942wpgBsy0omE2zWJ4U1spkGV14Rd2IzAT67NOfxdBRYTdoCHX83BcqxRyBM781PwpBDzsS7EOIgvJ2rF8f5zGUdZ0QqxZAW/AcT6zy4C1ATPlrwG2zG8IWxkxQ1MJMIN8hYD9AaWoGoaRlxFFoIVcYxwaPw0apXhVPtymialR7QNCjMcBVAFWEMRhmgaBRhD5rQjOAVfaCovKVPNI9TRQLNDGv8sdhbdkB94qgSSBgiSjiWLcuO5JGnSR8Xu6cwZOFwUdJ4mu5C7JNyvss4xe84TESjaTlh0X1Y4iMcl3BQSKd4JjxGkd4QFyjH2Twi9K0kVgnsxbuRuFZE7lTMevEYSK6t5ZaRWV66mJfWF+a3FfGx04dxNe/0YVps774edtqe8rbXGbfHmTLCanHM/u2IwE338Ac4dG/nflUI2sSf+I0KEZv4Ew3w/2sNlr8cG67pKCjLuWNz4i+9vZLG4C/gbOkETb7e4n6nphuiWsGtFFfUl5sLr/oP/tR/fQtnYzNzBoTbIUWzaNSnUZwqCB2HQohTyQEHFG8BWTwXFZwdBANo76OTgb0Px/xTadyW5DizfMYd19mHy1mXlxEeMuysrTr44cPrGze/oKQxM3UnBAkHh4sR98Wa/Ma9XdzKpirRPrrgvQXpd4BvLLqBHmKfO4aHD+EQnp9FDzUB6y1JEh+3XqMZp7u/6tDx+NMcLbS387CVgyPc4YWvhteuD5Zv978+Rmn03ePIGNC23KdW1AnB2PPAoyW9Wx2F6t/+RnGyjgVy26ekHWlqIhBDkE66d1cywKAXMXoW9pbcHLjFtRaWN48cG9x6sb72PXVgPl0hWsztwyjkwRMAg72WRtiDT6vgFwGxNYf1emD46Yn+qwfDb0/0v7+D2Z6iFDwcSsj1NO5qd06l3UaeVZKIvYUOVMBJO0bziJLT4SXCk43T38GsOvZk85sTOGWnOtFkpd7N6EoBrA8EivM6u75xLKJD0la6jocP6VSfE99hHgUnphtUWQTChVgUYEv9048GJ75womT9+apPLjCZUcNs7yUdboVZmM3keDCup0nTzTX22ksw/9ACvl639yTFbMioV5bnB6dfu/fbvHZu4wFauu0uzMG02kT3yQDIIjfjRpJnKMkuw+XY5SquFcp/j2meHvQvXBqu3uufWsVZBI+XcVsEw3dNSTNpt+NpmOXtZIYmE6QM7K3M8j4PGgKr/9tzm1+eGN49Njj2BFdOVINMgZVaoiB4HYUfABB+cDZYxjPLtAVLExps0W6A2yAjubdaxTsFaMYZyevPL+AdlCeGDdCPW1k9aKwdAWLLNNTJ+JV8Fq396OOM7fUWU8qotYECzDW3vjIPCbLiZEbeqEP6V/6uYK2WZCZsQ2aZwmLhNL1NB9j+q9M0nTyuVJbw4LMZXzGkML06bcgO5zrI20nQgMOdPwT5pcSdfu3Twf0v+5/edL1ETTQTN5H2Jyn4OfxGklwtTCdud1GJo5pk7kgdJzDlaug7yll8UNQDOJX2mj+AfcY5fS6egzY+vzP89vsN9MGcTUnYuy1puxnTxZ1trKZuqXE9j2bQQ4GMpSX0A1jGDKy9J90c/kPJ/leHC+fR3ezx4NTXeA3lNlapIz9I7tTuryoC1aIA2c6nt/Nw6I1H0y1Q9phGo7eUYE6u+y/6jy4Oj3/UP3q9f/oeKCzEdvs3M6ukmWBOtbN9btdZozlVQ2PRvcT9OkQvo/JCuQIZuChH8/X+R0/Bp/+TL/vnTlHONqQDJw285SKNCxoCp1XN55yrp5lrlx+DK5AqV3C5V2zl5Lf9r+7ZVtymEalLjTCsxnMmzs5oJpXoUAIssSvcJOiilswv3JyDkts4/vXwyDxNseGDJXKtTjoIEEN9iP2RBI4yLOSs1yQx/mtZK5CvodgaVxgwTQXtkPA1WF7upvFMb8Fp/2ln8+VJhY4WwUYjz+9wvrV6i26+LR1GxUOJ2nTara+tDZ99NXz2BcmcPEtmoik3L5wATRQf2a9GYXuJb3AER7DI86xD1Rnu7UPPxdGsDNyW4eLzEazEM0le34YRCBLv1lsjeKiMTJ9Y5EHTKdr2bZZs33rYdiVMuRi0HGWsF8hTXFtaX131DWTtHOT6WPyInhArAjIkNjCLZyfC7HRvjjbxWhnm6vl7g1MQNNBxwm72MKY7dCSHY2gBny+BOLu6mVEpmZxjsWg5pz6+4SqEYsFCO/Xx4OS3WGuh3uq2yy0wGDtjtNMuBSS2szyBeSmB/rBZdNKcysA10AGy92SartQOcAqAR3PORB0cuTt8fa//YhV3n+D3o6jkyFFugl+QPlWaXdfrfvNE9R84bAiECu+iluc3v7m6/vybwWcPaS+FjYGpHfGOykO6IYk1yqR7oA2JoshEhvt9Er2QcopzLz664mTu+sppCrmbhZQzbTaSe4+jWtTxNrLHYysZC5EIJhvKUN0TMclWFkCylhmxYCw71t0evFExtTB6Kwel3Gnydm4/1ifCjfuZpY3bL2CoTy4OToLN3JlMGhVnoSEEdwSiZWnUkOyp+p2TSg2KoumgvVzEHxw52r/72uLHboPviEY3gXC0qro5ZFlPOnRS0QL7DGZOE9XoCjiCLGD8y+v5/qWXYF6e/H7w4Bw547gtGdDDlizAMciYebSFjj4gm3kvFmJvvLw+OL5ksWFCuA2soyu20Eg6Yr+6Hcx0b7WDGfHymDvf6eUaLbQrU7CdoowODzevQJjn8NaXgxMYHbMfTaSKQ3C9hLdIgpUjWIgfYwkJhYRp6NYYJtVARDcN+7cBl/Cg2EuASalIRp0SwVaWdD50i26B3daUdr52y2s3u55Gt7W6my1uY8XfhbKsLlBmE7c4zz7tv/qYt4VmS2j3axjphZErJD+uXR8++pr2t8GGLNyJ2d2RboOgd4o7LbsNGddUcZ9RMPoDU18t/NC2tyZ9YGZbA1vt6sCitsa0MXGLtq21ZgMjNjRfrXVZtimtJak2pDccpY/RYCRfKW+zqalWNNEKxlLRIrN2mLWMAqtohPWBOGWbJ7QvtjQsSqCc0pcUuWrxseq7qHHJ860uGntw/BFp7IIuDfWY0V2qrlhLWd0UqhGrkVQTqcrw6iIQ4dBSILBFTo+Qz15+olBTOaniMZCJoayyckrlk0omK5VGRJklaFf91qlisOvSqPvPo7Lutt7O/xaDZXqLwY3q8Nli//JRZ4I5hR8GnsWQMdehVVKyuX5rzyf/Ylz0GVMdmJhgsumJv7AxaG48mhH5JtHtwyTmgw7r6vUvXhq+vK9BaLCo4HTBR6G5RppBpl1Q8jOtoJoheHu2K3CnaGowOo178ZLepHawlompY0iwoZ884tK9IEECz9aTCjF9ijaso1K8/a23orASIKIWXeRLLMu1vGFbaotTK4GbPzayA+ZNTxOy72ms5+KD/ZC8xLbcaO6mO4zzl2B45y9knK8gPahxyyAubaI5gFXHjN4yQorTFzawc7hRWMbnC9HsbZmH9E5DhCjXZYjofT4Sw10IV4SyOKNASh5f9K2/3Qxf17sQyRv71Gc49cWfxHIon0udF8wYzc9VxgmdvopQCsG3m3VKmB+OIU/lwgiGo0cZ6agakQdQXy9aYCOy3frepjy32uHuYdvnDCh1CPc0boyht53EVKeQ2RZxTE5bB+XPnBEOj++YHwuFOIYZM0JmeAz1eGevrcaJx4jloxEF2xHgOO7meXxox8/zan33hfVeJv7O+X5ntg1Axu39cA+qBrqdICj1V5fd1q88/KN8sBz5qCrOgPoBiZM3R39d8MGiH/mtCj5YQpi4toM6gT8Z64MFJJTAzrE78RPrgwXRH5h4R3yw8N4Gcsxbc+H0IwgXEyXWwc1yIUdqK+5Us0KU2vSoglCEXsjNjw0EkXbUhlW/3EQhN/80HH77iDQ4U2qrV8G1xcGV7wZzd/hYDx/lRLZE51PZ0mdNZhvgDI+cLONoYluitJXQ6BuKwliZwppxdfI54/Co/u0T/VcnHSCFR0E2gWkBpSptmPaAcTRWyoKXsC1sEbMIyIVL8riKX3Q/lKGh1w6H3r26T1fAL28sxWpSK9RkIFCT001ww1xpiOy92Bm5mNyfobx/FqH7lLkGP8icy5xbT3ZuwqTYRvR0FPJI2ALmGEDjsEWQMvtDbjlvq3KqHtGManJ5GzYLkJbN3nLL9+uxRcNgAaqUW5ffnMyccp/qlYG+v3eWltXgM4YbZhW73KHB9FIv3NFooU9XGVCBxMGdYCgrebnvSgMcDi45uesq9yjq3vUeRjV+b4PKSGoCmSVd4CwcxdIQckZ1w1Y2WjwE6zcYNwsxzhACIW40gUp/Evpe0AeCeafS3UjkgsTcsbwMZKWVaGAv2va1cdM2TdhdUrHceF/L+z2uvHDBjX6P0mp7TzOaZ2AiY7dP1/rgwgNa6+VpNyprMHDyLyMrATiCDwjVvdT/KVUCwJ/5PUuFAPBHZwIhC0HioF/+YnwlAEeFhhgxPvHLX6gp1s6StLdcq7S7dL3fW2jCTTped/Nu6uGNjc/hBppkSjueakdpPBtDijg2Wh+Dx+S0w2hztWxwiKUCqfvxipkOVbE6WP/CwubCChUIa1ejjhQn9igScg5eEu1oKoWki3k1axMkcgh5O4BDkqDA4c0zeKXJZevzKjDYTqYQeR9ELClvHtCiKYwB8MRSehMdN9K4Kuknb01qEVUW5hcv9W8/A/8GzMeeJ86OzFGYg3IGOvGUwk8GQ4mZzJBo3bQYUhZRhpxUypuK2eFavXsctgZpVOXoxpk0srGNe6OXwEhnXXRr7W6T6HsLddzOdHtPIDAcrdVXr+CA6NiZ4bHzuOfj5wlLyUt4cg8oUIU0PQSoaXoUVlL1KI7PJJS7/YG8Jcy+aa5pcBwNsmhSgj/hOa3KAh+M496taXTyAQaOf9p/dZopNXsRPO7zAzUi7pcM3ISFENznTuOdjjOvJeC0gdNaqkwmk9roeFKfMgmJpdm4njWSaoVdICCz/JTczGKeeQq/Xp4fHl/oP7q48fmRjU8wIepULYKD0Qontok7CCNOBYyaFTAtlAWRAppIJBO1mkcFvjhZG0EMcJXV8yiuChNEokkU8VOk5EqpZBzrQc9pmDHckmj9UPAGcYsLaP90jrbpcTrbaeOajLiWYxL7OrNCn21P7utkA4C8NjhDBvkplslGfHR9cPU7vjBx+t7Jz0nKOggyTEnH0xVo5H3dzE/okmEMHaiGWbpnwCe1f/kjirAlDMHGpTa49WLzqzl5Uc3ljM/KOx52YlnGtncf8hPcaELNP3Syebnxam79OSDMdrp2dB0VkOn4IopBUGolNVT8vmnUzLPJVqIpwiTDJlQ9BmERJDO7OFj+ykkMyhampLgI/ac4BPb5zArAxexrDK5CSRF4pfrPXXWQgmyfcaV3BrXiLKj/WVntmzdOrr/4jIUMP9j+cYe9ofhzHAIJr4oV8siQwqBQMX+KYviLo7wTsXC/D56s85Ba5hDdqjKj/bM3+i8+6c8/dyuY2HWmUKfmKDsSns+fI8MwIfvOLYIXete2ocnZfDMiDLUhL/chZw6+QINy8lAVU+Z9ffXB4MUx4jrtTiY0QV03s3pqOjXttQFm5zHaQNFCZhlU54Hieu2EuEUeJcYHHNfb5E3K9sPzk45F3uY3s3a95aRNO6H9YDYddRujeTRIimIhhB9EUG46SQtTtKHfLGdn27h5jlKzOXNxf5alkpsNypNMt6OKr4bEX2SaTQiuUycpn9Dg0xVKMQJPSC14+jSuuDFYjTszGa25uGejbrdWmDGhpPoyGU+B5SRmU2jj7MpgskaNpt3IcQzI2ZyzEQ+PfTM8cYzsEjFJ1Kpge4JMCbYjvAlhFP3O1LyqeK+exytnUcyBVt1Wp3p9umuNaHTalhpNtdnulRBNs4Tl+ggdYfWC0QD2Tyu/jeRWae3ltBHRgRAdJT4LIjMQllZOeqEx5pVVeHm5VaA5UCExw34Wz08aCSPCxYoGcsxJwNn8FrrKLyz2b3+qcsHLhJE1h9u95V9XoqTW6n2TR9Ol0CwnjpsO94+B08OT89CA3TSjWIji6em/rUBh6PbsVODv8Isxm2Yli8DhAemmJ37xC+PwkMYNTZ0oVzxYwXNfpbdyIKxRuza8+1V/zhf/6LSzfDIekS3RgwYuEP7rgh8EN2hCyrEtE1IuTdmQcg8XOhW0Eqj+IMlloI76m6NBsZX+6e+GJ8+bgrtMUnoP+treytA3xXsZ30rxYgYaCusm+7YC5wgP7F8EMqPj5dIfSDdNcoSAGxe+87uzDOEBc1wAyum5EUly2onTlUGSHIItJUDUBgreHdiIfQlpJ3gBbKaQwjGbxGOpP7BrGx4fdvcHNXqOfdx/fU+HYjrZP8I7Je5AwFZwOYbIpesx00ahbA82Y99BWgregRoKX6LdhoI+mlazBfo1D7JqXrg4uHjG1kBsjSqJAyj2FQh3RDZNbqGQTBMbCVxspJ1wFErVh9yMq/opVEX9GGSIGJw7P5g/6Rc12H2lzAEAYi+p4POICSTwBeaxheB+khuxvCeC6fs+jXJdx12nPp82g7nz5dzGV4t2GeeNEbIIQGzHw+fyAmb4wrTBFgrrNy9drVIbhbXrJG8aML+YHChw3z99Srl30rs1YurXnK0e5GHNR6xcj19i3zURzPpsqrxyoY0gnXlS6y3DCU0EHvlnMBQEyMA5VTyD+/PHnXlNzsHtbpbUEjwPot2eU7v8hclI1uZIMbb0PWRh34TAuhXx2H4rIl90xXXDmRUdL+81gXdQpPST/qPPtbNn8065q6sQORn0NcD6lPEW2msqQlZNBciqoBAx6Nlu1fVIcLjSgvR12Ksm+efg89cbt+7S7TactnQo/SeYYRF+9JfaAknOu1UdIIKw9IZYToFbkHG+xYUlfrhA6XlOnd+8gt6H2bRtNs1MqzH8iDXbmMhS+MfHtiPvSo3xNX5k2mv1ljo5CH3/onkS1yFMlNL2IUqLvcEdxsbJOcZwozqbT+q9veB4ses1UqiKjt82lk2U5aOEeFGEj9JBJeVz/HYg+wS7ILjLescyWjDGHKa1xOL90YjUx3Erh+DynXCMUQJlvjeOfxZIP24mVJrYSiEfNQwTcQ+3qKiXDfcQPnfsY7McJ0vM95ZjGGm7HAFztMovKXvLNKNbngk8VJMzOeRvgyBDPIdYnKy8vUIr6cnzjZMPYGeRZM76xNiKPJmB85Dc7cDrAX2pgCDjFDUiYlouEbyoEbGRsGchAidR63YJksCuTIXV+U4Pvv9e+/ZQMsKuTWuH49CuZdiSZpEGCnYttmHZ52ZCrYitFCZGrgZtUSFabdjpjkpLnheTko9UhmU9WFCCDB6mIM8LCcgxUqEe5w1f2WtRQ40gQsKNKWUd7Z/+aHB6fuMuF/A0dC0pMKpfdEvYWQiteCGSXE/4b8YdP5ltUbC50k2V37eFmyi7wbFbGt3GmN2L37EEWwqK9arjEvwUI9Q7bd0bWMs9tNXVPmez3Jvi1lS2xrEaxGIHq+3rzdPAIFUjlG1PsTe9SWiMQDX8xN5TG8/MO2t2qanFFpZYVWL4kMFC4uCgHFj0Lz2lAws1cax1wy3NZJwxA62O1tt5DCl59Hn/8lEyNtTOMMbA1qaAmAGqx0docdbgBb27A63rNa4fOlYxpFBE//GAlZ4iRaTKh3WO1zNGF8gkoulDgl6FuxHKW4lzlbKBGDSCT4UdyTgv1wpTgWYBTQEnX1SmFNf7TlZ7uNJHJiaE5fZ3cF3fzqp5/IdSRM1yDVb+rzBoGg4RfxscLz280D+7uHnnm43jK2FMDWBV6MA8yE/48zHHS0Awgx4ZcCQw8XN/sEQHXjPJDBaS4NP51VqFErfDmZGY/ny9+1n/5GP0N3g5PPOQDryc9EgOxY6ej+4BMxZIPb+nlvjRoBnFDeGKSGylQi1OU8LJFCt88J0vCNDMprimpRsgh+CTSiM9UxOVPC/1U4VCYgjgb4g3wrw13Sk87bVFOwfP1jaumKKdk0mqxTq1gDL8HQIoJdMIgZjA8OJlrWkYKJgqiBUWPU7SsqnCoMaggrLOvuYvGLCUeJ6asr6sc2vrz8+5hqw7a6Fcc8Jw4skKaiutNKM809AcuGehOz7ywF4BDabOp8PXN/uvTmPdjovqgjobHYycFTdZwQbZEbWd7YO0D/AC7NoKbUtaVtNRHpw6yXq2pt6tFal9wA5wLDmAWlJ79+1cC/dExDUfvJ0637/8jdscAce+5yHqIqtDZqmpg+S3hn1fb/We1gst4NXHYepxto0/P+J4DdE8SMGztdPq7qtgPteMyrO7Ebw/a/g0RTi//d6tEOZVvOIgGVLcwJkC6QDIN05AE+le8LWbKU5iA619a6aG+tkZrluatnS6why3evf3YSipsowT4dLmtRPEKkyBKqgW9HrFpVKDxNA69rRY6CpDepKGnHtS/V1TdnYFAo3yed9jHb+HoUYM8Xd1ywkSeDoUjvlJK3QX5Pmjk+ZT54evrxF/PA64NwHc36DGQSDpNo9oMDypUGW4qMe4ur6jYDcVGTpJFW926N6Rp8Hg9GuaAJBct4vh1yKidydYJYOGexM6mKjCPR828fHyBtVPobmVK3henvEBOj3vRdCel/R7WWF8Ob1lh8j6eSeWlThjdrebPKMcVmeSP4xwV3UPf4AsIOu/K3ir4q/8LgVfVfwJfU7/0ZpEPxvrpuoI2Ek1nfiZsYh6d1txjtdVTZ7PkErlPooAyCy4gJ7vrxc2Xj5YX7uzeR3qhUzGbjNQhQxZ7IKEMdRdZxnWYDspfkgKvVvYIiLbCL2lSWXylttzIWaMyWB6y7gFef0tQH5+pH8K0o465pwOFUe8SWXM4XC9kFkpVrO+9oiK1SANPS4WEb0GW2Gm5XC7TU3LdptehQsOusWPAGKTEWAApghKG1BqRTmwvmvRiDsO5McZeYcKdhIwdeN5aCcRb8VALGioeFxGrRlzyTbEmSe7enyGTQ1OXByceC2LQpvyJhM2FAQyazuQrk2sJtvQStVGAWEz688vGLuGmsH0Y97AwXZahTZGwJegi7gBojeZoIZyq6LIMhZYw9Kjy9HUVQb3oSMETrqUoiqXkGWedkXcMqhFNHAGK7CciF8wnBh6RD/YkQwjgghe5G9sON0D4ki4MAJaXj8qjZcdK3IEbyseSn9eM2LZ6qLZEklNJkESILWaxg20HeFRw4uw721kEUnspGZC98LZVO1vJVMbJivh7FGVNzd0dT5fHT64TVmk1le+oHHI2pX96ARNxhKDxZJpQxgtLf1gwQcjiioQX3ac/fS+tMIuRPnexK4UrBoxs/Xl/ZuLaNs1lW9rT6JknBx5n0tz1+/kX2nKvI6fnjzLaUqS8wZOQ/8SipBNyQQ05GZG8z21zmKaveXDKeJ+RA5qaOkD7Gd8o38NbTD6lV8xtMHoJzCp4LX/d1BmfJwZBjRkhmFXTfy1t8QyZ+Y7W9YZVXTcA2mSr2C9w6MPh8cWKC6dHiD/evmkHvbyRbYNufjXy2d/BFCPUieE8fwJsrw1sV7CvTanO3x7BU+ILz6HUtYPMftTK8LceZ0Wp0E9nOQd8E1iaoCVr7aBOkSPEW9CI77pCRYE534RjBZ6pfsDMQTrn/5Ij8Wm0GkVW06jdt6tddtqhAlmCdEieQwpgiwoqTrv1V0XHMIjmFuYKhXTvd6+OzhDrtL+d8xSih9M5Dd/wffksB1hhMefEAJkPaVnfMS3EHEkFwpFt5eEQeBDTfBAhLPcVoX/Wp4dcbp59sbw+Mv+6aWNG6ftGedsh+CSSXAU4FPOsBE95gwaH91woaViAyVs81YzSSfqZO67ToremUtQUpVfJ6PKpptffr7+/Ppw/s7mvc+40kAr73YqUw0MT8OgTzg/r7mdAMKY4kld8u3FY/jefXQafrYyfLBAA5emSbWEIIekeJrD8xHdJa6gB+3tx4MLuO1sS5m/elLPIfW7Gv9EuiWhnMwKqaTDq3VTufRbyaGDYXV/97XrV7Q5cLhkxxG1ooY2SqTZ1pRS4VxoU80f5+ZgLZLAnx8u1FmwrD+/SYIFK6lOOQkwRWVphaamxXA8SrYTEGbFw4jFnSdxzQkarZULiW8hOT1lKMZAhBfP1l9cW395sz9/msKOO0BA1XJrmVbLVahsl0hSORewND3EXbitaUsZ+IPOPqNgi4XBzQucdR9+Zy7ogzAixNnWtNoufZSmO906plbHDnk7P12hIhpGLEKesrsqEyHDrcyTTD4IKwyWBViKYag15oA+CjNJ3nvacQY7p+7IereweiK6zl46OzgLkcWgdznVRcxxPK1ukTzbhpovnpneZumIOEFpJDWc75M3E5ZRvr06eHGFw8LlwYom5vDf6NCEgDuCM4k5PGBqxA7MorguU3ipidtbP16bVxc3jy/68XIkTEFDZiB02Mx3mUXl6s8ESdWfDZ4MoqGWUphZJ87FEKFiU3DYAYeHGzcuDY6sUUR+DR+iaqb6ySdfwc/ZDhCktJRipHvjQj/smQf9aEID8rhBLMApNNZTBYD5jzbWqOhuI2qxeRPx05FxqIDP2XbEIu+YPN1D2/L03pqWx8USJPOtZHFhH/J5F9lIcAl5xBiCEeVp6j3mj3oNyYAWTlEMPfeEQRhTHVyt161tXWvnGmt0O7M2yrEGOD/s7UVS24fFUBxceWitRGMhhvbd9tZdYNn991hW72T5eNtlK8vFWC3e7tjS6jAWR2go7MBMCEyEQKnvTqWLOg/U8ZbK2Chiqzi3U5tGZRYU3tbqzqu6EWppJ0qpqJBKasMoDdUXgbIoKAorXrcXrla475oyIGQ5tY1Q87J0d0SxIRqx/x0hrwJZNSLLrJslvaeN+P+ST0wzj39fPH94e2W2tzL1O9jYwPFDeAU0fLg8uPnQ7W/6n3wUusQAVKUNn9vd4OThr8b5xDiKzsQEk1Qn/sofPMBrNyUFMk4nqPFCdZXwwOnmo/7r48Mj85jumfMmyzkZ0PgbH7wbZZgAQujhXrREbi5aIidh2jHf8oAv+sEKwSxA2Z23cxh0evNG//n5wZEjgzWQCPF0NuVD4QXBXkLRVxZQUZg+INXbFvooeWDf3AjS520sn/G585LoYCVNpfw3oVg3VvwGzlbhQK1DEcVQrQsw5b7GZPF5ddKh852NP4R3bcidDR7OWVy5tIEz/oqbWeCCgj+2NRZa2jOJz7Adm0wN8gVjQ756L6Joktg9gJbRrNcJfkG+CNk0XGk5MRNhDvq3VyBi50JXmiCfXDo4XDnZv33dNQPljfjE3TXDbgnogkN56bF2ML1Bp+XmUK3UKt8CUxN6DQxvEOAGWKVbFezxNnhJOgVONyxt7SAo0hWM7eDmF/ZqxY2ppGrGiHBfrth2vX5R7nc7acLpUoAKL1hkshcQ7Sjy7QphkcIVqnAA461Q+GaFUTyIXKw4A01GZKGjswFvIii/LDglthkYPUDcSEzpVDi9vgbj1b+5OHz9GZfeyMCVMdFJATU4OhH5qkhTS3z9uMfJIGTFixj4mlxWsMJdxcswdmrASncswuQOBkVYcAVDQ81VEAixhGQwFCDjSbOl88puBfQeBSlXnlQS6FT8L0lP9z/uUy/LdkNiW3nHFV1aYb6vjTsKvqe/J4EuDxfYbrh/d+ajd5sjo+5ICGZEaXEg+IDm8pt7/woZaTDlHrD5q2KlcXqWe+v5HMmAUs1xQUyms3+o/Bmv1j8G1cd/Mbb6OBDjLYp7JfwX+mXipzaA3BmNHSwz2Hai2eTAXaxRGUG8cHxzY79JnPftucFXR9bX7vQvPmQZShitqMY52AW0HnenJXqcvzOh44WGTPi4NGIjyIncBpDLVzZCz1c9j5pJp/eUbzEPYdYLiGh0TSZvbqBhMveof/ESHOjfvrv+4gvcDCdOrUcxhgxkjcMQNOCsKQgh4JeYkvNdD+pPpAhQT6QQLQqQNMUT3h1JQYG6ZBKgi4fD0uXcE2deUV8jZNdJbEhhhOk/4nauSG7vLp3tv3Q6DLUs3pFWK5QfhYqg8nrV0mv9+bubn385vHuUFi5XX4uhCNOPKWjKthYxbNgcplH+MHyXQjZd9zK+GkBiiy4YbGMQ8nfGs4ZgAwdkh6qux3VKZmYrAhgQ70ujXRSm0iX0UipdGANbHsC14W01Z+l3a7ZCQAHbzxWPy3PFFwkYiWgNQMYs5l2VGdMKmPWlApJJK8SlJ9LRoJ5TFqnEJScIHwlVqhnAP4zs0yAJK/apqRiAU1v1RMhpCBx2KG8zpEPNNCihFcqjKyDUNvCscm1wZNF3I+qiwlArcHGgw0HmWgLA0VQA4x2N33l0x/O228H1SJpVV10LCnyFw2nG0qGRBi0w5ZEMN2b8zOAV6MdWFiAtwKVkpfItqQ9VTUZdFNSE5US5wGAkKMVOzjQiv9n1txZPtdS5EvzTMSf+3aObR0+xyAyFZSjKVIJBSBjLri/u8EtbcbU7Mi803tfKfo/rbnev8p7eJITJRr3FTmbeSPMPsUYagNTKB7hK4C3/vWj1yQMsXormnvyMDhHJr4Oi7ePtPKLiIgfJ5MRfGr/legzJGvmOrwqnvFMFj9znR4fP7qpH7qxDyvMuX1G0yY9GL+URzEApvaXkywmmNXd6kPVqRiJyoWYhJjDjPGvEzfDbE4Ozn2wurJhrPSJqyQVkO8fPkb3WE+TMACtaiGP8QxiIdQzu3GACtCWuCzjrUiI4rCG1chC21DUf49X/6NuNs9/1zy4Mn32pkV5tSNuECr2JE/Ewo3LIl7bDR+cJVfIiEEMe0MrRXw1CPpMpcbJ+O+fYo9OTo3DoA+JqcP/V8Nn3g7MvBmehfmjciBqdnIfN08uI6he7heNBVnpxg0idERhJ8tNboPilAFdNhvjZ18OX9wf3F2iI0Q0F7eQ80Xu5w/FMJSpiKK1Q8c0s0MlFZPdAPFXTa/VkGvPUoQ+eTviNO4twIfXiFrW/vwYUeDdIxHI1SJ+yAEnJlZAvBulh9b/oxrJPWOhigjVZbCePD+7fpYbxqRjjivBP9bjoxnw9zbRKp0T83t3Y+zfApUNDXT5wJLnU7n1naH3Ga2BWfDzg0eBevCE+HluRcsPwrDRch5xLXSqBt0SlMGV1gM/Ry2s+AhJy6rhtCC4LokuaBiRTCKU1VOKMB0/K9XuSx5NtUH0+Q5KfcDbdxr1rbtZoegKlKuVJ0l9s4jP/rdm8gmsVN+Q3rht311w7ZteaK6mtA+e/DHNDJB3Nt0Wj8PZKkGLBDUf/4qf6GgejvA7n+eVUC4QUvMNMBrXnzAv4Fjz/1IDhn6jsppugi/EP7WwaU9B51jHcq8D78mc+QwSTlLNE8A9h6hD6rhT1upJTO4V8ESfvuKaClBG+tTBthAE2r9OOHD94e4kXv2+OdjmDxupBvgE++3jz5pHB1VviuhhPtyudbsa3KwwhdVb548jkIh5b2Wf8sBzfdDnbmYJ6zmdwGXHpmd4K3PYXEildPtE/ZnJuzUTF8nl5nk1FdqucR4eTZuYMjHhE/3MLhRfARsJQmqjMP7UUJO1oQ8HnDhgIFJa/coBLVnOKyeF3X/VPPqP8kh15lju93Vuiz5pCXNEyi6UwFoMjhwVCZBuYFe478MjIAv2oehFNb3VFxAsNIBiFUNDYJYgoAFDZnFQhGhomb++rDqV9xYRCEBq7SLHqFxaGDx71j3xBqU9rFUfDN9FK7IzFfbnUH6Wv6egVT7Boz/TpCmGUydVpwNlFdV4a4B17QPLbbn78ePAELhlnnT5rQjQRHp/C01ptWMgzISY6JRKlhlTj8qOgBbqN/am2Z8k83NY4DAzDvVprgWG1S7PKmFTmplgUxnYGERtDvG5ryWTCWdfG2y9qu6jtsZXlIf8EZsM2RgMbDOLJUe0tp062xFspe1H0BS0fqF1Vt0ahB9rValWr71TPGRXqVZuskHbv6bTRk6BmVIt5jWK1iJH1VrqrRBdBrsLbCG0jTFWAstz0sjKUauzPxd5CRx+yt5D/VaRZURBtKYWsDNqLsAiW+uiFrou8vLVmwl9VnLx1M+F/F3fYiNZ6c+//4M0KptVp9Zb/ze6xXUObpy6tP58bLpzfvPxdsMGG5v+JLlH2E7qvODxmc40cU4qUVlSd+AsThpK4oYiCOg9vr6d2m7NwfnD1pG5z8m7WYR/QxHicMwqrF6yHQudJpwfPnwuZOH4mDR/q0YELG60H2aIk8xRv1FtusrfaxplT668XBp/N9R+eYO2AdFwpMkQxuHrHEWCGuyiFlo2Uokce2sbyRnm1GaeutZxdgsgJDIPMQJ0lb+eakJm8QS5h/dffbqx+s77yaPhsGRd2K57pZu3KbLdqPwpcoZXIeHpLCxbXQkT2gwwMFHzvLePeFFLjIhwMDpx94rJ5/rz/8AXWgIDfdXgtYW+52xgHmO0Aj1ViEVHvBLpOxM5E/jAgOQTGXtNMws1rS/2PPtZJGBNJPaLTFI8gw6RfBIAKFEDIrBQSifmIcvJQ4RAbKOMEw8uZ/Ydnj/WXv6Lk/q2sHbkdiSQI8pQ+PZD/zmLFDQzbVLj1598MX1/ziBIZosSp0aYN6TGYa1jrx9/hDf50YnBzVe/wwKRoSGcl9EH7SsHw8Jmyi5IUQP/CVyQAPIoPHEEYOXVKcojX53xvP1yAoxI6V66jP+dy/+ip/urX4qlYi2YqeGTgpBr4f8Jn1j0C1SbvYczXg7L65hd9PJtuz4Kbq6Y0Mgjt4PgmrrjnaAJM4k0bbh1eX+m/OoI53tzOFa5rcvQfTOPuTGUWKTjvBt6zPm2TWIR8e05s4NX+4rn+hU8obQ+fe9DT4h9k0vVJmYvw2EZFTSfe7xYFe/rHaVbVVSYoemxDlJ5GvPmRKoyIQG+0SP1ioeXLtH+qyyHC1/3Tj9RpFOeZ29d4t1F0+alERdAAT6FCnAKIZMPJpp2ydBsy4atBcSs4a1cwadnNVTdj+3Nr7AabJ5FnC9LpdAlBQ7oUMkBTpBCmgCHd9WxGow2qpIfhrS4uD0+DYO1MNZKU775xesjggPPadlRS7wfoRNCBAzEcaIiuvV+Xa5cHX25+eUI6Uh6DiSV/y2I1v20LwAtVSFjjOqt8yitGcLim3dfq1c2TIBjpgUj/kgBK/JBtQ8Zxk/g3v3UT9gSQt5sPo8kpFySMTzH2OZg5/oDNETS6nGUs3hdNg50tZ2wKZ6EUw1DzgaaQyxikEECh5+KUb2K5Aztzm/Rs48HjwcX5wZlznqm2swqSbptzn7l154Ak+1nKURlFQItkMSQABEE0/sNN1witKDqGzHCpQdpTz9bJu4Ozt5UnoEAC6ikCcB+TZhExs3gKZCEkMEQwdOffTmhHhkqelILT8aQR8EdaofScSsFdkmnuBvqIJx2L+8WK7D/4kqzIDhGagMERxHRHtAV1ZGhhdo+MNyGDditzlk1ZY2+OMDathWlsS7UsC/beTm09++cIq2x7m2yEPRZYTtvbTcZmCk0cY+CoYaMmjTVnAvNjZ8aHNzysqTDGThBDI7AR9qbdeT3FUxQqM0ojqzYOtaboTFKXXldaPRlqtO30WaDLVJFto49EF1ktsgMd4vWHVwJbqwD91wjrbUS1EdMqTncuTFWQFmTedhLPSru9yCwrc7YWOF7cjDgqQLDfO1sV+qqcMwwg317/RzkoWD7kPthzAuKPzgmAUXtOQCz/vvJnTkLORPnv7UHBT8YcFPBrTkwgSWfiJ+akYLpJudXchFk+gD6rNK2vn9h8OT/4BE6iZ+sJpU5yuBV0DGyxjGviV3hsA0dEkNUWygjfwgl0cXNhdXD+DMV7AWViQPx6SnBPH0sK494Kzr/1lxf6jx7zvMVH9AC0Rh+LEJFklgYYeIOXDxyIRTCGLFFIjEgtSzO8OG9DTSk9P+bbWaqlAMdleLh65sL6yrn152c3ll4jOLq9droOPs8mKXFKG3vIA3Im4m455ReiFnPML7229xN5FB8s3E9oA8EFC79FoQnI1lzIunr2bJiyfLqURmwcOF2iAaS9PTt71iRXny5dmyGavzJrRoLGLog/XOgGCU+HD59Zh0aA1ORdAOVdGUMczEtNKJUgFyYM4SQxSsCaEXNw5RUzHbRgXBuphTDP5pzpSd+HxXyaSW+JJoHPqGnAtsQx5CUXRn7l3tMW+wbKa7PTx4Pj9Jrq8IZTU/IAmf5TMNN1OqAeoEgdxp8IAI4hjR212naEMFNNgzJBzaCPHSqcA8VxaiMzUwKrDop7H6P4XUYIiTXZqVsutEQ+NONixyQYEHTjapjOCek9rScMqca6HNbdOIozmTN+8F6xjhdxnzhbQISxSOJQhm4nQa30tHLBlJwRMWkFJE+FttcbuZ159Jb0iiIvtl3hdjmPWMJ7XW/vsDLCBQHX/1It8+Qdusoza2Jvs20PM2WUiyA0+3cjcmi5xz/ARG4wmL8upNDCH92MgKVYSKGFPzmRX4vS33IYSKcb1BD85c/HpdJytHiD4WjpD1ClE7/8ufcRzGec6SiJesDXzZkIksBg+PDz/sU7csKfHeQ7jCpR6LkxI1D2ens++/CCHs4iuZwaM4A4KydwW0h1c51lMIvHjsAHncxSlWWBXDwyfDRHZ7SDzx4SdpykEJVAhXQFTgOH6KNkJlV4BRMAQ6vJKeoQzj+j9Z6p2JPlx9lxGze/8Jx0844wwrTtOIASxzZIL8dFHjZuPKdqXFMdIKdOkscl8/thuD2nglbEDkl4W83qmXfeSaAWHnnuVJCZ3FEWfF0IUhxG4J2SNuYr9UdMnz0cHPl8cOKiHp60Itc7v1E84yqCIZ5NxAzsDkmyGNoflGHRWCGzjmEVMDVgjK2QMuJoS6YE4I0MQBgTL0mINkoSMKn2ELi2kT6TsEg3u8GOl6hIxVXW2AemAOFJy0GxINzwDcngKPeZFEHzfaaKDuA11zMOh1oegBl0mIcRgBJ1YHkcRu/dwJIgeg53RWpKJFrDR01fx6PoOBKC6IRMTIz3NkKIuqcBIkoJemjAa3QksXrLicR2BZNPSEbrW8OHZyADBXYlMOE6gHMrEq3H6fre0FHwQ6AkY8NRSbyScCWhyuLUi1Ir6baUcl7GWaGE2GhdcIXAB38igQTiTGURNdLwE0vt0VnyVIBZ9G6Ldm/L6h0mvTRYeqU2vdOemFKiXQz/qGzoh5NfjciG7rj+AFdFMRE6/gDcF7Kg4/eYsSb+PZkPs9HvggrE46wHIEWjASY3/uFYnviFNx6yWtLqfcnHCw00TjG+AMIXByfPD45CtLR7JuLjBXx+wefCYPrtiA2l7BuTFJxEUjfI4i5Ipawx1Tk7t2weP9p/fRcynT//GtNyZFNMI5kwessK49NzyFcGVcECmAKC3jPnjTiNhK9FSP09f8jyNTj2df/Tm56vbJ8wlKVJtbe6zzBDWJFBUgAmlTszotT+6bR7q42WsPH2CkYyPOlYPobnvt64ekP5mIJSX45COsdB4GfPjGBGFlGBDITcdjOC3GjCPihrSuYSJ58aeDx3IOicE18Mjp9UpmBrBCTMFG6P4HNQJSJranZQRlQgA2GOp5CAmDoc8fSFM90GVh3RTPk3H21+fq2/8hQFQRTzJAYKPh07HElV+WnOnuSe7n98Xgj4aZOsrBk106i2bXOzKT+Gj/shwE9yj+lJlQ5/596nZ1PvOdbBFB9UwxUcEqnczv20wqXibt+FKjtnb/TnzmGuKqCoTLr9JTuogmMYYkzVuH6rwHLqLcYJEQyhv3EHV4S2FFMlv4dVyPJCaayWN87d7y/fRpu728FHW2xRx/ghxIHWlVpJMYtP6jZAqaHUNKEQHe/rOVBKAGc37Aum4s0bG2ufB1ORwurrwXSMFEwnpXwTQCsi6spoWiIQAwgzVWoZvnRvCYJAMU35fvVC/2pw/hSE4KMXehs0bTNKMS/3dNqtqd8tfYoo7UjX7aaWsLbJkW8cAhpZjkimCz0qoZpptwEnz5lM1QyyifTuH6Z5Onz8zfDUN3Q35vYjKr2ISruBUOhOAXLR0s3HsSeb35wQWkMmoqsV4+Eo+zjCW2s1vOM33UuzadLETKpi+UWHW3HvRYM2a5K1ZKqVNci8eXsF8mmTg+Wrx0PMn4UIIanpfWdURlBRFIxxsNQlF8ibGz50XjaB/dfHB0e/o8h52gfuryVoxrfj/RHvwLIalKAFPOqcfegoDW7FDgrdj45+1587jzcg3QZHnwKNzTeYd9vcN6BTME1XuE1WE+7Tm4PjZ3WfzH3WTgjCdxuCuoXhO02aiWwjimhRJNSPIUT/zSRRrloZUsgvTgar6sjHgxO3dVXlsdU5uamMAjgGQ0mFiJ+XZg9DLSG3fZYV/eYo7GjfXK7axtdf3B4ce6KNg4yoOytMM2MxhvLAX4SAiuMRLPF7sAOcWUHEuzcElFSWclLvPVW3/cUpODWbqmFQhTjwD44urq+dGtw8Q278sZsbJqDFAWTekR/Q6C4TL8rx/G3u/PABF9ycEgJNktqUHnAvbV9+4/RjffN4xmkYccUGCnlt+ECkRMHPymPjAgV2bVa+m+VnR2j8+HgjLbSmtrGljB0VGDzbmTvG1NmFqeKtDGNjvLmRso3x0fdsY4h9sQcrYI+q+x0Vq1eHWypDUYR70F97Uzm70wWBhN5OPhvZvBuBumfBt+NlICJqVxJlB/JgRG7JqN7qTmb5b50i7n0L66YUuA+LCFbFP2Pi2Fqpwhitq/7jY4PvH4fpJWmhfViZjuNfBRVXx2ynmSCemHAU9Ymf+2107qxyTujdoBy44CsDPbf5yevBrQXN8BlmgTY5oHdFzh8C/9duPcobfw6BL+ppyQVFIV9QbwGdcK98sbH03catKzQySKI+/5DYqIGOA90xsLsElZhfhtV6UpBkQHxBlzCLO0ToLDXFU3jx3PDhq82ri+z07p7nlMtunSZIre7C8CELkBTAk8r+molTSY7hdiaQ1M+ZiW3wJub7BTTIlrqHKEkRllo+dam//HX/zqfoPj3VziNQI20Jya+a/M+IszsUjcSvmuK0OVZbR4bcUoGjKnZx0vCUb28MHl7pg7P7EVIA7DmbxzkEEfqcD4xlkJRcCGVOMqkvTeHkKJSDQNEGL4P5t3q30Dx17+K2mzdxkTtZAPdtvMXrMFkq2zzaC7ktyDSwgrfPVw5CbilIGwkO4ihS119c2Pzsi+G3J/rPKckzwchliqJqUuGFVtLUcgSQqAqEj8zK9RfXnQSiWQnl0ptamEA+mXz8jJTtFEiqFMhnmdpptwN+W8SR+wM0DqYa/vKzwa1TmIGnI47v/KxwwR+zrSllKtPDsq9oZum0ZJAn+8AtB7xXP7U8+PQUqnp6JDJ/ywzhj9m2xHIqQZ/EPoxoGdliw8uHzNzXMlort9yc0Uxfs0BWiF5OFMqHL/MiLcYuSxOFMoDYhvXd0WaC4OXEo2pKWZR2tW49lsgXZz9mGMtRKikzPPZk8Mk1W0yGfC6BmKNhyHYhOA2H8W1YfAW0OAUI9ZWGgsnIPBXopOs+6Q00ox4Oz6xSP6DXX1TBLiC3P6Cmd1c8g6PkRCgkJl7JiYhOkloWYAxgvlgeYJg/PaU8xJ5QWAmwDEP+e4utkAFYCCPxOL1vUogfccIVU7+T/6ATmRV/ObA8PPeYrghY4Vf2RxTY6exboa7ytCDA31goBVGEDw0t95aT7S2wYwNO4FIHvVXhGMIwtHHmGvit3nmtbDna3ylbaQaptwlL+GL8D0cgFzA9oIUyUQpduB6wt+v0pibHENw/OUTJMUQ0USrSJKlrcRODZ9AUwhKrNAFyPfSedMZCFjfMFMOqyOCt6yfYxvxH/ZuPdILNTk0zlc6v3rIHsvNL8D2uwlmgEMIfB/SeOjt5KmAOl04aGET9i0/6cx+pTTTrrDWgUuYS/qLAmqBHBlfRPI5F8FFolPC2uDLfXN5fWJgbdy/5hYmJb9uGMfyiyBdBG0hF8hiGWnMdJZ3egpPZUbPIFcmbUF584oez7SijppsejlJYa4dwlj//g8VX2BCwCNX2+a267XbkNffbK3Ci7cvVfPnZ+vM1U14o3lflEzYUQq1G0o5sTitEywyYghhyH4IpACO4ofsVOhpEdURr0m1p1lfPra9xZRInBaX8nJsd+G4jubmP957of7Z6brB825PKjQ8TCyddZ3a0ISIP9Ovbj7vG9hdTcHDmCE12tgaVBgLZOuS4L1+lviychx6BTCV9FJmq+gTIBVh2oYe0gGSw4g6KjATh89YCWK3IZJqh8U3cJc5+zWqGN8EJYBTBk4sdKPRjXA5xd7ft3s7/MWr3tbu9l9l3+Z3SNvsks0cauUHa1baGtzTi1oA7CzxSmCUPyMN4TXR9/fll3oT4DUh5yyDFWMRcchsEMpd4j2D2BwWTfocGvTXmrTmuLvc0/OByT5ITjHFviFs7ejsr2vxlDFxj0qoZK9arsVjfyYrcucn3brbYnuym92HUyDAkFP68hfGhhsferYJQae9YZe9Jp767ouN7ucTNO06L2ltpcrsbNx5Qu6yWApWkr7nE7ZbJSH943RFKdzoY7M7K3N689iWvIfOEf9pL321kr5e7I6KLZIV8CMHwgFY6NHTrBtApFQm245oJiuLSalp/PscN25NDWWAfQpARsBN44/xszPGhLsuJCXqHiZ+ZE8SoQccvmIZb60z0ligYUUJJ+s+/HsyvajTJLJKU0rAhUhRkYWP0chozaaSQhQ3bCXbS0lSwk+aWgizuk3EedcQd2Ql8KE3F4v7lTc4sBJOrzakZsobDaMV+DwEBUNHW7vmay5BIRf9r085I7HRr8SEy0iG29u0cjurJ18PvKVdslOeuTSjemZO6hCPVlqN06sjH8bW96zHs2jIMzst6C0lHDLGjDwffnR58vqCbo3Y7bsqJKmGKu65kDSyNQKnzbc+7sc2rpQikUgZCgqcAJAQNp43OGYULY5DCvIlNQvP51ZPeQkpZsIL06oPP7zhs6wdM8OoTiIka0xGYowALaCOgjE8wfBzjchozsnU6hUTXDtv0aMHzNOktIaT6nmoDAbccgECchmgGpRiVxK/ug5LC1/dhMNID6iNM6BpHYfpTYEudKekFAqgROKG/ME6oZviuHx+EegsNRXNQG2vXqKvbiAh/M6VHKU+a0oRBX2LmaUpA1Jv4fY9t/B5GljDYv5iYi7C0bgPX3YdFLOy5cCxe3nK95z2OCZ4dSLHjxOl4FKIBsiNqyMfHPDXEAFd5rzJeRLsR50aWbivCvRAORKYYYL1VOjFdPLKBpimLRxWORnQxd8SYvJ6IpvclQN55Zb+XladcWAAl1JXBy+Id5+y7TKmRTs0UU12MjXJPfwAL/h8Bu1Auh37ktyvERuFPrl1oOkjq9tdjQ6IgQnuCSaoTf22NqLzbiNvehnIWMpQjPWgLmay/vDi4uOALmUBKJV/IJG7FbgPdDuuYIGg5fypjF+4gED5IAAstlAKIqZkwhlhNwO10+Bi7D0bjf8Lqw3aC2xNnTrW77vcO7t5iLB6LkducweXzIxtLr/0cg4htYtpRxBASPROnfMmRonsxYsU+WLQE6ZSlRYUoyoS4tLBuJqm+/G/rDuC9mMvXqak9DyPi2Xhw5psFH5kPwrKpSfjgOHEchGUhpRanQWiNDw9xR2KGgKPQvEnmZgGmah1Z4a63OgkWc0UVuYwmSbCbF4YLX3GZu6XXXpTBTCkWt3NSBlv2Lo/8IuUBtQNph9AXzOB3KASRS89Yg832js5B7SAf1EVzTKpo2B4vI49EDSFH4YUx5jDZ/NQQFz0/K8hNT6dEO05Y4QfM6eog6y1EsRBMz+VwEMIUOfwfmQHRexp/xpGgMVy1Hxb70cob1ZQ60ChtbD9mIsU/tN2oclARSuRjrTfUP0bjqJZh5WIUSiDotrf3UH3bgQuEtwpuPxIqWnfZkIr39yN03suqf69L0nI0rjsKC48PZHG5hOlONM2JSXBiZyyf6Xe5GFOgaUUhIpHOrlFR7sjs31XiSg5D/4cRBXGA8gOcv+5VfEFEbPDvCrVx6FnuqOdzg9PPYOIUKuTQQxCGhk1jLJtjNKiI+Ffj7D6kpiA26Eb8C95y4q9MMHynG6WTFQjhp4TTde83xTP6/o3NT17351foDJJyFjrNnWIxUCKPUkagZEf0XQCnQBbFAkj5I9ejB+A4S7yUoGZidxbuImCCvZ3DrGWbn32xvjLff/H1BhanR7KpGgRicNI2BtF4ff1mL6CaRo4xJKImq/mqJ1TXB66KyNP4xpf9K4+5nnySccUVJNG6J+zatSNqyRaf+aIrzU4CQQdVLjAFqYShoD1d+Nx52b9zcXj2GDgvT3Vmp3LxsyEy72GDHyk5ryUPaSXdPzwrjhDdatpbkPvfff6SavjqEl1SwRN8YMkPy3klfcq2oaRG+WF5aTiMt+maqdsoe57rMohDabPbFj2r6Yjbmot/CzrJQNz2/lpxJ55uZlANhZcIZAuD01Gs4cQZnC5+3390kZYIPM45DfwiYYjCMomr9G0AqnAhVghD79RK0iyZUcbo3nu5I8wdxdx4888GF+cd3OAc5M1iEsNcC7z6E0g+angT6KwEayEDvABKbkHiTlRV/t5eaVQo0eDmi8uDM5exYH03rwdd1VsmorCrGIkiBxqEYMlDSn6FKMGEWVHajTjxWosTkuFd+fDhK/cmmx9jWYN2lLrVCCQwGEIaw9cGTbtDMBSASWj64N/e1zgYJDCUcNZzdM7ap/35M/0XK5xav9vQnsj5c9gT+q3HUhiPIY4SCuFLGLj51Ja0w737B1AQwpy7tuiEH59U8TN02WC/6JZwsu1hxPfAf6NVnPK41hIpiicOJJbB6A28d9dfXHewm188VQdeIZU0hwl+Ugb516yEa8EMjM/9S0DC4XQ3b4i8WT0gDtevbhMT090sp6GgB6V5/IBeGvN4i46Z/9ZfXnZyXam4RXxUFky9FVWLmk8VE93B0CLgJ9VnWb4fTyUpwlt+hURJPUv1subtzRRZhWvrW+hojOP56tzg6rnBg285QThT0HrjD5og3P+oYArhiXW58uOi+d0E4UhfSrL75jJ5tJwbLJ/neI2krflnWxE9rvEA8CnbHbFmZEvavdUmu7E6Ssnd7mgpcXujlbUDR1Vs2mdtFwC69XIAzATddy2f3/z6U+o/BIpClG6AkScz3UxiSXghvLmH84cWwPx9DOaCNDeZm1wQiILX80IfTdW6tXbwZhZOgQTF0EbpmHwcaKNtbc6pKRcaXGrfiHy48SVNSrWujGUlAjOflKSjxiQSe6jdzTNsH4whb8NsbcGI9WLsj62tD7U8vPWwje0gdkOg27fT7EarW727M63rNa5VkqNUpFGPXpttrcv0X6t1ttI5Rt8UlcS2KiJUD4EIFwHOk8HZ6izCXc8PXlzxItyKby+FsTcw49TaCRG9Ina97NxKcorUtDJuawlnpJsRTluLJiOWvM8SUUHNOqa58YRoQIwYIbKHtT4icAzDxVq4v6WH/qm4wXWcvLn897irhTZcE0EtGmLPbWW50SB0zLH8O7d9BTb+yW5efzoudAzecWIC2Z74qcm/0nLdGecc3usWV9VNRzc/gujes3f6N/6k0b1QKgqCxdDJkck1upc/02bE4UARCJRTfxq+vuKJxbKjpzWUg+pHdA9gUqsO111DHKgkZo5D5tYcYv/VVT0Rce9crWQNPRqPqSgTlHMoFxyEVrTafJxWtBVzTA5XutiKHpZjE+FBOcMH1QZTDhAZ8fKAAK8tXNX30mdMHPaZjX6RlwmiX+hdNPrFdJePf4lnGMpHv7y3riJs31E81FSXro3F7j80d/bUD0VHjxt/0jM5bCHOfzwbT/0e71ZnsORDNMuHfAhf8B7ZIShc/uiVLcGadLMITOfKcOmEmRQ8utOZbq4uUwY2OmT2N6Ruxh65Nrj6HfsM4NGa9BTdONEhc8vnp6URqYNkrBXbDxq2rRjkmHEtXHDX4OxEqCYjo9HG8l0jO03HWjuN64hmrYqMRkwpGKAyI6xgaE4POXlhjAItIMp8lwtryzXdOPS+mmpFzagSl0HfHE06WgOAe/32EpUBOJjledZ0c177BthtRb3H4H8+4xO1U3eUJ09p4uisaWNPkycJzRlNfvs/OGO46fc0YRhNbifimTivVqCYpYP8QwBGe8KVZB8cz0K9O8gLFIytMzAePe6/vtd/dVruS53pTk1WK2nKd7GtLIe72OJI1P3Nrh2OwpQ0sofvdrk7xl5skOTdWu56PcUycYdEoh12R5XthSj3K+09S773JHPekxDgA8QChtJaBnQdvp9FwHl9RSF+SMlcCwuAL0Cun9A5b2akmeWMWL4QwXVV9myBV/8A23EzoJj1l37kOVFwbaHfnKzAzvwXayf+5VjnFiDCqw0agYm/9MYiBEXkkyACegvQkRE4KmBmh6PoQD5/t3/3XP8F7cxB+XfIad3tS52AbcUVm2GaCoDWIcFcrDUQMV+I5BnnfL0L54evb0CKcaxnMhsdzON6q2txJdK8A+5wcESZU7kMyLdBshVqT/5wD/tl8+ozJ1H7Fy/1T62iXx+ENbtXdbSY9aOIQ1eq2T4+/Dok5SYGpy9SuQkoY6rnQUSrgfS95QjSGmFyFGdS70cmwJsN0q78cAEvGy9+5TgZvj61eeQ63usewkRzlamG21wJaoowFbktFWCLqlAGxBJzNVQu8WyMRWSpZCyeWlVjsdPNSrZiwrWi1VRMMHvlHyymdTpBRFOEICuUTkceTcXxFjKqtqEVZohdEmanjNcJoaNChvhjkWjYBhuIsfvb+vEVQEcghtIRsLxVCMyShm/DnOEEW7As3PRLx+t4t1Y2vl4r63i3hUH/HcqFDzPUJxDGt4BGwPuAi8Vp+7b7uQnseUlWjgOpmU/pJQLPk06ruw9sN5hfIdgBDPUO92BuSL/9fv35EZXaueufuAEzhZpi8S2oiVTl5RbkylubKcKbXO4WD4FCkzCug+d9EvE2FuJ1aU2cfjR8/QWFp6VuyKFnUXrD47Hwg9muy7OsNMNkMlhzD1gRY89PBDX19N3GzwJ81fIs8MMF00BtPFx5xsLb0+Ajilh2tAngRWcsLSdbDtMqRpFMOcfV6Bp++8gtaCeYN+Ye+a2AW3g4eWlh014ga0g/Z9hCHHBqRY4da/ICxbcdY8Blvbs5Rv60fri3T+sc9T+6QXWOUD2onrBKAg/eJr3YFF1QVgNG3EIS3ntYC4aintzkf3WZsvl3upmKWhWH8ryzDTr0/OaRIyycRebZh3XaqfwxkkeETmnEVchYiVKQIrra39vaEza2Yrstdtgotnc1Ufc+dUZYWQmmLi7mRHbPfoB2TG/5HwtZkfEn6tdiYmT8iWb8Pwb1oMfmQ3YUaFzB0Ez8hfUcdtO6FlXyhG2hWbefSrlI53D+zubNJ1Sk09HCkxW8PBEqpKMtA30BByuddvb3ARhlsoOMX5xGGmEH97+ExF/iGovg8f4k5Zwo3ABkEZMYizyC6DZitbeYQHGYOnO6cX5ucOaycurk/pRwehhuZzyfCMFsNtgYEawio4RqGSXgjmUU8UM2a+14mtlcpSg74XPz8YvNjz2fbuAmhU8kMozi5wKjilbklHALXYrohlNqIWTVzZQqlI+tOwt7miJkIfTwfi3IO7H2Vf+0T67i7OAkg/qFeHOVk2JTKLCSEcs0YKYF4pc6eu0ry3vQgHkBaiF8gU5Ww9SV5hWwOhcY4dXwJU5tvPjUZ4hJWvsD/uN9UHG5yD7Dmxcw6OXXgCaC+cKt+JegZuw74IYkacVu0+P+koq5vUXwz5zF/0OGRb4F6C8+Xl+d27iyKMEoSdTJYX/kbPRJvn9JimjlVnwDClsEHAHmz35jX/MLbt+6P1ygMHWxuzdvfDS48p23u2uUKKvk8Q1lGmsIZs+y4duYC68ZcbJQ44ZKAuXqRdda0O++QTN/TGt2ACB2p5U4w2wf7rTQnwwvkIZnVvs3lmkxQVGkqCE3cPR4IWRybxh6i48B1p0MnPjypKP1DJ1ymOaChucu+LDsTjblxMP+qGOis5FYWfKIlIJhHq57yIR4+Xhw6USIVYDRCnh0Ie93bnAtzpd4wd4NLtmvPNa9G97Th1muBMmc8rdKstjAF0eZWwhlXLswxORNEIqIqRYmqObpinWCboU3CRtX1tz/dLoejPJ6ea7u61bBJc3MUwYuCGltoCQesBX7AtKQeQFupSDkWuC1JAVvtIFgABhdN89uIU+XRoBg7Agk0+/AvzYSjEBS1DLgC8Hdj14QeJvDRtT8facN+egNnSDKHU+eELbnETBkm4CLLDt4y69vwTAs8Jbl2WrV7XR9YeYK5gBWl/g7LyEJsJQWooexKDMUuk06tioz/SjV4QnI59chJM2vQw9HIdC4msVsI1lTS40ruCNvsgs6PeWtH7F4YF/YJitn49wSGzdi0hgjxBoeampQIopJtSuMtsdNDp3LY/qKs4+derdaXXV5oGO9auXaUmunNj8+zTpUNOf7UmVWj1kdpqrL65BQc7ybsH9nuWwEZyAsVTyyVFRZGEgqXt20lFn8eKFjRIKKgfvy9MbaZ7LedZX7tSjrj1acLjSzvNiVA5JymGq9FcqHS6tA5n8w+0c5OEBeZjesv6nAEV3iSP6huLEC7KR3xG6ouI3AmaEjQH9mgHzN3HEuDUyWTEwQ1dTET4xjA+bgcFsQt3JzyEQS5ZzD6J4zRxegU/G8+RZ2T/+jR4M1yEy2sXacty7R/nYldnQ1Ioz3WTD80ifDwV8CdMX0aBZEPRSjFJat5RCr2zhbI+Bv4/T9wZUjlr+q24fXLIMhljIoX3P+JtyyoB1zbc0hGiwLIfkeJykJNMztFA+saYZ/+03/oydEyk/AP4WGd0msNq1TisjtmxuQYYa6cvPGN9qVCfZkbxkeKzS5K1LxRz+UVW33Q4YpECMHwvlxam1w7qntfyAzvZ95HN8Dh0gIC6LiKIISahCCm/Q1TIHnGboMZ0jLIT/Dl19vfhPM17Q2G0yHEMrPV/5agOnapXf/cIWSwDtguHA59Y2D98AWT52NscopF6ynCFOYVsdWnPlGIsqnYHYabTokJB9gpKQ0UI6QPZGRMFIyduhMwRChxKiryQFxKd2YP04upWnkfmeXUnhUnUmRritkeL/k1b4jH76+oWofQSJB6IogdpobspBl0+pzRhm2OJkZnFiA8nhzYz85ovVXnO03PzhzeX3tTv/iQ6yb5kwiCXljOB/DRt9gINf4FvCG0dyW2mZeXNezOmip/eMOHwUQcsTY5DxXdyIozjs+6iPVBF5uMlECr6laxL7gERLwHla6RDGy7SA027gHSffEh0HYKxcGQtb+tJMYjqWpVtIUn0Vyr1UTc/OzL/o3vlQTsxnFHbEwkZatS0EKUJRcCMVHHZ81S94NVycKtRTM0xZm+QnE0KsTG1ce6bKHfFtxOuVoCwvfAAYrH78P8RXV4gUwQZb3TtQKGQU/QbgRDfgcPH06eP7ciqdmMzkY6FPKC6dwBYXa4cJOgq6YBi0AiaRIc9p7BtEhDawTgGs+AY1KgTJuvQ/mPqZYmTSNqrNgWc5IiEiaVR19huTdfSw96CuLpTgBiKWX6TUJciTg5Yd7k5X8zQ1I49TwPPVv3+s/urJ57zPiDMmYJ4FgfhASLxY8DhbeYgCmEEJNBlyN20lcDXkBxVw1HfOV6Rgw8ky3gB9HNewWBAygFMZgWHLJe5+0et90iqy8nTvoWdl4eYnjmZIW5E9gRtqwbTBcEFKAofRKrHQ+/syp/6jQFy24xPDtP3zgu6IT7zedAcHHtVaWRrY7BNOiKVIAEyKY4el0J0OOequQ/bjDSuq7p8PnlHusVsvaZmQ6ENQeDoyDMiAKIHxkuN8R0rEFcOqtXVu1e7Y3NYXHrkzGndiL1uLbpU32fswlb/KIvUO2jhg6YuaIrWINFTVQ2DQhw8QaDWPNhYKFQIaBNwlCBbqN+gwV+G5JC5SkKLdUk6oi30ltvYMy2bvk34OM3rM83b0IfBdZtQPpQrLJy5ZRRwZwLlBOhgn3KvVWb+XfKr2V2bfzvw/OC84uDl/PD489WX95uXBq4IiDvJe//Nm4gwJodeKXP/NR+uKntfMKJ1M1yW+dMbGvcEJYYyqcEKHUoqFnU7+MwLOM9jV4eFWxu5v+pc90g5PHIPRli4ML0gl9EzUnYBme+1GKZsob8t3G3JJHMCY5AqTvyIoA7ZERIdf9P5L6ew4gLhywzy35Kh4AFB6uA1hwtl7DnGKyvXJqFyHRbcG4PMzfBdzP75hCzw7ab6Wwr8xGinxm3CRGlc2Q4iRDXJJrDPvFaBgyOMS0okbMGrsp/JH7EQJ5PzSHYkpdO4Y0CwkA2LgE6LaC5xFijfU6AgZLLkfYRsHhyPUU9ql1KtfWpBnFDHEM/RhHs8h0YNnJzAGO8zCjORT6l3nTkIDFx0V7VVHDYdZMKoZRVgOw6IlFzArRW6lSLBLP6Tsv159f6L+6SjN7Nq1DLICYZ0grA438mEE2A8x17XFNwBzBsdX4AT+ypVyUpus5cVFxAGwSSsI1boO7GkamXpVUiBA/5MhxkWLXUDFg1zd4ICIXNFAQ+NVVcN/A7nbz9SAN3W/weDoBGOkiD0jM6HL3I0WePcDJ2Gr36uI1Vhp7SWwF1tbi6v+v7dp64ziu9F9p+CGrPCwEJ06y8MsicGJks16vkxgIEGBB9Ew3yRZ7uunuGdHkIoC4tm5WdIu58kWURMq0RWlJXahIIikpfhgZ+iOci572L2ydS5061TMjUhT3SRTZ9dX9nK+qzkXJzFcq5JWhvc79o75xx6yM2cN3WWVNvdo+fN3tsYcG7rN9obcO9rQIhkYVyn87JJKQafkhmKQ/VqIG4e+h9ZVAQfh7TFeffuBluv/5qOBApgQnuE+nx/5JcQ1D0f5mA5EvJw2bbqy3uNRZuYdhy7NGzl67/KML+UFlJSAhG2Y6IGeOSXg0ShZSxSO0v8GIhDKJeYFxOWi/QJpGvs2cRAN8TEDw4snfYfeuX+/ML3Icrjwrg+mcMwNYkPCIzZFJv4GXvzQs0ANAkJlhWdt3wu5sbpLtexkj9KzhoK2ypdDTmI97YT22Lv9wIWq6v0BhzZY7Z+GNcjrMVHihxKUU5nJ87bwQ4SUwH/gvb+1s3qJTEpQPVWl715g0CkgG4WgJZeaiNnjspH/jtGmNEJTpOE4rBhiC5Wzn8Tf0MB/zWYqxfTdLAhf7CAH3bekRzTempyrJnL69fMSyDV0Te13AyRhusx0HoUqBzDw+33m0oYPbUgNmozAuIMKQNrZvmLGKnLk9NmBIrdVqBJ2hfTjHdwiQCU/TEh7n8AEaqYQcVxEEbOa1grKH/T/uXuysfA3bxtSJoogqZJUJ+emDGXwDLdvrNHpNx39U7ZX+UB3cFx9XYXlcKK+38mm0joe/sTYtnTp1A8VK1TQdlSoNF9/7p01IQ0aVUZi8ukZlqU8LgcV+dR70AhZghejKa4aUNxMzVjG3HUecmr5G+cXMMJvmGki48sghrmiJmNAAHGaaWzWuYoivGyim+LZ9SJq4dWiHT0vE0iZvgdiM3rCZgDw9uzynhpa9wJYeGQ7VPXaOR3ZwUfB64IryRvv+a64GRvI4VaNo/WqAUTGaz6lAzDhORcCOVLlBBchoUGp54kpNNWoL7uIoirUPlaZUjlIIogPQ+t4IfxH6nAbHKGQJWjFM2ousVpLU76h00vZQZORBiqaDEAsHuklfaTwOog/xAay4Yeb6pj2/GmKwD808RBIC0P9QMdqnP3NHK1b79DdWX94N0i9GsTssg/QOmzz2C8XviiQ2gozsueB0uIXXVpuf9I7R5gzHIVIMesa3JtA0P4zCemkjk3ycQAgpvEFq0q/B6AeMvzdaaUAyC+IWMTb+Bm8YdjbP9C88BbG1eYyq63yC0WxmQIZGFosrA/fLIjxiI9ZEIThaw7ovcow2RKZia5hqtE7mYp3Fu/2zEJGmLOIZ85URgEbTc+z8Am6xpDx7YMVw+8BmLAwF/W2vmslfxAdMhOx9/Wn/9Ebv8fd4NwKYpnUxRpLRIOT1UW+vj8NZjcITTOTS2IzSxINd2yfg4FVOmVmLCzSGA7eRpJ5QwRLOCuP2ZAGmuXOUEvOvaLsJSc1Aqsz/T28BHcUKNNenYyKU1La8RQFxu5ckYoLcha6hCURkPZLhsmzxbufUXfJLnjTtQCt6DgECOAkGMMTgC+KnHCVp+z749xUU/sSgPl/A52hkNZnNIG+gF69BAtjbVztXvqbQOmlgSue8nU0XqA7EbbVv1oM8qOFfcXGhiR/Q8CkKmUDraWfrTO/mdmcFD3NTGOArsN62eRqj9UeQ20WUtubCAKCZejXtZbIB6H9+xWK0Ury2ho8RQ56J4gLTuzUTyl2/SrG50IVrZbH7JcxFc3IiyTDQMWWINKVsMaMYMknVFmHsMvwLP1h9bFM/GKDug3l6+wCunjTzHCd8zhzZwMCai5F+aqWcsL41IQGWjp/uLp7ixqRZnqNPWWY2J1i+FjakYZjEEJYUAShk0PNzGINi8VT38TJFPGgEaYr352GGIdYNiA02lLWv11OIYGL6VdjsFaAmQW7Sy9vGzc69e2aZoku5ORaZQmGdHiAQYLmOMVbqrDzDIoqnOReRfZKjVQTQaK9YBvyqce2+Qd/Z/Kx3as2ih4E80+F/M4eD6O0bSRQfNV0KwS8eNyXg8aBvfEWDDnH5p+oJ0vNwzpbIYpvkDcriOKZxk+SVERq1ALCgy0vLBonoLcgwQKPRs6XSpGklaZjBoreAYcJ2BhBhi5q2hmm8Ht80kL3HJ+iNylAuAA2MeqB5AQwLH+KFBrUTBJ7Z9+hNhJgJXQd+xJgPHpE3EWHCxjG7ne7q8c4Ct7o4FTVA9hopZzhugT5rEe+hWsDBGtdweWElnD6y/3ewkOqc/w6sUUx1mEcypGzgwTjYYZsTK1yPYoTdIMtxzTdQTNuq8iC1JsiNfwTNVZN6E7roN7UYcKJjk2UYlwrF7JWEw8qFkxBdy8wlgE9gRrsfzpoR2p7kRcuvXt37n3W3Lpl1Sw9fRqymAdgDZy3aRu17PgznCjGNBcOQqPJyF2B6vG0ZEnrGe3HyL1AHJf+cotS+AVya0LsewmFuTUbkFI0wBY14gj1IwRycIuNtbHY34D1rCmI7Gm2EwfDy9npRHQPEMJgleBUX+PxoINC7H7fA/f73Jyk6R4LRm4LSHJzqDswUnWsVdX88Q8g5iaFNwSQ5otEEmrz80IwicCZwlhoygiEumLCRVAHNqqOsejQxtONBkuBet1DYQNnxClRvevNTMo0hc5tCHCBmHhiLl5yhYBWGq3v1i+43tzub3/U+ATNs/Ho8sMXxbpyR4DWSH9staABGQUAEpgMOOw9RNho4+V5tuCse3el//wiWAFWJq4Dr43XQLM2xk0JRUG28GiAaBdRiIwLUgzKcTJFgIPeCXGtmSUP6IUp0aOjWi2++7Jx/2F2y1M55lJfhkXwSEvqatksMObM7BRJSj7aX8Cn4/MPOFhg0jIOD7iwFFMRvj3DACVRJR1PY0IqePbvMhOfFyXO4sJCVRWkyg/vVK4JnCRrO9q3IIsBLa8kYx+YVtTNrdIJv4DB8eRraKDSpkYl1I7jNYmhmdMHb3oJ863RHuDErpp+nb3ZXzvYWVvtn76B5A4g9KY1zXkGiScfvwFptAoPZPL/QIvEB5wZbkU0Cdvdv3QcnuSLMA0aliacwyWbAlBFJFcbj7fVmqzAdLfKjBYWr3CLdisBLF7tX4XozBoPCZmK+xAZjkTSvFRy5kkvjCuVdRalMcVMZFNpUiKI3FEGY0QjAv5yjU4ZzmME0gz0P0QobqEUvU4Ze8lAxqrogcxMMb9w/dpx9Xj592D95q7Nyg+SLWd8EhVrWcF/GRZHA0NUa88RMRE7y9Yez4PCh6rK7a2dzXapiAUsAoG/SKEoavMkqFRt6M42BWYZeH7zCiUmflConCzlOyCnCnkyE6jPJJ3bP1N6yeo69F/tUW8g1c2rh6sKjecAcb9aM2fJkziPqE1LLboGRIru1rFZTUMtA0aqGGejO9m1ioIp8OoqnaZ1wOWZxzN4c14JnsTmhV+sXiF5pXuX4jmY6wnIsxbHExrIJAObv8CNhDqLS8aiEH2xdYk3N2tlqU1KgpDut4mR16ek0q8tIjyklplSXp1G0mhLtJHpC9AJXQvI6gfzrszRKRmCztIYarJBWoplEqshkfPezsXurUlNEpRVfIrS0iGHJQlKFRYoIEm8z02EBty5A43aVjerty8Hrlbg4mrwXFL+EIKUE9371rsVIgpn21m8wTCnU0177k2efs3Kpe+rRzuY5rtgz0SnyPGq2/j34USDYLkvtKGsdKpSPjVEPxn7u7lrgLJpPm0lTGdaW6cxNBh38Wri+AOHgrnxrTQZmyiwckq2sNKLRd3kW/IFka7YaP0MX1aQzdLnK/IxlXJeXqBYypUNlIRvdGAq6HEm07OVTgM4WNwhqjX8wAQ4WdDGzBcshCYhDUKk36GvnXtyaAMLV4qfa1RnPjfyL2y62ZzlsKE3xuPBzv1lIz5hntWLMY5BdUFJC9hxlCVY9ljUEF1KA0q0tpAlFaBXA6dRFAy1Xtub3gC7WMxbYep4LqJjheGgaaiiODhBqkcwJRp6+6eKWGsn2Gnh3C8C4bMoWNtA91TvkzMd1z+mCJSijILTlDeS3I0MmaSlbAVB33UjysyN2nEaAnSBA5UNVYhcgNcUuqRGj68GUKXdhe4eieMnFbCtDNzEyKZ1vt/DiD1BQVrqFODAf8ZDy/IpE5XVxF7zTLTY78JWJ1LPIy8waNFRW2atOoZSX/GDSGk6lCVleCYQzSy7BfpL8roDFcTW5IRWclgyJ240yL17JkTE0rcRUMlLkosgdLQI9cbVbKZFU9qZPrylqMLVWi4sD2dKvuelefxt4DUCOR1sTil7/kjoOGd1LCjbnFSvD0SNVXV37XBFDrHu50g/wgv3dIUY4XPQQ9qO9/mHFFkf+DJWev1A1yZE/l9zt34ESmip/6SVtHWmfw8XHxmzxj/A9x/Rr7GeOYeRRAremuTKpvoBXfPf+q3/nEVHG1kcSjTtqNc2RNs3F0ITLO49DBFAuhwQkLocWLvTBbOYTQqP4By4bvYqAgEnpxT2NUtPPsoEbFGX/NNWtPSS1p48lqeYrjQha0SfNePogRkSBiSVO5FiKOJ5a3ofOp6NpCpbVFCXKIEZZFktMj5dCcssO01j5Nj1R7LOUGH/R/iZTL8tgUV3Tz8rfze9snvWkUPMfsjxyT8sRxAnJFKIG84EsCtx7aXmGGMpuJrLSTKxJ//fJNTEoFWCSceZPZFfKNaC8+2eognbOQF7M9jri3/SGoVSvyRpdg9pm/xiOKqnZ5PIyjgiV9KhJ5GgLUBYHbFNlErakyrTw8kSO05NqPK999FKtMIYCVAJQCklBHJmaAZKCUxJ6MxIPKVclJ1hMzFv2MI9D5nDXCcRKZP5cLbZ1buaquo9KWqbSvlGhKWrrC1mhnT+ErwBUrJHoqIf+CM/m7d6E4nq7S9HR8SLRHYiE7G7yTAtkJcheLkFFemr3oz3XJ+LOiToedxpztQ7xhaCQml5HOhzkTt37hqpuJm8PHR69H6B6u5cOy77Y12qtri8l9mVd2d7atTWM9pRJ/k4Ac/HBEDsV06ZDuPhh3n9XsVLBP/JCqBip4J9KiB74oZFe7w6hOm+NNFYxZQ3NgbLNsTHTAyE6b3lEh4M3mVphTIlkgPknOK0Jw+gubveP3ReGAR9PTkdhzIGWDDUP01Y9KVrmTOnIhg+dO2BB9LFoOXpgNptxLay7GAHkYg6vYp9P2OxxT070Fh50lzh8RJzWOO0Z/WSZVC2sS6AARpHC8jEnNMOflY9WWcZ1SEwgSf7gJer5AgWP/Wq1d+FEZ+VTXCz2SxuygP+rQhbYL/K9Qjk3Kf6F85TiPM98MoFxIZ9ZP6Tag87x47Ke4b1zckgAwIkirHs2wxa9gAfmo3E0tIof8D5bqnixCDMQcR1gzdgMyiiOM1eFn4kHbZ9MT+1FI7w9YPpkjKZh9+LTp2CagrE0qBNRmKdo5ZRIVI0JDH8FD90urgaiVy/yXC3+TR7Vom/ypJbqXZ6tS/clj6P2uiT4NGJojV5tr1/s3ziBLsWR5PWkny29poK8wkeWDOUnycmYU07gDF8pMUYh5VDrHb+B5zQMTMjxV1wkQfqZqnMlMWvZ5JzdUgjSebJEW4qgQgGSLMBxo329LuEznlEMZhhaLT16lzdFekARSKWNF/VF2IBQkiw0BM1DEghX2PovUmk5ZIRpPZZgIhBCyTokX/7yxQIcfaMizGuz8RT7cNL3cs6i/+a7l7ZHJCpgL5lSCCaa2SR7ZdDearBPtjykfdbZ+u/OvfP0igbmbvXS2WkYNghPAPhsmWlMfAZgLBARiOEB+KXtOwk+PNO8PD/XMIuq4SaltzTfuXNCJgX0B8QC42lp3zOarcDLajs1BOegBEOXtnkoXXFuzfR0SNJu62ProU7vxkCh8IFl+3xv9UxvYbWzDVfV8L06S4aGPZnfKDASw0PRdEg/hSqHSyiehVVom0g5ngjLjFNuwoMdPELjEpy/0314CqUnyG/rzRsfoc9tCmcpTnkrLYDZYRDHhbNXIlT3yjJrKwYMFRy3phlnGN2MU7NRiAwwt4ao0H6Ctt7Ti/35hZ3tv0qONincbOWTTbQPkF/ZXG3yi3AQXoPqstRx+S/3vAkakzdf/vxcZpU0WHLZldv/9CKo6Svfd7YwUSwVoTs+/lk6jv/NXxlM0joTHC+YvDltNhWHkFR4zy7XAggnAI7fsjUYeHGtf/tub21B9gij4A5Jk2Z7GQie3R/uF/noOgbBHSw13MGIhk9baWwUPC4AEIoU7AFaS1fPi9vd02dMI/n2GehUkEKRwuoqRmh6gLmGExwfgWkHlxhoUWOgRVbeU4uYbTg8Hrqj7fsNO26v3hwuPzpoiUc8d2OdPuMUmkjXQOkIjij/VgjdHumcR+U8HlchWMKrhLQJ91D0RhMaITGKu2i+oujGS7mG/Gvpwi4kg3mB1uK76HCnv7X23VX3Or0rCvLl6lGpRqfIXq7GfBVGzTuaNElTcKgKp7m0zvKViqcRdlEnTvZ7cnnPUln/6AToq4pPJzp9obYvkabFmd7ru+90J3SoGTHs+JHF0qSWO8EyeDjncYEQpWEykad5Vo8/rJ7SwdgPRvqPlIp1a7Jsr/1Wn9R7jxfNuO9snusu3ul+dsw7qksNPwpmsYJJqsFlZB1xTLdTNjYm5ZpjP/UO6PV40ixCPNbAvtrOeO2ieRha8Cf0uAPL+Pyj3rVvu4u38Cqq1miZGZvJsymy3TdYeQUKl/ZkhomjLW++WbA/RNDeaCgutbO93Vu49uKrvwiRgjS7UNRGRBF493JBrQ/QP5CDIzdssin0Ak6efY757C6chfQ3m5svrlwl95VsKqA4AUV8VMEHs61GBdy1u70NrfZafOKaNDeuw8NeErY+qjMBFFB7No8Z0gYKYTeJWfa8aK8WXswQFG4Fu01sHuvfOdG/vSLxQ/q3b1LcD8w60IwnXCSRmKr1gjLauiW0uFTp+xZTJdZeQsEfbsZxo5LNlerxHiW4mlhyX7mKnl+oIxVS94ZU2/pK5+kTd4GI9uVgARZg9XKRSLXFpfVkDIfUUcUW1GFQ6s3Cjo4c4ilrtms6GVRcYlQkQ41kklroMhHygKT+YMidp99OvhWQdiIoAlYvPgW5+kqBg9BePlKZUO1hredV3KvV7IprtU2DyItn1qvDZvLxO6CgfdAKmP+KwaMSVkcZPU+3CI7WQVASGt7Bcrs4bnBN0mm5NvkTj08bA+XldeMgZjz25psmY2CqvWl2c+xD2FcN9iZu36DWubcNB2efNnjzyNMGouIlcn2OdkqTA1aWHO6/gqEBBgqPfOBQOsPGcbcqwiqHoVrBF6u2qFmlVNKsS1tSlfNkl+6CNB/1Y9w4zJLKiaXKFnwdQfH/tJsPboPpFb3HHWFfNlT5/S/f/a+zYRHcINDJe4fLEA40YOmB/XpnSNZSrPsQOEYa/fz7IJksTa2/r2Qv5Y86i3eNwuY1U0liyp+YzoTpB4fNas9NvRNZYhr7r15G01HPIYQAQeINwjQCTOOLCHR37Cc6Uks9a18v8mwiCcyimLbboL09gx6Yay3DFgzPqPN2+mLJHHR7G1u97TtMMahsTGUBLlRoZFctVSh0wdMwFYRUpVyw5Ie8YzC/KSDpKyEzlrjj+T4onojiFKfXXQhxKgZmQXwppCvQ4AKpwaogErXGHHFxwTbEdx+OmnOSQKl7/Eb3q23KntTIozKZCbhRkKShFSVQWGzFBC5kKukAIdyE4HVWvlZ49VbDxwvxVySzUEFVXgbQfRcH0n8ZeDH/uem3fhmwxEu/CgikvG7gb/yQMZH1u9UWsAg/SOockav5qVZJJFVsSxgZ3CmUjRtCaxsTWgK+kQmiZYO8zaEOIA4XxzUvJ6plPzK+FNBDhsCjQaTPt08Qvgs044bbMiEnpms6nStJ6YGZdOCu5S+V/bXBlKieCqhAqxkcoQJwdNMDg/LJWo2yC3tgeqLY9MRqFZgEKqLnKH4JwCBRq6lsp55ScgDegA8qJTVv+wewlAz0mtkK7w/sAm88N8+q8aTl/y/obCIrX/SjaoXenr5+xIIjg6PsT8S/tvj1haUWkyIhRTx6ktGJK91/6bsTSlYaHYysOPide1C7TNbmqPGo8jRdZl/reX9rcAg/y5vhuwFM0pAkp1DRITysmEXxBxTGppI/VSgZftS5fXVn+wz3t0LI8IOyWQ/fHUbD3hxJw2qQ+hTKjTv29SazLyn/Nto0h2lpdsWHzbQVjsNJ5s+mZ+1b1BcwsgHHsxIu5996+42P4yhLoAbd2z+/0b10cmdzXX/7E/9b6pCt+df6yzfVl7Zh4JnkmmYW8X/4wytD6MZKxgR+ysJpM18A0mil+Ts4PObj8eS9YDZNQgxx0wjfb0IisZ++TVd4+D8aw38zP46NvfGf/wfkaIYm";
\ No newline at end of file
+export const w="eNq0velyG8eSNnwrCP+Y8Vc+E0erZZ9/WAmAIADuy8SEogE0gRYBNImFFPnFREi2ZcuytdiWV8nHkjdJ1mrLixZb+gE5dCMESN3FW5lZawOkqGUiDItodD6V3VWV9VRVVub//u///v//eqXZ8uqTdW+17i2+8o//faXue82621is+cWQU3fbhVf+9cqbe175h/1DlV99Q1wtOkWvunjY5be3+eX9fZfh5n1wtenJaz5ce3O3da3pN1p+018GaPhFXq+6II/3ykvtFr+0Z7etFSDaRfMrB8wiAOcV/siu20i06m6x6PBfR8fTxdnJUnrSmZueTs+xmRRrjLPZCEvOzkTYP8MsOce/DM+x1Bwr5VhyjBWcuegEy44k8rN5J8em8lNj8WyKvTbORmdzLD81ETs0w94YZ+PTORbNDU9lhqP5zFRkhH+y+Vx4OBfOZ2ITyWJ4KBFJcOxZXkg4moiEo0ORRGwikoiPRfhPYf49wf+NcrWbDb9VdBqtpld65R//8z+v+Fz9mlequ/zfUM0v8Od4dM47FHp8phpySyH/8alKqP7oXIVf37z03caZdze+eqf7w1/dB8f5lXKdSzqtZsMt1duhku+X4bV1bgcr/r//wQvqfMevihesC1G4Qbg+pCrCwG+oq99w20uhdlxicU29aqhc5/8cDj3+eIWA1++923v7du/4R/yroarfCrXqzkooxS+biF57yS4Fyqi5rVDnpyJvT/94xetcLPBCOtdrob+vHg51rhX4Q9T5Dxtf/tX74tSTi/e7D4+t/3Whrzh32amE2v6qWSCArzoV+Xo6l1RDr8Hjd65VmiF4Nv73k/dO8KehRtly6g7eVnfES7I6Tj/aTrDcSqsPTLxx1Vf8KUC6wN/vo6urIQUZ4i+lKl75+p0P1u8coRJ6X/9AL77uURnVqideuSoitMpfq1WKUa8DirLq1ypM1rIszKpiA1xWcU1ZC5fbhX+84laNYnifCD06Cm+ENyAqYP3+tfX7n/ErLS8ky1gVb80wRoOgB+EGQLdCbPpVDgGg8opsiQNeDrVE861QSzQ0phbY5DVmq/wC6FtCKzMMBTR9/VY6t+uDi4DX01+1/CVR1RrP4cJNBqZ4jAGlDAAPwG6FKfSvmy9ooN4BfUnTpoA1xp/Au6bG8ffJNofRalLz2Lz5q9QSmkdT6Vgxx7POFQTkHUYg1raouo9XQt6jc+Vgnzn+0cb9L6Ht16C7aIXV8MgBX27rUEj3Wna35za27S9v2e85PD7BoObx1wX+FFSVvBTjSbjB+U/o/r4qg4yjtGfxLd9W/4syHsWE5E/13//NR9VSw592q4s1B97f/7zwaEdvnYYJa4BTo5o1wBiDSp/534HxDxh+q2J22OB122m8FJS6ifJ/YJxeurUIGolBr7zfJPzf9K6X3cqNJt50CsDtRb3GOaF0m2673G41fE76X/n/ZIW/iiXxgtL8FjknMH8WLwXl616laP/K+wbpASVUml61DP1g167d/3ploegsclVWgH47LW6g+L9S8OBBJege5Hcf3AszkQFzE07kOQX2a/b0gS71zR74Zbdds2YP4pKePUjpgRODwszYcgbmAsUcO5xhKxk2M7Y0w2rjbHJilBWHJthkcmWGHYqyfw6xWpQtz7BEjo1Nz7LDo2w6xfZNsrUEW06wXBYnC9NxtmeSwYQhOzIWP5Blo7smGZ8wFGYmYospNr46ybaZMAxFw/MZlub/5KNsPMpyUTYRZelUNDwVjkbCicjEUHwpxcZyfOIwwmcTfN6QYoOmDrzKselxq41N/m419OgTMFSdC6uy75z/pXf6+uaPR6ltuU1fUDNeT345VHMEA6/7Nhv0W3QnVOw8585uSRTAsQuSeQv8r34l1g0WURTgFkKtZrtmQJtUW+o9Jfsp55SVNVPtje/vdX/+VKnd8gpexdIbh5WGuGyoXeKXQG23qZQWBfD+p9Xm+L0vHhhqr/Imy1+rqbgAtxR3eJNq8hHCEdpzlYE7XEZi/Oio6tUb90+u3/+ge+tdoT9JmfxbXjJ11+hB/f++Wina6nffu2eoL9EM9VUJ9gNQF+t7951r7Yr17tf//Ip0X/H5TYbiBGDOG0RH5tOGURvUmisQrJolIKw9RVA4eoYgDAIRNU7MQnKSQAVoNt+98TYfk4XqxkQBi1GcXlgNNUuw4PEd19FQw0hfMNHfu7dx6tbmxcsKeiCuMVcg5MEDCulujihCbzlXQHA9YCpDOQg5CGhCDcTpmxSIyzT+wjsOvGCqPv6C1dtVkwEsQI3Dlp7qgq2kBgygDYKy+b9EM1X0DivVeH8WvB+gjGHDfnH2XJOUUhNNqRMyftKoYg5Aku4LKNAGmH3nbhOMF7B7/jCbN9/vfnSCSL1QRY1Xks4/ZyVKGEnefaFIi0gGcHSpi6QXf10gfTQ9R0AkF1IpC4zoiqGR2Xt1VZkAW3FwtPPGuKHGCzUS6QGCbAlab8toK2PN/xBGWhtnqg1h6HBx6MIadWFoFucv806rra9pFE3LtWVxovLkbc8gIi3CS+mxL6s7GcrgstWjc7iQdgEK652/1rvwh2z1uslT2YbQ4zOLSqj7yVESGtBEX6xFDeK7gDUygO5iGcR2AX4uQHfFz1RakO2KHzmn4BqMm0z3zTe3IroogzwXtD745ptbctxam88IG+682wjhcvqb+3mpxkXks2/slwvddbHqfsC8Auz49f3EbxcJZr/6SoRY3t5uea1mHRZq8SXW+W979/X9BoB75OUit4ZyrX+vdQ0X+uFSw/cabgtIVtFreVX+1jnsXppA4XcBuZdmK3QJEXdbl1DXXXutNyCZPz2spPvwaPAadgd0B8jdhpJiS8DQ63WjQHikvnnAdGbidf45EE6wfTNJVosz/tf+GP6VHdvjcHY/tncuy1ZHd62trY7u3pXfzf/Mr01nciv8czgXjbTDy9kDY2w6M9KMvDHEWiOZucrSzPRcZjzrL0yxsWw6NZ5N17Lp+u4k7DDweQfNIfhEg887VkbZVIqVkrlp5mWnWWmEJQ9lGnNLiXl3aKiccPln/lC8WCg48VIxVnLixVhhOjo7MzMdnZuNzPE/IzN8jjDJP1PRyIHXs/u46vwB/OFUem11V34XVzsaObwy3p4fY+UUi8fCzdmZ6aWx9N5ptnuaDafG4hHQ0ue/eLFwORHmJSfCxViYFzm9a5bNRvj90XhsanLQZoVqvLhA3u7cBkb+98lyCFfk652LnLpxc3Li0+6xa71bH3WPXbbbvCO+dq6ojkHcV97gW7AKy0Yh3mXiVM11l7pYv0dC3rndLnOGzj/X0Wjd+L177q/1Oz9x2qUWYUJ6Hb8eWMKn3xSSQtCy5sJ9Xa7ZNzvXeQfdqRarjVa9Db0Tmj9KCh3oi7+VBlKOVKCb9ZsoOSWvSDpg7ag3CvUCb7TurvHOQsU6dYff34Zv+vkJwX8qAJVvQFSfSwdfATyvChpBEnFeKY2iX3NL/LmAIp2FUROQgCsgAb8PWOehna6qe+sePI+WrQfRTCiFYkLY8vKFlJy6Ox7y6/g4F9owIVgN8YljUarz5MtvN2/c6J5+izRyeQODqWClRSohAJ+OuVIjccHvAzSxLCAThSCanBGVYXBAvWB0x/VwPiHsXCjp93SCTwm7318ixZQMqNbCypNXDOU0MjIAQgQwRArA2Bi6C3p68Go2UcXHp+bFRA2rRlKg3u1Puzd+2vjqHb1UyHuokm60fdlP+4bKQYWZBSn0IKjR+c0xFvA8PskgO/T4fDUEUH7noteCeSD04QcfcMTe1xfJAqw4VSxxFYRE60cALa6ExO1UNAqI1tXClaAarUt4iyG0o/wVCcL1w2VuS/nrEUtBcPcq3gx/eTXD6MEFx4JR8lJSVBj8WZVLzVi+XBeR5ZurOoigF6Pg/uCSDpVtrC5gYYFNYAM+sAmMJZibwLIQc/tXYcplEadS9YtNte17ZQ2YavuwYbB7H1x5cuR9ZbDdoudXinrYUETKQjOxFIaWNtqOJF0oXteEq3O9ijy3c7kItPsyrJLhSMB7Jb7R65/1zj5cv/d99/vP0PoQ/Sp7bsOfD7I3AhML3hr6Gq7UADbo+Mt9Dgg9U/Kof+i7VUNTF4wBzoLhI5RCqnM7KKmiIGgkLI28uuA/E5hogUpa2gxgK3WvRrqVxfLWXZx8fvrwyduXcc4p7nHEVIe+SIXkBf/pAGLkUxDV59NBCTy3CkqiqmfFJQ8XAKUSH0NXe/zxGq5PftM7cp/mxuIufBXGV6GJgePvBEa8EAOo+vz6GEIvpI4hJVsJ72TLYHXQPp+dN1rbvfPU1MAvR9xF5KThegX+RVaR+M3fCYBkJwKi6m6xaalmRk8nwTYBNhnr9nxVc1XNMJ/CLyW3tDjZ0xiZSQifVdC3BJ+XdRkEaWf0SFEjm708hbsYvGUAj9gJiwgyCDn6bzn207ivB8hth2oxTO/8brrJGMm2H8fMMexFRhd7MNhatupoYd8WFjbwqTbTMNnPLOibgtqw7MAYWXbxucRdW1yYoB0YIMP49K+tyRrIh9wQQQ4F19mgKhB/LvT4LKdzZ+fpm7nYRhW0fueUKN9caxP1nQ/9R0gpNWSut72xxXqbbCgHD+qHOfjGm9vsKxe8BpAvTu/0xrK4FtxYdsV1Y2NZXjI3lunSwI3lySxsGpen2GtDbCLL5qdgAzmRYyOxlMM/heL0bG6GxSbyyaFWAtxOYcu5OFcdZwvjsJM8GWZT+UPjLDabj782DlvIo5VxNj7Opsr84nSOFebY+Dz/YWIyVxpnmeEobCYX+O+R7EguPDw3znLhzFAiHnGS4aHhodlUiv89FI9GwCM1HuFIY/EE/xJNxPkPAzeR3WWXHlnuIz86B1tgmrZ33/3S4OxeY2UAaS86JVjd0bxdogapO4LbpJ3j24xdFGFTdirB3kZuUWUZLPSXtmCM63+dp34LYA5SYXG3GL/Vd2Sd56DPk/DmkWOWMI3d6nZp5MRXBz120Uu3c6UEnh249wAOup/zByM3I8QR3rlOoy1FtWsuH9TpfUFf42pIHK6IBWLLV+1XTVOvZ6892T0G1J7t43vY3tHlyGo7VyHr/VwJa27oSlzp8kkvzNhpBefmd780d3AJWW61yv4pt3ADgAE0E2owjt6ylUjYULGd+bSHxykWuewclnu2d4+v3z8C2EZ7Rce3UqjlVFaILokCOlfEs1v4UlXVAQJQFkRwx1Y9s96yVc+tNmvp0dVOrWjKYkPIs9/iAMwAngE2GMnaqpVgDtaJD6tICCgcb49+wvG6P9xFeyu6WNMwx06wStxtcMRmrcQxrbrcrZUoeg9OumPyur122Kxacshcf3hRVwl6ZloVIwsQm7nPXLFSXu7iUotzGrDSK7uy3M4Naik3dZWWltslFYMbaVJHsbdr4hpICqBfcqtNXUcZKmnr0EC5wjxJS23Z2O3Ns2Fdn98aklF+im5yKH8ZpuPFOvVL6nc7eeoX0tcUfvZGNGAflzQY4LconuhVbCQcfcbeyFU/i0Zg7+SqX6llTJvU8sBWW7lCCPdyQfODB7bjla5btUklXOhjlPyaySaVzF713WSW/PtAWvlamk1lWKGYLs3yP8dKKWcsVXgzzcZn95aGRliSXywWnImxRJRNh1lzmu3Ks1QskXGGWCzKOKlczTNnZiw7HmbZDItE2UqeTcSW86w+xBZT7J8RNhpm7TzLppOtPItkhuP5dHIiFYss8W+5+DD/ZHgZuTRLJXmxyTT/KzubSsujTZFcZjg1FqnkWSJyYIbh8Sb8a7CXYgtWsomkIc+6VzJWVjnd2rx5X62sNtySI/YJHQAy1sMFkG/gKHktKVfkhGzVFLV0GCAreCIIPkeZQlK5gLVRlAgiPDOQRDxZcJ/TQ3DbA1GDFdKzmpywKiQ7l9urJPnki2PCc93BJSAlJ7lgVfr2QYGaBXJRxQKx3CAJhKZpEsCqdQ6Ig9kHu27e16e6BJxxnoukDTc+6Cra8+peyT7fA/VvMD4EVNYWsKr9ODaIidAnrjle56fqVvwO8Ex6B4h0igzgAuzO61yB55DUru1WtXvPL7DRq8A2H77Xh6QR+phd1SR1xqtStE69LcXsqAGKYcF4WxacjWMi9IlbTA5emKPet3rXgryJtt8Uhs8xX7PbLyWompCS1lKwtJdVNe4LVgzKC2LmVUXzV6L0+lDUrgAc9PTL34GkLbalB12L1gG3Nj7a2BkG62kShsAz2RmxHrulgIR3d3xrXd6qGoC4X1TTlp3nRRr5DnV7DtWkiK/BtcXsq/dB/CjTT4046KtQlVzNWZsV4S9CbZsR4S9Uf2MmG3p9KzbEBZAJgX4HX9+aCaGzVhUGS/LyUmfE8RrwmV3mJfjex2+qCxOve0mWmmUTB4bC4/v4Z394bM/uofDY3vDorr1D4dHdpSE2Fwd6k5lhKyk2E2YjY+z1UVaeKkyy7Bhr75uE4xjOJMuMgaPVUJQdGIWTGmMZEOTUaCg80uSfVnUhs8Q/jYjvJtm+NCsl2eQo25tm+8dYJpWu8U+9sZRa4J/qUDjp8c+h8p4w2x1mQ1NDFf6PW0yUEs58MREvzu9Ksbhbikdic+mh8GwkOluIOnNxXsDKfKkYWZplk7MsCSQswVJRFp7KpA68nty/b2+KJffuAZeycTY2fDjKyqPsn2k2m4hHhpOx6Giy1ZxINZZi0bzLnyVcr01kqgsjh7y1KEuHK9Uwy0Xm46XibGI4mY3yTyyXiE876aFBXlq0TDwPvgjkDvD4zKHQo6vcHihngO4fP29884NyBuBjtxBAjwADwFroxiu0ZSYQFZQF4tgYcl+87FaVSugPWq5bHgrr9z7onvlQeyi0y45brUqlhLhQSHzT57QJy+tcXhEeFoS2/tdJsWWv0BwNJvfyKnVvzZPOE39fPQQ7TFXjbf187Mlb95ViDb9QKXtuXehV94qudqAQUL4BpBBMWekzhcJy3/hF9PBfRA8hrFw5ao7J/7zOBcuP4/jPeklx2a8GznGQrDrJD9/7T/FfCHpuHP/ZWgQWsNYasADSh1k6l5xGwTiLU8BNxVVT196Jn3sf/KDULbcr/avXa4hiOp0IYHmmxYC2aDCBKyYswI1XsSZh9Ns45LkFoXH90bkVa6n2jCbpzaa30K8pn49beiKYUVGIWH90dSmwUnvm/vq9X5SeEttQtEk4Us2qW3dkRwcacRnPUfY+fK93/GPiBTRZ4sza43eKboRS/rZCorWRmHZA82o+BZmg/vxLuw79+QqOZZs37/Xel9tZLa9WE13Y11KyGxtA/o5wpNuZEpMqwT1O01HWjk8I/75aQbf1P7tXvhLcqOTS3oJT8gvafUTJ+k8RFSYAhSVtKDY6t5e9knCZ5IIh0XGvfLXx433cdG34cAO+Ak98kUVL8e1lTcnBD1yHw0pC7e6l+6S2W3a8Bu+Foui6X/MaLUf7rEiIp8nb0sptx+PaOYvC9tWhxz3+mHcoPTr8+ev6n19q4+fWW3A/2eBDLvwtbF9Vvf3O3XluZ+bBmxFYHo1XP77X/f5q9+bdzYe4TFZd1C60Ake5a3KjWNHDKDhbcB4GJyv0kHVv491v9JBVrDutuue0l4qO0Ixj+MZAqjHxRcMOCAzM7b9P4smINg5kv6CiHJUPrN2PLvfeP7L+5+egwIpfX/gvPs2SzU5gq6ZX9mpe3bPUvV6ytO19qgfY1Zpbd+Xg6uEXqaUAEo67hKMAlGjdMURfXAn/+ZWQooYOjtCg/fjjVbQCi8ZAevqD3vkPlA58CuQ15vWbcEwVhCE0YAw/bsRRi1cCx1Ewzovr478cfUhSelGVnDVUTzjUglcM4ln+tJu3TnA805920as0BSZ505YcTjoByPCjFeAGrMKyIEzxqmFB1GRCcLvD4LCDfkkbt+93j90WIOjNVBWLduTRJGclA7D8HUGZrvxiOjNwWs65rYPUdksmLKivxYMN3mqRVsVVTZaqOKrJ5p7C5RSffDYZX8sAxyJ6RpRMMDHBvixyZNEixYWIBWnuY/AUQU+IjggWIrmHog/bkQdFHIKD/U6GemuY7xuvthmlxQj9nOPrC4yMeigDBb+qYtQrOF2z/uC73tvH1NClhi17fDHHKzVQyTHEGDxMU7udndWW/hkk/ICEYxkuZbCUqZKG81kEfCXw7JZngKnYiaEwjUT/Gk7TAhwLrud4hwF7yFzIEYVYHlNGedYCzv6tPKVMBQ/u33oBB2KKFNqcOLUhWMau/SLMCFxCL6c396GTHZwQkVEDdxmXMF7HXjI1ZWdRLANhUEB5BW7Zu0fjwlm83RIB4Harm2EvrG95yCvNj1f2NdJsd4qNjUfY7j1pNhZhY3t2p9lsfHSNf3b54/nD8cwcW83747nl+MqBMZabjWdbczND2fGRxtLS4kizkWkujjQyS6srzfGRTGI4x/+XjUXTseghZ5ZFJ4Yj88ny1BirRsBna35yjK3MMO/wKKtHWWVlFC7WoqxYSPoRNs7xxyB+SD3C3GS8wD/FmaEYLy7mxKOrI2xmbig6m4hMZfIsMj2cZ2tJlklM8KKGI7x8P5PYPZzmV3atcSUOJ5Zfj7L5MRaLtl4bYblEI5PgCkcPTUSGU5HwcCQdLhaGWqPMmZuZijKud3y2WEhEnbnJhWxsht83zO9JDdps4z2g6rRbMCleJnMDXjuPPimbIR56n93qnftVhXhwW05psW0GeSCQoj0plsjcjhbJH9FAx2ksn9IrdD6TfXL+iEbn882Si+ONAW8dwmg1ofFoZy7wmYX/X8Ex4/u76/d/7332Hi1jV31Bs1ruYsPRDFiA7BRCeqsLEEFDlvk0uOFI3ikRDJpFMPo0SNUTJGuZd96GolkSyLdwlLyUFJNQIVvV0YMKnXuL/L15GNDDe3R0QZy15LbwYoXPKB59go7Bfx7pHrvWvXPnydf/5l9l7264y7IHAsyqPJMtL3Su0PTDwAVKInywELP3xU0N2PRMuKZcKKq2ix7Ow6SenWs1zoeaQSVvvrtx6ahSkreJZa+htSyJr1JJ8V3qiEMMgGoNYTy7dJQ0lGhNz8CSTguNdhkOyAnt8IQqGPegfscud2+8r/Wbd5pKOUJQutFXVM0RR14BEHnN54QjESAahachpL+G1+BCzbY8bnS3gnM+JFHH/9g4Sw7H8Du6szccvFc2cCW8raho2FJYri4I2R2U6wtRtbIgRP0dFCtlRVPmZt9ritCmEDCH/JnEbnj39B/gyIQb4vzGMr9TbIlXnc7PagzSOL6JogC0NKkghcV23Px/cdNWQw9/zhQpSumKOEPYubdCkx+vc6WGntfnN/76aOPew97nF3rn3+/9AuDePAdotf1Ky1uRX7k2Brq/BXYAUQqTmvin9HZDD1q5ACZxtNEhFGV0Fvj433LpeHLJmPgQjAWihA0xKr8kJjl0NKDo1sHdvyQ9ST9Bi3XRq5KRgBMUllNB79QPmw//zW1F7zMdYgpQAMYrDXITliVYJ/zU1T5n4YEa2AvHphLmCrKtR8CX2CzQCO6E18FRsO8F9D118Hm3etgBTxqCg7hbP+mgxxvwYFs8VeCRyvyWulxufnwK9rbtp9m8dLz322kjQNiK3yj0PwzhmM9CV4LPocug5itOE3uPzqltUywQW/KJ7oPPxXK/KhY4gnokXYb2+S6Jq2J1YCmkigRj8OVlwieDhKDk1CPFlF+PvODvEEb6+Eg50WsX6p70K/pEEI6qeW701A9PPnmgOy3cjbtjfGqgl6vwsm9hKFkpJU6ykZz0MeIcunNRkqbO5VWx9fXk4m+CmQAf581C8G28Vw4k8rsgJzWuNcp+/S0XV7Jyl4rulWf5wJ4LdiTifFmW6uqXpqXC22lMgb/UST5PnVtXGLyXlxXA5s0fpLQcV+Bv8ewFWAQ1D6xrm6mPrJPZoyPrBVpxD+HbQOmqPKheEAuqg01mQS3Vk9QWrhqSH1u8WNFhRYQtAqw56w4Zq2arJsPcll9qbmkRQHpzv5TVObzusZ/pHJ6YtGm2Z3IyOeHnbEysKlw6qimY5l8GVzJpl6JaINNoF+nQHd1m8oztWIYmNs8i4hsiyCS25xGKQ9AQn/gvb3rnA7y4G0Z3NSY/bUSm0Tg4JG41CAYGPmu8s8c4C9GCUxha2hA1zbxp2JUJV2Zbm2rbtO7MsJpG1TjFWsb7t7aHyhaaxoyMIBlAYcG09VJWx7Y5ytwIWyPtzA5vL+AKIfy/bx2o4E6H3BCv2obbqqeCy0CIhvXQuZu0FoO45Tt6dv3ex9Z6EID9hwmmFoT2bbEgxHU6eFAIeAf3bbMgVHIaDZczlRYcvliFuEp7qCOryxBcSaR9wGt21Fa40h+0teFSGBYdsxWv2CFbuejgg3V70ixdHHPSpbnpSWdyrFhwStOTw7FkbjIL0ZQOjzI/wuro+ZzLQnTWRCafnY5DUNZ9MTY1djjPsvHJOKRyyKbQ/zm7nGexN8ZZJsV2xcD7eXgqm4lFZ/OZkfxUbiqSncrmh2PhfKY0lCrGI0OxyL4oi4Yj0cIoS0ZYGL5FUonIRGZ4LBVJwne8ltgbZfzf5CDfZ6fRLjmVojsvI4HABt/jUwU5Tp892jtxQlCDol8Vbs9t+eblUK1RBAbJSinp8qzkVLQZFOpchIrtXDyEHbJAS5swPF2FuMaox+fXu8dub9w/3f3jFxHFtVoMrYIrWNVR02rEJjDeSvpKsNBNXAu0H8xYg0UwmB00/AoOo3ho5DqGoymoJdknn//a+/x3wkY/UQ/ZKsDjqILNTKIEwH1TS6UhDUaon6BZqvWKqH9c27oOWSuf0gy0i0BmoN3qgDkBVY/BokkpFTpVV47hvUHQ+qidhDZDp2KnNF2uEdgInKqxraCphG2dt6O6V6FN8UUoD2wTdhBkAG8gmBEmlVqPnANZaopTKUpFGRyVII0YicIe9eMFsUyggSh9oVEBbuD7U/7Y6nn1STtqRir0oqGeATkILoA1CMiOiDpIPVMtEQ/VFT3DrkvR2QI1adciHa0T/cIw6sJn+4Wrb5BGz1x7AkTFREUUOqNka2TXWaDCKPqkqY4BFAQxEfrFt/LldvhE1q8WBplw03yblnVHNlUbVMPakcV6irVTls6wRluKCIGGLumlmIOX0HFfTuey+tTAVxDoSS/eaF+knQ2KkcqREoNCpPKngwiphb6NR/WjeMZgfFT8jcbWqMk5924dHpWLoB85qHtw73Yn6tA10iCS8L3vQB1cNE/Uob+nQSHBx2AQgfSnWRyzfHG+OJGFrbxGGjb6ZsZSDv8UxkeLlSH+4wxLLo6w12PgRV4cAi/ysQwrDTE6WpeZyGdbKabO1eUzU9ncKByqmx2Cc3UjGRbmEmEWy2TY9JA4WQfEcjiaz4XZCKQQi2RHwlyHPAb/H0nFkgVnKBZLzw6NsLARrSE7MpZ6WqwG/rhyhVYEa8ApYTDqP0wKjaj/EDWjSFmwbDqyCNy+ZIX9b7iiBCMEvS5Dh6CnIowQ9LIQMwS9wA8s4GFFIx0Wybwen8KNmKMLlMare/4eRycXP3fRJwcvKafX76j9qNlZ524NdcSp/xfdu59y9TSGWr3zRIOSR/T48zqYZw1WEfpoJ6wtzUvViHf2zj4g7STvBHxxQqbhLjoW81Ql0G5NTUJx9QhEyGsKTxhyTd7T7s1YCY9PlYL1/P4nqp4RqS+6Q8C32TMdm58B1AjsEPBprmGnNLimQrWoJuFaWbwAWp3UE+agD3EQmg3Vj2OEdYCvJkVRcIqhCDSVqQvQ1HFtQysLKghjYPQDBIklmTp90s96RB3CQT6lTr6FTUUeATdUE1+Db8usUB0Usw/EDt5AOKZapjoytxY1ejf4egJVZlcXJdKi5q5su4qp/yL15L5gNZGMiqoPnS7ep4ddL3al0LisldAYQXlDOCC5FW+URt+0xMoCa/NuWFzTRO7UzGrzaFmu7e2WYbO0dTEeWj2weFppPnZ6M/bmnd5Mne3F+8NOy1O6PW+Le86WMoD5cWXDA0Iq8Jtfxap7fCoWCKeAP4knCsRSwJ+ognMm6duzZSAFLkGZn7iaB/dss9IIkxLYzmnKsPbohuc13cUQhHLjNshvYPD3feq3FjAA32t6wAn37xNB35xFjw9IIdeB7VoZ6d78oYgekSLWPfjgelVnmYCKvIMIHza/7hSdFmcYLbXqSVf4hMprOjW883VaDfUW27D01QD6LQ8+qqsU5WHXHksLGbGeMEFLQ2TgwcjDi5ND+exIfCq5Nsf/Gedfx5bq1fLsVHIX/+yeSu6f27NcKu/lPxT5hdVKuVRbcB3+X3N+ZnrEdTJLTr3a2HuYfnedpWqD/+gs1fn/U9XlUsUri/8tl1aTzZnpRKO24HCcZX57nJcZ49/d5P612eJUcm6oOT/NPzN+cTZ5eHEonBuORXLD+9ZGWDoRDYfHc8NcIjnMwuOjw4V8fCQfb2ZHhuIp/j03xu/gf2e4HkP8uZJj6Wg4OxLLsOhobjgylk5wtIkY/3cQ06264BiF1YbuvZcXOMErS1IGhyXQFn/75OKD7o1/dx9eQDtW8zn1LIaqzipOqasOxN8QILTvA2et+9xKgbIFkKU/vgIXbu8WtPY8lQ3br1TdpgwZuSo289yS8Ezmc7tPEB7iTt6/x+E3b361cf4bCqW4XOLNlnCwowvEQ64KCcmfzq37lZBziDxZLkBQStAbU1ii3/PXXOHNm7DbKO5Fv2sJ1rkiQ1vyVsi7g9/5rkX7gLcbyO0fn4GFFNir2jz53eaXX/Wuf9/98S1KSsdvR8VAtg59yWnZYMLFSqN5nQstBdX9/ieF47dMIN3X5EOWII9Q55KMi4hnY9BfvnOFt4ELInPh9SdH3upd+HP9/h/0AhuLIZLFiJcChVwVLWBg+lUH3+DtAjiAwYnRNbUPuvnZO90HNzZ/e6f7xw8YA9WpgitXH3Kp6rbV66xU2+WGH/Ic4Ra5FIKjRy4SawrZjLulv2wc/x1a1Vu/PPnpHWyylZYzHyq1fdo7Bd6KQG6jJBy6RVAEjqRKaXMd4rR9KcJBY2wsPsCXKU8nHIIVgwiW1D1+q/fON3wQWr9zTweMmvepYDFT8FqiFKHCqi8X591S1avxtiZ80T2MynkRH6/d+aWKaXCQkVw/0zv+kD/fky8/2LiBc6RmG9pgtVDDQwEWkIlcc8tew8cx8BPwAvikgH2FEp9h8NMb3ZMfbd672n3vHrYiuL0ft04wYlMdBhYcWTrf8dGDGhME0u7cXRWrLFAQzBd/++DJt+9sXnqr99Yv2HOcIsTPDsGIJED6hyrO3n3RsoyyoGtCgXWaR4oyaHrVuVfAzVMohk+v1u+cxM12LQxT5/+s+yWrsKYDiHWjoJYvHknHll3AkztYXudyleLMbqAB48Wt3z0DYWNdb1k+UYuYmx5fIfOpt2yXIVuZgsU05MptCGC7D45Tc9K4MqWgBl/1xV5qFZoXH+PL+II0w4YCOO6ZwxB1VR4Su/9Z79q33c/O87dERdQ83pAWvCo4dKVk6NeLFg1AEw8soiLHfxGZEU09gFOi7DNL+M5EnMbTH0AZX/+w+dsfG3iyYLVKxr7eDjVrLnkomIUV1WELt9RwltEVi2j2FXR4uo55CTq/tBvwP8rydm/z4ofoV/tz770fcb+dT8mrXHyFDgnxvwoIVHQsZLM9PT4DW064MVQHmoih0TpXPIxUe+3P7q3Tm2+/2z36Vff4VRiwEJvP/I1WJYux2lTTP+Q0oGxoU0WcZvCHuFaCMCo4eKFdgbi0lLnkq+67t+Gk2qffdj94jyI9oBx4o+F2vmZb2KyKOhJzqerzcsVtsAFZEPlQrwZLOfZb97urZikN10PpvkIErIpS4HGGWvNCzmEPVBI+v/MwFtVl+8JlHRjkNt7+cfPIGWpimzeu0IEhYG8cwIXEgAuODIcgYCFZmQr8py/LvgKBo4KlidRyRlFWOWR8DSxtd6vucuciH/0X+Wyh4YVoYR/YPZ1nsttbvXOZt7crazjwUPhi1ezW79/f/PW7zV+/IZvT8L1lp8LbBTegnsJH9QuOXZ6nCxygEXRyTtwoLd/VQ+iiPViVHp9snr4zQBV32WuUnqIIcMN2qT5Ah9DAoOJBHVSQcbN8M3eMLt0uO2QHIrdKdnwxLtD5J1XS+r17ugC/2QC7viW+Q3dIFgFxw8sY277lYMzmR0dr6D8DbfXDq7334Chcixu71TUMAs5F1lwoAe/vA+EzsppPOUQb4oQxdeeqPrX3ORwwho723se9Y79hkr1Svd3sL0GACa+zZrVNx+ybfsODdikjDsEyA7fmlFS9jJ7enV8WaUN7ScQiunWKU9TekUubD692/7yH6xbg4KhQyWOtvwjxgPQtVGvzt66n3ZT4TxyGBaMi5t/Xzzz56fP1Oz/1vrhJs3AsDKi2I+biGpJXiavOTraXmhD8kygyODKR6YUwoiIi+a2z3Oau3z1OB8lXIYxgU5Dkzs9qYhnAEywZM1BKTEGUuZkgTOLKEpDYskAMkGWuustZT8hIgti5uwKZzqGqvcenFjAxLS75vH9l4/s/oaqPXe4dA87cmvfKIc7QEEK8CETzq05Z5hRQ17hVKtPZ0Bby5SB+78jR7qWHJr7bgInuFkUgHPWqdgNyD3ktWuOqAz+DllPDYfQueLxdxFOdD890P/oL6OWxP3o3PiCvQz4lA3mYklk4BjLG46+jRyPYZjEXs7E3/vqq9/YVExsaRKUJcsESyl5L8leYzHfutTDKccMVL5+Py0XqaGcrMJ2i0FI3n5yF4AWbF77tvYNnPheQIoVoOUAsDBAWLTHY+C4mVlOQ0Ax5H8PoXojIm2H3e8AlPMjyaWFSTLRB64swlaUxH16LmgLzqSnNfM0prznZ1TJqWqtms8FprHTso9wDFynEGu+cJ253H3wspoXGlNCcr+H5ZTyPSfbjy682b/1I81trQmbPxMzZkZoGwdsJzrTMachWRQXnGQHSb1F9xfBtbm9SeotmmwRb8WqLUZtk2qC4QW5rslmLxNr01WSX/ZzSZJKKQ2riKN8xEkZyCtWcTVG1IEULkKUgIzN5mMmMLFY0gH0gTj/nsfnFtsSiD1QkuqCBXI3iWw7fwRGXXHxLcsTuvX2LRuzAWGqPY8bYpYYrMUqZY5M9jJgjkhqJ1JChhwvLhENJlsGWdnqAfdb2E42aspPKPFo20bZVpp1S9klZJtMqDTg77SGvyvOhGHhd1WmPDspFUX98Jo+nAjuXLX+GzV8vdz85yikYH/Dt49Qu5JHgaKEqca68ubK9e6sz1UJq6eBBIbZ4cPc2ofEcb7nukk8DBcGjC7QbqR1m9V1vmFcM3wdMfmrct09/RyQKJ0wXcP17j3EB3SNo4ZluaMkz1/TdBxffN5V6mClVaYHOFKIsPJwtYQFTQgxcux6dmMxCfovlGbZrlCXnwO1iYgxC9aXHwFl3ZIylxlg+CyeoJ8ZnR/dNgtvucoKNj7JMLJGbGnUmY/9MstH4bI5NxtmuSfDcnX4tycZj/4yw1Unw3B0ZZdFsejIVj+YmY5EM/4yk4uF0PJwbHk7Hp8ZZIjKUZOUES0bRlSIynE6NT45kRof4V3Ct4P8O9KxweNeqOeTkSVuQ85jwBlce1cHp7umPNv+6pg5Og32EhSJ9cpq3l5qVCAP4Grx0w50CTig0Q+BYoN0pnnDydPoj5U7RwmSN2pNCwNpnu6iy0TmAIEFn0yUVMXXYX0wUGXQBKdUhoJPhkUpNJnCsq09l6d9kqC2CYYpSrKNpWMgOlDfeNCHrN40JK/UBdRTvU1u6NTzL6zC8aCWG9qJFxYUfggY1/NtISzN4McAqD7fOddGFCY66+Y7hBmEZzrOIZm6Za0jtfUmIcs8cEbXznGdoZ8MFoUycQSB9rrN0Vbs42I+rfTHlE+twutj0pWOeqaH83vfyrBajYr7249jes0EoBSFcHEqUEcyuQ9GUAzVo1x5FOaZ0qxpAOc0Ko92fjEK/bUpDoV44v9l85wJQcILnqzeBoVwexEARSDyBOEbKCQ6ltw8QDldihT4mFOIYyhg1ZFSPIb211+x29STqSNhHwxQ8TQDr8Vnux5t2fL/orS/esV5Kw9+53i+stgHgi/L+vlpphmBSD/zswSd8Ft9f/YOcWbn4gDQRqNarZE4eHU0EnFnpR/FUAWdWKejxssdN9rdrS2dWEKGgyFzdg7u2D4q8CBsD4lApp1QyCLK8LIPkQD4xuGJ6vtKVAenJipTa3MhOBle0/6sqADijhhroETs7MzabglDK6TlWnWMzKRYbnWEpJ8//92aaFYrTydmJWZadZnPJpRlIVsb53D5OzhLoE7s4g96w5Ac7VZ9BX9iVPMtkwB22OsOyIxm2MMNinKJxusYvH5ohT9hUNA9+sFMTkSx4wabC+UwiHomn2HDByaVZbN8M2z/FZmuGL2zktWE2PaNzl0XS05DNfrBPLBwexSCN0icWd0MhG5fJ3I7fgtPmkk+0cAkqkAKh7rYKfuCQ++Kg5MOEHshihgVYB/WpDJMJiSICWcyoiagD7bBS21ReXl9e7p39vXfqB7FYTq2JQriTnM5UQd9VrgoLZ/PIsX4clbeCJM2s26LZ1ulULeYnL5EPsDhd3f3+ne6DYxyQTldD5KlFCUoZwTFEltkrguB92CZsEDMIKJJkNtwCXmjHZdXQY9tVzx9dRzsSD2+QdupWZvoLAjXi/0pcO64uIuuTWQI5mAZNQGl/WULXGTEMfCsxhtDcPJ0lijCSEQljMgB5IGwAcwtAw4GWIGXrt7UVaRmUpuqUj0A1sh4ZagYgTTU71+v6vb512VAwANWXOkM8OTHO/neqNuLU8+sDQLI36NxKhrIKu/+FWs1LnSwZjGb72PYDKiB5aItg9DBgv7u+CrYrlw5uqV5uDCbS3fYl1Kr70ipVICk2anTpgGZ2LfZVocg9ZajlDzYPVv+16s2E2IqTghE3RgJl/cnoa0NvGeadWnfDIgcs5o7tpWUrTYsG1N0sXxVulC0oxLNJCbvxsrr3S+x5docb/Bx9ve0ltWjRAj1Zd4dUX++dvEF9vb/ZDUoKApqMDcyZxgVeJVT+UOm+nGn4s3jOvpRp+COnQKiCFWTyzTe2zpnGpZATk+IH33xj6yNeTh3c0RdDzbZy+NXXkBLvx/CTy1VHxRnYZd5FVDjIZJ3J8b38s288Ed/NP3tysdG1RoRVp9norolc7HA0vJp3Jpdzk3O5laFoODvFb8rFGiPFmZFmLpZZ5F8zcC0aHi4l2eEUcyMsXS3x/83PsloyVRlhh1ILk6OsMs1iycqeYcZvThZnhuZzsfLQTCmeZwlnMuG6M4W4MxkvFibnYpPLMSc2M5xjUbcYneWlRipcqFRwJmLzw5wyV6YS8Xx2OBIN71ob4/9OxJZXxvLDEX5nc+FQcnEsn43Uqq/NsNwU4z/HptnCoUwlHQ3Pj8fdxRzj+hZzc6NTzIG0I/zu4fRQdGIAH276XrVzvcjfOXkudS7WwEkIPXnE6sLNcxtfg3MNGfamW+F14a66ENNZTOJ+1vWGPdGBUyIYfAD3DzD0iUwH3j158cnFu5QRvFlwWoKsGSgybBA4gDWdShWipDcKfpMgUUOIvQYa0jAGGp5/H701cCSDOCGgYNOrIPIhOAqtdNOAJpqCMQC0sFDJQZ+0qluQ8eIvzGNWdK0Kn0h2v/8VXLcw51XD42S+gSMqMCSQk06g+M3AUMJCzBBRidJdCDtJUQ6rVPDfVyX346VeehumylWnIMImYD/RQROeT15GXOAUr11stmsk37lYwul9u/MLBPfBKcODB7Bg+tb7m299iGsg4n7CUuJ9eNLFQUIFQi0SoAq1qGBluEWFo6NBNvgkTT4ltL5FkTfubWTFzryMKgH3qSSi8MXwSb6wiP6LoMDbn3UfHBeSKgIl3K5jPJYd8V58ODsjBcEz+DhuV/M5joxkUcZmLUqte/Oq0K1FddhLFJbFuiW/7BVCwrsLsndVpNMJ5vKiEDrXz2y+fbF76/TG10c2PsUMBpWiAxsFIRGc0G0hjPSXEqh+ANOEMkFEAAzCkA210HACeonoygTRw15WajhuQSpBIirqOX5zlLiSVGLiACTdp+KXwAbwIs2MydGNdy6Q/fcHtGzlVldbTeyTDr3PusfvlzErpbz/dHERYEwAyMcGP28rxth1Iuq3vup9/rvYC+aki9vPeQoTDjZMiW4tF5CRz8tbvkf7p1vIwfi8SluoeKd6v+IrmrArGNsFu1rvwp9PvjslH1QlX8F75TOucbMs67ZzDWJMneP86iyGub3z18aDU+t3AGG11TZrl0uBmKpfRDEQlLQSNaTE81adWsOfr3sqzKsMiX+Zt3YwFlZA2tO9699xi0ERX5UodkL9zbWBdUzaAHAwgq4AV0ZJIYieqr+3le8nhOd3Q533cVRcBQ62Knv7k3PH1v/8QhgZcWPzP1vC0VN8d20gqavCsnUUkFJBKSX0UyiGfi4nBY4w7tfASf8MhAc8TA4jQtHuiXPdPz/tnrnDezCpy/ko0omWjPsjvjuGwoSsX24QPPB2zTJUgF1djDSGqiBt9yHuIT5AmeIq+ujhJ3Rfv3ej9+dbpHW1Pe9RA+WvWQxPNT5M69EAIywao4FCs5UVoKodKFw9OiFuUEd58BXO5DTJUV7whzvHuIpiraXmN0t1bm2aHk3K/UWnXR6so4GkUEwIqQ8iKG04/8Ywu3gkQETY3Tj/AYXX5Zx9wferMr4upIBcbDohnXFWXPBVREjwFJmnmJC9z+5SmDi4QxgS8a3qDp4mA2vcGWU06eJzk7pnZWEGhUKyosiTxZwkbbI5zjMRJpPUqHheDawDOkcj0odsvvXT5jtvES+RlESxCsEniEoIHqEphDHQ72yYV0O8Hp63HpzlwGyNqk8dU/V4+swjojGmbTuiqdHs2QchamaesOsDxghzXDBGAPNP034blltZa22nDRNtGdFB5jNgMi1jadpJbTS2eGRlvLTdCsgshcjMCBeyO8cMCyONi2kayOfQg3M0F/AU0MXL3e8/U3ZB24T+NQyn6DU71xMhxyvWOz81nMW+88rcHNc47rTlz/XLh1CAuXKBZsFxFxfDoSqArlYsV643tli5UGIO+HKh3OLBN7Zeu+AvzCt6wM7FugSeMK67rYbT1Jt8e81rsOu2F82MC0mXcDfhX6+8uUddkts+/3rljT1KUOzc4R0D9+1eD+fYhDfFJg9UI6wyxSbCiQnwp5qdyLL4BHhTVfxp1lorN1fzWf5rcYgtuzOQ3z3L+A/85r2VPfzvxjQr8++FSQhyw2+ammUTo2w8A6lVd/PvhLqLQ5KP1vQsiC9n4Ha6dyUDt09NZpac6UaG/97iv06n4Ncm/20qxUqZai1aT49FWNSrLMQi1dRiecarVg4lq94aR5uB1PSoSpiLznBZLjfNBbO8yMzIDFtO8SdYSbHdeVacmwiPp9BbDNUsFibC7USO7ePPzcvePwnqcgSOxxXgt3EYdzY8yT9ThblwcorVRhPR4WQsUhtPRGOR1DQbioyk43AlkkvHW/XSUhb/Honzy0PDsYiXjqf4bbXx0Si/ms4OJ7nsaKKWQI+yCIul2NzE1ORA/7GqW1bR0+WOOR8hzkEombtLVoCVd+9vXvque0one2w1/ca8OyBguga1PMr05YBbmSjQCNODZRlhemRRZpgeDWf7aNU9yPYngx5yu8jpgJVcs3v8981jH+qghy0h0vccdNncWaUrwb1VXUpwcxUKshKEGmVZvmYaWD8IZMLCDeIpojbz4uwcrxfhQvHDdTg4d0rkaOY0aUDwxqbHqZYVvJFg+2KgqwICznJYiPkQshzrAbCYQBR3fx6XlqeE0zduAbQXrJysb33cfXhVVcWitzDA2c9twVFma4Mbkfu2uI0yAmlasRjzGWRJ1jNQQfZDNJuQwFVF1q8DPWtYgfVPnu6dfl876DlufVAKVEAxH4FwBwTUFyUE4uljIZbHoizHroW+bLO8xRV0EyogvbKibvU++LB35pju1DBt6IvGBCDmRjN8H9CAJHxAeSzB8jEQhZi6exJTv/uq01D9uM3Z1+2a1Xa+PbXx3WWzGzfKA2wRgJgvHr73d2ABH2g2WEKg/zb63COojEDf5QN31VL+srcU0L57/D2lPR/86wOafpFP9axUDI0BPVfj96nPi7BavV/p77lQhpXRyCt2riOFgLNq7+MhSRCDYxvyzEz3zNt8dkbHZpptyTnEYoEmIUak3KY4Qy0mihoyMO1GYDWT1dh6JisvtKUnHOccLW3vVQ4fM13EzU+7t75WL3u10ep/1QWIKWC9a4DVWaNMaD1SEbIaqQBZDVCIaL3ZdoG/EWttrg5hlfGtGvH/e18/3LhwiTxUYLGuRRkAgMU7+FU7pkhIOtZSUBVEEKa8ISw3EeqYCE0kEvz7JIWNfO/DJ2fRmdtfNIut+kapLvyIObqFkCmhb9+yHPmsVJhwxXGM8uqdKwZlpdmn55YggAKFk0aUujgnxTE2jp0SGLxWVxvzyvdG4mizq0ckeyh6+3uD2Th+Y5ARD5rwQWNQ3+Dz9veW7ZPYAcPdP+6YigbIGMc0mZi74AzIfuLWGxB2ZSca4/m5fr033v7Csn6iGHvQxFICKWmgmkh78ITAcdnQHg6Wv/Wx0R3n+5TvXNezEQNz8JDfN9ibSgt0U2cCt4fJ5QbEFYbj97iMdXk+9Pgs9aRf7mwcuwETU8/n7BNPHTa8ZVhOaziHZNQyId+XMF7gBEdExDS1RPDgiIiF2G8WzqZ6it1egTwQdyt2NvbjvT/+UO/2sDeA11aLa67NawVs38giCwjwWizDVF8UY4+KWEqgYTQUoQ0OiOZo2GoPykzUCOYlGjgY9o+DgUFQgNtZiBqBHER4hq/kNso6k/NldQgXzg7yOqVo+N3j7/aOn9m4dJIC4htyGAHUBFI5ZPQl34ZWeDaS3N3SV7ZavTSmRdbkSk2q9LzNnkSZExxzSqOmMcbsRc9YrCkFnYIuYRf8DGO3tJpqbmAyd5urK34uaLmm4iZVNsmxIsSSByvuq+mpRUgVCRXcU/JNTQkNEqiIn+R7iuMZ7c6kXYpqCYYlWZUkPkRYyBysyPWu7ke3ab1LURyT3YiSln0RSwpZR/3xGTxseevr7idHiWwonmGQge2pgKQBahwfMIqLETww7u5g1NUjrq46McTQgCLHP1FhfXfRQKQGHzHm6HHGGAtkI6LmQ4ZeGXfDKG9nzpWVtcygYfiUsSMbp+1aoClQK6AmwO2LsinB/r6T3m739IEBs6G7RcHbo+kXGu5U31nT60Xo+TEMJwJr0HlrdfLmye6Jy09++Gnj7bv2aVPACtF+ixU3+8AWq5MgsIxeVbAkcPDANj5V3rIH4cAgoI86PwCX+k4PwEXz7IApt1df0ocJvPaSE/KXMdDibgU8cE1ybDRdHJtLs1J6Op1yJrKpwnByNp5l+8fY3OERlsXVxeExNjQGK3fOpA6q7UxOZJ0hiqUNQbWdqcns9KSOqF0cn4izGX7DJFMhtSeymdRwNJ1hb0bY1GQtwyZikWSGHYiw/EgslQsnMmx/hBVmposjsYwTiYajdmTtzHBqJClOEsQjgxO14LI0f1xM2Sf20O4VQ5QiC5bm5AxLOGF80T32M3oF/bX5/k1aluZG2jvscnmxwQaYroRUu2xUkrjVKkbh2nBBJDEZaILLnE6Wq7OvdW/8rlOv1XxyjXAgGgBUt8opg/JCmqTk/WLmoSTkyTf4G07JYuC8dgX3ZCoY8Eesf/x6f+PsNxAAhKj0vFcNrdYo1fhyyKspGBtASQoZKSBnGtRwg+TEUCDACBHLItvLuK8aYIQC1OCt/Ao4/C+JWPx8nkApvqgo0+3/1P31Ox/wgkzP/2rA7V/ASad/YAfVUM1p+OpAKeyG0k48HVa5C0RB+elvPjzffXAcMySeVt76q86Kw8nyfAgLFD77Tf8QxJ2CBxCnANAeiKwMxovS4PSSzEMAVX0CgKyJOmYKGssghJg7D+aej0/VcepJWov1zfc+7H7yE5+Dgsb6zcNZQb8EoS0rK+TiKyxR53YpUAJuUK7RGxdTkK+PcF1tNA0SOATQqrcPhTCdA241Qpw3iMKp9dSuw5u//cF7iNBVOhBDNEa3jC0F4hGRG7EE9eTrBbfk5WAjNqDVuzWahnJJNrSuq4j7iyGhcb1z7RDGslAqY0P46MmX75Cq0AQKMILjAQHsKkXIC6PqnjoLbTjKN0lVLt6kOhpQFecCcJiQZ1Nfdl27L6GqEUMeDaAxClDESdVqiHZstX60oP/eh5sPvyT9RD3gFBBwUziwq8GOHP4kooGhRaWUj516i1MBL2jYjdx3La+A+6/kHSCaQe/4Q2oAkFujjfFfpIl+NsMqQ3jxJ6H1nwLsxmMRH1/foEyV1LYaCrzR3+ItdLpfm6Dn7tIvpYcJF5JtX4jsPy+kshL2hbpPazyDfPuXvakBnv385ldRBVR9PODYj7+KZwm49eNP6J6fMZnn61t69HMB4c9fPfj6dsSTM0A78x9e6OOdcNHknfDdIJm0LeTzq5pmuvStn2eOc545Ol5KA4tLcGI3nayNsNnqCEvOcfa5gnvXe0bhUOvMvklM2DLDRmIJcUo1PcNaKZZPxrONDBsPs+QMa6RYNjY0w5ZSbDEDuVoSM2wxxWITyfgMi0djM6yeYpGJqZFIZIZlqyk2kU+O5eLhf06zmelSMeJEwxP52TdSrBBNRArRocjE/mkWKaXYWGTfNCumGMQZ4dcTCX7rIJ7ZuVTnDwt7rTVhJSBC3jU0rBAw+iIevXp4ceOvG+v3f3jyFeS7nHf5TLYAgU+F+yWGxmnzaU0R1kKkD6aCflbYIKJgXp0r80rJC16d0ra7GOOvcx3nzw9/A8ivj3TfgzwEXDnOTKQT8rxSjOOIfJerMtnq+v1blGwVZeh2yTPpMQS3NUq214qoaLlWRI9CTBdMKgJIpkuAFphCULKWpMqIDlPHojNggw714dT5cIB9glLn7tjsk3QLngSGgoJrvVSaQULNgkRA8bZa+8Wieu+c7r3zUJoaVZQmotRrzaAmqhyIwiu5qFnQ3YJ5DBWLWb9z0mCLVAxGldW0EcupB8oYAN8HHcS1EDUR9ZtNXnsKWdaFUwuZ6HJd9XMBrs8uEjgxFIqwcEUYNIrHFsDtBzURDTgDy+KjpC/QUQE94D2YNWkfSSV4Oaq5hqbPgTgQzo6GIh/f6asvs67oEExT4eGYKvqMnC+oTrMtkiKiEkkNHZKLblXRZg0Pql416LyUmkUkyT5rcvSqFMMyAC/GoBNBQUOPzqneeefe5o3vKTjo+t1vqB78ZmgBD4AQBTWGQuG9S4r2dX2rw1s1isQCH3YrVvqyRoVnMOXPZ3ZlwuUBLVs9vH5yadqeWUqX9VymZCs78jK75jM/k36kivE4unmKVk5NkjyPsBnqh1AIfkU2QEPcaNHCyUK1Ymq9/SurpP2ApDRQ0qv4nvGJZmxmS7+KR7SZLf0ERBUeO2KS2/1bkVuQIXKLr+rg/je2C+HSrDuLh11y7dy7X4Q2p2vo3blHXCvC8naRcx2nVYUkL2/uC17H2H77aMJVwgk+JyMyrY28BDe9rkRFAF9x5969fddRg73YYbhONb8obsVENPqaDj4olYdidtsaqpCCpItcETYLBCkDeGDIv6ncxOv8cyA/lFiJhccn0mwqN7ZnMjO2dyo3uot/dh+u5Ffn3bW8W8mt7A8n2OHcZCbbjmeXy0MsN8LJfDPD2fxIK5GbZZmloUSmERmenmL+8NQwm5pii5OZdI1/6pOZ1AL/VEfjSS++a4wlD+WmWTLKhspuaYQNVVbLCZd/5uPjM6xQdOKvpVkpXoo58RiEtslEZ2dmpqNzs5G5aWeMzUZmirnw5FwmPBWPj7IDr0cj+/anWCoW3jMR372rNJRYbRWnVqKRdm4IrjbnJhtLyWhkPBau12Lh6kLkkFcYY7tmGS+7Us4PzbtjM6zIy4xBQBteYjybnI0keZHpVGyQu6jPZ+58esoZPa3gQuqVs7BO0Dt6c/OtixQgiW6gg23ymzraJi/4TxGXB9vkd72qV3KqnAHgkjLUdw2z911tihDqj8/i3trpO91j13o3MaKsaGG89im1wprXaIFXp5AGWHnpKVCH6TbSTcrIQ2Fe1ZPp0jVGHY+D6TVuBOsef1etdFfwtAiWXHWajXax3VQzAInZh2giaQxSS6NUldd8ifoTnC7B9AuYQuL7S7336YyS/h0zHyhrIlZ2pCmhpV9YYRAIP39KCNrc6Hg32v7QEQ8Ykb0CdNKG2KcA13/YBauHxF/XVwdsWJw4t/n2X93jVzbOHTe3LVZbBOfNg4uV2LiwC1E7F1bhgwsOlBQsoA/beKplr+W0/AbZVNg35NW9Kh7Hf3QUt1W//Xr9zlebZ354cvULkfeuzu1ZqFLGc+EY8sIyzUY65DYdqsENzM41PK3z693NGxep4qpVr9CHIPc90FiL9oiOZmfx6Mr3P/dO4koSn6KIPRZuTCGdlJp5kui2gnKzRYrKENvFdlW6S9xtwAuG3v37j/y9IuHF6pLTXafulFWhJOpvLylKVbJVFZMahwB54vbvkyVhWNbvnCfD0nBLVb/CLQB/IEeEpgaZokrNqlH8nYAIVTSMnO41PLfIDY18CxcgmQYkvKKsJ3gC8M9f1//8cv2v890zxynoSgsE0GJ6RU621SsRUP4zIgnjiVgqONYl2OduinBdEO79Hp1yvNg7f1Jk8oLfhRb0RSoihf3tZVW59FUW3WqXMF0TvpDHZxZDlNLRMIsQ+/iSsomQNUO2E19+kaoIMN/CUhiGtDrsR1+lMl6jc7vFZ4sicJnfuQB5fS7goYOPTvROQFwVIH0i0JcrDtDK4rW4/xRp4bIj5M0YZZKqOKJ7omMpzE1gyfb7e70/z4qgOJpEqU5u0q1BgDuCM8KSmTxNmx1oRW5JNuErNVxb0fX15PPLT96+rOuLiwgJqjIDQlWbcc03UT1hIxFy8+YPNp6sRENavEnOTNyGJCKU+hhW2mA/YOPcR70j9ykeURFvwh6vv+nQc/jd3wGCTHSsMKrPp4X68tw6qK/GmbyGWyYVYGMJEhTBQLFx5t2N+6fRLJSduqA3jrjbMVzR4Lv/NGFp74R49TnKlnc/X9HydskEib71MS58h2KxlTgS+BUcMYigQwFDOz/r2YgFaMIpFENevAkDoTp4DUOx1+25rslzDTb6NFrrNBqOoqEGX6Rhe00Sxd7ZmyZLNBiize+ezu4sZvd/w6xeiPlo7rIdczFYi+Yd27IOg3HYRGEHNMGiCNag/mxDuhzOreF428HYGIjNgfNpw6YxZAYGvO2HOz3UDRiWdjIoBQekvmHDGDTUeGENFoGBwjSvTzeupnF/ZklLUNippxg1bUufTcg1hAbMfwfYK8tWDchcwVtJ53bZzZI3Ya3hTgQXvx6fXe3crYzDxAbWvuxd3c2b13vnb/L5TffTd21nQoAKNeF7s20te+3bypuQS7QOHhQihYP7ttvVdXg/h9AxrbrTLhopKehyX04KumwmoaArlAB5j3lJ56GQy+Z4XSajkGUM3PidS7PEKEvNVUeYk+JfJiaTM8OTs8m5mdHh9BwrTUF2iSz/L51JTMfZnkk2mZudGJt6bZzlsyn2z1k2PTwZe2OcjWVS7M1ZFhuZyEbS8WgsF8lkRyYjczPTo5FsPMzx595IMV5CJDaTCEPSiOhQJJZNR9pjLDkawbQR0aGt0kZAK6rJLDXYOyENJ6W+xcXj87e6D9/ePHIGM/KI1DZyzRtk9O4teo8IGAtCyoPnSJ+4sWkq3jq1VDgUtRIimIuQGfXxKQyecf5c986HvSNHevfBwLqLfkWH9JEI5oayqCIDUKEIeUtU7ZyKFiDyOzw6Z8Vi3rj+vg7E7DkroWpVnEwQKOZ5Ctm6oE+5LYqMAgmVAVPuvRohIR8c4+hi/1VvqPEy5P4rLrSbuHIDFvbrQryjgpMetX0V00WWZ0TRxXLMyLyQBwQLUgkbRMeSyR+eA7QfzfTLwwvkreUvwvY09uElNDRwdPRkWxZBh0NoE+Duse73X/FiIAOt2D3jxQjHLXRSpNRhEIFemQbehop9pQo/GSpCOcrAE1i4FlbfDim+8Sa463M+RLulTfWCII+yVbe989+Y26S8TmUKFoxso6LeW69eXeh/72ajsZtLAMreLJWNPYBo1qLYKSUs4i9Syq5AdzsUsUsqUAz7KzZJOd+VNXKxpVoD2lrKGwHe8U0BjD5yvCYqqikcX78P9dU9f3nz4RciO6IPPvWeahSQJrHlkDefLOqKcCV4zsYgxYKbqnCZnPowCXlI2zDh9oXJyIUJk/upaMKs7VSqapGojhD7kAwMBeCLRrOte9+zGujnNKTEZbQIvFT8P1lP/p94p9qWPYuIWcoL9ui+HqbfteGwh8+p9zzhldsd7Fm0f3HlnRdrI4P2OwmmP10FCrxKbfnR1RmIrIfxm0HNWCB7hbhXvK07p8gGBPNYKERv0U+G/kP01mmTGO7daj+UhHFHlD8S/gvv5eDe7Rki7BLJVGQyiZm8GPT/gx/cdlFmKtsnGKG8qD0BNcZABpgdmRmrRVl5EhKKzU+x7EjKiUcKqcnR8dnR8bmZsaHDoyw+x9bCrDYHmcRicyyRyWfz2cgcmwrPsexYfHk5DFRw9LVZlp2ItVphoILjkJQiMxzNZ0byU7mpSHYqmx/OhfOZoWg4FQ2nneF4bCgeiSanwtFIcig2MRRPjuU4Dxzh9HB4q/RhfOLSgiU5PjVeNLNQXIbTZhDJAUM8nVswQlf/9kHvuyPr93/onr4pBh7CqDtFkZBKgpbc9qKM/SKuGYFfAgUZwV9kIWb8FxI3w7/IS+b5+lbDLYjAMzWv1bkt3DgOY8gziEfAi/QenUM2d+pW9/RHsKn0/aX1P7/BBRmPcyHHxQN/fnkNjvxxCgoHAMVDVOQegwbVq6IEqFZFEc2xkFR8T9kI8W2UZBgp2vxak69cvIn3H9C7Rsg2H+YgfiXGfnObDYVUd9XLbhhtnBy50EmkEKLgePD/Q9LIqZTi3TOXnnz97ealo2TtRFZxF5IL/ycdeTZLcwSsXRwmMonbzxLIZ8EfRqdG88wMdAa2waJlD9auhQRrnWvhqOpES4ki2Zrp0QwQ7UyoXpGdzILQ+5JZQB2YudJ4GZrgShOhGbONrduKxhVtRWdMG4hosmaBGcx8IFtM3VJW503z5s2RTxvEgaBaUzEOkZYiW9JAqL4EatI2DnqnVhoEfKdG+jRs2mpwtTW1ge0XKuZm8oUazaAPzU5moQEh0ZtWlTK8kYr6NVpDRPAFBivarmSRWA00qtgjjTq/8sK1u7Vuz1q5GknltVC+VQG97Oo06pKjEe0IKKWRDG2M+jMqLyC/ZZo1GgXwCK4YScAi4PChhiZjuAgME6YmSgs8Suwu8xtocV7Yb3GipOhW6sq7HI49YYKwS0efHH1PmEzbWNqmTFkwONAtbNc3P4iHNs3Vs4lpo/GyevZL7HfP9igv6UlsGH/QU+yk5Q3kzIg1kDVTKa9iL4GnnAtSZXmDMC9Bjix/RqccL2GS4z1bk2OSEhnfvPmDe7Z3F+RtG05LkBee9BcUF6sqlQWf1bTEMQ2RFk5eIoIMV2jZg3bX//XKXusSwu/BSy2vAEQNYlK6h3hPlN5/6gfT9w8Vkb5/okgAN7BFgl8SxwS/fUl9h8Z25aJju53i6OpyZXRtuZJf4Z/DK5VcezqVW14dYc3FPUmWbfm7kywXHVnin0am5fNrzUV+aTrBwsP+LKutRFk9yeqzrB6PpRf4p1pwplLu1EqKHVreP8mSE5A8eHWUFXPMGZpgBWdoOgX0v4qRHRM5NjE6lFgZhS/1CHt9lB2IAedfnGb7Jhm/vjsFP+0bZdOp2GxjmB1Ks4kIvyMVneafGeeQ5+Zz0chQ2Jlg4/yvcCS8a2qUTQytrU6O56Lj+Wg7nRkeHmGRcGMpnM4Op7MZrjScGx9i7bmZ6SrXujQ7MRoJl0chIGR1IRlbSMZn87mZ6ZFEeDIRGefQgw79lFyI8i58FAqwS1UJHGe5c3Tz10vqOMsqb4WNRltssTbJD1A5FSGYAaXkTUmxuSpkDZ8ECJe7LGOxPLq6RmkjRIBm0mbzt3d6Jz59cvGu4ZZAQnXpQGG0/T5k3wBWaDaO4d+m+gsd2oOlEjAeTXnUHDRrUwRpTMZ8dwXWsIr62Hn33d82TvzePXFx89dv1eHzJsR7RTJYQyO2JlDFKXRVjtj68yi7OYEY4pasXGsvQrAPryJPKD0+xdWj5cqjsMoKQ13v2oPNX//onfizd+I3GMXKTrnVENWm5WWNqgvPCicqWclLN64qn0A4MmvCBSCNMpN1UVbxrz9u/nWtd+0iVTG60eEcq+Epv4I1dznkBDGUrJQSniUgJx0p2ktupajcgrxFDHCNDuyqwW/8cBk21P+8QOUvFEECfRtIWLo20DffQlLiSlA4NtDNyn+s7co55sU2RmaWne3Y271rl6hgvMvFo874p/IYa7vCvUbIKjklJJ677Wr/LNg0LSuXNazJzt15qsD1+1+IPrAqfdTgVsuvpyx91LYTFQXDvbLgEkTbbLs14Td5b1X3DvCZ/OtLHZQBoinyKSx2C5LzagaIryCUrCElnYnhTuk+5DXc+SbQJh0bUzc4M9Da1S95q1GBqZRUX4RM9YsZ8lZfNRY+wDVUFKQXPTYu3eflGCseDSVqJlTXF+2oYF5LRVqlWnh81gquxauje/oz9RgrTqMEG2j9QbYIyXqGZR+SuBsPoEvQ+lMBhv4kZS7YEHTw8GDTX8Tgw1p1PIEe0P36Fzo2mBDpjw8mfrCDxtG1vkAcdxtUTiBS2LEfeFFWsDBdmh0wzAA2HqfpcH3Q+wIdVx4dbYvYafdWhAfLiZ+fnD/S+/yCdL12F5uhVtsX25kCou41TcSBYeU0tlJf4Nt57Rf749wqUK35MnYjkTi0cxe8lQIhND95p/uWEW112QnmoW80/IpjLrM0nDWv5nMG6Q54/6KEwANgIfY5VKdffyrJCtfWlOxUpIS5uwRj7zUVm37z9++6x36lwPQtea946c3OFU12bTTfxFIwJoYIZiIhpG0DWsGvgUeZb42PalzEaZtypUZuCwKDEAIjdh+EYwEo2+wVIEALNN7Ody3KF4GhJCFax2UKn3Py4uaNW90j31DOhGKIKPU/TGFJ2g1M2uvA1U+ab392lzD6xZXTE+dFJdE1wLt/SSbGePLxz71fYFd/lY9nNTiKi/sVcLfsBUrcl8Ikp4TkoIZSW0XGQwb6FP6puGcfPXwqObSI4fOyNYtYPSOtMiiV4ZohB4ynESJBhkS/LXrznoi3uzV/UdxFcY/tmIf8x6INTyENgjBIT7RC53qV2xZ3u8FeDvSBUd4adtVwawzo1uhqjqrmeKfGOWMI1UOb7CHNzu1FY5yEYUaNYnpEMUcRw9ab1l1ZdGnIlfE2jLZhTJUBFXZT20rbqgl/VOHtePSm8HbUv0prFjRE21oh0wY9j7Gwuvrgjq46ef+yjBCMhbi95S0hElydQbT6o6tp3MrEgIr1zvVZc32GF/TkvY/W75zavPjhk09+txZnoPgR2rVcIHS1MLN7i4UZ1JiC49WdwsHd2yTtKPI37OFcBoLo00lKzDBq/4CrLPo0ZwvdMkJ4lHOvfRF2Nff2AVgnKik9yJt9SyeRcDnLXp84MDnKCsOsVV3YN5mLjo8e3r2rOJIaO7x3dBf/7J7NT2XYanaG5deKk2xXc3SlPjeby+7Ns3yetfM5ll2eS7PqQnNkYXSkVeKiw7FkIh0f9uPD4wm2OJsOJ1gtFWXwb701mWKpBfx/NRJOevxzaCQ1VM5FhyqRcMLln/lUIsHixVSc/7+UjsMRybEIK6zUo7P8M5eLRqbXkiwyMxUNT3OFw1PJRGyYhfmjDMdiKZZPx/csNHfvSsdXM5NsajK6Egm330ixYqrZSkzERhm/2Q/PsH9Os+U4y8drtTgrjlQXYkuJhSGW5S9lOLaUzKdLxeGC80aYTebmZodmpsNDU5ORQQclPd7ZHCsF4OOvquZE9uKHvc+PqYlso+23xCkFzzgTJVAEgcBUmbTafLx3544Uk0cTvLI+jNiC7dyG4y2rJc9FeUa8c70m/Kk33n9v/eHF3henujffEeM/ynFT00Q/cRPFwFU7oBamPU9W0HKqrNAdDW2GOnEahZpb5aU1hNMquSnjGXwgLN7jUzVIWlUmp+Xuw9827v20fvfW5q/X0XTX3eW23wyttgvmVwkXKMUxziLJEkxcE8Ixv8iKgW7Vua46JsJB5cDOCBrGO3e6N//E9IDwu6peU7BzvV3eCtDfAZ4gPUFEtWPY5l162dHLPd5hoPM1oxE++fJK992PVSN0SaTk0HqZRpDVpC5YgArIgpCtUorIU4lOg5z+xCFQyPAL1SuSvm2eeKt7/TvK+1b3mw6fc8qolFpSx6TU10wst4xRLRTc+p2fNh9+qRHl2UUlXDX4Ulm+MWhrmAZW7/D3/v1O7/w9tcMPpLEsX5ZHX9S7UmC4NUWZA8gKoAf8AzIAGkUfbUQYua7oNSCckYjl/PdJWAyjXacSnji43j36Xvfej9KXvugsh3BRiI9bYOPhu2AXEqpJ51swSCSOxue/6eLOVXMVDmKoOJoGQtNaoOPDS8mjBjCP+/A4OXx4tvvgCMZvbrRwM7eBHu5Vt70cWkUJEewNvTBuN8ksQixtbjbQW+ryB92Tn1KsSLGyRXdLl0sjFLfMgGgvzClT03IXeKcQZ9Hcql9QvUyiqIU5ktQy8rwZStln9tDB11EnN6DkT2iGXJLLRD92j99SxxqwnfGZqz7YIIfrAKiFp6BsnACIDMHoL3I6xKfcUq8ynazEVnsXAxKfv8dbbPfUfXFQo+E5Wi2I4dgmBHXoWEFaaArJhglgyNf167I6D1cgpgVPdfr65nEwrK1K2asKzxhsHrJywB/4aVIyFSzISUMHR1xgyUqOtddKclP2xrdPvn1Hvkh5GzQs+bfsrMZvTwUQHVWKiBGXz7sqemCEI0E0v773+ZNjYBjpBkf9JY/44xf/KWLiZD/+LZ66BrM+yMkjthvo2AhYGB3X9msgsnoJlQuU2yK0rXvIWYSZlFxFVXAmlMIwpMWStRSXdVCFI35q54PCcV1vwdqLGWl348bPvdNneu9/oJVqclbgtZsi4C7vdxxIhtytinODQUATycSQRxQRRJ1Q5M3VQRZFC80+djVIaaDVOnapd+J7pRNIoAC9KQLgX71aENE38RSQCSGPLkoMtbaDpFwO8jQo8DGeRgT8kXoo3aes4DOKqdBW9BXXsi4vSBbZvfEtscgWCRpH2gcI0y7gNtKOIQute+CJSCK029FZQWUNvjmAbJoM0+CWilkG+N5OuZ755wBW9nRONoCPWczp6bzJ4Ew2xTEIjiI2itKYdMaiHzsjH5p4mFRhC54giYbFEZ5vdBf9ya3QYc5BI7Iaje1RU46ZNFzqsdIcJ+0R7WnjmTWWqYHsKeORHIvMUWQHY4geP/QgsP0QoP41jPVTTLVhppU53bkxVYY0YPOeZvFMa/c8Nsu0OdsbHG1uBiwGIdgE56rwrvoD1QLk468ycino+mH+xVwJIv1oJQgUNVeCSOWJ0H9wC7nsNCbMpaBdWywFicc8eBBFWgd3beugU4RFQQrndUB4xdAlCr21h2LP1iHZlp1PAa/1BbaFi2ZgW1Nwr76kPdxleYCgcAc7u8/OTAwnY+nJbMrJpgqpKCuBk/t4eo7NQHDbMON/zSbHID/qUJQNz7FYIpNvpRilUoA8CpMz2T1DbCUPIW7HwywcZZUwG+O/tfMQ4fafEYh2G83kpuLR/JsRfn96lE0kY5EDERbOT/HCwxk47BgrOHsibDg2FJGHIcP5XGQ4OYaZFOAoZJr/O2ilZrFGAZV5h72+hMcwyKx89c6Tv870PoW9ntWSR5E9eb2G0G27LsaYGl7ChVFYhIWMIU0YZrADn35y8V7vw/fpRDhIegaItmdYtTVXpofp3MX+v/7Xye6tn4XdoAYhtxhU+7AhHJm1B2DgCf66wUFMBGMiIduTWO73qz66pjQh3bPaoRH+D5SnDhakcfvi/ZPrdz9Yv3Ni48pDBMeTHK02h2/48xTXr9kQrUwAiiwv7f6ItIgazN915aG5A9hw3JXADqAqwNrCFE8RKAIy4QRSLZw4YaeDWuyLcrsVOG1TA6S5P33ihJG4arFvYxrR9KZ0zZFowkH875NtK8vB5s1fTXdzgFSxZQFKO5rbOJjzh1BCVgB8qMJ5UpSAVRj83tkHQmmrBMPxnEqwg+ufMt6kfofBIPpe54owNSqMvgG2LY4h3udgLh65c7suPLflYwu3qhtv02Mqd2RsmjJMpfH+FJjx6lSFaoCgtH2kUgJgHVLdUalNLiitr3TJFg3UqPQtqwrbQLCemqhMRRl16T7+/HXkvkgNobDKcMC7C3WRuFEvZp1YFYJOtmXj5djyWlYL2lJbOoSXeD1KV19OPnHnvoRb3Z9yLiaNsbTEtg19mgU1radpF4x0ntJMmgZSNIWmHjcaZsujp6RHlPbiqT3c7M4DuvDz9rcX6Bl2hwAHG7FZ3j32A22WG33i+Vrbc7SUQQ7cUGx0QIhXfvurGGcYKjMRiPCKP/IWAV0xEOEVf+Imv+hU8+JkY6udN4nhmwe2ivTKZXGPkMvSHzCUHnzzwDYHG4vkdqR5XxFDdwRoX5FcIRTtg+8ktVdfMI81FtGXup/kccpVLIylS8UxJ5VaGmGF8RmWzyZn+Wdu16hIlzUxCumyxkdFuqx0KpYgjjc6CjSP3xyNsulJlhsVCbO8cVYcZzHO9yYn2cioSJk1O5F9LcKS0eFRSJo1m594I8JikdQoJM0ankux1yNsLyd+w2xolGX2R9hIKlYcSccKmeG5WTN1Vjo1thph8XACriT4DwOTGjSW+aRIBkkEP11OvmTwqM2bX3dP/yD3rvwVsTtXIAm1IyIQKOeaufNw86TadkBxuR8iAOQhHQ88HUKdK8S5VnFBHfSgPYcQhs2RkJePbN46RbsPvS9uErbrVeE03n+2PFo4QTh1ypi+ypQECl6BSQBDVgUGK0EopWVSDU53YopiUx/OkDfOf6M1aTdaUhEh23QtKOmUC3GlRWrCjXN3KId0pQXi9JLk7TKR1hp4/lAaZlKHxk4zB/Ov2vHQgwzu5HUYQmUassMYSbMQUjq7wTN5TUxUoBdPv7jZO/J1753Talmw7vC3k1J4hpsbxoOoIabF6GR0dZvZUWh1g9+tcoWV6YZOKfldP+JgjtgHoOkbIGwRXIEQzZAKgEkZc8Etl5iCjKHAWzfMkGQIBYWrVBP+ewEILdofQQOGDXxConL970ym7tbvTFEIgFepc7A6FKcDTOuFaRgJ0Cdtcbo1PHlgcTSSF7ExUJoyCBTxVuNdu4PkxAlAklOmWZC3l1ZDiPpcFUSS8rBfGR6jJfNU1blJbIYw8JdMEHRh8+b7EP0LXyUowV+ACKpOshqnrd+GqgVdBUpky9gVZF7JuJJRFeZUm1LT0m1r5bSNM40SYiNvE3ntb/ybDBKYM2WLqJCybliK6a+SlxUOni/UaZ+vW71Ao5cF9j1Sk57puZRSQs9Q/YOSS615sQHJpbjWr2KvCOaVwh9A+0BSKbyO0QLdCSJmq864ycve2IqXgSjSMWjc+AdX+eAbB7bz4aqLuFiclwnnrbojlt7e2I9r7FVwTatCB8fbDgSu0voeyla9QvuQPHxnXCFGJ13AeMWLe3abl6xTfLBj7FeK7Rog7dPXCEmnAIAIGxA4QeD1/0Co+yjeC68YGKOJUO7fa13EG/fhNTit1/Cb4r7dlAagUXarjnmwUF4iwT3q3UmGq1+RZLf0NmR0N/HcALdbPaC5mqke4v/19qXPTR3bvv+K6ny4N6/zboWZ5H55pcmSbEke5anqlWtL2pa2LWnbGmzsV7cKMkFCAiThZIKcQEISSCBhOEnAQPggTvGPINn+9P6F12utHrdkA4Z37z0i1tZev+7du3v1r7vXIIO4qcoChK4BOhYG+e9McuLI6EBsYmFo/NBCPskOjyfHDhwaY/za2Hx+dN/s+P7R2fGRtWKGraeibGS1kB08xj9lfkMqmq3u9/hdA7HMTDK9nHQTLF1fODzkLxxeGqI7Bluz46nFmWQlNXQoye9dSNYAOpNYSTIvP+DOjs8P5CbGMqscNsPmY044wmbH8zFnPDqTnF1KsuhIOhUdy0SGRhj8xW8N58YyR5zZw4dyE5kD5YHYPn55LREJx4+tFgY5ViMVrS/zGvj8ezYdnZ5gi4szC95gPBIuj8bc8PBQhkUzjNfP4Ygzg/FEOJ6IpKb6eQnCq2p/J3YwS7j+RSdBiF/Rfe+j7gmIMSQGhydebfuyjiAn5J8lbEjKrSk9cKTNPxoer2GyL2Ghuv3Oic6jnyDX190fMZidXxYyMn5c+4Y1Km1kA1WBWTABBGVKRB1a1OsqJL86d8ysV/ftHzufX9T18hdkhaBrtzcWjMqIwWEgKQAhKs0iSFK1T7PR3ijVZDWenEd3xNtNsx5bp3/c/OKCqkcZMrVzCdk4HAK/68pITMdEVEAGhDRoEgjSaAW2WkBHSSO/MyU8gVm2Gufdb7vvvKcqBbsvICIqhTswUvNZmI6FqIAMCGMHXChKnOEc0X3h2K6E2UxVrriLN7e/+apz7w7OiI4rOjFIiA34dWF5w+8XIVz53Z1PP5IC4m4jYnLVqVacwjOLW6uI2/B2/QrwmzRV0aJKDn8XrU/3VrT5N84GTQ89ssCrgNL4Xq+AewFlhYDsvR9e6Jw5jQFzQSI074eawssErLv1jGLCivi/AsdGMAS1URVYm0GyC8O0bQNiI1Is3Rubp693blzBxWeribfWxNLSxS82DpSupJUohhKtuDU0TpeSKleBnNjM0JOcQC9YXfHihc3731hdkSaTotUd7enTgregFSKSRmdJhqC4E5hoZVcp+PjQ7WsQBQQTdS0qV7Lvux+dhBhM6ErWAMpZdSqYmWqp0ioo5xn65lCwvlaJVwNzph7/mSPgaoMLye5Ct8pYHRU+Q/pSh10HL6LL0FfWqZ9u3fp56+TPZP7AF+ZKe5GUagZCoWNjSIhBh9tv397++V0pa4hJ1VVz8fxFOCrAU0uC3n3nIn9owdGrmM5BLoFgUm8/KNGuhYz1V675JeL5T85DRinykvjr1hYG8UUEW9Rofb66co55sHlQhQhZnoyg9/iCjp0kd0M6j97pnviDQifRhshiwcP1bMNddMRWhF9ocE0IeNQ4C+jtBL5BHAotTE/80TnzER5yt0oi/AjImEHP662GaBuYUzBWsL1fpNYyn1/svvOh2jASbdbwCEI3myRputFkMY5ZiEI0UaS/voCQ89+K59TVrAxJ1K7OW6Pq+Kfdd6+oUVV3zTmnbuQGBRwDQ4lKIXG/LHYdchTXm2pEPz4BWzuPP8ubhT99cKX79m1VOOiIIl+OqHiyAkPVQVywARWORjCFXwEP4LRCE+UXIwJKVA5lr9i+o3zvrpZhY75cQM9I6YXXPXH16f2T3YsfkC+ey/uG4ZXKAXztjQdoZK6CtlC4xX/mo61frwpBKaAyNVRlC/CHNh9+89Qt9eTuCp9hpD8VSMjHhi8kShLiXnnbTt5+L0wrX475mW9o5/ejSZrNpp7BpQweZRGeZ9Edg+q8AFXRLMPgGI8vVATHeP9PwTEkv9gDC9jj1P2SE6ueDnedDOVEuIf5a29TzovNBZaGfpZ+NnTziyjUPSu+5x4GUkW9kEZ5Dn3QJ8C9U6y15v36CJ+I27/DuOmJ3ASDCEbFKGavKPRkLqdx1bn1dvfPW3aMexpo8dCS68bMfaWjO+wrCQF3bo5LFOeO7rKfVOGst0m+gEdpAwgv4LbNEeUDWGgVXeERY2wCicvGNlAF3B7qvHfzxlT7QHhR7wNV/BoMHH3bQfMqOR/i9o8379RLvlsC3zBOzsmR8KD1i3ZBbDgFzpmrLiTLM+4/GPytoTNF0qNa3orwQProEiout3JE/dCX0aiB2NgxSuh7uPn6MMtOs+owG5tmbw6z6cowG5lm6djU0UH49034d/Iw/ntkkEXDBweZN8VSuUODrDzFYhOvH5hkXopNvLF/kjXd8TfTsbfGZ+NjR/jn6HBi9BD/HI4sjRyI+CMH962XohNsvVQYhvhQ+0prM0kWn8BsjNlW0x0eHUplFiq1sstrVMix9FvHWu74cGKo5M7ns8nI4HAi5fPP0kJ5pTIb3zfAkiul2kIxHUtw5MrAgRFWybCRYcYxVvbvW4/nlzMs5jaX+L/z6Vi0EHVGWHEpyerzEWc2no9UnfhMZD7DZsP8qd8aZK9Psbem2HCCPzR/+uEEf2D+5FCraPj1sUk2yX9KRo4eGUodPsRb4sDU5HgicmiahTNsjd+VWyzGWtOjqcZANLw8OrTkZyPlAVadHB9e5JXyKiMsnmFVZ7ZUTM+74cK+YZZJsrFs0hmIzqT7bi3xr57ItFWi5DRgIgzaZPvvj7qXLqvUG3Z6JiM50wuJiy+W20+ryLvTf4BHt3Iw4doBDh8hiGr7Mvoenf9289ofm5fOk7ZCEeXqCNFeS2iv19oB9gVBZTAbAauyjEP0LOkCcw3Tq4Hr+bWqdJC6enrrt7+2v7gqfP34/SIXEp+7PJRWXlLwxbeQFIAWlXtOQrgiIwbiAMe4EQ1wohKHz7hIudY6RpFbYQbYPvlJ58aPnR8+R6+xcoNrHU6tGjLWVN5IzIQ4L4aiQkzlteuhV6/DI2OF+PQB5xjCslt55f5+ofvb+Q74+B0nUiQchupuHaJj6GBmAstAUuJSUPZJIapzRnJuAXkacbqHh8GgxO1LuGTjz3Llp85FnPj4/AhmLmLboynEKnLrg/YH+LJ8CaqCRl/nVyHgLiQgAL84pBlPH3y8/eW3W7+/27lL2ZcIRp60K1SV7edyzauqPIEQvRcmZNkrnz74ms/K1CvrDt1JGQPlNyNRnkDynxdIpg+U32XX5rMBmKtTjfgfwMIwB9B3X3YvncSwpE3p7yfulbUQX/3dJWVXppvlWrvqV5ZkajfizHw4oDnbyRvdz08i/aVbHONv2UPEV/+ZwnKnjr7JNZNDw8gIfAwOHLrvq+Tq9y7xPqPCH6+BWCAsj6egdFweMUiDQXlkEba9LJVhmsyqYqyoPJ5GVclJUNsRGyGHX76m8tGFtSfX69bbt7t//8rM8kquJiAsnICJzxucxy7DxFeAJk4AQrmIOSHRJIhQJlsQ2Rq4tPht64MNagd0dnBC2ATk7eBoXiPxDBwlToJSxHDT5iqi6VXMKsA7gP5i1gFe8+cnVR1cLSirYmEZFdLXTWwFaYHZMNINuf2z5I+Yk43cJrjKDOmT4xtbp2/R+bEgwaFFhyKW8DWfyT41YMqEUiAKIW7Iitbiul1RVFUTOPFHJx3YmjMqtPnBV+Cu88MjVS0uO66qVfEhJ5amuwZ+vA9yAFMDmlCGc2YLzo5N0yt6UiN4JhgncEQZPJNknIrUJl5RZR018Aw0BWEKK20C4uogSPN12cXA6BidlHQH2zz3fufiTdXB1spLQkr1r/aNHuJv4WtcBWcC2RB6i6x9hzO+slU5HDoVixB1zt7unHlfcaI1ztZASlXOExcCVZPojoGr0DSOiaCd7yl1SnBkPv5sMTAwN3/6RA9MTKHSMCqGF4L1ImgDUiFpDENaBfH0mu3LcjFl1Yr0ja0v/q5fZ4PWQWWQlFVr2HBm/fQPJr6CtQGDUA0duLXVaDh65n5yHk55dB7Z7758eve+kffXXciLXWdUQrWS13DMYK2I5htgCsQQ15EnJECf2tCZI22X43REY5Iv859unH56X6QM5VpQ5oXnvQOfrW9trqNRDJp9b5zu3riiReUpqBCWNYH1bQMCEcD8+uTTlsH9JRXsfnCcOrtgg0oG/Peb5K8oL1V0vnYN3QeZcu0qZEq3ayEHYIXnIMRKJ8KKKygiCbKely4Da8VKVnwk31Q7j/NXv2DUTeJYMApBi0seKOV3sPTH1d0z13b6j36rrxdbexnrLr1SesY6yVgj9V0gvdCyRixppM0brixwm22NHA/W8ej066d3PxOLEL0A6V0yyCypki7xBQLRJbFGMNYHAUr/nITeJPMmHVeebvT6wdONNCeQcU3ETR79LBZt/GUQXIPSKhor2avBWF+KRT4/5Xs5LrYn3vQqSI18DR5FfdmFfCjisXdWYE/azz1l72lOffmJTpxVe7zfiVwR7XtVUe7mhV+pXDEtWVOSesxrotxeMZo/9Nxha3faLG+tyb69/dV3YgwZd+i7tfZ9hu7VerePU7UcIXGIAQRoPRvpfNwAOsXYw3J4MdNWulgcTU/vnhEFm7vpcoDFwbcaqmOZah7ZYUtdDcu5OXqGuSO7Oc+4Iniy4TUNV3rcZ+Ci6T6jxQ7qC6b7DFzou8U8MsYOj7LDOeZH2PAYRPqvRSAH7NjkFEs5E2Op/GixMD40mHQj7MAoW02D3/T+EZaZZkdH2cFRtpIGPxfwp4lFwaVmbYSNxVPTLJucZvU0eE2vjrDlNHpNr4ywgWm2lAav6dYIi4ejw+FoAwwDhwYnUrHI8gjLDoaH+Cc9k00PZWJ5ZyYaYa9Ps5FxJl2nk+GIN8JSY5HyCJPu0/H0UCLdd5PWKdEOF6Z/Ukkh29cozIV0ku3c/bF7bkP5ya6hSE8IZ0RyrAjOAr03BLIsJBDBGcuxNitkUdZmhSjJyh4279adpnQH4nMqpOUWM+rDiyIqKYzfhgj65Zc4Rs3VyzRw7XZ2dzxUcdBJVFIsVTTn4c1WwT1G6yCI2vLkDA6c9x5t/Uk5Spx6nZfJ69CqEyOBXesal+Qzvo4Q0dCuP7Aw9jHsg9++7DUl1z3xW/ePU91vLqv1Z6PhVuWmNWFKdxkZcbznDfQ0vtny/N3W8z2+1T3RywmeXKsR1O42qs8oONu72o65XiU0ndfLa1+uUARdK61X95sfOLbph0PwyiYfg7xX+mD2Awyg9YEyfHLg6w4uH65ANp0+IMESxzZaNOD54bWvIaTy/VAFWLUVrpVUUxvNQAn6W4tH1+7W9uNrB1/ZAspHh9CVh6jRnhK2pzFl4CoLqg+O7a+DHapqP+unq5Dnr6TQONTm/a+oqRuIKJW8sN0glN5O09Nh0JdH1KmsZgrpzfOq3637Ct4sYQj/HqocxIsL+SUcd/EgFrac/S4eXuKtpz1+CF44cGDDSaeffogGkPlGDfGdvblLco2j9L3S8VK1G+rc0KXPVOFaCVsqU3Lc9gZtSl89vonsX6hHpRwN1SVqRxWTjydV06tSIC89sl/JyFO1MAGUoBoZYli8ZJ99mS7V16mIovUEvb753a/BgE8DdiC3Lf0oni7g9Y0/8XKhaCsg9OEdnb0h9s+cEMnPHd6NpzorbqViE1W61JO4Fq+aSWsNyYPGFSuFLVzpy1Y52YzPMs5ZG+NARTlhrcyy+jg7EgP+OjXDjo2ykSxQ2MkZSF81NTGWKzjTs6t42eHXJ8Y4c/WnMNTP7OTgNJuKC766L8deH2cHEowT13Rimk3G1nLszXG2LwGkdXhoMj0Uj45Epxm/OTMxORiLhCdHht6YYuGR9GQmNjPOBjOsOsDcAZYfZQOR5gxrxhVrHU4PRTKDYxEgrMBYEzvlvK23Sm5D01W+3lvnemLVzFX69OHZ7tnLOlcpxEXVuUrdmttsgLWrmaoUQXvTXAjswIkawlt5OqCEnig0VIwdiEax7WfRpR0oNnT8/w6CjeVYZ4GcuTZa/Pcm7kWAHagI/yPCMH5zfPPaIz2cIewPVZpLuBBXBzst7rdU0IEEsVwdcaQHkvMSExVCcXhUSxOWD1pFTf6/NYcclGbKFc4I9vwaEc8MKiTqLeYYYmqyynqegcymWGPLAx0lVf5ZhFZBhmzcvpg2YD80zX55L8CMGqH25aZMga64UntjHhYnIcWZ5NukyeLix1uXvyfixN+pnjWgpwAt4fO+QYovY8naqF08SO8LNV+k+Qp1Tkxb8coQKbJlTG5sto7qg6qBtP869TGZKNNs8V7kvqg2ZD88O1ARdDbdNaQRtu4VZIitukTD9QS3siqnRgcRZRvFhBDyIuMtTVGCI/939QDnFb1/gSP943HUxoPtaOobRUrUi0ZtY7ajL7V43GxGpQcVQo/4jkQZ5x9jxlGzjJhcjAnFUnTPptbIlMwXZylvpbj1m1Cq9QULUur91SidVzLqX+mQNGu0U3MEBp44XsDhYsfMU7HyjCh5Zo8VJ1QtkW/ZmmnlhIhCqnf1C5WElY2G3FAdXv1kn5y3IPka9l/+KNO48wtfsMBoIP0t3Ssa6u6Z7ql/QscJJMGlm8DjHotGt31e0SmTYh/aiWKjNPnrQzPiX/CUc4d2JtvVVh7cbMDS+k2wb6bvyKiPohu8V/E9iDcegtBRTWkGrS5Ld3naqQeDQ3XjPvu6tpMu+hURbEdE9FSXKtIrHuyea2h0SNbdB+yLLZlF1yl4EOum7pQLrQIaQu8zLlOh++VjyVUCVR4g9usaKu94qovIuiuKxDy7Ehbu7Fk65Ja9ciYVHZ9Pju2fnhw7MFrKskKWrU/PsPksy2fZvtps4lgsMjI5yWKR4RX+WY1Fss1Idn6ItfzcYn1mejKTO4Qo6UWvnHtrjE0PsaGJQVaaT07FIoOzWZZrLPj8vtSh5WSZf7wDycQ8/5RikYEi/7ipqDfF8vHyFCuA+GRsNnF4jMUcZzI6zT8z1eUZtjzIJiPVOJvif/NyfF5eOB0+uBxl/K/92cGBuPwM889YKlpfHw8vxSK1wyk2nOVXMtGF0rxXbuZYI8frNpwdjPPPQH4oMptJzUwPxZZmWGyGrY+nJ/oFnmq2nMq86CRwRlnUZqhCpV6/sP33R51z9+hIhyLfc+pYWcKwtyiuuhmFzKVrFpwCMlFMAJlimw/pZdi6lkafXC2B5wZY5h3DnFmwkbb95bdP753rPPhx89fLlKe74ZYL4OspQn8LEBUbS13ZC6gKRi4wpNOuX9DZUSn/L5y8kzPThe865291zp1CHyBfZGZFEZUfVVjKPpe0zCrn6+Ss1aYHfo15kcQcEtKsgwrH8/MfHnZ+OLv14dsw1srNtXJdmi2SmDZYxK+U4sUUt2VlWkC4V9qV8RHcvizNaRb0mf/WX5/Qmb9QZY74k98szybom/8MSSpU3CwfGs42zaQ/1GwUg503Gbi6NoQVLN2rkto0VM6+XeRkHpuGNn91m+5S1YesqWKIQMxpOAnBXM8iDu3ZPzs3z9IQgdtF/DA9SAREYJi4ebpqgSo4G8uGoWcSWl9WjMyIbjRl5U5ghPVz/+yePcfhuqc/0BOFUbkaOA6aU4oJ7ffAmpAWngUlD5VxrpH1e3K+FKJw9dsPPut+AG+6wR+vaDVV+0Zg4jKRyDmxRAimuC0pHsHxMOyvU2k5Inx3TYRVRtOjrd/+4k+y/SmmP2w4FT4aQQRehhR14bKBpppDYigAIULdB//WrhvWSwKmjr1eOADf/7xz7oPOg3siBV+rpFqiLr7bLaGuaiwFozGk3ZmC0KkOeX9qyOQ17evLqAihz311lSs/sSst7qGDRfNCqwfHfzaMNOXSV1S257pbqEktiltepJZh1WU5Qzx98DWH3f72jvKHkKIyWL6H31QFxa9+D64JZsDoDDIEJGu41KqXpL7ZWJb+K39doUostfw6vQq6URaPX9Do7RwaJWH8+KcPP+N6XUmJEvFWOWCKNScfnPnUxETnrTQIxJ3KBURe31lKJpqq6RGiaB4W+ORiBasKVkCX0G8D3+dfp7tfnO7++rtIMyUkaLxp4mjBmWAKQgur4apIJnVs3kFEMBFK1fL4MzIQPN298ZFwCfUaKotJzaHblXsVfPNfTFjFlfYa7Y2q8ArgkjIDGJel9F+lmt+w7P41F7YA6ISbA4hK0Nn2jY+2f/yc2g+BHBulZWHUvZWWL91VxUB4/Av2HxoA566jvzjwaZ93LvB1rQgujPKSehugJpwCkiiGrFPZIfYdcrTd6ZyicjbhUvxG6ocL31GnVOzKYFZSYdbnZeoKgxJJPtRo1X0sH8iQ5jC7MxjJXgz+sTv7UMxDs4dncAfJG6y5/VkzuzGrm/Pu8826esY1J8l+U6QxPerZbPe5TP3XnHV2m3OM+SY4STxzirCnB0uFSwUuOgPn6kKF85bvPjivVbipvrUWxtbA6K7335WqV6pdrTt305xSa5o6bncNZ2g3QzntrpoMtaRNQEkKctsLmQu3SQbUiKFE9jDW+/imo0d6DTdY6KZMcIeF1+TxZwncVoEyeBFWzlqq3tO7Z0Shlnc6r/J46N9CUI2MuXtycCfvdHjGuTms9tzBXa3oViAVIJzotAqGJR1e7TmgrPH/51PQCmbKETH66JtlYUdXFOZB86plaAel9D27zEwNFjJvDbLi4OgYKwyziSxbmWbFYZbLsoUoW51mk5nkTKY4w5KzU2F2NMbS0xizOjMNJ5sraTaUORxjAyMpOLMcHWWHYmwkPZYdD7NsipG13Uh6IrsvBueVmVGws3Omc+mhVCyaHptIsInhydUYi/BrI8OpGASkLgwPxZKR2ZlUPBINT4ajkcHkQGR4KJWYZq+n2UAknAlHBwYi/O9+Z5V+jV9w6yJ0C9dqea4H+MC0Ird8+EPnwj9U5BbI5Q1Oz2isL8RV5BbxnVaBHAdyOOIE8Y+tR+e1sKTUdLdySaT0j61ljNyLGxf3lqk+kOrd2Ag9c58jdv76Qu2F8s6WD/kldSjmUtZsyMYIxVmnYlgKHs7GyRZHlWIckIHdDJaijsmwCPuITMCbZ50AvtPDAwI8tqxVcS9tJoTtNjO9OOXDWF6c9CzKi9NoLu3HKYac6cX5ypqKsHVDiVcNZ5LfwxlNw63EDcMoaoegNd2Ff6jdeCzBrf/7mlueQAMWGsXOmtjeR/iAid5zgsKxr7KLIVgjWwkC04kSKpJlaTZCw6Z9m/fVGxRmmo6XtBkK77HHv+p+8YcwzMJNddlSdNZMx0s1nd5EKkE+JRWC5VsFm6UYyK7ANeGsU0ZO0CEZrHwbDcyv3rfR1LtWjUbvetWvheTbcCm8ll92cASjGpXHG2Jg9AMNIMr+Lq2CzFrTWWP7+zJX+E7I7QV9fMJrqhR+otWvXKMsfqt+ve5XeZ9XbUOTR/uWnj2MztnbeXo6juo1DWxpMtcTE4/MnfLf2GP0DPcqOoxAk+eS7opbz/OJgiuNirApkGC0GL/nLcDBTGuRYj5a75Yzu5u3Oo9+6fx1SlpK8DUTFZkPVSrCCqPm18EKI/gmitqmw3wdgS5p6B5h1SGaY8cjTdK8u+tdPU8JnficQnJ2eDEpfy9CdT3SXrHme0U65xUpAbFzG8BQsmYF1Dh8NYNApIWRE2KcMlYEBoA4+vz6XdXnjR5p9HKB2HsUiuOq13wQHv01LIf3gGDSGPpR9ImA/SD9xnUFNuaYSdAP7GhBCEJ4qElvYO7Abiy94jRCoO+RYTmap8P1HocXuGjScfgeJONwzaTi/HtfIj4xPjaais0M8v8Wc2w+ztw4S42OcLqdnUnFCknOucfSkCcGWPgoy+cgO2B6jKViA9kwp9ismRK+Ltn8+BiljcmmIW3MxPhEnGVHgXyn0yI7YC7tTA0mo8Pw1+x0KhbJhNnUSDaX4RQ8PJwsxJyVYZaOs5k3MyyRG2Wcloc5Ex8Is8RAOJLh7D3MwgOcn7Mo/AS/8zv70HFwn6zPg5JtX4au6oARGMZFO4GuZud+6vx0uvOANp2AXjXJva1cqPMprOaGzBRQuPiGVa6MnA2uihhtTyYCE2lfLn+09egC5ADDhK9rzmrdLdZaJq6MSdMEq27Yfa9TPlGIVkez1+MT86F//YI9b/uLf/I5q3P2k87JDTRPhwAovDNxWYyZF8QhcxV/QezrHpP5OLunzlI+Tv4UavNbyKqQO+0b0AUrGFqQL1oWsRJglA1BC//1MRpynP2e12Tr0cnt41+jzcwxDNMcKpdafl2iYk+uhKQligQ2URWUAWIKk9KG7DABOo5V6qHjJzcUHW+2/B42jqAmGfcwCcKkiWka9CGikSXQtwk41VHxb7C0AXzFvs3pArF7pouThkUfoSPlgUglcs7AMgQFd0EFGOboAdA+iPb8QypE8m6oLHGohtQ3AMyHBe9+lZ1ZFB8rmz/e72VRfJGItpGUrA56qM5Do5QaWHaFHLt8s/lFEdjyMpsYvkiVQMPSgzQJNmutBWDH0L9ssGUMCmOvcvkr/f3Pp3ePq3mxztvHLUFPoaLEBClRUWGK2RZ7sDAnUsUE4Y1kayZe1VThNRFYChzIPEdsFEBkDxoTp25uPfqWHNkr/JVDy+L8CLe7sj6YNKm3l/X0MNkZTEKNE4eg07ojKDKtnm3nXoCP2tsL9OuCbqBYtJiYFIfe08tHFMmdaZklBp3BZbluWadRjCqZUlcpWrv1+00+oLli3jxzUy+2+MDDzksDm1Zbfkm2s48luFZNTZVjvmtyZsCn3YEi++2f6ugjXPvXLwsqEXTn/QuUCBqnBzVPmJME7inPa7Up54LeacBQt5DL5RdM1kr+0bzz//UZpdtrtnylapU6lPdz9tWk+7ePHxfKWeo882bV7ZT+MTSPVDo9b1wpGVOjBLSIGu2vbOzJauxW7YZkuv2q/UIdde9dpw+P9TADTjC1Dr/3NeQx7RvpQHId/InaNZhfB3+iHp82+ev+HdPqcAmkr/Bq5vbvTF7hYKXmcSW1INxaRS5s47rOhi1CDTT9eXXz4cB1nVpGI4C4dRfI9XDZgXC2Vs5VpyrZWGS85E8NRMLpkjc1PjuaKlcXp8ZHU35uZHixOlpIuaOF+dRoqjTJkql5tziaSjgjw/nEaGpgZni2OMgJ7wRrTLFDOTbh+dVxzj6TKb88znkwv8R/m855i1PDkeIwW55mU35ucWIsPMw/I/FoJDYUjw7Go4kpVh1l0dgUeMDEUoxfzcyOzrsca3JpIOwkwq+n2Az/7VCGRZMRxiWzQ1W8Nc6foJYYGBnu6xTDtUrBCdU9QUXXQu17uJ8IDPTcD9sXb/NuRrwW7gzhsayUQjlaE9MF2DlsNvyEBUZhuCFcsUgGhbDd699B1GLp9YHg7qJXEcHrRAEQAll6atYdCENAVW1f9SB5blHUdPOjM90PPlM15dNuWdZ0Hc59dT0RQlSzJLigxApWlFDNihJw06wo4tvVLDTcJVHNDQqHIOu5fevB9qe6nnzczMt6opBRUfweqKhCC9aUcANNiuhGTakEu6p8oOZDkJqAL3CWKJQJxIi4XrAChN3/vnNKR8HjyxDPr+dxyylUqxOvUFCwSEEsowCjWyB+T0Pf/96su1WA8QBUgv0ATb+AcfeNR8Ds5bAGytsPcXLzwec6lJ9XW7Tq7y64zd7qC3jjAQz03seAIqz+IkrRD0HFmM+A60Gv5vJVPf8LPXSxU4LrwRp+IDy8OF/sXL31dOPM5vmr0qXVc5p1WJ7yJdK8ONn1gmi9pegCFGwQsA+YPtxwdU50ONdv/etjiicklz3bF97vnv9DL3sKFNG0x5kJTIwLCGYe1sBVVySmN9TJ5YIoqEehfHGWl2a1uy7Q6D9GaeYLAA9gMTHAQhctVfFoeuuDjc6FGzSYIGm0U5Jn+9YM9XIYyj5IT2WQrlAYM6zD3Az9YfO9n7qnP9bxc5p+mauHRadphNHR86CNSLGyzsFBMjG4h7e6n7xrYwVg5LKZbHeMhTMY3AjzAGvpDOY752+ppTNaANnhSCWScYxV69HFBnzwLYsSbB3XCLxislOyVUS5htl1RHfFbL+X7KOyzfP3+f9Ud1116sXevrrQyoOxq9FPBXBASasCetQDlmI+gCzIeABRSkDJ1cAeUqatVQVYL0Cgq70LPpCXet4AwZhvwFt6ifqrQqw34AVnGbCyEs2P9lV4XCk47LnrfDYUe8toXtXb8GRjZbY8AtrVJuBglTm8WV9dglFhCW9WeS2f98ucdFelTREmMFHeXj88hAwmMkEw3byG9y5VXa/pNHireCYS2qopIB0IkZBUIES62bGBwGat/zkJciSTailyBdY3VeFdRXdp9iMZDyzLG8RyNk9fE+RGUhqDhJjEQ1ENihg2r3iFMdvjGpMOnjDO2Ie3+PRuzupqLrfmWD21igzR909uf3pKzKFy5nxVU5k5j5lzmJq69Bxizxwvp+xfWi8bitNSlko9Cq2odKGlqcTopqEs1I9WOoZKUGrgurx78/6XcryrUa7Hohx/NOLUQDOGlzASg+hpjQZl3xGjQY0C2f+t3t/PdAqSyvDXmgrBDqnHRZLBdS1ge+3j5npWlGGZSTUl0L8ZQGotu28nYykh5s3NkVR5bt/O61muazHUcMGDdRdkNj0IiTnoMqXWUMk7mk7NvvOg+YtOk1Hx8w3PBVv/EuVCPWBcpDwh4kqzNa/u2m9cqyhvMayIlXGDlyUWyAJSuIORaF8HsIXDx8qzg5GJhaPHyoMRN8HGl/35/anwWD7LpteXDs6kY6Pz0/uX0rGR+Qw7eri8wO8eTseyLf5Z4b82Rkey0Vo1PzV10J+vDtX8WnVoaWhpsOoPDfKla2qRfypc7lhkcii5cPTwsVSULc2wRDHDpg4u+xxtYCDiJA+kwvFadWoyUkzGSu5gpJmORdeXIlMcOTIY8YaG+WqZf47wz6FsJhpv8FIbo9koX5Gv8ipEs9GxeKs5E6tV/cGJWcYrUQhXFiNFxystz0CB4QwbH064/L5McybtQLXd2cGpA4VUrp8VFwbO48tRrsXxvTp1EXj0F740uQwDDI9+LuFQ6bx/s3sfwglv3n9HLGOdxUbIlf3hf/7NXTDB8KKOYIm/WOgKU6OZIMoO3qmACjdriGlaOe+06rd56nr3/HGzfvmqVymYFbSxVAXlZRF0FZevyGm/us8RDSwTQgZpn6dsRqDnKnh2RNru9587798mUXEH/CdQ8AsKq/UNDQquYC9AWEhqyu0LP6um9LAl2zcCYxv3+l5EVHo9HfPzZvNDWFiYUpbt/nHyfvf0HbP9QcxofV/j6BY4RhOyRFQ4CkEJKlc3rgALGLdaV+gz2M69Yddn6+GP2z9b/bVSWLO6gw2l+6u4LIHpBLR9fT1E2cw4MJx9nvyZw2tgE0+5tNR84SfEiTAF0oBu9fY9TuVputJ5Uzi7WbIFydMEJSl2KxcU/i4o6Cgx4TZQAVJK2Qw2vGXpuLB57h1yXKg4/HfhuAC3KpcFlGtJMTzq1RSQi289uqAoIII4EqElJ2XO4iB0sL+kLJspLK6IQAy7V0AkHl9YJHPnzj2+DjjX/eCzp/d/6JyFnAouJJWSnv0CTrvq0xX0V9+5BDSnMExDzGIefK22zaGkxr83xbYQITsCm0y0i1wFufWm9i2sqKi7vDNR1N1ywREeRw4KiP0M2SQKw38WhEoRpEEqe6qHgbDXWhgQcuwvcY3Bq1SueVVpGU9OHGq5sf3lt50L36nlRtVxm3K1gbJipSGRLBQlLgWlJxTeawx5/rqajj1LQT+tYdxISw399e7m+Ztq2EOQXLdS5rKBgW8AWiMfr9v4CtXEs2Cs1EyKJsmKglE0GCdY9ezeudO9e9dUT9Wqt2rNpxTM2WZdVjEWusI00CwQ0a08t9L+J/ggljDhHY55D2ZUcsfk47175lPyyKxUnPwarDJWpCMiJ1lc3l8RrI20B10ysRSOBWLKy+41D3rEqsu/fuGc8PEFCAxa0nXqXPmlc/P89i9fUs1QTNRJQoj6ICSe8WkczCAtAISEFFQZPPKuJK26LjAx542G+d5oGCD8RrOA0VrebhYEtKAUjIFhistkVV6t/XMzWJUnZ1Z1VTYffiK8Zr0ahIkSFWnAEtKoBSFZGEpeCSs57eXMp38n0BY1OE/U5f/2q26KprtoNAbEWCnU/IpjNofENNEUkgVjIxivRywWdI3aG5CypCkmqT/ubN2laLaFgt8w3kwTYvfYLwYWChpEAch6+Lj2laI7ZnIt1l6Y1e6Zb6pIZS9EGZ+HL5qM7wU52auhS5rySL5DXEcSHUlzJFcxiYoiKIKaEDExScOOdCHAEIgYaEpgT6DPmD7tCfxFRQOSNFHuOk2qKfKlpq2XmEz2rvn3oKP3rE9fXAW+jK56Du1Cuknrln7bR7BH1BvBHs7YirX2vZlQ+97ak3MT1t7Rh1e3Hp3bevv204efBXaQuLAVrP6tIzttGkGpc28d2S3yJ9egPa51eLHHs67k8qtm6E+8IK19DxrXrOCftBHUa7Y7nGClBBssDEbxv8XxMWc2m5xJTeZm8rNOKjmZa0yx2hSbnZ7MzU5P5aanJsFVbjI3tjoCvnH1FASjH89nR9l0gi3xnxLCRDcZy6QGk7HoZC7txEZSkWJhZiXG+JVwrFjgxY5knORMIoZecolwlP8LXnKDSYjlmYAAn4no4Wg/k1xlcfr8WR3LBZnTxxfCOqsjYe2Q1ZEEZf5NureitRDYyNKyEPeBQ+bisPPJl2p9WHdhzpQrRNRn8HK1a7sE83ELndLSUHS5PzbPXNMIxooGASovWRUJtMeKSHG1fYKi+sgQhANnVWeu6cyFAGSfU+E4MI+pChjkV65OOWtBSDTAMoy3zv0EuN/8oCOxAbReiWJbGetQsv7jOgAZj4CU5n5USzLyExZ+KlYImPbVcHgJ5w5RPzKkRCBtUctRdLA6qJCKVYfj0/Bhg2YL2FAi1o72k1DBHuNJLCNgOslbSugW7YCkSpPFKEwbx5DfwWTWMRqw11yWA+5kK0t9yLaU1cyagKW1nmpVhWq/ZhVvz6iomEVh0FMVMXRT+16e/FZFn/7h4dO7H3f++oJ69lqlCH5jkt2irHzRWB/jJRsvGENfijGhFbT0NdNvtic4vNH0Irxl8AWYUeEJ1zCAfqHXKKQ3ZGxy8DXl4jhIsWnQQQzaBveT5Fln569TvHnAEgqbm/fXVXp1KTzp8QBGNpEGpMqo4a7fFNkoQk12Mm/Vxqo7amOtiU2Ftbu6MnTmCwlZMjTWxfPRs4kHkzrmOe6rBfrUi43Dlx0ez1HBPdbPsfrBc3WCvrEn/cE+8SZ5zV+DlzQViC2J16H2gXCSeB3iQTqVEZOivXlkpxCSXIIiSPIazr25G1Wr1iGZWtOmanixx72qyifCouVgRVd8MBJWDlZ0zSRrgLZDsIM0+ldN5ybGxtIj2cFYcmYyk5w9lGNHE8zJgYdVOp+DeO1TKTZ0OMEyA80UWzuQY4cSLD+dG4tEgbRN5cC1iqNAMPZ9CZbLgWfVWNrJDg3Govy/I8OrCTYZKU4NLA0PxsLDQ7FiPBreF2X839lkNByHsAb8v4lZztiGRUiDof7B1x2+SPinzF912avKLNWbFy91rtxCY9xa1RfRScSfOrQZyarI38JKXwNp23zCo44mIY3A3/IKhv5W48CvY/wxUjm1xyfKYj+9jN5YmLdu+8FfoABvfNc5cVEEvPVrjdCSLxLKSRBnQYQPEFfADqHi1NEdTCELkiodoQi7c/cuOUI1XIRe46ugVqNloFdcseHgFFwZ2gi25Pnjn6f4wZc7H4PFxJJTM8Ioeg2dRJTkxMHH+SIeQ4gtpwv3nt79mdbpIO8Y0nK3W3R7zewooTPVwSJ4Wz99wGujON6S61YC5mAKSztS4RUyE3LFal5g21ENCFxZaylw27EK0WzPKiqSfKvalxckYTNLEi54sDcD5ymaxlGhwAfvn+38edtM2EEVWCs6bh0iKZqeVzSsle8VaYjeUoPFKHQBbcNpykiAgjM2JWfU3n8wqTcgNXIRktCIvoLqWzgD3vykc+VrGDa8TNTmVKBgHeVCqxpaRYuMRvuG1HmKQhqlB56HyhDPYuMaWBad9AstfwldpVDxESFpaEaiG0rwEl515CXUXOLkqdKE7NVUGMWjLpioYuIUmppmzuB7MDuwAjYQtbxJMv2mx9vKFXXHFqeqX6e01LyZeXU5JGy6+RDAv4GYUAFsZnq3RrsqryyzgsovS9YPeaeoXdmYbgTztDoIeaXAvg6FWX98Yd1oWuF0felPTkO7x8+Ilu3tFKI/qFmsfecle4NAsmhptd6K9ZBSgWbTUlAzmpYSsOalulEBstirtSx1ZbxqnC3EI+7EUvcwpRlTjjEhqDkAXbG48ldKX2RP5ZxGBefqp+2VrjY0qf2g6iHlEyod+SpV06tQC690kL5Qe7yKZ3BfQY/r57vF6xPr470F1XyNNASgjwc8uOhn8aABFy76TUxf1h7m0Z0IMsogQ8Yqzx3dmSI7Ba/mFDC4UIF34//82+FDFNSlWfOraLpbQnu2owcpWTDnehA8tsJpFdysr4bqznqrDkz50EEDATLec4GqV5B2csYvdXGkI83lnGarPh+q+Pk67o4KOzg+T1fggHrJxfydGGWdlwmV0nDaEg5l9/ew8bwzMzV1uDE/daQxP33AD5cmc+70IT98bLk8u77iTe/jn8JwuLWff4d7963j9zWUO3J4Hv67/1h5djZXK00fOhCezS2VpqeKC3AdPvzv6r71len9x5b5PUs1LtPgZRycnqoutCYSw4v8nsU8YCyXF/MOx1/x+H9nSrmD7lKt5A4PRBMj6aEI/180zhZybCnHvBxbhGXCUIQjFDKpeCzLP2MjQ5GxkXQkHkumplgmHnsrw/hlzuyjE4nIaDSbScX4Jz46MJRLMn7nEK+v34/r1z2XT2pkaQybLfdwE/3uO5vHSVE78xAdEYMStUroNOYU+QuT0fiOeRA2FTdkm3QZzFHBLel2qxKi+QtidQpsvIIbdk/vnt469xCmsLvHqbjOOxjBcRXm06LEEoVBXIa6syCjNBYdiHEDOrDuY4RNMmK+XgQWVSBD5s7Fm1sfQxTGRt1d5XfxyZCzPpEbrr6EnVjIC9dsFzbzhFGdgILnbV/liuAimlMg5ObX7259cHvz/iPcagRMXjsXoyeaIOQOWmjfmIetD4oMVfJVZfl8siYsrt8Bz+/GIh/Bbh3NtMGf1Ct4JNiApfe8XKiD08g6pv1+8il6FUBedJhhTvyyeR49yOvoSEa7LiBpepnU65As6ZIKVqVOZq6jQVZRBoOBveeLNzunblJImDKvB/p3iehrgONh0G6Me6VCxBS9SvsOOP7XKfIcR31yHo1jkOEi2aVm7Fz8ljdj59d/dL75msJJVkJc2heqnT8ClYG4rfa1QsgP5fFX7FxofA5LskWKVkX96em905vXNjpXcG9kEYPahmQYDr/ioi1ayJedqNJad0IALWh4Ux5tcYCtz76RGK0KHqLBzYihDq3dOmaIb3oYxQ/SGMJSBH27r1zsfgnvolkueTXMLoMrT5CSYpwk1FS29yLG68VfxPH5MZnakAN1fz9BJ7GwbvOavo8vfN0ptcD1R4gRV2lVSP5Eq6SCir73QffiKVGZSs330dm81kKd7NdlGG/HcyEUPwJQmMwnZzD818VT3fuXKdhUNVSp4GmeU8O8VhxEBtistb8rVCB4XLlAbEkkMMc5lOwAbl/r3LrFuylG8+FLZDnpUOhN8BhTMxD11aK7JHLtSgMB6kUAjZb0jZA4Y/32Dkd/evfDzVPXJboTUkYD+LWmcRC9/ZNXdFdgCoKQRDgoAU80+u2vqNEhGdpiwcOlmrMuJWquzBMPstiOFbdJ+oorjXwIsOCRL13mSLTUAR0GaNR6UqriNaUmdWrQ6SWg4wmrJ4gqS1W7jpnA71/jkJv336cTc06/ATTEqQK9F8CQ8A7uD1I9QeHxcY9+rojp0e76ssD8/U/ycyVMGDh8tNPRF24B4lBX7q5V0L1cy/H1Th2d2YtiDOVDIkD5dexeWAis0jGKMNhrds7+CLZxvLiL4BXpuDRK58FDyGuE4LQBs0qEaj72+SqqaVmUz0mArMJ/wMyVV+V6dG7GS+HgRM3LDcdtGCiCsWCDlAPkBpaBvIU2yqLTijP47p0Pu/c+5/2WjuG5Wq2EwFOl1qJh1L5lw4hcmLyyYKZWDNgRcD5awTJEk5BRwfbJj6AMbA8sAB/fCwkrA4TjegsnwKIwNgC6xV9B1S2J0BLgqETRoG/f7d6G0/VFiGfOZyMMAO23b9SDbYAYHLMB4UbqaAzBITDsDw6BO1uPTlJgNA8DZ4YafBFd0GCS7Fnt6fCGWMJw/uAsU6TWhCXT5T94KwJ/BjfePi1ocEQbkPe6PJrw0IuhEQ+aBMe6hMIKqhFvgJqDnv/lLWGaiKYiDhAnGtyYGiIt3FVoru4/vuh+/2vn7o+b74CDEN7NOakQR5YqkMA2Qpj+SNAQmCgCEVgKiVxfEOCsii/fKg1HxZ+/bT36E7oAFYm9QJQn+kGz4VdEjCoqTfQGCFMFpchQQYVQwylXkGAg94Jc4rxLQ3rde7SGOvdw+/svO2f/6F6S1E6Hmmk4C36ZI/AWc1XcZD46FeRV8Jy6hIYpZ//o3APzqnmI3LFGQbTx3gURiQqnpJUKDGiDnj2+IAjP9skz2LGQlRUr3iqOV0sE15XUnO2fixIB7D4aAuP4CYPa8T5aEruxmLKn4sgAgBWuEwtccfPO0KzReUn73irwkXVy1VaG6B9c6175ePP81a2Pf0NjK1B7ShrfeQCJXjreB0uTEsYRfHKuReoD1pCyIJnk+uY/u7+fFAVhnmuSJp4iSLYArAhEmgrd+fYNXBfxB1ypU4j2ezS3IvClT7r/gK1uF8ybmx6/015KiWjtQhp7qBhVCEODiqPQoEIUc0ARhLECw1qtQyQa2H0uwta5U8VZ9EIZg/GQ7ySfqutk/IYpPbaOvye8Md/9Y+vkz50rP5F+4f2boHCW5dxX4KJKENDBEn2Pvwif9Ou/PgZXRKMsObqe3r2hihIKlgBgvqkUi15VDLJAwZzeLGHEtr5bSS+wYjJXSoGVhVpOqFWEXJkoqi9IPrF7Qe0lqxdhj12baityLTi14uqKR4sG07zZZMySJ1NrBwipZLfASJHdSlZrUlDJQNHGTzDQpxu/EgM1yKemeCatU1xOsDjB3jTXglPmdUWvbpwjemXyKs13TKajWI6kOJLYSDYBwOI+vEkxBzWl41IJb7j3uZipxewsZ1OaQGnulBOnmC6tOU3OZTSPGZOYMXVZM4o5TanZSc0Tal4QhZC+5s3EVTa1ElfYQltDCVJJG6qZVKrSyXiMLvNVBLWmUpVSfSmlZaoYoVlIqwiVohSJNZhpsYBDF6BxuKqBao3L3q02t77ipUP1MATmJ7hscN+Na4LV9r0khuaHctrXZy1rwSufd0/9+fTuGVGwZTBY9/1iszUc+reQwlb7bkd2sh0kIX9ujp5g7siuVoT8vXMtD6ceNXkIbV1V59NH91M70w94Qi0sB+U1PI/ebyP0PZMeTx0bZaVJNjALqcEHhtn8JBufGJ3OpGPJ1Wn2eoINJ2bZ6Oz6AFsZYEPpgcz4zOjwsDMVz6bYzDA7mmUjMxOZ2Pw4mxpmh7NsLDo1kY0MDUaHIuncUC6SSWfDg9FseCgxEElMMv7v9L4ZJhKAJwZi/BN/ZgJwvm73l3gHN1KAX6b9CbIlE4YKN85D1OJvfpDWSquNmtMnnXaDTyN24BKF35MNXBZjp5CmkswU0rowO6W2KMsMmM8vUmGOsPfjdP1yUWXTuXwK0IWxH4JKu0PM0IqCOqeOwtJICkQjGKn56G4dJKRVAnLaElYiV1etYDBf/KpD0Df6NaXoblbAfgFp2RFeDdgRcmQdO5+QrXAXBGscMlcVLp/qxWkHhwohtBEF89QnHFoddfDrgK4M9ySwjB+jQJUFoIVmQvXFMePYSyS+2lNWN3TgQZUUpmJ45gHA2G0aLaygthIydYCFqy15FJZC2QnCNPqDBOxkQ6lqKgyQ6HF1S4rjenxwagHhvgb0CIpSJkmqJFdn3RXoZmOqV66zS/RFsbJfy1o6+sWol9L54R5ukgIKziu6I/a8D7ePvDh9JXlLlaoY87qzyYYPvEjzLYpuJm2pAr3sRV+hklcJrFVtmjSeuKyoCr2qh5dgPGHLwlkvYInw76IiAZyWahI9GtV7sSR3DPUuNaahI5VeVHrHVIGWunqWlNJUclfU7FNUYaqtqS5eyZB+yUH38sPAqgDyYRqaIPrdl/TgNd/DXGBG16WCnZ1bKti79tgj+vhliEJH8DBioI/9nxB9DZ+jfWMiYAaofoZCz54LWgOqnxvisUdhElpshE0GdnhH00AhPjcnxZfxHJQ/19xhycb+dmA//z9pD3iA/j64/2+9LA3ibHhNVEtm0me6hAmeMWIlJy4wXPkbUjaGRXep18Sw6C1ZBobwnaQO6gvatlAWJU46EbQvq5uZGixMjQ8Ws8mUwz/58ABLzqyn2VRyeIrNpsdYcgxyJxXQ6hDSKSXA9jCZiQ3kwpBFqQlZk9hIcjjNshTLfSYBNoeTObacZrFMWqRSmkqA5eFENjmUZtGhUVZLs0GQS/GLkdQoq3DQNAsn0mwoFU5wfplm6emxQjER45fSI9nZMv8V+F88Gglz8pcZS70+xOLgQhKPDvAf+qZYKmJj+obj0jncur719tZvf9JSqLWsEvwUW03eahVfGdMJee3XjwCGYz8BKcd+CefYYDKLJaFRxCm+lEMjwetFI+bUx3/f+lU7gcM+nS+8wElUeIEbj6VhlLySVM4scLP0rn6xFkFfNdmLX7ZFDDBlbVjUjFKFd5AcHUM87EwpUdakk8UaBOWtuSqK2q6QomZvUFvZdotF12aULl5of18zrGfA8SZvms78eOLp3Y+tGaP57zW/qM1nYIQKzkKIJpgNJFFgP9ecexDDsA0syplHOR383wffKr8DBUzzEf+J3A9ECTg3/S8ogrScymmj47Ej/jWrGRqGxYyJboLKav8PWIJXuEJW1j+WbpNWQEVNMYFeamAaFb++Q9gy3GZIwiszIHw9FRPPqh9Z4xgYfQECEdcVoUQc9Wp6CCW+Esd6I24fuSCRJIUuTfie4z32eYfPfIFYiHp/uhRZO/3mgjyFJCWrbP8UoJTG0FfEkkZ+H26JU5WJRMtydFt7fEKOTRA3h7sS3TlAOjrdkpJ9lj4zFbKhyHbXoEp7mk6+z12eUnda1Yl2pzY3+iGefNVVSS+jHV7lSH3+ARUcTNYYemPn8QDFy7H0hhoXe+qtwf5lqH3Vr+TTyr7Vj6I2PD8agncx0scWj9fpNez88N5HA5Z4+KPoCAFDPPypAfGaJ7j2GuhDSw/taJDHZTklBdnm3Bx/AkVKD+1imld3INa2B7Ztb6HlHF1ALvommdLxR67jjhPedTBwUUeiw4BxvNMvOXRxf/Aiktl9aIXnNR1oLAF5wLxEcfDoEphDUN32q+/4O3k+Y10Bc79VJ8FlddHScE8UAfgSrm8IO7c5to9/9scio2v8s16aH1nln2ODY+BFcxjdaVJjbCTLJlOwx9lw9+/LYbLRVinHYpHMMv/Uh4fS/kAsshSPDlX5p/bmGBs8lmKL8zPsKP+zMp+KjDEvmVhILcwnS/xTHp9liYVZ5vJPYnGWzWdnJ9lAIevwf4uJsbiTSGdZPp6IHZhkM+ExFhvLsNlkIjrFP9Mz2UiOfyZjkfA4/0wk8vv3pYcy4WTi2Ko/wPwcxIovDXC+PZzNsfTQaHg0Ez4yzZaGa9VIZbGUYrySXsIZYuUS1GGeVyYWKRaqqagTWeBs/UiapeLTUwOxyRyXzvRn0SIWK+/SMGCJwYL/BMQdUPS1e3Fj6/gdRV/h5vJS0XFF3FS+RncqrYJXbzmhhmayNrSvgRWijUW6zgITU7+fdwo6zBNFCQJTgs9KMs38g/c3z//evSQigLmVvMiPTn9Jmp4Xic8NFCWsbhaZz/Fvw0+80XALkEhPpJxfxuP7J+cpFcdXVzfPvd+58i5qInmnjDolvhpRp+Qd/vNCaVdtcUF7a7v1ulNQe7fQLhT2xI6Q/HvnvfeUsgQjkXKfeN6lulOwnG4keh2sclbcYt8i/oWHgKqI7YvwBoqiDHAHaIYaRdet6SLszLFoMMqfVJ7OwIEt7BFTQDSp6B8+BHs+DIdGD1F0/AqahnoqMFoJo9mCdZAOjYbowR19XYq9pU+lmFv6qpTgpr4sy3wW3y22b6yIHnaDz3HXydTlu0+2fnofo8LwQSEXb/i3XLuRoOjhO0o66i/ZoTHYtzB5WsJjdjqOO7n53k+4YYNxxkUIPR0YnP6m4rQkpjcvr8shhSCdB5doSBGUo4Bk8IW6W21/V1AR0B5TRhtoWlN7bF64q7QHiPBOgJoDJgSIDC+UhkKzkBSEFpYxFEharWCdSsFV8eAgCqaMKXPhy+3zsAdWrDt+fs1dFHEk6H61iKev/rOl5fqbBORucwVyA9TEaTcYUdyrirA6yvrgw869v3dunSXTA7ARLjS0cRtfasC5Kdp61ExMPDsVWKAiEMMCsKXl4TJa69B7eXKmyjtVVb+UzUsnOr+9r14KkBMI7SteS/uWySEMOA2lMExpURVDXNRmidMJ1Hb3jskgQ2RsA/wcT6U3zm5ePb15/mpnA86s4H5jo0KzFAlGargvmhmh20BVOxcgXnOC0KIXQHToBlBh6oPH0HIHu+CJ37p/nELtCfpbRhRxF+h20Qm0OFZQAfARBqH4aGgRVPeby2K2EoCOASdq03RrGKxYpBKnKGfgrwRJXuyE4psPP9k6cf7pxqcqp7gSbrb8chONqtQlmVtcXXB64U1QU5YeXH0VT96EGVMMPv/JmZqcpMH8VfbcrXc/gWn6m0ede3cQAkVos1/8rR4cv/ovDCZPOQWc6DB+c4kPKhER3sB7fCEfgohQEHxGDQ0BfPH61q83N6+fV2NEoOAI4cy0fVkSYjQrUxf8ncvoBdewVHENo2b4Sqvi8gkeOwAoRYrXBbWlM6iLG90PTvNKimMooFOhCojU5VwlEJoWoG/CKRwbQdAOIdFTo2pPjaS+pxoJtqHxRNOttO9UZbu9eHWE/M5x5yzi+SzWaTNORRNpj7GyA0dU/w0QuuekcxaVs3hcgGApXqVIm+IeBr0xCY0iMQZ3MfmKQTd25Rrqv5IuPINkCF5gzuLPmMP1/G3Ovs+ce/W8qybI3adHY2rUE9nu05g9hVH1VvhSlJamFG1Mz1zmnGVPKtaM8IzpROt+Sy8/t1Y2/9QK9EXVp1adtlLbk0oz1Zk51p890rXSoWq4MOJ3FKt4eV8rlt6dH9EukHHA8Up+xa8V3IngFhBYSENLT6FhGJiqta8PmttAm/cv8nZ/evdM9+Jv3Q+PW/tAqoR/C61hAWUqQe0BHdxhD0i+srk5JdecO7jz7g9XbgWf90lc5fBh1KrJdAENz8VfYLdc2Y2JS0GrMXHZsBkTV0yLMbrU92RxanJsZHJ2ik2nks4US03zf5L860xqYnZyat8IBDJZH2DZTHogszaCeaHTLDYdz6yOsAMJNlJPs/GZVKw1AnFLxpbSLB7NZJPx6HBkfDidBWuxWHiQf4aS0zOz2fj0G5MMYsnloolINjkeiS+n2SieFMaj/J+hwR3OBwtu2Wip9kZNDHo0RkZ/MY+Ox2H8n/1z89sfuhd/xg3iPG/XENectUXyFAs0OkChTijXHPTdEguOa3XhfRdq364aJPTpxsbm+W+3v/pIMdC6W0JRGc5OwevzRKp9CCMTiCQxVZnzGOOPeI8/w8T15z6GLKx3725/8w9ylqwthijIU91dMeBDa61qAFzXu70BtbZq/P63qrpuAUwjPKe1XBDMWYHKTQ1XQMoob8Ipb034+bWv1q2Abzgr1IWT3t3jW7+9v/XrFRX8bevXaxS0DbOvNd2SDgMnOqoVkFyWrVIsqSLtqCZUiLQ4M+DfaLpgO24eFMrBZB4VimJclYJZF/TkXAE5pLGbT6XduNJ5+EBv66M3E9gbh7B4tb1PpbkNGUPB6VNGEFuh9oMyThJl66jdDziJM6tOJmmfC1RkkVWvTDVUxi3XlHaxGkOdRNj1FNspqp4IioDB4wiFHDw7xEZoX14IvFAztov5XlVgF+PtqqAu4vxCdp41qwyZUNZ+AAPaBg2A2WeLolWcYCtjzIt7BEf9INQgtLLWxzJnRl5lddZ1sl88Hjj2yKszx1fxxl3rfdPL6HnV1mvW79iGkGeNIo5J+yeqnT5x1HDywFEMHnXgiKh4tFNYp5HSFMHaGyLtWQDDBOgR3vHY0ZgzZD4rOUXIyaHvrGCrVSnKeylJ8n4pJQ05S3eZj6Cqj8TCrb4hNJVWS4Eh+DKK4v/TaH51A8zs0c85IuR5oyG/9+67937WL3oxRKlLv9FwYCUItnL4XNHe40gq+zVww+fz81jIKzd4qWP2saS8qXPxJp+wRZ+xjyflLfxhnMrIG7y3+7zcUs3jlR0yCeqBnQ4pCQGSZXGEJQRYwnNKeNy5A0d2SwXdKnrQ8EQjRWpneREyi1W1qRy+Ia6Ylakc9ZygrRxcNG3l4Ls2jeNvCb0m9ssva+qoUZarrOZc+nII7+x7pjgzPlhIDY+w4uD4aMoZLydZPlVIzSSLzvjs0BjbP8JW02w1BamhnRzjtLeY4Jw3BtH6YlE2k2NOgsVG4tmZBFNxlldGwHZumd/B2S9nvhRsOZOMTcSj4zmWS7DIRJ5fiIzmWHY8wQYiUQjJlx5L5gqzKV4DZ2RwbDYehWsJlojEhicimbHIYAJ8KlIJFk3iX+mh/lH8CrX2d3W/VvJCfNguSUXV3ljFiAzXW5zPcSZYEArvi0ubX7+7efve5sZvggSSrEuyAOcYaORnpYow0BWeCRNAqBjJASU9JW9ZGHKIZO528t6OOllsdbqlolvBAaj3OkXSQMFTxX6nWYAJriBNsCCIimhY94vY9aoqrhPsoqyrVL/d937qfrVBeX6rfrHhrYZEpSCdoDEsbDhHkH0NCKHIFF7nytcGXqFVtfFoRNGsghQicOiF4TywIe1Dr+0Tn/HnNg+9JDU2D7wUpDq4wyt2OMGijMNhenkgfC/t1lRb4GiijRdsmzyBDO6Vhh03Qpu2edQFbOM8RKv1MmuN2oPYf8IkjaR4teCnqn0p2JtqAouoEuPaeJ/wdRBC3dySq+qJVGhEo969b1KD65rvOjtbWrXPJB2ANt7gDpM0tm7llUHZdBqbIPCyzBclTPbkvC9nCMd6R+4uAL1UGmcYSaRN2qABrAbvpQ3Ge9s7gCTNwDz4UMj2jAKrPe9+bLQndf8UOp+qnq8YjFELc3jaDAYFdwyctzcV/9Lq11aWpppUGlKpR0szanVlPr96dq2UpDZ6Nbri1Y/cVzXKVN/cqT2CTNqU2VN/3lsf7MOg/aYzEIKXNN6HNPOCXsPlJO8U46iMeSGzAdKMN3V+/cfTjdPieQOUGW9ocOY00I8o79+RKHM5TpO53Lzmx/sFP1by/4l+O06lwUfFRLPScuZhrflf/MnaP9OzgHEiOKIjazv0n3875hZrHpJT42n/62/dz08+vXvDvPeAfS89kCw5bt6537hTVgwIvK4a78T/225e1YS6rVSbwF81Z4m/LwCptip+FJuH3zzvpUNrFc/B8IdVJ9sEan3wP2mTFb9RG2b4n3Nzf/s//w9Xp4gR";
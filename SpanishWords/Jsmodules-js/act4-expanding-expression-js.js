@@ -1,2 +1,2 @@
 // Obfuscated production version (zlib + base64)
-export const w="eNq8vWlzHElyJvxX0uaDpmW2Y6/m0Eirb7OjHmnWpN15NbMraWUyWKIqUZVkVmYxswok+JrMCLJ5kyB4NS+wSfAEmwQvsEkcPD4U2/hHUAf+xetXRHhkFQ4eWrNuIzIr43GPy90jwsP9P/7j3//9J/vDZhBVg6watsK89ZP/8pP359tTQedBHf7sr97rnjsFf0y1wihvBVEljJrwWCrzb//l338ifweNdpCHaVwUoYHKOvNxK/hwoV4E6fvpeA/j9q7P99887y++dehhkNbiAp4NVopYjTyeIAphq4jbe9KsQqRbcd5ZbBYRfJ4Cs0VQS98/3BV0Vifwr/P1/Ujm7nf95297c6e7b6fhsVVEXH4iC6B43ERaHmrbohLBCjw9aPwmCKuB/QyKtH88Xd8fxO+vNXxyvRfP+29nLDksHkFppCaU5S2BRhqUyCVZPQ2BeBDGaedFkv0WPu88qgZpZxEoLQLNzvwUtuF48P7hPvixO/e09/Rs7/G3/eNX+mcWB3ffYWOmWQK1qRcxgP0RKSZZ55nBxd+IWiIPQZhjG8adm1WkUThq8HZ97Xbv0kumgUh5FJhy8OggKlmz84CHAVZvCepVD7K8lUb4HXTMPmglarUPs0Ci8yhB7t8dWl9e7J553p05Ao95hJ8HUD7D4jgMhrDKFOBlI2tgMy3sZu41/rE1YN7i87fA/yYUBIt6Atogy6N6EBbZrjDHGjba8Hkt7SzF+2ikTQUfrqbYh+mHmRq8+XBuCj7YuPbN4OSz7t2l/tVvehdvdU8ehZdRGhNYNBnm4wFOC6xpnISTgSOUtplynkftGo0N+WkUWR5x0FM3qZcs1fXV471jlxXJPNxL3TYEirTizhJ+AxM2a0AV8yjPqS0/zBYBDNHAIxt3HuwNOs/bNM4X1wYHTjHV9eXV9Tdz2JRUjaAIgyiuIgsZYNQFOs6lZZMwzeJKmAZMvFy5zup+Gn+2Ur1LZ2D0GXgq3QpTGnsCxHS48eoJyA1oYqg3zKQaTtXO8yq3E0i0KlZpEfup9+0laKju20uDH24hr0kLy0V1EDkxtVgiSAkKM0DS8Ch9mo2wQsx/mKlXbEd051a5/atJFE8wqkKzBQktrqSd76tp1IyqaUydQ91EqK57cSxDs2CLcu/2H57sn3yETFfSyBYHGSN9HevXDnUESZRq1FWdR7ki07t019KYgm80nSEC0EBIo7NYNUIlbxVt/CXr3O7cbyfZZJRzLz8CqfKgFnQWpkgWYEW7Z99sXH+wvny1++ouygnoXC4ROCCWMwYVB0tFUKlKBbAX5hObk0OxtgSj/8PMhKXYvXO/e+1Nb+miT7QONcvxK4taJpelYSPLgwxFeLOBvBE2CukPMw0kRILn2pvu8vWNB4/6by5hR4GmaUQBFcWRbDEihCBYwQOFCr0CqgKBn7ehR543sH0NEXg9mH3Tez4P4oWJOHgcvDAKYKhhDQQ9SLB3qp1FGXT7oSFD/gV7vxpPchXqLFIK0oGd5/jYmW/XSaet9S/cQHqzM/2rKM6KIsqRIBCLJmKsr0WNaDAgKsmXooj/GNgff4+i5QKMaOp91GCixdaX17qHHw1OzcF/qImoGFP52j4rGmFC8DlYCVwVHPtZTioJ5mPcCMDK2EWdwtUg4YX9cuRi98RNaDWoCMgt1DmZsI0zf2+WV+hdVQjB1CdY1fOWqKhmIaA7n+Bt5xsKpd63RAg8auVZgSYIiK04zFluqU6wbW++SyMeJK5gGssQTaLxsPg9I/0TT4X5vaQ14s48GA7TrB+h7VEQ9mdOora68mYwM7O+/Gb99Ql4WW8Bxv44+Zro/L84AwUUqZj2xz9VyzOduLOwN3CdwBSgrbnp6bN4t9fcUzTbvbYOyQz6GocoEbHoPA98GwhrcO2NNoCg4s0/4vA0tHBGkwX0NY5PIhgpbfuzorPUNG1uRfnsDItyEKutImtaNYp/K02dh3mYVKIqmaEor4G1NvKF+uXxbQYIIvuRFCPFIi/Zes46izAggqwGJhVazg/3UP/XsY16czc2LmLVqjSvA/kmk8eslkufOE1vAAWKbKOS2QCoYB9Zm0HAyiaDEBGDGO08lvj307DabpB1BzY9gsbjgbUiUVK9m+6eucwWpNiOKDJqaVhnO9hgZfG4UYpFHE6C+RA1AmjmRtTS3Hce4ZymaqAlaSvQX/1+fflbsCRRNkUNWGokAkKqQ/C0iZq0K50HBQpbau0gC2k2C3xnAe2599d4BSHg3/cuvsDBmrfJSMUB3Gpn9Vo7y2l8ZQmsXEjaUmcEgBoSsX/5l0DoeTSwQnlnwVLonp5eXz2lKMAcjOGPvS02F+NoMiAaXINWDgoKBB983J4g630+4bkXkUwCydRZaEPDraD90bt+tzf3Pcrwx1f784/Xl0+T2sCyYO+EBIbmLcLGCpdI8WcZGFpFSsPJ0ULrh0w3/MfS6R1agv8cBWmr8TDYncbcWPxDAlIRhSzhshhMIxT72FLYQDCaaLQyOJjycwv9maeIDEUA1H5tCqJ5Bc3mgSHreTTJmu4mW5rTVcZGzUcK6GT3zXlAB2XHCwUqyOYgmO2k5CwesJ3HiPdv//Y3PymqefbPUQJW3T5YRf27XQZ7a1+74LVLXbfG9Ve2yKO3oiwvXfWCVWw6WipWyktFvTq0i0Iy39wS0K1+sH48cPbpFRSuYg7ctyuoTZZO3pJpxHJFr1Dc2gR5GV6NlIrborICsOsKbZB7Zr417q1Z7wzwEUYwNZuxfEea1mWTl1tutLVpDUzPriTVULIjhw1Iazdak86ZcSXbbXP7QGwzzybzjSXPbrHmijNUtAFklDGbJNaQsGYDVkwMEWd/xFHu6WurokX5s8pX2qq04LELHVadVhd5alLUzi6wAZD6xqUXoAusDnOqUWkt6oV53Nl6hGZJ9/AhkLxo7MCvkdVHWkEogW3ltJPQRugrKamFoxWHVhBawVeWdZ6YszJuWLopgVPgsP6PnxR2Ev49KMxGHv3pJ38DwhFaqw2GYZMM7qnOSv2PNKk7j/4Bfk7jqTTGnwZPFntzT2RyUzEQz1itAoGCKZrpfw+/1Is4qaXQRn/xq5//zU92V8Im8LD3J//f34AoAiUL/2KJ1tgYF6mPwXdjvwISuLsIzIOdsCsMaAOl/eEc2yFgvqGeldX48ZPdZVBL0MAHaCOomeBeAlcdSk+FgWyPWLTMB7MgrjjbfRZALL6JCJbrxMr7hyjmVqnG3eVj3RlUxvRzaP4QovR3tmURJkZ/WtMyjmDm7Ld7RyML784ypgcTLo0rZMi3h8pvWVrsW1teFkehFG5n/5tN0wnavQGLYE/w4RwOz427i93pq92Ztd6xswYsa6HRnNWCxk9/T/NPQIOpbNLHBWkB9kX7aw9cDAKNj9aAhw8dsjfQ4IAE+ozQGwa9iBKck++nad8YZkeE6wmsaPfxof7hx+trj9bXcDK24oCAp7gZUoOZjMRznDpAZtMCjkIrsiRxwhDxOt9XsskAWwDHBWDxFjTx+mEWJeT6yrH1tQPI6pubBradTaHR2Qrr2D4FyArG7zwYqj8RGOKYoR3HDvrPkzBvJ82vkIaHXWR5Kyuk90BGOApLabmFud9sC3O/mRaOiGcA8Fp4GLHEsRoKFnIUnvCZes0clnpN91j37goCyBwoWAfxDCh1VrQFCne6QXEgiaiCL9rhYam7PXCPRa+jPTyNsyonL6aeqPqL8pyUJdOHc/v9eXn5Se+AnvrFVLgX1uG/pz0Kwic8o+CMOPHBPUSHpUCA45F2spHk28lxJcOtMN5KFJt/fBm6lQRV0tMTcbqitpKujIivLyhnPlMElGb+F52eerhu1i52Kv4/aiIxFyNK7miIf9bQGzaXpGd/WzaS/lz68iuY1Qs5GqN/0IaS+3nj7vf9QyueseR+ROM2I3BrMP3XX25iMEmhsTEuVBmDL63JlIed+1GDTubCJp5LZWQG0rosfj+9G+3L8SBF2YNj+f7J7usD3TtHu0fplCuH9SHq2alqSJZ4Hu7nXVMGA9ZkCwFhQTq1cQR2VvaBZQD2tIMG+yzeY3YJ177vPn3GNLrHjrKZRgRwv5l2DgAXt4paZhsnjSdApk/GLaRr7FyLbbaZO49oDDEybzL35hC8oIMeLorHPvEEDUeHh/Zu3Eo6q6Y2USMsQpA3XNFRpNudJbDPPswmQfrjwzqT7S+u9O+87j64WqYJHVOt0iQIqxkd3XiQcjxcdBbl6GFkNT/MtgLaV7d1XH9zfrD6UJaHrn6ANFVv8ukwYdKCURPTRJAbGNMTPB/a1eD9ea/rUIo+/mHj8ks7KuDrejNQNM2atIxIIiiqhbVwnDYo5VtsNDw721eicn1mMH/KUYFytXaCu51SLtoVNsG4i2jTxGu7akwHg45EZ2VvILs+ikL/+ION2zcshWqWTSh4QZHNVAtehFVTL2i2VhEFhdqvzD7M1AOvk6aCmA9x35+nJfzdNzLUXz3vXVjpXcOdv2pkWioPQcybXcyCNy+D1DZkYc6l8mbeLtD4Dxp2zLJ6+DC7T7wVokRzoqzcb+d6h06srx6RUWO0RlTEAmtawegQJpgVuICw3IyeG45Va3mYSeG3C630aXaYwSs7+DgzaHssd90hkptmC3QIz0JQRna62rEVTwL7hgnDAY+uD1eTYRZgiPUuHdYsNGP0RQH6Pm0YbYANQ83RFS3YStu7UGJsMkv3gCCa0iYw0Rr88AoknVWLORCMapkjKiqyhB1YIxYG3gSeiGuyIPBA6q3sKnc7011/fXUwfdX2OdOdamFT6tqyWAJ4kLHQ1IqAOOKYtp3HsZ+lUQ7LczJcR4193HlomB0oNfQ3rt/qzj3VQ7+Ig2razvKaLDoNchIFpeGPasW+YyveqBMc82U2ZNCTZsFBb7kgG7+G28ZTeTQJHWuboM5+QpkmI3Z/hEbmFoOdLGJgYfeIofbk4uDAIT3UCGv0UE+ZkNQeZIwhxUowdzrcG+zDqwgwTSvDvPCCojvrsdMKoyDzxr1aYDBFVFWWoFlq5HFYiAlQdbKqAQCt4muSvnuCH0tswJRcqBtDqzuz1j26yqz0Fm/L2rCdBVnNWhuoNFswR8zuQZxYopaimNhg0u+CLjLv2bZ7P13Bs8O9XluwmXdntndFJoaZjSnIIdsQvyeLMyJdkJnJMHJ/3phTpTGoB78xboxhM6SAPflh5YWv1bFwyWD4BIghOyDfrrzTjvknlvO0x4j5MzRS9QD1p8iQINZS0ixJRorCkhAsydzGJ1btC9bM61g1ob4u4aja+FWhlcrQULVLFfrlDyOWKlzkKxq7SOP/lNYq5nepfmmxYn6FqWop2PXKX2++XuFytGCRP/9aLVnQQQeET4Tn4SD6ySsTvb8+zO4KUK+DHCJPjzcXu0dvrq/c7C7eo510KTSFZeiUftHhxAzEZzby2sFaNIXjI8hOaNZoAce1LOFt384KnW61ydPp4tPuE9Qwjbr5hhYztoTsxboX2fYIohptEaOUwArLmqAuHBewoNvPGL1TR3nHP6VPUuMjKI9tHyHbFsDufcuz2RCjo69W1pQtaTq1srvw3ZWDagt+L35lzr6oiNmYdiAMwUVtITFHbTFxTACjpBqC4tvPh0loatOWzwStK3Do9m6u9L5d6a7gsVIry3KU7e09NCy4cCXY31kMczkMC3NiQGx2KGyLEQP0qaGehI24AnrRtX1mjqyhA5+eobNN/iRUf0uNzWO2bWEmbZ6k1UXqT5hGXyE/6PMTAnDMCP0KfWNkPj+ZAWghtgWQHSUHkVi7G0+tctv5H2bHCQXXPrTv9uQCQPWvvOWFHH0ccSeDXW3KCkMe3M7BZFw6ONdERTwJ6lxYm5mgnTpYvZE7CZ0RLV3cuHJnY/o8D1Cor5SQ2sqTazD3s4GzKLq8ay8poLV9JU6acStpNxRjNbTZBGt95bLR2OpTq7bVO68j7fsdQo4C9IyS1jivNAUPT2F2MVz36Bk3OvgzWTvk5dFlf90WQqY4g8j8bmSGAxTQtN+MguHcqd4B9KloGMr0hxElVGirIkKJCiXeybuhBqsXkSOgY3YF768x2/PHUJYcWRrcv+3O4gvXN/ykG0D9/jGIar4xgu4Y3PmwnuPQxQbXytz+wklAtWKXuh0LpW4QtStRqacItYRpsTSK4o1hEnu8nXTm5RwUd5AKORTvP740eDxvIPCzkI8fbRHDiHnOdoIgKtGUkUmfq+HMp5S4GpVKwcyfMovitbswKQb3pmU5bMoMnVWq2aHOK91bXHc1YLnqNj0suR8fgo3yaNysvIjixvxa991htv000WgyrIsRWEafCutmtcUzheuFiyuaULpatKA6Y6tlJ9dQtXiauRoZ7HJ1HBW/NkxI10bT8mpDpLyK0BTlWpC/ha7AiZuW+2o1HGacZq3qCYQqM02gJX5P3NTMCrTHZ0Oqb9jMYOXbWU1Fvz/CU25x5BPTZvESaEpl3Yw32ikPbClpxrU8isvpzTghKFyBHj0DEK6wjGn5Hof0qNXmpxiuvsm5rcGpjU3PTtzOStQWom/ZjbLrlE1nDbBR5pcxvbTltJ3dpP7S1s52to62c8pWyY5tEs8e8WyHbSwHbTV8Ud1e1sk70MhGG1utuoVOFX3qK76PVXta5fmaaQd6SeskT5vsQJcoPVKW75Yy7Z1dVlLbl9SeFNVy08pKJSKtWHQyTKQWSyoWUEYoaRmiJJGVQFZ8ONExwqkLWG115kFKhv8YFFHnBxwIUfN/lrcCqKnSzsq/0uoavbz0RgA23rtZWGcjWc+7izeYADCoAwW9/P+rzZb/tkw2NgaFGmN/pdb+vKkppznZeJjQXbL9Yd7Eq2Wd43yXBe9foXf9Yhp8uDAlrqbZ++lagK7WJBTnurPHegcX1pdnuodfbDy83H17DL0DsilgNN4bQHsQfMJ+RFHeLkKQtbjDHgct2k2pxa20xEclTHDVEshOQsTHUXS5Qz5y/MX7SMwG6CfYEpZOn9m4fKN77RZtBUctueHmWEGyjJlqTBoIuP0XoPdCM4YuxX1QaJB2hncy0b0cxgbdZKAt284iOjPuMkqL3TZY0Q4OHMY2OXMQ3XG/m+7ff8KaDF042HZQFKJJlApgQAYNcebgFx4bUzJr92PHQaW8H2G1XRFnSXTrn58KUCi0P5ybCto/nq4GPuvIL96EpdPAQ4OFA90zZ3tzxzcOvbFso/f8kzPkVhtnk9SC9UBTrFdCclnFvfE0ikfx42SMe0+LArz+UA1rcT7Oy3PXojTWOgvQqXhFk9y8TSMeXBg8vdX75oaRLRYzx9GGO/347+40VAa0/aaNZwG43Y8bs6ytO7erYTWuBGUOq+Ekn/hZvsg/my9A4eC3XPWenu0efgSDfoilNNoftwC7XovZrQJQq+24EpTYClsJe8gUMDrHcTOiCuPRjQu8Ml1kf0f1WUnkvgaZX8zY+2m8xzRrvPcGj1cHbx/gdSlg7tEtPJCksWbQ0TFecYkTcjdYS7/Xn0SaAZCieKHEHAA4xqCvUaI14oCcdMnCBPHwnO7SXKvboYZM3ZveOHoa5AI3GlkwHg8OC2VCTHJ5FCWRBlkDerFAd16SXw33bVHqN/GZXtwDIypXB7XMCHraHzrcP7RoD2oZuI7IRni52We2CC1xutKliFt/w4jObmM8L0HvcY/DrBWTalN9CBoBJQd6Ez/Igx9Pgyz7cGEfayrsx2/eDY5+v7662r1zdfB4mTSkw/ZYTMOG2IeavMdjvSK6tADdjJO6GrifWSng5V9nEOAdbccsqoPOam6OmRdODp68ZTbRPL53kK3/AsAr5cEmp157szq7NuAXfOjrxkKjsyTOR6BBC9qPG8EhnUtW2OLRc5RYWvwW7B6ZngcXRHUWZqNvBFM09u03wFeZLSPG4rSNa7oqHd3aH9FgwO6Deaj61J6IDB4/Xn99VZrInIvgiVsEn4xgiI5KUEgwMWZG07MDLAnbtdj7DR7Ql0dNALwRxVOgyWpAnVqzXF083l1ZArnvDq6ThLchFFPwihljmiRIh+kqTe31mZwkWx2NZ8muqcTPjtQ1niJTS/ERMqluaaPCayQ+R7ZOKtBGmpw3DUmdq6IlCSEKXMsF0dbsY+rNr0T0tHFwZPiKxjcuqHSWHulmEEdPN4LlZF1JK+fzyWtqPlpnpsjz0/pymKP10ugRd1Ae1XTOjsOnxIO9jhbtYmeyUfNrBRUe3byK0dwbmmbXHm/Mrwye3NUzrVVhxE3nWQZfTGV8G8tjzHhmtTqLScZqzwmFzu3/wef/9nDbNdnKuAzn3vO13oV3xnQ5LWoPIGIELHHTylKs9u/ZdUuIAkOKKHuDZEXerqCczzRHclp4E1fpWhvLjP/hGi5aWXazpQejKGWn/zInZOsZItwqmWuUUZsTIyxgZ4izblVWrm/bagutbM5qk9W3TsWZtywOlc2kZpSdRWWTaMgkM/JiS4jIA8g/p3CpBqPGvIwq2U/kscSnyMMqo6wgykrBTpiSxHWH42WpPyzmP6p+X7Z6pe72x355yOvBPjS6Rwxne1wuv406MDfFvsIRCrR+Wzowd79Le5SOzN3vqG01Jbty/vXmB+emNB2duxqN/Votoemuc5DBWmwcljXjGO2CN5g4kIF4RTZ5OwtNUXJekYUzXn679HLj8OnusSNgiKIXCy2cQXmB3dmg5ZTC5CuyLCFgBZDH9jceeyhCwF5Q783FufcP9zs2UFCuzg5++IYJk4KrwPKJdpA1PYsIVu0QtZgtj4gXx3ixtmr31hYmSCjTvVS2PaA19pkde+EBSG8cWoA1HZgf/WvLvWOzwgyrULI/shZFQhFgsOw10dQRZac9iqagGcHbwjV7t79lKZ++OHhxr3f2BBNMkpgDyICakLhSadRm31SFX4QTEZjTuIngtTB6v6LzudfA3RPz62trroF3F6G4PXoNHAoiUmqRc4b4zSfhOEbRykqk+KYWLkE1MRT7r+5aYrthIA/TynYxJN2BVrTogjXoDwy8k9APbPnr0CJ88R2dzOWamBlGFGEErJLu02frqw+ZPMyVSVhOwiqOHE7ISqNb19BvQrrh7mtYkrCMG+dlpKIxarOJ6OhtpgiJ4BKymmW1oPgpLx4tbgadOW6WjY24mpP7WkOTLuiiQjzp5ss0VV7uyHee14IfwT4Es4djxCwOTlB9Dz/rPju8cXCNPAoBuGZ8PYGfAnQuLPwjvrmxSGRp5jqiKSw2JnFyyeZjHuLBXok1uU53nrZl6VgD7UVkakpYc0vawZt7g7dHwFzsX1gA5uySFoFD4UuWsFG9QsFIHDfGYmYHUMXCkLGqO8gzUqlrhsxTpqvM0aKzaDvHXGlAhxGqPM92dYeGBCleSranr0O1lwspIE2PveMNNtcA7AqK3iWhxwnbIa14PKwrhoSbAl0jGwVAZ7TI8WYG3nJvGZlG0RTaH87t1g5ws6dAoHXPLnXP3FaankRAIyzUICGVn9H2CpCLG+QBjbcjFDdFWETNglal9JuRbtwIMQpbEnTUHY4JaIHBi5XeycPYJYaJgiJBiFusYqEAHmD0opwvkx8aDrKEKbkG6zGh1jC+ezAOD17DjHQPxlnDaxflIxx5dONCXRKUKwS4maj5k8Wd3EmAhkPRr/ljpvh+AugfmCMycmmy0EUFDCsnLPGVKKaFh5eGjlnkQdegigzTgLZ1Rk4d2s+hLbEoCUry7SbKVowYVRMH2pvOhfEqbpitHhH2lk/01+b6b8525xZkiwVFfStKgzSD5UxSGuHMGC4mcL9HtGbD3ghzXIIdnyoHZ7a+aNk31LOo1Y3vs9yVX18+6eb+8mn2feYYTa3YMRS0fprCAmqK71NGTgBglA90dg7MKR5MvrgR0rYeX4DAb0NYfcHA/1uxYWUftnOzJcvnOp9S0F432hlNepT5+OR89/Cj7t1LyOebM7BE6p452Zs7iWdrPC2qYFDlE7zf1wqTCduStCnK/NAKsIhxs1JPD9wSipsZD0Mw77hd/8CnPBTLagrHIPQo/cnCQxaJ96d735zBEfjmJvwBYoPZgSUTQdKWtuODNoTwPUxIx8PI5aE2GvAIwFglZ86yjvYsg5Jl5+wnurFmir4+wEWNkaRNo4+lp82PsmzV9oW1KSJrR2xmPmxfNt10/LuLLGW9pjWaN7V8hTFCRTgktfYTKeMco538bXxGzb5kxTysTGHRms8DUnXSFfo9hyMqD093kdNgjrjMaah9JVIHCP3OX/K5L6QZ/BWfBkDj8496qfeXmy71TDFxkq4XY3/5Sz8Qxv4Y2Y4mAu6RjCyxuPNgggJnUeiaK4ODd7vL9+ik2H6OIoXu22AUpVRtwdgvMg/OIvkw5tYOolgnLPhlH4h38fHBi4QkcZSjT2/mbvfhtPNUmgjz2gg3pTzahQEhlcOPQA/5/FgivuMP0/EclQwp30uJKfl+StWsaWJdiA8UDDHtrXT8+/V3j20lorSdN4crgSi6BvhcZl/hlxyXiITm31Lx+Degjvk8NJ5iGLhrMfEYn3vaP+Faf2+WjOAbADTb8IgEQCBEfIC5OsW3Gy3H6ljhwOXBgYvCtZEqhgrxTcLFglqfqyoFWO2sxrSLe/yaCbhEIzttV8JJPJk1wVPxc/agHi5gBiZ9bUdmJuGk6e4+7qsneKLVoqhYq72Tx3snaVWSkasGOXOZv8WZSxCynQEwD+ZJb/xHxtc0pggn5yQoK1+N7i7O9u+f7j8/x65l1SgSR9ckiamk8t5vyG8Wx5Y3JcXf1ZSVdU0tpohhICMa1odqY/Ue+1C1woisIfoqMC5UH1HEGMKtOKonNlwNmb68U8C3dMDSxS2CIxiis5nl4hc6iS41zi1UHjMiDeYTKH+q5I2V3s03Zh9XPpJOlycrj2pgbhp30DYuyXkPzIat6T190fvhqA1bk0etcO/whKj5PpP0POz/6fBLkoho6JlsyXgzuTbkLim1MVF3MPC5nGVjDdS07l94Cv0O1bAzu5GHE8MVEUBdF9N+peqgsqM4zc2yXDq8Bh3gySXbCeUaKWxXKVA0iZGuMgF0Te6fdrqBvhwWT+M0nLVqoA+HXFgX+WQG26vUI3dOAx1PNxhSHv9MSbNfHtfP23U8wKRA57Dq5Vk8mHnVu/Byfe0Nz+JWEU2CAueJXK9EhQ7MZPE8NAuiistsNgAmbC22cJzXQuN/TR4hMMl0RKynZ2GmKYdVGhwcKMqVD52gM68yD9EiOQwTLkqhfBG+VPFP5kqVcErg8xoLLAU0IT6npQzEF2mmzMB9MkMWwW5gpNF+RE9dPHLmBzcBOCg5wMBy38gYOjxEaqGpGZgDPlYJyqIoCF1eTnYwEEKWemHRaXPLsNGfecpsUHh0OcTkI4lQziw1kl2lf5ilHdMbNzZuHdGlVVG50dl2o5ouHtPm0pTpn1XZ9KP9hqvYQ6sz/QsLEqHPlMwzCgGusTicQZmGBreQPtgQ0ObBkIyVvgND3hjxNhbsvjTSdrW1pY0JrcxmZ9h6pqw1X43VaixVF1LARo6UKBlzT8FuFFtRDMQdGIbOImTzbEfGmfpL2VJbWVLOivpYe0gbMjswY5wJw8OjXevM+7aFtSeMGWFMB0+dy2BHcqhKDj4HYlpTK+0s5aQJRCH/eHqcdXHv3CJ1SuH0oae3ttNaTmOVBNQ24snXKh9d9jOKGhH90QUzXVBk3zaSz0o9J6jI/QHDaHCk342jIFOeGjFlRNRny47hTRD342/KeyAAjcj/Q+96CAm90+GI/Sb4MzTZoIa/03sdv9psr0OxSbsd2DRjv9IXwjFm+j6MjNFuyVWOB3gb/kJNTuNqFMkLNwexa05c3vh+oXfgfu/C2+7rA8Ia3V9NoyapKgxNPR4Snr3vEUZF0VkaQcNCaqQIRCb5yEQw+ikxhoJCCTdOgTlySYqwiAJpHN3xKPrruUP9mbX+rRnxScQjo91ZToAtzuZg0h5kVetthJ77mc2Ag17ej/B2w/MmZ7/BY+tbM/2bLzhuV1QvgUIX7g9tUHzmjyd9+uEC4YBOozXR6RuA0rt0k6+27A6jfJzik/O+EdYU4ay7Fu6H1yhgF7VCs53zKQwuagsO4o6H0Sgdbh/snbvYXb63ceM+CRSOu03FiU0DJQ2aGanG3GKopJYJ6Q3sfpiRc3z0aqA7HsD28fPdp0e6p/HeN3OeScBwDgKI6RLIezltNyWoeqPzoF1LQrl0gMOP9jk4kCDvl6IDLDw38LaBRBU8dmR9dbV3Y3Z9eYa0XBbhjTTarm+2AyJNO7wxYdNFAqIujQbah3bvMZwTVU5OVXkzHg8KogRdzSc4V44K5jR7qjuLJzDdM6cH76672KUVgURDiGtuXIMNMbKJLA/ogoXxaSmglMSIcxEH4wZSx5RUZDwsJDr44PVbvbX53g/TvaXvLf2CepO8I1pF3rbUkUyC50CKtDRy2fVQtfiQzyE3ufY2NK3sOxcWqPOok5VLYVRNsgbF8KGm9kL3dJYa2NRmPMki9/WZ3sI8NDKPKLk7iCCudSVKFL3lKFEPbAULHsqUVCghb5UG1x6J7iP3ePSXuInhm5439RHp0lr38FL3+hkg7I5Im3GdL80gFlPnPfpomALXF+Y5JdSg4CbjkgNmJaG0B6q26oD4zcXB46euxoa2ILlqE2F8i3OCz4YVYXIABpYmAkuWg8qRMDWnTTlZoosgVXuXz3cfr7DveBECmpk4AILH6zJhRdQkUY2ShNgare6yAoBrhDV5dqB76AeuBl8TcdzTha8oriPjjusCNDCdlw4NkAf7QYbhRQM9F41/wZXB/W/cPOTTzyhp50NjBCU84ScwwZwMMBI9aKPLtecTZyQ89A0fz1KiFSFMoh56B09hX9+R/QsS+FMNj66R+NRN0pKSkgzm+3jIGWJgYnCt6TiljeIHSLY7z1uWrkSdeQEUNw6cAaIyNjya5LW6n2ETzJ3gyGV0FxR6mII0jXMWGMxGJK78Zu5xdKa1y73nx7n/ZHu9kkZY2LUrHejE8jqJmNoml2Z3pM9Frw1pcHYQN1rW6ldPsyqFqpSpVaRKi1rtqdWaU2ZWgxndZVXWzr/XUtYfzENCriTevBHrC7OGEdgSY0mrRitBRCkawWHFszlNLDM2uh5WAHyZeqjppga5hpAjwyN6wKlBVhpYLqASjeKh00Ki9xWif5j5W/+YUH6SmvpnhPIbxm8F0v9NW82/3PSEkApx0Ffkd+yX2ge0xb6H6KODQjmRxBK7AtrX5fiI6YdZyolxca4/97r75tbG1VnjkJMEMBdanCIkkz8VmNgw9LYRGa0Ga5aEddhg+gKbJPQFb8vYJzkMae8ByywLcce1zVboDMhOkD85Z0HsrFDjDN486d240PvmxuD+PUqw0M7YbRHtuglamBI0pn1iKMMcSjc+sYIlepWUD4ZQ7TygAXdwhVwvznffYmKtpD1BING4xcujVGLvUcTYgBgmyxY3e1fyctjZwfHnvZf3dNhZ5tXEm9Uo7OWIC+iIcAw29RCu8ykX1b3p7uMfcPkdTeS0Zqdsbu57E5W6GmJMmAC3Ayh9CRDFexKZpEcFwd2bW+hdfM6eRHvRNWd3JUt382oXS+dhRfCyNIyb8kxL3j2kBWrYu+SiNPti49yt7usVzj4W862KqZB2bfgFRWc1eOiEzE5IDXxnLEzrckyJFKEZ9/PAVHYueR5D73Tvnum9vmDtTHJERgctImqDXqP38RRQSS1lup2n2wWUjWuUjUvSInmWyQ0s1SqwPsTlAZmtripcAbmMVk1DkmGOdx4M5OBl/JGcJyDXonvgCibJYn8k4wlI9dAh93EllUY2rD9SBXKdedmswSbVvGzTnIb+UHMScW5OPpGZMg0pVM3m1SROU9QCPCgcvLczq2xJritt0TrXEvTAJULsYYiwcofMkFLRT8uUMKoqelWViWwWVdURKoF+uZFh0CLM07U/wqvI5CtMt8haHG0q7awmrF5g8HaPPR28wS3RFGwAdudjx+Ck8wB3mLFHRbaycERfz85t7D20A/GOEbqQxRR+4tjZ/q2n3WMPOfInSxpyZyN7syKl09IcpB9GDxqc30Nj5fWKHiV20qmhgnOucC2L6X1oEz0Mskr2JwnFixeEHzSs217npjH1zh+C1u6eP907dZw7EAix4zs6vZAGBs3W4BsGmR2SndtJhqMSayMXP1p0ZS7FRjeBfr7tzh6HGsjICKEBalZYsbWay1u0Vwl8dIxPowhRI1F0bHKUu9ebueuUnNJwVgGRzUl3QVmT3T+udRimrwNNaxWY63jyzmyYYr2zy6oYtohTId48YQEN84Kl85/jWqydtwpMdBp+xdXOeEleEmksk0dLYU/4eiJ3pGAcwtHizxd57sKSEwAGis1MH0hNe3crVM1zNcG3aJaCi9jEArpM4FdBz4gzdi5o3p3atENRFTUM20FoR15ptFmrEqfM8JUj+PgrEurQFv9KAS9geMDoKF89ou+kgZZnZNyUrh/RN5W4aP8jTjFg6A+8WYuD60/a7vzF5peQAGNsDDEaZH1iregPGqBjv9BmaOd2i5P6woIq4lAQH87heupmuxYYr3VJHrZxYbp36uDG+bmNtW/QCK9kSRXvjsLynIX0ksMC7SvzLG9mhezomeFO9ijerW9P4fAxlLAzriysr8z2H88DFUniLTNkBBUFSFNzf5rhdiLGQgirsZfl3PrfUwIxzlKJFbl+jld/ARfmtSyiAD6ARBoY9zzrSciZJvEWn+W6f/wU80u/jsLClHRVs7bPqxhpcRSb1CqcT5N5hPbo31gyPKYZx00FgLjpsciY2ChqG5oTiga0V0Hw76/RmcXg4E3co7ixtHF+mrdGWwWlrcc9Cg/f25Km9o4rZu+3iBv28JKDvaygdZUGdBjGR5kY4uXVq97S3d5TXGbvixu0nczp1Pgvbp3KfrMT4Yig47Td62RXOQfO4cotMpgCycRIbEKRpG28RMIt0IprdtqdX4Z1AWr+Fqo3NFJCWpFh2iuJLrKEeeDiig8FtkvYDDn+EoaTIbCN704yWBFlmPdzGI2L7ZeDqIimB4h4LPzjwwkODIN5ht8/pCO7g3cGB0/11s6uU7ZAWE0Wwe4k5lCpXDiJ4qZDw0v0Ld7LXME9/vp+SYYheK+erK+c7K8tM141zPIyXpbG5hQLVDlnbZX8E+RnOU/nbPMU03D1Xe/Jtf7bE7zflIP+TmANw7FLuGgiSSMFCow60LoUWOnhFIN5iIP524BoQdEGjPYWZVSDIvZGNcNdfBxLraiI+ZwO05z8KaD737j0paA103f+NHix0Lt9nPbk4nrxMzQfWy1JV7M0jFMm0Igm26lxs6RLXwZ8ffXs4MQzxq62M4xTMQo5Gm+n5uioEsE6Fs1d5yCM9yX4pD7mIFk4j5YPdY9/P7iN07US5+MhjHVecCYOwORSzpn/mJbWfEHkRxwDOBCww96cHVy7NpjD2DPjYDXCAjPmK4ydZ6ZsEhmtGbeKzjyfOdCwXGzK9X4KmYEDvfcAT8BB3uPEGR+nw6WwkdU4OXhq8nDWK2DN0ZGcj2EAclCyecTnETmnYEEUWd+DtMlh6tjzOs6nwcfuFFqEz++wta68BJHQPXeKz/BIKLeKKSgNvAR0mCfvEHFKH+VZMtgCzOpqvCdQtGh9fYhJkDEMlRZ4BWrK81Im5HwrRYT7CWxzrtgILhyv8PCrjTuzG+dfUozAKIGuxRy2MiVbZA6R0MBDUeN5YHBLKkkgSSO9tBppGE0rJBRnZd1hNrgpd2OMd2Ef7rJ724Njj7qLsxtHz/KhS00rjyzPhjWHECjzypjIK0ExrwjocDSfsNIQCa6EkdXBq+9YB0d5jIO62cz40FvKRMm4TGb7CoCzBtki484AWZ5mmDTmE8ESDJRJM7Npjg4HbSMuwkTOUmqY14QmGvTpdTbEg0YbRGqbsyfF/KctNgxWT8grqbM0brAeX2CsJM4mNgMDDWKjLNwPJYlRHqUmCIZcK+Js6tdiPj4g5553l/hSEXQs2AQb525REviIzQJ0FIkkhl1FYGN6xQnoJzvz1XhfhomkgSxPTor8gRqRMlID4MaFY5yImmELWNJgLmq6igI9YwCQgrnZilcYyEiCNdukrsMI3h3XSYz7ZzntaAJGXGc7iUMa+dBZPW03bewzMY56J8Usgrk8MYyUdZ61bdSRBFYRlGw8LjqrNJLIoqVEyBdoA54GOFi0GzeWus++42FOhjmKDUlZriHkmjy+Qh2HcU9aHFGT7GXayml54GAh9n442Zu5ZfFNqRIJjac3JrFSmDmPTSK8mcrbk5TdeIn3Jnnh3yjwuvRetyuJ3nNJVkYLC6L64+k2+UGT2p0/xSjY1xhbxscxhVyQSrTqecIlYYwWQEM5ys1X+PJearzfvr3Suz7bXzzbXVul6nIJSoBVESgbPXQUNC/Vk6xSRJpe+mG2KfeGM5I1ktege366f2Ghd3Oe8xoUUZw0m22yUOoVdsQqYY3et6C1l7ocbJZZZoHlL3nUUkRfKOaMyHYp4y893NrAbDsvSnayF7Ks8JYU2gInRa2MeWNpl21sZxCTFVwzRvD1B2wEl8xfa6XyUaY1Sq05qixRYzRS1ysD0ZqGyiT0zDRxxqeRR9bYkB2m7C87sGihwcMJVhfW0hIrq2zFZOaOOdsxg0MvjR2jbCBtVvhWi7VUnIHiLAin4XmLnw6BSJ37ity2vTHP3Bg6epbHkNOmTveZ4cMDh88wlZrz9RFuCJAKYv0zQvVYjWNEP0t8I+uN4nCyl1zo2HuOJK0nZH3ZSjmtlbAzMs4TbVoAcQgq8itdkOMUK2eMdLUTnDSKWNm4Krg+q8SH/nM4aqug/GN5N4iGEkB6Wz8soPy4rIkDsFs6P980IqvhZOznXubIVoohJ0FiTwZtTjW3B5SDd52PNuDfqut86AhWvrGxP/FulEF98mjEBZo92FgtDABqjnYBvXfiUfftJblpUmCijvItDUT3rphkVdympwAFEi7/x9N8y4RiMpy7sXFpRTaYwHICaRpyiHxd0HrUu1fZzqDM7QNX0N2O5PaUc1QjR/bIvMIISHRed/x0d/UEVJ1P0U0arCjPJuh4MiqGkXz8YsR1HkuhfJ+HSOm7MEAT6fnNrImWr/PwGKFLVv7g2H5kSOnSZR5DpTw8EN7nnoeff8uT6fiXPIc5b5iXOju40PAShDMJnSOcSNhdcIGxScJ92GHIMt4oMBf6xOJlboNdsyqdaNnkNhAe3Q77ZkyWW9ft2Ds2XbOOyAtuGS4lBrcEXGJwTcLkBrdUbHpwImR39H2+3Zsyy0oWObBRSH5mcAumGNSMMUsFInEQJs2NHVVeR/udTJ6RzEhdIdiE4PL8qT27CUflXvV61HVnCcRmADdT+usyR36v+V3Gd+w9djwgH8RDGCq+SZZvVhxsHKEhSCr+4eXemVmjG4w+KMvuHUluX2qzPVP8LHeDBIZ7IjK6d/2uFdAtSrngBKQnx1zNba2lykow7bxEqkt88Wn8hSZZaW6NqI2ZEuYQbrjcp43hzxl2o87j6Jd/GHEkx0Uwbd58glfK/oWO5YAYvPhT6VjOfAtjZuPIufXlGbZqyidz5jPy5/pnPpUDHv9BW3B/sfmhHBcXd7C9HB8Qajj2F55Ftz9O0CKJQzEKnlf5KIDiBLMrLYWKW8DzgNdXu08pqEcVSjndXcQy3AUMbDuju+VNxBfCFD5mx3l/bbfDXrvbPfPEYqe0oa4wo2ok+yCRvLH3yN8/9LKxDJ486d55Zm9HNhFO8h0l4TgGEDR35gVIMtcyY8jQgXPAkClqsxxJYZtT7H7UzEwEASoOSzO80FExV/cPnOuvneg9mmc+omS80W4xK9l+WPxmLpSABcs0lsVQpcWB35Q3hmQcVqQLKUoTdt5+/ybEYPZN9/pNexMiSfRtcOrAPCIvjXDSQUq3EUfvz5PLnGmhwatTMBwMEncXIbiOauCjc+8SCGVKMYrz4wIg672FSMUXgXGmE1ZJOY06MOs2Klji4hJOKO9XQvpCML5p1FnEl2wX+RUU/WoqaDxi8Ias8aElvPTLQSljKOYrlQbGFqfVZEIbFaqbaLxQJ3ltIvGqbZuwAcSE64JgjJ9Pb1jio/UFQKzJgzDGNVhhGOdgxlCtKAlCkI/G5yJsau6IMPQkqZWgRnZ6ctPFp8hxhxAFBJdxEk5LN/lcxNE2wkgJIrPLJk7cbQoxQ0MG5E5v5rjUUWTEzr9OzdefOee+0Pz4iGnx+WPxM0fRCOslDkeEswJKX1FsPwAuO6jjT9AlWLmSe3rI0auApHej87/+YlPf9JADVyGTY/CZ8wiKqym0EcXQxQMDsFJsGttHGJUFjZEF2ihF55Tph/3pRd7mLeJ2jb+O8tiEiajaly4EAj9nH4Vo9mzsG9EhICFhJmUFiso4asQ5+UbHSZNzp7K+Ne70nGiqd/Fs78DdwfypwTu8rF6NQ7wQBxxPJU0qVmRxEu/DJBeYtUlDbkIRWqoV75btTzr1cjceHz9jerQS2x1YaiPpCJBKsVUBo9HlvizwJJ/2ji/e7n97xmbZoq+8LJJUzM8jie+2hyljyLkDb52xcYV2FdrU1Jgn7g7oFERt04X8t42FxI/ZNkVN8k8um5hbPtDjlcAkP6FT6cyE2EXnpliiBr471H16pru8vHH9O74tEGEAW/SI5TAEDGOTmJg3Erf40T4QAeQcsXZkfe0CZ7NgDFXcuI6CPE5hgVaLCikvyZPeT9Nh/kL38XFCiCbINQhL89fDAJsWbsUYRtsvHtp1aFgrKG7SJMsiDkDMo86PO9Q78wKGn447FLUrWHZ4oy+slDJPGjI6tpgEdKYEAMPBxXCkn3xSCi7mCOrwYkKuFE4pCV0STUdI14couMpMhiNSaBKMF0IJX+DyF1O18O3kT6iH0NK1IGBdB7x9U8vbdsCSzzOmRfeHK8iD/ov7drhKIRmtBmNKxqp5Jud1CyihrQWJglrLd+K0boqZpOrV9i6YV2hKsKc0L0jGA/JxSTurnDjoQXf5ce/Zwe4T9JxpJlGd8mPtLjiaDQu+PMYDRQXqAVoYA2AC2XDh5IuxAxBT4acxw0VNMmO8/HgraY83QpS0GG+Z1CrFzyanxhWOkMh+5W/u9U7cwUl15iGfs4ZcNA0x3U1FMmfKS5CBoDwaYTKCVJmEBveQXY51g2o2gkABjTfYWSpr5nRd3XBPaXM4BDbdV+IKoODnrDkbl5/3Xh6DSnTPviZTlbKqsepGJ3ypC6omIlFQrGBVF0e9yKwMUgTJf+Ayk6Hr51GrXosnDIEStmkeTqkS2mqQskDesStBXYDS4DvDCSeft23eWeR3YYlNh0nGNkX6YP3TfXKD9Y9D84EkkwvGiYmaPP34ggTM4r1yMWOBfOo2rjzonn4Gs3Dw7gpWrA01q6WY8YnnIoDktRiz15lUZAbVajYH7IsKgTaiwkEb3WahjbwQ5EbkNlXJB1SRQNfFDxc4d+by4vrKSaayvjrTvfMN2V5Egu8FCryJ1iR8ezxbPl1ZM+u5sAqwWAXbgg2JuHNzr7lyPl+3+zR3vsXAxnOrEpyNSlTEtIjcY9tH5PhRNQpMQCL88PrqSV1eYtjb50Snwa2BAaaSd99s7zb530TeImNHfugdOswCF1V0BeUrFmOjJ7bPNnachv4UYDfxDfImEaWMUf0RJrVvTm9i2Sob2hrO2mQeZcR+rsmpbMatLUZrLWqLjnaUKY0z+WoeAXHKUYaVIfcZNphnGXmWlzW2tMmjTB1livj2h7U3xMawhoVW/krzW6VvNb5T9k4PbqkFnTreeQFSmWUltlMV5qkvX3t8pOpQasMT79sIdyXYPfm7qRSzclaLWCUAtxF/TvR5UmobGaXlU1mCbDICrLDwBMWI8FFmuP8xADFiYb8eTjMMMyF9f4COS4Ag0PvveheCZwfeXmIO9D7EVAtWPH8M/iwwTH2t9yL+erO9CCpWjI3Zqoz9tbcfgfcTK+R47xQaWDfohzLNnlSgwzYOHBjMPyWPtpi+Zt1VpFGFvEVs+gd6NNKYI+hRdLgrp9eXpS/oE9FfBsCGzYV1RihRiquisXprL+RsI8sZO6yGu8Jxpwg+lqwpLws+/sku93CNJxcxXNzomTUAsgujdG9WLa2KCFD5+BAm+uTtKaHKLVCN2zu0pHCzmiRf3Rs4aECK23vk2HNfHI6H2nED79w+5MRKccl9A+/evpnBhlAeHJiEXnldEAE5U2XGbcZWYVpBEscWzHDsYbkzCGFVn+8rRu0Rv3BojviZPXc6q/hj9lzuNOFPkJg3gjGM+ShDfhrE3zBnnpOGbT974s8M2mNfxR+u5LkFedvVa0Hd5xbOMOqh+W4ao5nUzImjBvFFUfXKLWbPKixD7qhC+LHdWUTITt3gWGeNz+/L8Av0JGHYgwvkiaUFZd2a0UR/Lzm2rD9G5z5NdG86evPQ6xBXfJMDCpE720odJei0vNpJOZZUSqQo1i3bjmcjLj6mQGoLfN7c+oLDf9OudaN7BMMYDpE/Hjx9xd+PGDrbYGf0ydBZAlL62xF+EPD1VzID4P9/KXk+0K/SqyVvB/oJ2PtbUiN/pzX5X216qoClxsawUnS4kNXG/uoX3mVjWBRgjnQTnXt+PIg/zNA+1skLPfLX4WCr+I3az+Yy3nY2v9oWJFI53bmI2VlO4/E2R1SlfHWcVYky/R1dXz7BmaaKOLdzI7Qr4M5teRGK/woGEWDnle6La+zqlHsGhF1t8p3l0Li9Atv7HeXeywWmTOXZjkAmdc13TtmUFRuCHjwTQvJIlY2IE9aIYN9WZ0IwnjMh6LlkQewEtGw/GBxnPziXSlYLxrHLOPAFH2bGlcpnZ6/15bcg3XsnTmhDgj2Srf8BUTKGxDgudU1URzUItDFBg8ECMvMe2taeoJsyLkEThxk3aokZL3uCdRaHa6DloVRAScQT1mfYiRlG2cwlNDOycXPmeZd8iHlrfjDzNk2R4lkefXZLsveEjlGmJG+suE5HeHiO4neYT7FEhEXj4aZHBjWrsy+FSWVdnrCjwVkiBLCZ2+jIlhw9BPz+N8fPZe4+vs8JYqQH6WjmRnWx7RTLH5kgijn6u11qOd21ul9d4alNb0iJpN9Oznsy3mmJrJHlTTe95QAYJnXvijVjQieljfGzjWKIWC3Ih1YUblWEKmxknVfEtZNtI/U9yZgvMNm/yNyzw2+bmsqkUDPrcwfup4+tUW4X4+0/jkgjBh9/JclrCfuPpSRi9LtUs5RAjH5q/q9hS+nXm1pKWGZsrNk2dtKvtZ3UardAx2cpB23jKLQYF1Z8NfEAnMbxsXODx/MYVvrU2/7JeTKVE7yxGKcph6pnoNRcFQv5OSyyJrli4635zmp9CLh/crl/clYD78smhnFxD5GDWGRt3E+iG8C3W7yMw4akFMpxCwPpylKuP3eje+dB9873HHAME2CS31I7jWoUBqlVwmtlOeUXACFFgRZSvsFssSkTwIP+hVfILYHjRhQeiSG6gs4q2F3UCkWGG7sBbYnxxbyYroFxQyzSAXqdUwwg9tVvunePdu++odt0ABIUbQLgnUGCyjrP4tRsLPKbFnkeSVQXzika0+VwIEDr0O/WV09inNgD3wM8x6maGAXdCmVRFued+VacZBjgg+LC0p52G0Mws39LZ7Ua/PiwRvbg08H8qf7JR93FO3SnEkytqSRKeQURY1QtxMlgTsimpgPPxjO5lDqPo4NiMZ58DVjwx0SCaaKHYMZF+tNd8BhPEHAbM+aNX4lqyQOMPWAXWGTcOtSfebK+eqd/561cLMWbgJOYQy4ZDxFHbgz7kD6lMCsK3o7FeMcUdH2XobOKcfpZPq2vrkJjb1w5DPTwmOvbb0h9FHiWNYpayL+Zo4XJPOIdfXOsz3F1hs71T033b8zZw7pqJOWcH4p54fxQ5E0jamR1XQ1DwjLP4DTLG4GB9lAxFFtWtw20iNHLyoFlKHRn+mG24SLLfHOjd/GMiSwD86YVS9gzaA3608WXAVqVOKHYHOwPstgKSD5p2I1blwdPrlvYStwkt4kRuIQil1hbYQPnexHxdKcsrfupJVZZ0VAkYoon0Dsw3b3/Dmf8kRu9Y7McWAAjBRd0DQ+hGnx02a6GjdTA+oQ4S2wm6TIpcDRPo5Ek15dXcUb5JPMsngzrGBBvJE0Yr46EZISga/Otdm6Fw4dz7VqJJIuH3ndzlhyZhG3MatDkFSkDZQQk1cIX3iAiaenD4kACUWkwcSAx6w5TjaGMjrywKkVByXXaktpsnCN8yJmZCfLw/Z3e4l2UlnJEgC3UxGAPuL2ftpmEAQybJRKtFANI/yOfq9Q0+jwM3PNtmxDumxtCYOVM//WqySKKB3UAk0SR+FwqYMwAbbyAMVtDNAlrCPhJMsdL2qIFTCks+SoojP/Z7pHDvZuvewfu01R25cg930Myp/r6nZEVmkDJaY1IKGnhCluBoQCNzMizBkw4dvswUSL5TBnd4zg8ZO/Q4e67Q3wBusFJ7kM+EuHSlN/euCPTGwqVlUq6CYzu+7yBSWOmuMk31i53V97Y4io0Ir9IKOpb3EpNJHgKHIQJb2WmYTBklhgcxWMPnhmiapySu9dPL/TmngyOr4omkAIB4mCCDYrJNxrT1aHNAxkbBAcpR1NrcovAeAQag2/eSsxuwK6G4zaphbxK5JY43sNPwqhqBAWmQDdSApNmUKziC7R5w4cllLOqv/aid+D6+goM/rXeoaX+7BHeRtqNOcu5KgRKN6o0gVgo+KTxsls9Jb0kwQaM5+NCYxMOuo9f4lnNrXslJnKoQ5RXN+MBKXWemeNgfp2PNkAXaR0lm7XGAAVx1Z95agxQQyR3NHJthMqbRlQLwS6mgwOM3Y8nzxNDNHpLF3vfrmga9UoIq7pmOJoOBt+cSL35GOMWa7ZLHD3bnSUKg4OLCEz9TcFaz/SWlzH+zcvbvbnjFLI1xKRtE24OEkjU3iVrxBAjJYGNj7ZYbBuJw4T44KAK+4/OeuC7s13BVFqGB1FpTFQ0xx6QekzGeQWLijbF6CySL1FCYYCq3bj0eOPo6fVldMyQ79mM5Mil+K8DUuAYdrcoxEJDhxSxUn0CIEjYTrU08qiFwVXKJAguLIlBdPMui8Gbe0eIwTvfWjFI66FWOxuWgYDm7Cb10pfj6FNUkuN3vh2W4/uishzHN3bcNMiyeUCGE8PWjctl/+133cdL7HI5BW1mYKhICWH0+sVCeqsXgpXVyxQZrRbFLi+Ae1iJYey7eXZpqXGAArlapuv9erV7/aqtNxSphHlIHhJQV0kBHrUJrMJofCbD0EFDwsfhlMHLfGaqHLi/vvw9j2OHWVAiMYsES4Qo3jRaL64d5eKLW3GahWZ5kektB8kDXC/97IqvtNrTSzGaPG5NZ5ZyQyut0jqIpEVT1lPdQ2u8kpqSNY9e//gLEio3agVSWnuMWHT4KwLxMKHkPrRRePEaWAtqVaFNf9/mt0YU2+PWEh9lg2urmCLelS3fso1dsnOV+ekXt0VtOVvKM/2GLT4capjJpaHNPRhyvefzytZTRt6Q8eWbXdbUopiP7hOvhLUiJPOJ2D6+4WP/dYm1hgwba8/4lkzJ0vBVPUXEkehmw0p9cOBwSZ2PUuKecjWrC6upjfIcpTPNuBOVJhtsRn0ZrTWksJQyoSKF0RmDg4dYVZR0xJDk9sW2Fdaum+gTr4QSrlo2W7HMMtnJTk+oSYQqIyKHhaMWYsM7hxSvN+GdgT9wHLxmPBQPmhaRMOz+AcUxkvIOXbvfnew/WxPKXkCgqDn1p2CqZQnofcS/3GwfEUu1xsZcsebYX/5C3ydH+yqJ8OBPWGtg4k2yvPkODRmUJKxkfXV5ZvDkRX/tyODJve7TI7K+ahmg4WTP/N7LR8+vRoS4GUW9lPlZkS/lsHYc+DmgHTUd9CaahCWTSWKNhNG41DdJLs90z5xVqaypwIj4N/Tej39Dr0ZXD9McDtUICPm5rA2tUgwci6sjJWFEUXY4k7swfGLc5pD1Bw5vHLjZPXaN4/7BZK6Yi3f0t4qShDjZR8C4MEn4pE9VCCo0d8E0jgWhgxnDDJ/M0JN3hB+btPLbgehDfIIxF6EQwZ5paxh/TDOiHs1UJQwVyb1MoKqLqa3cwTY7wTho7R+3tgrQ1j9OoH33uIjR3PE2wttMfo9kAmoftvV38/1ry945NgNbLzbCTIbxvEZQGQGpBSzgKDTlE4d4ZliH44HikWT0fWbPY8x52ijOPKAhznh6OM7MPB+GGzqppgq7yEVREgyjW+c4zIkmNOwBdVXoWKcexXWJwCbIJcxReP5RNZ80ILvecGImeRiZo2nCwrYvt+WIPvb7l27zG17qBsIeS9v+ICmTif6donw476/xbismxBDJdfPV+sqx3oGZ7ttLg/vHyx2EkfZbIWfBoXdQdM82/e71+YgOZ5zV1mYX7lnY8zX1/RTam9yj5rrHXmoloRSDJ7S1MrCi2UpkJYW11Ny5zHTy0pdyO5BxWr45IVSWPVbg2IYzAuYjy6S2zKf3FU/OLzplPrIWX6ASDDEcWCjOR9zNx4+/onHA8OX8HvSzdG3JnY5+wrs28NdvvaTLmzvTQRkOE0R//UrZdWElm8gmjBcdnirKpY3T97qHH1IgiaLAPV/aysJtJWMJmJJbl5O7UlzSaAVYPGJCntSQpf3bFQp++u5p98wVWWDKN3ZA86On+O0XMTp1oB1IyRuvvOldmjZzgr7Rip8LWWHYWcLtMsMLJYrFmxU27ND66km8X2HCDk3lmQn2w1la7R0ti6RwbHlb0mbqTVzMoZzz5ZkLy+T1VvNibz453j3rXN+ShBLwDlmYWaVkX2YV361OkD3Dg7Gt4WGwldlhcLRbnUshTBmZDLIfT5GQtfFB4CoEIqaxUJEKvbzEbe0+1398yeGkmDSjhKKMDsLRvtuWOxdojzkzLlLElg6RllVUoD2FxmwxDLIkVng7q5SLj/CJyzxTw2syF2/PNJk1MIg3FXYtq/gxEk2+qsK7du6ysTF3PkDZ9S3jWEPoJUQQljlKH4NAzBetxIMCWeJYbtzyGsd4u1k/N+KFgyMyJ3VX1JoTNdy1bkj6M0VcUwbWhHAhxU3A3o/sIiltXNhkfNMImDSh5FI1aDgky5ubMlGoVdFqoZ5Jkp9KZDniyHrFZRUz56xvEbSE7hJVbFO3e5KxW0pYK11LUnETuWoloicNfQG2lfiyoks1nSUlQVGeDh7Pm1pa+bHz72VGf87s+7zp4ShzDGj2EKOgHtceD17cM6Xomp1itvDIieULpDYbgR/Z6lxkVOTC7Lcj4xZmGP8HWOk8+u98CW8FHdJA8v/3obCF+Cl3BAYtfAd/PB8OWpiJ4QE1+S0HLYQZ4GUS++UvtghamIkNgg0hEYOi1tgvvU2mfRTnkdz6lhqUtVcpwf7thd7x81YJVtNRITt2xX6MYUQsb7AYbH97heH19oqh4G2u7IpLcZGzVtaQfRV243leNauCudXuiQVeGEBL4iGfRJ/GIi6MEWas31lxs5XSokz0PIBSUMsY1D60oZUQiOJryz34KwsIdeapxCvEPkXnEQp4bwobK8a+cFgWQhWWmwH2axtQJo8KNmXs/YAJPqWiuJMmv/jp9XeP119f5Y7cF08YMZpT/vRcxxDnOK0ESgeQKvKKINMQ+ZEdFggZhsgGpeWtRohNOTGDohpR7hFLorTPZxn/33Lz22HL8Js9wtiSZjIOm6PC3+T02uOfX30C90KjXAHG8/iPTTYK5p9WLrzsUTXABcXaqptASdweH6qARdJV6Cyat1iLaJL9RRwRmUmWBs8iSoOGNKACrYIObx28Zj+LJwITmYrThsbkm1mTEdxffde/8EPv5oqMYEzME0rGUAoW1bYwmY9iC5tisiCRgjaGDIY84QkU7+djp0Iz0F2c7a8tOQaamblWQ5nY3PVcwtEotrApZu7UcEExMpPMRJDiTFQ2J8RzOip9+mJw6GX/AuU9aSe1oN6K99pjoBqG1DBaKxH6CsYCmNJmBWIKW7s5NgtBSmjHPGBWxV2mFZbvAUz39CvTCph5m3VgrBqhJTHbHIota0pJI3C5xHhCYKYT2wnvH7JL7mzv1hM6TalWMSIL52BI+Fvb7Py4VUGhaIsmZhGbjwvNNuZBQRNjP+c12Ti3xmmA5Cp2lgNO2FLrXyy6TUETvISLmpbO2ZWiLSm88JoEt/DGhSd4dYOad29YSHVz9DuzleXCXJSLyMemivx5YhwFswJUn2yyv5+uSkq49+fxYix367ED3ePfr69eY7pFnhUgptDTjQ6VMZvarhjkj+NAMD1EC+RBcHgeiyAXTybxqF962t7xso3QPXVl49xd2w5T0W6e7JNhkrhYcIxhd3fS99Ntyhdy4XH38JIUk8nOBc0wSyUdlGKCakHeWEvthCuyvnx98N0qJ0qBjtwb5ZXCHohA36Zol7nsEWXYjwB1xyMK1pySFO0JFPfGvmAw6Lzd0laMuHHrkowZy2YmYFY2GqRMAVkAW1TGqyls2ACNKTyQYKOIBZYHzOB27rjlIYllTyaDdrfbRQyRKQRb0pQR2lTKEAYTMQ8bljToIdyKc0MFAC7csUMljxqNsG7rT0UNfUHKFJAFcEVd/elrt6WA5+2Y7cvNWgwgofeJuodfdV/dtftESZZZ6YhueVC6rmSkA/TgYslFRliDJ3cNkBWYDmqzCD5o8joj1xq2zp41ZqwzP3dkfBrD07MTt7QSlYXoW1nK/rFmDxuCykAzZ8Bo7GxSgO0jZxP5tpCVDe3O8xpv+/a++8YYPtoYMdaDTA3JKQRTQ/La5qRuxWhwmn4rPW91vNXLW2tlrZGtGt1SiRoFqlTgFgpQKT+V5SgnRwyUnRR8zCkup7Sc0hlWOVbdaL2wrVZwGsFJcqUJrAZgIW4E+Agxu3MhOyRgPZm4lURU0tDJsS2kmJFgWuhsKXKUuCmJBi0YrEwQgeALg+FtAZX87rdBFBQW9XflrQKM1YTTxOwR7EJ6f6d3CDgf3vryjHCgNwZg6YCz6b8FfxYUwJefV3yz3QApND42hmVaY7/w9gCwgRvK0eT5FG3I65XYhYWNa0ftOmYqS7DA0Eosotd6M6Boj3K2eI7pHOpFeTvgwsL6m3ee50jRHtoNYBr+UhI+s+4iBtvzImBo50XAuKVEWjGMifZ/MvdCRLMPLzqr2tcW8MmNzne1xbSFc8e9MLmFjTtK3k3EvQ2TG7l3kk9ZXAOlgyWb4OqZ/sJJwO4+/o7jpjF/pPwcQvIlG7oYamR1YsLA3nEJ1tw6aTCgOirh4u6gBLfL3TGJ4tM7KGE+/WgDbXfCgaDJEOBIsBJSGUadksCTf4CPR/e07jXAFMl85dj62gFCNYOodGAfd+YRyp7YG1yfQz0qPSgHMXRigu/ceQmDeYclCOfFCmi7jVzXZvw03GB6iLij5BKGf1JCMH5H6g60AQHwM8UBzdxyn/n9xe4W+F1dytqzkS/VUeHndhOVMff+8fXXfmuobvH6hA46XGvYorqYLeMV2DRdQqk/Lc8M4CSzndTbfs6i0JdV5IbcstswGwcu8B6MyCUlk3ZOp9jxt6n59pOn1GcP/52y+jmcmrLZtlTwixHnH8X/GnH6UbS/4n4DqNL9e/pNoEtnHFwqJkSXS3PzQ42Cb93DPz//hZ97CczFdujSabJLOt569CLa9K4f6s0cc0HIsVwdCzotFQbGHmBIb2PZvFSbsppS50EVE0DU1fYsU0Q3rJlXdpO26girnVqL7u3Udm6DDd+ge7scSxSdzRfJjWn61ODtd+aMMa3FFAVeokm2U3xQ0YcEZAcQLnYtg4gUSTNYzo6HYA4VJqv14pTcNOi+PrQxfYlvGvBtcP621c7M1ql5lcrixbxwWBbHB9GFXZam4TycsJLfHWBchFISztcH+vfWPMNsMoyG81juwkWOanh0QgNLM4+1eWJp+J6kRMIZKQZfx1nkiI06zqILhQhfW2DlSbp6hIE9M4WwXUREhE00v9DVkzb20jBoCXEEnBdgUYVAIxcKSqW9GicqJN/yyf7FKy72DQGq4G2OQeyzob7SfaR7x0cYEVqR5h7y5FXSqkRbT6cYCdeFghtqOXw7WW413cE6n0AZqhxU0bJnm0w3l7FbJjm9dlhqpeFRMTQi2HxhPuoGQkVT/LyOCz+z26i8iqNoIiOWWLF+vsRKqac4ROJQL9lzTseLnoOqfxzAFkmgSOD6UtwKba0gtHz2Rer2AlUJ00+WfFbsqZrbWpsqG0mz049T+/Gnz80vNYO8iYP+H9hsg8d4Q7BlJ8lnDcjPG0WjDCHgdmTgxqj6FQ1zGOX/QJs8WJ9/KgdwxK9kEi7PYE3LYRzxAzBKgI1/kJSVrchPWblFNMeI4zhiHdgLBFpx7C+U0YRGdxQ3bR6dKt05xItgLKvmnvYOPukdmOPo0PChKHIpZjZxBYauAqrifllXzBgTFOJrEkNDW/KyP0G3YpmBwZOrgysXZDLR18IDOVLRC7uXbADtaTTetaeNk1OPu3ePKxCvvDkg4/th7Vacx80iEq5qcn0CxwdtyfBubO/A/f70D7gbc/iVLE5MSdVIGk43lnrvk7DIJcxhOLsfk3Xup9F4qJw/VicCigWvnD/698707163zh8FGAfj6gZNXImqAOLtyRhcDLnKLWaBh1PuMH4p5Q5TQctWEu4YMp6J1cLzEZMi60FOfWZi/nTnbpM0jM2pLH/sznNCk4x0i4L2FCe0B7QZPeyMJn9rjGh6yHZGkj/2rl7lmbt5VeMMdOos6+yJ/t1X9iwrj6bCvKldsbOyI3ZmLmAxlsVwpT0X7MyNGvhbnFaIh0Uv7RQg9O+6FRIBjbg5WLo1OGSMW+jSLimha2PcEChdDCzt8H4+y/tLGbK+OM/7Sx5CnduN2GTWxYPBhnGtufa4P3Nt/TV62DYwnpEEy53HP9uuaLZ9SdPBWNQMtTQeD3Om+2F2HAxHkitPLvROogyMx/FXNizoQzOm+CnbqpQMbP7SZIXJq+6snHwpKXHJ8rH+cUpyUUSxDOMQI6IZVwIqlW1dyDhXtCsfTyxqZdU8qri5+xEUXVmzDKpltTAlhxCJ2tCSjEwU6oqCksBf5Ity82Dv4pXune/7J1a6c+w9RKWnSC5wGB+Hl9jkBvbVZhRK4GVkH9YcZ7b3FFGD2e48KiT2Hh6i7bEMP1ntz93oLR823O4Bka9YRYz9iOFYtbDDqBrQQ/Oh5KSOovaQEzw6/2F9MTROYVjbOHqqu3oF8IQ1/t6yJuUx2HTkAbJQZCw64UAMD0CX5jrtivJaPLJ/Va8SG/VKjg4RroXAwE+wrGsgAfOxLIyH4QGYDT271cN7zh+ushD6rnt3iRVrtSr3gzAcYtWpRC66XUEhy0Vlw75tkoCbk3UoRRGomA59K1To22zkpyY1WFxVii/GVCq503wxn69SnIRzlN+KHO6gfR9f6t8/zeoPTDUpJgpMnpwG5Dc+pMVRCH75TTw4Ps6G/Rx78wtagQwllhpHeJtCS4BC3r05u/7uujHDlPnlDBmmukCBJsSbYu429+VUktWN1fQxBTJXQEwUpVStIrX2ibJNrE7epIB8nn/Mp/tltY3KdFtVatSoUoZbqEKrBo0XhvGvsXPi2EtuGdYsosckDJColy11kdZDnob4BP2gdIMnwXcov5XsVnJ2aylrJaySiNvJQycLnTTbRpYZOWYFk1tJSmjj5esc2pg/tt9+ogAZ3gPoPPhdQHuu9ME/DQcU+TAzhXFEaBeAKCGh/6O3AtbXnq6/w1sgQlrvAsBqMvwdrP2FmX/yEkT/fJPFPxaaGBszFRiDD1V84hQWdM71exfHDlN3L9derq+etOsQ/jyVtVAUN0CO4MWSUC2K8IvMw7M4FsF5QCsIL40fJTWzafwoQjX7xfUv3BCnuEoa5TCN4DOXtg9fZKW0fQK1EyCVpk+QbPZiDJzJ5gklGnlOzq6YjvcdhfzFX50xAp+HTW2MmPLbFNdlTWIVaZ04nPRqwEt69rawtYFVfffpEbpH2GzCYsQuewq+Eo/IYRBOlrCjatb0wXHzJQ3eX9ttoQeH3nTPPHHQaVixkFE1ajdNTifBxDOHADcrKRe9gsZNVQ4MaM/RtfsE0uoeuNK79JJP1NfXHnUfH3J08XACT9XTiE7VU2IA6HTmRaI2uKlNWiloaZrNLUUFGn3jwFV76kHfOy8NLKxSQTAaewDY+ijYTerDi0WmVKoPrxoJV2eFULWi4+NN6mUvUfk10/Q2p6GwvUMUdAzkvMpMw92SLVGx92QNIbtNTyXd2TVyr/w/OOysoFH0YosGUP21M2qrqIzjHaZ0FmG88nGIxLrgkxCObyFh638qPhdUXPlcELRNT+WqZs9TTLXEHYSnpQFyHiEE+zEjYtPR4LqpNAKGxrWiOsS/uKBY/j1Ui+Z8R+iXr4dh+KatgfG7lp1CXLcqlCEIXb5UeLMEEaQYtlYbQyqjLOR3IOI98a5l8xaS2Upl447hDWaota2xVNcIRjVvt/zeEz7/GZP9i8xDyYMlTb9ZUxcipylbsi1WjKBsK4FUR45YN850yGoboVqiUsvQGplKi5j9zSj/lLBpckS8n/5d2UEFf5QalT1UuFxMtfx7Lyvmzzd3UwmbdOjCTTP219oCw4GVt8IATOFCBFOGLucYNV7OeI89Hby7wfFOEhOjlErhGtb6ojBMO2sVX5dg3LxmKBu0JZHtUAc3hc7ZxqG9FuFNGtQGTVlRglibr0LH0fby7Mzg7dveCVyZJuFkjFc686g1QcbhOD0m6Pict3w8ChhK94opf9rbt8CUghAryAD4ZdOdsZFmzTZntKtFdPMoCD+BB1dc5j2VxewPsMKGQUVrhSqZYCZIAcB0j4ncq0YM1irau8Trg+BwvwTKhzZ5me4zzuBjuqt3/S5jwdhp4A3Fnyoc7YiUxpOUsKOItA8JYnn+I4BnjR6BjIBDK30Yd0okEFXXmFHSWtqIolZTriNUWx9LOY8QWllnGtTNNSYRGdaYQm3YaiKyntp0hDVFDV+G1FCelQTLXjoEC3mqUnrqhfp+2hjU0ZGOnhq8ww1Cd76NF4ai/KdWnOqW5mea7V4zi1Q2zeyPKh/Js5CwebnSTqTQWNDjgG1qGQSS297jSkZ7shmA9TmRGWPLu5gi/xd6PPxS/c1AxkKijjbT0u/mUher/hVZqhsxI2bYRrKcqG41ngXEiSu9qZEkUt7mLZEore9udNde0uCYChO+Gm4kupZ7W0s9K3U/qogISSUhNykSmRL5xxZIXYHPm8xfaLY5TjbhvLCsfzbnDqCdbdtWbgSN8k6B4qPClODnX6E+Bcy/LdlB/JtQKRlC/Bu6lADp33hJRTc3hLAQ+6Egv2N/pQwhzCFQxLg/YTJqzu4iA40uQ155snF7hu/dVQoQJnwRPdrFRWS7x0HsBECO9wTCZvVkO0h4MLm5+dbjoTODg+x3CR9BA5ogZFTCboDxY7aT8jYUGRWxl9PbraTtruJ3FnbT/UMydo6tbVy7yIJ7EsOzhzzXE30v3pXfrrTdcUq8y/HtyTCvbUedcyakwsA4lnAMMMD2xS0DVN70gcoOUk/wpxYfxTQDjhXp0o10z0+vv5mz6UZ2w4DTeUZChxTm41kZvXPcpkgRSHbrkewAGGydkNG1h3IEGGhUmL/38cVqTqT1A7ue5Tu9nSVMvEHplToPyFI8sdB7sdY99W3v26N2W9SUJgnrA3nglM3Aopk9W4qQxIi9y09APWkYUfHu2RtsASzPeG/TgkZaLDJq/+o3yqLhgnk74+MMhsnB4minGlqDWiQHoAsbpVBPI0qezdH4HnGaMS8a3+P5weO31sOD3Cqrwz4enWdRgaeaOiJftAuzagwFJDJEfFcPpqNdPRwpz9lDKHmO+lHauYUZoyIOoUW5DShzHC8ZqmaPg1r1dvfNeeg0zkvgSvFiD5Dm1btoFL65MEj49gRSXRgEGv2Zp/bCoEfG5OfwCdkMHZW4KMD8q9gJE1fN5gHPlO7hZVjDmzkC6/WkYqYIFqayRVQCMxxrvFI6EYY1LBtkw61BtnymeVTNGn5Tc1PoGcLtDW1hJ4mUkyliYAzD8vixDSzFDLPm0fAqgk2OXpRss5EVSLRtHFrgkxcSbew4M658vwxMZgLpmsvKGEmXLitTQeM8M555HpdxkTX3GT0D/ZAElMcaR/79Y91nF+XUOh6P6/t0Fm9TTnugmXc0mziNHIf0fX11CEl5opliNhpolIQ1awNQ4sKblK2hu3aif2GNRi4YEaF4PHQWpYALAhqZH7cuLk1iAZLRynelcPpr/izrLxRdTfzKeDKZIqM18NYQ1q/JFHGMpHHTBYYF9bE6YY6rL6x1Vw7zwKCIbsbowZABzq/KYmgEMwsIgse/hXDBcpyX1acxYkt9Hiu2WGJzYqCyZZ8vSsuibIHHL13eMf6OzwXNQ9vDyHYGYbyV+AnbZNTCzFieO7A7nc2p7cUdWIvOUjSpM2gARZtZWZhchs7oxL7Tttm2lpmzyiTWkjF0XOxI8tMxrTXS6PKMls3sgBE2zyeZD57toFS6VeNWeyuNPUKTGhFPOprFOujmksYcUpa+bvO1mtVkTocp9aWVjKderEqxysTpEWmh8UwrD6s0ROqLxC+L6B2Iel84a8G6nVhVItUXhdsKQi0EJatQVfaMmBTTMQLCyiktXlyGO1Oiv3bZL2S+VKJgR4LACYHhtTXzjWE+olY+dNiAHMHo/WcbArTz6F+9PDI0pNHhgynqdXYkyH8WtPw19q83W2PLvBgbA07Hfq3W12CHBF7oQBpmuzGt0ri6nwor/f7cycGth/ZyahphMXstNSoISbtjM7IEckmNIxJtUNyf7r7VIBQ4hSHoe/HewimU4oWhlJDxnkFLsBp+hEO9zXr9FuCXLhq0oqhhzXPatgFqcdoux2uMKlHdhSgSIhbUAWkAxXEFAybyxVe8uib5tfDqzmkeb1MwWtR1V8AIq8iA8bpiiKE7qzy1zI24UvqZ63f5fpDve94qh0i1tHyf+f80eptSs/e/fComxrW51WXpSKRruuRFdMAil1tsRCEURD6eIApyOuFhyy61geSNasKzhxPMcGFdVtKwgemjbezzebrPgZl3nWfKNy/X105bPBAnDTwv8xDVcQdyt0krl1pXtavbrhQ4c+Qq/Lk4zJZBuZPAzPESlTkbwipdma3EE0MtJwdPqjMMZ3YDVMBSjWP8RWiVpaI8X36itgvCIQx9Q1a4QUbQ7bXFs6k7jbqsQA5oq1n1mmuUoT7z+4tOKaRN+JSCYOwpxed0lHDU+lJI1kEDofjUoHQ7Vl+NpfJ8fEtsyMqyc9+0jGQ8goYBa91cjoFmeXtd9k24VRzEZucOUfEzXsYaKckiMuL0gyjNy0KVloB8PQ4WgIPpqyJRlTjlbmzv8cehraNUUMmzHRdQn7vJvVkZbgQ7h7/Y7LUTRCm3kkorqzJfiXnTxR/z3ni3Y90NdDPKd9xixcd9nvHXw2cMXNevwRJCDfC7EccNWPIrqn9DBT2Ty7Gl4wf+VtpmeUa4KJ1D8Edo4UXRP/K9WODyj17Ovc0PJLA034eFJqc/sIpjf6kMJ/EvCpthEGbj7GYej3N6WtwKlKTdfEdgML/QvfMt5ji++2Zw/Am7HoHdgI4flLzb+B/FDIjZu7UXE72UiIA1k0txcP8g51JUWMpTVaDk5morDetJBLaJ7BLTDZoF6sXXr/vP1jjAY9yIXbrbSpSTw6RZV/Kz2fBCBElrVtrwArxry3bDy6C6ZL+MY7a8CvuGrQMdmULRwC1FcYOY3cMmqlLqTPLtMZh/gx9egaXq/A92x0kY7M6yxG0EK+cGlFJMHbcFJsscQXM10At2ZwxZ79gtWWOP2VEMToWNYb5S50VrXhmfX0msqVmQ8B2HzlhyfKKPVEqtIPuarv7K/zcn792saeTccBVZ2OkaUXZqaLApCqzoUAz3rlkxKMJ/Thcbu8sQd6Zc7nx/f3xYpxtkCnxlBvAtIFfDh3I2XLkeKrDSzc1rIZEHDp0pV4FPd10VrLp4YAgbIZ8rP0+fgFU+AkuYVIthNM/es5M845jS29SBD32G6iC2nKuD0VG27axdyG9KnSA2jOkEhiP2h4CUcRg1fmbR2KeJmgJWEHIhD1gE/gBNrgbSArAgXBr5ZpA0dAP7Q8QfHmQzMl91V96YjP93xoVhs/UFRoUpbcxLMBFz47s7UrrYAWBBXdczl3y2s1837ChY0o5uON19o/pcQ2yagMeqxR0oRU8hlrTh1qpQ6SsuV/xMynGC89WpQJdenbEAUTLekBTeVpSrHnNDzA4vqb4TnV9KdH1B8eHPYrO+GzlUPHkxWliMkhXbtlEhjbR53UaPXDPNSrV0fHhz4j9jPox2RM7DPwybw8zEVwHUv/OoFCbP/CYt4pu95kfQ8DT2f8OWL7SZZ/n+alPLlwHI4uXJQ39im4/96uc6Kky7FaOjcNhKeO+/Cubftb24kUt+8qv3+quPNh5epiNX+bZeo2xKXlG+6MpvFI6FUOV1UWPU5lkaZElniZZxi7uwLEXT+266e+oSTcMMI9LktMYyn2fSvfhbZvfkoTgumQ6uQGFT0twCz9zFqwx3nyO+8cWe1I/Q9JXL6NPnBz/cYXWDGUPxS7yX1DIJCtqVSF3/smAay8L4GB6AzMNK3Ows5S1ZQv74cE+A1xrpqKCzkNt76adWu3NPu8v3+ocWmbUCCoImVRfTDJLjTaOPAC/h+qA+ossiP4GRsOoS7WI1pkk0rm4V9mcPdU+fsLcK0XuyyUVCyTAvCDavjAPNNKbF8lGENYdjIkbUUpiqxi0WM6tYZ5/Buzn2X5gK94awQpmQ1RHGxErM2ojLK8eFEeWxqD30p8JmARTFlc5iGibmLBU9bFw+ENU6sHo8fbH/+IBtIFjVJ/ZcNfWycDjMMqJGshj2WDVVKTmiJJyUECEXaojgXQEdPH3VffbMpd/Ec55JJkd/GU7w70xj2LKulKx56G+bjDSJbCyNH0/XMaMRBVTsLNnptr682Pvu0vryNRP7oZa2d6mgCwzhQi7wM+2SGCgSFgjhlVeF5TQ2J9cjHrnPUfdyALjXN3vPKUwf/86Ofxh432UgMWWzrYsanz8pbFohaRfAbBqZwUF32UvTpvv8mp42VCamIuZJEMxRt3qlIS2UByLNocrIoXs9iYUpurVMl+zR1UT8VJ69Q7DV+8wUHnEXEsSG/rLMEIwCsWVdKcNCYeNfJCGIRtCxZu8siNGgNALv+XLvh1c8JlpFmEkcjozP6jARkwpTUmQ2Ww2B2PK6sCppc58Vcj+a7tZztuD9qlN6B6b7J146WdYKTXZaLmtGBz85r4Mlvmf2+GX32htbzvpD4rf6PvTiJLqt2evQ17wZ2p+bdvQraczfijUsT/pG9KL9QKAk6QngcMYTC+J2mQQmcfflbRQPozLUQCWN4cRXxl+bu/Pl0B3ym1U9YloQCDMkCM5vqOYC0YZ4ZAwaIWzYUYphCPZjFpF9AZ9D9p6c7i5e6h650r1znxwNWnFTvGft38KR/u3Hh1X0CKV5vHHozca9b1UBZsZ+ntisHq00yyckzM4CZ0bi/UJydrl4avBWggHlEZhl42rQ5qasG7cOz4OzSB6MjyGeBWFUyaw/8/wUzyA0cpsm2MqLkzAN+sePSm9RAXbsTUNYEGQuKhT9lHlQFsAWNYGhuKxRva00wlN4vMXEjlW4qa4HzcaVI9A7OtSAfM8RnOyj0TfuTebwLI6HYCI52RdmajVNaiMMMw5jD4fdtbcw7PBqoUnR2HRJjOjvbPPvpQ+akrlodHCZjzSCxYa1ti+bvWK5itWqrcxtbExnX5qjJrLfjOuJmHzG2GNbT9l5ZXtse2vMs8ScGcXSZ3qCEtzRMPx2BYwoZYFZC8q3dCQ6K0XRXCQHipkb3ZUlY+I488aaJVsbJcYgcabDNoaDMRq01t9S5yt9X9LL22plTyNbPbqlFhUN6tTeVkrPKDylo/CKJdph+O2r74xqsmqppEasEmH9oZSHVhxa1jtJb4W8lfBOumtZvI0kVn95InMbgamEpZJuW8s2J9dKMmgbCeRJHytJNpUjIkNGeBrFE2Fey6K/K28lfJhNOo+86zv92SOIp7cNpupNW9qlDN5si8B8XRv7pdoQKGAUVPKoAavFSVhk5+gU1d6TSnxUaLMKO1un79GXZHWC71jTYJpb7S4f7H37tDd3uvt2mhKSR7sxydveCIAig6IpRG2PhI4lBWI/iBTxEQTfHbKkWnnI60JFCEbafgJKoiEiGHU55tPsII9z+Kkqt+4K0JpgAH64QLECaOn35Ej/xt3umW8HMzhQolo1SvZm6e4gwnIVjpgmcQsyD9Ad/IGARDdo9F8kJ7oULzuwT7xJIkDX3k+Rn/0loUR7nVQQRJ86WmQsTSWTpE4ZvG7XONNuBt8VX3uO4wEGLePLjqxDHlTlJAgN370BtrFJx47+5etrb/Aa5LGnyNOhN725a93lU7w1Np7xCq0V1chfqJnVJXgye6xjo/usmFj+5iWujlDoT8TWYw35gdmZ2osHRHnj6lteewutak5ZvUYjsaDLMURNAzMPybXuRmQ+DjE0tzu1olDeUyYaMV6+oztCcedBgzcJeaWq7kUffQEWTO/YLF5Lnzveez5Pt2Vn3DFWlP//vV1bbxzXkf4rAz9kvQ/B2t5ssshbYDi7ysbG7jrILhZYEM2ZJtl0TzfdM0OZDAJItiPJinWxLMmyqBsdyQolUZKt2CApS3oYG/4jnCH9L/bU9dTpnhtFegFD5sx0fVV9LnXqnKpTNYsVJuLZKHPDv4gX3QRYEtsfatZFWGKtVcRZDo7BzmziRdPoX4gAaEnHevl94hvpVGw6OInHK6ydt8hFYY6WsS/hOuoHT3vP7rq29CUGWnASAn0JbasyEnPpSi9g4DyL2m7lcna6+wXy/EpfgLg+Y/f35zrOAFxzalp86aWBh9oEkgMuy/H1tSs7jz8mF7sfeZce9I9wpu8W8wV3O4rdchZFqlcqjWA5uN9rre56IJwUpICUOCo232OmRNCQGEfF5Cw0PpM+CUX5aDSfPsjBd5cPY3Y8wxXOlJpgavCpux+3oIbSKMOAjDjl7pShuLVUkxMT71vbOtY7ed0Nvu2t0zuPT9j8PDleW2rwoFtKEZdO5fMUMsvN1Sxv+LHIFyoygSpDGwgagW/XrOPt7bfxBl1YIOr0w979a7tfQcHisPhCDAUqHXc3+udc2+SUKtKzyVPhJAtt001hNxhzZxb7bolorP81eRtjnMzY+e5Ui3Obsqv8BOxvqG/6V5/uPnncu7WJyQqTVhTD4flcG87t4loL+ipGU0P4dleBcY6MeSrKQA/liUN5NAvHWiMQg1JxwCjBWeb6ogZpdogxzjDLK/eX6guJtMyHzqi4QVflpCTJ2ayqy/1scvMI7tG998iNVD+bZCphxRIYtpBPacBcirGECQkEp6Qi8f/nPLLNZKfRYtKO56fzWqsDDuHu7SyqO8FRsjepcKXblUMayBjv5NuxbHUOhTLeOA4pIi+/70YwjWlSOJwpJ42cpllq6rDmRjqEkVVtMGUSJ8KAtikgC6cbY/qjs27eIEvqXAMvg4H7CQQ4/u72xqmdK38mM7/dAspOrf137q0ouUgFKRtW5cIYTYG9pMaSN5FKZpGxhIz94y0ftXcC28MZ2dO5WcF13aYV267U7AotLWV+6fd1a3j2yDLlFyddjDiazY47i8XDjHBodNHQCnRzVf2RKzQQyed+QZEkhm9WXZ7B641vjoN4gwBDxgQ6OD29EdvLTDkEmLbiyOQ3GZBIQN7xRcB2I+NfQ2+m/5nN19Cf6X+GK0gwi36lNS6C7corQz2aAkH5BXAiSqWL2alXzBam+xdnZDfB8kuiVubLlOD8B60NmgAznixorDrsIfH0d71J8ZBOie88fq9/+hx1eO/mWv8S3PM6nBeF025tsN7clgOsDA5id8tu9wsw96IlZGuj2aPu7Rgjs1AirjsLOYC9KNBVH9zunzhDbPGchBw6yspf8RQmPOCW3bpZQAXatlyqprumsGKnbiuT2foQvaOXe6cf906u9E7e0SoRaj8sgemeUqYTthqc/nTgYAiam9aijuAfmJbfrkBRUMikglypeOIq9v7u7b/AZvX0490HF3oPr4YajlhaBafsaG4m2KT4bvbqyHenOrjcwfGi5zbgFknv5uX+yt+IdekuSVzgBd52eJ+k1V0VjllSuvWAYkToPKnxyRNyR1sAk3HhjasHF8AUefpJ78g3fFvEMQHv9WHSuQRNOCkB0Z0Hwi9tUPTlYL2o7EbwxdzaYXcgwC7YdWTC062hdpMBpk2jxnxbJePGsraaGQwcZmuSTYl1Bbx1H+Ea1rL224cianTm3Xygfg0NHKw7AmeH0zh8M7zpV94l9E6u9Tbuwyh+GGwOFtJ4TsZxYMsAxyU3J91ck641C7WboEU+04prRo5oWqcP8zx7m6cNsoJtKPKRGH+3ta/RrX7lkfsiHBBvJK+KOaYyvgPlXi/BJBU6V/VdbfK+lf75TWLP7+uLK+UONSm9NZVhcXzn8ailGQ14a7LArTR0kf7eQHvf9Tn8Fxr7Yt6DfQvceUkMcH07oGtdep0CoWAe434VUlWaEcej7eZl2K5uHZMBh9YAjOIaJM5uszkNZZBrZqCJOY32fQQHWbG+YN0PbokvvLfKQ/rYKTpmdvt30krLeJGtnQt4MG/oPXTYDpo3soabOYNjpzRhaAThfGlF5aGDXJzhmEmZ2tYAvQDbANprbxWBWnhyw22oe5+/y2rBWZR5Ay3smYTMV20010o8LvbdbHSyh4k0TLPZyU63X+xLlG1yegVrh5vRfYhzhbLoOqgHW8Sy6garra6zZnm1y2psp4RfzGQN41XLr1STPu8bZCKKzFKURpyZrJlOUL6x4vWSaiO9skLq3lzqMlreNr6/I+ZndnPPb7DvF9gzRx111Rss7pffDbi2QgQvojCI+mrproo8wJxKl1TkV1zqfxcUtx1+N4WI6FJK0Z562d5JcYMQdbrxMkPSHjwE957mHz553L/4kGPB3GbdpCgnBOtpVkh0J7TxhBMPBz/u3TlnASy13vbMOpBIUKrBYxZkOKsydiUkBP7yulqUcZuogMxXH1Mkm7RHvnNqIW9BlO4C3W0xfMKbq8QqqPFquOEpWJwF7EIzrunWeszL+XuqyrDMqXdtFbXrtyD3rrwNU5gX4W/se/BXwTsgOlbt8newwZvw0Um9gC1kRmz+KpA6aSfNVhYVYuN/dxfs3VPTgW1/fKt/bt1b9a2o3ojyIqj/pjBGdP9lILyyMPfHkYPK7jkY8T1aqbJx9zYGvkQcb7NKB4xBZMmZhzvnv7KRJRpv40wZcDGX6qK1OQuLR1MUQy+xE4wgsUdwuCKFasDxsL5g4xWOfvzDZx+pKGmcZdGcxJQApQaUwIfcoii1oZNwEnhYwhOa4IArFnzZMDwoN4E/K/d3T76rIsjj2BryQSIX5HNuoBTCEHNTyMdU46fcnrqA/Zfm5zs9A3Ypqtf7z344Dlk5DsfJYoGLrqZeESqTfkW+mgDGp18RIq3+2gAFCTopsiUDKd/xeUo9tLXV//Do9gYG+sf8tIwVJTc5agLMyRF19BjMVEMyFHGvQlo8FjHAy/cqoQU0/erGnNsFcFKdFSwWOU9HHRwgtHvkT7v3H/bOcjUmJuk4GunkBkR4LNgUOwyaG0xFCjF8FzOKVF6IZyNYgG21KPRlTdP06Z+8hY5deoLS6vAnkw/S/D6KXpNB8mc53J/1+YZgx4nRqWt0HLTAuUJ27t6A3HgPOHwqTus+91CeduqUH1CU0qwmHzJ4imLoJSRdAHw0oPvsLG8d87zq593VpM0dRut+/+oqh+wWOSRTADc7RwUmiOBjAhnSAioMLP1AqrGARJza6SzZodBburoMGzbNY/bsk/7Vd/tX7nHzZMmy2wc0a0Y/lJUDJxEjLIWwxIFaMPpax/H3Z2lZnSaPNmer2tpwnb79+IkU1VyIFrRV8nrS6D6yw9gMYYVTlIBeQ+EFQYPhG+gnNcHNsFqC0qOLTBLcfG69t/mM7DRHQ8UVKSaQPnozTSDRdIDYFrfpgnAdDDu6svXD9Uf9819bGIPBvd2AmR1lxsxTUdDWIzncc7Ep/Qe1kvCgwBuMDDTEXFT6gHjILS+2PSu2rDVjxQRV8zO0DgN7UG3A0PSzJl9gk1lDTA0wNb2MyVUyh8gGghJoq1Syavfpx9vfkKtKnzCPB3bJOKvEWyTejhhjRYgFESz5oxd8s9iXFujxy3OwNFcWqImXp9LiuS+gMo5fi8auRMEqVFpApN0HLx926TBqfqyStwqey2SwLh6lib0Wth02RmX6rjK6baxmC7Sa0T8TaR/9v9cWo3SF6onqtlya5Y2aMwAB6PXyFh0ay0lDhdUcC8fhdbtDpwaEJBLE0+7P3Yu+UfsJAMevB+XUh23NoWWmplDoqZdsii03ihO9T59/e3RZPBBrlNNtWop2meJaj673V/4GvoAzlyBTitywj1uQtxMcclJoq8hjCPQxWQKIXcQ7MjgBHMYWAwJgf8wtb7nufn7U7dX6X64GXHm7RmuXZ077tZpUGgCFTDsUjKfElHJ0IF/JjNH74sLusxWbGUOJOS9GLp81KYbiB9gKZjAsuVpKfKYulhKfo+thOQVoNuV43FS141Nxn1OUgSaBsaXtGEd9GnLIH6Q4k+P9qmuK8MtOKX+a731Sco5frpKN7PIi7vwHjQzYOLY1MoSOZe5e6p8523/vUQUegz8OGfQcoz3YFVVyWLBvCCMWQn+Mdw3112/BK4l3QuqGEEM+uFWHFL+Q8UYoT03TJU1nK7tBk1XAS6gmTxdDBmEpxuWyBplKCy1VhOBPLvQ+f1eS9RN+GJGSQGJIbDANRwn4cN0taSst3kXtU0EOICt5vKRNfMm2sF1MxTZuGhOFxUNWTm5Z6rQEXmlrOzwrA7OEFub5kpkkZUVERwTaSsuMQL4AUVMUreWW+nY8bUO0mE1U7lFf5k3a2VcvoXaWAiYybz2YJgf7MUZHdNBjgwE1u0M4M8mRMmBecmSTmZNhP1pPSnUyCpcQPsAM0AzMsFwPtJ4NWcJKi5Zdq8wC9fyrRqDpJ9DzJR0faFzyJIEjjOh7F98nek9bPB9ZZsgOSqUc4GR/jkYc8UIDqQeO/X2OyIGZzADs9QGeIKR4EcGdbP9ScgPxryxuyQvEP87SnZjmoaB870tD/UBIRlFNKPmUe9bXj8PdZD2ZSSC9PJ+ckzmBKYSh057dl02lPqfFtvWb4NTcPjcezaRz95QmzTzundmnoKWGp/HiF13UcEbok3uCah5WVPNdIGf52YlgrbgGgI9H6rkV01nrOVfY7Z/6bHvrJl7wgK22JMTPk+km3FfBQ++OxZgAQc5nPISJf2lWcuFOD7MU3asOsBSRS9lQRF4lQxF45RhazCkjlVVgKhIXbyoqvrEUCT6wFAGdTTaJGZ8u220Q7ovoPqTTKRdioMYbY6dV3MGYIeBgNGMKAp7onpKgPiaZMCUamTG9Rg1EDBCraAZqCE7F2MNXtpZe8Npq6umbe1OPGKi6DuQsIQ9GDSEH44Vl6CDuG3ArwlohucAs4eFRQKUF1ZIzgnkTkeUiW46lmvNAasrtu3ejA+lbRlFjDWB8plc4TyEYyfYKV4ncnCv14yHVGho5pUBWGDttbb9Z+mG15uxCMMkyUF4CBqnpiZV0VUF7zTper4Y61Su5oHW0ZZTQK7C9kGSGZL8z/kCno0rkayiQId378CKZ0OVpdwAjW6Ils8kaL2eiqgHW6AyyvvBxyh87PcD84p+ZT8n84h+dHQXcXw1q9w63vpAKrS+UeeqfX7IHfosFuVM7bn/YoZVoqw672jDsYv3S9rOrPvRFqEy4iHxlq7rql4VP3I85iBHfxItc+NTBa8xFQ/F91n7PIFz5O5wQAeV/LcC3wS7IQOVfiOO3yrJnQczOjyB7VonSaSQdIziEV2+ifxfP+L3sl9//YfXpzp9u++bH0ndvQcU7/w4IZoN18AuQvZQyH+q5wZG5eQ2JOjp+Sl+FJ4hyqmTMR3TzOm7AYRqnXAqxQVKFWfTsBpXYds6+17903VZiY0IuxCYwthCbfFeCndUCPIi5vXGHavDw4+JjpU/i0ZzvtDSBFjg3ljUB1vtcAGypXSQNLaaV1JVA6SWB1ih6SaGF9Fo1y+1+UsMeNnhYfVmuAx8/0tv8kmCyKE6lgFpi6DyOF2M8joqDlCJPAb91Mqjb53a1nGgBzxswamkNi5Dc/XTn/Ff9Gxt0nQ56Kj6cQxJkpMXREKJY5CiZLWJ2xeFtWMSEK3oIuIS/DsCKuutEyOnM0+4jiMFJpotOW5w3KCRk4IDAci1YdGXLids781Hv5ApXLiKqWiPDShZlsIBBSVoBdfISFstbhrLCFlGat9xw43otGaoiKnZ7IzG30SFFQ/cGHitffdb/4oaTGthcetS7eYccophpOs0pIzyDagEP+FwV16BaMG1mixZIHTfclK4nRdsZq1wYhOTVy+JYj+YruhCOoxwfr8PzOOEFAL+RKiEWFh18qfcWn1whb7FBKsPwnrbVXZ2t0eEleN+6994GNxk54PoPz29vnKZSszUuVtKiewqeNveUSsXPsYM/8tU7Y9en3ASd7qMlZ+riCcyXm/1PQCemSW7qouDT7vUW9JXxG6YlOiIKHlYXD3VM5GfyDaogsYbR5fyZs3IcP+P6FJaD42coPQd364wTKE+lnhwjwo0By8NmnVnDa+hbZx2cogTEevaRgiNVRjG4Wmm47mxt0P2QfLpBNbqcsdvGxaIRkErayhHE/jgDAVItnpRgBPV6CiEnMPjOvbdz+jEefkbpLCXlcc8oR/yQjyDxWRXhyaBW66rTatTjOTX4Zku6/eKnvdWPqOfjuJj5KTxPWXo8qXa9fpNbKIXhOmN+cfIEIs47Cdx9myVv/1048yfVVsC86aAf8srT3rX3+h+c3978gi5agE8BXZRR0XHmp6MvkraHyz2UkqMJG00Xvo4gkWpAdFoHpyyn0nGNsU5u3/V35Cy6f/7r3sq13dUP6UTaiZHWl+pQOLhB0QSEUMMrdhqMMABWsSxKACFtgyXAOpDjlBXU96cLZ8Iclq66/nH/i1XqKtiMdVLMm5rpVixLILYfUwO0SogGTZEsTBXDlyuIwcKu5Uls1mIIp4HG/swNwAd8ZpzlRbKIE80QNSSpt8WRDGVjkExaMCQdlrFLbWdr3qtVb+x5a2fzOGDL1Rq/avSyJW0tXGN7SuH5zTlK5tM/eZMtSjUgrXVH5tTdd2iUYfWd6250qTnnTTm1w1hhLpPxJZaXGF3eUApMJLWOxDRSq8jaLfC+aKmQmVKxT6zVMNxaCM0Ev3CPX7CDlfoAVlJdCocuhPyvrmCwTOkKuE4BMl9u7lx/VF3NnnOZed41Zm/rQ6iYx6hlq5JVgY5Un6o696Xi9quN9q+KBqTqWoZSfNEbNboD7R76FSAPiFxaLbr3/gcDl5AlcAwuz++8//Xu8TvOSmMZygUCI4he8mK9Zg82fvHSiDqBUTY1ZV5n6hf2aCNvd9weMks4LhyiHCXf3MaJ3oNvKKNgnR/KotJniVcXlHwCEIlS1y80F3erFc/oRQiBSQlm9wjlrJirR3Gbq+C6jZ5P2ujJ83HUUgCX6GXhdOudWy0oxKm71qEarYNCnNY/71/41IY4wTVOBJbSP8sZVh7FCxEa5YT4AbaCGYwSuSY/hUQGUiydBDOV0h2ElkknSQZWScd0BP7sg17YeIQIN3AGOWT1BCmycQQxbOAJIlyo8ih+G06vkGs9LD7Yx8ONvqnf1+rUiIv6b5iBuBsUXXOGBIgWaxiQeoIIiW/TQm4bqioCeZdaLCt72DdPbD8+0pcyYATM4R6QMofPdpmD69+3KwxUVs5uVcEKMSouIWlTPS6mVzZNyr4EfPu+KezXhOBuHvdycCxc4rTMQPOeBKgWbwhUEP+jI8B2PmTAlGHP6TQefEOD33V7K9bhX+pyRrMdbjqbPEIyrw25uoSYvGmSkR0OupfHIJ3lNWtBlwiaBC/stUuFXj1BLE2bZhynbUrmNd/ejb4U/oMBRljoxxFBAhwzbf18Nd1kKYcG5Ij2Hq+7ww+B1h2jc72+fW5laLWWvDW9sbyu0UgHoiz2OYsPaG4ZKSqvXZk1+xqlzzmyBvl1AOS1AZ4dooDsQZ13AP03JdeO/M5DoeTbkV95fARXrH8+3LkDROjbQdGnfm4DaxrRctLI6OYeLf1u906jEtMUUn7Y7c0bTiJIRXjrCY3PDPY4suA7E1VRdMEHM1e+NbiKZnBKED6ZdtToaGZ6zODVEoyd89cJw5l28BCZRFmzk/pbaBl8yMeTSipvJGbmvlU0cTZR956eI+rY7QHgkQW+BedboBMi5OMBSIJyA2AyIPhc9s5oH4WuGWpX65qhXiq5ZSyqrxQtwnpzSLkEFhExUaNIOXijyECJUUQZT5ryS2tA1hNO2OXYmdgWyXsC6bvWP/dRM5j6hFhLlh1MfpIxBx6AITt9H1tu6obFDRAzJVeTySMOsZqC97DGk38H0y8VE2qN4dWEKjG0L2G7vAQagpVsKclJE1dm5oBkNwQ/LNkNMSzlurE9MJhNGV6BAzz/6ta0asbTtQGQI3SV67vDNdEysEOtWQl1LoQjJBwdVFyZhMNKeTJNJb+OdJsNoFasMH5aOszHTwdjQbI9yhTS8OmAxx7GgdJpKA5ntcXvf0UJ8SVZLiZhRlBy6GOWXAhFdhNeUinMcLcfsilyTYvy3yUVEugO09mEwi87xEB77oUkXEXGrgO6BgTqe6zyNoo7UKVDRBWFaTRlMNVHkpVU075GhmqIA5uqVpwhr6HTqPUPdiodxBDf3+gbVM6Op0i1nh2ROCtu/R2H/9+linbyK790qaSd/MpD9rdBCeehNhyToRWHsk/9k7HiYIy3KTiFk2iYjFK+hs+Fh72NDVN6RGjohE8++coj5neDqEgWQ50MQsOX1ePF7mpSQCUtqc0C56oSogU+SrrlkE5H9FjwQa6oe5RJMKT8lqDYGG3wQEDuSGomzPYE5TZhZj+4vnv7XQnR4+cyH5wtlEFktnw5EZiNyBZC8SfMJk5DLWo2Hg2TRNQcfezmvIsjJq/f2n34nh58xW2PUjn+0l/sAZh+aSOwDcdqBDaxLEdgh4xtGHbAwefwKabzOpQFo5ellMQUouEDmk4/7J35SKOZinjRkSSNyps5rA5i2Tw+gh+k8fFsTFwWctG4LMsFXiNgUMnik1GDysCGRCJHZ2pcWZOLDl06jfibPpEPUek1zEV/jGxBLaTiBAj+BuaiP0PmUZmrXOIsu9FxvRqKdvFh78RKIBoQimw8TPGL0pjP8SDEIitcAFRGkcwMs3maZ3U4xV6kILBNzH82L9fA+1ce9E8eoZvgS/jwHDzNd8K764Zeg78U1OApVIBTxpDA4rwNKSIorcZpzBcNA9Irz0cX+hc3VXk28rk235UVUi2BRh9zC6QAntQnB4WnbRW0O41kERMQzWVxxlly4Z7Y3HIQZ9M/dX/3wVENtYEyGUiYZ1IiAz+KG7tlsKncr8IqmIXxRdHoc+Wqi44xGAgZpPG1yVn6Rx9sP1vV5Cwa9+yoZpwqrMcJl+trR1pbEIoWNKhAJ2YG3iSH4qn7br1Bz27kCwtGWlTQVzqgzpNSC1pEAdYpekAK1tEnU7OOvsjHkPu6dfRZzilacbv7aCGZk2Xlr5DKj2pT7t5/2jt6HM2tliPPF5ao+id8FCJZcP03E4BwRJKBSfVeWuyv9mxCed8UMbZ2zh6jNDlwIs5xQPSwuQIey5WeoZQ8MIRWMuQUMStdf/mJlbpP5EU6XWtsqrr1d9JV22quHI9rURUtwLG30hUpUI1+HfQWQM4eclrcZLDqk0YdemoRD/LGt2Iq7owpXVbxRde+3rlxHs8K4fRNKz5ZhNSU4KFSNtJuS5ye3+dgu/Nh7/41WzNOSHQZ0S86FdjcoipaiOMbTr4xmbOgOcWypKqOuEX++C2u7Lj++c5t2hzSo5yorp7MdNeZ1mQ+4m8mxuLhZtHSEtgeJcsNVkWwfI+CWbChxfDELB5vSFsjOrR9J7B87Z9lG3USC7VknZasxKHTxdh/gdEXGmPDZq9MXmtrlcyhscaQN4T2b6fsz56wJsBoA8Av/uXleezabNdlv3COWDV5xQyXu9GLnV3owuVp/OIULExmZRm5rvg1paT4x6r9isrfn2ouK9Dx6jNUnaFCmVSdhDruuTFyi1FJMOR/fRX2e0U1CfD355fcAHoTWX378b/Zk43dB+tu+DPXILMQANWwTFv9TXuc8bNhxxlA0Z6aIpLW1M9espX3uCgddB4UR/Ixz1S8Zr6GboPvz+Nx3LNLvaO3ejcv797fwKOg1kKU1payiPIsuQmS5g5Ew5wD8DzEVThKnZClnZl2POtMVk3vJnCyZRCgTt7GCnNWSDxPlWNUFPLpCdrKelzawubLCQThAfQSh/F56EHvL9c3BDbAlCscBlSuccSM2eTU6fNc7o7SJm1N45x86GB3Pz+6vXGKjlXbjOuD2SFROCFnWt+HkSt+KuUROqqIjXVUMZfQU+U5ha4qbfbfBzzM6QEx8BmAFT08FSFwW89Dmh3yzEcFRhxO0lCeQZtTSQVy19R7IePa521RdOOV2jrGL2Aq/2Dnin+e0OWO+MGiencX3m326PZecYWH3i4O2Jh6VsDp79Oo6KQLL5pQgSFvYtN9DOAzgMkYDuWIIuY0kIXUmFMWwSjS8IRA9IOErFwwb9R0hmmCAc9AcwsIOCcWaKn64sP2UOIQMhC5MmAuUh1ThvNQ6gFjrIHdVu4y218SgDFQsn2iqcure1tn9RvBhPY1Lq3a4HKWtoOoXgS7vFDSLISmy5mpyKhVCh2axbEIw26kmyVqwgXKL07h6jGc3JL6pYLtvJ8WfiRrW2nrWG1ndXSgQCehtHTNyehCTfUjq4yDntZ2aA97zyFT9gBnxYBhy6snZZ53y/LRTwYN2EEOMpRoUJgTUkAdiXkA/69SkBP/ym9dinHiH9X0+HVQxnl4kBPSaSk0J/vUPxqz0m1Auo+acGKLQU6zeF4JzcdBA/0jt0EcjBhw+xF4UoKZE/roI5kFCztxiXeGvWfHKNMqUVtCXiAwXUAx3XT91iIpkBruTEmMdfLtSpOweivXKMJ65yleW4yTQKiWgLe8WC19RzreZXDFszByn1FRfgwZqcivVqB9XiENjJaRQgkr1uYmZ3UvRUU9OeN6xhqbbmfp8OHAt3xfvciBUSm/JDKT9JLKxLrjkIM64iy8CRVncBsVhUt7U16nZfMHwUX/e/Ol3EFPP3F8bO4gZeU1IzeW5g8qg1eBQ9ThkKFhGAoe2Iaeg885o0zEJFQ+g/QvN1X1HUz5V8yb1l2dEyYhhwngq0kmgU3YRLyDE+xSB3sFHwh8IFgDjEBph/IgqQwQMQA9uF9PwvHhmzYYHeHIQOvPYFkcn0RSgMZ10a4sT4pIsU+0Rg0T77lQA0ifORIxNZ2Gps8joFK3HNJq5V6q/SAMsfr2tqaEqnSMHjWKfs90IrdVhRi13hAR8Y1DpWe0nZ2/Y+jK6ubHnPoHNkvNIB38eiOm4I8wbfY5OgdmiHTP/XaQhYfv/6JTQd175SB2+Y1boWzg8a94Jx2l+M+g9O0IEw8p0cYT+adescHs7XrSiIt4kYO21zqY/wOLyh571DsBV4vhEXiCHGfyvLrN5It8HL14zITAr4xxXe/wQRadFt8i3b3/ze6DD1Axd1qHI87E0MiiJvg2RQAhz8dR84m50KeSkSppt5zUcsS3NChwYHvzg/76X0zgANH4Ez7Muw9fZb4uKH4RYCqSx7C0ItIi1mrisLSREQdBXEA0HXds1aJFKfk0WdgCU7MMc1nHGYot4xdfK8xbbG0RCGyqXQvQ2EB3QFsdhAZiPAAPDobwcQoLaaeuR7rdzQSm+V8zidRL6GL4zsXLvWN/6m1s/HD1Gl7XTpPOrJzrgn8PUTRZEKNiiFP3Xoe6GmCe3HFd7AEwR5CSt3x1x3qOYWct1Rjf3YX6mYe5JKGkl9p9eqX/yQ1IoUxbXCSEi7OUPFmR5Axbv0DJSrAlSItHcgoxywn7Eix/ISNp0NSEMUDPiIOMPkkXeoyxCCb4hSjE5Zx2NNP+96c7b9W6q+jau/d058llyiI0wzV/8El1L+OnkVSSiAqf1FibVoKTQNMkLGFRpnkpZfPD8Q93/vzFzspHVM0mTaJ5KmSTxvWiu1q3JXUIDAceo0AvIDWTBnTPJ0GW4/PqVKVPcQg2TAYm9nGS9DgfCjaTgl39OMxd383QMN85iaUk8PeIblzCnxJWgx/y0WQSVo0fJKxnYoZuRqc+ZGUPDJkw1dI3nWmo5tuUkzsKFVhv17A+jRRSOtnbWu8/ukAN3i46mKsEJ02R2x5XPI4A6SwBDvTZp585eiWW2N3CxO2qKBLc2GZa4q20XAeQHvYVpfbAV58WNYlVd2fTzrwGxCygy6uFJYRv9u6vIlXCyYdzt+DAVO6UqfMxxJLoB8kl3GXZWcPzGjt51OlNfu37l0j0eLbR4YpwyzH8JVOcKUfT8SQnypTvGeibjuaHRHq3TF5wHC+k0ty/0Wy+2Ig0bg/0+xW+rtp7+me0C5e8beKeno78Gyr1aFqxTJhanKVMPAnnnGl9gB7R5pMwFuJhwThqso2x8Kx1F9hmYywzb5U9r+nkDZ6JIkHQ1CkZKWNNFG+eWCtitAlh7IdghccIi1nOr0RrulnQzWoeLsPjFmG7APtVdNQaKuvn3te7SShodTIrk9f2I3W9LiyTP0/rAjdywfU4hulR0d2B7h2ptY3WLSnN0SpT1aXqoJEaSDTdxE/rw6JqRs53r2QCLTGOJhea8l4XS4CtF53f1OJaUt3zOrzvT//a7nQdMMhvt7dpNBv/tvaT2uEouNfz8rA9LTyfTk05yaZelo2skv2SYtRSSAz9OzeuoxkIhvrjH19ode+QXP/unlmK0gUMgvrZL194J264WfaHUPI/vtC/eHx7Y90++0r4LEkvnF+zT75snhTBIILHi+aGxf+Wkv1IC/mG0aaAv7Jowc1oAGl20vxVbBQMyMPKh++8BkcDToW6v6Bxm9Eb7XqE7we7/g5+ojZ83f05NfXCH/4Pc3r96Q==";
\ No newline at end of file
+export const w="eNq0vWlzE9e2Pv5VVHlxb26fc+sACRnuO8+TZHmebt2iWlJbarulFt2Ssf2vUwUhJAzBjBkhAScQIGAgkAGbEF6IFF/Eku1v8VvDnrolA0n4V8VBavV+9trTWs/ee+21//3vf/9///NGWHFL4yV3qeSW3/jnv9+wK6FbPVjyswknl6hW3MAth84b//PGu/vf+OcbdtYNnKKNP6n34Ld36DfPL9nwbsJ2S75Hz/fjc098T9hZv4xIb+NTH5B8gCgk/KBScvDtt2LP4XHRL8IP+/AHB766nr2QsEuuHzgF+LcKv+2lrIPAqeZJKv4RfthDiehNvwi5B4CLYO+/TTKVfDdrlxKOePs9fGq72ZKTKzll+J+bsD0CdHMoMidyg0pYxd8wddXzF5wA5aa0oZMt2cFs9Kd9+JMPdVYuugkP4XKujWXdQ2m4vuDxkhPAz5jgLaplqCh87LuZIr3+7j7Kf8Fxc05RVeQ7+8wKwwd7CVVWwf69sgqwCPglItzevTIvLMQb0BUcJ+jGxsja8Mt0qpDz57Pjy2FwcH9x+SB+zmfsFPyzx5mZ3Lu/+DY8G88uVKcm8Pki/Lu4MDVxcD8mqOBfCO8sY5IlSORBIvwrwZ+fHS9jGvybTr2bc+Hf0eG+7pI3MwnfC4C75ObtlJvPpEqeM1nIJfsXF6oT8HkG/p1aAmEGutwey+63Zof7/tFjDQ0OdLXNjvaNwL/tvZ0dI0PwO8D3Jyet4aQ1P2mNDA12QR7J0eF/jVjD3VZ7urMjDW92tHcMWu+n8PeB9nRvB/x1dnV2dA8O9HVBxYRQu1kbGh46wj//7//eWLbL1DQ5uwJPoZ6eXaguJWq3CvBxa+P7+vlP4MNSxXaCSsLJ2g4Mqnia//3n/70hPieK1UQALRaGtoTya6tuJfH8YiFMlJ4dcQ8ybuPr1a0nD7bWftfodqKUd0PsAgKrhFjFwJ2lHCID2YeBXFvDkQydAIQNE/nSs9tzidrGLH66UFjGbK5/s/Xg98bl0/Xfj8DXSuhw+lk/wXoA+0tcPTAqZQg9sXar2Aad3NAO/3yj+sfpwnLCfXapGM2u8dODrd9XVHasW9ooN5GzeEqgEZVD2Xl+QSmc2k+e3wGv1+7kEqXaGuS0BnnWVpewDjOJZ7cX4cf65fuN++cadz/bOvHl1pm17etPsTJZORVCF8BGWY/VfowoMsxNa7EA69CtXc1hHqHODZ5uPv6u8fkvnAepJSch08UVYe0WdwMs3kNTD0L7gLRQS1Rrz89CFrU7Hkr/9Ojmo7X6mQf1lY/ga4AKMZtQo/+fLbDiOQiNCtV0c56lN/GPPwbhFT6/C/LvkoPAopaAOmCVHPpzdoAlLFbh9Xyp9tBdpJ62lHj+VQnbsPR8JQ9Pnp9fghd2Ln24ferH+vWHW1992Pj02/qpj1FhCf3uLNhBJmFHVb/MCHQ/5Wwofv6pVbbc46ClrlIrqVw3N040jn9hZBnYh2LWRIBiXm7tIb4DA5btiRMEVJfPz4YJ6KKJSLZu7dahRO1Blfr52uPtw59wrpuPNjafXMaqpGIkQrClqFhQTcOwNE0V9zphpzjzeOFqG8vU/1ShGp+fgd4n4Sl1xS7FDB7qKqq8ggd6A6oYyg0jKY9DtfYgx/UEGi2HRVrDdmp89jlUVP33z7d//hZl9SqYzimAynGpxjyB5KEyAyQTHrVPGc0YCv98pZBVDVG/vMH1n/Mcd5ZRDTSVkNDANtd+UMYZG4eaiVB182JfhmrBGuXW3bp9auvUHRTatO2gY0RbR0y+Rm2Rpc1kAHVMYGTT+Py6ymMJ3jHz2Y1T1NZyUqlIRuHXvqvdEKaZWvkOaJVb+UTt5hLpAixo/dyTna9vbT76qv7rdTbmFU6R0EAxngKdRRp8KpJkKbtmh2rtIfT+5yuzKsf6tRv1S08aDz+NZlqAkgWzEe4Tyw4IYdEPgMZAnwMGhHWH2Kikn68UMSNSPJee1B99vXPrztaTz7GhwNIUnQQlxZ6sMJBEMazAA4MKrQKmAoEfVKFFHhSxfmUm8Hj77JPGg1VQL5yJhsfOC70AutpsE0WrrYlOtwwVafMvNnG3BS5CgVVKSDaw9gC/1larBbJpj7cuXsH8zq5sfYXqLAydADOEzJxZF8urUInjESrplzB0RxPqxz5ULRehR1ProwUTVmzz0eP6sTvbn1yG/9ASUTLOpUt9N/KwPYIPgCVwUbDv+wGZJBiPbjEBLGOOGoWLQcoL2+WjT+snr0KtQUFAb6HN8YXYOPIP+UGWnuVERjD0CdZoeZWpMM0iA7PxCV41vswh1voqEwJ3KoEfIgUBteXaAestoxFU3cv3Sg53Ep2w5Iou6jkZO+xjpBEeCquHyGq4tVUgDkfYPkLdoyLcWjmF1urLJ9srK5uPnmz+dhIeFiqAsex6XZTPMI5AAYq5yPrHj0bNcz5u7eahhG4EzgHqmqueXnPnI9VNMwU7Utc20aAu7KKUiULncRDlQFiCS09MAgQFL49i95R54YgmBtRlTE20tf3vsPawLOtcqfKzK6zKQa1WQr+szCh+Nix1YAe2l3VyRENRX4NoVZQL7cvd7xgg4aiXRDIyLOIhs2e/tgYdIuHngVIhc759kNq/gHXUuHxl51MsWo7GdUK844uvfj4QbaItvQQUUMSNYrQBUIEfKc4gwOKUQWQiCDHyPNb4N0p2rlokdgecHkHdTEKxSNRUT4/Uz3zBDFJwR1QZ+ZJdyIp5GmOJSSFmELpySgjVXHQqpvS1OzimqRjIJFUBtjZ+2Hz0GTBJ1E1OEaYacl4Zn2JKiupVs7VbISpbqu2Eb9NoFvC1m8jnnl3iGYQA/6Hx6U/YWYMqkVTswJWqX8hX/YD6l+/BzIW0LTVGAlBtymxqKiHyi+SBBQpqN1UO9dNHNjc+MXKAMejCh0MVpouus5CgPLgElQAMFCg+eLk6S+x91eOx55BOAs1Uu1mFiltH/tH4+nrj8g+ow+9+tbV6d/PRaTIbmBb4jk1gSG8R1jVwKSt+zQeiFZaoO+m8kP0QdcN/VD6Now/hP52DqKuMnZgvuVxZ/IMHWhGVLOGyGiw5qPaxprCCoDdRb2VwoPKXb26t3EdkSAKg6m2ZEOkVVFsEDEUPnAW2dFeZaR7JMTZaPjJAp+pPLgA6GDueKFBCpoNA28nIKTwQO3AR73//FybTucCfdDxgdYsOzaZj02ia+6oJr5rq6jludGaLMkZmlPGpqzlhFZyOporZ+FTRnB2qSSHRNz0F1LMfLB93nEVzBoWzmMM31Axql6lTZMrUYrpizlD03IQWdppmI7HkKqmYAah5hUnIIzRfkXtF6zUBb0GCqdok821JreOUl2uuNdtUBDPCK8k0xHhkM4FUvFFROk3jYtxtd34guFmEk0XJUoS3KLqiiYpJgKQxZkqiiISiDVgwQUQ0/3CdIGKvlYkWxp9NvmGtYhMeNdFh06lsUcRMCrMzBxwAc9/5/CewBcqGadNoWC1qhVVc2bqDtKR+7ChoXiQ7tF4o7ZFpIAyFrfS01tBS6Rta0lSOSh0qRagUX1zXRdSc0nHN2s1QOCF263+/EapB2AsGsxg4Y2/8DyhHqK0qEMMyEe6l2nphlAZ17U4SfpYL429s31trXL4nBjclA/WMxQoRKLFEI70XfimErpcvQR3teXvv/7wxn7XLIMMhXF61K2BkccUdUlQOHOAkhQPw3oG3ce29xWo8WPiSm8XVNug3//PG+7hkq56FflDxQ38B16/Fyi8+poVkWu4NI4nfMh9VK7jabMJhoqZF4KHB/iz85Tra+mz4y4yN9E4PDfbOjI30p635Lis5n7b+1WX1pa30QKr7/S6r2m5NDE2NdA0Ov9tlhe1WV9oam+hMW52j+7usg+1WR9qaHhxP9/d2dQy1p8bSgxPtYyPjk/C9rbcrl81ALl3THT1tHd3tbR097QP9ve17B63ZtDXS3gOP4Fk3/NvRYmEW2h0o1pydoLWn6vPzTOGA+SJFEQsZJ07VH4FFh755mNbQyh4uw3CvgdRLdkKsLCk0PwqmQHRypswKQJDlWaeQZVGe3UYLsUGdpf7oeH0FeQz9bMsPIlP67L8wCWdGHxUrdx1QOstq2a1l4nnf5/xAV3EP0GtoOv0LU4upgUov5pW2SFz1J5jVz9LCF5Cpg4nn53Fk71xfqx/5qr7yuHH8nATzKzjf8POJ4n/2keoSoIklfyGKC4oWqFm1KwIuuJSJj0Qqgg8NcihhggMSUAFCL0r00PFQnT07QkvuoFgcnIphQet3j24du7v5+M7mY9RjFTdBwEtcDSWJ6bXE05JqQBZTAbZCC33P03YE8Wo/ZP0FHMDULwCLV+9J1udn0bhsrh/ffHwYRX1yVcJW/SXk6xW7cIhGeG2V8Wu3mspPGTRJzNBaYg39X54dVL3ym5hHBFtpI5qZ+EYOD0vxGuZ2UzXM7SZr2CGZASBSw82IMYmNrqAgW+EJOUuRarZjrWa2WP36OgKIMRBqRWvHG8t5AQo3ukQxtLWwoq+1we1Yc0fAIyJGGjqCZ+JsiE0rWU5kTWF8TIrZ5vPzy9Fx+cW9xmFz6IdL9iHPppHpC/uEeJIbSHUSBY8gaiwDBCRuOcWQmvxletzQ4UoZv0gVy3+iOvRFGtTQnhEVZxZUFVKnEerrNeqZv6kCYiP/tQ5Ps7vuVi9qKP7LGEgsRYuUr9TF/1bXa2aaomU74vzyv0Rbvgmj+maAPH7I5Jj6553rP2wdXY/wTP0jzgt8Aldc8/23duGaItGBA5woewDe3J1t+gsuTIPsMk7coUncileV3gcwmQ1ddm8Qb6CHwT7hVCATwbQY6mAWuSQlyvm0K4Q/J4BoKmjJZZ05213ANQL1oySzgVPkTeZQYROL3bc3miXKxyxWfW+msRPpydHuzvauVHJ8ZHgolUwlpydSyZkJ/DyRzo3C5+lUMjOSGR8ZhO+T8Hl8Cn6bGk4lB3KTo/B8bGp4CL4PpTrTfb3AQNsGujp7uzq7+zq6B63udvgf0NXuzuEJC4hqF5FVerYbXQ3s2g0qItWNXyn5NHuh5QT32ZF5nBZlEiXU+6hHbpyq/3a4fu3j+se0ORvYlRA5zlLOpglkYC/zYj+DQbcQK18IC5ahiqO/tr4IrAymgRoauLF7UC5uP/6hfv9HzqN+/GOmyJQBbpPQghfg4gpnRa4+lqBHmJ2GpmcKW+6O1O7Q+GVk3htpXEbwkPYnRfN6iEaqoKkT1jZkaZyiHdqg60WPapF1tfYQuPHzs16i9MftAme7tba+de23+q2v4nnCoMjlSAFRT8XeZkIKr4awtiZ2zFoW8/nZSoK2g1QZN59c2N64LVY1dPkAaalQFmMJMWmdw8zMzESNJdJF1Vzi2YVI06EFu/vzzhe/qF4BbxfKCSNPuZQSRyT17+TtvJ2hdXXxLlYabvkuxnL5emV79ROdC6TLVz1cpBfpYBCXgVg7tNYXqbucS/vZOova+qGEWKw0ctg6cWvnuysqh5zvzxrwAkXsASjw0M7JckG1VULQIcYyu/98pZCINNJSwmXfg2cXaOXp+hPR1X990Li43riEC9Y5R9ZUYIOJlYvvIa+5J0qqIkO5nRqUg2qIE69EUfVZNs3Pzy4KJxvHMyUxZhifXW4cPbm58ZHoNdJiO6ErYGUtSPvNGfohTt6UNK3HhhZVsT45KKL1QgtUNDpk5xUbTzgyaFU30M0hrGZMr9dWtWKXfQvUuq2EkBJw73r+ldcsAnSxxufHTBHKLrpQQf7RvA2TIfMVDKRSqs6hxthllB4ERbRkTj8or+2ffwVNpyhJABk6eV9nKuhJDDuhJhDQ8WbRkcPMFhQeaL31uXizc76bv321feQr1eac71IFq9IsLaslgAcdC1VtZCD8x2TdrmLf90tOEDgVmjS06vu4YFaUC6dG19/5+tv65ftm1w/dRK5U9YO8mPBLZM9JxLo/mhX1jGdQ0pxgn4+LITo9WRbs9EoKml/lcbdjKXAWoGFVFRTYvc03sxFzLgcJ/gs6O81GQIT5Fl3t3qfbh4+aXY2wWnf1EmckSm+wETaCgbbhkc7ePIODaUG2WRaezNXPRsSp2E7Cj/R7Y3LXTIzUNC9w7VBQgJzWVUUAqIRdpH0PJv6IiQFD8mZBktz6yuP6xxssSmPtOzEvr/oJP6/YBhrNCowRuXLjeipTlaOY3sB0ag6aSD5nXv3sSBa3vA9F6oIp9rWzjS/FwJCjsQR6SFVEH7F9h2yBLwdDy20lSadifdDs/JLcSGLTZIAj+kPpi6hVx8QxwvAXIJp4QPCy9No6Bn8xXcR6tBg/TT3V7KDRIdKkiE0tKaeDLVVhTAnGdG7xLxbtNZYs0rDGgOqK4RiliRaFZolNXVVNE+mXoRbTRE7yJvVdzGMmNk+Uv4vixyaK8lcYqioHNVd8b/e5IqejyaL4+N4LpovoZwbKyEG3DhdsAZ0T4LMA6hfbk+cAkK7l7Go2sYwbZMLlHj/zO+++LeZ1WfQkY+f+t6PPPOlsD49Cd8HNidf2RJ/ha++/JWeJWdcr4zy2KF5+r9UvJMBb2kE+FC/viz7D1/aq9NWsIwWIPiMByDffq2Y9m5b3IWPzCe3R0LzaB31eLfEre4wH9AbNkVVlyqmxqEDl0Y+1Y8yMqRoQbW9TSRHSKBE2lyE5tpSWkSbSUhyEa5pV215xxpnoHJ3oHNkLf/smOoeX4W/Pcq/V1mNV2qzFf3VbYZs1tNR5sDxV6GhLjwwPVuCv+s6gVUpbQSVpFdNWKgyT1qGpZBn+Dk50DpSKbda+pDXgz/R0W/3eTDf8v9j9j25rbrbf6nu/25rf12vNDXYV2nrdQ51WZw/AzAJE97TVk4fPgDw+YuUAuXtsxHJGhrsy8JfdM27NdC6nrOLyuGUvpax+yHnE2jdulZPWSMpKjlh7xy0/aS0O4pOFlNU+bI2NWocG8Vd43tPdNgZ/45Mjw2+NDu/bOzqyZ3mgp3uxra+91+2qVnq6g2TSyk0fLKd6ukt2Z9HrbWvvaOtLt6cGumcHenJLw5Y7mM34eWeiOmxNjVv9SasPXugtdIyPtVghMIcXjy6w4LcKoLTmEkijweyTP+CTT+sfX91cv1pf+572W0WiJUxDvlxrTcOUd/Zlt1KwCs3AiSKITR+/WAEFkfc93uGqrZMPRJX8YT+9X7+HhK5YkO/Q2oFKIbad9AP/5QiCiaokkgNCV/TLwM60FM/P8pz10/uNTz7mfeESvVKSnuTiazWK4L8UQG3zie9y7Z8cJCp+Wey+kW+D2nCsr39g7DYewrekhwQlkXtwGoQhOKlKJGZ/KplwX2ONepA1KlKrCzS/PTJL03i0FI2r643P1uvr6HxQ8f0AqVT1YBhRx7U1OxAuE6iMBRAnVslIAHpV5u7ZRTcLNFTXvS8dm6AB758hDxh+xTY+ixLLr/5LE3PW8puodUGyZmWlr9NpmQuzAuC45FhsOCTFUqYlCvFSALF4riE8Nc1FZRioxn9+NkMouNRAWwz3LgLU1pe/87oJvexwI8M0VqYVAkXgXh1M9EsNp6tIGEQWbWWWNiUSPjsd0nb4w093vry2c+QCd1BtQkVptZGNAhpwCsVMr+tLmWRd44bZVYLlcYoksDbXv5AE2XhVseSoPW8B+4qQrQAjc4BKhhd2BB5uOM8xXP3jM7p38Gtiqh7Ee5f69aUQYogziBjfRV9KgAqattZQMZz/pHEYPe+KMmf6IFUJJXpREpETJfIi/lkyt1LtqtAjYGPmEs8usdirx1GXfPRw+8Z32mMr1G2jiFMM808jGuNNEi9dp7jQqM4XQRNLXKVzt26eAlSldqnZMVFJdyJJ3WKoMUyFZaIYskm2J52gvNqqcPnABdtQuE5t3f18++6qhBD8z5Y8C5NIQeR3/1UQhEmUacSgD4zuzA4ZuPgjCgUjf0muQT2+DoNi+/sjYvVJpmlyyzBGh+GaoZ/iMkfRqRhrjCq7P24DR7mTkQsdlOPO6uP602M81TIzdRbsgphzxdGX7IJc3OCRwuXCtQwaUGaxaP3ijCqWGlxNxeJhpksksePF0blES8MZmaUx84qUhrKKFISGKJeCvPLMApy8qqTP5exmwWnUGi2BUHGhCTQm78mrprACOiJnURRfionEv7ZREvb9Djr0CHdvQW3WPgdLabCbDE5bbDFlwJSyX4uv4mDCVdcjKFzw+fgMQOjEok+L97FLt1rc+SvENUo5X0o4TbIZ4YkvY4kmQ4wyu1a8zuB0ioC1ol+SepnM6WW8yfhksp2XcR2T58RZyStzkggfiXCHlzAHkzW8Vtset8mvYJGlNVZW9QU2VdjTqOH7s2bPNHlRy/QKdsm0SRFr8gq2xLAjcf2ucqal6i8MrR3V1BEtaupNpSsNFanUotZhQmuxpmIFJZWSqUMMTaQ0kFIfWnW0cP0FUSu1VdCSdioROrWfsSM45XR85Y2qqlRbn6bZNfoCm+tuWHlPz8I8G7ON+ADzei4AJgqQg7na9u5uq20qjX/gACQqHnj3BUtttERTdqEQuNBexY0K3IvAVeO89MOwSzCny1XdbCL6tl3xbOmQAfXh4Xk49LdQL+ChY+Vc7NBYzNL+ghd7Uy5AwSulKvFUesEvmm+8u1cowaK9gIMpoTPSnsnYHK6Hcx+YemtBSjIsRaQE2sXDeNLs5DE8PTWaSQ70plPJgZHhoUH4Ojycg//lpkcHxtKpHDyA/yYGJtMpeDaVTtE7M+nUyODA5FgK/h2Cf9PpVGYA/pIdbUHSmklbPe2d3V19nd3SJ7mnu7MdHrzMH5m3gcT+t5+xPTo0vmwHZTxDXjvBh1bxoDUeo1srJZ5fXBJnSvxnR/IJPFNFdu1y/ezxxgc3Nx+t1I/9tHP7i/rvx9GXzV+CvuYeSkCXJniPvV6doBraYC5xT9JNVGj9Oe9WSjE5sraHE8+EWAxyeAOfTnGKl7R87iJZygQeCKgIkU6f2fniSv3St7R55lTEUXYtCmbLmCUTk8Yybpgk0NdONTxUSNXH4At4jgyGNx1ZpE2u2hqeWpiTvIOdDJkrbR8+hnVy5gM8d/PNka0b95iMoMMh0z8jB4f7YslOFIXrIT+IiLEkFO8yNhwUKvIjDK6sOBWB5/dWlxKo16vPzy8lqn+cziWioqO8GPKC/CeObt88XD9zrnH5xM7RJ0psPCZ37wydn3H9BarBQsLMsZC16WwK7iaWHLeVPNpM6Oc0r8Nzjjk77wYZXmHRNUp9rXYTGhVjMdB5LlmJH9zcvv9t48Mr0jwozAB7G+6N4r/zJduYA+2mlFCy2negkNxsIi5hzl5gHwklFx3E4pPO2PmVVI375+rH7kCnbxKp5CyDCskmCnm3EFV+UbFI+9G2FPTODK4n5aA/6n6BsVFCv4fKs+6Jg5nEoFmwZ0fwwPJZ6Wu+fXdj+/dbeC4ahLvzLbpwUF+T6HgCzpASB+Q8EN4+8xXHFAAMIZ4clVumWjBoazRKRTdBp3FokgDq4QEdmr1UUF0Nhfr+yM7Hp0EvcKWR/o3IoLFQJ7hkWlvlJLSBX4RWDPHcDukvrd6lb4vu5nw4au0g9KjAcG1hQfBI3dFjW0fXlGsLAxcQWSovPfrkKq/KnM5uG5kr73g2Ly7uMOMxsYiEfsUldmK0IRh11Bx4bOhWkPjjNOiy5xcXmWxgO374dPvjHzY3NurXvtq++4hIjsaOiFiyi8q66VciMhaygg6B/azioM4ZFpCNAhlcxekwGIsWFs1BbSOQjjk3T23f+53FxBnO9x/wBC5kOx7tbMJP4JBfiFr62qph6msPhasskCBp55skJE+OLJNWc4ySSGufAXUVw/ODm4L9hHKttoVQu9AKLZZUY4JV5KKUAjkfNh+MQ6NN1R7y9t27m799JapI7iSjj4IDr7QQiDaXUUnsRmFUB/Psat6N/AZf0PvRGAB49JmHQJnNgOHnw3p17UR9/SHofe3q43m8kmQIBY9YMM6TFGlzvoaljrSZ8L1RNhq9b3RVCa9wMtfod0M1xU43ZLpFHYWRSmLPG+XWB3VkZhcZhmTOjaQxDSEMuKkXhLXmExGR8eUJOy3d8VuRSHnsEL2PHLMaxLEE3YOFL5KhrfQJBV4WYWckForOKSjvN+mMFOs94vAC92ryTMLuE5NBnTt35tj9ttX4WkeDR0esXaR7TcPs0t2d1fXte9fNkVbJMuKu4wwoqLPk87HriGDSl7VSW0PaTbF1lFKofTfIHlPKHUhX2XpGdOfGg8eNi08ldTktzJ7i8VFpKn4Ji90nqD5nGuf6VEdhUM2invdNiYR/xVVcaDGtsRjxP1/CdQfW3cz0oBeV+IhaXBLiejITrhVfV0qr9aUWDFgTcbatBsuNcluTocXprElZo+xUHD2Jq0ODMxkjSo2iOCVqomRSX7wQwokABH8ncawErfq86FViSZj7EvvdNJuMuIGIGwU1YGIaV7sTxbV+s5r/U+V7vcWLNXe078e7vNnZm3p3i+6sHIzEb61cjGSyN7GHQl4dMRcj/buoj5iTkf4dra2Zk1r8eGd3VyOZmpyNdIkOvPOiVRA3F9hzPIrx5SId5ysBrVhAcoiLB/ukWg5d+Qb98L5aVai4GZhnqZ/V4Wn2MsdFcJnQOEjtaDAK7gFTQKxH7XQDEvo4BfI17B4+Xa0ftDpencxkhgeT8G9uYGpybDI9PTCZnhmYHhuYhL+pXGZkaDg9moLf7OH0eCqZywyNDqaS8O/IODzODGeT8HwU/h2EdNPdXZ3t7b0d6HfSPWi14TmUro72Nlyp6Olq78J/Orq74HGrBQsKIZPwYeabgUlkxhW/iNAB0mu/zOu/SPzJuVIsU2BMgc9/2Tl2un78I6D96GVJyxRAFYDlF2nyamBy5BFuSZhvBa76jUc6KmxgZ8ZzGY/g2e1lLQaapY2z2z9/yBlTS2VhskpbLmZ+ChG6SVNuLvM8h5ciMF5JTi1G35wlE0jhPpjpQW0syi0uIQNkvXP0JsyggextXXrUOH5WCMOEhdieX6EAcwIY5lFmpiWdKTuVU5AqUxAMwpJXIZMqKufTn27/9H3j3EnO0PNcjssHRlmE6yw5VT47YeCH9qwDkxdcsonUMJ7OwINpkQqun1zdfPxYV/B8aAu3/EgF2wIRc6qQ86A4U+fZGQxO6sey4lPcOOE3M0Mj++t1ldk8qI3mvPw5hqTQMkZeFLcGrDXGM/TUuItGbON4QngIShwhl92IArcBB6zf/3Fz4zZnD5ppASbvMGcmh0jixBTMBtpNZF3UZzlVljBpzvCk3cij1dIe5WMu6jmYCU7Yc76fT4T/yVN1rcmgMTNykl5kZQjj1cw6pEOM7oIeL0eo8CL0UO1BPvEHsHEgmRx6b237JJX32I/1H4/tfPCYPN4BOC/PIoA8oCgyhbzr8KnOtRfrYF6tD2zcCY+JJo7aX6B9DNoHRHaOQi0J0fQCwvaT77d//wjI+dbFmyCcWkBAYFvIJRYMnEKWYrxpaeT8hA8oGCI0TQ3MBopMCahpmiYDnK9B/sPammFmRLApdMnCwvNoN87XkiLFWC/KXaGp9OKwKmjT4095OVNXAB9VQHcsOyIJsz5h15RAQpoQXfeLIUD7NKWMjAwMHlSROo2CVFWfn583HbTPfgIKrX7uYf3MdwavIhVQtEOjkxDB8mkxC7Jzi3RCB0/vGdKEduiUQ1oDoN+kduNKcFHZkqKj5tBCQA1s/7TeOHUMm0QKEVKALXFswxAhBBmg96Kej2ff1B3EhDF2dMXsE8aMMXp8BbsHzxhbHl/BUcMzReMMixPJ1w2NAALiiBsu3Zryiam0ODMHFYeq35SPheLzc2B/YIyInkuDhQ7SYbReIRIfl25BdMSUGpoGTaRdStAiWsuhQ6tntADpeImYfruKuhUDcebFAY+r2sX+K1ye3PhIiPfo5Nbjy1tPztUv3xQLWqjqK04pUfJh8ujFejgLhlM3XF1LKDom41ppDVn7rmQcwGGuS5PsppZFqy7P5ogQRJuPTumx/+g0n83h0JcVVwuUqPxnCaarSxxrIUYN8TBOQm57w+BzizYtovIBPXzXhrkudPxOMWMQq961qxWxWFHgPSHaWUCeUaavYjzeu1A/dqd+/XOU88kZmJDWz5xqXD6Fm9E8LHJAqIJZXl2t2N6sqklagmZ5aL4dumXNVtUCHNJY6oZA77heh3hblEKELmEfhBalj6w8xJT8xpHGh2ewBz65Ch9AbbA4khnTBoKWg5bf4oy59WTcJA244SJZyZlzbKMjzCDG7DR/ohPVMulvhzmpJEkmNfqz+Zn0I65bTX6hOIWjeMRu9OHlaUu79n990DJu10yLFhlaUYPRwkRoJGOmLbSMPrij9W/xb5TsdRYsguUbWDTDjgAZZTIL1MdRHuPdUwd5kJgtAj3I3N4UWgcy6o5OsPUbohqi82sTAMnnqDmx3r/rxFomE4d4CuGB/bvPqOPz0dH+rs6+3rH5pFXssoqd1mSPFaQtp9vyuqyJHutg2vLS4oBEkNRHIw4mLWcYf1pI4XN+ODaKz/eXZp3OoXf6rbcHrKnpTit9yJ1KL850D1an/tFrDS709aZC+KtMDQ1ayYNTafh/kJu0pgcQrkx5ZCcFYn/aWp6yFtsx8Bg87x+BGa4112X1tGUmrfKgZU9a/iBKC49nunvdqX29Vu9cz/hs3ukpjPcUup18T/dsW1c2E/Za0125bGfO7sp2Zuxuu8ea7szOdJTdTNKa7Oudai8W8pCiLT+SGmjv6pxOW4Ueaww+w38DSatjye63SgPW4qGZMcvtsZJ9vdWxkYH23uBg/0iqvT9pjXZ1JtODyd7BZJ/r5LvbZp22nv5sR2d/xu5qH5ruGgPg/Hh3zy6BzJZd7FrObIJHjU9s2a3dmqWYsRS18cvtD67XH31P7i/qdVT7dGYXA4iWjEVJ9YYfgVNIURh58hdRlGcp/LIIJlg4LmIwArIKhvdiY+V6/fYR7X45awf5Fr6XgTOHsdANL0YB3eTIqDKJejNyPhHvS5lV1PWSc4o6X+b8soxVJhw7QQ2YLpgnfth8elcVwilVg3JzIRDFLAF+j4tv4Me8MSkLU36VS0R+CaqFD2zp/ooxa9e8iOCX72+d1LV/yPdayA0AptjwFTMApe3wlv7GEkdIUBIbG22Hv9g+/KmQWmp+mQvJTQZAgSpH0hzdLVDbcGlf48QlGWuUenapmrUX0FdB3huAr/OxkOYEsmPS26pn+uImFYq9hDtNHu7xVigg7Ebj1InGKZo58igjD1X5WXioCgT/1QBYBvnN3ApzpAO9SxHqzov7CDi8Sn3t7NaN01sPzrO/bM5xhPe+57mU0jiSVBS/KRyVXqYUTvwyrZh75l0Klgs6oqgcQ3c2vmfH0IrtEGOltxLSL/RPJJGTlYrrFDwVbpCmJ7yawyd9YTaCyzgfYXT6sh8IZ/cF9BPUvu7iq09ZA8UFgkaFvLLeuPpE7myIl0Sji29KH+VhSiB93Ku4bMLrlCrsYOP+T42fP1ZhBwOnYh9qHhD5qCM4fW92atf4MU1EeZgjWWUTGcn5Jh9wURoZNRHv/BHeHVgCY1hvXbwP7Q7FUCO7GNizzQURgGZZZP3FioOEhK4oKcf10rHH0AARvaQaIV4iA1sXCgyNJ7WrGABmSW6c1raB3mxWTxnqzqZpoBeb/PLXeK8S6yvWItdOQz4R2yCzisjPOZnix/v1g2oBt/Tpjp+bs2IUb6/82rj4y+bjJzyKK6GzACSLB3Ih64RmYE2FF0FTIEZyMZolgLyxAWvYDfK2PFRCPlIwyMyIpvfPwUgzvPCpc3CgT53e1opOPvIjiApJY8hwnwbKa5HLSP6XpTJSaCPw9yoLmAJSiL9TUxLitVSTL+H+skAKQS0ylZxlRC/pq3hYHlyo4ft4AKZ++abUMbSdjrnZsmRAB6JYMSiFYkCY6cVeJwZT8kuRG4FoAVKKsbVyn8Wgm4HEtj5vG9liF99EUispz8/SqvaVKzvffmSmNpKKqBBV3aspeAktAC7J9tkQC7O0JvQVttDGytbFmyI4tUwZ+HT7jYnFIZHieZjgCjIK1gS0ezBLydJfgchLEq+uQVgsOSavVlxaUmiDNmtiG6Gyir5K1iqZqg5LpIKmi0hbl+8DbxRcURDEVyCGmhEyPXslcmZ8MrjUi5iUZlF/lg+ZROYVaIymMNw9qvnaapRbKD4haYSkDhFzLjo7Zoem5IMHkJlpqQ3rLNKJKhAG+Y/TGbbFjfNr1CihtocRu/Uyq6UtVkxBvUQ9Ra3Kn077N5JKFf2nE/pmQqH7XqL5lNbTioocgjAUF19ysfMx6JT7Uk1JFfW3dUfzQpX+sS2+TgXQiDxorkyJLMzVKJ1ZW+I/kLJBCbvN9ai3d1uPMsSkFSmsmgNvv8DHw6/4ARidZbxHUN5xGrpOuUjBC9i5TgYPzXk+7zPx79KVA2TI0q1FNK8Vv9DdqJ6bRZvEYKG8IlXkRgnEb0UdHV8CNHtvZAeTAzn46++0ZzJD6bdHrf7O3sF+a2IEw4aOjSYHJoaTA5PDY6ND6eTAFHyfGpsYnobfJidG7fE0/A3lsvDWyPB0Ljs4AH/J9pmuTowuSj4bxoGTma7+lx04sfHipUWMU1atiJN+tzA20cW82HvOU0xbXArHTn7yi50fbjYO32hc/L3+22HRyBTeoOSUyejj/TYZm/DUcUDbCcPawxZ5KEgTyQHjQ/53DugRul3PgEJbkaEwaYG4WW0NVXsGXX3pConzR7dWHm99uyL8nXGDdN4PCLDCV8LJu9P8nPJkxINdvrpGE0+Q3MHDbw/KfIUmOml8u7J19SeOouoUYqAwGLjr8TDM8MSDFt2fXyQcYAc0uzx9BVAan1/lk4/zthNk6JIjXoHDkiKccgXF3Z88hU+lWihXA95zxOWBkG+CQtcL1LPffdA4/2n90fc7V26QaubLeyg5iSmhRIX60j6wtBi4siLvBQJxn68IrxX04aEjgCD2iQv1+x/VT2NYEJbcF7cOcThsGgN4MqJULYubmYq1W9W8Z4sDTTiQacWIQ2rz7gA618P3Ip5kEvG1j3+0ubHRuHJ289EK8QXfwQPLtDlVriYoa9rPcAmbDinxeONKg95Ne1UYXJMKJ3wIeOsJt8UcD4+xzPKFm0ZozbOf1M/ifmP9zOntp1/rKP5ZAYmUkksujx3IzIhdKhnQvRNvaqDwniJir4697RYxd7zXlmjYTc8Mw/31t43Hq42fjzQe/qDyD6k1yReoEgZVlTtm4+Gup5G1qOS4W7NR403+zFzlpiezrOWo43KI7MHUqESWSJ1iREWq6kggxdrDIla17E9iueC3M42bq1DJ3KPE0XIE0bUrYnZqTc0Zq4id0JXJK88j3yyhrTHTRTp6g95BVzGY5oOy6RDw8HH92MP612cgY+0QUHYLfKYSsTh33pFymnPg8rKdYL8IKjRxK4/uTjNKa7hDPPl0++59XWKZt0DSxaaM8SmOCdMQ6cMFZIpUthzil5Sp3FsNiNOvgVZtfHGhfnedz6WENqDJgQMg6EyiDBof/HXydNOgKtHGnFIAXCIsyY+H60d/5mLwETQtPZ0HdtwCCq6lDoHLkHdAUwe5tQw6DA8xmWNRetN8uX3jQz0Oea/f8apBUx9BDU/4nrDC5plt3LXD4xwRf1up4aFt2BmBbmsUGZOqh9ZBn4PfromVIFL4S8VIvlLjR80/DUAY7xmbr5mEgcGlps3DKqofyLJae1BR+YoYgD9BjjuHz0Cmom9E8iSP+GWG9fACNp2dT6ECoIUpZGaGr5LEK03FMSE59jhW5uMvGg9OcPuJjYpsycHEul5p+9IVjz2Hc9slpsIr2XNh15osOB8+kVZW2deIZTUMqmFMlSE1rKiynqZZ08ZMWTBpu5TJevX3TS0b7cxNSi6m3iI9NqrMilJhi4iXpmlUGkQYRak4lHqWe+dxwVqXQymA11MOY7gZndyEEBvkH5kdzuhksY6lw1tSL27aG6f83kT05yud0U1x8ZMoaXRHXPyGNxlA1u3m/OOtXffDKRFff4DyHnjrrRfetpUFIoTBc6vqRDw5KPMvcoKBwYAT9KrjKRdx+UbzPGFkeHzAnhntHxtKJQezM6ODWXsUP4/C3xj9JVMjwwN4F8GAtTxgwe8zMEnAScTIWCo5DkkH4S8N701MYAIATA92ZnthItAHf70d+CcOpvfz3QO9u88TgOkwBcohUwTtIO7km0vQvgDH6C49P0vXCX56eevyb/Un3+58dVY63XkJgKvw7Yq++GiACeZGT4uOtOUw5/XYcm8fuchEjN7gZT31TWymVQ9iM9i4Yl9l7r0CFgO0bsAXyNfWqUtsP7nXuHKx8eGV7Rvf0910VZ9dk5HNztLCBkHjjbkMJYVDnc47ns9X3ByZXAzjX7tFw+yDdXKvulD/He8k9qqzBOJkFF7glET8Z7q1IEECE5/HzYL1IH71wfaJB41fvjevPmBZ5Z0HJgp7MuMCjEM4EptaCNeJ6Brf74/U7/6MyzfObEBrPnQRtn5f3kqTszFQWgKXk+jmR8gUT54hzkE2V43LNxufPmBvwUPofjef9UvzvFqCqQPq1+JSZ7csvtOSyUGyfXlsXXJDPPvTzvlv67+t88XNLp9TW7Jp1Y8f0A0BEg8PGrCjYZEGk+DV6lgB3UEP1bjMHdNg93S6AFqnfv1M47eLil3TYQN0wqRM1aU3OICXIJeSypnOO5v1AiZWV8rO56JGAt8XZ1qNWoFZMU6KiKzronABxPFe1B8H+dpJITt3BnLilD6H2tuXS1E//CXeL8w+h9Lbl8phXrmF88eSo671EuqqtioW+7BKTVleUp0y/6bqpMy5OnlHb0lrQspVLn4u4DBF28edQsNHVvYNBs1lpSV+7T6GXvaUEXsRI6w4lSuzMiLwx3PCyP7oORnPZLfI/jqjGOjr6xkSzcErjpcdDO5A5wHoXG6FQzCWahseG1XovPXj97ef4JJ6CZgPu+yy879Xu2XYGq0c0Z+79h22HrJfPLWJbqIuxWQ6fm7r2/v147c5+jxrGnJZJZadFalLsTFIP7TuNDi+m/rKb+tmL1GDzugqOOZCXbN4MyptwtgJP+uPiesgMOTCraJyza1dlQT3wlGo7fqF041PTnADQkZ8uAUd24h3gD0v8ikiX3XJ2neej70SSyOO0lXoEHIJK11Gv/usfvYElED0DBsqIK+UFXP0QDxFlk7grePMS0OIFoluaCFn2O8bK9e1kTMsnDJAxLTpdD1bshsnTBuGN3+DpVUGTDc8eWAXZbLGuUdGMqwRbUIi44QVNIwL1s7/hTPQKlCCkgtK7E0uts8LETGVxjq5tRaOKN+Iym2pGJtwTPUXVXn6CKhWABKKyXUUyBj2+py9Mc6NAf6Cagk5ibpYzEyTiBbBHBFn1FgwZddmU3VFI6kUWHVC1fNivU1xaRwyzYc44eU3SalDXUxTCCHoHtA74oc56T1RQY9WRL+JHeikd7JuWE3hEAOBhnixHzvXmMm29+1+rBMwDhxAjCJxbiwVfaAOemDfC0NcVWxa04RZJRhQ4t/7aXVePtedFok4xZQPco5Lp9n1jsHb+3nDpsrRbvAS4ZKLP+zdz3FiCAzUu1OlAOgcPD7n4wIkrqhWnNAtUvb7Yz85GQqETlHp7RK5uWFsW4eu0uVY6X5Ulv1v0dMAF1OwBKVqWe5peFhnCZuqyrxJLUslZEbt2S6aoaI82EpVoQ+zkmC8URGfcpTmZ3PjXqZSsCffnh7f77rwITs9PufA/ybDYh7/xXdmphYC/G1mapH+HX/Hy0zuKebh+8JkeWZq8uDMFD5fgncn94R5SJZZKs3m4FH/uIXoc649Cb8US/M5BJ1dAthlZ3ocPntzbmFy8mB5atnJjsO/M/DdBqHege/TfT1dHR0jne2d7e+nrJGk1ZbqXxq06OlgcqAjnRxobxvu70gPwufBJHxODcFv8HFgqK+rI9Xftr/DGurr6RgdQQD41DU60rk/bQ2n+rtbTXpq3+nu5XAop+fncc3iajWfkOegxC3fOxePND75YOfC5Z3HH+JEN+t7OYz9ENq8egAvR7sqT53Lfhjvpzj7wdg41SVUVjInHPpf3txcP7t1dxVy4fiRUh+3yMUAJEOwDL06g0zQwfhKvFudY3qpTnTRTd+bj7/DU7lQkK/P8wpLghPzehGiAD6AOCYw9uqCBw+LfEV3WUm9deITlpd+bYWFd8fn5PoZjE6M9tRCTKqVNdpWZhmhPrauPJQyQkcPI8NbiciYWCnGVg82HJ3GRU8whH92iXZYtz+4iuuAVx7uXDjC2w+VEG0rrQNG1Ye57UP17Wbl/gqoA+VqwcHa1pHLlxK0dc+OFxii7ddfGw+vN+7jUtaiW6QtG773nD9x7WSX5WqfzgSP4qj9BHbs1eB8QZNCBuLpzbbEJhRxuzqrD58Un6p22gF7BLNQ5JkVJFNIiW2a/2t9CXNsVpgRKGDKdtnmEJgYDo7Adr45xWCh40Olt0DjZMti29yh4QGEAhP/cXuWA7utYlyf2+Rg8MG17Q8+aTw+t/noa6wPdz5MzHsuR6vnxJ7jljUaBsGp8H7BOu6jFZbF9X8C79d7m+unth4/Yryc7QdxPL/kyj13II70xBU37pFX+Cp5BaxSWOmNp417l7Z+P8lrugGwRQ9mzIZN8T23YEKB7gaOR7EtYXpCYBHE7dXvAFGBoqp3DoVxVIki2G2zoeKLHccSFL8FF1oo6NyRa2PbP91sfHeC1r3dQvjfOFmpVMTlqA+bceIZFJ2Fakk6hdMxYgm+uXFu++SPjJ2r+hhnqhUy2UuxPZt1Kgn0LDKOM+AJPPYrcjlOKY6jR0frJ37Y/g6Ha9YNMjb0dV7e8DSAmE1IA+zSQg4fOfwD+wB2BGywJ+e2L13avoyx4zIwRwmcnMuH4ms/msabOZpbCWurvK9H3XKtLMLzUMgr7OiNW+ivA/oeB04mQxu4dtHPExA+FoKB2Qlo2zuKIQECoHSBw3t+AV86iShiNQm0TQBDR+2J8w2C7CREocF4jxxr68tfQCXUz3/C++RMKcIlSA2yJGjDXDxDxCVzu1xlgzXAom64BxNGXrSac5SzoKkXFFrAG6AyPU+cbb5hMnRw9YpnOOsqAhuHjD726861szsXfqEwzY4HTQtVuSCGZIXINykNdDyQflISN2aSBCRZpF+URWpGMw0SqrO47ZCbSHgpdMLF6Aq359T+0fbxO/W1szsfn+ONzbxpPCTZi1gOkUFcVsZEWQmKZUVAjWPKCfNaocENZaRs8MZTtsFO4GKnLpd9dtERaRwvIwazegTAfpG4SEYTkEdHGKbk8q57DAbSlHy5MYXuUVWpLmxP7Ffm8SZHGmjQpl/ztC9RrIJKrfJ9sS5/VMmawQoe+VDWHmYk1t2LjOW5/uxuYGBBVJSkG7a4tjVwSjKIlTioSk2KVICXKalVP+djqtCwwAl2zn9Lq/kO0wJ0a3NEGOGsgHXpEQ0aZ6G2mnMXwWQkMFsenBS5Cy3iOg4jANy5eHzz0WkFG8IEuuTaRGewZSQA5iBjJeCBKyJJlZLccecytJBdS+25uFobuJEZRk6EJIxC+wWceMjYpYIcNU4JWlThe51jSH7tx6qKGubBnFXMVmob1JOI0aJZe36RNrmogwOj3bnysP7jN9zNaW6ToIlOZMKDECLwCj5CG4dxyyoc1Jz4Mi0cViLgwBAbP59qrHyr8GWqWBYmnrkMjoXCe9qZEmGsA14MR+xzD3klnJeZiiEG4Dik18DR19fz42h2SLn+cbpKpzbI7K5+wijY1hgbLoojE+k44S0me9qtdzXLx8FL0lf3sy8bX5/dWjtXf7xBxeUUdOWvnDeqAO6toHlhyPOzoWPmV3p+tiwiUfika8TVUvULR7Yu3mxcXeWrpULH9crlKjGUQpbdRmNYrVfJaO5lhJuQ0yw5wYpOeYypiBmigiY0eioTnXrouYHc5FgT9zH/JKYVkSmFycDJUBtkXjLtOMfWhJhYcF6S4K9vMQmO0V/FUtldQJFSRUcNJipJIzW9QRAVNTQoYYSmiaND1POIjTXxMIN/qY5FEw3uTjC7UExLsKw4i/Fl1BLmMdtHf5E8xuBAJq2IshbFVDRB0QxCW3jeUKItRzLnUUOu6l7SM92HPj7HfUhbU237ZPfhjsN+AoaZi9ojXBAgE8T2p4XpURZHqn7W+FLXS8OhdS85/LKvL2naiJKN6lbM3VR2UsdFVJupgDiEJHnB3xSbd0rPSO2qBjhZFMGycVbw9VlDfZgfmwPnC5RUfO2RuhJARhYaWUFFQ+N7GkAtIO7dNSi+lOTA3hfv01dKGEPaiO2mn4V+UPGBEKjIbuK5Ec5NPqpWtJ+veNZyB39x0OqYsAZGxF2B7RN4+NxPWu/3Wn09Vp/9Xq/VC/9mJqeHRw+mrf5+a6ndmuxP46n01AieofcH8YZB+G26Ozk0ODTYk7YmJka6BsN2K91udaWt4Ymxwc6D7Vaq3epIW6MDE4PJ5EDHUDI1NJGeaB+cGBwaSLcNJdE3eKxj2srYXZ09ykO4szttjbX3dqatEeUl3N2e77Va7f8HqvT+QqLKV5UfBFMbOcpNm2e/G0e50XU1flpv2YucJobeETgtDk8exK5XwXDo0hkF0Bsn79R//1ycMgzx5rn4CT1Ejxwv9HO4xUYBhMT9T3+c5hOGFDPp/JWdz9fFch3wULBNNt/5ZCZUp6n0I//VoOTJM51Qn4zn+hQ+EFIrHxRaCuNB0l77idP1jZNQdPb7kdcoO4E/S64FTtiMFMUPWxzlVDnEz3JSVuY5SMgT84tWs5lp/Cgn9xE6YBvtHC/vGSJ17CCnzCXePRA+Kj13v+gJf84nesC/WfKiUgMi3NiRSkLmYexd3T3KWWjPYDdBWagdLK1hWsE2Q8bxWoHp0GQKz9ebY6aoohGVmFwHQka9O7abkPHa1bttWkxdraaDQRRY6VK5BacyoF24eOWKbS2jckUnEYKr3bio3PpJXGRDF2mwVkhC0JKMnyjADAFNwVikEJEMAyGkUb0q0tDRRiZfbhakYJoYEUhLfv+rLbuLRPFWjbSobs4YSG2jIvkuD+muuETRVos2GcfAiYgTAYqCRBCaki/tEuOJDAdTTaTVRJhuf9E4c1baBmkP4rr7lTR3VGszOwz/O9CdBLq7J3R04+vrSkFX6A4xrSAjekyXXJVaFNlQTK+eomSmeO3D+DUNstjYalEaOSTkBnpzur/Wh/9Ot2u1l06/JFtsp3MSvHZ91cPjxFO0pQ6ZwYOx2Ja6fBf6zM5H5zcfrTCrie+qy9fIA3WSd9RBxqTJh/fsvqHOyYUD6yGOlgwlPLDnhVvpnp3BGLh0q/i7vHUsHhELlqfqbIyWqRk0f4+yZ8eOBkKGr5o1S1R8WSK0Pio3PNo/Otyfm+7vs+EvY/f3wj99Vu9M51hyoHd8ZN+A1dk9OPSPIWvPgBWmLDdtTSUHumaGrXzaWhqwDqasyfHO8TFratg6NGD5KctJW+muton2oa620TFraCLVDv/YaWtwaqxtAP6S9sx0bqA3Yw/0zUxLotw+lG4bhDfTFh+wg/8NpbtakuRl10OS59qCZz3I8V4VXUTB5ykoOu5N3LD67av6fYpjloNUmg6FrtAgAgzosqRD4onD56sNfLxB89mleY39+Hr9zD2FXaIdHwPTyTlioc4RT1RYlme3Izc2bt+7V7/2owo2UEY4cSeq7i8mkM+eYCwYCnT4PAgkk6qbUHXPEhNkp+zLgDyUvFS7iqf6sjISzuHzW49PNu6sshyOlylWKyyKv+y4lFhdzirAfBNLYRipxSkumV5ycxf6KzchBabExluOHofbPvuk/vVVdRzO88zgKtSAgUNOa/aChhTNRhI9u0AexLKGtn/9BLqDROLmIgTdUEUaaMrbVUAY7JRRtFsrAClnVkQKXwuMZqNYJOPkgAZTZwcElvD4s2eNIxCsRF4PTJRt1tbwIVPNaAEFZZEFlA6CeLhXHqQgvNLrgzL4pcsRCiSMSk7LHR6tpBnNRP2FGilSJ+JCFFUnzCk544JUvIJP/vWKJTkqrwFEsUiEkedDDAx5QoQxjFoUN9ChHMW/i7ArgxTKMKJJlQaVujOiN3W4pwCXsFFBcBqt4UztJl4X6uglyshQRHIZWJzkqVLENuoyoHcaKydEGYWOePW3S/LtvznmXtP4+BPD4u/3xb/Zi1oQQtduEcETcnqTwhkDcPyUEv4ETYKFi51RsjlgJ2QZCZDw/r5dDyjZHKsThTwAr734DlCMlsd3lwNre1veaSGe4uLle2/zrcJ0Kw+dUgjsou15kgjqnyQP1AgyIIJ4p/VS6NjIHvjbO5ybXcrNLg8Ppq2huUnrUCptuZPW0GJ7utRvVZPd6QVnejQc6mkbfK/H2t9jpQ6OjwQpv8tKj+KqaG7SGhy1xtpxYTQ7iaurmUkMIjo+ihE92ycwmOfYqNXT1j/f2e71A5ab6mzv8wCwr6ujNzO8lJubHu1ZygzPToyPdI/5ueHO9n91W11Tk9OdzmjnTPtMx+SM22Z1TM2MtI+PtCNopc16d8BqG30HKGaf1TY2Mb53j5/LLIH8IPsAlKKrY6AK+P/otDrbg4Pt1e7eSSvdNmrleq23Oy34Zb6/q8Pt6kgPFIbanI72arK/r8Nun57pgIw7Oyud1sT4UM/YaCsPRDdXgi5Pt0DgBiXw+EVH3q6NMeuQW96kjRl0hjtye+vIGm8rhW41z287gSuDaOXUQx0gir/7fwpRrmqqJ4ISgMEDxeiHaPlcp+gGdPLH9coUkWSd6ZM8LMZ3Czc+Pdc4fH179ZPtpxjKJ+faeMgdJF7yypQs9F3PXcRL8fCiXhNylxyhpiruvNhuoV12HcXg7o+cH61VzCdUbi3zEUDGrco8YkRkrqsheg7RXtWn3219dkZdrExviRXdh5HhF4N6OUwcQ+xz8uIyc2WkyTjrpMo8eX2bdl2NhWybP6tIkfzVf0lSEYJLpPXkyV1o8WxCXpZIXjC+vCQCnSldEff66dH6/TP1R492vv6Gz8I5eAUDnvfgIE0Moy49lE/EzRt3FkGjkzPW4482H1/k2+8Yw0guD0aAeS3ZQTXvhCK9uGz12RFyHrpZv3uCEJxZckXE1Px2M8CuiSsuXgQTTW6rlRo7H1JUyQU2LXyFBve6aFTGxpmfoPuZURmdahbTNi+F2/Q8shTO2ZiRV8WVJHRhWHPoVezpp+7FQq/qDM3gqyK7WLBJzw5l4FgjI7M8lIMuzIIdtggxiTCRAJP4ABeI8GpHjjjyF8oh8jJLQcBmGfBsaT6oqg5LJ3qgu8e6K+iDrZ9uqO4qEoneKjGWRF+V3+lolgIUl7MIJLqWRbwnjmTJZKEMhVedg3GFzJDPAfH8MpMgn7pSbYMvGr1Vf3S38eMH9XvoqVf2nALdpzsfcqw/VnyBiw4MBmgEUMFIABnmjxN7r00cgFiy/5ownFSMJxsDGnzrVTNFGzUt3hhCLIlugCEn6nWOH82npp583zh5DQfVmdvs12Fz0pKN12NmmZfIh6ADJbFpyiqehQkeQRYyG6hyqRQMUKbIzpl+OaAQNFJ6umaTL3Gh07hcAFT8fMvmzhcPGr8ch0LUz/1GMw+6hZlNNx4xE2VB00RZhL5B0qK5h77SQUaG5K/0BWdDIWWcSiHvzsoMYtiyevgKRlsVg4wFyo5NCeYCjAbHAaHrIbWcdm2tmUtGMWnuRHHQ2P7U711h+6PRokDi5keMoueUefjx8T8YxYfEscOb5MO78+Wt+ukfYRRuP/0SC1aFkuVLeEMsj0UACfIu3nYtry6WqMqyaeCoqhDQUlVoaGnbFLTUFwK56OhtB/I5N7JAV+nnFwt8ieDa5vopzmVzY6V+7UPiXpQFn3oX8DKWpZA7IrOSU6eVo54TG+Gnc8AtmEi4tauHZBiZ1YJadrv2GV7NcXlDhK6lFFlBLRz9tRpF5OiaeQo2RCr82ObGKTO9uIVJfZeKiMKZ5IGASZ6FPkTVeXlftNC3KNhHPzeOHmOFiyY6i/oVkzHpcdV3FVnXhP4rwHrgS+Rd4m1KUv0nKHWUTu/CbA0OrYizSZlbkdi/SzkNzvhixqjYosnoaM8FnfYL5Bv+EahTvifDIHJ/g4NFmFGEeSmyZVIeg+oYVCTKPxTfEBxDEQvT+BuWXxl9ZfG1sdd28IVWUJvjV09AJjNuxF7VhEXMV9R6/EnTYZiNiHp/iXI3FHtE/+6qxZSeNVWsoQBfov606otoqZfoKFM/xTXILj1AKYuIomgRXFN299EEqBEF2xVfT6KRUHp2mDYUIUPIr99cVOLRgWdzWQJzWWmpAjOe0cR/JKRQXebS0nu7LS1RsvDAAVWUA+/te6FT3ZydYY+694RLHD4wNgTfpcUhfEg7gm+xLx1+py3BvTpVy6WjrmGrr3vYmnmv1+qDz3bvVJs10WZNjfb1TvNtLx0TeLvMWDVlzeNJTmtgKGWlU7wdmE7h1mBfV2owhbuB+bSVSuHOYKozmbIW5ZbgQAq3B/tT1nhqoCPdl7KqA1ayF1DG21M9KSscsLpTVjBgpfvTXYAzYA2M2jNLQ1aHEW9ztP0fSWt+wBpufz9pzQ1YL4m7SR6kXpZOTGlmADQRXd6OsAsskIGdw4e3V++TK7JLbzMJCKF2yDFN3QRHX6VZ40DNFIT4y9Obj0SnplcEEZAA6nYGmLDZ4jKMnDD9jcc/iT0/P2BsO0ftpizqn81WphczZ/5JzZtxsixO0OnrSVYeA5CaYZYO+bnY9JIADXdCwkRn6oMxVBEswsRtHH1o4Prk5lYp2YcSGhqQ3OpB4WGx6NoZ2/QRw9Act/mOVTfmKYYhOp6sYEUYzmKBc8g3HLzE0OFtORI8lLf3CaENSJJYgUmJI1h6b06IaroSGYIqbyIhofQmYvG0I4ghH4unL60W8gkklo1gpGBRlCaXMJKvWbKIP5iqP+VcxAIqDxNDPlwS4Rrk7YhIDZptruCkoBG0qEdYayFN4YRPGMkl1VykxtQenhJIb+EJeVRzhg6KU1DqUvqF/f22tF9DSxKG2tBDmVhb0AW8K2amfeK6XeX6VbtBAz0yHCPjMNIgOvkuG3dC77xU6xiKztRXr5KONZWhUgzRldhaZqku/kyCkkrw98bWa+z+uzat7t0tBMZY0fzy9v1f+f0WXecl2D690rTHhjl1tnC5grffFCMA/qZiTlb0q2jVmGMV/QTidZIZ6TEp0bu77rZhqgMHsFC06ebnD7z7si23BcdTO25qv4wfEldiX6pMNYycRsDvTb5U+NB0psLvpjeVAEYUCdKSSfXPTVqltJUtpq19Sas/V+x72y72vZXpLU1ac4PWdF9n78xI/0IKN9Vy41ngU8mxocH+icoI+lYNJScGc8PBCNKoscFyyupUxAlIFJ48GOjtGEoNTYz1dbYPDs5BioE2F9MNTFqTQMySFt6aV0wOTPeYd8wPpvpGXnbHPE1fufJ462s1k3Cfr9CK66mLDfK95EsT8B1j50W1gp4F86OXgig/JaPZeGJbogqm3aULHDvjKp8aO/3x5qOTfKtv6AZK+dhqrab2nXhgC19EDObEjoj1ny6x22oQYWhqXYSjedjyCAOIvaxzbvxyk3Om9EzUqCsZJX/1nGVaQdLoS4SjiTt74yztpGJpfE5BczTG0xyNu32Uor0KaJygSRxN0LR7PNtd6aQrnbETz1cyBqdix93NR7+D+WycPGkyNT5dohyfxEAVwc9wUUbGFDc6gcnWqDMoQBY+gvZir/5dBRchu5sFl3afBY979dbWmktgGhxRAMPknFTnP7QeZ5Td3Pt9aXx2F573c5qEV/yOhVdXwhoyi69RcWPG7aQZIdcwbaZaLbXw1m8lb7OcguoJEaW3stkzqFo1gRdCGvT9pOoNmuqxet/lCEDLmmzdBaLtL/1e4tL9+TYniJanAVoL16qJVaMo+YjjGcLR52qs5symNdtVJ17a9eyw0PQv0/MRHa+thF/0g7Ie3sJVAQZ140vFE22tpSW7fIlhcNgsiBeVKnxREiqw1HWRJLqeVB0Z75OOeQ2D/bWMPdX9XlJSMSiMkfV3O+5f71ut/L0y1dEWVzbDy28muFiEPRq7sJl+F8WMXdZMP5XHm6noO7tSUUxz4EC5KonoOy8goqDucM0c4xVhCLr9FOMOY9bgvSfibnkMdU2x6CjqHB6w9mwnBzM5vErLRyK5j8LR5VwMmhnSCt4+/UBA79vH13A71VkMPQTkjVz6Kf6c/J5wSo6LOe3R6fEd4xX8sYm29nTtn9wXeHbXu5Ojs/29HfARv76Vm57Ykxkf3pud8fOuk52Bn9Lwz2Jvx2AV/hY64Fc/X5h7a59nYzr4byA7s5zvKPZPT/eXZt7aF9iYzs+HhezMUIfVC5/m4A2/t6P7/W5r3s3O7C1NT8y7zkzHnso4vO+VOqaL/TMdpYHuNiCw7+7fW8pNw2+Zvs5ke9tIpsfq7rCAy462pXu6UvBS12Jbl/Wvdgs/w3/JsfbU5Kg1mOpumy6WOsaS7Z2FQcvND1rvtFvD6a7ugbYev9tqG073wG99M6Xp/s6x5NQgJG8ZkrtaAUrnlzhWMl95gZdQiDMB6JlDauv4+e27q3iHzSe/b51apamnh6Eb3FKJbxhjoJI8M2/zdzv0y3SKCsMH1TYKTcBbpx5tnTprAi/6s824uLnB0bz8Ki50UyiU7yq8LILjBuPnHIHO5NauiqWRrctX6tdu1a/9wHF+7VKC43JXS06eoo9WYngVP6Br4cAmUcSpEodyUdh0gdutrYu/orQEjivkuFeP6AY0jI+C2JISo4fW6jlCgUvn4bki1sizp8A3wyH2Vx/Wr39cv/6EwgoASCKsEgBvWfBArP3oluSOBz+pkIerCG9XoPBiLkXJgQxoXeebzY1TeCnF4R8AnsPDzraCrthikcMNaqsV1/Mx0hldQkGbbVW874Ud72obucQft/NE/+9vr36ydepOfe0aBZcAZr3kOSWekbsYzBZxfFCBYrdFg/sZX0TnWMXeQSHQT/0GWPBh1vMPJZphMsLYU1AcF7c2cX/F5R0pEUyeOxiftLjJFuLbo1sr9zY3rm1d+11E2MCQCAt49beXsRFHhE6JQkZzsv0w5H0ivFyFbniak/ls4PVqbI42Nzagsne+PAb54f77Zx8SWwhxk71Vbjb/Jvc8FwKHtxqlvxEHGGxyOPrkyNaVy8qLIOeIdNpBTj7QDnLiSdEp+gWzGDILJTyD0ygvJiR0BBUjIPsFVUFrGDQ4HmGPIuaXnp8t6hB7H15pfHpGhtiDcVNxRbRhqA36qAPtQV5Z16MgZeyotlZJkH4yYXe+/WL73tcKNuuWyZ+rBS6hiGgeFbuI4z10eLhfxcXQZaqJDeYVdO0JBVZqHD5Sv/EUR/xHVxrHz3KEJbyWJKQT9AhVZJ+Kas4uliRsNCM0kmjs2beQbqnhYdQyy81HGziiolkGvrtgFzAOdcs8ob/qLMRFfhQ/qFINlHJ4fr6aj2XJ6qHxzWWVHc0AqniFWpkXIBjIJyBRLHwQ6USkLaOw2JFAVUpM7EgsusY0+pBPe/FYlDCkO1Gr4kbqDIc6E5v5MtrVD9caa9dRW4q9S6yhMka9wn3HUpWzkIB2OZZFpYS31aR4wzdvoq9Cx71QVfd4f3hFZLB+Zuu3DeE0SB4EAOM5jvDtN4AdRC7qq+GcBZgywk/kapSXt83ehMq6JS7HozvDztU/Ota4+lvj8A0ayjodHQOLIEl3I/OZ1BVmBjFvWsrC0BY6sVIYBqDUGYFfhAHH/mgyODs7u6DfLkdlbxw9Vn96lCPBFDF8VR4vKKDja5S65FQz8tJ3fkIxQ0vibju8VONBEe/6XOIq33n8RX39iUpuRCTnBx6Fv3UrJXntFEVQXGuioyqc2UF0ZkDTuCSC0Ny/2Lh8b/vEhrAEIkFCslrJcFtg6jJUuSNjhWAn5bCyZa4R6I+Qx/aHv4sLggA7Z2fUDXrikSfC5Wi+zD9DYctSS+ANfXRFyEVaq+PNR7pqeOvxT43DX2+uQ+d/3Dj6cOvsR7xqOA8zA1EUAo0QcqEnKIdo1kjVCyWySyLqknTJvlncRYL63V9w7/Pb72NCBFAGJ8jtJgPmVPtR+qnw46A1AV2jabPY/JAEFNTV1sp9SUBlJoHOIzBJqHhSdPI2TINoIw4vCkOXmNmmPBoPP218tm7mUcjaMIkv263zwZj3s6XIeHRxy8KfEx7o1dpDigeIc0YgT9TBj59pPHqEgQB/+a5x+QTdlGDjXduzegwSiFOdE0sCNoaMhCkdcjFXVRLHS4uCgyncunMuAj7vzyWWSnF4UJWSoiIdu0Xm0cvwggUa2hKGqRPX3IuYYGBqdz6/u/Px6c1H6DEm3mcayRcG4L8ayADH2y7CUDA09JQTLDWaASgS5qkqD5jTYZS5eBYEZ8fUIJ4/iavBq4daqMFrnyk1SNPfStVv1oGApnmT8TCqx9HZMabHr33WrMcXnbgexyeq3xSJ2dwi4sSwBekLvvX7N/W7D9kXfAnqTMJQkhhC6/mLgozMXghWzF6WiLQqFDW9AOl9monXVtnXLs+xhcQRZrPcv23Uv/5KlVvMxMl1C8oaRqf1jMZ7nAydKIo4ujhk8NC4HCqHb2w++oH7scYM6f5nhSRWBHa5JAPnjuKApZ5xyolmfJIZmQ7S0RRz6qdmfLHZnjkVo8Gj53RyKtc004rNg0hblMV8qn70Mc+klsScx5z/RCcklK7VDCQ292gx6YjOCITrG90kSuvCn14CtmDMKkzqH+X8ikQxH1dMvBUHN1kxhf6NM984x47xXIN+RpOrpCqdShWhfs2MD7saXhtZNOkedLnGg1WD6xkkr4l8RWmXoloU/Fq/EkmhWIS4ZlFwnyjxUf/qW3ybiI3iM1EmE2MaUVNPoQFFmNdmo759+FjMnLcy4hHjKmcXylJL49nKZsp+J0yaWE+V5ktarSaDZRgTShJKm7H9wVE2FTEb0aS5o2pbKWvdTPRKJIWhXE3drNQy62StOyNKTYTqlCqyWTmaSqx5oZguLvB4ZWCIAwKX3aZrWGgSCd0uieoYs4o4MdS/ObX142ORcyQyolNeGkssVVQG5rLx/t2WjTFV5cABnax8YP/LPBicICscGN5SDgz0zJMLvqFLD8iB4d29+oHhwUAXqNNDclDgqIn0HY+rS+9PekAuDXv2GllheoWKcjStDQdJ69CEtTSOh4MPJq3FcTwZ7HRbkz3WwQ48NNwzYU30WOUOPDfcDZ+Heqfneq0BjCGzOGnNTVqTlSQe4+2ZCsmRFAD3jaNTaV/aqqas3DA6lPZ2dA1mhoUvaWXE6u/r6Wzrt2aGhTPp9LDF3qQdU8PCJaI8YnW2p8Y620sj1uAIJOjtaPNGrGRfD8g7O27le6xsj1XosWamuzv6+yaTSXi/q62zvbttMDXSNtSWHbF6O7vpSetIM8iIPQd35kVnKiYwpjDOOfg4Jk0ByLyIGfEXK9v3ftp6/NH2ve/r9z8SM+KKBGo6tyeemyf3xKMW8QRb5R4Nzmdmb4boi0gQidNn5GZGGHQWYJLLxxI5Y5wOmIcSv1ipnzmnQw1yghbBBul5NNggPWpdvNrV2eYSQUaRcIMqr1jAQYVrhqXEYPjsciuOVbJLR5Xv9jp8bOfw1frxSxyymkeeCEqGn42QlIjj/wkYHZNSjEvtHINQtjxWbOIoENo5lcLw1qlUFDGYVwExvWyEbuGmQATldGLCRPs0I5q9mYqEUc65lQnUaGKqK+15wm6AGtr0EH68AdDKQ1hARx2EHUbT/icIry56vyMGoOnFu/l0devSo4ijCQMrP16hUZvwIpVgXBhPNaAAW6EZXsGIJ7u1nUkYMpJVvcHiRQTTvoaGZBGgJsl4eGjJ5DhvhmtyJaEC6zCRjpdoRlfuwXhltshDeZDkRD7KrdGQOpbBLsgxzFZ4UV8S3htCcSPdiYXkbiR9RwhLWkSzLlu0cbR9Kc6PlKWgjKr0G1HtQVrGF4xpiS4OfXaJ18fx5kChua7+url+vHF4pf7759s3TsQbCC+Jqth8XSg9g6QHX9LukTZv0eCMs1HZLRQPK3sOYLNMt9KQg+jl+vFfTCNhGIaI0jaNgVLNSiMbWtjUmq+uM7W+jGq5V9Bxpn7TSiiue5TCURUnFcyfTFNSaf56W/HgfK1D5k+W4jUUgiGaozi6QYuoPfjym9QPGD5+ESL9LJo25lBMP+GxTfjUYZLxt3d3J4Y0HJORPr39MiYeBHZJUPF3FRXnh56Oy8iXYcdim/vZVpHN8aKtaGBzfBLzKcYMVIhGvoe0lVfxQGd/Fv5yfUCk99p74P99md5/9VvTc21W7z+AJbttVteEtZybtOa7kE3/q8tamrKWhgZT3e93WROHOvqthZF3R6yu8QELWHV1yqpWxt4B/jw6YP2jzwqnrLAjPTCRHOjsmHi/zWpPvdNnTbQPpjvbBuAv2dGWy87bkC0Q+Olsv5XpsHrbrLa2QWum1xqHDNo62tu628fSyYGRjkH0zki1dXTPw3Sgpa+xnfVn/VnpZ4wb8eIA5unv68duU4yvMMRtElr9xZVYScVkyhenE+eeOaU0ywvQE7g9RRRGJNLrdHHC0/v1M1+KNRnxjtIoql9onaTecNHtDYk49uCtL580Pj8ilRK9YzIv2ZWk+8BDXGGWstwhWfJGRMjNjVN4VlJGhFwKfBmHsQJqWcWDNJAMHJVepRT+zpzWUOt+VgUfIb/gfCTS/L0T9XPaOdjDi75aUHw/GyP4fjbqeCyQI8yPsRXzk9gG75M4puOxnzUPhinkaPRwQjbZH4EbAb9xHBpxuX2DTl6tmg7GW3c/1zglvHAvhmKwPsIxjw8p6XRYaZZMOpGSWGZAYD9rhJU20FgshkGRxDSo6mfjyVt4DfsRrhepMh1dWlaZYngkmxFk2M9GI4LLm5XDSAgZfW84SxcFiDsH+xwGEv0oCUIJR1dPIhDLRYtXiRBF0po1iiP9gZUnMMnCocBZkoKhlCWfy+NGT1Fc1G1kbuYMoomMpQaXl338ySYSqaWTr+jf1AMWZODkktFpOFrek6tioFCtIm2klvG8/xRxlEki5TfsZ+WYU96XUBNmkxjJdj35RTr2hRpWadeYVtxFryqNGNGGUQX2IvWlVJdRdSorEeDs/vbdVVlKpT9e/X0xov/O6Pt7w0PnzPfHsA8tBei6dHf7p+9lKuIDhrBhJDsx9YCsduuBf7LWOUmrON1+R8so3T6GZgRRanf6+UD9OrrsgubvbwrSja9yQ2CI7qfw4UFziG5fMD8oSQeH6IYRELnz+q19LwjR7QsSiBUhgjk6lQNvvYAN2iWwOOgZRFxwP19NLR558hZr8YTXZONsbXzU4kPzzrC1dxyDJfp0OU1fz+jb8Ld/anJkXzILj96Cd4CyTQ/geii8k520+joxCT9PjeCqa3IEgzEujuOS63i6P20VgW91LXpdVjo5WIW/hUyb1TlszYXtqco/2qy9e9NW8iD8L3in3Up2tvuLSWugfChp7esF6uf1W8XJ+X6rvzTXb/XNv99vufCv916/leytuJ3tvXMHS235qcmeQn9nu9PX0z07cagrC3+5yalOe2qyM9PX0zENfzN2pn0yY7dP7elqG19abJsYHejuGIO/wb6efbOQ+F+T1vCE1TZldU1Zc8l/dVrv9UANLFSBFR7qs/41Zf0jHXij1sGx0e6O4c72Yo83nwFp4IfiqDU9ao0MDfaNjQ507JnIZfvbMzZ87u7vnJosFSbGWy7WLlJwevJffwiDbiVncpmt7242TlxQXCZXahVFbc6NXoyCiPGFSokdXaZkeHOZUuYQWaScc2OXufgVvyjWJ9mB8UFOzq4vb9RP3uQJNgwIdG8QV+ZgEh1ZEr74r5ZcLkliEslasBvjvWa2inaJQHQpkAhN9OVNhDpzX0QEx6GJI0GOAUosyah6oLEUhJFYHIFTb6sYf4ETMiNVB+FmeX+eIrsLunLt9ObTu5u/fcUNuejOSmsY2B7GDDYvPuLLJQiUXC+MYHgCmbrIH+yqRcjQRXYuH6atXcR2MtiIYc6h6ydVFrH1ciX4hAjGo7FF9zv7EWOz1IFrl1tFJAzocUR+fvQXpBd5xAvAeBH5XXkhIctPKwC8fGCUACfmjzf0APLcaqapAArJLEJtTT7FUjgL7CmnMxEjSeXBo4huwsY8oACVkNxWNLwpvu/OJmSwUFwGxrDM6JWeFz14a+Pp1sWfG1fXRQ/Gu1ltvmiuSPE7qwrGj6KoxDKZmFeKhCqsH0ah4wHkLvOGe2gKUF87u/X4oRag7Mvzo3QZtw70QTgmikosk8nDo5xQzBU8Xwb15MuI1bWAD8hJ5P5P20d/2bpIV19WvXyiUHEPqQ3wPEY5k+TDE/kbMApAppYTSZlYTX9cOZ+nO81ZBjD71TlZC4++B5j66V9lLdiVhKAyrlEJFRFGV6OotDKVqARO50kfMLzsUjXCs9t8GOFs49t7tI+cy2GQPL6Gz+N3VbXz1xclFDmqpJ5ciwgyIs8qXoWJTHGZr7bcOf+Yb4IVQV38AHDsirGMgUlfklDGk+OksqYDdiKriluc8Twg1/DOxXt4RpGq95AdiuIG6HGrCsuJOSknES/LIvLrnnSR9kMwfWKz6tmRnLgV/NkFDLHBzXr8cP3ED5sblzhfsMohqCn08SV3GrxQew7PNGkJBGYEUQFFIDhiokIQJywX0MlJtLQ6zKwqof7Jlzvnr6t6WHLmebAv2J6nw/MyhlolLT07UqUrIy/erR97KJKJwc4JZTcriRuBDSGoFOSH+rDqcUE2H329/c0G35UJDXnICbKh2liEti0hvdZX3sVh/wSo3mY0YOVuY1idRXUv+QWDQePNi7pixJ1vPxd9RonpCzClGyWSbwApAJVU9FeZWIoBFlPIQIqNYh8pGfAS7/MnlAyeK5bWfKh3terHEL6BoFLKNCJvSiUzBqYf2EWVNdghXNLWXQUALl5TXSVwikW7oMpPSWX+Ask3gBSATqrLT2/rlSH0NMILn/WoxVBU5nJf/div9V+vq+U+z/eVdkSHZEhdMHSkBozAueI6asLavnddAimFqaF2C6qIlFeTXEVsNZ+VNFbTz1cin5J4RnjiC1miwRCjLMvgP4r2MBE0CJr0pUCys0sC5keaE0W5kNIN1dqDPG+fNL75UBIfk4xI9iCGhrhWFoYG3yyLxEGTBm3pX2TnlY1XdvnFVtm0yMqMvtCISgNqmMAXGEDD+BkX3Qbkgoa6k+LBasOljZY2Os0mR5kb0y681Cpoi6A1uWEJlAVgJS4VeAs1++pKtknBRnTiizSioQ21HnuBFpMazFQ6L1Q5hrqJqQZTMSidIBRCVBk0r+4Y9593JJxEqFC74ys+GD4Th4lc6pnD/HrMhR6+En3z0YqQwFzfgakDjqb2xH8kQpArsqizb7dFHZEoc+AApqkc2PfiwIlhVTjBye06XEqOb9bBM3OnTqV5S32PXEccVltu0o1mpifHRvH+YXaRm53EOzMWB62plOXQnRmHBq3JlDWcHZ3OjU/29mYmhTdcbthqGxaBFTu7k0McU7Eygq5wI329gxxRMRhBP7i+3s7FARFPsTyCbnADXRPJoeRAV29n/9hEZ3s4YKW7hgaG0l1JeHdwamykd2xkuk+GUBxKJwdSI+0vD55IN/CUi4b324Ml2qQyp7UXb+5c+lhNCpd8DxM0TWsdemyurHAVxz3AHuCFfoUwvrZy8ebmk6cRd7aw2rS0wnlE5+XYcNKHTWJHXJsYWrs2MW7sKmUXBlj1/2fpRSam+PCgtmEe2QB88saOntgA/MblE5FrIEIVV5+cZEl6dQ2Eo5/RAF6UHuaigdfYHG2c2bp5CrDrd7/huMAsHzEJjeC9zooOmyrZ2EVk4MgWIpZceY4xoLF9yMn15iGOe711aMgZ2TxkOaMxiqp61w9BvSbAlmAxpDiMsXMI36JeRehPRIsIEpguXlo/vvn4MKHKThTzInJrqwil3IgkblRCs1dGoDRE0y4iPtN7iAwW2UBEuEiEoare3NB1xt+aK8zsItq/JYYR3T0kmGhDmg2owgj9v97etLmt42gb/iuofEj8HL+paHXifMNKAMRCggS4VD2lOgAOSZAADoSFEvnUXWVZiS0rtuzE8ip5UeJNtijJVuJosaQPTMp/RCCpf/FOd8/ScwAQ1OK7yrCIg9PXzJkz090z03N1T6p3ta8KoMF3Zr8vigGD+1aUaVD7hc/rRbnP+ppQRrEFweW43RrstVjvBDf/TGtoUS6mZSyBkdndAu9T15kAjGbWg3rs7aQKbV2Fp1m6ek3r8SsXaUFL6iWmkw5eTufA9zbVvU89pJ65+x+0qs9SUyXrjy0F7hiyJ9gpDtkR7PReoPcmoAKsPfibhA7s+5FUDRG1T3h49EZfh7h6xD+HxxBpw+FoHr61imdHAg7hKq2iaI8QvlsuoLgw1Aecnkkf3yzCcYjZiHNsLtUNO26xE3ZS5fm55EIxWXIWk8IRPFwEX9AXnl/COST8PuEAZirTzlQumgZCbeH2laedZDznTkO0FuXZXZyG0w+52MI0RGwJB1C4fnAUopTLxKMlIVycdrJTwgGcnXZyuZlpoIYsiP8LL7DQiM0m3dhsSmfbnZyNZMXthUhmerwfuFkTl3ou7ct4OncAMBBYZII7n5zduXDOZCoCuRUQNKbeDSmniiCtrQ51kW0T8JK2r1Yh6d8K2zCgEiHA9sK/9bZB1RTM9g40urV3sP0PMatsIIcGJRyAg19bGKB65s29B5+q4IXmcg1TRUnK+V4TvjDiRwlyAAiT4IJApCpu+tUmEBA3aKqMp+U35Km//k9nH5/5gE79ETML3dvt+WoxX11qyum0umCwNI4NwoVNZt7OgH9b+8+ZtRBwFNnebf+nV3a/umd5t+suBJQHNz5h2s0aHsKLhbvernEfT5dhnxHAIoynp/A5hzixkXMOcUPzLe7WwOyMwN3XCNjy9RDbsH2TrmD1Fa96XdNeDoIGEIfAWeThjN4XY7Ng42n7bq3O6KZv/2X3vY8M7SACMmJiU0F4ZwPvir8j/nZshCG04Tj2oE7WQ2q/Qj+n8S4Q19AcD7QcXF0Pthp/wTzpWBAqSBiuq6ebjDeXcv4ARylz1kqDvWKgR5APSPVY0fbAMIU/24tzn/G1oTzjCFes34Gq6BMcWJXAmyL674G3pHfeTV34GGTvxwDsk/gXFa6txbXS5gaC62dbpY5XqEyZPrXm02qPPbl+avXIStMc9Oamvvnpx+bzGkHWwIHAMmi2vetwWr+rB8kzdchn60XDvElR26Gk5F71BezmopdncNkRnqcQJCeHu+QgvH0BnjRIUQ43CKdEVCNDYWXdrpfh3uahfZjKPeIoh2eg8DLRiicOjTli4K/Dlh9G+P/+uDwAgNfogMFxfSbAV+cQjvFLeNMxYoqqhfCGw/orOquH5P2QhKctMQ4fsa7VFTWkKly5vLIYtegJoOykMEoPJY50k7MvTSTCs+XSzLGJaed4Z86ZWTpUOLJ06GhhZWm6EXMOrywVwhunl3LO1ObxguPlnPxmJeqciuXLUef0aaRLfynn9E7NOY28sy7+jJcgfm49C6ujhaxzMlaCtMNVXE4VPxwpQqCc8KLFb8KRTscnffFpJcLpRjgtPOxmOp5aE596uZSsic/q4aWJ5WpxZeLwSsIrdnLOkvhnTYAkwtX4aq3ktpPlWCI8v5CLRRcXI3P1hBOPzIv/l8Onk06xGj6VdErp+EuNGeEqh4+JJzsyI/6IZKJ58ZmK9QrIvT6ZilSLzlQ+Ol90otlUpNlYLjqNhPh7MgJbZtOJ8PL0RNibm01XTi3k3Kl8JpKdTAnHuziXdIY43jD79WotnbC1ihwScLCf7N3lmzuv3th55TKlIRI3SmdQiqmtKQmD1A5M3JY1YsohRYZe6J2meLlQiCwnVIG9Gx/vfXRRKmS8W9YBo3x1h7cAdYwNcCfhCuab1/tfvsFALHm17U/n/XvdWrvW6niyVsvycCXoGFwbpT2mnVe+3j3zL1gW/fO/5SqBkmSNxOF4Y7HrdhEaOYA5CKcXRv3tr5te2WUhbXeXQph0jIW07X719u6Xn+iQto5wMMvsfG2t4lUFiLU4qnAhJQW1mAYezO1K+IHcrlQKzI5kZldVjOWmd2HXV+VivtrGd6Y4HPuX/4EWtaZiTehms0str+8rqPemXR124uOXg5VJ96qJGH7xD1Yk3WwdzAYtq85lL1PmerZD/9fzu1/+W+/Qt70Nt93i54T84CkhXx3PJiyNYaSt80G+6TXibxmKh3XYsvIbC4TdL80sG4GG8AoEOAUGJnQaOrBdgeh8QqcKCNAGBLZanr3Km4FUzM+9zpuBuMftfwjDKSMyINyhoQIGL13fvXDp0U9w/KOBtlb6sGR2tag/XlK94Ctkosk/rZXdNpX78ztlMflAvXLj4s5fQAfWyvArOad4o+pT9M3fT0p2bLpTpR9tV00EEAb6Y4bM2+d238Bsih2vJruxCwy3KkAKpfz9hVTIWK/y5IV5Xb/a9ipm7D5BiUZWTaWX/WW3iWFukoWrK1P/InUpksyJvzDC7vNXd977qP/Ft7vn7/QvU0wkSm+gXiBaRoNX18nf9KVRJQTAg8g2rArS6J3seA2q9va1juRShtCAk7rCN+7uXv5s5/afVW1PCpXPqgoYm4BhqqphB1E5oIVmQ8n4A2RhxBNaENIMzwtUhx1Vtcevv9m/+5HAk1Wj+3XVpDzkivEsQFKKhIVbjYBhAXBpeqZVr71cG/p+2VvFaqxU2hDmZVpITBLrIGsaSILZWBrGwrAA1Mq6Xi6kzZ+fPyYl9Gn/y1tkWKtVeXgV6K2rxiSS6DhBWSyJyp0zEDRFkhQyilI5eK8sBe/1h96qclDXqszwqamBsnw1ihpB3qu/YSJlDCMW7Xv9g92v3yLzZ2YU0oCZOYcFa0NqHD6rsORHxKU9mQ/7LP7mc/QCCUp6asTYuwGeAFIY3//ro4efKDeMuV/GkaFSv0HiMBkjdvkf9C436v6K8pqeRMA3AtJFYUZVG1LtnzDfRNvkEQLy9vaT3LopV2zAmI41pcqMMmO4jynUZlDFlqmoQT0mzv1ILUOWRdoxSesozcu+tojbIctCPIV9YLbB0uAH1N9MdzM9u7+W1RqWacRx+tDoQqPNxugypce0YjIzSZmZ5PYnlJmEbtb3PqUCGVxH2r6aCOG6Pd5QGCSI+/nCBvDC4UoSlgQFLfLlpEf3bj56CEcUZdF8JUnMJt1E6NchWZkCX0B6+fCIBSQQWjpxQj3ACXHj6IUjtwN+UbXp9nSyDwhB4xd1aJu4OBjbJi5SNNtx/d0KduNIR801O+LNbQ0PeZtOV8Snmj4y7aTcw9NOJ+WkynPF1ML8YvJ3RWcqG1tYLKbWC04xNZujsLZOFjY3S5NOaW3WkaFtJ7OwvZnJOrFWFpjeKLzNz8IGZzKejcWjjaxTmgaUUiyylnVmp53wataZmXYw/11BCE/PVCtzxbKbiEUqRUdtdCYrWQe2OiPlrJMcv9kJYbTrnjlPtEpUvIyX4d6Pj+7+RU8D6famnIp6tYZQ43Do1GVzUrjDt/A0jkYwx2oYhCaUgtTVmLxcWmmZ34eCrXcvfiYjrStNry20mLitqTYq8YKZmVpQBwEyu5UKSWXoczvYc3QezB/wBEX/wr29h5hBA/ud9gWrst9pX1DJjxHnsirvp2ydmrtuPQGtqFDUmX6aRz993L/5GnIMtFpiLqhnnR3iKwJkN+SuB7C9qt+ywWHtqxn6z6U1Db139n7/7RsGuulWNKRX9XotlXJYYsK2IY20kzY07IsQz7aOJ+JhZFBW/5WPdj74kSKLHt271r9+1pQL+4sQXdT0MLpIK4ztK9KgNaipVdZj0dKoTLusFNHoj1/5WG9c4v0mWg3VikmkR2gUCaWfh8GOeB6aq1NJgeehSTvi8px67KkwjGbEc+mTufaT8fJGl8GwrX1QiDbHLRdZhmHQCJSiOTRUQXqnDSVNDA/UnsXBURYHiYbJQDSagNq99zZbqQviWPuh21uiv9KOpiQio81MIh+TSb9+I2PPUJzFniG0zp5sHk1viarHkmFxNCy1HdGRcQj7JD1iZG8wrynQAwb6NSt1oP4yFE/X30LVaCaGDn+JD8IQC4eCsV8tBceZ18pQBiC4fEB4VHo9NAz7m40BkxFU8gdQ8ZZ657p5H82stbIKS7M6s3hq/cTycZViZON23/st5fNLDPbnMg5lmmbZ9KOauiP1dLcmh42k7RgsWT8ElDq0x5p+xjPA6IQvMsmL7FpDMz1jZcPD4vTclsqw958ziWCgHvwonygYqUdyNXzKJPd//3B4dLie28J9U2qaE384vG/M3rJXrw96u3h1wN3Fq9y/tYWPsouWhwtXhrq4hVwxnZufnSnO5txSNpaaKyQXSnNhJ7lYKedm63k44NFCQmM4uVElHzeaduaFd3s6F8875OGG05DcORbNS9/2xZQDfGvJeHSqWG7PusKtDZemJuPhqUxuwamknSNV4aK6UfBXpSubmUxGStlCBC7Nxp19nFgYm+2uGxKTuY7U7T4cBYM8VjLS5dzNvYefEZ9fXWVNQClYhdEReQTT87udeADGqEaC0qSEdbmgb+A24NCUOmi27MEJVzCoLbkmIizDlaro+7hB8s6FvQcPds7D2krdXa8B1ULb6y6hf13Gr3U4kNTu2niYwgD5PjBD+oMHolIMQjqSCsCWbR6sGk2/1aOc9dh58Dj5k9fBiEvVibKQj84ru2Jc4my3il6s4oASMP1z0nRUPQLrdnqrMvYN4WDFT8i7Ons2f2eUQla9rp1PviQsMfwawBzwG4bDwzGbtXVMIdjxeCQdYFlRdAJP+40S0hM11AqccDekEsfHVZ6obC3uh2KrsQA6fFobi4XQIVrQ7VCoo50OLGTQ6ZClDTqeSoUYz8MUzEvk8EFIDmU5msAjhI4mDVVYad/+ZmUTl7Y5++frb+49hCVuE+UDB3m99m+0ReItTd9xtFvNLA2bama7V9lIlpMJzUsPbVQK9gXeD2haIjuBcDlrWiHLWsneXh8FoCPv5IgxCl1Ttv0vvHH3eb1vAlJOJr5oNSzt1xx4xez9Sl3KG9HHypCbqWvCXquKr8KaGOmRfqbU8jqToswb8fCz/r0fsXNsuHWibFEaneu9/bWe1rpPJCKVJNOQI0Q8JdF+UoGmEXi2wfycRpupyYiad3TVn7nmBqDnj20r04OGxegJ8WEscHD7C2BPBWYs4ErSb7KUgC9Jv0FgnSg6zH3J34/2JUGIovGgvid+v48v6eq8zG67DLFuxyFizlzFzMvHjmGHanod2H9DgyiczqPsogoiED4npm32mi4klvQklShE7g1eh2xZf/zVS0cpeV4HeCrw1uP8Ct107KgMyKt1/NZpT0byvXwkcBX81T8cwfkbHM5f5uzF+pLmLtZPqbxg+TQqys+qLRRnqiUJik3ZUG1TyFC3ORcrHIodm3QKh2PTmbyzEZuezDubpZwzVc45p8QPU27OOR2rZ5x8T3zL/67orFfTuU6iuZCrV9MtfyEbE/+2iwuZWKKz0IhJfrxEGsL+2q21dLuVrsdq6biTKiVSq7nYcrKUSK7EI2FPOMtLjXSikl5MVBPxmYLjxgoFJ14+GavmnIWTfmwxnI3Oic98IrKUc4pezvEjpXBrznkx4cz4c87LCSc8GwkfPhTe3Diec8KnT72YddZ7laIjfPOZWLgzP3cyE/ZjWVFaKeY0qmv1SHj1dMwR31dEBaLlUrWSjITdhYx/0pufW5txkvFwMR6ZnRnirkPuPTEDaenF3Z/fWcWZGFJpfHTj8T8uEGtDpSNMHtEYeaskItd1DcRBAGQYhYRQO8Fd8tZlHXDH1FcZi86+vfcqnZEQN4leopiIUUKvdNNX/yDymo8YRTS1Ua9b7xkip+1v1pC9Al3yc/ceX3qP3It1SGvmkkWqc1YlIz9OWi8t1y1qpd66214eVzrlGmzKCpRBwlSAAMaL6wqgvHoHLKvmSh1+6tKWdytEjP0mTWf/3TOP7l/WaTrXhFrk+Tldg4SqLoC+/YZOLSohKXxSZtWDJGWIDCGUmFvPqMjfdFM2vpzb1WXrh/TCFTHCbN+ChJWYlnj7Ks5nzn+z8897/Tff33n/db3/oaTRD7CBLHDMAqjR1OYM0qQS4s6HN4QTxWGkI2q+W50t5HaIhNiAetx4E+rux39ifjcJtns+bRsTjBjPXq/JoTmoRjIAXFi5LitCJcNxDqLkvkbpuS1K7utX9q4/0JF0eASiOhhLt/09s16SPcdbhWyUA3SWqhA7pI7K4SF1pigrqE6WZB2q85rbfzeGD18ZZVyniW1VLWZiq/6jf/9d8dIonx8zozWySdtXLNM6BF8xJCC+jvRgDAmijN0LNzVDglWMymtpF6QzWwp71xGTlIoeMLWqWiWkkdL/8+3de2+rMdIhs05DBIRRtuMFwFSNOV4gDSfBqiorZFVbhazr2Wx7Vb9hNzU1BR8h1N6iLfQgkXJyiCgYVWH59UkbWIqpyqqvqq5Ssck9VqbbNC8XqrbHZ7+hLVZUbRSgWGYxtgrGV+lMFNUN5DNBqhsUVEGKZd+KbFc+lKzEhTowDmEj7X19rv/9ezI6qFaurZz2VADoLcsjG8DC0UTp1ymxyk8fDyCxiF/jxklGZnLYlP0VU2PQHkg9dX734j3sucLVdWVk2faWcfosgLHiskk0QH248b3TMfbryl/JfoHqasFdKmJUiQy3wPtD6PhRJWIq0qy1THYIYT7uLqmwoIv3+nf+TB0DaZ2V0wOEUyZ+VWNwBDUKEIL6v4YwVIsmmvXpKqKlnq0qWqyuc0mCsaXYWkxnynyB6z+afN10HwUAqC89C8M/GISKCqVv0CbDlg+U53kAv9P4nNxfPIC3aDxFlXISO5A3ysuCpKy4GS/9O+6bjfXMjFcmmTqVo2MI5DEeUrXWUKfLclpG+QFDfJ6nch8s34GZdG3GtfVmFnuIJVUqHm00qXVhmwMWc8BY2rbNtmrakhkbxswXNzKWedEmRRsTY0dkC5V9bjy00ZBaX2r8oIo+gKq3lTNXrOPUKlOptiocqwi5EpTZeKtyZZOKonKUgtB6iqsXkxleSeze+9AWUncyVXAgRWCUwOAKENUbSOK8bntgVxFqJHrvnM4DsH1twcq/il0aAuuoRL4a5EnkX4e69krQS6NWguS4OHFC1PTES/vvKFbBX+34bDdRXgnsJuJVvpuIF6yNwyoF1w2ugMwtFgvJ2Ox8ypmeWajOz6UqVXGhuhp3NiLOfCELCxoL4lux4M7HEjkgfZvAzcO5SScZq8RPZuXWYXHSqS4WY35Wbh3OTDq5fKY0GY9ORaZK2WQskouHpybz8XAmEYmGc+JKKjYReTHm6I3D2Ug2lYyo2LdEJD2U6MNbD1kE3Tgc1yBtc5lxbvTP3dy9/Je9v3+nCTeaHohpqg2vg0j8eBAhS7rEpgqMxeXGr8/0H3AQpCckCLxfRhODqmnCIehmiN4UBbE2McTV4hHnmyaf/F3gBw6+dT2voacxuAgrSqs1e0FWdK/irRgiUFmIBjVAHIDVuAK05ETmAcfxZf5uOI78Fo3LDTGqGIWHwKDepaKACWKAh4NUkDrlH0iW+smXdObZPgvVDSYi0GXZZ7h+sfJGlqbPtNulqIRA6qS6LkemBcKD61iOmLnIk/lYgisRabMRS5B7jRa23HNSkLTthHh6q5Eq3NExfE230fZaJlHUFTxfeLXNQ/X+9OOje29pPKF2G7D7bSGyzUuo3YhWDrQua1ez+aBUmIxBkfUzSWt0BeUZOaocTeWpZgNYARqQSm1poOXkNjJ7GapmejtDgjU5jgqgw9koS4nz4Q22rOIOYHDWD1kbqAgcw+jSaOqfAZvfgRpofS3fmmmUgXdmvy/cc5RtQnuOpPbVnuOzvChZo+7zQtIRawBFe4ABxg9O94HyFIyB1ZAz8O2vVcvI/LyiYcSsRh3WFM3y4BO5vkStYiBG7SJ6nd/SdF9pSVKRHipA1OZBpYpTZTquLSbKe2c+lhqVqVN6jb2Tdj/UzygfkOmzAwuw283gHiVDjaDH8HMbvXqAMOMWMGlBU2YbMWu42H3e6u+6r5uOrnr5gVus82S3+3T34I4hPWtceIxgARJDNg9B8gV8/gajFpaEH4HNRLpXts3tC7IWgV1Fugk8Yc/LEteHqOUMdyqPj95eBGni+BBNjn/AI544vq+DKd5DG+N0jYepL9kuprzMfEx5hTuZdGn4CYyFdOXInHN42nlp0knPpt1UIZ0qC0dzfnqmOjebXpworBecI5POQjYxlesWJL1cIuaU59NxYpabjsWc4smCMxsjVrmZSMwp5TL5lPQw86VILiY8zGQsnCnPz1am8vGycDBfSgr/siT8y3xqNpKKJyNh4WDGIWItMzk06yfFpbotN+T6ZTodViuDI4hr7uLbCmW1hw61d+Wb/hfv7378p/6X9/feuEEhq8K9goDBUNWno0UQt1ojwKbXK/PoV7wo6cmXsQxUSq8KUBuLnXCQUJJwott0V+qecOHkpgMefP0GO/tPP+1+f4/Y5muNWkfFz9XkK1ZHHOR3tX4KCDJXeWD9VOBduq3XTxWqWkBVOGoFtaOvkBPFSclYGbBCLWO/3jlJnjzzfajIB+eEmtr717+FQ2+CrtZqdTe05vt1s6/AIrpAmVPpsMq0HqyRaK4GnJ44WIX0qYp9q0YnLYZVcMNtDNaraU5fqEvqrAiqLLsKkrnt7Nu6OApjglICrSCXyc3zs3MjbTz1gTpsxCOSTeBPBEcbYdazgSzvBkXV3jQr8GH9Mq9YuaeqcOPxts2Zkf9+t4IHvxn4nQsCXwPSY9hQxtUNPgcjJv189FNI0qmzbwcfgUJazCNoq3pVa11pC9vsfIBdgLbREhYx8SkG0Sy3WA9ynxLcjHkG2kMceAbp8ppnUKZct512n6Xut1+CdPXUSyA4rP4AEPOhvcZvNRoFcmJTiImWPEcvqijqJ9DkiX6cJ3cQF3u+6iQN3sB2F7G7B7rWVK8VZuykZ/2/0y9UNbvPoVcoaeWFC0+6rc58DNUuugNoUPPqqZa0VbjJG3YYLFpH052+vM/eOYcYmdRVm8UDGEXLIAas4f6mkNkrkuv8Vsp1cAH97kaIS9+9oAG8elnchZ6pVuXsjZkupruXfHyjOp+X6nqO6sMexWoaPLSrWPpiuLIYpivGtlFHNtLoZxvec9UwCzylqYc1Jn6J8TD8AEvbnRqcNVAlXgiJ59++FqCZVr/JFrFnB+pHYeGx74dpgiDazJogHBs5QSAAnBjQ4ME/oc1PHNtnjiAm8C2hm+WRWEn/Zy7qzLP1XgePycjgviPH7It1zQLo15Y16d+Ro+wK3oJBhk3Xg7PBPRUSKC9QaUdM+ZTVlpXDmQCRB/C4lobSBiYlx1orL09OvFhcrk5OJBPRWfH9+Kqfd16aeam1cvR40TldcI4VFuanD4vPkcVMbGpyYurQdCR/eiIZd/Ib+XhuXXxOCfFuPt7LRlbDTqZdCzsr006mszA/2Tq2MnmykI83E9G0PzlRXwk7KX8OuAWXxZ2x5Kr4rJWyzsTROWelJeZHE7Vm3ulmnNmMsxSbyTiJ5elIXMDHvYX5WDnSKjqVWCYWFVWJCs0XmRefhUQ0XBKfOVHOy9lUOiz+PT6Tjx8tR44cjh46WnB+l3FmCvHT0XA2FQ3nUouxTrs6cbKVTc2GYRk+EV1bnawVRQ2S0RcnnaWZQr7qLmbKyYS7WJ5emBf3pYfS/vW6NThH43brtOlYFROFS6dgBwlP4t39avfutcfffYixHvLelWXM5WyJEpMJXWE4GoLJc1E1/Wn7zZBf376F6yJbqyCLlNufnum/+QEqbB8oB9u4aKFu96UigN98vRkoxGEN4tU7QlhJKpof3xzt9mHby6Mz5XTQ6BpMkiTb0Jl39/71BTkmosXwTjj53FV59XoVjx0w12AcS8PYGBaA1NhiJGzfEkOR1mT++93JEPBW4B7l9jdtTTz05t3+5Zv921/tnt2iqnXkEDZH3xWSqRtHHwIewLVBbUSZe6y9fXUJ6HJXJJ3Z3Rqq2zLjLdh952z/rfOatwAOF7RIBKMnam1PIuh0qAbU55gay0aRVTM4ihJsuSmUujo1AglBdZTh3sPLFDi14Z5yxVx2Sc6jgTi3rmbRJM8ipobIg6iONkJhNVX2apXtraZbV0EcENpn0liy1vn4T/233tu9/opuoGYNpWjftGkljzSYQUSOpDF0PEeTZZL06u665IC7uAwIFsnE3s1/97//XtdlAzaY16k4/EvVBP72OYaWNVJydox/q62H9bqnydL++9YKJOJF1vXtW3q4Pbq9tfPpB49uX1LkXsvN3ipj1SIIw6lF33HZUUGhsgAIS54JyzCQNsY8Us/9Abw0Yon+6fOdH5DLm36niGPIF2cSZypZf39RFWwshVUrgHUTb9JTnQPJigLDpv/DJT5smOVV3ySCirFhlzikhrJAZHMwGRnts1KvyUohLQ2yKEGMmwyQ+/4hgN39mioFsTUdyVKIf+nKIAwD0bJGSlWhownO6q5QjcIbU4vRoRpMPZTC++H2zr/+TX2i23F9SbTmU5AA5A9mPHQdXydZRRAtz4WZpE7Z3ZEMLEieBH5kDw4665ey88qZ3fM/Gl3WhbV1GY4Nsqp30DcT7nSLTrJf/7F/6b6W04HYcC9nXNlah3hZTbhyyRqhu5fPmPIrzRrdK+dN8hvnXNnSN0gomatT4FCiTg1i1iMlTN0QImmaNmUyWEdFi2HUl3T+FDlSkJtN/qZNj3QtEIQqJBFMwOKyyVbhQqyKsAhuQ/dS4JnahOSXp0O0sb9z463+1gf91z7qf/E1Rjh1ay0Ztq//ljXiv/33uyqEouM4fnz2/uOv3mcCVBl9e10no+w2/faS5FH8hhL60soyRtm99+beA8n22PaEA19mnbatZE2/NXgWnEayYGwMGdKEbrUO5NygEQTToZZi0/vnX8Qw2H3jdfm2yDEn1k9XTB19Q/uJP/kWlAbQoor5k2SV6RX+OIT/wCFfiuiEXSreaR5/9Jp4O5zMSN5PFJ36q7I35opv8DSOhaCoOvUFNbRaKiMvJHQSfQ+63aUHotsBeYFLrJV4kxo+LZl4d8T98h20ZMLd4eyBT+gESx9W+77k9krPVXqt3Msc42Ma/1Lt3aL/pmLepMunnD05BzN+XtAfG++NWZ6YcaNI+5xZwrzs2A3fvyOcKOaBaQ/K9nRkCgek2t/CyK0Ln/Xv3FIujnFvtFuyv1OiHBLjOoxxHJTTwK3+vjaf2fuAXR5rlS2LrO3ovlZUWlBj9vYzesrgMRsFDATgh8G9//5UmSZtlgJmRBsRsh/MeHDDwXW90fRayZvZvNbuXBeP0cTsL0tljlGYTFky7ba/bjN6LaCDxmggS/toTTJSj0gdMiTEsbbktpd9byK46PTzO/Xta9bp1t13XgM8vsC0sdLS0nox6eioxSR19/KJo/tRAvqbwkUDjSqGbLdT652kE5u4hNOu9ZYxTTZsqdZrldoSHvFE3kAInAYO6VU6OdEUD1PDW2mrRm1VQ6cTA0CYezH59XplMS3TmJAQttZRm9fmB5ijNSi1xWHZ8g1RupiY+VWIBVMluXWz023/4kvaFmJo4Zcl8GGrxKGb4fnJuel0aX5qcX5qMl1anMpPutPi73R+diZbnM5n87PZYimdy4jrc+L3+bnp7GypkElPF/Oz4nrBnZtemMqUcvFYJLsAhzmjkd/FnHjOiU/Eo5FoYiISSU3Ek+FERHxPxCPJYdvc0H6VttcQrbfuN/krIrpJOLKNYVD/gVi6u0tEuoNj//Ld/u1Xd96/uXP5rf4DGNidrrcGqeRPeQLIUyi8BK9nFcG5XUXjhTxW+JACH57VRXXbLk3jWUFCMQzraorXEGinIJon1K6JbneyKjkEOsLJEf76zxeRPApn6jde2/3sy/7b7+9dgHHtLVe9+im/uSb6k5CrEIOxJLLyLUCzoy/sGRyXgTh3DLZuwqE4OjulEsMhD9KbeB7rA1kSbmKgoLBULGaAsHgpvsx27IfMEPLFfZ24dcAoBCTCRN1AJv9qVW7xwjzlVAjaWO7O4TmkR/fuA6nDuZtQp7P3dy5f6t9+k9a8yz5NqLveMsZLtvwVmRCHxic0ul0VlZ/NHuLbW0s1HbEL9RHKtKkPqGHJjz9+QEslsqxqG3OHD0ciu9QGzsIGpOSVJDUNT93sQrolsx2N6Zk2VHYQoBLAs6S17asNWv2nhQXG8vL6P4XDuXPuHSDZufzGzg9XkPvjgtmf9trLmDXQW3abovu3vXUxADbUVE10UORoDMFGUdNvMU2GVdOnRCACqqNerKm/YUJULxWbDrbYkJCjt0Z7j2zPCN8lkGu88aD/8DvRliZtXAcWruBdQtvqOlLho1St3P3UerYJkwlLyZosTD//rSf89avCqqogmUDHQ20CZN2bal/q08u7996l2BnT8z68sfOKzN7UkeVCHA1WuyMcwLomiBg0ANtbQQugORJ1tSUrCyVmAaZEXU1JS2iyo1GliKBQ50iDekgmllPIVs1KRSsAnqHcTjP9Fg2N28SANK8uX6fqinc3QmqBy2ya332tf/4z0fke3b2we+8cJ2z08XhrVXa6jTri0nabXwem55UQLxt+bPutgTqBKkOXFRpBnsLcQi6ak3jS2s6cfOFm//qne//6txgRdkI9T3gQEBIrev+KaBufqNsb3OTKkpRfpC1ur2tei0t9/RsxYYAYT9Z3/vtWR+YakDEw52A6Su9m55MHe/fv9b+8g+ThtY7rwa7YSheWWb1QB96Vh56hKnf7ylBTTyOR18ez66M5xUSVeDWIWAx6CY4y8S5CwLtIBQ91HmRQQVtFmvsjR5RXpSPVKs3kO81BXW5GkxhHcN767C3RU81oUkMJs1BCtwWCzSFjycO0lFQhWNRWNf7fHEe2M2WG0Xqt662W/VCnB5Ee21833YqoONZsBpoYF1GAlt1DhiHel7nOoVDuz18HyvaP/yR6MPVpUjiSOrHuCk2z0dDdWjZSCiNLu+DK1EQVhrRNG1jxRR/TPwrvJkee1N+qeGgY9pWhAq+/+uj2W7uX/0Kzsm4HJHuh7m/EUxFV2gBSc1TmQuY0Wf6SdpaMixRwi5gnxPwf4/lof8fyPcScqOwzC67tNllsbqlljEPAlBnTb3KRytGjzJQxTtoYyWhe3u84luxmhEO9i7qWpZsH1R/FOFhVMkx2WCUVw7ysYxmsxxvfHM/jCSwM1ScwcsHIs2qbOhMjkpQdiFCQTzKEFkk94wuALXpG0g5TMD9L99UOVDA/w1FVGEVhnbfQml0eGRmqoCCILQkHospeuHziyH68SU1yw9wNtyMGkDplI8MIOvhTFwZXjXEjHTlCgfa9DXF/Tf8emEEK4OUQET6oWzA9N04j/ZVKrxEy13mYtLp96ERwamG2kMtmJqfc2cJcMZ/OpxMl52TemZstTGUn0xl3oZAVt0xPuQuz4t8Zcb00V5xPF4VMMQefLHwy4lo+EgWOn2g4t+CUi050Ie8kIuJ/0YnIRCImPnE8V4dXxL9TTjQRHZbNb/sfYuLSAG+6ho2ojj6hTgVLCNoVOfFa+vwTLKPgBshWg2LshWHcvXd258LfaBD1v7i68yGcsT7lt9vCYnTBIxbTOPDc5MEo0b7b3w95dzix2v7awzBWrBGupwDR8GlWFej+b3y9c+5tKhaXCmlPUxdl6BVUIXIQbwpfhPqFIjQhngfwgupietjkOfD6Zz7uX7jXP3+pf/5bnQlP+2QbMB2qExee9MSETRLg4FwzlhOl4uF/oOr+c6kGtLp1WSraLIi8xrC3f8B6zYV7ezfe69/8xLYaVCQ3Gro40nc13eet44j/fauHLgSssJvShpxM7H/x8c6lf1LRgfOJXhvJM7r2GcXO9pUho0xSu0A1XNw/DMnFVywd/Suka8XTzjfeA/fuwQf9V36SJxBFIRDAcYrsGEETTp2A6Bwd4QcmffrhwAYPzPDwwYQ95rM6KM6ayTXZyOYTN3AXqyFZbifgMPKiubUDp1EWy+hIlccKZeu5mWhYXrSZkoG2WnVD8r3aTiPmVoTl8zJ23yaesg/OvPrnr/ZvX4defNOacLXq3orqx5Z/qPXj9pWAgpQDtO0vdbwQq4db1sNHlvnO13LYYFEwtcdy1Lkxo2B1Gb5JNAjBmepRkYW0Kc/ViserIUGUHqv6WTlD9qWdi3eoePm8JgmxL1BrgaemVJOi3FVcvmq4Q56aZjW8NkRic23oHEq8c/jPnkCpKRPMGaB06WZYuKYdMLpEvXWKGoVxjGsAwAfPepzsbV98DEsAd19THQ49LOjFIUgO1JVTlAHrJacoOGdyYXHQ0w9YMZ1bBWNfuyK79Gtv0U7Lsiu10iYeju76CtwaN/QcutsOGzfKL2JjBvtOYMBQD8Lx0nGDXQdLEc54U05YZGSwrRdgakXrF3fbllq4//nOp5f7X70q1YLw0v0qzlqWajQl0I0mWkn2i2duNlotRRIr1mx8sNOJSv4QwXkOPQKf27DenZKE/LLqulMPn2Uoq2tZW21nmXnlZtXjQ8IYM2XDpNUyluqg95sGOZBEk0sEehwbrE09QOUpSKOXtDbSxyBJ3bODwkzL88Y3547NyG488RM88wM8cYm61w2eihS/zA45CkkCL2BlEDUaOP+obpAlBQ4+ql/R1M/yOcLh0ecdSYgOOra7Jw7vF8Nc71UUwZDkJ9WX0FP/gwwqrsJudItuO2pfw/uOcFEVXqxuGRphPJlsFJ1DmcThwnQ676zFnc15Z7Po1OPOatwJJ5x2xplq552JkuMlwPGfjThiBlA7tZZf26ivTyZznYlorhuPZU+KT3symfGTKwkn06otTjYWFyabtfTq2motXU/XU7W1dGo1PZ9cTs8lV2ZTE574LE0mExXxqSbjR+cc90jYeXnaiZdbc85S2lmY9NKOP+fEFmdT0TnxmZ+eiBbjsVJkfi41MxENz8Yi4UMl8VdUPEF5cTIpfuzECuHIVKLlxxYai6u1tRQUn59cWZ6OLnlTmWqlmIu58dycs7ApHuvFeWd+TkhkC7+bdEoZp5gZNuUApYE2mAXGAMEhbgSZ4JjHH9zbef+mDF/teG2Wt4kQeHCMhsQd0C6u8uMC+bv9b//GAbi0Znxo9oAanGYDMjUMrNeyeQBkSfnhMz0D8LokBWImI7ZG4gSH6ppQ434HjqC06OAmK8dmr6CiOHUFLw1Xgr2mVZztdjeEb4ZM+yXKFLgp85HwzN6ffQkJSdTTSAn2IPIKfw55yXoGRMdM0oaHBXbU/npek7AoMVZtecmqda1ba3SablvNyf77HcxP3ipbc7HX7+78bcvMwjpuper6bSsnuYZhVTcXrcrrIhiHDJag625KYNU3aBa5JG5udjVNHZgRnK9awXBv39y9+C8eDKdDBIXrCVExgVzdXclYZ9A0CpNX4V4SQYVLwgKjSp4Km29bLR5idebdx3//q65K3Ws23RUVBgeSOgYOvvgcRUszORUBBzeriKoGxAy0WyaVNW4WsVjFS9f3zr+qq6Bux9ZQX1SwlfruMygNwYRlU6ivdR3yWVv32jBf1lzGF5ZgHoHm8PrDx68Dg9kpr7beRidJ09QpKUZVpy4dAMZQ1SkhFRoIW1nAi9aGg90mpTxlMLlINI137+68eebRbTzF5sm7VV/R4ozPz8I8OKLuPQyzrqPINOKTVpLjySpaeP6T1pADsvcq+pyYtUkCwkuw53ttlZamZEzj3it/3rt+s/+OzBAsRXpCRr1k4wYEQH2GqZFsDPOKjeOgmK/BYeIZjHE/t0zDZ+f8lxjcQHcQBaH8xriz2e/7yWvibPldbXAtG25GWCHAgPqrtHzXkrxqu999DjzCN2TEp1evGJ5G8HyIS1kppWVN1MjwNAqTV6doFIAJYBbfxUxJ93lp9f3tK7WufGFk93c+uSJPGQjvoRPqQKiJDGSuIYIJY5aQHFDDgOkHUR2+TMJ1PpwVkyZGDFzZhAm25nx9+MHOJ6/uXL4mm6dZ2xTztkaI6YegcpCEq4SlIbiwpRaYvtb9+Od3yKyWKapDMnvevS1e+qN796kqoq+5Ld0q4JVu3+LdmHVhDadRLHl9ekch6PM7VYwVYOcxwFqC0qNTuuo8xt+2+ncekp8mZNy2CWOmr8ZNU5DoOkA4npgkQ4QhRkpevvv4s1s7F3/kMAxDvu0qjGy3ydw8XRX09age4j6PpaOH/L24sGMcRgk0wl3U8pbwiCPM0vcc8GW5G6tcUO1+2t6h5Q9qH9B2/bjLZ/lk3BHTDph2vZjLFXCHyAeCtNxXKI3y3oN3H/1E27X6Dna75ZeM80qMR2L8iDFehPIgLJO/v8Fnxj5goMebZ8s0DxioA5ungPF8JqAgjrFFYy2RZYUCBkS1+3DzwU0HU/NjlTxX8DJ3oNTF+2lio4X5CxujMs2rYrptrGaztBrTPwfSPvpfoy320xVaTwwuo6hmyYWEAwhA2eCSCjSWqA0l+xZFiBKyfEWFGhCIpKhMvp4iHjQX+jUAe1m+lHJo1FIKtMyJE1jpE4f2pyOl5XAZ56oYSdUaeYCSlC5zTlJL+ii/ZhGV4qWhu6XJ+bnMzKGsM9/JO7PJlDtVzk04qUwpuSA+i4UsrJ6cLjp+zslUp53prDMTceYWFzLJ8jTwlU4Vk/HcIvyQdfIRJ5fJOrmIE5ufdmYms05W/OkW82kgk0oWZicS+Uh1fq4kvofzk6n4ZDruzh7JOosLKs3hZDoVif8u7FCiw3hkn0SHsJFQ07w7/n/ObKrNt6tEJVxWSaFZ8uZbn+1c+idsg739IRDPKSYerwN08bC/rxI5t30P4gYZmxAV58rJLSx+jyoW44tgqUF2Yl7q3ldnxLR354crVqly5ktugCmcpr4hlYYNbBtN9jCaHpmMaS9qgEGr//17ew8vcQYtLSz5s3z1XZNnaXwLW4MxDC6unU65naScTrmFpPeJKDy/oXaGWNZ02V8Nlb0EOggMT51uRoe9v2UxxqqdrcFdWcIP7seajSyzHau2sOwVIVmc3/Z609QzYA7e1YFmtML13Yc7b7+zc/bWADzGkqUYuo/BY3IXNrBXJ7dFMQDK3oo0u6I7W1/CI6mNOZVUkQqUexZ6L1Y+ENuI02Vq1lPVdDxzODTZAHgAldGeSkgryo3tNl4Fgvy2ToWL4Pff63/1qspkRvh2gFsN+MhJCaroNqscmddZtZVODk3tM4BsQQ7Qoqo2MSnB7XZhGcFl07CgTtll1aaFrHU9AD7Q1rx7DnTMAJpNm6pGksq5qHSEpa10DkbgFVJqioI/hdfU9co84lMW4wbfqEkjrtrZpHakdlbZHdW4ZeZMca3+Er3Dfd59QwJqFih7ZNIe4pBxKQMl2Zi03yPfRBwcjKoUG97CtNAYzChOKLJnI0xYwGhxW8UM1NNbDUvTH0DPB3S8pXFpExX2gEm+//6fSN7Itp9OrMnEnpdKeY6D/SkacZ8HGio9tO8/Y48cSgwLYNkhm6Ao8QKCi7pNBHZA5a+yuoENUPnjMp2IbKS43/7yoZFboChGQZJY8xPi3n1O49UqLh6z8xvBTI3mus7ViJdhlUDunpiUjcFfdOZG4bvXyg3YHaiz6QFdGpge0GU+PaArZirAKybzPNpFy3SPqoyhU4ZUe85JV+ZS6erMdMqdnkmV5+eSC+KzuFl00gXYhRUzhvC0s5Z3UnlnY95JZKZyhyadU/OQ5aBUKsRzG5NOPO9M9+ad0mwudmrSieadmc68M1nKZSC5QSY7VQLq2VKO8qIni9XKXKXspgtmsgCpDRLxgk5tMCojOq6m6LdBO0fkA2K6ERhpD6+rRRV9n8oGYr1fszrD7xuPxlI/8X5h4Ni7lw402GZYBaTDemLmcP+aQmU3a1S7Ww0FPjgsr67VK4n+2ufVFFMsOCyA5+Tf+vuju1/gIT9YalLJs3zsSnLTp8cxDoCg1icNBIvXawzkgyiPcu/Fow5x77GUoHdPg8b27qEsH4+XSNp0XZTl31Mpxr/X+My9l+OZu/eALv1sdW6oHHS24cgHopuwfmERqADtcWtdMYA7HNMGHI7G/HfAUwYjUFFzLoUw1YkUiWnMoFVFC3EQjUGNwBnw0PGRuXtuPbb2z/WTG/+cCtA21qpnAHk4qg05HM9OrA5nfwB3oLK8klS9DuEZNc9bULvfrGLGr5f1Igdc1mqF2Qvlfz/z23Wfy7uVKNrDBhiT7QDWEwlGZTyA46RizAXeY0prDR3pqYF4Zfiw5e+Ny4/Kns4NwUHMQNAEDFPTB1bSgwraaNbxetXWqUbJWa2jW0YLGgX2JCJNJvKsI/65DkddI5NvjWY//Tffp3lPcNg9h56torubB2s8XwoNes3V3jCXGW+nHArlIT6z/FmWE/CZ5Y/C+YXSo9xl/sNolxml0GXGOp/4wz4es3A2e50Q7m398VeHMdavJrzsurr0MiVg9+qVXjPk1pbbHjGkylztdR/iRGrlNrq0x/lVfa/M4V73O+wicqf6Xl0MDti+xUNIMlG7vIZuM6Zol1IhF2K4VZZ2fbFukrR3MZs0UGwcZRcoqlFmdu924MgMlffyEX7NBEmiB96sQRgrnizuqEhJ+wcs+cgR/cjKp1dPIF1388y/13WCJ2Nlo1cfgIfXMeDpV+ecVs7JFpzjsP5fgL2AY40YRFY2c87v5ycgrrKRc16q553TOed0xEnnHXfOiZWcUznI1r7e8xdnZ6LTNfE/NxUPt9cqRfFn/rC4vu4vnjzeKUWOd0uR0+L6kdXJ3rG5Sb+32JqcSMSOCYDYVKa8kBK/1VNHTk4CSDIenlgWn5V4OOGJz1J5IV4prqedanyyXl0QRcREmQv1ajl6rBWZO9aaj3Q7keJa5ei0E47G550/iGlGNJ5z/jDhzCZip6adQyknl6zOOIcSsUYmKwqOhaeTefGv+D51crXli38ybjy8Fp7O1WIry/6MMxFb8lLhSjHtTCTcxpwjKrbQKc3PiScsDt2oWG9TRE3PXw/1yBm7W4HVODvybuvDRw8/MdGPSopFDKpLJu7Or+qLbZO/DVPRID4LGXzvIwGvw+6qGt8kbzMF2M5vT9J4Yf3jFj6Pd8QCdP1bnrcWrHvTCtv8BereHAjUrNZ6rOJwIuoOhvjgNq+p+8d/enzlwe6fvzbNj2N7DRLEm2dAMB6viReg7oHMaZD+HHZN2WOowNPX39KPIm2ELmkgcRqis8cROhfJR32VtxyowJYxuMdKXL77ztmdDz/jiculoMxbrmB43nJ1LQC7rPPVIuaj299Sylp5uwqzoW8qqGVV6HhF+wr725uatvVPMl/2Rrddq+rc02gUSEDLK9rX/eQV8SvK6yTTaE9M8bAw1YTdGMWK8vor/Ts/EEwTLI2knq0xOYNjqjEeR1cHJVV9lDWrQ/4jT9KD4TopBq5exZyd3320e/FfO5/fJlYBeFPeKR+SvKAss4kKhSMrlY+1BFIQxASmAgTcIMs1iOVub5GgzGpV375lzKvcv8dKAm8cnAXT+X0v3xXV7b/91/75SzLRL0mFqk1MaBgEswoI1FaBivoSlqxvEIpXlsx73ZPpTZuoiiD2g+qrSXmAWGz7c9wO++Thzvefi1pDMR/e6n/xLcXEYCadut/RPgNeY4UMVpehcjDdzBzNqrVXFUO6UhPGuu7J/JBUX82Zg+lb/0W8ONjL8fYK3I8DXgHgFZUsksNijEfdBAydv0QBQwwpCCOXdTrbV5ZDtOkCARjb105CpATFYOzcvPjo9gV0YZdDMmdlh44WGlnfSGopeZ+M8RJ/KQ3hiXcqm6C3fWtDzPZw5fiHOzsfgE6s13yWHhPv1o6blpeyJEdC1s16a1p6bmYkf06JBK/igTD5XXLJvf62eKdgDl5/m0jl5GtdEhWCQ36U6pc7iKwMzpV4Fdl47r4j4DSKJayX/+oQS6N6MUTbUHfdvXubjnT65SqltBbzPeVyclFFtr6PsFnRUy6qzDVcw0NPW3WIOoTO97ezuxfu4aaNW18mKklxjy4Rv/j7iBgucLizrkkvu5D1uSXfuE8NfqejXvv7H/Wv/JXevPA/l36r/NT/j4nqV6+v+BxKw8i03MY4GQFVndM1OK6+TAFf38FeJam2NoybHsZPXH7Q//TszhsXH935ns5Gwl4ohla47Z6YgQn5dq1r4HwDpcVxFueW23oASFF9JqZegWASSQApGmOLwlW2Tqs9tJ2LP/Yvfbp35U3aSRPVqFc2hEjIr1JAGSGE8FS8jkcbAquxOIoFodoGM2b3gJlfKqifL7SFC3NKvarP3t35/gq9KliP6NWR7b+pVyOseYyNyNA0EocZxDDp2DyYZIb8msdsMURUQmP/XXTAG3Kvq+m3a+s40JhQVSUt4jiKV3cMEiOzRdFRPLPad+buvfbqmT/P/WzZD6Tnyp1f7fRKT5p7uMz3JCpKyK9NFJQ757+QHqV2ILl3R+7Ud6epl2ES1s9E79LunHHltB8mFeYmOV/K81JOl3GULBdJe0fKNdJeEfdb4HnRUyE3ZcA/4V7DaG/BdhOM4R5vsC1L/RwsqTaFIw2h/L+2YDhtVxZwi2Ikf7iz+9mtQWv2lGbmaW3Mk9kHWzGPUctcJWsFuq/61KrzmVTcs2qjZ1dFQwhmNyFzvQtRq/KmMCAPCV690t6+toixq1gklGhxCO3+6ce9178VXpqsA1/Zk2X8OmSqFedre78ftbaHgs0TJ9jjnPj9Pqt77mbTbXpINYNhhZKXll3G1TMiB5JXcDYtF7zURbk5Jpe7lDDMeSWbrblEnLKH5F45XfVQVm2WqzvtzXJYA5a/eJpziF1U+zR//NVLuLfOq3CcXeG77bL0hgnFpStm/92Xt3QVp628ICb8Ms2Sbiu5gNfW314yzy2PSauHk+t5uvZQvq4hHqHWdcFlPlUslDmw5ld4seikK4WXxf+ryVjKFZ/yTGFuIT0/m0wvzG6mnUIvC1v701knnShOHZp05iadaNoppRfm4xuTTnHSCaedaTi0DPlkJ50XU85MND9Zgo39fCaSFZ9cPh6eFJ9MSZRWrSQiZTcSW0isTjhybz+fmYwk4slxe/via098a9bk2TQ4aaFoum+f69/4iYjYK/Kmphv4rs7MKRT/ACDqpJy+oFMYdTrekj6MqWDqBLP3CnHHrVRcj3a+cfXFcN0bcX+ctPRrpbzy3ITDJXoSxQZvX+3Bea/Pa8Nig7e+2nnvIx4bDNQfCKxy624CcRQbxwbfwtZgDCMgrnNGAPlVVZ47pophmLSMGHrvI6BZxJUqqonOu9r4DS29KUC2+EYPzHblCdfakBfIejdeI7PNeAlr7cYTrhjqeu9cUnL5Oi+33FzF1TVRhN5B7/RCVIreQ5cFqC1fja65+yxEjjUKSO/GE5JkYAGOSUrbCfynHVlXGZp259yje6/sqHTkBCzjJIG6Uu6vyRLE+z05UICuq2SZHcCyMQa25VWb6i07emTWpHI/F5+emkFluVzpykbVm3eqFK8eLEDzD1qoHG8ElBU4q3sAf/mQOEB1e0nBduMn6vzitXc83f0Dr1yi8RfOXjbtyqtxzcT1trwUbzBS4FPW65V9kBaTGyHrlSg0FfX3pK9UyevdeFmbLo04SZ9aW9W815/DiMOGhg5GWLiXripi4bBha8Yre01ccmQkq9Le43W3/cXSumN0rtG3T60MudZST01PrB6XaaTnoiyecRQ/p7HFajHw2AOj5pl66VP2rGF76wASH7K7ThLA4tk7DejpwPa6+l12hcD+uvpV9g+Lluel0RvsIIT761j1Ey8d2u9AGZAWwtl/ywlWF4NesLrOvFh1yTpTpi4yT1bmk6AfTIoGT18YDBwtLKYrmYVqOhFJueJTzsaSC5V8crGYmTuZc0rFzHyuUsxUSpm1lJPOLcaX8+BJ1lLO9Nx0dcbLgye5LJzJbCydSEQmo+nZSBbOlOUqpaJwLcOxqWQl7M44ZTcs/MVkFD4TkUQsqZk6k/uEiVbdzZp8TOlEbZ0O0fhG4nVKUPLozufi3QK5+pf3aaQ3YblCuU5itqlRtOsEM1Z1leFqNIYTgDDZnNxqT6dGQ07ijsLYvfgZYYh2hpvIuWw2enXDKdCEL/54UZVLCoVl4aZVdOYmku4/+BtJe2I6D7e0JKeBaYGejeCPB6AaBBugzXq1tdGq35G9y0rtyndZ6S0Fdlg5qt4y1gPAOJa6FMu3pEK0e6lLMO4lg1LuJfENNvSAHMI5KCmIRXEsUlOxDgIh8dZXJgYUiQepaMVxidSDTTUQqQPaxenn4ZmxP+e4FmLTqI+6pt5Ql0b4n9ZzcDfUPAN7LwPO6FUJr53RQIH8IfgrD4DaYAGvVDFCegMjcwjVJMGPopqkAgNMk/wNDC8mCK+BLbxGQHvLmYRXDg2B3EdXiXd3KqS0DCw2hXgN9Viwe4jdO9BblZVb4fZDsVuq18bPcGks+wiXemHmCJfVFxR/vTZH6gSXVcYT9AMtpwNLZZ4OvB6mjGwq/QemlUFQis3BvB9wGkoMeEWMtSRfe4on/WAt6iujaakQS3ewl00o8mFHuLpPbUhsKzLWDmgbYKnvscqbKW5LlY6oqlKYTFNaQ31fsYBqeqaeoTXEcxuqvDojHkMPo87v+FB6Hl382XrfEHfYk0NkwB+WBQp/eOu0wJ+3vWH9q3xo2xvWv8oum+He8PGR3rAUQ38Y637i+LgTWrBvBiTleN7qyHEV+qgu11UoKl31m82avPfYscBVuPXoMYqy9Ot+swJrecAsq0JM+XXEPSZZdOmE+x9/dYhdoLxrR7ELdryu36qtqEoGLiIUhaG2fU8dHTvEr9Stw2fLNTHO1/WDvDTkh7penodwdNh9qKjSg1frOoucuUg1CFw0meRYC6s1dNOQahJhWkuvh2PLqMVw3QJy+ZueVa5+W4+jlrx1VdRCN78wuNhdnJ05Oh2dOTYdLRyOhAtHuhknOe1Mb3YyzoT491B8aqLktPNOZc7ZkFkEYpFpJ794uuicyhScifKEk+vi/3tCMJd3sm0hmBX/dtYXM63i7MlMtTDZFB+/OJuuT0cb6URqPeOspnoZ53jOWYseTjrJlegh8f9acXZiaTo6sZycSFSbhYR32o2XxadSKccW10/G3NjhvBOdX8458O/CbKRULM5G5krhOfFnuDhxzJ11jvrN6uGl6KHNDKYlmEknJ8Q/4SmnOuGIWoY74gnb2Ui4tZrwm8mJRn1tdTKxkIS42NpKOrm8JL5XD21UynNT7qIoRhS2MF+cLYVLoqghsyawKV2K65QUhIw/2SRtfu9m//ZtlmtWydDmmPpmUs2y3xmiRuIYen9eyUiqL299+0qtDanTVTJe2JJUAf4Q3kMHm+tll26zviiCL4NyEAyVb12h8BN+SttQMyG38X/OUFLqG5/tff2qOuAh72uao31MfQ3CHQiMn+czWo/Wo7RCkHka1CEbRPUxPI2t1MvzNp99uXfzrF6y97oGZWDh3igctnSvL/Lze6zEwfN7VGTw/J5dMD/EZ5VgGFDbZb8CeeDpYSmpEUU3mljgCzf7b/9VBwK3vXUhUqsOPJnA6iEWZ0FV+BYJqimGhTRjKTqkmZcCj2EVMMCB2qQGVR0baBjPLFEg22mVZfrDC4h/x9CgkpRmXlk3G2AclENqHAvBkK6sm90v2St9XS8VZ/J5T7xVu2rv3+yfu2RVTdpX3um1GbbRA8gazgIKoiheO2azKX76DrJ9ryoSrZ3LN3bOv0I8Wht48wrcLRm1trcCNt8GZXgaysIJYqhjaX4XCPaIlPACZpyCDmmU5633dt6/o5Vn1V/pSnocJapz3tNXnwNpACNqUmHA3Tzt/bfV2jrSt640vabMCQPUECubVojqzlvX926c0VGqkGgTBf2mSrKJX1UEWIdhd1wLVoNxGE0jKb8PHJTWfQw6QhOS1nBqy50zNx49vKKpLfWpOSG1JFRhxasRearfdauq6SDtYVUoIpUH5w7F4rx1XdgbDIoSv6puL/7Uye1UrkR6eSpZo07DCHaKbnBlQmf6pl+YuuCPEVevTN2v1gWFe7R9Cz1EMivfAHH9BYTYu/6gf+Z16UStCC9qYwVrgT6VFFIG11w5AIgM5mUwdU1F4ZmD4XfqkHwHMe7uvvMakYzCXp4ModV+LJfdX1J2DCWr+EXbnlS65ui8VOqGBpl0uhpDG1rdGhoqrW0106jB5agazcLhRFQayVKNxg4aD8CXwWVk3FRn1XcydWj580TGXuud7GD42H+/Q0LMK/igV3/c/fwi7nLAvoFO8W07/iaJLyXDVe22IRP8GQbrb9/sX/+UOW5aRJsRfaE3AOtzVI1m45iGU1cY77CcftBYPwPE1rgk9e4aHkb+Ucwpd7+mxRi6VdJ8C59/e8tMaAJoB8aS3Y2j1QNgT1gzn2ENVMx/wopxsFFRqdotHu9Icyfa9n0P4PnyP4M+6kE81IB3GvASRw4X5v9ZTp/tjI0avWrwcl8r4A6NdYaMI/Tsfsqz+RPcBdjfATDGP2iex9pmbpeN4dzHakqLaZu7/Y0dN3S2eRpvnCzDxCzLvnbF2JSA4h+r9gdU/rOp5qACHa8+bdVpK5SDqhNbxz01hs8xBuhZza9RmO+1B1Pe/HxxQ3SgGSzqP+9O8pXEvRtbovvLUi1eVgAKYaL3ygxfPjw2avkQJLonTpBI58SxfbfSXdHN675NvUSXBqiX6DIPBqUrFgsrXhq6M14su5VSYTZXrKZc8SkXism0k1yNO1MzzkTamUsVTucg083MqRzQKy1kE1M5iro8Ne+UCpV4TkZd9uadymwuJqMuO/NOZrKUA0KlWUmoFA8TodJEIhypzJbdeGwiko4mxGciMjmbjiQLadwpj6YnEnB1yJpPh7pcxYNeDnmozbkqyhO8GsL9zJ8v4j7Bww/7Z77sf/Hx3vXbuEbdabn10EbTJTpf1Z76KJUF7tu4Go5o5Zr13lLXWxa+vWYRV3BqbqWAen63Ew9UEjd61P4OVvLBOZrzG1ya6/ubtap8oRvyqICBHvb86oiogrUw1TFRBqqOinoSsyEzqqEu/vyUpJS9W0bldVPA7n115tHtt2i/pytxzYE5yB9GyE2dSlkiD2yg6zLsHXQqhu+gy1LsLXRTkr2Hrpu9ZJXBllmoAJNoRqPby0cEztN8qmaH9HNuG081HKShTAFdSbNr1Tukt1VVvzaclhqdbZfffU0+AEuyjC9XhWBp3fELoJp9eKQQMuicvmegDE3iYxXDUodDSf+n7rZ79dYLLBpsxJNwKsQh5QwpZEwJwaBRWdLQImgxkhVh9SIdgWZV/XlCDvA4VUN6hGkeL1OApvBS4JK/q6PVl9wFtGtsQ1pVHugwuDWv4ZhNUlvzEmvoawu+Mv6+VIzd0Jo9I5rei9/+Wo/qnDWg9bqTpTZo7cl6QZRGUu7FY02bNjQRQNRVHdXrBjSOwxFGET8xE3VAA2WMk209RotzUWMqpEP827bpybqtdOtwbcd1tKVADyLJ5RoHk7M11S+sMp73sOZde9Rzjhiyz3FUDOm20npSgjNhls98MKzDDtu5xxoNi2RFCUgvuQrgc4E4VvmrfOpAGKv8UbseCe56Hx0dx4pyOuu8qPuJo2P877aPp50tB5yuDXrgba8nDzIbH1xes71wBBjqhi8UKuVS1Em56bmiW81lU5X5ueLCZCmTyxSc0gRkQfASTpF4TasJ5DXNTeSdhVIuW4BwVeA0XUw4uYWEMxvz8shqOp9AVtPMpM1qmhdOeLiSTjipaDiVcIQPHo5ExN/hZDSSSTgTsdmJyYQTL9RyDp6BSiYgnHVYpsdae/tWA7YEMGp1GRfEodvJKLCdV76G14ghYGLCC3eqcz41+moO+Sgs7Pwbcumh//A1SoRC0lxQGlZkM2uXG6K/d6gWKA3n2dXxo9p/LjUIq3/pUzp8tPsAKSW8mlWpjgLvmGp19DPS/oEE13gcRnFNaJRfoo6+6lnCBXiGSjIYnZUbazjgpd+RSdcCYa733xZvhjvpbU/IN2DMBLmEaNgEchZgYSplgS6E7/diCXqnl8OzU1RqnLIwV3SJGupxOpzeFEiYrq0GqE0ffCDK4dSmuihjUWRjaXrTIPggsI06GtJ2qO2KWz61KcFQYupClCutyxlmt7RKCz6DNhpUhrh3RRVil3AA+MHEBVCM3URy5quwAy/YGEarws8Fa4jzrNoh2EkGOohynA24scN2/zBNa/UOu2eg18ywLEuiExMooHGvaE+ZdY1IwayWMRqo3lOhWpAmGwFiaqozTclOQIHXQo6DXatnQRjhLT+ZTbFV6Rg9yhT9E8upenNViAe6qqqK+MS20mPajo/fMXJBdfNLDv3nNkpZJx3+ePsMwV9g2Dxj7xyadUDclxnmGePzvyBU0Pa14Pku9ZtshaBjLH9FviCsRYG7xkf2cY1REn1jVf8TR/ZxjuteBYicKOujDDPV11SYadOvdWqY4knFmaorlJPgqBZSAZfyd0wNEHSO1zuzL4nP7735mWOz2Znj653CkfnfJZyjhex0+VAuMX04ezjpTG0cLzqHxL+b6538KW/+dP50J9fz5tdz2aNzTinrdI7MOcWsk+3mc4mTkXCm7c2v+LlEa3I2m26cSjqdjJNu5hKpNfGpJ5KZvFNLJCfzzmq2tXw06YRXJo4kndZ8whOfpVwiXhGfai6x6EbCsXK8HF1IxqOLkeVpZ65UKkbm58LzxcW8MxcuFbO/fykdCR8T5R5JJeOHIuHNjUIucaqQT/S6xTknKuoWj07ExG9+JNxsJOP1tfhq7XjOiUczsXxuyUtWK3+IOfHMRFR8YlPpuXBaFDHsLFm3Uqt6bW9dnpm62kMmPehD/ddu9c8BSQ/cAnfQPrq6X++iqwv+OHm1ga4EjB/jVTQZAfBRdiQfy971n/ZuvIFmtNc55UpOs2rTbUCog6qAEvfHScsNNCVfV/TGtW5H1FotZG8MiyN6dOeNna1/sDgikjHr2JjEEC6pZWyFa2FqJIPBZVWV1jHxtYxS3TcAyQoTcstej6eAXlf5sw8WxSSlZR1Wmj3h1ndYmMzVNnuKu3cJBJaORAtQ38Ddwa6OF2AQ4wFk55AQJmypVe9V9MbF9p0aKOVvmipwt0YUS7vvf9x/7c/927cff/IpEh/Va71ltXsB2/2Iomk3JSpGPG5f69GrBpj734pXbACQbVOLd/QJR9HfMAq1o/X7f79bBtoxyqOkiVr3Hlze+eBzSKJECzkoCAwglD5JI6mdGn0BaxaADUByPKqnEpb1hFkk5hJVPWnY0IQ+QPeo/XL6pl6hwRiLwGLhSEJFoNR7Otfezxd6a6HtK7jTf+3B7v2PiY9zSSZQxjt1tAl+21dKUbrinTr0jsxGUxOObWCG61WVF/jx62/u/uX73Ut/pdTA9Zq7SlmBwb5sX6nw/MQEhh1PosBbQGkpask9XQ2aPpk+FWOhDKEFNqoOUtiETSujif2pUWvLyB/s5uLdLVE33z2PySTxd5eoI+BPFWWHX/z9xdSpJvyiovwOXKAY0XUTwfYEBUrBus4j3CvX2l2hveXaI0UObXVDmOxXZaU+37+7tXPrPWrwbruHrH84aNo+f+MaTwaE9TYAB97ZR38X8lpYhfK3WRi/roqKde5KWSpby7qU2JhuNum5n6BcfbdSk7DK7y7Xe6s6Pq6FG7ugNMQw7V+/glI1mcnGFwYHhnIvKO2PEVaUmSiuot82xdxlVYdSnxF6Uz729Q+p6t5yFW5AigkP/lJDXEruLycHOUnW5TE//aT7l4dC+mi3esBxZaGUTiTjLvvrVVeH8YJ+vyx5N/oP/oJe/IbxTcTdZdc8oZbeX1Z5JlJahQRI4YOU7EtZE69Lsv5BClbCo2LztMs2xsPj3p3lm43xzIxX9rSuk3F4DhQYhq5OwEkZ66IY94R7Efu7EMx/sCw8BlwtS6ZSsunMoDNrbpvhcUaYG2BjRfezocp+Prm9O4gEWSdmmYy231fXa8Ny8PvJLshGbsuMnKP0qNLdlu7dV2szrRtQmvurTK0utQ7aVwMpTXfgu/XNStXsO96NkrG0xDgZX8kEVyYwn/pWu5cOeaHa4AqFwPv5QoKvSwhgqD9fjKi7y14m9OvQKdc6Vnt41AoE3F8/cULU7MRhteygxf5IIat1yDI0K/q1uwSxkf/zP7/qbH9L9ZoS92y49RZOgI/98VenvaoYZf/Prvn//Grn/dcf3d7i9x6x76Xaq5Lj/M7D7E5VMVgXMVUT3eL/BmgzVQuZhtFNAX813ZYY0QDS6NX9KDYKLYIAO+/pOCzkCBUq/oLGbbi5LqyEHPsjrjH18Bu1YVb8eeLEr/7f/w/xX3m5";
@@ -1,2 +1,2 @@
 // Obfuscated production version (zlib + base64)
-export const w="eNq9velzHEeSJ/qvlOlDD5/ZPtu+1N2vv/V0q/f12PTb2eneOXZsDJaoSgBJZVVCdYAE19qMlESKh3ioSZESCUoEJYqgSJAUSakJgMeHooz/CKoA/Bcv/AyPzKwDQGk/SERmpf/C43L3iPBw/8tf/vM/32hG7VY8kzSi+hv/5Y1G90ZyuPL6Qtv9vXXu4ebzi+4P+b2Sweu45SkqUTOaf+M//gugNNutRlaPa5W4806lHrcr3a+r2YIjmG28PjdXrXTvpZXZRnfVwbw+l0xXvr972L2bdoU13Ee9pfWtu2f6n5zbXl7ZWd7ovTy++fwGlNb2wFm7Ei9Ec5VOtpjnA8pcjOaIlWS22WlVkriZVDpvaaW+v4tMdOYqr/96iKrX+2B989nV/smPEC5pRpU0TQ5V/uAeGSSqLLo6GNR4Ia6FkFwPRSTuFbHd6tQ9nuUz637Rve0+mY8qUb0DoK+OdWYrSfeGZw9gqg3XyvG8+6wRYdGPkyqTNTqIFCXVRvdrejUOTjzXzgGlVMe4GuNzJ1soNF3WvbEYNN32V8eo6RjVdc9sI8lmK/W/wxYUMNOG8iprQkPspYR2I+IOMlhJ5x3El1dxc74et/I9P9dy/L3+6xGF73/yoH90w8O3FqNDKTZgAJS0ELwuL1txGofYjbheeXWs7QfVxr3NjcseeJEbXBGy1EEUOdYpU8o3zxTLO82RgH2eHa2ke6ekElJeSUEWPcAtALayZjtrcZ+2svp4zY6tZHuXq7BxL+hjrkUM3+WxuRLmdav7uFHsi2CC5/DzwFyZxr4GUCvH/Fzrv8ZzOOcGd0FhFIUj6LKBDbDS7p0feOjEkx04SrreZrl3O+C8KKM924XhUjZWQBxk1SNFprWkfBEBrkUMoBz7//Efv36jVWtm/xqn8/XosOuxgsZ0yuwwKTaCdApsqM5kYQLqIGAqkNWoOpCUFEdOzI8h5AMBH0jfgaWqlDXidVeUOTk3MYkz8VlvORtYKT/7wtk8ofkwgRFqhmcrchbIX6SnfvPGr90YijuznXYzm3cU/5d04YEKFuLK+K37ppEsNpLc71x/BGgk2CTmV6fhkREoYa6VpLMNNyd+/Kuf/PqNt6vRvGPl0Bv/+9dvRO24Dv8K3dSU0EVT7uOpN12ZYHvGtaiWRnFaIS7dLLrj6j7b+P7s3BEnIN3wXoFm2H5wtffyxub6ic2n0DGL7TRazIBoRkZ5dCRJ41oy4w1Sgc7DKpwHKoKk3kCL2p35uFmJMrDwumuLrv3uHa6ANeqsWpj3ywkAbH99avPl8tbV93u3nm+fegCQWdJm4lqWzWohjNeIO9P5UriE2cari3MtAu198TDAysMwp203AaLu7UaUVtCU7K5NO30CzdN7+l7vPBm4rjWABAaQ+z6pR0fge7YhLUQGCCtOCucg5qqNjvuZZrnFYGuGMByz1aSVzVfq2GbQh9BO92rFVtt8frZ3/6ptNTdOoLJIz83GBSmsb7mguKAoxQ4hS9As67NOG5El3r3RqVVe3YX52r//7ebToyDS+QtpQHywrQfPmV3wuBZ0XTnj/jpMS5ze03d7J09sbZwwcL418VH4WXCKDXnJXh1zq6XuGqiX/o0Ptq7dB2KnP6I2ssJ/CiNAl40goyL5QQqEYZjVs6brtxgrgZMQYNz6Zg3EwObT1Z1LRzdfvscjkr5uZDIm+bmAFzE7glMCYlYkTMMrEtB5nQbIzn8BlO6NWTANzjnV9/pcza4Yeh+d7q297J+6qIsGp0TbzXihVlyZRG3X+el0Z96uTaSk/PLVltl91DmSX7hiub1jV4NVqy3arFlNycWVYDuer2fVoPVREhzBIX2QOmBz/dTW3c+47YSkkbgXwH8sL+IiboSwIV4ZGHWFRdPV4QL1DfWFm8Md0LzODjlsO2Lz2Y3e/S98L3APF/oAZiD3tVkgchFlewiu/V/d7bTz7e86/Vxuy0BLDJreF2jbPkpmu3dwkyHmZXh3pfssrXRX0Bj4+NbWKpjii7O0E4HN6GhiIdEluIEZCSJt7GG4ibNaUu+0GjAMgJVX11xvOak2Q/MQVMLR49tP1vrfnUQbjb+FAg0ps2TeZONjEWuGluVDI5rNUhaPrrdds77+69vQ/uf/1jv/BYwH+iDSP2NhhH/JRlCyDGBaEUvzTkS4N6zW7rFIcpJtxU3HVejZ3ssrTsBtPv2axDR+HckfIhYFJgtQlFo+Z2EMfzID0VwjcqZ/lQeHmzqPapXu4w5pMVi2oZbonV7pP9lwIp6YaMwmTAX93P2GH2SwKGaAqDAWgIeKQrDCh6XAeiPS/hARpRKJNYyXRLh5lLGQk2YRmMyjfH+2COKIskZDNo4ERPYwnKUlUs2Ji5zIdJ29CMuUmpfRS6d6T78ixazczbUTEB4Gyo29PPzgqhqoEIXby/3ejt9u4oqNVBGs2BZJGW1fuEUQ+on+7UyW/dFDG5WtIfdhnu7baszbe0OtvdDSm5jdFVhNYnGRteVtI2MXqXEz3LTxf4Q2yEgLJLA+AoOgxASwaj+n7QMlX1DC46ngUP0GijFUhar+Aq0XKru8dhqlmwK9lNMjY2uRQIMQB3Uc60Pkv5f9gcQeKq/lHytUR4pUI04DITimIPUCcP/iaV+ypbj697z8UyWuyId/zG8GAJPI43+rvL60SB0JRf673REg3jefnmMm7H6Ar85vKj8KytEtgf/nlwO2BExT4K4A1WXKfa+7AjhjOmnWgtUq6/3FSvdO5yC0DGyRkM7dvn+/d+LxzvIa61w3g4RKprM8i76zyAZXwUIYsyoRIrsz0EjqTTdJa6z1kEFnDicA57B616+KENYvWc2RMNa3MklCWNzkA1uXGOy9fM8zGHwUgnkWW0kVnsVucQtwZNFYTvevOki1nBwwkzAqP/nG8z97PMWxCL7lmITt26SGj3q+ZNiyaznE80sIIsqvIBjLHtHxh/50aZf4/nTJQ8nhUp0/4+Mfg+yPf7hB5fiHKXRblDHTyeKZ0yR64RdNCslrJYKjVZL0BO5JdlcD3vYPlD8j4vbkndtcZW2v6M5tjYFl6zYJONwTZDlieAKE7+DbtBKM8c31EzrM24nrNcbSzeGyBix0bditeMajQB5Ej3j23A3xhLpTKOXohn/MTS3b2EFL42Z1wMp+EAYcxxihPlKkh+J8YkI3kI8jpaOVjFZwDSRUAeUl027oQnkxmQk+4UkYzr3y2gyYchMZ4fscmyUHMViv3xXPYai+B0i4OPx/CI9h5GeudXgK42kVXQ2uXw0yuJgKjS3661d5W2s+81YCmFdgGx42doIzsXaOnrJ2QtuReG8UoLcWFjzn0BTF0xvrCghkwxdWLk5utnibsXvnCPNjFHj/zB0HpQq8TQSlW4z0k93n1QLym4y+qHCLkUqzW4y+wMIOo4dWf6R4Ls2qrdhbPePUKW5lGfjE5J1qZhHKbpky+t5r44uyteGSfrCauEVmWloRY77tDt5Yb4gdGG8MztaW08MVD24NrvcIXm0up+u5BBWjswmAp6XAZaA5xFI4Y8QxoPRjyKqIM2GThqPyqEKaGiAtRcyjWahSnILDj9SZpH6xMUVk+sbkiaqMqvi3jBahy2BzmKWAgU0XEWaeU8uhGHWMpRrGdrVOtFxHh51MNp3gKIaadBPo3VKudt+5BKOmnUztt5grBpGedCD5PkT9d9DwEmAYRky3BX1mAIbZdvPZSGXiFQk1ish4y4fyYAV4KLdzw6WUVOWNF5K7JsNBuguqQFZMZE5Pdr6NU5XyyTWJMby/sVfmRINYb5UYb1DZAzBhAf3fcqYb/cgVzllu9BtsfrnSf2sNt18ONtyACO02ZHnql9Zua7bTZEZOxd6pvF5KYWt61u7ufLrS3/hy+6U/GnNrFSDCLUyiF6uNnnie3TsIcDDJPl5yCJ6Qj3/oY2737p35pNlmRm4kB9G7G/fBYPL1P/tu+/2rm09hANQy/DJCAzqb76421WuBQbJxMYgRRWFW6ll2RE6gYBsOXZ2mwdJ+5GyHC3g4svX+V73zn2xdWtl8DhuzSMKbcvi3bMXhQxYiKbl8TGzgnzIH6rNRcyZKahX16H4HTmaO0X7w0snecagGfDU3D5/h+aASyfmgvsjGAuEzQqVKdeM+anba05k4tdypw0lcBzbfd66s9F7epa5td+ZacobMBP4ImV9kIwH04JgphImondRiMeZXaYd02tpz2y8+2np22Rvz8HmJx0YtMBbpRQZr6Oa8m5BFcGf1WvCdpaMGvBbHDY8b2LhRqxVXvZvD6wtp5fWl3NWBCyd6X76vVweEwF8eiPiNZVi+ytvpWoC5SID4epFAKPPLDQPouXeNPx9VvYX+/dnO3BFXwLStQP/sqf7Zj/3dByYyFeA3tgL8qrDOeASwl6YN/9vn/ubg/UUIpszzbwCF/1bcFBeY7krLTbtl3Og/9Wjn5hKOrlTcXehP9k9lH4jBJDI4U+/QELdbUbONrhYoMl5fwCbCQ8gHl3oP1tCLlz9hEeFp9HRa32SjMFho6bOIjOZ0PXPzr2Hdfl5fWHRj+S6enB8hz5/e8292PnnSW4LDvkNultGUY98fxkjF80dewOEs44HoWL3gUAJ6S4yURzppxZ9U1uTofuvYAzq0b885lSvtAR9LS8Df7GPEggqlFH1PJeEnbCpWsxl2EDQugRWSttyE5BQIIhcbstUBGnYKdIMmm2nExhkQfvQCmyFyxNwFTMsdMNeK0pmgzlQFsCBcI5kGOH5q58rX1AxExM1AD9IQ9JSVolkgJSSu6G9RZfFsVE/CXRmw1F2jvHe+d+0Fmk/wBW3C8NcstYV4BKnalPgxH6LORM3Z7uO2aysq+9VdcsZ34xF8BNA/4KQbRP2P3kfZ7xRQczZrZ3Pk5mfpRZmZV7sD5OFp6Hns+Dd74dGQi/nj32R7YdHQD/L3IKMJRAQbakXzSk0rYxKNaRAZY0itF+79mYrTAEh16cXWsztsr8g/gbUxjq1h7YzQRBhlIFjjwOhwq7hVX3tNrUo61KJGb6q+DDSlUZCB+jIKSxVVoKKMZhLdMkyz6L+BMhihCqwaMOJ6qLBWQS3CdoCoJTGrIpFvqNRIskJbvbvmhKJIRC8NvehSYBVZobzSf72sGS5pVMrk5MGuplogCXKzdrdAhrKw+IuSGfry9xU8G6w34z/nF4KvLy121+b+ROW54v5kF4LbD1b7Sw+4aLsKbAFUZVE5+Se7CvzFoFUgULWnpjzZ/NQv8vv3SSOZ0ZN+OADj0wtdCm6unerdvxps4AuN3hPiZ7uPb75RVEULceyVUqaSA7+omswkjdmkJX4ScELn/gPPQELrv3++v3SKXcaiuC56Nasl7QY42Yt/hMHKGAmcMJmnC3cNBEtmRpBNAstMx/ASNJVjR5tK4FBxGGpppj1w5Cl0iaRvQIqTx1OLr0nDiH51DQTq1pfr28srmxu3eufxfglgNlCiBQAxuxXpO8Fzvzr2QB7BTbrrrpYwKAEmB2G2zf1b2N9GUx2qSVAVYKB7Z67FVx38hjeib66d3Nw46grb3LjXu/+esAx7WZWsVmlHc+gK44vo3uFim/ERWEHHeBAgG+u+CjAxTWFSm62r7+seu5YUluB32cMicC0zvHa8E5WrGW5JYWFuUWNq1Uq6y4PqhUXq6imsFpdiqxQUkYcOduYJHjb1sIiRncVrwUJn0aKQxuwhW6msPrCzpNTynuKSwp4KisnDhxv4fo61WsnwijlxfKRYq+2Xn0pZuM/vKxUN7abSsVc27i7LXKJNfzPHeeM/3/cTHW3RDzXWDDCfExBuNnqElY4u0+d/MBXIBvEP5fyPEtYL48kCB4BDTxZIVY1Wb6FqE2cB0Czq9/f63KxqD9xlph/ls5yy0EbTJvKKIlQSu5DlWHu2YPdKXpCZP4zg+uEkx251n5MHdr7+EHNnkuO55LRCyvlT8bxCWTiAV2m79/49PLIwv/c+egytEh5bmN9pcAY+vm8OPLlQOjy9gFpMvWmM1iZ4hrc4zEgs1w9wiWs2Kbfvv+gd+8BvUhKNidDiXgTRRRgVNbobVO0AWJwg/KAifHaE0NMtwpCtShxeXFK4z9pIcN+ENol58TNLwQBsHb5Z7r/32NeBqYqeKvQ+cFOhV8WbcLao0LWDSgtcO3yBoaeKB5cqxe1kPo3m2S5eqVaSV8dgFPS/PbP14RItrt2a0C8YWtk8RMgJFgz8zra8trQc1nIvmQUDU6VBN/KJgXag7bR8X4UuMg2CKwwM61iisNyQAfp7j/MFmLAzhG58S9AmqfO3bK0m3TuHnDJcaRpDdfPp+vb9LwPHEqLR012GFs+SANFz7BF5hqhjSSmct3mjuUaykNR80ALoYQlX8OESjRjqZR+BIeAp7n4LT0qvtSQQrqGc087Dt3mkgmMwMl2oYCACcpNTgzkEvE0EK/QFFjh00jDj2a1mdEijOSlDWk62yxotPzDCQSFuI9hmFkTsR7J8qaDAecRPEHEe4Zqq84jMJzoxn1CHMo53H6lyEAsaVHRO9uGSnpC5QYWKbDYof9dkg0KyFLveyh2dyCrNaUKQGMxLVZWkgQA1cjMv8EaLu1DUyWwcRivNzX4mDaWbkFyY0Hye2NQz/AxqEjM/gok2kZG8l+FYYoy51yV2GBVxACerq1XO51d+5YrmIq/wj+gFMk/oaoH9fKAFRmTsPAK1nfq5McAitzppzoMBUKtEC0k7xrPUekeCD3Rv4CrOmTEcSAQWdocq6BmvJ5KnnVlDl0V3rmz0Lz+ko8m46qDjGTjgdO2FZ+BtPBnCIrHAWtxp6kGl5YTiGxExbTqWcYAxBoKSy4rlw6NcqXLMlVS7q/UEuBPXCK4dHR6uQ2iJ5aTNiwau3/3vts7c619f5nAgrSb70ji0hMDUnaYzIx4TOdwcmnucz7KqjwggSMznQtLqpNXDEprAoCh9rN/gWaAhkQM4/2YkBLPhKVJZTzW6T5pyCR58aWCbM2nouU3v/KPe2hM6uolT93nWnOPb70D7uGluvysY3UXEMB6AsXPsYv/0rQCA+VGI1J85ZdNRGsRJwOAc3TtzdCd18/lS7wLeSc3a9HHqIyUotfVz4VfZbvCM0wuTs62Vuq6M58GbuRYlC4244huuu4KK//nLrVNrdLm05iarG7TixiAkzFwBKsPjPvRrkkvbbsW4c/QY3dsOAXXXGUnV9yH4hufAcgc2r9cO41V0PMb56JPt+w92jl4tZTN1k0tfMK854Gy3uMRtgGzj04AnPzO7MoOSwbi7nTyx895KcMZR5Wg9qHrxwS5W9EeCUghDbBYpSG7uvzvro8OHCOi1UeUjxd7x49vLt+TScDov6yFDZGMG0ZtsHBQTKIiobMugexT7nF2bhu0o2zb9pXtbp06G5z+12MYTrcW5lVwt5liijKYoht6u4WpeWLgZ4tkpPdzlL0hgyeciHuR5BLE4r/DXIhnwabyS5e+OJc3GKpYf/HRShwka7kl3GU5i++sX+tdRolWbHfbHgSnS8e4RTDuKUpyHiNbeQq7h/WaO+eV94FhNu/FMNRDtnMzMZBUnUnx1yIWIBjmhpUEAIXqXL8Bi45RNggYK4Khf0Z9M4vbVMV4FiK6d6zd7D4+hkbuAjlXQq7UIbCc1EuY5VspQSh4QTMqlxu14roqRinlMtDWSwM7NTyiSgDO20loUz5F2iNJOO1HPVHnMRhLzwODvZcnd6LBpRR2cSlCxG+d5KtY7opci+VsmQkN/Qko4k6ezDSC+6Im54kLOg6PujMSo0cwOOr2BFvViaEI9varGE3/acd/OoAuVe1HLkmY8L/FPPNrYUCHOIL+YQfbf/qy/ouWndtlurDJjkXH8EbaLRtlR1oYKbJ6RFo+xdvKWyS7sktAmkcMHsAA4OgbaDRV2NPnok/6TFyXGiLcbSnT7LjV7TqtbLTxcBxv9m9OaY+jMQF8Gyo38YtDZ1qo0o86sMhquE7waMopkJImhQB0wQgOo9A8F8wixXM+yZutQ3AgkssrUERLVS1MrCkcJQi8EjRQbJcO8/JqIuCkuzBXxH0a79UBhrqx/K3r1cLlFrx7l4x/s8vxnI5x6PPdTP7Or89nOjDrzgDf7chvjIbu5T9pj59jLnaPvbd0+Szokdl3ZMtZcK1oIrDl4NlgKwFfS6VdPaIyLRrwAQlR8Y7vLMEuRg08e7dx8n+cNf2Vjm/CrILAJvRsNlMPQYwF+Frd89Go/Eni1r97c+WRDD1uEL3NiJJDmaIBfwT4UhfZHZGKxeGaERTzKnRlJQRDqX06M+FV4ZtROFuQmBGw01hHcVKB3/KzrGa1ALckW7IEX0YeXIBaC+7IeNTjWIFw91iDc4FRDkbznD74x12U9dnBdlnk2pxoErwfJhJyWoJYihnBlWOZAA5/tbriH1N1wRpTdcEL0J9KWvRCvgGWASlGCow3cr4eDafrJ35QNa633K7XiesuSytADbsuoPBcaMRhHGkmlBCj0r2GsgD3LFp9zMJDsvkbFtst3bNipeMghIAogJxz77s1oAn3JZHKqQTP2rSI/Ybfl+gy3iC0zBqeAYQAK1IN9V3Yl0/crgwNRGYhIFYlGDPIpiyUtDFatuBFHKofGpgnkwgRm8GTm1hjsl86kfQ/bfQy1MrcS977kCiyWdICmQvfe3+f8SehHrmfOl4R+wygk2UIQP/6ngx1JgIhDlziGp35qvUiimhtjrRjjiqewoz+D9xOSV8ferry6hiei6I2LLffs6PbtLzY3bu1cBb/0NF6Imo0OKsG0A5siSNqEwIBNcNjKoVKcwGb3TrvlmjRzv1HROBlqFchqRMVepAPi9Y+3Hy65MvvnVyG2orP2WovoAVzxJWMgQfglgTChFVs2R0CsJ2mlGVPSoUo210ggAqy/pNtdS52kwtChr+6+Y+7f9V68v/23Bzufftl/elxv4c21IzwVcQW51WbOIyQjbGTjIGw218JreVEtWYBTkWbU5BXAInr5wfrp8kc7H5yGQdie7mS1ynxHS8CRWes4eztKFVi85xYoop7WDyJETuPlDfGpwz4UGwzWHA1KBwCx225/QRVzy4+dKxD/U6ihhjFg52qo8FhHuPEPMaDCMNztJMU9hMxxtSDxor6/267wOlO5gmp/fax34hGxggEFmFbLd3WjPtafgpIlrCdHGgxGsK89jF637rk256t99UXvxUncbOBKBgO4DBDrhsGPg1aP+PKss1T+EBSKN3jcDL9wUG/SavNX4llxsSV+ei/v9h4+pwu21BmbT79md9vMMVhTjqaB2RbcvK20krk/09qcbuu41Yvn3PZIrRG13C+4seO5B/2Xb6a23B2ES/C6HYEsbj88ubkOF+FpX8IJk7fTqF1ZnDbMNengpRGl027IuMmdxh38QU643ew74qpTFwq2YePUjwo3To/g2aHx+Vk/wTx88PXWmXv+SL6RpRG4IlMvsiJzlm3WMoW7LvPGbh0bMHFLjI7woCHq4QYljBLHS83ww0rj1nM3YnovrhAnpD0c6qGKk0sLwAQ1A0+URpxMVxZdMXDGLw2eGh8UW3glM7EvsUxwAn51zY+PzbWT/aPn2BNFigHX30PZHDsSaCEOrfu4yg3ebjhIXJZpaDdTsXfQddKoZWrlb//mlsQ++Ytr1ngWpoiUzYq6BrIBZK0pQA3HVuJGG6yp0og9CaXLkSfe/8DJ0L0zR04Gw1jjWfH8482NjVI23YCcay9CeG3msSKM4z4mcpMgO9USdmiedIzUmQd/QcrhkbwDWwaGPQg2Tae2briu0kWpkx84bpiz957vXHnSv/KdsuWGCCzYiLM6Cn87PrEpoUS/5x0wI04qzEgwXXhxgMXrRKH5UVL2HE5QFOq+eA2rgyGpa8l85F7b8tV/V7oM45G//munVWiU7pqXfTCXaPZQ7/WXTvVP+TbqPfwG5N6LkzSZFtO3qwnem1Su7Yxygmu+u9yktmop+7LIaKneKZ1aZfoHB153XZxbrC5y46z31bvsy+e1EiOHc8+rphaIGt+wOg1x9zSrV9A1hG5fND3Wv9iGZcVgmYQGbca0wwG9H8wH1BKsQ1xzvg/7Hm4g6JYKFBtVGomfvGn6d3+QHV33ozOi4DDcjwY2VUTRtzrgDq8C3uca8yyj53UgwHOpx4hX8scmXm0aspYUBbYdsmgykhlGkrpnU/OTlWcW83almrFqvQZ2a85a5fONKEVprEYhVAHNQEogleoNV2OLNUskrEpUY2hoqKSC+TIOpXw6Nh2qIm41muP5KZ3Xc0a92ennVYwGPRIJKkGP1I7I6RPvsma1R93WZURVWlKXyVQlQJGxzSGPFMJUwHKPc0fpi0GPEO2fS5zXqJgDOE9cCXnvNfmZ65xzX5NfnWx0fwbeaz8Z7L1GVLjwgz+nfmK3x5NpPW13khtlzho6cmNY+a0rH/Tfu90/dgFP76Y1MgFRabqWaT51Hw9B3LOmfRSC2CnmpDVv4mtP8/UnmHm4RLhyfOvWZ1uPXuAgdCZkdbFFzMATEYsXAD3vBiiAUZaaHWdeB22DIARIddvaOO/QmJy+Dx48S/C8G6AAxochhxNZjZKu7e0vAUN0JQzV7zB33jvWP/0RqNt3v+C9LCY3xwv8xpwu8EcFfAsawIVI0n61qOZkM6RVoTv8SxKRJMasBxgIZPvTj7be/2rr+lEKBLLYjpPDDZvAhBBs+hJ8Y/EUxgNYWvVdcLZ4FVIoTIOPUIODHoDZVuGLxs6sEkePDz7cfnACblI/XyJfj1Yn89Tq5xGCpnHFnO6awlBN2nLwDIzxS8BLkDXugolGRN0yFx7bvH+y/8gf26TgTGEOPdwKMBeGqCQGkcDmQp0isr0Pg+CFyzBRITGzGyUtP43uYHJiiE/TvVdll6qtlTNbl6/07y372Pkt427WCr3N9DeLpiiG3gTO9w5nTdhugtWKtiPrijS4a3T7i60LJ/zpUSNqt4CyY1oTgJqU1MsEXmX0fKsm3eVpTtkdtuvWp8/7n5yz7WoKy4eR1RJzUbbg6FNu+YAvBmbKg7NvGRafXeidPNG/fot12JFFJChcnTpCQEGoLXqVr4+W4nfKqBAfqcoXEoyQIx7QbxbBigPSpEgOJhofuDUCI+PRBtux7SjmsHecAweJgrSL+CYbAyVIvYhUchQGSx9X1yB3nwXbfLqqeIvwrcaOYspGADSQF6Y1hOLfVe9oY0D8ENJfxzpoCGw++7J38hpuw+FXkf9TY951pBFGUku8u07QAOA8BOEg227NUDceRChuVmiZtwpqs3/8dv/T9d7Rz3sfrLLzkKMjQhbjmH9HwDRKiy0C4bV5eqevOcgcWB4nSJ8E5hXMig4mdcHrCsDfYYmERd4wcG1h+cPtUw82n55Fn5HEDct4ulIDo83ZS9VODZ3lU84rHGJnAbLCWSBuSg9UAoNdGnBofBEIUn0RFNiOd8YJh/xuecyByWZDczpudu9UST3KwH99zi3nb9RM9LTt9z/qfXmbFGMjiZrTXiMiRFw1utCD0uYagoGERRCLEJDTIJnNUrd69pYhbbXcwWCmqfiw9O5/11v9CuIWYRqqditxZMZAtCgyQcyrvcByTxuUVHeG+c3e+TUg0sv+TbZ3dg2KznP4Bt/EvFceYhrARQ+Hfo1Rd9USh3BjY+WAoBlLPRthsTDuAkMWFxNYDEzAeJ+MVb1X87doju7GGM0bot5qNHai2obeJBRL0Fpso+01b6sFppRYaBDCJyXTbHP9RN5OCsyjwHQxxooaKYF5YqySnBkx2ogIDYi9KX2jssdQ2P6PCajRog4ZqUGMhtsbdah7Ah0xTEN47ZCT4HsQiIHszknYvcFlIdy+JWFZLDX+7Z9GO11Cia7Acr9LX3xJQDVhJ4in9uNR8dS0ElM/zodTixaaMV1dhGTyMMPXqzCVpyvd9UUKJ41N8snmy+ub6+e2Lom7shLazPQBmPfd5dcWXkFzcEWoNAfU0KC5a3MC1T/9ZQ6qIbFzPVojlyxaXo4BVcAJHUfbnQamT63EzQWUgYBHt3LBdYRQtzae9I6DYRvHzZmKm/QRiM+EUiHinEvghQNqJK0CugFVOJIdA2F0V6LTSDAIr9+ZWIfws9jJJtDzx59CH8uSej6O37aLaQa1S2l8YQNNKGzgkUnA6pGJwLkwEwoVxpmAnobwKkEmEy0kcM1k7o1rJpbj74HHCZXBzpndr/FRLpavOr1HHeZjrX14zLWxj7KWRNjMRUiTzsSZ1bjfADwHgQuUaXXuY4bFuQ+5NffN45DbO/joD/iEXd77IVYpKo/wWQArZDahtyavSdC06vanTauef8isv9Ie8CrAhVblnQ5pVQ76I9zm0QKfTa5/nk3LHnttEmf+yny+16kdTadjdbXDsZ7ouclAFkTPXyfTy4OY20snK5ZPXuem/az35jSshd0a9inf9w86NJvjZz5PVK5Mf+Y6M4QZFpRsP6phIpJ8AoLWSEMrBFXyeZlnhF2OSFpVW3SYxCETRqS6jpfc6LNDr1S6FKZryfTPzf2yiZ+boTqrdEaZ6ZSbl/urSICyz1Fadkbo3v+xLLwFEhyAo4mqK+Jf8/Et+GfuxnyAC/4VIoURH2Em4V8MjnGBlBRjjGsw5T5Xay6FbeKOzRhu70Rj5nC9E51GGQW3yiAexkGfA0Ofs0Gpx5GU9yvkYwkDsBcOoIL+8GA3xRMlnx652VlNowp6QUSUpb3BqgfCgkO6xFU4Mn4bDuFgdb02hyFPZNesd+J479qT7Q/f27r6fu/86d75B/1TZ7ZvfwWuELiPNld1y0nwfQC3F8qPwGUmdc7MkM1TSjcfkeUG5phHXLy65INfCDE3XRI3o9kYUv3g6F3GS5O14MDjxYveyYdqnRE75uToCOHZkwHIdw/vJA4fQS7XcvdlTj502GqdEXB4X+aI4vgbMwJuXAOF68AjkPk2dhm3pLizC3haDlyCmoMsxzMXZwRR5IvjVZuCA+asn6BmUEVNoN5jPuSyAKlccmw64hDBBiAFxhgcBIFHPQyBksakjrKN6e9gxISvTvkhowa0BDEHV44UXp7hirNVIc3I10OwCSVMGKOp1/+AFsz1ctjDFChMkAyKXqPZd99GE+pZwVEDTIBwRgdsSW/yzJOuJDhUSiFPIZRnyPSh7cAAYZDttYB9WCpi2/FsM7LyPRDNwwQzC2UjDIeKQi8GrQw3VdTqGblkBNLYVDnZMKEpPKEJRrVwWr0dGRmtgjmYAeFcmsiA3ecIK7tLQ2C/KblOQzQHEL27/LvcfRr5lSueu1Ejv4LfqePin4N8wAPNJiZDswmZn/qVsZmiubQzG2ksmYtzR2AbelZuHv/1ZP/GGl87TtGXHy2Wg0gjJ1UMIQBE5ynYViEans+Sy47i8NngW1vrLzXmVs1xO8dn6WkypyZaIuG2bmD0PkfiP2bDDD73AXOaNY10ikHDH1u7rPfsfH9l2UfLgQQm0by4djThb+/ZgUiZAVIAQ6peHUisftJJNVbvgRt65tu//GnvKUiEatKcjjhdXy05GHunAaLMlBBv8RPpzvWbnlSTIACx5pvqtFu86Ftpou8zRpBav7v17Dq5Xh+KKd0IfqgnZbul065tdh9DYpbI9zD4Wa/AEN/c+G4HNwAXmxl84z7C0w9HlPFjJ4+SjQHCFVcUn2khauPlprrcw+7eeLuC9yfAoQxtQJOabmvpDN6euNL/5IUmqIMMVJW3M3B+z6c0rkKCK2NuSmnFXNMl5SavromEsuW6/7OPjS3XuqdgsYF3TeKKXfCV7K7PoP81nc8EuZSXzm4vf7F156XWDk7yasWaIaC9N08llCTR5rL4TgoWmPPKwjJd/Vyx1odISw7qRuXYOMVpMgONSrN3DaN2YlQJuc+wdfvo9hfH6Q7DoQwi1WXJXIsnklCLkyM/ZrvF4iULk8teZ+edpN3JpjXezw3I6fj6wrwe3vbWr/QuHqPDW/918CCc2V/HRdL8Zkwq0fuaGgDJqep5AvLybuvUhw5K5V2tAc4NFLoPCTVuHz5ZECVWMgnYh5/yQnQWluYLlKTx9SVX6tqM3mk7/2Xvy7N8oY2/a/0dhmTXxzhAcYK8zUlmZyluSYUx0fR6tvPFOQLF7llsuxFKlAaSMfxhJJzaasQN18vfo+d87/TL7e/OYNXEgwsPIulr9ST2AEPJNcKjAHDnpDFktQL90vCxN+FCcuXPJtZm7/zDP9Oq++00OtSO6KIhBctCBADw6f88qAxst8Y/wgP624chTIhB4jaNa3jtAy/vtFmvbZ1aI71Gv5Iaxj9FStNTNoxK9DE+aCAHZ7ZAn9isc3jFVXM5bd9f3r7/gnYLZ5MWpyWKIMxR95u4lfjURQZsXCiNJefB0hzW7vgySAWust1xZaAGBtFCg2uAuSWmloYATwdYSmwlWcNmuFnjTRpjlYyySdQe2ZNRkbMFRlsC1gpgzTWdHI5LNXBO8bpHiJWHYp9jGlQ7qVF/2I+iVWFVgJrUaDJVYFRXHP2uW0lp7FLjeG0TqAe85m/VQl4n2D9Vig+V4SK/rdj1kluFtpen5q9QIg6Th1YWhjJrhMQy0srInCESR6VNOA/HnIWhXNgrhEUohKYCrLcqTlzVssLmutNyoOR+75Qcuh445eAGSpBwjpTe5tNzvYdXYdzYRSJowD9VfsSD6PdB3vFBC0TUmlNTPO6mfmkWh3EtVa2wBuHvgmXT8b/ZZRN+Ssm+U68h6CHzAEooJJLbO/Xqgfx1GgmoUevg3GBBs3aYHZw33tu+v8qZdBJ0LvbuDvUmJPwsAOLvaxDW+g76m9xf7X2+ZiBCenHIpydN/nEHg9AdCSzrkxe2Nt5Xsxq/L/iuE6ZZMNBnvDlNog1ww93pjXWHrLvTgmw2pwUl9Byg18ZtIE4rzDv59QbOA5vrJ1wVes9v2n1qRNCtIypGNqkt+gBYBaR0cCVoZosan+1RcgCqp8mMKRuZ3C+yLWVZDBFL0CxUGU7eWYBZ9s4ChWrrwbLWXLc2kVb3vSyf8lzWjjq2LFoJVLhDTehuEAzo+GKnUwfBpjWB6zZbsUFLejzs7cvkqoUwCqG71fvv5mgincyEslUNMyaj398qZSzs2bBbcTPQcmWQSlAsRJ5+wGY1isfBQlQE6L6Endpay2mHxyPfjyZHSWLbSyAVPbsjDATARCbqpGaRZ4YXZh0KexVWomyGyE30EaSF8berlpNBUrbf7N7/vmSzGT4/wAMZMP8tt91Mv3Mpuc1moU0Y26euHbzTDDS4z4x//MJuM9cgKrBZ7TVeX0L76ctv+mc/Rxs6SzlDwOqCG5qHNVA3kw4l5EWmkuo6M2s2NVOuW11PVwADpsKTWw4B5nAUS85b/VqXcPw8glbO4vlrvcMHbKu/4fd3JcWGHClc9GnCWiWbi0QfXNuDF9bXcO2diuRBNubCuQ1oG81pxdjG1VBw9CSb3nDIBFbpzK/GR7BnzxcpKIKPboPhJCgUgjrqOMxk3oc/8OXYAgLUEC8HZDwMLbciNXzz2pgOfPyDLU0sS0IY5dd7BHlY5pcKCkrwiB4oh1BwMTTs2k7LM2vsB+xBz7MGJTBsqwNSgWt5aZvYD7kAKwQJc2GFXJc1b65pOWGP51A9nYojgdH9ODBj4LICWWp1PPwhOn8gh+P2PQOoNVE1TNrZn4s2ojOp2L9oEhTZImQP6XE8giEdZE5EPEAGClQrTK0s9JLwIAvCDzZUEHohaASWGfI6tL1YUnk0JkUoFPY+S/c1U0bzKuM3mAF7Hld76PkyXz73wz+V+PIBQwcqrhauEn/KOfLRb1ytnBsf/Yb5pv4xyBI62H8PSDhFVTr1prUOOBPAAqSP0Bwrs5Xv7x40Gw7b6/d2PruhGw6H+LAEt5WYNtik53caP9H9/zFy3//4Xu/JB5pHYAEdC9o5KNkQTp0G56MCCMK0SrGNoLcvnOxd+0zOjCEGFW3Pt9O4s2CMCATgzVqYbecoIvr2+t3t5/eUlm0IouWDlCNJak6+DrHe8O3x4AHoCWmPefc1FsRksgPDj5mEjl/G2Bv91Vv9jY+EjIrnL2UXBjbn8P4BXZp6dcwN3DvJQYzhAQhnzm6ffre/dArs07n24lxTblO3ust0AVg2cAUpszgKQQJEzpKEWE/No7gdzUctueN9o+3aoQ0dATmpMK3C9tPz209v7lw9v/nsCa1u5uejtnCTIf0Rz40iZrjNeajCmIB08jMCg/1HN37bWaan6gyjpmXcaSaaUAx7FS4rdjCd4PN7/Stn8Gqi+yzD78gziGh0bPDzWAjq8kk0emAR++DxmEDjIKXM2D52Fa9bNiMpvBUnM/bUJJ6RrGt4cxrmfO/BWv/JC6WTIolSThfjdlalAxhQIRffdm3nhuWqXr/euv1R//KD7Zdf0wEWfQzHV5QYztP78yv/LoS0aBYqh6PbtOGpGrpAQwf7c7X+NzdcHxNjzSxL6RZSzZyuEYpnjZ7FodqhwbhFlCKEoZd7qMmCXwNwH5tdQ9fNumWIcqCwZdhMZsNwKMlC0bmAcHPJgZ/fs6ftgh7EuQBwe9YeJTNRczaLm5rDBlpPc1qc/IyyTCzOzfNnkvOtu2oIVQibd2NBcQsGYNSQ3TspRkBIXl1LnbGIEB+/2D69is56Kf1If4j/CpLoFLeEbo6HtFwwP8gEr8I2iutddOaqMQ64RrnlNKxaIBjvDOH1T57cubLSP3Oq9+wKDlMmxYFhXzSjNImmWaHTOxzwBdABiBZL+GylTpQ1Ay67N9ybV9fgX67whZXew0vu/xhhEgiENSFXvuhFtAskzryIZBJjoBG1czxRJW+0tcX6527S7QP3qTYUE/pWwheZNtIN2mkMiTl0APxtGmVBtxuOUBVI8fWOr7kK9M5CjNIj7dStijEcFnwvA5eIxyFllQXfawaohOstxV/DzBWHKH0Piw2SGJQFKqHqmjxQHmE4vSSCUgRufQ8wDgeN7irTy6m+p8/GYcADWHdzqX/2+lxNyNdOErmp/hH8S6ruqz2YjGtNhOluC4xtTXdRXqwVLA/+oAZn0dwku9Wam4Gp6c1EFeUkvllqq11ozTn0USVDTq04teACo2uYyeXNrdAyGssu8jaRNWbGMWW8GeNNkWH2i9ogobEw2lSwZoLX5qN1uehx1bmzQ6rlrE0Nlwlf5nTfOJovp/V2q/Imok+88B9b9Ou/KqmHyWn9V2XsGBKWpWtOMA6VSlYk5uTZKDqVZEY6DJMNIofG/zwm9ELkBKD9XX51DkCvLwW36xjQrsWdvejAf1f5EY7d3wX5ogetxYmmNjWFfE393KzFs6TuJBl7S7OvCeb3Nif/F4/1bl3WhacTSU0OC5TUMQ2U+PASUhYCKYCSivcuEmvcn2b3cTvRtfc9PMNkp4uTd7bfWyK3n3Y1WeBtAHlQ+1MQRtLL6l8QxHqfa0Sz3nyHE5TFwHr/9qa33pNDReMdyK3xjnhmB58Qg+17h6l794xpTvqZ3t9BQ8Rw555Ay7fuHXi4dQ9F5HbuI4WUfXsqJYAPMAO0AMac71tOzVlfyCovXZRNvul9qLBbv5xnkvBDYEXzOCFA4YTfMDmoJX03hbvzhks9VcwzCTuIkGNHnAh8WypqgBcAhfvzCDOQU8shQFjm9OQyzx1jml42PXxZYDytnulPsmuj/XUskus+vGXMTLjiRrxwVehK3FLNs5TEJBg8oodRAKUceAGNxOMI4aiCMZBpoySakWZG9Ai7xKoKGJEso760M3vPc27f82AYlzxAzQDf4xDafTeXnco78v9Wcirvvobg2jXA/PfciTz+1ntxBeqTO5DHn8Bzoxm95ZQ9/NVI/jXIPzn4ZN4R0735ZkT5lRztoamfWb1vne461nMEo+DSnjd5kGgUXPW7M9EfG5RoIwj+SKjZKHeUMPIjA+l2TNLuLmtySnTtoEtUNgHM5toNcAqU1C+xI6pGPlclgFQRRWN8Cqz3LWbH3O2/fdu7/5kFkX1HwVAzwb2JNFOl4WztHWstEG+9cxtqMyhywXCQH4LLRVSKeAv6cgpllBZgrAh9ay0Jhg9tCVOZMnuCist7Awh83q7QdgxsCy63UGC+lCJ+AdhYG2FtfDyZkurwHWlbFTqIy9XDi7GyikiJxaIsfg65CFmwSIKKDOsROwDyjgO5mqg4LauIKVTyJQR9YsspllCADq0W6g50UI+a8yG2W16jLYyHSzKRl/oPn+JJaL4KKuSHdUZ+TIXj6XIAHKKpbfPDDaRo0sNIAb0fQsA8h4Up47wwdsoHDiq7MralpFwRAW6IGEANNJF25coY6I1AaFqmlCHDjRXruyIU60lwdkWbl18TlCM/wEweq252OuUmKPtIsr4dqG1bpk9aAW3mSTEmo96gubRCpGnkSTOlLJplWIUSVwghh7hGh4G7f8wZZ/o71zdnoOnPsLuCfwchKn862DpjSjTM5O+fFvwjWnAtLTbHm/fwsv41Chx+evvJSn/pHm8zw7c+lGor9uHeBYlvLypCgdy4RLR8mvB6K2km85AcCveg7znL4xJdzVjUS0mba6c2n27sfP3h1sZ5StpeZSIMy+wxUtmrlje7h8zh2XTyWVLF9GAWFLbmMdKpYvaP3t66cEJzy0OctKbnU2Esq/Jy98BFVG+F3kmjRLKmvD43U+EYzDAQMUzA44+3HxzbfnEHr9a1qzF+Hhi2hBCYtvQq2g2kNXOZPDURY9uNrMKRn9dAKLV1AN1f33x+kcbQonxp43AzZQA1Jk4IEvBTh4yq83CbSrAwdjTcLySw7Qcntu9/KWDyuWVM3gXM8cvdgBYR1WciacH+Pobr0ijmPI2b3Tvq8N1b/Qpm8tEP2dfc0cE5AdARwwZIuPWv9gScQ430xmOczmjWNzhjacAIsjeejl7vnT+raw0YPjMUNyu3CZolh+mnIJ4AvSrm7OCCcjEEsCzrz2CKC5O7aGmBY0M1me0+TnXx6PTO404qnkzbLz7acSYPejJVofPNtEIyM6XwOTIgSq/EOoHoW2rQNGrCVTrOnsnRZbj83ou/7Ry7SOW36ENmgB5sbqEEXxkQpcfTMv2ZKP34c6JgnNKryVw7tlLFkYUCZUDRROmJNEtIqsFluutzOB5Tc5Sws/ru1rFvfUy8TtbiZCFp5FOFpBxdRhGUUmgkRYiPJ4cpIsUdiK4PUmzrzaerFNi61kjqYaKkunH84Wfe+9HI2K7MkNqQGg1L8ei5xYFU8nxIo798b/vUA2p0ULj8vU1H4v4zPnQW1sTH18j4dA25oaHxQxST8ApywAZOUvfUCHMSYufT42RMLaZp1GlXOVC/G1ZuRknLyAvhQ26XO8qtcw9lHOLvSquZRpIYOdKIGRCj8MasPV16+W3/q3d1SLTniYC2mPhBd5cYLQvAFMSQy9YSP4rincmcaZwmM4XkHd07FKEeQ6r3Lj6i9LLzbimbJpJizhPLSPVvdgPGg9cTc1vpi93z5mmlqfRFtnvWPLGezs3gFzMmKYcgCcyiRxFla4gClNEQIf3gHBxs3Y6wbb1dO0nzc/L2Yc6O24UVF1pw+7e5JmwY/QCWS2BXsBPOItoSaj8EZkNoLVj1Pky5e8XutfoAjRho4l0rUNV8Q/Ue6zyvsCQ9Raf7uC35KZ6wthJNtX99smc1EEjtUTLbyOtQuu5CgFm5GsrB3YFkAcheBVdxNwJy+Mx0H8Ovvx8jY4Yr53+VpsuAYktyZQgbwUbET34xIleGMj/1k8IB0WEIxqH51mp48oIXVim65dLD/vUX/UsvJOQ4fW5yeVajg/gqzM2Cn7Gl5tFKoHIoegRD5cjZiIEJvSsIUR0smMocjsT1JkObwxGBzy9WbDG59QqWY9crWpRZrcQtKSzINOjm3Dy0cSwTC8zH7+/i3Opf+a5/7MHmM1xxQTJgCpnZQgrd9Ww1oio5CVpSS+eJ0hwRr/jiVIsNDpjWTxCOX/e1yhZ9AhakaeR30kuKH3YRwmsXCbw5vjI4/vhKXobnV1pE6fEVFxUeX2GB+aOrAF2PruRtvrB8CSF2AdQcW2mzVRudRpDIkmqxhgk6H1dlmBH807ObG+d4WQwlgFtpw2wKB6hhQVJENO27m4MwXLjN8B64CBmcV0nbZ/WSEVh+XpXrAtPn+bOqsi4YUFIePgQuIIbBM8LGKjQ+332ShufjKdPsfuN7SLNrxHBF12jhwvJlxQ3R9GQqN+KLgyV/MhW0te/U3KlUWTvvb7h4aj6XMlPYGdJx858s2yhsQJraHnTSZmfpqOlEDCyLZ0gK1U5acVWS2akwe8tiB2POg4U4Q8+i9qioaHqMIBYVYTXD7gX62BRiA8uXY9PlBdhEJcrk5vVYFZIZlpuzExz1u+tBoSmeWtFPvys5tmKiA5XksMPNx/jQX7mw3KGV/gzht1thTOkfDz6xYjI8sQLmp35sLMV6PBup566Ey7qKIQI7NfYk2lo5079yvH//W9rlWYwbzU52UG6TteIFdCvizQsBDOAUxJDrDTIBSAN6YQgiy1xNrV/T8ofAjfg1zSfs0xQfBLpSLgwGLMctyPbLTwWENwgRxm9MRvjsL+coHHulIxCuQVKuB6YWDLhRmGxsFElgG7DTJBSNbSb1Cp2XCMw6LzFmwfJDNGv2EZNqmdsCQs9nKUJtP1+Esf4Ezpt++KboAy39U+YHTT0VGn5cWt708+hq9+GrQkl5+DxwiGiMPsu/dVIsVIB9Fi3zlOU+4NyL1ALrVFSxDAscQOawCt5JhvVhrW47OGfrhbyrDC+wri+Ny6hvd1tAHjrEDI29QfzDheGcOzWNzqUV71SdY111yIBmz4+XcKxcNogGRq29H2aQRBMbIkwnnkeWXXWgLfJaGBdlgwLNswKj9CaHHQBaKI8xMCYKJPhdIE+i7krHxnn97jTFeYXIFW78VK2KMZrBcqJcsCIQJRCI7nEFtxfaRqQOKk2FpkrLyUmtSQiRSc7mMZrDzyk7Pfc/1PczBsvMO/f+X0psO/j8AA2Q11fz/kj0I1c1Z9cJYYKF/znIsPbmQLMOqNCmI5an3Kd+/6+ZxO2sySd3r65NY7prey+sv3Rv+/2r5uQuaVZbfHAXN6fB7YwPoxgqC5AUwdPKqR1Ri3vPbLPTjupRs2YPxh51jvDl0d797zafL/VOQV7m9txs0jy0GKWSt15JNW+9vsnGx5Ir50qrrEGO5YYEzXVDHpII493UT59vncEjqA6cgzQknroSKD/yIhsJIFwIhR7O1bp3ZtFs1NC9yauLuHW0PCcmr6tT/91HvaV1NsBr8WykUe/lQa/SKaLBUxBDLk5jApB6+roGlQCA1xcOE33v8hLR1/mQF4jrQRwJIR5K6kuu+wNvM0owdOY92sbxLXDy/M57K9QC9G2kf6n3gYwNRlBK/VKcD8xAaCa1jhsokdrVr8/hvdPZwIPm3Ic7zy76RCNAMR8Vk3EwlHWf4VfFHWktJ7chjUXZDWlTWpCAwyDrjnQ7kjasyyH92sc8yTWFS9tkb2lH3GJ1N1KOzRLB9oNbTCDT2mdqiRpxVddnry8cxKXBXNUKl08f4GCVS6eOgF1F4K/YhE+Iq7xG8zhKr5QSO4Fo00As5SRciVyKaK+nM7tHiUa0JvNhu4H5XGH74C06w0umwQqtYbx4CAvNWmVlc+OL3sMTvO+hVCYNon9pV2H+bbwQ18IieKgoPg2TAL/d6tRz6GEGmtkouCj7qMZWjRnuvdMrTlcZh7HiUEeXk2Cgz0L6vTrzbIFlfJu4iYjPY1y3hhweME+GAxcQsJ7VonY1ntecD9fQb+AY3iqCoPkm4JazzW6/27/ic6c03UhHYp+dgrFkOJpXGddA8DHOwRWHGACZ3BQClU6aUQO1PzYNWWodjEGK+O2WUij0eoLPGhrEjahkRlWTdLq7Pj+UHwUxzsqEkkrIgLYPZkQeWLNq2PeevufEEufDbXaqkvIr9am3FGAcck37lfr0W1k1hYRh+VwvFB6AEr1whIDZqN2iGFRZ0mTBlKrjNuOQTSD0OWLNgqXUSHrErT+8E95yB70i3KS8ijuYH33Sf3apd+sx57FQeQ5UVd8dDDIuhASUIwwZwG3NCSYQSk6DSwpvWm3SFHUyjEzGo9EpbqUfQdq0BjkaOFK0XCgW2M6nN8GCoEBgsfuQUseRLyBTmtZnKIukICGCJR90koDmLJ7uViEuEh7kn+2vfohKUX+V70IzdWwjNTBQQ9tylGVprcrQABxu/hnTLzDdhhlu3mjz5tYQY0v/5ZDbMCug9YEdymsM0W5A8Z460z9zNjB0jH2j2iXUKjnLho0UtStGWRVqUVibYIRFINZAXk8HKhrInl1y2pljgWME53aokAdXSUlJ5aoezEn+ceR+qJr2BpCj9xpjDEFvhbwV0GOIZxXNPup6aZeGQtUKVC8IxxSDKgJVjg2XYvqvlzkjJI5Km5I8M90vurddP/+m4nQ6fFPwLAIeYIz9PWabcQV07wWnRzRuINMMTcFc1Jl29TeVH1WIkWCD4VdvDg4742o3NcXMT/3KbC/ALaiZpNWK0ipYkhjqE87F7y5Ctifwv744A7pTbxU+PePm6dY3G72TJ/rXb5G1tygIJTeq3U/wS3ilWr7PL6R8keE6isqz6yhbZHATQUsMl1JwinwwbsAugkQ0xcDVGle1d/Kv2/eXyTUcL+rDp4EHFSDj29CJilAF8dVdnEGAdvt9A1VEkdUPjpcj7t1sM/Oh+o9gRhqTPXDjg62N9322VDjxFqJGpOiK41OnWnSDrZh5NDWnLJw4fMkLuZ8ifPoI+8yoBtkXCpsxXlDNmJB33kuJoW2eUIT21+yVJswZ75H8YZW8NHl5tIQgIQ+zb7LxaDE+mbOUkA5ALyLnYAdjmgMqeWXTtii0pmxhZEnZEvse0qTRIbtF3BDTAg5BKxxK6Q8+U0/QEJrLRdtC07loMT5DdchzGX4ROwc8GDU8jeK3OZ4tr5JZ3k8RzYc9oG1zAyEcBHQD3oNZID15mkjvRxPse08rp036wVtWbby+gOYABnyzKuPCif7HT4pdTim9QzZDZM+j6eVcF4coA86ajOaxukb1S6hWAm2yf3lfFMdjCOO8IA6F5QAAIxetQNwdbV4wTVB0/AAzujCRS6o2ZPpObG5MYPSWnVLRT/+9LK89ER1A0fD60v/KJ7aXn7kV8pnt5Wc3an0ZPnfh4BMrpsRDK/n7l4FZCTutuDUZa2zGC3OBpdB78Kz/4QfeUqjh5mywo5rkrAR+lTcbEd4tJxZzZqMroffsY2s2UiF5m9HA6v6kr8BbQQWMLUwVUCu4UAF4/D/APbwLbt1CVMum+1Yu3mIBsNxKYcVByDs3T7gVBh6Tz7Xcx1Gs12+z2SNMrldAFDFAU6QAJkDQc5nZpJnUfHs6sTlH7WkPZj685drTXm0GmsK5DEEFu9X4xpuOu8H2lqOH8Sma6FVgNQp4YDYSvDUbuQRNncLgYjJS8zCw6SCDSp0kkNhDOTSTnYlehMaCcOrT+xGXYi0wiyzDuqsBi3nEHFoAVYpTMBDhch1+GFiItjl9uj9pTrUXuAwR/EnAaxm6n7EGmSSOP6QowwyNQ4HN82v5ZPNQ4DT/TFl7imEo1eYLC1xf8j4XHI+heZj2383xZHpZCNXziOZ3OLft1Mv3JLllWF7GxigCDHQuQuNMh4IOASNLjQLgfbExaWTzcM/CkW1KGV0XKSxPUKCKKS+fxqcKhcVEJvXEZ1txkpkJprNrwNSaxAje38grMdawXiX+4lTfAxWMLn1hLmepya/ch6GdJj/iPl5M6D4v5EAjjcjIVxwZn/rFm4XAk5Bvg5LJY3p2HPs7xy5u3V+mxcx0vZPybcqmW/i0G5neI98HgjqowNRL5ptRVZNPddcwz+rfbvXxkGgRoorxB4jA3/vL7HuHEC6aiZubCxG6JPD+G15QPeikMw6BpfX+uU/6H17mHXX3KeTJ1LNnelZPCAs3Lpg5fmY0ls/tVlRrgNRRxniv/vWFdwht54Oz29/+Dc9CoqYkhllvzipDHiMbD0Lc+RGE+agnDkP8UW5QOqq5lj9d+ey7/qkzdMBSS7OZmUhc0JI6EgovjJONhnFDR5E0VDkSywZZs9PuNNvaa53uo1nNt/DZ+1sbcL87dh9V4St2FeAn212KMhpDusmj2E3cWqMzowl80OMLYLaWj/Y+X5eFvfsmm6n4DVuYQ0k1t19LQKNh7FatAElWJtpjpv5ab+Mt8ToeTc3jYQ0uxXAtcO3FzvWbvbXHvWc3+ASukTTn405Ked4y2vLuBLBFUIsUYHDXIZ103Ky9FQLHRw1IX0DuYf2bx/o31oiTOuQnw36btRHmZ/11kGXUuo5GvuYemvXx5LPUyWoJrgunVLCGu9F5W27E3Ljcu36Fynu7mjS51m4Z16xF3nWSQDIcIo/b5KWMSvfLJw5Babm2Qp36s7q5NJqOfJDfO80KCStovTrzsrm+7qRW78JZ9h6JIemH3EJpTmfWbUTwsgBOQTy5Xj8BgNSfkTZrMacbmKWYgK/Podb+8MbWxa+QfDFKfYukSfebaNqHB1KIbBwEYkIxdAZDsOfY6TGbo1gTSVN9ek9Pbq2ckSo5rQifs/CNE6BOAtkrgLuBk3mteN4zjeH2wF6mcKbJGC7bPXcezufCa7uVajOyjddd4xglBxlt9aPexjrZLm1nUDTF8wefidrnxZM3u0CT/GseTg1bfrF75jKPpq6N8iLbNW8GTYY/Wi6Q40Y9LBd9Fzy42Dt+D1P1pCSFM8gt5wX0HAc+en1u2slQdBK4/rK39NAns6FigUoKTKrd1ZmkFvuskp598ilhaXTqDtWjt35bg33X0qTDYimB7eSaj/MNnh6c6yMEtVgWRTQp4wh/oHZAo2GMqNgH74JA98wlXs6hIDgUzmv7/gtgdGmlv/oF66WqYLgFTqMjuknfNoqlIeOWaeHYwhWABkUi2rtJul9jMm/6jWn4BUZfaK2NZauJnWaNq/EtNG9ThabQSEMoMIJyhovUHGeGM1loZnirJWexGLtCrYrllMyJ7YvXrS0hdoRaAeU2AOt/o7dV85O+F21tNHVerY5QqqpQA1WoY4b14N9u5fWg0YE5fbULfWA1VU6v7A4lC1BU/I8vYAPBH8rpXYFkORCQscMkLEvXULQOlCQi+4zcm4wYGuD8Q7/+Nr8FAPgA/w925c/l2PW+KfG3QYbnQQt9y+LUmznfnuZ0NMOOPRnfrgz2xXeO3uid/M77VMCsjmY6jahuNt4jzWCAcH7r3U0YfteEAPPs4q7leA93KkY93HPF5Bx4EDBw38FmrWWQh8IoJ7qrMIsZnkklba7f3rr0uTYiUqBrKfcbvYhzoDTUAqgiTg5Er7gfoWdzRGCxwlMCgg2cSxhO9+r4OSuHHwCdwx0E6o8LGNXuIwfQupXMyOpfwEi6Kxiym4MtgbR4g8DyBweJtIE/Nii0g54caFN4TwOG1Y3HkGdfQFn7SvilAHQQYnByoJjA76xmISdfx/vvAd76bXEsEUDd3yxt15IxEPY/p1YQMAMkBwgT6vh4gv0uj96thH9+q5TBsKMLvUwJDo4E7AWIJWgWqhxnUHAaNHpIYFnBpwKvIOqMhNu/EOLTzyOj6AfIg8lN2QlPpHD+5OaOTpyBs2a3zRKOw4mMmLJzAfylJP8BV/oA1RCL+VPucEC+YNZzpwPyK2QxkDJ8LsrBxwNER9kP6M+fv2mTHyzg0pIvsLw+B7FD8JbT7ZM7N8Gh5lCcLMSSghIMeLf28cvk2w23qOHdqXsHMRErOsWv3tp+eY1Tcy7U/Bqd6WVBCq7cs5kkxITbowhjLiYikDrE6veRYI/mpffNx2W8MHWwNE6zhVjv8txIptWR/Dw7ksMcpa+8Ny5T2a1dfCW+Y8AM7pddJjYUIwfAq5N4wT3CtQMJFvjq2Axcu3g7cKo5/1Hv2VF1qpnPUrDKrFdKmmbNZpSLEmiwxY2C7rRCGfYy4TcfuxLUXBT40APXlxD4UvgirD+F1CEwlLgWxlCSktQvzRSSDi6gCB4iD4E1zhUeODh5F3RVmgwuSlPAvQdcgelS6BDWYA4DzFtNtjWMv4VtEdWl2iiqTqUkdbQrcB4UkW/rYCwK7BDMMF1VCOuZtsyy5aSY6tI3rIlzoyIcEWg8ebwQSx0wJjMUoskOBAOnVpQRFm+h64JhkjwRr75PkIVO/wNtjOQ4zCPm4CzWIKChZtSRJI06rWTh/wa1E6ocVRqscozCYNc6EvF8HekdpyLaJbpGZfu+5HFeYJqm0GYIRGMoE3dJXhRMk5UbE5/LxSmsikT1RzjTCjN3khPC7/cnI3mCrxgoGLgl1pxyVxYZUAnJpjvy6tjvc3655gsuPeeZaz5w5hkxFbh9/Gywb67SomnHFZr6mfX9SKKWnGnxYXCje+cQGkbzfC68dfdG//IHWw8+4EAlEea2QltvEanDE2uIexCiKYZSs6lH5HoSGTe6X89WTIxAdMyHSFVzcirS++zM1jcbW7f5XDRuNuJZORZ1RZlwEASGxyF3kmkK/w826xfHNp9fxN3PGtDqiRpSy3laPZEQ2w04EHp1DFOlfP5t//QzjFG9OKcxtfFbdY+FBzyuX4Joi2uU3uWMo1QyiVWSaPDseCYzvguw0y5BEU+/y5FRjjQi8VuQj8WNQp6ZlMg8jaa2CJwUWpCExJ/G0fkAF/rgys5Xl7l58Ts6+IK/9Ai8U+2u4hs+cz5EiRrwmECiMfbO33JYjhmKxkhYciAGf2vMZd3No6H3+hwsztxw6X/8BRLq3h192rB00XAyrn7LbNRFC5DooRk1uIcpMUR3DbeoD+MlQL3ye/T29suHvfOf9pdO9Z7CBn6sxNL9+kLHgL6heDmECy2LUAEIs+cpxA8pa8OZHI+IFVr0Tle+vwtOIMd0gGx9+WLr1MneB+twAZ17rJNBqoIExMN0h9onxVTUCKin4/wsE9UUAF338QnCpTD8DMUn9x7Mp9/F3zn9LoT3ceLZrkSeghGkKxHBMysRRshtJ+M7u52M17FNsHcKmOKwdTtZsItbyVQFu5Wcdtrd1fmoGkg/bti7N8Txoj0fzXHyGyXw84BfZDJxCYUmoQMxCOIPIiQi9Wogwyp+6oPke4cA+u9hDJiM/Wzg2r0PCcWE2XA6HxkpiMXagBkoK+p16Cx7w3T71KPt23/1oUtiSIgorRAfFGoTlZXfIDMrLTzrVJwAQcOxMoV3YMjmjUMMSCU6a3MiBOoCP9MhE/zl3RSyee/2UkokTgnwt0p3LWyo9KtroXVbaF0KNcQSgBapSd7VTel1W3rSwuJR9iAE3cRwtHQNY7GJzIp8gTiHmcmXjeRMSmRKYz4X1eKM3LoEVPr+bIdPgQ9j2hmt8pPew/P9pXucASxeyEh0RfynaBrGykIoRVBarjRTa+iRTmTC5oCjA8XJ2Xy+hId5c20NRUMf+wA+8JSNoFS3yXYn2kuh9O0eiqRv1b2rDSEl4lxcPA0RQnMhaR6ScEX8uakrvRhcNpH76jLAIDcItO9UR3bXUtKR2/fXxRhTQ8waTgPNJrS4vMWkVg+bSmQmibHDho41VMrNFG+iePuEY5DwOCdrQuwIsSG8ITDUDBATINTPo7Sz1cycbIhVX0EpW11sdWTwt1WWXlGqfgy0l1FaoapRTUVayisYq1yMghiqHkQ15OS4VwqlQtwKcC+Hh0lhkcBegOYFGL+j38aXc/QpSpoRUkklkp/gw6e3SpNdEATf48QcLgXsFC5LTdRcSP6x4iY3BBECin8seBKsHnTD708UPuRO57DrgX8NnAq+Obu59hUEEFn9CtZfQYait7Ps7ys/qsQW3SdLHrSqBLLpqSmlSqd+ah0Nkk5K2QKb0bxMsNd/7bQksxgc2B+h6dY/dXTz6emtjWe0wdJiSj2l1xe6/S5vIs19xqLk/jq5JRkY7xGtVGKvNhLIs+QjroODTKO7fCi4JXjyQu++j5Xn2qUBqfvyUU2mozBcnmCDoQl7Ke1cCcWgeVRQLmieLw6tWA6dh4VZE7bO2QRJjLGL1vXPqS1q6i+aRg2fOZAecEJ0uo8g8AmNzAvn+ktHPRnlNWLKaPINx1AlTWci1St+mKAIS9Ag9b4Ec/DgsXzkD37X0twvtgTrQnGCSrCHDlyI7sEJflqKXQ6cQx0AacJ+8Bu7vWyR/S0/ApYdZgb2W3whs3nYIqTFGwRWvNOJ78sb1qeukibQneZazCXo/mHIbQBdjpsDHYCXu8xpuEX9CJjEo5s9Dk78MQRN9ybLG7N0TBXGE3llKKSB02AfE+nzaHI9rrRymiAy4K1ifXPdrH3MiHgGEHIWoBWhLE4ZyOBTBJb5o/VEqCMCSRSypOxYkaNiWcTxEGEs4nRPZfDXI0opFymTm/UTnZG5iVhaoYHzb1Ljev+jsCxKB/7y55LzACI5wLPGlfGvueMA+YCHQe4swJMnyMjvg6ySg88BiA4PAagCUz8JbLZ2K8HdGI3S0V2FJiDL1e/j9T881rt+VffxhMrv4ylQkGie3+WDXZgyMkr1C+ksu6uLel8XSnOGRO/+1c2ncoDKYPmg2bYQH7ij00jaYPnJzuRhSrZtQ5Stbm3c9oFHhMBUqTNLO8nWUpHPfGBkwS7ad1REzr7TgkxkZC2p4O+q5UVckhs4FAlutbfxnbjUy0f2KqASsrg9nDhpxZ4r9Qqni925fnPz6Rk4U81S9JnP0U6uMT1mSWOK3SfIgc1H2GrzKXZo9Rkob/ZpZ5GOFngbkQ35tr64QqOStLsu0OkeYYdgepPPwJqcZ4KtKc8YWl0yfdeIvO4MZFenXwBqEYfAFaw+/iHk05wVK6/WDVdHqiiEHLchcBE1BzkYL7T5/GSI/2vQaQopRp+fSqJ18v3vZ1vQ+2HPk7nnwQIgtfjk9310+GD2dt/bHktNPv3iLYtk52Wha1FB5rkaF2gQyqBgbiL9A6WiGiTQGlZZhPKnfDgYQWNldFE2l5NbwZwXrHsoPiAdJIJK6QtCZ4RYKAUpyIOJztZdTNJhM3Ri438CQ7bMNqQPf1tiHDLEAZj+3Xv/kLMM9VduhZxpqD87G88X4TNJDjYOmRKtQ/n7x7nwILPNqMWnhfd4E4/TZsmF9d4XdzefruqFdaeUHVEsyYcYQa/w8nMWAiqMBVCvYCKRXay4kUFaAOQpw4iTtMEI0/7G8ubT07jx28hSNpuEgFmQx2wMct5EYwo9xmtGc2nShlvNtOXz6u40GLLzEuC+d/zbrXfv9/iuaJzSx+THANdF+QVEFihARsTWfIX8EADny9sBjibaNEDm5mo0g3fhlTE4bPB89Vdv9fQOK36qkff5JivRB6zJS4upcDmsAhChzDUcTp34anx/92AleX1uTvk6ca3/7d+YrwVyjmCemMyzI0AWRyEMvSWW0Hud1Aef60CUduj4MELc5Sv9k5/4CHFzs2U7mHNVhxQE9XPPdt/XgJds+2IZ+VwpUpLd9cVy7JrA/d2IOHxEd+VtOIVC79XjZ3rXwUflbfgVj+rpQzm/padsGBUfz9OXMtKn69m093h3S7QbNFWfrW29C8m36Xe0XPAvOSjX94OpuIvoS8kY1fSZS5wif6cCh2wcEeSzr/unT3Pc684sn1Jnbbhfr8XWef4QNVHx93IyzRR8Rp7OJM2KLZAGNhSGA5s+oMgXrc6MOgLUmhF41bViU1w5rcS8AGp1QtBqdu+9I+lEPl3pr36FdsN8FPMhcd3HPtC6DSYRj4OmvbbQToybC/o7Qgx8cvV5eIqkHQTph68oo1NEJObGAr3IxoGQiScg6V75cL8SyT7YUAw9/2jG7GSIomNWrEUnPHoPT+AuXTMWt0L5W9QGElOOqWPTEjcnTyinLvSk5cKN48xHn3GgVL5Rovc/ATAf9cVRzHBUd6FXTugxC9AUw1Cr2xZ+r25HUS3NWjrsQZyTIjbcHP/WqWPDTYIkqJuYXH2R6DELwBTCELM25+81CEdSbXbvHI7pWKp7r1OjtpFUMZ98Ds1CmqFOyo/zxBDlwSBRj0ezYIpjQHIIgyNJgOkx2lYxdoo1MkabGN68yBkCYga8/mtnjuyArWN3rR0Q2gA5XT1KU4damhqPNCuHU1gsVayqVL3eC7Sdajej0VSTGVU0RBGpEvKaZJgeER2iQrIo/knme+mfE+HDBbgIb4s/UASz+A0ElhdXMB5hKH780o1GL6yMvNw1oUg4L6GGyyfzl5Ek3AIzmvolL0i8ELFzftSM97M9nJzDpqadliVuEZCtL0mTP4KhVbLN/vrSYndt7k/IkEMP1lHbD1b7Sw82189AYYEzBCBVFhk5SNb680GOELSnzjT1Kfeh31KP5+tZE0PC5HOpQDKZWgWCZBqLkwLj9y+v9k/5dJTt+Q5DFAIfz9flJ3tzz5dpzVBfYJkVCiXmrVBbrrFETanhNnvcnJF7iBfRQRm8cEzq+udf9U6u+cASb0fN6RKHAECx5nQzmg/qgZE4QT+1yyqyerN3bClXkXk30/PWNBYTxMiuYUmRX92SyS6OwJ+qHyzCocRlEjUE6THgUXkSQjaK+NvUVFJXIxhQXDSFq6Zdkly/5caIgzMXLqlyQSu6Sd0Or3NiCbC1/k55GaFnhZSiG+1Sit9k5yKCLXYsw97lpKipQd6TzY3LrkF2PtkI73I6eL2M3oiTdmwjY0ca7iLPtvGqEJ7NTc4SUL/HnrVaSaXOLkrBQbty7U/ZiWN/d88h6y7YHW4J8dk3aHl2+URLWeWbSiVowQ67sgrbZNga/v5m0MQ+XLY0sbnKB4OP99rigGVGHdC8uSERzqocYLjRTpiWScuc3tfESSEX9sO+p8lf2vOFXufbmohmkGR/fULdXcbgnntbwHSHHcXAWwW+wl4NuxQ3GmeD/iSYskbLT2/fkQHMoA12r1lUn6gV7FQIW8FGbYTqgqMzOclrVYRqBqMTVER74TVUqqpEHfN7LoJG7bg0OVEywdk+2VloJ195dcon3eQG9CRGYdmeeTMqiZZBlT6A0wXw/xxumMvPXPlwu1x+BOPfMfCnIHneIIOPqeguJbA99Str8iXNeKbVgIs2ZPFhQHaIOZjbXDx3a/v5PVXjSlQwiGpR2sJrO+ZSlC/DXIsClwkux9+L2rq94YrxYbYWsmJ8LSmhkB8vga81eXANbzKa+0GQ5/nlBbWLgALxZa8/IQCz208vsgBQgSyE3+1nkFRvWcOvrUo9bikKL2tPr2w+PUvR3eCjdifjuzN4VQAYSVo812sdBClmbUe41ULeldMrrh2DvCvFdpRSQpsYS6qbNCfg54KLsjAhN/STWsYMHpp02LLGoGNkY9N57MCaI3TvM8HoxpTDNzYwx2EHbMw43y5hTA4EDhwmAEnl5ELsWPSxOKjjvGtsETLEKwGzETjcjznvyEfWbcjzp6flQOIlL1Y69WCON8Ejf8ZHtaD7TceHIMU4G/DSW2hhVX2IDamtPzVHNkSWG/4UNGsE3RykXLdgRaRcPA1MLRwwZ5kS/weaiaIlbHdKi1l/10e1XD+S3wOBKICPm7GvDizlZpf9Rxg+Pgb88laRm7DDwt5ChWVZQZS4bv1igQ87EX0PGeqBPg0i6QMBr4Ldz2cryUN5O1LaBpLWi1k7S5V7LtDLu/G+F4NrfIJg4u9/lk5oHllGBrFfNm/2PUz3MbhKg1VkfyyxpBzZAQLtrv57zozC37iOOSOKyRIC9cniBhtQjgLNJ/j3lz+3Icaqje7Ndmu60/I7MZBd/VAY/mH7yQrEstbwD1W4PIhEnJfaPcKT7MxYWAuavDo2q3DbD24FWLxT49F4hidwMdKJ06RRiduthPcw36ngtjTnDu4/vNR/eJ9yBzdi/totQOOmZD+IZ7uP8a1aXB7XACqWAQrpZTujkU1jFhRhyVG3hZ2tm4+ZF/oo4IReKRv0zABEq4Tme41jTlzXkjlfNOwEv+Ob4qZph9riXEk7AHW+Hdw7bgeEk4a4aZBCgICj5HBW6S57BEgPbvvmtvK06L7Mc7Tq3oX8ODyLpTCKYUnlbDft1JvdxzN2U5FDiHsb+tn53vF7akMjCacD8eQyjPVFgKYohl5OuIWAh+50R9JNQAx0m2Rj6/6yJtmI4TM04uEPMd/h70xIiUK+5ZaDP1MTDanVsgn+3HBqVV5dC13Jt29/0V//zvsKC5X3FcZXQXY/t/yRz8zqB5Gd7HrctFEhEN6sfpgutwKSMoIFUC1Ju4/5ZPT1BbdIWMOw388v9q7B3V73sx6C0pd6CEqP2TA6Of+kT/Uw1lng3dXUlLmySLT97x4hbeedJJVC6VtfKj1nQ0m1XPpYjGmnF3xYx8QGVdy6+Y0OTvpM/xB/Ennb4LjyjkS+YT8S/CIVPqvdZX/6DVp05/hT5LAqyR7oG18zeMrKCbRC8I2eI7ey+bp4hWEWhDtzFQjoRTkQehdO9jDoPkSfxw9pxeq0IT7pgpVhsjFRZNEqODZeZAThkGQpfQ/tOLzyvX6pd/6sRHSNOGYSRXTFpyCmkoZUGopgHP8JIxXpUe3eSWEVyeMLnCZWZqwwWr3QO3nC97ejiFNe0BtyL47kjYFTGAug4kgIeDDUs7YMhoRcOBZz7Jz7XNlxH8sAITppG3rKDIgSCxl3DX1pc364BYwMk1aBga0nN3rH3ws3OFKJeaVPnRAts2AKYsj93gY+CjfVpN5d7byDE+nCPF7jltHWu3ist/oVjbY0ch/GdM+fSZw4s5Fq9a1eOrdQ979TKKeuAUkYEjrRXvIMB0kp3muHY3oLtv3ghYJRkuzFJoNCdxuAWFNmR76eAV+CU4owKKyFMeyMWacWnTXnrCm3H3trN0bSvuyZPRofgaUwyk4wNoIq+VIVz+o91O2B1lVta/Ss0a1WNQ5RjF4pBlptmE4z+kzGf6u7PF2qkOQfr1dKtYpqlEAPjKcFrAYIRPdIwW2FdihgR4hXK1qNRBwiD1UWBqJrhOAyQisvscYRM0bE7FkQFJey/Mv/qODp41A/EFeIK+P/LfqBcJFlfiDEQuBC/4uRjiDM99Qv7LFA1OwcNBcr72Go/iCS8vbXF20k5WYUHyqe7CNMcK7vngtXKgHdxEfjDQYqwG5jaxnBeYBABmcB+Jadf5cXxc1ne+WoQ4ULse0oM4oRv7aaEV9kQ6mNXsSvNS5gK65nGne8+6jTkNvmJlTZg/X+qZfGUk3qEhUwEnIxWxQvRFMUQy9hA5lAwm636VnjX6zA0Q64J3NHPji2+fI6r2gYKU15G59prb8OvzI7+SQoXh0LnIOcwNhaveRPCRg53Mr3WH43n9/J9SDTgH7vnRtQ994ZXHfhBDedPKa59qivzImMb1waxNi4vEvGiH6nbxCb+8QrbPErLu7y56svw4CrH/aXbieGvE4YNdzv15cDcNEllaMlefjeBYzL23G9rPNBNjUNoi2hOBzCoUBHAopmkPRcQJD86QAzyDNCbvR/RPOBew42VoPO8zgB7J4GghLzUQGCuCmciSB4q4jITRqIBAfu2pQ6zkEry7hVK/zK7v0g6IEixqIMPE8AyWr0j2oFowxEB4TCe5jotmI7kLEjJayXroEsHC2Z+Tyh7WmHyKQygJwU2v8gUWnxA0zngDtzJbK8igOn68RmwgSGaNmpBP5S5uJBJAcgfFoD6/vb3OmEfMBtkDugkF+dJYWMBPlQ3hx8TEF0eFJBFZh60x5WwLrAGyZuulfIk1J8fEFMLZ/sn7+ws8w7q2kkJBgKD5YJgWnSNj8LHp9REBKdUSiMRDVVIAl4Oe/tE5CbOS/S7fv3ActbEvR90YuUufG2ChdbsDcXOSWo2Xq9f7+3se63Xn0Zwc5rwyOqJ267Gc9kYu7doLgg08o2OcvMGGszqSfVuOnvxAjAcPLAxYTodfPaPQKCGHi4ZY9diwsd9tV+cc3B9R6eUAceQPD71gRp7TxG9YHNPK5x1yBcddcg3NDII+jAxmPswGlD4MOMcwhvnTaoBJ8KisDTUuAy0BxiKVze7VZhQw8AAfdJxwhbPAAI2wvcAbx60RYCWrRyqIKhp5CPG4Xq2/6yfhw8vkSEB0x6zPHgSrFC405YzEo5hOD5edzNp+ts2CE8bpMxcIiZ7/Sww9GYk8nkQdSSE5DQkkteXZv1RtzWxqdqwQVdwmBivjHWrnuWYdTJo3ubmdIwTwYotNkUM7DZCJ1TexGLOeg8rp3Vpk8txCBzTRSCVweqCYwasCrAiGkrmFUgB6LYSGAjOL3OKAjNnMAM5JqttFbYCDAvuYZLliJtKEsmNdcnNh2DAeqNs9IK6XTRBHUFhD0O8f2OwTJ7DDn67yX2GJZ4gAR20eOWf+VK52wxJQXPJgT3mekGW2JIhYYYMj71c2OHxa35JK3KMc4qbH3dg83UnS8+719Blw7+oBHZBzm9pMdsBK2cZNKTv7DazMBKNGU3KIz71uePdz5dQdNbvuH7bPykm2PyIhuNoFdV+Tk4YExjzoQu22RH8KDhsD1QW7/d/8QfqGFUmlTpNDCNvgkOH+13Hl1RC3g2/pjSygWF2bhRyapuvThtvIGTVxdhTvSffLazgXZpms1V3HhINUk90TXjg51Zf6/dghln5SFoUQFL9waztDPt3otJv76o1dxc/4iqGfEnFE2cHwoAo8g1Iwl/z56MtcSx1G5F/kY2ec0f5oD9ry6+LUuLTz7fXv6w9/D8zs0r1J9KSwPdP3Zy2FkZtIW0YDzy9dmnatAjdh5n4NYR8Nd7fkWZo885d4M5ZeenLIBRciXU/A32YD2Z7z6ugv5oa8ffI197DCN4A9NZf7y0/XKpv4RZv+Yz/hxHQKKPMtANYLYrPB6fHlGWElEzS+cPx7yUwAjY6JhlVmNbT272z900CbeJorjzT++DzX96lV+P+WLCAwAqKfBj94WFRwAeWMON1KJashA1Z9n3vnuPHBDhzHWdPBCv7Xxwtn8FcBfb9Kl3wnfUMb4SL3zFC7AUx4NYYvFlaCfTze5jCbmDEcUzcL97faEzK+ECNp+e3jl2cfv5CkUMAJKMA8kwuYSR4Ue+Zk8o0NVIraQyBPljnrDtxNm77ahlZwKY3LmZcPauzgQgcUMkIu8hDyDTVF9kAaACBRA8O5XGRJmIICRJDBFwRJpBhAyQizOVzvdnW3wtfPvk2s4Xn22f+oTn6UzUrMZATOwhvQk2YVBDTIUKQZjBBZ/VyKmuzmw2U9HcqQc1rsH9VYpr0I7frmZNbp94zksLoc1GkUq7ILGKrE7UgOwSkR5k0cRenuPkK72PPtk++XXvPmQo8x9TNhLz3MnDZbtAk2GkLzSS1OHuchrNqrfg4YL+3nq8YfX34uEIv0fXBv5bPV4FjKHg1LrhUR493rn4nYcQV1cGkQg84NCpA/v1X52AuRews/G5w/L+Oe7zxZZkykFSnysHHzMLpACeVNPk4NepSQKSNDoVXd86idNBuQPpDnSyr/buf+ramiZ7LEQ+RIi8MRFCFJmD4B+RjkOkHEyIIeY2Tgfl7G1gpy08bd1Z7335NTOEk4E44UlkGCEc8kVAhwoHBQLoyhOHIdQBafl6ke3T4bas+SuwQEfan9b2LBqG45mFeZOwYMKNYb/lrbfA8hphdxmbKzSKdmESWXPI2DDDLRi1XvKWxm7sjMDGCGwAq/VV0wcK3uj1Petfqy6HKkuvKEOdNlqjWW1WVDrjqBxWN1ZfjNAWqilycn18qR5I9EACo3uLyt6c4PVC18rJ4VLSS8hAiI0SYUZ87UnmFPcHGO5/VtzoQrC38jsFyNDrS/+OghoLcJIx2C0gNjefniNZGWwWxIL/owrwElzO/dmgrQKp7tQU8j/1M7NRQOJq1izvVppwKQDH0f0vexe+otg2DfB4VEHlvofnYC08y3JmIH2eOg2Jd8vAfoo3IQ+T+GDclGOhO52DFUisZVciG9f7Z/7qA89U8fvCQuRINFcFv2Ib85CgNXa3gOeCdwO8nmx4eBO6m7GDsCIMbs42FD842iB8e7TBRWjUW0FPS5FLUPOQ5Xj50w3Ftacbiq6HGwwuhxsM7qPrDuJWj91CxABuAFYhcLdi6nXVoBX08qM2hJ5ycBEavjfk1mPnG9aOBY9XDhYcdGDbCsN+n9XybHnlS6yCrAGCQz4FLzcCwt7Hgw4FMiAavJtR9tHfA/jadV8Ljp54QKtlMvXfCqDsrMx1K+4MhyyNDVKCMDTP+y6l6V4FYSCqTBWUfSuTjDAaKitKiHPSYWKTd3Lzyo6wAXUZNG8mMjgHD6eS5jTjqCwmCKL8c0kYbSI5gPOwu5YPoy2/cmm5KNryq9N7yMU/BynxBh5TMB2eUxD3Uz8N7Q83Ges1H9f29TnwYl2DTugtrfeO3+KcRPRVQ2wAJvI2AH0wGiKkt0bIQtacj3gnzy348GbtPGfvZtu898GJ/qm1rY3z/SWMnIg0jsjv6dHUmkYo2dYz8BZa8QxSDiHgz3VrNeLsuGBGtioQRwUTgF7pn9OLuvNx1X0WsAPvIs2Ta9DGQMqBWMvJPZLh5DGC3NYI5nPiEGMm5QkjhjaTe2O8fg1yGMADsb3dRNih3UTwebPJvTJWk8EP43gQ79ZuoiJUkjF6WoZcjpqDLMUrM5vgtdWiBt2HhSBw1aME7sVlObeCWkS0cOVYZWYTYqrVlGsFHzRCGsIrWCpCRXLArWIXGzYYZz5GYxlYudmEA9paTeFsEF7FbmJklf8Bn4xXGAFh75PdJEAeJIjJxlD76vRS5vbQ4YxTsJ3gi9wMDaZmrm/JzdGyND5IEWFIdrs9qIH9Cel9y1Qr+wYSq4Tzom245CkhDmXNxETB5GapHap+XpbXacBsnMho3+f4HGCTVX9TYpIhwQGa3g4/b5Pxz1zrnEnGP4JlBSz8Jkh5N9giQzIyyJDzqZ+IQabkv+Ydagiz8+d22olmYN3wl7+84cYJsQ/+wotROo9XGn/+6zcOx7VGQrtNvoJ/gWTjEALRfPvT8FuqjZT8lv3yJ+ZLYQzulHnW3Gj+z7BFte18Q2mTYIZC2MCD3mnUO2n2W2wcjBnebkV/rMTtKKnFcGet8Qdo7Hr0/7VhRL8J/jbT9Q4+UVv+sQ1t+Mb//v8BQi75Xg==";
\ No newline at end of file
+export const w="eNq8vWlzG0eSP/xVEH6x66d2I1bUae873PdBEASPf/xD0QCaYEsNNIWDFPnERlhjW5Z8yPLIpyzPSj7G0liHx/J4JMqWX0AT+iIEj2/x1JmV1WjwkOgnwrCIQuevsuvIyqrMyvyf//mf//e/X+n2nPZ021ltO0uv/Of/vNL2nLrTsZaskNXuv/Lfr5w4+sp/4kKXlh1nZV3Hrtu8zO4stWynS394fcL4oet1el7XW6a/vMZ+UeWuzUD4s6qo36NFRydwXbTgFIZjNK9Qhm27k+i17Xrdor/mKvVMeTLTKGdIL0pWqyQzTbIJcqREulGSnib5GGmESWouE0vNZ5LLRZKJklypXyTpKKnkSoWZUiYZJaVqueBEybkimYyzb5VCM0q8IpmKsqeqhUQkHCXRcqVUTRT/I0IilWqhlI+9FiFha362wX6NzyfmwlH2VzKSiB2lzyTiE/T/4WQiEo8mE4lINkpfoNvxenWr0+s6jVf+8//+31c6Vq9rLzhtq8XefHDTOR96frVH/9668uPGb9foH+r3kMeK7a6mCFm0VV75P//JUChi22vZjZDdPxdq2b3Q4G912u7/+Uqz/fzKYj00uOuGmu3BPQrz/IpTC/3rh/O0rEYra9OHhjfWt354b/PzK9u3bu/cejL8/e2N326y2noa2OuF7GVrMdT3Vv18sDpXrUXBitPs9Lshx+44oX4cXupfP3Am+ouh539eEa83fGd949frm5c+4nC0x0Ou66yE0vSrBLFCq/QdEKq9bDdMSPkegCi4B8Ret9/SeJhPb/DN4Hs5pFt9BvrsQr8ZcgY3NXt8xLZpK9tL9LG2xat+iKcHQ7KcenvwN1G0Hxx7secDcsU7wlTwlkeazhvcXDWabvuvF0TTSVTaPc224zVDrX/nLajAUBuqIq/DGuJFaui1LdlBCMvpn+P4hjTo+nt+sUv5e/7nNYDf/PzB5htPNHx31VpxeQP6xQoDb4FIsanwMLDbdiv07EJPD6ondzeefKqBV2WDa6HkUohRjmHKBPItZwrmXcwRg305O7rO4E7AS6j6AirC6AbuCCDIVIbY9Vr7a3beSrh35Ss8uWv0sXwLmz3nx5YvgYq7g4ft0b4wJrgP3w8sX6b9UgOo62N+sftf9iJabYK6YGQUmSPoUwRrYLmDO3/w0LEPd+AA6XpPyr3vDc5HZbRme2S4BI0VJg68+too01CTvwoDFyMaUJT9//N/6ILZ6HgztrvUss7bASsmXczOi4VNQNIFbNc1UwoTthwYTBmymi8dnFQsHD4xvw8hbwh4Q/qOrRWkLBKvB6L0yblDkziHPusxZ2NfSs8+czYf0nw4hBGKhmfXqjHVWfZUmOp5dtfuN/u9jkd16lf+H9WFr4Z4JbQOpgsqnRv/Lt+fA7Qd3iToV7rCc0ZYDYtdx2226Zw48trEf79ytm4tUVZWmH5s9ewW+1fRnT6t6KzT9OHTJ5ieP0bzt9Yc1244C0K3/O9Xjp2QGrn+gW0AjkJxr79kd6guZPdrtHzCX84ePqIKvZbXWaKjhT143CgTz7Eyq23RuV7Hmw8ogq0HZojtEiaMWmnJyQkMz+qb0EDstUb2EcVW+UixPVEuTs6HyWoqTLo5Mhcmk1W3TEor1bP0/+dbTrHfcpaL1QRJxkihm6D/W4mSXriQP0c/nfR/pEjOs8IkHSa5peKR7MkkmWj/V4qcSJLFauZsNZcnGbcQJc7RKkkXqiQfJWcmqqTayZJUs3yO/n9xupy06WchF07U6acRzcct+qklI7G5XDg2Hz6fJtGZ8Ar9/+zZxch0OVuNZNLhKfqp2NMTRyLzOUK5X82kz6+snVnud871ujWrc245xbha8lLJepJESmn37FQpk0tGFpupyIIdizbq0ZqVzyeic4nY7EyVPjSdnclVpgL2LHbDariW7YbE6KbS9w6dM832vz5YXKMLKxWLt9n02X5wffj7zY31ixuP2IRe7bnWqseIFpR0NAcbn9gS2g8LcBpoFMTVir0afh7bGQwer9J5d/d8iO1i6G6IrRe3HAaw/bfLG7/f2rr+1vC737YvPxBjpieJG57XhErwMPfVImtotp9dW+wK0OE3PxpYfhjJKR18LWvwfdtyQ3wLMnhco3oIa57hozeHH4qNEW0NRsIED33eaVlr7Hm598AQHkO4TVdvH8Rivd2nP4vVAWNILVhg8F1311sKtXibsT5k7XS3MdpqG799MLx/HbcalS/sZTm9bDZZEcDqljOqM6oCbBMyAA2z3qRajNjBDW72G6FnPzA5v3n/HxuP3mCqgHxCNSD/gluPfffwRpm2IO3KBfrXebE1Hj760/DSxa0nFxGcbk3+VfGzTBUizov37ALdZQ8eM7Vk8+Y7W1/eZ8RU77B6nBX5p2KE0Xl7kIkq5RdVIRuGQoS2bP4SfBIyGLovfsyWj41H93Y+fmPj9zfliJRC2FNjEoSyD8+S7CicABC0kwUxLo4jqK7Ub7M1t8pQBjebTKW8QlWm51caeKc5/Ojd4ePfNy9fg80mVb56HXu5MbqjtXq0891afwnvaVVN/mMPXOfgp/6a/8CD1zu8cN047cBVo7MOVPPoCULPXmp5daP1uSRY40P6jOiAjfXLWz/8RbadImk7bEmi/NuqwB7FtTisiRcEJroCo8GpwrLoG9EXdA73mcZG9dfzuCM2fr05vP+N7gXZwyN9gJZsdLAgqwg6e6Lt/+yHfs/f/rTTr/iOmqBGo+l1hbjtLac5uMMPp2x5fDO4PfjVDQ1ucyXyk++27rEt3GpTnGDxZqQ0tiKBoxsEsyeIamMNI5vYazitfrfNhgFj5dmXtLeoVFsQ85AtCW+8vf3z481fLnHdXj7LKkSkkiVU4u0fS7CGaKV8aFtNz5XikfY2bdbnfz7L2v/Dfw4//IaNB/GABX/aihH5i7cHpZQBklaJpSUqImiJXNbuSpFEJdttOh3vsZ4d/v4ZFXAbj/4mxDR/2lJ/KLGoYDwDBajV41IYsz8lA9ai0hk5B3Tq/NQIDR72xSrGtvt8lRi+e3vz5ydUxAsm2k1HUrF+Hvxda6ImpoEIMBhADhWAkAs+20Kuty3oDyWiQCLJFUZLIn7o6Ekhp5pFwXga5V8fjIJQIq/dVgeOCkSdfVFNS0k1Ki58IpN29irb3ja0jL5xefjor2JhBu4Wew4THgiKjj0//PhXRVAmimwv+nvPPtvhO32xFLGd/qpYjLavficg4BH4m6osL0fP2ijo7OEl1NOX1hr9+t6u2p6p6R2a3mVoTUrjEtqW1o2QXgTKze6qjf7D1EH21EAM7cNQCAJUALzs+1Z7Y5EfWYT3twSby6+xMJpLISx/xqpnLnb+1WmvtclYl3zryL5XEWMFERy0+FjfRf5r2W9I7F3ltfoHC9U9RSoSp4YQ3Kcg1QLw5cXTS8mW0VMjzUspZIfUg3n/IRJjkvOYDD3/eFV0JKtyDp8kCd43Hl2RTOBzJP064dC/GfXAUdLrp8YcJaGm4KdJ4l1O0+d3PU3qu16Xb5vZWc7r6uRGlbLjnNfgOKfttDp08jT4EvLfr5wa/YETnJTlXafOigwTtSxDFuoGL/FcbZoWJSOGaVGM7dKixDRLC84ZmJ85BoSYANN1Q34bNVznYyRTP5si9L9M40yKTE2mrdY0ORYmtfR8hUxMMbv13GqZ1MMkNZ+ZL5czpD9F+kVSi5PJDMlVSoXqcpXMx0kxQ0q5aoFZr3tVks+QSiGXITFvipmwq3GSzZBstZDLpqKlfKlaqSQzJFKoFErZVLiUY3XXp1KkMVOzirnsXDgRjyTjUWG4jryeJuV4gn6J0uKJKKmXSJAZm4tL1a9S6VsNDe70z7Bpwc5VhcK1ff/+8OLDnVuPpcJFxaeiUrIcjRkQxOgZhQtgJgzakuphppdeGEtCYHMG6V7IYXAUa/jVdbUCw5NSxxErsTFIR2G5ZYBtdASDw9/f1AwaD5lgmkU5gpXSerch2hCpzfevU0hQm/Wgl6h6WpiIBh7gYATdcjCNhOVdTgRllEZs4Y08x9P7RznxfNtHiYXt+vJBbZI+IL42SWsoZZFuycekzRgha5uxbFBlM5YUYEsBAXKoeMgELQr0jhkg5UZZwIktsuoJbsgY3DN4e3kgv2FZiUph7vG9LO4VMPc0JLCy9zgGhy8EGYxomo2FjKXPuiFjjG+sX4Rh3nNCSqRri1JQA450rdmtn6K1AYOAXfiFu8E+pO5UlMreK3/0TS3c2EZLcwuXwcrLIIyx4SKhvqdIN8X5oQldQz7uKR2xZMSCaywhCCgtmQ5CZ8qLw5nghzwJzbkX/DZjptyhjPCXHJsB1lv+XrFR461431eFcKH4GdN2q36Wb22abjUtoIO2/do4bVtScU1b/PXaHor2kudXslkJKNhdujd0bUMP5gUjanDTcW1DC+YFphK85EkFWIAEKreNCqE6bIcqr/lYpmGdnCHpuTyZrJ2YIbN5MlOeTqdnptqzJF2eKBFvlhyhCi1Va6l+G0tQtXaVarTdKZKPxQtzkytUoU3PVmJ9qsZSZZZqtUWq7DJltsK02VikEC6dmSJUmXWmSI6qqfXy/HRkipSoNpuhOmy8Go0kKslIpZAvx8OJSD4eTdCnxqqxrOWUAsY0V7bnOo9UMKq97rxxGatgPUqivQNlX4CgYt99aICi6ZHiKrpOnGawBqeN3JXH94M7a5IfpBttvneHQoFu1BMEgUf34idsP4EK/If3uirz6F7Uho/udYUjJ/caGvxD7UXXq3dtrVDu553srucxH0W/k2OTQ2FThER/8bfRVeG3kTX9YW8i5mPAiyDN+GDwSDEWkx/rxRJcKrJUxQlpcKzLvingQZ2lapSsAVYoLiFAQTaBg0B9iIFwSD+WgKofTVbVSqHYFMMReIT1T0m/IEQ/GoYKxBlxwFTvLBbU0cZUq5FuTDlRgVFYWTGjo9BBsD7MQEBDXbYEpp9TzKHSlyUWLN64q2Gi+Tra7GShLiscvcIobfkQejeQq4N3roABrVlN7bjkSoKonqQg/j7kqsUZxIuBgRhB3Wb0GQLYTW1e8vZcTPRCIhpFyXjMB/CABbgpt33DJZAU5I0WkgcmE2rE/qkMWXEoc/pw59t+XiV4ch3GGH65sRfk1Mix4gF6MXvZV9mEZeizPq1Y/Chf2KcUi9/YoTKtPYp14lPjdWJGxFVizvLpU7uoxHbDW3I63L2GarbHuf4vSri+eoo7Gi5YnabX8xak5nzkqFkIurIHZQLOLBOAE7oKdh49gaGY9yEmYXWNKMzZzOR5+lmNhEvL9LOyOFuK55LR4lS50KGf7lQ5v0Q/5+xkkVQzZHmKXXJaiJNEkUxnyPkEOT9FClHSjrLClQRZmWLOhb0omQ2TxQipZYnbjZJmhFhZEl08RjXqUjztnJ1OLUyVm6lI2Gtk7GQyQSZppcloOlaZKs9Hwla8Uc1mFkvxWCQcpX9FZ8qRytRUOTJdCU/TP8NTyejq+dn4ynItnaDPdDuR8LmlxhSZnyKvTRF7isxVM7NR0pirZqO1mBMJNxdy0UY3TmrpWJG+43wyWkvTOqtT5UqY1hkJUso7PddZUK4E50LPb7jMntfEp6Jf3N588u3279qfgO7xGRG3+wh6pZKLb1KI3j3D4JgE/eQGRdCE0mYuHpaTanCHDyHByE3nDL9Kxc+PmWTd/Msv229d33jEZrccbJYcFYN7HXD1kiDefjEEI4AiWWl53poy27Pja+5XXGM71J+oYniVW5S33vrr8MPPtz6+vfEbs2ZxEnmYzf9WR9j8i2ciAbl6WLDB/1QCrtW0OguW0wjB9alzzJx9QRjRblwavs1egz21uMQe404VQKScKqDA2xeIdKwAKhesnVan36t5yhPwTou5L/SZxXLns9vD338QXdvrL3aV440k0H43ssDbEwC8bSSFYsLqOQ1b7dTuCctCDSvr208/2vr1U71TY48HuLk1jJ2AKPDY2VNniUrbUXC6pcHgOzfeQOAN225rXGMDY3W7dl37hj2/6oaef+y7p3f14vDbt+CeniLQN/UsWYIZVk/5N2FQAbq1x/Hh1p6i9O8lEaDmnjb+klXX269/fdBfXKMV1PALbH5wefODT/RFQ0mEXkCW4BeQRSObyJ8Y7Mc1xP/2lX9SeH3rUFL6+UeAiv+u3VF+g4PbXTrtbnED2eWfdr6+wUeXq3wExZ/yMoh0HBtPoganq73A7F6XylPun8ZFxvOrvIm458aDj4cPHvMrM/IRKSI0Dbj0QIm3F4YUWvBdiYxOreXR+dfGvpLPr67SsfwDdzdaE+6Sw9/+vvP5z8MbzENihc4yMeWkw6TEcJW7pCpgHi0Sj4mOe1cpikGPiTnlWt8NafeOhvJ32rrwQHg69RapPqXagz2sWoL9LR0zpaDiUko8L2rij8h9QJ2qCcKrGvlRh4S0lU0oPKmZyOUN2e0zGulJTQeNt9C2kQc1+1ELbAnhI5ZdIGllByx2LXfBeGfxCkw9pI2EGuDtyzuf/U00gyCSzSC+qIYQ37xANAwEhIIr8bdayuym1XLMIze2DaON8uaHwy+fct2YPSFO2OTTUmor4j1IYcPAH5aeJ0wfGzzkup5w2/xB3Hyj45E5VnGnqkt0EG1+9BaX/XQB4grcovCNxvRqMUNFBwOUwxPRy7GjS16ER0Su1B9d4r0Ii4h+nJOcUJqYiJCK2qh6BaoVUon2qRAhZQi0F9n7CyG6AnCqj59u/XpH6ivqH0Pb2I+ugfUMU0XYS0HAygFaw/HCDeu1XqlhkTZXUbRuwnpprJRogTSWL7RgwUJlLFFoZVJry24rC/xrLAZ7LAV4GUDieldhDYJaCdsxolaIWRCJ8jpoQ0hW1lZ/ekyFopKIWhpq0QXAILJMeQX/almzu6QBKeOTBweaaoYk8M3agwIhypGdveXILWkixG3qrY5d8e/yn3+8Oni8OCXqo9VN4V3+9oN7mzceyKrxFr/LoEKrwEkJb/FPjtviM6re6dOabOn0yT3sXk7bWQA3MLB9qVLtYGbVnQWn3XS4LYJtyIVVzF8sbWO62G8go43kp+F7f3/hCbMQWdT8Tx7zlWpbm+fnecJ4PTDCAW2gJW5qhhwPk0y9PMNcyzKNRCRtnSyRaow0KyRdLaTmYsXUfKlamKGfWRYRJVGcq+aq5cLM8Tw5lyGTsWqlkM2Qo3niZchUsVrIsVgm9MlqoliIZKuFUjRXDCcijXokGraS7BwA4qCkIol4JJWkX+n3BP13rNVN9Rk4j0lzLuzxNx5fHt6/bpjdFA3cttajQfvw6mcAFdBMHByYA0aQsDLr/pGOY8xlgX6Yn7xA23zrw80bl6UDtWW3lMLkNRzaF13tMIawPInEriRInq7+gCDkkisR1NEeZqaPeDGairIDTaXguEaAqFUzvQBHxtAWi44erQ0uOfhFOhFshomqZ1+ylXLr2/XtW7c3nnw3/JDftmSYbb5UGQC2dLLVQ1vi0V8pe2yhYfEIvqJvyaYAg/FBIGMXms3MGML2YOw1BVSIMTC4s9iVF/+0mYqjbzy+tPHkDVrZxpO7w/tvKpbZCXTIa4R61uKKKV4Gd2S1HXuNHY3Y3HynzGH6FZjERZWpt9m6/hZYxqAmswZtGzOr4JvU3d9Onh/73owfJPPK6G4VvVXXGdwa9168StgWm68la8GvZFThhzbsaQKeHcXzKvbsLLnJH+kssdsXY3YFvxQW4L6XUrUG95Ssyewpoxo/vGl203Os23V2fzG6zq6NvtX271+ourh1Tr+UtWs3BY69oHH3qZpLwlSH5rg01/n7/lBHm/VHjTUELK17Atfbe4QFji7U52n0At44/lk9kwGsj4wnDGwA7moPlNrAnsububQp7ym2soAj9PMrTVg9uG1I/Kge8y0W0GjQRHqhMBeJA8hy/vZya/Ki5CMy848RXH+c5Djo2kflAZ6vf8TcOczxHGBjVPVMjVoZgYVXeWCJwd0509CIfh9+9JC1imlsRL+LwWnceDkx1t4IdNzmyN7i9Im9diNdb4mFrfPFTZSlOHBimxdhfzxZNOKRJ4qxS54o8cVL5HXogIlt+XV0P1BJCY87K0uKSRYmsT1LkkUyVyDtMsklyUy3zIyKrTKZac2S1Ny0S/8/X0mVC1EyPf96jLnpJeguoVQ4FSPVci5eiEfJiRiZnI2TXKUQi0bJsRiZqtJvdKuQjkdLebpTKFYjBbq/oJuFcI7tDcKlYrxRmYeIicV0JRKOl/mlE7ZToP8FmQI77HJaV0bIs9UNSH5ghI78t+8/HV54Rx/5CxoUXJAWGIHxJCpXo+hM7hnAyl9Mz2SBL33GwBFAYKiDfz6nZU2m1aLt8FNIYXKRRwlNEccKv8Pfb22++VC/g6QadeoT5YZHnygavYyPqzK94ERthhecrtB06tPg6pXsnrPkWktyM3K7HnKeXWBTb/Mf7229f0McVfWbaJemZ4nepcky3PLQ0sqvRfYS2qXBzMLdKO1v0IG40/x9ZXoTipk1OjCwDx7AyoY00N986K8ARUyUc17vTLgi2JLPyi2CM7izQjWQ2x20O9h4tL59/1vDB0/QgCMMiBNxTmUgao41opwh4IMXCKc3GtZi21l2GjreFuthFWnr/RtixIhe1sHDDJ7swT/YN6CHtxQg8g2VS8sSF3A+pJHrKZzpkRc0RIBvckIcMoO3Q8Eyb6QoOO7PhsYz3ULCkOY6vBrSygkoqNH8A8McFMrDjrcZBlFKu9huiIoMPzs9QZSfnXxT8LNT82kVrTsv3aESR3va1WX8NTGohNX5/Rtgb6aDimsPTaP+A5ONiyY42vVY7sBEBmkuJoQQg36pCpLUEKBIbvoF3t7izhR1ajbuRquaW7rktYHukOTCIc3nQ5t6iJ9xTYLmhzHRDmUkv8hwDNCAaXGA8iuqeJVPVvpWvpsn6lf5or6ggfJH7jC3JNBB7T0+Vu0VZNLPjr3t6eO7aL1USW57HRWtT/jVqSJ+W1uF+avbSi9+/Rgu4kf0qoQ7vgjl2SjimjOQWQ1+q1fEEYRr4qpYXRGXbCi1WVbIfO8mNLS+tS3oAzXmJa98hH4mrMLkaiY8uTaVK61YhdL5TLjYj1fzpLhcKxe69NOLZ1Mkfy6TImenSb5TK+c8+lk60+qUWRjybPsc1bBjpBNl0QMzZ89FSYL+6zbCpD0xRZzWkSmSPnMuSRZeS5LmUpKkTiXJ4uRi0q5PJhcSM0WSL5L6ZKJRyBMWaDDGQK0808jp36V4bC4ea8TJfCkenaGf2Uw4Ml2KR6pnc+Ep+ql0axNHFuz66nT8/EosGumvWL1uNNI5V5la8iKtbJmsccYoT+5Z+rvTbCTJ2jRJznFHvhT9M5KsH8mxit0wsejTkfm5fJzEIrMzqVh0upoJjBZoddssKqzD9ojWstOzuTNLq69CZg1u8tMWqvnK8HfsAGYlxK/0gUvIu1QTFiFOdj57svnpj8I3xK5TaHuBeZjQKcadkHrcNM+r5BU27H4HPEUwJyKaqyAWxoEgDnhkLKPmoGql9d5Xq/IzcOqDey2Hcad80+TbCe+NdRYQ7ZbTk5t7+X73f9l67+7mV7dkELtuRzozUjRHgIE/Y39Buaz5cH1ofCh7dR3HSiFJPpedbt+tn1cBtRAK0NvwDHfGQCTKA0KX7Akh2dAUrjr3aA9+7qjQTcyZkZkjnDYYzocf/jR8/LOwndsun+eLMmYTo33YQTGbAExE0ODB5xjGzoVrm+9+ZwBIfgDC1UZ/r2a5RnQvHlJucGdRRFLZ+O3G8CqPpOL1xMOuju8F1NjRUBZ5B8FDXoeSXKrnLu1Ke4ndFWpYznLbDumGG9zmuuJvv29dfixCojSofKeDVvmRKRLJ3AiUx/0tuGOpCjW0df2tnTcuiGhDJiBYhzgpOJ8Zz8g5cKvPjEyPz/MAStyO/tHn2/cf7LxxPZBNl04uKJC8+oC9g+IKbg1kHFWRrU6S2dsLXDIgf+NLF3fevG3YIusyxiTX1tRqZ4AhKIBAxGhfK1dGCLZEFda+NPZxt7m69OkYvv329q3vVKgbd0ltoRERjnQpSrz9oKDwloIKtwxfk6XT75c1dmyM22bzxt2ty5dMO23DxtkTGrZv89+wZeYEiQYoiB5v+xtaWNAZotkJ9K6RTwiBpR5X4kF934NYeQ/Kp5Vk4N/2V7P6u49JvX1VK7/o6QQea2K4O4NbzBVmc/3q5ldcotU7fekQyaZIX/unSdq9KJX3pqDF4VO4itWWkWq1E7Jcpul4Fm+gVmdnYcELUZGiX0f4cIpBjvQ4Xw3+CjA2n7KO0UAGnOhX7tCropS3eJQ1Jrp2vvp6+OMFvi9a5p6trFcbFlO3QUlYkhH+dqWUA0KSylrtnr1Y53lZ5JjoQfyrna8/F/GvqH7uNix7UawOltvvOXA1QH319iSWA0M+r05p2n2pWokOdlUo3JsfyqnY6qt1yVJ/q4nQhp84JXOKEjZIRnxNE8sXV+RycLTovsJqd7wzdN3gm7BVU4V6dB2UJ/lonz67wH1YaUHDczr2korap9H2DWXijHNMHKf/vZz2N6r5gV52EK0MaWQyap7Ui/bSo7AOZeg8e2o8SNvxayYH0EtMnUQZCZkGIGO6cb0hJD39Pvp88+enAcqI1hsC1vYDruy+VR2vwruvwWj99a2a+1gzjfXSWNyEYyK/7YCXNLSc4cVo9zVBL0NoIdmTBFHwNWCPFQCkvymY9xDLLc/rdFfstiGRQabuIVG1NMWicC9BqIUgkmJ7yTAtvw5F3Iye5QBiZm+/SlYZrWt21K1S1jvqVgl8ZPCJzrE9vCo196eP7W7G7FrLts+jUhQZ8fra9rLdWfIH65Ol+him61g9Z9kMPSJK/JZOUYo9JXmBYedkfKDoe6I2eYgjcQOPcDplcjTMIpLUJ8JkrkIyjbmZtHX89RSppetxUqyyi5MFdXdSJGYQFy0zOTJZJTNhcr5KMiWSznHjZ5oF3kvmSLUcL1QKZCpMEiUSp98rhdhkmHSqJFYi0RyPupeJR0u5fKmaikUKhVaVlLJhl/4/l8vG6+VayqoW8rHo2jRJROj/oslINlOJ5FPlCLOE8pJxbpNWs78A/pLsJtitHk/cQ8W2WPh3Lvy+88abW99/IJZ/m87CLlLEoZ9VJCTWuBoLAFDTY0KkF8peV/dKBreYgOUcfP7TztdvSZEnn8Lx9NAg8oHtDeTDACOg/K6utPEbYWvGjbB7X+98/gRMq4ovZB9WkMgQKIvYqbPIQceRBYujFmJexU8+C7GqiOWkU/ZhWWRaiMW4F+Han1+hIpOBoxcYvv0B7Rl4gYbjLWPztqA3LxAuG4FENKphxBS4YMQUuIYNE5C0c6WYyzqOiMY24ohInpENU8CDr46SEqOogYgmXBAWMl/y79j2pSHB9iURle1LIGqnH8yeiTeChYACUQxDJrfOMd8f8ZMOIWK+NQSegBeH8BOiDvAhwoyq7yONaIwjiN4XAGS6MEosgz3MlrRqSiBla7FG287fsWancpOmAtErg7RnvnRvWofQl5JM2TDFjI2P8mN2m6/PuEEIM4NwRjAQwAj1ePfAA8n0l5XBhqg0RCSIRCQGpU0Vk44MVnhxJI5ADu2bxpALhzCDD2du7YP9wJn00sP2JYZakOceLQ+IDcJrelVMhcHdiM9lT/wo39Pnrid+45HvvGUj0dnR8b56jEiGy6MMnz66i4bbsdrsOhqtk6c2ch3m59dQyi5T6amGxVIAhNCTSvOlexUZZxhTHuPqr+3UQqt0ae866iHDvw/KQl6LK80ikEiDe1i5dl/+qBVgr+EsWbSMPdGFR7g+LC4NUXXQccVBBCXUj0h8rjSb7/A6ZiVQU65OF3Jz9FPIlUuV2ani5Ew2X6ffp6xKcb5cyhdyjUp9rpCzirPVyqxVLORqpZn5fJb+W6bPW/W56Rylmaf/FmYm5/PxCNV7k9FwPBI7UyXpaPgE1azD0UgikoxFUsk403Lp93E6bsdqUAGhu2pwb4FfzHSeXTgbevYld17ht1X4sP/1je3vv9l48t3OdXYhz7WXrU67zzUYt88OIzlph4WRNweAQBVR5TuDO7z/PfqbqJpLskaI5U4W1V4Tvjzrn2z/eIPWufnhPRaJn42bVX5DJqRrHhlRum4ZL7/luKGOLVIbh7zFtsPyhejoJIPHLl1meKKJZz+cQ4EHhk/f2v7ng50vvt189DaEH1jsWdwaSSuyXX8UAk9gczbOMCNPw4xHYDWcZWaN7FgdufNe5V7w7Nzi04923nmXDZ5ere81Qkt9qIGLlUaf7nMtF4CVd7kc8/B+LJ9Ajd9aVT7nvA+VAs32+m2RPI4Fe/7+G/FidNu/8xnLFqGo2RvyQex7Q4AXk1cGbDeTNvXklPFCai6zyBE/9ELyfAe4Yq/9twvDiz8JVniYLEkL9bPJJgwl6iejZpUEAosMNYL127PRG2o/+3JRv/b1p8Onl/ghn3xJYwAHAfJ346lyjFa3ZNQQqmamjUr51WUqnq+egRAi0Pwhu6muoAh+hr//MPzxNxFZRHTGxqO/yesoHmWwARzVGLNdFnKEisHFijgTE9eU6dZTc457pNG2uvQXIceAe6a8+Jupp4ImsOg/cAzIWdz+8dLGOosAJM4D6Upw1rV6odUaYq4jDJ5ty63RIdMGeWkrZyQ6+9bo67QUhdyA2K4eFXScrnGbPXLPXL8oeXjnb1vv3dXeU23PtdhVHdGLUguhotrrosqZ5IadSos3oEMXkb7iARKasdARbJRQXhqIH7nif/cbHTHDp58JTsTST1FXQlQuLTMmRDPIiYLWqsEdvVhpd0FcuVhPcFewSzLPvtTjY+Pxpc03rkinQVUNuxqz4i1Kny+8+g0e1mWD99oUku+pIRY0erFz/GoB0qlEK//jnxuP3tApZmmz2k02RVTdUsviCyuTtagC0Pq7Dh1tbEPsWtLpW3U550meO/LJMLizKPzBdmNNzorfPtl48iSQTTogF3urLBmT5DGkGOf2A86Nw9mpB7Aj5kkfSZ0l5totMj4659h5D2KPpSYS3hJ0uN4TN8QvvUO5kZy9+dvOZz9vfvYLsEWHiM31B8ZZiwt/PD55U7Iata3JYEb5E0pGjOkid3a8epgoYn4E1L0YqBGpYJE8gZFSilD9cL9FdRnPXvX8z/3uSKMMHmvZx+aSmD2i9zZvXN68rNto+OPfmdx7eklMplX3bN3hASOAazyjmLI2uDWirakdYhfWncCpFbT+8IE3WFd+iHgtouNs+Nc/SbdrvSpJZHPujVcS1TTkVguvFeIuWeJ2YkdjVXHDyoUBM8katGOL4ynW+8Z84KuEXENoc77FDq3oQIDzMFatFWo7evK67r+nlSWF/kiVKOaEokeDVFXUQt/ts+tiIOB1RnPNMr+ZZAhwX4Jzwau4ryR4xcnOu6oqpttxFlHec8SI09JsQhb04PzlWq8ENRa0V0Nv9Wmr0q5ouVwag1LIXoGrgSJNtQuhPZAu1gmQsCBRkaIBAUBH1Jf9UKpH903HlyLZamKO+6e0f51DyxuefnqJgVCeSoKqUJ6gR/jWE+1djFePFn6XPV6lq97lcF7FQFFjWwbyBAj0Aph7PneAfjSUJ0crB/gZi2pe5fOE1uB3NFY/y3f2eRqrX6lspH8ajsYT4x2NBRXftbM/T0/sYZaiswqyQ6m05LLQyEneBVfjE8dRCXci5g7KTRbFxukuGTnGdSHc0/OgjD93zCzjG/WjR0XmNVXId9kTvkKR3Pwo5hilKO9yr2S+WQcmWAGuTIYQ1ZiBMURL2cTJdKxyaiYzdTwXnjoxkykfzYXLx6aTk0cy5RkyMTmTKa3mwmulRr24El88XxQ2rl6UXf+DYKLdKEs+dbxKGhXSTeTrFdLzmvHcYqPeWc6Q1DSZnyQnkyReTJLkNEttnp4ly3mSaaXEv+1oJH02MkHL3VQ7S5yjSZJItbLkTHwl2fTii8npZMLOhRcSi+fidfppzM5krMjZNKnFpqNzszPR+em5yPxMdC4yO2fnSXh6PjxXjeVTBfp+x+nnaGQiPEOOlLOJ1Xbr/Eo+VUkXSCzVDVfI0VU7PFUuJWZn2q2TMffsGSeeJVaSVKcXm+VS1vaajTptI2tmLhwJ05oi1elAy5pTAx8rqjfwFe8xv/HFU+BtffbO5pvfb164yrukBgHBBBWklq1JX6v9ISin3JoO/mV35fiBdFA1eTmdyX2+Qf3s7a3v/rL101MuAukGpr7aFcywbzDGEdhBgAwYYKnTp5s7o204iAAU77b15EOKJsnF88YXzRL7fhAgA0ZnzZJiAAyQor11iBYW1JSnFaSYO29e2Hz3I6bs/ekbOQMlObJMImFj1jGCj0ENOBNJtV/DalDNgKWAFaGzbqhAgDbP0Mjj721/8dHWW3/d+uoNEX9vtWc759s42apAwKlWeQnGAxgNgGnBY43uBOss3WONeYa2ZawxtmkIyTAwVKlX7n3vvL/94CKLc/PbDeHh1+17mhq8+0xQ1w4hnx5UGVfScD3c80HiB4AHIEO4MxQEVHTLomnxfevS5k/a4usyFzpkL21bXV/0z4DQnwrWlz6CI+OLsxx85Nas1fWnDu92wcFYppL1eFjIwd26dKTduv3e1qefbd69pVO9dZGTcdf0MYbfMBqgIHqU5027GXfYYSfbK0M7Sk3FNS4lf//N1tWL2vDctnpdRtlHrcmAOiIBOUpmIdH9reoMbvGgxfdavnbd+uK3zc+v4HZFlflTc0CNvuC2zOFFXQdmHnjM8Yh7PKlh8Zerw0sXN7/6TmpQa6ucYOSO9ZoAMiLciiL/+0At+pxWVKIDxOpKjBGypgH1USXb77KUripftBgf/GCOjYyfnshdVM+yZbRpma+XE2HXb1Hi7QNFe34rHGVFZxtv+q44070BtvHoHuCtsmchZKukbBtAY3mRtIhQefW2+tAYLGyfWL8u9LkauvHrt8NLX/JDYP6Upf+EUNN91Qh7Uqsw032jAZjLKAux36M71hbyG+Xi5rY4ZLjHls3Nt7/f/GJ9+Mb/Dt+5J11GKZ0glGKc5wpWYBAcEVfB4aF5hu9+SSF9YH4cI9UzU+7ZrOjzBLT8XiPj77wKQCt8INn9xlvvb19+sPHoA+4p6NBhaddCDbZloNp6vd/gV6Rclrp2BNszkAEOA8mm1EABMLxLDQ6RG5OABDcmAMbjXeKYQ/6gPPrA1FFXp2Z3BnfqYnlUA//5lXaIOdfqoMXbb300/PZ7sTC2HatT0ysih7DraC3UoOJol4MxCctBMIJBLgYJ3QQMHiLNUBz03eEJIlzluTi8/8vw3l9ZuFCeMpvqtmzvoBVEjKImCCp6EVjZ0wjFBbuELHlxfhGI6mVd4r04uwgF5jnezvFdt4mJAFc1HPdmtwb3MLEJt28sHxBrxkB/drZZ2O8GQ20uDmEzcAjK++Fo1S+q/o6qowdRRv2KqNYakZ4IuqFWCZUmiDW2vfU1rasZqpTS0FiARVeoZhvrF/16kqEeGaoLUlZASTHUE6SV+NSIvZUIU4F4sUUfLdn7WLD1H4ewjI6uIXuuIGiFezFqc+0x1ojdVgi9Ovgk+AsIREN2+yTsi8F5JtxLS8KgEMbyt9LervasRlphsLe9rj4gjrFixwhjfGSvMMbwEqeP7BE3zFru2OL+esdawoGM9Q+G7z0v5qkZjBAIUIzd720mLqyWL9aYKBsNNmY7/Acj3JgsMwOOKc6QN76qHvzxZTXBYYnnM/XVKdKwMtPVNElb02nSjZB0baqRmstGSbhA5lOZdLIeJzVruhYn+QQLOVadj5PcXJwU4guzxInyoGOVwkycxBqzpBnlYceixWohUqH/liL5UrUcJ9VIYTJOSuFsrBQn4VyjOUXS9UiaZCIUO72cJ/NziUg0XE1GI+FMnFDaSDpOysVkIpJPRhPRXDY5Lmix2XFMUq/XmUiuhQbrqyIbDx/an2/8/tXG+pWtj9VlIyDsyMs4D/2jQN+8US2N4AHUBzcK5fqA2pBz5PGigtp891sfVFulHtFocriNoO0DagTHvDvQ67PhxbyROst8LWN4IgwL8x4UqFtPfh6+zTYodBQthKjwttjgcvjWRshORw7qttMdQUegACfWgLEwcLrUbzs8h4k+YVpn2Tt4J6M8OZ98wfpYHY0s2fZZfCgiQfGRiJiVKLIYwBpO+QIYnPI5sC+uGECZgcVYT7MghkaWT6jE8M6X3CPvfF6PDvwjZYDyzx/8TcgPafm/R/UX0WE6ovH7F2gb61jGjsWbeRQSpfqk2yN+bsR4NiJVAdPg3y0ZVv7dnFsUYMg2ub3Dv2o3AcWuPMMTrIrYl4rPEbCRrJ+iFOX8NJoWPL+hacH5mzOrYxgZvCrgkVaVJ1aqVWVoTcWtH81w25fv72cTsycd9wVnOkaSv9dFO6JO568LHc7fkzvvSyBjSVFeHIfTy+OYe5FOBizw52/Qad/UDv2INbNbzT6VAZ6MDvUW5XfplQBcof70daYJs1vo35dZGg5Fkh+CoEXSEAtBkHxa5iFh5yNSrQotupvEEaqokuowXnyjDw+9QOkyMl0Dpr9v7gdNfN8MhVkFMwpNJ9+8fLkXMVBecpQGeRrQ8nxQPDNO8CozMdVpFTP+gGbyZ9mN/ohm8lcWj1fwYcTyff3k+KBmnFJE8pVvcJo+PlYr7zrWWtuqu5Z5cVWWjVxdleX48qos0lozkAfqw/lYpk4/jbDlRshqkmrChTxJREg+lpqbL6bcFEvk2S6TI2FSSpJWjvQz7FbqWpjfR+1myHSYnA+TKruR6uRY3o6pMFkO8xupzRzL3DEZJr0wv5Gay4obqSwob7VQyhbDpRxL35GKhq25SopEwzqBRyWSiIu7qCwsbyKSCrKXu8xY0pcJyaha9LiF48HcfGfry/sQD8a1PBEL1mOxwM7oBIzw3cNAAKBI5amdeliFQHoRDtjw0Ca0g1QvKKUNtS57mnmi8Sx0g9ttuXCznFR2g9+Yf/blWWaKZmdMjxd5hEB1djy8+Pbwy5+3339z6/pbww/fHX74YPPye9vf/5W5o/HT5MW6ZXeY/xlzPRTJ+WSdTkumBfSWRLJ4HcDwJttXCFx+91cH/lLEsukcu2M1bZZEmM/9WzxgRMMw+z19Orz0I+i2gh1kP5VDHdvH6IIgZo+MFS4gbzV8F04v/UixQbcVwOaF0zXA0VdOFThyz1ZcG17Zkm+k1cqWVPfB9BQPBA5A9UEG46GbpwpRSWfKKzSFjC+5flE0A6g5AlRfOTO5HIEELmUoZ8EhBxuDZKiyzBzKrqSxIRDQmKKjcGPqS4y2wIdbbSajCDQA0QcXjGTePpUvLnUy1YzyfiVvQhVVV6LBtbkxLejrZbOHRVxdhYSFvLqH+tJ9ax1SzyocUF8VEJ/RBluqN+XMU10p4PiSbvJkQmmGUB/iDjQQxmmuy7wPA0Vsz252LCzfDdG8m2CWQhkJw11FoRaDWIajV4TXQ3IJCaR9U/lkwyFN4UOaYOItqE7Us5CMBsFszABzLh3KgH3JERZ0GVWAhQPuowqaVzn64FbMdyFV/Spf3HclVf3KfP8pF2WsdL42VumUZFzp5Myffu3kbufAHXZ5j3uayqi5vIDrlNyR1WJhltp212kYGetRKaiqukynrNdlOmW9qEMprRpK+pvi76PuptVU7Hw6MbkaLS3Pp0mpViUrc2mSihV79NNPxQod+unGw/kl+jk3Vc616cfLTEuX01yCpKelv2k2QcILsxG3PUtKVVYcni6S9GK4Qv/vTJVT9LdUk9bXSCTtfILk4uHEXGW6Plck1SyJz5fdPIlbViU2uxCZi6ViUfooS1U/xTLKT0emw+VKJDyViWaT0clsMhPt96LdzglaUeIc5c1rZ6KTyeViIZpPOIsz1dgC/Z5t5NN1K5wnrTyZn6mmZguZmd2S1FuLbr9pQVjEa4trzLbWVJFY/nxp8+ZjGYbF5dfjuAJ6htMo87uEUACCTlNI1VPQSPHsLKiAmiwKOY4ju7X+O4SPbdDBtygdhFxnETRuR0WOvcljl1MS/bDUs9njOvZjpwF5HnieqodYzR7++uHm7Vs68CNLhmotKX81NboxkoeAAACRgquamgnyWmndBpeom+DIsvnpF8NHTMDXnU7NWpDRTZ0ztvaEEpQeEPKAVIJ056uvNSnk3WPEkLu63+vKE5DbHX6diAdDXf9h69evxG2mFVukLuUPgvn/oHTQtZ3BQ5bk1dI9zK4u3WYSa+PJLzv8NHy147Fn6EPcpEuJPPm170fx9gEiXxxQdHI/q8fvC7dUXJrBzbMhfiWReclylR6lud+68R6/kPjZ5udPIdk9y2YdOuux+2Q+Bzt228TYPajauiMOdgH1Os++VAsOrpf+XzoO4nqxzx2v1nAZdGi1y/olB+sL/EqTMDrjF9y88cH2rW+27vwOb8fcExqjb8YBcRwhUcPoi6m65DVPXqHP1ZTXSd+PVosdI6Fm491EPThLi+sssEYVs/cxz1nAA6SpK4Jb37+x/c3b4lrgiseCLnvOYldOJEWtPLflV++gWHIHKsnVwX//nNPrezUIXXmTLVzPry6BR8pw/bPhtQvCI0U/bXxRnOFf94sEudIlqQpE3YFYnlTzWhJAWt5tXX6fQoG8a7SZx5aIQs0JIQQ1/4ZBgBjIVOxp/qg8V2iyc6rl0OAOt2HTWh8vwDXxD78dfvuBvCMun+v+O88CBl9tA4UK8h7XiQd3miIEX0hick36151vrghQ3j2rPTpCBSWClBjaw4K5okAEMtrL/+KX0Ybv/r79y3v81ZRbKveuEE/D9QgNsCs5BCtXALJzXJtlyGbrS1uHkWcBWkIVFDZ++OGPFXGIcta1VnqWuLsv4r5yBAYAIWgRqBrY/ed/XpMD+h8/mjAmhhC3rt3gNyn5fdieXNe2Lj8W65r4VSzD/E8lpcU3bzcqtR7zLxDYimqhrE9wBnseNQLyQm/fv7V9/6k4Om86XZkJl2t6g7+DLukD2y8UhEXWYK4P62B8IaQRrryDcYWgxsaD5QrXGHVLqVqQAMkdoylJLQkrNrurNVqlQVrJXjoJ6CMvpFT4dIG9NQGsBciVq+actwNXYN/CS7+ysM9c7MsYT/W+i5Y/3o9qVWWbPL6SopUMFjDxrnz0024Vi8YBVxy92hjLAw97hJcF/5qA/wQpvqsMV/Ibi10tuUFoa3mK/jIl4m7yEMtCU2btIbGQtEIyZxeJA9LGnIf7nIWmXHhRCIwwEmWVYcVDVFw1vBFLE13l2CKXoIsc98OhiwMdKEbyerHobTy6MvzxOhs3eM/PVsCp0L/JQZTA+/1T4/b7fNU8fVqOu9OnTu7h89XqeAvCges4OHDxMr6NPyaDp/ISboN6bQKVIAuUyD/PS/nGXiaU5wXc+gR543kZ5IhU30ZtUZl4ep5+rMlKapZ+5iaTRbZhb8bJ6zHSnyL9Io+Dmi3mJ+dmp6cn4/kTMXJuipwrshio01P52LEY8aaIV2QxUDPT+WwmHi1mc8Xp6VgkP50vZuLhYpb5XE0l5maVrSmbmYrkc5PI1pQOsjXZDRdW2McsKraxBX37n3gLyh/laiL/S6mI/IunAYBQkUh9kP+tdp3cobPtMJUE34BpS6H9+Ly8AfPkze3792QiXIffPtF+VKrLfYD898cs280d7pB4/97wfx8jCJNe3diSPazSSN7hsanXjF3KpatbT96CLYoYSv7LTQITbb7EY9JuI5YJhmsabp6sU2Qw3ChkZLdRKKZLkhy82h/JdkOSd3Hxw/BK2li/SF9h+NvX2ITDEeBUVU0PYb/B6GNgAVBkcw9AQ9Yb/h37qBig4KYiMdUZv+wXdWKLWTQRA9AwVBCO3wtJsqy9kEZeGzxW4M3h1J/TwpEw5lN9D2pHGFsYLQDKNN4IdDoIxnT8aKeLDmL2HAEOJ9CjDRrQ42Zvfyp8eTmMlpbKkPPy3WwdSidLQmXFYTPGE7/HAxkze9bsVn5OjrlCSAEoGMJPP8aOw8XjeCGqBOhLCTvQW2+5fTkeZfgW4Ukv2NYSCETPwQgNAXAoE/WwZpFmRm5y+yKkqvkSQTNEBcrZg3Rk/B2o5dQgCTLF0PJEgB2GPf6qHMgMc9ZniRG/y1p8dhhF60hsUMpOjjfCMBpuguF/nNxFK2OXMTq987a0wYhooLJIWGGkR32DJyuRMX5AMRPFfsWMlTpLWDOTJVo1U5Vov3mGFKiZzc2k51nk+vmZ1Gwsl5rLWfNzNa6WpaNkZYpqZNVTMVKYIcUMyU5P5mfjLDV3PEq6WaqWVeMsNXc0SnU1ppOlY1FKMR1NFCKvZwlVywrpWDgTs+YT8chsmKpnLE5nOJWIRAqZtIrTmRkTi56/PDqFaD//mOv13/5984P/5Xs7z5VJ2O7pZhb7O066K6E8/ABSOP/wOh0eVlKc0d2shRgGEys/f0cRmDy07AV16KGehqMF+X0PWuXyI5+GC/OMbXAK/9cPKouhslxe08m7uwGH3oLeuCPPCrBD+ONznCWf6nXlCWsbyDQtsZE/uMIBhxk0YLtKPZL8Qigs7OJyTcS/0oEMeeQwEfUKvCnFKIZIV7oeXIGBauL5gJAbOOZWSWDdvDh8l7Qy85YWLKs0rcCvdts0Zq2uyKhBI2ogH8KIHzhiF3ean1mki/Ee1DxD/CnENniJjnCtCnET6yFnYJkgZoZqk+ug5vU1rUyjqzkEd9TRkSDR9ThAY+BTAMLU4B3+R3T+WA732/cSADSzOmISz35fYDmYSaP9y9WrUbYEsobUOBoBkY5TzSw5QMYKVCxMsSzUkvCMFITvPAFBqIUgElhoyMPQ1mIJ5NE+KUyh8OKz9KVmyt68qvFrzIAXHlcv0PNBDtf0h1KAwzVj6NUQfQv6ElM+b2vxm3wtn6+1+I1ngc5hVevEeCdrRiITR7unT+zmXW2JaA06lJssETHVTvBDzgWr0/TsjlfHeaONYp072ulYrmPVQjqeGxS5cMIm6lCR1xCSusMoSXjwNb/m1VoqkcpJN088+u+pxiSpVMjy8VR06kQqWj5KP8fysckjs6no5FyltJqPrZXmKsWV2LniefHsiX60sHzuVCvftTK9/FI+dq6TiydIv1dmsdeER0ypSrpl6RHTO5Npnepl2qlo+mw0Pe2e6rXac5VEjKS8BSszXSomvUX+b6KQjtfpp1GJkNi8tZCJ1Sq16JxTic6fTUVnSsXIbKkYni6Gz1bnaPXk5GQhfbyQPna0XEgfqU4XV6vTpZXJdD/XWYp1uZZHPwtWu1Vwz4bPzkadLP2eTYryWj5BrGhqfi6WTSZoaSLQFUam1ltm+RghaWkz9K8fzqCjuu31uzt/uQlHdSvSZMsPtyWtYSqUZRAYnf7/IR+rm5/cHf78DiTmW+beaj0flDJLuVRfkwZLFl31nghayub21UvDL/+iPFdYcFlhJOy5dn8ZqYwcQJqMmGy9IlKMba//sP3bXaCVGqOglebcNcdF9vcVqSXo9njwgGkFqj2W6NO8Ikmmzi7lV0/lYrvFw5pt3vtu88lHikxUL59U55ddOcXkffRnF6iYuuOc4eHRGMJ7H2y/+6fNG5fZWF/srS52VKCa7uAWzFYDycM4ACGWC2XRVsTgu2PZPWvJ6qrwOTd7tB16rCNYkmeep3D70Yfbj77euf7hxq8/i3OBpSWrp7jxOP2a5gYQPW5sWQlJTIZ06S8CjFlBqLTqeR749kgY2EjY/Y4DGbp5r7I4EH2246Udu/nZezzqA33M488Jd1NBA2NDft8XAtwjEDRgNrV1Si+ekfKMyEG5feE6j2TRsVTlXdtZwLZbe0GlMedBaZiEHz54vPnzU6BTVQpK5eNg97y6MAMzheHaWdp2dFjeg8g2W99/tPnpg+3f/ybM6OJhZkQXmdY1vbai6zITEqNhKB8OGItM2z6/lcQ6WFv3N/9+k/axYKzjea64GNxANn6BolkT39UdJ4rGxi1HGYVA9CrEh7Osd3yyj9F5O+1mOGzncmDksL3jNM1Ic87yqIuTwDWdfyg09vlR6EYIMQaOPX6MtVKkBP94RSeJvPQXkbZxdXFJPqaSqA/umWvvCNi+oGQLGmCiIQd3XB5cynn2pUu3Bhzik6fb797jHuCu+FH8obzoOAlMcUxI57hJKyuWX9QEr7MDSNq73EO4IXGYg2Z7cIftUVmWjQWBt3np0s5ntzffuzz89TM+TCUpHxi4QKoLQn0TZXzAj4COQcRYis+uS0VZx+BycJOWPPuS/Stf+Ort4Y8f0//z0PGMQLGmyIEvUWAdAEn0miBT4ZvaVs/Hk3jJmz1osc0rX4sLgfRRaChJqFuJF3jQSDfFGb1JLKMysb9RoyzD4dKaeAWx8A3ffkxfYPgBSz6w1nOtFRFplD2vBq4g3g+pXLLY85BS2ZHvrar/kucTXBH5cKXYEBJDpFVWaqdOrKwRdqdXmZUBQba+BtgPB+3BPa0L++i9/TCgAfAdJvX+3vMrDUX++JIgR6+/xv9Sr65fezyZfGtB6B60Qhu/6QHqs+EFg+NqgcI5qm4KvRWrm4aqqdVEEOVCfEupDXohVuf4xQehyIEWBxqcoXTtpnJpdcvUjPalF2mdCCsz+1FltBqjVZHd9BfQQUxlYW9VAasJejXfey1X6zisuc1dXotqmxAHnz3pW/v2s/L5Vr2DLnmHsp5o4b9v0Q//gqTeTU7DvyBj9yFhpXT1CcZdpRIWiT55thcdSDIkHXaTDUoO7f9xW6CPBKVitDH/WQwDev6xceFdAuKTF6ovUvBY6N/42I3hk5fj405eBE3j9GnO1+nju99rb1vNUeMVLx1xKmKF2KeIfdd2K0EVaKeKpdLz9GMVs6nZbCU111PplNlxRzGbzpFUjmSL+WJ2Npkj05OJHAvwRErMWMU8iGL0e6xEysxclSMRWsTsVXFur0rFY2CvioczcWs+Zs3PRnNlIvyICpl0JBXPgR/RmMxyntOiMl7eZpG+gM+vOPiIYnjtwvC7T2FLToV1R8aidFo8bbG6YyGQPBMIAIBU3a7gxBBssjN42HPgVOIu94uQTnGX7my/eUO4ZfbqzrI8IFFfQDNXCHvSq3MRhaD2NYu8Y9XGhlllV419zT++1vsaZ2V0W8PI8baG4yFLlkA0zFgUE2xYEhN5D0l6feV7EUZtFzn4yAR1oyYsCm6asFgVPguWMRFQLQa8gWmgGTDIZwhzivwHTFblpg7YlGFpVkasVrf8TAp8ExjQNI4JMOI1hJgc15K6m0wrFeISPBX8TLKTdJYTVjkm6bYEVAPPADLtVBxmLKeYQwaBmQNvCD93EhP1MurhTxWMpgU/ocPsWuvlOpaTgz0KM4Ym3KhBSnE10pXctOBnybGFYNCIGgYAgHLsfW8hHvcQjiAYDZm2l0RD0gyJHsWuYBUEjJIsez2JZ/YLz7mXnge7cSkHKBrgLziEDt7NQZ4+lDwZ4OlDn2b5hBoMc87n5cN/Gz79jL2Pz8mH/8S8wTpWnKpB7K+2M4MVoWPjvX0osQjy07FEPmBKu3L62C4akVV3mF6wJK1R3FIEZYYrtiocVZ7ULyMKlPoBK1GqTCtSqki7ZuuCUd0qFyVumaTnz5bJ8UmStnKx1Gx0rpCqZUmxSsJplpsnK0ID9TOE+wRRjYt5A4mIQOcypMS8gY6lWDwgL0PKzBsoMpvh2lUyUYjQ78V4tBCm1dBKrHmmVykv7WQiRj/xSCKS2i0ikOEu3cc+fzzBhbC5CN8/SHABHtMosHtbZHA04roLVG8vR0IzqLsEguNApze4xbQ/YYZgTnniKjHOLLrx+CZz51Y5RW3VcyqCP/vOUSB8v4LVN2zk9ZTtf/5jeP8vGESdeysMUMZoCR8eMvMecPb4HNbJBG/DK09AMwPkEfUMRjO+YitqUX7eup6ROgIrQLoalGJ9TcKbGht6mSCtTVTn9z2CueXT3vyz0ah3pEJ/LaP4I8BIpzPfRocYDHgdGfgFv4ow+/veQy8WQS+iahytCuP7kEchR/Q+40V26xE8APxuSr43gUUr6EVQpSoRn9EnuJ7RGkagTd1QdAe/pmV1lkzs51f6fMfBjZtqIt/Y/PER97vwvwIspbt1hn9MmePpUwPYRAMN8o8bSNZhDyMA1F5PBvMyUmAQ5yNjJ3jgcJUiiG1Vk68KA9dENKDGKqIHckI31g1DaGKmgCHEDRbrByJUOqrCORCtX34dohz5A2byvt4NTyffBJXe7XK9HbvadlGfdA1aT5PyMN1wj/Tj24LUtTSpB5Sjyi9/hQDHK0XOQl2eZ9zlfCow/C7f16cGw8/sdI//bUSfPzpeB5aUXP1Vfx/dSwO2XctRyTWPnFAtLUpFXKHjkICy1/ZEosvXzDL+3Cld1rLZsbstnj05Ws6fF6GN6k7XWeBRFfnDx32FQg+XhSzLvWQUlQgmj0nObfnESV0gauPfF+ga4kr3CaXyQxmo/J4q4k8dNYq4Qi/zfKoyzvkRs0yHZNLtydiYwA0H8Zdw66gNg24FyBLKX5jVpXDV1QH1Eip9qP46gbkKjOa0UiCVEpk65pVIM0umjjcmyxOVXPlo79zkml2YPGIXSucbk6ulSq64TD8r5yplUuidm6L/7zcm8x366faWckerpN87N0E3Itn22Vg0ko3T/51ZmMqwf92FqXQ2tRhJkGzKCSdIMbwSJQvN5FSF1CfJaiHRoLVPZ4mdyCfiNfqp5xOx+UQuTGJWLjo7U43OVWYjc9XobGRmLheu5MKz02cWjh8rho9OdBpH1vKJ1fPl8Mryqt3vlRLdzvLcdCXpLLazqXQym8okM+nkUpzWnUmX8nYjGqnXrHkKnqX4s+FIjOJHpivRsS5tXRbPwEYeKXd5lKcvRRqtd7d/vr154660DLJndWKRrq2TnykkGfYCEEbIkRdb1wZzcKvrdJwllqibmw3vUmX9Y3EPdRVus288vrzx6MnO397fevIh8+fqUjkgiHiSIo3hKvOiKjk4pA8P4FyeRpqnasegzJrK834A5uYb329dvSgwORGVp5pPgMGsqsKDA4+i6o3bHS7sZF7OKwshmZGIyW4eX+rhJ9sPLmw/vcNjMijZaOwF74AQ9YFaB4HEO8M7SgDr/ClS+nINhq3jPRhA99c3frsmxtCqehJnpZKUBtQ+cUwQgx+Q5sATz6TEAlMIsO0HF7fvf6vA1OOYMbRQjOAeBHQUEdzcnC4zyfK1BHJ6yWncGdyB223De39lM/mN9+XFOkrHTLuMTjCMgBS3uuiFgH2oFoTKsN0FHjJRpK/kzqYLxvXuN74afvgBbM/Z8FkQ8XN91hnPOS9+MgJRiaLRDJayIl/wKV4XdkFD1ZmpTqE2wxeNrlmDhy6ct1BV7WHfVc6n208/2qG7BO58KlZzPa04GZpS/LuFQIAeiGECiWdFg7pWh8UNEPXfkVEmZf3Dp//cuXBN1N8VD0oGxBecadfhRQgE6LmDA/wsKPX4o6JgP7XXnUWqqyCpQslMgTKmakGpiSBnpgtRCQfri3w8usjGuXPvT1sX/qFjY/e9rkyd6Vo6caYrwxICAlAqGpUwU8eVZlnKWsqDU8RKEJmeNh7dE2meGm2nZaYNbiFfTfldHkpDnihap0mNSNEKK7KzyRZnpCrrpWr039/cvvxANDpbcOXzODkn/SC3ZwyLssVBnjgRv6YNieJMFJT+ucMiwmG/1ruwb6ESYueLt8X+Y9V1rX6vLtPW0WFFZ5RqGVWg+FBhiSjl1pUf1TjkvwMt5N10bM4RhFpjscpvNrHZ+/d/bP71TzAkekuCQJzKyi9wICvRPAMMQBC5Oo2VX9XCS1VSOkmdhZFUloM7Il8bTzA2vPYT9+xYXOIarEq4ronVSNUlBwGTg1cTy7aCgoPzpmlVU0GBd3DWNDG4DaBdh1x1FJKCWdUoarFFRAbK3hAm/fiMlFK73UO31XrtYaqfh68f+vS4A2hxpgb38jrXIStGf4DmYugV0m9ylesSoD8YaoOpLeDlfbfFXS/selUfsyIaK/GBF1BY+XZd9+SapxcslayxP3jYU9kaf5arlVqpXn49eeFlwJDae8lsJK9N6XoAAYblqikHDwbiGSAvKrhGD/BYRtuFwUP2a2If+SNpPfOBySNZtQGZIxUbxtndxMk9MkcC86cn9ooidoYFdZOHXTptpCjVSSO7jtVtW3UeZrHe7rdRShtVPpLTRv2Ak9qoMl8uSF6dvEWpIQOt194ky7uYqU9WSCMzSzIzlXSOmapztZlKNJyao5/5Uq9MkvOTpBYn2ST7cW6S5GYKpFyYqZRmJok1Ey8lk8yWPT1JJo/lyVSBVAvxJLNnT02SqenGbCURyUZzRUpTTSaKkZkK/T1aDK9Fyckp0p4hdXadMRqen/PbtffyGuQ2hPO8eVUG+AY3GPMIKSLTwI0fN796uvnxU5U8SzwuVUsR3EZ3m7Zr88ektqzRAqB8KGA5FvUoky6CMV3vBCJ430kqZNO1Wx0JjWy6Ct6/YcTV+PaMvB68Z4Sq0I7R7qrK8H7Ro3JvibWxrYQbU+H/9QOXb5uf/bJ54cHGr3zX26VPifQFXU4Bxho1CkWiY0WK6TSR6yOSu27bhWoNu/j6RYGj997doI03TDlkd1dlqpcA3+wiDg9dpOCR1R3haKu7KjTN7lBFoNVdVmVa3XmFfou7gQ4Wd5Afvsr8NZjYI6DI2m5IKnQwod7icY3fxqirYSbgH32w8eSKPJpgNbDbGG1kyzLln1GRqsKq6e6WUb+ufi/hNfAopGFmV23vtQJGYLCZ3dcFqM/9JvagLhhTkx/eBB5BNKO1mY010vjyyrBqeGlVR82u7XW7NDtkbwJ0yNykWP4UcE00MKj7RvzoYPEb1I221p3qM6YHtfPLDRdNLc3paArTzYzdKWG2ubBh0hT3IJU2OzfeQJ3Is0Jw0zdA9ZyuXbfbUoYqYRbH2MaY02Amzq4m9BdcqMT02INYLRF4ZTi4QN83hdqHqCf3TecXYIcqUQ5vXu/rhdQM883ZQxz1B+tBRTNqbBc/xQKs7ZLo1ZBznuL6g8rBr7Iyn60dfmapkLpmfp8j4w3tkowb2hnzp4/sZmWnM3OZezeKaCbCTqzKsKZ+xnKWkZOpUtR58YiWzkuxis4LtH6uqtDaOXsgUDWfznSypD57Lksyjfh82ppL14qxWmouZqXmk0UWpmR5iiWfzGVKZLbAAgFXcqVCrlEtkO4UmaY6eLkwmSiRSoEFA65SpbxSmGK3eAosGPAk09FzqXjUolTVeCYWybOSUjEVD8fzsTpTx+fSPMYcV8iL2VQkns9EEpH0buGAW3bTgtszKgzudR5Gvd+QfqZbt9/b/Oztzfv/EAeaq3a70/fOqLvuqFtEFDMBaMABCCKH++26DzG9YohFjLzuYq/XW+8zbpTX65IjPV5t3nOBXCAMdvKEQbZ//0KByLNwNSLkkYQYEPrqMMDJO3MciG+3XfkebA52DG4Axts3ijy37BjsdOToVDGL1XuZrq0CDLu2SswRBZujYe1aMAkbIFyBeftIVQEqtq4CKdkKTmvYem4a95BU/wTdRRI9ZerXsja/hm3MfFThSE1+eD+wiYh0a8w/vigw8gLy3gBmnkt3k3O9co2wLqoarQMDG5A+rBHfVcT6bq2OO9inUpu8w1I5wjoUomsbut1xBX5oE9PUqcfxz8KZ+K40idF547a+2ORjHZbqMc3uHy/mWPkUISIYUKr/mEFiHdoQkXTKLxWzC5dYRnkdGRdBg4JrwSOMihIftgGIoTTG2Ph8Tleuyiz9Qh/nwvjlXZELg0VRo+OnjpcYtDJgToALuRCoRcAQ3fsV3FpoI5E6rjYQmiAtD09qHYYQOczZvI/m0HMKT8+XH+ovMwaDtGhaXg1Qodnjr4oB8vy631tV/Chf1ac+K0KHV14xUrKfGKs9MyquOguWT9NHx4dmZqartkjh8N+vnDjBow/IIqH8nuAbT1ck+4OjcFfk75O6tSLR2S/p78H31900qZyMnaX/P9VcmDpOPyemkuWj9HMsNVnKkSPJYo5MTiRLLFt7IlZaWyyTo0kSSZCVYrNMwglyfqEwUSKZaVI7c6TEUlrmvSTpzubbSdKbScRy5yYLuU6llPXoZ+n8FJnNkFbmzMoUmcmQdjJfZfneqbKdTZCFOMlVSTFJmqlFZ7GZOpM6k2w6qeTiUom0YiRhZ1KJhUopXqefhhMrRIiVSdViiVh0brIQnY/M9GjNkdkurdmdSk5PFqrhmdKpk9XkieOThWNHp8uFIzOV1USEZOMRK0nmpsuTRfpnOho+Fy7GIxO2lYqGI68lyGLTSTIG5mMLdriYjcwnclYuHZ7LxvMVui1IR6eDTsw7jt3zOtLf4NmXNZY8yLhmv3nj7vZb15G/gdOpd6W7gd2pMf9yaUKXUJ6BBAiaVvkaCGrllNjs9HtWy+o0sDn/p/6ajFIyvP/Lxm83hpe/Zzj0VTsrq5YrjfmaVLGiS7z9Y6nYRkALrHkuFU4qrwmVXjW6vPEgKF/8tvUeN5z31Xi35EgWBMCPKvD2BFBcKApwKWgM7jT5DgCyqzjPrvHD1luLavdC32nzTz8Nb6zLvVTDblqQ5E19gcgEgIjwAASRK1dXBeBq+hZEL2MAz6+eF/TDT28I+pZ0TWHELSNgmSLelVTX3NJuOmiU8OwGd8XBp26BSx/uvHlbtIB41oK/wGdKjQ2JAJTwpHKZQgOh4zT6dKBYsEV6foUHOGkafn9X3t/59ZrOq8koKMlI7kkJhZ3+ZNGoDQfq8ZlweFXYhINqM/JNImSw4fQs1YYt5Vr0+BM5ySFjaQ8lK+1ZssVadKRcaAqC7QffSQI1rXViUosKbNhqP796hu/yFutYuHzxgA9WFcODEkgHN/aXjeJ02XW53dY4QA+UKkiXoHUNseSTcAFyyRKno/3mC0o0QSvf3bE7Vo+50HSYBYsrBoy6xjYUDZ4ejWXukQrC7Y0n3wx/vChPCoHKdR2119WFeEOtS+1lu2FWIYcK4IthYuD3uv2WD91MuNq0jLgjPzWkgoqG+/Dd21TtQG6uo0OdO8oZA53issv3gmcMrMY3CsfO8eUYh8NUiseYFzqgrMBg3WtYvbq9BCkOv+TeThf49WGWIw5FdqVq9vd/2vxMpwqlS6Qg1skYJZYajqjIk2+g8HlArc8oogGEUjEqKPewGUVQL8cmInPxtQgmRfTJWSAU99Vkj7UhWrCgUjOq7ri1wfrSrvwACLpiIVBcFZuqp6NmCr/RJuzRho/epGKJx0Wwep1+XWW4dnWmaQDYDzlkuXZ1tmmv7rL82P7UpiIOlchrKkNRNa1eVwQ79ZyOFEwuXDeROEInUPQ+Ykj6DNScdI1uJbXr8K0+9+Wik/I6P/P/6PPNXz8efvdQpm0Eec6o6ro7JMh+IVTkYoGhBnAPUmArCCAXg0tV3sGrSUctJ7uRqfGI1hSPcsyyhLeFexQl5ZqLCDq788XXTIMQEWdt+qDIlC48mCUlan0JhZEAxETA5ONsb1yd5f4QdRaAk7sffbB5732+KMKv6jlTTd23kmooqKZuuZdmibVKUwHcXf1Dqp+huu2muGmlTatbuyhb8K/MisRmBWt9xk7/+Z/Z/Hp2gWeFvPze5nsfGIoO0m9gdTFXFZ9mI5UU0Cv20ipAo8A6wR4agdIG/Ou0sUQzsl8/pquzTNfEE8P0zAV5/CsBqVhyYR30Sf79yH1zaXoxAB+9XjH2IeixkMcCeh/iGUSzTowV2KWmUMUCVQvCfYpBEIEgx3aXYvCvljl7SByQNgFpVQffDL6n/RwO0TWdPTPiD8l4YGMswpOr0goGdw17qxg3LLGqmIK+8Ia9ejj0byHBiHFW9NqJ8fEN6dudPi2ZP/3aiT2cIuvOgtNmG27hF3kK/CLhB25wPQnla7S02fGkbfbEaLkLSSQcKPRcZJ1VhSMGWvUDttGqMp8bpeJO3ubFHOjQQLpg9NgqPTedmak1/itFZuosSVgtbc2k5qarqflCu0zmJ9kh01qYvJZn9tu5SZLIlQqlwswkqVbL8cLxPDPdMpfKaqUQO5pnhlvmTpmtFnK5bLSUy5eqxWqkUC2UssVwKVfMZeOz5ZoVm0+AG2UiVokk4uW93Cg7/F27XcutM/2fZwJg/j8/rLKU1Oyuz7UFpvFA0IdH71HpuvX3J8NLFze/+k7o6KsKISDgDf2J/WJGvFHP+7e/ukpz9yvqw7tfXKVx6w1qNDfAzFvmjM1HnEp4wLMYQdqF4aU/b9+/Ja4h8WhV7FHDU9QYy35UhfjsBy73GNr3byGoURS1Z+WzHIa3ytu2xlO96h3B1pN3tp68BdsB7tmjiNoWoOPpE4COsAHTjwZKsDnrRNfBfJF3IRWfOt2aZBQyrsGs0xtcQEVjAqYyeGNKaLT/FNA6ChLQGKZihKStxSAUdMJbqMHIdCvZR2luoRowiiCxE4w+iuyDHY+JLMSqCOdDBWjIhSqRVS5UW/eQsr/42B3FNTEx4C5oI1Zh+EGnwDUaApKkQltAnlSoBuw8Pp6D8EexfcDjUU1zsJLjJs+YV5n9VgOCWWlc2/oGgjkIRIAiDWYsTsr0eyi9bx1i32taZe6FB+J42Xh+lStxPB40XjKuXtz85OfRLuf2MR+bJrLmEfWyr4tNlDHGXrTy4LUG1hdzWTFWk5eX96PieB/C2C+ITWE5BgDJRSwQD0brF0yHKDr+gBk9MpEDXm2X6Xtoc+MQRm+QmVj8VAywFEuiV7loeP7xvM9WDD/LVvCZi+FnOmp1HbANODXeZCwpudVY/X3qxG7RzpsO3bobmroo8avptihGSros0Sq6JA1UvJenyMRsmDTjZGaqVGUW24kSET6TvShL6nakRBJFltetMZ2amy3Pp+bK3iyZnCHz0+erpDRDEpVSIRkl1eUqS98bL1UL8RyZ7FVJboZq5dkZEotGyVSnSjIzpJirFrKZaInq45VqJVLIhKlCngnnSkwjj0TD+dj8XJTdZYpHI1QHj8Qjr1VJOR5ORJKsmOrygSo5sy3ww3gbwt5fXTS0rOGDXzfff0drWQ1ujjBsCI5Pw5JFfpWbw9MN9KpP5aY1DH/9BKvcohK/vo1g4URev0DceAG0jxAvADuIkRdgX/9/4J6VGdExWMKADn1WBcjgFbADBpftsQXyztcX6Z6a+/gsdunDlg1hMrzmmiSHq5qAaKABkgFjIIAlUo5/1Z50yVkU7YlNke9/R9sThyDh081viRRQhn1GzEtQuw+CrbVuDaNzHcv5jTVuBW6o3AIeq9yyBshBCrJDqNuieSQw6iCEKjpJQfIe8qGhNMeiwFS0FKegaUkulaYlWZTyf3DPYNGP6EMzoAJxRpRrdgLBHzS0a9ycoF5Dc4KuJetQi6Zj8BqErmcsQhYSR5vlgjBNxVrB+vnFfErVWsFBIteg9lRKtXptealNvq+4oaRw0EqiEhq/fDfbh9PLihDcJsX8Nuc2nnr+nhQ+ZZiXfWOMAoz1jOSKLQwFGAJIlqIFQJ4E75NGHZe/sHCU+rgaXddExEmjQhBTWj7tn8oUFocyqQ99to1OMjTBYHaNmVqHMYJfbuQFKLr8vQLuFIn3fTXEE/dcXfRpuepX2Yemjqt+5CfXtkAHBffkWAVXkIn7RJzx0ydP7HajqEM3hb22J0NPnhR5k6FQBLxUhT1KRXeWMr6mv1REveSl/U5TnoMf0d8hAig/lGY7UkflZT4+UgzBOl2qo9dEHCn63DFUIgLiH5OU9T7VQ3lYIVuF0DSKURRNeD04YNdvAWH3KcsqyCZiTCnykgd5pI4rCgyMOR+eOhYuJsjU8U69PFGfTJDy0U59cm0+PHmkmDofSZDZdGk10ad6+XKiR/+/Um8lSaEXdun/+9OVfCcVJnNhku8WU7kl+jlH/9dOZ71EisRjGZd+WplI+gz9nE0mUov04zSSC7bdSDYXEk36Z8Kej9csaz5er8Xq9M+YlY7+V4nMRmtV8h8lMhePRar0M9M9NUnClZOTpBsh4el47PixRv7oRDx2ZC1NdX4vtbIcj/V7jXK3U8qmo+lcKXom0nLnZs+e8YrOYuNUnCwk0ilCK7bma7EarZA+kz2TmamKqA3TlfGR/lmCTZ5V/maDB99mEnnnwrWt+7fE8USt1XdlLA48alFU/xdBAEdBtiCIMaCyTQ8eM3v08J/fbXJj/SoL4ywf4AhoPrwshOKi49AVY9nirmHyRJ2HNzlDdQYumG6sb175fPP9T6Vlkz563paOLMy6Kb6DRxqG2y8YcgOSaFJr6HWtRputhcCYtJk+v3pOoO2888H2P/7JbdJWR2WCXZfCwMTw9gehbsitCwnCMVoOxVB+gTdF/unFrrZy/+WXzcvvCUN3w/UWFizlCuy0OKHiReJ4e8PQoQNIkIGLE6sj706/xwSA6rX+4KcmJFj8y1tbT1h0IJs+xMWEdNmS33B3AcreGKqbNAo2yzTa/QXI2Ms9bxnM1q03hv+7ro7q6DPeQkibYJBI9gPtDYONL1qIixSLwmok+mu9x2MMtbiLwBI3mvMDAr5D/fLpzldfDx8/HP56U3pCtJ3Okt13RWJ3Txix+gbsKChGMjBk13E61XFNfNGSmfHbLF+hcNPd/PrC5s3HgpMWS0jO+62JE6c19Q3LW1wXpDTqadlDTZ0mzXOpBqGymTBvAXaycLN/Vl0yvfnp8KvPRH1n605HvrXrOp2GpV3YBYjHh8jDnrj4w1XBb3+mCEAr31ZRu9pnYtG1apbOqnKnExLCirVeS/Kysb5Opdbw6gfSi89mWT7Vxc5OzcPuewrPM+AARJPDjU4G4GpflU7Dlln0miII+/MrXJd8/+bWtb9y8lXL1S3iOoO/K6XAgPD2gyCYAAyYwSyHkU21K23K5LEF2PVd9T7DR5e2br+nXonqauxxKXxth1E7huxVgAeBU/Ma8LSHsIR7AfY8gENNJuG8g3On4VTr9eye0z/XsXDjDR7LCHdnJNq9j4ZP1oVG3aNqbkd5YPLvghomN5QcAE0lXNdwsN2SBQdnztNo4GKuCrwD84bQ1PDnmgtLague7qu6Cx5cG759l+fmdYUU9lgyeS2gF2XYzOdXalSGcmetr34f3vhRZ68V1TIqVaFTH9xbcBq2qm4FsS98+6Q0unxHvMdw/XvIrtRwnb4USw4zEDV0YiXmcSdTWJqgGAujqJVU4ij+2LKjtHYZKp2HfmX52ySX/L6rCKEogsFu33/KGL1xe/PeN3JdAs2fbrvbfbU24W2CvzbOOGZacYzhRoDGxbF8cZX0ZZVJv+q3T8XPUPpMbW1fuprS07BytX8NTetUpiq0pyJkKEE+xUW9OZ8ZVGURM0NrLT6NBekVoFXccoU6sX3tK6xLKD0CtIBgHUCu/2jdhpVfrPdqtUYrtX9Z3WNRhQXVWAphzMh18J/f+ddBtAb61qsDrAd4pfKtKwdD8QwUEP/7F7CG4Dfl9IFAPB8Ik7G7SVgpXU3ROlaSKNmH5N7hiKExTpji16j/YIrhM/gMPo+S9eBTKFRjFB8/nRh3/IRZPH1iDx/Ler/hscx3kAcFFfLjmiPCW1IWcQvsqQlchEywJ7kJVpbzoyFhcVVF3Ah7ZMKohZEhuECzbLbETLKv51lKxNLUQpycSJJyhYRnSXL6v2bIZIUkq4lyIVfIVc5GSbxQyc2cKxInSoqLUVLOxbwiOZonk80oyeQruYgdJdFCtlApl+tREsnlwoV0rBDOJOKRsDPDAktWpyvxaKQcTUSS8UiJGVyzzOCaSY/zgezUrAXpAOnJMBCGDWznjZvDS79o3zMmK62FfttqISObBYn4OJw2s1ExJMs6LE+avMAF9ej7W6IauL/lq8bn6MgBDTdHPlh5R+ElX9zEo3vEazK2+b2N9e+3Pv5fGJpiADl6NqgRZYKKCWxAjeL4QCAWz5oca9ociLFMi6CANZzwJBycy+vRHAQ/BtqHOw5UmwYlKrYZGdBgNpLI4IelpouyAJjs+mADIDHeODC/kdBRbaBNhCPtAFZCaArtkSVhwchg8qwrCGpfFY7TAB2HaFgJAZPxqxCVJ//9Nxne+vfKAU8Bgi0jsF0DxoDZ/59ikWYAKWPhIXW8fYj9rr5q9zv5czyQQbOjR3pZ5OlbM9gzEAPQMFQwzrhghVyVFAILCz4QeCOiDkm4lxdC0tNhbS/6MfLg8KbsIU8kc/745g5MnLGz5qDNYo7DQxkxQTZA/ktAGj/50q+KN+TVTPkMgeoJybrPEqh+Zcn4VB2gix0fbwoUdCKJn/jz+B4qWd/1lm3/FRZZiO+vuK7X6Vg8zCe+waKLR+6w6J/wLRZdat5j4VXqCyvwWKCKFg1n6vTTSGXSFv1vktSqM/9fbV/63NZx7PuvsPLhlmtSr2xScuLcb1iJhQABEASXqleqg4UkKACHxEKRepWqKPd5v5aU2PESy7Elx5Yci7JjOb5a4vgDndI/IpDSf/Fm6e7pOTgAtfBVGRYxmP5NnzMz3T0zPd0itbQkVmLyX/n36myhkl9YLi2qyyryP31VZXGpOWeuqSwurc+Nv6JS9eq1TNXLFEVkVQE+5TUVr7mjt0XgEuyDiyqUnL4pff2Nx9eUe+e5RnOnAQmffbX4lOt2u8VzvSMX5LCzenNTbfaaiJf7Xzz66WNzPc3bqdv9JaDHzRR1HWxdm1Vms6c6pWFYcAMNRNczqL6H2MfzMvz7n8J4AWpnW8eMJMobU6XLaJfgMpqShKaWvRtiB6ULhJ7Mihm91/u+YYMwAgCwsm7syK/q6iKG6P75wpq6unnWcVO89IfhP39HbopbfkvZvtzPzw5d5pTGsNExzcTFUG3wgAR//5NsgYxyhHfvg7BJxr3TbBPcQw2fwTFH4SmYOYotkZe0M5PHNjAK7iJPgGXuahbY8WVCdDJNABxNEwS3/tgjTIdCu7AMcxJg0Dblb4N5sPE3QhYLvRQyWrAlcvse4dxpIviunbGIsBMw3dzWLqxlmjML9ilhkoP5pFccGBXuiNAmqsULyH50aTuZoeCd7EBgcGSrMmGR0M5gjEnjF//n/2sgRzo9bTb1AhwGEQNwHGsc0ERj9Xyz5Q16zZ3/pdSOq3JIaYDKYQoDnJWNiIcrzdtSRfRDdA3J9ueSx0GByV4FvQZHNLoy8SnJRwXTycqNE5/Lo1OYFAnpD3emjczck5wQ9qyqeSxPqhYAOQM3xGYm7sLicROhsZzP/3whGbglwmpA64F7IqyCNIINU44j3anxN0WIVhvQ8EBnTk0KMdhtdBrr4Kr2stnVVgXGU00XtAb95pZXM3VeOcWLdK1fn4KA2z7ePH9lxpaY7NgzhIwboogBEbpN7fDtzMzCKfk5nc2UpuVnpr5UKWz6aRVtcCch2q3CbipS2CvM7/wqIiqF+XOVQr5fyPsxMfAXc92Nci/n5cXccllslZfKYm77NznRKYlIWvxySSxmRLskXkyJ30greS/Tkp92NCk6WbG5URKF9PmzW+XUhvw0W1FRL4q1xuzZqFivF5L19UKysZaKJKrL2UwiEl+NitVsJu7ls0I2tSQLYyvRzayoyIJoMyuWclmxI5mWP5Y3JB+RxXjs9Kl4bGY6Lc1w+Uy76l/1SUV63VcWxPZvFsTW6nJmY0ksZ9utZDRZEomsmIs0N/LpaFJ+ZmPV2WQpEVuNL5/KCGnVx+Q/qUVJF+qxpjIUNdBlQbuwdA6+OqdN4i3wZjn6+rPD918/+uZ1CHPn6XzO2srf09Sun42KmuWiEQZRg5FvyMl/otE5+Nv6FAsWri8IqpC1G3iWO/zL20d/v390Hbw5Gl01LMExQDbFgokZMH2I+1WzalLeqdXK5xce/viuPrOpK1ryA9DU6AXQbmJKo446xv75gk4P+uk/Dt/6p84JtLdBOYx0Xbpqor5oJ6MrKuz6XZPS9G1JSWQY6a5JyYoaaz7zuFLngxgd/a3fQ1y98x0Pva2wMjp/4XcgNWSWhtI5Oq5VPZV40/oQmFNNaPSbDx5/+T68Xl3PHNerv8hxZ1A72Ncl4ClzziQn1IebGJZ9eOkLiSWZMWHZDRYe46u/KccN7Zaboffgotr8kMPl8E+fa0LaGzdVO5zOm0wGj99jG+Hejkpu2PU60MMmGeLBXX2wtquDEVDAmN9df/TTt8NLHx1eeXN4Rx07NogYu58KaAxQiYm2aHDVm9VQDgiwZynQe9LvK08CGBE3zKZSderfXyvXtQs0QI7++q+jN98Yvn5PhS+CHhv4Kj1fUymG6sC8n5bXREDy6YHvOFFZA6rr/vSawTWp5wAK/I0sWIuiSejfzSJUB4eUipmvQe8o85fWoIjH1qCAEDiu0WX8uEYH82HJtUy4PYlNxzWIPXpUYx6BH9VIXXOwrxQWl37wYr/+DN3F+lveBiR8JQI7D6DAx4lrUMwklCAMAb3YkASlXl3JsCk79ZXk2zYAh/+lIwj64B2ogjbZgKJA6E+ms3E1naQMHTUDcS/lnuosHuni0ZvfPbr+Rxv4rqFUBr6FxiZSs/QMUKKZudHTHhqE4yBQXgagsG5X/hZz41NSyXgISBGinkUbDfpoXBsUA0blTyRCVyr1N0l3amyi9GtTo23eaBsbZcSYiUJTG3nXZq23eevGAjKyR0OYW42S1lxp3OtqZlG+qIDn/hZLvaxNIkNqyIiGVUfVIpc3bQzH+e93BuC7sqtTrdIjfz/89tLhlZuQ9bqx4xvR5cGfqGkAy3ehCIFo4aGBmgLXDTwWdFG5Z5koiw9/vKJdEDb6FMjQVLbhH9U3/xhKcvbuD7xnadTUfYYmTV1ySu2rgGSNQFRlCjBn5kKzew6DXUJ19qymYHzbhtw+LgCMc97S9h3pyIO7LaMjH926h8YYGWLccBprNmmLy1pMZPWAqWTMJDR2wNDhhkq4mWJNFGufQAQ7GOfGmkA7Am0IawhMNAPQBHD183HamWtmSLALqm9EKXNdzHWk8zdXllZRkn50tBdTWq6qIU1ltJRVMFy5MAUxUT2gagjIcasUQoU4F+BWDk+SwiiBrQANCjAoM789uZwzVbWkOUYqkUSyE3zy9CZp8hQETn09MSdLAT6Fw9Lxdneac1NycqsQlIpibsT/aX9TDr8FE3zuq8Gu7IElxxXq7+88vPulCj+3/6VafzlZec/6fnTqP6YaHJ32E2bG7ScosuqZM0TVOjMz+SyuN2jV6D4bpuXFQifZV6epcv66J3FQNnIMB+X8DA6KnAM4aMdm/DKVQrcUlkuZmvzUV/Iq30BmTlSzkHKgVxJeVmBK3kp+PSFX1KK0OFgQmYKOHJfvLYhUwcSO24monF/JgjmU60dUxq94YfzBXC5er6VikV9mhIRPP230uCa+ya63hRLtwR8HPUxfrjyQzhv5dvjm7x7eeevo/j/dPiC3I9ZTsJ6nbqIE6yC7b90z3qsMxl6cYZ1rZB72DOa6Un6UnYOr55wQB29cHt6yoa3lQOw010bD2VU9N7o1YivLXm1b9gMtjMa4Ng0FYlzb5vSyASJd68b4mqGt6pDeAE/eTz4176JO1wpangIDm8B80RJocPCdinhnRMHli4dXfmfJTOJeoPRO/sUBVMirYznCCN/NwKtboPRgtgV2xmexbMg3nLuU3JS3wH3CXjMt8PM9aIS2u61sCMMOBw6gjoFk8d6ghJ/kcGQbosAA42EOANvddJfZIOwoJMcbBzYakMJIstAXa3Mz4yugQ516A1qgrXqXWwc6HDcAOgYvEImCcasNEoVpeJSzR8Khgxmi0TFA+MsMHVMj48m4mREkVxwY5e1E+tw7uR4nWjy4QxmQGH3eQDdTHwOiPm5zOXPQRqE4ThjI+AM7VLTH6glXRziSyGWJ2OEih8QyiuMJwhjF6TO1AbWPaSVcpJzcrD/RGRmYiKEPNHb+ndS4fv5RGBaeTf9SDjl6MyQvwKyRbSwFTt6wAgyDwLGbJW9qRpLcRJ4ef+Rm6PR5m3mAM9PHxWkedJp9soht1GUqRqe1DhVpO3naLTPKjG4cuHXRpraVA0a1U/tlp4gb2k61U26Ztb59l0+3aI9fYkBijELBvr/scKzNdsuUaok3rpphrYRGsJAG/vmCqJ9bEN5eQaTnK2J3QXRiIhcTtXxFyPLFtIoZYSLTVVdKszVvpiheUkb+qva4yye2M2KvKM4VK/ly3M/IP8RgrHGvzu4y8hNNq6gRqyY49GwsOhuPlmejiZI272djyew4817+qXdKKRrdwb6aLWZVaffYD//7wvCTP9MeO1LZPXYC4qHHsCwY1I21oS1NtQ1UV7vDFJdGtSZtzuGtPz+8g24tABZMh8QbsQHqaMDAqcGuDgXthDHeP7p/3QbYo5FoH2mwbk55uFFrBzemvEHs0aWAaSKwFKCGWM4bamnkrgeboKYlKWNMtOj94f0f8JIeVuLBBdiE12i7TanYwJ+wPaWCuarNtE+uPbzztvJ08Vv6Fl6A9uRepsUMeZm4REBkZ3lgsGl5QNjuAoFB2RUCdZYx5xCeR23WfPN7KEhDSvfgnhU0zwY7AdOuDhgsy/+O2JT+HaDpOoLtGlTtg7Hs0vRzQDniBLiRBQKKQYdP5sFDvPIrKDRS0XYIcOsCj6IGIMfjucsDOxkaLzqdRpC4PrBTCQ2UYP/b2eb0vtvzZmVgwRwgWhzg78/R4ePZe/retli0OqAaCY7E5+VI12pbKsjVkwKNQxkX8Bmlv6NUSIM4WoMrC1f+hA8HJmi4jB6VzeHkXDAHBeszNO+QjhNBofQjQucYsRAKMiIPTnS2PsUknTRDT2z8n8CQDVtGmIqxkHUEQLygpv/BzUxgEUG/wlsIrCLoZ7kcsE3QOuKl8esIoNQLCfz7pWPC4EmV3tchQ8yO+69OQ2A4Kldm9WmKFuet6dgspvLpkXIMX9fxmL+fSRbjMXc/vWDx+81at7GJOddgVcFKKSgdsYOLCtsmLikAHkx+BAm16WPLIrEsirvRZRGX/+4tlgs78nNuoTffX5hJi8H8wiDfXU+L09K0z5fm81uR7VyvIPKVjApJPV1Qe/yLGRWSWsWmjmRb8tMuJiOb0UyyIs7O59Mb5dS8SDdj0dSa/Kx3suJ8WtSLOdHOimRKNAo5kU961fl8slauJVYXywkvnRKptGSonEqJ+MpiOVYp52dFbKmyFBfRcqUi/7/YieSjQjK0EElG9nZj0XM71VK+Xy3Nd7NblYJCrueyqwWRm2u35rKzqVjUz4sN+Vcmm0lNz4lipJqIeqvJWHRlOR5dqsRji+WzxWRpTGy69a7XA6ePm3A0AGnQMVrS8POvH97Zp2hJskskUQMzEAMCxY+B774LSDAcgK71GBLcG290fJUbUPPk6wQG5thCaYjPrj6885Y+v+v4LbCwkQBYwK/+E5DD1jxQkDdG19swEwPua//8dVWtebYwy93w1X8c/f7WEAKV4Cwy7mgqVokz3QKQnmFra8q4kymcv153cDAsHAdiYVPMJOwQY+rM2PJ1uP/FkAKo6KqUfg/CqLDJHQTlmAQXwBoBMigbHYnTNnx1/v315lTzwcUN4uu1jw//8T/A147xcQOegMyyg0AchyAYPSfGaOSDlo3HPVCp2lTHu0Gz3//g8I0PbdDsjfWwc5GNmkRy4pzL7/w0iYGHHCbpNoIJU7Elfpak2+HLR/m3lHEwHW+cVc4E+vrJq28PP1GuhmfVr9rjylRENxzzzZ9EBV5WpiaO9Grbr9ora3I1/5mZqv+8e/T7O/IP87s2cvVf6O9E5eOpoItMTUwb3bXpS6XNtz2lfCUgHN1f/nb41luQRmmwDs5Gfl8Fd6Jm2zB/DLWhgvroYAQU4OrUWmt2p3iDZmCrxvTANhVM2LXeYI38uepdT7nF9xqsuXBaDLimqMmXjB7z4OY25hT96Mbh/pfaxNzyGuDr07aBt+jZxpOg41iX3zs0+hYzPF/U3tVXIVPft28aaacy9alaJq0zqGh25dAU+E8CgRMPQVrPyof8lYyHZ2WDMOhUtdsAX3EtOtZxYSGFx/Db1/Tev7m04LG/UW1oYpNo+kIVgzYGCfEsl+4+gA9Qrbnm29CHEtS0z5TorQ8VmA05KCnWIEkY0hMn5qvvoBEGoybvW12fvEe9esvv0bBX4twoYsbNq/+Q6phx09QkWjcBObmUmq++A0YQjBi0OdSnCHDSRjv4ardhDrsPbg7q5t1gvtgPP1WvxWiGtlF+kCzWUG462XotGgcjHAYSQBgfxkyZHsfbKsxO4UbG8SaGNS8ChgCaAQ/+ONgwdsDRha+5HeDaAAFdfZymdrW0eXlGs0Isr71QxUpK1eo9R9uRdmMajTQZU0UTFBEpIatJJukR1CEkJEfFv5H5VvoHRPhkAY7Cm+OPFcEgfh2BZcWVGo9qKP7pJzkarbBi8vKpCVHCWQk1WT6xv5gkgTewRvlfg4LEChE+54+b8Xa2u5Nz0tTk0zLEu60hh1yz1cwpQyvk8O7Be3sHdzcWNEMS3VlyP/pm//DKNw/vva0ac3zaFNLUHiDzRfZvTo/zZzMndUDTPiMrTsihJF93PxAsAopGsih1Gs2+GyUCi3geJUMd6o9WXKhlFheK9X5J5U7KxES2IOZnlUvaUka5pKX6BTEzK1aiqfmyWM2VMqeKKntSbFGkY2KmKHLJQn4+Iyr5JfFSUZTm8oniL8siEVOHV7tFUc7HM0vilbKIxdQRVmy+kk9GY4UoHGDlC5FsfLsoInP53HJpNhZJRdIrLy8IWSdSmZULzmS0vFkUiWhpfjYZzc3GkjG5Lg07wmpstf2uDuoYzG+q0vLWp1TyBWa2m2R1h+/vH775rjXetwYAMZJQZ6uNP/H4BbZNbsvbBsNMedVi0JTn7TJznrXqHms1umsYjeFdfVlHeaTah3v045fDN+7aIGZnvW41xFdLofA1Sdfbcp5DZ3hQSr4f9iD714YXrgQeZEuKy+CSRDfj5F6q65Y8u0Vg1j14KeYjuhOi4bTaAhKyps1Xh0fiCQnBsoS6LfaQtKTTiapQ3crH5Ou6T76QY0TCsbAT5uGctwjzMvga1VHWdngbrtMbtkIHW9iKPdRCacCPtHQbPKKFycbh5CJ9eP99+UIef3jfjWgh4SnwEYgKm3HJo9BqQbaZwxvyzOJZhIDaMy2/12uqqyjae9TxgSKurQOU4dhGMJDItOv8FclFc72MoQXZhRNkYhXua4egOSdaxKraltZvw0axcF6xTcOEr5gFNFCDD/a2Gw7LgDrm9QaGhDurAoDuwZbB5Exy5ihqhZ4UGBzK7Xsz+UN7fqTXIWaFRuM6CM6zTqi7wxh85t5GMDrR0mIgMcKX26tul+qN/XWnPw1M2EsLTm/bkQ7MuAMtq1lIn9BSQqoQWEowteGqC4ivKiUvVxGkGZhOIBFthddEqUoS9QnrQxNggDwhTUCUnOBsP9lZyCdf+OOET7qTG9AnMQrDzqi6XkhkNvPQL+jpovDL7gEV/gwP7x5P4Y9qBSUZWOBW8yvjrGagMhElFNtnXplsN+/4bddqVgUjNvNOY9B2LGZd4NjLki7UWvYWVjLSOq63S+JsViwtpj35qZYy6VTVW6jn0qWMt5rWgdNW00uVSj6XSBbE9rwolvNiOVOOxwvCnxcLpbxQrlypuHHlUilFlStXXN3TSC+XMqtVby4bn1WpRSuRWDQireC5bEq7ceUiOtFouBtXt7HW66hbuMYE1pnPVBj1wJb1xS8e/XiT7BoiGrEQ616rp+/0shvTtg12Z1r5bEE79tL00fX7shkb41Z3TuDGNLbgeDyZuCmyNgZp0JsFd/fY5eHhWzce/XSZDEVFofHxBKlpANgZkinwHUAC4hD2DAlAWhR8R/3am2o3eoQCmyVv3Xh45x0TsFpV6g98uFir7xEqRpo9EH71gQYJ+sIB3P5IgtO3bsj36CQ4HX2P2Iq7SNAttVk+UeVop5f6PLSaxrdLBQB3bVz9ZpmFC8jMyLXYjnlr0K3TFqAz21aX8HhtuxKY2bX2vbih2jSw47GlkEhx6BltQ7SZjrPXOEYhXbwQMB6YTf4Y8OT/jvstWv7IXUeRWFUEYorAJG+IZ3zvv6s73c863gUZDb+mCq3J6j6qjbyGT2vddjQbqNwYfwTqd5xuZngu2ChSIMya3w4yx5lCBywzE1Ft8u7EN8bvZnxXD/SjcbwyIFbkUzi15+rAUG6esv8Mhg2bpn5JjHLjdpjbW1qDc1Y0SqPN73AoPvhEtD3EqMc6VaGkdwQ8CXY7n7kkd+XtsdLWkbRWzPJZStxDg1bePVl9tECfnMCZ+M8/S09oHnFGxrEfNm+ee5g+x+AKjWHm50JMS0n2ggE92F8J2JX6N3jGgFUJZE0DajPaj7coJYW2J9W/v55gTfqdxroUXM2O1qgYoYwKWZAyXVZvbkDFl9xCXVEn8lRlzV0fqr3Ci4zTknaLag3aXZVnzrhAOUXkUyWtMDhQk82xAtPWKVMw2G62eOA0KLFx02RJjWcKNd8DeUI9FWjLNOSWtfCetWSv1mgpC8E05pbZEGxtv+8xxy7znbl11aQQkOaE36f0EjO8vEV5LzwoUWH8el6rhhdRsNzmLqXuoshv2C148wQ6gBzEzKtG7zDzWvESCbxBuOWt3xbPaCrfClwlwadHrzL1pArSPg3cIfHo26i72XYlKxZONWoLpwul6b3aTGl3Zbl4vjD7UnG7sDtT2ytMryzP7xRmz82vLOf7hdn8YDOb68pPb2Zv7pdxsbe9tJiIZTvy4xdmMy35aUcjm6tRkU2fXYmKaCS1IT/NRm12TX7Wi2UxExH1sqgna2XRkF/XGonqynKiFlUR5iJxL7EsXlwQsWX5vxfzIrayt721OBspR2VLW7PRSqQwe/rU7Mx0IRONnJ/d2y3Jf3fkp59NxdPJRCyyILqbficaabdkSS6XTcdLhfW1WD1SVpk85pKxqixLJeLLQj5RphLJZ8rR0BDRtc7BtX6vOujZPeTzUyqJlhPE7dH3N1QeLQriVlMhQDSR9gTUX9U33FPmsBy0+fOFdYJ79M0XDhbsMVs0UMVNFd7ESIqG5ByOsLan9KmkCv6llmHfvnf47a3DK2+aBNSmdk9q9y5mXmysH9wmERTAZYCExYBcetyI7fhVnYEVWZLUfWTn6Npt4MVUcjgxRcSG+Q4AhpYIWX3KoWa4VuKQmlYHgdv2VVxj76G+txHyHlDCBhDhPWg4fBHXGJIL4HCkJO/BVYvw4OKe0zfXiac9WTPI0T6IcgePYxEMYXBSdO1REufg9ho/DoH0ZXax+89Lw1dv0mKX9AH+rclxGFOBg0YojB4dnJAAhm51gKkuVf41nuDz6NZVSvDZUNX0alv9gets9bePpIYC68KbU3+2WDTbXk9nG4clqhxOvamfP3YvnT26/vnhvR/srSKksreKdFGz7u5TYDW2TaGRpZFxu8tju2l4tk0BdIGtCmzD2amQ+uHgNjjGPLgsV/N3dcqxH98dfqwi9Bit7IEmUTXJB8Z89SfRofuLqUq+OFJhHOy3WJs39gzt4Q/faVqt5j1UWKqubdV89yeSUrumMq56pQFnw/I3eVD8o2t/p8FpqtEf6E6IpR3IaSdJsA64EeoaLeSzdnDVOj8pc/fxq3c0hzVMNGnq2CdT3/xwAnogVYfciHr+VhudgnUGxq82plRAZpN/cXj5jaFO+Kcy3+mKZmtJmq36G+0sAYz/hCi4u4Q4PN6/tqtwz+umXnDpwE333hteegfznngQ+dTkPUHzzMU4HoFdEURzDqRH7eArbbjB+FI+czfWuDDavzx84zXb32TpgeED5FYcYQmDIxgOQOIICWAwSOsJB0PTePDtBdi5+CmxY4xMD6wuNkDMN5+BEDGSQdeYmjzfaKNF2T97Iwwcff/Z8NX/cnciWxi5lr4NXDSfgxEII7ebkPorciPtxYP9wbaeSJe3dDAmHG3Ddy8M9780o62lDMuGidYFJNau5kAmApy+5Muhbv1AUFJdKyRkCOlQe+F3dQTe0tGplJcWB3v0zb8IrKfM9am9LoCCBYwAxpjnsDqsGOMLcUIRxgWnY4YdM+vIouPmHDflnsfeehoj6bnsmWc0PhxL4Tg7gdkIpORDVTyod1e3O1qXtC3Ts0y3ctU4QTFapehotUk6jekzHP+9g6vVUIWE/1i9EqpVSKM4euDJtADXAI7oPlZwc6HtCthjxCsXrUwiTpCHJAsd0XWM4GJCKyixnkTMMBHzzIJgdM8JfilOab+JiW6AshHZRmrUDRCaDHMDNCw4l+1+dawfIPB95leTDzQlGSXzxDNNKBs51oRyfrAJRc7RpikLPd2cLigfwNl5UdGuf+qa2ry6slYrpz35qcZThZhY6c+KF2dFanU3qaJazFdEPiZUuqhCPpcsFSq/TgmvUkokYmJtWTkBFk+nRKUcry8r/7+FUykRm89WplNiLhubq0Rz5+Wv0XxuPpItzEfmoqlYJJuoeit7iyIWGRelLimrheb37A42WQiLmzohoJNJ6NHf3uWZhLpe49yoT5eGcTy65PeR4BUKnUWJhp1U0wA/r6M2nINPhHQOPXUp3J25uodeso9u/E6iqig1fc9nhoWuzS0LXeBPpGZ2ha5N0dF7ZqTAKvS7QQdDQLGAzd/cO3zzJ2bpN9sYG91DcjT7CM9FIxRGj8HTgQDTTuHQxaB0N9QZtrrdAx35zYWHP30CK0JAarXgvBJouacmTiR7ZGkE7c8XHLdQKXCP9t+zx6GA7J5ZWix7bImTEkQke4H2kBFeIB0yAjgdN9jJfuKYLMAEFbGjZ/tyzSDWLxeOAwDRHmmMY/M58UbOMglXH2cGHx+HATy+2190buLyesKo7sEmFY7B1Tc6IGashR9e1nlpBrKXaT7g6Q1D5C2MDgd3KJizT0LjqgEPQBHJHoMCgzAjMMzWH8x8gJ5TJ0hO51kcB/aZBgIRw5moBpFT2EdBkBhFhFfqiAQJLt+p6TgJTSzrMynkF48px0GPFTEcZezBqZKsTP+QVmDKAHWAK7wniW4uth0Ze6yEtdLVkYXHS2Y4OO1b2gkyKQwgIIWef5CQtPj/MJ0d7ljwifBHHDtdT2wmnMAQDTt+1b+EOfcZkhdUEOmOft5Y4BgWK8A7CJzE4q/SktKMOFlXXx5/Hmvo9JGseYAzL082iWuNrrrKyC1iUzRiEJtibg+bEscc1kWh1vD8vMicqpVmMnUTvy2+KKZXV0z4tiUvtSI/q7XS2WWV8T41mBfVhNhcFsoK/nVcqCsxG8siLi1h5f63nFDW8LK0g5X7XyUhpDkcj81XIumE/H80p+7CZOKRbHx5WUTm4vVWLRqZT1QXTSi3irSB59PlaHFZSCs4Is3ghLSCo9KCDjsfU0tRa8tJCTllrh3ghRgl2a++cXjp8uOrsJnf8pBEx1BXK1PHmuuznxEPjsUMkjkWIxhMh0FAmClhy5p0StUErlw8unVLYVnjy9QfvXIB3FjzDpodMdH15Z/mJt/tv3VreP+e3e23bTib/R2LSNdW+t2GHDxgIX9mgtZViW3jSLnGDPRmu2nGG71GAzCZ3HE/pBFsBLf8qhDQJtanRLpr9doaLjb962MJN/z2NXLuVAj2qMRActMYUG2AZovLXPkMLrnyGVzXLoaZyc1iwHYc+hDecegz8Nyhz7Rgc3TjtA8DDgMNIIbCBe+oEKzrHYbgNhu8wUbvMINtddQYXq02cAE5WjjUiG1MkLc7I4/P+4v7+MH4Qq3nMGkxnwwuFMu1h5FFP5RDlXUtiPvwzj2whTW8FeFBzGCnux2u7V+cTEwPoPGLIK7x2/z543Vr9x7d/4iMXqdLAAwtXsB66p4FGHIAPLgOTFG4WgbkmrmE6Zi5Bh1yrhsWA9BBXD6rWZ9yiHEWLioEqw5IEzA1wFUAE9NcMJNAdkQxk8BMcFqdMSI0AwLTkWv8oemBmQCzkmuyZBmldWXJSc31E5uOzgC19mzoA9F0QVt2FOEZh/jzjsEwE1ZzNB9iwuoWXzACe/R6CvwKDx0wX4lUeb1qcDJeT483XjWVtl0142dOnz4m/nKr0e/p4HbaEW7mZYxNTOU6irF2Ius3q10foqudsgXGC/CUXnA0JZnXYy58VOR68SG8gpomKGUnMxrtyxa0gUv5hVPyc7q9WJqWn5lKWkUuLp7/VVH/+9L5TmFXfvbai/M7c4n5c+3FfF9+BvWi2JsV3UZud1b06sXC3Jb8bBcL2VxFnN/bnauI/mKmNZdoZ1LR9Kb8nJ1LpDbkpxmLrC3ERXJ2vRQX0WSvHk12G8VCoio/tblEfLWUj3ulfGxZflaKBWkap0Q0JZaig367XMovRmKR06fK+Znpl/yiiKbF+aXi3q5sZKdcGvSTWbEyK2pFkawktrfmZXE2FW3lkmc3M9HmxlounUw36rnKXK26EIusxiMry5mUamAhHgtLa9robTVbNTwb3lf7wTfVCc3jzz89/ED7iUGFjse/oEuE+eofQ4vuEeabDYLS9dXSibXdMRnejj69/fijG6ZfoQ7ESIBvtGOMBf7xCBT+BL47Xgs0dnHv+Lw+vdzlp/T3rh9+aE/pdVDMFtFRXEw+O0LwHXRCHcHj4Y/ZvDI35dYbnSlfduKgyu4CNX9+V0m9w+//8vi+Xnm0/I0pOeNbVcrcqum6jc3Buo2VxMHYVaUJaN4IFm2Y+61BVZbjou3eHj3mw3t/MI/pQRWTaAy+jAAcR07JSqE+3GOoNyVL/Z5no/yYS4S7kMvv53fP4uLxw08fXf3v4beXHl/7wPQn0ZqBbr8OAth+GDSH5GAw8um7zeJIfjswzpSvmMPf8McPiDlTHdI6Mtcd+OY7MEROhJTakXvrNLcObteUhdCnjr9pbtrpKOafndPBV648+unK4RWdCn7Lh+p6BDTpKw50Bug/FR6MT4uIi0Wv67e2dhuwWNS5mrS3J1tvH31/7fDiNbveBorR4zBT7pyImaLgits2456KmZacW2y2MfdczAJTCLu6V2/ueN11uHl3cNNcP1COHPfM/YOPH7/+zuEHCnevb6raK3iSuqGL8A4e4TlYhGNBODE6SCnNeXAbwzjq3Fe+8ul9cHmwjiGoHt556/GFdx/9eMNEoQJF3kTFK8kxNCF8hdBNBkV1taYmUhyCUBkmrFTbB1/1vR6fCWpRFZgJ73xNM0GRGPPAg28GAKcpFfgOIAE5EDA7iYZFLvNUmLuGiqqI0kxFXVNycW1q8O93ehBq6NEbdx9//pdHb34I83TN69Yaitiwp+lZADOG6mISlAsCDO7YhMdSdQ3W/TU8Yf1M75kYJ41b+yZWVr9xtuZ34f00Nqy0QFr/OFJ8L5qYRNbA66jEkx6d7pqJfXUD8rIO//Dhozf+NrylkpfbyiZRKfs+CML5T4GGw4gKKDrp7sHVlrdOLsi7I/r76PZ9rr/3dj1dX/tLwd/kRo9gAKVcYToW5bvbj9/9wUKg/zyAYFRH5SVOA/vBH6WAuemwc/9TiWWd/mT1vR4m0dWkNo2u/upzIAKwpJRBV9dusfygzc5ginYwpMQZaLmjMiHSZN8f3vpIvmsz2RtIZMPOYQmLOkfIkK7tPHacRgrAuBi4oNLTgTg7q9jpI09HX90b/vVvwJCeDIYTmESMEYNjHJy0l5aEUgLog+8lBlI7pOE7AmCfTrZl2V+OBXqs/cltz1HD8MnMwqBJOGLCPYH9FrTeHMvrGLuL2VyuUfQUJhE3h5gNM9mCIeslaGk8jZ3h2BiODcC1Pml6R8Ezvf7M+pery4nK0ipKV6cdr9G4NhtVOk+ickDdcH1xjLYgTRGQ608u1R2J7khg7TNHsjcgeK3Q5XJyspS0EtIRYseJMCa+nknmjO4AAdzilBxdGiwR3AvSDD14b0ULat2AlIzOfpBh8+Gdi0ZWOttBDcT/jynFixOr5NS4zSB83DNnNP9nTh23FSTliPKaZqHuWambnmsdFnqYnIvKdOB8SMJ13tuoNbrmYPSVaaeMnYyayPhQbnaJTGotKNJno9PTDjuwUYQFcOmR4EMPTzuLIr2y2psTy2kvnYsLb3k1tZKeS4rF3GpRFL3ySlEks/O5+dxSUSwuFhO5hYiYnRWFRfl1IRcvRkRiVpQWiiKzmMtmM7H57Nz8Yn4xmlvMzWfykfnsympqORldZqlsF6LJRPG4VLZGdayzpfaNrrr1pef0rb8OL39pYlfqbiClYTvLqp91kPlj6YPULZf4aRl4nuZZSPNmY1P1szmE/WqwOaXyn/NV4f1PDt/+o42JWNP1RxaFMF6cmOYGmtI4IXggj5OCp3NEC8+yOOFQ5hHvAJydJBK+c5Bo8PlBIjRBCVDsRAlDDkENQobjBc8SCZefJRI6HSUCOB4lArhNtDKOWzrkdhEduDFYIzmcCJMChzhvgcJQ0IugM0VogjK5uNxa7OCL5WPB4oWDOceK+t0iw/ZUg/PMeYVwIohMuWJcPhEvMALc3tfHigTEpSjmcQKU5+jvMXw9dV8jDp0vqrfm49RPOFB8Vga6VZ/DuCw9MUgIwvi8rk8vTZ9VEDqiij0Csc9lEhNGE2VFCHFAOpzY5D25ecVH2JhnGTdvTmRwjh9OIa+TjaOwcHUapRSSUcmQvKDn4cHdYEYl/BVaCyRUwl+l3tNclLgdODP2UBDo9Kmg4f7MzGRbsNds1z0w8H4DBh6UtTCihja+qn53y9P7mBBUg5XqqtaO7G811FVZk940UKqrngaz0RQ5mVtN0UjeVlPMU7SaEutOh3xDiAzLHbcgNZG1IfHrqAmZWS2LhSVRWymL0pLI1FeX0t7Ki0uimvaLKs1pasVbzSyLVL1UzYrCrKiuDhaEMivnCvl8b0FIw7JSKSXyO9sLQlqVxUo5H+/7C0LalDqRaiZhE6nmd+dEIRtR/5+byyZqVdlOc0l4SdlAZ0msoJGZzbg3UcYbmT3oQZvAoibHtpppwyv3hq9+Aa/L1OqgoWeHAsg3U+F4CJeeW5o7eniYrfPOg/d0fIwtvUuxiYvh4euvHb559+j+pcMrOvy9ppFEdhPdyE87/gLwHJrwGFIAweFPzl05iMxGhVq39aZU2EKFcumDw4sUbmNLjYophx07xgNoT4AUAOHmsRrS2jq2GDwcgQGzOXANYyzFKSC6hrGaY/buCUN24+VpbGscG2zXOIYJG7CN1YS1phDDd8PmGd65cWyaIHVF4iAEORw1ABmKF2Ybq2JuKjF0G4XNgJOxZMCtTgznFlFHETlcOFaYbawxyTQOvAUbow1fhLWiTBOkdx1uCXv0xTrjzMaIDwMLt431gOamsTsbkFc0jgGZlLzDJ+CNjAC3941xjEBMW/CY0AD1XJ0eytwzdDjgjBjIqkZghjpTM9C3xtmes/TkIKMI4w3kZ1EDzyekn1umctk3lpgknBVtkyVPCLEra05MFJzcLOVD1c7L8GcaMxtPZLQ/5/gcY3jXIiF2tyZ4wUxviR80vOFneOqA3Q0/KvNZsRDhZvf0eLNbkxmrW3N+ZhqtbiL/TzgSUlEty/3WwFtTi8Pf/vYXcpwY9tWtlT2vtaUNudP/+YvdRr3TNNu79gF/+4vD919XIdhZ3Rm3rnkabDnBa06zmsiYWhZY1uRo/t/uG6V3Z18UvRL1V0ftmKve6bQHLT+mX45O/NTvebmpRt9r1hvq5nknrV5228v31Yh+WbkwVtsD/c28y1xfvcNf/J//By3TanI=";
@@ -1,2 +1,2 @@
 // Obfuscated production version (zlib + base64)
-export const w="eNq8ve1zFEeWL/yvdPjDrp+Iu/HMzM7Ozt1vszPee+fG7t7Z64l9u7FBlLpLUkGpS3R1A+LGRoBtbMDmxTY2NuAB2cYggwAbbCNhzIfGwT+ibkmfnn/hyfOaJ7Oq1S2pfWN3sKq6zi9Pvp1zMvPkOf/5n//xHy91krm0022njV5xpNFLX/ovL/W/7s035tr9r8tG/67788V7R93brUe3tk+c3Pj+yvD0u+6xkx7J8rTVyPPsaOP38EJwksZSceSl//1f/uOltMevOmnZSI+kLQBfm20Uz09mBxs/3jnm8Gfcu40nH22sf769/GTw7JR7bKUCns40umVvwaKnvcONpWQe8fP0SH85m20XzUZ/pVH0P2u7L9v9251Gu3/Xga+0Gv3V+eON/hqV8mTj2fLgh8uDE99vPD6HBTn0TheKKbqNbtHGgrJZKaTh3kA58A4KgdcLabfR/7LpaghFuVLm2q42x6Q2jRcXAcUVtHn1MdVo4+kN94ZKcsWkRxxwr1iKysKCkv6tNpe1UDShhOcOFotpvzi/4Mr68dw8vB88e90VMXyyPDgFLZY222mL6Oa7GfRWclyA3P8ibNtI2i7CYkCb5EH9e8U/R7U244OqrOOD6mtGByPq4JA3RSft/VMEO+dq6/5jgYevP7TA0F/tJMR2SFnvMIIvZAuupxoL/EuZ5jCwHV7DD492utB4fhIq7ICpETae3N148iE06EKDyllK5+GLdtJfpXG2uuAIqYwQvA44Qq2HLIs8Ty3XjCujLOSaxpfnGAeXK7CdMcc0tMpMZ4bnOAKOQS1iPVZZdLpFyR2IMMBvWSzowHJIDduT0BbcjU9v8BB5cpd60qF7tlP4RpEaWVeY9u/K/sN2NFAMfIhdC8rst21jp8o5NrNCcyMjqhkQMD2qQ0HkQzQQwkEAI6BkvuYNTt5fGdv7vsa+/6nC0v9Bh41mcdd9r1Dr3bDXC5YJr9T0etTjNd0N87ZgaN/XFrMGz4BVURy7//t//81LZatT/EuaLy4kx1xnGP1mdY/qHK/IjI4hVhaybn91Ls1HSsvM6SkQrw2RSCyK9iptd0nX2ROVSJ26MZEs1Iy0wcXLdqTp2GgULSsapjxVd9uG062UhdvHkDTjsUycBfKf3Ge/felvXkpLZxz1up1i0X3//3Bfvoxy3pXyr+6LdrbUzsJfud5I3c7QEPA/zrUz4OCP7uf5MsvnYMT/7Be/+JuXDjWTRcfE0Zf+z9+8lHTTBfgvUx04wFTdA+7TA79yxYFJ6Cyp/q1mdsTYIajXZOo4K+qTK/C2yLr8GZsd7f7DrMmvtAUNWoLf3Mja0pWDZ99QVxos1o8GSuyQrJX0yk66yJZIf3228eO53nxgpw6vndu6/0jtkFRIvCmiKMYY0XexjefLCC08KsZaeFpSZOQF0GLpFa3M2WxYuaKboYlLNutt95GzvZfnnVx8/v4sj7Hle4PHj7c/+RMarc02tcqSE10w2jzUkgOK0HtFt3wl6EE/dF0vUiN5zIWERrDBdAAkEjupB524+QXYN7+imObXd2INeuzAFiR0tQUVPTAHLZgahPrSiSFjDqZ5wxcVWoTrb3JdjFHo254HqYGNyuFCatEj3JGg3jS07FvTIODf2wbKu5gHWoaadCsR51pCdeTbEc+Io+ECG9EJdFMZVQvUElHL87DEVtEWon5ecA3jqyCqwjZTtTQqqq6ICHwnXGMv2p6mtldsanSCpeYuBZQXZ7UNTQMk6EG2GP3QQ6PRczhv8cRwnPbYSKc5MjwxG5CF0+oM3/XWo4EU25HnutqOiowC6riCRKgIGcNZrHqcUeaj0V4T6K5Qb4WqxbKlLBm9YXVFJMWtdlCNYOV2ILJDkTqyWE/qv90tZTugnJII+SnmcsDfqIrVzdrpzYCpjNMam5Lxa6xKKfllmF5QzKuhXel/5yYILUv/s7MSiZnfWuvyv/58lHUplGhfcjUOuM/VwoSdu9WO+yWyfu7OH3ct6taJ/eV2jRn09N7Gk5vbV35QYyjNZ3AZ5oDYGnJv+qv8hq0hX5gTmHUlReju0bF9PHG2UPnn3SwEZVvIqYVWdqTXUv77q0sNtxiinVPD9uaH7w5PnFCG895sd6ZXtNR4czgORQ03gUVOPWZKO5keD3cxLV6ZeTTmEbdHjxSdxQXfzI65lXbj+dVDsCnqMMGe33r96eDC/Y3H54Z/Oukel/L0UJa3e6ZFkxlCsS0qyMiph836N7q84Uq4g8+/pN1WxS2zhrSqAIuFmcznaekGSyIm5l3ooRvOaLU70ffuDZ6sexOzzI60ErvVeJAx7GajAlcMfC0iNPCplMDAp4LiPdyDBljMeyfIdZXi2uZuDqPi7kKj6N9YUkPn88G7T7e+OMkmeDtZWCBL1g2+Yq6x8OdUmXbqpldQlWY2m5Vlklc3pG1R0YY0lmZr00HcuDJUWliVdjLDVXlx0c0ah37QVmS4+unmFye1IvB1XIlsJpt3HW1q4Yb5TAavzNGAR/dHAwRujga6gmXOBvSVYTt16wEQhGbsI89wruGKCSepY377rXM6ST2pTAHzhqeAeYUzwIK3n1+d96g/nA4gcaIaahEoWae/XDplkbZDhqEPey/eW6qy7JpkeO2Mcr3USZheZEvm3tALES+mEOTayRUtxIlE0IabV95g7I/uB6gkYRST+XY1SRecPEhAHNSIGWkLkgXYFiQIYvFSFS6xaBkNVVpxIpw5juZpirh14CIugl9cclW9gQcM/RtHG8/vgBm3ffX2xuO3h9euDh6/A/q6nSUdJ6Aa6WIxjwIlOZL2cmdLL+fJwYLaUQAVR/U3oLBcEnpgwRB3srnsWKpr6Oww7EkuBWvor15zXaACDkRDcNJGAHb3Al+AucOHbIgKHStSwFhMCM6SQOwmLgImFJlODBkIgqRT5DBiDecvLh4ORMFXr22s/UlFwVxaFQXJXNEJpBmDVvddGD7adsESrBzjQgIpBmWEMqxbZiVYGwu9bqnG16obH7QlwnMLzte6Upd3Tg4+uQKz64QeaSHGUp47I73HXSHAedorw7JMd/iCavoDy4n6gyFsf/CrYBOpk82mIPdwDiaddI73KZ+fhLF0Ecf57bna2t39dPDhteHVR7aCnRThwgryS19BJ7r5nZHdtCna+/HckhHeg1OnN77/yJ7rMqGV3fIqHGlzaZ7Aelb2g+Z477V/Nxhwg7XHg/U3dcClzaw4mHaC7aC0FDizHXQ8y9NZ4r9GhR6DGTkXjbzBqUfbdz6yI29pcdGNucrw8wWGG36uNh1XUFJmTWxQOq7u31gEm2meSlvHvjnxweDew+1rJ4aXUVEnjlVXRCsF1YBn1ClwHB9S60sYeN0KdDjoqIhw0ElBWBcadbYg7ppuVqZokLp1aysTZbI8rxVaW2r0+g+XTIW2vrqzeXZNK5R2GSSsVAKma+XknczhinRQyxjNWDjoX5OOIgvZ2ZzOSHb/8hY/GsmxnDAl1q/+demwu3VDsGQIDHvm3akz4tRpMmPFqwkfW9m7NLED4zoygK3Jq2auWrfWoo3NzdDAVKPSG6/egmRJiCaetezUosMDNDLbjAUXWVahWaUWlTWnAlsqtnGMCaUWkzVprD0Ttrhtb21m06r2TzUIUmsQqDGA3eI6GMwBaHtvCCSkda0VoPpZdbLq4kBdMg19TkpQFF+ghALlo8pGFYxRLFahVFWI1RiqKIz4po4r/yJFwRfKaxXTXkBbKanSEWUHqOIX70GbD1+/NTx5kcWSyCJut+xIf71lxYBOe5nqMr2r+yXFkazb7h2c6b3agGVzMZ9n3eS/xZsn/dXfNp6fnO2vzf/WDZ/DLy79G0iXH+8EJ3Nb988NLry7deuL4YNLW/dXh29f3/r4SrCJUjqdPJd1/ujETtZtUrF2C+XXo7ZQmLB74ICnLA/82myhAOc4T/mIzq9jYbWgM9utEKjdYenKp3SFsxeyBTeUStco/pxO8IqRIoJQ6JQiBOFjCtwtdeM6dTw5PZws9HjT9KCbEz0g2zp3cXj+Nm+a4pf8qWydGmonyOpAJ4U054iGWlya9I14NQlisNWA0MYSF2yz2+ChjVWrL717k+Ib+4XwzSaA4If+TRZNT7QS894fasG5iikLzgFAJmXWLWlw73Uq2JU6uPiuPeCCcrOG50OdlVrQ28RDroddngF1gtKSfXHciFLKjuD+xCuoHOj9f6bTfKhR9vzqXCMYA4OLl11lNp98rIOhpjJ4wv87dlvwbar18UV6NxnfkrQrRHVBmyIAjlHjYzDFrvaRN8u0Y/xCwPKvPhIB72VdEbXwEfZOwMHRl+0KPluq9sCo5i+1GOi/umFk4ONBFA4gPAyz8ztElPOwajeiE0jUk27E2M6sDhRyBdmZ4b2NEwOqp2JeHL1SO4ujaRtzTIf2Aa+1wBVQizgabsThmOqgnTVGrC1qpPqEMr0iz8M6jkSxAJ39EBtZtfexVjfQjOz4CeZzyOvImo6Yq9OtaYQ7jQFa52nFsP+rxtlKSnyZ+HeF/TFyuPJfcNtEPlf+d7fiE67+l7Xs/nrk4ZgS4+mYVunAXxvjztt2vfAU5PZcwxm9/hDksVv5nfCm2WzRcIuZbBGNpILWcQ0xo3Zp3zG1t+y6ZTrXK9mom4AnmLqOBGlguMD5dIcgvGUnoKN4MiDEl4URtzB6nPzISBDNliojmj1VeqMOSQobOCSxke2d0wk4MN88kthuiVvSQYXUk8TU3AH5DgG/XkTEs3YHwGTkakS44mikDBrLi6rt/c+JO/UzYkDjZkSQkSOJh1YvEkb23seEzAquvyo4FrV64mZP2sQVsxYotqaoSSu1Djrb76Xy8GGhmGmzTRMtcBXS2o/t3tL3b9S9AhJ1btix7FMu88OgqHNQpUfZho57gSzo0f3K0rueyz10rQCFjuUFzQzvF+QBxS+Ip5z6BQkuqgThriv7GYoWI1mYOogp2DwkQUNJN17OBTLOyqJRpJ5OPtwVkYiB6UzV6c0pw8+oSlRnz3QG5X4HT409gnV6tWqMUF1fhoEOBfyP0BCRX7nGoRUiP6IPN/AQbC39aqQBQnTs+428H/iVsT06RStpd9JunpD18fzOQax7CzbE3HTNcr1EMby2vnnpm8GFd4ffnOTbFEVXiNu4mezBWOebN8U+0EmFGTDWYPAmayUdsZwON+jiwA0YJIOPb2++vjr84DPGwg+FTXwwTOJzMSGIZwcf5UJXOpeknRm41ePZWZl35lJOQIOLpze/eOL+nm92ezn5x7vhkSAN82JAJoEgThTEm29lmS2U7aTTtcysldj6M4S1feL64MJHJI3M57zq8i+8+RZ+NTGk35rz9LIx5z5sJm5gsj33/H08uuyvwplHcPi39fSLwclrg/NPdP/sUCdZrJ44N93b0BlIi4jPlUxhkTcQlmVP/6Ss4ECJigoPzOD8pJMeEfMUTmLBggzs0+H1m8PPTqh9eqiZzoPLPFegzI4E24tFl97Ya7Ue1jjPIKo5fz2aIp29VktIwUllM2v3P206Yc3THxz8bzuL101V6NPHp4efPnBz0/3tvkzm4Uu074FuGZ94fCSKhINjpXcsAFr9QoFKRWIj32Pl+2KqUCAZswpUTIrD6yFFkg3Kdua6tuDZBKsC1wUvLuauA/D64OD8a5sX39x4Bo66i4Urp5Mli7x/3UnzPOkKT4q0KxwWOYQk0zzN+w/LZI7PBPAcNuPD//7XeLz09drw+qPNS7Dcd3ZM6gQvnwrwk1gs/FgEMArgvyc2+ME3TV4gG2kp9CAb0I8p668sMM5XT4fXzgy/Bh/qVEi6vULuMMurdlYGsAZSgQyEJeXhA2eEOdxbpPOI5UXZFIfbXOimefWjwcV3hx+uYV3Sedg1d7M27dLSVOi5w+Sx2D0ai2cGMErLdWTaTITDlQU8RAf3pMu3XQ1Z1+BHTaNbmcqoLX5TTALjtRZTyTDK0s4szzSQiM9PomsYCMHTgJEecsqF5lcbvpS5hWTFzlQ8m5COi+ul7UUqLaONz/UcD13Pbz29h6Zd1pXJ3O0vL7jPpUSkLHYk1NkrpHq+UMgBVXYcSc1OxmD1ooPQnQzqQxRyrbTnT6YIwyMopdKwOCMqFmV5r9lfTXkw4sjJG9BgwPoPb7rmwtPlZjbvvsFqIwE8STsLQjEegKuvENLDHaeYTA8Lyp0l6jGHQ1WHz5AJJBAG8EE7muaho6J5CL9xsfjdXovMsyP9hwtFt5fstlxDKb19JOsW9CbJOt2yv96i0/HbS+gXNdcwiBuPrwy+u6m4S+77Xgt8rxTEvT3uYCwifEFM+qJGceqBmGELlo+4x6ym7t6t5sBiDgzdycxcY+KGpukEhqkxSivG4y5Mx8hsjAy6wIRTs81ba95IY0I0fwL7Se0mWNo100X07ut6Wym0bHAIqfmgtkOeiPVgjZnQAJnQ/LCmh7UWJrIVDsHaT4yEwEIYo9b9H3tTvFZN7lpJegUZabUJdFqgz7xW2lEniT5SlbKTQgmUiWoB5Iw+9tJfJH8gtMeKbCuuvdQbLfNEzqoH00MRUbWiJ89mVIZ5ORlJrrFyK5BZ1e2OUqF+A+6InfSP8c7Hi0tL/bX5V7ER+nf/KXSrWR1eu8+FBt40AOSl8G/sdsdfjfSkcUTsRkPcHvgr60XjxtNMAsKh7PFsBp/C+ePg4SiBj9Y3b36yeeUNWpuVeCKZ99yIm8NLuzjF22nPwRTz7bSR0TRVZNzJPEZaBqboh9eGJ1erQBGKm/u9CGh/LJbor9lEx9dy7zwGMDVMTo5EB7ldxhKTytS2mBArcPRRPNlOOJ61UwLkBbi0XhDbCtrP3yiy4MbTR7HNVoKH15MiKcBuVWAB3k/ZFhC6+kgZgaePKcT6+WhJNuLQh1wZOfRZyOYbQXnqdaNF5ZVi5EypWkCEvjOy8eaxVdDdFlsHuack/OMmS4V572kTce/HDdyVW4bNHd3/DYuw+GOwa+Idwam6aSe6mYonFbat/GGFNJe5xxwMXTmpj6tji4l7Ihi0evV1R9jwfCp38sWi246wncA9UKaRnIqYNQ0SjZtwzNBl9nDmWjh14JnuYEl+sqGiyNEhlvD/h3hsRONixKDAkwSBlqMsixnhWbDRQCMPtPalqKagR6aiQCYDiQZyZ1/U7X1RGznzU8z4PfG0d+J4RuwBwQ7WOoce+unvavx5mOhlmGeuyf49cubRn1moRb48+jOchyk/wU33X4525mFqOk3ztTnwS3uiljbT+Ta7QXGQTbzQCMttY4YMLtzfuve5N0PccJiLvI3TZtGOnI0h8IPAmxMBLSDr356xl7KwkK1P75hzAS3InAxoScHZQP+zVgZV5A1mWGcfdotXEPWwJfHi/JyT6cfVKX/4+qmNtbeHz04M37i++ckJctBPW70ugfBGrz6b03IqBm8ivI+4gHZyxeFYBEss22utZC7rzBS000TSN6ODBxa9Dz51/89y95BbZPPmInoouqZ0i8c5v+O0C04ihFyjJvELsT+zY9RQ1gB98KnD8+c/yJXtdYYIQibxO293CrA1PBHYH5AhcBQtyeOIxVmUZQbBM+GiWqIWp3Qw3MO10Yywdwc/nPZ+RhnoM6R25D6qkRQk9maI7/k31ia1i7E2R6LaWEn8yt/pe3EeooZgMFVgnrX7NxeGdz8DxsUD2OCbqCQh2xX0nYYYtXcVqxokSX4gg7La1nxOaNpavYAN1z7sSci0ebUr9J2gA5Oy6N/y8GipcWey3zL2Y8wuOsuMaN14TITjAS1JalyOiSSTTmMiRb0U1pn92LS+owdAOrXu95Q+EpJIhleqHIY9UtfZqDCbx5U/Ewtpl7ijQUcF1VSNZjSNKheru6wq2bNsDwS7DAtub21sGg8VOTwRrchFKxB3QRgLo12QVmTDTzVfd9GGbk6V/28wr3ZfoZByaiOyNv4R/vSbuvhHRPQysupK/G9x/CP5neVTHP9Ifna2HVQuiK35lztEPyI6tAmxUQ78pbEGk2bW6fZX3Bo8bekdOVBRR+lIB7bGn767eekbPLYojnbhzBKJmrBwb7OvhXtEkJa5KRdD7wpYPS8C5Nxswc/VOITZEyfdiW+7T/1OPDwFB9RzVc+vkTD2iBqezYn5QqeYJd8h9WeCQBrmBGlw/m06Qeqk/mNhzL8xzPmXxS4gPZP+nZx6HuvlfJSOx3TSE8NvTlJPLCRpx3sZpFmnA6ExmaU8cQsKYqWW2BF0Or2m9yoQ+lzP5zqpE9uN5FgG0+UltzwqwQNjEa4EO5sd0T54MLi+Nrh3ZuPpeUARmqMFnGekB/mxOOgQItQY0aJZKOZPoIxTWhtCIvChJrd0C8Mv4GnW266a23c+IqgueEzMz2XzBIWPhRxkKpYFUgwDoKx0jQNGUpbJQpHNNMiZ6i4mDYADqefv03nRo9ubZ1Y2L4GCkk/xCC7xdBZnUhCDwF3m5t9Cp7/SLWAKZXMw6PUyOi0XW3QhffP11cG1B3A8jR+5mbzQcXVzdDSLPUp/lWAq8CjIBVLxPJAXCZ4mDwVNp5XNu9Galb3QD8ocTt/NnblFkfbgeBKn+ODs1eGDR3SRP19siAwqOq2l+UYo4AouoldXMF8YqpYUFRMWEEs6LiKXs86ZTk+cJElIreeNH89RfJ/1raf3ht+yxxJ9SMee9Lf36NLfDHmFljmRr3M+w2tnCTvEuNacwcZEl6lPnm1/8imeLrYTuuNDf4m0IMJiDJ14bMHfMhMXenQ1iGZi1r9NkdKPyVTcerQ2/PY0TUXYiFtkAp6OAb0BpAgM84QFMCcuO5gQw5CLcM/4mVbMlht7pAIc+SMV5SAKPcbv7c0efhU7f5pyIudPqrwNBedLC0I9G2QTzAbi8kgouBX0TgCJQJHExaN8ePqikwyDB2+q/cP6zh8/sV61sZNgjlYD2JgyouhJWEhQESkn9mRl7WuzrSQQHL85Yp7b2Y1ChD+2f6tSo+dichgesgKUi8g/gj4/LRIDXXEt3HxtdfPU50jgOmOWXOEezvC3hnQnOkOUm3iKjoFuiTe8nB2eHXE6pO1sxhZNOTzxcIJo7VgDw25Q9JDBVx+42mw+WYXoGxhGBGgXixx26hoQR8RNWwDlgJZQQuFKyHM41y/TVrV0Cd5mSzIB3LQsiuFmitBQaVJKGCuyDSafap12f7mH0VdW2jKesv6N41yt4fpFUENu0L55jqrFmgiKO+r+6HDRDGvVkClOqhIVYGsjRfjaILwP+0ZIEklPjWC4qYO+PmTJqUnw8W02CZrtJMthjeHNYHLvEBMYzFBxFvK4/TPCcv/rFo9dYBf2n48Tz4OzUIZjeOvZx0b/QEDR34dFANd1S+zQlqe0THmDzHnQdGrSP7nmrHqn6UYZ9hWj3lrik9rh1gavGsuTm8qxmeyt3HE2rrVvQzN0QiPUGKDWYhxjL3pbcZ8GXmx+jTO+QsOravzsyfSpmj3WXNnZWPGGijE2djY19L97NgkCjT2SNNXf9VNVkLFKVDVotJ/XeLT7kpGimVg/mb92rV0qwh2Hc6BArOoYpS4isYqsxxLbyupaIR2OMmo5kXBQ87MsOGuFZd3WTKv4QyNljfJKJcbS3RyQf9eAsJyoa6Cj/tHu0ZBY23h8npRNsEHTSY869D9rLAm4bs38YvTWzNFi8cAB0lMHfvHzIOUJ37KhpXqtOyhfn/H3oY6EUYpK/XlHenv56YjfY6GAGHJbSKwsUCnQAegkff/k9pfvSFAM/VKPwvVNEDiJ306GVsXibe/eYbiSJPGclsjV926T3bcd0PDG4+HdZfLgpvtLnjEMRGe2NYpW2xRY31iwdwYwVZB8aherFDKKrgyoeqzmccNUJIisN/8JOfTlEvjAl0vwS5/+wZdgHLnW32TezakaFaJuVjNpjwvI68FrkSPYUZhBUIAgpRJ68bp+t4yzQ87jt90A4ALkTIUK8M5V2iq6lUA8K3yMavFGgVXCLWlLcO6AGp6No5bl25ysUWnqWhFxXldMHXqEOwI0jLhkZkeV84hj4rWU2VIZFspkZVCEA4IO1Yi7+QDIBBOY2kgYzebuB4LH0rM1FQ6vjOKz0vNRt6OdHjMZ4cZwFqgWZXSWkZ1vIpDqsGpjWhI+FHsjGaiVxbuk7QR005RW05Mk05/Zu2ykqdUpBNrfwK3zxyLAf67xx+KKv4zTDUqJohr4D7j2kUeW/sw2QOCL9fPRvlhMR+duUIkDP7deWMZgGCW84IZ5VTAMzj+JlHx0wVxsJeOTpS+NS5aZncYhi2ap8cYSaW1uaasEDzcWneG/oGGPwMMFt6DMJunm5+uDrz7QTdKjcH24wn6G2YOPpCH/+jZI3oyh0qESeJXXXDU/d8/VY3jtjKmHANiKKGrkVeakmKtNu4Ao9Bo1dFY2gbbeed3VRASZ/1DlEbYEvAks326ZzmbtZEHOCcbh2XsEipj7xqavwvZeCrdxHezw+0vBNq7Q2Z1cAbd7ufKdjzilPRoYntSnPgeeKSI0P6WUqmPXEUqTQNEWHXQL4+xgvxbuESM8ry5IV3thvPnampsUW88+Buv0o/OuxwOfL4RV2eyKT3tYvlinyqeGrNIamjKwetblS8mq0N5IxZpRxTQo49iaccDwaq3UHwgBvZLQJmWTRVnzsWa0SgxO1dHNdj+KYszAhMXqgBKhruK8eRN1FY+Suq7yXkQIq5oqqha/Qkar3WRHoXU88dMohg09xbSjJqlRbU3Y4E0ZpDLSDCu6xvJ10PWVVEGuJRg5EKCK9ft/YYjtUJW9jjAPqbYx1KOgYsEYqOOadKAwG40binQUcVr4gl8J5KMVjNXBEmGNTOI81sZdkt87gWVbgsrpfwk6h/2VzdDS4WQ4CtRUjXqaSJXEaiSS8bZ9tG1q2NgPtZeSUxdVKiSscBohhyLZUy94JF+PBN6v7aPqfJ/2DJnaOK4zl/nL39XYy9wKL+OYcmX9W2Qu6+/c1ZG5rD/jFQRTjs8DPdpmZmK+vyDVOfCzn0fpoJNO2m1nflvyayfyvu7BAcg8p8TGDebbG0+vbay/t3n1seTFZMK2GmvyJrTV+N3ewG3GaEEKN1Vb7ewvYIe+aIY7q5BtjBNTbF5+a/DsHcpNwQvmVjsTIrNsNm+jjVZfyq5LqMdnJZDNFblToIuyOw2RlPgSOSEPVr/YfuvC4MxreAorH1NmdH008cTKoiVt7UEUgT9g5xSDwP4pKB677sVCirmHspx3hn+8g24NMH8luebG2hc4g9HZJ81nE6eM6boFxFYAYSAuM3mPQspMCCJZCAQm9/nIuom2FByUQioLkCSD0ysbj9+nE8Uu+8/o5z6yj/62I7H3uMPPdXeo019pi6MkjWRMu0Tjd/vEFTo9UQ9JT+HjU/GLYjyCxrZhEvGfSbIjWS4XTp5fzdDdtjcP13JycZ+59dnm9+8PP7kpctn1YpjXgDDCNSG+Ci4ZKbZZ0CK0WQgydrAORKRoOdtr0v2oVziNEJ2wms38N04Pv37i70cBgV1V9cKdfHSMtPmQBLImHxIiR/mQED/Mh6SYxikGLrFRGvd0No3l16wKrsGZ+xRRZHYWjvSzkrPPtNq9Zgqr8iaQawYbee1z2DQph83w7jLlsGmBT70ElDJIsiBCfvgW1Hs9vBWEcnT4p2vDD057XtoyHWc15CDTFuNI/Ryc1UiDKcoWnn0H+XzIyRWOUy2Sp8zwL5l2YwSSF0dMp756zUTOyor+crYAtji009uXNz+8Q2fXTfwET697+KeJusa/7EgqPnpEbNRKelAVopP0pdyeHjx4Y/hQQtc38SOj/NKlWPURzHgQq+QIhRuhlSdeq2k6O9w8/ebNzYewvFnsdZbYxxguZB5UoUu0YylZ2hGt+MzmvXKxv2wU6nJboxANrp7dev1bXHu5r7gMT+FlPr8YD8DdoBS5IOT91UXdM1o+Sttfz98/xENv4/HjrXP3tz+9zKG8co6OnnSKFpF6ZujZAimAkDIbSszjIWv1VxZSjjrKSatevIfXInFQnbu/eescTwGI39OS+ITgCpbQs0ZRYyyZ+0RvKX0GHqHN1fep23N2cLLQSWZtqERO2UoxhtykIsBumeGn84saX63XX2Fqr5AMZDE5og+85jHzdIcs62S57ckCjKy/n9IoCy0yXa9QFm9NV7YkK5dH0PUYbZGsqsCiUsNnYrPHmjzWYBljrnhTJTQyxpoY1rywtkWg+1Xne0PCK3lepKEDl2hg1bisZUW1xupvnDZVLRhoQKPCxigwVV6qhHZUQaJ+jPoYozxUcYTifqywDwQ9MbdYdJJj4wS1CulAvI4VrkawWlG4kyA0QpDbW4URdrRSbZ5ZISqZXBTSzHxekTITy5hYvtQFojLAfzcmFhWU5Ybnv9cEozp3f3D625pgVOBm2e2lxM8f7Jr7v/5s54BUAeXiAfe5X3C32mmzTDvN0Kv44Qz64i6qS/Hg7de33r9LvjILRTGDQgaiJXL0afdKVhEPIa7fMiaOPvfZ5hoIO/yZFftcL7qU0yyTxkLqvchgUogzmW7NDM69tfH47ODa7eHqZ5RBEp2bGm28GXM8V048poa4Pc6QMIS/ve1gDIBQqyXrxkpPopHT4H/+PjJw9sbg0z8hZYK5NsWYdQT83AsgivEIRrfSC11UMQavqhQliOCAcCY1PYPaIFKEYhcqwhwf/Bhom+oWof19B4GOwkcplPc44ncmcJQpIcgKx+zbMx0pxsd24hLyEeh1yCHsSEwTLorf2OA/BpozVijDupcuyCaUU8BuFTfGNICj0SreRvS+vnU1eZc2g99O10Gn0VsCdiPoOtgQcyRg6F00gl3LppyxMCAGh6ltykq/h31Ohyt+chkgDfc0nc5OptjVSixHJjL3X6nhL+zfauf+XuSJZy7Ci7EMUD3KKDciZw11uqXI7Vm9SPnwAV3dMlpCUvT2yljKq2RnkcziOBBWY+VoIEN3Tarf7pawbQmnM9unOxMrE7CuQjXTbmpjem/dWBfkk0F+UxeRCUlexmkC2JWQTPw7lxdHZOJfnVlDbPw+yJn7s9HBmJAQzzKY/wO/NnZV2u1ISjX2f3wfUxJo1G8w9s9q1O9ujxNyAFna8cHfO5xEzYMoMZPJ7jAR2uS4Wc/ZapnskBUUmIZ9wQYP3nUo2vrWwwWoyixycFGsCZDM7pFimb2sng9FMAIJ1ya9lk3Vy4+WJf1gLIrdzurZUAPZcXwkM8vABMYQ4nljiBAqdz8Z2Fz9JGyxtCx64GND+N7HRvFNVremQKmllRK6MbRsAaGlhQUElhbh+VAiBJ/XQY+ADTHrASOPGYK1mtdie9VL0Kp6m9xFnPkp4DWErIEzWPVAlWxvXHmOjVTTrl4HSxt4NczDTXJLBbwqeE2j2pHgxXotWmBdCV7Ep+VPjKsmf5rWNGC1p8NeJsNK5pIHCbxVptG96ZR6l5/UpOJp/kodY2F3xn3JEWEsWxatBsnA1GGMMKdYfu8k6b2UZwFDInm8QI6EcShBJ5Cfgey0wm2HooWQZdcuqViCTGeOT3H2BZNuRCXiqTaVobzvgVeXJg5+qMlZS1V9mWZJjUu1/M41jhLF8Y9OOTYZ3uepHWlNERUaU/TXX9stqm7mxPGiMyzo/GvtEG7TQ3mD9fc3nuBWcNkr5tNOcpRPOoTCHzLyi2I8guzKCIk3qTrFYkPPvpqwU4z70ae/2np0C06f82K+UcxJTpFkLm0VM9ZmAfpiEnLemGKAXOvQ7n+K95rn4EABAHDF9enrW8/eQqkl957p22UIF9QKiWWn7cdzcDSxDrnHYBz112jXdXX7xKWtH97fenbR4zXYNBdICcSbzGbODOa8S7AxVeKZgLNw19F76fb5wamHw8swpMtZ+rZo45DO4TZ8J9FkSwwVwiiEpw+IS1l8u1ZyVZsFBwL0XEUeMjd4cQsRGsix8c13g2uYdnqh6JbOau7SKW3Sa+nOoQUKcBTC03tizfqkaYwwtge36NajNW7L+TnMWERGfprPehNfEhntSCdWPlDygHTvk3bq5hJEL3mFTwe6jf6KMy2t98WD1wfnLnjvi27SzojI7BTKqyBzHWNbvwZTRNWzgUqKPRt8eZF/g7yuXDTInJ5qJd4/A5KOvLiEKSJ093Pz4puDz9/wu59zCTjf2xpRktPqRQMIZGLcSgAcTpbmjFeJA9+8t2y8SgjdOpUIfMg8hNdKOhqB5cdzcCjbixIAPP5y69lTz3kTI3h5xhkj4JvfBfc7PHgUdZcKCKPuHsJSbAUYMrobMe+aPsic9OL8oUr2pMG5ZU2gdKjZM2kbF0zeJgUrDJYCKKlfmy348Ccdp1D6X3ZNVvLDDTpZMCvoj28P7q3pChpIEvWf6xSttJ12TUpyAykimBPEYP+s4vnsva+2Pju1ffXNAE8jrgmiun8VTYmdRCd/z0/O2BTln60N3jnl06bPJaD7RAL0DvtgSoyEh/AOAyr3zilDopMfiaz3WaqOAO3+SkfzNs+iR/X6xpNvObaGk2ypD/zWzRbsHoPgFBPCGH80BMqNLxHMdjcxWhWmek7jlIo3vPQtHRhni1lTlvEg4oVcHRQsZrEbSO+spPS5CnoIoCD+NE4N4zk6hdW4tX3iJB73pkeynLdFlEDcN+hZiOWo0xFTFiwhtqTiXgkhSZodcMngzaGLizgKaS/0/ZODD2D0LXWzVrGwwKM5cZZsm6mEBQM0GiZ15j6kdur4bJcGitf7/ZXjcDA4sXXVxiNQn2VXASa2rRQh3K2agdxmuPHkTRTsGJBwi2KfnNw+dY5XJ0rhT7H9q3poPuZXyHo8u4OlpLluyS3aUJB4Tw2yuqFfgz/3PvXd4Lub2yeu0JDwVLLNtxgEhPRvuO4eSTHwVNt+Z2ByjbnXLdHnQ2Lc9NeOcoSbMyuU/dTVhn73H2tMwT2Sj0okp0b02JFhLW5jLk9gLKuhvHcrec9GaGQ3Tmw1essPh9naktbv2UWqH9t9YvOFJllgiKnhFRtb1sgSfxqyf6zZo+aOWlHWvgnsmtDsUEsDVTmGMe0ayyI0AnYyAbz6V31EInxXajpQ0UarjtCpXp+GSnAyFWjVX1VP7UJLRRpqj9ol0ggT6YNAFwRyfJK5KhK8RsZOJGFj6VqVgXZd6lektcJvP6Krui+iuH+EcELy4d/H+yTAn2Pv3zCiEJTXX/uXwJkHeYZwQsSA3SaZc58sZvOvNv6sIVz9vd0o+dWojRImLA8c0Noc+NXPguszbr4nvTlrftHi5lyPriKuu6k+PIOxNRNnY+BimKwvfvD2O0MVIVLx4vyMIm08+yRAEqOLHzWCctlOZ8UofH6V1iwYKhqF3olTg3N3hufOyfyaZbtL6TRqMj8XAtN78R6dJZO/kQO6d3r7o68tkJjvTKpReKkUMDVCEEVIpXA8GpWHkHw8NZtd/MRGhBPtwh6ucLU1AgcfbBNdKPL3JlOHtJRJ1MGv4NDpcAxtz7QQWs+0hCrI1eGh/KETvzOnTh4+PHMi3s2ZE5PqEZF7zmbNje0IuxY3BB2FGB07CbA9mfDo/lyCwOVcQnpHQ+ZLc7AVGIFWAA3aKKhKYg5578+ewlbwRxXSEHpaIWNdAvGH3Po3lZYNhpoAjkALE7spYMCoZZCPnvTDuM91hkY9HvY2Hj7pXLYwwfHTNLp5FIO772VF0iMoO90j3sJujfsUN/Ejxop64WE7M+jJEGPkEZTK8cl1h5H2gYieVM4b0WwEK/tvq1D9YTkQql6gBmLPtoW2gzaCLXRXVCpZpjXzpzgnd1eTKVUkgNnPUKwN4wif1dxcZnZfdmYdxG5c/rsov4b8zGMlSq8hvzoDSgvw+XxHnksxHR5M8Z9/Zcwt2IFHGyk5kiclJVuDWyRkEtjbhGc/d4aBV+VAk846ErPva4CCvV/zPgiPM4+WGGh11/j9r30AbirPWWaD0w8GFy6bXWBfrt0JNgXY3eCAIbl2dYMiT0AZ21eukfXnUdGOxMfS7y8mRxzbmiFkDALbj4phN4jceq6zyMngtPoQG0grPLx2Rm824Mec9I3vN+Ark/eNIQ2cIgUwEYKx4eboDd8iZZbCfndg2u/ClrHhGMHacPzK2HC2s5cCaDXhBDq04TyUt+H4nc3tK/CBCce8GxNOylCLS+DzWuga2BhzBKCJBylFhLlZBVnVOgOLWhdgL3lDVgVWwziEgAHaKKiK+SbvvfkWtICqeW0E1fRShgr3kNsqeA1wjDoCspKcl3+IOKaMtzoXMDOvnw1pfWtG3R52OZpxytW8QdGIj1Pp63RaPa2UQSibg2bGh+yF3VvpW9R7BwPeArAIKECpgxgZvcaL7QkEbqQAiC3IvJWMkIqdtJunuKmkQnp/4jQQeiNoPaF+uCuqtqWawtyf9qy0fI2oTHX2TWd473cg1plwiPyHGhOOigQTbt6V8LeRBSe/cp0jC05+hdgxTSnAZ80dbcIRIQWdIf4P/PJnNlTjXDuZ94dfz+8cpE3P4bV1nB34c+L/lL0oeip2JOO9J3rQEMedQlL+vDjfpfumHLpg+dJg/ZacZx8t+LCICOSgiJ6ImGj0az6YpS9kCQupryH/B3n+9NcgkwduCq9/sX3iOtqF6WJJDjH+4ySi3oE0pJNiIZ1invhC4XpIo788E3rmOKA7Hw3fvqT+OUpI/PBDEoJS2PMZOWYhektMDaGf2/g8eW8x63T9Jf4exIN3S90Xl45LJ777ESx1n7xBXXk07diYPEIfhOORl7uBtBEghZ4br53NgA9Zm1ZUbdqKx6zH0m5vnto6/ZUDo0aj72mfkv9OAyQ9RiN2iFYJfWaoxIY87yQzC6lcQbxDFzdagQl6bX3z4yd+F7GTwCXQSsRSwgnintOrOJ2QLyRKJYTl2FRCWlSQR8jAepeceScUSg2liWdtsJ8RpHd6dnF45iOtR1uiMgfxXrrNZDaohADzgswjG08cBNYFmALr0othAyecTga390vxLOnfRgecFZSDg3ufbqxRmhMn9vAjii+RHkxKE1rIgBQTYEigCUHJ98xJIRj7YURBZK8ew+rlPUxcxus/TN/y/KR7ISvAb04O187RChDCwfLnvALEk09+5QMreNgAUtECqAhFGqnsiVNofy1v9B/Syej2x29ufsKpBVrthOJQuVodzzoQxEebB6mLccSaR1DIuWEgvFZeNDWObQb38F5cPAwYn/1pC2Xi7GyRHkpYkzijb9F41yj9zrSW0joflVlZJpL7PJcIA+CZd3aF8u3xJ21Sn1meHeslXoHyM1UfIuhdws2+sytbP5yiiAv8hahRfpRh0b9VLLixkkj+vKsZuWJgIqxbFzdX1jE5Dmx7HE0572XSTWaT44n3o/Egk0DwTBEQ8cwt8mxRfNVeXIS9nxsY4Rnqs73y7fbKDxySCT78C/bqUTJ1UubnYlIU8VRmOr3DDs8No+Ag1MexBvQw6aKt5XdcHwuSYSZkhU/+JkCwjAR7Nkl2JGG3AZz5y6CvXatunf5SHFroC9KD7m+TNm1P5KNcUcgI28la83+onSUm2l32RDrERtrpb4fnb4nZJSbX3iymwLIxtpJaR8au8TZNxfbYheURWR3GUNjRTFATIVDiVm2rqjYa2ijmUG9alamq0ipJpiUVGSmT8arE6LO90BaWdl+Kwsv5MVI+kPB7FM+BYNUhQYnDpLrvfjQ4u0w1XjKf6p+BVJxAJnp5GEixCWWYkV+GfEK5o8T7kRjVFawA/aaBh547hXHBcqCY/14N5MKlVgO5MBe/CVJ8jwnhIpwf+Et7ybiJ3k4JRsZcyDUFGV6wp1xt5Nu6jCnJJOzS9cGFdze+vzJ4/JjiL5XtdHHR2dFLeZ70yh4npmfkPO2VvNui71rimCflUN5Gn/nrwrtbrz+l5F+M3U6aIW4r7floPkdSTfeEOZUwv6H4UW88+XZj/W1/VRo/p+ArcDuqtIFXjqSstARH6ZWSdRWRijnz0zVkC8uZdjMyqjaiB3VLiQLT1IEmmIeSG74EDPR1euPJCQhJjgUYrrvJ/FE67kTw/ooeGQi4zyNlmA7ySHGbPLk7uPe659q7aCCy2d6nF9GO791u4/n7Pr3Pkw+HV58Nz9+kpR9sRTsl2gQ6c7DKrRw2hqCGDDOsMouwzGmMWPXRYIbtLr/wa5I8Kc+y82fZ9me4lmt4oQ0tca6DVuabL9LEvFolxiPMcJt/eoMjHhtWTnB4d7ypcXtRDpK+u7X56QPe/hde5z2Sbv7nKSztGr1K53E4KGGzK4Gh4v58fHZr/Y4raHDttu1YaPgCLq3Z/k2nPF6kWfioAHGC6vwmrogDrVaEs8FgRZ7e0IpQR7uiTEXoGL22Fr24J/hoAnsiGDQGZOR5gsAGw1GHoWJZ4W6k8c6yWOVwKBknKaq1F7L23shUHEx9ngYdN5KRUjnZI/97IyuYqsZHw/3wap2LBhC8zEP6+cmKiwb9zCXFHhpCmyED/z1IsrmDgwaQ4eY+8X3gF/+37KPkJ7GOksA26gSim65gMjDkhTA3FhFWdxpTt7hzq3LY93Eio5S1bS9vQKTNLqK5P7JuVEqWHIlZx5g97HePhQwevDk497BSCG36lllUkluQH9m3mcd/78XMo4ef3MzLIG10Me3xIKg6HkpRk6NVelwbY56hctfqqBfGAsRRhGES24FUegkpbUTfKwOhHDGKjcuLlZvR0HetkjblGzGtJWsoqiPtTNXzj3eweyiGDnkFvLU+fP0haWbY8W0s9hop6l+JBMGIrjFL3d5peruzjRnaEJjzeJx/4EAJ0ZG6TytQGqwr6zRFE7i2stwZi3D9TWZSFILnM/GJ/DIBbwujP1kB6r2n1s9yt0x1QOHsHG0ouplasRVVCEPqebYXqThvL0bjdwL7rta284adUY4yByMbjLsa/DeoAdFlLhg/0HinH+gQYlOrpI7vZqhDGb0rHQMbWcZ5cgUcH2931Bpd37r3OWdKdEqu20DMVoCEMD1mzzX1CA61e5FDvjW+AAy2EEpYLBh3IRrje0Eu63CnYiEmbB+OJ/P6JdQpuzIv6Q8qEJtjZHFYYy91d0XDEmvXhhkLkynalYb53diVu69yme6iJBpNv9fBVGdUQrH/syYaDRKMNCrl51qj0tPiXwjvk3uOjkaDZGhU0vw68HN7x2qOjpk5RPASON8eQkeZ74dnIDaxfEC2izyw8cKPxRhatl74SU5UDtIZHJ02rmN2EdwQPnFxe+Ur8bHK1Gw6WOSJvUvP5MU4ai5cyG1o5KQFQ13iI7/fg7yceOi3/sXmresccyrXdAOZEtjgyPKu2BHDG3AeRdNBpM2OJt5x+qJ3yEkAEK6DTy4Prj2AuOH8BYYb5781+YL/bSdayQLBX8v17yJvjC7W/SoRHtx3PrxDLvZqr8Ukw3vfKIlGVHB/chXz9Ej/4UKmESQx+klLb0RsrN9y1MPTz+jSLyjuPGEna2cuwF7+TLFg03/ABVV6m0lAyQkxuR0CVHESOZ513Cg5wt4VP96Zwx37ResDvfH9g637JlJLD763rhUIELi8C6rxd/fQftFDyMa/HaGtazvBBO4VbVeJ3uF2Jmf28zz6hqe/o9HXbSe4cKHzLv5Ym1HfFDtSq0uN0Oe7L91/vKfC/ddBfI406yyiHz2eVV+CS9W3KfbTk43HV+hG9dGCJAj0uSPA730LFCRCRtP6AaPE+R45KAzIbhmwtCI4QI5I3I+1jt7NHpy6SRezYdEgod1h2eFDjjLpGELxD2j7IKM5qLM8kaxlx9F+B3F367oz2EHc8OfIPnSZD60htDhh4ZyVOnz7rXelw3V+KqnGkEdKmZhhquZb1/3FgXZNNNOEsay/E8LFLltUH+us5bCtp5bAB45ajB7cNoFjTzhvK/q3klYqLjVOPL24hEuCniTZcTJqcO26k7i0T4AOMrMFrCjElQF0Rdr144UeC4+nKEIvM4a+1MMJxwiP1cTI4YzSXDhxufXoU4zV0knpIzSxZ9Legp+zAch4CFYEAmJnLgvv3Yhuih/YX00gmqvTozOSplRjx5QJZ9Dg+BOQQQPjT5StopCkb0RLAdfqVgBOzM47U1IjgcP2CQYkPDm8fpPSrhzPKHHKnPcEYHNkjDFiDJGKAYEa9W7Ok2Lrm5PGfIhNB6v5d9b7Xuer8t5J27Pe3m8/WfWqp/jJkcSqPlV5FMkh6TjrXd0kQNOFWmInHWGV066oipDKCvSdRHKoD3ZNW0S02Kk7yESRwUZ07fy1SE8rdTUjEJunl26HJIkhYdExWsR48RKLhbFCwQgEmr/tdGanWaszti5FjR+hvx/j2oBMudpULluSd4MfylUHBxzar8DQDuJ//myMjwPNCEhXk3YO/Mz66KfHk456WR52oySPcp59+9nG2kWf9qzTAxmwyDoV9xE0DBxCFR5JyS2h6FQk1aB0xAU6rdCNS9pIgb6+cHlj/Q4NjoWl4mA7Fc/TtOnkqLl0WEL0Fo4cMRaD1QFAmJQ5jECyajxIp6AwQr3ObCl0+2BGcHyumgyzJYutYYGCmBOIqHYHYVYMD+XS5qyRAiSWelBEGEwdC9HNLC3Epq3hEsK8NSUcXvgrkRhvyFk0x6I7kXc/HXx4zd6JpBJ8dhkBz2uA60AjxBFwNlsNAFp3CY/qb8gRqNyQI1CTayJkMoSM4SzWKKBqjhqsNW1iBZ3Vfn41uOOO3TX44XQQyyLl8abZLEJ+dy4gwlbgEZiho4SMNG7aeE7ce91PC25W1DR17Rl3edjd6A4h08pi+EQ1++znZDq9rDD2GiSEigE0vC9W7d+ob7VjCZiSy4TMGTjDGV0yQc5sH4YAI/0WQFijr2dOywc8Abs4eHbHyHmV8aFAnEQcslyujJtRhErEnO+aUCXXrinbAeW+p/vUJ+GuKzSN+gQYex5/tZlq4Ke6EBZS5MskWLB+/xpnq5FPuNJxuhr52WlN4OaVIA3gf/35yGw1RId72liLA+5jta+SrF3MJRzJ+8UldJz9mm7WuLmzsoDZJr/YvHx1eO3M8GvMCY0E3V4h92v6q/hGInozYmLxFEXpNSQpfZzLAcRsUTbccgG2/pwF8VmbUWhYZHCR0C0074Bj8wyBusbaun9zsH5p4zEFl5md7ZWNbtFutHLHY8lnTy3Y1Z0B0LYtKt7U8GWFWxtUkN3d4IKi/Q0pyW47gtzIsLRdtDIcQHBVtKVpVeugwPE1KyP0Ue2tSBGCmrY/TZtTIXVN3uK1hpQAG8aKu/H9FY+ovhCzgcfrAgEBq2JfeTRtU2NpETS1rdpbhuvChBLDsphjLqhSRowcY4ZgxufV810dcLhv3l8PRxw4azw+F4y47p/DLqh3STD8En4VOkC0WCFKxeNV2d2hhfkeZdjCJDPDFvbHlIZjKaXSvBY2BgyRQjMuZlnHbGWolimeyafVBoy7O+xqtN+Ek3lFUG/WqfdxOo0uJhC15DyTFGZfRZJrL9/2ToA4zsLORM7oONewRYCKxTzZoWFBDPkIG46UyI4qxKsPI11s+Vq2Fuwl9P5k564K3DUFiY0pTOgpzTDPySjWS+V9/6x7hD2OqVoHg9ni1Tr/glnwO0Xg4vnJf4/dC/BXUPsnVyveBbPssYqlvxokDhxpiiEV+RYgzwd+bQwxWIH08uYxjU2/TvuCGEf348+H59+jrXH+qC0XmYTIByWgN2MhInoJUt873E4gWQkxsQKCfhGTDYGRsv3pJ1vfXBpgTN80n6EkURwoP2sqrQaqlxeTQ8kBogfjlT/4bbayppiqbl13FLKhc8aZwecfDt+4wBln6MumNVLhzmUOCUbSzFlOPvuMokItjvFd6RfX4EbznHgWbZ5/a/jBKXIuSrtJp6H4HGsixNaWhJuDEHkEE1PEzq/Cv3ouUQ1AuDXbqZLJhUJ9oU0boO8FW1vaoMtZRrO/Opu20xk9q25iSiibguPzNwY3n3qX3Yy+p4PbJj+pA4LiFRZOYQyAnN8KhOx9tpJOby4tw+DGsMsI4WogCwpFqdz+eAVCo316B50C3FJfk3UzgHdHEcRi14ASqU4QdTv0COzzawoYOA7orwUboVv3Pt18sqoboUfT2hNYggncIuhVkARG4E3MCUQ3ThGEb70iCCc4fd3zjIdHetr3fPdQ5gAWziqSsl0sQjRAmvXoZtlfOR6snDaePNl69Jlfn3aBMBNCzDsVo8n8j4sxRShwBbIGTyZOE1LLa+ZXDF6P11fdKNr+7Dw4hMIH5BzmxIUGSiTCYgydeIYhpQ66ZtZqZ0cyHXjY6i/eA+PKDLxvLm0++lQH3kKW5M3qwFtwb8NMpgY9Xir7cqKlMhZll8paWuAJwIUFIVuyzgx6bh/RTHczfH05cCt69snwzDN1K3ILV8xoxdlYOzM9m8yq6HbSGfRa17ljYY1LEaKa2UO4ZvYQtGUY1MeciYPhJG+L4mBsPPmMtgznOAYGf2oy78wlHO5hFJ1PtjPn/d86Krg49MWdkpOQePmFG2ePB6fukvTCNjKy0GOYYBgGd9eoEkTGwNpTcZHlXnaD4hYrEmIUXD1LhiTcSm8GqsS8CNzZ5GWxG0jvHFTRL3jvG7xi6YyPL4K8uIS1Pvlsa/mm3CH3H9E98uNZG0LyZlFcqH1iSRweTIlWih5Wm0QNErVFSMt5C8ePM7RvinH0En9HAPTeTJb3Hy5KoJX285MtHQznPqBhsOS+Kdjh8jh+7kOWKfkYYh5CQq5xVp1hknQS3qCFO40c0jBIq3b/pA21ioMyDUM40aA0GlVwQ5Wq6EapIrgVC4geuBoSvAqG2nQ4e7PLA706sVYNLOh6Q3cXZm7FxK1aoHuwPyPbMzIUx5iJ1kQMrDmR7ioJnn1CYoBtN2u3WaONXERI8YIXxfDDB8Orj8RE86bTnvtDLZxp2h3edtjZclCrwcgnVexWlav6Fq1tNLXR0KEOVd2pupgck1BdGm23k65TPRcpo92qolANVfXFLrRFpCmmJdoDuT5GKFuBHIjTnYWpF6TcZyTrpNf6t3uHqc82l++pvDSSrCYsCvzw6viYKNhDcXxPchrinqrxGIJ0Wo6D3wf5gkdtooi/EBNlB/7a7KHgtGrPZS0JFeeWSK6HlhptcFblaHGDaw82Ht8cPDhLAePcHEMKs1GAz5pKSt5QYBrCQkc1wPAAlla0dwvyPKULpL0h3v5dcCRcP9p4fgejSrkuhJlw5Y3hG7eGl29srL09ePo+CisMnN4ylykYySc17sAGvKwYWuCVDJXbfG1t4/uPUFD6xH8Bgl7pIARpKMlkx420+WRlcPY6tRBB6RkU0anI3iUn9LWePRFPrIChhVbnjxvlO/jh8uDE9/5uMzeLaF4hn9FsCPyCjpgEz166JUS9dCuIS0kAaI6a6I2EP3GIKy0+DvOnQK4HAXf9knUPUmg5DCIkjZheAQZWjcsRMqqAI9DM2RK9kNUZLpChS5cagi0RNc8M377J6OI+Iug+BkrAbIQdAlqoUTiVkyV+zRdb41ZlV3XTqupIIiVoMIWA0VpoaVd2S5B2ZWOxHi8OokJZ0yyjlkHOdsNY6B5S03w1Q6gyfPBwSXma91B6vDTFbk6n0slCJ0dL/Vv4jAZ7UNmoVytdyinrLU+7BKtFGpXyZvdyXfcT2HfdDAUzDmioWJlrBeXOYtKLyHDg1RblhxvLrV3RtCs0e5/fU517E9SiMtOmMICnNN7qTp8A/x9qYqZguS9DIY7R6PRJfiS+44gp/KNbOyEHQUqbX408fyIyPIAixg/8yh5AdWYWxFbh4IHkmAFxJNkrA78gs9T9mXl7hGiLcaSyyUDE+7lsgzTB7bQ9XbcxMLk5E3brUviOrSOHNAdZ6EvIfkomEslckLNvXB989afB0/dI4NKZ8Vy7yNOZIAAxA/oEpe2UC6H7D4QNTYZoFieCMDlohE0K3r++REzandL18w5Pd0aYL5ODpqmoJguNwNo0NAKOe8pREAEoA7aWxfWaiwnz0WhJxvkaQkIkDdMQGFONi6JYaoTuYz5ok7Q9YqomFb+QLDTCtI1Thw0iVhVzaowqQfB2VcBjGK1O8DVaHcPb6GNchJWYIdsV6BjWYI4GCyws4hklqvxsYtbZVtGYddowPmadZ94I6JD3miLq4EPskaCVBDW7HBulDo50ZCNHIyMcFWh9CXvzAY4NVje94ZBObzB4KLHEiFWn0qyUCBkNe7+u60W1hWxGoDGgQauHGWWUkR4Zo0W8BtnLfSqV+Oou4QAqQt5K9tGyOJSXpiG0EbQFAhm4O7p2SDcVeTH92RvwNqJKNRN0WqN+GsOy1nbDn/5Qa70R1cswn1wxr1YMOPmd61+x4eR3GV1/G2Qm3MmMI0q05KgmB/7KWnLk17bY43Mj8BUgi4VCi1/a+AG96PJF+ER2GbN2thBG1IXlS7tTzDaKsSD+9IhhbOSQzDWaY6WY4Yl92Bnmh+UWH6Qrx9v0t7efwjW+wfsn+a4FUJVJg+81wpFNB/hLezMxNPFn4eqAxG2DcES99w4XGPsKbsfhbTnMvP78fdwj3Xp0a/P7dcxW776Cu+bdXqGPuivLGGT+rjcb/TXcalr9aLD+vn5NxdPf+yq8RAnkWhrcwCZkYalTcCQ1vtdtMErxvndNI0nZZeBAFnlMQ48nCxRW/oM3ty+d2HxyAfO3alp3ztptIDRzt3lX7BZVUngbDH8dLmslzaSbBMxCxKTndxYJEiKonlmjS76JswqL+aOcCqLMOsVSogsYA1bsAktiPgiaYe1g2kmOBJzJ1Zb+as6Il+5tX/2WryC76d0xvLWzgDdCK3YFZplr++UWXKA+0uiDLKUju9toAj35bhNrB5VzyxSgPJjMgK+MzuSiKTGEIHaRW7diMPvhmc+GZ3EHo92Dsyj14SNyTZZSpp05iX7iVhHZIm6A6z3ezZu3B9/fYG+y9FAzI188/lOTpjBKISBE6T+ksvlBc9CDA5XcIqawlnifgY5dti8/2lr+bOv+B2D8FEUH84x1s1kZ0cmMCUGiWMWuoHQYE1iuOZo63eyIuF7d7dFREN6/xqa9fm3z8/XBVx9QaIPm0WK+lOg0RChrX3meHEbD1BBhvj+G4MA4WUzcAGnUsDSHN6ucUFqn8CdfXh5ipIeIGQNieg49Ezns0jKE3KZl8oUHjhnKSgjjTjvLyYhiwfYW0hfjyH0HEYBhoAPneBLzy/V39uL8Al7C/HZj7QFCLPVmGt6xBj9PDAf0ptiZ3vrQEEK+Bw7813sr339u/I1SlBg2bRqqKXbIvtLm/AyPbjkZNLj5EK8dLhRHSxQl0i4MYtyN+M1eQH1jMYi2FT2bpurf4MoOztENHbewL6Wt6GvfVPRcjCHWpqLPfV4kp1Q7qXYVHjSTuKZTZielKZ7GPAZg4UNvJfIuO/qqmABGvcSUSkPHNGEnGWBwu/r2koF5fIVgUqCBb2Yp2IZCtEIMFAdLsP0DLTL86P2tR49xjzTpdEPCESs7Y0+OsyYDSzKy9Sax9LyVZ22jnYwz/S/5yvS/6d9KRnxfCoExoSp2zi6tnMjCiSySye0Ra4uEpsNuDAdrNASqf5ziV6XP4zidz7OZEYra/2G16m50qtGnVuFMrLe89ovIx2mrQFMFamaMkrEKJhTOO4rmQC3sji4kU3m5B5FrxW0gLXeWlUZOxsJtvGgLxdqe5FFNHBywf/+5kUI+507yz/HCXi4DZf/aeHFpSW5r91f/3q7uYcpcOrHx+DzPncCpxbXWq40/a+BcCmLg/HKkTws08IEDNPsO/NKs5DtJVizKlRcMg9ok3xHr/z58793hpfv25jDUZTG4OpyWnWQJoGTB2EkwjR8s3au3oMlFaiXDrPMYfC3y8YauOn1n+5MbGz98Yj29Z12XdyDcsXAQOn0rF2GezmyW5o4UBpMeodGXqrGU4yUJpnfdaOLYtBLoV+vFCZs+FOxJHbvXzw+urxsPTqDw/psCGl6KAOdGN1AWIeYqt37/7jEY5TkJJ7x2NDxxa+ubDx2ndPMI3BuZCK8doIbgF6HfJL2ke0y5RDJCpAAmwtAMu/QYhLKHevdXegfdsD0cx7GHFnjz4eDChz6OPUME6YoY1QSyl1fkT6OVf3Fxid1piOeNJzfJnUbqKqmKhFzcaRJpHbqg61uTbukSGF7U5Q/p7jDl79CGpcMefuazHoUyd7OZNz7rkRprQiKmNxmJPHPmloNnUS84MJuckNZyarMIBfwKeAU3wLSAFaRqQqKRjWkveCq3soMbMuyzkgT8+jdx4wawEWYMFp7oSAkUkTwYsOB5bQfq1rOPzSjtJmTjKkDYYf5MR/H8uQ7C8dGOfD9vwPRgZ3+9H1zYnlLXK6G41lgWcYc75C/s77Cz/bXtkDl5DOEsVIATIIzyrCn/IgW1NVqitylKo6iDCdQA6AAvq/crSG23RCPHjhqtthFmeyCtK3UfcmB603PyupT60VTqYkH2PgBr0xPBL7+ry0+EJC+jAn9+59/i9ET8K4+cOD8R/4rZOhnfZ28cfU5DdHhKw3/+pY28A4dVZaphBefk6PKGcVWGLO8+sTV+bb1K8IUmtVbAJIRTJAtjrv8STR4cJGB6V1weUH4U5gjOJM4/II7kEERg+ETCJu6m1TH2q1uwu9U0snLbLaaZFfnAAMheTkaPbNYpgvUORiQ17Oh7vazH5OobLC/UlmE8b8wQnhozXB+OQSPU3jOY3njty3hkyzAW2jLMmDdlmLIdAHlDhoGMLzAzxqkV6Xs1ZJjc2zH0grKg/JeFrIyq2278f9+/g97oFMeawJ/ecG/BFf0jX3ew5MuUI0ow6mpZKSTGt6AWy+LExgy3LxxDV3lmuVbLN4q4KuvpUeFcsYX1sLS6giJ0AxoARgEEdz8cJARNMB74KR4N4UhAocwfznsINWZ+iiGQTmcECJ0YNfxjWsNnfZfX9vfvmcsiZFLQX4mBLZoH8QAjA9OIkB0vYq143Z9MNO09ilB+ZEG1C4pqGXue1VOdXhNUoZRfp1AFA7HXQVNjkGBVXqkJPYMEaI4cd+i/jULP8K9c0Sj2DP8I+zwM7rMljo49g1Roi9Bfv7AOI0cyOUWnIf38Dt6aAcVPJjV4Un3zxvbymhzQgkMFXTl2tE0fVQORCguk1ErHjhhEaAM+uDdZN6XDLt7i4+RjyM7dg7Tv1V/DvfSzVzfWz2ze+ZOzRganvqPE5O3UYJgrXeZtcLHLv68pzRZSha8i6/YMve61CjXuAJpahJIZCfStzUvX6a7BEbwrWngDj1H4Zcw1vt0dcAVTjubnnIBaQEd22uqCk6Lnd2ykNz4x+vwr3WWkYKhOMKbtHm12FSAmEUVjEyqwAVWoCCRAsIOiky6WhbGS+w87DY6pv3Xus821k1RN+cy0nrwK2o5fTgAVoUhr9T8r8coAm8h3e12IkdhDx+uDetKzfeLE1vKD4Tfn6bAHbncTFdrLeMGbHtMINdkLKJuCiioxiFxv91dbmvXkKMgb3GgZnF0enADfou6MxG9q9eAvTXnClDvS8RqCKHMfcCCla+x4ob6EQwY8DTmzsvXsLZhHvXwRPbkyvPZypL/smhg9u0IEzla1hIdVKISefrx59bRBYGcPD+GDFszC1Q3uoeNgP6DiWL289c3nSAK3elvCAn/eDqmLMcRSOn/OZf/t7//A56109fDFe8eDCQqxhdqN/sPeHKysqFFPfD888YTm7ODNU4OrTwfnQD/94Xf/jY5lAVNOZN3fk4DXwhKmAuq6CB3DKHoMSP5e/2E3DB7zxvDsBz5tDH0fR4/Juh18b24SCHR8vqCFxJFjoJwghYwWZUPHSElBJJYSMmVKSJSDbva8jxv0zig79xXun9AH5k85b9cfdqBjrzmmzM1l8HwW66zS6QZfOF2kwzXcgoejJKjf6ye23rztltDbJ65sPD4vN8URgcUW3RXHNyZxABczuoAI3CKHoHrLJWv1VzpN9Q/9eqkB5xuU62LjGUr4rJVyw+jn/voxPRfjqPXaL30vngl5r+tMRs0I7PpRBczpxyRgWu2CY8DAH1IwExZj6CSpTxEFeOEBQu5nLy7N0WGaOqBtvbY8uMARzWh3Q6LsQYSUML5LI7FASh+5eyotC+Qyh1q1JckqsCDLh8evQfHX+Ii8kyw0FIj98Yg41y0WejZYClODYQDUNWDBtVAzNd4y/ZXesUDjwHHu6heqcTxNW1wV5bkXoxa7B/Uei/xCnJDkOaHUmD+eg3wxgigtuPF4lTCpEZc8KG9S9VcFxrehIusteOJRuVsKeTMYIxxdwALe0f5V2/enMUOnbSbuz5Tbv+EV2kd7sI6sZWSNm51MGzFrKjYN2yO3qfZPP3ZWjTdIAmPE2hI7WxLGipiqig+UsFG7qmpVwxqt6nXijhrR/zFtHRVomDH6xegWqx921g6sGQzjO0pyL8W91J1A5oq8jcTiroViIBADmTVGYllpVd2ZYJBXxsd0AU5dOVDM/6iGdfE8VyO7lE0uJMi9OyayixClB35udyggyxyvUfkeyQ2KBZTNYOpAiE4KXg9ZThnct5Zvw2Xtm0+3ztynfbVkoVPMwt0guVDS/0og/Z0SLYYG3kobRfAxHLtPhyduhVAhioYqbWNCY0JYPeaG7hpaf8vvbD27yLnS2z0RS81eMz2YmnVg/5Z7cyzlQxwAAElAAMMzt3je0DfGyCAYe4s5abUTWgKxxhR2UKU4bYkcXSWV0pnDlXJm4hVhBljLl7xLtP0dZxQ67MHg3p9kRvNXhjcllNyxvW7iozz6SgZB3bC2enVZOs9EdRNQE60ScM2tZYNslzOI7GNhMnKYKorBzWVlcFtwzXk8mdX7xV/3aJtsCf0X7IHNySvDG99tPfvYB4TpQUr1xlKnkzR9kicpRVJGAf8Mbng3Li3UKAIqrMd4/iwImQaWNSoC54FH3sWZC7LAO5Z5zWU5zTGPqGSBCdlNeBAKtOGY13PELV1/ZVYrYMFBELILB9TYyhxGwnJsryUK17qJbBnXRDMhz/5NtYmDcacXoZnvGC84+5FW5vu1wawd3HtdJy5zCJHYOnisGHGH/c/Zo16cX2Lxxumjvr/kZBqf/ChX8wZEDn/22+eSJWd6vS1QNpEUZnud5YuayBjtr5+8UtObuMceTZasrExy24MepQZi1PXjfYj/SHyPF96B4K4I2UlEbCRexa9z5/I975090rUt3VSEwFSnpmVrZG1gXFSmIVLaieNsOTNnBhcvBxOmbrbINeRxI7syJuuySeEv/6smmRSRvEyCpho7Rn/n6kaJpDx1Rk34hyBT5+hMUkSIZ0jc9gd+Zp2V0+5MIbkpYUeUU5QOfri8dR7OZ9pZAl8Uahe0PYWOf3w3AgAsJ8SIAPwVwybceWbbC8LZaYRKiGZ3+iJ6kuW9WfiyyVk9smP9Fb/ZRhg70FdIdR8VYie2bfhqP4GtYUMz2UerPZK6nkmCcLVzRR6YNa5VkmYemDYGO4jGQugaikXQQ+MGC7BJMFPhXcLRxTpX/Cm9zvVx7g65aaIWCEGLPSOMe1jDd4DLreLD3RHfIa7xcRGGd6HjmFUvfCyvFUDDKGc3Jw45ghSxF2FVnFq0WXdryjheW45XFW2WVQMc8mlC50lrhqMghAvdVzwiZpy0useZMKp+KM4dwuGVkLomrOvsSkdzpDtmbF7B1IVl3z2cTK1/CUmtl7mM5vkrlVpqf/I09CHuCI+S1Bi2dotVA7Q0MuD0XoTpHqVgKKhGGi9+5JAQ+knExNTmc81sc6xBW4KLeTh/f7iMbubib1s749RLk9uIhvMy5pU//WDrhx/MlJD5MKXBq7tQvcNUkf5adtD064OvqF9h38BzUBBp1TKhOvymxjQBipep+xx7UUwU/pWHQ2SW0G8Qmw6K/02Q3fLXI20SoKKIdsj0AfdpGAclabvF5EIn3Akhh55LFLv68Spc7nwNXbfmko46tVIIR0ffTBbc4GybiCYCSrHbmuqY9Jq4cRFOFSQK/FHhiS6bMktR5A5iKsObW/ic+vjW/GrS8B8Gxd9ehltoZdqZKUp7LMipcDYv3R58/hZGi04WOWiMq0FvMe3YXAMeohiDICeDjCEnPf1b6WKQLYn9j558y/ndm2nmTH46EDsOf6vLApEqIV5xpYxFfLnkybfbVx3Ml3S5hJE47wAieReGdrFo7nED3ItLx036I4e1+eQNn/5IKSSSOT+apuE3hUVUpADD5/3gF9w4C25YddvFgt5RPQ6ZoWFZ89mpwb0zfPev3cMv0oP4bYNXpkKLDLoeoegbPWyY7VPnHALaxjMLxkNLIKrFjwMgYveQYK6EfbEgKHoW2OmW/XVMkkFuLXivvb9ss1NtPL7i1j7aPUuOpNfS9CeZPPpsWh7TIiqSxRDHeQWRTc3j2ULWLdiPon8DbtZCXF6z8zh458ON7z/SnccUKRaLaiIe+cEuAhg+9qXwBYXOFFSWdaawxQWZeOR9nNlmAf7BIyo+IDkG19kxNtoHp7fvfITdxZ/MqscqEvhLCejzKiCQcgKBJN/Eab6lUwfh3Sw6kFOX3RMvwWbu85N4sXzw1pvDGyBSWh3Y7ObzevjbSUQfikQQigkAOLaDQvhw6Sn4/KhAOCZRmrY//o6iNHWb+AVJRvrbu0vgYzGOVmQiPQWpsBLodvUxyXI4S8SJ89aFrUe3OVcEfBQkvIu8HfGDZDyGzWvXDJbXGkUHMo+RcYhWDAfoXb8w+O7m9sn3adoJATYJ/20C+TQljI5keCI/sc3bb7OfGH/CrcJPuXgZKzvks6j8WKdFYkidFstUiPzN6FI5k5yAilwWFljhAiB2DCqUhE2t+bZr30T06Kr40aJUQj0Gv7MaS1FTqTAiUhkr0CLrz5SChA9TcFnNrDPTX57V4vi0GBpDgikA8+dfc8xDiACWiW6cJRTkyCMID/oiAlQcg8A8KUkeZBnpzEAhbRarBbhTw7DzThtXtk/cGJz+lpw2IDdmD1B7bQjO5Y+jGCg4jqJ3JJuO62BGtBgqxhnpvbEf6y42x8YZY4EhVjWhdjagjPHkzZ/Q+FGbR6wdsXQim2SsRRJYI3uzBfDj/VgRkaIep6atig4UqFWZqiaNdrQacZ8azCqf8arHqh2rNsYoDa8wQjk/Vsp7CR9I5JEiT39mWRcKy7GS0khJL+ZqhZwKuEAUjRdERghNRUjUOE24b/HTfxjvNgHFudL+vSYTDhVe9ZewzPxDkFL41zv7TAS1OPDreAns1gS0feDjpoALVte7jrxxYXDxHXY84W813wvmMZC3Pu2LwbWYiuahqih5eN4FkZASE1/ssKZmGn7y+vD8aX/q1XFau5f45MdNTx04Z/LbCfGqYMbVP1vA8OgsXZ9fPeSkpLOz1zOMYHrxMMb5ub917/Hwq9e27n8njmdEdoi8/fipk7XSxQqyR1WoEETsH3rybtv0TMsN4KkNAWusB8W9x4NTJ/Wg4WgBh/n+mEEAAn9temXOGRQ4OGUgaD1lIOjgjMFAySlDQq8MqCLRLinC0I00JpbA7vzM+4PKk3GMoLrKviAx5G/IMrm5IktvbPhuReX1073XGVT2lgnU33gLeIwRIzQLVY9TvRDL733k9qDevKJULs3RARXgb9MFjFaha2AjzHrA6PrrmM4tpXfT+oaLujbsVjwsYC7mDYa/77rf/kyn051Kp7dbeZYGcymYRGGv0W3CgJdJMWoAlnYKxrdH6T01MRtJwnFy0MvAQFiNGHEy2vSzXdCIwJjKxJ7upJtgrsUTbRrjeX/jsPZeLPzyh7qLsUjyMowDh/9v8cVY/pVrG9+M5V+dPQRMBGcIf/3r0VdjkQzNKOT9wF8bCwryrMxAlExXcXT6gwgpGF3LqtpbZwb3r5sz/YwojLadyZpxnhWGrd6OwuiW5+eiHb3N6zeHb1wPdvSknPiCFBdmN/Rwxi7S52RqvTg/Cwc1hyQSO20TDB9+sHnt7c1b52ibAGawUMkElmdrctE7y71yHKDEGLJ5CuEQyJShU7G7cM039AgdnH7ghNPw4W3fzs0Mo2rE26fw0m6d4kdlWfDYDUvg+B+VQjAMSFBOm112GNCEAuGejL0npIjYg0JKME4UVIKeY2IBeS36KOgqbh2osYEYtnK+7humHXOsx+yE7I9LDb8xbh1ohFgLV+sYCnVg/V5tBzWJbFP4M3gqRE9kDcseeCRoBbEOLrCIkhmdEpBzhTGJQcKyfKGbf7UR67q80t3kSsH8zAuS2kZT62fLIP69my6OcQJf0Ix+fqWWPeMjQ4hxl5Kq8bwVClaHFMFUMEbYTCKuR4k4kcVG/u5XOnL7ZEcSttF4AOno0aGDEmnyz9v6+ZQm6zRnkQ6vUbXws4WKrS10AtZ9m+1jvNR5R3SLf6zxjHAfv4xD2+E7+NhnE3/WsmLnCPzVKTko/B+DbH+jXSMcDdo0yPCBX9ldoU6WHu919Hx7PYd7YWhFPr03fIyBdMusJ7d/O2mzZy7/CnFRpd1+7Z6nlZwwRM1aB3bHZxP2MHhxJZdUyC/Og6vP85MQuXntKKxGvm7JjbfnV9EwuXxqY+3trW8ubN16bfPMyuDs7c1L17ffgmvUWSeZ5VDz/CfzKqUV0y+MascPsqHlmiZ3fVZwGsX+7UOw3zsDd+hwz/fep4N3Tm29/g4GFIRec/+bkUZmStPM/KaYHErbnElNzo+uP45aWWzwJT1/ZL55/7vB44vWo4EScCT9rxInBZuYpMbBQF4ODRIhH1lMxRIUuTlbxWFV0k5mErm7/+Odo3jt4Vijbc+uvnp78ODC9uVHbJRmSMCo+LewxFgWSemV0nM04883k1ZS9gqTgtKNDhwzno3tL950A0OP0NrqUeBIC+OJIkgWR8mZUGJnEKW9tnWwyBM5ZC290fBs4+kFTkXWKuiAMD2YtOCS7HyQtYkAihH0uCRvFRDzv2m8LBjHpm0aw0gI1PapyolufxxZJDnxdW0133Yv/c066B6IfAq2BDn3Xz41XL05+IFzth3KwBoqFsoMgzGW4okyDSidWYykQVYEQ6kP5YlkHUr4Uz9QhHgHUrkVL8Q8VjI4IlO3iPNeDN86TSK80ytodhatDC4kek8toS12JNV8WUycG3+zjtNN3Uz9xFbwWMa1I5/f81Fcwp/R4Mj8c6+CVEwE5L3X+IXshifdzBk+vIIkye7+haPXw8HVv1uvDS68Njj/xAczQbrqChJfB2tIfMPRKE0JPhwlgftwlEgg4SiFPggy7jCwBaH5QVYBtOuAwf3vMdIq/E5CbhVK63mqYmcijVXg/vYO886CzX2Ur6pUytMuiAAULPK1+K/JM6kiTBcATrrLWRsPkeAUZPPzH0A4rj3a/uQ9j8YCRuj9yU/Z1o0IEAquzyl9wLPhAzSzSvDQABNK9x2Iwm860PN4ehMcqZ2aQKe7aZA86RoxGzSH1xSibVhNoMIJmoFRrJDttcVYAMWOjrNtvBeObu4cmeTTdwfPvtlc/3Kwfku1M1GK1KUnK3PxRVHBtXAWyItdeg6O6DrdxKvFrIUHXwet7fDa2vDj+2o7gEBvOqKuPalrEkpwTIdvQlRFC3GCaCpINsqBg63TnW1Tb5daM3HqRqL/I7ToJrbnrC3Hp+FJp4PvdzK5as0tYx/taB15y8gaM3RSjxYjOLMMb5x2HJMpo2ZMpPAnUffW+NgbubEUpqXbQ92MQT9w0d7DkfTtw61nkNQlJTLRy1ax7qRWrUqNteAkOjDQf7K3X2LiGq+VVBuJHvIqSJXIjipE1Ecg7nYp+43ctyJ7rMA2wjoufhJZq3I2lIWTSkIrBUNRNYmgCoRUdW8Ax1jvj+O9R6BnXlz5+6rziOsmUE5V5xFELv4YpJAd4zZCJN0Df2W2BpJunognIXjzsdPRxtoFyUWa0NoD3Zw61pglyp3oTMzxjll4oYNVqS4g6C1J5IPHq0SOMXVnEnHghifj9GEQxtDbqOfe0aNDvENocAngDM6ooINxKj7sSIaSZ29tX/p4cG+Nk5SkcDaJuWT+nOOEC1LaWzQpFuit+7HUAOQYYBPYbNBFcw5B/vlXjuGt159SCHInnKSEpWQhwufLU/QCozNpYApuAUqCxTGE/EEBNsrwo/sQOkjOCqSkcik5CseOHXOpypfALrJcqI1YLklHNEw1ZRwJwauo/jiCMZNmu9dulOrdrjVx+NATGscXK4GFnJfE0FRIx9nobSzKbFEqNGd461L/u86GLimDaME+1wdXI4CvAY5dN0xN6qtgdkRtNXyK7bgmfn80qoi8sqGWw/wv2hUhdhU1PLwwo6p+QEUDqTKEUDXGA8dpviZ4ryYQL4cc7KMxFI6fYGRmcrgBqHK6YUeNDhqdu3h62F+fIe2NjOuRN07lje+vuIKcQh8+eEz9bFpe94nDRtf5TBXY29hhBHUT8bWQuAFcBXVnh6T2ucwBWs1iFci7ffjJTTeEqI9NFWibOuRfBr8T/eUrAeNmwISjhZbFBDQyMjr8uoP0N5I/FNo7i2wjroPWB37QRBe6B+8SnZGZRVdFppEx4yhVOu0sK9IcPVGPU6hkPUTbevylE+LjZEYIjXOwTCugwRVTBh47kXfXSpiKydPxsJTTICWVQY3kVDnU6HY0m5GMnhL1BSOZjqba45M8+bu68xP3+csY6Kt0mP8UH5/gr1xKfHiCv4Gh30z+vvFnDap74GH7yx2OURw1nqMA5/gHNNyBX9rzFDIRZ5wsa/pddrdc7D8E+bPGkRyxHc7eHj56snnzk8H6m7KaEUJ1kJIX4WLZf7UHcBuNS5BMuHKI54EewtBxTuTA4PvxDi28Tm+f/IYD32Q53Wr012PhTa+poZMNFto4IMVW5nE58sbg4ukAJsaw+4ulE19ZO2kcz/IUhcrtHG6M9A45kd7xMSw31i4Ont0ZXr7JYSyT1ny3kzljaXExmcc54VayKcETVKUEivJsMKtocsfHY6kTbgcfadvRLDaDMGaDr26qx0qeZ7N5b9Y6BhGi9cIlUHDC/acANoxh5mB1F1NgQxfcXHA0hJmtuA9l1kgP4rLJNwPexRJ7Dk9i4F/yFcfmcaqHrLvB5ysbT87C0Or0umjcOUu1RSFeuLGWeCm2kFLF2Gz0o8wajjja1HCUeqknLyGa+GY1NaKsJyPqBLlPRtTn6Y2wMpD6ROpS9ldHVCYMfIRLY5DaEvsIOt/VBiWm1EY9BKU21tHFVkgioY3qH62H0RRaH6qM6gsdzR0IfZT5mhUy/6Rq8EYq97BdrZod14IuVVN3xaBqbHfkcAfS1q+/UlM19xE5zND2W9xTm1fecGPDGZ3aWVqzMpu3NYuGH3eYja5Hx3tdUx10pdHKzHsUDa5m+e+5JVdtHUaMMjvEbH8sBR1Sz3d1nAVjrG6AMZAamYHYoxhVI+c+5N6pnyeuw8N58ntlvQg5L1g6vhKybcZPOHh+7yF2jGrCCszsx7D6O/W4ovgipbdvLVVpybHqI1QdVsTbZtEmCaS5F+NW6FSmZDiGd5Sd9cLLyGLxlkc5HIyqwLnZg1XERSTYxSuPBftO8sKM91FtI5NTZ+ZU5sg+h2udgzOA/bYBScL8YKkJmEIVNxFTGnSLp4MDKoqfIh9ztJfH53mwRW7Q/JWzVInVv3M2b8nD8W+D3IWjfaIRA61dru6BAwIxc+Avje0L6b2badvNJjkNxjTzMCeX/FW9D94crF/a+OEqnm44cEjWkXBy8PSIuRhu4IpdofHFfcXLfWr2TrpYxMytLklcXoe2dfEmhebtFF36up1I9nR86oVYxW6glDF6FL+Bzkw2yxfyQM4eo4uwc5JocXP988GpM5RosZPCt5L3EQk1vAI+JRGI0isx73vS1+Lv0k4wdnLS6c113KKszOgKpEM4BMZ2q/HjuR5K19vY6veeDh5/Mfj8yvDqI/c4321lRwmig7vmilfMN8F26S8v1JeTBIUocojJ3jEBpF79d/Jbr/0fhCVQmKpoeO7e8IMHeus/6Sacj7ss4E9/0R9w+JI/wSixkInp38UvqeEg/GFSdHw4BgwTiqEH4DzFzeQFm6cKNnPPXod9++/vaKoqweBOlUfpVn6WI5o2Z7lHDP+5Icxt1s1O6tdymiyBrgZy4Od799yKhPdY+Gufx1Ne1ECqZylB1eHYPX4m0ou87f6jWaeFu4086TidavO1yJ7i8No67Sa2OkkxM9907VOy80ymVDwf9XkSDPGi8Si5OZXqQsBtZcaJ3lkOeX+a7Qn+pm2cEZAmcEfoctjunTECf4Suz3h6HFYtYCFj+HAvsCD7KowCc95+76vt1+7peXvuJm7azBw5c3e8pxlTItAixFSsAEUZBBwT/KdZZpDM3Q18Sd0CqXrdqnTeSYoZw9/29YeDC98N376tLKbtAno9a0lKl64wGAMXMa7FC5A0yUu3wmR1aiqXlZlJyHZmInqQkKcJYf3bJvYBlEL+wsKjMsgAIa26OqZufW7iW5GbY5fuvzuzGoZomz6ioy4mUPdGehxPzcOdv89Vf6VdkFx4zHb3MI+rNbCwBh/f3rz01dZ391FndHsFxXnnP40GRIRiIgBWffSgis8ZP+kMyqdSmhCCLIeBWy58t/FsWUU4RNxwar1JYtxDiCjXN7idvXIUJOYsqBfw3YBpOLj6aOud1zevfrj1xZsGLwDzfqALyXyzSFvgAUZNdUMzOTl1vyjpSLfuf7J94sr2p+9u3XoT7cLEMUhk5BOxkOQ5v/AefwZ8L9DqN2rAiXGYwH+RNjqFDwOC3ZMdR+uyRQs7ycUBkUFeuzdYvbh56Rs4SMCMHCgDGksz+meHvToY28RDC6HBWp31sdoUefDgpJFRNKb5T2qQxcXflN1k/l+oZ9GdpWwsuv/7TaNsdBtJY77xLz5WzFn5nKLFKDHG0fFPaQhNLRKDBq0h32pLKDE2RgAF2K/+w6va0HeP4fFS3L7PljevryoeECCUUAoKN6mCFP1lt+jmlkSM4SfL1IbwObYg/tHjM4T+Nxjlot1zQg+VK2W9W8Pjros5zS3qJUk1df369qdvArjrIGzIElfMCCIoaA+4VUWB8TA8OjdutVytBhTFzF/6pha8Hrkc5dPl1wSTrQjcnKCAI7oaCMz3XRjvxnD35vY4Y1sM7Vrrd7ztW7F7vbG6g6UqVuqezMeKoTfWzAtNvFH23QR2WWCThabUOEMqMKJqjB1v6tC4BKOC7ko7m8eNTmdVbN1ftZaPWj11lsmkdgnbJHs1FYyeH6vlVcMHynkS1ez/mJb6rKi3PSi3SLEZzVOvdiJlI12p/7VaQKNpkeSItAGH11q/ZD6v+5OldiCyVVCTZOZ/fxohWd1pqpRR8SmDAqG839nNJC448COLWQicyX4x0pmswvmBX9j9odR7fIDbmw7s5eywpF90ohjCYqEv6plzG2tvQ6bhb09zfKYkXXTkMA+dBkhn0FfQTZTeLDpTMSLdqDdFVS/VcyFxnEwsyt6q9wWG1+pNqcaL36kbvKhb6o5E7lZBC+p6AuP9u/tbz74jVxNM7VXkmL27m86ZQIQOnqDEqPXIlZifXEaUPhWLCdOnupKglEpFGNrGB8CYIL4BefkpvgiAjw4IvDnuG0mPrTMhTawfuoEsJkQ0Z9UeM690seZZSHMzhuwpKVwaxu7Vg9Kgb4MrHwbYxmgw3PugSKa0ICwSFaZhkYLC/LlsiOlzMBgGyAmOjqpMYbXuTObwFIsPXJrkMMCzQn5BeigQFVphxYc0MHyE8Qyo1GpJNWUYd79qdWum6g7+WzWVjWZv4MTl1NrYqhrPHsODvx5PJUal1OHHDoGVVp6sV+2gino1HmDsKsinKbW9Gr73GSmifo1mTk1ZNaWE57w71xa9IGmTm4t4fM5VCjCj+lDYympNrJivGZ2VkflhiE3Huh5DAyXEI/InHZDjarafwWhh5PC3fyuqXSzJsv7to4F7IUuza1+qY2FcFTwBax6vqYgtrkZGR4MsRo9xR8dk0IoGdVHmYV1VZu3kiFXfoXL16lRVqNGcRlvWqbTJFFqszGLVMpJ3i2C/jyTXRPTt0fTTk3w/taCJJsnIipe25iPJpzTHpj/ga86TtbjfVc+QPSsvY5lQ5L+GJ8f2E26l8NDYfmCM7t8FqVtHHhd7agpGKhU78HNZCSjK33Da39JNkD92816CMWz/0y1k+l9SpSAq2FKSL2Lv/fJvXjqWQgzf/xNW+z9fGn741sbjVfvtL8JvqW5S8iv2y5+bL4UxXcoga06F/Ee0jJLW9M2mLUNSZtHZ7QCy0MuL32IbuXHSbfY6XQf820YLhMKR1v8/8CKA3EQ/0AXgOmagwEvKLQXzICHqC2TGxytVAwAl+frV";
\ No newline at end of file
+export const w="eNq8fVlzG0eW7l9B+GHGN7snRtTiZd6wEjtAAFwnJhQFoAgUCaBILKTIGxMhtZeW7ZYs2/IutyUvLam1WLZst0TZ1gPk0B8hSOpf3FxPniwUuIm+EYZFJCq/PLmd81XmyZP/+7//+3//64VO12lNtpy1lrP0wp//94WW5cy33ErAaQZa9gv/9cLY8Rf+DIkdt9FgicdYYsfxPPrqGE7tuO2u23FX6A+vsB88D59CaRzzJM/teeoETux1acpxluLKp7pSRpTmrjH5xrTQrCwkFysJSmZ4ugCGBEAM5QXaPLbdjnVbdqVi0Z8yeZLNk+NFMpcnBWuajBXJbJ6UStOkME0smjAxTTIFUp4sxWensnPxNP3/ZKkwESOzM/lsaT5CpnIxEs1PZZNhUo2QiUyMlKYj6eUQKUdIMRUjVnoqm0pGwzOl/FQ4lgvFI1Y+l4wGc6noeo7EQuFgbCpEIrNh+v9YKDgeDoVyqWQoGq9EyDhNoCmxFH2Mit9pu92K1e52nOoLf/6f/3mhbdXsNq1KoOeuBHo2rU7/h149UGv1f+gE+rfpn0/fX6WpOz9ef3b23OYvn22df49+bdsrTsOuBhoNZzWQYAkKxwqs0e797z//zwt2Tya17U7AXrGrDPzhfMB9cs5ZCPx+6wzFL9O0zUefbG588+zao8HjN+jXqq3A7XKg2+k1MbrdWw6sWXWO37BX+tdE//ZvBtz+1y3Wv/0b7UCrf5uC36wG+nfq64H+Q1HKo83H1wa/fTw4+8vmgwu8IIre7rJi3G6g67Z4Qc68KiRAU1g5bTnSWHLT7gb6/6zQGrKiaCm1Fq3NGVWbwNNLDIUWtP35A1GjzV+v0hRREi3GXqHAPToezbJ4QVb/uppTTTrWaAlPKCwvpvX0YpOW9fuFOksfPH6NFrH16NrgDdZidqVlV0W+etdhvWWtKyA2aE1s3EjQLkpEI6/VMOrfc6c8tUbjQ1QZxoeoLxodEhEGh0px23ZvwgNbo7Wl/2DgrdfuY2DWXy3LxKZITm+ZgzeppmjagaZSOnaDDWyKF9DDo2U3A0/OsQpTYNEIm49ubz76iDVoMyDKWbPrXa40+nfEOLvDVRAvwwT3A/ag+kMK7YmklrhqlJlSi/GlJeaDixbYcqTEYmh1HJgZWmIPsBcUI/pjgfJmaByGydtxmzCwKFIA9yRrC9mNv16VQ+TRbdGTFF2LbbNnAEnqcFaMTuv077c8AwXBm9i+oFL8Fm5sGyTnzQzQspE5KhoQbHoMDwWlHzwDwRwEbAR0pFx1hNPo39yz93WNdf+LCqv+NzpstIgH7nuA2uiavS4Nay/q0+ueHvfpbjZvXQmt+xpj+uAhsGEUKu5//zc1b9W2O203lprWGduwb9j2gM3RhgzZGCFK0+n279Tsxkht6VA7xdRrQGkkqYoOq20PmK99qFxK6/iNCavpM9IGlz7GIw3GRsCtYtVwxFP1oG14tJXCcM8xJNF47FhlxqJFnzEWZncoOep12y5l1y/8H9mXL3I9T0uZoU8o7o1+lfXmuVsOJwL6x1rLYRKU6M/1jtOosRF/7Pjx/3phsWItUSFWGW21unaT/StznT4tc3VP00dPv8Sovh/5d51KxVlRbIJSes7+dSrlCZTOC/bPuAhPpCUB+YdEL/2HHxDZhzTN7HVZDNOA5Mzdy8jnZpKVXJaEC6SanEn8KUKa9L9pMj1NThRJI0LKM7Nxazo+Vy3Pjc8ea+bIWIJkYvns7Mx0IT8VzTo5ciZBrDiZmJmejNRyZCVBZuOkGM5NZSmNzpcy+ancVCgbzQdT8WgwHY9WK0FKtGORUHQpQ8Kx0FR4PBSJl0KxeDTEfomG6f/SKT8GTolr/7psSUn7OI1QmoqS1i8+E43QlY9Jltfq3zd6hg9YhGbxZ646LTVzBo9/EjMHYUk6gqAU7XOqVq/Ttpck8etvzAd+v9CrG68FW1cu7Hz3I9A+W2XRzA9QEPeDNC+l1mWYhFoUgwk1lOTh1Aa0ItZu1VGDyu06/I1CvCLcoA/RV51rdWqGnnwwL6f0tbuDBw+effF3/o5QaYlWWaOWgk1uDbVGgTzoPbfbiRo9qDUF7UXRSBqzaQmFgTApgLBAbT0P9t/8Clg3P6Cg5oc0Rb41tkG9BTpQb0A32DcGA/6NtABm33YjoIsyCfjGm7IuiIPrtpeDFCsXsxxZiC+6B3ckqGbiWHzMxAz5NRUD2RUbgzKAQd/0SA4lDI98POIl4mg4g5JT+4kqA1ZYtISn5eWw5K0CLST6uUkbRldBWWbcTMOliaL8ivCA74aL6DnuadH2gC0aXcCK5u4oUGxRvA0tBojRg5Kg66H3kbQ/SjMaFkry9KMeG/ZRjgydWfJ1l5IoCd/VZB1BKqou5zpQdUDmCmodQDyoHNILh7H8cUaxdWS99mG7TLtlmhYsFoiE7Aa2FR4tjq0DWASstw2VbarUkcXqrPrZg+ZsGTmPSIX8EXPZkG9Uxfxm7dHNgCMZpz4UXuL7kHhV8otserFiiiaN17/LJjCJvP6ZknIhTBiT+VfHRpF5lZPTeVmN0/TxkYTebpQd+vJK38YZhfmvF46d4ppRJXb4sj1fD1+xe40GJYTWgsu4+An2HKVMKmHsBM5IE17i6/fy15eHePlideJMqbA2kQznVxLRSL6Y6zpOr54rZlsz5GSRdJbGioyil0uFap6to/dSZDxFKnmSTuaI4PHFuRnK4CeLqcZitZlqVJMLpcJiMlHP9ZxuIufQrGkKHa7nUuVXJ0muQF5JkniKZAukECNOhOEtz5BCpkCas5PF1sxamMyMk6Y1WSzO0RJbM+2piRixgqQSJL0kWYyT2fYMKZZq5cIkzTRJvxQoQLlIv4TXCmlyhhL8FVp2PRkuTBFK/xPj0cg8lcHONRvZ8OJCNFLPsVX4UDC/Pk7G46HgfDoRoZ9oZSKbHI/HgvQT8nkzYAvcd3iXmKz1dn2dzoQ1qhmvtXzo6693Nx99++yz34DEsh6qyg4XLJam9O/oIaBW00Vh1ND5leRBp1/pcFu3KIft/HvXMUElh6XmvOqs9Kogf//OWsDpXxMbDEjs7Y/e2zp7FgRu9Oa75Z5bBdJNcSgKEG4FyyXVmLZY8Nd4fLEf43UcjSZl5LsIK257qambmQp3sxV48vki2zugmOw9bOe1Xwfvfrf54MLW38/Rr2sNe9FptHqoRa2yQMEtqpC5pBrW6V/tyn0JgTv45p9iUwJwO05AtaoCVm8GVr1hd+gkt9SrwW3WQ1fpywbesLl7d/BoQ78adJyVqoVX5BckBl6TB+ChFzMownwxE6UYL2aiIO9WxwICVq9l1ADD2yVtm9sNNipuNwNu/+oaENRvBu/9uvOPc/LVqWU1m+INhA4+txZo/ruoTMumatGoSsWZdzodqzG8b4OL8uzb8NJwbdoc11sZUZpZlZZVllV5eonOGoq+gCuydeer7X+cg4qwp72VcMpOnXY0qgUd5mWHJaEdNI2ud9AEONpB6yostIUGSUhsm77HMQOGxj6XmW3/0WLMSUqFf/bXCzBJdVY1BVCKnAIoic8ADN568nldo/523oDkExXlVgrFafevdaiRt1umwKwPe0/fXxsWmTbJ1pW3QOq1tiXzK93i0BSRoNQLKoRLTfUKFEJVImMx25+9LrE/+c5AFRoGMKXctCZ2k+oDi6kDHzWj2kLoAt4WQhF41cuwcvGqltFQHaxOlGRUorqYIvT9fYkvXjy9TKt6le/D9a+uBp7cYvT72ec3Nh+8s3Xl88GDvzGe1XKsNlVQAXvJrXOFIrlC/xq3/rwdFSDgAO9iKFIvqfxMBJS57dScMzasfTjLbOl+zVj7+P4vtAtAwTHVYGxICwC86sQTGE2Ve9EclXWs0gKI6XJwqQkU35VFsAklKK+ENBSB1XYbbMQiyZ9eWjZUwfd/2Xz4d1AFNXtYFVg1t21oMwk6vF4m4T3LZbwErMdkIYYWY2WYOowyjw5jG81etwOk+Q4dH2IpS84ttg3dVXX527nBF5+x2XUWdn45xlqjQV+uerIrFHDD7nXMslB36IJ8+oOX4+kPCYH7QyYZi39tZ95meo/PQatt1+Ry/pNzbCxd4uP8Rs23dre/Gnx0ZevzH3EF2zaHMysoE3UFqeqWaUh3i72D3u8X1pDyHrxxfvOXT7D7g8yIdbdKMkdazW5YbB1CrePV5BZF/7Yx4AYPHww23oQBZ1ccd8FuG8t4dkfBoWW8dadhzwv5fUzoGTYja56RN3jjx2e3PsEjb21piY65oeGnCzQXamlt2rQgq+NUeIMKr47+1SXGmeqitA3eN2c/HNy9/+zK2a2PuaG2qKi0iKrNTAN35bCZxF5fDkhkA687BG0OOlGEOehUQbwuYtThgmTXdJ2OzQmpXbWqjjIm1+pQoYdrgV7//hqq0M73t7bffggVsrsSxKyUxajrkIOKoMND2gGYMaexzB/moeoowZAp56Qkmf5f7oRxkuzVE6hE/1UbeHU42HuD8cpgEHspOzVnQlJqyRCLBwrvZdkHpNgGufYQYEx5geYCu8WM1ks3TYIJpFKTV80gpSbkFA8zO2B0fJ9Z0DbE4DzMyqRVwKgwnTK4lJfjIAoFjAlTGsxnzBbH7Q3NjFoV/wmEwMaEAMgA7xbawYwOsLbXRMASVhezALDPYJPBFhvmUuYRjwsjqAyfYYQM4wPGBgwMMizYoAybEGwxwFAg9S06rvMfNld8pr4GNa0VNNaSoB257mCm+On7rM23Xru+de6SVEtKF8l2c1b6G1WsBmDaq6mupvfwOpe74nRbvYVyrxhgr81uveF0rXHvolf/Tjjw5Nx8/2E9TIfP8tPLs0y7/H7L2MDe+e7C4N33dq7/Y+ve5Z3v7my98+XOp58Zi18dapNrTrtE1Y7TrYhi8dLXK6OWvmTG7unTOmfn9Ctju+9l0xFl03lILaBFlcB/vXBSbWejH9iO9gnpzwqpbkPsar8y5vkBbWu/zFfA6C+O+KmBHFZ1Kt/aHhvzlssXzQxo3+3tidUIScy9miavhImVKE3EZ4qZ+Gw8lxovTdgTpJkjpVQus5gjuczkRG4yY00QJ8e2s/OTkWJmdoLUcmw7u5BNTWZioWQ4VcxNhmPZUHIyk0uFs8G4TXHnopHZmWAsFB4PhkOx8Qj9RENsGYt+jyX9nUnZOOFaUW5k61UD9m4GepS+j4lRzhYK5F6222WNQyduhw5BvZut8NyRClmgiL08E0Ru5vE9BdS1zZ7cWligGqjHsu1cuLR18YbcWuBPykfVBoM5YvxA9wuJdtuN0SbNuEpRrpYK0VjY4dDovUdho7UdDY3eIfQ4Bp9LwEdsUeCjJReFbzpdYjTY97VQut76ZbuPqCy2W8YsgIN9JQd3XxMF01IHl97D28CsXCeg5QAPSj2fxMwUIuhZqRzyoGRdnGxEVcqu4Hpf2KgcY1lTwsWI1ch58nktYIyBwaWPaWW2H30Kg8GnMtztKCJ9qTyaxixS++7plhRrcKIunMEZwF5U72ax1jJDfaRJMHSMfu3C8oPjliF7x68IX3gP9m7AxgYx7gq5AzvcA6OavwPFmMrar9mHBpE5gPiWMZ7fHvUvd42Hu5F7pnl6ko4Y3JnDA6XqsSNHN04QKOwda3UU9Z3FnmnrlVi4thiy+gIPgWLE0XAjtpDBBu1uMbzWwker71OnD+lzs44jUTBA+3kyI111+LHmN9CQ7vgD5rMp68iajpirR1tTD+5RDFA/908JW/DxAFUlvijkp4WVPF6g+gnZNh5HUP07fb9WUhUwj3555BYyZOZ7yFCl0y/vQqU79K2m1usYlFikeOmwTRkCS0dcWCVpIiwz+xLeZCQxF0lYp4qkGCYTYRKfGY+TTIjEZzPp+KtJMluaiJHVEEnHcpnZKTdFjmXIZC6aya9lSCdEmilSmjmTIZFUjCyHyGqGLKYII7+pZDhXTOcmO/TxUCYbzCVz2WAqaM3NF0kmPTsTDlopEp2kBLgYmk2R8fHoYobM0LyUBkdH02DNgnvm7tyNWoC+jOnNuQf/3HxwVpPYeTdAX7KdJU4nXbG+EFCE84BMWObWHLjb4X1j7VcmpuRoFp6HH42rtGzRvYgDK9BRMiEQIReGUW6m4uv+tzIVIlrql4horV+kgIMjwBoOjvJ1RJ8tEsAG0dVIiuVabUeOe+mZhmpOgXSHsGMZHJH77sgRD66Lcq5Ix0UQEHFUUW19fEhIB36LEhC5LaoJaTimaWjwSpPI+vCIQJZUoH8HJjZCHd4JxjvAypPeF8jLO+VM99ba6Gy9xi+HjzQfDjTbUaIZrodQ+z27t6P719O9CsTTuWbHyiNBan5gTamcDYd6VL5teHtBvGuM7ldp5/ylPETXKiDzXJArZob2M9SAys9QTjnwM1S43Hgq6bpqnQ3QvEgYxg/iCNih0KCmpttbzxk6DuuiUVl1PvXggTIpNXA0U/Xo5hSSZ1QlhmfP0QzK5x08PsyN16k4TNtEXV9kA50VkDQpm/pV1tjka+pHfgSHyWAseb40kqqJfPLoDpf99Eu7L3h2nGanRemJXO48cUoMWJ3MFjuPs1Sr4rSsCu1o8eTLJ4009thLLMlVSfypU0aSOMgjk7qUbdgt8Rj3FdRpImIAT2v0Kk7dXhGPvXwcJ/GnXmJJDWfFbbrdniUeO2Gm8eeOHzcrBv6IUjZFPl39/fgYFkoGBVCls+dxKTwSgJea5kpkofRStkSc0svxYPEk/ZyKBwvH6efE2urEMfoZm5meaGSZK+JYmnk0LmbJ9EQ3xrwSx4oseS3MvBInsr1ut5Nd6WVWOtleppuMpJfppx0LpdxMMpKankg248EW5ZyJxVCsRBKNl2nhcYcVHl/IJcZr9FOfnojZ9DNPc1RyiWg1HoxY9FPOJcKz9DNnT4Sm6WeGCjb20oITjAdffikZOXUyGTlxfGZ67NgcfWpuNp9IRnqZCBUnnGovR8NpN5uJNPO5xmJwqUgWnHQqGl4Mzdvp1Hg4kyxb9N/oYmxm2irFJ/2CDLhVq9W2uw1LUOIntxb4hKyy3QNqQ5wGHMzcurKxffmnwbvvbf10Tp7QdLsqc4vvvGkwSURRivsc6IJXITBJq1iKU7Xais4vB8RhxKtMcw0+vbH92p2tD7+WWPxBJSb/goTk3919gmhx+Fd1SNyuWXa7zE4Ka3Fu1imHbwigwaXz2/94RP+uV7q9hjgERnWWxfNIWRDIfiCEJACi3yk6WodoYR52eOuXBdazs18O3v1ETkz9uFw0MVTTMOhBIPXKOlZsYuWbb7JQbSlfMp58wP08+nfYBrHhKbHz6z8G564MLj6C5e/FtrU07J5Toamm5yQU4d2ER4V5XCd5WdhVQpVl7L6LokzvArbZ3KbqUb4zMbcV9lpjvDRtffnt1tdn4aVpsWLX2bkwWYGOs2LsDrhdkYJDdWhY5GnIUZGzyqrN8+FQHQLJcOugGrf/FTMPcvqzU2w36GsYnaqsTx+c3/rqHp2b9G+mm+vc3EjN3b+mDBJ/9wIkPjhu9s4YQHf+AUAdQJJvnhqr8VxCuQCkxiwAufvFkS/pgKT2F1oO7VpXzib2qkq74OmlBu0AHpJgcPEv25fe3HzMTqMsubSctmMtye2ntt1oWF0lEyAdCEeqHIGkprnd6N/vWDW5pcedVhzpKdX/ge/F//Bw68sfty+z1TpKrm2qeOWmnvymaLT86howAKCfF2LIL7ppGi4Xw+6o/Ew3cKdPp3+zKXG+/3XryltbP7CDQrbK0u25Ki6KSmo5HQMWQQIQgsBZ5fBhDhUNFgtBbCdeW1J7WuyEOPdp//yTwaX3tj56yOti19mmF521dlesl6j8ssPUV/fgaFI9SwBktGhH2hVLSXizyT2OmC/nxzdoDaWt4Q9VkG2VuZDZkinufmC01ZK51DBy7Pa8nGlMIz45x/1omRI8zzDsRWpcxPxqsSfV3OLZ3N1zydnE88niKJtbEqU5Yt9io8E9VC7u/HqXv284XTWZu/1riqVCTnfXjDB7VVbYHnTV/rKzzrOi5bXBnUsUApbXRB9yJVe1e3pjWWBoBMgJeaQ6E7mkKqOMtX/HloORj5xGgDUYE/23N2lzcVccwaktSXH7dyTpNhDcvQFk9QFC9XCbGibUwwrl1proMYojqs4e40LwDEoA/gU6WsxDmkvMQ/abLJY/d9giKZfv34fXiIOUi3Kq3l5xuvL1w3Io1+1vVIUr0Y017kRaCyDEzQefDf71LeCu0ed7VeaoCiA0dZ3CYET2hBBSFzVKUg0kBcZgjRGxUYDqHp41G4zZILr7o7mI4prUdB/EFJHSIfJ4AOrooY0eQmdQOKBtmq1pkiYzcvpj8CfgTWy9oWIvcVforuZKJrPhQwjoA3CHhqXYAyYzJgHZJ/3A1AOzhX1xhUW2IKFIgsEQ9jDr+o/DGV5sJg9sJLWB9Fi1fdg0w55pq7SrTVL2CEzKbgbFMCZgBbhk4mGt/ZXmN5T2niobq2ut9UbrPKVnwd3zvlJRvqqn4ZRBh2k96dFce+otQ2cNr8F1ACrIfLfbdsm7HPf08lr/Yb3IG6F/e8L0QbyzdeU7WajhesiAtBYO4jW4UyPdDmkm6XMopD19ai+Xwy6dYMyZXiysnQKPQ0hvKEfEjgOJbgPFz1SJQxE01Q84XqZKM0PoqGTtZqgThjddZwqV5Nx0sjo7aSUmKsXyiRCZKpL47NQk/f9cNl8g62FyqkDmghOkEyOvRngInXw2HSZTU4VoNpombowkw2RiqpSNNGPkRITEw6SYS01l0ykRRCc9Fcrmc8FULphPZxKRarIcioSLZC42GwzHQsHweCgWKYWiiQL3PKTfY+MjPA/pJC5bTCN3elKFMq/3+jrzwVcRLDe2v/1i+7PXxQtxh3txNHp0mtd4OBCuV1t2j8K49ZYdcIRuBGS+p3FGmHamFz+6snXuzjCQB4Uq3J4H6PlE7PATBXIsHF5GA8ZHyP0jCecXPMA9tXX3iWU4R6KJIczqutOyBaBc9VCtZwQpZe2nz7xicOQdCdho/UbDw56xKgCvD/EC9EkaXIDpHglzGHtHokKwbySUhENHfiQro7Z/m049YJQHnopIXXiLUbvLwwV40HdHRh6QuAqwxIXroE7SKvn5ytaQ8No70SO9HjfsNPc1tqIGO0FmERh/D2yfwJXMEwm1k4h5wfcscVvpbUvVXChCijF0lXeTtzq4GG9PGIMWgmrsCmvuVDeofsHouCNwJ8ge6NgePeURFjWIZ9yYY0aEyTFnrmGJlNPj0Q4W6w8bKoDs2c5W8ue9Y8MzLkYMCr6nqKDVpjbG9OBhsNFAI7e2n8tQHYEdORIDsj8Qz0BuP1fu1nPlRnrmj5jxh5Lp8Jm9M+IQCHiw+jlBip9iPj6QMtOLbJ7RJpvzOEDCz1Kpefwf4We2Mw7yGDF0To52gJS5xb66rs3pk7t6QNoVOvzbNcug6pA4HO1S/mBEu5RpmqprBF9eXkgn4ykyXf1Tku0apyIJK1pezpLE9GySsvNTUTJD/50bz09lK5SZJyC4ZfZPeVJISm7OA1zmk4Kbh3mAy2xyOMBlIZhPRdL5oAhfE7YmY0kyx7n5lOTmsWgBAlzGQr4BLtu0OvWW9LiVQeZ5pAK2NITY2+Dd73bufqPZG51FNc/BFrvitjznWlgkLgWPdq+gAKd/o4xPW/NCdr66hfawoCC0iwUlGftY/a+rDhsZcjOErQktB57cYhaSLZ89vVijpnAdTtttvfbG5sN3th6f3Xr9y+0vzoqTd3a11xUgclMCviN3I1EMP2L4AcdlaOduUhyMgDOrpeCqVXPaZVesigqj5YhNMmmx7n1F/5PmarFl1eVCOHeGd9Ro1Nux+5bEg9CAMJZqgEva7pwRDYV5+72vKJ7eq+RS4V6XEEYMSzXzgK4rYMzXObDezOXAnvCVGkcRdbfTcVjweHYC3QKirjqYBdjA4SV57w5+O68dNR1GA3huml2HmdSqQsaPN/C1/Iiki3ZBJH0kKg5eKZP0Yf2nF1kYN36ZABNekqKf3t26/TUTXB02QfgoTJwp9hD6bkNMtPcw1nDUSvWD4OHDbS33tFFbw4ETJLWOQ2cKjZIOhL4btMHE3f51Dc8JruxMeUSG96NXXGwRvK3rHRPmeOAEXDSuDFKpJh0EqfT0klln6QgM9R09AOwj636dU4emVJohOiyh2SN+nc15RmUd5EPBKQ+IOxp0VFB5sGjI0oBxwbYLm5JD63ZDsathIdsbGluMhyE9vK+8Si9ihXiAjF5ldICsQ7rhj5qvB2hDOqc6/2nMq4NXyMx5ZCPSNyAl/ynoF5BSZHqRi0pLHPcGpFS/S/3kDUipfqaUmFXOiC1/YpdwlCIfp9K8UU6f2IVEWxWn3a2wpYwqnMh/STqj4h8YwT4l09n6u2tTzuPU2ja/7On4Sc8v7PGxkxjGbVeduizgmN8vnMKf4GvlZb7xW1XOpzKB03a+ds/CWqywDR4swnGxjyOFZvtHbFNQ3oulf+jArVhGDWE9HyqhTkaZcsJFVlwm6aMK6L4XVKXc4olUq3hydZLMhEhhbGWSTNN/j6dOTqzTz7GZYv7MVCm/NlPMrVTS4Zw9Ver2zkyS7EqUhIKZdjA9TjKd1vSkW5spppdPplqTJ1JuOpxsBJtZkmzGookF+lmk+epBJ+5MkeJ4a4a0p8nEidTyNHGmSvSNxZ0mr04yF1j61hJNh0gnTcqpEGmnSbSSG4/MjUes6TyZnlx2l2rF8LLbmnTsUoj+O21PFYOpk6UTq0FyfCyWqh5bDwXXzlhz4yuxaLcQJbFop92shJfmi24rHos26CcSrY8Xpog1l4sn49FCMh4rR625kznSrKRn8sEWfQ/Kh9rjpOTzvsLbu3+TdotdhYABjEStig1yttH463vbl3/im8Duapd5gOi+bFnQZxykisIGeKEPBAx+bAZyA21o1nzca/H+PexrttgUgX1N9s1w96kN+9GOhMEOP+w78j9qtt154YkJ3qEshhvajx9cfEfsx7dt/bASTKcg4XSiewBILaROUz4kZ3oN6ZjEnR5UT2z9dE70RNOy29pny3babRZNX4rUsHpd4ZThn5lmaLd7Fe2jpfI3wNuhbVNiEbDOOEyhv9B/SKk6NYdLLBoNfavkaB/eG3z5cHD3rc1fLzIUlWfVZbvD9oL86i5QBA+qFxGjYSgpn4JCLr4tFo1LuojIlq7yyF/cN+AdWs1ntz4RUF3mf1avOXUBxb+6yi0EsDAQYCAAEKWL3NmsTsdquk45IFxTb/Nr3dj2/pMPxO77jze237q5fZlRKPUod2iwdD6Ms18QhCC7jOvn/k3D/qg4SGJBoypiIW2/dmdw5R5z9uEP0ZlM9XqdK/Y/myj9OwJmCJ5TDQUJeBpIqwSdp2EqGmn0nE7P9CpFrj63G/SFQATnZs4efIoP3v58696PIoZUYymALNBaPWAqOG1XfQqWp6eHS/IUYxbg1XRgoKXnSLndUy7nQkltNAK/XxChJTd2fr279bP0/xQPCicS8bf2j4XfUPahvFIS9XRDekS0HEu6F9LWLPPG5A6oXzx+9sVX3FejZYljvOIvpS1ERnePfMr/lf2tZmKzJ07/ipno9G+Iu6zOqKm48+PDrZ/Pi6nIVtiXZAY5HY38CFAE/6oLLAZz9mMKY2Kg7Eq5O/K7WNPB0uC9UiaR3isFCTxRb2U6Prwrk7yu9Kgcjyu9qDyOQqxLM26HQcgojiILCamiEN/kvl5MI4i7ntShsa3zl6hmGNx7Exi6tHd6X1naVRy2k83R4diJqAxP4E5eiFERVY73XIC0vvg+TItdX1YZMc/x7OZKRD6M/wajJr67+4eRQ1YBNZTKX5FEmquBrnLU3v7Lne03vuEZaGfMC8fi+4p0o6y75UOZGiiUNxWg2+GHuOmborNCbUiLvtVUxZTjW5lUET08E+AR30TgusH3H9LabD+6wwK/8Qh2LO+S22BryQHG9em0ZaAyljorwaUlNBrMS6pjV4dLV3GDcUkodjCUJcIHoyIgSq8qxQxTjl85uA9cjwf+u9lS48npX12X1drauMTMEB20b14Q1ZKWiBW3Sv9om28y2Ayh4lRVPAXg2qgidG04vI44LJBUEGcgwewwLn9JEkwOKMGnNyQlqLQsp8HegjUNhrcdgSDfskzc/ltK5P4PVTl2mbhsY2ldyDx4m5VBBd55/CmyPyyWfcIsgknttwhkcnlxcW4jIOg8s3RA6R9doayeWrpRxH6I1GMmvl8ejjn4MFneP1X20mTNcvfiuJjfmjR0nyQUEVDMGPfgi5orPifB89KvvciXSbyGyc+hqM8w7cF0ZXeyookKIhu7Uw3499CUwLDYI7Pa8Ds8CgbSaxLBDCLrpy2eWB90hKHZt31Cfx3Yugwpdz6cDQOCTccoc+FRq1x0r8bGutpXSZujTLSc0nCs5m9LxemrLP0WD6tuPmBLixIdCu95u8GQIwEWEZ7bGtZRWbyKKNTa5oOLwtgYS4hte5Wi/1tgTYHD4uHx0YuHq+7S6dPCTp0+vte59hVYMXwVzn6vqMXCV8DJVh2XtPQJczO9oRf6aDIPCCzf8bGvLqRjX12VaPjqqsQhX92y3RO/YGddSDS8dcXJAHHdJZaWYXkk0v68OmHYbyCS7IZJpRMmyWp9nCxlSWKSJKzZOP1/eXoyPluw4nOJeGF8ciJGmjMsnFIsnc/2QiSfnYpnC9FommRixJkhEzPZEgulVJth0ZSKzJ2X+fOmpc/AVDbP/XnDwUponDQK5HiJlK10jkRCZG42Ggovx8lUMBwKjUdKqfFoIRcLBTPBkRfUMysgOlWs0fieqpCnUPWx4hUzVmcHft41Pz5DvKIX10RYOBgt6pDVDR6u+So/a/TduWf//JsKDQdPgnMTHoFDiPtDG8aSO3K9ZXayV0U1XRMnZm5X5CkoCrR19cHW7WviIJQ4BqwFw2NdRj5DBfo3FlvWZzDDII0jO58MkJ4bXRgq7PhrXPPaSo4MUZ0EsumdC7MWe+cq/I6+KlCXgFxzN96UsqMNf1EIOM7ClIbNfg+4L7IHdhSmEfDJuO2YH4ah/Y4Fly6WD96hA0AWoLZ7RQHaXRbpMmlnhMwA70XFeKPAhoKOQkvIe+Z8ZEaut1hutOkvSgNnOY/kfsX4oXtwR4CacUfR7BiW3COxkLWjZsvQsAAhhwaFOSDEfr+Qrm7aER0o6shGwmgxDz4QNBZs+4NyiI6Sc6jnPd3OX9C8QnpwvXAYyBdl9I2Uux/oE6YDm42j0vCm2hspgK8uPmDetpHvKLXV0WmSo5/ZB2ykI6uTCfR8A9fPw1YATvl42MqKv8inGyvFE7FKPyBr7/GxhZ8lBzC8a8dGe9fKfMIlgFXi9NheJ+YoA3TZbUteFg7pmIWrRIOFq8QhFk5/sHv8sijEwiHRc2ZOomiOrRN8fHOT62EyPslCPDUiZCnKQjtNFmYT05PuNGEn6OaChDLtcnwuXi2MzzGqbU9wnl2ZUDy7yg7SEWsCePYr42R2YjTPDo2Hg8FYNBSNzM3Sf8IH4NaYqY2yGixCzrBGHlx85GFXngA5iqQiP11IRG66SC0iJ12hHpGHrjKTKMoMmE5zKZ91DsQSZV6PfNEXbUtsf7Mx+P5D2JZYZeFPhsRnEfyqVJeb8kMqjpLDL+PgleChSFConAt3aT22rryF6qEAcEUA1eNpTM0HrU1LDHZF7+fVsuvO316jNVEWRD8IhgDPH41IB/m807KaamduLzx8JA/NPGhs8ZTZ3mvmxgmF3frlsrFxovLhvRMFjndP1HM6jCv0qMH4RZ/qi+pRESbvBz0x5Oy7Iu7EE8HeKXSVB6/k/erSr/w6nztN1dXaCm7/5SGdFDuPP2WvBZ9cpD1u+AFzWDCKoGPgtQDkhDiwUENUBq8edgOGbMPQ+u2A10xUDGLC71kzeTvUcK3AR5QDauuMVK8IjqtE0wEcoUoSXFQHtrf0KPJiGu8OvDrMeouukpfb76ur5Cjx6yrtWcphgSJ4qiWTuKDD3YRHIXZG1NPIC2t6D0NH7adGvjWRbxq2BBkaaUgUeLnVdYAXW1UFdcIP6QHTcMrXjv8PQ2yXqhx2hGlIeClh9XBFsYyF+UktbKAS1jNuRPhQj6SuLjhq6EesGIcHiwdrlA/y3i8Xa+r3tvFK0WEmp/9PZnPkGRY0tGA4IYkMM+VjnvZlSrxmxKPjcftA2/iI8Ty5tZY8clUFSgIrpxF6yKN7/BWPupxV3bLm20fD8/2oZ8iRjWO/9xT5ZMTnRUW2wot8TNGyZj3vKfC77GrPewr8zE/zoXLgZeXY6JcVmVkeBVTVOX1sjzcWOrLtbsvxRNnVyRBlV67mV1t8Fws2Gsb8f2PZjnG/Z6fmNqjNWFJbHifNRL7nIQPvgk8nFcRIaoCzNJfNXgOB1Q6KSoQtFKvR6yxZxnYIJME7mNV2qw1HiXbCSGog5+huz65YzbY1L4R7dcybzAV8ZcxsPHWRhLd1IMKvagUm4BiqL36T4/WSIX5lBaT3tJSUPewRx9edulBthcmxSjNMCmPFxsQa/axXg/nVQih/phDK9ehnJZl9OUk6uVi2O5PMLNNPu1IIuWnpAU3fCltpUoiR8jRxIuTVJFmeIdY0eSVJJqZJqTixeKYaTKajxKlkyGKU0L8WyhmyECVlK1OLhOP1XGzctjLj81SS2FjlWGmcxKp2JmrRT3kmGZnNxSJzc8nwdC4WnnFnkyQ06c7Q/09NjgWL9FMai5VoHYqN9bVc7MxqPrbSi4Q79STFby/XspFwYjwaX56bWVxwUhlWPP2eCieidiE3Tl6KkUpivGxl0+HZbDoyXSlMTS5WS0X/zRtmJ8QEUPsmP1Bq8EOPbc3XxZvCGb71eWPz1yubG+9vf/5Amg41c1rwUoOnGDJDIu1w4OgFB81UvIJHR9t/qMmIt37YFezyts7tj/86ePw3cWGnXNFDMxit65lz3r+UA5fgjy/JktYPYvuMRUyVwaIE8uDOP5799d3BW3/h/kHqYTYr+newwlEeHR23qtpagwCCfEC6TSIE6TnJaUSXJjRtfiGz05BbV7/f4g53zM79fkH4SWw+/Ae3dNwN1W7MW5S0iqOqLIYaM5rKmbPRE6Ej9wmiLgtUMA19SXvXgpZiLjzsfk9mcQfnb24++ED4unSlZyc8riN4wm+7Zta+4PxxWL5u92+2lAu/GMn8Lmoxfp+d/Uzs64Pvvs6h49DKBHdvBIhhKbMoz07LWXEa6rDuk88dflSpV2dHmhvKsfP619u/fLD1xbeKv9BeNK8fFBjm2glPMg5oAzZa+OHQaMFEYhvrJRzJs+zTq4iz5VF5t7Lw/UG7ja+f3/rhkT5bzjLg1YeeudXIXfbxJdEK0ueSaI7suSSa45uXRAMmctdkcRO4k6pjz9te/TUPimvw1ncicuD8PHM2czrySt5qq1ex2epVhWWHa31Vsr7YtyIu9t26fU1c7Ftl5xFV4FiEpBYOuDzyBPn7PX6imuvRrb9f2frwvJalpabjPIQWl3ndvbLqOTgPEcVtrlvk7FuQG9hUr8hLkpTm6Tj8LzXt9lBIWh3JfOBFXrHUZr7bv+Y02Tsra6d3Pt7+6JbwqqrwR7hfVY//iaIry192zaq8x0VmZFbsBTCIVNN3VMCewb3Xt+6rG+Yq/CFk/ICseWD2BsFGTrE7EWawYWmrxtfsaCte47s7P725fZ8tAyz12mvy9AuLAbIASlfk3TOn1HYirzrNwehX/xoyqNdaEG108PnbO6/9zNcoJMtUhI3n0DpfJuwNILsBcjQUQqN/ZwnWVq+timXiJx8syqG3+eDBzoXvnn31sQzZ25BXc3G+yLNqYcR3DAQAKqsUAzLL8eBU+zebtrxdQN7k/fR9HlKCD6oL321fvyCnAIvTWVVxyJmTsiW+Q7RkiaXmvsiPc+qLclXeBnjldnv0fVHQcBQSnc5ECTV4cJ5OKgFIKR5/tL4EcZR7/Zua2w9DuvtH1AGWNWbDHrlBqzjgoRigh/39kaTMZGTwXs+pSgDucF9Tb/g/sq7nUdUFqzIYFRCffdMeTHkwYdmDrmiqYpKMPSkGpheYWxi2H2y+JhLayMvFDO5arCwwWFxpZZVp9Zq/vawpWEHDAiITtocBA+MFRmhXE6TMDzIfexgPMBymut9T2RuKXgi35LatM3spalDShnrdU7kixYpV4W6KEClB2d6gjHhHQ67tt26KXGpyidDF6PEhLbNvHePVL34BZxFwbI+Ys6wsOjznfILOXvhucP5nn6Cz7ACAWmio5/Ha1KvHdg88a+RcOk0f3yVElcWaq2d5gsmKtOFYsiLdCCUrknB4KpnmuwNetpIV+qlWKwmLfsozhfgs/czlp7JL04T+Ocl2uwv5LI9DtZaRN9PzOFTLIXkz/dBed3YyTPKpYJ7+k6bwCVZEJjJnRIllkaj2iBLLbmetdOx2xTwNdL/Mz9AswVGgwTuv7XxwW7g6Nl23zFUwixkv7+ChSeod6z6Lbn5tnhvar7cfMlPAf5a0p9bzHKatdKxA09be30xlKCdwWOAdXPjr5oO3B1dubN35misQh/umBlr8ROt6AyTRmHDRx7qEZBP85xsUBgGo3MDzRd8KYy9Uw5MPuABvXx189Xee06LNpXgozyC/9wwId28ExDxEArxyqiEm3jkBxYgNxuH0+5sCxVFdBQp+jVPCye1jBI0cAgS0PqeooD3xXAFKO4yqWaQjuaISjKvtpfh4Z1gVo4Otwjz1R/dDNmFHYqL4rTIFR+NE0PIySRAYduQUMoqtaog7jOvFRICj0YacRaWm8W1duIEcmkFvysGgg3CKhrgeaD9YE3MkoOkcOkJcLKbaqZWASOt6mnKo380+F1u0enJh9a3irx5NZ1tH2NWQWW28qrkf9ZHP7N/hzk0ofaKF8+B5sRCQP8ooL1DKFdviMgiGNw8BEO7fE0eukZWQJ6LKvY5Xy4NmlypZqmNDWe2pRw0deuCs8OxBM7ZwxqOZ7Uc7E4cmoF+FfKbdkY3pw3Wj31UHEiToFyKVZ3mRTxOGPRQjVf4uy/OGSJW/UlojxEhg2vnKsdHRUXlGviMq5T/9yrHdt0N7lDpR3uU9dAXJxpmrSk8HfzrlSUR+niIFM1mRMhxolScbYVZ5iunbKWVBJ6r4U+Dqqb4Ns9x4JFmhn+p0MWFNj+dJohwpkFaY+XYm4nOT9P/luUkrVspns40SmSokSZQSYGuK/GmcXUg/kaBs95VxfnwqmyTp3FSW0tg8JbulUjJJQtlEkgTzqXyc/pMOBauVQnmV0uS58dhsOBYNjUfDIUpy6b+hQjRI/2WJad/Yq3a3re6hlwcLPuBX5sGtVOwl9W24larbkxdGsmx2W19O1pY3z2sQyCyzqV0NkbGB/EQc1s6OWtl1RTBK6WQ9uPceRYF5gT0Y8QAaxtoHElr1RKMOoHo6uNMIJP5O3auig2VooHpw9oOCl2F7OHiTsy5GJyfACMagqRxP01Q5F7zRNCQwCqYhsBUHxuiGD6XA1z6UgK9JsJp/iAPbAh1RYFyAyYF5AQYHFng6fKCa3j7QI2BNTH9Aj0ekgMWcCGNrUiSggRRJBaKuyzZkNSF94BCWP5CX+MpeU/FQfdpVsyPVBpogyeGmLuQ2ZAVwn0bFI0EbXF80g/cqPI+cWD5FeyvyUdunAYd72uzlj5Aml/EZhZ7H3ohH0b32EfWu/AZkV07zqJ9gZnd6+1JGgcRiYTQfJATjhzGC6Er9vZum11peKhihkvdWyB5lbGrQfehPQ3di5bZL0Sqj1F0HzCU1yNHM8SOcfcakG1EJ71Q7kqH83APPh+zy9igMc11R1RfFLPE5q6R+lzU2qa76kRrHioQHnvvySJ4rcnGaK/56eReS63adjrtEeYbwZDslrj0QScKLTSWJEIRVFcAUknjY0JPS7a8p7sKUUUtlggjoKRz9Ki2r0pZXIUt3PZSoIx6wdWFxN7qi3TKFgwHl7pUdThOFFKeGkpFvX8WhKTUWYZnVYcxMEw6Kx1Htwa9P1hN57zW5z92xMSw7J9ggpXTJw6JIvzwo0tcpLxkqvUQ/L0eDxZOFdPFUMlQ4Tj8nxsMTx+hnrJDOr9HPeiT3UpqsRnKn0uRMN9uaIUvTJFNgnncr7jQZD69kxlPMP68zQ5aDU+R4mnRnyEKW/Cd33KOpTpYU0ik3nTpTJEvj4WSTflrRYGKRfhpTk3GHfhbmZsdr9FMPxUIhYs/NkGCIxObDr0ySaGVqMlqNBiMW/ZTrtfBsLTpBwnPj4dA0/cw4leAk/UwV0i+/FMmnTpbSJ45Hg2PHiqn1tUgxn4pHg+lpkqX/LLmlQn7JLRfJfKjVjEUaVIIFZzpcryUirMg4fW9IxMrWsThZy5O52fnkzHQ8OjXpty5Oe6p/nw1c4ZLwcJHvnLKpNNj4YPMR353r9Ny63bZW5eazyqH9PmSCuzeCWgpWWfTbQttdCoA7QoVt3vEtwvPf7/x4nTkENdx6wK2p61ytml11y5iOs/zufrLL1XAJ0IA6tPpf8SBINbbHywD4Ms9Xr+08/is3yCpIknj2mpjYRma1vP/7BbZbvMGufWcqsv9QbITdeXb28s5vH+w8vqTxAnI9QEGq63iseYe+e8srr9lqeIdv09KXtw3ueH3j4uCN+1sfM23dmRfPui2urRssdFbbgnuuJZQJAxA6v5G5o1b8aCvRqs0zny5+6IbL4FC9zPctWANRMX761+DKDb675XY79IWwKxxnrF4VtiswkIEDEDq/zgwXbsMN0jwQoGzRnR8fyras1/hl0eL91W7M67dXdYf0rvnUCyzLKQckTbdaNjUTLDhLVG7YdgP9m/StCTvE3XttcOFd7RDXtVqOyIS2J1QS3p9Q2NjVDBUx7GwmSvI6m+nyPC5nKnnojKRDKVjV0i5z7L7Xp5f57Zyw5bJ96c3BN6/rLZeaxc4N4hpRYtYxAh7KM5Is6iHy9GPgbLO/hhz9KPj23WvI0U+gYz8/BW8Kz2LxWm0I1/j7BeYn0/NcA/jgnzuPf9WSV3i4Xy24xDDklmnG0VQN7rlERhRgXiKzyEvBFZCQnmOd9Ra37PrS6qcXF4curh5cuAZ3Vy9Weu0urEA00ZXZAOYiLACArHrZoaljJbYpV+r/k7sKQ3BmsZ2JFoc+vTG4+xAWh1gWC1ya227Vbtn8qwrPrCGVCpZ38/L+ucNdZu5+v/P1G88+f9PAg/DMChE8ct2KCrQqnDGenCsjAXe+fjj42xsgIB1EjNYpDdBb1pFXJRL3i6IYrHJ/ewNlgcnPM2GHYBt8s1r9m/wqa/5eOs8Pg21sPvpZBuKjms3WUaK7ThMvnykcd58wyEWYAzWQeyeb7XRiVIeE6lGL0wG8rcs/Cx8eZ8mpqBUqpuJVdvAZw5juQSC1/yjkb4CiZ9HWlIsjNcPctUnE4Lv+7Ow57oFjrzgNueIHGZRHnfiuMivvE5pZXECuMuOsyuOdxS8UpFiue15a4qNQbMB8cG7wIRt9a12n6jabcjRb9CUN8Wsv0GgYm3Iodqt2G3zrMJRcyurfXGe+GvtmVy3uldKAa5gAYN/cChDMhVgg9y1NUXjHMA23pPjJuWdvXJAv3votARyL8IuDH7T0vAJIfzy8OIteOdRq8xKOG8+P2P9+oSZczbQr0hv/Gvzr22dnPxNDQudSK9hLRvR4nSLrrpEAgzsa4ecQTAMCdHc73A1PBcTsP1yV4TDfYqFSO/Ce8mf0MAQgP2R21ja+O5OKRO85MjDjRnR5H2QZiPLhWfKhSaiHN+6bNWrmx4fZwzWo3+NLon6S9ynOZ1Iyg4gB8fKSLUyylIuj4D+Y9gDdARaF+Y3Ba0zaAUyDm3J+50EXMQuTBOxGAbT5B3skVPiBzLRhopFVHWFTtT01jeD+TCA2f8N26gBWymOhDmldPBZhX/bAsAWGHt/PXFUa3EfH7kvDerXrsA7E76X6jdRX+T2P6hpe8gPcEos9qh5Me5cAmXxUvFkefpSV1384bfhXcplZ7FEhAF4BrNFHlpx6MfBvASVVGq8BvjRqDVBm7Jw+DbU5/dKuDpZsuM57Yg+ptKGNaZruzJuRhyDNuAFUAPhuPqciyQr9VOcWoyRhzS3Q/5fLVnw2GorPZTOF8Yx0ssxnpypxUshGy3EysZZh131acVLKRubipLiaYRd+zsYJc7VMhafjhDtbToUm44SHFgoWWVI4WK1Q7PHg3GwinI2TZJzk4iRI/wqH6N+hUiZOoqFCOk646yVNCsdioQT9x/80KNWVVq+Gqat4MbzQExEoNqia3HqLX2JgUX7GFxIEc5Vf9LuPhHJNJPfpxTIgbT7+wkBShFV+hatqOqK3xDvZ5+J9j9/Jww3G2TcGF25tXbigdNO85KyQD66nkd9dBdN7+r5w/hEOohTo7vlnn/yAgdSrj8wK152IUhhNM0EAwVaFc18W9cXMvnduSVnlN0nAqFlU4vHVAWgNwyOTtwm8ZMvn0aWdqqXQnZ1qprTZO7EHGm91c2jY6la5jGs7NZTei1aTTm9Ga3hzK1rIjraiZVbYOVZzEjajTWxfXBN0FKJnN1oB4w1Lja63KwW42q5UvQO352kdxNW8B3QIEKGNghq6o1Ol6y1psxX0DqZqCNjEVGNd3clnSqtThlrWGGoKcASasSOtAQ1BsYByRxoe9PY5zFBPj5u9zfekYS4bKh7vSh9FN48S8OC9DEiwM42nu0c2s1u9fcr39jyCuf7KA3em0ZMmxsidadDj+7cdSNsbKnq/eh6pZqRY5XEkUKq/XTOUqlaohtrDbQHtAI2ACz1QLtAsRzXzj3BOHqwmR1QRA+Z5hqJvvHz2mE/AGinui5QSsyD512KeqzbVz3KseG7aVL9S8gkFAFU9NXK7Wubj+9Xyz1N7eGVW6CsbC5zAY6doT0uRil0t7ZpIM1itTBtitTIdk1qZZDpcinLAv1I+5EtyJ4qV5ESylyTVSClh0U95MlQk8dnJGFmIkLl4firbmiaF5Nwku9t+Tp4nWigRQXT5eaJ6iQiaW8ylzXvts8F8KpoPpmdnCtVUtGyps0R+t9pTdpyMEh86y3aHOAe1VhpWR9xrzw6dCsqFgw+8/Q0lXpoqsTz2PM2C9iQQkLEvgdKNqJN1znQZa6KDu/+DvklKlEeZ7+D8vcG7H6MdCl0u3qVABeCdCkMgdUr7qgjoxsp49tkVwa41Kufp/GtHr31bK1RsuOpyDwTJzwEDL16K8dR0K7j6LOQmVHjryltwEJI/XO86q/o4JAx8ExLBAZIB40FAHFmN8SgWyex3Cgb9rsRCHFkiYI6s5p3myLiz1wxooMgK2uTIGkpzZDWFNUcGeIMiS9kRRVZlAKPVGsIP2gfWizkCEMW3V0UYvAmQgTZJYEWbFLC2bKaoChaio5mABtooqCF6rNI1PTZaAGgUNAIwKVUGGE9T2mFwH2Av6ghIkyOzq6tqaoxjiRmdevQRzIWmUw909Gyw/VvT0+1ml3OaDFLVsdFQEeyPpK/to+ppyGlEiFxAM94Uz+zeob7lvGLBkM0A8wAZKH4QI4NCarW9D4XrMQBCLHbJuTVCK7btbsPmC56gpJ9PnRpKb0RenREePFCuFs51BHP/qGcllmtEZYZn39EM7+cdiH4UmSPnfSiyKJJR5DotIeRhyOpXWWcPQ1a/spCMFVUAUOSToymyyChiOQr5T5/cgyNbjd6S0+6q40gqWCIkc5YMqc6KFdA+j5AkHDLHzLzMuRE/5evJGA4WjtHPWDQcXMtFJtaL46v5bDx/Jhzs5dolMlciuZVmPduplcZJthsOZpaDmXY4QubtdHCKdJv1/5xkbotzebKSJNkCc1uczRPKpDMFEk8uLiw4ycZiouEkFxMLbjNeszv1+FJr3Kaf+eJ4rEI/1eJ41KKfcnE8MtvLR+bGp8LT45PhmZnQZHiaseRqjASLzTAJh0iwlAmNHYsUMqHe7OqZtUhvpRHvdkLt5XqYxGgl2CccXEwEWcHZeq1UnLfZsnI4WLZoDWcp3mRmajIcDfuGEGxbtZZV11vnT24tiC2TrSsbXH/xny39p1qNFd/cXbPJ1VfxBS7VoRJIzvv0YlcEEJGxqK5dHmxcV94wq67cahYZ1Daz+CYyizzwtHTrEE+oRRyr6lTYVaPCb7D/kF0ayreUNv7x7OyXnLnbSx3hTqcftjy5d8lq5lPF9rpOt2HpQtmJ1kD/Wtn066NAtz7ZeucyePdBRiGP/GKZoOKirbLapBX5cWbREPA4DrioZpmKytRjV8/dbAeeXl5XnfjeJ2yx59HroitX7TYOsogm7zDoQSBx6Hs99Xk9W06ZB0QVawotsZHHoKDd3nxj5/z3FEw0mnherNTLv20DCTbhhTgiL2TUl1Bb+JKttlVu2ipqwi1x1rRqvCRc2dj+9JFeR29bLG7F0FUNAse4aUskeW8u1oV4bi3m5eBbi6Eo48piBKsd+upUbXfgDgG+U89W9IybpB9f2nrrE6hHS90DZATwo0pj3qiEApavzBoZ+fFxYHhFBmB4OZawhgtf22HhmDrKL61/g7vv3eSWanD3q82H4kZVapj4QyJgmL1gdVCsSATi7gNDRQ5TKI1DS+IqjOcRBEDUbhWPJ97o8TvS5Rs6vyn2yTmaoN7Rfzq39fCCeEdn92DIx+U7OvebkEk6UpaGNSABzYDyoKhG6vSUS3n/YSPQvy/8Kp59+ub2F/Iyu2rLEoFFaa3WnTaLygjNw3O7e2WWel1nlw3D4qU23Apc4OGw0AFPLy0zjK//vsN14vy8ay9a0pJQWr6EfPMg/+55cU7suthxOh3pdMacUWTIKObX+/ZN7iJhyUdawnw6DedMz9IGVH4X1Wehwy/z5e63b+789oYIoSWfUGZUflXDon/dbdKxYsna86hfzL2F37l9/dL2zQ1+Dy9bmFql0oqp0rXmrXVLe+FpkP1AyJmiQJRfv9twlpSn69NLbHXuKr/ahtXn2c2fn938TcbYZA/+h/QJhGxwxEF+d/eLos45yHwQdod9DyADx2K3nQmwHha2aOfa32gfKyQkjCmK3PveBwIWxFhV4yxUOB3xmX+N2Wvaqjvn/6nc4cQTwg5Ksvs82Uc5sgkSthtb038Az1IU7bb0Y1yUJO38z1sXryvapSjX4RiTwWwQVwJ2hHiN5jRD3OMAzMPDOhBR2JUmAEUwjDg222CqkYVGhtm0m9hkgqnERlLmFSbSY0z2NiXInh0mr4vzPpeh0Hp+Dy1vaPhDqmdDscKQEHeUq+q+98ng7WuixmvoUfjT0Ir70IlaHxpabJ86DOkvlH2fegcyP4/GGF5jUEDBAN/23y0uHy+HFRMfjswnSx2OzCelCOIlhhN7xORTkp8+sdvqgl21Kz2+0aIOTTJXL5EGCwaQhPbZXhbeYyj3SZTCN95OSG8ynsL33cYwmu8uW6lQy5C5UmE+Q6xkND5DP7OZ+TihqVN2nNDkUpJMR4qxXCFJeiFSmSJuiqQmohknR/JWnG21pYqZyGKKuZIxh7IpEglnJ1PJaDhUTKWztRQJZaLBTDIbDaYimQw5OU0yLA5gOKhi96WSxVA0M0UmIHpfLBT3jWVS4Z6nFg8c32zA3fE8whIP5HdbnDO4xu+SV1FJvxy8+97mL58NHjwQ4Uk7LXtpib6VrDUaVq/T44oFkBt2ryNXFyGtqpykVTlsrrbQle3vvrfz2q/i1naJ3bIqJm7V7ulglys2XNfM70RmsxDOtGw++nlz4x0dkYU/LqLvdXjXosh7K7akAAoH8kNOafk7apxwY/LHNaQay0fbjBIVGlGD0hcz1gIsBDLVn6zkgC6Bx8E9v/noLLvZiheApO5a9VXhPsHB+zdhi0yB63ugkdDGPdCyTR7dHtx9TUutXb7kLIbtLJHg2eG43Q08+UBfz/voo63PH29d/Fa8SLOtF0pJKnxOa0cNpTGMxlCopsASFoTlsFJSL+Kwz5cUGO9qKXnRJc0gs1rpxmJrnxAsNUuAhlbXJRmtLE8hqiaW7/5CcA+mua11dIPDOzawnpC3hPFTczeW1Mbpv65vf3VPbncpWetIUavNrobNXpQDvaHOk/FAlZhdFRnU258P3t7ZuEULGly5gTuWNbzLDhDj/rWPeLyoZpFbYxzHqE7QWxEKOlwReakor8ivV6EioqNpUagiwi3HtxY9b0/IrTjeE8agQSAj988UrDEcYRgCFlbuSBvvrotBD5uacT9FVQ+TrXW4bKAOjnyeGh03UpAOSHJI+Q+XzZW5fHy+6A9FP5cvluFFOaSfnBty+RI/y5K8Hl8qr8MFiGOqeXwXhy+WjW9mCblPH9+VbbbbvYrL7JjkjGOCccpkN2B3tHOXSgSnLpEgMp5Cz/i7ax07WVk/QclidcKaKhQmphKpeLJAZlPxRIHMTaSz05WJ5RSZmbDyk1OxTC6dyBZDmVLUmipNFCONFClkIuHcZDiTSqRLmWI2lJtMZFOz6WBuPBYNRSbTVnButjdBnCSRAfC4e1aI5pxJkSgljiwIHrv++P83cbT+ENpoGaSxbdg0ESdAArN7F9Gxeg4LC9p2xWosBfjyItWlHbWE0msEWIT+LkejfzhdTymOteIVnUezlIfDeCGDe28OLtwfKkTsLXQcT0lWQAWyfw7+K/8+DP8VX/5w/itn0RGPB4UK46Gj+MNoruOtDeKtnPVAdcAdq8kijLNh4iXIWosAEQIBTAWLLL4sz2v1EXW5jdkLKh/ZLygZgrSutBzgLb/f4t0jYhgK96C/bmy9dl9QFraxEFjqBWxOTFQkLqz61CpiRRPyFr8BnQPLezIv3qOgApFmpY8OQUEYW6ddUSaSthWWDlHljTelkMpSajnZTp8K86XAW0rQP6wAcJMGWnit27FhQPHZOZpB05k6RKLBOgU6/66ItChOE2nP+N0H8fUlvZrxItag5qCHnMquZo5cogG576wxfljjnb8HQ0hy0I7o+K7DyYVE76qOYeulyEv9JvMwv9EGmr6xc/cbgbZIrX83wDGrBhKH6UnxaFOPkBC6l0soQ5s0mYBVDqVEdCVu0zPGD4Pc8cM9EupsSeK8dzZtX0ybciDeLf4QBfLmGFkcr7HWugfKIzXWgRmrVCZHSLiR8Ach3Aevcsc+QEliNCVgMPmxbVZszicaIM8wkm2rn33Zts7L/+LwwLbHRkcD5Nk42xbz6/TYbgeB7YpjsXC1lE+VBYkeilGXmDhDP2uTpfwK/ay+GiazSZLrTkfJq1Mk15ssZdvJRLYTzMznyVLGzpPlTJr0uulWbSbt1uPjhRgZK5JcgYgYdfXkguPUk4sLiUX6Z8KpxudtuxqvzY/X6J/jdiRUfjlJUuFYpRSJztGPVUxH8gWSa9UoRqI3ScJTiS79/7Q1FyrRz+T44mx6KpkIpsJrZyKh1RW2sTWRCreXl4Kx2aLbKk9kw059IbFAi7Wr8+PztLjlpUwwZM1FKvlQNJuanopGJkux8PKS3wHgmvAAkReOrLGTC4vcy/CXrbfYTSfqAcH31BdJ+ORXd4+8kvHJb2qzc0FsjwtHgA1+kyPfqzl76dnN75WDqgNUc8FtWDhIjszu7pVbFq6y44tWrCpTD+q2lQ96axSE78dv/GP7+pcyTmoDrnZzIAO+akWlubtiaNKrUeDqPbvShktOqY3tLVKtyQzS4IuPB1fusTua5BP8aif5N1x0p3/bLa+6cU8+reK6uI3A6GLpryp0E31Ox21qKI7fq8osW3d/giwQKon+KavYsFf695sORD3nYc2qcFxvc+M6zb11/rGI5sHITsOSJ1QoxWLbbGW3ia9aZJEnRKqjgqDvE1O2g4Gq/LfWnTYdJSvS8en3WzW+mbaED5Bs/nJv5zsUgq3HnsdeTxzAOC+kUNFhIQ2tXxQFMjocxKHxuSABY3g+tWglesstR7nT1OXo2zr/LzH6ui2Lv+yJrWj5MDQjpLi75gZvN5W/cfDS9cOHKlw/bQTesp32Ej+ExN1ILrNoKTdEUMdHmw8+E6FSVl2hQVif0wz8ed0CrlAho/PqAQOZG4eUwEUgBxUA51WKg+kRFdDrYRuCrgze+FZEXGEvWuqiKPaqpsPky6x7ZFSuOy0dGL/BKEDDUjdEr/N3Hqburn9JX3KYupGPc/FZl+mYWSovn7DMBUJ0+LO/vqc6HOYnZIUbqXhONTGN26JoZn3qquUTgd+SWNgVkcN5vSlFfbAfJcXGTpQK3vChlOjGUT3mkcC2wt3+datqK283qp6eXuavUT11oSnVUYMrX1KNK9ZWuO/avMvewpSXEbMVdlePF/HV1XiAovKrGSOehJ0uKogcqxbSw464UpCqy50fv+JB2Nq2eIi/lpTtXlPPWQNkbwhpCBQInrlSeR9EdYuY1/07mtKJCFY6KFzHkrcVysBS7LZCHliqU3VddcG2yCsiqfq9NVE1W6f0G+4VYktOPIj2ua0vvxVXXK474pLKmnbSkXRkDzKCiMgQgeAW9XZDToqdn84h+uClDtjy7273tc0H472btZd2+3n7CZtXcLCxVixs+sDkiRBNVpu+8YAHE7N0ppXYzUZg43SgXK6ZCyv03VSyaQ8OnNf15OWduotOVDoYqa7dn1baE2tduH1V0tPLN8wsFsoiVcdoFaPVi1ct7KkUkEIQ87dll3ebtTBj/a4D1SM0sYfXEReK1mYoEoBwPNJDedj3iA/tKBvaRsz6Y3u4H4kZwa4Gtdunj+1xIWivPc/CLZo3gsrE4StB5Q/GnaAyzbwUVCT6bg+Fg8kK/VST8XCwnEycSpNIKT6bTsVz+ansepgUPfeCZoqkVyDJsDjHnyqSToHEw+Je0FR4Fu4FZYGqcsF8umxVK8GylYyFtF+ROscfC8V38ypq2+tWGzzEl+k0angu4P75682Hl/Qd3O0eU5JLknTwxSkIgMuhXI0E2XFGRTp4VgjHK6TgDnfiPL9YnWOT4d2PNzduidnTXHMXWrbymrcr1NCgI+0dFrdOxn3aE0PaSwaBbiiVCEKZ7w3SdkUARTkgLKX6DykMGmzyNjXHXqHzWJExDGREjOKIQMwE5hAzAynxFaGqAHVBklGEeUMSLwRWSKEQfEuomlrGNaEdtiOmD9zzSIuU8p3xnLi//dXgoyv4xL0oQV/mqeftMLAfqAdxBBy+HJQBYuckjarPXwtQdf5agKKr/UwhTUgvHMYaBTR8JSivtVgZNTqr9eRzI0IN767Bb+eNSFS2HG9weaAp7+4FeLABeASm6ZakRppsWu+cuPuanhayWbH6NdrT2+Vmd3PnIzWtDBUO94I+Zz9bR9PLAIMP2bNAbwyNn0Ye7l9P30LHCmBxl6cpHIJDkokDclwy3IcmwEgvIaasuZ96Q7xf8W3VS4PHt5CeBx1vKsT9qEOpl4fGzaiMkEnZ4INmBM114JwtI+dzT/cjn4QHrtBR1MfAOPT4870YlP3kF4BKFfmiUCy8fjPey0HVI7LS3ttB1c/UajJposad9K+OjbwcVOTjGyW8FqfpwyMJqOW03Jq4mARuMeIp+gqjjtOeZ056LeSdNG/6w0sXpXnl/C6jTvEEzUoFMkMBEF96mokkK1n6v5miNTtbnCbuNLvvxyrGZ61jITIXn52MTxcm43MZki7ls9PxyhQ5liH59FR2bqITItYUKWXHMySymmFXeqZizA2eU9WEvNQzEsqWKFVNUKoai4Yq+Vw6NT05N0v/dpJEeTNlM4XM1F6+TLKxxJUwTy/zMxQ/iEOWVBXdZGu3O+/8Y/vjz7euvLX1A4sAvcYzdHuuOmrZvwM9IE7PiObHeIAC+SG2veoruUk473YC9PWULTVTQvZ1S6KIWeawM+U1+u7IzriUBSgdezvffTvYuLz5QETam2d91nVbgWqDytiR+8NVtotQZqAtXJR3EU2XZS6liYLwaposyLOepkrCy9xMDTu8tAO0MtsklFWBlharKGLsqtbW6KPaG5A8CPCm8Me0uSjEr8mr8t1WlcA2KAB385fPNCL4K80b7vpNAcREVXRVo0GbIuIqoEXbAn1FUrsorqpSFaigoTK8yF5MEww57Gu5hwcc36fpb5gjjjlUPbhgjLjuv7NVd+02hOQV+MPQBiLGMlGG3PVB3F1aWB6pN1tYmCCzhbUrAZJYlTLUvBjWC2gimazYKzKM2aGh2rG534w93IDe7ja7mtNhJUldmw3lin/kfWwfRRcLECDGWkhxXxOoJNpeuu2pAqGSmZ3JJRMuF0gsAQhYUiY8NDAIyj6CEktLu5sJ0eYDaRdcPpQNBWsN/Xy680AFHjiHUBtHMKGPaIZpSUaJ3gHZn190jXDIMeXrBDTvFv18gOaZ0zwHdp+cm/O6APFfmdk/d2fIA2heutvz0ovGtfcjmS3PJfx/uMynX9mF17Zcp9NrVM7YMm7US/JeT5XYUNd/8uBP606LBcl11MPHh39oqAitNK3hLsknj+OUhvLph3KMoFMKS96pKXKxLEMEOFpMhsiJWCJEiierkcJYPlo4brUm1lPWsYm5VP7MRCZE8muxSm4lVs6txuxsdyaW7ZWniRMhf5okx4ssypQ1TV6dZA5KM7H0Ev0sW8dSLeuYS2lvskE/zQR9tNONkdIEfa5dmJ8iZ0IsQlV0YppU+DWcwfFOmswnguO1iV6s2uvG7InVaHliJVpJrUfmUr0YiVgxO0HCM7Eq/f9sOHQsSqYSwdB0IUYoHhVkIcuAJqeZIE6WhE8uBcmJsHN8rFw6tt4OknicrJ0JR1dXKHowPh4KZsPLS2tzbms81GzU5qeCodUJksyQ/wzV5tcniB2sZvO5Srm6EiPWXPpknMzOJOPjU/NTiaz/FQeqw5WrEd+d4Nd0fPrN1sX3jVHRUied0dBRqwWiP/eC8ORXd2D1llsWuwtRCHGTmf8lfk0vo67Pvvpi56fLA35liN0oi+uV5T1cTgXywj1YKmH/UMqNQYPJ5TXmcV+lQ1NSa6d/dZUa2TV5oeXgm4+2Xn9XXmgpnqzgVxcWlKHBWtt2KJ/Wl1sCKqvFGRlM5ekVFvKkpnxCty/+devDN4RbqN212gHAl8GoTGxoSRZagAWP4/feeY8tKPnB51TUgJm8SsuGbCriACRA0xroh8GGlkboake10r8zb7fsMnjMVPhlyviGv29eH3z7qz5s4YjnhftIRX4DNyjAczEcwCAA5UWiINQGQ9Vq92p2x7z/gy3ls4iD7JJFEcj92ac3WXTbr25x16R2r6P8ShSAdopTiO6BAVWwYYUIew4rbLcRbphkm5L9h8Zuw87dr7Yf3YHdhlXb1w9EwBjOWSLJuGNSwaOgVBwduWYJfOybJXAMH5BDz3j2VXx77vmuoZAbCNsxtTotd4kFdBaznjvI92+uG+/Tm48e7fz4tV616LKMjsrIr7X1oqn57y0GFQHAQ5A+eGriVDpOG7wHxd1YPL4FHUXPvr7IXPnZA8JFlaoLiHUtMrp75FP+qTwnDLqKQw31igMDj7f60/cZ5UYD76fL2z9+BQOv6ViNyvDAa9JUY+RhdO8Cii7Hs4DCi8ILKFCa4Y8kCzNiujntMj9zswJ3xJdlfBPDufHxF1tvPQbnxra9wi/MFZWgED18V67bbdtlft4I5g6GRY6NHBXNHoGLZo+AxgIz81FDgbKo5q2KQFmbj74W6/I1GSRLPoou9qxZMh7UqHz6Ls+a9sJtg+KSsbFudeQdh1p/8dXpB4M3bgvtxdsI6UKNgaJlIdwDo6oocwgW++YoXa51NzPc6t2CBTH6/G3xesHC1lQMU4ISDKdalegeBFK7KA7ZFx4Yhp1nEBvp8gjf08u81uce71z7VgWZ0Q+JQDMGIT8yLBWoj9+43FF2GDgJEBLgIsLKaYajxxnnN+5e+VWAPgUAJx6dRv/+korE1npyrgqD4cKHYhisVcRLhXxToI/rmKaQfY/Mcgip7BAqnxITq23JXRB2TF9GpTZubf7uHI6WzwelbcZ4FIMSWVSFa5pUQEdGlYNjtcDRDYdnAQ+Kwfe2zcPxcsOu7tuqGgzan+gegOYOUdxhBnoI/unhnh6iuAdNxBTRYHNKu4MmePyFUAOSu2HehkmbcFQThpf5cm19dG/r8x8VRdPU6dD9AQznKHmH5g67MwdgDUg/gWHHphzMt7LayFIjC23aULCdYIuFeyQ3l8ja7WbrwM55jNFBTZFphobtxQGshcdSHJVqN/T6HkoZK2RDne6uTLUilX0mdJ3qtf6N3rLos+1rd0FfIk3mEzeN/VDcO2ga7yFviHbhuih7ysdvkd3WSyVI4KW1l0ctrSmvRZnJOf3yLitrbtdh/tboziKZInZ+ZRQ1OrbZmVV8XZFIGto1Fsl421ik6H1jga/vKeK/++4czxSSlUipmlwukZcnSMJaKpGX6L/lSHy2FCPJaLwYI4lqYdqOk+MZMjOfIelYPvtyhO0fT/0pT5izo5MjE1acXVzEnB2Ls3HyUp5dXJTOTWWTUXFp0XH6qLi2KH8sT4LpfC5aaU2Q7hQpW8HwbDhG1PVFuaR5fVEonfKNicGUUKvmVFXAXvoeSqfBWqDFziXImL2DK/c2H3w7uPe2CNtLFRnPgVZj+He4DliliPCAAov7JDMMDYDzKopUdUQncH7C7v26zXzGN1YDT27x2J50njB189nrW69f3/r46ubDdwa/fsAtAr9gqIrOzUkkODZHNcfNJryWVdkBFFa57b883PzlE26N9OXtBgKc3hMIqqHUbeSykbYf3Ry8/aVoIQEF278iH9jFA0oinoZtXyGTZDmshe7U1xHDGfz28eDsLzr0h2wWRW9U9jLcyiYTxO6uwsMxKQQixKRQiGuWAYh2eeV8k2HTKOLNqtyJ1huwtAcZ7sZl7OgI0GofFibzCGAmKnKe5IIC4Ag0tK0rEtQrMF+FYF26FlDYKq75W1vvfCvRlSOcQtex0wxhPdgmIIYahTO0qSuTZdwHb6vKU0moVcElTpUAQZgMQX2hVbtKByvVrpKR++N5g6+Jm6+xoFhAeeumxNLq2Gw+nyE0NHz4vi7IVEeaXe3sHmE320fSySqf2tXtXxeGJ+qtrKdXh7qUb55V1rFMBwTzRRp19ebB9Tos2shjSmgooHEghgrWuVhR7q4mtYo0B55vUXq4Sb11oDytoTyHn99HOvf2UYuhmXYEA/iIxpvfxi/Dz/jEWuPlvsgKoYJ6Nn7Vj0Jub6Q1+SN9QeUSGFdrvjRy61dk43u/QvDTL+3CUDlFbNns0JGI46sZqEz1IaHyF5OHykTjKniV6ktAE+FkhX6qkdU0pZ/xaKLM9zjjZLYWJ+NxMhcvzRXGmzmSoP/NkFaJE9BGiSzmyBo/axOdIQslsspP2oRnSL1EekVGPb33ZeZzwXQiXK1UwmUrFIzCfZmR+L4Ip9suNxW/k2GvhR8Zi4Auncj4E+J9if7paA4n8rp7ZVWrXyLz85xF5XmMw9uHOo2KYBrIhaUiu1m+WT69WKMvn8xx6VZP0Ephp5htev3Lwfd/H/z6vjBSwsWl1nIbdtm4OkMCAhNn40OOGn48UGCzJuNoGMcDge63VGKKi8E21oSQeAl/4yLFgyU7KRe63xIGNL7hUsHiKy4VON/s8MQlYmWwPQ918EYWY951CSWhozcsypQVQA3B49fKokTcWoGuw0hBk7SMGS1pqJrM8qpDJTSOCcwbRDFRKSkioqAOgIsaMpqRgRU+RAaW8DjSqywCWxlT7CFoLyzCHA1msFIhM7dC6mcUHxi3CsQHhobR8YG18MiombL7FOEHb2KPBB26/PKAY6MDg8Me2ciekWGOCs5YlXh10wqgwMBHNxzsoxsMGkqxVyEqpQFYS5iCmr3v1/WKDphiekC9gAjNH2YUkRV2ZA8roi3IYY4bg8YHPx4KMKTksWYfrYtNfYkaAhoBWsDQgQfL1zLzHYm+OPrZa8g2oko+E/SoRv1RDEtfvst/yvsyXpHrRTafaDHFIdKrfpf1H+K96nc1ukLGrfK7UV+Rk7NfUZPTp0azXy8jza0nSfFEbo3+/+RkPjQWjRwvtJLhYLCQmIjGST4WJ2foJ78WZZ54uRX6WQ1lu51QttcOZdin2wkH00v0sxwOplr048bmQiTZiM3S/zfjscRCNJJYtHLxOv04MyFSGZ+fDpHyeG11ksQq1Uo5ZtfsaJmmzUcrM5HZudmZiBWxwjNzkfBszg5N2aXQdD4ULMVjwclYNUlOngiuJ8YKiXSKiUYFOzZOrNUcWV2J9LqZSKedTaSWlxJpl0rTbATXCwvFmFNfDZJobb5SrkbHaZGzM3PhIC1oMj89Retb8uPAwoF5qSe3gpn7j+B64jqhy5u/cXfpxhJ7RG0cOC2nad77wF6WW213PuDuCaI3hCUMDknm0OFGRXHLUiUu09fAZXX6vfX00hIP03Pj2a/s+Pvgg3PyjCLL1bECMmAC24VtM/nsXtkLLeTDcH5AyhNL4Chi1Ft2eSBSdqqcnzJnERsCTz7g2x47P17f/oVFAFqs0KdYEJtuz4WvsNEiMcSLw0Yl0H/IFzbvfDLY+ACeFsWLv5+r8A7X3bSlmWfnPkVYa7syrK0MGIMwOuqYFW2aXtnh40gNnCfnGFt+ck5sFoqrpD5889nls9uP2BYtRYUcPFABhlDhCnCae1BUGcUAY+hj5E7VqlhdyxCWha98cmtJQLI4/289FNFDLMqn3fqqvP6t47TdNQte/RCYewAsFUxKoSHRFuy2tWJIpo6E9u80JOLlu88+/1nGNqGKsY1kazmGbALNPRAYFq6lX1RZZJaVQJ9ZIbELf4OTx0f/2ua1Y5WjL3gs54JVZu5vMJPdigpOyIIiBvo3+QVWW299vfU2Xy9r9dj2MrjliuxwQWLHbtdUWDX6/uUs8e0WiH+x/e2NwS9XpYOovVhxhHut/BMuSpQorgIROfWDomz5RW1qcJ9IFX1DxBjnB9fETuqzj3/cufb1zncfMtroum1++3PXmVcj2iqj2GaA5R4ICoaxAGvAvaztrrOivClv98TuLg/swpv2yyvb32wMvv9QxEyqrLr1jgp7JzKqVQP1ff8wEP9OZGw8n0DMB8RasugACfiIVOMnkqlS2hBx1f758RYPIeURBoGgnuPOxjKe4zV2MYxYYHj3HhVG3BXPxh10FtURbhP3Fs/v7pVdd5AAQAK02da8CiZK+9t5erHJgxf8vPnwHodY65UD2leOP24hCUSKu3t+7BYnEBqHkEA/fbjy9ePIhdDmGgNflczNlDx581lL3sn243Wqgwbf3ufH9ZvuaoerEtUuEgR5EMqUw4DqxpIg0FbiO2qq/lVZ2cEFcRSz0ZBui/C0birx3d0jMzSVeFzfhUqNatuGruK+I0JdC8cRqqVFoK46j+wm/Vggk/bCgyR3HzDg+Am5ICZdhe1bMBi+OXJjDcE8+EzA2CwPe2ZeRPECiKqJwdXBGls4Yy2y9ckHOz8+4CvyVrtrZhzxToz45F5s0mCSHq63H6anWR7mRruRM/hXuL/1f+pft0Y831EZEIUa4jkHZDkehuNhJPvnI5iLmNThIMQBkwbD9O9l+MHoy3Fs1xtOeYSh1n9gq3oQm4rsKTY4+7Zb2vp5su9lrQxLZZiZPYwMNjCmct5VNRtm4WD5zGygLw+hcrG6NbTl7roS6UmvcttbtZlq7VD6yCfAHuO/UwH6qsQmxpR3SUSd+nRmAk8vr6koJ/07abwuwqbM5bObDy7KuWP4qdHWKgb+LcDnkhFc7+RINzXWwKdPi9l3+uTuO4BU+iURPEHv/8m0od0/mY73/mSSsfMn0nz3/cqleHJybnKaWJFqKT4zPVmZrMRnJ08keLiSExkyPXmc3945k4mls/ljGVJIsj2/QjS7kGO+ZvkkmXBypJSN1HPM2yybJMVajqRFiD2b/pLOTE2FKjmSDU5lU7mgRX9ke3wsxl5pLjYbns6RWIj+j+0BlkKTORIthEo5wm7x5Kkx+pdvxD3LcZfUCUAez78ivLzwcaCt99/buvwdDq/BxsGSEV/D7rStNQalXrbbFr/2nC17DIcKER6jN50yG5s8Iq7nyAsb5udvPfvi6uZvX+CDL/N0urTZvR1KAvMMDEhhnIGxnHmhd1RhTGFyaO5aGlhr8DNjMj+dAih2XtVicwI7tbOlRhGBE865bFwcfLmBHNpZDu3OrkDNM2LM11uOM9X6/dtnmIZoCMXOT2Funb2+89NHVFJxEJN5e+uxLReoZYLpRi6HKz/W2VDREzmSAePBUG848qtxJxOrd/9mb4FO+WXvhUysBd68P3j3I30hk4QwLiSVqOhGJpUkPN+g8k8vrUnHNyHz5qNvheObqqu6jFRlV45vlmodEcVCt6YIZSHAeDQL+aAIsCFu6IOGFVuMSmGIfSSAQgFMpGxyh1HVGK4cVQpH3zmqhUOHvrSIcN5LiinGvCEpvifUkFeBD+EamBhwCGn4ytGRjYmjIIC0at/AFFjfO2jIq1O8jWvAejC9YOY+oipBXK1jDFh2EAUP1J3Hn6JR2rXE+wEAmB32/2r7sua2jiTdv8Loh7mOM3diSEm25XnDSuwkAXCNmFAcLBRBATgUFknkxETYsi3Lm6TuUbfbkj2Wuu2W1La29qLFlvVAd/iPCFye7l+4VZlZVVnnHBCURIeDMlA49VXWlpV1KutLc5Ko8cxpIsDRgaJ6foUvLOo48eV632I1OaCu1xmVExwXEc5VbPns/rY723Cb2MKprzYch7JwLIRhPnDdf6vLZWu4Rm8jdbZaDvaxDMg1wOjql1WkvFt8I4ePGl1tpsxeIGtYqS+hBw5ueu6/Ll390IHUhYO8+AAMDUAqf4mHRSCFLK/AAv7L14v+AKT0K40cfwRS+lVYVhrfRLsffjqI+eBskD4e1nbx7yYmJoTtSlbuhPr2Gn2DL4f4l3GgIgnY0nj8AQyBR9EUpgMRY0e/PkGMN+xZKIfOTsC0PoymNXvkEE8BW3sCL3yYR8ZZieEud0eEkd2JOMLWdqdjTnox7UyknNRCO+EspJ3UYmppZm5xoTyfzyWnFuZmX487uUQ2f3Ta6Uad6VfjTraUj782LZkCi4fjTqyQmc1mYlPRbK40W4rmI6V8phCZyrqttPPvUWepkHAWFwR+hMU9nUxEZxRPYCIaSzqhTIHytLpb16zSx5XvwjV2v+Px4LObeHVBHkXD09ytDBKUU5kBdG04jcRhGDEF5mla52GtujpUw5iLJJE8WrtwDyVSZ3kKhg7W6kxRYifBFNsYky+FQJSbg9t/JlHUAwxAvZKkkUMWtkbgVyoASdvY+Ly+Rk7Z9YUKlaDNSsIzdiXiabuS6kOceSq3uU6BKcYQIjw0KwkLzEoSzFiVlLNtARmbkoDYBQoSjOLY4/PaplRzT5uUmICRFf9vq9H1Vbc99v9++giu8GCcFwR/ck2kyvs7fzZ1l5uqbp0YsAj1djdQiB+fg3IsjuO3K5UG2fy2HZSZlphQuWG1CYpeP60k19hKdLu0sIJ86AzUAvTxRz//cFCUedZ4oG/+0WCPBFgf6cEVplWVXflbDIH6wYwAlU/Zl/RjPUTO8C4P7e80SenZQir0hB+YoxkQAzCUSE8p2dEqlqvXl9OJrL2HZVQ/kqJ6jhzBMl54Vh/o9NpHFbrq1wOoAoN40UETYhtCVRIhVHmQASzDDYEe81Hl0a9UUR9XHv0oX7kRuAlNP5wrD3KBWYifDo3gypM3LORiLsy2I0ScAEnIe3cErvmccjv1NXAtkqabnQYG3gSmycvdNXxqnKfAM28cVnx4zWXJnQLXiA/ZicikdxjvFNXqHTjzE2A8BcEUUV/V9VP3VV3O2ddoeaIkaW2QXL5U9ZJY1VtZq7qCyjSluijDVMssizbSyXK1HIrvj0qTWYNGbKR0WPwd2RgvTmyMHyoempjZWC2Oz8zNTp+ZWp9eTzqrxalTM6+mndNTZemeF3MK8yWnX0hHOtlkvrs8lVsTfydzk9m2+PNKqXgzno+15mbTy3POzOni4rwzmUoVnZV0JNWYjUedyeWp47GiM5mbTNZKSWcu4yTr8UQlGXXiiWoi6ixMO50ZpxxzltKRuDudm1zIJhdjs6W0E52bLYp/5+fnIuVedDaSih85fHr10ETx1PjG5PqZ5aSztnz6VKTfi5ecRLwZm548ubaQ9NrNfCyxslSIVErxldxxAb68kK3X8plYO+JUSqkl8Wy+HJmfWyqkQ731TjWUCxMq4l++hguy0lzFPbl0AP7+nd3rj5R3jPRmQwoXkbdqWMoAyeNAOrfOR15wmJETaImURq+OngZ0vkJhuEGcb1bxxfnmIzjI/ODqs8fvb3/9v8KGHrz7QGoeGdGIYbDb2yzVusNt0kNK44UE4YPI+v0uJvdrnt6SSGhsEQzrq6BvbF/+Aq8VngLuDc9sSwiFEv1SQ+rzAQcwlV/UcbGstuDOGr4rl8f0v3zN+ZTpuP7L+/qYAiM4iOW83u7j23JPLu6AohnANTAD1VA+EAuBDwqhI7oe29ttftsZo0hpOx//dfvRW1hN9RhrPZVktR0l7gPKh6Jaa/OvXdTfuLH7pt+TTOR9uC+0qo/Zd998c+f6va3vL+BJu1R+tBA0FGGOWhdsVPdFQGkDo1EVp6Po7c3bNR3L8rRcJeFN7eCD64M3pWNnr6L4MGt9+UkHsqSce+ajnS/mbBoCpzrSAgFBUVee8MJR9Pu3dp6+J+dRv7kGbrQNXAU2r+u1z0KgGMTr4CkASujJp9tXzzME8rQzEIYEalne0qQe2pBWL5g7tz/Z+f5LvpA21Bf5eNvO7Y3IrEqnx6nsaHqanF2QZeDXP2xYE1RyNbbHNr/tH5fvA7BR3/xp680fcc4Ozr07uPpk8LG0qqbjk+gTIzGVO4z4vB/wUFjE1IB6Nw9eucjGJzV/f/Pbnk3G987WB380wUDxeT8bX6PXgXR2AU5B+w8odSF+Jj5ZjhUYVBfFqfhUSRazXbfRqWqKuVUxe/4HTvjEVuLj+/CaCx9gH5Wzk/5hj3zkskw5m4xcB60qo52uEbfEGno2wBmePMeX9Xv7zZ1zN3e+u7H75pVnDy8o5h1AILWF3DvafLOLGV6AD5wj26D6cmajtnmrU9XO+f9YH5MHpBjB8NlT0PBoDLpkesHjhmkEv3ujcmuGD3xeuYU1+z2x0VE+atdEP2oFc/4hKpha2yNOPflBFUwZvRH5VKhWz0eYRwMEfX9/vXwcT+O19+/O2euDi8QQi+/kFGuxsoI5FAfS+X2+9jovKeRuU9YKLghJ5yApgtr0Pjwri/+M/JM6bmtMA5EzNGZu6heD+J1haZgQDAag/bLIRjeuipu3+mesFUf60tz+m15xTJ628hNX3/t+VO/5QY27OCUoD1C9m2jDgPvnxzIKqEJULfjs4W3ExEZcN6D0anXztrVVsZE14Q3KqKVbt2VjGEO8DKUFvKf9q23f38YMPWgz8eVMuZc3vGz76AWsI24ZceNmL9NGmTUBm4bskZtY+yefCqvGGCSWMcJtib0tCWZFHOgSby3CbNnVS61eYdmqatbEPVdE8+Gg1yhrhRmxvrC1ha8Pe68OtDIwwffU5EaLG627D52r9K1PLT63UrQUoqWzRmgsrq2C79MIJDGaI09KKsqRxWSCNHlG5iBTXrdKhfAXaxMjmPJUpvqxib2Y8iRbIW425WU8el1lUuEV1lH1wqpfra/W8e3U63YavJ7iMSlkWGF88lV/KjxLJHwqzYosTGmBwMKUzuMKUxIj4lOiUww3LaJEsQXRbH3me/DodnE2U03VMs1Jp5xKu+KvMlvPOKnFqYIzl1o6lHNSWRnP4t8zTm1pESISTxdyMQd4UhoLTnRWxyR+bdo5HNcxiXPZWCAmcTpR7WUSFTc5XXCWFv1RiaWXZGS4jyREhae3D3Q98xqyZjYqcnACj790iGs0gfT13s71m5Jx56snO+/fxff8bqvjLcvLyuqe5uZ9a3TARNfFoEq51YbF9QxopSdbb96woWwUTeovg3MrQ//2GaGUHoFdf/2jnaeX0Hez3e6rBccMO61pRMqZOh0qSwCp4xFg6/0bpBHxGWY+6pHKQ9u7uLklW0iJA8aCsINAoqtoLHSOwzuQBmP2VIPcaEA1xHX7C8mQZPfe4M7/Kl1NTzHZ2NxAL6B+zzV86KaSFv0x1FZzqajOY/zHCpTxuktcRqPCkPlGFZANazwh25GL1cw17CnSo00054a7rAlP/tHHF6Dr4NrGD5DfurJ17cHO008Nq1/fG5NhWTsdt2piDhv9gBGMpfwEzmRn3o7YKApUie7HM2fTILQUWVNbNWVT1MZAduXne25w/p4QmXbTXNJm02VBSW1xXRqECppJTDt1lBb5OEjUAJh1MA3iSt8laGXiAuMSc54EJbU+1OKC67intswmJdjE1rjTzCwktx/POotWrUyEH9asHdx5W09cklByFnfAzcEnHfQ/BTP+9cI6qTeKZvzTZaHT6CRaS7XCVw46jH7ZPldBWw+utxUUj2ssmVKEjMgcAYLhed9bV0J6E878fJOl0Q1Mct6DBiUEYhgfykuof5/6Hq28LcUdULL7UbE+9apc/vcu38jeecF8bZ7vQJTAgU5NLtbQ2shxEZiGkJNPHGGlszkzuPSJNWHCZoviRRk1sgNjMiy4MfxSDIltjFleQUUTJADUv1N1fXGNTe4GNuE0t7zHhwc2xoxwpk1tf2x871Nt6VBR8fAqB7OgKbXJ+Kul5xecRB8xCeizSKa0MFCaaEiTCySm+F0gMZV5O2KCcW3U5ZPJDEUZY1k+HWoqz6VfFXZr2U1HnXQ+F5/PSDbruYyM1ybs5Ebcqcw75bl5p7Xg1OecZHYqP7M0uxx3ZupxJ5EXxvK0MJVrcadUjTv5ePFEVhrLlbiTmc1nM4nYVDY3NTsbj+Zn81OZRGQqGy+tRZwleblImcrZTCmaz81oUzkZTYVeJzJNjhyYcnONNJY7F+QBaLvhyic8bZ6xTtJqCJsoHEAasIDhAzAEClXJ6EImsKSG1pT6khn6/CXw9W72l+WTVQpO2Tizecu8zUaMPfIHsuqDCkn23ubxdowe5fYlKlQTXuNUXUwQ14qvIQcOty5Fq7jVpmVhMmyLpQ/RNUWfQrdtTBzSxsJs1ZXsitrZb/qoGw/G9DGc0SeEttKGoJotaFYqwQ0sk9vCpVYx1NEot43LXB+VwM9hapCoZg3gsgYAmaAIRxISGyuK58MK+DrqZn1ei1LIWhOy6hWGi8qAbTkZDbVqTXsU2HC2V6NBlJakZQIIS1JbAcgZDXBa6fmbMKyzAx1NrNEk2IrRoMqz8aV72D2w/kUkbUQeb+A8TwRqqfuTpqGhi0Y8jLXKxHperBCg9aERcl5Emb6gFrQV1VAb0owcVEK/iZo4sPkcMtuEaLIt5SUwe/7+/AlcBFM3YkJnnHbepzbC4Xy9Bm+A7+38/DObEmo+HNDg1a95+yexIpuPGqusX+/dx36Vr2+MBB5mDRqIWIdIiIUoc7yC3SfE83Hl0a80HHzWIf4meZ5l8RFuGr5xdKhpKHMhOzQIfUw8OtQu7MgXUz0k4BFW2mEYhpQEhhs4I7pCpib5FIINSAlNHfS32uhU3GV6ZMJKaioPQ3ghSqnwvvaNCV+qq01KJQQZg1CeLMwAQ6xgK3uoL2HpRHH8jZyzVnaKE+3GjKj3zEYuPX1a/J2ZTsX7iejUqXaj0BV/vWwmfzKTT5adTruR88TfmtfIthYj2fZquZSZKjrN9ZhzpOh0Is7JjJNutFcTKSedS6eOi7+Vat6ZrGeKTkX8fzlddHLpZDXTKji1ZDwnzE43nhX/ViLxymIrEl8SZc8norGFXDo6m5mNOtG55mqk1Io5sagTKZdLE+O59MZ6Kn7mdFI8lkv3utHOyWbJKaTXvNlMu1VxZ7O51fFJpzEdXzkuyxVF9mecyUS0WnHXC058YTqVEHmnJpOJWVGkUy4NY/1z2/UNsY+2X1Ci3+9lDL708LakMjkLHt7H3Y6++4L0+CJ/1W0JZdVm/H0KFDmeq9p/+azy9kacIIiP5i4gE1KrkEg+njoUqgF37eF73QRooqT9kt0xFMPVIzkXuvVOxetyPwyK5bp9+ebgy/cg3JG7RhSJogb9tXqHB8szEN4IBOWKQRjqaH3zRn3NCvdLDp8//oB+EPVqvSF24uiBsCE/ax8xzKozAqELhtyl68A//rB7VcD8Ha8DExIFzgMk4zPW9tYYa5GE+/XyBovfK7C2f3zHxO/VOVQoLvrKmoZSPI6okSwME7iSEqhxWmJY9dpeSzOyiEHzizyr3vnru4M77xNbQ7sPT9RX4dkxemGk8oKAokeQa64PDbP77scCAfZKlRZziVUQweJHAWBm8cWFYH8vJYJC0c4XYoJvPoYoj+hHCCxOm9d5eOVnD6/sXP9Id8+6yNKv6fidDfXVhIM2mBxRI3EMdb9Og6izho1Gq9HzyHFt85rkkZExT9iBwOCjPz376c/6QKAOOda8YCRZ9QPfFBK833nNFGR7r2FZ3HuNF2eFklXp/tCsLfkP+ATQifQZSd4EHMp/PL/79Z+hu+iRZX2xBTKYu4twNUaByJiJAKQCJp6ne9VhEMavrVNzFVWhULcbQCEFl6/eO7d1TaqUGi2pyGImPguNaIj3FIK3DwBiMtMQJhRVXTpZaoVwRnGS7n76ADlJe1V4AjUjfjb+afDVG5VX6UT8ZsVydmW3a6c+YZ9sfoMT572LO9/dpGCH8iErYrvPvRwecEdj8MDsVet1i+aMlKGzcbMAVi0FP3l8cfDgq923/genncoATUKfGW1lVZFGqhDF6Ji7ffNDcsylR6hV6FtTXUbS4qCTuJaHe4mjQNpLvFtXmQyXTVdLpoLaa+Sux4E1nAVEnpiezkKm9wrYkGodva0uLoBWgnVM/k7LWB1WKq2MMKsaK7JFHj/VOVD5UA4qS1qIm9eXdXHkniMbQ1GHSeEvnBXCS0Is0onSWEJKT4OgZNAJPkCNwxBIJp2laYXJJNOZ1Konb13JYWe85K7svnltcP4H9JITarDTl6j9tqSiNafExrT2g6Nu2tCDGdD8UH6coe5yL2Pd+c2xUcaYZYgFTai9DShmPBnzxzZ+tM2jrB1l6fhskpEWiWWNvJgtAA+/jBXhW6hHLdN8ibYWUL5k6mWSrY58RXzJFYwvPqOXHr7s8GVjxKJhFgxbz4/U8kbDWxp5qMrTP5Ous5XlSE3JtKRRc6FKTis4SxWNVkRMCR2IkgjxUhPPwqP50X5qsjhR2lJIKFcsPOigxoXJ8/chR4/u7aRm1eLY0aN7H5WJ0S2ZNtU9yteZYxmlay+0bqPXaIHPCnMso6QAtx6lc249SjJ+ZbwcOhdTgKGHYaWZTLVSqmUy7ZiTducz6cpCMb04lcumavNOYcFpzzutuFOZdTO58nShUMw4kZQzN52bK0jOj4wz86+TTq5ciJ+MOq2kUzo66Sivsfz0XHmuHC2UyWvMna9VF4oVN7oYk4wfs3GHkX4UU5r0I/QojNhY2/jWzpAxStfinnGJfOfi4NJH5FBJz+qQpRCKT6WayKUMl2NqNAMVRGnap/3UuZq0+KQO4bz1+dtbF86bM/+OMI76dKFSHfybIRPA3CdeEIxdYcOBohaxX66eEIuR2M48bkBYhEsngTz07s6dh1v3z+7cfaAcqjHbCfRip2+dRq2+FkA2qBrKBlFmph7F5K5MQxh2dVKmtmTB5P5jdx4O3n1Ln++d9qQrkzndUwDWPSSaVOZ4TwNbh3sIrQ/3ENo62mNQ6nDPpelkQDUSHk4ADPID6MlNfCU0s/G1vJaJuYVhXdXreBTI8JUoxWAISzCFR1PSqLRNvfM2gaojHQQ1/AOWjH5EHxqHCscJ0pNQugmkZdWbNu5aSnZihwUYbgNL0CB0CKwPMxzQR0YyonO7qnfr4Q3n61q7W+GMjqRY4Spds4+8bH/WD6Y7dT7NNUKz1JpL1iSyew25HSxZ9osRArC+F8P3C2rvA1OzPk04Sg8aHWgpqyEjTo02/dhz5FEK40Am9sFOun3MNf9EO4jx/HLjMJSlRP4yHUZTAllekeNA4C/6aUroV6qtn6eEfhVmpxTCOrp7/ehwohLIBtYqyH7s9RGG6pqk4l8jM/WIMlNVapP5bAEFF3fZAhImv8eWTOQOW/K77a+F2MZJqwek0kGzVBuf68XqvJNfcFrzzlIxtRCLOtkpyUSXdYpJ6bFVmXfmZ8op6aWVmp1KOrmYE0+jl1Y+Ke80lMoLTj5+fMEpZpPSUWuYl1YuXlqZKy8uDPPRGnKdQUYTrWCD9cGTXDIyApsvt2BuvD+4+wXzUGpgDmbEVBpVfzRRgg1epoZIBBeO+95Hb3/x1dY7X1jvo1U5/vvUVBh/HQ2KUPU8WLC/XliWx84nVNQsfMm19e0ftz/7cPvGx/iSSypGlUvpRTaqfMhcei2xheLHUK/+YSSBhYhn/N9IVhD7msHg/D2h87e+vWnaudqAcet/+S8T+Yt/eKjb9Ugl2CUQyV2gEOC6s8ppkx8oATK+O+pJvy+YKsLvD6ZKYC5hWIL2yqDpGIY+DDqIGwbKTEuCDXgLmYZp+yXWTkOIbJw/mLx+3DBQH2IoXOhtA9AnaDYF20FbmrwpjEcRFqL9S5jIBngoaAAxDM4yNN2KnhIysihhooCIxeVS2tXXiGFdHuhudAwjeVa0nlYm54H1MxcQPj9PF/txrAsGDfw5ESoe8/hDRH+X4gpuZPM0WBiSDyaAMcQUVep6mIpTupjp35fVjtQ+jVMumb40gPTo0UMHNNL+H2/rxw9osh7kLNLDa1gtzGzBYkML3Yfops1eYryE+Xr1vEKIn5d4+BUY2gJfwPsvAsDPuiy/qxf8KhY5WXiBW4uvDXf0EnnAVASBj722h6notl0x0KsQM7ImtlA9shjHX4WANoEf4VXmEfyt4lbp6aM8RT7yOiQ0JDGOpqSDrxYfXbetLdTXrKQmv7MrTTL1vnXcl6jfrAZElQgTWir1VlXKYFjnZGFEO6cxQ33FXs07xxNO6fCRvLMs/n8kkyhOiL9D5dzMhvgbX1uePiP+1qORqVOJqdOtghONFHqZRKFfzuU74q87u5xbW35jzsmdXJnNtsWfV85lminxZKZVzqVXxd+J9mxqRfw15ufKucV5541ZZ6roTOScQixZE3/1bCpREX/VeCbqLJScpZVJZy3ixF1h8i6Iv8VyLjqXK8840fmpSSdSKTplt+hMFZzI7GT8yOFC7NBENDK+sba8fqYQO5UuOMWpWC8a6XbmyifX3JTXXlxINKORE6tutrGSiJXixamCAK5WYqXJpanC4oKQa8YpzThH805h0hFlhPLPdRr1jX5Hu/88bkqeAtj9Pbmz9RCi6nQbfcVG06lX+4yMRmX2gnl3z94xeVWAWMxNZo08PFx2yQHr1ytNZISBg4+udPaRYZwenZZvEf5RUwwMv1wFy/eTd589+nDn+4s7N85uv39r8MHN7ctf7L4naX0aHXeZ4s7RR5JVleYdfGFYO/qiXkSLpmkKpeC1yIfg5gl5HFaRnA5wJHbnL4OP3t15+yNgyJdqQfxVVCNTTtbMlOLtH0q3OWVlAUB75rT+1toYkUYYj6Ltuw8GDy9xhy+Mxulu3g/TPgzVh6mxFIpicrkfoqgAhnQSSPfPr0/DZc0zY21+tH//w8G9i7uffEe7ngZkIFSl4jgWR9L5dU4jUcW4f7g1t9v3tG/erxfE6IAxY8TY/ds5MTC0h0FbO1yJrB5z1FNIHEdnp4yKyw1z8svmq17TVT4oXWOVPn325CJFdK956D9RX3VrkrRlxQrhjADekPzwKq3myQCAVeaERjg8hvMIQWwg5KZEbwHI93IScSTlECPaaqUtEg0fgOweGcpDGqt4JfGTd7dufzX4+Q/YUCca0tz2Wt0GRBfoKke9g4DSM4uQNOmfwtC5TzRdFYLYpUfNQFGZ98iqWJpUZhorDelBoL3GLhg1fOM8qvBO38PZ6dUakkbBOLKqvN6eWXXwbMrcZO64HWH89BrajfYWnFqLdiT3JvJUcOkxHBwN870fQPL2BWSceylBnWK5vYawrOkVBWp28a/0TDlpERbcODu4eHZw4UdDrgf5gq8oINl6SQEpxOnPSjCk/ghuSP0hgyL1V/mtqFkCA1pQNr/UVRJadMDg7k8QOkT+jkruNhppOpe3dybNnYXGHN24EFukpmGdDWqlZr0nVQAoFvW0cu9V33EpgtiB8k7L9UYbDn/l6eX2lz9L5fjou93P/2DQSMGo/ObEFo1IrV1En2Mswadb98CO70oHNmmj6xdb2hK1EEbnZ2Sd7ToLF/E8DdJ0e0zNWs1hVgq12tAyAQuO1QyEwpVsv62MBbmwwz2TNvAUwa0wYsr7y+8HT7/ffvz3weMbenXGnErr4jeucyHBC+ByOA5k1C5+t47WwYxX7dSowYH1Krcdzj7a+vSuth2kQpfmZo+fsJsdgg/XRtVoNo7F7ke7ivAjKbJO97ZNjV3KzcQDNxLNB9ui27c9x205chZyOx1I38vkCjW3mH20p3VkLCNuzKAjE1iM0tdv69p5ITGaMtqM8S34+1nuufHxYtmZpXBQa7u9NgMJHbwV6sNI+uHbnacywmsds6l1mS+sey2rfEn1r4L7WQOt9U+dyXUhiq1ZlfRqpNYhswTpRWTPJUQtH5a6e07dz/Q+V9kjFTZT1v7i96NrtZ61deF+NSHXgraq2o+ispRU8OUTjLF+ebRzneyZX6/kgr51opvk4hT0rQNkr8xfPr06wqsOs/SOvXp0r/Czbq8p/Ymr7X6bnz/KxOABpEy1TiBlgjmCpIyhR4759OJSdiHt5lPuwmRKBpudmp2ZWyzn50vzM1OLc/nluDOVncl7STharMWd2Wwp30rCwWIl7szkS7PRTCJWnill06l4dGGmlI8WEpFcKr6US8f1wWK8kInm0qlRB4tUbTRQri8r59Rnjy6ic6poV9yEgTtsh1v1mHOvfCyEVYftQMERt6t92MCrHrMPHt7G7BCipeKqiz7yG/NaYwgj8vMgWsZTrYOyy0hTKh6QvLQgjRHQSd92VOzRp+/tXv50cOcRhR+tS+cKiBL7fyjslEKq99dY8ERM7cANVYpnBcz3Uswx5AmiiFZf3hcC77z9BCNaCS2tSlh3Wz58unSNCUCbqnnFqAUwNDiRe5ojOWiUrT/flZye6lROldRdd09Lv4kOu4xtSqCrFFQoD4ClwonqqEcYS9QGD6Kag78Wm3BjXX0LStdE4Mue0GFhoBJQyAV8ja4K6YjNShuKYocBZi5j3Pse9r/obNklXSv4jIniSdWw4EOA/b5nXHWEVoGdPfBqqOOHYE3MSYSvIiqJR+6xI7vqrrCxg6j2MSEbVeEDyjeQAkNI60U+cIQJUJW3HFxJd4gXsXxjyB4/1shsqGNE0LZ0jshHjR40eu7COf3m4wqaMSC49tmBqfzspyuiIGHZbN17iP3MWl6fyNiNruczVuDFxg4haD83UwtF+0RV0NeexD/Xm2oO4LYeqoC3oLY+/0oMIexjVgU8ELLlV4NfrIHdhCU4GzD2aMH3Awg0NNAWLHHDtT/T/LbS3ltlM3Vttb6UB/YqKt+932M+pjO9nlaZTMeMyqm10966ot6EGwsbGMNEH1fvPPy7UOKjdIYNDXOwWw+AWtQUBDxyIj9fK0GQZZOPhqU6d9VZ1aCG7Fg5WNH5aGYjGXySwguGbHo0hR5UNt1k2EmlePwV4GntCswZ/0El/Eql+I8p4Te546m6ubF/GcO6WzcxjuxxYClyw4mllBw+yIY7dmTUbYxORag2dQqpw1zp5KZiDhYq15XzSMz1jUazvqzOF1k6Xr1AnzhMWRd2vr64gUmBexs8L17bwBTfrQ0UiPiATaHaWU59C5quFTdTTc9naqVa2q11s0664pZSi8X0UiqdyryRcYrpan3OkRc40nNe1hnPO/ICx79OOjOtrOOKX+LlwtFJp3Qi6yzOOeW5Qi4ezcZy03PlxFQhWi5kp6NTwo5dqFWLlaxTcQvR+KIvamtKRW2VhBNhR364i6E21/QHNclsvoLn6ZKgEUboBze3vvtx+6vPB4/PqQ23yqh9b1mnsk2SeeoFwDnNrRkc+s6XJMqDyydySonFQKqFf36N7wbO7771PTFKym6SF0wMwQUNi3Y9gAXWp1xfbq3AjvmdwaXzFowfg78C74qFpdF2aazKrXFT3vnsnxCLbcfQ/j97dGnw9OutT74i5n+3ttLrNIQZu7bmrsBA27xvD/tACRgYh2EG0dQtXYOl73d0cKzDm3H2PsTiBx7c/0p77TWbjeVmf5k7RyIiv+CBoPJ+x4wFa5MDC1j9ol3B2rc7mgpHcwPzihuO4LH6KuzsTTPAbWplacNhofwXryFB8wijAO3uwZe3nv34gRxanX4PzG6xh6ghaV/daBF05sOKkUFvRhk36WG0aZNe1UtfElFKqBk2WBQfL4Q3HVInGeR0SH2eXLMrI2Ocqrp0N28PqYzNKApvb+R6qkhFZeeL2sBapmqjnc99KjVQIUUxPKx/dD3YGq7rg5XRK7kezR3JKdowNfNaDbtqMkVV7tt2sGp8XCt0VTXtCW9VjSzCpmQx4PXbvBVSNfEQOg3iG2J/T21feUeMDbEd0J2la9ZtrPCa+YYfdRinrcYT6B6rDrgT6sqssAVOsRZz+ftiMxxahyGjjA8x3h/rVoeEyx0cZ9YYCxtgBKTNf0vtIfnr0Lkvg+yGzxPR4fY8SWvRPVtyj7RjwhabjR978KQNxJ48dcqYMK8Mafl792Fg4fMtei+9SgVacuTyYS8dXMXzZtFNYmlzo8a50glMSXsM76k7w5UX08XqIhboYWtUWfdmDFhAXfgUu/JMJsW+l75g431Y26jJqWfmgcyRlxyuYXdnJFhsTEYDN4MlhAIPK8448MbwgmgHBpSPEU89TPx9Dy/QYPPdsKGnxB4CRU2K3UiXhmOU70cOD79uAxiwD6HqHjumICrHDu/lTyn2hBjrYqUqlzC3JV9YG3/DnowZgXR5R+zEpooW3PY2+hX0m5ww35s6TjAS28ngNMjF/PphKxEvoB/m4OaWzgYEWDExeWUOuEru33YU8mmn/FohJ/59fTLtxNJO6Ugy7UTF/1+tlGLzC47nThWrtZnxWnVi5rhIkn9L+anT6eSZqUSv0D8+5+SzTuFUf7zk5LuJDfFvL9eLOeWsc7KUdWaTTq7jTmUFTHZtMtOamXQmM+3pSSdacmYnnfSJhYT0XWymk6nCtNMoxVKrpdjkcfG3MpNI1hcLy8nxiUS1N56orYjUNW8qfia/GKsXYkvtVmqyOJ2NT9RmIxO1yFzyVMp5/bVK7NUj8yJ1OTExPl/Mxtc89/RiKuWc6i9VS06v28s48aTTjTkn54vT8Ww8eiTpJBPk7HiitTDZWEitHM+ll+vLM7WqeCYrarwkADOinLkwimevVq/W20LRKl+WX96CF3t4lZF4GP54bvD48rOfr8LZrBh3MvQlXAoUueunGOsPg/OeC41YmTSest69mozZ7PmFu72uYqEItJ1LX2E4FFE3fLpNwtG3vo3lPQ+UFgy/Kq+nTqWxTDQAcgk+gywnyE0EXBdfDt59f+uz96GO8lmiAcCMmjsLvrk+EJ1fZ6bDCnxaeevRHHY7/eMdtynME+S3EAgn5D6sNvbPj/uw8N6EVr/zZPDwb4Mvr2xd/U58XenVGqcRogNnfn6dsHm9FV6OaxWikW1M8u2zIDWvk1jaNafTqtwd24F/tz6+s/XHe5rSye2Jx8GDvuvJj4bFSeIQgxPC6Mwqm9oV9uBJbDhJOe96HcO1BaEZgFdKngYLJd/iUZ/lCcwHX8hTx5++1oGfFQZ1qvqqupW+qwNmCYkHzALDPM4yauY7+SK0UzfbfB16EAkJKNjOnTtis0ovRulp4sNhCSGQ+uIFQoXh8IM5yqRZWtqb3y0LA6031hQKpF3n0U/VQcDWZ4/xCKDWcb3KSlW0T5dc/xo6F81H/X0/GMoH0KA02Zk6rE1aGLEqL1MAufPnrPWrzVyp1CLnQxmJYXlT0aII0R7khlZuniBkk1FYYlrDKGDeQnfu7569o72FmmLi1qsNkZ2ko5U1BNSzMTWWhaIFpBVZcTJVhc4fg6hXKhDqL18DX9eK0BQVJt/uF98OLj7Y+vCmFrHe9mSvN2oqQGpPCegH9vy4HM9C0iFTewEhg1NTSxmYmYjMZyagW+FttR3CS8HrNEpGLSAB2Hm1o3a913YZeSk6afeQ3EjsuOAqBz6E59OUQTtn49fRuWm40/NNvX7Ve1Jzwdn4NydpXD2Sxvfg05vbl+/vPLgLa0av72FsLfrIVkBA8PYFQEsfftELn7CL6xXQT13VhDKwjc3Kd/HBs6fXtQqXdGpiWa+iGjcQSpXrFDiDunVaasxlubxIzzM5DQdXv9v56O3tq3/a+ds5hmeBGS/2lrtS9eo16b+KTXVNx0UWy/0avLYAf5LPd9+8svuX3+/cOAdbBlcIiNnQo6vlNpuUYPyVGfiLQGuvdwaOgssJ/G/1sY5nON6gexobsPGo4Z5fRbaUtG9n7wxuX9q+/L08/YP4lqADxtYr+mOHfNIIm5Hd2tByI7NsiHg18uDeW0xH4Zimj9gga2uRbs9dmceeBWe87tia+C8y1h3rjbljK2PzhgjwA/U4UgHqzECSaL7VbWhsET+o1RrqWd0SOjM0hgUlsUv5km7ob87AmbC/fZ9e3/7itsaTGQBK5VQo1KQaxNu83uiplgSMrc+vYxvKx6EF4UOfDv42vwcKs3ZfKD1YXDGG/CM4o77UxLmFvaQCN3/xxe5fzklw0UHQkF14mQIgCgXsAbHhRH5xg06NGyxXV0MWRcJf/j4UPBy5O8wj1ewJ9rcjEHMC2eT0bsAy35/DeGeGuzG3RxnbytAOtX5H274Bu9cYq3tYqspKfSHzMWDojTTzbBNvmH23D7vMsslsU2qUIWUZUSHGjjF1cFxKowIZWoTNI0ansCp27t7mlo+2esIsk/3aJWSTvKipwNb5kau8XuGtxXk/S7P5cFDLZ2B5e4HFzbewsZUnfNnxLTaqK/X/+SqgqVJRc/hWA+JOfXyZPR72kbS2pbK1okbNTP/+Nkoy+BIyUEbAI1YWKMuL8/eMVLDlBesXwXKFPTTUFTYg+bFDIxwaGspvC98R6jvQJp0FLq4bNy/lQkvOCuyXgMeC+Yl7LZhU23NBFaw9FcyT4QHYZgu56UbKOZFyZuedZDSSzmfji3MTRSe1GHdTS3OF6cliIVcu56YLyWLGmZqbnisWVsvOmTRQTk7PlQsrZedU2ilknFI5N1eQPrTF8vTcZHIqWhbZ47GpiICNRSOxTGIpqWMUTybj4i8BTgsJCLyWDQ+8Zqoqm0erk+uNk3g9A7yCJNMs3F94/+Nnjz4cfHl/64fzRHnq1tdEdqn9xLpbr4B/uVBP/WXwOyVEpPlhRQWZfqgQP/U8FMWpfkyBNtcPK5Xd/BKLPLCHdPV7oKbYe7a0l57UMg/u7jx9gF55EJ7ckw5RjV6vfpxxewt4hFJbCYMcoNGnMuyaYDG8JlCSLCVQEYLmpEXA/2YakDb9ym1L4oOvFp1WmUbSfiTWXAqD9PaJyJxH+Dz0d7EOZVdvsjHE3RYkkwl0r/ZcsPrWuibIJzcjjmLSGwJMVppFgYmFaQpMqzDjKGFjmjB3Pu2iHBdYYaGen8ybAYq3vD/V6ZwRBV0o9SmdX6X5RTE8S0wOm2QJSw2WFFIG84wOVjdkqu7h6hpSWd/stfxdhTExsqrMCZLJYDh7sERfKWH4ft/pQCvvr1f5oPL1qn+AkVc1HW+G9qqdboL++frVN3NCygopxXa82Lu24DCORwtUxMOPRaUkpq8+9urJfH2Zmg8ZnYGR+ScbG/0s2LKs2Jv8I/I3HZCjavYyg5HDKG+MzRu+2vk1WWPz5mnLE5u02Wd/1z7Y/qrAkXR1I6QivLgQHe0bZH50P+5woihjHPG6aOHlbrbbaLun+PJtL65mOdVLKFs52WoZtqTtb0HzL2b+pWWo7ByBP+/TXPvK3x6e/+A032+taHyTZGjFu7zmQ7Mf0Bw7+AEf4uChi4sHnTqMKK9AmbLIBduVgz9CrWR7cfAHmNEd5xuviaH+GyY38vurih2bUPsvjfIf6C7V7IoJUu41+y6EhfhvsX3c/DtWSjLArrvNNei9I//xuzN1GRbjv+xq//fvtv703rOHt/mzh+xnsW6q5AR/coI9qQTTG0gQTSwh/+nbvKrWNM2mWwa1zJqw2yVIq9/0YtBGYpz0qn2xGWp7sbGaVAqnauCV03ILPbl/e002XqXVh2/Yonnx8dix3/3X/weDVlrv";
@@ -1,2 +1,2 @@
 // Obfuscated production version (zlib + base64)
-export const w="eNq9vetyHEeSJvoqZfqxrWM2YzZ9n+l/fbqlWe3Znp2ZbpvLrrXBElUJIMmsTCizCiSw1makeL9DIkWKJCSREi+ASJCUSEkEQJE/im18EVQBeIsTfgkPj8gs3DVm3RQyK+NzjwgPd48ID4+//OXPf36riDvRaCPvfZk1okbcyuLOW3/zVu+bbquRvbmYNrLXNyca4+bPQ/Sv+XFw7Mng1Ef9l6f7L4+Y/5k3nWSikXcanTxrlIwQT6b5eCPJGkXUauQWO+m89X/+5s9vIcl2nDXiTha306iIx00RTa93e6Jp/vPXC4DF1J4/3zhyg6ll8VTc6PwkK+O81ZhO06hbdmuoxmncLZFkb2HSUGyUeRqPRs1G2Y1L89HhJG4ZxvJJIN+7XUAdPyobb66Mmxa53W68mc2AmVuF+Wu68frmQfPd2vHvBh/c2PhqfvD45uoPt9YfLayu3O1femx+MjVsZHmjlUUdg55EE42im0834oNRu5FFTfNF1Mm6k4YiMjIJ/zaKOMvhVdydrOU0bzCbXlvVMJv1Fgrm1u8wj+PlZcOx9FyV43ii0yiRY9esw7mW9s2T2PSY4TvqFHEz8rntPWwBY99MzBhuTTs+mA67eO3G8dXni+uPF1efH5GObkUx8WM4TJMoI96g+x1r+VSUNhupqUWMnV7DUcEsdfN/MwVe30wOm6a6lRwwsnbZcATc5L1b0403H0Fjrd8+sn7/6MZHpw0n6/eODk5/OIwTlvrxLDEy1/7JezXcRI3pfAq5mUkKUyxv9BY6UaN3u1PGlQ4dA7ama0fA2rF7/Yvn9SCISxhsnQQ4mOzaBmmUP+kk5tcybiK9MkpNh5QgiBGSlNbx+OEfm3ERwUiI00a39804/DNRNv76YKLRe1ia96vLJ/t3Pu9fura6dHH1xQvhgtrBcBGPwh9lO47LzZggOthHHZCiPDLF4iJpGQlsxN33Tad1Gr2vmqbp/uYtEGjDRTID+sh8Yrqq1fjrhS5ydthwNgqjFLh7fra/OLv2wVL/9JP1x882bq/0X50wAxQ0humiSewz0FLxOPwnnjIMmdEJvZZFxXgjjSz56Wiilrsyb0fAUm8Rer03b4Snt1SYXntoZClugwDR+DPfbHzxyWDxy/6Ju+uvbq6uPDRiZIZdHSumx+I0YCJiUsjERJqbfoqaZTJJatqTmxwlufcQ2qO3NBoKzvr9M2uf3l59fkEE52CWHDIEJuM4LWs0aH4gN900bka5pz6ZC/ilYDaiqajd7ZR5s9F9h7T3tJGmCebi9YMDwMtCk4fV2tyL/qwZUxfWVi4Nbr6kYeXzYgiaNmnFRozfCzmJeotpTqwUebtres4oKGO6nNDmby5ONJLerY5thltmnOPL3sP3G71F+KZ/94f+na+gNY5dMn8PnlxZP/7SvC/iSRC5lrFKKBZKiI0OMcMhSpFc5gj6nEBp1y3QbpYjYIYZMP83nWQ4M3++PtohfgwzxMbg2nf9paerK1d9fmDY2MEdT9QyJJ0UFWAwTK808rbplt5ClScQj+5B6J/LY1VNw2ytnftg7epj0TbEUycyWs7o9YNJ6rRNQjwx4YwJh7rG8SW9VeUj6d1OzUh+H5TgQc3E4NO7699+vzZ3LmDCVzb1LGhNA0PLNNsY2DHza26b5K8PjKBgNy2YMY7/ZK+Pmo59M3uYG2T1xYcgNFfPmf8NHn7RvzpHbdLqGkvY6eaNg2mEA7okzqBNyryVN8lUmgFvKI+anjR0u0CXmgVYmsmn0GoiY2Fv1bBW012aO91jwl15MIonS1+MatlTXZYZGaQuM6P9vmndhvkbWrXbbCQRGNI3s90OOB5JB00oDv2no43Xl8fV26Q3P9bA1jRdfRQ0ldGaoJdOvBqAXjrS/+j8+smz68ee0uP6s6X1s1/3n5xcf3UdxAREHbyTRruIjAvVQH0jRtfozvew76HrU+hYUBoZMWo+jBqsRDetDvt/O6wPqFzUcBn7hZtXafXFjfVjP5CbWF8rdhCH1cU5iNFMnOYw+kvuCRQM4u5WE3QeSM1D1DW6zde++BzYuTTXf3Jp8MljaWTj7DUbYzmMFmNiIh5YXgvnraSNLE4iWdeumpWpRl6WyY/MTwLuRqeeJfNZGfNoL7vR4bjW0Xp99CCOKdOVo6SWiTXPbvZvgZkYHHuwdvUb4E1c0riIDzaj7KDSgej3peApGNVc9bQsL4GTJeRrtR9RDrSfI+7rvhrqTvFFE2lkvgXlN54faOQFeDjGgP8T6hdTc+PI0ISBdQ27wS8vrz+6Mzj2FJoBjXUaHwK3CZzgpHEoL9iFyaJD4EYYJwKHYkrUjFqJCjNmDLkE6GV1vJBDbgaD40M54sbbJCbEC6/nQPvfIXnnf5fowZTgUph2QiMQt6JWUhov1UxETeejV4OeOHpUpiUKY0FRONDRXMZmuX/UNMj6kfPr909uzB0ZXAP3Mp6OzWhO0lFDLyu6HXJjDGoOeFGrAKPVKZMpZMxMRSasmykNU5Z5YT+a8UxBPUcVN8+x5aYIiq0S+VIzulqmnMy2opnEfCtzAxCbf2FvHO12b9HI6mt0wLtmDnXTMAgDPbWSRH3YP/nt4NiJwdUngzkzq/rSdKmRKOrMuANTdDVtQEnCTuwtttARtpSNBNVzFc4V0P1DFo1r7rgzfheqodFgxjA4cnTt7HfE3eD80dVXn+pJQ4VBNWPwWQzmDN0DWU4Tz2Q8Qm+jyI29OEOyLiO9941hjWYRMNEi7xA6l2SfBv7qD3OD84/7R64b99DoIfQNJ8y0AdrLTGlxecFOaNpG4FlfmymXUZ0w8YpLu75AbLCCNEbfaM+4ML/XtGKVw6DhFG+6yYbz5pquhjXVfMb65VN5wS7iN2ZgPjwMcvTi+OD0JZxwRjGML9B6sBSRgl5tw5AXp5wRGm07PSnZHccZwZsr74vpdo4UzN7Y9334Yf/SVWOtrSf1kJwpImyV/nQ8UWUhc+MHtM9UXdvCkkMJM9lupVHXlx+s//BQN2cr6+aFUyla/jqGFI1cWPPwGhApt82HUzwx0yT1QgfSc0scPjFPq3rUnE4FB3bMVA8k1ohwakR4GtQUSMiLSxtHrxmdhB1ptGzSBld0opMcQucTGtyIJCpjo81LhWca2Iwco/9KayBauA4HWjATQwVdyDPLG8dNc/VffQvG6sUNqg3IHhINqhJQxroYZcvqxVTdWKaoQL2jJ7e92zOgQMad1MD8lunfej6Y/cyIC8xskbjRGIfiouk8bmpE46mgqu0YDnKlajVV6TWjKYSobxSJnvSbEKt0mqanDGEWT3VhUSYb4h2h2zaD5gZVaLgUdfxMf24eJhyvjompKWGu0bSm2XONyni0S2tAWVzxjRQzcWHmvMaPOxCDE1fLCVu+Nx/NBHwYzTg4slLhw6jtcjo6lEZD2ACKIHr/5zemYJH/e5xOto2n9tbf/PnPvJKcN5Ost0xzhZZ1EHpPjewZaRy3sv5spb/0Dcm6acUsMTLc6IwZW9hBByBYlNaLvLzGC4vRuMi71TJ07fLz5gvPmyzf+suk3RyXSWuXa4MV2k1WRKuLoGwWCzO0sd1JuMFIH8AFT15YPAIrnCTPLfDPRoevINYuzvVuD1maCxbjatbg/NU3vd4Vd2W9q7rWppfXahbW8lawiBWsGeUTtFMSLhMF60LV5amaRSDiuQkTfjOASho+tJCBawawyoL/QkdefwD/u/rY/M88Ts9ERZOau24Nhds66bZp9aR2VSJYhIAmBk5wWWTIWsMm0/IuzJia252Ro0vFk/JNZuEwm8CJ+LD59yZzbz3V5eatmeIGM9raiWxl3hrMEJvJWN0UNZiQBlPBuhmgP90yYpwf0PM9meDVzqqqE6m6KVTtxCSYi9RMjoZMPkIHPy7/NoIBkqEG28qxr3XmfR9+2tALPXfajERK7A/Xu7+ByzvM063zbkOv1vhJLZQXaIiNI9cG5z+03mXoUDp/LvDixHnz3bbQU1M+FflT3GPWiQKpQq8J+Da+UsU9qvonvmOi/RHliYTOR2jprRWoWvjArNcY9FpLrix4GZlP/mKoddv578xHzaRjDGietN4z04Det2a2X0wefuet35gWN4Oi2ylo6e/KdG/xP9DmTaO78zvzRZZMZwn8CjZv6dbalXnj7lDJLJkAfVEScJa3DTHzy0SZpOOZqdrf/fJnv3nLDM9Jw9Oht/7vb0x7mGYw/8USycgIFmmOmO9Gfm1IwD58jjreWBrY1eApCy+XwcSw++ajafJ63Vxl49ozmBbOnTFur5uowDQQpwppagySnamAq2Pa0DgXLbEXHi0kwAt0joQB7z856cBDXAsI2j1lgcGKmPfetKemIjTt8SpBE2+/BrxHRxUok96Cq4FPxCFzNXiyitBQC0IPgAXRVKHo5CW7yVSLMm8bRdvZrCvILw+6gpc4/IrEh1Q9AFjq4chU6uBIuHoIvg8tmLYmmaoJNFQS1fSFZr7Cs2NYCw41uxIbzbDIjWXWlxvcfLBCk/YW/gtEpsr6HiXGst9b7ij2E9OFfxrKeEVKakXkPdXgSs4BukPzwhDSA/NwrFgbnpFJo+JRvRhzwEMeDdw4Bh30bmWhdukfvTG49f3GB19q7dKJwGtu+brFzKVAD1gj3vtySij4kBop1CKGdaVDgNkihpVQ2Few/WUME/JsAMnFdzJhpieG4dWl0+uvrotYeNyyUBhmccjb9ZIKEaSgkAHWAvpYjBMoDmAdhyI6y1V+3Yj2GLaD2uOZVAawjIATVlsYdsve00y3MK8PKKRAMzhGs7CNu67iLA6WW5ED4jLgj5lzfQ/tqHpe9bp0uVUAIKp2+Nf3tpnc1LFku2X2mubM73BwyBSDpeNwT/1NbMuwB7YT6GdeJKqKZqWbwz6mqCFoQ5FIWQJSEFJSj27YPqCx3ftywvjJEQ7vRAYfOrIkH0Ylof+82Na2/dO7oObuLAw+uSjD0kwAzBQVl5PNLEUP0iiLel9DIBupvynxIWopBlSUexLAWjg1+m11zC/JlL8sXamOLEi7qmDP1dSDl065GtbuT1m7UEtKw1tT4+MJjq8GbB1w6CUCGvYEK/FP70o3UD/XsI8jWbhnWz/l/IfEqgS/F4SC75l4qILmawivH4b1QND6tbwrxrXwUKOHouOLjS8zynuYEvXxXyMuVcZ3JS2WeatELPMJdCAOe4JbwvhExbgIypOvifGhgvKebm4l4yEJ5UQgx6FoOCdiChVN3TIp+lPaLRGXRPsjaqKw/377j+FBOy63U7cfy8Hcs++3N39sv/yjvTkt1q+wxaghqZRpQS5ifYp9svE7NcT7bAv3yyTtr3FwXGkcKa9LOi29T/pyrwqsukSUF91O913wwsqoXeTvhmtCsORoJnF/xA17FLr/oReFBkeOwlQO9PHJYFHIgDViRNdrQv/wi6FrQkU+NjKCJcZGzGduSaiTtBrRRJbwkYxxinuGJalXp9YfP4PlvyQqGy3cE8gnmvB5b9GursfGP21Re1G8NO/7Pn7GO75Q9j0pGdsAhiQeC9ah3PDxpoeeLEMEUHXZCVekQaxH1SDZj0WnUX++iEz7unezMR9wy1NDZBYHj+V23wzVaGWaiBw7s+U3sZs46HHpM01zQ+IZYEadpt0vUzhamTO6dqYIjYWJJnTvoYavmwenZ/uPzouG9jkXtpVYAGQpU0cXKsgCgdGBLA2jvis4qieS+ygGAXP7YdNH9eQRWWXj7o8x3fm1Pf+ea0Enqrv1E0bdNJJ4sgoHFvpp+o2xDrN2o/bojbWVS/3vv7F8ifaBka7UTxuBvJHuDXEZ3y0IceeRTeUrI5ugZBko5MyeAFHcqQ5uuYMePMK1kpwKu9Z1JwXhuMilRLirG8iGx95ibcNpV0ez6A1soOMPacUljMappKPb0XWthREEKVs3ePe3KXfZksyePxj2IngeH4keB9JOrpE4yFBJ/gzuu26XMG/CW5Fnce99tR1hx/En0q4lfQZUl+sWrVxreoc0bKWD9KkmMWcyIrfoIB2lR8V8UQcpNC1lXcndyTkSCWyXE/KOBd9Ezh0ClvWFfCbeSU+WWoRcI6leVD14FSV3go+8OKujO85MuTG4BSwiMCBrlUD90XlQ6q6zMERHy1K5i45Swwj6RoLHglFd6ZWwS5xRsY4gbL8PH0hSKJ4YujqAHqh1P8n1ZL/Tep1iX6kZ6qfa1uIXnvu3m6Kec7e/jtJu2PlxfIxdceKaxaph3hykbUHStdneDOdeTNlWrGlLFCWu5vJZGbnaai8lrgByu2U1g9EMb1VVM6yltmosa5W7S502jDXSV7tmLNrpyK6JrEBbXcT/bNTuZDv+09BpM9kvM1b/vWbajMbLnzbHZRb/qdFpIrieOP/90IkzFOmMjFCZyZG/11PnVpZEzUbeNQKTSRTvN11aNZjB8MOWPu4y+0P/01uDq4ty3GU8S1IInZmM44OkHFtZPA2Y44mN3EUaEK7GSjd/c7HVeH3ZTKadvj3y0fr3531IPivOeNPu1JJ5MxMVHcv277APZiBGpgUbyjA/sL219umR/vN7azefrT4/Iujmf8VoyDHgKZaJgmUaF1IQ3y0wP78XAGp+TVmP4WSqm2t+8Xg22J1OpY37p5/0Zx8GbVxAHKnPce43MRCw7Cp0D9NDU+zmQeummtXeMnAHoWQHZGlkZW1lcW3lvgC2orgI2AMQ3Z6pcAeAGM/EEagC2p+bHyx+6YMqLg2E36btAr0DCFKOzONvg9hTpJHAkSWmgFGohsj6q0+ECMWhGiXfKRUtA236xGtfIfZOHZmAQgAfArtqFLC4BCuotgK9pffhnFeTotlxjq+q0L+40j+1DEHtnzyWWsDZVQppr1QjNei6FlFhDEXmegI3ki53p2v6wxjAteV7QZdAnGAA7+qSQHg2DHZSIyiErx/gcPRrsXH08trnd3UVDuXZQeZewEcD3uNRbCol4QjuQVo+EU8xOuoxmpdGKUuLc8oSzSBlKhHusqgZMtfqTjrmZqJJVHAlVZxOu7JEHPuBrUU6GjXakY+gWEJbo1oPLY5iyZgd4cc6NJohDGHRreWUV53xMm0EIKqJoITjx42qyC7u+32oe68idkHHlUqPhmIWCFg86uOoFvJsFCWT6N1O3g9106ub/TMXAvVkhoavnBx/bvfCDDwZZLqk0kChTtdqkvcjNS/GSgSMwJq7x0mCKFrPaENJMbbWRho4D0h3nkHxeIuaeZo3NX9wri8wjoOzZwPL2OkYqQwYzCd9FULIlkuAFTQfR/OXT4YGHHKUeF1Ki+8Bi2YqFLA4bYayzyGsyvumO3GamlEfeuv6nzz24BSjgBV6GmOeNcT1R6+bca7oy1srZBHWUHzvYsxpYYBUVsTgaROSeyoXkHwGp0zf+0YQnCE8faPGq3GEBs9WtOWbStKqwZgKxFHQ39kRboDoM9z2BfM1WLugRWePBS3aieKgSRFFc9pWUml8qrEGAlc1zsbdRYNfMWyxZ6XzwOHExBOKaRarwC16FnCN+S4025Q/whtOqZaEW6ZxCVp7FY8/NdBaJBBX2CVQZrdufYE8cM+zF1/e+dvO1/Z8YO39iuer3F7l8tqdq959Y90iOfiAjiideDBOqPNAxft0PqJ1N+e70+QSbnxywjmDzhH0vDLfHxM3TDlg2vlycxJ4neAZksUUD88eWbu3Ym0jJRtiJ0e7INr5EMfDeR3K41C+AVpBOtYwTtkwgOCdz417YH0DNH7KOXCGPJzdku1WdtsZWjbUZJ+tRRVrKlUnc0emzto527gimOMxzjix8+2EgkJ2D7AcmEnFk5P9C0/FJClz5JsLMhRkJJyFUNZB6+7KShipaaWitRplBUp602pMpS21JrOnEsfxmAidSVy78rnoLaWztFphJUWKSfSF0hV6MHvDWEYvj1tIMKMGbc12e9LKestF/I94DrF2xx06GIKd/sP0RBP++AOeyPi9Xj/ov7jU/+GL9ccX+rMX+mfna3beW1nXUNELCL/eYucdS4yP/FotHxRwnBxO/gGzST6JJzPxlD4eycreXMEx0p+92L9zqn/qpB37WKaIO2MRHurxYHoL3ckybtlTPfxD3fF7SyE4IE6kvBQFjOIfDtd0/ZPhjqbhB85W0Wqq8TVxxuHX7cyF1aVzUr1pnLSifEN6ItNwOP6AVjoeF0XkMF1ILyTeK8EPAj5wKcwl6hpWSUjRFdaTiFdzCWjqOgdDu4zbDeNkQ43hKBOc5cSDrYuUSW4cvWwz9ulo17Xv+ouzGx/PrZ24bx7HUgOLJ7pQdx3MczhpNHHItmzSbqTRUDphb76ZBfXNU0VI9RKmret///X6qa8gb8ej27rOmg3koaaTDSt+D0/lTTjYHPZu7/Y0no8sqV/Xzlzvn/6eZHai7BajQX+mxrg0/f4U6KB6iNroLbRsbU5/3395jWpA0DU9xvi6xyYySEIaDrbeEuQTaNNIG3z7bPDNLHMNCUT1OOt9DYdjg1FGqJScIWTcSOEMZvgKMlu8vD14ds0bY0irWgui6LV+0n0f9n9qhtc4ZhQzUnCLQurPXOjfO9k/fxVPzVF60LxhpxdhZxCq3xuOVCVdoqMUShqS1HVztIFubU8RHVXNaLSI4CwnBdlV9COR7FCXAa0zx8Syl16XwTpyVOmzAD7UjaZiyxAiDLFQfuUWZ9eP3e6ffuT1HRKt1otJawGkg/hwthXyIUxWu7Dbe9rBREXcf3eeDb4ABwFP25v6jYJr7XWdcVEmA61YoRLUT4hUVD9Q81KtyCF/JFytI1H35BNzajhFiLMe8jCMCoQF5U9nrQ9jlJrSeVgwjTRMyDkmV8EJX5iV85yB9ZJxJrVdYkFFztoRJnBD1ZpUBU2vVGI2QcxRAblCSfZ4yXL57Orzs3hgWmUR88SwzJs1YhhQD2obpw0/GcD7YbWXTzIDF1e8lC7ERl5nyZgTX6HTcfRAnS+Cuj1Mgjj47o7RWFaZ4yaXkkGvvIKsWKmKIvS1ICJXWbZY0xIyi4kV1Rk+zqPIoJQ7kcWA0jjahDaQGLHMef+umcWQBVEpa89lwD00312AAIvAV5BIhtvsIzA87Ckim7wt57hUe3Oc5dFuz2Fax0OKUc7bVeSjkMYDlrcIlo9Im3kNJ9vxYiLWv32yfu+owPKEzHTZT2S3c8qBmz6bwumale83szi3WT67/u33dOC6pGPn/GnDJhSweiZKUM/g+BzzVdilD30VVo7ShIAVh83Is93urPSlnb2hDUYTXDG92uTaBFKHcjg3aUMbmt2WAGE0K8kX5zUSblSX8c4BC9d7jh06hp4fiCk70jvKN4O8vTHPBSH/nl2sQc/MAMI23ukna3PnCBw8s2ljFGNepUbE+gUK63N7br248s6D97x2m5XA/RbIv5Z7LfGeRzzMQ1X15lyDVE9KMRh6nc7TJHlAL9D6feTvWU/P8+5C/0t1u3S5da6UQ8X72uPk3wTujLgwJPqc3Eb5KVUHAnNeWIdEvBF0C7Qr4A+aWAaNN2C80SKWV1lbTm3PqxU8dUeTakyeMnPWjFK+HzSckJChQ9ZyfXkZhPsQxOUkqTYNTn+TxiYtzcrZKWQK/xDFjtbIRgKgjiElyLrPaSerlDA/oNVBVJfFJu0RSxKKMZz/X1hd+XJ9+UH/0gWkTv9sTp0HM0a88rDloH36pybeYCo5HKdj8b8aI9bOs7z458q6wWLTcPd74s4w966fvEFx6a0WZF1EMyaNCeg1g18NXTOgYpMjI7ZcMfIrHXgwjmusxijaVC7JKLcbqBlKd7GMHbv+csnwZerfn5tf+xgzn7YbkCHN5ioBLJw9d6KWcU4oCSJIusC/mU3puKnG3Th1fv3VdQdaxBMWsbeIpUO8VoMWDR2cWz1kNLuGiGhjOeYVJpXDmKCo+ZyGsYrjkU3ItPQ+HWZDDjErN2/3PvkaWLz4hHZJG7hQF007FExH1Yh69yMb0few27IOK6jkx0u0MNaZGE+M/ksauDwGS5SNPJ2xbiTygssRFop3Oio8Hb0R8mQxDVsOETSzWGadt3VixjmgnLb1wXXyPiGpVUZdAKmA6DYHuzgIvJkO5eVEu65v7DV4QLi8jyuMsE5+5eXq869Md9Bqo5m3QTLcBq84cjI3hoXspoUxTXgVAwhRm9N3wvUHePEByGNvqQS7B22/dvP52tznkKj+8Zn+h4A/0ekWlBnICGaa4uqNRU0h3yT7ysYxp/Te0TicI2nbXdXXlw0tSJIUUFpdPre6fJP2voQYzurNCC8VsXw8jRwdQ6D3lcWfH8dsgzimXt9E1OdfEeTaynWKbAQkM0opv5cxGG2bjAxaXKCglW9lAdLGB18KEp7WVlDQzBaKxCui4cOqHHKQeZIFc6Cjc55kTeaUjQjkvejd5ps/YDcimvKRgDdAExzDmoHiodixSGZGF2msqJmDFYxTY9KKfApyANks1zPo5huTQ97kJ882ri2uP2aHsgPzGUhHlMLXUhJ0Rpr2bjd1rR0JDewPKkT3q05EbO0rsHGd2xugogdcQSVXuMixJYypNRrIplrfF+TpEDbvYHZjp+xvHrIKam3+Kdt+o50gM15pdRNhLPCuBalzdhoCdU5Ios4JDxUwwYk2V3ik6UZpAsj6w4x2kmrAufopToqM5BzMkqIligOKYFN1x3u3LYLpVBzHGDv65BkVhhuDDklp833kShN59ossedpiYPq40UBqi7YakLrda2jHo7Y45cVbaNny4PK+vEbljX44xOWpTW15SFQ1BeqVU9XhlqPp3Db+w7vkJ74w/wPHOT2Up2VDNi8SY+9LSJQrCeowN6bxnSEFFSEa/5vSf74vGyGDuzcGz0/QXsh0Wpih03SYWNYBWkPUzVUDUUCb3U207fSQ9hSxqTC7bKekjRzcETdToybv4mKbMSRBYdPBP7gU8hBa7u4PttkECFtOA6EsyhyBRZEnCSSFNElAEeTZAcmgTBCofgRhq4dTKoahyhkYQmI5sGBUNZls7EYSJXEam9VxdOQtK73bmTAxOPfKcmCmEh0hbwGg70EiXEZFM5NIQB1j3FFOqSv7r46tH5mFIKZ7RzG1ZJxA7jPKpwjrGAjh9jKjVtJtNiLO/UhX2iCy5BD8YAkyq2ICwbRr3MuoaRMHUtks7tT5DdaMoa/AFgy9BDRf7CJAph72D6wfaXcxPdWD/ofWPcbzEN3TnZR+rzob4ALYnUJcZVTbhf1Hn9EocY5FxasIfQrwABgzxiuuaAKStAR4den06soR02yyG8l+BG+tAkItqnUHH1KmprbzLc8NPp+VTVdGo71XKDgTjGXnVLpMNTpvjkv4wl0w422Q6vMSbEhoMZW8eWP0yY9nF95z3nn9iVxtdNq7lB3X+Ovr3z7BUoci8q2dY635NnNlO1Wdvc/+NHu9zuUtZLObb2PCWTkp9bNrC6/IFyXBcB6o8wYD/0+7fc7ZEz9PPDPlkjm3Tvww8cGM12PvlFmkk8lz4Mvk3Fx1LpHyV8RJcf4PtbLzS2o9fnHyuRwtv/j+ARWMS70+LmvidpbPiwOeFe99RVqP9B0pO6vmxNYWdVv4ZBTFHm66cV9aK6Uysmo7QtYDLQWbDG0tWMtr7S56nfW5qHJMgYvW0/hbby4iu5eubpw6RVlS8UyG1bubnMiIO4E46tgLEj8tfJV4C9IIVhmokStBFij4M3UBDGU0ZTQ7pOJ9b3j8Ah57eJjCP38IwhZWV+70P/yhNmAhCvNH/nLLiIUI80f+Ui88TKRGg7a72CULBcaQZmBVQK/jZAlV23J/6dn6kaM0WcIQ4HajleYN3F7IMzBZRq13bRJkSP1SRdRICoPP/DMIH2uMmwnCRJndd0KeEIx2ngyIgUITFhEvEMczEx8gi5B5OLwJInwIE1xYlbRpoo1iacZQNoupfXA02PLnr1J5CPuKuBnAikOhA1jGtoaHtClMFYMbo4iFE7mIJeOocmqVW8lozWUspoUufaIvY4FmOgRXhlSvYAEaBywJdfmKoi0Xryiiwc0rSNFdDqDI6eBhR8u/aQXEpvdlB3PDHbCnYi09/7woZ6JBknJelA+GG6q4uA2rAEUkx2Yd0WnWGFKzgBRVLSRjaubRwJpVwNUZdKoQxHwlY5w1X+8EAiW37WcGF231pbmKl4nUwdqAfcd9CErsa2hgXdCR7ypscGYXmefNKeiOoT2hOz84uRv2hJxUC6pCr2SEBH2ghdmDxopUMP3D69U+qDRU0Mf9R8eCbuDbMeOhHVAnPRXJsWJTEtsTGlEyUeyDyPyEuzb+MeRFQOUMvsexf6gtrTtJLFLi+tHyzhG8zRmf8bx3XzSQBteQgVD4OMPOGediGbZhppyJ2o1d2bMpCHSxN0pkdKgm0Fp2F2Uzr+w+q5p9H/M+k5vWj3e+96d6KlzAA9yrxFbdSOm9ShLy/0e6+W0kksAc64/ai9RfGMLrt5947qT+GWTvt9ql/MUwl1IKjYygwI78wstAleOdDHhWfRqS4WfKm1w/+0P/wYK4kp1uXkyWDQyswXLiOBXdEt1IwIAg8TYVXp+FCz/MJKQYhe0kMsBUVLK/0EArui1IkkiMLFPEzwJWeu3k54PTOJfKwT3vdswgp0iZp0kzwnJwo4WL4KdvtoMTongOZRkXTeIHvDXa+iGkjY9fEdJEBwXCUwGmkO9OAs7WIAGE8yaRDXLnPAjtzhGW+HLD/LiiqZw4C01eKp/+2xm+3OfG4Ooitzaj850/pb2bVhNwl/3ojPdIiq770Slrx/miH+3FWXyeUluatcRCCj62D+r8Qr8WLgJTI9NKvqsLZzBHKrCuRlWxOUilHlrVBhVhqvXkNLxCDeA8D9F2Qs4tNKQK9viaynlvK0EH2XTuWqmHUvBBNYSeDcOq9ogm46P7sJ6j6HVKFfbNxe40dsW0k9xXc4MnzwFQcU6mpb7p6yTIl56rgmbdQxi17Bv++GIT76fQEJi4ia1MtI4+mlfDvj4YbRnX5+mQiHdQz5hN0EK9xamoZZfxe/eJWlUFaWglGwppqL8IFknZNLFlYsWsIdq73dirstfqeLOyylfccaHMFdq7dtnn0a242qwmJVdlX2riQPYifrXOn0H7Xa3nVzTfbhABxP9dxfGDD7i6Fa+PCsOI8k4+/Xwzp69ooscHTI/8XPl8GBscFZhGrbT3kFNosDKTFBtszSRceOvymgFCBuZ+qtvZfSpABtD21uD66ev8mGUdsMwccdQZHD9KYBHbcrSj7EVcMDCbfKSJchnpFmLBsC1EssH8oGhzUWFmxymRNDeZcMMYdDNbi2+og5uUXvJFnMQDM5Bb6tSiw1OetWzKMyjhjNhe+mKXPWH7wdoiW2mb50Dqbedntu5eF7xnmXAcbCdhIHzu3aUCYwSz4cmiUXhbhbfu6C6r8O5SacG5fHWPCkh9M7EZNEMKGKJM95J52KefQGY5GUUO0+KFd6sEyQYdrkv/SJjuWo0WJh9wd6hAb1hOA7gAycI4BCk95O4UP8ugX2uXWsnWWl2qAST0pSnC4ZDchWHGQjfcLBCD1NydEiaNVHu/ur8Va8xXPqOaraZvK/1qO5WGoSntX52y587cS1fajvRuRXGZCCs39uBxmeSAu7xXrkfBLL9fB51p70eJhb8wyaHuPtd3OGSBr9zuEXSyHMZsPqZvV+tA3gd7OtPltoYLFsDJliE1DQEKxt+dhhxykoi6iKcjHLLdMRmwLtW+B6nBNASVVsOTGE1yvxeW3m8odl1/XFwhXvnsi3Bp/EebFRCZpAHHbEZTkV6PphwipHQNl3yyOD7kjVXkUQ1VYtMMjnyslkV/YAmbdngFnOJII0bNcGM28TQMLZ3LvQHcppKqx53QKWKXkFFxm/mNWtPtNlzD9jkNWccgnHzCbQPkL/bbUPW16uerNt8gGdsxGa4/Tufuumu5Y+3QZe6679bzVenN2q58z3IVsOSSLUnn8XkDXiYCToZN2PbiQO7a39u9b7ZVssp8987PDj2W/fYj9mbt98USV9P8Shn6mm2kdxJlB5ZsN1bGNnM+FiYqgdEman4P2tc2Xe41HIzQQNE6fyjzNSJF/VU55MNDe1AgHE+oWkxSjhFPiiEe6TUJQlpRWUb/jEkA4iJK4ebtYpNQm9IQMT3zj8bnn3n9AP679P+GmUIurqy/OtU/fX39/nGYAVVjbzpAUYjpqfPPtgjBMSUnR0Zs0WTkZ17y0aQZY6JP2B94fRPOWsyWeuPkyInB4opsnLQg3r4Jgce09NMdg6BQ3iawWLmCEghdmCcRXNxOmU2DtSHikYPeD3Hx1eXbVHyiEznCtOaEOUqZPJffvLRQVuV3Tt98GnfdZg2W3LSUKpPyghfchVWJrIG2r4TUGBwdTxPj2dJKKE3CeF4YDRKhcxpxij2LmyFJ71b3ICe0W1xZv3e0/+qBQ6bdljIR1KgRWU8KAZ1yBkRPLYOsiO+odHKMlY/LfYFRyywIpDQnILnE84u87hw7/d5bRNL5HosHqeapPqLsbH1c2sBFp+xibSQILdsvIL3MUpBQkjiSLJYxRSfrziCSXlf43XCVC7KLiGVlaWXHDci0O3sqrlf4EULFgAAEyrfXaEbAXbpBSeZHvPC6NwEpFF3etbgrOHTJnvUgLvSMc0r/wccnKJm/VYJOAW5fh3h6a6eqR6mEQCxIKnCsb/URjcC9DJ59EfWt2NwLl67sjkWibhndYPyhuooOlXgbk4EcejMbRE7Qb9yL/vq5LZZM/157AD8dungOBXDtfLo18tNK1jBKe4wnnDEiP3t9eUxvl/dfHOmfPinb5XGHS4Vb8hGEtUdqT954SJjMo4gOJ2B1gxwemFwZDg2EuWNOLa99fN1Li9NKyqjRicM8LJaklxiH9r6QQzLjvcWU6tR72ITTnbCKc2/FVGnw8DbHFONWGBVxm2H07IdiyDcWVMB8GHvxgwJKVVKzstHmg+qWNVz7JiRa+8bUdvRtp5vDKWuVc8EMkqT08HTCMteL1VV+6sxgrV93qUvs74hVs7KVHMOxN4HhlnFBHPZDM4z+xUNnd0jjG2+oiu9iOByUBHHwK3vfoYAbSwfHkPR6GlLoPzo2OHvWLX8nDSElF+IwldSjUEckBHeezRBM59/wC8kpVWGcx41mWlLWdKS/bHIZj+Wh2BqTR+EwqNARshXgCxxr21n3pLSzy4Ui48hmmfGYVjTyrNLKGroq4gGi5y3ROw+wt/i+uyWO2T3xHd0SZxgtLS4eHqlp2BpZU8yRV+WUhkOxvtV+9n20Xz1vi1oHjH98p57BSk9Xu5lsp+auHtMb/36/aojpYcltpgpjRwtJcwFH/b3jg+svl4xFcMcHrd1xtiY0BluaAt8MsJqDdLn21BCeTsPSgzPnqPRkt4FBhloJawWp20TaQzWG0387LJWpUvugGfZ5sPpjtLcwbquyceMKVaU6HPdH1PcqkjUuIX7zx6pPSGXfhmQmBv9d3ym0P7Kc+W6h/VE8hz9q7/DvhnqHVA79Q+Z85O/04lDvy7I7Zn2pBcgd2Hta4FG70+ufXSBhxy9Y1PFv5zbZnzYr6twl/NoqqG6nTOxiTG/pUAMgst4SqMm1MwsGZPD99+jndzuHE1r1idLmTOwWZQSDGeDSUhSK8RVLXDBVI5yTJLqqv7lCB09Pr60ct6PcfiQD3b7wPEf11RZA2nW0pVLRG6OUXP3fGKe3kBzwXC9AvOxcLy5Q8bwssHK97Kfsewm673ohvnO9HL7yvBySc734nb5rGnJZCJWqD0aHVYlgjSfGgOI0WaJpLUGho9wwRFb3AdcDKjeM33jXQtdWQq6JDisgllk60upLn/2QlFCw12Uh63wx3xCoildm36t7tYd2gVybUe0CZ72twFol7dfBvQnbX4uSumuxHs130AQQmLWgAPboGOFZt0w+jOpb1sXAqOrz+j8zRs6ZjEqFJc7ZjyYR0X7Jg5S0vpr9+Z3N+R3S/5XORxvnM+uRcJxq/eH1uAcxbDUN7cjmVsRZEOv1oO4frvlF61f09JZaOtDQngpVtZYau+oqDbmzUpkutQ8KYh8H6c4qsj/10Ch7kLg6zwx/qQl6ZZJvw3B5c+V/B66Z/ZHFJfDN7K/GDAu8+Gb/8POhvhmVQ+eM/zQfa98MJiKdBrf7QzMTwdOxZnrzfoM38vtnb/ZffLx25lva0QcpbkIZXlNCOcYXmW1ORq0gajCF5IGIr3K4O8mOyuujqfZRBufOiIOSppTH2/dO0uiA55oAVDWRe7huaHD1oqGF9tYLATlYLQRw2vc0iLQ8aJBoYRAx2LMrkk7DXwzsROTPmTYyZalxTFFbThw5KGlPQO2lWQAnbBZ13gnwPGfNIIqnZhH1ApmB83w0wGN/CewA4Cl3yej/c2e0C4aQbtEK0NI6JI2iIarlla8FCK6riRnWCcSINZyIouadjo0AI3ViogTEL1nxmQ5jjg7dGqxVbGuIQaQul/mqY0PDaAhdvlrYd3s8NoQ8+zpQmHKX+FV37a/aHp0aFk9bSNyZXTV6tMsmx3LiluCweEfTVe3sNzJNqx1RXTZVou9a1pUY7l7sWuO5wUgcEHUmbZXOVh+Rltgayn602yG2y4Gxe0HmWTgGlukaaakldPfRVlLDqzHu8026vM6+H+7+c926S9J52zTh/wxXXOA18BwutsB7vLCr69/+O9yWmyJoyIHBkb/3zXhZwk03zoy/Pjqt7ffFc5xYqOjSl8p447Oy3fSBs0wOQwOoJRf8nMdSaXhrJ/agcO8buGzqrxcoX9PZ+f5JvImeP6LcM/ah6wHk2yhvTxHQk432731ZFOYFp755/aDbsVb54jxZ5YnSWeUD+Kmzy1zWkQcAIm7K28JSeSouxplLs30G0tpAX5wXA40oFQNNaN5+FrOjrDSg+mb64ryYaYurzPQBi6D2sRjVs9aAq8JnVq5Ce1lF0E4mGogtyoBhUx9SDhvbptMeADahQNbB6T0rAvTMCeA5e3JxXuwJYjmN4/FWQXIoAlFbvrotxXWkBRDgKKin2BypqlgeEhur2DwGq9D1sD5mHWCwGYWYFU41h3a1A8BAmdY2HMsIDiSyEMAGrW7waHBl3b7Tbvsv2lPvcWk5MZWC6POofMfjg5PAg5hTi4qMo+73uPAhXHEpWym3yTpESXccbKJclWLVSnFrlejUoac/+Chnaft/MHubOj+eyidKpcnCUvZ70XxOo2zn00x9utthuL9DZDtc74Hp7RPJ+cuafR0oVpMshbDfhjr/KfAx+BcgEHgZ/Avde+b5Gb8e7mdgIfQ0gNmRXytPI42njEMHN6p3ki6HjH0zTVliIQ4JjsLzVuaV+fUjs/3nzzc+/YxvxsQL0wtMPWTMUYueOUpKgHsLPipcIcd6hyFfnqZEVxayTOi4imDay16bSdqEqxwUrw8hP7uxpGb8zAQMD47cH8x93v9wXnhOI0CYbgrTFtAyLS+Q6bjVCClw3PnajeOCTjHoAo0BsoLDnKdRls/ApemdbisndfBmdhJyOdCdT4YGrlD1HuIS2eWjq8v3DYH1sx/0F78EjdrEcg3AKSPczYQ/kyaGuuf8s0fKr4FF9ytA+LYCBE0VUOi28dtG0KJ2kiVt8UqNI4SXGRnfxV4+urp0ZvX5ytqjI4PPIIOUKsQOqsYRH9W92zFuAClR25C3GG9utMKi8l4HcoLZr0VIym7OJVlKFJaVE/UK27n22lkHhE2qyohUNPFWxBqZ6D2EpMo3R0Ua+nNPBnMPPVFoYoZSC+KJALyyAmChVNcTmAiu+Zg7Hf9kTdmCjKd4Qpo6xfTE8gxE79nb3JfWv3sKcsRHI5JispPnY41pWkZPY7iNuu1hORwB8IrajVcsyxMQ1CNGDYzHrRySPHJvvr6JO5F0hdnSIb43tvH65sGgd9fvf7lx/cLamYW1K5/3Lz329JeDtV3tv9SqzL3Ghh1Ov0qzAkzy4L8SFZf1vhgvclfRBwcoXXcgtHPLZgIotTHFIijlFJv5Gl84zcbAvTMkFwKszv5BdyIwnGRFnWyBy5903vOAHcPjvadp3oyFY6PlO7Y9Qo18FFpEq+PxHMs6vi2aYty+shKtCegDkKjUgIKcgVQUOHOigrOCXnQ7abcZtQu6Zmwem/pphleI2zw7q89v9E/Ora0sUp6d2C+jIRr2/r19hpVl9E6ZT7o9/6S3ANepg51del9PTtc/uNu/BUeXZIpqC1bDdPkHN0+FC6zs2yH3WApdf82dyHq3JTqyfqQuv/djSdMm5IzhyoHNNb272J3wpt1Xvuvf/MyFNIDZNUWqmwYEpWff/ErHxioa1eBYIhUGxzqCLjbWw3bVmUnSpNOVCpEbBP9OzOgqGUdo49QFV6WyW1chAdNVkpfVe1SB1ptZPK4+hsJnRqLfW4bu6g+v+ncuGOpefLVlwOsxj5TcctmBWHcxE4uY3X522hmKjS8/37j7yBkKPLjjUgxhXiFIcG9NBd9WLkgCAack8nysUjKys24ypGZcl5haVZlTvMfHHpNGe7q6fJNURGkNqnGz0fyU1pYaEemUcYCde8AC5wFVYNLKoGrzTUl2EL25Mi2DZ/X5RQ735o9trPcBKZ7JZSMCqeEEysPxIdzqWu++69m2zZFfFZ1AXERK9K6hA/K3Du3rYAiI5FuwKg50bt28204vvLmFTCncZEJNIzwPn7KldiEMYBkvrbj4uP/yKzR4MLyVD6+9aplzKG9d++m1/vk+u7iBA2qHCkDy+vD645OD45dofVicUM8DdW4iMuN8Tetlet6l8uG28ODEe6vxm/boNFWePa9GOUriHDnvRTsugVPh+yvio3i+g+c2/BjG3bfsw0ayM6TafnqWzbNnYr+czVKGKjAf2xiZ6mM3slkJD1PYHT4fphW2p1G3VKdale5R5+2HQqou8KCUd+CCie4fG8Z8/VvlqPfT7gSK1x9BPEwz/c5I/P+nV3wGz1aMzIGknD8Koq/XfOCG3eR/NkD2swRugvWCeH81bNEHi6UjI65cOfIrvcNkRLu3OBnbjR0ciMnrm7jq9uWT/hMMd++arxLzEW3s2CJ2c8U+59tA4K0dW8Ran1ZkBkEJhqeL16V0x22c0OCzOY4TMj0HyXUzymgZpVkMV1zJ6XKLkG8FwKndBEFn6I0mmjGfducEP210k9yJdziNv/TxxrVFOfQOi7t5SiG8ZjSXXbwoSyfHJdQ8ANVgCoYnvwLE/n7STZuZC/G9xRcS2kjcjySxw/Nzhi2IbDpizyC2uGiaJrx3ZMGUA2lf2TDfrLeUEjodx1to+ZtT64+WIfjv1HL/5TUX9mtJeTtVCtrlzeV3NoNRlZrbX9KkvFBfS03Of09bSuk+URlOwu1o2erJ5dJVKjwn0hQkvrMlHcunYP067AF9KHS4AWZ/GN5E1T73An4tIZekw6vDXkkMxff2xRKhQNmVLBnK+EHAdl+sJd+GMmOhde4rYRiWS2xyJAI08xm7ZSZMTmhYu2+2v1IyjOt9kBKBlhAc+/s7O1Q8mm9cNAqYJuDf1TazpFaSZg5EwQcctivHdgaXfaetNKw/XmSLwFZJWSTfmGxhSrQZUdq+KOImXabgFH2g5ZWG99QvhqnahgUvBJtT1Vvp0x0XFOX1YymWH3WwB2NcD28Z23UD+8caH/srwnUbhsZreLcuHsmI19sgV3B33T+GUUn4I9xUe+JpJTIJfzMeoZFA/5auoVuG3G4jI5Nd3DecnIyKQ/gXV2Lkl8qZLOBmx6w7pi7vwsUDmOrxLXvLy/375/qnb2JuNfNtPsZ+ky1qHSd5ke8AyvpOApb6WDvmS0runSsp6q24EJvscMIyBExfzf8B6sWNjVMf9j9fticMHFs0F/HaS8NtH0yfKfNajJ4w/8M7HNPAlfTWKx9AVd3lWojp1isjjlQiZLVYSU3oYp80vOdlEgHxL4WACoOyWC4Kit7oGCi8c92R8IKXV5dPEhXtWhIhCWIixFTjS3LMOtgAsA5N5ckUhnVMTQ3LEmHjsWxdBCLigizqeHbJ0OqQA8xawErsFANL5FQd3zZ6SvMtLkLLjhIbz6EZt898JKsWuIpaD+kHUckorjIdMMs+I0KCdtH80YM7M6YYlGNjljn0Eu2wEyCJq2Ih2EQGavq/tvM9DuNiVB+jqcBpoBoUlUsJ2ZNYq5C3Sh+7DkZUNHaaMXqoDH9v3KtBr8oPO8XPCnb7mlnbCk+97wjCQ3BqeNtK2FPASkH6DSONotSg6D81yPegk/ZXVez3+KVRMhk1h7eLP0Y5erxSYluC70R0p/JZ48klxehv65I8jUZvNyBhwJuLvw9zPMFP/RdHBmcuV3I8wU9w6iue/F/evVjD476ALXLagFUOAEvSUdiVGPmFcuD+9O4/2cWvUdhJaTXo+uuHFFT1tGN38PvPj66ufAkXxD2b78+ep338zlhGq3P4B7kl8Ge+F0ASUPjLLre8G/+elmufFjS4EBKvHsf4yRnYAgdX/rMLMNrOX+2/Orb6fLF/EaZDyRjmPIP/2B16ALRx4buFZDbxT+bTNPLBCG6E4WPJ01Rr2uEbnH1hKio7fPghb6DZRzvF4GeFIeXd16ockzceWLMDu6K6P2Gn6fVR3N8wDd5/PN//+msY/vwtdp48dH2cbaOwSuGncH8xKjp4707LRo/Vt3TQxqgtpbQpHO42OtjKjqP8xLd+G6OGV1g/xLt7u3j/9ZWXcJX12ZuDT4/VUKsnZLNRdMoEKmqsQLOI27LIu4y3Aveff7B2Bl2I+GARwRXh3VE6ijIqJWpQ1GLxcBxuafzTnVSIIfxNwgwg0+Hro4fCqJC1z18NTAurqBAsVpMOou0fW8DPKkEgby42UZEFYQUbp04ZHeYFFDAVL57AQtpQgonS/MiHPA4b7vF49vPz/cunMczW/BjZP1hI8e98kwLUUvinjQw0HDQlXiGZ4NynMm/vn7++8dFdmbRPxwcpWsGUS5s2SoFB6PJwOB9tZuRwd48p2X98kovxfsOUWs03XkcHUv/ZFCJvPurSzm3OCaUGZ44MPrm8unwH7+3MDJXDvPvinroh1LaBmCP76A3RMsPDuqw1GMj056g9bINoaw+vuAx5TVvInX7jF97c1H3kMWi500hqWipYNmA/QRni7aq/Xhgnyww7x/3v7xq5Rt8s49QuOf1p+eDC+ZZleZuKHuTkShJ3isgJjanCKF7S+r4WmxMbH32tolzS1MxUKRayiOExGZUYFwH0wATFlbfrGhaAGyOLD5qxhE1hnK5JurJd7VWtnTm/unLH3ZCOn0fyl9Xw+JB7IFJYPrb7H/C3mBgjPwebeTra4KMIxjaUeENpyklW//rgfUykhevDZzcuv+x/eq1/frk/N48mQspnefBcoZDzIFPIMNAsol/cmiB5Yafa3bgwv8US3/L66BiFEeKFwGia+5+e7d/5anXlLllnKcIWR54l9oZfVPA0liqoMbStNt1q46lhv7GDY45Zen507czS4PEVYsl+bm0gP1qG7HPuY2kcVUpZ60TaKWrFeTvvTCZFUzkQvW/QdYMJBaVweH50/dl9o+j6Z/Fahyak2+02TbnpgrdDW3HmgKzG0uC7gubh4IEPiQ8yjuMevE/+d1/dzt04ddoT264fpv76r3CHtBfjbpgz+KBdB9/Nr82dQwucKA9IOxWeuyIeCrsM1k0QY09xJjMNZe+PvPBMvv2PmOlNjbQ10L5J3a5B1X8G9m4b1i6wdNpSbWWnxEZ59mQLa6ItCd/v0UzG1CiRAWEVvvzX18k70Mj+wx7VptZy29Fx6q9A/+xG+wSapzrdd/i/A7+gzNtF/Kdw+m8Ue28JIoEejhrq/x2oG+L/Qy8DrD9eHMw99ngJ7n2I/9TwePM2dX7+8+H3PsSdkRG/ViM/V8sAZdSO4CrWJG9hVNtBWpTHBBMnzq0+v4Pk4ZP8UMce6Tff56wF8InMhilLfiMWBC8Ef4zR4FMxNgtENE8TvOIQKaOatQOAGRhcvdM/8VDxYEoc9PjAFx4vBEqbPw6S/VnGs6xh6cgyh0/WbqVRE+6JtUfg52nx6T5qAviN8wx2m2Xv9qgzd1xsWCF72MUWsxswZTyposXRYr2+HNxXferC2v0n7uz5eBIfqs7hAEjP4eDZRvkw9JvZjoX3tl8MgdUfLhsa7hy6paF2YBjQbcDAC3Vg3PGurt1E1vWWCyHLgiSCprWAoHIYN255mJcAFiIyHtKplRpMdRIdHmWZ08Y1wEmVJMUkH3ZPmCIbDPrg4gfuZDNCuyVPxa8H7DeAnRdj5emUaQ1OZZMFX/LNYY5RaVIvAANb1R1PR3hZSFVc8mNtH2nxcqduq1D+lRKEFjCoGVMsgciHTeZJDIikiIoRQt4/YSYmbHnZPtm/zoz2pSuppFwlGE8G8TM+a6oDibWgA/nyQOHLAQZMqY7TvebKD9k8QT1JCpuUNatDqwgDZeppUtGiSoVqBarU4BAlqBSgU1Jh5aRitlZW+eysSCZF9jpO92sYCTMCQqVE3lnYmR59+Oaiwb+IB7JvHV279SmGStuvS/k8F1inNUVVgoTZIvhhTRBKGdflxDEfv81oWN/gkmf6nZs+iELhogkQ/nfvoqrhGximDO1aALMjP1OuStRKWrG+lymBBRDq+EuDb8/RbV1tCLuK4rZboqJSen0K3mwHw0ew28CKi9cPYNn2m26TjjgcFkfjh8HFrzZuL7moYcuRLS4TZHrUWAKgitppsOakwAfxG7gqvtMAdXLrvgwWug0EquKD4Vm5DRY58BcA24UDO2wVDcxALhQYXqhgDQXuBWoQuBcAzPgSnNuCxb20ClsLGeDVgqm7pABumIEB4NC8GGiJ3mRoCZfDJkiruBU4DVSLEroK2Lp+Ihtdc9mml8q7UE0rVTbsTjHJj9WW1N2ubjCtQfJdBQLzGdSM2ThdGXK6a7HJKh3rdyqF5MpAsQhyM9X+9WaFs910JoKIt9C7H7fr3QUEC5wFM+DCPqTNaMeXQqwAaYhq+c3y4u1GYzplMrSkK0WqbUdFih2XwIHOM9DWpmWUONLo26exsVPiwvCexG1PglEX5NCK626yMiy+zdLbmw/cBPqRqxiEOXC5BAn/wbvOani0qimEfgJxO/JTneAmSoq8zPA2IMpPgOuAcOBsPEhP0H/0yeC4S08wzeU4N4EDkrwQ8gYzEyhc71pmRHXXMnMRzkfgMEqXuWQqzaey2EtzcwAvnsn4apFKZoX+F8f6J75bff5sffmBS3ExlZRF3G4nkl6BXmSJl8iEqemEMRVqQZoFTU5q5sjZXAtCjusGEVNpt52UNtjkfRDZRu8p1LJ/fX5w7vPB/G0MrerwhzYYl55UNC69yLcJ40Jx6TmV7BVjvdswW8knVMaNw7QiHmavOPq4f2JepdyYmIy4qEtf4eBUAgv30jayoxEmsEAi0qaaiMtg4fBKWXgu4XBlqxEVdD6htwR5MhYO2V1B2d7rL99bW3lGe4P9S/c4WToVhlXWPJNrOwQxD4koAgLpIalkklzEBf+17RJhcsDWXjYuPz6/+vyqu1Y2NSOdFuWwnJz5g4dcY0hZKcU7ufhpak/x4xN4JF2vNGa5NxLvOFi5auQbI8sQDBsGFbcg5D7kMGZKzY18bX32cViQN+PDrfdBHg8v20X/7Pzq8kcuiUeTi1SW+7ryk/beLYW67BBEK7hrD8l5+TsURS98wxH08kEkzaz3VVLEk4dj2UNMMfHSAXXhXv/iybWVS3LhHhyc4TIof4BiX8j0yEOmTYhpAgar9dV5A+hD8URJY+nbXFjDUCSGKBDRHrj95bQQbX3xsxfg4L7ZHEUH3XOZ1J3mH21HkmXVKGDMTkCafe3iY3assrxIQFfTedysgHNH7qJjBsmT2IY6bAnEo4SRXEAI6O1E9qVxcx+hFihK+oWx3M8H33D2eNb6OgMtqX2dgxYBsR3BQHpwYB6rcEqFEJoc6iiTKWdAiDuci+JOb7f3tENmYO3O8uCTl4PTz/p3nuHG2aHYFCSDAhBiTOAh3yWcNSyAIWom7TZ7TxtlN3bW20DqnCgfz63NvZBoEchYEqXjFC5SRmMR7MG0fbDcgxIMVZp1DBWX9L3GMoGf1MCrtrq0xHplGg0mjHwO0ug/ut5/dMoI7fr1GxSkEUtJg9vIKBOlfZXGNlJDEajDD6BD3ADU5kGIpqKGNB7MhKAXVKzNsUumD6T1uMB02/3NjcdPuQ8kCO577kV6sNsEeE9U3DL+eRrhkUDKcEC75uoCkUefrV18IteITHfw80Yr5gtF8CYqQXHIkp+NoXR+NgSj/GyIQxnDCMrlZ4OB3I2GsThOEUqwTDfj2Hyx3P/iM49NQBnv0nKUhfTZldeU+ewoHjdk1LO3CE9wmFUpI7nuzNwAxks9s1pcgE8RF8snl0ePmZA8Hu1L26hWvFW6Q0S0Oe/oa856xw/xkEwz1kP3XHxx7J1Lr715Ghvk/yZDXPjAbdcetHaefY93e/6u9nUrTqh2ccWt9X3NwM303b+tnD/P8XMO26bumnXVlFO1uUcl3pTv52jPRrwZ5cT4jkvFrdiGU+E7FKEXsJUP4Nt/z25vy2A7Y+0ZVoTVFrViTj1T6uzeTq1eJy5bES6rUXFlorayT9Y2+WbDMxpQ82kxGf0Tx7S90LZCaXcclThFvYWtBhNgjB+Sn/kPOqc9/P4nT2H7im9rradVnlZILA+k2kSpVZRZTVYZ/OHfRF/+6zZCSow6BW36H6Ad/vrgP2piSrRurYkp6RAlpu1dFrlVUAmp6ZERrtDI3+lcM624GI9l0t/GkBuVWeXxybX7n8ikrxMXTb5TO+e/Zd5HOLmDkeKuILsV/CRORRpPSRq+HCX99WXTpXTjGZ3Yvn55cGlx8OldvjUiwhLVtILxFJ4C8G41x08LoD4Vk4JMCZ9nVzAe5r4x8DSzQtFhAvFoo1N22xq7en05EYhcghq8pM3Nm+8s92cfu4Bf1DdUxGkcevZnLvKNBRUwH8abulChdI8N67LSWESdqJHa3l49aVrTaIngmgTToBtHLrkLjaS/VIiK4Nhdp5jr09awBo/37Bzs6Q/7s7gCittYBI67yAJAISr0WKqjoLCecNm7WRJOuhk9emnR3cNCzEqECqO4GBVLxW1WVJm1672KYV71VTyrrWuPc6ZQhVeYfNtKPU4lWIVf0x6UkgSVThMFwbskiceA3RXn/krrQf225RMttmE9KQgA/SPAWgQE0ZMBAg1koBQhiOpaks+F23bkbSlqR75liXmbcBASxrLv/R3tS2/bcrxDheUbcCew6SP67p0ATnhVY9QgG16pgwywYhb3FZhT3gSrxdUDXvezKj90y4qsxmY2w9kLrX60eIhMCGmlr0OFuqU69VXpzmnusEymyux12O/vwFQsDatFOOr2QZx31Hg5F6m516FT5n+oy9Ni3rffRkMAwfDhtZD8M4jF1x9XUrXQj8bjOJRPeJn+/uFnQ6NkkEPc/ypzMyehK6WQ/xFTymVpiVtZDiGpuB841eh6Fy+/+QgugVBZlvGq1/Xlb1zESCuZqEkebZz/XHtD9KLAuwPYG4KliCalBXb+0Pq1Sxs3ZsUfyuIW4GtviJA8Z+hAIrXgS8Ah48IDPBFhd8Wa2re8c3x16ZyZExhqLnGfGXhw3ikBgni2rpMwqPWOFJ18GJkAPgTmw3YCbT1RxvWaRZrDNTNPfbgwqFyveAN8zeqaftDMNrmRamqb3Ij6Ui3oK2peDmtPav7NJ6PzjSONzYVFauM8PYWu8sIoEn7yQSSi0g4SEefwSad5cUb0Lgg1Ynwv1Ijw/VyDhoQLDWL01EfG3dvU71KdYdBHrYXUAUf0RicEUbCSDIRRXaa4ZMIp6wWfU8VojbBoIVHiUQELPT7h3Q87UvWXsCNpApUhLpkQaxA0rMbOs2qzamFQ+cNqAIPoIzvyfFY1i5IoMKHYoWHNWOluv6s5MyCqAYXjwpD23Mfx/vWwcONyvuCz5HzRSH6P+t3JuTA0X7nSHsHI9oa060IPZFjKl+0oUWdDQp2+O42utfn2VbmnWXdUbFeFMl1oX4b9/o7InTXcPtVF4+xJIGvcQMKuud6LiVIQVNMQ+E/fEZTfuda+J6hKG9n7796FokM9QS5EKV+SiZG//5mOgyq6nShzUVC928aBfhhemrV2/Lv1U1+pK1qolMRA8aNEQNGz3XYR0CCqhVDVtSxUTGKg+NFtFSVFMlnGwUVf47h3gnfWwCVilHt/7ShcY95/eZpXU7Gk41egHMvyyr8iS6F7l2QRAbdxRARk64ix1HU4RW9BBW/hyfyn3Ym6S3zgpO2zFf8en048XsSZvhGn01vgVy6iSN5hHYRGBqcD1GWCCL9yu3/ihIftIokEp5TN1zL+27bxwnPyOQ348hi3UAwnPudxbnfvUn/p+eryydXny3RaOR79W+PAHGoUlBoLYGBbQzmuFllDCpQH4gHYBTHDa2k6KJ9oQAJ4I/qjGHBxEZDgGCkfZbtJJ6qffjy4urT6w+XBx7BrMdGM8mJyMmoASCL7WxbQuJ35WCYdaF/bi5IccijWREAFaxG6uizJYtlNW7xR4HCcjlGOWcN9ztGXtAEzRsyvXb3Wf3K8fwlOakx7RaLeonuWu4b2GdbeqBIVByHPCQcyZL1lPPLbVpeA/fBo/fgZF8fABTiOgUtLlG3RxOdcYwmIKmEDGbi8jZaKitEEziDFbh6yMIHDdtKbiNy+3V966iYizSxKo9HqxFXQvDw39mXN3EqIBZMrpOdNrhxJL2DKA7fzK5DmsozsIZLe0zZsiUN/fbgwOI8iaD+gywzgT56mtvVPm5TkqSiVtQMqORwVk3lBh7qUyBAM3KmAp/EOiOgQ7ODOxfXjZ0nam4SAygYGaNOof4J0kvmjUpFjOPFU0Z2OGlGL7lvogKIaa/SWwC+HFaHrR/qzt9Y/+Gbjk1d0jpu+H8v1k+WZnn+7E6jfahwvr04HT0HYvCM4lwUpatuEYMee9k9yyhFcIKTvvTRX9MrPb9WRoHEHKXAeVgBjm2w8TxoFNGdUTNr9zd6ysX2LhymTC+Yt/GHtw7nVpVtrK7AVa8pMN2LuEfuMGPjCwio0weCvbSEbKRVNFTYnC47gHBJK8V1IFx6vXzhDDVOOFvGEbRPjeJnJ/YS0B4GUkcaQ8lLY6hQqa8OjomQSIgGidl5EzIeTUbAr2LTGvIh4bty7vn4W9rqnoeQEF2XWPDjLn365S/wQmrlPDiZyZRPs4pMHw3L15IpxXKj56DvmkR4kPzY86eJS1H4qRURvdCIz+tBhw+HmKmS9P6kMuX1QmQlXiMZcb9G9EV0hr3YOG2JKB8OruG1McMCszdtNl/6QbTz7auP2suBiKc0tvvCYhTe7QA0gJTlYt5N1J7tNEcUrmLXkMrkbR59vfHSa7xFq8ndW7lxJkTp5tR0gH2NYTp0yiWxbY5+A/HZoztC/s+AcefWX73FTelWcbVN8zdrdz9a+eak9ac+rDr3dnbu6vpe7F0c08A4xsEN5nOJr1rqYP4aXpp2qLTwq9RfWIilGDVvgiviejXgzzonxHBfP6djU5RB347/AC7Dzg1ZvAe3vjlwA/eferesObKCzXZsaLme0fiRjskMzsO+aer+16V61X01enynDXWbaK/1tI8rwOGNl26+30D38+sF/YvRc76F3nXt/8V7//MrqypeDm6+8RZ6YscwkQQh4F7oPW+fhgu2REVcyGvn1z3TEVZTG496d7i2UjS6FnZ5c2Zibw+jaMi/GZK2hZTREgVlrZKmBgHq3OyXHtzCKvYJjdfmkgaJbOBjNri44NCruhlcRjycFTDTbcSlLcKBKU5pbLfM6XP/k9xtzRwbXbtkhJwU73dxzkeWHzAa84o0s5h3d5tKbx+NchgJU/8Izg0yaPs35VhEPxUbPKxB7aGkTHI5ZM9YCC7mjGTtkxoOQADYszlNf7AccImria7qif+qMTHyRo8qsl0D1lJdw1eYbZfVifG/7rf/qgaHgIq7y8MYvhveSAhG+2nxz1fc336gl9OYbEpAYqd4igad1wPWgPmItnNt4y8syaQis3poJwGV7xuHbHRok4UImklqOJWyhFtbHrAWshF5ZYNmHC6Htro2guwisXF25E3kMV5DrUX3IOjw//AohK3xq/ngTjodD0PHMUqXb/S6ngKvcXstlMewGHPY1Iw3p6bCX67q4nrWa/vX6ttKxFkY24Hisv+MNdT3K/e7DxUafFQ2h+VBdpvrLAxgaRwWmYGtr4qn+vevivSpQreWGFmVN5lSYHrCblwr0yf6O9H0dhv7oq69SMOb2Q6qVOFLOR6LoWlAJX12YFZSs2V6jOr2NIxZA/2cQZsU/c82CMCv+kSTGy574q+FhVliIgqsM2yO/8v2tIp6E9WLnclFqWD5Y0c3AA6X8HYsbRz4Y3Lg6eI7bTx1b0jlhKT2rI/pwTpxdMAcmm2CIRTtg7cKY4jLROM75YiTZAdwayfKUjCaOITiA0t4RP+wQIoryBfE+4KZhKbI5GvEcx3xBxzjWjkEg3mT3bxFE+Vbm3zRqqtPgMYIMR4COBpAKhMRkERcS4hRL3oP5IkyhbxQwQess+oYGclkNjyNCOuJJaMmVq0JKb2MgjToCyt1idC/aieA9f6vABKe+twUVOHtLe1udKHZxSQCdIHZah1uDGQLWoqkwJ8LzjS+DiullTGt6EdOpSFv7tA7Q60LO6mN7jgBtk1YAK3FOXHXtXqnqi3MlLSDWGRkWLezzy2+67zvF7hhWMRXEsQW1TIegfqCTHQ/Aq6d9DJeiesDF4lER9raVUXuowTEmBxosX1eJqZK4mtBgEu20x64ewt2ue1rwdOIlQJSAJ8ee37d+x75n9YnizYNSupGDarHtCQU58iGGe15kI+zJNe7Lj85TR7Zi+dlqfaeoPTaEBaZvtfJeFanWbJuU5qLFrkqJEtnf0b7/Y9EfglaURENiwsbIGyn7KtW+GLKyJupWLWupqwtpAk5qLq7i+oHPVYRJq9WvXM3A5bK/kgR5CSB/OdznolLodEFdR36pnK4oSzp54VJALsCFrnSFxfy51ZfnaImt083phBt83nUH4GxpjAXEJV7ObbF8yRRXZTmJCJfmUZ52W7B4zVdwwHoJPKq480+vDeZvu4hz833ON5NwUeu98GOugQTAFeVTjfy12NBojFO+ICfdNx8dpGMYipNLXw4u3tWx71wEc4jMCIDNIuIgOc07VAvFd+PTL9Y+Pu9hEFcOhFoH86OX1qe7OQor25QFf+7h+nE4AMtfRO5Pe20YPeVbleTbwejBrt+MJ6ZxmkQXdofo5gd3SPIW5LZ3LdGyK3ZczvYIP+YKRUrbctwd/KllYKqwp1zhOmZjRh7CYuYYpL3Bq5k/X3u6Mpi7sPpiGQ/4F/aYK/5lyeNDzptTVDIow8Tx79Rl1up2IpcWBVbxD8OR4Bk6x71++/zgzH3OEQAH4Kn/qVwz0pm1ACffNozLrIWPwg/mNBN2OOnLbb5l8/r84Pjnqy9u0TnyLLZ5vvBPl5cli12Gry0RJBNL5poFT08XUdqFszE8SGBBs2WzPX2w1L97itJMuM/ApHrl7Njw324Hi5jyy/EgyUc7EN7kriaGWkKSJNxWpR0QvnvSVHZuuX9nYf0obIbZkpH62w4ffsx3i8njip9kejQVF5PqUuD5Ju6r4TWX7Nh8e27ji+OrL27YLFVJC4q4M75mnodv9EQIUcNAKwvuB1kRvp+WikgEQVaWjg6xKuPet0UrmuTtBgriM1oUIzKT3kKbUxrN34ZAz29A65awqdKBY44ZBhBnxr02T3Z3QRDLXAEKjAbgwBOL4KLZsiQuOjzfpCzNGRii8MK2lWPrj7ypZpbAtVjVG9tiuJHFW9knCmEDK1p+GxMp3cZCyr+2jSh5h4QoQ3gxqUPzmih1o15t5s+tvbiqDgnVbVFYKF0V+642LM8SCqqDtPxDT0TOq41GlmNmvDIxkeVNWnBcMPCQXwG6+PSDdbw+BnakkmycPyF/OGnmWMaGiQxHamipQUiRnU2BveCydt7pRvpCRU5+gluwcBXR2Xnaf8XdM/o6uEHRvvbDy/Dd9kFr8LwttLKMmznGjL2ZhQgl8NSWDjR4Z3dt9mT/zvHBhUeDj5/QOq77nqcZ9Oy16r6B2hZtG72dj6eRdSDGIDaha7eeH12DOdOE/YYysEkRa7zlRb41BJtxKaIinXtPR8E3pUwSKCuY20X0OfoEjwdnj4gmBx1jCuZQjmKWBMZGLNkXuwL1ELlve8/goWLAtIEhY8J+Nv3FTUWF8+2UFaOUk/jX3mOA7vxWEwFx5LXvvbnn7bxu3z/W7ra42do5Vo6xcm23cGzdH8oV3cQRdU6ocx43cR3lv8rX266np7w85Z9t0ztzf1QcqW24UYELpV2dXTo66i/nizjvQzwO52go58JzAbaw/8r2a6vs2WGxvdbkKjPr27/A4omVsxdwEJvy9f7Ysv00C5uqb9Ham+prX9FuqWa1it1nPej02Da0mPy3st7y2/caxm9j0G3keQIJyIzM/W+6hcU8/Stnz1ooDAOvH9TcJrZ+7IfB9eX+93cNX6vPLzruqlmg3vtt4781uLr/6l00/rPNc0Al0ciIbaaRX+jdMaMyJvli38vdaWwlNS1fvte/+6FL/wTf0mYP/CURNPCQ8616RoRh0Kw/etS/cMmWsXmf4G9r0g2nTZkU15SDXPVxMW7NeZLFU0bk3c4SFs+3LM2kbXF3J/NoO07ZJTZdN4OipmZNqz9cWn/0RGZNRWy+b2NqJHaFiQH/gApAusRIDKr3pxBUfGwB9XeOuGo6UIeg3Vl2yE350Ns1enkN2LU7PIIsuzwtwxYsCZSMCESgQeym0cNpvn7TYQ6OX+rPnndn47E9Q0C3a6S5lJVS4jPp3Z6w2wnI6PqrT8jvF0Yx90yLl3+pBco85FUmosItT0GJU5pJIJtuKdliBWE5yKvfkryhYFsy6CNZSbaAmWAxf5Vm5Pm3bUaeWJFYhmg6CsfnTXiCEpYdjI31ulRaKexQvzPp9DsPDYUi2Y6kE/fSh8Jbx+dtxx1ogdz5d1YbZuQV0Xg80VQaoGEdzNstUQaD07PrL18GCqUx0aQ0pznDZxYvTR0ZYJgWVRy3qkd1d76nsIZuFYH6U3pW9CtrSashVT230m5Ks7EOqhFFYdhy65SMP762KmTH/LBRGbUbYb/2Z6/Vdm0w1PdvJHnitlWFdH32LKI77DZbqBpUQ4z8rmaPB8Ehe9E0MPanYI+Hf+VaBls8/COcnzAceLHMPx++xYOlcIcH+R75ufYcjNcqK+q9eb3DMvjinvgMbTPQ6FaCvPd13C1V5C0C5F4o/zyH8hsEKcsW3Ja2/kNqZipwWZzHgT3Ezdd7fXGvf32hP7dsr/eK2nC3WsaXgqYJIUjeRQuZK0SB8QDsBaECYeMGsE6SXdxVy53Lpdq5c7lUSTqWS5VUCcYJbrM2KnUjCYBdyYRoP+kmzpPq4fQffSdQRew6C0r2vs69az2kv7YL5PYfEEp8LwSS1Uho5m+6M16CK9PiR2+In0RolcVIBNUOGDGoUxWpDsgpebAKmSZ+gYqNmhZCyhtDKp4zhmTMXNNGyCsisJ2PVD6adgRezQ2ePBf0cjo6RDeBR9RZiJSUGlwyFmlo55chrPhlLEAS62glQNwyxa9T1h42zpKB6xmr7JDE4JPHgyMrpPI088q7wtapq0EtHQ2uYQO8irO2SYsr1pWh0Oxbc+HVQKxGpQKWXl37a/QA1wf0/bl9EpgaeWHoqrT4knJVKwqHJD6flpD9FJChHO9GOhgMPcFa/6qm1yrWRFkST+dvpfG1tle6eUvF7JSyp0a3r0SVAlVabhvVLFyZ/dIq+zXA922cOYnaRoOoOuxVCOvcNgP5xxqfDdh8m/sZKPwh8Nrod2Y2cNps2QRY+L13L+twny0vKSQHuB75mZ9jModtGjhbEXVKY0h5ckNrHpgc9hDefsWLFbj2MZi72X/Ocx1jGCGrOpjGhmGFLGRkTGOZYBR0Gh3I+drpMsZ3XUgKZQ9ROuMLGS2Ns7iM4WTW/g4+m+vf+4AztyONsUTjJ3YAFDFk9alUBENKINy81Rhap/7LE2uLZ6o16ySGYCvt5kHVmJZfNX5p66boBlUjakHVEl01hpKqlUkTd+IT58Rg0/2ValCpj2k8OIXnV6YVt+I4CyrSScq4ad4GVWGCXj9ZYn4nMR1XEyZia2IJSF1a3U5dN0EebtjNWOjWVwkyFy3d6i/eq9QqAcSgWglRCWpFL22lPHKqUo6Mq5SlYWvF+FKpiTQahY133UPoveJ6L63/1lfrh7n+93dhrTes1sGiInUHiEhQK0tb6uXohjVDYn7NmIytGJOwFYun4P4lVakYVi/hMD+t+9TUaO3TI4NnK+uvPqnUaCpJQw0B8IGCgFfGIlFdfHIQ56uqI5SMaVI1AjLxhNMSACj1aUMEma5PCikFm8NErj97LFQJUYwaoRlWBZCDqsAr2yuakO4SoWErEHcireMAwx6QbUVpNNYo4kDOYGfnrxe6lBJxiJytP/50/fGzqpzFB/PJcPCko9FEKGRAWHpFUQy6hMjo/iACrj8I3dXIeFyTWKUaxb1gmoqS/FX75vny6srdsG8mxuGQcVAdpBDqN3hnu6beAAXWx2HbiiCGGyiNIYY0BztguD+4Se/0Tz9ZmztX0zvG8a4VtnDUJFNaVzO90OwgEV2nQ1GpRW1KdUurImZ0RdiBISPl9NrK9ZD5qWS8nvtWOFBaMkaS1zfHQ6GCuxhWrsM5CBGqqWi80Ukc6y3XEaOmUvWdgLlD69jfOHp57fNQmA7F2cGQ8UmYaPisj3Zh0UK3vZBRVXAUpO0JXmoA0LYOSd1guJ1uIkCQ+rsqPaA7ajsgq6pd0Lq2D4BWtQ8MDa8P2lHT64NMCVAnadUPatIa9RrqWWgxkihQTfGBquwY4W9JBzh4Tyk982xe4on9ASc8hu3YqDk0QhSFhwPgX9g9AbsK1z3MDxEj0OVHb6wunV5/db1SlVbYB80kVLLxTDIWWnFwvISgHsxHbwxufc+EXM1aWqSAggyLmr7AYMpaaZo7E/JvdHbA/2i3wv9UF7ItlQ7aKVODaLks4fwF5DZxnAKW+FLgWHn27eEQiYFlhkDii7gyCZmq8QShf7Un+LAqNAwu0k7ITldq/88g5mNOXjTfdTyHDJtBpDnujgXcArZi02PR40+NRgMiXV9rljAB9s2D9YK8crd/KWzbek3enazo8q6zrJqIViaCL5LL4E6hdyd/RNk1vVcjEcK2gAcSrBlGUC0OyG5tnFtoicIM+WqlOT5onFeecKpJrj/FrE5q9RQW1gigNs2se2C0W77doMmlmlfaI+I8y1PzO5nSoSNtZm3IijeR8ydTehqF+YwOyASq/+RkDSs4cdJzqHAa409guHI0camv3MHCckhzFz2RcPEWDHOJMHCO4OqGcwTtteN9ixQXN3usQjPuRM451x6y7xozUXaJa3hH19g5xZ5zav3fDI8zM/vPl9cf3SGkg1liFKjqHiwk3qD2A8X1I4/P1tgNWKBl3C6Mabte5dL4WnZQel6P9nfExWHPxjk1VtiQJ/QsuDbGneDOsG7KIedIeNbd2nUy5VURSGylDigOjS11ZluMc03hlrOWllc8l8lppYnXuTNWcMy417way+UbFdbTpJ5ZMWubwdEUmHPZ+zBodSnWHRO2WhRURkpV9KhVn05z2sXMxNaDqkBqyzFTXa6E+VgZ/XMjN6wgJ39s5K1GGbWL/N1K/qyH77+58p98cSGcgTAN/Y96FXPw5ApEstEFxRfNPP1UGLqWv9twlf5jo2NI69XMn24SvZaPUSotbrCREVN4cuSndl1TQH7DdziVWVT8qZN2ozGQ97/85a2y9xXVBUhOR+kkCtovfvPW4biVJZizS9X2L28Nrp5afb6ov/2Z/y1Vy1J+R3/5U/WlZQyq4VgzHfVnv3mlGV2LScPAX1lkdAf0X9bupvnvWqQFp5tZ3E3fbfw3yANhmgSznrWjf8Jg4F//BmNyuvhEzfmHDmzkv/V//39XVHqt";
\ No newline at end of file
+export const w="eNq8velyG0fSLnwrCP8Zfz3viSNKsi3PP4AACBAkuFMkT5xQNIAm0SSAJrFw++KNkMab5EXS2B55k8fSeJNs0dJY9liLbf2AJnQjAkndxcnM2rK6m9RGv2GTIhpdT2VtmU9VZWX993//9///lxdabb8x1fA3Gv7yC//13y8Ei0Gi6S54y4mgkXD9WtB64S8v9L30wn+94PqVRM2FL9stLxE0Pb+zAl8dPRL+yuusJDbcKnx3JPwdPHv5BcjT85rZdsMrl114YX156NXh3NSfjy5NvgI/x4ZzEy9VZ1+eeGVp/Aj8HB3MJvvg53A2OboJP4cmx0cgycjG4nRxdXqhuLa00GwvTneGF6ebQwudoVY2uVz48/rQyuT4YKM+PxhMjjfmi8O5fPPYK0fbrelcEtCTL/mzi9Or8416dgGwM2V4Af4vZZPlNHzuH8r1u341NZNNzqYmx5PT7dbi8dREof/4+LFXpgr9Lx2fPHI0nRodyKRTA4N5SDWcWysXc+315WZraqJ/BRIGI4X+GuAuwjuj7sxgcqAfXu7PpKYmCi78m54ZzB6HCmk1g3bZbbZbfuWF//q///eFptd2S4mg+yVUf8KrNLw21FH3x04l0XhwtpZo3P+smliAP9fEb/hy+7Ub22+93/v9dO/3k/A/PGn71UTQTrShCVsSwVuuBQsJvwENUaGmJWy//cL/+a//+wJlWfcaCQ9apV5zm94CJOH5dS9Xy/DPf95DLJnbrVuPTn4qc2t4q16i/adGywsqiY1aze20OjG5ejWv06Isu1eXIcdEK6h5JbecaHW8Fry07nsVECxYxuy7l5tYxvdbiQcfLkCNXK4nHpxvoDCXmvDXRuL+Z0vw3s7r/97+66ePvruyff2zh79d2v3h6sO7X/fOXYevoISJRpCoNKDzJZq+W000O8FGwlty64mGW8be2W50liFHEmQZfyeaXiPAR15nOVbSICHFtOoqRthG92pTSms3mCXxnTsgsW65qMRetZ1okcSmWveWWtdv4HvQYiC32256ZdeWtnutgoL9WN0EaaEev98IN/HOp68/vLW1e33r4a2TuqErrifkAQlrvtsQsmHzG9GCVbdWTtSgFB41eoxETSlSJ5iGBPc/89ehqi75i9DXPgCJUJqge2kj8eB9rKzdyyd3vz316P3TIMnuN6e2T/9tL0lkr19o+NDn6n/Kx0jjJjaCVZJm029CsiDRvdp2E93LpLhCDTqPYm3EjoCd177pnX2XDwKvhYOt7aMEyx1VIYnWn9o+fNvyypRfy61Bg7SwIwpdqWvHkkd+WfaaLo4Er5bodH9cwF/VVuI/31cT3WsteP7wzpu9r77onfvo4e2zD3/9VUsh6gGk8Er4R6vuea39hBD5UBu1sRcFLiTzmqC4mz6p87rXTnS/K0PV/dcL2KFBCn8T9RG8Ak1VSfznvQ5Jtg6SlXCUonS33u5tnd/56+3e6Ru71396dPlu794bMEBRY0ATLVOboZbyFvAfbxUEgtGJrdZwmwtkNHxtTeKkawV1F0XqbmGrd69A5+nebkKrXYO+5NWxA4nxB+88+ufH21tf9t74evfeZw/vXoNuBMMuThRoMa8WEsKVWZEQ1VoA7eSWW/6yUNNWvwmoJ3evYX10b5fCHWf32zM7n19+eOs93XGWGv4aZLDsebVWjAa17DEbTEIK/KYpxXBX3Xqn3QrKiU5GaO8N6E1VKcX97xdRlqtlOax2Lv7aOw9j6r2du+e2P/tdDCtbFsgQ6qTiQTfOhyVxu1tIDVCUZlDvQMuBggLTZTpt8OBsNeF3L7VVNVyCcU4Pu9dWEt0tfKf39W+9r77D2njtHPy9fePD3dd/h+dNbxm7XAWsEnUL1olBh8BwcGuUXcNkaEuCqU2zYL0piVAYKQD8QCOBZPDn/VNtIQ8II8TY/ujfvds3H969YMuDw0YNbq8aK5BuJLeJBgNaJRHUoVm6V6MyYffoLGH7fDAf1TRSrJ13/rpz4brWNkKmtgtaDvT6kl8z2sYXMsmMGzLjsK4xcunWisrhdy/XYCSvoBJc4kJsf/717s+/7Fx8JySErWziReCahkhhzZ1HOwbfBqpK/vM9dBRqpqswxulX4/4paNgH59dlhTz89W/YaS68A/9vX/tn78JFUSeVDljCdidILNVcGtAtIRnWSSuoBGVhKmHAQ84laEnIt4P5impBkTaDVbKaJFi4tWJEi2kuLh1vMS1da8n1llt2N4oVjzVZA/qgaDIY7d9C7Sbgb6zVTjnhu2hIH5zvtJF4+G0yoTT0b5YS9z9YYE/97pX5BNUmNPUp1FSgNVEvvXFvG/XSyd777+6++fbuazfFx92fbu++/a/ejTd3732C3QS7OrKTRL3pAoVKkL7RRhd0Z57aHpu+hg2LSqMhBIUX3YRUovsWR/K/pywPqlzScA3JC/cv0sNfP9197TdBE+NLJQniXmUxBNHd9GoBjv6WbAnqGEK6S2XUedhrrpGu4XW+888vUJxzF3s3zm1/fF1XMpC9cmI+wNECJsaVA8uq4aDi10nEZcrW1CsXZTURtFr+HyyPj3SjHS8SvAZzPjHaWx133YslWvdPLdGYgqYsCbUsRLPsZu8Smont177fufAjyqYpqdf0lspuY4npQOJ9NWQKoJqjTEvJEiJZOvtY7SdyDmk/k7mt+2JyN4rPrdZceBeV30KwiBNpYDhgwIukX6DkQGTEhEHqGkmDf/9g94evtl+7idVAxrrmrSFtQhLsJ9aCpqQwDXcNaQSQCBqKNZEbqBW3CWNGzNvBgsfJIgg5DAYjByPiwDaFEJqFx0vA+Xc4e8O/W8RgWkgpoJ7ICHgVt+K3gKXCRBQan1gNMXFiVFATTbCg1DmIaN6havn2FFTI7sl3d79989HFk9sfIb30NjwYzX6tBPk1mp22oDGAGiCeW2mi0YIJ9yoJBlORqqKZumJaraCpXtq0TEG8RBGaZ8QyUwQmVovkYjO6WKFMn624mz6822brL50xycbJbne3oK/eJwLegTnUZyAgDvSa6kmiDXtv/rz92hvbF25sX4RZ1ZfQpNCjRGN6bZyis2kD9SRqxO5WdOUnVqrwXIHoH4kI1NxIB7yL1FApNGPYPnlq5+1/C+m23z318N7nfNIQEZDNGGwRQ3OGzmIjEBNPf8ElttEMwF6cEX1dj/TujyCamEXgREuwQ2xc0ffFwH/428Xtd6/3Tn4C9BD0EHHDKkwbsL5gSkvLC2pCU4cOL/U1TLlAdeLEy2up9QUhhlSQYPRBe3pN+D6mFqMShiqOycarbG/ZTNXFiMaqD6xfsBo0JUX8EQbmtXXsR7++vn36HE04XQ/HF2o9XIqooV6t45DXpFwiJOpqetKSdJxmBA8+XNGm2xApnL1J7nvtb71zF8BaKyZ1TZApkbFS+hteNSpCw4wf1D6rcXWLSw4tnMl2IpW6e+f73d+u8eqsNDpB06gU3v/akJUYubjmYVUg5VyHF1flxIxnyRc6KD+zxGFnZmlVKzejU5HAzkPxsMdCF65BF95ANYU95Ndzj059BDqJGhK0rF9HKlpt+2tEPrHCoUuSMgZt3mJ4UMEwckD/tZSBqNA6HGrBhjZU2IRyZvnp61BdvXs/o7H69VNRGux7lGmoKKGcqSygbKV6gaKDZcLFUdA7fHLbvbyJCmTB9Bqc38r8L93aPv8P6C44s6XMQWOsec2yYdyiEoGpkKptgwQBU7U8V91qoCl0prZRFPnpdtOZRRqN58cMYcNb7eCiTGMPdkS0bZPMDanQ8FLU62d6F6/ghOPea9rUtHCuUVam2aJGLa/UEWtADS/CjZgwXhPmvMDjFj0kcbGSSMv34P3NkBygGbdP3o3IAWq7teGu1dw9xMAcsev9n79AwmZw3Kst14Gp0bK4WEkOyn6je0fMFSqKIHRvQt+D3rig+vpPd3u3fxR9HWqx4UMfTrTnwRa2iQCEFqX5Iq9c48XFaFrkfdwydOzy8/4Lz/ss39rLpJ2Alkljl2tDK7T7rIhGF0GlWWzC0BabMtS50Ugv0oKnXFg8iSucoj9XkJ+V9l5BjF2c617eY2kutBgXswZnr77x9S6vo9e7omttfHktZmEtqIQWsUJrRkFV7JSEl4lC60LR5amYRSAhcxkn/DCAWmL4iIUMWjPAVRb6jQ35yff4/4Xr8D983Nh0m2VR3XFrKLKu/U5drJ7ErkqEFiGwilESWhbZY61hn2l5B2dM5SedkROlkpPyfWbhOJugifhe8+995t58qiurN2aKG5rRxk5kI/PW0Ayx7M/HTVFDE9LQVDBuBmhPt6AbB4t8vqcneLGzquhEKm4KFTsxCc1FYiZHe0w+wgTfa/0vFwdIgzTY44h9LJm3OfwG5Bdm7mIzknKSfDie/oYo715MN47dhlkt8KQK9ResiEcnP9p+92+KXYYJpeFzIRanyZtN28JMjXEqwadkiykShb2KWBPKDVwpQo+i/MQmJpyPMCYSJh9hS6+sQNTCh8x6jEGPteTMgrfcEnoVtBqdetAPL5X9NhjQwK/kYRrQ/Rlm+83l9cwLf4Eah0HRaTfF0t+HG92tGbJ5G0R3+uEN5aPwAtq825d2PrwCdEekbPhV1BctAdwI6pAZfFNt+bWFBhTt0EuH//ICDM9lkGkNHRBcrAZ0fsAU/okTlKR8At478Qq6QcQ5RiA5gVK7TdpR/8sLR9ApQn5EZVpD94bD+FC+2vI99S45UKjP8HKzHbSA//3lhUPsfY38ylFSfvQuob58lKHq1146Sh1cvNfBJ0fZezrvI/hQ5gyTFZCR3gLCBcKTn0bfUVESsOeqHIfUOyg0vfTqEVkEeksX4NgR+aLEeumIUNxVIflR9XVLfk8+IfRBiHxYvSCz6TtC0uJSDMp6iOAa8F9dVj1m+uphXfWrWuRjh82rsqrx3VcOm6pf5ZK/zN8P6jrBS+y5zvHIYdUkq6Jgh3lq/VrfYd0kq6J8h9h7OotX+1STrIpiHuszfQll7mPdBUXt0x0C67TPtDuKpsGoPvtUW6I4fbrNUJQ+2TSYoWoFzE3WOHnn6HrFmmA1h/nqKsB8TEExI10ezCfi4rPZXG17eWdlyFlMO+W+9Wa7nHeCIaeadtxmX3vTzTv1IWc+7cxu9rWbY5mR45CiL9UpTsHn1bHM8ERmfrE6PO50Ck7/uDM77izX5quFcadVcI6PO8lxZ7DaODLsZIadlYLz5zFnCl4acZar88n8sTFnYtxpzC8up3Ivjzlj4061AN8t9icHRsad0uTMtJbsUGVuclpLtjFZmS5pydZKlenJsUx/B1JUjhdTLfg8M5ZJrqRGitmJ4WJmqjiWHi8O92dHxlPF/pFkMn94zMnN5/rGnJUxJ5taHnMOjTlDuc0xZyCZ34A/h3LrY06+2D+emkimxqZSmdFsaiQ53l+Ef4b7Y1yDAqKdQH5xo1WuosgVfFyr6jx4f0NMxM3yyaOPfsKVqotnYCZu1k5wZYpWL2o14Mhq8UQqOJjvVDSFtfKiDOSegckCwHs33jTgYVwFKAcqwVJB4Lm1EhNTELESYxVCrAXaJZBuA0rtdq+aEtiZGGRZDLl+RtBYCoEeAtaIRn2YUpDqILKwZ1OIpYJQU8hVV7sg3horh9RJiuypbCJlMFmYcmh8G1pjqpI0WEmwonw3pi248BGZjcC844hqZ92GC6z7jRLW7je0H6o6Ta179X+gy0RFf84eo8Tv3mkz8UGXepN7Ch7pJbFdJM8qnPVzhG6LpaowpAVm4ahuDTKTkMA6Sb0AQ5VDnjj3AvlBdS81wtqld+rT7Uu/PPrrl1y7tF2cyFds3YJsA+pEzSu6X67qHGxIjhTWIpqfaGGbHm7O4Fanai/gyiQzAIpVB9Mndj59HQR+ePv07r1PdLewpJWdgmgP1I1awo1kQjkwZIRVgDaWxAkpDhSdhiLN36PymhFtCawGtSWzUBkoMgFWlbYAcVvdmw1ew3LJkiGFNIMRtBGu444puOwOSlrdD4SUIfmkcKbtsR5Zy7NW102uFAB2VTX841sbSFWcSKpZzn/EJbMbHOeITMCWkfC52luIrYc9io38a16uW0e7ZqSZw20sHBmxDnWP1KvSDEKn5KNb0GjSal9WgYK6NLx9Pfhobi36B6gkmtJv1blt//xrVHNfXd3++KwelmtBsxnUaYcrKFvDHFhu91/I1IX6W9UcIjbHUC6MnoRgFRwb/ao48I2/au+URYqj98hMUajlYsohd3NkMZTdX1V2ITYrDq9MjY2ncWw1oMpAQ8/XoOGWkEr88691M4h2jhGfRrKWXs9pNH/wlUqwW0HnYDMTC1Wj2RrCaoe9WiBU+7GyM8F55xGVHu46drex+wxjD6taffzPdJeo4M/UW5TwSoko4X1sQBr2Au42uUwzwXVHufEvIfieHSXPq5v18XAWjESQxOGuYUgETWRjd26IT3FaoikJ5yNsonDwvP2PYNBGyicp2x9FMJ+b+z0fHzsofvR8pEXxCpVMVKRIBTUokyhOcUA2/mkN8QHbwoMySQdrHIxUHEen5ymNlj4gffm8Ciy6ah00O+1OFllYy603g2x4mRp3QWASN0E+RNTpBvk69fbJUziVQ338ZmidGsASHqHzZepXj+65TN0M5k+coBTzJ+C1vVepq2W/knD9klhspdVl2oVq4GZiVS1Fi09mtde8h+t94sVXj8rlv1JoxfeofllhvnRU7laqVV/zSku9c0SuVpf0yq95SWXZJ5aqS3r19yiTX5aJ1qHFJ7P0e4TJr158RSxYqzfNui97GTSOfJvWrdVnw3HUCrYsi6pXsYjtl+xVbFEn8p0+cfixZK1k6zqWIsq16bCEtGZcZQvNLZXRocO69dS6sGmxl/pUM6hlYV37h/tUzaplYV2hh/pMPWH9snrQC8WqSlWR5FKxLsjRyJLvXKM6Pzo4PrncaDdL5Xpmwllu1kpu0Vnqn3Dcueb64mzRmfWTE878ZnN5dLD453GnWmpv5ocXjo07m8359uCQ9/K4U9ucr5bKkHxjsbRehbS+u9ao1lbdvANplzql2nxjJJ9baS83qqODA0F+cmZ6eiQPCWrN6vpwyllag0Tzq5PTAzlnZcBZGcZ0g5XpyWw6NQFvV4pDA+nK9KEZ+Hwc/y40xp3i8PBgfdzJlKfz//vPY8NDmVeLYwPpY8WhEWdsIJfPjOamc4MjmcGBQrqQg4fJ/lRmxBnOjUKicQDJ4sdkv5dzsvBHf/+okxp1kqNO3KJuGwdsteHLc54L4jAV7nPde2v3+k+4p+i7rUSFHA3k+O5uqS17D2aYFaHxxCEs6Ux2/SfpRoZp8zqlp7wifW8+tJJsDKC1wGNZI3Qrji4ciwEKarjEzNxBLBuX7BUfEtpmT/tZ7ZC0cnFHjkBQ+kraA6OapchCD0lsiKddxWbqzy2rLbRY3VHKytMyHyCZLUVWfUw9C7fPq9UyNu9awmZX26fP9354V3MsW3ItNusWCNnSiz/m/IHsEHTkQPaGkj2ZK/GloAPsBiHhDoKVl/jyD4kq6bk9xnjjx7Z83tSg6arPyvRLZiFIyKQUDnoPiAU0cqA8r7y/Tn26c/dc75cflVxa+5ApNuqnTkDWSLeGuB7fFTw3J0e2SB8Z2QJKL+SGJVPHSpl0rIEr5vSo4gFMSa6Gm9Y0p/DsNe7QvpYubiCDjN2t2IrjkxUuojWwMR97SDMpcTSu+m1ej6ZpFYxG0GnjBu/BVuUz1qQUzx4Mz9PxLDl8Pg50PZlKkicXWM/fJGeuJ81YevapLi+7e/e7J+nsNP50b+c9fRNVl2kWrlxjWkdo2EgD8aPS2pzpEfmYBuKu/yKZ3dWxF0JNqcngs/VzyiRku0wnbyvwffq5QaC0diff9J6mJVu8C5lKYq3IWvCCZNviHK2xOrzh0JWjJi0iCqB3GzD3H95FpW4ai/x+eV9qPUNDsWGEbaM90kOjOtIq4SYxRkURwWrD22cg6URedc/1PWKgin4K6il5p2Kd2r6KaohfLFMWv2nRv2dJapG7gyVKzyLOH8MxnkkSUy1KDcvtfbGxL3Rt4/kM5/OYsseJxi2R65uS69dariktZyleBFDWWyNmMMLwZkWFYa1Ly8YyV7nPqNP2Ek3oq2cWzH3akR3jrkm2uumNgtpdrnuTey58CfsFY/V4zMIXGS974ctrNbzJRLtM4Hzp69ieS1+YpH3ihEizfOLY3otf4SWI6ub66sLGWmd9tda31lk61Le6WD3U8RcWq+t9/sLaoZlGafp43Z2aXpxbnvJng8nFueaEP7syNzNdmT0+VZ6Znq8cn/LKzeXq+kqwsAbp1yH9Wq1SmgFRjzdq89P1JW9qen5uZsqbPT7ZXC5NrATu3HRpfnbK9UpzMxV39nh5ork8N7kSzObGRkf6U8nx8ZF8LpkbHa8WMql8er3fGUrm08PwTTaVHMgOD8FXI/nRwWymvzA4AI/S/cnhoUwqmcG/spl0fypuGaHS8N1yIujA4GnoY1I/dsQa6Cad76jw88Tnf+t9fmn7wpY+T7zQ8Gvom7zseUvCUFQa3gZiLvjqaBTlgecBpAEKHpytJO5/4FeY7Tn5/u4v79qQMhiPxNswx8LhySYUQondT/1xE52QK+geg3Ml1XN3Pj/Zu/XNzmc/Pbx1UqPD/81SWGLEYyKLHJTQtCxM+Ga77NY3IUAuL6S1BPZXOwGXl+LfoA1uR+q4d/pG7/y1UB038aCOLXFgVzFmoMRl6BamhcbEDUK1W+Oidu+gdOirv6iXie7u3N3aufutBqy4XjMkHoLw+qxp6RCQHMblER8N2rt4ZXvrSxuUSQkQdp3Wm8SU8BSYCx+TocM9lIePZ8JlDnTMBzLZvfexzkQc9AGD126xvAAa2sSqX51ZJi6bUA4h+DCwKUYTF9pwP0gVoHt7BQ/Sl8VxQVrvYEXonb3be+sOnhr8+LouBQYHEWcGI8WoATovhdsEo9kwLUHb4h90NmLaA8jAzp1vQk2CBzFC8KYsPp5/w8Eu1Ah1wvvf03C0S/Ho1Ac7X3zNi7AWNJak9Bq8FJLdK1FVsR5O4BakkpPwmKAlS9CgBQZK17iMCccFFKHgtHQNtxwWrtJZNsJtusuk4Fqi4CKciOwRr/0mLWet5Cbqro3ARCK7y2qPrC8TCUywlkeROy4QOeTx2jLKK86QQx0hCKsiTGHkMaPKVVuVdhvy1ot0u1DDtZgeDXezUAfzSjYOqyHLRoloXd3L/kpYN937rHfmvZB6gqFhKycjn9mLhYGnBxlPyTRQWKdzNSm9K7gsYCVCguAOoiWJTyhcz3BDKQ4xKRsJcBYQbzxAsWRzy0EtKHP5MHBCyDhuv/12yDK229ArQwIGy7YKEchKSoTVaDYOly9YDhtwDAJnNanYiAiJCNPCkIgbMJRtCXGHwjbdvtHUEvWatcfx8XULjgmKWGGmMW9ZQ1qLtZqZ5s12f6uERcT1JJtdzBstjJDMigAeNyGBpXIRyRZwFdreNoJIhuh4MxuvQIS2f7rLLd+qX4sajNVQd9TomafCDSHaAtftjnkfrV2oRs+/FqrRtuuFqpRQuKR11iuBU80nCDiqcR59vQX4EcPmWVY6CBFOiuzFhJbdKkSLfgpJTQHFuNgiQJc1nGq8J1yCyhXQnFVc/xygeZcgXC2uAJXixq21CAZuMXvN5Q3fNlzb4sCc/Wrmy2gvo7xqF6/7LVg3V58sJSIqjpQCCTUMVLNPwxEV3bzS2RCU8NHHbxgyaIigxcpsPqZpGCNgnHyZOQk+9umQ7laNopOc3PnmrrKNIpqjJDmcgnDyoYmHYR2McTBuQFZQnBtdEOHGMMOvvgB6oLgBGT9GDowhD8/0he1mdtsYWmmohX1WFlVbU110Ye6EqVN2TlWu7pgLHs2+qfHVhEIcQFiU/QAmFTfe7L13U5skZo5scyEMhTASxkIw68B1d2RVUKhppqK5GpUKVOhNpTGZtuSaTIV9WKBzuCLow86HX2i9xXQWVytSSQnFpPUF0xV8MFvDWI9eOW4xgh8btDHOQ36l0b3T9AYo0EOs/xA2MLpuzkBLlPGPYTrymuZrKb1fz/V+++fu9fd659/rvX0lxo+o0uhALnwx5ZXH+BFRioUTr+zjR+S1mhjBB4MtoPheZ7nlVdTRVPyygcEP+Dfkl6O/0THAj6nHuKLk2kle0t+1gnLou1eFa4xbW/CaTfSRRi+TwyYL4cYSXvKpVRqLrWChM+QsVWvL5U7gTw8MFo/lnIW6u9Su1loLS/BdsLpYWfBW3OpSe3nFbwW1xmqltQAQ7eUSfL3ieyPDgznXh78XaquNxT9nHPjT83EgQbp6dnJ8ZnRkuDCRz83NwK9cc3BgvDiUHcrOjc8cz+fg30n4mJ4fGa4MOQPzo8PjQ9km/DsyOV7MQsrZfK45MHN8Ind8Ij+fa04PwvOh/lQyDT+ZTH3MSSVzIw7825/ET7ELPlb7+MEyBSuhwFUUpaDx4EPSar3zZ3tfvdV7602lrSlN02vPu7IyGUz3qqh+edBdfhEXkUrlEIqZJLKyonZJFDteEs/XDpZk8sTe0G4I44OzA5oj2mU7897D2+/o4m3QMgNpJIzYCV2dNCbmJXuRxjRHSjAWdQuZK8pBC7kmdu1ehcSoteFyisyj4bV47jwsWb3l1RMwLcIS4+l+DG9CsV62RHDlBZoXgbYW0Q4++ndv6/yjv1/ceeNb+DhfA1gKckDWZikI8PB9dU3VrF9P1Nw98wm35oPzaHDl5B6jH4YjOfd++dfuW99hKLsfLvMyczFIhphGBlHsFl4NynjaO9y63csbFDKkJdp158wnvdO/iD5bbXWapVB71oAOlO321NCh4hFqonu1okpz+pfe7x+JEgjomBaT+LzFqqjYgvBg697GEFt1MdK2f/5p+8fzUmqMqc/HWfdfUmXyUSZQRbyysODQCzcp6G0o2Nvvl7d/+sgaY5RXtBQiR6v2/c4K7l7GDK8FCrILveCSONJ15r3eN2/23r1AgSRExPwgoSaE4cYQqHZrmKwiEcRNTuGeRlnyspm8Md/YlhL5sGK6paaL4U2Ek3dEP4os26LJMK8zr2ku1rKazNgs3mYh+LBuhILdwSMq6MlnF27r/O5rl3unf7DajjKNlktmzTugiE2F4V4wRNhytAk73Zttit0p2++rn7b/iZSOAlBB+Uo4GbKaDkjlckgrRnIJlU9nElH9mJsVfVDHvaKMo2UUuVv9k8LMGUVI81TBCUEF4hbA5+cV6wSlxnQeJay5HCYsOcUbpCl6OFD9OwBrxaf3Y5tEgep+VncppjGpVj/a0fjaMgXYprBtGD5f9D25yHzn7Ye33qYYQiywrtUNNT2yumEo91BpvVrCjo+1Ei72nTelAGfvWlEOhRhBnCWTktgKXURoCqnzLVS366Ijbv/7K9BYSpnTFi3rg1Z6BhmxUhFFaGtBQo6KrLA29JENijXOzpDL0OISVIQTl91ARDZXMR4xVngrkLvP5YaHgcGZsrYoA+0A23QB3YNCXEH74Vw2PFcdhSEx5aaykZLtLMvA52pzmSKdrzFBZSjbZlDCyHa4IClgZdQgmInK+JOWR8/uzzd2vzmlYeUUGprsT3qvftWAQ5ut0gRb9e8H52k2euft3Z9/ETGIWiISk3w1oWJsKT3j+qRnaHzO2yrs3N9sFdYqiSmcVBwqSOWTNmekLdV8m2wwmeCI6eUmV8VUXQvw3L5yzCl3KhqIfLFF/5KhPrU0rMnkXo/sXHkjjojMFCx6ImBohnEzvMrCk7N3DEmtlteImQEgbryevrFz8R0BjsxsA4yiJ/cVCDF+SUlxbovWaypvGLzF2lWgLvNdqP/zfs97vMWI92KorNwy/LYop4i6HWadhmmK/kAsUPE+wfcU07PYXZh/sWbXTa7IFSNU0itjQfCbEJ3RFEZ0fRnvkfGUKIGgMHCKkGg2QrSAUwF70Hh60FgDxhot2vIyaytve5LrS3KxhUwqmDxm5pQZFSEwyXBijLK2sJa7d+5g515DrzK/xk2D0d9CYwstLZWzUcjCeUkrdrJGyo+FdIxQglL3Ge2klBKFzFY6SJRlqyx29XVctnlasXnv4d0vd+983zv3HuUufu2fuxzM5K8th608NCZ+xXjLrPrrXm3eGwcjVg8aQXM0stKzVQbp0kI6EC5rxzNjUlrrO40OoYFJkxnwVZ6X91zlEcmWT5xQ6ZonXt7vzNiCX6cZcNuteHSp26t4Hgz7K3t2zDxDhSdia9G9cBvwEaM9y9Uhv+rqBxS4rBmsYsg7DPHZxjiGZX1ibIM9OSrOkAWUWtkVeWxMvKif0ckxXJkVT3E9VJ4dUzKrh4f0Q9IP8lQWPcClSrWkZApOx6Sk8CKwlhbwsPyoxejTD2Rm0fWoUnuxObNSXejz3Zm541MThUOtocnhgfGX4HNraK62HJRmKuXCcXi2Bj/r8FP04EFp8ZXmkUNDw+3FV1Zeri4MbZYKQanw8jJ+J34KZfy3CQAv9bkzMy+vLMBPFZ/N449H79Q2l4NW1nmpz5+ZOjzgpHJOMudMQyYgz+bRuakNlOV/jzuvjDvjfcPO7PQw3maXyYwVc5nxYg7+HIGf0cz4WG56cqB15FBrZR6ywIcjg1l4XGyNQarJ4cF8plxwRiBxqj/5aiaVTmbS/cn+YMxpjjmNsdhzTwu0NwP1rmJs+iU5etHYiTiEd0i97P5+G0YHjMLexSs7f6crKeoJDF2tgkjyHgwUWUSnF31Bwj84XxNBNzjuo7fe3b33iQFtelWF2N1Svd/CqyTEZoOBM7sOEk3tPRDafEAXvgjDJzHl6JHcbMFVkXJvr4gj/SQhXZck3URu/AtFPHtDeFckaIGfRoQKsIFxghNu91tXeUVf61TUtAmJwfXbYkG9XV3wwQr7CVpWpwEU1DbVZIZkoUUxBSV3SCMynfo0LJPCBLEMIvIDzQ/5hRrVTTMNkvdpfP+JmANhtOGGaAKM0Squ2VObCigbNKjchlD7gcAakYfTtiDtTOD+2oe/P7z1HTSH2KVoBHRLSULuVMgo2xIWr51oAkGiO/KwE9XlvQp4Lx3dSIf9sXu7hewL637ns1s7F7/AG8Sun+n9DfGr7U5ThGyFjlmr0RqiQq3hRQByxgbTQ3HvkruAZ/Hqyhvj/geQF0avDeX08M47D+98JvbMdWa0tgR2psUyCxZqrskHMuh+p/CvLFAYeBpT9z8j1FvfCcidu58I73BEAlshAi8DbamrKNFY4xoKa/lSI4T06K9faiSKWcOgsJoVlOherhg+klBgcGirZ+FM/NRFq2ctByJMLBmZ7mV5JSPuYrqrNhLKhmgaB0QDKDkU2wqpuyXsk8JyywFyMQ+UfEJbKhHseJMmm0B8xJzm458efbS1e11Oa9o4q8Y4sbXlqI3rXi7zUpssOLA9qAjdLrrIhBlKG9aLm3yFUGkeFkEVEzJja0EDqTuwDgR5IwwbtOnaGaPsP1tTCmrnyk3JQEE7YcjylmXcu1flbqc07YK6htS5QNLqXOCRAhZwWpszPKHpSmIZQuoPGO2iVyPOhc9pag49Z6nhNytacWASqqrOQveyQoBGpXFM/vc3fhKJ8SrXNZ0a3ndNapG9ZOcqe7E1KfOnDUqhtsQWJeWu9ijrXkklFwHLr1ZUepx4/f6RSA/6YU2mF3Wq0mME4VVUrzKGOLkqQOPW6Zf0rnnjn/A/Tt9qa0GtldCbnj6wzhbeYKIjh9OlBTCDw9jAAhFmgeJehhW9gbr99afbt94Qe6gbtSYMnbLBpLQGUBmiTsAqSDjCKi8EVU/XhC8CVRVd+wEco6YqDCfoZen9QXUmIQUUVR3+ogW5a1hzX/+mqk0DUc1xIMEo1UxVdkU5VRW9UExVqQvKOarog3qaKsonIFTxaGIvYUThAEYgyX6gwETR9JT3WXqijmgtzeoCTSeVKN3LDS3E9jv3lAQwoW3r7BUAtj32CBPqHuazPqpj8lcMxJ0CvXuv7Z48j86P35yimP+ej0GpRaB7XE0jCOMD4Vb8TjnhyqD84q5RQtbB3f96G6+8oMjutQ5Mctyyiugu0ja8dhxvUGaMuIK0YMQSyHxJioDxCiU/UDxSeT9Yqof4B9c9wDy07uks63aPkg2kAMrDgNa6mZtB74d/iFFiiEWEVYQ5BTIAienR3cNiGuxXNPDD26cf3j0J1aa9GCSPkC4ZiBCLqujgNRGvsm645TvbX5zXzhoSTfhsYMLN0Fg2pNLE6+PRA03YO9kEm5ZjBT9zJg2JWNIXbB6MvuDxksJb5F2uggqqTaS9I64tAb6++/MNSrXmCm5tiDWX2y2pYvfOfyv5tGS9hvI2tZOMvCaX1oaEUn975+o9wUVFxzAM1LDBEP/jtM+QPc3zNDNjlMzQOs3DNAcTE1uSbUtEd7iIXCaQ1RVHiRhf0STF8B81P1a8JJbxa5Iv04lFQJsfiIRei+/S6J0ZtdYkl6gsK979Tmg9oe+EslNqTtvaZpzrjzCK2h7u6/DTUlaKXZXB7YiwHmQppMng1kJqea7dtV6X+lyrcrqbhKwn8K0HZ0nccxcevfWWuL6CzrUpvbvPqTavHeqO3GdLdD/e+SJ+WkIjKGXARq52zqKOvxnn+NRyV0Gz4x0p+b39nujo2LUa/hoOuTs9vPtV72+/xTo6ueHA/i891tPJpcD+L+2z/NXyvbK36K02wKRtqDUg9pCHPqIVH/WFCHXUJ+7Fkc86Oga7QYiNj5NKDpbhp5JNJd3+wVK+WnRGh53c7ELRGYF/58bmZicGRqeLQ9nR4uTx8dz0eKZ4NOO4RefwuDM2PVlMH844s0Xn0LgzMTQyXcym+kcnh0enR6ZTxWJytJAeTQ71u5Vyst8dBGyAnZtN9mdT0/0DqWx6MpXNjONps1SmH34NFWLDjVdrYGrqHeq7V5vkpN9A84sGkGaVZAPu9G7/tHvylJhV0hmLeqJSCxK0Gxg00LaD/euoa3wwUmAUkSMxDBlgRoLIM/Re2ScYt6G2iUkmAhMbxQACUGTrXSELOkpuYnMk6J4KjiP3LLUcWgiZmKVUFx2BBi57mBZanOqH1IZK/+4FkR79al1ZDUh3MJHoJao2LKR9YaIYsjKanpZEXyXakMd2RK1c8ksx14lCDZ37mF8nitW0hpdeRi8RberubV8fyvLWV4eyTEN3h1KO5no7lh0/nWHysu8KxW7T/bJNoYQXVQgGlZ8dnEAGLqQsdXACGYUEcqW9KFwuabo6RgPXAEK16pKFshJFC2cDJbPyoJJFwFnAE1EgdKr15+W9b3zjHnMyu/QwuMTOfC1g7m0ui+IQEt9IHwYV4nNoFF2jk9xR2FCACBJe7iVjc+zZErzxQ2Eiwi2hj0WHiiIe6RESagPemS1oKkgE046UEm2DSEWF2rj3w2uhZmj9qe1zmxBpgLjeE+k5qtu0hNhVy8qosEcH0GX+JJvW+yP6iwbVAV8sie1Tw7W4sBW6l5h2VLLLIxLlTVvwoPut1kAcnEOGOoWNs1dQi0BbhicwU8ZEPYtdeW5TENLF1ijRo4NVAdeyz5C2YaU9YFVz4GPeFnLf8klHlYMpHvPusQCft8dG+bZuvcg1Wv+fbuYXKRMfJ6MTnG7zNyDj3cs3LN7Nv8a+l+Tc++he3FsnOnGCOuyJo/uw7wYuJjY7FbxsCWiRjInJn9ZURExi1Hg3orwnlFP1ZjmOpzfLIZIODwxDxzqFBxhIpBK0dVxMnbWKfinwY1n8SGawDD+V9SEnP+Dk3dyAM5Jx8qXasSHg8vR7Lj2Vy48O55y1AcfNOuOTo8XRfC4/7IxOjxeTwOXzObzDaBQovYhQOZXF64vGJ6eLlXKmH96fzhTSqbnZ6WJmOI0xIvpnSofSjpufEow+CYy+Uh5JZYYLqUHJ6LOpeEbfDuhKR4pKs4F36TUYld99+7fe91c1j293guZyK0FOiJROs9Zmp0UcHjHwCFRdJN49j/eFwlS5WcJNT8F+RFId501oOapeVwpyR3hHXqUet/PmF9unz4tmgElkp409gDTpTauf6PNp4p0nwQmjWGy+hT2B5EGqLDYoBdKjv98TSNU2jUZL/0Iim8sjzuNBQhCGypMYgktbEJxLCyxNpPci0dizNYNW0GKKIM+2Px2+vg5egrN74OsSXV4ZLBmznYG5K5jfTkVZiduC+fUSC/KeYE6h2cDnecZmFs7BxrZBDSm3S2G81Tmy2G8yZZG3DVEuuPoriqLuC9Dl4HYuVBCZa3x2HJ6hhuAseq4aIZA1tEcR1OFsdj+VKoQ4ps3vmdDlYNY1VAydn3JZjbYIz8ZGt2Etlm41ShT2wdnOBjXFhum59y5u37iFgExybQ9iqj6uB9m954JGU9wcR60k5n98t/EOstMIMM3RKw2tdfjB8xjxedgPJTg/LU6ZWMfQpX3tbgkDK+mPyC2qgjg06xsMaU+yjhaJ2TRty7QVU4bo+e3G8yp7ro73S8uI+lMnaphEz69dDnh0M6n2K0lLFuVASmJAnqf7xTJvQOuPpd3N8osJkQHh90dYN74gixuh3CIxjijrXO+R/Rh3s0x0G4U+cWQ/b8/VDr9VFjcs8Am7P3bT55e34gswoWVx7r3OPAtNj9/DAxWdPsyQl8vj652CA3y3HJTWx9qtgrNWd1dH+9risk4gvLPFwVwzm06NFMfWNwsLxSn4vAqfh/vKQ7XSbPlQqVaori25G4PLqQmnuqYTDuZmR5x5eDOfqzUKhalWDlIuplNHx5yB6vTM3CEv74ykMO9GZm4aeHY579Q3qpOV6SXEGHDW4H2KAz8zOVcayqRa8JniwE8NZZJJp10oZuBJOpkfGM61xlLw78jUeCabdDJjuSoQ+VxyZHigOLhQgH/zqUNDTn/SeWnIGR9KjXnZ1OhwfiCZnsoU4d84Nk4nXNwmhbKVNEYdcGEERpxwUQQmaCdYJGVEaCARgxZ89nDMEoAzIcC1QwjbJ2/4sRspkfSdxkO0vuxTTx9BUnVGm9DIg7kiniSvITlkVQ2JUSvlIaUjk2phnjosJZemoaWRGLiajm438C/tVb6Hx0pvvadlkAIEKndRo3uHna2osLNiiCp68Txt8YwtodpBsQRVaBVfSZdbLVuosltNkFdCGAmeJGgzvm7dSIljhCIS67XU8J1/1nK8ufLPupGygvGA2G2U2OtBr8lhE86BDtqIC+ct7NM3MLqvHkUGU+GFb6gMBXw2uCYEt8A0lxNWKOiRuYlSauC4+NEhJAVjEHTqPW6gtCM926U2IR1VqdnVhJgFv3pSS7hH/Ohw1Ggz3BSQBIm5gTIcuJv5jvD2ZqJJudCU6WqLadtIu6pGFcOQDCG/gPK5G/N5mlI1pHW3pIkGHbn3lA59+iqkEb/8lG5a+FeoMdUtk56WLxxomjefaTsasihXoLbO2o0Ax2wwz++obmO8KRVjwNwvgtfU4fRHD6kNdHCCmcgGxvHVl4E0vQ2XhmxnXg9Yc2GZBcnBOIRIzYanENQP7Fa4vZJg4pr2OHtXyCpPcGopgeioyMwkpBhwUkx31eXbNCJ2mVC6IKWMj+GtWWOVZGRDVYgJgyOYjxXRHlhaTDW8QpLSSBOCwnCTYtKZTrGjpG9fk3WqQwSac6ZNzwTFZtI27EqNaXbl7qXaXAxZIyCe36XdNJLPs+uQtTVr5wsq5nNV8VI5XP+Yxn3mppUNq4aulK6TjZcr0pqxTZlXUoVEMkEedePJU3NyAQ8l2Wsq/TwE8pn53rNzs8cFDA+enfw8JWM5aB7xfNb+QCxx9KoFnUa8LW2kdZ7yKSzZs1gZVc3BfDhAGo42reafQ/uqqgusisMRGlK0hg81bI0ovIajEsojsM+hQKQ/MqsxHepUyMQEkiM9JjBZxW213FEKZeM13VoHz2Lv46rXgkygZQaA82/e/x7/vZ0KRyg7e3f33lu905/sfvs6zoCivnttzFFnxhc1Dj/GhQ9SLp84oZL6Jw7v68rXDOoiVpjcGhSfQxuD0EPq1sYgPeCue5Asdr9veG6wDD+VQtqpFp28O5hGz7p8qVLOzRaHc3NjE/m1AWd2ujg8nC2OdgacchFXIF4uDKYz/RNOq+AMp5wWPJ6bSh+mZYxCChciiiND04Pp/tHU6PTw8elUMZ0chSTJoUK6UhbeeyU3mU31pzL9ycVcfyo10A9fDnoDTi6bSiZz/dnUQCZ2x6/ilz0KwY57W/c/w9Ns51t80+/kG9tbd/WmXwVPNJXxaIdYtuzMo9u93OJSWAGD0hA8sZxmyeRqUaGNjeHKTTa8PEUkf3jnskhebbsmY7FeStHjZfYy/f6pdc4s/dPnD69ij3B5zvumYmlqcrEW71yOuORh3Ud88QCHO+J5FEMi4oPnSzzL/44yESfhvBq1LG3k+d1LnSUZanjr7u43p3r3vjfIYqew5WtUN+EqrkmAxnwhomW4sK9ods2slhhCXutAYNhCFAEx24JI5nqkLbln4hkL2N2SKuD5kocuRBLl0eZAlccEdN4y5sDjZlSgNQ4KiC9ENUWnFN1R9MWWJ85/8MYQWVpNYTfDBZlQkmihHNXi01NXoMy7/VzJ+e4UQTDnMYSg/m1VGnRwEwhah1kWssg9GwHEUHh6U+Mm4Z7bTVIP0lLYgrx4avvvb4grp5QSNArwyXWIpbeeVvUwlRDqFqJX0Fh/3EtiBD7P4DmQrv44MZ9HSpP2qbtE3BYQYAxHd4CwEC9S0K+1B+dDLlfiO9mK9t6PSuZvpDlH6ttz4wcT0L7PRuVE32PdrNxlvNgh7GYlnjI3K/koqBkeJR+FqZR8zLiUfGLIlMlD+1Ppj1GClR+fWUs5peOHCk5/Fn2qKvDbLWeFW5U7NTrq5IJRZ2HU8UadzqgzmR+vjKWciQL6VtXSTnZotDhWcGazzmLamcZDE4fHnZGCczzrVOHBZDF9aNwZLqCT1XzaKUwXhwqZ/tEheXBiujhayCRH8f7eWtaZLGXd9EAKslRuVkOFyVQmN54aQNLVP5CFf/v3DM0qbgOhMDJ04Kxx/4N57mfT+/Vk7/Sb2s/Ga6tqD/nyuHhqy2XOPEDgKWJa0133kfKEAqXRnSN4Ji4coO+tOzt//8SKPVjxW26i7YWD3aksreiDYtNc9BXhuLVVE2XqXitj8AJcZPzmLhRp+9pleRKE9tBFErOLrjthBJaBajAbRt0Nd5P3WxM5tpWoy2hASjTamhFIYmuGIj6Ld9udAIOIsMBWoKH8loXHo8KaVoxuQonGDG1F8SY1d3+ZzKKhb1vS+ev5OoysGeP9pV4EHTZmoUsuyvGBikbxjfOXgdLeX0o3CI5hwIFm4ClbvtxLOfR+eG377bfN7oyf0FnpOzO1BuI5xGUSBje0cg9MQy7lAx24MyK4HDdcaB0XsK3bS0Xws0TeE5tjylG4F1SYhaoCCJMaX8+8JXU9m4BzehypUH6W0CyPoBGpZQ4d7eIhRIuqSn3PAbtbK+YiaSnuG/8WF0mDoC2Fa2yMXbExfY0JJyitURrMUklie5Bt7x5Uy6ukiv3KLzPxAkZaOtrMgrhw6eIxrfFvtyuH2NgrguBqE0hMU0dxwkg21un43d9vg0Uwp+OV3TG2JmwMHmsKbDMg1RzeIqEOxdLha0q9feYdkXq5kyDvZK6EuYLkdaLrg1WG0X9PmarBUh2AZjjgwWqP0e7VBVWUR59+KIoSHY4H09Wft0vG8HF6ZyJKyEXaFzFWF+BnbUauvpT9zObk6kvNHCY4NT+0JzUX6YicS8lPHNqfobc685KdvyrZOT1BGn5M03UZxlm891LkcU0FtQOaLZ9ZPF4+ixB5+ZwzefnIovIgEILZueJ0gqPHMvtCZrCcTQ1WMvlNPAiRypemjudmp6Zzc9PF2qDzas4Zn52aQ/4+O1ok5g6EvZly0mlx3Hk55RzNO6k0cH1g7UMFm7WPAGvvT+bL/clBd3Iuqw9GqKPOj2HsoHmoqgWxvYrRsrs3m3Ss//TuP95jjSH1jmoqqbbUV/slNdxVtqoYQh0QQi1Ldm+vJRCi0b2NNmvnzFUA2f7lF5rxdtrrvlj/dGvlTc8sT2oMKYBMrZNiMnklrkxYY+pWdRxd9AcfiiAXp3fuvq5UrnpJa13WC6NQjwfiPN70XKXERbcjIow43av+osWDEfEDw4NVNw/TYAXMeLB6VRJhjW7zYMI3PNjgMxpskAwPVmNLkhMV8U7nEiXEIjCGyDCGFktAzWDNgI7LUOfDODEhG068ByDjxPKJueljr0LIvapoATRN0g2pjJctfjgrnYO63phElxep7wEVocjqueTI+zaBvtov2gSGSqkOqyymXQbzJFz/vCsZA7wHms2WNSAKq0AR7IfXBJ7iyPpFN75mjb8cK77cK5SCCaasRyW3BIop/2E9wj2o/qBTKuKsvs7sL+8e7R9pfCIctrBWFkZSrj+sFrcg9lpXJjuyvxUxFkRRUNL9e2t+rfUjevqxWjqkoS0VykqtS2yKyzTk06Vq8FQHoCAOcJA+XUEOphwc5Tl6XBxNpm9iji7ILF/E4fLgw7kQT1Zfyu4SIsrqWzDDGl4T5VeP7EmURTpiyvJPeHnfpWzkbokGMU1FlcUzTpabfjvBWTJ+FvxWLXPDA3uR22/HLHHrZHKB22+HlrcxZ82K4WvDh8WHKBl2jw+Wpw7lnMrgDBDfInDflDNVOX4s5wync7PwM1cSD+Hbijucc8ZStLTdP+5kJpxCzukMOOnBDJ4f7p9w8jl0K5jMOTnAQr+CzLAzkEPXAr7APZ1OFYu1AWe0kBxdGnCGhtOT5Rzw4TywZHQg6M+JBe7i8HgKiPqIk8ztS5hxqt5OyMFwDebqFPXj/im8iEZ4YvXe/qz36993zvwsXLJQtVAjyVVXUi66JdkCQDuCyMEYkgWiCeR6Z1myx/unapw4br9zRrPGWk1cJ2RTxpq7aPFFhIreJxVeWQdcvqyuoK0VdUQOracjuHDLAESxgA5IYumcMCTdlv2YV5ArSDbUEaQVlQNJVTrNrmXXfe5qQZxwtbCjxIhnMWhA1PRZIfIlZBx3nDgjniSxaJwRj3FYMMrvnOG8mCDNsq4YxTFIHIVDRNMzAowIpqmFMFJRC0EUmyEUtjJjxAhh1Ew3YR3EThkhsusUpI3XhlT1qjY0SxFNrld0jBgchkPw9NHENhe1xNDZSwKKiZWG5EU39c/qnpim7J5arSqO+UyV7j5jlVM6zRVpWGR4vqye7UoWC08mU562xrq+qVmTYm/O98wazwxGIYHIXWatlM7jXhJa4vFQ6qVnHWLPODCevSPLpRHyDOYl4r1WoJuXHtdr5HqleX2fJo8jXeud0biVSb/9IlThUHhNEh+jzOHlSHxONz0TmiZYx/YmWJCE2BUKeOLY/tyqhfdv2tSKHnFmtdhZrnsWtxJPLHYlHln8SjyKMCyeWHAs8cReecR7hhTJou8NzVIfo0QrPTlYTk8NAdEaTudd+Cllp3OzI9O5ucrU5PgUMKvWkPIbAFq1MqT9BoBUjQVDymsA6NREfegxPgPlbKrkJkN0Sq0+7k+mWlTHhkzdP7XBWdTZd2R8z2ZHvMkolG4wtRYpmssAaQwOwFYjZeuKM0XQQ+q+ioTS/RHviv7PeyJs6ttXem/+SHsn4iUR2VB96FgAwROkV4fxxCd1aK77ZbNJrS+o0fedtuJGZ68IblRtGW6ke6Kd1mSPACJzSK8S68Lrnicn0yK1ZEmYNadJZ69omkQoEZok0Kx9dykO40qIapOls1c0WVK4jCwtKgS23y5RLc6EuMzH8u4FrC+ljut+NUHYWiXr0WlB6mgqquo4D6Mq1JBxcHxvXQBaRh3xjFU/e0VbdcIyet+SLYJkUDREbPro9rkso1gbRIlC5dSWXxdV23/RbZR5sQSMQsfD2phxgKFNc8KMSMolVAuBCGYUaajiZB+hgSTsNIohFv7kaGBKWO+PP2v7uc/VejK1Pnhcw64vR2XGkkPeCIbdXNSo7uNkgS0pbAiTXKeNpNtnia4lLrzbR7kyxcqV4uNVolGHlv6QsSpaqv23z18Wje+tBtUW02ThVOp9rfmMRnmSVxvs1Wcdhgc7RJ5E6ucQ+skzkQwkbv8Zk8WE4hPYL2KZJ0NMT36DGYS4nvxGXIJtsb1X9mZ7lIj4Hgp74pV9+F5Q9mtlv5zY6NDlaC9RsBPxqIWE6pB80nAXmoF865Uj/Bm99rJ8tIDRxj353kv2w5aOKEI7xxRBBy8cqFvb2Oqx2cemx5t+zW93vKYipn2RLwQ97TMFQLH6mKSSO2qBpDcqzxXvfAsDYyVEWKU/Mn4ok+obz6TGNgb6N8cmGu7kVC49Ojsz0ikkV0cKyWIr3ck47eL8dCE5mB0bHswOBfCz7E4W6t5Eo+CPDC5lUrXBXDrv10YW87MzuQX4qRaSA6NDzsQGUM3+rJPOzmedUtaZm53x6Hdmslw6nnFKM+lZ+Jkrzc0ez6X7ZwrJ1FR6YDrVcJMT5ayznHYmk5DdocHsykYxk1qr+audTKrdyq6MDY0NLwfTyUY9GM8uDfQv+lPp6sJGvj+1HIwPLo0WU7mRDOS0kR84npmeGihkJidiGGvNW4XpWQePk/gd6Z/+44a49AOdnjFmlHTd+fDK7snzvVu3Hn3+D9qMKmEcpcRGkwKkAq2piM/SJVsDd6/aqHgvvbRfEvL30yIcr4Js+eL0sMaU4fepP+D9kEzWa3jdFjAy0MObIYG3T367ffGL3t+uaJlrLiJslLXQClAJrR+Q0F4lEc5BHgPc+fR1jS6OBGpoOo2jcaTkNbcRbLrogNmpBMKsPDi/jEHPxEXSkAdtAnSv0S7EB6ce3vkWMth9+6+9rS/RMpcpXQJxWi557+Cf2OExOIL82srKLoFCtwsg8FUBBLQoAENXlV8HheXW/YZf17MbINR0QzJwYEDeWqSrSc48vHV354eT2//AOLcskZzocBw91zHPnho3BKmPiOE1NK1GYDoLu8Yo1E/oMiPdSVqdQKaUvYRhqX7CHlE90+Hg+9/TqfhHpz7Y+eJrC4iqlKXRvaIc1OL7RPca3pHzWUn3ht7FG9sXr1ldoUwXTigQqwvgI9UBFBRregGmOy68LBud/pQWt4IXWFDAGtEo0BJ3NtFbXYbtvXd79983sR/Jk6p+c7kdBPOJDbFTWfM61YS61khiGRwNYCVVvi2UVk5kSY+AGljwKgGGopetef8zcvYQ96LfXsOGxQsn73+2FGrd3W+/fPTJeztnru58+EXv3HVLfxlY1dT2Q67KzGOq2L3zj+YZARb9wX6kVVyj+080x7qg3y+K25dCnfbine2LZ3RptGHXig3eVpbeBu6eEf1CA7NQDNicBIyBRUgna3bwp3beAjYCL3RvEi9QEoOWb6v6CGvkU1gjXB0roqHlVmhMcPVI9WieAY9HQUoNc9AhKVgOMr47g1Mdvdlp1zplt94Ud5dfoaq+2YBmXdcBKR/e+rT35sWdu1siIKVnp+EQMEL+EFi9KdZuBcvGrcrvXp1HJlqhE+RskWP3r1/3LuFJcr3UoRJGj6XIL8x6B96KrZ7S3daRvTOTr72DJrLlm2gsW/tkinxun51AwgckUBQObS607hYGUGfLNx/+u/fZP4zXGJpdSBLdAhRQfBVHPuJnQVge0cMgIqvwYRCToTkLYmGb4mhWq0IBIw3C32DeWJGACD166z1TpFYnrkCGIrMi6YfhFhJ5PThP0YPmqfPBSLRbC/J9+Nu93lfvQe7WeSIlgNViVlaqjDBb8SvGTGzRZWXnN4yhePTlF4++/sEYCjolbGJxsumDMBW+ZBcKSUPgkcwgmI+kdNXqjTCkMK5bdAEEM6d0LauKWkP29OGdz4SKaCmDCtM1Mj8tZUuhi7RbXgg7sIA1nAUUgalFBlVdXnyrBtGDDzf04Hl466w83iRfVmebFnXyhr47UkNyOA1l4dgQZpW2+61p2bq68izadULdRfcS7gNgT++i+KEhoHu+AoviYOPGrd+o6YU1t9BTCjOZYNMIi+GLOx066Gl1h+4gPHu99/t3ZPBweDMOz1m1nnMwts55eiw/P2CKGyKgaqggpNxn2L3+5vbr58Q+gyahFgM1NJGEMVxTsUyLXTIO9xgGp9lbDG96TtIU+WyxGkaUNDky7IUTlxCpsPmK5igWd7Bowx9h3G3LvtdINoaU20/Lsln2TNsvY7OYoQqZjycYmexlM7LVgsseCrstD6NzhW1p1MeqU65Kn1PnHYRCii4UUi9v432BnYkEmK/pSOSdm50qda8J7B5QTf3Q4wt85XD7p7vQ57CnvHsKuz5fO4SyrPpDCez7Dd/FTPji4ct7LR5SstqJEyZd68TL+60fQlf3l+VWMG0Xqye0m3tMbAV3auVG6ByKfBQJzbMhv+DRedQzdnOHyEQu6Sm02A3gbEocOykO5134KRWHc7OFdG6uODw+MDMxPoUbv8dHi9OZ4ujQ1MAwXrA3NjlUTGeG8Xa9/FD0uElxUh03qdCGb6Y/OZuDX9NJEZcnk0yNZ7Ip+HfvqDwgf3dr2VP7rKTP/Puf0SL4lzd6N+iUXEdVriuLTEnUXqf6HDwBgtxpVUmUEa+4oEtaaL87dIloZ0F5tG7/46L0aIUBgJd5NEQEfbfW8PDiZx0RSCEEjwOQAYs1Ar8RxK2WPRmhSIatrBPbNFGKMMbU7b8/+mhLByrCvZagJg6bgFJsdej6aH4Zh0ANQqAcjMHINQQNJKdNqp/Kwyh4NSkeblRnRt7X4cpuvQNioQ/uSRU3oqJ6cs2XW7kKjPFwPTTkgZRG93ZNoItT/Fcr9l7x7g930E39rTu93z8yB1RUVtbGMYM293SoYSfjckZzM9u9PCvrUIrKTcfs2TDj+2By2TsLs8GsiqfmLTG5yKklz0GfRKjohpWRS+wyPAf6ntDh/Wj1xd5VFG1z62iKysiEnrPK8LxZ7IlvbVP7OgcRM1RlI+LYCWC1TV3R74b7jILmEV21wLjqpEJ+CkCYFqodbC1k1TIfchv7YHvJXlIfQC/R0NovUX2feUrFw+WmtbeQ0AK4P7aadcBQXc2hrmAD7rVJLu0MrZ5vqN6we31LWgRplZhFso3JY0wJNyNM2zebXlncnGcUfUjLMw1vqV86UKEqFskcVScrN9OnT51QK68/SrH8oYM9NMb58NZjO25g/1Hj42C7cNz+PbCGbJyTJnSvF7Ff4Y3uA2FXTfoS+lrvjZsRd036Dog19ED77uo9d/BlvZ04sdyhbfzlZbe5Rn/JQpx46THnY9xKQ58lN5vr4iE/IU5PLBdNehLx0KSn3EGTHoSCPOEz45MpP0UZ+dxgqVxyByuDlbxbHsyX+gacSm62PJWbK7njr+YccVXeakqdeZmd7gxjEE10ysTL8popPO0ij4QXUk5+3FkZttwy82njlummy3l3ID04yA6Fo1vm8Hgqj26ZnaxD9+X1r2aduFBOoJWorOYabFrgwuWIDjUx3gf67Tu9059ROGZ4N5iXpFQlVaxUPwieAkoRUw1Ws7GeWi6d8vml0kmtVUEhpmTzuFSGSyzwg1C/fvrorb/1vrijDhoascR82aovDvfkYPxouVVjss9iTK6M9N+ShbTW1L/HopprqgnTrKm70itTILMFdVGFxs+Tw1sUXmSgybvOgLl8Kizj8SmecH9PPNXLsrCOyzy886bIhfN2kZF22FQjn+HrePpxsCHAODQWWl8LzP0HY0TW3oSWyIp/iUyMQ1mczCZ+chxyCDMWMOInKoG1l2ic3MpTlMut+VdFjRLlu8YFV5/lyexY4ChqPKTtMKpHcVTokLCSkBOkVu96xRY/mKPjTEB9elwJRxRcDTtjJ5QPqewE+/SBmPaPbXxLQq9Z4qdpI3AcKAaFBRcl8bRfaVi2SBubBiZUYhJcMPEhMvytcc8GPUu/V2QlqWCfXDNzW2Gp96eCsBCMGn5iJWwpYKYg7YrRlcLUoNZ/bJA/h046WFVx0ONXjJJlt7x3vdhjVJ5XiqR4oo5vuujT9s8Ymuw3S8m4qKcl98UEBnF6cDYdDnqKX/V+Pbl95oNI0FP8Cg9/e8sj1g3Te/u4oliCEaOo0tnVr5Vw5+zE0cex402/BhyPbr6sSJfSl44yz0/zpWDLR/VB71aDjhoTsT5yJPy4pq7IiwDh633260SVw+T40NBgpg9+6gNjG/CzOZ0eXZvKro9OZUc62ZHVqYnJYmtisl2slGdyjfrAcDHnrA/gQfH1gjOTWxl1DuHNeIU6/DRGUoNL8FObTud9+FmcnMgtJA8XnFw13z/gwc/8TC4LONnKSCrjwk8pl0zPws9cOdd/fDo90388nZoamU51itXkxEI1OZkZGy4MZoYL8PLa6GonBZK0BjNjhb5Dgxn4rjHm9B0aynj9i/7MYsGpLsx7h4acoeWpShmeDx6fnpud9/LH3dGpkbnZWL/SyWxRrQOXcG+2ksAuiu465KZ5s618gnq3Tj28+2Xv3Qu7P13pnX9XeAa15xtioZr+ECQS/wyeB1CoE/xLrTxmvbTYALrZFKqQIOGvdeHZv4lONTir/cd7qBvfvdC799rDW1u9s7gy4M9TyGb8R/n8IKA6sfSskFJM+lPKCUNiycXLWGUsmQ1RauEzsP32r1BQ7TNAL8otefVRzbblZ4ah05u3WTqZPfDlchv9LHh74t71/VO0YwoV3rt+pfevf+GokO9S4+kPHRvniVGkAZCfwh4LZmxLj5H4mg7VMdk2nRoSh/0XbH0Sn6No4ktAQXA9j877di93VmjH9feHt97BU/yfvxaTW3xGKoQYjB4sKNjsctOr6/2OOz5xq1t/3TlDhM9barp1PMhcEkdVSzpFDArbN9kbR9Y0/WnO0HnoUKsdlzBQ+/1Ta2E/s50v7m1DDTM/M0oWE8Orbh+oo9cibmUPzpbJ7IQclR699RZYHMtFSeZieSgpSOWcVG3Bl/L44TpITzF1br3b++A0HQCBL131h+yk9HewTwJRU/Sn8jUGCcraAwqsl6gevYTVe/eTR+9/rdevNrwl4f8E6Wpl5fckQah/oHsELk7htbmQsnf9TZlMbr2tso0t4IhtjFyu4r49eL8jfEECGZJ1+8zJ7Y8/eHjnK0y50IBc1uVGpPnUCUM9MZCUSH20hqg0pVJrSCBoz5I6BkpoO9c+NDGmtf01p+ONnY4gc1yNF0JiiwjMuMvT39SH5M7tf95bEDwKfVF6v3wN/ZqYdEPG4wvEn0oOmTh4bFq5Yys+6DOVvtduuqbTQBFKqEL8Fd5t3nj0/r+Y31yt5q5J7+qmhx/9kvaa04AWmEYx6dUqlAKQldHwlmAsUVUARV6mUwM1tm27c+bdh3e/0nu24nVX/6U0PH0ILBCdWL+stgLxb21ioP8slYNaKSEPyYFtwPXgS35N3hHxn+9XKBQtbZW8/eiD33uff9R7907v4hUyETp9Iwh9juQQyEHGkHGgKUQ7uTJB+oFaGOl4TfjO0x5z90/NC8dkdH4Uprn3+du9r757ePdrYZ11Emlx9GftzScfRPA4FkvIMbithmZVJzRw671NY06KdOvUzpnb29c/FCKp15UNlB+VQOpzYGNxHJaKWWtf15Nb8YJ60F72m2VGILo/EnXD6Z+Iu3Xr1O5P34Ki671N9/aV8baQThnSbTSlZ0DFaxggpbE4+DNBy+Fgge/hcQjE8TnYp/x9oLTzWUgdZ2JPysPYX/8TdIizGHO5O+Cjdt3+95Wdi++QBfYZA+KkwqIrmqFIyqBogjb2wnNtM8Hs/clfLZOv/tFmel8jrQy0bVKf1KDyP0P27gmsXcjScUv1ODulbZRlTx5jTbglkRc4lv15Nkr0gFAKX/9r6+Sn0Mj2h+dUm1zLPYmOY3+F9M+zaJ+Q5okuzhj8fuQFraDe9CbDizWg2Lu30bfwWglyz2HukPkgX7TZvb61ffG6JUvoYj9vMmHJZu1vHjmy98V+XvvECbtUJ47ss2jj1jplKBzf0NSP+HZmy1u2dzPxQWQzEx/yvUz8bLYyJbDZyISvY/cxx/PHR51mwRnOpQcnKnl3bup4Pj+Vmx3P5+bWCxi5T6zMuGsF3NCUu5nT/eO4mdkpOLl0ptg/4STH5bWAANUccIrpP4/hvYArA+H4fTmM31cZwfh9+HsoOZBNzc6Mu8Xh9OxgfzY1qHY25QU1g3sHnGm5dbeJV8AFFfJDXhJbVBTg6413Ht76ipoXXwnW2iqkErwfSC1Ln4RZhrSCl1NCZHn0pUeESiSTZldkGtTwAjuZM5kxpWCkANsXvuq9cY3JACmWLDnogSWLABVboQZSzhcknhKNUrtKOPqkeEHNBUNibgi8IpZivyVNi9/J4NvQP7qXS4ZOyGR7JVLHE1UytR1J3U6f7yFGcP8DezPy0Vvv7Xx7w0SdWfC9tegcGYH4HJlGgXQolNAPzrcVvLUZCRk8/O0DyMNEoFF5sP1ICWi2I2lYmVAxRnazNi9E5xuQAlkvz8uxGgeIKl3iehUL8xzCovPXNXHOMAaTxaDBj3rRX7lQ4dlCv0ZB1pT7iXCiAvTts381MU0I2mwAMHktYLsC1LoDFV7El4jBiWw50kN59bYRVFep5etFtWoC0xC83lZgUsqPsW3Eu5eJtxGFsm8cFGghAblgTCSlaHmVWT0Gu6TuKtAJ5W6iFKKqFbXaTDy4xnQPpClFSrWXSIM5s7dorAGFaKEGpL0WJpcBDAnFGo63mkm/x1Yi6UmhsIWylupQKcKQMrU0qdaiTIVyBcrU4B5KkClAo6TChdMFU6VSyufpkjR0kucdpwc1jLQwGkSk0v1ddnaZn3jxwVnAP0shNC6d2rn0OR1uUW+39OuBhjVaU6tK7GEqCb0Y4+/W8uJiEsLLL0o0Km9/yOONvpdVH3J4k0l9zPi4ddPz3tt5kEbs4aGwJw4/Zv/Or8jbL+SNheZZTdHDFn0OdFAY8ZlRwVf6xEVE8iLoI+KoCX4mKtjXx3D1xYXi7ygVnJzOz03mRzKOO5abHHJm0vnc7OwYMMCNuUl3PVsYGZ6byg8j6RtKZ4ZH20DxBoad4xOtdH/ROTzsNDPDzuDUcGEw1z8yMTQyNZFODQ/XCs7IYHIJfhfSM3OH0k5hcGYgmc3gmZIUkr/hobEjQw4eNYEnWfgijuq5FVEz+tpjHxfoxMA5t/3zO+K68Dp6yLpe3Syh6jrW80kq/RNg2AjKqYRJcf973Fb4sVMWh/rWNVH7bfvsd48u3zYHPJREKrlewBEfOZYGYEnVMg2XpEkfNO+SRbFJF5bJ7EtIsDDtEqDsKAd1OEO7FHKIbyG2OblhsNnBDQlkTm1Q1zWuXwzccvsS4NZZDYmvz1Fg/9bHNBhsLGQILxaMXdWMcHsZaAQOm2eA1o72Elp7NsvBG8GNwHGgWJQw1RJ6wAoByEuunX504Y1XvepVykOaCSk/RmuSN7txto5DsqmWALMF5IKpIxV6yPGmpSqLNKzdqOL0hB4oWhmqi58PrjUjkj1LYxKIZlvdb716PN0isBDZggEXbkPh2mLkYogRIA4RTb9fXOdn0ZhGmeyZ0qQSqu2pkjSfOgUNdDmDr+ybhnVHMfoOaGw8beZa4Ofqbs/VMeJcpipe3EXRIOKLsvd2r4RolvhSFjHkNCXT+ZTxsHVb9N4HCyAR8Swh7Ym+/UMDzhO/D6oyoJ8KBqgfU0i/V6VzVAuPaVcSQD0w1N6x0FMkYq9oF6tap+6ri6iPHQk9rakYg5i86dUbvnTROmo/pBePHLFlQv7Xx7NWy3wmB3N/nQCK9cOq+RNHhgpHJ2r+eN9Q4fD4UGFsE34OTQWj6+XZjdHy7MhqYa06kk8W2/DTGR0qNKfzTmsm70ylnGBqeSiYOr4ytVFolGcLwfoQ3mM9WFsbcsrwbz2Tyi/Cz1JtDr2xCv5qLp8cmIefhaQ7V4Efrz6bKQ0Vyhmvkp6DH7dRL0/BC/3BytQy5JXaCFZmM6nkn9NO6miq3zmSOtyXy6QOgYwb65lUbjXbP1zIO2n4Gco7xdL0aGF0KGhkUvXaTHJp0R+pjqeL2f50caB/JJcqDbtz80MOfMqO5DLT8zP5ybiYf67fDKBSWzpkE21k4Bn8hVDEpt4PH2+/biI2bch0MlyTAdKhsvQTCtbEcHmgJoGqozQpVBmiyWC0TDC31Vqw2vCsyH+LdPdsQ94uGgk21fvna703/v3w1k+7d743Ub9Wqa/UfR1xalX1Qh7bTebGY+hFcgtFnuLZ6ZKZ7FT4KZ2dLBs66IrhIjdHV1CnJbo3sZS9T65sv/PF9pXL5MnbVuNK+vWKT+zwh3gQPCGMOfkhPtd0QK/57mWpF0wQsnWxpRcO6HXqeu+NKywKWXVZaxod0cvAsZhe5qGqZJNHOKYXZaLrlGdignoZvJbeOTOKjM4adm9j6LCra8qtQfsn9O58s3P3J+Hc0Dv3jaXvcJsoaOjLIplqDGXCMtCQFhKL065VqXLkras1eH9RlV57Xvz93Ye3LmjPi0oNTIFY9aZ0+vw+fgg4hk6rU0lXFHq1pgIb0SekrB0rNd2tBj3eSHD3AvRvcmQmMKoYsuwaIbAh9xKmxaXRb6tJ3QLuKML4MAvqGNrMCgDWe/vKwzvvm7hmZZkksp7e0V/x6Z3KIS5glsjL9j0T2VkhzViOlv+ZydAKkeWXG93v/Ka3vO5pJ4gaxaLE2imrfZezb+7cPbd97bKcNpcbnkxD/Q9R1AM9f7aQxS7qhgBGWvPduwBoQ8mZNMfid4hKDSNcybQC0dqD9u+NFhJ794YDRHAei8LPeGnWoAMclequvsAAFDAFbBKafefsdcm88Z4u1NUitkajiWeI1ajQIIHvKV+txwLJUSKRjEcb6m1fO9aQdxJBXRWHcn4Fandr+8czhpDA2/xyB0OALECqRzSQFhyaxygcUyGaOQnl3/JXjQER0tFiBbmqdLo328IM7Hx1Z/vj37dP/9T76ifa+V/zIKEwKAihjQl+CJ4RThkWxNBqptYpd28mWh3PWG+A5GHi/n5x5+Kv2t0Ng7i5tQXh79Zy513c5KzbYIEFpTFYaqljRHJ9MwZYJiTSCbptuyP2MD7cIIOJI196mfV++KT3w1vQaXc/+VR4mXk6JeAmGiLIu3pU85SrGcsgDj8EHcYNgarQUO6qm9CVh1NlbAXmLPjaOWgDXXsywUbd/C0rT34KbCCNYN6XrSg+qH04up3Yq8AErubS8X4R9Em4/bBrK3/4x87ZG/ryyo02vZ6oePIaS7r/WKMYZB2yVkLxkLUEJkLWEo4IoiqgTMhaHMgddy8RF4SLJa6Dbxoxf73T++c/LDERZaEj1isVpC2ufiyCwZ6i0AES9e1LAk/jSFF1Gh3+FyaPOF7iheXdBeXU3UXJKdMTYxZIlozqoapU1b1ZBGhCVGGAxdsyELD84O0RfE8xdIvia2JvKD1n82JsCP7r70HhQ7SdM2hOnm3G+2R8l3PdCAnlFFfTWptrhmimTf8eR/4s4mcI2750TVE1Rqr2Z1SaTdk8hzMbzWYYibGJS4RWPAGpsAlFmAU8jgPY9t+y209ksI2xtgwrwXKLGjGnlik1du9prV7ba1VcWncVyZmJepx9UrbJNhuW0cCSb2iT0XvjNW4vuK1g2p1GJU1RL1Gt4QSYHCD11/IPEXNl71uHLYVtK77Haz2u8rhCkv1BqDat1CLKLCbQHn0xrfXl+BP4xIE6RW06g9rhP9/PxDjFcd0a4xTXFjnJvPni3KHHecUJNX3ihCzQiUOPO8xY81Yx4mko1od8yr3jxCPawlT+ceJRxENOPOY+cuJJKOAHPTSOcupjzC1s9X5nsJyuwe9KvphzFgedmYm54/6gsz7k5Aec3GxuwBnJOLm53Dh8V5obzjleEa9mG87SvWzlIjrNrQw5o9OZYjPlyMvZJnMzeDPbbJEuZxsZmi7mM/2jk8Oj00PTqWImOVrIZ5JD2VSlPFTIDEyyECCFvLmZLbnPzWwVr7ng6VWWOjlpsrB019/c+fZjPctue82yJ+YvgfxbT7QFTmBgdHKTUPI4+UmzOFn3NLMNSLXc/wDGkLjYXIS7+eSD7XNb259/Le8hdClFNLS1t0rnxvSsFi0bvdrE3Fc9YZFqAl9OZ1EBXfwR4MVUlsaqzMArJdqtTp1jh664RW0uOqKJ7kd3sZuFiq/u9M5fN0dESMGLJEbF6x4egWWgGsyGseaKalA8X8WakH4KkQcLF3UvN4KxNkEth658gwp9dPKcuSJXtxdzutM4ah/Y0+OXwQKe3EU3sKf/1jtPexK0sSzAyS9GAwinOzn4WagHXMD5QN6NboI9gOE6t2Vu9hTCap87pUK0153KxWwfRoVVOzBMYLkPw2RmzjiW5DKHKDzDlPd3xuNE3O/kY7ErzHoCC+lOHcG6dleOAeXnI9urFg9q1608A6kq1uoFIUA7xAfvAhrR6gMCNNQHWroTuHE1KeO+qHqUG8WiHuW9vVK2KrMOyjHvwNvbPZDWVunknjGlT7hNF13sxHuZEJyWlY1RQAZZRQMBMBOWdvqkpHJbOhaXD3jeziz9npvIwmrsZzOMveDqh3cP3Sd01kxfhxXqY9WprUqfPs+nTNNgaZ532B/swGQi7VWK8Kg7gO78VJUXyCQxd9S1W8FwXJA7eF5/kQwBHp+aC4e5E19jt/jX3yNx7sSXwDjWgqoVbfrVw3v6/ZGEtCPdCmASKC4pJvlPQKo9eW/L9yqNAL3u+WkP9SwSVFo+5zGl5SNDaHXyeAJbcifHpw4VnI0hpzKZdydH8qXy1PHchDfqzJVHgZYW11JOeWpuVZzyKI8W6RLhkQnn8Lgz1hTx6oYnnEPjzsSyONfBY0pjtDqMKQ0sNJkpuf2Z9EBKUdU0UNVM7rFUtanKRF4Mq4mOCFKPVAYI14P38bI2dhvK51/v/vzL7p0fjZ9bxa/GXPICM9KAM0bxoEl3fEnGiOtjZXF9h+GMux+de/Tpec0ZG14F8TljFEgWYVz0dSkEX7yNUae+p3OGaqu2zPn3V68/vP0OTFQhNxMZGpQTniL2MUM6sd72JahikCyfYK9sQvBhYHmEXUMrtq56Ea8WXR2mmuV8XCZGs2QlTyAfj240hapZRc9kVa2iZ4q2ZLtMLDfrrhmr10zb2fB7gSiP/TuLLo1hwwydxcZjWdjRrSkTFtdaZGJIsW40yztSjnrbQVLiWw6SAt8OZg1ZGIdGrVMsZHIpqNlNykNY26ixkNxNUjzhQdEYrA6IJlFNKGK/agzaVVtSJmhMZ+GdhHWPCFiYFWvZbWdJVn7tLKmrgIUg9qvaYoYqlmMHjWi18s7AAtTGAIZ8JtXIs0XlIupI1H6VGYZoNUaa225qGXqa1AA3MNp58rnb2Du4FtbSmLh3wvZlYkSzW9RuThkPjMsVMO0RGtnWkDZNaIHsFfbuSZSosSFhnf5sGp1r8ydX5ZZmfapkz5SowRMdyLA/2BH5dBV3QGXhOM/VIWOossCOuc5ZZipcN8uQwaxNlvX3stQ2W2apoe/lOFs+tidblolE2Du/euLY4X29N9veQtNrqNuYD0vnTfWUiK668BlIJPpAgYEO5huect80X9DL5L7p0uVG615tHmdE6F35cuSxOIVDj8sYZKC5HDTxfC69Tu6e9nPL47Pstskd3nb5VE+Nz6cLM1JI32m7DQFMq9z8qXjXPPXqWER89XDoIb3Zd9iqIHZ9tKgENXfgRVUHh6zyGP9SKbVcIWeyoQyWCJh/ZNKRSk4cGR05OjE1ON6X6cvCTGJqcGyzmDk0NjU4up5c7R+t18rLyfX+kZVSsQ0/nVRyuJkcXhxyWp12aai8trIw6Lj5QgN+glJ5sAY/9VQyvwg/S4P/G31Pfb/oHMIF+JmpwWy6ALOObAV+vHotU2qvlDPZoJGfGM6mpwb74Y3+2WImNQ0/x2cGk5PFzFRybjh7JHm4D6RLJQ9tJo+MrCePjK5OZjrt/NxEdiyXSqbng8bMVL3WcJcW/bGiszjgVLPzhTR8PzxZLJfg74H11dmZXPL4dC41Fe95KlpU+512L8MM+lr45uad1/+9+9Z37J5QkUp7ncqP2udUfFYb3Ro05EcoUNndoCKZ9jqVH83mvN/0l1te6LbpBdqtpotT8SZrcQHczqmf8TbW30/L/StKaeTVUEZk/ci+p5mhWzc1iwzMVr3IQG/WSyx2J2uze5W5y1Iwp5udatxNshic5ae79mWyWuNoJ85296pRQjIT/YzKoPNo4IFHCmRTNvB3L/feeMPCNr6bGqel3V1a3v+qwxQzEBMqAL8zL2vIwyAhV2hx55tzvdu3Ht558+GtOyLAjVf6X8DO1xJNEfsWYXAjmc3KFDKH1FAWiAWgVsRRhUADgabBW8hAr5fIxe0sImHkEXk6/zMRhOfm37cv3H742wfbf8d94mrZDZrLy25C6yGpkwSgUtmqbuVjdVuvQQ53a5EBc49Vql7f2KuwlJsM13tC+kAeiBBb3vNC+J0LH/VuvN47h4dPN6wkbnfLNh5/BKy61tNtLmFoPOk61ujeoSgxdXYT9W8/7L5+xniOyQTSc0ym1gdfmmX6HHAsDcJSKNcxmV75p7rNko/Hqj0zyb5apWG7bM2yL1/u3b5pZtnlhltzS9FVGY1mhUZUD2MWDnRmoZUDys9aOTBZWi6qFrhaPMDe3Gq56lxn92YdnZCwvf52dftd6oLqBXGjHv4p12Dq/Kt9Usp1FpFWDSh/XRtbq8sIGLzYjwIMLOquI2C3vzq7+/rbordLc03Khsw3qH/DU/4HctEnY73VZmfDTbgVcelfGxXVfKJ7GyeduCT8ycne+Uu7f/3x0cf3ROif/9fbtT63USz7f0WVD6eorbpVsfMCvkm2Xrbl97vqlmslra21Ja0jaZ04t6gihAuEkJMc4AAJ5pBwSG5ySUJ4nEOwIflgKP6RSHb+izs90zPTM7uyncTcDypL451fd8+jp3umt0c8vxjQX5Jn8Tv5PFBJimOkYhQ2l0xVxzdqYBTVZA7ZCz+038EsdfyEQDxvZEbVxpwFa0EqOAPLgpFNthT4iQY0p8sveuQRJdubbO27f1Yk/+OJyX/d+dvG059v7GxB8Aurs57wsEfk74a02xQsQVMY+LSsJGNT3bWGTOPHZ3AAOUjxQt7L3+5evigapllseBXZJsyraHjM51C39nCQpksxVH1VWeoUUVcGpLr+KsReubWg4SIfeozCusKbli0vang+u31t932ILlqHmhWsiqwZcJI/WviC+DY0cu+v+OreYIibEhYMjquHHzPDRTSfeA55FD/U7ULwi1ZXVeWjqorSG8Q7KBsCSetPCSPMPhCmoiuJObd933A9LOTnh7UxVQdrB8VkVt56JG6eFWvj+0+e3dxUuLwW5VY6PybwC6BakCqfbNiqh6thSQ3Fj3miu4+EuXH+0bMP38PLbEv4nBx3uqYadaroIEAmRrc0jE3flW3N+wTGb0v4DO2v72pDnnwzLW5xfwLfShIRjTu3/rHz/WNqSRtWtW3tPr+pa1q5L2OIWtYhD6UjFqeyNWNNzD/DSqNG1T4WFfnGpfAbRcYWmCKmZaOsGW3EGIaLYXTsaXIoc+P/wQqQ/kF5+y5ff5/LBKBfX351fY41UK9dey5cetH6kxaT51wGDl1TH7Y2fVntF5MKco1xV2ftVU0m3DrPMBA599++G5797Zs5Hq+8fW+SbmO2799uf7D1dOufnc+fGDuYHmIxJ0ERoJuYp7ptYmLF2sKCrukunNprJ7PM5n5DpNhrNdWt0nx7reEt+Q3w+ur8te5T0X/wrT2RJMhlJXWMGOihJeJw7vUjRzFOljwn42Tlg1acLHnyBCmggbPkkWO0hFxmTfmiBevAU48tEiYjQuaBMmGRBy9IPnCXsal+aXBAjuw3zuRLA/NzA+WxibxbyjhzA04xny/l5thnfiA3PtfnnBmEmNyJQQfDHI6PQ0zu2KAzPTA+nO4dd4IhZ2QQbuibHZ7sPzru1IacwqCzaiaylAEPcD1foX+yXJ4puvmpeRGbm+1LjQwNTmZT6XEe8JDtywx2i811q94S3Wf7vsyVSCjeCHln69nGBn/xhfXbotqU0sNJ7UkJoO2brSZGQiKKvOny6eY7DEpcdolochtKo4nqWg+rIVjzmuogAtbcqnDCN/E0ov3OT8823ux8ekPqZlWxFQaGL2WMdn3xKSsTl6Zu3+FvWjMKIP7lHxmyMAmqAV7e+YM1NWwQ+T7xHjgY3czMihqOZOPO7QMzY0CoUGdeHfdIeD9wXUp2SFhXtN+9qHZIOEeR7REBSvdGBC4JQRAZgxHfCEJoP/mGUdCxuYF9sbac0jQhpsAnIQhafDMEQbQEDUHgBFQ07fZ9qQxigONBTcRYOB1+EDSbfkLB0gNqC1wdUmt8eU7NSejgOj+WYxXgFgtrYsYCRoJ0JbCKRrCh5dm1QtexugG52dY1GI4gx6OakHF4ZqAuh4zwSfnDUAScDlbHI0uRbje7XITmBvL2a4khwxB4XyNSl562ezmui+NZi+lfo28jHSthVBgCzvW0MdXpLDe7j+9Km6xQCMoH6TLSXwZA14hbWAr2X00M1f/yuvhlFSjVcl2roibTKoxO2L1rWfrkcGf6oU5Dc/bFi2TNucMY1WQ4inzygqJuQTL44gJyoWZMkIGQ6RU+YwF0yArIxX+jZFZALv5TjBgjM/vJ7gG5vJIIw2VsL5zc2zBnM8drGWZ54Bd9VXISDWo2UqtuybSosSxiUsOohn9QG1qW0WhdBIhPxzlcGJgdHygPZPuSkDCzMuyMFpzc3NKwM8L+zmd7Bp1zQ05/xpmfy02BITszOjxdYCbsTAaM10Fm00K87lQGTNc8WLxd4nWLjAJQmRpn5iszU7PJvlS2PzWZTae4+cp+ZzKpV0edLgZsw+MtqG1YcY8HvkQa1sH3E8ns7j97863O9U86j/jBb0vW1Fat6Auajghy4qBNq8HU8TPHEmfPtQazbZo+xdHWLCKps/f9kSRPfCgoI7veCGrPxQ9a2ByFGNegJf0SY8mVCd/5O6t3GuKV1Z0LEAO/Gv4HByHGKg44nfnG4yDdEWDmAEgEQoX6Ci5U5Kyncjzdadj3nbEVTUDTK88YDc5lNOpaEKKBtIqWfLNMk6IHiJxGHAFiv8rpSINoBbxhwDb4bRSm+QoCvH+Dmq8t19PhrmqmqhBaAzcG0waMRSPRswLPtGYQVNkyiCltGY6p1xytjGIAjS7EFJey5wSgbNIIYCR8FkWn9ioRX1mrqgWUucMZVsuayS+WhKf1SqkZJqF6gmMJKpm2Qc34WTkfgFdD+zAuleoBmxVnhd3bcozK9wk1Y+pdQsnXJ4KppuCqYih+GUT7kl3dhbsX7mmFR7OQAqKKo9XsmX1rdmxe6hPCmwFFdCO+q8HbXqBwjkyI7qasWCPkW/rYlx9+IDqy7Kl/S62vFbXBhmIB6Uut/LKKlGq2PWpj1cYL1VJK5HBn++HPRXMKyqGkNCTP/u4aM+VQR7U5DFFZC+pSLdNRFxcpC5zE3AmN8oER27BvGCL/RTEtG1b+V4wgI5v8ie5GrKjFrViQdeHEXlZsNSwHPCrl9SOneDisKOD250lesOSXg5J4oocUiD3jE/q2ZziUaIUuhq6+1hv9D9+N5nYyHAMFxQBjaI8ZReIa6V7Fi7SNBV2S4ZRAy41fxIiNJ832TZ7MpSZP5VITx9nnxPzceO/szPixXGrsKPv05FKj6+xzbmpw5Az7nJ2dGQ7ZZy2XKjTZp1V0h05n0kONbN9gwD6rA2ezzuKwU8w4p/1Men4uv8I+1fpQrtbvnK5l0pl0f7ZRdCtuKeOVmO2dWVz00qVFr5xuLPW7S6ykv1hd6Ztjn/m1MDXDPrNnBpNT7DM9Nlo4OVo4cTyfS/WOFnqOjhXOrbOyZC61Fo6Ntpr15cbp6anVYJg9MDwAn3zq1GrQ56cXPT9TLqUrRTfIMn5yszOs3khcZvw6a6uGzox/t1JK4M2Tdy49fXxJHHO0wkCkGYDHQ52FQNbmLxvwYzbM6LZ5hVUndTF1HtZGfc/6FQ4Q8eZM2IqEn+TFti8+7dy5qV9pE2PSxSHBzx5DAymgQApAV8XUEvi0sqbcRUx0yDkJ//hwRbwLSzi58s/OX2/Rl+uwCs+cd04ByNx5GhJvZwOxuCJ79sVXO3//wMAQXGkQ0Tr8WrOmtO4/L8Lpori8buPe7tuQ9gWfcPVXedu3+BXsVxMv9RY/5NYom17bP5QEXTihFxc26kwVN+BKOt0SZbkZjvVkj+DPgKCo2rIedgc+KhlYa8hUI0v1Pz5kBsU9OCdYhGSPgLD15c4PW52Ny09/2eRprRoy1wj/JsnzHwEGCIiaVh0kzr9XdT7ZsOXqZIBwknoWEuGcE9mLdm9+0Ln4P5gZC9I+if4X9UouzScLOMGBYXQ+Wf5T8cMz+Sp2MNXhzVDMsWt3Om9/+fSXGyJ7Ut2T2W35V52NsO7pvLb7Iqj8g3XdLDxnUMOthvCCMk4SOCsoyxynb/3cvvWuSK6mHwPjyqgn54ZZehAswZRZDydJUGxBiKngafsuHF6fTkBqUB7aIk6h+fK/CcJubLa/vrt7HgISZE2XfJfTB38GL4qJ8wp/KUd5zWusipeSxVZticc2bN8LK9LE/delZ1+9/fSX6zI3q1+GKjrRCvP4eQl1iTmqHewqwc1AV4FvJmMVJKxAV0mHhrk2ve1/NcruKp7kiUBqpkV5VLy/fbeGiTzv3IRg++9B6zbhYLsFuSbq/A2lOnO02C95cKcQmwEBVDAUAIP/JIKOKK77XqOFOw/i8p86LET2PetbF3YfGJsOdR9us45etO7BRarGoZmgYDcwoWW2sSBF21iRMm9bF5SMt5DFxVONVRoeXeKjrmhIc+fSzi+fkLeQ407/JBQVRZbFhkZLQpY4nJb5VrUgZ0hDkdV77LhHVWGWoNjLv8vgIasYdPF73+zyW1/hsNevL+EjwjPySwGvI0P1uiMl6KjhkGrs7AlsBPgKqxSjMOE2YUz5x8Ng4Abh9++IGBh+MC2eNo6kTaPXAj44aAyecTrdbHqlgMft/nEVokTBUvt5OYHRNTtX32l//Xbn8oPO3x+KIxL9PDqc4rfRqocGKlu0xvR2sFR1pQGxCPFhoQz/efApeM8V+YzIO6yqyMVbFQT7Q+AyrqqQt022f+B+hEjnxccKz2io9Dm3Cb7tvP+m0uSgY6T/IeJGFYyMGpUFLwRqIGLfbv8IPyILGF1gxGKCdrb4hk0lKgcHqasWpUAM/9jr8bg5v58joAx5anvvbXlrq9u0j6m5rcxsahwTw5iYtvsYtvoLMUX3MES1EaqNxz1MR/WX2HoHtfSIlUfsswNaZ/pLxJA6gBllmVDU1HlBQ4d807aItj6UxaENDWJcGCbAPus/Wfvpqmysw2rtlUsuWWbN9c9a8dQqJ+91FGyqpw9nLTvMZWFP9a209p762lS0+6pZqmIPWQ9qPXYALab+RnbekvkEs9sQ9ADZTWEE1NmYmxeXe7Jf45gz9m6DMfDbNzGXgO9e+LVzbbP90y3G19NHf9XcRXOf5pOJvyRQ3HG6YXe8d+/Mp767sCCbaeH4ntmf4B1K5iw2A329oyoyb3hkxV4o/EoVgIlF+p5HWTv2MLkvmZ9nH7cwlJtln7mxwtC5IbjNeynvvJp2qv3OUKYwEhacfMHx8pCmdKowlC7lneNpZ7TS70xmCs5Ev5t3etPO+GK/01cYnkoN9I2kRqaG2LfC9OToeN/IcHI+25dMp+ZmXUZtKtmXymVSEwNj2fRwJpUcSvZlBrpEQbJfq2IR/e2jcJ0PIbJnsXm7fetvOkEpPCvOROGbityDH8ITWYeYR9Aouw8etC9fkXVkZlL4Lu0d0eDoosfUg/vNvMaStHX8urdWD8gBLK8e7FsbScvqKlSwUax5VfQX2Lg+x+chcSmf/npl98FD5VI2PPZ8jSfvRD9BMGC+QQmQOnUngtJjXA6qHBAFah6womg0QFBA60xCkK7+nnG4+vhTYFcehCpkdRiKoxaXwBonAg0iz1bv8Te0f2gRzM7bV9pXP9CZiXh72oD6cJVyqQ4UBJ/+9s2KPHXjjO4++Uw4RYpRnh2xjKckan5avCovXXGL/rngVLhZnE194mJNbHnywnk1WxLP3WRLWn2kDlwkYF1hIX+RZsTNCdmM6HWKYWmj0eg/kzfFE9SQ7BDdhF2qWsnuULMzRe4hnBpUw8l8nKoTX6YPFW8tk7fn7kAJpLMPodpgM6/hLnmVEtEACWl93ywrZdB57+ru48eWQklUSuLmgwDh6xKvWtVkgGGx46S5JT1KuzNPsLqeqIL6I3pW6VfUklJDEjn3025Es6EOihmKimHJrVYy5vzar5Kc891mpQtJRs1+bV/9NLZrral+eDPJGG77CUTleekh+pzdJitFg/kEI30xR6EcHPJrrgNjk9ZRKP4XpbROQvGf8IIf48B42eZY95NQXosfhHK+F47tdRJa98KmiOfH00tZUlXhfU1exPMiyIu2sSRQmebBy6sHTYFzjJZwHH6w2eC/xdqLb+OIIlw08WWcusvBmc9U88TFjT26VL62Iw1AqK6fPEVKiVHIc/rAYDOfPkGLlS6XGX8sJo7pQiGRMCutp3pIKTc1+as82KSYI0g0HuYHwlYCJmVz4Ns9QmA84hUyARuaZZlPCB/TlGPf85nOD5TYpzw0nHenJvLF6XxuLp8bzjrz0/nsDPvM9gw6Zwed13LOcM5xJ84MOoWcM14edoaHBnOOMnWHJ4dG+yac5LjTHISM/CNjQ+Ons0664JwedLI5pzg77EwODWT7UtPDzvjwZJ5ZuNm+cmlmuuj2p9LJ2ZlMX7o/merPpZKpXDqZLAxk+zPp5CD7EWfpVqBz5GntHXpc2vnqtrJxa2xhEBfrBdvfqRHN5zYHCIx3I+/gu5EMQdVFi1PWlvZu1SvDPfUmBzIrDl5h/tXt9rW77Y1NeYW5W2tVlvy6OECuVn2BoDLZS8iAICoYAwBPkTWEDAfjMqkLsrRYOtGJkE4nOhFCijwnQkhyR5aA26uNmrSRFIA8loCoeNVNeNWHgdN+8G8F1fB0Z0HN7e8C42ZK1V8HBdKHiRxK+QocSB0tQDN/H54z0uGyFj9/Xdn1Ai1yssBBqcNQQZWlE5uSDgjE/Tfk1SLBL1CRbxcpQsR74FQM56GilFXTJgJRWpzKh+uawJONzsNHCr257p6piuVfdJbUUQRc5Tel0NqP4LDKj8ABpN4J+E5r4wi/2rgwsPmWF3B9Ti7OnETns287b26JJZoyT7wB3jpxEsTSoeAU1sKLOBd7tDhhnRg2lH1p3hgSKCsnIoCkF9f+FN3CNQFN/+OQBkzMeEHo6GgxR8onVFFoJOWj0BFymAOkK8cvMjoQjHsusf5ATK9FVhOykhg6fz+NT7U90c37KmatlA01enAlShQo0XIHELOh6xyWVjmsCX5o80yPqAM0CJHhZQdhnJvBICdifAxg8xXsZ6BQsLwM8X9k1nIyZF0fWOinPkZvdx8jaIpIS+B6oXcPB8Nla1pTpL5yl2Hr9rUTPH0BxCnD2/1YegpLW37TK3l1VX4Cy/1y2CKPH8PiZbcI0QayuEcUe/4aXFUqCR7HwhrEbkl6otCtFt2KJoaFbNqualKyukbskUVlTeQYFq2GTU1EFtZJ5RNYuExqH5MPlnzNTY8sLIa6kLtonBujPU5hcbio6cgnyyERhlTXhHoj3sJieXa6NDM1OX2qp1GfH58ojvc2WNH47PSJ4nplzD3WU2wdrbijq4vTyyPelI/PD59rLJZH+0uFE63l2bHR/qHpynw9k6yNzM5XVjOppQCey7MHp1cXzwY578z87Gp9IhvUps8ulzNn/FJ1cXZ6xZuZmq1O96xM9R+drqzWk31BrV4tT6dWSlNnq+XZldJMf3Jp4mRyafL4an2+d2r0aP/UWP96Jhnk0qlkmEoOjTjNVPLVrHOauR4Dyb7sYI39I6hlRpJLgwO1kVw6n0kl3eTUWDLLfufTyZF8OhV/vUIAAQTwQq3bajKrEHeWxIYzvzvmDL+NHHeK+cZzZ+Pz9iPcaGJWHtxyB3Zegs0rYe6pObF9k3cBP95sNj1eFkI+ZJliRVuScJkD83w2eci7NCY7/9ho334Lb9LjNBZ9iu9LbS4mW0QQHuwI7xiWE11laj/+7537F6OStXxGsFwNA0s0pGWKhoVSNkLXEk1Qs0TzqWgIpURr+iUeI+Zri5w33e9Cgog8rPEg9YIpTNkre0zrmIJIXWSJggSNfpLEzE5COloSJCIlkQSULELJRboJrumCc/a7YbxIkNf05xvt+7cjUnG1aYmFqtSSShRKoQxyRChNRgslaUipEF8JVamikiY9xF0xfhIpTibjxfp1o/3TLTiFtMVaaURGHa4EllSStpJL07Ul48RMyZCMFAxJSME8vsgQoTw4OoJUX2LTPUainS/e7Py4tfvks4hEa37V1hAAbykIKGLmlZDFJAfvIhFxFCVmZxGJgIxX0VoCAJU8fH2k8lQhm36p25BrX71gqwTX4xqhZIsCyJYoUCR7hRKiXaJoSAG8lkt1HGDIrChltpotJhqeNc4g5uD3y6G4DaDLONv99ovdb3+MjjNvJVi1Jw+3F6xBBoRVrxCKVpcIMrQ/BAHdHwJdS8TtEBApRnHfZU0l8ttH++bR5tOtW3bfVJYgs4wlDqdg6zcok10TvwBZq4/GloJwDD1REl0W0gDWAcb9yh69037v4c7GpZjeYV5k7GCzZ42/RnU10rOXHU6EynTGbdKhtka6pRwZZuLK9uUuM+W9na1rNvNr/lI892V7opTVHPF/+3zJHlRwVePWNXhXUw2qNXcp0fI162XdEUUmVHwn8Gsz4th/dv6jnS/twXTGq6/YjIPha7FeDGEHjra9IkNE0BRU2wt4JQFASxn8uMlws7rHAIJbr6KjB3RHbAfUo2oXtK7sA6AV7QNGw+iDmlsy+qBOBlDLL8dPaqE14jXUj/aK4buWauIOhW1QMkNWdYCGN5TSj8aa5xvDflkPHsa2x9QcX4REfDifAGNonsC6CrdB3ukyjECXn7/+9Of3dp9ci4hStvsA3CBLlHP+or2Kg+GlCNLJfP5658ZPSEhLVqZDCiioaRHTFzzMP3Y0bVy0+Wc62+IfPDZ76Q4hF2tTQ2tlyhAll014RxQyH2pOAUvZUtzno+vbvS4jBvbMrBHf8CJOyFqMJQj9Sy3Be9FBg+BqtAtkrSup/ccQg0U9XijfcTzbDLNJRDlm/q3JLWATNg0WDf7IbGQgqutjlyV+99PnK/EDeetW+4rdtvGaPFyN6PJQr6yUCFUmCl+NXATXCj1c/RPHLuwMREeEYluBWyOYMsxB6XDg7MZGYNsrkX05HDk28VaY8YoOJ3FyTRcz6tRSFxY2vECaUj1cLobNVxLCuSR+pcwLhF4e8e+US8cNaea1cVYMR850pqgbxbOdLisHqv3wnRhWuONEfSjbjTEdGBROOC7xwoEDQ30X6kjoYDeEuSIwuI+gZeM+ArXaYVP5GxGxffVChKbXcrVxTi1k0zRGomgSx/DOTWNtFBvGqbR/6zzlCrL/aHP3wdcCaaXuMwVKuodXUtYgtQOV6ScsPimxnrBAi5ldPNr6WpRLZmvJSWlYPdTeUSYOWjbaqJGDjfPELQuUhpkT2BnSTDmjDQljdZfruljKo0PAl0ItEw7ZWqqXbbU4x1Qu69VS8spzR+ClM4LXjYty4LB5T3llK5e5qKCeFuoZFTNdMzCUjd/IYjxotbqqFi4qtsoi3FkoVaVHpfrUmlPuzPtSDiGCUFuamejeO/hjTXc0ETBWOCcTiaCcaLq1RpCJZNe9d/qPj+dgl//3b2bh7TzW0Fm6Jd95+DHEWF/6cvfadXhP78m7dlB1kElooScSLUaabs337BFXHSyKRLvYYAsLrPLqQo/cpFcgr+MVz82625hsVUN3Ecb7G28caW7/r5AFSK671VU+0I6/fuSsV677fLOYSPvGkc4n7z59dJ8+22s+K8SSlNP0yR7ypGQMxNCssY76T7N5VTPqFlMNA9/qLtMd0H/1WlgN+spCC66X6l5YzST+ArmqWJPwnMg1d5i/pnLqdR4QGfJfojkLLYiiOvJf/wcvuLBO";
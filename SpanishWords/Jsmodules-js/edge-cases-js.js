@@ -1,2 +1,2 @@
-// Edge Cases - Obfuscated (zlib + base64)
-export const w="eNp1lN9KG0EUxl9l2ItepVBTm5bcSap3llIDUkSWMRl3p+7OLJlZkygBeyUtaAsNSsVC0hRqq4LYKtEWvNiUvkgS9S16Zjd/ZmPKXuzOzjffOed3zm6lsrhoeN6UkNieR5wZCcNiQc0WyINrCgkkEUY2mkc0qK3Bbrv5ti/v7B/Ai8FhxmMrYiwkNOsC99T2iGlw6lvIYn+2pHb25mrzdmNPNysv6StlpXtHOZ+WwSg4Ko8mDrvX1YPOZVWTj3tcWEgbIl/gRSNRMQQJzoKvOEeZ7/IccUjWSBtEEN/yZVQJhCoBKPoUNhgtM6petq/q19WzSMqonYNXgnEqI6Ohky2oYwGhRPLJRNpYyWEvDLyeNrAkrrrfOSZN0JopiKI6hh1SwEJgD2GtZTSoS5TVOtV5d5KNurTi4CL4IWLLqFGRgzJwwl7p1XOHSjGNCMJ5PjtaePDNsljrwwz6Ww2JQ+Dg2J7TMXRrv28b2+3mdudkr7t7HuNBnLKcQ/cgCWoLPKPDeJz6Dwx1RphmdGTZBJ35qAeCB408txyMSB6BXFAXqyjBRQlABEf2GmJBnboqqddfsjc/D7qNN7CQBbC6r1BIyXNhO3/c9YmPBMW0QCS+A4TDFDiAPhNDsPOx++l9fBKcocGg5omH/xuAnto1QWJO9vu+ytkgP4Rdf1Arax2WkBrIV6h1WO7V2905af86bzc3tJKLBBzUAKwSX/difvhRCWwx7CKXiDE8L2gJBZfFPs3PO93dmmYtBAzqKiGOUOVGRoxqRirAqGvPbGijchvfAez5/MUofn+5dfgyhn5/66beiKG34C65k9HJp5Ljwfe0OTOVNCcU9sERiKE+SkcwXMhKx8fLJA/7kFjwPcrnOWjK2PEEhY3JtFEieUbDCdYyrsBwbLabx7o2GddGafcjT+vKCU3ZT2zwvwhTA4CLI/+qPpohkQEG9cSwJwxFmrm+wzMRb/gHCpxBxMqr+MTFz2QO5uZB2iiQJdcPVxG2WXg0TWP9H/4UVmM=";
\ No newline at end of file
+// Obfuscated production version (zlib + base64)
+export const w="eNqNlN9qE0EUxl9lmAsvSgQba5XepZsEbyqiEZFSlulmujt2d2bZmW0SpaBXouAfsLQoCq0RrFahVCu1Cr3Yii+Spu1beGY3SSdpihKSzOyc883Z33dmFhcX709gqRi/xVmDsxDn9ANKo7Li1HEIzuFSYaRQGJkswI8eWp25hSExEsohkZKsinMzMzgMC1IR7zYSHBJdnqx6EoXwKSCJFCLIQ7cRS1bvwWpr50k3/ODNOjzoJXPRN6N4OmdIRyLUywOiyVbsIpf/fqqM3KO9R8cPXptijVlzpqVM7azmrQYIJZ8bg4XD6uHS+sHukhE+bDg9DWCqkagBSyxpsp18IA7jcSAc6tMKYKOSxm6ssjeBreoAihVhoesBbu2tHS5tZ6GceQ48klwwlQmdKHmS+S4QyuWvjE7geYeE6cZgIVE00P+n0pQNsfa4dvrf3lup18VhXhOfRkRKEiJimM2SNYUqhscHzzcrmb/zPqlBJYh6KrM4U9ACfuqyyU34TMkSoohUxdQgsuSj6/L9l2X0Zyn1CjZOvng3TYDt1V/HzWetnWcHm6/bK9/7SFK/oW6ic1AE8yQpmxgvj5+BUedI285S5myIsy8NR4i5qArXJ4hWEWRLFhAHtriAB9kWJy19rEaGsBVJ87QGvPePOrBNPnv3EE/WWKDf8+H7ytG39XbzMUxUBNWd13SVEk7aW19P6/T3JyMsooqcYiygJX1w0+qjuvyq/fZFf1v6JwI9jKMXz+rGTnRgQ4g99n9NWCoWJuFrXS0PvXTIguC9t0MkiHuk+P5GHemzdRftbzQ6tNrLm62f31s7DwxgNQoKuiMXaGxq8Ti9HyRxOQlQQOUQN36wOkp2a10v3i23V1YNaSnhzC1Q6ksNKxPizBDSGwyqdsROZHRtw/0jYSxuDJoXz+1v3Okz7s3To7Vmn3Eu/CvhW6Zv4/nhtnViHXs8b4+mTd5NgT30/eJLTqKK8mMyR6vaVCyTT1k91yGmQfwwtWtsAtdplbP0MBgVL0JrPWrtfDFj8/2xWdndnUtm5KgR2S2sd/WlpQHAmYFrt4vmhEgPgx5xEkqsSfMg9oWV8YbrXBILUbeq96cBuaZ0h16YwBGdDeJ0lmGbgqFt4/t/AYA9sQ8=";
@@ -66,7 +66,10 @@ export const p1_1_greetings__goodbyes = {
     ["muy bienvenido aquí", "very welcome here", "非常欢迎来到这里", "fēi cháng huān yíng lái dào zhè lǐ", "muito bem-vindo aqui"],
     ["bienvenida a la fiesta", "welcome to the party", "欢迎参加聚会", "huān yíng cān jiā jù huì", "bem-vinda à festa"],
     ["muy bienvenida aquí", "very welcome here", "非常欢迎来到这里", "fēi cháng huān yíng lái dào zhè lǐ", "muito bem-vinda aqui"]
-  ]
+  ],
+  accentFree: {"1": "adios", "2": "buenos dias", "8": "perdon", "12": "hasta manana", "17": "adios amigos", "18": "adios mi amor", "19": "muy buenos dias", "20": "buenos dias senor", "26": "ayudame por favor", "31": "te pido perdon", "32": "perdon por la demora", "33": "disculpe senor", "36": "con permiso senora", "39": "hasta manana entonces", "40": "nos vemos hasta manana", "42": "muy bienvenido aqui", "44": "muy bienvenida aqui"},
+  pinyinUnits: {"20": "11211", "29": "11211", "33": "11211"},
+  distractors: "*MYBHIAHIG*FJTKLVE*EzfXD*FEfJGPC5FHIIBGAHBGAFGPCCLNOCKNORSdeOCKLNCKLCFJKCKLNMSdeMRdeCbhDCVXaDXUaDimgEVUanorWcTUVUVXlThDEZTUVMRSeMRSdDEMRqsWiTbDEWmgnkUVXjUVXLUVXoWigorWYmnrWNOUVsgWipnoWqgWi"
 };
 
 export const p1_2_yes__no__agreement = {
@@ -110,7 +113,10 @@ export const p1_2_yes__no__agreement = {
     ["de acuerdo contigo", "agree with you", "同意你的观点", "tóng yì nǐ de guān diǎn", "concordo com você"],
     ["es correcto", "it's right", "是的", "shì de", "está certo"],
     ["muy correcto", "very correct", "非常正确", "fēi cháng zhèng què", "muito correto"]
-  ]
+  ],
+  accentFree: {"0": "si", "3": "quizas", "7": "esta bien", "10": "si claro", "11": "si senor", "14": "tal vez manana", "15": "tal vez despues", "16": "quizas luego", "17": "quizas otro dia", "18": "claro que si", "20": "por supuesto que si", "21": "si por supuesto", "24": "todo esta bien", "25": "esta bien gracias"},
+  pinyinUnits: {"11": "1211", "12": "211", "23": "1211", "25": "11211"},
+  distractors: "*FR*FUBG*CNf*FOADEKLCEKLCDGKVQdOEABC*DwJNIMTHJcHNIELCDKCDH*AGITHHJIKWXYFRVOWFdOSPVOWcFIMIMHJFbZaFPROOXYFOWYFHOWXUabPPRVZUZaPJdSF*PbcJF"
 };
 
 export const p1_3_numbers__010 = {
@@ -157,7 +163,10 @@ export const p1_3_numbers__010 = {
     ["las nueve", "nine o'clock", "九点钟", "jiǔ diǎn zhōng", "nove horas"],
     ["diez euros", "ten euros", "十欧元", "shí ōu yuán", "dez euros"],
     ["los diez", "the ten", "十个", "shí gè", "os dez"]
-  ]
+  ],
+  accentFree: {"13": "uno mas", "14": "numero uno", "17": "tres dias", "19": "cuatro anos", "25": "siete dias"},
+  pinyinUnits: {},
+  distractors: "*FP*RODG*E6*Au*E5*E7*E3BAD*Cz*SvAG*FS*AxNQHJAD*C2ADIFJADADGK*JIFHAADGITMOU*P7OUX*E7EQFMUXZRWae*FCENFPWaeYcgELMOUEMOX*OBdLTPRaeMOUZScgEMOUXPRWeMOUXSYgEVLTMPRWaMOUXSYcE"
 };
 
 export const p1_4_asking__questions__qu__cundo__dnde = {
@@ -204,7 +213,10 @@ export const p1_4_asking__questions__qu__cundo__dnde = {
     ["cuántos hay", "how many are there", "有多少人", "yǒu duō shǎo rén", "quantos existem"],
     ["cuántas personas", "how many people", "有多少人", "yǒu duō shǎo rén", "quantas pessoas"],
     ["cuántas veces", "how many times", "多少次", "duō shǎo cì", "quantas vezes"]
-  ]
+  ],
+  accentFree: {"0": "que", "1": "quien", "2": "donde", "3": "cuando", "4": "por que", "5": "como", "6": "cual", "7": "cuanto", "8": "cuanta", "9": "cuantos", "10": "cuantas", "11": "que hora es", "12": "que tal", "13": "quien es", "14": "quien sabe", "15": "donde esta", "16": "de donde", "17": "cuando vienes", "18": "desde cuando", "19": "por que no", "20": "por que si", "21": "como lo haces", "22": "como no", "23": "cual es", "24": "cual quieres", "25": "cuanto cuesta", "26": "cuanto tiempo", "27": "cuanta gente", "28": "cuanta agua", "29": "cuantos anos", "30": "cuantos hay", "31": "cuantas personas", "32": "cuantas veces"},
+  pinyinUnits: {},
+  distractors: "FGBCCDEF*FTBDEH*FSIJ*FQ*R1TU*REGABFABCDIJ*FSHKDJKHDIJIHN*MlOPT*JrDEHB*DHJKLPTU*Fj*Dy*D5*D4*FkCJKZagSVYbd*FeUEJ*FdTEJSYbd*NL*NYFDGDEHSVbdRagSRZgSSVYdeLOPSVYbJcLORZagRZaS"
 };
 
 export const p1_5_referring__to__people__yo__t__l__ella = {
@@ -254,7 +266,10 @@ export const p1_5_referring__to__people__yo__t__l__ella = {
     ["como ellas", "like them", "像她们一样", "xiàng tā men yī yàng", "como elas"],
     ["para ustedes", "for you", "为你们", "wèi nǐ men", "para vocês"],
     ["ustedes también", "you too", "你们也是", "nǐ men yě shì", "vocês também"]
-  ]
+  ],
+  accentFree: {"1": "tu", "2": "el", "14": "y tu", "15": "tu mismo", "16": "el mismo", "17": "como el", "18": "ella tambien", "23": "nosotros tambien", "27": "vosotros tambien", "30": "ellos tambien", "32": "ellas tambien", "35": "ustedes tambien"},
+  pinyinUnits: {},
+  distractors: "*Au*P1*FN*FO*KrOAC*E1ABOKEJOJKDRGHITFIHTFIGTGHFTKEDRJDERENPQVfhF*QQPQ*P5BACDNQ*QQLNP*QQL*REEJKgeWihfFGegSWMfhF97*NZFb*NZZdcaUZdjXYcYUZX*Eh*Mq*NbYaUZZjXYgS*FnUhTMVeSUWfTMVSWUeZdXY"
 };
 
 export const p1_6_being__permanent__ser = {
@@ -313,7 +328,10 @@ export const p1_6_being__permanent__ser = {
     ["ser honesto", "be honest", "说实话", "shuō shí huà", "seja honesto"],
     ["muy amable", "very kind", "非常友善", "fēi cháng yǒu shàn", "muito gentil"],
     ["persona amable", "kind person", "善良的人", "shàn liáng de rén", "pessoa gentil"]
-  ]
+  ],
+  accentFree: {"7": "profesion", "11": "simpatico", "19": "tu eres", "20": "eres tu", "22": "que es", "29": "mi profesion", "30": "que profesion", "32": "que nacionalidad", "37": "muy simpatico", "38": "chico simpatico"},
+  pinyinUnits: {},
+  distractors: "*ET*J8BGG*ND*PqA*BOFAB*E1*GVABRSVW*BRCABBACDdeLrfgJZIZeljYdIlHrM*KEn*RKaQOPTTUENbHLNNOPT*NTESVERVW*EM*BOCOCOTEERSWERSV*NZZ*Cj*Ef*FKKdI*Nb*CjX*EhMcpq*NdPHLMapqHeKYdHIJIgjmfIjmiJkohJkoKfmXhiogLIJZfjXgMXsInghiq*PbNMpNMaOHLMXnIJ"
 };
 
 export const p1_7_being__temporary__estar = {
@@ -372,7 +390,10 @@ export const p1_7_being__temporary__estar = {
     ["todo abierto", "all open", "全部开放", "quán bù kāi fàng", "tudo aberto"],
     ["bien situado", "well located", "位置优越", "wèi zhì yōu yuè", "bem localizado"],
     ["está situado", "is located", "位于", "wèi yú", "está localizado"]
-  ]
+  ],
+  accentFree: {"2": "estas", "3": "esta", "5": "estais", "6": "estan", "7": "ubicacion", "8": "condicion", "9": "animo", "19": "como estas", "20": "donde estas", "21": "aqui esta", "22": "como esta", "23": "aqui estamos", "25": "como estais", "26": "donde estais", "27": "donde estan", "28": "como estan", "29": "buena ubicacion", "30": "mi ubicacion", "31": "buena condicion", "32": "mala condicion", "33": "buen animo", "34": "estado de animo", "41": "esta abierto", "44": "esta situado"},
+  pinyinUnits: {},
+  distractors: "BCGJACGJGDFACGABKLMNCGDACDABe*LkIP*S3HPSABCG*TV*GJELEKMNEKLNEKLMEKLMHIST*KT*DAUZ*DCBEK*A0HIPcWZHb*B7a*FjWEHITcZVaepqgidfTcWQUb*B7*FjU*B7a*FjTWZHfYgiH*L1XagdYifIYiHIPSYgdfklnXKQUZn*Pcmj*O9LQUl*PcojMQUZXaeqXaepXaepXaep"
 };
 
 export const p1_8_having__age__tener = {
@@ -428,7 +449,10 @@ export const p1_8_having__age__tener = {
     ["con razón", "no wonder", "难怪", "nán guài", "justamente"],
     ["buena suerte", "good luck", "祝你好运", "zhù nǐ hǎo yùn", "boa sorte"],
     ["mucha suerte", "good luck", "祝你好运", "zhù nǐ hǎo yùn", "boa sorte"]
-  ]
+  ],
+  accentFree: {"4": "teneis", "9": "sueno", "12": "razon", "16": "tu tienes", "17": "tienes razon", "18": "el tiene", "22": "vosotros teneis", "23": "teneis razon", "32": "tengo sueno", "33": "mucho sueno", "38": "tiene razon", "39": "con razon"},
+  pinyinUnits: {},
+  distractors: "CGJKFC*DE*R2BFAGOSBEBFHNBC*R2GACJK*HpBEF*CxACG*LuACG*ILACG*G/ACGACGJ*Lq*BSBE*RnADSQefnBPefmXYZCDOB*ANRVX*MoW*DI*NZTWRU*MqU*DK*NbRYZaRXZakRXYRXYZ*KJ*DAghRXYZRXYZPQfnPQeniPebj*M/bggebhh*M/bgZbghbghiRbghPQefpRXYoRXY"
 };
 
 export const p1_9_the__a__articles__el__la__un__una = {
@@ -466,7 +490,10 @@ export const p1_9_the__a__articles__el__la__un__una = {
     ["unos amigos", "some friends", "一些朋友", "yī xiē péng yǒu", "alguns amigos"],
     ["unas horas", "a few hours", "几个小时", "jǐ gè xiǎo shí", "algumas horas"],
     ["unas amigas", "some friends", "一些朋友", "yī xiē péng yǒu", "alguns amigos"]
-  ]
+  ],
+  accentFree: {"9": "el dia", "12": "los ninos", "13": "los dias", "20": "unos dias"},
+  pinyinUnits: {},
+  distractors: "*CP*C0BE*NF*P1DA*BNDFAC*NEBF*BMFAB*BMEHCH*BMCDGFCD*IGMUKGHLR*Oi*Oj*OQN*H2*Lx*Ly*Mz*O1IUK*BbUKTPQWI*Bn*N7OQOPWILSJKLRJKKNILN*ACIMX*DJOPOPQIVOPQ"
 };
 
 export const p1_10_connecting__words__y__pero__porque = {
@@ -510,7 +537,10 @@ export const p1_10_connecting__words__y__pero__porque = {
     ["tú también", "you too", "你也是", "nǐ yě shì", "você também"],
     ["yo tampoco", "me neither", "我也不", "wǒ yě bù", "nem eu"],
     ["tampoco es", "neither is it", "也不是", "yě bú shì", "nem é"]
-  ]
+  ],
+  accentFree: {"7": "asi", "8": "tambien", "10": "tu y yo", "12": "si o no", "15": "pero si", "16": "porque si", "22": "donde esta", "24": "asi es", "25": "asi que", "26": "yo tambien", "27": "tu tambien"},
+  pinyinUnits: {},
+  distractors: "B*CN*P1EA*Au*CNE*BLGHK*Bw*R1QR*AtABH*Bv*BP*BzD*BuKMY*AtCEAabJNcdINGMYCQRTIGKYCIJXDP*P4CDOCDF*CARDL*B/QDLTWabLQRIVSWaUSWa*B7*Dy*D5*D4*B8GIJGKMCDFOPbISWaISWJSWaJSWa"
 };
 
 export const p1_11_days__of__the__week = {
@@ -554,7 +584,10 @@ export const p1_11_days__of__the__week = {
     ["la semana", "the week", "一周", "yī zhōu", "a semana"],
     ["fin de semana", "weekend", "周末", "zhōu mò", "fim de semana"],
     ["al fin", "at last", "终于", "zhōng yú", "afinal"]
-  ]
+  ],
+  accentFree: {"2": "miercoles", "5": "sabado", "7": "dia", "14": "el miercoles", "15": "cada miercoles", "20": "el sabado", "21": "cada sabado", "24": "cada dia", "25": "un dia"},
+  pinyinUnits: {},
+  distractors: "ZdBD*PwMDFOLSW*K0*BUQB*EMSGKUBDIWEKY*G9JAZ*G5bBDHAZdAEGYRCSWBQUbRVaCCTXcOCTXDMUbLNVaECLWOXcNFMQbNRaCG*NjCLOTcNEGKBAdBDbNRVIMQUOTXNAZBD"
 };
 
 export const p1_12_months__of__the__year = {
@@ -610,7 +643,10 @@ export const p1_12_months__of__the__year = {
     ["el mes que viene", "next month", "下个月", "xià gè yuè", "próximo mês"],
     ["año nuevo", "New Year", "新年", "xīn nián", "ano novo"],
     ["el año que viene", "next year", "明年", "míng nián", "próximo ano"]
-  ]
+  ],
+  accentFree: {"13": "ano", "15": "frio de enero", "32": "otono en octubre", "40": "ano nuevo", "41": "el ano que viene"},
+  pinyinUnits: {},
+  distractors: "CDFGJHoAADFGACFG*Hr*JMACGACDFACDABCDKLPTBHoALmIoKmIo*C0NEA*Ll*MdMEWUgdTIXaSZRYYbiQQZRYPIXaOgWdcfhkOdnpaPTWRbiQQSRYXPTWcRYibVfhWnpOjlVcVchkOUWdVcfkRYbQelVcVcfhVcefKLIopWdOBJKLnWdO"
 };
 
 export const p1_13_family__members = {
@@ -669,7 +705,10 @@ export const p1_13_family__members = {
     ["su esposo", "her husband", "她的丈夫", "tā de zhàng fū", "o marido dela"],
     ["mi esposa", "my wife", "我的妻子", "wǒ de qī zǐ", "minha esposa"],
     ["su esposa", "his wife", "他的妻子", "tā de qī zǐ", "sua esposa"]
-  ]
+  ],
+  accentFree: {"9": "tio", "10": "tia", "33": "mi tio", "34": "su tio", "35": "mi tia", "36": "su tia"},
+  pinyinUnits: {},
+  distractors: "PQFGC*OWLMBLMhE*OXBCDBCJGZaAF*FzbcI*OY*JL*LuH*OYfgKDEB*FyJDEMBCh*EWLBCOpqHNrsHQAZaPA*SfZTSBCURB*OvRUCASTCAXW*H3DYVD*OxVYEHWXEHbaFccZFbZcGaabGZfeH*OygdHfdgIeefIdjBCLkBCLhBCLiBCLnmLAolLAloMAmnMArqNdspNdpsOdqrOd"
 };
 
 export const p1_14_body__parts = {
@@ -740,7 +779,10 @@ export const p1_14_body__parts = {
     ["la rodilla", "the knee", "膝盖", "xī gài", "o joelho"],
     ["mi pie", "my foot", "我的脚", "wǒ de jiǎo", "meu pé"],
     ["el pie", "the foot", "脚", "jiǎo", "o pé"]
-  ]
+  ],
+  accentFree: {"15": "estomago", "49": "mi estomago", "50": "dolor de estomago"},
+  pinyinUnits: {},
+  distractors: "TGHI*Li*MXFL5SBFEKNXDKNXBLMC*BS*ENfAhiAG*Ry*LujA*ESlmADENX*GN*JMBFBFLC*LtDEKvwRZxTfh*Lqz0A12OZCBFLAPfhgkYuWBAG*FAV*Mz*LQDEKNuUgkaDORZDORcEORbEOReFAGd*MzFAGPThUkYuiHPThHPT*SH*MJIPuUgYmJPT*E9lJPoKORn*L3KOq*TNLApLAG*EVsMArMAG*MHNORkYUgwO*He1vO*La1Pvw1UgkY0QPTz*MBQP2Rvw1RvwDEKNDEKN"
 };
 
 export const p1_15_colors = {
@@ -793,7 +835,10 @@ export const p1_15_colors = {
     ["color oscuro", "dark color", "深色", "shēn sè", "cor escura"],
     ["color turquesa", "turquoise color", "绿松石色", "lǜ sōng shí sè", "cor turquesa"],
     ["azul turquesa", "turquoise blue", "绿松石蓝色", "lǜ sōng shí lán sè", "azul turquesa"]
-  ]
+  ],
+  accentFree: {"7": "marron", "27": "color marron", "28": "marron claro"},
+  pinyinUnits: {},
+  distractors: "*HiBGJAGJCEABFMINPCABF*R7q*SZ*S0ABJCFKLCDFHK*QXABG*OP*R4FHFHKCDINPfPQWkRVYNQWZNPWZOVYaXbchldimeTldORYaNPQZSbchORVafNPQORVYSXchSXbhimSTUTldNZPQ*A3NPQSXbcSOdmLNPQOSXbTdimMdiS"
 };
 
 export const p1_16_describing__things__grande__pequeo__bueno = {
@@ -864,7 +909,10 @@ export const p1_16_describing__things__grande__pequeo__bueno = {
     ["lugar bonito", "nice place", "好地方", "hǎo dì fāng", "lugar legal"],
     ["qué feo", "how ugly", "多么丑陋", "duō me chǒu lòu", "que feio"],
     ["tiempo feo", "ugly weather", "恶劣的天气", "è liè de tiān qì", "clima feio"]
-  ]
+  ],
+  accentFree: {"1": "pequeno", "13": "facil", "14": "dificil", "15": "rapido", "21": "desde pequeno", "22": "un pequeno error", "27": "dia largo", "38": "el mas viejo", "41": "que bueno", "43": "que malo", "45": "parece facil", "46": "nada facil", "47": "momento dificil", "48": "situacion dificil", "49": "muy rapido", "50": "coche rapido", "53": "que bonito", "55": "que feo"},
+  pinyinUnits: {},
+  distractors: "PRs3OXkqMDEFEFGIDFGI*RQDEGDEFI*MHZbf*BUDEFDEFGDEFGDEFG*GN*HrCDDEFGBXkq*MeARsDEFGAPs3CMDEYjlmVWav0UceavUiBOkqTjlmHbfnWvUiHZfneghtux14cghtHZbncehtHcegWavwTYlmIBOXTYjmTYjlHZbfTYjlHZbfLBOX*B4BOXMAPRceghdx14WaUiiWavPdu1*RscegceghVUceRduxcegh*DHAPRdux1"
 };
 
 export const p1_17_basic__action__verbs = {
@@ -923,7 +971,10 @@ export const p1_17_basic__action__verbs = {
     ["me gusta conversar", "I like to talk", "我喜欢说话", "wǒ xǐ huān shuō huà", "eu gosto de conversar"],
     ["limpiar la casa", "clean the house", "打扫房子", "dǎ sǎo fáng zi", "limpar a casa"],
     ["voy a limpiar", "I'm going to clean", "我去打扫", "wǒ qù dǎ sǎo", "eu vou limpar"]
-  ]
+  ],
+  accentFree: {"4": "oir", "8": "reir", "15": "venir aqui", "23": "oir musica", "24": "puedo oir", "25": "entrar aqui", "30": "nacer aqui", "31": "reir mucho", "32": "me hace reir"},
+  pinyinUnits: {},
+  distractors: "BGHCAGHCFJKM*Cx*P3EIDIAB*TB*DeCJABHC*MPABGABDECFKMkCFJ*RK*C9YkCFJKPRVWCFJKNRVW*Em*DASTNPVWQTZgQSZglrdiNPRW*NScNPNPRVLkNOQSTg*Ducho*RUNPRWahoijmnNPRVNPRVQSTZacoscdjmdimnKLYN*RgUrdLdijdijmachsqUlrpUlrUldiacho"
 };
 
 export const p1_18_common__foods = {
@@ -997,7 +1048,10 @@ export const p1_18_common__foods = {
     ["patatas fritas", "fries", "薯条", "shǔ tiáo", "batatas fritas"],
     ["la galleta", "the cookie", "饼干", "bǐng gān", "o biscoito"],
     ["galleta dulce", "sweet cookie", "甜饼干", "tián bǐng gān", "biscoito doce"]
-  ]
+  ],
+  accentFree: {"4": "cafe", "5": "te", "8": "platano", "23": "agua fria", "27": "leche fria", "28": "el cafe", "29": "cafe caliente", "30": "el te", "31": "te verde", "36": "el platano", "37": "platano maduro"},
+  pinyinUnits: {},
+  distractors: "*QYVOREeCD*NIBEFGJKLBeCD*COCBE*NMDJK*PsiINkHNSDGKLDGJLDGJKDGJK*R4uHI*Fu*JIARDGJK0VX2*J62AOHINT6HINhjnzAQX2BAORQV2HDGJKbikrDHINZikrEAORx7UhBECD*IbHIN*NlGHIUjnzH*MDZbUhnzIZbipv15JHINUhjz*FAKHIlv15*SJ*H2LHZbikMHIN034U*STN*INZlp15*O1*OzOZd7Uh*MJPHIUhjnQ*IQt3lpv5RQVXt04USt03lpv1T*SJZbdxUh"
 };
 
 export const p1_19_house__rooms = {
@@ -1056,7 +1110,10 @@ export const p1_19_house__rooms = {
     ["por las escaleras", "down the stairs", "下楼梯", "xià lóu tī", "descendo as escadas"],
     ["el garaje", "the garage", "车库", "chē kù", "a garagem"],
     ["en el garaje", "in the garage", "在车库里", "zài chē kù lǐ", "na garagem"]
-  ]
+  ],
+  accentFree: {"2": "habitacion", "3": "bano", "4": "salon", "7": "jardin", "19": "mi habitacion", "20": "la habitacion", "21": "el bano", "22": "en el bano", "23": "el salon", "24": "en el salon", "29": "el jardin", "30": "en el jardin"},
+  pinyinUnits: {},
+  distractors: "*Hh16DRScCTU*DlF7*GWAEKLMAZaCe*J/bJXdIOP*EY*HwfHhGXjELMA*HtEKM*EUEKLpYbhrHIP*Mx*FAQA*FAPAHSBgTRBgTUC*D8ZTCZa*Om*II*SX*SZ*SY*SaVdEYGJXNbhaFTUZFTUGcNYbBCFHeWfdCFs*IUIWdRSTUJ*LI*GGihTUZKkGJjNYb*IN*JHLml*INNY*LY*ID*SHMn*SoNYNqTUpRSgOsWdr*SOCF"
 };
 
 export const p1_20_making__doing__hacer = {
@@ -1121,7 +1178,10 @@ export const p1_20_making__doing__hacer = {
     ["mucho ruido", "a lot of noise", "有很多噪音", "yǒu hěn duō zào yīn", "muito barulho"],
     ["hacer esfuerzo", "make effort", "努力", "nǔ lì", "faça um esforço"],
     ["el esfuerzo", "the effort", "努力", "nǔ lì", "o esforço"]
-  ]
+  ],
+  accentFree: {"5": "haceis", "14": "dano", "21": "tu haces", "22": "que haces", "23": "el hace", "27": "vosotros haceis", "28": "que haceis", "45": "hacer dano", "46": "sin dano"},
+  pinyinUnits: {},
+  distractors: "*KACGDDIJNAGDHACGBCaLVCMTUACDHACGP*Hh*LiBD*AABDImRYaoEVe*FrFTU*LiBDI*Ll*GWBDACGHyWEKKYacdsvwUBFMTBFMCELecQEKDFMTKRac*Ef*NZb*DIEeKR*Eh*NbZ*DKWFKR*NdeSsGELVHELVhnmpgmpS*LxIFMrKRY*FA*H2*H+JmbZxKhpSoghmLKRYhmSd*OuMKRtjKRSdvwrKRYELVeSdsw*Es*EuSdybglQSds"
 };
 
 export const p1_21_going__places__ir = {
@@ -1180,7 +1240,10 @@ export const p1_21_going__places__ir = {
     ["de excursión", "tour", "旅游", "lǚ yóu", "percorrer"],
     ["el trayecto", "the journey", "旅程", "lǚ chéng", "a jornada"],
     ["largo trayecto", "long journey", "长途旅行", "cháng tú lǚ xíng", "longa jornada"]
-  ]
+  ],
+  accentFree: {"8": "direccion", "13": "excursion", "19": "tu vas", "20": "donde vas", "21": "el va", "22": "como va", "26": "donde vais", "28": "donde van", "31": "la direccion", "32": "en direccion", "41": "la excursion", "42": "de excursion"},
+  pinyinUnits: {},
+  distractors: "DBCG*Cy*PqCG*E4GDF*E2*P1CGLRTFCKVB*KoCDB*QbdelfgNY*CC*QY*S2h*KsFVBERTFnoJWpqIYrPQSYOQS*KPOPS*DCELTOPQUELRFcaOPFKBC*CC*BxJM*DIZ*Cj*MoPINa*DKX*Mq*CjUcIN*DMOPQUaOPeHINdHINgIpqfIpqiJOPhJOP*LGk*KsKj*KsKJ*SnLHJrINYoMOPnMOPqNfgpNfgOmINXZfg"
 };
 
 export const p1_22_numbers__1120 = {
@@ -1224,7 +1287,10 @@ export const p1_22_numbers__1120 = {
     ["el diecinueve", "the nineteen", "十九个", "shí jiǔ gè", "os dezenove"],
     ["veinte años", "twenty years", "二十年", "èr shí nián", "vinte anos"],
     ["los veinte", "the twenty", "二十个", "èr shí gè", "os vinte"]
-  ]
+  ],
+  accentFree: {"5": "dieciseis", "14": "trece anos", "16": "catorce dias", "20": "dieciseis anos", "21": "el dieciseis", "22": "diecisiete anos", "24": "dieciocho anos", "26": "diecinueve anos", "28": "veinte anos"},
+  pinyinUnits: {},
+  distractors: "BCEJACEJABEJRKMPTJCDVHORXIcFZFORbGcFECDKLMDPKNTDNKDPMLTDFHRd*TACDKVZGIDFHO*BgUYWELNDYW*T1FFQZGaU*T3GGbVQUHSWHQVGW*T7ISIXQS*T9*TrGI*Bl*T+JF"
 };
 
 export const p1_23_extended__family = {
@@ -1283,7 +1349,10 @@ export const p1_23_extended__family = {
     ["mi pariente", "my relative", "我的亲戚", "wǒ de qīn qī", "meu parente"],
     ["una parienta", "a relative", "一个亲戚", "yí gè qīn qī", "um parente"],
     ["mi parienta", "my relative", "我的亲戚", "wǒ de qīn qī", "meu parente"]
-  ]
+  ],
+  accentFree: {"4": "bebe", "5": "nino", "6": "nina", "23": "el bebe", "24": "mi bebe", "25": "el nino", "26": "un nino", "27": "la nina", "28": "una nina"},
+  pinyinUnits: {},
+  distractors: "BDKCADKC*Ij*GLTUABKC*RFFGAGEABFEABI*JCdCHCJM*G0*G1*LsC*G2ABD*G6*G7PQCHIJOpqTNsTURQALSPALPSBLQRBLUCNOTCNO*E/WDL*E/VDLYECHXECH*L3aFCZcFCcGCHabLPfHNOglmpdIhielmpi*HE*M5*HGh*HF*HHJk*HINOj*HJNOm*HQ*HSLl*LWLeojMfn*FB*LW*BlqrNsspN*H/psOeqOpr"
 };
 
 export const p1_24_emotions__feelings = {
@@ -1345,7 +1414,10 @@ export const p1_24_emotions__feelings = {
     ["muy aliviado", "very relieved", "很放心", "hěn fàng xīn", "muito aliviado"],
     ["estoy satisfecho con", "I am satisfied with", "我很满意", "wǒ hěn mǎn yì", "estou satisfeito com"],
     ["muy satisfecho", "very satisfied", "非常满意", "fēi cháng mǎn yì", "muito satisfeito"]
-  ]
+  ],
+  accentFree: {"16": "cumpleanos feliz", "30": "quedate tranquilo", "35": "me dejo asustado", "36": "me dejo sorprendido", "39": "me dejo confundido"},
+  pinyinUnits: {},
+  distractors: "BCEGACEGBEGI*EE*DpFLGIJObDLPEIJOMRDEEGJOEGIOlNhtDFPHJpHRrKhtEGIJvDFLZgmYHMDEpKNTVbdiWaquTbdiUaqukoYaensQQgmYquUXFTVdfjlrTVbiYnsQcjlrmQZY*BK*DaIK*ED*EFTVcflrnlXoKcfjgnLQkmYeXkYaMSKNrauUNcfjYenQOKNhaqUXPTVb"
 };
 
 export const p1_25_time__words__hoy__ayer__maana = {
@@ -1404,7 +1476,10 @@ export const p1_25_time__words__hoy__ayer__maana = {
     ["esta vez", "this time", "这次", "zhè cì", "desta vez"],
     ["muy pronto", "very soon", "很快", "hěn kuài", "muito em breve"],
     ["hasta pronto", "see you soon", "再见", "zài jiàn", "vejo você em breve"]
-  ]
+  ],
+  accentFree: {"2": "manana", "5": "despues", "10": "todavia", "19": "pasado manana", "20": "manana mismo", "23": "mas tarde", "25": "despues de", "26": "justo despues", "32": "nunca mas", "35": "todavia no", "36": "todavia mas", "37": "ya esta", "40": "mas temprano"},
+  pinyinUnits: {},
+  distractors: "*Cy*NDNBADEG*KtJOlEGIBDGIBZHKQDEIBFKQbDEGBCOlDjFHQ*CN*E2*NF*FNPXYg*J8ABL*FbCJl*CaMXYFHKb*BXWSZV*CamR*AMaUddenoSPWcRVchYMPgXMPgFRSfTUdeGFHKVWhiUenoUdnoRSZjMPXYiVWchVWcKkRSjKVW*DhCJO*Ca*Cc*CdFoMUdnMUdFHKQFHKQORSZUden"
 };
 
 export const p1_26_clothing = {
@@ -1463,7 +1538,10 @@ export const p1_26_clothing = {
     ["cinturón de seguridad", "seat belt", "安全带", "ān quán dài", "cinto de segurança"],
     ["ponerse la corbata", "put on the tie", "系上领带", "xì shàng lǐng dài", "coloque a gravata"],
     ["nudo de corbata", "tie knot", "领带结", "lǐng dài jié", "nó de gravata"]
-  ]
+  ],
+  accentFree: {"13": "cinturon", "28": "zapatos de tacon", "30": "calcetines de algodon", "37": "gorra de beisbol", "41": "abrocharse el cinturon", "42": "cinturon de seguridad"},
+  pinyinUnits: {},
+  distractors: "*IiFLB*Km*NL*S2*LiBIKNHZCI*NJGMOLABJEMOBDZCICKNE*GMBEFCINEFABJ*PwEGOCIKEEGMBbnQssPXaVTegmrgWgjRUYirSRTegDSdfacklhUirDHCIXcklPnQsXaklHSWfqRVpSWdhrSTjYjSWUYrShTgRXaclXackrXacPbQsXackeqRVeRVpmSgUQPXa"
 };
 
 export const p1_27_daily__activities = {
@@ -1522,7 +1600,10 @@ export const p1_27_daily__activities = {
     ["arreglo todo", "I fix everything", "我修复一切", "wǒ xiū fù yī qiè", "eu conserto tudo"],
     ["yo platico", "I talk", "我说话", "wǒ shuō huà", "eu falo"],
     ["platico contigo", "I talk to you", "我跟你说话", "wǒ gēn nǐ shuō huà", "eu falo com você"]
-  ]
+  ],
+  accentFree: {"24": "despues de ducharse", "30": "estudio espanol", "34": "escucho musica", "40": "corro rapido"},
+  pinyinUnits: {},
+  distractors: "*BxBKM*ORAKMTGHJWoqUFLQSaELQ*KEbCHdCGJfPRjhCGH*BLABMlEFQ*JFABIpCGHrCGHjnAI*KUEFLjBIPEFLQCbdhXcDWWYZeDiUXEUcDVZememsWFglDGTdh*KeUXDHhTbZmsWIEFLalDTJdTbWUXZPR*EZKTbdhL*SPagZesWPMCG*JyDqUNTbdDoUXOTbdZemW"
 };
 
 export const p1_28_city__places = {
@@ -1596,7 +1677,10 @@ export const p1_28_city__places = {
     ["al cine", "to the cinema", "去电影院", "qù diàn yǐng yuàn", "para o cinema"],
     ["la terminal", "the terminal", "终端", "zhōng duān", "o terminal"],
     ["en la terminal", "in the terminal", "在航站楼", "zài háng zhàn lóu", "no terminal"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "UBEF*Ho*LuWXDKRmCKRm*FQ*BwcA*EM*EQ*ENeghji*Kz*IjiLkPjrSCDK*S0*IeCDqHOYsNTUuMTUwHLYyIjr0VdfCDKmCDJK6MNUAVMNUQdf*IDX*MJBWBMN*LQCZHYbipDbHLa*K2ZiEdMNc*MOQVFfMNeQVdhG1kgG1k*LUHjZiIPrIlyGkIzgCDKR*L4mHL*TL*TK*Ie*L3*L4on*TKLrZbqIPjMtQVsMGvNv*HDQuNGtOxZbwIPjPzkGyPlgQ1Gt0Qgh*NnR3H2*MKZb5*IYSA4*GISAT7QV6TGt"
 };
 
 export const p1_29_transportation = {
@@ -1655,7 +1739,10 @@ export const p1_29_transportation = {
     ["en helicóptero", "by helicopter", "乘坐直升机", "chéng zuò zhí shēng jī", "de helicóptero"],
     ["el patinete", "the scooter", "滑板车", "huá bǎn chē", "a scooter"],
     ["en patinete", "on scooter", "骑踏板车", "qí tà bǎn chē", "na scooter"]
-  ]
+  ],
+  accentFree: {"1": "autobus", "4": "avion", "11": "tranvia", "13": "helicoptero", "17": "el autobus", "18": "en autobus", "23": "el avion", "24": "en avion", "36": "se conducir", "37": "el tranvia", "38": "en tranvia", "41": "el helicoptero", "42": "en helicoptero"},
+  pinyinUnits: {},
+  distractors: "DEHMRSJL*BOGIAAEHMADHMZaRSCIAD*R7ADECGAD*NL*QYBLkOBFlmBJADEHpqZarsKBQABJPABJSBFlRBFlU*N+CbT*J+CbWDBJVf*GJDYEBJXEBJaFNhZFNhcGTUbGTUe*SZHB*SZd*L3*SXgWIT*IJf*H3INZajpqjNkKNZKrsFmLFRlLFRoMBJn*DoMBqNijpNijsOkFrOkF"
 };
 
 export const p1_30_numbers__21100 = {
@@ -1720,5 +1807,8 @@ export const p1_30_numbers__21100 = {
     ["los noventa", "the nineties", "九十年代", "jiǔ shí nián dài", "os anos noventa"],
     ["cien por cien", "one hundred percent", "百分之一百", "bǎi fēn zhī yì bǎi", "cem por cento"],
     ["casi cien", "almost a hundred", "近一百个", "jìn yì bǎi gè", "quase cem"]
-  ]
+  ],
+  accentFree: {"0": "veintiun", "1": "veintidos", "2": "veintitres", "5": "veintiseis", "17": "veintiun anos", "18": "solo veintiun", "19": "veintidos anos", "20": "los veintidos", "21": "veintitres anos", "22": "los veintitres", "25": "veinticinco anos", "27": "veintiseis anos", "28": "los veintiseis", "29": "veintisiete anos", "31": "veintiocho dias", "33": "veintinueve anos", "35": "treinta anos", "37": "cuarenta anos", "39": "cincuenta anos", "41": "sesenta anos", "43": "setenta anos", "45": "ochenta anos", "47": "noventa anos"},
+  pinyinUnits: {},
+  distractors: "KyBJACFUFBWHYERSaGIjCBcHIeEjgCFkGiEjMNOPAyBJoBACNJOPMJOPJMNPJMNOJMNOT*OLVbADRURVb*OLWcBgbTRCcUCgDYZdDaeidREhEeYgVT*ODdWUFghZ*OFbiGacHVabHWcUd*OJIZeIVa*OLEGI*OMJCFjnprKEGIltvLLmuwrtvEsuwMptvEquwNprvEqswOprtEqsuPEGIjAKBJ"
 };
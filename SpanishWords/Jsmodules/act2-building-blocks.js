@@ -57,7 +57,10 @@ export const p2_31_liking__things__gustar = {
     ["va a doler un poco", "it's going to hurt a little", "会有点痛", "huì yǒu diǎn tòng", "vai doer um pouco"],
     ["debería bastar así", "that should suffice", "那应该足够了", "nà yīng gāi zú gòu le", "isso deveria bastar"],
     ["puede bastar con eso", "that can be enough", "这就足够了", "zhè jiù zú gòu le", "isso pode ser suficiente"]
-  ]
+  ],
+  accentFree: {"18": "perdon por molestar", "20": "deberia importar mas", "34": "deberia bastar asi"},
+  pinyinUnits: {},
+  distractors: "L*JY*PVIDEGJHBDEBEGJBDGJABDEBDEJCBDE*LIALFBDEG*SzAILA*JY*Mc*MdCHOYZPSaYeQhNSadhOWYVZfUNPadiNPSVXbNRgUXcgQTUVbNOeQhNRfUNPSdUVXNWgQTNPSaOYQhRZUVWcQTQOWYTNPSNPSa"
 };
 
 export const p2_32_weather__talk = {
@@ -113,7 +116,10 @@ export const p2_32_weather__talk = {
     ["mal pronóstico", "bad forecast", "不好的预测", "bù hǎo de yù cè", "previsão ruim"],
     ["muy húmedo", "very humid", "非常潮湿", "fēi cháng cháo shī", "muito úmido"],
     ["clima húmedo", "humid climate", "气候潮湿", "qì hòu cháo shī", "clima úmido"]
-  ]
+  ],
+  accentFree: {"1": "frio", "12": "pronostico", "13": "humedo", "16": "hace frio", "17": "mucho frio", "38": "el pronostico", "39": "mal pronostico", "40": "muy humedo", "41": "clima humedo"},
+  pinyinUnits: {},
+  distractors: "PEFIHCDGGKVA*GIBHC*Fc*E+*Fe*G+*IeZAECKVABCDGfAEFhPQZCGVAkXgpmnTWAEFIklnmAJQZJPZaSYejRYej*MF*MHMWbdiACGKAMThLLgpMZFRSYFJPbJPQaGUdJPQZUbiAfaIReIJPhJLXgJ*P5*GlKUbdiRSYLlnOkLOnnMLXmMkONRSYLXgM"
 };
 
 export const p2_33_can__able__poder = {
@@ -157,7 +163,10 @@ export const p2_33_can__able__poder = {
     ["casi imposible", "almost impossible", "几乎不可能", "jī hū bù kě néng", "quase impossível"],
     ["soy capaz", "I am capable", "我有能力", "wǒ yǒu néng lì", "eu sou capaz"],
     ["es capaz", "is capable", "有能力", "yǒu néng lì", "é capaz"]
-  ]
+  ],
+  accentFree: {"4": "podeis", "12": "tu puedes", "14": "puede que si", "18": "vosotros podeis", "19": "no podeis"},
+  pinyinUnits: {},
+  distractors: "CGJBFCAMABFGRHKLTBFABCAVACJBIYDKYHaZACGBLADHKNVANBPTVMLBPIRUOMNTSu*FO*JgDT*OUIQw*FQbEMNPyZaONLFMGDHKMNPTIHZaYaIUIYZbaZISMNPTJDHK"
 };
 
 export const p2_34_want__desire__querer = {
@@ -201,7 +210,10 @@ export const p2_34_want__desire__querer = {
     ["voy a desear", "I will wish", "我会希望", "wǒ huì xī wàng", "eu vou desejar"],
     ["con ansias", "eagerly", "热切地", "rè qiè dì", "ansiosamente"],
     ["muchas ansias", "a lot of eagerness", "许多愿望", "xǔ duō yuàn wàng", "muita vontade"]
-  ]
+  ],
+  accentFree: {"4": "quereis", "12": "tu quieres", "13": "que quieres", "14": "el quiere", "18": "vosotros quereis", "19": "que quereis"},
+  pinyinUnits: {},
+  distractors: "CBFKFCAGABFGRKLOBFYZBCAGCBFAACGIHACGACGILADOKADOBV*BaLTMBRCDKLNRTU*Jg*BeS*FODNTb*Ji*BgQ*FQNERb*BiV*Q9aFMKOXGMVWGMVZHBEYHBE*FU*Jm*Ne*Pn*Jn*PONRJMVWUaPN"
 };
 
 export const p2_35_school__supplies = {
@@ -275,7 +287,10 @@ export const p2_35_school__supplies = {
     ["en el aula", "in the classroom", "在教室里", "zài jiào shì lǐ", "na sala de aula"],
     ["la regla", "the ruler", "尺子", "chǐ zi", "a régua"],
     ["mi regla", "my ruler", "我的尺子", "wǒ de chǐ zi", "minha régua"]
-  ]
+  ],
+  accentFree: {"2": "lapiz", "3": "boligrafo", "17": "leccion", "24": "el lapiz", "25": "mi lapiz", "26": "el boligrafo", "27": "mi boligrafo", "54": "la leccion", "55": "esta leccion"},
+  pinyinUnits: {},
+  distractors: "CEFIWXNjAEFIabKOACFIACEIghJRSACEACEFmGRUopDOqrabstWXOuvBNwxuACEF01i42GJUHACEACEFVAGJUAGJXB*P/MWBMuZCGJYCGJbDLfaDLfdEGJcEGJ*GjFGJLabnhGDKgGDK*Dc*GS*Iq*I4iBN0l*HY*S9*SxkIGJJn*GdDmLabpKLaoKLarLstqL*DkstMLasMLavNOwxuNOxOuvvwOuzPGJyPGJ1QBN0QBNR*Dq3D2Lab*IeS5Q4BNj7TGJ6TGJ"
 };
 
 export const p2_36_office__work = {
@@ -349,7 +364,10 @@ export const p2_36_office__work = {
     ["mi despacho", "my office", "我的办公室", "wǒ de bàn gōng shì", "meu escritório"],
     ["el cubículo", "the cubicle", "小隔间", "xiǎo gé jiān", "o cubículo"],
     ["mi cubículo", "my cubicle", "我的小隔间", "wǒ de xiǎo gé jiān", "meu cubículo"]
-  ]
+  ],
+  accentFree: {"4": "companero", "5": "companera", "8": "reunion", "12": "telefono", "19": "cubiculo", "28": "mi companero", "29": "un companero", "30": "mi companera", "31": "una companera", "36": "la reunion", "37": "en la reunion", "44": "el telefono", "45": "por telefono", "58": "el cubiculo", "59": "mi cubiculo"},
+  pinyinUnits: {},
+  distractors: "BRLUARLUDYZJCaJMFcd*OiEe*OjcH*FeghGiINkGHNmnCDop*PaE*MbqrUsCDJuvGHwxCD*QNyzG01GHABLU45CD67CDVALWXUAL*CsX*GS*IqVWBLZCaDYbCabDYZZaDcedEFcfEecFdfde*O1FhGi*SvgjGijHghhi*TJHIl*DAEkbcdnJ*PtYmJYZpKbcoKbcrLCDqLCDMtYZsMbcvNEFuNEFxOYZwOYZzPa*IcyPEF1QEF0QEF3*GS*Im*O+2RLU5SYZ4SYZ7TYZ6TYZ"
 };
 
 export const p2_37_animals = {
@@ -423,7 +441,10 @@ export const p2_37_animals = {
     ["picadura de abeja", "bee sting", "蜂蜇", "fēng zhē", "picada de abelha"],
     ["pato de goma", "rubber duck", "橡皮鸭", "xiàng pí yā", "pato de borracha"],
     ["pato salvaje", "wild duck", "野鸭", "yě yā", "pato selvagem"]
-  ]
+  ],
+  accentFree: {"2": "pajaro", "8": "raton", "10": "leon", "24": "pajaro carpintero", "25": "a vista de pajaro", "36": "raton de biblioteca", "37": "trampa para raton", "40": "leon marino", "41": "valiente como un leon", "46": "mono arana"},
+  pinyinUnits: {},
+  distractors: "GHILTFKNJAEGPBFKcCJMBKNQAHILAGILAGHL*H8CAEBFNQAGHIRacyBFKQ*Fq*Fw*FeWDBFKBFKNMacyAGHIB*OmFKnVZgZmq2Ou1MYtbdXtbdVmq2MRcylx35EMRakswXfjr7ejr7nzUeiov0hov0efr7dswXbx35VZq2gUVZhiv0dkswVZm2efj7dkwXXYbdOW1Mhio0dksXbl35MRacgUefhiovOWuMVZmqblx5hiovblx3hiovefjr"
 };
 
 export const p2_38_thinking__pensar = {
@@ -467,7 +488,10 @@ export const p2_38_thinking__pensar = {
     ["buena idea", "good idea", "好主意", "hǎo zhǔ yì", "Boa ideia"],
     ["mi opinión", "my opinion", "我的意见", "wǒ de yì jiàn", "minha opinião"],
     ["en mi opinión", "in my opinion", "在我看来", "zài wǒ kàn lái", "na minha opinião"]
-  ]
+  ],
+  accentFree: {"4": "pensais", "9": "opinion", "12": "tu piensas", "13": "que piensas", "14": "el piensa", "18": "vosotros pensais", "19": "que pensais", "28": "mi opinion", "29": "en mi opinion"},
+  pinyinUnits: {},
+  distractors: "C*AoeBFCAGABFGRKOBBFJaBCAGC*MgBFYZmdACGBcBEFADOBAMVXBVNOTMBPCDKBFNRT*Jg*Q5*BeSDvNP*Ji*BgQ*QdNEPRV*Bi*QfWFMKO*CG*Pn*Pp*RB0GLMZH*IDUYH5U*HZbBEaLMVJdLMcHNP"
 };
 
 export const p2_39_feeling__sentir = {
@@ -511,7 +535,10 @@ export const p2_39_feeling__sentir = {
     ["mi sentimiento", "my feeling", "我的感觉", "wǒ de gǎn jué", "meu sentimento"],
     ["una sensación", "a feeling", "一种感觉", "yī zhǒng gǎn jué", "um sentimento"],
     ["la sensación", "the feeling", "感觉", "gǎn jué", "o sentimento"]
-  ]
+  ],
+  accentFree: {"4": "sentis", "9": "sensacion", "13": "como te sientes", "15": "como se siente", "18": "os sentis", "19": "como os sentis", "21": "como se sienten", "28": "una sensacion", "29": "la sensacion"},
+  pinyinUnits: {},
+  distractors: "*AoC*E+BFCAEABF*Ao*QsRHKG*Mg*QtBBCAU*MgE*Ov*QvGZDKab*FF*IDd*NucMLADHKOADUOBLVPTMUL*EQMVNOTRDIdQD*FPZEDHKNSPcOMF*EQPNUX*FVGJMNVab*Q/NVXHRIJbI*IENaI*FXNdJPTcJIQ"
 };
 
 export const p2_40_meals__food__details = {
@@ -585,7 +612,10 @@ export const p2_40_meals__food__details = {
     ["con mantequilla", "with butter", "加黄油", "jiā huáng yóu", "com manteiga"],
     ["el jamón", "the ham", "火腿", "huǒ tuǐ", "o presunto"],
     ["con jamón", "with ham", "配火腿", "pèi huǒ tuǐ", "com presunto"]
-  ]
+  ],
+  accentFree: {"5": "sandwich", "13": "azucar", "19": "jamon", "30": "un sandwich", "31": "el sandwich", "46": "el azucar", "47": "con azucar", "58": "el jamon", "59": "con jamon"},
+  pinyinUnits: {},
+  distractors: "UBFPWAFPDHIL*OoCHIcdMvefABhgScILTwHLTw*K5*H7mn*CPopJHITwstEvuJKQ*An*S8CD*HqyAB0JKN2bjr45Gc*SCHILAWZeUXg5BUZeWVg5*Cs*Dc*D8*IqUWef*O+*I4*Tib*O/aRjdEGScEGSfFUWeFUWhGVXgG4Vj*InABi*ImHRABFPGScdnJABmJABpKABo*CoKArABF*O4q*I4LMtGSsMGSNABFuNEM*TiHILJKNQP*ID*IE*Doy*IEPGQABF0QEMR3EM2RUWS5hV4SVX*SW*IgTRABFP"
 };
 
 export const p2_41_drinks__beverages = {
@@ -641,7 +671,10 @@ export const p2_41_drinks__beverages = {
     ["con ron", "with rum", "朗姆酒", "lǎng mǔ jiǔ", "com rum"],
     ["el vodka", "the vodka", "伏特加", "fú tè jiā", "vodca"],
     ["con vodka", "with vodka", "加伏特加", "jiā fú tè jiā", "com vodca"]
-  ]
+  ],
+  accentFree: {"11": "sangria", "36": "la sangria", "37": "una sangria"},
+  pinyinUnits: {},
+  distractors: "BEHIAEHISTFa*IWVLcABHI*QBYCaabJOIKNm*LxHKNhGOQHINm*IQkDc*LEABEHIKmQAGJRZSTOBGJPZSTTCUXSCUX*IvV*IuD*IuUD*Iv*O8fEGSTUYZF*QB*RHY*QCFSbGCFaGCFdHDLcHDL*L6*MEVkWIDLSTUXJCFa*CujKD*FYiCFl*IiLVk*IjLSHIKNGJOQNDLcCFab"
 };
 
 export const p2_42_vegetables = {
@@ -700,7 +733,10 @@ export const p2_42_vegetables = {
     ["con espinaca", "with spinach", "配菠菜", "pèi bō cài", "com espinafre"],
     ["el aguacate", "the avocado", "鳄梨", "è lí", "o abacate"],
     ["un aguacate", "an avocado", "鳄梨", "è lí", "um abacate"]
-  ]
+  ],
+  accentFree: {"4": "brocoli", "7": "maiz", "9": "judias", "23": "el brocoli", "24": "con brocoli", "29": "el maiz", "30": "con maiz", "33": "las judias", "34": "judias verdes"},
+  pinyinUnits: {},
+  distractors: "PBEFRAEF*SGTUJVWILXABFZABEHMbCMGbCfgDLCcdn*GJjkNlmDIHGbCpKOTrsKNQA*RVDPAYaBDILWfgiU*SeCKTCKNWDlqVDfgEYDIXEQaaFDIZ*TkFQCHJM*ELoCJHCJcABEFgIWifIWi*IiJDI/WfgkK*Gs*QjjK*Gs*TJmLVqlLWfbMCJcABENqQYpNVlsOQYrOQY"
 };
 
 export const p2_43_fruits = {
@@ -759,7 +795,10 @@ export const p2_43_fruits = {
     ["con frambuesa", "with raspberry", "覆盆子", "fù pén zǐ", "com framboesa"],
     ["la mora", "the blackberry", "黑莓", "hēi méi", "a amora"],
     ["con mora", "with blackberry", "与黑莓", "yǔ hēi méi", "com amora"]
-  ]
+  ],
+  accentFree: {"2": "limon", "3": "sandia", "4": "melon", "5": "pina", "8": "melocoton", "19": "el limon", "20": "jugo de limon", "21": "la sandia", "22": "una sandia", "23": "el melon", "24": "un melon", "25": "la pina", "26": "una pina", "31": "el melocoton", "32": "un melocoton"},
+  pinyinUnits: {},
+  distractors: "CEGRFHKMAEGR*HBVJLACGRHKMOACER*LGFKMfgNW*G5*Kd*SKhFHMO*GClDJFHKOpqIW*JqFHK*Sm*CsQAPVhlACEG*ICINU*G0CPXfgpS*HaWDQ*HbV*HZDYEPTXEPT*D8d*Gdae*GcZPcGPTbGPT*Cs*Dc*GSZadPTgIUpfIUp*HLi*SmJ*HKh*HLQkKDJjKDJmLQVlLINoMDJnMDJNqUfpNUf*Cs*GUd*O+PTXY"
 };
 
 export const p2_44_need__necessity__necesitar = {
@@ -797,7 +836,10 @@ export const p2_44_need__necessity__necesitar = {
     ["hay que necesitar", "must be needed", "必须需要", "bì xū xū yào", "deve ser necessário"],
     ["la necesidad", "the need", "需要", "xū yào", "a necessidade"],
     ["por necesidad", "out of necessity", "出于必要", "chū yú bì yào", "por necessidade"]
-  ]
+  ],
+  accentFree: {"4": "necesitais", "10": "tu necesitas", "11": "que necesitas", "12": "el necesita", "16": "vosotros necesitais", "17": "que necesitais"},
+  pinyinUnits: {},
+  distractors: "CBFGFGCHABFGBPEFBDFGBGCHBFCHBFGCJNAMINTABTLMRKBUNCIJJTIMQ*FO*QbmDTJNO*FQ*QdoLEPSTNPRNJFKGLKT*CG*FULSHTNXWHTN"
 };
 
 export const p2_45_looking__for__buscar = {
@@ -835,7 +877,10 @@ export const p2_45_looking__for__buscar = {
     ["voy a buscar", "I'm going to look", "我去看看", "wǒ qù kàn kàn", "vou dar uma olhada"],
     ["sin hallar", "without finding", "未找到", "wèi zhǎo dào", "sem encontrar"],
     ["puedo hallar", "I can find", "我可以找到", "wǒ kě yǐ zhǎo dào", "eu posso encontrar"]
-  ]
+  ],
+  accentFree: {"4": "buscais", "10": "tu buscas", "11": "que buscas", "12": "el busca", "16": "vosotros buscais", "17": "que buscais"},
+  pinyinUnits: {},
+  distractors: "CBFGFGCAABFGBPKTBIMDBGCABFC*AA*Mc*MdBFAEMBUSXNBDTERKBWCEIBPRVL*B8*FOQ*Q5DTNR*B+*FQO*BgLENPTXJNFDKE*CG*FU*Ne*Pp*CHNPRHLDKSJNP"
 };
 
 export const p2_46_telling__time = {
@@ -891,7 +936,10 @@ export const p2_46_telling__time = {
     ["durante el atardecer", "during sunset", "日落期间", "rì luò qī jiān", "durante o pôr do sol"],
     ["al anochecer", "at dusk", "黄昏", "huáng hūn", "ao anoitecer"],
     ["antes del anochecer", "before nightfall", "夜幕降临之前", "yè mù jiàng lín zhī qián", "antes do anoitecer"]
-  ]
+  ],
+  accentFree: {"3": "mediodia", "14": "que hora", "15": "a que hora", "20": "al mediodia", "21": "a mediodia", "23": "despues de medianoche"},
+  pinyinUnits: {},
+  distractors: "*IbGJB*G+QKCSHOgVULPWb*LOIYZMNJABKCOghfERUGABKi*Ol*PYBkDPQmLFNoFMSPCHgODLQBRDLQEIUCTFMSWYjVDEIDUFMETYjnpelFZTWYFTWEIRUEFMNdHEIcHEIfIlpIZTWhJCHgJCHKCHOTWYmLmEIefpZMkTWXpelNTWYnXel"
 };
 
 export const p2_47_directions__position = {
@@ -950,7 +998,10 @@ export const p2_47_directions__position = {
     ["ahí detrás", "back there", "在后面那里", "zài hòu miàn nà lǐ", "lá atrás"],
     ["por delante", "ahead", "前进", "qián jìn", "à frente"],
     ["ahí delante", "there in front", "前面有", "qián miàn yǒu", "lá na frente"]
-  ]
+  ],
+  accentFree: {"13": "detras", "23": "ahi arriba", "24": "mas arriba", "25": "ahi abajo", "26": "mas abajo", "34": "aqui cerca", "39": "ahi enfrente", "41": "por detras", "42": "ahi detras", "44": "ahi delante"},
+  pinyinUnits: {},
+  distractors: "DFIJCLADDLABCAFINTlAADIJOPVmdXYfADFJADFIADFICABDZahjETlA5GPVAGOVWUScADFIUbgrVDCEWQSnTDGOUQScYEHfXEHfMahjMZhjcGSgbQWdeHQWdkoQHXYiSbrsMZajhHXYMZahoQWc*GDm*NILlGOPMUQSkQWcqNHXpNHXsOSbrOSb"
 };
 
 export const p2_48_prepositions__en__con__sin__para = {
@@ -1009,7 +1060,10 @@ export const p2_48_prepositions__en__con__sin__para = {
     ["mediante el uso", "by using", "通过使用", "tōng guò shǐ yòng", "usando"],
     ["ante todo", "first of all", "首先", "shǒu xiān", "antes de mais nada"],
     ["ante ti", "before you", "在你面前", "zài nǐ miàn qián", "antes de você"]
-  ]
+  ],
+  accentFree: {"17": "de aqui", "26": "para mi", "28": "por aqui", "33": "desde aqui", "36": "hasta aqui", "37": "hacia alla", "39": "durante el dia"},
+  pinyinUnits: {},
+  distractors: "*OJBCD*No*OGAC*NoABD*HCEGADGAB*IU*QwODyDEAIJKLHJKLHIKLHIJLHIJK*KiUVXWrMPFDEGSdhkYefgZasHPdhkHIJKMVXcMUXcNrMPMUVcQefga*PX*QwFZ*QwFRPQSYMUVX*OTPShQYfgQYegQYefRPSdjmqnimqnPSdhPSdh*KoijqpQYeijmqqNnQpijmNWMPORZa"
 };
 
 export const p2_49_comparing__things = {
@@ -1068,7 +1122,10 @@ export const p2_49_comparing__things = {
     ["calidad superior", "top quality", "顶级品质", "dǐng jí pǐn zhì", "qualidade superior"],
     ["muy inferior", "very inferior", "很劣质", "hěn liè zhì", "muito inferior"],
     ["calidad inferior", "inferior quality", "质量低劣", "zhì liàng dī liè", "qualidade inferior"]
-  ]
+  ],
+  accentFree: {"0": "mas", "15": "mucho mas", "16": "un poco mas"},
+  pinyinUnits: {},
+  distractors: "CFBDHDEG*NrAFB*G+BEGHBDG*LHABCBDEHBEDGBDEG*KghQUBDEGWbcdNOPTMOPTMNPTMNOTSJUVXZPlQamnMNOPJQVZJQUZDLbcRZ*A3lahoSX*A3RJYSmncdGLbeGLbeHLcd*O2HILWb*N0JQUJiYohJYokKLWjKLWLRXJSanpMSamnMYhrNSasiYhpOSaqiYh"
 };
 
 export const p2_50_physical__actions = {
@@ -1127,7 +1184,10 @@ export const p2_50_physical__actions = {
     ["dejar rodar", "let roll", "让它滚", "ràng tā gǔn", "vamos rolar"],
     ["aprender a gatear", "learn to crawl", "学习爬行", "xué xí pá xíng", "aprenda a engatinhar"],
     ["empezar a gatear", "start crawling", "开始爬行", "kāi shǐ pá xíng", "comece a rastejar"]
-  ]
+  ],
+  accentFree: {"17": "saltar de alegria", "27": "acostar al bebe", "29": "despertar interes", "35": "patear el balon"},
+  pinyinUnits: {},
+  distractors: "*DRBCF*AL*JZF*S8*AL*JZABENABDNAB*Fi*FE*FgB*PVLMAI*Ow*B0JGHJLHWXaO*PU*QwAGMABGLABDEABKABCQUbcPUbclprSsRbcWVYZPQbcTYZq*AJTHJHJWaqTVZTVYqFHJWcfjkbfjkhiRedghibcjkedhidiRedhRebcfkbcfjmRprlbcfbcfjbcfjRlrSYTVZRlpSSRbc"
 };
 
 export const p2_51_names__calling__llamar = {
@@ -1171,7 +1231,10 @@ export const p2_51_names__calling__llamar = {
     ["una llamada", "a call", "一个电话", "yí gè diàn huà", "uma ligação"],
     ["el nombre", "the name", "名字", "míng zì", "o nome"],
     ["mi nombre", "my name", "我的名字", "wǒ de míng zì", "o meu nome"]
-  ]
+  ],
+  accentFree: {"4": "llamais", "13": "como te llamas", "15": "como se llama", "18": "os llamais", "19": "como os llamais", "21": "como se llaman"},
+  pinyinUnits: {},
+  distractors: "CBFGFGCAABFGBRHMBSIKBGCABFCABGZDBFGC*LIcdBLOAEKAEIUOBDVPTMUKMCVNQRRDPNQDXZEaDHNSYVOMFDPNUW*Pp*RB*CG*FU*PqRZbTNVWHRXbbISDaIRXdJDHcJDH"
 };
 
 export const p2_52_giving__dar = {
@@ -1215,7 +1278,10 @@ export const p2_52_giving__dar = {
     ["hacer una donación", "make a donation", "捐款", "juān kuǎn", "fazer uma doação"],
     ["ofrenda floral", "floral offering", "鲜花供品", "xiān huā gòng pǐn", "oferenda floral"],
     ["dejar una ofrenda", "leave an offering", "留下奉献", "liú xià fèng xiàn", "deixe uma oferta"]
-  ]
+  ],
+  accentFree: {"8": "donacion", "24": "regalo de cumpleanos", "26": "donacion de sangre", "27": "hacer una donacion"},
+  pinyinUnits: {},
+  distractors: "BFGCFGCE*LC*LDBFEHABBADF*LwBGCBFCA*CdDJWNUJOWHINVXdRQMPOLPOTIUJO*MO*MNILLMOTLTVZSKVXRKVXLMPQINJOKZcQJHINKdRSabKXVcQRbKXdaKXdVZQRKXRS"
 };
 
 export const p2_53_seeing__watching__ver = {
@@ -1259,7 +1325,10 @@ export const p2_53_seeing__watching__ver = {
     ["sin observar", "unobserved", "未被观察到", "wèi bèi guān chá dào", "não observado"],
     ["visión de futuro", "vision of the future", "未来愿景", "wèi lái yuàn jǐng", "visão do futuro"],
     ["campo de visión", "field of vision", "视野", "shì yě", "campo de visão"]
-  ]
+  ],
+  accentFree: {"9": "vision", "12": "que ves", "18": "que veis", "24": "mirar atras", "28": "vision de futuro", "29": "campo de vision"},
+  pinyinUnits: {},
+  distractors: "BFCEAFCE*LCABFGHEJBADFAB*LBCDHEJDGEJsNOPKMDGJMDGXRWbSJKDIOPQINPQTINOINOPbLTXMUIJPYRVSIJKINOPdLXcLRWbTRVb*LnacWcWdLIRLTWadLWLXc"
 };
 
 export const p2_54_restaurant__vocabulary = {
@@ -1321,7 +1390,10 @@ export const p2_54_restaurant__vocabulary = {
     ["quiero reservar", "I want to reserve", "我要预约", "wǒ yào yù yuē", "Quero reservar"],
     ["la taza", "the cup", "杯子", "bēi zi", "a xícara"],
     ["una taza", "a cup", "一个杯子", "yí gè bēi zi", "uma xícara"]
-  ]
+  ],
+  accentFree: {"2": "menu", "20": "el menu", "21": "ver el menu"},
+  pinyinUnits: {},
+  distractors: "BQRIASIOFGPDECFG*EVDCFCGPD*F9CFPeJLMghABijHLklQRmHJMoHJL*Fi*QvUa*OMABICFGDRASBQTASTBQRRS*DlB*MMCNaUeij*Gl*D8*P9DWKQRZEHJYEHJ*HMb*H7FaFNU*GU*D8*GS*I4*GVcHJfH*SMVeHKQhI*ScKgIKQjJ*MMViJVelKpskKnpLVeitlkpMVeioksTsKQRTKQR*CHqOknlkp*P9*TivPuHJL"
 };
 
 export const p2_55_shopping__buying = {
@@ -1392,7 +1464,10 @@ export const p2_55_shopping__buying = {
     ["hacer devolución", "make return", "退货", "tuì huò", "fazer devolução"],
     ["la garantía", "the guarantee", "保证", "bǎo zhèng", "a garantia"],
     ["con garantía", "with guarantee", "有保证", "yǒu bǎo zhèng", "com garantia"]
-  ]
+  ],
+  accentFree: {"17": "devolucion", "18": "garantia", "26": "cuanto va a costar", "30": "mas barato", "53": "la devolucion", "54": "hacer devolucion", "55": "la garantia", "56": "con garantia"},
+  pinyinUnits: {},
+  distractors: "JKPQDEFH*QwBDE*Mh*AA*ALB*KcbBD*LaBDEMCBDhBDE*DQ*FnjYlmAKnAJPpSbhGCBDGtuBvBDExyAJz0AJ1cop3LbhXZi4gkVW*FU*CG*Q/*RFVj1T*RB*FU*NeT*NfIdeTXi4q2UgELShbRopefFId*KuFIAJKPUkVWHLSbhTXZkIVWjIUgmJIYlJIYK*BFo*GlnKRcLRcopa2U*D8*GS*O+*PQ*TjrLSuNLStNLS*G7wOLv*HPOIyPIYxPIY0Q*DwIzQIYR2VW1RaqS4Rc3STX"
 };
 
 export const p2_56_beginning__empezar = {
@@ -1436,7 +1511,10 @@ export const p2_56_beginning__empezar = {
     ["hay que comenzar", "we have to start", "我们必须开始", "wǒ men bì xū kāi shǐ", "temos que começar"],
     ["el inicio", "the beginning", "开始", "kāi shǐ", "o começo"],
     ["desde el inicio", "from the beginning", "从一开始", "cóng yī kāi shǐ", "desde o início"]
-  ]
+  ],
+  accentFree: {"4": "empezais", "12": "tu empiezas", "13": "cuando empiezas", "14": "el empieza", "18": "vosotros empezais", "19": "cuando empezais"},
+  pinyinUnits: {},
+  distractors: "CBFKFCAGABF*DVBEGKBFHIBCAGCBFAYBEFBEFHcACGAOCDPRUWBOFCTVabCKBFBFC*DJ*FOS*B8*JgDUWX*FQQ*B+*JiNVab*FSRWXNTab7a3R6*CG*FUbH*IDMDYNSTW7NTX6*FUNJBEFRUWX"
 };
 
 export const p2_57_continuing__seguir = {
@@ -1480,7 +1558,10 @@ export const p2_57_continuing__seguir = {
     ["puede detenerse", "can stop", "可以停止", "kě yǐ tíng zhǐ", "pode parar"],
     ["hay que avanzar", "we must move forward", "我们必须前进", "wǒ men bì xū qián jìn", "devemos seguir em frente"],
     ["vamos a avanzar", "let's move forward", "让我们继续前进", "ràng wǒ men jì xù qián jìn", "vamos seguir em frente"]
-  ]
+  ],
+  accentFree: {"4": "seguis", "12": "tu sigues", "14": "el sigue", "15": "sigue asi", "17": "seguimos aqui", "18": "vosotros seguis", "19": "seguis bien"},
+  pinyinUnits: {},
+  distractors: "CHBEFCEMBFHA*FfMPI*FgBGFBCEG*Fi*OvEB*PU*LGCADMNPOBDEABEFV*K/RWBDPITIUYCJBDBDMI*FOS*B8*JgDLWXQVbaNIUYYZLNLSba*CG*FU*Pn*PpLRWU*Pp*FU*NeUUYLN*F0b*CGQSVac*Qi*FU*Ne*Pn*Qh*QlZc"
 };
 
 export const p2_58_furniture__objects = {
@@ -1548,7 +1629,10 @@ export const p2_58_furniture__objects = {
     ["vaciar el lavavajillas", "empty the dishwasher", "清空洗碗机", "qīng kōng xǐ wǎn jī", "esvazie a máquina de lavar louça"],
     ["colchón de muelles", "spring mattress", "弹簧床垫", "tán huáng chuáng diàn", "colchão de molas"],
     ["cambiar el colchón", "change the mattress", "换床垫", "huàn chuáng diàn", "trocar o colchão"]
-  ]
+  ],
+  accentFree: {"1": "sabana", "4": "sofa", "5": "lampara", "9": "television", "17": "colchon", "20": "cambiar las sabanas", "21": "sabanas de algodon", "26": "sentarse en el sofa", "27": "sofa cama", "28": "encender la lampara", "29": "lampara de pie", "36": "encender la television", "37": "television de pantalla plana", "39": "nevera vacia", "41": "horno de lena", "47": "lavadora automatica", "52": "colchon de muelles", "53": "cambiar el colchon"},
+  pinyinUnits: {},
+  distractors: "GOPbIKMCLBEIFHRACLBIDHRAAOPbDFRABKMCNWnpBIMCCBEIBIKCJWnpAGPbAGObdWfmDFHAVZajlskzXcwSSZajnprJUcwShxefSVajSVZjAGOPUXwSQWfmgiuSmQYdeiuSYxefeguSSVZazyosTskzfQYdWprJtvUXWnrJSVZaWnpJkzlyovUXegiSotUXUXcSYhefzkotykosSVZaSVZa"
 };
 
 export const p2_59_bathroom__items = {
@@ -1607,7 +1691,10 @@ export const p2_59_bathroom__items = {
     ["crema hidratante", "moisturizing cream", "保湿霜", "bǎo shī shuāng", "creme hidratante"],
     ["el desodorante", "the deodorant", "除臭剂", "chú chòu jì", "o desodorante"],
     ["usar desodorante", "use deodorant", "使用除臭剂", "shǐ yòng chú chòu jì", "usar desodorante"]
-  ]
+  ],
+  accentFree: {"1": "banera", "4": "vater", "5": "jabon", "6": "champu", "17": "la banera", "18": "en la banera", "23": "el vater", "24": "en el vater", "25": "el jabon", "26": "jabon de manos", "27": "el champu", "28": "champu para el cabello", "34": "un peine pequeno"},
+  pinyinUnits: {},
+  distractors: "EFJN*IqRCGTBGHVILPAFJN*GNAEJbBCHdBCGfDLPAEFNjkSUlDIPnimeAEFJrKSUAQDIPVYfBSTbRKUOCURbTKSODQYfgneqEYDIXQVf*G0FDIjOkrGRTdWgneHRTbqsMWI*Hz*PCQWneq*HzJDIMmekKkaOjKrMLQVYMiekMWgecWgn*Ic*GS*IuNesMWOskMrOeq"
 };
 
 export const p2_60_health__medical = {
@@ -1681,5 +1768,8 @@ export const p2_60_health__medical = {
     ["en la sala", "in the room", "在房间里", "zài fáng jiān lǐ", "na sala"],
     ["una camilla", "a stretcher", "担架", "dān jià", "uma maca"],
     ["en la camilla", "on the stretcher", "在担架上", "zài dān jià shàng", "na maca"]
-  ]
+  ],
+  accentFree: {"1": "medico", "2": "medica", "14": "clinica", "22": "el medico", "23": "al medico", "24": "la medica", "25": "una medica", "48": "la clinica", "49": "en la clinica"},
+  pinyinUnits: {},
+  distractors: "JNBCCWXIBYIKEabQDQcaefGHgFHP*CuFGP*KckBC*AKANBBCI4SAJNsDERAJBCwTVuzFGHE1D023DE*GIAJL*CuOVuQefgAOTuXBFGWBFGZCFGYCDEbDcEadDcd1Eabc0EfF*ID*DmeF*Dp*IEGYQUg0dt6Habth0dIFGHkIDEQUefFGHPabciKDEMFGHPFGHPMabcshj0NOTVQUefOxDEwabczPabyPQUd1Qbc0QdR3QU2Rab*Gq*GU*PQ*P9*P+4FG7*H6iT6abc"
 };
@@ -51,7 +51,10 @@ export const p3_61_knowing__facts__saber = {
     ["sin conocimiento", "without knowledge", "没有知识", "méi yǒu zhī shí", "sem conhecimento"],
     ["la ignorancia", "ignorance", "无知", "wú zhī", "ignorância"],
     ["pura ignorancia", "pure ignorance", "纯粹的无知", "chún cuì de wú zhī", "pura ignorância"]
-  ]
+  ],
+  accentFree: {"0": "se", "4": "sabeis", "7": "sabiduria", "10": "yo se", "11": "no se", "12": "tu sabes", "14": "el sabe", "18": "vosotros sabeis", "19": "ya sabeis", "24": "mucha sabiduria", "25": "con sabiduria"},
+  pinyinUnits: {},
+  distractors: "CKLBFG*GHC*GIBFG*GJBRMBTODBG*GLCBFCEZRJPab*HIZcUHRLCBFKCBF*GSN*UQBM*GbTB*GU*USCETDHM*GW*Ip*Lp*PuD*Iq*Lq*Pv*Ir*Lr*Pw*GYNEPD*Ga*UY*CD*ItFDMN*Gd*P0*Ua*Ws*Iw*Lw*P1*RKZSadHYIcIb*HhSaIQSJd*POIcJSY"
 };
 
 export const p3_62_knowing__peopleplaces__conocer = {
@@ -92,7 +95,10 @@ export const p3_62_knowing__peopleplaces__conocer = {
     ["muy conocido", "very well known", "非常出名", "fēi cháng chū míng", "muito conhecido"],
     ["un desconocido", "a stranger", "一个陌生人", "yí gè mò shēng rén", "um estranho"],
     ["número desconocido", "unknown number", "未知号码", "wèi zhī hào mǎ", "número desconhecido"]
-  ]
+  ],
+  accentFree: {"4": "conoceis", "11": "tu conoces", "13": "el conoce", "17": "vosotros conoceis", "18": "lo conoceis", "26": "numero desconocido"},
+  pinyinUnits: {},
+  distractors: "CJKBFGCEBFGABQ*LqEBSHNBGCUBFCA*V/XENZYXHKADLJADLMBUNLOSBOCEHNMCE*LpR*G0*PuDIYS*LrP*G2*PwMEXD*Lt*LP*PyMFLMN*Fz*G7*P0WVZTIY*WZH*WaXI*WaHIX*WZVPRVW"
 };
 
 export const p3_63_technology__internet = {
@@ -160,7 +166,10 @@ export const p3_63_technology__internet = {
     ["un cable", "a cable", "一根电缆", "yī gēn diàn xiàn", "um cabo"],
     ["los auriculares", "the headphones", "耳机", "ěr jī", "os fones de ouvido"],
     ["mis auriculares", "my headphones", "我的耳机", "wǒ de ěr jī", "meus fones de ouvido"]
-  ]
+  ],
+  accentFree: {"0": "movil", "2": "portatil", "6": "aplicacion", "7": "contrasena", "10": "camara", "18": "el movil", "19": "mi movil", "22": "el portatil", "23": "mi portatil", "30": "una aplicacion", "31": "la aplicacion", "32": "la contrasena", "33": "mi contrasena", "38": "la camara", "39": "mi camara"},
+  pinyinUnits: {},
+  distractors: "MQKLUVDFWXEI*L6Y*QjBaCImcdBD*ZSfe*Zjgh*KaGiCEm*IgklBmnOp*X6AMQAQKL*UNOUV*Fg*Qb*Uo*FowxGHAMKL01bGTABDSABDVBNYUBNYXCGHWCGHZ*MRD*RAY*V2DGEb*NLGaERGdF*VaNcF*VZNf*ZkG*Zje*ZjG*ZShHfjgHfjIjGHi*RBIflJ*R7*Yfk*IxJ*R8nKCEmKCEpBDFoLKOrMBDqMBD*Ugu*Oc*RU01es*Qw*IV*NP*RI*Qx*U5*IW*RJxPfgwPfgzQBDyQBD1Rte0Rte"
 };
 
 export const p3_64_asking__for__things__pedir = {
@@ -204,7 +213,10 @@ export const p3_64_asking__for__things__pedir = {
     ["mi pedido", "my order", "我的订单", "wǒ de dìng dān", "meu pedido"],
     ["una solicitud", "a request", "一个请求", "yí gè qǐng qiú", "um pedido"],
     ["la solicitud", "the request", "请求", "qǐng qiú", "o pedido"]
-  ]
+  ],
+  accentFree: {"4": "pedis", "7": "peticion", "12": "tu pides", "13": "que pides", "14": "el pide", "18": "vosotros pedis", "19": "que pedis", "24": "una peticion", "25": "la peticion"},
+  pinyinUnits: {"13": "1112", "19": "11112"},
+  distractors: "CBEFFCEGABFE*K+IRMBFGABCEGBEFA*LhZNPL*LGDGdcRXL*LF*QGAIK*LGA*LH*Ll*QIBT*LIHP*LJ*Ln*QKC*LKHNT*LL*GW*Lp*QM*LMD*Lq*UV*LN*GY*QO*UWN*LOHP*LP*Lt*QQ*AUFDMH*LR*Gd*QS*Ua*Gc*Lv*RH*RLZ*WOHW*LzYH*FAbIHNaIHNdJSWcJWY"
 };
 
 export const p3_65_asking__questions__preguntar = {
@@ -245,7 +257,10 @@ export const p3_65_asking__questions__preguntar = {
     ["buena respuesta", "good answer", "好答案", "hǎo dá àn", "boa resposta"],
     ["hay que contestar", "you have to answer", "你必须回答", "nǐ bì xū huí dá", "você tem que responder"],
     ["voy a contestar", "I'm going to answer", "我来回答", "wǒ lái huí dá", "eu vou responder"]
-  ]
+  ],
+  accentFree: {"4": "preguntais", "11": "tu preguntas", "13": "el pregunta", "17": "vosotros preguntais", "18": "nos preguntais"},
+  pinyinUnits: {},
+  distractors: "CBFGFGCAABFGBEFGBDFGBGCABFC*Y0XBFG*VGBFGKANCJANLMBUKULBKCJKBNTWCR*N5*OW*SfDMTYP*N7*OY*INEWaOOQYSMFLK*Fv*FzZQ*ZGO*G+*XwHDLMXQTS*Vf*OF*Qw*ZF*Vg*QxIS"
 };
 
 export const p3_66_nature__outdoors = {
@@ -319,7 +334,10 @@ export const p3_66_nature__outdoors = {
     ["flores del prado", "meadow flowers", "草地花", "cǎo dì huā", "flores do prado"],
     ["bajar en cascada", "cascade down", "像瀑布一样落下", "xiàng pù bù yī yàng luò xià", "cascata para baixo"],
     ["cascada de agua", "waterfall", "瀑布", "pù bù", "cachoeira"]
-  ]
+  ],
+  accentFree: {"1": "arbol", "6": "montana", "7": "rio", "22": "trepar al arbol", "23": "arbol frutal", "32": "escalar la montana", "33": "cima de la montana", "34": "cruzar el rio", "35": "orilla del rio", "37": "lago de montana", "45": "roca volcanica"},
+  pinyinUnits: {},
+  distractors: "o24XKLPR*HUKFQEIMNDIMNCQBGTCFOJDEI*M9DEM*WIHDEBLPRBKPRDEINDEIMcGTuBKLR*Uk*Ui*Up*Uj*ECBKLBKLPGCFOegnpe3UgYabkivz0Wabkhqx1WYbkWYakOGTujmWX3UVgs56WnpUZZqx1Xvz0mdWXWYabWYabjdWXgpUZA24XgnUZZhx1WYabf56WWYabyAOcXiz0WYabZhq1uAOcXiv0XivzZhqxAo4XeUVgAo2Xfs6Wfs5WWYab"
 };
 
 export const p3_67_sleeping__dormir = {
@@ -363,7 +381,10 @@ export const p3_67_sleeping__dormir = {
     ["deja de roncar", "stop snoring", "停止打鼾", "tíng zhǐ dǎ hān", "pare de roncar"],
     ["tengo insomnio", "I have insomnia", "我失眠了", "wǒ shī mián le", "Estou com insônia"],
     ["el insomnio", "insomnia", "失眠", "shī mián", "insônia"]
-  ]
+  ],
+  accentFree: {"4": "dormis", "12": "tu duermes", "13": "como duermes", "14": "el duerme", "18": "vosotros dormis", "19": "cuanto dormis"},
+  pinyinUnits: {},
+  distractors: "CBFKFCAMABFOJKOZGACHBCAVEACHZACE*C0ACEdDKOADJOpFWdBV*GwOPaLRCDJKNaLR*LL*UU*G0*UyDTUX*LN*UW*Lr*CBRUXb*G4*U2y*ItFM*G5K*IW*Qx*UbL*LR*Ua*G7*U4ZHMVYHDJNPLRRTUXdRSTJLWM"
 };
 
 export const p3_68_playing__jugar = {
@@ -407,7 +428,10 @@ export const p3_68_playing__jugar = {
     ["buena jugadora", "good player", "好球员", "hǎo qiú yuán", "bom jogador"],
     ["el partido", "the match", "比赛", "bǐ sài", "a partida"],
     ["un partido", "a match", "一场比赛", "yī cháng bǐ sài", "uma partida"]
-  ]
+  ],
+  accentFree: {"4": "jugais", "12": "tu juegas", "13": "a que juegas", "14": "el juega", "18": "vosotros jugais", "19": "cuando jugais"},
+  pinyinUnits: {},
+  distractors: "*C5CGBFCAGABFGHJKOBFACBCAGACBEIDGYHaMP*GOcdDADHJ*DvYcdBIPDaLUVCDHJIMDH*AQ*B/*GW*Ip*GX*QNbS*AS*Ir*Lr*PwRUVW*IPVWXUWXZUVXZ*Wn*WsUVHIaZbYUVIYHNZaRSdJ*Gg*CJcJ*Gg*GO"
 };
 
 export const p3_69_sports = {
@@ -481,7 +505,10 @@ export const p3_69_sports = {
     ["practicar escalada", "practice climbing", "练习攀爬", "liàn xí pān pá", "praticar escalada"],
     ["el patinaje", "skating", "滑冰", "huá bīng", "patinação"],
     ["practicar patinaje", "practice skating", "练习滑冰", "liàn xí huá bīng", "praticar patinação"]
-  ]
+  ],
+  accentFree: {"0": "futbol", "3": "beisbol", "6": "natacion", "16": "esqui", "20": "el futbol", "21": "jugar futbol", "26": "el beisbol", "27": "jugar beisbol", "32": "la natacion", "33": "practicar natacion", "52": "el esqui", "53": "practicar esqui"},
+  pinyinUnits: {},
+  distractors: "UIc2WJZeNPQsaLYtMRCNeGOS*MA*Yp*YqgiadBklAcKmn*ZTJomnDYtuERCNCPQswFGSCNQsCNPsECMN4FGO6FGOAFGOKiBJBbmnWBpzCDLtBJegDHdBVWmnEAI2HaBFFBJZoq3W*MdG*Yp*CIx57jHKVBxh57lIFGkIFGnJKomJpKpKmnonKmfo3WWbmnCNPQsDLYvNDLuNDLOBJZjh57*MfPDLp1XfQDLY3pzX*NbRAI1foqS*GeBJhx7jTBJZhx5j"
 };
 
 export const p3_70_hobbies__interests = {
@@ -537,7 +564,10 @@ export const p3_70_hobbies__interests = {
     ["ir a cazar", "go hunting", "去打猎", "qù dǎ liè", "ir caçar"],
     ["me gusta acampar", "I like camping", "我喜欢露营", "wǒ xǐ huān lù yíng", "Gosto de acampar"],
     ["ir a acampar", "go camping", "去露营", "qù lù yíng", "ir acampar"]
-  ]
+  ],
+  accentFree: {"5": "fotografia", "6": "jardineria", "24": "la fotografia", "25": "hacer fotografia", "26": "la jardineria", "27": "hacer jardineria"},
+  pinyinUnits: {},
+  distractors: "OPFGnDNlE*ID*QmKNBCE*BHC*M4*QbY*I+AGaAFpVAFGefQZMCEK*ID*Qb*WDC*Qm*WGCEJCEKDBCEPARTOARTkUoW*Xq*OdBOWkiUX*TC*U4*CFShoIHAFGSmoiT*U4*Ws*TCF*JdZOYFIQGbOPaGIQdefIH*VgIQIfcQeIcQmkOPUoIQSWkmhIQZSWigLABFWogSBDNlWmUhnNAF"
 };
 
 export const p3_71_leaving__salir = {
@@ -581,7 +611,10 @@ export const p3_71_leaving__salir = {
     ["hora de partida", "departure time", "出发时间", "chū fā shí jiān", "hora de partida"],
     ["en marcha", "underway", "正在进行", "zhèng zài jìn xíng", "em andamento"],
     ["ponerse en marcha", "get going", "开始吧", "kāi shǐ ba", "vá em frente"]
-  ]
+  ],
+  accentFree: {"4": "salis", "12": "tu sales", "13": "cuando sales", "14": "el sale", "18": "vosotros salis", "19": "a que hora salis"},
+  pinyinUnits: {},
+  distractors: "*M8BEF*ABEFC*ACBFA*ADIKMBAFG*AFBCAABEF*QUG*M8Y*EL*OvaDcHOAADIMUNPW*AMBDIXZLU*AOCHJWaLU*AQ*B/*LL*QM*QN*ETST*CB*LN*QO*UWRSbN*AU*CD*It*LP*ANFDI*RL*CG*Ub*Q7*AW*CF*LR*QSHcDIYNXL*PQI*Ee*Ef*UdRSTJYDIQRST"
 };
 
 export const p3_72_returning__volver = {
@@ -625,7 +658,10 @@ export const p3_72_returning__volver = {
     ["hay que regresar", "we have to go back", "我们得回去", "wǒ men dé huí qù", "temos que voltar"],
     ["el retorno", "the return", "返回", "fǎn huí", "o retorno"],
     ["sin retorno", "no return", "没有回报", "méi yǒu huí bào", "sem retorno"]
-  ]
+  ],
+  accentFree: {"4": "volveis", "12": "tu vuelves", "13": "cuando vuelves", "14": "el vuelve", "15": "vuelve manana", "18": "vosotros volveis", "19": "cuando volveis"},
+  pinyinUnits: {},
+  distractors: "C*L+BFFCAMABF*L+*XGIKOBFHJBCAVACBEIYZBHDKOcBEFADIOPUXaB*DwVOT*GTRLCDIKLUXa*Lp*QM*XF*D0NTLP*Lr*XH*IN*ASNRLP*D4*QQ*EW*IPF*D5MK*Lv*YW*XMd*QS*XL*D7*AWZH*YdMYHMV*Xw*Cj*NU*Od*Xv*NT*Oc*RQJd*J9McJWM"
 };
 
 export const p3_73_music__songs = {
@@ -696,7 +732,10 @@ export const p3_73_music__songs = {
     ["una orquesta", "an orchestra", "管弦乐队", "guǎn xián yuè duì", "uma orquestra"],
     ["la flauta", "the flute", "长笛", "cháng dí", "a flauta"],
     ["tocar la flauta", "play the flute", "吹长笛", "chuī cháng dí", "tocar flauta"]
-  ]
+  ],
+  accentFree: {"0": "musica", "1": "cancion", "3": "melodia", "10": "bateria", "11": "violin", "14": "album", "19": "la musica", "20": "escuchar musica", "21": "una cancion", "22": "buena cancion", "25": "la melodia", "26": "una melodia", "39": "la bateria", "40": "tocar la bateria", "41": "el violin", "42": "tocar el violin", "47": "el album", "48": "un album"},
+  pinyinUnits: {},
+  distractors: "TLSz*YD*YpDKXYIMZBKbFJNOEJNOfg*Us*UthifgjCMREFNO*I5nBDpASzrCIREFJOEFJNEFJNEFJN1CIM*Cq3ALACIMohik*YqW*EmBV*Jq*YqmYCVaXCVaaD*R5GZDVX*R9c*WhEb*WiCIeFBDdFBDgGH2fGH2iHq4hHq4IVXYojsU*NZJBDWHfg*JTK*KX*R9UhikLCIMhi4UMVXYrkUou*KfNBtNBDwOBDvOBD*VVPBDxGZn0*Nb*Nf*YXz*Nc*NgQ2RVX1RHfSCIMhiqU"
 };
 
 export const p3_74_wearing__carrying__llevar = {
@@ -740,7 +779,10 @@ export const p3_74_wearing__carrying__llevar = {
     ["voy a portar", "I'm going to carry", "我要带", "wǒ yào dài", "Vou carregar"],
     ["hay que sostener", "you have to hold", "你必须握住", "nǐ bì xū wò zhù", "você tem que segurar"],
     ["voy a sostener", "I will hold", "我会握住", "wǒ huì wò zhù", "eu vou segurar"]
-  ]
+  ],
+  accentFree: {"4": "llevais", "12": "tu llevas", "13": "que llevas", "14": "el lleva", "18": "vosotros llevais", "19": "que llevais"},
+  pinyinUnits: {},
+  distractors: "CBFGFGCAABFGBRJMBKLOBGCABFCA*Et*YtBF*Qb*Fe*Fm*MJ*SYDMVLPA*W/KPVABDJVTM*XI*XCPCEKLVKO*XF*G0*S8*UyDV*XGL*XH*G2*S+*U0N*XIER*EW*XJVZPLFD*Wo*XMRT*Bna*NP*QwZXacURTW*Qw*YV*Bn*NP*Qx*YW*Bo*D6*Sr*Zl*RO*Lw*Ss*RP*ZE*Lv"
 };
 
 export const p3_75_bringing__traer = {
@@ -784,7 +826,10 @@ export const p3_75_bringing__traer = {
     ["un encargo", "an assignment", "作业", "zuò yè", "uma tarefa"],
     ["hay que acarrear", "you have to carry", "你必须携带", "nǐ bì xū xié dài", "você tem que carregar"],
     ["voy a acarrear", "I'm going to carry", "我要携带", "wǒ yào xié dài", "eu vou carregar"]
-  ]
+  ],
+  accentFree: {"4": "traeis", "12": "tu traes", "13": "que traes", "14": "el trae", "18": "vosotros traeis", "19": "que traeis"},
+  pinyinUnits: {},
+  distractors: "*LGKLEFGCABFGA*PhBRI*PiBAHBGCABFCA*SP*X+*BCYabDMKLNYLAJNKAJN*PqBDITJKLP*PsCAOCAE*Pu*AQ*Lp*XF*PvD*AR*Lq*Pw*AS*Lr*XHN*XIER*Py*AU*CD*GaFDIM*Lv*Q3*Q7*XM*P1*AX*Lw*Q2*BeHJKScdQbIRTaI*WVR*NN*Bn*Q4*RO*Bo*U5*Q5*RP"
 };
 
 export const p3_76_school__education = {
@@ -870,7 +915,10 @@ export const p3_76_school__education = {
     ["un posgrado", "a postgraduate", "研究生", "yán jiū shēng", "uma pós-graduação"],
     ["el rector", "the rector", "校长", "xiào zhǎng", "o reitor"],
     ["la rectora", "the rector", "校长", "xiào zhǎng", "o reitor"]
-  ]
+  ],
+  accentFree: {"4": "matematicas", "7": "geografia", "9": "espanol", "10": "ingles", "13": "educacion", "16": "titulo", "32": "las matematicas", "33": "estudiar matematicas", "38": "la geografia", "39": "estudiar geografia", "42": "el espanol", "43": "hablar espanol", "44": "el ingles", "45": "hablar ingles", "50": "la educacion", "51": "buena educacion", "56": "el titulo", "57": "un titulo"},
+  pinyinUnits: {},
+  distractors: "*WLYCFaHNR*HM*O0cAefLdgZam*ME*Pli*OPkOSVm*FhBNopKQqACFsIQXuDdkUIKQy*MA*X4BGSVW23AC45IK67BH8GOV*VR+ACMIKQ*J5*J6GO*J7*J8GO*W9*W+*J9*OlAZ*MfBYEamBbEZaBfr*Hpd*PaCcCDLfD*MpteD*MqbEz01vnlj*OP*Ml*P2Flgz0GDLdjngvH*F0EZlvhjpIGOoIGOJBHNbfegKGOSeux9L*Uc*XNehnljMIKQOetuN*Md*YTE*HYyg0*Ug*Ocgz*TCgz03PoB2PpB5QGO4QGO7REZ6REZS9DL8Set*V1/T*Ii*V2+TD*Wh*J4UI*Wi*J3AC*J6VDL*J5VDL*J8WDL*J7WDL*XP*OlX*O8*XR*Om*XN*O+"
 };
 
 export const p3_77_deep__emotions = {
@@ -944,7 +992,10 @@ export const p3_77_deep__emotions = {
     ["con melancolía", "with melancholy", "带着忧郁", "dài zhe yōu yù", "com melancolia"],
     ["el pánico", "panic", "恐慌", "kǒng huāng", "pânico"],
     ["con pánico", "in panic", "恐慌", "kǒng huāng", "em pânico"]
-  ]
+  ],
+  accentFree: {"2": "alegria", "7": "verguenza", "10": "desesperacion", "12": "estres", "15": "emocion", "17": "jubilo", "18": "melancolia", "19": "panico", "24": "la alegria", "25": "con alegria", "31": "que sorpresa", "34": "la verguenza", "35": "que verguenza", "40": "la desesperacion", "41": "con desesperacion", "44": "el estres", "45": "mucho estres", "50": "la emocion", "51": "con emocion", "54": "el jubilo", "55": "con jubilo", "56": "la melancolia", "57": "con melancolia", "58": "el panico", "59": "con panico"},
+  pinyinUnits: {},
+  distractors: "*WIBGEAGEJYILPaFQh*MC*MKOAeDQhABEJijYkk*TXCLNcwxop5jqrCIsRTUJcwxEABGyCIL0DFh2MTU45Za6MRUAMRTCILP*PKBMRCILPC*HpZHYCSaDbSZ*BAaDf*MxJNwMRTUFfSZeFbi*HvGMRDFQnHjbfiH4KIlHYkISZuJCIDFQhKp5joK5jrL*GeHqLHYMDFQbfi1mNCIDFQhJNcxJNcwP*CIz*MdyPSZQ1SZ0QbfRDFQ*R42RHS5*Hbj4SKjTDFQ6THY"
 };
 
 export const p3_78_saying__telling__decir = {
@@ -988,7 +1039,10 @@ export const p3_78_saying__telling__decir = {
     ["es mentira", "it's a lie", "这是一个谎言", "zhè shì yí gè huǎng yán", "é mentira"],
     ["la palabra", "the word", "这个词", "zhè ge cí", "a palavra"],
     ["una palabra", "a word", "一句话", "yī jù huà", "uma palavra"]
-  ]
+  ],
+  accentFree: {"4": "decis", "12": "tu dices", "13": "que dices", "14": "el dice", "18": "vosotros decis", "19": "que decis"},
+  pinyinUnits: {},
+  distractors: "CBEFFCEGBFAE*ByRIJBFGABCEGBEFAYZKLbDJMcDIM*B5L*QG*KA*B3*B6*IZK*B7*QIBD*B8TPY*B9*QKCH*B+NTY*B/*GW*QM*UU*CAD*Sc*Si*CB*GY*QO*UW*CCNPY*CD*QQ*AU*GaFDIJ*CF*Gd*QS*Ua*QT*RG*RK*Q0ZHNPYHNP*XSb*MqIIaRcdJRbcJUa"
 };
 
 export const p3_79_putting__placing__poner = {
@@ -1032,7 +1086,10 @@ export const p3_79_putting__placing__poner = {
     ["en posición", "in position", "就位", "jiù wèi", "em posição"],
     ["en orden", "in order", "按顺序", "àn shùn xù", "em ordem"],
     ["poner en orden", "tidy", "整齐的", "zhěng qí de", "limpo"]
-  ]
+  ],
+  accentFree: {"4": "poneis", "8": "posicion", "12": "tu pones", "13": "donde pones", "14": "el pone", "18": "vosotros poneis", "19": "donde poneis", "26": "la posicion", "27": "en posicion"},
+  pinyinUnits: {},
+  distractors: "BFGJFGCABFGABRHKBOPABGCABFCABGDK*B2abDABFGLADHKVPA*B7BDHT*QJUa*B9PCEVOLC*AQ*B/*Ip*PuD*AR*Ah*CA*AS*Ir*Pw*G2NXUa*CD*AU*Ga*ItPLFD*ZK*CG*Iv*RHY*ZJ*AX*IwX*ZJSZSQYd*CIbINaINUJDHKTXYN"
 };
 
 export const p3_80_travel__tourism = {
@@ -1106,7 +1163,10 @@ export const p3_80_travel__tourism = {
     ["enviar postal", "send postcard", "寄明信片", "jì míng xìn piàn", "enviar postal"],
     ["la gira", "the tour", "游览", "yóu lǎn", "o passeio"],
     ["una gira", "a tour", "一次旅行", "yī cì lǚ xíng", "um passeio"]
-  ]
+  ],
+  accentFree: {"9": "estacion", "16": "guia turistico", "38": "la estacion", "39": "a la estacion", "52": "el guia turistico", "53": "un guia turistico"},
+  pinyinUnits: {},
+  distractors: "BUVGAWXGYZOU*A8abKcdJPHqDKgABN*GkFqDklMc*EmmEP*Ev*W/*XAo*KD*QDTFtsIc*I8uABwCUV*ULyEJ01sk2EJP*IDDK6*NA*KDFHVACOUWACVXB*HzWBCOZCnwYCnwb*BRDEaDEJdE*FEIcE*FFIfFABeFABhGCOgGIMjHABiHABlI*IUtkI*IUtn*FAJ*CIm*FAJYp*FSKEoKEJFHDKIMcdtMQkMskl*JZvN*OPu*PP*P3NOYZnwQs0*UczP*XNy*LVPY1Q3x0Q3xRIMc01xQSCOU4klt*Kb*QU7T6*NgAB"
 };
 
 export const p3_81_banking__money = {
@@ -1174,7 +1234,10 @@ export const p3_81_banking__money = {
     ["una inversión", "an investment", "一项投资", "yī xiàng tóu zī", "um investimento"],
     ["la divisa", "the currency", "货币", "huò bì", "a moeda"],
     ["una divisa", "a currency", "一种货币", "yī zhǒng huò bì", "uma moeda"]
-  ]
+  ],
+  accentFree: {"1": "debito", "2": "prestamo", "3": "interes", "16": "inversion", "20": "de debito", "21": "tarjeta de debito", "22": "un prestamo", "23": "el prestamo", "24": "el interes", "25": "con interes", "50": "la inversion", "51": "una inversion"},
+  pinyinUnits: {},
+  distractors: "*TaSBFUAFMWXOPYEHkDHkl*Fg*QgABQTYdDEklWXZu*GGABF*CwLNJKNJAqrAB*MKKLJuCPSCOSUyzGT*QV0ABACOPS*TaAGBCOPeijaXCIZWCIZD*BT*Jj*KrYDIW*Q4*IV*I1*Qw*U4*Wp*ZD*D7*Q6*Bn*IV*QwFGQT*OF*IV*Bl*Ug*IWGab*TGa*Oc*Qy*Sm*TH*U5vj*IwVeIVablJDEkJDEn*Yn*Hn*Cwm*YoKA*FW*H1ps*H2otLrMCOqMCO*H1otN*H2ps*MyvOIWuOhwxPhvwPhvzQhvyQca1RCO0RGQ"
 };
 
 export const p3_82_finding__encontrar = {
@@ -1218,7 +1281,10 @@ export const p3_82_finding__encontrar = {
     ["gran hallazgo", "great find", "伟大的发现", "wěi dà de fā xiàn", "ótima descoberta"],
     ["hay que detectar", "must be detected", "必须检测到", "bì xū jiǎn cè dào", "deve ser detectado"],
     ["puedo detectar", "I can detect", "我可以检测到", "wǒ kě yǐ jiǎn cè dào", "eu posso detectar"]
-  ]
+  ],
+  accentFree: {"4": "encontrais", "12": "tu encuentras", "14": "el encuentra", "18": "vosotros encontrais", "19": "lo encontrais"},
+  pinyinUnits: {},
+  distractors: "CBFKFCAMABFORHEGTDGHBCAVHCBEGDEKaJACIACGLPAOKPNVNBVOVPMLPCKLLNVKS*Y9*AttDTN*Y+Q*Y/*AvvERN*ZAV*ZBNPNPLF*ZD*Fz*Zm*Az*ZE*QxGRXZSQYSQUIbBEaIMN*Vf*Xv*Ug*CmRXMN"
 };
 
 export const p3_83_waiting__hoping__esperar = {
@@ -1259,7 +1325,10 @@ export const p3_83_waiting__hoping__esperar = {
     ["con esperanza", "with hope", "满怀希望", "mǎn huái xī wàng", "com esperança"],
     ["la paciencia", "patience", "耐心", "nài xīn", "paciência"],
     ["con paciencia", "patiently", "耐心地", "nài xīn dì", "pacientemente"]
-  ]
+  ],
+  accentFree: {"4": "esperais", "10": "espero que si", "11": "tu esperas", "12": "que esperas", "13": "el espera", "17": "vosotros esperais", "18": "cuanto esperais"},
+  pinyinUnits: {},
+  distractors: "CBFGFGCAABFGBQH*RuBJNDBGCABFCAFXDB*JZ*I8Z*MlAENBQWXZBUMNLBODCEJBNTMD*Y9*ILR*S8DUKW*Y/*INP*S+VRTYOU*U2*EWFLJN*NN*NT*Vd*ZJKQXZHYUKXHUT*JZIa*MlZI*QF*JZ"
 };
 
 export const p3_84_business__terms = {
@@ -1333,7 +1402,10 @@ export const p3_84_business__terms = {
     ["empresa matriz", "parent company", "母公司", "mǔ gōng sī", "empresa controladora"],
     ["el dividendo", "the dividend", "股息", "gǔ xī", "o dividendo"],
     ["un dividendo", "a dividend", "股息", "gǔ xī", "um dividendo"]
-  ]
+  ],
+  accentFree: {"0": "compania", "6": "presentacion", "13": "perdida", "14": "facturacion", "16": "expansion", "20": "la compania", "21": "una compania", "32": "la presentacion", "33": "una presentacion", "46": "la perdida", "47": "una perdida", "48": "la facturacion", "49": "alta facturacion", "52": "la expansion", "53": "en expansion"},
+  pinyinUnits: {},
+  distractors: "UDIJCWXHBYHNE*J9*JOaD*J+c*XRefGPgh*Md*Y0*RbijBklADmnADSBCHqrUZsADI*GOuBCwVctyFGd01ET2ADI*I54BC67*QEEVALZUAOcXBY*RaWZBYZCWXXYCLb*J9DEaDdEd*J+Eacb*XSEfFgyeFgyhG*MdegG*CH*WOjH*R0EiHEQlILUkILUnJLUmJLUp*VV*KVKo*VWKBrLFGqL*YOFtM*MlLs*MmMO*GgvNEuNLUOx*FA5wOhePzefyPhx1QOV0QOV3RLU2ROV*JTSADwFGP7TOV6TOV"
 };
 
 export const p3_85_believing__creer = {
@@ -1377,7 +1449,10 @@ export const p3_85_believing__creer = {
     ["con fe", "with faith", "凭着信念", "píng zhe xìn niàn", "com fé"],
     ["la incredulidad", "disbelief", "难以置信", "nán yǐ zhì xìn", "descrença"],
     ["con incredulidad", "with disbelief", "难以置信", "nán yǐ zhì xìn", "com descrença"]
-  ]
+  ],
+  accentFree: {"4": "creeis", "11": "creo que si", "12": "tu crees", "14": "el cree", "18": "vosotros creeis", "19": "lo creeis"},
+  pinyinUnits: {},
+  distractors: "CaBFFGCbABFG*Ic*W4BR*IdB*W5TBGCbBFCb*I8YPTACaBcdWX*W/AEORHPT*IlN*XBBMVTB*In*XDCE*XEHTD*Ip*XF*AQ*Lp*Iq*XGDN*Ir*XH*AS*LrNEHP*It*XJ*AU*CDNFDM*XL*AW*U4X*Iw*Q2*AX*Lw*JZZH*MlY*MmHWACBFBFGAJdSQcJQS"
 };
 
 export const p3_86_living__vivir = {
@@ -1421,7 +1496,10 @@ export const p3_86_living__vivir = {
     ["una vivienda", "a home", "一个家", "yí gè jiā", "uma casa"],
     ["la convivencia", "coexistence", "共存", "gòng cún", "coexistência"],
     ["buena convivencia", "good coexistence", "良好的共存", "liáng hǎo de gòng cún", "boa convivência"]
-  ]
+  ],
+  accentFree: {"4": "vivis", "11": "vivo aqui", "12": "tu vives", "13": "donde vives", "14": "el vive", "18": "vosotros vivis", "19": "donde vivis"},
+  pinyinUnits: {},
+  distractors: "CHBEEFCGABFHMIKLBFGABCEGBEFA*MCACBaLDMcWXb*B5*LFAOIDMP*B7*LHBDT*LmUV*B9*LJCKILNT*B/*GW*LL*UU*GX*ETSc*CB*GY*LN*UWNUVa*CD*LP*AU*GaNTUa*CF*Gd*LR*Ua*LS*RG*RK*YV*GN*MxZ*R5*NEYHKbINTaIJWJd*JZRcJQR"
 };
 
 export const p3_87_cooking__verbs = {
@@ -1495,7 +1573,10 @@ export const p3_87_cooking__verbs = {
     ["voy a marinar", "I'm going to marinate", "我要腌制", "wǒ yào yān zhì", "Vou marinar"],
     ["hay que descongelar", "must be defrosted", "必须解冻", "bì xū jiě dòng", "deve ser descongelado"],
     ["voy a descongelar", "I'm going to defrost", "我要去解冻", "wǒ yào qù jiě dòng", "vou descongelar"]
-  ]
+  ],
+  accentFree: {"4": "freir", "7": "sarten", "28": "hay que freir", "29": "voy a freir", "34": "la sarten", "35": "en la sarten", "43": "esta delicioso"},
+  pinyinUnits: {},
+  distractors: "UVTZ*ID*BH*Fg*FmFQSmBHKNJMOBCQSm*WIIEJiBDKGEJMEMOBBDHNqdntEJOBBDHKEJMBG*WIBDCFSmBDHKCFQm*VHAZbVAYeUAYe*IV*Bn*YV*NP*IW*Bo*U5*YW*NT4*OFuATbc*LS*QT*Bn*ISATZc*P1*IwAT*Iv*XMLn*NN*IVW*Lw*IWX*LvA*Wr*NPy*AX*WozilHjhliXgpIlBDkhiC*BRJnCmlLd*IV*Lws*YV*IW*Lvt*YWLrWaqLUV*LS*Lw*QT*YV*CG*Lv*Wo*YW*Bn*NP*TE0*Bo*TF*Gc1*AX*LS*QT*YV*Gc*CG*Ub*Wog*Wr*NP2h3*TF*Wo*NPu*AXev*GcAT*NPysgzt*Woh*Bn*TE*NTY*Bo*TFAT*Vh*Bl7U*ViT*OA6"
 };
 
 export const p3_88_physical__appearance = {
@@ -1566,7 +1647,10 @@ export const p3_88_physical__appearance = {
     ["sus cejas", "his eyebrows", "他的眉毛", "tā de méi máo", "as sobrancelhas dele"],
     ["las pestañas", "the tabs", "选项卡", "xuǎn xiàng kǎ", "as abas"],
     ["sus pestañas", "your eyelashes", "你的睫毛", "nǐ de jié máo", "seus cílios"]
-  ]
+  ],
+  accentFree: {"18": "pestanas", "50": "esta calvo", "55": "las pestanas", "56": "sus pestanas"},
+  pinyinUnits: {},
+  distractors: "TCGJKNPRYAGJa*VQZOcFSV*OpeESfACJhLjk*WDBKN*VO*X+lmBNPRpHjksACGBKPRwvDTBKNRz0ACBKNPEFVhAU*KfDTabdEFShBACGYCceC*OKXDaDvUDZUbcEUaEbXeeFUaF*PEdXGgDOfGXcHEFS*K2hHD*Wh*QUkIj*MhIHm*YfJ*BdlJ*Be*Ix*HdKACEFSVLEFSpLDOsMXcMrDOEFSVNACGwOZUOvUaPyACxDOT0Q*Wl*BrzQDO2EFS1EFS4SUa3SUa"
 };
 
 export const p3_89_receiving__recibir = {
@@ -1610,7 +1694,10 @@ export const p3_89_receiving__recibir = {
     ["un receptor", "a receiver", "接收器", "jiē shōu qì", "um receptor"],
     ["hay que obtener", "you have to get", "你必须得到", "nǐ bì xū dé dào", "você tem que pegar"],
     ["voy a obtener", "I'm going to get", "我会得到", "wǒ huì dé dào", "eu vou conseguir"]
-  ]
+  ],
+  accentFree: {"4": "recibis", "7": "recepcion", "12": "tu recibes", "14": "el recibe", "18": "vosotros recibis", "19": "lo recibis", "24": "la recepcion", "25": "en la recepcion"},
+  pinyinUnits: {},
+  distractors: "C*Ig*WJBEFCGABFER*XW*K+BBFGABCEGBEFmY*V5*X4D*JOabK*IEBEFLPAIKPNTNBTVTVPMPCIKLNVK*Xj*LL*B/*QMD*Xk*LMN*Xl*LN*LL*PwNVLP*XnV*AU*CDNPTL*Xp*LR*CF*QS4*NU*ZI*XqHZ*WN*YTYHWcb*J9I*XPaI*XQD*IX*Zl*ZJ*Iw*IYRXY"
 };
 
 export const p3_90_sending__enviar = {
@@ -1651,7 +1738,10 @@ export const p3_90_sending__enviar = {
     ["voy a mandar", "I'm going to send", "我要发送", "wǒ yào fā sòng", "Vou enviar"],
     ["hay que remitir", "must be sent", "必须发送", "bì xū fà sòng", "deve ser enviado"],
     ["voy a remitir", "I will forward", "我会转发", "wǒ huì zhuǎn fā", "vou encaminhar"]
-  ]
+  ],
+  accentFree: {"0": "envio", "1": "envias", "2": "envia", "4": "enviais", "5": "envian", "9": "yo envio", "10": "te envio", "11": "tu envias", "12": "me envias", "13": "el envia", "14": "lo envia", "17": "vosotros enviais", "18": "lo enviais", "19": "ellos envian", "20": "lo envian"},
+  pinyinUnits: {},
+  distractors: "CBFGFCGAABFGQLMUSIJKBCGABFCH*Fg*HGBF*SVEJKKOAEJAEIMBDULBDUOCEIUJNC*QM*IL*Uy*B/DS*H+W*IN*U0*EU*OYEQ*H/DUaQVOFDL*QS*Fv*Fz*U4QYST*Bn*NP*RI*RM*Bo*RJ*RN*RT*NT*ZH*Q0*Xv*Sm*NUTQ"
 };
 
 export const p3_91_personal__qualities = {
@@ -1725,7 +1815,10 @@ export const p3_91_personal__qualities = {
     ["consejo sincero", "sincere advice", "真诚的建议", "zhēn chéng de jiàn yì", "conselho sincero"],
     ["amigo leal", "loyal friend", "忠实的朋友", "zhōng shí de péng yǒu", "amigo leal"],
     ["cliente leal", "loyal customer", "忠实顾客", "zhōng shí gù kè", "cliente fiel"]
-  ]
+  ],
+  accentFree: {"0": "estupido", "3": "tacano", "11": "antipatico", "20": "que estupido", "21": "error estupido", "26": "demasiado tacano", "27": "tan tacano", "39": "decision valiente", "42": "parece antipatico", "43": "me cae antipatico", "45": "vision optimista", "47": "pronostico pesimista", "56": "se sincero"},
+  pinyinUnits: {},
+  distractors: "CFJRDTKOAFJRBKOQC*LDMNACJRHUpxGVYcLEGMACFROQSAIEGMNsEPMEPbKQSA*KHEMNKOSAACFJ*Mz4KOBDKOAGpxHYcoXfsGWfsGZHVcYz5HekmrDEMNEHVYvghyakmrFWXsHydvdvgihdvgihdvlIaeknqaaekrlqaeHVYcGUx3rlnaqLaeMWXfsaekaekmdghyHVYcGUp3gdv2Z5HV1HVY0HVYglnqRGUpSEMNZzHVEMNPGUpx"
 };
 
 export const p3_92_opening__abrir = {
@@ -1769,7 +1862,10 @@ export const p3_92_opening__abrir = {
     ["un abridor", "an opener", "开场白", "kāi chǎng bái", "um abridor"],
     ["hay que destapar", "must be uncovered", "必须揭开", "bì xū jiē kāi", "deve ser descoberto"],
     ["voy a destapar", "I'm going to uncover", "我要揭开", "wǒ yào jiē kāi", "eu vou descobrir"]
-  ]
+  ],
+  accentFree: {"4": "abris", "12": "tu abres", "14": "el abre", "18": "vosotros abris", "19": "lo abris"},
+  pinyinUnits: {},
+  distractors: "CBEFEFCGABFEIRMNBFGABCEGBEFA*MGYJDDGabHDIMLPAOKPNT*AMNBDTVPM*AOPCKLNVK*AQ*B/*GW*LLD*AR*CA*LM*CB*GY*LN*QONVLP*AU*CD*Ga*ItNPTL*AW*CF*Gd*LR*CG*Gc*RL*D6*MpH*XNU*GhcQSbIRXaIRX*Bl*Jr*OF*NT*NU*Od*ZE*Wo"
 };
 
 export const p3_93_closing__cerrar = {
@@ -1813,7 +1909,10 @@ export const p3_93_closing__cerrar = {
     ["ya está cerrado", "is already closed", "已经关闭", "yǐ jīng guān bì", "já está fechado"],
     ["la cerradura", "the lock", "锁", "suǒ", "a fechadura"],
     ["una cerradura", "a lock", "一把锁", "yī bǎ suǒ", "uma fechadura"]
-  ]
+  ],
+  accentFree: {"4": "cerrais", "12": "tu cierras", "14": "el cierra", "18": "vosotros cerrais", "19": "lo cerrais", "26": "esta cerrado", "27": "ya esta cerrado"},
+  pinyinUnits: {},
+  distractors: "CH*C4*C3FC*C4A*C4AHBIRKLTBFIBC*C4A*BH*QbCBAC*C4BDGBEcIGdLPADKPNVNBVOVPMLPYCDLNVK*Pu*D0*IL*S8D*PvNT*Pw*IN*S+*EUEN*PxRV*D4*Oa*EWNPLF*Fz*NO*P0*Wn*Bo*Qx*IW*NUOHDKUWdabcRUaUWZdJaRcJ*J2U"
 };
 
 export const p3_94_internet__web = {
@@ -1884,7 +1983,10 @@ export const p3_94_internet__web = {
     ["una carpeta", "a folder", "文件夹", "wén jiàn jiā", "uma pasta"],
     ["hay que actualizar", "need to update", "需要更新", "xū yào gēng xīn", "preciso atualizar"],
     ["voy a actualizar", "I will update", "我会更新", "wǒ huì gēng xīn", "vou atualizar"]
-  ]
+  ],
+  accentFree: {"2": "pagina", "10": "senal", "15": "publico", "23": "la pagina", "24": "una pagina", "39": "la senal", "40": "buena senal", "49": "es publico", "50": "muy publico"},
+  pinyinUnits: {},
+  distractors: "IJBKKTjCXDNkUZaCFbcYELMO*CVXZa*QtGbcAJBKABIKBTjCMpqFLrFO*M+tCD*Rf*C6vFxFLMz0FL*JK1FLoswyBKjCDTFL*Hz*PKWB*PLVBFYCGZX*MyCEaDGXZDGXcEHebEHe*Bn*Oc*RO*RS*BoHbc*Cm*OF*Qwh*Cn*Qxi*Xw*RUf*OF*Bl*RVgHfBKTC*YajCDJCDNFLMOKFLMSswyqLrMpsLrsMpqqrMSNGXZtNEYO*R7wEvOSoPy*ZLExPSo0QEYzQEY*J12R*BR*J21*BSR*I1*Jr4hSfdi"
 };
 
 export const p3_95_relationships = {
@@ -1958,7 +2060,10 @@ export const p3_95_relationships = {
     ["mi colega", "my colleague", "我的同事", "wǒ de tóng shì", "meu colega"],
     ["un confidente", "a confidant", "知己", "zhī jǐ", "um confidente"],
     ["mi confidente", "my confidant", "我的知己", "wǒ de zhī jǐ", "meu confidente"]
-  ]
+  ],
+  accentFree: {"0": "relacion", "20": "la relacion", "21": "una relacion"},
+  pinyinUnits: {},
+  distractors: "UGJaWEFODNHKCNHKFYcdEfBO*AlhAJ*CzijMklLTmnAG*RePCDqrITstHQCDHKBEFY*J/*Qg*CxKR*SP01Q23H*I345H67ILVA*CI*FAU*CH*YU*YqBcdfwklqEZaCbYCBYAGJZDBEdeE*I0fcEFcfaFdFce*A1hGVG*A1*A2gjHAGiHAGlIqrkIqrnJILmJIL*R5*J3*QU*Hd*J4*HeoBrLklqLkltMAGsMAG*CF*EZ*LR*U4*Q7*CG*RH*RL*Ua*NO*U4u*RN*UbVg*Q6*RM*AX*Iw*XL*AW*EZ*Gd1QAG30QA3RAG12RA5SAG4SAG7T*YI*Hi6Tkl"
 };
 
 export const p3_96_reading__leer = {
@@ -2002,7 +2107,10 @@ export const p3_96_reading__leer = {
     ["un lector", "a reader", "读者", "dú zhě", "um leitor"],
     ["la lectora", "the reader", "读者", "dú zhě", "o leitor"],
     ["una lectora", "a reader", "一个读者", "yí gè dú zhě", "um leitor"]
-  ]
+  ],
+  accentFree: {"4": "leeis", "12": "tu lees", "13": "que lees", "14": "el lee", "18": "vosotros leeis", "19": "que leeis"},
+  pinyinUnits: {},
+  distractors: "C*X7BFFGCAA*X7BF*PhBRIKLOBBGCABFCAJIYN*JOJH*J9HI*JO*J+LEOBKEOB*PqBDITHJPEKLB*PtHJN*Pu*AQ*B/*Ip*Gn*PvDT*Pw*CB*LN*ASNRXa*Py*AU*CD*GaLFDI*P0*Ws*AW*CFRTabc*J+H*MGd3YS*J9bIRaIdR*J+YdJcb*LV*J+"
 };
 
 export const p3_97_writing__escribir = {
@@ -2046,7 +2154,10 @@ export const p3_97_writing__escribir = {
     ["un escritor", "a writer", "作家", "zuò jiā", "um escritor"],
     ["hay que redactar", "you have to write", "你必须写", "nǐ bì xū xiě", "você tem que escrever"],
     ["voy a redactar", "I'm going to write", "我要写", "wǒ yào xiě", "eu vou escrever"]
-  ]
+  ],
+  accentFree: {"4": "escribis", "12": "tu escribes", "14": "el escribe", "18": "vosotros escribis", "19": "que escribis"},
+  pinyinUnits: {},
+  distractors: "CBEFEFCGABFER*SSBEBFGABCEGBEFIIYGKGAHaBEFGLAO*SZKAOMNBV*SbMBVLCKL*SdOUTY*SfS*Zb*OWD*SgV*SS*ShQ*OY*S+EPYD*SjPV*AUFMN*Sk*SlZcU*Sm*ZI*FtGHPTD*XOYWcbIDMaIDM*OF*G/*Vf*NT*G+*Vg*Cj*NU"
 };
 
 export const p3_98_government__politics = {
@@ -2120,7 +2231,10 @@ export const p3_98_government__politics = {
     ["una nación", "a nation", "一个国家", "yí gè guó jiā", "uma nação"],
     ["el referéndum", "the referendum", "公投", "gōng tóu", "o referendo"],
     ["un referéndum", "a referendum", "全民公投", "quán mín gōng tóu", "um referendo"]
-  ]
+  ],
+  accentFree: {"5": "politico", "6": "politica", "7": "eleccion", "11": "constitucion", "17": "pais", "18": "nacion", "19": "referendum", "30": "el politico", "31": "un politico", "32": "la politica", "33": "politica exterior", "34": "la eleccion", "35": "una eleccion", "42": "la constitucion", "43": "nuestra constitucion", "54": "el pais", "55": "un pais", "56": "la nacion", "57": "una nacion", "58": "el referendum", "59": "un referendum"},
+  pinyinUnits: {},
+  distractors: "UVDECWXYBY*Y0WEabADcAFGefAFgADiADEoJNR*BERIK*W1*W3JRqWXYsADE*Ig*RfuSwxBCQyz0P0yzJIKo*HD*Em4N67BCVABCUABCXBYCWZBYZCWXXYCWbDcEadDcdEabbcEjfFgGeFgGGefFqZrLjH*Md*WNi*WOHd*IV*Qw*Lw*QT*IW*Qx*Lv*RH*H1nJNmJNSIJNR*VkoNSLZWXqhZLMt*G8BsMLW*R7NvAuBCOxOLWwOLWzP0Qy1P01Qyzz0Qy*NZ3RN*Na2RN*Em*HD5*FA*Em*HX4*FA7TLW6TLW"
 };
 
 export const p3_99_showing__mostrar = {
@@ -2164,7 +2278,10 @@ export const p3_99_showing__mostrar = {
     ["voy a exhibir", "I'm going to exhibit", "我要展示", "wǒ yào zhǎn shì", "Vou expor"],
     ["hay que exponer", "must be exposed", "必须暴露", "bì xū bào lù", "deve ficar exposto"],
     ["voy a exponer", "I am going to expose", "我要揭露", "wǒ yào jiē lù", "eu vou expor"]
-  ]
+  ],
+  accentFree: {"4": "mostrais", "12": "tu muestras", "14": "el muestra", "18": "vosotros mostrais", "19": "lo mostrais"},
+  pinyinUnits: {},
+  distractors: "C*ICBFFCAMABFOR*IqEGTBFABCAVACIJ*CT*CO*CS*CPACGJ*LfACGLPAOKAOPNBVLMBVLPCKLVKOC*OW*UyS*IpDTXb*OY*U0Q*N7ERMNV*Oa*U2*EWPFMN*NO*Fv*Fz*U4*IW*Qx*YWR*OF*Xv*Cm*G/*Cj*XwHU*TGc*QTU*Sm*XqRX*Lw*Lx*Oc*Sr*LvRXb"
 };
 
 export const p3_100_explaining__explicar = {
@@ -2208,5 +2325,8 @@ export const p3_100_explaining__explicar = {
     ["quiero entender", "I want to understand", "我想了解", "wǒ xiǎng liǎo jiě", "Eu quero entender"],
     ["la comprensión", "understanding", "理解", "lǐ jiě", "compreensão"],
     ["buena comprensión", "good understanding", "很好的理解", "hěn hǎo de lǐ jiě", "bom entendimento"]
-  ]
+  ],
+  accentFree: {"4": "explicais", "7": "explicacion", "9": "comprension", "12": "tu explicas", "14": "el explica", "18": "vosotros explicais", "19": "lo explicais", "24": "la explicacion", "25": "una explicacion", "28": "la comprension", "29": "buena comprension"},
+  pinyinUnits: {},
+  distractors: "CBFGFGCAABFGBREFBTDFBGCABFCA*A/Y*BYFBFGAcHTDLPAOKAOPNBVLMBVLPCKLVKOC*OWS*S8*XjDTVP*OYQ*S+*INERVPV*OaPYPFMN*TCZab*RH*Od*ZI*ZK*BYZH*A/*BXYH*BY*Sr*IX*ZJWWZaUJdUYcJSQ"
 };
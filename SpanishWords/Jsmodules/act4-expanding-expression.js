@@ -81,7 +81,10 @@ export const p4_101_law__legal = {
     ["una demanda", "a lawsuit", "诉讼", "sù sòng", "um processo"],
     ["el veredicto", "the verdict", "判决", "pàn jué", "o veredicto"],
     ["un veredicto", "a verdict", "判决", "pàn jué", "um veredicto"]
-  ]
+  ],
+  accentFree: {"9": "prision", "10": "carcel", "38": "la prision", "39": "en prision", "40": "la carcel", "41": "en la carcel"},
+  pinyinUnits: {},
+  distractors: "BUVJAWJPDGLECGLE*D8cdHefNODLCE*N5ijEklEHmnABoEHIDGCEs*MC*WUtuFORwFNRyzAB0EHI2FNO4ABJ67MUVAW*OZUXAWXBUVVW*QgBZCEHYCbEbDABaZFNdEFNcEFNfFXpeFXp*H2GhA*H3gpMj*OKHFi*OLHFlIFNkIFNnJ*Ls*HwmJMTKpFNohXerLABqFNOtM*MU*W2s*MV*W3MNvXeuNsxOxXewOsvzP*H0*U5yP*H1M1QFN0bQMR3*F/X2Rsv5SMT4SXe7Tsv6Tsv"
 };
 
 export const p4_102_remembering__recordar = {
@@ -125,7 +128,10 @@ export const p4_102_remembering__recordar = {
     ["buenas memorias", "good memories", "美好的回忆", "měi hǎo de huí yì", "boas lembranças"],
     ["la memoria", "memory", "记忆", "jì yì", "memória"],
     ["buena memoria", "good memory", "好记性", "hǎo jì xìng", "boa memória"]
-  ]
+  ],
+  accentFree: {"4": "recordais", "12": "tu recuerdas", "14": "el recuerda", "18": "vosotros recordais", "19": "lo recordais"},
+  pinyinUnits: {},
+  distractors: "CHBFFHCAABF*NiRE*FKGTDG*FLBCHAACIBBAFCJ*FIACI*FJcALPAOKPNVNBVOVPMLPCKLLNVK*FXS*OC*OeDT*FYN*FZQ*OE*OgERMNVY*OGNNPLF*Fd*OI*OkU*Fe*No*GV*RLNLVKYUWXcIMNdaUWJaI*CVbcRY"
 };
 
 export const p4_103_forgetting__olvidar = {
@@ -169,7 +175,10 @@ export const p4_103_forgetting__olvidar = {
     ["soy olvidadizo", "I'm forgetful", "我很健忘", "wǒ hěn jiàn wàng", "Estou esquecido"],
     ["los olvidos", "the forgetfulness", "健忘", "jiàn wàng", "o esquecimento"],
     ["muchos olvidos", "many lapses", "许多健忘", "xǔ duō jiàn wàng", "muitos esquecimentos"]
-  ]
+  ],
+  accentFree: {"4": "olvidais", "12": "tu olvidas", "14": "el olvida", "18": "vosotros olvidais", "19": "lo olvidais"},
+  pinyinUnits: {},
+  distractors: "CJBFFGJCABFGBJRHBJTKBGCJBFCJBGDEabTcBAFGLPAEKPAENBVOVPMTPCEKNVKL*XsS*I+*KSDNTc*XuQ*JA*KUNEcRV*Xw*JC*KWNPFMY*Ej*NwS*Ek*NxRIW*JG*SP*EjH*JHURbIdUaIdUNTRVcabU"
 };
 
 export const p4_104_science__terms = {
@@ -240,7 +249,10 @@ export const p4_104_science__terms = {
     ["una variable", "a variable", "变量", "biàn liàng", "uma variável"],
     ["la constante", "the constant", "常数", "cháng shù", "a constante"],
     ["una constante", "a constant", "一个常数", "yí gè cháng shù", "uma constante"]
-  ]
+  ],
+  accentFree: {"0": "cientifico", "1": "cientifica", "3": "investigacion", "5": "teoria", "6": "hipotesis", "10": "metodo", "11": "tecnologia", "12": "innovacion", "16": "observacion", "19": "el cientifico", "20": "un cientifico", "21": "la cientifica", "22": "una cientifica", "25": "la investigacion", "26": "una investigacion", "29": "la teoria", "30": "una teoria", "31": "la hipotesis", "32": "una hipotesis", "39": "el metodo", "40": "un metodo", "41": "la tecnologia", "42": "nueva tecnologia", "43": "la innovacion", "44": "una innovacion", "51": "la observacion", "52": "una observacion"},
+  pinyinUnits: {},
+  distractors: "BTUVAVTUXY*Ng*O1ZaPWbcy0dKjkfgHJhi*O8*HYFKjklmGHnoFjpABMr*LtsA*Gb*Gd*PA*OYGHJS*OYABLz0Cf1dno3*Ta4GUAVBTWAVWBTUUVBTYC*O1*NgXC*O1DaDqvZDbccEaxbEaxeFRndFGHgGCQfGTUiH*H0ChH*H1Ck*N5*LuIj*LvIFJmCQlJTUoKRdnKRdLqTUpLZvsM*OM*QGrM*ON*QHuN*GbGtN*GbG*RLw*UxZO*QBDW*Oq*VFy*Wc*Or*VGPE0Q*QG*LszQ*QH*Lt2RAB1RCQ4SCQ3STU"
 };
 
 export const p4_105_learning__aprender = {
@@ -284,7 +296,10 @@ export const p4_105_learning__aprender = {
     ["un alumno", "a student", "学生", "xué shēng", "um estudante"],
     ["el aprendizaje", "learning", "学习", "xué xí", "aprendizagem"],
     ["buen aprendizaje", "good learning", "好好学习", "hǎo hǎo xué xí", "bom aprendizado"]
-  ]
+  ],
+  accentFree: {"4": "aprendeis", "11": "aprendo rapido", "12": "tu aprendes", "13": "como aprendes", "14": "el aprende", "18": "vosotros aprendeis", "19": "que aprendeis"},
+  pinyinUnits: {},
+  distractors: "CBFGFGCHABFGBEFGBHDFBGCHBFCHBFGAab*SaAcHPDAOCEUVcNBOFGMBTJCKBFFJDMS*Ig*I+*OeSdQWQ*Ii*JA*OgEZNJ*IkLVcLUcNXLUV*NqWLUZHOcYHDMbIBFaIBFJdYLcJZR"
 };
 
 export const p4_106_teaching__ensear = {
@@ -328,7 +343,10 @@ export const p4_106_teaching__ensear = {
     ["un maestro", "a teacher", "老师", "lǎo shī", "um professor"],
     ["el instructor", "the instructor", "导师", "dǎo shī", "o instrutor"],
     ["un instructor", "an instructor", "导师", "dǎo shī", "um instrutor"]
-  ]
+  ],
+  accentFree: {"0": "enseno", "1": "ensenas", "2": "ensena", "3": "ensenamos", "4": "ensenais", "5": "ensenan", "6": "ensenar", "7": "ensenanza", "10": "yo enseno", "11": "te enseno", "12": "tu ensenas", "13": "me ensenas", "14": "el ensena", "15": "nos ensena", "16": "nosotros ensenamos", "17": "les ensenamos", "18": "vosotros ensenais", "19": "que ensenais", "20": "ellos ensenan", "21": "nos ensenan", "22": "quiero ensenar", "23": "voy a ensenar", "24": "la ensenanza", "25": "buena ensenanza"},
+  pinyinUnits: {},
+  distractors: "CBFGFGCAABFGBHEFBKLOBGCABFC*GjFYDBabBFcd*U+VLAEOKAEONBLOMBLOCEKLVKOCS*I+*KS*KwDNUcQ*JA*KU*KyEXYJV*JC*KW*K0PUFJ*MQ*Ok*MuR*JzTYJHTXJYWRSbIDHaIDHdJ*U9RcJ*U+R"
 };
 
 export const p4_107_environment__nature = {
@@ -402,7 +420,10 @@ export const p4_107_environment__nature = {
     ["voy a conservar", "I will keep", "我会保留", "wǒ huì bǎo liú", "Eu vou continuar"],
     ["hay que preservar", "must be preserved", "必须保留", "bì xū bǎo liú", "deve ser preservado"],
     ["voy a preservar", "I will preserve", "我会保存", "wǒ huì bǎo cún", "eu vou preservar"]
-  ]
+  ],
+  accentFree: {"1": "contaminacion", "4": "plastico", "6": "carton", "7": "energia", "8": "petroleo", "12": "eolica", "22": "la contaminacion", "23": "sin contaminacion", "28": "el plastico", "29": "sin plastico", "32": "el carton", "33": "de carton", "34": "la energia", "35": "mucha energia", "36": "el petroleo", "37": "sin petroleo", "42": "energia solar", "44": "energia eolica", "45": "turbina eolica", "46": "energia nuclear", "49": "esta limpio", "51": "esta sucio"},
+  pinyinUnits: {},
+  distractors: "UEIaWXVsYSTi*WmaFG*JUcAIefDG*SoghDiNQAkAEaLPmDopjqPmDFDFGOHQADDFGMLmDF0*SdHN*I0*QwDFT*G8*NECS*O8*XECA*Q3ckUBstBXp4WBp4CbdlYouvDAEIYdlKEd*JvUcEYbfFAEeFAEhGAEgGAEHCSTiKq2IlUckIYbLPDF*N4DFGKpZuoKW4uKj2UckxBVt5BVs5qZovZou1OCSTUckrAEIaCSTiQCSTZouv*JF*Nw*VD*Wa*OJ*Bx*Nx*Ol6*Nm*VF*GX7*Nn*VG*Dm4*BT*RL*No5*RM*Np*Wd"
 };
 
 export const p4_108_changing__cambiar = {
@@ -446,7 +467,10 @@ export const p4_108_changing__cambiar = {
     ["una transformación", "a transformation", "转变", "zhuǎn biàn", "uma transformação"],
     ["la modificación", "the modification", "修改", "xiū gǎi", "a modificação"],
     ["una modificación", "a modification", "修改", "xiū gǎi", "uma modificação"]
-  ]
+  ],
+  accentFree: {"4": "cambiais", "8": "transformacion", "9": "modificacion", "12": "tu cambias", "14": "el cambia", "18": "vosotros cambiais", "19": "lo cambiais", "26": "la transformacion", "27": "una transformacion", "28": "la modificacion", "29": "una modificacion"},
+  pinyinUnits: {},
+  distractors: "CBFGFGCAABFGBREFBTKLBGCABFCAYZRJabcWcdUHLPAEKPNVNBVOVPMLPCEKLNVK*XsS*OC*KwDNTV*XuQ*OE*KyNERVV*OG*Xw*K0NPLF*Xy*OI*Ok*QA*Ux*Ej*RJ*UzZHWXYHWXbISQaIQSdJIWcJ*WrI"
 };
 
 export const p4_109_improving__mejorar = {
@@ -490,7 +514,10 @@ export const p4_109_improving__mejorar = {
     ["buen progreso", "good progress", "良好的进展", "liáng hǎo de jìn zhǎn", "bom progresso"],
     ["no hay que empeorar", "no need to get worse", "没必要变得更糟", "méi bì yào biàn dé gèng zāo", "não precisa piorar"],
     ["puede empeorar", "can get worse", "可能会变得更糟", "kě néng huì biàn dé gèng zāo", "pode piorar"]
-  ]
+  ],
+  accentFree: {"4": "mejorais", "12": "tu mejoras", "13": "como mejoras", "14": "el mejora", "18": "vosotros mejorais", "19": "como mejorais"},
+  pinyinUnits: {},
+  distractors: "CBFGFGC*BEABFGBR*A/EBIJKBGCABFCAYZ*M2TaEJKEIKOAEIJVWXdBOFGTRHPCEIJOUaD*BM*MKS*QXD*BN*MLN*BO*MMQ*QZNEHUP*MO*QbHLYZW*BS*MQ*QdL*No*Ux*BT*MRZHVLYHVLI*GNbPaIHT*OsX*M0SLWXH"
 };
 
 export const p4_110_media__news = {
@@ -558,7 +585,10 @@ export const p4_110_media__news = {
     ["voy a comunicar", "I will communicate", "我会沟通", "wǒ huì gōu tōng", "Vou comunicar"],
     ["la prensa", "the press", "媒体", "méi tǐ", "a imprensa"],
     ["en la prensa", "in the press", "在新闻界", "zài xīn wén jiè", "na imprensa"]
-  ]
+  ],
+  accentFree: {"2": "periodico", "5": "articulo", "22": "el periodico", "23": "un periodico", "28": "el articulo", "29": "un articulo"},
+  pinyinUnits: {},
+  distractors: "*LU*LV*K/RMARDWX*X+G*OzY*WNEaDNUcdLPefCQghKOJijkIkijZmYDopFPBARDsDEUHKZbFL0CCGSV0ABDTACGSIWXBVDEUCGQXCITWCITZD*Wo*JeKY*Jf*WpbE*Q9*A2a*W3EHdFHKcFHKfGITeGIThHWJgHXJjIJkiIlJlJijkjJinKYZmKZipL*FhHoLHKrMDEqMDEtNCGsNHKvlykOkwi*VF*BT*Oq*Fe*VG*OrP*Lr*FA*Ej*El*Uz*Xz*Ek*OJQR1FL0*UmHK"
 };
 
 export const p4_111_trying__intentar = {
@@ -599,7 +629,10 @@ export const p4_111_trying__intentar = {
     ["voy a tratar de hacerlo", "I'll try to do it", "我会努力去做", "wǒ huì nǔ lì qù zuò", "Vou tentar fazer"],
     ["ensayar la obra", "rehearse the play", "排练戏剧", "pái liàn xì jù", "ensaia a peça"],
     ["vamos a ensayar mañana", "let's rehearse tomorrow", "明天我们排练一下", "míng tiān wǒ men pái liàn yī xià", "vamos ensaiar amanhã"]
-  ]
+  ],
+  accentFree: {"4": "intentais", "14": "el lo intenta mucho", "17": "lo intentais con ganas", "18": "siempre intentais ayudar", "22": "hay que intentar mas", "26": "vamos a ensayar manana"},
+  pinyinUnits: {},
+  distractors: "*CFC*PABFGC*OYABFGBEFGBDFGBGC*OYBF*OYC*Ub*YNAC*DVACBOXUWLMNUKMNUKLNUKLMUJXUWVRTWSRTYTYaPQRTYMRYaLJKMPRTW*Oq*VFJOJOUWRTaPKLMNRTYP"
 };
 
 export const p4_112_getting__achieving__conseguir = {
@@ -640,7 +673,10 @@ export const p4_112_getting__achieving__conseguir = {
     ["adquirir conocimientos", "acquire knowledge", "获取知识", "huò qǔ zhī shí", "adquirir conhecimento"],
     ["conquistar el corazón", "conquer the heart", "征服心", "zhēng fú xīn", "conquiste o coração"],
     ["conquistar nuevos mercados", "conquer new markets", "征服新市场", "zhēng fú xīn shì chǎng", "conquistar novos mercados"]
-  ]
+  ],
+  accentFree: {"4": "conseguis", "11": "como lo consigues", "13": "el lo consigue todo", "14": "ella consigue todo facilmente", "17": "como lo conseguis", "18": "siempre conseguis buenos resultados", "19": "ellos consiguen trabajo rapido", "21": "dificil de conseguir", "25": "conquistar el corazon"},
+  pinyinUnits: {},
+  distractors: "CHBEFCEGBFAHEGIBBGFCBCEGE*NE*D/BCABE*YMBDENVLPYQWaRNJVTOUQJLRVTMQWXZVJWaKOLNJVUMTOMOQUMSTOJPXZQaKOPZVJKPXZPXVJQWKO"
 };
 
 export const p4_113_geography = {
@@ -717,7 +753,10 @@ export const p4_113_geography = {
     ["polo norte", "north pole", "北极", "běi jí", "pólo norte"],
     ["la latitud", "latitude", "纬度", "wěi dù", "latitude"],
     ["alta latitud", "high latitude", "高纬度", "gāo wěi dù", "alta latitude"]
-  ]
+  ],
+  accentFree: {"2": "oceano", "5": "region", "10": "peninsula", "17": "tropico", "25": "el oceano", "26": "un oceano", "31": "la region", "32": "una region", "41": "la peninsula", "42": "una peninsula", "55": "el tropico", "56": "en el tropico"},
+  pinyinUnits: {},
+  distractors: "JTIMXYQbZaFHbLZadORSf*K+CHh*WUiKjkCFMNACATIMpqGdrsDZINACIMACxERS*L/*R30C12Bb3EOS5EORAJIM9EORWACFVACFYBciXBciaCDLZCDLDc*UpBbDXYeEGKdEBQgF*LSDf*LT*Lt*OniG*W2ph*W3G*MVkHDLjHDL*Ag*Ne*WoI*AhlGKoJCFnEORqKh4pKXYsL*Qh*AirL*AjBMuEOtGKdwNEOvNEOyO*EHGxOBQ0PGKPDLZ2QXY1QXYR4*Rx*U53hp6S6*Ooj5hp4TCFHGKdgU+GK9hp4"
 };
 
 export const p4_114_seeming__appearing__parecer = {
@@ -761,7 +800,10 @@ export const p4_114_seeming__appearing__parecer = {
     ["es parecido", "is similar", "类似", "lèi sì", "é semelhante"],
     ["la apariencia", "the appearance", "外观", "wài guān", "a aparência"],
     ["buena apariencia", "good appearance", "良好的外表", "liáng hǎo de wài biǎo", "boa aparência"]
-  ]
+  ],
+  accentFree: {"4": "pareceis", "12": "tu pareces", "14": "el parece", "18": "vosotros pareceis", "19": "os pareceis"},
+  pinyinUnits: {},
+  distractors: "CKLBFGCEBFGABHEIBTIOBGCVBFCH6BGDbEOPcTXbLADHKPADNBVOMVPBPCEIOLNV*DBS*Kw*OeDT*RqU*DDQ*Ky*OgEJXb*DF*K0*Oi*RtNPFMY*K2*RvRGZJTWdSQXHRUbIJRIaJTJ*K6*Q1*W2cJYS"
 };
 
 export const p4_115_staying__meeting__quedar = {
@@ -805,7 +847,10 @@ export const p4_115_staying__meeting__quedar = {
     ["hay que reunirse", "we have to meet", "我们必须见面", "wǒ men bì xū jiàn miàn", "temos que nos encontrar"],
     ["para verse", "to be seen", "待见", "dài jiàn", "para se ver"],
     ["hay que verse", "must be seen", "必须被看到", "bì xū bèi kàn dào", "deve se ver"]
-  ]
+  ],
+  accentFree: {"4": "quedais", "12": "tu quedas", "14": "el queda", "18": "vosotros quedais", "19": "os quedais"},
+  pinyinUnits: {},
+  distractors: "CJBFFGCAABFGBHIMBTKLBGCABFC*D+BGDIDHMNACBFLAEOKPAENBDHMVPBPCEKVLON*KS*MK*Oe*MoDUZd*KU*MM*Og*MqEcDH*KW*MO*OG*OiPNFDXaRU*EjY*Lo*MRX*By*EjdHRUdcIWXdYSQ*IXTDHRUZW"
 };
 
 export const p4_116_art__culture = {
@@ -873,7 +918,10 @@ export const p4_116_art__culture = {
     ["un retrato", "a portrait", "肖像", "xiào xiàng", "um retrato"],
     ["el paisaje", "the landscape", "风景", "fēng jǐng", "a paisagem"],
     ["un paisaje", "a landscape", "风景", "fēng jǐng", "uma paisagem"]
-  ]
+  ],
+  accentFree: {"4": "galeria", "5": "exposicion", "8": "clasico", "9": "contemporaneo", "10": "disenar", "13": "artistica", "26": "la galeria", "27": "una galeria", "28": "la exposicion", "29": "una exposicion", "34": "muy clasico", "35": "es clasico", "36": "muy contemporaneo", "37": "es contemporaneo", "38": "hay que disenar", "39": "voy a disenar", "44": "es artistica", "45": "obra artistica"},
+  pinyinUnits: {},
+  distractors: "STBEUAEH*SkWXeqoLYaABHcdVbCeABhABE*DxjABlkdm*DVABEMDoALqWXsADS*YN*Ucuv*M+wxA*N5yzA01ABTA*F9*WoS*F+*WpAVBo*NeU*NfBFXCMAWCMAZDoqY*NdDqbE*RRDa*RSEFdFZJcFJmfGCAeABEhHFVHgDNjIFVI*EJiDlJprJkpr*MR*JF*Wc*Lo*DmYsFDLYUrJdlDMYopJdlNYnFsNJdv*U/O*K4uO*LlDx*NaP*K4w*NbP*NVz*OKQDy*OLQD1R*K4D0RDN"
 };
 
 export const p4_117_arriving__llegar = {
@@ -917,7 +965,10 @@ export const p4_117_arriving__llegar = {
     ["tras el arribo", "after arrival", "抵达后", "dǐ dá hòu", "após a chegada"],
     ["estoy retrasado", "I'm late", "我迟到了", "wǒ chí dào le", "Estou atrasado"],
     ["va retrasado", "is late", "迟到了", "chí dào le", "está atrasado"]
-  ]
+  ],
+  accentFree: {"4": "llegais", "12": "tu llegas", "13": "cuando llegas", "14": "el llega", "18": "vosotros llegais", "19": "cuando llegais"},
+  pinyinUnits: {},
+  distractors: "CBFGFGC*ETABFGBRMVBHKLBGCABFCABFGCaBFGd2*Jc*YNLPAEKPVABDVaTrbUPCEHLVKO*I+*MK*Oe*OCDVLP*JA*MM*Og*OENx*TkX*JC*MO*OidPLFD*U2*Lp*Nx*OlTNbcZH*AWVYHRWIDMVaNTUSTXNJUNR"
 };
 
 export const p4_118_happening__pasar = {
@@ -961,7 +1012,10 @@ export const p4_118_happening__pasar = {
     ["una ocurrencia", "an occurrence", "发生", "fā shēng", "uma ocorrência"],
     ["el acontecimiento", "the event", "事件", "shì jiàn", "o evento"],
     ["un acontecimiento", "an event", "一个事件", "yí gè shì jiàn", "um evento"]
-  ]
+  ],
+  accentFree: {"4": "pasais", "12": "tu pasas", "13": "cuando pasas", "14": "el pasa", "15": "que pasa", "18": "vosotros pasais", "19": "cuando pasais", "21": "cuando pasan"},
+  pinyinUnits: {},
+  distractors: "CBFGFGCAABFG*QLH*MbB*QMB*McHBGCABFCA*UcBDFabUWcdSQL*QR*MiAK*QS*MjA*QT*MkBDVTIU*QV*MmCEDMEH*QX*Mo*MK*Oe*QY*MpD*ML*QZ*Mq*MM*OgN*TkV*KV*Qb*Ms*MO*OiNTIU*RvIUZYDMP*U/HZXYIUWbI*Is*Q1aI*Q2JdJQScJQS"
 };
 
 export const p4_119_religion__faith = {
@@ -1035,7 +1089,10 @@ export const p4_119_religion__faith = {
     ["con devoción", "with devotion", "虔诚地", "qián chéng dì", "com devoção"],
     ["la piedad", "piety", "怜悯", "lián mǐn", "piedade"],
     ["con piedad", "with piety", "怜悯地", "lián mǐn dì", "com piedade"]
-  ]
+  ],
+  accentFree: {"0": "religion", "10": "iman", "13": "oracion", "18": "devocion", "20": "la religion", "21": "una religion", "40": "el iman", "41": "un iman", "46": "la oracion", "47": "una oracion", "56": "la devocion", "57": "con devocion"},
+  pinyinUnits: {},
+  distractors: "*HWUFGCIKMBLOPaNYwcJTWeAGQgAFQijarBKMC*Fm*UgmnBIMC*UXCOP*UdBIK*OW*WRuDPCLBOCLBAFGS230f4AFG*Sm6EJV*HwAdU*HxAb*FlXBE*FlWBZZCDNYXAFDbHraVijEdAFc*UkUeFf*NsUeFh1GhUdgGf1jHVbiHVblIEJkIEJn*VHJAmJAFpKEJoKEJ*U1*MR*ST*Wc*U2*Ol*SU*Wd*VB*VDq*MR*VC*Mv*Ol*VE*N6v*Om*Wwu*N6*On*Wxx*CbODw*CczO*Ne*R5zP*NfxyARfh1*DmQfhR30f2R0fS*Ws5*QG4SVbTAFG6THa"
 };
 
 export const p4_120_letting__leaving__dejar = {
@@ -1079,7 +1136,10 @@ export const p4_120_letting__leaving__dejar = {
     ["una renuncia", "a resignation", "辞职", "cí zhí", "uma demissão"],
     ["hay que autorizar", "must be authorized", "必须获得授权", "bì xū huò dé shòu quán", "deve ser autorizado"],
     ["voy a autorizar", "I am going to authorize", "我要授权", "wǒ yào shòu quán", "eu vou autorizar"]
-  ]
+  ],
+  accentFree: {"4": "dejais", "12": "tu dejas", "14": "el deja", "18": "vosotros dejais", "19": "lo dejais"},
+  pinyinUnits: {},
+  distractors: "CBFGFGCAABFG*QLBRM*QMBTKBGCABFCAYITDaHTDmRHILP*QRAKP*QSNN*QTBDVPM*QUP*QVCELNVK*QX*Kw*Oe*I+*QYDN*Kx*QZ*Ky*Og*JA*QaNEH*Qb*K0*Oi*JCNP*QcL*Qd*Ok0*Fd*Lo*Nw*U1*STHZ*VHUYHWXbI*AsUa*AtIW4*BT*GV*Uz5JSQ"
 };
 
 export const p4_121_using__usar = {
@@ -1123,7 +1183,10 @@ export const p4_121_using__usar = {
     ["voy a utilizar", "I'm going to use", "我将使用", "wǒ jiāng shǐ yòng", "Vou usar"],
     ["hay que emplear", "you have to use", "你必须使用", "nǐ bì xū shǐ yòng", "você tem que usar"],
     ["voy a emplear", "I'm going to employ", "我要雇用", "wǒ yào gù yòng", "vou empregar"]
-  ]
+  ],
+  accentFree: {"4": "usais", "12": "tu usas", "13": "que usas", "14": "el usa", "18": "vosotros usais", "19": "que usais"},
+  pinyinUnits: {},
+  distractors: "CBFGFGCAABFG*KjBRMKLOPBGCABFCAIYRTHRTXNDHILEOPKPEO*KsBDVTJDHEKLPLVEK*Kw*Rp*MK*Oe*KxDHI*Ky*Rr*MM*OgNHIR*K0*Rt*MO*OiPLFD*MQ*Ok*QA*Qd*Lr*VC*WbHHWUdYScQ*MW*Nw*ST*We*MX*Nx*SU*Wf*No*Ux*RJ*STWYbS"
 };
 
 export const p4_122_tools__building = {
@@ -1197,7 +1260,10 @@ export const p4_122_tools__building = {
     ["un motor", "an engine", "发动机", "fā dòng jī", "um motor"],
     ["hay que lijar", "you have to sand", "你必须打磨", "nǐ bì xū dǎ mó", "você tem que lixar"],
     ["voy a lijar", "I'm going to sand", "我要打磨", "wǒ yào dǎ mó", "vou lixar"]
-  ]
+  ],
+  accentFree: {"17": "maquina", "54": "la maquina", "55": "una maquina"},
+  pinyinUnits: {},
+  distractors: "UVhnWXDJFKSTabBJcdV0CKSTINPR*SY*Sm*X/i*JbklGmBDQCFSTq*SlrO+*X/*Iw*SkuvGI*G8*D/Lj*XE*XA*VQ*W/BDJf2GINCFKTCFKSVAxyUAE0XBabWBbaZCGIYCGIbDWXaDXWdEwVcEwVfFGIeBDJhGWXgAnqjHBDitHL*J8lI*Ji*J9kI*JjnJ*JkWm*JlJA*H2*LwpK*LxoBDL*B6r*O1qL*O11*A+tMBsj*QD*AbvNLOuNLO*ElxEV*Em*OJOU*Fe*Ux*BT*RL*Uy*RM*Wd*Lp*U1*DI*Wc*Lo*U2*KY*Wd*Lp3R*LcL2RWX5SGI4SGI*MR*Lo*ST*U1*Qe*Lp*Ol*SU"
 };
 
 export const p4_123_telling__counting__contar = {
@@ -1241,7 +1307,10 @@ export const p4_123_telling__counting__contar = {
     ["una narración", "a narrative", "叙述", "xù shù", "uma narrativa"],
     ["el chisme", "the gossip", "八卦", "bā guà", "a fofoca"],
     ["un chisme", "a gossip", "八卦", "bā guà", "uma fofoca"]
-  ]
+  ],
+  accentFree: {"4": "contais", "8": "narracion", "12": "tu cuentas", "14": "el cuenta", "18": "vosotros contais", "19": "lo contais", "26": "la narracion", "27": "una narracion"},
+  pinyinUnits: {},
+  distractors: "CBF*SkFCAMABF*NCRKLOTBFABCAV*EU*HZ*NAA*AH*Cb*JcY*Ls*LtakcdACLADOKADONBV*I6MB*A9VCDKLVKOCs*Xs*I+*KSD*R6Ttu*Xu*JA*KUE*R7Rv*JCwV*E9FMNPy*Xy*E/*MQ*Ek*Wdz*VE*AiZ*J+H*AjY*J/HbI*Lt0a1*LtIdJDKcJDK"
 };
 
 export const p4_124_creating__crear = {
@@ -1285,7 +1354,10 @@ export const p4_124_creating__crear = {
     ["voy a inventar", "I'm going to invent", "我要发明", "wǒ yào fā míng", "Vou inventar"],
     ["hay que elaborar", "you have to elaborate", "你必须详细说明", "nǐ bì xū xiáng xì shuō míng", "você tem que elaborar"],
     ["voy a elaborar", "I'm going to elaborate", "我将详细说明", "wǒ jiāng xiáng xì shuō míng", "vou elaborar"]
-  ]
+  ],
+  accentFree: {"3": "creais", "6": "creacion", "10": "tu creas", "11": "que creas", "12": "el crea", "16": "vosotros creais", "17": "lo creais", "22": "la creacion", "23": "una creacion"},
+  pinyinUnits: {},
+  distractors: "EFBDAEFDH*RcAPARMNAFBDAEBD*LLWIJCFYZ*Gh*Gc*Gg*Uf*VwGIL*RlACHGIJRN*RnBDTMBD*Rp*Kw*MK*QXC*Kx*ML*QY*Ky*MM*QZ*JADGIJ*Rt*K0*MO*QbNECH*MQ*Qd*Mu*OI*Lp*U2*Lr*VC*LsXG*Wi*LtW*Wj*WxZH*IK*HjYHPV*VF*SN*Cp*GV*VG*SO*Cq*GW*Fe*No*Ux*Lq*Np*Uy*Vw*Lr"
 };
 
 export const p4_125_personality__types = {
@@ -1359,7 +1431,10 @@ export const p4_125_personality__types = {
     ["tan ingenuo", "so naive", "太天真了", "tài tiān zhēn le", "tão ingênuo"],
     ["zorro astuto", "cunning fox", "狡猾的狐狸", "jiǎo huá de hú lí", "raposa astuta"],
     ["plan astuto", "cunning plan", "狡猾的计划", "jiǎo huá de jì huà", "plano astuto"]
-  ]
+  ],
+  accentFree: {"0": "caracter", "1": "timido", "20": "tiene caracter", "21": "caracter fuerte", "22": "nino timido", "23": "es timido", "32": "sonador idealista", "35": "temperamento artistico", "55": "nino curioso"},
+  pinyinUnits: {},
+  distractors: "FKMNXLTDJYnZIBLTGOQA*FoGAKFEOQ*B6*Ngi*NhDBLTCnmYAFMN*SWMBTLAFKAFKM*B/*EAxEAFKMEGOASABF*CF*GbRABLDIbt0CYdn157EGBAFKnCZJmYCnlr23Ut0CZeikVYn1Zcik*F9FCHozZcjsgoH*CPZchsgoZceiar23ZnJYYJmCgzZcKCHJCHJfal23jhgoUb0CvNCHuNCHxZceOCHJZceigoZc1QUb0VYd3alr2alrCHJfSW7Ealr2W5EG"
 };
 
 export const p4_126_going__up__subir = {
@@ -1403,7 +1478,10 @@ export const p4_126_going__up__subir = {
     ["en ascenso", "rising", "上升", "shàng shēng", "subindo"],
     ["la elevación", "the elevation", "海拔", "hǎi bá", "a elevação"],
     ["una elevación", "an elevation", "海拔", "hǎi bá", "uma elevação"]
-  ]
+  ],
+  accentFree: {"4": "subis", "9": "elevacion", "12": "tu subes", "14": "el sube", "18": "vosotros subis", "19": "lo subis", "28": "la elevacion", "29": "una elevacion"},
+  pinyinUnits: {},
+  distractors: "CBEFEFCGABFERIMNBFGABCEGBEFAGYKLmabDc*LQ*OW*WKLP*MiAKP*MjNNBDITVPMPCHKLNVK*Mo*Kw*MK*OeD*MpNT*Mq*RrQdNVLP*Ms*RtVJNPTL*MucUd*Wb*MvJRZHDIY*Nj*WnHb3Ima4ImdJ*L2*Omc*On*WjJ"
 };
 
 export const p4_127_going__down__bajar = {
@@ -1444,7 +1522,10 @@ export const p4_127_going__down__bajar = {
     ["una bajada", "a drop", "一滴", "yī dī", "uma gota"],
     ["el descenso", "the descent", "下降", "xià jiàng", "a descida"],
     ["en descenso", "in decline", "衰退中", "shuāi tuì zhōng", "em declínio"]
-  ]
+  ],
+  accentFree: {"4": "bajais", "11": "tu bajas", "13": "el baja", "17": "vosotros bajais", "18": "lo bajais"},
+  pinyinUnits: {},
+  distractors: "CBFGFGCAABFG*Kj*L9BQ*Kk*L+BSBGCABFCABFGC*PyZaSK*Kq*MEOJO*Kr*MF*Ks*MGMBUO*MHL*Ku*MIOCKMU*MJ*Kw*MK*Oe*Mo*Kx*MLDM*Ky*MM*Og*Mq*MNMEI*K0*MO*Oi*MsMO*MPK*MQ*Ok*MuT*Nx*VC*Lp*OlYHISX*AV*AXHa*QEI*H8Z*QFI*QE"
 };
 
 export const p4_128_emergency__safety = {
@@ -1512,7 +1593,10 @@ export const p4_128_emergency__safety = {
     ["aplicar primeros auxilios", "apply first aid", "进行急救", "jìn xíng jí jiù", "aplicar primeiros socorros"],
     ["el extinguidor", "the extinguisher", "灭火器", "miè huǒ qì", "o extintor"],
     ["un extinguidor", "a fire extinguisher", "灭火器", "miè huǒ qì", "um extintor de incêndio"]
-  ]
+  ],
+  accentFree: {"4": "policia", "15": "evacuacion", "26": "la policia", "27": "llamar a la policia", "48": "la evacuacion", "49": "una evacuacion"},
+  pinyinUnits: {},
+  distractors: "STGPUV*DtDDWXECZYBaCIJLuBCeAPhKOCEiCEJkCEI*D4*Hd*SAO*WHFuBqrBD*D+CEIuKCEw*WK*Wi*Wjybdo01UVTA*Is*K6SA*K7*AtVB*EBRUBRZXC*AiZWCZBZDSeDYWXE*F/BDQdoTFRUVfQbyGSYjdyQbHCEIAGPlIBDMiSYeJlBDkJAG*ST*Wa*VB*Ej*SU*Qe*Wb*VC*Wc*No*BT*SN*Wd*Np*SO*EoMrRUqM*G5*G8NAGPsSYevOFLu*JnOBxP*Wi*OMw*WjP*ONQzfdyfdQ1RTx0RTx"
 };
 
 export const p4_129_falling__caer = {
@@ -1556,7 +1640,10 @@ export const p4_129_falling__caer = {
     ["un resbalón", "a slip", "一个失误", "yí gè shī wù", "um deslize"],
     ["puede deslizarse", "can slide", "可以滑动", "kě yǐ huá dòng", "pode deslizar"],
     ["va a deslizarse", "is going to slide", "将会滑动", "jiāng huì huá dòng", "vai deslizar"]
-  ]
+  ],
+  accentFree: {"4": "caeis", "8": "resbalon", "12": "tu caes", "14": "el cae", "18": "vosotros caeis", "19": "os caeis", "26": "el resbalon", "27": "un resbalon"},
+  pinyinUnits: {},
+  distractors: "EOPBFGCABFGA*OSBMNAOPBBGCABFCAYZIKabHKdYZaLATXKATXN*Oa*TSBMVP*TSAEPBVAEO*Oe*Mo*Kw*QX*TUDUW*Mq*Ky*Og*QZEKLX*Oi*Ms*K0*P+PNFD*K2RUHKLTDZH*IIJYHJabIJYaIJYdJQSJSQc"
 };
 
 export const p4_130_lifting__waking__levantar = {
@@ -1600,7 +1687,10 @@ export const p4_130_lifting__waking__levantar = {
     ["un despertador", "an alarm clock", "闹钟", "nào zhōng", "um despertador"],
     ["hay que alzar", "you have to raise", "你得抬起", "nǐ děi tái qǐ", "você tem que erguer"],
     ["voy a alzar", "I'm going to lift", "我要举起", "wǒ yào jǔ qǐ", "eu vou levantar"]
-  ]
+  ],
+  accentFree: {"4": "levantais", "12": "tu levantas", "14": "el levanta", "18": "vosotros levantais", "19": "lo levantais"},
+  pinyinUnits: {},
+  distractors: "C*HgBFFGCAABFGBR*ODHBT*OFDBGCABFCABGDEab*YCTACBFLPAOKPNVNBVOVPMLPCKLLNVKS*OC*BM*BqDNTVQ*OE*BO*BsNERVV*OGNPNPLFY*Oq*RL*No*Or*RM*Np*OJW*By*JJ*OqSQYWbI*GH*H8aI*GI*H9*Lo*RJ*VB*MR*Lp*RK*VC*Nx"
 };
 
 export const p4_131_materials = {
@@ -1674,7 +1764,10 @@ export const p4_131_materials = {
     ["edad de bronce", "bronze age", "青铜时代", "qīng tóng shí dài", "idade do bronze"],
     ["instrumento de latón", "brass instrument", "铜管乐器", "tóng guǎn yuè qì", "instrumento de sopro"],
     ["candado de latón", "brass padlock", "黄铜挂锁", "huáng tóng guà suǒ", "cadeado de latão"]
-  ]
+  ],
+  accentFree: {"12": "algodon", "19": "laton", "21": "material de construccion", "25": "musica metal", "26": "puno de hierro", "35": "corazon de oro", "42": "tela de arana", "44": "nube de algodon", "45": "camiseta de algodon", "46": "sueter de lana", "51": "cinturon de cuero", "54": "corazon de piedra", "58": "instrumento de laton", "59": "candado de laton"},
+  pinyinUnits: {},
+  distractors: "FJMQ*O5DRSEGIP*M9BRSCGIP*C5AJMCEIPKLNOCEGPMQABLNOCKNOCJQABKLOCKLNCCEGI*NyJMA*LR*M9BDBDRCCEGIYcez6tblahijZpqWUcezXpqWWhijlUYcUYezfknyfUYcedknms0WWaij4Wah*UJWahdfnybUYcgs0WdfkyWahiXZqWXZpWvxXZgm0Wbl6UWahirxXZWahirvXZdfknUYcegmsWUYcejUYcWahii5UY4WahtblUdfkn"
 };
 
 export const p4_132_touching__playing__music__tocar = {
@@ -1718,7 +1811,10 @@ export const p4_132_touching__playing__music__tocar = {
     ["suave al tacto", "soft to the touch", "触感柔软", "chù gǎn róu ruǎn", "suave ao toque"],
     ["en contacto", "in contact", "联系", "lián xì", "em contato"],
     ["lentes de contacto", "contact lenses", "隐形眼镜", "yǐn xíng yǎn jìng", "lentes de contato"]
-  ]
+  ],
+  accentFree: {"4": "tocais", "14": "le toca a el", "18": "tocais bien", "19": "cuando tocais"},
+  pinyinUnits: {},
+  distractors: "CBFGFGCHABFGBEJFBDFGBGCHBFCHBFGIBFGHcDNOUQRLMPTVVLPTOJSZNJSZULMTRKLMQKLMZacN*Kz*KVLMPKQRMLPTLMPTLMPSLMPTSacNSZcNLMPTJSZaKUQR"
 };
 
 export const p4_133_breaking__romper = {
@@ -1762,7 +1858,10 @@ export const p4_133_breaking__romper = {
     ["vidrio roto", "broken glass", "碎玻璃", "suì bō lí", "vidro quebrado"],
     ["fractura de hueso", "bone fracture", "骨折", "gǔ zhé", "fratura óssea"],
     ["fractura abierta", "open fracture", "开放性骨折", "kāi fàng xìng gǔ zhé", "fratura exposta"]
-  ]
+  ],
+  accentFree: {"4": "rompeis", "12": "me rompes el corazon", "15": "se rompe facil", "16": "rompemos el record", "18": "rompeis el molde", "19": "siempre rompeis", "26": "corazon roto"},
+  pinyinUnits: {},
+  distractors: "CBFGFGCAABFGBJEZBDFGBGCABFCABFGAACBFDEZBLNcdKNcdYQRVKLcdPUaSOUaSVWKLMYQVTXKLSXKLOPSTQWKLQVKLSTKLMQRV*JNHDJ*S4OPbZaDJKLNdKLNc"
 };
 
 export const p4_134_farming__agriculture = {
@@ -1836,7 +1935,10 @@ export const p4_134_farming__agriculture = {
     ["voy a injertar", "I'm going to graft", "我要嫁接", "wǒ yào jià jiē", "Vou enxertar"],
     ["el abono", "the fertilizer", "肥料", "féi liào", "o fertilizante"],
     ["con abono", "with fertilizer", "带肥料", "dài féi liào", "com fertilizante"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "GFUgKMRTEYPBEabJDCcJGAefAFgeiILNHLNOLDES*LJBMRJqrHBKRTuHIL*Gi*TZwx*Kn*JayC*LKBKMBKMT*Gh*OYDEBKMRgAhGUghmBXHIW*LbipCZcDY*GaFabDcEadDcdEY*HsbcEAfFGgeFhGUhGegfUGjH*H2XiHFZ*FA*Fe*No*Wa*Np*WbAG*Ej*FA*RJ*Nw*Ek*Bx*Xz*OJ*Lo*MR*Wc*Nw*Lp*Ol*KY*WdrL*NOXqL*NPXtMHIsMHIvN*H+XuNFZxOXiwO*DYX*K4*J6PDefn5*Lq*ST*Lo*MR*Lr*Mv*Ol*Qe*Lq*Lo*MR*Nw*Lr*Lp*Nx*Ol*Oq*GV*El*Fe*Or*GW*Dm*Em*LkTHIDEJS"
 };
 
 export const p4_135_sharing__compartir = {
@@ -1880,7 +1982,10 @@ export const p4_135_sharing__compartir = {
     ["dividir en partes iguales", "divide into equal parts", "分成相等的部分", "fēn chéng xiāng děng de bù fèn", "dividir em partes iguais"],
     ["distribuir los recursos", "distribute resources", "分配资源", "fēn pèi zī yuán", "distribuir recursos"],
     ["distribuir bien el tiempo", "distribute time well", "很好地分配时间", "hěn hǎo dì fēn pèi shí jiān", "distribua bem o tempo"]
-  ]
+  ],
+  accentFree: {"4": "compartis", "10": "comparto tu opinion", "12": "por que no lo compartes", "14": "el comparte su comida", "18": "compartis habitacion", "19": "lo compartis todo", "21": "los vecinos comparten el jardin"},
+  pinyinUnits: {},
+  distractors: "CBEFEFCGABFEBEGABFGABCEGBEFA*NFACBACHBBDEFYZOWNcQbSUOQLcQbKMSURbdLLMNSPbdLMUOQaWXKMSOQPRbdXKTYWKTYKZOWKYOWTWXKdLNPLNQbbLNP"
 };
 
 export const p4_136_participating__participar = {
@@ -1924,7 +2029,10 @@ export const p4_136_participating__participar = {
     ["soy participante activo", "I am an active participant", "我是一个积极的参与者", "wǒ shì yí gè jī jí de cān yù zhě", "Sou um participante ativo"],
     ["colaborar en equipo", "collaborate as a team", "团队协作", "tuán duì xié zuò", "colaborar em equipe"],
     ["es un placer colaborar contigo", "It is a pleasure to collaborate with you", "很高兴与您合作", "hěn gāo xìng yǔ nín hé zuò", "É um prazer colaborar com você"]
-  ]
+  ],
+  accentFree: {"4": "participais", "7": "participacion", "11": "no participo en politica", "14": "el participa activamente", "17": "participamos en la reunion", "18": "participais en las decisiones", "19": "como participais en clase", "24": "alta participacion ciudadana", "25": "gracias por tu participacion"},
+  pinyinUnits: {},
+  distractors: "CBFGFGCAABFGBIEFBDFGBGCABFCAFDIEFDBG*OZ*LrACLbMOKbMOOTWKPRMOMTWKNRMOZSXYNPMOXYdQMOWKVSXYSXYdMOTKSYdQSXdQQSXYNPQRKLMOHKLbSXYQ"
 };
 
 export const p4_137_math__operations = {
@@ -1995,7 +2103,10 @@ export const p4_137_math__operations = {
     ["un logaritmo", "a logarithm", "对数", "duì shù", "um logaritmo"],
     ["la geometría", "geometry", "几何", "jǐ hé", "geometria"],
     ["estudiar geometría", "study geometry", "学习几何", "xué xí jǐ hé", "estudar geometria"]
-  ]
+  ],
+  accentFree: {"0": "numero", "4": "calculo", "5": "ecuacion", "6": "solucion", "9": "multiplicacion", "10": "division", "12": "fraccion", "14": "raiz", "18": "geometria", "19": "el numero", "20": "un numero", "27": "el calculo", "28": "un calculo", "29": "la ecuacion", "30": "una ecuacion", "31": "la solucion", "32": "una solucion", "37": "la multiplicacion", "38": "una multiplicacion", "39": "la division", "40": "una division", "43": "la fraccion", "44": "una fraccion", "47": "la raiz", "48": "raiz cuadrada", "55": "la geometria", "56": "estudiar geometria"},
+  pinyinUnits: {},
+  distractors: "TUChHIACI*LJ*UX*QuVegobcNi*QydGKfFKMBOIACBAHlmDanFGMpqYd*LLrFGtuEiHBIAxFGKz0RS12QS3QRWUAFGTAFG*Lo*MR*Nw*ST*QB*Mv*Lp*Nx*Lo*U1*RL*MR*Lp*U2*RM*OJ*Mya*Uzm*MzDZ*U0cEQRbEQRe*RTF*Omd*RU*On*LtgG*YF*Lsf*LtGD*DwiHAhENj*H2k*F9I*Jfj*F+FmJ*FFZlJ*FGZoK*L2*AmnKDVqLXwpLXw*LssM*Om*Ltr*On*N6uNQRtNQROAChXpqDyP*As*F/x*At*GA*Hz0QDVzQDV2RDV1RDVSDVeZmla"
 };
 
 export const p4_138_preparing__preparar = {
@@ -2039,7 +2150,10 @@ export const p4_138_preparing__preparar = {
     ["últimos preparativos", "final preparations", "最后的准备", "zuì hòu de zhǔn bèi", "preparativos finais"],
     ["todo listo", "all ready", "一切准备就绪", "yī qiè zhǔn bèi jiù xù", "tudo pronto"],
     ["listo para empezar", "ready to start", "准备开始", "zhǔn bèi kāi shǐ", "pronto para começar"]
-  ]
+  ],
+  accentFree: {"4": "preparais", "7": "preparacion", "12": "que preparas de comer", "18": "preparais el viaje", "19": "os preparais para la boda", "24": "fase de preparacion", "25": "preparacion fisica", "27": "ultimos preparativos"},
+  pinyinUnits: {},
+  distractors: "CBFGFGC*NFABFGBEFGB*VQDFBGC*NFBF*NFCIFDEHDEKACBFHIODMPQXLPQXTRUbSWdKLMQXLMPXUbLMWdOVNRUbRbLMYZLMSdOVLMPQVZLMVYLMLMPQRULMEBDFSWOV"
 };
 
 export const p4_139_cooking__cocinar = {
@@ -2083,7 +2197,10 @@ export const p4_139_cooking__cocinar = {
     ["un chef", "a chef", "厨师", "chú shī", "um chef"],
     ["el ayudante", "the helper", "帮手", "bāng shǒu", "o ajudante"],
     ["un ayudante", "a helper", "一个帮手", "yí gè bāng shǒu", "um ajudante"]
-  ]
+  ],
+  accentFree: {"4": "cocinais", "12": "tu cocinas", "13": "que cocinas", "14": "el cocina", "18": "vosotros cocinais", "19": "que cocinais"},
+  pinyinUnits: {},
+  distractors: "CBFGFGCAABFGBR*Of*N1BHJKBGCABFCAGCYEACabcdEHAEHJWURTBVNOTMBPCEHJOUNY*OC*Bq*E5SD*ODVT*OE*Bs*E7QNERXPV*Bu*E9FMKO*OI*E/*OkL*Ek*OJRTZHNPYHRTbIACaIACdJNPcJNP"
 };
 
 export const p4_140_history__terms = {
@@ -2157,5 +2274,8 @@ export const p4_140_history__terms = {
     ["espíritu de conquista", "spirit of conquest", "征服精神", "zhēng fú jīng shén", "espírito de conquista"],
     ["firmar un tratado", "sign a treaty", "签署条约", "qiān shǔ tiáo yuē", "assinar um tratado"],
     ["tratado de paz", "peace treaty", "和约", "hé yuē", "tratado de paz"]
-  ]
+  ],
+  accentFree: {"3": "epoca", "11": "revolucion", "14": "heroe", "15": "heroina", "16": "historico", "26": "epoca medieval", "27": "cambio de epoca", "32": "el rey de espana", "40": "caida del imperio", "42": "revolucion francesa", "43": "revolucion industrial", "44": "dia de la independencia", "48": "heroe nacional", "49": "morir como heroe", "50": "heroina de guerra", "51": "una heroina valiente", "52": "momento historico", "53": "centro historico", "54": "epoca colonial", "55": "colonia espanola", "56": "conquista de america", "57": "espiritu de conquista"},
+  pinyinUnits: {},
+  distractors: "EIKNFCDEDHOBCHOBKNPR*M9*NCBCCDHOCDOB*FQ*R/QSLIQSENPR*Wk*LQ*WLJabgiEKPRCDHBEKNRISfAEKNP*G+IQf*Ja*GiEKckoyXuvxZelnVuvxJLdhWelnMbgiMagiyUkoh7MYWZlnFIQSMabid7MYMabgMabgpUcoWZenWZelWZelUckykMabz4m5st5qrt5qrs5qVXvxVXuxMabgVXuvcUkoq4m51WZe0UckMabgUckoqzm5qrszUckodhMY"
 };
@@ -51,7 +51,10 @@ export const p5_141_accepting__aceptar = {
     ["sin aprobación", "without approval", "未经批准", "wèi jīng pī zhǔn", "sem aprovação"],
     ["la admisión", "admission", "入场", "rù chǎng", "admissão"],
     ["una admisión", "an admission", "入场", "rù chǎng", "uma admissão"]
-  ]
+  ],
+  accentFree: {"4": "aceptais", "7": "aceptacion", "8": "aprobacion", "9": "admision", "12": "tu aceptas", "14": "el acepta", "18": "vosotros aceptais", "19": "lo aceptais", "24": "la aceptacion", "25": "con aceptacion", "26": "la aprobacion", "27": "sin aprobacion", "28": "la admision", "29": "una admision"},
+  pinyinUnits: {},
+  distractors: "CBFGFGCAABFGBREFBTJKBGCABFCAY*Wn*XJFa*Wi*W/bcEKLLP*LxAKP*LxNNBVOVPMLPCEJLNVKS*QS*SotDNTVQ*QU*SqvNERVV*QW*SsNNPLF*QY*SuZb*GP*KbRdH*XJZaYH*BJ*QoIb*W/YaIWZdJ*WR*TYc*WS*TZJ"
 };
 
 export const p5_142_rejecting__rechazar = {
@@ -92,7 +95,10 @@ export const p5_142_rejecting__rechazar = {
     ["una negación", "a denial", "否认", "fǒu rèn", "uma negação"],
     ["la denegación", "denial", "否认", "fǒu rèn", "negação"],
     ["una denegación", "a denial", "否认", "fǒu rèn", "uma negação"]
-  ]
+  ],
+  accentFree: {"4": "rechazais", "7": "negacion", "8": "denegacion", "11": "tu rechazas", "13": "el rechaza", "17": "vosotros rechazais", "18": "lo rechazais", "23": "la negacion", "24": "una negacion", "25": "la denegacion", "26": "una denegacion"},
+  pinyinUnits: {},
+  distractors: "CBFGFGCAABFGBQEFBSDFBGCABFCAIXBFXHZYKOANJOMUMBUNUOLKOCJKKMUJ*QSR*GE*AQDMSU*QUP*GG*ASMEQUU*QWMOMOKF*QYTaQ*QZMU*FLIYHZXa*DMIaIX*LsZYI*Un"
 };
 
 export const p5_143_space__universe = {
@@ -163,7 +169,10 @@ export const p5_143_space__universe = {
     ["un meteorito", "a meteorite", "陨石", "yǔn shí", "um meteorito"],
     ["el eclipse", "the eclipse", "日食", "rì shí", "o eclipse"],
     ["un eclipse", "an eclipse", "日食", "rì shí", "um eclipse"]
-  ]
+  ],
+  accentFree: {"7": "satelite", "8": "orbita", "16": "constelacion", "33": "el satelite", "34": "un satelite", "35": "la orbita", "36": "en orbita", "51": "la constelacion", "52": "una constelacion"},
+  pinyinUnits: {},
+  distractors: "TCDS*HCVHJXYADZACSbcLVMdeIFIMfhiBJjkFMlBHKBHJOpqEVF*Qc*GY*KFtuRTvBHJxyQWz*IB*Qo012NT34ACAUNRTmtuBW*HB*HCVBPQYCNRXCNRaDNRZDELcEPQbEPQerFBdsFB*DRgGF*DSfACiHELhHELkIBHjIBHJmELlJUt*VLxyz*VMKPQqLPQpLPQds*GxMer*Gy*QduNUmtNUmwOELvOUmyPnzxPnz0Q*IU*Q6zQ*IU*IV2RUm1RUm4SNR3SNR"
 };
 
 export const p5_144_offering__ofrecer = {
@@ -207,7 +216,10 @@ export const p5_144_offering__ofrecer = {
     ["voy a proponer", "I'm going to propose", "我要提议", "wǒ yào tí yì", "Vou propor"],
     ["la propuesta", "the proposal", "该提案", "gāi tí àn", "a proposta"],
     ["una propuesta", "a proposal", "一项提案", "yī xiàng tí àn", "uma proposta"]
-  ]
+  ],
+  accentFree: {"4": "ofreceis", "12": "tu ofreces", "14": "el ofrece", "18": "vosotros ofreceis", "19": "lo ofreceis"},
+  pinyinUnits: {},
+  distractors: "CKLBFGCEBFGABRE*XQBTIOBGCVBFCAYZUbEOABcldDLA*XXDKADJNBVOMBVOCEIAVOCD*Xd*EVS*OoDTVX*Xf*EXQ*OqERVD*XhV*JO*D7FMNP*Xj*Eb*OuH*Eg*XkRcZHaWYHaW*Sw*VNYZ1*UD*Sx*VOdJ2Rc3J*OO"
 };
 
 export const p5_145_promising__prometer = {
@@ -251,7 +263,10 @@ export const p5_145_promising__prometer = {
     ["un juramento", "an oath", "誓言", "shì yán", "um juramento"],
     ["hay que jurar", "you have to swear", "你必须发誓", "nǐ bì xū fà shì", "você tem que jurar"],
     ["voy a jurar", "I'm going to swear", "我要发誓", "wǒ yào fā shì", "eu vou jurar"]
-  ]
+  ],
+  accentFree: {"4": "prometeis", "12": "tu prometes", "14": "el promete", "18": "vosotros prometeis", "19": "lo prometeis"},
+  pinyinUnits: {},
+  distractors: "CHBFFGCAABFGBREFBTDFBGCABFCAAC*UyYabEKACHBLAOPKAOMNBV*HzMBVLCKL*H1VKOC*H3S*Qw*XdDTV*H4Q*Qy*Xf*CEERVa*H7VPRFMNPURXS*CN*VO*Sx*FxZH*G/*GtY*CPHDbITcaITc*JU*OF*P0*Rs*JV*OG*NY*P1"
 };
 
 export const p5_146_chemistry__terms = {
@@ -322,7 +337,10 @@ export const p5_146_chemistry__terms = {
     ["hay nitrógeno", "there is nitrogen", "有氮气", "yǒu dàn qì", "existe nitrogênio"],
     ["la sustancia", "the substance", "该物质", "gāi wù zhì", "a substância"],
     ["una sustancia", "a substance", "一种物质", "yī zhǒng wù zhì", "uma substância"]
-  ]
+  ],
+  accentFree: {"0": "quimica", "1": "quimico", "3": "atomo", "4": "molecula", "5": "reaccion", "7": "acido", "9": "liquido", "10": "solido", "13": "formula", "14": "oxigeno", "15": "hidrogeno", "17": "nitrogeno", "19": "la quimica", "20": "clase de quimica", "21": "el quimico", "22": "producto quimico", "25": "el atomo", "26": "un atomo", "27": "la molecula", "28": "una molecula", "29": "la reaccion", "30": "una reaccion", "33": "el acido", "34": "un acido", "37": "el liquido", "38": "un liquido", "39": "el solido", "40": "un solido", "45": "la formula", "46": "una formula", "47": "el oxigeno", "48": "hay oxigeno", "49": "el hidrogeno", "50": "hay hidrogeno", "53": "el nitrogeno", "54": "hay nitrogeno"},
+  pinyinUnits: {},
+  distractors: "BTJNAVJNXY*XDEHIKMbCFL*S6*TAdCfgPRDIKMMDHKlmABnojr*SACEFIDHKtABJvABJRxyGzABJP12G34GPAVBGpWqyBTAGUpqyYC*N/*S/XC*S/*XEaDABZDABcEXYbEef*TQe*TcFd*Td*A2*TQgGcefGceiHABhHAB*BYkIK*BZjABmJGPlJGPoKCEnKCEUWqy*D+Ly2sMKjrMKjuNGPtNXYOwGPvOXY1Pyc2xPqQ0GPzQXYxR2cy1RP4Sce3S*KVq"
 };
 
 export const p5_147_moving__mover = {
@@ -366,7 +384,10 @@ export const p5_147_moving__mover = {
     ["un movimiento", "a movement", "一个运动", "yí gè yùn dòng", "um movimento"],
     ["hay que trasladar", "you have to move", "必须转移", "bì xū zhuǎn yí", "deve ser transferido"],
     ["voy a trasladar", "I'm going to transfer", "我要转接", "wǒ yào zhuǎn jiē", "vou transferir"]
-  ]
+  ],
+  accentFree: {"4": "moveis", "12": "tu mueves", "14": "el mueve", "18": "vosotros moveis", "19": "lo moveis"},
+  pinyinUnits: {},
+  distractors: "CGBEFCAMABFGRHKLTBFABCAVACBEGDKLabZJRXIMLPADKPNVNBTVVPMLPCDHLNVK*NRS*Oo*PDDTJX*NTQ*Oq*PFEMNVVWIZNPLFUIZaJRIMdSabHIJRbIUWaIUW*Kk*Rmd*GOJYSa"
 };
 
 export const p5_148_stopping__detener = {
@@ -410,7 +431,10 @@ export const p5_148_stopping__detener = {
     ["voy a frenar", "I'm going to brake", "我要刹车", "wǒ yào shā chē", "Vou frear"],
     ["hay que interrumpir", "we have to interrupt", "我们必须打断", "wǒ men bì xū dǎ duàn", "temos que interromper"],
     ["voy a interrumpir", "I'm going to interrupt", "我要打断一下", "wǒ yào dǎ duàn yī xià", "vou interromper"]
-  ]
+  ],
+  accentFree: {"4": "deteneis", "12": "tu detienes", "14": "el detiene", "18": "vosotros deteneis", "19": "lo deteneis"},
+  pinyinUnits: {},
+  distractors: "GKLCFCGMBFGORBE*QjTBFYBCGVACBF*S5YIAHACGRXMNLA*QqDKAPNNBVOVPMBPCBFNVOC*Qw*CC*T8*WJDNT*Qx*Qy*CE*T+QENLR*Q0*WNV*JONPFM*Q2*CI*UC*WP*Q3JRMZ*TOHBY*G2*PtH*Rs*JW*FK*GO*PK*CJ*NY*RtdQSUJcSQ"
 };
 
 export const p5_149_military__terms = {
@@ -475,7 +499,10 @@ export const p5_149_military__terms = {
     ["un coronel", "a colonel", "上校", "shàng xiào", "um coronel"],
     ["el sargento", "the sergeant", "中士", "zhōng shì", "o sargento"],
     ["un sargento", "a sergeant", "一名中士", "yī míng zhōng shì", "um sargento"]
-  ]
+  ],
+  accentFree: {"0": "ejercito", "4": "capitan", "13": "infanteria", "14": "artilleria", "17": "el ejercito", "18": "en el ejercito", "25": "el capitan", "26": "un capitan", "43": "la infanteria", "44": "en la infanteria", "45": "la artilleria", "46": "en la artilleria"},
+  pinyinUnits: {},
+  distractors: "RFQkTUCDVWBDXYBCFZaBEbAQ*L1HJKJGKLh*NoBCHGKLlmLM*PZKMd*HF*PVpKrORbtNRbvwBCxyAFASNOR*BNAnUB*DVVTB*DWVWC*GNTVCTUYD*HHTXD*IH*HIaETUZEcTcFNObaFN*MPe*HF*Km*MQd*Iz*KngHBCfHBCiI*OHThINOk*VFJBjAFQmKAFlKAF*P0*Cs*JU*Ef*P1*Ct*JVN*PsMqApNORNs*I4*IgrNuSOu*I2StOsSwPTUvPTUyQ*XD*XBxQ*XE*XC"
 };
 
 export const p5_150_continuing__continuar = {
@@ -519,7 +546,10 @@ export const p5_150_continuing__continuar = {
     ["voy a proseguir", "I will continue", "我会继续", "wǒ huì jì xù", "Vou continuar"],
     ["hay que persistir", "you have to persist", "你一定要坚持", "nǐ yí dìng yào jiān chí", "você tem que persistir"],
     ["voy a persistir", "I will persist", "我会坚持", "wǒ huì jiān chí", "eu vou persistir"]
-  ]
+  ],
+  accentFree: {"0": "continuo", "1": "continuas", "2": "continua", "4": "continuais", "5": "continuan", "7": "continuacion", "10": "yo continuo", "11": "lo continuo", "12": "tu continuas", "13": "lo continuas", "14": "el continua", "15": "lo continua", "18": "vosotros continuais", "19": "lo continuais", "20": "ellos continuan", "21": "lo continuan", "24": "a continuacion", "25": "la continuacion"},
+  pinyinUnits: {},
+  distractors: "CBFKFCGAABFGREBGTBDGBCGABFCAYZ*BJ*IBBFGJBFGILPAOKPNVNBVOVPMLPCKLLNVKSu*Qw*JoDTNVQw*Qy*JqENRVVNPZNPLF0*Q2acGRYbHZRXYH*Bs*IU*Sw*VNc*CM*Cn*Sx*VOI*Pya*Swd*PzJRX"
 };
 
 export const p5_151_finishing__terminar = {
@@ -563,7 +593,10 @@ export const p5_151_finishing__terminar = {
     ["voy a acabar", "I'm going to finish", "我要完成", "wǒ yào wán chéng", "Vou terminar"],
     ["la conclusión", "the conclusion", "结论", "jié lùn", "a conclusão"],
     ["en conclusión", "in conclusion", "综上所述", "zōng shàng suǒ shù", "para concluir"]
-  ]
+  ],
+  accentFree: {"4": "terminais", "9": "conclusion", "12": "tu terminas", "14": "el termina", "18": "vosotros terminais", "19": "lo terminais", "28": "la conclusion", "29": "en conclusion"},
+  pinyinUnits: {},
+  distractors: "CBFGFGCAABFGBREFBTDFBGCABFCAIACY*J+ACHcdDMLPAOKPNVNBVOVPMLPCKLLNVKS*PD*So*AtDNTVQ*PF*Sq*AvNERVV*PH*SsNNPLF*PJ*SuUR*UH*EgNVZHACYHAC*Ka*Rs*Ef*FK*Kb*LJ*AX*NYdJRXcJRX"
 };
 
 export const p5_152_literature__books = {
@@ -634,7 +667,10 @@ export const p5_152_literature__books = {
     ["un género", "a genre", "一种类型", "yī zhǒng lèi xíng", "um gênero"],
     ["el ensayo", "the essay", "文章", "wén zhāng", "a redação"],
     ["un ensayo", "an essay", "一篇文章", "yì piān wén zhāng", "um ensaio"]
-  ]
+  ],
+  accentFree: {"4": "poesia", "9": "capitulo", "17": "genero", "27": "la poesia", "28": "con poesia", "37": "el capitulo", "38": "un capitulo", "53": "el genero", "54": "un genero"},
+  pinyinUnits: {},
+  distractors: "T*S9UH*J3CFGB*J3XDZCERFGbCGBINFBINhiAL*KE*RFBFlmKX*WhJXZp*S9q*S8rsAHBFGIBFGIxVWdBFGI12CD34CDUA*TWhT*TXA*Iv*KMW*KiB*KNV*KjBYCJKXW*TX*KNaDJKZ*BZDAEJKXbEAHfeFPgdFPdg*BkGef*Qd*BliHTphHTpkzIP*Rhj*Kn*FBmJyAlJyA*W9*H/*Rm*JU*W+*IA*Rn*M9qL*TWTp*TXL*NaMsThrMUou*CoNPtNPVwOPV*A6vOPyPAHxPlm*Ev*FA*IojPVWd2RJK1RJK4SJK3SJK"
 };
 
 export const p5_153_developing__desarrollar = {
@@ -678,7 +714,10 @@ export const p5_153_developing__desarrollar = {
     ["un avance", "a progress", "一个进步", "yí gè jìn bù", "um progresso"],
     ["el adelanto", "the advance", "进步", "xiān jìn", "o avanço"],
     ["un adelanto", "a preview", "预览", "yù lǎn", "uma prévia"]
-  ]
+  ],
+  accentFree: {"4": "desarrollais", "7": "evolucion", "12": "tu desarrollas", "14": "el desarrolla", "18": "vosotros desarrollais", "19": "lo desarrollais", "24": "la evolucion", "25": "una evolucion"},
+  pinyinUnits: {},
+  distractors: "CBFGFGCAABFGBREFBTDFBGCABFCA*WCYZA*QJabJcdabLPAOKPNVNBVOVPMLPCKLLNVKS*LgWUDNTVQ*LiWUNERVVNPLNPLFURXSNVPGZ*WVH*WCY*WWH*WVb*QaIJaIJHdJACcJAC"
 };
 
 export const p5_154_producing__producir = {
@@ -716,7 +755,10 @@ export const p5_154_producing__producir = {
     ["en producción", "in production", "生产中", "shēng chǎn zhōng", "em produção"],
     ["hay que fabricar", "you have to manufacture", "必须制造", "bì xū zhì zào", "deve ser fabricado"],
     ["voy a fabricar", "I am going to manufacture", "我要制造", "wǒ yào zhì zào", "vou fabricar"]
-  ]
+  ],
+  accentFree: {"4": "producis", "6": "produccion", "10": "tu produces", "12": "el produce", "16": "vosotros producis", "17": "lo producis", "20": "la produccion", "21": "en produccion"},
+  pinyinUnits: {},
+  distractors: "CIJBEFCKBFAEPBEGBFCRBCETUV*S6*WiABEFJANDINALLB*CcRRTNKNC*CeBLTMJ*CgQ*M2*OoDLR*ChO*Ci*OqWLTNE*CkTLNLNRFVG*TQ*W/UG*XA*TR*G5*EfSP*G6*M9*Eg*PK"
 };
 
 export const p5_155_construction = {
@@ -787,7 +829,10 @@ export const p5_155_construction = {
     ["de carpintería", "carpentry", "木工", "mù gōng", "carpintaria"],
     ["la fontanería", "plumbing", "管道", "guǎn dào", "encanamento"],
     ["de fontanería", "plumbing", "管道", "guǎn dào", "encanamento"]
-  ]
+  ],
+  accentFree: {"0": "construccion", "7": "albanil", "12": "cimentacion", "15": "grua", "17": "carpinteria", "18": "fontaneria", "19": "la construccion", "20": "en construccion", "33": "el albanil", "34": "un albanil", "43": "la cimentacion", "44": "una cimentacion", "49": "la grua", "50": "una grua", "53": "la carpinteria", "54": "de carpinteria", "55": "la fontaneria", "56": "de fontaneria"},
+  pinyinUnits: {},
+  distractors: "TU*BJ*QoVWJjKPLIEZabDbZaGde*HIFf*E7dhiOojkXYlmBjCPLICIKPrsRdtuDEvwHoCKLIz0DE12Md34DEUA*Bs*Q6TA*Q7sWBDEVBDEY*P+*VbCX*P/CIaDbEZcDbcEZaabEZeFfGdgFfgGdeefGdiHFGhHFGkIBJjIBJmJDElJDE*HFoKInHOpqLHOpLHOsM*AY*AHrMTUuN*GlAtN*GmcwO*WtFvO*WuFyPIX*FBxHO0QAZzQcr2R*FQc1Rcr4S*FOA3SAZ"
 };
 
 export const p5_156_directing__dirigir = {
@@ -831,7 +876,10 @@ export const p5_156_directing__dirigir = {
     ["voy a guiar", "I will guide", "我来指导", "wǒ lái zhǐ dǎo", "Eu vou guiar"],
     ["hay que orientar", "you have to guide", "你必须引导", "nǐ bì xū yǐn dǎo", "você tem que orientar"],
     ["voy a orientar", "I will guide", "我会指导", "wǒ huì zhǐ dǎo", "eu vou guiar"]
-  ]
+  ],
+  accentFree: {"4": "dirigis", "12": "tu diriges", "14": "el dirige", "18": "vosotros dirigis", "19": "lo dirigis"},
+  pinyinUnits: {},
+  distractors: "CKLBEFCGBFAER*V8BEBFGCBCEGBEFCYZDMACBEKLOPLAJOKPAJNBTVTVPMPCJKNVLO*WJ*VrS*CCD*WKNT*WL*VtQ*LENVPE*WN*VvV*CGNPTF*WP*VxUZ*WQ*XoRYHZRXYHUd*Cs*OF*P0*Rs*Ct*NY*OG*P1*Ef*VPSW*Eg*AX1*Sv"
 };
 
 export const p5_157_organizing__organizar = {
@@ -875,7 +923,10 @@ export const p5_157_organizing__organizar = {
     ["con planificación", "with planning", "有计划", "yǒu jì huà", "com planejamento"],
     ["hay que clasificar", "you have to classify", "你必须分类", "nǐ bì xū fēn lèi", "você tem que classificar"],
     ["voy a clasificar", "I'm going to classify", "我来分类一下", "wǒ lái fēn lèi yī xià", "vou classificar"]
-  ]
+  ],
+  accentFree: {"4": "organizais", "7": "organizacion", "8": "planificacion", "12": "tu organizas", "14": "el organiza", "18": "vosotros organizais", "19": "lo organizais", "24": "la organizacion", "25": "una organizacion", "26": "la planificacion", "27": "con planificacion"},
+  pinyinUnits: {},
+  distractors: "CBFGFGCAABFGBREFBTDFBGCABFCAYFZDabRXEKLOLPAOKPNVNBVOVPMLPCKLLNVKS*QS*NR*M2DNTVQ*QU*NT*M4NERVV*QWNPNPLF*QY*NX*M8*Az*JX*QZ*RnNZHVUYHWaIbWZaIcW*H/dbWJUYI"
 };
 
 export const p5_158_theater__acting = {
@@ -949,7 +1000,10 @@ export const p5_158_theater__acting = {
     ["un dramaturgo", "a playwright", "剧作家", "jù zuò jiā", "um dramaturgo"],
     ["el libreto", "the script", "脚本", "jiǎo běn", "o roteiro"],
     ["un libreto", "a script", "一个脚本", "yí gè jiǎo běn", "um roteiro"]
-  ]
+  ],
+  accentFree: {"4": "telon", "17": "monologo", "28": "el telon", "29": "un telon", "54": "el monologo", "55": "un monologo"},
+  pinyinUnits: {},
+  distractors: "UCIL*GTMEKYAILaLFZBKOAefDZHghiGigh*F8BACHae1BEOAqACIBEKOQRUY*GaBEK*BFyTW0NRU23NQ45GV67PWAVNQUGSl*GnsXB*GotWBZCNQYCDFDbHJa*BNDidEPTcEPTfFHJeF*Dm*PphGHigGjHjHghihHg*GO*VL*Ef*FK*GP*AX*VMGn*JW*SwjJm*JX*SxpKPToKPTrLNQqLDFWt*GnMXs*GoM*UI*P0jb*UJ*P1Nfx*FA*RgOw*FB*G2*RhzPDFy*BlPG1Q*LOG0*LPQH3RGS2RGS5Sfg4Sfg7T*IkD6T*IlD"
 };
 
 export const p5_159_traveling__viajar = {
@@ -993,7 +1047,10 @@ export const p5_159_traveling__viajar = {
     ["un viaje", "a trip", "一次旅行", "yī cì lǚ xíng", "uma viagem"],
     ["la travesía", "the journey", "旅程", "lǚ chéng", "a viagem"],
     ["una travesía", "a journey", "一段旅程", "yī duàn lǚ chéng", "uma viagem"]
-  ]
+  ],
+  accentFree: {"4": "viajais", "9": "travesia", "12": "tu viajas", "14": "el viaja", "18": "vosotros viajais", "19": "siempre viajais", "28": "la travesia", "29": "una travesia"},
+  pinyinUnits: {},
+  distractors: "CIBFFGCAAIBFBJMEBHKOBGCABFCAGAIYACBFcDMEAEHOPNV*NMBDJEVPLTaCEHLNV*NQ*So*NR*PDSNT*NSV*Sq*NT*PFQNRV*NU*Ss*NVdLNPLT*Su*NX*PJL*GP*Sv*NY*OGZHaDYHbDObIYaIZEdJ*KqXc*KrJU"
 };
 
 export const p5_160_resting__descansar = {
@@ -1037,7 +1094,10 @@ export const p5_160_resting__descansar = {
     ["quiero relajarme", "I want to relax", "我想放松", "wǒ xiǎng fàng sōng", "Quero relaxar"],
     ["la relajación", "relaxation", "放松", "fàng sōng", "relaxamento"],
     ["con relajación", "with relaxation", "放松地", "fàng sōng dì", "com relaxamento"]
-  ]
+  ],
+  accentFree: {"4": "descansais", "9": "relajacion", "12": "tu descansas", "14": "el descansa", "18": "vosotros descansais", "19": "nunca descansais", "28": "la relajacion", "29": "con relajacion"},
+  pinyinUnits: {},
+  distractors: "CBFGFGCAABFGBEFGBDFGBGCABFCAYZACBFGAc*Wn*S6*CzAOCENVTWBOFGVR*NOLCKBFTXdUS*QS*At*GENV*NS*M3Q*QU*Av*GGPEWa*QWPTWNR*NWL*QY*Az*GK*Eb*QZG*RtPZHACYHACTWbL*Az*LITWJ*XJd*TQcJ*BJ*Qo"
 };
 
 export const p5_161_philosophy__terms = {
@@ -1108,7 +1168,10 @@ export const p5_161_philosophy__terms = {
     ["del empirismo", "of empiricism", "经验主义", "jīng yàn zhǔ yì", "do empirismo"],
     ["la esencia", "the essence", "本质", "běn zhì", "a essência"],
     ["en esencia", "in essence", "本质上", "běn zhì shàng", "em essência"]
-  ]
+  ],
+  accentFree: {"0": "filosofia", "1": "filosofo", "2": "filosofa", "8": "etica", "10": "logica", "12": "metafisica", "13": "epistemologia", "14": "ontologia", "15": "dialectica", "19": "la filosofia", "20": "de filosofia", "21": "el filosofo", "22": "un filosofo", "23": "la filosofa", "24": "una filosofa", "35": "la etica", "36": "con etica", "39": "la logica", "40": "con logica", "43": "la metafisica", "44": "de metafisica", "45": "la epistemologia", "46": "de epistemologia", "47": "la ontologia", "48": "de ontologia", "49": "la dialectica", "50": "con dialectica"},
+  pinyinUnits: {},
+  distractors: "CTUBCVWDBAXD*AK*ALZabcBCdeMPIJHK*EpGIJGJHKGIHKnhiGTUYvrsFPtueyvwARxyFMz0dr12AO34fjUXALTALYWBXCVYBXTYCVWXCLaD*ALFZDFMcEFMbEFMFe*KU*PodFNy*Qc*TSGgf*CwAO*FAiHK*FBhHKISflBCDEJSfjBCDEKBCDknKA*V1qtu*V2LptsMQdrMQduN*RSqtN*RTqwOLTvOLTPyQdxPNe0QNezQqt2RLT1RQd4S*Kg*Po3S*PT*Nw"
 };
 
 export const p5_162_practicing__practicar = {
@@ -1149,7 +1212,10 @@ export const p5_162_practicing__practicar = {
     ["con práctica", "with practice", "通过练习", "tōng guò liàn xí", "com prática"],
     ["el entrenamiento", "the training", "培训", "péi xùn", "o treinamento"],
     ["un entrenamiento", "a training", "一次培训", "yī cì péi xùn", "um treinamento"]
-  ]
+  ],
+  accentFree: {"4": "practicais", "7": "practica", "11": "tu practicas", "13": "el practica", "17": "vosotros practicais", "18": "siempre practicais", "23": "la practica", "24": "con practica"},
+  pinyinUnits: {},
+  distractors: "CHBFFGCAAHBFBEFGBDFGBGCABFCACABFZa*Rk*RlANCEOMUSBNFGUOKSCJXBKMUSR*Jo*At*H3MSUKP*Jq*Av*ASMQUKIKOVMOKS*Ju*Az*AWK*G6*IA*VO*KbHNYCXHDLaI*Q4*RkZI*Rl*CL"
 };
 
 export const p5_163_winning__earning__ganar = {
@@ -1190,7 +1256,10 @@ export const p5_163_winning__earning__ganar = {
     ["una victoria", "a victory", "胜利", "shèng lì", "uma vitória"],
     ["el premio", "the prize", "奖品", "jiǎng pǐn", "o prêmio"],
     ["un premio", "a prize", "一个奖品", "yí gè jiǎng pǐn", "um prêmio"]
-  ]
+  ],
+  accentFree: {"4": "ganais", "11": "tu ganas", "13": "el gana", "17": "vosotros ganais", "18": "siempre ganais"},
+  pinyinUnits: {},
+  distractors: "CBFGFGCAABFGBLEHBIJNBGCABF*RLCXZaDZaEJAEINOMU*K9BDEHUOKSCEIJKMU*LB*LC*D3R*PDM*LDSU*LE*D5P*PFM*LFQU*LGXKOMOK*LH*LIKOY*Rt*JV*OG*CtYHTKXHKOaIHDZIHD"
 };
 
 export const p5_164_dance__dancing = {
@@ -1264,7 +1333,10 @@ export const p5_164_dance__dancing = {
     ["una vuelta", "one turn", "一回合", "yī huí hé", "uma volta"],
     ["la reverencia", "the reverence", "崇敬", "chóng jìng", "a reverência"],
     ["una reverencia", "a bow", "一个鞠躬", "yí gè jū gōng", "uma reverência"]
-  ]
+  ],
+  accentFree: {"2": "bailarin", "9": "coreografia", "16": "compas", "24": "el bailarin", "25": "un bailarin", "38": "la coreografia", "39": "una coreografia", "52": "el compas", "53": "con compas"},
+  pinyinUnits: {},
+  distractors: "BFGKAFGKDYZHCa*FMbABFGABGKABFKiCXkAklNmnafABFGABFGsDprLuIQwPUVyOUV0INR23IN4INQ6*Mm7YVkAOUAOPXBOPWCHkZCTiYCbTbDJfaZD*BTdEINcEINFOPUJahoGOPUJafoH*DFTYnmt7lUICkICHnJt7mJjt*Cs*JU*Rs*VP*Ct*JV*NY*Rtu*FELrqDMpMtJasMm7qvNCu5*TT*QdxOqDwOTYPzDMyPTYQCHX0QDM3RCH2RCH5SCH4v*TT*Qd7T*Po*Ml6T*Ppm"
 };
 
 export const p5_165_losing__perder = {
@@ -1305,7 +1377,10 @@ export const p5_165_losing__perder = {
     ["una derrota", "a defeat", "失败", "shī bài", "uma derrota"],
     ["el extravío", "the loss", "损失", "sǔn shī", "a perda"],
     ["un extravío", "a loss", "损失", "sǔn shī", "uma perda"]
-  ]
+  ],
+  accentFree: {"4": "perdeis", "8": "extravio", "11": "tu pierdes", "13": "el pierde", "17": "vosotros perdeis", "18": "siempre perdeis", "25": "el extravio", "26": "un extravio"},
+  pinyinUnits: {},
+  distractors: "CBFJFCAGABFGIJNBBFHABCAGCBFAXBEFZaDJADINOMU*K9BNFCUOKSCDIJKMUSq*CC*D3*EVMSUKs*CE*D5*EXMQUK*JO*WN*D7VMOKSw*CI*D9*EbYZaLYHLDXHWZaIWYZIWY"
 };
 
 export const p5_166_forming__formar = {
@@ -1346,7 +1421,10 @@ export const p5_166_forming__formar = {
     ["en formación", "in training", "训练中", "xùn liàn zhōng", "em treinamento"],
     ["el molde", "the mold", "模具", "mú jù", "o molde"],
     ["un molde", "a mold", "一个模具", "yí gè mú jù", "um molde"]
-  ]
+  ],
+  accentFree: {"4": "formais", "7": "formacion", "11": "tu formas", "13": "el forma", "17": "vosotros formais", "18": "lo formais", "23": "la formacion", "24": "en formacion"},
+  pinyinUnits: {},
+  distractors: "CIBFFGCAABFGBQLMBSJKBGCABFCAXYFSACBFKOAEJOMUMBDUUOLKOCEJKMUJ*LC*Oo*So*D3DMSU*LE*Oq*Sq*D5MEQUUXYQMOKF*LI*Ou*Su*D9*Eg*Ct*OGQYHTQXHTQaIEJZIEJ"
 };
 
 export const p5_167_fashion__style = {
@@ -1411,7 +1489,10 @@ export const p5_167_fashion__style = {
     ["un hilo", "a thread", "一条线", "yì tiáo xiàn", "um fio"],
     ["la aguja", "the needle", "针", "zhēn", "a agulha"],
     ["una aguja", "a needle", "一根针", "yī gēn zhēn", "uma agulha"]
-  ]
+  ],
+  accentFree: {"0": "disenador", "1": "disenadora", "14": "patron", "17": "el disenador", "18": "un disenador", "19": "la disenadora", "20": "una disenadora", "45": "el patron", "46": "un patron"},
+  pinyinUnits: {},
+  distractors: "BRSTATRSVWJNXHVWZ*Mm*MAacIMdKQCJfDVWhiFMCNOvGQCJnoAEpqFI*V5rsCtuCJGKQCGKCJSABTRAUBUBRSTSBRWCDHVCDHDYBfXDTaaE*MlRZE*KV*OYcUTYFAEL*FMeGFdDHVgHBXfHRSiI*OTAhI*OUA*UI*VP*XnlBXfA*FK*Cs*JU*UI*FL*Ct*JV*UJoLRSnLRSqMAEpMAEsNDHrNDHuODHtODH*IYw*VbP*IZvPCyQFIxDHV"
 };
 
 export const p5_168_reaching__alcanzar = {
@@ -1455,7 +1536,10 @@ export const p5_168_reaching__alcanzar = {
     ["una meta", "a goal", "一个目标", "yí gè mù biāo", "um gol"],
     ["el objetivo", "the goal", "目标", "mù biāo", "o objetivo"],
     ["un objetivo", "a goal", "一个目标", "yí gè mù biāo", "um gol"]
-  ]
+  ],
+  accentFree: {"4": "alcanzais", "12": "tu alcanzas", "14": "el alcanza", "18": "vosotros alcanzais", "19": "lo alcanzais"},
+  pinyinUnits: {},
+  distractors: "CHBFFGCAABFGBREFBTDFBGCABFCAAC*HTYaACHcdBFLPAOKPNVNBVOVPMLPCKLLNVK*At*AQ*Jo*LgDNTV*Av*AS*Jq*LiNERVV*Ax*AU*JsNPLF*Az*AW*Ju*Lm*GP*A0*Rn*AX*HlHOZYHDM*BF*MNbI*Gy*BlaAdJDMcJDM"
 };
 
 export const p5_169_maintaining__mantener = {
@@ -1499,7 +1583,10 @@ export const p5_169_maintaining__mantener = {
     ["en conservación", "in conservation", "保护", "bǎo hù", "em conservação"],
     ["la preservación", "preservation", "保存", "bǎo cún", "preservação"],
     ["para preservación", "for preservation", "用于保存", "yòng yú bǎo cún", "para preservação"]
-  ]
+  ],
+  accentFree: {"4": "manteneis", "8": "conservacion", "9": "preservacion", "12": "tu mantienes", "14": "el mantiene", "18": "vosotros manteneis", "19": "lo manteneis", "26": "la conservacion", "27": "en conservacion", "28": "la preservacion", "29": "para preservacion"},
+  pinyinUnits: {},
+  distractors: "GKLCFCGMBFGOR*EIBETB*EJABCGVACBFYZ*MvIab*BJ*IBcI*SgdLA*EPDKAP*EQNBV*ERVPMBPC*ETBNVOC*EVS*Cg*XdD*EWNT*EXQ*Ci*XfEN*EYL*EZVNPNPFM*EbUab*EcGIJHZ*NA*CKYHdSbI*Bs*IUaI*IVUJad*SycJZS"
 };
 
 export const p5_170_psychology__terms = {
@@ -1573,7 +1660,10 @@ export const p5_170_psychology__terms = {
     ["una psicosis", "a psychosis", "精神病", "jīng shén bìng", "uma psicose"],
     ["la fobia", "the phobia", "恐惧症", "kǒng jù zhèng", "a fobia"],
     ["una fobia", "a phobia", "恐惧症", "kǒng jù zhèng", "uma fobia"]
-  ]
+  ],
+  accentFree: {"0": "psicologia", "1": "psicologo", "2": "psicologa", "12": "sesion", "16": "depresion", "20": "la psicologia", "21": "de psicologia", "22": "el psicologo", "23": "un psicologo", "24": "la psicologa", "25": "una psicologa", "44": "la sesion", "45": "una sesion", "52": "la depresion", "53": "con depresion"},
+  pinyinUnits: {},
+  distractors: "CUVBCWXABAYWaI6FcdgoeKPRghUV*Ga*KEijklD6mnWXFPRSAey2*TAsHD*NITHMwxmnyFKR0*WA1B2FKP4FKPNHMDVYAZUA*MeYXBYCWZBYUZCWXYCUDb*IkBaJWXdEqhcEqhFfALeFGUGhEogGwEj*KmHF*G2i*KnHlI*G1BkIBCnJ*Mv*XHmJ*Mv*XI*G5*UG*GOE*G6*QZ*UH*JvrcdhLEgot*TcMFs*Td*V4*S1*Cs*JU*OF*Ef*NY*Ct*JV*OGOxhEwOcdPzALyPJWQ1*WRJ0QGU3RAL2RJW5SAL4SJW7TDI6FKP"
 };
 
 export const p5_171_solving__resolver = {
@@ -1617,7 +1707,10 @@ export const p5_171_solving__resolver = {
     ["hay que despejar el camino", "you have to clear the path", "必须清除路径", "bì xū qīng chú lù jìng", "o caminho deve ser limpo"],
     ["desentrañar el misterio", "to unravel the mystery", "揭开谜底", "jiē kāi mí dǐ", "desvende o mistério"],
     ["difícil de desentrañar", "difficult to unravel", "难以解开", "nán yǐ jiě kāi", "difícil de desvendar"]
-  ]
+  ],
+  accentFree: {"4": "resolveis", "9": "desentranar", "12": "como resuelves los conflictos", "13": "tu resuelves todo rapido", "14": "el lo resuelve todo", "18": "como lo resolveis", "19": "lo resolveis muy bien", "23": "dificil de resolver", "28": "desentranar el misterio", "29": "dificil de desentranar"},
+  pinyinUnits: {},
+  distractors: "CBFGFCAGABFGEGHBDGBFBCAG*C5ACI*VjDBEACGBDHBEMZQWNUYcZKWQLUYcaSXTRbLNKMZWPbLNOaXTVXOaLNYcTdLNMPRZOTaSLNUcMKWQOSXTPRLNLNUYLNUV"
 };
 
 export const p5_172_avoiding__evitar = {
@@ -1661,7 +1754,10 @@ export const p5_172_avoiding__evitar = {
     ["con prevención", "with prevention", "预防", "yù fáng", "com prevenção"],
     ["la evasión", "evasion", "逃避", "táo bì", "evasão"],
     ["una evasión", "an escape", "一种逃避", "yī zhǒng táo bì", "uma fuga"]
-  ]
+  ],
+  accentFree: {"4": "evitais", "8": "prevencion", "9": "evasion", "12": "tu evitas", "14": "el evita", "18": "vosotros evitais", "19": "lo evitais", "26": "la prevencion", "27": "con prevencion", "28": "la evasion", "29": "una evasion"},
+  pinyinUnits: {},
+  distractors: "CBFGFGC*UzABFGBRHMBTJKBGC*UzBF*UzCDMNVaHbRcEKLLP*VlAKP*VmNNBDHVPMLPCEJLNVK*LC*PD*Vr*AQDNTV*LE*PF*AS*NTNERV*LG*VvVINPLF*LI*PJ*Vx*AW*VQ*LJ*JV*OG*CM*VN*Fw*Ef*CN*Cn*VO*EcIb*H94aIWYdJ*TY*A1c*TZ*A2*Rr"
 };
 
 export const p5_173_journalism__terms = {
@@ -1729,7 +1825,10 @@ export const p5_173_journalism__terms = {
     ["una primicia", "a first", "一条独家新闻", "yì tiáo dú jiā xīn wén", "uma primícia"],
     ["la rueda de prensa", "the press conference", "新闻发布会", "xīn wén fā bù huì", "a conferência de imprensa"],
     ["en rueda de prensa", "at a press conference", "在新闻发布会上", "zài xīn wén fā bù huì shàng", "em uma coletiva de imprensa"]
-  ]
+  ],
+  accentFree: {"4": "redaccion", "8": "edicion", "10": "seccion", "14": "cronica", "26": "la redaccion", "27": "en la redaccion", "34": "la edicion", "35": "una edicion", "38": "la seccion", "39": "una seccion", "46": "la cronica", "47": "una cronica"},
+  pinyinUnits: {},
+  distractors: "STJVUCDHWXBD*EMYZB*Cza*Al*DL*L0cGB*UzH*Se*SYG*Uz*GdgiBCDkl*DF*DG*Cz*RKmBopSTqrBCstawuBCDwxEUycef01bsTALkSALkVBEPUBAJXCEPWCEPZ*EdDEYDEP*DLEb*DMa*DM*DL*H+*MNdFQc*OM*OWFfGQceGhQh*G7H*Gpg*G8f*GqjI*S0mi*S1n*AdlJ*DF*CqkJ*DG*Cr*DL*RqnK*DM*RrmjpLRboLRbrM*Uk*HJqM*HKEtNRbsNRbvO*MVEuOAJxPNawPLSzQAJyQNa1Rop0Rop"
 };
 
 export const p5_174_supposing__suponer = {
@@ -1773,7 +1872,10 @@ export const p5_174_supposing__suponer = {
     ["voy a imaginar", "I'm going to imagine", "我会想象", "wǒ huì xiǎng xiàng", "Vou imaginar"],
     ["hay que asumir", "we have to assume", "我们必须假设", "wǒ men bì xū jiǎ shè", "temos que assumir"],
     ["voy a asumir", "I will assume", "我会假设", "wǒ huì jiǎ shè", "eu vou assumir"]
-  ]
+  ],
+  accentFree: {"4": "suponeis", "7": "suposicion", "12": "tu supones", "14": "el supone", "18": "vosotros suponeis", "19": "lo suponeis", "24": "la suposicion", "25": "una suposicion"},
+  pinyinUnits: {},
+  distractors: "BFGCFGCABFGABREABTIOBGCABFCAYZTdEOPACABFLANVKNVPNBVOVPLMPCEINVOL*EVS*D3*CCDNTL*EXQ*D5*CENELRV*D7NPNPLF*Eb*D9ZU*CNRHTZH*XlUYH*XmW*Rm*OF*RsW*GL*Rn*NY*OG*Xn*P0*GO*Ka*Xo*P1HT"
 };
 
 export const p5_175_meaning__significar = {
@@ -1817,7 +1919,10 @@ export const p5_175_meaning__significar = {
     ["con sentido", "with meaning", "有意义", "yǒu yì yì", "com significado"],
     ["la definición", "the definition", "定义", "dìng yì", "a definição"],
     ["una definición", "a definition", "一个定义", "yí gè dìng yì", "uma definição"]
-  ]
+  ],
+  accentFree: {"4": "significais", "9": "definicion", "11": "que significo", "12": "tu significas", "13": "que significas", "14": "el significa", "15": "que significa", "17": "que significamos", "18": "vosotros significais", "19": "que significais", "21": "que significan", "28": "la definicion", "29": "una definicion"},
+  pinyinUnits: {},
+  distractors: "CBFGFGCAABFGHBEFBHDFBGCABFCABDFGaACBcdBFAOLCPNVKBNOFVPLTCKBFLNVOS*Jo*M2*JKNTVDQ*Jq*M4WNRVLVYOFNPLTXNVPWNVPZHODYHNVI*Tg*DV*P6aIBFdJ*A3*WRcJ*A4*WS"
 };
 
 export const p5_176_photography__terms = {
@@ -1882,7 +1987,10 @@ export const p5_176_photography__terms = {
     ["un trípode", "a tripod", "三脚架", "sān jiǎo jià", "um tripé"],
     ["el filtro", "the filter", "滤镜", "lǜ jìng", "o filtro"],
     ["un filtro", "a filter", "一个过滤器", "yí gè guò lǜ qì", "um filtro"]
-  ]
+  ],
+  accentFree: {"0": "fotografo", "1": "fotografa", "15": "tripode", "17": "el fotografo", "18": "un fotografo", "19": "la fotografa", "20": "una fotografa", "47": "el tripode", "48": "un tripode"},
+  pinyinUnits: {},
+  distractors: "BRSTATRSVGLQIbCGZPXhODIb*EsdCLfgABiDbCKVYd*CXJVY*Se*S8*SZ*SdpqABrsABDFIbvwEXxyCGSATBRUATUBRSSTBRWCJKVCABDEPhJKVdEaABZRSTDICGCGLQ*FGGeJdoABHgRSfHUkiIEPI*J3hC*Ka*Bg*Csl*Kb*Bh*AX*Ct*CM*Sw*Fw*Ef*Cn*CN*Sx*Fx*JU*OF*Ef*FK*Sv*JV*OGeqMRSpMRSsNRSrNRSOCGLEPXhwPABvPAByQJKxQJK"
 };
 
 export const p5_177_choosing__elegir = {
@@ -1926,7 +2034,10 @@ export const p5_177_choosing__elegir = {
     ["voy a seleccionar", "I'm going to select", "我要选择", "wǒ yào xuǎn zé", "Vou selecionar"],
     ["la opción", "the option", "选项", "xuǎn xiàng", "a opção"],
     ["una opción", "an option", "一个选项", "yí gè xuǎn xiàng", "uma opção"]
-  ]
+  ],
+  accentFree: {"4": "elegis", "9": "opcion", "12": "tu eliges", "14": "el elige", "18": "vosotros elegis", "19": "lo elegis", "28": "la opcion", "29": "una opcion"},
+  pinyinUnits: {},
+  distractors: "CBEFFCEMBFAERMNTBGTFBCVEEBFJKLOP*SBUZRcBEFL*SiAHK*SjPANBDTVPMTPCHKNVLO*So*EV*JKuDTXI*JMwQYNEDM*Ss*JOyVNPFD*Su*Eb*JQ0*Xo*P1RI*XnSWIIURW*MX*W5bQ*MYI*W6adJDMc*Rr*TZ*Td"
 };
 
 export const p5_178_deciding__decidir = {
@@ -1970,7 +2081,10 @@ export const p5_178_deciding__decidir = {
     ["con determinación", "with determination", "坚决", "jiān jué", "com determinação"],
     ["la resolución", "the resolution", "决议", "jué yì", "a resolução"],
     ["una resolución", "a resolution", "一项决议", "yī xiàng jué yì", "uma resolução"]
-  ]
+  ],
+  accentFree: {"4": "decidis", "7": "decision", "8": "determinacion", "9": "resolucion", "12": "tu decides", "14": "el decide", "18": "vosotros decidis", "19": "lo decidis", "24": "la decision", "25": "una decision", "26": "la determinacion", "27": "con determinacion", "28": "la resolucion", "29": "una resolucion"},
+  pinyinUnits: {},
+  distractors: "C*Pc*C1BEFCGABFER*I9BEBFGABCEGBEFAYKLOabWd*HSc*HjdLPAHKPNTNB*JGTTVPMPCHKLNVK*JK*EV*Oo*SoD*JLNT*JM*VtQ*OqNVLP*JO*EZ*VvVNPTL*JQ*Eb*Ou*Su*JRRZJZH*Ac*RyY*Ad*S1*TZIb*A3*UmaIQS*HjdJ*Hk*HkcJ*DM"
 };
 
 export const p5_179_marketing__advertising = {
@@ -2038,7 +2152,10 @@ export const p5_179_marketing__advertising = {
     ["buena reputación", "good reputation", "良好的信誉", "liáng hǎo de xìn yù", "boa reputação"],
     ["la fidelización", "loyalty", "忠诚", "zhōng chéng", "lealdade"],
     ["para fidelización", "for loyalty", "为了忠诚", "wèi le zhōng chéng", "por lealdade"]
-  ]
+  ],
+  accentFree: {"3": "campana", "11": "promocion", "16": "reputacion", "17": "fidelizacion", "24": "la campana", "25": "una campana", "40": "la promocion", "41": "en promocion", "50": "la reputacion", "51": "buena reputacion", "52": "la fidelizacion", "53": "para fidelizacion"},
+  pinyinUnits: {},
+  distractors: "STLWKU*GcVWXDFYCFMMabCcdCDefBHghBGLJPSklIPB*GcGHop*AI*HvqrabstqruvjzwxIJy*AH*LZB01UeTAIJSAIJBVKRUBhkXC*IwAWC*IxAZDALYDBGbEMCaEMCdFALcFALfGRUeGRUhH*KqRgH*KrV*V1j*CM*VNI*V2i*CNlJ*MLVkJVh*G5*H/n1*G6K0OpL*AI*AaoL*H+IrMNAqMNAt*CwN*DFsN*DG*FVOvimuOimxP*RkVwP*RlVQ*AY*Ls*AHy*AZQOR1nO0RmO"
 };
 
 export const p5_180_appearing__aparecer = {
@@ -2082,5 +2199,8 @@ export const p5_180_appearing__aparecer = {
     ["voy a surgir", "I will arise", "我会出现", "wǒ huì chū xiàn", "Eu irei surgir"],
     ["hay que manifestarse", "you have to demonstrate", "你必须表明立场", "nǐ bì xū biǎo míng lì chǎng", "você tem que demonstrar"],
     ["para manifestarse", "to manifest", "体现", "tǐ xiàn", "manifestar"]
-  ]
+  ],
+  accentFree: {"4": "apareceis", "7": "aparicion", "12": "tu apareces", "14": "el aparece", "18": "vosotros apareceis", "19": "siempre apareceis", "24": "la aparicion", "25": "una aparicion"},
+  pinyinUnits: {},
+  distractors: "CKBFFGCEBFGAB*B1EFB*B2DFBGCABFCAYFZECABFdXZaA*B8DMPNVTB*B+OFVPTRC*CABFNVLT*CCS*Oo*CgNTVP*CEQ*Oq*CiNRVP*CGJPWNPLT*CI*OuPL*CJ*OvGJZHDJYH*Ad*DM*UI*Cs*P0*FK*UJ*Vy*Ct*JRdJQRJcTL"
 };
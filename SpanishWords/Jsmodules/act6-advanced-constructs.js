@@ -51,7 +51,10 @@ export const p6_181_disappearing__desaparecer = {
     ["sin perderse", "without getting lost", "不会迷路", "bú huì mí lù", "sem se perder"],
     ["hay que esfumarse", "you have to disappear", "你必须消失", "nǐ bì xū xiāo shī", "você tem que desaparecer"],
     ["antes de esfumarse", "before disappearing", "消失之前", "xiāo shī zhī qián", "antes de desaparecer"]
-  ]
+  ],
+  accentFree: {"4": "desapareceis", "7": "desaparicion", "12": "tu desapareces", "14": "el desaparece", "18": "vosotros desapareceis", "19": "nunca desapareceis", "24": "la desaparicion", "25": "una desaparicion"},
+  pinyinUnits: {},
+  distractors: "CKBFFGCEBFGABEFGBDFGBGCABFCAYFZEJCABCIABAOCDPNVTBOFGVPTRCBFGNVLTS*JN*Iv*ThNTVPQ*JP*Ix*TjNRVPVO*JRFNPLTTLNRGPNVZHaDYH*R1VYDKMIABF*WU*Hk*HiPLNUV"
 };
 
 export const p6_182_telecommunications = {
@@ -125,7 +128,10 @@ export const p6_182_telecommunications = {
     ["un operador", "an operator", "运营商", "yùn yíng shāng", "um operador"],
     ["el proveedor", "the supplier", "供应商", "gōng yìng shāng", "o fornecedor"],
     ["un proveedor", "a supplier", "供应商", "gōng yìng shāng", "um fornecedor"]
-  ]
+  ],
+  accentFree: {"8": "marcacion", "10": "buzon", "11": "extension", "36": "la marcacion", "37": "con marcacion", "40": "el buzon", "41": "un buzon", "42": "la extension", "43": "una extension", "53": "mas ancho de banda"},
+  pinyinUnits: {},
+  distractors: "VUd1JDKPZSbgKPRWcdQfefILghHXiGXmk*GN*M8*EF*F4BDKDPRWq*Cs*FD*Jtst*ScZuv*HHYwaopDKRW01EfDKPW45Cb67*HvFVAd1AUd1DKPRGHmnZCNeCYMxDOopCSghdE0tcE10FfNYeFEQhGCSgGCSjHCSi*PNHFIl*NO*EXkI*GU*SB*GPnJG*GQmJGpKOaoKOarL*FU*KSq*KT*CtLtM*SzEsM*S0uvN*KM*VguNtEOxFIwOMZCSbgCSbgQ1cd0QdcROao*XWCSb5S*IB*IF4S*IC*IG7T*ILN6T*IMN"
 };
 
 export const p6_183_birthdays__fulfilling__cumplir = {
@@ -169,7 +175,10 @@ export const p6_183_birthdays__fulfilling__cumplir = {
     ["en cumplimiento", "in compliance", "遵守", "zūn shǒu", "em conformidade"],
     ["la celebración", "the celebration", "庆祝活动", "qìng zhù huó dòng", "a celebração"],
     ["una celebración", "a celebration", "庆祝活动", "qìng zhù huó dòng", "uma celebração"]
-  ]
+  ],
+  accentFree: {"4": "cumplis", "7": "cumpleanos", "9": "celebracion", "12": "tu cumples", "14": "el cumple", "18": "vosotros cumplis", "19": "hoy cumplis", "24": "el cumpleanos", "25": "feliz cumpleanos", "28": "la celebracion", "29": "una celebracion"},
+  pinyinUnits: {},
+  distractors: "CBEFEFCGABFEHBEGBFGABCEGBEFAYDBNab*KbRcdXHLAOBPKNTBNOETVPLCKBDLNVT*VY*KkS*G8NTDL*Va*KmQ*G+NVLP*M0*KoVINPTL*VecIR*J9JHIHZIRYHSabI*KsdaIdSdJWIcJab"
 };
 
 export const p6_184_missing__lacking__faltar = {
@@ -210,7 +219,10 @@ export const p6_184_missing__lacking__faltar = {
     ["una ausencia", "an absence", "缺席", "quē xí", "uma ausência"],
     ["la carencia", "the lack", "缺乏", "quē fá", "a falta"],
     ["una carencia", "a lack", "缺乏", "quē fá", "uma falta"]
-  ]
+  ],
+  accentFree: {"4": "faltais", "11": "tu faltas", "13": "el falta", "17": "vosotros faltais", "18": "nunca faltais"},
+  pinyinUnits: {},
+  distractors: "CBFGFGCAABFGBHILBJNDBGCABFCAXDILZDHLAENBMSQXBDHIKSQTCEJBUSMQ*Db*FKR*FmMSKU*Dd*FMP*FoMQKO*DfMVYOQWSWMTYVQUOYHZ*HGXaHMaIXKZYIM"
 };
 
 export const p6_185_tourism__terms = {
@@ -281,7 +293,10 @@ export const p6_185_tourism__terms = {
     ["un safari", "a safari", "野生动物观赏之旅", "yě shēng dòng wù guān shǎng zhī lǚ", "um safári"],
     ["el crucero", "the cruise", "邮轮", "yóu lún", "o cruzeiro"],
     ["un crucero", "a cruise", "游轮", "yóu lún", "um cruzeiro"]
-  ]
+  ],
+  accentFree: {"0": "atraccion", "3": "pension", "5": "guia", "14": "cabana", "15": "tienda de campana", "19": "la atraccion", "20": "una atraccion", "25": "la pension", "26": "una pension", "29": "el guia", "30": "un guia", "47": "la cabana", "48": "una cabana", "49": "la tienda de campana", "50": "una tienda de campana"},
+  pinyinUnits: {},
+  distractors: "T*GO*GN*M8*QS*QTVWXYNOZGSCbcJXCNORDSCEhiKajkABlEXYnoHapqTVrsABtCOR*NIvCNxyfpz0AB12CN34DGUA*NO*RaT*RbA*GOWB*QTLVBLTYCEJXCEJaD*Ap*GhZ*SX*BJDcEHKbEHKeFCNdFCN*L1*RO*U9*WYLTVWiHUnhHUnkILTjILTmJ*NmHlJLToKUhnKUhqL*V9fpLfUsMLTrMLTuNEJtNAB*NmwOEvOAByPfpxPfp0QLTzQLT2REJ1REJ4S*Ef*M43S*Eg*M5"
 };
 
 export const p6_186_noticing__notar = {
@@ -322,7 +337,10 @@ export const p6_186_noticing__notar = {
     ["una percepción", "a perception", "一种看法", "yī zhǒng kàn fǎ", "uma percepção"],
     ["hay que percibir", "you have to perceive", "你必须感知", "nǐ bì xū gǎn zhī", "você tem que perceber"],
     ["voy a percibir", "I will perceive", "我会察觉", "wǒ huì chá jué", "eu perceberei"]
-  ]
+  ],
+  accentFree: {"4": "notais", "7": "percepcion", "11": "tu notas", "13": "el nota", "17": "vosotros notais", "18": "lo notais", "23": "la percepcion", "24": "una percepcion"},
+  pinyinUnits: {},
+  distractors: "CBFGFGCAABFGBQLMBSJKBGCABFCAXYTVhSDLKOAEJOMUMBDUUOLKOCEJKMUJ*CH*FKR*XgDM*XTS*CJ*FMP*XiMEID*CL*FOUHMOKFHTQW*Wb*RN*FR*KHYH*OK*BCXHRZ*Wm*XM*WcRy*Wn*XN*Wd"
 };
 
 export const p6_187_allowing__permitir = {
@@ -366,7 +384,10 @@ export const p6_187_allowing__permitir = {
     ["una autorización", "an authorization", "授权", "shòu quán", "uma autorização"],
     ["el consentimiento", "consent", "同意", "tóng yì", "consentimento"],
     ["con consentimiento", "with consent", "经同意", "jīng tóng yì", "com consentimento"]
-  ]
+  ],
+  accentFree: {"4": "permitis", "8": "autorizacion", "12": "tu permites", "14": "el permite", "18": "vosotros permitis", "19": "lo permitis", "26": "la autorizacion", "27": "una autorizacion"},
+  pinyinUnits: {},
+  distractors: "CHBEEFCGABFHRBEGBFGABCEG*DUBEFACYBabRXcdWaLPAOKPNTNBTVTVPMPCKLLNVK*G8S*Fm*BqDNTL*G+Q*JP*BsNVLPV*HA*JRNNPTLJaUb*Dm*Wn*XN*WdHKLOYIRXbIJWaI*CnJJdSbcJQS"
 };
 
 export const p6_188_manufacturing__terms = {
@@ -434,7 +455,10 @@ export const p6_188_manufacturing__terms = {
     ["en inventario", "in inventory", "库存中", "kù cún zhōng", "em estoque"],
     ["el almacenamiento", "storage", "存储", "cún chǔ", "armazenamento"],
     ["en almacenamiento", "in storage", "储存中", "chǔ cún zhōng", "em armazenamento"]
-  ]
+  ],
+  accentFree: {"0": "fabricacion", "1": "fabrica", "2": "linea", "7": "estandar", "18": "la fabricacion", "19": "en fabricacion", "20": "la fabrica", "21": "una fabrica", "22": "la linea", "23": "una linea", "32": "el estandar", "33": "un estandar"},
+  pinyinUnits: {},
+  distractors: "ST*AmYUEFGOBEFEHPXD*NyabcBEG*Qu*RI*RJeghDPi*G0jLKUabmnJUopIN*SlqrBstILCBEFwxDHyzIL01STTA*BC*CmSAjlVB*BUJUBILXCBEWDHPZDAmYbDAbE*DKDaE*DLDFd*NmJcFIL*RIfG*Mb*RJeG*MchHILgHILI*HEjniI*Jq*Ar*R4*Cyl*ROJSTjnKAYmKiopLinoLinr*TFMJqMJKtNinsNinvOBEuDHPxPILwPILzQinyQin1R*Tp*L90RkS"
 };
 
 export const p6_189_achieving__lograr = {
@@ -475,7 +499,10 @@ export const p6_189_achieving__lograr = {
     ["con éxito", "successfully", "成功", "chéng gōng", "com sucesso"],
     ["la obtención", "obtaining", "获得", "huò dé", "obtenção"],
     ["para obtención", "to obtain", "获得", "huò dé", "para obter"]
-  ]
+  ],
+  accentFree: {"4": "lograis", "7": "exito", "8": "obtencion", "11": "tu logras", "13": "el logra", "17": "vosotros lograis", "18": "lo lograis", "23": "el exito", "24": "con exito", "25": "la obtencion", "26": "para obtencion"},
+  pinyinUnits: {},
+  distractors: "CHBFFGCAABFGBQLMBSJKBGCABFCAACBFZ*ApSDKOAEJOMUMBDUUOLKOCEJKMUJ*Db*CH*KkRDM*DcS*Dd*CJP*XiME*DeQ*DfUZQMOKF*Ve*Xm*WVT*Wb*Di*L2*RN*JVHEJ*JWDLMI*BIaTZ*N5IV"
 };
 
 export const p6_190_performing__realizar = {
@@ -519,7 +546,10 @@ export const p6_190_performing__realizar = {
     ["en ejecución", "running", "运行", "yùn xíng", "correndo"],
     ["el desempeño", "performance", "性能", "xìng néng", "desempenho"],
     ["buen desempeño", "good performance", "良好的表现", "liáng hǎo de biǎo xiàn", "bom desempenho"]
-  ]
+  ],
+  accentFree: {"4": "realizais", "7": "realizacion", "8": "ejecucion", "9": "desempeno", "12": "tu realizas", "14": "el realiza", "18": "vosotros realizais", "19": "lo realizais", "24": "la realizacion", "25": "en realizacion", "26": "la ejecucion", "27": "en ejecucion", "28": "el desempeno", "29": "buen desempeno"},
+  pinyinUnits: {},
+  distractors: "CBFGFGCAABFGBREFBTDFBGCABFCAYZ*NPFabEJtcEILPAOKPNVNBVOVPMLPCKLLNVKS*CH*D3*P6DNTVQ*CJ*UB*XiNERVV*CLNPNPLFUYZd*J/*U+*KH*L2ZHV*NOYH*JeUbIHTaIHT*GlJdHcJUY"
 };
 
 export const p6_191_economics__terms = {
@@ -590,7 +620,10 @@ export const p6_191_economics__terms = {
     ["con competitividad", "with competitiveness", "具有竞争力", "jù yǒu jìng zhēng lì", "com competitividade"],
     ["el activo", "the asset", "资产", "zī chǎn", "o ativo"],
     ["un activo", "an asset", "一项资产", "yī xiàng zī chǎn", "um ativo"]
-  ]
+  ],
+  accentFree: {"0": "economia", "3": "accion", "5": "credito", "6": "inflacion", "10": "deficit", "11": "superavit", "13": "recesion", "19": "la economia", "20": "en la economia", "25": "la accion", "26": "una accion", "29": "el credito", "30": "un credito", "31": "la inflacion", "32": "con inflacion", "39": "el deficit", "40": "en deficit", "41": "el superavit", "42": "en superavit", "45": "la recesion", "46": "en recesion"},
+  pinyinUnits: {},
+  distractors: "TINZVWATMlDEZHSb*AnCJMdeKXf*QrgLhDSbANZhECMlnoFXpqGPClDE*SDtuAvwfp*FfxyGz0vR12jw34DHAUBtTAVWWB*IRUVB*ISUCYFKXGLPaDAIZ*CT*Qr*PX*BEcED*BFbEDeF*JV*FSdFGLG*RCgOfG*BDUiHAIh*RHHG*WYRwQ*VfIUVmCMDlDHSoKGLnKGLqLOfpLOfsMFKrAINu*SWN*CstNBTOw*I5QvORj*FyPyOxPUVQ0RjzQ12R20z1R0z4SAI3SAI"
 };
 
 export const p6_192_existing__existir = {
@@ -631,7 +664,10 @@ export const p6_192_existing__existir = {
     ["en existencia", "in stock", "有现货", "yǒu xiàn huò", "em estoque"],
     ["la presencia", "the presence", "在场", "zài chǎng", "a presença"],
     ["con presencia", "with presence", "有在场", "yǒu zài chǎng", "com presença"]
-  ]
+  ],
+  accentFree: {"4": "existis", "10": "si existo", "11": "tu existes", "12": "si existes", "13": "el existe", "16": "si existimos", "17": "vosotros existis", "18": "si existis"},
+  pinyinUnits: {"10": "12111", "12": "12111", "16": "121111", "18": "12111"},
+  distractors: "C*FCBEEFCGABFEQBEGBFGABCEGBEFA*H1XY*ENZ*B/*ImaKOANJMSAMBSUSLKBOCJKUJNC*D3R*Bq*P6DMSK*D5P*Bs*P8MKEL*D7UVXOFLMWTXYVQZHYH*IX*EnXH*H1*IYI*CPa*I3*ArZ*I4I"
 };
 
 export const p6_193_depending__depender = {
@@ -675,7 +711,10 @@ export const p6_193_depending__depender = {
     ["para basarse", "to rely on", "依靠", "yī kào", "confiar"],
     ["hay que apoyarse", "you have to support yourself", "你必须依靠别人", "nǐ bì xū yī kào bié rén", "você tem que se sustentar"],
     ["sin apoyarse", "without supporting", "没有支撑", "méi yǒu zhī chēng", "sem apoiar"]
-  ]
+  ],
+  accentFree: {"4": "dependeis", "12": "tu dependes", "14": "el depende", "18": "vosotros dependeis", "19": "no dependeis"},
+  pinyinUnits: {},
+  distractors: "CBFGFGC*OWABFG*OTBRE*OUBTDBGC*OWBF*OWCYFZTACBFBFGAL*OaAOKNVAN*OcBVVMLT*OeCKLNVKL*OgS*JN*Mw*OhDNT*OiQ*JP*My*OjNER*Ok*JR*M0PNLFMX*JT*M2UW*M3UYHZ*I3UYHcUcUWXHTdDa*WUZUJHTb"
 };
 
 export const p6_194_retail__sales = {
@@ -746,7 +785,10 @@ export const p6_194_retail__sales = {
     ["buen surtido", "good assortment", "品种齐全", "pǐn zhǒng qí quán", "bom sortimento"],
     ["el suministro", "the supply", "供应", "gōng yìng", "o fornecimento"],
     ["un suministro", "a supply", "供应", "gōng yìng", "um suprimento"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "TCJnVWPUDXYACZXYFbcGEdbcfgE*AwhiFSjRzAlmACnoLIpqKINrsDMtuDvw*Owa*G0*HE*HFxKLIR1IzA34*JdFUAFHTABPWBTeVBeOYCDZXCaDaDXYZYDXcEf*BWbEegeFbcdcF*UwgGb*BWfGc*BXiHOahHOakIDEjIFHmJ*BYFlJ*BZFoKACnKACqLACpLACstMBruMBruNBstNBwOxyvOxy*HEyP*HFx*HFP*HEQIRAACJnR2DE1BPU4S*JyO3S*JzO"
 };
 
 export const p6_195_belonging__pertenecer = {
@@ -790,7 +832,10 @@ export const p6_195_belonging__pertenecer = {
     ["una propiedad", "a property", "财产", "cái chǎn", "uma propriedade"],
     ["el miembro", "the member", "会员", "huì yuán", "o membro"],
     ["un miembro", "a member", "会员", "huì yuán", "um membro"]
-  ]
+  ],
+  accentFree: {"4": "perteneceis", "12": "tu perteneces", "14": "el pertenece", "18": "vosotros perteneceis", "19": "le perteneceis"},
+  pinyinUnits: {},
+  distractors: "CKLBFGCEBFGABREFBTHDBGCVBFCAYEABabCccdCILAOPKPANNBVOVPMTPCBFNVOLSu*Th*XCDNTVQw*Tj*XENERVVy*Ok*TlNPFL*Tn*XI*OI*OmGRZTHZ*HG*HgY*HHH*ArbIEHaI*LwDdJCIcJCI"
 };
 
 export const p6_196_deserving__merecer = {
@@ -834,7 +879,10 @@ export const p6_196_deserving__merecer = {
     ["un merecimiento", "a deserved", "当之无愧的", "dāng zhī wú kuì de", "um merecido"],
     ["la dignidad", "dignity", "尊严", "zūn yán", "dignidade"],
     ["con dignidad", "with dignity", "有尊严地", "yǒu zūn yán dì", "com dignidade"]
-  ]
+  ],
+  accentFree: {"4": "mereceis", "7": "merito", "12": "tu mereces", "14": "el merece", "18": "vosotros mereceis", "19": "lo mereceis", "24": "el merito", "25": "con merito"},
+  pinyinUnits: {},
+  distractors: "CKLBFGCEBFGABREFBTJOBGCVBFCA*FCYCAab*Vt*QncEOPLA*P0PKPANNBV*P2VPMTPCEJNVOL*Mw*P6*HYSDNTV*My*HaQ*OiNERV*P+V*M0*D7NPFL*MfX*M2*HeWRdI*FSHEJ*FTYHDbI*Q6*TpaI*Q7*TqJdTDcJRX"
 };
 
 export const p6_197_insurance__terms = {
@@ -905,7 +953,10 @@ export const p6_197_insurance__terms = {
     ["una franquicia", "a deductible", "免赔额", "miǎn péi é", "uma franquia"],
     ["la exclusión", "exclusion", "排除", "pái chú", "exclusão"],
     ["una exclusión", "an exclusion", "排除", "pái chú", "uma exclusão"]
-  ]
+  ],
+  accentFree: {"1": "poliza", "3": "indemnizacion", "18": "exclusion", "21": "la poliza", "22": "una poliza", "25": "la indemnizacion", "26": "una indemnizacion", "55": "la exclusion", "56": "una exclusion"},
+  pinyinUnits: {},
+  distractors: "NIVfVGHJXY*H4LZa*FvdbcOPNdAe*QzfgB/*MJ*QwBAVfglmBGnoZypqCNABGHAFtuvwECxy*HH*Arz0Tb12iC3*Ap4C*Ni*S1*WU*RM*Nj*S2*Vf*FRWBAIV*E0BCYC*IdFXC*IeFaD*FuKZDzKcEvQbEwQeFtudFuQgGAIf*LsGA*RM*Wc*WQE*RN*Bx*VfRr*U9QT*Fts*U+ImJAIlJAIKo0anK0aqLFXpLFX*S1*U9*Wa*L1*S2*U+*Di*WbuNFXtNeFwObFvOcFyP*BMQxPKZQ0aKzQna2REP1RDd4S*BIF3*BJSE"
 };
 
 export const p6_198_suffering__sufrir = {
@@ -949,7 +1000,10 @@ export const p6_198_suffering__sufrir = {
     ["no debe padecer", "should not suffer", "不应该受苦", "bù yīng gāi shòu kǔ", "não deveria sofrer"],
     ["la agonía", "the agony", "痛苦", "tòng kǔ", "a agonia"],
     ["sin agonía", "without agony", "没有痛苦", "méi yǒu tòng kǔ", "sem agonia"]
-  ]
+  ],
+  accentFree: {"4": "sufris", "9": "agonia", "12": "tu sufres", "14": "el sufre", "18": "vosotros sufris", "19": "no sufris", "28": "la agonia", "29": "sin agonia"},
+  pinyinUnits: {},
+  distractors: "CBEFEFCGABFE*VMRMNBFGABCEG*JiBEFYZUWKLOPcBEFLPAIKPNTNBDTTVPMPCIKLNVK*VY*FK*Bq*MwD*MGNT*Va*BsQZNVLP*M0*VcHWNPTL*MZHURWHUYHZ*B0aYHSa*U/*Wo*WSYYaSXJDMNcJDM"
 };
 
 export const p6_199_enjoying__disfrutar = {
@@ -993,7 +1047,10 @@ export const p6_199_enjoying__disfrutar = {
     ["con goce", "with enjoyment", "享受", "xiǎng shòu", "com prazer"],
     ["el placer", "the pleasure", "乐趣", "lè qù", "o prazer"],
     ["un placer", "a pleasure", "一种乐趣", "yī zhǒng lè qù", "um prazer"]
-  ]
+  ],
+  accentFree: {"4": "disfrutais", "12": "tu disfrutas", "14": "el disfruta", "18": "vosotros disfrutais", "19": "lo disfrutais"},
+  pinyinUnits: {},
+  distractors: "CHBFFGCAAHBFBREFBTDFBGCABFCAACBFJabAcdabLPAOKPNVNBVOVPMLPYCKLNVKS*CH*Rs*SKDNTVQ*CJ*Ru*SMNERVVNPRNPLFURXS*CzNVPOHKLYHTD*L5IJbACHJdJACcJAC"
 };
 
 export const p6_200_real__estate__terms = {
@@ -1058,7 +1115,10 @@ export const p6_200_real__estate__terms = {
     ["un desalojo", "an eviction", "驱逐", "qū zhú", "um despejo"],
     ["el embargo", "the embargo", "扣押", "kòu yā", "o embargo"],
     ["un embargo", "an embargo", "扣押", "kòu yā", "um embargo"]
-  ]
+  ],
+  accentFree: {"18": "bienes raices"},
+  pinyinUnits: {},
+  distractors: "pqCFTUDEVWKNEBPcDZaBAMpqHdefGfdeJhijIjhiCNQbnoSYFApqrCKQtudevwBDxyCKAIJVLYkGUBZaTBZaWC*UtIVC*UuI*ROgnO*RPDLSaEDTZEDTcFCK*J7bBDeGfHdgGfgHdeefHdiIjJhkIjkJhiijJh*Cy*KG*RO*S1*FRGHhoLXgnLtu*LMq*PeMp*PfMAsNIJrNTUuO*V9*EWtO*JY*C9wPTUvPTUyQIJxQIJ"
 };
 
 export const p6_201_occurring__ocurrir = {
@@ -1102,7 +1162,10 @@ export const p6_201_occurring__ocurrir = {
     ["tiene que tener lugar", "has to take place", "必须发生", "bì xū fà shēng", "tem que acontecer"],
     ["puede acaecer", "can happen", "可能发生", "kě néng fā shēng", "pode acontecer"],
     ["suele acaecer", "usually happens", "通常会发生", "tōng cháng huì fā shēng", "geralmente acontece"]
-  ]
+  ],
+  accentFree: {"4": "ocurris", "15": "que ocurre", "18": "os ocurris", "19": "se os ocurris", "21": "que les ocurren"},
+  pinyinUnits: {},
+  distractors: "CBEFEFCGABFE*KX*KlBEBFGABCEGBEF*Ji*QuYZAaLUDBEFGOALYKNIUOBNSMTLIKMCUOCDMR*KlDSQTVaETMBSNILOMFVUPaQX*KqQcWNLQZ*RIHKY*RJHKIVQRRVaQd*JT3zc40Q"
 };
 
 export const p6_202_happening__suceder = {
@@ -1143,7 +1206,10 @@ export const p6_202_happening__suceder = {
     ["un suceso", "an event", "一个事件", "yí gè shì jiàn", "um evento"],
     ["puede acontecer", "can happen", "可能发生", "kě néng fā shēng", "pode acontecer"],
     ["suele acontecer", "usually happens", "通常会发生", "tōng cháng huì fā shēng", "geralmente acontece"]
-  ]
+  ],
+  accentFree: {"4": "sucedeis", "11": "tu sucedes", "13": "el sucede", "14": "que sucede", "17": "vosotros sucedeis", "18": "le sucedeis", "20": "que suceden"},
+  pinyinUnits: {},
+  distractors: "CHBFFGCAABFGBQ*VMEBSJKBGCABFCAACXY*WM*W4*MMDKAENJMAEMB*KgNLKSBCEJKUNCD*VY*JN*HY*KkDMSK*JP*HaP*OiMEQK*Ko*Vc*Bu*JROFSDW*JT*Mf*HeV*Mg*HfMYHEJXHEJa*MfRTZ*MgRT"
 };
 
 export const p6_203_aviation__terms = {
@@ -1211,7 +1277,10 @@ export const p6_203_aviation__terms = {
     ["una torre", "a tower", "一座塔", "yī zuò tǎ", "uma torre"],
     ["el hangar", "the hangar", "机库", "jī kù", "o hangar"],
     ["un hangar", "a hangar", "机库", "jī kù", "um hangar"]
-  ]
+  ],
+  accentFree: {"0": "aviacion", "13": "tripulacion", "18": "la aviacion", "19": "de aviacion", "44": "la tripulacion", "45": "una tripulacion"},
+  pinyinUnits: {},
+  distractors: "STCECUVMUVBWYOyAabACcdACefSTghNlJijAIkACACEFACEF*ChqrBstHlvuDyxwYuBMRD01BMTA*BC*CmSA*FdGCVBWCUBXXCUGWCVGZDPuYDGSbEGSaEGSdFGScFGSfGnpeGnpHhsegHmojIkJilIklJijjkJH*RM*Ju*PY*L1*RN*Jv*PZ*L2*U/hmt*VALef*DCrMAqMACtN*GTgsNhmvO*TZ*TrOuACxPHNPwGSzQDOyACE1RAC0RAC"
 };
 
 export const p6_204_protecting__proteger = {
@@ -1255,7 +1324,10 @@ export const p6_204_protecting__proteger = {
     ["un resguardo", "a safeguard", "保障", "bǎo zhàng", "uma salvaguarda"],
     ["hay que salvaguardar", "must be safeguarded", "必须受到保护", "bì xū shòu dào bǎo hù", "deve ser salvaguardado"],
     ["voy a salvaguardar", "I will safeguard", "我会守护", "wǒ huì shǒu hù", "eu salvaguardarei"]
-  ]
+  ],
+  accentFree: {"4": "protegeis", "7": "proteccion", "12": "tu proteges", "14": "el protege", "18": "vosotros protegeis", "19": "lo protegeis", "24": "la proteccion", "25": "con proteccion"},
+  pinyinUnits: {},
+  distractors: "*EJCKLFGCEBFGABREFBTDFBGCVBFCAYZDMabEKdRXYLAPEKPANNBVOVPMTPCBFNVLOS*JN*Mw*ThDNTVQ*JP*My*TjNERVVNPZNPFMUZJR*WnNVPHZ*Dj*FUYH*SBUbITDaITDd*JuJQJcSQ"
 };
 
 export const p6_205_defending__defender = {
@@ -1299,7 +1371,10 @@ export const p6_205_defending__defender = {
     ["un defensor", "a defender", "捍卫者", "hàn wèi zhě", "um defensor"],
     ["el custodio", "the custodian", "保管人", "bǎo guǎn rén", "o guardião"],
     ["un custodio", "a custodian", "托管人", "tuō guǎn rén", "um guardião"]
-  ]
+  ],
+  accentFree: {"4": "defendeis", "12": "tu defiendes", "14": "el defiende", "18": "vosotros defendeis", "19": "lo defendeis"},
+  pinyinUnits: {},
+  distractors: "C*HIBFFC*HJAABFG*HLRBE*HMTB*HJBC*HNA*HO*HJ*HNCIYZAGHabcdACLP*HSAKPNVN*HUBVVPMLP*HWCKLNVK*HY*JN*MwS*HZDNT*Ha*JP*MyQ*HbENR*HcVNPNPLFURXMGRMNZHBEYHabbI*EjZaI*EkZdJDKcJDK"
 };
 
 export const p6_206_logistics__shipping = {
@@ -1373,7 +1448,10 @@ export const p6_206_logistics__shipping = {
     ["una bodega", "a cargo hold", "货舱", "huò cāng", "um porão"],
     ["el depósito", "the warehouse", "仓库", "cāng kù", "o depósito"],
     ["un depósito", "a warehouse", "仓库", "cāng kù", "um depósito"]
-  ]
+  ],
+  accentFree: {"0": "logistica", "2": "distribucion", "3": "almacen", "4": "mercancia", "10": "camion", "17": "transito", "19": "deposito", "20": "la logistica", "21": "de logistica", "24": "la distribucion", "25": "en distribucion", "26": "el almacen", "27": "un almacen", "28": "la mercancia", "29": "una mercancia", "40": "el camion", "41": "un camion", "54": "en transito", "55": "de transito", "58": "el deposito", "59": "un deposito"},
+  pinyinUnits: {},
+  distractors: "UVEHWXJfYZ*Py*H0abFIcdAH*XZeDIghCWijAEklDFmnBf*SbopPRTopAEHN*WLAEHKPSDyzKS01AE23LT4KPD67LRVAciUAciXBCGWBCGZC*QEgYCghbDAEaDAEdEUVcE*U8CfF*BA*XZe*BBFBhGYZgGYZjHUViHUVlIAEkIAEnJCGmJCGp*SxKLoKLR*Ni*Xs*L1*U/*Nj*Xt*L2*VAq*Xs*Cy*KGMvCG*Wov*J8*RM*Wp*XnNtx*L5ODw*L6ODzPLRyPLR1QCG0QCG3RBJ2RBJ5SLR4SAE7TBJ6TBJ"
 };
 
 export const p6_207_reducing__reducir = {
@@ -1417,7 +1495,10 @@ export const p6_207_reducing__reducir = {
     ["una disminución", "a decrease", "减少", "jiǎn shǎo", "uma diminuição"],
     ["el recorte", "the cut", "削减", "xuē jiǎn", "o corte"],
     ["un recorte", "a cut", "一个削减", "yí gè xuē jiǎn", "um corte"]
-  ]
+  ],
+  accentFree: {"4": "reducis", "7": "reduccion", "8": "disminucion", "12": "tu reduces", "14": "el reduce", "18": "vosotros reducis", "19": "lo reducis", "24": "la reduccion", "25": "una reduccion", "26": "la disminucion", "27": "una disminucion"},
+  pinyinUnits: {},
+  distractors: "CKLBEFCGBFAERBEGBFGCBCEGBEFCYFGZa*OwbRcdABLA*JHPKPA*JINB*JJTTVPMPCABNVOL*JNS*Bq*G8DNTIQ*Bs*G+*VaNVPE*JRV*TlNNPTFaUZbIRYUZHIRYH*Cn*RDbI*PGWaISWdJDHcJDH"
 };
 
 export const p6_208_increasing__aumentar = {
@@ -1461,7 +1542,10 @@ export const p6_208_increasing__aumentar = {
     ["en alza", "on the rise", "正在上升", "zhèng zài shàng shēng", "em ascensão"],
     ["el auge", "the boom", "繁荣", "fán róng", "o boom"],
     ["en auge", "booming", "蓬勃发展", "péng bó fā zhǎn", "crescendo"]
-  ]
+  ],
+  accentFree: {"4": "aumentais", "12": "tu aumentas", "14": "el aumenta", "18": "vosotros aumentais", "19": "lo aumentais"},
+  pinyinUnits: {},
+  distractors: "CBFGFGCAABFGBREFBTDFBGCABFCAYZDMJabcIabcL*CUPAKP*CUNNBVOVPMLPCKLLNVKS*HY*Og*BqDNTVQ*Ha*Oi*MyNERVVNPRNPLFURXY*WpNVPZHRXYHRXbIcdaIcddJabcJab"
 };
 
 export const p6_209_pharmaceutical__terms = {
@@ -1529,7 +1613,10 @@ export const p6_209_pharmaceutical__terms = {
     ["una contraindicación", "a contraindication", "禁忌症", "jìn jì zhèng", "uma contra-indicação"],
     ["la interacción", "the interaction", "相互作用", "xiāng hù zuò yòng", "a interação"],
     ["una interacción", "an interaction", "相互作用", "xiāng hù zuò yòng", "uma interação"]
-  ]
+  ],
+  accentFree: {"0": "farmaceutico", "2": "pildora", "3": "capsula", "5": "inyeccion", "12": "generico", "15": "posologia", "16": "contraindicacion", "17": "interaccion", "18": "el farmaceutico", "19": "un farmaceutico", "22": "la pildora", "23": "una pildora", "24": "la capsula", "25": "una capsula", "28": "la inyeccion", "29": "una inyeccion", "42": "el generico", "43": "un generico", "48": "la posologia", "49": "una posologia", "50": "la contraindicacion", "51": "una contraindicacion", "52": "la interaccion", "53": "una interaccion"},
+  pinyinUnits: {},
+  distractors: "STdkUVRcWDLNYCLNabGIc*F6*GOReEICKEGI*EL*MKijkXZqHEGICDNgqrab*JhsCDuvFPwxFOyzlS0*CTF1TA1USA1UVB*JXoUB*JYoXCFOWCJZZDFOYDJXbEMeaEMedF*GT0c1F*CnfGMaeGFOhHCDgMab*Ej*Mbj*EL*Ek*Mci*ELJAdxkQST*WQ*J8*Wa*Xq*J9*Di*Wb*FR*Ln*Cy*L1*U9*LoBRcrMJXqMJXtNFOs*J7NJvOBRuOBRxPBRwPAdzQlSyQlS1R*Cmc0*CndR"
 };
 
 export const p6_210_demonstrating__demostrar = {
@@ -1573,7 +1660,10 @@ export const p6_210_demonstrating__demostrar = {
     ["voy a evidenciar", "I'm going to show", "我要展示", "wǒ yào zhǎn shì", "Vou mostrar"],
     ["hay que verificar", "must be verified", "必须验证", "bì xū yàn zhèng", "deve ser verificado"],
     ["voy a verificar", "I'm going to check", "我去检查一下", "wǒ qù jiǎn chá yī xià", "vou verificar"]
-  ]
+  ],
+  accentFree: {"4": "demostrais", "7": "demostracion", "12": "tu demuestras", "14": "el demuestra", "18": "vosotros demostrais", "19": "lo demostrais", "24": "la demostracion", "25": "una demostracion"},
+  pinyinUnits: {},
+  distractors: "CBFKFCAMABFOREGKTDGBBCAVCBEFYZDEBEFAACGBLPAOKPNVNBVOVPMLPCKLLNVKS*QY*G8*FKDTNXQ*Qa*FM*DdERNHVNP*QcNPLF*Qe*FQUZGRdHZHbRYH*AZ*B3b*WoUWIYRU*Cy*Ep*Dl*Nk*UG*CzJR"
 };
 
 export const p6_211_checking__comprobar = {
@@ -1617,7 +1707,10 @@ export const p6_211_checking__comprobar = {
     ["una verificación", "a verification", "验证", "yàn zhèng", "uma verificação"],
     ["la revisión", "the review", "检查", "jiǎn chá", "a revisão"],
     ["una revisión", "a review", "检查", "jiǎn chá", "uma revisão"]
-  ]
+  ],
+  accentFree: {"4": "comprobais", "7": "comprobacion", "8": "verificacion", "9": "revision", "12": "tu compruebas", "14": "el comprueba", "18": "vosotros comprobais", "19": "lo comprobais", "24": "la comprobacion", "25": "una comprobacion", "26": "la verificacion", "27": "una verificacion", "28": "la revision", "29": "una revision"},
+  pinyinUnits: {},
+  distractors: "CBFKFCAMABFOREGKTDGBBCAV*HqCBEYZ*BD*OLab*T2*Rl*GBcACLPAOKPNVNBVOVPMLPCKLLNVKS*Bq*Xg*FKDTNXQ*Xi*FM*LEERNHVNP*BuNPLF*Bw*Xm*FQUGRHIZHaRYHUWbI*UHYaI*UI*Np*GhdJ*Csc*CtJD"
 };
 
 export const p6_212_energy__power = {
@@ -1688,7 +1781,10 @@ export const p6_212_energy__power = {
     ["un generador", "a generator", "发电机", "fā diàn jī", "um gerador"],
     ["la red eléctrica", "the electrical network", "电网", "diàn wǎng", "a rede elétrica"],
     ["una red eléctrica", "an electrical network", "电网", "diàn wǎng", "uma rede elétrica"]
-  ]
+  ],
+  accentFree: {"0": "electrico", "3": "carbon", "10": "hidroelectrica", "11": "geotermica", "18": "red electrica", "19": "es electrico", "20": "aparato electrico", "22": "energia renovable", "25": "el carbon", "26": "de carbon", "39": "la hidroelectrica", "40": "una hidroelectrica", "41": "la geotermica", "42": "energia geotermica", "55": "la red electrica", "56": "una red electrica"},
+  pinyinUnits: {},
+  distractors: "T*GrBPV*JnAPXLcm*O4ZaEbFHJREHJHOZa*VRGhEDEFHlEFHnoSfpCcmrsEF*ERtEFvGZaxyABz0dKF12*Aw3T4KASVeWnoqBTeiUnoqCSgpoqUW*PWaDGZDGOcE*Lr*BKb*Ls*BLE*KG*L1*U9*Wo*KHTVi*WqK3Q*Wr*XnGS*ViHiAhTVekIEFjIEFmJ*NmAlJCLoK3UnK4qLSXgoUWnsM*GLArMAB*EvN*UxutTVeOCLcvOSXyPTVxPSX0Q4KzQ4K2R*BW*Uv1R*BX*Uw4SnK3SoK"
 };
 
 export const p6_213_thanking__agradecer = {
@@ -1732,7 +1828,10 @@ export const p6_213_thanking__agradecer = {
     ["con gratitud", "with gratitude", "怀着感激之情", "huái zhe gǎn jī zhī qíng", "com gratidão"],
     ["hay que reconocer", "must be recognized", "必须被认可", "bì xū bèi rèn kě", "deve ser reconhecido"],
     ["voy a reconocer", "I will recognize", "我会认可", "wǒ huì rèn kě", "eu vou reconhecer"]
-  ]
+  ],
+  accentFree: {"4": "agradeceis", "12": "tu agradeces", "14": "el agradece", "18": "vosotros agradeceis", "19": "lo agradeceis"},
+  pinyinUnits: {},
+  distractors: "CKBFFGCEBFGABREFBTDFBGCVBFCAYZ*JFUaCABABFGAPLDKPARNBVOVPMTPCBFNVOCS*JN*Iv*OCDNTVQ*JP*Ix*OENERVV*JR*P+NNPFM*I1*OI*QAcNVPGZH*JX*E5YH*JYWI*NqbEaIDK*KG*J+dW*KHJLR"
 };
 
 export const p6_214_congratulating__felicitar = {
@@ -1776,7 +1875,10 @@ export const p6_214_congratulating__felicitar = {
     ["mis felicidades", "my congratulations", "我的祝贺", "wǒ de zhù hè", "meus parabéns"],
     ["mucha enhorabuena", "congratulations", "恭喜", "gōng xǐ", "parabéns"],
     ["mi enhorabuena", "my congratulations", "我的祝贺", "wǒ de zhù hè", "meus parabéns"]
-  ]
+  ],
+  accentFree: {"4": "felicitais", "7": "felicitacion", "12": "tu felicitas", "14": "el felicita", "18": "vosotros felicitais", "19": "lo felicitais", "24": "la felicitacion", "25": "una felicitacion"},
+  pinyinUnits: {},
+  distractors: "CBFGFGCAABFGBRIEBTDFBGCABFCAYFZ*SCDBbJdDIMLPAOKAOPNBVLVPMTPCKLNVKOS*CH*D3*FmDNTVQ*CJ*Fo*LENERVV*CLNPNPFM*D9*Fs*QAZ*R5*Cz*RPNZH*SUVYH*SV*B3bScQIaUYdJWZJcRX"
 };
 
 export const p6_215_automotive__terms = {
@@ -1850,7 +1952,10 @@ export const p6_215_automotive__terms = {
     ["un radiador", "a radiator", "散热器", "sàn rè qì", "um radiador"],
     ["el alternador", "the alternator", "交流发电机", "jiāo liú fā diàn jī", "o alternador"],
     ["un alternador", "an alternator", "交流发电机", "jiāo liú fā diàn jī", "um alternador"]
-  ]
+  ],
+  accentFree: {"1": "automovil", "3": "vehiculo", "5": "neumatico", "12": "mecanico", "13": "mecanica", "16": "transmision", "22": "el automovil", "23": "un automovil", "26": "el vehiculo", "27": "un vehiculo", "30": "el neumatico", "31": "un neumatico", "44": "el mecanico", "45": "un mecanico", "46": "la mecanica", "47": "una mecanica", "52": "la transmision", "53": "una transmision"},
+  pinyinUnits: {},
+  distractors: "UHTaWXFkEGKLabJMCGKLefBkCEKLij*SpAklOPmDMNoLCEqrKCNstDMuDJIPYZIOYZ01WX23DJ45DJ67AHAij61wy0XBQeWBQeZCIOYCIObDAHaDAHdEIOcDJMfFQWeFQWhGIOgGIOjH*TN6iH*TO7lI*TFBkIBFJnAHmJQWKDJMoKBFrLDJqLDJtMuNsvMuvNsttuNQ*KG*Cy*RO*S1*KH*FtQW*Nk*Ku*L1*RO*NlQWX1Qwy0Qwy3RAH2RAH5SAH4SAH7Ti*TN6Tj*TO"
 };
 
 export const p6_216_suggesting__sugerir = {
@@ -1891,7 +1996,10 @@ export const p6_216_suggesting__sugerir = {
     ["una sugerencia", "a suggestion", "一个建议", "yí gè jiàn yì", "uma sugestão"],
     ["el consejo", "the advice", "建议", "jiàn yì", "o conselho"],
     ["un consejo", "a piece of advice", "一个建议", "yí gè jiàn yì", "um conselho"]
-  ]
+  ],
+  accentFree: {"4": "sugeris", "11": "tu sugieres", "13": "el sugiere", "17": "vosotros sugeris", "18": "me sugeris"},
+  pinyinUnits: {},
+  distractors: "CBFJFCAEABFN*KX*MkEGG*KYBSBCAUE*KaACXYLM*SfZaAKANOJOANMBU*MsUOLSOCJKMUKN*Kk*Mw*Bq*FKD*MxXT*Km*Bs*MyPMEOU*M0*KoVYMOFL*Bw*FQTY*J9HLMYH*BM*HGXH*CQ*CS*S5aIDZIDJ"
 };
 
 export const p6_217_recommending__recomendar = {
@@ -1932,7 +2040,10 @@ export const p6_217_recommending__recomendar = {
     ["una recomendación", "a recommendation", "推荐", "tuī jiàn", "uma recomendação"],
     ["el asesoramiento", "the advice", "建议", "jiàn yì", "o conselho"],
     ["con asesoramiento", "with advice", "有建议", "yǒu jiàn yì", "com conselhos"]
-  ]
+  ],
+  accentFree: {"4": "recomendais", "7": "recomendacion", "11": "tu recomiendas", "13": "el recomienda", "17": "vosotros recomendais", "18": "me lo recomendais", "23": "la recomendacion", "24": "una recomendacion"},
+  pinyinUnits: {},
+  distractors: "CBFJFCAGABFGBEGFBDGFBCAGCBFAXYDEZa*CeHANCKOMUJBNFCUOSKCJBFMUKNR*HY*Og*QYMSDUP*Ha*Oi*QaMUOQUMO*OkMOKT*Om*QeQTGKOHYHMSXHQTIa*C8*L9ZI*DwQ"
 };
 
 export const p6_218_subjunctive__triggers = {
@@ -1997,7 +2108,10 @@ export const p6_218_subjunctive__triggers = {
     ["muy dudoso", "very doubtful", "非常怀疑", "fēi cháng huái yí", "muito duvidoso"],
     ["es increíble", "it's amazing", "难以置信", "nán yǐ zhì xìn", "é incrível"],
     ["muy increíble", "very incredible", "非常难以置信", "fēi cháng nán yǐ zhì xìn", "muito incrível"]
-  ]
+  ],
+  accentFree: {"7": "ojala", "16": "increible", "31": "ojala que", "32": "ojala llueva", "49": "es increible", "50": "muy increible"},
+  pinyinUnits: {},
+  distractors: "BFHGAFHGJNQcEILfDILfABHG*GzPABABFGOhDEjkCNlmOeDEIfDEGI*Mp*VRCJhItivGABx*LRyC*RMSb*XqR*XrU*RMURbgTS*XrY*Hk*Ju*Ac*Aa*FQVrXn*S1ZSSUam*GX*CyXnSUYm*RMR*Xq*KG*Di*FR*RN*KH*J8*RO*U9bKOhCDEILRTbiOItiuOhIJkRTjJdlKmdklKSU*DlXZS*Dm*D+*OJL*Pc*KG*Ku*S1*PdRTb*S3*S1ps*S4*XnNSOhuiitOSPDEIvPCJQyRTxQdk"
 };
 
 export const p6_219_convincing__convencer = {
@@ -2041,7 +2155,10 @@ export const p6_219_convincing__convencer = {
     ["voy a persuadir", "I will persuade", "我会说服", "wǒ huì shuō fú", "Vou persuadir"],
     ["la convicción", "the conviction", "信念", "xìn niàn", "a convicção"],
     ["con convicción", "with conviction", "坚信", "jiān xìn", "com convicção"]
-  ]
+  ],
+  accentFree: {"4": "convenceis", "9": "conviccion", "12": "tu convences", "14": "el convence", "18": "vosotros convenceis", "19": "me convenceis", "28": "la conviccion", "29": "con conviccion"},
+  pinyinUnits: {},
+  distractors: "CKLBFGCEBFGABEHFBTHDBGCVBFC*MpEBDFBFGAcdEHLAEHKAPENBVOVPMTPCBFNVOCS*HY*Iv*OgDUWXQ*Ha*Ix*OiNEVPRWXYNPFM*I1*Om0YGZbdZHWaHYXb*Dl*S3*WW*Wm*Dm*D+IXJd*RC*NOcJXZ"
 };
 
 export const p6_220_trusting__confiar = {
@@ -2085,5 +2202,8 @@ export const p6_220_trusting__confiar = {
     ["no hay que fiar", "not to be trusted", "不值得信任", "bù zhí dé xìn rèn", "não é confiável"],
     ["hay que entregar", "must be delivered", "必须交付", "bì xū jiāo fù", "deve ser entregue"],
     ["voy a entregar", "I will deliver", "我会送货", "wǒ huì sòng huò", "eu vou entregar"]
-  ]
+  ],
+  accentFree: {"0": "confio", "1": "confias", "2": "confia", "4": "confiais", "5": "confian", "10": "yo confio", "11": "en ti confio", "12": "tu confias", "13": "en mi confias", "14": "el confia", "15": "en mi confia", "18": "vosotros confiais", "19": "en mi confiais", "20": "ellos confian", "21": "en mi confian"},
+  pinyinUnits: {},
+  distractors: "CBFKFCGAABFG*DcHEBJKOBBCGABF*BVCYD*BVFACBF*OzEKOAEJOPaDHBOFCVPTXCEJKNVLa*FKS*Db*BqLDWT*FMQ*Dd*CJNVPE*FOV*DfTNPXY*FQRTUNVYLHZNVYHTUb*RM*WQ*Waa*WR*WTT*PY*S1*WaR*PZ*S2*PN*PM"
 };
@@ -81,7 +81,10 @@ export const p7_221_past__subjunctive__forms = {
     ["ojalá esperara", "I wish I would wait", "我希望我会等待", "wǒ xī wàng wǒ huì děng dài", "Eu gostaria de esperar"],
     ["si quisiera", "if I wanted", "如果我想要", "rú guǒ wǒ xiǎng yào", "se eu quisesse"],
     ["ojalá quisiera", "I wish I wanted to", "我希望我会", "wǒ xī wàng wǒ huì", "Eu gostaria de poder"]
-  ]
+  ],
+  accentFree: {"21": "ojala tuviera", "23": "ojala pudiera", "25": "ojala fuera", "27": "ojala estuviera", "29": "ojala hubiera", "31": "ojala hiciera", "33": "ojala dijera", "35": "ojala viniera", "37": "ojala supiera", "39": "ojala diera", "41": "ojala viera", "43": "ojala pensara", "45": "ojala hablara", "47": "ojala comiera", "49": "ojala viviera", "51": "ojala trabajara", "53": "ojala estudiara", "55": "ojala necesitara", "57": "ojala esperara", "59": "ojala quisiera"},
+  pinyinUnits: {},
+  distractors: "BEIOAEImJKGAQUAaABFIEHOmJKgAOFmoABEmKGCAJCGAq*G8ABs*OLABuABEHoAFyDQUD0PU2Znp4TgA6SgADWckXdlxUckBVdlnmoCAnphV0DUk1VlXUWekVXflciwFdjxVmoGSnpXZweHoxfpVUWcIVXdfogBFphZXOmAFnZhVLDPQXjt5McDPdfrzNUWcVXdfiUeOjVfpPah0tb13aQhyb5VXRVXdr2RbSRZnr17VTUWcVXdf"
 };
 
 export const p7_222_dreaming__soar = {
@@ -125,7 +128,10 @@ export const p7_222_dreaming__soar = {
     ["una pesadilla", "a nightmare", "一场噩梦", "yī cháng è mèng", "um pesadelo"],
     ["el ensueño", "the dream", "梦想", "mèng xiǎng", "o sonho"],
     ["un ensueño", "a dream", "一个梦", "yí gè mèng", "um sonho"]
-  ]
+  ],
+  accentFree: {"0": "suenas", "1": "suena", "2": "sonamos", "3": "sonais", "4": "suenan", "5": "sonar", "6": "sonador", "7": "suenos", "9": "ensueno", "10": "tu suenas", "11": "siempre suenas", "12": "el suena", "13": "siempre suena", "14": "nosotros sonamos", "15": "siempre sonamos", "16": "vosotros sonais", "17": "siempre sonais", "18": "ellos suenan", "19": "siempre suenan", "20": "quiero sonar", "21": "voy a sonar", "22": "el sonador", "23": "un sonador", "24": "los suenos", "25": "mis suenos", "28": "el ensueno", "29": "un ensueno"},
+  pinyinUnits: {},
+  distractors: "EHBKAEFDGJMAAEHBABHDBADECFWXAEBDabVWcdCGACGITNR*NVBCGJLT*NXb*HG*Kq*ME*GqRLQO*HI*Ks*RA*SCPLTN*Ie*MI*Mu*HKLN*NdR*HM*KwSa*HN*H9*Kx*K1XGIVWGIVZ*GNHIYHIVbISUaINLdJIVcJIV"
 };
 
 export const p7_223_agreeing__acordar = {
@@ -166,7 +172,10 @@ export const p7_223_agreeing__acordar = {
     ["un convenio", "an agreement", "协议", "xié yì", "um acordo"],
     ["el pacto", "the pact", "协议", "xié yì", "o pacto"],
     ["un pacto", "a pact", "一个契约", "yí gè qì yuē", "um pacto"]
-  ]
+  ],
+  accentFree: {"4": "acordais", "11": "tu acuerdas", "13": "el acuerda", "17": "vosotros acordais", "18": "os acordais"},
+  pinyinUnits: {},
+  distractors: "CBFJFCALABFNEGQJSBFHBCAUACZaXYBEACGZANOCRPTVMBUNLUOBOCJBUNMC*DfR*E2*IaDS*MFT*DhP*E4*IcELMU*BO*Ie*MI*MuOMFL*Dl*E8*Ig*BQ*LzLMQYHLMXHLMaIACZIAC"
 };
 
 export const p7_224_robotics__ai__terms = {
@@ -240,7 +249,10 @@ export const p7_224_robotics__ai__terms = {
     ["un módulo", "a module", "一个模块", "yí gè mó kuài", "um módulo"],
     ["la rutina", "the routine", "程序", "chéng xù", "a rotina"],
     ["una rutina", "a routine", "例程", "lì chéng", "uma rotina"]
-  ]
+  ],
+  accentFree: {"1": "robotica", "4": "automatizacion", "15": "codigo", "18": "modulo", "22": "la robotica", "23": "de robotica", "28": "la automatizacion", "29": "con automatizacion", "50": "el codigo", "51": "un codigo", "56": "el modulo", "57": "un modulo"},
+  pinyinUnits: {},
+  distractors: "OMPQWXHIYZGoabhEcdFiefEiCop7BIJNBHJNBHINopUVqrjnstPQuvBHAMPQyzMQ01MP2BHI45MP6MPQVAKwUAKwXBuvWBuvZCklYCklbD*NggaDgrEdefcEeffF*NgceFcahabrGDEFEFmq*DmHLnlIYZkIYZEFiq*Fb*Nf*GxJpKCGoKCGrLEFqLabtMBHsMBHvNWXuNWXxOKUwOKUzPBHyPBH1QBH0QBH3RWX2RYZ5SBH4SBH7TBH6TCG"
 };
 
 export const p7_225_warming__calentar = {
@@ -284,7 +296,10 @@ export const p7_225_warming__calentar = {
     ["muy tibio", "very warm", "很温暖", "hěn wēn nuǎn", "muito quente"],
     ["está templado", "is warm", "很温暖", "hěn wēn nuǎn", "está quente"],
     ["muy templado", "very temperate", "温暖适中", "wēn nuǎn shì zhōng", "muito temperado"]
-  ]
+  ],
+  accentFree: {"4": "calentais", "12": "tu calientas", "14": "el calienta", "18": "vosotros calentais", "19": "lo calentais", "26": "esta tibio", "28": "esta templado"},
+  pinyinUnits: {},
+  distractors: "C*P8BFFCAGABFGRBEGTBDGBCAGCBFAYZRUACGJACGbLPAOKPNVNBVOVPMLPCKLLNVKS*LI*Bp*FUDNTVQ*LK*Br*FWENRMVNPWNPLFUHYZ*FD*Lz*K1GZH*MO*NgYH*MP*NhBEFAACGJdJRXJMNT"
 };
 
 export const p7_226_cooling__enfriar = {
@@ -328,7 +343,10 @@ export const p7_226_cooling__enfriar = {
     ["sin refrigeración", "without refrigeration", "无需冷藏", "wú xū lěng cáng", "sem refrigeração"],
     ["está escarchado", "it's frosty", "结霜了", "jié shuāng le", "está gelado"],
     ["muy escarchado", "very frosty", "霜冻", "shuāng dòng", "muito gelado"]
-  ]
+  ],
+  accentFree: {"0": "enfrio", "1": "enfrias", "2": "enfria", "4": "enfriais", "5": "enfrian", "8": "refrigeracion", "10": "yo enfrio", "11": "lo enfrio", "12": "tu enfrias", "13": "lo enfrias", "14": "el enfria", "15": "lo enfria", "18": "vosotros enfriais", "19": "lo enfriais", "20": "ellos enfrian", "21": "lo enfrian", "26": "la refrigeracion", "27": "sin refrigeracion", "28": "esta escarchado"},
+  pinyinUnits: {},
+  distractors: "CBFKFCGAABFGREBGTKLOBCGABFCAYZUIabWddTDMLPAEKPNVNBVOVPMLPCEKLNVK*Bp*KM*Lm*R0DTNX*Br*KO*Lo*R2ENRJV*KQ*Lq*R4NPLF*Bv*KS*Ls*Kw*CYRHJZHcIYHcIIb*JY*FcaISQdJYZJcIW"
 };
 
 export const p7_227_alternative__medicine = {
@@ -399,7 +417,10 @@ export const p7_227_alternative__medicine = {
     ["muy espiritual", "very spiritual", "很有灵性", "hěn yǒu líng xìng", "muito espiritual"],
     ["es natural", "it's natural", "这是自然的", "zhè shì zì rán de", "é natural"],
     ["muy natural", "very natural", "非常自然", "fēi cháng zì rán", "muito natural"]
-  ]
+  ],
+  accentFree: {"1": "homeopatia", "2": "naturopatia", "7": "meditacion", "9": "quiropractica", "13": "reflexologia", "14": "holistico", "16": "energetico", "21": "la homeopatia", "22": "de homeopatia", "23": "la naturopatia", "24": "de naturopatia", "33": "la meditacion", "34": "con meditacion", "37": "la quiropractica", "38": "de quiropractica", "45": "la reflexologia", "46": "de reflexologia", "47": "es holistico", "48": "enfoque holistico", "51": "es energetico", "52": "muy energetico"},
+  pinyinUnits: {},
+  distractors: "TUBHVWAHXYvxGKfFbcNTMSZIDKfFh*Gj*NQijkanlmUXnofDABHQFSZItuETvP3AxO3Az0AB*F112A3FMZAUENTAJXWBENVBENYCJUXCJUDFMSInoFEcqtbElmeFABdFABGKDFJUXYH*G0*NiihH*K/JkIABjIABmJcblJcboKIanKIa*JgqwcLbtus*LjMArMABuNbqtNbqOCxApclmPCvAxPJUQ0ENzQJUR2*F1E1RJUS4OP3SAB"
 };
 
 export const p7_228_hiding__esconder = {
@@ -443,7 +464,10 @@ export const p7_228_hiding__esconder = {
     ["un escondite", "a hiding place", "一个藏身之处", "yí gè cáng shēn zhī chù", "um esconderijo"],
     ["hay que ocultar", "must be hidden", "必须隐藏", "bì xū yǐn cáng", "deve estar oculto"],
     ["voy a ocultar", "I'm going to hide", "我要躲起来", "wǒ yào duǒ qǐ lái", "eu vou me esconder"]
-  ]
+  ],
+  accentFree: {"4": "escondeis", "12": "tu escondes", "14": "el esconde", "18": "vosotros escondeis", "19": "lo escondeis"},
+  pinyinUnits: {},
+  distractors: "CBFGFGCAABFGBRHEBTIDBGCABFCABGDECabEACBFLPAOKPNVNBVOVPMLPCKLLNVK*BpS*R0*SMDNTV*BrQ*R2*SONERVVNPcNPLF*BvZUc*BwNVP*PcZ*PeSHWUcbIOTaITd*Ly*K0URTabD"
 };
 
 export const p7_229_revealing__exposing__revelar = {
@@ -487,7 +511,10 @@ export const p7_229_revealing__exposing__revelar = {
     ["voy a desvelar", "I'm going to reveal", "我来揭晓", "wǒ lái jiē xiǎo", "Vou revelar"],
     ["el secreto", "the secret", "秘密", "mì mì", "o segredo"],
     ["un secreto", "a secret", "一个秘密", "yí gè mì mì", "um segredo"]
-  ]
+  ],
+  accentFree: {"4": "revelais", "7": "revelacion", "12": "tu revelas", "14": "el revela", "18": "vosotros revelais", "19": "me revelais", "24": "la revelacion", "25": "una revelacion"},
+  pinyinUnits: {},
+  distractors: "CBFGFGCAABFGBREFBTIKBGCABFCAYFZTGEKLcdBFLAEIKPAENBVLVPMTPCEINVLO*LmS*NY*HGDXHT*LoQ*HI*BrNEVP*Lq*BO*Nc*HKNPFM*Ls*Ne*HMZb*JjRHZH*EO*GHYH*GI*Lx*JiWZSX*Jj*HNIdJ*ClDcJ*CmD"
 };
 
 export const p7_230_virtual__reality__terms = {
@@ -558,7 +585,10 @@ export const p7_230_virtual__reality__terms = {
     ["muy inmersivo", "very immersive", "非常身临其境", "fēi cháng shēn lín qí jìng", "muito envolvente"],
     ["es sensorial", "it's sensory", "这是感官", "zhè shì gǎn guān", "é sensorial"],
     ["muy sensorial", "very sensory", "非常感官", "fēi cháng gǎn guān", "muito sensorial"]
-  ]
+  ],
+  accentFree: {"7": "inmersion", "9": "simulacion", "14": "dimension", "15": "holografico", "33": "la inmersion", "34": "con inmersion", "37": "la simulacion", "38": "una simulacion", "47": "la dimension", "48": "otra dimension", "49": "es holografico", "50": "muy holografico"},
+  pinyinUnits: {},
+  distractors: "TIXfVEHOFGND*LfZaMbBHOCGNDCFNDRhOijkAXlmBEnoLPKPVbN*IL*IKD*IKMCFvHBExyKLz0BEH12B3*CB4B*D+ABEYqoyBKLPpUqoCAIfUcmnaDdeZDdeEcKLbEYmeZaAdZaAgGAIfGAIHviKhH*KZlkIBEjIBEmJ*Fc*LwlJ*Fd*LxoKYcnKyUqWUoLpUo*BU*IXs*IVrKLPuNAItNAIOhwKvOYcPyYcxPoU0QKLzQKLR2KL1RilS4KL3Sil"
 };
 
 export const p7_231_measuring__medir = {
@@ -599,7 +629,10 @@ export const p7_231_measuring__medir = {
     ["una medida", "a measure", "一项措施", "yī xiàng cuò shī", "uma medida"],
     ["la medición", "measurement", "测量", "cè liáng", "medição"],
     ["una medición", "a measurement", "测量", "cè liáng", "uma medida"]
-  ]
+  ],
+  accentFree: {"4": "medis", "8": "medicion", "11": "tu mides", "13": "el mide", "17": "vosotros medis", "18": "lo medis", "25": "la medicion", "26": "una medicion"},
+  pinyinUnits: {},
+  distractors: "CBEFFCEGABFE*L3QLMBFGABCEGBEFAGXJK*D0ZXDKO*KkAJO*KlMMBDSUOLSOCHJKMUJ*MEr*M2*NCDsSW*MG*Q+tPMEDL*Ku*MIUZMOKFxaTZy*H9QYYHIDX*LTHQa*EOITZIVT"
 };
 
 export const p7_232_weighing__pesar = {
@@ -643,7 +676,10 @@ export const p7_232_weighing__pesar = {
     ["dos kilogramos", "two kilograms", "两公斤", "liǎng gōng jīn", "dois quilogramas"],
     ["un gramo", "one gram", "一克", "yī kè", "um grama"],
     ["dos gramos", "two grams", "两克", "liǎng kè", "dois gramas"]
-  ]
+  ],
+  accentFree: {"4": "pesais", "7": "bascula", "12": "tu pesas", "14": "el pesa", "18": "vosotros pesais", "19": "lo pesais", "24": "la bascula", "25": "una bascula"},
+  pinyinUnits: {},
+  distractors: "CBFGFGCJABFGBRHMBTKLBGCJBFCJYDMNaRXYBFGALP*OdAKP*OdNNBDHVPMLPCEKLNVK*BK*Gq*Kq*Q+DN*Gr*Kr*BM*Ks*RA*SCNEDH*Ku*BO*RCVNPLF*BQ*Gw*Kwa*BR*Gx*H9*KxZHIRYHUIIWUZaIdSJDHM*Kr*PWIR"
 };
 
 export const p7_233_cryptocurrency__terms = {
@@ -711,7 +747,10 @@ export const p7_233_cryptocurrency__terms = {
     ["de defi", "defi", "去中心化金融", "qù zhōng xīn huà jīn róng", "DeFi"],
     ["el nft", "the nft", "非同质化代币", "fēi tóng zhì huà dài bì", "o nft"],
     ["un nft", "an nft", "非同质化代币", "fēi tóng zhì huà dài bì", "um NFT"]
-  ]
+  ],
+  accentFree: {"7": "transaccion", "13": "descentralizacion", "32": "la transaccion", "33": "una transaccion", "44": "la descentralizacion", "45": "con descentralizacion"},
+  pinyinUnits: {},
+  distractors: "STYZOUPaWIefYZVWJL01cdUpL*L0efgh*KjXijCeEL01*QnMQEEJ01KQEJstTSBuvPwBOaKMEJKMQETAhgSAhNuBVOUBDWCXDVWCHcZDAHYDAHbEBOaEBOdFHXcFHXfGCIeGCIhH*K2AgHSTjIDViIDVlJBOkJBOnKGqmKGq*K0*PqHX*Kx*BR*Gx*HNMGmnHXcdNtTSsNTSUvOFuOFUPxFUwPDVzQGmyQGmEJL1EJL0"
 };
 
 export const p7_234_establishing__founding__fundar = {
@@ -755,7 +794,10 @@ export const p7_234_establishing__founding__fundar = {
     ["un fundador", "a founder", "创始人", "chuàng shǐ rén", "um fundador"],
     ["la fundadora", "the founder", "创始人", "chuàng shǐ rén", "o fundador"],
     ["una fundadora", "a founder", "创始人", "chuàng shǐ rén", "um fundador"]
-  ]
+  ],
+  accentFree: {"4": "fundais", "7": "fundacion", "12": "tu fundas", "14": "el funda", "18": "vosotros fundais", "19": "lo fundais", "24": "la fundacion", "25": "una fundacion"},
+  pinyinUnits: {},
+  distractors: "*FvCBFFGC*FuABFGIBRMBTKLBGCABFCAYFZJJDGaIcDaLPAEKPNVNBDIVPMLPCEKLNVK*Mq*RI*BK*BpDNTV*BM*Br*HIQNERV*BO*MuVYNPLF*BQ*Bv*Gw*HM*H9RabZHUcYHd*G1bIJcaIdJdJabcbJZ"
 };
 
 export const p7_235_concluding__wrapping__up__concluir = {
@@ -799,7 +841,10 @@ export const p7_235_concluding__wrapping__up__concluir = {
     ["un desenlace", "an outcome", "结果", "jié guǒ", "um resultado"],
     ["el epílogo", "the epilogue", "尾声", "wěi shēng", "o epílogo"],
     ["un epílogo", "an epilogue", "尾声", "wěi shēng", "um epílogo"]
-  ]
+  ],
+  accentFree: {"4": "concluis", "9": "epilogo", "12": "tu concluyes", "14": "el concluye", "18": "vosotros concluis", "19": "lo concluis", "28": "el epilogo", "29": "un epilogo"},
+  pinyinUnits: {},
+  distractors: "CEGBFCAEABFERBAEACGBBCAVACEHYACEabBFcdACLPAOKPTNNBVOVPMLPCKLLNVKS*LI*NY*MEDNLTQ*Na*MGULPNEVNPWNPLFURSXGRMNZHDKYHMNbIMNaIMNdJBFcJBF"
 };
 
 export const p7_236_sustainable__living = {
@@ -867,7 +912,10 @@ export const p7_236_sustainable__living = {
     ["muy cíclico", "very cyclical", "非常周期性", "fēi cháng zhōu qī xìng", "muito cíclico"],
     ["es duradero", "it is durable", "它很耐用", "tā hěn nài yòng", "é durável"],
     ["muy duradero", "very durable", "非常耐用", "fēi cháng nài yòng", "muito durável"]
-  ]
+  ],
+  accentFree: {"0": "reutilizacion", "3": "alimentacion", "8": "ecologico", "9": "organico", "16": "ciclico", "18": "la reutilizacion", "19": "con reutilizacion", "24": "la alimentacion", "25": "mi alimentacion", "34": "es ecologico", "35": "muy ecologico", "36": "es organico", "37": "muy organico", "50": "es ciclico", "51": "muy ciclico"},
+  pinyinUnits: {},
+  distractors: "STEKGUVEWGIyYZ*EOHBNPkJRopBCIyghDUijCGkFRomnAVopMQLQqFstBEuvilwBENyqFJ0FJoAT*Dp*FcSAanBVGDUBAKXCDHWYZbZDXbYDXb*EWbcTEXYZ*FeXYZ*Fb*FfFD*FCf*LyS*LPGAKhHXYgHXYIjOliIDHJlBEkJOiKnSemKTapLFJoLFJMQFJAKVfNt*EuDsNAKOvAKuOXYPDHUTanSQzCGyQBER1BE0ROi"
 };
 
 export const p7_237_pushing__empujar = {
@@ -911,7 +959,10 @@ export const p7_237_pushing__empujar = {
     ["un impulso", "an impulse", "冲动", "chōng dòng", "um impulso"],
     ["la presión", "the pressure", "压力", "yā lì", "a pressão"],
     ["con presión", "with pressure", "有压力", "yǒu yā lì", "com pressão"]
-  ]
+  ],
+  accentFree: {"4": "empujais", "7": "empujon", "9": "presion", "12": "tu empujas", "14": "el empuja", "18": "vosotros empujais", "19": "lo empujais", "24": "el empujon", "25": "un empujon", "28": "la presion", "29": "con presion"},
+  pinyinUnits: {},
+  distractors: "CBFGFGCHABFGBREFBTKLBGHCBFCHFBGAabBFcBFGLPAEKPNVNBVOVPMLPCEKLNVK*Df*LmS*HGDNTV*Dh*LoQ*HINERVV*Dj*Lq*HKNPLF*Dl*Ls*HMURTUdZHVOYHVFbIDMaIDMJd*LUDcJTD"
 };
 
 export const p7_238_pulling__tirar = {
@@ -955,7 +1006,10 @@ export const p7_238_pulling__tirar = {
     ["voy a jalar", "I'm going to pull", "我要拉", "wǒ yào lā", "Vou puxar"],
     ["la tracción", "traction", "牵引力", "qiān yǐn lì", "tração"],
     ["con tracción", "with traction", "有牵引力", "yǒu qiān yǐn lì", "com tração"]
-  ]
+  ],
+  accentFree: {"4": "tirais", "7": "tiron", "9": "traccion", "12": "tu tiras", "14": "el tira", "18": "vosotros tirais", "19": "lo tirais", "24": "el tiron", "25": "un tiron", "28": "la traccion", "29": "con traccion"},
+  pinyinUnits: {},
+  distractors: "CBFGFGCHA*OJBFBRMNBTKLBGHCBFCHFBGIBFGHcTDML*GkPAKP*GlNNBDVVPMLPCEKLNVK*BK*HG*ME*M2DN*HH*HT*BM*HI*SC*RANEJD*Gu*HK*SE*RCNPLF*BQ*HMad*H9*BR*HNbZHDMYHDM*H8WdU*BR*HN*H9XJd*H0UcJWa"
 };
 
 export const p7_239_combining__combinar = {
@@ -999,7 +1053,10 @@ export const p7_239_combining__combinar = {
     ["una mezcla", "a mixture", "混合物", "hùn hé wù", "uma mistura"],
     ["la fusión", "the fusion", "融合", "róng hé", "a fusão"],
     ["una fusión", "a fusion", "融合", "róng hé", "uma fusão"]
-  ]
+  ],
+  accentFree: {"4": "combinais", "7": "combinacion", "9": "fusion", "12": "tu combinas", "14": "el combina", "18": "vosotros combinais", "19": "lo combinais", "24": "la combinacion", "25": "una combinacion", "28": "la fusion", "29": "una fusion"},
+  pinyinUnits: {},
+  distractors: "CBFGFGCAABFGBREFBTDFBGCABFCAYFZTaJACcIACLPAOKPNVNBVOVPMLPCKLLNVKS*DB*I4*BpDNTVQ*DD*Br*DhNERVVNPYNPLFZUYR*H9*JlNVZHVUYHWUbIBFa*GzIEdJBFcJEK"
 };
 
 export const p7_240_separating__separar = {
@@ -1043,7 +1100,10 @@ export const p7_240_separating__separar = {
     ["una separación", "a separation", "一次分离", "yī cì fēn lí", "uma separação"],
     ["hay que apartar", "you have to set aside", "你必须留出", "nǐ bì xū liú chū", "você tem que deixar de lado"],
     ["voy a apartar", "I'm going to separate", "我要分开", "wǒ yào fēn kāi", "eu vou separar"]
-  ]
+  ],
+  accentFree: {"4": "separais", "8": "separacion", "12": "tu separas", "14": "el separa", "18": "vosotros separais", "19": "lo separais", "26": "la separacion", "27": "una separacion"},
+  pinyinUnits: {},
+  distractors: "CBFGFGCAABFGBRHEBTKLBGCABFCA*PPBGDaFbT*FlBFGLPAEKPNVNBVOVPMLPCEKLNVK*Df*FU*KM*R0DNTV*Dh*FW*KO*R2NERVV*Dj*FY*KQNPLF*Dl*Fa*KS*BQdRIT*Pu*Pe*Pg*PoH*PPUabI*EO*FcaI*Fd*GI*FC*K0Wb*BwXRI"
 };
 
 export const p7_241_dying__morir = {
@@ -1087,7 +1147,10 @@ export const p7_241_dying__morir = {
     ["un fallecimiento", "a death", "死亡", "sǐ wáng", "uma morte"],
     ["el difunto", "the deceased", "死者", "sǐ zhě", "o falecido"],
     ["un difunto", "a deceased", "一个死者", "yí gè sǐ zhě", "um falecido"]
-  ]
+  ],
+  accentFree: {"4": "moris", "12": "tu mueres", "14": "el muere", "18": "vosotros moris", "19": "os moris"},
+  pinyinUnits: {},
+  distractors: "CEGBFCHAABFH*GeJKLACGBBCHjACEBCBFAab*Ng*NhcdDKLADJKPADNBVWMVPBPCDJVLON*Gq*BK*Kq*M2DUZc*Gs*BM*Ks*SCEDJK6*BO*Nc*GuPNFMMNVY*GwISQZHMNYHcdbI*Ng*DJaI*Nh*DKdJZMcJZM"
 };
 
 export const p7_242_irregular__past__forms = {
@@ -1155,7 +1218,10 @@ export const p7_242_irregular__past__forms = {
     ["tuvisteis que", "you had to", "你必须", "nǐ bì xū", "você tinha que"],
     ["ellos tuvieron", "they had", "他们有", "tā men yǒu", "eles tinham"],
     ["tuvieron que", "they had to", "他们必须", "tā men bì xū", "eles tiveram que"]
-  ]
+  ],
+  accentFree: {"20": "tu fuiste", "22": "el fue", "32": "tu hiciste", "34": "el hizo", "44": "tu tuviste", "46": "el tuvo"},
+  pinyinUnits: {},
+  distractors: "CGIMNEUDAGIMPBFeQBLR*L5*AC*L0BIMOAKgJNGMOAHNPThHQE*AFERUOGIABQsHMGIADHJNENKt*AAELUWBDFXHJNsBELbZTXSBDFTHJNw*Gq*MEkVdThym*Ic*HIVZEn*MI*BO*Ie0ZXVhG*Q4BDjHJNHsUKKnlHIBDFf*OYHJ*Gq*Kq*MEwh*SBpJyakwhKlb0cYblLc1MBDFvHJNUNgKzxQNOBDFrHJNY*Gq*Kq*MEt1Pvamw*KstQxboc*MI*KuxRcp"
 };
 
 export const p7_243_growing__crecer = {
@@ -1199,7 +1265,10 @@ export const p7_243_growing__crecer = {
     ["una maduración", "a maturation", "成熟", "chéng shú", "um amadurecimento"],
     ["el brote", "the outbreak", "萌芽", "méng yá", "o surto"],
     ["un brote", "a sprout", "一个嫩芽", "yí gè nèn yá", "um broto"]
-  ]
+  ],
+  accentFree: {"4": "creceis", "8": "maduracion", "11": "todavia crezco", "12": "tu creces", "14": "el crece", "18": "vosotros creceis", "19": "siempre creceis", "26": "la maduracion", "27": "una maduracion"},
+  pinyinUnits: {},
+  distractors: "CKBFFGCEBFGJBKMEBOcdBGCABFCAYZUIa*D0bXCABFADMENVYZBDKEVPTRCEcdNVTR*RU*FU*Gq*HGNTVP*RW*HIQ*RANRVP*MIHIPNPTR*Fa*Gw*HMPIHUDZH*L8lYH*L8lbI*EO*GHaI*GI*LxdJEOcJEO"
 };
 
 export const p7_244_aging__envejecer = {
@@ -1243,7 +1312,10 @@ export const p7_244_aging__envejecer = {
     ["en la vejez", "in old age", "年老时", "nián lǎo shí", "na velhice"],
     ["el anciano", "the old man", "老年人", "lǎo nián rén", "o velho"],
     ["un anciano", "an old man", "一个老年人", "yí gè lǎo nián rén", "um velho"]
-  ]
+  ],
+  accentFree: {"4": "envejeceis", "12": "tu envejeces", "14": "el envejece", "18": "vosotros envejeceis", "19": "ya envejeceis"},
+  pinyinUnits: {},
+  distractors: "CKLBFGCEBFGABREFBTDFBGCVBFCAYZ*Ng*NhJaCAcdaCLAPDKPANNBVOVPMTPCBFNVOLS*R0*NY*E2DNTVQ*R2*Na*E4NERVHRWTNPFLNVPGSYZQZH*MO*NgYH*MP*NhIbJCaABFdJABcJAB"
 };
 
 export const p7_245_command__forms = {
@@ -1317,7 +1389,10 @@ export const p7_245_command__forms = {
     ["vete de aquí", "get out of here", "离开这里", "lí kāi zhè lǐ", "sai daqui"],
     ["quédate aquí", "stay here", "留在这里", "liú zài zhè lǐ", "fique aqui"],
     ["quédate conmigo", "stay with me", "留在我身边", "liú zài wǒ shēn biān", "fique comigo"]
-  ]
+  ],
+  accentFree: {"10": "sientate", "11": "levantate", "12": "callate", "13": "parte", "19": "quedate", "24": "pon aqui", "31": "mira aqui", "40": "sientate aqui", "41": "sientate bien", "42": "levantate ya", "43": "levantate ahora", "44": "callate ya", "45": "callate por favor", "46": "parte ahi", "47": "parte ya", "57": "vete de aqui", "58": "quedate aqui", "59": "quedate conmigo"},
+  pinyinUnits: {},
+  distractors: "*Qn*Qr*QoCACDEADBE9ACBFIJO*KcEIJMTVY*QsNQREFJOEFIOcdefqs03sGTVHQREPEFIOEFIHNREHNQEEFIJGMVY*M1R*R7*R/RGMTyUZ4zai1GMTV*HA*HB*G2UXi15*FsopzlKdeKcefKcdfKcdehq6Xgq6XXa15boprKcdecKdeKcdeKcdep6KboKbzLgh6q7jtML03r7jbKcdeNGMTxGMTwGMTWKcdXboplZLsXai5RGMTLs0KSUWZXai1ghqXrjtb"
 };
 
 export const p7_246_reflexive__pronouns = {
@@ -1379,7 +1454,10 @@ export const p7_246_reflexive__pronouns = {
     ["antes de arreglarse", "before getting ready", "准备之前", "zhǔn bèi zhī qián", "antes de se preparar"],
     ["hay que prepararse", "you have to prepare", "你必须准备", "nǐ bì xū zhǔn bèi", "você tem que se preparar"],
     ["después de prepararse", "after preparing", "准备后", "zhǔn bèi hòu", "depois de preparar"]
-  ]
+  ],
+  accentFree: {"11": "banarse", "24": "os arreglais", "29": "despues de acostarse", "35": "despues de afeitarse", "38": "hay que banarse", "39": "despues de banarse", "47": "despues de prepararse"},
+  pinyinUnits: {},
+  distractors: "BC*QmEAC*Qm*OHAB*QmEEABCDABCLNRTJVrHfISWHSWXGrHIYMOPFNRTOPfGrFLRMPfG*LdMOfDFLNTZFLHIWXRZFLFLNRGJrHHISXZHISKMOPXRTFmqeghegaie*Lu*E+jnvlg*LuiaHJMOeiq*Lubptccegsdvnlosiqptkhaqegdjvo*Lukgslhtkamg*H8NJGVioucplhk*Lugosjndl"
 };
 
 export const p7_247_gerund__forms = {
@@ -1447,7 +1525,10 @@ export const p7_247_gerund__forms = {
     ["sigo trayendo", "I keep bringing", "我一直带着", "wǒ yì zhí dài zhe", "Continuo trazendo"],
     ["estoy cayendo", "I'm falling", "我跌倒了", "wǒ diē dǎo le", "Estou caindo"],
     ["sigo cayendo", "I keep falling", "我不断坠落", "wǒ bù duàn zhuì luò", "Eu continuo caindo"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "BCDEFACDGEABELMACDGABGJKCEFJPIORPHLMFGABFABCMDIAL*CxDIBEKhRPHAHIORRABCOPQHYoqTZprScWYadXZbeaUYfbVZaoqSbprTWYeUXZfVUekmVflnWackXbdlwiu0xjv1wgoqxhprceUWdfVXcUWYdVXZqYiSrZjToYiUpZjVUamWVbnX0wgi1xhjgiu0hjv10kuw1lvxuwygvxzh"
 };
 
 export const p7_248_perfect__tenses = {
@@ -1515,7 +1596,10 @@ export const p7_248_perfect__tenses = {
     ["habrán hecho", "they will have done", "他们会做", "tā men huì zuò", "eles terão feito"],
     ["he dicho", "I said", "我说", "wǒ shuō", "Eu disse"],
     ["había dicho", "had said", "说过", "shuō guò", "tinha dito"]
-  ]
+  ],
+  accentFree: {"4": "habeis", "6": "habia", "7": "habias", "8": "habiamos", "9": "habiais", "10": "habian", "11": "habre", "12": "habras", "13": "habra", "15": "habreis", "16": "habran", "20": "tu has", "22": "el ha", "26": "vosotros habeis", "27": "habeis hecho", "30": "yo habia", "31": "habia hecho", "32": "tu habias", "33": "habias hecho", "34": "nosotros habiamos", "35": "habiamos hecho", "36": "vosotros habiais", "37": "habiais hecho", "38": "ellos habian", "39": "habian hecho", "40": "yo habre", "41": "habre hecho", "42": "tu habras", "43": "habras hecho", "44": "el habra", "45": "habra hecho", "48": "vosotros habreis", "49": "habreis hecho", "50": "ellos habran", "51": "habran hecho", "53": "habia dicho"},
+  pinyinUnits: {},
+  distractors: "*PA*PB*PCC*OEF*HeCA*OEBFGLNR*RmPHM*OEBCA*OLHKDKGJEOJHVHPEIHGQ*OLN8DGQN9ELMQ+/IVcE*RmJMMN*RnKDGLNWBDFX0VdDGLNdXTISBDFTVdJ*SA*Mq*Gq*HGVTvf*SCwk*BMxhrl*SEIOVVXTIoGJPhnptqHIOnflbuk*SA*Iavlhnwai*SChxbjy*SEcbhfzl*R6eLJtfrz*R8gMIztbh*R+NJPprzf*SAiY*NYjxrZa*SCk*Nablrp*SEmcbrtnpTRJPfhnZ"
 };
 
 export const p7_249_future__forms = {
@@ -1583,7 +1667,10 @@ export const p7_249_future__forms = {
     ["tendréis tiempo", "you will have time", "你会有时间", "nǐ huì yǒu shí jiān", "você terá tempo"],
     ["ellos tendrán", "they will have", "他们将有", "tā men jiāng yǒu", "eles terão"],
     ["tendrán tiempo", "they will have time", "他们会有时间", "tā men huì yǒu shí jiān", "eles terão tempo"]
-  ]
+  ],
+  accentFree: {"0": "vendre", "1": "vendras", "2": "vendra", "4": "vendreis", "5": "vendran", "6": "hare", "7": "haras", "8": "hara", "10": "hareis", "11": "haran", "12": "tendre", "13": "tendras", "14": "tendra", "16": "tendreis", "17": "tendran", "18": "yo vendre", "19": "vendre manana", "20": "tu vendras", "21": "vendras manana", "22": "el vendra", "23": "vendra manana", "25": "vendremos manana", "26": "vosotros vendreis", "27": "vendreis manana", "28": "ellos vendran", "29": "vendran manana", "30": "yo hare", "31": "hare eso", "32": "tu haras", "33": "haras eso", "34": "el hara", "35": "hara eso", "38": "vosotros hareis", "39": "hareis eso", "40": "ellos haran", "41": "haran eso", "42": "yo tendre", "43": "tendre tiempo", "44": "tu tendras", "45": "tendras tiempo", "46": "el tendra", "47": "tendra tiempo", "50": "vosotros tendreis", "51": "tendreis tiempo", "52": "ellos tendran", "53": "tendran tiempo"},
+  pinyinUnits: {},
+  distractors: "CMOBFNCRAOBFPEBUQBASBRCNI*QxHLL*QyIAG*QzHL*Q0*QpBF*Qq*Q1HfH*Q2IAAOCNBROFCMNRDQNUENMSFNOBqAEQXVdbsBNWdXTbuCEQTVdbw*Df*Lm*IabVdTy*Dh*Lo*IcVTZd0*Dj*Lq*IeVXTb*ROGACj*OYKh*RQ*Q6HBpjfn*RS*Q8IAfhp*OY*RU*Q+*Kq*ME*M3nhJ*RA*RW*Ks*RKhflp*RY*RC*Ku*RMhjfESMEQvt1zUNuB1vrzWOEQrt1zY*Df*Lm*Iazt1ra*Dh*Lo*Ictrx1c*Dj*Lq*Ietvrz"
 };
 
 export const p7_250_common__idioms = {
@@ -1660,5 +1747,8 @@ export const p7_250_common__idioms = {
     ["puede poner los pelos de punta", "can make your hair stand on end", "可以让你毛骨悚然", "kě yǐ ràng nǐ máo gǔ sǒng rán", "pode deixar seus cabelos em pé"],
     ["suele no dar ni golpe", "usually doesn't even hit", "通常很懒", "tōng cháng hěn lǎn", "geralmente nem bate"],
     ["tiende a no dar ni golpe", "tends not to hit", "往往很懒惰", "wǎng wǎng hěn lǎn duò", "tende a não bater"]
-  ]
+  ],
+  accentFree: {"6": "estar al dia", "33": "hay que estar al dia", "34": "quiero estar al dia", "51": "solia no pegar ojo"},
+  pinyinUnits: {},
+  distractors: "WFJXDECGaKSUBECGBDCGAJXaPBDEjMNclCKOoAFXqCSUsrpxtHNcwHMcAFIJGBDEGPBD43TW5CKU78RWCKSBWjstVARTBYAFXBhiaCHLCAFJDcAFbHMNHMNcEAFJgFmnfvVjYi5AYh5AHVst478rIHMNfnRToJfmnJRTqLx+KpAFsLugLrVjMuVjtrgkwNgVvNVjyOLpxORT0PAFzPAF2AFJ1AFJ4Rk73Rk7S6Yh5SHM8Tk47Tk4+UHM9Lpx"
 };
@@ -22,7 +22,10 @@ export const p1_26_clothing = {
     ["camiseta", "t-shirt", "T恤", "T xù", "camiseta"],
     ["camiseta sin mangas", "sleeveless t-shirt", "无袖T恤", "wú xiù T xù", "camiseta sem mangas"],
     ["una camiseta nueva", "a new t-shirt", "一件新T恤", "yī jiàn xīn T xù", "uma camiseta nova"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "CBFHCADEBADE"
 };
 
 export const p4_131_materials = {
@@ -35,7 +38,10 @@ export const p4_131_materials = {
   },
   words: [
     ["camiseta de algodón", "cotton t-shirt", "棉质T恤", "mián zhì T xù", "camiseta de algodão"]
-  ]
+  ],
+  accentFree: {"0": "camiseta de algodon"},
+  pinyinUnits: {},
+  distractors: "*AB*ACBD"
 };
 
 export const p5_167_fashion__style = {
@@ -48,7 +54,10 @@ export const p5_167_fashion__style = {
   },
   words: [
     ["en la pasarela", "on the catwalk", "在T台上", "zài T tái shàng", "na passarela"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "CD*AA*AC"
 };
 
 export const p6_182_telecommunications = {
@@ -63,5 +72,8 @@ export const p6_182_telecommunications = {
     ["WhatsApp", "WhatsApp", "WhatsApp应用", "W h a t s A p p yìng yòng", "WhatsApp"],
     ["por WhatsApp", "by WhatsApp", "通过WhatsApp", "tōng guò W h a t s A p p", "por WhatsApp"],
     ["en WhatsApp", "on WhatsApp", "在WhatsApp上", "zài W h a t s A p p shàng", "no WhatsApp"]
-  ]
+  ],
+  accentFree: {},
+  pinyinUnits: {},
+  distractors: "CB*AA*AECA*AE*AAAB*AA*AE"
 };
@@ -0,0 +1,272 @@
+// Language catalog - generated by PythonHelpers/build_catalog.py, do not edit
+// Acts, packs, titles and word counts for the selectors, without decoding the act modules
+
+export const catalog = {
+  "language": "spanish",
+  "acts": [
+    {"act": 1, "actName": "Foundation", "url": "./Jsmodules-js/act1-foundation-js.js", "sha256": "f0f274267a64537e7fb8b6055812d477660343cd440fbeeb88d8ba40bdf71ae0", "bytes": 53008, "actMeta": {"actNumber": 1, "actName": "Foundation", "wordColumns": ["spanish", "english", "chinese", "pinyin", "portuguese"], "translations": {"english": {"index": 1, "display": "English"}, "chinese": {"index": 2, "display": "中文"}, "portuguese": {"index": 4, "display": "Português"}}, "defaultTranslation": "english"}, "packs": [
+      {"key": "p1_1_greetings__goodbyes", "wordpack": 1, "titles": {"english": "Greetings & Goodbyes", "chinese": "问候与告别", "pinyin": "Wènhòu yǔ Gàobié", "portuguese": "Cumprimentos e Despedidas"}, "base": 15, "example": 30},
+      {"key": "p1_2_yes__no__agreement", "wordpack": 2, "titles": {"english": "Yes No & Agreement", "chinese": "是非与同意", "pinyin": "Shìfēi yǔ Tóngyì", "portuguese": "Sim Não e Acordo"}, "base": 10, "example": 20},
+      {"key": "p1_3_numbers__010", "wordpack": 3, "titles": {"english": "Numbers 0-10", "chinese": "数字 0-10", "pinyin": "Shùzì 0-10", "portuguese": "Números 0-10"}, "base": 11, "example": 22},
+      {"key": "p1_4_asking__questions__qu__cundo__dnde", "wordpack": 4, "titles": {"english": "Asking Questions", "chinese": "提问", "pinyin": "Tíwèn", "portuguese": "Fazer Perguntas"}, "base": 11, "example": 22},
+      {"key": "p1_5_referring__to__people__yo__t__l__ella", "wordpack": 5, "titles": {"english": "Referring to People", "chinese": "称呼人", "pinyin": "Chēnghu Rén", "portuguese": "Referir-se a Pessoas"}, "base": 12, "example": 24},
+      {"key": "p1_6_being__permanent__ser", "wordpack": 6, "titles": {"english": "Being Permanent (ser)", "chinese": "永久状态 (ser)", "pinyin": "Yǒngjiǔ Zhuàngtài (ser)", "portuguese": "Ser Permanente"}, "base": 15, "example": 30},
+      {"key": "p1_7_being__temporary__estar", "wordpack": 7, "titles": {"english": "Being Temporary (estar)", "chinese": "临时状态 (estar)", "pinyin": "Línshí Zhuàngtài (estar)", "portuguese": "Estar Temporário"}, "base": 15, "example": 30},
+      {"key": "p1_8_having__age__tener", "wordpack": 8, "titles": {"english": "Having & Age (tener)", "chinese": "拥有与年龄 (tener)", "pinyin": "Yǒngyǒu yǔ Niánlíng (tener)", "portuguese": "Ter e Idade"}, "base": 14, "example": 28},
+      {"key": "p1_9_the__a__articles__el__la__un__una", "wordpack": 9, "titles": {"english": "The & A Articles", "chinese": "冠词", "pinyin": "Guàncí", "portuguese": "Artigos"}, "base": 8, "example": 16},
+      {"key": "p1_10_connecting__words__y__pero__porque", "wordpack": 10, "titles": {"english": "Connecting Words", "chinese": "连接词", "pinyin": "Liánjiē Cí", "portuguese": "Palavras de Conexão"}, "base": 10, "example": 20},
+      {"key": "p1_11_days__of__the__week", "wordpack": 11, "titles": {"english": "Days of the Week", "chinese": "星期几", "pinyin": "Xīngqī Jǐ", "portuguese": "Dias da Semana"}, "base": 10, "example": 20},
+      {"key": "p1_12_months__of__the__year", "wordpack": 12, "titles": {"english": "Months of the Year", "chinese": "月份", "pinyin": "Yuèfèn", "portuguese": "Meses do Ano"}, "base": 14, "example": 28},
+      {"key": "p1_13_family__members", "wordpack": 13, "titles": {"english": "Family Members", "chinese": "家庭成员", "pinyin": "Jiātíng Chéngyuán", "portuguese": "Membros da Família"}, "base": 15, "example": 30},
+      {"key": "p1_14_body__parts", "wordpack": 14, "titles": {"english": "Body Parts", "chinese": "身体部位", "pinyin": "Shēntǐ Bùwèi", "portuguese": "Partes do Corpo"}, "base": 19, "example": 38},
+      {"key": "p1_15_colors", "wordpack": 15, "titles": {"english": "Colors", "chinese": "颜色", "pinyin": "Yánsè", "portuguese": "Cores"}, "base": 13, "example": 26},
+      {"key": "p1_16_describing__things__grande__pequeo__bueno", "wordpack": 16, "titles": {"english": "Describing Things", "chinese": "描述事物", "pinyin": "Miáoshù Shìwù", "portuguese": "Descrever Coisas"}, "base": 19, "example": 38},
+      {"key": "p1_17_basic__action__verbs", "wordpack": 17, "titles": {"english": "Basic Action Verbs", "chinese": "基本动词", "pinyin": "Jīběn Dòngcí", "portuguese": "Verbos de Ação Básicos"}, "base": 15, "example": 30},
+      {"key": "p1_18_common__foods", "wordpack": 18, "titles": {"english": "Common Foods", "chinese": "常见食物", "pinyin": "Chángjiàn Shíwù", "portuguese": "Alimentos Comuns"}, "base": 20, "example": 40},
+      {"key": "p1_19_house__rooms", "wordpack": 19, "titles": {"english": "House Rooms", "chinese": "房间", "pinyin": "Fángjiān", "portuguese": "Cômodos da Casa"}, "base": 15, "example": 30},
+      {"key": "p1_20_making__doing__hacer", "wordpack": 20, "titles": {"english": "Making & Doing (hacer)", "chinese": "制作与做 (hacer)", "pinyin": "Zhìzuò yǔ Zuò (hacer)", "portuguese": "Fazer"}, "base": 17, "example": 34},
+      {"key": "p1_21_going__places__ir", "wordpack": 21, "titles": {"english": "Going Places (ir)", "chinese": "去地方 (ir)", "pinyin": "Qù Dìfang (ir)", "portuguese": "Ir a Lugares"}, "base": 15, "example": 30},
+      {"key": "p1_22_numbers__1120", "wordpack": 22, "titles": {"english": "Numbers 11-20", "chinese": "数字 11-20", "pinyin": "Shùzì 11-20", "portuguese": "Números 11-20"}, "base": 10, "example": 20},
+      {"key": "p1_23_extended__family", "wordpack": 23, "titles": {"english": "Extended Family", "chinese": "大家庭", "pinyin": "Dà Jiātíng", "portuguese": "Família Estendida"}, "base": 15, "example": 30},
+      {"key": "p1_24_emotions__feelings", "wordpack": 24, "titles": {"english": "Emotions & Feelings", "chinese": "情感", "pinyin": "Qínggǎn", "portuguese": "Emoções e Sentimentos"}, "base": 16, "example": 32},
+      {"key": "p1_25_time__words__hoy__ayer__maana", "wordpack": 25, "titles": {"english": "Time Words", "chinese": "时间词", "pinyin": "Shíjiān Cí", "portuguese": "Palavras de Tempo"}, "base": 15, "example": 30},
+      {"key": "p1_26_clothing", "wordpack": 26, "titles": {"english": "Clothing", "chinese": "衣服", "pinyin": "Yīfu", "portuguese": "Roupas"}, "base": 15, "example": 30},
+      {"key": "p1_27_daily__activities", "wordpack": 27, "titles": {"english": "Daily Activities", "chinese": "日常活动", "pinyin": "Rìcháng Huódòng", "portuguese": "Atividades Diárias"}, "base": 15, "example": 30},
+      {"key": "p1_28_city__places", "wordpack": 28, "titles": {"english": "City Places", "chinese": "城市地点", "pinyin": "Chéngshì Dìdiǎn", "portuguese": "Lugares da Cidade"}, "base": 20, "example": 40},
+      {"key": "p1_29_transportation", "wordpack": 29, "titles": {"english": "Transportation", "chinese": "交通", "pinyin": "Jiāotōng", "portuguese": "Transporte"}, "base": 15, "example": 30},
+      {"key": "p1_30_numbers__21100", "wordpack": 30, "titles": {"english": "Numbers 21-100", "chinese": "数字 21-100", "pinyin": "Shùzì 21-100", "portuguese": "Números 21-100"}, "base": 17, "example": 34}
+    ]},
+    {"act": 2, "actName": "Building Blocks", "url": "./Jsmodules-js/act2-building-blocks-js.js", "sha256": "a9eafdddbc3235c9e0544222e023b8b78d9dd7c3a5f3a5ce4dab282b95cbd676", "bytes": 49960, "actMeta": {"actNumber": 2, "actName": "Building Blocks", "wordColumns": ["spanish", "english", "chinese", "pinyin", "portuguese"], "translations": {"english": {"index": 1, "display": "English"}, "chinese": {"index": 2, "display": "中文"}, "portuguese": {"index": 4, "display": "Português"}}, "defaultTranslation": "english"}, "packs": [
+      {"key": "p2_31_liking__things__gustar", "wordpack": 31, "titles": {"english": "Liking Things (gustar)", "chinese": "喜欢 (gustar)", "pinyin": "Xǐhuan (gustar)", "portuguese": "Gostar de Coisas"}, "base": 12, "example": 24},
+      {"key": "p2_32_weather__talk", "wordpack": 32, "titles": {"english": "Weather Talk", "chinese": "天气", "pinyin": "Tiānqì", "portuguese": "Conversa sobre Clima"}, "base": 14, "example": 28},
+      {"key": "p2_33_can__able__poder", "wordpack": 33, "titles": {"english": "Can & Able (poder)", "chinese": "能够 (poder)", "pinyin": "Nénggòu (poder)", "portuguese": "Poder"}, "base": 10, "example": 20},
+      {"key": "p2_34_want__desire__querer", "wordpack": 34, "titles": {"english": "Want & Desire (querer)", "chinese": "想要 (querer)", "pinyin": "Xiǎng Yào (querer)", "portuguese": "Querer"}, "base": 10, "example": 20},
+      {"key": "p2_35_school__supplies", "wordpack": 35, "titles": {"english": "School Supplies", "chinese": "学习用品", "pinyin": "Xuéxí Yòngpǐn", "portuguese": "Material Escolar"}, "base": 20, "example": 40},
+      {"key": "p2_36_office__work", "wordpack": 36, "titles": {"english": "Office & Work", "chinese": "办公室与工作", "pinyin": "Bàngōngshì yǔ Gōngzuò", "portuguese": "Escritório e Trabalho"}, "base": 20, "example": 40},
+      {"key": "p2_37_animals", "wordpack": 37, "titles": {"english": "Animals", "chinese": "动物", "pinyin": "Dòngwù", "portuguese": "Animais"}, "base": 20, "example": 40},
+      {"key": "p2_38_thinking__pensar", "wordpack": 38, "titles": {"english": "Thinking (pensar)", "chinese": "思考 (pensar)", "pinyin": "Sīkǎo (pensar)", "portuguese": "Pensar"}, "base": 10, "example": 20},
+      {"key": "p2_39_feeling__sentir", "wordpack": 39, "titles": {"english": "Feeling (sentir)", "chinese": "感觉 (sentir)", "pinyin": "Gǎnjué (sentir)", "portuguese": "Sentir"}, "base": 10, "example": 20},
+      {"key": "p2_40_meals__food__details", "wordpack": 40, "titles": {"english": "Meals & Food Details", "chinese": "餐食详情", "pinyin": "Cānshí Xiángqíng", "portuguese": "Refeições e Detalhes"}, "base": 20, "example": 40},
+      {"key": "p2_41_drinks__beverages", "wordpack": 41, "titles": {"english": "Drinks & Beverages", "chinese": "饮料", "pinyin": "Yǐnliào", "portuguese": "Bebidas"}, "base": 14, "example": 28},
+      {"key": "p2_42_vegetables", "wordpack": 42, "titles": {"english": "Vegetables", "chinese": "蔬菜", "pinyin": "Shūcài", "portuguese": "Vegetais"}, "base": 15, "example": 30},
+      {"key": "p2_43_fruits", "wordpack": 43, "titles": {"english": "Fruits", "chinese": "水果", "pinyin": "Shuǐguǒ", "portuguese": "Frutas"}, "base": 15, "example": 30},
+      {"key": "p2_44_need__necessity__necesitar", "wordpack": 44, "titles": {"english": "Need & Necessity (necesitar)", "chinese": "需要 (necesitar)", "pinyin": "Xūyào (necesitar)", "portuguese": "Necessidade"}, "base": 8, "example": 16},
+      {"key": "p2_45_looking__for__buscar", "wordpack": 45, "titles": {"english": "Looking For (buscar)", "chinese": "寻找 (buscar)", "pinyin": "Xúnzhǎo (buscar)", "portuguese": "Procurar"}, "base": 8, "example": 16},
+      {"key": "p2_46_telling__time", "wordpack": 46, "titles": {"english": "Telling Time", "chinese": "报时", "pinyin": "Bàoshí", "portuguese": "Dizer as Horas"}, "base": 14, "example": 28},
+      {"key": "p2_47_directions__position", "wordpack": 47, "titles": {"english": "Directions & Position", "chinese": "方向与位置", "pinyin": "Fāngxiàng yǔ Wèizhì", "portuguese": "Direções e Posição"}, "base": 15, "example": 30},
+      {"key": "p2_48_prepositions__en__con__sin__para", "wordpack": 48, "titles": {"english": "Prepositions", "chinese": "介词", "pinyin": "Jiècí", "portuguese": "Preposições"}, "base": 15, "example": 30},
+      {"key": "p2_49_comparing__things", "wordpack": 49, "titles": {"english": "Comparing Things", "chinese": "比较事物", "pinyin": "Bǐjiào Shìwù", "portuguese": "Comparar Coisas"}, "base": 15, "example": 30},
+      {"key": "p2_50_physical__actions", "wordpack": 50, "titles": {"english": "Physical Actions", "chinese": "身体动作", "pinyin": "Shēntǐ Dòngzuò", "portuguese": "Ações Físicas"}, "base": 15, "example": 30},
+      {"key": "p2_51_names__calling__llamar", "wordpack": 51, "titles": {"english": "Names & Calling (llamar)", "chinese": "名字与称呼 (llamar)", "pinyin": "Míngzi yǔ Chēnghu (llamar)", "portuguese": "Nomes e Chamar"}, "base": 10, "example": 20},
+      {"key": "p2_52_giving__dar", "wordpack": 52, "titles": {"english": "Giving (dar)", "chinese": "给予 (dar)", "pinyin": "Jǐyǔ (dar)", "portuguese": "Dar"}, "base": 10, "example": 20},
+      {"key": "p2_53_seeing__watching__ver", "wordpack": 53, "titles": {"english": "Seeing & Watching (ver)", "chinese": "看 (ver)", "pinyin": "Kàn (ver)", "portuguese": "Ver"}, "base": 10, "example": 20},
+      {"key": "p2_54_restaurant__vocabulary", "wordpack": 54, "titles": {"english": "Restaurant Vocabulary", "chinese": "餐厅词汇", "pinyin": "Cāntīng Cíhuì", "portuguese": "Vocabulário de Restaurante"}, "base": 16, "example": 32},
+      {"key": "p2_55_shopping__buying", "wordpack": 55, "titles": {"english": "Shopping & Buying", "chinese": "购物", "pinyin": "Gòuwù", "portuguese": "Compras"}, "base": 19, "example": 38},
+      {"key": "p2_56_beginning__empezar", "wordpack": 56, "titles": {"english": "Beginning (empezar)", "chinese": "开始 (empezar)", "pinyin": "Kāishǐ (empezar)", "portuguese": "Começar"}, "base": 10, "example": 20},
+      {"key": "p2_57_continuing__seguir", "wordpack": 57, "titles": {"english": "Continuing (seguir)", "chinese": "继续 (seguir)", "pinyin": "Jìxù (seguir)", "portuguese": "Continuar"}, "base": 10, "example": 20},
+      {"key": "p2_58_furniture__objects", "wordpack": 58, "titles": {"english": "Furniture & Objects", "chinese": "家具与物品", "pinyin": "Jiājù yǔ Wùpǐn", "portuguese": "Móveis e Objetos"}, "base": 18, "example": 36},
+      {"key": "p2_59_bathroom__items", "wordpack": 59, "titles": {"english": "Bathroom Items", "chinese": "浴室用品", "pinyin": "Yùshì Yòngpǐn", "portuguese": "Itens de Banheiro"}, "base": 15, "example": 30},
+      {"key": "p2_60_health__medical", "wordpack": 60, "titles": {"english": "Health & Medical", "chinese": "健康与医疗", "pinyin": "Jiànkāng yǔ Yīliáo", "portuguese": "Saúde e Medicina"}, "base": 20, "example": 40}
+    ]},
+    {"act": 3, "actName": "Daily Life", "url": "./Jsmodules-js/act3-daily-life-js.js", "sha256": "87266511af4294a0f046a31b45d594e3c6acfc53735294f8f890e32ecabb86a1", "bytes": 59644, "actMeta": {"actNumber": 3, "actName": "Daily Life", "wordColumns": ["spanish", "english", "chinese", "pinyin", "portuguese"], "translations": {"english": {"index": 1, "display": "English"}, "chinese": {"index": 2, "display": "中文"}, "portuguese": {"index": 4, "display": "Português"}}, "defaultTranslation": "english"}, "packs": [
+      {"key": "p3_61_knowing__facts__saber", "wordpack": 61, "titles": {"english": "Knowing Facts (saber)", "chinese": "知道事实 (saber)", "pinyin": "Zhīdào Shìshí (saber)", "portuguese": "Saber Fatos"}, "base": 10, "example": 20},
+      {"key": "p3_62_knowing__peopleplaces__conocer", "wordpack": 62, "titles": {"english": "Knowing People/Places (conocer)", "chinese": "认识人地 (conocer)", "pinyin": "Rènshi Réndì (conocer)", "portuguese": "Conhecer Pessoas/Lugares"}, "base": 9, "example": 18},
+      {"key": "p3_63_technology__internet", "wordpack": 63, "titles": {"english": "Technology & Internet", "chinese": "技术与网络", "pinyin": "Jìshù yǔ Wǎngluò", "portuguese": "Tecnologia e Internet"}, "base": 18, "example": 36},
+      {"key": "p3_64_asking__for__things__pedir", "wordpack": 64, "titles": {"english": "Asking For Things (pedir)", "chinese": "请求 (pedir)", "pinyin": "Qǐngqiú (pedir)", "portuguese": "Pedir Coisas"}, "base": 10, "example": 20},
+      {"key": "p3_65_asking__questions__preguntar", "wordpack": 65, "titles": {"english": "Asking Questions (preguntar)", "chinese": "提问 (preguntar)", "pinyin": "Tíwèn (preguntar)", "portuguese": "Fazer Perguntas"}, "base": 9, "example": 18},
+      {"key": "p3_66_nature__outdoors", "wordpack": 66, "titles": {"english": "Nature & Outdoors", "chinese": "自然与户外", "pinyin": "Zìrán yǔ Hùwài", "portuguese": "Natureza e Ar Livre"}, "base": 20, "example": 40},
+      {"key": "p3_67_sleeping__dormir", "wordpack": 67, "titles": {"english": "Sleeping (dormir)", "chinese": "睡觉 (dormir)", "pinyin": "Shuìjiào (dormir)", "portuguese": "Dormir"}, "base": 10, "example": 20},
+      {"key": "p3_68_playing__jugar", "wordpack": 68, "titles": {"english": "Playing (jugar)", "chinese": "玩 (jugar)", "pinyin": "Wán (jugar)", "portuguese": "Jogar"}, "base": 10, "example": 20},
+      {"key": "p3_69_sports", "wordpack": 69, "titles": {"english": "Sports", "chinese": "体育运动", "pinyin": "Tǐyù Yùndòng", "portuguese": "Esportes"}, "base": 20, "example": 40},
+      {"key": "p3_70_hobbies__interests", "wordpack": 70, "titles": {"english": "Hobbies & Interests", "chinese": "爱好", "pinyin": "Àihào", "portuguese": "Hobbies e Interesses"}, "base": 14, "example": 28},
+      {"key": "p3_71_leaving__salir", "wordpack": 71, "titles": {"english": "Leaving (salir)", "chinese": "离开 (salir)", "pinyin": "Líkāi (salir)", "portuguese": "Sair"}, "base": 10, "example": 20},
+      {"key": "p3_72_returning__volver", "wordpack": 72, "titles": {"english": "Returning (volver)", "chinese": "返回 (volver)", "pinyin": "Fǎnhuí (volver)", "portuguese": "Voltar"}, "base": 10, "example": 20},
+      {"key": "p3_73_music__songs", "wordpack": 73, "titles": {"english": "Music & Songs", "chinese": "音乐与歌曲", "pinyin": "Yīnyuè yǔ Gēqǔ", "portuguese": "Música e Canções"}, "base": 19, "example": 38},
+      {"key": "p3_74_wearing__carrying__llevar", "wordpack": 74, "titles": {"english": "Wearing & Carrying (llevar)", "chinese": "穿戴与携带 (llevar)", "pinyin": "Chuāndài yǔ Xiédài (llevar)", "portuguese": "Vestir e Carregar"}, "base": 10, "example": 20},
+      {"key": "p3_75_bringing__traer", "wordpack": 75, "titles": {"english": "Bringing (traer)", "chinese": "带来 (traer)", "pinyin": "Dài Lái (traer)", "portuguese": "Trazer"}, "base": 10, "example": 20},
+      {"key": "p3_76_school__education", "wordpack": 76, "titles": {"english": "School & Education", "chinese": "学校与教育", "pinyin": "Xuéxiào yǔ Jiàoyù", "portuguese": "Escola e Educação"}, "base": 24, "example": 48},
+      {"key": "p3_77_deep__emotions", "wordpack": 77, "titles": {"english": "Deep Emotions", "chinese": "深层情感", "pinyin": "Shēncéng Qínggǎn", "portuguese": "Emoções Profundas"}, "base": 20, "example": 40},
+      {"key": "p3_78_saying__telling__decir", "wordpack": 78, "titles": {"english": "Saying & Telling (decir)", "chinese": "说 (decir)", "pinyin": "Shuō (decir)", "portuguese": "Dizer"}, "base": 10, "example": 20},
+      {"key": "p3_79_putting__placing__poner", "wordpack": 79, "titles": {"english": "Putting & Placing (poner)", "chinese": "放置 (poner)", "pinyin": "Fàngzhì (poner)", "portuguese": "Colocar"}, "base": 10, "example": 20},
+      {"key": "p3_80_travel__tourism", "wordpack": 80, "titles": {"english": "Travel & Tourism", "chinese": "旅行与旅游", "pinyin": "Lǚxíng yǔ Lǚyóu", "portuguese": "Viagem e Turismo"}, "base": 20, "example": 40},
+      {"key": "p3_81_banking__money", "wordpack": 81, "titles": {"english": "Banking & Money", "chinese": "银行与金钱", "pinyin": "Yínháng yǔ Jīnqián", "portuguese": "Banco e Dinheiro"}, "base": 18, "example": 36},
+      {"key": "p3_82_finding__encontrar", "wordpack": 82, "titles": {"english": "Finding (encontrar)", "chinese": "找到 (encontrar)", "pinyin": "Zhǎodào (encontrar)", "portuguese": "Encontrar"}, "base": 10, "example": 20},
+      {"key": "p3_83_waiting__hoping__esperar", "wordpack": 83, "titles": {"english": "Waiting & Hoping (esperar)", "chinese": "等待与希望 (esperar)", "pinyin": "Děngdài yǔ Xīwàng (esperar)", "portuguese": "Esperar"}, "base": 9, "example": 18},
+      {"key": "p3_84_business__terms", "wordpack": 84, "titles": {"english": "Business Terms", "chinese": "商业术语", "pinyin": "Shāngyè Shùyǔ", "portuguese": "Termos de Negócios"}, "base": 20, "example": 40},
+      {"key": "p3_85_believing__creer", "wordpack": 85, "titles": {"english": "Believing (creer)", "chinese": "相信 (creer)", "pinyin": "Xiāngxìn (creer)", "portuguese": "Acreditar"}, "base": 10, "example": 20},
+      {"key": "p3_86_living__vivir", "wordpack": 86, "titles": {"english": "Living (vivir)", "chinese": "生活 (vivir)", "pinyin": "Shēnghuó (vivir)", "portuguese": "Viver"}, "base": 10, "example": 20},
+      {"key": "p3_87_cooking__verbs", "wordpack": 87, "titles": {"english": "Cooking Verbs", "chinese": "烹饪动词", "pinyin": "Pēngrèn Dòngcí", "portuguese": "Verbos de Cozinhar"}, "base": 20, "example": 40},
+      {"key": "p3_88_physical__appearance", "wordpack": 88, "titles": {"english": "Physical Appearance", "chinese": "外貌", "pinyin": "Wàimào", "portuguese": "Aparência Física"}, "base": 19, "example": 38},
+      {"key": "p3_89_receiving__recibir", "wordpack": 89, "titles": {"english": "Receiving (recibir)", "chinese": "接收 (recibir)", "pinyin": "Jiēshōu (recibir)", "portuguese": "Receber"}, "base": 10, "example": 20},
+      {"key": "p3_90_sending__enviar", "wordpack": 90, "titles": {"english": "Sending (enviar)", "chinese": "发送 (enviar)", "pinyin": "Fāsòng (enviar)", "portuguese": "Enviar"}, "base": 9, "example": 18},
+      {"key": "p3_91_personal__qualities", "wordpack": 91, "titles": {"english": "Personal Qualities", "chinese": "个人品质", "pinyin": "Gèrén Pǐnzhì", "portuguese": "Qualidades Pessoais"}, "base": 20, "example": 40},
+      {"key": "p3_92_opening__abrir", "wordpack": 92, "titles": {"english": "Opening (abrir)", "chinese": "打开 (abrir)", "pinyin": "Dǎkāi (abrir)", "portuguese": "Abrir"}, "base": 10, "example": 20},
+      {"key": "p3_93_closing__cerrar", "wordpack": 93, "titles": {"english": "Closing (cerrar)", "chinese": "关闭 (cerrar)", "pinyin": "Guānbì (cerrar)", "portuguese": "Fechar"}, "base": 10, "example": 20},
+      {"key": "p3_94_internet__web", "wordpack": 94, "titles": {"english": "Internet & Web", "chinese": "互联网", "pinyin": "Hùliánwǎng", "portuguese": "Internet e Web"}, "base": 19, "example": 38},
+      {"key": "p3_95_relationships", "wordpack": 95, "titles": {"english": "Relationships", "chinese": "关系", "pinyin": "Guānxi", "portuguese": "Relacionamentos"}, "base": 20, "example": 40},
+      {"key": "p3_96_reading__leer", "wordpack": 96, "titles": {"english": "Reading (leer)", "chinese": "阅读 (leer)", "pinyin": "Yuèdú (leer)", "portuguese": "Ler"}, "base": 10, "example": 20},
+      {"key": "p3_97_writing__escribir", "wordpack": 97, "titles": {"english": "Writing (escribir)", "chinese": "写作 (escribir)", "pinyin": "Xiězuò (escribir)", "portuguese": "Escrever"}, "base": 10, "example": 20},
+      {"key": "p3_98_government__politics", "wordpack": 98, "titles": {"english": "Government & Politics", "chinese": "政府与政治", "pinyin": "Zhèngfǔ yǔ Zhèngzhì", "portuguese": "Governo e Política"}, "base": 20, "example": 40},
+      {"key": "p3_99_showing__mostrar", "wordpack": 99, "titles": {"english": "Showing (mostrar)", "chinese": "展示 (mostrar)", "pinyin": "Zhǎnshì (mostrar)", "portuguese": "Mostrar"}, "base": 10, "example": 20},
+      {"key": "p3_100_explaining__explicar", "wordpack": 100, "titles": {"english": "Explaining (explicar)", "chinese": "解释 (explicar)", "pinyin": "Jiěshì (explicar)", "portuguese": "Explicar"}, "base": 10, "example": 20}
+    ]},
+    {"act": 4, "actName": "Expanding Expression", "url": "./Jsmodules-js/act4-expanding-expression-js.js", "sha256": "a9145204c9d92c08368d97e060cd91a0c01a564fb1f5285d8f6cd62577ec81f7", "bytes": 62532, "actMeta": {"actNumber": 4, "actName": "Expanding Expression", "wordColumns": ["spanish", "english", "chinese", "pinyin", "portuguese"], "translations": {"english": {"index": 1, "display": "English"}, "chinese": {"index": 2, "display": "中文"}, "portuguese": {"index": 4, "display": "Português"}}, "defaultTranslation": "english"}, "packs": [
+      {"key": "p4_101_law__legal", "wordpack": 101, "titles": {"english": "Law & Legal", "chinese": "法律", "pinyin": "Fǎlǜ", "portuguese": "Lei e Jurídico"}, "base": 20, "example": 40},
+      {"key": "p4_102_remembering__recordar", "wordpack": 102, "titles": {"english": "Remembering (recordar)", "chinese": "记得 (recordar)", "pinyin": "Jìde (recordar)", "portuguese": "Lembrar"}, "base": 10, "example": 20},
+      {"key": "p4_103_forgetting__olvidar", "wordpack": 103, "titles": {"english": "Forgetting (olvidar)", "chinese": "忘记 (olvidar)", "pinyin": "Wàngjì (olvidar)", "portuguese": "Esquecer"}, "base": 10, "example": 20},
+      {"key": "p4_104_science__terms", "wordpack": 104, "titles": {"english": "Science Terms", "chinese": "科学术语", "pinyin": "Kēxué Shùyǔ", "portuguese": "Termos Científicos"}, "base": 19, "example": 38},
+      {"key": "p4_105_learning__aprender", "wordpack": 105, "titles": {"english": "Learning (aprender)", "chinese": "学习 (aprender)", "pinyin": "Xuéxí (aprender)", "portuguese": "Aprender"}, "base": 10, "example": 20},
+      {"key": "p4_106_teaching__ensear", "wordpack": 106, "titles": {"english": "Teaching (enseñar)", "chinese": "教学 (enseñar)", "pinyin": "Jiàoxué (enseñar)", "portuguese": "Ensinar"}, "base": 10, "example": 20},
+      {"key": "p4_107_environment__nature", "wordpack": 107, "titles": {"english": "Environment & Nature", "chinese": "环境与自然", "pinyin": "Huánjìng yǔ Zìrán", "portuguese": "Meio Ambiente e Natureza"}, "base": 20, "example": 40},
+      {"key": "p4_108_changing__cambiar", "wordpack": 108, "titles": {"english": "Changing (cambiar)", "chinese": "改变 (cambiar)", "pinyin": "Gǎibiàn (cambiar)", "portuguese": "Mudar"}, "base": 10, "example": 20},
+      {"key": "p4_109_improving__mejorar", "wordpack": 109, "titles": {"english": "Improving (mejorar)", "chinese": "改进 (mejorar)", "pinyin": "Gǎijìn (mejorar)", "portuguese": "Melhorar"}, "base": 10, "example": 20},
+      {"key": "p4_110_media__news", "wordpack": 110, "titles": {"english": "Media & News", "chinese": "媒体与新闻", "pinyin": "Méitǐ yǔ Xīnwén", "portuguese": "Mídia e Notícias"}, "base": 18, "example": 36},
+      {"key": "p4_111_trying__intentar", "wordpack": 111, "titles": {"english": "Trying (intentar)", "chinese": "尝试 (intentar)", "pinyin": "Chángshì (intentar)", "portuguese": "Tentar"}, "base": 9, "example": 18},
+      {"key": "p4_112_getting__achieving__conseguir", "wordpack": 112, "titles": {"english": "Getting & Achieving (conseguir)", "chinese": "获得 (conseguir)", "pinyin": "Huòdé (conseguir)", "portuguese": "Conseguir"}, "base": 9, "example": 18},
+      {"key": "p4_113_geography", "wordpack": 113, "titles": {"english": "Geography", "chinese": "地理", "pinyin": "Dìlǐ", "portuguese": "Geografia"}, "base": 21, "example": 42},
+      {"key": "p4_114_seeming__appearing__parecer", "wordpack": 114, "titles": {"english": "Seeming & Appearing (parecer)", "chinese": "似乎 (parecer)", "pinyin": "Sìhū (parecer)", "portuguese": "Parecer"}, "base": 10, "example": 20},
+      {"key": "p4_115_staying__meeting__quedar", "wordpack": 115, "titles": {"english": "Staying & Meeting (quedar)", "chinese": "留下与见面 (quedar)", "pinyin": "Liúxià yǔ Jiànmiàn (quedar)", "portuguese": "Ficar e Encontrar"}, "base": 10, "example": 20},
+      {"key": "p4_116_art__culture", "wordpack": 116, "titles": {"english": "Art & Culture", "chinese": "艺术与文化", "pinyin": "Yìshù yǔ Wénhuà", "portuguese": "Arte e Cultura"}, "base": 18, "example": 36},
+      {"key": "p4_117_arriving__llegar", "wordpack": 117, "titles": {"english": "Arriving (llegar)", "chinese": "到达 (llegar)", "pinyin": "Dàodá (llegar)", "portuguese": "Chegar"}, "base": 10, "example": 20},
+      {"key": "p4_118_happening__pasar", "wordpack": 118, "titles": {"english": "Happening (pasar)", "chinese": "发生 (pasar)", "pinyin": "Fāshēng (pasar)", "portuguese": "Acontecer"}, "base": 10, "example": 20},
+      {"key": "p4_119_religion__faith", "wordpack": 119, "titles": {"english": "Religion & Faith", "chinese": "宗教与信仰", "pinyin": "Zōngjiào yǔ Xìnyǎng", "portuguese": "Religião e Fé"}, "base": 20, "example": 40},
+      {"key": "p4_120_letting__leaving__dejar", "wordpack": 120, "titles": {"english": "Letting & Leaving (dejar)", "chinese": "让与留下 (dejar)", "pinyin": "Ràng yǔ Liúxià (dejar)", "portuguese": "Deixar"}, "base": 10, "example": 20},
+      {"key": "p4_121_using__usar", "wordpack": 121, "titles": {"english": "Using (usar)", "chinese": "使用 (usar)", "pinyin": "Shǐyòng (usar)", "portuguese": "Usar"}, "base": 10, "example": 20},
+      {"key": "p4_122_tools__building", "wordpack": 122, "titles": {"english": "Tools & Building", "chinese": "工具与建筑", "pinyin": "Gōngjù yǔ Jiànzhù", "portuguese": "Ferramentas e Construção"}, "base": 20, "example": 40},
+      {"key": "p4_123_telling__counting__contar", "wordpack": 123, "titles": {"english": "Telling & Counting (contar)", "chinese": "讲述与计数 (contar)", "pinyin": "Jiǎngshù yǔ Jìshù (contar)", "portuguese": "Contar"}, "base": 10, "example": 20},
+      {"key": "p4_124_creating__crear", "wordpack": 124, "titles": {"english": "Creating (crear)", "chinese": "创造 (crear)", "pinyin": "Chuàngzào (crear)", "portuguese": "Criar"}, "base": 10, "example": 20},
+      {"key": "p4_125_personality__types", "wordpack": 125, "titles": {"english": "Personality Types", "chinese": "性格类型", "pinyin": "Xìnggé Lèixíng", "portuguese": "Tipos de Personalidade"}, "base": 20, "example": 40},
+      {"key": "p4_126_going__up__subir", "wordpack": 126, "titles": {"english": "Going Up (subir)", "chinese": "上升 (subir)", "pinyin": "Shàngshēng (subir)", "portuguese": "Subir"}, "base": 10, "example": 20},
+      {"key": "p4_127_going__down__bajar", "wordpack": 127, "titles": {"english": "Going Down (bajar)", "chinese": "下降 (bajar)", "pinyin": "Xiàjiàng (bajar)", "portuguese": "Descer"}, "base": 9, "example": 18},
+      {"key": "p4_128_emergency__safety", "wordpack": 128, "titles": {"english": "Emergency & Safety", "chinese": "紧急与安全", "pinyin": "Jǐnjí yǔ Ānquán", "portuguese": "Emergência e Segurança"}, "base": 18, "example": 36},
+      {"key": "p4_129_falling__caer", "wordpack": 129, "titles": {"english": "Falling (caer)", "chinese": "跌落 (caer)", "pinyin": "Diēluò (caer)", "portuguese": "Cair"}, "base": 10, "example": 20},
+      {"key": "p4_130_lifting__waking__levantar", "wordpack": 130, "titles": {"english": "Lifting & Waking (levantar)", "chinese": "抬起与醒来 (levantar)", "pinyin": "Táiqǐ yǔ Xǐnglái (levantar)", "portuguese": "Levantar"}, "base": 10, "example": 20},
+      {"key": "p4_131_materials", "wordpack": 131, "titles": {"english": "Materials", "chinese": "材料", "pinyin": "Cáiliào", "portuguese": "Materiais"}, "base": 20, "example": 40},
+      {"key": "p4_132_touching__playing__music__tocar", "wordpack": 132, "titles": {"english": "Touching & Playing Music (tocar)", "chinese": "触摸与演奏 (tocar)", "pinyin": "Chùmō yǔ Yǎnzòu (tocar)", "portuguese": "Tocar"}, "base": 10, "example": 20},
+      {"key": "p4_133_breaking__romper", "wordpack": 133, "titles": {"english": "Breaking (romper)", "chinese": "打破 (romper)", "pinyin": "Dǎpò (romper)", "portuguese": "Quebrar"}, "base": 10, "example": 20},
+      {"key": "p4_134_farming__agriculture", "wordpack": 134, "titles": {"english": "Farming & Agriculture", "chinese": "农业", "pinyin": "Nóngyè", "portuguese": "Agricultura"}, "base": 20, "example": 40},
+      {"key": "p4_135_sharing__compartir", "wordpack": 135, "titles": {"english": "Sharing (compartir)", "chinese": "分享 (compartir)", "pinyin": "Fēnxiǎng (compartir)", "portuguese": "Compartilhar"}, "base": 10, "example": 20},
+      {"key": "p4_136_participating__participar", "wordpack": 136, "titles": {"english": "Participating (participar)", "chinese": "参与 (participar)", "pinyin": "Cānyù (participar)", "portuguese": "Participar"}, "base": 10, "example": 20},
+      {"key": "p4_137_math__operations", "wordpack": 137, "titles": {"english": "Math Operations", "chinese": "数学运算", "pinyin": "Shùxué Yùnsuàn", "portuguese": "Operações Matemáticas"}, "base": 19, "example": 38},
+      {"key": "p4_138_preparing__preparar", "wordpack": 138, "titles": {"english": "Preparing (preparar)", "chinese": "准备 (preparar)", "pinyin": "Zhǔnbèi (preparar)", "portuguese": "Preparar"}, "base": 10, "example": 20},
+      {"key": "p4_139_cooking__cocinar", "wordpack": 139, "titles": {"english": "Cooking (cocinar)", "chinese": "烹饪 (cocinar)", "pinyin": "Pēngrèn (cocinar)", "portuguese": "Cozinhar"}, "base": 10, "example": 20},
+      {"key": "p4_140_history__terms", "wordpack": 140, "titles": {"english": "History Terms", "chinese": "历史术语", "pinyin": "Lìshǐ Shùyǔ", "portuguese": "Termos Históricos"}, "base": 20, "example": 40}
+    ]},
+    {"act": 5, "actName": "Intermediate Mastery", "url": "./Jsmodules-js/act5-intermediate-mastery-js.js", "sha256": "f4a1d8857e07942cde723d6bb370033dac47c2d8fd22e1559ccda0919216ed9f", "bytes": 49708, "actMeta": {"actNumber": 5, "actName": "Intermediate Mastery", "wordColumns": ["spanish", "english", "chinese", "pinyin", "portuguese"], "translations": {"english": {"index": 1, "display": "English"}, "chinese": {"index": 2, "display": "中文"}, "portuguese": {"index": 4, "display": "Português"}}, "defaultTranslation": "english"}, "packs": [
+      {"key": "p5_141_accepting__aceptar", "wordpack": 141, "titles": {"english": "Accepting (aceptar)", "chinese": "接受 (aceptar)", "pinyin": "Jiēshòu (aceptar)", "portuguese": "Aceitar"}, "base": 10, "example": 20},
+      {"key": "p5_142_rejecting__rechazar", "wordpack": 142, "titles": {"english": "Rejecting (rechazar)", "chinese": "拒绝 (rechazar)", "pinyin": "Jùjué (rechazar)", "portuguese": "Rejeitar"}, "base": 9, "example": 18},
+      {"key": "p5_143_space__universe", "wordpack": 143, "titles": {"english": "Space & Universe", "chinese": "太空与宇宙", "pinyin": "Tàikōng yǔ Yǔzhòu", "portuguese": "Espaço e Universo"}, "base": 19, "example": 38},
+      {"key": "p5_144_offering__ofrecer", "wordpack": 144, "titles": {"english": "Offering (ofrecer)", "chinese": "提供 (ofrecer)", "pinyin": "Tígōng (ofrecer)", "portuguese": "Oferecer"}, "base": 10, "example": 20},
+      {"key": "p5_145_promising__prometer", "wordpack": 145, "titles": {"english": "Promising (prometer)", "chinese": "承诺 (prometer)", "pinyin": "Chéngnuò (prometer)", "portuguese": "Prometer"}, "base": 10, "example": 20},
+      {"key": "p5_146_chemistry__terms", "wordpack": 146, "titles": {"english": "Chemistry Terms", "chinese": "化学术语", "pinyin": "Huàxué Shùyǔ", "portuguese": "Termos de Química"}, "base": 19, "example": 38},
+      {"key": "p5_147_moving__mover", "wordpack": 147, "titles": {"english": "Moving (mover)", "chinese": "移动 (mover)", "pinyin": "Yídòng (mover)", "portuguese": "Mover"}, "base": 10, "example": 20},
+      {"key": "p5_148_stopping__detener", "wordpack": 148, "titles": {"english": "Stopping (detener)", "chinese": "停止 (detener)", "pinyin": "Tíngzhǐ (detener)", "portuguese": "Parar"}, "base": 10, "example": 20},
+      {"key": "p5_149_military__terms", "wordpack": 149, "titles": {"english": "Military Terms", "chinese": "军事术语", "pinyin": "Jūnshì Shùyǔ", "portuguese": "Termos Militares"}, "base": 17, "example": 34},
+      {"key": "p5_150_continuing__continuar", "wordpack": 150, "titles": {"english": "Continuing (continuar)", "chinese": "继续 (continuar)", "pinyin": "Jìxù (continuar)", "portuguese": "Continuar"}, "base": 10, "example": 20},
+      {"key": "p5_151_finishing__terminar", "wordpack": 151, "titles": {"english": "Finishing (terminar)", "chinese": "完成 (terminar)", "pinyin": "Wánchéng (terminar)", "portuguese": "Terminar"}, "base": 10, "example": 20},
+      {"key": "p5_152_literature__books", "wordpack": 152, "titles": {"english": "Literature & Books", "chinese": "文学与书籍", "pinyin": "Wénxué yǔ Shūjí", "portuguese": "Literatura e Livros"}, "base": 19, "example": 38},
+      {"key": "p5_153_developing__desarrollar", "wordpack": 153, "titles": {"english": "Developing (desarrollar)", "chinese": "发展 (desarrollar)", "pinyin": "Fāzhǎn (desarrollar)", "portuguese": "Desenvolver"}, "base": 10, "example": 20},
+      {"key": "p5_154_producing__producir", "wordpack": 154, "titles": {"english": "Producing (producir)", "chinese": "生产 (producir)", "pinyin": "Shēngchǎn (producir)", "portuguese": "Produzir"}, "base": 8, "example": 16},
+      {"key": "p5_155_construction", "wordpack": 155, "titles": {"english": "Construction", "chinese": "建筑", "pinyin": "Jiànzhù", "portuguese": "Construção"}, "base": 19, "example": 38},
+      {"key": "p5_156_directing__dirigir", "wordpack": 156, "titles": {"english": "Directing (dirigir)", "chinese": "指导 (dirigir)", "pinyin": "Zhǐdǎo (dirigir)", "portuguese": "Dirigir"}, "base": 10, "example": 20},
+      {"key": "p5_157_organizing__organizar", "wordpack": 157, "titles": {"english": "Organizing (organizar)", "chinese": "组织 (organizar)", "pinyin": "Zǔzhī (organizar)", "portuguese": "Organizar"}, "base": 10, "example": 20},
+      {"key": "p5_158_theater__acting", "wordpack": 158, "titles": {"english": "Theater & Acting", "chinese": "戏剧与表演", "pinyin": "Xìjù yǔ Biǎoyǎn", "portuguese": "Teatro e Atuação"}, "base": 20, "example": 40},
+      {"key": "p5_159_traveling__viajar", "wordpack": 159, "titles": {"english": "Traveling (viajar)", "chinese": "旅行 (viajar)", "pinyin": "Lǚxíng (viajar)", "portuguese": "Viajar"}, "base": 10, "example": 20},
+      {"key": "p5_160_resting__descansar", "wordpack": 160, "titles": {"english": "Resting (descansar)", "chinese": "休息 (descansar)", "pinyin": "Xiūxi (descansar)", "portuguese": "Descansar"}, "base": 10, "example": 20},
+      {"key": "p5_161_philosophy__terms", "wordpack": 161, "titles": {"english": "Philosophy Terms", "chinese": "哲学术语", "pinyin": "Zhéxué Shùyǔ", "portuguese": "Termos Filosóficos"}, "base": 19, "example": 38},
+      {"key": "p5_162_practicing__practicar", "wordpack": 162, "titles": {"english": "Practicing (practicar)", "chinese": "练习 (practicar)", "pinyin": "Liànxí (practicar)", "portuguese": "Praticar"}, "base": 9, "example": 18},
+      {"key": "p5_163_winning__earning__ganar", "wordpack": 163, "titles": {"english": "Winning & Earning (ganar)", "chinese": "赢得 (ganar)", "pinyin": "Yíngdé (ganar)", "portuguese": "Ganhar"}, "base": 9, "example": 18},
+      {"key": "p5_164_dance__dancing", "wordpack": 164, "titles": {"english": "Dance & Dancing", "chinese": "舞蹈", "pinyin": "Wǔdǎo", "portuguese": "Dança"}, "base": 20, "example": 40},
+      {"key": "p5_165_losing__perder", "wordpack": 165, "titles": {"english": "Losing (perder)", "chinese": "失去 (perder)", "pinyin": "Shīqù (perder)", "portuguese": "Perder"}, "base": 9, "example": 18},
+      {"key": "p5_166_forming__formar", "wordpack": 166, "titles": {"english": "Forming (formar)", "chinese": "形成 (formar)", "pinyin": "Xíngchéng (formar)", "portuguese": "Formar"}, "base": 9, "example": 18},
+      {"key": "p5_167_fashion__style", "wordpack": 167, "titles": {"english": "Fashion & Style", "chinese": "时尚与风格", "pinyin": "Shíshàng yǔ Fēnggé", "portuguese": "Moda e Estilo"}, "base": 17, "example": 34},
+      {"key": "p5_168_reaching__alcanzar", "wordpack": 168, "titles": {"english": "Reaching (alcanzar)", "chinese": "达到 (alcanzar)", "pinyin": "Dádào (alcanzar)", "portuguese": "Alcançar"}, "base": 10, "example": 20},
+      {"key": "p5_169_maintaining__mantener", "wordpack": 169, "titles": {"english": "Maintaining (mantener)", "chinese": "维持 (mantener)", "pinyin": "Wéichí (mantener)", "portuguese": "Manter"}, "base": 10, "example": 20},
+      {"key": "p5_170_psychology__terms", "wordpack": 170, "titles": {"english": "Psychology Terms", "chinese": "心理学术语", "pinyin": "Xīnlǐxué Shùyǔ", "portuguese": "Termos de Psicologia"}, "base": 20, "example": 40},
+      {"key": "p5_171_solving__resolver", "wordpack": 171, "titles": {"english": "Solving (resolver)", "chinese": "解决 (resolver)", "pinyin": "Jiějué (resolver)", "portuguese": "Resolver"}, "base": 10, "example": 20},
+      {"key": "p5_172_avoiding__evitar", "wordpack": 172, "titles": {"english": "Avoiding (evitar)", "chinese": "避免 (evitar)", "pinyin": "Bìmiǎn (evitar)", "portuguese": "Evitar"}, "base": 10, "example": 20},
+      {"key": "p5_173_journalism__terms", "wordpack": 173, "titles": {"english": "Journalism Terms", "chinese": "新闻术语", "pinyin": "Xīnwén Shùyǔ", "portuguese": "Termos de Jornalismo"}, "base": 18, "example": 36},
+      {"key": "p5_174_supposing__suponer", "wordpack": 174, "titles": {"english": "Supposing (suponer)", "chinese": "假设 (suponer)", "pinyin": "Jiǎshè (suponer)", "portuguese": "Supor"}, "base": 10, "example": 20},
+      {"key": "p5_175_meaning__significar", "wordpack": 175, "titles": {"english": "Meaning (significar)", "chinese": "意味 (significar)", "pinyin": "Yìwèi (significar)", "portuguese": "Significar"}, "base": 10, "example": 20},
+      {"key": "p5_176_photography__terms", "wordpack": 176, "titles": {"english": "Photography Terms", "chinese": "摄影术语", "pinyin": "Shèyǐng Shùyǔ", "portuguese": "Termos de Fotografia"}, "base": 17, "example": 34},
+      {"key": "p5_177_choosing__elegir", "wordpack": 177, "titles": {"english": "Choosing (elegir)", "chinese": "选择 (elegir)", "pinyin": "Xuǎnzé (elegir)", "portuguese": "Escolher"}, "base": 10, "example": 20},
+      {"key": "p5_178_deciding__decidir", "wordpack": 178, "titles": {"english": "Deciding (decidir)", "chinese": "决定 (decidir)", "pinyin": "Juédìng (decidir)", "portuguese": "Decidir"}, "base": 10, "example": 20},
+      {"key": "p5_179_marketing__advertising", "wordpack": 179, "titles": {"english": "Marketing & Advertising", "chinese": "营销与广告", "pinyin": "Yíngxiāo yǔ Guǎnggào", "portuguese": "Marketing e Publicidade"}, "base": 18, "example": 36},
+      {"key": "p5_180_appearing__aparecer", "wordpack": 180, "titles": {"english": "Appearing (aparecer)", "chinese": "出现 (aparecer)", "pinyin": "Chūxiàn (aparecer)", "portuguese": "Aparecer"}, "base": 10, "example": 20}
+    ]},
+    {"act": 6, "actName": "Advanced Constructs", "url": "./Jsmodules-js/act6-advanced-constructs-js.js", "sha256": "5544f76e14597419dfcf473c7a7b663c36a980f22ddd95cfdb69b702b46971ea", "bytes": 50400, "actMeta": {"actNumber": 6, "actName": "Advanced Constructs", "wordColumns": ["spanish", "english", "chinese", "pinyin", "portuguese"], "translations": {"english": {"index": 1, "display": "English"}, "chinese": {"index": 2, "display": "中文"}, "portuguese": {"index": 4, "display": "Português"}}, "defaultTranslation": "english"}, "packs": [
+      {"key": "p6_181_disappearing__desaparecer", "wordpack": 181, "titles": {"english": "Disappearing (desaparecer)", "chinese": "消失 (desaparecer)", "pinyin": "Xiāoshī (desaparecer)", "portuguese": "Desaparecer"}, "base": 10, "example": 20},
+      {"key": "p6_182_telecommunications", "wordpack": 182, "titles": {"english": "Telecommunications", "chinese": "电信", "pinyin": "Diànxìn", "portuguese": "Telecomunicações"}, "base": 20, "example": 40},
+      {"key": "p6_183_birthdays__fulfilling__cumplir", "wordpack": 183, "titles": {"english": "Birthdays & Fulfilling (cumplir)", "chinese": "生日与实现 (cumplir)", "pinyin": "Shēngrì yǔ Shíxiàn (cumplir)", "portuguese": "Aniversários e Cumprir"}, "base": 10, "example": 20},
+      {"key": "p6_184_missing__lacking__faltar", "wordpack": 184, "titles": {"english": "Missing & Lacking (faltar)", "chinese": "缺少 (faltar)", "pinyin": "Quēshǎo (faltar)", "portuguese": "Faltar"}, "base": 9, "example": 18},
+      {"key": "p6_185_tourism__terms", "wordpack": 185, "titles": {"english": "Tourism Terms", "chinese": "旅游术语", "pinyin": "Lǚyóu Shùyǔ", "portuguese": "Termos de Turismo"}, "base": 19, "example": 38},
+      {"key": "p6_186_noticing__notar", "wordpack": 186, "titles": {"english": "Noticing (notar)", "chinese": "注意到 (notar)", "pinyin": "Zhùyìdào (notar)", "portuguese": "Notar"}, "base": 9, "example": 18},
+      {"key": "p6_187_allowing__permitir", "wordpack": 187, "titles": {"english": "Allowing (permitir)", "chinese": "允许 (permitir)", "pinyin": "Yǔnxǔ (permitir)", "portuguese": "Permitir"}, "base": 10, "example": 20},
+      {"key": "p6_188_manufacturing__terms", "wordpack": 188, "titles": {"english": "Manufacturing Terms", "chinese": "制造术语", "pinyin": "Zhìzào Shùyǔ", "portuguese": "Termos de Manufatura"}, "base": 18, "example": 36},
+      {"key": "p6_189_achieving__lograr", "wordpack": 189, "titles": {"english": "Achieving (lograr)", "chinese": "实现 (lograr)", "pinyin": "Shíxiàn (lograr)", "portuguese": "Alcançar"}, "base": 9, "example": 18},
+      {"key": "p6_190_performing__realizar", "wordpack": 190, "titles": {"english": "Performing (realizar)", "chinese": "执行 (realizar)", "pinyin": "Zhíxíng (realizar)", "portuguese": "Realizar"}, "base": 10, "example": 20},
+      {"key": "p6_191_economics__terms", "wordpack": 191, "titles": {"english": "Economics Terms", "chinese": "经济学术语", "pinyin": "Jīngjìxué Shùyǔ", "portuguese": "Termos de Economia"}, "base": 19, "example": 38},
+      {"key": "p6_192_existing__existir", "wordpack": 192, "titles": {"english": "Existing (existir)", "chinese": "存在 (existir)", "pinyin": "Cúnzài (existir)", "portuguese": "Existir"}, "base": 9, "example": 18},
+      {"key": "p6_193_depending__depender", "wordpack": 193, "titles": {"english": "Depending (depender)", "chinese": "依赖 (depender)", "pinyin": "Yīlài (depender)", "portuguese": "Depender"}, "base": 10, "example": 20},
+      {"key": "p6_194_retail__sales", "wordpack": 194, "titles": {"english": "Retail & Sales", "chinese": "零售与销售", "pinyin": "Língshòu yǔ Xiāoshòu", "portuguese": "Varejo e Vendas"}, "base": 19, "example": 38},
+      {"key": "p6_195_belonging__pertenecer", "wordpack": 195, "titles": {"english": "Belonging (pertenecer)", "chinese": "属于 (pertenecer)", "pinyin": "Shǔyú (pertenecer)", "portuguese": "Pertencer"}, "base": 10, "example": 20},
+      {"key": "p6_196_deserving__merecer", "wordpack": 196, "titles": {"english": "Deserving (merecer)", "chinese": "值得 (merecer)", "pinyin": "Zhídé (merecer)", "portuguese": "Merecer"}, "base": 10, "example": 20},
+      {"key": "p6_197_insurance__terms", "wordpack": 197, "titles": {"english": "Insurance Terms", "chinese": "保险术语", "pinyin": "Bǎoxiǎn Shùyǔ", "portuguese": "Termos de Seguro"}, "base": 19, "example": 38},
+      {"key": "p6_198_suffering__sufrir", "wordpack": 198, "titles": {"english": "Suffering (sufrir)", "chinese": "遭受 (sufrir)", "pinyin": "Zāoshòu (sufrir)", "portuguese": "Sofrer"}, "base": 10, "example": 20},
+      {"key": "p6_199_enjoying__disfrutar", "wordpack": 199, "titles": {"english": "Enjoying (disfrutar)", "chinese": "享受 (disfrutar)", "pinyin": "Xiǎngshòu (disfrutar)", "portuguese": "Desfrutar"}, "base": 10, "example": 20},
+      {"key": "p6_200_real__estate__terms", "wordpack": 200, "titles": {"english": "Real Estate Terms", "chinese": "房地产术语", "pinyin": "Fángdìchǎn Shùyǔ", "portuguese": "Termos Imobiliários"}, "base": 17, "example": 34},
+      {"key": "p6_201_occurring__ocurrir", "wordpack": 201, "titles": {"english": "Occurring (ocurrir)", "chinese": "发生 (ocurrir)", "pinyin": "Fāshēng (ocurrir)", "portuguese": "Ocorrer"}, "base": 10, "example": 20},
+      {"key": "p6_202_happening__suceder", "wordpack": 202, "titles": {"english": "Happening (suceder)", "chinese": "发生 (suceder)", "pinyin": "Fāshēng (suceder)", "portuguese": "Suceder"}, "base": 9, "example": 18},
+      {"key": "p6_203_aviation__terms", "wordpack": 203, "titles": {"english": "Aviation Terms", "chinese": "航空术语", "pinyin": "Hángkōng Shùyǔ", "portuguese": "Termos de Aviação"}, "base": 18, "example": 36},
+      {"key": "p6_204_protecting__proteger", "wordpack": 204, "titles": {"english": "Protecting (proteger)", "chinese": "保护 (proteger)", "pinyin": "Bǎohù (proteger)", "portuguese": "Proteger"}, "base": 10, "example": 20},
+      {"key": "p6_205_defending__defender", "wordpack": 205, "titles": {"english": "Defending (defender)", "chinese": "防御 (defender)", "pinyin": "Fángyù (defender)", "portuguese": "Defender"}, "base": 10, "example": 20},
+      {"key": "p6_206_logistics__shipping", "wordpack": 206, "titles": {"english": "Logistics & Shipping", "chinese": "物流与运输", "pinyin": "Wùliú yǔ Yùnshū", "portuguese": "Logística e Transporte"}, "base": 20, "example": 40},
+      {"key": "p6_207_reducing__reducir", "wordpack": 207, "titles": {"english": "Reducing (reducir)", "chinese": "减少 (reducir)", "pinyin": "Jiǎnshǎo (reducir)", "portuguese": "Reduzir"}, "base": 10, "example": 20},
+      {"key": "p6_208_increasing__aumentar", "wordpack": 208, "titles": {"english": "Increasing (aumentar)", "chinese": "增加 (aumentar)", "pinyin": "Zēngjiā (aumentar)", "portuguese": "Aumentar"}, "base": 10, "example": 20},
+      {"key": "p6_209_pharmaceutical__terms", "wordpack": 209, "titles": {"english": "Pharmaceutical Terms", "chinese": "制药术语", "pinyin": "Zhìyào Shùyǔ", "portuguese": "Termos Farmacêuticos"}, "base": 18, "example": 36},
+      {"key": "p6_210_demonstrating__demostrar", "wordpack": 210, "titles": {"english": "Demonstrating (demostrar)", "chinese": "演示 (demostrar)", "pinyin": "Yǎnshì (demostrar)", "portuguese": "Demonstrar"}, "base": 10, "example": 20},
+      {"key": "p6_211_checking__comprobar", "wordpack": 211, "titles": {"english": "Checking (comprobar)", "chinese": "检查 (comprobar)", "pinyin": "Jiǎnchá (comprobar)", "portuguese": "Verificar"}, "base": 10, "example": 20},
+      {"key": "p6_212_energy__power", "wordpack": 212, "titles": {"english": "Energy & Power", "chinese": "能源与电力", "pinyin": "Néngyuán yǔ Diànlì", "portuguese": "Energia e Poder"}, "base": 19, "example": 38},
+      {"key": "p6_213_thanking__agradecer", "wordpack": 213, "titles": {"english": "Thanking (agradecer)", "chinese": "感谢 (agradecer)", "pinyin": "Gǎnxiè (agradecer)", "portuguese": "Agradecer"}, "base": 10, "example": 20},
+      {"key": "p6_214_congratulating__felicitar", "wordpack": 214, "titles": {"english": "Congratulating (felicitar)", "chinese": "祝贺 (felicitar)", "pinyin": "Zhùhè (felicitar)", "portuguese": "Felicitar"}, "base": 10, "example": 20},
+      {"key": "p6_215_automotive__terms", "wordpack": 215, "titles": {"english": "Automotive Terms", "chinese": "汽车术语", "pinyin": "Qìchē Shùyǔ", "portuguese": "Termos Automotivos"}, "base": 20, "example": 40},
+      {"key": "p6_216_suggesting__sugerir", "wordpack": 216, "titles": {"english": "Suggesting (sugerir)", "chinese": "建议 (sugerir)", "pinyin": "Jiànyì (sugerir)", "portuguese": "Sugerir"}, "base": 9, "example": 18},
+      {"key": "p6_217_recommending__recomendar", "wordpack": 217, "titles": {"english": "Recommending (recomendar)", "chinese": "推荐 (recomendar)", "pinyin": "Tuījiàn (recomendar)", "portuguese": "Recomendar"}, "base": 9, "example": 18},
+      {"key": "p6_218_subjunctive__triggers", "wordpack": 218, "titles": {"english": "Subjunctive Triggers", "chinese": "虚拟语气触发词", "pinyin": "Xūnǐ Yǔqì Chùfā Cí", "portuguese": "Gatilhos do Subjuntivo"}, "base": 17, "example": 34},
+      {"key": "p6_219_convincing__convencer", "wordpack": 219, "titles": {"english": "Convincing (convencer)", "chinese": "说服 (convencer)", "pinyin": "Shuōfú (convencer)", "portuguese": "Convencer"}, "base": 10, "example": 20},
+      {"key": "p6_220_trusting__confiar", "wordpack": 220, "titles": {"english": "Trusting (confiar)", "chinese": "信任 (confiar)", "pinyin": "Xìnrèn (confiar)", "portuguese": "Confiar"}, "base": 10, "example": 20}
+    ]},
+    {"act": 7, "actName": "Mastery & Fluency", "url": "./Jsmodules-js/act7-mastery-fluency-js.js", "sha256": "29f4582aa91f8b2f7bbe3c4b2228d7f2b311c222ec7068a674be531548ec8c97", "bytes": 44160, "actMeta": {"actNumber": 7, "actName": "Mastery & Fluency", "wordColumns": ["spanish", "english", "chinese", "pinyin", "portuguese"], "translations": {"english": {"index": 1, "display": "English"}, "chinese": {"index": 2, "display": "中文"}, "portuguese": {"index": 4, "display": "Português"}}, "defaultTranslation": "english"}, "packs": [
+      {"key": "p7_221_past__subjunctive__forms", "wordpack": 221, "titles": {"english": "Past Subjunctive Forms", "chinese": "过去虚拟语气", "pinyin": "Guòqù Xūnǐ Yǔqì", "portuguese": "Formas do Subjuntivo Passado"}, "base": 20, "example": 40},
+      {"key": "p7_222_dreaming__soar", "wordpack": 222, "titles": {"english": "Dreaming (soñar)", "chinese": "梦想 (soñar)", "pinyin": "Mèngxiǎng (soñar)", "portuguese": "Sonhar"}, "base": 10, "example": 20},
+      {"key": "p7_223_agreeing__acordar", "wordpack": 223, "titles": {"english": "Agreeing (acordar)", "chinese": "同意 (acordar)", "pinyin": "Tóngyì (acordar)", "portuguese": "Concordar"}, "base": 9, "example": 18},
+      {"key": "p7_224_robotics__ai__terms", "wordpack": 224, "titles": {"english": "Robotics & AI Terms", "chinese": "机器人与人工智能术语", "pinyin": "Jīqìrén yǔ Réngōng Zhìnéng Shùyǔ", "portuguese": "Termos de Robótica e IA"}, "base": 20, "example": 40},
+      {"key": "p7_225_warming__calentar", "wordpack": 225, "titles": {"english": "Warming (calentar)", "chinese": "加热 (calentar)", "pinyin": "Jiārè (calentar)", "portuguese": "Aquecer"}, "base": 10, "example": 20},
+      {"key": "p7_226_cooling__enfriar", "wordpack": 226, "titles": {"english": "Cooling (enfriar)", "chinese": "冷却 (enfriar)", "pinyin": "Lěngquè (enfriar)", "portuguese": "Esfriar"}, "base": 10, "example": 20},
+      {"key": "p7_227_alternative__medicine", "wordpack": 227, "titles": {"english": "Alternative Medicine", "chinese": "替代医学", "pinyin": "Tìdài Yīxué", "portuguese": "Medicina Alternativa"}, "base": 19, "example": 38},
+      {"key": "p7_228_hiding__esconder", "wordpack": 228, "titles": {"english": "Hiding (esconder)", "chinese": "隐藏 (esconder)", "pinyin": "Yǐncáng (esconder)", "portuguese": "Esconder"}, "base": 10, "example": 20},
+      {"key": "p7_229_revealing__exposing__revelar", "wordpack": 229, "titles": {"english": "Showing (mostrar)", "chinese": "展示 (mostrar)", "pinyin": "Zhǎnshì (mostrar)", "portuguese": "Mostrar"}, "base": 10, "example": 20},
+      {"key": "p7_230_virtual__reality__terms", "wordpack": 230, "titles": {"english": "Virtual Reality Terms", "chinese": "虚拟现实术语", "pinyin": "Xūnǐ Xiànshí Shùyǔ", "portuguese": "Termos de Realidade Virtual"}, "base": 19, "example": 38},
+      {"key": "p7_231_measuring__medir", "wordpack": 231, "titles": {"english": "Measuring (medir)", "chinese": "测量 (medir)", "pinyin": "Cèliáng (medir)", "portuguese": "Medir"}, "base": 9, "example": 18},
+      {"key": "p7_232_weighing__pesar", "wordpack": 232, "titles": {"english": "Weighing (pesar)", "chinese": "称重 (pesar)", "pinyin": "Chēngzhòng (pesar)", "portuguese": "Pesar"}, "base": 10, "example": 20},
+      {"key": "p7_233_cryptocurrency__terms", "wordpack": 233, "titles": {"english": "Cryptocurrency Terms", "chinese": "加密货币术语", "pinyin": "Jiāmì Huòbì Shùyǔ", "portuguese": "Termos de Criptomoeda"}, "base": 18, "example": 36},
+      {"key": "p7_234_establishing__founding__fundar", "wordpack": 234, "titles": {"english": "Opening (abrir)", "chinese": "打开 (abrir)", "pinyin": "Dǎkāi (abrir)", "portuguese": "Abrir"}, "base": 10, "example": 20},
+      {"key": "p7_235_concluding__wrapping__up__concluir", "wordpack": 235, "titles": {"english": "Closing (cerrar)", "chinese": "关闭 (cerrar)", "pinyin": "Guānbì (cerrar)", "portuguese": "Fechar"}, "base": 10, "example": 20},
+      {"key": "p7_236_sustainable__living", "wordpack": 236, "titles": {"english": "Sustainable Living", "chinese": "可持续生活", "pinyin": "Kě Chíxù Shēnghuó", "portuguese": "Vida Sustentável"}, "base": 18, "example": 36},
+      {"key": "p7_237_pushing__empujar", "wordpack": 237, "titles": {"english": "Pushing (empujar)", "chinese": "推 (empujar)", "pinyin": "Tuī (empujar)", "portuguese": "Empurrar"}, "base": 10, "example": 20},
+      {"key": "p7_238_pulling__tirar", "wordpack": 238, "titles": {"english": "Pulling (tirar)", "chinese": "拉 (tirar)", "pinyin": "Lā (tirar)", "portuguese": "Puxar"}, "base": 10, "example": 20},
+      {"key": "p7_239_combining__combinar", "wordpack": 239, "titles": {"english": "Combining (combinar)", "chinese": "组合 (combinar)", "pinyin": "Zǔhé (combinar)", "portuguese": "Combinar"}, "base": 10, "example": 20},
+      {"key": "p7_240_separating__separar", "wordpack": 240, "titles": {"english": "Separating (separar)", "chinese": "分离 (separar)", "pinyin": "Fēnlí (separar)", "portuguese": "Separar"}, "base": 10, "example": 20},
+      {"key": "p7_241_dying__morir", "wordpack": 241, "titles": {"english": "Dying (morir)", "chinese": "死亡 (morir)", "pinyin": "Sǐwáng (morir)", "portuguese": "Morrer"}, "base": 10, "example": 20},
+      {"key": "p7_242_irregular__past__forms", "wordpack": 242, "titles": {"english": "Irregular Past Forms", "chinese": "不规则过去式", "pinyin": "Bù Guīzé Guòqùshì", "portuguese": "Formas Irregulares do Passado"}, "base": 18, "example": 36},
+      {"key": "p7_243_growing__crecer", "wordpack": 243, "titles": {"english": "Growing (crecer)", "chinese": "成长 (crecer)", "pinyin": "Chéngzhǎng (crecer)", "portuguese": "Crescer"}, "base": 10, "example": 20},
+      {"key": "p7_244_aging__envejecer", "wordpack": 244, "titles": {"english": "Aging (envejecer)", "chinese": "衰老 (envejecer)", "pinyin": "Shuāilǎo (envejecer)", "portuguese": "Envelhecer"}, "base": 10, "example": 20},
+      {"key": "p7_245_command__forms", "wordpack": 245, "titles": {"english": "Command Forms", "chinese": "命令式", "pinyin": "Mìnglìng Shì", "portuguese": "Formas Imperativas"}, "base": 20, "example": 40},
+      {"key": "p7_246_reflexive__pronouns", "wordpack": 246, "titles": {"english": "Reflexive Pronouns", "chinese": "反身代词", "pinyin": "Fǎnshēn Dàicí", "portuguese": "Pronomes Reflexivos"}, "base": 16, "example": 32},
+      {"key": "p7_247_gerund__forms", "wordpack": 247, "titles": {"english": "Gerund Forms", "chinese": "动名词形式", "pinyin": "Dòng Míngcí Xíngshì", "portuguese": "Formas de Gerúndio"}, "base": 18, "example": 36},
+      {"key": "p7_248_perfect__tenses", "wordpack": 248, "titles": {"english": "Perfect Tenses", "chinese": "完成时态", "pinyin": "Wánchéng Shítài", "portuguese": "Tempos Perfeitos"}, "base": 18, "example": 36},
+      {"key": "p7_249_future__forms", "wordpack": 249, "titles": {"english": "Future Forms", "chinese": "将来时态", "pinyin": "Jiānglái Shítài", "portuguese": "Formas do Futuro"}, "base": 18, "example": 36},
+      {"key": "p7_250_common__idioms", "wordpack": 250, "titles": {"english": "Common Idioms", "chinese": "常用习语", "pinyin": "Chángyòng Xíyǔ", "portuguese": "Expressões Idiomáticas Comuns"}, "base": 21, "example": 42}
+    ]}
+  ]
+};
@@ -8,6 +8,7 @@
 
 const LANGUAGE_CONFIG = {
   'Spanish': {
+    catalog: './SpanishWords/catalog.js',
     modules: [
       { act: 1, name: 'Foundation', path: './SpanishWords/Jsmodules-js/act1-foundation-js.js' },
       { act: 2, name: 'Building Blocks', path: './SpanishWords/Jsmodules-js/act2-building-blocks-js.js' },
@@ -21,6 +22,7 @@ const LANGUAGE_CONFIG = {
     nativeLanguages: { 'English': 1, 'Chinese': 2, 'Pinyin': 3, 'Portuguese': 4 }
   },
   'Chinese': {
+    catalog: './ChineseWords/catalog.js',
     modules: [
       { act: 1, name: 'Foundation', path: './ChineseWords/Jsmodules-js/act1-foundation-js.js' },
       { act: 2, name: 'Development', path: './ChineseWords/Jsmodules-js/act2-development-js.js' },
@@ -32,6 +34,7 @@ const LANGUAGE_CONFIG = {
     nativeLanguages: { 'English': 2, 'Spanish': 3, 'French': 4, 'Portuguese': 5, 'Vietnamese': 6, 'Thai': 7, 'Khmer': 8, 'Indonesian': 9, 'Malay': 10, 'Filipino': 11 }
   },
   'English': {
+    catalog: './EnglishWords/catalog.js',
     modules: [
       { act: 1, name: 'Foundation', path: './EnglishWords/Jsmodules-js/act1-foundation-js.js' },
       { act: 2, name: 'Building Blocks', path: './EnglishWords/Jsmodules-js/act2-building-blocks-js.js' },
@@ -141,18 +144,52 @@ async function loadAct(actNumber) {
   return { actMeta, packs: decodedData };
 }
 
+// Acts, packs, titles and word counts of a language (PythonHelpers/build_catalog.py) - fills the selectors without decoding any act
+async function loadLanguageCatalog(language, state) {
+  const config = LANGUAGE_CONFIG[language];
+  if (!config || !config.catalog) return null;
+  const { catalog } = await import(config.catalog);
+  const catalogDir = config.catalog.slice(0, config.catalog.lastIndexOf('/') + 1);
+  catalog.acts.forEach(act => { act.path = catalogDir + act.url.replace(/^\.\//, ''); });
+  state.catalog = catalog;
+  state.loadedActMeta = Object.assign(state.loadedActMeta || {}, Object.fromEntries(catalog.acts.map(act => [act.act, act.actMeta])));
+  return catalog;
+}
+
+// { actNum: { actName } } for getSelectorOptions(.., 'act')
+function getCatalogActs(catalog) {
+  return catalog ? Object.fromEntries(catalog.acts.map(act => [act.act, { actName: act.actName }])) : {};
+}
+
+// { packKey: { meta, baseCount, exampleCount } } for getSelectorOptions(.., 'pack') and getWordpackTitleData
+function getCatalogPacks(catalog, actNumber) {
+  const act = catalog && catalog.acts.find(a => a.act === actNumber);
+  if (!act) return {};
+  return Object.fromEntries(act.packs.map(pack => [pack.key, { meta: { wordpack: pack.wordpack, ...pack.titles }, baseCount: pack.base, exampleCount: pack.example }]));
+}
+
+// Decode one act on demand (catalog URL when loaded, else LANGUAGE_CONFIG) into state.loadedData
+async function loadActData(language, actNumber, state) {
+  if (!state.loadedData) state.loadedData = {};
+  if (!state.loadedActMeta) state.loadedActMeta = {};
+  if (state.loadedData[actNumber]) return state.loadedData[actNumber];
+  const catalogAct = state.catalog && state.catalog.language === language.toLowerCase() ? state.catalog.acts.find(act => act.act === actNumber) : null;
+  const moduleInfo = (LANGUAGE_CONFIG[language]?.modules || []).find(m => m.act === actNumber);
+  const path = catalogAct ? catalogAct.path : moduleInfo?.path;
+  if (!path) throw new Error(`Act ${actNumber} not found`);
+  const result = await decodeObfuscatedModule(path);
+  if (result.__actMeta) { state.loadedActMeta[actNumber] = result.__actMeta; delete result.__actMeta; }
+  state.loadedData[actNumber] = result;
+  return result;
+}
+
 async function loadLanguageData(language, state) {
   const config = LANGUAGE_CONFIG[language];
   if (!config || config.modules.length === 0) return;
   state.loadedData = {};
   state.loadedActMeta = {};
-  for (const moduleInfo of config.modules) {
-    try {
-      const result = await decodeObfuscatedModule(moduleInfo.path);
-      if (result.__actMeta) { state.loadedActMeta[moduleInfo.act] = result.__actMeta; delete result.__actMeta; }
-      state.loadedData[moduleInfo.act] = result;
-    } catch (error) { console.error(`Failed to load ${moduleInfo.path}:`, error); }
-  }
+  await Promise.all(config.modules.map(moduleInfo => loadActData(language, moduleInfo.act, state)
+    .catch(error => console.error(`Failed to load ${moduleInfo.path}:`, error))));
 }
 
 // Unified metadata property getter - replaces getTranslationsConfig, getDefaultTranslation, getWordColumns, getValidLanguages
@@ -193,8 +230,8 @@ function shuffleArray(array) {
 function combineAndShuffleWords(pack, difficulty = 'hard') {
   const baseWords = pack.baseWords || [];
   const exampleWords = pack.exampleWords || [];
-  const shuffledBase = shuffleArray(baseWords).map(word => ({ word, type: "Base Word" }));
-  const shuffledExamples = shuffleArray(exampleWords).map(word => ({ word, type: "Example Word" }));
+  const shuffledBase = shuffleArray(baseWords.map((word, index) => ({ word, index, type: "Base Word" })));
+  const shuffledExamples = shuffleArray(exampleWords.map((word, i) => ({ word, index: baseWords.length + i, type: "Example Word" })));
   if (difficulty === 'easy') return shuffledBase;
   if (difficulty === 'medium') return shuffledExamples;
   return [...shuffledBase, ...shuffledExamples];
@@ -212,10 +249,16 @@ function createDeckFromPack(pack, options = {}) {
   const targetIsChinese = targetLang === 'chinese';
   const nativeIsChinese = nativeLang === 'chinese';
   const pinyinColIndex = wordColumns.indexOf('pinyin');
+  const chineseColIndex = wordColumns.indexOf('chinese');
 
   return combinedWords.map((item, index) => {
     const word = item.word;
     const card = { id: `card-${index}`, rawWord: word, type: item.type };
+    if (pack.pinyinUnits && chineseColIndex !== -1 && pinyinColIndex !== -1 && pack.pinyinUnits[item.index] !== null) {
+      card.pinyinPairs = expandPinyinUnits(word[chineseColIndex] || '', word[pinyinColIndex] || '', pack.pinyinUnits[item.index]);
+    }
+    if (pack.accentFree) card.accentFree = pack.accentFree[item.index] !== undefined ? pack.accentFree[item.index] : (word[0] || '').toLowerCase();
+    if (pack.tonelessPinyin) card.tonelessPinyin = pack.tonelessPinyin[item.index];
     if (targetIsChinese && pinyinColIndex !== -1) {
       card.chinese = word[targetColIndex] || '';
       card.pinyin = word[pinyinColIndex] || '';
@@ -237,7 +280,25 @@ function createDeckFromPack(pack, options = {}) {
   });
 }
 
-function coupleChineseWithPinyin(chinese, pinyin) {
+// A row's build-time alignment (pack.pinyinUnits, see PythonHelpers/build_pinyin_alignment.py) as [unit, syllable, ...]:
+// the Chinese characters grouped by the stored unit lengths (one each when there are none), the pinyin split on spaces
+function expandPinyinUnits(chinese, pinyin, units) {
+  const chars = chinese.replace(/\s+/g, '').split('');
+  const syllables = pinyin.trim().split(/\s+/);
+  const lengths = units ? units.split('').map(Number) : chars.map(() => 1);
+  const pairs = [];
+  let start = 0;
+  lengths.forEach((length, i) => { pairs.push(chars.slice(start, start + length).join(''), syllables[i]); start += length; });
+  return pairs;
+}
+
+// pinyinPairs: the row's build-time [unit, syllable, ...] alignment (card.pinyinPairs, from expandPinyinUnits)
+function coupleChineseWithPinyin(chinese, pinyin, pinyinPairs = null) {
+  if (pinyinPairs) {
+    const coupled = [];
+    for (let i = 0; i < pinyinPairs.length; i += 2) coupled.push({ char: pinyinPairs[i], pinyin: pinyinPairs[i + 1] });
+    return coupled;
+  }
   if (!chinese || !pinyin) return [];
   const result = [];
   const pinyinParts = pinyin.split(/\s+/);
@@ -326,20 +387,60 @@ function normalize(str, opts = {}) {
   return result;
 }
 
-function collectFilteredWords(actData, correctAnswer, transformFn) {
-  const normalizedCorrect = normalize(correctAnswer, { removeSpaces: true });
-  const results = [];
+function getPackRows(pack) {
+  return pack.words || [...(pack.baseWords || []), ...(pack.exampleWords || [])];
+}
+
+// A pack's build-time distractors string (see PythonHelpers/build_distractors.py) as act word
+// indices per row: DISTRACTOR_SLOTS slots per row, each one base-64 digit counted from packStart,
+// '*' + two base-64 digits for an act-wide index, or '-' for an empty slot
+const DISTRACTOR_DIGITS = 'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/';
+const DISTRACTOR_SLOTS = 4;
+function decodeDistractors(encoded, packStart) {
+  const rows = [];
+  let indices = [], slots = 0;
+  for (let pos = 0; pos < encoded.length; pos++) {
+    if (encoded[pos] === '*') {
+      indices.push(DISTRACTOR_DIGITS.indexOf(encoded[pos + 1]) * 64 + DISTRACTOR_DIGITS.indexOf(encoded[pos + 2]));
+      pos += 2;
+    } else if (encoded[pos] !== '-') {
+      indices.push(packStart + DISTRACTOR_DIGITS.indexOf(encoded[pos]));
+    }
+    if (++slots === DISTRACTOR_SLOTS) { rows.push(indices); indices = []; slots = 0; }
+  }
+  return rows;
+}
+
+// Act-wide word list (packs in order, base then example words) with each row's multiple-choice
+// key and build-time distractors - built once per act
+const actWordIndexCache = new WeakMap();
+function getActWordIndex(actData) {
+  let index = actWordIndexCache.get(actData);
+  if (index) return index;
+  index = { rows: [], matchKeys: [], distractors: [], firstRow: new Map() };
   Object.keys(actData).forEach(packKey => {
-    if (packKey === '__actMeta') return;
     const pack = actData[packKey];
-    if (!pack || !pack.words) return;
-    pack.words.forEach(wordArray => {
-      const targetWord = wordArray[0];
-      if (targetWord !== correctAnswer && normalize(targetWord, { removeSpaces: true }) !== normalizedCorrect) {
-        results.push(transformFn(wordArray));
-      }
+    if (packKey === '__actMeta' || !pack) return;
+    const distractors = pack.distractors ? decodeDistractors(pack.distractors, index.rows.length) : null;
+    getPackRows(pack).forEach((wordArray, i) => {
+      if (!index.firstRow.has(wordArray[0])) index.firstRow.set(wordArray[0], index.rows.length);
+      index.rows.push(wordArray);
+      index.matchKeys.push(normalize(wordArray[0], { removeSpaces: true }));
+      index.distractors.push(distractors ? distractors[i] : null);
     });
   });
+  actWordIndexCache.set(actData, index);
+  return index;
+}
+
+function collectFilteredWords(actData, correctAnswer, transformFn) {
+  const index = getActWordIndex(actData);
+  const correctRow = index.firstRow.get(correctAnswer);
+  const normalizedCorrect = correctRow !== undefined ? index.matchKeys[correctRow] : normalize(correctAnswer, { removeSpaces: true });
+  const results = [];
+  index.rows.forEach((wordArray, i) => {
+    if (wordArray[0] !== correctAnswer && index.matchKeys[i] !== normalizedCorrect) results.push(transformFn(wordArray));
+  });
   return results;
 }
 
@@ -347,6 +448,10 @@ function generateWrongAnswers(actData, correctAnswer, count = 4, withPinyin = fa
   const wordColumns = getActMetaProperty('wordColumns') || [];
   const pinyinIndex = withPinyin ? wordColumns.indexOf('pinyin') : -1;
   const transform = pinyinIndex !== -1 ? w => ({text: w[0], pinyin: w[pinyinIndex] || ''}) : w => (withPinyin ? {text: w[0], pinyin: ''} : w[0]);
+  const index = getActWordIndex(actData);
+  const correctRow = index.firstRow.get(correctAnswer);
+  const distractors = correctRow !== undefined ? index.distractors[correctRow] : null;
+  if (distractors && distractors.length >= count) return shuffleArray(distractors.slice(0, count).map(i => transform(index.rows[i])));
   const words = shuffleArray(collectFilteredWords(actData, correctAnswer, transform));
   return words.slice(0, Math.min(count, words.length));
 }
@@ -363,19 +468,22 @@ function findNextTypingPosition(chars, typedPositions) {
   return nextPos >= chars.length ? -1 : nextPos;
 }
 
-function checkTypingKey(key, targetChar) {
+// plainTargetChar: the character at the same position of the card's build-time accentFree form (typingState.plainChars)
+function checkTypingKey(key, targetChar, plainTargetChar = normalize(targetChar, { removeAccents: true })) {
   if (key === ' ') return 'space';
-  return normalize(key, { removeAccents: true }) === normalize(targetChar, { removeAccents: true }) ? 'correct' : 'wrong';
+  return normalize(key, { removeAccents: true }) === plainTargetChar ? 'correct' : 'wrong';
 }
 
 function isWordComplete(chars, typedPositions) {
   return typedPositions.size >= chars.filter(c => c !== ' ').length;
 }
 
-function initializeTypingState(targetWord) {
-  if (!targetWord) return { chars: [], typedPositions: new Set(), wrongPositions: [], wrongAttempts: 0, wrongLetters: [], typingDisplay: '' };
+// accentFree: the card's build-time accentFree form; used per character when it lines up with targetWord
+function initializeTypingState(targetWord, accentFree = null) {
+  if (!targetWord) return { chars: [], plainChars: null, typedPositions: new Set(), wrongPositions: [], wrongAttempts: 0, wrongLetters: [], typingDisplay: '' };
   const chars = targetWord.split('');
-  return { chars, typedPositions: new Set(), wrongPositions: [], wrongAttempts: 0, wrongLetters: [], typingDisplay: chars.map(c => c === ' ' ? ' ' : '_').join(' ') };
+  const plainChars = accentFree && accentFree.length === chars.length ? accentFree.split('') : null;
+  return { chars, plainChars, typedPositions: new Set(), wrongPositions: [], wrongAttempts: 0, wrongLetters: [], typingDisplay: chars.map(c => c === ' ' ? ' ' : '_').join(' ') };
 }
 
 function renderTypingDisplayHTML(typingDisplay, typedPositions, wrongPositions = []) {
@@ -432,8 +540,8 @@ function levenshteinDistance(str1, str2) {
   return dp[m][n];
 }
 
-function calculateSimilarity(expected, heard, language) {
-  const normalizedExpected = normalize(expected, { chinese: language === 'chinese' });
+// normalizedExpected: pass the card's build-time form (e.g. card.tonelessPinyin) to skip normalizing the target
+function calculateSimilarity(expected, heard, language, normalizedExpected = normalize(expected, { chinese: language === 'chinese' })) {
   const normalizedHeard = normalize(heard, { chinese: language === 'chinese' });
   if (normalizedExpected === normalizedHeard) return { score: 100, normalizedExpected, normalizedHeard };
   if (normalizedHeard.length === 0) return { score: 0, normalizedExpected, normalizedHeard };
@@ -651,7 +759,7 @@ function getDebugTableData(options = {}) {
       nativeText = card.rawWord[nativeColIndex] || '';
       nativePinyin = card.rawWord[nativePinyinColIndex] || '';
     }
-    return { target: targetText, native: nativeText, nativePinyin, type: card.type || '—', nativeIsChinese };
+    return { target: targetText, native: nativeText, nativePinyin, nativePinyinPairs: card.pinyinPairs || null, type: card.type || '—', nativeIsChinese };
   });
 }
 
@@ -679,7 +787,7 @@ function updateDebugTable(options = {}) {
     const row = document.createElement('tr');
     const targetCell = document.createElement('td'); targetCell.textContent = rowData.target; row.appendChild(targetCell);
     const nativeCell = document.createElement('td');
-    if (rowData.nativeIsChinese && rowData.nativePinyin) nativeCell.appendChild(renderChineseWithPinyin(coupleChineseWithPinyin(rowData.native, rowData.nativePinyin)));
+    if (rowData.nativeIsChinese && rowData.nativePinyin) nativeCell.appendChild(renderChineseWithPinyin(coupleChineseWithPinyin(rowData.native, rowData.nativePinyin, rowData.nativePinyinPairs)));
     else nativeCell.textContent = rowData.native;
     row.appendChild(nativeCell);
     const typeCell = document.createElement('td'); typeCell.textContent = rowData.type; row.appendChild(typeCell);
@@ -779,10 +887,10 @@ function initializeDebugUI() {
 if (typeof module !== 'undefined' && module.exports) {
   module.exports = {
     LANGUAGE_CONFIG, TTS_LANG_MAP, TOOLTIP_MESSAGES, saveState, loadState, switchLanguage, restoreSavedState, validateAndFixState,
-    decodeObfuscatedModule, loadAct, loadLanguageData, getActMetaProperty, validateTargetLanguageConsistency,
-    shuffleArray, combineAndShuffleWords, createDeckFromPack, coupleChineseWithPinyin, renderChineseWithPinyin,
+    decodeObfuscatedModule, loadAct, loadLanguageCatalog, getCatalogActs, getCatalogPacks, loadActData, loadLanguageData, getActMetaProperty, validateTargetLanguageConsistency,
+    shuffleArray, combineAndShuffleWords, createDeckFromPack, expandPinyinUnits, coupleChineseWithPinyin, renderChineseWithPinyin,
     speakWord, switchModeLogic, updateModeButtonsVisual, updateControlVisibilityForMode,
-    normalize, collectFilteredWords, generateWrongAnswers,
+    normalize, getPackRows, decodeDistractors, getActWordIndex, collectFilteredWords, generateWrongAnswers,
     findNextTypingPosition, checkTypingKey, isWordComplete, initializeTypingState, renderTypingDisplayHTML,
     initializeSpeechRecognition, getSimilarityThreshold, levenshteinDistance, calculateSimilarity, getScoreFeedback, updatePronunciationDebug,
     determineOutcome, showStamp, removeCard, addDuplicateCards, navigateToNextPack, getWordpackTitleData, getSelectorOptions,